@@ -217,15 +217,23 @@ class TestCAMSanity(PathTestBase):
             dummy_builder = DummyImageBuilder(self.temp_file.name)
             mock_factory.return_value = dummy_builder
             S = Sanity.CAMSanity(self.job, output_file=self.temp_file.name)
-        data = S._stockData()
+        with patch("Path.Preferences.sanitySimulationEnabled", return_value=False):
+            data = S._stockData()
         self.assertIsInstance(data, dict)
         self.assertIn("xLen", data)
         self.assertIn("yLen", data)
         self.assertIn("zLen", data)
         self.assertIn("material", data)
         self.assertIn("stockImage", data)
+        self.assertIn("removedVolume", data)
+        self.assertEqual(data["removedVolume"], "")
         self.assertIn("squawkData", data)
 
+        # the job is only simulated if enabled in the preferences
+        with patch("Path.Preferences.sanitySimulationEnabled", return_value=True):
+            data = S._stockData()
+        self.assertNotEqual(data["removedVolume"], "")
+
     def test120(self):
         """Test squawk data"""
         with patch(
@@ -22,10 +22,14 @@
 # *                                                                         *
 # ***************************************************************************
 
+import concurrent.futures
+import io
 
 import FreeCAD
 
 import Path
+import Path.Post.UtilsExport as PostUtilsExport
+import Path.Post.UtilsParallel as PostUtilsParallel
 import CAMTests.PathTestUtils as PathTestUtils
 import CAMTests.PostTestMocks as PostTestMocks
 from Path.Post.Processor import PostProcessorFactory
@@ -335,3 +339,102 @@ G54
         result = gcode.splitlines()[17]
         expected = "(comment)"
         self.assertEqual(result, expected)
+
+    def test100(self):
+        """
+        Test streaming output matches the regular output
+        """
+        c = Path.Command("G0 X10 Y20 Z30")
+        c1 = Path.Command("G1 X20 Y30 Z10 F100")
+
+        self.profile_op.Path = Path.Path([c, c1] * 1500)
+
+        self.job.PostProcessorArgs = "--no-header --line-numbers --no-show-editor"
+        expected = self.post.export()[0][1]
+
+        self.post.reinitialize()
+        sections = list(self.post.export_streaming())
+        self.assertEqual(len(sections), 1)
+        partname, chunks = sections[0]
+        stream = io.StringIO()
+        line_count = PostUtilsExport.write_gcode_chunks(self.post.values, chunks, stream)
+        self.assertEqual(stream.getvalue(), expected)
+        self.assertEqual(line_count, len(expected.splitlines()))
+
+    def test101(self):
+        """
+        Test streaming output is produced in chunks
+        """
+        c = Path.Command("G0 X10 Y20 Z30")
+
+        self.profile_op.Path = Path.Path([c] * 2500)
+
+        self.job.PostProcessorArgs = "--no-header --no-show-editor"
+        partname, chunks = next(self.post.export_streaming())
+        chunk_sizes = [len(chunk) for chunk in chunks]
+        self.assertGreater(len(chunk_sizes), 2)
+        self.assertLessEqual(max(chunk_sizes), self.post.values["STREAMING_CHUNK_SIZE"])
+
+    def test110(self):
+        """
+        Test parallel postprocessing of split output matches the serial output
+        """
+        op2 = PostTestMocks.MockOperation(
+            name="Profile001", label="Profile001", tool_controller=self.tool_controller
+        )
+        op2.Path = Path.Path([Path.Command("G91"), Path.Command("G1 X1 Y1 F100")])
+        op3 = PostTestMocks.MockOperation(
+            name="Profile002", label="Profile002", tool_controller=self.tool_controller
+        )
+        op3.Path = Path.Path([Path.Command("G1 X2 Y2 F100")])
+        self.profile_op.Path = Path.Path([Path.Command("G0 X10 Y20 Z30")])
+        self.job.Operations.Group.extend([op2, op3])
+        self.job.OrderOutputBy = "Operation"
+        self.job.SplitOutput = True
+        try:
+            self.job.PostProcessorArgs = "--no-header --line-numbers --no-show-editor"
+            expected = self.post.export()
+            self.assertEqual(len(expected), 3)
+
+            self.post.reinitialize()
+            self.post.process_arguments()
+            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+                sections = PostUtilsParallel.export_sections_parallel(
+                    self.post.values, self.post._prepare_postables(), 2, executor
+                )
+            self.assertEqual(sections, expected)
+        finally:
+            del self.job.Operations.Group[1:]
+            self.job.OrderOutputBy = "Tool"
+            self.job.SplitOutput = False
+
+    def test111(self):
+        """
+        Test parallel postprocessing in worker processes matches the serial output
+        """
+        from freecad import utils
+
+        if not utils.get_python_exe():
+            self.skipTest("No Python interpreter found to start the worker processes.")
+        op2 = PostTestMocks.MockOperation(
+            name="Profile001", label="Profile001", tool_controller=self.tool_controller
+        )
+        op2.Path = Path.Path([Path.Command("G1 X1 Y1 F100")])
+        self.profile_op.Path = Path.Path([Path.Command("G0 X10 Y20 Z30")])
+        self.job.Operations.Group.append(op2)
+        self.job.OrderOutputBy = "Operation"
+        self.job.SplitOutput = True
+        try:
+            self.job.PostProcessorArgs = "--no-header --line-numbers --no-show-editor"
+            expected = self.post.export()
+
+            self.post.reinitialize()
+            self.post.process_arguments()
+            sections = PostUtilsParallel.export_sections_parallel(
+                self.post.values, self.post._prepare_postables(), 2
+            )
+            self.assertEqual(sections, expected)
+        finally:
+            del self.job.Operations.Group[1:]
+            self.job.OrderOutputBy = "Tool"
+            self.job.SplitOutput = False
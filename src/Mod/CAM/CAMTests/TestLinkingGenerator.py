@@ -12,6 +12,10 @@
 
 import FreeCAD
 import Part
+import math
+import os
+import time
+import Path
 import CAMTests.PathTestUtils as PathTestUtils
 import Path.Base.Generator.linking as generator
 import unittest
@@ -154,3 +158,137 @@ class TestGetLinkingMoves(PathTestUtils.PathTestBase):
     @unittest.skip("not yet implemented")
     def test_path_generated_without_local_safe(self):
         pass
+
+
+class TestHeightField(PathTestUtils.PathTestBase):
+    """The heightfield must give the same linking moves as the solids."""
+
+    def setUp(self):
+        self.tool = Part.makeCylinder(1, 5)
+        # a wall between start and target and a post next to them
+        wall = Part.makeBox(2, 20, 3, FreeCAD.Vector(4, -10, 0))
+        post = Part.makeCylinder(1, 8, FreeCAD.Vector(5, 15, 0))
+        self.solids = [wall, post]
+        self.heightfield = generator.HeightField(self.solids)
+
+    def assertSameMoves(self, start, target, local_clearance, global_clearance, **kwargs):
+        expected = generator.get_linking_moves(
+            start, target, local_clearance, global_clearance, self.tool, self.solids, **kwargs
+        )
+        cmds = generator.get_linking_moves(
+            start,
+            target,
+            local_clearance,
+            global_clearance,
+            self.tool,
+            self.solids,
+            heightfield=self.heightfield,
+            **kwargs,
+        )
+        self.assertEqual(len(cmds), len(expected))
+        for cmd, exp in zip(cmds, expected):
+            self.assertEqual(cmd.Name, exp.Name)
+            for axis in "XYZ":
+                self.assertRoughly(cmd.Parameters[axis], exp.Parameters[axis])
+        return cmds
+
+    def test_max_z(self):
+        v = FreeCAD.Vector
+        self.assertGreaterEqual(self.heightfield.max_z(v(0, 0, 0), v(10, 0, 0)), 3)
+        self.assertLess(self.heightfield.max_z(v(0, 0, 0), v(10, 0, 0)), 3.1)
+        self.assertGreaterEqual(self.heightfield.max_z(v(0, 15, 0), v(10, 15, 0)), 8)
+        self.assertEqual(self.heightfield.max_z(v(0, 0, 0), v(2, 0, 0)), float("-inf"))
+        self.assertEqual(self.heightfield.max_z(v(20, -20, 0), v(30, 30, 0)), float("-inf"))
+
+    def test_check_collision(self):
+        v = FreeCAD.Vector
+        segments = [
+            (v(0, 0, 1), v(10, 0, 1)),  # through the wall
+            (v(0, 0, 4), v(10, 0, 4)),  # above the wall
+            (v(0, 0, 4), v(10, 0, 2)),  # descending into the wall
+            (v(0, 15, 4), v(10, 15, 4)),  # through the post
+            (v(0, 15, 9), v(10, 15, 9)),  # above the post
+            (v(0, -12, 1), v(10, -12, 1)),  # beside the wall
+            (v(5, 0, 10), v(5, 0, 3.5)),  # plunge above the wall
+            (v(5, 0, 10), v(5, 0, 2)),  # plunge into the wall
+        ]
+        for start, target in segments:
+            self.assertEqual(
+                generator.check_collision(start, target, heightfield=self.heightfield),
+                generator.check_collision(start, target, self.solids),
+                "{} -> {}".format(start, target),
+            )
+
+    def test_link_over_wall(self):
+        v = FreeCAD.Vector
+        # the local clearance is below the top of the wall
+        cmds = self.assertSameMoves(v(0, 0, 0), v(10, 0, 0), 2.0, 5.0)
+        self.assertRoughly(max(cmd.Parameters["Z"] for cmd in cmds), 5.0)
+        # the local clearance is above the wall
+        cmds = self.assertSameMoves(v(0, 0, 0), v(10, 0, 0), 4.0, 10.0)
+        self.assertRoughly(max(cmd.Parameters["Z"] for cmd in cmds), 4.0)
+        # over the post only the global clearance is safe
+        cmds = self.assertSameMoves(v(0, 15, 9), v(10, 15, 0), 4.0, 10.0)
+        self.assertRoughly(max(cmd.Parameters["Z"] for cmd in cmds), 10.0)
+
+    def test_link_with_retract_offset(self):
+        v = FreeCAD.Vector
+        self.assertSameMoves(v(0, 0, 3), v(10, 0, 3), 4.0, 10.0, retract_height_offset=0.5)
+        self.assertSameMoves(v(0, 0, 3), v(10, 0, 3), 4.0, 10.0, retract_height_offset=0)
+
+    def test_skip_if_no_collision(self):
+        v = FreeCAD.Vector
+        self.assertSameMoves(v(0, -12, 1), v(10, -12, 1), 4.0, 10.0, skip_if_no_collision=True)
+        self.assertSameMoves(v(0, 0, 1), v(10, 0, 1), 4.0, 10.0, skip_if_no_collision=True)
+
+    def test_blocked(self):
+        v = FreeCAD.Vector
+        # the start is inside the wall
+        for heightfield in (None, self.heightfield):
+            with self.assertRaises(RuntimeError):
+                generator.get_linking_moves(
+                    v(5, 0, 1),
+                    v(10, 0, 0),
+                    4.0,
+                    10.0,
+                    self.tool,
+                    self.solids,
+                    heightfield=heightfield,
+                )
+
+    def test_no_solids(self):
+        heightfield = generator.HeightField([])
+        v = FreeCAD.Vector
+        self.assertTrue(heightfield.is_segment_collision_free(v(0, 0, 0), v(10, 0, 0)))
+        self.assertFalse(
+            generator.check_collision(v(0, 0, 0), v(10, 0, 0), heightfield=heightfield)
+        )
+
+    def _large_solids(self):
+        """Return a large box and a prism whose top face is tessellated into slivers."""
+        v = FreeCAD.Vector
+        box = Part.makeBox(100, 100, 10)
+        # the top face of a prism over a 200-gon is tessellated into slivers
+        corners = [
+            v(50 + 50 * math.cos(a), 50 + 50 * math.sin(a), 0)
+            for a in (2 * math.pi * k / 200 for k in range(200))
+        ]
+        prism = Part.Face(Part.makePolygon(corners + corners[:1])).extrude(v(0, 0, 10))
+        return (box, prism)
+
+    def test_build_large(self):
+        """The heightfield of a large box and of sliver triangles has the solid's height."""
+        v = FreeCAD.Vector
+        for solid in self._large_solids():
+            heightfield = generator.HeightField([solid])
+            self.assertRoughly(
+                heightfield.max_z(v(40, 50, 0), v(60, 50, 0)), 10 + heightfield.deflection
+            )
+
+    @unittest.skipUnless(os.environ.get("CAM_BENCHMARKS"), "set CAM_BENCHMARKS=1 to run")
+    def test_build_time(self):
+        """Benchmark building the heightfield of a large box and of sliver triangles."""
+        for name, solid in zip(("box", "slivers"), self._large_solids()):
+            start = time.perf_counter()
+            generator.HeightField([solid])
+            Path.Log.info("heightfield of {}: {:.3f} s".format(name, time.perf_counter() - start))
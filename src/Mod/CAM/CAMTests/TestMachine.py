@@ -202,6 +202,7 @@ class TestSpindle(PathTestUtils.PathTestBase):
             min_rpm=500,
             tool_change="manual",
             tool_axis=FreeCAD.Vector(0, 1, 0),
+            tool_change_time=12.5,
         )
 
         data = spindle.to_dict()
@@ -209,12 +210,18 @@ class TestSpindle(PathTestUtils.PathTestBase):
         self.assertEqual(data["id"], "spindle-001")
         self.assertEqual(data["max_power_kw"], 3.0)
         self.assertEqual(data["tool_axis"], [0, 1, 0])
+        self.assertEqual(data["tool_change_time"], 12.5)
 
         restored = Spindle.from_dict(data)
         self.assertEqual(restored.name, spindle.name)
         self.assertEqual(restored.id, spindle.id)
         self.assertEqual(restored.max_power_kw, spindle.max_power_kw)
         self.assertEqual(restored.tool_axis, spindle.tool_axis)
+        self.assertEqual(restored.tool_change_time, spindle.tool_change_time)
+
+        # files without a tool change time
+        del data["tool_change_time"]
+        self.assertEqual(Spindle.from_dict(data).tool_change_time, 0)
 
 
 class TestMachineFactory(PathTestUtils.PathTestBase):
@@ -408,3 +415,20 @@ class TestMachineFactory(PathTestUtils.PathTestBase):
         self.assertFalse(loaded.output.output_comments)
         self.assertEqual(loaded.output.axis_precision, 4)
         self.assertEqual(loaded.output.line_increment, 5)
+
+    def test_axis_kinematics_roundtrip(self):
+        """Test that the acceleration and jerk limits of the axes are saved and loaded"""
+        machine = Machine.create_AC_table_config()
+        machine.linear_axes["X"].max_acceleration = 2000
+        machine.linear_axes["X"].max_jerk = 50000
+        machine.rotary_axes["C"].max_acceleration = 720
+
+        filepath = MachineFactory.save_configuration(machine, "kinematics.fcm")
+        loaded = MachineFactory.load_configuration(filepath)
+
+        self.assertEqual(loaded.linear_axes["X"].max_acceleration, 2000)
+        self.assertEqual(loaded.linear_axes["X"].max_jerk, 50000)
+        self.assertEqual(loaded.linear_axes["Y"].max_acceleration, 0)
+        self.assertEqual(loaded.linear_axes["Y"].max_jerk, 0)
+        self.assertEqual(loaded.rotary_axes["C"].max_acceleration, 720)
+        self.assertEqual(loaded.rotary_axes["A"].max_jerk, 0)
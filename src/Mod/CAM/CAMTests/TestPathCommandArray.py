@@ -0,0 +1,176 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+# ***************************************************************************
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import math
+import os
+import time
+import unittest
+
+import Path
+import Path.Base.CommandArray as PathCommandArray
+import Path.Base.MachineState as PathMachineState
+import CAMTests.PathTestUtils as PathTestUtils
+
+
+class TestPathCommandArray(PathTestUtils.PathTestBase):
+    """Test the columnar toolpath against MachineState and Path.Path."""
+
+    def setUp(self):
+        self.commands = [
+            Path.Command("G0", {"X": 0.0, "Y": 0.0, "Z": 10.0}),
+            Path.Command("M6", {"T": 2.0}),
+            Path.Command("M3", {"S": 5000.0}),
+            Path.Command("G55"),
+            Path.Command("G0", {"X": 10.0, "Y": 5.0}),
+            Path.Command("G1", {"Z": -2.0, "F": 3.0}),
+            Path.Command("G1", {"X": 30.0, "F": 8.0}),
+            Path.Command("G81", {"X": 40.0, "Y": 5.0, "Z": -8.0, "R": 3.0}),
+            Path.Command("G0", {"Z": 10.0}),
+            Path.Command("M4", {"S": 2000.0}),
+            Path.Command("G1", {"Y": 25.0}),
+            Path.Command("M5"),
+        ]
+
+    def test00(self):
+        """Test the states are the same as the states of MachineState."""
+        spindle = {
+            "off": PathCommandArray.SpindleOff,
+            "CW": PathCommandArray.SpindleCW,
+            "CCW": PathCommandArray.SpindleCCW,
+        }
+        states = PathCommandArray.CommandArray(Path.Path(self.commands)).states()
+        machine = PathMachineState.MachineState()
+        for cmd, state in zip(self.commands, states):
+            machine.addCommand(cmd)
+            expected = machine.getState()
+            for f in ("X", "Y", "Z", "A", "B", "C", "F", "S"):
+                self.assertEqual(state[f], expected[f], "{} after {}".format(f, cmd))
+            if expected["T"] is None:
+                self.assertTrue(math.isnan(state["T"]))
+            else:
+                self.assertEqual(state["T"], expected["T"])
+            self.assertEqual(state["Spindle"], spindle[expected["Spindle"]])
+            self.assertEqual(machine.WCSLIST[state["WCS"]], expected["WCS"])
+
+    def test10(self):
+        """Test the distances and the cycle time of straight moves."""
+        path = Path.Path([c for c in self.commands if c.Name != "G81"])
+        commands = PathCommandArray.CommandArray(path)
+        self.assertRoughly(commands.rapidDistance(), 10.0 + math.hypot(10.0, 5.0) + 12.0)
+        self.assertRoughly(commands.feedDistance(), 12.0 + 20.0 + 20.0)
+        self.assertRoughly(
+            commands.cycleTime(2.0, 1.0, 20.0, 10.0), path.getCycleTime(2.0, 1.0, 20.0, 10.0)
+        )
+        self.assertRoughly(
+            commands.cycleTime(2.0, 1.0, 0.0, 0.0), path.getCycleTime(2.0, 1.0, 0.0, 0.0)
+        )
+        self.assertEqual(commands.cycleTime(0.0, 1.0, 20.0, 10.0), 0.0)
+
+    def test20(self):
+        """Test the length and the bound box of arcs."""
+        commands = PathCommandArray.CommandArray(
+            [
+                Path.Command("G0", {"X": 5.0, "Y": 0.0, "Z": 1.0}),
+                Path.Command("G3", {"X": 5.0, "Y": 0.0, "I": -5.0, "J": 0.0}),
+                Path.Command("G2", {"X": -5.0, "Y": 0.0, "Z": -2.0, "I": -5.0, "J": 0.0}),
+                Path.Command("G2", {"X": 0.0, "Y": 5.0, "I": 5.0, "J": 0.0}),
+            ]
+        )
+        distances = commands.distances()
+        self.assertRoughly(distances[1], 10.0 * math.pi)
+        self.assertRoughly(distances[2], math.hypot(5.0 * math.pi, 3.0))
+        self.assertRoughly(distances[3], 2.5 * math.pi)
+
+        bb = commands.boundBox()
+        self.assertRoughly(bb.XMin, -5.0)
+        self.assertRoughly(bb.XMax, 5.0)
+        self.assertRoughly(bb.YMin, -5.0)
+        self.assertRoughly(bb.YMax, 5.0)
+        self.assertRoughly(bb.ZMin, -2.0)
+        self.assertRoughly(bb.ZMax, 1.0)
+
+    def test30(self):
+        """Test the bound box of straight moves and drill cycles is the one of Path.Path."""
+        path = Path.Path(self.commands)
+        bb = PathCommandArray.CommandArray(path).boundBox()
+        self.assertRoughly(bb.XMin, path.BoundBox.XMin)
+        self.assertRoughly(bb.XMax, path.BoundBox.XMax)
+        self.assertRoughly(bb.YMin, path.BoundBox.YMin)
+        self.assertRoughly(bb.YMax, path.BoundBox.YMax)
+        self.assertRoughly(bb.ZMin, path.BoundBox.ZMin)
+        self.assertRoughly(bb.ZMax, path.BoundBox.ZMax)
+        self.assertFalse(PathCommandArray.CommandArray([]).boundBox().isValid())
+
+    def _largePath(self):
+        """Return a large toolpath of feed moves with a retract every 100 moves."""
+        commands = []
+        for i in range(50000):
+            if i % 100 == 0:
+                commands.append(Path.Command("G0", {"Z": 5.0}))
+            else:
+                commands.append(
+                    Path.Command("G1", {"X": i * 0.01, "Y": (i % 200) * 0.1, "Z": -1.0})
+                )
+        return Path.Path(commands)
+
+    def _walk(self, path):
+        """Return the distance of path walked with MachineState."""
+        machine = PathMachineState.MachineState()
+        position = machine.getPosition()
+        distance = 0.0
+        for cmd in path.Commands:
+            machine.addCommand(cmd)
+            distance += (machine.getPosition() - position).Length
+            position = machine.getPosition()
+        return distance
+
+    def _analyse(self, path):
+        """Return the analysed commands of path and their cycle time."""
+        commands = PathCommandArray.CommandArray(path)
+        seconds = commands.cycleTime(20.0, 10.0, 100.0, 50.0)
+        commands.boundBox()
+        return (commands, seconds)
+
+    def test40(self):
+        """Test a large toolpath is analysed like walking it with MachineState."""
+        path = self._largePath()
+        distance = self._walk(path)
+        commands, seconds = self._analyse(path)
+
+        self.assertRoughly(commands.distances().sum(), distance, 1e-3)
+        self.assertRoughly(seconds, path.getCycleTime(20.0, 10.0, 100.0, 50.0), 1e-3)
+
+    @unittest.skipUnless(os.environ.get("CAM_BENCHMARKS"), "set CAM_BENCHMARKS=1 to run")
+    def test41(self):
+        """Benchmark analysing a large toolpath against walking it with MachineState."""
+        path = self._largePath()
+
+        start = time.perf_counter()
+        self._walk(path)
+        walked = time.perf_counter() - start
+
+        start = time.perf_counter()
+        self._analyse(path)
+        analysed = time.perf_counter() - start
+
+        Path.Log.info("walked in {:.3f} s, analysed in {:.3f} s".format(walked, analysed))
+        self.assertLess(analysed, walked)
@@ -0,0 +1,196 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+# ***************************************************************************
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import math
+import pathlib
+import shutil
+import tempfile
+import time
+
+import FreeCAD
+import Path
+import Path.Base.CommandArray as PathCommandArray
+import Path.Main.CycleTime as PathCycleTime
+
+from CAMTests.PathTestUtils import PathTestBase
+from Path.Machine.models.machine import Machine, MachineFactory, Spindle
+
+
+def _path(gcode):
+    return Path.Path([Path.Command(line) for line in gcode.strip().splitlines()])
+
+
+class TestPathCycleTime(PathTestBase):
+    """Unit tests for the cycle time estimation."""
+
+    @classmethod
+    def setUpClass(cls):
+        FreeCAD.ConfigSet("SuppressRecomputeRequiredDialog", "True")
+        cls.doc = FreeCAD.open(FreeCAD.getHomePath() + "/Mod/CAM/CAMTests/boxtest.fcstd")
+        FreeCAD.ConfigSet("SuppressRecomputeRequiredDialog", "")
+        cls.job = cls.doc.getObject("Job")
+
+    @classmethod
+    def tearDownClass(cls):
+        FreeCAD.closeDocument("boxtest")
+
+    def setUp(self):
+        # 6000 mm/min, 500 mm/s^2 on all axes
+        self.kinematics = PathCycleTime.Kinematics((100, 100, 100), (500, 500, 500))
+
+    def cycleTime(self, gcode, kinematics=None, feed=10):
+        return PathCycleTime.cycleTime(
+            _path(gcode), kinematics or self.kinematics, feed, feed, feed, feed
+        )
+
+    def test00(self):
+        """Check that without limits the rules of Path.getCycleTime() are kept."""
+        # F parameters, drill cycles and dwells are ignored
+        path = _path("""
+            G0 X0 Y0 Z5
+            G1 Z0 F2
+            G1 X10 F20
+            G2 X10 Y10 I0 J5
+            G0 Z5
+            G81 X20 Y20 Z-3 R2
+            G4 P2
+            """)
+        expected = PathCommandArray.CommandArray(path).cycleTime(10, 5, 100, 50)
+        self.assertRoughly(expected, path.getCycleTime(10, 5, 100, 50))
+        seconds = PathCycleTime.cycleTime(path, PathCycleTime.Kinematics(), 10, 5, 100, 50)
+        self.assertRoughly(seconds, expected)
+        self.assertEqual(PathCycleTime.cycleTime(path, PathCycleTime.Kinematics(), 0, 5, 0, 0), 0)
+
+        # only the tool changes are added
+        kinematics = PathCycleTime.Kinematics(toolChangeTime=5)
+        seconds = PathCycleTime.cycleTime(
+            Path.Path([Path.Command("M6 T1")] + path.Commands), kinematics, 10, 5, 100, 50
+        )
+        self.assertRoughly(seconds, expected + 5)
+
+    def test01(self):
+        """Check the time of a single move against the trapezoidal profile."""
+        # accelerating to 10 mm/s takes 0.02 s and 0.1 mm, the same for decelerating
+        self.assertRoughly(self.cycleTime("G1 X100"), 100 / 10 + 10 / 500)
+        # too short to reach the feed rate
+        self.assertRoughly(self.cycleTime("G1 X0.1"), 2 * math.sqrt(0.1 / 500))
+        # with limits the F parameter of a move is used instead of the feed rate
+        self.assertRoughly(self.cycleTime("G1 X100 F20"), 100 / 20 + 20 / 500)
+
+        # with jerk each ramp takes a / j longer
+        kinematics = PathCycleTime.Kinematics(acceleration=(500,) * 3, jerk=(50000,) * 3)
+        self.assertRoughly(self.cycleTime("G1 X100", kinematics), 100 / 10 + 10 / 500 + 0.01)
+
+    def test02(self):
+        """Check that corners and stops slow down the moves."""
+        straight = self.cycleTime("G1 X50\nG1 X100")
+        self.assertRoughly(straight, self.cycleTime("G1 X100"))
+        corner = self.cycleTime("G1 X50\nG1 X50 Y50")
+        self.assertGreater(corner, straight)
+        # a reversal stops the machine, as does any spindle command in between
+        self.assertRoughly(self.cycleTime("G1 X50\nG1 X0"), 2 * self.cycleTime("G1 X50"))
+        self.assertRoughly(self.cycleTime("G1 X50\nM5\nG1 X100"), 2 * self.cycleTime("G1 X50"))
+        # a smooth transition into an arc does not stop the machine
+        tangent = self.cycleTime("G1 X50\nG3 X50 Y100 I0 J50")
+        stopped = self.cycleTime("G1 X50") + self.cycleTime("G3 X0 Y100 I0 J50")
+        self.assertLess(tangent, stopped)
+
+    def test03(self):
+        """Check that the speed on arcs is limited by the centripetal acceleration."""
+        # a 1 mm radius allows sqrt(500 * 1) mm/s
+        seconds = self.cycleTime("G1 X1\nG3 X1 Y0 I-1 J0", feed=100)
+        self.assertGreater(seconds, 2 * math.pi / math.sqrt(500))
+        self.assertLess(seconds, 2 * math.pi / math.sqrt(500) + 0.2)
+
+    def test04(self):
+        """Check rapid moves, dwells, drill cycles and tool changes."""
+        # rapid moves run at the velocity limit of the machine
+        kinematics = PathCycleTime.Kinematics(velocity=(100, 100, 50), toolChangeTime=7)
+        self.assertRoughly(self.cycleTime("G0 X100", kinematics, feed=1), 1)
+        self.assertRoughly(self.cycleTime("G0 Z100", kinematics, feed=1), 2)
+        self.assertRoughly(self.cycleTime("M6 T1\nG4 P2.5", kinematics), 9.5)
+
+        # rapid from Z10 to R2, feed to Z-5 and rapid back to Z10
+        seconds = self.cycleTime("G0 X10 Z10\nG81 X10 Z-5 R2 F1", kinematics, feed=1)
+        self.assertRoughly(seconds, 0.2 + 8 / 50 + 7 + 7 / 50 + 8 / 50)
+
+    def test05(self):
+        """Check that a large path is estimated quickly."""
+        commands = [Path.Command("G0", {"X": 0, "Y": 0, "Z": 1}), Path.Command("G1", {"Z": -1})]
+        for i in range(100000):
+            commands.append(Path.Command("G1", {"X": (i % 100) * 0.1, "Y": (i // 100) * 0.02}))
+        path = Path.Path(commands)
+        kinematics = PathCycleTime.Kinematics((100,) * 3, (500,) * 3, (5000,) * 3)
+
+        start = time.perf_counter()
+        seconds = PathCycleTime.cycleTime(path, kinematics, 20, 10, 0, 0)
+        Path.Log.info("100000 moves estimated in {:.2f} s".format(time.perf_counter() - start))
+        self.assertGreater(seconds, path.getCycleTime(20, 10, 0, 0))
+
+    def test10(self):
+        """Check the kinematics of a machine."""
+        machine = Machine.create_3axis_config()
+        for axis in machine.linear_axes.values():
+            axis.max_velocity = 6000
+            axis.max_acceleration = 1000
+        machine.linear_axes["Z"].max_acceleration = 0
+        machine.spindles.append(Spindle("Main", tool_change_time=15))
+
+        kinematics = PathCycleTime.machineKinematics(machine)
+        self.assertEqual(kinematics.velocity.tolist(), [100, 100, 100])
+        # Z gets the limit of the other axes
+        self.assertEqual(kinematics.acceleration.tolist(), [1000, 1000, 1000])
+        self.assertEqual(kinematics.toolChangeTime, 15)
+
+        directory = tempfile.mkdtemp()
+        configDir = MachineFactory._config_dir
+        try:
+            MachineFactory.set_config_directory(directory)
+            MachineFactory.save_configuration(machine, "estimate.fcm")
+            self.job.Machine = machine.name
+            self.assertEqual(PathCycleTime.jobKinematics(self.job).toolChangeTime, 15)
+            self.job.Machine = "missing"
+            self.assertFalse(PathCycleTime.jobKinematics(self.job).limitsVelocity())
+        finally:
+            self.job.Machine = ""
+            MachineFactory._config_dir = configDir
+            shutil.rmtree(pathlib.Path(directory))
+
+    def test11(self):
+        """Estimate a job."""
+        kinematics = PathCycleTime.Kinematics((100,) * 3, (500,) * 3, toolChangeTime=10)
+        result = PathCycleTime.estimate_job(self.job, kinematics)
+
+        op = self.job.Operations.Group[0]
+        tc = op.ToolController
+        seconds = PathCycleTime.cycleTime(
+            op.Path,
+            kinematics,
+            tc.HorizFeed.Value,
+            tc.VertFeed.Value,
+            tc.HorizRapid.Value,
+            tc.VertRapid.Value,
+        )
+        self.assertEqual(result.toolChanges, 1)
+        self.assertRoughly(result.operations[op.Label], seconds)
+        self.assertRoughly(result.tools[tc.ToolNumber], seconds + 10)
+        self.assertRoughly(result.total, sum(result.tools.values()))
@@ -0,0 +1,103 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+# ***************************************************************************
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import FreeCAD
+import Part
+import Path
+import Path.Main.Job as PathJob
+import Path.Op.Fingerprint as PathFingerprint
+import Path.Op.Profile as PathProfile
+import CAMTests.PathTestUtils as PathTestUtils
+
+
+class TestPathOpFingerprint(PathTestUtils.PathTestBase):
+    """Test the fingerprints of operation inputs and the incremental recompute of a job."""
+
+    def setUp(self):
+        self.doc = FreeCAD.newDocument("TestPathOpFingerprint")
+        self.box = self.doc.addObject("Part::Box", "Box")
+        self.box.Length = 40
+        self.box.Width = 30
+        self.box.Height = 10
+        self.doc.recompute()
+        self.incremental = Path.Preferences.incrementalRecomputeEnabled()
+
+    def tearDown(self):
+        Path.Preferences.preferences().SetBool(
+            Path.Preferences.IncrementalRecompute, self.incremental
+        )
+        FreeCAD.closeDocument(self.doc.Name)
+
+    def test00(self):
+        """Test the shape digest changes with the geometry and placement only."""
+        shape = Part.makeBox(10, 10, 10)
+        digest = PathFingerprint.shapeDigest(shape)
+        self.assertEqual(PathFingerprint.shapeDigest(shape.copy()), digest)
+
+        moved = shape.copy()
+        moved.translate(FreeCAD.Vector(0, 0, 1))
+        self.assertNotEqual(PathFingerprint.shapeDigest(moved), digest)
+        self.assertNotEqual(PathFingerprint.shapeDigest(Part.makeBox(10, 10, 11)), digest)
+
+    def test10(self):
+        """Test the changed inputs of two fingerprints."""
+        stored = PathFingerprint.dumps({"StepDown": "a", "Base": "b", "Comment": "c"})
+        self.assertIsNone(PathFingerprint.changedInputs("", {"StepDown": "a"}))
+        self.assertIsNone(PathFingerprint.changedInputs("garbage", {"StepDown": "a"}))
+        self.assertEqual(
+            PathFingerprint.changedInputs(stored, {"StepDown": "a", "Base": "b", "Comment": "c"}),
+            [],
+        )
+        self.assertEqual(
+            PathFingerprint.changedInputs(stored, {"StepDown": "x", "Base": "b", "Tool": "t"}),
+            ["Comment", "StepDown", "Tool"],
+        )
+
+    def test20(self):
+        """Test an operation with unchanged inputs is skipped when it is recomputed."""
+        Path.Preferences.preferences().SetBool(Path.Preferences.IncrementalRecompute, True)
+        job = PathJob.Create("Job", [self.box], None)
+        profile = PathProfile.Create("Profile")
+        self.doc.recompute()
+
+        report = dict((r[0], r[1:]) for r in job.Proxy.recomputeReport())
+        self.assertEqual(report[profile.Label][0], "recomputed")
+        commands = profile.Path.toGCode()
+        self.assertNotEqual(profile.InputFingerprint, "")
+
+        profile.touch()
+        self.doc.recompute()
+        report = dict((r[0], r[1:]) for r in job.Proxy.recomputeReport())
+        self.assertEqual(report[profile.Label], ("skipped", "inputs unchanged"))
+        self.assertEqual(profile.Path.toGCode(), commands)
+
+        profile.Comment = "changed"
+        self.doc.recompute()
+        report = dict((r[0], r[1:]) for r in job.Proxy.recomputeReport())
+        self.assertEqual(report[profile.Label], ("recomputed", "changed: Comment"))
+
+        self.box.Height = 12
+        self.doc.recompute()
+        report = dict((r[0], r[1:]) for r in job.Proxy.recomputeReport())
+        self.assertEqual(report[profile.Label][0], "recomputed")
+        self.assertIn("Job.Model", report[profile.Label][1])
+        self.assertNotEqual(profile.Path.toGCode(), commands)
@@ -0,0 +1,131 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+# ***************************************************************************
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import math
+import os
+import time
+import unittest
+
+import FreeCAD
+import Mesh
+import Part
+import Path
+import Path.Main.Simulation as PathSimulation
+import PathSimulator
+
+from CAMTests.PathTestUtils import PathTestBase
+
+
+def _path(gcode):
+    return Path.Path([Path.Command(line) for line in gcode.strip().splitlines()])
+
+
+class TestPathSimulation(PathTestBase):
+    """Unit tests for the headless heightfield simulation."""
+
+    @classmethod
+    def setUpClass(cls):
+        FreeCAD.ConfigSet("SuppressRecomputeRequiredDialog", "True")
+        cls.doc = FreeCAD.open(FreeCAD.getHomePath() + "/Mod/CAM/CAMTests/boxtest.fcstd")
+        FreeCAD.ConfigSet("SuppressRecomputeRequiredDialog", "")
+        cls.job = cls.doc.getObject("Job")
+
+    @classmethod
+    def tearDownClass(cls):
+        FreeCAD.closeDocument("boxtest")
+
+    def setUp(self):
+        # 10x10x10 stock, 2mm flat end mill, 0.05mm cells
+        self.sim = PathSimulator.PathSim()
+        self.sim.BeginSimulation(Part.makeBox(10, 10, 10), 0.05)
+        self.sim.SetToolShape(Part.makeCylinder(1, 5), 0.05)
+        self.start = FreeCAD.Placement(FreeCAD.Vector(0, 0, 15), FreeCAD.Rotation())
+
+    def test00(self):
+        """Check the volume of a straight slot."""
+        self.assertRoughly(self.sim.GetRemovedVolume(), 0.0)
+        pos = self.sim.ApplyPath(self.start, _path("G0 X-2 Y5\nG1 Z5\nG1 X12"))
+        self.assertCoincide(pos.Base, FreeCAD.Vector(12, 5, 5))
+        self.assertAlmostEqual(self.sim.GetRemovedVolume(), 10 * 2 * 5, delta=10)
+
+    def test01(self):
+        """Check that a full circle arc is linearized into a groove."""
+        self.sim.ApplyPath(self.start, _path("G0 X2 Y5\nG1 Z8\nG3 X2 Y5 I3 J0"))
+        # groove of radius 3 +/- 1 and 2 deep
+        expected = math.pi * (4**2 - 2**2) * 2
+        self.assertAlmostEqual(self.sim.GetRemovedVolume(), expected, delta=0.1 * expected)
+
+    def test02(self):
+        """Check that drill cycles are expanded."""
+        self.sim.ApplyPath(self.start, _path("G0 Z12\nG81 X5 Y5 Z2 R12\nG80"))
+        expected = math.pi * 8
+        self.assertAlmostEqual(self.sim.GetRemovedVolume(), expected, delta=0.15 * expected)
+
+    def test03(self):
+        """Check that cuts below the model are reported as gouges."""
+        model = Mesh.Mesh(Part.makeBox(4, 4, 6, FreeCAD.Vector(3, 3, 0)).tessellate(0.1))
+        self.sim.SetModel(model)
+        self.sim.ApplyPath(self.start, _path("G0 X-2 Y1\nG1 Z6\nG1 X12"))
+        self.assertEqual(self.sim.GetGouges(0.05), [])
+
+        self.sim.ApplyPath(self.start, _path("G0 X-2 Y5\nG1 Z5\nG1 X12"))
+        gouges = self.sim.GetGouges(0.05)
+        self.assertTrue(gouges)
+        for pos, depth in gouges:
+            self.assertTrue(3 < pos.x < 7)
+            self.assertAlmostEqual(depth, 1.0, places=3)
+
+    def test04(self):
+        """Check that many moves are applied in one call."""
+        gcode = ["G0 X0 Y0", "G1 Z9"]
+        for i in range(50000):
+            gcode.append("G1 X{:.2f} Y{:.2f}".format((i % 100) * 0.1, (i // 100) * 0.02))
+        path = Path.Path([Path.Command(line) for line in gcode])
+
+        pos = self.sim.ApplyPath(self.start, path)
+        self.assertCoincide(pos.Base, FreeCAD.Vector(9.9, 9.98, 9))
+        # the rows of moves face the whole top of the stock 1mm deep
+        self.assertAlmostEqual(self.sim.GetRemovedVolume(), 10 * 10 * 1, delta=2)
+
+    @unittest.skipUnless(os.environ.get("CAM_BENCHMARKS"), "set CAM_BENCHMARKS=1 to run")
+    def test05(self):
+        """Benchmark simulating a million moves."""
+        commands = [Path.Command("G0", {"X": 0, "Y": 0}), Path.Command("G1", {"Z": 9})]
+        for i in range(1000000):
+            commands.append(Path.Command("G1", {"X": (i % 100) * 0.1, "Y": (i // 100) * 0.001}))
+        path = Path.Path(commands)
+
+        start = time.perf_counter()
+        self.sim.ApplyPath(self.start, path)
+        Path.Log.info("1000000 moves simulated in {:.2f} s".format(time.perf_counter() - start))
+        self.assertAlmostEqual(self.sim.GetRemovedVolume(), 10 * 10 * 1, delta=2)
+
+    def test10(self):
+        """Simulate a job."""
+        result = PathSimulation.simulate_job(self.job)
+
+        # the profile removes a 5mm wide ring around the 10x10 box, 12mm deep
+        self.assertAlmostEqual(result.removedVolume, 44 * 12, delta=60)
+        self.assertEqual(result.gouges, [])
+        self.assertEqual(result.maxGougeDepth(), 0.0)
+        self.assertGreater(result.stock.CountFacets, 0)
+        self.assertEqual(result.moves, self.job.Operations.Group[0].Path.Size)
@@ -0,0 +1,215 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+# ***************************************************************************
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import array
+import concurrent.futures
+import math
+import os
+import tempfile
+import time
+import unittest
+
+import FreeCAD
+import MeshPart
+import Part
+import Path.Preferences
+import Path.Op.SurfaceSupport as PathSurfaceSupport
+import CAMTests.PathTestUtils as PathTestUtils
+
+try:
+    try:
+        import ocl
+    except ImportError:
+        import opencamlib as ocl
+except ImportError:
+    ocl = None
+
+
+class TestPathSurfaceSupportCache(PathTestUtils.PathTestBase):
+    """Test the LRU eviction and the disk format of the OCL cache."""
+
+    def test00(self):
+        """Test the least recently used entries are evicted first."""
+        cache = PathSurfaceSupport.OCLCache(100)
+        cache._put("scan-a", dict(), 40)
+        cache._put("scan-b", dict(), 40)
+        self.assertIsNotNone(cache._get("scan-a"))
+        cache._put("scan-c", dict(), 40)
+        self.assertIsNone(cache._get("scan-b"))
+        self.assertIsNotNone(cache._get("scan-a"))
+        self.assertIsNotNone(cache._get("scan-c"))
+        self.assertEqual(cache.totalBytes, 80)
+
+    def test10(self):
+        """Test the scans written to the disk cache are read back unchanged."""
+        cache = PathSurfaceSupport.OCLCache(1024 * 1024)
+        scans = {
+            ("L", 0.0, 0.0, 10.0, 0.5): array.array("d", [0.0, 0.0, -1.5, 10.0, 0.5, -0.25]),
+            ("A", 0.0, 0.0, 1.0, 1.0, 0.0, 1.0, True): array.array("d", [1.0, 2.0, 3.0]),
+        }
+        with tempfile.TemporaryDirectory() as cacheDir:
+            cache.scanDirs["scan-key"] = cacheDir
+            cache._writeScans("scan-key", scans)
+            read = cache._readScans(os.path.join(cacheDir, "scan-key.scans"))
+        self.assertEqual(read, scans)
+
+
+@unittest.skipIf(ocl is None, "OpenCamLib is not installed")
+class TestPathSurfaceSupportSTL(PathTestUtils.PathTestBase):
+    """Test the conversion of meshes into OCL STL surfaces."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.mesh = MeshPart.meshFromShape(
+            Shape=Part.makeSphere(50.0),
+            LinearDeflection=0.01,
+            AngularDeflection=0.05,
+        )
+
+    def test00(self):
+        """Test the bulk and per-triangle conversions create the same surface size."""
+        bulk = PathSurfaceSupport._meshToSTL(self.mesh, ocl)
+        single = PathSurfaceSupport._meshToSTL(self.mesh, ocl, bulk=False)
+        self.assertEqual(bulk.size(), self.mesh.CountFacets)
+        self.assertEqual(single.size(), self.mesh.CountFacets)
+
+    @unittest.skipUnless(os.environ.get("CAM_BENCHMARKS"), "set CAM_BENCHMARKS=1 to run")
+    def test10(self):
+        """Benchmark the bulk and the per-triangle conversion in triangles per second."""
+        for bulk in (True, False):
+            start = time.perf_counter()
+            PathSurfaceSupport._meshToSTL(self.mesh, ocl, bulk=bulk)
+            elapsed = time.perf_counter() - start
+            Path.Log.info(
+                "{} conversion: {} triangles in {:.3f} s, {:.0f} triangles/s".format(
+                    "bulk" if bulk else "per-triangle",
+                    self.mesh.CountFacets,
+                    elapsed,
+                    self.mesh.CountFacets / elapsed,
+                )
+            )
+
+    def test20(self):
+        """Test the OCL cache reuses STL surfaces and drop-cutter scans."""
+        cache = PathSurfaceSupport.OCLCache(64 * 1024 * 1024)
+        box = Part.makeBox(20.0, 20.0, 10.0)
+        stl = cache.getSTL(box, 0.01, 0.25, None, ocl)
+        self.assertIs(cache.getSTL(box.copy(), 0.01, 0.25, None, ocl), stl)
+        self.assertIsNot(cache.getSTL(box, 0.02, 0.25, None, ocl), stl)
+
+        # rotating a copy leaves the cached surface unchanged
+        heights = [p.z for t in stl.getTriangles() for p in t.getPoints()]
+        copy = PathSurfaceSupport.copySTL(ocl, stl)
+        copy.rotate(math.radians(90.0), 0.0, 0.0)
+        self.assertEqual(copy.size(), stl.size())
+        self.assertEqual([p.z for t in stl.getTriangles() for p in t.getPoints()], heights)
+
+        cutter = ocl.CylCutter(3.0, 20.0)
+        (key, scans) = cache.getScans(stl, cutter, -1.0, 0.5)
+        self.assertIsNotNone(key)
+        self.assertEqual(cache.getScans(stl, ocl.CylCutter(4.0, 20.0), -1.0, 0.5)[1], {})
+
+        original = PathSurfaceSupport._oclCache
+        PathSurfaceSupport._oclCache = cache
+        try:
+            dc = PathSurfaceSupport.DropCutter(ocl, stl, cutter, -1.0, 0.5)
+            first = dc.scanLine((-5.0, 10.0), (25.0, 10.0))
+            self.assertEqual(len(scans), 1)
+            dc = PathSurfaceSupport.DropCutter(ocl, stl, cutter, -1.0, 0.5)
+            second = dc.scanLine((-5.0, 10.0), (25.0, 10.0))
+            self.assertIsNone(dc.pdc)
+        finally:
+            PathSurfaceSupport._oclCache = original
+        self.assertEqual(len(first), len(second))
+        for p1, p2 in zip(first, second):
+            self.assertCoincide(p1, p2)
+
+    def test30(self):
+        """Test the scans in the scan pool equal the scans in one process."""
+        stl = PathSurfaceSupport._meshToSTL(self.mesh, ocl)
+        cutter = ocl.BallCutter(6.0, 20.0)
+        cutterArgs = ("BallCutter", (6.0, 20.0))
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=3)
+        pool.workers = 3
+        original = PathSurfaceSupport.getScanPool
+        try:
+            PathSurfaceSupport.getScanPool = lambda: None
+            dc = PathSurfaceSupport.DropCutter(ocl, stl, cutter, -60.0, 0.5)
+            expected = dc.scanGrid(-55.0, 55.0, -55.0, 23)
+            steps = [((math.radians(10.0), 0.0, 0.0), ("L", -55.0, 0.0, 0.0, 55.0, 0.0, 0.0))] * 7
+            expectedSteps = PathSurfaceSupport.rotatedDropCutScans(
+                ocl, stl, cutter, 0.0, 0.5, steps
+            )
+
+            PathSurfaceSupport.getScanPool = lambda: pool
+            stl = PathSurfaceSupport._meshToSTL(self.mesh, ocl)
+            dc = PathSurfaceSupport.DropCutter(ocl, stl, cutter, -60.0, 0.5, cutterArgs=cutterArgs)
+            result = dc.scanGrid(-55.0, 55.0, -55.0, 23)
+            resultSteps = PathSurfaceSupport.rotatedDropCutScans(
+                ocl, stl, cutter, 0.0, 0.5, steps, cutterArgs
+            )
+        finally:
+            PathSurfaceSupport.getScanPool = original
+            PathSurfaceSupport.closeScanPool()
+            pool.shutdown()
+
+        self.assertEqual([tuple(p) for p in result], [tuple(p) for p in expected])
+        self.assertEqual(len(resultSteps), len(expectedSteps))
+        for r, e in zip(resultSteps, expectedSteps):
+            self.assertEqual([tuple(p) for p in r], [tuple(p) for p in e])
+
+    def test31(self):
+        """Test the scans in the worker processes equal the scans in one process."""
+        from freecad import utils
+
+        if not utils.get_python_exe():
+            self.skipTest("No Python interpreter found to start the worker processes.")
+        cutter = ocl.BallCutter(6.0, 20.0)
+        cutterArgs = ("BallCutter", (6.0, 20.0))
+        steps = [((math.radians(10.0), 0.0, 0.0), ("L", -55.0, 0.0, 0.0, 55.0, 0.0, 0.0))] * 4
+        prefs = Path.Preferences.preferences()
+        workers = Path.Preferences.oclWorkers()
+        results = []
+        try:
+            for count in (1, 2):
+                prefs.SetInt(Path.Preferences.OCLWorkers, count)
+                stl = PathSurfaceSupport._meshToSTL(self.mesh, ocl)
+                dc = PathSurfaceSupport.DropCutter(
+                    ocl, stl, cutter, -60.0, 0.5, cutterArgs=cutterArgs
+                )
+                grid = dc.scanGrid(-55.0, 55.0, -55.0, 5)
+                rotated = PathSurfaceSupport.rotatedDropCutScans(
+                    ocl, stl, cutter, 0.0, 0.5, steps, cutterArgs
+                )
+                results.append(
+                    (
+                        [tuple(p) for p in grid],
+                        [[tuple(p) for p in scan] for scan in rotated],
+                    )
+                )
+                if count > 1:
+                    self.assertIsNotNone(PathSurfaceSupport._scanPool)
+        finally:
+            prefs.SetInt(Path.Preferences.OCLWorkers, workers)
+            PathSurfaceSupport.closeScanPool()
+
+        self.assertEqual(results[0], results[1])
@@ -117,6 +117,37 @@ class MockAssetWithDeps(Asset):
         return self._dependencies
 
 
+# Mock Asset class that can be copied instead of deserialized again
+class MockReusableAsset(MockAsset):
+    asset_type: str = "mock_reusable_asset"
+    build_count = 0
+
+    @classmethod
+    def from_bytes(
+        cls,
+        data: bytes,
+        id: str,
+        dependencies: Optional[Mapping[AssetUri, Asset]],
+        serializer: Type[AssetSerializer],
+    ) -> "MockReusableAsset":
+        cls.build_count += 1
+        return cls(data, id)
+
+    def copy_for_reuse(self) -> "MockReusableAsset":
+        return MockReusableAsset(self._data, self._id)
+
+
+# MemoryStore that counts the reads
+class CountingMemoryStore(MemoryStore):
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.reads: List[AssetUri] = []
+
+    async def get(self, uri: AssetUri) -> bytes:
+        self.reads.append(uri)
+        return await super().get(uri)
+
+
 class TestPathToolAssetManager(unittest.TestCase):
     def test_register_store(self):
         manager = AssetManager()
@@ -473,6 +504,33 @@ class TestPathToolAssetManager(unittest.TestCase):
         # The test already asserts that the non-existent asset is None, which is the expected behavior.
         manager.get_bulk(uris, store="non_existent_store")
 
+    def test_get_bulk_shared_dependencies(self):
+        store = CountingMemoryStore("memory_shared")
+        manager = AssetManager()
+        manager.register_store(store)
+        manager.register_asset(MockAssetWithDeps, DummyAssetSerializer)
+        manager.register_asset(MockReusableAsset, DummyAssetSerializer)
+        MockReusableAsset.build_count = 0
+
+        dep_uri = manager.add_raw(MockReusableAsset.asset_type, "shared", b"shared", store.name)
+        data = f'{{"deps": ["{dep_uri}"]}}'.encode()
+        uris = [
+            manager.add_raw(MockAssetWithDeps.asset_type, f"id{i}", data, store.name)
+            for i in range(3)
+        ]
+        store.reads.clear()
+
+        assets = cast(List[MockAssetWithDeps], manager.get_bulk(uris, store=store.name))
+
+        # The shared dependency is read and deserialized once, each asset gets a copy
+        self.assertEqual(store.reads.count(dep_uri), 1)
+        self.assertEqual(MockReusableAsset.build_count, 1)
+        deps = [asset.get_dependencies()[dep_uri] for asset in assets]
+        for dep in deps:
+            self.assertIsInstance(dep, MockReusableAsset)
+            self.assertEqual(dep.get_data(), b"shared")
+        self.assertEqual(len({id(dep) for dep in deps}), 3)
+
     def test_fetch(self):
         # Setup AssetManager with a real MemoryStore and MockAsset class
         memory_store = MemoryStore("memory_fetch")
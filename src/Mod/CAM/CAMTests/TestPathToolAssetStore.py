@@ -342,12 +342,12 @@ class TestPathToolFileStore(BaseTestPathToolAssetStore):
 
     def setUp(self):
         super().setUp()
-        asset_type_map = {
+        self.asset_type_map = {
             "*": "{asset_type}/{asset_id}/{version}",
             "special1": "Especial/{asset_id}/{version}",
             "special2": "my/super/{asset_id}.spcl",
         }
-        self.store = FileStore("versioned", self.tmp_path, asset_type_map)
+        self.store = FileStore("versioned", self.tmp_path, self.asset_type_map)
 
     def test_get_latest_version(self):
         async def async_test():
@@ -378,6 +378,65 @@ class TestPathToolFileStore(BaseTestPathToolAssetStore):
 
         asyncio.run(async_test())
 
+    def test_external_changes(self):
+        async def async_test():
+            self.assertEqual(await self.store.count_assets("special2"), 0)
+
+            # Files added and removed by other programs are picked up
+            path = self.tmp_path / "my" / "super" / "external.spcl"
+            path.parent.mkdir(parents=True)
+            path.write_bytes(b"external")
+            uris = await self.store.list_assets("special2")
+            self.assertEqual([uri.asset_id for uri in uris], ["external"])
+
+            path.unlink()
+            self.assertEqual(await self.store.count_assets("special2"), 0)
+
+        asyncio.run(async_test())
+
+    def test_get_case_insensitive(self):
+        async def async_test():
+            path = self.tmp_path / "my" / "super" / "Mixed.spcl"
+            path.parent.mkdir(parents=True)
+            path.write_bytes(b"mixed")
+
+            uri = AssetUri.build(asset_type="special2", asset_id="mixed")
+            self.assertEqual(await self.store.get(uri), b"mixed")
+
+        asyncio.run(async_test())
+
+    def test_persistent_index(self):
+        async def async_test():
+            # Keep the index in a path that matches the "*" mapping
+            index_path = self.tmp_path / "idx" / "store" / "index.json"
+            store = FileStore("indexed", self.tmp_path, self.asset_type_map, index_path)
+            uri = await store.create("special1", "asset1", b"v1")
+            await store.update(uri, b"v2")
+            self.assertEqual(await store.count_assets(), 1)
+            self.assertTrue(index_path.exists())
+
+            reloaded = FileStore("indexed", self.tmp_path, self.asset_type_map, index_path)
+            self.assertEqual(await reloaded.list_versions(uri), await store.list_versions(uri))
+            self.assertEqual(await reloaded.count_assets(), 1)
+
+            # A broken index is rebuilt from the files
+            index_path.write_text("{")
+            rebuilt = FileStore("indexed", self.tmp_path, self.asset_type_map, index_path)
+            self.assertEqual(await rebuilt.count_assets("special1"), 1)
+
+        asyncio.run(async_test())
+
+    def test_set_dir(self):
+        async def async_test():
+            await self.store.create("special2", "asset1", b"data")
+            self.assertEqual(await self.store.count_assets("special2"), 1)
+
+            with tempfile.TemporaryDirectory() as other_dir:
+                self.store.set_dir(pathlib.Path(other_dir))
+                self.assertEqual(await self.store.count_assets("special2"), 0)
+
+        asyncio.run(async_test())
+
 
 class TestPathToolMemoryStore(BaseTestPathToolAssetStore):
     """Test suite for MemoryStore."""
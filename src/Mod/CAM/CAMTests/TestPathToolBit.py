@@ -22,10 +22,15 @@
 # ***************************************************************************
 
 from typing import cast
+import json
 import os
+import time
+import unittest
 import uuid
 import pathlib
+from unittest import mock
 import FreeCAD
+import Path
 from CAMTests.PathTestUtils import PathTestWithAssets
 from Path.Tool.library import Library
 from Path.Tool.shape import ToolBitShapeBullnose
@@ -80,3 +85,60 @@ class TestPathToolBit(PathTestWithAssets):
             # Add more assertions here to check if other attributes are preserved
         except Exception as e:
             self.fail(f"ToolBit is not picklable: {e}")
+
+    def testGetBulkSharedShape(self):
+        """Test that tool bits loaded in bulk get their own copy of a shared shape"""
+        for diameter in (2, 4):
+            attrs = {"name": f"{diameter}mm Endmill", "shape": "endmill.fcstd"}
+            attrs["parameter"] = {"Diameter": f"{diameter} mm"}
+            self.assets.add_raw("toolbit", f"bulk_{diameter}", json.dumps(attrs).encode())
+
+        bit2, bit4 = self.assets.get_bulk(["toolbit://bulk_2", "toolbit://bulk_4"])
+        self.assertIsInstance(bit2, ToolBitEndmill)
+        self.assertIsInstance(bit4, ToolBitEndmill)
+        self.assertIsNot(bit2._tool_bit_shape, bit4._tool_bit_shape)
+        self.assertEqual(bit2.obj.Diameter, FreeCAD.Units.Quantity("2 mm"))
+        self.assertEqual(bit4.obj.Diameter, FreeCAD.Units.Quantity("4 mm"))
+        self.assertEqual(bit2._tool_bit_shape.get_parameter("Diameter"), bit2.obj.Diameter)
+        self.assertEqual(bit4._tool_bit_shape.get_parameter("Diameter"), bit4.obj.Diameter)
+
+    def testGetBulkSharedShapesReadOnce(self):
+        """Test that loading many tool bits in bulk reads each of their shapes once"""
+        shapes = ("endmill", "ballend", "bullnose", "drill", "v-bit")
+        uris = []
+        for i in range(100):
+            attrs = {"name": f"Bulk {i}", "shape": f"{shapes[i % len(shapes)]}.fcstd"}
+            attrs["parameter"] = {"Diameter": f"{1 + i % 20} mm"}
+            uris.append(self.assets.add_raw("toolbit", f"shared_{i}", json.dumps(attrs).encode()))
+
+        with mock.patch.object(self.asset_store, "get", wraps=self.asset_store.get) as read:
+            toolbits = self.assets.get_bulk(uris)
+
+        shape_reads = [
+            call.args[0]
+            for call in read.call_args_list
+            if call.args[0].asset_type == "toolbitshape"
+        ]
+        self.assertEqual(len(shape_reads), len(shapes))
+        self.assertEqual(len(set(shape_reads)), len(shapes))
+        self.assertEqual(len(toolbits), 100)
+        self.assertEqual(toolbits[21].obj.Diameter, FreeCAD.Units.Quantity("2 mm"))
+        self.assertEqual(toolbits[21].obj.ShapeType, "Ballend")
+
+    @unittest.skipUnless(os.environ.get("CAM_BENCHMARKS"), "set CAM_BENCHMARKS=1 to run")
+    def testGetBulkBenchmark(self):
+        """Load a generated library of 10000 tool bits in bulk"""
+        shapes = ("endmill", "ballend", "bullnose", "drill", "v-bit")
+        uris = []
+        for i in range(10000):
+            attrs = {"name": f"Bench {i}", "shape": f"{shapes[i % len(shapes)]}.fcstd"}
+            attrs["parameter"] = {"Diameter": f"{1 + i % 20} mm"}
+            uris.append(self.assets.add_raw("toolbit", f"bench_{i}", json.dumps(attrs).encode()))
+
+        start = time.perf_counter()
+        toolbits = self.assets.get_bulk(uris)
+        Path.Log.info(f"10000 tool bits loaded in {time.perf_counter() - start:.2f} s")
+
+        self.assertEqual(len(toolbits), 10000)
+        self.assertEqual(toolbits[21].obj.Diameter, FreeCAD.Units.Quantity("2 mm"))
+        self.assertEqual(toolbits[21].obj.ShapeType, "Ballend")
@@ -0,0 +1,309 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+# ***************************************************************************
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import random
+import unittest
+
+import numpy
+
+import FreeCAD
+import CAMTests.PathTestUtils as PathTestUtils
+
+try:
+    import Path.Op.Waterline as PathWaterline
+except ImportError:
+    PathWaterline = None
+
+
+# Synthetic scan grids, "#" is above the layer depth and "." below it
+ISLAND = """
+........
+..###...
+..###...
+..###...
+........
+"""
+
+ISLAND_WITH_HOLE = """
+..........
+.#######..
+.##...##..
+.##...##..
+.#######..
+..........
+"""
+
+TOUCHING_POCKETS = """
+##########
+#...#....#
+#...#....#
+#####....#
+#..#######
+#..#.....#
+##########
+"""
+
+TOUCHING_ISLANDS = """
+..........
+.###......
+.###......
+....###...
+....###...
+.......##.
+..........
+"""
+
+L_SHAPE = """
+.........
+.##......
+.##......
+.######..
+.######..
+.........
+"""
+
+
+def _scanLines(grid):
+    """Return the (lines, points, 3) scan array of a synthetic grid."""
+    rows = grid.strip().splitlines()
+    scan = numpy.zeros((len(rows), len(rows[0]), 3))
+    for lin, row in enumerate(rows):
+        for pt, c in enumerate(row):
+            scan[lin, pt] = (pt * 0.5, lin * 0.5, 1.0 if c == "#" else 0.0)
+    return scan
+
+
+class _ListWaterline:
+    """The waterline loop extraction before the topo map was a NumPy array, as reference.
+
+    The topo map is a list of lists of ints and the scan lines are lists of vectors."""
+
+    def __init__(self, cutClimb):
+        if cutClimb:
+            self.lC = [-1, -1, -1, 0, 1, 1, 1, 0] * 3
+        else:
+            self.lC = [1, 1, 1, 0, -1, -1, -1, 0] * 3
+        self.pC = [-1, 0, 1, 1, 1, 0, -1, -1] * 3
+
+    def loops(self, oclScan, layDep):
+        self.topoMap = [[2 if P.z > layDep else 0 for P in line] for line in oclScan]
+        # buffer
+        for line in self.topoMap:
+            line.insert(0, 0)
+            line.append(0)
+        self.topoMap.insert(0, [0] * len(self.topoMap[0]))
+        self.topoMap.append([0] * len(self.topoMap[0]))
+        self.highlight(4, 9)
+        self.highlighted = [list(line) for line in self.topoMap]
+        return self.extract(oclScan)
+
+    def highlight(self, extraMaterial, insCorn):
+        TM = self.topoMap
+        lastPnt = len(TM[1]) - 1
+        lastLn = len(TM) - 1
+        highFlag = 0
+
+        for lin in range(1, lastLn):
+            for pt in range(1, lastPnt):
+                if TM[lin][pt] == 0:
+                    if TM[lin][pt + 1] == 2:
+                        TM[lin][pt] = 1
+                    if TM[lin][pt - 1] == 2:
+                        TM[lin][pt] = 1
+
+        for pt in range(1, lastPnt):
+            for lin in range(1, lastLn):
+                if TM[lin][pt] == 0:
+                    highFlag = 0
+                    if TM[lin + 1][pt] == 2:
+                        TM[lin][pt] = 1
+                    if TM[lin - 1][pt] == 2:
+                        TM[lin][pt] = 1
+                elif TM[lin][pt] == 2:
+                    highFlag += 1
+                    if highFlag == 3:
+                        if TM[lin - 1][pt - 1] < 2 or TM[lin - 1][pt + 1] < 2:
+                            highFlag = 2
+                        else:
+                            TM[lin - 1][pt] = extraMaterial
+                            highFlag = 2
+
+        for pt in range(1, lastPnt):
+            for lin in range(1, lastLn):
+                if TM[lin][pt] == 1:
+                    cont = True
+                    if TM[lin + 1][pt] == 0:
+                        if TM[lin + 1][pt - 1] == 1:
+                            if TM[lin][pt - 1] == 2:
+                                TM[lin + 1][pt] = 1
+                                cont = False
+
+                        if cont is True and TM[lin + 1][pt + 1] == 1:
+                            if TM[lin][pt + 1] == 2:
+                                TM[lin + 1][pt] = 1
+                        cont = True
+
+                    if TM[lin - 1][pt] == 0:
+                        if TM[lin - 1][pt - 1] == 1:
+                            if TM[lin][pt - 1] == 2:
+                                TM[lin - 1][pt] = 1
+                                cont = False
+
+                        if cont is True and TM[lin - 1][pt + 1] == 1:
+                            if TM[lin][pt + 1] == 2:
+                                TM[lin - 1][pt] = 1
+
+        for pt in range(1, lastPnt):
+            for lin in range(1, lastLn):
+                if TM[lin][pt] == 1:
+                    if TM[lin][pt + 1] == 1:
+                        if TM[lin - 1][pt + 1] == 1 or TM[lin + 1][pt + 1] == 1:
+                            TM[lin][pt + 1] = insCorn
+                    elif TM[lin][pt - 1] == 1:
+                        if TM[lin - 1][pt - 1] == 1 or TM[lin + 1][pt - 1] == 1:
+                            TM[lin][pt - 1] = insCorn
+
+    def extract(self, oclScan):
+        lastPnt = len(self.topoMap[0]) - 1
+        lastLn = len(self.topoMap) - 1
+        loopList = []
+        srch = True
+        srchCnt = 1
+        while srch is True and srchCnt <= 5:
+            srch = False
+            for L in range(1, lastLn):
+                for P in range(1, lastPnt):
+                    if self.topoMap[L][P] == 1:
+                        srch = True
+                        loopList.append(self.track(oclScan, L, P))
+                        self.topoMap[L][P] = 0
+            srchCnt += 1
+        return loopList
+
+    def track(self, oclScan, L, P):
+        loop = [oclScan[L - 1][P - 1]]
+        cur = [L, P, 1]
+        prv = [L, P - 1, 1]
+        for _ in range(200000):
+            nxt = self.findNext(cur[0], cur[1], prv[0], prv[1])
+            loop.append(oclScan[nxt[0] - 1][nxt[1] - 1])
+            self.topoMap[nxt[0]][nxt[1]] = nxt[2]
+            if nxt[0] == L and nxt[1] == P:
+                break
+            elif nxt[0] == cur[0] and nxt[1] == cur[1]:
+                break
+            prv = cur
+            cur = nxt
+        return loop
+
+    def findNext(self, cl, cp, pl, pp):
+        lC, pC = self.lC, self.pC
+        dl = cl - pl
+        dp = cp - pp
+        num = 0
+        s = 0
+        found = False
+        for mtch in range(8):
+            i = mtch + 3
+            if lC[i] == dl and pC[i] == dp:
+                s = i - 3
+                found = True
+                for y in range(1, mtch):
+                    if lC[i + y] == dl and pC[i + y] == dp:
+                        num = 1
+                        break
+                break
+        if found is False:
+            return [cl, cp, num]
+
+        for r in range(0, 8):
+            l = cl + lC[s + r]
+            p = cp + pC[s + r]
+            if self.topoMap[l][p] == 1:
+                return [l, p, num]
+        return [cl, cp, num]
+
+
+@unittest.skipIf(PathWaterline is None, "OpenCamLib is not installed")
+class TestPathWaterline(PathTestUtils.PathTestBase):
+    """Test the loop extraction of the OCL Dropcutter waterline."""
+
+    def extract(self, scanLines, cutClimb, layDep=0.5):
+        """Return the topo map and the loops of the operation and of the reference."""
+        op = PathWaterline.ObjectWaterline.__new__(PathWaterline.ObjectWaterline)
+        op.CutClimb = cutClimb
+        lenSL, pntsPerLine = scanLines.shape[:2]
+        op.topoMap = op._createTopoMap(scanLines, layDep, lenSL, pntsPerLine)
+        op._bufferTopoMap(lenSL, pntsPerLine)
+        op._highlightWaterline(4, 9)
+        highlighted = op.topoMap.tolist()
+        loops = op._extractWaterlines(None, scanLines, 0, layDep)
+
+        ref = _ListWaterline(cutClimb)
+        vectors = [[FreeCAD.Vector(*P) for P in line] for line in scanLines.tolist()]
+        refLoops = ref.loops(vectors, layDep)
+
+        def points(loops):
+            return [[(P.x, P.y, P.z) for P in loop] for loop in loops]
+
+        return (highlighted, points(loops)), (ref.highlighted, points(refLoops))
+
+    def assertSameLoops(self, scanLines):
+        for cutClimb in (False, True):
+            result, expected = self.extract(scanLines, cutClimb)
+            self.assertEqual(result[0], expected[0])
+            self.assertEqual(result[1], expected[1])
+
+    def test00(self):
+        """Verify the loop around a single island."""
+        scanLines = _scanLines(ISLAND)
+        result, expected = self.extract(scanLines, False)
+        self.assertEqual(result, expected)
+        # the loop is closed and runs on the low points around the island,
+        # given as (point, line) of the scan grid
+        points = [(1, 0), (1, 1), (1, 2), (1, 3), (1, 4), (2, 4), (3, 4), (4, 4)]
+        points += [(5, 3), (5, 2), (5, 1), (4, 0), (3, 0), (2, 0), (1, 0)]
+        self.assertEqual(result[1], [[(pt * 0.5, lin * 0.5, 0.0) for (pt, lin) in points]])
+
+    def test01(self):
+        """Verify an island with a hole has an outer and an inner loop."""
+        scanLines = _scanLines(ISLAND_WITH_HOLE)
+        result, expected = self.extract(scanLines, False)
+        self.assertEqual(len(result[1]), 2)
+        self.assertEqual(result, expected)
+        self.assertSameLoops(scanLines)
+
+    def test02(self):
+        """Verify the loops of touching pockets and islands and of concave outlines."""
+        for grid in (TOUCHING_POCKETS, TOUCHING_ISLANDS, L_SHAPE):
+            self.assertSameLoops(_scanLines(grid))
+
+    def test03(self):
+        """Verify the loops of random grids are those of the list based extraction."""
+        rnd = random.Random(7)
+        for _ in range(50):
+            lines, points = (rnd.randint(3, 14), rnd.randint(3, 14))
+            scanLines = numpy.zeros((lines, points, 3))
+            scanLines[:, :, 0] = numpy.arange(points) * 0.5
+            scanLines[:, :, 1] = numpy.arange(lines)[:, None] * 0.5
+            scanLines[:, :, 2] = [[rnd.random() for _ in range(points)] for _ in range(lines)]
+            self.assertSameLoops(scanLines)
@@ -0,0 +1,268 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+# ***************************************************************************
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+"""Test the compiled formatter plan against the per-parameter function dispatch."""
+
+import math
+import os
+import time
+import unittest
+from unittest import mock
+
+import FreeCAD
+
+import Path
+import Path.Post.Utils as PostUtils
+import Path.Post.UtilsParse as PostUtilsParse
+import CAMTests.PathTestUtils as PathTestUtils
+import CAMTests.PostTestMocks as PostTestMocks
+from Path.Post.Processor import PostProcessorFactory, WrapperPost
+
+
+Path.Log.setLevel(Path.Log.Level.DEBUG, Path.Log.thisModule())
+Path.Log.trackModule(Path.Log.thisModule())
+
+
+def _benchmark_commands(count):
+    """Create a path similar to a 3D surfacing job with count commands."""
+    commands = [Path.Command("G0", {"X": 0.0, "Y": 0.0, "Z": 5.0})]
+    for i in range(count):
+        x = (i % 200) * 0.25
+        y = (i // 200) * 0.25
+        z = -1.0 + 0.5 * math.sin(x / 7.0) * math.cos(y / 5.0)
+        if i % 50 == 0:
+            commands.append(
+                Path.Command("G2", {"X": x, "Y": y, "Z": z, "I": 0.5, "J": 0.0, "F": 800.0})
+            )
+        elif i % 200 == 0:
+            commands.append(Path.Command("G0", {"Z": 5.0}))
+        else:
+            commands.append(Path.Command("G1", {"X": x, "Y": y, "Z": z, "F": 1200.0}))
+    return commands
+
+
+def _baseline_iter_parse_a_path(values, pathobj, chunk_size=1000, plan=None):
+    """A copy of UtilsParse.iter_parse_a_path before the formatter plan.
+
+    It calls the functions in values["PARAMETER_FUNCTIONS"] for every parameter
+    and all the check_for_* functions for every command.  The plan is ignored.
+    """
+    current_location = {}  # keep track for no doubles
+    drill_retract_mode = "G98"
+    gcode = []
+    lastcommand = ""
+    motion_location = {}  # keep track of last motion location
+
+    swap_tool_change_order = False
+    if "TOOL_BEFORE_CHANGE" in values and values["TOOL_BEFORE_CHANGE"]:
+        swap_tool_change_order = True
+    current_location.update(
+        # the goal is to have initial values that aren't likely to match
+        # any "real" first parameter values
+        Path.Command(
+            "G0", {axis: 123456789.0 for axis in ("X", "Y", "Z", "U", "V", "W", "A", "B", "C", "F")}
+        ).Parameters
+    )
+    adaptive_op_variables = PostUtilsParse.determine_adaptive_op(values, pathobj)
+
+    path_to_process = pathobj.Path
+    if values["SPLIT_ARCS"]:
+        path_to_process = PostUtils.splitArcs(path_to_process)
+
+    for c in path_to_process.Commands:
+        command = c.Name
+        command_line = []
+
+        if not command:
+            if not values["OUTPUT_BLANK_LINES"]:
+                continue
+
+        if command.startswith("("):
+            if not values["OUTPUT_COMMENTS"]:
+                continue
+            if values["COMMENT_SYMBOL"] != "(" and len(command) > 2:
+                command = PostUtilsParse.create_comment(values, command[1:-1])
+
+        cmd = PostUtilsParse.check_for_an_adaptive_op(
+            values, command, command_line, adaptive_op_variables
+        )
+        if cmd:
+            command = cmd
+        command_line.append(command)
+        if values["MODAL"] and command == lastcommand:
+            command_line.pop(0)
+
+        for parameter in values["PARAMETER_ORDER"]:
+            if parameter in c.Parameters:
+                parameter_value = values["PARAMETER_FUNCTIONS"][parameter](
+                    values,
+                    command,
+                    parameter,
+                    c.Parameters[parameter],
+                    c.Parameters,
+                    current_location,
+                )
+                if parameter_value:
+                    command_line.append(f"{parameter}{parameter_value}")
+
+        PostUtilsParse.set_adaptive_op_speed(
+            values, command, command_line, c.Parameters, adaptive_op_variables
+        )
+        lastcommand = command
+        current_location.update(c.Parameters)
+        if command in ("G90", "G91"):
+            values["MOTION_MODE"] = command
+        elif command in ("G98", "G99"):
+            drill_retract_mode = command
+        if command in values["MOTION_COMMANDS"]:
+            motion_location.update(c.Parameters)
+        if PostUtilsParse.check_for_drill_translate(
+            values,
+            gcode,
+            command,
+            command_line,
+            c.Parameters,
+            motion_location,
+            drill_retract_mode,
+        ):
+            command_line = []
+        PostUtilsParse.check_for_spindle_wait(values, gcode, command, command_line)
+        if PostUtilsParse.check_for_tool_change(values, gcode, command, command_line):
+            command_line = []
+        if PostUtilsParse.check_for_suppressed_commands(values, gcode, command, command_line):
+            command_line = []
+
+        if command_line:
+            if command in ("M6", "M06") and swap_tool_change_order:
+                command_line = [command_line[1], command_line[0]]
+            # Add a line number to the front of the command line
+            linenumber = PostUtilsParse.linenumber(values)
+            gcode.append(f"{linenumber}{PostUtilsParse.format_command_line(values, command_line)}")
+
+        PostUtilsParse.check_for_tlo(values, gcode, command, c.Parameters)
+        PostUtilsParse.check_for_machine_specific_commands(values, gcode, command)
+
+        if len(gcode) >= chunk_size:
+            yield gcode
+            gcode = []
+
+    if gcode:
+        yield gcode
+
+
+class TestPostFormatterPlan(PathTestUtils.PathTestBase):
+    """Compare the compiled formatter plan with the per-parameter function dispatch."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.job, cls.profile_op, cls.tool_controller = (
+            PostTestMocks.create_default_job_with_operation()
+        )
+        cls.profile_op.Path = Path.Path(_benchmark_commands(2000))
+        cls.script_dir = os.path.join(os.path.dirname(PostUtilsParse.__file__), "scripts")
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def setUp(self):
+        self.maxDiff = None
+
+    def tearDown(self):
+        pass
+
+    def _export(self, post, args, compile_formatters, baseline=False):
+        """Export the job using or not using the compiled formatter plan.
+
+        With baseline the path is parsed by the copy of the parsing before the plan.
+        """
+        post.reinitialize()
+        post.values["COMPILE_FORMATTERS"] = compile_formatters
+        self.job.PostProcessorArgs = args
+        start = time.perf_counter()
+        if baseline:
+            with mock.patch.object(
+                PostUtilsParse, "iter_parse_a_path", _baseline_iter_parse_a_path
+            ):
+                gcode = post.export()
+        else:
+            gcode = post.export()
+        return gcode, time.perf_counter() - start
+
+    def _postprocessors(self):
+        """Yield the name and postprocessor of every script that uses UtilsParse."""
+        for filename in sorted(os.listdir(self.script_dir)):
+            if not filename.endswith("_post.py"):
+                continue
+            name = filename[: -len("_post.py")]
+            post = PostProcessorFactory.get_post_processor(self.job, name)
+            # legacy scripts do not use UtilsParse at all
+            if post is None or isinstance(post, WrapperPost):
+                continue
+            if "COMPILE_FORMATTERS" not in getattr(post, "values", {}):
+                continue
+            yield name, post
+
+    def test000(self):
+        """Test the plan produces the output of the parsing before it for every postprocessor."""
+        compared = []
+        for name, post in self._postprocessors():
+            for args in (
+                "--no-header --no-show-editor",
+                "--no-header --no-show-editor --line-numbers --modal --axis-modal",
+                "--no-header --no-show-editor --inches --precision=5",
+            ):
+                with self.subTest(post=name, args=args):
+                    expected, _ = self._export(post, args, False, baseline=True)
+                    for compile_formatters in (False, True):
+                        gcode, _ = self._export(post, args, compile_formatters)
+                        self.assertEqual(gcode, expected)
+            compared.append(name)
+        self.assertIn("generic", compared)
+
+    @unittest.skipUnless(os.environ.get("CAM_BENCHMARKS"), "set CAM_BENCHMARKS=1 to run")
+    def test001(self):
+        """Benchmark the compiled plan, it must post at least 5 times faster."""
+        post = PostProcessorFactory.get_post_processor(self.job, "generic")
+        path = self.profile_op.Path
+        try:
+            self.profile_op.Path = Path.Path(_benchmark_commands(20000))
+            args = "--no-header --no-show-editor"
+            expected, expected_time = self._export(post, args, False, baseline=True)
+            gcode, gcode_time = self._export(post, args, True)
+        finally:
+            self.profile_op.Path = path
+        self.assertEqual(gcode, expected)
+        self.assertGreaterEqual(expected_time / gcode_time, 5.0)
+
+    def test010(self):
+        """Test replaced parameter functions are still called by the compiled plan."""
+        post = PostProcessorFactory.get_post_processor(self.job, "generic")
+        post.reinitialize()
+        post.values["PARAMETER_FUNCTIONS"]["X"] = (
+            lambda values, command, param, param_value, parameters, current_location: "CUSTOM"
+        )
+        plan = PostUtilsParse.compile_formatter_plan(post.values)
+        formatters = dict(plan.formatters("G1", {"X": 1.0, "Y": 2.0}))
+        self.assertEqual(list(formatters), ["X", "Y"])
+        self.assertEqual(formatters["X"](1.0, {"X": 1.0, "Y": 2.0}, {}), "CUSTOM")
+        self.assertEqual(formatters["Y"](2.0, {"X": 1.0, "Y": 2.0}, {}), "2.000")
@@ -0,0 +1,284 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+# ***************************************************************************
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "CAM Command Array"
+__author__ = ""
+__url__ = "https://www.freecad.org"
+__doc__ = "Columnar representation of a toolpath and a vectorised machine state tracker"
+__contributors__ = ""
+
+import math
+
+import numpy
+
+import FreeCAD
+import Path
+import Path.Base.MachineState as PathMachineState
+
+if False:
+    Path.Log.setLevel(Path.Log.Level.DEBUG, Path.Log.thisModule())
+    Path.Log.trackModule(Path.Log.thisModule())
+else:
+    Path.Log.setLevel(Path.Log.Level.INFO, Path.Log.thisModule())
+
+
+Axes = ("X", "Y", "Z", "A", "B", "C")
+StateFields = Axes + ("F", "S", "T")
+# I, J, K, R and P are not part of the machine state but needed for arcs, drill cycles and dwells
+Fields = StateFields + ("I", "J", "K", "R", "P")
+
+CommandDType = numpy.dtype([("opcode", numpy.int32)] + [(f, numpy.float64) for f in Fields])
+StateDType = numpy.dtype(
+    [(f, numpy.float64) for f in StateFields] + [("Spindle", numpy.int8), ("WCS", numpy.int8)]
+)
+
+SpindleOff = 0
+SpindleCW = 1
+SpindleCCW = -1
+
+
+def _fill(values, initial):
+    """_fill(values, initial) ... return values with each NaN replaced by the value before it.
+    Leading NaNs are replaced by initial."""
+    index = numpy.where(numpy.isnan(values), 0, numpy.arange(1, len(values) + 1))
+    numpy.maximum.accumulate(index, out=index)
+    return numpy.concatenate(([initial], values))[index]
+
+
+class CommandArray:
+    """CommandArray(commands) ... columnar copy of a toolpath.
+
+    commands is a Path.Path or a list of Path.Command. The commands are converted once into
+    the structured array 'commands' with one row per command, the index of the command name
+    in 'names' as opcode and NaN for every parameter the command does not have. All other
+    functions work on that array and do not access the commands again.
+
+    The machine state follows the same rules as Path.Base.MachineState.MachineState, which
+    means all coordinates are absolute and drill cycles do not change Z."""
+
+    def __init__(self, commands):
+        if hasattr(commands, "Commands"):
+            commands = commands.Commands
+        opcodes = {}
+        ops = []
+        parameters = []
+        for cmd in commands:
+            ops.append(opcodes.setdefault(cmd.Name, len(opcodes)))
+            parameters.append(cmd.Parameters)
+        self.names = list(opcodes)
+        self.commands = numpy.empty(len(ops), dtype=CommandDType)
+        self.commands["opcode"] = ops
+        # filled column by column, most fields are not used by any command
+        used = set().union(*parameters)
+        for f in Fields:
+            if f in used:
+                self.commands[f] = [p.get(f, math.nan) for p in parameters]
+            else:
+                self.commands[f] = math.nan
+        self.opcodes = numpy.ascontiguousarray(self.commands["opcode"])
+        self._state = {}
+        self._positions = None
+        self._distances = None
+
+    def __len__(self):
+        return len(self.commands)
+
+    def isCommand(self, names):
+        """isCommand(names) ... return a boolean array which is True for every command in names."""
+        table = numpy.array([name in names for name in self.names] + [False])
+        return table[self.opcodes]
+
+    def _indices(self, names):
+        """_indices(names) ... return the indices of the commands in names."""
+        return numpy.flatnonzero(self.isCommand(names))
+
+    def _lookup(self, values):
+        """_lookup(values) ... return the value for the name of each command, NaN if it has none."""
+        table = numpy.array([values.get(name, math.nan) for name in self.names] + [math.nan])
+        return table[self.opcodes]
+
+    def state(self, field):
+        """state(field) ... return the value of field of the machine state after each command.
+        field is one of StateFields."""
+        if field in self._state:
+            return self._state[field]
+
+        # only keep the parameters MachineState.addCommand takes from each command
+        column = self.commands[field].copy()
+        column[self._indices(PathMachineState.MachineState().WCSLIST)] = math.nan
+        column[self._indices(["M2", "M5"])] = 0.0 if field == "S" else math.nan
+        if field == "T":
+            column = numpy.trunc(column)
+        else:
+            column[self._indices(["M6"])] = math.nan
+        if field != "S":
+            column[self._indices(["M3", "M4"])] = math.nan
+        if field == "Z":
+            column[self._indices(Path.Geom.CmdMoveDrill)] = math.nan
+
+        self._state[field] = _fill(column, math.nan if field == "T" else 0.0)
+        return self._state[field]
+
+    def states(self):
+        """states() ... return the machine state after each command as a structured array.
+        Row i holds the values MachineState.getState() returns after adding command i, the
+        spindle as SpindleOff, SpindleCW or SpindleCCW and the WCS as index into
+        MachineState.WCSLIST."""
+        wcsList = PathMachineState.MachineState().WCSLIST
+        states = numpy.empty(len(self.commands), dtype=StateDType)
+        for f in StateFields:
+            states[f] = self.state(f)
+        spindle = {"M3": SpindleCW, "M4": SpindleCCW, "M2": SpindleOff, "M5": SpindleOff}
+        states["Spindle"] = _fill(self._lookup(spindle), SpindleOff)
+        wcsIndex = self._lookup({name: i for i, name in enumerate(wcsList)})
+        states["WCS"] = _fill(wcsIndex, wcsList.index("G54"))
+        return states
+
+    def positions(self):
+        """positions() ... return the (n, 3) array of the XYZ position after each command."""
+        if self._positions is None:
+            # one more row for the start position of the first command
+            self._positions = numpy.zeros((len(self.commands) + 1, 3))
+            for i, f in enumerate(("X", "Y", "Z")):
+                self._positions[1:, i] = self.state(f)
+        return self._positions[1:]
+
+    def startPositions(self):
+        """startPositions() ... return the (n, 3) array of the XYZ position before each command."""
+        self.positions()
+        return self._positions[:-1]
+
+    def arcs(self):
+        """arcs() ... return the mask, centers, radii, start angles and signed sweeps of the arcs.
+        Arcs are in the XY plane with the center relative to the start point."""
+        arcs = self.isCommand(Path.Geom.CmdMoveArc)
+        start = self.startPositions()[arcs]
+        end = self.positions()[arcs]
+        offset = numpy.nan_to_num(
+            numpy.stack((self.commands["I"][arcs], self.commands["J"][arcs]), axis=1)
+        )
+        center = start[:, :2] + offset
+        radius = numpy.hypot(offset[:, 0], offset[:, 1])
+        a0 = numpy.arctan2(start[:, 1] - center[:, 1], start[:, 0] - center[:, 0])
+        a1 = numpy.arctan2(end[:, 1] - center[:, 1], end[:, 0] - center[:, 0])
+
+        ccw = self.isCommand(Path.Geom.CmdMoveCCW)[arcs]
+        sweep = numpy.where(ccw, a1 - a0, a0 - a1) % (2 * math.pi)
+        # start and end point coincide for a full circle
+        sweep[numpy.isclose(sweep, 0.0) | numpy.isclose(sweep, 2 * math.pi)] = 2 * math.pi
+        sweep[~ccw] *= -1
+        return (arcs, center, radius, a0, sweep)
+
+    def distances(self):
+        """distances() ... return the length of the move of each command, 0 for other commands."""
+        if self._distances is not None:
+            return self._distances
+
+        start = self.startPositions()
+        end = self.positions()
+        distances = numpy.zeros(len(self.commands))
+        lines = self.isCommand(Path.Geom.CmdMoveRapid + Path.Geom.CmdMoveStraight)
+        distances[lines] = numpy.linalg.norm(end[lines] - start[lines], axis=1)
+
+        arcs, _, radius, _, sweep = self.arcs()
+        dz = end[arcs, 2] - start[arcs, 2]
+        distances[arcs] = numpy.hypot(radius * numpy.abs(sweep), dz)
+        self._distances = distances
+        return distances
+
+    def rapidDistance(self):
+        """rapidDistance() ... return the total length of all rapid moves."""
+        return float(self.distances()[self.isCommand(Path.Geom.CmdMoveRapid)].sum())
+
+    def feedDistance(self):
+        """feedDistance() ... return the total length of all straight and arc feed moves."""
+        feeds = self.isCommand(Path.Geom.CmdMoveStraight + Path.Geom.CmdMoveArc)
+        return float(self.distances()[feeds].sum())
+
+    def moveTimes(self, hFeed, vFeed, hRapid, vRapid):
+        """moveTimes(hFeed, vFeed, hRapid, vRapid) ... return the time in seconds of each move.
+        Uses the same rules as Path.Path.getCycleTime(): moves that change Z use the vertical
+        rates, the feed rates are used for rapid moves if the rapid rates are 0, F parameters
+        are ignored and all other commands take no time."""
+        if hFeed == 0 or vFeed == 0:
+            return numpy.zeros(len(self.commands))
+        if hRapid == 0:
+            hRapid = hFeed
+        if vRapid == 0:
+            vRapid = vFeed
+
+        vertical = self.startPositions()[:, 2] != self.positions()[:, 2]
+        rapid = self.isCommand(Path.Geom.CmdMoveRapid)
+        rates = numpy.where(vertical, vFeed, hFeed)
+        rates[rapid] = numpy.where(vertical[rapid], vRapid, hRapid)
+        return self.distances() / rates
+
+    def cycleTime(self, hFeed, vFeed, hRapid, vRapid):
+        """cycleTime(hFeed, vFeed, hRapid, vRapid) ... return the time in seconds to run all moves.
+        See moveTimes()."""
+        return float(self.moveTimes(hFeed, vFeed, hRapid, vRapid).sum())
+
+    def boundBox(self, mask=None):
+        """boundBox(mask=None) ... return the FreeCAD.BoundBox of all moves or of the moves in mask.
+        Includes the start point of each move, the extremes of arcs and the depth and retract
+        height of drill cycles."""
+        moves = self.isCommand(Path.Geom.CmdMoveAll)
+        if mask is not None:
+            moves &= mask
+        end = self.positions()
+        # row i of self._positions is the start and row i + 1 the end of command i
+        ends = numpy.zeros(len(moves) + 1, dtype=bool)
+        ends[:-1] = moves
+        ends[1:] |= moves
+        points = [self._positions[ends]]
+
+        arcs, center, radius, a0, sweep = self.arcs()
+        selected = moves[arcs]
+        z = end[arcs, 2]
+        for quadrant in range(4):
+            angle = quadrant * math.pi / 2
+            delta = numpy.where(sweep > 0, angle - a0, a0 - angle) % (2 * math.pi)
+            hit = selected & (delta <= numpy.abs(sweep))
+            points.append(
+                numpy.stack(
+                    (
+                        center[hit, 0] + radius[hit] * math.cos(angle),
+                        center[hit, 1] + radius[hit] * math.sin(angle),
+                        z[hit],
+                    ),
+                    axis=1,
+                )
+            )
+
+        drill = self.isCommand(Path.Geom.CmdMoveDrill) & moves
+        for f in ("Z", "R"):
+            depth = drill & ~numpy.isnan(self.commands[f])
+            points.append(
+                numpy.stack((end[depth, 0], end[depth, 1], self.commands[f][depth]), axis=1)
+            )
+
+        points = numpy.concatenate(points)
+        if len(points) == 0:
+            return FreeCAD.BoundBox()
+        lo = points.min(axis=0)
+        hi = points.max(axis=0)
+        return FreeCAD.BoundBox(lo[0], lo[1], lo[2], hi[0], hi[1], hi[2])
@@ -22,10 +22,12 @@
 # *                                                                         *
 # ***************************************************************************
 
+import math
+import numpy
 import Part
 import Path
 from FreeCAD import Vector
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 if False:
     Path.Log.setLevel(Path.Log.Level.DEBUG, Path.Log.thisModule())
@@ -34,19 +36,249 @@ else:
     Path.Log.setLevel(Path.Log.Level.INFO, Path.Log.thisModule())
 
 
+# number of cells along the longer side of the solids if no resolution is given
+HEIGHTFIELD_CELLS = 200
+# number of links of an operation from which building a heightfield pays off
+HEIGHTFIELD_LINKS = 10
+
+
+class HeightField:
+    """
+    Z-max heightfield of solids for fast collision checks of linking moves.
+
+    The XY bounding box of the solids is split into square cells, each cell holds
+    the highest point of the solids above it. Everything below that point counts
+    as material, so a move is never reported collision free if it touches the
+    solids, but it may be reported colliding up to a cell next to the solids or
+    below an overhang. Build it once per operation and pass it to
+    get_linking_moves() and check_collision() instead of the solids.
+    """
+
+    def __init__(
+        self,
+        solids: List[Part.Shape],
+        resolution: Optional[float] = None,
+        deflection: Optional[float] = None,
+    ):
+        solids = [s for s in solids if s and not s.isNull()]
+        bb = None
+        for solid in solids:
+            if bb is None:
+                bb = solid.BoundBox
+            else:
+                bb.add(solid.BoundBox)
+
+        if resolution is None:
+            longest = max(bb.XLength, bb.YLength) if bb else 0
+            resolution = longest / HEIGHTFIELD_CELLS if longest > 0 else 1.0
+        if resolution <= 0:
+            raise ValueError("Resolution must be positive")
+        if deflection is None:
+            deflection = resolution / 4
+
+        self.resolution = resolution
+        self.deflection = deflection
+        if bb is None:
+            self.origin = (0.0, 0.0)
+            self.nx = self.ny = 0
+        else:
+            # one empty cell all around, so the solids never touch the border
+            self.origin = (bb.XMin - resolution, bb.YMin - resolution)
+            self.nx = int(math.ceil(bb.XLength / resolution)) + 2
+            self.ny = int(math.ceil(bb.YLength / resolution)) + 2
+        z = numpy.full((self.ny, self.nx), -math.inf)
+        for solid in solids:
+            points, triangles = solid.tessellate(deflection)
+            if triangles:
+                _add_triangles(
+                    z,
+                    numpy.array([self._to_grid(p) for p in points]),
+                    numpy.array(triangles, dtype=int),
+                )
+        # tessellated curved faces lie up to the deflection below the faces
+        z += deflection
+        # the checks read a few cells at a time, which is faster from a list
+        self._z = z.ravel().tolist()
+
+    def _to_grid(self, p) -> tuple:
+        return (
+            (p.x - self.origin[0]) / self.resolution,
+            (p.y - self.origin[1]) / self.resolution,
+            p.z,
+        )
+
+    def _rows(self, p: tuple, q: tuple, r: float):
+        """Yield (j, i0, i1, t0, t1) for the cells within r of the segment p-q,
+        row by row, and the parameter range of the segment in the row."""
+        # widen a little, so rounding never drops a cell the segment touches
+        r += 1e-9
+        u0, v0, u1, v1 = p[0], p[1], q[0], q[1]
+        j0 = max(0, math.floor(min(v0, v1) - r))
+        j1 = min(self.ny - 1, math.floor(max(v0, v1) + r))
+        for j in range(j0, j1 + 1):
+            low, high = j - r, j + 1 + r
+            if v0 == v1:
+                if not low <= v0 <= high:
+                    continue
+                t0, t1 = 0.0, 1.0
+            else:
+                ta = (low - v0) / (v1 - v0)
+                tb = (high - v0) / (v1 - v0)
+                t0 = max(0.0, min(ta, tb))
+                t1 = min(1.0, max(ta, tb))
+                if t0 > t1:
+                    continue
+            ua = u0 + (u1 - u0) * t0
+            ub = u0 + (u1 - u0) * t1
+            i0 = max(0, math.floor(min(ua, ub) - r))
+            i1 = min(self.nx - 1, math.floor(max(ua, ub) + r))
+            if i0 <= i1:
+                yield j, i0, i1, t0, t1
+
+    def max_z(self, start: Vector, end: Vector, tolerance: float = 0.0) -> float:
+        """
+        Return the highest point of the solids within tolerance of the XY
+        projection of the segment from start to end, -inf if there is none.
+        """
+        z = -math.inf
+        r = tolerance / self.resolution
+        for j, i0, i1, _, _ in self._rows(self._to_grid(start), self._to_grid(end), r):
+            row = j * self.nx
+            z = max(z, max(self._z[row + i0 : row + i1 + 1]))
+        return z
+
+    def is_segment_collision_free(
+        self, start: Vector, end: Vector, tolerance: float = 0.001
+    ) -> bool:
+        """Return True if the segment from start to end keeps tolerance from the solids."""
+        p = self._to_grid(start)
+        q = self._to_grid(end)
+        r = tolerance / self.resolution
+        for j, i0, i1, t0, t1 in self._rows(p, q, r):
+            low = min(p[2] + (q[2] - p[2]) * t0, p[2] + (q[2] - p[2]) * t1)
+            row = j * self.nx
+            if max(self._z[row + i0 : row + i1 + 1]) + tolerance > low:
+                return False
+        return True
+
+    def is_path_collision_free(self, points: Sequence[Vector], tolerance: float = 0.001) -> bool:
+        """Return True if the polyline through points keeps tolerance from the solids."""
+        return all(
+            self.is_segment_collision_free(points[k], points[k + 1], tolerance)
+            for k in range(len(points) - 1)
+        )
+
+
+def _add_triangles(z: numpy.ndarray, uvz: numpy.ndarray, triangles: numpy.ndarray):
+    """
+    Raise the cells of z to the highest point of the triangles above them.
+
+    uvz holds the points in grid coordinates, triangles the indices of their corners.
+    The highest point of a triangle above a cell is a corner of the triangle clipped
+    to the cell: a corner of the triangle, a crossing of an edge with a grid line or
+    a grid point inside the triangle. Each of these raises the cells it touches.
+    """
+    _raise_cells(z, uvz)
+
+    edges = numpy.concatenate((triangles[:, [0, 1]], triangles[:, [1, 2]], triangles[:, [2, 0]]))
+    edges = numpy.unique(numpy.sort(edges, axis=1), axis=0)
+    p = uvz[edges[:, 0]]
+    q = uvz[edges[:, 1]]
+    for axis in (0, 1):
+        crossing = p[:, axis] != q[:, axis]
+        pa = p[crossing]
+        qa = q[crossing]
+        index, line = _integer_ranges(
+            numpy.minimum(pa[:, axis], qa[:, axis]), numpy.maximum(pa[:, axis], qa[:, axis])
+        )
+        pa = pa[index]
+        qa = qa[index]
+        t = (line - pa[:, axis]) / (qa[:, axis] - pa[:, axis])
+        points = pa + (qa - pa) * t[:, numpy.newaxis]
+        points[:, axis] = line
+        _raise_cells(z, points)
+
+    a = uvz[triangles[:, 0]]
+    b = uvz[triangles[:, 1]]
+    c = uvz[triangles[:, 2]]
+    ab = b - a
+    ac = c - a
+    area = ab[:, 0] * ac[:, 1] - ac[:, 0] * ab[:, 1]
+    # vertical triangles have no grid points inside, their edges cover them
+    flat = numpy.abs(area) >= 1e-12
+    a, b, c, ab, ac, area = a[flat], b[flat], c[flat], ab[flat], ac[flat], area[flat]
+    # slope of the plane of each triangle along u and v
+    du = (ab[:, 2] * ac[:, 1] - ac[:, 2] * ab[:, 1]) / area
+    dv = (ac[:, 2] * ab[:, 0] - ab[:, 2] * ac[:, 0]) / area
+
+    # the grid points inside a triangle lie between its edges on each grid row
+    tri, v = _integer_ranges(
+        numpy.minimum(numpy.minimum(a[:, 1], b[:, 1]), c[:, 1]),
+        numpy.maximum(numpy.maximum(a[:, 1], b[:, 1]), c[:, 1]),
+    )
+    low = numpy.full(len(tri), math.inf)
+    high = numpy.full(len(tri), -math.inf)
+    for p, q in ((a, b), (b, c), (c, a)):
+        p = p[tri]
+        q = q[tri]
+        crossing = (numpy.minimum(p[:, 1], q[:, 1]) <= v) & (v <= numpy.maximum(p[:, 1], q[:, 1]))
+        crossing &= p[:, 1] != q[:, 1]
+        t = (v[crossing] - p[crossing, 1]) / (q[crossing, 1] - p[crossing, 1])
+        u = p[crossing, 0] + (q[crossing, 0] - p[crossing, 0]) * t
+        low[crossing] = numpy.minimum(low[crossing], u)
+        high[crossing] = numpy.maximum(high[crossing], u)
+    rows = low <= high
+    tri, v, low, high = tri[rows], v[rows], low[rows], high[rows]
+    row, u = _integer_ranges(low, high)
+    tri = tri[row]
+    v = v[row]
+    points = numpy.empty((len(u), 3))
+    points[:, 0] = u
+    points[:, 1] = v
+    points[:, 2] = a[tri, 2] + du[tri] * (u - a[tri, 0]) + dv[tri] * (v - a[tri, 1])
+    _raise_cells(z, points)
+
+
+def _integer_ranges(low: numpy.ndarray, high: numpy.ndarray) -> tuple:
+    """Return (index, n) of all integers n with low[index] <= n <= high[index]."""
+    first = numpy.ceil(low).astype(int)
+    count = numpy.maximum(numpy.floor(high).astype(int) - first + 1, 0)
+    index = numpy.repeat(numpy.arange(len(count)), count)
+    offset = numpy.arange(len(index)) - numpy.repeat(numpy.cumsum(count) - count, count)
+    return index, first[index] + offset
+
+
+def _raise_cells(z: numpy.ndarray, points: numpy.ndarray):
+    """Raise the cells of z to the (u, v, z) points on them, a point on the border
+    of cells raises all of them."""
+    ny, nx = z.shape
+    u = points[:, 0]
+    v = points[:, 1]
+    for i in (numpy.floor(u), numpy.ceil(u) - 1):
+        i = numpy.clip(i, 0, nx - 1).astype(int)
+        for j in (numpy.floor(v), numpy.ceil(v) - 1):
+            j = numpy.clip(j, 0, ny - 1).astype(int)
+            numpy.maximum.at(z, (j, i), points[:, 2])
+
+
 def check_collision(
     start_position: Vector,
     target_position: Vector,
     solids: Optional[List[Part.Shape]] = None,
     tolerance: float = 0.001,
+    heightfield: Optional[HeightField] = None,
 ) -> bool:
     """
     Check if a direct move from start to target would collide with solids.
+    If a heightfield is given it is used instead of the solids.
     Returns True if collision detected, False if path is clear.
     """
     if start_position == target_position:
         return False
 
+    if heightfield is not None:
+        return not heightfield.is_segment_collision_free(start_position, target_position, tolerance)
+
     # Build collision model
     collision_model = None
     if solids:
@@ -74,6 +306,7 @@ def get_linking_moves(
     solids: Optional[List[Part.Shape]] = None,
     retract_height_offset: Optional[float] = None,
     skip_if_no_collision: bool = False,
+    heightfield: Optional[HeightField] = None,
 ) -> list:
     """
     Generate linking moves from start to target position.
@@ -81,13 +314,16 @@ def get_linking_moves(
     If skip_if_no_collision is True and the direct path at the current height
     is collision-free, returns empty list (useful for canned drill cycles that
     handle their own retraction).
+
+    If a heightfield of the solids is given, the moves are checked against it
+    instead of the solids, which is much faster for many links in one operation.
     """
     if start_position == target_position:
         return []
 
     # For canned cycles: if we're already at a safe height and can move directly, skip linking
     if skip_if_no_collision:
-        if not check_collision(start_position, target_position, solids):
+        if not check_collision(start_position, target_position, solids, heightfield=heightfield):
             return []
 
     if local_clearance > global_clearance:
@@ -98,7 +334,7 @@ def get_linking_moves(
 
     # Collision model
     collision_model = None
-    if solids:
+    if solids and heightfield is None:
         solids = [s for s in solids if s]
         if len(solids) == 1:
             collision_model = solids[0]
@@ -120,26 +356,33 @@ def get_linking_moves(
 
     # Try each height
     for height in heights:
-        wire = make_linking_wire(start_position, target_position, height)
-        if is_wire_collision_free(wire, collision_model):
-            cmds = Path.fromShape(wire).Commands
-            # Ensure all commands have complete XYZ coordinates
-            # Path.fromShape() may omit coordinates that don't change
-            current_pos = start_position
-            complete_cmds = []
-            for i, cmd in enumerate(cmds):
-                params = dict(cmd.Parameters)
-                # Fill in missing coordinates from current position
-                x = params.get("X", current_pos.x)
-                y = params.get("Y", current_pos.y)
-                # For the last command (plunge to target), use target.z if Z is missing
-                if "Z" not in params and i == len(cmds) - 1:
-                    z = target_position.z
-                else:
-                    z = params.get("Z", current_pos.z)
-                complete_cmds.append(Path.Command("G0", {"X": x, "Y": y, "Z": z}))
-                current_pos = Vector(x, y, z)
-            return complete_cmds
+        if heightfield is not None:
+            points = make_linking_points(start_position, target_position, height)
+            if not heightfield.is_path_collision_free(points):
+                continue
+            wire = make_linking_wire(start_position, target_position, height)
+        else:
+            wire = make_linking_wire(start_position, target_position, height)
+            if not is_wire_collision_free(wire, collision_model):
+                continue
+        cmds = Path.fromShape(wire).Commands
+        # Ensure all commands have complete XYZ coordinates
+        # Path.fromShape() may omit coordinates that don't change
+        current_pos = start_position
+        complete_cmds = []
+        for i, cmd in enumerate(cmds):
+            params = dict(cmd.Parameters)
+            # Fill in missing coordinates from current position
+            x = params.get("X", current_pos.x)
+            y = params.get("Y", current_pos.y)
+            # For the last command (plunge to target), use target.z if Z is missing
+            if "Z" not in params and i == len(cmds) - 1:
+                z = target_position.z
+            else:
+                z = params.get("Z", current_pos.z)
+            complete_cmds.append(Path.Command("G0", {"X": x, "Y": y, "Z": z}))
+            current_pos = Vector(x, y, z)
+        return complete_cmds
 
     raise RuntimeError("No collision-free path found between start and target positions")
 
@@ -164,6 +407,11 @@ def make_linking_wire(start: Vector, target: Vector, z: float) -> Part.Wire:
     return Part.Wire(edges) if edges else Part.Wire([Part.makeLine(start, target)])
 
 
+def make_linking_points(start: Vector, target: Vector, z: float) -> List[Vector]:
+    """Return the corners of the linking moves of make_linking_wire()."""
+    return [start, Vector(start.x, start.y, z), Vector(target.x, target.y, z), target]
+
+
 def is_wire_collision_free(
     wire: Part.Wire, solid: Optional[Part.Shape], tolerance: float = 0.001
 ) -> bool:
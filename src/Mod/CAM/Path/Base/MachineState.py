@@ -73,36 +73,57 @@ class MachineState:
 
     def addCommand(self, command):
         """Processes a command and updates the internal state of the machine. Returns true if the command has alterned the machine state"""
-        oldstate = self.getState()
-        if command.Name == "M6":
-            self.T = int(command.Parameters["T"])
-            return not oldstate == self.getState()
-
-        if command.Name in ["M3", "M4"]:
-            self.S = command.Parameters["S"]
-            self.Spindle = "CW" if command.Name == "M3" else "CCW"
-            return not oldstate == self.getState()
-
-        if command.Name in ["M2", "M5"]:
+        oldstate = self._stateTuple()
+        name = command.Name
+        params = command.Parameters
+        if name == "M6":
+            self.T = int(params["T"])
+            return oldstate != self._stateTuple()
+
+        if name in ["M3", "M4"]:
+            self.S = params["S"]
+            self.Spindle = "CW" if name == "M3" else "CCW"
+            return oldstate != self._stateTuple()
+
+        if name in ["M2", "M5"]:
             self.S = 0
             self.Spindle = "off"
-            return not oldstate == self.getState()
+            return oldstate != self._stateTuple()
 
-        if command.Name in self.WCSLIST:
-            self.WCS = command.Name
-            return not oldstate == self.getState()
+        if name in self.WCSLIST:
+            self.WCS = name
+            return oldstate != self._stateTuple()
 
-        if command.Name in Path.Geom.CmdMoveDrill:
+        if name in Path.Geom.CmdMoveDrill:
             oldZ = self.Z
-            for p in command.Parameters:
-                self.__setattr__(p, command.Parameters[p])
-            self.__setattr__("Z", oldZ)
-            return not oldstate == self.getState()
+            for p, value in params.items():
+                setattr(self, p, value)
+            self.Z = oldZ
+            return oldstate != self._stateTuple()
+
+        for p, value in params.items():
+            setattr(self, p, value)
 
-        for p in command.Parameters:
-            self.__setattr__(p, command.Parameters[p])
+        return oldstate != self._stateTuple()
 
-        return not oldstate == self.getState()
+    def _stateTuple(self):
+        """
+        Returns the values of getState() as a tuple, which is cheaper to create and compare
+        """
+        return (
+            self.X,
+            self.Y,
+            self.Z,
+            self.A,
+            self.B,
+            self.C,
+            self.F,
+            self.Coolant,
+            self.WCS,
+            self.Spindle,
+            self.S,
+            self.T,
+        )
 
     def getState(self):
         """
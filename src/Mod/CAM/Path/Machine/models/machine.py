@@ -194,6 +194,9 @@ class LinearAxis:
     max_limit: float = 1000
     max_velocity: float = 10000
     sequence: int = 0
+    # Acceleration in mm/s^2 and jerk in mm/s^3, 0 if not limited
+    max_acceleration: float = 0
+    max_jerk: float = 0
 
     def __post_init__(self):
         """Normalize direction vector and validate parameters after initialization"""
@@ -228,6 +231,8 @@ class LinearAxis:
             "max_limit": self.max_limit,
             "max_velocity": self.max_velocity,
             "sequence": self.sequence,
+            "max_acceleration": self.max_acceleration,
+            "max_jerk": self.max_jerk,
         }
 
     @classmethod
@@ -243,6 +248,8 @@ class LinearAxis:
             data.get("max_limit", 1000),
             data.get("max_velocity", 10000),
             data.get("sequence", 0),
+            data.get("max_acceleration", 0),
+            data.get("max_jerk", 0),
         )
 
 
@@ -257,6 +264,9 @@ class RotaryAxis:
     max_velocity: float = 36000
     sequence: int = 0
     prefer_positive: bool = True
+    # Acceleration in deg/s^2 and jerk in deg/s^3, 0 if not limited
+    max_acceleration: float = 0
+    max_jerk: float = 0
 
     def __post_init__(self):
         """Normalize rotation vector and validate parameters after initialization"""
@@ -296,6 +306,8 @@ class RotaryAxis:
             "max_velocity": self.max_velocity,
             "sequence": self.sequence,
             "prefer_positive": self.prefer_positive,
+            "max_acceleration": self.max_acceleration,
+            "max_jerk": self.max_jerk,
         }
 
     @classmethod
@@ -312,6 +324,8 @@ class RotaryAxis:
             data.get("max_velocity", 36000),
             data.get("sequence", 0),
             data.get("prefer_positive", True),
+            data.get("max_acceleration", 0),
+            data.get("max_jerk", 0),
         )
 
 
@@ -326,6 +340,7 @@ class Spindle:
     min_rpm: float = 0
     tool_change: str = "manual"
     tool_axis: Optional[FreeCAD.Vector] = None
+    tool_change_time: float = 0  # seconds
 
     def __post_init__(self):
         """Set default tool axis if not provided"""
@@ -341,6 +356,7 @@ class Spindle:
             "min_rpm": self.min_rpm,
             "tool_change": self.tool_change,
             "tool_axis": [self.tool_axis.x, self.tool_axis.y, self.tool_axis.z],
+            "tool_change_time": self.tool_change_time,
         }
         if self.id is not None:
             data["id"] = self.id
@@ -359,6 +375,7 @@ class Spindle:
             data.get("min_rpm", 0),
             data.get("tool_change", "manual"),
             tool_axis,
+            data.get("tool_change_time", 0),
         )
 
 
@@ -748,6 +765,8 @@ class Machine:
                 "min": axis_obj.min_limit,
                 "max": axis_obj.max_limit,
                 "max_velocity": axis_obj.max_velocity,
+                "max_acceleration": axis_obj.max_acceleration,
+                "max_jerk": axis_obj.max_jerk,
                 "joint": joint,
                 "sequence": axis_obj.sequence,
             }
@@ -761,6 +780,8 @@ class Machine:
                 "min": axis_obj.min_limit,
                 "max": axis_obj.max_limit,
                 "max_velocity": axis_obj.max_velocity,
+                "max_acceleration": axis_obj.max_acceleration,
+                "max_jerk": axis_obj.max_jerk,
                 "joint": joint,
                 "sequence": axis_obj.sequence,
                 "prefer_positive": axis_obj.prefer_positive,
@@ -976,6 +997,8 @@ class Machine:
                     min_limit=min_limit,
                     max_limit=max_limit,
                     max_velocity=max_velocity,
+                    max_acceleration=axis_data.get("max_acceleration", 0),
+                    max_jerk=axis_data.get("max_jerk", 0),
                 )
             elif axis_type == "angular":
                 joint = axis_data.get("joint", [[0, 0, 0], [0, 0, 1]])
@@ -993,6 +1016,8 @@ class Machine:
                     max_limit=max_limit,
                     max_velocity=max_velocity,
                     prefer_positive=prefer_positive,
+                    max_acceleration=axis_data.get("max_acceleration", 0),
+                    max_jerk=axis_data.get("max_jerk", 0),
                 )
 
         # Parse spindles if present
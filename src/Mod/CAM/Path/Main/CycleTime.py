@@ -0,0 +1,430 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+# ***************************************************************************
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+"""Cycle time estimation with the acceleration limits of the machine.
+
+The moves of a path are planned like a motion controller does: each move
+accelerates and decelerates within the limits of the axes it moves, corners
+are passed at the speed the junction deviation allows and arcs at the speed
+the centripetal acceleration allows. Drill cycles, dwells and tool changes
+are added.
+Without any limits of the machine the rules of Path.Path.getCycleTime() are
+kept: every move takes its length divided by the rate of the tool controller,
+F parameters, drill cycles and dwells are ignored.
+"""
+
+import numpy
+
+import Path
+import Path.Base.CommandArray as PathCommandArray
+import Path.Base.Util as PathUtil
+import Path.Dressup.Utils as PathDressup
+
+from Path.Machine.models.machine import MachineFactory
+
+if False:
+    Path.Log.setLevel(Path.Log.Level.DEBUG, Path.Log.thisModule())
+    Path.Log.trackModule(Path.Log.thisModule())
+else:
+    Path.Log.setLevel(Path.Log.Level.INFO, Path.Log.thisModule())
+
+
+# deviation from the corner in mm the controller allows when blending two moves
+JunctionDeviation = 0.01
+
+# commands which bring the machine to a stop between the moves around them
+Stops = ["M0", "M00", "M1", "M01", "M3", "M03", "M4", "M04", "M5", "M05", "M6", "M06"]
+Stops += ["G4", "G04"] + Path.Geom.CmdMoveDrill
+
+Dwells = ["G4", "G04"] + Path.Geom.CmdMoveDrill
+ToolChanges = ["M6", "M06"]
+
+
+def _limits(values):
+    """Return values as array of three limits, numpy.inf for each one not given."""
+    limits = numpy.full(3, numpy.inf)
+    if values is not None:
+        limits[:] = values
+        limits[~(limits > 0)] = numpy.inf
+    return limits
+
+
+class Kinematics:
+    """Kinematics(velocity=None, acceleration=None, jerk=None, toolChangeTime=0, junctionDeviation=JunctionDeviation)
+
+    The limits of the X, Y and Z axes of a machine. velocity, acceleration and jerk are
+    sequences of three values in mm/s, mm/s^2 and mm/s^3, a value of 0 means the axis is
+    not limited. An axis without an acceleration limit gets the largest limit of the other
+    axes, if there is one. toolChangeTime is the time of a tool change in seconds.
+    """
+
+    def __init__(
+        self,
+        velocity=None,
+        acceleration=None,
+        jerk=None,
+        toolChangeTime=0.0,
+        junctionDeviation=JunctionDeviation,
+    ):
+        self.velocity = _limits(velocity)
+        self.acceleration = _limits(acceleration)
+        self.jerk = _limits(jerk)
+        self.toolChangeTime = toolChangeTime
+        self.junctionDeviation = junctionDeviation
+
+        limited = numpy.isfinite(self.acceleration)
+        if limited.any():
+            self.acceleration[~limited] = self.acceleration[limited].max()
+        else:
+            self.jerk[:] = numpy.inf
+
+    def limitsVelocity(self):
+        return bool(numpy.isfinite(self.velocity).any())
+
+    def limitsAcceleration(self):
+        return bool(numpy.isfinite(self.acceleration).any())
+
+    def isLimited(self):
+        return self.limitsVelocity() or self.limitsAcceleration()
+
+    def __repr__(self):
+        return "Kinematics(v={}, a={}, j={}, tc={})".format(
+            self.velocity.tolist(),
+            self.acceleration.tolist(),
+            self.jerk.tolist(),
+            self.toolChangeTime,
+        )
+
+
+def machineKinematics(machine):
+    """machineKinematics(machine) ... return the Kinematics of a Path.Machine Machine."""
+    axes = [machine.linear_axes.get(name) for name in ("X", "Y", "Z")]
+
+    def limits(attr, scale=1.0):
+        return [getattr(axis, attr) * scale if axis else 0 for axis in axes]
+
+    toolChangeTime = machine.spindles[0].tool_change_time if machine.spindles else 0.0
+    # the velocities of the machine are in mm/min
+    return Kinematics(
+        limits("max_velocity", 1 / 60),
+        limits("max_acceleration"),
+        limits("max_jerk"),
+        toolChangeTime,
+    )
+
+
+def jobKinematics(job):
+    """jobKinematics(job) ... return the Kinematics of the machine of job.
+    Returns Kinematics without any limits if the job has no machine or it cannot be loaded."""
+    name = getattr(job, "Machine", "") if job else ""
+    if not name:
+        return Kinematics()
+    try:
+        return machineKinematics(MachineFactory.get_machine(name))
+    except Exception as e:
+        Path.Log.warning("{}: cannot load machine {}: {}".format(job.Label, name, e))
+        return Kinematics()
+
+
+def _rampTimes(dv, accel, jerk):
+    """Return the times to change the speed by dv with accel and jerk."""
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        full = dv / accel + accel / jerk
+        short = 2 * numpy.sqrt(dv / jerk)
+    return numpy.where(dv >= accel * accel / jerk, full, short)
+
+
+def _profileTimes(length, speed, accel, jerk, vIn, vOut):
+    """Return the times of moves which start at vIn, end at vOut and cruise at up to speed.
+    The ramps are symmetric S-curves if jerk is finite and linear otherwise. If the S-curves
+    do not fit into a move it is run at their average speed."""
+    peak = numpy.sqrt(
+        numpy.minimum(speed * speed, 0.5 * (vIn * vIn + vOut * vOut) + accel * length)
+    )
+    peak = numpy.maximum(peak, numpy.maximum(vIn, vOut))
+    tUp = _rampTimes(peak - vIn, accel, jerk)
+    tDown = _rampTimes(peak - vOut, accel, jerk)
+    rampTime = tUp + tDown
+    rampLength = 0.5 * (vIn + peak) * tUp + 0.5 * (vOut + peak) * tDown
+    fits = rampLength <= length
+    times = numpy.empty_like(length)
+    times[fits] = rampTime[fits] + (length[fits] - rampLength[fits]) / peak[fits]
+    times[~fits] = length[~fits] * rampTime[~fits] / rampLength[~fits]
+    return times
+
+
+def _axisLimits(limits, share):
+    """Return the limit of each move for the per axis limits. share is the (n, 3) array of the
+    part of the speed each axis has to deliver."""
+    with numpy.errstate(divide="ignore"):
+        return numpy.min(limits / share, axis=1)
+
+
+def _speeds(kinematics, speed, share, rapid):
+    """Return speed limited by the velocity of the axes. Rapid moves run at the velocity
+    limit if there is one."""
+    limit = _axisLimits(kinematics.velocity, share)
+    return numpy.where(rapid & numpy.isfinite(limit), limit, numpy.minimum(speed, limit))
+
+
+def _legTimes(kinematics, length, speed, share, rapid):
+    """Return the times of moves from stop to stop, see _speeds()."""
+    speed = _speeds(kinematics, speed, share, rapid)
+    times = numpy.zeros(len(length))
+    moves = length > 0
+    if not kinematics.limitsAcceleration():
+        times[moves] = length[moves] / speed[moves]
+    else:
+        zero = times[moves]
+        times[moves] = _profileTimes(
+            length[moves],
+            speed[moves],
+            _axisLimits(kinematics.acceleration, share[moves]),
+            _axisLimits(kinematics.jerk, share[moves]),
+            zero,
+            zero,
+        )
+    return times
+
+
+def _plan(caps, limits):
+    """Return the highest squared speeds at the junctions which stay below caps.
+    limits[k] is the largest change of the squared speed along move k, between junction k and
+    k + 1. Backward and forward pass of a look ahead planner, in closed form."""
+    total = numpy.concatenate(([0.0], numpy.cumsum(limits)))
+    speeds = numpy.minimum.accumulate((caps + total)[::-1])[::-1] - total
+    speeds = numpy.minimum.accumulate(speeds - total) + total
+    return numpy.maximum(speeds, 0.0)
+
+
+def _drillTimes(commands, kinematics, drill, vFeed, hRapid, vRapid):
+    """Return the times of the drill cycles in drill: the rapid move to the hole, the rapid
+    down to the retract height, the feed to the bottom and the rapid back up. Pecks are not
+    taken into account."""
+    start = commands.startPositions()[drill]
+    end = commands.positions()[drill]
+    z0 = start[:, 2]
+    depth = commands.commands["Z"][drill]
+    depth = numpy.where(numpy.isnan(depth), z0, depth)
+    retract = commands.commands["R"][drill]
+    retract = numpy.where(numpy.isnan(retract), z0, retract)
+    feed = commands.state("F")[drill]
+    feed = numpy.where(feed > 0, feed, vFeed)
+
+    xy = numpy.hypot(end[:, 0] - start[:, 0], end[:, 1] - start[:, 1])
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        share = numpy.abs(end - start) / xy[:, None]
+    share[:, 2] = 0
+    share[xy == 0] = 0
+    vertical = numpy.zeros_like(share)
+    vertical[:, 2] = 1
+
+    rapid = numpy.full(len(xy), hRapid)
+    times = _legTimes(kinematics, xy, rapid, share, True)
+    rapid[:] = vRapid
+    times += 2 * _legTimes(kinematics, numpy.abs(z0 - retract), rapid, vertical, True)
+    times += _legTimes(kinematics, numpy.abs(retract - depth), rapid, vertical, True)
+    times += _legTimes(kinematics, numpy.abs(retract - depth), feed, vertical, False)
+    return times
+
+
+def commandTimes(commands, kinematics, hFeed, vFeed, hRapid, vRapid):
+    """commandTimes(commands, kinematics, hFeed, vFeed, hRapid, vRapid) ... return the time in
+    seconds of each command.
+
+    commands is a Path.Path, a list of Path.Command or a CommandArray. If kinematics has no
+    limits the times are those of CommandArray.moveTimes(), plus the tool changes.
+    Otherwise feed moves use their F parameter and the feed rates if they have none, rapid
+    moves the velocity limits of the machine and the rapid rates if it has none, and drill
+    cycles and dwells are included."""
+    if not isinstance(commands, PathCommandArray.CommandArray):
+        commands = PathCommandArray.CommandArray(commands)
+    if not kinematics.isLimited():
+        times = commands.moveTimes(hFeed, vFeed, hRapid, vRapid)
+        times[commands.isCommand(ToolChanges)] += kinematics.toolChangeTime
+        return times
+    times = numpy.zeros(len(commands))
+    if len(commands) == 0:
+        return times
+    if hRapid == 0:
+        hRapid = hFeed
+    if vRapid == 0:
+        vRapid = vFeed
+
+    start = commands.startPositions()
+    length = commands.distances()
+    rapid = commands.isCommand(Path.Geom.CmdMoveRapid)
+    moves = commands.isCommand(
+        Path.Geom.CmdMoveRapid + Path.Geom.CmdMoveStraight + Path.Geom.CmdMoveArc
+    ) & (length > Path.Geom.Tolerance)
+    index = numpy.flatnonzero(moves)
+    arcs, _, radius, a0, sweep = commands.arcs()
+
+    # directions at the start and the end of each move and the part of the speed on each axis
+    delta = commands.positions() - start
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        tangentIn = delta / length[:, None]
+        tangentOut = tangentIn.copy()
+        planar = radius * numpy.abs(sweep)
+        for tangent, angle in ((tangentIn, a0), (tangentOut, a0 + sweep)):
+            direction = numpy.sign(sweep) * planar
+            tangent[arcs] = (
+                numpy.stack(
+                    (-direction * numpy.sin(angle), direction * numpy.cos(angle), delta[arcs, 2]),
+                    axis=1,
+                )
+                / length[arcs, None]
+            )
+        share = numpy.abs(tangentIn)
+        share[arcs, 0] = share[arcs, 1] = planar / length[arcs]
+
+    vertical = start[:, 2] != commands.positions()[:, 2]
+    feed = commands.state("F")
+    speed = numpy.where(feed > 0, feed, numpy.where(vertical, vFeed, hFeed))
+    speed[rapid] = numpy.where(vertical[rapid], vRapid, hRapid)
+    share = share[index]
+    speed = _speeds(kinematics, speed[index], share, rapid[index])
+
+    if not kinematics.limitsAcceleration():
+        times[index] = length[index] / speed
+    elif len(index):
+        accel = _axisLimits(kinematics.acceleration, share)
+        jerk = _axisLimits(kinematics.jerk, share)
+
+        # arcs are limited by the centripetal acceleration
+        arcRadius = numpy.full(len(commands), numpy.inf)
+        arcRadius[arcs] = radius
+        arcAccel = kinematics.acceleration[:2].min()
+        speed = numpy.minimum(speed, numpy.sqrt(arcAccel * arcRadius[index]))
+
+        # corners are limited by the junction deviation, the machine stops if there is any
+        # other command which stops it in between
+        stops = numpy.cumsum(commands.isCommand(Stops))
+        stopped = stops[index[1:] - 1] > stops[index[:-1]]
+        cos = numpy.einsum("ij,ij->i", tangentOut[index[:-1]], tangentIn[index[1:]])
+        sinHalf = numpy.sqrt(0.5 * (1 + numpy.clip(cos, -1, 1)))
+        with numpy.errstate(divide="ignore"):
+            junction = (
+                numpy.minimum(accel[:-1], accel[1:])
+                * kinematics.junctionDeviation
+                * sinHalf
+                / (1 - sinHalf)
+            )
+        junction[stopped] = 0
+        squared = speed * speed
+        caps = numpy.zeros(len(index) + 1)
+        caps[1:-1] = numpy.minimum(junction, numpy.minimum(squared[:-1], squared[1:]))
+
+        junctions = numpy.sqrt(_plan(caps, 2 * accel * length[index]))
+        times[index] = _profileTimes(
+            length[index], speed, accel, jerk, junctions[:-1], junctions[1:]
+        )
+
+    drill = commands.isCommand(Path.Geom.CmdMoveDrill)
+    if drill.any():
+        times[drill] = _drillTimes(commands, kinematics, drill, vFeed, hRapid, vRapid)
+
+    dwell = commands.isCommand(Dwells)
+    times[dwell] += numpy.nan_to_num(commands.commands["P"][dwell])
+    times[commands.isCommand(ToolChanges)] += kinematics.toolChangeTime
+    return times
+
+
+def cycleTime(commands, kinematics, hFeed, vFeed, hRapid, vRapid):
+    """cycleTime(commands, kinematics, hFeed, vFeed, hRapid, vRapid) ... return the time in
+    seconds to run all commands, 0 if one of the feed rates is 0. See commandTimes()."""
+    if hFeed == 0 or vFeed == 0:
+        return 0.0
+    return float(commandTimes(commands, kinematics, hFeed, vFeed, hRapid, vRapid).sum())
+
+
+def toolChanges(operations):
+    """toolChanges(operations) ... return the number of tool changes needed to run operations
+    in order, including loading the first tool."""
+    changes = 0
+    previous = None
+    for op in operations:
+        try:
+            tc = PathDressup.toolController(op)
+        except Exception:
+            tc = None
+        if tc is not None and tc != previous:
+            changes += 1
+            previous = tc
+    return changes
+
+
+class CycleTimeResult:
+    """The outcome of estimate_job(), all times in seconds.
+
+    total:       time of the whole job
+    operations:  dictionary of the time of each operation by its label
+    tools:       dictionary of the time of each tool by its tool number, including the
+                 tool changes loading it
+    toolChanges: number of tool changes
+    """
+
+    def __init__(self):
+        self.total = 0.0
+        self.operations = {}
+        self.tools = {}
+        self.toolChanges = 0
+
+
+def estimate_job(job, kinematics=None):
+    """estimate_job(job, kinematics=None) ... estimate the cycle time of all active operations
+    of job, in the order they are run. kinematics defaults to jobKinematics(job).
+    Returns a CycleTimeResult."""
+    if kinematics is None:
+        kinematics = jobKinematics(job)
+
+    result = CycleTimeResult()
+    previous = None
+    for op in job.Operations.Group:
+        if PathUtil.opProperty(op, "Active") is False:
+            continue
+        try:
+            tc = PathDressup.toolController(op)
+        except Exception:
+            tc = None
+        if tc is None or getattr(op, "Path", None) is None:
+            Path.Log.debug("{}: no tool controller or path".format(op.Label))
+            continue
+
+        seconds = cycleTime(
+            op.Path,
+            kinematics,
+            tc.HorizFeed.Value,
+            tc.VertFeed.Value,
+            tc.HorizRapid.Value,
+            tc.VertRapid.Value,
+        )
+        result.operations[op.Label] = seconds
+        if tc != previous:
+            result.toolChanges += 1
+            seconds += kinematics.toolChangeTime
+            previous = tc
+        result.tools[tc.ToolNumber] = result.tools.get(tc.ToolNumber, 0.0) + seconds
+        result.total += seconds
+    return result
@@ -38,6 +38,7 @@ import time
 from lazy_loader.lazy_loader import LazyLoader
 
 Draft = LazyLoader("Draft", globals(), "Draft")
+PathCycleTime = LazyLoader("Path.Main.CycleTime", globals(), "Path.Main.CycleTime")
 
 
 if False:
@@ -158,6 +159,15 @@ class ObjectJob:
             QT_TRANSLATE_NOOP("App::Property", "Job Cycle Time Estimation"),
         )
         obj.setEditorMode("CycleTime", 1)  # read-only
+        obj.addProperty(
+            "App::PropertyString",
+            "Machine",
+            "Path",
+            QT_TRANSLATE_NOOP(
+                "App::Property",
+                "Name of the machine whose limits are used for the cycle time estimation",
+            ),
+        )
         obj.addProperty(
             "App::PropertyDistance",
             "GeometryTolerance",
@@ -488,6 +498,17 @@ class ObjectJob:
             )
             obj.setEditorMode("CycleTime", 1)  # read-only
 
+        if not hasattr(obj, "Machine"):
+            obj.addProperty(
+                "App::PropertyString",
+                "Machine",
+                "Path",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "Name of the machine whose limits are used for the cycle time estimation",
+                ),
+            )
+
         if not hasattr(obj, "Fixtures"):
             obj.addProperty(
                 "App::PropertyStringList",
@@ -645,6 +666,7 @@ class ObjectJob:
 
     def getCycleTime(self):
         seconds = 0
+        operations = []
 
         if len(self.obj.Operations.Group):
             for op in self.obj.Operations.Group:
@@ -670,10 +692,29 @@ class ObjectJob:
 
                 if opCycleTime > 0:
                     seconds = seconds + opCycleTime
+                    operations.append(op)
+
+        # the operations do not know about the tool changes between them
+        toolChangeTime = PathCycleTime.jobKinematics(self.obj).toolChangeTime
+        if toolChangeTime > 0:
+            seconds += toolChangeTime * PathCycleTime.toolChanges(operations)
 
         cycleTimeString = time.strftime("%H:%M:%S", time.gmtime(seconds))
         self.obj.CycleTime = cycleTimeString
 
+    def setRecomputeStatus(self, op, status, reason):
+        """setRecomputeStatus(op, status, reason) ... record if op was recomputed and why."""
+        Path.Log.debug("{}: {} ({})".format(op.Label, status, reason))
+        if not hasattr(self, "recomputeStatus"):
+            self.recomputeStatus = {}
+        self.recomputeStatus[op.Name] = (status, reason)
+
+    def recomputeReport(self):
+        """recomputeReport() ... return a list of (op label, status, reason) of the last recompute
+        of each operation, status being either "recomputed" or "skipped"."""
+        status = getattr(self, "recomputeStatus", {})
+        return [(op.Label,) + status[op.Name] for op in self.allOperations() if op.Name in status]
+
     def addOperation(self, op, before=None, removeBefore=False):
         group = self.obj.Operations.Group
         if op not in group:
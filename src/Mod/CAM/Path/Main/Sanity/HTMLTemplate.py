@@ -470,17 +470,21 @@ html_template = Template(
 </div>
 <table>
     <colgroup>
-        <col width="20%"/>
-        <col width="20%"/>
-        <col width="20%"/>
-        <col width="20%"/>
-        <col width="20%"/>
+        <col width="22%"/>
+        <col width="13%"/>
+        <col width="13%"/>
+        <col width="13%"/>
+        <col width="13%"/>
+        <col width="13%"/>
+        <col width="13%"/>
     </colgroup>
     <thead>
         <tr>
             <th><strong>${opLabel}</strong></th>
             <th><strong>${jobMinZLabel}</strong></th>
             <th><strong>${jobMaxZLabel}</strong></th>
+            <th><strong>${feedDistanceLabel}</strong></th>
+            <th><strong>${rapidDistanceLabel}</strong></th>
             <th><strong>${coolantLabel}</strong></th>
             <th><strong>${cycleTimeLabel}</strong></th>
         </tr>
@@ -504,7 +508,7 @@ html_template = Template(
         <tr>
             <td><strong>${materialLabel}</strong></td>
             <td>${material}</td>
-            <td rowspan="7" class="image-container">
+            <td rowspan="8" class="image-container">
                 ${stockImage}
             </td>
         </tr>
@@ -528,6 +532,10 @@ html_template = Template(
         <td><strong>${zDimLabel}</strong></td>
         <td>${zLen}</td>
     </tr>
+    <tr>
+        <td><strong>${removedVolumeLabel}</strong></td>
+        <td>${removedVolume}</td>
+    </tr>
 </table>
 
 
@@ -848,6 +856,12 @@ op_run_template = Template(
     <td>
         ${maxZ}
     </td>
+    <td>
+        ${feedDistance}
+    </td>
+    <td>
+        ${rapidDistance}
+    </td>
     <td>
         ${coolantMode}
     </td>
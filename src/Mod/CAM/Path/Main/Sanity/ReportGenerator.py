@@ -113,6 +113,9 @@ class ReportGenerator:
             "jobMaxZLabel": translate("CAM_Sanity", "Maximum Z"),
             "coolantLabel": translate("CAM_Sanity", "Coolant Mode"),
             "cycleTimeLabel": translate("CAM_Sanity", "Cycle Time"),
+            "feedDistanceLabel": translate("CAM_Sanity", "Feed Distance"),
+            "rapidDistanceLabel": translate("CAM_Sanity", "Rapid Distance"),
+            "removedVolumeLabel": translate("CAM_Sanity", "Removed Volume"),
             "PartLabel": translate("CAM_Sanity", "Part"),
             "SequenceLabel": translate("CAM_Sanity", "Sequence"),
             "JobTypeLabel": translate("CAM_Sanity", "Job Type"),
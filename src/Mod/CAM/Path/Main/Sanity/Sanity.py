@@ -35,8 +35,10 @@ from datetime import datetime
 import FreeCAD
 import Path
 import Path.Log
+import Path.Base.CommandArray as PathCommandArray
 import Path.Main.Sanity.ImageBuilder as ImageBuilder
 import Path.Main.Sanity.ReportGenerator as ReportGenerator
+import Path.Main.Simulation as PathSimulation
 import os
 import Path.Dressup.Utils as PathDressup
 
@@ -299,10 +301,20 @@ class CAMSanity:
                 zmin = ""
                 zmax = ""
 
+            commands = PathCommandArray.CommandArray(op.Path)
+            feedDistance = FreeCAD.Units.Quantity(
+                commands.feedDistance(), FreeCAD.Units.Length
+            ).UserString
+            rapidDistance = FreeCAD.Units.Quantity(
+                commands.rapidDistance(), FreeCAD.Units.Length
+            ).UserString
+
             opdata = {
                 "opName": oplabel,
                 "minZ": zmin,
                 "maxZ": zmax,
+                "feedDistance": feedDistance,
+                "rapidDistance": rapidDistance,
                 "cycleTime": ctime,
                 "coolantMode": cool,
             }
@@ -320,6 +332,7 @@ class CAMSanity:
             "surfaceSpeedCarbide": "",
             "surfaceSpeedHSS": "",
             "stockImage": "",
+            "removedVolume": "",
             "squawkData": [],
         }
 
@@ -354,8 +367,39 @@ class CAMSanity:
 
         data["stockImage"] = self.image_builder.build_image(obj.Stock, "stockImage", as_bytes=True)
 
+        if Path.Preferences.sanitySimulationEnabled():
+            self._simulationData(data)
+
         return data
 
+    def _simulationData(self, data):
+        """
+        Simulates the job on the stock, adds the removed volume to data
+        and squawks if the tools cut into the model
+        """
+        try:
+            result = PathSimulation.simulate_job(self.job)
+        except Exception as e:
+            Path.Log.error("Simulation of {} failed: {}".format(self.job.Label, e))
+            return
+
+        data["removedVolume"] = FreeCAD.Units.Quantity(
+            result.removedVolume, FreeCAD.Units.Volume
+        ).UserString
+
+        if result.gouges:
+            depth = FreeCAD.Units.Quantity(result.maxGougeDepth(), FreeCAD.Units.Length)
+            data["squawkData"].append(
+                self.squawk(
+                    "CAMSanity",
+                    translate(
+                        "CAM_Sanity",
+                        "The tools cut into the model at {} places, up to {} deep",
+                    ).format(len(result.gouges), depth.UserString),
+                    squawkType="CAUTION",
+                )
+            )
+
     def _toolData(self):
         """
         Returns information about the tools used in the job, and associated
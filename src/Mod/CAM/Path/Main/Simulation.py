@@ -0,0 +1,138 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+# ***************************************************************************
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+"""Headless material removal simulation of a job.
+
+The stock is a heightfield of the PathSimulator module, the paths of all
+operations are applied to it in bulk, without any GUI. The result has the
+removed volume, the places the tools cut into the model and the remaining
+stock as a mesh.
+"""
+
+import FreeCAD
+import Path
+import Path.Dressup.Utils as PathDressup
+import PathScripts.PathUtils as PathUtils
+
+from lazy_loader.lazy_loader import LazyLoader
+
+Mesh = LazyLoader("Mesh", globals(), "Mesh")
+MeshPart = LazyLoader("MeshPart", globals(), "MeshPart")
+PathSimulator = LazyLoader("PathSimulator", globals(), "PathSimulator")
+
+if False:
+    Path.Log.setLevel(Path.Log.Level.DEBUG, Path.Log.thisModule())
+    Path.Log.trackModule(Path.Log.thisModule())
+else:
+    Path.Log.setLevel(Path.Log.Level.INFO, Path.Log.thisModule())
+
+
+# number of heightfield cells along the longer side of the stock by default
+DefaultCells = 200
+
+
+class SimulationResult:
+    """The outcome of simulate_job().
+
+    removedVolume: volume of the material removed from the stock
+    gouges:        list of (position, depth) of the stock cells cut below the model
+    stock:         Mesh.Mesh of the remaining stock
+    moves:         number of path commands applied to the stock
+    """
+
+    def __init__(self, removedVolume, gouges, stock, moves):
+        self.removedVolume = removedVolume
+        self.gouges = gouges
+        self.stock = stock
+        self.moves = moves
+
+    def maxGougeDepth(self):
+        """Return the depth of the deepest gouge, 0 if there is none."""
+        return max((depth for _, depth in self.gouges), default=0.0)
+
+
+def defaultResolution(job):
+    """Return the resolution used for job if none is given."""
+    bb = job.Stock.Shape.BoundBox
+    return max(bb.XLength, bb.YLength) / DefaultCells
+
+
+def modelMesh(job, resolution):
+    """Return the models of job as one mesh, tessellated to resolution."""
+    mesh = Mesh.Mesh()
+    for base in job.Model.Group:
+        if hasattr(base, "Mesh"):
+            mesh.addMesh(base.Mesh)
+        elif hasattr(base, "Shape") and not base.Shape.isNull():
+            mesh.addMesh(
+                MeshPart.meshFromShape(
+                    Shape=base.Shape, LinearDeflection=resolution, AngularDeflection=0.5
+                )
+            )
+    return mesh
+
+
+def simulate_job(job, resolution=None, operations=None, tolerance=None):
+    """simulate_job(job, resolution=None, operations=None, tolerance=None) ... simulate job.
+
+    All active operations of job, or the given operations, are applied to the stock
+    with the shapes of their tools. The stock is sampled at resolution, which
+    defaults to defaultResolution(job). Cuts deeper than tolerance into the model
+    are reported as gouges, tolerance defaults to resolution.
+    Returns a SimulationResult.
+    """
+    if resolution is None:
+        resolution = defaultResolution(job)
+    if tolerance is None:
+        tolerance = resolution
+    if operations is None:
+        operations = [op for op in job.Operations.Group if getattr(op, "Active", True)]
+
+    stock = job.Stock.Shape
+    sim = PathSimulator.PathSim()
+    sim.BeginSimulation(stock, resolution)
+    sim.SetModel(modelMesh(job, resolution))
+
+    initialPos = FreeCAD.Placement(FreeCAD.Vector(0, 0, stock.BoundBox.ZMax), FreeCAD.Rotation())
+    moves = 0
+    for op in operations:
+        try:
+            tool = PathDressup.toolController(op).Tool
+        except Exception:
+            tool = None
+        if tool is None or not hasattr(tool, "Shape"):
+            Path.Log.warning("{}: no tool to simulate the operation with".format(op.Label))
+            continue
+        path = PathUtils.getPathWithPlacement(op)
+        if path is None:
+            continue
+        Path.Log.debug("{}: {} commands".format(op.Label, path.Size))
+        sim.SetToolShape(tool.Shape, resolution)
+        sim.ApplyPath(initialPos, path)
+        moves += path.Size
+
+    outer, inner = sim.GetResultMesh()
+    remaining = outer.copy()
+    remaining.addMesh(inner)
+    return SimulationResult(sim.GetRemovedVolume(), sim.GetGouges(tolerance), remaining, moves)
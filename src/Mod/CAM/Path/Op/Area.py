@@ -384,6 +384,18 @@ class ObjectOp(PathOp.ObjectOp):
 
         return paths, simobj
 
+    def opFingerprint(self, obj):
+        """opFingerprint(obj) ... rest machining uses the paths of the preceding operations."""
+        if not getattr(obj, "UseRestMachining", False):
+            return {}
+        paths = []
+        for op in self.job.Operations.Group:
+            if self in [x.Proxy for x in [op] + op.OutListRecursive if hasattr(x, "Proxy")]:
+                break
+            if hasattr(op, "Active") and op.Active and op.Path:
+                paths.append(op.Path.toGCode())
+        return {"RestMachining": paths}
+
     def opExecute(self, obj, getsim=False):
         """opExecute(obj, getsim=False) ... implementation of Path.Area ops.
         determines the parameters for _buildPathArea().
@@ -26,6 +26,7 @@ from PathScripts.PathUtils import waiting_effects
 from PySide.QtCore import QT_TRANSLATE_NOOP
 import Path
 import Path.Base.Util as PathUtil
+import Path.Op.Fingerprint as PathFingerprint
 import PathScripts.PathUtils as PathUtils
 import math
 import time
@@ -35,6 +36,7 @@ import time
 from lazy_loader.lazy_loader import LazyLoader
 
 Part = LazyLoader("Part", globals(), "Part")
+PathCycleTime = LazyLoader("Path.Main.CycleTime", globals(), "Path.Main.CycleTime")
 
 __title__ = "Base class for all operations."
 __author__ = "sliptonic (Brad Collette)"
@@ -116,6 +118,17 @@ class ObjectOp(object):
             QT_TRANSLATE_NOOP("App::Property", "The base geometry for this operation"),
         )
 
+    def addFingerprintProperty(self, obj):
+        obj.addProperty(
+            "App::PropertyString",
+            "InputFingerprint",
+            "Path",
+            QT_TRANSLATE_NOOP(
+                "App::Property", "Fingerprint of the inputs of the last recompute of the operation"
+            ),
+        )
+        obj.setEditorMode("InputFingerprint", 2)  # hide
+
     def addOpValues(self, obj, values):
         if "start" in values:
             obj.addProperty(
@@ -187,6 +200,7 @@ class ObjectOp(object):
             QT_TRANSLATE_NOOP("App::Property", "Operations Cycle Time Estimation"),
         )
         obj.setEditorMode("CycleTime", 1)  # read-only
+        self.addFingerprintProperty(obj)
 
         features = self.opFeatures(obj)
 
@@ -386,6 +400,9 @@ class ObjectOp(object):
             if hasattr(obj, op):
                 obj.setEditorMode(op, 1)  # read-only
 
+        if hasattr(obj, "InputFingerprint"):
+            obj.setEditorMode("InputFingerprint", 2)  # hide
+
         if FeatureDepths & features:
             if FeatureNoFinalDepth & features:
                 obj.setEditorMode("OpFinalDepth", 2)
@@ -444,6 +461,9 @@ class ObjectOp(object):
                 QT_TRANSLATE_NOOP("App::Property", "Operations Cycle Time Estimation"),
             )
 
+        if not hasattr(obj, "InputFingerprint"):
+            self.addFingerprintProperty(obj)
+
         if FeatureStepDown & features and not hasattr(obj, "StepDown"):
             obj.addProperty(
                 "App::PropertyDistance",
@@ -516,6 +536,13 @@ class ObjectOp(object):
         Should be overwritten by subclasses."""
         pass
 
+    def opFingerprint(self, obj):
+        """opFingerprint(obj) ... return a dictionary of the inputs of the op which are not
+        properties of obj or the job's model or stock. If incremental recompute is enabled in the
+        preferences an op whose inputs did not change is not recomputed.
+        Can safely be overwritten by subclasses."""
+        return {}
+
     def opRejectAddBase(self, obj, base, sub):
         """opRejectAddBase(base, sub) ... if op returns True the addition of the feature is prevented.
         Should be overwritten by subclasses."""
@@ -792,6 +819,25 @@ class ObjectOp(object):
         # in case they still have an expression referencing any op values
         obj.recompute()
 
+        fingerprint = None
+        if Path.Preferences.incrementalRecomputeEnabled():
+            fingerprint = PathFingerprint.opFingerprint(obj, self.job, self.opFingerprint(obj))
+            stored = getattr(obj, "InputFingerprint", "")
+            changed = PathFingerprint.changedInputs(stored, fingerprint)
+            if changed is None:
+                reason = "no fingerprint of a previous recompute"
+            elif changed:
+                reason = "changed: {}".format(", ".join(changed))
+            else:
+                self.job.Proxy.setRecomputeStatus(obj, "skipped", "inputs unchanged")
+                return
+            self.job.Proxy.setRecomputeStatus(obj, "recomputed", reason)
+        else:
+            self.job.Proxy.setRecomputeStatus(obj, "recomputed", "incremental recompute disabled")
+        if getattr(obj, "InputFingerprint", ""):
+            # only valid once the op has been recomputed successfully
+            obj.InputFingerprint = ""
+
         self.commandlist = []
         self.commandlist.append(Path.Command("(%s)" % obj.Label))
         if obj.Comment:
@@ -807,6 +853,10 @@ class ObjectOp(object):
         obj.Path = path
         obj.CycleTime = getCycleTimeEstimate(obj)
         self.job.Proxy.getCycleTime()
+        if fingerprint is not None and hasattr(obj, "InputFingerprint"):
+            # the op might have updated some of its own properties
+            fingerprint = PathFingerprint.opFingerprint(obj, self.job, self.opFingerprint(obj))
+            obj.InputFingerprint = PathFingerprint.dumps(fingerprint)
         return result
 
     def addBase(self, obj, base, sub):
@@ -1090,8 +1140,11 @@ def getCycleTimeEstimate(obj):
             )
         )
 
-    # Get the cycle time in seconds
-    seconds = obj.Path.getCycleTime(hFeedrate, vFeedrate, hRapidrate, vRapidrate)
+    # Get the cycle time in seconds, with the limits of the machine of the job if it has one
+    kinematics = PathCycleTime.jobKinematics(PathUtils.findParentJob(obj))
+    seconds = PathCycleTime.cycleTime(
+        obj.Path, kinematics, hFeedrate, vFeedrate, hRapidrate, vRapidrate
+    )
 
     if math.isnan(seconds):
         return translate("CAM", "Cycletime Error")
@@ -242,6 +242,10 @@ class ObjectDrilling(PathCircularHoleBase.ObjectOp):
         solids = []
         for base in self.job.Model.Group:
             solids.append(base.Shape)
+        # many links are checked faster against a heightfield of the solids,
+        # it is built on the first link, once for all holes
+        heightfield = None
+        useHeightfield = len(edgelist) > linking.HEIGHTFIELD_LINKS
 
         # http://linuxcnc.org/docs/html/gcode/g-code.html#gcode:g98-g99
 
@@ -284,11 +288,15 @@ class ObjectDrilling(PathCircularHoleBase.ObjectOp):
                 current_pos = machinestate.getPosition()
                 target_at_retract_plane = FreeCAD.Vector(startPoint.x, startPoint.y, current_pos.z)
 
+                if useHeightfield and heightfield is None:
+                    heightfield = linking.HeightField(solids)
+
                 # Check collision at the retract plane (current Z height)
                 collision_detected = linking.check_collision(
                     start_position=current_pos,
                     target_position=target_at_retract_plane,
                     solids=solids,
+                    heightfield=heightfield,
                 )
 
                 if collision_detected:
@@ -302,6 +310,7 @@ class ObjectDrilling(PathCircularHoleBase.ObjectOp):
                         global_clearance=obj.ClearanceHeight.Value,
                         tool_shape=self.tool.Shape,
                         solids=solids,
+                        heightfield=heightfield,
                     )
                     self.commandlist.extend(linking_moves)
                     for move in linking_moves:
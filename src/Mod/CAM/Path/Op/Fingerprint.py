@@ -0,0 +1,168 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+# ***************************************************************************
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "CAM Operation Fingerprint"
+__author__ = ""
+__url__ = "https://www.freecad.org"
+__doc__ = "Fingerprints of the inputs of an operation, used to skip unnecessary recomputes."
+__contributors__ = ""
+
+import collections
+import hashlib
+import json
+
+import FreeCAD
+import Path
+
+if False:
+    Path.Log.setLevel(Path.Log.Level.DEBUG, Path.Log.thisModule())
+    Path.Log.trackModule(Path.Log.thisModule())
+else:
+    Path.Log.setLevel(Path.Log.Level.INFO, Path.Log.thisModule())
+
+
+# Properties an operation sets itself or which have no influence on its path
+IgnoredProperties = [
+    "CycleTime",
+    "ExpressionEngine",
+    "InputFingerprint",
+    "Label2",
+    "Path",
+    "Proxy",
+    "Visibility",
+]
+
+# Linked objects are followed this many links deep, objects further away are only
+# identified by their name and shape
+LinkDepth = 2
+
+# The digests of the most recently used shapes, see shapeDigest()
+_shapeDigests = collections.OrderedDict()
+_shapeDigestsSize = 64
+
+
+def _digest(value):
+    """_digest(value) ... return a short hex digest of the JSON representation of value."""
+    data = json.dumps(value, separators=(",", ":")).encode()
+    return hashlib.sha1(data).hexdigest()[:16]
+
+
+def shapeDigest(shape):
+    """shapeDigest(shape) ... return a digest of the geometry and placement of shape.
+    Exporting the BREP of a large model is not free, so the digests of the most
+    recently used shapes are kept. The cache holds a reference to each shape, which
+    keeps its hash code from being reused by a different shape."""
+    if shape.isNull():
+        return "null"
+    key = shape.hashCode()
+    entry = _shapeDigests.get(key)
+    if entry is not None and entry[0].isSame(shape):
+        _shapeDigests.move_to_end(key)
+        return entry[1]
+
+    digest = _digest(shape.exportBrepToString())
+    _shapeDigests[key] = (shape, digest)
+    while len(_shapeDigests) > _shapeDigestsSize:
+        _shapeDigests.popitem(last=False)
+    return digest
+
+
+def _objectValue(obj, depth, visited):
+    """_objectValue(obj, depth, visited) ... return a JSON compatible value describing obj."""
+    shape = getattr(obj, "Shape", None)
+    value = [obj.Name, shapeDigest(shape) if _isShape(shape) else None]
+    if depth < 0 or obj.Name in visited:
+        return value
+
+    visited = visited | {obj.Name}
+    for name in sorted(obj.PropertiesList):
+        if name in IgnoredProperties or name == "Shape":
+            continue
+        value.append([name, _value(getattr(obj, name, None), depth - 1, visited)])
+    return value
+
+
+def _isShape(value):
+    """_isShape(value) ... return True if value is a Part.Shape."""
+    return hasattr(value, "exportBrepToString") and hasattr(value, "isNull")
+
+
+def _value(value, depth, visited):
+    """_value(value, depth, visited) ... return a JSON compatible value describing value."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, FreeCAD.DocumentObject):
+        return _objectValue(value, depth, visited)
+    if isinstance(value, (list, tuple)):
+        return [_value(v, depth, visited) for v in value]
+    if isinstance(value, dict):
+        return [[str(k), _value(v, depth, visited)] for k, v in sorted(value.items())]
+    if isinstance(value, FreeCAD.Units.Quantity):
+        return [value.Value, str(value.Unit)]
+    if isinstance(value, FreeCAD.Vector):
+        return [value.x, value.y, value.z]
+    if isinstance(value, FreeCAD.Placement):
+        return [_value(value.Base, depth, visited), list(value.Rotation.Q)]
+    if _isShape(value):
+        return shapeDigest(value)
+    return repr(value)
+
+
+def opFingerprint(obj, job, inputs=None):
+    """opFingerprint(obj, job, inputs=None) ... return the fingerprint of the inputs of obj.
+    The fingerprint is a dictionary with a digest for each property of obj, for the model
+    and the stock of job and for each item of inputs, a dictionary of additional inputs
+    the operation uses."""
+    fingerprint = {}
+    visited = {obj.Name}
+    for name in obj.PropertiesList:
+        if name not in IgnoredProperties:
+            fingerprint[name] = _digest(_value(getattr(obj, name, None), LinkDepth, visited))
+
+    fingerprint["Job.Model"] = _digest([shapeDigest(m.Shape) for m in job.Model.Group])
+    fingerprint["Job.Stock"] = _digest(shapeDigest(job.Stock.Shape) if job.Stock else None)
+    fingerprint["Job.GeometryTolerance"] = _digest(_value(job.GeometryTolerance, 0, visited))
+    fingerprint["Job.JobType"] = _digest(getattr(job, "JobType", None))
+
+    for name, value in (inputs or {}).items():
+        fingerprint[name] = _digest(_value(value, LinkDepth, visited))
+    return fingerprint
+
+
+def dumps(fingerprint):
+    """dumps(fingerprint) ... return fingerprint as stored in the InputFingerprint property."""
+    return json.dumps(fingerprint, sort_keys=True, separators=(",", ":"))
+
+
+def changedInputs(stored, fingerprint):
+    """changedInputs(stored, fingerprint) ... return the names of the inputs that changed.
+    stored is the string of the fingerprint of the last recompute. Returns None if there
+    is no usable fingerprint of the last recompute."""
+    if not stored:
+        return None
+    try:
+        old = json.loads(stored)
+    except ValueError:
+        return None
+    if not isinstance(old, dict):
+        return None
+    return sorted(n for n in set(old) | set(fingerprint) if old.get(n) != fingerprint.get(n))
@@ -727,8 +727,23 @@ class ObjectSurface(PathOp.ObjectOp):
                     models = self.job.Stock
                     obj.OpFinalDepth = self.job.Stock.Shape.BoundBox.ZMin
 
+    def opFingerprint(self, obj):
+        """opFingerprint(obj) ... the height offsets of the setup sheet are used directly."""
+        setupSheet = self.job.SetupSheet
+        return {
+            "SetupSheet.SafeHeightOffset": setupSheet.SafeHeightOffset,
+            "SetupSheet.ClearanceHeightOffset": setupSheet.ClearanceHeightOffset,
+        }
+
     def opExecute(self, obj):
         """opExecute(obj) ... process surface operation"""
+        try:
+            return self._opExecute(obj)
+        finally:
+            # stop the drop-cutter scan workers, also if the operation failed
+            PathSurfaceSupport.closeScanPool()
+
+    def _opExecute(self, obj):
         Path.Log.track()
 
         self.modelSTLs = []
@@ -745,6 +760,7 @@ class ObjectSurface(PathOp.ObjectOp):
         self.tmpCOM = None
         self.gaps = [0.1, 0.2, 0.3]
         self.cancelOperation = False
+        self.oclCacheDir = PathSurfaceSupport.getOCLCacheDirectory(obj)
         CMDS = []
         modelVisibility = []
         FCAD = FreeCAD.ActiveDocument
@@ -798,6 +814,7 @@ class ObjectSurface(PathOp.ObjectOp):
                 )
             )
             return
+        self.cutterArgs = oclTool.getOclToolArgs()
         self.toolDiam = self.cutter.getDiameter()  # oclTool.diameter
         self.radius = self.toolDiam / 2.0
         self.useTiltCutter = oclTool.useTiltCutter()
@@ -935,6 +952,7 @@ class ObjectSurface(PathOp.ObjectOp):
 
             # Save gcode produced
             self.commandlist.extend(CMDS)
+            PathSurfaceSupport.flushOCLCache()
         else:
             Path.Log.error("Failed to pre-process model and/or selected face(s).")
 
@@ -1228,6 +1246,8 @@ class ObjectSurface(PathOp.ObjectOp):
 
         if offsetPoints or obj.CutPattern == "Offset":
             PNTSET = PathSurfaceSupport.pathGeomToOffsetPointSet(obj, pathGeom)
+            # scan all lines at once, so they can be scanned in parallel
+            scans = iter(pdc.scanLines([I for D in PNTSET for I in D if I != "BRK"]))
             for D in PNTSET:
                 stpOvr = []
                 ofst = []
@@ -1238,8 +1258,7 @@ class ObjectSurface(PathOp.ObjectOp):
                         ofst = []
                     else:
                         # D format is ((p1, p2), (p3, p4))
-                        (A, B) = I
-                        ofst.extend(self._planarDropCutScan(pdc, A, B))
+                        ofst.extend(next(scans))
                 if len(ofst) > 0:
                     stpOvr.append(ofst)
                 SCANS.extend(stpOvr)
@@ -1254,14 +1273,15 @@ class ObjectSurface(PathOp.ObjectOp):
             elif obj.CutPattern == "Spiral":
                 PNTSET = PathSurfaceSupport.pathGeomToSpiralPointSet(obj, pathGeom)
 
+            # scan all lines at once, so they can be scanned in parallel
+            scans = iter(pdc.scanLines([LN for STEP in PNTSET for LN in STEP if LN != "BRK"]))
             for STEP in PNTSET:
                 for LN in STEP:
                     if LN == "BRK":
                         stpOvr.append(LN)
                     else:
                         # D format is ((p1, p2), (p3, p4))
-                        (A, B) = LN
-                        stpOvr.append(self._planarDropCutScan(pdc, A, B))
+                        stpOvr.append(next(scans))
                 SCANS.append(stpOvr)
                 stpOvr = []
         elif obj.CutPattern in ["Circular", "CircularZigZag"]:
@@ -1270,22 +1290,28 @@ class ObjectSurface(PathOp.ObjectOp):
             # PNTSET = PathSurfaceSupport.pathGeomToCircularPointSet(obj, pathGeom, self.CutClimb, self.toolDiam, self.closedGap, self.gaps, self.tmpCOM)
             PNTSET = PathSurfaceSupport.pathGeomToCircularPointSet(self, obj, pathGeom)
 
+            # scan all arcs at once, so they can be scanned in parallel
+            scans = iter(
+                pdc.scanArcs(
+                    [
+                        (Arc, dirFlg == 1)  # cMode
+                        for (aTyp, dirFlg, ARCS) in PNTSET
+                        for Arc in ARCS
+                        if Arc != "BRK"
+                    ]
+                )
+            )
             for so in range(0, len(PNTSET)):
                 stpOvr = []
                 erFlg = False
                 (aTyp, dirFlg, ARCS) = PNTSET[so]
 
-                if dirFlg == 1:  # 1
-                    cMode = True
-                else:
-                    cMode = False
-
                 for a in range(0, len(ARCS)):
                     Arc = ARCS[a]
                     if Arc == "BRK":
                         stpOvr.append("BRK")
                     else:
-                        scan = self._planarCircularDropCutScan(pdc, Arc, cMode)
+                        scan = next(scans)
                         if scan is False:
                             erFlg = True
                         else:
@@ -1299,35 +1325,8 @@ class ObjectSurface(PathOp.ObjectOp):
         return SCANS
 
     def _planarDropCutScan(self, pdc, A, B):
-        (x1, y1) = A
-        (x2, y2) = B
-        path = ocl.Path()  # create an empty path object
-        p1 = ocl.Point(x1, y1, 0)  # start-point of line
-        p2 = ocl.Point(x2, y2, 0)  # end-point of line
-        lo = ocl.Line(p1, p2)  # line-object
-        path.append(lo)  # add the line to the path
-        pdc.setPath(path)
-        pdc.run()  # run dropcutter algorithm on path
-        CLP = pdc.getCLPoints()
-        PNTS = [FreeCAD.Vector(p.x, p.y, p.z) for p in CLP]
-        return PNTS  # pdc.getCLPoints()
-
-    def _planarCircularDropCutScan(self, pdc, Arc, cMode):
-        path = ocl.Path()  # create an empty path object
-        (sp, ep, cp) = Arc
-
-        # process list of segment tuples (vect, vect)
-        p1 = ocl.Point(sp[0], sp[1], 0)  # start point of arc
-        p2 = ocl.Point(ep[0], ep[1], 0)  # end point of arc
-        C = ocl.Point(cp[0], cp[1], 0)  # center point of arc
-        ao = ocl.Arc(p1, p2, C, cMode)  # arc object
-        path.append(ao)  # add the arc to the path
-        pdc.setPath(path)
-        pdc.run()  # run dropcutter algorithm on path
-        CLP = pdc.getCLPoints()
-
-        # Convert OCL object data to FreeCAD vectors
-        return [FreeCAD.Vector(p.x, p.y, p.z) for p in CLP]
+        # pdc is a PathSurfaceSupport.DropCutter, which returns FreeCAD vectors
+        return pdc.scanLine(A, B)
 
     # Main planar scan functions
     def _planarDropCutSingle(self, JOB, obj, pdc, safePDC, depthparams, SCANDATA):
@@ -1952,12 +1951,10 @@ class ObjectSurface(PathOp.ObjectOp):
                         SCANDATA[s][prt][pt].z += DepthOffset
 
     def _planarGetPDC(self, stl, finalDep, SampleInterval, cutter):
-        pdc = ocl.PathDropCutter()  # create a pdc [PathDropCutter] object
-        pdc.setSTL(stl)  # add stl model
-        pdc.setCutter(cutter)  # add cutter
-        pdc.setZ(finalDep)  # set minimumZ (final / target depth value)
-        pdc.setSampling(SampleInterval)  # set sampling size
-        return pdc
+        # scans of unchanged geometry are taken from the OCL cache
+        return PathSurfaceSupport.DropCutter(
+            ocl, stl, cutter, finalDep, SampleInterval, self.oclCacheDir, self.cutterArgs
+        )
 
     # Main rotational scan functions
     def _processRotationalOp(self, JOB, obj, mdlIdx, compoundFaces=None):
@@ -1966,6 +1963,9 @@ class ObjectSurface(PathOp.ObjectOp):
         base = JOB.Model.Group[mdlIdx]
         bb = self.boundBoxes[mdlIdx]
         stl = self.modelSTLs[mdlIdx]
+        # the scans rotate the STL, a cached one is shared with later recomputes
+        if PathSurfaceSupport.getOCLCache() is not None:
+            stl = PathSurfaceSupport.copySTL(ocl, stl)
 
         # Rotate model to initial index
         initIdx = obj.CutterTilt + obj.StartIndex
@@ -2220,12 +2220,7 @@ class ObjectSurface(PathOp.ObjectOp):
         cutterOfst = 0.0
         iCnt = 0
         Lines = []
-        result = None
-
-        pdc = ocl.PathDropCutter()  # create a pdc
-        pdc.setCutter(self.cutter)
-        pdc.setZ(layDep)  # set minimumZ (final / ta9rget depth value)
-        pdc.setSampling(sample)
+        steps = []
 
         # if self.useTiltCutter == True:
         if obj.CutterTilt != 0.0:
@@ -2235,59 +2230,56 @@ class ObjectSurface(PathOp.ObjectOp):
         sumAdv = 0.0
         for adv in advances:
             sumAdv += adv
+            rotation = None
             if adv > 0.0:
                 # Rotate STL object using OCL method
                 radsRot = math.radians(adv)
                 if obj.RotationAxis == "X":
-                    stl.rotate(radsRot, 0.0, 0.0)
+                    rotation = (radsRot, 0.0, 0.0)
                 else:
-                    stl.rotate(0.0, radsRot, 0.0)
-
-            # Set STL after rotation is made
-            pdc.setSTL(stl)
+                    rotation = (0.0, radsRot, 0.0)
 
             # add Line objects to the path in this loop
             if obj.RotationAxis == "X":
-                p1 = ocl.Point(xmin, cutterOfst, 0.0)  # start-point of line
-                p2 = ocl.Point(xmax, cutterOfst, 0.0)  # end-point of line
+                p1 = (xmin, cutterOfst)  # start-point of line
+                p2 = (xmax, cutterOfst)  # end-point of line
             else:
-                p1 = ocl.Point(cutterOfst, ymin, 0.0)  # start-point of line
-                p2 = ocl.Point(cutterOfst, ymax, 0.0)  # end-point of line
+                p1 = (cutterOfst, ymin)  # start-point of line
+                p2 = (cutterOfst, ymax)  # end-point of line
 
             # Create line object
             if obj.RotationAxis == obj.DropCutterDir:  # parallel cut
                 if obj.CutPattern == "ZigZag":
                     if iCnt % 2 == 0.0:  # even
-                        lo = ocl.Line(p1, p2)
+                        lo = (p1, p2)
                     else:  # odd
-                        lo = ocl.Line(p2, p1)
+                        lo = (p2, p1)
                 elif obj.CutPattern == "Line":
                     if self.CutClimb is True:
-                        lo = ocl.Line(p2, p1)
+                        lo = (p2, p1)
                     else:
-                        lo = ocl.Line(p1, p2)
+                        lo = (p1, p2)
                 else:
                     # default to line-object
-                    lo = ocl.Line(p1, p2)
+                    lo = (p1, p2)
             else:
-                lo = ocl.Line(p1, p2)  # line-object
+                lo = (p1, p2)  # line-object
 
-            path = ocl.Path()  # create an empty path object
-            path.append(lo)  # add the line to the path
-            pdc.setPath(path)  # set path
-            pdc.run()  # run drop-cutter on the path
-            result = pdc.getCLPoints()  # request the list of points
+            steps.append((rotation, ("L", lo[0][0], lo[0][1], 0.0, lo[1][0], lo[1][1], 0.0)))
+            iCnt += 1
+        # End loop
 
-            # Convert list of OCL objects to list of Vectors for faster access and Apply depth offset
+        # The STL is rotated before each scan, the steps can be scanned in parallel
+        for result in PathSurfaceSupport.rotatedDropCutScans(
+            ocl, stl, self.cutter, layDep, sample, steps, self.cutterArgs
+        ):
+            # Apply depth offset
             if obj.DepthOffset.Value != 0.0:
                 Lines.append(
                     [FreeCAD.Vector(p.x, p.y, p.z + obj.DepthOffset.Value) for p in result]
                 )
             else:
-                Lines.append([FreeCAD.Vector(p.x, p.y, p.z) for p in result])
-
-            iCnt += 1
-        # End loop
+                Lines.append(result)
 
         # Rotate STL object back to original position using OCL method
         reset = -1 * math.radians(sumAdv - self.resetTolerance)
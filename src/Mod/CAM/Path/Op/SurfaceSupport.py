@@ -32,11 +32,20 @@ import FreeCAD
 import Path
 import Path.Op.Util as PathOpUtil
 import PathScripts.PathUtils as PathUtils
+import array
+import collections
+import hashlib
+import json
 import math
+import os
+import struct
+import sys
+import tempfile
 
 # lazily loaded modules
 from lazy_loader.lazy_loader import LazyLoader
 
+Mesh = LazyLoader("Mesh", globals(), "Mesh")
 MeshPart = LazyLoader("MeshPart", globals(), "MeshPart")  # tessellate bug Workaround
 Part = LazyLoader("Part", globals(), "Part")
 
@@ -1253,6 +1262,8 @@ def _makeSafeSTL(self, JOB, obj, mdlIdx, faceShapes, voidShapes, ocl):
 def _makeSTL(model, obj, ocl, model_type=None):
     """Convert a mesh or shape into an OCL STL, using the tessellation
     tolerance specified in obj.LinearDeflection.
+    The STL is taken from the OCL cache if the same model was tessellated
+    with the same tolerances before.
     Returns an ocl.STLSurf()."""
     # Determine Deflection Values
     lin_def = obj.LinearDeflection.Value
@@ -1270,32 +1281,684 @@ def _makeSTL(model, obj, ocl, model_type=None):
         lin_def = 0.001
         ang_def = 0.15
 
+    cache = getOCLCache()
+    if cache is None:
+        return _meshToSTL(_makeMesh(model, lin_def, ang_def, model_type), ocl)
+    return cache.getSTL(model, lin_def, ang_def, model_type, ocl, getOCLCacheDirectory(obj))
+
+
+def _makeMesh(model, lin_def, ang_def, model_type=None):
+    """Return the mesh of a mesh object, or tessellate a shape or shape object."""
+    if model_type == "M":
+        return model.Mesh
+    if hasattr(model, "Shape"):
+        shape = model.Shape
+    else:
+        shape = model
+    # vertices, facet_indices = shape.tessellate(obj.LinearDeflection.Value) # tessellate workaround
+    # Workaround for tessellate bug
+    return MeshPart.meshFromShape(
+        Shape=shape,
+        LinearDeflection=lin_def,
+        AngularDeflection=ang_def,
+    )
+
+
+def _meshToSTL(mesh, ocl, bulk=True):
+    """Convert a Mesh.Mesh into an OCL STL.
+    With bulk=True and an OCL providing STLReader, the facets are passed to OCL
+    as a binary STL file, so no Python objects are created per point or facet.
+    Binary STL stores single precision coordinates, which is far below any
+    usable LinearDeflection value.  Otherwise one ocl.Point is made per mesh point
+    and shared by the triangles using it.
+    Returns an ocl.STLSurf()."""
+    stl = ocl.STLSurf()
+
+    if bulk and hasattr(ocl, "STLReader"):
+        fd, stlPath = tempfile.mkstemp(suffix=".stl")
+        os.close(fd)
+        try:
+            mesh.write(Filename=stlPath, Format="STL")
+            ocl.STLReader(stlPath, stl)
+        except Exception as ee:
+            Path.Log.warning("OCL STLReader failed: {}".format(ee))
+        finally:
+            os.remove(stlPath)
+        if stl.size() == mesh.CountFacets:
+            return stl
+        Path.Log.warning("Bulk STL transfer to OCL incomplete, adding triangles one by one.")
+        stl = ocl.STLSurf()
+
+    vertices, facet_indices = mesh.Topology
+    points = [ocl.Point(v.x, v.y, v.z) for v in vertices]
+    Triangle = ocl.Triangle
+    addTriangle = stl.addTriangle
+    for i1, i2, i3 in facet_indices:
+        addTriangle(Triangle(points[i1], points[i2], points[i3]))
+    return stl
+
+
+def copySTL(ocl, stl):
+    """copySTL(ocl, stl) ... Return a new ocl.STLSurf with the triangles of stl,
+    to be rotated without changing stl."""
+    copy = ocl.STLSurf()
+    Point = ocl.Point
+    Triangle = ocl.Triangle
+    for t in stl.getTriangles():
+        p1, p2, p3 = t.getPoints()
+        copy.addTriangle(
+            Triangle(Point(p1.x, p1.y, p1.z), Point(p2.x, p2.y, p2.z), Point(p3.x, p3.y, p3.z))
+        )
+    return copy
+
+
+# OCL cache
+# Tessellating the models and running the drop-cutter scans take most of the time of
+# a Surface or Waterline operation.  Both only depend on the model geometry, the
+# tessellation tolerances, the cutter and the scanned geometry, so they are kept in a
+# content addressed cache and reused when only other properties of the operation change.
+_oclCache = None
+
+
+def getOCLCache():
+    """getOCLCache() ... Return the OCL cache shared by all operations,
+    or None if the cache is disabled in the preferences."""
+    global _oclCache
+    maxBytes = Path.Preferences.oclCacheSize() * 1024 * 1024
+    if maxBytes <= 0:
+        _oclCache = None
+    elif _oclCache is None:
+        _oclCache = OCLCache(maxBytes)
+    elif _oclCache.maxBytes != maxBytes:
+        _oclCache.maxBytes = maxBytes
+        _oclCache._evict()
+    return _oclCache
+
+
+def clearOCLCache():
+    """clearOCLCache() ... Drop all STL surfaces and scans held in memory."""
+    global _oclCache
+    if _oclCache is not None:
+        _oclCache.flush()
+    _oclCache = None
+
+
+def flushOCLCache():
+    """flushOCLCache() ... Write the new scans to the disk cache."""
+    if _oclCache is not None:
+        _oclCache.flush()
+
+
+def getOCLCacheDirectory(obj):
+    """getOCLCacheDirectory(obj) ... Return the disk cache directory next to the
+    document of obj, or None if the disk cache is disabled or the document was
+    never saved."""
+    if not Path.Preferences.oclDiskCacheEnabled():
+        return None
+    fileName = obj.Document.FileName
+    if not fileName:
+        return None
+    name = os.path.splitext(os.path.basename(fileName))[0]
+    return os.path.join(os.path.dirname(fileName), name + "_OCLCache")
+
+
+def _hash(*args):
+    return hashlib.sha1(":".join([str(a) for a in args]).encode()).hexdigest()
+
+
+def _modelKey(model, model_type=None):
+    """Return a hash of the geometry of a mesh object, a shape or a shape object."""
+    digest = hashlib.sha1()
     if model_type == "M":
-        facets = model.Mesh.Facets.Points
+        vertices, facet_indices = model.Mesh.Topology
+        digest.update(b"M")
+        digest.update(array.array("d", [c for v in vertices for c in (v.x, v.y, v.z)]).tobytes())
+        digest.update(array.array("q", [i for f in facet_indices for i in f]).tobytes())
     else:
         if hasattr(model, "Shape"):
             shape = model.Shape
         else:
             shape = model
-        # vertices, facet_indices = shape.tessellate(obj.LinearDeflection.Value) # tessellate workaround
-        # Workaround for tessellate bug
-        mesh = MeshPart.meshFromShape(
-            Shape=shape,
-            LinearDeflection=lin_def,
-            AngularDeflection=ang_def,
+        digest.update(b"S")
+        digest.update(shape.exportBrepToString().encode())
+    return digest.hexdigest()
+
+
+def _cutterKey(cutter):
+    """Return a description of the geometry of an OCL cutter."""
+    return "{}({!r}, {!r}, {})".format(
+        type(cutter).__name__, cutter.getDiameter(), cutter.getLength(), cutter
+    )
+
+
+class OCLCache:
+    """OCLCache(maxBytes) ... Content addressed cache of OCL STL surfaces and drop-cutter scans.
+    STL surfaces are keyed by a hash of the model geometry and the deflection values,
+    scans by the STL, the cutter geometry, the depth, the sampling interval and the
+    scanned line or arc.  The least recently used entries are dropped once the
+    estimated size exceeds maxBytes.  If a cache directory is given the meshes and
+    the scans are also kept on disk; new scans are written by flush()."""
+
+    # estimated memory used by an ocl.Triangle with its points
+    triangleBytes = 200
+
+    def __init__(self, maxBytes):
+        self.maxBytes = maxBytes
+        self.totalBytes = 0
+        self.entries = collections.OrderedDict()  # key: (value, size in bytes)
+        self.stlKeys = dict()  # id(stl): key, for the STL surfaces in entries
+        self.scanDirs = dict()  # scan set key: cache directory
+        self.dirty = set()  # scan set keys with scans missing on disk
+
+    def _get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        self.entries.move_to_end(key)
+        return entry[0]
+
+    def _put(self, key, value, size):
+        self._remove(key)
+        self.entries[key] = (value, size)
+        self.totalBytes += size
+        self._evict()
+
+    def _grow(self, key, size):
+        (value, oldSize) = self.entries[key]
+        self.entries[key] = (value, oldSize + size)
+        self.entries.move_to_end(key)
+        self.totalBytes += size
+        self._evict()
+
+    def _evict(self):
+        # the most recently used entry is kept, it is in use
+        while self.totalBytes > self.maxBytes and len(self.entries) > 1:
+            (key, (value, size)) = self.entries.popitem(last=False)
+            self._forget(key, value, size)
+
+    def _remove(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self._forget(key, entry[0], entry[1])
+
+    def _forget(self, key, value, size):
+        self.totalBytes -= size
+        if key.startswith("stl-"):
+            self.stlKeys.pop(id(value), None)
+        elif key in self.dirty:
+            self._writeScans(key, value)
+            self.dirty.discard(key)
+
+    # Public methods
+    def getSTL(self, model, lin_def, ang_def, model_type, ocl, cacheDir=None):
+        """getSTL(model, lin_def, ang_def, model_type, ocl, cacheDir=None) ...
+        Return the ocl.STLSurf of model tessellated with the deflection values,
+        from memory, from the mesh in cacheDir or by tessellating the model."""
+        key = "stl-" + _hash(_modelKey(model, model_type), repr(lin_def), repr(ang_def))
+        stl = self._get(key)
+        if stl is not None:
+            Path.Log.debug("OCL cache: reusing STL surface {}".format(key))
+            return stl
+
+        mesh = None
+        if cacheDir:
+            fileName = os.path.join(cacheDir, key + ".stl")
+            if os.path.isfile(fileName):
+                try:
+                    mesh = Mesh.Mesh(fileName)
+                except Exception as ee:
+                    Path.Log.warning("OCL cache: failed to read {}: {}".format(fileName, ee))
+                    mesh = None
+        if mesh is None:
+            mesh = _makeMesh(model, lin_def, ang_def, model_type)
+            if cacheDir:
+                self._write(
+                    cacheDir, key + ".stl", lambda f: mesh.write(Filename=f, Format="STL")
+                )
+
+        stl = _meshToSTL(mesh, ocl)
+        self._put(key, stl, stl.size() * self.triangleBytes)
+        self.stlKeys[id(stl)] = key
+        return stl
+
+    def getScans(self, stl, cutter, z, sampling, cacheDir=None):
+        """getScans(stl, cutter, z, sampling, cacheDir=None) ...
+        Return the key and the dictionary of the scans made on stl with cutter,
+        minimum depth z and the sampling interval.
+        Returns (None, None) if stl is not an STL surface of this cache."""
+        stlKey = self.stlKeys.get(id(stl))
+        if stlKey is None:
+            return (None, None)
+        key = "scan-" + _hash(stlKey, _cutterKey(cutter), repr(z), repr(sampling))
+        scans = self._get(key)
+        if scans is None:
+            scans = dict()
+            if cacheDir:
+                self.scanDirs[key] = cacheDir
+                scans = self._readScans(os.path.join(cacheDir, key + ".scans"))
+            self._put(key, scans, sum([a.itemsize * len(a) for a in scans.values()]))
+        return (key, scans)
+
+    def addScan(self, key, scanKey, points):
+        """addScan(key, scanKey, points) ... Add the flat array of x, y, z
+        values of a scan to the scan set with key."""
+        scans = self._get(key)
+        if scans is None:
+            return
+        scans[scanKey] = points
+        if key in self.scanDirs:
+            self.dirty.add(key)
+        self._grow(key, points.itemsize * len(points))
+
+    def flush(self):
+        """flush() ... Write the scan sets with new scans to their cache directory."""
+        for key in list(self.dirty):
+            entry = self.entries.get(key)
+            if entry is not None:
+                self._writeScans(key, entry[0])
+        self.dirty.clear()
+
+    # Disk cache
+    def _write(self, cacheDir, name, write):
+        """Write a file of the disk cache through a temporary file,
+        so an interrupted write never leaves a partial entry."""
+        tmpName = None
+        try:
+            os.makedirs(cacheDir, exist_ok=True)
+            fd, tmpName = tempfile.mkstemp(dir=cacheDir, suffix=os.path.splitext(name)[1])
+            os.close(fd)
+            write(tmpName)
+            os.replace(tmpName, os.path.join(cacheDir, name))
+        except Exception as ee:
+            Path.Log.warning("OCL cache: failed to write {}: {}".format(name, ee))
+            if tmpName and os.path.exists(tmpName):
+                os.remove(tmpName)
+
+    def _writeScans(self, key, scans):
+        # A JSON header with the scan keys and lengths, followed by the raw values
+        def write(fileName):
+            keys = list(scans)
+            header = json.dumps(
+                {
+                    "byteorder": sys.byteorder,
+                    "scans": [[list(k), len(scans[k])] for k in keys],
+                }
+            ).encode()
+            with open(fileName, "wb") as fp:
+                fp.write(struct.pack("<Q", len(header)))
+                fp.write(header)
+                for k in keys:
+                    scans[k].tofile(fp)
+
+        self._write(self.scanDirs[key], key + ".scans", write)
+
+    def _readScans(self, fileName):
+        scans = dict()
+        if not os.path.isfile(fileName):
+            return scans
+        try:
+            with open(fileName, "rb") as fp:
+                (size,) = struct.unpack("<Q", fp.read(8))
+                header = json.loads(fp.read(size).decode())
+                for k, count in header["scans"]:
+                    points = array.array("d")
+                    points.fromfile(fp, count)
+                    if header["byteorder"] != sys.byteorder:
+                        points.byteswap()
+                    scans[tuple(k)] = points
+        except Exception as ee:
+            Path.Log.warning("OCL cache: failed to read {}: {}".format(fileName, ee))
+            return dict()
+        return scans
+
+
+class DropCutter:
+    """DropCutter(ocl, stl, cutter, z, sampling, cacheDir=None, cutterArgs=None) ...
+    Runs ocl.PathDropCutter scans on stl with cutter, minimum depth z and the
+    sampling interval, reusing the scans in the OCL cache where possible.
+    With cutterArgs, the (class name, arguments) of the OCL cutter, the scans
+    missing from the cache are run in the scan pool when it is enabled.
+    All scans are returned as lists of FreeCAD.Vector."""
+
+    def __init__(self, ocl, stl, cutter, z, sampling, cacheDir=None, cutterArgs=None):
+        self.ocl = ocl
+        self.stl = stl
+        self.cutter = cutter
+        self.z = z
+        self.sampling = sampling
+        self.cutterArgs = cutterArgs
+        self.pdc = None
+        self.key = None
+        self.scans = None
+        self.cache = getOCLCache()
+        if self.cache is not None:
+            (self.key, self.scans) = self.cache.getScans(stl, cutter, z, sampling, cacheDir)
+
+    def _getPDC(self):
+        # Setting the STL builds the search tree, so only do it once a scan is missing
+        if self.pdc is None:
+            self.pdc = self.ocl.PathDropCutter()  # create a pdc [PathDropCutter] object
+            self.pdc.setSTL(self.stl)  # add stl model
+            self.pdc.setCutter(self.cutter)  # add cutter
+            self.pdc.setZ(self.z)  # set minimumZ (final / target depth value)
+            self.pdc.setSampling(self.sampling)  # set sampling size
+        return self.pdc
+
+    def _run(self, spanLists):
+        """Return the flat x, y, z arrays of the scans of each list of spans."""
+        pool = None
+        if self.cutterArgs and sum([len(spans) for spans in spanLists]) > 1:
+            pool = getScanPool()
+        if pool is not None:
+            return _scanParallel(
+                pool, self.stl, self.cutterArgs, self.z, self.sampling, spanLists
+            )
+
+        results = []
+        for spans in spanLists:
+            path = self.ocl.Path()  # create an empty path object
+            for span in spans:
+                path.append(_makeOCLSpan(self.ocl, span))
+            pdc = self._getPDC()
+            pdc.setPath(path)
+            pdc.run()  # run dropcutter algorithm on path
+            results.append(_clPointsToArray(pdc.getCLPoints()))
+        return results
+
+    # Public methods
+    def scan(self, requests):
+        """scan(requests) ... Run the scans of the (scanKey, spans) requests, see
+        lineRequest(), arcRequest() and gridRequest(), and return the points of each."""
+        return [_arrayToVectors(pnts) for pnts in self.scanArrays(requests)]
+
+    def scanArrays(self, requests):
+        """scanArrays(requests) ... Like scan(), but return the points of each
+        scan as a flat array.array of x, y, z values."""
+        results = [None] * len(requests)
+        missing = []
+        for i, (scanKey, spans) in enumerate(requests):
+            if self.scans is not None:
+                results[i] = self.scans.get(scanKey)
+            if results[i] is None:
+                missing.append(i)
+
+        if missing:
+            computed = self._run([requests[i][1] for i in missing])
+            for i, pnts in zip(missing, computed):
+                results[i] = pnts
+                if self.scans is not None:
+                    self.cache.addScan(self.key, requests[i][0], pnts)
+
+        return results
+
+    def lineRequest(self, A, B):
+        """lineRequest(A, B) ... Return the request to scan the line
+        from the (x, y) tuple A to B."""
+        (x1, y1) = (float(A[0]), float(A[1]))
+        (x2, y2) = (float(B[0]), float(B[1]))
+        return (("L", x1, y1, x2, y2), [("L", x1, y1, 0.0, x2, y2, 0.0)])
+
+    def arcRequest(self, Arc, cMode):
+        """arcRequest(Arc, cMode) ... Return the request to scan the arc
+        (start, end, center) in direction cMode."""
+        (sp, ep, cp) = Arc
+        arc = [float(v) for v in (sp[0], sp[1], ep[0], ep[1], cp[0], cp[1])]
+        return (tuple(["A"] + arc + [bool(cMode)]), [tuple(["A"] + arc + [bool(cMode)])])
+
+    def gridRequest(self, xmin, xmax, ymin, numScanLines):
+        """gridRequest(xmin, xmax, ymin, numScanLines) ... Return the request to scan
+        numScanLines lines from xmin to xmax at depth z, spaced by the sampling
+        interval from ymin."""
+        (xmin, xmax, ymin) = (float(xmin), float(xmax), float(ymin))
+        spans = []
+        for nSL in range(0, numScanLines):
+            yVal = ymin + (nSL * self.sampling)
+            spans.append(("L", xmin, yVal, self.z, xmax, yVal, self.z))
+        return (("G", xmin, xmax, ymin, int(numScanLines)), spans)
+
+    def scanLines(self, lines):
+        """scanLines(lines) ... Scan the ((x, y), (x, y)) lines."""
+        return self.scan([self.lineRequest(A, B) for (A, B) in lines])
+
+    def scanArcs(self, arcs):
+        """scanArcs(arcs) ... Scan the ((start, end, center), cMode) arcs."""
+        return self.scan([self.arcRequest(Arc, cMode) for (Arc, cMode) in arcs])
+
+    def scanLine(self, A, B):
+        """scanLine(A, B) ... Scan the line from the (x, y) tuple A to B."""
+        return self.scan([self.lineRequest(A, B)])[0]
+
+    def scanArc(self, Arc, cMode):
+        """scanArc(Arc, cMode) ... Scan the arc (start, end, center) in direction cMode."""
+        return self.scan([self.arcRequest(Arc, cMode)])[0]
+
+    def scanGrid(self, xmin, xmax, ymin, numScanLines):
+        """scanGrid(xmin, xmax, ymin, numScanLines) ... Scan numScanLines lines
+        from xmin to xmax at depth z, spaced by the sampling interval from ymin."""
+        return self.scan([self.gridRequest(xmin, xmax, ymin, numScanLines)])[0]
+
+
+def rotatedDropCutScans(ocl, stl, cutter, z, sampling, steps, cutterArgs=None):
+    """rotatedDropCutScans(ocl, stl, cutter, z, sampling, steps, cutterArgs=None) ...
+    Scan the steps, a list of (rotation, span) tuples, one after another: stl is
+    rotated by the (rx, ry, rz) radians of rotation, unless it is None, and then
+    span is scanned.  stl is left rotated by all rotations.
+    Returns the list of FreeCAD.Vector points of each step."""
+    pool = None
+    if cutterArgs and len(steps) > 1:
+        pool = getScanPool()
+
+    if pool is None:
+        results = []
+        pdc = ocl.PathDropCutter()  # create a pdc
+        pdc.setCutter(cutter)
+        pdc.setZ(z)  # set minimumZ (final / target depth value)
+        pdc.setSampling(sampling)
+        for rotation, span in steps:
+            if rotation is not None:
+                stl.rotate(*rotation)
+            # Set STL after rotation is made
+            pdc.setSTL(stl)
+            path = ocl.Path()  # create an empty path object
+            path.append(_makeOCLSpan(ocl, span))  # add the line to the path
+            pdc.setPath(path)  # set path
+            pdc.run()  # run drop-cutter on the path
+            results.append(_arrayToVectors(_clPointsToArray(pdc.getCLPoints())))
+        return results
+
+    # Each worker starts from the current STL and repeats the rotations
+    # of the steps before its band, so it rotates exactly like stl would
+    stlFile = _writeSTLFile(stl)
+    try:
+        results = _scanParallel(
+            pool, stl, cutterArgs, z, sampling, [[span] for _, span in steps], stlFile, steps
+        )
+    finally:
+        os.remove(stlFile)
+    for rotation, _ in steps:
+        if rotation is not None:
+            stl.rotate(*rotation)
+    return [_arrayToVectors(pnts) for pnts in results]
+
+
+# Parallel drop-cutter scans
+# The scans are independent of each other, the points of a path are the points
+# of its spans, one after another.  So the spans are split into bands which are
+# scanned in worker processes.  OCL objects can not be pickled, each worker reads
+# its own copy of the STL surface from a file and creates its own cutter.
+_scanPool = None
+_scanPoolSTLs = dict()  # id(stl): (stl, file name), the STL files of the pool
+_workerSTLs = dict()  # file name: ocl.STLSurf, in a worker process
+
+
+def getScanPool():
+    """getScanPool() ... Return the process pool for drop-cutter scans,
+    or None if the OCLWorkers preference is 1 or less."""
+    global _scanPool
+    workers = Path.Preferences.oclWorkers()
+    if workers <= 1:
+        return None
+    if _scanPool is None:
+        import Path.Post.UtilsParallel as PostUtilsParallel
+
+        try:
+            _scanPool = PostUtilsParallel.create_executor(workers)
+        except RuntimeError as e:
+            Path.Log.warning("Running the drop-cutter scans in one process: {}".format(e))
+            return None
+        _scanPool.workers = workers
+    return _scanPool
+
+
+def closeScanPool():
+    """closeScanPool() ... Stop the worker processes and remove their STL files."""
+    global _scanPool
+    if _scanPool is not None:
+        _scanPool.shutdown()
+        _scanPool = None
+    for _, fileName in _scanPoolSTLs.values():
+        if os.path.exists(fileName):
+            os.remove(fileName)
+    _scanPoolSTLs.clear()
+
+
+def _scanParallel(pool, stl, cutterArgs, z, sampling, spanLists, stlFile=None, steps=None):
+    """Scan the lists of spans in bands in the pool and join the points of each list.
+    With steps, see rotatedDropCutScans(), the STL is rotated before each list."""
+    if stlFile is None:
+        if id(stl) not in _scanPoolSTLs:
+            _scanPoolSTLs[id(stl)] = (stl, _writeSTLFile(stl))
+        stlFile = _scanPoolSTLs[id(stl)][1]
+
+    flat = [(i, span) for i, spans in enumerate(spanLists) for span in spans]
+    bandSize = max(1, int(math.ceil(len(flat) / (pool.workers * 4.0))))
+    futures = []
+    for start in range(0, len(flat), bandSize):
+        operations = []
+        indexes = []
+        if steps is not None:
+            # rotations of the steps before this band
+            for rotation, _ in steps[: flat[start][0]]:
+                if rotation is not None:
+                    operations.append(("R",) + tuple(rotation))
+        for i, span in flat[start : start + bandSize]:
+            if not indexes or indexes[-1] != i:
+                if steps is not None and steps[i][0] is not None:
+                    operations.append(("R",) + tuple(steps[i][0]))
+                operations.append(("S", []))
+                indexes.append(i)
+            operations[-1][1].append(span)
+        futures.append(
+            (
+                indexes,
+                pool.submit(_dropCutBand, stlFile, cutterArgs, z, sampling, operations),
+            )
         )
-        vertices = [point.Vector for point in mesh.Points]
-        facet_indices = [facet.PointIndices for facet in mesh.Facets]
-        facets = ((vertices[f[0]], vertices[f[1]], vertices[f[2]]) for f in facet_indices)
+
+    results = [array.array("d") for _ in spanLists]
+    for indexes, future in futures:
+        for i, pnts in zip(indexes, future.result()):
+            results[i].extend(pnts)
+    return results
+
+
+def _dropCutBand(stlFile, cutterArgs, z, sampling, operations):
+    """Scan a band in a worker process.  The operations are ("R", rx, ry, rz)
+    rotations of the STL and ("S", spans) scans.
+    Returns the flat x, y, z array of each scan."""
+    ocl = _importOCL()
+    rotated = any([op[0] == "R" for op in operations])
+    if rotated:
+        # the rotations change the STL, so it can not be reused
+        stl = _readSTLFile(ocl, stlFile)
+    else:
+        if stlFile not in _workerSTLs:
+            _workerSTLs[stlFile] = _readSTLFile(ocl, stlFile)
+        stl = _workerSTLs[stlFile]
+
+    (name, args) = cutterArgs
+    pdc = ocl.PathDropCutter()
+    pdc.setCutter(getattr(ocl, name)(*args))
+    pdc.setZ(z)
+    pdc.setSampling(sampling)
+
+    results = []
+    stlSet = False
+    for op in operations:
+        if op[0] == "R":
+            stl.rotate(*op[1:])
+            stlSet = False
+            continue
+        if not stlSet:
+            pdc.setSTL(stl)
+            stlSet = True
+        path = ocl.Path()
+        for span in op[1]:
+            path.append(_makeOCLSpan(ocl, span))
+        pdc.setPath(path)
+        pdc.run()
+        results.append(_clPointsToArray(pdc.getCLPoints()))
+    return results
+
+
+def _importOCL():
+    try:
+        import ocl
+    except ImportError:
+        import opencamlib as ocl
+    return ocl
+
+
+def _makeOCLSpan(ocl, span):
+    """Return the ocl.Line of a ("L", x1, y1, z1, x2, y2, z2) span
+    or the ocl.Arc of a ("A", x1, y1, x2, y2, cx, cy, ccw) span."""
+    if span[0] == "L":
+        p1 = ocl.Point(span[1], span[2], span[3])  # start-point of line
+        p2 = ocl.Point(span[4], span[5], span[6])  # end-point of line
+        return ocl.Line(p1, p2)
+    p1 = ocl.Point(span[1], span[2], 0)  # start point of arc
+    p2 = ocl.Point(span[3], span[4], 0)  # end point of arc
+    C = ocl.Point(span[5], span[6], 0)  # center point of arc
+    return ocl.Arc(p1, p2, C, span[7])
+
+
+def _clPointsToArray(CLP):
+    return array.array("d", [c for p in CLP for c in (p.x, p.y, p.z)])
+
+
+def _arrayToVectors(pnts):
+    return [FreeCAD.Vector(pnts[i], pnts[i + 1], pnts[i + 2]) for i in range(0, len(pnts), 3)]
+
+
+def _writeSTLFile(stl):
+    """Write the triangles of an ocl.STLSurf to a temporary file, at full
+    precision and in order, and return its name."""
+    pnts = array.array("d")
+    for t in stl.getTriangles():
+        for p in t.getPoints():
+            pnts.extend((p.x, p.y, p.z))
+    fd, fileName = tempfile.mkstemp(suffix=".oclstl")
+    with os.fdopen(fd, "wb") as fp:
+        pnts.tofile(fp)
+    return fileName
+
+
+def _readSTLFile(ocl, fileName):
+    """Read an ocl.STLSurf written by _writeSTLFile()."""
+    pnts = array.array("d")
+    with open(fileName, "rb") as fp:
+        pnts.frombytes(fp.read())
     stl = ocl.STLSurf()
-    for tri in facets:
-        v1, v2, v3 = tri
-        t = ocl.Triangle(
-            ocl.Point(v1[0], v1[1], v1[2]),
-            ocl.Point(v2[0], v2[1], v2[2]),
-            ocl.Point(v3[0], v3[1], v3[2]),
+    Point = ocl.Point
+    Triangle = ocl.Triangle
+    for i in range(0, len(pnts), 9):
+        stl.addTriangle(
+            Triangle(
+                Point(pnts[i], pnts[i + 1], pnts[i + 2]),
+                Point(pnts[i + 3], pnts[i + 4], pnts[i + 5]),
+                Point(pnts[i + 6], pnts[i + 7], pnts[i + 8]),
+            )
         )
-        stl.addTriangle(t)
     return stl
 
 
@@ -2444,6 +3107,7 @@ class OCL_Tool:
         self.tiltCutter = False
         self.safe = safe
         self.oclTool = None
+        self.oclToolArgs = None
         self.toolType = None
         self.toolMode = None
         self.toolMethod = None
@@ -2639,7 +3303,8 @@ class OCL_Tool:
         # OCL -> CylCutter::CylCutter(diameter, length)
         if self.diameter == -1.0 or self.cutEdgeHeight == -1.0:
             return
-        self.oclTool = self.ocl.CylCutter(self.diameter, self.cutEdgeHeight + self.lengthOffset)
+        self.oclToolArgs = ("CylCutter", (self.diameter, self.cutEdgeHeight + self.lengthOffset))
+        self.oclTool = self.ocl.CylCutter(*self.oclToolArgs[1])
 
     def _oclBallCutter(self):
         # Standard Ball End Mill
@@ -2649,7 +3314,8 @@ class OCL_Tool:
         self.tiltCutter = True
         if self.cutEdgeHeight == 0:
             self.cutEdgeHeight = self.diameter / 2
-        self.oclTool = self.ocl.BallCutter(self.diameter, self.cutEdgeHeight + self.lengthOffset)
+        self.oclToolArgs = ("BallCutter", (self.diameter, self.cutEdgeHeight + self.lengthOffset))
+        self.oclTool = self.ocl.BallCutter(*self.oclToolArgs[1])
 
     def _oclBullCutter(self):
         # Standard Bull Nose cutter
@@ -2657,18 +3323,23 @@ class OCL_Tool:
         # OCL -> BullCutter::BullCutter(diameter, minor radius, length)
         if self.diameter == -1.0 or self.flatRadius == -1.0 or self.cutEdgeHeight == -1.0:
             return
-        self.oclTool = self.ocl.BullCutter(
-            self.diameter,
-            self.diameter / 2 - self.flatRadius,
-            self.cutEdgeHeight + self.lengthOffset,
+        self.oclToolArgs = (
+            "BullCutter",
+            (
+                self.diameter,
+                self.diameter / 2 - self.flatRadius,
+                self.cutEdgeHeight + self.lengthOffset,
+            ),
         )
+        self.oclTool = self.ocl.BullCutter(*self.oclToolArgs[1])
 
     def _oclConeCutter(self):
         # Engraver or V-bit cutter
         # OCL -> ConeCutter::ConeCutter(diameter, angle, length)
         if self.diameter == -1.0 or self.cutEdgeAngle == -1.0 or self.cutEdgeHeight == -1.0:
             return
-        self.oclTool = self.ocl.ConeCutter(self.diameter, self.cutEdgeAngle / 2, self.lengthOffset)
+        self.oclToolArgs = ("ConeCutter", (self.diameter, self.cutEdgeAngle / 2, self.lengthOffset))
+        self.oclTool = self.ocl.ConeCutter(*self.oclToolArgs[1])
 
     def _setToolMethod(self):
         toolMap = dict()
@@ -2721,6 +3392,12 @@ class OCL_Tool:
         FreeCAD.Console.PrintError(err + "\n")
         return False
 
+    def getOclToolArgs(self):
+        """getOclToolArgs()... Call this method after getOclTool() method
+        to return the OCL class name and arguments of the OCL tool, which
+        worker processes use to create their own copy of the tool."""
+        return self.oclToolArgs
+
     def useTiltCutter(self):
         """useTiltCutter()... Call this method after getOclTool() method
         to return status of cutter tilt availability - generally this
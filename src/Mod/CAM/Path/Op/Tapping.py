@@ -275,6 +275,10 @@ class ObjectTapping(PathCircularHoleBase.ObjectOp):
         # Apply feed rates to commands
         PathFeedRate.setFeedRate(self.commandlist, obj.ToolController)
 
+    def opFingerprint(self, obj):
+        """opFingerprint(obj) ... the safe height offset of the setup sheet is used directly."""
+        return {"SetupSheet.SafeHeightOffset": self.job.SetupSheet.SafeHeightOffset}
+
     def opSetDefaultValues(self, obj, job):
         """opSetDefaultValues(obj, job) ... set default value for RetractHeight"""
         obj.ExtraOffset = "None"
@@ -48,6 +48,7 @@ import Path.Op.Base as PathOp
 import Path.Op.SurfaceSupport as PathSurfaceSupport
 import PathScripts.PathUtils as PathUtils
 import math
+import numpy
 import time
 from PySide.QtCore import QT_TRANSLATE_NOOP
 
@@ -743,8 +744,23 @@ class ObjectWaterline(PathOp.ObjectOp):
                     models = self.job.Stock
                     obj.OpFinalDepth = self.job.Stock.Shape.BoundBox.ZMin
 
+    def opFingerprint(self, obj):
+        """opFingerprint(obj) ... the height offsets of the setup sheet are used directly."""
+        setupSheet = self.job.SetupSheet
+        return {
+            "SetupSheet.SafeHeightOffset": setupSheet.SafeHeightOffset,
+            "SetupSheet.ClearanceHeightOffset": setupSheet.ClearanceHeightOffset,
+        }
+
     def opExecute(self, obj):
         """opExecute(obj) ... process surface operation"""
+        try:
+            return self._opExecute(obj)
+        finally:
+            # stop the drop-cutter scan workers, also if the operation failed
+            PathSurfaceSupport.closeScanPool()
+
+    def _opExecute(self, obj):
         Path.Log.track()
 
         self.modelSTLs = list()
@@ -761,6 +777,7 @@ class ObjectWaterline(PathOp.ObjectOp):
         self.closedGap = False
         self.tmpCOM = None
         self.gaps = [0.1, 0.2, 0.3]
+        self.oclCacheDir = PathSurfaceSupport.getOCLCacheDirectory(obj)
         CMDS = list()
         modelVisibility = list()
         FCAD = FreeCAD.ActiveDocument
@@ -817,6 +834,7 @@ class ObjectWaterline(PathOp.ObjectOp):
                 )
             )
             return
+        self.cutterArgs = oclTool.getOclToolArgs()
         self.toolDiam = self.cutter.getDiameter()
         self.radius = self.toolDiam / 2.0
         self.cutOut = self.toolDiam * (float(obj.StepOver) / 100.0)
@@ -970,6 +988,7 @@ class ObjectWaterline(PathOp.ObjectOp):
 
             # Save gcode produced
             self.commandlist.extend(CMDS)
+            PathSurfaceSupport.flushOCLCache()
 
         # ######  CLOSING COMMANDS FOR OPERATION ######
 
@@ -1318,17 +1337,12 @@ class ObjectWaterline(PathOp.ObjectOp):
             # Run Scan (Grid  based)
             fd = depthparams[-1]
             oclScan = self._waterlineDropCutScan(stl, smplInt, xmin, xmax, ymin, fd, numScanLines)
-            oclScan = [FreeCAD.Vector(P.x, P.y, P.z + depOfst) for P in oclScan]
+            oclScan[:, 2] += depOfst
 
-            # Convert point list to grid (scanLines)
+            # Convert point array to grid (scanLines)
             lenOS = len(oclScan)
             ptPrLn = int(lenOS / numScanLines)
-            scanLines = []
-            for L in range(0, numScanLines):
-                scanLines.append([])
-                for P in range(0, ptPrLn):
-                    pi = L * ptPrLn + P
-                    scanLines[L].append(oclScan[pi])
+            scanLines = oclScan[: numScanLines * ptPrLn].reshape(numScanLines, ptPrLn, 3)
 
             # Extract Waterline Layers Iteratively
             lenSL = len(scanLines)
@@ -1352,25 +1366,13 @@ class ObjectWaterline(PathOp.ObjectOp):
     def _waterlineDropCutScan(self, stl, smplInt, xmin, xmax, ymin, fd, numScanLines):
         """_waterlineDropCutScan(stl, smplInt, xmin, xmax, ymin, fd, numScanLines) ...
         Perform OCL scan for waterline purpose."""
-        pdc = ocl.PathDropCutter()  # create a pdc
-        pdc.setSTL(stl)
-        pdc.setCutter(self.cutter)
-        pdc.setZ(fd)  # set minimumZ (final / target depth value)
-        pdc.setSampling(smplInt)
-
-        # Create line object as path
-        path = ocl.Path()  # create an empty path object
-        for nSL in range(0, numScanLines):
-            yVal = ymin + (nSL * smplInt)
-            p1 = ocl.Point(xmin, yVal, fd)  # start-point of line
-            p2 = ocl.Point(xmax, yVal, fd)  # end-point of line
-            path.append(ocl.Line(p1, p2))
-            # path.append(l)        # add the line to the path
-        pdc.setPath(path)
-        pdc.run()  # run drop-cutter on the path
-
-        # return the list of points
-        return pdc.getCLPoints()
+        pdc = PathSurfaceSupport.DropCutter(
+            ocl, stl, self.cutter, fd, smplInt, self.oclCacheDir, self.cutterArgs
+        )
+
+        # return the (n, 3) array of points, the grid of unchanged geometry is taken from the OCL cache
+        pnts = pdc.scanArrays([pdc.gridRequest(xmin, xmax, ymin, numScanLines)])[0]
+        return numpy.array(pnts, dtype=float).reshape(-1, 3)
 
     def _waterlineAdaptiveScan(self, stl, smplInt, minSmplInt, zheights, depOfst):
         """Perform OCL Adaptive scan for waterline purpose."""
@@ -1440,108 +1442,108 @@ class ObjectWaterline(PathOp.ObjectOp):
 
     def _createTopoMap(self, scanLines, layDep, lenSL, pntsPerLine):
         """_createTopoMap(scanLines, layDep, lenSL, pntsPerLine) ... Create topo map version of OCL scan data."""
-        topoMap = []
-        for L in range(0, lenSL):
-            topoMap.append([])
-            for P in range(0, pntsPerLine):
-                if scanLines[L][P].z > layDep:
-                    topoMap[L].append(2)
-                else:
-                    topoMap[L].append(0)
-        return topoMap
+        # scanLines is a (lenSL, pntsPerLine, 3) array of the scan points
+        return numpy.where(scanLines[:lenSL, :pntsPerLine, 2] > layDep, 2, 0).astype(numpy.int8)
 
     def _bufferTopoMap(self, lenSL, pntsPerLine):
         """_bufferTopoMap(lenSL, pntsPerLine) ... Add buffer boarder of zeros to all sides to topoMap data."""
-        pre = [0, 0]
-        post = [0, 0]
-        for p in range(0, pntsPerLine):
-            pre.append(0)
-            post.append(0)
-        for i in range(0, lenSL):
-            self.topoMap[i].insert(0, 0)
-            self.topoMap[i].append(0)
-        self.topoMap.insert(0, pre)
-        self.topoMap.append(post)
+        self.topoMap = numpy.pad(self.topoMap, 1)
         return True
 
     def _highlightWaterline(self, extraMaterial, insCorn):
         """_highlightWaterline(extraMaterial, insCorn) ... Highlight the waterline data, separating from extra material."""
         TM = self.topoMap
-        lastPnt = len(TM[1]) - 1
-        lastLn = len(TM) - 1
-        highFlag = 0
+        lastPnt = TM.shape[1] - 1
+        lastLn = TM.shape[0] - 1
+        inner = TM[1:lastLn, 1:lastPnt]
 
         # ("--Convert parallel data to ridges")
-        for lin in range(1, lastLn):
-            for pt in range(1, lastPnt):  # Ignore first and last points
-                if TM[lin][pt] == 0:
-                    if TM[lin][pt + 1] == 2:  # step up
-                        TM[lin][pt] = 1
-                    if TM[lin][pt - 1] == 2:  # step down
-                        TM[lin][pt] = 1
+        # Only zeros change, so the steps up and down are those of the unchanged map
+        ridges = (inner == 0) & ((TM[1:lastLn, 2:] == 2) | (TM[1:lastLn, :-2] == 2))
+        inner[ridges] = 1
 
         # ("--Convert perpendicular data to ridges and highlight ridges")
-        for pt in range(1, lastPnt):  # Ignore first and last points
-            for lin in range(1, lastLn):
-                if TM[lin][pt] == 0:
-                    highFlag = 0
-                    if TM[lin + 1][pt] == 2:  # step up
-                        TM[lin][pt] = 1
-                    if TM[lin - 1][pt] == 2:  # step down
-                        TM[lin][pt] = 1
-                elif TM[lin][pt] == 2:
-                    highFlag += 1
-                    if highFlag == 3:
-                        if TM[lin - 1][pt - 1] < 2 or TM[lin - 1][pt + 1] < 2:
-                            highFlag = 2
-                        else:
-                            TM[lin - 1][pt] = extraMaterial
-                            highFlag = 2
+        # The points are visited column by column.  From the third high point after a
+        # zero point, counting on from the end of the previous column, the point before
+        # a high point is extra material if the points diagonal to it are high too.
+        sequence = inner.T.ravel()
+        highs = numpy.cumsum(sequence == 2)
+        highRun = highs - numpy.maximum.accumulate(numpy.where(sequence == 0, highs, 0))
+        pt, lin = numpy.divmod(numpy.flatnonzero((sequence == 2) & (highRun >= 3)), lastLn - 1)
+        (lin, pt) = (lin + 1, pt + 1)
+        ridges = (inner == 0) & ((TM[2:, 1:lastPnt] == 2) | (TM[:-2, 1:lastPnt] == 2))
+        inner[ridges] = 1
+        # Marking a ridge point as extra material makes it high for the next column,
+        # so the columns are marked in order
+        (cols, starts) = numpy.unique(pt, return_index=True)
+        for p, lins in zip(cols.tolist(), numpy.split(lin, starts[1:])):
+            lins = lins[(TM[lins - 1, p - 1] >= 2) & (TM[lins - 1, p + 1] >= 2)]
+            TM[lins - 1, p] = extraMaterial
 
         # ("--Square corners")
-        for pt in range(1, lastPnt):
-            for lin in range(1, lastLn):
-                if TM[lin][pt] == 1:  # point == 1
-                    cont = True
-                    if TM[lin + 1][pt] == 0:  # forward == 0
-                        if TM[lin + 1][pt - 1] == 1:  # forward left == 1
-                            if TM[lin][pt - 1] == 2:  # left == 2
-                                TM[lin + 1][pt] = 1  # square the corner
-                                cont = False
-
-                        if cont is True and TM[lin + 1][pt + 1] == 1:  # forward right == 1
-                            if TM[lin][pt + 1] == 2:  # right == 2
-                                TM[lin + 1][pt] = 1  # square the corner
-                        cont = True
-
-                    if TM[lin - 1][pt] == 0:  # back == 0
-                        if TM[lin - 1][pt - 1] == 1:  # back left == 1
-                            if TM[lin][pt - 1] == 2:  # left == 2
-                                TM[lin - 1][pt] = 1  # square the corner
-                                cont = False
-
-                        if cont is True and TM[lin - 1][pt + 1] == 1:  # back right == 1
-                            if TM[lin][pt + 1] == 2:  # right == 2
-                                TM[lin - 1][pt] = 1  # square the corner
+        # Squaring a corner can add the next point of the column, which is squared in turn
+        cols = numpy.ascontiguousarray(TM.T)  # the passes below go column by column
+        for pt in numpy.flatnonzero((cols[1:lastPnt, 1:lastLn] == 1).any(axis=1)) + 1:
+            left = cols[pt - 1].tolist()
+            cur = cols[pt].tolist()
+            right = cols[pt + 1].tolist()
+            for lin in (numpy.flatnonzero(cols[pt, 1:lastLn] == 1) + 1).tolist():
+                while self._squareCorner(left, cur, right, lin) and lin + 1 < lastLn:
+                    lin += 1
+            cols[pt] = cur
 
         # remove inside corners
-        for pt in range(1, lastPnt):
-            for lin in range(1, lastLn):
-                if TM[lin][pt] == 1:  # point == 1
-                    if TM[lin][pt + 1] == 1:
-                        if TM[lin - 1][pt + 1] == 1 or TM[lin + 1][pt + 1] == 1:
-                            TM[lin][pt + 1] = insCorn
-                    elif TM[lin][pt - 1] == 1:
-                        if TM[lin - 1][pt - 1] == 1 or TM[lin + 1][pt - 1] == 1:
-                            TM[lin][pt - 1] = insCorn
+        for pt in numpy.flatnonzero((cols[1:lastPnt, 1:lastLn] == 1).any(axis=1)) + 1:
+            left = cols[pt - 1].tolist()
+            cur = cols[pt].tolist()
+            right = cols[pt + 1].tolist()
+            for lin in (numpy.flatnonzero(cols[pt, 1:lastLn] == 1) + 1).tolist():
+                if right[lin] == 1:
+                    if right[lin - 1] == 1 or right[lin + 1] == 1:
+                        right[lin] = insCorn
+                elif left[lin] == 1:
+                    if left[lin - 1] == 1 or left[lin + 1] == 1:
+                        left[lin] = insCorn
+            cols[pt - 1] = left
+            cols[pt + 1] = right
+        TM[:, :] = cols.T
 
         return True
 
+    def _squareCorner(self, left, cur, right, lin):
+        """_squareCorner(left, cur, right, lin) ... Square the corners at point lin of the
+        column cur, a ridge point.  Returns True if the next point became a ridge point."""
+        forward = False
+        cont = True
+        if cur[lin + 1] == 0:  # forward == 0
+            if left[lin + 1] == 1:  # forward left == 1
+                if left[lin] == 2:  # left == 2
+                    cur[lin + 1] = 1  # square the corner
+                    forward = True
+                    cont = False
+
+            if cont is True and right[lin + 1] == 1:  # forward right == 1
+                if right[lin] == 2:  # right == 2
+                    cur[lin + 1] = 1  # square the corner
+                    forward = True
+            cont = True
+
+        if cur[lin - 1] == 0:  # back == 0
+            if left[lin - 1] == 1:  # back left == 1
+                if left[lin] == 2:  # left == 2
+                    cur[lin - 1] = 1  # square the corner
+                    cont = False
+
+            if cont is True and right[lin - 1] == 1:  # back right == 1
+                if right[lin] == 2:  # right == 2
+                    cur[lin - 1] = 1  # square the corner
+        return forward
+
     def _extractWaterlines(self, obj, oclScan, lyr, layDep):
         """_extractWaterlines(obj, oclScan, lyr, layDep) ... Extract water lines from OCL scan data."""
         srch = True
-        lastPnt = len(self.topoMap[0]) - 1
-        lastLn = len(self.topoMap) - 1
+        lastPnt = self.topoMap.shape[1] - 1
+        lastLn = self.topoMap.shape[0] - 1
         maxSrchs = 5
         srchCnt = 1
         loopList = []
@@ -1665,14 +1667,20 @@ class ObjectWaterline(PathOp.ObjectOp):
                 )
                 break
             for L in range(1, lastLn):
-                for P in range(1, lastPnt):
-                    if self.topoMap[L][P] == 1:
-                        # start loop follow
-                        srch = True
-                        loopNum += 1
-                        loop = self._trackLoop(oclScan, lC, pC, L, P, loopNum)
-                        self.topoMap[L][P] = 0  # Mute the starting point
-                        loopList.append(loop)
+                # following a loop changes the map, so search again after each loop
+                P = 1
+                while True:
+                    found = numpy.flatnonzero(self.topoMap[L, P:lastPnt] == 1)
+                    if len(found) == 0:
+                        break
+                    P += int(found[0])
+                    # start loop follow
+                    srch = True
+                    loopNum += 1
+                    loop = self._trackLoop(oclScan, lC, pC, L, P, loopNum)
+                    self.topoMap[L, P] = 0  # Mute the starting point
+                    loopList.append(loop)
+                    P += 1
             srchCnt += 1
         Path.Log.debug(
             "Search count for layer "
@@ -1687,7 +1695,7 @@ class ObjectWaterline(PathOp.ObjectOp):
 
     def _trackLoop(self, oclScan, lC, pC, L, P, loopNum):
         """_trackLoop(oclScan, lC, pC, L, P, loopNum) ... Track the loop direction."""
-        loop = [oclScan[L - 1][P - 1]]  # Start loop point list
+        loop = [FreeCAD.Vector(*oclScan[L - 1, P - 1])]  # Start loop point list
         cur = [L, P, 1]
         prv = [L, P - 1, 1]
         nxt = [L, P + 1, 1]
@@ -1710,8 +1718,10 @@ class ObjectWaterline(PathOp.ObjectOp):
                 )
                 break
             nxt = self._findNextWlPoint(lC, pC, cur[0], cur[1], prv[0], prv[1])  # get next point
-            loop.append(oclScan[nxt[0] - 1][nxt[1] - 1])  # add it to loop point list
-            self.topoMap[nxt[0]][nxt[1]] = nxt[2]  # Mute the point, if not Y stem
+            loop.append(
+                FreeCAD.Vector(*oclScan[nxt[0] - 1, nxt[1] - 1])
+            )  # add it to loop point list
+            self.topoMap[nxt[0], nxt[1]] = nxt[2]  # Mute the point, if not Y stem
             if nxt[0] == L and nxt[1] == P:  # check if loop complete
                 follow = False
             elif nxt[0] == cur[0] and nxt[1] == cur[1]:  # check if line cannot be detected
@@ -1751,7 +1761,7 @@ class ObjectWaterline(PathOp.ObjectOp):
         for r in range(0, 8):
             l = cl + lC[s + r]
             p = cp + pC[s + r]
-            if self.topoMap[l][p] == 1:
+            if self.topoMap[l, p] == 1:
                 return [l, p, num]
 
         # ("_findNext: No next pnt found")
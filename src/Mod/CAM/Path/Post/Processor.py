@@ -34,11 +34,12 @@ import os
 from PySide import QtCore, QtGui
 import re
 import sys
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import Path.Base.Util as PathUtil
 import Path.Post.UtilsArguments as PostUtilsArguments
 import Path.Post.UtilsExport as PostUtilsExport
+import Path.Post.UtilsParallel as PostUtilsParallel
 import Path.Post.PostList as PostList
 import Path.Post.Utils as PostUtils
 
@@ -64,6 +65,8 @@ Defaults = Dict[str, bool]
 FormatHelp = str
 GCodeOrNone = Optional[str]
 GCodeSections = List[Tuple[str, GCodeOrNone]]
+GCodeChunks = Iterator[List[str]]
+GCodeStreamSections = Iterator[Tuple[str, GCodeChunks]]
 Parser = argparse.ArgumentParser
 ParserArgs = Union[None, str, argparse.Namespace]
 Postables = Union[List, List[Tuple[str, List]]]
@@ -202,6 +205,27 @@ class PostProcessor:
         #
         return [("allitems", args)]  # type: ignore
 
+    def export_streaming(self) -> GCodeStreamSections:
+        """Process the parser arguments, then postprocess the 'postables' as a generator.
+
+        Yields (partname, chunks) tuples where chunks is an iterator over lists
+        of G-code lines (without end-of-line characters).  The chunks of a
+        section must be consumed before the next section is requested since
+        they share the line numbering and modal state of the postprocessor.
+        Pass the chunks to PostUtilsExport.write_gcode_chunks to write them to
+        a file or socket as they are produced.
+        """
+        args: ParserArgs
+        flag: bool
+
+        Path.Log.debug("Exporting the job as a stream")
+
+        (flag, args) = self.process_arguments()
+        if flag:
+            yield from self.process_postables_streaming()
+        elif args is not None:
+            yield ("allitems", iter([[args]]))  # type: ignore
+
     def init_arguments(
         self,
         values: Values,
@@ -282,14 +306,8 @@ class PostProcessor:
         #
         return (flag, args)
 
-    def process_postables(self) -> GCodeSections:
-        """Postprocess the 'postables' in the job to g code sections."""
-        #
-        # This function is separated out to make it easier to inherit from this class.
-        #
-        gcode: GCodeOrNone
-        g_code_sections: GCodeSections
-        partname: str
+    def _prepare_postables(self) -> Postables:
+        """Build the list of 'postables' and terminate their canned cycles."""
         postables: Postables
         section: Section
         sublist: Sublist
@@ -305,6 +323,29 @@ class PostProcessor:
 
         Path.Log.debug(f"postables count: {len(postables)}")
 
+        return postables
+
+    def process_postables(self) -> GCodeSections:
+        """Postprocess the 'postables' in the job to g code sections."""
+        #
+        # This function is separated out to make it easier to inherit from this class.
+        #
+        gcode: GCodeOrNone
+        g_code_sections: GCodeSections
+        partname: str
+        postables: Postables
+        section: Section
+        sublist: Sublist
+
+        postables = self._prepare_postables()
+
+        if self.values["POSTPROCESSING_WORKERS"] > 1 and len(postables) > 1:
+            g_code_sections = PostUtilsParallel.export_sections_parallel(
+                self.values, postables, self.values["POSTPROCESSING_WORKERS"]
+            )
+            if g_code_sections is not None:
+                return g_code_sections
+
         g_code_sections = []
         for _, section in enumerate(postables):
             partname, sublist = section
@@ -313,6 +354,21 @@ class PostProcessor:
 
         return g_code_sections
 
+    def process_postables_streaming(self) -> GCodeStreamSections:
+        """Postprocess the 'postables' in the job yielding sections of g code chunks."""
+        partname: str
+        postables: Postables
+        section: Section
+        sublist: Sublist
+
+        postables = self._prepare_postables()
+
+        for _, section in enumerate(postables):
+            partname, sublist = section
+            if not PostUtilsExport.check_for_paths(sublist):
+                continue
+            yield (partname, PostUtilsExport.iter_export_common(self.values, sublist))
+
     def reinitialize(self) -> None:
         """Initialize or reinitialize the 'core' data structures for the postprocessor."""
         #
@@ -504,6 +504,12 @@ def init_shared_values(values: Values) -> None:
     #
     values["COMMENT_SYMBOL"] = "("
     #
+    # If True the parameter formatting is compiled once per export into
+    # specialised formatters instead of calling the functions in
+    # PARAMETER_FUNCTIONS for every parameter.  The output is the same either way.
+    #
+    values["COMPILE_FORMATTERS"] = True
+    #
     # Default axis precision for metric is 3 digits after the decimal point.
     # (see http://linuxcnc.org/docs/2.7/html/gcode/overview.html#_g_code_best_practices)
     #
@@ -685,6 +691,12 @@ def init_shared_values(values: Values) -> None:
     #
     values["POST_OPERATION"] = """"""
     #
+    # The number of worker processes used to postprocess the sections of a job
+    # (see PostList) in parallel.  A value of 1 postprocesses the sections one
+    # after another in the current process.
+    #
+    values["POSTPROCESSING_WORKERS"] = 1
+    #
     # Any commands in this value will be output after the header and
     # safety block at the beginning of the G-code file.
     #
@@ -741,6 +753,12 @@ def init_shared_values(values: Values) -> None:
     #
     values["STOP_SPINDLE_FOR_TOOL_CHANGE"] = True
     #
+    # The number of G-code lines that are collected before they are handed
+    # to the output when the G-code is streamed instead of being returned
+    # as a single string.
+    #
+    values["STREAMING_CHUNK_SIZE"] = 1000
+    #
     # These commands are ignored by commenting them out.
     # Used when replacing the drill commands by G0 and G1 commands, for example.
     #
@@ -30,7 +30,7 @@
 
 import datetime
 import os
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, TextIO, Union
 
 import FreeCAD
 import Path.Base.Util as PathUtil
@@ -268,22 +268,27 @@ def output_units(values: Values, gcode: Gcode) -> None:
         gcode.append(f'{PostUtilsParse.linenumber(values)}{values["UNITS"]}')
 
 
-def export_common(values: Values, objectslist, filename: str) -> str:
-    """Do the common parts of postprocessing the objects in objectslist to filename."""
-    coolant_mode: str
-    dia: PostUtils.GCodeEditorDialog
-    final: str
-    final_for_editor: str
-    gcode: Gcode = []
-    editor_result: int = 1
-
+def check_for_paths(objectslist) -> bool:
+    """Verify that all of the objects in objectslist are paths."""
     for obj in objectslist:
         if not hasattr(obj, "Path"):
             print(f"The object {obj.Name} is not a path.")
             print("Please select only path and Compounds.")
-            return ""
+            return False
+    return True
 
-    print(f'PostProcessor:  {values["POSTPROCESSOR_FILE_NAME"]} postprocessing...')
+
+def iter_export_common(values: Values, objectslist) -> Iterator[Gcode]:
+    """Postprocess the objects in objectslist yielding chunks of G-code lines.
+
+    The chunks are produced as the objects are postprocessed, so the first lines
+    are available long before the last operation has been postprocessed and the
+    memory used does not depend on the length of the program.
+    """
+    chunk_size: int = values["STREAMING_CHUNK_SIZE"]
+    coolant_mode: str
+    gcode: Gcode = []
+    plan: PostUtilsParse.FormatterPlan
 
     check_canned_cycles(values)
     output_header(values, gcode)
@@ -292,6 +297,8 @@ def export_common(values: Values, objectslist, filename: str) -> str:
     output_preamble(values, gcode)
     output_motion_mode(values, gcode)
     output_units(values, gcode)
+    # the units might have been changed by the preamble, so compile the plan afterwards
+    plan = PostUtilsParse.compile_formatter_plan(values)
 
     for obj in objectslist:
         # Skip inactive operations
@@ -301,8 +308,10 @@ def export_common(values: Values, objectslist, filename: str) -> str:
         output_start_bcnc(values, gcode, obj)
         output_preop(values, gcode, obj)
         output_coolant_on(values, gcode, coolant_mode)
+        yield gcode
+        gcode = []
         # output the G-code for the group (compound) or simple path
-        PostUtilsParse.parse_a_group(values, gcode, obj)
+        yield from PostUtilsParse.iter_parse_a_group(values, obj, chunk_size, plan)
         output_postop(values, gcode, obj)
         output_coolant_off(values, gcode, coolant_mode)
 
@@ -318,6 +327,89 @@ def export_common(values: Values, objectslist, filename: str) -> str:
     output_tool_return(values, gcode)
     output_safetyblock(values, gcode)
     output_postamble(values, gcode)
+    yield gcode
+
+
+def write_gcode_chunks(values: Values, chunks, output: Union[str, TextIO]) -> int:
+    """Write chunks of G-code lines to a file name or to an open text stream.
+
+    The lines are written as they arrive, so a DNC client reading from the
+    other end of a pipe or socket can start while the rest is still being
+    postprocessed.  Returns the number of lines written.
+    """
+    end_of_line: str
+    gfile: TextIO
+    line_count: int = 0
+
+    if values["END_OF_LINE_CHARACTERS"] in ("\n", "\n\n"):
+        # "\n\n" means "use \n" and "\n" means "use the end-of-line characters
+        # that match the system", which is left to the newline translation of the stream
+        end_of_line = "\n"
+    else:
+        end_of_line = values["END_OF_LINE_CHARACTERS"]
+
+    if isinstance(output, str):
+        if values["END_OF_LINE_CHARACTERS"] == "\n":
+            gfile = open(output, "w", encoding="utf-8", newline=None)
+        else:
+            gfile = open(output, "w", encoding="utf-8", newline="")
+        with gfile:
+            return write_gcode_chunks(values, chunks, gfile)
+
+    for chunk in chunks:
+        if chunk:
+            output.write(end_of_line.join(chunk))
+            output.write(end_of_line)
+            line_count += len(chunk)
+    output.flush()
+    return line_count
+
+
+def export_common_streaming(
+    values: Values, objectslist, output: Union[str, TextIO]
+) -> Union[None, int]:
+    """Postprocess the objects in objectslist writing the G-code incrementally to output.
+
+    The output is either a file name or an open text stream such as a file
+    or a socket wrapped with socket.makefile("w").  The G-code editor is never
+    shown since the G-code is never held in memory as a whole.
+    Returns the number of lines written or None if the objects can not be postprocessed.
+    """
+    line_count: int
+
+    if not check_for_paths(objectslist):
+        return None
+
+    print(f'PostProcessor:  {values["POSTPROCESSOR_FILE_NAME"]} streaming...')
+
+    line_count = write_gcode_chunks(values, iter_export_common(values, objectslist), output)
+
+    print("done postprocessing.")
+    return line_count
+
+
+def export_common(values: Values, objectslist, filename: str) -> str:
+    """Do the common parts of postprocessing the objects in objectslist to filename."""
+    chunk: Gcode
+    gcode: Gcode = []
+
+    if not check_for_paths(objectslist):
+        return ""
+
+    print(f'PostProcessor:  {values["POSTPROCESSOR_FILE_NAME"]} postprocessing...')
+
+    for chunk in iter_export_common(values, objectslist):
+        gcode.extend(chunk)
+
+    return finish_export(values, gcode, filename)
+
+
+def finish_export(values: Values, gcode: Gcode, filename: str) -> Union[None, str]:
+    """Add the end-of-line characters, show the editor and write the G-code to filename."""
+    dia: PostUtils.GCodeEditorDialog
+    final: str
+    final_for_editor: str
+    editor_result: int = 1
 
     # add the appropriate end-of-line characters to the gcode, including after the last line
     gcode.append("")
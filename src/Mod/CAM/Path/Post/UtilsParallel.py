@@ -0,0 +1,219 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+# ***************************************************************************
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   FreeCAD is distributed in the hope that it will be useful,            *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Lesser General Public License for more details.                   *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with FreeCAD; if not, write to the Free Software        *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""
+Postprocess the sections of a job in parallel.
+
+The 'postables' of a job are independent of each other except for the line
+numbering and the motion mode (G90/G91) that carry over from one section to the
+next.  Each section is posted in a worker process from a picklable snapshot of its
+objects and a copy of the postprocessor values.  The line numbers are added once
+the sections are joined in order, and a section that was posted with the wrong
+starting motion mode is posted again in order.
+"""
+
+import concurrent.futures
+import multiprocessing
+import pickle
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import Path
+import Path.Base.Util as PathUtil
+import Path.Post.UtilsExport as PostUtilsExport
+import Path.Tool.Controller as PathToolController
+
+# Define some types that are used throughout this file
+Gcode = List[str]
+GCodeSections = List[Tuple[str, Optional[str]]]
+SectionResult = Tuple[Gcode, Dict[str, Any]]
+Values = Dict[str, Any]
+
+#
+# The values that postprocessing a section may change and that the next
+# section (or the caller) sees when the sections are postprocessed in order.
+#
+CARRIED_VALUES = ("MOTION_MODE", "UNITS", "UNIT_FORMAT", "UNIT_SPEED_FORMAT")
+
+
+class PostableSnapshot:
+    """A picklable copy of the parts of a postable object that postprocessing uses."""
+
+    def __init__(self, obj) -> None:
+        self.Name = obj.Name
+        self.Label = obj.Label
+        self.Active = PathUtil.activeForOp(obj)
+        self.CoolantMode = PathUtil.coolantModeForOp(obj)
+        if hasattr(obj, "Path"):
+            # the parameters are kept as they are to avoid rounding them twice
+            self.Path = [(c.Name, c.Parameters) for c in obj.Path.Commands]
+        if hasattr(obj, "Group"):
+            self.Group = [PostableSnapshot(child) for child in obj.Group]
+        if hasattr(obj, "Proxy") and isinstance(obj.Proxy, PathToolController.ToolController):
+            # only used to recognize the tool controller, which needs no state
+            self.Proxy = PathToolController.ToolController.__new__(
+                PathToolController.ToolController
+            )
+            self.ToolNumber = obj.ToolNumber
+        if getattr(obj, "ToolController", None) is not None:
+            self.ToolController = _ToolControllerSnapshot(obj.ToolController)
+
+    def restore(self) -> "PostableSnapshot":
+        """Turn the snapshot of the commands back into paths, in the worker."""
+        if hasattr(self, "Path"):
+            self.Path = Path.Path([Path.Command(name, params) for name, params in self.Path])
+        for child in getattr(self, "Group", []):
+            child.restore()
+        return self
+
+
+class _ToolControllerSnapshot:
+    """The rapid rates of a tool controller which are used for adaptive operations."""
+
+    def __init__(self, tc) -> None:
+        if hasattr(tc, "HorizRapid"):
+            self.HorizRapid = getattr(tc.HorizRapid, "Value", tc.HorizRapid)
+        if hasattr(tc, "VertRapid"):
+            self.VertRapid = getattr(tc.VertRapid, "Value", tc.VertRapid)
+
+
+def export_section(
+    values_data: bytes, motion_mode: str, snapshots: List[PostableSnapshot]
+) -> SectionResult:
+    """Postprocess one section without line numbers, this runs in the worker.
+
+    Returns the G-code lines and the CARRIED_VALUES at the end of the section.
+    """
+    gcode: Gcode = []
+    values: Values
+
+    values = pickle.loads(values_data)
+    values["MOTION_MODE"] = motion_mode
+    values["OUTPUT_LINE_NUMBERS"] = False
+    objectslist = [snapshot.restore() for snapshot in snapshots]
+    for chunk in PostUtilsExport.iter_export_common(values, objectslist):
+        gcode.extend(chunk)
+    return (gcode, {key: values[key] for key in CARRIED_VALUES})
+
+
+def add_line_numbers(values: Values, gcode: Gcode) -> Gcode:
+    """Add the line numbers that export_section left out, continuing values["line_number"]."""
+    line_number: int = values["line_number"]
+    increment: int = values["LINE_INCREMENT"]
+    space: str = values["COMMAND_SPACE"]
+    numbered: Gcode = []
+
+    for line in gcode:
+        numbered.append(f"N{line_number}{space}{line}")
+        line_number += increment
+    values["line_number"] = line_number
+    return numbered
+
+
+def create_executor(max_workers: int) -> concurrent.futures.Executor:
+    """Create a process pool whose workers can import the FreeCAD modules.
+
+    The workers are started with the Python interpreter of FreeCAD, inside FreeCAD
+    sys.executable is the FreeCAD binary and would start another FreeCAD instead.
+    Raises RuntimeError if there is no Python interpreter.
+    """
+    from freecad import utils
+
+    python_exe = utils.get_python_exe()
+    if not python_exe:
+        raise RuntimeError("No Python interpreter found to start the worker processes")
+    # spawn rather than fork, forking a running FreeCAD (and Qt) is not safe
+    context = multiprocessing.get_context("spawn")
+    context.set_executable(python_exe)
+    return concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+
+
+def export_sections_parallel(
+    values: Values,
+    postables,
+    max_workers: int,
+    executor: Union[None, concurrent.futures.Executor] = None,
+) -> Optional[GCodeSections]:
+    """Postprocess the sections in postables in parallel.
+
+    Produces the same sections as calling PostUtilsExport.export_common with
+    filename "-" on each section in order, and leaves values in the same state.
+    Returns None if the values can not be sent to a worker process, for example
+    because a postprocessor uses a lambda as a parameter function, or if no worker
+    process can be started; the caller should then postprocess the sections one
+    after another.
+    """
+    carried: Dict[str, Any] = {}
+    futures: List[Optional[concurrent.futures.Future]] = []
+    g_code_sections: GCodeSections = []
+    motion_mode: str
+    result: SectionResult
+    values_data: bytes
+
+    try:
+        values_data = pickle.dumps(values)
+    except (pickle.PicklingError, TypeError, AttributeError) as e:
+        Path.Log.warning(f"Postprocessing the sections one after another: {e}")
+        return None
+
+    own_executor = executor is None
+    if own_executor:
+        try:
+            executor = create_executor(max_workers)
+        except RuntimeError as e:
+            Path.Log.warning(f"Postprocessing the sections one after another: {e}")
+            return None
+    try:
+        for _, sublist in postables:
+            if not PostUtilsExport.check_for_paths(sublist):
+                futures.append(None)
+                continue
+            snapshots = [PostableSnapshot(obj) for obj in sublist]
+            futures.append(
+                executor.submit(export_section, values_data, values["MOTION_MODE"], snapshots)
+            )
+
+        print(f'PostProcessor:  {values["POSTPROCESSOR_FILE_NAME"]} postprocessing in parallel...')
+
+        motion_mode = values["MOTION_MODE"]
+        for (partname, sublist), future in zip(postables, futures):
+            if future is None:
+                g_code_sections.append((partname, ""))
+                continue
+            result = future.result()
+            if motion_mode != values["MOTION_MODE"]:
+                # an earlier section changed the motion mode, so this section
+                # has to be posted again starting with the right motion mode
+                result = export_section(
+                    values_data, motion_mode, [PostableSnapshot(obj) for obj in sublist]
+                )
+            gcode, carried = result
+            motion_mode = carried["MOTION_MODE"]
+            if values["OUTPUT_LINE_NUMBERS"]:
+                gcode = add_line_numbers(values, gcode)
+            g_code_sections.append((partname, PostUtilsExport.finish_export(values, gcode, "-")))
+    finally:
+        if own_executor:
+            executor.shutdown()
+
+    values.update(carried)
+    return g_code_sections
@@ -31,7 +31,7 @@
 
 import math
 import re
-from typing import Any, Callable, Dict, List, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Union
 
 import FreeCAD
 from FreeCAD import Units
@@ -47,6 +47,8 @@ PathParameters = Dict[str, PathParameter]
 Values = Dict[str, Any]
 
 ParameterFunction = Callable[[Values, str, str, PathParameter, PathParameters], str]
+CompiledParameterFunction = Callable[[PathParameter, PathParameters, PathParameters], str]
+CommandFormatters = Tuple[Tuple[str, CompiledParameterFunction], ...]
 
 
 def check_for_an_adaptive_op(
@@ -646,39 +648,301 @@ def output_G81_G82_drill_moves(
     gcode.append(f"{linenumber(values)}{G0_retract_z}")
 
 
-def parse_a_group(values: Values, gcode: Gcode, pathobj) -> None:
-    """Parse a Group (compound, project, or simple path)."""
+class FormatterPlan:
+    """The parameter formatting for parse_a_path, compiled once from values.
+
+    Everything in values that does not change while postprocessing (precision,
+    units, modal flags, parameter order, suppressed commands and so on) is
+    resolved up front.  The resulting formatters are cached per command name and
+    set of parameters, so parse_a_path only has to call one small function per
+    parameter instead of dispatching through values["PARAMETER_FUNCTIONS"] and
+    the check_for_* functions for every command.
+
+    Parameter functions that have been replaced by a postprocessor are called
+    through unchanged.  If specialise is False all of the parameter functions are
+    called through unchanged, which gives the original (slower) behavior.
+    """
+
+    # used to compare two floating point numbers for "close-enough equality"
+    epsilon: float = 0.00001
+
+    def __init__(self, values: Values, specialise: bool = True) -> None:
+        self.values = values
+        self.specialise = specialise
+        self.parameter_order: Tuple[str, ...] = tuple(values["PARAMETER_ORDER"])
+        self.motion_commands = frozenset(values["MOTION_COMMANDS"])
+        self.rapid_moves = frozenset(values["RAPID_MOVES"])
+        self.output_blank_lines: bool = values["OUTPUT_BLANK_LINES"]
+        self.output_comments: bool = values["OUTPUT_COMMENTS"]
+        self.convert_comments: bool = values["COMMENT_SYMBOL"] != "("
+        self.modal: bool = values["MODAL"]
+        self.machine_specific_commands: bool = values["ENABLE_MACHINE_SPECIFIC_COMMANDS"]
+        self.checked_commands = frozenset(self._commands_to_check(values))
+        # the divisors that Units.Quantity.getValueAs uses to convert to the output units
+        self.length_divisor: float = Units.Quantity(values["UNIT_FORMAT"]).Value
+        self.speed_divisor: float = Units.Quantity(values["UNIT_SPEED_FORMAT"]).Value
+        self.axis_format: str = f'.{str(values["AXIS_PRECISION"])}f'
+        self.feed_format: str = f'.{str(values["FEED_PRECISION"])}f'
+        self.spindle_format: str = f'.{str(values["SPINDLE_DECIMALS"])}f'
+        self._command_formatters: Dict[Tuple[str, ...], CommandFormatters] = {}
+
+    @staticmethod
+    def _commands_to_check(values: Values) -> List[str]:
+        """Return the commands that one of the check_for_* functions may act upon."""
+        commands: List[str] = ["M6", "M06"]
+
+        if values["TRANSLATE_DRILL_CYCLES"]:
+            commands += values["DRILL_CYCLES_TO_TRANSLATE"]
+        if values["SPINDLE_WAIT"] > 0:
+            commands += ["M3", "M03", "M4", "M04"]
+        commands += values["SUPPRESS_COMMANDS"]
+        return commands
+
+    def needs_checks(self, command: str) -> bool:
+        """Return True if the check_for_* functions have to look at the command."""
+        if command in self.checked_commands:
+            return True
+        return self.machine_specific_commands and command.startswith("(")
+
+    def formatters(self, command: str, parameters: PathParameters) -> CommandFormatters:
+        """Return the (parameter, formatter) pairs for the parameters of a command.
+
+        Only the parameters that are present are returned, in output order.
+        """
+        key: Tuple[str, ...]
+
+        if not parameters:
+            # most notably comments, which would otherwise fill up the cache
+            return ()
+        key = (command, *parameters)
+        try:
+            return self._command_formatters[key]
+        except KeyError:
+            pass
+        formatters = tuple(
+            (parameter, self._compile(command, parameter))
+            for parameter in self.parameter_order
+            if parameter in parameters
+        )
+        self._command_formatters[key] = formatters
+        return formatters
+
+    def _compile(self, command: str, parameter: str) -> CompiledParameterFunction:
+        """Compile the formatter for one parameter of one command."""
+        function: ParameterFunction = self.values["PARAMETER_FUNCTIONS"][parameter]
+        compiler: Union[None, Callable[[str, str], CompiledParameterFunction]] = None
+
+        if self.specialise:
+            compiler = {
+                default_axis_parameter: self._compile_axis,
+                default_D_parameter: self._compile_D,
+                default_F_parameter: self._compile_F,
+                default_int_parameter: self._compile_int,
+                default_length_parameter: self._compile_length,
+                default_P_parameter: self._compile_P,
+                default_Q_parameter: self._compile_Q,
+                default_rotary_parameter: self._compile_rotary,
+                default_S_parameter: self._compile_S,
+            }.get(function)
+        if compiler is not None:
+            return compiler(command, parameter)
+
+        values = self.values
+
+        def call_parameter_function(param_value, parameters, current_location):
+            return function(values, command, parameter, param_value, parameters, current_location)
+
+        return call_parameter_function
+
+    def _compile_length_format(self) -> CompiledParameterFunction:
+        divisor = self.length_divisor
+        axis_format = self.axis_format
+
+        def format_length(param_value, parameters, current_location):
+            return format(param_value / divisor, axis_format)
+
+        return format_length
+
+    def _compile_axis(self, command: str, parameter: str) -> CompiledParameterFunction:
+        axis_format = self.axis_format
+        divisor = self.length_divisor
+        epsilon = self.epsilon
+
+        if self.values["OUTPUT_DOUBLES"]:
+            return self._compile_length_format()
+
+        def format_axis(param_value, parameters, current_location):
+            if (
+                parameter in current_location
+                and math.fabs(current_location[parameter] - param_value) < epsilon
+            ):
+                return ""
+            return format(param_value / divisor, axis_format)
+
+        return format_axis
+
+    def _compile_D(self, command: str, parameter: str) -> CompiledParameterFunction:
+        if command in ("G41", "G42"):
+            return self._compile_int(command, parameter)
+        if command in ("G41.1", "G42.1"):
+            return self._compile_length_format()
+        if command in ("G96", "G97"):
+            return self._compile_S(command, parameter)
+        # anything else that is supported
+        return lambda param_value, parameters, current_location: str(float(param_value))
+
+    def _compile_F(self, command: str, parameter: str) -> CompiledParameterFunction:
+        divisor = self.speed_divisor
+        epsilon = self.epsilon
+        feed_format = self.feed_format
+        output_doubles = self.values["OUTPUT_DOUBLES"]
+
+        # Many posts don't use rapid speeds, but eventually
+        # there will be refactored posts that do, so this
+        # "if statement" is being kept separate to make it
+        # more obvious where to put that check.
+        if command in self.rapid_moves:
+            return lambda param_value, parameters, current_location: ""
+
+        def format_feed(param_value, parameters, current_location):
+            if (
+                not output_doubles
+                and parameter in current_location
+                and math.fabs(current_location[parameter] - param_value) < epsilon
+            ):
+                return ""
+            feed = param_value / divisor
+            if feed <= 0.0:
+                return ""
+            # if any of X, Y, Z, U, V, or W are in the parameters
+            # and any of their values is different than where the device currently should be
+            # then feed is in linear units
+            for key in ("X", "Y", "Z", "U", "V", "W"):
+                if (
+                    key in parameters
+                    and math.fabs(current_location[key] - parameters[key]) > epsilon
+                ):
+                    return format(feed, feed_format)
+            # else if any of A, B, or C are in the parameters, the feed is in degrees,
+            #     which should not be converted when in --inches mode
+            for key in ("A", "B", "C"):
+                if key in parameters:
+                    # converting from degrees per second to degrees per minute as well
+                    return format(float(param_value * 60.0), feed_format)
+            return format(feed, feed_format)
+
+        return format_feed
+
+    def _compile_int(self, command: str, parameter: str) -> CompiledParameterFunction:
+        return lambda param_value, parameters, current_location: str(int(param_value))
+
+    def _compile_length(self, command: str, parameter: str) -> CompiledParameterFunction:
+        return self._compile_length_format()
+
+    def _compile_P(self, command: str, parameter: str) -> CompiledParameterFunction:
+        if command in ("G2", "G02", "G3", "G03", "G5.2", "G5.3", "G10", "G54.1", "G59"):
+            return self._compile_int(command, parameter)
+        if command in ("G4", "G04", "G76", "G82", "G86", "G89"):
+            return lambda param_value, parameters, current_location: str(float(param_value))
+        if command in ("G5", "G05", "G64"):
+            return self._compile_length_format()
+        # anything else that is supported
+        return lambda param_value, parameters, current_location: str(param_value)
+
+    def _compile_Q(self, command: str, parameter: str) -> CompiledParameterFunction:
+        if command == "G10":
+            return self._compile_int(command, parameter)
+        if command in ("G64", "G73", "G83"):
+            return self._compile_length_format()
+        return lambda param_value, parameters, current_location: ""
+
+    def _compile_rotary(self, command: str, parameter: str) -> CompiledParameterFunction:
+        axis_format = self.axis_format
+        epsilon = self.epsilon
+        output_doubles = self.values["OUTPUT_DOUBLES"]
+
+        #  unlike other axis, rotary axis such as A, B, and C are always in degrees
+        #  and should not be converted when in --inches mode
+        def format_rotary(param_value, parameters, current_location):
+            if (
+                not output_doubles
+                and parameter in current_location
+                and math.fabs(current_location[parameter] - param_value) < epsilon
+            ):
+                return ""
+            return format(float(param_value), axis_format)
+
+        return format_rotary
+
+    def _compile_S(self, command: str, parameter: str) -> CompiledParameterFunction:
+        spindle_format = self.spindle_format
+        return lambda param_value, parameters, current_location: format(
+            float(param_value), spindle_format
+        )
+
+
+def compile_formatter_plan(values: Values) -> FormatterPlan:
+    """Compile the parameter formatting for parse_a_path from the current values."""
+    return FormatterPlan(values, values["COMPILE_FORMATTERS"])
+
+
+def iter_parse_a_group(
+    values: Values,
+    pathobj,
+    chunk_size: int = 1000,
+    plan: Union[FormatterPlan, None] = None,
+) -> Iterator[Gcode]:
+    """Parse a Group (compound, project, or simple path) yielding chunks of G-code lines.
+
+    Each chunk holds at most roughly chunk_size lines, so the caller can hand the
+    G-code to its destination without keeping the whole program in memory.
+    The chunks share the line numbering and modal state in values, so they have
+    to be consumed in order before anything else is output.
+    """
     comment: str
 
+    if plan is None:
+        plan = compile_formatter_plan(values)
+
     if hasattr(pathobj, "Group"):  # We have a compound or project.
         if values["OUTPUT_COMMENTS"]:
             comment = create_comment(values, f"Compound: {pathobj.Label}")
-            gcode.append(f"{linenumber(values)}{comment}")
+            yield [f"{linenumber(values)}{comment}"]
         for p in pathobj.Group:
-            parse_a_group(values, gcode, p)
+            yield from iter_parse_a_group(values, p, chunk_size, plan)
     else:  # parsing simple path
         # groups might contain non-path things like stock.
         if not hasattr(pathobj, "Path"):
             return
         if values["OUTPUT_PATH_LABELS"] and values["OUTPUT_COMMENTS"]:
             comment = create_comment(values, f"Path: {pathobj.Label}")
-            gcode.append(f"{linenumber(values)}{comment}")
-        parse_a_path(values, gcode, pathobj)
+            yield [f"{linenumber(values)}{comment}"]
+        yield from iter_parse_a_path(values, pathobj, chunk_size, plan)
 
 
-def parse_a_path(values: Values, gcode: Gcode, pathobj) -> None:
-    """Parse a simple Path."""
+def iter_parse_a_path(
+    values: Values,
+    pathobj,
+    chunk_size: int = 1000,
+    plan: Union[FormatterPlan, None] = None,
+) -> Iterator[Gcode]:
+    """Parse a simple Path yielding chunks of G-code lines."""
+    adaptive_op: bool
     adaptive_op_variables: Tuple[bool, float, float]
     cmd: str
     command: str
     command_line: CommandLine
     current_location: PathParameters = {}  # keep track for no doubles
     drill_retract_mode: str = "G98"
+    gcode: Gcode = []
     lastcommand: str = ""
     motion_location: PathParameters = {}  # keep track of last motion location
     parameter: str
     parameter_value: str
+    params: PathParameters
 
+    if plan is None:
+        plan = compile_formatter_plan(values)
     # Check to see if values["TOOL_BEFORE_CHANGE"] is set and value is true
     # doing it here to reduce the number of times it is checked
     swap_tool_change_order = False
@@ -704,6 +968,7 @@ def parse_a_path(values: Values, gcode: Gcode, pathobj) -> None:
         ).Parameters
     )
     adaptive_op_variables = determine_adaptive_op(values, pathobj)
+    adaptive_op = adaptive_op_variables[0]
 
     # Apply arc splitting if requested
     path_to_process = pathobj.Path
@@ -713,88 +978,114 @@ def parse_a_path(values: Values, gcode: Gcode, pathobj) -> None:
     for c in path_to_process.Commands:
         command = c.Name
         command_line = []
+        # c.Parameters builds a new dictionary each time it is used
+        params = c.Parameters
 
         # Skip blank lines if requested
         if not command:
-            if not values["OUTPUT_BLANK_LINES"]:
+            if not plan.output_blank_lines:
                 continue
 
         # Modify the command name if necessary
         if command.startswith("("):
-            if not values["OUTPUT_COMMENTS"]:
+            if not plan.output_comments:
                 continue
-            if values["COMMENT_SYMBOL"] != "(" and len(command) > 2:
+            if plan.convert_comments and len(command) > 2:
                 command = create_comment(values, command[1:-1])
 
-        cmd = check_for_an_adaptive_op(values, command, command_line, adaptive_op_variables)
-        if cmd:
-            command = cmd
+        if adaptive_op:
+            cmd = check_for_an_adaptive_op(values, command, command_line, adaptive_op_variables)
+            if cmd:
+                command = cmd
         # Add the command name to the command line
         command_line.append(command)
         # if modal: suppress the command if it is the same as the last one
-        if values["MODAL"] and command == lastcommand:
+        if plan.modal and command == lastcommand:
             command_line.pop(0)
 
         # Now add the remaining parameters in order
-        for parameter in values["PARAMETER_ORDER"]:
-            if parameter in c.Parameters:
-                parameter_value = values["PARAMETER_FUNCTIONS"][parameter](
-                    values,
-                    command,
-                    parameter,
-                    c.Parameters[parameter],
-                    c.Parameters,
-                    current_location,
-                )
-                if parameter_value:
-                    command_line.append(f"{parameter}{parameter_value}")
+        for parameter, formatter in plan.formatters(command, params):
+            parameter_value = formatter(params[parameter], params, current_location)
+            if parameter_value:
+                command_line.append(f"{parameter}{parameter_value}")
 
-        set_adaptive_op_speed(values, command, command_line, c.Parameters, adaptive_op_variables)
+        if adaptive_op:
+            set_adaptive_op_speed(values, command, command_line, params, adaptive_op_variables)
         # Remember the current command
         lastcommand = command
         # Remember the current location
-        current_location.update(c.Parameters)
+        current_location.update(params)
         if command in ("G90", "G91"):
             # Remember the motion mode
             values["MOTION_MODE"] = command
         elif command in ("G98", "G99"):
             # Remember the drill retract mode for drill_translate
             drill_retract_mode = command
-        if command in values["MOTION_COMMANDS"]:
+        if command in plan.motion_commands:
             # Remember the current location for drill_translate
-            motion_location.update(c.Parameters)
-        if check_for_drill_translate(
-            values,
-            gcode,
-            command,
-            command_line,
-            c.Parameters,
-            motion_location,
-            drill_retract_mode,
-        ):
-            command_line = []
-        check_for_spindle_wait(values, gcode, command, command_line)
-        if check_for_tool_change(values, gcode, command, command_line):
-            command_line = []
-        if check_for_suppressed_commands(values, gcode, command, command_line):
-            command_line = []
-
-        if command_line:
-            if command in ("M6", "M06") and swap_tool_change_order:
-                swapped_command_line = [
-                    command_line[1],
-                    command_line[0],
-                ]  # swap the order of the commands
-                # Add a line number to the front of the command line
-                gcode.append(
-                    f"{linenumber(values)}{format_command_line(values, swapped_command_line)}"
-                )
-            else:
+            motion_location.update(params)
+        if not plan.needs_checks(command):
+            if command_line:
                 # Add a line number to the front of the command line
                 gcode.append(f"{linenumber(values)}{format_command_line(values, command_line)}")
+        else:
+            if check_for_drill_translate(
+                values,
+                gcode,
+                command,
+                command_line,
+                params,
+                motion_location,
+                drill_retract_mode,
+            ):
+                command_line = []
+            check_for_spindle_wait(values, gcode, command, command_line)
+            if check_for_tool_change(values, gcode, command, command_line):
+                command_line = []
+            if check_for_suppressed_commands(values, gcode, command, command_line):
+                command_line = []
+
+            if command_line:
+                if command in ("M6", "M06") and swap_tool_change_order:
+                    swapped_command_line = [
+                        command_line[1],
+                        command_line[0],
+                    ]  # swap the order of the commands
+                    # Add a line number to the front of the command line
+                    gcode.append(
+                        f"{linenumber(values)}{format_command_line(values, swapped_command_line)}"
+                    )
+                else:
+                    # Add a line number to the front of the command line
+                    gcode.append(
+                        f"{linenumber(values)}{format_command_line(values, command_line)}"
+                    )
+
+            check_for_tlo(values, gcode, command, params)
+            check_for_machine_specific_commands(values, gcode, command)
+
+        if len(gcode) >= chunk_size:
+            yield gcode
+            gcode = []
+
+    if gcode:
+        yield gcode
+
+
+def parse_a_group(values: Values, gcode: Gcode, pathobj) -> None:
+    """Parse a Group (compound, project, or simple path)."""
+    chunk: Gcode
+
+    for chunk in iter_parse_a_group(values, pathobj):
+        gcode.extend(chunk)
+
+
+def parse_a_path(values: Values, gcode: Gcode, pathobj) -> None:
+    """Parse a simple Path."""
+    chunk: Gcode
 
-        check_for_tlo(values, gcode, command, c.Parameters)
-        check_for_machine_specific_commands(values, gcode, command)
+    for chunk in iter_parse_a_path(values, pathobj):
+        gcode.extend(chunk)
 
 
 def set_adaptive_op_speed(
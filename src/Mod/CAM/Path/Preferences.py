@@ -69,6 +69,17 @@ WarningSuppressVelocity = "WarningSuppressVelocity"
 EnableExperimentalFeatures = "EnableExperimentalFeatures"
 EnableAdvancedOCLFeatures = "EnableAdvancedOCLFeatures"
 
+# Size in MB of the in-memory cache of OCL surfaces and scans, 0 disables the cache
+OCLCacheSize = "OCLCacheSize"
+# Keep the OCL surfaces and scans next to the document so they survive a restart
+OCLDiskCache = "OCLDiskCache"
+# Number of processes running the OCL drop-cutter scans, 1 scans in FreeCAD itself
+OCLWorkers = "OCLWorkers"
+# Skip recomputing operations whose inputs did not change since their last recompute
+IncrementalRecompute = "IncrementalRecompute"
+# Simulate the job in the CAM Sanity report to report the removed volume and gouges
+SanitySimulation = "SanitySimulation"
+
 
 _observers = defaultdict(list)  # maps group name to callback functions
 
@@ -104,6 +115,11 @@ def getBuiltinAssetPath() -> pathlib.Path:
     return home / "Mod" / "CAM" / "Tools"
 
 
+def getAssetIndexPath(store_name: str) -> pathlib.Path:
+    cache_dir = pathlib.Path(FreeCAD.getUserCachePath())
+    return cache_dir / "CAM" / f"asset-index-{store_name}.json"
+
+
 def getBuiltinLibraryPath() -> pathlib.Path:
     return getBuiltinAssetPath() / "Library"
 
@@ -343,6 +359,26 @@ def advancedOCLFeaturesEnabled():
     return preferences().GetBool(EnableAdvancedOCLFeatures, False)
 
 
+def oclCacheSize():
+    return preferences().GetInt(OCLCacheSize, 256)
+
+
+def oclDiskCacheEnabled():
+    return preferences().GetBool(OCLDiskCache, False)
+
+
+def oclWorkers():
+    return preferences().GetInt(OCLWorkers, 1)
+
+
+def incrementalRecomputeEnabled():
+    return preferences().GetBool(IncrementalRecompute, False)
+
+
+def sanitySimulationEnabled():
+    return preferences().GetBool(SanitySimulation, False)
+
+
 def experimentalFeaturesEnabled():
     return preferences().GetBool(EnableExperimentalFeatures, False)
 
@@ -90,3 +90,13 @@ class Asset(ABC):
     def to_bytes(self, serializer: Type[AssetSerializer]) -> bytes:
         """Serializes an object into bytes."""
         return serializer.serialize(self)
+
+    def copy_for_reuse(self) -> Optional[Asset]:
+        """
+        Returns an instance to hand to another asset depending on the same
+        data, or None if the asset must be deserialized again.
+
+        The AssetManager deserializes a dependency shared by many assets once
+        per call and hands each dependent asset a copy obtained from this method.
+        """
+        return None
@@ -45,10 +45,13 @@ from .serializer import AssetSerializer
 from .uri import AssetUri
 from .cache import AssetCache, CacheKey
 
-
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.ERROR)
 
+# Raw data of at least this size is parsed for dependencies in a worker thread;
+# for smaller data, like toolbit files, handing it over costs more than parsing
+PARSE_IN_WORKER_MIN_BYTES = 64 * 1024
+
 
 @dataclass
 class _AssetConstructionData:
@@ -62,6 +65,46 @@ class _AssetConstructionData:
     dependencies_data: Optional[Dict[AssetUri, Optional["_AssetConstructionData"]]] = None
 
 
+class _SharedReads:
+    """
+    Store reads and dependency lists shared by the fetches of one call, so
+    that assets used by many others, like the shapes of toolbits, are read
+    from the stores and parsed only once.
+    """
+
+    def __init__(self):
+        self.raw_data: Dict[AssetUri, "asyncio.Future[Tuple[Optional[str], Optional[bytes]]]"] = {}
+        self.dependencies: Dict[AssetUri, "asyncio.Future[List[AssetUri]]"] = {}
+
+
+class _SharedBuilds:
+    """
+    Assets built by one call, keyed by the asset and the tree of its
+    dependencies. Equal dependencies of several assets are deserialized once.
+    """
+
+    def __init__(self):
+        self._ids: Dict[Tuple[str, AssetUri, Optional[frozenset]], int] = {}
+        self._data_ids: Dict[int, int] = {}
+        self.templates: Dict[int, Asset] = {}
+
+    def key(self, construction_data: _AssetConstructionData) -> int:
+        key = self._data_ids.get(id(construction_data))
+        if key is not None:
+            return key
+        if construction_data.dependencies_data is None:
+            deps_signature: Optional[frozenset] = None
+        else:
+            deps_signature = frozenset(
+                (dep_uri, None if dep_data is None else self.key(dep_data))
+                for dep_uri, dep_data in construction_data.dependencies_data.items()
+            )
+        signature = (construction_data.store, construction_data.uri, deps_signature)
+        key = self._ids.setdefault(signature, len(self._ids))
+        self._data_ids[id(construction_data)] = key
+        return key
+
+
 class AssetManager:
     def __init__(self, cache_max_size_bytes: int = 100 * 1024 * 1024):
         self.stores: Dict[str, AssetStore] = {}
@@ -101,12 +144,59 @@ class AssetManager:
         logger.debug(f"Registering asset type: '{asset_type_name}' -> {asset_class.__name__}")
         self._asset_classes[asset_type_name] = asset_class
 
+    async def _read_from_stores_async(
+        self, uri: AssetUri, store_names: Sequence[str]
+    ) -> Tuple[Optional[str], Optional[bytes]]:
+        """Returns the name of the first store that has uri and the raw data."""
+        # Log toolbit search details
+        if uri.asset_type == "toolbit":
+            logger.info(
+                f"TOOLBIT SEARCH: Looking for toolbit '{uri.asset_id}' in stores: {store_names}"
+            )
+
+        for current_store_name in store_names:
+            store = self.stores.get(current_store_name)
+            if not store:
+                logger.warning(f"Store '{current_store_name}' not registered. Skipping.")
+                continue
+
+            # Log store search path for toolbits
+            if uri.asset_type == "toolbit":
+                store_path = getattr(store, "base_path", "unknown")
+                logger.info(
+                    f"TOOLBIT SEARCH: Checking store '{current_store_name}' at path: {store_path}"
+                )
+
+            try:
+                raw_data = await store.get(uri)
+            except FileNotFoundError:
+                if uri.asset_type == "toolbit":
+                    logger.info(
+                        f"TOOLBIT SEARCH: '{uri.asset_id}' NOT found in store '{current_store_name}'"
+                    )
+                logger.debug(
+                    f"_read_from_stores_async: Asset {uri} not found in store {current_store_name}"
+                )
+                continue  # Try next store
+
+            if uri.asset_type == "toolbit":
+                logger.info(
+                    f"TOOLBIT FOUND: '{uri.asset_id}' found in store '{current_store_name}'"
+                )
+            logger.debug(
+                f"_read_from_stores_async: Asset {uri} found in store {current_store_name}"
+            )
+            return current_store_name, raw_data  # Asset found, no need to check other stores
+
+        return None, None
+
     async def _fetch_asset_construction_data_recursive_async(
         self,
         uri: AssetUri,
         store_names: Sequence[str],
         visited_uris: Set[AssetUri],
         depth: Optional[int] = None,
+        shared: Optional[_SharedReads] = None,
     ) -> Optional[_AssetConstructionData]:
         # Log library fetch details
         if uri.asset_type == "library":
@@ -130,49 +220,16 @@ class AssetManager:
         if not asset_class:
             raise ValueError(f"No asset class registered for URI: {uri}")
 
-        # Fetch the requested asset, trying each store in order
-        raw_data = None
-        found_store_name = None
-
-        # Log toolbit search details
-        if uri.asset_type == "toolbit":
-            logger.info(
-                f"TOOLBIT SEARCH: Looking for toolbit '{uri.asset_id}' in stores: {store_names}"
-            )
-
-        for current_store_name in store_names:
-            store = self.stores.get(current_store_name)
-            if not store:
-                logger.warning(f"Store '{current_store_name}' not registered. Skipping.")
-                continue
+        if shared is None:
+            shared = _SharedReads()
 
-            # Log store search path for toolbits
-            if uri.asset_type == "toolbit":
-                store_path = getattr(store, "base_path", "unknown")
-                logger.info(
-                    f"TOOLBIT SEARCH: Checking store '{current_store_name}' at path: {store_path}"
-                )
-
-            try:
-                raw_data = await store.get(uri)
-                found_store_name = current_store_name
-                if uri.asset_type == "toolbit":
-                    logger.info(
-                        f"TOOLBIT FOUND: '{uri.asset_id}' found in store '{found_store_name}'"
-                    )
-                logger.debug(
-                    f"_fetch_asset_construction_data_recursive_async: Asset {uri} found in store {found_store_name}"
-                )
-                break  # Asset found, no need to check other stores
-            except FileNotFoundError:
-                if uri.asset_type == "toolbit":
-                    logger.info(
-                        f"TOOLBIT SEARCH: '{uri.asset_id}' NOT found in store '{current_store_name}'"
-                    )
-                logger.debug(
-                    f"_fetch_asset_construction_data_recursive_async: Asset {uri} not found in store {current_store_name}"
-                )
-                continue  # Try next store
+        # Fetch the requested asset, trying each store in order. Assets that
+        # many others depend on are read only once per call.
+        read = shared.raw_data.get(uri)
+        if read is None:
+            read = asyncio.ensure_future(self._read_from_stores_async(uri, store_names))
+            shared.raw_data[uri] = read
+        found_store_name, raw_data = await read
 
         if raw_data is None or not found_store_name:
             if uri.asset_type == "toolbit":
@@ -194,27 +251,45 @@ class AssetManager:
                 dependencies_data=None,  # Indicates that no attempt was made to fetch deps
             )
 
-        # Extract the list of dependencies (non-recursive)
-        serializer = self.get_serializer_for_class(asset_class)
-        dependency_uris = asset_class.extract_dependencies(raw_data, serializer)
+        # Extract the list of dependencies (non-recursive). Parsing does not
+        # touch any document, so large data, like the FCStd archives of shapes,
+        # is parsed in the worker threads of the loop while the stores are read.
+        extraction = shared.dependencies.get(uri)
+        if extraction is None:
+            serializer = self.get_serializer_for_class(asset_class)
+            loop = asyncio.get_running_loop()
+            if len(raw_data) >= PARSE_IN_WORKER_MIN_BYTES:
+                extraction = loop.run_in_executor(
+                    None, asset_class.extract_dependencies, raw_data, serializer
+                )
+            else:
+                extraction = loop.create_future()
+                extraction.set_result(asset_class.extract_dependencies(raw_data, serializer))
+            shared.dependencies[uri] = extraction
+        dependency_uris = await extraction
 
-        # Initialize deps_construction_data_map. Any dependencies mapped to None
+        # Fetch the dependencies concurrently. Any dependencies mapped to None
         # indicate that dependencies were intentionally not fetched.
-        deps_construction_data: Dict[AssetUri, Optional[_AssetConstructionData]] = {}
-
-        for dep_uri in dependency_uris:
-            visited_uris.add(uri)
-            try:
-                # For dependencies, use the same list of stores for fallback
-                dep_data = await self._fetch_asset_construction_data_recursive_async(
-                    dep_uri,
-                    store_names,  # Pass the list of stores for dependency fallback
-                    visited_uris,
-                    None if depth is None else depth - 1,
-                )
-            finally:
-                visited_uris.remove(uri)
-            deps_construction_data[dep_uri] = dep_data
+        dependency_visited_uris = visited_uris | {uri}
+        dependency_fetches = [
+            # For dependencies, use the same list of stores for fallback
+            self._fetch_asset_construction_data_recursive_async(
+                dep_uri,
+                store_names,
+                dependency_visited_uris,
+                None if depth is None else depth - 1,
+                shared,
+            )
+            for dep_uri in dependency_uris
+        ]
+        if len(dependency_fetches) == 1:
+            # No need for a task of its own, like for the shape of a toolbit
+            dependencies = [await dependency_fetches[0]]
+        else:
+            dependencies = await asyncio.gather(*dependency_fetches)
+        deps_construction_data: Dict[AssetUri, Optional[_AssetConstructionData]] = dict(
+            zip(dependency_uris, dependencies)
+        )
 
         logger.debug(
             f"ToolBitShape '{uri.asset_id}' dependencies_data: {deps_construction_data is None}"
@@ -254,14 +329,40 @@ class AssetManager:
     def _build_asset_tree_from_data_sync(
         self,
         construction_data: Optional[_AssetConstructionData],
+        shared: Optional[_SharedBuilds] = None,
     ) -> Optional[Asset]:
         """
         Synchronously and recursively builds an asset instance.
-        Integrates caching logic.
+        Assets already built with the same dependencies in shared are
+        copied instead of deserialized again, if the asset supports it.
         """
         if not construction_data:
             return None
 
+        if shared is None:
+            shared = _SharedBuilds()
+        shared_key = shared.key(construction_data)
+        template = shared.templates.get(shared_key)
+        if template is not None:
+            return template.copy_for_reuse()
+
+        asset = self._build_asset_from_data_sync(construction_data, shared)
+        if asset is not None:
+            # Keep an unmodified copy, the dependent asset may change this one
+            template = asset.copy_for_reuse()
+            if template is not None:
+                shared.templates[shared_key] = template
+        return asset
+
+    def _build_asset_from_data_sync(
+        self,
+        construction_data: _AssetConstructionData,
+        shared: _SharedBuilds,
+    ) -> Optional[Asset]:
+        """
+        Builds an asset instance and its dependencies.
+        Integrates caching logic.
+        """
         cache_key: Optional[CacheKey] = None
         if construction_data.store in self._cacheable_stores:
             cache_key = self._calculate_cache_key_from_construction_data(construction_data)
@@ -301,7 +402,7 @@ class AssetManager:
                 # this would need more complex store_name propagation.
                 # For now, use the parent's store_name_for_cache.
                 try:
-                    dep = self._build_asset_tree_from_data_sync(dep_data_node)
+                    dep = self._build_asset_tree_from_data_sync(dep_data_node, shared)
                     if dep_uri.asset_type == "toolbit":
                         if dep:
                             logger.info(
@@ -585,12 +686,14 @@ class AssetManager:
         )
 
         async def _fetch_all_construction_data_bulk_async():
+            shared_reads = _SharedReads()
             tasks = [
                 self._fetch_asset_construction_data_recursive_async(
                     AssetUri(u) if isinstance(u, str) else u,
                     stores_list,
                     set(),
                     depth,
+                    shared_reads,
                 )
                 for u in uris
             ]
@@ -609,6 +712,9 @@ class AssetManager:
             )
             raise
 
+        # Dependencies shared by the assets, like the shapes of toolbits, are
+        # deserialized once for all of them
+        shared_builds = _SharedBuilds()
         assets = []
         for i, data_or_exc in enumerate(all_construction_data_list):
             original_uri_input = uris[i]
@@ -622,7 +728,7 @@ class AssetManager:
             elif isinstance(data_or_exc, _AssetConstructionData):
                 # Build asset instance synchronously. Exceptions during build should propagate.
                 # Use the first store from the list for caching purposes in build_asset_tree
-                assets.append(self._build_asset_tree_from_data_sync(data_or_exc))
+                assets.append(self._build_asset_tree_from_data_sync(data_or_exc, shared_builds))
             elif data_or_exc is None:  # From _fetch_... returning None for not found
                 logger.debug(f"GetBulk: Asset '{original_uri_input}' not found")
                 assets.append(None)
@@ -647,22 +753,25 @@ class AssetManager:
         logger.debug(
             f"AssetManager.get_bulk_async for {len(uris)} URIs from stores '{stores_list}', depth '{depth}'"
         )
+        shared_reads = _SharedReads()
         tasks = [
             self._fetch_asset_construction_data_recursive_async(
                 AssetUri(u) if isinstance(u, str) else u,
                 stores_list,
                 set(),
                 depth,
+                shared_reads,
             )
             for u in uris
         ]
         all_construction_data_list = await asyncio.gather(*tasks, return_exceptions=True)
 
+        shared_builds = _SharedBuilds()
         assets = []
         for i, data_or_exc in enumerate(all_construction_data_list):
             if isinstance(data_or_exc, _AssetConstructionData):
                 # Use the first store from the list for caching purposes in build_asset_tree
-                asset = self._build_asset_tree_from_data_sync(data_or_exc)
+                asset = self._build_asset_tree_from_data_sync(data_or_exc, shared_builds)
                 assets.append(asset)
             elif isinstance(data_or_exc, FileNotFoundError) or data_or_exc is None:
                 assets.append(None)
@@ -21,30 +21,32 @@
 # *                                                                         *
 # ***************************************************************************
 import re
+import os
+import json
+import time
+import logging
 import pathlib
-from typing import List, Dict, Tuple, Optional, cast
+import threading
+from typing import List, Dict, Set, Tuple, Optional, NamedTuple, cast
 from ..uri import AssetUri
 from .base import AssetStore
 
+logger = logging.getLogger(__name__)
 
-def _resolve_case_insensitive(path: pathlib.Path) -> pathlib.Path:
-    if path.is_file():
-        return path
+# Format version of the index file, bump it when the format changes.
+INDEX_VERSION = 1
 
-    # pathlib in Python 2.10 (2.1x versions) does not support
-    # 'case_sensitive' argument in glob. Instead, simulate
-    # case-insensitive search manually
-    pattern = path.name.lower()
-    for p in path.parent.glob("*"):
-        if p.name.lower() == pattern:
-            return p
-    return path
+# A directory modified this recently may be modified again without a change
+# of its mtime, so it is scanned again on the next refresh of the index.
+RACY_MTIME_NS = 2_000_000_000
 
-    # Use this starting Python 2.13:
-    try:
-        return next(path.parent.glob(path.name, case_sensitive=False))
-    except StopIteration:
-        return path
+
+class IndexedFile(NamedTuple):
+    asset_type: str
+    asset_id: str
+    version: str
+    mtime_ns: int
+    size: int
 
 
 class FileStore(AssetStore):
@@ -66,6 +68,13 @@ class FileStore(AssetStore):
 
     Placeholders like {version} are matched greedily (.*), but for compatibility,
     versions are expected to be numeric strings for versioned assets.
+
+    The store keeps an index of the asset files with their URI, mtime and size,
+    so listing, counting and versions do not walk the directory tree. Before each
+    query the mtime of every indexed directory is checked and only the changed
+    directories are scanned again, so files added, removed or renamed by other
+    programs are picked up. If index_path is given, the index is saved there and
+    loaded on the next start, otherwise it is built on the first query.
     """
 
     DEFAULT_MAPPING = {
@@ -81,6 +90,7 @@ class FileStore(AssetStore):
         name: str,
         base_dir: pathlib.Path,
         mapping: Optional[Dict[str, str]] = None,
+        index_path: Optional[pathlib.Path] = None,
     ):
         super().__init__(name)
         self._base_dir = base_dir.resolve()
@@ -88,6 +98,9 @@ class FileStore(AssetStore):
         self._validate_patterns_on_init()
         # For _path_to_uri: iterate specific keys before '*' to ensure correct pattern matching
         self._sorted_mapping_keys = sorted(self._mapping.keys(), key=lambda k: (k == "*", k))
+        self._index_path = index_path.resolve() if index_path is not None else None
+        self._index_lock = threading.RLock()
+        self._reset_index()
 
     def _validate_patterns_on_init(self):
         if not self._mapping:
@@ -164,6 +177,10 @@ class FileStore(AssetStore):
         except ValueError:
             return None  # Path not under base_dir
 
+        return self._relative_path_to_uri(relative_path_posix)
+
+    def _relative_path_to_uri(self, relative_path_posix: str) -> Optional[AssetUri]:
+        """Converts a POSIX path relative to the base directory to an AssetUri."""
         for asset_type_key in self._sorted_mapping_keys:
             path_format_str = self._mapping[asset_type_key]  # Pattern uses /
             try:
@@ -204,7 +221,207 @@ class FileStore(AssetStore):
 
     def set_dir(self, new_dir: pathlib.Path):
         """Sets the base directory for the store."""
-        self._base_dir = new_dir.resolve()
+        with self._index_lock:
+            self._base_dir = new_dir.resolve()
+            self._reset_index()
+
+    def _reset_index(self):
+        # relative directory -> mtime at the last scan, None to scan it again
+        self._dirs: Dict[str, Optional[int]] = {}
+        # relative directory -> indexed files and subdirectories in it
+        self._children: Dict[str, Set[str]] = {}
+        # relative file path -> asset of the file
+        self._files: Dict[str, IndexedFile] = {}
+        # (asset_type, asset_id) -> {version: relative file path}
+        self._assets: Dict[Tuple[str, str], Dict[str, str]] = {}
+        # lower case relative file path -> relative file path
+        self._lower_paths: Dict[str, str] = {}
+        self._index_loaded = False
+        self._index_dirty = False
+
+    def _add_file(self, relative_path: str, entry: IndexedFile):
+        self._remove_file(relative_path)
+        self._files[relative_path] = entry
+        self._assets.setdefault((entry.asset_type, entry.asset_id), {})[
+            entry.version
+        ] = relative_path
+        self._lower_paths[relative_path.lower()] = relative_path
+
+    def _remove_file(self, relative_path: str):
+        entry = self._files.pop(relative_path, None)
+        if entry is None:
+            return
+        key = (entry.asset_type, entry.asset_id)
+        versions = self._assets.get(key, {})
+        if versions.get(entry.version) == relative_path:
+            del versions[entry.version]
+            if not versions:
+                del self._assets[key]
+        if self._lower_paths.get(relative_path.lower()) == relative_path:
+            del self._lower_paths[relative_path.lower()]
+
+    def _forget_dir(self, relative_dir: str):
+        for child in self._children.pop(relative_dir, ()):
+            if child in self._dirs:
+                self._forget_dir(child)
+            else:
+                self._remove_file(child)
+        self._dirs.pop(relative_dir, None)
+        self._index_dirty = True
+
+    def _scan_dir(self, relative_dir: str, now_ns: int):
+        """Updates the index entries of the files and subdirectories in a directory."""
+        dir_path = self._base_dir / relative_dir
+        try:
+            mtime_ns = dir_path.stat().st_mtime_ns
+            entries = list(os.scandir(dir_path))
+        except OSError:
+            self._forget_dir(relative_dir)
+            return
+
+        self._dirs[relative_dir] = mtime_ns if now_ns - mtime_ns > RACY_MTIME_NS else None
+        prefix = relative_dir + "/" if relative_dir else ""
+        children: Set[str] = set()
+        for dir_entry in entries:
+            relative_path = prefix + dir_entry.name
+            try:
+                # Like rglob(), do not follow symlinks to directories
+                if dir_entry.is_dir(follow_symlinks=False):
+                    self._remove_file(relative_path)
+                    children.add(relative_path)
+                    if relative_path not in self._dirs:
+                        self._scan_dir(relative_path, now_ns)
+                    continue
+                if not dir_entry.is_file():
+                    continue
+                if self._index_path is not None and dir_entry.path == str(self._index_path):
+                    continue
+                stat = dir_entry.stat()
+            except OSError:
+                continue
+
+            known = self._files.get(relative_path)
+            if known and known.mtime_ns == stat.st_mtime_ns and known.size == stat.st_size:
+                children.add(relative_path)
+                continue
+            uri = self._relative_path_to_uri(relative_path)
+            if uri is None:
+                self._remove_file(relative_path)
+                continue
+            children.add(relative_path)
+            entry = IndexedFile(
+                uri.asset_type, uri.asset_id, cast(str, uri.version), stat.st_mtime_ns, stat.st_size
+            )
+            self._add_file(relative_path, entry)
+
+        # Drop what was removed since the last scan
+        for child in self._children.get(relative_dir, set()) - children:
+            if child in self._dirs:
+                self._forget_dir(child)
+            else:
+                self._remove_file(child)
+        self._children[relative_dir] = children
+        self._index_dirty = True
+
+    def _refresh_index(self):
+        """Brings the index up to date with the files in the base directory."""
+        if not self._index_loaded:
+            self._load_index()
+            self._index_loaded = True
+        self._dirs.setdefault("", None)
+
+        now_ns = time.time_ns()
+        for relative_dir in list(self._dirs):
+            if relative_dir not in self._dirs:
+                continue  # Forgotten together with its parent
+            mtime_ns = self._dirs[relative_dir]
+            try:
+                current_mtime_ns = (self._base_dir / relative_dir).stat().st_mtime_ns
+            except OSError:
+                self._forget_dir(relative_dir)
+                continue
+            if mtime_ns is None or current_mtime_ns != mtime_ns:
+                self._scan_dir(relative_dir, now_ns)
+
+        if self._index_dirty:
+            self._save_index()
+
+    def _invalidate(self, path: pathlib.Path):
+        """Marks the directories from path up to the base directory to be scanned again."""
+        try:
+            relative_path = path.relative_to(self._base_dir).as_posix()
+        except ValueError:
+            return
+        with self._index_lock:
+            while relative_path not in ("", "."):
+                relative_path = relative_path.rpartition("/")[0]
+                if relative_path in self._dirs:
+                    self._dirs[relative_path] = None
+
+    def _load_index(self):
+        if self._index_path is None:
+            return
+        try:
+            with open(self._index_path, encoding="utf-8") as f:
+                data = json.load(f)
+            if (
+                data.get("version") != INDEX_VERSION
+                or data.get("base_dir") != str(self._base_dir)
+                or data.get("mapping") != self._mapping
+            ):
+                return
+            for relative_dir, (mtime_ns, children) in data["dirs"].items():
+                self._dirs[relative_dir] = mtime_ns
+                self._children[relative_dir] = set(children)
+            for relative_path, entry in data["files"].items():
+                self._add_file(relative_path, IndexedFile(*entry))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            logger.warning(f"Ignoring the asset index {self._index_path}: {e}")
+            self._reset_index()
+
+    def _save_index(self):
+        self._index_dirty = False
+        if self._index_path is None:
+            return
+        data = {
+            "version": INDEX_VERSION,
+            "base_dir": str(self._base_dir),
+            "mapping": self._mapping,
+            "dirs": {
+                d: [mtime_ns, sorted(self._children.get(d, ()))]
+                for d, mtime_ns in self._dirs.items()
+            },
+            "files": {p: list(entry) for p, entry in self._files.items()},
+        }
+        tmp_path = self._index_path.with_name(self._index_path.name + ".tmp")
+        try:
+            self._index_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self._index_path)
+        except OSError as e:
+            logger.warning(f"Failed to write the asset index {self._index_path}: {e}")
+
+    def _resolve_case_insensitive(self, path: pathlib.Path) -> pathlib.Path:
+        """Returns the indexed file whose path matches path ignoring case, or path."""
+        if path.is_file():
+            return path
+        try:
+            relative_path = path.relative_to(self._base_dir).as_posix()
+        except ValueError:
+            return path
+        with self._index_lock:
+            self._refresh_index()
+            found = self._lower_paths.get(relative_path.lower())
+        return self._base_dir / found if found is not None else path
+
+    def _indexed_versions(self, asset_type: str, asset_id: str) -> Dict[str, str]:
+        """Returns {version: relative file path} of an asset from the index."""
+        with self._index_lock:
+            self._refresh_index()
+            return dict(self._assets.get((asset_type, asset_id), {}))
 
     def _uri_to_path(self, uri: AssetUri) -> pathlib.Path:
         """Converts an AssetUri to a filesystem path using mapping."""
@@ -279,7 +496,7 @@ class FileStore(AssetStore):
                 )
             path_to_read = self._uri_to_path(request_uri)
 
-        path_to_read = _resolve_case_insensitive(path_to_read)
+        path_to_read = self._resolve_case_insensitive(path_to_read)
         try:
             with open(path_to_read, mode="rb") as f:
                 return f.read()
@@ -308,14 +525,8 @@ class FileStore(AssetStore):
         is_versioned_pattern = "{version}" in path_format_str
 
         if uri.version is None:  # Delete all versions or the single unversioned file
-            for path_obj in self._base_dir.rglob("*"):
-                parsed_uri = self._path_to_uri(path_obj)
-                if (
-                    parsed_uri
-                    and parsed_uri.asset_type == uri.asset_type
-                    and parsed_uri.asset_id == uri.asset_id
-                ):
-                    paths_to_delete.append(path_obj)
+            for relative_path in self._indexed_versions(uri.asset_type, uri.asset_id).values():
+                paths_to_delete.append(self._base_dir / relative_path)
         else:  # Delete a specific version or an unversioned file (if version is "1")
             target_uri_for_path = uri
             if not is_versioned_pattern:
@@ -329,7 +540,7 @@ class FileStore(AssetStore):
                 )
 
             path = self._uri_to_path(target_uri_for_path)
-            path = _resolve_case_insensitive(path)
+            path = self._resolve_case_insensitive(path)
             if path.is_file():
                 paths_to_delete.append(path)
 
@@ -339,6 +550,7 @@ class FileStore(AssetStore):
                 parent_dirs_of_deleted_files.add(p_del.parent)
             except FileNotFoundError:
                 pass
+            self._invalidate(p_del)
 
         # Clean up empty parent directories, from deepest first
         sorted_parents = sorted(
@@ -378,6 +590,7 @@ class FileStore(AssetStore):
         asset_path.parent.mkdir(parents=True, exist_ok=True)
         with open(asset_path, mode="wb") as f:
             f.write(data)
+        self._invalidate(asset_path)
         return uri_to_create
 
     async def update(self, uri: AssetUri, data: bytes) -> AssetUri:
@@ -403,7 +616,7 @@ class FileStore(AssetStore):
             params=uri.params,
         )
         asset_path = self._uri_to_path(next_uri)
-        asset_path = _resolve_case_insensitive(asset_path)
+        asset_path = self._resolve_case_insensitive(asset_path)
 
         # If the file is versioned, then the new version should not yet exist.
         # Double check to be sure.
@@ -416,6 +629,7 @@ class FileStore(AssetStore):
         asset_path.parent.mkdir(parents=True, exist_ok=True)
         with open(asset_path, mode="wb") as f:
             f.write(data)
+        self._invalidate(asset_path)
         return next_uri
 
     async def list_assets(
@@ -431,19 +645,13 @@ class FileStore(AssetStore):
         """
         latest_asset_versions: Dict[Tuple[str, str], str] = {}
 
-        for path_obj in self._base_dir.rglob("*"):
-            parsed_uri = self._path_to_uri(path_obj)
-            if parsed_uri:
-                if asset_type is not None and parsed_uri.asset_type != asset_type:
+        with self._index_lock:
+            self._refresh_index()
+            for key, versions in self._assets.items():
+                if asset_type is not None and key[0] != asset_type:
                     continue
-
-                key = (parsed_uri.asset_type, parsed_uri.asset_id)
-                current_version_str = cast(str, parsed_uri.version)  # Is "1" or numeric string
-
-                if key not in latest_asset_versions or int(current_version_str) > int(
-                    latest_asset_versions[key]
-                ):
-                    latest_asset_versions[key] = current_version_str
+                # Versions are "1" or numeric strings
+                latest_asset_versions[key] = max(versions, key=int)
 
         result_uris: List[AssetUri] = [
             AssetUri.build(
@@ -461,16 +669,11 @@ class FileStore(AssetStore):
         """
         Counts assets in the store, optionally filtered by asset type.
         """
-        unique_assets: set[Tuple[str, str]] = set()
-
-        for path_obj in self._base_dir.rglob("*"):
-            parsed_uri = self._path_to_uri(path_obj)
-            if parsed_uri:
-                if asset_type is not None and parsed_uri.asset_type != asset_type:
-                    continue
-                unique_assets.add((parsed_uri.asset_type, parsed_uri.asset_id))
-
-        return len(unique_assets)
+        with self._index_lock:
+            self._refresh_index()
+            if asset_type is None:
+                return len(self._assets)
+            return sum(1 for key in self._assets if key[0] == asset_type)
 
     async def list_versions(self, uri: AssetUri) -> List[AssetUri]:
         """
@@ -496,25 +699,16 @@ class FileStore(AssetStore):
                 params=uri.params,
             )
             path_to_asset = self._uri_to_path(path_check_uri)
-            path_to_asset = _resolve_case_insensitive(path_to_asset)
+            path_to_asset = self._resolve_case_insensitive(path_to_asset)
             if path_to_asset.is_file():
                 return [path_check_uri]  # Returns URI with version "1" and original params
             return []
 
-        found_versions_strs: List[str] = []
-        for path_obj in self._base_dir.rglob("*"):
-            parsed_uri = self._path_to_uri(path_obj)  # This parsed_uri does not have params
-            if (
-                parsed_uri
-                and parsed_uri.asset_type == uri.asset_type
-                and parsed_uri.asset_id == uri.asset_id
-            ):
-                # Version from path is guaranteed numeric string by _path_to_uri for versioned patterns
-                found_versions_strs.append(cast(str, parsed_uri.version))
-
+        # Versions from paths are numeric strings for versioned patterns
+        found_versions_strs = self._indexed_versions(uri.asset_type, uri.asset_id)
         if not found_versions_strs:
             return []
-        sorted_unique_versions = sorted(list(set(found_versions_strs)), key=int)
+        sorted_unique_versions = sorted(found_versions_strs, key=int)
 
         return [
             AssetUri.build(
@@ -531,7 +725,6 @@ class FileStore(AssetStore):
         Checks if the store contains any assets, optionally filtered by asset
         type.
         """
-        # Reuses list_assets which iterates files.
-        # Limit=1 makes it stop after finding the first asset.
+        # Reuses list_assets which queries the index.
         assets = await self.list_assets(asset_type=asset_type, limit=1)
         return not bool(assets)
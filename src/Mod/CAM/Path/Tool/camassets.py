@@ -199,12 +199,14 @@ user_asset_store = FileStore(
     name="local",
     base_dir=Preferences.getAssetPath(),
     mapping=asset_mapping,
+    index_path=Preferences.getAssetIndexPath("local"),
 )
 
 builtin_asset_store = FileStore(
     name="builtin",
     base_dir=Preferences.getBuiltinAssetPath(),
     mapping=builtin_asset_mapping,
+    index_path=Preferences.getAssetIndexPath("builtin"),
 )
 
 
@@ -422,6 +422,19 @@ class ToolBitShape(Asset):
 
             return instance
 
+    def copy_for_reuse(self) -> "ToolBitShape":
+        """
+        Returns a copy of the shape with its own parameters, without opening
+        the shape document again. The document content and the icon are shared.
+        """
+        instance = self.__class__(id=self.id)
+        instance._data = self._data
+        instance._defaults = dict(self._defaults)
+        instance._param_types = dict(self._param_types)
+        instance._params = dict(self._params)
+        instance.icon = self.icon
+        return instance
+
     def to_bytes(self, serializer: Type[AssetSerializer]) -> bytes:
         """
         Serializes a ToolBitShape object to bytes (e.g., an fcstd file).
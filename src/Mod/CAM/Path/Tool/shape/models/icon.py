@@ -77,6 +77,10 @@ class ToolBitShapeIcon(Asset):
         assert serializer == DummyAssetSerializer, "ToolBitShapeIcon supports only native import"
         return cls(id=id, data=data)
 
+    def copy_for_reuse(self) -> "ToolBitShapeIcon":
+        """Icons are never modified, so the same instance is shared."""
+        return self
+
     def to_bytes(self, serializer: AssetSerializer) -> bytes:
         """
         Serializes a ToolBitShapeIcon object to bytes.
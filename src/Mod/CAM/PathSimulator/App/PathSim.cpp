@@ -22,6 +22,9 @@
  *                                                                         *
  ***************************************************************************/
 
+#include <algorithm>
+#include <cmath>
+#include <numbers>
 
 #include "PathSim.h"
 
@@ -82,3 +85,97 @@ Base::Placement* PathSim::ApplyCommand(Base::Placement* pos, Command* cmd)
     plc->setPosition(vec);
     return plc;
 }
+
+Base::Placement* PathSim::ApplyPath(Base::Placement* pos, const Toolpath& path)
+{
+    Point3D curPos(*pos);
+    bool firstDrill = true;
+    for (Command* cmd : path.getCommands()) {
+        const std::string& name = cmd->Name;
+        Point3D toPos(curPos);
+        toPos.UpdateCmd(*cmd);
+        if (name == "G0" || name == "G00" || name == "G1" || name == "G01") {
+            firstDrill = true;
+            ApplyMove(curPos, toPos);
+        }
+        else if (name == "G2" || name == "G02" || name == "G3" || name == "G03") {
+            firstDrill = true;
+            bool isCCW = name == "G3" || name == "G03";
+            if (cmd->getParam("K") == 0) {
+                ApplyArc(curPos, toPos, *cmd, isCCW);
+            }
+            else {
+                if (m_tool) {
+                    Vector3d vcent = cmd->getCenter();
+                    Point3D cent(vcent);
+                    m_stock->ApplyCircularTool(curPos, toPos, cent, *m_tool, isCCW);
+                }
+                curPos = toPos;
+            }
+        }
+        else if (name == "G80") {
+            firstDrill = true;
+        }
+        else if (name == "G73" || name == "G81" || name == "G82" || name == "G83") {
+            // drill cycles are a rapid move to the retract height, a plunge and a retract
+            float retract = cmd->getParam("R", curPos.z);
+            if (firstDrill) {
+                ApplyMove(curPos, Point3D(curPos.x, curPos.y, retract));
+                firstDrill = false;
+            }
+            ApplyMove(curPos, Point3D(toPos.x, toPos.y, retract));
+            ApplyMove(curPos, toPos);
+            ApplyMove(curPos, Point3D(toPos.x, toPos.y, retract));
+        }
+    }
+
+    Base::Placement* plc = new Base::Placement();
+    Vector3d vec(curPos.x, curPos.y, curPos.z);
+    plc->setPosition(vec);
+    return plc;
+}
+
+void PathSim::ApplyMove(Point3D& pos, const Point3D& toPos)
+{
+    Point3D to(toPos);
+    if (m_tool) {
+        m_stock->ApplyLinearTool(pos, to, *m_tool);
+    }
+    pos = to;
+}
+
+void PathSim::ApplyArc(Point3D& pos, const Point3D& toPos, const Command& cmd, bool isCCW)
+{
+    // linearize the arc with segments of about the simulation resolution
+    constexpr double fullCircle = 2 * std::numbers::pi;
+    double ci = cmd.getParam("I");
+    double cj = cmd.getParam("J");
+    double r = sqrt(ci * ci + cj * cj);
+    if (r < SIM_EPSILON) {
+        ApplyMove(pos, toPos);
+        return;
+    }
+    double cx = pos.x + ci;
+    double cy = pos.y + cj;
+    double a0 = atan2(pos.y - cy, pos.x - cx);
+    double a1 = atan2(toPos.y - cy, toPos.x - cx);
+    double da = a1 - a0;
+    if (isCCW) {
+        da -= fullCircle * floor(da / fullCircle);
+    }
+    else {
+        da += fullCircle * floor(-da / fullCircle);
+    }
+    if (fabs(da) < SIM_EPSILON) {
+        da = isCCW ? fullCircle : -fullCircle;  // start and end point are the same
+    }
+    int n = std::max(1, (int)ceil(sqrt(r / m_stock->GetResolution() * da * da)));
+    da /= n;
+    double z0 = pos.z;
+    double dz = (toPos.z - z0) / n;
+    for (int i = 1; i < n; i++) {
+        double a = a0 + da * i;
+        ApplyMove(pos, Point3D(cx + r * cos(a), cy + r * sin(a), z0 + dz * i));
+    }
+    ApplyMove(pos, toPos);
+}
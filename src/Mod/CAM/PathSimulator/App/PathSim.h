@@ -29,6 +29,7 @@
 #include <TopoDS_Shape.hxx>
 
 #include <Mod/CAM/App/Command.h>
+#include <Mod/CAM/App/Path.h>
 #include <Mod/Part/App/TopoShape.h>
 #include <Mod/CAM/PathGlobal.h>
 
@@ -53,6 +54,11 @@ public:
     void BeginSimulation(Part::TopoShape* stock, float resolution);
     void SetToolShape(const TopoDS_Shape& toolShape, float resolution);
     Base::Placement* ApplyCommand(Base::Placement* pos, Command* cmd);
+    Base::Placement* ApplyPath(Base::Placement* pos, const Toolpath& path);
+
+private:
+    void ApplyMove(Point3D& pos, const Point3D& toPos);
+    void ApplyArc(Point3D& pos, const Point3D& toPos, const Command& cmd, bool isCCW);
 
 public:
     std::unique_ptr<cStock> m_stock;
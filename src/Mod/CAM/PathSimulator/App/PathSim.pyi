@@ -7,9 +7,11 @@ from typing import Any, Final
 from Base.BaseClass import BaseClass
 from Base.Metadata import export
 from Base.Placement import Placement
+from Base.Vector import Vector
 from Part.App.TopoShape import TopoShape
 from Mesh.App.Mesh import Mesh
 from CAM.App.Command import Command
+from CAM.App.Path import Path
 
 @export(
     FatherInclude="Base/BaseClassPy.h",
@@ -53,5 +55,32 @@ class PathSim(BaseClass):
         Apply a single path command on the stock starting from placement.
         """
         ...
+
+    def ApplyPath(self, placement: Placement, path: Path) -> Placement:
+        """
+        Apply all commands of a path on the stock starting from placement.
+        Arcs are linearized with the resolution of the simulation and drill cycles
+        are expanded to their moves. Returns the placement at the end of the path.
+        """
+        ...
+
+    def SetModel(self, model: Mesh, /) -> None:
+        """
+        Set the model the stock is machined to, used to find gouges.
+        """
+        ...
+
+    def GetRemovedVolume(self) -> float:
+        """
+        Return the volume of the material removed from the stock so far.
+        """
+        ...
+
+    def GetGouges(self, tolerance: float = 0.0, /) -> list[tuple[Vector, float]]:
+        """
+        Return the cells of the stock that are cut deeper than the model by more than
+        tolerance, as a list of (position, depth) tuples.
+        """
+        ...
     Tool: Final[Any]
     """Return current simulation tool."""
@@ -25,9 +25,11 @@
 
 #include <Base/PlacementPy.h>
 #include <Base/PyWrapParseTupleAndKeywords.h>
+#include <Base/VectorPy.h>
 
 #include <Mod/Mesh/App/MeshPy.h>
 #include <Mod/CAM/App/CommandPy.h>
+#include <Mod/CAM/App/PathPy.h>
 #include <Mod/Part/App/TopoShapePy.h>
 
 #include "PathSim.h"
@@ -145,6 +147,87 @@ PyObject* PathSimPy::ApplyCommand(PyObject* args, PyObject* kwds)
     return newposPy;
 }
 
+PyObject* PathSimPy::ApplyPath(PyObject* args, PyObject* kwds)
+{
+    static const std::array<const char*, 3> kwlist {"position", "path", nullptr};
+    PyObject* pObjPlace;
+    PyObject* pObjPath;
+    if (!Base::Wrapped_ParseTupleAndKeywords(
+            args,
+            kwds,
+            "O!O!",
+            kwlist,
+            &(Base::PlacementPy::Type),
+            &pObjPlace,
+            &(Path::PathPy::Type),
+            &pObjPath
+        )) {
+        return nullptr;
+    }
+    PathSim* sim = getPathSimPtr();
+    if (!sim->m_stock) {
+        PyErr_SetString(PyExc_RuntimeError, "Simulation has no stock object");
+        return nullptr;
+    }
+    Base::Placement* pos = static_cast<Base::PlacementPy*>(pObjPlace)->getPlacementPtr();
+    Path::Toolpath* path = static_cast<Path::PathPy*>(pObjPath)->getToolpathPtr();
+    Base::Placement* newpos = sim->ApplyPath(pos, *path);
+    return new Base::PlacementPy(newpos);
+}
+
+PyObject* PathSimPy::SetModel(PyObject* args)
+{
+    PyObject* pObjModel;
+    if (!PyArg_ParseTuple(args, "O!", &(Mesh::MeshPy::Type), &pObjModel)) {
+        return nullptr;
+    }
+    cStock* stock = getPathSimPtr()->m_stock.get();
+    if (!stock) {
+        PyErr_SetString(PyExc_RuntimeError, "Simulation has no stock object");
+        return nullptr;
+    }
+    const Mesh::MeshObject* model = static_cast<Mesh::MeshPy*>(pObjModel)->getMeshObjectPtr();
+    stock->SetModel(model->getKernel());
+    Py_IncRef(Py_None);
+    return Py_None;
+}
+
+PyObject* PathSimPy::GetRemovedVolume(PyObject* args)
+{
+    if (!PyArg_ParseTuple(args, "")) {
+        return nullptr;
+    }
+    cStock* stock = getPathSimPtr()->m_stock.get();
+    if (!stock) {
+        PyErr_SetString(PyExc_RuntimeError, "Simulation has no stock object");
+        return nullptr;
+    }
+    return PyFloat_FromDouble(stock->GetRemovedVolume());
+}
+
+PyObject* PathSimPy::GetGouges(PyObject* args)
+{
+    float tolerance = 0;
+    if (!PyArg_ParseTuple(args, "|f", &tolerance)) {
+        return nullptr;
+    }
+    cStock* stock = getPathSimPtr()->m_stock.get();
+    if (!stock) {
+        PyErr_SetString(PyExc_RuntimeError, "Simulation has no stock object");
+        return nullptr;
+    }
+    std::vector<std::pair<Base::Vector3d, float>> gouges;
+    stock->GetGouges(tolerance, gouges);
+    Py::List list;
+    for (const auto& gouge : gouges) {
+        Py::Tuple item(2);
+        item.setItem(0, Py::asObject(new Base::VectorPy(gouge.first)));
+        item.setItem(1, Py::Float(gouge.second));
+        list.append(item);
+    }
+    return Py::new_reference_to(list);
+}
+
 Py::Object PathSimPy::getTool() const
 {
     // return Py::Object();
@@ -45,6 +45,7 @@ cStock::cStock(float px, float py, float pz, float lx, float ly, float lz, float
     , m_ly(ly)
     , m_lz(lz)
     , m_res(res)
+    , m_hasModel(false)
 {
     m_x = (int)(m_lx / res) + 1;
     m_y = (int)(m_ly / res) + 1;
@@ -663,6 +664,106 @@ void cStock::ApplyCircularTool(Point3D& p1, Point3D& p2, Point3D& cent, cSimTool
     }
 }
 
+void cStock::SetModel(const MeshCore::MeshKernel& model)
+{
+    if (!m_hasModel) {
+        m_model.Init(m_x, m_y);
+        m_hasModel = true;
+    }
+    for (int y = 0; y < m_y; y++) {
+        for (int x = 0; x < m_x; x++) {
+            m_model[x][y] = SIM_NO_MODEL;
+        }
+    }
+    unsigned long count = model.CountFacets();
+    for (unsigned long i = 0; i < count; i++) {
+        RasterizeFacet(model.GetFacet(i));
+    }
+}
+
+void cStock::RasterizeFacet(const MeshCore::MeshGeomFacet& facet)
+{
+    // facet corners in cell units, cell centers are at integer positions
+    float px[3], py[3], pz[3];
+    for (int i = 0; i < 3; i++) {
+        px[i] = (facet._aclPoints[i].x - m_px) / m_res - 0.5f;
+        py[i] = (facet._aclPoints[i].y - m_py) / m_res - 0.5f;
+        pz[i] = facet._aclPoints[i].z;
+    }
+    float area = (px[1] - px[0]) * (py[2] - py[0]) - (px[2] - px[0]) * (py[1] - py[0]);
+    if (fabs(area) < SIM_EPSILON) {
+        return;  // vertical facet, the neighbouring facets define the height
+    }
+    int xmin = std::max(0, (int)ceil(std::min({px[0], px[1], px[2]})));
+    int xmax = std::min(m_x - 1, (int)floor(std::max({px[0], px[1], px[2]})));
+    int ymin = std::max(0, (int)ceil(std::min({py[0], py[1], py[2]})));
+    int ymax = std::min(m_y - 1, (int)floor(std::max({py[0], py[1], py[2]})));
+    for (int x = xmin; x <= xmax; x++) {
+        for (int y = ymin; y <= ymax; y++) {
+            // barycentric coordinates of the cell center
+            float w1 = ((x - px[0]) * (py[2] - py[0]) - (px[2] - px[0]) * (y - py[0])) / area;
+            float w2 = ((px[1] - px[0]) * (y - py[0]) - (x - px[0]) * (py[1] - py[0])) / area;
+            float w0 = 1.0f - w1 - w2;
+            if (w0 < -SIM_EPSILON || w1 < -SIM_EPSILON || w2 < -SIM_EPSILON) {
+                continue;
+            }
+            float z = w0 * pz[0] + w1 * pz[1] + w2 * pz[2];
+            if (m_model[x][y] < z) {
+                m_model[x][y] = z;
+            }
+        }
+    }
+}
+
+double cStock::GetRemovedVolume()
+{
+    // the last row and column of cells may be partially outside of the stock
+    float xcells = m_lx / m_res;
+    float ycells = m_ly / m_res;
+    double volume = 0;
+    for (int x = 0; x < m_x; x++) {
+        float wx = std::clamp(xcells - x, 0.0f, 1.0f);
+        for (int y = 0; y < m_y; y++) {
+            float wy = std::clamp(ycells - y, 0.0f, 1.0f);
+            float z = std::max(m_stock[x][y], m_pz);
+            volume += (m_plane - z) * wx * wy;
+        }
+    }
+    return volume * m_res * m_res;
+}
+
+float cStock::ModelFloorAt(int xp, int yp)
+{
+    // the tool footprint is only known to a cell, so compare against the lowest model point
+    // around the cell to not report cells at the model walls
+    float z = m_model[xp][yp];
+    for (int x = std::max(0, xp - 1); x <= std::min(m_x - 1, xp + 1); x++) {
+        for (int y = std::max(0, yp - 1); y <= std::min(m_y - 1, yp + 1); y++) {
+            z = std::min(z, m_model[x][y]);
+        }
+    }
+    return z;
+}
+
+void cStock::GetGouges(float tolerance, std::vector<std::pair<Base::Vector3d, float>>& gouges)
+{
+    if (!m_hasModel) {
+        return;
+    }
+    for (int x = 0; x < m_x; x++) {
+        for (int y = 0; y < m_y; y++) {
+            if (m_model[x][y] == SIM_NO_MODEL) {
+                continue;
+            }
+            float depth = ModelFloorAt(x, y) - m_stock[x][y];
+            if (depth > tolerance) {
+                Base::Vector3d pos(m_px + (x + 0.5) * m_res, m_py + (y + 0.5) * m_res, m_stock[x][y]);
+                gouges.emplace_back(pos, depth);
+            }
+        }
+    }
+}
+
 
 //************************************************************************************************************
 // Line Segment
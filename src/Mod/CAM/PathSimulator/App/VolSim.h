@@ -27,6 +27,7 @@
 #ifndef PATHSIMULATOR_VolSim_H
 #define PATHSIMULATOR_VolSim_H
 
+#include <limits>
 #include <vector>
 
 #include <Mod/Mesh/App/Mesh.h>
@@ -36,6 +37,7 @@
 #define SIM_EPSILON 0.00001
 #define SIM_TESSEL_TOP 1
 #define SIM_TESSEL_BOT 2
+#define SIM_NO_MODEL (-std::numeric_limits<float>::max())  // cell not covered by the model
 #define SIM_WALK_RES \
     0.6  // step size in pixel units (to make sure all pixels in the path are visited)
 
@@ -229,6 +231,13 @@ public:
     void CreatePocket(float x, float y, float rad, float height);
     void ApplyLinearTool(Point3D& p1, Point3D& p2, cSimTool& tool);
     void ApplyCircularTool(Point3D& p1, Point3D& p2, Point3D& cent, cSimTool& tool, bool isCCW);
+    void SetModel(const MeshCore::MeshKernel& model);
+    double GetRemovedVolume();
+    void GetGouges(float tolerance, std::vector<std::pair<Base::Vector3d, float>>& gouges);
+    inline float GetResolution() const
+    {
+        return m_res;
+    }
     inline Point3D ToInner(Point3D& p)
     {
         return Point3D((p.x - m_px) / m_res, (p.y - m_py) / m_res, p.z);
@@ -249,8 +258,12 @@ private:
     int TesselBot(int x, int y);
     int TesselSidesX(int yp);
     int TesselSidesY(int xp);
+    void RasterizeFacet(const MeshCore::MeshGeomFacet& facet);
+    float ModelFloorAt(int xp, int yp);
     Array2D<float> m_stock;
     Array2D<char> m_attr;
+    Array2D<float> m_model;  // highest model point at the cell centers
+    bool m_hasModel;
     float m_px, m_py, m_pz;  // stock zero position
     float m_lx, m_ly, m_lz;  // stock dimensions
     float m_res;             // resoulution
@@ -35,7 +35,9 @@ from CAMTests.TestPathProfile import TestPathProfile
 
 from CAMTests.TestPathAdaptive import TestPathAdaptive
 from CAMTests.TestPathCommandAnnotations import TestPathCommandAnnotations
+from CAMTests.TestPathCommandArray import TestPathCommandArray
 from CAMTests.TestPathCore import TestPathCore
+from CAMTests.TestPathCycleTime import TestPathCycleTime
 from CAMTests.TestPathDepthParams import depthTestCases
 from CAMTests.TestPathDressupDogbone import TestDressupDogbone
 from CAMTests.TestPathDressupDogboneII import TestDressupDogboneII
@@ -47,6 +49,7 @@ from CAMTests.TestPathGeneratorDogboneII import TestGeneratorDogboneII
 from CAMTests.TestPathGeom import TestPathGeom
 from CAMTests.TestPathLanguage import TestPathLanguage
 from CAMTests.TestPathOpDeburr import TestPathOpDeburr
+from CAMTests.TestPathOpFingerprint import TestPathOpFingerprint
 from CAMTests.TestPathHelpers import TestPathHelpers
 from CAMTests.TestPathHelix import TestPathHelix
 from CAMTests.TestPathHelixGenerator import TestPathHelixGenerator
@@ -67,7 +70,10 @@ from CAMTests.TestPathProfile import TestPathProfile
 from CAMTests.TestPathPropertyBag import TestPathPropertyBag
 from CAMTests.TestPathRotationGenerator import TestPathRotationGenerator
 from CAMTests.TestPathSetupSheet import TestPathSetupSheet
+from CAMTests.TestPathSimulation import TestPathSimulation
 from CAMTests.TestPathStock import TestPathStock
+from CAMTests.TestPathSurfaceSupport import TestPathSurfaceSupportCache
+from CAMTests.TestPathSurfaceSupport import TestPathSurfaceSupportSTL
 from CAMTests.TestPathTapGenerator import TestPathTapGenerator
 from CAMTests.TestPathThreadMilling import TestPathThreadMilling
 from CAMTests.TestPathThreadMillingGenerator import TestPathThreadMillingGenerator
@@ -102,6 +108,7 @@ from CAMTests.TestPathToolController import TestPathToolController
 from CAMTests.TestPathUtil import TestPathUtil
 from CAMTests.TestPathVcarve import TestPathVcarve
 from CAMTests.TestPathVoronoi import TestPathVoronoi
+from CAMTests.TestPathWaterline import TestPathWaterline
 
 from CAMTests.TestGenericPost import TestGenericPost
 from CAMTests.TestLinuxCNCPost import TestLinuxCNCPost
@@ -111,6 +118,7 @@ from CAMTests.TestMassoG3Post import TestMassoG3Post
 from CAMTests.TestCentroidPost import TestCentroidPost
 from CAMTests.TestMach3Mach4Post import TestMach3Mach4Post
 from CAMTests.TestTestPost import TestTestPost
+from CAMTests.TestPostFormatterPlan import TestPostFormatterPlan
 from CAMTests.TestPostGCodes import TestPostGCodes
 from CAMTests.TestPostMCodes import TestPostMCodes
 from CAMTests.TestDressupPost import TestDressupPost
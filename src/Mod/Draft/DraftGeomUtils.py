@@ -141,6 +141,8 @@ from draftgeoutils.wires import (
     get_extended_wire,
 )
 
+from draftgeoutils.spatial_index import SpatialHash, group_connected_edges, find_wires_indexed
+
 # Needs wires functions
 from draftgeoutils.fillets import fillet, filletWire
 
@@ -0,0 +1,180 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+# ***************************************************************************
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   FreeCAD is distributed in the hope that it will be useful,            *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with FreeCAD; if not, write to the Free Software        *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Provides a spatial hash to find points and boxes near each other."""
+## @package spatial_index
+# \ingroup draftgeoutils
+# \brief Provides a spatial hash to find points and boxes near each other.
+
+import itertools
+import math
+
+import lazy_loader.lazy_loader as lz
+
+# Delay import of module until first use because it is heavy
+Part = lz.LazyLoader("Part", globals(), "Part")
+
+## \addtogroup draftgeoutils
+# @{
+
+# Precision::Confusion(), the default tolerance of Part.sortEdges()
+CONFUSION = 1e-7
+
+_NEIGHBOURS = tuple(itertools.product((-1, 0, 1), repeat=3))
+
+
+class SpatialHash:
+    """Uniform grid over points and bounding boxes.
+
+    Each item is stored in the cells it touches, a query only looks at the items
+    of the cells around the queried point or box, instead of at all items.
+
+    Parameters
+    ----------
+    cell_size: float
+        The edge length of the cubic cells. Queries with a tolerance larger than the
+        cell size are not supported.
+    """
+
+    def __init__(self, cell_size):
+        if cell_size <= 0:
+            raise ValueError("The cell size of a spatial hash must be positive")
+        self.cell_size = cell_size
+        self._cells = {}
+        self._points = {}
+        self._boxes = {}
+
+    def __len__(self):
+        return len(self._points) + len(self._boxes)
+
+    def _cell(self, point):
+        size = self.cell_size
+        return (
+            math.floor(point[0] / size),
+            math.floor(point[1] / size),
+            math.floor(point[2] / size),
+        )
+
+    def insert_point(self, item, point):
+        """Add item at point, a Vector or a tuple of three floats."""
+        self._points[item] = (point[0], point[1], point[2])
+        self._cells.setdefault(self._cell(point), []).append(item)
+
+    def insert_box(self, item, box):
+        """Add item with the bounding box box, a FreeCAD.BoundBox."""
+        self._boxes[item] = (box.XMin, box.YMin, box.ZMin, box.XMax, box.YMax, box.ZMax)
+        low = self._cell((box.XMin, box.YMin, box.ZMin))
+        high = self._cell((box.XMax, box.YMax, box.ZMax))
+        for cell in itertools.product(
+            range(low[0], high[0] + 1), range(low[1], high[1] + 1), range(low[2], high[2] + 1)
+        ):
+            self._cells.setdefault(cell, []).append(item)
+
+    def query_point(self, point, tolerance=0.0):
+        """Return the point items within tolerance of point, in the order of insertion."""
+        if tolerance > self.cell_size:
+            raise ValueError("The tolerance must not be larger than the cell size")
+        x, y, z = point[0], point[1], point[2]
+        cx, cy, cz = self._cell(point)
+        tolerance_sq = tolerance * tolerance
+        found = []
+        for dx, dy, dz in _NEIGHBOURS:
+            for item in self._cells.get((cx + dx, cy + dy, cz + dz), ()):
+                p = self._points.get(item)
+                if p is None:
+                    continue
+                if (p[0] - x) ** 2 + (p[1] - y) ** 2 + (p[2] - z) ** 2 <= tolerance_sq:
+                    found.append(item)
+        return found
+
+    def query_box(self, box, tolerance=0.0):
+        """Return the box items whose boxes overlap box enlarged by tolerance."""
+        low = (box.XMin - tolerance, box.YMin - tolerance, box.ZMin - tolerance)
+        high = (box.XMax + tolerance, box.YMax + tolerance, box.ZMax + tolerance)
+        cell_low = self._cell(low)
+        cell_high = self._cell(high)
+        found = {}
+        for cell in itertools.product(
+            range(cell_low[0], cell_high[0] + 1),
+            range(cell_low[1], cell_high[1] + 1),
+            range(cell_low[2], cell_high[2] + 1),
+        ):
+            for item in self._cells.get(cell, ()):
+                b = self._boxes.get(item)
+                if b is None or item in found:
+                    continue
+                if all(b[i] <= high[i] and low[i] <= b[i + 3] for i in range(3)):
+                    found[item] = None
+        return list(found)
+
+
+def group_connected_edges(edges, tolerance=CONFUSION):
+    """Group edges whose end points touch each other, directly or through other edges.
+
+    Returns a list of lists of edges. The edges of a group and the groups are in the
+    order of the given edges.
+    """
+    parent = list(range(len(edges)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    index = SpatialHash(max(tolerance, CONFUSION) * 2)
+    for i, edge in enumerate(edges):
+        vertexes = edge.Vertexes
+        if not vertexes:
+            continue
+        for j, vertex in enumerate((vertexes[0], vertexes[-1])):
+            point = vertex.Point
+            for other, _ in index.query_point(point, tolerance):
+                root_i, root_other = find(i), find(other)
+                if root_i != root_other:
+                    parent[max(root_i, root_other)] = min(root_i, root_other)
+            index.insert_point((i, j), point)
+
+    groups = {}
+    for i, edge in enumerate(edges):
+        groups.setdefault(find(i), []).append(edge)
+    return list(groups.values())
+
+
+def find_wires_indexed(edgeslist, tolerance=CONFUSION):
+    """Find wires in a list of edges, like findWires(), for large lists of edges.
+
+    The edges are grouped by touching end points with a spatial hash first, each group
+    is sorted with Part.sortEdges() on its own. The wires of the same group are in the
+    order of findWires(), the wires of different groups may be in another order.
+    """
+    wires = []
+    for group in group_connected_edges(edgeslist, tolerance):
+        if len(group) == 1:
+            wires.append(Part.Wire(group))
+        else:
+            wires.extend(Part.Wire(e) for e in Part.sortEdges(group, tolerance))
+    return wires
+
+
+## @}
@@ -26,6 +26,12 @@
 
 """Unit tests for the Draft Workbench, DraftGeomUtils module tests."""
 
+import os
+import random
+import time
+import unittest
+
+import FreeCAD as App
 import Part
 import DraftGeomUtils
 from FreeCAD import Vector
@@ -251,6 +257,95 @@ class TestDraftGeomUtils(test_base.DraftTestCaseNoDoc):
         wire.Orientation = "Reversed"
         self.check_wire(wire)
 
+    def test_spatial_hash(self):
+        """Test the DraftGeomUtils.SpatialHash class."""
+        operation = "DraftGeomUtils.SpatialHash"
+        _msg("  Test '{}'".format(operation))
+
+        index = DraftGeomUtils.SpatialHash(1.0)
+        index.insert_point("a", Vector(0.0, 0.0, 0.0))
+        index.insert_point("b", Vector(0.5, 0.0, 0.0))
+        index.insert_point("c", Vector(-0.95, 0.0, 0.0))
+        index.insert_point("d", Vector(5.0, 5.0, 0.0))
+        self.assertEqual(index.query_point(Vector(0.0, 0.0, 0.0)), ["a"])
+        self.assertEqual(sorted(index.query_point(Vector(0.0, 0.0, 0.0), 0.96)), ["a", "b", "c"])
+        self.assertEqual(index.query_point(Vector(5.0, 5.8, 0.0), 0.9), ["d"])
+        self.assertEqual(index.query_point(Vector(2.5, 2.5, 0.0), 1.0), [])
+        self.assertRaises(ValueError, index.query_point, Vector(), 2.0)
+
+        index.insert_box("box1", App.BoundBox(0.0, 0.0, 0.0, 3.0, 1.0, 0.0))
+        index.insert_box("box2", App.BoundBox(10.0, 10.0, 0.0, 12.0, 12.0, 0.0))
+        self.assertEqual(index.query_box(App.BoundBox(2.5, 0.5, 0.0, 4.0, 4.0, 0.0)), ["box1"])
+        self.assertEqual(index.query_box(App.BoundBox(4.0, 4.0, 0.0, 9.0, 9.0, 0.0)), [])
+        self.assertEqual(index.query_box(App.BoundBox(4.0, 4.0, 0.0, 9.0, 9.0, 0.0), 1.0), ["box2"])
+        self.assertEqual(len(index), 6)
+
+    def synthetic_edges(self, n):
+        """Return a grid of n x n separate squares plus some open polylines,
+        in random order and with random edge orientation, like the lines of an imported DXF.
+        """
+        edges = []
+        for i in range(n):
+            for j in range(n):
+                x, y = 20.0 * i, 20.0 * j
+                corners = [
+                    Vector(x, y, 0.0),
+                    Vector(x + 10.0, y, 0.0),
+                    Vector(x + 10.0, y + 10.0, 0.0),
+                    Vector(x, y + 10.0, 0.0),
+                ]
+                for k in range(4):
+                    edges.append(Part.makeLine(corners[k], corners[(k + 1) % 4]))
+                if i % 5 == 0:
+                    edges.append(
+                        Part.makeLine(Vector(x, y + 12.0, 0.0), Vector(x + 5, y + 15, 0.0))
+                    )
+                    edges.append(
+                        Part.makeLine(Vector(x + 5, y + 15, 0.0), Vector(x + 10, y + 12, 0.0))
+                    )
+        rng = random.Random(0)
+        rng.shuffle(edges)
+        return [e.reversed() if rng.random() < 0.5 else e for e in edges]
+
+    def test_find_wires_indexed(self):
+        """Test the DraftGeomUtils.find_wires_indexed function against findWires."""
+        operation = "DraftGeomUtils.find_wires_indexed"
+        _msg("  Test '{}'".format(operation))
+
+        edges = self.synthetic_edges(15)
+        expected = DraftGeomUtils.findWires(edges)
+        wires = DraftGeomUtils.find_wires_indexed(edges)
+
+        self.assertEqual(len(wires), len(expected))
+        self.assertEqual(len(wires), 225 + 45)
+        self.assertEqual(sum(w.isClosed() for w in wires), 225)
+
+        def key(wire):
+            box = wire.BoundBox
+            return (round(box.XMin, 6), round(box.YMin, 6), round(wire.Length, 6))
+
+        self.assertEqual(sorted(map(key, wires)), sorted(map(key, expected)))
+
+    @unittest.skipUnless(os.environ.get("DRAFT_BENCHMARKS"), "set DRAFT_BENCHMARKS=1 to run")
+    def test_find_wires_indexed_benchmark(self):
+        """Report the times of findWires and find_wires_indexed on many edges."""
+        operation = "DraftGeomUtils.find_wires_indexed benchmark"
+        _msg("  Test '{}'".format(operation))
+
+        edges = self.synthetic_edges(40)
+        start = time.perf_counter()
+        expected = DraftGeomUtils.findWires(edges)
+        time_find_wires = time.perf_counter() - start
+        start = time.perf_counter()
+        wires = DraftGeomUtils.find_wires_indexed(edges)
+        time_indexed = time.perf_counter() - start
+        _msg(
+            "  {} edges: findWires {:.3f} s, find_wires_indexed {:.3f} s".format(
+                len(edges), time_find_wires, time_indexed
+            )
+        )
+        self.assertEqual(len(wires), len(expected))
+
 
 # suite = unittest.defaultTestLoader.loadTestsFromTestCase(TestDraftGeomUtils)
 # unittest.TextTestRunner().run(suite)
@@ -35,6 +35,9 @@
 # @{
 
 import os
+import tempfile
+import time
+import unittest
 
 import FreeCAD as App
 import Draft
@@ -93,6 +96,83 @@ class DraftDXF(test_base.DraftTestCaseDoc):
             if doc:
                 App.closeDocument(doc.Name)
 
+    def write_synthetic_dxf(self, filename, num_layers, num_lines):
+        """Write a DXF file with num_lines separate lines spread over num_layers layers."""
+        codes = ["0", "SECTION", "2", "HEADER", "9", "$ACADVER", "1", "AC1009", "0", "ENDSEC"]
+        codes += ["0", "SECTION", "2", "TABLES", "0", "TABLE", "2", "LAYER", "70", str(num_layers)]
+        for i in range(num_layers):
+            codes += ["0", "LAYER", "2", "Layer{}".format(i), "70", "0", "62", "7"]
+            codes += ["6", "CONTINUOUS"]
+        codes += ["0", "ENDTAB", "0", "ENDSEC", "0", "SECTION", "2", "ENTITIES"]
+        for i in range(num_lines):
+            x, y = 10.0 * (i % 100), 10.0 * (i // 100)
+            codes += ["0", "LINE", "8", "Layer{}".format(i % num_layers)]
+            codes += ["10", str(x), "20", str(y), "30", "0.0"]
+            codes += ["11", str(x + 5.0), "21", str(y + 5.0), "31", "0.0"]
+        codes += ["0", "ENDSEC", "0", "EOF"]
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write("\n".join(codes) + "\n")
+
+    def read_synthetic_dxf(self, num_layers, num_lines):
+        """Import a synthetic DXF file as Draft objects, check the objects and layers
+        and return the import time."""
+        in_file = os.path.join(tempfile.mkdtemp(), "synthetic_lines.dxf")
+        self.write_synthetic_dxf(in_file, num_layers, num_lines)
+
+        hGrp = App.ParamGet("User parameter:BaseApp/Preferences/Mod/Draft")
+
+        # Set options, doing our best to restore them:
+        wasShowDialog = hGrp.GetBool("dxfShowDialog", True)
+        wasUseLegacyImporter = hGrp.GetBool("dxfUseLegacyImporter", False)
+        wasUseLayers = hGrp.GetBool("dxfUseDraftVisGroups", True)
+        wasImportMode = hGrp.GetInt("DxfImportMode", 2)
+        wasCreateSketch = hGrp.GetBool("dxfCreateSketch", False)
+
+        doc = None
+        try:
+            hGrp.SetBool("dxfShowDialog", False)
+            hGrp.SetBool("dxfUseLegacyImporter", False)
+            hGrp.SetBool("dxfUseDraftVisGroups", True)
+            # editable Draft objects, the objects of the C++ importer are post-processed
+            hGrp.SetInt("DxfImportMode", 0)
+            hGrp.SetBool("dxfCreateSketch", False)
+            start = time.perf_counter()
+            doc = importDXF.open(in_file)
+            seconds = time.perf_counter() - start
+
+            wires = [obj for obj in doc.Objects if Draft.get_type(obj) == "Wire"]
+            self.assertEqual(len(wires), num_lines)
+            layers = [obj for obj in doc.Objects if Draft.get_type(obj) == "Layer"]
+            for layer in layers:
+                if layer.Label.startswith("Layer"):
+                    self.assertEqual(len(layer.Group), num_lines // num_layers)
+        finally:
+            hGrp.SetBool("dxfShowDialog", wasShowDialog)
+            hGrp.SetBool("dxfUseLegacyImporter", wasUseLegacyImporter)
+            hGrp.SetBool("dxfUseDraftVisGroups", wasUseLayers)
+            hGrp.SetInt("DxfImportMode", wasImportMode)
+            hGrp.SetBool("dxfCreateSketch", wasCreateSketch)
+            if doc:
+                App.closeDocument(doc.Name)
+            os.remove(in_file)
+            os.rmdir(os.path.dirname(in_file))
+        return seconds
+
+    def test_read_dxf_many_lines(self):
+        """Import a synthetic DXF file with many lines on several layers as Draft objects."""
+        operation = "importDXF.open many lines"
+        _msg("  Test '{}'".format(operation))
+        self.read_synthetic_dxf(10, 2000)
+
+    @unittest.skipUnless(os.environ.get("DRAFT_BENCHMARKS"), "set DRAFT_BENCHMARKS=1 to run")
+    def test_read_dxf_large_benchmark(self):
+        """Import a large synthetic DXF file as Draft objects and report the import time."""
+        operation = "importDXF.open large file benchmark"
+        _msg("  Test '{}'".format(operation))
+        for num_lines in (2000, 20000, 100000):
+            seconds = self.read_synthetic_dxf(20, num_lines)
+            _msg("  {} lines imported in {:.3f} s".format(num_lines, seconds))
+
     def test_export_dxf(self):
         """Create some figures and export them to a DXF file."""
         operation = "importDXF.export"
@@ -1794,7 +1794,7 @@ def drawInsert(insert, num=None, clone=False):
         else:
             shape = None
     else:
-        if insert in blockshapes:
+        if insert.block in blockshapes:
             shape = blockshapes[insert.block].copy()
         else:
             shape = None
@@ -2393,11 +2393,13 @@ def processdxf(document, filename, getShapes=False, reComputeFlag=True):
         edges = []
         for s in shapes:
             edges.extend(s.Edges)
-        if len(edges) > (100):
+        # the edges are grouped with a spatial index before they are sorted,
+        # so only the joining of very large drawings needs a confirmation
+        if len(edges) > (10000):
             FCC.PrintMessage(str(len(edges)) + " edges to join\n")
             if gui:
                 d = QtWidgets.QMessageBox()
-                d.setText("Warning: High number of entities to join (>100)")
+                d.setText("Warning: High number of entities to join (>10000)")
                 d.setInformativeText(
                     "This might take a long time "
                     "or even freeze your computer. "
@@ -2411,7 +2413,7 @@ def processdxf(document, filename, getShapes=False, reComputeFlag=True):
                 if res == QtWidgets.QMessageBox.Cancel:
                     FCC.PrintMessage("Aborted\n")
                     return
-        shapes = DraftGeomUtils.findWires(edges)
+        shapes = DraftGeomUtils.find_wires_indexed(edges)
         for s in shapes:
             newob = addObject(s)
 
@@ -4524,6 +4526,9 @@ class DxfDraftPostProcessor:
         self.import_mode = import_mode
         self.all_originals_to_delete = set()
         self.newly_created_draft_objects = []
+        self.layers_by_label = None
+        self.layer_children = {}
+        self.progressbar = None
 
     def _categorize_objects(self):
         """
@@ -4821,24 +4826,44 @@ class DxfDraftPostProcessor:
         if hasattr(original_obj, "OriginalLayer"):
             layer_name = original_obj.OriginalLayer
 
-            found_layers = self.doc.getObjectsByLabel(layer_name)
-
-            layer_obj = None
-            if found_layers:
-                for l_obj in found_layers:
+            # Looking up the layers by label in the whole document for every object
+            # is quadratic, so they are indexed once.
+            if self.layers_by_label is None:
+                self.layers_by_label = {}
+                for l_obj in self.doc.Objects:
                     if Draft.get_type(l_obj) == "Layer":
-                        layer_obj = l_obj
-                        break
+                        self.layers_by_label.setdefault(l_obj.Label, l_obj)
+
+            layer_obj = self.layers_by_label.get(layer_name)
 
             if layer_obj:
-                layer_obj.Proxy.addObject(layer_obj, new_obj)
+                # The children are added to the layer in one go by _add_layer_children()
+                self.layer_children.setdefault(layer_obj, []).append(new_obj)
             else:
                 FCC.PrintWarning(
                     f"DXF Post-Processor: Could not find a valid Draft Layer with label '{layer_name}' for object '{new_obj.Label}'.\n"
                 )
 
+    def _add_layer_children(self):
+        """Adds the new objects to their layers, setting the group of every layer once."""
+        for layer_obj, children in self.layer_children.items():
+            group = layer_obj.Group
+            members = set(group)
+            for child in children:
+                if child not in members:
+                    group.append(child)
+                    members.add(child)
+            layer_obj.Group = group
+        self.layer_children = {}
+
+    def _next_step(self):
+        """Advances the progress indicator of the post-processing by one object."""
+        if self.progressbar is not None:
+            self.progressbar.next()
+
     def _create_and_parent_geometry(self, intermediate_obj):
         """High-level helper to convert, name, and parent a single geometric object."""
+        self._next_step()
         new_draft_obj, obj_type_str = self._create_draft_object_from_part(intermediate_obj)
         if new_draft_obj:
             label = intermediate_obj.Label
@@ -4859,6 +4884,7 @@ class DxfDraftPostProcessor:
             return
 
         for placeholder in placeholders:
+            self._next_step()
             if not placeholder.isValid():
                 continue
             new_obj = None
@@ -5038,10 +5064,21 @@ class DxfDraftPostProcessor:
         if not self.all_imported_objects:
             return
 
+        from FreeCAD import Base
+
         self.doc.openTransaction("DXF Post-processing")
         try:
             block_defs, top_geo, placeholders = self._categorize_objects()
 
+            # The objects are converted one at a time, the progress is reported per object
+            num_objects = (
+                sum(len(children) for children in block_defs.values())
+                + len(top_geo)
+                + len(placeholders)
+            )
+            self.progressbar = Base.ProgressIndicator()
+            self.progressbar.start("Converting DXF objects to Draft objects...", num_objects)
+
             # Process geometry inside block definitions
             for block_def_obj, original_children in block_defs.items():
                 new_draft_children = [
@@ -5063,6 +5100,8 @@ class DxfDraftPostProcessor:
             # Process placeholders like Text and Dimensions
             self._create_from_placeholders(placeholders)
 
+            self._add_layer_children()
+
             # Perform all deletions at once
             self._delete_objects_in_batch()
 
@@ -5074,6 +5113,9 @@ class DxfDraftPostProcessor:
             traceback.print_exc()
             return
         finally:
+            if self.progressbar is not None:
+                self.progressbar.stop()
+                self.progressbar = None
             self.doc.commitTransaction()
 
         self._apply_gui_styles()
@@ -89,6 +89,31 @@ class FemMesh(ComplexGeoData):
         """Add list of volumes by list of node indices and list of nodes per volume."""
         ...
 
+    def addNodes(self, coordinates: Any, ids: Any = None, /) -> None:
+        """
+        Add many nodes at once.
+
+        coordinates: x, y, z of the nodes, a flat sequence of floats, a sequence
+            of (x, y, z) tuples or a contiguous buffer like a numpy array
+        ids: the node IDs, the same kinds of sequences of int are accepted.
+            Without ids the nodes are numbered automatically.
+        """
+        ...
+
+    def addElements(self, element_type: str, nodes: Any, ids: Any = None, /) -> None:
+        """
+        Add many elements of the same type at once.
+
+        element_type: "Seg2", "Seg3", "Tria3", "Tria6", "Quad4", "Quad8", "Tetra4",
+            "Tetra10", "Pyra5", "Pyra13", "Penta6", "Penta15", "Hexa8", "Hexa20"
+        nodes: the node IDs of all elements one after the other, a flat sequence
+            of int, a sequence of tuples of node IDs or a contiguous buffer like a
+            numpy array
+        ids: the element IDs, the same kinds of sequences of int are accepted.
+            Without ids the elements are numbered automatically.
+        """
+        ...
+
     def read(self, file_name: str, /) -> None:
         """
         Read in a various FEM mesh file formats.
@@ -28,11 +28,16 @@
 #include <SMESHDS_Mesh.hxx>
 #include <SMESH_Group.hxx>
 #include <SMESH_Mesh.hxx>
+#include <SMESH_MeshEditor.hxx>
 #include <TopoDS.hxx>
 #include <TopoDS_Face.hxx>
 #include <TopoDS_Shape.hxx>
 #include <algorithm>
+#include <cstdint>
+#include <map>
 #include <stdexcept>
+#include <string>
+#include <vector>
 
 
 #include "Mod/Fem/App/FemMesh.h"
@@ -1118,6 +1123,201 @@ PyObject* FemMeshPy::addVolumeList(PyObject* args)
 }
 
 
+namespace
+{
+
+// element type name --> (SMESH element type, number of nodes), the names are the
+// ones of the mesh data of importToolsFem without the suffix "Elem"
+std::map<std::string, std::pair<SMDSAbs_ElementType, std::size_t>> elementTypePyMap = {
+    {"Seg2", {SMDSAbs_Edge, 2}},
+    {"Seg3", {SMDSAbs_Edge, 3}},
+    {"Tria3", {SMDSAbs_Face, 3}},
+    {"Tria6", {SMDSAbs_Face, 6}},
+    {"Quad4", {SMDSAbs_Face, 4}},
+    {"Quad8", {SMDSAbs_Face, 8}},
+    {"Tetra4", {SMDSAbs_Volume, 4}},
+    {"Tetra10", {SMDSAbs_Volume, 10}},
+    {"Pyra5", {SMDSAbs_Volume, 5}},
+    {"Pyra13", {SMDSAbs_Volume, 13}},
+    {"Penta6", {SMDSAbs_Volume, 6}},
+    {"Penta15", {SMDSAbs_Volume, 15}},
+    {"Hexa8", {SMDSAbs_Volume, 8}},
+    {"Hexa20", {SMDSAbs_Volume, 20}}
+};
+
+template<typename T, typename S>
+void appendBuffer(const Py_buffer& buf, std::vector<T>& values)
+{
+    const S* data = static_cast<const S*>(buf.buf);
+    values.insert(values.end(), data, data + buf.len / sizeof(S));
+}
+
+// Reads the numbers of a contiguous buffer, for example of a numpy array or an
+// array.array. Returns false if obj has no buffer with a supported number format.
+template<typename T>
+bool readBuffer(PyObject* obj, std::vector<T>& values)
+{
+    if (!PyObject_CheckBuffer(obj)) {
+        return false;
+    }
+    Py_buffer buf;
+    if (PyObject_GetBuffer(obj, &buf, PyBUF_FORMAT | PyBUF_C_CONTIGUOUS) < 0) {
+        PyErr_Clear();
+        return false;
+    }
+    std::string format(buf.format ? buf.format : "B");
+    if (!format.empty() && std::string("@=<").find(format[0]) != std::string::npos) {
+        format.erase(0, 1);
+    }
+    bool supported = true;
+    if (format == "d" && buf.itemsize == sizeof(double)) {
+        appendBuffer<T, double>(buf, values);
+    }
+    else if (format == "f" && buf.itemsize == sizeof(float)) {
+        appendBuffer<T, float>(buf, values);
+    }
+    else if ((format == "i" || format == "l" || format == "q") && buf.itemsize == 4) {
+        appendBuffer<T, std::int32_t>(buf, values);
+    }
+    else if ((format == "i" || format == "l" || format == "q") && buf.itemsize == 8) {
+        appendBuffer<T, std::int64_t>(buf, values);
+    }
+    else {
+        supported = false;
+    }
+    PyBuffer_Release(&buf);
+    return supported;
+}
+
+// Reads a flat sequence of numbers or a sequence of sequences of numbers, for example
+// a list of (x, y, z) tuples, into values
+template<typename T>
+void readNumbers(PyObject* obj, std::vector<T>& values)
+{
+    if (readBuffer(obj, values)) {
+        return;
+    }
+    Py::Sequence seq(obj);
+    values.reserve(seq.size());
+    for (Py::Sequence::iterator it = seq.begin(); it != seq.end(); ++it) {
+        Py::Object item(*it);
+        if (PySequence_Check(item.ptr())) {
+            Py::Sequence inner(item);
+            for (Py::Sequence::iterator jt = inner.begin(); jt != inner.end(); ++jt) {
+                values.push_back(static_cast<T>(Py::Float(*jt)));
+            }
+        }
+        else {
+            values.push_back(static_cast<T>(Py::Float(item)));
+        }
+    }
+}
+
+// Reads the optional element or node ids, an empty vector means automatic numbering
+std::vector<int> readIds(PyObject* obj, std::size_t count)
+{
+    std::vector<int> ids;
+    if (obj && obj != Py_None) {
+        readNumbers(obj, ids);
+        if (ids.size() != count) {
+            throw Py::ValueError("The number of ids does not match the number of items");
+        }
+    }
+    return ids;
+}
+
+}  // namespace
+
+PyObject* FemMeshPy::addNodes(PyObject* args)
+{
+    PyObject* coordsObj = nullptr;
+    PyObject* idsObj = nullptr;
+    if (!PyArg_ParseTuple(args, "O|O", &coordsObj, &idsObj)) {
+        return nullptr;
+    }
+
+    try {
+        std::vector<double> coords;
+        readNumbers(coordsObj, coords);
+        if (coords.size() % 3 != 0) {
+            throw Py::ValueError("The number of coordinates is not a multiple of 3");
+        }
+        std::size_t count = coords.size() / 3;
+        std::vector<int> ids = readIds(idsObj, count);
+
+        SMESHDS_Mesh* meshDS = getFemMeshPtr()->getSMesh()->GetMeshDS();
+        for (std::size_t i = 0; i < count; ++i) {
+            const double* xyz = &coords[3 * i];
+            SMDS_MeshNode* node = ids.empty()
+                ? meshDS->AddNode(xyz[0], xyz[1], xyz[2])
+                : meshDS->AddNodeWithID(xyz[0], xyz[1], xyz[2], ids[i]);
+            if (!node) {
+                throw std::runtime_error("Failed to add node");
+            }
+        }
+    }
+    catch (const Py::Exception&) {
+        return nullptr;
+    }
+    catch (const std::exception& e) {
+        PyErr_SetString(Base::PyExc_FC_GeneralError, e.what());
+        return nullptr;
+    }
+    Py_Return;
+}
+
+PyObject* FemMeshPy::addElements(PyObject* args)
+{
+    const char* typeName = nullptr;
+    PyObject* nodesObj = nullptr;
+    PyObject* idsObj = nullptr;
+    if (!PyArg_ParseTuple(args, "sO|O", &typeName, &nodesObj, &idsObj)) {
+        return nullptr;
+    }
+
+    auto itType = elementTypePyMap.find(typeName);
+    if (itType == elementTypePyMap.end()) {
+        PyErr_SetString(PyExc_ValueError, "Unknown element type");
+        return nullptr;
+    }
+    const std::size_t np = itType->second.second;
+
+    try {
+        std::vector<int> nodeIds;
+        readNumbers(nodesObj, nodeIds);
+        if (nodeIds.size() % np != 0) {
+            throw Py::ValueError("The number of nodes does not match the element type");
+        }
+        std::size_t count = nodeIds.size() / np;
+        std::vector<int> ids = readIds(idsObj, count);
+
+        SMESH_MeshEditor editor(getFemMeshPtr()->getSMesh());
+        SMESHDS_Mesh* meshDS = editor.GetMeshDS();
+        SMESH_MeshEditor::ElemFeatures features(itType->second.first);
+        std::vector<const SMDS_MeshNode*> nodes(np);
+        for (std::size_t i = 0; i < count; ++i) {
+            for (std::size_t j = 0; j < np; ++j) {
+                nodes[j] = meshDS->FindNode(nodeIds[i * np + j]);
+                if (!nodes[j]) {
+                    throw std::runtime_error("Failed to get node of the given indices");
+                }
+            }
+            features.SetID(ids.empty() ? -1 : ids[i]);
+            if (!editor.AddElement(nodes, features)) {
+                throw std::runtime_error("Failed to add element");
+            }
+        }
+    }
+    catch (const Py::Exception&) {
+        return nullptr;
+    }
+    catch (const std::exception& e) {
+        PyErr_SetString(Base::PyExc_FC_GeneralError, e.what());
+        return nullptr;
+    }
+    Py_Return;
+}
+
 PyObject* FemMeshPy::copy(PyObject* args) const
 {
     if (!PyArg_ParseTuple(args, "")) {
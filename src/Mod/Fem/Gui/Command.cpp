@@ -2975,7 +2975,14 @@ void CmdFemPostPipelineFromResult::activated(int)
                 FeatName.c_str()
             );
         }
-        // load the contents of the result object to the pipeline
+        // load the contents of the result object to the pipeline,
+        // the node data of a lazy stored result is loaded first
+        doCommand(Doc, "from femresult import resulttools");
+        doCommand(
+            Doc,
+            "resulttools.load_result_data(App.activeDocument().getObject(\"%s\"))",
+            results[0]->getNameInDocument()
+        );
         doCommand(
             Doc,
             "App.activeDocument().ActiveObject.load("
@@ -676,6 +676,11 @@ def makePostVtkResult(doc, result_data, name="VtkResult"):
           needed for a multistep result: [results_list, value_list, unit, description]
     """
 
+    from femresult import resulttools
+
+    # the node data of lazy stored results is loaded on demand
+    for result in result_data[0] if len(result_data) > 1 else result_data:
+        resulttools.load_result_data(result)
     Pipeline_Name = "Pipeline_" + name
     obj = doc.addObject("Fem::FemPostPipeline", Pipeline_Name)
     obj.load(*result_data)
@@ -0,0 +1,13 @@
+# the meshes of the examples are stored in binary mesh files, see feminout.importBinaryMesh
+# the mesh modules load them with load_mesh()
+
+import os
+
+
+def load_mesh(femmesh, module_name, nodes=True, elements=True):
+    """load the nodes and/or the elements of the mesh of a mesh module into femmesh"""
+    from feminout import importBinaryMesh
+
+    mesh_name = module_name.rsplit(".", 1)[-1]
+    mesh_file = os.path.join(os.path.dirname(__file__), mesh_name + ".meshbin")
+    return importBinaryMesh.load(femmesh, mesh_file, nodes, elements)
@@ -1,4363 +1,11 @@
+from . import load_mesh
+
+
 def create_nodes(femmesh):
     # nodes
-    femmesh.addNode(0.0, 0.0, 0.0, 1)
-    femmesh.addNode(0.0, 6000.0, 0.0, 2)
-    femmesh.addNode(8000.0, 0.0, 0.0, 3)
-    femmesh.addNode(8000.0, 6000.0, 0.0, 4)
-    femmesh.addNode(0.0, 300.0, 0.0, 5)
-    femmesh.addNode(0.0, 600.0, 0.0, 6)
-    femmesh.addNode(0.0, 900.0, 0.0, 7)
-    femmesh.addNode(0.0, 1200.0, 0.0, 8)
-    femmesh.addNode(0.0, 1500.0, 0.0, 9)
-    femmesh.addNode(0.0, 1800.0, 0.0, 10)
-    femmesh.addNode(0.0, 2100.0, 0.0, 11)
-    femmesh.addNode(0.0, 2400.0, 0.0, 12)
-    femmesh.addNode(0.0, 2700.0, 0.0, 13)
-    femmesh.addNode(0.0, 3000.0, 0.0, 14)
-    femmesh.addNode(0.0, 3300.0, 0.0, 15)
-    femmesh.addNode(0.0, 3600.0, 0.0, 16)
-    femmesh.addNode(0.0, 3900.0, 0.0, 17)
-    femmesh.addNode(0.0, 4200.0, 0.0, 18)
-    femmesh.addNode(0.0, 4500.0, 0.0, 19)
-    femmesh.addNode(0.0, 4800.0, 0.0, 20)
-    femmesh.addNode(0.0, 5100.0, 0.0, 21)
-    femmesh.addNode(0.0, 5400.0, 0.0, 22)
-    femmesh.addNode(0.0, 5700.0, 0.0, 23)
-    femmesh.addNode(0.0, 150.0, 0.0, 24)
-    femmesh.addNode(0.0, 450.0, 0.0, 25)
-    femmesh.addNode(0.0, 750.0, 0.0, 26)
-    femmesh.addNode(0.0, 1050.0, 0.0, 27)
-    femmesh.addNode(0.0, 1350.0, 0.0, 28)
-    femmesh.addNode(0.0, 1650.0, 0.0, 29)
-    femmesh.addNode(0.0, 1950.0, 0.0, 30)
-    femmesh.addNode(0.0, 2250.0, 0.0, 31)
-    femmesh.addNode(0.0, 2550.0, 0.0, 32)
-    femmesh.addNode(0.0, 2850.0, 0.0, 33)
-    femmesh.addNode(0.0, 3150.0, 0.0, 34)
-    femmesh.addNode(0.0, 3450.0, 0.0, 35)
-    femmesh.addNode(0.0, 3750.0, 0.0, 36)
-    femmesh.addNode(0.0, 4050.0, 0.0, 37)
-    femmesh.addNode(0.0, 4350.0, 0.0, 38)
-    femmesh.addNode(0.0, 4650.0, 0.0, 39)
-    femmesh.addNode(0.0, 4950.0, 0.0, 40)
-    femmesh.addNode(0.0, 5250.0, 0.0, 41)
-    femmesh.addNode(0.0, 5550.0, 0.0, 42)
-    femmesh.addNode(0.0, 5850.0, 0.0, 43)
-    femmesh.addNode(296.29629629629585, 0.0, 0.0, 44)
-    femmesh.addNode(592.5925925925918, 0.0, 0.0, 45)
-    femmesh.addNode(888.8888888888874, 0.0, 0.0, 46)
-    femmesh.addNode(1185.1851851851832, 0.0, 0.0, 47)
-    femmesh.addNode(1481.4814814814792, 0.0, 0.0, 48)
-    femmesh.addNode(1777.7777777777753, 0.0, 0.0, 49)
-    femmesh.addNode(2074.0740740740716, 0.0, 0.0, 50)
-    femmesh.addNode(2370.370370370368, 0.0, 0.0, 51)
-    femmesh.addNode(2666.666666666663, 0.0, 0.0, 52)
-    femmesh.addNode(2962.962962962958, 0.0, 0.0, 53)
-    femmesh.addNode(3259.259259259253, 0.0, 0.0, 54)
-    femmesh.addNode(3555.555555555548, 0.0, 0.0, 55)
-    femmesh.addNode(3851.851851851843, 0.0, 0.0, 56)
-    femmesh.addNode(4148.148148148138, 0.0, 0.0, 57)
-    femmesh.addNode(4444.4444444444325, 0.0, 0.0, 58)
-    femmesh.addNode(4740.740740740728, 0.0, 0.0, 59)
-    femmesh.addNode(5037.037037037026, 0.0, 0.0, 60)
-    femmesh.addNode(5333.333333333322, 0.0, 0.0, 61)
-    femmesh.addNode(5629.6296296296205, 0.0, 0.0, 62)
-    femmesh.addNode(5925.925925925918, 0.0, 0.0, 63)
-    femmesh.addNode(6222.222222222214, 0.0, 0.0, 64)
-    femmesh.addNode(6518.518518518513, 0.0, 0.0, 65)
-    femmesh.addNode(6814.81481481481, 0.0, 0.0, 66)
-    femmesh.addNode(7111.111111111108, 0.0, 0.0, 67)
-    femmesh.addNode(7407.407407407406, 0.0, 0.0, 68)
-    femmesh.addNode(7703.703703703703, 0.0, 0.0, 69)
-    femmesh.addNode(148.14814814814792, 0.0, 0.0, 70)
-    femmesh.addNode(444.44444444444383, 0.0, 0.0, 71)
-    femmesh.addNode(740.7407407407396, 0.0, 0.0, 72)
-    femmesh.addNode(1037.0370370370354, 0.0, 0.0, 73)
-    femmesh.addNode(1333.3333333333312, 0.0, 0.0, 74)
-    femmesh.addNode(1629.6296296296273, 0.0, 0.0, 75)
-    femmesh.addNode(1925.9259259259236, 0.0, 0.0, 76)
-    femmesh.addNode(2222.22222222222, 0.0, 0.0, 77)
-    femmesh.addNode(2518.5185185185155, 0.0, 0.0, 78)
-    femmesh.addNode(2814.8148148148102, 0.0, 0.0, 79)
-    femmesh.addNode(3111.111111111106, 0.0, 0.0, 80)
-    femmesh.addNode(3407.4074074074006, 0.0, 0.0, 81)
-    femmesh.addNode(3703.7037037036953, 0.0, 0.0, 82)
-    femmesh.addNode(3999.9999999999905, 0.0, 0.0, 83)
-    femmesh.addNode(4296.296296296286, 0.0, 0.0, 84)
-    femmesh.addNode(4592.59259259258, 0.0, 0.0, 85)
-    femmesh.addNode(4888.888888888877, 0.0, 0.0, 86)
-    femmesh.addNode(5185.185185185173, 0.0, 0.0, 87)
-    femmesh.addNode(5481.481481481472, 0.0, 0.0, 88)
-    femmesh.addNode(5777.777777777769, 0.0, 0.0, 89)
-    femmesh.addNode(6074.074074074066, 0.0, 0.0, 90)
-    femmesh.addNode(6370.370370370364, 0.0, 0.0, 91)
-    femmesh.addNode(6666.6666666666615, 0.0, 0.0, 92)
-    femmesh.addNode(6962.962962962959, 0.0, 0.0, 93)
-    femmesh.addNode(7259.259259259257, 0.0, 0.0, 94)
-    femmesh.addNode(7555.555555555554, 0.0, 0.0, 95)
-    femmesh.addNode(7851.851851851851, 0.0, 0.0, 96)
-    femmesh.addNode(8000.0, 300.0, 0.0, 97)
-    femmesh.addNode(8000.0, 600.0, 0.0, 98)
-    femmesh.addNode(8000.0, 900.0, 0.0, 99)
-    femmesh.addNode(8000.0, 1200.0, 0.0, 100)
-    femmesh.addNode(8000.0, 1500.0, 0.0, 101)
-    femmesh.addNode(8000.0, 1800.0, 0.0, 102)
-    femmesh.addNode(8000.0, 2100.0, 0.0, 103)
-    femmesh.addNode(8000.0, 2400.0, 0.0, 104)
-    femmesh.addNode(8000.0, 2700.0, 0.0, 105)
-    femmesh.addNode(8000.0, 3000.0, 0.0, 106)
-    femmesh.addNode(8000.0, 3300.0, 0.0, 107)
-    femmesh.addNode(8000.0, 3600.0, 0.0, 108)
-    femmesh.addNode(8000.0, 3900.0, 0.0, 109)
-    femmesh.addNode(8000.0, 4200.0, 0.0, 110)
-    femmesh.addNode(8000.0, 4500.0, 0.0, 111)
-    femmesh.addNode(8000.0, 4800.0, 0.0, 112)
-    femmesh.addNode(8000.0, 5100.0, 0.0, 113)
-    femmesh.addNode(8000.0, 5400.0, 0.0, 114)
-    femmesh.addNode(8000.0, 5700.0, 0.0, 115)
-    femmesh.addNode(8000.0, 150.0, 0.0, 116)
-    femmesh.addNode(8000.0, 450.0, 0.0, 117)
-    femmesh.addNode(8000.0, 750.0, 0.0, 118)
-    femmesh.addNode(8000.0, 1050.0, 0.0, 119)
-    femmesh.addNode(8000.0, 1350.0, 0.0, 120)
-    femmesh.addNode(8000.0, 1650.0, 0.0, 121)
-    femmesh.addNode(8000.0, 1950.0, 0.0, 122)
-    femmesh.addNode(8000.0, 2250.0, 0.0, 123)
-    femmesh.addNode(8000.0, 2550.0, 0.0, 124)
-    femmesh.addNode(8000.0, 2850.0, 0.0, 125)
-    femmesh.addNode(8000.0, 3150.0, 0.0, 126)
-    femmesh.addNode(8000.0, 3450.0, 0.0, 127)
-    femmesh.addNode(8000.0, 3750.0, 0.0, 128)
-    femmesh.addNode(8000.0, 4050.0, 0.0, 129)
-    femmesh.addNode(8000.0, 4350.0, 0.0, 130)
-    femmesh.addNode(8000.0, 4650.0, 0.0, 131)
-    femmesh.addNode(8000.0, 4950.0, 0.0, 132)
-    femmesh.addNode(8000.0, 5250.0, 0.0, 133)
-    femmesh.addNode(8000.0, 5550.0, 0.0, 134)
-    femmesh.addNode(8000.0, 5850.0, 0.0, 135)
-    femmesh.addNode(296.29629629629585, 6000.0, 0.0, 136)
-    femmesh.addNode(592.5925925925918, 6000.0, 0.0, 137)
-    femmesh.addNode(888.8888888888874, 6000.0, 0.0, 138)
-    femmesh.addNode(1185.1851851851832, 6000.0, 0.0, 139)
-    femmesh.addNode(1481.4814814814792, 6000.0, 0.0, 140)
-    femmesh.addNode(1777.7777777777753, 6000.0, 0.0, 141)
-    femmesh.addNode(2074.0740740740716, 6000.0, 0.0, 142)
-    femmesh.addNode(2370.370370370368, 6000.0, 0.0, 143)
-    femmesh.addNode(2666.666666666663, 6000.0, 0.0, 144)
-    femmesh.addNode(2962.962962962958, 6000.0, 0.0, 145)
-    femmesh.addNode(3259.259259259253, 6000.0, 0.0, 146)
-    femmesh.addNode(3555.555555555548, 6000.0, 0.0, 147)
-    femmesh.addNode(3851.851851851843, 6000.0, 0.0, 148)
-    femmesh.addNode(4148.148148148138, 6000.0, 0.0, 149)
-    femmesh.addNode(4444.4444444444325, 6000.0, 0.0, 150)
-    femmesh.addNode(4740.740740740728, 6000.0, 0.0, 151)
-    femmesh.addNode(5037.037037037026, 6000.0, 0.0, 152)
-    femmesh.addNode(5333.333333333322, 6000.0, 0.0, 153)
-    femmesh.addNode(5629.6296296296205, 6000.0, 0.0, 154)
-    femmesh.addNode(5925.925925925918, 6000.0, 0.0, 155)
-    femmesh.addNode(6222.222222222214, 6000.0, 0.0, 156)
-    femmesh.addNode(6518.518518518513, 6000.0, 0.0, 157)
-    femmesh.addNode(6814.81481481481, 6000.0, 0.0, 158)
-    femmesh.addNode(7111.111111111108, 6000.0, 0.0, 159)
-    femmesh.addNode(7407.407407407406, 6000.0, 0.0, 160)
-    femmesh.addNode(7703.703703703703, 6000.0, 0.0, 161)
-    femmesh.addNode(148.14814814814792, 6000.0, 0.0, 162)
-    femmesh.addNode(444.44444444444383, 6000.0, 0.0, 163)
-    femmesh.addNode(740.7407407407396, 6000.0, 0.0, 164)
-    femmesh.addNode(1037.0370370370354, 6000.0, 0.0, 165)
-    femmesh.addNode(1333.3333333333312, 6000.0, 0.0, 166)
-    femmesh.addNode(1629.6296296296273, 6000.0, 0.0, 167)
-    femmesh.addNode(1925.9259259259236, 6000.0, 0.0, 168)
-    femmesh.addNode(2222.22222222222, 6000.0, 0.0, 169)
-    femmesh.addNode(2518.5185185185155, 6000.0, 0.0, 170)
-    femmesh.addNode(2814.8148148148102, 6000.0, 0.0, 171)
-    femmesh.addNode(3111.111111111106, 6000.0, 0.0, 172)
-    femmesh.addNode(3407.4074074074006, 6000.0, 0.0, 173)
-    femmesh.addNode(3703.7037037036953, 6000.0, 0.0, 174)
-    femmesh.addNode(3999.9999999999905, 6000.0, 0.0, 175)
-    femmesh.addNode(4296.296296296286, 6000.0, 0.0, 176)
-    femmesh.addNode(4592.59259259258, 6000.0, 0.0, 177)
-    femmesh.addNode(4888.888888888877, 6000.0, 0.0, 178)
-    femmesh.addNode(5185.185185185173, 6000.0, 0.0, 179)
-    femmesh.addNode(5481.481481481472, 6000.0, 0.0, 180)
-    femmesh.addNode(5777.777777777769, 6000.0, 0.0, 181)
-    femmesh.addNode(6074.074074074066, 6000.0, 0.0, 182)
-    femmesh.addNode(6370.370370370364, 6000.0, 0.0, 183)
-    femmesh.addNode(6666.6666666666615, 6000.0, 0.0, 184)
-    femmesh.addNode(6962.962962962959, 6000.0, 0.0, 185)
-    femmesh.addNode(7259.259259259257, 6000.0, 0.0, 186)
-    femmesh.addNode(7555.555555555554, 6000.0, 0.0, 187)
-    femmesh.addNode(7851.851851851851, 6000.0, 0.0, 188)
-    femmesh.addNode(3397.675066189013, 2995.934030581119, 0.0, 189)
-    femmesh.addNode(5657.1164021163995, 3656.594160297862, 0.0, 190)
-    femmesh.addNode(4950.416162456272, 1895.5621403740552, 0.0, 191)
-    femmesh.addNode(1893.6104054596278, 4113.981242140242, 0.0, 192)
-    femmesh.addNode(1872.4714864952516, 1842.7996085860893, 0.0, 193)
-    femmesh.addNode(4185.972932127833, 4396.738427421472, 0.0, 194)
-    femmesh.addNode(6447.307132798734, 2329.735043709901, 0.0, 195)
-    femmesh.addNode(3402.516938748461, 1517.956170752087, 0.0, 196)
-    femmesh.addNode(6629.034405789423, 4643.278384787789, 0.0, 197)
-    femmesh.addNode(3033.3166107475263, 4655.661389078079, 0.0, 198)
-    femmesh.addNode(1287.3985866605758, 2987.824421819152, 0.0, 199)
-    femmesh.addNode(5955.974285979601, 1196.7804284982203, 0.0, 200)
-    femmesh.addNode(4608.739785878135, 3045.546187687468, 0.0, 201)
-    femmesh.addNode(5340.334238522032, 4806.896193286155, 0.0, 202)
-    femmesh.addNode(6811.315625530508, 3387.1905777588804, 0.0, 203)
-    femmesh.addNode(1101.9837017424315, 4896.897669975468, 0.0, 204)
-    femmesh.addNode(1101.9837017424318, 1103.1023300245324, 0.0, 205)
-    femmesh.addNode(2400.271622137972, 2857.386398815501, 0.0, 206)
-    femmesh.addNode(4284.361837816873, 1031.6656017058608, 0.0, 207)
-    femmesh.addNode(2478.7599581374348, 1032.410098352988, 0.0, 208)
-    femmesh.addNode(6957.046136624422, 1033.6408541603678, 0.0, 209)
-    femmesh.addNode(4036.751618466364, 2276.157754556386, 0.0, 210)
-    femmesh.addNode(2813.7600959689394, 3763.3398184475423, 0.0, 211)
-    femmesh.addNode(5526.041899263087, 2675.1490601747937, 0.0, 212)
-    femmesh.addNode(2087.3567941456886, 5051.849438915983, 0.0, 213)
-    femmesh.addNode(922.4074414497819, 2101.1567771400555, 0.0, 214)
-    femmesh.addNode(974.0422185325958, 3912.8247971981245, 0.0, 215)
-    femmesh.addNode(2743.586624399766, 2071.4546368160372, 0.0, 216)
-    femmesh.addNode(3765.2432557370757, 5152.552577516728, 0.0, 217)
-    femmesh.addNode(5179.825211944617, 842.7358197532764, 0.0, 218)
-    femmesh.addNode(7161.146696923641, 1860.8838419302124, 0.0, 219)
-    femmesh.addNode(3650.614686079948, 3793.899049835917, 0.0, 220)
-    femmesh.addNode(4622.163182662431, 5198.554136222392, 0.0, 221)
-    femmesh.addNode(4849.157741854054, 3859.795231713585, 0.0, 222)
-    femmesh.addNode(7183.217668730613, 2689.168961044971, 0.0, 223)
-    femmesh.addNode(6016.951150744347, 5178.092072492946, 0.0, 224)
-    femmesh.addNode(7180.890501881602, 5191.352542912435, 0.0, 225)
-    femmesh.addNode(7237.323529050707, 4159.19359802075, 0.0, 226)
-    femmesh.addNode(3606.4227449015343, 787.3721600011913, 0.0, 227)
-    femmesh.addNode(5713.982860463556, 1938.8090157441297, 0.0, 228)
-    femmesh.addNode(1756.7081232879061, 784.9829985050347, 0.0, 229)
-    femmesh.addNode(5928.931994200185, 4306.400483322682, 0.0, 230)
-    femmesh.addNode(6157.2654571960275, 3100.1994077631202, 0.0, 231)
-    femmesh.addNode(1851.6605441211916, 3411.1415779437475, 0.0, 232)
-    femmesh.addNode(6490.357652058749, 1651.7558837325553, 0.0, 233)
-    femmesh.addNode(6361.0453067015915, 691.7471420781542, 0.0, 234)
-    femmesh.addNode(3387.3446151833773, 2292.28606491495, 0.0, 235)
-    femmesh.addNode(2725.6609598761743, 5286.145622664251, 0.0, 236)
-    femmesh.addNode(657.1616804008489, 2682.4095085782874, 0.0, 237)
-    femmesh.addNode(1769.0646642165354, 2531.7018154860525, 0.0, 238)
-    femmesh.addNode(4241.048725984901, 3562.2042509829134, 0.0, 239)
-    femmesh.addNode(6447.836877657186, 4060.838068266804, 0.0, 240)
-    femmesh.addNode(2997.2658727270814, 645.8394329708688, 0.0, 241)
-    femmesh.addNode(3569.404821855382, 4426.604571366504, 0.0, 242)
-    femmesh.addNode(717.2819816319766, 631.4118928754859, 0.0, 243)
-    femmesh.addNode(683.9644443642508, 5338.739943732482, 0.0, 244)
-    femmesh.addNode(4040.8704915388403, 1605.40586038152, 0.0, 245)
-    femmesh.addNode(2480.2860811929954, 4327.634132798396, 0.0, 246)
-    femmesh.addNode(1550.8369065130175, 5323.670460339219, 0.0, 247)
-    femmesh.addNode(638.2111157671299, 4456.2851347090345, 0.0, 248)
-    femmesh.addNode(645.0144875487056, 1529.3931506962488, 0.0, 249)
-    femmesh.addNode(606.0899831585815, 3274.4917946223304, 0.0, 250)
-    femmesh.addNode(5746.248746872634, 602.7107460703565, 0.0, 251)
-    femmesh.addNode(4024.1819322631945, 2882.217777079039, 0.0, 252)
-    femmesh.addNode(4934.4309702782775, 2519.1809619784544, 0.0, 253)
-    femmesh.addNode(5214.473879473443, 3217.022143244332, 0.0, 254)
-    femmesh.addNode(5344.474372306417, 1433.0227093810447, 0.0, 255)
-    femmesh.addNode(5185.185185185174, 5402.558251627225, 0.0, 256)
-    femmesh.addNode(4838.704000595254, 4432.085273325963, 0.0, 257)
-    femmesh.addNode(6591.41004163284, 5367.3326714702025, 0.0, 258)
-    femmesh.addNode(7411.25451639115, 596.1961450493792, 0.0, 259)
-    femmesh.addNode(5392.529206098521, 4254.269772712942, 0.0, 260)
-    femmesh.addNode(7432.413552786258, 3248.9659932976074, 0.0, 261)
-    femmesh.addNode(1619.6939316495213, 1300.3719347779015, 0.0, 262)
-    femmesh.addNode(2835.3175846871354, 3148.619933239689, 0.0, 263)
-    femmesh.addNode(1646.535354557444, 4659.675491871235, 0.0, 264)
-    femmesh.addNode(2825.114231337695, 1500.5142187870686, 0.0, 265)
-    femmesh.addNode(7431.546705667136, 4661.610494463315, 0.0, 266)
-    femmesh.addNode(3263.769879015891, 5439.490826087185, 0.0, 267)
-    femmesh.addNode(4684.368677470502, 606.1672674234318, 0.0, 268)
-    femmesh.addNode(7445.043104270031, 1338.3109649162725, 0.0, 269)
-    femmesh.addNode(1266.6159128197107, 529.0026539507099, 0.0, 270)
-    femmesh.addNode(2894.3063699430318, 2599.204848452612, 0.0, 271)
-    femmesh.addNode(4775.466605021726, 1425.2175854203888, 0.0, 272)
-    femmesh.addNode(6649.093544781434, 2830.957997230098, 0.0, 273)
-    femmesh.addNode(2255.730762865147, 2320.1476915303238, 0.0, 274)
-    femmesh.addNode(4128.998776673298, 508.32959442572815, 0.0, 275)
-    femmesh.addNode(2268.3197941928315, 532.6087740901199, 0.0, 276)
-    femmesh.addNode(1494.5084166412269, 3795.1972419759486, 0.0, 277)
-    femmesh.addNode(2270.2438945572353, 1541.2905631898257, 0.0, 278)
-    femmesh.addNode(3102.2598007284423, 4208.58580621284, 0.0, 279)
-    femmesh.addNode(2272.4869687423907, 3775.809362934254, 0.0, 280)
-    femmesh.addNode(1249.1086797286632, 1616.2422721486678, 0.0, 281)
-    femmesh.addNode(1194.5487003459718, 4404.719080046412, 0.0, 282)
-    femmesh.addNode(7481.424544110604, 2279.598230715955, 0.0, 283)
-    femmesh.addNode(4221.873252660906, 5485.354618892098, 0.0, 284)
-    femmesh.addNode(6837.50177198781, 500.8695378626019, 0.0, 285)
-    femmesh.addNode(4435.206690695379, 1952.623231449892, 0.0, 286)
-    femmesh.addNode(4435.863231127135, 2541.7665395151253, 0.0, 287)
-    femmesh.addNode(3222.60025912073, 3430.8441977764146, 0.0, 288)
-    femmesh.addNode(3794.309440521653, 3323.2397059701725, 0.0, 289)
-    femmesh.addNode(5935.35863180151, 2368.6014943950568, 0.0, 290)
-    femmesh.addNode(6159.350257910878, 3605.0654382216726, 0.0, 291)
-    femmesh.addNode(1453.3196818484107, 2142.5323902878413, 0.0, 292)
-    femmesh.addNode(3658.41793414081, 1925.187396680512, 0.0, 293)
-    femmesh.addNode(2222.222222222219, 5526.419323570788, 0.0, 294)
-    femmesh.addNode(4203.249322996915, 4911.825239320628, 0.0, 295)
-    femmesh.addNode(477.56674021983457, 2245.739760834411, 0.0, 296)
-    femmesh.addNode(5679.630489410519, 5513.93397676138, 0.0, 297)
-    femmesh.addNode(7534.407410028579, 3738.5928525453073, 0.0, 298)
-    femmesh.addNode(5302.105821445276, 2238.951353101928, 0.0, 299)
-    femmesh.addNode(455.60537461227864, 4015.3740286760267, 0.0, 300)
-    femmesh.addNode(2521.8661694161806, 4807.703973058636, 0.0, 301)
-    femmesh.addNode(6500.5780450773245, 1143.7331668716852, 0.0, 302)
-    femmesh.addNode(3113.505831612044, 1113.9279912480858, 0.0, 303)
-    femmesh.addNode(6938.8514360835, 2309.129525240316, 0.0, 304)
-    femmesh.addNode(1172.437325575929, 2529.0884365994834, 0.0, 305)
-    femmesh.addNode(1095.0464929086543, 5519.79915794031, 0.0, 306)
-    femmesh.addNode(7540.017932967519, 5538.335041248212, 0.0, 307)
-    femmesh.addNode(481.7853096084257, 1103.6339161833605, 0.0, 308)
-    femmesh.addNode(482.2266217807585, 4893.646426325952, 0.0, 309)
-    femmesh.addNode(1178.9305753167218, 3455.084853708434, 0.0, 310)
-    femmesh.addNode(5656.077683368319, 3143.1241199906663, 0.0, 311)
-    femmesh.addNode(3768.0099646627423, 1201.4317309018002, 0.0, 312)
-    femmesh.addNode(3176.975472281174, 1904.2763839869097, 0.0, 313)
-    femmesh.addNode(5803.882652287688, 4783.805453238971, 0.0, 314)
-    femmesh.addNode(2114.1878090878636, 4571.661957778536, 0.0, 315)
-    femmesh.addNode(6180.499666359125, 1976.8703310582544, 0.0, 316)
-    femmesh.addNode(2404.7221638079945, 3311.809044588913, 0.0, 317)
-    femmesh.addNode(3703.189057704747, 5588.803232125313, 0.0, 318)
-    femmesh.addNode(2035.7445392001036, 1119.4562251458779, 0.0, 319)
-    femmesh.addNode(6926.1946899518225, 1474.0564103457014, 0.0, 320)
-    femmesh.addNode(4029.5338651416737, 3996.367012511001, 0.0, 321)
-    femmesh.addNode(1893.8877094741165, 2966.2822019009022, 0.0, 322)
-    femmesh.addNode(3428.3194594898437, 4880.707091435496, 0.0, 323)
-    femmesh.addNode(5354.509432766604, 439.2063291726035, 0.0, 324)
-    femmesh.addNode(7583.649470251285, 2862.166033957777, 0.0, 325)
-    femmesh.addNode(3367.759405746351, 420.0748062916648, 0.0, 326)
-    femmesh.addNode(4786.929259037574, 5570.325435420024, 0.0, 327)
-    femmesh.addNode(4954.97425049191, 4917.102596761554, 0.0, 328)
-    femmesh.addNode(6238.340888026186, 4809.087427725724, 0.0, 329)
-    femmesh.addNode(7024.433674904425, 4804.772199991581, 0.0, 330)
-    femmesh.addNode(4478.581235074521, 4069.9117306609655, 0.0, 331)
-    femmesh.addNode(5569.431810033599, 993.7579210576936, 0.0, 332)
-    femmesh.addNode(4802.148254473836, 3435.796687607469, 0.0, 333)
-    femmesh.addNode(5228.302516957269, 3645.750156453162, 0.0, 334)
-    femmesh.addNode(3657.8148639814453, 2643.520783890189, 0.0, 335)
-    femmesh.addNode(7019.076693738983, 5576.332053786248, 0.0, 336)
-    femmesh.addNode(7573.6082130647155, 1763.2539353761488, 0.0, 337)
-    femmesh.addNode(6240.677755204676, 5576.951209655838, 0.0, 338)
-    femmesh.addNode(6860.343772307708, 4301.31606715292, 0.0, 339)
-    femmesh.addNode(6243.91143599323, 2687.122440338326, 0.0, 340)
-    femmesh.addNode(7634.874461019663, 5055.900701239916, 0.0, 341)
-    femmesh.addNode(2658.8071340610913, 395.0225543628404, 0.0, 342)
-    femmesh.addNode(7549.03268297424, 934.7115216601442, 0.0, 343)
-    femmesh.addNode(6902.215957905839, 3845.0291642762386, 0.0, 344)
-    femmesh.addNode(7025.59003468577, 3082.21047851184, 0.0, 345)
-    femmesh.addNode(7584.06159843794, 4253.165203468226, 0.0, 346)
-    femmesh.addNode(1569.839297525874, 303.8313638308509, 0.0, 347)
-    femmesh.addNode(4469.621538372686, 1512.7283176410292, 0.0, 348)
-    femmesh.addNode(6095.902011993467, 377.2371543174669, 0.0, 349)
-    femmesh.addNode(2403.6969246794406, 1872.7602557566709, 0.0, 350)
-    femmesh.addNode(5948.375649812166, 3996.9838710873087, 0.0, 351)
-    femmesh.addNode(4781.183338415543, 941.2715323463972, 0.0, 352)
-    femmesh.addNode(407.1231268370476, 3024.859353790048, 0.0, 353)
-    femmesh.addNode(5896.032305517452, 1607.6587417561202, 0.0, 354)
-    femmesh.addNode(3800.7427921477174, 376.73372396162324, 0.0, 355)
-    femmesh.addNode(4245.013758272589, 3192.4890176916206, 0.0, 356)
-    femmesh.addNode(6350.501198385864, 4314.729623053648, 0.0, 357)
-    femmesh.addNode(5528.242804228755, 5074.10907722706, 0.0, 358)
-    femmesh.addNode(393.49683907692514, 1857.1094669769416, 0.0, 359)
-    femmesh.addNode(3837.3847068674945, 4725.522234842084, 0.0, 360)
-    femmesh.addNode(6650.048741944859, 1920.4048544080372, 0.0, 361)
-    femmesh.addNode(5336.467319484916, 1825.0684300956189, 0.0, 362)
-    femmesh.addNode(1837.5229945063875, 5643.078707336442, 0.0, 363)
-    femmesh.addNode(4945.651206791982, 2881.6961694004817, 0.0, 364)
-    femmesh.addNode(6696.11805675985, 5078.574081412251, 0.0, 365)
-    femmesh.addNode(3008.441213646821, 5119.911067458521, 0.0, 366)
-    femmesh.addNode(884.1306548849702, 3053.8376993440547, 0.0, 367)
-    femmesh.addNode(4562.386541644964, 4741.481920990653, 0.0, 368)
-    femmesh.addNode(4651.092496390126, 2254.2313235399834, 0.0, 369)
-    femmesh.addNode(1472.4365299676333, 3340.810088616796, 0.0, 370)
-    femmesh.addNode(1471.8549770258608, 1000.9516164765802, 0.0, 371)
-    femmesh.addNode(5599.34672594549, 4548.619957372794, 0.0, 372)
-    femmesh.addNode(6448.819526273548, 3351.4327801206664, 0.0, 373)
-    femmesh.addNode(3256.7405344520134, 3859.598342226095, 0.0, 374)
-    femmesh.addNode(392.86172127684944, 355.64193876170407, 0.0, 375)
-    femmesh.addNode(375.15126669697383, 5625.79938908758, 0.0, 376)
-    femmesh.addNode(1442.1012987574402, 4141.322487978434, 0.0, 377)
-    femmesh.addNode(2957.7309948022894, 5628.918535121977, 0.0, 378)
-    femmesh.addNode(4009.445808752669, 900.9777206491683, 0.0, 379)
-    femmesh.addNode(7197.327269328491, 3572.6995068346623, 0.0, 380)
-    femmesh.addNode(894.6059541322886, 358.7338188301992, 0.0, 381)
-    femmesh.addNode(430.6916645551602, 3560.1693795597657, 0.0, 382)
-    femmesh.addNode(1711.5670273114922, 5008.297488116714, 0.0, 383)
-    femmesh.addNode(5895.74601206341, 2805.958293007776, 0.0, 384)
-    femmesh.addNode(6100.17962473483, 882.1151603930263, 0.0, 385)
-    femmesh.addNode(4995.051996249644, 426.75811586475294, 0.0, 386)
-    femmesh.addNode(1564.262259208933, 1699.0540211769903, 0.0, 387)
-    femmesh.addNode(3193.136252750478, 2737.80932266654, 0.0, 388)
-    femmesh.addNode(2539.8199062579647, 2547.1529707588747, 0.0, 389)
-    femmesh.addNode(6550.698578808808, 348.8627944392093, 0.0, 390)
-    femmesh.addNode(1817.283909345593, 3770.740176561226, 0.0, 391)
-    femmesh.addNode(2555.966991266524, 5658.54834676069, 0.0, 392)
-    femmesh.addNode(7090.020341851579, 4365.621854931105, 0.0, 393)
-    femmesh.addNode(336.3574764539135, 2575.450172238827, 0.0, 394)
-    femmesh.addNode(5186.238809766994, 4487.186813822886, 0.0, 395)
-    femmesh.addNode(7648.548186063908, 350.7937439880927, 0.0, 396)
-    femmesh.addNode(3461.5562949275245, 1069.2217280332845, 0.0, 397)
-    femmesh.addNode(1997.485473037803, 1563.2079501336295, 0.0, 398)
-    femmesh.addNode(1992.4129851047553, 342.158041424327, 0.0, 399)
-    femmesh.addNode(971.1205318554096, 776.876012694342, 0.0, 400)
-    femmesh.addNode(2975.6516658450573, 2285.1446050674276, 0.0, 401)
-    femmesh.addNode(5025.513618133736, 4181.708582771429, 0.0, 402)
-    femmesh.addNode(5151.743808818835, 1146.1563419902773, 0.0, 403)
-    femmesh.addNode(2548.898661746062, 4003.292929161928, 0.0, 404)
-    femmesh.addNode(2836.6926337823834, 4418.8050771149265, 0.0, 405)
-    femmesh.addNode(1920.5400397275678, 2218.9470149814993, 0.0, 406)
-    femmesh.addNode(2813.2330483403935, 940.0172732983631, 0.0, 407)
-    femmesh.addNode(6263.116396852106, 1381.025081358192, 0.0, 408)
-    femmesh.addNode(4431.5335477157805, 387.14720536155346, 0.0, 409)
-    femmesh.addNode(1580.0475343627381, 2838.3953290897625, 0.0, 410)
-    femmesh.addNode(6676.235021893778, 842.8275912399433, 0.0, 411)
-    femmesh.addNode(707.9748958240762, 5682.972567815318, 0.0, 412)
-    femmesh.addNode(3733.71870076103, 4107.870463918293, 0.0, 413)
-    femmesh.addNode(229.60103168917135, 756.8154402733644, 0.0, 414)
-    femmesh.addNode(228.0033973830223, 5242.459925168885, 0.0, 415)
-    femmesh.addNode(7145.901703750549, 366.6169532222625, 0.0, 416)
-    femmesh.addNode(2089.740237344564, 2622.54767610804, 0.0, 417)
-    femmesh.addNode(956.5211885818039, 5227.599518081492, 0.0, 418)
-    femmesh.addNode(4455.838457668975, 5657.750829458527, 0.0, 419)
-    femmesh.addNode(810.4576724031075, 1221.4131645302532, 0.0, 420)
-    femmesh.addNode(800.4168705293669, 4768.602180867976, 0.0, 421)
-    femmesh.addNode(327.64594779543205, 4306.874959379801, 0.0, 422)
-    femmesh.addNode(2424.140768923782, 5128.309569458421, 0.0, 423)
-    femmesh.addNode(1371.9487665668998, 5663.517383947134, 0.0, 424)
-    femmesh.addNode(324.65023660724717, 1392.3454233802788, 0.0, 425)
-    femmesh.addNode(6448.10060698228, 5132.244259251715, 0.0, 426)
-    femmesh.addNode(3665.660531632448, 2283.744291028161, 0.0, 427)
-    femmesh.addNode(2687.556746104989, 2861.467062185074, 0.0, 428)
-    femmesh.addNode(6587.483319713963, 3683.957244081274, 0.0, 429)
-    femmesh.addNode(5892.420190147987, 3374.2837938799858, 0.0, 430)
-    femmesh.addNode(2230.4151123596644, 4122.5127535582005, 0.0, 431)
-    femmesh.addNode(7680.876160864512, 2585.1649045001727, 0.0, 432)
-    femmesh.addNode(893.6016602732036, 1773.9528382411743, 0.0, 433)
-    femmesh.addNode(4584.014275220912, 3642.1518833407285, 0.0, 434)
-    femmesh.addNode(881.7373010169938, 4243.37390096147, 0.0, 435)
-    femmesh.addNode(7699.657480336969, 3467.671338869537, 0.0, 436)
-    femmesh.addNode(852.0663634056174, 2421.419154449371, 0.0, 437)
-    femmesh.addNode(4113.615129922027, 1289.4104734229475, 0.0, 438)
-    femmesh.addNode(3262.4424934747362, 4504.062929891488, 0.0, 439)
-    femmesh.addNode(5050.927585973604, 1584.1480393129732, 0.0, 440)
-    femmesh.addNode(3917.733719156471, 3621.6969973860146, 0.0, 441)
-    femmesh.addNode(1383.4039454847152, 5079.02150318774, 0.0, 442)
-    femmesh.addNode(3317.3662212002037, 774.4172335199089, 0.0, 443)
-    femmesh.addNode(5434.926525016685, 5674.7073384339465, 0.0, 444)
-    femmesh.addNode(3052.1910643655883, 319.0914604585107, 0.0, 445)
-    femmesh.addNode(717.6300240610055, 3664.156515438797, 0.0, 446)
-    femmesh.addNode(5587.988128890475, 2362.0924844129895, 0.0, 447)
-    femmesh.addNode(5689.034938019035, 1412.6161576564828, 0.0, 448)
-    femmesh.addNode(4115.567226082192, 1935.4399814346266, 0.0, 449)
-    femmesh.addNode(3089.4436960444414, 3015.8059012370027, 0.0, 450)
-    femmesh.addNode(3698.3683458223036, 1617.2321178200973, 0.0, 451)
-    femmesh.addNode(2502.1369544602003, 748.8123829910405, 0.0, 452)
-    femmesh.addNode(4922.2452503380755, 5211.4954417112995, 0.0, 453)
-    femmesh.addNode(2691.8483469669936, 3429.4788468746488, 0.0, 454)
-    femmesh.addNode(5685.819187696872, 4129.6507590219635, 0.0, 455)
-    femmesh.addNode(5822.554885478489, 306.5856549170968, 0.0, 456)
-    femmesh.addNode(7216.115596016455, 916.1361542746558, 0.0, 457)
-    femmesh.addNode(5217.3150338915375, 2702.2844991908223, 0.0, 458)
-    femmesh.addNode(3859.6204530607442, 4456.558606204545, 0.0, 459)
-    femmesh.addNode(6704.385602542148, 2515.634826215184, 0.0, 460)
-    femmesh.addNode(2672.6263318282963, 1765.1713241838895, 0.0, 461)
-    femmesh.addNode(4349.282176041125, 2843.4643472435573, 0.0, 462)
-    femmesh.addNode(297.8202976980327, 4630.770403569758, 0.0, 463)
-    femmesh.addNode(4120.395380973169, 2592.3235710140902, 0.0, 464)
-    femmesh.addNode(3451.7958869359236, 5717.139812959343, 0.0, 465)
-    femmesh.addNode(2218.2128307108846, 866.6565808601297, 0.0, 466)
-    femmesh.addNode(1879.800308930349, 5316.652962324044, 0.0, 467)
-    femmesh.addNode(3709.310532254126, 2968.601960842235, 0.0, 468)
-    femmesh.addNode(4743.776177906142, 1689.1917263705027, 0.0, 469)
-    femmesh.addNode(4394.639457933925, 723.988332836765, 0.0, 470)
-    femmesh.addNode(4699.038258206253, 2744.4658764707215, 0.0, 471)
-    femmesh.addNode(5937.460290603522, 5679.968274980756, 0.0, 472)
-    femmesh.addNode(1339.0324241513529, 1305.8487643076937, 0.0, 473)
-    femmesh.addNode(1336.431241509912, 4652.000840803289, 0.0, 474)
-    femmesh.addNode(6661.097094512917, 5718.050012997552, 0.0, 475)
-    femmesh.addNode(2547.0274326814665, 1344.085721719676, 0.0, 476)
-    femmesh.addNode(5448.932300429864, 3404.4103026806215, 0.0, 477)
-    femmesh.addNode(4513.582743502173, 4338.697098684659, 0.0, 478)
-    femmesh.addNode(6709.73178466819, 3102.4978256473055, 0.0, 479)
-    femmesh.addNode(4988.469116267259, 2197.8663096630016, 0.0, 480)
-    femmesh.addNode(3418.55180209943, 4146.383187281093, 0.0, 481)
-    femmesh.addNode(2101.828981491012, 3192.8293730652504, 0.0, 482)
-    femmesh.addNode(5435.641017808661, 2943.286147410158, 0.0, 483)
-    femmesh.addNode(3441.520417883232, 5142.192781204675, 0.0, 484)
-    femmesh.addNode(312.84027258935737, 3309.6956057010893, 0.0, 485)
-    femmesh.addNode(4073.705568853905, 5182.175314071145, 0.0, 486)
-    femmesh.addNode(5210.5884757921585, 5091.138447121744, 0.0, 487)
-    femmesh.addNode(5457.949657229582, 3873.653051222626, 0.0, 488)
-    femmesh.addNode(5070.700005727941, 5692.775772146069, 0.0, 489)
-    femmesh.addNode(2834.195678482428, 4093.3002651651827, 0.0, 490)
-    femmesh.addNode(4343.835626129535, 2223.7145272434877, 0.0, 491)
-    femmesh.addNode(3157.5252273551405, 1641.7187855472714, 0.0, 492)
-    femmesh.addNode(7739.687107200998, 4029.0189475851225, 0.0, 493)
-    femmesh.addNode(1193.9820984945802, 1964.372301363749, 0.0, 494)
-    femmesh.addNode(7726.2735900286625, 687.5326027625042, 0.0, 495)
-    femmesh.addNode(6934.996323144335, 5322.1498244889735, 0.0, 496)
-    femmesh.addNode(3965.492306109945, 5719.508456470199, 0.0, 497)
-    femmesh.addNode(1833.531211265304, 4452.57587935261, 0.0, 498)
-    femmesh.addNode(7255.955382892531, 5739.957018893448, 0.0, 499)
-    femmesh.addNode(4544.442112474293, 3339.8755158051863, 0.0, 500)
-    femmesh.addNode(3509.0173831860507, 3288.0629411238574, 0.0, 501)
-    femmesh.addNode(1333.333333333331, 266.6921674423133, 0.0, 502)
-    femmesh.addNode(1246.455792552338, 3943.1168160681245, 0.0, 503)
-    femmesh.addNode(7671.82243665608, 2045.08978978048, 0.0, 504)
-    femmesh.addNode(664.0054257521647, 2002.0003762572062, 0.0, 505)
-    femmesh.addNode(2725.080338578547, 4990.947615037001, 0.0, 506)
-    femmesh.addNode(1452.921675895289, 2477.833873082014, 0.0, 507)
-    femmesh.addNode(7152.573814365585, 1264.814182573502, 0.0, 508)
-    femmesh.addNode(5468.0739198056435, 720.8423450484322, 0.0, 509)
-    femmesh.addNode(7725.392372819453, 3131.7530697448874, 0.0, 510)
-    femmesh.addNode(7205.080473574019, 2153.0752992404005, 0.0, 511)
-    femmesh.addNode(7738.506645821522, 4647.832318697929, 0.0, 512)
-    femmesh.addNode(967.7867487459522, 2749.220623124383, 0.0, 513)
-    femmesh.addNode(6939.3590862421825, 1738.8584485341664, 0.0, 514)
-    femmesh.addNode(6178.773825732844, 4159.694920788544, 0.0, 515)
-    femmesh.addNode(7303.794820638505, 2970.0961289267307, 0.0, 516)
-    femmesh.addNode(7226.520629430566, 1562.4250294684975, 0.0, 517)
-    femmesh.addNode(7741.820450739236, 1350.0, 0.0, 518)
-    femmesh.addNode(722.7259334596312, 931.9750850103734, 0.0, 519)
-    femmesh.addNode(1929.5639363908322, 4786.057610646385, 0.0, 520)
-    femmesh.addNode(4030.9218236587863, 268.0181913625381, 0.0, 521)
-    femmesh.addNode(940.9452676929355, 1493.047796935849, 0.0, 522)
-    femmesh.addNode(923.8259286131885, 4509.587879703922, 0.0, 523)
-    femmesh.addNode(4972.926175193251, 735.0482181329983, 0.0, 524)
-    femmesh.addNode(7314.152871169299, 4942.321760659757, 0.0, 525)
-    femmesh.addNode(7730.628307770583, 5312.084618080309, 0.0, 526)
-    femmesh.addNode(6243.042679488634, 1104.8267878014224, 0.0, 527)
-    femmesh.addNode(2166.34800818854, 3486.033443101096, 0.0, 528)
-    femmesh.addNode(1791.182019072847, 1065.6994832561645, 0.0, 529)
-    femmesh.addNode(4693.71601286955, 283.2512769942201, 0.0, 530)
-    femmesh.addNode(5585.704144994118, 1681.203136378545, 0.0, 531)
-    femmesh.addNode(710.161986014143, 5065.236506469547, 0.0, 532)
-    femmesh.addNode(4580.758362874801, 1179.728519598056, 0.0, 533)
-    femmesh.addNode(1491.5272685921811, 709.500652737893, 0.0, 534)
-    femmesh.addNode(624.6271074576289, 298.27695501945294, 0.0, 535)
-    femmesh.addNode(2967.06909414469, 3537.0088950923446, 0.0, 536)
-    femmesh.addNode(2405.7328284113396, 282.856722823379, 0.0, 537)
-    femmesh.addNode(2738.0546482353043, 2352.4236232081976, 0.0, 538)
-    femmesh.addNode(6401.2394796078315, 2940.815854871483, 0.0, 539)
-    femmesh.addNode(7108.19263962835, 635.5586686593102, 0.0, 540)
-    femmesh.addNode(6656.390813550942, 1380.3033377931897, 0.0, 541)
-    femmesh.addNode(6043.831321753771, 4633.234533455912, 0.0, 542)
-    femmesh.addNode(4721.16668715434, 4125.139738225244, 0.0, 543)
-    femmesh.addNode(1526.317693000979, 4425.931537245603, 0.0, 544)
-    femmesh.addNode(2856.9031223791794, 1235.5922818643587, 0.0, 545)
-    femmesh.addNode(1667.0413113868217, 3107.9483938783933, 0.0, 546)
-    femmesh.addNode(5155.803715908436, 3910.80238661925, 0.0, 547)
-    femmesh.addNode(5946.577768389446, 2091.170848821226, 0.0, 548)
-    femmesh.addNode(1194.4453099462119, 2248.1095928705754, 0.0, 549)
-    femmesh.addNode(6922.751848183759, 2819.9762673987525, 0.0, 550)
-    femmesh.addNode(6190.490338145421, 1678.9200868066084, 0.0, 551)
-    femmesh.addNode(3247.687431535846, 3209.5160076575958, 0.0, 552)
-    femmesh.addNode(7408.591570458754, 2538.3703459313115, 0.0, 553)
-    femmesh.addNode(2282.47082712219, 1254.746220629342, 0.0, 554)
-    femmesh.addNode(2132.2091900271516, 1772.438504133486, 0.0, 555)
-    femmesh.addNode(3424.681865436226, 1774.1140487341595, 0.0, 556)
-    femmesh.addNode(3418.7164283924403, 2054.450819765342, 0.0, 557)
-    femmesh.addNode(1179.4576460939484, 809.9370254008327, 0.0, 558)
-    femmesh.addNode(1262.722629987954, 5317.710122060681, 0.0, 559)
-    femmesh.addNode(4079.318698927749, 4649.051081831825, 0.0, 560)
-    femmesh.addNode(2924.7874036597086, 1810.0803017983594, 0.0, 561)
-    femmesh.addNode(7240.0300717518385, 3828.794555472594, 0.0, 562)
-    femmesh.addNode(3883.2729462580755, 5413.1992046940395, 0.0, 563)
-    femmesh.addNode(6189.678396669246, 2220.9032263668005, 0.0, 564)
-    femmesh.addNode(2244.822649395099, 4819.977361531794, 0.0, 565)
-    femmesh.addNode(2003.210320148662, 633.8443419719574, 0.0, 566)
-    femmesh.addNode(2489.490123847494, 2176.802779443699, 0.0, 567)
-    femmesh.addNode(2539.198818666904, 3702.1182730220376, 0.0, 568)
-    femmesh.addNode(4356.704072065866, 5197.059743681803, 0.0, 569)
-    femmesh.addNode(2161.34454034768, 2036.3116425755577, 0.0, 570)
-    femmesh.addNode(3865.8393816515136, 690.9368418386389, 0.0, 571)
-    femmesh.addNode(4042.0363531421444, 3375.2634430541025, 0.0, 572)
-    femmesh.addNode(1627.7142948634164, 3558.2248615468197, 0.0, 573)
-    femmesh.addNode(7407.388700150634, 1974.850934552782, 0.0, 574)
-    femmesh.addNode(3423.267554715098, 3643.457894388013, 0.0, 575)
-    femmesh.addNode(2372.4231375619115, 4573.673129222867, 0.0, 576)
-    femmesh.addNode(1210.8277639475282, 3706.9485653999477, 0.0, 577)
-    femmesh.addNode(7169.356634383594, 2425.7496526266914, 0.0, 578)
-    femmesh.addNode(6918.328467523301, 249.49598358478482, 0.0, 579)
-    femmesh.addNode(7730.874457753487, 5730.516153976924, 0.0, 580)
-    femmesh.addNode(4911.0716099769215, 3189.011146540938, 0.0, 581)
-    femmesh.addNode(4704.962751209002, 1976.7445416105706, 0.0, 582)
-    femmesh.addNode(2057.0711132894726, 3910.336144619501, 0.0, 583)
-    femmesh.addNode(5465.5101026011025, 5343.53019910437, 0.0, 584)
-    femmesh.addNode(7454.411974715306, 5284.166041789147, 0.0, 585)
-    femmesh.addNode(3854.479091618668, 2476.4846987096553, 0.0, 586)
-    femmesh.addNode(3975.898105570808, 3140.0515925059863, 0.0, 587)
-    femmesh.addNode(5774.264181489211, 5270.221993499352, 0.0, 588)
-    femmesh.addNode(231.8249691868472, 1637.5237907057171, 0.0, 589)
-    femmesh.addNode(1277.2291045783618, 2749.6798332821254, 0.0, 590)
-    femmesh.addNode(5473.693448996911, 1186.840294404773, 0.0, 591)
-    femmesh.addNode(5371.833565525066, 2475.462790725797, 0.0, 592)
-    femmesh.addNode(4323.602233314767, 3865.083675137802, 0.0, 593)
-    femmesh.addNode(912.8628139788123, 3383.249088628385, 0.0, 594)
-    femmesh.addNode(243.4295842170963, 2078.3985342679584, 0.0, 595)
-    femmesh.addNode(6935.259448158041, 2031.4302735176093, 0.0, 596)
-    femmesh.addNode(211.9984552794599, 4048.6488513738286, 0.0, 597)
-    femmesh.addNode(2772.462276984934, 4721.206809711335, 0.0, 598)
-    femmesh.addNode(6305.238886322673, 234.95886392138928, 0.0, 599)
-    femmesh.addNode(7230.891468223379, 5442.048753853078, 0.0, 600)
-    femmesh.addNode(5512.6394728493515, 238.04834278204174, 0.0, 601)
-    femmesh.addNode(1619.6910797101407, 5773.6124170727535, 0.0, 602)
-    femmesh.addNode(2479.9209008880734, 5403.183891491337, 0.0, 603)
-    femmesh.addNode(2070.3160628156097, 5738.861794816952, 0.0, 604)
-    femmesh.addNode(6375.264650330476, 1865.9917935034364, 0.0, 605)
-    femmesh.addNode(1031.9562844128895, 5769.006763532598, 0.0, 606)
-    femmesh.addNode(6265.808023974815, 3844.300408214667, 0.0, 607)
-    femmesh.addNode(1654.9993175669306, 2020.2530673917213, 0.0, 608)
-    femmesh.addNode(7153.171435619634, 3329.9593243366235, 0.0, 609)
-    femmesh.addNode(4286.223632984385, 1712.4692927440046, 0.0, 610)
-    femmesh.addNode(4451.349298609171, 4958.376562059673, 0.0, 611)
-    femmesh.addNode(5186.910026854137, 212.06636231126453, 0.0, 612)
-    femmesh.addNode(2578.7527701937665, 3123.69197619792, 0.0, 613)
-    femmesh.addNode(5776.858575101864, 2584.14832653534, 0.0, 614)
-    femmesh.addNode(7368.050177751716, 4374.351092159811, 0.0, 615)
-    femmesh.addNode(233.86688181995729, 2853.4080758781265, 0.0, 616)
-    femmesh.addNode(6486.393862312616, 4870.847189242479, 0.0, 617)
-    femmesh.addNode(6886.138995403915, 4585.223518498947, 0.0, 618)
-    femmesh.addNode(5922.477242685285, 3703.5763447693994, 0.0, 619)
-    femmesh.addNode(6591.503893510523, 4372.741484900332, 0.0, 620)
-    femmesh.addNode(231.81166885210675, 4957.778546792837, 0.0, 621)
-    femmesh.addNode(228.62380945363049, 1045.374636617549, 0.0, 622)
-    femmesh.addNode(3004.3184583377865, 5372.715182623278, 0.0, 623)
-    femmesh.addNode(6385.766002081878, 5769.657386335872, 0.0, 624)
-    femmesh.addNode(7794.75039951331, 3747.0566277999933, 0.0, 625)
-    femmesh.addNode(6019.939674630335, 4943.543019367761, 0.0, 626)
-    femmesh.addNode(3195.0653130500623, 1344.3985367274709, 0.0, 627)
-    femmesh.addNode(2811.743180673703, 219.47728697613394, 0.0, 628)
-    femmesh.addNode(689.2485148549873, 3973.481065898407, 0.0, 629)
-    femmesh.addNode(3880.650039729889, 1817.7921036490995, 0.0, 630)
-    femmesh.addNode(3179.1037965952632, 5757.109834833701, 0.0, 631)
-    femmesh.addNode(7766.824628326239, 2281.970584999322, 0.0, 632)
-    femmesh.addNode(1677.2320473992283, 3980.5486554044087, 0.0, 633)
-    femmesh.addNode(5794.791988511394, 884.1724024931256, 0.0, 634)
-    femmesh.addNode(7412.781274043341, 254.58465586025423, 0.0, 635)
-    femmesh.addNode(6193.890942005577, 3352.485485715128, 0.0, 636)
-    femmesh.addNode(4546.243647203619, 5417.071463756736, 0.0, 637)
-    femmesh.addNode(2191.081358123883, 5305.309956253436, 0.0, 638)
-    femmesh.addNode(3191.396700192288, 4950.424148223933, 0.0, 639)
-    femmesh.addNode(4225.297363344471, 5759.923903915871, 0.0, 640)
-    femmesh.addNode(4976.344215678057, 3629.4972670024436, 0.0, 641)
-    femmesh.addNode(5698.037661607894, 5757.736765869845, 0.0, 642)
-    femmesh.addNode(3010.238704575181, 3911.659865723999, 0.0, 643)
-    femmesh.addNode(3871.8296759758955, 2057.9153649043133, 0.0, 644)
-    femmesh.addNode(6745.70221134085, 1132.0551650706996, 0.0, 645)
-    femmesh.addNode(3560.9078855313464, 255.15464434189056, 0.0, 646)
-    femmesh.addNode(4348.544851981782, 4621.517329235005, 0.0, 647)
-    femmesh.addNode(6983.712637984722, 2551.931846505183, 0.0, 648)
-    femmesh.addNode(4251.394224701829, 4145.614599615976, 0.0, 649)
-    femmesh.addNode(7772.002527403345, 1617.5349953137304, 0.0, 650)
-    femmesh.addNode(2071.134898911248, 4330.571340232713, 0.0, 651)
-    femmesh.addNode(2325.067791136765, 5754.209202323643, 0.0, 652)
-    femmesh.addNode(5981.228864201084, 5426.7734342243875, 0.0, 653)
-    femmesh.addNode(5027.050753095909, 4690.037583475891, 0.0, 654)
-    femmesh.addNode(5480.797298615219, 2029.3986783417329, 0.0, 655)
-    femmesh.addNode(604.704157760315, 2455.1729768673063, 0.0, 656)
-    femmesh.addNode(5171.252289758761, 2012.6167387243493, 0.0, 657)
-    femmesh.addNode(981.0448133667329, 3636.6217674739146, 0.0, 658)
-    femmesh.addNode(244.66777119757057, 2341.087110344873, 0.0, 659)
-    femmesh.addNode(7451.203050102608, 4039.958737455424, 0.0, 660)
-    femmesh.addNode(6673.463202445251, 2201.3903891004625, 0.0, 661)
-    femmesh.addNode(3946.366417118861, 4953.074340636045, 0.0, 662)
-    femmesh.addNode(3543.2782155726627, 5410.287922706808, 0.0, 663)
-    femmesh.addNode(1179.8135616646825, 3181.667416999124, 0.0, 664)
-    femmesh.addNode(6728.681911293427, 4045.2437934759328, 0.0, 665)
-    femmesh.addNode(6474.687920164094, 2634.2296694011075, 0.0, 666)
-    femmesh.addNode(7419.009338945211, 3508.08206400413, 0.0, 667)
-    femmesh.addNode(6352.970682877889, 4582.690816278861, 0.0, 668)
-    femmesh.addNode(655.60704275733, 2941.6673827429368, 0.0, 669)
-    femmesh.addNode(4680.106239000447, 2514.911175376071, 0.0, 670)
-    femmesh.addNode(3558.0060578462108, 1321.6578218526356, 0.0, 671)
-    femmesh.addNode(6376.216135579232, 933.0499696768462, 0.0, 672)
-    femmesh.addNode(5734.3476279080605, 3872.091637279832, 0.0, 673)
-    femmesh.addNode(5574.303485888935, 4807.420813122383, 0.0, 674)
-    femmesh.addNode(5931.860873417766, 1843.5555111010833, 0.0, 675)
-    femmesh.addNode(4545.062334902329, 896.5642507821021, 0.0, 676)
-    femmesh.addNode(3660.8866986857915, 4918.04538572049, 0.0, 677)
-    femmesh.addNode(3780.864048487133, 960.3213210298263, 0.0, 678)
-    femmesh.addNode(6023.7012758737255, 603.990712191235, 0.0, 679)
-    femmesh.addNode(5895.2378155235065, 3031.985357691641, 0.0, 680)
-    femmesh.addNode(7394.22059512344, 1118.5235472479005, 0.0, 681)
-    femmesh.addNode(3004.0438635732626, 2043.6105321832192, 0.0, 682)
-    femmesh.addNode(3081.8548921882334, 857.365185031774, 0.0, 683)
-    femmesh.addNode(585.5351361249942, 4211.928404950215, 0.0, 684)
-    femmesh.addNode(5658.014432307285, 2893.28801742469, 0.0, 685)
-    femmesh.addNode(1451.6451835070357, 4855.3673533763595, 0.0, 686)
-    femmesh.addNode(2765.27892389935, 5779.359189014944, 0.0, 687)
-    femmesh.addNode(870.2902456962894, 5486.655743343572, 0.0, 688)
-    femmesh.addNode(7787.762076240306, 4887.109949102407, 0.0, 689)
-    femmesh.addNode(3554.47391121278, 4661.594333353671, 0.0, 690)
-    femmesh.addNode(4700.793478538623, 4956.50528912313, 0.0, 691)
-    femmesh.addNode(1972.9669301010545, 887.890174710281, 0.0, 692)
-    femmesh.addNode(5162.830901481482, 2426.749182932, 0.0, 693)
-    femmesh.addNode(1659.094893589362, 2295.7353299982683, 0.0, 694)
-    femmesh.addNode(1097.5513471651684, 223.17522248963803, 0.0, 695)
-    femmesh.addNode(554.668726443822, 4687.32603636818, 0.0, 696)
-    femmesh.addNode(6584.053137574225, 584.065680234474, 0.0, 697)
-    femmesh.addNode(3873.411382506447, 1411.0293244320474, 0.0, 698)
-    femmesh.addNode(1876.735979275271, 1328.6614350324999, 0.0, 699)
-    femmesh.addNode(558.0370263214184, 1316.7004362305465, 0.0, 700)
-    femmesh.addNode(6997.373829246505, 4082.724871629095, 0.0, 701)
-    femmesh.addNode(5096.878796164898, 3420.2479505881606, 0.0, 702)
-    femmesh.addNode(1396.8835161473053, 3571.253122249589, 0.0, 703)
-    femmesh.addNode(4663.348458325404, 5787.573269939614, 0.0, 704)
-    femmesh.addNode(260.7028909063048, 3773.3507731078653, 0.0, 705)
-    femmesh.addNode(7010.473210279063, 5038.647948387555, 0.0, 706)
-    femmesh.addNode(3703.7037037036944, 5814.396894736165, 0.0, 707)
-    femmesh.addNode(6027.150950410699, 2622.9477279269677, 0.0, 708)
-    femmesh.addNode(2740.1183798746188, 619.9689263583819, 0.0, 709)
-    femmesh.addNode(5189.499896025458, 619.3837773149462, 0.0, 710)
-    femmesh.addNode(3586.506405196444, 550.7815683258195, 0.0, 711)
-    femmesh.addNode(2194.987623854444, 219.35507233726327, 0.0, 712)
-    femmesh.addNode(6952.846593223185, 5788.207510598596, 0.0, 713)
-    femmesh.addNode(5786.263991544878, 5009.5320714914105, 0.0, 714)
-    femmesh.addNode(4012.0480351586225, 4220.629821934257, 0.0, 715)
-    femmesh.addNode(5819.292309685397, 4524.975633009085, 0.0, 716)
-    femmesh.addNode(7782.561366478809, 1044.9664362804583, 0.0, 717)
-    femmesh.addNode(6279.857377354824, 5322.001033101209, 0.0, 718)
-    femmesh.addNode(2319.604310150899, 3074.782696813805, 0.0, 719)
-    femmesh.addNode(6788.765367574882, 4836.8905537201, 0.0, 720)
-    femmesh.addNode(712.3837086741332, 2232.1795042719523, 0.0, 721)
-    femmesh.addNode(1431.098810327134, 1892.9905610510473, 0.0, 722)
-    femmesh.addNode(7808.11448364904, 2852.967755939065, 0.0, 723)
-    femmesh.addNode(2525.828125024906, 1582.8425930603191, 0.0, 724)
-    femmesh.addNode(3190.4539047908393, 2172.5939373401834, 0.0, 725)
-    femmesh.addNode(6940.69566802581, 793.5401535989213, 0.0, 726)
-    femmesh.addNode(5703.462130202242, 1148.527541717765, 0.0, 727)
-    femmesh.addNode(3463.051013788995, 2775.062693898545, 0.0, 728)
-    femmesh.addNode(7796.726177457187, 4352.626640444091, 0.0, 729)
-    femmesh.addNode(5580.805291554545, 461.4786835981061, 0.0, 730)
-    femmesh.addNode(611.4875208222093, 1775.0876496125954, 0.0, 731)
-    femmesh.addNode(7518.014942230175, 5796.939408216338, 0.0, 732)
-    femmesh.addNode(1129.6654880248216, 4143.8728391465065, 0.0, 733)
-    femmesh.addNode(6142.219295343434, 5792.135433631225, 0.0, 734)
-    femmesh.addNode(3424.4997768010785, 2531.3697290869395, 0.0, 735)
-    femmesh.addNode(6241.095268228463, 2467.351569343273, 0.0, 736)
-    femmesh.addNode(4599.9205343073145, 3899.9090404954377, 0.0, 737)
-    femmesh.addNode(2380.953591693878, 3539.28978149762, 0.0, 738)
-    femmesh.addNode(6419.376965091281, 2085.882606357815, 0.0, 739)
-    femmesh.addNode(2144.1595705334644, 2867.683809341155, 0.0, 740)
-    femmesh.addNode(1888.1145065450337, 2737.549388652982, 0.0, 741)
-    femmesh.addNode(196.00333475926118, 3110.4258175768596, 0.0, 742)
-    femmesh.addNode(6111.9031180580105, 2875.0585140836074, 0.0, 743)
-    femmesh.addNode(2318.226438471728, 2632.182570843897, 0.0, 744)
-    femmesh.addNode(221.57756791084597, 5777.43339505779, 0.0, 745)
-    femmesh.addNode(221.80552637723434, 223.009254943073, 0.0, 746)
-    femmesh.addNode(4872.3518380550795, 5817.242926532023, 0.0, 747)
-    femmesh.addNode(3865.2605688800986, 3853.129767883814, 0.0, 748)
-    femmesh.addNode(3179.991383469728, 2455.7952181232536, 0.0, 749)
-    femmesh.addNode(5186.634406051553, 2991.4265060837615, 0.0, 750)
-    femmesh.addNode(214.33040809660318, 468.9046623767502, 0.0, 751)
-    femmesh.addNode(211.07440020453453, 5527.9552281719825, 0.0, 752)
-    femmesh.addNode(3014.2383291309907, 3305.850992778784, 0.0, 753)
-    femmesh.addNode(7199.230778367561, 4653.833362292602, 0.0, 754)
-    femmesh.addNode(1163.8311758101122, 5114.632406477825, 0.0, 755)
-    femmesh.addNode(1722.0439197160224, 499.2582450775219, 0.0, 756)
-    femmesh.addNode(6981.923946641713, 3607.9383954600453, 0.0, 757)
-    femmesh.addNode(458.02324165381947, 2815.5588986456455, 0.0, 758)
-    femmesh.addNode(3256.3022642579417, 224.8132839930043, 0.0, 759)
-    femmesh.addNode(3873.23636021812, 2712.6297583070414, 0.0, 760)
-    femmesh.addNode(4910.216579634459, 176.56383757158628, 0.0, 761)
-    femmesh.addNode(511.22450260381254, 5791.305770680782, 0.0, 762)
-    femmesh.addNode(7803.473441573102, 5527.030202261261, 0.0, 763)
-    femmesh.addNode(4779.915568604455, 4707.623497640575, 0.0, 764)
-    femmesh.addNode(4963.043088722695, 5431.809496481827, 0.0, 765)
-    femmesh.addNode(4247.268001838055, 1481.020611457224, 0.0, 766)
-    femmesh.addNode(5732.940937632042, 2158.014504343027, 0.0, 767)
-    femmesh.addNode(4174.520085422308, 762.1480990967555, 0.0, 768)
-    femmesh.addNode(3181.8893338152034, 5204.946801119518, 0.0, 769)
-    femmesh.addNode(6702.473080041118, 192.8310175088782, 0.0, 770)
-    femmesh.addNode(2095.254919929917, 1373.7314904909426, 0.0, 771)
-    femmesh.addNode(2048.2934550589653, 3686.932386954009, 0.0, 772)
-    femmesh.addNode(3196.8815847467063, 583.075895625296, 0.0, 773)
-    femmesh.addNode(470.28870584653316, 841.195385207082, 0.0, 774)
-    femmesh.addNode(4243.033916902981, 201.146760489176, 0.0, 775)
-    femmesh.addNode(1485.0094162506439, 1490.1868733555805, 0.0, 776)
-    femmesh.addNode(6725.626167325743, 1606.3255781165349, 0.0, 777)
-    femmesh.addNode(1787.8099762209974, 221.79198964494955, 0.0, 778)
-    femmesh.addNode(6303.202265065661, 465.8759364089426, 0.0, 779)
-    femmesh.addNode(6074.150790107617, 169.70701065603228, 0.0, 780)
-    femmesh.addNode(5005.018839825389, 979.1746828735724, 0.0, 781)
-    femmesh.addNode(1878.37688714491, 3177.124580302714, 0.0, 782)
-    femmesh.addNode(6431.761654157427, 5550.798462712135, 0.0, 783)
-    femmesh.addNode(1674.5585311765158, 4222.87196042426, 0.0, 784)
-    femmesh.addNode(3677.021332473203, 3533.6134856093586, 0.0, 785)
-    femmesh.addNode(7375.331949431746, 1742.8570129200461, 0.0, 786)
-    femmesh.addNode(439.54862092186886, 167.10408822191343, 0.0, 787)
-    femmesh.addNode(1087.4940396624463, 4660.3685041514, 0.0, 788)
-    femmesh.addNode(2926.7997695741387, 2863.2622049550796, 0.0, 789)
-    femmesh.addNode(3115.6127071627748, 3690.984835609068, 0.0, 790)
-    femmesh.addNode(6353.329118540121, 3564.247526559453, 0.0, 791)
-    femmesh.addNode(1106.543838510997, 1324.2375590629008, 0.0, 792)
-    femmesh.addNode(6831.885349250451, 5554.414414668315, 0.0, 793)
-    femmesh.addNode(3055.595444319715, 4439.605808740129, 0.0, 794)
-    femmesh.addNode(5133.236929475503, 4876.293705161336, 0.0, 795)
-    femmesh.addNode(7829.372319094267, 213.18313173660414, 0.0, 796)
-    femmesh.addNode(2008.7689260384534, 2423.3360495264787, 0.0, 797)
-    femmesh.addNode(7781.828319235978, 1839.364710720715, 0.0, 798)
-    femmesh.addNode(5446.047976769356, 3624.313787580194, 0.0, 799)
-    femmesh.addNode(1021.1055622830836, 554.8561043735345, 0.0, 800)
-    femmesh.addNode(7404.78052672849, 2747.490464787852, 0.0, 801)
-    femmesh.addNode(7511.312554123875, 3053.2453064817505, 0.0, 802)
-    femmesh.addNode(2746.6816687168184, 5528.491177749865, 0.0, 803)
-    femmesh.addNode(1735.9430909862372, 1537.3803038437818, 0.0, 804)
-    femmesh.addNode(200.8469656101645, 3508.643151673744, 0.0, 805)
-    femmesh.addNode(7522.387812389939, 1562.3969896657823, 0.0, 806)
-    femmesh.addNode(906.0764241352223, 4972.645050447971, 0.0, 807)
-    femmesh.addNode(1629.7243782181613, 5561.465994080193, 0.0, 808)
-    femmesh.addNode(6025.673219847194, 1423.8319883999982, 0.0, 809)
-    femmesh.addNode(4519.551287107112, 1737.8592257885407, 0.0, 810)
-    femmesh.addNode(471.58414497416675, 5145.111607230162, 0.0, 811)
-    femmesh.addNode(2693.3241740935628, 4254.118094329861, 0.0, 812)
-    femmesh.addNode(440.9777702500636, 1638.164063171364, 0.0, 813)
-    femmesh.addNode(5367.27242342023, 959.3222350518702, 0.0, 814)
-    femmesh.addNode(2852.0251263404166, 439.87993222534715, 0.0, 815)
-    femmesh.addNode(5386.096481900847, 4590.106289408233, 0.0, 816)
-    femmesh.addNode(2031.9085609386927, 5499.020507644635, 0.0, 817)
-    femmesh.addNode(7842.282420583796, 450.0, 0.0, 818)
-    femmesh.addNode(3973.313452093168, 1117.3201454738632, 0.0, 819)
-    femmesh.addNode(7582.006414577216, 4470.19019899655, 0.0, 820)
-    femmesh.addNode(6240.219884391122, 5037.334269150257, 0.0, 821)
-    femmesh.addNode(7591.186715278582, 1171.1007534391983, 0.0, 822)
-    femmesh.addNode(4339.124974164889, 1298.9107047650234, 0.0, 823)
-    femmesh.addNode(2262.329564554463, 4387.186150036952, 0.0, 824)
-    femmesh.addNode(521.9574975008106, 3790.031597052506, 0.0, 825)
-    femmesh.addNode(7565.429274360342, 4831.81672557419, 0.0, 826)
-    femmesh.addNode(4885.18026527887, 1174.05818769299, 0.0, 827)
-    femmesh.addNode(3460.360750059373, 3927.545938102442, 0.0, 828)
-    femmesh.addNode(4234.21146417405, 2408.4905980822723, 0.0, 829)
-    femmesh.addNode(1469.8512380358118, 472.24024827065307, 0.0, 830)
-    femmesh.addNode(2604.522501327609, 204.45574222938612, 0.0, 831)
-    femmesh.addNode(2612.8424121719945, 4517.190202706002, 0.0, 832)
-    femmesh.addNode(4623.644876662934, 4547.9453351780485, 0.0, 833)
-    femmesh.addNode(441.71416923636394, 577.9613402823597, 0.0, 834)
-    femmesh.addNode(441.714169236365, 5422.03865971764, 0.0, 835)
-    femmesh.addNode(2946.1394280300233, 4887.630205901774, 0.0, 836)
-    femmesh.addNode(3338.164729539498, 4321.409123687981, 0.0, 837)
-    femmesh.addNode(1453.3901914270816, 3114.4717280219606, 0.0, 838)
-    femmesh.addNode(5156.128659672082, 1788.4144435794203, 0.0, 839)
-    femmesh.addNode(6159.626777669178, 4409.512074067423, 0.0, 840)
-    femmesh.addNode(924.8866777254106, 984.7829005826844, 0.0, 841)
-    femmesh.addNode(2673.9808903846188, 1138.0263438088466, 0.0, 842)
-    femmesh.addNode(4075.4358224955818, 3779.6963407803087, 0.0, 843)
-    femmesh.addNode(1094.9160650751094, 2940.5021817421703, 0.0, 844)
-    femmesh.addNode(6912.404148541939, 1258.3438929925874, 0.0, 845)
-    femmesh.addNode(5414.51326450606, 3172.6073243219735, 0.0, 846)
-    femmesh.addNode(3293.989835023435, 4730.489978396533, 0.0, 847)
-    femmesh.addNode(5280.020347319281, 1638.413925643536, 0.0, 848)
-    femmesh.addNode(4768.099784995892, 5362.461220031454, 0.0, 849)
-    femmesh.addNode(5720.468854239854, 4352.81773765507, 0.0, 850)
-    femmesh.addNode(5041.5585274798905, 1352.5205727595348, 0.0, 851)
-    femmesh.addNode(2496.445168419508, 514.1607306334574, 0.0, 852)
-    femmesh.addNode(6063.574737772505, 4078.3393959379264, 0.0, 853)
-    femmesh.addNode(6053.852909966514, 4233.047702055613, 0.0, 854)
-    femmesh.addNode(5938.653822006176, 4151.6921772049955, 0.0, 855)
-    femmesh.addNode(7382.5741394953475, 925.4238379674, 0.0, 856)
-    femmesh.addNode(7313.685056203803, 756.1661496620175, 0.0, 857)
-    femmesh.addNode(7480.143599682695, 765.4538333547616, 0.0, 858)
-    femmesh.addNode(5369.415640010457, 5082.623762174402, 0.0, 859)
-    femmesh.addNode(5275.461357157095, 4949.01732020395, 0.0, 860)
-    femmesh.addNode(5434.288521375393, 4940.502635256607, 0.0, 861)
-    femmesh.addNode(5162.590656561084, 3532.9990535206616, 0.0, 862)
-    femmesh.addNode(5272.905548297381, 3412.3291266343913, 0.0, 863)
-    femmesh.addNode(5338.617408693566, 3525.080229566892, 0.0, 864)
-    femmesh.addNode(1516.4846051290135, 2658.1146010858884, 0.0, 865)
-    femmesh.addNode(1610.9931700559123, 2504.7678442840333, 0.0, 866)
-    femmesh.addNode(1674.5560992896367, 2685.0485722879075, 0.0, 867)
-    femmesh.addNode(6760.523705099349, 3244.844201703093, 0.0, 868)
-    femmesh.addNode(6867.66090967698, 3092.3541520795725, 0.0, 869)
-    femmesh.addNode(6918.452830108139, 3234.7005281353604, 0.0, 870)
-    femmesh.addNode(5492.721603923168, 4569.3631233905135, 0.0, 871)
-    femmesh.addNode(5389.3128439996835, 4422.1880310605875, 0.0, 872)
-    femmesh.addNode(5495.937966022006, 4401.444865042868, 0.0, 873)
-    femmesh.addNode(7865.3141538852915, 5206.042309040155, 0.0, 874)
-    femmesh.addNode(7682.751384395123, 5183.992659660113, 0.0, 875)
-    femmesh.addNode(7817.437230509831, 5077.950350619958, 0.0, 876)
-    femmesh.addNode(5384.129929175004, 5837.353669216973, 0.0, 877)
-    femmesh.addNode(5532.278077323153, 5837.353669216973, 0.0, 878)
-    femmesh.addNode(6519.670385583855, 4216.789776583568, 0.0, 879)
-    femmesh.addNode(6471.002545948193, 4343.73555397699, 0.0, 880)
-    femmesh.addNode(6399.169038021525, 4187.783845660226, 0.0, 881)
-    femmesh.addNode(4394.727935373441, 3266.1822667484034, 0.0, 882)
-    femmesh.addNode(4392.745419229597, 3451.03988339405, 0.0, 883)
-    femmesh.addNode(4243.031242128745, 3377.346634337267, 0.0, 884)
-    femmesh.addNode(531.3650847971887, 2983.2633682664923, 0.0, 885)
-    femmesh.addNode(630.8485129579558, 3108.0795886826336, 0.0, 886)
-    femmesh.addNode(506.60655499781456, 3149.675574206189, 0.0, 887)
-    femmesh.addNode(3680.825338839532, 315.9441841517569, 0.0, 888)
-    femmesh.addNode(3706.3798686915948, 127.57732217094528, 0.0, 889)
-    femmesh.addNode(3826.2973219997803, 188.36686198081162, 0.0, 890)
-    femmesh.addNode(1953.9195286609986, 5690.9702510766965, 0.0, 891)
-    femmesh.addNode(1924.0469202966924, 5869.430897408476, 0.0, 892)
-    femmesh.addNode(1807.6503861420815, 5821.53935366822, 0.0, 893)
-    femmesh.addNode(7711.318268629984, 4971.5053251711615, 0.0, 894)
-    femmesh.addNode(7893.881038120153, 4993.5549745512035, 0.0, 895)
-    femmesh.addNode(1479.3631779004372, 1303.1103495427976, 0.0, 896)
-    femmesh.addNode(1405.4437005886068, 1153.400190392137, 0.0, 897)
-    femmesh.addNode(1545.7744543376912, 1150.6617756272408, 0.0, 898)
-    femmesh.addNode(5286.167645833921, 4538.6465516155595, 0.0, 899)
-    femmesh.addNode(5289.384007932757, 4370.728293267914, 0.0, 900)
-    femmesh.addNode(2398.0360097910707, 1562.0665781250723, 0.0, 901)
-    femmesh.addNode(2464.7625248521736, 1727.801424408495, 0.0, 902)
-    femmesh.addNode(2336.9704096183377, 1707.0254094732481, 0.0, 903)
-    femmesh.addNode(318.4632116470107, 1967.75400062245, 0.0, 904)
-    femmesh.addNode(121.71479210854815, 1939.1992671339792, 0.0, 905)
-    femmesh.addNode(196.74841953846257, 1828.554733488471, 0.0, 906)
-    femmesh.addNode(1220.5080629468923, 1204.475547166113, 0.0, 907)
-    femmesh.addNode(1286.9193393841463, 1052.0269732505562, 0.0, 908)
-    femmesh.addNode(4932.108809364495, 4306.896928048696, 0.0, 909)
-    femmesh.addNode(5105.876213950365, 4334.447698297157, 0.0, 910)
-    femmesh.addNode(5012.471405181124, 4459.636043574425, 0.0, 911)
-    femmesh.addNode(5457.318862205484, 4807.158503204269, 0.0, 912)
-    femmesh.addNode(5551.273145058845, 4940.764945174722, 0.0, 913)
-    femmesh.addNode(5807.375590948528, 4218.025621172323, 0.0, 914)
-    femmesh.addNode(5817.097418754519, 4063.3173150546363, 0.0, 915)
-    femmesh.addNode(6359.299678078662, 2660.6760548697166, 0.0, 916)
-    femmesh.addNode(6437.963699885962, 2787.5227621362956, 0.0, 917)
-    femmesh.addNode(6322.575457800531, 2813.9691476049047, 0.0, 918)
-    femmesh.addNode(5209.021412116128, 4217.989177742185, 0.0, 919)
-    femmesh.addNode(2389.656887052863, 4062.9028413600645, 0.0, 920)
-    femmesh.addNode(2251.4510405510273, 3949.161058246227, 0.0, 921)
-    femmesh.addNode(2410.692815244226, 3889.551146048091, 0.0, 922)
-    femmesh.addNode(2538.1616282538685, 1818.9657899702802, 0.0, 923)
-    femmesh.addNode(2708.1064781140312, 1918.3129804999635, 0.0, 924)
-    femmesh.addNode(2573.6417745396034, 1972.107446286354, 0.0, 925)
-    femmesh.addNode(4759.621391463934, 1557.2046558954457, 0.0, 926)
-    femmesh.addNode(4606.698858139414, 1600.960022005766, 0.0, 927)
-    femmesh.addNode(4622.544071697206, 1468.972951530709, 0.0, 928)
-    femmesh.addNode(6519.75532430756, 5249.788465360959, 0.0, 929)
-    femmesh.addNode(6572.109331871065, 5105.409170331983, 0.0, 930)
-    femmesh.addNode(6643.764049196345, 5222.953376441226, 0.0, 931)
-    femmesh.addNode(7568.764053209907, 641.8643739059416, 0.0, 932)
-    femmesh.addNode(7637.653136501451, 811.1220622113242, 0.0, 933)
-    femmesh.addNode(3215.436026406124, 944.1726123839974, 0.0, 934)
-    femmesh.addNode(3389.461258063864, 921.8194807765967, 0.0, 935)
-    femmesh.addNode(3287.531063269784, 1091.5748596406852, 0.0, 936)
-    femmesh.addNode(2380.615392629812, 1143.578159491165, 0.0, 937)
-    femmesh.addNode(2250.3418289165375, 1060.7014007447358, 0.0, 938)
-    femmesh.addNode(2348.4863944241597, 949.5333396065588, 0.0, 939)
-    femmesh.addNode(5566.48209331229, 5716.222052151896, 0.0, 940)
-    femmesh.addNode(5663.833645618757, 5878.868382934923, 0.0, 941)
-    femmesh.addNode(5202.016669530632, 5846.387886073035, 0.0, 942)
-    femmesh.addNode(5252.813265372313, 5683.741555290007, 0.0, 943)
-    femmesh.addNode(5670.676245288925, 3389.3470482803036, 0.0, 944)
-    femmesh.addNode(5552.504991899092, 3273.767211335644, 0.0, 945)
-    femmesh.addNode(5774.248936758153, 3258.703956935326, 0.0, 946)
-    femmesh.addNode(5553.024351273132, 3530.5022314892417, 0.0, 947)
-    femmesh.addNode(5774.768296132193, 3515.438977088924, 0.0, 948)
-    femmesh.addNode(946.9538136727726, 3509.9354280511498, 0.0, 949)
-    femmesh.addNode(849.3374187138693, 3650.389141456356, 0.0, 950)
-    femmesh.addNode(815.2464190199089, 3523.702802033591, 0.0, 951)
-    femmesh.addNode(3025.984217714621, 1289.9954092959147, 0.0, 952)
-    femmesh.addNode(3010.0897721938786, 1422.4563777572698, 0.0, 953)
-    femmesh.addNode(2841.008676858437, 1368.0532503257136, 0.0, 954)
-    femmesh.addNode(1763.735402031091, 1931.5263379889052, 0.0, 955)
-    femmesh.addNode(1609.6307883879317, 1859.6535442843558, 0.0, 956)
-    femmesh.addNode(1718.3668728520925, 1770.92681488154, 0.0, 957)
-    femmesh.addNode(7076.357659691194, 1518.2407199070994, 0.0, 958)
-    femmesh.addNode(7082.939857836374, 1650.641739001332, 0.0, 959)
-    femmesh.addNode(6932.7768880970025, 1606.457429439934, 0.0, 960)
-    femmesh.addNode(4384.058449932262, 5451.213041324418, 0.0, 961)
-    femmesh.addNode(4501.041052436297, 5537.411146607632, 0.0, 962)
-    femmesh.addNode(4338.85585516494, 5571.5527241753125, 0.0, 963)
-    femmesh.addNode(2159.1076831611467, 1187.1012228876098, 0.0, 964)
-    femmesh.addNode(2126.978684955494, 993.0564030030038, 0.0, 965)
-    femmesh.addNode(1634.6457288512383, 110.89599482247478, 0.0, 966)
-    femmesh.addNode(1678.8246368734358, 262.8116767379002, 0.0, 967)
-    femmesh.addNode(1525.6603895036765, 151.91568191542544, 0.0, 968)
-    femmesh.addNode(759.4763985686968, 3328.8704416253577, 0.0, 969)
-    femmesh.addNode(661.8600036097935, 3469.324155030564, 0.0, 970)
-    femmesh.addNode(1108.5707347990365, 5884.503381766299, 0.0, 971)
-    femmesh.addNode(1201.9525254898947, 5716.262073739866, 0.0, 972)
-    femmesh.addNode(1278.5669758760414, 5831.758691973567, 0.0, 973)
-    femmesh.addNode(4451.473859634742, 5307.065603719269, 0.0, 974)
-    femmesh.addNode(4289.288662363386, 5341.207181286951, 0.0, 975)
-    femmesh.addNode(4186.73205415216, 2862.8410621612984, 0.0, 976)
-    femmesh.addNode(4297.147967156858, 3017.976682467589, 0.0, 977)
-    femmesh.addNode(4134.597845267892, 3037.35339738533, 0.0, 978)
-    femmesh.addNode(4389.849428628335, 2382.7405333793067, 0.0, 979)
-    femmesh.addNode(4497.4640612598305, 2238.9729253917358, 0.0, 980)
-    femmesh.addNode(4543.4778637586305, 2397.9989315275543, 0.0, 981)
-    femmesh.addNode(7089.380735152702, 3206.0849014242317, 0.0, 982)
-    femmesh.addNode(6982.243530575071, 3358.5749510477517, 0.0, 983)
-    femmesh.addNode(4479.010980959631, 2944.5052674655126, 0.0, 984)
-    femmesh.addNode(4426.876772075362, 3119.017602689544, 0.0, 985)
-    femmesh.addNode(3713.275580915369, 5411.743563700424, 0.0, 986)
-    femmesh.addNode(3654.260735654869, 5281.420250111768, 0.0, 987)
-    femmesh.addNode(3824.2581009975756, 5282.875891105384, 0.0, 988)
-    femmesh.addNode(1795.6836681209206, 5162.475225220379, 0.0, 989)
-    femmesh.addNode(1715.3186077216833, 5320.1617113316315, 0.0, 990)
-    femmesh.addNode(1631.2019669122549, 5165.983974227966, 0.0, 991)
-    femmesh.addNode(5155.67633781917, 3318.635046916246, 0.0, 992)
-    femmesh.addNode(5331.703089951654, 3310.7162229624764, 0.0, 993)
-    femmesh.addNode(1451.5863154296026, 285.2617656365821, 0.0, 994)
-    femmesh.addNode(1407.4074074074051, 133.34608372115665, 0.0, 995)
-    femmesh.addNode(4819.780806328692, 2226.0488166014925, 0.0, 996)
-    femmesh.addNode(4961.450043272768, 2358.523635820728, 0.0, 997)
-    femmesh.addNode(4792.761733334202, 2386.706142759219, 0.0, 998)
-    femmesh.addNode(7193.8336631771035, 1711.654435699355, 0.0, 999)
-    femmesh.addNode(7050.252891582912, 1799.8711452321895, 0.0, 1000)
-    femmesh.addNode(769.8688488211501, 2997.7525410434955, 0.0, 1001)
-    femmesh.addNode(745.1103190217759, 3164.1647469831923, 0.0, 1002)
-    femmesh.addNode(6607.991909692246, 1629.0407309245452, 0.0, 1003)
-    femmesh.addNode(6687.837454635301, 1763.3652162622861, 0.0, 1004)
-    femmesh.addNode(6570.203197001804, 1786.0803690702962, 0.0, 1005)
-    femmesh.addNode(459.46512787396944, 3292.09370016171, 0.0, 1006)
-    femmesh.addNode(359.9816997132025, 3167.2774797455686, 0.0, 1007)
-    femmesh.addNode(4828.647426331876, 670.607742778215, 0.0, 1008)
-    femmesh.addNode(4877.054756804397, 838.1598752396977, 0.0, 1009)
-    femmesh.addNode(4732.776007943023, 773.7193998849145, 0.0, 1010)
-    femmesh.addNode(1428.63831947055, 2794.037581185944, 0.0, 1011)
-    femmesh.addNode(1365.0753902368253, 2613.75685318207, 0.0, 1012)
-    femmesh.addNode(7082.943895683857, 5382.099289171026, 0.0, 1013)
-    femmesh.addNode(7124.984080981181, 5509.190403819663, 0.0, 1014)
-    femmesh.addNode(6977.036508441659, 5449.240939137611, 0.0, 1015)
-    femmesh.addNode(6699.399472622235, 3535.573910920077, 0.0, 1016)
-    femmesh.addNode(6518.151422993756, 3517.6950121009704, 0.0, 1017)
-    femmesh.addNode(6630.067575902029, 3369.3116789397736, 0.0, 1018)
-    femmesh.addNode(2463.168680818446, 5829.274173380345, 0.0, 1019)
-    femmesh.addNode(2611.3168289665937, 5829.274173380345, 0.0, 1020)
-    femmesh.addNode(5893.829002835747, 3203.1345757858135, 0.0, 1021)
-    femmesh.addNode(6026.251636359767, 3066.092382727381, 0.0, 1022)
-    femmesh.addNode(6024.842823672007, 3237.241600821553, 0.0, 1023)
-    femmesh.addNode(5913.946589467609, 1725.6071264286018, 0.0, 1024)
-    femmesh.addNode(5758.782509205942, 1762.379323739814, 0.0, 1025)
-    femmesh.addNode(5740.868225255785, 1644.4309390673325, 0.0, 1026)
-    femmesh.addNode(4072.288656618182, 2737.2706740465646, 0.0, 1027)
-    femmesh.addNode(4234.838778507147, 2717.8939591288236, 0.0, 1028)
-    femmesh.addNode(2790.9315580240104, 2730.335955318843, 0.0, 1029)
-    femmesh.addNode(2613.688326181477, 2704.3100164719744, 0.0, 1030)
-    femmesh.addNode(2717.0631381004982, 2573.1789096057437, 0.0, 1031)
-    femmesh.addNode(4278.129306050152, 2567.045055264608, 0.0, 1032)
-    femmesh.addNode(4392.57270358413, 2692.6154433793413, 0.0, 1033)
-    femmesh.addNode(6175.578199600803, 3226.342446739124, 0.0, 1034)
-    femmesh.addNode(6043.155566076783, 3363.3846397975567, 0.0, 1035)
-    femmesh.addNode(2543.9141841214805, 2859.4267305002877, 0.0, 1036)
-    femmesh.addNode(2470.0457641979683, 2702.2696847871875, 0.0, 1037)
-    femmesh.addNode(4663.122836658937, 918.9178915642497, 0.0, 1038)
-    femmesh.addNode(4614.715506186416, 751.365759102767, 0.0, 1039)
-    femmesh.addNode(5053.868521382483, 5846.387886073035, 0.0, 1040)
-    femmesh.addNode(6588.259394475306, 4053.0409308713683, 0.0, 1041)
-    femmesh.addNode(6660.092902401975, 4208.992639188133, 0.0, 1042)
-    femmesh.addNode(6578.484429314133, 1262.0182523324374, 0.0, 1043)
-    femmesh.addNode(6459.753605201524, 1380.6642095756908, 0.0, 1044)
-    femmesh.addNode(6381.847220964715, 1262.3791241149386, 0.0, 1045)
-    femmesh.addNode(5556.499030169188, 4303.543755184006, 0.0, 1046)
-    femmesh.addNode(5659.907790092672, 4450.718847513932, 0.0, 1047)
-    femmesh.addNode(6573.374232804846, 1516.0296107628724, 0.0, 1048)
-    femmesh.addNode(6376.737024455428, 1516.3904825453737, 0.0, 1049)
-    femmesh.addNode(4413.086502824853, 555.5677690991592, 0.0, 1050)
-    femmesh.addNode(4261.819117303612, 616.1589636312466, 0.0, 1051)
-    femmesh.addNode(4280.266162194539, 447.7383998936408, 0.0, 1052)
-    femmesh.addNode(6974.170941434764, 2951.093372955296, 0.0, 1053)
-    femmesh.addNode(7113.273334411132, 2895.0361981627416, 0.0, 1054)
-    femmesh.addNode(7164.692427662138, 3026.1533037192853, 0.0, 1055)
-    femmesh.addNode(4539.504067702213, 665.0778001300985, 0.0, 1056)
-    femmesh.addNode(4557.951112593141, 496.6572363924926, 0.0, 1057)
-    femmesh.addNode(7052.984758457185, 2754.572614221862, 0.0, 1058)
-    femmesh.addNode(7243.506244684559, 2829.632544985851, 0.0, 1059)
-    femmesh.addNode(2616.53837412363, 2124.128708129868, 0.0, 1060)
-    femmesh.addNode(2446.5935242634673, 2024.781517600185, 0.0, 1061)
-    femmesh.addNode(759.6165307949587, 328.5053869248261, 0.0, 1062)
-    femmesh.addNode(756.7579981732581, 149.13847750972647, 0.0, 1063)
-    femmesh.addNode(891.7474215105881, 179.3669094150996, 0.0, 1064)
-    femmesh.addNode(5075.873002084907, 2610.7327305846384, 0.0, 1065)
-    femmesh.addNode(5081.48312034176, 2791.9903342956522, 0.0, 1066)
-    femmesh.addNode(4940.04108853513, 2700.4385656894683, 0.0, 1067)
-    femmesh.addNode(4525.189950623743, 1346.2284186195425, 0.0, 1068)
-    femmesh.addNode(4678.112483948264, 1302.4730525092223, 0.0, 1069)
-    femmesh.addNode(4822.3447324991175, 2813.0810229356016, 0.0, 1070)
-    femmesh.addNode(4816.734614242265, 2631.823419224588, 0.0, 1071)
-    femmesh.addNode(1426.7151240241897, 5831.758691973567, 0.0, 1072)
-    femmesh.addNode(1162.1070941853968, 4274.295959596459, 0.0, 1073)
-    femmesh.addNode(1285.883393391131, 4142.59766356247, 0.0, 1074)
-    femmesh.addNode(1318.324999551706, 4273.020784012423, 0.0, 1075)
-    femmesh.addNode(3541.157320391262, 2587.445256488564, 0.0, 1076)
-    femmesh.addNode(3545.0801542167633, 2407.5570100575505, 0.0, 1077)
-    femmesh.addNode(3661.737697806947, 2463.632537459175, 0.0, 1078)
-    femmesh.addNode(1881.547573828068, 4619.316744999498, 0.0, 1079)
-    femmesh.addNode(1788.049645474138, 4722.86655125881, 0.0, 1080)
-    femmesh.addNode(1740.033282911374, 4556.125685611923, 0.0, 1081)
-    femmesh.addNode(3695.929309040137, 4693.558284097877, 0.0, 1082)
-    femmesh.addNode(3707.047182136762, 4559.076469779107, 0.0, 1083)
-    femmesh.addNode(3848.5025799641194, 4591.040420523314, 0.0, 1084)
-    femmesh.addNode(468.0157067325813, 4543.527769139397, 0.0, 1085)
-    femmesh.addNode(312.73312274673236, 4468.8226814747795, 0.0, 1086)
-    femmesh.addNode(482.928531781281, 4381.580047044417, 0.0, 1087)
-    femmesh.addNode(3561.9393665340813, 4544.0994523600875, 0.0, 1088)
-    femmesh.addNode(3714.512637458063, 4441.581588785524, 0.0, 1089)
-    femmesh.addNode(2267.953057353296, 1822.5993799450785, 0.0, 1090)
-    femmesh.addNode(2201.2265422921937, 1656.864533661656, 0.0, 1091)
-    femmesh.addNode(6928.858800777107, 4192.020469391007, 0.0, 1092)
-    femmesh.addNode(7043.697085549042, 4224.173363280101, 0.0, 1093)
-    femmesh.addNode(6975.1820570796435, 4333.468961042013, 0.0, 1094)
-    femmesh.addNode(7117.348679148607, 4120.9592348249225, 0.0, 1095)
-    femmesh.addNode(7163.671935451143, 4262.407726475927, 0.0, 1096)
-    femmesh.addNode(4653.8890220421945, 2895.0060320790944, 0.0, 1097)
-    femmesh.addNode(4777.195496335058, 2963.6211785439746, 0.0, 1098)
-    femmesh.addNode(1179.372068490702, 3318.376135353779, 0.0, 1099)
-    femmesh.addNode(1326.125045816158, 3261.23875280796, 0.0, 1100)
-    femmesh.addNode(1325.6835526421776, 3397.947471162615, 0.0, 1101)
-    femmesh.addNode(7205.890985052491, 5316.700648382756, 0.0, 1102)
-    femmesh.addNode(7057.943412512968, 5256.751183700704, 0.0, 1103)
-    femmesh.addNode(1467.1204259988663, 5201.345981763479, 0.0, 1104)
-    femmesh.addNode(1547.4854863981036, 5043.659495652227, 0.0, 1105)
-    femmesh.addNode(3941.3868377553144, 134.00909568126906, 0.0, 1106)
-    femmesh.addNode(3915.8323079032516, 322.3759576620807, 0.0, 1107)
-    femmesh.addNode(574.1608443080829, 3612.1629474992815, 0.0, 1108)
-    femmesh.addNode(518.3908238568708, 3417.330587091048, 0.0, 1109)
-    femmesh.addNode(1543.0490639470322, 1956.6218142213843, 0.0, 1110)
-    femmesh.addNode(1497.6805347680336, 1796.0222911140188, 0.0, 1111)
-    femmesh.addNode(4279.9766975313905, 5054.442491501215, 0.0, 1112)
-    femmesh.addNode(4215.204820459885, 5189.617528876474, 0.0, 1113)
-    femmesh.addNode(4138.4774459254095, 5047.000276695886, 0.0, 1114)
-    femmesh.addNode(5822.921866940661, 1891.1822634226064, 0.0, 1115)
-    femmesh.addNode(5649.843502728837, 1810.0060760613374, 0.0, 1116)
-    femmesh.addNode(6816.241816425974, 2961.2370465230288, 0.0, 1117)
-    femmesh.addNode(3509.7811763868676, 1195.43977494296, 0.0, 1118)
-    femmesh.addNode(3376.5356854481365, 1333.0281792900532, 0.0, 1119)
-    femmesh.addNode(3328.3108039887934, 1206.8101323803776, 0.0, 1120)
-    femmesh.addNode(408.43271796666943, 5523.91902440261, 0.0, 1121)
-    femmesh.addNode(574.8445325302206, 5552.50561376648, 0.0, 1122)
-    femmesh.addNode(541.563081260525, 5654.385978451449, 0.0, 1123)
-    femmesh.addNode(4327.299310803042, 4935.10090069015, 0.0, 1124)
-    femmesh.addNode(4404.026685337518, 5077.718152870739, 0.0, 1125)
-    femmesh.addNode(1569.7389206772275, 3224.3792412475946, 0.0, 1126)
-    femmesh.addNode(1759.3509277540065, 3259.5449859110704, 0.0, 1127)
-    femmesh.addNode(1662.0485370444126, 3375.9758332802717, 0.0, 1128)
-    femmesh.addNode(4727.756861225607, 3264.4433311730622, 0.0, 1129)
-    femmesh.addNode(4856.6099322253785, 3312.4039170742035, 0.0, 1130)
-    femmesh.addNode(4673.295183474064, 3387.8361017063276, 0.0, 1131)
-    femmesh.addNode(4576.590949176214, 3192.710851746327, 0.0, 1132)
-    femmesh.addNode(6815.4489345996335, 3945.1364788760857, 0.0, 1133)
-    femmesh.addNode(6658.082615503696, 3864.600518778603, 0.0, 1134)
-    femmesh.addNode(6744.849638809901, 3764.493204178756, 0.0, 1135)
-    femmesh.addNode(2021.8758727393479, 4678.85978421246, 0.0, 1136)
-    femmesh.addNode(1973.8595101765836, 4512.118918565573, 0.0, 1137)
-    femmesh.addNode(670.9545445448027, 464.8444239474694, 0.0, 1138)
-    femmesh.addNode(805.9439678821326, 495.07285585284257, 0.0, 1139)
-    femmesh.addNode(5875.383137245497, 1040.4764154956729, 0.0, 1140)
-    femmesh.addNode(5947.485806623112, 883.1437814430759, 0.0, 1141)
-    femmesh.addNode(6028.076955357215, 1039.4477944456232, 0.0, 1142)
-    femmesh.addNode(5689.0930690883115, 4795.613133180677, 0.0, 1143)
-    femmesh.addNode(5586.825105917213, 4678.020385247588, 0.0, 1144)
-    femmesh.addNode(5701.614689116589, 4666.212705305882, 0.0, 1145)
-    femmesh.addNode(4567.450744666694, 2643.1162079929236, 0.0, 1146)
-    femmesh.addNode(4524.160217123689, 2793.965111857139, 0.0, 1147)
-    femmesh.addNode(957.8557582076861, 456.7949616018669, 0.0, 1148)
-    femmesh.addNode(869.1937719575301, 593.1339986245102, 0.0, 1149)
-    femmesh.addNode(6784.703633177838, 3645.9478197706594, 0.0, 1150)
-    femmesh.addNode(6942.069952273776, 3726.483779868142, 0.0, 1151)
-    femmesh.addNode(3154.285572331053, 1229.1632639877785, 0.0, 1152)
-    femmesh.addNode(168.17873822695674, 2487.7250861194134, 0.0, 1153)
-    femmesh.addNode(168.17873822695674, 2637.7250861194134, 0.0, 1154)
-    femmesh.addNode(6061.940450304278, 743.0529362921307, 0.0, 1155)
-    femmesh.addNode(6192.3732912876585, 647.8689271346946, 0.0, 1156)
-    femmesh.addNode(6230.612465718211, 786.9311512355903, 0.0, 1157)
-    femmesh.addNode(5703.144020968363, 4241.234248338516, 0.0, 1158)
-    femmesh.addNode(5539.174196897697, 4191.960265867452, 0.0, 1159)
-    femmesh.addNode(7344.263289576658, 4099.576167738087, 0.0, 1160)
-    femmesh.addNode(7409.626613927162, 4207.154914807617, 0.0, 1161)
-    femmesh.addNode(7302.686853401212, 4266.77234509028, 0.0, 1162)
-    femmesh.addNode(6785.922696482596, 2825.4671323144253, 0.0, 1163)
-    femmesh.addNode(6679.412664724812, 2966.727911438702, 0.0, 1164)
-    femmesh.addNode(7261.946192577225, 127.29232793012712, 0.0, 1165)
-    femmesh.addNode(7279.3414888969455, 310.60080454125836, 0.0, 1166)
-    femmesh.addNode(7128.506407430828, 183.30847661113125, 0.0, 1167)
-    femmesh.addNode(4079.9603001660425, 388.17389289413313, 0.0, 1168)
-    femmesh.addNode(3964.870784410508, 442.5316591936757, 0.0, 1169)
-    femmesh.addNode(4110.455931921699, 3166.2703050988034, 0.0, 1170)
-    femmesh.addNode(4000.0400189170014, 3011.1346847925124, 0.0, 1171)
-    femmesh.addNode(528.7511324145449, 1929.554921617074, 0.0, 1172)
-    femmesh.addNode(570.7860829859997, 2123.8700685458084, 0.0, 1173)
-    femmesh.addNode(435.53178964837986, 2051.4246139056763, 0.0, 1174)
-    femmesh.addNode(114.31190472681524, 1122.6873183087746, 0.0, 1175)
-    femmesh.addNode(276.63702303043885, 1218.860029998914, 0.0, 1176)
-    femmesh.addNode(162.32511830362358, 1296.1727116901393, 0.0, 1177)
-    femmesh.addNode(3997.419079162406, 599.6332181321835, 0.0, 1178)
-    femmesh.addNode(3833.2910868996155, 533.835282900131, 0.0, 1179)
-    femmesh.addNode(7891.280683239404, 972.4832181402292, 0.0, 1180)
-    femmesh.addNode(7754.417478253736, 866.2495195214813, 0.0, 1181)
-    femmesh.addNode(7863.136795014331, 793.7663013812521, 0.0, 1182)
-    femmesh.addNode(7517.632324270275, 4146.561970461825, 0.0, 1183)
-    femmesh.addNode(7476.055888094828, 4313.758147814018, 0.0, 1184)
-    femmesh.addNode(4759.905697927528, 3117.278667114203, 0.0, 1185)
-    femmesh.addNode(4807.268604639363, 2517.0460686772626, 0.0, 1186)
-    femmesh.addNode(4665.599367695287, 2384.571249458027, 0.0, 1187)
-    femmesh.addNode(3097.6803619001385, 985.6465881399299, 0.0, 1188)
-    femmesh.addNode(3199.6105566942188, 815.8912092758414, 0.0, 1189)
-    femmesh.addNode(5409.083910651663, 1309.9315018929087, 0.0, 1190)
-    femmesh.addNode(5581.364193507972, 1299.7282260306279, 0.0, 1191)
-    femmesh.addNode(5516.754655162726, 1422.8194335187636, 0.0, 1192)
-    femmesh.addNode(2372.6104433563205, 2248.4752354870116, 0.0, 1193)
-    femmesh.addNode(2514.655015052729, 2361.977875101287, 0.0, 1194)
-    femmesh.addNode(2397.7753345615556, 2433.6503311445995, 0.0, 1195)
-    femmesh.addNode(6264.637512059354, 4237.212271921096, 0.0, 1196)
-    femmesh.addNode(6313.305351695015, 4110.266494527674, 0.0, 1197)
-    femmesh.addNode(562.8393068003079, 5380.389301725061, 0.0, 1198)
-    femmesh.addNode(695.9696700941635, 5510.856255773901, 0.0, 1199)
-    femmesh.addNode(4562.910348888565, 1038.146385190079, 0.0, 1200)
-    femmesh.addNode(4680.970850645172, 1060.5000259722265, 0.0, 1201)
-    femmesh.addNode(3059.9680111623084, 2800.53576381081, 0.0, 1202)
-    femmesh.addNode(2910.5530697585855, 2731.233526703846, 0.0, 1203)
-    femmesh.addNode(3043.721311346755, 2668.507085559576, 0.0, 1204)
-    femmesh.addNode(6815.557189952093, 5200.361952950612, 0.0, 1205)
-    femmesh.addNode(6763.203182388588, 5344.741247979588, 0.0, 1206)
-    femmesh.addNode(3186.176620807394, 3775.2915889175815, 0.0, 1207)
-    femmesh.addNode(3269.4401309389364, 3667.2213649985406, 0.0, 1208)
-    femmesh.addNode(3340.0040445835557, 3751.528118307054, 0.0, 1209)
-    femmesh.addNode(7184.344705191021, 1090.475168424079, 0.0, 1210)
-    femmesh.addNode(7054.8099754950035, 1149.2275183669349, 0.0, 1211)
-    femmesh.addNode(7086.580866320439, 974.8885042175118, 0.0, 1212)
-    femmesh.addNode(2347.7190807535667, 5877.104601161822, 0.0, 1213)
-    femmesh.addNode(2440.5173912016444, 5706.378774542167, 0.0, 1214)
-    femmesh.addNode(162.32511830362358, 1446.1727116901393, 0.0, 1215)
-    femmesh.addNode(5588.577789599576, 1167.683918061269, 0.0, 1216)
-    femmesh.addNode(5696.2485341106385, 1280.5718496871239, 0.0, 1217)
-    femmesh.addNode(6579.2756554708685, 3226.9653028839857, 0.0, 1218)
-    femmesh.addNode(4141.542539563523, 3468.7338470185077, 0.0, 1219)
-    femmesh.addNode(4143.525055707367, 3283.8762303728618, 0.0, 1220)
-    femmesh.addNode(360.49816221846544, 2162.069147551185, 0.0, 1221)
-    femmesh.addNode(148.91014884901634, 4565.3852017848785, 0.0, 1222)
-    femmesh.addNode(163.82297389771603, 4403.437479689901, 0.0, 1223)
-    femmesh.addNode(6256.5712988329215, 2907.937184477545, 0.0, 1224)
-    femmesh.addNode(6177.907277025621, 2781.090477210967, 0.0, 1225)
-    femmesh.addNode(4389.521158412457, 2088.16887934669, 0.0, 1226)
-    femmesh.addNode(4543.149593542752, 2103.4272774949377, 0.0, 1227)
-    femmesh.addNode(1983.578551538019, 5184.251200620014, 0.0, 1228)
-    femmesh.addNode(1899.4619107285903, 5030.073463516348, 0.0, 1229)
-    femmesh.addNode(2208.5376516064134, 2178.229667052941, 0.0, 1230)
-    femmesh.addNode(2325.417332097587, 2106.557211009628, 0.0, 1231)
-    femmesh.addNode(2490.4484562988173, 890.6112406720142, 0.0, 1232)
-    femmesh.addNode(2657.6850014002966, 844.4148281447018, 0.0, 1233)
-    femmesh.addNode(2645.996503238914, 986.2136858256755, 0.0, 1234)
-    femmesh.addNode(4128.837644955021, 1074.492873589862, 0.0, 1235)
-    femmesh.addNode(3991.3796304229186, 1009.1489330615158, 0.0, 1236)
-    femmesh.addNode(4146.903823284771, 966.3216611775146, 0.0, 1237)
-    femmesh.addNode(3337.6461682757217, 4002.9907647535942, 0.0, 1238)
-    femmesh.addNode(3260.4058014139364, 4177.484496746967, 0.0, 1239)
-    femmesh.addNode(3179.5001675902276, 4034.0920742194676, 0.0, 1240)
-    femmesh.addNode(7544.643217867484, 5170.033371514532, 0.0, 1241)
-    femmesh.addNode(7384.282422942302, 5113.243901224452, 0.0, 1242)
-    femmesh.addNode(7474.513666094481, 4999.111230949837, 0.0, 1243)
-    femmesh.addNode(6512.6566961376675, 1893.1983239557367, 0.0, 1244)
-    femmesh.addNode(6432.811151194613, 1758.8738386179957, 0.0, 1245)
-    femmesh.addNode(7530.664730053624, 302.68919992417347, 0.0, 1246)
-    femmesh.addNode(7558.242488873522, 127.29232793012712, 0.0, 1247)
-    femmesh.addNode(7676.1259448838055, 175.39687199404634, 0.0, 1248)
-    femmesh.addNode(6561.890732472764, 2732.5938333156028, 0.0, 1249)
-    femmesh.addNode(6525.166512194633, 2885.886926050791, 0.0, 1250)
-    femmesh.addNode(2725.3706492273604, 5138.546618850626, 0.0, 1251)
-    femmesh.addNode(2866.7607761126837, 5055.429341247761, 0.0, 1252)
-    femmesh.addNode(2867.0510867614976, 5203.028345061386, 0.0, 1253)
-    femmesh.addNode(609.5996992139444, 5737.13916924805, 0.0, 1254)
-    femmesh.addNode(443.1878846503932, 5708.552579884181, 0.0, 1255)
-    femmesh.addNode(4229.701426105863, 2079.577254339057, 0.0, 1256)
-    femmesh.addNode(4190.29362229795, 2249.9361408999366, 0.0, 1257)
-    femmesh.addNode(4076.159422274278, 2105.798867995506, 0.0, 1258)
-    femmesh.addNode(4275.386958388785, 1944.0316064422593, 0.0, 1259)
-    femmesh.addNode(4569.080228656991, 141.62563849711006, 0.0, 1260)
-    femmesh.addNode(4562.624780292665, 335.1992411778868, 0.0, 1261)
-    femmesh.addNode(4437.9889960801065, 193.57360268077673, 0.0, 1262)
-    femmesh.addNode(6832.492626783963, 1672.5920133253508, 0.0, 1263)
-    femmesh.addNode(6794.703914093521, 1829.6316514711018, 0.0, 1264)
-    femmesh.addNode(3176.2952702026014, 1493.058661137371, 0.0, 1265)
-    femmesh.addNode(2991.3197293464177, 1571.11650216717, 0.0, 1266)
-    femmesh.addNode(163.82297389771603, 4253.437479689901, 0.0, 1267)
-    femmesh.addNode(4833.181801847207, 1057.6648600196936, 0.0, 1268)
-    femmesh.addNode(4732.969314076836, 1176.893353645523, 0.0, 1269)
-    femmesh.addNode(2282.5207325135602, 1954.5359491661143, 0.0, 1270)
-    femmesh.addNode(115.9124845934236, 1718.7618953528586, 0.0, 1271)
-    femmesh.addNode(312.6609041318862, 1747.3166288413295, 0.0, 1272)
-    femmesh.addNode(4780.179245449484, 3635.824575171586, 0.0, 1273)
-    femmesh.addNode(4912.750978766055, 3744.6462493580143, 0.0, 1274)
-    femmesh.addNode(4716.5860085374825, 3750.973557527157, 0.0, 1275)
-    femmesh.addNode(4889.246235075946, 3532.646977304956, 0.0, 1276)
-    femmesh.addNode(4693.081264847374, 3538.974285474099, 0.0, 1277)
-    femmesh.addNode(6059.801643933596, 490.61393325435097, 0.0, 1278)
-    femmesh.addNode(5923.128080676108, 455.2881835541659, 0.0, 1279)
-    femmesh.addNode(5959.2284487359775, 341.91140461728185, 0.0, 1280)
-    femmesh.addNode(3221.436837805577, 5598.300330460443, 0.0, 1281)
-    femmesh.addNode(3068.417395698776, 5693.014184977839, 0.0, 1282)
-    femmesh.addNode(3110.7504369090902, 5534.204680604581, 0.0, 1283)
-    femmesh.addNode(371.76596857225877, 3434.9324926304275, 0.0, 1284)
-    femmesh.addNode(7317.651238298455, 5237.759292350791, 0.0, 1285)
-    femmesh.addNode(7247.521686525451, 5066.837151786096, 0.0, 1286)
-    femmesh.addNode(7410.0943407253735, 127.29232793012712, 0.0, 1287)
-    femmesh.addNode(3243.5593811167273, 3005.8699659090607, 0.0, 1288)
-    femmesh.addNode(3141.2899743974594, 2876.8076119517714, 0.0, 1289)
-    femmesh.addNode(3295.4056594697454, 2866.8716766238294, 0.0, 1290)
-    femmesh.addNode(1698.734428743958, 5886.806208536376, 0.0, 1291)
-    femmesh.addNode(1728.6070371082642, 5708.345562204598, 0.0, 1292)
-    femmesh.addNode(5884.97501137318, 603.3507291307958, 0.0, 1293)
-    femmesh.addNode(5784.401816175561, 454.6482004937267, 0.0, 1294)
-    femmesh.addNode(2355.35059677633, 4225.0734431782985, 0.0, 1295)
-    femmesh.addNode(2514.5923714695286, 4165.463530980162, 0.0, 1296)
-    femmesh.addNode(3760.069811625558, 2380.114494868908, 0.0, 1297)
-    femmesh.addNode(3756.1469778000564, 2560.002741299922, 0.0, 1298)
-    femmesh.addNode(1188.0606402885796, 4043.4948276073155, 0.0, 1299)
-    femmesh.addNode(1344.278545654889, 4042.219652023279, 0.0, 1300)
-    femmesh.addNode(6435.633709493832, 5344.666852285705, 0.0, 1301)
-    femmesh.addNode(6363.9789921685515, 5227.122646176462, 0.0, 1302)
-    femmesh.addNode(1023.2558366759147, 2334.764373659973, 0.0, 1303)
-    femmesh.addNode(1183.4413177610704, 2388.5990147350294, 0.0, 1304)
-    femmesh.addNode(1012.2518444907732, 2475.253795524427, 0.0, 1305)
-    femmesh.addNode(5447.49013859961, 3514.3620451304078, 0.0, 1306)
-    femmesh.addNode(5337.175246863313, 3635.031972016678, 0.0, 1307)
-    femmesh.addNode(1058.426375697997, 2174.6331850053157, 0.0, 1308)
-    femmesh.addNode(887.2369024276996, 2261.2879657947133, 0.0, 1309)
-    femmesh.addNode(1276.8144426247336, 4876.1325116759135, 0.0, 1310)
-    femmesh.addNode(1417.5245644958754, 4967.19442828205, 0.0, 1311)
-    femmesh.addNode(1242.6938236135734, 4987.959586581604, 0.0, 1312)
-    femmesh.addNode(6511.585847895134, 5459.065567091169, 0.0, 1313)
-    femmesh.addNode(6355.809515756126, 5436.399747906672, 0.0, 1314)
-    femmesh.addNode(3441.8141523872355, 3785.501916245227, 0.0, 1315)
-    femmesh.addNode(3358.550642255693, 3893.5721401642686, 0.0, 1316)
-    femmesh.addNode(2072.1950684448407, 5869.430897408476, 0.0, 1317)
-    femmesh.addNode(3008.12173280929, 2939.534053096041, 0.0, 1318)
-    femmesh.addNode(996.1130470692466, 665.8660585339383, 0.0, 1319)
-    femmesh.addNode(844.2012567436931, 704.143952784914, 0.0, 1320)
-    femmesh.addNode(5709.319517815444, 4536.79779519094, 0.0, 1321)
-    femmesh.addNode(5811.587480986543, 4654.390543124027, 0.0, 1322)
-    femmesh.addNode(596.439921105476, 4571.805585538607, 0.0, 1323)
-    femmesh.addNode(426.2445120709274, 4659.048219968969, 0.0, 1324)
-    femmesh.addNode(1221.5453891116217, 1790.3072867562084, 0.0, 1325)
-    femmesh.addNode(1043.791879383892, 1869.1625698024618, 0.0, 1326)
-    femmesh.addNode(1071.3551700009334, 1695.097555194921, 0.0, 1327)
-    femmesh.addNode(3006.379835992304, 5246.3131250409, 0.0, 1328)
-    femmesh.addNode(2864.9897091069806, 5329.430402643765, 0.0, 1329)
-    femmesh.addNode(898.4967344318912, 3218.5433939862196, 0.0, 1330)
-    femmesh.addNode(1317.335698277427, 5490.613753003907, 0.0, 1331)
-    femmesh.addNode(1406.7797682504856, 5320.69029119995, 0.0, 1332)
-    femmesh.addNode(1461.3928365399588, 5493.593922143176, 0.0, 1333)
-    femmesh.addNode(1178.884561448304, 5418.754640000496, 0.0, 1334)
-    femmesh.addNode(1233.497629737777, 5591.658270943722, 0.0, 1335)
-    femmesh.addNode(1058.1947699721811, 2032.7645392519023, 0.0, 1336)
-    femmesh.addNode(908.0045508614928, 1937.5548076906148, 0.0, 1337)
-    femmesh.addNode(3461.894483050869, 780.8946967605501, 0.0, 1338)
-    femmesh.addNode(3533.9895199145294, 928.2969440172379, 0.0, 1339)
-    femmesh.addNode(1394.0382125084739, 4753.684097089825, 0.0, 1340)
-    femmesh.addNode(1219.2074716261718, 4774.449255389378, 0.0, 1341)
-    femmesh.addNode(3493.978311977406, 4286.493879323799, 0.0, 1342)
-    femmesh.addNode(3576.13525143023, 4127.126825599693, 0.0, 1343)
-    femmesh.addNode(3651.561761308206, 4267.237517642399, 0.0, 1344)
-    femmesh.addNode(1631.5184980493539, 1033.3255498663723, 0.0, 1345)
-    femmesh.addNode(1705.4379753611843, 1183.035709017033, 0.0, 1346)
-    femmesh.addNode(6710.968616617314, 987.4413781553214, 0.0, 1347)
-    femmesh.addNode(6623.140128209087, 1137.8941659711923, 0.0, 1348)
-    femmesh.addNode(6588.406533485551, 993.2803790558143, 0.0, 1349)
-    femmesh.addNode(4928.361408384451, 3035.3536579707097, 0.0, 1350)
-    femmesh.addNode(5935.426446248725, 3850.280107928354, 0.0, 1351)
-    femmesh.addNode(6094.14263333005, 3773.938376492033, 0.0, 1352)
-    femmesh.addNode(6107.091836893491, 3920.6421396509877, 0.0, 1353)
-    femmesh.addNode(4335.037347650592, 2475.128568798699, 0.0, 1354)
-    femmesh.addNode(4289.023545151793, 2316.10256266288, 0.0, 1355)
-    femmesh.addNode(4557.984735063791, 2528.338857445598, 0.0, 1356)
-    femmesh.addNode(3558.2317205434474, 127.57732217094528, 0.0, 1357)
-    femmesh.addNode(5183.692495808971, 4748.466888381023, 0.0, 1358)
-    femmesh.addNode(5106.6447814314515, 4588.612198649388, 0.0, 1359)
-    femmesh.addNode(5263.286524144512, 4647.04150355452, 0.0, 1360)
-    femmesh.addNode(1340.1037450278986, 1754.6164165998575, 0.0, 1361)
-    femmesh.addNode(1406.6854694687981, 1657.648146662829, 0.0, 1362)
-    femmesh.addNode(6279.25246840193, 3020.5076313173017, 0.0, 1363)
-    femmesh.addNode(6425.02950294069, 3146.1243174960746, 0.0, 1364)
-    femmesh.addNode(6303.042491734788, 3225.816093941893, 0.0, 1365)
-    femmesh.addNode(1650.1026750975852, 1618.217162510386, 0.0, 1366)
-    femmesh.addNode(1804.2072887407444, 1690.0899562149357, 0.0, 1367)
-    femmesh.addNode(3796.6695769108874, 4282.214535061419, 0.0, 1368)
-    femmesh.addNode(5496.876453414929, 5208.819638165714, 0.0, 1369)
-    femmesh.addNode(5338.0492891966305, 5217.334323113057, 0.0, 1370)
-    femmesh.addNode(4453.808254267839, 3753.6177792392655, 0.0, 1371)
-    femmesh.addNode(4282.325479649833, 3713.6439630603577, 0.0, 1372)
-    femmesh.addNode(4412.531500602907, 3602.1780671618208, 0.0, 1373)
-    femmesh.addNode(1370.4821045967824, 3869.1570290220366, 0.0, 1374)
-    femmesh.addNode(1468.3048576993335, 3968.2598649771912, 0.0, 1375)
-    femmesh.addNode(1063.501388660772, 5644.402960736454, 0.0, 1376)
-    femmesh.addNode(4564.228193847603, 3491.013699572957, 0.0, 1377)
-    femmesh.addNode(1434.6600230574693, 3456.0316054331925, 0.0, 1378)
-    femmesh.addNode(1287.9070457320136, 3513.1689879790115, 0.0, 1379)
-    femmesh.addNode(3609.1639577200885, 3128.3324509830463, 0.0, 1380)
-    femmesh.addNode(3453.3462246875315, 3141.998485852488, 0.0, 1381)
-    femmesh.addNode(3553.4927992215694, 2982.267995711677, 0.0, 1382)
-    femmesh.addNode(3651.663411853852, 3305.6513235470147, 0.0, 1383)
-    femmesh.addNode(3751.8099863878897, 3145.9208334062037, 0.0, 1384)
-    femmesh.addNode(6896.61978608611, 3497.5644866094626, 0.0, 1385)
-    femmesh.addNode(4678.027623799564, 2115.4879325752772, 0.0, 1386)
-    femmesh.addNode(4846.715933738131, 2087.305425636786, 0.0, 1387)
-    femmesh.addNode(7110.977009196776, 3718.3664754663196, 0.0, 1388)
-    femmesh.addNode(7071.123014828839, 3836.911859874416, 0.0, 1389)
-    femmesh.addNode(4570.084720952191, 1964.6838865302313, 0.0, 1390)
-    femmesh.addNode(4591.967404764113, 3771.0304619180833, 0.0, 1391)
-    femmesh.addNode(4461.761383811041, 3882.49635781662, 0.0, 1392)
-    femmesh.addNode(2835.4441561324056, 4256.052671140054, 0.0, 1393)
-    femmesh.addNode(2968.227739605435, 4150.943035689012, 0.0, 1394)
-    femmesh.addNode(2969.476217255413, 4313.695441663884, 0.0, 1395)
-    femmesh.addNode(6368.630721140412, 812.3985558775003, 0.0, 1396)
-    femmesh.addNode(6238.197880157031, 907.5825650349362, 0.0, 1397)
-    femmesh.addNode(1739.687419492304, 3484.6832197452836, 0.0, 1398)
-    femmesh.addNode(1550.0754124155249, 3449.517475081808, 0.0, 1399)
-    femmesh.addNode(3477.132905471398, 485.42818730874217, 0.0, 1400)
-    femmesh.addNode(3451.9363131983237, 662.5994009228642, 0.0, 1401)
-    femmesh.addNode(3342.5628134732774, 597.2460199057869, 0.0, 1402)
-    femmesh.addNode(121.71479210854815, 2089.1992671339794, 0.0, 1403)
-    femmesh.addNode(7898.3630887285935, 4276.313320222045, 0.0, 1404)
-    femmesh.addNode(7768.206642329093, 4190.822794014607, 0.0, 1405)
-    femmesh.addNode(7869.843553600499, 4114.509473792561, 0.0, 1406)
-    femmesh.addNode(3257.123902973455, 678.7465645726024, 0.0, 1407)
-    femmesh.addNode(3282.3204952465285, 501.5753509584804, 0.0, 1408)
-    femmesh.addNode(1773.9450711803765, 925.3412408805996, 0.0, 1409)
-    femmesh.addNode(1614.2815501568834, 892.9673074908075, 0.0, 1410)
-    femmesh.addNode(2599.227228426601, 1674.0069586221043, 0.0, 1411)
-    femmesh.addNode(5425.239431664051, 4063.9614119677835, 0.0, 1412)
-    femmesh.addNode(5571.884422463227, 4001.651905122295, 0.0, 1413)
-    femmesh.addNode(3623.233636638705, 5499.54557741606, 0.0, 1414)
-    femmesh.addNode(3793.2310019814113, 5501.001218409676, 0.0, 1415)
-    femmesh.addNode(6517.660098685575, 3872.397656174039, 0.0, 1416)
-    femmesh.addNode(7665.797024726524, 989.8389789703012, 0.0, 1417)
-    femmesh.addNode(1754.7623435742553, 5439.059478202118, 0.0, 1418)
-    femmesh.addNode(1590.2806423655893, 5442.568227209706, 0.0, 1419)
-    femmesh.addNode(7305.168095569948, 1017.3298507612782, 0.0, 1420)
-    femmesh.addNode(7273.397204744513, 1191.6688649107014, 0.0, 1421)
-    femmesh.addNode(1820.565481851162, 4897.177549381549, 0.0, 1422)
-    femmesh.addNode(1679.0511909344682, 4833.986489993975, 0.0, 1423)
-    femmesh.addNode(1140.7206739181902, 956.5196777126826, 0.0, 1424)
-    femmesh.addNode(1325.6563115599047, 905.4443209387064, 0.0, 1425)
-    femmesh.addNode(1481.691122809021, 855.2261346072366, 0.0, 1426)
-    femmesh.addNode(1624.1176959400436, 747.2418256214639, 0.0, 1427)
-    femmesh.addNode(6321.3552341395625, 3351.9591329178975, 0.0, 1428)
-    femmesh.addNode(2613.772386041399, 2264.6132013259485, 0.0, 1429)
-    femmesh.addNode(2638.9372772466345, 2449.7882969835364, 0.0, 1430)
-    femmesh.addNode(5637.369541506576, 1546.9096470175139, 0.0, 1431)
-    femmesh.addNode(5792.533621768243, 1510.1374497063016, 0.0, 1432)
-    femmesh.addNode(3316.45855903776, 5046.308464714304, 0.0, 1433)
-    femmesh.addNode(3309.858079841066, 4915.565619829715, 0.0, 1434)
-    femmesh.addNode(3434.9199386865375, 5011.449936320086, 0.0, 1435)
-    femmesh.addNode(3408.458202343758, 4582.828631622579, 0.0, 1436)
-    femmesh.addNode(3415.923657665059, 4465.333750628996, 0.0, 1437)
-    femmesh.addNode(5082.781363142034, 5004.12052194165, 0.0, 1438)
-    femmesh.addNode(5066.416863065117, 5151.316944416521, 0.0, 1439)
-    femmesh.addNode(4938.609750414993, 5064.299019236427, 0.0, 1440)
-    femmesh.addNode(3311.7048758492174, 5173.569791162096, 0.0, 1441)
-    femmesh.addNode(3186.6430170037456, 5077.685474671725, 0.0, 1442)
-    femmesh.addNode(2360.1748925855427, 807.7344819255851, 0.0, 1443)
-    femmesh.addNode(2243.266312451858, 699.6326774751249, 0.0, 1444)
-    femmesh.addNode(2385.228374326516, 640.7105785405802, 0.0, 1445)
-    femmesh.addNode(6438.397090328279, 1038.3915682742656, 0.0, 1446)
-    femmesh.addNode(6526.225578736505, 887.9387804583948, 0.0, 1447)
-    femmesh.addNode(4897.351881939873, 1636.669882841738, 0.0, 1448)
-    femmesh.addNode(4913.197095497665, 1504.682812366681, 0.0, 1449)
-    femmesh.addNode(4847.096170181207, 1792.376933372279, 0.0, 1450)
-    femmesh.addNode(5000.671874214939, 1739.8550898435142, 0.0, 1451)
-    femmesh.addNode(2166.0897217703937, 4935.913400223888, 0.0, 1452)
-    femmesh.addNode(2334.4817091594405, 4974.143465495107, 0.0, 1453)
-    femmesh.addNode(2255.7487815347354, 5090.0795041872025, 0.0, 1454)
-    femmesh.addNode(2383.3444094056395, 4813.840667295215, 0.0, 1455)
-    femmesh.addNode(2473.003469169981, 4968.006771258528, 0.0, 1456)
-    femmesh.addNode(7118.701950499171, 3955.7597135508445, 0.0, 1457)
-    femmesh.addNode(6949.794893576172, 3963.877017952667, 0.0, 1458)
-    femmesh.addNode(6163.451770469694, 534.9333243000888, 0.0, 1459)
-    femmesh.addNode(6332.123785883627, 578.8115392435484, 0.0, 1460)
-    femmesh.addNode(6040.913750298081, 3654.3208914955358, 0.0, 1461)
-    femmesh.addNode(6212.579140942847, 3724.68292321817, 0.0, 1462)
-    femmesh.addNode(3586.1807730215605, 2871.83232737039, 0.0, 1463)
-    femmesh.addNode(3560.43293888522, 2709.291738894367, 0.0, 1464)
-    femmesh.addNode(3683.5626981177857, 2806.061372366212, 0.0, 1465)
-    femmesh.addNode(2143.7431128245685, 4016.4244490888505, 0.0, 1466)
-    femmesh.addNode(2164.7790410159314, 3843.072753776877, 0.0, 1467)
-    femmesh.addNode(3405.922195992228, 2411.827897000945, 0.0, 1468)
-    femmesh.addNode(3526.5025734079127, 2288.0151779715557, 0.0, 1469)
-    femmesh.addNode(6813.568725362953, 2667.8055468069683, 0.0, 1470)
-    femmesh.addNode(6676.739573661791, 2673.296411722641, 0.0, 1471)
-    femmesh.addNode(5829.7182080909215, 1172.6539851079926, 0.0, 1472)
-    femmesh.addNode(5749.127059356819, 1016.3499721054452, 0.0, 1473)
-    femmesh.addNode(1866.7142820120202, 1550.2941269887056, 0.0, 1474)
-    femmesh.addNode(1934.9784797665275, 1703.0037793598594, 0.0, 1475)
-    femmesh.addNode(3056.2492526518117, 4060.122835968419, 0.0, 1476)
-    femmesh.addNode(3133.489619513597, 3885.6291039750467, 0.0, 1477)
-    femmesh.addNode(4043.4642910075977, 1203.3653094484052, 0.0, 1478)
-    femmesh.addNode(4198.988483869451, 1160.538037564404, 0.0, 1479)
-    femmesh.addNode(2008.4603652682604, 4918.953524781184, 0.0, 1480)
-    femmesh.addNode(3169.1064831417525, 3560.914516692741, 0.0, 1481)
-    femmesh.addNode(3322.933906917914, 3537.1510460822137, 0.0, 1482)
-    femmesh.addNode(4717.228376805138, 141.62563849711006, 0.0, 1483)
-    femmesh.addNode(5480.1999838948905, 4698.763551265309, 0.0, 1484)
-    femmesh.addNode(650.2837442083339, 5841.4862839076595, 0.0, 1485)
-    femmesh.addNode(798.4318923564817, 5841.4862839076595, 0.0, 1486)
-    femmesh.addNode(7687.410888046285, 519.1631733752985, 0.0, 1487)
-    femmesh.addNode(7529.901351227529, 473.4949445187359, 0.0, 1488)
-    femmesh.addNode(5236.785583998768, 4841.594949223745, 0.0, 1489)
-    femmesh.addNode(5080.143841285706, 4783.165644318613, 0.0, 1490)
-    femmesh.addNode(7863.136795014331, 643.7663013812521, 0.0, 1491)
-    femmesh.addNode(7717.289080728595, 5865.258076988463, 0.0, 1492)
-    femmesh.addNode(7865.437228876744, 5865.258076988463, 0.0, 1493)
-    femmesh.addNode(3424.2318731181076, 4696.042155875102, 0.0, 1494)
-    femmesh.addNode(3278.2161642490855, 4617.27645414401, 0.0, 1495)
-    femmesh.addNode(1484.2094958792095, 4283.627012612018, 0.0, 1496)
-    femmesh.addNode(1360.4331966734753, 4415.325308646008, 0.0, 1497)
-    femmesh.addNode(4689.042345170026, 444.70927220882595, 0.0, 1498)
-    femmesh.addNode(4844.384004559597, 355.00469642948656, 0.0, 1499)
-    femmesh.addNode(4839.710336860073, 516.4626916440924, 0.0, 1500)
-    femmesh.addNode(114.00169869151115, 5171.229962584443, 0.0, 1501)
-    femmesh.addNode(114.00169869151115, 5321.229962584443, 0.0, 1502)
-    femmesh.addNode(114.80051584458568, 678.4077201366822, 0.0, 1503)
-    femmesh.addNode(114.80051584458568, 828.4077201366822, 0.0, 1504)
-    femmesh.addNode(6626.585829424963, 270.84690597404375, 0.0, 1505)
-    femmesh.addNode(6769.987426014464, 346.85027768574, 0.0, 1506)
-    femmesh.addNode(6694.100175398309, 424.8661661509056, 0.0, 1507)
-    femmesh.addNode(5044.1055899837065, 4896.698150961445, 0.0, 1508)
-    femmesh.addNode(5171.91270263383, 4983.71607614154, 0.0, 1509)
-    femmesh.addNode(7292.792494202946, 3289.4626588171154, 0.0, 1510)
-    femmesh.addNode(7228.48312812907, 3150.027726631677, 0.0, 1511)
-    femmesh.addNode(7368.104186712382, 3109.531061112169, 0.0, 1512)
-    femmesh.addNode(7865.437228876744, 5715.258076988463, 0.0, 1513)
-    femmesh.addNode(355.20455953102805, 1074.5042764004547, 0.0, 1514)
-    femmesh.addNode(403.2177731078364, 1247.9896697818197, 0.0, 1515)
-    femmesh.addNode(6794.512841800568, 4173.279930314427, 0.0, 1516)
-    femmesh.addNode(6725.923832909115, 4337.028776026626, 0.0, 1517)
-    femmesh.addNode(4091.9829470874884, 831.5629098729619, 0.0, 1518)
-    femmesh.addNode(4229.44096161959, 896.9068504013081, 0.0, 1519)
-    femmesh.addNode(7578.902962802856, 3190.3595315212474, 0.0, 1520)
-    femmesh.addNode(7712.524926578211, 3299.7122043072122, 0.0, 1521)
-    femmesh.addNode(7566.035516561613, 3358.318666083572, 0.0, 1522)
-    femmesh.addNode(3071.033379779111, 5878.55491741685, 0.0, 1523)
-    femmesh.addNode(2960.3469788826237, 5814.459267560988, 0.0, 1524)
-    femmesh.addNode(2981.024726570038, 5500.816858872628, 0.0, 1525)
-    femmesh.addNode(3134.044168676839, 5406.103004355232, 0.0, 1526)
-    femmesh.addNode(5480.841458535873, 2809.2176037924755, 0.0, 1527)
-    femmesh.addNode(5326.4780258501, 2822.78532330049, 0.0, 1528)
-    femmesh.addNode(5371.678466577312, 2688.716779682808, 0.0, 1529)
-    femmesh.addNode(7089.625607985102, 3590.318951147354, 0.0, 1530)
-    femmesh.addNode(7218.678670540165, 3700.747031153628, 0.0, 1531)
-    femmesh.addNode(6171.611152111733, 993.4709740972244, 0.0, 1532)
-    femmesh.addNode(6099.508482734118, 1150.8036081498212, 0.0, 1533)
-    femmesh.addNode(7849.828740168485, 3533.8356694347685, 0.0, 1534)
-    femmesh.addNode(7849.828740168485, 3383.8356694347685, 0.0, 1535)
-    femmesh.addNode(1585.8702320202276, 3887.8729486901784, 0.0, 1536)
-    femmesh.addNode(1559.6666730783343, 4060.9355716914215, 0.0, 1537)
-    femmesh.addNode(2864.120943431154, 5889.679594507472, 0.0, 1538)
-    femmesh.addNode(2861.5049593508197, 5704.13886206846, 0.0, 1539)
-    femmesh.addNode(993.2201180270279, 111.58761124481902, 0.0, 1540)
-    femmesh.addNode(996.0786506487285, 290.9545206599186, 0.0, 1541)
-    femmesh.addNode(4983.989085721447, 580.9031669988756, 0.0, 1542)
-    femmesh.addNode(122.33388559878529, 2370.5435551724368, 0.0, 1543)
-    femmesh.addNode(290.512623825742, 2458.26864129185, 0.0, 1544)
-    femmesh.addNode(1782.7938769993864, 110.89599482247478, 0.0, 1545)
-    femmesh.addNode(1316.601876545882, 3148.0695725105425, 0.0, 1546)
-    femmesh.addNode(1462.9133606973573, 3227.6409083193785, 0.0, 1547)
-    femmesh.addNode(1070.1120371609406, 2639.154529861933, 0.0, 1548)
-    femmesh.addNode(909.9265560757848, 2585.319888786877, 0.0, 1549)
-    femmesh.addNode(812.4742145734006, 2715.815065851335, 0.0, 1550)
-    femmesh.addNode(754.6140219032332, 2551.914331513829, 0.0, 1551)
-    femmesh.addNode(7840.438080432255, 2642.582452250086, 0.0, 1552)
-    femmesh.addNode(7840.438080432255, 2492.582452250086, 0.0, 1553)
-    femmesh.addNode(4779.935343874797, 4278.6125057756035, 0.0, 1554)
-    femmesh.addNode(4873.3401526440375, 4153.424160498336, 0.0, 1555)
-    femmesh.addNode(608.6098500251103, 149.13847750972647, 0.0, 1556)
-    femmesh.addNode(5048.853008014237, 3090.21882631235, 0.0, 1557)
-    femmesh.addNode(5200.554142762498, 3104.2243246640464, 0.0, 1558)
-    femmesh.addNode(5062.772744725182, 3203.0166448926348, 0.0, 1559)
-    femmesh.addNode(811.696895751641, 2845.44400293366, 0.0, 1560)
-    femmesh.addNode(925.9587018154612, 2901.529161234219, 0.0, 1561)
-    femmesh.addNode(6738.821444457219, 4478.982501699639, 0.0, 1562)
-    femmesh.addNode(6873.241383855811, 4443.269792825933, 0.0, 1563)
-    femmesh.addNode(3542.1884800124444, 2169.097555396752, 0.0, 1564)
-    femmesh.addNode(3538.567181266625, 1989.819108222927, 0.0, 1565)
-    femmesh.addNode(3662.039232886629, 2104.4658438543365, 0.0, 1566)
-    femmesh.addNode(656.3843615790895, 2812.038445660612, 0.0, 1567)
-    femmesh.addNode(4827.689456832637, 1936.153340992313, 0.0, 1568)
-    femmesh.addNode(4969.442639361765, 2046.7142250185284, 0.0, 1569)
-    femmesh.addNode(3403.0305217879086, 2173.3684423401464, 0.0, 1570)
-    femmesh.addNode(2633.154758149378, 2992.579519191497, 0.0, 1571)
-    femmesh.addNode(2489.512196165869, 2990.5391875067107, 0.0, 1572)
-    femmesh.addNode(5363.2153602114395, 4698.501241347194, 0.0, 1573)
-    femmesh.addNode(4275.897087489348, 4766.671284277816, 0.0, 1574)
-    femmesh.addNode(4399.947075295477, 4789.946945647339, 0.0, 1575)
-    femmesh.addNode(2574.610553751165, 5059.628592247711, 0.0, 1576)
-    femmesh.addNode(2574.900864399978, 5207.227596061336, 0.0, 1577)
-    femmesh.addNode(579.4980754341702, 604.6866165789229, 0.0, 1578)
-    femmesh.addNode(533.1706383469964, 438.11914765090637, 0.0, 1579)
-    femmesh.addNode(2623.473253997364, 4899.325794047818, 0.0, 1580)
-    femmesh.addNode(1143.860737551397, 541.9293791621222, 0.0, 1581)
-    femmesh.addNode(1059.328454724126, 389.0156634315863, 0.0, 1582)
-    femmesh.addNode(1182.0836299924395, 376.088938220174, 0.0, 1583)
-    femmesh.addNode(3453.7847756974397, 4374.006847527243, 0.0, 1584)
-    femmesh.addNode(3378.3582658194637, 4233.896155484537, 0.0, 1585)
-    femmesh.addNode(1581.6061054092638, 4931.832420746537, 0.0, 1586)
-    femmesh.addNode(1549.0902690322398, 4757.521422623797, 0.0, 1587)
-    femmesh.addNode(1733.6236863622744, 5602.272350708317, 0.0, 1588)
-    femmesh.addNode(1858.6616517183684, 5479.865834830243, 0.0, 1589)
-    femmesh.addNode(3492.3993167279473, 5276.240351955741, 0.0, 1590)
-    femmesh.addNode(3603.381836810154, 5147.372679360702, 0.0, 1591)
-    femmesh.addNode(7869.843553600499, 3964.509473792561, 0.0, 1592)
-    femmesh.addNode(3765.525612099783, 2678.0752710986153, 0.0, 1593)
-    femmesh.addNode(3791.273446236123, 2840.6158595746383, 0.0, 1594)
-    femmesh.addNode(3596.464575048989, 669.0768641635054, 0.0, 1595)
-    femmesh.addNode(3408.605074894644, 239.98396416744743, 0.0, 1596)
-    femmesh.addNode(3405.9289099067446, 112.40664199650215, 0.0, 1597)
-    femmesh.addNode(1890.1114806628764, 281.97501553463826, 0.0, 1598)
-    femmesh.addNode(1930.9420251475344, 110.89599482247478, 0.0, 1599)
-    femmesh.addNode(2033.2435295894134, 171.0790207121635, 0.0, 1600)
-    femmesh.addNode(7412.0178952172455, 425.3904004548167, 0.0, 1601)
-    femmesh.addNode(6988.079668627747, 4475.422686715026, 0.0, 1602)
-    femmesh.addNode(7690.393887947564, 4302.895921956158, 0.0, 1603)
-    femmesh.addNode(7661.874352819469, 4141.092075526674, 0.0, 1604)
-    femmesh.addNode(4455.465696813373, 4681.499625112829, 0.0, 1605)
-    femmesh.addNode(4506.867920127068, 4849.929241525163, 0.0, 1606)
-    femmesh.addNode(3328.0936332697365, 2756.4360082825424, 0.0, 1607)
-    femmesh.addNode(3430.363039989004, 2885.498362239832, 0.0, 1608)
-    femmesh.addNode(3109.63261361045, 112.40664199650215, 0.0, 1609)
-    femmesh.addNode(3154.246664311765, 271.9523722257575, 0.0, 1610)
-    femmesh.addNode(3007.577013664273, 159.54573022925535, 0.0, 1611)
-    femmesh.addNode(3257.7807617585977, 112.40664199650215, 0.0, 1612)
-    femmesh.addNode(2823.977887225684, 3928.3200418063625, 0.0, 1613)
-    femmesh.addNode(2691.547170114245, 4048.2965971635554, 0.0, 1614)
-    femmesh.addNode(2681.3293788575006, 3883.316373804735, 0.0, 1615)
-    femmesh.addNode(5770.520367692014, 743.441574281741, 0.0, 1616)
-    femmesh.addNode(5631.432954158519, 802.5073737707789, 0.0, 1617)
-    femmesh.addNode(5607.161333339139, 661.7765455593944, 0.0, 1618)
-    femmesh.addNode(7494.214998489888, 2804.8282493728148, 0.0, 1619)
-    femmesh.addNode(7542.828343796501, 2666.327684644012, 0.0, 1620)
-    femmesh.addNode(7632.262815557899, 2723.665469228975, 0.0, 1621)
-    femmesh.addNode(5272.00466439603, 529.2950532437749, 0.0, 1622)
-    femmesh.addNode(5092.275946137551, 523.0709465898495, 0.0, 1623)
-    femmesh.addNode(5174.780714508124, 432.9822225186782, 0.0, 1624)
-    femmesh.addNode(2359.24903030485, 2744.784484829699, 0.0, 1625)
-    femmesh.addNode(2429.0231723648467, 2589.667770801386, 0.0, 1626)
-    femmesh.addNode(6844.049120263435, 2533.7833363601835, 0.0, 1627)
-    femmesh.addNode(6953.2322430842405, 2685.9540569519677, 0.0, 1628)
-    femmesh.addNode(5090.658667021085, 4046.2554846953394, 0.0, 1629)
-    femmesh.addNode(5274.166461003479, 4082.5360796660957, 0.0, 1630)
-    femmesh.addNode(1312.5404544108571, 1928.6814312073982, 0.0, 1631)
-    femmesh.addNode(4186.016346788139, 354.7381774574521, 0.0, 1632)
-    femmesh.addNode(4337.283732309381, 294.14698292536474, 0.0, 1633)
-    femmesh.addNode(6169.200301701011, 4284.603497427983, 0.0, 1634)
-    femmesh.addNode(6044.279385934682, 4357.956278695052, 0.0, 1635)
-    femmesh.addNode(793.2064336009732, 2051.578576698631, 0.0, 1636)
-    femmesh.addNode(778.8035430126841, 1887.9766072491902, 0.0, 1637)
-    femmesh.addNode(5090.98101155189, 319.41223908800873, 0.0, 1638)
-    femmesh.addNode(5270.709729810371, 325.636345741934, 0.0, 1639)
-    femmesh.addNode(5830.429676805801, 5470.353705492884, 0.0, 1640)
-    femmesh.addNode(5959.344577402303, 5553.370854602572, 0.0, 1641)
-    femmesh.addNode(5808.545390007021, 5596.951125871068, 0.0, 1642)
-    femmesh.addNode(1586.4265237792115, 4542.803514558419, 0.0, 1643)
-    femmesh.addNode(1679.9244521331416, 4439.253708299107, 0.0, 1644)
-    femmesh.addNode(3715.708720176329, 1366.3435731423415, 0.0, 1645)
-    femmesh.addNode(3785.8898641643755, 1514.1307211260723, 0.0, 1646)
-    femmesh.addNode(3628.1872018342574, 1469.4449698363665, 0.0, 1647)
-    femmesh.addNode(3051.8410125877162, 3160.8284470078934, 0.0, 1648)
-    femmesh.addNode(2924.777956909063, 3227.235463009237, 0.0, 1649)
-    femmesh.addNode(2962.380640365788, 3082.2129172383457, 0.0, 1650)
-    femmesh.addNode(831.6453666937916, 3943.1529315482658, 0.0, 1651)
-    femmesh.addNode(703.4392694579965, 3818.818790668602, 0.0, 1652)
-    femmesh.addNode(845.8361212968007, 3788.490656318461, 0.0, 1653)
-    femmesh.addNode(6356.822450816, 3952.5692382407356, 0.0, 1654)
-    femmesh.addNode(6426.64567184439, 3764.1288261479704, 0.0, 1655)
-    femmesh.addNode(3037.14887670638, 2527.5000332879326, 0.0, 1656)
-    femmesh.addNode(3186.563818110103, 2596.802270394897, 0.0, 1657)
-    femmesh.addNode(7278.57811007085, 481.40654913582085, 0.0, 1658)
-    femmesh.addNode(4218.683578414832, 4271.176513518723, 0.0, 1659)
-    femmesh.addNode(4382.488484102001, 4242.155849150317, 0.0, 1660)
-    femmesh.addNode(4349.777837815003, 4367.717763053066, 0.0, 1661)
-    femmesh.addNode(4364.987729888175, 4107.763165138471, 0.0, 1662)
-    femmesh.addNode(4496.081989288346, 4204.3044146728125, 0.0, 1663)
-    femmesh.addNode(3315.449841765593, 5737.124823896522, 0.0, 1664)
-    femmesh.addNode(3357.7828829759073, 5578.315319523264, 0.0, 1665)
-    femmesh.addNode(2816.180509089168, 2475.814235830405, 0.0, 1666)
-    femmesh.addNode(7766.538011398985, 106.59156586830207, 0.0, 1667)
-    femmesh.addNode(7738.960252579088, 281.9884378623484, 0.0, 1668)
-    femmesh.addNode(6427.9687325657405, 291.9108291802993, 0.0, 1669)
-    femmesh.addNode(6411.878702420593, 117.47943196069464, 0.0, 1670)
-    femmesh.addNode(6534.60854866366, 174.43139721960466, 0.0, 1671)
-    femmesh.addNode(7127.04717168945, 501.08781094078637, 0.0, 1672)
-    femmesh.addNode(6972.84720580808, 568.2141032609561, 0.0, 1673)
-    femmesh.addNode(6991.70173786918, 433.7432455424322, 0.0, 1674)
-    femmesh.addNode(1367.0590479896537, 1553.2145727521242, 0.0, 1675)
-    femmesh.addNode(1524.6358377297884, 1594.6204472662853, 0.0, 1676)
-    femmesh.addNode(5391.4515600302475, 2134.1750157218303, 0.0, 1677)
-    femmesh.addNode(5534.392713752847, 2195.7455813773613, 0.0, 1678)
-    femmesh.addNode(5445.046975167876, 2300.5219187574585, 0.0, 1679)
-    femmesh.addNode(148.91014884901634, 4715.3852017848785, 0.0, 1680)
-    femmesh.addNode(7259.72357800975, 615.8774068543447, 0.0, 1681)
-    femmesh.addNode(7229.035259801647, 4369.986473545458, 0.0, 1682)
-    femmesh.addNode(6851.374173982636, 1082.8480096155336, 0.0, 1683)
-    femmesh.addNode(6816.6405792590995, 938.2342227001556, 0.0, 1684)
-    femmesh.addNode(5003.97520307091, 3304.6295485645496, 0.0, 1685)
-    femmesh.addNode(1215.4423402492498, 244.93369496597566, 0.0, 1686)
-    femmesh.addNode(1299.9746230765209, 397.8474106965116, 0.0, 1687)
-    femmesh.addNode(7406.686048593622, 2642.9304053595815, 0.0, 1688)
-    femmesh.addNode(7544.733865661633, 2561.767625215742, 0.0, 1689)
-    femmesh.addNode(1949.9769995900783, 3549.036982448878, 0.0, 1690)
-    femmesh.addNode(1932.7886822022792, 3728.836281757617, 0.0, 1691)
-    femmesh.addNode(1834.4722267333923, 3590.9408772524866, 0.0, 1692)
-    femmesh.addNode(2985.204476995612, 1174.7601365562223, 0.0, 1693)
-    femmesh.addNode(2635.3005585803803, 3276.5854115362845, 0.0, 1694)
-    femmesh.addNode(2707.0351774404508, 3136.1559547188044, 0.0, 1695)
-    femmesh.addNode(2763.5829658270645, 3289.049390057169, 0.0, 1696)
-    femmesh.addNode(5682.111899272497, 938.9651617754096, 0.0, 1697)
-    femmesh.addNode(5518.752864919621, 857.3001330530628, 0.0, 1698)
-    femmesh.addNode(5002.480728881244, 3885.2988091664174, 0.0, 1699)
-    femmesh.addNode(4937.335679993895, 4020.751907242507, 0.0, 1700)
-    femmesh.addNode(2491.7374670008803, 3217.7505103934163, 0.0, 1701)
-    femmesh.addNode(2548.285255387494, 3370.643945731781, 0.0, 1702)
-    femmesh.addNode(7325.390589247099, 2352.6739416713235, 0.0, 1703)
-    femmesh.addNode(7187.218553978806, 2289.412475933546, 0.0, 1704)
-    femmesh.addNode(7343.252508842312, 2216.3367649781776, 0.0, 1705)
-    femmesh.addNode(7862.696186409727, 3215.8765348724437, 0.0, 1706)
-    femmesh.addNode(3555.4877180696603, 3860.7224939691796, 0.0, 1707)
-    femmesh.addNode(3536.9411203975233, 3718.6784721119648, 0.0, 1708)
-    femmesh.addNode(4785.1622145041965, 3992.4674849694147, 0.0, 1709)
-    femmesh.addNode(4469.850896418127, 810.2762918094336, 0.0, 1710)
-    femmesh.addNode(5465.089258650267, 1557.112922879795, 0.0, 1711)
-    femmesh.addNode(1224.8332150771453, 2639.3841349408044, 0.0, 1712)
-    femmesh.addNode(1122.507926662157, 2749.4502282032545, 0.0, 1713)
-    femmesh.addNode(6810.400773782209, 221.16350054683153, 0.0, 1714)
-    femmesh.addNode(6877.915119755555, 375.1827607236934, 0.0, 1715)
-    femmesh.addNode(3413.5994020923436, 1646.0351097431233, 0.0, 1716)
-    femmesh.addNode(3291.103546395683, 1707.9164171407156, 0.0, 1717)
-    femmesh.addNode(3280.021083051801, 1579.837478149679, 0.0, 1718)
-    femmesh.addNode(1109.621909284879, 5272.654820071086, 0.0, 1719)
-    femmesh.addNode(1025.783840745229, 5373.699338010901, 0.0, 1720)
-    femmesh.addNode(5877.746522845147, 5348.49771386187, 0.0, 1721)
-    femmesh.addNode(5726.947335449865, 5392.077985130366, 0.0, 1722)
-    femmesh.addNode(3300.8286688587, 1839.1952163605347, 0.0, 1723)
-    femmesh.addNode(3167.2503498181572, 1772.9975847670905, 0.0, 1724)
-    femmesh.addNode(7067.547691130674, 3468.9488598983344, 0.0, 1725)
-    femmesh.addNode(5325.347643893138, 5373.0442253657975, 0.0, 1726)
-    femmesh.addNode(5197.886830488666, 5246.848349374484, 0.0, 1727)
-    femmesh.addNode(3130.962880333418, 3257.6835002181897, 0.0, 1728)
-    femmesh.addNode(3168.5655637901436, 3112.6609544472994, 0.0, 1729)
-    femmesh.addNode(5127.942595456558, 5547.667011886648, 0.0, 1730)
-    femmesh.addNode(5310.05585510093, 5538.632795030586, 0.0, 1731)
-    femmesh.addNode(875.7014700480215, 1357.230480733051, 0.0, 1732)
-    femmesh.addNode(792.9798776208206, 1511.220473816049, 0.0, 1733)
-    femmesh.addNode(727.7360799759065, 1375.403157613251, 0.0, 1734)
-    femmesh.addNode(2853.043338048992, 3367.6649198267164, 0.0, 1735)
-    femmesh.addNode(846.9232326575204, 854.4255488523577, 0.0, 1736)
-    femmesh.addNode(720.0039575458038, 781.6934889429297, 0.0, 1737)
-    femmesh.addNode(7238.676800401273, 3993.994076746672, 0.0, 1738)
-    femmesh.addNode(1186.0725848267357, 2845.091007512148, 0.0, 1739)
-    femmesh.addNode(1031.3514069105308, 2844.8614024332765, 0.0, 1740)
-    femmesh.addNode(2064.8473315324773, 1667.8232271335578, 0.0, 1741)
-    femmesh.addNode(2133.8646837975193, 1552.2492566617275, 0.0, 1742)
-    femmesh.addNode(1772.709099265866, 3142.5364870905537, 0.0, 1743)
-    femmesh.addNode(1865.0187156330508, 3294.133079123231, 0.0, 1744)
-    femmesh.addNode(2002.3403382612016, 1807.6190563597877, 0.0, 1745)
-    femmesh.addNode(781.0185221901592, 4482.936507206478, 0.0, 1746)
-    femmesh.addNode(862.1213995712776, 4639.095030285949, 0.0, 1747)
-    femmesh.addNode(719.3139931482483, 4612.443657788505, 0.0, 1748)
-    femmesh.addNode(2286.9786006684376, 2476.16513118711, 0.0, 1749)
-    femmesh.addNode(5053.715217761624, 5307.026846669262, 0.0, 1750)
-    femmesh.addNode(5193.016449893154, 1392.7716410702897, 0.0, 1751)
-    femmesh.addNode(5096.651168149363, 1249.338457374906, 0.0, 1752)
-    femmesh.addNode(5248.109090562626, 1289.589525685661, 0.0, 1753)
-    femmesh.addNode(5273.548817682424, 901.0290274025733, 0.0, 1754)
-    femmesh.addNode(5259.508116119532, 1052.7392885210738, 0.0, 1755)
-    femmesh.addNode(5165.784510381725, 994.4460808717768, 0.0, 1756)
-    femmesh.addNode(3561.5251056292645, 1695.6730832771284, 0.0, 1757)
-    femmesh.addNode(3550.442642285382, 1567.5941442860922, 0.0, 1758)
-    femmesh.addNode(3541.549899788518, 1849.6507227073357, 0.0, 1759)
-    femmesh.addNode(3678.3931399815565, 1771.2097572503046, 0.0, 1760)
-    femmesh.addNode(5775.6577494459125, 3087.5547388411537, 0.0, 1761)
-    femmesh.addNode(755.289428271755, 4916.919343668762, 0.0, 1762)
-    femmesh.addNode(596.1943038974507, 4979.4414663977495, 0.0, 1763)
-    femmesh.addNode(641.3217461550627, 4831.124303596964, 0.0, 1764)
-    femmesh.addNode(7897.375199756655, 3673.5283138999966, 0.0, 1765)
-    femmesh.addNode(7747.203939925139, 3607.363983334765, 0.0, 1766)
-    femmesh.addNode(2093.7003044795997, 280.75655688079513, 0.0, 1767)
-    femmesh.addNode(2231.653709023638, 375.98192321369163, 0.0, 1768)
-    femmesh.addNode(2130.3663896487933, 437.3834077572235, 0.0, 1769)
-    femmesh.addNode(2647.164223200557, 4764.455391384985, 0.0, 1770)
-    femmesh.addNode(2748.7713077817407, 4856.077212374168, 0.0, 1771)
-    femmesh.addNode(602.2556215340285, 1017.804500596867, 0.0, 1772)
-    femmesh.addNode(766.5918029313693, 1076.6941247703132, 0.0, 1773)
-    femmesh.addNode(646.1214910057665, 1162.5235403568067, 0.0, 1774)
-    femmesh.addNode(6253.07953817037, 1242.9259345798073, 0.0, 1775)
-    femmesh.addNode(6109.545341415853, 1288.9027549282061, 0.0, 1776)
-    femmesh.addNode(4617.374715328257, 4231.918418454952, 0.0, 1777)
-    femmesh.addNode(4676.143372048713, 4385.39118600531, 0.0, 1778)
-    femmesh.addNode(3480.261498297336, 1419.8069963023613, 0.0, 1779)
-    femmesh.addNode(3298.7911258992617, 1431.177353739779, 0.0, 1780)
-    femmesh.addNode(6371.810362282979, 1124.2799773365537, 0.0, 1781)
-    femmesh.addNode(5533.2507218046685, 1855.3009073601388, 0.0, 1782)
-    femmesh.addNode(5408.632309050067, 1927.2335542186759, 0.0, 1783)
-    femmesh.addNode(5461.085732239517, 1753.1357832370818, 0.0, 1784)
-    femmesh.addNode(789.1325707601827, 5584.814155579445, 0.0, 1785)
-    femmesh.addNode(951.1232650545894, 5627.831253438085, 0.0, 1786)
-    femmesh.addNode(869.9655901184829, 5725.989665673958, 0.0, 1787)
-    femmesh.addNode(917.2734639830696, 1633.5003175885117, 0.0, 1788)
-    femmesh.addNode(769.3080739109546, 1651.6729944687115, 0.0, 1789)
-    femmesh.addNode(1722.4991021045048, 3664.4825190540228, 0.0, 1790)
-    femmesh.addNode(5597.390079539387, 1984.1038470429312, 0.0, 1791)
-    femmesh.addNode(1480.6892533139965, 590.8704505042731, 0.0, 1792)
-    femmesh.addNode(1595.947578875917, 485.7492466740875, 0.0, 1793)
-    femmesh.addNode(1606.7855941541018, 604.3794489077075, 0.0, 1794)
-    femmesh.addNode(5874.240405702203, 153.2928274585484, 0.0, 1795)
-    femmesh.addNode(5726.092257554055, 153.2928274585484, 0.0, 1796)
-    femmesh.addNode(1561.1113557523217, 3676.711051761384, 0.0, 1797)
-    femmesh.addNode(1655.89616299341, 3782.968709268587, 0.0, 1798)
-    femmesh.addNode(5596.148642568822, 3872.872344251229, 0.0, 1799)
-    femmesh.addNode(5710.083407802466, 4000.8711981508977, 0.0, 1800)
-    femmesh.addNode(6948.870902325116, 913.5905038796445, 0.0, 1801)
-    femmesh.addNode(7078.405632021133, 854.8381539367886, 0.0, 1802)
-    femmesh.addNode(2621.1276671674095, 684.3906546747112, 0.0, 1803)
-    femmesh.addNode(2776.675714107506, 779.9930998283725, 0.0, 1804)
-    femmesh.addNode(2856.853157040181, 2318.7841141378126, 0.0, 1805)
-    femmesh.addNode(2934.979017894045, 2442.17472676002, 0.0, 1806)
-    femmesh.addNode(2040.942290037624, 2127.6293287785284, 0.0, 1807)
-    femmesh.addNode(2088.1354012963575, 2269.5473532559117, 0.0, 1808)
-    femmesh.addNode(7032.115085636925, 308.0564684035237, 0.0, 1809)
-    femmesh.addNode(7014.719789317204, 124.74799179239241, 0.0, 1810)
-    femmesh.addNode(3077.8215246573927, 2370.469911595341, 0.0, 1811)
-    femmesh.addNode(7288.974102421174, 2482.059999279001, 0.0, 1812)
-    femmesh.addNode(7445.008057284679, 2408.9842883236333, 0.0, 1813)
-    femmesh.addNode(7183.533247001819, 5869.978509446724, 0.0, 1814)
-    femmesh.addNode(7331.681395149968, 5869.978509446724, 0.0, 1815)
-    femmesh.addNode(902.7816148150912, 4376.480890332696, 0.0, 1816)
-    femmesh.addNode(759.9742083920619, 4349.829517835253, 0.0, 1817)
-    femmesh.addNode(2449.1785401723328, 3099.237336505863, 0.0, 1818)
-    femmesh.addNode(2359.9379661444354, 2966.084547814653, 0.0, 1819)
-    femmesh.addNode(7865.3141538852915, 5356.042309040155, 0.0, 1820)
-    femmesh.addNode(3355.527573097588, 5858.569906479672, 0.0, 1821)
-    femmesh.addNode(3503.675721245736, 5858.569906479672, 0.0, 1822)
-    femmesh.addNode(3693.6433966943337, 873.8467405155088, 0.0, 1823)
-    femmesh.addNode(3621.2101717073288, 1014.7715245315554, 0.0, 1824)
-    femmesh.addNode(3774.4370065749376, 1080.8765259658132, 0.0, 1825)
-    femmesh.addNode(3614.7831297951334, 1135.3267294675425, 0.0, 1826)
-    femmesh.addNode(7308.168304136851, 3540.3907854193963, 0.0, 1827)
-    femmesh.addNode(7329.519705348524, 3668.438309738362, 0.0, 1828)
-    femmesh.addNode(2351.071561555146, 5464.8016075310625, 0.0, 1829)
-    femmesh.addNode(2517.9439460772987, 5530.8661191260135, 0.0, 1830)
-    femmesh.addNode(2389.0946067443715, 5592.483835165739, 0.0, 1831)
-    femmesh.addNode(7476.708374486895, 3623.3374582747188, 0.0, 1832)
-    femmesh.addNode(7387.218740890208, 3783.6937040089506, 0.0, 1833)
-    femmesh.addNode(264.8159832750697, 4794.274475181297, 0.0, 1834)
-    femmesh.addNode(115.90583442605337, 4878.8892733964185, 0.0, 1835)
-    femmesh.addNode(5066.142806421767, 2936.5613377421214, 0.0, 1836)
-    femmesh.addNode(6610.269149649973, 4508.00993484406, 0.0, 1837)
-    femmesh.addNode(6757.586700596668, 4614.250951643367, 0.0, 1838)
-    femmesh.addNode(4334.870903894452, 5879.9619519579355, 0.0, 1839)
-    femmesh.addNode(4340.567910506723, 5708.837366687199, 0.0, 1840)
-    femmesh.addNode(4450.141451056704, 5828.875414729264, 0.0, 1841)
-    femmesh.addNode(3078.9276225240787, 4324.095807476484, 0.0, 1842)
-    femmesh.addNode(2946.1440390510493, 4429.205442927528, 0.0, 1843)
-    femmesh.addNode(4074.807870057888, 4932.449789978336, 0.0, 1844)
-    femmesh.addNode(4012.842558023305, 4801.062711233935, 0.0, 1845)
-    femmesh.addNode(4141.284010962332, 4780.438160576226, 0.0, 1846)
-    femmesh.addNode(1747.2579783724107, 3875.644415982817, 0.0, 1847)
-    femmesh.addNode(2660.622957582937, 5718.953767887817, 0.0, 1848)
-    femmesh.addNode(2715.9727952830062, 5889.679594507472, 0.0, 1849)
-    femmesh.addNode(7904.05724182452, 2776.4838779695324, 0.0, 1850)
-    femmesh.addNode(7744.4953222567765, 2719.066330219619, 0.0, 1851)
-    femmesh.addNode(7031.978852167146, 5894.103755299298, 0.0, 1852)
-    femmesh.addNode(7104.400988057858, 5764.082264746022, 0.0, 1853)
-    femmesh.addNode(1937.1775113175327, 3840.538160590363, 0.0, 1854)
-    femmesh.addNode(1975.34075937455, 4012.1586933798717, 0.0, 1855)
-    femmesh.addNode(1855.4471574026104, 3942.360709350734, 0.0, 1856)
-    femmesh.addNode(7471.863053455067, 3151.1056498896787, 0.0, 1857)
-    femmesh.addNode(7618.352463471664, 3092.499188113319, 0.0, 1858)
-    femmesh.addNode(4661.4783306005265, 5077.529712672761, 0.0, 1859)
-    femmesh.addNode(4811.519364438349, 5084.000365417214, 0.0, 1860)
-    femmesh.addNode(4772.204216500253, 5205.024788966846, 0.0, 1861)
-    femmesh.addNode(2798.7068677440025, 1787.6258129911243, 0.0, 1862)
-    femmesh.addNode(2834.1870140297374, 1940.7674693071983, 0.0, 1863)
-    femmesh.addNode(4827.883864515266, 4936.8039429423425, 0.0, 1864)
-    femmesh.addNode(6144.39480834965, 1402.428534879095, 0.0, 1865)
-    femmesh.addNode(5990.823752913397, 1310.3062084491094, 0.0, 1866)
-    femmesh.addNode(4136.9778702808835, 234.58247592585707, 0.0, 1867)
-    femmesh.addNode(6610.495799279815, 96.4155087544391, 0.0, 1868)
-    femmesh.addNode(2990.6537116378404, 3421.4299439355646, 0.0, 1869)
-    femmesh.addNode(2829.458720555842, 3483.243870983497, 0.0, 1870)
-    femmesh.addNode(2740.820636317535, 2211.9391300121174, 0.0, 1871)
-    femmesh.addNode(2859.6191451224117, 2178.2996209417324, 0.0, 1872)
-    femmesh.addNode(3908.672078980894, 5859.7542282351, 0.0, 1873)
-    femmesh.addNode(4056.820227129041, 5859.7542282351, 0.0, 1874)
-    femmesh.addNode(6467.247234647448, 5001.545724247097, 0.0, 1875)
-    femmesh.addNode(6591.255959536233, 4974.710635327365, 0.0, 1876)
-    femmesh.addNode(6589.807806515715, 5859.025006498776, 0.0, 1877)
-    femmesh.addNode(6737.955954663863, 5859.025006498776, 0.0, 1878)
-    femmesh.addNode(5078.381324322112, 1062.6655124319248, 0.0, 1879)
-    femmesh.addNode(5092.422025885003, 910.9552513134244, 0.0, 1880)
-    femmesh.addNode(2859.3008525074783, 4804.418507806555, 0.0, 1881)
-    femmesh.addNode(2835.609883304285, 4939.288910469388, 0.0, 1882)
-    femmesh.addNode(960.4225866508884, 5884.503381766299, 0.0, 1883)
-    femmesh.addNode(3891.875561993178, 4839.298287739064, 0.0, 1884)
-    femmesh.addNode(3958.351702897622, 4687.286658336954, 0.0, 1885)
-    femmesh.addNode(2701.965277530323, 1289.8390017920174, 0.0, 1886)
-    femmesh.addNode(2686.070832009581, 1422.2999702533723, 0.0, 1887)
-    femmesh.addNode(605.603006177899, 3881.7563314754566, 0.0, 1888)
-    femmesh.addNode(619.7937607809081, 3727.0940562456517, 0.0, 1889)
-    femmesh.addNode(6518.640164297685, 767.2873666590488, 0.0, 1890)
-    femmesh.addNode(2544.0487402064828, 3852.7056010919828, 0.0, 1891)
-    femmesh.addNode(2676.4794573179215, 3732.72904573479, 0.0, 1892)
-    femmesh.addNode(1600.4381120887474, 4324.401748834931, 0.0, 1893)
-    femmesh.addNode(1754.04487122091, 4337.7239198884345, 0.0, 1894)
-    femmesh.addNode(6710.777454781017, 542.467609048538, 0.0, 1895)
-    femmesh.addNode(6567.375858191516, 466.4642373368417, 0.0, 1896)
-    femmesh.addNode(3597.0397254102018, 4017.7082010103677, 0.0, 1897)
-    femmesh.addNode(3692.166693420489, 3950.8847568771052, 0.0, 1898)
-    femmesh.addNode(2405.8428937046474, 3738.963817978146, 0.0, 1899)
-    femmesh.addNode(5619.887142045157, 5306.876096301861, 0.0, 1900)
-    femmesh.addNode(5572.570296005811, 5428.7320879328745, 0.0, 1901)
-    femmesh.addNode(6546.420083768266, 2143.6364977291387, 0.0, 1902)
-    femmesh.addNode(6534.71285351807, 2003.1437303829262, 0.0, 1903)
-    femmesh.addNode(6661.755972195055, 2060.89762175425, 0.0, 1904)
-    femmesh.addNode(1785.421226429428, 4047.2649487723256, 0.0, 1905)
-    femmesh.addNode(229.11242057140092, 901.0950384454567, 0.0, 1906)
-    femmesh.addNode(114.31190472681524, 972.6873183087745, 0.0, 1907)
-    femmesh.addNode(115.90583442605337, 5028.8892733964185, 0.0, 1908)
-    femmesh.addNode(229.90753311756453, 5100.119235980861, 0.0, 1909)
-    femmesh.addNode(5651.253492858983, 5172.165535363206, 0.0, 1910)
-    femmesh.addNode(2273.6450066794923, 5640.314262947215, 0.0, 1911)
-    femmesh.addNode(2132.2498444518, 2371.7418705284013, 0.0, 1912)
-    femmesh.addNode(1964.6544828830106, 2321.1415322539888, 0.0, 1913)
-    femmesh.addNode(2807.178257839564, 2862.364633570077, 0.0, 1914)
-    femmesh.addNode(2881.058677130637, 3005.9410690973846, 0.0, 1915)
-    femmesh.addNode(2761.4371653960625, 3005.0434977123814, 0.0, 1916)
-    femmesh.addNode(5046.243056726747, 1468.334306036254, 0.0, 1917)
-    femmesh.addNode(5197.7009791400105, 1508.5853743470088, 0.0, 1918)
-    femmesh.addNode(3924.3826261840104, 5566.353830582119, 0.0, 1919)
-    femmesh.addNode(3834.340681907346, 5654.155844297757, 0.0, 1920)
-    femmesh.addNode(2765.008403937973, 4336.461585722394, 0.0, 1921)
-    femmesh.addNode(2763.7599262879953, 4173.709179747522, 0.0, 1922)
-    femmesh.addNode(4052.5730994594905, 5449.276911793069, 0.0, 1923)
-    femmesh.addNode(4093.6827793854254, 5602.431537681148, 0.0, 1924)
-    femmesh.addNode(982.6683693024718, 5503.227450641941, 0.0, 1925)
-    femmesh.addNode(417.2879452566067, 466.8016395220319, 0.0, 1926)
-    femmesh.addNode(508.7444143672392, 326.95944689057853, 0.0, 1927)
-    femmesh.addNode(5450.218313808894, 5509.118768769158, 0.0, 1928)
-    femmesh.addNode(5557.278507213602, 5594.320657597664, 0.0, 1929)
-    femmesh.addNode(470.5308171071142, 2515.3115745530667, 0.0, 1930)
-    femmesh.addNode(630.932919080582, 2568.7912427227966, 0.0, 1931)
-    femmesh.addNode(496.7595784273812, 2628.929840408557, 0.0, 1932)
-    femmesh.addNode(697.0632151891969, 5201.988225101015, 0.0, 1933)
-    femmesh.addNode(833.3415872979735, 5146.418012275519, 0.0, 1934)
-    femmesh.addNode(820.2428164730273, 5283.169730906987, 0.0, 1935)
-    femmesh.addNode(541.1354489900748, 2350.456368850859, 0.0, 1936)
-    femmesh.addNode(406.96210833687405, 2410.594966536619, 0.0, 1937)
-    femmesh.addNode(557.5924610273341, 2748.984203611966, 0.0, 1938)
-    femmesh.addNode(397.1903590538665, 2695.5045354422364, 0.0, 1939)
-    femmesh.addNode(2868.69212630085, 632.9041796646253, 0.0, 1940)
-    femmesh.addNode(2905.2494605337374, 792.9283531346159, 0.0, 1941)
-    femmesh.addNode(7664.578904770944, 3742.8247401726503, 0.0, 1942)
-    femmesh.addNode(7617.032445182774, 3603.132095707422, 0.0, 1943)
-    femmesh.addNode(5688.834075509207, 5635.835371315612, 0.0, 1944)
-    femmesh.addNode(2835.0680853597864, 1087.804777581361, 0.0, 1945)
-    femmesh.addNode(2963.369439976219, 1026.9726322732245, 0.0, 1946)
-    femmesh.addNode(6340.423995102085, 1665.3379852695818, 0.0, 1947)
-    femmesh.addNode(6226.803367498764, 1529.9725840824003, 0.0, 1948)
-    femmesh.addNode(6198.40100231583, 4607.962674867387, 0.0, 1949)
-    femmesh.addNode(6295.655785452038, 4695.889122002292, 0.0, 1950)
-    femmesh.addNode(6141.086104889979, 4721.160980590818, 0.0, 1951)
-    femmesh.addNode(1095.0269737107994, 1554.6450345422584, 0.0, 1952)
-    femmesh.addNode(1104.2637701267145, 1213.6699445437166, 0.0, 1953)
-    femmesh.addNode(958.5007554570523, 1272.825361796577, 0.0, 1954)
-    femmesh.addNode(956.2206870727696, 1162.2577472773928, 0.0, 1955)
-    femmesh.addNode(2199.5709326054184, 5877.104601161822, 0.0, 1956)
-    femmesh.addNode(1734.081020453886, 2787.9723588713723, 0.0, 1957)
-    femmesh.addNode(1891.001108009575, 2851.915795276942, 0.0, 1958)
-    femmesh.addNode(1736.9676219184273, 2902.338765495332, 0.0, 1959)
-    femmesh.addNode(1828.5895853807847, 2634.6256020695173, 0.0, 1960)
-    femmesh.addNode(6134.584287627019, 2987.6289609233636, 0.0, 1961)
-    femmesh.addNode(6101.7290497114745, 4521.373303761668, 0.0, 1962)
-    femmesh.addNode(6256.298730273534, 4496.101445173143, 0.0, 1963)
-    femmesh.addNode(5857.354078933115, 1418.2240730282406, 0.0, 1964)
-    femmesh.addNode(5822.504611999318, 1304.6982930773515, 0.0, 1965)
-    femmesh.addNode(1888.9167951274944, 2477.5189325062656, 0.0, 1966)
-    femmesh.addNode(1844.8023519720516, 2375.3244152337757, 0.0, 1967)
-    femmesh.addNode(5960.852762682323, 1515.7453650780592, 0.0, 1968)
-    femmesh.addNode(1059.1873144795802, 4457.153479875167, 0.0, 1969)
-    femmesh.addNode(1038.1430006814828, 4324.046490503941, 0.0, 1970)
-    femmesh.addNode(943.9554550959066, 4714.485342509688, 0.0, 1971)
-    femmesh.addNode(1094.7388707024388, 4778.633087063434, 0.0, 1972)
-    femmesh.addNode(951.2002861358992, 4832.749925421722, 0.0, 1973)
-    femmesh.addNode(1780.464510430469, 3037.115297889648, 0.0, 1974)
-    femmesh.addNode(1623.54442287478, 2973.171861484078, 0.0, 1975)
-    femmesh.addNode(7695.881976950162, 2857.5668949484207, 0.0, 1976)
-    femmesh.addNode(5066.073965793246, 3770.1498268108467, 0.0, 1977)
-    femmesh.addNode(6309.629407533934, 1018.9383787391344, 0.0, 1978)
-    femmesh.addNode(2122.9942760122385, 3030.256591203203, 0.0, 1979)
-    femmesh.addNode(2231.8819403421817, 2971.23325307748, 0.0, 1980)
-    femmesh.addNode(2210.716645820956, 3133.8060349395278, 0.0, 1981)
-    femmesh.addNode(7024.44415382708, 714.5494111291157, 0.0, 1982)
-    femmesh.addNode(7162.154117822402, 775.847411466983, 0.0, 1983)
-    femmesh.addNode(2135.765057170747, 583.2265580310386, 0.0, 1984)
-    femmesh.addNode(1997.8116526267086, 488.0011916981422, 0.0, 1985)
-    femmesh.addNode(5306.876686569009, 3892.227718920938, 0.0, 1986)
-    femmesh.addNode(7175.249352474062, 3451.329415585643, 0.0, 1987)
-    femmesh.addNode(6925.481021494717, 5565.3732342272815, 0.0, 1988)
-    femmesh.addNode(6883.440836197393, 5438.282119578644, 0.0, 1989)
-    femmesh.addNode(5606.86911812363, 2093.70659134238, 0.0, 1990)
-    femmesh.addNode(5660.464533261258, 2260.0534943780085, 0.0, 1991)
-    femmesh.addNode(285.11217913693537, 2714.4291240584766, 0.0, 1992)
-    femmesh.addNode(116.93344090997864, 2776.7040379390633, 0.0, 1993)
-    femmesh.addNode(4988.972507509319, 857.1114505032854, 0.0, 1994)
-    femmesh.addNode(4893.101089120466, 960.2231076099847, 0.0, 1995)
-    femmesh.addNode(2016.9080134214657, 1939.5556255808235, 0.0, 1996)
-    femmesh.addNode(1896.5057631114096, 2030.8733117837942, 0.0, 1997)
-    femmesh.addNode(1323.6834929207503, 2362.971732976295, 0.0, 1998)
-    femmesh.addNode(1323.8824958973114, 2195.3209915792086, 0.0, 1999)
-    femmesh.addNode(1453.1206788718498, 2310.1831316849275, 0.0, 2000)
-    femmesh.addNode(361.1172557087026, 2293.413435589642, 0.0, 2001)
-    femmesh.addNode(1312.679500735609, 2503.461154840749, 0.0, 2002)
-    femmesh.addNode(2049.2545816915085, 2522.9418628172593, 0.0, 2003)
-    femmesh.addNode(1929.4024507805498, 2577.124745797046, 0.0, 2004)
-    femmesh.addNode(2621.111417919812, 4128.705511745895, 0.0, 2005)
-    femmesh.addNode(2586.805127643279, 4290.876113564129, 0.0, 2006)
-    femmesh.addNode(6555.48563213801, 3021.6568402593944, 0.0, 2007)
-    femmesh.addNode(2964.686401565857, 3727.1623270283053, 0.0, 2008)
-    femmesh.addNode(3062.925705868978, 3801.3223506665336, 0.0, 2009)
-    femmesh.addNode(2911.9994002720605, 3837.4998420857705, 0.0, 2010)
-    femmesh.addNode(4559.593457997189, 5722.662049699071, 0.0, 2011)
-    femmesh.addNode(4553.896451384919, 5893.786634969807, 0.0, 2012)
-    femmesh.addNode(4724.369464557572, 1832.9681339905367, 0.0, 2013)
-    femmesh.addNode(4932.877376845581, 4561.061428400926, 0.0, 2014)
-    femmesh.addNode(5811.981793766906, 5878.868382934923, 0.0, 2015)
-    femmesh.addNode(5817.748976105708, 5718.8525204253, 0.0, 2016)
-    femmesh.addNode(5931.69310826472, 5839.984137490378, 0.0, 2017)
-    femmesh.addNode(3044.4560275336207, 4547.633598909104, 0.0, 2018)
-    femmesh.addNode(2935.004622264955, 4537.233233096503, 0.0, 2019)
-    femmesh.addNode(2203.983337908146, 2627.365123475968, 0.0, 2020)
-    femmesh.addNode(2172.7355001048554, 2471.347683819182, 0.0, 2021)
-    femmesh.addNode(357.0191453164326, 4925.712486559394, 0.0, 2022)
-    femmesh.addNode(390.02345973939555, 4762.208414947855, 0.0, 2023)
-    femmesh.addNode(2019.0236400037904, 2916.9830056210285, 0.0, 2024)
-    femmesh.addNode(1997.8583454825643, 3079.5557874830765, 0.0, 2025)
-    femmesh.addNode(2110.7115754297733, 750.2504614160435, 0.0, 2026)
-    femmesh.addNode(3041.340900653732, 3613.9968653507062, 0.0, 2027)
-    femmesh.addNode(2890.4145950568145, 3650.174356769943, 0.0, 2028)
-    femmesh.addNode(5311.137711930107, 2967.35632674696, 0.0, 2029)
-    femmesh.addNode(5201.974719971546, 2846.855502637292, 0.0, 2030)
-    femmesh.addNode(6176.620599958227, 3478.7754619684, 0.0, 2031)
-    femmesh.addNode(6025.885224029433, 3489.674616050829, 0.0, 2032)
-    femmesh.addNode(3895.154928619901, 930.6495208394973, 0.0, 2033)
-    femmesh.addNode(3823.3517150693233, 825.6290814342326, 0.0, 2034)
-    femmesh.addNode(3937.6425952020913, 795.9572812439036, 0.0, 2035)
-    femmesh.addNode(7862.696186409727, 3065.8765348724437, 0.0, 2036)
-    femmesh.addNode(2285.5350859982673, 3398.9212438450045, 0.0, 2037)
-    femmesh.addNode(2134.088494839776, 3339.431408083173, 0.0, 2038)
-    femmesh.addNode(2253.2755726495034, 3252.3192088270816, 0.0, 2039)
-    femmesh.addNode(3757.9376274800234, 3823.5144088598654, 0.0, 2040)
-    femmesh.addNode(3799.4896348205643, 3980.5001159010535, 0.0, 2041)
-    femmesh.addNode(3947.3972170108864, 3924.7483901974074, 0.0, 2042)
-    femmesh.addNode(3881.6262829513516, 4052.1187382146472, 0.0, 2043)
-    femmesh.addNode(2046.3701964838601, 1468.469720312286, 0.0, 2044)
-    femmesh.addNode(2182.749407243576, 1457.5110268403841, 0.0, 2045)
-    femmesh.addNode(6309.568571257469, 3704.27396738706, 0.0, 2046)
-    femmesh.addNode(6470.406219127042, 3624.1023853203633, 0.0, 2047)
-    femmesh.addNode(7189.547221898076, 1413.6196060209998, 0.0, 2048)
-    femmesh.addNode(7039.384252158704, 1369.4352964596017, 0.0, 2049)
-    femmesh.addNode(2874.950817498702, 1655.2972602927139, 0.0, 2050)
-    femmesh.addNode(2748.8702815829956, 1632.842771485479, 0.0, 2051)
-    femmesh.addNode(2197.6919269761875, 5746.535498570298, 0.0, 2052)
-    femmesh.addNode(4431.063797741977, 4480.107213959832, 0.0, 2053)
-    femmesh.addNode(4267.258892054808, 4509.127878328238, 0.0, 2054)
-    femmesh.addNode(3948.709146240657, 2797.42376769304, 0.0, 2055)
-    femmesh.addNode(3866.7462322586603, 2925.409868960637, 0.0, 2056)
-    femmesh.addNode(3820.7106735845946, 1306.2305276669238, 0.0, 2057)
-    femmesh.addNode(3663.0080112544765, 1261.5447763772179, 0.0, 2058)
-    femmesh.addNode(3497.537051254293, 5563.713867833076, 0.0, 2059)
-    femmesh.addNode(3577.4924723203353, 5652.971522542328, 0.0, 2060)
-    femmesh.addNode(4089.5349859034623, 134.00909568126906, 0.0, 2061)
-    femmesh.addNode(2134.5308489642575, 109.67753616863163, 0.0, 2062)
-    femmesh.addNode(5312.718628907873, 1166.4983181975251, 0.0, 2063)
-    femmesh.addNode(6222.290924853829, 4001.9976645016054, 0.0, 2064)
-    femmesh.addNode(1079.9876943417273, 3545.8533105911742, 0.0, 2065)
-    femmesh.addNode(1045.8966946477672, 3419.1669711684094, 0.0, 2066)
-    femmesh.addNode(1004.0300629388269, 4934.771360211719, 0.0, 2067)
-    femmesh.addNode(853.2466473322945, 4870.6236156579735, 0.0, 2068)
-    femmesh.addNode(4830.323435150298, 1299.6378865566894, 0.0, 2069)
-    femmesh.addNode(4020.790950150148, 4108.498417222629, 0.0, 2070)
-    femmesh.addNode(3872.8833679598265, 4164.250142926276, 0.0, 2071)
-    femmesh.addNode(551.9085475982022, 5895.652885340391, 0.0, 2072)
-    femmesh.addNode(4539.250884690918, 3984.9103855782014, 0.0, 2073)
-    femmesh.addNode(4401.091734194644, 3967.4977028993835, 0.0, 2074)
-    femmesh.addNode(1739.3760215019643, 642.1206217912784, 0.0, 2075)
-    femmesh.addNode(4414.712086359601, 964.1149262439815, 0.0, 2076)
-    femmesh.addNode(4432.560100345837, 1105.6970606519585, 0.0, 2077)
-    femmesh.addNode(2902.88944386623, 4688.434099394707, 0.0, 2078)
-    femmesh.addNode(2804.5774553836586, 4570.005943413131, 0.0, 2079)
-    femmesh.addNode(3736.131063276524, 739.1545009199151, 0.0, 2080)
-    femmesh.addNode(6742.441712167366, 4957.732317566175, 0.0, 2081)
-    femmesh.addNode(6899.619288926972, 4937.769251053827, 0.0, 2082)
-    femmesh.addNode(6853.295633519457, 5058.611014899903, 0.0, 2083)
-    femmesh.addNode(3945.615355042516, 2376.3212266330206, 0.0, 2084)
-    femmesh.addNode(3851.206075049406, 2279.9510227922738, 0.0, 2085)
-    femmesh.addNode(1013.4351897339211, 1043.9426153036084, 0.0, 2086)
-    femmesh.addNode(1052.1721619096795, 897.3599629917585, 0.0, 2087)
-    femmesh.addNode(6985.961643481083, 5682.269782192422, 0.0, 2088)
-    femmesh.addNode(7137.516038315756, 5658.144536339848, 0.0, 2089)
-    femmesh.addNode(1519.8452677808427, 388.03580605075194, 0.0, 2090)
-    femmesh.addNode(1645.941608620948, 401.5448044541864, 0.0, 2091)
-    femmesh.addNode(2873.8152439865144, 2057.5325844996282, 0.0, 2092)
-    femmesh.addNode(2989.84776470916, 2164.3775686253234, 0.0, 2093)
-    femmesh.addNode(4223.585308002688, 5622.639261403985, 0.0, 2094)
-    femmesh.addNode(3935.8342441096834, 4338.594214069401, 0.0, 2095)
-    femmesh.addNode(611.873125946062, 4334.106769829625, 0.0, 2096)
-    femmesh.addNode(733.6362185709941, 4227.651152955843, 0.0, 2097)
-    femmesh.addNode(7581.150352487558, 2432.381567608064, 0.0, 2098)
-    femmesh.addNode(3403.524047294277, 5424.889374396997, 0.0, 2099)
-    femmesh.addNode(1787.7696786472493, 2119.6000411866103, 0.0, 2100)
-    femmesh.addNode(122.33388559878529, 2220.5435551724368, 0.0, 2101)
-    femmesh.addNode(107.16520404830159, 534.4523311883751, 0.0, 2102)
-    femmesh.addNode(221.96571989288725, 612.8600513250573, 0.0, 2103)
-    femmesh.addNode(219.5388987937784, 5385.207576670434, 0.0, 2104)
-    femmesh.addNode(105.53720010226726, 5463.977614085991, 0.0, 2105)
-    femmesh.addNode(1259.259259259257, 133.34608372115665, 0.0, 2106)
-    femmesh.addNode(1282.3138456194688, 2868.7521275506388, 0.0, 2107)
-    femmesh.addNode(1433.723060511657, 2913.1098754544573, 0.0, 2108)
-    femmesh.addNode(948.00360479041, 880.8294566385132, 0.0, 2109)
-    femmesh.addNode(1075.289088974679, 793.4065190475874, 0.0, 2110)
-    femmesh.addNode(6589.536761353122, 2574.932247808146, 0.0, 2111)
-    femmesh.addNode(6460.997526481414, 2481.9823565555043, 0.0, 2112)
-    femmesh.addNode(6575.846367670441, 2422.6849349625427, 0.0, 2113)
-    femmesh.addNode(2947.5439702643134, 898.6912291650685, 0.0, 2114)
-    femmesh.addNode(3039.5603824576574, 751.6023090013214, 0.0, 2115)
-    femmesh.addNode(2536.400969330436, 3484.3843141861344, 0.0, 2116)
-    femmesh.addNode(2392.837877750936, 3425.549413043266, 0.0, 2117)
-    femmesh.addNode(1516.7188628949098, 2976.433528555862, 0.0, 2118)
-    femmesh.addNode(1370.3943890438286, 3051.1480749205566, 0.0, 2119)
-    femmesh.addNode(2087.1932928929655, 4803.017486089089, 0.0, 2120)
-    femmesh.addNode(349.94486876785226, 799.0054127402232, 0.0, 2121)
-    femmesh.addNode(349.45625765008185, 943.2850109123156, 0.0, 2122)
-    femmesh.addNode(2179.505229241481, 4695.819659655164, 0.0, 2123)
-    femmesh.addNode(269.82220153744595, 4177.761905376815, 0.0, 2124)
-    femmesh.addNode(333.80191494586927, 4032.0114400249277, 0.0, 2125)
-    femmesh.addNode(391.6256612038553, 4161.124494027914, 0.0, 2126)
-    femmesh.addNode(6630.144079734002, 713.4466357372087, 0.0, 2127)
-    femmesh.addNode(6756.868396940794, 671.8485645512726, 0.0, 2128)
-    femmesh.addNode(6889.09872000681, 647.2048457307616, 0.0, 2129)
-    femmesh.addNode(6808.465344959794, 818.1838724194323, 0.0, 2130)
-    femmesh.addNode(5948.3528377930525, 238.14633278656453, 0.0, 2131)
-    femmesh.addNode(6085.026401050542, 273.47208248674957, 0.0, 2132)
-    femmesh.addNode(105.99922763972995, 4124.324425686915, 0.0, 2133)
-    femmesh.addNode(913.4057171390466, 5357.127630712532, 0.0, 2134)
-    femmesh.addNode(1714.0797789029489, 2413.71857274216, 0.0, 2135)
-    femmesh.addNode(1789.817466658465, 2257.341172489884, 0.0, 2136)
-    femmesh.addNode(4343.739180673707, 100.573380244588, 0.0, 2137)
-    femmesh.addNode(777.1273450302701, 5412.697843538027, 0.0, 2138)
-    femmesh.addNode(4908.512566250808, 1388.8690790899618, 0.0, 2139)
-    femmesh.addNode(218.06796723691878, 345.9569586599116, 0.0, 2140)
-    femmesh.addNode(107.16520404830159, 384.45233118837507, 0.0, 2141)
-    femmesh.addNode(110.90276318861717, 261.5046274715365, 0.0, 2142)
-    femmesh.addNode(105.53720010226726, 5613.977614085991, 0.0, 2143)
-    femmesh.addNode(216.32598405769025, 5652.694311614887, 0.0, 2144)
-    femmesh.addNode(110.78878395542299, 5738.716697528895, 0.0, 2145)
-    femmesh.addNode(1194.213704220396, 2106.2409471171622, 0.0, 2146)
-    femmesh.addNode(1323.6508901714956, 2053.4523458257954, 0.0, 2147)
-    femmesh.addNode(3439.4562760794015, 4036.9645626917677, 0.0, 2148)
-    femmesh.addNode(5102.323366317663, 3637.623711727803, 0.0, 2149)
-    femmesh.addNode(5192.053116432853, 3778.276271536206, 0.0, 2150)
-    femmesh.addNode(2743.606969362506, 1039.0218085536048, 0.0, 2151)
-    femmesh.addNode(2576.3704242610265, 1085.2182210809174, 0.0, 2152)
-    femmesh.addNode(6804.3613253016465, 2116.410331309036, 0.0, 2153)
-    femmesh.addNode(6792.65409505145, 1975.9175639628234, 0.0, 2154)
-    femmesh.addNode(2752.8042214679663, 3596.4093326610955, 0.0, 2155)
-    femmesh.addNode(1988.9273719447988, 2680.048532380511, 0.0, 2156)
-    femmesh.addNode(3041.1563155074246, 1725.8995436728155, 0.0, 2157)
-    femmesh.addNode(1100.281604188516, 682.3965648871836, 0.0, 2158)
-    femmesh.addNode(1223.0367794568297, 669.4698396757713, 0.0, 2159)
-    femmesh.addNode(366.4010352573292, 5784.369582869286, 0.0, 2160)
-    femmesh.addNode(403.7603994500542, 5895.652885340391, 0.0, 2161)
-    femmesh.addNode(258.93693210357094, 5888.716697528895, 0.0, 2162)
-    femmesh.addNode(6472.549222137908, 637.9064111563141, 0.0, 2163)
-    femmesh.addNode(3220.21226513397, 4264.997464950411, 0.0, 2164)
-    femmesh.addNode(3300.3036115071172, 4412.736026789735, 0.0, 2165)
-    femmesh.addNode(3182.351147101589, 4356.324368052165, 0.0, 2166)
-    femmesh.addNode(1323.0632877363346, 5198.36581262421, 0.0, 2167)
-    femmesh.addNode(1092.4349912400621, 3809.8866812990364, 0.0, 2168)
-    femmesh.addNode(1228.641778249933, 3825.032690734036, 0.0, 2169)
-    femmesh.addNode(1110.2490055424669, 3927.9708066331245, 0.0, 2170)
-    femmesh.addNode(5432.862246156699, 1659.8085310110405, 0.0, 2171)
-    femmesh.addNode(5312.247359812849, 1535.7183175122905, 0.0, 2172)
-    femmesh.addNode(4284.579771678116, 743.0682159667602, 0.0, 2173)
-    femmesh.addNode(4339.5006478753985, 877.8269672713129, 0.0, 2174)
-    femmesh.addNode(7869.253322910761, 4723.916159348964, 0.0, 2175)
-    femmesh.addNode(7869.253322910761, 4573.916159348964, 0.0, 2176)
-    femmesh.addNode(2414.7491299018284, 1299.415971174509, 0.0, 2177)
-    femmesh.addNode(2512.8936954094506, 1188.247910036332, 0.0, 2178)
-    femmesh.addNode(5907.448716416637, 3538.9300693246923, 0.0, 2179)
-    femmesh.addNode(5789.796822400842, 3680.0852525336304, 0.0, 2180)
-    femmesh.addNode(3551.203558284512, 5030.119083462583, 0.0, 2181)
-    femmesh.addNode(3713.064977211434, 5035.298981618609, 0.0, 2182)
-    femmesh.addNode(3544.6030790878176, 4899.376238577994, 0.0, 2183)
-    femmesh.addNode(6255.063988027521, 4362.120848560535, 0.0, 2184)
-    femmesh.addNode(2150.775005635456, 4226.542046895456, 0.0, 2185)
-    femmesh.addNode(1982.3726521854378, 4222.2762911864775, 0.0, 2186)
-    femmesh.addNode(2062.012758909646, 4118.246997849221, 0.0, 2187)
-    femmesh.addNode(5834.149784716776, 2263.3079993690417, 0.0, 2188)
-    femmesh.addNode(5761.673380345992, 2365.346989404023, 0.0, 2189)
-    femmesh.addNode(1495.8199231385202, 5718.564900509944, 0.0, 2190)
-    femmesh.addNode(1550.58628059581, 5886.806208536376, 0.0, 2191)
-    femmesh.addNode(3979.885036149308, 3498.4802202200585, 0.0, 2192)
-    femmesh.addNode(4079.391222570686, 3591.950624184464, 0.0, 2193)
-    femmesh.addNode(2139.2190761347856, 5178.57969758471, 0.0, 2194)
-    femmesh.addNode(2035.440833527116, 5310.98145928874, 0.0, 2195)
-    femmesh.addNode(3159.018968897226, 4471.8343693158085, 0.0, 2196)
-    femmesh.addNode(3147.8795521111315, 4579.862159484784, 0.0, 2197)
-    femmesh.addNode(3703.4463807042207, 5701.600063430739, 0.0, 2198)
-    femmesh.addNode(3577.749795319809, 5765.768353847754, 0.0, 2199)
-    femmesh.addNode(3322.681248862429, 3102.725019119357, 0.0, 2200)
-    femmesh.addNode(2009.0042761548657, 3448.587510522422, 0.0, 2201)
-    femmesh.addNode(1976.7447628061018, 3301.985475504499, 0.0, 2202)
-    femmesh.addNode(7335.781866850299, 1450.367997192385, 0.0, 2203)
-    femmesh.addNode(7298.808459317808, 1301.5625737448872, 0.0, 2204)
-    femmesh.addNode(6433.342048945007, 2207.808825033858, 0.0, 2205)
-    femmesh.addNode(6560.385167621993, 2265.562716405182, 0.0, 2206)
-    femmesh.addNode(6344.1602456867, 5084.7892642009865, 0.0, 2207)
-    femmesh.addNode(6363.3068733518685, 4954.090729196368, 0.0, 2208)
-    femmesh.addNode(5420.48293620857, 1073.0812647283215, 0.0, 2209)
-    femmesh.addNode(5636.4469701179205, 1071.1427313877293, 0.0, 2210)
-    femmesh.addNode(5521.562629515254, 1090.2991077312333, 0.0, 2211)
-    femmesh.addNode(278.23760289704717, 1514.9346070429979, 0.0, 2212)
-    femmesh.addNode(115.9124845934236, 1568.7618953528586, 0.0, 2213)
-    femmesh.addNode(5103.528122822843, 1686.2812414461969, 0.0, 2214)
-    femmesh.addNode(5053.2724110641775, 1841.9882919767379, 0.0, 2215)
-    femmesh.addNode(1051.8538532787088, 4028.3488181723155, 0.0, 2216)
-    femmesh.addNode(1005.7013945209077, 4193.623370053989, 0.0, 2217)
-    femmesh.addNode(927.8897597747948, 4078.0993490797973, 0.0, 2218)
-    femmesh.addNode(4666.586453120597, 5493.698449588381, 0.0, 2219)
-    femmesh.addNode(4621.383858353274, 5614.038132439276, 0.0, 2220)
-    femmesh.addNode(3918.1728968318985, 3349.2515745121373, 0.0, 2221)
-    femmesh.addNode(3856.021579839062, 3472.4683516780933, 0.0, 2222)
-    femmesh.addNode(1431.3744672554456, 4538.966189024446, 0.0, 2223)
-    femmesh.addNode(1265.489970927942, 4528.35996042485, 0.0, 2224)
-    femmesh.addNode(7726.825377946028, 1942.2272502505975, 0.0, 2225)
-    femmesh.addNode(7890.914159617989, 1969.6823553603576, 0.0, 2226)
-    femmesh.addNode(7835.9112183280395, 2072.54489489024, 0.0, 2227)
-    femmesh.addNode(7624.124586218421, 2280.7844078576386, 0.0, 2228)
-    femmesh.addNode(7723.850394595375, 2433.5677447497474, 0.0, 2229)
-    femmesh.addNode(2602.790930382124, 5344.664757077794, 0.0, 2230)
-    femmesh.addNode(2452.030834905928, 5265.746730474879, 0.0, 2231)
-    femmesh.addNode(6000.038358016767, 84.85350532801614, 0.0, 2232)
-    femmesh.addNode(6806.1573192643755, 2255.2599571703895, 0.0, 2233)
-    femmesh.addNode(6937.055442120771, 2170.279899378963, 0.0, 2234)
-    femmesh.addNode(456.59054196021316, 4259.4016821650075, 0.0, 2235)
-    femmesh.addNode(2875.5000635273027, 5450.603180186572, 0.0, 2236)
-    femmesh.addNode(2736.1713142964963, 5407.3184002070575, 0.0, 2237)
-    femmesh.addNode(520.5702553686365, 4113.651216813121, 0.0, 2238)
-    femmesh.addNode(4725.138858681489, 5678.94935267982, 0.0, 2239)
-    femmesh.addNode(867.672175064259, 1103.0980325564688, 0.0, 2240)
-    femmesh.addNode(4612.257019158057, 1857.3018836995557, 0.0, 2241)
-    femmesh.addNode(4631.663732506628, 1713.5254760795217, 0.0, 2242)
-    femmesh.addNode(5165.473966646443, 1611.2809824782546, 0.0, 2243)
-    femmesh.addNode(1491.483298033678, 4655.838166337262, 0.0, 2244)
-    femmesh.addNode(244.04867770733344, 2209.7428223064157, 0.0, 2245)
-    femmesh.addNode(518.4476741122903, 4790.486231347066, 0.0, 2246)
-    femmesh.addNode(677.5427984865944, 4727.964108618078, 0.0, 2247)
-    femmesh.addNode(6401.074322406835, 3457.8401533400597, 0.0, 2248)
-    femmesh.addNode(2675.4711781813003, 1541.6784059236938, 0.0, 2249)
-    femmesh.addNode(2107.3207316237526, 3586.4829150275527, 0.0, 2250)
-    femmesh.addNode(3735.665386497428, 3428.4265957897655, 0.0, 2251)
-    femmesh.addNode(3593.0193578296266, 3410.838213366608, 0.0, 2252)
-    femmesh.addNode(3629.6296296296214, 5907.198447368082, 0.0, 2253)
-    femmesh.addNode(3969.469575994247, 4552.804844018185, 0.0, 2254)
-    femmesh.addNode(3987.4372362959184, 2534.404134861873, 0.0, 2255)
-    femmesh.addNode(4078.573499719767, 2434.240662785238, 0.0, 2256)
-    femmesh.addNode(4186.722755746305, 5879.9619519579355, 0.0, 2257)
-    femmesh.addNode(7890.914159617989, 1819.6823553603576, 0.0, 2258)
-    femmesh.addNode(7870.910225369618, 1425.0, 0.0, 2259)
-    femmesh.addNode(7870.910225369618, 1275.0, 0.0, 2260)
-    femmesh.addNode(6866.5716411690555, 124.74799179239241, 0.0, 2261)
-    femmesh.addNode(7559.33340964109, 3487.8767014368336, 0.0, 2262)
-    femmesh.addNode(7425.711445865734, 3378.524028650869, 0.0, 2263)
-    femmesh.addNode(4599.87396111443, 4097.525734443105, 0.0, 2264)
-    femmesh.addNode(3765.1238050583524, 1991.5513807924126, 0.0, 2265)
-    femmesh.addNode(3768.745103804172, 2170.829827966237, 0.0, 2266)
-    femmesh.addNode(351.69790691313676, 5051.4450770115, 0.0, 2267)
-    femmesh.addNode(349.7937711785945, 5193.785766199524, 0.0, 2268)
-    femmesh.addNode(3954.29064722113, 2167.03655973035, 0.0, 2269)
-    femmesh.addNode(5349.774749851744, 225.05735254665314, 0.0, 2270)
-    femmesh.addNode(5260.121680093729, 106.03318115563226, 0.0, 2271)
-    femmesh.addNode(5422.986403091337, 119.02417139102087, 0.0, 2272)
-    femmesh.addNode(6972.734766711699, 5180.3988864382645, 0.0, 2273)
-    femmesh.addNode(684.2473493622629, 1269.0568003803999, 0.0, 2274)
-    femmesh.addNode(519.911167964922, 1210.1671762069536, 0.0, 2275)
-    femmesh.addNode(601.525756935062, 1423.0467934633975, 0.0, 2276)
-    femmesh.addNode(4132.645815527791, 4522.894754626648, 0.0, 2277)
-    femmesh.addNode(4022.7966925942883, 4426.648516813008, 0.0, 2278)
-    femmesh.addNode(2307.611063523833, 5216.809762855928, 0.0, 2279)
-    femmesh.addNode(6806.97184386805, 5753.128761798074, 0.0, 2280)
-    femmesh.addNode(6883.8307040189975, 5894.103755299298, 0.0, 2281)
-    femmesh.addNode(5682.423351996169, 2473.1204054741647, 0.0, 2282)
-    femmesh.addNode(5651.450237182475, 2629.648693355067, 0.0, 2283)
-    femmesh.addNode(5557.015014076781, 2518.6207722938916, 0.0, 2284)
-    femmesh.addNode(6061.175605781594, 1761.2377989538459, 0.0, 2285)
-    femmesh.addNode(6043.261321831436, 1643.2894142813643, 0.0, 2286)
-    femmesh.addNode(5856.108603451687, 2476.3749104651984, 0.0, 2287)
-    femmesh.addNode(2536.4277788531863, 1463.4641573899976, 0.0, 2288)
-    femmesh.addNode(3124.5363245561475, 451.08367804190334, 0.0, 2289)
-    femmesh.addNode(3209.9752350559697, 369.58313337508775, 0.0, 2290)
-    femmesh.addNode(6056.180269888446, 1910.2129210796688, 0.0, 2291)
-    femmesh.addNode(6185.4950022522735, 1827.8952089324314, 0.0, 2292)
-    femmesh.addNode(5479.9108472077705, 2418.777637569393, 0.0, 2293)
-    femmesh.addNode(5336.969693485171, 2357.2070719138624, 0.0, 2294)
-    femmesh.addNode(3097.073728736894, 614.4576642980824, 0.0, 2295)
-    femmesh.addNode(3024.7284685463346, 482.46544671468973, 0.0, 2296)
-    femmesh.addNode(5448.937732394076, 2575.305925450295, 0.0, 2297)
-    femmesh.addNode(3957.140937022644, 1508.2175924067838, 0.0, 2298)
-    femmesh.addNode(3993.513256214237, 1350.2198989274975, 0.0, 2299)
-    femmesh.addNode(4077.242810730434, 1447.4081669022337, 0.0, 2300)
-    femmesh.addNode(6263.730554272444, 117.47943196069464, 0.0, 2301)
-    femmesh.addNode(2276.357360839713, 1398.018391909584, 0.0, 2302)
-    femmesh.addNode(2408.635663619351, 1442.688142454751, 0.0, 2303)
-    femmesh.addNode(2615.523582816949, 3565.798559948343, 0.0, 2304)
-    femmesh.addNode(5076.375693568934, 788.8920189431374, 0.0, 2305)
-    femmesh.addNode(752.5445905477064, 1774.5202439268849, 0.0, 2306)
-    femmesh.addNode(628.2510041854574, 1652.240400154422, 0.0, 2307)
-    femmesh.addNode(4568.613810082554, 4443.321216931354, 0.0, 2308)
-    femmesh.addNode(4486.094864322358, 4584.7313322065265, 0.0, 2309)
-    femmesh.addNode(2300.3602261328915, 251.10589758032114, 0.0, 2310)
-    femmesh.addNode(2337.0263113020856, 407.7327484567495, 0.0, 2311)
-    femmesh.addNode(1023.7445531019662, 1408.6426779993749, 0.0, 2312)
-    femmesh.addNode(3978.48925755599, 5297.687259382592, 0.0, 2313)
-    femmesh.addNode(3919.4744122954903, 5167.363945793937, 0.0, 2314)
-    femmesh.addNode(7883.412314163119, 2340.985292499661, 0.0, 2315)
-    femmesh.addNode(2922.2171915288045, 4002.4800654445908, 0.0, 2316)
-    femmesh.addNode(7284.267698537137, 1917.8673882414973, 0.0, 2317)
-    femmesh.addNode(7306.234586862327, 2063.963116896591, 0.0, 2318)
-    femmesh.addNode(7183.11358524883, 2006.9795705853064, 0.0, 2319)
-    femmesh.addNode(3842.604318912467, 3054.3267766741105, 0.0, 2320)
-    femmesh.addNode(3885.1037730462303, 3231.6456492380794, 0.0, 2321)
-    femmesh.addNode(1500.8365723925306, 5612.491689013663, 0.0, 2322)
-    femmesh.addNode(7243.423425557955, 5591.002886373262, 0.0, 2323)
-    femmesh.addNode(7385.454700595449, 5490.191897550645, 0.0, 2324)
-    femmesh.addNode(7397.986657930025, 5639.1460300708295, 0.0, 2325)
-    femmesh.addNode(785.4929079359906, 4108.427483429939, 0.0, 2326)
-    femmesh.addNode(441.34363146433276, 1354.5229298054128, 0.0, 2327)
-    femmesh.addNode(484.83236207797637, 1460.8692870382638, 0.0, 2328)
-    femmesh.addNode(1177.82625911983, 1470.2399156057843, 0.0, 2329)
-    femmesh.addNode(1222.788131331175, 1315.0431616852973, 0.0, 2330)
-    femmesh.addNode(1294.070551940008, 1461.0455182281808, 0.0, 2331)
-    femmesh.addNode(782.2250360398752, 2326.7993293606614, 0.0, 2332)
-    femmesh.addNode(817.3955750619575, 2166.668140706004, 0.0, 2333)
-    femmesh.addNode(1412.0209202009983, 1398.0178188316372, 0.0, 2334)
-    femmesh.addNode(542.9961288993845, 1583.7786069338063, 0.0, 2335)
-    femmesh.addNode(382.8140034286554, 1515.2547432758215, 0.0, 2336)
-    femmesh.addNode(476.0370077274794, 972.4146506952213, 0.0, 2337)
-    femmesh.addNode(6746.491221881684, 5636.232213832933, 0.0, 2338)
-    femmesh.addNode(6892.365971236818, 5671.310962633455, 0.0, 2339)
-    femmesh.addNode(4949.513525319367, 3428.022319097815, 0.0, 2340)
-    femmesh.addNode(3378.3524073609483, 3248.7894743907264, 0.0, 2341)
-    femmesh.addNode(4180.441565880041, 1385.2155424400858, 0.0, 2342)
-    femmesh.addNode(4144.0692466884475, 1543.213235919372, 0.0, 2343)
-    femmesh.addNode(1211.962640586179, 4656.184672477344, 0.0, 2344)
-    femmesh.addNode(1141.021370004209, 4532.543792098906, 0.0, 2345)
-    femmesh.addNode(3235.143845328288, 3320.180102717005, 0.0, 2346)
-    femmesh.addNode(3365.8088211533905, 3359.453569450136, 0.0, 2347)
-    femmesh.addNode(1005.6599841378174, 4584.978191927661, 0.0, 2348)
-    femmesh.addNode(5343.126087093426, 3759.7016038378943, 0.0, 2349)
-    femmesh.addNode(476.3245810279854, 3675.100488306136, 0.0, 2350)
-    femmesh.addNode(6039.839792973478, 5736.051854305991, 0.0, 2351)
-    femmesh.addNode(6034.072610634676, 5896.067716815613, 0.0, 2352)
-    femmesh.addNode(4724.539138080684, 3879.8521361045114, 0.0, 2353)
-    femmesh.addNode(728.3852605829661, 2438.2960656583386, 0.0, 2354)
-    femmesh.addNode(5048.63093587988, 2472.9650724552275, 0.0, 2355)
-    femmesh.addNode(5190.07296768651, 2564.5168410614115, 0.0, 2356)
-    femmesh.addNode(4200.895429533289, 1823.9546370893156, 0.0, 2357)
-    femmesh.addNode(4360.715161839882, 1832.5462620969483, 0.0, 2358)
-    femmesh.addNode(2371.3078228737295, 4357.410141417675, 0.0, 2359)
-    femmesh.addNode(2246.372338457064, 4254.849451797576, 0.0, 2360)
-    femmesh.addNode(3993.698451029044, 1996.67767316947, 0.0, 2361)
-    femmesh.addNode(2610.504161533043, 1241.0560327642613, 0.0, 2362)
-    femmesh.addNode(2765.442006381899, 1186.8093128366027, 0.0, 2363)
-    femmesh.addNode(6031.885498192052, 4788.388776411837, 0.0, 2364)
-    femmesh.addNode(5911.911163459012, 4863.674236303366, 0.0, 2365)
-    femmesh.addNode(5923.856987020729, 4708.519993347441, 0.0, 2366)
-    femmesh.addNode(7286.090387282423, 3419.020694170377, 0.0, 2367)
-    femmesh.addNode(6129.14028132826, 4876.315223546742, 0.0, 2368)
-    femmesh.addNode(3663.8180092765756, 3663.756267722638, 0.0, 2369)
-    femmesh.addNode(3797.377525814837, 3577.655241497687, 0.0, 2370)
-    femmesh.addNode(3784.1742026182096, 3707.798023610966, 0.0, 2371)
-    femmesh.addNode(6961.2820370341105, 2430.5306858727495, 0.0, 2372)
-    femmesh.addNode(6821.618519312824, 2412.38217572775, 0.0, 2373)
-    femmesh.addNode(4163.547062261613, 1658.9375765627624, 0.0, 2374)
-    femmesh.addNode(4078.2188588105164, 1770.4229209080731, 0.0, 2375)
-    femmesh.addNode(4311.743405990881, 1165.2881532354422, 0.0, 2376)
-    femmesh.addNode(4226.370052043458, 1294.1605890939854, 0.0, 2377)
-    femmesh.addNode(2931.9671225196457, 269.2843737173223, 0.0, 2378)
-    femmesh.addNode(2887.3530718183306, 109.73864348806697, 0.0, 2379)
-    femmesh.addNode(1233.6060741626293, 3084.745919409138, 0.0, 2380)
-    femmesh.addNode(7483.715458329985, 1450.3539772910274, 0.0, 2381)
-    femmesh.addNode(7374.454220910253, 1562.41100956714, 0.0, 2382)
-    femmesh.addNode(6088.226950014987, 2417.976531869165, 0.0, 2383)
-    femmesh.addNode(6134.123109319581, 2545.1496486351202, 0.0, 2384)
-    femmesh.addNode(5981.254791106105, 2495.774611161012, 0.0, 2385)
-    femmesh.addNode(2964.4156336164856, 1926.8454169907893, 0.0, 2386)
-    femmesh.addNode(7595.445078651803, 4034.4888425202735, 0.0, 2387)
-    femmesh.addNode(4147.789410757405, 5333.764966481622, 0.0, 2388)
-    femmesh.addNode(3163.6532228854803, 4693.0756837373065, 0.0, 2389)
-    femmesh.addNode(3550.1444435941503, 3588.5356899986855, 0.0, 2390)
-    femmesh.addNode(3466.1424689505743, 3465.760417755935, 0.0, 2391)
-    femmesh.addNode(3923.3624172998075, 1264.1747349529553, 0.0, 2392)
-    femmesh.addNode(3998.108632906041, 1876.616042541863, 0.0, 2393)
-    femmesh.addNode(3960.7602656343647, 1711.5989820153097, 0.0, 2394)
-    femmesh.addNode(977.5435159496644, 3774.7232823360196, 0.0, 2395)
-    femmesh.addNode(5294.574299708302, 2588.8736449583093, 0.0, 2396)
-    femmesh.addNode(5524.439605680094, 591.1605143232691, 0.0, 2397)
-    femmesh.addNode(5663.5270192135895, 532.0947148342314, 0.0, 2398)
-    femmesh.addNode(3789.5091927760964, 1717.5121107345985, 0.0, 2399)
-    femmesh.addNode(3769.5339869353493, 1871.4897501648056, 0.0, 2400)
-    femmesh.addNode(3869.619418680572, 1611.3189891008087, 0.0, 2401)
-    femmesh.addNode(3891.497144018285, 3737.4133826349143, 0.0, 2402)
-    femmesh.addNode(7883.412314163119, 2190.985292499661, 0.0, 2403)
-    femmesh.addNode(7719.323532491159, 2163.530187389901, 0.0, 2404)
-    femmesh.addNode(5571.1345512394855, 119.02417139102087, 0.0, 2405)
-    femmesh.addNode(4095.394834727208, 5739.716180193035, 0.0, 2406)
-    femmesh.addNode(6443.627701319943, 524.9708083217083, 0.0, 2407)
-    femmesh.addNode(6426.950421937234, 407.36936542407597, 0.0, 2408)
-    femmesh.addNode(3050.8814379704413, 1857.1783428926346, 0.0, 2409)
-    femmesh.addNode(6688.9244024937, 2358.5126076578235, 0.0, 2410)
-    femmesh.addNode(2460.0762051803913, 3620.7040272598288, 0.0, 2411)
-    femmesh.addNode(4020.1797335369106, 726.5424704676972, 0.0, 2412)
-    femmesh.addNode(7448.859880910843, 1652.6270012929142, 0.0, 2413)
-    femmesh.addNode(7300.926289431156, 1652.6410211942718, 0.0, 2414)
-    femmesh.addNode(6199.552138529563, 421.55654536320475, 0.0, 2415)
-    femmesh.addNode(5667.59717916392, 272.31699884956925, 0.0, 2416)
-    femmesh.addNode(5717.436503704574, 2738.718171980015, 0.0, 2417)
-    femmesh.addNode(5592.028165785186, 2784.218538799742, 0.0, 2418)
-    femmesh.addNode(3312.0308350021464, 322.4440451423345, 0.0, 2419)
-    femmesh.addNode(5776.8802221853475, 2849.623155216233, 0.0, 2420)
-    femmesh.addNode(5836.302293582637, 2695.053309771558, 0.0, 2421)
-    femmesh.addNode(1273.6175606474137, 5096.826954832783, 0.0, 2422)
-    femmesh.addNode(1132.9074387762719, 5005.765038226646, 0.0, 2423)
-    femmesh.addNode(4702.0445995330665, 5893.786634969807, 0.0, 2424)
-    femmesh.addNode(3870.661708377955, 1159.3759381878317, 0.0, 2425)
-    femmesh.addNode(4158.242274240241, 3670.950295881611, 0.0, 2426)
-    femmesh.addNode(3996.584770826026, 3700.6966690831614, 0.0, 2427)
-    femmesh.addNode(2382.3824813061697, 523.3847523617887, 0.0, 2428)
-    femmesh.addNode(2499.2910614398543, 631.486556812249, 0.0, 2429)
-    femmesh.addNode(2924.645499533749, 542.859682598108, 0.0, 2430)
-    femmesh.addNode(2952.1080953530027, 379.48569634192893, 0.0, 2431)
-    femmesh.addNode(6303.994112152046, 5884.828693167936, 0.0, 2432)
-    femmesh.addNode(6452.142260300196, 5884.828693167936, 0.0, 2433)
-    femmesh.addNode(3219.1815279272582, 5878.55491741685, 0.0, 2434)
-    femmesh.addNode(637.746473287187, 1888.5440129349008, 0.0, 2435)
-    femmesh.addNode(6906.599521239654, 4820.83137685584, 0.0, 2436)
-    femmesh.addNode(7017.4534425917445, 4921.710074189568, 0.0, 2437)
-    femmesh.addNode(6357.891594196279, 2550.79061937219, 0.0, 2438)
-    femmesh.addNode(6344.201200513598, 2398.543306526587, 0.0, 2439)
-    femmesh.addNode(4135.481541320207, 2342.324176319329, 0.0, 2440)
-    femmesh.addNode(4177.30342257361, 2500.407084548181, 0.0, 2441)
-    femmesh.addNode(5909.24663219256, 744.0815573421803, 0.0, 2442)
-    femmesh.addNode(2613.301284802446, 5465.837534620601, 0.0, 2443)
-    femmesh.addNode(2651.324329991671, 5593.519762255277, 0.0, 2444)
-    femmesh.addNode(7492.805230065594, 3889.2757950003656, 0.0, 2445)
-    femmesh.addNode(7637.047258614788, 3883.8059000652147, 0.0, 2446)
-    femmesh.addNode(4689.57224860335, 2629.688525923396, 0.0, 2447)
-    femmesh.addNode(5048.563303244298, 194.3150999414254, 0.0, 2448)
-    femmesh.addNode(4973.626808335743, 88.28191878579314, 0.0, 2449)
-    femmesh.addNode(5111.973531945581, 106.03318115563226, 0.0, 2450)
-    femmesh.addNode(7767.616411639355, 4500.2294795710095, 0.0, 2451)
-    femmesh.addNode(7898.3630887285935, 4426.313320222045, 0.0, 2452)
-    femmesh.addNode(7886.0012637016725, 1708.767497656865, 0.0, 2453)
-    femmesh.addNode(7886.0012637016725, 1558.767497656865, 0.0, 2454)
-    femmesh.addNode(4151.759431047803, 635.2388467612418, 0.0, 2455)
-    femmesh.addNode(1952.333055088276, 4391.573609792662, 0.0, 2456)
-    femmesh.addNode(1863.5708083624659, 4283.278560746427, 0.0, 2457)
-    femmesh.addNode(7745.415303323853, 400.39687199404636, 0.0, 2458)
-    femmesh.addNode(7784.278005306229, 568.7663013812521, 0.0, 2459)
-    femmesh.addNode(7444.406622130618, 2127.2245826343687, 0.0, 2460)
-    femmesh.addNode(7539.605568403356, 2009.970362166631, 0.0, 2461)
-    femmesh.addNode(7576.623490383342, 2162.3440102482177, 0.0, 2462)
-    femmesh.addNode(4099.010483643227, 4308.684124677864, 0.0, 2463)
-    femmesh.addNode(4536.756240635801, 5078.465349141033, 0.0, 2464)
-    femmesh.addNode(4489.433627364148, 5197.806939952097, 0.0, 2465)
-    femmesh.addNode(391.3301942035577, 3781.6911850801857, 0.0, 2466)
-    femmesh.addNode(488.78143605654463, 3902.7028128642664, 0.0, 2467)
-    femmesh.addNode(358.1541327592917, 3894.362400891946, 0.0, 2468)
-    femmesh.addNode(7070.16996086603, 2092.2527863790046, 0.0, 2469)
-    femmesh.addNode(7071.96595482876, 2231.1024122403583, 0.0, 2470)
-    femmesh.addNode(6215.386832448854, 2344.1273978550366, 0.0, 2471)
-    femmesh.addNode(6062.518514235378, 2294.7523603809286, 0.0, 2472)
-    femmesh.addNode(7048.20307254084, 1946.1570577239108, 0.0, 2473)
-    femmesh.addNode(2095.58988040597, 877.2733777852054, 0.0, 2474)
-    femmesh.addNode(1988.0886251248583, 760.8672583411192, 0.0, 2475)
-    femmesh.addNode(116.93344090997864, 2926.7040379390633, 0.0, 2476)
-    femmesh.addNode(6711.647695441646, 5460.873543069259, 0.0, 2477)
-    femmesh.addNode(6108.081778996308, 1551.3760376033033, 0.0, 2478)
-    femmesh.addNode(5824.70042422002, 4329.6091104888765, 0.0, 2479)
-    femmesh.addNode(7893.881038120153, 4843.5549745512035, 0.0, 2480)
-    femmesh.addNode(1141.368266175176, 111.58761124481902, 0.0, 2481)
-    femmesh.addNode(476.9053833774626, 5019.379016778057, 0.0, 2482)
-    femmesh.addNode(6523.431548297397, 5743.853699666712, 0.0, 2483)
-    femmesh.addNode(5433.574452807978, 338.6273359773226, 0.0, 2484)
-    femmesh.addNode(7490.498456607675, 1869.0524349644654, 0.0, 2485)
-    femmesh.addNode(7622.715324860397, 1904.1718625783144, 0.0, 2486)
-    femmesh.addNode(7342.651721469343, 5363.1073978211125, 0.0, 2487)
-    femmesh.addNode(7497.214953841412, 5411.25054151868, 0.0, 2488)
-    femmesh.addNode(7042.684886885738, 4619.528440395774, 0.0, 2489)
-    femmesh.addNode(7111.832226635993, 4729.302781142092, 0.0, 2490)
-    femmesh.addNode(6955.28633515417, 4694.997859245264, 0.0, 2491)
-    femmesh.addNode(7144.62556010957, 4509.727608611854, 0.0, 2492)
-    femmesh.addNode(4660.543610730827, 4012.524389360341, 0.0, 2493)
-    femmesh.addNode(1352.6680902943776, 3751.0729036879484, 0.0, 2494)
-    femmesh.addNode(3996.815870595645, 2652.476664660566, 0.0, 2495)
-    femmesh.addNode(303.5960646867263, 412.2733005692271, 0.0, 2496)
-    femmesh.addNode(307.3336238270419, 289.3255968523885, 0.0, 2497)
-    femmesh.addNode(293.1128334507542, 5576.877308629781, 0.0, 2498)
-    femmesh.addNode(298.36441730390993, 5701.616392072685, 0.0, 2499)
-    femmesh.addNode(1833.958999174059, 1197.1804591443322, 0.0, 2500)
-    femmesh.addNode(1748.2149554623961, 1314.5166849052007, 0.0, 2501)
-    femmesh.addNode(3361.1546472566392, 4805.598534916015, 0.0, 2502)
-    femmesh.addNode(3491.396685351312, 4771.150712394583, 0.0, 2503)
-    femmesh.addNode(7054.104035233547, 2367.4395889335037, 0.0, 2504)
-    femmesh.addNode(7762.190908609022, 1197.4832181402292, 0.0, 2505)
-    femmesh.addNode(7891.280683239404, 1122.4832181402292, 0.0, 2506)
-    femmesh.addNode(1191.1573258678427, 2964.163301780661, 0.0, 2507)
-    femmesh.addNode(5081.213035609355, 677.2159977239722, 0.0, 2508)
-    femmesh.addNode(130.3514454531524, 3686.6753865539326, 0.0, 2509)
-    femmesh.addNode(130.3514454531524, 3836.6753865539326, 0.0, 2510)
-    femmesh.addNode(2852.206331759554, 5578.704856435921, 0.0, 2511)
-    femmesh.addNode(5841.361638860113, 3934.5377541835705, 0.0, 2512)
-    femmesh.addNode(5701.680088516518, 384.0321692576015, 0.0, 2513)
-    femmesh.addNode(6185.089031514185, 2098.8867787125273, 0.0, 2514)
-    femmesh.addNode(6068.128082529345, 2156.0370375940133, 0.0, 2515)
-    femmesh.addNode(6063.538717374286, 2034.0205899397401, 0.0, 2516)
-    femmesh.addNode(3777.7777777777687, 5907.198447368082, 0.0, 2517)
-    femmesh.addNode(3834.5980049068194, 5766.952675603183, 0.0, 2518)
-    femmesh.addNode(5328.786907915551, 670.1130611816892, 0.0, 2519)
-    femmesh.addNode(5411.291676286124, 580.0243371105179, 0.0, 2520)
-    femmesh.addNode(5184.662553985037, 731.0597985341112, 0.0, 2521)
-    femmesh.addNode(5323.94956587513, 781.7890824008543, 0.0, 2522)
-    femmesh.addNode(6182.220758782824, 5896.067716815613, 0.0, 2523)
-    femmesh.addNode(5308.243833402099, 1731.7411778695773, 0.0, 2524)
-    femmesh.addNode(6937.309267200111, 1885.144361025888, 0.0, 2525)
-    femmesh.addNode(7471.62663904884, 1026.6175344540225, 0.0, 2526)
-    femmesh.addNode(5060.834226107517, 1954.0894395492023, 0.0, 2527)
-    femmesh.addNode(5079.86070301301, 2105.2415241936756, 0.0, 2528)
-    femmesh.addNode(5074.114136953935, 5417.183874054526, 0.0, 2529)
-    femmesh.addNode(4942.644169530386, 5321.652469096563, 0.0, 2530)
-    femmesh.addNode(3139.36823846747, 720.220540328535, 0.0, 2531)
-    femmesh.addNode(6110.95330970288, 5501.862321940112, 0.0, 2532)
-    femmesh.addNode(6089.069022904099, 5628.459742318297, 0.0, 2533)
-    femmesh.addNode(5236.679055602019, 2125.7840459131385, 0.0, 2534)
-    femmesh.addNode(5145.287468856268, 2218.408831382465, 0.0, 2535)
-    femmesh.addNode(3726.172893423979, 620.8592050822292, 0.0, 2536)
-    femmesh.addNode(3693.6245986720805, 463.7576461437214, 0.0, 2537)
-    femmesh.addNode(1060.176182195958, 5171.115962279659, 0.0, 2538)
-    femmesh.addNode(1213.276902899033, 5216.171264269253, 0.0, 2539)
-    femmesh.addNode(2635.594583997136, 102.22787111469306, 0.0, 2540)
-    femmesh.addNode(2487.4464358489886, 102.22787111469306, 0.0, 2541)
-    femmesh.addNode(4845.172517666984, 5286.978330871377, 0.0, 2542)
-    femmesh.addNode(4695.131483829162, 5280.507678126924, 0.0, 2543)
-    femmesh.addNode(1095.9362886571305, 3671.785166436931, 0.0, 2544)
-    femmesh.addNode(6239.280386208654, 4923.2108484379905, 0.0, 2545)
-    femmesh.addNode(6362.3673751694005, 4839.9673084841015, 0.0, 2546)
-    femmesh.addNode(100.42348280508224, 3554.321575836872, 0.0, 2547)
-    femmesh.addNode(230.77492825823464, 3640.9969623908046, 0.0, 2548)
-    femmesh.addNode(4213.931775454766, 4635.284205533415, 0.0, 2549)
-    femmesh.addNode(4952.634287942052, 301.6609767181696, 0.0, 2550)
-    femmesh.addNode(1335.4924573430649, 759.7188390693628, 0.0, 2551)
-    femmesh.addNode(1379.071590705946, 619.2516533443015, 0.0, 2552)
-    femmesh.addNode(7439.7910727648205, 4887.069243116974, 0.0, 2553)
-    femmesh.addNode(7600.151867690002, 4943.858713407053, 0.0, 2554)
-    femmesh.addNode(5839.759353010744, 2124.592676582127, 0.0, 2555)
-    femmesh.addNode(5940.968200095478, 2229.8861716081415, 0.0, 2556)
-    femmesh.addNode(7419.631849696736, 1228.4172560820866, 0.0, 2557)
-    femmesh.addNode(4477.378988901246, 1845.2412286192164, 0.0, 2558)
-    femmesh.addNode(7095.681856080333, 5115.000245649995, 0.0, 2559)
-    femmesh.addNode(7162.313040724181, 4990.484854523656, 0.0, 2560)
-    femmesh.addNode(6397.320807710878, 1975.9371999306256, 0.0, 2561)
-    femmesh.addNode(7169.293273036862, 4873.546980325669, 0.0, 2562)
-    femmesh.addNode(7766.753428234247, 2992.360412841976, 0.0, 2563)
-    femmesh.addNode(7654.520921535369, 2996.9595518513324, 0.0, 2564)
-    femmesh.addNode(7904.05724182452, 2926.4838779695324, 0.0, 2565)
-    femmesh.addNode(110.78878395542299, 5888.716697528895, 0.0, 2566)
-    femmesh.addNode(110.90276318861717, 111.5046274715365, 0.0, 2567)
-    femmesh.addNode(1955.854434934521, 5407.836734984339, 0.0, 2568)
-    femmesh.addNode(1934.7157777225402, 5571.049607490539, 0.0, 2569)
-    femmesh.addNode(259.0509113367651, 111.5046274715365, 0.0, 2570)
-    femmesh.addNode(4010.035992986383, 5067.624827353595, 0.0, 2571)
-    femmesh.addNode(5016.871547225318, 5562.292634313948, 0.0, 2572)
-    femmesh.addNode(2004.355734650579, 1003.6731999280794, 0.0, 2573)
-    femmesh.addNode(5467.657362160575, 450.3425063853548, 0.0, 2574)
-    femmesh.addNode(6546.429374335172, 5634.424237854843, 0.0, 2575)
-    femmesh.addNode(6626.253568072878, 5542.691342233877, 0.0, 2576)
-    femmesh.addNode(214.93510828960922, 2981.9169467274933, 0.0, 2577)
-    femmesh.addNode(98.00166737963059, 3055.2129087884296, 0.0, 2578)
-    femmesh.addNode(3421.699146914333, 1914.2824342497508, 0.0, 2579)
-    femmesh.addNode(256.84361909976093, 3409.1693786874166, 0.0, 2580)
-    femmesh.addNode(100.42348280508224, 3404.321575836872, 0.0, 2581)
-    femmesh.addNode(156.42013629467868, 3304.8478028505447, 0.0, 2582)
-    femmesh.addNode(3297.845950336807, 1979.3636018761258, 0.0, 2583)
-    femmesh.addNode(2111.494959531288, 5402.165231949035, 0.0, 2584)
-    femmesh.addNode(7767.218753357154, 3888.0377876925577, 0.0, 2585)
-    femmesh.addNode(7897.375199756655, 3823.5283138999966, 0.0, 2586)
-    femmesh.addNode(4494.586412739899, 1625.293771714785, 0.0, 2587)
-    femmesh.addNode(5314.493571989751, 3194.8147337831524, 0.0, 2588)
-    femmesh.addNode(5431.722782467962, 3288.5088135012975, 0.0, 2589)
-    femmesh.addNode(6472.2372881942065, 4477.7161505895965, 0.0, 2590)
-    femmesh.addNode(6351.7359406318765, 4448.7102196662545, 0.0, 2591)
-    femmesh.addNode(6491.002544333656, 4612.984600533326, 0.0, 2592)
-    femmesh.addNode(4874.986173880135, 5501.067465950926, 0.0, 2593)
-    femmesh.addNode(4928.814632382758, 5631.550603783047, 0.0, 2594)
-    femmesh.addNode(2505.1276648694743, 243.65623252638255, 0.0, 2595)
-    femmesh.addNode(2388.051599390854, 141.4283614116895, 0.0, 2596)
-    femmesh.addNode(5232.46836146338, 2332.850268016964, 0.0, 2597)
-    femmesh.addNode(5075.6500088743705, 2312.3077462975007, 0.0, 2598)
-    femmesh.addNode(5546.827725057972, 2918.2870824174242, 0.0, 2599)
-    femmesh.addNode(5657.046057837802, 3018.2060687076782, 0.0, 2600)
-    femmesh.addNode(5545.85935058849, 3043.2051337004123, 0.0, 2601)
-    femmesh.addNode(6784.397481046441, 1319.3236153928885, 0.0, 2602)
-    femmesh.addNode(6919.299419246881, 1366.2001516691444, 0.0, 2603)
-    femmesh.addNode(6791.292751751382, 1427.1798740694455, 0.0, 2604)
-    femmesh.addNode(236.35067309288235, 3910.999812240847, 0.0, 2605)
-    femmesh.addNode(2989.7280193887746, 4771.645797489927, 0.0, 2606)
-    femmesh.addNode(5535.29547393719, 3157.86572215632, 0.0, 2607)
-    femmesh.addNode(5695.7320150122305, 3764.342898788847, 0.0, 2608)
-    femmesh.addNode(5557.533029672991, 3765.1236057602437, 0.0, 2609)
-    femmesh.addNode(98.00166737963059, 3205.2129087884296, 0.0, 2610)
-    femmesh.addNode(254.42180367430927, 3210.0607116389747, 0.0, 2611)
-    femmesh.addNode(6191.448525274055, 5684.543321643532, 0.0, 2612)
-    femmesh.addNode(3352.6451484495615, 5290.84180364593, 0.0, 2613)
-    femmesh.addNode(1552.3516739500826, 1395.2794040667409, 0.0, 2614)
-    femmesh.addNode(2146.7768651874158, 1904.3750733545219, 0.0, 2615)
-    femmesh.addNode(2272.215596335718, 2862.535104078328, 0.0, 2616)
-    femmesh.addNode(3855.8048364279684, 5052.813459076387, 0.0, 2617)
-    femmesh.addNode(7660.256530199369, 4559.011258847239, 0.0, 2618)
-    femmesh.addNode(7689.366296017201, 4411.408419720321, 0.0, 2619)
-    femmesh.addNode(1556.2072877188864, 2219.133860143055, 0.0, 2620)
-    femmesh.addNode(1556.0082847423255, 2386.784601540141, 0.0, 2621)
-    femmesh.addNode(6282.877494237949, 1772.4559401550223, 0.0, 2622)
-    femmesh.addNode(6277.882158344801, 1921.4310622808453, 0.0, 2623)
-    femmesh.addNode(6128.585517567734, 5107.713170821601, 0.0, 2624)
-    femmesh.addNode(6260.038630872973, 5179.667651125733, 0.0, 2625)
-    femmesh.addNode(6148.404264049585, 5250.046552797077, 0.0, 2626)
-    femmesh.addNode(4731.174438629094, 4490.015304252005, 0.0, 2627)
-    femmesh.addNode(2282.6789971124063, 109.67753616863163, 0.0, 2628)
-    femmesh.addNode(5551.582189442877, 3640.453973939028, 0.0, 2629)
-    femmesh.addNode(4971.525921891511, 5755.009349339047, 0.0, 2630)
-    femmesh.addNode(4829.640548546327, 5693.784180976024, 0.0, 2631)
-    femmesh.addNode(7592.520141242945, 5298.125329934728, 0.0, 2632)
-    femmesh.addNode(637.3918254899908, 4092.704735424311, 0.0, 2633)
-    femmesh.addNode(1401.5922856845714, 369.46620785648315, 0.0, 2634)
-    femmesh.addNode(7635.323120369051, 5425.209829664261, 0.0, 2635)
-    femmesh.addNode(5326.02479418699, 2021.007708533041, 0.0, 2636)
-    femmesh.addNode(5253.8598046218385, 1918.842584409984, 0.0, 2637)
-    femmesh.addNode(688.194567213149, 2117.089940264579, 0.0, 2638)
-    femmesh.addNode(2243.3054733248873, 4572.667543500702, 0.0, 2639)
-    femmesh.addNode(2308.622893478505, 4696.82524537733, 0.0, 2640)
-    femmesh.addNode(5451.9988169994685, 3748.98341940141, 0.0, 2641)
-    femmesh.addNode(931.298806358513, 5100.122284264731, 0.0, 2642)
-    femmesh.addNode(1034.9537999726672, 5043.638728462898, 0.0, 2643)
-    femmesh.addNode(105.99922763972995, 3974.3244256869143, 0.0, 2644)
-    femmesh.addNode(1754.92694796851, 360.52511736123574, 0.0, 2645)
-    femmesh.addNode(1857.2284524103889, 420.7081432509244, 0.0, 2646)
-    femmesh.addNode(7462.711174818791, 5898.469704108169, 0.0, 2647)
-    femmesh.addNode(7610.859322966939, 5898.469704108169, 0.0, 2648)
-    femmesh.addNode(572.426944733633, 3994.427547287217, 0.0, 2649)
-    femmesh.addNode(2092.661353999556, 4451.116649005624, 0.0, 2650)
-    femmesh.addNode(5425.0771411573605, 3057.946735866066, 0.0, 2651)
-    femmesh.addNode(823.8063055925209, 958.3789927965289, 0.0, 2652)
-    femmesh.addNode(1956.2402592376873, 1224.0588300891889, 0.0, 2653)
-    femmesh.addNode(1913.4632791364752, 1092.5778542010212, 0.0, 2654)
-    femmesh.addNode(6263.992648712656, 5780.896409983548, 0.0, 2655)
-    femmesh.addNode(2362.163236979447, 3193.295870701359, 0.0, 2656)
-    femmesh.addNode(1442.2092460877725, 2017.7614756694443, 0.0, 2657)
-    femmesh.addNode(1554.1594997076706, 2081.3927288397813, 0.0, 2658)
-    femmesh.addNode(4584.203414933025, 5307.812799989564, 0.0, 2659)
-    femmesh.addNode(2739.2049236701832, 109.73864348806697, 0.0, 2660)
-    femmesh.addNode(7345.616560927223, 3934.376646464009, 0.0, 2661)
-    femmesh.addNode(7176.287151557103, 2557.4593068358313, 0.0, 2662)
-    femmesh.addNode(7295.904619594683, 2613.7696534881416, 0.0, 2663)
-    femmesh.addNode(4195.591032525559, 100.573380244588, 0.0, 2664)
-    femmesh.addNode(1990.1029343179612, 3184.9769766839822, 0.0, 2665)
-    femmesh.addNode(1886.1322983095133, 3071.703391101808, 0.0, 2666)
-    femmesh.addNode(1560.2157514069518, 3111.2100609501767, 0.0, 2667)
-    femmesh.addNode(301.5632307981544, 3067.642585683454, 0.0, 2668)
-    femmesh.addNode(6829.053179941395, 1195.1995290316436, 0.0, 2669)
-    femmesh.addNode(6701.046512445896, 1256.1792514319445, 0.0, 2670)
-    femmesh.addNode(3222.8296064155475, 5322.218813603351, 0.0, 2671)
-    femmesh.addNode(7921.1412102918985, 525.0, 0.0, 2672)
-    femmesh.addNode(2447.144653489046, 4690.688551140751, 0.0, 2673)
-    femmesh.addNode(315.76931508266233, 3534.406265616755, 0.0, 2674)
-    femmesh.addNode(5828.412435296673, 3787.833991024616, 0.0, 2675)
-    femmesh.addNode(808.1192050746827, 5018.940778458758, 0.0, 2676)
-    femmesh.addNode(3283.6679993265525, 2374.040641519102, 0.0, 2677)
-    femmesh.addNode(3185.2226441302837, 2314.1945777317187, 0.0, 2678)
-    femmesh.addNode(3288.899259987108, 2232.4400011275666, 0.0, 2679)
-    femmesh.addNode(5776.6261239153955, 2962.6366875581657, 0.0, 2680)
-    femmesh.addNode(5895.491913793458, 2918.9718253497085, 0.0, 2681)
-    femmesh.addNode(7529.016437598847, 5667.637224732275, 0.0, 2682)
-    femmesh.addNode(7386.985162561353, 5768.448213554893, 0.0, 2683)
-    femmesh.addNode(5780.264086517045, 5139.877032495381, 0.0, 2684)
-    femmesh.addNode(5901.607571144612, 5093.812071992178, 0.0, 2685)
-    femmesh.addNode(5895.607666116779, 5224.157032996149, 0.0, 2686)
-    femmesh.addNode(1031.9721082748265, 3117.752558171589, 0.0, 2687)
-    femmesh.addNode(1046.3381878217474, 3282.4582528137544, 0.0, 2688)
-    femmesh.addNode(2273.650799941209, 3512.6616122993582, 0.0, 2689)
-    femmesh.addNode(7076.534636184158, 2488.840749565937, 0.0, 2690)
-    femmesh.addNode(4008.9672293564763, 3257.657517780044, 0.0, 2691)
-    femmesh.addNode(7914.686159547134, 256.59156586830204, 0.0, 2692)
-    femmesh.addNode(7914.686159547134, 106.59156586830207, 0.0, 2693)
-    femmesh.addNode(7268.239323177693, 1801.8704274251293, 0.0, 2694)
-    femmesh.addNode(7391.36032479119, 1858.853973736414, 0.0, 2695)
-    femmesh.addNode(456.6491571052659, 5283.575133473902, 0.0, 2696)
-    femmesh.addNode(577.7742946692088, 5241.9257754813225, 0.0, 2697)
-    femmesh.addNode(1864.8375266944804, 836.4365866076579, 0.0, 2698)
-    femmesh.addNode(1882.0744745869506, 976.7948289832227, 0.0, 2699)
-    femmesh.addNode(5999.090007472716, 5302.432753358667, 0.0, 2700)
-    femmesh.addNode(4954.6944375460525, 5908.621463266012, 0.0, 2701)
-    femmesh.addNode(3083.0527853179483, 2228.8692712038055, 0.0, 2702)
-    femmesh.addNode(5903.101833087607, 4976.537545429586, 0.0, 2703)
-    femmesh.addNode(6018.445412687341, 5060.817545930353, 0.0, 2704)
-    femmesh.addNode(1368.2335754277613, 500.6214511106815, 0.0, 2705)
-    femmesh.addNode(5267.3322335032735, 2451.1059868288985, 0.0, 2706)
-    femmesh.addNode(320.49500432850243, 2939.133714834087, 0.0, 2707)
-    femmesh.addNode(7283.640478059639, 4514.092227226207, 0.0, 2708)
-    femmesh.addNode(1558.3299149669779, 4182.097224201347, 0.0, 2709)
-    femmesh.addNode(7756.91148907129, 1483.767497656865, 0.0, 2710)
-    femmesh.addNode(7315.388742017349, 4657.721928377959, 0.0, 2711)
-    femmesh.addNode(7399.798441709426, 4517.980793311563, 0.0, 2712)
-    femmesh.addNode(7498.487990013738, 4746.713610018753, 0.0, 2713)
-    femmesh.addNode(7372.849788418218, 4801.966127561536, 0.0, 2714)
-    femmesh.addNode(6256.3396882255, 3584.656482390563, 0.0, 2715)
-    femmesh.addNode(2492.632774866953, 4545.431665964435, 0.0, 2716)
-    femmesh.addNode(2567.3542907940873, 4662.4470878823195, 0.0, 2717)
-    femmesh.addNode(6637.579614943748, 4853.868871481289, 0.0, 2718)
-    femmesh.addNode(6708.899886682152, 4740.084469253945, 0.0, 2719)
-    femmesh.addNode(6557.714134051019, 4757.062787015134, 0.0, 2720)
-    femmesh.addNode(7666.503583008909, 1260.5503767195992, 0.0, 2721)
-    femmesh.addNode(7686.874040878695, 1108.0335948598283, 0.0, 2722)
-    femmesh.addNode(6758.643947427964, 96.4155087544391, 0.0, 2723)
-    femmesh.addNode(7763.134361030914, 4767.471133900168, 0.0, 2724)
-    femmesh.addNode(4287.498229008298, 4005.349137376889, 0.0, 2725)
-    femmesh.addNode(4140.464044921751, 4070.9908060634884, 0.0, 2726)
-    femmesh.addNode(4176.56804922822, 3930.7253438244015, 0.0, 2727)
-    femmesh.addNode(4801.966296252004, 229.9075572829032, 0.0, 2728)
-    femmesh.addNode(7901.736720786551, 5613.515101130631, 0.0, 2729)
-    femmesh.addNode(7901.736720786551, 5463.515101130631, 0.0, 2730)
-    femmesh.addNode(3118.4192941258602, 3368.3475952775993, 0.0, 2731)
-    femmesh.addNode(3094.83467663271, 3483.92654643438, 0.0, 2732)
-    femmesh.addNode(594.9752244469839, 2238.9596325531816, 0.0, 2733)
-    femmesh.addNode(7256.69182476843, 4798.07756147618, 0.0, 2734)
-    femmesh.addNode(3803.6265579023266, 4935.559863178268, 0.0, 2735)
-    femmesh.addNode(3749.135702776643, 4821.7838102812875, 0.0, 2736)
-    femmesh.addNode(1784.0844683180717, 4168.426601282251, 0.0, 2737)
-    femmesh.addNode(596.5073196530822, 886.5852351087277, 0.0, 2738)
-    femmesh.addNode(593.7853437392548, 736.303639041284, 0.0, 2739)
-    femmesh.addNode(2692.652344578464, 4619.198506208669, 0.0, 2740)
-    femmesh.addNode(1303.8556400474167, 3639.100843824768, 0.0, 2741)
-    femmesh.addNode(1194.879169632125, 3581.016709554191, 0.0, 2742)
-    femmesh.addNode(502.49217994956723, 1816.0985582947685, 0.0, 2743)
-    femmesh.addNode(456.0014375414486, 709.5783627447208, 0.0, 2744)
-    femmesh.addNode(7632.104131564587, 1456.1984948328911, 0.0, 2745)
-    femmesh.addNode(7593.431777504633, 1344.1554824581362, 0.0, 2746)
-    femmesh.addNode(4593.0157091539495, 4644.713628084351, 0.0, 2747)
-    femmesh.addNode(3095.1652737310123, 5162.428934289019, 0.0, 2748)
-    femmesh.addNode(3099.918956919554, 5035.167607841227, 0.0, 2749)
-    femmesh.addNode(2618.2817741470635, 567.0648284959196, 0.0, 2750)
-    femmesh.addNode(2577.6261512403, 454.59164249814893, 0.0, 2751)
-    femmesh.addNode(2699.462756967855, 507.49574036061114, 0.0, 2752)
-    femmesh.addNode(1879.959221718284, 709.413670238496, 0.0, 2753)
-    femmesh.addNode(989.5233599800398, 2997.1699405431127, 0.0, 2754)
-    femmesh.addNode(1137.364813369896, 3061.084799370647, 0.0, 2755)
-    femmesh.addNode(3464.333645638849, 337.6147253167777, 0.0, 2756)
-    femmesh.addNode(345.6972777307325, 3666.7600763338155, 0.0, 2757)
-    femmesh.addNode(7624.444699991831, 5763.727781096632, 0.0, 2758)
-    femmesh.addNode(7767.050874671842, 5419.557410170785, 0.0, 2759)
-    femmesh.addNode(7671.745687270311, 5532.682621754737, 0.0, 2760)
-    femmesh.addNode(6336.219704681052, 5563.874836183986, 0.0, 2761)
-    femmesh.addNode(6260.26756627975, 5449.476121378524, 0.0, 2762)
-    femmesh.addNode(5417.673171612936, 840.0822900501512, 0.0, 2763)
-    femmesh.addNode(5468.352116726914, 976.5400780547818, 0.0, 2764)
-    femmesh.addNode(7651.967960090932, 4739.824522136059, 0.0, 2765)
-    femmesh.addNode(7585.02667574433, 4654.721406580622, 0.0, 2766)
-    femmesh.addNode(590.8730654941548, 5105.174056849854, 0.0, 2767)
-    femmesh.addNode(5300.573835278807, 3082.0169152028675, 0.0, 2768)
-    femmesh.addNode(7677.718266150347, 1801.309323048432, 0.0, 2769)
-    femmesh.addNode(7083.465153357667, 2620.550403775077, 0.0, 2770)
-    femmesh.addNode(2977.2903208384223, 5003.770636680148, 0.0, 2771)
-    femmesh.addNode(7776.915423319661, 1728.4498530172227, 0.0, 2772)
-    femmesh.addNode(2206.6517901730513, 5415.864639912112, 0.0, 2773)
-    femmesh.addNode(2335.5011295059785, 5354.246923872386, 0.0, 2774)
-    femmesh.addNode(2231.1930045025965, 2749.9331900925263, 0.0, 2775)
-    femmesh.addNode(2116.949903939014, 2745.1157427245976, 0.0, 2776)
-    femmesh.addNode(3090.5096679272183, 1973.9434580850643, 0.0, 2777)
-    femmesh.addNode(7407.553687381191, 3011.670717704241, 0.0, 2778)
-    femmesh.addNode(7032.488981453762, 1261.5790377830447, 0.0, 2779)
-    femmesh.addNode(6934.72514258318, 1145.9923735764776, 0.0, 2780)
-    femmesh.addNode(7547.48101218758, 2957.7056702197638, 0.0, 2781)
-    femmesh.addNode(7506.776560122176, 4565.900346729933, 0.0, 2782)
-    femmesh.addNode(6825.910428638783, 1540.190994231118, 0.0, 2783)
-    femmesh.addNode(4806.546289397904, 5908.621463266012, 0.0, 2784)
-    femmesh.addNode(4404.373256268787, 1405.8195112030262, 0.0, 2785)
-    femmesh.addNode(4459.941668519845, 1239.3196121815397, 0.0, 2786)
-    femmesh.addNode(6299.938315725203, 2031.3764687080347, 0.0, 2787)
-    femmesh.addNode(6304.527680880263, 2153.392916362308, 0.0, 2788)
-    femmesh.addNode(1657.0471055781463, 2157.994198694995, 0.0, 2789)
-    femmesh.addNode(5931.561815719584, 4579.105083232498, 0.0, 2790)
-    femmesh.addNode(3573.7071453638955, 402.9681063338551, 0.0, 2791)
-    femmesh.addNode(3876.2398578528923, 1937.8537342767063, 0.0, 2792)
-    femmesh.addNode(334.85878330969365, 5332.249292443263, 0.0, 2793)
-    femmesh.addNode(6242.503352110847, 2577.2370048407993, 0.0, 2794)
-    femmesh.addNode(6135.531193201965, 2655.035084132647, 0.0, 2795)
-    femmesh.addNode(7443.722145444895, 2916.131081442254, 0.0, 2796)
-    femmesh.addNode(2724.767522977189, 4467.997639910464, 0.0, 2797)
-    femmesh.addNode(2653.0832931327786, 4385.654148517931, 0.0, 2798)
-    femmesh.addNode(5939.219320903606, 1967.3631799611549, 0.0, 2799)
-    femmesh.addNode(5830.280314426501, 2014.989932282678, 0.0, 2800)
-    femmesh.addNode(4825.478660187593, 88.28191878579314, 0.0, 2801)
-    femmesh.addNode(7293.999097729551, 2718.3297129164116, 0.0, 2802)
-    femmesh.addNode(7354.287673683498, 2858.7932968572914, 0.0, 2803)
-    femmesh.addNode(2188.8628735260536, 1314.2388555601424, 0.0, 2804)
-    femmesh.addNode(2065.49972956501, 1246.5938578184102, 0.0, 2805)
-    femmesh.addNode(6148.186506164915, 84.85350532801614, 0.0, 2806)
-    femmesh.addNode(5036.611505921477, 3524.872608795302, 0.0, 2807)
-    femmesh.addNode(1806.339535130754, 1433.0208694381408, 0.0, 2808)
-    femmesh.addNode(1937.110726156537, 1445.9346925830646, 0.0, 2809)
-    femmesh.addNode(335.6576004627676, 667.3883902778621, 0.0, 2810)
-    femmesh.addNode(1677.8185113178793, 1418.8761193108417, 0.0, 2811)
-    femmesh.addNode(1862.6271199323423, 566.5512935247397, 0.0, 2812)
-    femmesh.addNode(516.0706067572303, 83.55204411095671, 0.0, 2813)
-    femmesh.addNode(367.92245860908235, 83.55204411095671, 0.0, 2814)
-    femmesh.addNode(7518.114909774306, 1254.7058591777354, 0.0, 2815)
-    femmesh.addNode(3863.857725918394, 2594.557228508348, 0.0, 2816)
-    femmesh.addNode(7921.1412102918985, 375.0, 0.0, 2817)
-    femmesh.addNode(2188.2586868211633, 4479.424053907744, 0.0, 2818)
-    femmesh.addNode(2317.3763510581875, 4480.42963962991, 0.0, 2819)
-    femmesh.addNode(6419.6822725952525, 4726.7690027606695, 0.0, 2820)
-    femmesh.addNode(1675.895289287872, 4101.710307914334, 0.0, 2821)
-    femmesh.addNode(2127.065391580456, 5512.719915607711, 0.0, 2822)
-    femmesh.addNode(2326.7202802181346, 3657.5495722159367, 0.0, 2823)
-    femmesh.addNode(2219.4174884654653, 3630.921403017675, 0.0, 2824)
-    femmesh.addNode(2146.269142518914, 5632.64055919387, 0.0, 2825)
-    femmesh.addNode(7767.1739496632945, 5628.773178119092, 0.0, 2826)
-    femmesh.addNode(7635.446195360503, 5634.425597612568, 0.0, 2827)
-    femmesh.addNode(3304.58516659164, 2113.522378552763, 0.0, 2828)
-    femmesh.addNode(1512.2989055053608, 3564.7389918982044, 0.0, 2829)
-    femmesh.addNode(1445.6959663942662, 3683.225182112769, 0.0, 2830)
-    femmesh.addNode(5874.112151942791, 4415.688058165883, 0.0, 2831)
-    femmesh.addNode(5986.381657976977, 4469.817508389297, 0.0, 2832)
-    femmesh.addNode(2160.390211900678, 3731.370874944131, 0.0, 2833)
-    femmesh.addNode(6313.221878643277, 5673.304297995855, 0.0, 2834)
-    femmesh.addNode(3093.103896076495, 5288.8309918713985, 0.0, 2835)
-    femmesh.addNode(3183.7146885360066, 2038.4351606635464, 0.0, 2836)
-    femmesh.addNode(5680.283738716907, 4908.476442306897, 0.0, 2837)
-    femmesh.addNode(5657.253397886816, 5041.820574359235, 0.0, 2838)
-    femmesh.addNode(6304.220575694168, 350.41740016516593, 0.0, 2839)
-    femmesh.addNode(5795.073321916283, 4896.668762365191, 0.0, 2840)
-    femmesh.addNode(4131.721129930226, 4183.122210775116, 0.0, 2841)
-    femmesh.addNode(532.0878641897489, 232.69052162068317, 0.0, 2842)
-    femmesh.addNode(6273.610030272849, 3458.3665061372903, 0.0, 2843)
-    femmesh.addNode(3302.2455801354035, 2493.5824736050963, 0.0, 2844)
-    femmesh.addNode(3308.8180147757785, 2634.5895258767396, 0.0, 2845)
-    femmesh.addNode(5723.461899047799, 2048.4117600435784, 0.0, 2846)
-    femmesh.addNode(416.2051710993592, 261.37301349180876, 0.0, 2847)
-    femmesh.addNode(4631.590010091793, 4848.993605056891, 0.0, 2848)
-    femmesh.addNode(4576.071388573897, 4957.4409255914015, 0.0, 2849)
-    femmesh.addNode(2451.0889984154237, 398.5087267284182, 0.0, 2850)
-    femmesh.addNode(2532.2699812362152, 338.93963859310975, 0.0, 2851)
-    femmesh.addNode(7474.470081248231, 1753.0554741480973, 0.0, 2852)
-    femmesh.addNode(6691.008490438342, 1493.3144579548623, 0.0, 2853)
-    femmesh.addNode(5546.722382201948, 349.7635131900739, 0.0, 2854)
-    femmesh.addNode(2546.5642466824947, 4422.4121677522, 0.0, 2855)
-    femmesh.addNode(4671.15105512471, 4724.552709315614, 0.0, 2856)
-    femmesh.addNode(4740.354523571539, 4832.064393381852, 0.0, 2857)
-    femmesh.addNode(7583.034006507578, 4361.677701232387, 0.0, 2858)
-    femmesh.addNode(7547.9980127273275, 1662.8254625209656, 0.0, 2859)
-    femmesh.addNode(6408.763828119652, 5660.227924524003, 0.0, 2860)
-    femmesh.addNode(6069.527034234355, 2749.0031210052875, 0.0, 2861)
-    femmesh.addNode(6003.82456506071, 2840.5084035456916, 0.0, 2862)
-    femmesh.addNode(5961.448481237054, 2714.4530104673718, 0.0, 2863)
-    femmesh.addNode(4991.01250179391, 4803.570090118723, 0.0, 2864)
-    femmesh.addNode(6863.027870269966, 4063.984332552514, 0.0, 2865)
-    femmesh.addNode(2051.112311877151, 5618.941151230793, 0.0, 2866)
-    femmesh.addNode(336.4013697184554, 1637.8439269385406, 0.0, 2867)
-    femmesh.addNode(4767.850148190242, 5802.408098235819, 0.0, 2868)
-    femmesh.addNode(6003.5704667907585, 2953.5219358876243, 0.0, 2869)
-    femmesh.addNode(2631.66481769435, 299.7391482961133, 0.0, 2870)
-    femmesh.addNode(4266.74581741122, 1596.7449521006142, 0.0, 2871)
-    femmesh.addNode(4358.4447701053705, 1496.8744645491265, 0.0, 2872)
-    femmesh.addNode(4377.922585678536, 1612.598805192517, 0.0, 2873)
-    femmesh.addNode(6318.49276473399, 2275.319135038351, 0.0, 2874)
-    femmesh.addNode(6189.694838215145, 202.33293728871078, 0.0, 2875)
-    femmesh.addNode(6200.57044915807, 306.09800911942807, 0.0, 2876)
-    femmesh.addNode(2166.7322317328553, 4358.878745134833, 0.0, 2877)
-    femmesh.addNode(7647.195169896642, 1589.9659924897564, 0.0, 2878)
-    femmesh.addNode(1624.707728964151, 5667.539205576473, 0.0, 2879)
-    femmesh.addNode(5902.004762756282, 2603.548027231154, 0.0, 2880)
-    femmesh.addNode(658.5439332172241, 2343.676240569629, 0.0, 2881)
-    femmesh.addNode(3242.6932676078613, 4840.457063310233, 0.0, 2882)
-    femmesh.addNode(3112.3566554699073, 4803.042768651007, 0.0, 2883)
-    femmesh.addNode(4867.444909548183, 4812.363047201065, 0.0, 2884)
-    femmesh.addNode(4199.519027905174, 3822.3900079590553, 0.0, 2885)
-    femmesh.addNode(3607.6803049492855, 4789.81985953708, 0.0, 2886)
-    femmesh.addNode(345.94506173688836, 2834.483487261886, 0.0, 2887)
-    femmesh.addNode(1985.995449602594, 1351.1964627617212, 0.0, 2888)
-    femmesh.addNode(4402.887460045749, 1725.1642592662727, 0.0, 2889)
-    femmesh.addNode(6837.452181489398, 4711.057036109523, 0.0, 2890)
-    femmesh.addNode(2052.6822841742187, 3798.634265786755, 0.0, 2891)
-    femmesh.addNode(4903.483160850183, 4698.830540558232, 0.0, 2892)
-    femmesh.addNode(4809.3097845998545, 4569.854385483269, 0.0, 2893)
-    femmesh.addNode(6130.543120777955, 5374.387233662798, 0.0, 2894)
-    femmesh.addNode(3097.248884182051, 2108.1022347617013, 0.0, 2895)
-    femmesh.addNode(4963.36939637938, 1263.2893802262624, 0.0, 2896)
-    femmesh.addNode(5018.462037048852, 1160.1072648416337, 0.0, 2897)
-    femmesh.addNode(556.8151422055747, 2878.6131406942914, 0.0, 2898)
-    femmesh.addNode(432.57318424543354, 2920.2091262178465, 0.0, 2899)
-    femmesh.addNode(2426.3546093774535, 4450.653631010631, 0.0, 2900)
-    femmesh.addNode(6130.079779510728, 4990.438644259009, 0.0, 2901)
-    femmesh.addNode(3877.0887502901505, 1038.8207332518448, 0.0, 2902)
-    femmesh.addNode(2016.137038539249, 2802.6165989970686, 0.0, 2903)
-    femmesh.addNode(3068.7680641111556, 4919.027177062853, 0.0, 2904)
-    femmesh.addNode(417.23730466349434, 1747.6367650741527, 0.0, 2905)
-    femmesh.addNode(4293.196488001472, 1389.9656581111237, 0.0, 2906)
-    femmesh.addNode(2831.8841535070596, 329.6786096007405, 0.0, 2907)
-    femmesh.addNode(2755.416130200754, 417.4512432940938, 0.0, 2908)
-    femmesh.addNode(2735.2751573673972, 307.2499206694872, 0.0, 2909)
-    femmesh.addNode(4657.171716099756, 5389.766341894096, 0.0, 2910)
-    femmesh.addNode(7672.80537023403, 1690.3944653449396, 0.0, 2911)
-    femmesh.addNode(7475.028296164466, 4422.270645578181, 0.0, 2912)
-    femmesh.addNode(7570.109699126411, 1052.9061375496713, 0.0, 2913)
-    femmesh.addNode(7676.595675300324, 4859.4633373382985, 0.0, 2914)
-    femmesh.addNode(2708.1328410006563, 211.96651460276001, 0.0, 2915)
-    femmesh.addNode(4052.4848438186277, 3888.031676645655, 0.0, 2916)
-    femmesh.addNode(5163.690474715422, 1900.5155911518848, 0.0, 2917)
-    femmesh.addNode(5246.297989578499, 1806.7414368375196, 0.0, 2918)
-    femmesh.addNode(7835.827369839031, 331.59156586830204, 0.0, 2919)
-    femmesh.addNode(3443.775395295037, 2653.2162114927423, 0.0, 2920)
-    femmesh.addNode(2755.9802963080842, 5653.925183382404, 0.0, 2921)
-    femmesh.addNode(4701.780222633694, 4627.784416409311, 0.0, 2922)
-    femmesh.addNode(2796.071753107518, 529.9244292918645, 0.0, 2923)
-    femmesh.addNode(7492.70365520101, 1144.8121503435495, 0.0, 2924)
-    femmesh.addNode(4777.514522016733, 5466.393327725739, 0.0, 2925)
-    femmesh.addNode(330.67707364955163, 195.0566715824932, 0.0, 2926)
-    femmesh.addNode(1610.4762536184405, 1513.783588599681, 0.0, 2927)
-    femmesh.addNode(4945.099552552129, 1076.6164352832811, 0.0, 2928)
-    femmesh.addNode(3970.3481956878404, 3816.4130543320616, 0.0, 2929)
-    femmesh.addNode(526.2326455361365, 1706.6258563919796, 0.0, 2930)
-    femmesh.addNode(328.0222886664836, 523.4330013295549, 0.0, 2931)
-    femmesh.addNode(326.3942847204498, 5474.996943944811, 0.0, 2932)
-    femmesh.addNode(5769.880581962626, 4438.896685332078, 0.0, 2933)
-    femmesh.addNode(4865.5714368592935, 5397.135358256641, 0.0, 2934)
-    femmesh.addNode(5218.074503495682, 1713.414184611478, 0.0, 2935)
-    return True
+    return load_mesh(femmesh, __name__, elements=False)
 
 
 def create_elements(femmesh):
     # elements
-    femmesh.addFace([351, 515, 230, 853, 854, 855], 95)
-    femmesh.addFace([343, 457, 259, 856, 857, 858], 96)
-    femmesh.addFace([358, 487, 202, 859, 860, 861], 97)
-    femmesh.addFace([334, 702, 477, 862, 863, 864], 98)
-    femmesh.addFace([410, 507, 238, 865, 866, 867], 99)
-    femmesh.addFace([203, 479, 345, 868, 869, 870], 100)
-    femmesh.addFace([372, 816, 260, 871, 872, 873], 101)
-    femmesh.addFace([113, 526, 341, 874, 875, 876], 102)
-    femmesh.addFace([153, 444, 154, 877, 878, 180], 103)
-    femmesh.addFace([240, 620, 357, 879, 880, 881], 104)
-    femmesh.addFace([356, 500, 239, 882, 883, 884], 105)
-    femmesh.addFace([353, 669, 250, 885, 886, 887], 106)
-    femmesh.addFace([355, 646, 56, 888, 889, 890], 107)
-    femmesh.addFace([363, 604, 141, 891, 892, 893], 108)
-    femmesh.addFace([341, 689, 113, 894, 895, 876], 109)
-    femmesh.addFace([262, 473, 371, 896, 897, 898], 110)
-    femmesh.addFace([260, 816, 395, 872, 899, 900], 111)
-    femmesh.addFace([278, 724, 350, 901, 902, 903], 112)
-    femmesh.addFace([359, 595, 10, 904, 905, 906], 113)
-    femmesh.addFace([371, 473, 205, 897, 907, 908], 114)
-    femmesh.addFace([257, 402, 395, 909, 910, 911], 115)
-    femmesh.addFace([202, 674, 358, 912, 913, 861], 116)
-    femmesh.addFace([230, 455, 351, 914, 915, 855], 117)
-    femmesh.addFace([340, 666, 539, 916, 917, 918], 118)
-    femmesh.addFace([395, 402, 260, 910, 919, 900], 119)
-    femmesh.addFace([404, 431, 280, 920, 921, 922], 120)
-    femmesh.addFace([350, 461, 216, 923, 924, 925], 121)
-    femmesh.addFace([272, 469, 348, 926, 927, 928], 122)
-    femmesh.addFace([258, 426, 365, 929, 930, 931], 123)
-    femmesh.addFace([259, 495, 343, 932, 933, 858], 124)
-    femmesh.addFace([303, 443, 397, 934, 935, 936], 125)
-    femmesh.addFace([208, 554, 466, 937, 938, 939], 126)
-    femmesh.addFace([444, 642, 154, 940, 941, 878], 127)
-    femmesh.addFace([153, 489, 444, 942, 943, 877], 128)
-    femmesh.addFace([430, 477, 311, 944, 945, 946], 129)
-    femmesh.addFace([190, 477, 430, 947, 944, 948], 130)
-    femmesh.addFace([594, 658, 446, 949, 950, 951], 131)
-    femmesh.addFace([545, 627, 265, 952, 953, 954], 132)
-    femmesh.addFace([193, 608, 387, 955, 956, 957], 133)
-    femmesh.addFace([320, 517, 514, 958, 959, 960], 134)
-    femmesh.addFace([284, 637, 419, 961, 962, 963], 135)
-    femmesh.addFace([466, 554, 319, 938, 964, 965], 136)
-    femmesh.addFace([48, 778, 347, 966, 967, 968], 137)
-    femmesh.addFace([250, 594, 446, 969, 951, 970], 138)
-    femmesh.addFace([139, 606, 424, 971, 972, 973], 139)
-    femmesh.addFace([569, 637, 284, 974, 961, 975], 140)
-    femmesh.addFace([252, 462, 356, 976, 977, 978], 141)
-    femmesh.addFace([287, 491, 369, 979, 980, 981], 142)
-    femmesh.addFace([345, 609, 203, 982, 983, 870], 143)
-    femmesh.addFace([356, 462, 201, 977, 984, 985], 144)
-    femmesh.addFace([563, 663, 217, 986, 987, 988], 145)
-    femmesh.addFace([383, 467, 247, 989, 990, 991], 146)
-    femmesh.addFace([477, 702, 254, 863, 992, 993], 147)
-    femmesh.addFace([347, 502, 48, 994, 995, 968], 148)
-    femmesh.addFace([369, 480, 253, 996, 997, 998], 149)
-    femmesh.addFace([514, 517, 219, 959, 999, 1000], 150)
-    femmesh.addFace([250, 669, 367, 886, 1001, 1002], 151)
-    femmesh.addFace([233, 777, 361, 1003, 1004, 1005], 152)
-    femmesh.addFace([250, 485, 353, 1006, 1007, 887], 153)
-    femmesh.addFace([268, 524, 352, 1008, 1009, 1010], 154)
-    femmesh.addFace([410, 590, 507, 1011, 1012, 865], 155)
-    femmesh.addFace([496, 600, 336, 1013, 1014, 1015], 156)
-    femmesh.addFace([203, 429, 373, 1016, 1017, 1018], 157)
-    femmesh.addFace([143, 392, 144, 1019, 1020, 170], 158)
-    femmesh.addFace([430, 680, 231, 1021, 1022, 1023], 159)
-    femmesh.addFace([354, 675, 531, 1024, 1025, 1026], 160)
-    femmesh.addFace([252, 464, 462, 1027, 1028, 976], 161)
-    femmesh.addFace([271, 428, 389, 1029, 1030, 1031], 162)
-    femmesh.addFace([462, 464, 287, 1028, 1032, 1033], 163)
-    femmesh.addFace([231, 636, 430, 1034, 1035, 1023], 164)
-    femmesh.addFace([389, 428, 206, 1030, 1036, 1037], 165)
-    femmesh.addFace([352, 676, 268, 1038, 1039, 1010], 166)
-    femmesh.addFace([152, 489, 153, 1040, 942, 179], 167)
-    femmesh.addFace([240, 665, 620, 1041, 1042, 879], 168)
-    femmesh.addFace([302, 541, 408, 1043, 1044, 1045], 169)
-    femmesh.addFace([260, 850, 372, 1046, 1047, 873], 170)
-    femmesh.addFace([408, 541, 233, 1044, 1048, 1049], 171)
-    femmesh.addFace([409, 470, 275, 1050, 1051, 1052], 172)
-    femmesh.addFace([345, 550, 516, 1053, 1054, 1055], 173)
-    femmesh.addFace([268, 470, 409, 1056, 1050, 1057], 174)
-    femmesh.addFace([516, 550, 223, 1054, 1058, 1059], 175)
-    femmesh.addFace([216, 567, 350, 1060, 1061, 925], 176)
-    femmesh.addFace([381, 535, 46, 1062, 1063, 1064], 177)
-    femmesh.addFace([253, 458, 364, 1065, 1066, 1067], 178)
-    femmesh.addFace([348, 533, 272, 1068, 1069, 928], 179)
-    femmesh.addFace([364, 471, 253, 1070, 1071, 1067], 180)
-    femmesh.addFace([139, 424, 140, 973, 1072, 166], 181)
-    femmesh.addFace([282, 733, 377, 1073, 1074, 1075], 182)
-    femmesh.addFace([335, 735, 427, 1076, 1077, 1078], 183)
-    femmesh.addFace([498, 520, 264, 1079, 1080, 1081], 184)
-    femmesh.addFace([360, 690, 459, 1082, 1083, 1084], 185)
-    femmesh.addFace([248, 463, 422, 1085, 1086, 1087], 186)
-    femmesh.addFace([459, 690, 242, 1083, 1088, 1089], 187)
-    femmesh.addFace([350, 555, 278, 1090, 1091, 903], 188)
-    femmesh.addFace([339, 701, 393, 1092, 1093, 1094], 189)
-    femmesh.addFace([393, 701, 226, 1093, 1095, 1096], 190)
-    femmesh.addFace([201, 471, 364, 1097, 1070, 1098], 191)
-    femmesh.addFace([310, 664, 370, 1099, 1100, 1101], 192)
-    femmesh.addFace([225, 600, 496, 1102, 1013, 1103], 193)
-    femmesh.addFace([247, 442, 383, 1104, 1105, 991], 194)
-    femmesh.addFace([56, 521, 355, 1106, 1107, 890], 195)
-    femmesh.addFace([250, 446, 382, 970, 1108, 1109], 196)
-    femmesh.addFace([608, 722, 387, 1110, 1111, 956], 197)
-    femmesh.addFace([295, 569, 486, 1112, 1113, 1114], 198)
-    femmesh.addFace([531, 675, 228, 1025, 1115, 1116], 199)
-    femmesh.addFace([479, 550, 345, 1117, 1053, 869], 200)
-    femmesh.addFace([397, 671, 627, 1118, 1119, 1120], 201)
-    femmesh.addFace([376, 835, 412, 1121, 1122, 1123], 202)
-    femmesh.addFace([295, 611, 569, 1124, 1125, 1112], 203)
-    femmesh.addFace([370, 546, 232, 1126, 1127, 1128], 204)
-    femmesh.addFace([500, 581, 333, 1129, 1130, 1131], 205)
-    femmesh.addFace([201, 500, 356, 1132, 882, 985], 206)
-    femmesh.addFace([344, 665, 429, 1133, 1134, 1135], 207)
-    femmesh.addFace([315, 520, 498, 1136, 1079, 1137], 208)
-    femmesh.addFace([243, 535, 381, 1138, 1062, 1139], 209)
-    femmesh.addFace([200, 634, 385, 1140, 1141, 1142], 210)
-    femmesh.addFace([314, 674, 372, 1143, 1144, 1145], 211)
-    femmesh.addFace([287, 471, 462, 1146, 1147, 1033], 212)
-    femmesh.addFace([462, 471, 201, 1147, 1097, 984], 213)
-    femmesh.addFace([381, 800, 243, 1148, 1149, 1139], 214)
-    femmesh.addFace([429, 757, 344, 1150, 1151, 1135], 215)
-    femmesh.addFace([397, 627, 303, 1120, 1152, 936], 216)
-    femmesh.addFace([12, 394, 13, 1153, 1154, 32], 217)
-    femmesh.addFace([385, 679, 234, 1155, 1156, 1157], 218)
-    femmesh.addFace([455, 850, 260, 1158, 1046, 1159], 219)
-    femmesh.addFace([226, 660, 615, 1160, 1161, 1162], 220)
-    femmesh.addFace([273, 550, 479, 1163, 1117, 1164], 221)
-    femmesh.addFace([67, 635, 416, 1165, 1166, 1167], 222)
-    femmesh.addFace([355, 521, 275, 1107, 1168, 1169], 223)
-    femmesh.addFace([356, 587, 252, 1170, 1171, 978], 224)
-    femmesh.addFace([359, 505, 296, 1172, 1173, 1174], 225)
-    femmesh.addFace([8, 622, 425, 1175, 1176, 1177], 226)
-    femmesh.addFace([275, 571, 355, 1178, 1179, 1169], 227)
-    femmesh.addFace([99, 717, 495, 1180, 1181, 1182], 228)
-    femmesh.addFace([615, 660, 346, 1161, 1183, 1184], 229)
-    femmesh.addFace([201, 581, 500, 1185, 1129, 1132], 230)
-    femmesh.addFace([253, 670, 369, 1186, 1187, 998], 231)
-    femmesh.addFace([303, 683, 443, 1188, 1189, 934], 232)
-    femmesh.addFace([255, 591, 448, 1190, 1191, 1192], 233)
-    femmesh.addFace([274, 567, 389, 1193, 1194, 1195], 234)
-    femmesh.addFace([357, 515, 240, 1196, 1197, 881], 235)
-    femmesh.addFace([412, 835, 244, 1122, 1198, 1199], 236)
-    femmesh.addFace([533, 676, 352, 1200, 1038, 1201], 237)
-    femmesh.addFace([388, 789, 271, 1202, 1203, 1204], 238)
-    femmesh.addFace([365, 496, 258, 1205, 1206, 931], 239)
-    femmesh.addFace([374, 790, 575, 1207, 1208, 1209], 240)
-    femmesh.addFace([457, 508, 209, 1210, 1211, 1212], 241)
-    femmesh.addFace([143, 652, 392, 1213, 1214, 1019], 242)
-    femmesh.addFace([8, 425, 9, 1177, 1215, 28], 243)
-    femmesh.addFace([591, 727, 448, 1216, 1217, 1191], 244)
-    femmesh.addFace([373, 479, 203, 1218, 868, 1018], 245)
-    femmesh.addFace([239, 572, 356, 1219, 1220, 884], 246)
-    femmesh.addFace([296, 595, 359, 1221, 904, 1174], 247)
-    femmesh.addFace([422, 463, 19, 1086, 1222, 1223], 248)
-    femmesh.addFace([539, 743, 340, 1224, 1225, 918], 249)
-    femmesh.addFace([369, 491, 286, 980, 1226, 1227], 250)
-    femmesh.addFace([213, 467, 383, 1228, 989, 1229], 251)
-    femmesh.addFace([274, 570, 567, 1230, 1231, 1193], 252)
-    femmesh.addFace([208, 452, 407, 1232, 1233, 1234], 253)
-    femmesh.addFace([207, 819, 379, 1235, 1236, 1237], 254)
-    femmesh.addFace([374, 481, 279, 1238, 1239, 1240], 255)
-    femmesh.addFace([341, 585, 525, 1241, 1242, 1243], 256)
-    femmesh.addFace([361, 605, 233, 1244, 1245, 1005], 257)
-    femmesh.addFace([396, 635, 69, 1246, 1247, 1248], 258)
-    femmesh.addFace([539, 666, 273, 917, 1249, 1250], 259)
-    femmesh.addFace([236, 506, 366, 1251, 1252, 1253], 260)
-    femmesh.addFace([412, 762, 376, 1254, 1255, 1123], 261)
-    femmesh.addFace([449, 491, 210, 1256, 1257, 1258], 262)
-    femmesh.addFace([286, 491, 449, 1226, 1256, 1259], 263)
-    femmesh.addFace([58, 530, 409, 1260, 1261, 1262], 264)
-    femmesh.addFace([361, 777, 514, 1004, 1263, 1264], 265)
-    femmesh.addFace([265, 627, 492, 953, 1265, 1266], 266)
-    femmesh.addFace([18, 422, 19, 1267, 1223, 38], 267)
-    femmesh.addFace([352, 827, 533, 1268, 1269, 1201], 268)
-    femmesh.addFace([567, 570, 350, 1231, 1270, 1061], 269)
-    femmesh.addFace([10, 589, 359, 1271, 1272, 906], 270)
-    femmesh.addFace([434, 641, 222, 1273, 1274, 1275], 271)
-    femmesh.addFace([333, 641, 434, 1276, 1273, 1277], 272)
-    femmesh.addFace([349, 679, 456, 1278, 1279, 1280], 273)
-    femmesh.addFace([267, 631, 378, 1281, 1282, 1283], 274)
-    femmesh.addFace([382, 485, 250, 1284, 1006, 1109], 275)
-    femmesh.addFace([525, 585, 225, 1242, 1285, 1286], 276)
-    femmesh.addFace([68, 635, 67, 1287, 1165, 94], 277)
-    femmesh.addFace([189, 450, 388, 1288, 1289, 1290], 278)
-    femmesh.addFace([141, 602, 363, 1291, 1292, 893], 279)
-    femmesh.addFace([456, 679, 251, 1279, 1293, 1294], 280)
-    femmesh.addFace([246, 431, 404, 1295, 920, 1296], 281)
-    femmesh.addFace([427, 586, 335, 1297, 1298, 1078], 282)
-    femmesh.addFace([377, 733, 503, 1074, 1299, 1300], 283)
-    femmesh.addFace([258, 718, 426, 1301, 1302, 929], 284)
-    femmesh.addFace([437, 549, 305, 1303, 1304, 1305], 285)
-    femmesh.addFace([477, 799, 334, 1306, 1307, 864], 286)
-    femmesh.addFace([214, 549, 437, 1308, 1303, 1309], 287)
-    femmesh.addFace([204, 686, 442, 1310, 1311, 1312], 288)
-    femmesh.addFace([258, 783, 718, 1313, 1314, 1301], 289)
-    femmesh.addFace([575, 828, 374, 1315, 1316, 1209], 290)
-    femmesh.addFace([141, 604, 142, 892, 1317, 168], 291)
-    femmesh.addFace([450, 789, 388, 1318, 1202, 1289], 292)
-    femmesh.addFace([243, 800, 400, 1149, 1319, 1320], 293)
-    femmesh.addFace([372, 716, 314, 1321, 1322, 1145], 294)
-    femmesh.addFace([248, 696, 463, 1323, 1324, 1085], 295)
-    femmesh.addFace([281, 494, 433, 1325, 1326, 1327], 296)
-    femmesh.addFace([366, 623, 236, 1328, 1329, 1253], 297)
-    femmesh.addFace([367, 594, 250, 1330, 969, 1002], 298)
-    femmesh.addFace([424, 559, 247, 1331, 1332, 1333], 299)
-    femmesh.addFace([306, 559, 424, 1334, 1331, 1335], 300)
-    femmesh.addFace([433, 494, 214, 1326, 1336, 1337], 301)
-    femmesh.addFace([397, 443, 227, 935, 1338, 1339], 302)
-    femmesh.addFace([474, 686, 204, 1340, 1310, 1341], 303)
-    femmesh.addFace([242, 481, 413, 1342, 1343, 1344], 304)
-    femmesh.addFace([371, 529, 262, 1345, 1346, 898], 305)
-    femmesh.addFace([411, 645, 302, 1347, 1348, 1349], 306)
-    femmesh.addFace([364, 581, 201, 1350, 1185, 1098], 307)
-    femmesh.addFace([351, 619, 607, 1351, 1352, 1353], 308)
-    femmesh.addFace([287, 829, 491, 1354, 1355, 979], 309)
-    femmesh.addFace([369, 670, 287, 1187, 1356, 981], 310)
-    femmesh.addFace([56, 646, 55, 889, 1357, 82], 311)
-    femmesh.addFace([202, 654, 395, 1358, 1359, 1360], 312)
-    femmesh.addFace([387, 722, 281, 1111, 1361, 1362], 313)
-    femmesh.addFace([231, 539, 373, 1363, 1364, 1365], 314)
-    femmesh.addFace([387, 804, 193, 1366, 1367, 957], 315)
-    femmesh.addFace([413, 459, 242, 1368, 1089, 1344], 316)
-    femmesh.addFace([358, 584, 487, 1369, 1370, 859], 317)
-    femmesh.addFace([434, 593, 239, 1371, 1372, 1373], 318)
-    femmesh.addFace([377, 503, 277, 1300, 1374, 1375], 319)
-    femmesh.addFace([424, 606, 306, 972, 1376, 1335], 320)
-    femmesh.addFace([239, 500, 434, 883, 1377, 1373], 321)
-    femmesh.addFace([370, 703, 310, 1378, 1379, 1101], 322)
-    femmesh.addFace([468, 501, 189, 1380, 1381, 1382], 323)
-    femmesh.addFace([289, 501, 468, 1383, 1380, 1384], 324)
-    femmesh.addFace([203, 757, 429, 1385, 1150, 1016], 325)
-    femmesh.addFace([369, 582, 480, 1386, 1387, 996], 326)
-    femmesh.addFace([344, 757, 562, 1151, 1388, 1389], 327)
-    femmesh.addFace([286, 582, 369, 1390, 1386, 1227], 328)
-    femmesh.addFace([434, 737, 593, 1391, 1392, 1371], 329)
-    femmesh.addFace([405, 490, 279, 1393, 1394, 1395], 330)
-    femmesh.addFace([234, 672, 385, 1396, 1397, 1157], 331)
-    femmesh.addFace([232, 573, 370, 1398, 1399, 1128], 332)
-    femmesh.addFace([326, 711, 443, 1400, 1401, 1402], 333)
-    femmesh.addFace([10, 595, 11, 905, 1403, 30], 334)
-    femmesh.addFace([110, 729, 493, 1404, 1405, 1406], 335)
-    femmesh.addFace([443, 773, 326, 1407, 1408, 1402], 336)
-    femmesh.addFace([229, 529, 371, 1409, 1345, 1410], 337)
-    femmesh.addFace([350, 724, 461, 902, 1411, 923], 338)
-    femmesh.addFace([260, 488, 455, 1412, 1413, 1159], 339)
-    femmesh.addFace([318, 663, 563, 1414, 986, 1415], 340)
-    femmesh.addFace([429, 665, 240, 1134, 1041, 1416], 341)
-    femmesh.addFace([495, 717, 343, 1181, 1417, 933], 342)
-    femmesh.addFace([467, 808, 247, 1418, 1419, 990], 343)
-    femmesh.addFace([457, 681, 508, 1420, 1421, 1210], 344)
-    femmesh.addFace([264, 520, 383, 1080, 1422, 1423], 345)
-    femmesh.addFace([205, 558, 371, 1424, 1425, 908], 346)
-    femmesh.addFace([69, 635, 68, 1247, 1287, 95], 347)
-    femmesh.addFace([371, 534, 229, 1426, 1427, 1410], 348)
-    femmesh.addFace([373, 636, 231, 1428, 1034, 1365], 349)
-    femmesh.addFace([389, 567, 538, 1194, 1429, 1430], 350)
-    femmesh.addFace([354, 531, 448, 1026, 1431, 1432], 351)
-    femmesh.addFace([484, 639, 323, 1433, 1434, 1435], 352)
-    femmesh.addFace([242, 690, 439, 1088, 1436, 1437], 353)
-    femmesh.addFace([328, 487, 453, 1438, 1439, 1440], 354)
-    femmesh.addFace([484, 769, 639, 1441, 1442, 1433], 355)
-    femmesh.addFace([452, 466, 276, 1443, 1444, 1445], 356)
-    femmesh.addFace([208, 466, 452, 939, 1443, 1232], 357)
-    femmesh.addFace([302, 672, 411, 1446, 1447, 1349], 358)
-    femmesh.addFace([440, 469, 272, 1448, 926, 1449], 359)
-    femmesh.addFace([191, 469, 440, 1450, 1448, 1451], 360)
-    femmesh.addFace([213, 565, 423, 1452, 1453, 1454], 361)
-    femmesh.addFace([423, 565, 301, 1453, 1455, 1456], 362)
-    femmesh.addFace([562, 701, 344, 1457, 1458, 1389], 363)
-    femmesh.addFace([679, 779, 234, 1459, 1460, 1156], 364)
-    femmesh.addFace([607, 619, 291, 1352, 1461, 1462], 365)
-    femmesh.addFace([468, 728, 335, 1463, 1464, 1465], 366)
-    femmesh.addFace([431, 583, 280, 1466, 1467, 921], 367)
-    femmesh.addFace([427, 735, 235, 1077, 1468, 1469], 368)
-    femmesh.addFace([460, 550, 273, 1470, 1163, 1471], 369)
-    femmesh.addFace([200, 727, 634, 1472, 1473, 1140], 370)
-    femmesh.addFace([193, 804, 398, 1367, 1474, 1475], 371)
-    femmesh.addFace([279, 643, 374, 1476, 1477, 1240], 372)
-    femmesh.addFace([438, 819, 207, 1478, 1235, 1479], 373)
-    femmesh.addFace([383, 520, 213, 1422, 1480, 1229], 374)
-    femmesh.addFace([575, 790, 288, 1208, 1481, 1482], 375)
-    femmesh.addFace([59, 530, 58, 1483, 1260, 85], 376)
-    femmesh.addFace([674, 816, 372, 1484, 871, 1144], 377)
-    femmesh.addFace([137, 412, 138, 1485, 1486, 164], 378)
-    femmesh.addFace([396, 495, 259, 1487, 932, 1488], 379)
-    femmesh.addFace([202, 795, 654, 1489, 1490, 1358], 380)
-    femmesh.addFace([99, 495, 98, 1182, 1491, 118], 381)
-    femmesh.addFace([161, 580, 4, 1492, 1493, 188], 382)
-    femmesh.addFace([690, 847, 439, 1494, 1495, 1436], 383)
-    femmesh.addFace([377, 544, 282, 1496, 1497, 1075], 384)
-    femmesh.addFace([268, 530, 386, 1498, 1499, 1500], 385)
-    femmesh.addFace([21, 415, 22, 1501, 1502, 41], 386)
-    femmesh.addFace([6, 414, 7, 1503, 1504, 26], 387)
-    femmesh.addFace([390, 770, 285, 1505, 1506, 1507], 388)
-    femmesh.addFace([328, 795, 487, 1508, 1509, 1438], 389)
-    femmesh.addFace([261, 609, 516, 1510, 1511, 1512], 390)
-    femmesh.addFace([4, 580, 115, 1493, 1513, 135], 391)
-    femmesh.addFace([425, 622, 308, 1176, 1514, 1515], 392)
-    femmesh.addFace([620, 665, 339, 1042, 1516, 1517], 393)
-    femmesh.addFace([379, 768, 207, 1518, 1519, 1237], 394)
-    femmesh.addFace([516, 609, 345, 1511, 982, 1055], 395)
-    femmesh.addFace([261, 510, 436, 1520, 1521, 1522], 396)
-    femmesh.addFace([378, 631, 145, 1282, 1523, 1524], 397)
-    femmesh.addFace([378, 623, 267, 1525, 1526, 1283], 398)
-    femmesh.addFace([212, 483, 458, 1527, 1528, 1529], 399)
-    femmesh.addFace([562, 757, 380, 1388, 1530, 1531], 400)
-    femmesh.addFace([385, 527, 200, 1532, 1533, 1142], 401)
-    femmesh.addFace([108, 436, 107, 1534, 1535, 127], 402)
-    femmesh.addFace([277, 633, 377, 1536, 1537, 1375], 403)
-    femmesh.addFace([145, 687, 378, 1538, 1539, 1524], 404)
-    femmesh.addFace([46, 695, 381, 1540, 1541, 1064], 405)
-    femmesh.addFace([386, 524, 268, 1542, 1008, 1500], 406)
-    femmesh.addFace([12, 659, 394, 1543, 1544, 1153], 407)
-    femmesh.addFace([49, 778, 48, 1545, 966, 75], 408)
-    femmesh.addFace([664, 838, 370, 1546, 1547, 1100], 409)
-    femmesh.addFace([305, 513, 437, 1548, 1549, 1305], 410)
-    femmesh.addFace([437, 513, 237, 1549, 1550, 1551], 411)
-    femmesh.addFace([105, 432, 104, 1552, 1553, 124], 412)
-    femmesh.addFace([257, 543, 402, 1554, 1555, 909], 413)
-    femmesh.addFace([46, 535, 45, 1063, 1556, 72], 414)
-    femmesh.addFace([581, 750, 254, 1557, 1558, 1559], 415)
-    femmesh.addFace([367, 669, 513, 1001, 1560, 1561], 416)
-    femmesh.addFace([618, 620, 339, 1562, 1517, 1563], 417)
-    femmesh.addFace([427, 557, 293, 1564, 1565, 1566], 418)
-    femmesh.addFace([513, 669, 237, 1560, 1567, 1550], 419)
-    femmesh.addFace([480, 582, 191, 1387, 1568, 1569], 420)
-    femmesh.addFace([235, 557, 427, 1570, 1564, 1469], 421)
-    femmesh.addFace([428, 613, 206, 1571, 1572, 1036], 422)
-    femmesh.addFace([395, 816, 202, 899, 1573, 1360], 423)
-    femmesh.addFace([295, 647, 611, 1574, 1575, 1124], 424)
-    femmesh.addFace([423, 506, 236, 1576, 1251, 1577], 425)
-    femmesh.addFace([243, 834, 535, 1578, 1579, 1138], 426)
-    femmesh.addFace([301, 506, 423, 1580, 1576, 1456], 427)
-    femmesh.addFace([270, 800, 695, 1581, 1582, 1583], 428)
-    femmesh.addFace([242, 837, 481, 1584, 1585, 1342], 429)
-    femmesh.addFace([383, 686, 264, 1586, 1587, 1423], 430)
-    femmesh.addFace([363, 808, 467, 1588, 1418, 1589], 431)
-    femmesh.addFace([217, 663, 484, 987, 1590, 1591], 432)
-    femmesh.addFace([110, 493, 109, 1406, 1592, 129], 433)
-    femmesh.addFace([335, 760, 468, 1593, 1594, 1465], 434)
-    femmesh.addFace([443, 711, 227, 1401, 1595, 1338], 435)
-    femmesh.addFace([434, 500, 333, 1377, 1131, 1277], 436)
-    femmesh.addFace([646, 759, 55, 1596, 1597, 1357], 437)
-    femmesh.addFace([399, 778, 50, 1598, 1599, 1600], 438)
-    femmesh.addFace([259, 635, 396, 1601, 1246, 1488], 439)
-    femmesh.addFace([393, 618, 339, 1602, 1563, 1094], 440)
-    femmesh.addFace([493, 729, 346, 1405, 1603, 1604], 441)
-    femmesh.addFace([611, 647, 368, 1575, 1605, 1606], 442)
-    femmesh.addFace([388, 728, 189, 1607, 1608, 1290], 443)
-    femmesh.addFace([53, 759, 445, 1609, 1610, 1611], 444)
-    femmesh.addFace([55, 759, 54, 1597, 1612, 81], 445)
-    femmesh.addFace([211, 490, 404, 1613, 1614, 1615], 446)
-    femmesh.addFace([251, 634, 509, 1616, 1617, 1618], 447)
-    femmesh.addFace([325, 801, 432, 1619, 1620, 1621], 448)
-    femmesh.addFace([324, 710, 386, 1622, 1623, 1624], 449)
-    femmesh.addFace([206, 744, 389, 1625, 1626, 1037], 450)
-    femmesh.addFace([460, 648, 550, 1627, 1628, 1470], 451)
-    femmesh.addFace([402, 547, 260, 1629, 1630, 919], 452)
-    femmesh.addFace([281, 722, 494, 1361, 1631, 1325], 453)
-    femmesh.addFace([275, 775, 409, 1632, 1633, 1052], 454)
-    femmesh.addFace([515, 840, 230, 1634, 1635, 854], 455)
-    femmesh.addFace([214, 505, 433, 1636, 1637, 1337], 456)
-    femmesh.addFace([386, 612, 324, 1638, 1639, 1624], 457)
-    femmesh.addFace([297, 653, 472, 1640, 1641, 1642], 458)
-    femmesh.addFace([264, 544, 498, 1643, 1644, 1081], 459)
-    femmesh.addFace([671, 698, 451, 1645, 1646, 1647], 460)
-    femmesh.addFace([450, 753, 263, 1648, 1649, 1650], 461)
-    femmesh.addFace([215, 629, 446, 1651, 1652, 1653], 462)
-    femmesh.addFace([240, 607, 429, 1654, 1655, 1416], 463)
-    femmesh.addFace([271, 749, 388, 1656, 1657, 1204], 464)
-    femmesh.addFace([416, 635, 259, 1166, 1601, 1658], 465)
-    femmesh.addFace([194, 649, 478, 1659, 1660, 1661], 466)
-    femmesh.addFace([478, 649, 331, 1660, 1662, 1663], 467)
-    femmesh.addFace([465, 631, 267, 1664, 1281, 1665], 468)
-    femmesh.addFace([389, 538, 271, 1430, 1666, 1031], 469)
-    femmesh.addFace([69, 796, 396, 1667, 1668, 1248], 470)
-    femmesh.addFace([390, 599, 65, 1669, 1670, 1671], 471)
-    femmesh.addFace([416, 540, 285, 1672, 1673, 1674], 472)
-    femmesh.addFace([281, 776, 387, 1675, 1676, 1362], 473)
-    femmesh.addFace([299, 655, 447, 1677, 1678, 1679], 474)
-    femmesh.addFace([19, 463, 20, 1222, 1680, 39], 475)
-    femmesh.addFace([259, 540, 416, 1681, 1672, 1658], 476)
-    femmesh.addFace([54, 759, 53, 1612, 1609, 80], 477)
-    femmesh.addFace([226, 615, 393, 1162, 1682, 1096], 478)
-    femmesh.addFace([209, 645, 411, 1683, 1347, 1684], 479)
-    femmesh.addFace([254, 702, 581, 992, 1685, 1559], 480)
-    femmesh.addFace([270, 695, 502, 1583, 1686, 1687], 481)
-    femmesh.addFace([432, 801, 553, 1620, 1688, 1689], 482)
-    femmesh.addFace([232, 772, 391, 1690, 1691, 1692], 483)
-    femmesh.addFace([303, 627, 545, 1152, 952, 1693], 484)
-    femmesh.addFace([454, 613, 263, 1694, 1695, 1696], 485)
-    femmesh.addFace([509, 634, 332, 1617, 1697, 1698], 486)
-    femmesh.addFace([222, 547, 402, 1699, 1629, 1700], 487)
-    femmesh.addFace([317, 613, 454, 1701, 1694, 1702], 488)
-    femmesh.addFace([283, 578, 511, 1703, 1704, 1705], 489)
-    femmesh.addFace([436, 510, 107, 1521, 1706, 1535], 490)
-    femmesh.addFace([220, 828, 575, 1707, 1315, 1708], 491)
-    femmesh.addFace([402, 543, 222, 1555, 1709, 1700], 492)
-    femmesh.addFace([268, 676, 470, 1039, 1710, 1056], 493)
-    femmesh.addFace([448, 531, 255, 1431, 1711, 1192], 494)
-    femmesh.addFace([305, 590, 513, 1712, 1713, 1548], 495)
-    femmesh.addFace([285, 770, 579, 1506, 1714, 1715], 496)
-    femmesh.addFace([196, 556, 492, 1716, 1717, 1718], 497)
-    femmesh.addFace([418, 559, 306, 1719, 1334, 1720], 498)
-    femmesh.addFace([588, 653, 297, 1721, 1640, 1722], 499)
-    femmesh.addFace([492, 556, 313, 1717, 1723, 1724], 500)
-    femmesh.addFace([609, 757, 203, 1725, 1385, 983], 501)
-    femmesh.addFace([487, 584, 256, 1370, 1726, 1727], 502)
-    femmesh.addFace([552, 753, 450, 1728, 1648, 1729], 503)
-    femmesh.addFace([444, 489, 256, 943, 1730, 1731], 504)
-    femmesh.addFace([420, 522, 249, 1732, 1733, 1734], 505)
-    femmesh.addFace([263, 753, 454, 1649, 1735, 1696], 506)
-    femmesh.addFace([400, 519, 243, 1736, 1737, 1320], 507)
-    femmesh.addFace([226, 701, 562, 1095, 1457, 1738], 508)
-    femmesh.addFace([590, 844, 513, 1739, 1740, 1713], 509)
-    femmesh.addFace([278, 555, 398, 1091, 1741, 1742], 510)
-    femmesh.addFace([546, 782, 232, 1743, 1744, 1127], 511)
-    femmesh.addFace([398, 555, 193, 1741, 1745, 1475], 512)
-    femmesh.addFace([248, 523, 421, 1746, 1747, 1748], 513)
-    femmesh.addFace([389, 744, 274, 1626, 1749, 1195], 514)
-    femmesh.addFace([453, 487, 256, 1439, 1727, 1750], 515)
-    femmesh.addFace([189, 728, 468, 1608, 1463, 1382], 516)
-    femmesh.addFace([255, 851, 403, 1751, 1752, 1753], 517)
-    femmesh.addFace([218, 814, 403, 1754, 1755, 1756], 518)
-    femmesh.addFace([451, 556, 196, 1757, 1716, 1758], 519)
-    femmesh.addFace([293, 556, 451, 1759, 1757, 1760], 520)
-    femmesh.addFace([311, 680, 430, 1761, 1021, 946], 521)
-    femmesh.addFace([421, 532, 309, 1762, 1763, 1764], 522)
-    femmesh.addFace([108, 625, 436, 1765, 1766, 1534], 523)
-    femmesh.addFace([399, 712, 276, 1767, 1768, 1769], 524)
-    femmesh.addFace([301, 598, 506, 1770, 1771, 1580], 525)
-    femmesh.addFace([308, 519, 420, 1772, 1773, 1774], 526)
-    femmesh.addFace([200, 527, 408, 1533, 1775, 1776], 527)
-    femmesh.addFace([478, 543, 257, 1777, 1554, 1778], 528)
-    femmesh.addFace([627, 671, 196, 1119, 1779, 1780], 529)
-    femmesh.addFace([408, 527, 302, 1775, 1781, 1045], 530)
-    femmesh.addFace([531, 655, 362, 1782, 1783, 1784], 531)
-    femmesh.addFace([412, 688, 606, 1785, 1786, 1787], 532)
-    femmesh.addFace([249, 522, 433, 1733, 1788, 1789], 533)
-    femmesh.addFace([391, 573, 232, 1790, 1398, 1692], 534)
-    femmesh.addFace([228, 655, 531, 1791, 1782, 1116], 535)
-    femmesh.addFace([534, 830, 756, 1792, 1793, 1794], 536)
-    femmesh.addFace([63, 456, 62, 1795, 1796, 89], 537)
-    femmesh.addFace([277, 573, 391, 1797, 1790, 1798], 538)
-    femmesh.addFace([488, 673, 455, 1799, 1800, 1413], 539)
-    femmesh.addFace([209, 726, 457, 1801, 1802, 1212], 540)
-    femmesh.addFace([452, 709, 407, 1803, 1804, 1233], 541)
-    femmesh.addFace([271, 538, 401, 1666, 1805, 1806], 542)
-    femmesh.addFace([406, 570, 274, 1807, 1230, 1808], 543)
-    femmesh.addFace([416, 579, 67, 1809, 1810, 1167], 544)
-    femmesh.addFace([401, 749, 271, 1811, 1656, 1806], 545)
-    femmesh.addFace([553, 578, 283, 1812, 1703, 1813], 546)
-    femmesh.addFace([159, 499, 160, 1814, 1815, 186], 547)
-    femmesh.addFace([435, 523, 248, 1816, 1746, 1817], 548)
-    femmesh.addFace([50, 778, 49, 1599, 1545, 76], 549)
-    femmesh.addFace([196, 671, 451, 1779, 1647, 1758], 550)
-    femmesh.addFace([613, 719, 206, 1818, 1819, 1572], 551)
-    femmesh.addFace([114, 526, 113, 1820, 874, 133], 552)
-    femmesh.addFace([146, 465, 147, 1821, 1822, 173], 553)
-    femmesh.addFace([227, 678, 397, 1823, 1824, 1339], 554)
-    femmesh.addFace([397, 678, 312, 1824, 1825, 1826], 555)
-    femmesh.addFace([380, 667, 562, 1827, 1828, 1531], 556)
-    femmesh.addFace([294, 603, 392, 1829, 1830, 1831], 557)
-    femmesh.addFace([562, 667, 298, 1828, 1832, 1833], 558)
-    femmesh.addFace([463, 621, 20, 1834, 1835, 1680], 559)
-    femmesh.addFace([364, 750, 581, 1836, 1557, 1350], 560)
-    femmesh.addFace([197, 620, 618, 1837, 1562, 1838], 561)
-    femmesh.addFace([150, 640, 419, 1839, 1840, 1841], 562)
-    femmesh.addFace([279, 794, 405, 1842, 1843, 1395], 563)
-    femmesh.addFace([295, 662, 560, 1844, 1845, 1846], 564)
-    femmesh.addFace([391, 633, 277, 1847, 1536, 1798], 565)
-    femmesh.addFace([392, 687, 144, 1848, 1849, 1020], 566)
-    femmesh.addFace([105, 723, 432, 1850, 1851, 1552], 567)
-    femmesh.addFace([159, 713, 499, 1852, 1853, 1814], 568)
-    femmesh.addFace([391, 583, 192, 1854, 1855, 1856], 569)
-    femmesh.addFace([261, 802, 510, 1857, 1858, 1520], 570)
-    femmesh.addFace([221, 691, 453, 1859, 1860, 1861], 571)
-    femmesh.addFace([461, 561, 216, 1862, 1863, 924], 572)
-    femmesh.addFace([453, 691, 328, 1860, 1864, 1440], 573)
-    femmesh.addFace([408, 809, 200, 1865, 1866, 1776], 574)
-    femmesh.addFace([521, 775, 275, 1867, 1632, 1168], 575)
-    femmesh.addFace([65, 770, 390, 1868, 1505, 1671], 576)
-    femmesh.addFace([454, 753, 536, 1735, 1869, 1870], 577)
-    femmesh.addFace([401, 538, 216, 1805, 1871, 1872], 578)
-    femmesh.addFace([148, 497, 149, 1873, 1874, 175], 579)
-    femmesh.addFace([426, 617, 365, 1875, 1876, 930], 580)
-    femmesh.addFace([157, 475, 158, 1877, 1878, 184], 581)
-    femmesh.addFace([403, 781, 218, 1879, 1880, 1756], 582)
-    femmesh.addFace([598, 836, 506, 1881, 1882, 1771], 583)
-    femmesh.addFace([412, 606, 138, 1787, 1883, 1486], 584)
-    femmesh.addFace([560, 662, 360, 1845, 1884, 1885], 585)
-    femmesh.addFace([476, 545, 265, 1886, 954, 1887], 586)
-    femmesh.addFace([409, 530, 268, 1261, 1498, 1057], 587)
-    femmesh.addFace([629, 825, 446, 1888, 1889, 1652], 588)
-    femmesh.addFace([411, 672, 234, 1447, 1396, 1890], 589)
-    femmesh.addFace([404, 568, 211, 1891, 1892, 1615], 590)
-    femmesh.addFace([544, 784, 498, 1893, 1894, 1644], 591)
-    femmesh.addFace([285, 697, 390, 1895, 1896, 1507], 592)
-    femmesh.addFace([413, 828, 220, 1897, 1707, 1898], 593)
-    femmesh.addFace([280, 568, 404, 1899, 1891, 922], 594)
-    femmesh.addFace([584, 588, 297, 1900, 1722, 1901], 595)
-    femmesh.addFace([661, 739, 361, 1902, 1903, 1904], 596)
-    femmesh.addFace([192, 633, 391, 1905, 1847, 1856], 597)
-    femmesh.addFace([414, 622, 7, 1906, 1907, 1504], 598)
-    femmesh.addFace([21, 621, 415, 1908, 1909, 1501], 599)
-    femmesh.addFace([358, 588, 584, 1910, 1900, 1369], 600)
-    femmesh.addFace([392, 652, 294, 1214, 1911, 1831], 601)
-    femmesh.addFace([274, 797, 406, 1912, 1913, 1808], 602)
-    femmesh.addFace([428, 789, 263, 1914, 1915, 1916], 603)
-    femmesh.addFace([440, 851, 255, 1917, 1751, 1918], 604)
-    femmesh.addFace([318, 563, 497, 1415, 1919, 1920], 605)
-    femmesh.addFace([405, 812, 490, 1921, 1922, 1393], 606)
-    femmesh.addFace([497, 563, 284, 1919, 1923, 1924], 607)
-    femmesh.addFace([606, 688, 306, 1786, 1925, 1376], 608)
-    femmesh.addFace([535, 834, 375, 1579, 1926, 1927], 609)
-    femmesh.addFace([256, 584, 444, 1726, 1928, 1731], 610)
-    femmesh.addFace([444, 584, 297, 1928, 1901, 1929], 611)
-    femmesh.addFace([394, 656, 237, 1930, 1931, 1932], 612)
-    femmesh.addFace([244, 532, 418, 1933, 1934, 1935], 613)
-    femmesh.addFace([296, 656, 394, 1936, 1930, 1937], 614)
-    femmesh.addFace([237, 758, 394, 1938, 1939, 1932], 615)
-    femmesh.addFace([407, 709, 241, 1804, 1940, 1941], 616)
-    femmesh.addFace([436, 625, 298, 1766, 1942, 1943], 617)
-    femmesh.addFace([297, 642, 444, 1944, 940, 1929], 618)
-    femmesh.addFace([303, 545, 407, 1693, 1945, 1946], 619)
-    femmesh.addFace([233, 551, 408, 1947, 1948, 1049], 620)
-    femmesh.addFace([542, 668, 329, 1949, 1950, 1951], 621)
-    femmesh.addFace([433, 522, 281, 1788, 1952, 1327], 622)
-    femmesh.addFace([205, 792, 420, 1953, 1954, 1955], 623)
-    femmesh.addFace([142, 652, 143, 1956, 1213, 169], 624)
-    femmesh.addFace([410, 741, 322, 1957, 1958, 1959], 625)
-    femmesh.addFace([238, 741, 410, 1960, 1957, 867], 626)
-    femmesh.addFace([231, 743, 539, 1961, 1224, 1363], 627)
-    femmesh.addFace([542, 840, 668, 1962, 1963, 1949], 628)
-    femmesh.addFace([200, 809, 448, 1866, 1964, 1965], 629)
-    femmesh.addFace([406, 797, 238, 1913, 1966, 1967], 630)
-    femmesh.addFace([448, 809, 354, 1964, 1968, 1432], 631)
-    femmesh.addFace([282, 523, 435, 1969, 1816, 1970], 632)
-    femmesh.addFace([421, 788, 204, 1971, 1972, 1973], 633)
-    femmesh.addFace([322, 546, 410, 1974, 1975, 1959], 634)
-    femmesh.addFace([432, 723, 325, 1851, 1976, 1621], 635)
-    femmesh.addFace([222, 641, 547, 1274, 1977, 1699], 636)
-    femmesh.addFace([385, 672, 527, 1397, 1978, 1532], 637)
-    femmesh.addFace([482, 740, 719, 1979, 1980, 1981], 638)
-    femmesh.addFace([457, 726, 540, 1802, 1982, 1983], 639)
-    femmesh.addFace([276, 566, 399, 1984, 1985, 1769], 640)
-    femmesh.addFace([260, 547, 488, 1630, 1986, 1412], 641)
-    femmesh.addFace([380, 757, 609, 1530, 1725, 1987], 642)
-    femmesh.addFace([336, 793, 496, 1988, 1989, 1015], 643)
-    femmesh.addFace([655, 767, 447, 1990, 1991, 1678], 644)
-    femmesh.addFace([394, 616, 13, 1992, 1993, 1154], 645)
-    femmesh.addFace([524, 781, 352, 1994, 1995, 1009], 646)
-    femmesh.addFace([193, 570, 406, 1996, 1807, 1997], 647)
-    femmesh.addFace([263, 789, 450, 1915, 1318, 1650], 648)
-    femmesh.addFace([507, 549, 292, 1998, 1999, 2000], 649)
-    femmesh.addFace([394, 659, 296, 1544, 2001, 1937], 650)
-    femmesh.addFace([305, 549, 507, 1304, 1998, 2002], 651)
-    femmesh.addFace([238, 797, 417, 1966, 2003, 2004], 652)
-    femmesh.addFace([404, 812, 246, 2005, 2006, 1296], 653)
-    femmesh.addFace([373, 539, 479, 1364, 2007, 1218], 654)
-    femmesh.addFace([211, 790, 643, 2008, 2009, 2010], 655)
-    femmesh.addFace([419, 704, 150, 2011, 2012, 1841], 656)
-    femmesh.addFace([191, 582, 469, 1568, 2013, 1450], 657)
-    femmesh.addFace([395, 654, 257, 1359, 2014, 911], 658)
-    femmesh.addFace([155, 642, 472, 2015, 2016, 2017], 659)
-    femmesh.addFace([405, 794, 198, 1843, 2018, 2019], 660)
-    femmesh.addFace([274, 744, 417, 1749, 2020, 2021], 661)
-    femmesh.addFace([309, 621, 463, 2022, 1834, 2023], 662)
-    femmesh.addFace([322, 740, 482, 2024, 1979, 2025], 663)
-    femmesh.addFace([466, 566, 276, 2026, 1984, 1444], 664)
-    femmesh.addFace([536, 790, 211, 2027, 2008, 2028], 665)
-    femmesh.addFace([483, 750, 458, 2029, 2030, 1528], 666)
-    femmesh.addFace([430, 636, 291, 1035, 2031, 2032], 667)
-    femmesh.addFace([417, 797, 274, 2003, 1912, 2021], 668)
-    femmesh.addFace([379, 678, 571, 2033, 2034, 2035], 669)
-    femmesh.addFace([107, 510, 106, 1706, 2036, 126], 670)
-    femmesh.addFace([317, 528, 482, 2037, 2038, 2039], 671)
-    femmesh.addFace([220, 748, 413, 2040, 2041, 1898], 672)
-    femmesh.addFace([413, 748, 321, 2041, 2042, 2043], 673)
-    femmesh.addFace([695, 800, 381, 1582, 1148, 1541], 674)
-    femmesh.addFace([398, 771, 278, 2044, 2045, 1742], 675)
-    femmesh.addFace([607, 791, 429, 2046, 2047, 1655], 676)
-    femmesh.addFace([508, 517, 320, 2048, 958, 2049], 677)
-    femmesh.addFace([265, 561, 461, 2050, 1862, 2051], 678)
-    femmesh.addFace([604, 652, 142, 2052, 1956, 1317], 679)
-    femmesh.addFace([478, 647, 194, 2053, 2054, 1661], 680)
-    femmesh.addFace([468, 760, 252, 1594, 2055, 2056], 681)
-    femmesh.addFace([312, 698, 671, 2057, 1645, 2058], 682)
-    femmesh.addFace([465, 663, 318, 2059, 1414, 2060], 683)
-    femmesh.addFace([57, 521, 56, 2061, 1106, 83], 684)
-    femmesh.addFace([50, 712, 399, 2062, 1767, 1600], 685)
-    femmesh.addFace([403, 591, 255, 2063, 1190, 1753], 686)
-    femmesh.addFace([351, 607, 515, 1353, 2064, 853], 687)
-    femmesh.addFace([310, 658, 594, 2065, 949, 2066], 688)
-    femmesh.addFace([204, 807, 421, 2067, 2068, 1973], 689)
-    femmesh.addFace([533, 827, 272, 1269, 2069, 1069], 690)
-    femmesh.addFace([321, 715, 413, 2070, 2071, 2043], 691)
-    femmesh.addFace([137, 762, 412, 2072, 1254, 1485], 692)
-    femmesh.addFace([593, 737, 331, 1392, 2073, 2074], 693)
-    femmesh.addFace([312, 671, 397, 2058, 1118, 1826], 694)
-    femmesh.addFace([534, 756, 229, 1794, 2075, 1427], 695)
-    femmesh.addFace([207, 676, 533, 2076, 1200, 2077], 696)
-    femmesh.addFace([198, 598, 405, 2078, 2079, 2019], 697)
-    femmesh.addFace([571, 678, 227, 2034, 1823, 2080], 698)
-    femmesh.addFace([365, 720, 706, 2081, 2082, 2083], 699)
-    femmesh.addFace([285, 579, 416, 1715, 1809, 1674], 700)
-    femmesh.addFace([210, 586, 427, 2084, 1297, 2085], 701)
-    femmesh.addFace([205, 841, 558, 2086, 2087, 1424], 702)
-    femmesh.addFace([499, 713, 336, 1853, 2088, 2089], 703)
-    femmesh.addFace([756, 830, 347, 1793, 2090, 2091], 704)
-    femmesh.addFace([202, 816, 674, 1573, 1484, 912], 705)
-    femmesh.addFace([216, 682, 401, 2092, 2093, 1872], 706)
-    femmesh.addFace([419, 640, 284, 1840, 2094, 963], 707)
-    femmesh.addFace([413, 715, 459, 2071, 2095, 1368], 708)
-    femmesh.addFace([248, 684, 435, 2096, 2097, 1817], 709)
-    femmesh.addFace([432, 553, 283, 1689, 1813, 2098], 710)
-    femmesh.addFace([267, 663, 465, 2099, 2059, 1665], 711)
-    femmesh.addFace([406, 608, 193, 2100, 955, 1997], 712)
-    femmesh.addFace([11, 659, 12, 2101, 1543, 31], 713)
-    femmesh.addFace([6, 751, 414, 2102, 2103, 1503], 714)
-    femmesh.addFace([415, 752, 22, 2104, 2105, 1502], 715)
-    femmesh.addFace([48, 502, 47, 995, 2106, 74], 716)
-    femmesh.addFace([199, 590, 410, 2107, 1011, 2108], 717)
-    femmesh.addFace([558, 841, 400, 2087, 2109, 2110], 718)
-    femmesh.addFace([460, 666, 195, 2111, 2112, 2113], 719)
-    femmesh.addFace([407, 683, 303, 2114, 1188, 1946], 720)
-    femmesh.addFace([241, 683, 407, 2115, 2114, 1941], 721)
-    femmesh.addFace([454, 738, 317, 2116, 2117, 1702], 722)
-    femmesh.addFace([410, 838, 199, 2118, 2119, 2108], 723)
-    femmesh.addFace([520, 565, 213, 2120, 1452, 1480], 724)
-    femmesh.addFace([414, 774, 622, 2121, 2122, 1906], 725)
-    femmesh.addFace([315, 565, 520, 2123, 2120, 1136], 726)
-    femmesh.addFace([422, 597, 300, 2124, 2125, 2126], 727)
-    femmesh.addFace([411, 697, 285, 2127, 1895, 2128], 728)
-    femmesh.addFace([285, 726, 411, 2129, 2130, 2128], 729)
-    femmesh.addFace([456, 780, 349, 2131, 2132, 1280], 730)
-    femmesh.addFace([18, 597, 422, 2133, 2124, 1267], 731)
-    femmesh.addFace([306, 688, 418, 1925, 2134, 1720], 732)
-    femmesh.addFace([238, 694, 406, 2135, 2136, 1967], 733)
-    femmesh.addFace([409, 775, 58, 1633, 2137, 1262], 734)
-    femmesh.addFace([418, 688, 244, 2134, 2138, 1935], 735)
-    femmesh.addFace([272, 851, 440, 2139, 1917, 1449], 736)
-    femmesh.addFace([746, 751, 5, 2140, 2141, 2142], 737)
-    femmesh.addFace([23, 752, 745, 2143, 2144, 2145], 738)
-    femmesh.addFace([292, 549, 494, 1999, 2146, 2147], 739)
-    femmesh.addFace([481, 828, 413, 2148, 1897, 1343], 740)
-    femmesh.addFace([547, 641, 334, 1977, 2149, 2150], 741)
-    femmesh.addFace([494, 549, 214, 2146, 1308, 1336], 742)
-    femmesh.addFace([411, 726, 209, 2130, 1801, 1684], 743)
-    femmesh.addFace([407, 842, 208, 2151, 2152, 1234], 744)
-    femmesh.addFace([596, 661, 361, 2153, 1904, 2154], 745)
-    femmesh.addFace([454, 536, 211, 1870, 2028, 2155], 746)
-    femmesh.addFace([417, 741, 238, 2156, 1960, 2004], 747)
-    femmesh.addFace([492, 561, 265, 2157, 2050, 1266], 748)
-    femmesh.addFace([507, 590, 305, 1012, 1712, 2002], 749)
-    femmesh.addFace([558, 800, 270, 2158, 1581, 2159], 750)
-    femmesh.addFace([745, 762, 136, 2160, 2161, 2162], 751)
-    femmesh.addFace([234, 697, 411, 2163, 2127, 1890], 752)
-    femmesh.addFace([279, 837, 439, 2164, 2165, 2166], 753)
-    femmesh.addFace([247, 559, 442, 1332, 2167, 1104], 754)
-    femmesh.addFace([400, 800, 558, 1319, 2158, 2110], 755)
-    femmesh.addFace([215, 577, 503, 2168, 2169, 2170], 756)
-    femmesh.addFace([531, 848, 255, 2171, 2172, 1711], 757)
-    femmesh.addFace([207, 768, 470, 1519, 2173, 2174], 758)
-    femmesh.addFace([154, 642, 155, 941, 2015, 181], 759)
-    femmesh.addFace([112, 512, 111, 2175, 2176, 131], 760)
-    femmesh.addFace([476, 554, 208, 2177, 937, 2178], 761)
-    femmesh.addFace([430, 619, 190, 2179, 2180, 948], 762)
-    femmesh.addFace([291, 619, 430, 1461, 2179, 2032], 763)
-    femmesh.addFace([484, 677, 217, 2181, 2182, 1591], 764)
-    femmesh.addFace([323, 677, 484, 2183, 2181, 1435], 765)
-    femmesh.addFace([357, 840, 515, 2184, 1634, 1196], 766)
-    femmesh.addFace([431, 651, 192, 2185, 2186, 2187], 767)
-    femmesh.addFace([447, 767, 290, 1991, 2188, 2189], 768)
-    femmesh.addFace([424, 602, 140, 2190, 2191, 1072], 769)
-    femmesh.addFace([192, 583, 431, 1855, 1466, 2187], 770)
-    femmesh.addFace([441, 572, 239, 2192, 1219, 2193], 771)
-    femmesh.addFace([213, 638, 467, 2194, 2195, 1228], 772)
-    femmesh.addFace([198, 794, 439, 2018, 2196, 2197], 773)
-    femmesh.addFace([318, 707, 465, 2198, 2199, 2060], 774)
-    femmesh.addFace([189, 552, 450, 2200, 1729, 1288], 775)
-    femmesh.addFace([457, 540, 259, 1983, 1681, 857], 776)
-    femmesh.addFace([482, 528, 232, 2038, 2201, 2202], 777)
-    femmesh.addFace([269, 517, 508, 2203, 2048, 2204], 778)
-    femmesh.addFace([195, 739, 661, 2205, 1902, 2206], 779)
-    femmesh.addFace([426, 821, 617, 2207, 2208, 1875], 780)
-    femmesh.addFace([403, 814, 591, 1755, 2209, 2063], 781)
-    femmesh.addFace([244, 688, 412, 2138, 1785, 1199], 782)
-    femmesh.addFace([439, 837, 242, 2165, 1584, 1437], 783)
-    femmesh.addFace([332, 727, 591, 2210, 1216, 2211], 784)
-    femmesh.addFace([425, 589, 9, 2212, 2213, 1215], 785)
-    femmesh.addFace([440, 839, 191, 2214, 2215, 1451], 786)
-    femmesh.addFace([215, 733, 435, 2216, 2217, 2218], 787)
-    femmesh.addFace([419, 637, 327, 962, 2219, 2220], 788)
-    femmesh.addFace([289, 572, 441, 2221, 2192, 2222], 789)
-    femmesh.addFace([282, 544, 474, 1497, 2223, 2224], 790)
-    femmesh.addFace([504, 798, 103, 2225, 2226, 2227], 791)
-    femmesh.addFace([283, 632, 432, 2228, 2229, 2098], 792)
-    femmesh.addFace([236, 603, 423, 2230, 2231, 1577], 793)
-    femmesh.addFace([63, 780, 456, 2232, 2131, 1795], 794)
-    femmesh.addFace([304, 661, 596, 2233, 2153, 2234], 795)
-    femmesh.addFace([422, 684, 248, 2235, 2096, 1087], 796)
-    femmesh.addFace([623, 803, 236, 2236, 2237, 1329], 797)
-    femmesh.addFace([300, 684, 422, 2238, 2235, 2126], 798)
-    femmesh.addFace([327, 704, 419, 2239, 2011, 2220], 799)
-    femmesh.addFace([420, 841, 205, 2240, 2086, 1955], 800)
-    femmesh.addFace([582, 810, 469, 2241, 2242, 2013], 801)
-    femmesh.addFace([271, 789, 428, 1203, 1914, 1029], 802)
-    femmesh.addFace([442, 686, 383, 1311, 1586, 1105], 803)
-    femmesh.addFace([255, 848, 440, 2172, 2243, 1918], 804)
-    femmesh.addFace([474, 544, 264, 2223, 1643, 2244], 805)
-    femmesh.addFace([595, 659, 11, 2245, 2101, 1403], 806)
-    femmesh.addFace([309, 696, 421, 2246, 2247, 1764], 807)
-    femmesh.addFace([421, 696, 248, 2247, 1323, 1748], 808)
-    femmesh.addFace([429, 791, 373, 2047, 2248, 1017], 809)
-    femmesh.addFace([461, 724, 265, 1411, 2249, 2051], 810)
-    femmesh.addFace([479, 539, 273, 2007, 1250, 1164], 811)
-    femmesh.addFace([528, 772, 232, 2250, 1690, 2201], 812)
-    femmesh.addFace([289, 785, 501, 2251, 2252, 1383], 813)
-    femmesh.addFace([465, 707, 147, 2199, 2253, 1822], 814)
-    femmesh.addFace([459, 560, 360, 2254, 1885, 1084], 815)
-    femmesh.addFace([464, 586, 210, 2255, 2084, 2256], 816)
-    femmesh.addFace([149, 640, 150, 2257, 1839, 176], 817)
-    femmesh.addFace([263, 613, 428, 1695, 1571, 1916], 818)
-    femmesh.addFace([103, 798, 102, 2226, 2258, 122], 819)
-    femmesh.addFace([101, 518, 100, 2259, 2260, 120], 820)
-    femmesh.addFace([67, 579, 66, 1810, 2261, 93], 821)
-    femmesh.addFace([436, 667, 261, 2262, 2263, 1522], 822)
-    femmesh.addFace([298, 667, 436, 1832, 2262, 1943], 823)
-    femmesh.addFace([331, 543, 478, 2264, 1777, 1663], 824)
-    femmesh.addFace([293, 644, 427, 2265, 2266, 1566], 825)
-    femmesh.addFace([621, 811, 415, 2267, 2268, 1909], 826)
-    femmesh.addFace([427, 644, 210, 2266, 2269, 2085], 827)
-    femmesh.addFace([601, 612, 61, 2270, 2271, 2272], 828)
-    femmesh.addFace([365, 706, 496, 2083, 2273, 1205], 829)
-    femmesh.addFace([420, 700, 308, 2274, 2275, 1774], 830)
-    femmesh.addFace([249, 700, 420, 2276, 2274, 1734], 831)
-    femmesh.addFace([194, 560, 459, 2277, 2254, 2278], 832)
-    femmesh.addFace([423, 638, 213, 2279, 2194, 1454], 833)
-    femmesh.addFace([475, 713, 158, 2280, 2281, 1878], 834)
-    femmesh.addFace([447, 614, 212, 2282, 2283, 2284], 835)
-    femmesh.addFace([551, 675, 354, 2285, 1024, 2286], 836)
-    femmesh.addFace([290, 614, 447, 2287, 2282, 2189], 837)
-    femmesh.addFace([265, 724, 476, 2249, 2288, 1887], 838)
-    femmesh.addFace([326, 773, 445, 1408, 2289, 2290], 839)
-    femmesh.addFace([316, 675, 551, 2291, 2285, 2292], 840)
-    femmesh.addFace([447, 592, 299, 2293, 2294, 1679], 841)
-    femmesh.addFace([445, 773, 241, 2289, 2295, 2296], 842)
-    femmesh.addFace([212, 592, 447, 2297, 2293, 2284], 843)
-    femmesh.addFace([245, 698, 438, 2298, 2299, 2300], 844)
-    femmesh.addFace([65, 599, 64, 1670, 2301, 91], 845)
-    femmesh.addFace([278, 554, 476, 2302, 2177, 2303], 846)
-    femmesh.addFace([211, 568, 454, 1892, 2304, 2155], 847)
-    femmesh.addFace([218, 781, 524, 1880, 1994, 2305], 848)
-    femmesh.addFace([433, 731, 249, 2306, 2307, 1789], 849)
-    femmesh.addFace([478, 833, 647, 2308, 2309, 2053], 850)
-    femmesh.addFace([276, 712, 537, 1768, 2310, 2311], 851)
-    femmesh.addFace([420, 792, 522, 1954, 2312, 1732], 852)
-    femmesh.addFace([486, 563, 217, 2313, 988, 2314], 853)
-    femmesh.addFace([432, 632, 104, 2229, 2315, 1553], 854)
-    femmesh.addFace([490, 643, 279, 2316, 1476, 1394], 855)
-    femmesh.addFace([219, 574, 511, 2317, 2318, 2319], 856)
-    femmesh.addFace([468, 587, 289, 2320, 2321, 1384], 857)
-    femmesh.addFace([252, 587, 468, 1171, 2320, 2056], 858)
-    femmesh.addFace([247, 808, 424, 1419, 2322, 1333], 859)
-    femmesh.addFace([499, 600, 307, 2323, 2324, 2325], 860)
-    femmesh.addFace([439, 794, 279, 2196, 1842, 2166], 861)
-    femmesh.addFace([435, 629, 215, 2326, 1651, 2218], 862)
-    femmesh.addFace([308, 700, 425, 2275, 2327, 1515], 863)
-    femmesh.addFace([425, 700, 249, 2327, 2276, 2328], 864)
-    femmesh.addFace([281, 792, 473, 2329, 2330, 2331], 865)
-    femmesh.addFace([437, 721, 214, 2332, 2333, 1309], 866)
-    femmesh.addFace([473, 776, 281, 2334, 1675, 2331], 867)
-    femmesh.addFace([249, 813, 425, 2335, 2336, 2328], 868)
-    femmesh.addFace([622, 774, 308, 2122, 2337, 1514], 869)
-    femmesh.addFace([475, 793, 713, 2338, 2339, 2280], 870)
-    femmesh.addFace([581, 702, 333, 1685, 2340, 1130], 871)
-    femmesh.addFace([501, 552, 189, 2341, 2200, 1381], 872)
-    femmesh.addFace([438, 766, 245, 2342, 2343, 2300], 873)
-    femmesh.addFace([458, 750, 364, 2030, 1836, 1066], 874)
-    femmesh.addFace([474, 788, 282, 2344, 2345, 2224], 875)
-    femmesh.addFace([288, 552, 501, 2346, 2341, 2347], 876)
-    femmesh.addFace([523, 788, 421, 2348, 1971, 1747], 877)
-    femmesh.addFace([538, 567, 216, 1429, 1060, 1871], 878)
-    femmesh.addFace([488, 547, 334, 1986, 2150, 2349], 879)
-    femmesh.addFace([446, 825, 382, 1889, 2350, 1108], 880)
-    femmesh.addFace([481, 837, 279, 1585, 2164, 1239], 881)
-    femmesh.addFace([472, 734, 155, 2351, 2352, 2017], 882)
-    femmesh.addFace([222, 737, 434, 2353, 1391, 1275], 883)
-    femmesh.addFace([237, 656, 437, 1931, 2354, 1551], 884)
-    femmesh.addFace([253, 693, 458, 2355, 2356, 1065], 885)
-    femmesh.addFace([449, 610, 286, 2357, 2358, 1259], 886)
-    femmesh.addFace([246, 824, 431, 2359, 2360, 1295], 887)
-    femmesh.addFace([210, 644, 449, 2269, 2361, 1258], 888)
-    femmesh.addFace([435, 733, 282, 2217, 1073, 1970], 889)
-    femmesh.addFace([476, 842, 545, 2362, 2363, 1886], 890)
-    femmesh.addFace([542, 626, 314, 2364, 2365, 2366], 891)
-    femmesh.addFace([609, 667, 380, 2367, 1827, 1987], 892)
-    femmesh.addFace([329, 626, 542, 2368, 2364, 1951], 893)
-    femmesh.addFace([220, 785, 441, 2369, 2370, 2371], 894)
-    femmesh.addFace([261, 667, 609, 2263, 2367, 1510], 895)
-    femmesh.addFace([304, 648, 460, 2372, 1627, 2373], 896)
-    femmesh.addFace([245, 610, 449, 2374, 2357, 2375], 897)
-    femmesh.addFace([207, 823, 438, 2376, 2377, 1479], 898)
-    femmesh.addFace([445, 628, 53, 2378, 2379, 1611], 899)
-    femmesh.addFace([199, 838, 664, 2119, 1546, 2380], 900)
-    femmesh.addFace([441, 785, 289, 2370, 2251, 2222], 901)
-    femmesh.addFace([269, 806, 517, 2381, 2382, 2203], 902)
-    femmesh.addFace([290, 736, 708, 2383, 2384, 2385], 903)
-    femmesh.addFace([561, 682, 216, 2386, 2092, 1863], 904)
-    femmesh.addFace([5, 751, 6, 2141, 2102, 25], 905)
-    femmesh.addFace([22, 752, 23, 2105, 2143, 42], 906)
-    femmesh.addFace([346, 660, 493, 1183, 2387, 1604], 907)
-    femmesh.addFace([136, 762, 137, 2161, 2072, 163], 908)
-    femmesh.addFace([284, 563, 486, 1923, 2313, 2388], 909)
-    femmesh.addFace([439, 847, 198, 1495, 2389, 2197], 910)
-    femmesh.addFace([501, 785, 575, 2252, 2390, 2391], 911)
-    femmesh.addFace([698, 819, 438, 2392, 1478, 2299], 912)
-    femmesh.addFace([449, 630, 245, 2393, 2394, 2375], 913)
-    femmesh.addFace([446, 658, 215, 950, 2395, 1653], 914)
-    femmesh.addFace([458, 592, 212, 2396, 2297, 1529], 915)
-    femmesh.addFace([509, 730, 251, 2397, 2398, 1618], 916)
-    femmesh.addFace([451, 630, 293, 2399, 2400, 1760], 917)
-    femmesh.addFace([245, 630, 451, 2394, 2399, 2401], 918)
-    femmesh.addFace([441, 748, 220, 2402, 2040, 2371], 919)
-    femmesh.addFace([486, 569, 284, 1113, 975, 2388], 920)
-    femmesh.addFace([103, 632, 504, 2403, 2404, 2227], 921)
-    femmesh.addFace([62, 601, 61, 2405, 2272, 88], 922)
-    femmesh.addFace([497, 640, 149, 2406, 2257, 1874], 923)
-    femmesh.addFace([697, 779, 390, 2407, 2408, 1896], 924)
-    femmesh.addFace([313, 561, 492, 2409, 2157, 1724], 925)
-    femmesh.addFace([195, 661, 460, 2206, 2410, 2113], 926)
-    femmesh.addFace([568, 738, 454, 2411, 2116, 2304], 927)
-    femmesh.addFace([571, 768, 379, 2412, 1518, 2035], 928)
-    femmesh.addFace([490, 812, 404, 1922, 2005, 1614], 929)
-    femmesh.addFace([460, 661, 304, 2410, 2233, 2373], 930)
-    femmesh.addFace([517, 806, 786, 2382, 2413, 2414], 931)
-    femmesh.addFace([349, 779, 679, 2415, 1459, 1278], 932)
-    femmesh.addFace([456, 601, 62, 2416, 2405, 1796], 933)
-    femmesh.addFace([614, 685, 212, 2417, 2418, 2283], 934)
-    femmesh.addFace([445, 759, 326, 1610, 2419, 2290], 935)
-    femmesh.addFace([384, 685, 614, 2420, 2417, 2421], 936)
-    femmesh.addFace([442, 755, 204, 2422, 2423, 1312], 937)
-    femmesh.addFace([150, 704, 151, 2012, 2424, 177], 938)
-    femmesh.addFace([312, 819, 698, 2425, 2392, 2057], 939)
-    femmesh.addFace([239, 843, 441, 2426, 2427, 2193], 940)
-    femmesh.addFace([276, 852, 452, 2428, 2429, 1445], 941)
-    femmesh.addFace([241, 815, 445, 2430, 2431, 2296], 942)
-    femmesh.addFace([156, 624, 157, 2432, 2433, 183], 943)
-    femmesh.addFace([145, 631, 146, 1523, 2434, 172], 944)
-    femmesh.addFace([505, 731, 433, 2435, 2306, 1637], 945)
-    femmesh.addFace([706, 720, 330, 2082, 2436, 2437], 946)
-    femmesh.addFace([666, 736, 195, 2438, 2439, 2112], 947)
-    femmesh.addFace([210, 829, 464, 2440, 2441, 2256], 948)
-    femmesh.addFace([251, 679, 634, 1293, 2442, 1616], 949)
-    femmesh.addFace([634, 679, 385, 2442, 1155, 1141], 950)
-    femmesh.addFace([603, 803, 392, 2443, 2444, 1830], 951)
-    femmesh.addFace([284, 640, 497, 2094, 2406, 1924], 952)
-    femmesh.addFace([104, 632, 103, 2315, 2403, 123], 953)
-    femmesh.addFace([493, 660, 298, 2387, 2445, 2446], 954)
-    femmesh.addFace([287, 670, 471, 1356, 2447, 1146], 955)
-    femmesh.addFace([612, 761, 60, 2448, 2449, 2450], 956)
-    femmesh.addFace([512, 729, 111, 2451, 2452, 2176], 957)
-    femmesh.addFace([448, 727, 200, 1217, 1472, 1965], 958)
-    femmesh.addFace([102, 650, 101, 2453, 2454, 121], 959)
-    femmesh.addFace([275, 768, 571, 2455, 2412, 1178], 960)
-    femmesh.addFace([192, 651, 498, 2186, 2456, 2457], 961)
-    femmesh.addFace([396, 818, 495, 2458, 2459, 1487], 962)
-    femmesh.addFace([283, 574, 504, 2460, 2461, 2462], 963)
-    femmesh.addFace([459, 715, 194, 2095, 2463, 2278], 964)
-    femmesh.addFace([569, 611, 221, 1125, 2464, 2465], 965)
-    femmesh.addFace([634, 727, 332, 1473, 2210, 1697], 966)
-    femmesh.addFace([705, 825, 300, 2466, 2467, 2468], 967)
-    femmesh.addFace([304, 596, 511, 2234, 2469, 2470], 968)
-    femmesh.addFace([564, 736, 290, 2471, 2383, 2472], 969)
-    femmesh.addFace([511, 596, 219, 2469, 2473, 2319], 970)
-    femmesh.addFace([466, 692, 566, 2474, 2475, 2026], 971)
-    femmesh.addFace([13, 616, 14, 1993, 2476, 33], 972)
-    femmesh.addFace([496, 793, 258, 1989, 2477, 1206], 973)
-    femmesh.addFace([551, 809, 408, 2478, 1865, 1948], 974)
-    femmesh.addFace([230, 850, 455, 2479, 1158, 914], 975)
-    femmesh.addFace([113, 689, 112, 895, 2480, 132], 976)
-    femmesh.addFace([47, 695, 46, 2481, 1540, 73], 977)
-    femmesh.addFace([146, 631, 465, 2434, 1664, 1821], 978)
-    femmesh.addFace([309, 811, 621, 2482, 2267, 2022], 979)
-    femmesh.addFace([471, 670, 253, 2447, 1186, 1071], 980)
-    femmesh.addFace([501, 575, 288, 2391, 1482, 2347], 981)
-    femmesh.addFace([157, 624, 475, 2433, 2483, 1877], 982)
-    femmesh.addFace([511, 574, 283, 2318, 2460, 1705], 983)
-    femmesh.addFace([234, 779, 697, 1460, 2407, 2163], 984)
-    femmesh.addFace([324, 612, 601, 1639, 2270, 2484], 985)
-    femmesh.addFace([504, 574, 337, 2461, 2485, 2486], 986)
-    femmesh.addFace([307, 600, 585, 2324, 2487, 2488], 987)
-    femmesh.addFace([236, 803, 603, 2237, 2443, 2230], 988)
-    femmesh.addFace([522, 792, 281, 2312, 2329, 1952], 989)
-    femmesh.addFace([618, 754, 330, 2489, 2490, 2491], 990)
-    femmesh.addFace([393, 754, 618, 2492, 2489, 1602], 991)
-    femmesh.addFace([543, 737, 222, 2493, 2353, 1709], 992)
-    femmesh.addFace([503, 577, 277, 2169, 2494, 1374], 993)
-    femmesh.addFace([252, 760, 464, 2055, 2495, 1027], 994)
-    femmesh.addFace([375, 751, 746, 2496, 2140, 2497], 995)
-    femmesh.addFace([745, 752, 376, 2144, 2498, 2499], 996)
-    femmesh.addFace([529, 699, 262, 2500, 2501, 1346], 997)
-    femmesh.addFace([323, 847, 690, 2502, 1494, 2503], 998)
-    femmesh.addFace([511, 578, 304, 1704, 2504, 2470], 999)
-    femmesh.addFace([451, 698, 245, 1646, 2298, 2401], 1000)
-    femmesh.addFace([518, 717, 100, 2505, 2506, 2260], 1001)
-    femmesh.addFace([503, 733, 215, 1299, 2216, 2170], 1002)
-    femmesh.addFace([354, 809, 551, 1968, 2478, 2286], 1003)
-    femmesh.addFace([199, 844, 590, 2507, 1739, 2107], 1004)
-    femmesh.addFace([386, 710, 524, 1623, 2508, 1542], 1005)
-    femmesh.addFace([282, 788, 523, 2345, 2348, 1969], 1006)
-    femmesh.addFace([16, 705, 17, 2509, 2510, 36], 1007)
-    femmesh.addFace([378, 803, 623, 2511, 2236, 1525], 1008)
-    femmesh.addFace([455, 673, 351, 1800, 2512, 915], 1009)
-    femmesh.addFace([251, 730, 456, 2398, 2513, 1294], 1010)
-    femmesh.addFace([273, 666, 460, 1249, 2111, 1471], 1011)
-    femmesh.addFace([472, 642, 297, 2016, 1944, 1642], 1012)
-    femmesh.addFace([316, 564, 548, 2514, 2515, 2516], 1013)
-    femmesh.addFace([148, 707, 497, 2517, 2518, 1873], 1014)
-    femmesh.addFace([497, 707, 318, 2518, 2198, 1920], 1015)
-    femmesh.addFace([509, 710, 324, 2519, 1622, 2520], 1016)
-    femmesh.addFace([218, 710, 509, 2521, 2519, 2522], 1017)
-    femmesh.addFace([155, 734, 156, 2352, 2523, 182], 1018)
-    femmesh.addFace([362, 848, 531, 2524, 2171, 1784], 1019)
-    femmesh.addFace([514, 596, 361, 2525, 2154, 1264], 1020)
-    femmesh.addFace([343, 681, 457, 2526, 1420, 856], 1021)
-    femmesh.addFace([191, 657, 480, 2527, 2528, 1569], 1022)
-    femmesh.addFace([256, 765, 453, 2529, 2530, 1750], 1023)
-    femmesh.addFace([683, 773, 443, 2531, 1407, 1189], 1024)
-    femmesh.addFace([241, 773, 683, 2295, 2531, 2115], 1025)
-    femmesh.addFace([472, 653, 338, 1641, 2532, 2533], 1026)
-    femmesh.addFace([480, 657, 299, 2528, 2534, 2535], 1027)
-    femmesh.addFace([571, 711, 355, 2536, 2537, 1179], 1028)
-    femmesh.addFace([227, 711, 571, 1595, 2536, 2080], 1029)
-    femmesh.addFace([418, 755, 559, 2538, 2539, 1719], 1030)
-    femmesh.addFace([52, 831, 51, 2540, 2541, 78], 1031)
-    femmesh.addFace([453, 849, 221, 2542, 2543, 1861], 1032)
-    femmesh.addFace([215, 658, 577, 2395, 2544, 2168], 1033)
-    femmesh.addFace([617, 821, 329, 2208, 2545, 2546], 1034)
-    femmesh.addFace([16, 805, 705, 2547, 2548, 2509], 1035)
-    femmesh.addFace([560, 647, 295, 2549, 1574, 1846], 1036)
-    femmesh.addFace([144, 687, 145, 1849, 1538, 171], 1037)
-    femmesh.addFace([504, 632, 283, 2404, 2228, 2462], 1038)
-    femmesh.addFace([386, 761, 612, 2550, 2448, 1638], 1039)
-    femmesh.addFace([534, 558, 270, 2551, 2159, 2552], 1040)
-    femmesh.addFace([371, 558, 534, 1425, 2551, 1426], 1041)
-    femmesh.addFace([525, 826, 341, 2553, 2554, 1243], 1042)
-    femmesh.addFace([290, 767, 548, 2188, 2555, 2556], 1043)
-    femmesh.addFace([61, 612, 60, 2271, 2450, 87], 1044)
-    femmesh.addFace([464, 829, 287, 2441, 1354, 1032], 1045)
-    femmesh.addFace([463, 696, 309, 1324, 2246, 2023], 1046)
-    femmesh.addFace([508, 681, 269, 1421, 2557, 2204], 1047)
-    femmesh.addFace([286, 810, 582, 2558, 2241, 1390], 1048)
-    femmesh.addFace([225, 706, 525, 2559, 2560, 1286], 1049)
-    femmesh.addFace([361, 739, 605, 1903, 2561, 1244], 1050)
-    femmesh.addFace([525, 706, 330, 2560, 2437, 2562], 1051)
-    femmesh.addFace([470, 676, 207, 1710, 2076, 2174], 1052)
-    femmesh.addFace([325, 723, 510, 1976, 2563, 2564], 1053)
-    femmesh.addFace([376, 762, 745, 1255, 2160, 2499], 1054)
-    femmesh.addFace([491, 829, 210, 1355, 2440, 1257], 1055)
-    femmesh.addFace([510, 723, 106, 2563, 2565, 2036], 1056)
-    femmesh.addFace([23, 745, 2, 2145, 2566, 43], 1057)
-    femmesh.addFace([1, 746, 5, 2567, 2142, 24], 1058)
-    femmesh.addFace([467, 817, 363, 2568, 2569, 1589], 1059)
-    femmesh.addFace([2, 745, 136, 2566, 2162, 162], 1060)
-    femmesh.addFace([44, 746, 1, 2570, 2567, 70], 1061)
-    femmesh.addFace([336, 600, 499, 1014, 2323, 2089], 1062)
-    femmesh.addFace([486, 662, 295, 2571, 1844, 1114], 1063)
-    femmesh.addFace([489, 765, 256, 2572, 2529, 1730], 1064)
-    femmesh.addFace([319, 692, 466, 2573, 2474, 965], 1065)
-    femmesh.addFace([324, 730, 509, 2574, 2397, 2520], 1066)
-    femmesh.addFace([475, 783, 258, 2575, 1313, 2576], 1067)
-    femmesh.addFace([616, 742, 14, 2577, 2578, 2476], 1068)
-    femmesh.addFace([293, 557, 556, 1565, 2579, 1759], 1069)
-    femmesh.addFace([264, 686, 474, 1587, 1340, 2244], 1070)
-    femmesh.addFace([485, 805, 15, 2580, 2581, 2582], 1071)
-    femmesh.addFace([556, 557, 313, 2579, 2583, 1723], 1072)
-    femmesh.addFace([638, 817, 467, 2584, 2568, 2195], 1073)
-    femmesh.addFace([493, 625, 109, 2585, 2586, 1592], 1074)
-    femmesh.addFace([469, 810, 348, 2242, 2587, 927], 1075)
-    femmesh.addFace([254, 846, 477, 2588, 2589, 993], 1076)
-    femmesh.addFace([208, 842, 476, 2152, 2362, 2178], 1077)
-    femmesh.addFace([713, 793, 336, 2339, 1988, 2088], 1078)
-    femmesh.addFace([620, 668, 357, 2590, 2591, 880], 1079)
-    femmesh.addFace([197, 668, 620, 2592, 2590, 1837], 1080)
-    femmesh.addFace([327, 765, 489, 2593, 2572, 2594], 1081)
-    femmesh.addFace([51, 831, 537, 2541, 2595, 2596], 1082)
-    femmesh.addFace([299, 693, 480, 2597, 2598, 2535], 1083)
-    femmesh.addFace([212, 685, 483, 2418, 2599, 1527], 1084)
-    femmesh.addFace([298, 625, 493, 1942, 2585, 2446], 1085)
-    femmesh.addFace([483, 685, 311, 2599, 2600, 2601], 1086)
-    femmesh.addFace([541, 845, 320, 2602, 2603, 2604], 1087)
-    femmesh.addFace([597, 705, 300, 2605, 2468, 2125], 1088)
-    femmesh.addFace([140, 602, 141, 2191, 1291, 167], 1089)
-    femmesh.addFace([492, 627, 196, 1265, 1780, 1718], 1090)
-    femmesh.addFace([470, 768, 275, 2173, 2455, 1051], 1091)
-    femmesh.addFace([198, 836, 598, 2606, 1881, 2078], 1092)
-    femmesh.addFace([477, 846, 311, 2589, 2607, 945], 1093)
-    femmesh.addFace([190, 673, 488, 2608, 1799, 2609], 1094)
-    femmesh.addFace([15, 742, 485, 2610, 2611, 2582], 1095)
-    femmesh.addFace([338, 734, 472, 2612, 2351, 2533], 1096)
-    femmesh.addFace([484, 663, 267, 1590, 2099, 2613], 1097)
-    femmesh.addFace([473, 792, 205, 2330, 1953, 907], 1098)
-    femmesh.addFace([262, 776, 473, 2614, 2334, 896], 1099)
-    femmesh.addFace([9, 589, 10, 2213, 1271, 29], 1100)
-    femmesh.addFace([555, 570, 193, 2615, 1996, 1745], 1101)
-    femmesh.addFace([719, 740, 206, 1980, 2616, 1819], 1102)
-    femmesh.addFace([217, 662, 486, 2617, 2571, 2314], 1103)
-    femmesh.addFace([548, 564, 290, 2515, 2472, 2556], 1104)
-    femmesh.addFace([512, 820, 729, 2618, 2619, 2451], 1105)
-    femmesh.addFace([292, 694, 507, 2620, 2621, 2000], 1106)
-    femmesh.addFace([551, 605, 316, 2622, 2623, 2292], 1107)
-    femmesh.addFace([204, 788, 474, 1972, 2344, 1341], 1108)
-    femmesh.addFace([233, 605, 551, 1245, 2622, 1947], 1109)
-    femmesh.addFace([224, 821, 718, 2624, 2625, 2626], 1110)
-    femmesh.addFace([476, 724, 278, 2288, 901, 2303], 1111)
-    femmesh.addFace([257, 833, 478, 2627, 2308, 1778], 1112)
-    femmesh.addFace([480, 693, 253, 2598, 2355, 997], 1113)
-    femmesh.addFace([258, 793, 475, 2477, 2338, 2576], 1114)
-    femmesh.addFace([51, 712, 50, 2628, 2062, 77], 1115)
-    femmesh.addFace([190, 799, 477, 2629, 1306, 947], 1116)
-    femmesh.addFace([489, 747, 327, 2630, 2631, 2594], 1117)
-    femmesh.addFace([526, 585, 341, 2632, 1241, 875], 1118)
-    femmesh.addFace([211, 643, 490, 2010, 2316, 1613], 1119)
-    femmesh.addFace([435, 684, 629, 2097, 2633, 2326], 1120)
-    femmesh.addFace([347, 830, 502, 2090, 2634, 994], 1121)
-    femmesh.addFace([219, 596, 514, 2473, 2525, 1000], 1122)
-    femmesh.addFace([307, 585, 526, 2488, 2632, 2635], 1123)
-    femmesh.addFace([655, 657, 362, 2636, 2637, 1783], 1124)
-    femmesh.addFace([299, 657, 655, 2534, 2636, 1677], 1125)
-    femmesh.addFace([214, 721, 505, 2333, 2638, 1636], 1126)
-    femmesh.addFace([315, 576, 565, 2639, 2640, 2123], 1127)
-    femmesh.addFace([334, 799, 488, 1307, 2641, 2349], 1128)
-    femmesh.addFace([418, 807, 755, 2642, 2643, 2538], 1129)
-    femmesh.addFace([488, 799, 190, 2641, 2629, 2609], 1130)
-    femmesh.addFace([17, 597, 18, 2644, 2133, 37], 1131)
-    femmesh.addFace([350, 570, 555, 1270, 2615, 1090], 1132)
-    femmesh.addFace([374, 828, 481, 1316, 2148, 1238], 1133)
-    femmesh.addFace([515, 607, 240, 2064, 1654, 1197], 1134)
-    femmesh.addFace([756, 778, 399, 2645, 1598, 2646], 1135)
-    femmesh.addFace([138, 606, 139, 1883, 971, 165], 1136)
-    femmesh.addFace([160, 732, 161, 2647, 2648, 187], 1137)
-    femmesh.addFace([718, 821, 426, 2625, 2207, 1302], 1138)
-    femmesh.addFace([300, 825, 629, 2467, 1888, 2649], 1139)
-    femmesh.addFace([498, 651, 315, 2456, 2650, 1137], 1140)
-    femmesh.addFace([311, 846, 483, 2607, 2651, 2601], 1141)
-    femmesh.addFace([519, 841, 420, 2652, 2240, 1773], 1142)
-    femmesh.addFace([319, 699, 529, 2653, 2500, 2654], 1143)
-    femmesh.addFace([156, 734, 624, 2523, 2655, 2432], 1144)
-    femmesh.addFace([482, 719, 317, 1981, 2656, 2039], 1145)
-    femmesh.addFace([292, 722, 608, 2657, 1110, 2658], 1146)
-    femmesh.addFace([221, 637, 569, 2659, 974, 2465], 1147)
-    femmesh.addFace([53, 628, 52, 2379, 2660, 79], 1148)
-    femmesh.addFace([298, 660, 562, 2445, 2661, 1833], 1149)
-    femmesh.addFace([109, 625, 108, 2586, 1765, 128], 1150)
-    femmesh.addFace([223, 578, 553, 2662, 1812, 2663], 1151)
-    femmesh.addFace([58, 775, 57, 2137, 2664, 84], 1152)
-    femmesh.addFace([7, 622, 8, 1907, 1175, 27], 1153)
-    femmesh.addFace([20, 621, 21, 1835, 1908, 40], 1154)
-    femmesh.addFace([482, 782, 322, 2665, 2666, 2025], 1155)
-    femmesh.addFace([232, 782, 482, 1744, 2665, 2202], 1156)
-    femmesh.addFace([546, 838, 410, 2667, 2118, 1975], 1157)
-    femmesh.addFace([485, 742, 353, 2611, 2668, 1007], 1158)
-    femmesh.addFace([645, 845, 541, 2669, 2602, 2670], 1159)
-    femmesh.addFace([267, 769, 484, 2671, 1441, 2613], 1160)
-    femmesh.addFace([537, 712, 51, 2310, 2628, 2596], 1161)
-    femmesh.addFace([495, 818, 98, 2459, 2672, 1491], 1162)
-    femmesh.addFace([565, 576, 301, 2640, 2673, 1455], 1163)
-    femmesh.addFace([382, 805, 485, 2674, 2580, 1284], 1164)
-    femmesh.addFace([619, 673, 190, 2675, 2608, 2180], 1165)
-    femmesh.addFace([351, 673, 619, 2512, 2675, 1351], 1166)
-    femmesh.addFace([421, 807, 532, 2068, 2676, 1762], 1167)
-    femmesh.addFace([235, 749, 725, 2677, 2678, 2679], 1168)
-    femmesh.addFace([311, 685, 680, 2600, 2680, 1761], 1169)
-    femmesh.addFace([680, 685, 384, 2680, 2420, 2681], 1170)
-    femmesh.addFace([307, 732, 499, 2682, 2683, 2325], 1171)
-    femmesh.addFace([588, 714, 224, 2684, 2685, 2686], 1172)
-    femmesh.addFace([755, 807, 204, 2643, 2067, 2423], 1173)
-    femmesh.addFace([367, 664, 594, 2687, 2688, 1330], 1174)
-    femmesh.addFace([15, 805, 16, 2581, 2547, 35], 1175)
-    femmesh.addFace([317, 738, 528, 2117, 2689, 2037], 1176)
-    femmesh.addFace([487, 795, 202, 1509, 1489, 860], 1177)
-    femmesh.addFace([331, 737, 543, 2073, 2493, 2264], 1178)
-    femmesh.addFace([496, 706, 225, 2273, 2559, 1103], 1179)
-    femmesh.addFace([540, 726, 285, 1982, 2129, 1673], 1180)
-    femmesh.addFace([578, 648, 304, 2690, 2372, 2504], 1181)
-    femmesh.addFace([289, 587, 572, 2321, 2691, 2221], 1182)
-    femmesh.addFace([97, 796, 3, 2692, 2693, 116], 1183)
-    femmesh.addFace([572, 587, 356, 2691, 1170, 1220], 1184)
-    femmesh.addFace([219, 786, 574, 2694, 2695, 2317], 1185)
-    femmesh.addFace([244, 835, 811, 1198, 2696, 2697], 1186)
-    femmesh.addFace([494, 722, 292, 1631, 2657, 2147], 1187)
-    femmesh.addFace([229, 692, 529, 2698, 2699, 1409], 1188)
-    femmesh.addFace([529, 692, 319, 2699, 2573, 2654], 1189)
-    femmesh.addFace([502, 695, 47, 1686, 2481, 2106], 1190)
-    femmesh.addFace([3, 796, 69, 2693, 1667, 96], 1191)
-    femmesh.addFace([224, 653, 588, 2700, 1721, 2686], 1192)
-    femmesh.addFace([152, 747, 489, 2701, 2630, 1040], 1193)
-    femmesh.addFace([725, 749, 401, 2678, 1811, 2702], 1194)
-    femmesh.addFace([347, 778, 756, 967, 2645, 2091], 1195)
-    femmesh.addFace([224, 714, 626, 2685, 2703, 2704], 1196)
-    femmesh.addFace([502, 830, 270, 2634, 2705, 1687], 1197)
-    femmesh.addFace([458, 693, 592, 2356, 2706, 2396], 1198)
-    femmesh.addFace([353, 742, 616, 2668, 2577, 2707], 1199)
-    femmesh.addFace([615, 754, 393, 2708, 2492, 1682], 1200)
-    femmesh.addFace([377, 784, 544, 2709, 1893, 1496], 1201)
-    femmesh.addFace([14, 742, 15, 2578, 2610, 34], 1202)
-    femmesh.addFace([101, 650, 518, 2454, 2710, 2259], 1203)
-    femmesh.addFace([266, 754, 615, 2711, 2708, 2712], 1204)
-    femmesh.addFace([266, 826, 525, 2713, 2553, 2714], 1205)
-    femmesh.addFace([291, 791, 607, 2715, 2046, 1462], 1206)
-    femmesh.addFace([507, 694, 238, 2621, 2135, 866], 1207)
-    femmesh.addFace([576, 832, 301, 2716, 2717, 2673], 1208)
-    femmesh.addFace([617, 720, 365, 2718, 2081, 1876], 1209)
-    femmesh.addFace([197, 720, 617, 2719, 2718, 2720], 1210)
-    femmesh.addFace([518, 822, 717, 2721, 2722, 2505], 1211)
-    femmesh.addFace([499, 732, 160, 2683, 2647, 1815], 1212)
-    femmesh.addFace([66, 770, 65, 2723, 1868, 92], 1213)
-    femmesh.addFace([112, 689, 512, 2480, 2724, 2175], 1214)
-    femmesh.addFace([593, 649, 321, 2725, 2726, 2727], 1215)
-    femmesh.addFace([331, 649, 593, 1662, 2725, 2074], 1216)
-    femmesh.addFace([530, 761, 386, 2728, 2550, 1499], 1217)
-    femmesh.addFace([585, 600, 225, 2487, 1102, 1285], 1218)
-    femmesh.addFace([115, 763, 114, 2729, 2730, 134], 1219)
-    femmesh.addFace([536, 753, 288, 1869, 2731, 2732], 1220)
-    femmesh.addFace([505, 721, 296, 2638, 2733, 1173], 1221)
-    femmesh.addFace([330, 754, 525, 2490, 2734, 2562], 1222)
-    femmesh.addFace([217, 677, 662, 2182, 2735, 2617], 1223)
-    femmesh.addFace([662, 677, 360, 2735, 2736, 1884], 1224)
-    femmesh.addFace([498, 784, 192, 1894, 2737, 2457], 1225)
-    femmesh.addFace([525, 754, 266, 2734, 2711, 2714], 1226)
-    femmesh.addFace([519, 774, 243, 2738, 2739, 1737], 1227)
-    femmesh.addFace([301, 832, 598, 2717, 2740, 1770], 1228)
-    femmesh.addFace([310, 703, 577, 1379, 2741, 2742], 1229)
-    femmesh.addFace([359, 731, 505, 2743, 2435, 1172], 1230)
-    femmesh.addFace([668, 840, 357, 1963, 2184, 2591], 1231)
-    femmesh.addFace([774, 834, 243, 2744, 1578, 2739], 1232)
-    femmesh.addFace([518, 806, 269, 2745, 2381, 2746], 1233)
-    femmesh.addFace([647, 833, 368, 2309, 2747, 1605], 1234)
-    femmesh.addFace([639, 769, 366, 1442, 2748, 2749], 1235)
-    femmesh.addFace([709, 852, 342, 2750, 2751, 2752], 1236)
-    femmesh.addFace([452, 852, 709, 2429, 2750, 1803], 1237)
-    femmesh.addFace([566, 692, 229, 2475, 2698, 2753], 1238)
-    femmesh.addFace([367, 844, 664, 2754, 2755, 2687], 1239)
-    femmesh.addFace([326, 759, 646, 2419, 1596, 2756], 1240)
-    femmesh.addFace([705, 805, 382, 2548, 2674, 2757], 1241)
-    femmesh.addFace([161, 732, 580, 2648, 2758, 1492], 1242)
-    femmesh.addFace([526, 763, 307, 2759, 2760, 2635], 1243)
-    femmesh.addFace([718, 783, 338, 1314, 2761, 2762], 1244)
-    femmesh.addFace([509, 814, 218, 2763, 1754, 2522], 1245)
-    femmesh.addFace([332, 814, 509, 2764, 2763, 1698], 1246)
-    femmesh.addFace([382, 825, 705, 2350, 2466, 2757], 1247)
-    femmesh.addFace([512, 826, 266, 2765, 2713, 2766], 1248)
-    femmesh.addFace([244, 811, 532, 2697, 2767, 1933], 1249)
-    femmesh.addFace([288, 753, 552, 2731, 1728, 2346], 1250)
-    femmesh.addFace([750, 846, 254, 2768, 2588, 1558], 1251)
-    femmesh.addFace([483, 846, 750, 2651, 2768, 2029], 1252)
-    femmesh.addFace([527, 672, 302, 1978, 1446, 1781], 1253)
-    femmesh.addFace([337, 798, 504, 2769, 2225, 2486], 1254)
-    femmesh.addFace([550, 648, 223, 1628, 2770, 1058], 1255)
-    femmesh.addFace([302, 645, 541, 1348, 2670, 1043], 1256)
-    femmesh.addFace([506, 836, 366, 1882, 2771, 1252], 1257)
-    femmesh.addFace([147, 707, 148, 2253, 2517, 174], 1258)
-    femmesh.addFace([102, 798, 650, 2258, 2772, 2453], 1259)
-    femmesh.addFace([294, 638, 603, 2773, 2774, 1829], 1260)
-    femmesh.addFace([740, 744, 206, 2775, 1625, 2616], 1261)
-    femmesh.addFace([603, 638, 423, 2774, 2279, 2231], 1262)
-    femmesh.addFace([158, 713, 159, 2281, 1852, 185], 1263)
-    femmesh.addFace([417, 744, 740, 2020, 2775, 2776], 1264)
-    femmesh.addFace([100, 717, 99, 2506, 1180, 119], 1265)
-    femmesh.addFace([313, 682, 561, 2777, 2386, 2409], 1266)
-    femmesh.addFace([516, 802, 261, 2778, 1857, 1512], 1267)
-    femmesh.addFace([508, 845, 209, 2779, 2780, 1211], 1268)
-    femmesh.addFace([575, 785, 220, 2390, 2369, 1708], 1269)
-    femmesh.addFace([320, 845, 508, 2603, 2779, 2049], 1270)
-    femmesh.addFace([106, 723, 105, 2565, 1850, 125], 1271)
-    femmesh.addFace([510, 802, 325, 1858, 2781, 2564], 1272)
-    femmesh.addFace([266, 820, 512, 2782, 2618, 2766], 1273)
-    femmesh.addFace([111, 729, 110, 2452, 1404, 130], 1274)
-    femmesh.addFace([524, 710, 218, 2508, 2521, 2305], 1275)
-    femmesh.addFace([514, 777, 320, 1263, 2783, 960], 1276)
-    femmesh.addFace([151, 747, 152, 2784, 2701, 178], 1277)
-    femmesh.addFace([194, 647, 560, 2054, 2549, 2277], 1278)
-    femmesh.addFace([545, 842, 407, 2363, 2151, 1945], 1279)
-    femmesh.addFace([348, 823, 533, 2785, 2786, 1068], 1280)
-    femmesh.addFace([316, 739, 564, 2787, 2788, 2514], 1281)
-    femmesh.addFace([532, 807, 418, 2676, 2642, 1934], 1282)
-    femmesh.addFace([608, 694, 292, 2789, 2620, 2658], 1283)
-    femmesh.addFace([223, 648, 578, 2770, 2690, 2662], 1284)
-    femmesh.addFace([314, 716, 542, 1322, 2790, 2366], 1285)
-    femmesh.addFace([355, 711, 646, 2537, 2791, 888], 1286)
-    femmesh.addFace([449, 644, 630, 2361, 2792, 2393], 1287)
-    femmesh.addFace([646, 711, 326, 2791, 1400, 2756], 1288)
-    femmesh.addFace([811, 835, 415, 2696, 2793, 2268], 1289)
-    femmesh.addFace([708, 736, 340, 2384, 2794, 2795], 1290)
-    femmesh.addFace([562, 660, 226, 2661, 1160, 1738], 1291)
-    femmesh.addFace([325, 802, 516, 2781, 2778, 2796], 1292)
-    femmesh.addFace([405, 832, 812, 2797, 2798, 1921], 1293)
-    femmesh.addFace([228, 675, 548, 1115, 2799, 2800], 1294)
-    femmesh.addFace([60, 761, 59, 2449, 2801, 86], 1295)
-    femmesh.addFace([223, 801, 516, 2802, 2803, 1059], 1296)
-    femmesh.addFace([548, 675, 316, 2799, 2291, 2516], 1297)
-    femmesh.addFace([516, 801, 325, 2803, 1619, 2796], 1298)
-    femmesh.addFace([554, 771, 319, 2804, 2805, 964], 1299)
-    femmesh.addFace([340, 736, 666, 2794, 2438, 916], 1300)
-    femmesh.addFace([517, 786, 219, 2414, 2694, 999], 1301)
-    femmesh.addFace([513, 844, 367, 1740, 2754, 1561], 1302)
-    femmesh.addFace([64, 780, 63, 2806, 2232, 90], 1303)
-    femmesh.addFace([641, 702, 334, 2807, 862, 2149], 1304)
-    femmesh.addFace([577, 658, 310, 2544, 2065, 2742], 1305)
-    femmesh.addFace([398, 804, 699, 1474, 2808, 2809], 1306)
-    femmesh.addFace([414, 834, 774, 2810, 2744, 2121], 1307)
-    femmesh.addFace([699, 804, 262, 2808, 2811, 2501], 1308)
-    femmesh.addFace([566, 756, 399, 2812, 2646, 1985], 1309)
-    femmesh.addFace([45, 787, 44, 2813, 2814, 71], 1310)
-    femmesh.addFace([269, 822, 518, 2815, 2721, 2746], 1311)
-    femmesh.addFace([464, 760, 586, 2495, 2816, 2255], 1312)
-    femmesh.addFace([98, 818, 97, 2672, 2817, 117], 1313)
-    femmesh.addFace([315, 824, 576, 2818, 2819, 2639], 1314)
-    femmesh.addFace([329, 668, 617, 1950, 2820, 2546], 1315)
-    femmesh.addFace([192, 784, 633, 2737, 2821, 1905], 1316)
-    femmesh.addFace([617, 668, 197, 2820, 2592, 2720], 1317)
-    femmesh.addFace([308, 774, 519, 2337, 2738, 1772], 1318)
-    femmesh.addFace([633, 784, 377, 2821, 2709, 1537], 1319)
-    femmesh.addFace([294, 817, 638, 2822, 2584, 2773], 1320)
-    femmesh.addFace([528, 738, 280, 2689, 2823, 2824], 1321)
-    femmesh.addFace([57, 775, 521, 2664, 1867, 2061], 1322)
-    femmesh.addFace([400, 841, 519, 2109, 2652, 1736], 1323)
-    femmesh.addFace([294, 652, 604, 1911, 2052, 2825], 1324)
-    femmesh.addFace([307, 763, 580, 2760, 2826, 2827], 1325)
-    femmesh.addFace([235, 725, 557, 2679, 2828, 1570], 1326)
-    femmesh.addFace([573, 703, 370, 2829, 1378, 1399], 1327)
-    femmesh.addFace([277, 703, 573, 2830, 2829, 1797], 1328)
-    femmesh.addFace([533, 823, 207, 2786, 2376, 2077], 1329)
-    femmesh.addFace([542, 716, 230, 2790, 2831, 2832], 1330)
-    femmesh.addFace([280, 772, 528, 2833, 2250, 2824], 1331)
-    femmesh.addFace([624, 734, 338, 2655, 2612, 2834], 1332)
-    femmesh.addFace([406, 694, 608, 2136, 2789, 2100], 1333)
-    femmesh.addFace([114, 763, 526, 2730, 2759, 1820], 1334)
-    femmesh.addFace([623, 769, 267, 2835, 2671, 1526], 1335)
-    femmesh.addFace([317, 719, 613, 2656, 1818, 1701], 1336)
-    femmesh.addFace([366, 769, 623, 2748, 2835, 1328], 1337)
-    femmesh.addFace([557, 725, 313, 2828, 2836, 2583], 1338)
-    femmesh.addFace([296, 659, 595, 2001, 2245, 1221], 1339)
-    femmesh.addFace([580, 763, 115, 2826, 2729, 1513], 1340)
-    femmesh.addFace([674, 714, 358, 2837, 2838, 913], 1341)
-    femmesh.addFace([390, 779, 599, 2408, 2839, 1669], 1342)
-    femmesh.addFace([314, 714, 674, 2840, 2837, 1143], 1343)
-    femmesh.addFace([278, 771, 554, 2045, 2804, 2302], 1344)
-    femmesh.addFace([59, 761, 530, 2801, 2728, 1483], 1345)
-    femmesh.addFace([194, 715, 649, 2463, 2841, 1659], 1346)
-    femmesh.addFace([594, 664, 310, 2688, 1099, 2066], 1347)
-    femmesh.addFace([580, 732, 307, 2758, 2682, 2827], 1348)
-    femmesh.addFace([535, 787, 45, 2842, 2813, 1556], 1349)
-    femmesh.addFace([636, 791, 291, 2843, 2715, 2031], 1350)
-    femmesh.addFace([373, 791, 636, 2248, 2843, 1428], 1351)
-    femmesh.addFace([630, 644, 293, 2792, 2265, 2400], 1352)
-    femmesh.addFace([388, 749, 735, 1657, 2844, 2845], 1353)
-    femmesh.addFace([228, 767, 655, 2846, 1990, 1791], 1354)
-    femmesh.addFace([375, 787, 535, 2847, 2842, 1927], 1355)
-    femmesh.addFace([368, 691, 611, 2848, 2849, 1606], 1356)
-    femmesh.addFace([342, 852, 537, 2751, 2850, 2851], 1357)
-    femmesh.addFace([537, 852, 276, 2850, 2428, 2311], 1358)
-    femmesh.addFace([574, 786, 337, 2695, 2852, 2485], 1359)
-    femmesh.addFace([592, 693, 299, 2706, 2597, 2294], 1360)
-    femmesh.addFace([320, 777, 541, 2783, 2853, 2604], 1361)
-    femmesh.addFace([456, 730, 601, 2513, 2854, 2416], 1362)
-    femmesh.addFace([643, 790, 374, 2009, 1207, 1477], 1363)
-    femmesh.addFace([735, 749, 235, 2844, 2677, 1468], 1364)
-    femmesh.addFace([577, 703, 277, 2741, 2830, 2494], 1365)
-    femmesh.addFace([812, 832, 246, 2798, 2855, 2006], 1366)
-    femmesh.addFace([368, 764, 691, 2856, 2857, 2848], 1367)
-    femmesh.addFace([288, 790, 536, 1481, 2027, 2732], 1368)
-    femmesh.addFace([729, 820, 346, 2619, 2858, 1603], 1369)
-    femmesh.addFace([532, 811, 309, 2767, 2482, 1763], 1370)
-    femmesh.addFace([786, 806, 337, 2413, 2859, 2852], 1371)
-    femmesh.addFace([624, 783, 475, 2860, 2575, 2483], 1372)
-    femmesh.addFace([708, 743, 384, 2861, 2862, 2863], 1373)
-    femmesh.addFace([340, 743, 708, 1225, 2861, 2795], 1374)
-    femmesh.addFace([654, 795, 328, 1490, 1508, 2864], 1375)
-    femmesh.addFace([665, 701, 339, 2865, 1092, 1516], 1376)
-    femmesh.addFace([344, 701, 665, 1458, 2865, 1133], 1377)
-    femmesh.addFace([541, 777, 233, 2853, 1003, 1048], 1378)
-    femmesh.addFace([604, 817, 294, 2866, 2822, 2825], 1379)
-    femmesh.addFace([363, 817, 604, 2569, 2866, 891], 1380)
-    femmesh.addFace([425, 813, 589, 2336, 2867, 2212], 1381)
-    femmesh.addFace([270, 830, 534, 2705, 1792, 2552], 1382)
-    femmesh.addFace([327, 747, 704, 2631, 2868, 2239], 1383)
-    femmesh.addFace([322, 782, 546, 2666, 1743, 1974], 1384)
-    femmesh.addFace([384, 743, 680, 2862, 2869, 2681], 1385)
-    femmesh.addFace([680, 743, 231, 2869, 1961, 1022], 1386)
-    femmesh.addFace([548, 767, 228, 2555, 2846, 2800], 1387)
-    femmesh.addFace([537, 831, 342, 2595, 2870, 2851], 1388)
-    femmesh.addFace([245, 766, 610, 2343, 2871, 2374], 1389)
-    femmesh.addFace([610, 766, 348, 2871, 2872, 2873], 1390)
-    femmesh.addFace([195, 736, 564, 2439, 2471, 2874], 1391)
-    femmesh.addFace([559, 755, 442, 2539, 2422, 2167], 1392)
-    femmesh.addFace([599, 780, 64, 2875, 2806, 2301], 1393)
-    femmesh.addFace([564, 739, 195, 2788, 2205, 2874], 1394)
-    femmesh.addFace([349, 780, 599, 2132, 2875, 2876], 1395)
-    femmesh.addFace([358, 714, 588, 2838, 2684, 1910], 1396)
-    femmesh.addFace([280, 738, 568, 2823, 2411, 1899], 1397)
-    femmesh.addFace([611, 691, 221, 2849, 1859, 2464], 1398)
-    femmesh.addFace([431, 824, 651, 2360, 2877, 2185], 1399)
-    femmesh.addFace([17, 705, 597, 2510, 2605, 2644], 1400)
-    femmesh.addFace([650, 806, 518, 2878, 2745, 2710], 1401)
-    femmesh.addFace([664, 844, 199, 2755, 2507, 2380], 1402)
-    femmesh.addFace([629, 684, 300, 2633, 2238, 2649], 1403)
-    femmesh.addFace([598, 832, 405, 2740, 2797, 2079], 1404)
-    femmesh.addFace([230, 840, 542, 1635, 1962, 2832], 1405)
-    femmesh.addFace([424, 808, 602, 2322, 2879, 2190], 1406)
-    femmesh.addFace([290, 708, 614, 2385, 2880, 2287], 1407)
-    femmesh.addFace([614, 708, 384, 2880, 2863, 2421], 1408)
-    femmesh.addFace([605, 739, 316, 2561, 2787, 2623], 1409)
-    femmesh.addFace([370, 838, 546, 1547, 2667, 1126], 1410)
-    femmesh.addFace([553, 801, 223, 1688, 2802, 2663], 1411)
-    femmesh.addFace([656, 721, 437, 2881, 2332, 2354], 1412)
-    femmesh.addFace([198, 847, 639, 2389, 2882, 2883], 1413)
-    femmesh.addFace([296, 721, 656, 2733, 2881, 1936], 1414)
-    femmesh.addFace([691, 764, 328, 2857, 2884, 1864], 1415)
-    femmesh.addFace([593, 843, 239, 2885, 2426, 1372], 1416)
-    femmesh.addFace([229, 756, 566, 2075, 2812, 2753], 1417)
-    femmesh.addFace([677, 690, 360, 2886, 1082, 2736], 1418)
-    femmesh.addFace([651, 824, 315, 2877, 2818, 2650], 1419)
-    femmesh.addFace([394, 758, 616, 1939, 2887, 1992], 1420)
-    femmesh.addFace([319, 771, 699, 2805, 2888, 2653], 1421)
-    femmesh.addFace([626, 714, 314, 2703, 2840, 2365], 1422)
-    femmesh.addFace([610, 810, 286, 2889, 2558, 2358], 1423)
-    femmesh.addFace([333, 702, 641, 2340, 2807, 1276], 1424)
-    femmesh.addFace([618, 720, 197, 2890, 2719, 1838], 1425)
-    femmesh.addFace([330, 720, 618, 2436, 2890, 2491], 1426)
-    femmesh.addFace([579, 770, 66, 1714, 2723, 2261], 1427)
-    femmesh.addFace([583, 772, 280, 2891, 2833, 1467], 1428)
-    femmesh.addFace([601, 730, 324, 2854, 2574, 2484], 1429)
-    femmesh.addFace([348, 810, 610, 2587, 2889, 2873], 1430)
-    femmesh.addFace([654, 764, 257, 2892, 2893, 2014], 1431)
-    femmesh.addFace([323, 690, 677, 2503, 2886, 2183], 1432)
-    femmesh.addFace([649, 715, 321, 2841, 2070, 2726], 1433)
-    femmesh.addFace([586, 760, 335, 2816, 1593, 1298], 1434)
-    femmesh.addFace([391, 772, 583, 1691, 2891, 1854], 1435)
-    femmesh.addFace([653, 718, 338, 2894, 2762, 2532], 1436)
-    femmesh.addFace([224, 718, 653, 2626, 2894, 2700], 1437)
-    femmesh.addFace([313, 725, 682, 2836, 2895, 2777], 1438)
-    femmesh.addFace([403, 851, 827, 1752, 2896, 2897], 1439)
-    femmesh.addFace([669, 758, 237, 2898, 1938, 1567], 1440)
-    femmesh.addFace([353, 758, 669, 2899, 2898, 885], 1441)
-    femmesh.addFace([576, 824, 246, 2819, 2359, 2900], 1442)
-    femmesh.addFace([626, 821, 224, 2901, 2624, 2704], 1443)
-    femmesh.addFace([678, 819, 312, 2902, 2425, 1825], 1444)
-    femmesh.addFace([379, 819, 678, 1236, 2902, 2033], 1445)
-    femmesh.addFace([740, 741, 417, 2903, 2156, 2776], 1446)
-    femmesh.addFace([322, 741, 740, 1958, 2903, 2024], 1447)
-    femmesh.addFace([366, 836, 639, 2771, 2904, 2749], 1448)
-    femmesh.addFace([639, 836, 198, 2904, 2606, 2883], 1449)
-    femmesh.addFace([246, 832, 576, 2855, 2716, 2900], 1450)
-    femmesh.addFace([589, 813, 359, 2867, 2905, 1272], 1451)
-    femmesh.addFace([616, 758, 353, 2887, 2899, 2707], 1452)
-    femmesh.addFace([599, 779, 349, 2839, 2415, 2876], 1453)
-    femmesh.addFace([766, 823, 348, 2906, 2785, 2872], 1454)
-    femmesh.addFace([445, 815, 628, 2431, 2907, 2378], 1455)
-    femmesh.addFace([628, 815, 342, 2907, 2908, 2909], 1456)
-    femmesh.addFace([221, 849, 637, 2543, 2910, 2659], 1457)
-    femmesh.addFace([591, 814, 332, 2209, 2764, 2211], 1458)
-    femmesh.addFace([650, 798, 337, 2772, 2769, 2911], 1459)
-    femmesh.addFace([615, 820, 266, 2912, 2782, 2712], 1460)
-    femmesh.addFace([346, 820, 615, 2858, 2912, 1184], 1461)
-    femmesh.addFace([682, 725, 401, 2895, 2702, 2093], 1462)
-    femmesh.addFace([602, 808, 363, 2879, 1588, 1292], 1463)
-    femmesh.addFace([717, 822, 343, 2722, 2913, 1417], 1464)
-    femmesh.addFace([689, 826, 512, 2914, 2765, 2724], 1465)
-    femmesh.addFace([338, 783, 624, 2761, 2860, 2834], 1466)
-    femmesh.addFace([628, 831, 52, 2915, 2540, 2660], 1467)
-    femmesh.addFace([321, 843, 593, 2916, 2885, 2727], 1468)
-    femmesh.addFace([191, 839, 657, 2215, 2917, 2527], 1469)
-    femmesh.addFace([657, 839, 362, 2917, 2918, 2637], 1470)
-    femmesh.addFace([209, 845, 645, 2780, 2669, 1683], 1471)
-    femmesh.addFace([328, 764, 654, 2884, 2892, 2864], 1472)
-    femmesh.addFace([827, 851, 272, 2896, 2139, 2069], 1473)
-    femmesh.addFace([796, 818, 396, 2919, 2458, 1668], 1474)
-    femmesh.addFace([388, 735, 728, 2845, 2920, 1607], 1475)
-    femmesh.addFace([97, 818, 796, 2817, 2919, 2692], 1476)
-    femmesh.addFace([687, 803, 378, 2921, 2511, 1539], 1477)
-    femmesh.addFace([392, 803, 687, 2444, 2921, 1848], 1478)
-    femmesh.addFace([764, 833, 257, 2922, 2627, 2893], 1479)
-    femmesh.addFace([329, 821, 626, 2545, 2901, 2368], 1480)
-    femmesh.addFace([342, 831, 628, 2870, 2915, 2909], 1481)
-    femmesh.addFace([704, 747, 151, 2868, 2784, 2424], 1482)
-    femmesh.addFace([709, 815, 241, 2923, 2430, 1940], 1483)
-    femmesh.addFace([337, 806, 650, 2859, 2878, 2911], 1484)
-    femmesh.addFace([728, 735, 335, 2920, 1076, 1464], 1485)
-    femmesh.addFace([681, 822, 269, 2924, 2815, 2557], 1486)
-    femmesh.addFace([637, 849, 327, 2910, 2925, 2219], 1487)
-    femmesh.addFace([44, 787, 746, 2814, 2926, 2570], 1488)
-    femmesh.addFace([699, 771, 398, 2888, 2044, 2809], 1489)
-    femmesh.addFace([746, 787, 375, 2926, 2847, 2497], 1490)
-    femmesh.addFace([639, 847, 323, 2882, 2502, 1434], 1491)
-    femmesh.addFace([262, 804, 776, 2811, 2927, 2614], 1492)
-    femmesh.addFace([776, 804, 387, 2927, 1366, 1676], 1493)
-    femmesh.addFace([403, 827, 781, 2897, 2928, 1879], 1494)
-    femmesh.addFace([343, 822, 681, 2913, 2924, 2526], 1495)
-    femmesh.addFace([341, 826, 689, 2554, 2914, 894], 1496)
-    femmesh.addFace([342, 815, 709, 2908, 2923, 2752], 1497)
-    femmesh.addFace([748, 843, 321, 2929, 2916, 2042], 1498)
-    femmesh.addFace([441, 843, 748, 2427, 2929, 2402], 1499)
-    femmesh.addFace([359, 813, 731, 2905, 2930, 2743], 1500)
-    femmesh.addFace([731, 813, 249, 2930, 2335, 2307], 1501)
-    femmesh.addFace([368, 833, 764, 2747, 2922, 2856], 1502)
-    femmesh.addFace([375, 834, 751, 1926, 2931, 2496], 1503)
-    femmesh.addFace([752, 835, 376, 2932, 1121, 2498], 1504)
-    femmesh.addFace([716, 850, 230, 2933, 2479, 2831], 1505)
-    femmesh.addFace([415, 835, 752, 2793, 2932, 2104], 1506)
-    femmesh.addFace([751, 834, 414, 2931, 2810, 2103], 1507)
-    femmesh.addFace([372, 850, 716, 1047, 2933, 1321], 1508)
-    femmesh.addFace([438, 823, 766, 2377, 2906, 2342], 1509)
-    femmesh.addFace([327, 849, 765, 2925, 2934, 2593], 1510)
-    femmesh.addFace([781, 827, 352, 2928, 1268, 1995], 1511)
-    femmesh.addFace([765, 849, 453, 2934, 2542, 2530], 1512)
-    femmesh.addFace([440, 848, 839, 2243, 2935, 2214], 1513)
-    femmesh.addFace([839, 848, 362, 2935, 2524, 2918], 1514)
-    return True
+    return load_mesh(femmesh, __name__, nodes=False)
@@ -1,255 +1,11 @@
+from . import load_mesh
+
+
 def create_nodes(femmesh):
     # nodes
-    femmesh.addNode(0.0, 500.0, 0.0, 1)
-    femmesh.addNode(0.0, 500.00000000000324, 1000.0, 2)
-    femmesh.addNode(8000.0, 500.0, 0.0, 3)
-    femmesh.addNode(8000.0, 500.00000000000324, 1000.0, 4)
-    femmesh.addNode(0.0, 500.0000000000001, 500.0, 5)
-    femmesh.addNode(0.0, 500.00000000000006, 250.0, 6)
-    femmesh.addNode(0.0, 500.00000000000017, 750.0, 7)
-    femmesh.addNode(500.0, 500.0, 0.0, 8)
-    femmesh.addNode(1000.0, 500.0, 0.0, 9)
-    femmesh.addNode(1500.0, 500.0, 0.0, 10)
-    femmesh.addNode(2000.0, 500.0, 0.0, 11)
-    femmesh.addNode(2500.0, 500.0, 0.0, 12)
-    femmesh.addNode(3000.0, 500.0, 0.0, 13)
-    femmesh.addNode(3500.0, 500.0, 0.0, 14)
-    femmesh.addNode(4000.0, 500.0, 0.0, 15)
-    femmesh.addNode(4500.0, 500.0, 0.0, 16)
-    femmesh.addNode(5000.0, 500.0, 0.0, 17)
-    femmesh.addNode(5500.0, 500.0, 0.0, 18)
-    femmesh.addNode(6000.0, 500.0, 0.0, 19)
-    femmesh.addNode(6500.0, 500.0, 0.0, 20)
-    femmesh.addNode(7000.0, 500.0, 0.0, 21)
-    femmesh.addNode(7500.0, 500.0, 0.0, 22)
-    femmesh.addNode(250.0, 500.0, 0.0, 23)
-    femmesh.addNode(750.0, 500.0, 0.0, 24)
-    femmesh.addNode(1250.0, 500.0, 0.0, 25)
-    femmesh.addNode(1750.0, 500.0, 0.0, 26)
-    femmesh.addNode(2250.0, 500.0, 0.0, 27)
-    femmesh.addNode(2750.0, 500.0, 0.0, 28)
-    femmesh.addNode(3250.0, 500.0, 0.0, 29)
-    femmesh.addNode(3750.0, 500.0, 0.0, 30)
-    femmesh.addNode(4250.0, 500.0, 0.0, 31)
-    femmesh.addNode(4750.0, 500.0, 0.0, 32)
-    femmesh.addNode(5250.0, 500.0, 0.0, 33)
-    femmesh.addNode(5750.0, 500.0, 0.0, 34)
-    femmesh.addNode(6250.0, 500.0, 0.0, 35)
-    femmesh.addNode(6750.0, 500.0, 0.0, 36)
-    femmesh.addNode(7250.0, 500.0, 0.0, 37)
-    femmesh.addNode(7750.0, 500.0, 0.0, 38)
-    femmesh.addNode(8000.0, 500.0000000000001, 500.0, 39)
-    femmesh.addNode(8000.0, 500.00000000000006, 250.0, 40)
-    femmesh.addNode(8000.0, 500.00000000000017, 750.0, 41)
-    femmesh.addNode(500.0, 500.0000000000002, 1000.0, 42)
-    femmesh.addNode(1000.0, 500.0000000000002, 1000.0, 43)
-    femmesh.addNode(1500.0, 500.0000000000002, 1000.0, 44)
-    femmesh.addNode(2000.0, 500.0000000000002, 1000.0, 45)
-    femmesh.addNode(2500.0, 500.0000000000002, 1000.0, 46)
-    femmesh.addNode(3000.0, 500.0000000000002, 1000.0, 47)
-    femmesh.addNode(3500.0, 500.0000000000002, 1000.0, 48)
-    femmesh.addNode(4000.0, 500.0000000000002, 1000.0, 49)
-    femmesh.addNode(4500.0, 500.0000000000002, 1000.0, 50)
-    femmesh.addNode(5000.0, 500.0000000000002, 1000.0, 51)
-    femmesh.addNode(5500.0, 500.0000000000002, 1000.0, 52)
-    femmesh.addNode(6000.0, 500.0000000000002, 1000.0, 53)
-    femmesh.addNode(6500.0, 500.0000000000002, 1000.0, 54)
-    femmesh.addNode(7000.0, 500.0000000000002, 1000.0, 55)
-    femmesh.addNode(7500.0, 500.0000000000002, 1000.0, 56)
-    femmesh.addNode(250.0, 500.0000000000002, 1000.0, 57)
-    femmesh.addNode(750.0, 500.0000000000002, 1000.0, 58)
-    femmesh.addNode(1250.0, 500.0000000000002, 1000.0, 59)
-    femmesh.addNode(1750.0, 500.0000000000002, 1000.0, 60)
-    femmesh.addNode(2250.0, 500.0000000000002, 1000.0, 61)
-    femmesh.addNode(2750.0, 500.0000000000002, 1000.0, 62)
-    femmesh.addNode(3250.0, 500.0000000000002, 1000.0, 63)
-    femmesh.addNode(3750.0, 500.0000000000002, 1000.0, 64)
-    femmesh.addNode(4250.0, 500.0000000000002, 1000.0, 65)
-    femmesh.addNode(4750.0, 500.0000000000002, 1000.0, 66)
-    femmesh.addNode(5250.0, 500.0000000000002, 1000.0, 67)
-    femmesh.addNode(5750.0, 500.0000000000002, 1000.0, 68)
-    femmesh.addNode(6250.0, 500.0000000000002, 1000.0, 69)
-    femmesh.addNode(6750.0, 500.0000000000002, 1000.0, 70)
-    femmesh.addNode(7250.0, 500.0000000000002, 1000.0, 71)
-    femmesh.addNode(7750.0, 500.0000000000002, 1000.0, 72)
-    femmesh.addNode(714.9234693877551, 500.0000000000001, 484.05612244897964, 73)
-    femmesh.addNode(1750.0, 500.0000000000001, 500.0, 74)
-    femmesh.addNode(2750.0, 500.0000000000001, 500.0, 75)
-    femmesh.addNode(3750.0, 500.0000000000001, 500.0, 76)
-    femmesh.addNode(4750.0, 500.0000000000001, 500.0, 77)
-    femmesh.addNode(5750.0, 500.0000000000001, 500.0, 78)
-    femmesh.addNode(6756.944444444443, 500.0000000000001, 489.5833333333333, 79)
-    femmesh.addNode(7301.463293650793, 500.0000000000001, 489.7073412698406, 80)
-    femmesh.addNode(1244.1539115646258, 500.0000000000001, 497.34268707482994, 81)
-    femmesh.addNode(2250.0, 500.0000000000001, 500.0, 82)
-    femmesh.addNode(3250.0, 500.0000000000001, 500.0, 83)
-    femmesh.addNode(4250.0, 500.0000000000001, 500.0, 84)
-    femmesh.addNode(5250.0, 500.0000000000001, 500.0, 85)
-    femmesh.addNode(6251.157407407407, 500.0000000000001, 498.2638888888889, 86)
-    femmesh.addNode(355.2776691684587, 500.0000000000001, 632.304566974645, 87)
-    femmesh.addNode(7660.398197179746, 500.00000000000017, 648.5965255878823, 88)
-    femmesh.addNode(7699.764777975907, 500.00000000000006, 310.456176890242, 89)
-    femmesh.addNode(314.0402277112428, 500.00000000000006, 323.27213788472494, 90)
-    femmesh.addNode(1122.0769557823128, 500.00000000000017, 748.6713435374149, 91)
-    femmesh.addNode(1372.0769557823128, 500.00000000000017, 748.6713435374149, 92)
-    femmesh.addNode(2125.0, 500.00000000000017, 750.0, 93)
-    femmesh.addNode(2375.0, 500.00000000000017, 750.0, 94)
-    femmesh.addNode(3125.0, 500.00000000000017, 750.0, 95)
-    femmesh.addNode(3375.0, 500.00000000000017, 750.0, 96)
-    femmesh.addNode(4125.0, 500.00000000000017, 750.0, 97)
-    femmesh.addNode(4375.0, 500.00000000000017, 750.0, 98)
-    femmesh.addNode(5125.0, 500.00000000000017, 750.0, 99)
-    femmesh.addNode(5375.0, 500.00000000000017, 750.0, 100)
-    femmesh.addNode(6125.5787037037035, 500.00000000000017, 749.1319444444445, 101)
-    femmesh.addNode(6375.5787037037035, 500.00000000000017, 749.1319444444445, 102)
-    femmesh.addNode(857.4617346938776, 500.00000000000017, 742.0280612244899, 103)
-    femmesh.addNode(979.5386904761904, 500.0000000000001, 490.6994047619048, 104)
-    femmesh.addNode(1497.0769557823128, 500.0000000000001, 498.67134353741494, 105)
-    femmesh.addNode(1625.0, 500.00000000000017, 750.0, 106)
-    femmesh.addNode(1875.0, 500.00000000000017, 750.0, 107)
-    femmesh.addNode(2000.0, 500.0000000000001, 500.0, 108)
-    femmesh.addNode(2500.0, 500.0000000000001, 500.0, 109)
-    femmesh.addNode(2625.0, 500.00000000000017, 750.0, 110)
-    femmesh.addNode(2875.0, 500.00000000000017, 750.0, 111)
-    femmesh.addNode(3000.0, 500.0000000000001, 500.0, 112)
-    femmesh.addNode(3500.0, 500.0000000000001, 500.0, 113)
-    femmesh.addNode(3625.0, 500.00000000000017, 750.0, 114)
-    femmesh.addNode(3875.0, 500.00000000000017, 750.0, 115)
-    femmesh.addNode(4000.0, 500.0000000000001, 500.0, 116)
-    femmesh.addNode(4500.0, 500.0000000000001, 500.0, 117)
-    femmesh.addNode(4625.0, 500.00000000000017, 750.0, 118)
-    femmesh.addNode(4875.0, 500.00000000000017, 750.0, 119)
-    femmesh.addNode(5000.0, 500.0000000000001, 500.0, 120)
-    femmesh.addNode(5500.0, 500.0000000000001, 500.0, 121)
-    femmesh.addNode(5625.0, 500.00000000000017, 750.0, 122)
-    femmesh.addNode(5875.0, 500.00000000000017, 750.0, 123)
-    femmesh.addNode(6000.5787037037035, 500.0000000000001, 499.13194444444446, 124)
-    femmesh.addNode(6504.050925925925, 500.0000000000001, 493.9236111111111, 125)
-    femmesh.addNode(6628.472222222222, 500.00000000000017, 744.7916666666666, 126)
-    femmesh.addNode(7150.731646825397, 500.00000000000006, 244.8536706349203, 127)
-    femmesh.addNode(7029.203869047618, 500.0000000000001, 489.64533730158695, 128)
-    femmesh.addNode(6878.472222222222, 500.00000000000006, 244.79166666666666, 129)
-    femmesh.addNode(6878.472222222222, 500.00000000000017, 744.7916666666666, 130)
-    femmesh.addNode(7150.731646825397, 500.00000000000017, 744.8536706349203, 131)
-    femmesh.addNode(7400.731646825397, 500.00000000000006, 244.8536706349203, 132)
-    femmesh.addNode(7400.731646825397, 500.00000000000017, 744.8536706349203, 133)
-    femmesh.addNode(857.4617346938776, 500.00000000000006, 242.02806122448982, 134)
-    femmesh.addNode(607.4617346938776, 500.00000000000006, 242.02806122448982, 135)
-    femmesh.addNode(1875.0, 500.00000000000006, 250.0, 136)
-    femmesh.addNode(1625.0, 500.00000000000006, 250.0, 137)
-    femmesh.addNode(2875.0, 500.00000000000006, 250.0, 138)
-    femmesh.addNode(2625.0, 500.00000000000006, 250.0, 139)
-    femmesh.addNode(3875.0, 500.00000000000006, 250.0, 140)
-    femmesh.addNode(3625.0, 500.00000000000006, 250.0, 141)
-    femmesh.addNode(4875.0, 500.00000000000006, 250.0, 142)
-    femmesh.addNode(4625.0, 500.00000000000006, 250.0, 143)
-    femmesh.addNode(5875.0, 500.00000000000006, 250.0, 144)
-    femmesh.addNode(5625.0, 500.00000000000006, 250.0, 145)
-    femmesh.addNode(6628.472222222222, 500.00000000000006, 244.79166666666666, 146)
-    femmesh.addNode(607.4617346938776, 500.00000000000017, 742.0280612244899, 147)
-    femmesh.addNode(1122.0769557823128, 500.00000000000006, 248.67134353741497, 148)
-    femmesh.addNode(1372.0769557823128, 500.00000000000006, 248.67134353741497, 149)
-    femmesh.addNode(2125.0, 500.00000000000006, 250.0, 150)
-    femmesh.addNode(2375.0, 500.00000000000006, 250.0, 151)
-    femmesh.addNode(3125.0, 500.00000000000006, 250.0, 152)
-    femmesh.addNode(3375.0, 500.00000000000006, 250.0, 153)
-    femmesh.addNode(4125.0, 500.00000000000006, 250.0, 154)
-    femmesh.addNode(4375.0, 500.00000000000006, 250.0, 155)
-    femmesh.addNode(5125.0, 500.00000000000006, 250.0, 156)
-    femmesh.addNode(5375.0, 500.00000000000006, 250.0, 157)
-    femmesh.addNode(6125.5787037037035, 500.00000000000006, 249.13194444444446, 158)
-    femmesh.addNode(6375.5787037037035, 500.00000000000006, 249.13194444444446, 159)
-    femmesh.addNode(514.4818485494989, 500.0000000000001, 403.66413016685226, 160)
-    femmesh.addNode(407.0201138556214, 500.00000000000006, 161.63606894236247, 161)
-    femmesh.addNode(177.63883458422936, 500.0000000000001, 566.1522834873225, 162)
-    femmesh.addNode(177.63883458422936, 500.00000000000017, 816.1522834873225, 163)
-    femmesh.addNode(427.63883458422936, 500.00000000000017, 816.1522834873225, 164)
-    femmesh.addNode(535.1005692781068, 500.0000000000001, 558.1803447118123, 165)
-    femmesh.addNode(7599.882388987953, 500.00000000000006, 155.228088445121, 166)
-    femmesh.addNode(7500.614035813351, 500.0000000000001, 400.08175908004125, 167)
-    femmesh.addNode(7830.199098589873, 500.00000000000017, 824.2982627939411, 168)
-    femmesh.addNode(7830.199098589873, 500.0000000000001, 574.2982627939411, 169)
-    femmesh.addNode(7580.199098589873, 500.00000000000017, 824.2982627939411, 170)
-    femmesh.addNode(7480.9307454152695, 500.0000000000001, 569.1519334288614, 171)
-    femmesh.addNode(334.65894843985075, 500.0000000000001, 477.788352429685, 172)
-    femmesh.addNode(7849.882388987953, 500.0000000000001, 405.228088445121, 173)
-    femmesh.addNode(7849.882388987953, 500.00000000000006, 155.228088445121, 174)
-    femmesh.addNode(157.0201138556214, 500.00000000000006, 161.63606894236247, 175)
-    femmesh.addNode(157.0201138556214, 500.0000000000001, 411.6360689423625, 176)
-    femmesh.addNode(7680.081487577827, 500.0000000000001, 479.52635123906214, 177)
-    return True
+    return load_mesh(femmesh, __name__, elements=False)
 
 
 def create_elements(femmesh):
     # elements
-    femmesh.addFace([43, 81, 44, 91, 92, 59], 37)
-    femmesh.addFace([45, 82, 46, 93, 94, 61], 38)
-    femmesh.addFace([47, 83, 48, 95, 96, 63], 39)
-    femmesh.addFace([49, 84, 50, 97, 98, 65], 40)
-    femmesh.addFace([51, 85, 52, 99, 100, 67], 41)
-    femmesh.addFace([53, 86, 54, 101, 102, 69], 42)
-    femmesh.addFace([43, 73, 81, 103, 104, 91], 43)
-    femmesh.addFace([44, 81, 74, 92, 105, 106], 44)
-    femmesh.addFace([45, 74, 82, 107, 108, 93], 45)
-    femmesh.addFace([46, 82, 75, 94, 109, 110], 46)
-    femmesh.addFace([47, 75, 83, 111, 112, 95], 47)
-    femmesh.addFace([48, 83, 76, 96, 113, 114], 48)
-    femmesh.addFace([49, 76, 84, 115, 116, 97], 49)
-    femmesh.addFace([50, 84, 77, 98, 117, 118], 50)
-    femmesh.addFace([51, 77, 85, 119, 120, 99], 51)
-    femmesh.addFace([52, 85, 78, 100, 121, 122], 52)
-    femmesh.addFace([53, 78, 86, 123, 124, 101], 53)
-    femmesh.addFace([54, 86, 79, 102, 125, 126], 54)
-    femmesh.addFace([21, 80, 79, 127, 128, 129], 55)
-    femmesh.addFace([55, 79, 80, 130, 128, 131], 56)
-    femmesh.addFace([21, 22, 80, 37, 132, 127], 57)
-    femmesh.addFace([55, 80, 56, 131, 133, 71], 58)
-    femmesh.addFace([8, 9, 73, 24, 134, 135], 59)
-    femmesh.addFace([10, 11, 74, 26, 136, 137], 60)
-    femmesh.addFace([12, 13, 75, 28, 138, 139], 61)
-    femmesh.addFace([14, 15, 76, 30, 140, 141], 62)
-    femmesh.addFace([16, 17, 77, 32, 142, 143], 63)
-    femmesh.addFace([18, 19, 78, 34, 144, 145], 64)
-    femmesh.addFace([20, 21, 79, 36, 129, 146], 65)
-    femmesh.addFace([42, 73, 43, 147, 103, 58], 66)
-    femmesh.addFace([44, 74, 45, 106, 107, 60], 67)
-    femmesh.addFace([46, 75, 47, 110, 111, 62], 68)
-    femmesh.addFace([48, 76, 49, 114, 115, 64], 69)
-    femmesh.addFace([50, 77, 51, 118, 119, 66], 70)
-    femmesh.addFace([52, 78, 53, 122, 123, 68], 71)
-    femmesh.addFace([54, 79, 55, 126, 130, 70], 72)
-    femmesh.addFace([9, 81, 73, 148, 104, 134], 73)
-    femmesh.addFace([10, 74, 81, 137, 105, 149], 74)
-    femmesh.addFace([11, 82, 74, 150, 108, 136], 75)
-    femmesh.addFace([12, 75, 82, 139, 109, 151], 76)
-    femmesh.addFace([13, 83, 75, 152, 112, 138], 77)
-    femmesh.addFace([14, 76, 83, 141, 113, 153], 78)
-    femmesh.addFace([15, 84, 76, 154, 116, 140], 79)
-    femmesh.addFace([16, 77, 84, 143, 117, 155], 80)
-    femmesh.addFace([17, 85, 77, 156, 120, 142], 81)
-    femmesh.addFace([18, 78, 85, 145, 121, 157], 82)
-    femmesh.addFace([19, 86, 78, 158, 124, 144], 83)
-    femmesh.addFace([20, 79, 86, 146, 125, 159], 84)
-    femmesh.addFace([9, 10, 81, 25, 149, 148], 85)
-    femmesh.addFace([11, 12, 82, 27, 151, 150], 86)
-    femmesh.addFace([13, 14, 83, 29, 153, 152], 87)
-    femmesh.addFace([15, 16, 84, 31, 155, 154], 88)
-    femmesh.addFace([17, 18, 85, 33, 157, 156], 89)
-    femmesh.addFace([19, 20, 86, 35, 159, 158], 90)
-    femmesh.addFace([8, 73, 90, 135, 160, 161], 91)
-    femmesh.addFace([2, 5, 87, 7, 162, 163], 92)
-    femmesh.addFace([2, 87, 42, 163, 164, 57], 93)
-    femmesh.addFace([42, 87, 73, 164, 165, 147], 94)
-    femmesh.addFace([22, 89, 80, 166, 167, 132], 95)
-    femmesh.addFace([4, 88, 39, 168, 169, 41], 96)
-    femmesh.addFace([4, 56, 88, 72, 170, 168], 97)
-    femmesh.addFace([56, 80, 88, 133, 171, 170], 98)
-    femmesh.addFace([73, 87, 90, 165, 172, 160], 99)
-    femmesh.addFace([3, 39, 89, 40, 173, 174], 100)
-    femmesh.addFace([3, 89, 22, 174, 166, 38], 101)
-    femmesh.addFace([1, 90, 5, 175, 176, 6], 102)
-    femmesh.addFace([1, 8, 90, 23, 161, 175], 103)
-    femmesh.addFace([80, 89, 88, 167, 177, 171], 104)
-    femmesh.addFace([5, 90, 87, 176, 172, 162], 105)
-    femmesh.addFace([39, 88, 89, 169, 177, 173], 106)
-    return True
+    return load_mesh(femmesh, __name__, nodes=False)
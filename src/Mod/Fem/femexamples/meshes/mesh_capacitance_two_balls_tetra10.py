@@ -1,6049 +1,11 @@
+from . import load_mesh
+
+
 def create_nodes(femmesh):
     # nodes
-    femmesh.addNode(3.06161699786838e-13, -7.49879891330929e-29, 5000.0, 1)
-    femmesh.addNode(3.06161699786838e-13, -7.49879891330929e-29, -5000.0, 2)
-    femmesh.addNode(-1000.0, -7.49879891330929e-30, 500.0, 3)
-    femmesh.addNode(-1000.0, -7.49879891330929e-30, -500.0, 4)
-    femmesh.addNode(1000.0, -7.49879891330929e-30, 500.0, 5)
-    femmesh.addNode(1000.0, -7.49879891330929e-30, -500.0, 6)
-    femmesh.addNode(1545.084971874736, -3.784366730434148e-13, -4755.282581475768, 7)
-    femmesh.addNode(2938.9262614623644, -7.198293278059964e-13, -4045.0849718747377, 8)
-    femmesh.addNode(4045.0849718747368, -9.907600726170915e-13, -2938.9262614623667, 9)
-    femmesh.addNode(4755.282581475768, -1.1647083184890924e-12, -1545.0849718747384, 10)
-    femmesh.addNode(5000.0, -1.2246467991473533e-12, -5.66553889764798e-12, 11)
-    femmesh.addNode(4755.28258147577, -1.1647083184890928e-12, 1545.0849718747318, 12)
-    femmesh.addNode(4045.0849718747436, -9.907600726170931e-13, 2938.926261462357, 13)
-    femmesh.addNode(2938.926261462374, -7.198293278059987e-13, 4045.0849718747313, 14)
-    femmesh.addNode(1545.084971874747, -3.7843667304341745e-13, 4755.282581475765, 15)
-    femmesh.addNode(782.1723252011534, -1.9157696688784703e-13, -4938.441702975689, 16)
-    femmesh.addNode(2269.952498697733, -5.55978012349343e-13, -4455.03262094184, 17)
-    femmesh.addNode(3535.5339059327366, -8.659560562354931e-13, -3535.5339059327384, 18)
-    femmesh.addNode(4455.032620941839, -1.0911682878666934e-12, -2269.952498697735, 19)
-    femmesh.addNode(4938.441702975688, -1.2095693648649961e-12, -782.1723252011599, 20)
-    femmesh.addNode(4938.44170297569, -1.2095693648649965e-12, 782.1723252011486, 21)
-    femmesh.addNode(4455.032620941842, -1.091168287866694e-12, 2269.952498697729, 22)
-    femmesh.addNode(3535.5339059327453, -8.659560562354952e-13, 3535.5339059327302, 23)
-    femmesh.addNode(2269.952498697743, -5.559780123493455e-13, 4455.0326209418345, 24)
-    femmesh.addNode(782.1723252011689, -1.9157696688785081e-13, 4938.441702975686, 25)
-    femmesh.addNode(-750.0000000000003, -6.123233995736757e-14, -433.0127018922195, 26)
-    femmesh.addNode(-566.9872981077808, -1.0605752387249065e-13, -250.00000000000023, 27)
-    femmesh.addNode(-500.0, -1.2246467991473532e-13, -1.4547323094649232e-12, 28)
-    femmesh.addNode(-566.9872981077795, -1.06057523872491e-13, 249.9999999999977, 29)
-    femmesh.addNode(-749.9999999999975, -6.123233995736828e-14, 433.0127018922179, 30)
-    femmesh.addNode(-870.5904774487399, -3.169619151431759e-14, -482.9629131445342, 31)
-    femmesh.addNode(-646.4466094067266, -8.659560562354924e-14, -353.5533905932742, 32)
-    femmesh.addNode(-517.037086855466, -1.1829179713786693e-13, -129.4095225512612, 33)
-    femmesh.addNode(-517.0370868554653, -1.182917971378671e-13, 129.4095225512584, 34)
-    femmesh.addNode(-646.4466094067243, -8.659560562354981e-14, 353.5533905932718, 35)
-    femmesh.addNode(-870.5904774487375, -3.169619151431818e-14, 482.96291314453356, 36)
-    femmesh.addNode(1249.9999999999995, -6.123233995736757e-14, -433.0127018922195, 37)
-    femmesh.addNode(1433.0127018922192, -1.0605752387249065e-13, -250.00000000000023, 38)
-    femmesh.addNode(1500.0, -1.2246467991473532e-13, -1.4547323094649232e-12, 39)
-    femmesh.addNode(1433.0127018922205, -1.06057523872491e-13, 249.9999999999977, 40)
-    femmesh.addNode(1250.0000000000025, -6.123233995736828e-14, 433.0127018922179, 41)
-    femmesh.addNode(1129.4095225512601, -3.169619151431759e-14, -482.9629131445342, 42)
-    femmesh.addNode(1353.5533905932734, -8.659560562354924e-14, -353.5533905932742, 43)
-    femmesh.addNode(1482.962913144534, -1.1829179713786693e-13, -129.4095225512612, 44)
-    femmesh.addNode(1482.9629131445347, -1.182917971378671e-13, 129.4095225512584, 45)
-    femmesh.addNode(1353.5533905932757, -8.659560562354981e-14, 353.5533905932718, 46)
-    femmesh.addNode(1129.4095225512626, -3.169619151431818e-14, 482.96291314453356, 47)
-    femmesh.addNode(4158.87739555451, -1456.713995105225, 2362.567066817429, 48)
-    femmesh.addNode(4701.087081244729, -1467.2425526352602, 864.2797847284614, 49)
-    femmesh.addNode(-2135.3274922371675, 4230.691856321079, -1594.2468183297806, 50)
-    femmesh.addNode(-652.7347014796295, 4354.054887299237, -2369.840384471057, 51)
-    femmesh.addNode(-1105.7611272489712, 4792.250972061349, -900.9011878347911, 52)
-    femmesh.addNode(-2171.4012644214845, 2630.1829395561235, -3656.1119038312668, 53)
-    femmesh.addNode(-3129.38918156898, 1426.0039353600116, -3629.522851094451, 54)
-    femmesh.addNode(-1898.7492117218794, 1360.0587483273264, -4420.971797250447, 55)
-    femmesh.addNode(-4795.0804407167325, -36.07058400305491, -1416.2988667740656, 56)
-    femmesh.addNode(-4824.283135327283, 1313.8622272600567, -7.6340013102649715, 57)
-    femmesh.addNode(-4924.41974008117, -852.3434251799309, 153.62587363934594, 58)
-    femmesh.addNode(-4715.417055658832, 638.828560616479, 1535.1677632566627, 59)
-    femmesh.addNode(3736.0966858244424, 3140.856024093441, -1084.714243516493, 60)
-    femmesh.addNode(3669.702284754481, 2557.265913455959, -2234.653483013418, 61)
-    femmesh.addNode(4613.052348462777, 1717.1461063776235, -878.1556124595558, 62)
-    femmesh.addNode(-1744.9884372595209, 3780.7403440992307, -2767.8543683385883, 63)
-    femmesh.addNode(3625.6749677930447, -3438.777533336737, 171.14351912184327, 64)
-    femmesh.addNode(3928.422312873105, -2966.4059643421133, -876.3183134205656, 65)
-    femmesh.addNode(2825.4869961499903, -4035.1859501332956, -856.6782257266492, 66)
-    femmesh.addNode(3062.6254394522466, -3328.106064314411, -2131.674328384515, 67)
-    femmesh.addNode(4266.346929460101, 1255.206167249145, -2285.3317822990352, 68)
-    femmesh.addNode(-584.0521080758134, 2087.875951424953, -4505.514082378785, 69)
-    femmesh.addNode(1072.4235313544832, 2535.848861899269, -4173.652874761072, 70)
-    femmesh.addNode(-486.748003154033, 3362.6695766949742, -3668.177980877646, 71)
-    femmesh.addNode(3460.5816761214587, 1432.0640981825807, -3312.637450973002, 72)
-    femmesh.addNode(586.6869708862182, 1209.3518135627999, -4815.93880663207, 73)
-    femmesh.addNode(-1875.8551645769926, 96.6361107351995, 4633.770480249513, 74)
-    femmesh.addNode(-799.2338805643178, 933.3614161515386, 4846.654688648418, 75)
-    femmesh.addNode(-1551.3334583210187, 4690.451660794243, 770.0829298499464, 76)
-    femmesh.addNode(-1554.5626500655437, 4217.401426417584, 2190.173549167307, 77)
-    femmesh.addNode(-3056.5849119120776, 3602.751108071889, 1636.2986064768902, 78)
-    femmesh.addNode(-177.76594824831568, 4786.2058768072175, 1435.490359584289, 79)
-    femmesh.addNode(4712.185143078325, 1449.387500479392, 833.4188927580207, 80)
-    femmesh.addNode(-3784.2956407793745, -1861.9221744165218, 2685.5823054961984, 81)
-    femmesh.addNode(-3091.0020046429445, -839.872277794529, 3839.3125900720206, 82)
-    femmesh.addNode(-2476.0654203665654, -2613.891919812407, 3469.390301710713, 83)
-    femmesh.addNode(-2540.0173307933937, 3018.913816983116, 3071.558452137553, 84)
-    femmesh.addNode(-3799.2699111937213, 1887.0468541001046, 2646.6209234283915, 85)
-    femmesh.addNode(-1953.9636765535288, -1427.0487754839844, 4375.56370575256, 86)
-    femmesh.addNode(2258.128675215505, 1439.060472370769, -4222.553711088763, 87)
-    femmesh.addNode(4296.828761948912, -2546.7870815694437, 226.1374618226304, 88)
-    femmesh.addNode(4755.611233366572, -1361.7892622321956, -727.7992871298787, 89)
-    femmesh.addNode(-934.8838214238914, -814.8467455006707, -4843.760628043755, 90)
-    femmesh.addNode(-2133.282919988305, -859.1182208752683, -4439.709434844389, 91)
-    femmesh.addNode(-1170.2612837987092, -2203.3137686853993, -4333.1163109664085, 92)
-    femmesh.addNode(613.4684609647641, 4680.012166306796, -1649.5886064779586, 93)
-    femmesh.addNode(1639.5436285004416, 4690.7576424268755, -555.598263367929, 94)
-    femmesh.addNode(84.37397258184568, 4999.228628072176, -24.37533618924871, 95)
-    femmesh.addNode(-4468.746911529401, -1692.9576489030349, -1471.1204708374999, 96)
-    femmesh.addNode(-4357.984907948294, -2429.050440027884, -328.14859727759006, 97)
-    femmesh.addNode(-3503.392151362072, -3188.906960824851, -1599.0984425536305, 98)
-    femmesh.addNode(-3564.65808199275, -3505.186556151026, 82.94555480480122, 99)
-    femmesh.addNode(-4248.345205680359, -2370.6352156197, 1153.972134774686, 100)
-    femmesh.addNode(-4588.384959510037, -947.360294124068, 1746.2050098597326, 101)
-    femmesh.addNode(963.9748129830853, -4758.362038975252, 1195.3004919155285, 102)
-    femmesh.addNode(1273.432427329733, -3923.1752465433888, 2826.1397414024523, 103)
-    femmesh.addNode(2413.8009812672904, -3971.1528683019114, 1844.8603522788849, 104)
-    femmesh.addNode(2946.45861068658, -2721.9223218093493, 2984.8819959165753, 105)
-    femmesh.addNode(1404.535811823169, -2558.5831363458346, 4059.671352180241, 106)
-    femmesh.addNode(-16.39203961261543, -3513.0851657892467, 3557.8032434282923, 107)
-    femmesh.addNode(-2655.540043892282, 4233.630089754743, -156.4715258691626, 108)
-    femmesh.addNode(3095.250101084956, 3910.939609419862, -352.1053581023449, 109)
-    femmesh.addNode(2128.3468599095386, 4477.520455284829, 649.5769518841802, 110)
-    femmesh.addNode(1982.1154874126908, -3260.511365778153, -3231.1428052919964, 111)
-    femmesh.addNode(537.9554209867819, -2736.8374424235703, -4149.737916878527, 112)
-    femmesh.addNode(488.6636004584541, -3837.014306235831, -3168.3637889813954, 113)
-    femmesh.addNode(-1895.445378039829, 1950.884833038643, 4195.394521029844, 114)
-    femmesh.addNode(-194.31954255793073, 2250.1931293862813, 4460.815037170097, 115)
-    femmesh.addNode(-2277.964879586377, -3149.411509535774, -3145.168223000898, 116)
-    femmesh.addNode(-2210.123819853273, -4015.0709254029975, -1998.6390781981345, 117)
-    femmesh.addNode(-991.7628423182605, -4169.069072922039, -2575.901692573258, 118)
-    femmesh.addNode(-4047.5093153880307, 522.7765240025172, -2888.6628477201975, 119)
-    femmesh.addNode(-4209.847065264575, -920.6223470829018, -2535.6739106467967, 120)
-    femmesh.addNode(-568.2048062296519, -4945.7751577054305, 465.2433638444922, 121)
-    femmesh.addNode(-1026.4199312669223, -4762.748507500011, -1123.694255126553, 122)
-    femmesh.addNode(-1717.9291768356888, -4695.55979565709, -20.9176668249541, 123)
-    femmesh.addNode(-3023.816283400287, 3346.3286058866424, -2158.3836419107784, 124)
-    femmesh.addNode(-3310.8544073169282, 3628.7887879993923, -932.8102838412387, 125)
-    femmesh.addNode(982.9287407843716, -4851.933542422139, -701.8489798090515, 126)
-    femmesh.addNode(276.7956800946623, -4548.076721302101, -2058.7331756764547, 127)
-    femmesh.addNode(-4141.194200145803, 2551.517821409661, -1157.699185327373, 128)
-    femmesh.addNode(-3928.1014353630753, 3092.182625238808, 91.79175164345632, 129)
-    femmesh.addNode(-2726.838667932115, -1941.5723357359677, -3714.114664920159, 130)
-    femmesh.addNode(-3647.678680505257, -2011.3960235767331, -2765.6330704066895, 131)
-    femmesh.addNode(-3377.657002215718, -823.1503337353637, -3593.5854941067546, 132)
-    femmesh.addNode(1297.8406689036765, 1824.475751148298, 4470.670848050829, 133)
-    femmesh.addNode(901.7538415531, 3281.98338994442, 3662.7073371173346, 134)
-    femmesh.addNode(2240.4286335016463, 2352.180879397133, 3801.016265261762, 135)
-    femmesh.addNode(-1861.964590794326, -4479.00412279169, 1213.0993078240367, 136)
-    femmesh.addNode(-2008.0235999163283, -3882.185941062568, 2428.265541738632, 137)
-    femmesh.addNode(-571.66022963503, -4471.834149746897, 2162.383850987394, 138)
-    femmesh.addNode(2748.870161281803, 3198.9386111066897, 2685.2382759795, 139)
-    femmesh.addNode(-3156.074782600777, -3479.7211465854043, 1711.9382899619418, 140)
-    femmesh.addNode(3425.1730175289626, 1476.8943615828866, 3329.7106247715014, 141)
-    femmesh.addNode(2432.9021794826554, 1044.3541093619156, 4241.498730322505, 142)
-    femmesh.addNode(3623.6857630178743, -3007.8921831736293, 1679.7279855097208, 143)
-    femmesh.addNode(1392.9898179622296, 4341.3038989296565, 2052.4765100219092, 144)
-    femmesh.addNode(1063.368162035575, 4826.023602362947, 760.7524836665644, 145)
-    femmesh.addNode(-264.1969431139015, 4219.9518691310195, 2668.746184534393, 146)
-    femmesh.addNode(-4094.741107804483, -55.5588768018467, 2868.799134004441, 147)
-    femmesh.addNode(-3145.842000201009, 771.5183658812837, 3808.9942925763476, 148)
-    femmesh.addNode(-2729.024629436249, 288.84376502588015, -4179.59254609059, 149)
-    femmesh.addNode(-759.6088844256216, -3464.7374361668285, -3524.001821952676, 150)
-    femmesh.addNode(-893.0919520814796, -1261.7841268490458, 4755.027611103755, 151)
-    femmesh.addNode(-1147.1439384411237, 562.3405158975579, -4834.028747191917, 152)
-    femmesh.addNode(-3745.8645629439447, 2105.3129853175046, -2556.590680952715, 153)
-    femmesh.addNode(2558.4706216668847, -4258.706209710642, 563.6040253932662, 154)
-    femmesh.addNode(-4327.161001642872, 2221.724051704677, 1157.4195021417297, 155)
-    femmesh.addNode(4242.258890236963, -1200.9895984323334, -2358.148318631123, 156)
-    femmesh.addNode(4018.150853850614, -2313.073383959265, -1871.93889753881, 157)
-    femmesh.addNode(3189.9346350680253, -2249.0098484534174, -3125.1034743753626, 158)
-    femmesh.addNode(-1106.3684615034986, 3397.390720214881, 3497.668526545675, 159)
-    femmesh.addNode(4367.509884675623, 1213.2817709014205, 2110.1669961543435, 160)
-    femmesh.addNode(1769.5256573038312, -4159.179330938147, -2137.757292407246, 161)
-    femmesh.addNode(1019.5319368993825, 3809.450568189027, -3073.8641801755807, 162)
-    femmesh.addNode(2521.8820825753137, 2812.3241764336753, -3275.8118823021946, 163)
-    femmesh.addNode(4110.888381422016, 2832.2837757162024, 280.65161553827534, 164)
-    femmesh.addNode(3036.7316608725328, 3742.9639216021287, 1329.8428108010194, 165)
-    femmesh.addNode(3925.7774447607653, 2452.2534037273913, 1890.6942370767047, 166)
-    femmesh.addNode(658.3463300990314, 1009.5382728469824, 4852.567628101877, 167)
-    femmesh.addNode(2475.009728709566, 3938.815208035735, -1833.0470806117921, 168)
-    femmesh.addNode(734.7880262030853, -1404.4597768318565, 4742.107051913736, 169)
-    femmesh.addNode(2083.154986325239, -1686.4580858389554, -4220.9388088026935, 170)
-    femmesh.addNode(687.2630822402878, -1408.2352921995694, -4748.109394021285, 171)
-    femmesh.addNode(-2532.4425372212468, -4247.921878148674, -736.1348468984864, 172)
-    femmesh.addNode(-1291.0144568884468, -3573.0987486389495, 3250.576411127694, 173)
-    femmesh.addNode(-2997.5717847058368, 2013.8964367421763, 3458.1475586811835, 174)
-    femmesh.addNode(26.247649451863637, -2294.9384827867557, 4442.135569872072, 175)
-    femmesh.addNode(2277.1624803661034, -1413.1281095259626, 4221.089904761621, 176)
-    femmesh.addNode(-2643.9023790118886, -4220.538364603011, 443.66217234447384, 177)
-    femmesh.addNode(-4527.36954074668, 1349.879098594028, -1637.3000521279434, 178)
-    femmesh.addNode(-1144.1445198498193, -2496.379463368167, 4178.399561144349, 179)
-    femmesh.addNode(3509.9520588933183, -1210.0735677628797, 3349.0235151267857, 180)
-    femmesh.addNode(3328.7216822860933, -1106.9250263547704, -3562.910179601491, 181)
-    femmesh.addNode(331.6268693139651, 508.53175839305055, 4963.005044351123, 182)
-    femmesh.addNode(1111.8515560927722, 509.4130679702418, 4848.1217438710455, 183)
-    femmesh.addNode(1155.224600180352, -711.6477477157163, 4812.381282308094, 184)
-    femmesh.addNode(372.2250750694174, -711.4638878433861, 4935.105635119105, 185)
-    femmesh.addNode(-402.71660431721926, 470.30055813932665, 4961.515567003801, 186)
-    femmesh.addNode(-1350.4664466622062, 519.9741304806237, 4786.007446721168, 187)
-    femmesh.addNode(-955.5890399914176, 49.22789884302042, 4907.588634005889, 188)
-    femmesh.addNode(-1404.4596001257748, -590.9839544979758, 4762.166649450697, 189)
-    femmesh.addNode(-452.1181362667654, -638.7645599900471, 4938.377165401544, 190)
-    femmesh.addNode(-71.20634056587157, 981.9659471916367, 4902.108988549648, 191)
-    femmesh.addNode(-80.23049659729092, -1351.287223325974, 4813.271850570227, 192)
-    femmesh.addNode(1078.8271898933115, 612.0174454161274, -4843.7141266649105, 193)
-    femmesh.addNode(296.0809916969043, 610.3187935625153, -4953.770989516994, 194)
-    femmesh.addNode(348.0429353078937, -713.1568061296572, -4936.6257185503955, 195)
-    femmesh.addNode(1131.6652513223905, -713.8899970953962, -4817.644116266431, 196)
-    femmesh.addNode(-578.3918732268003, 283.5330192506679, -4958.333577723447, 197)
-    femmesh.addNode(-285.15447370213593, 901.4179910608157, -4909.799642706364, 198)
-    femmesh.addNode(-471.1369068486452, -410.64393931446887, -4960.786386260689, 199)
-    femmesh.addNode(-1051.270669896669, -127.49704795730328, -4886.570830488102, 200)
-    femmesh.addNode(-125.70560187071291, -1128.5559783014487, -4869.348981691329, 201)
-    femmesh.addNode(2632.5205407673966, 728.9428915185038, -4187.896591768041, 202)
-    femmesh.addNode(1929.4283985308236, 730.0573673318704, -4554.593537885377, 203)
-    femmesh.addNode(2557.595822228454, -858.8626790148516, -4209.638762259178, 204)
-    femmesh.addNode(1845.9527055132187, -858.0253517282616, -4566.864471910681, 205)
-    femmesh.addNode(1445.7170038623283, 1345.9060801562916, -4593.303731318196, 206)
-    femmesh.addNode(1401.4465807114648, -1565.484827800069, -4537.09210126265, 207)
-    femmesh.addNode(3246.506082762881, 726.4941072034084, -3732.6136374908046, 208)
-    femmesh.addNode(3801.2680728736864, 725.2732888401586, -3166.123764897094, 209)
-    femmesh.addNode(3726.7658648067213, -559.4465106827125, -3286.066918155555, 210)
-    femmesh.addNode(3159.3554602274335, -557.9716119129716, -3834.989016441943, 211)
-    femmesh.addNode(2892.4296063035304, 1452.167569443786, -3811.175713980468, 212)
-    femmesh.addNode(2737.8883209826286, -1413.1827953994652, -3937.8778458217666, 213)
-    femmesh.addNode(4199.014466423205, 634.1420969563987, -2639.3448640972224, 214)
-    femmesh.addNode(4565.063402086631, 635.150859302809, -1938.241347421971, 215)
-    femmesh.addNode(4552.969558511657, -607.7292445878228, -1975.128695690203, 216)
-    femmesh.addNode(4181.8712444370785, -606.0305871358478, -2672.9533894937367, 217)
-    femmesh.addNode(3897.44009505628, 1355.451229506716, -2823.5992403095074, 218)
-    femmesh.addNode(3829.68811596126, -1167.4304439873727, -2995.0951725974483, 219)
-    femmesh.addNode(4902.308728666213, 875.6823577514729, -447.8275752629333, 220)
-    femmesh.addNode(4766.224088935683, 873.6134219843511, -1232.845295638513, 221)
-    femmesh.addNode(4938.524889419555, -689.370456120275, -368.4294923212513, 222)
-    femmesh.addNode(4816.582254570351, -689.6481153744021, -1151.0520674228974, 223)
-    femmesh.addNode(4491.9699643588965, 1503.6734714500456, -1600.3661863945063, 224)
-    femmesh.addNode(4566.739022956465, -1300.7013959340743, -1566.2281362629715, 225)
-    femmesh.addNode(4791.349500437228, -743.4218545097307, 1220.7759462314268, 226)
-    femmesh.addNode(4924.704834110551, -744.8378136657732, 438.74699796325626, 227)
-    femmesh.addNode(4927.520964713983, 735.3532896452733, 422.8388365702219, 228)
-    femmesh.addNode(4796.721863613088, 734.3366689665121, 1205.0763543225596, 229)
-    femmesh.addNode(4789.784379557806, -1432.8946472985995, 69.12689120069889, 230)
-    femmesh.addNode(4734.44074449484, 1607.6551123459378, -22.712917362385575, 231)
-    femmesh.addNode(4528.888504364618, -740.0916388732993, 1985.3043295937898, 232)
-    femmesh.addNode(4153.53826685059, -737.5115891008542, 2684.0634347477194, 233)
-    femmesh.addNode(4254.711806051125, 613.6233068090078, 2553.6040971125417, 234)
-    femmesh.addNode(4606.3369581710485, 612.6177574152524, 1845.6324962155918, 235)
-    femmesh.addNode(4487.314200758513, -1480.8989103099334, 1634.3040357026111, 236)
-    femmesh.addNode(4581.374205700771, 1343.5125608215194, 1485.2556635995127, 237)
-    femmesh.addNode(3786.9524430644988, 748.6928455051836, 3177.805880958932, 238)
-    femmesh.addNode(3229.7069872008205, 749.5068555432313, 3742.6237120928813, 239)
-    femmesh.addNode(3814.2905484431817, -610.9264790684477, 3174.5797279687345, 240)
-    femmesh.addNode(3261.752577120047, -612.0383083825551, 3739.8367925249026, 241)
-    femmesh.addNode(3862.6188666464395, -1343.2015948272385, 2876.8011691252727, 242)
-    femmesh.addNode(3944.8613693963, 1361.8380261446282, 2753.809355563898, 243)
-    femmesh.addNode(2010.6530657155809, 527.8633921591919, 4547.376660069707, 244)
-    femmesh.addNode(2704.713950147245, 525.8319694193075, 4172.292318116684, 245)
-    femmesh.addNode(2640.8066321373076, -715.439914541725, 4185.007295135833, 246)
-    femmesh.addNode(1938.6365775195718, -716.7358670726614, 4552.798910247937, 247)
-    femmesh.addNode(2958.820826985286, 1273.4425958959728, 3824.0977064865683, 248)
-    femmesh.addNode(2927.740590865395, -1327.0955631729314, 3829.771846834465, 249)
-    femmesh.addNode(1883.8241328895253, 1448.6045122945952, 4399.176241445978, 250)
-    femmesh.addNode(1446.7925153646513, 928.4934587676713, 4695.177452930877, 251)
-    femmesh.addNode(984.1096495820889, 1425.7228728575453, 4690.2923669436905, 252)
-    femmesh.addNode(1526.3385316033657, -1427.8431693173764, 4542.197108314058, 253)
-    femmesh.addNode(4252.635593598701, -2286.082469717715, 1299.5835678042304, 254)
-    femmesh.addNode(3954.2370045107723, -2268.418591794136, 2053.846830842159, 255)
-    femmesh.addNode(3615.7338093607677, -2126.4070544756337, 2721.1876191328183, 256)
-    femmesh.addNode(3322.5601793087353, -2897.6004827650386, 2358.92036685254, 257)
-    femmesh.addNode(3273.291365871755, -1993.4556295529853, 3211.183315712906, 258)
-    femmesh.addNode(4584.4618289039045, -1979.4352752173024, -254.058517960846, 259)
-    femmesh.addNode(4538.526331489225, -2024.6665458642549, 550.0037422027718, 260)
-    femmesh.addNode(4016.452253117641, -2816.749338429715, 966.4545839727734, 261)
-    femmesh.addNode(-1635.7962877562593, 4553.9317544624955, -1259.315719214599, 262)
-    femmesh.addNode(-890.7003770870364, 4632.719591820631, -1656.6719717005851, 263)
-    femmesh.addNode(-1414.0751696071463, 4354.091251937254, -2010.5424105210993, 264)
-    femmesh.addNode(-1209.0614527877399, 4102.002930070325, -2590.7030638568494, 265)
-    femmesh.addNode(-1957.1829352525212, 4040.8664331692717, -2200.1894071288893, 266)
-    femmesh.addNode(-2423.9350411142573, 4282.515934669591, -885.7743424594421, 267)
-    femmesh.addNode(-1912.155189931307, 4588.54118050261, -537.5428954516004, 268)
-    femmesh.addNode(-2411.017025532829, 3603.3105960742373, -2490.6123043962402, 269)
-    femmesh.addNode(-2604.2967478854116, 3824.822607497625, -1894.299466855369, 270)
-    femmesh.addNode(-2753.2901331076487, 3973.3212934238973, -1277.5411312972738, 271)
-    femmesh.addNode(-3004.270562005875, 3958.9795434676257, -548.4882539031938, 272)
-    femmesh.addNode(-3194.024403407934, 3516.946067197179, -1558.620694993136, 273)
-    femmesh.addNode(-250.60787381036383, 4821.976616463119, -1298.3594278423568, 274)
-    femmesh.addNode(-19.85558567122547, 4568.216615353416, -2032.4868292135702, 275)
-    femmesh.addNode(-1130.4810641716124, 3618.4781960978553, -3260.1576814494465, 276)
-    femmesh.addNode(-577.5805592103, 3911.4503564303677, -3060.54844869397, 277)
-    femmesh.addNode(186.78075715117345, 4157.026233414518, -2772.0472296592525, 278)
-    femmesh.addNode(270.2318154302103, 3637.7505485402653, -3419.6119242575305, 279)
-    femmesh.addNode(828.8224227112121, 4308.790788002456, -2397.3684190871236, 280)
-    femmesh.addNode(-516.478404131418, 4951.195768278895, -467.8787473726808, 281)
-    femmesh.addNode(-1348.9429483259353, 4814.139819158269, -66.41327997101934, 282)
-    femmesh.addNode(-746.2840504627964, 4929.416199944375, 379.36268102016174, 283)
-    femmesh.addNode(-2127.904273711008, 4513.944069378101, 310.37451642926027, 284)
-    femmesh.addNode(354.318117814629, 4914.4767002906365, -849.927899111892, 285)
-    femmesh.addNode(-2058.601194677109, 2018.1849181926755, -4085.22836047798, 286)
-    femmesh.addNode(-2541.4770556110307, 1408.217879510515, -4069.1297324648663, 287)
-    femmesh.addNode(-2682.351252431369, 2052.5463239650867, -3686.739121033285, 288)
-    femmesh.addNode(-3019.066147572428, 2416.1117407697357, -3169.801831770689, 289)
-    femmesh.addNode(-3472.397959690015, 1783.5178345476693, -3124.342577789929, 290)
-    femmesh.addNode(-1402.7451239656914, 2401.8675728519056, -4154.917361353047, 291)
-    femmesh.addNode(-1255.7048333999549, 1743.8319503064988, -4514.671139791493, 292)
-    femmesh.addNode(-1981.0555185328756, 3242.883348540377, -3249.480977056181, 293)
-    femmesh.addNode(-1352.085106614132, 3048.303845159416, -3725.5482189952354, 294)
-    femmesh.addNode(-2644.058646012313, 3041.6911090365907, -2959.234541846132, 295)
-    femmesh.addNode(-541.7644305169192, 2757.6684603225567, -4135.426938632685, 296)
-    femmesh.addNode(-3423.0502645900046, 2756.5912802667326, -2384.0997042170275, 297)
-    femmesh.addNode(-2336.1290602700055, 832.3762593447481, -4341.618451296846, 298)
-    femmesh.addNode(-2955.2691133287335, 865.0526587065478, -3939.2979533756943, 299)
-    femmesh.addNode(-3628.727367845825, 985.3271562653852, -3295.674147268306, 300)
-    femmesh.addNode(-3448.4436502285103, 413.01745920335503, -3596.8949066648966, 301)
-    femmesh.addNode(-3950.4973909671294, 1332.190770246861, -2760.224287196782, 302)
-    femmesh.addNode(-877.7614047241356, 1343.7286515645262, -4735.391032147324, 303)
-    femmesh.addNode(-1533.5018107065396, 967.8615129463802, -4659.572543519084, 304)
-    femmesh.addNode(-1967.8815644538295, 432.1354515547775, -4576.101080591675, 305)
-    femmesh.addNode(-4938.089455503026, -451.3676392058591, -641.5136660489405, 306)
-    femmesh.addNode(-4993.84765049745, 236.41653816756272, 74.78545381267027, 307)
-    femmesh.addNode(-4903.946870378279, 651.4175579714074, -725.9202832774772, 308)
-    femmesh.addNode(-4709.542371931919, 663.7136032238432, -1542.6259753658678, 309)
-    femmesh.addNode(-4741.36073141574, 1350.5375957093515, -833.9943747798312, 310)
-    femmesh.addNode(-4782.335945811306, -1295.8872413289896, -670.7750436337237, 311)
-    femmesh.addNode(-4699.479125493087, -877.124732463869, -1464.768975898559, 312)
-    femmesh.addNode(-4378.814687104359, -1318.6908504934024, -2021.6420001632684, 313)
-    femmesh.addNode(-4556.970529966718, -484.13732262590685, -1999.907658332121, 314)
-    femmesh.addNode(-4175.59047545714, -201.1831817562371, -2742.985510105741, 315)
-    femmesh.addNode(-4490.048185397868, 247.13722823206226, -2185.952991998474, 316)
-    femmesh.addNode(-4341.619506777062, 948.1601217869356, -2291.57859167559, 317)
-    femmesh.addNode(-4923.822495845588, -109.05882699171124, 862.5996763621689, 318)
-    femmesh.addNode(-4839.252914312663, 990.5515264422813, 774.8799292659919, 319)
-    femmesh.addNode(-4585.924413275923, 1450.7232314916064, 1365.5399596241887, 320)
-    femmesh.addNode(-4632.32025270613, 1789.659389284174, 582.0037342797827, 321)
-    femmesh.addNode(-4559.082622759617, 1965.6049924442693, -592.5897843613699, 322)
-    femmesh.addNode(-4465.861572023675, 2248.1629129140715, 42.94108196062929, 323)
-    femmesh.addNode(-4073.5102513236275, 2849.0307783068947, -538.0872202731824, 324)
-    femmesh.addNode(-4374.3392193212885, 1968.726777286679, -1410.4152830645412, 325)
-    femmesh.addNode(-4170.6546627861335, 2684.6474995703097, 631.1160644692593, 326)
-    femmesh.addNode(-4820.9099936016955, -912.0558993802969, 962.7984576207506, 327)
-    femmesh.addNode(-4713.016682828225, -156.2925785428778, 1662.2413715448333, 328)
-    femmesh.addNode(-4455.002822429622, -2080.4481257426046, -908.1219346751783, 329)
-    femmesh.addNode(-4713.373640124164, -1666.2099890699103, -88.61828765176702, 330)
-    femmesh.addNode(-4675.189129198436, -1642.6927752103445, 666.4585902338608, 331)
-    femmesh.addNode(-4351.565032341778, -2426.8351306062436, 417.556006010788, 332)
-    femmesh.addNode(-4474.470489972634, -1680.064086679093, 1468.5021276849413, 333)
-    femmesh.addNode(-4026.5166786501995, 934.1913597017785, 2813.263219112336, 334)
-    femmesh.addNode(-4336.8445033952, 1286.5216244847986, 2129.9394036225135, 335)
-    femmesh.addNode(-4464.540595570742, 295.5714452840747, 2231.7066991953775, 336)
-    femmesh.addNode(-4117.26763729955, 2081.7145510738146, 1927.322425203765, 337)
-    femmesh.addNode(-4392.351390285897, -507.3257465814071, 2334.495630989522, 338)
-    femmesh.addNode(4235.117723422341, 2464.2284906749123, -995.668526418311, 339)
-    femmesh.addNode(4214.409385751241, 2174.8950599973728, -1583.8513210812657, 340)
-    femmesh.addNode(3734.161032795628, 2873.1140264332043, -1673.6956629756407, 341)
-    femmesh.addNode(3127.5316085726326, 3306.3712334768647, -2070.375643166177, 342)
-    femmesh.addNode(3149.7565152096877, 3590.2203408979076, -1479.6458355623606, 343)
-    femmesh.addNode(3965.347789045966, 3018.4301990967097, -406.3201263650083, 344)
-    femmesh.addNode(4425.228320622585, 2307.7032020590223, -303.084545244974, 345)
-    femmesh.addNode(3442.2892998151356, 3553.372623424962, -724.0078559464836, 346)
-    femmesh.addNode(3650.756579585784, 3416.235644188981, -36.19972353224247, 347)
-    femmesh.addNode(2821.7492386079643, 3976.4823107419775, -1106.941582366258, 348)
-    femmesh.addNode(4009.413153942811, 1926.1190671599904, -2283.565523498961, 349)
-    femmesh.addNode(3610.038713860398, 2019.7843260384084, -2808.5746849102547, 350)
-    femmesh.addNode(3033.8165572570965, 2152.4067578745776, -3341.1229018951917, 351)
-    femmesh.addNode(3134.6930508289697, 2718.5314358941987, -2789.854173454161, 352)
-    femmesh.addNode(2541.4127173622055, 3433.620765938421, -2598.359065977239, 353)
-    femmesh.addNode(4469.559790433609, 2168.9931200048723, 564.3616970619141, 354)
-    femmesh.addNode(3259.2006451808684, -3775.931645110201, -346.33995713457955, 355)
-    femmesh.addNode(3417.5071908337295, -3542.835655645492, -876.9037106129318, 356)
-    femmesh.addNode(3803.999726831025, -3225.443804891578, -355.10328040730667, 357)
-    femmesh.addNode(4144.394141031143, -2777.890273500729, -327.6016364073639, 358)
-    femmesh.addNode(3986.2264508230096, -3011.650963504995, 199.89286325035965, 359)
-    femmesh.addNode(3122.911306733746, -3887.1269550206657, 371.0377417814767, 360)
-    femmesh.addNode(2721.232289474517, -4192.0105529988505, -148.12950505403697, 361)
-    femmesh.addNode(3670.131827572447, -3263.753672493203, 937.0401984583465, 362)
-    femmesh.addNode(3153.9143407652123, -3707.157738143791, 1144.4674899865665, 363)
-    femmesh.addNode(2976.7083876850784, -3722.4786958639747, -1510.748004640133, 364)
-    femmesh.addNode(3539.2624747446307, -3186.6368259954565, -1522.8154432084382, 365)
-    femmesh.addNode(3576.528857967307, -2849.3826459120864, -2022.2412974969395, 366)
-    femmesh.addNode(4001.925893783562, -2658.7668251941254, -1384.033276302193, 367)
-    femmesh.addNode(4415.0518617612, -2200.4989146348294, -815.549866439758, 368)
-    femmesh.addNode(4448.653394395431, -1863.3044778744218, -1318.1727501610442, 369)
-    femmesh.addNode(2445.1353904091525, -3788.6701246398866, -2160.391540723548, 370)
-    femmesh.addNode(2330.022577315627, -4155.169430777646, -1518.407649720723, 371)
-    femmesh.addNode(1944.345823148735, -4537.22357504051, -795.6893552767182, 372)
-    femmesh.addNode(1811.327125004634, -4659.83844808769, -70.70844324516297, 373)
-    femmesh.addNode(1398.504323248977, -4578.488319164174, -1442.785628266075, 374)
-    femmesh.addNode(2618.8781510801564, -2789.7573281720433, -3218.498295743741, 375)
-    femmesh.addNode(3160.722949780623, -2819.280110703209, -2657.346438107643, 376)
-    femmesh.addNode(2552.94510490694, -3334.2403227656755, -2713.9109715270947, 377)
-    femmesh.addNode(1895.3319532080013, -3748.4333703428183, -2712.3724034964525, 378)
-    femmesh.addNode(3645.4807129365277, -2307.2682004312032, -2527.248270923683, 379)
-    femmesh.addNode(297.900640395506, 3000.249004155972, -3988.704190775877, 380)
-    femmesh.addNode(248.00299195285217, 2348.003042382627, -4407.42285569973, 381)
-    femmesh.addNode(839.7274568341749, 1895.562612792824, -4549.912106757762, 382)
-    femmesh.addNode(1.3324310543613636, 1667.384218268604, -4713.791265350671, 383)
-    femmesh.addNode(1061.1240503912145, 3218.591377483027, -3676.2324864558354, 384)
-    femmesh.addNode(1687.453506148719, 2013.9227001173551, -4254.01175627647, 385)
-    femmesh.addNode(1824.576913273731, 2714.892416526134, -3781.5708712435094, 386)
-    femmesh.addNode(2424.8303727037946, 2156.6659877627853, -3803.812492860334, 387)
-    femmesh.addNode(1800.593714971539, 3366.769861292152, -3228.424224710844, 388)
-    femmesh.addNode(-1365.6330870442132, 1461.703502003279, 4582.40866180674, 389)
-    femmesh.addNode(-1920.8436273002276, 1042.8677089423204, 4496.975283577341, 390)
-    femmesh.addNode(-2547.12055063798, -1144.5313142566706, 4147.556506089287, 391)
-    femmesh.addNode(-1938.2546731461991, -673.3160683655262, 4559.584881774624, 392)
-    femmesh.addNode(-2521.3420599571864, -377.2914228540946, 4301.219059630837, 393)
-    femmesh.addNode(-3159.7777499999456, -34.63020236215272, 3874.8684261132844, 394)
-    femmesh.addNode(-2546.0830534529987, 440.1685980182568, 4280.620596389979, 395)
-    femmesh.addNode(-1432.84838908814, -1353.2190428194065, 4595.1870164377915, 396)
-    femmesh.addNode(-2560.6950812686177, 1382.8302093614882, 4065.786678226487, 397)
-    femmesh.addNode(-502.45858037365673, 1609.9831778207426, 4706.961816516373, 398)
-    femmesh.addNode(-1061.2120774020905, 2133.3665944386967, 4395.745204229765, 399)
-    femmesh.addNode(234.87243872341972, 1649.9501420659376, 4714.07461398573, 400)
-    femmesh.addNode(-2353.9119979037578, 4236.505061545859, 1229.2774990298444, 401)
-    femmesh.addNode(-2340.2395817082797, 3968.866805980001, 1942.0028261040106, 402)
-    femmesh.addNode(-1570.6424079515987, 4504.6747651342, 1496.9928813147856, 403)
-    femmesh.addNode(-878.5000731280583, 4565.91762209438, 1838.6500182911375, 404)
-    femmesh.addNode(-874.83982642942, 4794.725742099131, 1115.9123335391885, 405)
-    femmesh.addNode(-2911.5143647975515, 3994.2642365198158, 754.2793331626464, 406)
-    femmesh.addNode(-47.22921771269041, 4948.588070293412, 713.6143997594075, 407)
-    femmesh.addNode(-2080.685984575243, 3677.178068885482, 2673.7814576550186, 408)
-    femmesh.addNode(-2836.3897439572474, 3355.8973224919014, 2385.9686463291655, 409)
-    femmesh.addNode(-918.1163009716173, 4259.205904260199, 2452.7999353810455, 410)
-    femmesh.addNode(-223.05323225605537, 4545.296980132763, 2071.3576750470015, 411)
-    femmesh.addNode(-1845.2855561581518, 3247.0272650293014, 3324.415009650636, 412)
-    femmesh.addNode(-1347.987610411705, 3857.538973817428, 2881.3751001312075, 413)
-    femmesh.addNode(-692.4979345633735, 3848.772187166211, 3115.669953945906, 414)
-    femmesh.addNode(-3508.053872145994, 2809.059919645773, 2191.5155481906086, 415)
-    femmesh.addNode(-3219.0723027463714, 2491.2330853297367, 2903.6754681351113, 416)
-    femmesh.addNode(-3763.123440466153, 2968.4416634558024, 1423.8174259623054, 417)
-    femmesh.addNode(-3342.0610712378334, 3718.8102613279425, -32.83346400579431, 418)
-    femmesh.addNode(-3553.3764032826634, 3405.9681948020593, 879.1454900019476, 419)
-    femmesh.addNode(578.5321457324962, 4952.527300159945, 371.1790639632061, 420)
-    femmesh.addNode(447.2904360001966, 4854.841426248719, 1109.2547010682704, 421)
-    femmesh.addNode(1240.7250756311535, 4630.486761293232, 1420.983335647602, 422)
-    femmesh.addNode(617.0824126970004, 4634.887360839238, 1771.1658443727763, 423)
-    femmesh.addNode(573.4740701014965, 4349.476595650339, 2398.578919863001, 424)
-    femmesh.addNode(4379.440942556402, 1978.1291879050066, 1381.1234364165198, 425)
-    femmesh.addNode(4184.013683557619, 1849.2846948365639, 2018.4587222050995, 426)
-    femmesh.addNode(4075.189800336686, 2679.6550309467525, 1101.0345164224425, 427)
-    femmesh.addNode(-3176.437178163361, -2270.978007912842, 3122.9642554403035, 428)
-    femmesh.addNode(-2835.9461321447434, -1759.398345624789, 3723.1608878728334, 429)
-    femmesh.addNode(-3487.821640376597, -1370.613702018466, 3310.0631844059926, 430)
-    femmesh.addNode(-4008.100405125551, -975.4309852140567, 2825.538096631637, 431)
-    femmesh.addNode(-3639.8472879688975, -453.56932590238307, 3397.9091492954776, 432)
-    femmesh.addNode(-3541.003799556376, -2725.3270562943126, 2243.6319947258476, 433)
-    femmesh.addNode(-2878.6515945480783, -3114.5156792977587, 2648.236598307302, 434)
-    femmesh.addNode(-4074.176302995353, -2146.764102761242, 1947.431985771734, 435)
-    femmesh.addNode(-4236.748469025963, -1421.55466879262, 2242.575468928541, 436)
-    femmesh.addNode(-3753.889901827312, -2966.011342540157, 1452.9581277112138, 437)
-    femmesh.addNode(-2243.2593180109907, -2046.2343858092615, 3972.494489673794, 438)
-    femmesh.addNode(-3665.818398979208, 362.4815058181314, 3380.8848876655557, 439)
-    femmesh.addNode(-1563.4903865781798, -1979.996160558902, 4316.840628891646, 440)
-    femmesh.addNode(-1831.1984086822647, -2584.911090613557, 3868.4553818885615, 441)
-    femmesh.addNode(-2275.414384161886, -3296.381703933691, 2992.717334183167, 442)
-    femmesh.addNode(-2608.1720655150457, -3718.1941536833306, 2091.045363492165, 443)
-    femmesh.addNode(-1660.2274320045503, -3751.841579916164, 2857.854025878817, 444)
-    femmesh.addNode(-1906.2871099061888, -3130.854918046716, 3400.5612679009623, 445)
-    femmesh.addNode(-1230.2030983477848, -3066.20264758511, 3752.9990222164424, 446)
-    femmesh.addNode(-3421.029641995368, 1963.447616819647, 3072.69094518051, 447)
-    femmesh.addNode(-2787.9419195749692, 2533.8071111768522, 3287.4308169794613, 448)
-    femmesh.addNode(-2249.6690143050496, 2520.6844841741654, 3685.802362758938, 449)
-    femmesh.addNode(-1525.5281154447555, 2718.0049002890023, 3909.630843314052, 450)
-    femmesh.addNode(-2468.353741248089, 2000.09163160226, 3860.9407238730264, 451)
-    femmesh.addNode(-3526.2550729760196, 1349.8384494590996, 3277.7219712283013, 452)
-    femmesh.addNode(-3097.9741481879432, 1404.6169365487974, 3664.642880107072, 453)
-    femmesh.addNode(-1028.538780952466, -1897.3825822181257, 4510.215883167024, 454)
-    femmesh.addNode(4162.027746484964, -1770.5692681985768, -2131.3398377546564, 455)
-    femmesh.addNode(-1064.5849725493847, -1526.302543313115, -4640.803743156775, 456)
-    femmesh.addNode(-1674.9258069299717, -1552.6798053445264, -4447.8993877284665, 457)
-    femmesh.addNode(-1546.5161278645812, -843.7656868639145, -4679.353302746632, 458)
-    femmesh.addNode(-1666.6606962863157, -150.78151648143097, -4711.63528488167, 459)
-    femmesh.addNode(-246.80669427150076, -1845.4612916577191, -4640.405055235566, 460)
-    femmesh.addNode(-1977.175177190982, -2102.88830654857, -4082.7244688909745, 461)
-    femmesh.addNode(-2455.36484715613, -1414.926975810046, -4119.364650097754, 462)
-    femmesh.addNode(-3078.354620075987, -1394.1850830389371, -3685.1025477303256, 463)
-    femmesh.addNode(-2787.2257589766746, -850.8280465978963, -4062.9378783854554, 464)
-    femmesh.addNode(-3084.3503663560045, -269.86647746686333, -3926.060990598491, 465)
-    femmesh.addNode(-2452.589711402013, -287.65133609393314, -4347.649987794368, 466)
-    femmesh.addNode(-112.2991121309351, -3141.9827232764296, -3887.8443225066294, 467)
-    femmesh.addNode(-976.7995077292021, -2868.871553042206, -3976.8629262076897, 468)
-    femmesh.addNode(-321.3963451314049, -2511.041945089731, -4311.771415478348, 469)
-    femmesh.addNode(619.2887708795894, -2095.1340452907957, -4497.432017332321, 470)
-    femmesh.addNode(-1755.404069971229, -2724.936037722998, -3807.0040900223535, 471)
-    femmesh.addNode(-2527.602007792604, -2571.126092517424, -3464.1793698622014, 472)
-    femmesh.addNode(-1538.5167882689461, -3350.0352530153777, -3377.9031803426224, 473)
-    femmesh.addNode(874.2672843330076, 4914.178019073989, -294.12771442867256, 474)
-    femmesh.addNode(1139.395792988521, 4738.9961851777625, -1115.20956944902, 475)
-    femmesh.addNode(1576.4796000711326, 4399.385295195622, -1777.6729437599295, 476)
-    femmesh.addNode(2087.721528641143, 4378.6392978275235, -1211.9969960230032, 477)
-    femmesh.addNode(1780.2878083260875, 3947.339713484139, -2499.8168944697622, 478)
-    femmesh.addNode(1365.7554683872797, 4808.73851378614, 103.66246475991183, 479)
-    femmesh.addNode(1900.5221092257862, 4624.474963332767, 47.40280426689106, 480)
-    femmesh.addNode(2641.811978318306, 4242.428051792596, 150.44499518827212, 481)
-    femmesh.addNode(2400.865406035759, 4361.650907010059, -460.2680387329538, 482)
-    femmesh.addNode(1606.0724471621909, 4681.54759093795, 709.6784118525251, 483)
-    femmesh.addNode(-4051.129537056299, -2480.772821492324, -1560.1652739806232, 484)
-    femmesh.addNode(-3989.42690458994, -2850.9547671751275, -978.0234600741143, 485)
-    femmesh.addNode(-3626.0752935896626, -2636.9044041471484, -2213.2133039108567, 486)
-    femmesh.addNode(-4108.886216977289, -1875.304291903909, -2144.8281676397387, 487)
-    femmesh.addNode(-3959.744376214324, -1477.5698648428781, -2671.5560577212746, 488)
-    femmesh.addNode(-3587.0213245960613, -3397.239040678915, -769.4445512056866, 489)
-    femmesh.addNode(-4000.649856477927, -2996.5763214638837, -123.81872033388365, 490)
-    femmesh.addNode(-3964.443853209663, -2981.4867148980256, 627.6319810483695, 491)
-    femmesh.addNode(-3061.217804650675, -3771.765468505362, -1184.3693693608532, 492)
-    femmesh.addNode(-3084.0361057012587, -3921.678160836985, -330.39627955722693, 493)
-    femmesh.addNode(-2893.369733300202, -3648.1514500679423, -1821.9227710826533, 494)
-    femmesh.addNode(-2948.65225542166, -3232.7180198631563, -2419.7074369949746, 495)
-    femmesh.addNode(-2267.6197319880002, -3619.875369436662, -2598.923442667072, 496)
-    femmesh.addNode(-3013.1900276747656, -2624.2708721553527, -3005.6427343711907, 497)
-    femmesh.addNode(-2392.3329309832507, -4168.171471744713, -1379.5251826141528, 498)
-    femmesh.addNode(-3408.795010385035, -3542.786033131223, 910.3755821771714, 499)
-    femmesh.addNode(-3127.6630302284652, -3891.959234048775, 265.28718371712665, 500)
-    femmesh.addNode(-2935.7232561902465, -3897.572403442095, 1091.0812632386014, 501)
-    femmesh.addNode(-2606.5494773280548, -4264.294782655404, -147.27467147731392, 502)
-    femmesh.addNode(1716.0767673962619, -4435.02429868714, 1544.5517144004734, 503)
-    femmesh.addNode(1864.863390721201, -3992.6529905568736, 2362.415423024723, 504)
-    femmesh.addNode(1138.532707614188, -4417.709022231083, 2046.3602489764096, 505)
-    femmesh.addNode(358.3941929598747, -4287.320910343235, 2547.6328256219144, 506)
-    femmesh.addNode(199.55420308532896, -4695.019055989493, 1707.9151571218379, 507)
-    femmesh.addNode(1790.0149807585974, -4582.239114024594, 893.8294415395485, 508)
-    femmesh.addNode(2508.1184032103874, -4151.314058791699, 1214.8801013909836, 509)
-    femmesh.addNode(200.8345092563144, -4924.389414040472, 842.6472564352869, 510)
-    femmesh.addNode(211.39245919961945, -4994.073319798268, -120.6022581573236, 511)
-    femmesh.addNode(991.5043000803665, -4894.258565381914, 251.30124971417544, 512)
-    femmesh.addNode(-578.992007978019, -4783.654513218707, 1334.6976260036874, 513)
-    femmesh.addNode(2156.4575623690735, -3395.7916862921643, 2969.5605070464976, 514)
-    femmesh.addNode(2723.2809696198324, -3400.4182037796913, 2453.751576649553, 515)
-    femmesh.addNode(2215.279502198347, -2688.5337848698373, 3586.6868855189064, 516)
-    femmesh.addNode(1362.3505961040958, -3297.4354466299096, 3502.9873434831916, 517)
-    femmesh.addNode(636.0939396453778, -3762.9341333256493, 3230.4351422369036, 518)
-    femmesh.addNode(705.3852250671388, -3085.318104344704, 3870.8195358683133, 519)
-    femmesh.addNode(-298.8075375345897, -4057.3843565646393, 2906.603901225116, 520)
-    femmesh.addNode(3055.93051865703, -3532.5090831999178, 1784.0034311207626, 521)
-    femmesh.addNode(2661.362125728337, -2106.750549878549, 3671.342228167401, 522)
-    femmesh.addNode(1860.4841235558852, -2007.0372773264075, 4184.5430089101355, 523)
-    femmesh.addNode(723.0808770715764, -2452.844028628062, 4296.592861377147, 524)
-    femmesh.addNode(4.984648547496414, -2937.5104246126143, 4046.1101886343968, 525)
-    femmesh.addNode(1081.8819895280947, -2004.1588259258574, 4451.16600018447, 526)
-    femmesh.addNode(383.1805469878235, -1862.6425724740545, 4624.255109270827, 527)
-    femmesh.addNode(-659.4075711056805, -3574.0095646812756, 3433.895351744905, 528)
-    femmesh.addNode(-943.2472630618447, -4073.905654498197, 2741.090534618286, 529)
-    femmesh.addNode(-588.235943438776, -3045.990293775645, 3921.214302364926, 530)
-    femmesh.addNode(-563.1310049458612, -2413.5855117591123, 4342.520978497993, 531)
-    femmesh.addNode(-3650.989590672299, 3389.7425543425134, -424.17027722603467, 532)
-    femmesh.addNode(2606.4656300599086, 4148.32221903105, 998.879215125488, 533)
-    femmesh.addNode(3110.8074322058415, 3882.8915208790554, 496.01467399506765, 534)
-    femmesh.addNode(3630.2256135872803, 3339.5217520296574, 817.958716669502, 535)
-    femmesh.addNode(1783.349033832663, 4466.213637127564, 1368.4304772489872, 536)
-    femmesh.addNode(2255.6285609690804, 4116.535425001821, 1722.2879810431357, 537)
-    femmesh.addNode(1251.5557646840487, -3595.201697071106, -3241.625043903623, 538)
-    femmesh.addNode(518.9869189560476, -3323.280587483811, -3699.5214169951446, 539)
-    femmesh.addNode(1280.7172935378067, -3047.893735228483, -3751.014128577519, 540)
-    femmesh.addNode(2068.8203669011687, -2517.5178926122194, -3792.372074292321, 541)
-    femmesh.addNode(1334.0824772628005, -2251.3515796770744, -4260.474153019343, 542)
-    femmesh.addNode(1145.2804230590316, -4055.4103249607183, -2691.0926867649378, 543)
-    femmesh.addNode(2673.456466182995, -1995.2822636854476, -3724.443476768926, 544)
-    femmesh.addNode(-136.72479495780198, -3684.620360226484, -3377.111062942438, 545)
-    femmesh.addNode(-254.95423729135734, -4057.2211440401798, -2911.0058270708555, 546)
-    femmesh.addNode(386.18558847737773, -4230.4030993865645, -2637.148139174765, 547)
-    femmesh.addNode(-361.1504495097667, -4403.280721641954, -2341.0871917199497, 548)
-    femmesh.addNode(-882.0994266553923, -3844.8584284187364, -3072.2897433203843, 549)
-    femmesh.addNode(1035.588404446821, -4406.5090059183785, -2123.7313948179776, 550)
-    femmesh.addNode(-660.581579758251, 2868.243460028501, 4041.8821643496517, 551)
-    femmesh.addNode(558.5258368005942, 2062.3147050407083, 4520.4985285916255, 552)
-    femmesh.addNode(1116.2953249435805, 2591.530593078932, 4127.693536667307, 553)
-    femmesh.addNode(358.965809486915, 2807.1330797881064, 4122.031952809044, 554)
-    femmesh.addNode(-104.45674474796584, 3409.852515280762, 3655.406217167952, 555)
-    femmesh.addNode(-1660.1074878933111, -3715.7419358034053, -2904.7039427715376, 556)
-    femmesh.addNode(-1615.8895533088694, -4130.273092534032, -2308.6240777997245, 557)
-    femmesh.addNode(-3215.558558071535, -1994.0335154456636, -3268.6409253529696, 558)
-    femmesh.addNode(-1021.750429942536, -4521.9335792627835, -1873.0036742216798, 559)
-    femmesh.addNode(-1640.7878851570906, -4449.975310427646, -1582.8881364474564, 560)
-    femmesh.addNode(-1803.7969179768115, -4567.0265750512635, -942.6478353408994, 561)
-    femmesh.addNode(-379.81837020027575, -4717.593458446676, -1612.4670435328408, 562)
-    femmesh.addNode(-3828.777430843679, -879.9359348555749, -3092.9235579968545, 563)
-    femmesh.addNode(-3764.8469194607387, -152.30115581092332, -3286.7509840214, 564)
-    femmesh.addNode(-4179.179868083775, 1745.3717635046723, -2118.521427166569, 565)
-    femmesh.addNode(-3551.418258859636, -1432.9079980763772, -3214.6855242289475, 566)
-    femmesh.addNode(-1152.4447099750084, -4860.216219349288, 223.98547190551466, 567)
-    femmesh.addNode(-1383.9805478135518, -4769.843118043785, -577.2299996743488, 568)
-    femmesh.addNode(-808.582429173875, -4922.877128588826, -333.87906799965464, 569)
-    femmesh.addNode(-22.219872794815934, -4912.1904859688175, -932.6794233874868, 570)
-    femmesh.addNode(-1804.3529732710458, -4624.201934259514, 600.8883582151501, 571)
-    femmesh.addNode(-1230.254868206262, -4771.223193658986, 849.6482775509726, 572)
-    femmesh.addNode(-1232.7316256626282, -4533.969789477685, 1709.8218290789428, 573)
-    femmesh.addNode(-2139.95269784699, -4502.812700524525, -381.1564442226149, 574)
-    femmesh.addNode(637.6642164705326, -4758.22337035432, -1397.388530383373, 575)
-    femmesh.addNode(-2267.3803769064475, -4377.664066906741, 833.6927154132376, 576)
-    femmesh.addNode(-2195.2192963704906, -4487.287158876327, 212.7585359656836, 577)
-    femmesh.addNode(-3761.9446493851806, 3119.943602829288, -1055.3314029852484, 578)
-    femmesh.addNode(-3635.2655042892225, 2992.3525884549085, -1682.4597171082683, 579)
-    femmesh.addNode(-3989.9283605510263, 2355.811191999993, -1878.9958236563944, 580)
-    femmesh.addNode(1783.599274885103, 2105.4026986076824, 4169.6586315098775, 581)
-    femmesh.addNode(1592.5416136578915, 2855.544236639058, 3782.8135456780556, 582)
-    femmesh.addNode(2359.684097830354, 1714.9972731292817, 4060.8712503114, 583)
-    femmesh.addNode(2522.8158413677547, 2806.8978756314746, 3279.744585530926, 584)
-    femmesh.addNode(1866.5925373738585, 3313.7459878283576, 3245.754123092457, 585)
-    femmesh.addNode(2108.6297873198578, 3838.753613100186, 2411.9807457642924, 586)
-    femmesh.addNode(1170.7651271557484, 3889.357695834538, 2915.854202611756, 587)
-    femmesh.addNode(324.05017932158705, 3812.9984506695287, 3218.079286853172, 588)
-    femmesh.addNode(2867.299471183456, 1937.8533984270682, 3608.7834444249684, 589)
-    femmesh.addNode(3148.025917595673, 2384.117337386436, 3066.9068038855257, 590)
-    femmesh.addNode(-1306.14989281773, -4229.821624344415, 2324.3453882159174, 591)
-    femmesh.addNode(-1953.1863610853648, -4219.899800821803, 1837.7999646028456, 592)
-    femmesh.addNode(-2546.5015510339317, -4038.809729189019, 1484.3671452810815, 593)
-    femmesh.addNode(3381.121660843958, 2862.6781305496934, 2317.992716866106, 594)
-    femmesh.addNode(3737.136525008115, 1997.5323873045452, 2653.99226734361, 595)
-    femmesh.addNode(2925.3947581325983, 3510.0592652074247, 2030.1599601563005, 596)
-    femmesh.addNode(3530.511464641409, 3141.4372981321203, 1633.052509853844, 597)
-    femmesh.addNode(-437.8459337369105, -1796.5123925196588, 4645.517641967723, 598)
-    femmesh.addNode(3769.1235423823073, -1749.6145777406152, -2780.7474807355266, 599)
-    femmesh.addNode(3284.306599389441, -1690.8268391310812, -3369.6342177276397, 600)
-    femmesh.addNode(-1446.4864651544617, 198.5296258469049, 105.99917025600597, 601)
-    femmesh.addNode(-1285.20528212214, 338.465414331633, 232.59215453438333, 602)
-    femmesh.addNode(-1329.8475066263206, 145.2547888829638, 346.55687654260305, 603)
-    femmesh.addNode(-1070.8742350281982, 325.4841212342274, 372.87656085298585, 604)
-    femmesh.addNode(-566.3821690972056, -233.7871245433589, 85.5520725693046, 605)
-    femmesh.addNode(-724.0363172441653, -392.41680889084705, 140.90100744764564, 606)
-    femmesh.addNode(-666.8109473664662, -243.4599883883815, 282.33364882545857, 607)
-    femmesh.addNode(-1061.7873819076804, -208.22840217764994, 450.35902562681844, 608)
-    femmesh.addNode(-856.4620512499212, -181.17220812923318, 443.3660883177665, 609)
-    femmesh.addNode(-888.5992752119346, -375.67775413998345, 310.57382948508695, 610)
-    femmesh.addNode(-1164.3617831958343, 86.65717759983782, -464.1936425621485, 611)
-    femmesh.addNode(-1324.2038458674624, 164.86777420626984, -343.08961417247417, 612)
-    femmesh.addNode(-1328.0906679938485, -115.10354694347974, -359.31558142721906, 613)
-    femmesh.addNode(-1236.7201610538266, -364.5195688492209, -247.1619899511827, 614)
-    femmesh.addNode(-1408.1340364279724, -250.85433190745928, -143.17371432030657, 615)
-    femmesh.addNode(-1449.3457056528416, -28.89361967965594, -217.37892159350955, 616)
-    femmesh.addNode(-753.4002390157391, 351.8968356231452, -255.65049376232872, 617)
-    femmesh.addNode(-672.0278282262922, 181.67093646094017, -330.80194284109416, 618)
-    femmesh.addNode(-563.7835177359864, 228.94830617284526, -85.42747626960902, 619)
-    femmesh.addNode(-1422.7424006331034, 217.26205678449915, -155.1968472254826, 620)
-    femmesh.addNode(-1498.2649385797456, -36.58288101777748, -19.84297857080859, 621)
-    femmesh.addNode(-1215.1107457509816, 401.51751790418234, -206.1820794310727, 622)
-    femmesh.addNode(-1201.1774625283072, -457.73856394245587, 1.7423118463219605, 623)
-    femmesh.addNode(-1388.4650358673684, -296.1003017952067, 106.86218781847745, 624)
-    femmesh.addNode(-972.9215432635744, -438.1210728573349, -239.40902802340472, 625)
-    femmesh.addNode(-1120.5248581573728, 301.7617974000183, -380.0178629960117, 626)
-    femmesh.addNode(-971.0153137833081, 438.43456120251534, -238.6106106359853, 627)
-    femmesh.addNode(-702.2347283828449, -396.05419419502846, -66.9097771576662, 628)
-    femmesh.addNode(-702.9514599807992, -260.9333347115137, -306.0652866771899, 629)
-    femmesh.addNode(-918.2038334777442, -245.82178365922184, -427.6459257620281, 630)
-    femmesh.addNode(-1462.5370318283283, -30.111627839459118, 187.4907572556524, 631)
-    femmesh.addNode(-1123.8760460099213, -283.84576679596535, -392.5382858995518, 632)
-    femmesh.addNode(-602.1391213724796, 258.7336004184063, 157.3646887718649, 633)
-    femmesh.addNode(-769.4960114091756, 243.25511634193026, 371.07257998563443, 634)
-    femmesh.addNode(-860.1922148441287, 437.8147119434891, 196.90622442078703, 635)
-    femmesh.addNode(-915.2222960437819, 210.95484354368614, -445.3210020843063, 636)
-    femmesh.addNode(-1126.9631025418632, -397.6254089872169, 275.27151091366653, 637)
-    femmesh.addNode(-1291.2510638496528, -131.84769169148237, 384.43335443490486, 638)
-    femmesh.addNode(-1308.5511503839725, 392.17057967176555, 31.597848607753942, 639)
-    femmesh.addNode(-560.735533536822, -208.82548275379838, -115.92517524447662, 640)
-    femmesh.addNode(-932.2724857156072, -490.40957092212113, 70.08164208149232, 641)
-    femmesh.addNode(-1145.883358837323, 72.52025507348726, 472.71435161037493, 642)
-    femmesh.addNode(-773.7802650891754, 444.52201104278925, -34.99733183187776, 643)
-    femmesh.addNode(-925.6663314997661, 163.53876215890526, 466.61502226013937, 644)
-    femmesh.addNode(-1125.5772738455864, -130.63609745339394, -466.00918267310783, 645)
-    femmesh.addNode(-1049.2091493090127, 497.3778486376026, -13.918883177658634, 646)
-    femmesh.addNode(-1128.7118475483453, 450.64917852068174, 174.20843320380988, 647)
-    femmesh.addNode(-926.1081381253692, -93.26559209729409, 485.63517384909596, 648)
-    femmesh.addNode(-798.7259361872857, -92.66010227453607, 448.221883315382, 649)
-    femmesh.addNode(-832.8503184151524, 84.28188213713374, 463.6351456582065, 650)
-    femmesh.addNode(-962.1967793880991, 83.16947123995143, 491.582908129478, 651)
-    femmesh.addNode(-1031.6902704796682, -106.79873758720588, 487.4317966718058, 652)
-    femmesh.addNode(-958.217822953392, -199.02009087307374, 456.7770277828334, 653)
-    femmesh.addNode(-1108.6338818784277, -70.9897926379339, 482.86553930597177, 654)
-    femmesh.addNode(-1073.9576488978562, 36.7651773680973, 493.13141037921497, 655)
-    femmesh.addNode(-1036.8366227022407, 121.53255887319865, 483.6040739712862, 656)
-    femmesh.addNode(-826.210904977675, -128.7571998395719, -450.79810773870145, 657)
-    femmesh.addNode(-957.5368865529183, -127.61427253984263, -481.5718860570112, 658)
-    femmesh.addNode(-956.4024583394108, 108.48503970629604, -486.1380981995513, 659)
-    femmesh.addNode(-826.2434137510143, 109.48994820644768, -455.8734473259527, 660)
-    femmesh.addNode(-1041.438275351577, 154.96226127028777, -473.57107905560065, 661)
-    femmesh.addNode(-1083.6929193204603, 44.12578175037606, -490.9668121579473, 662)
-    femmesh.addNode(-1148.635803112218, -22.545572642554752, -476.8638119918571, 663)
-    femmesh.addNode(-1063.8837538592231, -66.4572819529752, -491.4288307255456, 664)
-    femmesh.addNode(-1022.5513274849209, -193.91069528124942, -460.3151962342871, 665)
-    femmesh.addNode(-703.579687445995, 93.17222938687581, -391.7319670086491, 666)
-    femmesh.addNode(-609.506489720829, 93.22303786747806, -298.0340310109061, 667)
-    femmesh.addNode(-713.83172444009, -136.4976541713645, -386.621401979743, 668)
-    femmesh.addNode(-617.4036796226387, -136.74487562583474, -291.4118985624617, 669)
-    femmesh.addNode(-785.6397794545871, 203.90884102573764, -403.0767673772112, 670)
-    femmesh.addNode(-804.4859599113837, -261.52599948603364, -378.6534190008827, 671)
-    femmesh.addNode(-516.2085980859072, 118.30941252109085, -44.14478840034236, 672)
-    femmesh.addNode(-547.0031638679643, 119.31589530644018, -174.80727553963015, 673)
-    femmesh.addNode(-515.4217126038411, -107.73567872587994, -59.807248002893566, 674)
-    femmesh.addNode(-549.7684921067425, -107.78662493717036, -188.87464833803804, 675)
-    femmesh.addNode(-602.8973707437011, 213.37398823125892, -216.28925767134393, 676)
-    femmesh.addNode(-620.4584515432252, -242.14293026518052, -217.52014692351068, 677)
-    femmesh.addNode(-516.8804933293434, -120.9778953837258, 44.27065735705439, 678)
-    femmesh.addNode(-547.8196601085915, -121.98271055291312, 175.08043449184885, 679)
-    femmesh.addNode(-567.6378632447415, 134.63734429647747, 211.98058453834622, 680)
-    femmesh.addNode(-526.2223943062734, 136.52692598226383, 83.03721349463271, 681)
-    femmesh.addNode(-554.2692872348786, -226.0167648315534, -15.50979409840923, 682)
-    femmesh.addNode(-569.5582403624041, 251.67768346113212, 37.12459033751599, 683)
-    femmesh.addNode(-694.5109027103279, -127.53046673812663, 374.7164147601448, 684)
-    femmesh.addNode(-602.6824411536456, -126.24733327986957, 276.0441418905593, 685)
-    femmesh.addNode(-751.7509801942867, 125.6760518715115, 415.4250283161713, 686)
-    femmesh.addNode(-647.3764530229626, 129.27705237129257, 330.0667778609703, 687)
-    femmesh.addNode(-606.8633927412393, -244.6813074196069, 188.61247528332453, 688)
-    femmesh.addNode(-673.5193800569049, 260.8191450579699, 274.56106492509446, 689)
-    femmesh.addNode(-753.3876137864356, -219.66357882475077, 375.4067701892899, 690)
-    femmesh.addNode(-844.4485361124844, 207.57731805550367, 427.45221851259026, 691)
-    femmesh.addNode(-1377.6666685418693, 277.17290594377755, 174.7657508872023, 692)
-    femmesh.addNode(-1315.8999299513998, 248.44563118315034, 297.459245280268, 693)
-    femmesh.addNode(-1403.4465556594532, 178.6584679451999, 235.18509425131012, 694)
-    femmesh.addNode(-1389.8079776715535, 304.9644783050985, 71.03807088957753, 695)
-    femmesh.addNode(-1303.605977380486, 373.59671899888195, 135.08849711248646, 696)
-    femmesh.addNode(-1411.6434775389907, 59.816829994207545, 277.4375501785052, 697)
-    femmesh.addNode(-1468.5875692884597, 86.81687610131372, 151.2895235379575, 698)
-    femmesh.addNode(-1482.3314772916456, 94.62167135158933, -91.6683441777503, 699)
-    femmesh.addNode(-1450.4654676717414, 215.47811185592954, -25.495994710597643, 700)
-    femmesh.addNode(-1490.8333056501021, 84.1373252154674, 44.76132895904806, 701)
-    femmesh.addNode(-1380.9078682218214, 317.4343409079777, -64.3788407710593, 702)
-    femmesh.addNode(-1491.4104385209419, -34.111480673331094, 85.74489955051887, 703)
-    femmesh.addNode(-1184.2017777040214, 343.46453212402804, 313.2121010808823, 704)
-    femmesh.addNode(-1211.2273600943797, 248.13462046560377, 379.22580670881297, 705)
-    femmesh.addNode(-1211.2794730813034, 402.7949157632861, 207.64691206404697, 706)
-    femmesh.addNode(-1102.8455725160716, 399.9370724232175, 281.9097840008175, 707)
-    femmesh.addNode(-1225.0347930355372, 433.7521600225961, 105.91697502848706, 708)
-    femmesh.addNode(-1112.9672103355126, 207.42730757891098, 440.6952705209984, 709)
-    femmesh.addNode(-1244.6958759286733, 112.01429002172154, 421.3985371764228, 710)
-    femmesh.addNode(-1323.7190115134495, 6.987831652494634, 380.9949760738999, 711)
-    femmesh.addNode(-1392.6140480070771, -84.35726753726712, 297.8893430808536, 712)
-    femmesh.addNode(-1226.7279550268481, -30.77128609250509, 444.57571049435074, 713)
-    femmesh.addNode(-963.909222433956, 399.631940522657, 298.31488043470756, 714)
-    femmesh.addNode(-807.3368503418347, 354.34211806716974, 295.5039325076188, 715)
-    femmesh.addNode(-915.9799786509798, 299.351980546828, 391.5725063831751, 716)
-    femmesh.addNode(-998.2196243038063, 251.67255376163374, 432.0390676148142, 717)
-    femmesh.addNode(-994.2383980790181, 461.3377831675353, 192.70250067232732, 718)
-    femmesh.addNode(-635.4005201851464, -321.7581405283982, 116.35685765113146, 719)
-    femmesh.addNode(-688.2542670901961, -325.42229016084565, 216.59854819227098, 720)
-    femmesh.addNode(-621.1962890267563, -326.21238861048886, 9.655364826801536, 721)
-    femmesh.addNode(-706.6583305083749, -403.1370538788965, 37.8309493630529, 722)
-    femmesh.addNode(-620.4145770319615, -311.52543263371706, -94.16374829280511, 723)
-    femmesh.addNode(-800.639903716613, -395.3058232982298, 232.35502593313407, 724)
-    femmesh.addNode(-769.8039521633415, -320.5720613350664, 306.99077030387934, 725)
-    femmesh.addNode(-822.9449115544356, -454.7946066292975, 108.68928850827902, 726)
-    femmesh.addNode(-906.9808291268329, -449.74887989854165, 197.66987347614628, 727)
-    femmesh.addNode(-809.4129082104232, -462.24866122535605, 1.653976589141833, 728)
-    femmesh.addNode(-868.7695729689065, -286.6401449676646, 388.0927753954627, 729)
-    femmesh.addNode(-974.1712990772236, -303.9814816521621, 396.14156184525507, 730)
-    femmesh.addNode(-1097.9033551652178, -314.25148934402216, 376.37871152930154, 731)
-    femmesh.addNode(-1008.0194805025309, -398.4924243167478, 301.8931527786454, 732)
-    femmesh.addNode(-1182.3407327385207, -175.64581106720286, 431.16169384457595, 733)
-    femmesh.addNode(-1221.5963829613163, -280.5484209156923, 349.55346741260223, 734)
-    femmesh.addNode(-1031.02430507146, -465.1033093667431, 180.87676498361154, 735)
-    femmesh.addNode(-1250.146504978532, 128.7812401576863, -413.33051935524145, 736)
-    femmesh.addNode(-1339.7850887020022, 25.92255800923222, -365.8881174375993, 737)
-    femmesh.addNode(-1256.501508903405, -14.816733355353325, -428.93757161497615, 738)
-    femmesh.addNode(-1146.551375584988, 199.810474858193, -434.27925169306815, 739)
-    femmesh.addNode(-1229.5453892904393, 240.84945653252615, -373.22975972380266, 740)
-    femmesh.addNode(-1233.0503514150387, -126.23706725031792, -423.9713864842363, 741)
-    femmesh.addNode(-1018.3830410186408, 263.6654931570302, -424.4320576030597, 742)
-    femmesh.addNode(-1400.852842986878, 70.46171290204626, -290.4344078862676, 743)
-    femmesh.addNode(-1397.2059976239227, -73.57070001146364, -294.6434244156952, 744)
-    femmesh.addNode(-1382.7241319389161, 195.7976340855689, -255.31456150814574, 745)
-    femmesh.addNode(-1450.9862925366754, 97.41169781873714, -192.67154712643818, 746)
-    femmesh.addNode(-1332.4425991828957, 322.50164680840817, -188.34703622405436, 747)
-    femmesh.addNode(-1282.15847646753, 296.3213189465591, -287.3678306548836, 748)
-    femmesh.addNode(-1172.0974318500673, 360.60704713012126, -300.5745024294408, 749)
-    femmesh.addNode(-1294.930987327261, -250.4479585213093, -316.6883843570452, 750)
-    femmesh.addNode(-1382.0337403648255, -189.8988942284916, -260.74629660583344, 751)
-    femmesh.addNode(-1331.3470902090012, -316.1991535490375, -200.56719847697, 752)
-    femmesh.addNode(-1184.0520594809411, -330.9324196536874, -326.5096828931414, 753)
-    femmesh.addNode(-1234.4954173683448, -206.98822044971564, -390.08688240993916, 754)
-    femmesh.addNode(-1441.3837418846197, -143.9989676682545, -185.59280619250427, 755)
-    femmesh.addNode(-1126.567300467153, -210.29926834014856, -435.6086961804775, 756)
-    femmesh.addNode(-1227.2724048880511, -426.7586148324269, -127.37479594766809, 757)
-    femmesh.addNode(-1322.3252796014785, -374.8450565428001, -74.81709507361082, 758)
-    femmesh.addNode(-1092.3054611531963, -474.9753539787041, -126.00839239550888, 759)
-    femmesh.addNode(-1108.9914797387742, -417.28811317822976, -252.96538882721737, 760)
-    femmesh.addNode(-1050.1882024464162, -374.3297553179931, -327.65588445619125, 761)
-    femmesh.addNode(-1483.9468678988562, -33.438994830162194, -121.14975309770689, 762)
-    femmesh.addNode(-1469.7556642560908, -148.9689006857761, -84.48599012730004, 763)
-    femmesh.addNode(-1466.1732911986212, -174.89880654486782, 45.74789658800096, 764)
-    femmesh.addNode(-1411.9010057673463, -282.8162516962, -18.775761618644985, 765)
-    femmesh.addNode(-1306.0865022137639, -391.3216945424373, 56.37716331085629, 766)
-    femmesh.addNode(-706.5995117291518, 272.46204683827403, -299.4671710139961, 767)
-    femmesh.addNode(-644.0483901063169, 302.79414903437106, -177.80369716247873, 768)
-    femmesh.addNode(-827.0670430521428, 293.73030908685917, -365.8096471185646, 769)
-    femmesh.addNode(-756.4619795752698, 410.2163109386803, -149.70574754318426, 770)
-    femmesh.addNode(-652.1935036980309, 353.5998565916614, -63.22802027981575, 771)
-    femmesh.addNode(-940.1221030234133, 341.8007639957218, -359.98177062957257, 772)
-    femmesh.addNode(-858.244495347995, 406.5317442157824, -254.23870249379627, 773)
-    femmesh.addNode(-866.9367798035607, 460.37229401235606, -142.6587899035832, 774)
-    femmesh.addNode(-670.901198763805, 370.8504537295429, 64.52844329047088, 775)
-    femmesh.addNode(-1270.8309405802734, 410.48488648955487, -90.29263307746493, 776)
-    femmesh.addNode(-1444.2769934876449, -170.30329400999327, 153.67088568406493, 777)
-    femmesh.addNode(-1047.2340882381259, 381.93614207353284, -319.20796400826066, 778)
-    femmesh.addNode(-1096.0893126992005, 433.6330881531289, -229.62837116474964, 779)
-    femmesh.addNode(-1010.4303863528763, 482.6276447435037, -130.23733554502746, 780)
-    femmesh.addNode(-1137.3152566898614, 466.9797858613557, -114.34334207587193, 781)
-    femmesh.addNode(-1186.5358634874196, 463.80966342817055, 9.217794945098905, 782)
-    femmesh.addNode(-1272.7251058240229, -367.06652933209995, 202.1958943632687, 783)
-    femmesh.addNode(-1171.422517049894, -446.8470553223016, 144.71361303646134, 784)
-    femmesh.addNode(-1069.4918944830893, -493.7327515625439, 37.401158212420164, 785)
-    femmesh.addNode(-950.0281209711752, -489.42509111915564, -89.25184305847515, 786)
-    femmesh.addNode(-1360.954219899311, -227.25610620488754, 260.89598181933104, 787)
-    femmesh.addNode(-690.6951901999983, -341.6353129231725, -193.94805386615974, 788)
-    femmesh.addNode(-828.3362035454777, -370.23245435495346, -288.8935283614495, 789)
-    femmesh.addNode(-828.334225230768, -440.82532926727094, -161.87615898977043, 790)
-    femmesh.addNode(-943.3863474759323, -355.6430513026768, -346.8615205063913, 791)
-    femmesh.addNode(-1021.529707444683, -270.9985756395688, -419.6382295485854, 792)
-    femmesh.addNode(-907.7719986953881, 490.75901981834727, -25.486864112549515, 793)
-    femmesh.addNode(-716.5883076668736, 367.159087548754, 186.74050733367858, 794)
-    femmesh.addNode(-811.1059336378391, 455.34327985822483, 83.55554548395862, 795)
-    femmesh.addNode(-952.6763616498805, 488.4920629430909, 95.58230848284873, 796)
-    femmesh.addNode(-1090.979735639942, 484.7727352805356, 81.96391176312947, 797)
-    femmesh.addNode(1278.190491101593, -227.92158885401324, 347.36407412816413, 798)
-    femmesh.addNode(1238.710468778837, -389.9529893577306, 202.37089263616363, 799)
-    femmesh.addNode(981.5103353915947, -362.65109369286284, 343.7183680661235, 800)
-    femmesh.addNode(820.583073076406, -261.5241279013747, -386.5419729585897, 801)
-    femmesh.addNode(784.1067193195732, -51.850987034218576, -447.9972840326376, 802)
-    femmesh.addNode(594.5700795606765, -143.3256128837881, -255.11634268319693, 803)
-    femmesh.addNode(1421.7197479730335, -243.0914687904864, 114.27594659789601, 804)
-    femmesh.addNode(1429.7417356106891, -217.58621426088436, -134.0831086972892, 805)
-    femmesh.addNode(1306.4322076488486, -227.0425802252615, -323.3434225094252, 806)
-    femmesh.addNode(1255.236818291046, -421.1956400059418, -86.30411014921991, 807)
-    femmesh.addNode(1049.792045563893, -225.33121196563738, -443.561266470214, 808)
-    femmesh.addNode(1026.410910905376, 499.2227947573855, -8.891849063814846, 809)
-    femmesh.addNode(943.7062403352734, 413.11407352511304, -275.9850990149604, 810)
-    femmesh.addNode(1211.3069648236005, 422.5423033995421, -163.72955889162768, 811)
-    femmesh.addNode(805.7281822296915, 460.6579363756161, -7.26129977199775, 812)
-    femmesh.addNode(769.6923339175148, 401.72662585050244, 188.61096740754226, 813)
-    femmesh.addNode(598.439289930649, 291.316510432974, 62.319233610127085, 814)
-    femmesh.addNode(1225.9288688187758, 434.5784684996919, 100.48731736259425, 815)
-    femmesh.addNode(1444.167419828696, 228.9421510412376, -17.343432166965883, 816)
-    femmesh.addNode(1363.3339194142181, 233.42062396225242, 251.99856212322962, 817)
-    femmesh.addNode(979.8115988935734, 457.76707000631023, 200.10431799090173, 818)
-    femmesh.addNode(569.7291731065989, -252.9125874646629, 30.03728726762956, 819)
-    femmesh.addNode(511.6075141695531, 72.55670245251844, -78.7927960766303, 820)
-    femmesh.addNode(533.1529425969652, 14.749287034953277, 178.42724995383426, 821)
-    femmesh.addNode(1339.0483513701208, 211.09899977840473, -300.8046338169679, 822)
-    femmesh.addNode(1119.0007766903684, 243.06413669371423, -420.42673630542157, 823)
-    femmesh.addNode(997.2731841333358, -491.2329620083632, 93.18122939583547, 824)
-    femmesh.addNode(957.2720407853886, -443.97382560018553, -225.96805898907604, 825)
-    femmesh.addNode(774.2446840669309, -445.5374254979136, -23.042131165568314, 826)
-    femmesh.addNode(704.2248971317554, -360.2653639211305, -180.90316769491545, 827)
-    femmesh.addNode(618.8197066341859, 85.12741192653716, -312.1776860831688, 828)
-    femmesh.addNode(779.3614428814109, -415.01879265094095, 170.5228103779149, 829)
-    femmesh.addNode(1156.872429842746, -365.44789486447763, -303.0492977955145, 830)
-    femmesh.addNode(670.4321248200862, 316.28405140580315, -203.34555435447328, 831)
-    femmesh.addNode(671.0145606302899, 236.13796343631344, 293.27025574863393, 832)
-    femmesh.addNode(662.8361919158133, -248.47641840117163, 273.0934565614775, 833)
-    femmesh.addNode(655.3919150200954, 7.248845500321488, 362.20535888552973, 834)
-    femmesh.addNode(824.005030827661, 229.27376045779272, -407.9942568119925, 835)
-    femmesh.addNode(1170.6787816190554, 319.9555309624957, 344.23423959789693, 836)
-    femmesh.addNode(1067.6576155383273, 195.5073842007416, 455.19150890877955, 837)
-    femmesh.addNode(908.4954887914857, 320.03657828731, 373.09986999011585, 838)
-    femmesh.addNode(827.9178408988704, 106.35457654729221, 457.24876661018965, 839)
-    femmesh.addNode(860.6546564023984, -130.1608797635759, 462.2131765720643, 840)
-    femmesh.addNode(1071.570667266708, -179.43317840608736, 461.173908709163, 841)
-    femmesh.addNode(1164.8719646594786, 101.47304821886857, 460.99940971165546, 842)
-    femmesh.addNode(1034.6131771901812, 100.02025163738716, 488.66949692731475, 843)
-    femmesh.addNode(1166.2647943471661, -92.77407283545149, 462.32995746567934, 844)
-    femmesh.addNode(1036.5009429468023, -91.51067690004014, 490.19738593477905, 845)
-    femmesh.addNode(912.0585862480813, 54.35178097143103, 489.19545342587503, 846)
-    femmesh.addNode(945.9910022807494, 156.12480929604553, 471.9195610351783, 847)
-    femmesh.addNode(839.6461507865467, -12.257852383598255, 473.4304469479873, 848)
-    femmesh.addNode(928.9724531605474, -66.34601304489426, 490.4623269355314, 849)
-    femmesh.addNode(965.2886501083395, -158.5611065855836, 472.9201810739883, 850)
-    femmesh.addNode(1157.2174253340045, -118.16855555988488, -459.69432631721384, 851)
-    femmesh.addNode(1025.6297824839135, -115.98619586948179, -485.6854091050641, 852)
-    femmesh.addNode(1062.0190611485536, 126.67656443832284, -479.69436527476057, 853)
-    femmesh.addNode(1191.979641419121, 126.45871974265009, -444.0180283295213, 854)
-    femmesh.addNode(889.1321607065693, -26.627076487038977, -486.82576041963864, 855)
-    femmesh.addNode(912.422715044128, -146.1449965105604, -470.0764396932549, 856)
-    femmesh.addNode(795.4668445537, 92.59996876658454, -446.7565714207316, 857)
-    femmesh.addNode(907.6517420808733, 120.304759075875, -476.4436631995415, 858)
-    femmesh.addNode(970.170046258876, 247.21497065979844, -433.583823662135, 859)
-    femmesh.addNode(1287.9954700028457, -117.51159207501802, -391.47111641324767, 860)
-    femmesh.addNode(1383.993876244746, -117.903253276051, -297.7373437670492, 861)
-    femmesh.addNode(1305.402642225847, 109.44804811625616, -380.4607087269498, 862)
-    femmesh.addNode(1397.309991639401, 108.63356140378308, -283.44932506575077, 863)
-    femmesh.addNode(1185.7269743463296, -235.8570898512468, -399.8461256121643, 864)
-    femmesh.addNode(1236.69367295176, 234.68561406513862, -372.69124987779645, 865)
-    femmesh.addNode(1445.1189933859064, -112.25877544805873, -198.15915084098398, 866)
-    femmesh.addNode(1482.1155814767576, -112.82886439513163, -69.52850822959485, 867)
-    femmesh.addNode(1464.0367150236748, 121.11259827822516, -141.4272450708634, 868)
-    femmesh.addNode(1485.8413886827407, 117.80704380804565, -8.924431188330049, 869)
-    femmesh.addNode(1377.870906899669, -228.22362478938467, -234.79257826178366, 870)
-    femmesh.addNode(1410.904814503978, 230.86234228263888, -166.91258889977425, 871)
-    femmesh.addNode(1444.9901930485094, -126.55810557160594, 189.64908121258244, 872)
-    femmesh.addNode(1480.031183355059, -126.60191526072283, 59.51485578457172, 873)
-    femmesh.addNode(1468.6078614520802, 122.30565779944442, 124.28997648866597, 874)
-    femmesh.addNode(1439.6686888976144, -237.8798769136232, -10.227813188177429, 875)
-    femmesh.addNode(1272.4048424461316, -117.54650177885783, 402.4654292376566, 876)
-    femmesh.addNode(1371.8327274502674, -119.1624374908049, 312.3151233740455, 877)
-    femmesh.addNode(1323.2725793875943, 123.03002459509726, 361.051869492766, 878)
-    femmesh.addNode(1410.5412532838834, 120.33553347229395, 258.7957471366883, 879)
-    femmesh.addNode(1363.8976473673665, -244.8893214975071, 240.0160879128445, 880)
-    femmesh.addNode(1420.7332504261758, 240.90535055418115, 122.26260286854615, 881)
-    femmesh.addNode(1180.1835366960072, -209.85355548718363, 416.5277642043879, 882)
-    femmesh.addNode(1274.392488576862, 284.34203900973455, 306.3631294140716, 883)
-    femmesh.addNode(1223.7836733594952, 170.203079306511, 413.4631535364576, 884)
-    femmesh.addNode(1121.5250772893298, 262.8288056382384, 407.6182951200786, 885)
-    femmesh.addNode(1265.0022802611945, -316.7689457945913, 281.8354598636421, 886)
-    femmesh.addNode(1115.2294708171976, -393.79644694089325, 285.7385648314152, 887)
-    femmesh.addNode(1137.3470645879936, -312.33410177767865, 365.4903455849308, 888)
-    femmesh.addNode(1341.1031760912851, -326.9588062510953, 163.54376256921697, 889)
-    femmesh.addNode(1027.3087927687404, -278.88823323928466, 414.0961038191308, 890)
-    femmesh.addNode(1123.0465494668372, -459.4678038762449, 154.10672881300738, 891)
-    femmesh.addNode(988.9428451407899, -445.0091638334078, 227.69405664336222, 892)
-    femmesh.addNode(1258.131496349909, -423.8974784169625, 60.65524201499557, 893)
-    femmesh.addNode(1356.7220488152495, -350.0458822035869, 14.739750383341955, 894)
-    femmesh.addNode(1133.3562952525776, -481.8743688521996, 3.6319636289001758, 895)
-    femmesh.addNode(884.8524492173949, -467.18373822582834, 135.94262130070942, 896)
-    femmesh.addNode(875.7769100957562, -403.9864283246329, 267.139644501052, 897)
-    femmesh.addNode(810.4816116622644, -325.65378958360367, 328.6828103380297, 898)
-    femmesh.addNode(713.5766305868733, -340.6951024130825, 227.79047531837415, 899)
-    femmesh.addNode(750.3925708603198, -198.33970079636816, 385.1720322223392, 900)
-    femmesh.addNode(917.601868394917, -257.2736321743278, 420.7384295447946, 901)
-    femmesh.addNode(797.3093185412234, -160.67942182293328, -427.9002349291533, 902)
-    femmesh.addNode(675.8494473579608, -101.82559191769566, -366.82143892154323, 903)
-    femmesh.addNode(694.7414649055661, -211.3097460688748, -334.91105978798, 904)
-    femmesh.addNode(933.2540267357637, -250.68978391687716, -427.43374608554166, 905)
-    femmesh.addNode(637.4940881458155, -260.3442647730901, -225.41146304153511, 906)
-    femmesh.addNode(754.2082809312973, -321.6188372537668, -293.509376955468, 907)
-    femmesh.addNode(884.3399579594113, -367.3184847063026, -318.9041948112865, 908)
-    femmesh.addNode(1003.7308007435929, -353.4843160708196, -353.6027706590497, 909)
-    femmesh.addNode(824.2038635733815, -417.66872479905624, -211.30204623288427, 910)
-    femmesh.addNode(595.1896577157202, -29.950327667205027, -291.9444547380738, 911)
-    femmesh.addNode(691.3381993425292, 17.20250514036436, -392.9783284505438, 912)
-    femmesh.addNode(710.7976062767066, 163.19025225340437, -373.80598849428225, 913)
-    femmesh.addNode(510.0298924632856, -96.19301342541328, -26.003805271512267, 914)
-    femmesh.addNode(561.0226942713687, -208.13619967539964, -118.2296385848907, 915)
-    femmesh.addNode(532.8992569872985, -36.98297381310947, -174.49686394007497, 916)
-    femmesh.addNode(622.7282318921272, -318.62272123752075, -78.39371467124475, 917)
-    femmesh.addNode(550.0848348231884, 81.58543604847607, -202.2873223133432, 918)
-    femmesh.addNode(1355.9478872764582, -331.94185447364225, -114.52382630712715, 919)
-    femmesh.addNode(1295.452293336366, -340.9899067784604, -215.4850942350743, 920)
-    femmesh.addNode(1236.6679195667598, -302.6593665494091, -319.97750497160274, 921)
-    femmesh.addNode(1212.5021989398851, -405.6290454504397, -200.76825678547522, 922)
-    femmesh.addNode(1106.0636806402829, -303.1977624237975, -383.17308427163636, 923)
-    femmesh.addNode(1112.5541139289912, -458.232108642077, -165.39318621725437, 924)
-    femmesh.addNode(975.9671419140284, -494.46272624704585, -70.20708001732156, 925)
-    femmesh.addNode(1058.6150093563494, -415.650985607836, -271.65886483122466, 926)
-    femmesh.addNode(984.3749157571426, 477.04087851792065, -148.95588932719002, 927)
-    femmesh.addNode(1080.9957395726708, 436.63768004964885, -229.7547094880464, 928)
-    femmesh.addNode(1122.8580084151274, 476.38918124629055, -89.21467233452891, 929)
-    femmesh.addNode(913.880524245808, 492.4578741745965, -8.28722265058982, 930)
-    femmesh.addNode(868.4138727397104, 458.8670002809403, -148.74867113964532, 931)
-    femmesh.addNode(1129.8548725010146, 480.5371714047208, 47.135326307294584, 932)
-    femmesh.addNode(1226.7168475007338, 444.43685622375403, -32.792558443574066, 933)
-    femmesh.addNode(1003.1880046018287, 490.2986401540384, 97.96468797357274, 934)
-    femmesh.addNode(888.6089178518703, 477.0318517281146, 100.16306332533306, 935)
-    femmesh.addNode(1106.7308686293977, 462.9172641693026, 155.93629537610005, 936)
-    femmesh.addNode(1174.7318888884322, 352.1039803691107, -309.01707722019114, 937)
-    femmesh.addNode(1032.6973304693818, 342.15111488334696, -363.13014080940565, 938)
-    femmesh.addNode(727.2854806092098, 404.4813015199844, -109.64336566409183, 939)
-    femmesh.addNode(797.8278176616176, 382.1681074102661, -251.14526944975734, 940)
-    femmesh.addNode(879.8508823518823, 332.26894747471636, -353.78176334065466, 941)
-    femmesh.addNode(737.4489009381432, 283.3214598475676, -317.4836543371236, 942)
-    femmesh.addNode(1348.0139907714877, 345.89559901076893, -96.13790517940464, 943)
-    femmesh.addNode(1353.9194012318962, 350.4463826339515, 43.91344134128022, 944)
-    femmesh.addNode(1286.863810333129, 330.2752844674873, -242.13093728616923, 945)
-    femmesh.addNode(782.9777683005847, 440.8046770868579, 92.696211392679, 946)
-    femmesh.addNode(674.5768229859041, 356.9292399007278, 129.2334073138254, 947)
-    femmesh.addNode(689.9921972159292, 391.24743130444006, 28.64628615841929, 948)
-    femmesh.addNode(871.6721820023887, 440.31410077519064, 199.13679666627976, 949)
-    femmesh.addNode(619.6196496214563, 316.11308771854164, -73.37100802732598, 950)
-    femmesh.addNode(713.3735953049402, 326.89270103151307, 246.95438069389573, 951)
-    femmesh.addNode(622.9184519777331, 272.25295714804395, 183.5424568465731, 952)
-    femmesh.addNode(942.5822486290683, 399.843961156636, 294.665927032761, 953)
-    femmesh.addNode(834.0401835472784, 372.2161475969408, 289.6765071438678, 954)
-    femmesh.addNode(782.008508049463, 288.3334499873716, 345.46133076736515, 955)
-    femmesh.addNode(504.7398743134688, 45.265269463602706, 51.657170705999484, 956)
-    femmesh.addNode(537.2582636780087, 189.2001996368499, -8.565624500568427, 957)
-    femmesh.addNode(543.7683494959689, 160.79647047383799, 126.47994371252597, 958)
-    femmesh.addNode(568.8631037189389, 204.95320281656205, -148.71167176912087, 959)
-    femmesh.addNode(584.8710729262182, 130.86994502860702, 246.05087155866804, 960)
-    femmesh.addNode(1307.559199585826, 348.6547433577622, 183.97610900401983, 961)
-    femmesh.addNode(1206.25379952091, 392.391584189017, 231.27519287814204, 962)
-    femmesh.addNode(1078.2868400027328, 404.5803101909545, 283.17122609505634, 963)
-    femmesh.addNode(1041.0405331945253, 331.7443566919702, 371.83511996332453, 964)
-    femmesh.addNode(528.4852351477971, -125.17587104687836, 109.5665452317773, 965)
-    femmesh.addNode(577.4055791068674, -122.84881457026769, 237.32282694397094, 966)
-    femmesh.addNode(602.5809563884109, -259.64626836836015, 156.9774477344922, 967)
-    femmesh.addNode(657.69732626892, -364.4386881817273, 3.6499469770905413, 968)
-    femmesh.addNode(734.2595001205854, -410.58858380036617, -103.91824467651742, 969)
-    femmesh.addNode(658.8382244813972, -350.0835310750912, 105.11976120116567, 970)
-    femmesh.addNode(772.387223011505, -438.7909476188322, 75.19925557711888, 971)
-    femmesh.addNode(631.9013652186262, 207.8922158048749, -266.99105168493594, 972)
-    femmesh.addNode(584.0008527228715, 11.277523424757614, 277.15974983771736, 973)
-    femmesh.addNode(653.1026006110432, 125.34302663793699, 337.5667637230004, 974)
-    femmesh.addNode(645.8713873220584, -125.29936566776955, 329.98938565664645, 975)
-    femmesh.addNode(860.44629906994, -462.35500904623007, -129.43187461589167, 976)
-    femmesh.addNode(881.8333631416684, -484.47992553359825, 36.2746149331774, 977)
-    femmesh.addNode(735.135748315689, 58.235056136843134, 420.0661928987486, 978)
-    femmesh.addNode(740.4385225178733, 177.41691934591253, 388.7815275152632, 979)
-    femmesh.addNode(864.1209212553338, 219.80488328844106, 428.04519532644633, 980)
-    femmesh.addNode(748.9446914394898, -63.76175240345345, 427.67472566663054, 981)
-    femmesh.addNode(987.7823576828981, 264.1321461516253, 424.3641579888054, 982)
-    femmesh.addNode(11.546874807291715, 2474.574032166084, -945.3410969064242, 983)
-    femmesh.addNode(-7.173653232338097, -2107.848207960751, -1582.018657074765, 984)
-    femmesh.addNode(-5.569095018281928, 1889.9621712144847, 1593.4143375364952, 985)
-    femmesh.addNode(25.44423247140901, -1507.6297566723988, 1960.109876375382, 986)
-    femmesh.addNode(-18.228594170749034, 657.0932822817131, -1916.878442651463, 987)
-    femmesh.addNode(-1645.1286666198496, -386.1673276656973, 2422.833524840137, 988)
-    femmesh.addNode(1643.7113389264389, -459.47760104280906, -2402.363422281663, 989)
-    femmesh.addNode(-0.5470510715847468, 428.7339546890401, 1369.1671782673625, 990)
-    femmesh.addNode(1570.6755820295598, 290.63935002304527, 2129.790266773233, 991)
-    femmesh.addNode(-24.314996577847865, 1317.2596854552862, 401.6587744462618, 992)
-    femmesh.addNode(-1488.0902918989163, -69.81074090792475, -2071.5256806724647, 993)
-    femmesh.addNode(-2888.456654321133, 488.70365499613973, -1126.6589464349413, 994)
-    femmesh.addNode(2251.5981183874956, 1654.6923558122642, 1061.8251149592365, 995)
-    femmesh.addNode(1.871563117998221, -1896.7883912848051, 325.44411439955206, 996)
-    femmesh.addNode(12.470875027186707, -529.8805094734762, -1221.70480770074, 997)
-    femmesh.addNode(-1735.1061769666462, 1691.4134992033921, 1279.6348199161816, 998)
-    femmesh.addNode(-1555.4168738805486, -2063.7576893826504, -693.6015254421577, 999)
-    femmesh.addNode(1501.0490918657893, -2002.322735979048, -742.3941764412432, 1000)
-    femmesh.addNode(1644.974152658268, -1459.6472119407326, 1455.5518119946755, 1001)
-    femmesh.addNode(-3068.8337122392254, -872.9784755992385, 4.771849226486836, 1002)
-    femmesh.addNode(-2813.7185297082387, 478.5335123920087, 985.3936457991314, 1003)
-    femmesh.addNode(2616.575172414138, 1423.3629183150779, -689.0895647582055, 1004)
-    femmesh.addNode(2769.2001547403047, -624.0709140066124, -1121.512422362166, 1005)
-    femmesh.addNode(3074.7628377430583, -406.774511624028, 555.9310268593485, 1006)
-    femmesh.addNode(-1416.1599880912152, 1697.2129946044709, -1200.383273806227, 1007)
-    femmesh.addNode(-2.85802097991143, -827.6405855918175, 468.21505229229683, 1008)
-    femmesh.addNode(-19.234546786948385, 721.1853491861558, -571.6080755255796, 1009)
-    femmesh.addNode(-1086.1446080592668, -1194.6988736237956, 1324.4058435121615, 1010)
-    femmesh.addNode(740.6848046981731, 1467.2941344312158, -392.7476407786946, 1011)
-    femmesh.addNode(-1108.77813083327, 367.637398446278, 1558.6976859253225, 1012)
-    femmesh.addNode(-1910.934735861659, -868.3414100784596, -1188.9560539069162, 1013)
-    femmesh.addNode(1904.0092736069773, 565.4985158482127, -1511.8344093490898, 1014)
-    femmesh.addNode(1143.4460979261312, 1040.310259692541, 1299.9839402131802, 1015)
-    femmesh.addNode(2180.0987444119055, -1342.8578076626663, 212.8939501900282, 1016)
-    femmesh.addNode(-1596.5068229437384, 1525.272011973184, 126.77601106852033, 1017)
-    femmesh.addNode(895.2055140359807, -1017.9032593816828, -1067.3707055888742, 1018)
-    femmesh.addNode(922.9091247516649, -362.3171362564778, 1532.3270509548843, 1019)
-    femmesh.addNode(25.299484298262087, -600.6934771840222, -315.7618058794411, 1020)
-    femmesh.addNode(-610.4251105087266, -1356.9098285875357, -280.4175939098505, 1021)
-    femmesh.addNode(-1650.1370420502963, 626.6605687213026, -1262.8047539251693, 1022)
-    femmesh.addNode(2117.213445301806, 323.9356097924166, 1117.2134453017936, 1023)
-    femmesh.addNode(0.8384940182872924, 334.5231236389862, 554.551754217952, 1024)
-    femmesh.addNode(795.6659853509082, -1191.999560262936, 598.9077911583556, 1025)
-    femmesh.addNode(912.0550769011485, 865.9525177477419, -1126.2087477883679, 1026)
-    femmesh.addNode(-2501.7563991516977, 388.8720142079624, -108.62831279239379, 1027)
-    femmesh.addNode(2501.788915637384, 335.76035842960505, -402.40312714705124, 1028)
-    femmesh.addNode(-1796.558479962285, -1240.8624684645974, 488.8261877819067, 1029)
-    femmesh.addNode(-637.1082847101625, 205.2017273529393, -1354.3303191074951, 1030)
-    femmesh.addNode(-911.093901317575, 880.8574612328686, -945.3654732536314, 1031)
-    femmesh.addNode(1248.2603284594009, 1294.2770753337381, 312.08206165627087, 1032)
-    femmesh.addNode(1353.4542982368673, -252.2937273452385, -1319.1093991735934, 1033)
-    femmesh.addNode(-989.5717305685283, -944.274206391963, -961.6214985029789, 1034)
-    femmesh.addNode(-82.56565864359385, -829.1900188673221, -3090.17725552916, 1035)
-    femmesh.addNode(507.38771057526117, 732.9290901687206, 695.1591686159645, 1036)
-    femmesh.addNode(896.0768152667679, 306.7190989680901, 1181.3531890126926, 1037)
-    femmesh.addNode(-322.64041540951916, -344.82580197149116, 931.1193893431034, 1038)
-    femmesh.addNode(-726.2616603785675, 982.3336602526206, 954.807896203469, 1039)
-    femmesh.addNode(363.0641207630583, 234.32151005435526, -1011.4461838683734, 1040)
-    femmesh.addNode(2275.378555950509, -411.1820703815484, -1.0317012746703114, 1041)
-    femmesh.addNode(1819.2321161041134, -976.6018427624999, -622.9740009413504, 1042)
-    femmesh.addNode(588.6589140058237, -1039.4221604851323, -379.01471186046723, 1043)
-    femmesh.addNode(-1271.8295726806055, -38.87933069860718, -1153.6839595463935, 1044)
-    femmesh.addNode(-1877.2877864910422, 57.64392204738762, -784.4699321944225, 1045)
-    femmesh.addNode(-665.1062236886555, -1019.0494618222407, 425.3423400604871, 1046)
-    femmesh.addNode(-2282.6813638023477, -428.2514447986737, 234.39911255764628, 1047)
-    femmesh.addNode(-756.8393115199633, 1216.9277163792106, 125.80353592988594, 1048)
-    femmesh.addNode(-1572.6029189919022, 685.7548894692927, 938.2979324930652, 1049)
-    femmesh.addNode(-11.050389485644132, -183.83530062718367, 264.9882494923909, 1050)
-    femmesh.addNode(1926.8839194632988, 832.2224344790892, 264.3337747559903, 1051)
-    femmesh.addNode(1325.479237859126, -741.2543781899797, 906.7117064555649, 1052)
-    femmesh.addNode(-1869.5872428738933, 733.5452427319567, 297.0056165744462, 1053)
-    femmesh.addNode(769.5299103752646, 2893.1590923292624, 492.9049532515098, 1054)
-    femmesh.addNode(1409.398802026793, -1133.471012670144, 146.110699416048, 1055)
-    femmesh.addNode(-21.483224864263775, 174.77646061999002, -262.19277967792885, 1056)
-    femmesh.addNode(1218.5298409902646, -1057.906399431302, 2978.6993788970426, 1057)
-    femmesh.addNode(1540.3263901911166, 2331.5917512314745, -1547.785958064084, 1058)
-    femmesh.addNode(355.9728279549771, -324.1618911284131, 876.4493465141829, 1059)
-    femmesh.addNode(-1398.0130060964816, -210.14574440063603, 1141.8685197392406, 1060)
-    femmesh.addNode(-887.0648288457691, -626.8152121388935, 890.7869572833663, 1061)
-    femmesh.addNode(-305.7097127460412, 92.6324047825141, -694.2902872539596, 1062)
-    femmesh.addNode(-303.6585808997798, 910.4017053895031, 3096.7306782604765, 1063)
-    femmesh.addNode(-220.80929020195282, 751.8128185312426, 30.863285903126368, 1064)
-    femmesh.addNode(369.0833878650916, 826.8176757089032, 132.68766546979023, 1065)
-    femmesh.addNode(-1206.6877358171653, 1059.3297463313384, -349.8218890181088, 1066)
-    femmesh.addNode(1505.5598939647607, 774.2070029287468, -723.1071338278713, 1067)
-    femmesh.addNode(1801.1099002658843, 163.78891601308308, -801.1099002658859, 1068)
-    femmesh.addNode(-726.0283787998035, 84.20036319151208, 1022.4760101511362, 1069)
-    femmesh.addNode(1092.633094662849, 1708.3355982110677, 2793.179350956094, 1070)
-    femmesh.addNode(-671.852095299449, 2627.3734628102175, 515.8967004900225, 1071)
-    femmesh.addNode(-1773.62037358014, -944.2125130533514, -243.15363564576023, 1072)
-    femmesh.addNode(575.7598676166591, 726.6885725957325, -627.3246424904462, 1073)
-    femmesh.addNode(1072.4138285763272, 785.8666868596858, 655.52019383102, 1074)
-    femmesh.addNode(1508.6051557039193, 373.2905605771184, 890.9052583639182, 1075)
-    femmesh.addNode(-1449.50947884037, -387.116515713305, -796.8498807374997, 1076)
-    femmesh.addNode(1272.4705764880382, -2576.0535597899775, 584.9071882588506, 1077)
-    femmesh.addNode(-1712.347362626091, 649.2507309909714, -554.6286190854485, 1078)
-    femmesh.addNode(-601.5099928467793, 506.86596882401705, -716.6278681304398, 1079)
-    femmesh.addNode(-1213.5444936282074, 1409.7868279418599, -2864.753296089737, 1080)
-    femmesh.addNode(-741.0249996143439, -198.3047166252649, -966.50785932944, 1081)
-    femmesh.addNode(370.74133951932765, -337.64259825276065, -778.4766153785381, 1082)
-    femmesh.addNode(1304.6398326458564, -1867.9876723325822, -2187.5250154679807, 1083)
-    femmesh.addNode(1717.3460853898387, -605.3118232474458, 481.1169896410505, 1084)
-    femmesh.addNode(-1323.6580858351906, -2859.788490227871, 897.2691130789914, 1085)
-    femmesh.addNode(5.633861186190931, -277.10418568446676, 2524.5695754900953, 1086)
-    femmesh.addNode(-1794.111412022613, 1128.5980287817115, 2724.427547865672, 1087)
-    femmesh.addNode(-1118.0857473829974, 371.4891606918596, -887.8149866809863, 1088)
-    femmesh.addNode(-1286.41650130193, -1785.5620717000475, -2032.9845308231725, 1089)
-    femmesh.addNode(-298.54057322943424, -667.392490136287, 85.27225232678892, 1090)
-    femmesh.addNode(-678.8883232115596, 873.8875483855381, -337.17950139445725, 1091)
-    femmesh.addNode(949.881071788785, -235.55247599972705, 996.2085553642639, 1092)
-    femmesh.addNode(234.93885729102382, 2167.2153961905833, -2563.4333279445136, 1093)
-    femmesh.addNode(1110.6598706453512, 962.7873028822821, -344.6604196615004, 1094)
-    femmesh.addNode(1198.2265248970198, 970.5282720452714, -2844.8830878372473, 1095)
-    femmesh.addNode(841.2494275763775, 914.6048051080029, 146.02151814658748, 1096)
-    femmesh.addNode(-2912.083801132843, -979.5048445845782, 1565.6449063668929, 1097)
-    femmesh.addNode(755.720189011171, -324.50458510618404, -1101.7015837625493, 1098)
-    femmesh.addNode(455.04393784687824, 255.03085262977908, 723.2908808989994, 1099)
-    femmesh.addNode(-1987.4865846039784, 115.2136078657287, 696.7198859328091, 1100)
-    femmesh.addNode(-683.128844191149, -459.15313533729545, 1819.9262361936267, 1101)
-    femmesh.addNode(-725.1696433502111, -623.6014770796614, -1822.5014607266871, 1102)
-    femmesh.addNode(3225.0912582902865, 561.7286741667515, -1484.8864101665974, 1103)
-    femmesh.addNode(363.3622564188754, -711.4859925536301, 129.00632402483853, 1104)
-    femmesh.addNode(1946.3622071780414, 2423.567192562309, -32.16272834960478, 1105)
-    femmesh.addNode(-1082.6318971686644, -1016.7277092737027, -160.92328760212843, 1106)
-    femmesh.addNode(-439.4069253767635, -3314.501773834293, -481.0237130952896, 1107)
-    femmesh.addNode(1259.2880924203387, 189.84980835108308, -967.6763347103199, 1108)
-    femmesh.addNode(2790.4205034404486, -653.7547885534915, 2102.760161955235, 1109)
-    femmesh.addNode(-1982.5674511036818, 166.02683129117537, -236.8673852262932, 1110)
-    femmesh.addNode(-2440.382193706462, 914.3652842213903, -2389.4174015900367, 1111)
-    femmesh.addNode(-158.46184025058497, 1615.5389459170738, -450.90034828758843, 1112)
-    femmesh.addNode(-479.0884476269407, 650.1557331055675, 455.02092598994034, 1113)
-    femmesh.addNode(1385.3530243416112, -256.2625705576505, 808.7819391551207, 1114)
-    femmesh.addNode(1959.8196347401113, 214.5903337229893, -257.1828960081497, 1115)
-    femmesh.addNode(3213.8039080390836, 906.7611739419542, 552.433700304024, 1116)
-    femmesh.addNode(-583.4520958927001, -806.5698535338485, -456.9535742976482, 1117)
-    femmesh.addNode(1004.2616273486318, -662.6141938991691, -663.9978107557808, 1118)
-    femmesh.addNode(-1137.5376399662593, 392.4849465210297, 891.1248029656792, 1119)
-    femmesh.addNode(167.23548359633094, 249.39679875434337, 125.80377437081378, 1120)
-    femmesh.addNode(78.19838399564804, -2909.893660118002, 1429.3551472887493, 1121)
-    femmesh.addNode(1889.0562245106782, 263.1466096477538, 262.44341107370644, 1122)
-    femmesh.addNode(-293.58114770215315, -270.4926872825742, -454.2398654427461, 1123)
-    femmesh.addNode(-3039.520121641104, 1820.6621368962385, -351.30625720635067, 1124)
-    femmesh.addNode(1803.7138403027025, -283.5034970879802, -509.4816736867136, 1125)
-    femmesh.addNode(1242.6171676671984, 2326.640454809682, 1590.1345132337428, 1126)
-    femmesh.addNode(-982.9123070158116, 940.8648310520023, -1947.0091470405523, 1127)
-    femmesh.addNode(644.7613754768709, -619.2224010665279, 601.8534666980004, 1128)
-    femmesh.addNode(-798.512186372475, -1358.515752520589, 3229.9768221254712, 1129)
-    femmesh.addNode(-2870.659101672799, -481.1221882975797, -2202.243350632215, 1130)
-    femmesh.addNode(175.70232979057045, -196.4583284225485, -147.30857596402763, 1131)
-    femmesh.addNode(1090.6656270858366, -2450.2014271291637, 2435.876267107619, 1132)
-    femmesh.addNode(1730.925346955522, -636.2370670047916, -41.72956055691351, 1133)
-    femmesh.addNode(-1131.5172503508682, -2321.1994400341664, 2215.947235755251, 1134)
-    femmesh.addNode(-1740.3630851979115, -290.02268444941006, -456.3297411792124, 1135)
-    femmesh.addNode(1837.6859946454897, -409.89560167477276, 1592.69279564461, 1136)
-    femmesh.addNode(-1628.6723313915213, -632.8551875878411, 594.6721801954752, 1137)
-    femmesh.addNode(590.9508841010603, -246.42111001942305, -2124.8719168974626, 1138)
-    femmesh.addNode(-1004.6560996499583, 832.0652825656321, 525.5739694199492, 1139)
-    femmesh.addNode(68.00902907457699, -999.2327127926757, 1289.8425041025791, 1140)
-    femmesh.addNode(1200.6585591982764, -801.8838907687868, -297.31167707972463, 1141)
-    femmesh.addNode(2707.887416465798, -1801.7378731178958, -792.1099766177043, 1142)
-    femmesh.addNode(3705.896151708962, -53.07647422583557, -485.48083304519025, 1143)
-    femmesh.addNode(654.9331172796979, 661.9115623148582, 2073.1615537458997, 1144)
-    femmesh.addNode(960.3120093497474, 303.84032581189206, 3436.899853326623, 1145)
-    femmesh.addNode(-405.14575482895833, 199.14331234497902, 594.854245171035, 1146)
-    femmesh.addNode(-921.4168607424326, 1383.6498505921704, 1975.6300815611903, 1147)
-    femmesh.addNode(-1077.911187359371, 2845.398375290093, 1913.2758286679577, 1148)
-    femmesh.addNode(262.6705537991738, 544.2419458836116, -224.38996374039098, 1149)
-    femmesh.addNode(-1340.535834773649, 870.752450560253, 72.37431844524585, 1150)
-    femmesh.addNode(-1355.1923051858198, 3182.389359445513, -760.144044855806, 1151)
-    femmesh.addNode(-2138.8358043186145, 2868.597743052468, 464.71810740639364, 1152)
-    femmesh.addNode(-2744.7391878631456, -2294.3763092051386, 126.49124996892522, 1153)
-    femmesh.addNode(1647.207439631805, 569.8535309396411, -275.8819388634652, 1154)
-    femmesh.addNode(1642.4200290972233, 1717.827065522225, -608.2609713746626, 1155)
-    femmesh.addNode(345.9169666393339, -1208.812825985925, -1902.539430586739, 1156)
-    femmesh.addNode(-364.59244229616047, 467.2336488575532, -370.3271664429249, 1157)
-    femmesh.addNode(759.6867017701989, -825.6542423288832, 136.53021903864686, 1158)
-    femmesh.addNode(1147.4684135969455, -809.384086042199, 424.6741254831403, 1159)
-    femmesh.addNode(-110.63868425685126, 601.3905794260704, -3371.04194898637, 1160)
-    femmesh.addNode(114.45691029125138, 1302.8732777165167, -1273.3834957355161, 1161)
-    femmesh.addNode(327.99029484727686, -172.86321267451785, 439.928486945825, 1162)
-    femmesh.addNode(2578.245351133792, 1614.7997154063964, -2022.6859809989485, 1163)
-    femmesh.addNode(-219.49560101397486, 251.91949764853103, 92.39680776585126, 1164)
-    femmesh.addNode(-20.669631998003233, -1173.2652876931393, -815.6957691286917, 1165)
-    femmesh.addNode(479.24231346029023, -2049.2300435981724, -580.8011145119176, 1166)
-    femmesh.addNode(935.5851481711538, -3223.3765134837304, -1354.2421221880406, 1167)
-    femmesh.addNode(-198.23328907126856, 2350.6721745835057, 2955.76244320206, 1168)
-    femmesh.addNode(-942.4331598951942, -218.49843940104557, 844.8802045004611, 1169)
-    femmesh.addNode(650.7385117933253, 1546.7959616095345, 845.7588198975999, 1170)
-    femmesh.addNode(2807.2383077873037, 971.1926417792786, 2165.270222685851, 1171)
-    femmesh.addNode(5.962486116153265, -1244.4918959935317, -52.18670110778237, 1172)
-    femmesh.addNode(-333.1776112944775, -203.5878759791168, 525.7415399620143, 1173)
-    femmesh.addNode(-2091.763463902471, 263.95607312622184, 1675.2936504867655, 1174)
-    femmesh.addNode(446.83586702006903, -1876.2639093373073, 1177.966929852492, 1175)
-    femmesh.addNode(-229.12139695024194, -220.9988975163088, -5.775464949996731, 1176)
-    femmesh.addNode(222.41691834561007, 3241.3741170669127, 1705.4463832434085, 1177)
-    femmesh.addNode(2587.534468241592, 441.60265446397165, -2642.192176341392, 1178)
-    femmesh.addNode(-1190.6439081712933, -742.2731703538032, -559.8921157653788, 1179)
-    femmesh.addNode(-1848.3175277203072, -357.96155959380206, 1.956678931959999, 1180)
-    femmesh.addNode(-1062.7675208390683, -368.3404112075319, -766.6509220186754, 1181)
-    femmesh.addNode(213.01505852672489, -2075.130237955582, -2863.2910038988502, 1182)
-    femmesh.addNode(946.4728348144229, 527.0569559569619, -685.4603944397236, 1183)
-    femmesh.addNode(146.28536981920072, -296.72588972938064, 1633.3745023275417, 1184)
-    femmesh.addNode(-576.7103860961856, -609.5155951542555, 470.67352862331904, 1185)
-    femmesh.addNode(719.1522020537286, 91.87273187260065, -738.3381882718359, 1186)
-    femmesh.addNode(595.2438650960952, -609.7235112048436, -521.796158798495, 1187)
-    femmesh.addNode(260.2729651417405, -12.309823941609721, -523.8762061403434, 1188)
-    femmesh.addNode(875.3329739971881, 353.1812183865169, 777.4682333877267, 1189)
-    femmesh.addNode(-1023.3420456260986, -1989.3315918251055, 426.2105882721283, 1190)
-    femmesh.addNode(2594.8578212005973, -1421.516290304612, -2216.2779247925755, 1191)
-    femmesh.addNode(1380.8414824244987, -300.11935699438595, -817.2899403503197, 1192)
-    femmesh.addNode(-2651.3225584506195, -2025.0167365058046, -1631.2510907450182, 1193)
-    femmesh.addNode(352.4245011153989, 2133.2349795383107, 138.84839968586545, 1194)
-    femmesh.addNode(-662.889749669684, -751.4293100263417, 48.519026705997206, 1195)
-    femmesh.addNode(447.3339194923957, 517.2177038328252, 297.24575861206955, 1196)
-    femmesh.addNode(1831.9857064968085, -163.11771797809845, 222.9298981700534, 1197)
-    femmesh.addNode(-1874.5701955979923, -1007.5412428508084, -3057.207374982706, 1198)
-    femmesh.addNode(-80.63423737850692, 859.9726717993947, 906.4012448474978, 1199)
-    femmesh.addNode(-2740.107634025712, 1307.5231504508683, 1922.2700275364014, 1200)
-    femmesh.addNode(-883.2927212616991, 2711.849513104261, -1967.6107279938021, 1201)
-    femmesh.addNode(822.0112690676019, -1098.1112144159822, 1355.9822285036028, 1202)
-    femmesh.addNode(-3907.2259768027216, 251.0271048133809, -175.630959232585, 1203)
-    femmesh.addNode(1051.3825529732107, 3423.685671844446, -789.8114077070096, 1204)
-    femmesh.addNode(-1189.4652479426313, -27.09889861509079, -804.1178716773575, 1205)
-    femmesh.addNode(-1842.6582945090893, 109.6886109126086, 141.78394114376331, 1206)
-    femmesh.addNode(-106.5828512572873, 3541.015722085549, -213.68917469186022, 1207)
-    femmesh.addNode(798.9646261036828, 662.5761081725452, 444.6349714298516, 1208)
-    femmesh.addNode(-641.0996429778589, -1752.1262430283002, -1073.8360697039852, 1209)
-    femmesh.addNode(-986.6212316135927, -2865.0319112657016, -1499.8149182572683, 1210)
-    femmesh.addNode(798.9503357924661, -11.438903998877604, 780.8074262573189, 1211)
-    femmesh.addNode(1502.164263926855, 663.8931112747199, 426.02383260172894, 1212)
-    femmesh.addNode(1737.3670939808567, -1143.0260896460572, -1622.0603571245083, 1213)
-    femmesh.addNode(3192.5662608601356, -1709.7260145024293, 1188.8117063248571, 1214)
-    femmesh.addNode(-2099.032158676583, 2206.446262084382, -2240.7917351462465, 1215)
-    femmesh.addNode(563.3061612337757, -855.8198042318608, 2145.127061161258, 1216)
-    femmesh.addNode(492.28082413953325, 366.0124318621267, -536.6208343410892, 1217)
-    femmesh.addNode(-2331.710889880404, 1322.2466946917248, -987.685898496181, 1218)
-    femmesh.addNode(-2589.5376627016517, 1509.6456713111716, 606.3758113607021, 1219)
-    femmesh.addNode(-2001.7163427794096, -1994.41721307079, 1425.9480243432163, 1220)
-    femmesh.addNode(938.4248436595764, 2411.9815605849694, -607.050448412152, 1221)
-    femmesh.addNode(1218.2375601317353, 111.1462004414574, 814.4736625314945, 1222)
-    femmesh.addNode(-1157.9692166513162, -829.3096371379277, 225.11674528510642, 1223)
-    femmesh.addNode(-980.9185045884174, 1905.7249806517334, -367.1505858168733, 1224)
-    femmesh.addNode(-886.9605441422572, -139.36102418733535, 3358.1751287799652, 1225)
-    femmesh.addNode(-2566.551741430636, -341.8183506723843, -543.2749047101747, 1226)
-    femmesh.addNode(-1378.7974177985186, 188.90793083408204, -3375.1764465913284, 1227)
-    femmesh.addNode(-1718.6102625351614, 500.57839581841995, -29.424944089622116, 1228)
-    femmesh.addNode(2999.4225255594224, 2008.6385920448513, 242.16705941133137, 1229)
-    femmesh.addNode(-944.5988777269222, 548.8992615594541, -589.0969118277582, 1230)
-    femmesh.addNode(-656.7893084773813, 147.91690984451543, -2225.199691331842, 1231)
-    femmesh.addNode(-1447.8441531425353, 42.048778698971894, -618.2535317605801, 1232)
-    femmesh.addNode(-543.5125132822093, -2053.6549671099747, 1319.466253605535, 1233)
-    femmesh.addNode(2568.5696535097713, -2622.6621654349055, 255.4061302017723, 1234)
-    femmesh.addNode(214.49657403288265, -717.7700389619115, 3727.0885336785395, 1235)
-    femmesh.addNode(-3344.821306864343, -1071.861184246002, -1202.5136662355603, 1236)
-    femmesh.addNode(-165.99019155369945, 482.7424800300686, -1120.723933825741, 1237)
-    femmesh.addNode(890.3402533740785, -120.17288963040772, -3303.510893255726, 1238)
-    femmesh.addNode(-548.0294363170577, -2284.0263060627253, -316.7505234738203, 1239)
-    femmesh.addNode(910.8527192936554, -396.0791351969061, 686.1951908295911, 1240)
-    femmesh.addNode(-1013.7736828189453, 1812.7253415577727, 752.140202672651, 1241)
-    femmesh.addNode(-860.4879729723449, 497.2224169624815, 642.9016754589259, 1242)
-    femmesh.addNode(-790.6292889929672, 118.39132651855098, -781.3821310950677, 1243)
-    femmesh.addNode(890.8856764154664, 1762.585651109082, -1233.015053316049, 1244)
-    femmesh.addNode(727.6940236218768, 1215.7893914188955, -1971.9004652126966, 1245)
-    femmesh.addNode(-1659.1332273001253, 392.01592838225633, 406.41058374133195, 1246)
-    femmesh.addNode(-1363.930256361401, -32.44547775883612, 744.2126981409218, 1247)
-    femmesh.addNode(-1271.9481824669024, -68.81274466357439, 807.2914356748078, 1248)
-    femmesh.addNode(-1344.6320349730672, -170.9967180460592, 763.1509370870727, 1249)
-    femmesh.addNode(-1448.5949293976885, 6.577579509657976, -417.8162266770448, 1250)
-    femmesh.addNode(-1386.0239995049988, 103.45827645262086, -480.67157296652715, 1251)
-    femmesh.addNode(-1435.2932768878195, 129.65541774173553, -386.7251894930314, 1252)
-    femmesh.addNode(2396.0544615664485, -506.0431674357369, 518.5240082501996, 1253)
-    femmesh.addNode(1948.722414900872, -974.0848154550561, 347.0054699155394, 1254)
-    femmesh.addNode(2627.430791077482, -874.8161596433472, 384.41248852468834, 1255)
-    femmesh.addNode(2456.224416194274, -408.33505664940037, 1074.3119112519794, 1256)
-    femmesh.addNode(2008.8923695286976, -876.3767046687195, 902.7933729173191, 1257)
-    femmesh.addNode(1777.5160400176642, -507.60371246110924, 1036.9048926428302, 1258)
-    femmesh.addNode(2183.6326360490516, -2598.0468683234967, -2159.5996719262475, 1259)
-    femmesh.addNode(1402.8444622558227, -1935.1552041558152, -1464.9595959546118, 1260)
-    femmesh.addNode(2281.837265659018, -2665.2144001467295, -1437.0342524128791, 1261)
-    femmesh.addNode(2885.2564279590224, -2564.9219687161535, -1461.8921525011096, 1262)
-    femmesh.addNode(2104.468254165794, -1902.030304548472, -767.2520765294737, 1263)
-    femmesh.addNode(2006.2636245558274, -1834.862772725239, -1489.8174960428425, 1264)
-    femmesh.addNode(-2188.2734731100245, 209.4464570441075, -1599.092313553703, 1265)
-    femmesh.addNode(-1569.1136669746063, 278.42491390668897, -1667.165217298817, 1266)
-    femmesh.addNode(-2269.2968481857147, 557.6821118587212, -1194.7318501800553, 1267)
-    femmesh.addNode(-2382.8722204060878, 273.1737885217637, -955.564439314682, 1268)
-    femmesh.addNode(-1763.7124142706693, 342.1522453843451, -1023.637343059796, 1269)
-    femmesh.addNode(-1682.6890391949792, -6.083409430268567, -1427.9978064334437, 1270)
-    femmesh.addNode(1160.983417734476, 692.6648031409121, -254.19498927656403, 1271)
-    femmesh.addNode(1168.2943697320634, 698.682885690987, -122.08655114945307, 1272)
-    femmesh.addNode(1068.5353907753638, 731.0050488198337, -176.77613436265761, 1273)
-    femmesh.addNode(1681.1601190240533, -1032.4795175940892, 968.3344008178631, 1274)
-    femmesh.addNode(1912.5364485350867, -1401.2525098016995, 834.2228810923518, 1275)
-    femmesh.addNode(1741.3300736518788, -934.7714068077527, 1524.1223038196426, 1276)
-    femmesh.addNode(-1928.0503115282186, -3553.8551841882727, 80.56713309025247, 1277)
-    femmesh.addNode(-1439.5374798578696, -2461.7730898052605, 101.83379381841684, 1278)
-    femmesh.addNode(-2043.9297055508978, -3155.839783765662, -714.8681861703221, 1279)
-    femmesh.addNode(-2638.590862542196, -3271.1490936769064, -304.8217984647806, 1280)
-    femmesh.addNode(-2150.078030871847, -2179.0669992938947, -283.55513773661625, 1281)
-    femmesh.addNode(-2034.198636849168, -2577.082399716505, 511.8801815239583, 1282)
-    femmesh.addNode(278.26266041485536, 723.9369608909442, -599.4663590080129, 1283)
-    femmesh.addNode(472.42162774087535, 776.7531241523178, -247.318488510328, 1284)
-    femmesh.addNode(174.9244205390716, 774.0015124475294, -219.4602050278947, 1285)
-    femmesh.addNode(121.7180035061127, 632.7136475348836, -397.99901963298527, 1286)
-    femmesh.addNode(315.87697083213266, 685.5298107962574, -45.851149135300375, 1287)
-    femmesh.addNode(419.2152107079164, 635.465259239672, -425.8573031154186, 1288)
-    femmesh.addNode(690.7440249231753, 593.6732544856743, -317.292971131222, 1289)
-    femmesh.addNode(623.0959962183726, 521.4863120007678, -415.33509842245974, 1290)
-    femmesh.addNode(759.7330539759662, 569.9013230604228, -451.6548707527033, 1291)
-    femmesh.addNode(1227.9476887446613, -611.5397653873644, -191.80789361447228, 1292)
-    femmesh.addNode(1253.5453834235625, -514.4632354970241, -310.3275497945749, 1293)
-    femmesh.addNode(1178.7654945205113, -583.6658928166322, -300.1804874376196, 1294)
-    femmesh.addNode(558.0549297786229, -1978.9155919007812, 2197.9930717415004, 1295)
-    femmesh.addNode(146.07672035668082, -1904.3585898248764, 2832.926544616545, 1296)
-    femmesh.addNode(-386.533976950533, -1433.072754596494, 2595.0433492504267, 1297)
-    femmesh.addNode(-553.0365089397296, -1914.4145983532826, 2088.0285560653165, 1298)
-    femmesh.addNode(-965.0147183616716, -1839.8575962773778, 2722.962028940361, 1299)
-    femmesh.addNode(-20.425811632515774, -2385.700433581665, 2325.911751431435, 1300)
-    femmesh.addNode(-152.10281598568227, 669.5678300392716, 2232.9489282639197, 1301)
-    femmesh.addNode(-706.2183558665249, 639.0195519178906, 2327.7141820928996, 1302)
-    femmesh.addNode(-554.6625909524274, 398.185676567659, 1463.9324320963424, 1303)
-    femmesh.addNode(2.543405057303092, 75.81488450228667, 1946.868376878729, 1304)
-    femmesh.addNode(-551.5721348235396, 45.266606380905614, 2041.633630707709, 1305)
-    femmesh.addNode(-149.01235985679443, 316.6487598525182, 2810.650126875286, 1306)
-    femmesh.addNode(-2.878859571781163, 63.60638640411844, -1569.2916251761017, 1307)
-    femmesh.addNode(-327.66843944045576, 431.1475048173262, -1635.604380879479, 1308)
-    femmesh.addNode(-312.3187048414879, -162.33939106026844, -1288.0175634041175, 1309)
-    femmesh.addNode(-76.75965826325637, -23.56901472170381, -1171.2143707632404, 1310)
-    femmesh.addNode(-401.54923813193096, 343.97210369150395, -1237.527126466618, 1311)
-    femmesh.addNode(-92.10939286222424, 569.9178811558909, -1518.801188238602, 1312)
-    femmesh.addNode(1843.1357788776643, -3273.6032140459447, 1214.8837702688677, 1313)
-    femmesh.addNode(1458.722364573153, -2017.850385865355, 1020.229500126763, 1314)
-    femmesh.addNode(2029.3875669627791, -2715.400040121322, 1650.2060821367802, 1315)
-    femmesh.addNode(2491.185317388531, -3296.9075168684085, 1050.1332412403285, 1316)
-    femmesh.addNode(2106.77190308402, -2041.154688687819, 855.478971098224, 1317)
-    femmesh.addNode(1920.5201149989048, -2599.3578626124417, 420.15665923031145, 1318)
-    femmesh.addNode(933.8301692408768, 706.9137999326942, 68.56483454138632, 1319)
-    femmesh.addNode(975.9546491108644, 938.6960539951425, -99.31945075745645, 1320)
-    femmesh.addNode(1033.5891481975766, 674.5916368038475, 123.25441775459086, 1321)
-    femmesh.addNode(1762.7676370727522, 1376.3448537864915, 3517.3390406392996, 1322)
-    femmesh.addNode(1331.6543383462044, 999.4874741170565, 2461.484808864663, 1323)
-    femmesh.addNode(2001.7888807561076, 667.4967296924804, 3185.6444985478693, 1324)
-    femmesh.addNode(1696.6070944162013, 674.0972175869038, 3839.199291824564, 1325)
-    femmesh.addNode(1265.4937956896536, 297.23983791746866, 2783.345060049928, 1326)
-    femmesh.addNode(1026.4725520062982, 1006.0879620114799, 3115.0396021413585, 1327)
-    femmesh.addNode(-1015.0974957878514, 875.6436245192242, 1767.1638837432565, 1328)
-    femmesh.addNode(-460.9819559070087, 906.1919026406052, 1672.3986299142764, 1329)
-    femmesh.addNode(-612.5377208211062, 1147.0257779908368, 2536.1803799108334, 1330)
-    femmesh.addNode(1085.6715846607435, 527.9011630494125, -1046.9425412493438, 1331)
-    femmesh.addNode(811.1761065916985, 212.08565920271917, -989.5612592893467, 1332)
-    femmesh.addNode(637.5595988321033, 550.1370139010486, -1068.8274658283706, 1333)
-    femmesh.addNode(751.5029805011044, 309.76570386415943, -1625.5403323429152, 1334)
-    femmesh.addNode(477.0075024320593, -6.049799982533898, -1568.159050382918, 1335)
-    femmesh.addNode(925.1194882606994, -28.285650834169985, -1546.2741258038914, 1336)
-    femmesh.addNode(-997.4118996286561, -2689.129731608472, -587.3126192687237, 1337)
-    femmesh.addNode(-1485.924731299005, -3781.2118259914837, -608.5792799968881, 1338)
-    femmesh.addNode(-881.5325056059771, -3087.145132031082, 208.12269999185088, 1339)
-    femmesh.addNode(2188.956944908432, 630.915995901162, 2147.5302447295417, 1340)
-    femmesh.addNode(2620.0702436349793, 1007.7733755705971, 3203.384476504178, 1341)
-    femmesh.addNode(1949.9357012250764, 1339.7641199951731, 2479.2247868209724, 1342)
-    femmesh.addNode(1218.3171200184715, -2612.849624731389, -1048.318149314642, 1343)
-    femmesh.addNode(1999.1052938117002, -3275.7412888990707, -1742.9582252862779, 1344)
-    femmesh.addNode(1120.112490408505, -2545.6820929081564, -1770.8835688280105, 1345)
-    femmesh.addNode(-808.5157631820459, 827.3712141613498, 161.3548801753365, 1346)
-    femmesh.addNode(-903.024230414488, 857.1527825084065, 55.942326376113655, 1347)
-    femmesh.addNode(-765.3097883045693, 830.7248637109999, 45.40310204900409, 1348)
-    femmesh.addNode(2921.9814962416813, -515.4227128153202, -282.79069775140874, 1349)
-    femmesh.addNode(2675.070696846784, -408.9782910027882, 277.4496627923391, 1350)
-    femmesh.addNode(2522.289355345407, -517.6264921940804, -561.2720618184181, 1351)
-    femmesh.addNode(2738.543785603051, -1212.904393562254, -956.8111994899352, 1352)
-    femmesh.addNode(2491.632986208154, -1106.4599717497222, -396.57083894618734, 1353)
-    femmesh.addNode(2891.3251271044282, -1104.2561923709618, -118.08947487917789, 1354)
-    femmesh.addNode(910.5305132349754, 686.1859375571565, 173.0629180687446, 1355)
-    femmesh.addNode(-1664.5186237303442, -1503.9851012180009, -468.37758054395897, 1356)
-    femmesh.addNode(-1842.2775547208994, -906.2769615659055, -716.0548447763382, 1357)
-    femmesh.addNode(-1733.1758048711038, -1466.049549730555, -941.2787896745369, 1358)
-    femmesh.addNode(-2103.369716165584, -2044.3872129442275, -1162.426308093588, 1359)
-    femmesh.addNode(-2281.1286471561393, -1446.6790732921322, -1410.1035723259672, 1360)
-    femmesh.addNode(-2212.4714660153795, -1484.614624779578, -937.2023631953892, 1361)
-    femmesh.addNode(-1037.7651673390783, 578.7747018999297, 449.22526513646756, 1362)
-    femmesh.addNode(-1144.9306908860492, 585.2653484486325, 379.08306197716627, 1363)
-    femmesh.addNode(-1066.6839735991518, 641.3572305431569, 349.8912013118795, 1364)
-    femmesh.addNode(187.76749789512252, -147.77949970956047, -1116.5754957845568, 1365)
-    femmesh.addNode(172.41776329615465, 445.70739616803417, -1464.1623132599182, 1366)
-    femmesh.addNode(98.53696460467944, 358.5319950422119, -1066.085058847057, 1367)
-    femmesh.addNode(-2469.976706111811, 950.0581973314976, 3266.7109202210095, 1368)
-    femmesh.addNode(-1719.6200393212312, 371.2153505580071, 2573.6305363529045, 1369)
-    femmesh.addNode(-2395.485333410429, 192.67551910779318, 3115.913908708242, 1370)
-    femmesh.addNode(-2618.80273205174, 517.7372195037527, 2742.1439715315564, 1371)
-    femmesh.addNode(-1868.4460652611601, -61.10562726973774, 2049.0635876634515, 1372)
-    femmesh.addNode(-1942.937437962542, 696.2770509539666, 2199.860599176219, 1373)
-    femmesh.addNode(-333.9821223342835, -923.3450237070291, 446.778696176392, 1374)
-    femmesh.addNode(-331.61733028532865, -1457.9189265535229, 375.3932272300196, 1375)
-    femmesh.addNode(-0.49322893095660447, -1362.2144884383113, 396.82958334592445, 1376)
-    femmesh.addNode(32.57550404733278, -913.4366491922466, 879.028778197438, 1377)
-    femmesh.addNode(34.940296096287604, -1448.0105520387403, 807.6433092510656, 1378)
-    femmesh.addNode(-298.54859730703924, -1009.1410873074582, 857.5924220815332, 1379)
-    femmesh.addNode(164.41439443278207, 80.82995548223417, 497.2401205818885, 1380)
-    femmesh.addNode(341.981561401127, -248.51255190146549, 658.1889167300039, 1381)
-    femmesh.addNode(178.4056609866322, 5.180616255286537, 715.5005503660675, 1382)
-    femmesh.addNode(-166.1695586380951, 65.4676238299347, 540.1466470899832, 1383)
-    femmesh.addNode(11.397608330249795, -263.87488355376496, 701.0954432380986, 1384)
-    femmesh.addNode(-2.593658223600329, -188.22554432681733, 482.8350134539196, 1385)
-    femmesh.addNode(2078.728051226319, -528.9531997156513, 3511.8921753858867, 1386)
-    femmesh.addNode(1394.6027115099123, -383.6335247041283, 2554.2448228351377, 1387)
-    femmesh.addNode(2254.8009217459667, 145.31967501152226, 3087.4376193239823, 1388)
-    femmesh.addNode(2864.6733824514113, -326.8773942767461, 3073.9225669149832, 1389)
-    femmesh.addNode(2180.548042735004, -181.5577192652231, 2116.2752143642338, 1390)
-    femmesh.addNode(2004.4751722153565, -855.8305939923966, 2540.729770426139, 1391)
-    femmesh.addNode(571.4495234272732, 734.5221071907905, 1334.5755592402713, 1392)
-    femmesh.addNode(825.4169042506962, 886.6196749306307, 997.5715544145723, 1393)
-    femmesh.addNode(253.4203297518382, 580.8315224288804, 1032.1631734416635, 1394)
-    femmesh.addNode(-40.590644225045835, 644.3533132442174, 1137.7842115574301, 1395)
-    femmesh.addNode(213.37673659837714, 796.4508809840577, 800.7802067317311, 1396)
-    femmesh.addNode(531.4059302738121, 950.1414657459678, 1103.192592530339, 1397)
-    femmesh.addNode(1118.0395962944901, 1374.3229289518044, 2046.581645584637, 1398)
-    femmesh.addNode(1357.0608399778455, 665.4748048577931, 1714.8871034932065, 1399)
-    femmesh.addNode(1975.3422028567174, 1005.7514507359098, 1732.6270814495156, 1400)
-    femmesh.addNode(1246.7923533906123, -35.838893116716264, 1831.0586588640585, 1401)
-    femmesh.addNode(1380.2975596985773, -386.1063689656253, 1562.5099232997472, 1402)
-    femmesh.addNode(1704.1807883375247, -59.62812582586375, 1861.2415312089215, 1403)
-    femmesh.addNode(1066.9908716316677, -282.59022710440775, 2137.4586639672452, 1404)
-    femmesh.addNode(1200.4960779396326, -632.8577029533168, 1868.909928402934, 1405)
-    femmesh.addNode(743.1076429927202, -609.0684702441692, 1838.7270560580712, 1406)
-    femmesh.addNode(-497.90793804249904, -333.27344073880136, -260.57482130020617, 1407)
-    femmesh.addNode(-427.1583406194876, -239.6590850181863, -285.08252034361135, 1408)
-    femmesh.addNode(-498.2663038414762, -265.71301099704397, -380.152576059968, 1409)
-    femmesh.addNode(1154.131074546638, -309.28985340706413, 1170.5544950550025, 1410)
-    femmesh.addNode(1167.617048065198, -245.90752327868879, 902.4952472596923, 1411)
-    femmesh.addNode(936.3950982702249, -298.9348061281024, 1264.2678031595742, 1412)
-    femmesh.addNode(1070.5733424417, -125.5854679075102, 1173.4003567431894, 1413)
-    femmesh.addNode(1084.0593159602602, -62.20313777913483, 905.3411089478792, 1414)
-    femmesh.addNode(1301.7952922366733, -72.55818505809657, 811.6278008433076, 1415)
-    femmesh.addNode(2418.7702067592018, -1584.686613221581, 1322.1817591597664, 1416)
-    femmesh.addNode(2803.183621063713, -2840.4394414021704, 1516.836029301871, 1417)
-    femmesh.addNode(2880.5679571849532, -2166.1940899686674, 722.1089182633148, 1418)
-    femmesh.addNode(1357.946058776653, 2658.363142445786, 230.37111245095252, 1419)
-    femmesh.addNode(2491.546934025287, 3083.265557082219, 648.8400412257073, 1420)
-    femmesh.addNode(1903.1307856238986, 3318.0615069656956, 911.3738820262646, 1421)
-    femmesh.addNode(1006.0735390212315, 2609.899773569472, 1041.5197332426264, 1422)
-    femmesh.addNode(2139.6744142698653, 3034.8021882059056, 1459.988662017381, 1423)
-    femmesh.addNode(1594.48968742262, 2375.103823685996, 778.985892442069, 1424)
-    femmesh.addNode(652.8358145365116, 1104.3537619621964, 1459.4601868217499, 1425)
-    femmesh.addNode(897.0923048597283, 1293.5531106510377, 1072.87138005539, 1426)
-    femmesh.addNode(899.1896076029145, 851.1109110036996, 1686.57274697954, 1427)
-    femmesh.addNode(287.1494399505955, 760.9421170571264, 1489.7813992966987, 1428)
-    femmesh.addNode(285.0521372074092, 1203.3843167044647, 876.0800323725489, 1429)
-    femmesh.addNode(2638.2115380077794, 2736.223887662458, -1316.2501007902886, 1430)
-    femmesh.addNode(2078.450781302627, 1877.4773347732762, -1118.4377614111447, 1431)
-    femmesh.addNode(3176.33592911929, 2282.1094712042595, -886.9019041373492, 1432)
-    femmesh.addNode(2841.229446501242, 2782.211608327875, -558.4384859330489, 1433)
-    femmesh.addNode(2281.4686897960896, 1923.4650554386935, -360.62614655390513, 1434)
-    femmesh.addNode(1743.344298684579, 2377.579471896892, -789.9743432068444, 1435)
-    femmesh.addNode(999.0288580163083, -1086.4465865776383, -116.45200622220962, 1436)
-    femmesh.addNode(1102.5323936888506, -1162.73528646654, 372.5092452872018, 1437)
-    femmesh.addNode(692.1624496783659, -1115.7108603740342, 109.9465396489442, 1438)
-    femmesh.addNode(533.950613733057, -1544.3261020416523, -479.90791318619245, 1439)
-    femmesh.addNode(637.4541494055992, -1620.6148019305542, 9.053338323219009, 1440)
-    femmesh.addNode(944.3205577435416, -1591.3505281341581, -217.34520754793482, 1441)
-    femmesh.addNode(555.2179264334868, 131.13984906505027, 542.7481198922645, 1442)
-    femmesh.addNode(494.0984402219217, 134.89006983236618, 450.8590654264168, 1443)
-    femmesh.addNode(563.029249238584, 245.58440803304626, 508.2805683238166, 1444)
-    femmesh.addNode(1104.027862329596, -2899.715036636854, -384.667466964595, 1445)
-    femmesh.addNode(1386.7598341769137, -2289.1881478845125, -78.74349409119628, 1446)
-    femmesh.addNode(2034.8093726877803, -2312.492450706977, -243.49402311973546, 1447)
-    femmesh.addNode(1752.0774008404626, -2923.019339459318, -549.4179959931341, 1448)
-    femmesh.addNode(1027.1830554903122, 687.9506882036976, -310.3227593382304, 1449)
-    femmesh.addNode(958.1940264375214, 711.7226196289491, -175.96085971674907, 1450)
-    femmesh.addNode(158.46995268081636, -178.34925665085075, 352.4583682191079, 1451)
-    femmesh.addNode(-5.10594773367842, 75.34391150590126, 409.7700018551714, 1452)
-    femmesh.addNode(-172.11400039006082, -193.71158830315022, 395.36489472720257, 1453)
-    femmesh.addNode(554.8840962816323, 1147.0559050700595, -130.02998765445216, 1454)
-    femmesh.addNode(360.7251289556124, 1094.2397418086857, -482.1778581521371, 1455)
-    femmesh.addNode(658.2223361574161, 1096.9913535134742, -510.0361416345704, 1456)
-    femmesh.addNode(533.7935767753154, -535.8756782373803, -25.94842183503846, 1457)
-    femmesh.addNode(466.54571476273713, -482.1992900091465, 79.52180564623404, 1458)
-    femmesh.addNode(372.7157514485847, -224.68545794360568, -58.63564434819904, 1459)
-    femmesh.addNode(269.53229310472295, -453.97216048808934, -9.151125969594545, 1460)
-    femmesh.addNode(439.96361346116294, -278.3618461718395, -164.10587182947154, 1461)
-    femmesh.addNode(-493.87331954908734, -681.9376318968659, 678.2308647017953, 1462)
-    femmesh.addNode(-162.7492181947153, -586.2331937816543, 699.6672208177001, 1463)
-    femmesh.addNode(-289.78420353804853, -718.5780903730365, 469.44429045780794, 1464)
-    femmesh.addNode(-449.6754007528524, -477.1706985628733, 700.8964589832112, 1465)
-    femmesh.addNode(-620.9083048924206, -814.2825284882481, 448.0079343419031, 1466)
-    femmesh.addNode(3685.795799845985, -1476.7807965967359, 391.03424434098946, 1467)
-    femmesh.addNode(3502.358089207355, -2174.2624773436696, -282.986257397537, 1468)
-    femmesh.addNode(3744.6975114045235, -2128.2565480359362, 707.4745840737438, 1469)
-    femmesh.addNode(2950.2268386629667, -1755.7319438101626, 198.3508648535764, 1470)
-    femmesh.addNode(3133.6645493015967, -1058.2502630632287, 872.3713665921028, 1471)
-    femmesh.addNode(1245.4387480632995, 1810.45876507171, 951.1082874450069, 1472)
-    femmesh.addNode(1008.8951194173328, 2093.7180838315003, 402.49350745389035, 1473)
-    femmesh.addNode(949.499420126363, 1420.5365184716363, 578.9204407769354, 1474)
-    femmesh.addNode(710.134211084295, 2219.9775269693982, 669.3318865745548, 1475)
-    femmesh.addNode(946.6778397302619, 1936.7182082096083, 1217.9466665656714, 1476)
-    femmesh.addNode(327.19303310405655, 545.3227585019491, 1721.164366006631, 1477)
-    femmesh.addNode(1949.6191354060606, 151.92016290594566, 3740.992412600677, 1478)
-    femmesh.addNode(1089.420925170006, -377.0330368097049, 3207.7996161118326, 1479)
-    femmesh.addNode(534.1993680144326, 502.4499411296139, -115.82563175619437, 1480)
-    femmesh.addNode(466.55133930962995, 430.2629986447074, -213.86775904743212, 1481)
-    femmesh.addNode(-1365.0037311641618, 358.75002480824185, 389.6435722971589, 1482)
-    femmesh.addNode(-1494.490366963223, 268.63535863261006, 376.4837301419675, 1483)
-    femmesh.addNode(-1472.1692547111327, 365.24067135694463, 319.50136913785764, 1484)
-    femmesh.addNode(2595.988141522432, -41.4194509158057, 836.5722360805711, 1485)
-    femmesh.addNode(3144.283372891071, 249.99333115896312, 554.1823635816863, 1486)
-    femmesh.addNode(2665.508676670445, 615.3483918671855, 834.8235728029088, 1487)
-    femmesh.addNode(2462.225876544555, 647.5641257858476, 1641.2418339938222, 1488)
-    femmesh.addNode(3010.5211079131936, 938.9769078606164, 1358.8519614949375, 1489)
-    femmesh.addNode(2941.000572765181, 282.20906507762527, 1360.6006247725998, 1490)
-    femmesh.addNode(1367.8198898720523, -1954.9243195349482, 1945.7140395511472, 1491)
-    femmesh.addNode(1752.2333041765635, -3210.6771477155376, 2140.368309693252, 1492)
-    femmesh.addNode(1181.5681017869374, -2513.1274934595704, 1510.3917276832346, 1493)
-    femmesh.addNode(446.9132413651997, 761.5229000147275, -1521.5435952199155, 1494)
-    femmesh.addNode(286.36114496515563, 205.336086131145, -2020.8751797744628, 1495)
-    femmesh.addNode(946.181527342625, -379.3651144448845, 514.9567794478573, 1496)
-    femmesh.addNode(991.2116932801816, -287.75615680149673, 573.6845497693771, 1497)
-    femmesh.addNode(1094.521605197624, -312.0003620254597, 516.7796324788776, 1498)
-    femmesh.addNode(2227.738650181207, -877.0199390221073, 105.93112445767895, 1499)
-    femmesh.addNode(2443.993080438852, -1572.2978403902812, -289.60801321383803, 1500)
-    femmesh.addNode(3390.32949472601, -229.92549292493177, 35.22509690707915, 1501)
-    femmesh.addNode(3237.548153224633, -338.573694116224, -803.4966277036781, 1502)
-    femmesh.addNode(3206.89178408738, -927.4071736718656, -638.7954048314473, 1503)
-    femmesh.addNode(-2879.557877996966, 3.7907333492800035, -1664.4511485335781, 1504)
-    femmesh.addNode(-2373.9734440819207, -211.73913312509606, -1493.3566414133188, 1505)
-    femmesh.addNode(-2179.374696785858, -275.46646460275224, -2136.88451565234, 1506)
-    femmesh.addNode(2453.8169743711273, -164.90958938053745, 1609.9868036285143, 1507)
-    femmesh.addNode(2932.5916705917534, -530.2646500887597, 1329.3455944072919, 1508)
-    femmesh.addNode(2798.829405613876, 158.71892661289354, 2134.015192320543, 1509)
-    femmesh.addNode(587.4057850473915, 643.7378060422596, 62.71318284889624, 1510)
-    femmesh.addNode(-322.1592167250973, -190.98179981448038, -1723.452249516291, 1511)
-    femmesh.addNode(-337.50895132406515, 402.50509606311425, -2071.0390669916524, 1512)
-    femmesh.addNode(-646.9487965937719, 176.55931859872737, -1789.7650052196686, 1513)
-    femmesh.addNode(-341.8379476313669, -15.209590324127674, 1594.5467072304946, 1514)
-    femmesh.addNode(-895.9534875122096, -45.757868445508734, 1689.3119610594745, 1515)
-    femmesh.addNode(-338.747491502479, -368.1286605108811, 2172.247905841861, 1516)
-    femmesh.addNode(366.902730141193, -51.660544099202696, -894.9613996234557, 1517)
-    femmesh.addNode(191.60610727325718, -433.7615538631184, -1000.0907115396391, 1518)
-    femmesh.addNode(559.3921548871147, -45.09153752591439, -1056.5738838154614, 1519)
-    femmesh.addNode(384.09553201917885, -427.19254728983015, -1161.7031957316447, 1520)
-    femmesh.addNode(563.2307642652493, -331.0735916794723, -940.0890995705437, 1521)
-    femmesh.addNode(1949.7488269232267, -1644.7519813185972, -2201.901470130278, 1522)
-    femmesh.addNode(2828.7416303264217, -2374.8111773095115, -2173.9761265885454, 1523)
-    femmesh.addNode(2651.3726188331975, -1611.627081711254, -1504.19395070514, 1524)
-    femmesh.addNode(385.1362046756235, -169.8919706531683, -201.21245932361228, 1525)
-    femmesh.addNode(649.7343811139253, -484.99443756298706, -351.3496632467052, 1526)
-    femmesh.addNode(594.9069723283858, -376.52456204431587, -388.4562507408459, 1527)
-    femmesh.addNode(385.4730974433328, -403.090919813696, -334.5523673812613, 1528)
-    femmesh.addNode(1435.9695375590686, 303.3555922696854, 571.4519102435739, 1529)
-    femmesh.addNode(1470.80892879807, 186.64528028855915, 570.452629181958, 1530)
-    femmesh.addNode(1379.302577851961, 186.64528028855918, 661.958980128068, 1531)
-    femmesh.addNode(-429.6380533831281, -438.1089864450427, -15.326461458843852, 1532)
-    femmesh.addNode(-500.38765080613956, -531.7233421656578, 9.181237584561359, 1533)
-    femmesh.addNode(-296.06086046579367, -468.94258870943065, -184.4838065579786, 1534)
-    femmesh.addNode(-328.84230585987, -983.3914460048471, 1890.0180562845044, 1535)
-    femmesh.addNode(-884.6367261252079, -826.9260044805455, 1572.166039852894, 1536)
-    femmesh.addNode(-530.3501877939289, -1351.164315148097, 1642.2578599437718, 1537)
-    femmesh.addNode(-942.3283972158708, -1276.6073130721925, 2277.1913328188166, 1538)
-    femmesh.addNode(-740.820515281812, -908.8344439289423, 2524.951529159549, 1539)
-    femmesh.addNode(-1044.1582593662586, -72.98909216377916, 658.797278055418, 1540)
-    femmesh.addNode(-1002.1102709014373, -213.36342078934774, 647.6196150636398, 1541)
-    femmesh.addNode(-1116.8421118724236, -175.17306554626396, 614.656779467683, 1542)
-    femmesh.addNode(-260.7416124321319, 87.38823030999495, -131.09638983896517, 1543)
-    femmesh.addNode(-292.6333713001251, 201.86238339641764, -173.81012797376894, 1544)
-    femmesh.addNode(-294.2352614860223, 87.38823030999495, -256.09638983896457, 1545)
-    femmesh.addNode(-398.05434752901135, -110.49944875815446, -127.88773247499847, 1546)
-    femmesh.addNode(-364.56069847512094, -110.49944875815446, -2.887732474999093, 1547)
-    femmesh.addNode(-125.30231090725286, -23.11121844815939, -133.98412231396279, 1548)
-    femmesh.addNode(1306.3711953286029, -31.221959497077705, -1143.3928669419565, 1549)
-    femmesh.addNode(858.2592094999628, -8.986108645441618, -1165.2777915209833, 1550)
-    femmesh.addNode(972.2025911689639, -249.35741868233077, -1721.990658035528, 1551)
-    femmesh.addNode(1408.0321752540628, 715.7255167979773, -1319.0215785687287, 1552)
-    femmesh.addNode(1208.8074854329545, 820.0797603382443, -924.6579408081195, 1553)
-    femmesh.addNode(1704.784583785869, 669.8527593884797, -1117.4707715884806, 1554)
-    femmesh.addNode(1397.4474750112217, 1164.0420834786473, -1372.4247313325695, 1555)
-    femmesh.addNode(1198.2227851901134, 1268.3963270189142, -978.0610935719601, 1556)
-    femmesh.addNode(901.4703766583075, 1314.269084428412, -1179.6119005522085, 1557)
-    femmesh.addNode(1112.8043496546288, 476.27545616895173, 2101.4759102595663, 1558)
-    femmesh.addNode(788.9211210156814, 149.7972130291902, 1802.744302350392, 1559)
-    femmesh.addNode(609.1196392567367, -96.95412095850128, 2109.144307453579, 1560)
-    femmesh.addNode(1880.1016370457073, 1013.9914581946913, 976.3651866615774, 1561)
-    femmesh.addNode(1326.0256268150251, 706.8004101348297, 1095.4445992885492, 1562)
-    femmesh.addNode(1697.5221081568134, 1347.5013077524027, 1180.9045275862084, 1563)
-    femmesh.addNode(1876.8811911571752, 1159.292733543492, 743.9244737804827, 1564)
-    femmesh.addNode(1322.805180926493, 852.1016854836305, 863.0038864074545, 1565)
-    femmesh.addNode(1505.3847098153872, 518.5918359259192, 658.4645454828235, 1566)
-    femmesh.addNode(872.4601969096334, -730.21417533623, 1444.1546397292436, 1567)
-    femmesh.addNode(1329.8486318565458, -754.0034080453775, 1474.3375120741064, 1568)
-    femmesh.addNode(692.6587151506887, -976.9655093239214, 1750.5546448324303, 1569)
-    femmesh.addNode(-2591.882547835933, -3136.469307327239, -1183.6929688217524, 1570)
-    femmesh.addNode(-2698.0308731568825, -2159.696522855472, -752.3799203880465, 1571)
-    femmesh.addNode(-1894.1112611763506, -405.348744015536, -986.7129930506694, 1572)
-    femmesh.addNode(-1699.5125138802878, -469.0760754931922, -1630.2408672896904, 1573)
-    femmesh.addNode(-2390.796918767229, -674.7317991880196, -1695.5997022695656, 1574)
-    femmesh.addNode(-2237.606905496179, 1499.4683248271303, 1600.9524237262915, 1575)
-    femmesh.addNode(-2439.471719172163, 2088.060446751668, 1193.4940674713976, 1576)
-    femmesh.addNode(-1936.9709906426303, 2280.00562112793, 872.1764636612877, 1577)
-    femmesh.addNode(-2162.321919834149, 1600.5295852572817, 943.0053156384419, 1578)
-    femmesh.addNode(-2364.1867335101333, 2189.12170718182, 535.5469593835478, 1579)
-    femmesh.addNode(-2664.8226483636818, 1408.58441088102, 1264.3229194485516, 1580)
-    femmesh.addNode(1019.7614565964495, 673.5146793303155, 1240.6685646129363, 1581)
-    femmesh.addNode(701.7322629210146, 519.8240945684054, 938.2561788143286, 1582)
-    femmesh.addNode(447.76488209759157, 367.7265268285651, 1275.2601836400277, 1583)
-    femmesh.addNode(-1727.1122319312014, 2694.4178107649477, -1500.4678900010263, 1584)
-    femmesh.addNode(-1757.5960733838992, 1951.8296283444265, -1720.5875044762367, 1585)
-    femmesh.addNode(-1385.6761466385174, 2439.801177024992, -980.2636593310165, 1586)
-    femmesh.addNode(-1843.451597533112, 2252.318027068619, -873.9149716759935, 1587)
-    femmesh.addNode(-1873.9354389858095, 1509.7298446480977, -1094.034586151204, 1588)
-    femmesh.addNode(-2215.371524278494, 1764.3464783880534, -1614.2388168212137, 1589)
-    femmesh.addNode(800.3424147873999, 1713.7560274360244, 225.46523067106816, 1590)
-    femmesh.addNode(560.9772057453317, 2513.1970359337865, 315.8766764686876, 1591)
-    femmesh.addNode(501.5815064543621, 1840.0154705739226, 492.3036097917327, 1592)
-    femmesh.addNode(1843.944513665683, 307.2874799077309, 1623.5018560375133, 1593)
-    femmesh.addNode(1630.3297716139687, 682.1229347424787, 1208.5986927574868, 1594)
-    femmesh.addNode(2336.604714173641, -29.286199079199832, -1316.6734158556278, 1595)
-    femmesh.addNode(1773.860306266708, 53.01045740270183, -1957.0989158153766, 1596)
-    femmesh.addNode(2206.455746833372, -541.7742575247107, -1761.9379223219146, 1597)
-    femmesh.addNode(2061.327226488586, -438.18232067592544, -1220.3109107678797, 1598)
-    femmesh.addNode(1498.582818581653, -355.8856641940238, -1860.7364107276283, 1599)
-    femmesh.addNode(1628.7317859219224, 156.6023942514871, -1415.4719042613415, 1600)
-    femmesh.addNode(579.0631111842932, 1139.8625258891275, 770.4589942567823, 1601)
-    femmesh.addNode(-120.0219184944506, 736.4990838586991, -270.3723948112266, 1602)
-    femmesh.addNode(74.13704883156939, 789.3152471200729, 81.7754756864583, 1603)
-    femmesh.addNode(-88.84819351876668, 1168.3621475516147, -511.25421190658403, 1604)
-    femmesh.addNode(105.31077380725331, 1221.1783108129885, -159.10634140889908, 1605)
-    femmesh.addNode(-189.6355652262689, 1183.6758822241582, -210.01853119223102, 1606)
-    femmesh.addNode(398.7687742344532, -1544.3939757738706, 462.17595277895384, 1607)
-    femmesh.addNode(295.26523856191096, -1468.1052758849687, -26.785298730457583, 1608)
-    femmesh.addNode(3.917024617075743, -1570.6401436391684, 136.62870664588485, 1609)
-    femmesh.addNode(297.3107000609885, -1141.957028239332, -215.6007064841248, 1610)
-    femmesh.addNode(400.8142357335307, -1218.2457281282338, 273.3605450252866, 1611)
-    femmesh.addNode(568.8034702429031, -578.5117090257719, 52.98209642963511, 1612)
-    femmesh.addNode(684.7442745815131, -527.6304683513786, -272.41914498203164, 1613)
-    femmesh.addNode(479.3030607574853, -660.6047518792368, -196.3949173868282, 1614)
-    femmesh.addNode(1072.3707988651406, -650.308524025281, 258.92767743948787, 1615)
-    femmesh.addNode(1193.0894411878912, -599.6685376999648, 313.52250905965195, 1616)
-    femmesh.addNode(1201.3526159439957, -615.2898630240704, 169.1850076669602, 1617)
-    femmesh.addNode(102.9207026471934, -2091.4892229581665, -2222.6548304868074, 1618)
-    femmesh.addNode(350.8393294925895, -2956.0722720957065, -3015.827396440123, 1619)
-    femmesh.addNode(240.744973613058, -2972.431257098291, -2375.1912230280805, 1620)
-    femmesh.addNode(-496.8974424229654, -2486.4400596132264, -1540.9167876660167, 1621)
-    femmesh.addNode(-248.97881557756932, -3351.0231087507664, -2334.0893536193316, 1622)
-    femmesh.addNode(-386.8030865434339, -2470.0810746106417, -2181.5529610780595, 1623)
-    femmesh.addNode(843.2098691310052, 844.7379377390073, -485.99253107597326, 1624)
-    femmesh.addNode(2997.1457065152954, -31.171119919930447, -1303.1994162643819, 1625)
-    femmesh.addNode(3635.0881150825116, 280.86433708337523, -2211.906335814482, 1626)
-    femmesh.addNode(3407.1425633075205, -312.0354570033067, -2030.2193419122664, 1627)
-    femmesh.addNode(2678.3673114909484, -91.23412977132037, -1881.852299351779, 1628)
-    femmesh.addNode(3316.309720058164, 220.80132723198534, -2790.5592189018794, 1629)
-    femmesh.addNode(2906.312863265939, 501.6656643153616, -2063.539293253995, 1630)
-    femmesh.addNode(7.124547406308977, -392.2643889056029, -25.386778193525117, 1631)
-    femmesh.addNode(82.32597015246316, -190.1468145248661, 58.83983676418163, 1632)
-    femmesh.addNode(100.50090704441627, -398.5759028032853, -231.53519092173437, 1633)
-    femmesh.addNode(-101.91095632598993, -410.8461873501655, -160.76863541471891, 1634)
-    femmesh.addNode(-26.70953357983575, -208.72861296942864, -76.54202045701217, 1635)
-    femmesh.addNode(-120.08589321794304, -202.41709907174624, 129.60639227119708, 1636)
-    femmesh.addNode(419.1250221133104, 242.7673810953284, 209.53701505972384, 1637)
-    femmesh.addNode(311.1397107216046, 252.21382569206122, 424.5473276349066, 1638)
-    femmesh.addNode(350.19421309664807, 132.07304289464832, 152.11551216232402, 1639)
-    femmesh.addNode(712.124374314804, -3530.1954098597807, -2261.302955584718, 1640)
-    femmesh.addNode(464.20574746940787, -2665.6123607222407, -1468.130389631403, 1641)
-    femmesh.addNode(-25.518041721219447, -3044.204212374716, -1427.0285202226546, 1642)
-    femmesh.addNode(1117.3311115137496, -352.94935553111605, -2263.617669589563, 1643)
-    femmesh.addNode(254.19261272873322, -537.8055644433725, -2607.5245862133115, 1644)
-    femmesh.addNode(780.5728401414225, -644.3338099550656, -2746.2703389054113, 1645)
-    femmesh.addNode(994.8141527828864, -834.145213514367, -2152.451426434201, 1646)
-    femmesh.addNode(131.67565399787003, -1019.0014224266235, -2496.3583430579492, 1647)
-    femmesh.addNode(468.43392537019713, -727.616968002674, -2013.7056737421008, 1648)
-    femmesh.addNode(-577.572877414478, 99.57165617248948, 513.9334735316264, 1649)
-    femmesh.addNode(-665.4060431643622, 181.34103725194214, 530.7346337155872, 1650)
-    femmesh.addNode(-587.3208831190669, 221.19921434345463, 482.9634125783347, 1651)
-    femmesh.addNode(175.63726818995903, 786.1566338521807, 2584.946116003188, 1652)
-    femmesh.addNode(-133.24187173136738, 1022.7807064535143, 2024.395817653545, 1653)
-    femmesh.addNode(2686.3325026360208, -1526.2919110825478, 700.8528282574426, 1654)
-    femmesh.addNode(-1106.6299676245637, -346.7061089937931, -1947.013570699576, 1655)
-    femmesh.addNode(-1299.8699194741016, -815.5713599652349, -2439.8544178546963, 1656)
-    femmesh.addNode(-1681.3302437484544, -538.6759918793666, -2564.3665278275853, 1657)
-    femmesh.addNode(-1072.4398001881489, 39.05308446829534, -2148.362686002153, 1658)
-    femmesh.addNode(-1265.6797520376867, -429.8121665031465, -2641.2035331572743, 1659)
-    femmesh.addNode(-690.9794759137963, -237.842283617573, -2023.8505760292646, 1660)
-    femmesh.addNode(-1007.0139656938161, -512.2203105630551, 583.0292340985164, 1661)
-    femmesh.addNode(-974.4261053767248, -417.5218071582717, 670.5729914550924, 1662)
-    femmesh.addNode(-887.8320520288519, -501.24648313943845, 600.6803933842266, 1663)
-    femmesh.addNode(-1026.9326244794854, 664.7215656016174, 255.82754312114528, 1664)
-    femmesh.addNode(-932.4241572470435, 634.9399972545606, 361.2400969203681, 1665)
-    femmesh.addNode(2089.241018925397, 1243.4573951456766, 663.0794448576135, 1666)
-    femmesh.addNode(1717.7445375836091, 602.7564975281039, 577.6195165599543, 1667)
-    femmesh.addNode(1714.524091695077, 748.0577728769046, 345.1788036788596, 1668)
-    femmesh.addNode(2635.4945351888446, -144.15527778850367, -761.9577747546086, 1669)
-    femmesh.addNode(2202.8990946221807, 450.6294371389089, -957.1187682480705, 1670)
-    femmesh.addNode(2285.1550275030945, -230.14099899676467, -961.311161314026, 1671)
-    femmesh.addNode(1852.5595869364308, 364.6437159306479, -1156.4721548074879, 1672)
-    femmesh.addNode(2151.4494079516344, 249.77463722134405, -601.7565137064686, 1673)
-    femmesh.addNode(-3.0580730449333373, 1159.3480629517624, 1481.2907579019288, 1674)
-    femmesh.addNode(324.68201113070796, 1275.9368667646713, 1833.2879456411974, 1675)
-    femmesh.addNode(-463.4929778803573, 1636.8060109033277, 1784.5222095488427, 1676)
-    femmesh.addNode(453.8381945315837, -773.8918844275795, -1144.5377566448071, 1677)
-    femmesh.addNode(825.4628515235759, -671.2039222439334, -1084.5361446757117, 1678)
-    femmesh.addNode(743.0781990685205, -632.1621847005529, -1596.1213112431683, 1679)
-    femmesh.addNode(673.3355365561156, -285.4628475628035, -1613.2867503300058, 1680)
-    femmesh.addNode(301.7108795641235, -388.1508097464496, -1673.2883622991012, 1681)
-    femmesh.addNode(648.7330897067591, -1987.9179401466668, -1884.7718362713729, 1682)
-    femmesh.addNode(1099.9226733409187, -1442.9454658571326, -1627.4478605284276, 1683)
-    femmesh.addNode(444.0159304018213, -1562.875733671217, -1324.6946813318195, 1684)
-    femmesh.addNode(236.03433011397607, -2078.5391257794618, -1081.4098857933413, 1685)
-    femmesh.addNode(687.2239137481355, -1533.5666514899276, -824.0859100503959, 1686)
-    femmesh.addNode(891.9410730530733, -1958.6088579653774, -1384.1630649899491, 1687)
-    femmesh.addNode(2295.716381672424, -2090.784766875041, 2220.2169039556256, 1688)
-    femmesh.addNode(1431.7519968242664, -1258.7768056860173, 2217.1255954458593, 1689)
-    femmesh.addNode(2082.494225838422, -1889.9143606203256, 2981.790687406809, 1690)
-    femmesh.addNode(2868.4395570635143, -1687.8385551814204, 2543.8210789359055, 1691)
-    femmesh.addNode(2217.6973280493585, -1056.701000247112, 1779.1559869749553, 1692)
-    femmesh.addNode(330.2834892329444, 192.40368831519572, 2298.8655646179977, 1693)
-    femmesh.addNode(922.9789435277764, 35.583311484181536, 1088.7808721884783, 1694)
-    femmesh.addNode(909.4929700092164, -27.799018644193836, 1356.8401199837886, 1695)
-    femmesh.addNode(1057.1571876992516, 208.93264970477375, 997.9134257720935, 1696)
-    femmesh.addNode(2644.164889630014, 2698.8281387071966, 1195.833962880128, 1697)
-    femmesh.addNode(2098.9801627827683, 2039.1297741872868, 514.8311933048159, 1698)
-    femmesh.addNode(1747.107643027347, 1990.666405310973, 1325.9798140964897, 1699)
-    femmesh.addNode(-823.8392605605001, 1182.9917554223955, 1465.2189888823295, 1700)
-    femmesh.addNode(-363.40435572507613, 705.5338074708303, 1161.9875372354159, 1701)
-    femmesh.addNode(-403.4479488785372, 921.1531660260076, 930.6045705254834, 1702)
-    femmesh.addNode(-501.02554906046976, 1121.8112611957827, 1441.015663204344, 1703)
-    femmesh.addNode(2873.082284624839, 485.59632088963895, 3105.177597280291, 1704)
-    femmesh.addNode(-1759.5318844174199, -3556.476894707188, -1117.9748825778775, 1705)
-    femmesh.addNode(-1271.0190527470706, -2464.394800324176, -1096.708221849713, 1706)
-    femmesh.addNode(-1818.9718950321062, -2445.024323885753, -1565.5330045011433, 1707)
-    femmesh.addNode(-43.101666198394426, 1374.9674215069397, 1249.9077911919965, 1708)
-    femmesh.addNode(-1618.3912817938378, -327.0309306945044, 54.409433375218725, 1709)
-    femmesh.addNode(-1524.747495124307, -407.85006176812897, 1.8494953891409798, 1710)
-    femmesh.addNode(-1628.2257820741397, -304.4079457506307, -70.60851769417329, 1711)
-    femmesh.addNode(-299.64543022409714, -88.93014125003005, -574.2650763483529, 1712)
-    femmesh.addNode(38.58009590858725, -304.0676427676674, -616.3582404106421, 1713)
-    femmesh.addNode(32.51581338664323, -122.50509673512327, -736.3834513162489, 1714)
-    femmesh.addNode(-22.718373802150353, 40.16129042045219, -609.0832466971515, 1715)
-    femmesh.addNode(315.50715233053404, -174.97621109718517, -651.1764107594407, 1716)
-    femmesh.addNode(-16.65409128020633, -141.40125561209197, -489.05803579154474, 1717)
-    femmesh.addNode(396.40398218549836, -1009.8200729273767, 533.5614217253262, 1718)
-    femmesh.addNode(431.8375072127426, -1095.6161365278058, 944.3751476304674, 1719)
-    femmesh.addNode(-2569.2761401588436, 2013.55419949031, -1296.0489961762987, 1720)
-    femmesh.addNode(-2197.356213413462, 2501.525748170876, -555.7251510310783, 1721)
-    femmesh.addNode(-2685.615505760754, 1571.4544157939818, -669.4960778512659, 1722)
-    femmesh.addNode(-997.8693374877637, 114.13818712947132, 2458.436407352644, 1723)
-    femmesh.addNode(-440.6633414780331, -208.23260493590107, 2941.3723521350303, 1724)
-    femmesh.addNode(-785.044694166703, -299.2570797623154, 2589.050682486796, 1725)
-    femmesh.addNode(-2259.1797807216426, -1619.294411129245, -58.33119283841751, 1726)
-    femmesh.addNode(-390.5771540489056, 1267.0937009172485, 263.7311551880739, 1727)
-    femmesh.addNode(-91.38841841421642, 1466.39931568618, -24.620786920663306, 1728)
-    femmesh.addNode(-457.6505758852741, 1416.233331148142, -162.54840617885125, 1729)
-    femmesh.addNode(-868.8789080541903, 1561.326348515472, -120.67352494349367, 1730)
-    femmesh.addNode(-569.6901724195012, 1760.6319632844036, -409.02546705223085, 1731)
-    femmesh.addNode(-502.6167505831326, 1611.4923330535098, 17.25409431469427, 1732)
-    femmesh.addNode(-713.0140784951782, -3089.7668425499974, -990.419315676279, 1733)
-    femmesh.addNode(3731.7493249161853, -1581.7635676750456, -759.9546318737915, 1734)
-    femmesh.addNode(3915.1870355548153, -884.2818869281118, -85.9341301352651, 1735)
-    femmesh.addNode(4230.753692537767, -707.4328682290156, -606.6400600875345, 1736)
-    femmesh.addNode(-1451.4447714279415, 748.1177136139947, 2141.5626168954973, 1737)
-    femmesh.addNode(-1048.8849964611964, 1019.4998670856073, 2910.579113063074, 1738)
-    femmesh.addNode(-1357.7641363825228, 1256.123939686941, 2350.028814713431, 1739)
-    femmesh.addNode(-899.4476055725577, -199.83532376513938, 644.1231464091138, 1740)
-    femmesh.addNode(-915.5162175535644, -297.08809677051454, 577.727016992774, 1741)
-    femmesh.addNode(-776.0855262672123, -822.932336980567, 658.0646486719268, 1742)
-    femmesh.addNode(-604.852622127644, -485.8205070551923, 910.9531733132349, 1743)
-    femmesh.addNode(-731.8876074709774, -618.1654036465745, 680.7302429533427, 1744)
-    femmesh.addNode(-1331.8946634750419, 612.0406054739442, 465.9922765806406, 1745)
-    femmesh.addNode(1247.4800788540188, 159.53870291439483, -1818.3531631232763, 1746)
-    femmesh.addNode(1315.8516486144272, 890.6439536335541, -1741.8674372808932, 1747)
-    femmesh.addNode(819.8745502615127, 1040.8709545833187, -1549.0546065005324, 1748)
-    femmesh.addNode(659.3224538614686, 484.68414069973625, -2048.3861910550795, 1749)
-    femmesh.addNode(1619.208092923323, -1572.6744128125526, -1182.2272667828756, 1750)
-    femmesh.addNode(1521.0034633133564, -1505.5068809893196, -1904.7926862962445, 1751)
-    femmesh.addNode(2222.6272552233277, -1472.3819813819764, -1207.0851668711064, 1752)
-    femmesh.addNode(1521.4126616244823, -673.2831007187127, 693.9143480483077, 1753)
-    femmesh.addNode(1485.226695258697, -1100.450795065356, 1181.1317592251203, 1754)
-    femmesh.addNode(1581.5826162523078, -575.5749899323762, 1249.7022510500874, 1755)
-    femmesh.addNode(491.6911049336861, -82.80718358709818, 401.06692291567737, 1756)
-    femmesh.addNode(594.3224756248376, -151.51204621904688, 451.0708317589447, 1757)
-    femmesh.addNode(829.8024960974323, -70.79989188122676, 621.5103014146916, 1758)
-    femmesh.addNode(563.4703153198715, -92.15105833669773, 610.3679566015719, 1759)
-    femmesh.addNode(727.1711254062808, -2.0950292492780584, 571.5063925714243, 1760)
-    femmesh.addNode(1577.2820992513757, -44.252405666077706, -1060.1096497197395, 1761)
-    femmesh.addNode(3319.971396537667, -710.7581451523065, -2577.602093127471, 1762)
-    femmesh.addNode(2591.1961447210947, -489.9568179203202, -2429.235050566984, 1763)
-    femmesh.addNode(2682.028987970451, -1022.7936021556122, -1668.8951735773708, 1764)
-    femmesh.addNode(169.3716567034979, -1658.330516973338, -1742.279043830752, 1765)
-    femmesh.addNode(-189.6263383554386, -916.2071515327932, -1862.520445656713, 1766)
-    femmesh.addNode(-366.1716482912746, -1365.7248425202063, -1702.260058900726, 1767)
-    femmesh.addNode(-324.1366481050985, -1929.9872254945258, -1327.9273633893752, 1768)
-    femmesh.addNode(-683.134643164035, -1187.8638600539807, -1448.1687652153362, 1769)
-    femmesh.addNode(-147.5913381692625, -1480.4695345071127, -1488.187750145362, 1770)
-    femmesh.addNode(-1306.1029681691848, 64.35297814940486, -541.2235871613643, 1771)
-    femmesh.addNode(-1284.1845056499542, 171.90528804949508, -499.1356973782959, 1772)
-    femmesh.addNode(495.41324338154504, -210.66981553784473, 356.51097175365123, 1773)
-    femmesh.addNode(611.0370870011312, -1348.588845599952, -2638.8511354985703, 1774)
-    femmesh.addNode(1474.1755857861476, -1163.7326366876955, -2294.9442188748217, 1775)
-    femmesh.addNode(825.2783996425951, -1538.4002491592537, -2045.0322230273598, 1776)
-    femmesh.addNode(-2399.695695091396, -189.81887754115994, -1157.8075001709287, 1777)
-    femmesh.addNode(-2238.7432386461473, -605.0798803754219, -866.1154793085454, 1778)
-    femmesh.addNode(-2727.5041978758845, 73.4426521618777, -834.966925572558, 1779)
-    femmesh.addNode(-2221.919763960839, -142.08721431249836, -663.8724184522987, 1780)
-    femmesh.addNode(1312.2803353275644, 508.6355698112305, -571.7669350666464, 1781)
-    femmesh.addNode(1422.3041226674409, 492.65300135357575, -511.9558838224196, 1782)
-    femmesh.addNode(1358.4334293941806, 598.3746531641444, -443.4183463597495, 1783)
-    femmesh.addNode(574.3001033489394, -2649.253375719656, -2108.7665630434453, 1784)
-    femmesh.addNode(-2664.4194240137977, 701.534469608765, -1758.038174012489, 1785)
-    femmesh.addNode(-1964.2362428026893, 422.27727165673275, -2230.471541131251, 1786)
-    femmesh.addNode(-2045.2596178783792, 770.5129264713464, -1826.111077757603, 1787)
-    femmesh.addNode(-411.4742057872162, 505.2732094748244, 94.11398733749564, 1788)
-    femmesh.addNode(-497.29477764556407, 598.1674147870159, -2.0670229643756954, 1789)
-    femmesh.addNode(-392.29640396896957, 490.3805623520439, -27.282095183241324, 1790)
-    femmesh.addNode(776.2579529407419, -526.8486684025146, -373.88210889378547, 1791)
-    femmesh.addNode(2286.4569975215036, -453.78720554729625, -815.4970480244398, 1792)
-    femmesh.addNode(1578.5840692697848, -267.8986122166093, -914.2955364301534, 1793)
-    femmesh.addNode(1802.4118702842934, -59.85729053744855, -655.2957869762997, 1794)
-    femmesh.addNode(-163.59646880515248, 133.70443270125207, -478.24153346594426, 1795)
-    femmesh.addNode(-162.4721297664948, 406.90887698433494, -632.9491813897696, 1796)
-    femmesh.addNode(-20.35888582560608, 447.9809049030729, -416.90042760175425, 1797)
-    femmesh.addNode(119.39487013873836, 81.23331833919015, -393.03449290913613, 1798)
-    femmesh.addNode(120.51920917739605, 354.43776262227306, -547.7421408329615, 1799)
-    femmesh.addNode(184.96094094168944, 580.6703996739446, 343.6197098438711, 1800)
-    femmesh.addNode(438.2355492201764, 779.8733829388118, 413.92341704287736, 1801)
-    femmesh.addNode(254.11310229677423, 533.7261069038534, 624.8554614169582, 1802)
-    femmesh.addNode(224.0862067553415, 425.8704137359057, 425.8987564150108, 1803)
-    femmesh.addNode(477.36081503382843, 625.073397000773, 496.202463614017, 1804)
-    femmesh.addNode(408.20865367874364, 672.0176897708642, 214.9667120409299, 1805)
-    femmesh.addNode(-721.9882297975715, -229.61902566838927, -636.286573003315, 1806)
-    femmesh.addNode(-745.5124998071722, -99.15235831263247, -699.7602806108298, 1807)
-    femmesh.addNode(-829.614416546044, -222.06325014224336, -697.076892545734, 1808)
-    femmesh.addNode(-1328.2615188545394, 1537.5316748977812, 1627.632450738686, 1809)
-    femmesh.addNode(-1764.6087944946296, 1410.0057639925517, 2002.0311838909267, 1810)
-    femmesh.addNode(-1436.011299690992, 1986.9982020359023, 2318.8516882668146, 1811)
-    femmesh.addNode(-1406.5086821630086, 2268.4059372467427, 1596.4553242920697, 1812)
-    femmesh.addNode(-999.6640240509018, 2114.5241129411315, 1944.452955114574, 1813)
-    femmesh.addNode(-1999.1142045960548, -1087.101859104187, 1445.0253749395272, 1814)
-    femmesh.addNode(-2155.048403614662, -594.8252944926071, 1353.7567130530667, 1815)
-    femmesh.addNode(-1242.0788070778742, -702.4223090122158, 1233.137181625701, 1816)
-    femmesh.addNode(-1357.408469725394, -913.7770306058184, 959.5390118538184, 1817)
-    femmesh.addNode(-1513.3426687440015, -421.50046599423854, 868.2703499673579, 1818)
-    femmesh.addNode(-2270.378066262182, -806.1800160862097, 1080.158543281184, 1819)
-    femmesh.addNode(-2167.0643714080034, 2073.755922882414, 2897.9930000016125, 1820)
-    femmesh.addNode(-2137.5617538800198, 2355.163658093254, 2175.5966360268676, 1821)
-    femmesh.addNode(-1808.9642590763824, 2932.1560961366044, 2492.4171404027556, 1822)
-    femmesh.addNode(-1520.7936313354398, -3777.6741429424806, 438.1757231270186, 1823)
-    femmesh.addNode(-1078.6680511062261, -4005.0307847456916, -250.97068996012186, 1824)
-    femmesh.addNode(322.5847083875217, 1718.3790664120097, 1219.5865787170476, 1825)
-    femmesh.addNode(823.4888049030344, 687.6313707418095, 69.38010918729486, 1826)
-    femmesh.addNode(605.1664077207345, 870.711240408453, 139.35459180818884, 1827)
-    femmesh.addNode(708.5046475965182, 820.6466888518677, -240.65156217192936, 1828)
-    femmesh.addNode(595.6622062978668, -299.5833630770677, -582.5092941685639, 1829)
-    femmesh.addNode(577.4240294194504, -194.7467926434896, -613.2369497055879, 1830)
-    femmesh.addNode(482.6557095400021, -240.48410556827437, -516.7964790308675, 1831)
-    femmesh.addNode(-2906.7864500511855, -1583.6773924021886, 65.63154959770603, 1832)
-    femmesh.addNode(-2421.2270429096825, -908.595494326295, -119.1908932096367, 1833)
-    femmesh.addNode(-2559.2208402222413, -1008.0368486496767, -722.8336509406603, 1834)
-    femmesh.addNode(-3206.8275095517843, -972.4198299226202, -598.8709085045367, 1835)
-    femmesh.addNode(-3044.7802473637444, -1683.1187467255704, -538.0112081333175, 1836)
-    femmesh.addNode(1198.127302950885, -1510.1129976803654, -904.8824410150587, 1837)
-    femmesh.addNode(990.1457026630397, -2025.7763897886102, -661.5976454765804, 1838)
-    femmesh.addNode(1448.9383851424016, 3685.3397738070457, 571.2409525678449, 1839)
-    femmesh.addNode(2037.35453354379, 3450.543823923569, 308.7071117672877, 1840)
-    femmesh.addNode(416.53182555563734, -2945.277666812135, 51.9417375817805, 1841)
-    femmesh.addNode(-218.76768112938265, -2605.6450825595493, -77.78979934786878, 1842)
-    femmesh.addNode(637.1710698030182, -2236.4209755373913, 455.17565132920134, 1843)
-    femmesh.addNode(875.8564449741642, -2312.641801694075, 2.0530368734665103, 1844)
-    femmesh.addNode(240.55693828914423, -1973.0092174414888, -127.67850005618277, 1845)
-    femmesh.addNode(19.917694041763355, -2681.8659087162328, -530.9124138036036, 1846)
-    femmesh.addNode(-1365.636637339558, -790.4331006447464, 1873.6196841761493, 1847)
-    femmesh.addNode(-1164.1287554054993, -422.66023150149636, 2121.3798805168817, 1848)
-    femmesh.addNode(-1221.8204264961623, -872.3415400931432, 2826.4051734828045, 1849)
-    femmesh.addNode(-1233.69257329629, 268.8698677019968, 618.8408397541411, 1850)
-    femmesh.addNode(-1141.7104994017911, 232.50260079725848, 681.9195772880271, 1851)
-    femmesh.addNode(-1267.7753230313706, 91.16960106019684, 1016.4966613524599, 1852)
-    femmesh.addNode(3915.022709609414, -203.38725581201456, 1050.5079993670402, 1853)
-    femmesh.addNode(3984.5432447574267, 453.38058697097654, 1048.759336089378, 1854)
-    femmesh.addNode(3781.2604446315368, 485.5963208896387, 1855.1775972802914, 1855)
-    femmesh.addNode(-1388.3229584853589, -1353.683383849932, 2319.390380297694, 1856)
-    femmesh.addNode(-1803.7913353587169, -2467.545679923287, 2842.6687687329822, 1857)
-    femmesh.addNode(-2060.5970434932074, -1500.0296237390523, 2946.111913275425, 1858)
-    femmesh.addNode(-1823.4225046996296, -1190.2922703682436, 1924.3907745916767, 1859)
-    femmesh.addNode(-2238.8908815729874, -2304.1545664415985, 2447.6691630269647, 1860)
-    femmesh.addNode(-1566.6167965651389, -2157.8083265524783, 1820.9476300492336, 1861)
-    femmesh.addNode(3157.1710184791173, 2377.827869749919, -1553.7001122577208, 1862)
-    femmesh.addNode(2059.2858706624543, 1973.1957333189355, -1785.2359695315163, 1863)
-    femmesh.addNode(2597.410261773965, 1519.0813168607372, -1355.887772878577, 1864)
-    femmesh.addNode(18.885179662724397, -565.2869933287492, -768.7333067900906, 1865)
-    femmesh.addNode(-285.4906104327567, -668.2251815036623, -839.3291909991941, 1866)
-    femmesh.addNode(-279.076305797219, -703.6316653589354, -386.35769008854464, 1867)
-    femmesh.addNode(-134.14083170194553, -435.5930822332982, -385.0008356610936, 1868)
-    femmesh.addNode(-438.51662179742664, -538.5312704082113, -455.59671987019715, 1869)
-    femmesh.addNode(-140.55513633748322, -400.1865983780252, -837.9723365717431, 1870)
-    femmesh.addNode(-2694.0746107497043, -1796.6983821984927, 2517.5176040388033, 1871)
-    femmesh.addNode(-2278.6062338763463, -682.8360861251377, 1994.239215603515, 1872)
-    femmesh.addNode(-2456.9000719561263, -1486.961028827684, 1495.7964653550546, 1873)
-    femmesh.addNode(1429.2572022277027, 496.1979171695916, -219.80574887754645, 1874)
-    femmesh.addNode(1436.5681542252905, 502.2159997196665, -87.69731075043549, 1875)
-    femmesh.addNode(1378.9336551385782, 766.3204169109616, -310.2711792624828, 1876)
-    femmesh.addNode(1118.2226947355616, -3667.207799382615, 890.1038400871896, 1877)
-    femmesh.addNode(262.28394380316087, -4036.4319064047727, 357.13838941011943, 1878)
-    femmesh.addNode(521.0865984893667, -3834.127849546627, 1312.3278196021388, 1879)
-    femmesh.addNode(-180.60427069055774, -3112.1977169761476, 474.16571709672985, 1880)
-    femmesh.addNode(675.3344802418432, -2742.9736099539896, 1007.1311677737999, 1881)
-    femmesh.addNode(-26.130058708821963, 250.6581482014372, 109.10029106833252, 1882)
-    femmesh.addNode(-120.48941293911932, 213.34797913426053, -84.8979859560388, 1883)
-    femmesh.addNode(72.87612936603358, 212.0866296871667, -68.19450265355754, 1884)
-    femmesh.addNode(-30.942956676955504, 14.198950619017282, 60.014154710408526, 1885)
-    femmesh.addNode(-224.3084989821084, 15.460300066111117, 43.310671407927266, 1886)
-    femmesh.addNode(0.14572147335127283, 381.62853916401315, 961.8594662426572, 1887)
-    femmesh.addNode(177.71288844169618, 52.28603178031349, 1122.8082623907726, 1888)
-    femmesh.addNode(227.94121593258276, 294.77698813438263, 638.9213175584757, 1889)
-    femmesh.addNode(405.5083829009277, -34.56551924931702, 799.8701137065912, 1890)
-    femmesh.addNode(227.24844338764674, 341.8824036594096, 1046.2290295831808, 1891)
-    femmesh.addNode(-1637.28880336952, -1986.2038361664981, 3349.683561918092, 1892)
-    femmesh.addNode(1268.8569561336224, -332.78362592943176, -560.1696190729172, 1893)
-    femmesh.addNode(1290.7500208113875, -551.0016238815864, -557.3008087150222, 1894)
-    femmesh.addNode(1343.6368450366735, -263.58096860982374, -570.3166814298725, 1895)
-    femmesh.addNode(2314.053249042969, -531.8251951141322, 1847.7264787999225, 1896)
-    femmesh.addNode(1977.449719973648, -42.97999594117809, 1354.9531204732018, 1897)
-    femmesh.addNode(887.6326237410702, 2249.403573711029, -2055.609643004299, 1898)
-    femmesh.addNode(123.24286604915777, 2320.8947141783337, -1754.387212425469, 1899)
-    femmesh.addNode(775.9366324992042, 2403.0828916987793, -1246.563527485254, 1900)
-    femmesh.addNode(1295.8544715821636, 2877.6387115379603, -1168.798682885547, 1901)
-    femmesh.addNode(531.4647138902512, 2949.129852005265, -867.5762523067169, 1902)
-    femmesh.addNode(643.1607051321173, 2795.4505340175147, -1676.6223678257616, 1903)
-    femmesh.addNode(1917.2797653458224, -140.6881067275146, 799.165217471422, 1904)
-    femmesh.addNode(-643.2017779367496, -533.7515941226811, -381.509430487419, 1905)
-    femmesh.addNode(-662.238547753522, -502.43728507955666, -711.7307168135441, 1906)
-    femmesh.addNode(-750.8279646852221, -526.1958185965351, -442.29975002983815, 1907)
-    femmesh.addNode(1673.1455751747044, -18.302520548827175, 1241.7990270042642, 1908)
-    femmesh.addNode(1366.8814049561288, -51.58825135334132, 1387.0229923286513, 1909)
-    femmesh.addNode(1202.3409854853435, 340.00482977260424, 1036.1292236883055, 1910)
-    femmesh.addNode(1363.4213579178272, 242.2183805092879, 852.6894604477063, 1911)
-    femmesh.addNode(1527.9617773886125, -149.3747006166577, 1203.5832290880521, 1912)
-    femmesh.addNode(890.9180011120202, -956.8631018315814, 2561.9132200291506, 1913)
-    femmesh.addNode(294.37519685259235, -1181.7247804521298, 2052.61846876832, 1914)
-    femmesh.addNode(621.9870367308367, -1282.7680780518504, 2469.4046276362124, 1915)
-    femmesh.addNode(716.5132075115736, -887.8382191966067, 3352.8939562877913, 1916)
-    femmesh.addNode(119.97040325214583, -1112.699897817155, 2843.5992050269606, 1917)
-    femmesh.addNode(388.9013676333292, -786.7949215968861, 2936.107797419899, 1918)
-    femmesh.addNode(-1379.959932289761, -54.345035803265965, -1612.604820109429, 1919)
-    femmesh.addNode(-1460.9833073654509, 293.8906190113477, -1208.2443567357814, 1920)
-    femmesh.addNode(-1574.558679585824, 9.382295674390221, -969.076945870408, 1921)
-    femmesh.addNode(1340.9346892574156, -1854.762286230061, 365.5089438374493, 1922)
-    femmesh.addNode(1034.0682809194732, -1884.0265600264568, 591.9074897086032, 1923)
-    femmesh.addNode(-115.2729952498095, 34.04209851067368, 178.69252862912106, 1924)
-    femmesh.addNode(78.0925470553434, 32.78074906357985, 195.39601193160235, 1925)
-    femmesh.addNode(-109.98539809183276, 543.1679710851143, 292.70752006053914, 1926)
-    femmesh.addNode(84.03698880730911, 291.9599611966648, 340.1777642943829, 1927)
-    femmesh.addNode(-26.78690330281094, 500.60480864279293, 78.33353013697007, 1928)
-    femmesh.addNode(113.26231464522144, 634.5152611820339, 164.05452225759797, 1929)
-    femmesh.addNode(307.2847015443633, 383.3072512935843, 211.52476649144165, 1930)
-    femmesh.addNode(-2333.023356251374, 3405.5890737224527, -846.4771643485224, 1931)
-    femmesh.addNode(-3175.1872644790164, 2724.7254624478155, -642.0582705237947, 1932)
-    femmesh.addNode(-2704.9432829967554, 2917.6175250418873, -1586.8010094937426, 1933)
-    femmesh.addNode(3772.851542458109, -326.8773942767463, 1823.9225669149835, 1934)
-    femmesh.addNode(-364.2770622935786, -364.0926130493705, -1094.10633351509, 1935)
-    femmesh.addNode(-517.3030736582485, -234.39870195391956, -710.373862386093, 1936)
-    femmesh.addNode(108.3551315601374, 1412.1543392361482, -2240.1558852979883, 1937)
-    femmesh.addNode(-373.9867248623939, 1554.0401136212927, -2255.221237492533, 1938)
-    femmesh.addNode(-500.5704505932803, 798.9790566668577, -1931.9437948460077, 1939)
-    femmesh.addNode(48.11415806025117, 979.9832799991149, -1595.1309691934896, 1940)
-    femmesh.addNode(-434.22769836228014, 1121.8690543842595, -1610.1963213880342, 1941)
-    femmesh.addNode(174.6978837911376, 1735.04433695355, -1918.4084118400149, 1942)
-    femmesh.addNode(-2627.878021363001, -970.1012971622308, -1195.7348600712382, 1943)
-    femmesh.addNode(-2998.0719326574813, -1548.4389603759032, -1416.8823784902893, 1944)
-    femmesh.addNode(1974.5995758993072, 80.40894590715907, 670.0716717359235, 1945)
-    femmesh.addNode(1774.6658959433234, -384.2147706127721, 352.02344390555197, 1946)
-    femmesh.addNode(2453.3742721199333, -284.94611480106323, 389.430462514701, 1947)
-    femmesh.addNode(-2990.458756686034, -926.2416600919084, 785.2083777966899, 1948)
-    femmesh.addNode(-2862.9011654205406, -250.48566609628477, 1275.519276083012, 1949)
-    femmesh.addNode(-2941.276120973732, -197.22248160361494, 495.0827475128091, 1950)
-    femmesh.addNode(-3488.0298445209737, -310.9756853929288, -85.42955500304909, 1951)
-    femmesh.addNode(-3360.47225325548, 364.7803086026948, 404.88134328327317, 1952)
-    femmesh.addNode(-3409.6548889677824, -364.23886988559866, 695.006973567154, 1953)
-    femmesh.addNode(1528.107917817877, -733.9010005530373, 2285.6960872708264, 1954)
-    femmesh.addNode(568.9385014539246, 1465.1362154535127, 1446.6991388748377, 1955)
-    femmesh.addNode(543.5319998222835, 1799.1488847127762, 2193.2968442462943, 1956)
-    femmesh.addNode(873.7831059712735, 1185.123580262963, 2433.170452350997, 1957)
-    femmesh.addNode(1996.3623206701739, -508.24694681449705, 240.0426441831901, 1958)
-    femmesh.addNode(2053.682131223659, -287.14989417982343, 110.94909844769154, 1959)
-    femmesh.addNode(788.1547216078753, 6.7675821692892555, 2327.179921131664, 1960)
-    femmesh.addNode(284.47001120998334, -566.4619949581638, 2334.8483183256767, 1961)
-    femmesh.addNode(20.930631798610477, 648.0273822074271, -96.76333891863231, 1962)
-    femmesh.addNode(-1591.382154271132, -453.6103703885334, -1171.3200067266548, 1963)
-    femmesh.addNode(-660.8932613585962, -2378.288440756338, 611.3566137392718, 1964)
-    femmesh.addNode(-1173.5000657306446, -2424.5600410264883, 661.7398506755599, 1965)
-    femmesh.addNode(-510.7352412540502, -1943.0599915549553, 375.82735133584015, 1966)
-    femmesh.addNode(-273.07893659952975, -2090.4073486737652, 4.3467954628658845, 1967)
-    femmesh.addNode(-785.6857409715782, -2136.678948943915, 54.730032399154, 1968)
-    femmesh.addNode(-935.8437610761241, -2571.9073981452984, 290.25929480258554, 1969)
-    femmesh.addNode(1618.3632710974607, -141.75174854399015, -379.7408368433569, 1970)
-    femmesh.addNode(1616.727787956696, -250.54485567443226, -321.7823911920014, 1971)
-    femmesh.addNode(1651.8569201513512, -141.75174854399015, -254.74083684335753, 1972)
-    femmesh.addNode(1693.8974094855475, -1777.222879085769, -3204.231912135337, 1973)
-    femmesh.addNode(1863.433162625839, -1072.9678434408822, -3311.6511155421786, 1974)
-    femmesh.addNode(1486.7476198496588, -903.3154877346816, -3762.2248510292097, 1975)
-    femmesh.addNode(1267.0257961502587, -289.8252453366084, -2852.9371577686943, 1976)
-    femmesh.addNode(1097.4900430099674, -994.080280981495, -2745.5179543618533, 1977)
-    femmesh.addNode(652.9269498718811, -279.85718356407006, 936.3289509392234, 1978)
-    femmesh.addNode(626.0248216108726, -8.721396080161497, 1028.9012677634378, 1979)
-    femmesh.addNode(847.513575529617, 147.64009748460626, 981.0803076350057, 1980)
-    femmesh.addNode(577.4615818737216, -167.80039756364536, 828.6283863857509, 1981)
-    femmesh.addNode(874.4157037906256, -123.49568999930233, 888.5079908107914, 1982)
-    femmesh.addNode(1455.223946946291, -1567.896874324596, -298.1417385125976, 1983)
-    femmesh.addNode(1044.8540029358064, -1520.8724482320902, -560.7044441508552, 1984)
-    femmesh.addNode(894.6587366020501, -920.6530256269596, -338.16319447009596, 1985)
-    femmesh.addNode(1350.8538255320327, -1402.1033133739174, -519.8529267604839, 1986)
-    femmesh.addNode(1305.0286806125346, -967.6774517194655, -75.60048883183832, 1987)
-    femmesh.addNode(291.1114822237941, 1541.4165401741448, -421.8239945331415, 1988)
-    femmesh.addNode(-3783.4448311938922, 1585.2706177451332, -994.303154667147, 1989)
-    femmesh.addNode(-2963.9883879811186, 1154.682895946189, -738.982601820646, 1990)
-    femmesh.addNode(-3707.9130975339067, 919.2913767950838, -1381.9794992814423, 1991)
-    femmesh.addNode(-3429.540215313542, 1336.0628966428762, -1312.4929753120623, 1992)
-    femmesh.addNode(-2610.0837721007683, 905.4751748439322, -1057.172422465561, 1993)
-    femmesh.addNode(-2942.9748171133606, 1039.5207581660761, 2865.6321600563742, 1994)
-    femmesh.addNode(-2415.935548964091, 785.7396117885451, 1798.7818390115835, 1995)
-    femmesh.addNode(-2267.1095230241626, 1218.06058961629, 2323.3487877010366, 1996)
-    femmesh.addNode(-263.8309850898381, -444.19569382629794, 39.74839368839609, 1997)
-    femmesh.addNode(-394.92846524353195, -214.9121901350536, -60.850320097236676, 1998)
-    femmesh.addNode(-261.35127232619755, -245.74579239944148, -230.00766519637142, 1999)
-    femmesh.addNode(2163.26804400789, -3018.754343056172, -799.5362010839463, 2000)
-    femmesh.addNode(2766.6872063078945, -2918.461911625596, -824.3941011721768, 2001)
-    femmesh.addNode(-787.3109141709001, 1656.3759702607722, -825.6418110469077, 2002)
-    femmesh.addNode(-534.77787078408, 1248.198203574971, -698.1329107706099, 2003)
-    femmesh.addNode(-1163.626944704395, 1289.0352279186698, -1072.8743735299292, 2004)
-    femmesh.addNode(-650.8515388999818, 1500.0431361604938, -1236.8833847708715, 2005)
-    femmesh.addNode(-398.31849551316185, 1091.8653694746927, -1109.3744844945738, 2006)
-    femmesh.addNode(-22.002464979666797, 1459.2061118167953, -862.1419220115523, 2007)
-    femmesh.addNode(-1376.95339872656, -9.264964609709665, 1990.76560538273, 2008)
-    femmesh.addNode(-1266.0446053810533, -262.7641759265163, 2890.504326810051, 2009)
-    femmesh.addNode(-1340.5359780824351, 494.61850229718806, 3041.3013383228185, 2010)
-    femmesh.addNode(179.1939208332603, -869.3466677297006, -1562.1221191437394, 2011)
-    femmesh.addNode(-356.3493841615122, -576.7409932765688, -1522.1031342137135, 2012)
-    femmesh.addNode(-372.91963767410715, -898.4333823864004, -1319.0986149276894, 2013)
-    femmesh.addNode(-4.099378485408263, -851.5728985833077, -1018.7002884147159, 2014)
-    femmesh.addNode(162.62366732066533, -1191.0390568395321, -1359.1175998577153, 2015)
-    femmesh.addNode(2184.405781844651, 989.3139828023404, 1089.5192801305152, 2016)
-    femmesh.addNode(2529.4182130873996, 1312.9424987957714, 1613.5476688225438, 2017)
-    femmesh.addNode(430.571618722121, -79.05696281978229, 309.17786844982965, 2018)
-    femmesh.addNode(391.51711634707755, 41.08381997763061, 581.6096839224122, 2019)
-    femmesh.addNode(1107.9299632512293, 913.0884732761134, 977.7520670221002, 2020)
-    femmesh.addNode(1160.337078517864, 1040.0718810967119, 483.80112774364545, 2021)
-    femmesh.addNode(1195.853213192766, 1167.2936675131396, 806.0330009347256, 2022)
-    femmesh.addNode(1375.212296193128, 979.0850933042291, 369.0529471289999, 2023)
-    femmesh.addNode(1287.2890462515911, 724.8798990672028, 540.7720132163745, 2024)
-    femmesh.addNode(1573.9899615309919, 1246.017034225486, -665.684052601267, 2025)
-    femmesh.addNode(1773.2146513521002, 1141.6627906852189, -1060.0476903618762, 2026)
-    femmesh.addNode(1266.6528527563448, 1740.2063583156535, -920.6380123453558, 2027)
-    femmesh.addNode(777.6763435605535, -1008.8269012959097, 367.71900509850127, 2028)
-    femmesh.addNode(674.1728078880112, -932.5382014070078, -121.24224641091018, 2029)
-    femmesh.addNode(1084.542751898496, -979.5626274995136, 141.32045922734744, 2030)
-    femmesh.addNode(620.5612403376573, -1113.358042683804, -1484.9550680878065, 2031)
-    femmesh.addNode(-359.74780050698746, 125.95974882426546, 46.19840388292491, 2032)
-    femmesh.addNode(-391.63955937498065, 240.43390191068815, 3.484665748121124, 2033)
-    femmesh.addNode(1685.4820137883685, 3402.080455047256, 1119.8557325589616, 2034)
-    femmesh.addNode(1880.536072160572, -3629.281231808513, -1105.460173957345, 2035)
-    femmesh.addNode(2048.978786319014, -3305.6197549616363, -135.8855187338993, 2036)
-    femmesh.addNode(2697.028324829881, -3328.9240577841006, -300.63604776243847, 2037)
-    femmesh.addNode(-2640.062482409553, 2163.218483716992, 2496.9142398369772, 2038)
-    femmesh.addNode(-846.2165799475958, -109.24921970052281, 638.9464531963395, 2039)
-    femmesh.addNode(-594.8198312721993, -192.380042054175, 484.5538141398904, 2040)
-    femmesh.addNode(-637.8053855948358, -211.0431576900812, 685.3108722312377, 2041)
-    femmesh.addNode(-541.5888056472375, -101.79393798955843, 479.37712092711604, 2042)
-    femmesh.addNode(2253.2836243605807, -883.5485018263348, -1371.7863897433372, 2043)
-    femmesh.addNode(1690.539216453648, -801.2518453444331, -2012.2118897030857, 2044)
-    femmesh.addNode(1545.4106961088619, -697.6599084956479, -1470.5848781490508, 2045)
-    femmesh.addNode(65.22469994156552, -1452.160128411452, -2976.734129714005, 2046)
-    femmesh.addNode(-536.7007213876026, -1930.3461548278146, -2448.1377673610114, 2047)
-    femmesh.addNode(-684.491079972762, -1307.3760452836848, -2561.5808931761662, 2048)
-    femmesh.addNode(-978.5679271207931, -918.3656308590653, -3073.692315255933, 2049)
-    femmesh.addNode(-1580.493348449961, -1396.551657275428, -2545.095952902939, 2050)
-    femmesh.addNode(-830.7775685356337, -1541.3357404031951, -2960.249189440778, 2051)
-    femmesh.addNode(-393.2414495608772, 125.95974882426546, 171.19840388292448, 2052)
-    femmesh.addNode(-289.0188437967118, -91.91765031359189, 257.4941247461943, 2053)
-    femmesh.addNode(-398.05434752901067, -110.49944875815446, 122.11226752500048, 2054)
-    femmesh.addNode(2129.4976007556807, 1570.5949919186514, -648.675268066434, 2055)
-    femmesh.addNode(1591.37320964417, 2024.7094083768498, -1078.0234647193734, 2056)
-    femmesh.addNode(1794.3911181376325, 2070.697129042267, -320.2118498621337, 2057)
-    femmesh.addNode(-2869.9348872121664, -220.863102233772, 2645.816329422289, 2058)
-    femmesh.addNode(-3503.412454468663, -517.5318606932125, 2217.222020185667, 2059)
-    femmesh.addNode(-3093.2522858534767, 104.19859816218757, 2272.0463922456033, 2060)
-    femmesh.addNode(-2501.923632517657, -357.7743857291782, 1620.469278426829, 2061)
-    femmesh.addNode(430.5549218649114, 417.77922815829277, -81.03536506513194, 2062)
-    femmesh.addNode(-127.3156931674711, -672.0292573820834, 1110.4809467228413, 2063)
-    femmesh.addNode(-885.3064971694544, 1514.8265289684916, 438.97186930126844, 2064)
-    femmesh.addNode(-997.3460937036814, 1859.2251611047532, 192.49480842788884, 2065)
-    femmesh.addNode(-519.0443396983966, 1564.9925135065296, 576.8994885594564, 2066)
-    femmesh.addNode(273.221834654949, -267.0504633376546, -462.89259567128283, 2067)
-    femmesh.addNode(427.4215223512085, -77.81771841269891, -389.4962744117702, 2068)
-    femmesh.addNode(217.98764746615547, -104.38407618207911, -335.59239105218546, 2069)
-    femmesh.addNode(-14.942045798064896, 1603.6109283348856, 997.5365559913785, 2070)
-    femmesh.addNode(313.2117576077387, 1432.0278235324104, 623.7087971719309, 2071)
-    femmesh.addNode(164.05475226877553, 1725.2473324967984, 270.25358706606363, 2072)
-    femmesh.addNode(173.4277030485585, 2011.5985753763975, 866.1313686111803, 2073)
-    femmesh.addNode(3367.7596056919324, 2574.747308069146, -421.27359205258085, 2074)
-    femmesh.addNode(2807.99884898678, 1716.0007551799645, -223.46125267343706, 2075)
-    femmesh.addNode(2472.892366368732, 2216.10289230358, 105.0021655308633, 2076)
-    femmesh.addNode(-1062.5992883045394, 67.69549322250727, -1712.92799988998, 2077)
-    femmesh.addNode(-1143.6226633802294, 415.931148037121, -1308.5675365163322, 2078)
-    femmesh.addNode(-954.468928695384, 83.16119832716606, -1254.0071393269443, 2079)
-    femmesh.addNode(741.9322140209022, -1028.6627099334075, -723.1927087246708, 2080)
-    femmesh.addNode(1047.9320366171287, -909.8935750752348, -682.3411913342994, 2081)
-    femmesh.addNode(-1760.4919155984212, -144.7656084652489, 3528.302002544825, 2082)
-    femmesh.addNode(-1834.9832882998028, 612.6170697584555, 3679.0990140575923, 2083)
-    femmesh.addNode(-1381.407854359625, -21.362456726067926, 3995.972804514739, 2084)
-    femmesh.addNode(1317.6765121708067, -128.1312852788253, 620.8973205236692, 2085)
-    femmesh.addNode(1446.9790900227654, 58.51399500973395, 849.8435987595194, 2086)
-    femmesh.addNode(1409.182863116916, -128.13128527882532, 529.3909695775592, 2087)
-    femmesh.addNode(1597.3112678187213, 1858.9221339480237, 139.95966665333304, 2088)
-    femmesh.addNode(891.9142313943369, 336.60889833691346, 575.2840516889213, 2089)
-    femmesh.addNode(851.6254074480293, 229.76789746690454, 617.3584999989582, 2090)
-    femmesh.addNode(773.1737673137391, 294.6595909114152, 535.3692445681803, 2091)
-    femmesh.addNode(675.560376556823, 280.8749757989346, 952.322034955846, 2092)
-    femmesh.addNode(626.9971368196722, 121.79597431545074, 752.0491535781591, 2093)
-    femmesh.addNode(1580.3335412831057, -426.911640632838, -87.90633462710136, 2094)
-    femmesh.addNode(1518.6787773021852, -431.63982361502656, -182.53649153316934, 2095)
-    femmesh.addNode(1493.081082623284, -528.7163535053667, -64.01683535306671, 2096)
-    femmesh.addNode(-146.61941885942724, -218.62405234548106, -957.9975474773498, 2097)
-    femmesh.addNode(1306.4120672861031, 813.340207078501, 40.68170647011428, 2098)
-    femmesh.addNode(1364.0465663728155, 549.2357898872059, 263.2555749821616, 2099)
-    femmesh.addNode(1171.7068457516161, 789.2489581913615, 286.0226753741582, 2100)
-    femmesh.addNode(-1296.6726462934653, 1030.979722466625, 3785.541118257045, 2101)
-    femmesh.addNode(-551.4462307320488, 921.8815607705209, 3971.6926834544474, 2102)
-    femmesh.addNode(-843.0972123532874, 397.0001959821016, 4102.414908714192, 2103)
-    femmesh.addNode(-595.3095625210185, 385.5203406010839, 3227.452903520221, 2104)
-    femmesh.addNode(248.08911139719515, -3268.9391436590117, -917.6329176416651, 2105)
-    femmesh.addNode(707.413730815722, -2636.3032785409514, -967.5216183499791, 2106)
-    femmesh.addNode(1589.8647064413747, 3950.6030635646375, -70.11722791141472, 2107)
-    femmesh.addNode(910.4562316742376, 3158.422382086854, -148.4532272277499, 2108)
-    femmesh.addNode(1498.872380075626, 2923.6264322033776, -410.9870680283072, 2109)
-    femmesh.addNode(2515.126127752813, -1059.810808088601, 1390.7522509847336, 2110)
-    femmesh.addNode(3363.019135158206, -2057.4056285385805, -1332.024437078257, 2111)
-    femmesh.addNode(3393.675504295459, -1468.5721489829386, -1496.725659950488, 2112)
-    femmesh.addNode(3306.5043375256055, -1867.2948371319385, -2044.1084111656928, 2113)
-    femmesh.addNode(-365.9153776984247, 1436.1479157335525, 1274.1111168699822, 2114)
-    femmesh.addNode(-375.2883284782077, 1149.7966728539534, 678.2333353248654, 2115)
-    femmesh.addNode(-52.474616978177394, 1088.6161786273406, 654.0300096468798, 2116)
-    femmesh.addNode(-1505.1702673169834, -654.3660409512861, -245.15781279847147, 2117)
-    femmesh.addNode(-1590.8772050040561, -597.5334224804053, -193.1636749830334, 2118)
-    femmesh.addNode(-1487.3989180542235, -700.9755384979036, -120.70566189971913, 2119)
-    femmesh.addNode(-1199.5361475535133, 1319.0389128282366, -1573.6962104233896, 2120)
-    femmesh.addNode(-1149.726354676457, 2204.531253854366, -1583.9970009000144, 2121)
-    femmesh.addNode(-933.1025141387554, 1826.3571720781315, -1957.3099375171773, 2122)
-    femmesh.addNode(-384.41790548522386, 2007.361395410389, -1620.497111864659, 2123)
-    femmesh.addNode(-3317.160608632539, 1297.0083201568223, -1841.6248136938282, 2124)
-    femmesh.addNode(-3093.1233783252037, 1509.8391347694474, -2473.004041271376, 2125)
-    femmesh.addNode(-3038.7877264121744, 1713.7798400046147, -1772.138289724448, 2126)
-    femmesh.addNode(-2386.046541793433, 1118.3059894565577, -1688.5516500431088, 2127)
-    femmesh.addNode(394.4872568815347, 1309.3686518002855, 2944.955014608285, 2128)
-    femmesh.addNode(-154.61383795903086, 1400.1819383019938, 2345.072507898486, 2129)
-    femmesh.addNode(194.33087035856875, -656.0897348688261, -93.37774092730129, 2130)
-    femmesh.addNode(364.7621907150087, -480.47942055257636, -248.33248678717828, 2131)
-    femmesh.addNode(-863.0141893999017, 42.10018159575604, 761.238005075568, 2132)
-    femmesh.addNode(-825.8473551497848, 123.86956267520867, 744.5455162056378, 2133)
-    femmesh.addNode(-738.0141893999005, 42.10018159575601, 727.744356021677, 2134)
-    femmesh.addNode(632.9734267776541, -677.7729288172218, -922.9236604837062, 2135)
-    femmesh.addNode(1749.929223423448, 1474.4847155730013, 686.9535883077538, 2136)
-    femmesh.addNode(-471.40899872810184, 148.9170660677267, -1024.3103031807273, 2137)
-    femmesh.addNode(-235.84995214987032, 287.6874424062913, -907.5071105398503, 2138)
-    femmesh.addNode(-1983.7802324235395, -3540.163427415441, 670.4656427117326, 2139)
-    femmesh.addNode(-2694.320783437517, -3257.457336904075, 285.0767111566995, 2140)
-    femmesh.addNode(945.0895375748481, 470.0855147410375, -480.722746727342, 2141)
-    femmesh.addNode(1032.7368057523956, 385.06054632533807, -552.9435653725726, 2142)
-    femmesh.addNode(1078.8898998190116, 474.799629678252, -424.59497666567563, 2143)
-    femmesh.addNode(2115.6229035840156, -8.937473289418705, -2522.277799311528, 2144)
-    femmesh.addNode(2245.7718709242845, 503.5505851560922, -2077.013292845241, 2145)
-    femmesh.addNode(-933.5852995587, -2456.721728668923, 1108.3676833422633, 2146)
-    femmesh.addNode(-783.4272794541539, -2021.49327946754, 872.8384209388316, 2147)
-    femmesh.addNode(-270.82047508210553, -1975.22167919739, 822.4551840025435, 2148)
-    femmesh.addNode(2638.2285349877848, -2212.200019276401, -268.351923207966, 2149)
-    femmesh.addNode(439.5463358879632, 36.40879399246372, -418.02694611175605, 2150)
-    femmesh.addNode(385.9402396556468, 30.123439255454358, -301.33450110848685, 2151)
-    femmesh.addNode(501.94416915454315, 219.28456715732256, -307.7068152088598, 2152)
-    femmesh.addNode(376.2768946406369, 176.85130396025846, -530.2485202407163, 2153)
-    femmesh.addNode(555.5502653868596, 225.5699218943319, -424.399260212129, 2154)
-    femmesh.addNode(-877.5970160465799, 288.3454440223994, -1121.0726528942407, 2155)
-    femmesh.addNode(-1194.9576600318014, 166.3049149966262, -1020.7494731136899, 2156)
-    femmesh.addNode(-1384.1113947166468, 499.07486470658114, -1075.3098703030778, 2157)
-    femmesh.addNode(-1289.3794597533235, -2026.544640603878, -133.6954685850147, 2158)
-    femmesh.addNode(-1051.723155098803, -2173.891997722688, -505.176024457989, 2159)
-    femmesh.addNode(-689.0666421622532, 3.4485053638371994, -1160.4190892184674, 2160)
-    femmesh.addNode(-523.3673561801925, -52.83615592137539, -830.3990732916998, 2161)
-    femmesh.addNode(-73.45748272164663, 2045.056489041579, -698.1207225970063, 2162)
-    femmesh.addNode(-702.3065566419617, 2085.8935133852774, -1072.8621853563257, 2163)
-    femmesh.addNode(63.001892549271545, 1888.7236549413005, -1109.3622963209702, 2164)
-    femmesh.addNode(-1508.5686836294449, -464.47774469152387, 350.7671840069763, 2165)
-    femmesh.addNode(-1545.6046816099247, -331.4834077136501, 391.0814687255638, 2166)
-    femmesh.addNode(-1459.961697620587, -382.35143963966175, 489.55276731519007, 2167)
-    femmesh.addNode(1023.0058778081218, 336.5683746745063, 560.8512364928118, 2168)
-    femmesh.addNode(971.4952947677577, 274.34430129362926, 616.3298711482531, 2169)
-    femmesh.addNode(994.472566578787, 1380.785604882477, -40.332789561211854, 2170)
-    femmesh.addNode(546.554652906786, 1800.2645569847632, -126.94962054641456, 2171)
-    femmesh.addNode(1093.3425860594887, 1853.1293179593538, -147.48419337794058, 2172)
-    femmesh.addNode(645.4246723874876, 2272.60827006164, -234.1010243631433, 2173)
-    femmesh.addNode(839.5548241788747, 1939.6378475080926, -499.89904459542333, 2174)
-    femmesh.addNode(-410.81736119322727, 255.32654903346867, 124.88074826885808, 2175)
-    femmesh.addNode(-220.15244560796384, 501.86615808988677, 61.630046834488816, 2176)
-    femmesh.addNode(-160.90096069561594, -5.151339166252484, 742.8355717805277, 2177)
-    femmesh.addNode(-161.59373324055196, 41.95407635877447, 1150.1432838052328, 2178)
-    femmesh.addNode(-202.84640295027154, 313.9386335170096, 982.0107117191988, 2179)
-    femmesh.addNode(-363.8930851192388, -72.84124481325607, 762.9868172570692, 2180)
-    femmesh.addNode(-202.15363040533552, 266.8332179919826, 574.7029996944934, 2181)
-    femmesh.addNode(1149.3933541467202, 2278.40108605031, 53.342835668130334, 2182)
-    femmesh.addNode(172.38419564362187, 1072.0386805820947, 267.17321995802604, 2183)
-    femmesh.addNode(-122.56214338990034, 1034.5362519932644, 216.2610301746941, 2184)
-    femmesh.addNode(-369.1616830617179, -2.2222818170688896, 560.2978925665246, 2185)
-    femmesh.addNode(-327.90901335199834, -274.206838975304, 728.4304646525588, 2186)
-    femmesh.addNode(1611.5195094935505, -333.07908611621167, 1200.7373673998654, 2187)
-    femmesh.addNode(-242.88999610373264, 529.5579920721868, 750.6277450092664, 2188)
-    femmesh.addNode(-279.8613425027238, 755.0642024524811, 680.711085418719, 2189)
-    femmesh.addNode(-442.11710122794955, 424.64952272527324, 524.9375855804876, 2190)
-    femmesh.addNode(-632.8168639006516, 348.18286465373023, 618.8779603149804, 2191)
-    femmesh.addNode(-669.7882102996427, 573.6890750340244, 548.9613007244332, 2192)
-    femmesh.addNode(-470.5611051754259, 678.5975443809381, 774.6514601532118, 2193)
-    femmesh.addNode(674.3185690758194, 823.7669476383617, 420.590343381276, 2194)
-    femmesh.addNode(956.8316280763523, 850.2357459838444, 400.77085598880376, 2195)
-    femmesh.addNode(789.9007695757941, 759.3978885142033, 675.3396812234923, 2196)
-    femmesh.addNode(653.176168339472, 697.752599170633, 569.8970700229081, 2197)
-    femmesh.addNode(935.689227340005, 724.2213975161155, 550.0775826304358, 2198)
-    femmesh.addNode(820.1070268400301, 788.590456640274, 295.32824478821954, 2199)
-    femmesh.addNode(2388.5837357939463, -37.71085597597167, -201.71741421086077, 2200)
-    femmesh.addNode(2788.275876690221, -35.507076597211466, 76.76394985614866, 2201)
-    femmesh.addNode(2195.4225700740312, 299.45348403867945, -69.9798580366724, 2202)
-    femmesh.addNode(2481.9095311268684, -71.8139509881371, 409.1872189665275, 2203)
-    femmesh.addNode(2082.2173902305935, -74.0177303668973, 130.70585489951807, 2204)
-    femmesh.addNode(437.2679410189888, -1095.584273537411, -941.533237358783, 2205)
-    femmesh.addNode(-13.921642615170665, -1640.5567478269452, -1198.8572131017283, 2206)
-    femmesh.addNode(229.2863407311435, -1611.2476656456558, -698.2484418203046, 2207)
-    femmesh.addNode(-136.62054446558608, -634.0429836601546, -115.24477677632609, 2208)
-    femmesh.addNode(-154.7954813575392, -425.61389538173535, 175.1302509095899, 2209)
-    femmesh.addNode(-1521.5708363581657, -298.1565360331667, 1782.351022289689, 2210)
-    femmesh.addNode(-627.8385678038434, 3815.8021260486553, 1674.3830941261235, 2211)
-    femmesh.addNode(-874.8816413294101, 2736.3859190501553, 1214.58626457899, 2212)
-    femmesh.addNode(-424.80902177388236, 3706.7896698087175, 975.6935300371558, 2213)
-    femmesh.addNode(22.325485048647195, 4013.789996937065, 1570.4683714138487, 2214)
-    femmesh.addNode(-224.7175884769195, 2934.373789938565, 1110.6715418667154, 2215)
-    femmesh.addNode(-427.7471345068805, 3043.386246178503, 1809.3611059556831, 2216)
-    femmesh.addNode(2559.1820440257607, 879.5616383723415, -545.7463459526284, 2217)
-    femmesh.addNode(2061.067533189449, 1098.7849606219124, -706.0983492930384, 2218)
-    femmesh.addNode(2003.6744048010723, 554.9836806791759, -562.7551304874612, 2219)
-    femmesh.addNode(2074.4981776345944, 452.8069446846231, -339.1425330052582, 2220)
-    femmesh.addNode(1576.3836667982828, 672.030266934194, -499.4945363456683, 2221)
-    femmesh.addNode(2131.8913060229715, 996.6082246273595, -482.4857518108354, 2222)
-    femmesh.addNode(1148.0850224259818, -1880.7941618972686, -3542.114906350772, 2223)
-    femmesh.addNode(758.8274455862907, -1971.5589551440821, -2525.4080096834155, 2224)
-    femmesh.addNode(551.6776559504017, -1097.6515637929947, -3083.400948577288, 2225)
-    femmesh.addNode(-1441.3515440107758, -1217.7806710441964, 906.6160156470341, 2226)
-    femmesh.addNode(-2354.321140547564, -1110.1836565245878, 1027.2355470743998, 2227)
-    femmesh.addNode(-1712.6154056769033, -936.8588280262193, 541.7491839886909, 2228)
-    femmesh.addNode(584.4320055407424, -2680.047543623583, 1932.615707198184, 2229)
-    femmesh.addNode(51.821308233528526, -2208.7617083952005, 1694.7325118320657, 2230)
-    femmesh.addNode(-526.65943317761, -2615.5465500760843, 1822.651191522, 2231)
-    femmesh.addNode(639.440976353321, -343.2395136924455, 1204.3881987345335, 2232)
-    femmesh.addNode(1586.3432071704904, -614.4477850538692, -971.0417000574719, 2233)
-    femmesh.addNode(2294.216135422209, -800.3363783845562, -872.2432116517582, 2234)
-    femmesh.addNode(1811.4729782034078, -630.05266992524, -566.227837314032, 2235)
-    femmesh.addNode(247.6128892218039, 38.266793039912756, 282.8661306583194, 2236)
-    femmesh.addNode(2915.189540226611, 1165.0620461285162, -68.32793222709074, 2237)
-    femmesh.addNode(2857.796411838234, 621.2607661857796, 75.01528657848638, 2238)
-    femmesh.addNode(3103.842533673173, 141.34194210188474, -443.94198009612074, 2239)
-    femmesh.addNode(3459.8500298740228, 426.8423498580593, 33.476433629416874, 2240)
-    femmesh.addNode(3161.23566206155, 685.1432220446211, -587.2851989016979, 2241)
-    femmesh.addNode(-1799.546171586689, -906.6080515748408, 3399.1986152963486, 2242)
-    femmesh.addNode(-1376.2379314630018, -1392.7822640022869, 3802.7702639390154, 2243)
-    femmesh.addNode(28.677204008508568, 163.47695741843467, -852.8682355611666, 2244)
-    femmesh.addNode(311.66854295239943, 111.00584305637277, -767.6611950043584, 2245)
-    femmesh.addNode(-559.8250749068505, 1867.161012587838, 2465.6962623816253, 2246)
-    femmesh.addNode(-996.1723505469407, 1739.6351016826086, 2840.0949955338656, 2247)
-    femmesh.addNode(-638.0722382153198, 2598.0352749367994, 2434.5191359350088, 2248)
-    femmesh.addNode(1060.572611605017, -966.6269692264578, 752.8097488069602, 2249)
-    femmesh.addNode(1220.320069004588, -1325.8233861018343, 1027.2298015765155, 2250)
-    femmesh.addNode(1527.1864773425305, -1296.5591123054382, 800.8312557053617, 2251)
-    femmesh.addNode(1367.4390199429595, -937.3626954300619, 526.4112029358065, 2252)
-    femmesh.addNode(1054.5872436240193, -288.3991562257113, -1210.4054914680714, 2253)
-    femmesh.addNode(-681.1389640301868, -209.19987486336106, -1588.4158899170911, 2254)
-    femmesh.addNode(-1319.0243855246065, -1540.2426993281765, -427.26240652214307, 2255)
-    femmesh.addNode(-1036.1018138685963, -980.5009578328329, -561.2723930525536, 2256)
-    femmesh.addNode(-1272.4943022245384, -1504.0159478873068, -827.6115119725682, 2257)
-    femmesh.addNode(-1373.0303910259208, -1403.0154298682269, -626.7468206037682, 2258)
-    femmesh.addNode(-1090.1078193699109, -843.273688372883, -760.7568071341789, 2259)
-    femmesh.addNode(-1136.6379026699788, -879.5004398137529, -360.4077016837536, 2260)
-    femmesh.addNode(268.15943573071127, 538.1072372316232, 129.245719920302, 2261)
-    femmesh.addNode(-571.5462775966956, -421.6513598488072, 278.11280059631184, 2262)
-    femmesh.addNode(-650.3733516701755, -500.9662020225513, 305.7872680354823, 2263)
-    femmesh.addNode(-621.760666731326, -426.4877917713185, 376.5035887243888, 2264)
-    femmesh.addNode(47.611181752151495, 1012.0293134513363, -922.4957856305479, 2265)
-    femmesh.addNode(345.1083889539552, 1014.7809251561246, -950.3540691129812, 2266)
-    femmesh.addNode(427.57085749471224, 1385.0837060738663, -833.0655682571054, 2267)
-    femmesh.addNode(16.66620627272897, -334.49384654995214, 903.7843679286432, 2268)
-    femmesh.addNode(3505.729522488634, -912.5302562194729, -1739.8303704966445, 2269)
-    femmesh.addNode(3733.675074263625, -319.63046213279097, -1921.51736439886, 2270)
-    femmesh.addNode(1995.7436644745007, 2762.789532958186, 2137.6863946066214, 2271)
-    femmesh.addNode(2500.2341398346493, 2426.815483459477, 1873.5316954693683, 2272)
-    femmesh.addNode(2778.0542345345534, 2085.065626442984, 2425.2542493326755, 2273)
-    femmesh.addNode(2024.927737727251, 1648.9165482944804, 1877.702367959797, 2274)
-    femmesh.addNode(-794.9911122645674, 877.3725048092033, -641.2724873240443, 2275)
-    femmesh.addNode(-349.061434999254, 797.5364487858469, -454.3937884600184, 2276)
-    femmesh.addNode(-465.1642240522617, 801.0214052095122, -758.4867743896054, 2277)
-    femmesh.addNode(-418.6750817310723, 1244.713247151306, -394.03992484102287, 2278)
-    femmesh.addNode(-310.3722698168638, 614.0256590050865, -644.1179718280097, 2279)
-    femmesh.addNode(-756.3019470821771, 693.8617150284429, -830.9966706920357, 2280)
-    femmesh.addNode(-92.61236917032392, 601.9639146081122, -846.1660046756602, 2281)
-    femmesh.addNode(-538.5420464356373, 681.7999706314686, -1033.0447035396862, 2282)
-    femmesh.addNode(-383.75009220023935, 494.8042244270428, -918.6759009780903, 2283)
-    femmesh.addNode(500.367101715924, -471.6921460974705, 739.1514066060917, 2284)
-    femmesh.addNode(797.3212236328279, -427.38743853312747, 799.0310110311322, 2285)
-    femmesh.addNode(588.9920485112896, -711.1365527721977, 1116.2157875088928, 2286)
-    femmesh.addNode(885.9461704281935, -666.8318452078546, 1176.0953919339333, 2287)
-    femmesh.addNode(733.3863222722364, -858.6668077412551, 978.9178476008016, 2288)
-    femmesh.addNode(1653.3348971153225, 468.9979594709149, -762.1085170468787, 2289)
-    femmesh.addNode(1189.1444345553537, 216.45697252239864, -694.0515355078708, 2290)
-    femmesh.addNode(1254.644046210169, 94.92490417554151, -700.3445183012698, 2291)
-    femmesh.addNode(1299.1682218952296, 200.4744040647439, -634.2404842636439, 2292)
-    femmesh.addNode(-430.284222904967, -135.24634364128715, -352.1199327213732, 2293)
-    femmesh.addNode(-157.53218628320846, -47.85811333129209, -358.2163225603375, 2294)
-    femmesh.addNode(-39.897871680109816, 597.2478977191904, 730.4764995327248, 2295)
-    femmesh.addNode(-150.7217637902299, 805.8927451653186, 468.63226537531204, 2296)
-    femmesh.addNode(144.22457524329235, 843.3951737541489, 519.544455158644, 2297)
-    femmesh.addNode(2018.5621188862083, -2586.0618744692565, 2710.379131512097, 2298)
-    femmesh.addNode(1154.5977340380505, -1754.0539132802328, 2707.2878230023307, 2299)
-    femmesh.addNode(1367.147890330683, -276.2065421698122, -1068.1996697619566, 2300)
-    femmesh.addNode(1592.2776613636006, -291.81142704118304, -663.3858070185166, 2301)
-    femmesh.addNode(1600.036799264306, -638.3605998784429, -720.131970645835, 2302)
-    femmesh.addNode(77.10955246315334, -10.840933901279243, -204.75067782097824, 2303)
-    femmesh.addNode(171.4689066934507, 26.46923516589743, -10.75240079660692, 2304)
-    femmesh.addNode(-409.527899885596, -813.0239624657845, 1090.3147306929727, 2305)
-    femmesh.addNode(-465.78987020197064, 233.61682442877654, -310.16358322146255, 2306)
-    femmesh.addNode(-193.03783358021212, 321.0050547387716, -316.2599730604269, 2307)
-    femmesh.addNode(-464.1879800160734, 348.09097751519926, -227.87732135626698, 2308)
-    femmesh.addNode(-1725.0118082161534, 42.55099001313479, 442.10532159423076, 2309)
-    femmesh.addNode(-1658.6670456151496, 130.23419837434625, 521.6383812377061, 2310)
-    femmesh.addNode(-1639.3688242268156, -8.317041912876832, 540.576620183857, 2311)
-    femmesh.addNode(-604.3093684854324, -1536.3522144661076, 872.4042968330111, 2312)
-    femmesh.addNode(-237.75174210381616, -1526.4438399513251, 1304.654378854057, 2313)
-    femmesh.addNode(-947.0031041666933, 910.8611461424355, -1446.187310147092, 2314)
-    femmesh.addNode(236.52313867629243, 543.5988905241412, -554.1144549333344, 2315)
-    femmesh.addNode(235.39879963763474, 270.39444624105835, -399.40680700950907, 2316)
-    femmesh.addNode(1812.9093005028626, 348.6130851847675, 1004.0593518328559, 2317)
-    femmesh.addNode(2119.284580063518, -940.4969456737106, -2309.3206735371195, 2318)
-    femmesh.addNode(2339.006403762918, -1553.9871880717837, -3218.6083667976345, 2319)
-    femmesh.addNode(-3828.609335874631, -910.1693848616533, 875.4884295431098, 2320)
-    femmesh.addNode(-3750.23438032144, -963.432569354323, 1655.9249581133126, 2321)
-    femmesh.addNode(-4247.805468156379, -348.16659465534354, 785.2870253135738, 2322)
-    femmesh.addNode(2166.112457590727, -1282.2711899753347, -1919.169140958542, 2323)
-    femmesh.addNode(-971.2165799475971, -109.24921970052279, 672.4401022502306, 2324)
-    femmesh.addNode(-1416.4361103917317, 475.50626419549485, -467.32324104073007, 2325)
-    femmesh.addNode(-1463.7290541885363, 525.3841244475768, -380.40534925826057, 2326)
-    femmesh.addNode(-1518.2756042467768, 407.0592525986206, -448.8591166289613, 2327)
-    femmesh.addNode(3418.55835571878, -1311.2529443684728, -2287.2131217118495, 2328)
-    femmesh.addNode(1574.68585177933, 616.8733211071806, 75.07094686913186, 2329)
-    femmesh.addNode(1587.57212396135, 1063.2497549064137, 288.20791820613056, 2330)
-    femmesh.addNode(40.03497355682313, -2403.341025701404, 877.3996308441507, 2331)
-    femmesh.addNode(381.98040767849136, 2391.5606317718734, 1043.1596453940024, 2332)
-    femmesh.addNode(-1108.8309292050676, -1757.949156828981, 1770.1765396337062, 2333)
-    femmesh.addNode(-1543.930475419338, -1594.5580433472928, 1375.1769339276889, 2334)
-    femmesh.addNode(482.9729352679692, 13.36807006371265, 2980.734714408359, 2335)
-    femmesh.addNode(761.8090852917616, -275.98973920998435, 2791.0134572439406, 2336)
-    femmesh.addNode(1245.999682631469, -3440.523264209957, 1637.107749783817, 2337)
-    femmesh.addNode(537.1367937366106, -2981.643296459205, 2996.8397552679553, 2338)
-    femmesh.addNode(-407.4521129925452, -2435.800459154918, 3393.8900327768815, 2339)
-    femmesh.addNode(-573.9546449817418, -2917.142302911707, 2886.875239591772, 2340)
-    femmesh.addNode(-493.7181808469106, -2799.264039948509, -398.88711828455496, 2341)
-    femmesh.addNode(-626.434356358058, 547.3388720741784, 210.01179707903128, 2342)
-    femmesh.addNode(-669.6403312355346, 543.9852225245284, 325.96357520536367, 2343)
-    femmesh.addNode(-617.963879573452, 933.5417247423891, 290.41223095991313, 2344)
-    femmesh.addNode(-857.3706869593698, -783.9378417358123, -1392.061479614833, 2345)
-    femmesh.addNode(-488.5504277706708, -737.0773579327197, -1091.6631531018595, 2346)
-    femmesh.addNode(-505.12068128326575, -1058.7697470425512, -888.6586338158353, 2347)
-    femmesh.addNode(2031.1042363832153, 2571.957963832575, -2411.798920183139, 2348)
-    femmesh.addNode(1378.4104699331688, 2489.7697863121293, -2919.6226051233543, 2349)
-    femmesh.addNode(1860.0543037361667, 1891.4262242394734, -3060.347485069721, 2350)
-    femmesh.addNode(716.5826910940218, 1568.8718341179274, -2704.1582078908805, 2351)
-    femmesh.addNode(1369.2764575440683, 1651.060011638373, -2196.334522950666, 2352)
-    femmesh.addNode(198.02041190879487, -469.1680377183914, -547.1192106289895, 2353)
-    femmesh.addNode(271.76090770380404, -4083.217658128216, -591.4363464521705, 2354)
-    femmesh.addNode(1127.699658636205, -3713.9935511060585, -58.470895775100416, 2355)
-    femmesh.addNode(959.2569444777628, -4037.6550279529347, -1028.045550998546, 2356)
-    femmesh.addNode(916.4490362054198, 3859.5913473461046, 626.8287184590372, 2357)
-    femmesh.addNode(495.97341436043735, 3067.2666046980876, 1099.1756682474593, 2358)
-    femmesh.addNode(642.8925401905926, 4033.6988597149298, 1233.0994334549864, 2359)
-    femmesh.addNode(478.3926553891439, 4183.519662224247, 273.5316544873521, 2360)
-    femmesh.addNode(57.917033544161384, 3391.194919576231, 745.8786042757741, 2361)
-    femmesh.addNode(331.4735295589887, 3217.0874072074057, 139.6078892798248, 2362)
-    femmesh.addNode(-330.88463748793106, -1462.6957653607196, -944.7659194163384, 2363)
-    femmesh.addNode(1936.62306332067, 1627.8948135206992, 116.08552320319276, 2364)
-    femmesh.addNode(1445.340178778312, 1506.0520704279816, -148.08945485919588, 2365)
-    femmesh.addNode(1784.6519742802611, 1275.0247500006571, -171.96359830933616, 2366)
-    femmesh.addNode(3018.0770932159776, 2875.80125682349, 786.0049351061754, 2367)
-    femmesh.addNode(2625.510321973459, 1831.6654739285577, 651.996087185284, 2368)
-    femmesh.addNode(-348.08354593864846, 1972.3165741327518, 458.77773746814216, 2369)
-    femmesh.addNode(-338.7105951588655, 2258.667817012351, 1054.6555190132588, 2370)
-    femmesh.addNode(-159.71379709202506, 2380.304221174264, 327.372550087944, 2371)
-    femmesh.addNode(-109.32855349784379, 293.2213106437586, 323.4742809919016, 2372)
-    femmesh.addNode(1240.9879314102143, 560.8300906405151, 313.0640752963153, 2373)
-    femmesh.addNode(2863.4400869638353, 448.74451629817827, -943.6447686568243, 2374)
-    femmesh.addNode(2920.8332153522124, 992.5457962409147, -1086.9879874624014, 2375)
-    femmesh.addNode(3465.4937049996242, 254.32609997045796, -985.1836216058939, 2376)
-    femmesh.addNode(-450.0824547011285, -101.79393798955846, 387.870769981006, 2377)
-    femmesh.addNode(-276.33660615422616, 24.165810834707116, 309.06917386393275, 2378)
-    femmesh.addNode(-774.1010930138688, 543.0295942929039, -1149.8478961805633, 2379)
-    femmesh.addNode(-1280.6154716839355, 753.7590149770856, -1104.0851135894004, 2380)
-    femmesh.addNode(-1014.5898243502862, 626.1733109623641, -916.5902299673089, 2381)
-    femmesh.addNode(1081.259864168747, 3617.2314956294595, 1272.6907316367096, 2382)
-    femmesh.addNode(1317.803492814714, 3333.972176869669, 1821.305511627826, 2383)
-    femmesh.addNode(509.91094982920845, 1186.8068186592188, 489.22324268369505, 2384)
-    femmesh.addNode(745.9939696848514, 1230.7003833587687, 495.8901690220937, 2385)
-    femmesh.addNode(-34.39356142838375, -2166.628174830449, -448.77581899286895, 2386)
-    femmesh.addNode(-521.7905738510767, -135.24634364128713, -443.6262836674828, 2387)
-    femmesh.addNode(261.05127655566054, -84.5430067961152, 221.70774972311256, 2388)
-    femmesh.addNode(354.42763619376785, -90.85452069379761, 15.559336994903319, 2389)
-    femmesh.addNode(448.85973397693783, -212.8879000695904, 234.98288710672728, 2390)
-    femmesh.addNode(251.84631231892365, -184.66077054853318, 146.3099554908987, 2391)
-    femmesh.addNode(176.15593346661564, -447.6606465904069, 196.9972867586147, 2392)
-    femmesh.addNode(382.82459394317607, -1035.0730691612075, 42.17175896543225, 2393)
-    femmesh.addNode(790.9671161372753, 1190.9494697696093, -123.36306131605355, 2394)
-    femmesh.addNode(1044.754878017889, 1104.4409402208705, 229.05178990142917, 2395)
-    femmesh.addNode(695.7116582457493, 1507.0450480203751, 226.50558955945266, 2396)
-    femmesh.addNode(214.95301869775236, 396.81937231897746, -49.2930946847886, 2397)
-    femmesh.addNode(120.593664467455, 359.50920325180084, -243.29137170915993, 2398)
-    femmesh.addNode(21.587476392599456, 398.0807217660713, -65.99657798726986, 2399)
-    femmesh.addNode(1644.8137343645142, 1143.840298230933, -442.0714551190639, 2400)
-    femmesh.addNode(-1428.126135374402, -980.470111163527, -202.03846162394433, 2401)
-    femmesh.addNode(-1482.1321408757167, -843.2428417035773, -401.5228757055695, 2402)
-    femmesh.addNode(-32.919212188160486, -49.25210008745381, -2175.0358041146524, 2403)
-    femmesh.addNode(-2449.7851928684104, -432.14561835942476, 1131.182396149851, 2404)
-    femmesh.addNode(-1692.74979535023, -47.466068267453664, 919.2942028360249, 2405)
-    femmesh.addNode(-1808.0794579977498, -258.8207898610562, 645.6960330641422, 2406)
-    femmesh.addNode(-1388.8000734171092, -251.11003132839235, -578.0827310823594, 2407)
-    femmesh.addNode(-1343.1148199470983, -375.81804228126293, -522.0059353443412, 2408)
-    femmesh.addNode(-1286.6927624251457, -335.4811412546352, -594.6940833185257, 2409)
-    femmesh.addNode(-1345.2298566496008, -420.54179488274553, 522.5156029111469, 2410)
-    femmesh.addNode(-1285.5527456433579, -425.6768134944433, 719.7761923479682, 2411)
-    femmesh.addNode(2271.7295459387183, 1127.7926763970836, -212.3778950011076, 2412)
-    femmesh.addNode(403.8872973652424, -474.68145424886495, -3196.844074392443, 2413)
-    femmesh.addNode(3919.071803376532, 1139.4373902721875, -1181.5210113130765, 2414)
-    femmesh.addNode(3614.8137604384574, 1570.2545123463506, -783.6225886088806, 2415)
-    femmesh.addNode(3595.6488497982846, 1665.97291089201, -1450.420796729252, 2416)
-    femmesh.addNode(2901.6683047120396, 1088.264194786574, -1753.786195582773, 2417)
-    femmesh.addNode(3762.4056940534383, -992.930088119404, -924.6558547460224, 2418)
-    femmesh.addNode(-875.6254158739612, -1106.8741677230182, 874.8740917863242, 2419)
-    femmesh.addNode(-986.604718452518, -910.7570428813445, 1107.5964003977638, 2420)
-    femmesh.addNode(-509.0677894923449, -1096.9657932082357, 1307.1241738073704, 2421)
-    femmesh.addNode(-1130.700651624567, -491.5767685452851, -1057.652729024686, 2422)
-    femmesh.addNode(-865.2983650914362, -571.289461508614, -964.0646789162095, 2423)
-    femmesh.addNode(-1006.4272861474747, -118.59202366193603, -1060.0959094379168, 2424)
-    femmesh.addNode(-1167.2985467598369, -203.60987095306953, -960.1674407825344, 2425)
-    femmesh.addNode(-901.8962602267061, -283.3225639163984, -866.5793906740577, 2426)
-    femmesh.addNode(-1026.1696257037984, -656.3073087997475, -864.136210260827, 2427)
-    femmesh.addNode(1233.492710862935, -1278.8792131783575, 1405.767020249139, 2428)
-    femmesh.addNode(1104.1401569460218, -1157.7335080862968, 1800.3394365779668, 2429)
-    femmesh.addNode(2260.292223010558, 994.4307170816453, -1100.4619870536476, 2430)
-    femmesh.addNode(2551.430066274881, 584.953891794854, 407.4385556888652, 2431)
-    femmesh.addNode(2022.0486823825524, 578.0790221357529, 690.773610028892, 2432)
-    femmesh.addNode(-1450.2532332150936, -906.3078082352113, -1075.2887762049475, 2433)
-    femmesh.addNode(-1219.5406047044492, -665.695361052634, -879.2356896202393, 2434)
-    femmesh.addNode(-1680.2221073510145, -627.7289628958823, -992.9029673222079, 2435)
-    femmesh.addNode(-1360.6695257604879, -212.99792320595608, -975.2669201419466, 2436)
-    femmesh.addNode(-208.09807215730123, 7.654005858897676, 429.92124733171295, 2437)
-    femmesh.addNode(-312.3206779214666, 225.53140499675504, 343.6255264684431, 2438)
-    femmesh.addNode(930.3668955412202, -315.8158055983166, 841.2018730969276, 2439)
-    femmesh.addNode(777.8070473852631, -507.65076813171703, 644.0243287637957, 2440)
-    femmesh.addNode(866.4319941806286, -747.0951748064442, 1021.088709666597, 2441)
-    femmesh.addNode(2570.3439137511914, 869.4918042105217, 408.3837375300071, 2442)
-    femmesh.addNode(2214.336417550341, 583.9913964543471, -69.03467619553047, 2443)
-    femmesh.addNode(1907.9700719869884, 547.6845220634215, 263.38859291484835, 2444)
-    femmesh.addNode(382.83738676349, 270.3566545936587, 94.06150399047044, 2445)
-    femmesh.addNode(-1005.7930723260706, -1204.5817743898544, -1927.7429957749298, 2446)
-    femmesh.addNode(-646.795077267134, -1946.7051398303993, -1807.5015939489688, 2447)
-    femmesh.addNode(-963.7580721398945, -1768.844157364174, -1553.4103002635788, 2448)
-    femmesh.addNode(1920.751627972326, 2453.637104658879, 2739.208813467797, 2449)
-    femmesh.addNode(1167.6251311650237, 2017.4880265103748, 2191.6569320949184, 2450)
-    femmesh.addNode(175.0358537606622, -755.45394297295, -797.0861922536149, 2451)
-    femmesh.addNode(482.9926023077114, -473.6830547288021, -650.1363870885166, 2452)
-    femmesh.addNode(745.224689566038, -813.8133852932632, -794.5834321936845, 2453)
-    femmesh.addNode(287.287116549046, -891.4943994489914, -668.7459639635933, 2454)
-    femmesh.addNode(1308.109882305056, 868.4971529055144, -533.8837767446859, 2455)
-    femmesh.addNode(1376.5399498712873, 1340.3071842022537, -476.4606955180815, 2456)
-    femmesh.addNode(-917.5198956059188, 674.9855293494493, 1256.7527910643958, 2457)
-    femmesh.addNode(-403.8676509969025, -726.3957479734918, -2456.3393581279233, 2458)
-    femmesh.addNode(-470.24976733129813, -1497.1874488429862, -1967.7619807049557, 2459)
-    femmesh.addNode(358.18490406016264, 1392.276909943251, 4.455566833783621, 2460)
-    femmesh.addNode(-324.1769319853376, 2439.532454647422, -2265.522027969158, 2461)
-    femmesh.addNode(-489.3028181685918, 1788.5011120662216, -2714.0933120171253, 2462)
-    femmesh.addNode(-615.8865438994783, 1033.4400551117865, -2390.8158693706, 2463)
-    femmesh.addNode(-1098.2284003220095, 1175.325829496931, -2405.8812215651446, 2464)
-    femmesh.addNode(354.7327147255639, 936.4413368503043, -1944.38945393208, 2465)
-    femmesh.addNode(1525.554950132942, 81.89445800654151, -617.0613010790528, 2466)
-    femmesh.addNode(1617.0613010790516, 81.89445800654148, -525.5549501329431, 2467)
-    femmesh.addNode(1570.0791258180025, 187.4439578957439, -550.9572670414269, 2468)
-    femmesh.addNode(559.1742400613427, 376.6778336345693, 295.25800718035174, 2469)
-    femmesh.addNode(451.188928669637, 386.1242782313021, 510.26831975553443, 2470)
-    femmesh.addNode(-2655.5206476896306, 216.6215479619053, -2295.8303761111256, 2471)
-    femmesh.addNode(1233.3761986481638, 298.6792244955677, 1655.5717278929628, 2472)
-    femmesh.addNode(1539.6403688667397, 331.96495530008184, 1510.3477625685755, 2473)
-    femmesh.addNode(3973.9244211679525, -854.8630072512152, 1366.9483390997943, 2474)
-    femmesh.addNode(2991.493382150292, -1181.7404015279603, 1645.7859341400463, 2475)
-    femmesh.addNode(-1104.2059374972287, 358.98453387762856, 632.0006819093326, 2476)
-    femmesh.addNode(-1580.0957578843131, 345.64975484497165, -586.4410754230144, 2477)
-    femmesh.addNode(1142.9475878350313, 153.3267923210995, 634.832585720137, 2478)
-    femmesh.addNode(1046.7852670644618, 232.16370941398714, 795.9709479596106, 2479)
-    femmesh.addNode(1194.4581708753954, 215.55086570197653, 579.3539510646957, 2480)
-    femmesh.addNode(1124.3299061364241, -635.0984933634606, -1193.240052381234, 2481)
-    femmesh.addNode(242.60239978822176, -1646.860969795852, -316.49390780985, 2482)
-    femmesh.addNode(720.2136804138895, -905.610980664732, 600.380628928178, 2483)
-    femmesh.addNode(320.9516772484797, -723.4314933291728, 535.0342594951486, 2484)
-    femmesh.addNode(356.38520227572394, -809.2275569296019, 945.8479854002898, 2485)
-    femmesh.addNode(-622.7298509197713, -2884.8410751729366, 1163.3121301838703, 2486)
-    femmesh.addNode(-234.91552616070484, -2596.9599830903635, 556.3023119074645, 2487)
-    femmesh.addNode(-1079.8548117389519, 475.2083897318182, -397.6394956294154, 2488)
-    femmesh.addNode(-1328.4731201765067, 599.0749962752127, -571.8627654566033, 2489)
-    femmesh.addNode(-1032.5618679421475, 425.3305294797362, -484.5573874118849, 2490)
-    femmesh.addNode(1191.552416897698, 1592.5605999767204, -500.50430607667863, 2491)
-    femmesh.addNode(1290.4224363783999, 2064.9043130535974, -607.6557098934073, 2492)
-    femmesh.addNode(1316.2863040084187, -1080.46467451387, -1344.7155313566914, 2493)
-    femmesh.addNode(1164.1589890409584, -694.7235998327401, -1873.4661370109854, 2494)
-    femmesh.addNode(-432.46137116331994, -450.589807339823, 85.41216244804676, 2495)
-    femmesh.addNode(-6.954205232777781, -505.7379431095006, 366.60165089234386, 2496)
-    femmesh.addNode(180.252117719482, -769.5632890727238, 298.61068815856765, 2497)
-    femmesh.addNode(345.6762756330761, -442.174602614074, 284.46740548533177, 2498)
-    femmesh.addNode(162.5661369336827, -500.2518991331677, 454.0717696190609, 2499)
-    femmesh.addNode(176.55740348753284, -575.9012383601153, 672.3321994032399, 2500)
-    femmesh.addNode(211.99092851477704, -661.6973019605443, 1083.145925308381, 2501)
-    femmesh.addNode(-499.99427933047184, -223.52393218374914, 404.0375943937364, 2502)
-    femmesh.addNode(310.27167469717864, -605.2084941944329, -418.77898233896804, 2503)
-    femmesh.addNode(-509.6713889186136, 1851.3437563861287, 1172.777270104573, 2504)
-    femmesh.addNode(-870.0176715987564, 1397.5295009051965, 853.47404943806, 2505)
-    femmesh.addNode(-778.1868195781373, -622.3454631955917, -348.18130116052646, 2506)
-    femmesh.addNode(-1433.4438548487174, 59.54859496307864, -2723.3510636318965, 2507)
-    femmesh.addNode(-1909.5898057524905, 551.6366075277361, -2882.2969240906823, 2508)
-    femmesh.addNode(-2124.728259735659, -146.10712873174884, -2788.7098986117717, 2509)
-    femmesh.addNode(-25.766640631224035, 892.8078788732926, -1197.0537147806285, 2510)
-    femmesh.addNode(-574.4512492847555, 711.8036555410354, -1533.8665404331466, 2511)
-    femmesh.addNode(-810.010295862987, 573.0332792024708, -1650.6697330740237, 2512)
-    femmesh.addNode(-1598.6756185817944, -1326.9517408892534, -1610.9702923650443, 2513)
-    femmesh.addNode(-1387.2533966004232, -927.6864063039861, -2052.2551057478186, 2514)
-    femmesh.addNode(-1318.052189605935, -745.9714435790605, -1505.7287573168016, 2515)
-    femmesh.addNode(956.3384480767193, -1774.156320772573, 1895.9292478056109, 2516)
-    femmesh.addNode(423.72775076950546, -1302.8704855441906, 1658.0460524394925, 2517)
-    femmesh.addNode(826.9858941598061, -1653.0106156805123, 2290.501664134438, 2518)
-    femmesh.addNode(-1533.1485150707558, 1161.9367816628867, -1231.5940138656981, 2519)
-    femmesh.addNode(-1928.2710908988388, 1305.7891394129306, -1794.9003376981318, 2520)
-    femmesh.addNode(-1711.647250361137, 927.6150576366963, -2168.2132743152943, 2521)
-    femmesh.addNode(-1316.524674533054, 783.7626998866524, -1604.9069504828608, 2522)
-    femmesh.addNode(2003.1348349062423, 293.54110972008516, 689.82842818775, 2523)
-    femmesh.addNode(-1210.8992407840733, 730.4236321177603, -278.00198422459073, 2524)
-    femmesh.addNode(-1088.8515248002368, 748.8821537669269, -294.216249827047, 2525)
-    femmesh.addNode(-1127.948442563089, 778.3537974844705, -181.8703860978837, 2526)
-    femmesh.addNode(-2368.065335631397, -613.0198027301132, 3131.073057456079, 2527)
-    femmesh.addNode(-3001.5429028878934, -909.6885611895536, 2702.478748219457, 2528)
-    femmesh.addNode(3069.5124357733575, -2215.8241681558893, 2086.846851120716, 2529)
-    femmesh.addNode(-369.67748356048753, -340.63655451140335, -2657.6884734305013, 2530)
-    femmesh.addNode(-449.7798901958416, -218.68750026123786, 305.64680626565945, 2531)
-    femmesh.addNode(-315.8590922619559, -435.4901830577019, 305.5068961444016, 2532)
-    femmesh.addNode(-397.75178302372376, -227.39301102983387, 39.888303809653934, 2533)
-    femmesh.addNode(-281.14950412235976, -212.29338674771282, 259.98303750600877, 2534)
-    femmesh.addNode(-1420.462110347893, -783.2048998356598, 3866.8694172662626, 2535)
-    femmesh.addNode(-842.7363652573661, -748.9383883539622, 3294.075975452718, 2536)
-    femmesh.addNode(1442.3935254188088, 2417.7743765736395, -319.6065883808784, 2537)
-    femmesh.addNode(-2589.1779629798593, 2344.6299399743534, 56.70592510002149, 2538)
-    femmesh.addNode(-2724.8451058177716, 3248.69326552593, -234.04608821742255, 2539)
-    femmesh.addNode(-1747.0140547522171, 3025.4935512489906, -147.71296872470617, 2540)
-    femmesh.addNode(809.2898500186716, 1489.1875212639889, -1602.4577592643727, 2541)
-    femmesh.addNode(3913.4281282509305, 1311.9536401597888, -162.86095607776588, 2542)
-    femmesh.addNode(4159.47425008587, 832.034816075894, -681.818222752373, 2543)
-    femmesh.addNode(618.5240363244582, 2108.3013130120835, 1591.774425385119, 2544)
-    femmesh.addNode(1193.0316327966648, 1683.4753572511115, 1445.0592267234615, 2545)
-    femmesh.addNode(1551.1178992519986, 768.0133939467421, -2178.3587485931685, 2546)
-    femmesh.addNode(1420.9689319117292, 255.52533550123115, -2623.623255059455, 2547)
-    femmesh.addNode(894.58870449904, 362.05358101292416, -2484.877502367355, 2548)
-    femmesh.addNode(627.2353970952031, 2988.332982189805, -2818.6487540600474, 2549)
-    femmesh.addNode(1279.9291635452496, 3070.5211597102507, -2310.8250691198323, 2550)
-    femmesh.addNode(1035.4572449362965, 3616.5681200167364, -1931.837793941295, 2551)
-    femmesh.addNode(-1884.0406167446222, -2141.853950515122, 276.3509191205268, 2552)
-    femmesh.addNode(-386.1322684603057, -1826.7271176536724, 3836.0561959987717, 2553)
-    femmesh.addNode(558.4566382688502, -2372.5699549579595, 3439.0059184898455, 2554)
-    femmesh.addNode(896.6517165521552, -2852.5009892842068, -2677.944402224688, 2555)
-    femmesh.addNode(807.6225633147226, 482.87594406337513, 2755.030703536261, 2556)
-    femmesh.addNode(312.5076678860279, 3577.29309923644, -1297.4648516921914, 2557)
-    femmesh.addNode(832.4255069689874, 4051.848919075621, -1219.7000070924842, 2558)
-    femmesh.addNode(253.44280485373838, 4110.513944196173, -931.6388905849094, 2559)
-    femmesh.addNode(472.3998508579617, 3482.3506969649975, -501.7502911994349, 2560)
-    femmesh.addNode(-47.517988224997794, 3007.7948771258166, -579.5151357991422, 2561)
-    femmesh.addNode(1551.349554865725, -430.78719690254815, 644.9494643980856, 2562)
-    femmesh.addNode(1751.2832348217087, 33.83651961738303, 962.9976922284571, 2563)
-    femmesh.addNode(1608.66936541921, -209.69014426787447, 515.855918662587, 2564)
-    femmesh.addNode(-640.1991580291694, 690.3767586047776, -526.9036847624485, 2565)
-    femmesh.addNode(579.5141208848918, -951.7427764082831, 363.95705759159705, 2566)
-    femmesh.addNode(1.5522325681209175, -1036.0662407926745, 208.01417559225723, 2567)
-    femmesh.addNode(184.66237126751435, -977.988944273581, 38.40981145852808, 2568)
-    femmesh.addNode(483.7613388978703, 559.0670930709385, 97.50344953995867, 2569)
-    femmesh.addNode(48.8389075379078, 2760.26627756974, 504.40082687076614, 2570)
-    femmesh.addNode(-1234.623841160997, 660.7008145404674, 123.29137582452786, 2571)
-    femmesh.addNode(-1172.5959672118036, 851.4088665629425, 298.97414393259754, 2572)
-    femmesh.addNode(-1312.8705584478944, 604.608932445943, 152.4832364898146, 2573)
-    femmesh.addNode(-842.8128890591972, 2220.049402183995, 634.0184515813366, 2574)
-    femmesh.addNode(-1377.8177169666924, -515.240298287529, 434.9718455545709, 2575)
-    femmesh.addNode(-815.3356867731936, -1348.2002247101316, -1017.728784103482, 2576)
-    femmesh.addNode(-1785.0894267712124, -1092.5374907589744, 122.83627606807323, 2577)
-    femmesh.addNode(-1675.9876769214168, -1652.310078923624, -102.3876688301255, 2578)
-    femmesh.addNode(-1439.5951885654747, -1128.79508886915, 163.95145008988914, 2579)
-    femmesh.addNode(-435.87292322720367, 2593.2117726351726, -1456.4759124501131, 2580)
-    femmesh.addNode(1666.5308640822477, 2030.2582388041005, 3297.097808108928, 2581)
-    femmesh.addNode(2523.833470644475, 1661.6867605882057, 2983.1432439738064, 2582)
-    femmesh.addNode(1787.045679547552, 701.0379827093652, -5.774082053737459, 2583)
-    femmesh.addNode(889.3881124986281, 560.1715890894277, 322.36964471037663, 2584)
-    femmesh.addNode(984.8217038613691, 491.26581956752045, 394.43460551387426, 2585)
-    femmesh.addNode(853.7300574475843, 491.3063432299276, 408.8674207099837, 2586)
-    femmesh.addNode(-2718.6054215517174, -411.47026948498205, -1372.7591276711948, 2587)
-    femmesh.addNode(-814.828560670738, -1624.176920366885, 1321.9360485588481, 2588)
-    femmesh.addNode(-540.6137844997102, 454.4446667619869, 306.19280738090265, 2589)
-    femmesh.addNode(2564.550265948632, 563.6135950074821, -1498.3604097578436, 2590)
-    femmesh.addNode(561.5244790945371, -768.5701174412567, 132.7682715317427, 2591)
-    femmesh.addNode(-569.1863536926679, 455.8778299501712, -202.66224913740135, 2592)
-    femmesh.addNode(-292.7008662490566, 609.5232336943978, -169.73194026989927, 2593)
-    femmesh.addNode(-142.1743997528015, 4163.610799446384, 610.9005924462144, 2594)
-    femmesh.addNode(-389.2174732783682, 3084.194592447883, 151.10376289908112, 2595)
-    femmesh.addNode(72.86915937380799, 66.00403247982973, 1501.2708402974522, 2596)
-    femmesh.addNode(-268.42173718597417, -377.9395125333381, 1726.6503692605843, 2597)
-    femmesh.addNode(75.95961550269583, -286.9150377069237, 2078.9720389088184, 2598)
-    femmesh.addNode(-273.29691294944837, -2769.933837061205, -3193.646412925763, 2599)
-    femmesh.addNode(-1023.0126928637758, -2625.1497539334378, -2778.493176387924, 2600)
-    femmesh.addNode(-873.1150580196072, -3164.884673716265, -2511.908370104972, 2601)
-    femmesh.addNode(-1136.5188664577613, -2325.2969914828745, -1766.3997245402204, 2602)
-    femmesh.addNode(-3120.113179411193, 2378.9820417470214, -1699.2454602368098, 2603)
-    femmesh.addNode(-3590.3571608934535, 2186.0899791529496, -754.5027212668618, 2604)
-    femmesh.addNode(-3236.452545013103, 1936.8822580506928, -1072.692541911777, 2605)
-    femmesh.addNode(-1119.2425132237595, 2947.119436274887, -1363.8773864248042, 2606)
-    femmesh.addNode(-671.822715189264, 2828.4816958057986, -852.7425708811152, 2607)
-    femmesh.addNode(-730.8875782215536, 3361.702540765531, -486.9166097738331, 2608)
-    femmesh.addNode(-494.9377862594932, 3126.432617594905, -1090.6499513428312, 2609)
-    femmesh.addNode(-1213.68203461256, -553.396369601512, -403.52705285828074, 2610)
-    femmesh.addNode(-1195.9106853498001, -600.0058671481295, -279.0749019595284, 2611)
-    femmesh.addNode(-1081.782725717434, -590.197121605569, -399.65057189439176, 2612)
-    femmesh.addNode(15.53904682879997, -892.3669711784328, 2242.3397259327385, 2613)
-    femmesh.addNode(-396.439162593142, -817.8099691025279, 2877.273198807783, 2614)
-    femmesh.addNode(1331.7717577216022, -242.09207970583188, 578.0730066416425, 2615)
-    femmesh.addNode(-565.5870668143809, 141.67183776824555, 808.6651276610855, 2616)
-    femmesh.addNode(-486.0665264683689, 99.57165617248945, 422.4271225855164, 2617)
-    femmesh.addNode(522.1898422306568, -32.08040548791415, -485.9367450864905, 2618)
-    femmesh.addNode(740.6455687375694, -183.2969998249154, -2714.1914050765945, 2619)
-    femmesh.addNode(1041.6420303100954, -1175.919457815991, -1762.2998938556236, 2620)
-    femmesh.addNode(-2270.6488339127154, -1767.619388834868, 307.65871887541596, 2621)
-    femmesh.addNode(-1409.9502627941918, -1615.0970301448515, 457.5183880270175, 2622)
-    femmesh.addNode(-1082.9209921946376, -1710.333758985093, -487.0095596760041, 2623)
-    femmesh.addNode(-799.9984205386274, -1150.5920174897494, -621.0195462064147, 2624)
-    femmesh.addNode(-846.5285038386955, -1186.8187689306192, -220.67044075598946, 2625)
-    femmesh.addNode(2486.216510606266, -783.2013136987897, -2982.6368009415773, 2626)
-    femmesh.addNode(2958.1280752638427, -332.6611859453993, -3102.5511779714416, 2627)
-    femmesh.addNode(2961.7897517433453, -1264.220658329691, -2889.5940521970333, 2628)
-    femmesh.addNode(-1256.1384998397193, -377.7284634604184, -781.7504013780875, 2629)
-    femmesh.addNode(-1790.967302749992, 691.397986861464, -128.81150125550113, 2630)
-    femmesh.addNode(-2107.051880888894, 519.061372599467, -331.6284659389211, 2631)
-    femmesh.addNode(-2185.6718210127956, 561.2086284699595, 94.18865189102621, 2632)
-    femmesh.addNode(-2100.6490663771488, 1027.8959687118409, -345.3401409608674, 2633)
-    femmesh.addNode(-2416.733644516051, 855.5593544498436, -548.1571056442874, 2634)
-    femmesh.addNode(-2022.0291262532473, 985.7487128413482, -771.1572587908147, 2635)
-    femmesh.addNode(2550.0637168545527, 2213.561945920036, -2649.2489316505716, 2636)
-    femmesh.addNode(1888.235938015406, 1292.663993725834, -2433.784534418098, 2637)
-    femmesh.addNode(-786.5119132306143, -875.4220299629058, -709.2875364003135, 2638)
-    femmesh.addNode(522.8866047115223, 404.2671071328996, 179.7824961110983, 2639)
-    femmesh.addNode(626.5310508610436, 488.9378201042207, 144.9922294200359, 2640)
-    femmesh.addNode(1290.5094921401233, 579.5786237184021, 773.2127260974692, 2641)
-    femmesh.addNode(962.9602742594483, 1093.1588317320834, -2408.391776524972, 2642)
-    femmesh.addNode(608.3137421786878, -227.1613854459945, 669.3312615431237, 2643)
-    femmesh.addNode(2152.751377970043, 26.128430670812435, -455.9424004168824, 2644)
-    femmesh.addNode(-436.348505426911, 46.316202391257, -472.1451436269799, 2645)
-    femmesh.addNode(-488.8687704861667, 137.15167062172713, -512.5461150475269, 2646)
-    femmesh.addNode(-527.8548563730208, 46.31620239125702, -563.6514945730896, 2647)
-    femmesh.addNode(513.0992241673443, -479.98120547740086, 201.04989029315803, 2648)
-    femmesh.addNode(-67.10937962457541, -435.01129354954224, -1973.6866888120749, 2649)
-    femmesh.addNode(-998.4996080154083, -331.2404038891343, -1488.0927101365403, 2650)
-    femmesh.addNode(-770.3146444964838, 59.19566325927546, -607.1974164936437, 2651)
-    femmesh.addNode(-895.3146444964837, 59.19566325927549, -640.6910655475339, 2652)
-    femmesh.addNode(-854.4165612353556, -63.71522857033543, -604.5140284285479, 2653)
-    femmesh.addNode(-65.59139852421816, -1703.069936092854, -430.609354210884, 2654)
-    femmesh.addNode(-315.5473712533649, -1265.0875581403375, -548.0566815192711, 2655)
-    femmesh.addNode(-302.23131219628664, -1300.7008622905337, -166.30214750881643, 2656)
-    femmesh.addNode(-7.353572940924984, -1208.8785918433355, -433.94123511823705, 2657)
-    femmesh.addNode(-1450.2399367630558, 2262.9943744982966, 3111.0480372056736, 2658)
-    femmesh.addNode(-1092.1398244314348, 3121.394547752487, 2705.4721776068163, 2659)
-    femmesh.addNode(-652.3008752873835, 2874.0314473991934, 3226.7154848738674, 2660)
-    femmesh.addNode(-518.3101352612264, 324.45229265924667, -350.5645546420095, 2661)
-    femmesh.addNode(-880.7477055849608, 1024.4964994724214, 325.68875267491757, 2662)
-    femmesh.addNode(1794.7487732193492, -1238.164410166405, 179.5023248030381, 2663)
-    femmesh.addNode(1752.7889911355157, -1042.056092926323, 559.8028283227966, 2664)
-    femmesh.addNode(1563.3724437083158, -869.3914179587949, 313.61384452854924, 2665)
-    femmesh.addNode(-2372.6146486353955, -744.331715574194, -2629.7253628074604, 2666)
-    femmesh.addNode(-1892.7524657298256, -937.941326464634, -2123.081714444811, 2667)
-    femmesh.addNode(2990.6373538297357, -232.12927230369198, -243.25626715993027, 2668)
-    femmesh.addNode(-797.5811176926456, -620.9194404742314, 59.30033439374476, 2669)
-    femmesh.addNode(-775.7445124408093, -563.5535320831625, 179.54642809554207, 2670)
-    femmesh.addNode(-693.4630334569247, -571.9230594585944, 94.71001707682143, 2671)
-    femmesh.addNode(837.1488000504355, 507.87866327953105, 611.0516024087892, 2672)
-    femmesh.addNode(734.9895933669864, 449.3570358044293, 368.9526135892428, 2673)
-    femmesh.addNode(-3454.229818756361, 211.487317795081, 1927.096389901786, 2674)
-    femmesh.addNode(-2452.740996805355, 371.2447927591153, 1330.3436481429485, 2675)
-    femmesh.addNode(-1068.7688199831296, 196.24247326051486, 695.5624014828396, 2676)
-    femmesh.addNode(-1031.6019857330127, 278.0118543399675, 678.8699126129093, 2677)
-    femmesh.addNode(-454.9439986953316, -406.55173556668615, 498.20753429266665, 2678)
-    femmesh.addNode(-3417.4243709150974, 625.9821368245108, 2395.534580770421, 2679)
-    femmesh.addNode(-2776.9130818669755, 893.0283314214385, 1453.8318366677663, 2680)
-    femmesh.addNode(1064.4893744942701, -586.0175898675309, 384.1962467746319, 2681)
-    femmesh.addNode(1212.829452349269, -518.6528374481061, 386.0190998056522, 2682)
-    femmesh.addNode(-1149.432289685235, 834.0442748609566, 946.5529143482671, 2683)
-    femmesh.addNode(-1340.6905249125862, 526.6961439577854, 1248.4978092091937, 2684)
-    femmesh.addNode(-1247.0098898671674, 1034.7023700307316, 1456.9640070271278, 2685)
-    femmesh.addNode(3887.9249594938938, -937.0085321296441, 710.105405793905, 2686)
-    femmesh.addNode(3946.826671052432, -1588.4842835688446, 1026.5457455266592, 2687)
-    femmesh.addNode(1057.375357504393, 4124.854637103696, -14.529462020222581, 2688)
-    femmesh.addNode(3088.6877815741304, 2053.4728797698276, 1476.2596760179706, 2689)
-    femmesh.addNode(2732.7010132132896, 1280.7267648771092, 807.1294076316303, 2690)
-    femmesh.addNode(3569.7906763999245, 1679.5072888346726, 1221.5639686903644, 2691)
-    femmesh.addNode(3366.5078762740345, 1711.723022753335, 2027.9822298812778, 2692)
-    femmesh.addNode(-1052.9869713973815, -1503.029650549404, 132.64365033499993, 2693)
-    femmesh.addNode(-816.8835780674126, -1673.1207102063206, 72.8964971811389, 2694)
-    femmesh.addNode(2210.685967943804, 3181.191200299022, -932.6049044806985, 2695)
-    femmesh.addNode(2007.6680594503414, 3135.2034796336047, -1690.416519337938, 2696)
-    femmesh.addNode(1763.1961408413883, 3681.2504399400905, -1311.429244159401, 2697)
-    femmesh.addNode(606.190414132908, -3885.7266173929156, -1706.4876489322478, 2698)
-    femmesh.addNode(-354.9127757594652, -3706.5543162839012, -1779.2740469668615, 2699)
-    femmesh.addNode(1590.9756913451915, -68.16522049065144, -809.1999203081028, 2700)
-    femmesh.addNode(1722.167831899047, 1448.5451335398436, -1529.810183706587, 2701)
-    femmesh.addNode(1215.6060333032915, 2047.0887011702782, -1390.4005056900664, 2702)
-    femmesh.addNode(1134.0102069064967, 1773.690571325185, -1759.8432116383904, 2703)
-    femmesh.addNode(-250.94593498552416, 1630.5369399865044, 3026.246560731268, 2704)
-    femmesh.addNode(-121.1462575331083, 463.2946395756163, -115.66474688740124, 2705)
-    femmesh.addNode(885.7536878480269, -263.12000748024104, 574.2041837008277, 2706)
-    femmesh.addNode(619.4215070704661, -284.471173935712, 563.0618388877081, 2707)
-    femmesh.addNode(633.4127736243163, -360.1205131626596, 781.3222686718871, 2708)
-    femmesh.addNode(-335.15107752110083, 279.93302682003366, -532.3087268484422, 2709)
-    femmesh.addNode(768.7507470529529, -2163.2326682332355, 1806.9215984800553, 2710)
-    femmesh.addNode(236.14004974573902, -1691.946833004853, 1569.038403113937, 2711)
-    femmesh.addNode(634.4235680438355, -1487.1875618766448, 1266.9745791780474, 2712)
-    femmesh.addNode(775.5049662732329, 484.31533064147413, 1627.2573713792963, 2713)
-    femmesh.addNode(279.4660125830294, -1641.9715319707534, -2382.915217242795, 2714)
-    femmesh.addNode(1661.0344632014494, 131.57330482387684, 256.2217055368521, 2715)
-    femmesh.addNode(1698.8306901072988, 318.21858511243613, 576.6743347188124, 2716)
-    femmesh.addNode(1626.1950719624483, 248.2836168050031, 257.220986598468, 2717)
-    femmesh.addNode(-1715.9565783782618, 68.5666058057597, -227.12315340990136, 2718)
-    femmesh.addNode(-1702.6549258683926, 191.64444403783727, -196.0321162258879, 2719)
-    femmesh.addNode(-1715.2058021231087, 104.03780499507363, -427.56045849343667, 2720)
-    femmesh.addNode(-2430.723189151946, -3020.043830954401, -1814.9450844715764, 2721)
-    femmesh.addNode(-1598.3725257334327, -3440.0514183343494, -1749.2269982277014, 2722)
-    femmesh.addNode(3462.5999851600936, 2230.4459978861214, 1066.430648244018, 2723)
-    femmesh.addNode(3106.6132167992528, 1457.6998829934028, 397.3003798576777, 2724)
-    femmesh.addNode(-2597.710358115346, 3235.674425562179, 1050.508356941642, 2725)
-    femmesh.addNode(-2395.845544439362, 2647.0823036376405, 1457.966713196536, 2726)
-    femmesh.addNode(-2898.3462729688945, 2455.1371292613785, 1779.2843170066458, 2727)
-    femmesh.addNode(96.98133043240698, 1874.3869627276922, -156.0259743008615, 2728)
-    femmesh.addNode(181.98568796134532, 2303.9045058521974, -403.24634861027937, 2729)
-    femmesh.addNode(-484.6858148905628, 2190.1495064089086, -656.2458413616488, 2730)
-    femmesh.addNode(-314.2470017365092, 2019.479980095022, -114.15109306550391, 2731)
-    femmesh.addNode(238.76051552715484, 768.597393885436, -1142.4148398019447, 2732)
-    femmesh.addNode(3990.1869198830273, 280.8643370833752, -1514.985691020668, 2733)
-    femmesh.addNode(3762.241368108036, -312.03545700330676, -1333.2986971184523, 2734)
-    femmesh.addNode(4230.589366592365, -26.538237112918367, -1015.2829024599644, 2735)
-    femmesh.addNode(1724.1586699488448, 366.8212234763621, -538.4959195646755, 2736)
-    femmesh.addNode(-1198.5392463398161, 1801.4689876281022, -783.7669298115501, 2737)
-    femmesh.addNode(3806.2374370111, 1862.8923492112374, -317.9942765241122, 2738)
-    femmesh.addNode(-2067.2480496357243, 3224.074741680991, 1774.787217572424, 2739)
-    femmesh.addNode(-1608.3734958389928, 2856.9980591712806, 1188.9969680371757, 2740)
-    femmesh.addNode(32.41084159472058, -689.4392413449586, 107.13928817581373, 2741)
-    femmesh.addNode(-865.4588800142628, 907.1994714091263, 740.1909328117091, 2742)
-    femmesh.addNode(-1288.6295093209303, 758.9100860174624, 731.9359509565072, 2743)
-    femmesh.addNode(-1293.1883009054238, 1249.2401155135326, 845.2190675828581, 2744)
-    femmesh.addNode(-1009.2148912344518, 1322.3953120617025, 638.8570860463001, 2745)
-    femmesh.addNode(-349.94886891444673, 700.984275818405, 242.94210594653336, 2746)
-    femmesh.addNode(-239.1249768043267, 492.33942837227687, 504.78634010394615, 2747)
-    femmesh.addNode(-1017.8445320513214, -403.2307420324334, -503.02997502104006, 2748)
-    femmesh.addNode(-823.1098083658842, -587.4551323706902, -611.8022481581618, 2749)
-    femmesh.addNode(-990.4856771584062, -307.08109743337684, -597.1484238903518, 2750)
-    femmesh.addNode(-1626.6838066982555, -409.3166560083632, -3216.191910787017, 2751)
-    femmesh.addNode(-1017.7933631379499, 168.41242033929873, -2800.1880689615855, 2752)
-    femmesh.addNode(1643.3776600292736, -2564.2495190553677, -2709.3339103799885, 2753)
-    femmesh.addNode(1458.8503177919224, -3241.9439396309417, -2292.6924637400184, 2754)
-    femmesh.addNode(339.42149888294205, 160.9767506034309, 23.505489147091744, 2755)
-    femmesh.addNode(343.6549219800618, -61.950812985015034, -113.05068602032895, 2756)
-    femmesh.addNode(2.314926150129427, -886.9793824385807, -565.7287875040664, 2757)
-    femmesh.addNode(1660.1406039849512, -1489.462289370774, -682.6840886912968, 2758)
-    femmesh.addNode(1357.2188150700472, -997.2525510720914, -845.1723532651123, 2759)
-    femmesh.addNode(1509.945337651195, -889.2428667656434, -460.1428390105375, 2760)
-    femmesh.addNode(-957.8070957551151, 493.66691138098474, -413.8537612318717, 2761)
-    femmesh.addNode(-1654.4270927849147, 1087.2613714820777, -213.92630400846406, 2762)
-    femmesh.addNode(-1733.0470329088157, 1129.4086273525704, 211.89081382148328, 2763)
-    femmesh.addNode(-1964.1088564120712, 1423.7593533324543, -430.45494371383035, 2764)
-    femmesh.addNode(658.1429274835971, 297.64309615995967, -472.30754557654086, 2765)
-    femmesh.addNode(717.9935322374033, 389.56325269361986, -406.3029666780248, 2766)
-    femmesh.addNode(581.3564744798098, 341.1482416339649, -369.98319434778125, 2767)
-    femmesh.addNode(1124.1941813053954, -551.7857572232288, 1219.5193787052247, 2768)
-    femmesh.addNode(1073.745253463364, -919.6827963029809, 1131.3469674795838, 2769)
-    femmesh.addNode(-1663.3986326657061, -164.7362968329587, -790.6599064659611, 2770)
-    femmesh.addNode(-502.8846298003341, -401.9894686543933, 1375.522812768365, 2771)
-    femmesh.addNode(-785.096836518459, -542.9841737380945, 1355.3565967384966, 2772)
-    femmesh.addNode(-307.559907558286, -729.1929240649856, 1554.8843701481028, 2773)
-    femmesh.addNode(424.20365912789396, 3423.6137812486895, -2106.510967211236, 2774)
-    femmesh.addNode(2520.8061541314987, 3167.2534009910855, -192.13404322597484, 2775)
-    femmesh.addNode(2073.3163270290834, 3667.312640632154, -570.9583829046773, 2776)
-    femmesh.addNode(-134.9121301484675, 3695.9308397055283, -1808.5996672358804, 2777)
-    femmesh.addNode(68.1196078188417, 3260.650040646644, -2520.7374540846913, 2778)
-    femmesh.addNode(-1093.3217834244947, -326.0930890017486, -579.5946039591136, 2779)
-    femmesh.addNode(-1567.544881629597, 433.25639388773527, -354.9127331554655, 2780)
-    femmesh.addNode(-558.9963406559498, 409.5652422403492, -312.9888301026268, 2781)
-    femmesh.addNode(858.4793712777937, -634.8140339645344, -44.71891997521459, 2782)
-    femmesh.addNode(766.9656929185649, -635.5958339133985, 56.74404393653927, 2783)
-    femmesh.addNode(878.4799429517673, -658.4436021686232, 114.85572421724117, 2784)
-    femmesh.addNode(1195.2368817832628, 1766.4056746796828, 3631.9250995034613, 2785)
-    femmesh.addNode(497.0910440019484, 1367.4387282689006, 3783.7007631556526, 2786)
-    femmesh.addNode(328.3267142249838, 607.1210156006975, 3266.8152657935498, 2787)
-    femmesh.addNode(1129.076339126712, 1064.158038480095, 3953.785350688726, 2788)
-    femmesh.addNode(-1287.5433763429783, -258.87630658334945, -631.4295317053038, 2789)
-    femmesh.addNode(677.4652834331471, -717.6888767668634, -192.63296987992405, 2790)
-    femmesh.addNode(-503.8058658032077, -4130.138465769862, -7.890174625398714, 2791)
-    femmesh.addNode(-945.9314460324213, -3902.781823966651, 681.2562384617418, 2792)
-    femmesh.addNode(-245.00321111700194, -3927.8344089117163, 947.2992555666208, 2793)
-    femmesh.addNode(-1257.8685801186452, -629.8351998633673, 742.7295687394208, 2794)
-    femmesh.addNode(-363.2877149356941, 256.4671589402761, 1195.8215942092493, 2795)
-    femmesh.addNode(-524.3343971046613, -130.31271938998952, 976.7976997471199, 2796)
-    femmesh.addNode(-88.17752279515922, -320.77584585043587, 1282.2469458353225, 2797)
-    femmesh.addNode(-289.8715044903014, -106.26276326893428, 1327.925256239339, 2798)
-    femmesh.addNode(469.4119941898587, 480.50504132504386, -819.3854131794099, 2799)
-    femmesh.addNode(204.88483803147983, 604.7155263129005, -874.0242881580936, 2800)
-    femmesh.addNode(-2545.6470309266747, 949.258842759567, 248.87374928415414, 2801)
-    femmesh.addNode(-2460.624276291028, 1415.9461830014482, -190.65504356773948, 2802)
-    femmesh.addNode(-2229.5624527877726, 1121.595457021564, 451.69071396757414, 2803)
-    femmesh.addNode(-2135.083974203163, -156.51891846647248, 465.5594992452277, 2804)
-    femmesh.addNode(-2597.382582467595, -703.878144691626, 900.0220094622696, 2805)
-    femmesh.addNode(-1955.6768475969345, -530.5533161932574, 414.53564637656075, 2806)
-    femmesh.addNode(805.4708807469461, 658.1657154792526, 167.31624277706487, 2807)
-    femmesh.addNode(608.5131267049553, 459.4721648416638, 242.9283630098059, 2808)
-    femmesh.addNode(644.2916735343865, 715.9112544704141, 221.63363837932852, 2809)
-    femmesh.addNode(421.07546695656407, 1259.331334567706, -1622.6419804741063, 2810)
-    femmesh.addNode(481.3164404564503, 1691.5023938047393, -2267.6668965786052, 2811)
-    femmesh.addNode(245.06214465264466, 123.66658153625423, -170.49278787727957, 2812)
-    femmesh.addNode(387.13903398436344, 308.39932416806505, -151.59137990851065, 2813)
-    femmesh.addNode(1915.4705990774614, -3417.3798847503094, 574.2556068260584, 2814)
-    femmesh.addNode(1747.0278849190192, -3741.041361597186, -395.31904839738723, 2815)
-    femmesh.addNode(2241.127312370385, 1090.1491156273046, -1767.2601951740191, 2816)
-    femmesh.addNode(2110.332690115508, 1666.3133904643107, -1315.4734761868056, 2817)
-    femmesh.addNode(1226.0163643895917, 650.6319794428543, -704.2837641337974, 2818)
-    femmesh.addNode(-642.8434121377725, -601.3120238644385, -261.9316757276572, 2819)
-    femmesh.addNode(171.91478698805497, 477.75342962025553, -791.5271296969765, 2820)
-    femmesh.addNode(-292.0440216550677, 359.5765732530421, -138.9651793385368, 2821)
-    femmesh.addNode(-3243.9457545472465, 718.5709041119537, -2639.0401246551173, 2822)
-    femmesh.addNode(-3467.982984854582, 505.7400894993285, -2007.6608970775694, 2823)
-    femmesh.addNode(-3459.084208530415, 20.82716785246876, -2545.4530991762063, 2824)
-    femmesh.addNode(-3483.8758672265712, 1132.1221914077091, -2013.35872685899, 2825)
-    femmesh.addNode(3408.126011939005, -2358.809098838029, 1434.2698459172889, 2826)
-    femmesh.addNode(3096.1277082638226, -2815.2771743042676, 967.5670578557466, 2827)
-    femmesh.addNode(-546.7754956363315, 771.1277052390363, -2659.025548013461, 2828)
-    femmesh.addNode(-64.43363921380015, 629.2419308538917, -2643.9601958189164, 2829)
-    femmesh.addNode(-383.71399636711624, 374.6537446352929, -2798.120820159106, 2830)
-    femmesh.addNode(-819.8508077465965, 544.3908704482589, -2086.1044191861974, 2831)
-    femmesh.addNode(1137.6801548239555, -488.4034270948533, 951.4601309099144, 2832)
-    femmesh.addNode(1118.1659785763907, -568.666756693443, 796.453448642578, 2833)
-    femmesh.addNode(-1119.305302770185, 336.62547904593896, -633.916424838499, 2834)
-    femmesh.addNode(-1141.223765289416, 229.0731691458487, -676.0043146215673, 2835)
-    femmesh.addNode(-1282.9649502627663, 206.76896969541573, -753.0342592207833, 2836)
-    femmesh.addNode(-716.5862186730534, -395.3439016417443, 457.0198084705428, 2837)
-    femmesh.addNode(-478.62311263599213, -2139.2220033204903, -3598.2036574326294, 2838)
-    femmesh.addNode(-1228.3388925503195, -1994.4379201927234, -3183.0504208947905, 2839)
-    femmesh.addNode(-1522.4157396983508, -1605.4275057681039, -3695.161842974557, 2840)
-    femmesh.addNode(-403.3313080891552, 472.0865174954534, 964.4386274993169, 2841)
-    femmesh.addNode(-1653.8545479792742, 1188.5841943363425, 1108.9663762046234, 2842)
-    femmesh.addNode(-1230.683918672607, 1336.8735797280065, 1117.2213580598254, 2843)
-    femmesh.addNode(3974.0775209729627, -627.0330363290846, -1421.8145758381565, 2844)
-    femmesh.addNode(1135.3250281257515, 1753.1885669722703, -3509.2679812991596, 2845)
-    femmesh.addNode(653.6811943227535, 2351.5321290449265, -3368.5431013527927, 2846)
-    femmesh.addNode(480.89242354881594, 1568.6197206626698, -3772.347411873721, 2847)
-    femmesh.addNode(62.15008651708628, 1384.3029878083269, -2967.2376384654417, 2848)
-    femmesh.addNode(543.7939203200842, 785.959425735671, -3107.9625184118086, 2849)
-    femmesh.addNode(-1988.9812743926009, -489.6166509909322, 3598.743859425993, 2850)
-    femmesh.addNode(-232.65706464328062, -2481.7743136139884, 1374.410700447142, 2851)
-    femmesh.addNode(1696.416168316165, 107.2951668614946, -253.59144800407498, 2852)
-    femmesh.addNode(1701.9935272844036, 221.76624238211343, -137.2631640875578, 2853)
-    femmesh.addNode(1649.433993055116, 212.844666750697, -278.99376491255885, 2854)
-    femmesh.addNode(1228.4618458041596, -217.84787448186893, 634.9779239321418, 2855)
-    femmesh.addNode(1148.1028718176333, -326.1708528772783, 747.4885649923558, 2856)
-    femmesh.addNode(241.53635699870665, 1025.0943878120033, 548.4089715311131, 2857)
-    femmesh.addNode(-917.4032548165368, 225.91888081889505, 1290.5868480382294, 2858)
-    femmesh.addNode(-704.5786114954763, -187.47638607289167, 1421.2011231723814, 2859)
-    femmesh.addNode(1726.2846604499719, -1959.455683726322, 398.90056922443944, 2860)
-    femmesh.addNode(-946.0062029529962, 1393.291220942301, -656.2580295352524, 2861)
-    femmesh.addNode(1432.7490916705365, 448.65686761848616, 339.01119736247927, 2862)
-    femmesh.addNode(1473.1658418777756, 446.41763115797875, 204.34020021738152, 2863)
-    femmesh.addNode(-2432.6960961007553, -1056.920472031918, 246.79901850419677, 2864)
-    femmesh.addNode(-2828.411494497994, -1636.9405768948584, 846.0680781679091, 2865)
-    femmesh.addNode(-2189.504294293053, 3264.3589826660777, -1459.2638433832922, 2866)
-    femmesh.addNode(-2561.424221038435, 2776.387433985512, -2199.5876885285124, 2867)
-    femmesh.addNode(450.13907038350635, -1741.6827650775756, -3805.7001989600676, 2868)
-    femmesh.addNode(302.3487117983469, -1118.7126555334457, -3919.1433247752225, 2869)
-    femmesh.addNode(788.8016678071831, -764.2040909149886, -4025.8101436385055, 2870)
-    femmesh.addNode(2563.520137588328, -3440.6841875727737, 409.5050777975192, 2871)
-    femmesh.addNode(-3031.6682025206956, 2583.4953713914406, -1254.8449495585646, 2872)
-    femmesh.addNode(1336.421522772955, 491.9243211186078, 385.12903609981294, 2873)
-    femmesh.addNode(-1844.778395031221, 1539.7414309101773, 3459.911034447758, 2874)
-    femmesh.addNode(-1099.5519794698043, 1430.643269214073, 3646.0625996451604, 2875)
-    femmesh.addNode(-1046.8393335555488, 2150.778503811074, 3575.5784821159523, 2876)
-    femmesh.addNode(-864.0487362602862, 685.6326985115704, -175.54919228605795, 2877)
-    femmesh.addNode(-726.3342941503674, 659.2047797141637, -186.0884166131675, 2878)
-    femmesh.addNode(-717.8638173657614, 1045.4076323823742, -105.68798273228566, 2879)
-    femmesh.addNode(-759.5717729956899, -414.00701727765056, 657.7768665618901, 2880)
-    femmesh.addNode(-824.9518184974338, 656.1610547940268, -287.89505601522126, 2881)
-    femmesh.addNode(-2785.2950556954615, -242.05323069563806, -51.928231782953475, 2882)
-    femmesh.addNode(-2657.737464429968, 433.7027632999856, 438.3826665033688, 2883)
-    femmesh.addNode(-2675.7575380207863, -650.6149601989562, 119.58548089206656, 2884)
-    femmesh.addNode(-2548.1999467552932, 25.1410337966675, 609.8963791783888, 2885)
-    femmesh.addNode(-2392.2188814770225, -19.689715295355626, 62.885399882626245, 2886)
-    femmesh.addNode(1236.4738257280358, -775.3192321160893, 665.6929159693526, 2887)
-    femmesh.addNode(971.5671994739268, -1000.6918231525675, 511.79095832074796, 2888)
-    femmesh.addNode(1278.4336078118693, -971.4275493561715, 285.39241244959413, 2889)
-    femmesh.addNode(-1235.501299457364, 435.52704507203873, -2009.2674138565085, 2890)
-    femmesh.addNode(1382.4239931925497, 482.0284056399149, -845.3917342690957, 2891)
-    femmesh.addNode(504.06181594787313, -665.354196810079, 365.4298953614194, 2892)
-    femmesh.addNode(486.3758351620738, -396.0428068705229, 520.8909768219127, 2893)
-    femmesh.addNode(807.7033681539199, 3791.3390079982846, 1878.9614466326589, 2894)
-    femmesh.addNode(732.5170430064043, 2784.007285938297, 1647.7904482385757, 2895)
-    femmesh.addNode(-1990.9239659653501, 974.4536317065138, -1125.245326210675, 2896)
-    femmesh.addNode(1840.5739181388474, -1672.5902718208572, -264.7501131256075, 2897)
-    femmesh.addNode(-1122.0569123552914, -1012.0042553808617, 774.7612943986339, 2898)
-    femmesh.addNode(-911.5377201699858, -924.1795494800842, 325.22954267279675, 2899)
-    femmesh.addNode(-1022.5170227485426, -728.0624246384106, 557.9518512842363, 2900)
-    femmesh.addNode(2374.3341989608384, -1982.759986548786, 234.15004019590026, 2901)
-    femmesh.addNode(1665.9928532484041, -81.55885898904928, 111.46494908502598, 2902)
-    femmesh.addNode(1817.8497733997556, -223.31060753303933, -143.2758877583301, 2903)
-    femmesh.addNode(1630.8637210537488, -190.3519661194914, 44.42339473638211, 2904)
-    femmesh.addNode(-1913.4348204345586, 977.684786164807, 1477.4642352014735, 2905)
-    femmesh.addNode(-1506.5901623224518, 823.8029618591961, 1825.461866023978, 2906)
-    femmesh.addNode(-814.9919921907602, 370.23876665220587, 506.98712772228015, 2907)
-    femmesh.addNode(-893.0771522360556, 330.38058956069335, 554.7583488595326, 2908)
-    femmesh.addNode(-1744.8882349994763, 26.905164362792902, 1408.5810851130032, 2909)
-    femmesh.addNode(-1003.9635033327247, 3768.222123372375, -1564.9922146634315, 2910)
-    femmesh.addNode(-768.0137113706643, 3532.952200201749, -2168.7255562324294, 2911)
-    femmesh.addNode(-379.6587763684584, 3947.535304692393, -1291.7647795814587, 2912)
-    femmesh.addNode(-1826.9633436673348, 1162.0760560816252, -2627.085348839887, 2913)
-    femmesh.addNode(-1350.8173927635619, 669.9880435169675, -2468.139488381101, 2914)
-    femmesh.addNode(534.5972472854328, -329.5215129929292, 1582.850776641213, 2915)
-    femmesh.addNode(521.1810925429843, 4.996604619354741, 1407.3638456701171, 2916)
-    femmesh.addNode(400.6092435494493, 182.59283629273878, 1853.2680280367208, 2917)
-    femmesh.addNode(30.903172191516305, -3211.489412953624, 2493.579195358521, 2918)
-    femmesh.addNode(-329.5718687862511, -1131.7706789078861, 186.57781947635237, 2919)
-    femmesh.addNode(1029.1605664453004, -602.7316106195526, 555.4346581563657, 2920)
-    femmesh.addNode(3790.656896357353, 1060.0214724216873, 1331.3003482291838, 2921)
-    femmesh.addNode(3587.374096231463, 1092.2372063403495, 2137.718609420097, 2922)
-    femmesh.addNode(2463.1532225113606, 1420.4305132619702, 253.25041708366084, 2923)
-    femmesh.addNode(240.15609992210452, 177.48473470332368, -2747.9569329419164, 2924)
-    femmesh.addNode(-302.0608639453516, -989.9175706134938, -636.3246717131699, 2925)
-    femmesh.addNode(-3832.8697711947657, -258.5963861503173, -1809.2711087031403, 2926)
-    femmesh.addNode(-3841.768547518933, 226.3165354965424, -1271.4789066045034, 2927)
-    femmesh.addNode(-4069.950873790538, -553.9658841245284, -1309.406266504813, 2928)
-    femmesh.addNode(-3116.6389805927383, -291.5787646249312, -1164.5863063352508, 2929)
-    femmesh.addNode(-3107.740204268571, -776.4916862717909, -1702.3785084338876, 2930)
-    femmesh.addNode(-2760.990830061709, -1253.0694624016921, -1916.7472206886166, 2931)
-    femmesh.addNode(-2262.946377024306, -1516.2789896783065, -2344.2292328638623, 2932)
-    femmesh.addNode(-529.6029950471404, -59.69375639380236, 774.1087750565753, 2933)
-    femmesh.addNode(481.21582421106973, 493.97997139924985, 709.225024757482, 2934)
-    femmesh.addNode(-662.0915889425294, 1005.5887036839652, -3117.8976225380534, 2935)
-    femmesh.addNode(46.726630772993, -1253.4312347325372, 1624.9761902389805, 2936)
-    femmesh.addNode(85.86480114530487, -902.1778232008897, 1796.742189351462, 2937)
-    femmesh.addNode(107.14719944688886, -647.9793012610281, 1461.6085032150604, 2938)
-    femmesh.addNode(445.0101490710895, -1048.671963604329, 1322.912366303091, 2939)
-    femmesh.addNode(668.9859543439572, 88.50007189956891, -525.2579371775023, 2940)
-    femmesh.addNode(751.6294606866509, 20.01087241919104, -593.1677361522368, 2941)
-    femmesh.addNode(489.7125835977346, 39.781453965495466, -631.1071972060896, 2942)
-    femmesh.addNode(-1600.2707973678705, 315.7967357862499, 1616.995668206044, 2943)
-    femmesh.addNode(251.1290988870889, -310.4438904288969, 1254.9119244208623, 2944)
-    femmesh.addNode(2039.5461981266058, -347.3427837347643, -255.25668748069194, 2945)
-    femmesh.addNode(-2169.5657027141706, 1137.2120162743583, -3405.1945994202415, 2946)
-    femmesh.addNode(-1556.1468526750434, 1384.9227881345932, -3642.862546670092, 2947)
-    femmesh.addNode(-1296.1709557133631, 799.3473793879709, -3119.9648713405327, 2948)
-    femmesh.addNode(-1638.773314760199, 774.4833395807042, -3898.0741219208876, 2949)
-    femmesh.addNode(1098.9658716658062, -646.5584263885751, -102.06522384194457, 2950)
-    femmesh.addNode(1174.063486397611, -805.6339884054929, 63.681224201707835, 2951)
-    femmesh.addNode(2291.318800194402, -229.7388005214049, -3223.7241970782006, 2952)
-    femmesh.addNode(1914.6332574182215, -60.086444815204224, -3674.297932565232, 2953)
-    femmesh.addNode(-1374.4399298927958, 1752.0694203805824, 1015.8875112944163, 2954)
-    femmesh.addNode(-1045.8424350891582, 2329.061858423933, 1332.7080156703043, 2955)
-    femmesh.addNode(-1576.30474356878, 2340.6615423051203, 608.4291550395224, 2956)
-    femmesh.addNode(4037.381418871529, -203.38725581201462, 277.96551342967143, 2957)
-    femmesh.addNode(4106.901954019542, 453.3805869709765, 276.21685015200916, 2958)
-    femmesh.addNode(4352.948075854481, -26.538237112918395, -242.74041652259797, 2959)
-    femmesh.addNode(-1111.5927768102338, 3658.9125618022304, 642.9898151699845, 2960)
-    femmesh.addNode(-1314.622322840195, 3767.925018042168, 1341.679379258952, 2961)
-    femmesh.addNode(949.7335706923063, -840.258726640426, -865.6842581723275, 2962)
-    femmesh.addNode(1411.7468717263725, -819.6080183308345, -643.4859058485656, 2963)
-    femmesh.addNode(1138.0234982302397, -659.0113081880344, -942.330322969597, 2964)
-    femmesh.addNode(1192.5515548865653, -481.3667754467775, -740.6438755530503, 2965)
-    femmesh.addNode(-1584.5548709678203, 1105.5134507212383, 532.5369717807928, 2966)
-    femmesh.addNode(-1300.5814612968484, 1178.668647269408, 326.1749902442348, 2967)
-    femmesh.addNode(-1305.140252881342, 1668.9986767654782, 439.45810687058565, 2968)
-    femmesh.addNode(1778.299605042485, -1059.8139662042786, -1122.5171790329293, 2969)
-    femmesh.addNode(-733.0973214822775, -410.95309685246315, -1394.5046600280634, 2970)
-    femmesh.addNode(-1142.4661595965897, -613.4675230625722, 250.1941280993865, 2971)
-    femmesh.addNode(-1023.2842459316254, -602.4936956389556, 267.8452873850967, 2972)
-    femmesh.addNode(1747.8461606781839, -1235.5172544786324, 3599.8946418293317, 2973)
-    femmesh.addNode(2533.791491903276, -1033.441449039727, 3161.925033358428, 2974)
-    femmesh.addNode(-150.69929710467284, -747.5165378640522, 276.7436523095429, 2975)
-    femmesh.addNode(-168.01781613719447, -515.6142307854672, 496.97829612715555, 2976)
-    femmesh.addNode(-191.91349454155443, 594.2094990218545, -470.9676209842522, 2977)
-    femmesh.addNode(451.21627561137905, 2118.579841637583, -1089.1780751112367, 2978)
-    femmesh.addNode(562.9122668532451, 1964.9005236498326, -1898.2241906302813, 2979)
-    femmesh.addNode(1880.4647675029978, 189.1896248680362, -529.1463981370179, 2980)
-    femmesh.addNode(2230.804275188748, 275.17534607629716, -329.7930115776005, 2981)
-    femmesh.addNode(1803.5135371859583, 392.2219323313152, -266.5324174358075, 2982)
-    femmesh.addNode(-3397.8413155619273, 369.8653799047603, -651.1449528337631, 2983)
-    femmesh.addNode(-4217.297758774701, 800.4531017037044, -906.4655056802642, 2984)
-    femmesh.addNode(-3473.373049221913, 1035.8446208548098, -263.46860821946785, 2985)
-    femmesh.addNode(2288.486654306644, -2341.0138280413826, -2723.710365042286, 2986)
-    femmesh.addNode(-2039.6250242532246, 189.58484049597527, 1186.0067682097874, 2987)
-    femmesh.addNode(-2093.0222428226953, 1517.4588416421777, 366.5759112146112, 2988)
-    femmesh.addNode(-511.28844523679976, -529.904649513567, 113.08662988721727, 2989)
-    femmesh.addNode(-1059.0428736914987, 185.7445803459298, -693.9074933404931, 2990)
-    femmesh.addNode(-1016.6540217133896, 291.22200211777283, -666.5679943826462, 2991)
-    femmesh.addNode(-1665.8064999551923, 1608.3427555882881, 703.205415492351, 2992)
-    femmesh.addNode(-1802.3467099202699, 1212.4793709676744, 788.320218245314, 2993)
-    femmesh.addNode(-1721.0950809328979, 709.6500661006247, 617.6517745337558, 2994)
-    femmesh.addNode(-606.4080364463994, -3241.496204378476, 2339.9657792082216, 2995)
-    femmesh.addNode(-1211.2658536196575, -2947.149094336558, 2733.261823441472, 2996)
-    femmesh.addNode(1045.9050098391685, -1667.95556063902, 1316.759370923584, 2997)
-    femmesh.addNode(-1420.9166875912392, -1924.659880541349, -1363.293028132665, 2998)
-    femmesh.addNode(-1137.9941159352293, -1364.9181390460053, -1497.3030146630756, 2999)
-    femmesh.addNode(-1098.2582584292038, -1907.9419662054752, -883.7187975730715, 3000)
-    femmesh.addNode(-1405.3439498090318, 2747.985602931343, 490.30740394820805, 3001)
-    femmesh.addNode(-1845.0846313198167, 3779.5247019233557, 617.40051862817, 3002)
-    femmesh.addNode(707.9134690862506, -435.6238195531091, -454.16906587854237, 3003)
-    femmesh.addNode(854.9015275430608, -203.75901959789186, 733.501308543455, 3004)
-    femmesh.addNode(-58.93940895579135, -233.47550785256135, -300.77422070338685, 3005)
-    femmesh.addNode(1614.315459065453, -1055.0364277163221, -238.4316507626512, 3006)
-    femmesh.addNode(142.7862247200013, -306.50165056281594, -419.81900600989223, 3007)
-    femmesh.addNode(-626.4134712211516, -1516.2518937763607, -3711.6467832477842, 3008)
-    femmesh.addNode(-503.642438100719, 228.93845638169267, 376.10946697144993, 3009)
-    femmesh.addNode(308.52766968251274, 908.589985422483, -2671.4712070995333, 3010)
-    femmesh.addNode(-726.1450195891855, 533.2670117220663, 988.6419531773026, 3011)
-    femmesh.addNode(1355.4161311003686, -498.7584743738151, 857.7468228053428, 3012)
-    femmesh.addNode(621.2509261854887, -1534.1317348001216, 888.4373605054238, 3013)
-    femmesh.addNode(224.35371506903363, -1886.5261503110562, 751.7055221260221, 3014)
-    femmesh.addNode(257.42244804732303, -1437.7483110649914, 1233.9047169775356, 3015)
-    femmesh.addNode(377.47568896935354, 455.12718887286917, -380.5053990407401, 3016)
-    femmesh.addNode(808.838627209255, -1145.0553873394592, 977.4450098309792, 3017)
-    femmesh.addNode(513.2559935961999, 1084.4128977321293, -1199.796121761942, 3018)
-    femmesh.addNode(1652.9696873778344, 1415.294553412646, -1997.2932231058226, 3019)
-    femmesh.addNode(589.9989653631353, 813.8107771634923, -2380.880765244355, 3020)
-    femmesh.addNode(1028.566352729887, 744.922129419622, -515.060407050612, 3021)
-    femmesh.addNode(3417.7527376575963, -326.87739427674626, 2520.843211708796, 3022)
-    femmesh.addNode(3426.1616398310234, 485.5963208896388, 2552.098242074104, 3023)
-    femmesh.addNode(-3658.589458959792, -1621.8068456094693, 579.3719920005865, 3024)
-    femmesh.addNode(-3580.2145034066007, -1675.070030102139, 1359.8085205707894, 3025)
-    femmesh.addNode(-488.82430086095803, 984.3702674552266, 78.33341091650615, 3026)
-    femmesh.addNode(-1968.8695298762748, -1905.289404102926, -1832.1178107840954, 3027)
-    femmesh.addNode(-2584.703411571356, 601.6045246236353, -3284.504973840313, 3028)
-    femmesh.addNode(-2799.841865554524, -96.13921163584979, -3190.9179483614025, 3029)
-    femmesh.addNode(-2053.9110236173838, 238.8758479299811, -3777.3844963409592, 3030)
-    femmesh.addNode(985.1203066679984, -680.2383896282538, 754.2825865767827, 3031)
-    femmesh.addNode(1465.791953076899, -719.0604788867893, -169.52061881831906, 3032)
-    femmesh.addNode(-2823.061287306865, 2556.1983896915303, 1121.337208918796, 3033)
-    femmesh.addNode(859.6532217540537, -2226.1587345636426, 881.4370590556714, 3034)
-    femmesh.addNode(-3819.000832517761, 896.1978698260327, 488.8798222444332, 3035)
-    femmesh.addNode(-4365.754556065002, 782.4446660367188, -91.632480271425, 3036)
-    femmesh.addNode(-3706.9103990144677, 1411.753949285614, 299.3709050252186, 3037)
-    femmesh.addNode(-3248.381819752187, 880.3363880622762, 215.37242606405852, 3038)
-    femmesh.addNode(-2701.628096204945, 994.0895918515901, 795.8847285799168, 3039)
-    femmesh.addNode(1670.2954311003639, 105.08642129950998, 556.9175782669857, 3040)
-    femmesh.addNode(1526.856920151351, -141.75174854399012, -471.2471877894666, 3041)
-    femmesh.addNode(1555.0730239757754, -255.27303865662083, -416.41254809806935, 3042)
-    femmesh.addNode(-449.84880670675625, 812.8501834583903, -153.15810774566543, 3043)
-    femmesh.addNode(984.2453219215475, 546.292892913888, 918.4366914218563, 3044)
-    femmesh.addNode(691.3603422862246, 543.0551542776187, 736.3137010018456, 3045)
-    femmesh.addNode(885.704894631978, 329.95015867730353, 979.4107112002097, 3046)
-    femmesh.addNode(973.8734012867576, 569.5239526231014, 716.4942136093734, 3047)
-    femmesh.addNode(769.5240723258048, -620.3365174899121, 153.5265147082809, 3048)
-    femmesh.addNode(870.5985185808968, -594.1526680108731, 240.12429355238518, 3049)
-    femmesh.addNode(-3496.542196771752, -2332.5057624124192, 640.2316923718056, 3050)
-    femmesh.addNode(-826.3852999439332, 2266.5492217309757, 74.37305733657459, 3051)
-    femmesh.addNode(2763.2303648519783, 220.80132723198545, -3343.638574108065, 3052)
-    femmesh.addNode(1892.880496569306, 706.0654632546215, -2743.5376320893197, 3053)
-    femmesh.addNode(2068.576393179692, 485.26413602263534, -3444.9840298559925, 3054)
-    femmesh.addNode(1044.2833891355492, 425.17769120743185, -3074.1969905464866, 3055)
-    femmesh.addNode(1738.9373608078354, 160.71488241678196, -2972.851534798559, 3056)
-    femmesh.addNode(-101.90119204477524, 2120.317172898995, 2274.5883903692775, 3057)
-    femmesh.addNode(447.19990279579025, 2029.5038863972868, 2874.470897079077, 3058)
-    femmesh.addNode(-3533.6343178342922, 1764.6236010777727, 1539.8447648390656, 3059)
-    femmesh.addNode(-3570.4397656755555, 1350.1287820483428, 1071.4065739704306, 3060)
-    femmesh.addNode(-3458.3493321722617, 1865.6848615079243, 881.8976567512159, 3061)
-    femmesh.addNode(-440.99633456106716, -736.9811718350677, -185.84066098542962, 3062)
-    femmesh.addNode(3432.6992077293417, -2584.724623502175, 240.77179601220135, 3063)
-    femmesh.addNode(427.6724724512958, 300.166970958241, -774.0335091047314, 3064)
-    femmesh.addNode(-1288.7126637660779, 1715.4984963124587, -120.18728737417646, 3065)
-    femmesh.addNode(-1134.1794591215937, 2076.3227373917007, 321.3363557792714, 3066)
-    femmesh.addNode(-1453.2628817534192, 3936.420510119878, 4.96944249707019, 3067)
-    femmesh.addNode(-1013.5222002426344, 2904.8814111278652, -122.12367218289177, 3068)
-    femmesh.addNode(-971.3283531111472, -1927.447607944378, 3704.1881916349103, 3069)
-    femmesh.addNode(-1137.8308851003437, -2408.7894517011664, 3197.1733984497996, 3070)
-    femmesh.addNode(571.3618496501431, -563.2523926022856, 149.76456720137674, 3071)
-    femmesh.addNode(-3204.49118797721, 319.94955951067163, -142.1296360124894, 3072)
-    femmesh.addNode(-2171.466837598594, 1417.8953816509356, -3247.138073592094, 3073)
-    femmesh.addNode(-2784.8856876377213, 1170.184609790701, -3009.470126342244, 3074)
-    femmesh.addNode(-1398.3354336331922, 392.25043745164305, 648.7676933535056, 3075)
-    femmesh.addNode(1072.185504610149, 2804.311922377051, 2626.4209251755387, 3076)
-    femmesh.addNode(997.1934681079745, 2495.159494077744, 3227.9433440367143, 3077)
-    femmesh.addNode(562.085379949355, 3261.6787535056665, 2684.0768601803716, 3078)
-    femmesh.addNode(657.5250065042296, 2474.8548576389903, 2249.312867099751, 3079)
-    femmesh.addNode(921.297626816319, -2302.412557378076, -3168.631466173254, 3080)
-    femmesh.addNode(375.48523975675334, -2405.983840189576, -3506.514460388689, 3081)
-    femmesh.addNode(976.658933596675, -1231.183088131579, 3860.4032154053893, 3082)
-    femmesh.addNode(622.3887452210641, -1676.4224411090288, 3710.417474384557, 3083)
-    femmesh.addNode(474.642300117984, -1061.114907896884, 4234.597792796138, 3084)
-    femmesh.addNode(120.37211174237314, -1506.3542608743337, 4084.6120517753056, 3085)
-    femmesh.addNode(1311.5328264067168, -1808.2447678885683, 3519.1853655386417, 3086)
-    femmesh.addNode(1247.6007194545027, -2504.392281737499, 3247.77380964393, 3087)
-    femmesh.addNode(-828.958154789153, 4115.733691439897, 278.1968775790431, 3088)
-    femmesh.addNode(-1273.2171262593424, -562.7049694665671, 165.98946655179193, 3089)
-    femmesh.addNode(-1179.5733395898117, -643.5241005401917, 113.4295285657142, 3090)
-    femmesh.addNode(-1039.9853999307268, 86.99325355999207, 868.0025037330702, 3091)
-    femmesh.addNode(-50.96094424849335, 505.73779737058237, -297.35856509165797, 3092)
-    femmesh.addNode(653.7987836963421, -433.84940973384977, 437.47346162973895, 3093)
-    femmesh.addNode(784.3284800105988, 532.1513670115238, 316.6229694186969, 3094)
-    femmesh.addNode(1555.0880987992007, -195.51965341605586, 285.1469861491088, 3095)
-    femmesh.addNode(1632.4992041945145, -81.55885898904928, 236.46494908502555, 3096)
-    femmesh.addNode(1097.5652729697078, -2667.8208018668674, -3047.2169045954233, 3097)
-    femmesh.addNode(-3124.065669612609, -2741.641635014995, -736.3035962923527, 3098)
-    femmesh.addNode(-3077.357354906346, -2606.961848665328, -1615.1747666493243, 3099)
-    femmesh.addNode(3745.7190938751937, 908.4674207079482, -1885.1090962328162, 3100)
-    femmesh.addNode(3422.2961402969468, 1435.0029413277707, -2154.008881648992, 3101)
-    femmesh.addNode(743.9074722589038, 796.3205451717372, -876.766695139407, 3102)
-    femmesh.addNode(-1740.4161948417136, 64.72197513669894, -128.3551818985509, 3103)
-    femmesh.addNode(-1456.5693768827755, 778.2536700147729, 505.33612546915555, 3104)
-    femmesh.addNode(-1468.5213288586938, 1198.0122312667186, 99.57516475688308, 3105)
-    femmesh.addNode(-625.7623767432927, -1554.5180358079178, -677.1268318069178, 3106)
-    femmesh.addNode(1234.118780065869, 55.57310022072867, 623.7431822118562, 3107)
-    femmesh.addNode(-2269.7071761915226, 1560.405773152886, -2315.1045683681414, 3108)
-    femmesh.addNode(-2922.4483608102637, 2155.8796237009433, -2398.691208049481, 3109)
-    femmesh.addNode(177.34387459962582, 959.9699891182428, 3974.6491531811766, 3110)
-    femmesh.addNode(809.3291697243894, 656.6892993294373, 4144.7337407142495, 3111)
-    femmesh.addNode(1729.9098173700556, 107.2951668614946, -128.5914480040756, 3112)
-    femmesh.addNode(-2274.4123533374423, 1084.9735057977005, 1132.5142328576565, 3113)
-    femmesh.addNode(-2193.1607243500703, 582.1442009306506, 961.8457891460982, 3114)
-    femmesh.addNode(-2081.070290846777, 1097.7002803902321, 772.3368719268836, 3115)
-    femmesh.addNode(354.7957655264882, -576.2728469806207, 1889.2507817443998, 3116)
-    femmesh.addNode(315.65759515417636, -927.5262585122682, 1717.4847826319187, 3117)
-    femmesh.addNode(-844.2241346573771, -1504.190526823673, 425.77646416630773, 3118)
-    femmesh.addNode(-873.86906042866, -1017.8885855479716, 132.20952622917935, 3119)
-    femmesh.addNode(-1120.3005569099903, -923.0186732058152, 32.096728841488996, 3120)
-    femmesh.addNode(-1090.6556311387073, -1409.3206144815167, 325.66366677861737, 3121)
-    femmesh.addNode(-2373.2277653212777, -2144.3967611379644, 776.2196371560708, 3122)
-    femmesh.addNode(-1899.1374113708473, -1617.6398407676938, 957.3871060625615, 3123)
-    femmesh.addNode(-1512.529194202754, -1991.874402447948, 926.0793063076723, 3124)
-    femmesh.addNode(502.67129335335886, 1532.7294644127992, -1253.1992745257826, 3125)
-    femmesh.addNode(108.42391166366407, 2565.6681441406986, 1649.4303603899518, 3126)
-    femmesh.addNode(-2039.6199218823162, -834.5569566316356, 361.6126501697765, 3127)
-    femmesh.addNode(-223.2902893045508, -2711.174990897522, -1031.5211850850274, 3128)
-    femmesh.addNode(-2614.2106701227813, 1816.225098722197, -2935.157293120349, 3129)
-    femmesh.addNode(-1656.2883261523953, 1808.116545013121, -2552.7725156179918, 3130)
-    femmesh.addNode(-1324.5434925788109, 631.4615151160093, 51.9860835264999, 3131)
-    femmesh.addNode(675.8154056626905, -3416.534453330695, 2127.747444345601, 3132)
-    femmesh.addNode(1182.0490272077848, -3186.688336836276, 2631.0080042550353, 3133)
-    femmesh.addNode(-541.7401411888266, 2367.6802732522888, 1753.3450831022265, 3134)
-    femmesh.addNode(-967.595271780689, 1598.1875960749717, 1363.8851421169206, 3135)
-    femmesh.addNode(826.3699407996608, 1166.6233260894787, -759.4781942835313, 3136)
-    femmesh.addNode(-1393.3207740214189, -731.0824123628844, 409.8944627402908, 3137)
-    femmesh.addNode(-2770.638260396401, 1104.7670755521006, -229.96728499937223, 3138)
-    femmesh.addNode(-2814.528892171378, 1665.153904103705, 127.5347770771757, 3139)
-    femmesh.addNode(-81.3056226410506, -3931.289247568197, -1269.8784443858722, 3140)
-    femmesh.addNode(-989.1920369659266, -3517.05049209387, -2037.8583054152632, 3141)
-    femmesh.addNode(-277.6015447746979, -2195.9372570117384, -949.3845902742927, 3142)
-    femmesh.addNode(925.6723376717622, 1215.040718656749, -368.7040302200975, 3143)
-    femmesh.addNode(-349.2920243204578, 451.0376153770493, 273.7088668778958, 3144)
-    femmesh.addNode(-2254.093299683749, 807.4559330970468, -3502.34964884289, 3145)
-    femmesh.addNode(955.4263596468277, -198.03956759845306, 593.0975954147955, 3146)
-    femmesh.addNode(1179.460099552376, 1128.5321891080102, -16.28917900261476, 3147)
-    femmesh.addNode(1447.733884045603, 932.0653031366896, 18.100061396402822, 3148)
-    femmesh.addNode(-259.03414040540014, -1780.6423618911867, 1639.7880649904587, 3149)
-    femmesh.addNode(-837.5148818165387, -2187.4272035720705, 1767.706744680393, 3150)
-    femmesh.addNode(861.5761701848262, 1166.3313242346103, 750.63950686431, 3151)
-    femmesh.addNode(-437.62547966280994, -638.4540426452713, 277.972890475054, 3152)
-    femmesh.addNode(612.0818510882277, -667.5052925578843, 2751.634477193569, 3153)
-    femmesh.addNode(-3713.40931009376, -1651.0144578135614, -161.6883740255516, 3154)
-    femmesh.addNode(-3551.36204790572, -2361.7133746165114, -100.82867365433242, 3155)
-    femmesh.addNode(-3851.4031074063187, -1750.4558121369432, -765.3311317565751, 3156)
-    femmesh.addNode(1860.5209655037434, 50.01444583482767, 242.68665462187994, 3157)
-    femmesh.addNode(2047.3053360273111, -693.8919565720241, -312.00285110801036, 3158)
-    femmesh.addNode(-246.73092281969096, -3690.8639049324497, 1795.8694991380717, 3159)
-    femmesh.addNode(-947.6591577351103, -3665.811319987384, 1529.8264820331926, 3160)
-    femmesh.addNode(-851.5887399929491, -3396.516794890532, 2189.165543371322, 3161)
-    femmesh.addNode(-1227.5876680930294, -2590.4939651310187, 1556.608174417121, 3162)
-    femmesh.addNode(-932.1056129250583, 2308.787246877997, -1167.3806569053377, 3163)
-    femmesh.addNode(-1040.5709251438152, -334.6494398689657, 1480.8973779664336, 3164)
-    femmesh.addNode(675.4820270536331, -467.11404815551384, -811.748871280522, 3165)
-    femmesh.addNode(283.99464100391026, -1106.3437240891358, -597.3552404945794, 3166)
-    femmesh.addNode(2418.1870131746487, 1526.9300938885826, -3122.6198460438554, 3167)
-    femmesh.addNode(1728.1776000562625, 1204.7943722080201, -3533.718399463005, 3168)
-    femmesh.addNode(2422.8315717285486, 940.3315634173704, -3432.3729437150773, 3169)
-    femmesh.addNode(2582.889909687692, 1028.201184935184, -2332.43907867017, 3170)
-    femmesh.addNode(-850.1462483911203, 2386.228202318417, -3266.4656384836917, 3171)
-    femmesh.addNode(-125.90457293150457, 2764.9424864427788, -3115.8056544110796, 3172)
-    femmesh.addNode(-685.020362207866, 3037.2595448996176, -2817.894354435724, 3173)
-    femmesh.addNode(-1048.4186074449533, 2060.8181705230604, -2416.1820120417697, 3174)
-    femmesh.addNode(1102.460093273454, -732.249042333978, -480.65474391775274, 3175)
-    femmesh.addNode(3143.1387285843093, 1990.3144158855184, -1461.8715238858117, 3176)
-    femmesh.addNode(3123.9738179441365, 2086.032814431178, -2128.669732006183, 3177)
-    femmesh.addNode(-1681.2422023381937, 637.955649856137, -908.7166865053089, 3178)
-    femmesh.addNode(-1794.8175745585665, 353.4473265191795, -669.5492756399356, 3179)
-    femmesh.addNode(-2300.402008473612, 568.9771929935556, -840.6437827601949, 3180)
-    femmesh.addNode(1493.127895500963, 390.47626535902293, -288.34328634021654, 3181)
-    femmesh.addNode(-2695.1065267364156, 438.7878346020511, -617.6436296136676, 3182)
-    femmesh.addNode(1381.8074064325058, -528.9531997156512, 3866.990980186404, 3183)
-    femmesh.addNode(1252.6984906122473, 151.92016290594583, 4096.091217401194, 3184)
-    femmesh.addNode(3047.336313322189, 2959.7891007323565, -54.969149345506764, 3185)
-    femmesh.addNode(-1071.0968698081087, 612.2751145433309, 708.3493861928142, 3186)
-    femmesh.addNode(-1230.8323518254701, -1129.955965143419, 457.0842639211969, 3187)
-    femmesh.addNode(-1477.2638483068006, -1035.0860528012627, 356.97146653350654, 3188)
-    femmesh.addNode(-284.34953415753046, -1728.6457968779323, -566.2231463012561, 3189)
-    femmesh.addNode(-594.5645396474583, -2018.0762745455127, -695.2932965889028, 3190)
-    femmesh.addNode(-579.2272734128921, -1820.4680673251305, -298.58405869183537, 3191)
-    femmesh.addNode(-59.911341478686666, -657.486469784578, 1982.5266486774424, 3192)
-    femmesh.addNode(-1562.5121122851187, 253.8492771933792, 793.9223444492442, 3193)
-    femmesh.addNode(-1823.3099059520518, 253.61476812399252, 551.5652348370705, 3194)
-    femmesh.addNode(-1782.1906904441535, -2467.4867906179106, -2589.076376912035, 3195)
-    femmesh.addNode(-1632.2930555999847, -3007.2217104007377, -2322.491570629083, 3196)
-    femmesh.addNode(-931.7830093830314, 238.34265485627088, 956.8004065584078, 3197)
-    femmesh.addNode(641.4808893728743, 180.69271458853564, 590.2698237545945, 3198)
-    femmesh.addNode(853.9773770174205, 2652.5703264571157, -57.072747580321106, 3199)
-    femmesh.addNode(-1075.6433067720436, 804.1145039453962, -469.45940042293347, 3200)
-    femmesh.addNode(-1180.854862407165, 564.8863809430421, -2661.0927968159403, 3201)
-    femmesh.addNode(-1832.1831914471866, 474.85548129775725, 1306.7957914899152, 3202)
-    femmesh.addNode(-2156.355276508807, 996.6390199600805, 1430.2839800147333, 3203)
-    femmesh.addNode(788.1516310437885, -293.01435650377937, -744.1217783605695, 3204)
-    femmesh.addNode(769.9134541653721, -188.1777860702013, -774.8494338975934, 3205)
-    femmesh.addNode(-2395.841598364225, 1571.247232761944, 3091.287553273428, 3206)
-    femmesh.addNode(-2868.839709365774, 1660.7097935965223, 2690.2087931087926, 3207)
-    femmesh.addNode(712.0614091791408, -517.1205968587344, 386.1881385379576, 3208)
-    femmesh.addNode(-829.9034138999884, 1389.8062645186358, -352.16504360566523, 3209)
-    femmesh.addNode(796.4602706772278, -851.0181771921507, -521.5062613081241, 3210)
-    femmesh.addNode(-732.6548306540601, -492.59667464711947, 390.62367905420297, 3211)
-    femmesh.addNode(-330.15261024607867, 2550.973747488151, -214.7221982082009, 3212)
-    femmesh.addNode(-1168.0554048871186, 2544.0571700486234, -563.6473153363396, 3213)
-    femmesh.addNode(1881.7667375214069, -34.45658168249544, -383.33228484743165, 3214)
-    femmesh.addNode(-834.2307693474988, -67.14903810476675, 933.6781073257987, 3215)
-    femmesh.addNode(771.5786164406948, 160.57324616519668, -573.1662225419142, 3216)
-    femmesh.addNode(-730.6815382210563, -320.14104401662007, -3232.676851060244, 3217)
-    femmesh.addNode(-2110.1833308434298, 444.72520501319116, -69.02662844100794, 3218)
-    femmesh.addNode(-1794.0987527045272, 617.0618192751883, 133.79033624241205, 3219)
-    femmesh.addNode(-1715.4788125806263, 574.9145634046956, -292.0267815875353, 3220)
-    femmesh.addNode(-1540.9722328461974, 1573.6555465681922, -2093.9004410933994, 3221)
-    femmesh.addNode(-3996.626726160198, -862.6609503895847, 79.19886143291639, 3222)
-    femmesh.addNode(-4415.822858441946, -300.658160183275, -11.002542796619537, 3223)
-    femmesh.addNode(1545.6874297302506, 399.39784099043936, -146.61268551521556, 3224)
-    femmesh.addNode(-3125.030774229884, -2182.526214345245, 1289.9600795589513, 3225)
-    femmesh.addNode(4203.491616476846, -760.1595134305478, 189.3994758416356, 3226)
-    femmesh.addNode(-3504.653733199457, -2227.033588266844, -979.6998440113041, 3227)
-    femmesh.addNode(1332.3178101589194, -777.333326338043, 29.903294633414042, 3228)
-    femmesh.addNode(1324.054635402815, -761.7120010139373, 174.2407960261058, 3229)
-    femmesh.addNode(-174.55662539239478, 2127.5456738077683, -3534.4737051616494, 3230)
-    femmesh.addNode(-898.7983008520105, 1748.8313896834065, -3685.133689234261, 3231)
-    femmesh.addNode(-347.3453961663323, 1344.6332654255118, -3938.2780156825775, 3232)
-    femmesh.addNode(-2301.797412517121, -359.3487389124641, -3618.399960536648, 3233)
-    femmesh.addNode(-1058.8908185673702, 970.0936037821034, -647.5936811358702, 3234)
-    femmesh.addNode(-942.7880295143625, 966.6086473584382, -343.500695206283, 3235)
-    femmesh.addNode(-1093.8031202027914, 1482.5273634915359, -358.486237417491, 3236)
-    femmesh.addNode(-1569.770425133598, -3101.692690548367, 2322.1063887469413, 3237)
-    femmesh.addNode(-1665.8408428757593, -3370.9872156452193, 1662.7673274088115, 3238)
-    femmesh.addNode(-2004.869971347869, -2938.301577066679, 1927.106783040924, 3239)
-    femmesh.addNode(-1662.6872143073, -2427.1028516493307, 1161.6085687111038, 3240)
-    femmesh.addNode(3962.9945255587045, 1178.074337210673, 692.9262965310223, 3241)
-    femmesh.addNode(4209.040647393644, 698.1555131267783, 173.9690298564152, 3242)
-    femmesh.addNode(474.98585923343404, 2443.277796375527, -776.1957726592882, 3243)
-    femmesh.addNode(994.9036983163935, 2917.833616214708, -698.4309280595808, 3244)
-    femmesh.addNode(1239.3756169253465, 2371.786655908222, -1077.4182032381182, 3245)
-    femmesh.addNode(-758.3661444452805, 358.9104061838516, -580.974435107373, 3246)
-    femmesh.addNode(-636.7689105365357, 344.2684526424786, -523.714905485767, 3247)
-    femmesh.addNode(-677.4551159312591, 429.3814022235811, -486.1391809463843, 3248)
-    femmesh.addNode(355.0022366457847, 530.7298248582184, 36.427897435839284, 3249)
-    femmesh.addNode(-1552.8098462272935, 295.2727771145806, 256.20487699866896, 3250)
-    femmesh.addNode(-1483.842188842049, 392.09325402701097, 219.00421617454293, 3251)
-    femmesh.addNode(389.9815017044957, 2013.7602532510216, -528.9753983498703, 3252)
-    femmesh.addNode(544.9467707865281, -122.88493319008, -758.407401825187, 3253)
-    femmesh.addNode(1215.3167639941958, -262.7252844800117, -630.4256034102668, 3254)
-    femmesh.addNode(-548.1695008695042, 105.51186565053254, -737.8362091745137, 3255)
-    femmesh.addNode(-731.3285586096297, 150.03113148974558, -556.092036968081, 3256)
-    femmesh.addNode(892.456747891619, 1089.9400428040356, -3830.4109472346586, 3257)
-    femmesh.addNode(238.02414331468347, 905.3711964944351, -4093.49037780922, 3258)
-    femmesh.addNode(-2189.52209282137, 223.257968127675, -446.54912249340816, 3259)
-    femmesh.addNode(-3348.1897209561084, -1420.7135095005501, 2125.613605931546, 3260)
-    femmesh.addNode(-2893.005991779392, -1928.169693743656, 2055.7651649197073, 3261)
-    femmesh.addNode(3474.6489494974794, -1055.2343918293582, 2232.663614386332, 3262)
-    femmesh.addNode(3675.7218282073227, -1583.2200048038271, 1775.6893865711431, 3263)
-    femmesh.addNode(534.0203458780961, 546.3505022289296, -581.9727384157677, 3264)
-    femmesh.addNode(-508.7247400337426, -822.0183821839964, -3966.9689417864574, 3265)
-    femmesh.addNode(-96.60217145022256, -113.89971972062585, -3230.609602257765, 3266)
-    femmesh.addNode(-522.7612528403713, -106.72808303730017, -4107.401288515062, 3267)
-    femmesh.addNode(-1156.840619611205, -312.9694073332944, -4109.468537317542, 3268)
-    femmesh.addNode(-744.718051027685, 395.1492551300762, -3373.109197788849, 3269)
-    femmesh.addNode(-1404.727008510942, -911.1939941757396, -3950.4840015132304, 3270)
-    femmesh.addNode(-602.6750540027541, 816.244696679094, 704.9144110967047, 3271)
-    femmesh.addNode(-793.3748166754563, 739.778038607551, 798.8547858311974, 3272)
-    femmesh.addNode(-48.338323131070126, -1964.959438223641, 1248.7165917290135, 3273)
-    femmesh.addNode(1080.567028595689, -514.0310443818233, -483.5235542756477, 3274)
-    femmesh.addNode(-1655.4272797743179, -194.0365937166306, 94.7237180938062, 3275)
-    femmesh.addNode(-1738.4949295559143, -495.4083735908216, 298.3144295637176, 3276)
-    femmesh.addNode(-1007.4521914421358, -753.5686400979118, -45.42082276031805, 3277)
-    femmesh.addNode(-1027.7767202161194, -727.4243910655188, -200.16615781276658, 3278)
-    femmesh.addNode(-1141.9046798484858, -737.2331366080792, -79.59048787790323, 3279)
-    femmesh.addNode(1574.234464294792, 659.4437913701806, -3763.0323021722443, 3280)
-    femmesh.addNode(-2239.8664342179836, -3169.7548184066377, 1304.6037015204665, 3281)
-    femmesh.addNode(-2950.4069852319612, -2887.0487278952714, 919.2147699654336, 3282)
-    femmesh.addNode(-1867.6713136311764, 2196.934877512826, 295.747059237457, 3283)
-    femmesh.addNode(476.01058521234955, -875.4540765193813, -125.00419391781435, 3284)
-    femmesh.addNode(1352.5554027374924, -3691.277922210939, -1745.9997072976435, 3285)
-    femmesh.addNode(-1415.2165550045443, 510.36994584141553, -721.2218028832174, 3286)
-    femmesh.addNode(-1031.3423125549598, 460.1942111256568, -738.4559492543722, 3287)
-    femmesh.addNode(-271.0334751004522, -1764.2591010281285, -184.46861229080133, 3288)
-    femmesh.addNode(-1509.3101067494333, 3471.27068471267, -1780.9287731617915, 3289)
-    femmesh.addNode(-1745.2598987114936, 3706.540607883296, -1177.1954315927933, 3290)
-    femmesh.addNode(-2117.1798254568753, 3218.5690592027304, -1917.5192767380136, 3291)
-    femmesh.addNode(-1491.1624399691411, 2459.147887594321, -2104.2012315700244, 3292)
-    femmesh.addNode(1626.852727234921, -203.10459338429243, 168.60292238397471, 3293)
-    femmesh.addNode(-2955.6865241474898, -706.8397674591931, -872.8942854728675, 3294)
-    femmesh.addNode(1315.4207412122491, -150.059678497193, -625.1513211212696, 3295)
-    femmesh.addNode(1190.4207412122494, -150.05967849719298, -658.6449701751599, 3296)
-    femmesh.addNode(1027.0268364562623, -443.97270293240325, -553.7795386129974, 3297)
-    femmesh.addNode(980.7668340670102, -553.2940097496773, -444.9829348724285, 3298)
-    femmesh.addNode(-1570.6763315841324, 358.92022630145954, -92.31089565755235, 3299)
-    femmesh.addNode(-1466.8605041430715, 451.04795686130115, -117.80351176034742, 3300)
-    femmesh.addNode(-1513.580706459567, 446.3744877450928, 1.0864522590659131, 3301)
-    femmesh.addNode(-1170.223082995838, -214.3220919008408, 993.3743621198508, 3302)
-    femmesh.addNode(1502.1861997504893, -542.6936939283835, -403.3966753832191, 3303)
-    femmesh.addNode(-1401.5972793804517, 1292.3008791522611, -111.52293897479422, 3304)
-    femmesh.addNode(-1459.517549221628, 854.290238661155, -452.2252540517786, 3305)
-    femmesh.addNode(-1769.1993128487848, 1190.7882205115316, -668.7538937571449, 3306)
-    femmesh.addNode(-1559.877154453516, 2387.1613618521005, 48.783760794760184, 3307)
-    femmesh.addNode(974.9405358943925, -117.77623799986353, 748.104277682132, 3308)
-    femmesh.addNode(1010.7258695277465, -207.49282720290722, 728.6912320367135, 3309)
-    femmesh.addNode(1109.1187800658677, 55.5731002207287, 657.2368312657472, 3310)
-    femmesh.addNode(1144.9041136992216, -34.143488982314985, 637.8237856203287, 3311)
-    femmesh.addNode(-2578.8955626900934, -2737.0691798280973, 1568.943157152579, 3312)
-    femmesh.addNode(-3236.8888591166788, -45.39562292950171, -359.4529319713799, 3313)
-    femmesh.addNode(-3626.0236418335326, -410.41703971631057, -689.0723127340726, 3314)
-    femmesh.addNode(665.1884559220332, 304.106035508148, 750.3795571433631, 3315)
-    femmesh.addNode(815.7852405568198, 1614.9398927701488, -812.8813470473718, 3316)
-    femmesh.addNode(366.2119180824407, 1689.0622985130778, -841.9577008018188, 3317)
-    femmesh.addNode(-1499.8345310368873, 631.3841894712547, 239.3924510932889, 3318)
-    femmesh.addNode(980.1726304842376, -813.7690665488351, -80.39072902053888, 3319)
-    femmesh.addNode(-1652.5976631687088, 39.78849153657474, 164.63734919970784, 3320)
-    femmesh.addNode(-1735.6653129503052, -261.58328833761624, 368.22806066961925, 3321)
-    femmesh.addNode(-1845.4879111146984, -124.13647434059673, 71.87031003786166, 3322)
-    femmesh.addNode(3150.1862811668834, -931.9141781581857, 2725.8918385410107, 3323)
-    femmesh.addNode(914.6552600375214, 2087.2836058470257, -920.0327508641005, 3324)
-    femmesh.addNode(1943.351777101705, 523.4063841010393, 3.5754393739202897, 3325)
-    femmesh.addNode(-1592.8113383147584, -3669.3963065097805, 1055.184210451514, 3326)
-    femmesh.addNode(-1526.44159869987, 760.0015907756122, -241.1271503201013, 3327)
-    femmesh.addNode(-1605.0615388237711, 802.1488466461049, 184.68996750984604, 3328)
-    femmesh.addNode(-1529.5730486544053, 685.6654231893365, 21.474687177811866, 3329)
-    femmesh.addNode(1497.7682882457157, -416.6167060507295, 414.2405318846073, 3330)
-    femmesh.addNode(1569.532916681436, -424.2016460189661, 297.69646811947325, 3331)
-    femmesh.addNode(1478.0282770843378, -497.63240630258815, 341.74394113860706, 3332)
-    femmesh.addNode(885.238932821042, 378.1653582073773, -546.727325625858, 3333)
-    femmesh.addNode(719.3768294769781, 446.53469390954433, -611.0406143904064, 3334)
-    femmesh.addNode(-1045.1208511834616, -659.8596040300245, 147.59919368329938, 3335)
-    femmesh.addNode(-910.4294831605, -790.3694735821347, 136.81788599555182, 3336)
-    femmesh.addNode(-1194.8724920413308, 684.0651495989277, 29.227717633793606, 3337)
-    femmesh.addNode(-151.82929044988975, 455.2008526947516, 4048.365339130238, 3338)
-    femmesh.addNode(480.1560046748739, 151.92016290594603, 4218.449926663312, 3339)
-    femmesh.addNode(107.24828701644148, -358.88501948095575, 4363.54426683927, 3340)
-    femmesh.addNode(587.404291691315, -206.96485657500972, 3581.9941935025813, 3341)
-    femmesh.addNode(-44.58100343344857, 96.31583321379583, 3411.909605969508, 3342)
-    femmesh.addNode(912.422350212519, -462.06916090027187, -525.2698918571853, 3343)
-    femmesh.addNode(-304.27677369536417, -1626.8491099361704, 22.513260244850784, 3344)
-    femmesh.addNode(-637.765667098691, -1187.9796452048881, 72.46237307531831, 3345)
-    femmesh.addNode(-1929.927618797362, 111.83537666928149, -510.6686587103579, 3346)
-    femmesh.addNode(-2242.1619251276898, 277.4494227495689, -172.7478490093435, 3347)
-    femmesh.addNode(-1847.4574068648863, 407.6387811410734, -395.74800215587084, 3348)
-    femmesh.addNode(-2464.643719018498, -2587.214123020789, -2388.209656872958, 3349)
-    femmesh.addNode(2263.559766284956, -1389.1698579401977, -707.5419887795274, 3350)
-    femmesh.addNode(262.5171255078585, -2393.0787847276547, 1303.6610385706208, 3351)
-    femmesh.addNode(1026.1127137349504, 621.816878432998, 427.81225591096086, 3352)
-    femmesh.addNode(-1094.7326239713157, -13.549449307545395, -652.0589358386787, 3353)
-    femmesh.addNode(-1153.7754976628144, 172.1951310383844, -845.9664291791719, 3354)
-    femmesh.addNode(-1176.913515569233, 29.779139492373517, -634.1557571197529, 3355)
-    femmesh.addNode(187.20485023418564, 557.5017622145868, 814.8460628732486, 3356)
-    femmesh.addNode(3116.2056626581334, 1224.0435016810825, 2747.4904237286764, 3357)
-    femmesh.addNode(376.1158397527324, 1970.93408329865, -669.0443688425594, 3358)
-    femmesh.addNode(-41.28282932179677, -414.59500943366106, -4045.08862776458, 3359)
-    femmesh.addNode(-55.319342128425475, 300.6952897130352, -4185.520974493185, 3360)
-    femmesh.addNode(-443.4802720711284, -69.68051209366767, 4179.087564389983, 3361)
-    femmesh.addNode(-336.23198505468724, -428.56553157462344, 3542.6318312292524, 3362)
-    femmesh.addNode(919.0764893720485, 167.46843428315745, -579.3824622886287, 3363)
-    femmesh.addNode(859.5761010268643, 45.93636593630033, -619.1690941359179, 3364)
-    femmesh.addNode(937.6664869985941, 176.59060919325844, 638.7341166938634, 3365)
-    femmesh.addNode(351.7602762409157, 2816.327782263963, 3309.234890159697, 3366)
-    femmesh.addNode(12.091814637170756, 2796.023145825209, 2330.6044132227344, 3367)
-    femmesh.addNode(-1054.7433268426828, -1592.0152327244505, 875.3082158921449, 3368)
-    femmesh.addNode(-741.5504859492654, 1099.6306883159154, 540.3057160666775, 3369)
-    femmesh.addNode(1530.1989963431115, 176.81936218208307, -884.3931174881029, 3370)
-    femmesh.addNode(-248.98906172885526, 1580.2974173878922, 3778.7728577152866, 3371)
-    femmesh.addNode(-3764.5677926835356, 558.6810365042438, 1260.2807045278971, 3372)
-    femmesh.addNode(-3813.750428395838, -170.33814198404963, 1550.406334811778, 3373)
-    femmesh.addNode(-2400.6025571561086, 296.8735601288687, 841.0567658659702, 3374)
-    femmesh.addNode(-3931.9016284841937, 1567.2621820781476, -179.47012925830782, 3375)
-    femmesh.addNode(-914.7489943704816, -422.6568257699695, 867.8335808919137, 3376)
-    femmesh.addNode(-3232.9984029807433, 2545.1608973785724, 811.0688047740616, 3377)
-    femmesh.addNode(-1648.8316166865743, -193.427589636729, -107.71112133077477, 3378)
-    femmesh.addNode(-1673.2912331500265, -197.27222030578977, -8.943149819424296, 3379)
-    femmesh.addNode(-2076.2675375921845, -2078.476376193291, -3101.187798991802, 3380)
-    femmesh.addNode(-196.27641581459966, 2300.4326519848937, 3708.288740186078, 3381)
-    femmesh.addNode(1345.4630907368262, 4057.2216571356607, -672.7048355374693, 3382)
-    femmesh.addNode(-80.92866475878435, -1900.6781433132364, -827.3185921079514, 3383)
-    femmesh.addNode(1767.3195936291122, -459.8702820463859, -275.60561712181357, 3384)
-    femmesh.addNode(445.17012668703944, -60.08644481520386, -4151.755446627863, 3385)
-    femmesh.addNode(389.85078455861367, 240.60884489783135, -3337.276421121048, 3386)
-    femmesh.addNode(-1230.4767162173955, 3987.320165753431, -830.5226163452985, 3387)
-    femmesh.addNode(-606.1719892531293, 4166.633347073449, -557.2951812633257, 3388)
-    femmesh.addNode(2117.59909534531, -98.29586832927954, -129.10729864141, 3389)
-    femmesh.addNode(1924.4379296253946, 238.86847168537156, 2.6302575327783586, 3390)
-    femmesh.addNode(627.0042819752805, 458.8034804011621, 583.9629261644254, 3391)
-    femmesh.addNode(623.1492727980392, 589.8969060026852, 370.9403650209606, 3392)
-    femmesh.addNode(-3259.168891089028, -1246.2591059371564, -2483.9382105194522, 3393)
-    femmesh.addNode(-3149.500619477938, -2018.2063800412689, -2198.4420805758537, 3394)
-    femmesh.addNode(-2761.1244380516246, -1509.4686332137708, -2911.4202226946977, 3395)
-    femmesh.addNode(-146.28904355664048, -955.9421930649094, 16.542775609503273, 3396)
-    femmesh.addNode(-481.8233984590449, -843.2209759792638, 255.30729619363802, 3397)
-    femmesh.addNode(-480.7151614495591, -709.4109000813144, 66.89563951639306, 3398)
-    femmesh.addNode(-663.9979866791698, -885.2393859242911, 236.93068338324215, 3399)
-    femmesh.addNode(-328.46363177676534, -997.9606030099367, -1.8338372008925816, 3400)
-    femmesh.addNode(1129.6440462101693, 94.92490417554154, -733.83816735516, 3401)
-    femmesh.addNode(1121.5463050976914, 552.9111089110908, 499.8772167144585, 3402)
-    femmesh.addNode(1145.3256943540314, 448.5064436505716, 734.9969281812573, 3403)
-    femmesh.addNode(990.4546586839065, 552.9516325734979, 514.3100319105679, 3404)
-    femmesh.addNode(-628.8913113489875, 581.8655476618142, -4102.535348089144, 3405)
-    femmesh.addNode(-1180.3442160346656, 986.0636719197089, -3849.391021640827, 3406)
-    femmesh.addNode(-1262.970678119821, 375.62422336581994, -4104.602596891623, 3407)
-    femmesh.addNode(584.0240069843871, 744.6968919407242, 288.6613184498209, 3408)
-    femmesh.addNode(879.9909081799015, -493.5593895026766, -882.849697259165, 3409)
-    femmesh.addNode(799.7527462223635, -636.1688525520063, -592.896984777138, 3410)
-    femmesh.addNode(-1488.5416231258691, -327.2711266493155, -351.74586556519756, 3411)
-    femmesh.addNode(-1574.2485608129418, -270.4385081784347, -299.7517277497595, 3412)
-    femmesh.addNode(-1756.9917293890257, -617.1175987513807, -349.7416884124863, 3413)
-    femmesh.addNode(2892.396228134311, -1835.2630693790147, -2670.690699583969, 3414)
-    femmesh.addNode(3855.8038343188737, 1729.0130462621216, 537.792976084676, 3415)
-    femmesh.addNode(1432.407249493392, -707.3479546448224, 452.8955575620954, 3416)
-    femmesh.addNode(-3033.468619840845, 2980.390184145638, 278.254929524925, 3417)
-    femmesh.addNode(-3483.8107785020898, 2456.4223810675235, -129.75725278144716, 3418)
-    femmesh.addNode(-3258.8195490323633, 2300.91414827499, 349.0837815020792, 3419)
-    femmesh.addNode(-1692.472879024846, 2019.9848837489917, -3260.4325999605016, 3420)
-    femmesh.addNode(-1527.3469928415918, 2671.0162263301922, -2811.8613159125343, 3421)
-    femmesh.addNode(-251.70172210239429, 983.7077092804268, 428.3398502181011, 3422)
-    femmesh.addNode(110.06521760953679, -497.4371123231891, 3125.8290545843174, 3423)
-    femmesh.addNode(15.630985207207676, -922.5926865887769, -183.97425349361174, 3424)
-    femmesh.addNode(-288.7448048882734, -1025.53087476369, -254.57013770271527, 3425)
-    femmesh.addNode(813.1358554342328, -490.93674737969536, 472.78591738206194, 3426)
-    femmesh.addNode(702.2240386235349, -722.4383216977055, 369.19184286832365, 3427)
-    femmesh.addNode(-453.6098527964102, 299.74918680326556, -705.4590776921997, 3428)
-    femmesh.addNode(-483.05121757146986, 487.0498088407851, -543.4775172866823, 3429)
-    femmesh.addNode(-765.8271443036556, -39.95669505335695, -873.9449952122538, 3430)
-    femmesh.addNode(1484.8179078671794, -513.0950281812611, 80.32066603962505, 3431)
-    femmesh.addNode(1576.3225474642777, -439.664267897639, 36.27319302049125, 3432)
-    femmesh.addNode(-1230.6474103116184, -32.98911465684898, -978.9009156118755, 3433)
-    femmesh.addNode(-1359.8368629115703, 1.5847240001823586, -885.9687456534868, 3434)
-    femmesh.addNode(-1318.6547005425832, 7.4749400419405525, -711.1857017189689, 3435)
-    femmesh.addNode(605.7165130966309, 228.94258186736366, -637.4795113064625, 3436)
-    femmesh.addNode(-619.3091387784709, 356.0338480884782, -1035.4790936189675, 3437)
-    femmesh.addNode(-713.8687868515649, 161.79652693574513, -1067.8562251012813, 3438)
-    femmesh.addNode(-696.0696409198732, 312.628647671284, -749.0049996127537, 3439)
-    femmesh.addNode(-793.2581758860742, 290.7113900769968, 832.6888428050311, 3440)
-    femmesh.addNode(-935.1669010527944, 778.8518688931877, -2544.9764937107893, 3441)
-    femmesh.addNode(-741.8722736384495, 741.1105078355997, 490.2974477049448, 3442)
-    femmesh.addNode(591.9513895509594, -824.5728358449879, -450.40543532948107, 3443)
-    femmesh.addNode(-596.9386032007133, -1081.739841060692, -368.6855841037493, 3444)
-    femmesh.addNode(-1560.835129564227, 180.9521502713986, 296.9506704984922, 3445)
-    femmesh.addNode(2526.6275399216793, 2776.807461721066, -1927.8665308053703, 3446)
-    femmesh.addNode(1999.6654302580096, -1159.7298252125831, -205.0400253756611, 3447)
-    femmesh.addNode(-1810.9689506502236, -651.0870363235767, -120.59847835690012, 3448)
-    femmesh.addNode(-1277.8232902623154, 636.1349842322177, -66.90388049291343, 3449)
-    femmesh.addNode(-2135.216711549034, 2418.314600820253, -2948.451819488757, 3450)
-    femmesh.addNode(813.4340883456682, 47.4578362742073, 619.0280964337543, 3451)
-    femmesh.addNode(-682.5622390262645, -573.7417521106851, -9.195375225834496, 3452)
-    femmesh.addNode(-817.9056464666292, -594.7751914418383, -95.44500065870375, 3453)
-    femmesh.addNode(-716.1442811136494, 612.8921920043417, -296.414997578393, 3454)
-    femmesh.addNode(-521.7403827538601, 670.5605986215456, -353.75333391869106, 3455)
-    femmesh.addNode(1011.3574737732499, 914.369910315012, -735.4345837249341, 3456)
-    femmesh.addNode(1266.4107189692784, -532.8233282999247, 616.7280323191305, 3457)
-    femmesh.addNode(-1506.3334055174769, 1611.2425032888273, -536.8036313688533, 3458)
-    femmesh.addNode(-1311.4238619541902, 1378.2713704679045, -775.1025814121679, 3459)
-    femmesh.addNode(-732.913428321843, -4038.625140667152, -802.3589841109213, 3460)
-    femmesh.addNode(1570.1620744911575, -884.8540398374678, 52.19056942956724, 3461)
-    femmesh.addNode(-931.8996501724134, 687.4093033868252, 922.9663495845741, 3462)
-    femmesh.addNode(-999.0128064693022, 444.8536817417556, 767.0132392123026, 3463)
-    femmesh.addNode(-1253.3955684648759, 78.74582702282098, 1350.2831028322817, 3464)
-    femmesh.addNode(-1314.14057926061, 3246.2949286017456, -2367.732548166195, 3465)
-    femmesh.addNode(-1922.0102979680519, 2993.5933030918063, -2504.323051742417, 3466)
-    femmesh.addNode(-867.3398013737509, -719.4126161460915, 347.8951369542127, 3467)
-    femmesh.addNode(3019.4135136276254, 1523.4319067944884, -2667.661715985975, 3468)
-    femmesh.addNode(3024.0580721815254, 936.8333763232762, -2977.414813657197, 3469)
-    femmesh.addNode(-1123.1578853997648, 380.0611724836539, 1224.9112444455009, 3470)
-    femmesh.addNode(-1355.070279479081, 539.1199179951612, 914.7113677293722, 3471)
-    femmesh.addNode(786.8444556047343, -322.27777679903886, 479.6443236955343, 3472)
-    femmesh.addNode(-3727.762344842272, 973.1758555336737, 1728.718895396532, 3473)
-    femmesh.addNode(879.7907729538148, -358.8850194809559, 4241.185557577152, 3474)
-    femmesh.addNode(-1006.5205814402575, -3813.8902093828565, -1311.7545866919106, 3475)
-    femmesh.addNode(-1503.1433721858116, -593.6355983658649, 113.53671210853321, 3476)
-    femmesh.addNode(-689.3987088992592, 94.45396541704102, -4187.588223295665, 3477)
-    femmesh.addNode(3426.9406988508463, 848.4044108565583, -2463.761979320214, 3478)
-    femmesh.addNode(122.92082492905581, 2837.12535081193, -37.420387502997386, 3479)
-    femmesh.addNode(415.92099620114453, 2976.498641335259, -410.3698115520061, 3480)
-    femmesh.addNode(-3124.1580519442587, -652.1362610164717, -2897.914422369485, 3481)
-    femmesh.addNode(-2626.1135989068553, -915.3457882930861, -3325.3964345447303, 3482)
-    femmesh.addNode(567.8782627775282, 4211.457149958311, -407.0933719481292, 3483)
-    femmesh.addNode(-11.104439337720812, 4270.122175078863, -119.03225544055447, 3484)
-    femmesh.addNode(-1670.4616165444174, 36.55286494741556, 60.970481286477366, 3485)
-    femmesh.addNode(-1632.7003475710962, 163.47533384855387, -6.706453040859643, 3486)
-    femmesh.addNode(-1644.5723798317754, 154.10911837975675, 123.89155569988463, 3487)
-    femmesh.addNode(-4351.153208759727, 107.478260405163, -795.9649130033253, 3488)
-    femmesh.addNode(-813.8604372957259, -2308.579077147001, -1286.8254939806268, 3489)
-    femmesh.addNode(-767.3253339653252, -2574.5291086642137, -908.2827208655443, 3490)
-    femmesh.addNode(738.5136121301484, 544.589461966196, -4059.724849943898, 3491)
-    femmesh.addNode(1078.9652999918326, -622.9288581844862, -261.63986803440037, 3492)
-    femmesh.addNode(-2028.1508686912439, -686.2319789260125, -4.377261544056978, 3493)
-    femmesh.addNode(-624.2922295180581, 446.7054247237489, 413.0467529877874, 3494)
-    femmesh.addNode(-619.8000678829349, -680.4724525902986, 259.59627766465815, 3495)
-    femmesh.addNode(-1316.2369187124573, 3531.3999008538385, 2051.724688917632, 3496)
-    femmesh.addNode(-1846.699227192079, 3542.999584735026, 1327.4458282868504, 3497)
-    femmesh.addNode(-2341.652886291066, 606.0393775619827, 641.1996311867888, 3498)
-    femmesh.addNode(-1311.720631971833, 765.05409611192, -749.99704616954, 3499)
-    femmesh.addNode(-927.8463895222486, 714.8783613961614, -767.2311925406948, 3500)
-    femmesh.addNode(761.116351215541, 626.8727642763472, -656.3925184650849, 3501)
-    femmesh.addNode(-4134.620523472757, -962.1023047129665, -524.4438962981072, 3502)
-    femmesh.addNode(-2318.0134722924213, 1672.9670744347113, -112.26512306891516, 3503)
-    femmesh.addNode(1695.6102442187666, 463.5198604612368, 344.2336218377177, 3504)
-    femmesh.addNode(3318.154864669452, -2384.0719187300047, -834.214145019135, 3505)
-    femmesh.addNode(3248.4959831914384, -2794.5340648885094, -310.45609160939665, 3506)
-    femmesh.addNode(-3540.253083468687, -700.8722676902407, -2368.958630639506, 3507)
-    femmesh.addNode(-3777.3341860644587, -996.2417656644519, -1869.0937884411785, 3508)
-    femmesh.addNode(-3683.340561641988, 2021.1930943004577, 403.0566224676895, 3509)
-    femmesh.addNode(306.9791991520429, -820.0578188345772, -347.38825886995414, 3510)
-    femmesh.addNode(-3154.6986349279478, -2899.781432678082, 104.71840238686322, 3511)
-    femmesh.addNode(-1062.0206924481427, -62.972690604561976, 1082.1722649451883, 3512)
-    femmesh.addNode(-812.7810020431716, -338.8257873691705, 1332.4032203470438, 3513)
-    femmesh.addNode(1666.611822169687, 246.0443803444957, 122.54998945337027, 3514)
-    femmesh.addNode(-2817.692726834931, -607.3984131358114, -269.2515277418439, 3515)
-    femmesh.addNode(-2424.616552616492, -385.034897735529, -154.43789607626422, 3516)
-    femmesh.addNode(-2534.154070291167, 23.526831767789048, -325.95160875128425, 3517)
-    femmesh.addNode(-4311.321516230777, 444.92783271492993, 679.7684020120389, 3518)
-    femmesh.addNode(902.756117287532, -274.9178985359107, -772.6314251163816, 3519)
-    femmesh.addNode(1581.648683013658, 377.6741620996479, -1239.7553720297049, 3520)
-    femmesh.addNode(-1534.22687659588, -202.5631156964449, -407.82266130321574, 3521)
-    femmesh.addNode(-666.0728658599668, 3729.3877717422483, 1947.8099662053578, 3522)
-    femmesh.addNode(-1387.967410568192, -36.52738412225392, -488.7845565938996, 3523)
-    femmesh.addNode(-1448.6768159914527, -172.53386850716655, -707.5517062490399, 3524)
-    femmesh.addNode(-1286.7107134940609, -44.29365937721103, -542.131357216844, 3525)
-    femmesh.addNode(953.5775576835722, -817.5191641855411, 280.60217226089355, 3526)
-    femmesh.addNode(-1157.2599770906072, -513.0594685748842, -476.21520083246526, 3527)
-    femmesh.addNode(-1320.0766935058318, -564.6948430335541, -678.3709982514392, 3528)
-    femmesh.addNode(-623.1709227811921, -778.999581780095, -204.2172737958255, 3529)
-    femmesh.addNode(1217.7126126244073, -60.086444815204054, -4029.396737365747, 3530)
-    femmesh.addNode(897.9512121471857, -705.8037009868152, -409.5539179391098, 3531)
-    femmesh.addNode(-852.9257925183745, 164.67308503111855, -613.3515665896871, 3532)
-    femmesh.addNode(-2005.366174539051, 3708.009724600128, -458.3077853624843, 3533)
-    femmesh.addNode(-2397.1879241054485, 3551.1139164036053, 154.1232907686155, 3534)
-    femmesh.addNode(-1780.0447517979403, 400.4842486675107, 817.5089092129372, 3535)
-    femmesh.addNode(-1928.5369137389357, 424.3794252988427, 496.86275125362766, 3536)
-    femmesh.addNode(-1564.253675358653, 1173.231862797721, -877.5059464458377, 3537)
-    femmesh.addNode(1895.90267061846, 25.736307872445423, -17.12649891904816, 3538)
-    femmesh.addNode(-1031.3837604195342, -184.17020560376594, -633.3254610093377, 3539)
-    femmesh.addNode(-1094.1723973423273, -249.4882543304629, -616.3300523458915, 3540)
-    femmesh.addNode(877.8600945055855, -162.25229255309202, -800.8507918812746, 3541)
-    femmesh.addNode(-1273.6117852954071, 965.0410984457957, -138.72378528643145, 3542)
-    femmesh.addNode(-1142.5389174711254, -418.4804782697647, 1016.3277385113034, 3543)
-    femmesh.addNode(1339.6419686614872, 346.62304576980705, 617.5697489809075, 3544)
-    femmesh.addNode(1694.5281122553392, 131.57330482387684, 131.22170553685248, 3545)
-    femmesh.addNode(-1915.072439556534, 112.45110938916865, 419.2519135382862, 3546)
-    femmesh.addNode(896.1148945369082, -714.3032435543635, 513.2637960905704, 3547)
-    femmesh.addNode(-872.7608234191741, -884.0785096500222, -56.20213044806561, 3548)
-    femmesh.addNode(-1272.6144280308094, -2024.0360900903825, 1372.7071389743755, 3549)
-    femmesh.addNode(-859.7978701148884, 439.1775647579383, -802.221427405713, 3550)
-    femmesh.addNode(-954.3575181879824, 244.9402436052053, -834.598558888027, 3551)
-    femmesh.addNode(1102.8804636173809, 358.4533821540225, -826.5683645750217, 3552)
-    femmesh.addNode(-1048.6875731468062, 1043.8400834697318, 99.0889271875659, 3553)
-    femmesh.addNode(-1615.8680731460138, 538.8854089257745, 672.3542581171986, 3554)
-    femmesh.addNode(-1009.7120789926043, 872.3199994728956, -132.40259147460569, 3555)
-    femmesh.addNode(-3560.0347349900103, -1858.9871927044196, -1551.185780791259, 3556)
-    femmesh.addNode(-3906.784109196872, -1382.4094165745184, -1336.81706853653, 3557)
-    femmesh.addNode(1068.2808357178349, -312.311971050285, -959.4957620564345, 3558)
-    femmesh.addNode(-2689.0806131913673, -1983.2945361208863, -2672.682877832589, 3559)
-    femmesh.addNode(-2300.704431765054, -1474.5567892933882, -3385.6610199514325, 3560)
-    femmesh.addNode(-1594.936282019141, -338.5696000813575, -626.5898109583561, 3561)
-    femmesh.addNode(-887.0480020319967, -774.4215119438259, -508.4228450315135, 3562)
-    femmesh.addNode(-1126.7057145051808, -555.3067907806675, -663.2715188920271, 3563)
-    femmesh.addNode(772.9654773956062, -741.6979930426589, -302.49138542477164, 3564)
-    femmesh.addNode(-1031.2294308367864, 39.7559979099719, -967.5330453207306, 3565)
-    femmesh.addNode(-845.8020692269772, -1310.1499396848176, 3992.5022166146127, 3566)
-    femmesh.addNode(-890.0262481118684, -700.5725755181905, 4056.60136994186, 3567)
-    femmesh.addNode(1768.1318320712417, 416.5000702936975, -6.71926389487939, 3568)
-    femmesh.addNode(3555.155453490719, 2420.4611838805267, 261.40933747480335, 3569)
-    femmesh.addNode(737.4361955324498, -116.3159266167917, -920.0198860171926, 3570)
-    femmesh.addNode(-636.6574300892053, -1054.1695693069387, -115.94928360192665, 3571)
-    femmesh.addNode(-1176.6730672318508, 1371.0998641761971, 126.28977349920314, 3572)
-    femmesh.addNode(899.4751678962331, -5.719451999438802, 640.4037131286594, 3573)
-    femmesh.addNode(-671.0540652366362, 3532.6751222105563, 2291.0110066011753, 3574)
-    femmesh.addNode(-20.89001238414572, 3730.662993098966, 2187.096283888901, 3575)
-    femmesh.addNode(-1808.825435844477, -116.18938120101123, -620.3998366868175, 3576)
-    femmesh.addNode(-1825.648910529785, -579.1820472639348, -822.6428975430642, 3577)
-    femmesh.addNode(484.1483194434013, -697.4185520726815, 1494.6783654155722, 3578)
-    femmesh.addNode(929.2639558577857, 696.5047368523519, -905.8345711140457, 3579)
-    femmesh.addNode(-981.7635236685643, 1138.1287313552743, -112.00917654411143, 3580)
-    femmesh.addNode(-3496.2499936848, -1541.6286039113675, -1984.073368321125, 3581)
-    femmesh.addNode(-1548.9905975964157, 334.35467371013726, -940.5291428428748, 3582)
-    femmesh.addNode(-929.910586885352, 379.9270525515701, -517.2089569560322, 3583)
-    femmesh.addNode(989.2201472370336, 140.86127011184186, -853.0072614910779, 3584)
-    femmesh.addNode(654.7684777887406, 380.6892330056586, -848.4532891540484, 3585)
-    femmesh.addNode(-632.5367876523567, -281.6621206862684, 887.9997969217823, 3586)
-    femmesh.addNode(1320.0647874224187, -55.134774321651435, -892.4831375303198, 3587)
-    femmesh.addNode(1008.5939479621007, 49.853648221289895, 797.6405443944067, 3588)
-    femmesh.addNode(549.803689916204, 2087.573962865902, 3713.216645626444, 3589)
-    femmesh.addNode(-231.21511609258505, 3285.3120218572626, 2812.2543138682263, 3590)
-    femmesh.addNode(-2003.9265577931487, -933.3297318630384, -3748.4584049135474, 3591)
-    femmesh.addNode(-1756.0401688934116, -335.1051450205931, -3907.4429407178586, 3592)
-    femmesh.addNode(837.1416548948271, 170.87115719381964, 779.1378298225228, 3593)
-    femmesh.addNode(-339.29768902429845, -989.7770829054787, 4241.058072391147, 3594)
-    femmesh.addNode(-292.00780616979614, -1038.1428957412504, 3478.532677902005, 3595)
-    femmesh.addNode(-1611.5649262102552, -665.6645143833282, -520.00175819163, 3596)
-    femmesh.addNode(-1550.789322016476, -805.3072902161314, -874.4240848361475, 3597)
-    femmesh.addNode(-2274.5595962671587, -87.89575969060448, -390.07114496823397, 3598)
-    femmesh.addNode(-1465.5034966846024, -516.1479274016066, -508.1109284722956, 3599)
-    femmesh.addNode(-990.0472684677993, 45.6462139517301, -792.7500013862126, 3600)
-    femmesh.addNode(-1485.307962544192, 237.80457253432834, 1040.083226116153, 3601)
-    femmesh.addNode(-2170.086057505388, -643.0154318628679, -393.2142701779675, 3602)
-    femmesh.addNode(-848.9995583713306, 450.39804859129964, -422.3737027950434, 3603)
-    femmesh.addNode(-811.7436004692408, 711.3934049724961, -463.1382066111077, 3604)
-    femmesh.addNode(-1319.4873633915008, -207.10770716419788, -800.4838762074286, 3605)
-    femmesh.addNode(-773.0544352868508, 527.8826151917356, -652.8623899790989, 3606)
-    femmesh.addNode(-965.6811040002715, 411.3532690983544, 507.8891181559559, 3607)
-    femmesh.addNode(-932.5720363111516, 664.6438497640568, 584.2378224394375, 3608)
-    femmesh.addNode(-2153.4574133142737, -315.9205175608972, -499.80232294469357, 3609)
-    femmesh.addNode(-3269.6887726097166, 1597.2850022754865, 2284.4454754823964, 3610)
-    femmesh.addNode(-1157.5212608941088, -78.86749803424237, -635.0635271752326, 3611)
-    femmesh.addNode(832.8125184340757, 309.4648439147813, -711.8992913557797, 3612)
-    femmesh.addNode(-1126.1163843908498, -197.71965491131132, -785.3843968480164, 3613)
-    femmesh.addNode(-926.6984049160178, -124.97454234449044, -774.0165265568716, 3614)
-    femmesh.addNode(-1594.8543954253764, -159.458152064533, -336.85433138636097, 3615)
-    femmesh.addNode(-1861.4652681507966, -61.99792657911735, -346.5985632027528, 3616)
-    femmesh.addNode(-1594.1036191702233, -123.98695287521909, -537.2916364698963, 3617)
-    femmesh.addNode(1724.1357161726803, -620.7744451261187, 219.6937145420685, 3618)
-    femmesh.addNode(1439.1968802762337, -722.8105765234952, 191.4722824631134, 3619)
-    femmesh.addNode(-2244.621491877838, 252.04281103684556, 294.04578657020767, 3620)
-    femmesh.addNode(-1850.5888568194216, 333.30261355479763, -133.14616465795766, 3621)
-    femmesh.addNode(-833.0419965306822, -911.6487814037755, -308.9384309498883, 3622)
-    femmesh.addNode(1781.4555267261653, -399.677392491445, 90.60016880656994, 3623)
-    femmesh.addNode(-1764.3602350870092, 562.7805855571065, 351.7081001578891, 3624)
-    femmesh.addNode(-965.2451237784876, -112.70180762017785, -885.3128655033987, 3625)
-    femmesh.addNode(2003.1519514530155, -523.70956869317, -21.38063091579191, 3626)
-    femmesh.addNode(1955.5120456837137, -989.547437333729, 85.58219481655735, 3627)
-    femmesh.addNode(1775.0787315298176, -806.4194548836458, -332.35178074913193, 3628)
-    femmesh.addNode(541.1081614083935, 163.09712096347795, -874.8921860701046, 3629)
-    femmesh.addNode(-1465.794795115728, -886.7610750956395, -9.018445180326907, 3630)
-    femmesh.addNode(-1794.3403064591093, -323.99212202160606, -227.1865311236262, 3631)
-    femmesh.addNode(-2207.4346345754716, -349.88995513309317, -270.65911288910735, 3632)
-    femmesh.addNode(-1912.6128728063854, 137.85772110189197, -47.54172204126495, 3633)
-    femmesh.addNode(-860.3400939082368, 467.5185644529853, 419.90394993985643, 3634)
-    femmesh.addNode(-1856.1227686914913, 421.61692682228266, 219.39477885910475, 3635)
-    femmesh.addNode(-2172.2073468303934, 249.2803125602855, 16.577814175684765, 3636)
-    femmesh.addNode(-1582.5483638448115, 349.5540108326624, 38.287113083191926, 3637)
-    femmesh.addNode(3097.122310651408, -3030.7198493858214, 213.27482466180777, 3638)
-    femmesh.addNode(-1662.5659698167888, 49.84635037317976, -701.3617319775013, 3639)
-    femmesh.addNode(-2062.6698291557186, -159.28141694303253, 188.09152685070478, 3640)
-    femmesh.addNode(-1750.8957609046074, 250.85226964743248, 274.0972624425476, 3641)
-    femmesh.addNode(-1688.8717449176434, 446.29716210033814, 188.49281982585492, 3642)
-    femmesh.addNode(-1780.6342785221254, 305.1335033655143, 56.1794985270706, 3643)
-    femmesh.addNode(-1915.4424894119945, -95.96736415131335, -117.4553531471666, 3644)
-    femmesh.addNode(-1701.1463524858307, -788.5338503205962, 175.7592722748575, 3645)
-    femmesh.addNode(-2065.4994457613275, -393.1065021962379, 118.17789574480314, 3646)
-    femmesh.addNode(-1917.9020561621428, -121.37397586403668, 349.3382824323846, 3647)
-    femmesh.addNode(-2132.624407453015, -131.11230675374915, -1.2341363343234661, 3648)
-    femmesh.addNode(-867.6140833599447, 333.6452940390025, -685.239521461413, 3649)
-    femmesh.addNode(-2235.273347099509, 2095.4222188720964, -261.4838955448937, 3650)
-    femmesh.addNode(-1777.497896204915, 2282.9053688284694, -367.83258319991666, 3651)
-    femmesh.addNode(652.5811005593596, -1583.9857330455375, 3081.482400393079, 3652)
-    femmesh.addNode(1000.7727735304088, 1362.686476995682, -788.8377364887747, 3653)
-    femmesh.addNode(1036.303250145298, -80.21049773631893, -1028.7237937227146, 3654)
-    femmesh.addNode(1176.7271491184338, -126.14686367261925, -909.5546995867967, 3655)
-    return True
+    return load_mesh(femmesh, __name__, elements=False)
 
 
 def create_elements(femmesh):
     # elements
-    femmesh.addVolume([603, 642, 638, 1060, 710, 713, 711, 1247, 1248, 1249], 511)
-    femmesh.addVolume([616, 612, 620, 1232, 743, 745, 746, 1250, 1251, 1252], 512)
-    femmesh.addVolume([1006, 1016, 1084, 1136, 1255, 1254, 1253, 1256, 1257, 1258], 513)
-    femmesh.addVolume([67, 1000, 1083, 1142, 1261, 1260, 1259, 1262, 1263, 1264], 514)
-    femmesh.addVolume([994, 1022, 993, 1045, 1267, 1266, 1265, 1268, 1269, 1270], 515)
-    femmesh.addVolume([811, 815, 809, 1094, 933, 932, 929, 1271, 1272, 1273], 516)
-    femmesh.addVolume([1016, 1001, 1084, 1136, 1275, 1274, 1254, 1257, 1276, 1258], 517)
-    femmesh.addVolume([172, 999, 1085, 1153, 1279, 1278, 1277, 1280, 1281, 1282], 518)
-    femmesh.addVolume([1009, 1065, 1073, 1149, 1285, 1284, 1283, 1286, 1287, 1288], 519)
-    femmesh.addVolume([812, 831, 810, 1073, 939, 940, 931, 1289, 1290, 1291], 520)
-    femmesh.addVolume([807, 806, 830, 1141, 920, 921, 922, 1292, 1293, 1294], 521)
-    femmesh.addVolume([986, 1129, 1132, 1134, 1297, 1296, 1295, 1298, 1299, 1300], 522)
-    femmesh.addVolume([990, 1012, 1063, 1086, 1303, 1302, 1301, 1304, 1305, 1306], 523)
-    femmesh.addVolume([997, 1030, 987, 1237, 1309, 1308, 1307, 1310, 1311, 1312], 524)
-    femmesh.addVolume([104, 1001, 1077, 1234, 1315, 1314, 1313, 1316, 1317, 1318], 525)
-    femmesh.addVolume([809, 1094, 815, 1096, 1273, 1272, 932, 1319, 1320, 1321], 526)
-    femmesh.addVolume([142, 991, 1070, 1145, 1324, 1323, 1322, 1325, 1326, 1327], 527)
-    femmesh.addVolume([1012, 990, 1063, 1147, 1303, 1301, 1302, 1328, 1329, 1330], 528)
-    femmesh.addVolume([1026, 1040, 1108, 1138, 1333, 1332, 1331, 1334, 1335, 1336], 529)
-    femmesh.addVolume([999, 172, 1085, 1107, 1279, 1277, 1278, 1337, 1338, 1339], 530)
-    femmesh.addVolume([991, 142, 1070, 1171, 1324, 1322, 1323, 1340, 1341, 1342], 531)
-    femmesh.addVolume([1000, 67, 1083, 1167, 1261, 1259, 1260, 1343, 1344, 1345], 532)
-    femmesh.addVolume([635, 646, 643, 1048, 796, 793, 795, 1346, 1347, 1348], 533)
-    femmesh.addVolume([1005, 1041, 1006, 1142, 1351, 1350, 1349, 1352, 1353, 1354], 534)
-    femmesh.addVolume([815, 818, 809, 1096, 936, 934, 932, 1321, 1355, 1319], 535)
-    femmesh.addVolume([999, 1013, 1072, 1193, 1358, 1357, 1356, 1359, 1360, 1361], 536)
-    femmesh.addVolume([604, 602, 647, 1139, 704, 706, 707, 1362, 1363, 1364], 537)
-    femmesh.addVolume([997, 987, 1040, 1237, 1307, 1366, 1365, 1310, 1312, 1367], 538)
-    femmesh.addVolume([148, 988, 1087, 1174, 1370, 1369, 1368, 1371, 1372, 1373], 539)
-    femmesh.addVolume([1008, 996, 1046, 1140, 1376, 1375, 1374, 1377, 1378, 1379], 540)
-    femmesh.addVolume([1024, 1059, 1162, 1173, 1382, 1381, 1380, 1383, 1384, 1385], 541)
-    femmesh.addVolume([14, 991, 1057, 1109, 1388, 1387, 1386, 1389, 1390, 1391], 542)
-    femmesh.addVolume([990, 1036, 1015, 1199, 1394, 1393, 1392, 1395, 1396, 1397], 543)
-    femmesh.addVolume([1015, 991, 1070, 1171, 1399, 1323, 1398, 1400, 1340, 1342], 544)
-    femmesh.addVolume([991, 1136, 1019, 1216, 1403, 1402, 1401, 1404, 1405, 1406], 545)
-    femmesh.addVolume([628, 640, 629, 1123, 723, 677, 788, 1407, 1408, 1409], 546)
-    femmesh.addVolume([1019, 1092, 1114, 1222, 1412, 1411, 1410, 1413, 1414, 1415], 547)
-    femmesh.addVolume([104, 1214, 1001, 1234, 1417, 1416, 1315, 1316, 1418, 1317], 548)
-    femmesh.addVolume([1054, 165, 1105, 1126, 1421, 1420, 1419, 1422, 1423, 1424], 549)
-    femmesh.addVolume([1144, 1015, 1170, 1199, 1427, 1426, 1425, 1428, 1397, 1429], 550)
-    femmesh.addVolume([60, 1004, 1058, 1105, 1432, 1431, 1430, 1433, 1434, 1435], 551)
-    femmesh.addVolume([1043, 1025, 1055, 1166, 1438, 1437, 1436, 1439, 1440, 1441], 552)
-    femmesh.addVolume([834, 821, 832, 1099, 973, 960, 974, 1442, 1443, 1444], 553)
-    femmesh.addVolume([1077, 1000, 1167, 1234, 1446, 1343, 1445, 1318, 1447, 1448], 554)
-    femmesh.addVolume([810, 809, 812, 1094, 927, 930, 931, 1449, 1273, 1450], 555)
-    femmesh.addVolume([1050, 1024, 1162, 1173, 1452, 1380, 1451, 1453, 1383, 1385], 556)
-    femmesh.addVolume([1011, 1009, 1065, 1073, 1455, 1285, 1454, 1456, 1283, 1284], 557)
-    femmesh.addVolume([819, 1104, 827, 1131, 1458, 1457, 917, 1459, 1460, 1461], 558)
-    femmesh.addVolume([1008, 1038, 1046, 1185, 1463, 1462, 1374, 1464, 1465, 1466], 559)
-    femmesh.addVolume([88, 1142, 1006, 1214, 1468, 1354, 1467, 1469, 1470, 1471], 560)
-    femmesh.addVolume([1032, 1054, 1126, 1170, 1473, 1422, 1472, 1474, 1475, 1476], 561)
-    femmesh.addVolume([990, 1015, 1144, 1199, 1392, 1427, 1477, 1395, 1397, 1428], 562)
-    femmesh.addVolume([991, 14, 1057, 1145, 1388, 1386, 1387, 1326, 1478, 1479], 563)
-    femmesh.addVolume([812, 831, 1073, 1149, 939, 1290, 1289, 1480, 1481, 1288], 564)
-    femmesh.addVolume([604, 603, 602, 1246, 705, 693, 704, 1482, 1483, 1484], 565)
-    femmesh.addVolume([1023, 1116, 1006, 1171, 1487, 1486, 1485, 1488, 1489, 1490], 566)
-    femmesh.addVolume([1001, 104, 1077, 1132, 1315, 1313, 1314, 1491, 1492, 1493], 567)
-    femmesh.addVolume([987, 1040, 1026, 1138, 1366, 1333, 1494, 1495, 1335, 1334], 568)
-    femmesh.addVolume([800, 841, 798, 1240, 890, 882, 888, 1496, 1497, 1498], 569)
-    femmesh.addVolume([1016, 1006, 1041, 1142, 1255, 1350, 1499, 1500, 1354, 1353], 570)
-    femmesh.addVolume([1006, 1005, 1142, 1143, 1349, 1352, 1354, 1501, 1502, 1503], 571)
-    femmesh.addVolume([994, 1045, 993, 1130, 1268, 1270, 1265, 1504, 1505, 1506], 572)
-    femmesh.addVolume([1023, 1006, 1109, 1171, 1485, 1508, 1507, 1488, 1490, 1509], 573)
-    femmesh.addVolume([812, 1073, 1065, 1149, 1289, 1284, 1510, 1480, 1288, 1287], 574)
-    femmesh.addVolume([997, 987, 1030, 1231, 1307, 1308, 1309, 1511, 1512, 1513], 575)
-    femmesh.addVolume([990, 1012, 1086, 1101, 1303, 1305, 1304, 1514, 1515, 1516], 576)
-    femmesh.addVolume([1040, 997, 1082, 1098, 1365, 1518, 1517, 1519, 1520, 1521], 577)
-    femmesh.addVolume([1083, 67, 1142, 1191, 1259, 1262, 1264, 1522, 1523, 1524], 578)
-    femmesh.addVolume([827, 803, 1131, 1187, 906, 1525, 1461, 1526, 1527, 1528], 579)
-    femmesh.addVolume([817, 40, 41, 1075, 879, 46, 878, 1529, 1530, 1531], 580)
-    femmesh.addVolume([628, 1090, 640, 1123, 1533, 1532, 723, 1407, 1534, 1408], 581)
-    femmesh.addVolume([986, 1010, 1101, 1129, 1537, 1536, 1535, 1297, 1538, 1539], 582)
-    femmesh.addVolume([642, 608, 638, 1169, 654, 733, 713, 1540, 1541, 1542], 583)
-    femmesh.addVolume([28, 619, 27, 1056, 672, 673, 33, 1543, 1544, 1545], 584)
-    femmesh.addVolume([27, 28, 1056, 1176, 33, 1543, 1545, 1546, 1547, 1548], 585)
-    femmesh.addVolume([1040, 1033, 1108, 1138, 1550, 1549, 1332, 1335, 1551, 1336], 586)
-    femmesh.addVolume([1014, 1067, 1026, 1244, 1554, 1553, 1552, 1555, 1556, 1557], 587)
-    femmesh.addVolume([1019, 1144, 991, 1216, 1559, 1558, 1401, 1406, 1560, 1404], 588)
-    femmesh.addVolume([995, 1015, 1075, 1212, 1563, 1562, 1561, 1564, 1565, 1566], 589)
-    femmesh.addVolume([1019, 1136, 1202, 1216, 1402, 1568, 1567, 1406, 1405, 1569], 590)
-    femmesh.addVolume([172, 999, 1153, 1193, 1279, 1281, 1280, 1570, 1359, 1571], 591)
-    femmesh.addVolume([1013, 993, 1045, 1130, 1573, 1270, 1572, 1574, 1506, 1505], 592)
-    femmesh.addVolume([998, 1152, 1200, 1219, 1577, 1576, 1575, 1578, 1579, 1580], 593)
-    femmesh.addVolume([1015, 1036, 990, 1037, 1393, 1394, 1392, 1581, 1582, 1583], 594)
-    femmesh.addVolume([1151, 1007, 1215, 1218, 1586, 1585, 1584, 1587, 1588, 1589], 595)
-    femmesh.addVolume([1032, 1054, 1170, 1194, 1473, 1475, 1474, 1590, 1591, 1592], 596)
-    femmesh.addVolume([991, 1015, 1023, 1171, 1399, 1594, 1593, 1340, 1400, 1488], 597)
-    femmesh.addVolume([1005, 989, 1014, 1033, 1597, 1596, 1595, 1598, 1599, 1600], 598)
-    femmesh.addVolume([1015, 1036, 1170, 1199, 1393, 1601, 1426, 1397, 1396, 1429], 599)
-    femmesh.addVolume([1009, 1065, 1064, 1112, 1285, 1603, 1602, 1604, 1605, 1606], 600)
-    femmesh.addVolume([996, 1043, 1025, 1172, 1608, 1438, 1607, 1609, 1610, 1611], 601)
-    femmesh.addVolume([826, 827, 1104, 1187, 969, 1457, 1612, 1613, 1526, 1614], 602)
-    femmesh.addVolume([824, 799, 807, 1159, 891, 893, 895, 1615, 1616, 1617], 603)
-    femmesh.addVolume([984, 113, 1182, 1210, 1620, 1619, 1618, 1621, 1622, 1623], 604)
-    femmesh.addVolume([810, 812, 1073, 1094, 931, 1289, 1291, 1449, 1450, 1624], 605)
-    femmesh.addVolume([1005, 9, 1103, 1178, 1627, 1626, 1625, 1628, 1629, 1630], 606)
-    femmesh.addVolume([1020, 1131, 1050, 1176, 1633, 1632, 1631, 1634, 1635, 1636], 607)
-    femmesh.addVolume([832, 1099, 821, 1120, 1444, 1443, 960, 1637, 1638, 1639], 608)
-    femmesh.addVolume([113, 984, 1167, 1210, 1620, 1641, 1640, 1622, 1621, 1642], 609)
-    femmesh.addVolume([989, 1035, 1138, 1156, 1645, 1644, 1643, 1646, 1647, 1648], 610)
-    femmesh.addVolume([30, 644, 634, 1146, 650, 691, 686, 1649, 1650, 1651], 611)
-    femmesh.addVolume([1063, 990, 1144, 1147, 1301, 1477, 1652, 1330, 1329, 1653], 612)
-    femmesh.addVolume([1016, 1006, 1142, 1214, 1255, 1354, 1500, 1654, 1471, 1470], 613)
-    femmesh.addVolume([993, 1198, 1102, 1231, 1657, 1656, 1655, 1658, 1659, 1660], 614)
-    femmesh.addVolume([637, 608, 610, 1061, 731, 730, 732, 1661, 1662, 1663], 615)
-    femmesh.addVolume([647, 646, 635, 1139, 797, 796, 718, 1364, 1664, 1665], 616)
-    femmesh.addVolume([995, 1075, 1051, 1212, 1561, 1667, 1666, 1564, 1566, 1668], 617)
-    femmesh.addVolume([1005, 1014, 1028, 1068, 1595, 1670, 1669, 1671, 1672, 1673], 618)
-    femmesh.addVolume([985, 1144, 990, 1147, 1675, 1477, 1674, 1676, 1653, 1329], 619)
-    femmesh.addVolume([1018, 1098, 997, 1138, 1678, 1520, 1677, 1679, 1680, 1681], 620)
-    femmesh.addVolume([984, 1018, 1083, 1166, 1684, 1683, 1682, 1685, 1686, 1687], 621)
-    femmesh.addVolume([105, 1057, 1001, 1109, 1690, 1689, 1688, 1691, 1391, 1692], 622)
-    femmesh.addVolume([990, 1086, 1063, 1144, 1304, 1306, 1301, 1477, 1693, 1652], 623)
-    femmesh.addVolume([1019, 1037, 1092, 1222, 1695, 1694, 1412, 1413, 1696, 1414], 624)
-    femmesh.addVolume([995, 1105, 165, 1126, 1698, 1420, 1697, 1699, 1424, 1423], 625)
-    femmesh.addVolume([1039, 990, 1147, 1199, 1701, 1329, 1700, 1702, 1395, 1703], 626)
-    femmesh.addVolume([14, 991, 1109, 1171, 1388, 1390, 1389, 1704, 1340, 1509], 627)
-    femmesh.addVolume([172, 999, 1193, 1210, 1279, 1359, 1570, 1705, 1706, 1707], 628)
-    femmesh.addVolume([985, 990, 1144, 1199, 1674, 1477, 1675, 1708, 1395, 1428], 629)
-    femmesh.addVolume([624, 623, 615, 1180, 766, 758, 765, 1709, 1710, 1711], 630)
-    femmesh.addVolume([1062, 1082, 1123, 1188, 1714, 1713, 1712, 1715, 1716, 1717], 631)
-    femmesh.addVolume([996, 1008, 1025, 1140, 1376, 1718, 1607, 1378, 1377, 1719], 632)
-    femmesh.addVolume([1124, 1151, 1215, 1218, 1721, 1584, 1720, 1722, 1587, 1589], 633)
-    femmesh.addVolume([1012, 1086, 1101, 1225, 1305, 1516, 1515, 1723, 1724, 1725], 634)
-    femmesh.addVolume([999, 1072, 1153, 1193, 1356, 1726, 1281, 1359, 1361, 1571], 635)
-    femmesh.addVolume([1048, 1112, 992, 1224, 1729, 1728, 1727, 1730, 1731, 1732], 636)
-    femmesh.addVolume([999, 172, 1107, 1210, 1279, 1338, 1337, 1706, 1705, 1733], 637)
-    femmesh.addVolume([89, 1006, 1142, 1143, 1735, 1354, 1734, 1736, 1501, 1503], 638)
-    femmesh.addVolume([1012, 1063, 1087, 1147, 1302, 1738, 1737, 1328, 1330, 1739], 639)
-    femmesh.addVolume([609, 610, 608, 1169, 729, 730, 653, 1740, 1741, 1541], 640)
-    femmesh.addVolume([1046, 1038, 1061, 1185, 1462, 1743, 1742, 1466, 1465, 1744], 641)
-    femmesh.addVolume([604, 602, 1139, 1246, 704, 1363, 1362, 1482, 1484, 1745], 642)
-    femmesh.addVolume([1014, 1026, 1138, 1245, 1552, 1334, 1746, 1747, 1748, 1749], 643)
-    femmesh.addVolume([1000, 1083, 1142, 1213, 1260, 1264, 1263, 1750, 1751, 1752], 644)
-    femmesh.addVolume([14, 991, 142, 1145, 1388, 1324, 245, 1478, 1326, 1325], 645)
-    femmesh.addVolume([1001, 1052, 1084, 1136, 1754, 1753, 1274, 1276, 1755, 1258], 646)
-    femmesh.addVolume([840, 1162, 834, 1211, 1757, 1756, 981, 1758, 1759, 1760], 647)
-    femmesh.addVolume([1005, 1033, 1014, 1068, 1598, 1600, 1595, 1671, 1761, 1672], 648)
-    femmesh.addVolume([9, 1178, 1005, 1191, 1629, 1628, 1627, 1762, 1763, 1764], 649)
-    femmesh.addVolume([984, 1102, 1156, 1209, 1767, 1766, 1765, 1768, 1769, 1770], 650)
-    femmesh.addVolume([611, 626, 612, 1232, 739, 740, 736, 1771, 1772, 1251], 651)
-    femmesh.addVolume([840, 833, 834, 1162, 900, 975, 981, 1757, 1773, 1756], 652)
-    femmesh.addVolume([989, 1083, 1035, 1156, 1775, 1774, 1645, 1646, 1776, 1647], 653)
-    femmesh.addVolume([1013, 994, 1045, 1226, 1777, 1268, 1572, 1778, 1779, 1780], 654)
-    femmesh.addVolume([823, 822, 811, 1067, 865, 945, 937, 1781, 1782, 1783], 655)
-    femmesh.addVolume([113, 1167, 984, 1182, 1640, 1641, 1620, 1619, 1784, 1618], 656)
-    femmesh.addVolume([994, 993, 1022, 1111, 1265, 1266, 1267, 1785, 1786, 1787], 657)
-    femmesh.addVolume([633, 643, 619, 1064, 775, 771, 683, 1788, 1789, 1790], 658)
-    femmesh.addVolume([14, 142, 991, 1171, 245, 1324, 1388, 1704, 1341, 1340], 659)
-    femmesh.addVolume([826, 825, 827, 1187, 976, 910, 969, 1613, 1791, 1526], 660)
-    femmesh.addVolume([1005, 1033, 1068, 1125, 1598, 1761, 1671, 1792, 1793, 1794], 661)
-    femmesh.addVolume([1056, 1009, 1062, 1188, 1797, 1796, 1795, 1798, 1799, 1715], 662)
-    femmesh.addVolume([1024, 1036, 1065, 1196, 1802, 1801, 1800, 1803, 1804, 1805], 663)
-    femmesh.addVolume([88, 89, 1006, 1142, 259, 1735, 1467, 1468, 1734, 1354], 664)
-    femmesh.addVolume([1040, 997, 1098, 1138, 1365, 1520, 1519, 1335, 1681, 1680], 665)
-    femmesh.addVolume([629, 26, 630, 1081, 668, 657, 671, 1806, 1807, 1808], 666)
-    femmesh.addVolume([1087, 998, 1147, 1148, 1810, 1809, 1739, 1811, 1812, 1813], 667)
-    femmesh.addVolume([1010, 1060, 1097, 1137, 1816, 1815, 1814, 1817, 1818, 1819], 668)
-    femmesh.addVolume([84, 998, 1087, 1148, 1821, 1810, 1820, 1822, 1812, 1811], 669)
-    femmesh.addVolume([123, 1085, 172, 1107, 1823, 1277, 574, 1824, 1339, 1338], 670)
-    femmesh.addVolume([985, 1144, 1170, 1199, 1675, 1425, 1825, 1708, 1428, 1429], 671)
-    femmesh.addVolume([812, 1065, 1073, 1096, 1510, 1284, 1289, 1826, 1827, 1828], 672)
-    femmesh.addVolume([801, 802, 803, 1082, 902, 903, 904, 1829, 1830, 1831], 673)
-    femmesh.addVolume([1072, 1002, 1153, 1236, 1833, 1832, 1726, 1834, 1835, 1836], 674)
-    femmesh.addVolume([1018, 1000, 1083, 1166, 1837, 1260, 1683, 1686, 1838, 1687], 675)
-    femmesh.addVolume([110, 1054, 165, 1105, 1839, 1421, 533, 1840, 1419, 1420], 676)
-    femmesh.addVolume([1077, 996, 1107, 1166, 1843, 1842, 1841, 1844, 1845, 1846], 677)
-    femmesh.addVolume([988, 1101, 1010, 1129, 1848, 1536, 1847, 1849, 1539, 1538], 678)
-    femmesh.addVolume([603, 642, 1060, 1119, 710, 1248, 1247, 1850, 1851, 1852], 679)
-    femmesh.addVolume([1006, 1116, 12, 1171, 1486, 1854, 1853, 1490, 1489, 1855], 680)
-    femmesh.addVolume([988, 83, 1134, 1220, 1858, 1857, 1856, 1859, 1860, 1861], 681)
-    femmesh.addVolume([60, 1058, 1004, 1163, 1430, 1431, 1432, 1862, 1863, 1864], 682)
-    femmesh.addVolume([1020, 1117, 997, 1123, 1867, 1866, 1865, 1868, 1869, 1870], 683)
-    femmesh.addVolume([988, 1097, 83, 1220, 1872, 1871, 1858, 1859, 1873, 1860], 684)
-    femmesh.addVolume([811, 815, 1094, 1154, 933, 1272, 1271, 1874, 1875, 1876], 685)
-    femmesh.addVolume([102, 1107, 1077, 1121, 1878, 1841, 1877, 1879, 1880, 1881], 686)
-    femmesh.addVolume([1120, 1056, 1164, 1176, 1884, 1883, 1882, 1885, 1548, 1886], 687)
-    femmesh.addVolume([1024, 1059, 990, 1099, 1382, 1888, 1887, 1889, 1890, 1891], 688)
-    femmesh.addVolume([83, 1129, 988, 1134, 1892, 1849, 1858, 1857, 1299, 1856], 689)
-    femmesh.addVolume([830, 1141, 806, 1192, 1294, 1293, 921, 1893, 1894, 1895], 690)
-    femmesh.addVolume([991, 1109, 1023, 1136, 1390, 1507, 1593, 1403, 1896, 1897], 691)
-    femmesh.addVolume([1058, 983, 1093, 1204, 1900, 1899, 1898, 1901, 1902, 1903], 692)
-    femmesh.addVolume([1006, 1084, 1023, 1136, 1253, 1904, 1485, 1256, 1258, 1897], 693)
-    femmesh.addVolume([629, 1081, 630, 1117, 1806, 1808, 671, 1905, 1906, 1907], 694)
-    femmesh.addVolume([1075, 1037, 1136, 1222, 1910, 1909, 1908, 1911, 1696, 1912], 695)
-    femmesh.addVolume([1057, 986, 1216, 1235, 1915, 1914, 1913, 1916, 1917, 1918], 696)
-    femmesh.addVolume([993, 1022, 1044, 1045, 1266, 1920, 1919, 1270, 1269, 1921], 697)
-    femmesh.addVolume([994, 1013, 1045, 1130, 1777, 1572, 1268, 1504, 1574, 1505], 698)
-    femmesh.addVolume([1055, 1025, 1077, 1166, 1437, 1923, 1922, 1441, 1440, 1844], 699)
-    femmesh.addVolume([1050, 1120, 1164, 1176, 1925, 1882, 1924, 1636, 1885, 1886], 700)
-    femmesh.addVolume([1064, 1120, 1024, 1196, 1928, 1927, 1926, 1929, 1930, 1803], 701)
-    femmesh.addVolume([125, 1124, 1151, 1215, 1932, 1721, 1931, 1933, 1720, 1584], 702)
-    femmesh.addVolume([1006, 12, 1109, 1171, 1853, 1934, 1508, 1490, 1855, 1509], 703)
-    femmesh.addVolume([1081, 997, 1117, 1123, 1935, 1866, 1906, 1936, 1870, 1869], 704)
-    femmesh.addVolume([987, 1127, 1093, 1161, 1939, 1938, 1937, 1940, 1941, 1942], 705)
-    femmesh.addVolume([1013, 1072, 1193, 1236, 1357, 1361, 1360, 1943, 1834, 1944], 706)
-    femmesh.addVolume([1023, 1084, 1006, 1197, 1904, 1253, 1485, 1945, 1946, 1947], 707)
-    femmesh.addVolume([1002, 1003, 1097, 1203, 1950, 1949, 1948, 1951, 1952, 1953], 708)
-    femmesh.addVolume([991, 1057, 1109, 1136, 1387, 1391, 1390, 1403, 1954, 1896], 709)
-    femmesh.addVolume([985, 1070, 1015, 1144, 1956, 1398, 1955, 1675, 1957, 1427], 710)
-    femmesh.addVolume([991, 1015, 1070, 1144, 1399, 1398, 1323, 1558, 1427, 1957], 711)
-    femmesh.addVolume([1041, 1006, 1084, 1197, 1350, 1253, 1958, 1959, 1947, 1946], 712)
-    femmesh.addVolume([1086, 991, 1144, 1216, 1960, 1558, 1693, 1961, 1404, 1560], 713)
-    femmesh.addVolume([1009, 1064, 1065, 1149, 1602, 1603, 1285, 1286, 1962, 1287], 714)
-    femmesh.addVolume([993, 1044, 1013, 1045, 1919, 1963, 1573, 1270, 1921, 1572], 715)
-    femmesh.addVolume([996, 1190, 1085, 1239, 1966, 1965, 1964, 1967, 1968, 1969], 716)
-    femmesh.addVolume([38, 805, 39, 1125, 866, 867, 44, 1970, 1971, 1972], 717)
-    femmesh.addVolume([170, 989, 1083, 1238, 1974, 1775, 1973, 1975, 1976, 1977], 718)
-    femmesh.addVolume([1037, 1059, 1092, 1211, 1979, 1978, 1694, 1980, 1981, 1982], 719)
-    femmesh.addVolume([987, 997, 1040, 1138, 1307, 1365, 1366, 1495, 1681, 1335], 720)
-    femmesh.addVolume([1043, 1000, 1055, 1141, 1984, 1983, 1436, 1985, 1986, 1987], 721)
-    femmesh.addVolume([1009, 1011, 1065, 1112, 1455, 1454, 1285, 1604, 1988, 1605], 722)
-    femmesh.addVolume([178, 994, 1124, 1218, 1991, 1990, 1989, 1992, 1993, 1722], 723)
-    femmesh.addVolume([148, 1174, 1087, 1200, 1371, 1373, 1368, 1994, 1995, 1996], 724)
-    femmesh.addVolume([1090, 640, 1123, 1176, 1532, 1408, 1534, 1997, 1998, 1999], 725)
-    femmesh.addVolume([66, 1000, 67, 1142, 2000, 1261, 364, 2001, 1263, 1262], 726)
-    femmesh.addVolume([1007, 1031, 1112, 1161, 2004, 2003, 2002, 2005, 2006, 2007], 727)
-    femmesh.addVolume([988, 1087, 1012, 1225, 1369, 1737, 2008, 2009, 2010, 1723], 728)
-    femmesh.addVolume([1102, 997, 1156, 1165, 2012, 2011, 1766, 2013, 2014, 2015], 729)
-    femmesh.addVolume([1015, 995, 1023, 1171, 1563, 2016, 1594, 1400, 2017, 1488], 730)
-    femmesh.addVolume([834, 821, 1099, 1162, 973, 1443, 1442, 1756, 2018, 2019], 731)
-    femmesh.addVolume([1015, 1032, 1074, 1212, 2022, 2021, 2020, 1565, 2023, 2024], 732)
-    femmesh.addVolume([1014, 1155, 1067, 1244, 2026, 2025, 1554, 1555, 2027, 1556], 733)
-    femmesh.addVolume([1025, 1043, 1055, 1158, 1438, 1436, 1437, 2028, 2029, 2030], 734)
-    femmesh.addVolume([1018, 984, 1083, 1156, 1684, 1682, 1683, 2031, 1765, 1776], 735)
-    femmesh.addVolume([28, 619, 1056, 1164, 672, 1544, 1543, 2032, 2033, 1883], 736)
-    femmesh.addVolume([110, 165, 1054, 1126, 533, 1421, 1839, 2034, 1423, 1422], 737)
-    femmesh.addVolume([66, 1077, 1167, 1234, 2036, 1445, 2035, 2037, 1318, 1448], 738)
-    femmesh.addVolume([998, 84, 1087, 1200, 1821, 1820, 1810, 1575, 2038, 1996], 739)
-    femmesh.addVolume([609, 1169, 30, 1173, 1740, 2039, 649, 2040, 2041, 2042], 740)
-    femmesh.addVolume([1005, 989, 1033, 1213, 1597, 1599, 1598, 2043, 2044, 2045], 741)
-    femmesh.addVolume([1035, 1089, 1182, 1198, 2048, 2047, 2046, 2049, 2050, 2051], 742)
-    femmesh.addVolume([29, 1050, 1164, 1176, 2053, 1924, 2052, 2054, 1636, 1886], 743)
-    femmesh.addVolume([1004, 1058, 1105, 1155, 1431, 1435, 1434, 2055, 2056, 2057], 744)
-    femmesh.addVolume([147, 1097, 988, 1174, 2059, 1872, 2058, 2060, 2061, 1372], 745)
-    femmesh.addVolume([812, 814, 831, 1149, 948, 950, 939, 1480, 2062, 1481], 746)
-    femmesh.addVolume([827, 803, 819, 1131, 906, 915, 917, 1461, 1525, 1459], 747)
-    femmesh.addVolume([1038, 1008, 1046, 1140, 1463, 1374, 1462, 2063, 1377, 1379], 748)
-    femmesh.addVolume([1048, 1224, 992, 1241, 1730, 1732, 1727, 2064, 2065, 2066], 749)
-    femmesh.addVolume([1082, 803, 1131, 1188, 1831, 1525, 2067, 1716, 2068, 2069], 750)
-    femmesh.addVolume([992, 1170, 985, 1194, 2071, 1825, 2070, 2072, 1592, 2073], 751)
-    femmesh.addVolume([60, 1004, 1105, 1229, 1432, 1434, 1433, 2074, 2075, 2076], 752)
-    femmesh.addVolume([993, 1022, 1030, 1044, 1266, 2078, 2077, 1919, 1920, 2079], 753)
-    femmesh.addVolume([1018, 1000, 1043, 1141, 1837, 1984, 2080, 2081, 1986, 1985], 754)
-    femmesh.addVolume([74, 1087, 988, 1225, 2083, 1369, 2082, 2084, 2010, 2009], 755)
-    femmesh.addVolume([988, 1012, 1101, 1225, 2008, 1515, 1848, 2009, 1723, 1725], 756)
-    femmesh.addVolume([41, 1075, 40, 1114, 1531, 1530, 46, 2085, 2086, 2087], 757)
-    femmesh.addVolume([1032, 1054, 1105, 1126, 1473, 1419, 2088, 1472, 1422, 1424], 758)
-    femmesh.addVolume([985, 1147, 990, 1199, 1676, 1329, 1674, 1708, 1703, 1395], 759)
-    femmesh.addVolume([838, 839, 832, 1189, 980, 979, 955, 2089, 2090, 2091], 760)
-    femmesh.addVolume([1037, 1099, 1059, 1211, 2092, 1890, 1979, 1980, 2093, 1981], 761)
-    femmesh.addVolume([805, 806, 807, 1133, 870, 920, 919, 2094, 2095, 2096], 762)
-    femmesh.addVolume([997, 1062, 1082, 1123, 2097, 1714, 1518, 1870, 1712, 1713], 763)
-    femmesh.addVolume([1094, 815, 1096, 1212, 1272, 1321, 1320, 2098, 2099, 2100], 764)
-    femmesh.addVolume([29, 1164, 28, 1176, 2052, 2032, 34, 2054, 1886, 1547], 765)
-    femmesh.addVolume([75, 1063, 1087, 1225, 2102, 1738, 2101, 2103, 2104, 2010], 766)
-    femmesh.addVolume([1107, 1077, 1166, 1167, 1841, 1844, 1846, 2105, 1445, 2106], 767)
-    femmesh.addVolume([110, 1054, 1105, 1204, 1839, 1419, 1840, 2107, 2108, 2109], 768)
-    femmesh.addVolume([985, 1144, 1015, 1170, 1675, 1427, 1955, 1825, 1425, 1426], 769)
-    femmesh.addVolume([1016, 1001, 1136, 1214, 1275, 1276, 1257, 1654, 1416, 2110], 770)
-    femmesh.addVolume([157, 1005, 1142, 1191, 2112, 1352, 2111, 2113, 1764, 1524], 771)
-    femmesh.addVolume([985, 992, 1039, 1199, 2070, 2115, 2114, 1708, 2116, 1702], 772)
-    femmesh.addVolume([614, 615, 623, 1072, 752, 758, 757, 2117, 2118, 2119], 773)
-    femmesh.addVolume([1007, 1127, 1161, 1201, 2120, 1941, 2005, 2121, 2122, 2123], 774)
-    femmesh.addVolume([1019, 1136, 1037, 1222, 1402, 1909, 1695, 1413, 1912, 1696], 775)
-    femmesh.addVolume([153, 1111, 994, 1218, 2125, 1785, 2124, 2126, 2127, 1993], 776)
-    femmesh.addVolume([985, 1063, 1070, 1144, 2129, 2128, 1956, 1675, 1652, 1957], 777)
-    femmesh.addVolume([1020, 827, 1104, 1131, 2131, 1457, 2130, 1633, 1461, 1460], 778)
-    femmesh.addVolume([3, 644, 30, 1069, 651, 650, 36, 2132, 2133, 2134], 779)
-    femmesh.addVolume([1063, 1012, 1087, 1225, 1302, 1737, 1738, 2104, 1723, 2010], 780)
-    femmesh.addVolume([1018, 1082, 997, 1098, 2135, 1518, 1677, 1678, 1521, 1520], 781)
-    femmesh.addVolume([1032, 1105, 995, 1126, 2088, 1698, 2136, 1472, 1424, 1699], 782)
-    femmesh.addVolume([997, 1062, 1030, 1237, 2097, 2137, 1309, 1310, 2138, 1311], 783)
-    femmesh.addVolume([172, 1085, 177, 1153, 1277, 2139, 502, 1280, 1282, 2140], 784)
-    femmesh.addVolume([810, 823, 811, 1183, 938, 937, 928, 2141, 2142, 2143], 785)
-    femmesh.addVolume([989, 1005, 1014, 1178, 1597, 1595, 1596, 2144, 1628, 2145], 786)
-    femmesh.addVolume([148, 147, 988, 1174, 439, 2058, 1370, 1371, 2060, 1372], 787)
-    femmesh.addVolume([995, 1032, 1015, 1212, 2136, 2022, 1563, 1564, 2023, 1565], 788)
-    femmesh.addVolume([1012, 1063, 1086, 1225, 1302, 1306, 1305, 1723, 2104, 1724], 789)
-    femmesh.addVolume([1085, 1190, 996, 1233, 1965, 1966, 1964, 2146, 2147, 2148], 790)
-    femmesh.addVolume([989, 1014, 1033, 1138, 1596, 1600, 1599, 1643, 1746, 1551], 791)
-    femmesh.addVolume([985, 1063, 1144, 1147, 2129, 1652, 1675, 1676, 1330, 1653], 792)
-    femmesh.addVolume([1000, 1142, 66, 1234, 1263, 2001, 2000, 1447, 2149, 2037], 793)
-    femmesh.addVolume([820, 1188, 828, 1217, 2151, 2150, 918, 2152, 2153, 2154], 794)
-    femmesh.addVolume([1030, 1044, 1022, 1088, 2079, 1920, 2078, 2155, 2156, 2157], 795)
-    femmesh.addVolume([1085, 1190, 999, 1239, 1965, 2158, 1278, 1969, 1968, 2159], 796)
-    femmesh.addVolume([996, 1025, 1043, 1166, 1607, 1438, 1608, 1845, 1440, 1439], 797)
-    femmesh.addVolume([1030, 1062, 997, 1081, 2137, 2097, 1309, 2160, 2161, 1935], 798)
-    femmesh.addVolume([983, 1007, 1112, 1161, 2163, 2002, 2162, 2164, 2005, 2007], 799)
-    femmesh.addVolume([624, 631, 638, 1137, 777, 712, 787, 2165, 2166, 2167], 800)
-    femmesh.addVolume([836, 837, 838, 1189, 885, 982, 964, 2168, 2169, 2089], 801)
-    femmesh.addVolume([1032, 1194, 1011, 1221, 1590, 2171, 2170, 2172, 2173, 2174], 802)
-    femmesh.addVolume([633, 1064, 619, 1164, 1788, 1790, 683, 2175, 2176, 2033], 803)
-    femmesh.addVolume([990, 1038, 1024, 1146, 2178, 2177, 1887, 2179, 2180, 2181], 804)
-    femmesh.addVolume([1054, 1032, 1105, 1194, 1473, 2088, 1419, 1591, 1590, 2182], 805)
-    femmesh.addVolume([992, 1064, 1065, 1112, 2184, 1603, 2183, 1728, 1606, 1605], 806)
-    femmesh.addVolume([1024, 1146, 1038, 1173, 2181, 2180, 2177, 1383, 2185, 2186], 807)
-    femmesh.addVolume([1114, 1075, 1136, 1222, 2086, 1908, 2187, 1415, 1911, 1912], 808)
-    femmesh.addVolume([1146, 1113, 1199, 1242, 2190, 2189, 2188, 2191, 2192, 2193], 809)
-    femmesh.addVolume([1036, 1074, 1096, 1208, 2196, 2195, 2194, 2197, 2198, 2199], 810)
-    femmesh.addVolume([1028, 1006, 1041, 1122, 2201, 1350, 2200, 2202, 2203, 2204], 811)
-    femmesh.addVolume([984, 1165, 1018, 1166, 2206, 2205, 1684, 1685, 2207, 1686], 812)
-    femmesh.addVolume([1020, 1050, 1090, 1176, 1631, 2209, 2208, 1634, 1636, 1997], 813)
-    femmesh.addVolume([1010, 1060, 988, 1097, 1816, 2210, 1847, 1814, 1815, 1872], 814)
-    femmesh.addVolume([79, 1071, 1148, 1177, 2213, 2212, 2211, 2214, 2215, 2216], 815)
-    femmesh.addVolume([1028, 1067, 1004, 1154, 2219, 2218, 2217, 2220, 2221, 2222], 816)
-    femmesh.addVolume([170, 1083, 1182, 1238, 1973, 2224, 2223, 1975, 1977, 2225], 817)
-    femmesh.addVolume([1010, 1097, 1029, 1137, 1814, 2227, 2226, 1817, 1819, 2228], 818)
-    femmesh.addVolume([1024, 1059, 1099, 1162, 1382, 1890, 1889, 1380, 1381, 2019], 819)
-    femmesh.addVolume([1121, 986, 1132, 1134, 2230, 1295, 2229, 2231, 1298, 1300], 820)
-    femmesh.addVolume([1019, 1037, 1059, 1092, 1695, 1979, 2232, 1412, 1694, 1978], 821)
-    femmesh.addVolume([1005, 1042, 1033, 1125, 2234, 2233, 1598, 1792, 2235, 1793], 822)
-    femmesh.addVolume([1037, 990, 1059, 1099, 1583, 1888, 1979, 2092, 1891, 1890], 823)
-    femmesh.addVolume([1099, 821, 1120, 1162, 1443, 1639, 1638, 2019, 2018, 2236], 824)
-    femmesh.addVolume([1077, 1000, 1166, 1167, 1446, 1838, 1844, 1445, 1343, 2106], 825)
-    femmesh.addVolume([1028, 1116, 1004, 1143, 2238, 2237, 2217, 2239, 2240, 2241], 826)
-    femmesh.addVolume([83, 86, 988, 1129, 438, 2242, 1858, 1892, 2243, 1849], 827)
-    femmesh.addVolume([1019, 1114, 1136, 1222, 1410, 2187, 1402, 1413, 1415, 1912], 828)
-    femmesh.addVolume([1062, 1040, 1082, 1188, 2244, 1517, 1714, 1715, 2245, 1716], 829)
-    femmesh.addVolume([1147, 1087, 1148, 1168, 1739, 1811, 1813, 2246, 2247, 2248], 830)
-    femmesh.addVolume([1025, 1001, 1052, 1055, 2250, 1754, 2249, 1437, 2251, 2252], 831)
-    femmesh.addVolume([123, 177, 172, 1085, 577, 502, 574, 1823, 2139, 1277], 832)
-    femmesh.addVolume([1033, 1040, 1098, 1138, 1550, 1519, 2253, 1551, 1335, 1680], 833)
-    femmesh.addVolume([997, 1030, 1102, 1231, 1309, 2254, 2012, 1511, 1513, 1660], 834)
-    femmesh.addVolume([1006, 1016, 1136, 1214, 1255, 1257, 1256, 1471, 1654, 2110], 835)
-    femmesh.addVolume([1057, 1001, 1109, 1136, 1689, 1692, 1391, 1954, 1276, 1896], 836)
-    femmesh.addVolume([999, 1034, 1106, 1179, 2257, 2256, 2255, 2258, 2259, 2260], 837)
-    femmesh.addVolume([1064, 1065, 1120, 1196, 1603, 2261, 1928, 1929, 1805, 1930], 838)
-    femmesh.addVolume([66, 67, 1000, 1167, 364, 1261, 2000, 2035, 1344, 1343], 839)
-    femmesh.addVolume([605, 606, 607, 1185, 719, 720, 688, 2262, 2263, 2264], 840)
-    femmesh.addVolume([1009, 1073, 1011, 1161, 1283, 1456, 1455, 2265, 2266, 2267], 841)
-    femmesh.addVolume([1038, 1059, 1024, 1173, 2268, 1382, 2177, 2186, 1384, 1383], 842)
-    femmesh.addVolume([1062, 997, 1081, 1123, 2097, 1935, 2161, 1712, 1870, 1936], 843)
-    femmesh.addVolume([1018, 984, 1156, 1165, 1684, 1765, 2031, 2205, 2206, 2015], 844)
-    femmesh.addVolume([9, 156, 1005, 1103, 217, 2269, 1627, 1626, 2270, 1625], 845)
-    femmesh.addVolume([139, 995, 1126, 1171, 2272, 1699, 2271, 2273, 2017, 2274], 846)
-    femmesh.addVolume([1031, 1009, 1091, 1112, 2277, 2276, 2275, 2003, 1604, 2278], 847)
-    femmesh.addVolume([1009, 1031, 1079, 1237, 2277, 2280, 2279, 2281, 2282, 2283], 848)
-    femmesh.addVolume([1059, 1092, 1128, 1202, 1978, 2285, 2284, 2286, 2287, 2288], 849)
-    femmesh.addVolume([1024, 1038, 990, 1059, 2177, 2178, 1887, 1382, 2268, 1888], 850)
-    femmesh.addVolume([1028, 1014, 1067, 1068, 1670, 1554, 2219, 1673, 1672, 2289], 851)
-    femmesh.addVolume([823, 37, 822, 1108, 854, 862, 865, 2290, 2291, 2292], 852)
-    femmesh.addVolume([27, 1056, 1123, 1176, 1545, 2294, 2293, 1546, 1548, 1999], 853)
-    femmesh.addVolume([1024, 1064, 1065, 1199, 1926, 1603, 1800, 2295, 2296, 2297], 854)
-    femmesh.addVolume([105, 1001, 1057, 1132, 1688, 1689, 1690, 2298, 1491, 2299], 855)
-    femmesh.addVolume([1033, 1125, 1042, 1192, 1793, 2235, 2233, 2300, 2301, 2302], 856)
-    femmesh.addVolume([1056, 1120, 1131, 1176, 1884, 2304, 2303, 1548, 1885, 1635], 857)
-    femmesh.addVolume([1038, 1046, 1061, 1140, 1462, 1742, 1743, 2063, 1379, 2305], 858)
-    femmesh.addVolume([27, 1056, 619, 1157, 1545, 1544, 673, 2306, 2307, 2308], 859)
-    femmesh.addVolume([631, 603, 638, 1100, 697, 711, 712, 2309, 2310, 2311], 860)
-    femmesh.addVolume([996, 1046, 1140, 1233, 1375, 1379, 1378, 2148, 2312, 2313], 861)
-    femmesh.addVolume([1007, 1127, 1031, 1161, 2120, 2314, 2004, 2005, 1941, 2006], 862)
-    femmesh.addVolume([1009, 1188, 1056, 1217, 1799, 1798, 1797, 2315, 2153, 2316], 863)
-    femmesh.addVolume([995, 1015, 1023, 1075, 1563, 1594, 2016, 1561, 1562, 2317], 864)
-    femmesh.addVolume([989, 170, 1083, 1191, 1974, 1973, 1775, 2318, 2319, 1522], 865)
-    femmesh.addVolume([1002, 1097, 101, 1203, 1948, 2321, 2320, 1951, 1953, 2322], 866)
-    femmesh.addVolume([1120, 1050, 1131, 1176, 1925, 1632, 2304, 1885, 1636, 1635], 867)
-    femmesh.addVolume([1142, 1083, 1191, 1213, 1264, 1522, 1524, 1752, 1751, 2323], 868)
-    femmesh.addVolume([642, 3, 608, 1169, 655, 652, 654, 1540, 2324, 1541], 869)
-    femmesh.addVolume([989, 1005, 1178, 1191, 1597, 1628, 2144, 2318, 1764, 1763], 870)
-    femmesh.addVolume([626, 622, 612, 1078, 749, 748, 740, 2325, 2326, 2327], 871)
-    femmesh.addVolume([9, 1005, 156, 1191, 1627, 2269, 217, 1762, 1764, 2328], 872)
-    femmesh.addVolume([815, 1094, 1154, 1212, 1272, 1876, 1875, 2099, 2098, 2329], 873)
-    femmesh.addVolume([995, 1051, 1032, 1212, 1666, 2330, 2136, 1564, 1668, 2023], 874)
-    femmesh.addVolume([1077, 1107, 996, 1121, 1841, 1842, 1843, 1881, 1880, 2331], 875)
-    femmesh.addVolume([985, 1170, 1054, 1194, 1825, 1475, 2332, 2073, 1592, 1591], 876)
-    femmesh.addVolume([988, 1134, 1010, 1220, 1856, 2333, 1847, 1859, 1861, 2334], 877)
-    femmesh.addVolume([991, 1086, 1145, 1216, 1960, 2335, 1326, 1404, 1961, 2336], 878)
-    femmesh.addVolume([1077, 104, 1121, 1132, 1313, 2337, 1881, 1493, 1492, 2229], 879)
-    femmesh.addVolume([1129, 107, 1132, 1134, 2339, 2338, 1296, 1299, 2340, 1300], 880)
-    femmesh.addVolume([1085, 999, 1107, 1239, 1278, 1337, 1339, 1969, 2159, 2341], 881)
-    femmesh.addVolume([643, 635, 1048, 1113, 795, 1346, 1348, 2342, 2343, 2344], 882)
-    femmesh.addVolume([1034, 997, 1102, 1165, 2346, 2012, 2345, 2347, 2014, 2013], 883)
-    femmesh.addVolume([163, 1093, 1058, 1095, 2349, 1898, 2348, 2350, 2351, 2352], 884)
-    femmesh.addVolume([28, 1164, 1056, 1176, 2032, 1883, 1543, 1547, 1886, 1548], 885)
-    femmesh.addVolume([105, 104, 1001, 1132, 515, 1315, 1688, 2298, 1492, 1491], 886)
-    femmesh.addVolume([1020, 997, 1082, 1123, 1865, 1518, 2353, 1868, 1870, 1713], 887)
-    femmesh.addVolume([126, 1077, 1107, 1167, 2355, 1841, 2354, 2356, 1445, 2105], 888)
-    femmesh.addVolume([145, 1177, 1054, 1207, 2359, 2358, 2357, 2360, 2361, 2362], 889)
-    femmesh.addVolume([1156, 1102, 1165, 1209, 1766, 2013, 2015, 1770, 1769, 2363], 890)
-    femmesh.addVolume([1032, 1051, 1105, 1155, 2330, 2364, 2088, 2365, 2366, 2057], 891)
-    femmesh.addVolume([165, 1105, 995, 1229, 1420, 1698, 1697, 2367, 2076, 2368], 892)
-    femmesh.addVolume([819, 826, 827, 1104, 968, 969, 917, 1458, 1612, 1457], 893)
-    femmesh.addVolume([992, 985, 1071, 1194, 2070, 2370, 2369, 2072, 2073, 2371], 894)
-    femmesh.addVolume([1064, 1024, 1120, 1164, 1926, 1927, 1928, 2176, 2372, 1882], 895)
-    femmesh.addVolume([818, 1096, 815, 1212, 1355, 1321, 936, 2373, 2100, 2099], 896)
-    femmesh.addVolume([1028, 1004, 1103, 1143, 2217, 2375, 2374, 2239, 2241, 2376], 897)
-    femmesh.addVolume([1050, 29, 1164, 1173, 2053, 2052, 1924, 1453, 2377, 2378], 898)
-    femmesh.addVolume([1030, 1022, 1031, 1088, 2078, 2380, 2379, 2155, 2157, 2381], 899)
-    femmesh.addVolume([1010, 1129, 986, 1134, 1538, 1297, 1537, 2333, 1299, 1298], 900)
-    femmesh.addVolume([144, 110, 1054, 1126, 536, 1839, 2382, 2383, 2034, 1422], 901)
-    femmesh.addVolume([1036, 1065, 1096, 1170, 1801, 1827, 2194, 1601, 2384, 2385], 902)
-    femmesh.addVolume([996, 1107, 1166, 1239, 1842, 1846, 1845, 1967, 2341, 2386], 903)
-    femmesh.addVolume([66, 1167, 1000, 1234, 2035, 1343, 2000, 2037, 1448, 1447], 904)
-    femmesh.addVolume([629, 26, 1081, 1123, 668, 1807, 1806, 1409, 2387, 1936], 905)
-    femmesh.addVolume([821, 1120, 1050, 1131, 1639, 1925, 2388, 2389, 2304, 1632], 906)
-    femmesh.addVolume([821, 819, 1131, 1162, 965, 1459, 2389, 2018, 2390, 2391], 907)
-    femmesh.addVolume([1050, 1020, 1104, 1131, 1631, 2130, 2392, 1632, 1633, 1460], 908)
-    femmesh.addVolume([1010, 988, 1129, 1134, 1847, 1849, 1538, 2333, 1856, 1299], 909)
-    femmesh.addVolume([1043, 1158, 1025, 1172, 2029, 2028, 1438, 1610, 2393, 1611], 910)
-    femmesh.addVolume([995, 1032, 1051, 1105, 2136, 2330, 1666, 1698, 2088, 2364], 911)
-    femmesh.addVolume([1011, 1032, 1096, 1170, 2170, 2395, 2394, 2396, 1474, 2385], 912)
-    femmesh.addVolume([1120, 1056, 1149, 1164, 1884, 2398, 2397, 1882, 1883, 2399], 913)
-    femmesh.addVolume([1067, 1004, 1154, 1155, 2218, 2222, 2221, 2025, 2055, 2400], 914)
-    femmesh.addVolume([999, 1106, 1072, 1179, 2255, 2401, 1356, 2258, 2260, 2402], 915)
-    femmesh.addVolume([997, 1138, 987, 1231, 1681, 1495, 1307, 1511, 2403, 1512], 916)
-    femmesh.addVolume([1097, 1060, 1100, 1137, 1815, 2405, 2404, 1819, 1818, 2406], 917)
-    femmesh.addVolume([613, 614, 632, 1076, 750, 753, 754, 2407, 2408, 2409], 918)
-    femmesh.addVolume([638, 608, 1137, 1169, 733, 2410, 2167, 1542, 1541, 2411], 919)
-    femmesh.addVolume([1001, 1055, 1025, 1077, 2251, 1437, 2250, 1314, 1922, 1923], 920)
-    femmesh.addVolume([1004, 1105, 1051, 1155, 1434, 2364, 2412, 2055, 2057, 2366], 921)
-    femmesh.addVolume([1083, 1035, 1182, 1238, 1774, 2046, 2224, 1977, 2413, 2225], 922)
-    femmesh.addVolume([62, 1004, 1103, 1163, 2415, 2375, 2414, 2416, 1864, 2417], 923)
-    femmesh.addVolume([996, 1077, 1025, 1166, 1843, 1923, 1607, 1845, 1844, 1440], 924)
-    femmesh.addVolume([89, 1142, 1005, 1143, 1734, 1352, 2418, 1736, 1503, 1502], 925)
-    femmesh.addVolume([1010, 1061, 1046, 1140, 2420, 1742, 2419, 2421, 2305, 1379], 926)
-    femmesh.addVolume([1044, 1081, 1034, 1181, 2424, 2423, 2422, 2425, 2426, 2427], 927)
-    femmesh.addVolume([985, 1039, 1147, 1199, 2114, 1700, 1676, 1708, 1702, 1703], 928)
-    femmesh.addVolume([1001, 1202, 1136, 1216, 2428, 1568, 1276, 2429, 1569, 1405], 929)
-    femmesh.addVolume([1014, 1004, 1067, 1155, 2430, 2218, 1554, 2026, 2055, 2025], 930)
-    femmesh.addVolume([989, 1035, 1083, 1238, 1645, 1774, 1775, 1976, 2413, 1977], 931)
-    femmesh.addVolume([1006, 1028, 1116, 1122, 2201, 2238, 1486, 2203, 2202, 2431], 932)
-    femmesh.addVolume([995, 1023, 1051, 1075, 2016, 2432, 1666, 1561, 2317, 1667], 933)
-    femmesh.addVolume([1034, 1013, 1044, 1076, 2433, 1963, 2422, 2434, 2435, 2436], 934)
-    femmesh.addVolume([1024, 1146, 1050, 1164, 2181, 2437, 1452, 2372, 2438, 1924], 935)
-    femmesh.addVolume([1092, 1128, 1202, 1240, 2285, 2288, 2287, 2439, 2440, 2441], 936)
-    femmesh.addVolume([1028, 1051, 1116, 1122, 2443, 2442, 2238, 2202, 2444, 2431], 937)
-    femmesh.addVolume([1064, 1024, 1065, 1196, 1926, 1800, 1603, 1929, 1803, 1805], 938)
-    femmesh.addVolume([832, 821, 814, 1120, 960, 958, 952, 1637, 1639, 2445], 939)
-    femmesh.addVolume([984, 1089, 1102, 1209, 2447, 2446, 1767, 1768, 2448, 1769], 940)
-    femmesh.addVolume([139, 1126, 1070, 1171, 2271, 2450, 2449, 2273, 2274, 1342], 941)
-    femmesh.addVolume([1082, 1018, 1165, 1187, 2135, 2205, 2451, 2452, 2453, 2454], 942)
-    femmesh.addVolume([1094, 1067, 1154, 1155, 2455, 2221, 1876, 2456, 2025, 2400], 943)
-    femmesh.addVolume([157, 1005, 89, 1142, 2112, 2418, 369, 2111, 1352, 1734], 944)
-    femmesh.addVolume([990, 1012, 1039, 1147, 1303, 2457, 1701, 1329, 1328, 1700], 945)
-    femmesh.addVolume([1035, 1089, 1102, 1156, 2048, 2446, 2458, 1647, 2459, 1766], 946)
-    femmesh.addVolume([1011, 992, 1065, 1112, 2460, 2183, 1454, 1988, 1728, 1605], 947)
-    femmesh.addVolume([1127, 1093, 1161, 1201, 1938, 1942, 1941, 2122, 2461, 2123], 948)
-    femmesh.addVolume([987, 1080, 1093, 1127, 2463, 2462, 1937, 1939, 2464, 1938], 949)
-    femmesh.addVolume([987, 1138, 1026, 1245, 1495, 1334, 1494, 2465, 1749, 1748], 950)
-    femmesh.addVolume([37, 38, 822, 1068, 43, 863, 862, 2466, 2467, 2468], 951)
-    femmesh.addVolume([832, 1099, 1120, 1196, 1444, 1638, 1637, 2469, 2470, 1930], 952)
-    femmesh.addVolume([994, 993, 1111, 1130, 1265, 1786, 1785, 1504, 1506, 2471], 953)
-    femmesh.addVolume([991, 1015, 1037, 1075, 1399, 1581, 2472, 2473, 1562, 1910], 954)
-    femmesh.addVolume([12, 1006, 1109, 1214, 1853, 1508, 1934, 2474, 1471, 2475], 955)
-    femmesh.addVolume([642, 603, 604, 1119, 710, 705, 709, 1851, 1850, 2476], 956)
-    femmesh.addVolume([612, 626, 1078, 1232, 740, 2325, 2327, 1251, 1772, 2477], 957)
-    femmesh.addVolume([837, 1189, 836, 1222, 2169, 2168, 885, 2478, 2479, 2480], 958)
-    femmesh.addVolume([991, 1057, 1136, 1216, 1387, 1954, 1403, 1404, 1913, 1405], 959)
-    femmesh.addVolume([1018, 1033, 1098, 1138, 2481, 2253, 1678, 1679, 1551, 1680], 960)
-    femmesh.addVolume([996, 1166, 1043, 1172, 1845, 1439, 1608, 1609, 2482, 1610], 961)
-    femmesh.addVolume([1008, 1128, 1025, 1140, 2484, 2483, 1718, 1377, 2485, 1719], 962)
-    femmesh.addVolume([1085, 1121, 996, 1239, 2486, 2331, 1964, 1969, 2487, 1967], 963)
-    femmesh.addVolume([622, 1078, 626, 1230, 2326, 2325, 749, 2488, 2489, 2490], 964)
-    femmesh.addVolume([1032, 1011, 1155, 1221, 2170, 2491, 2365, 2172, 2174, 2492], 965)
-    femmesh.addVolume([1000, 1043, 1055, 1166, 1984, 1436, 1983, 1838, 1439, 1441], 966)
-    femmesh.addVolume([1018, 1033, 1138, 1213, 2481, 1551, 1679, 2493, 2045, 2494], 967)
-    femmesh.addVolume([803, 1082, 1131, 1187, 1831, 2067, 1525, 1527, 2452, 1528], 968)
-    femmesh.addVolume([605, 640, 628, 1090, 682, 723, 721, 2495, 1532, 1533], 969)
-    femmesh.addVolume([1050, 1104, 1008, 1162, 2392, 2497, 2496, 1451, 2498, 2499], 970)
-    femmesh.addVolume([1072, 1153, 1193, 1236, 1726, 1571, 1361, 1834, 1836, 1944], 971)
-    femmesh.addVolume([1008, 1059, 1128, 1140, 2500, 2284, 2484, 1377, 2501, 2485], 972)
-    femmesh.addVolume([821, 1131, 1050, 1162, 2389, 1632, 2388, 2018, 2391, 1451], 973)
-    femmesh.addVolume([609, 30, 607, 1173, 649, 684, 690, 2040, 2042, 2502], 974)
-    femmesh.addVolume([827, 1131, 1020, 1187, 1461, 1633, 2131, 1526, 1528, 2503], 975)
-    femmesh.addVolume([985, 1039, 992, 1241, 2114, 2115, 2070, 2504, 2505, 2066], 976)
-    femmesh.addVolume([629, 630, 625, 1117, 671, 791, 789, 1905, 1907, 2506], 977)
-    femmesh.addVolume([993, 1111, 1130, 1227, 1786, 2471, 1506, 2507, 2508, 2509], 978)
-    femmesh.addVolume([1031, 1161, 1127, 1237, 2006, 1941, 2314, 2282, 2510, 2511], 979)
-    femmesh.addVolume([1030, 1031, 1127, 1237, 2379, 2314, 2512, 1311, 2282, 2511], 980)
-    femmesh.addVolume([1040, 997, 1062, 1082, 1365, 2097, 2244, 1517, 1518, 1714], 981)
-    femmesh.addVolume([993, 1089, 1013, 1102, 2514, 2513, 1573, 1655, 2446, 2515], 982)
-    femmesh.addVolume([1132, 986, 1202, 1216, 1295, 2517, 2516, 2518, 1914, 1569], 983)
-    femmesh.addVolume([1007, 1111, 1022, 1127, 2520, 1787, 2519, 2120, 2521, 2522], 984)
-    femmesh.addVolume([1051, 1023, 1116, 1122, 2432, 1487, 2442, 2444, 2523, 2431], 985)
-    femmesh.addVolume([622, 627, 646, 1066, 779, 780, 781, 2524, 2525, 2526], 986)
-    femmesh.addVolume([83, 988, 82, 1097, 1858, 2527, 429, 1871, 1872, 2528], 987)
-    femmesh.addVolume([1006, 1116, 1023, 1122, 1486, 1487, 1485, 2203, 2431, 2523], 988)
-    femmesh.addVolume([1001, 105, 1109, 1214, 1688, 1691, 1692, 1416, 2529, 2475], 989)
-    femmesh.addVolume([1035, 1102, 1198, 1231, 2458, 1656, 2049, 2530, 1660, 1659], 990)
-    femmesh.addVolume([605, 1090, 1173, 1176, 2495, 2532, 2531, 2533, 1997, 2534], 991)
-    femmesh.addVolume([74, 148, 988, 1087, 395, 1370, 2082, 2083, 1368, 1369], 992)
-    femmesh.addVolume([86, 988, 1129, 1225, 2242, 1849, 2243, 2535, 2009, 2536], 993)
-    femmesh.addVolume([1032, 1105, 1194, 1221, 2088, 2182, 1590, 2172, 2537, 2173], 994)
-    femmesh.addVolume([1124, 125, 1151, 1152, 1932, 1931, 1721, 2538, 2539, 2540], 995)
-    femmesh.addVolume([605, 640, 1090, 1176, 682, 1532, 2495, 2533, 1998, 1997], 996)
-    femmesh.addVolume([1026, 1014, 1244, 1245, 1552, 1555, 1557, 1748, 1747, 2541], 997)
-    femmesh.addVolume([1014, 1004, 1028, 1067, 2430, 2217, 1670, 1554, 2218, 2219], 998)
-    femmesh.addVolume([62, 1004, 1116, 1143, 2415, 2237, 2542, 2543, 2241, 2240], 999)
-    femmesh.addVolume([985, 1015, 1070, 1126, 1955, 1398, 1956, 2544, 2545, 2450], 1000)
-    femmesh.addVolume([821, 1050, 1120, 1162, 2388, 1925, 1639, 2018, 1451, 2236], 1001)
-    femmesh.addVolume([989, 1095, 1014, 1138, 2547, 2546, 1596, 1643, 2548, 1746], 1002)
-    femmesh.addVolume([997, 1040, 1062, 1237, 1365, 2244, 2097, 1310, 1367, 2138], 1003)
-    femmesh.addVolume([984, 1102, 1089, 1156, 1767, 2446, 2447, 1765, 1766, 2459], 1004)
-    femmesh.addVolume([162, 1058, 1093, 1204, 2550, 1898, 2549, 2551, 1901, 1903], 1005)
-    femmesh.addVolume([999, 1085, 1153, 1190, 1278, 1282, 1281, 2158, 1965, 2552], 1006)
-    femmesh.addVolume([175, 1129, 107, 1132, 2553, 2339, 525, 2554, 1296, 2338], 1007)
-    femmesh.addVolume([113, 1083, 1167, 1182, 2555, 1345, 1640, 1619, 2224, 1784], 1008)
-    femmesh.addVolume([991, 1086, 1144, 1145, 1960, 1693, 1558, 1326, 2335, 2556], 1009)
-    femmesh.addVolume([93, 1204, 983, 1207, 2558, 1902, 2557, 2559, 2560, 2561], 1010)
-    femmesh.addVolume([1023, 1114, 1084, 1197, 2563, 2562, 1904, 1945, 2564, 1946], 1011)
-    femmesh.addVolume([991, 1075, 1037, 1136, 2473, 1910, 2472, 1403, 1908, 1909], 1012)
-    femmesh.addVolume([1009, 1079, 1031, 1091, 2279, 2280, 2277, 2276, 2565, 2275], 1013)
-    femmesh.addVolume([1008, 1025, 1104, 1172, 1718, 2566, 2497, 2567, 1611, 2568], 1014)
-    femmesh.addVolume([812, 1065, 814, 1149, 1510, 2569, 948, 1480, 1287, 2062], 1015)
-    femmesh.addVolume([985, 1054, 1071, 1194, 2332, 2570, 2370, 2073, 1591, 2371], 1016)
-    femmesh.addVolume([62, 1103, 1004, 1143, 2414, 2375, 2415, 2543, 2376, 2241], 1017)
-    femmesh.addVolume([647, 1139, 602, 1150, 1364, 1363, 706, 2571, 2572, 2573], 1018)
-    femmesh.addVolume([985, 992, 1071, 1241, 2070, 2369, 2370, 2504, 2066, 2574], 1019)
-    femmesh.addVolume([638, 608, 637, 1137, 733, 731, 734, 2167, 2410, 2575], 1020)
-    femmesh.addVolume([1102, 1034, 1165, 1209, 2345, 2347, 2013, 1769, 2576, 2363], 1021)
-    femmesh.addVolume([999, 1029, 1072, 1106, 2578, 2577, 1356, 2255, 2579, 2401], 1022)
-    femmesh.addVolume([1007, 1161, 983, 1201, 2005, 2164, 2163, 2121, 2123, 2580], 1023)
-    femmesh.addVolume([142, 135, 1070, 1171, 583, 2581, 1322, 1341, 2582, 1342], 1024)
-    femmesh.addVolume([812, 1073, 1094, 1096, 1289, 1624, 1450, 1826, 1828, 1320], 1025)
-    femmesh.addVolume([1028, 1004, 1051, 1154, 2217, 2412, 2443, 2220, 2222, 2583], 1026)
-    femmesh.addVolume([629, 1081, 1117, 1123, 1806, 1906, 1905, 1409, 1936, 1869], 1027)
-    femmesh.addVolume([818, 836, 838, 1208, 963, 964, 953, 2584, 2585, 2586], 1028)
-    femmesh.addVolume([102, 126, 1077, 1107, 512, 2355, 1877, 1878, 2354, 1841], 1029)
-    femmesh.addVolume([994, 1013, 1130, 1226, 1777, 1574, 1504, 1779, 1778, 2587], 1030)
-    femmesh.addVolume([1046, 1010, 1140, 1233, 2419, 2421, 1379, 2312, 2588, 2313], 1031)
-    femmesh.addVolume([1050, 1164, 1146, 1173, 1924, 2438, 2437, 1453, 2378, 2185], 1032)
-    femmesh.addVolume([633, 635, 643, 1113, 794, 795, 775, 2589, 2343, 2342], 1033)
-    femmesh.addVolume([1014, 1005, 1103, 1178, 1595, 1625, 2590, 2145, 1628, 1630], 1034)
-    femmesh.addVolume([1104, 1025, 1158, 1172, 2566, 2028, 2591, 2568, 1611, 2393], 1035)
-    femmesh.addVolume([1065, 1011, 1073, 1096, 1454, 1456, 1284, 1827, 2394, 1828], 1036)
-    femmesh.addVolume([643, 619, 1064, 1157, 771, 1790, 1789, 2592, 2308, 2593], 1037)
-    femmesh.addVolume([991, 1023, 1015, 1075, 1593, 1594, 1399, 2473, 2317, 1562], 1038)
-    femmesh.addVolume([1014, 1005, 1028, 1103, 1595, 1669, 1670, 2590, 1625, 2374], 1039)
-    femmesh.addVolume([79, 1071, 1177, 1207, 2213, 2215, 2214, 2594, 2595, 2361], 1040)
-    femmesh.addVolume([990, 1101, 1086, 1184, 1514, 1516, 1304, 2596, 2597, 2598], 1041)
-    femmesh.addVolume([150, 1089, 1182, 1210, 2600, 2047, 2599, 2601, 2602, 1623], 1042)
-    femmesh.addVolume([128, 1124, 1215, 1218, 2604, 1720, 2603, 2605, 1722, 1589], 1043)
-    femmesh.addVolume([983, 1151, 1201, 1207, 2607, 2606, 2580, 2561, 2608, 2609], 1044)
-    femmesh.addVolume([1000, 1055, 1077, 1166, 1983, 1922, 1446, 1838, 1441, 1844], 1045)
-    femmesh.addVolume([178, 153, 994, 1218, 565, 2124, 1991, 1992, 2126, 1993], 1046)
-    femmesh.addVolume([614, 623, 625, 1179, 757, 759, 760, 2610, 2611, 2612], 1047)
-    femmesh.addVolume([1057, 1001, 1136, 1216, 1689, 1276, 1954, 1913, 2429, 1405], 1048)
-    femmesh.addVolume([1086, 986, 1101, 1129, 2613, 1535, 1516, 2614, 1297, 1539], 1049)
-    femmesh.addVolume([1107, 996, 1121, 1239, 1842, 2331, 1880, 2341, 1967, 2487], 1050)
-    femmesh.addVolume([41, 40, 798, 1114, 46, 877, 876, 2085, 2087, 2615], 1051)
-    femmesh.addVolume([30, 1069, 644, 1146, 2134, 2133, 650, 1649, 2616, 1650], 1052)
-    femmesh.addVolume([29, 1146, 1164, 1173, 2617, 2438, 2052, 2377, 2185, 2378], 1053)
-    femmesh.addVolume([802, 828, 803, 1188, 912, 911, 903, 2618, 2150, 2068], 1054)
-    femmesh.addVolume([989, 1138, 1035, 1238, 1643, 1644, 1645, 1976, 2619, 2413], 1055)
-    femmesh.addVolume([1020, 1104, 827, 1187, 2130, 1457, 2131, 2503, 1614, 1526], 1056)
-    femmesh.addVolume([1009, 1161, 1031, 1237, 2265, 2006, 2277, 2281, 2510, 2282], 1057)
-    femmesh.addVolume([27, 640, 28, 1176, 675, 674, 33, 1546, 1998, 1547], 1058)
-    femmesh.addVolume([1018, 1138, 1156, 1213, 1679, 1648, 2031, 2493, 2494, 2620], 1059)
-    femmesh.addVolume([999, 1153, 1029, 1190, 1281, 2621, 2578, 2158, 2552, 2622], 1060)
-    femmesh.addVolume([999, 1034, 1021, 1106, 2257, 2624, 2623, 2255, 2256, 2625], 1061)
-    femmesh.addVolume([989, 1178, 181, 1191, 2144, 2627, 2626, 2318, 1763, 2628], 1062)
-    femmesh.addVolume([1044, 1034, 1076, 1181, 2422, 2434, 2436, 2425, 2427, 2629], 1063)
-    femmesh.addVolume([1053, 1027, 1078, 1218, 2632, 2631, 2630, 2633, 2634, 2635], 1064)
-    femmesh.addVolume([163, 1095, 1058, 1163, 2350, 2352, 2348, 2636, 2637, 1863], 1065)
-    femmesh.addVolume([997, 1034, 1081, 1117, 2346, 2423, 1935, 1866, 2638, 1906], 1066)
-    femmesh.addVolume([1006, 1023, 1109, 1136, 1485, 1507, 1508, 1256, 1897, 1896], 1067)
-    femmesh.addVolume([814, 1065, 812, 1196, 2569, 1510, 948, 2639, 1805, 2640], 1068)
-    femmesh.addVolume([1015, 1074, 1075, 1212, 2020, 2641, 1562, 1565, 2024, 1566], 1069)
-    femmesh.addVolume([1014, 1138, 1095, 1245, 1746, 2548, 2546, 1747, 1749, 2642], 1070)
-    femmesh.addVolume([840, 1059, 1162, 1211, 2643, 1381, 1757, 1758, 1981, 1759], 1071)
-    femmesh.addVolume([1005, 1068, 1028, 1125, 1671, 1673, 1669, 1792, 1794, 2644], 1072)
-    femmesh.addVolume([1051, 1154, 1004, 1155, 2583, 2222, 2412, 2366, 2400, 2055], 1073)
-    femmesh.addVolume([27, 618, 26, 1062, 667, 666, 32, 2645, 2646, 2647], 1074)
-    femmesh.addVolume([1023, 1084, 1114, 1136, 1904, 2562, 2563, 1897, 1258, 2187], 1075)
-    femmesh.addVolume([833, 1104, 819, 1162, 2648, 1458, 967, 1773, 2498, 2390], 1076)
-    femmesh.addVolume([997, 1102, 1138, 1231, 2012, 2649, 1681, 1511, 1660, 2403], 1077)
-    femmesh.addVolume([1013, 1044, 993, 1102, 1963, 1919, 1573, 2515, 2650, 1655], 1078)
-    femmesh.addVolume([1050, 1024, 1120, 1162, 1452, 1927, 1925, 1451, 1380, 2236], 1079)
-    femmesh.addVolume([1031, 1009, 1112, 1161, 2277, 1604, 2003, 2006, 2265, 2007], 1080)
-    femmesh.addVolume([26, 4, 630, 1243, 31, 658, 657, 2651, 2652, 2653], 1081)
-    femmesh.addVolume([1021, 1165, 1166, 1172, 2655, 2207, 2654, 2656, 2657, 2482], 1082)
-    femmesh.addVolume([999, 1072, 1029, 1153, 1356, 2577, 2578, 1281, 1726, 2621], 1083)
-    femmesh.addVolume([1001, 1132, 1202, 1216, 1491, 2516, 2428, 2429, 2518, 1569], 1084)
-    femmesh.addVolume([159, 1148, 1087, 1168, 2659, 1811, 2658, 2660, 2248, 2247], 1085)
-    femmesh.addVolume([27, 619, 618, 1157, 673, 676, 667, 2306, 2308, 2661], 1086)
-    femmesh.addVolume([635, 646, 1048, 1139, 796, 1347, 1346, 1665, 1664, 2662], 1087)
-    femmesh.addVolume([1016, 1052, 1055, 1084, 2664, 2252, 2663, 1254, 1753, 2665], 1088)
-    femmesh.addVolume([993, 1130, 1013, 1198, 1506, 1574, 1573, 1657, 2666, 2667], 1089)
-    femmesh.addVolume([1013, 1034, 1044, 1102, 2433, 2422, 1963, 2515, 2345, 2650], 1090)
-    femmesh.addVolume([1005, 1006, 1041, 1143, 1349, 1350, 1351, 1502, 1501, 2668], 1091)
-    femmesh.addVolume([641, 610, 606, 1195, 727, 724, 726, 2669, 2670, 2671], 1092)
-    femmesh.addVolume([838, 1189, 832, 1208, 2089, 2091, 955, 2586, 2672, 2673], 1093)
-    femmesh.addVolume([147, 1003, 1097, 1174, 2674, 1949, 2059, 2060, 2675, 2061], 1094)
-    femmesh.addVolume([809, 812, 1094, 1096, 930, 1450, 1273, 1319, 1826, 1320], 1095)
-    femmesh.addVolume([3, 642, 644, 1119, 655, 656, 651, 2676, 1851, 2677], 1096)
-    femmesh.addVolume([607, 1173, 605, 1185, 2502, 2531, 688, 2264, 2678, 2262], 1097)
-    femmesh.addVolume([147, 1003, 1174, 1200, 2674, 2675, 2060, 2679, 2680, 1995], 1098)
-    femmesh.addVolume([1024, 1050, 1120, 1164, 1452, 1925, 1927, 2372, 1924, 1882], 1099)
-    femmesh.addVolume([800, 798, 799, 1159, 888, 886, 887, 2681, 2682, 1616], 1100)
-    femmesh.addVolume([1039, 1012, 1049, 1147, 2457, 2684, 2683, 1700, 1328, 2685], 1101)
-    femmesh.addVolume([88, 1006, 49, 1214, 1467, 2686, 260, 1469, 1471, 2687], 1102)
-    femmesh.addVolume([145, 1054, 110, 1204, 2357, 1839, 483, 2688, 2108, 2107], 1103)
-    femmesh.addVolume([104, 102, 1077, 1121, 503, 1877, 1313, 2337, 1879, 1881], 1104)
-    femmesh.addVolume([802, 803, 1082, 1188, 903, 1831, 1830, 2618, 2068, 1716], 1105)
-    femmesh.addVolume([181, 170, 989, 1191, 213, 1974, 2626, 2628, 2319, 2318], 1106)
-    femmesh.addVolume([1005, 1191, 989, 1213, 1764, 2318, 1597, 2043, 2323, 2044], 1107)
-    femmesh.addVolume([166, 1116, 995, 1171, 2691, 2690, 2689, 2692, 1489, 2017], 1108)
-    femmesh.addVolume([999, 1106, 1021, 1190, 2255, 2625, 2623, 2158, 2693, 2694], 1109)
-    femmesh.addVolume([1058, 168, 1105, 1204, 2696, 2695, 1435, 1901, 2697, 2109], 1110)
-    femmesh.addVolume([1006, 1136, 1109, 1214, 1256, 1896, 1508, 1471, 2110, 2475], 1111)
-    femmesh.addVolume([113, 1167, 127, 1210, 1640, 2698, 547, 1622, 1642, 2699], 1112)
-    femmesh.addVolume([1068, 1125, 1033, 1192, 1794, 1793, 1761, 2700, 2301, 2300], 1113)
-    femmesh.addVolume([1058, 1244, 1014, 1245, 2702, 1555, 2701, 2703, 2541, 1747], 1114)
-    femmesh.addVolume([1063, 1087, 1147, 1168, 1738, 1739, 1330, 2704, 2247, 2246], 1115)
-    femmesh.addVolume([1064, 1149, 1056, 1164, 1962, 2398, 2705, 2176, 2399, 1883], 1116)
-    femmesh.addVolume([840, 1162, 1059, 1240, 1757, 1381, 2643, 2706, 2707, 2708], 1117)
-    femmesh.addVolume([168, 60, 1058, 1105, 343, 1430, 2696, 2695, 1433, 1435], 1118)
-    femmesh.addVolume([27, 618, 1062, 1157, 667, 2646, 2645, 2306, 2661, 2709], 1119)
-    femmesh.addVolume([1132, 986, 1175, 1202, 1295, 2711, 2710, 2516, 2517, 2712], 1120)
-    femmesh.addVolume([1001, 1109, 1136, 1214, 1692, 1896, 1276, 1416, 2475, 2110], 1121)
-    femmesh.addVolume([990, 1015, 1037, 1144, 1392, 1581, 1583, 1477, 1427, 2713], 1122)
-    femmesh.addVolume([984, 1156, 1089, 1182, 1765, 2459, 2447, 1618, 2714, 2047], 1123)
-    femmesh.addVolume([40, 1075, 817, 1122, 1530, 1529, 879, 2715, 2716, 2717], 1124)
-    femmesh.addVolume([616, 620, 1110, 1232, 746, 2719, 2718, 1250, 1252, 2720], 1125)
-    femmesh.addVolume([117, 172, 1193, 1210, 498, 1570, 2721, 2722, 1705, 1707], 1126)
-    femmesh.addVolume([999, 1029, 1106, 1190, 2578, 2579, 2255, 2158, 2622, 2693], 1127)
-    femmesh.addVolume([166, 995, 1116, 1229, 2689, 2690, 2691, 2723, 2368, 2724], 1128)
-    femmesh.addVolume([991, 1145, 1057, 1216, 1326, 1479, 1387, 1404, 2336, 1913], 1129)
-    femmesh.addVolume([78, 998, 1152, 1200, 2726, 1577, 2725, 2727, 1575, 1576], 1130)
-    femmesh.addVolume([1014, 1058, 1155, 1244, 2701, 2056, 2026, 1555, 2702, 2027], 1131)
-    femmesh.addVolume([983, 1194, 1112, 1224, 2729, 2728, 2162, 2730, 2731, 1731], 1132)
-    femmesh.addVolume([987, 1161, 1040, 1237, 1940, 2732, 1366, 1312, 2510, 1367], 1133)
-    femmesh.addVolume([113, 150, 1182, 1210, 545, 2599, 1619, 1622, 2601, 1623], 1134)
-    femmesh.addVolume([10, 1005, 1103, 1143, 2734, 1625, 2733, 2735, 1502, 2376], 1135)
-    femmesh.addVolume([145, 1054, 1204, 1207, 2357, 2108, 2688, 2360, 2362, 2560], 1136)
-    femmesh.addVolume([27, 1062, 1056, 1157, 2645, 1795, 1545, 2306, 2709, 2307], 1137)
-    femmesh.addVolume([1067, 1028, 1068, 1154, 2219, 1673, 2289, 2221, 2220, 2736], 1138)
-    femmesh.addVolume([1083, 984, 1167, 1182, 1682, 1641, 1345, 2224, 1618, 1784], 1139)
-    femmesh.addVolume([983, 1112, 1007, 1224, 2162, 2002, 2163, 2730, 1731, 2737], 1140)
-    femmesh.addVolume([62, 1116, 1004, 1229, 2542, 2237, 2415, 2738, 2724, 2075], 1141)
-    femmesh.addVolume([998, 1148, 78, 1152, 1812, 2739, 2726, 1577, 2740, 2725], 1142)
-    femmesh.addVolume([1050, 1020, 1090, 1104, 1631, 2208, 2209, 2392, 2130, 2741], 1143)
-    femmesh.addVolume([991, 1037, 1019, 1136, 2472, 1695, 1401, 1403, 1909, 1402], 1144)
-    femmesh.addVolume([1039, 1049, 1139, 1241, 2683, 2743, 2742, 2505, 2744, 2745], 1145)
-    femmesh.addVolume([1024, 1113, 1064, 1199, 2747, 2746, 1926, 2295, 2189, 2296], 1146)
-    femmesh.addVolume([985, 1015, 1126, 1170, 1955, 2545, 2544, 1825, 1426, 1476], 1147)
-    femmesh.addVolume([625, 1117, 630, 1181, 2506, 1907, 791, 2748, 2749, 2750], 1148)
-    femmesh.addVolume([993, 1227, 1198, 1231, 2507, 2751, 1657, 1658, 2752, 1659], 1149)
-    femmesh.addVolume([1036, 1024, 1065, 1199, 1802, 1800, 1801, 1396, 2295, 2297], 1150)
-    femmesh.addVolume([67, 111, 1083, 1167, 377, 2753, 1259, 1344, 2754, 1345], 1151)
-    femmesh.addVolume([1016, 1001, 1052, 1084, 1275, 1754, 2664, 1254, 1274, 1753], 1152)
-    femmesh.addVolume([821, 820, 1120, 1131, 956, 2755, 1639, 2389, 2756, 2304], 1153)
-    femmesh.addVolume([1083, 1035, 1156, 1182, 1774, 1647, 1776, 2224, 2046, 2714], 1154)
-    femmesh.addVolume([1020, 1082, 1165, 1187, 2353, 2451, 2757, 2503, 2452, 2454], 1155)
-    femmesh.addVolume([987, 1127, 1161, 1237, 1939, 1941, 1940, 1312, 2511, 2510], 1156)
-    femmesh.addVolume([1018, 1042, 1000, 1141, 2759, 2758, 1837, 2081, 2760, 1986], 1157)
-    femmesh.addVolume([622, 626, 627, 1230, 749, 778, 779, 2488, 2490, 2761], 1158)
-    femmesh.addVolume([157, 156, 1005, 1191, 455, 2269, 2112, 2113, 2328, 1764], 1159)
-    femmesh.addVolume([993, 1013, 1089, 1198, 1573, 2513, 2514, 1657, 2667, 2050], 1160)
-    femmesh.addVolume([1017, 1053, 1078, 1218, 2763, 2630, 2762, 2764, 2633, 2635], 1161)
-    femmesh.addVolume([835, 810, 831, 1217, 941, 940, 942, 2765, 2766, 2767], 1162)
-    femmesh.addVolume([1052, 1019, 1136, 1202, 2768, 1402, 1755, 2769, 1567, 1568], 1163)
-    femmesh.addVolume([1044, 1013, 1045, 1076, 1963, 1572, 1921, 2436, 2435, 2770], 1164)
-    femmesh.addVolume([1038, 1061, 1101, 1140, 1743, 2772, 2771, 2063, 2305, 2773], 1165)
-    femmesh.addVolume([93, 162, 1093, 1204, 280, 2549, 2774, 2558, 2551, 1903], 1166)
-    femmesh.addVolume([109, 110, 1105, 1204, 481, 1840, 2775, 2776, 2107, 2109], 1167)
-    femmesh.addVolume([1004, 1028, 1051, 1116, 2217, 2443, 2412, 2237, 2238, 2442], 1168)
-    femmesh.addVolume([93, 1093, 162, 1201, 2774, 2549, 280, 2777, 2461, 2778], 1169)
-    femmesh.addVolume([630, 632, 625, 1181, 792, 761, 791, 2750, 2779, 2748], 1170)
-    femmesh.addVolume([620, 612, 1078, 1232, 745, 2327, 2780, 1252, 1251, 2477], 1171)
-    femmesh.addVolume([617, 619, 643, 1157, 768, 771, 770, 2781, 2308, 2592], 1172)
-    femmesh.addVolume([825, 826, 824, 1158, 976, 977, 925, 2782, 2783, 2784], 1173)
-    femmesh.addVolume([1063, 133, 1070, 1145, 2786, 2785, 2128, 2787, 2788, 1327], 1174)
-    femmesh.addVolume([613, 632, 645, 1076, 754, 756, 741, 2407, 2409, 2789], 1175)
-    femmesh.addVolume([1019, 1092, 1059, 1202, 1412, 1978, 2232, 1567, 2287, 2286], 1176)
-    femmesh.addVolume([1089, 984, 1182, 1210, 2447, 1618, 2047, 2602, 1621, 1623], 1177)
-    femmesh.addVolume([826, 1104, 1158, 1187, 1612, 2591, 2783, 1613, 1614, 2790], 1178)
-    femmesh.addVolume([121, 1085, 1107, 1121, 2792, 1339, 2791, 2793, 2486, 1880], 1179)
-    femmesh.addVolume([637, 608, 1061, 1137, 731, 1662, 1661, 2575, 2410, 2794], 1180)
-    femmesh.addVolume([990, 1038, 1069, 1184, 2178, 2796, 2795, 2596, 2797, 2798], 1181)
-    femmesh.addVolume([1073, 1040, 1161, 1237, 2799, 2732, 2266, 2800, 1367, 2510], 1182)
-    femmesh.addVolume([1027, 1218, 1053, 1219, 2634, 2633, 2632, 2801, 2802, 2803], 1183)
-    femmesh.addVolume([1047, 1097, 1100, 1137, 2805, 2404, 2804, 2806, 1819, 2406], 1184)
-    femmesh.addVolume([813, 812, 1096, 1196, 946, 1826, 2807, 2808, 2640, 2809], 1185)
-    femmesh.addVolume([987, 1030, 1127, 1237, 1308, 2512, 1939, 1312, 1311, 2511], 1186)
-    femmesh.addVolume([987, 1161, 1093, 1245, 1940, 1942, 1937, 2465, 2810, 2811], 1187)
-    femmesh.addVolume([156, 10, 1005, 1103, 216, 2734, 2269, 2270, 2733, 1625], 1188)
-    femmesh.addVolume([605, 1173, 29, 1176, 2531, 2377, 679, 2533, 2534, 2054], 1189)
-    femmesh.addVolume([820, 1120, 1056, 1149, 2755, 1884, 2812, 2813, 2397, 2398], 1190)
-    femmesh.addVolume([78, 998, 84, 1148, 2726, 1821, 409, 2739, 1812, 1822], 1191)
-    femmesh.addVolume([154, 66, 1077, 1167, 361, 2036, 2814, 2815, 2035, 1445], 1192)
-    femmesh.addVolume([1014, 1004, 1155, 1163, 2430, 2055, 2026, 2816, 1864, 2817], 1193)
-    femmesh.addVolume([811, 823, 1067, 1183, 937, 1781, 1783, 2143, 2142, 2818], 1194)
-    femmesh.addVolume([1102, 997, 1138, 1156, 2012, 1681, 2649, 1766, 2011, 1648], 1195)
-    femmesh.addVolume([628, 629, 1117, 1123, 788, 1905, 2819, 1407, 1409, 1869], 1196)
-    femmesh.addVolume([1040, 1062, 1009, 1188, 2244, 1796, 2820, 2245, 1715, 1799], 1197)
-    femmesh.addVolume([1064, 1056, 1157, 1164, 2705, 2307, 2593, 2176, 1883, 2821], 1198)
-    femmesh.addVolume([985, 1126, 1054, 1170, 2544, 1422, 2332, 1825, 1476, 1475], 1199)
-    femmesh.addVolume([119, 994, 1111, 1130, 2823, 1785, 2822, 2824, 1504, 2471], 1200)
-    femmesh.addVolume([997, 1082, 1018, 1165, 1518, 2135, 1677, 2014, 2451, 2205], 1201)
-    femmesh.addVolume([148, 147, 1174, 1200, 439, 2060, 1371, 1994, 2679, 1995], 1202)
-    femmesh.addVolume([178, 119, 994, 1111, 317, 2823, 1991, 2825, 2822, 1785], 1203)
-    femmesh.addVolume([104, 143, 1214, 1234, 521, 2826, 1417, 1316, 2827, 1418], 1204)
-    femmesh.addVolume([987, 1160, 1127, 1231, 2829, 2828, 1939, 1512, 2830, 2831], 1205)
-    femmesh.addVolume([996, 1025, 1008, 1172, 1607, 1718, 1376, 1609, 1611, 2567], 1206)
-    femmesh.addVolume([126, 154, 1077, 1167, 373, 2814, 2355, 2356, 2815, 1445], 1207)
-    femmesh.addVolume([1092, 1202, 1052, 1240, 2287, 2769, 2832, 2439, 2441, 2833], 1208)
-    femmesh.addVolume([997, 1018, 1138, 1156, 1677, 1679, 1681, 2011, 2031, 1648], 1209)
-    femmesh.addVolume([27, 1056, 1062, 1123, 1545, 1795, 2645, 2293, 2294, 1712], 1210)
-    femmesh.addVolume([611, 1088, 626, 1232, 2835, 2834, 739, 1771, 2836, 1772], 1211)
-    femmesh.addVolume([607, 609, 1173, 1185, 690, 2040, 2502, 2264, 2837, 2678], 1212)
-    femmesh.addVolume([27, 1123, 640, 1176, 2293, 1408, 675, 1546, 1999, 1998], 1213)
-    femmesh.addVolume([991, 1023, 1109, 1171, 1593, 1507, 1390, 1340, 1488, 1509], 1214)
-    femmesh.addVolume([1089, 92, 1182, 1198, 2839, 2838, 2047, 2050, 2840, 2051], 1215)
-    femmesh.addVolume([990, 1069, 1146, 1199, 2795, 2616, 2179, 1395, 2841, 2188], 1216)
-    femmesh.addVolume([998, 1039, 1049, 1147, 2843, 2683, 2842, 1809, 1700, 2685], 1217)
-    femmesh.addVolume([89, 1005, 156, 1143, 2418, 2269, 225, 1736, 1502, 2844], 1218)
-    femmesh.addVolume([992, 985, 1170, 1199, 2070, 1825, 2071, 2116, 1708, 1429], 1219)
-    femmesh.addVolume([70, 1093, 1095, 1160, 2846, 2351, 2845, 2847, 2848, 2849], 1220)
-    femmesh.addVolume([82, 988, 86, 1225, 2527, 2242, 391, 2850, 2009, 2535], 1221)
-    femmesh.addVolume([1085, 996, 1121, 1233, 1964, 2331, 2486, 2146, 2148, 2851], 1222)
-    femmesh.addVolume([38, 816, 822, 1115, 868, 871, 863, 2852, 2853, 2854], 1223)
-    femmesh.addVolume([798, 841, 1114, 1240, 882, 2855, 2615, 1498, 1497, 2856], 1224)
-    femmesh.addVolume([1036, 992, 1065, 1170, 2857, 2183, 1801, 1601, 2071, 2384], 1225)
-    femmesh.addVolume([990, 1069, 1012, 1101, 2795, 2858, 1303, 1514, 2859, 1515], 1226)
-    femmesh.addVolume([1001, 1016, 1055, 1077, 1275, 2663, 2251, 1314, 2860, 1922], 1227)
-    femmesh.addVolume([1031, 1007, 1112, 1224, 2004, 2002, 2003, 2861, 2737, 1731], 1228)
-    femmesh.addVolume([817, 815, 816, 1212, 961, 944, 881, 2862, 2099, 2863], 1229)
-    femmesh.addVolume([1029, 1002, 1097, 1153, 2864, 1948, 2227, 2621, 1832, 2865], 1230)
-    femmesh.addVolume([124, 125, 1151, 1215, 273, 1931, 2866, 2867, 1933, 1584], 1231)
-    femmesh.addVolume([1035, 171, 1182, 1238, 2869, 2868, 2046, 2413, 2870, 2225], 1232)
-    femmesh.addVolume([66, 154, 1077, 1234, 361, 2814, 2036, 2037, 2871, 1318], 1233)
-    femmesh.addVolume([124, 1124, 125, 1215, 2872, 1932, 273, 2867, 1720, 1933], 1234)
-    femmesh.addVolume([818, 815, 836, 1212, 936, 962, 963, 2373, 2099, 2873], 1235)
-    femmesh.addVolume([1064, 1120, 1149, 1164, 1928, 2397, 1962, 2176, 1882, 2399], 1236)
-    femmesh.addVolume([1063, 114, 1087, 1168, 2875, 2874, 1738, 2704, 2876, 2247], 1237)
-    femmesh.addVolume([75, 1063, 114, 1087, 2102, 2875, 389, 2101, 1738, 2874], 1238)
-    femmesh.addVolume([990, 1069, 1038, 1146, 2795, 2796, 2178, 2179, 2616, 2180], 1239)
-    femmesh.addVolume([646, 643, 1048, 1091, 793, 1348, 1347, 2877, 2878, 2879], 1240)
-    femmesh.addVolume([993, 1130, 1198, 1227, 1506, 2666, 1657, 2507, 2509, 2751], 1241)
-    femmesh.addVolume([814, 812, 813, 1196, 948, 946, 947, 2639, 2640, 2808], 1242)
-    femmesh.addVolume([609, 1169, 1173, 1185, 1740, 2041, 2040, 2837, 2880, 2678], 1243)
-    femmesh.addVolume([646, 627, 643, 1091, 780, 774, 793, 2877, 2881, 2878], 1244)
-    femmesh.addVolume([633, 643, 1064, 1113, 775, 1789, 1788, 2589, 2342, 2746], 1245)
-    femmesh.addVolume([1002, 1003, 1027, 1047, 1950, 2883, 2882, 2884, 2885, 2886], 1246)
-    femmesh.addVolume([1052, 1025, 1055, 1159, 2249, 1437, 2252, 2887, 2888, 2889], 1247)
-    femmesh.addVolume([1022, 1111, 993, 1127, 1787, 1786, 1266, 2522, 2521, 2890], 1248)
-    femmesh.addVolume([84, 998, 78, 1200, 1821, 2726, 409, 2038, 1575, 2727], 1249)
-    femmesh.addVolume([823, 822, 1067, 1108, 865, 1782, 1781, 2290, 2292, 2891], 1250)
-    femmesh.addVolume([1008, 1104, 1128, 1162, 2497, 2892, 2484, 2499, 2498, 2893], 1251)
-    femmesh.addVolume([144, 1126, 1054, 1177, 2383, 1422, 2382, 2894, 2895, 2358], 1252)
-    femmesh.addVolume([153, 178, 994, 1111, 565, 1991, 2124, 2125, 2825, 1785], 1253)
-    femmesh.addVolume([1007, 1022, 1111, 1218, 2519, 1787, 2520, 1588, 2896, 2127], 1254)
-    femmesh.addVolume([1016, 1000, 1055, 1077, 2897, 1983, 2663, 2860, 1446, 1922], 1255)
-    femmesh.addVolume([619, 1157, 1056, 1164, 2308, 2307, 1544, 2033, 2821, 1883], 1256)
-    femmesh.addVolume([1024, 1099, 1120, 1162, 1889, 1638, 1927, 1380, 2019, 2236], 1257)
-    femmesh.addVolume([1010, 1046, 1061, 1223, 2419, 1742, 2420, 2898, 2899, 2900], 1258)
-    femmesh.addVolume([1090, 1050, 1173, 1176, 2209, 1453, 2532, 1997, 1636, 2534], 1259)
-    femmesh.addVolume([1142, 1016, 1214, 1234, 1500, 1654, 1470, 2149, 2901, 1418], 1260)
-    femmesh.addVolume([39, 1125, 805, 1197, 1972, 1971, 867, 2902, 2903, 2904], 1261)
-    femmesh.addVolume([1002, 1029, 1072, 1153, 2864, 2577, 1833, 1832, 2621, 1726], 1262)
-    femmesh.addVolume([1093, 1058, 1095, 1245, 1898, 2352, 2351, 2811, 2703, 2642], 1263)
-    femmesh.addVolume([998, 1087, 1147, 1174, 1810, 1739, 1809, 2905, 1373, 2906], 1264)
-    femmesh.addVolume([634, 1146, 644, 1242, 1651, 1650, 691, 2907, 2191, 2908], 1265)
-    femmesh.addVolume([82, 83, 86, 988, 429, 438, 391, 2527, 1858, 2242], 1266)
-    femmesh.addVolume([1060, 988, 1097, 1174, 2210, 1872, 1815, 2909, 1372, 2061], 1267)
-    femmesh.addVolume([51, 1201, 1151, 1207, 2911, 2606, 2910, 2912, 2609, 2608], 1268)
-    femmesh.addVolume([1080, 993, 1111, 1127, 2914, 1786, 2913, 2464, 2890, 2521], 1269)
-    femmesh.addVolume([1019, 1037, 1144, 1184, 1695, 2713, 1559, 2915, 2916, 2917], 1270)
-    femmesh.addVolume([107, 1121, 1132, 1134, 2918, 2229, 2338, 2340, 2231, 1300], 1271)
-    femmesh.addVolume([996, 1008, 1046, 1172, 1376, 1374, 1375, 1609, 2567, 2919], 1272)
-    femmesh.addVolume([800, 798, 1159, 1240, 888, 2682, 2681, 1496, 1498, 2920], 1273)
-    femmesh.addVolume([160, 12, 1116, 1171, 235, 1854, 2921, 2922, 1855, 1489], 1274)
-    femmesh.addVolume([1001, 1016, 1077, 1234, 1275, 2860, 1314, 1317, 2901, 1318], 1275)
-    femmesh.addVolume([1004, 1051, 1105, 1229, 2412, 2364, 1434, 2075, 2923, 2076], 1276)
-    femmesh.addVolume([987, 1138, 1160, 1231, 1495, 2924, 2829, 1512, 2403, 2830], 1277)
-    femmesh.addVolume([1089, 1035, 1102, 1198, 2048, 2458, 2446, 2050, 2049, 1656], 1278)
-    femmesh.addVolume([1020, 997, 1117, 1165, 1865, 1866, 1867, 2757, 2014, 2925], 1279)
-    femmesh.addVolume([56, 994, 1130, 1236, 2927, 1504, 2926, 2928, 2929, 2930], 1280)
-    femmesh.addVolume([1013, 1130, 1193, 1198, 1574, 2931, 1360, 2667, 2666, 2932], 1281)
-    femmesh.addVolume([1016, 1052, 1001, 1055, 2664, 1754, 1275, 2663, 2252, 2251], 1282)
-    femmesh.addVolume([159, 84, 1087, 1148, 412, 1820, 2658, 2659, 1822, 1811], 1283)
-    femmesh.addVolume([30, 1069, 1146, 1173, 2134, 2616, 1649, 2042, 2933, 2185], 1284)
-    femmesh.addVolume([102, 121, 1107, 1121, 510, 2791, 1878, 1879, 2793, 1880], 1285)
-    femmesh.addVolume([1036, 990, 1037, 1099, 1394, 1583, 1582, 2934, 1891, 2092], 1286)
-    femmesh.addVolume([1080, 987, 1093, 1160, 2463, 1937, 2462, 2935, 2829, 2848], 1287)
-    femmesh.addVolume([986, 1101, 1140, 1184, 1535, 2773, 2936, 2937, 2597, 2938], 1288)
-    femmesh.addVolume([1059, 1128, 1140, 1202, 2284, 2485, 2501, 2286, 2288, 2939], 1289)
-    femmesh.addVolume([802, 1186, 828, 1188, 2941, 2940, 912, 2618, 2942, 2150], 1290)
-    femmesh.addVolume([987, 1080, 1127, 1160, 2463, 2464, 1939, 2829, 2935, 2828], 1291)
-    femmesh.addVolume([1087, 1012, 1147, 1174, 1737, 1328, 1739, 1373, 2943, 2906], 1292)
-    femmesh.addVolume([163, 70, 1093, 1095, 386, 2846, 2349, 2350, 2845, 2351], 1293)
-    femmesh.addVolume([990, 1037, 1059, 1184, 1583, 1979, 1888, 2596, 2916, 2944], 1294)
-    femmesh.addVolume([988, 1010, 1097, 1220, 1847, 1814, 1872, 1859, 2334, 1873], 1295)
-    femmesh.addVolume([620, 612, 622, 1078, 745, 748, 747, 2780, 2327, 2326], 1296)
-    femmesh.addVolume([1005, 1028, 1041, 1125, 1669, 2200, 1351, 1792, 2644, 2945], 1297)
-    femmesh.addVolume([1080, 55, 1111, 1227, 2947, 2946, 2913, 2948, 2949, 2508], 1298)
-    femmesh.addVolume([807, 1141, 824, 1159, 1292, 2950, 895, 1617, 2951, 1615], 1299)
-    femmesh.addVolume([8, 989, 170, 1238, 2952, 1974, 204, 2953, 1976, 1975], 1300)
-    femmesh.addVolume([998, 1148, 1152, 1241, 1812, 2740, 1577, 2954, 2955, 2956], 1301)
-    femmesh.addVolume([75, 1087, 74, 1225, 2101, 2083, 187, 2103, 2010, 2084], 1302)
-    femmesh.addVolume([11, 1116, 1006, 1143, 2958, 1486, 2957, 2959, 2240, 1501], 1303)
-    femmesh.addVolume([1009, 1073, 1161, 1237, 1283, 2266, 2265, 2281, 2800, 2510], 1304)
-    femmesh.addVolume([76, 79, 1071, 1148, 405, 2213, 2960, 2961, 2211, 2212], 1305)
-    femmesh.addVolume([1018, 1042, 1118, 1192, 2759, 2963, 2962, 2964, 2302, 2965], 1306)
-    femmesh.addVolume([1017, 1139, 1049, 1241, 2967, 2743, 2966, 2968, 2745, 2744], 1307)
-    femmesh.addVolume([1005, 1041, 1028, 1143, 1351, 2200, 1669, 1502, 2668, 2239], 1308)
-    femmesh.addVolume([1005, 1033, 1042, 1213, 1598, 2233, 2234, 2043, 2045, 2969], 1309)
-    femmesh.addVolume([810, 811, 809, 1094, 928, 929, 927, 1449, 1271, 1273], 1310)
-    femmesh.addVolume([1030, 1044, 1081, 1102, 2079, 2424, 2160, 2254, 2650, 2970], 1311)
-    femmesh.addVolume([637, 1061, 610, 1223, 1661, 1663, 732, 2971, 2900, 2972], 1312)
-    femmesh.addVolume([14, 1057, 176, 1109, 1386, 2973, 246, 1389, 1391, 2974], 1313)
-    femmesh.addVolume([1004, 1014, 1028, 1103, 2430, 1670, 2217, 2375, 2590, 2374], 1314)
-    femmesh.addVolume([1081, 630, 1117, 1181, 1808, 1907, 1906, 2426, 2750, 2749], 1315)
-    femmesh.addVolume([1050, 1008, 1090, 1173, 2496, 2975, 2209, 1453, 2976, 2532], 1316)
-    femmesh.addVolume([1009, 1056, 1062, 1157, 1797, 1795, 1796, 2977, 2307, 2709], 1317)
-    femmesh.addVolume([983, 1058, 1093, 1244, 1900, 1898, 1899, 2978, 2702, 2979], 1318)
-    femmesh.addVolume([820, 831, 814, 1149, 959, 950, 957, 2813, 1481, 2062], 1319)
-    femmesh.addVolume([1068, 1028, 1115, 1154, 1673, 2981, 2980, 2736, 2220, 2982], 1320)
-    femmesh.addVolume([1050, 29, 1173, 1176, 2053, 2377, 1453, 1636, 2054, 2534], 1321)
-    femmesh.addVolume([994, 178, 1124, 1203, 1991, 1989, 1990, 2983, 2984, 2985], 1322)
-    femmesh.addVolume([1016, 1041, 1006, 1084, 1499, 1350, 1255, 1254, 1958, 1253], 1323)
-    femmesh.addVolume([111, 67, 1083, 1191, 377, 1259, 2753, 2986, 1523, 1522], 1324)
-    femmesh.addVolume([1060, 1097, 1100, 1174, 1815, 2404, 2405, 2909, 2061, 2987], 1325)
-    femmesh.addVolume([88, 89, 49, 1006, 259, 230, 260, 1467, 1735, 2686], 1326)
-    femmesh.addVolume([1030, 1081, 997, 1102, 2160, 1935, 1309, 2254, 2970, 2012], 1327)
-    femmesh.addVolume([1053, 1218, 1017, 1219, 2633, 2764, 2763, 2803, 2802, 2988], 1328)
-    femmesh.addVolume([1009, 1011, 1112, 1161, 1455, 1988, 1604, 2265, 2267, 2007], 1329)
-    femmesh.addVolume([628, 606, 605, 1090, 722, 719, 721, 1533, 2989, 2495], 1330)
-    femmesh.addVolume([992, 1011, 1170, 1194, 2460, 2396, 2071, 2072, 2171, 1592], 1331)
-    femmesh.addVolume([135, 139, 1070, 1171, 584, 2449, 2581, 2582, 2273, 1342], 1332)
-    femmesh.addVolume([988, 1012, 1087, 1174, 2008, 1737, 1369, 1372, 2943, 1373], 1333)
-    femmesh.addVolume([4, 636, 611, 1088, 659, 661, 662, 2990, 2991, 2835], 1334)
-    femmesh.addVolume([1017, 998, 1049, 1053, 2992, 2842, 2966, 2763, 2993, 2994], 1335)
-    femmesh.addVolume([107, 173, 1121, 1134, 528, 2995, 2918, 2340, 2996, 2231], 1336)
-    femmesh.addVolume([1001, 1132, 1175, 1202, 1491, 2710, 2997, 2428, 2516, 2712], 1337)
-    femmesh.addVolume([150, 1089, 92, 1182, 2600, 2839, 468, 2599, 2047, 2838], 1338)
-    femmesh.addVolume([999, 1034, 1089, 1209, 2257, 2999, 2998, 3000, 2576, 2448], 1339)
-    femmesh.addVolume([1071, 76, 1148, 1152, 2960, 2961, 2212, 3001, 3002, 2740], 1340)
-    femmesh.addVolume([827, 801, 803, 1187, 907, 904, 906, 1526, 3003, 1527], 1341)
-    femmesh.addVolume([840, 1059, 1211, 1240, 2643, 1981, 1758, 2706, 2708, 3004], 1342)
-    femmesh.addVolume([990, 1086, 1144, 1184, 1304, 1693, 1477, 2596, 2598, 2917], 1343)
-    femmesh.addVolume([1123, 1056, 1131, 1176, 2294, 2303, 3005, 1999, 1548, 1635], 1344)
-    femmesh.addVolume([997, 1034, 1117, 1165, 2346, 2638, 1866, 2014, 2347, 2925], 1345)
-    femmesh.addVolume([1042, 1055, 1000, 1141, 3006, 1983, 2758, 2760, 1987, 1986], 1346)
-    femmesh.addVolume([1020, 1123, 1082, 1188, 1868, 1713, 2353, 3007, 1717, 1716], 1347)
-    femmesh.addVolume([1035, 1182, 92, 1198, 2046, 2838, 3008, 2049, 2051, 2840], 1348)
-    femmesh.addVolume([989, 1156, 1138, 1213, 1646, 1648, 1643, 2044, 2620, 2494], 1349)
-    femmesh.addVolume([619, 1064, 1157, 1164, 1790, 2593, 2308, 2033, 2176, 2821], 1350)
-    femmesh.addVolume([147, 82, 988, 1097, 432, 2527, 2058, 2059, 2528, 1872], 1351)
-    femmesh.addVolume([633, 29, 1146, 1164, 680, 2617, 3009, 2175, 2052, 2438], 1352)
-    femmesh.addVolume([1093, 1160, 987, 1245, 2848, 2829, 1937, 2811, 3010, 2465], 1353)
-    femmesh.addVolume([1012, 990, 1039, 1069, 1303, 1701, 2457, 2858, 2795, 3011], 1354)
-    femmesh.addVolume([1052, 1114, 1084, 1136, 3012, 2562, 1753, 1755, 2187, 1258], 1355)
-    femmesh.addVolume([820, 803, 828, 1188, 916, 911, 918, 2151, 2068, 2150], 1356)
-    femmesh.addVolume([991, 1144, 1070, 1145, 1558, 1957, 1323, 1326, 2556, 1327], 1357)
-    femmesh.addVolume([1037, 1019, 1059, 1184, 1695, 2232, 1979, 2916, 2915, 2944], 1358)
-    femmesh.addVolume([1025, 996, 1140, 1175, 1607, 1378, 1719, 3013, 3014, 3015], 1359)
-    femmesh.addVolume([1009, 1056, 1149, 1217, 1797, 2398, 1286, 2315, 2316, 3016], 1360)
-    femmesh.addVolume([1000, 1018, 1043, 1166, 1837, 2080, 1984, 1838, 1686, 1439], 1361)
-    femmesh.addVolume([820, 1056, 1120, 1131, 2812, 1884, 2755, 2756, 2303, 2304], 1362)
-    femmesh.addVolume([1001, 1175, 1025, 1202, 2997, 3013, 2250, 2428, 2712, 3017], 1363)
-    femmesh.addVolume([987, 1026, 1040, 1161, 1494, 1333, 1366, 1940, 3018, 2732], 1364)
-    femmesh.addVolume([1014, 1163, 1058, 1245, 2816, 1863, 2701, 1747, 3019, 2703], 1365)
-    femmesh.addVolume([1008, 1050, 1090, 1104, 2496, 2209, 2975, 2497, 2392, 2741], 1366)
-    femmesh.addVolume([1095, 987, 1138, 1160, 3020, 1495, 2548, 2849, 2829, 2924], 1367)
-    femmesh.addVolume([810, 811, 1094, 1183, 928, 1271, 1449, 2141, 2143, 3021], 1368)
-    femmesh.addVolume([993, 1044, 1030, 1102, 1919, 2079, 2077, 1655, 2650, 2254], 1369)
-    femmesh.addVolume([13, 1109, 12, 1171, 3022, 1934, 22, 3023, 1509, 1855], 1370)
-    femmesh.addVolume([100, 101, 1002, 1097, 333, 2320, 3024, 3025, 2321, 1948], 1371)
-    femmesh.addVolume([643, 1048, 1064, 1113, 1348, 3026, 1789, 2342, 2344, 2746], 1372)
-    femmesh.addVolume([1014, 1095, 1163, 1245, 2546, 2637, 2816, 1747, 2642, 3019], 1373)
-    femmesh.addVolume([1013, 1193, 1089, 1198, 1360, 3027, 2513, 2667, 2932, 2050], 1374)
-    femmesh.addVolume([149, 1130, 1111, 1227, 3029, 2471, 3028, 3030, 2509, 2508], 1375)
-    femmesh.addVolume([1128, 1052, 1202, 1240, 3031, 2769, 2288, 2440, 2833, 2441], 1376)
-    femmesh.addVolume([156, 89, 157, 1005, 225, 369, 455, 2269, 2418, 2112], 1377)
-    femmesh.addVolume([1032, 1155, 1105, 1221, 2365, 2057, 2088, 2172, 2492, 2537], 1378)
-    femmesh.addVolume([1085, 1107, 1121, 1239, 1339, 1880, 2486, 1969, 2341, 2487], 1379)
-    femmesh.addVolume([807, 1133, 806, 1141, 2096, 2095, 920, 1292, 3032, 1293], 1380)
-    femmesh.addVolume([1008, 1128, 1059, 1162, 2484, 2284, 2500, 2499, 2893, 1381], 1381)
-    femmesh.addVolume([1152, 78, 1200, 1219, 2725, 2727, 1576, 1579, 3033, 1580], 1382)
-    femmesh.addVolume([1025, 1001, 1077, 1175, 2250, 1314, 1923, 3013, 2997, 3034], 1383)
-    femmesh.addVolume([57, 1203, 1003, 1219, 3036, 1952, 3035, 3037, 3038, 3039], 1384)
-    femmesh.addVolume([1023, 1075, 1114, 1197, 2317, 2086, 2563, 1945, 3040, 2564], 1385)
-    femmesh.addVolume([803, 801, 1082, 1187, 904, 1829, 1831, 1527, 3003, 2452], 1386)
-    femmesh.addVolume([1035, 1089, 1156, 1182, 2048, 2459, 1647, 2046, 2047, 2714], 1387)
-    femmesh.addVolume([26, 1062, 1081, 1123, 2647, 2161, 1807, 2387, 1712, 1936], 1388)
-    femmesh.addVolume([38, 37, 806, 1125, 43, 860, 861, 1970, 3041, 3042], 1389)
-    femmesh.addVolume([1013, 999, 1034, 1089, 1358, 2257, 2433, 2513, 2998, 2999], 1390)
-    femmesh.addVolume([1009, 1064, 1091, 1112, 1602, 3043, 2276, 1604, 1606, 2278], 1391)
-    femmesh.addVolume([1036, 1037, 1074, 1189, 1582, 3044, 2196, 3045, 3046, 3047], 1392)
-    femmesh.addVolume([829, 800, 824, 1158, 897, 892, 896, 3048, 3049, 2784], 1393)
-    femmesh.addVolume([1010, 986, 1101, 1140, 1537, 1535, 1536, 2421, 2936, 2773], 1394)
-    femmesh.addVolume([100, 1097, 1002, 1153, 3025, 1948, 3024, 3050, 2865, 1832], 1395)
-    femmesh.addVolume([1071, 992, 1224, 1241, 2369, 1732, 3051, 2574, 2066, 2065], 1396)
-    femmesh.addVolume([123, 121, 1085, 1107, 567, 2792, 1823, 1824, 2791, 1339], 1397)
-    femmesh.addVolume([1000, 1018, 1083, 1213, 1837, 1683, 1260, 1750, 2493, 1751], 1398)
-    femmesh.addVolume([1001, 1214, 1016, 1234, 1416, 1654, 1275, 1317, 1418, 2901], 1399)
-    femmesh.addVolume([8, 1095, 1178, 1238, 3054, 3053, 3052, 2953, 3055, 3056], 1400)
-    femmesh.addVolume([10, 156, 1005, 1143, 216, 2269, 2734, 2735, 2844, 1502], 1401)
-    femmesh.addVolume([1063, 985, 1070, 1168, 2129, 1956, 2128, 2704, 3057, 3058], 1402)
-    femmesh.addVolume([165, 139, 995, 1126, 596, 2272, 1697, 1423, 2271, 1699], 1403)
-    femmesh.addVolume([991, 1019, 1037, 1144, 1401, 1695, 2472, 1558, 1559, 2713], 1404)
-    femmesh.addVolume([155, 1003, 1200, 1219, 3060, 2680, 3059, 3061, 3039, 1580], 1405)
-    femmesh.addVolume([628, 1117, 1090, 1123, 2819, 3062, 1533, 1407, 1869, 1534], 1406)
-    femmesh.addVolume([113, 1083, 111, 1167, 2555, 2753, 538, 1640, 1345, 2754], 1407)
-    femmesh.addVolume([605, 29, 28, 1176, 679, 34, 678, 2533, 2054, 1547], 1408)
-    femmesh.addVolume([88, 1142, 1214, 1234, 1468, 1470, 1469, 3063, 2149, 1418], 1409)
-    femmesh.addVolume([993, 1089, 1102, 1198, 2514, 2446, 1655, 1657, 2050, 1656], 1410)
-    femmesh.addVolume([1009, 1040, 1188, 1217, 2820, 2245, 1799, 2315, 3064, 2153], 1411)
-    femmesh.addVolume([1017, 1071, 1224, 1241, 3066, 3051, 3065, 2968, 2574, 2065], 1412)
-    femmesh.addVolume([1044, 1034, 1081, 1102, 2422, 2423, 2424, 2650, 2345, 2970], 1413)
-    femmesh.addVolume([76, 1071, 1151, 1152, 2960, 3068, 3067, 3002, 3001, 2540], 1414)
-    femmesh.addVolume([179, 107, 1129, 1134, 530, 2339, 3069, 3070, 2340, 1299], 1415)
-    femmesh.addVolume([829, 819, 833, 1104, 970, 967, 899, 3071, 1458, 2648], 1416)
-    femmesh.addVolume([1093, 983, 1161, 1201, 1899, 2164, 1942, 2461, 2580, 2123], 1417)
-    femmesh.addVolume([1008, 1059, 1038, 1173, 2500, 2268, 1463, 2976, 1384, 2186], 1418)
-    femmesh.addVolume([1003, 1203, 1027, 1219, 1952, 3072, 2883, 3039, 3038, 2801], 1419)
-    femmesh.addVolume([820, 814, 1120, 1149, 957, 2445, 2755, 2813, 2062, 2397], 1420)
-    femmesh.addVolume([54, 1080, 55, 1111, 3073, 2947, 287, 3074, 2913, 2946], 1421)
-    femmesh.addVolume([996, 1025, 1077, 1175, 1607, 1923, 1843, 3014, 3013, 3034], 1422)
-    femmesh.addVolume([1008, 1038, 1059, 1140, 1463, 2268, 2500, 1377, 2063, 2501], 1423)
-    femmesh.addVolume([604, 1119, 603, 1246, 2476, 1850, 705, 1482, 3075, 1483], 1424)
-    femmesh.addVolume([134, 1070, 1126, 1177, 3077, 2450, 3076, 3078, 3079, 2895], 1425)
-    femmesh.addVolume([814, 832, 1120, 1196, 952, 1637, 2445, 2639, 2469, 1930], 1426)
-    femmesh.addVolume([1024, 1050, 1146, 1173, 1452, 2437, 2181, 1383, 1453, 2185], 1427)
-    femmesh.addVolume([170, 1083, 112, 1182, 1973, 3080, 542, 2223, 2224, 3081], 1428)
-    femmesh.addVolume([169, 175, 1057, 1235, 527, 3083, 3082, 3084, 3085, 1916], 1429)
-    femmesh.addVolume([26, 629, 27, 1123, 668, 669, 32, 2387, 1409, 2293], 1430)
-    femmesh.addVolume([1056, 1123, 1131, 1188, 2294, 3005, 2303, 1798, 1717, 2069], 1431)
-    femmesh.addVolume([175, 106, 1057, 1132, 524, 3086, 3083, 2554, 3087, 2299], 1432)
-    femmesh.addVolume([168, 109, 1105, 1204, 348, 2775, 2695, 2697, 2776, 2109], 1433)
-    femmesh.addVolume([1019, 1092, 1052, 1114, 1412, 2832, 2768, 1410, 1411, 3012], 1434)
-    femmesh.addVolume([76, 1151, 1071, 1207, 3067, 3068, 2960, 3088, 2608, 2595], 1435)
-    femmesh.addVolume([1008, 1104, 1025, 1128, 2497, 2566, 1718, 2484, 2892, 2483], 1436)
-    femmesh.addVolume([989, 8, 1178, 1238, 2952, 3052, 2144, 1976, 2953, 3056], 1437)
-    femmesh.addVolume([1065, 1064, 1120, 1149, 1603, 1928, 2261, 1287, 1962, 2397], 1438)
-    femmesh.addVolume([624, 637, 623, 1223, 783, 784, 766, 3089, 2971, 3090], 1439)
-    femmesh.addVolume([642, 1119, 3, 1169, 1851, 2676, 655, 1540, 3091, 2324], 1440)
-    femmesh.addVolume([1064, 1056, 1149, 1157, 2705, 2398, 1962, 2593, 2307, 3092], 1441)
-    femmesh.addVolume([611, 636, 626, 1088, 661, 742, 739, 2835, 2991, 2834], 1442)
-    femmesh.addVolume([833, 1128, 1104, 1162, 3093, 2892, 2648, 1773, 2893, 2498], 1443)
-    femmesh.addVolume([813, 838, 832, 1208, 954, 955, 951, 3094, 2586, 2673], 1444)
-    femmesh.addVolume([798, 1114, 40, 1197, 2615, 2087, 877, 3095, 2564, 3096], 1445)
-    femmesh.addVolume([834, 1162, 1099, 1211, 1756, 2019, 1442, 1760, 1759, 2093], 1446)
-    femmesh.addVolume([112, 1083, 111, 1182, 3080, 2753, 540, 3081, 2224, 3097], 1447)
-    femmesh.addVolume([172, 1153, 98, 1193, 1280, 3098, 492, 1570, 1571, 3099], 1448)
-    femmesh.addVolume([162, 1058, 163, 1093, 2550, 2348, 388, 2549, 1898, 2349], 1449)
-    femmesh.addVolume([62, 1103, 68, 1163, 2414, 3100, 224, 2416, 2417, 3101], 1450)
-    femmesh.addVolume([1051, 995, 1105, 1229, 1666, 1698, 2364, 2923, 2368, 2076], 1451)
-    femmesh.addVolume([1020, 1082, 997, 1165, 2353, 1518, 1865, 2757, 2451, 2014], 1452)
-    femmesh.addVolume([984, 1156, 1165, 1209, 1765, 2015, 2206, 1768, 1770, 2363], 1453)
-    femmesh.addVolume([820, 1056, 1131, 1188, 2812, 2303, 2756, 2151, 1798, 2069], 1454)
-    femmesh.addVolume([987, 1095, 1138, 1245, 3020, 2548, 1495, 2465, 2642, 1749], 1455)
-    femmesh.addVolume([1009, 1040, 1073, 1237, 2820, 2799, 1283, 2281, 1367, 2800], 1456)
-    femmesh.addVolume([1040, 1026, 1073, 1161, 1333, 3102, 2799, 2732, 3018, 2266], 1457)
-    femmesh.addVolume([621, 616, 620, 1110, 762, 746, 699, 3103, 2718, 2719], 1458)
-    femmesh.addVolume([1049, 1139, 1017, 1150, 2743, 2967, 2966, 3104, 2572, 3105], 1459)
-    femmesh.addVolume([999, 1021, 1034, 1209, 2623, 2624, 2257, 3000, 3106, 2576], 1460)
-    femmesh.addVolume([990, 1146, 1024, 1199, 2179, 2181, 1887, 1395, 2188, 2295], 1461)
-    femmesh.addVolume([837, 836, 41, 1222, 885, 884, 842, 2478, 2480, 3107], 1462)
-    femmesh.addVolume([153, 1215, 1111, 1218, 3109, 3108, 2125, 2126, 1589, 2127], 1463)
-    femmesh.addVolume([167, 133, 1063, 1145, 252, 2786, 3110, 3111, 2788, 2787], 1464)
-    femmesh.addVolume([39, 816, 38, 1115, 869, 868, 44, 3112, 2853, 2852], 1465)
-    femmesh.addVolume([168, 109, 60, 1105, 348, 346, 343, 2695, 2775, 1433], 1466)
-    femmesh.addVolume([992, 1065, 1064, 1199, 2183, 1603, 2184, 2116, 2297, 2296], 1467)
-    femmesh.addVolume([1003, 1049, 998, 1219, 3114, 2842, 3113, 3039, 3115, 1578], 1468)
-    femmesh.addVolume([113, 111, 1083, 1182, 538, 2753, 2555, 1619, 3097, 2224], 1469)
-    femmesh.addVolume([986, 1184, 1140, 1216, 2937, 2938, 2936, 1914, 3116, 3117], 1470)
-    femmesh.addVolume([990, 1144, 1037, 1184, 1477, 2713, 1583, 2596, 2917, 2916], 1471)
-    femmesh.addVolume([1022, 993, 1030, 1127, 1266, 2077, 2078, 2522, 2890, 2512], 1472)
-    femmesh.addVolume([145, 79, 1177, 1207, 421, 2214, 2359, 2360, 2594, 2361], 1473)
-    femmesh.addVolume([76, 1071, 79, 1207, 2960, 2213, 405, 3088, 2595, 2594], 1474)
-    femmesh.addVolume([1106, 1046, 1190, 1223, 3119, 3118, 2693, 3120, 2899, 3121], 1475)
-    femmesh.addVolume([147, 82, 148, 988, 432, 394, 439, 2058, 2527, 1370], 1476)
-    femmesh.addVolume([1153, 1029, 1190, 1220, 2621, 2622, 2552, 3122, 3123, 3124], 1477)
-    femmesh.addVolume([1034, 997, 1081, 1102, 2346, 1935, 2423, 2345, 2012, 2970], 1478)
-    femmesh.addVolume([1001, 1132, 1077, 1175, 1491, 1493, 1314, 2997, 2710, 3034], 1479)
-    femmesh.addVolume([983, 1093, 1161, 1244, 1899, 1942, 2164, 2978, 2979, 3125], 1480)
-    femmesh.addVolume([1054, 985, 1071, 1177, 2332, 2370, 2570, 2358, 3126, 2215], 1481)
-    femmesh.addVolume([1029, 1097, 1047, 1137, 2227, 2805, 3127, 2228, 1819, 2806], 1482)
-    femmesh.addVolume([984, 1107, 1166, 1167, 3128, 1846, 1685, 1641, 2105, 2106], 1483)
-    femmesh.addVolume([985, 1063, 1147, 1168, 2129, 1330, 1676, 3057, 2704, 2246], 1484)
-    femmesh.addVolume([1062, 1123, 1056, 1188, 1712, 2294, 1795, 1715, 1717, 1798], 1485)
-    femmesh.addVolume([166, 165, 995, 1229, 597, 1697, 2689, 2723, 2367, 2368], 1486)
-    femmesh.addVolume([54, 1080, 1111, 1215, 3073, 2913, 3074, 3129, 3130, 3108], 1487)
-    femmesh.addVolume([647, 602, 639, 1150, 706, 696, 708, 2571, 2573, 3131], 1488)
-    femmesh.addVolume([8, 181, 170, 989, 211, 213, 204, 2952, 2626, 1974], 1489)
-    femmesh.addVolume([1014, 1155, 1058, 1163, 2026, 2056, 2701, 2816, 2817, 1863], 1490)
-    femmesh.addVolume([1018, 1033, 1042, 1192, 2481, 2233, 2759, 2964, 2300, 2302], 1491)
-    femmesh.addVolume([9, 181, 1178, 1191, 210, 2627, 1629, 1762, 2628, 1763], 1492)
-    femmesh.addVolume([1033, 989, 1138, 1213, 1599, 1643, 1551, 2045, 2044, 2494], 1493)
-    femmesh.addVolume([103, 1121, 104, 1132, 3132, 2337, 504, 3133, 2229, 1492], 1494)
-    femmesh.addVolume([985, 1148, 1147, 1241, 3134, 1813, 1676, 2504, 2955, 3135], 1495)
-    femmesh.addVolume([1026, 1011, 1073, 1161, 3136, 1456, 3102, 3018, 2267, 2266], 1496)
-    femmesh.addVolume([1010, 1061, 1137, 1223, 2420, 2794, 1817, 2898, 2900, 3137], 1497)
-    femmesh.addVolume([1069, 1038, 1101, 1184, 2796, 2771, 2859, 2798, 2797, 2597], 1498)
-    femmesh.addVolume([1124, 1027, 1203, 1219, 3138, 3072, 2985, 3139, 2801, 3038], 1499)
-    femmesh.addVolume([26, 27, 1062, 1123, 32, 2645, 2647, 2387, 2293, 1712], 1500)
-    femmesh.addVolume([127, 1167, 1107, 1210, 2698, 2105, 3140, 2699, 1642, 1733], 1501)
-    femmesh.addVolume([119, 56, 994, 1130, 316, 2927, 2823, 2824, 2926, 1504], 1502)
-    femmesh.addVolume([113, 127, 118, 1210, 547, 548, 546, 1622, 2699, 3141], 1503)
-    femmesh.addVolume([1023, 995, 1051, 1116, 2016, 1666, 2432, 1487, 2690, 2442], 1504)
-    femmesh.addVolume([1107, 984, 1166, 1239, 3128, 1685, 1846, 2341, 3142, 2386], 1505)
-    femmesh.addVolume([1073, 1011, 1094, 1096, 1456, 3143, 1624, 1828, 2394, 1320], 1506)
-    femmesh.addVolume([118, 150, 113, 1210, 549, 545, 546, 3141, 2601, 1622], 1507)
-    femmesh.addVolume([633, 1146, 1113, 1164, 3009, 2190, 2589, 2175, 2438, 3144], 1508)
-    femmesh.addVolume([54, 1111, 55, 1227, 3074, 2946, 287, 3145, 2508, 2949], 1509)
-    femmesh.addVolume([841, 840, 5, 1240, 850, 849, 845, 1497, 2706, 3146], 1510)
-    femmesh.addVolume([1032, 1154, 1094, 1212, 3148, 1876, 3147, 2023, 2329, 2098], 1511)
-    femmesh.addVolume([110, 145, 144, 1054, 483, 422, 536, 1839, 2357, 2382], 1512)
-    femmesh.addVolume([990, 1069, 1101, 1184, 2795, 2859, 1514, 2596, 2798, 2597], 1513)
-    femmesh.addVolume([813, 812, 818, 1096, 946, 935, 949, 2807, 1826, 1355], 1514)
-    femmesh.addVolume([819, 829, 826, 1104, 970, 971, 968, 1458, 3071, 1612], 1515)
-    femmesh.addVolume([1034, 1013, 1089, 1102, 2433, 2513, 2999, 2345, 2515, 2446], 1516)
-    femmesh.addVolume([1092, 1059, 1128, 1240, 1978, 2284, 2285, 2439, 2708, 2440], 1517)
-    femmesh.addVolume([986, 1134, 1121, 1233, 1298, 2231, 2230, 3149, 3150, 2851], 1518)
-    femmesh.addVolume([1036, 1096, 1074, 1170, 2194, 2195, 2196, 1601, 2385, 3151], 1519)
-    femmesh.addVolume([1024, 1064, 1113, 1164, 1926, 2746, 2747, 2372, 2176, 3144], 1520)
-    femmesh.addVolume([605, 1090, 606, 1185, 2495, 2989, 719, 2262, 3152, 2263], 1521)
-    femmesh.addVolume([67, 157, 1142, 1191, 366, 2111, 1262, 1523, 2113, 1524], 1522)
-    femmesh.addVolume([1086, 1057, 1145, 1216, 3153, 1479, 2335, 1961, 1913, 2336], 1523)
-    femmesh.addVolume([97, 1153, 1002, 1236, 3155, 1832, 3154, 3156, 1836, 1835], 1524)
-    femmesh.addVolume([1023, 1122, 1075, 1197, 2523, 2716, 2317, 1945, 3157, 3040], 1525)
-    femmesh.addVolume([629, 625, 628, 1117, 789, 790, 788, 1905, 2506, 2819], 1526)
-    femmesh.addVolume([1005, 1041, 1042, 1125, 1351, 3158, 2234, 1792, 2945, 2235], 1527)
-    femmesh.addVolume([144, 165, 110, 1126, 537, 533, 536, 2383, 1423, 2034], 1528)
-    femmesh.addVolume([138, 1085, 1121, 1134, 3160, 2486, 3159, 3161, 3162, 2231], 1529)
-    femmesh.addVolume([983, 1007, 1201, 1224, 2163, 2121, 2580, 2730, 2737, 3163], 1530)
-    femmesh.addVolume([988, 1060, 1010, 1101, 2210, 1816, 1847, 1848, 3164, 1536], 1531)
-    femmesh.addVolume([1018, 1082, 1098, 1187, 2135, 1521, 1678, 2453, 2452, 3165], 1532)
-    femmesh.addVolume([1043, 1018, 1165, 1166, 2080, 2205, 3166, 1439, 1686, 2207], 1533)
-    femmesh.addVolume([87, 1095, 1163, 1178, 3168, 2637, 3167, 3169, 3053, 3170], 1534)
-    femmesh.addVolume([8, 181, 989, 1178, 211, 2626, 2952, 3052, 2627, 2144], 1535)
-    femmesh.addVolume([1032, 1170, 1011, 1194, 1474, 2396, 2170, 1590, 1592, 2171], 1536)
-    femmesh.addVolume([71, 1093, 1080, 1201, 3172, 2462, 3171, 3173, 2461, 3174], 1537)
-    femmesh.addVolume([139, 166, 995, 1171, 594, 2689, 2272, 2273, 2692, 2017], 1538)
-    femmesh.addVolume([1018, 1118, 1042, 1141, 2962, 2963, 2759, 2081, 3175, 2760], 1539)
-    femmesh.addVolume([997, 1018, 1156, 1165, 1677, 2031, 2011, 2014, 2205, 2015], 1540)
-    femmesh.addVolume([62, 61, 1004, 1163, 340, 3176, 2415, 2416, 3177, 1864], 1541)
-    femmesh.addVolume([1001, 1025, 1052, 1202, 2250, 2249, 1754, 2428, 3017, 2769], 1542)
-    femmesh.addVolume([1071, 1054, 1177, 1207, 2570, 2358, 2215, 2595, 2362, 2361], 1543)
-    femmesh.addVolume([1022, 1045, 994, 1078, 1269, 1268, 1267, 3178, 3179, 3180], 1544)
-    femmesh.addVolume([1057, 986, 1132, 1216, 1915, 1295, 2299, 1913, 1914, 2518], 1545)
-    femmesh.addVolume([822, 811, 1067, 1154, 945, 1783, 1782, 3181, 1874, 2221], 1546)
-    femmesh.addVolume([60, 62, 1004, 1229, 339, 2415, 1432, 2074, 2738, 2075], 1547)
-    femmesh.addVolume([170, 1182, 171, 1238, 2223, 2868, 207, 1975, 2225, 2870], 1548)
-    femmesh.addVolume([995, 1116, 1023, 1171, 2690, 1487, 2016, 2017, 1489, 1488], 1549)
-    femmesh.addVolume([82, 74, 988, 1225, 393, 2082, 2527, 2850, 2084, 2009], 1550)
-    femmesh.addVolume([1027, 994, 1124, 1203, 3182, 1990, 3138, 3072, 2983, 2985], 1551)
-    femmesh.addVolume([145, 144, 1054, 1177, 422, 2382, 2357, 2359, 2894, 2358], 1552)
-    femmesh.addVolume([15, 1057, 14, 1145, 3183, 1386, 24, 3184, 1479, 1478], 1553)
-    femmesh.addVolume([165, 109, 1105, 1229, 534, 2775, 1420, 2367, 3185, 2076], 1554)
-    femmesh.addVolume([604, 1139, 1119, 1246, 1362, 3186, 2476, 1482, 1745, 3075], 1555)
-    femmesh.addVolume([1010, 1029, 1046, 1223, 2226, 3187, 2419, 2898, 3188, 2899], 1556)
-    femmesh.addVolume([1165, 1209, 1021, 1239, 2363, 3106, 2655, 3189, 3190, 3191], 1557)
-    femmesh.addVolume([1020, 1131, 1123, 1188, 1633, 3005, 1868, 3007, 2069, 1717], 1558)
-    femmesh.addVolume([986, 1101, 1184, 1216, 1535, 2597, 2937, 1914, 3192, 3116], 1559)
-    femmesh.addVolume([1029, 1097, 1010, 1220, 2227, 1814, 2226, 3123, 1873, 2334], 1560)
-    femmesh.addVolume([603, 1119, 1100, 1246, 1850, 3193, 2310, 1483, 3075, 3194], 1561)
-    femmesh.addVolume([150, 116, 1089, 1210, 473, 3195, 2600, 2601, 3196, 2602], 1562)
-    femmesh.addVolume([1080, 1093, 1127, 1201, 2462, 1938, 2464, 3174, 2461, 2122], 1563)
-    femmesh.addVolume([60, 1004, 61, 1163, 1432, 3176, 341, 1862, 1864, 3177], 1564)
-    femmesh.addVolume([3, 644, 1069, 1119, 651, 2133, 2132, 2676, 2677, 3197], 1565)
-    femmesh.addVolume([834, 832, 839, 1099, 974, 979, 978, 1442, 1444, 3198], 1566)
-    femmesh.addVolume([1105, 1054, 1194, 1221, 1419, 1591, 2182, 2537, 3199, 2173], 1567)
-    femmesh.addVolume([622, 627, 1066, 1230, 779, 2525, 2524, 2488, 2761, 3200], 1568)
-    femmesh.addVolume([614, 1072, 623, 1179, 2117, 2119, 757, 2610, 2402, 2611], 1569)
-    femmesh.addVolume([1127, 1227, 993, 1231, 3201, 2507, 2890, 2831, 2752, 1658], 1570)
-    femmesh.addVolume([1061, 1010, 1101, 1140, 2420, 1536, 2772, 2305, 2421, 2773], 1571)
-    femmesh.addVolume([998, 1174, 1049, 1200, 2905, 3202, 2842, 1575, 1995, 3203], 1572)
-    femmesh.addVolume([801, 802, 1082, 1098, 902, 1830, 1829, 3204, 3205, 1521], 1573)
-    femmesh.addVolume([174, 1087, 84, 1200, 3206, 1820, 448, 3207, 1996, 2038], 1574)
-    femmesh.addVolume([833, 829, 1104, 1128, 899, 3071, 2648, 3093, 3208, 2892], 1575)
-    femmesh.addVolume([989, 1083, 1156, 1213, 1775, 1776, 1646, 2044, 1751, 2620], 1576)
-    femmesh.addVolume([1031, 1112, 1091, 1224, 2003, 2278, 2275, 2861, 1731, 3209], 1577)
-    femmesh.addVolume([1148, 1071, 1152, 1241, 2212, 3001, 2740, 2955, 2574, 2956], 1578)
-    femmesh.addVolume([985, 1147, 1039, 1241, 1676, 1700, 2114, 2504, 3135, 2505], 1579)
-    femmesh.addVolume([1018, 1043, 1118, 1141, 2080, 3210, 2962, 2081, 1985, 3175], 1580)
-    femmesh.addVolume([638, 631, 1100, 1137, 712, 2309, 2311, 2167, 2166, 2406], 1581)
-    femmesh.addVolume([12, 1006, 11, 1116, 1853, 2957, 21, 1854, 1486, 2958], 1582)
-    femmesh.addVolume([3, 30, 609, 1169, 36, 649, 648, 2324, 2039, 1740], 1583)
-    femmesh.addVolume([607, 610, 609, 1185, 725, 729, 690, 2264, 3211, 2837], 1584)
-    femmesh.addVolume([1020, 1082, 1131, 1188, 2353, 2067, 1633, 3007, 1716, 2069], 1585)
-    femmesh.addVolume([986, 1010, 1134, 1233, 1537, 2333, 1298, 3149, 2588, 3150], 1586)
-    femmesh.addVolume([14, 1109, 13, 1171, 1389, 3022, 23, 1704, 1509, 3023], 1587)
-    femmesh.addVolume([983, 1071, 1194, 1224, 3212, 2371, 2729, 2730, 3051, 2731], 1588)
-    femmesh.addVolume([153, 128, 1215, 1218, 580, 2603, 3109, 2126, 2605, 1589], 1589)
-    femmesh.addVolume([821, 819, 820, 1131, 965, 914, 956, 2389, 1459, 2756], 1590)
-    femmesh.addVolume([638, 603, 1060, 1100, 711, 1247, 1249, 2311, 2310, 2405], 1591)
-    femmesh.addVolume([159, 1087, 114, 1168, 2658, 2874, 450, 2660, 2247, 2876], 1592)
-    femmesh.addVolume([983, 1151, 1071, 1224, 2607, 3068, 3212, 2730, 3213, 3051], 1593)
-    femmesh.addVolume([1097, 1029, 1153, 1220, 2227, 2621, 2865, 1873, 3123, 3122], 1594)
-    femmesh.addVolume([38, 39, 1115, 1125, 44, 3112, 2852, 1970, 1972, 3214], 1595)
-    femmesh.addVolume([1002, 1003, 1047, 1097, 1950, 2885, 2884, 1948, 1949, 2805], 1596)
-    femmesh.addVolume([109, 60, 1105, 1229, 346, 1433, 2775, 3185, 2074, 2076], 1597)
-    femmesh.addVolume([93, 162, 51, 1201, 280, 278, 275, 2777, 2778, 2911], 1598)
-    femmesh.addVolume([1001, 1057, 1132, 1216, 1689, 2299, 1491, 2429, 1913, 2518], 1599)
-    femmesh.addVolume([1069, 30, 1169, 1173, 2134, 2039, 3215, 2933, 2042, 2041], 1600)
-    femmesh.addVolume([835, 828, 802, 1186, 913, 912, 857, 3216, 2940, 2941], 1601)
-    femmesh.addVolume([57, 1003, 155, 1219, 3035, 3060, 321, 3037, 3039, 3061], 1602)
-    femmesh.addVolume([1035, 1198, 1227, 1231, 2049, 2751, 3217, 2530, 1659, 2752], 1603)
-    femmesh.addVolume([998, 1147, 1148, 1241, 1809, 1813, 1812, 2954, 3135, 2955], 1604)
-    femmesh.addVolume([1046, 996, 1190, 1233, 1375, 1966, 3118, 2312, 2148, 2147], 1605)
-    femmesh.addVolume([1027, 1053, 1078, 1228, 2632, 2630, 2631, 3218, 3219, 3220], 1606)
-    femmesh.addVolume([1007, 1111, 1127, 1215, 2520, 2521, 2120, 1585, 3108, 3221], 1607)
-    femmesh.addVolume([101, 58, 1002, 1203, 327, 3222, 2320, 2322, 3223, 1951], 1608)
-    femmesh.addVolume([816, 815, 1154, 1212, 944, 1875, 3224, 2863, 2099, 2329], 1609)
-    femmesh.addVolume([100, 1097, 1153, 1220, 3025, 2865, 3050, 3225, 1873, 3122], 1610)
-    femmesh.addVolume([89, 49, 1006, 1143, 230, 2686, 1735, 1736, 3226, 1501], 1611)
-    femmesh.addVolume([97, 1193, 1153, 1236, 3227, 1571, 3155, 3156, 1944, 1836], 1612)
-    femmesh.addVolume([807, 799, 1055, 1159, 893, 3229, 3228, 1617, 1616, 2889], 1613)
-    femmesh.addVolume([69, 1080, 1093, 1160, 3231, 2462, 3230, 3232, 2935, 2848], 1614)
-    femmesh.addVolume([149, 1198, 1130, 1227, 3233, 2666, 3029, 3030, 2751, 2509], 1615)
-    femmesh.addVolume([166, 160, 1116, 1171, 426, 2921, 2691, 2692, 2922, 1489], 1616)
-    femmesh.addVolume([173, 138, 1121, 1134, 529, 3159, 2995, 2996, 3161, 2231], 1617)
-    femmesh.addVolume([1031, 1091, 1066, 1224, 2275, 3235, 3234, 2861, 3209, 3236], 1618)
-    femmesh.addVolume([991, 1023, 1075, 1136, 1593, 2317, 2473, 1403, 1897, 1908], 1619)
-    femmesh.addVolume([1095, 1058, 1163, 1245, 2352, 1863, 2637, 2642, 2703, 3019], 1620)
-    femmesh.addVolume([1015, 991, 1037, 1144, 1399, 2472, 1581, 1427, 1558, 2713], 1621)
-    femmesh.addVolume([137, 1085, 1134, 1220, 3238, 3162, 3237, 3239, 3240, 1861], 1622)
-    femmesh.addVolume([62, 1116, 80, 1143, 2542, 3241, 231, 2543, 2240, 3242], 1623)
-    femmesh.addVolume([1063, 1070, 1144, 1145, 2128, 1957, 1652, 2787, 1327, 2556], 1624)
-    femmesh.addVolume([74, 148, 82, 988, 395, 394, 393, 2082, 1370, 2527], 1625)
-    femmesh.addVolume([983, 1204, 1058, 1221, 1902, 1901, 1900, 3243, 3244, 3245], 1626)
-    femmesh.addVolume([636, 618, 617, 1079, 670, 767, 769, 3246, 3247, 3248], 1627)
-    femmesh.addVolume([1002, 1047, 1029, 1097, 2884, 3127, 2864, 1948, 2805, 2227], 1628)
-    femmesh.addVolume([814, 1149, 1065, 1196, 2062, 1287, 2569, 2639, 3249, 1805], 1629)
-    femmesh.addVolume([1099, 1024, 1120, 1196, 1889, 1927, 1638, 2470, 1803, 1930], 1630)
-    femmesh.addVolume([1102, 1035, 1138, 1231, 2458, 1644, 2649, 1660, 2530, 2403], 1631)
-    femmesh.addVolume([1035, 1102, 1138, 1156, 2458, 2649, 1644, 1647, 1766, 1648], 1632)
-    femmesh.addVolume([602, 601, 639, 1246, 692, 695, 696, 1484, 3250, 3251], 1633)
-    femmesh.addVolume([179, 107, 175, 1129, 530, 525, 531, 3069, 2339, 2553], 1634)
-    femmesh.addVolume([633, 1113, 1064, 1164, 2589, 2746, 1788, 2175, 3144, 2176], 1635)
-    femmesh.addVolume([1029, 1190, 1046, 1223, 2622, 3118, 3187, 3188, 3121, 2899], 1636)
-    femmesh.addVolume([1011, 1194, 1112, 1221, 2171, 2728, 1988, 2174, 2173, 3252], 1637)
-    femmesh.addVolume([802, 1082, 1186, 1188, 1830, 3253, 2941, 2618, 1716, 2942], 1638)
-    femmesh.addVolume([139, 134, 1070, 1126, 585, 3077, 2449, 2271, 3076, 2450], 1639)
-    femmesh.addVolume([830, 806, 808, 1192, 921, 864, 923, 1893, 1895, 3254], 1640)
-    femmesh.addVolume([70, 69, 1093, 1160, 381, 3230, 2846, 2847, 3232, 2848], 1641)
-    femmesh.addVolume([26, 1062, 618, 1243, 2647, 2646, 666, 2651, 3255, 3256], 1642)
-    femmesh.addVolume([1165, 1021, 1166, 1239, 2655, 2654, 2207, 3189, 3191, 2386], 1643)
-    femmesh.addVolume([70, 1095, 73, 1160, 2845, 3257, 382, 2847, 2849, 3258], 1644)
-    femmesh.addVolume([1027, 994, 1045, 1078, 3182, 1268, 3259, 2631, 3180, 3179], 1645)
-    femmesh.addVolume([642, 604, 644, 1119, 709, 717, 656, 1851, 2476, 2677], 1646)
-    femmesh.addVolume([1004, 1116, 1051, 1229, 2237, 2442, 2412, 2075, 2724, 2923], 1647)
-    femmesh.addVolume([81, 83, 1097, 1220, 428, 1871, 3260, 3261, 1860, 1873], 1648)
-    femmesh.addVolume([1082, 1020, 1131, 1187, 2353, 1633, 2067, 2452, 2503, 1528], 1649)
-    femmesh.addVolume([48, 12, 1109, 1214, 232, 1934, 3262, 3263, 2474, 2475], 1650)
-    femmesh.addVolume([1128, 1025, 1140, 1202, 2483, 1719, 2485, 2288, 3017, 2939], 1651)
-    femmesh.addVolume([831, 810, 1073, 1217, 940, 1291, 1290, 2767, 2766, 3264], 1652)
-    femmesh.addVolume([87, 1095, 163, 1163, 3168, 2350, 387, 3167, 2637, 2636], 1653)
-    femmesh.addVolume([90, 1160, 1035, 1227, 3267, 3266, 3265, 3268, 3269, 3217], 1654)
-    femmesh.addVolume([90, 1035, 1198, 1227, 3265, 2049, 3270, 3268, 3217, 2751], 1655)
-    femmesh.addVolume([998, 1049, 1003, 1200, 2842, 3114, 3113, 1575, 3203, 2680], 1656)
-    femmesh.addVolume([1039, 1199, 1113, 1242, 1702, 2189, 3271, 3272, 2193, 2192], 1657)
-    femmesh.addVolume([1001, 1052, 1136, 1202, 1754, 1755, 1276, 2428, 2769, 1568], 1658)
-    femmesh.addVolume([996, 1140, 1175, 1233, 1378, 3015, 3014, 2148, 2313, 3273], 1659)
-    femmesh.addVolume([830, 1118, 1141, 1192, 3274, 3175, 1294, 1893, 2965, 1894], 1660)
-    femmesh.addVolume([1101, 1086, 1129, 1225, 1516, 2614, 1539, 1725, 1724, 2536], 1661)
-    femmesh.addVolume([100, 1002, 97, 1153, 3024, 3154, 332, 3050, 1832, 3155], 1662)
-    femmesh.addVolume([624, 631, 1137, 1180, 777, 2166, 2165, 1709, 3275, 3276], 1663)
-    femmesh.addVolume([641, 625, 623, 1106, 786, 759, 785, 3277, 3278, 3279], 1664)
-    femmesh.addVolume([814, 1120, 1149, 1196, 2445, 2397, 2062, 2639, 1930, 3249], 1665)
-    femmesh.addVolume([38, 822, 1068, 1115, 863, 2468, 2467, 2852, 2854, 2980], 1666)
-    femmesh.addVolume([8, 87, 1095, 1238, 202, 3168, 3054, 2953, 3280, 3055], 1667)
-    femmesh.addVolume([140, 177, 1085, 1153, 501, 2139, 3281, 3282, 2140, 1282], 1668)
-    femmesh.addVolume([992, 1048, 1064, 1112, 1727, 3026, 2184, 1728, 1729, 1606], 1669)
-    femmesh.addVolume([1071, 1017, 1152, 1241, 3066, 3283, 3001, 2574, 2968, 2956], 1670)
-    femmesh.addVolume([1043, 1104, 1158, 1172, 3284, 2591, 2029, 1610, 2568, 2393], 1671)
-    femmesh.addVolume([161, 111, 67, 1167, 378, 377, 370, 3285, 2754, 1344], 1672)
-    femmesh.addVolume([626, 1078, 1088, 1230, 2325, 3286, 2834, 2490, 2489, 3287], 1673)
-    femmesh.addVolume([1021, 1172, 1166, 1239, 2656, 2482, 2654, 3191, 3288, 2386], 1674)
-    femmesh.addVolume([50, 1151, 1201, 1215, 3290, 2606, 3289, 3291, 1584, 3292], 1675)
-    femmesh.addVolume([798, 40, 804, 1197, 877, 872, 880, 3095, 3096, 3293], 1676)
-    femmesh.addVolume([804, 39, 805, 1197, 873, 867, 875, 3293, 2902, 2904], 1677)
-    femmesh.addVolume([138, 1085, 121, 1121, 3160, 2792, 513, 3159, 2486, 2793], 1678)
-    femmesh.addVolume([1130, 994, 1226, 1236, 1504, 1779, 2587, 2930, 2929, 3294], 1679)
-    femmesh.addVolume([1022, 994, 1111, 1218, 1267, 1785, 1787, 2896, 1993, 2127], 1680)
-    femmesh.addVolume([37, 6, 808, 1192, 42, 852, 851, 3295, 3296, 3254], 1681)
-    femmesh.addVolume([830, 808, 825, 1118, 923, 909, 926, 3274, 3297, 3298], 1682)
-    femmesh.addVolume([620, 622, 639, 1228, 747, 776, 702, 3299, 3300, 3301], 1683)
-    femmesh.addVolume([642, 638, 1060, 1169, 713, 1249, 1248, 1540, 1542, 3302], 1684)
-    femmesh.addVolume([1089, 1034, 1102, 1209, 2999, 2345, 2446, 2448, 2576, 1769], 1685)
-    femmesh.addVolume([1125, 806, 1141, 1192, 3042, 1293, 3303, 2301, 1895, 1894], 1686)
-    femmesh.addVolume([1022, 1030, 1031, 1127, 2078, 2379, 2380, 2522, 2512, 2314], 1687)
-    femmesh.addVolume([1017, 1078, 1066, 1218, 2762, 3305, 3304, 2764, 2635, 3306], 1688)
-    femmesh.addVolume([1071, 1152, 1017, 1224, 3001, 3283, 3066, 3051, 3307, 3065], 1689)
-    femmesh.addVolume([5, 841, 1092, 1222, 845, 3309, 3308, 3310, 3311, 1414], 1690)
-    femmesh.addVolume([124, 128, 1124, 1215, 579, 2604, 2872, 2867, 2603, 1720], 1691)
-    femmesh.addVolume([155, 1200, 78, 1219, 3059, 2727, 417, 3061, 1580, 3033], 1692)
-    femmesh.addVolume([140, 1153, 1085, 1220, 3282, 1282, 3281, 3312, 3122, 3240], 1693)
-    femmesh.addVolume([1039, 998, 1049, 1241, 2843, 2842, 2683, 2505, 2954, 2744], 1694)
-    femmesh.addVolume([1078, 626, 1088, 1232, 2325, 2834, 3286, 2477, 1772, 2836], 1695)
-    femmesh.addVolume([1024, 1113, 1146, 1164, 2747, 2190, 2181, 2372, 3144, 2438], 1696)
-    femmesh.addVolume([607, 29, 605, 1173, 685, 679, 688, 2502, 2377, 2531], 1697)
-    femmesh.addVolume([994, 1203, 1226, 1236, 2983, 3313, 1779, 2929, 3314, 3294], 1698)
-    femmesh.addVolume([985, 1071, 1148, 1241, 2370, 2212, 3134, 2504, 2574, 2955], 1699)
-    femmesh.addVolume([988, 1101, 1129, 1225, 1848, 1539, 1849, 2009, 1725, 2536], 1700)
-    femmesh.addVolume([832, 839, 1099, 1189, 979, 3198, 1444, 2091, 2090, 3315], 1701)
-    femmesh.addVolume([1011, 1112, 1161, 1244, 1988, 2007, 2267, 3316, 3317, 3125], 1702)
-    femmesh.addVolume([1064, 1048, 1091, 1112, 3026, 2879, 3043, 1606, 1729, 2278], 1703)
-    femmesh.addVolume([1139, 602, 1150, 1246, 1363, 2573, 2572, 1745, 1484, 3318], 1704)
-    femmesh.addVolume([1055, 1043, 1141, 1158, 1436, 1985, 1987, 2030, 2029, 3319], 1705)
-    femmesh.addVolume([631, 1137, 1180, 1206, 2166, 3276, 3275, 3320, 3321, 3322], 1706)
-    femmesh.addVolume([14, 176, 180, 1109, 246, 249, 241, 1389, 2974, 3323], 1707)
-    femmesh.addVolume([990, 1059, 1038, 1184, 1888, 2268, 2178, 2596, 2944, 2797], 1708)
-    femmesh.addVolume([643, 1064, 1048, 1091, 1789, 3026, 1348, 2878, 3043, 2879], 1709)
-    femmesh.addVolume([984, 1107, 1167, 1210, 3128, 2105, 1641, 1621, 1733, 1642], 1710)
-    femmesh.addVolume([983, 1221, 1058, 1244, 3243, 3245, 1900, 2978, 3324, 2702], 1711)
-    femmesh.addVolume([1086, 1063, 1144, 1145, 1306, 1652, 1693, 2335, 2787, 2556], 1712)
-    femmesh.addVolume([998, 1152, 1017, 1241, 1577, 3283, 2992, 2954, 2956, 2968], 1713)
-    femmesh.addVolume([1051, 1115, 1028, 1154, 3325, 2981, 2443, 2583, 2982, 2220], 1714)
-    femmesh.addVolume([136, 123, 121, 1085, 571, 567, 572, 3326, 1823, 2792], 1715)
-    femmesh.addVolume([1078, 1053, 1150, 1228, 2630, 3328, 3327, 3220, 3219, 3329], 1716)
-    femmesh.addVolume([998, 1049, 1053, 1219, 2842, 2994, 2993, 1578, 3115, 2803], 1717)
-    femmesh.addVolume([798, 804, 799, 1084, 880, 889, 886, 3330, 3331, 3332], 1718)
-    femmesh.addVolume([835, 1183, 810, 1217, 3333, 2141, 941, 2765, 3334, 2766], 1719)
-    femmesh.addVolume([102, 126, 154, 1077, 512, 373, 508, 1877, 2355, 2814], 1720)
-    femmesh.addVolume([641, 610, 1195, 1223, 727, 2670, 2669, 3335, 2972, 3336], 1721)
-    femmesh.addVolume([110, 165, 109, 1105, 533, 534, 481, 1840, 1420, 2775], 1722)
-    femmesh.addVolume([647, 646, 1139, 1150, 797, 1664, 1364, 2571, 3337, 2572], 1723)
-    femmesh.addVolume([635, 604, 647, 1139, 714, 707, 718, 1665, 1362, 1364], 1724)
-    femmesh.addVolume([1027, 1124, 994, 1218, 3138, 1990, 3182, 2634, 1722, 1993], 1725)
-    femmesh.addVolume([1113, 1024, 1146, 1199, 2747, 2181, 2190, 2189, 2295, 2188], 1726)
-    femmesh.addVolume([624, 638, 637, 1137, 787, 734, 783, 2165, 2167, 2575], 1727)
-    femmesh.addVolume([1, 1145, 1063, 1235, 3339, 2787, 3338, 3340, 3341, 3342], 1728)
-    femmesh.addVolume([1016, 1000, 1077, 1234, 2897, 1446, 2860, 2901, 1447, 1318], 1729)
-    femmesh.addVolume([1080, 993, 1127, 1227, 2914, 2890, 2464, 2948, 2507, 3201], 1730)
-    femmesh.addVolume([137, 1085, 138, 1134, 3238, 3160, 591, 3237, 3162, 3161], 1731)
-    femmesh.addVolume([801, 825, 808, 1118, 908, 909, 905, 3343, 3298, 3297], 1732)
-    femmesh.addVolume([1006, 1028, 1041, 1143, 2201, 2200, 1350, 1501, 2239, 2668], 1733)
-    femmesh.addVolume([996, 1046, 1021, 1172, 1375, 3345, 3344, 1609, 2919, 2656], 1734)
-    femmesh.addVolume([1045, 1027, 1078, 1110, 3259, 2631, 3179, 3346, 3347, 3348], 1735)
-    femmesh.addVolume([1089, 116, 1193, 1210, 3195, 3349, 3027, 2602, 3196, 1707], 1736)
-    femmesh.addVolume([992, 1112, 1011, 1194, 1728, 1988, 2460, 2072, 2728, 2171], 1737)
-    femmesh.addVolume([1046, 1021, 1106, 1190, 3345, 2625, 3119, 3118, 2694, 2693], 1738)
-    femmesh.addVolume([87, 8, 1095, 1178, 202, 3054, 3168, 3169, 3052, 3053], 1739)
-    femmesh.addVolume([144, 134, 1126, 1177, 587, 3076, 2383, 2894, 3078, 2895], 1740)
-    femmesh.addVolume([1042, 1142, 1005, 1213, 3350, 1352, 2234, 2969, 1752, 2043], 1741)
-    femmesh.addVolume([83, 82, 81, 1097, 429, 430, 428, 1871, 2528, 3260], 1742)
-    femmesh.addVolume([1130, 1226, 1013, 1236, 2587, 1778, 1574, 2930, 3294, 1943], 1743)
-    femmesh.addVolume([990, 1039, 1069, 1199, 1701, 3011, 2795, 1395, 1702, 2841], 1744)
-    femmesh.addVolume([1032, 1011, 1094, 1155, 2170, 3143, 3147, 2365, 2491, 2456], 1745)
-    femmesh.addVolume([996, 1077, 1121, 1175, 1843, 1881, 2331, 3014, 3034, 3351], 1746)
-    femmesh.addVolume([1090, 605, 1173, 1185, 2495, 2531, 2532, 3152, 2262, 2678], 1747)
-    femmesh.addVolume([149, 119, 1111, 1130, 301, 2822, 3028, 3029, 2824, 2471], 1748)
-    femmesh.addVolume([818, 1074, 1096, 1212, 3352, 2195, 1355, 2373, 2024, 2100], 1749)
-    femmesh.addVolume([1074, 818, 1096, 1208, 3352, 1355, 2195, 2198, 2584, 2199], 1750)
-    femmesh.addVolume([41, 1075, 1114, 1222, 1531, 2086, 2085, 3107, 1911, 1415], 1751)
-    femmesh.addVolume([103, 102, 104, 1121, 505, 503, 504, 3132, 1879, 2337], 1752)
-    femmesh.addVolume([4, 1088, 611, 1205, 2990, 2835, 662, 3353, 3354, 3355], 1753)
-    femmesh.addVolume([986, 1140, 1010, 1233, 2936, 2421, 1537, 3149, 2313, 2588], 1754)
-    femmesh.addVolume([1020, 1090, 1123, 1176, 2208, 1534, 1868, 1634, 1997, 1999], 1755)
-    femmesh.addVolume([1024, 1036, 1099, 1199, 1802, 2934, 1889, 2295, 1396, 3356], 1756)
-    femmesh.addVolume([141, 135, 142, 1171, 589, 583, 248, 3357, 2582, 1341], 1757)
-    femmesh.addVolume([983, 1112, 1011, 1244, 2162, 1988, 3358, 2978, 3317, 3316], 1758)
-    femmesh.addVolume([2, 1035, 90, 1160, 3359, 3265, 199, 3360, 3266, 3267], 1759)
-    femmesh.addVolume([1, 1063, 1225, 1235, 3338, 2104, 3361, 3340, 3342, 3362], 1760)
-    femmesh.addVolume([823, 835, 6, 1186, 859, 858, 853, 3363, 3216, 3364], 1761)
-    femmesh.addVolume([837, 5, 839, 1189, 843, 846, 847, 2169, 3365, 2090], 1762)
-    femmesh.addVolume([134, 1168, 1070, 1177, 3366, 3058, 3077, 3078, 3367, 3079], 1763)
-    femmesh.addVolume([989, 1014, 1095, 1178, 1596, 2546, 2547, 2144, 2145, 3053], 1764)
-    femmesh.addVolume([12, 49, 1006, 1214, 226, 2686, 1853, 2474, 2687, 1471], 1765)
-    femmesh.addVolume([1010, 1046, 1190, 1233, 2419, 3118, 3368, 2588, 2312, 2147], 1766)
-    femmesh.addVolume([992, 1039, 1048, 1241, 2115, 3369, 1727, 2066, 2505, 2064], 1767)
-    femmesh.addVolume([822, 37, 1068, 1108, 862, 2466, 2468, 2292, 2291, 3370], 1768)
-    femmesh.addVolume([133, 115, 167, 1063, 552, 400, 252, 2786, 3371, 3110], 1769)
-    femmesh.addVolume([59, 147, 1003, 1097, 336, 2674, 3372, 3373, 2059, 1949], 1770)
-    femmesh.addVolume([1003, 1047, 1097, 1100, 2885, 2805, 1949, 3374, 2804, 2404], 1771)
-    femmesh.addVolume([159, 84, 114, 1087, 412, 449, 450, 2658, 1820, 2874], 1772)
-    femmesh.addVolume([57, 1124, 1203, 1219, 3375, 2985, 3036, 3037, 3139, 3038], 1773)
-    femmesh.addVolume([993, 1080, 1111, 1227, 2914, 2913, 1786, 2507, 2948, 2508], 1774)
-    femmesh.addVolume([1085, 1153, 1190, 1220, 1282, 2552, 1965, 3240, 3122, 3124], 1775)
-    femmesh.addVolume([1003, 1002, 1027, 1203, 1950, 2882, 2883, 1952, 1951, 3072], 1776)
-    femmesh.addVolume([608, 1061, 1137, 1169, 1662, 2794, 2410, 1541, 3376, 2411], 1777)
-    femmesh.addVolume([155, 78, 1152, 1219, 417, 2725, 3377, 3061, 3033, 1579], 1778)
-    femmesh.addVolume([60, 62, 61, 1004, 339, 340, 341, 1432, 2415, 3176], 1779)
-    femmesh.addVolume([820, 1131, 803, 1188, 2756, 1525, 916, 2151, 2069, 2068], 1780)
-    femmesh.addVolume([162, 168, 1058, 1204, 478, 2696, 2550, 2551, 2697, 1901], 1781)
-    femmesh.addVolume([983, 1201, 1151, 1224, 2580, 2606, 2607, 2730, 3163, 3213], 1782)
-    femmesh.addVolume([616, 621, 615, 1180, 762, 763, 755, 3378, 3379, 1711], 1783)
-    femmesh.addVolume([985, 1054, 1126, 1177, 2332, 1422, 2544, 3126, 2358, 2895], 1784)
-    femmesh.addVolume([1035, 1160, 1138, 1231, 3266, 2924, 1644, 2530, 2830, 2403], 1785)
-    femmesh.addVolume([92, 1089, 116, 1198, 2839, 3195, 471, 2840, 2050, 3380], 1786)
-    femmesh.addVolume([608, 610, 1061, 1169, 730, 1663, 1662, 1541, 1741, 3376], 1787)
-    femmesh.addVolume([142, 1070, 133, 1145, 1322, 2785, 250, 1325, 1327, 2788], 1788)
-    femmesh.addVolume([115, 114, 1063, 1168, 399, 2875, 3371, 3381, 2876, 2704], 1789)
-    femmesh.addVolume([1095, 987, 1160, 1245, 3020, 2829, 2849, 2642, 2465, 3010], 1790)
-    femmesh.addVolume([94, 110, 109, 1204, 480, 481, 482, 3382, 2107, 2776], 1791)
-    femmesh.addVolume([984, 1165, 1166, 1209, 2206, 2207, 1685, 1768, 2363, 3383], 1792)
-    femmesh.addVolume([124, 128, 125, 1124, 579, 578, 273, 2872, 2604, 1932], 1793)
-    femmesh.addVolume([805, 1125, 806, 1133, 1971, 3042, 870, 2094, 3384, 2095], 1794)
-    femmesh.addVolume([2, 1035, 1160, 1238, 3359, 3266, 3360, 3385, 2413, 3386], 1795)
-    femmesh.addVolume([51, 1151, 52, 1207, 2910, 3387, 263, 2912, 2608, 3388], 1796)
-    femmesh.addVolume([177, 123, 136, 1085, 577, 571, 576, 2139, 1823, 3326], 1797)
-    femmesh.addVolume([1041, 1115, 1028, 1122, 3389, 2981, 2200, 2204, 3390, 2202], 1798)
-    femmesh.addVolume([832, 1099, 1196, 1208, 1444, 2470, 2469, 2673, 3391, 3392], 1799)
-    femmesh.addVolume([75, 114, 74, 1087, 389, 390, 187, 2101, 2874, 2083], 1800)
-    femmesh.addVolume([1010, 1046, 1029, 1190, 2419, 3187, 2226, 3368, 3118, 2622], 1801)
-    femmesh.addVolume([145, 110, 94, 1204, 483, 480, 479, 2688, 2107, 3382], 1802)
-    femmesh.addVolume([131, 1193, 1130, 1198, 3394, 2931, 3393, 3395, 2932, 2666], 1803)
-    femmesh.addVolume([986, 1086, 1101, 1216, 2613, 1516, 1535, 1914, 1961, 3192], 1804)
-    femmesh.addVolume([1, 167, 1063, 1145, 182, 3110, 3338, 3339, 3111, 2787], 1805)
-    femmesh.addVolume([1090, 1046, 1172, 1195, 3397, 2919, 3396, 3398, 3399, 3400], 1806)
-    femmesh.addVolume([6, 37, 823, 1108, 42, 854, 853, 3401, 2291, 2290], 1807)
-    femmesh.addVolume([836, 1189, 1074, 1222, 2168, 3047, 3402, 2480, 2479, 3403], 1808)
-    femmesh.addVolume([112, 170, 111, 1083, 542, 541, 540, 3080, 1973, 2753], 1809)
-    femmesh.addVolume([1021, 1046, 996, 1190, 3345, 1375, 3344, 2694, 3118, 1966], 1810)
-    femmesh.addVolume([816, 815, 811, 1154, 944, 933, 943, 3224, 1875, 1874], 1811)
-    femmesh.addVolume([1015, 1036, 1037, 1074, 1393, 1582, 1581, 2020, 2196, 3044], 1812)
-    femmesh.addVolume([836, 838, 1074, 1189, 964, 3404, 3402, 2168, 2089, 3047], 1813)
-    femmesh.addVolume([152, 1080, 1160, 1227, 3406, 2935, 3405, 3407, 2948, 3269], 1814)
-    femmesh.addVolume([1019, 1114, 1052, 1136, 1410, 3012, 2768, 1402, 2187, 1755], 1815)
-    femmesh.addVolume([1065, 1036, 1096, 1208, 1801, 2194, 1827, 3408, 2197, 2199], 1816)
-    femmesh.addVolume([1018, 1098, 1118, 1187, 1678, 3409, 2962, 2453, 3165, 3410], 1817)
-    femmesh.addVolume([614, 615, 1072, 1135, 752, 2118, 2117, 3411, 3412, 3413], 1818)
-    femmesh.addVolume([83, 137, 1134, 1220, 442, 3237, 1857, 1860, 3239, 1861], 1819)
-    femmesh.addVolume([1029, 1106, 1190, 1223, 2579, 2693, 2622, 3188, 3120, 3121], 1820)
-    femmesh.addVolume([117, 172, 98, 1193, 498, 492, 494, 2721, 1570, 3099], 1821)
-    femmesh.addVolume([13, 12, 160, 1171, 22, 235, 234, 3023, 1855, 2922], 1822)
-    femmesh.addVolume([1007, 1151, 1201, 1224, 1586, 2606, 2121, 2737, 3213, 3163], 1823)
-    femmesh.addVolume([831, 1073, 1149, 1217, 1290, 1288, 1481, 2767, 3264, 3016], 1824)
-    femmesh.addVolume([111, 158, 67, 1191, 375, 376, 377, 2986, 3414, 1523], 1825)
-    femmesh.addVolume([11, 80, 1116, 1143, 228, 3241, 2958, 2959, 3242, 2240], 1826)
-    femmesh.addVolume([166, 1116, 80, 1229, 2691, 3241, 425, 2723, 2724, 3415], 1827)
-    femmesh.addVolume([1095, 989, 1178, 1238, 2547, 2144, 3053, 3055, 1976, 3056], 1828)
-    femmesh.addVolume([116, 92, 150, 1089, 471, 468, 473, 3195, 2839, 2600], 1829)
-    femmesh.addVolume([798, 1084, 799, 1159, 3330, 3332, 886, 2682, 3416, 1616], 1830)
-    femmesh.addVolume([1124, 129, 1152, 1219, 3418, 3417, 2538, 3139, 3419, 1579], 1831)
-    femmesh.addVolume([155, 1152, 129, 1219, 3377, 3417, 326, 3061, 1579, 3419], 1832)
-    femmesh.addVolume([1032, 1094, 1096, 1212, 3147, 1320, 2395, 2023, 2098, 2100], 1833)
-    femmesh.addVolume([71, 1080, 53, 1201, 3171, 3420, 294, 3173, 3174, 3421], 1834)
-    femmesh.addVolume([1039, 992, 1048, 1113, 2115, 1727, 3369, 3271, 3422, 2344], 1835)
-    femmesh.addVolume([1086, 1063, 1145, 1235, 1306, 2787, 2335, 3423, 3342, 3341], 1836)
-    femmesh.addVolume([1049, 1017, 1053, 1150, 2966, 2763, 2994, 3104, 3105, 3328], 1837)
-    femmesh.addVolume([175, 106, 169, 1057, 524, 526, 527, 3083, 3086, 3082], 1838)
-    femmesh.addVolume([1000, 1042, 1018, 1213, 2758, 2759, 1837, 1750, 2969, 2493], 1839)
-    femmesh.addVolume([992, 1036, 1065, 1199, 2857, 1801, 2183, 2116, 1396, 2297], 1840)
-    femmesh.addVolume([1090, 1020, 1117, 1172, 2208, 1867, 3062, 3396, 3424, 3425], 1841)
-    femmesh.addVolume([829, 1128, 800, 1158, 3208, 3426, 897, 3048, 3427, 3049], 1842)
-    femmesh.addVolume([126, 66, 154, 1167, 372, 361, 373, 2356, 2035, 2815], 1843)
-    femmesh.addVolume([1120, 1065, 1149, 1196, 2261, 1287, 2397, 1930, 1805, 3249], 1844)
-    femmesh.addVolume([992, 1064, 1113, 1199, 2184, 2746, 3422, 2116, 2296, 2189], 1845)
-    femmesh.addVolume([1009, 1062, 1079, 1157, 1796, 3428, 2279, 2977, 2709, 3429], 1846)
-    femmesh.addVolume([1005, 1028, 1103, 1143, 1669, 2374, 1625, 1502, 2239, 2376], 1847)
-    femmesh.addVolume([1017, 1049, 998, 1241, 2966, 2842, 2992, 2968, 2744, 2954], 1848)
-    femmesh.addVolume([1013, 999, 1089, 1193, 1358, 2998, 2513, 1360, 1359, 3027], 1849)
-    femmesh.addVolume([26, 1081, 1062, 1243, 1807, 2161, 2647, 2651, 3430, 3255], 1850)
-    femmesh.addVolume([799, 804, 807, 1133, 889, 894, 893, 3431, 3432, 2096], 1851)
-    femmesh.addVolume([1083, 1018, 1156, 1213, 1683, 2031, 1776, 1751, 2493, 2620], 1852)
-    femmesh.addVolume([1044, 1088, 1205, 1232, 2156, 3354, 3433, 3434, 2836, 3435], 1853)
-    femmesh.addVolume([1000, 1142, 1042, 1213, 1263, 3350, 2758, 1750, 1752, 2969], 1854)
-    femmesh.addVolume([828, 1188, 1186, 1217, 2150, 2942, 2940, 2154, 2153, 3436], 1855)
-    femmesh.addVolume([1062, 1030, 1079, 1243, 2137, 3437, 3428, 3255, 3438, 3439], 1856)
-    femmesh.addVolume([106, 105, 1057, 1132, 516, 1690, 3086, 3087, 2298, 2299], 1857)
-    femmesh.addVolume([69, 1080, 71, 1093, 3231, 3171, 296, 3230, 2462, 3172], 1858)
-    femmesh.addVolume([1101, 1086, 1184, 1216, 1516, 2598, 2597, 3192, 1961, 3116], 1859)
-    femmesh.addVolume([102, 121, 126, 1107, 510, 511, 512, 1878, 2791, 2354], 1860)
-    femmesh.addVolume([1069, 644, 1146, 1242, 2133, 1650, 2616, 3440, 2908, 2191], 1861)
-    femmesh.addVolume([1080, 1127, 1160, 1231, 2464, 2828, 2935, 3441, 2831, 2830], 1862)
-    femmesh.addVolume([635, 1048, 1113, 1139, 1346, 2344, 2343, 1665, 2662, 3442], 1863)
-    femmesh.addVolume([1086, 1225, 1063, 1235, 1724, 2104, 1306, 3423, 3362, 3342], 1864)
-    femmesh.addVolume([1043, 1165, 1018, 1187, 3166, 2205, 2080, 3443, 2454, 2453], 1865)
-    femmesh.addVolume([1034, 1021, 1117, 1165, 2624, 3444, 2638, 2347, 2655, 2925], 1866)
-    femmesh.addVolume([631, 603, 1100, 1246, 697, 2310, 2309, 3445, 1483, 3194], 1867)
-    femmesh.addVolume([995, 1051, 1116, 1229, 1666, 2442, 2690, 2368, 2923, 2724], 1868)
-    femmesh.addVolume([168, 163, 1058, 1163, 353, 2348, 2696, 3446, 2636, 1863], 1869)
-    femmesh.addVolume([1014, 1103, 1004, 1163, 2590, 2375, 2430, 2816, 2417, 1864], 1870)
-    femmesh.addVolume([1003, 1049, 1174, 1200, 3114, 3202, 2675, 2680, 3203, 1995], 1871)
-    femmesh.addVolume([1000, 1042, 1016, 1055, 2758, 3447, 2897, 1983, 3006, 2663], 1872)
-    femmesh.addVolume([615, 623, 1072, 1180, 758, 2119, 2118, 1711, 1710, 3448], 1873)
-    femmesh.addVolume([622, 646, 639, 1150, 781, 782, 776, 3449, 3337, 3131], 1874)
-    femmesh.addVolume([1104, 1025, 1128, 1158, 2566, 2483, 2892, 2591, 2028, 3427], 1875)
-    femmesh.addVolume([152, 55, 1080, 1227, 304, 2947, 3406, 3407, 2949, 2948], 1876)
-    femmesh.addVolume([830, 808, 1118, 1192, 923, 3297, 3274, 1893, 3254, 2965], 1877)
-    femmesh.addVolume([1165, 1166, 1209, 1239, 2207, 3383, 2363, 3189, 2386, 3190], 1878)
-    femmesh.addVolume([1028, 1006, 1116, 1143, 2201, 1486, 2238, 2239, 1501, 2240], 1879)
-    femmesh.addVolume([1093, 1161, 1244, 1245, 1942, 3125, 2979, 2811, 2810, 2541], 1880)
-    femmesh.addVolume([53, 1201, 1080, 1215, 3421, 3174, 3420, 3450, 3292, 3130], 1881)
-    femmesh.addVolume([840, 834, 839, 1211, 981, 978, 848, 1758, 1760, 3451], 1882)
-    femmesh.addVolume([1004, 1058, 1155, 1163, 1431, 2056, 2055, 1864, 1863, 2817], 1883)
-    femmesh.addVolume([639, 1150, 602, 1246, 3131, 2573, 696, 3251, 3318, 1484], 1884)
-    femmesh.addVolume([999, 1089, 1193, 1210, 2998, 3027, 1359, 1706, 2602, 1707], 1885)
-    femmesh.addVolume([628, 625, 641, 1195, 790, 786, 728, 3452, 3453, 2669], 1886)
-    femmesh.addVolume([54, 149, 1111, 1227, 299, 3028, 3074, 3145, 3030, 2508], 1887)
-    femmesh.addVolume([1011, 1112, 983, 1221, 1988, 2162, 3358, 2174, 3252, 3243], 1888)
-    femmesh.addVolume([162, 163, 70, 1093, 388, 386, 384, 2549, 2349, 2846], 1889)
-    femmesh.addVolume([643, 1091, 617, 1157, 2878, 3454, 770, 2592, 3455, 2781], 1890)
-    femmesh.addVolume([1026, 1073, 1011, 1094, 3102, 1456, 3136, 3456, 1624, 3143], 1891)
-    femmesh.addVolume([173, 107, 179, 1134, 528, 530, 446, 2996, 2340, 3070], 1892)
-    femmesh.addVolume([798, 1114, 1159, 1240, 2615, 3457, 2682, 1498, 2856, 2920], 1893)
-    femmesh.addVolume([1017, 1066, 1007, 1218, 3304, 3459, 3458, 2764, 3306, 1588], 1894)
-    femmesh.addVolume([1016, 1142, 1000, 1234, 1500, 1263, 2897, 2901, 2149, 1447], 1895)
-    femmesh.addVolume([1111, 1080, 1127, 1215, 2913, 2464, 2521, 3108, 3130, 3221], 1896)
-    femmesh.addVolume([1121, 1077, 1132, 1175, 1881, 1493, 2229, 3351, 3034, 2710], 1897)
-    femmesh.addVolume([172, 122, 123, 1107, 561, 568, 574, 1338, 3460, 1824], 1898)
-    femmesh.addVolume([1005, 1142, 1191, 1213, 1352, 1524, 1764, 2043, 1752, 2323], 1899)
-    femmesh.addVolume([799, 807, 1055, 1133, 893, 3228, 3229, 3431, 2096, 3461], 1900)
-    femmesh.addVolume([1039, 1119, 1069, 1242, 3462, 3197, 3011, 3272, 3463, 3440], 1901)
-    femmesh.addVolume([1075, 1023, 1114, 1136, 2317, 2563, 2086, 1908, 1897, 2187], 1902)
-    femmesh.addVolume([81, 1097, 100, 1220, 3260, 3025, 435, 3261, 1873, 3225], 1903)
-    femmesh.addVolume([998, 1087, 1174, 1200, 1810, 1373, 2905, 1575, 1996, 1995], 1904)
-    femmesh.addVolume([988, 1012, 1060, 1101, 2008, 3464, 2210, 1848, 1515, 3164], 1905)
-    femmesh.addVolume([1024, 1099, 990, 1199, 1889, 1891, 1887, 2295, 3356, 1395], 1906)
-    femmesh.addVolume([63, 50, 1201, 1215, 266, 3289, 3465, 3466, 3291, 3292], 1907)
-    femmesh.addVolume([148, 1087, 174, 1200, 1368, 3206, 453, 1994, 1996, 3207], 1908)
-    femmesh.addVolume([610, 1061, 1185, 1223, 1663, 1744, 3211, 2972, 2900, 3467], 1909)
-    femmesh.addVolume([1036, 1099, 1037, 1189, 2934, 2092, 1582, 3045, 3315, 3046], 1910)
-    femmesh.addVolume([87, 1163, 72, 1178, 3167, 3468, 212, 3169, 3170, 3469], 1911)
-    femmesh.addVolume([62, 80, 1116, 1229, 231, 3241, 2542, 2738, 3415, 2724], 1912)
-    femmesh.addVolume([1012, 1039, 1049, 1119, 2457, 2683, 2684, 3470, 3462, 3471], 1913)
-    femmesh.addVolume([818, 812, 809, 1096, 935, 930, 934, 1355, 1826, 1319], 1914)
-    femmesh.addVolume([840, 800, 833, 1240, 901, 898, 900, 2706, 1496, 3472], 1915)
-    femmesh.addVolume([1166, 984, 1209, 1239, 1685, 1768, 3383, 2386, 3142, 3190], 1916)
-    femmesh.addVolume([147, 59, 1003, 1200, 336, 3372, 2674, 2679, 3473, 2680], 1917)
-    femmesh.addVolume([1151, 1007, 1201, 1215, 1586, 2121, 2606, 1584, 1585, 3292], 1918)
-    femmesh.addVolume([1040, 1009, 1062, 1237, 2820, 1796, 2244, 1367, 2281, 2138], 1919)
-    femmesh.addVolume([1058, 1204, 1105, 1221, 1901, 2109, 1435, 3245, 3244, 2537], 1920)
-    femmesh.addVolume([1008, 1090, 1173, 1185, 2975, 2532, 2976, 1464, 3152, 2678], 1921)
-    femmesh.addVolume([15, 1057, 1145, 1235, 3183, 1479, 3184, 3474, 1916, 3341], 1922)
-    femmesh.addVolume([998, 1039, 1147, 1241, 2843, 1700, 1809, 2954, 2505, 3135], 1923)
-    femmesh.addVolume([115, 114, 75, 1063, 399, 389, 398, 3371, 2875, 2102], 1924)
-    femmesh.addVolume([122, 1107, 172, 1210, 3460, 1338, 561, 3475, 1733, 1705], 1925)
-    femmesh.addVolume([1071, 1151, 1152, 1224, 3068, 2540, 3001, 3051, 3213, 3307], 1926)
-    femmesh.addVolume([100, 101, 58, 1002, 333, 327, 331, 3024, 2320, 3222], 1927)
-    femmesh.addVolume([107, 173, 138, 1121, 528, 529, 520, 2918, 2995, 3159], 1928)
-    femmesh.addVolume([646, 1066, 627, 1091, 2526, 2525, 780, 2877, 3235, 2881], 1929)
-    femmesh.addVolume([1165, 1043, 1166, 1172, 3166, 1439, 2207, 2657, 1610, 2482], 1930)
-    femmesh.addVolume([839, 834, 1099, 1211, 978, 1442, 3198, 3451, 1760, 2093], 1931)
-    femmesh.addVolume([624, 1180, 1137, 1223, 1709, 3276, 2165, 3089, 3476, 3137], 1932)
-    femmesh.addVolume([9, 156, 181, 1191, 217, 219, 210, 1762, 2328, 2628], 1933)
-    femmesh.addVolume([2, 1160, 90, 1227, 3360, 3267, 199, 3477, 3269, 3268], 1934)
-    femmesh.addVolume([1103, 68, 1163, 1178, 3100, 3101, 2417, 1630, 3478, 3170], 1935)
-    femmesh.addVolume([165, 139, 166, 995, 596, 594, 597, 1697, 2272, 2689], 1936)
-    femmesh.addVolume([1038, 1059, 1140, 1184, 2268, 2501, 2063, 2797, 2944, 2938], 1937)
-    femmesh.addVolume([1194, 1054, 1207, 1221, 1591, 2362, 3479, 2173, 3199, 3480], 1938)
-    femmesh.addVolume([132, 1130, 149, 1198, 3481, 3029, 465, 3482, 2666, 3233], 1939)
-    femmesh.addVolume([1071, 985, 1148, 1177, 2370, 3134, 2212, 2215, 3126, 2216], 1940)
-    femmesh.addVolume([145, 1204, 95, 1207, 2688, 3483, 420, 2360, 2560, 3484], 1941)
-    femmesh.addVolume([119, 56, 178, 994, 316, 309, 317, 2823, 2927, 1991], 1942)
-    femmesh.addVolume([999, 1190, 1021, 1239, 2158, 2694, 2623, 2159, 1968, 3191], 1943)
-    femmesh.addVolume([621, 620, 601, 1206, 699, 700, 701, 3485, 3486, 3487], 1944)
-    femmesh.addVolume([90, 1035, 92, 1198, 3265, 3008, 456, 3270, 2049, 2840], 1945)
-    femmesh.addVolume([56, 1203, 994, 1236, 3488, 2983, 2927, 2928, 3314, 2929], 1946)
-    femmesh.addVolume([1209, 984, 1210, 1239, 1768, 1621, 3489, 3190, 3142, 3490], 1947)
-    femmesh.addVolume([983, 1194, 1071, 1207, 2729, 2371, 3212, 2561, 3479, 2595], 1948)
-    femmesh.addVolume([814, 821, 820, 1120, 958, 956, 957, 2445, 1639, 2755], 1949)
-    femmesh.addVolume([1128, 1059, 1162, 1240, 2284, 1381, 2893, 2440, 2708, 2707], 1950)
-    femmesh.addVolume([983, 1194, 1207, 1221, 2729, 3479, 2561, 3243, 2173, 3480], 1951)
-    femmesh.addVolume([163, 87, 70, 1095, 387, 385, 386, 2350, 3168, 2845], 1952)
-    femmesh.addVolume([1095, 73, 1160, 1238, 3257, 3258, 2849, 3055, 3491, 3386], 1953)
-    femmesh.addVolume([801, 827, 825, 1187, 907, 910, 908, 3003, 1526, 1791], 1954)
-    femmesh.addVolume([155, 1003, 59, 1200, 3060, 3372, 320, 3059, 2680, 3473], 1955)
-    femmesh.addVolume([993, 1030, 1127, 1231, 2077, 2512, 2890, 1658, 1513, 2831], 1956)
-    femmesh.addVolume([1007, 1111, 1215, 1218, 2520, 3108, 1585, 1588, 2127, 1589], 1957)
-    femmesh.addVolume([825, 824, 1141, 1158, 925, 2950, 3492, 2782, 2784, 3319], 1958)
-    femmesh.addVolume([1002, 1029, 1047, 1072, 2864, 3127, 2884, 1833, 2577, 3493], 1959)
-    femmesh.addVolume([633, 634, 635, 1113, 689, 715, 794, 2589, 3494, 2343], 1960)
-    femmesh.addVolume([606, 610, 1185, 1195, 724, 3211, 2263, 2671, 2670, 3495], 1961)
-    femmesh.addVolume([3, 1069, 30, 1169, 2132, 2134, 36, 2324, 3215, 2039], 1962)
-    femmesh.addVolume([643, 627, 617, 1091, 774, 773, 770, 2878, 2881, 3454], 1963)
-    femmesh.addVolume([115, 75, 167, 1063, 398, 191, 400, 3371, 2102, 3110], 1964)
-    femmesh.addVolume([117, 1193, 116, 1210, 2721, 3349, 496, 2722, 1707, 3196], 1965)
-    femmesh.addVolume([813, 1196, 1096, 1208, 2808, 2809, 2807, 3094, 3392, 2199], 1966)
-    femmesh.addVolume([9, 10, 156, 1103, 19, 216, 217, 1626, 2733, 2270], 1967)
-    femmesh.addVolume([811, 1067, 1094, 1183, 1783, 2455, 1271, 2143, 2818, 3021], 1968)
-    femmesh.addVolume([643, 1064, 1091, 1157, 1789, 3043, 2878, 2592, 2593, 3455], 1969)
-    femmesh.addVolume([1036, 992, 1170, 1199, 2857, 2071, 1601, 1396, 2116, 1429], 1970)
-    femmesh.addVolume([1046, 1008, 1090, 1172, 1374, 2975, 3397, 2919, 2567, 3396], 1971)
-    femmesh.addVolume([1101, 1038, 1140, 1184, 2771, 2063, 2773, 2597, 2797, 2938], 1972)
-    femmesh.addVolume([77, 1148, 76, 1152, 3496, 2961, 403, 3497, 2740, 3002], 1973)
-    femmesh.addVolume([1003, 1053, 1049, 1219, 3498, 2994, 3114, 3039, 2803, 3115], 1974)
-    femmesh.addVolume([1083, 989, 1191, 1213, 1775, 2318, 1522, 1751, 2044, 2323], 1975)
-    femmesh.addVolume([833, 819, 821, 1162, 967, 965, 966, 1773, 2390, 2018], 1976)
-    femmesh.addVolume([1095, 1014, 1163, 1178, 2546, 2816, 2637, 3053, 2145, 3170], 1977)
-    femmesh.addVolume([75, 1, 1063, 1225, 186, 3338, 2102, 2103, 3361, 2104], 1978)
-    femmesh.addVolume([1031, 1030, 1079, 1237, 2379, 3437, 2280, 2282, 1311, 2283], 1979)
-    femmesh.addVolume([169, 1057, 15, 1235, 3082, 3183, 184, 3084, 1916, 3474], 1980)
-    femmesh.addVolume([125, 50, 124, 1151, 271, 270, 273, 1931, 3290, 2866], 1981)
-    femmesh.addVolume([1009, 1149, 1056, 1157, 1286, 2398, 1797, 2977, 3092, 2307], 1982)
-    femmesh.addVolume([70, 73, 69, 1160, 382, 383, 381, 2847, 3258, 3232], 1983)
-    femmesh.addVolume([813, 832, 1196, 1208, 951, 2469, 2808, 3094, 2673, 3392], 1984)
-    femmesh.addVolume([1093, 1095, 1160, 1245, 2351, 2849, 2848, 2811, 2642, 3010], 1985)
-    femmesh.addVolume([986, 1121, 1132, 1175, 2230, 2229, 1295, 2711, 3351, 2710], 1986)
-    femmesh.addVolume([1012, 1069, 1039, 1119, 2858, 3011, 2457, 3470, 3197, 3462], 1987)
-    femmesh.addVolume([1078, 1031, 1088, 1230, 3499, 2381, 3286, 2489, 3500, 3287], 1988)
-    femmesh.addVolume([82, 86, 74, 1225, 391, 392, 393, 2850, 2535, 2084], 1989)
-    femmesh.addVolume([1048, 992, 1064, 1113, 1727, 2184, 3026, 2344, 3422, 2746], 1990)
-    femmesh.addVolume([1099, 832, 1189, 1208, 1444, 2091, 3315, 3391, 2673, 2672], 1991)
-    femmesh.addVolume([1032, 1074, 1096, 1170, 2021, 2195, 2395, 1474, 3151, 2385], 1992)
-    femmesh.addVolume([810, 1094, 1073, 1183, 1449, 1624, 1291, 2141, 3021, 3501], 1993)
-    femmesh.addVolume([171, 92, 1035, 1182, 460, 3008, 2869, 2868, 2838, 2046], 1994)
-    femmesh.addVolume([1003, 1100, 1097, 1174, 3374, 2404, 1949, 2675, 2987, 2061], 1995)
-    femmesh.addVolume([58, 97, 1002, 1236, 330, 3154, 3222, 3502, 3156, 1835], 1996)
-    femmesh.addVolume([161, 67, 66, 1167, 370, 364, 371, 3285, 1344, 2035], 1997)
-    femmesh.addVolume([983, 1071, 1151, 1207, 3212, 3068, 2607, 2561, 2595, 2608], 1998)
-    femmesh.addVolume([838, 836, 1074, 1208, 964, 3402, 3404, 2586, 2585, 2198], 1999)
-    femmesh.addVolume([1032, 1051, 1154, 1212, 2330, 2583, 3148, 2023, 1668, 2329], 2000)
-    femmesh.addVolume([1015, 1036, 1074, 1170, 1393, 2196, 2020, 1426, 1601, 3151], 2001)
-    femmesh.addVolume([1019, 1052, 1092, 1202, 2768, 2832, 1412, 1567, 2769, 2287], 2002)
-    femmesh.addVolume([1051, 1028, 1115, 1122, 2443, 2981, 3325, 2444, 2202, 3390], 2003)
-    femmesh.addVolume([818, 836, 1074, 1212, 963, 3402, 3352, 2373, 2873, 2024], 2004)
-    femmesh.addVolume([1017, 1124, 1152, 1219, 3503, 2538, 3283, 2988, 3139, 1579], 2005)
-    femmesh.addVolume([27, 629, 640, 1123, 669, 677, 675, 2293, 1409, 1408], 2006)
-    femmesh.addVolume([1027, 1124, 1218, 1219, 3138, 1722, 2634, 2801, 3139, 2802], 2007)
-    femmesh.addVolume([166, 160, 80, 1116, 426, 237, 425, 2691, 2921, 3241], 2008)
-    femmesh.addVolume([1017, 1078, 1053, 1150, 2762, 2630, 2763, 3105, 3327, 3328], 2009)
-    femmesh.addVolume([1051, 1075, 1122, 1212, 1667, 2716, 2444, 1668, 1566, 3504], 2010)
-    femmesh.addVolume([136, 121, 138, 1085, 572, 513, 573, 3326, 2792, 3160], 2011)
-    femmesh.addVolume([985, 1147, 1148, 1168, 1676, 1813, 3134, 3057, 2246, 2248], 2012)
-    femmesh.addVolume([66, 1142, 65, 1234, 2001, 3505, 356, 2037, 2149, 3506], 2013)
-    femmesh.addVolume([56, 1130, 120, 1236, 2926, 3507, 314, 2928, 2930, 3508], 2014)
-    femmesh.addVolume([57, 155, 1124, 1219, 321, 3509, 3375, 3037, 3061, 3139], 2015)
-    femmesh.addVolume([812, 1065, 1096, 1196, 1510, 1827, 1826, 2640, 1805, 2809], 2016)
-    femmesh.addVolume([1020, 1165, 1043, 1187, 2757, 3166, 3510, 2503, 2454, 3443], 2017)
-    femmesh.addVolume([99, 172, 177, 1153, 493, 502, 500, 3511, 1280, 2140], 2018)
-    femmesh.addVolume([633, 28, 29, 1164, 681, 34, 680, 2175, 2032, 2052], 2019)
-    femmesh.addVolume([1069, 1060, 1101, 1169, 3512, 3164, 2859, 3215, 3302, 3513], 2020)
-    femmesh.addVolume([66, 67, 65, 1142, 364, 365, 356, 2001, 1262, 3505], 2021)
-    femmesh.addVolume([817, 816, 1122, 1212, 881, 3514, 2717, 2862, 2863, 3504], 2022)
-    femmesh.addVolume([1002, 1047, 1027, 1226, 2884, 2886, 2882, 3515, 3516, 3517], 2023)
-    femmesh.addVolume([601, 603, 631, 1246, 694, 697, 698, 3250, 1483, 3445], 2024)
-    femmesh.addVolume([818, 1074, 836, 1208, 3352, 3402, 963, 2584, 2198, 2585], 2025)
-    femmesh.addVolume([59, 1003, 57, 1203, 3372, 3035, 319, 3518, 1952, 3036], 2026)
-    femmesh.addVolume([801, 808, 802, 1098, 905, 856, 902, 3204, 3519, 3205], 2027)
-    femmesh.addVolume([114, 84, 174, 1087, 449, 448, 451, 2874, 1820, 3206], 2028)
-    femmesh.addVolume([15, 176, 14, 1057, 247, 246, 24, 3183, 2973, 1386], 2029)
-    femmesh.addVolume([152, 1080, 69, 1160, 3406, 3231, 303, 3405, 2935, 3232], 2030)
-    femmesh.addVolume([124, 1151, 50, 1215, 2866, 3290, 270, 2867, 1584, 3291], 2031)
-    femmesh.addVolume([1105, 1204, 1054, 1221, 2109, 2108, 1419, 2537, 3244, 3199], 2032)
-    femmesh.addVolume([1026, 1067, 1014, 1108, 1553, 1554, 1552, 1331, 2891, 3520], 2033)
-    femmesh.addVolume([614, 613, 615, 1135, 750, 751, 752, 3411, 3521, 3412], 2034)
-    femmesh.addVolume([77, 79, 1148, 1177, 404, 2211, 3496, 3522, 2214, 2216], 2035)
-    femmesh.addVolume([1027, 994, 1078, 1218, 3182, 3180, 2631, 2634, 1993, 2635], 2036)
-    femmesh.addVolume([99, 98, 172, 1153, 489, 492, 493, 3511, 3098, 1280], 2037)
-    femmesh.addVolume([613, 1076, 645, 1232, 2407, 2789, 741, 3523, 3524, 3525], 2038)
-    femmesh.addVolume([154, 104, 1077, 1234, 509, 1313, 2814, 2871, 1316, 1318], 2039)
-    femmesh.addVolume([824, 1141, 1158, 1159, 2950, 3319, 2784, 1615, 2951, 3526], 2040)
-    femmesh.addVolume([1020, 1165, 1117, 1172, 2757, 2925, 1867, 3424, 2657, 3425], 2041)
-    femmesh.addVolume([1020, 1090, 1117, 1123, 2208, 3062, 1867, 1868, 1534, 1869], 2042)
-    femmesh.addVolume([639, 622, 1150, 1228, 776, 3449, 3131, 3301, 3300, 3329], 2043)
-    femmesh.addVolume([104, 102, 154, 1077, 503, 508, 509, 1313, 1877, 2814], 2044)
-    femmesh.addVolume([140, 100, 1153, 1220, 437, 3050, 3282, 3312, 3225, 3122], 2045)
-    femmesh.addVolume([800, 829, 833, 1128, 897, 899, 898, 3426, 3208, 3093], 2046)
-    femmesh.addVolume([1017, 1152, 998, 1219, 3283, 1577, 2992, 2988, 1579, 1578], 2047)
-    femmesh.addVolume([38, 1068, 37, 1125, 2467, 2466, 43, 1970, 1794, 3041], 2048)
-    femmesh.addVolume([614, 632, 1076, 1179, 753, 2409, 2408, 2610, 3527, 3528], 2049)
-    femmesh.addVolume([1000, 1016, 1042, 1142, 2897, 3447, 2758, 1263, 1500, 3350], 2050)
-    femmesh.addVolume([62, 68, 61, 1163, 224, 349, 340, 2416, 3101, 3177], 2051)
-    femmesh.addVolume([1020, 1123, 1131, 1176, 1868, 3005, 1633, 1634, 1999, 1635], 2052)
-    femmesh.addVolume([628, 1117, 625, 1195, 2819, 2506, 790, 3452, 3529, 3453], 2053)
-    femmesh.addVolume([1059, 1099, 1162, 1211, 1890, 2019, 1381, 1981, 2093, 1759], 2054)
-    femmesh.addVolume([152, 55, 69, 1080, 304, 292, 303, 3406, 2947, 3231], 2055)
-    femmesh.addVolume([994, 1022, 1078, 1218, 1267, 3178, 3180, 1993, 2896, 2635], 2056)
-    femmesh.addVolume([1080, 1227, 1127, 1231, 2948, 3201, 2464, 3441, 2752, 2831], 2057)
-    femmesh.addVolume([607, 30, 29, 1173, 684, 35, 685, 2502, 2042, 2377], 2058)
-    femmesh.addVolume([26, 630, 1081, 1243, 657, 1808, 1807, 2651, 2653, 3430], 2059)
-    femmesh.addVolume([144, 134, 139, 1126, 587, 585, 586, 2383, 3076, 2271], 2060)
-    femmesh.addVolume([603, 1060, 1100, 1119, 1247, 2405, 2310, 1850, 1852, 3193], 2061)
-    femmesh.addVolume([1020, 1090, 1104, 1172, 2208, 2741, 2130, 3424, 3396, 2568], 2062)
-    femmesh.addVolume([122, 127, 1107, 1210, 562, 3140, 3460, 3475, 2699, 1733], 2063)
-    femmesh.addVolume([1, 167, 75, 1063, 182, 191, 186, 3338, 3110, 2102], 2064)
-    femmesh.addVolume([1125, 806, 1133, 1141, 3042, 2095, 3384, 3303, 1293, 3032], 2065)
-    femmesh.addVolume([7, 87, 8, 1238, 203, 202, 17, 3530, 3280, 2953], 2066)
-    femmesh.addVolume([825, 1141, 1118, 1187, 3492, 3175, 3298, 1791, 3531, 3410], 2067)
-    femmesh.addVolume([633, 634, 1113, 1146, 689, 3494, 2589, 3009, 1651, 2190], 2068)
-    femmesh.addVolume([48, 1109, 105, 1214, 3262, 1691, 256, 3263, 2475, 2529], 2069)
-    femmesh.addVolume([26, 618, 636, 1243, 666, 670, 660, 2651, 3256, 3532], 2070)
-    femmesh.addVolume([101, 147, 59, 1097, 338, 336, 328, 2321, 2059, 3373], 2071)
-    femmesh.addVolume([1036, 990, 1099, 1199, 1394, 1891, 2934, 1396, 1395, 3356], 2072)
-    femmesh.addVolume([108, 1151, 125, 1152, 3533, 1931, 272, 3534, 2540, 2539], 2073)
-    femmesh.addVolume([1008, 1173, 1038, 1185, 2976, 2186, 1463, 1464, 2678, 1465], 2074)
-    femmesh.addVolume([1017, 998, 1053, 1219, 2992, 2993, 2763, 2988, 1578, 2803], 2075)
-    femmesh.addVolume([1027, 994, 1203, 1226, 3182, 2983, 3072, 3517, 1779, 3313], 2076)
-    femmesh.addVolume([1015, 1074, 1032, 1170, 2020, 2021, 2022, 1426, 3151, 1474], 2077)
-    femmesh.addVolume([992, 1113, 1039, 1199, 3422, 3271, 2115, 2116, 2189, 1702], 2078)
-    femmesh.addVolume([1028, 1068, 1115, 1125, 1673, 2980, 2981, 2644, 1794, 3214], 2079)
-    femmesh.addVolume([89, 88, 65, 1142, 259, 358, 368, 1734, 1468, 3505], 2080)
-    femmesh.addVolume([1003, 1049, 1053, 1100, 3114, 2994, 3498, 3374, 3535, 3536], 2081)
-    femmesh.addVolume([983, 1161, 1112, 1244, 2164, 2007, 2162, 2978, 3125, 3317], 2082)
-    femmesh.addVolume([999, 1210, 1107, 1239, 1706, 1733, 1337, 2159, 3490, 2341], 2083)
-    femmesh.addVolume([126, 1107, 127, 1167, 2354, 3140, 575, 2356, 2105, 2698], 2084)
-    femmesh.addVolume([137, 140, 1085, 1220, 443, 3281, 3238, 3239, 3312, 3240], 2085)
-    femmesh.addVolume([11, 1006, 49, 1143, 2957, 2686, 227, 2959, 1501, 3226], 2086)
-    femmesh.addVolume([619, 617, 618, 1157, 768, 767, 676, 2308, 2781, 2661], 2087)
-    femmesh.addVolume([1203, 1002, 1226, 1236, 1951, 3515, 3313, 3314, 1835, 3294], 2088)
-    femmesh.addVolume([77, 79, 76, 1148, 404, 405, 403, 3496, 2211, 2961], 2089)
-    femmesh.addVolume([1007, 1066, 1078, 1218, 3459, 3305, 3537, 1588, 3306, 2635], 2090)
-    femmesh.addVolume([1138, 1095, 1160, 1238, 2548, 2849, 2924, 2619, 3055, 3386], 2091)
-    femmesh.addVolume([97, 98, 1153, 1193, 485, 3098, 3155, 3227, 3099, 1571], 2092)
-    femmesh.addVolume([1021, 996, 1172, 1239, 3344, 1609, 2656, 3191, 1967, 3288], 2093)
-    femmesh.addVolume([39, 1115, 1125, 1197, 3112, 3214, 1972, 2902, 3538, 2903], 2094)
-    femmesh.addVolume([5, 41, 841, 1222, 47, 844, 845, 3310, 3107, 3311], 2095)
-    femmesh.addVolume([2, 171, 1035, 1238, 195, 2869, 3359, 3385, 2870, 2413], 2096)
-    femmesh.addVolume([4, 645, 630, 1181, 664, 665, 658, 3539, 3540, 2750], 2097)
-    femmesh.addVolume([8, 170, 7, 1238, 204, 205, 17, 2953, 1975, 3530], 2098)
-    femmesh.addVolume([1029, 1010, 1137, 1223, 2226, 1817, 2228, 3188, 2898, 3137], 2099)
-    femmesh.addVolume([633, 29, 634, 1146, 680, 687, 689, 3009, 2617, 1651], 2100)
-    femmesh.addVolume([131, 1130, 132, 1198, 3393, 3481, 566, 3395, 2666, 3482], 2101)
-    femmesh.addVolume([806, 805, 38, 1125, 870, 866, 861, 3042, 1971, 1970], 2102)
-    femmesh.addVolume([1052, 1025, 1128, 1202, 2249, 2483, 3031, 2769, 3017, 2288], 2103)
-    femmesh.addVolume([802, 808, 6, 1098, 856, 852, 855, 3205, 3519, 3541], 2104)
-    femmesh.addVolume([1062, 1081, 1030, 1243, 2161, 2160, 2137, 3255, 3430, 3438], 2105)
-    femmesh.addVolume([618, 1079, 1062, 1157, 3247, 3428, 2646, 2661, 3429, 2709], 2106)
-    femmesh.addVolume([999, 1021, 1209, 1239, 2623, 3106, 3000, 2159, 3191, 3190], 2107)
-    femmesh.addVolume([1017, 1066, 1078, 1150, 3304, 3305, 2762, 3105, 3542, 3327], 2108)
-    femmesh.addVolume([984, 1083, 1156, 1182, 1682, 1776, 1765, 1618, 2224, 2714], 2109)
-    femmesh.addVolume([1061, 1101, 1060, 1169, 2772, 3164, 3543, 3376, 3513, 3302], 2110)
-    femmesh.addVolume([801, 808, 1098, 1118, 905, 3519, 3204, 3343, 3297, 3409], 2111)
-    femmesh.addVolume([817, 1075, 836, 1212, 1529, 3544, 883, 2862, 1566, 2873], 2112)
-    femmesh.addVolume([107, 106, 175, 1132, 519, 524, 525, 2338, 3087, 2554], 2113)
-    femmesh.addVolume([39, 40, 816, 1122, 45, 874, 869, 3545, 2715, 3514], 2114)
-    femmesh.addVolume([628, 1090, 1117, 1195, 1533, 3062, 2819, 3452, 3398, 3529], 2115)
-    femmesh.addVolume([1130, 1013, 1193, 1236, 1574, 1360, 2931, 2930, 1943, 1944], 2116)
-    femmesh.addVolume([1009, 1091, 1064, 1157, 2276, 3043, 1602, 2977, 3455, 2593], 2117)
-    femmesh.addVolume([54, 55, 149, 1227, 287, 298, 299, 3145, 2949, 3030], 2118)
-    femmesh.addVolume([622, 1066, 1078, 1230, 2524, 3305, 2326, 2488, 3200, 2489], 2119)
-    femmesh.addVolume([989, 1095, 1138, 1238, 2547, 2548, 1643, 1976, 3055, 2619], 2120)
-    femmesh.addVolume([56, 178, 994, 1203, 309, 1991, 2927, 3488, 2984, 2983], 2121)
-    femmesh.addVolume([68, 1103, 9, 1178, 3100, 1626, 214, 3478, 1630, 1629], 2122)
-    femmesh.addVolume([1002, 1027, 1203, 1226, 2882, 3072, 1951, 3515, 3517, 3313], 2123)
-    femmesh.addVolume([618, 617, 1079, 1157, 767, 3248, 3247, 2661, 2781, 3429], 2124)
-    femmesh.addVolume([820, 819, 803, 1131, 914, 915, 916, 2756, 1459, 1525], 2125)
-    femmesh.addVolume([160, 12, 80, 1116, 235, 229, 237, 2921, 1854, 3241], 2126)
-    femmesh.addVolume([1009, 1073, 1040, 1217, 1283, 2799, 2820, 2315, 3264, 3064], 2127)
-    femmesh.addVolume([77, 78, 1148, 1152, 402, 2739, 3496, 3497, 2725, 2740], 2128)
-    femmesh.addVolume([631, 1100, 1137, 1206, 2309, 2406, 2166, 3320, 3546, 3321], 2129)
-    femmesh.addVolume([176, 106, 105, 1057, 523, 516, 522, 2973, 3086, 1690], 2130)
-    femmesh.addVolume([89, 156, 10, 1143, 225, 216, 223, 1736, 2844, 2735], 2131)
-    femmesh.addVolume([129, 125, 1124, 1152, 532, 1932, 3418, 3417, 2539, 2538], 2132)
-    femmesh.addVolume([144, 139, 165, 1126, 586, 596, 537, 2383, 2271, 1423], 2133)
-    femmesh.addVolume([1061, 637, 1137, 1223, 1661, 2575, 2794, 2900, 2971, 3137], 2134)
-    femmesh.addVolume([1052, 1128, 1159, 1240, 3031, 3547, 2887, 2833, 2440, 2920], 2135)
-    femmesh.addVolume([2, 152, 1160, 1227, 197, 3405, 3360, 3477, 3407, 3269], 2136)
-    femmesh.addVolume([641, 625, 1106, 1195, 786, 3278, 3277, 2669, 3453, 3548], 2137)
-    femmesh.addVolume([996, 1166, 1172, 1239, 1845, 2482, 1609, 1967, 2386, 3288], 2138)
-    femmesh.addVolume([1057, 1216, 1086, 1235, 1913, 1961, 3153, 1916, 1918, 3423], 2139)
-    femmesh.addVolume([1010, 1190, 1220, 1233, 3368, 3124, 2334, 2588, 2147, 3549], 2140)
-    femmesh.addVolume([1030, 1088, 1079, 1243, 2155, 3550, 3437, 3438, 3551, 3439], 2141)
-    femmesh.addVolume([1009, 1064, 1149, 1157, 1602, 1962, 1286, 2977, 2593, 3092], 2142)
-    femmesh.addVolume([822, 1067, 1068, 1154, 1782, 2289, 2468, 3181, 2221, 2736], 2143)
-    femmesh.addVolume([1033, 1018, 1042, 1213, 2481, 2759, 2233, 2045, 2493, 2969], 2144)
-    femmesh.addVolume([1058, 1105, 1155, 1221, 1435, 2057, 2056, 3245, 2537, 2492], 2145)
-    femmesh.addVolume([813, 1096, 818, 1208, 2807, 1355, 949, 3094, 2199, 2584], 2146)
-    femmesh.addVolume([823, 1108, 1067, 1183, 2290, 2891, 1781, 2142, 3552, 2818], 2147)
-    femmesh.addVolume([135, 139, 134, 1070, 584, 585, 582, 2581, 2449, 3077], 2148)
-    femmesh.addVolume([83, 179, 1129, 1134, 441, 3069, 1892, 1857, 3070, 1299], 2149)
-    femmesh.addVolume([1140, 1025, 1175, 1202, 1719, 3013, 3015, 2939, 3017, 2712], 2150)
-    femmesh.addVolume([1093, 1244, 1058, 1245, 2979, 2702, 1898, 2811, 2541, 2703], 2151)
-    femmesh.addVolume([1048, 1139, 646, 1150, 2662, 1664, 1347, 3553, 2572, 3337], 2152)
-    femmesh.addVolume([828, 1186, 835, 1217, 2940, 3216, 913, 2154, 3436, 2765], 2153)
-    femmesh.addVolume([1028, 1115, 1041, 1125, 2981, 3389, 2200, 2644, 3214, 2945], 2154)
-    femmesh.addVolume([637, 610, 641, 1223, 732, 727, 735, 2971, 2972, 3335], 2155)
-    femmesh.addVolume([163, 162, 168, 1058, 388, 478, 353, 2348, 2550, 2696], 2156)
-    femmesh.addVolume([51, 50, 1151, 1201, 264, 3290, 2910, 2911, 3289, 2606], 2157)
-    femmesh.addVolume([150, 118, 116, 1210, 549, 556, 473, 2601, 3141, 3196], 2158)
-    femmesh.addVolume([1032, 1094, 1011, 1096, 3147, 3143, 2170, 2395, 1320, 2394], 2159)
-    femmesh.addVolume([107, 1121, 103, 1132, 2918, 3132, 518, 2338, 2229, 3133], 2160)
-    femmesh.addVolume([88, 65, 1142, 1234, 358, 3505, 1468, 3063, 3506, 2149], 2161)
-    femmesh.addVolume([1036, 1024, 1099, 1196, 1802, 1889, 2934, 1804, 1803, 2470], 2162)
-    femmesh.addVolume([145, 94, 95, 1204, 479, 474, 420, 2688, 3382, 3483], 2163)
-    femmesh.addVolume([79, 145, 95, 1207, 421, 420, 407, 2594, 2360, 3484], 2164)
-    femmesh.addVolume([53, 1080, 54, 1215, 3420, 3073, 288, 3450, 3130, 3129], 2165)
-    femmesh.addVolume([1049, 1139, 1150, 1246, 2743, 2572, 3104, 3554, 1745, 3318], 2166)
-    femmesh.addVolume([14, 141, 142, 1171, 239, 248, 245, 1704, 3357, 1341], 2167)
-    femmesh.addVolume([141, 139, 135, 1171, 590, 584, 589, 3357, 2273, 2582], 2168)
-    femmesh.addVolume([74, 114, 148, 1087, 390, 397, 395, 2083, 2874, 1368], 2169)
-    femmesh.addVolume([993, 1102, 1030, 1231, 1655, 2254, 2077, 1658, 1660, 1513], 2170)
-    femmesh.addVolume([1008, 1104, 1090, 1172, 2497, 2741, 2975, 2567, 2568, 3396], 2171)
-    femmesh.addVolume([62, 10, 1103, 1143, 221, 2733, 2414, 2543, 2735, 2376], 2172)
-    femmesh.addVolume([149, 132, 119, 1130, 465, 564, 301, 3029, 3481, 2824], 2173)
-    femmesh.addVolume([58, 97, 100, 1002, 330, 332, 331, 3222, 3154, 3024], 2174)
-    femmesh.addVolume([987, 1026, 1161, 1245, 1494, 3018, 1940, 2465, 1748, 2810], 2175)
-    femmesh.addVolume([1031, 1079, 1030, 1088, 2280, 3437, 2379, 2381, 3550, 2155], 2176)
-    femmesh.addVolume([157, 89, 65, 1142, 369, 368, 367, 2111, 1734, 3505], 2177)
-    femmesh.addVolume([1030, 1062, 1079, 1237, 2137, 3428, 3437, 1311, 2138, 2283], 2178)
-    femmesh.addVolume([1017, 1007, 1066, 1224, 3458, 3459, 3304, 3065, 2737, 3236], 2179)
-    femmesh.addVolume([1085, 1121, 1134, 1233, 2486, 2231, 3162, 2146, 2851, 3150], 2180)
-    femmesh.addVolume([153, 119, 178, 1111, 302, 317, 565, 2125, 2822, 2825], 2181)
-    femmesh.addVolume([1054, 1071, 1194, 1207, 2570, 2371, 1591, 2362, 2595, 3479], 2182)
-    femmesh.addVolume([157, 65, 67, 1142, 367, 365, 366, 2111, 3505, 1262], 2183)
-    femmesh.addVolume([57, 59, 155, 1003, 319, 320, 321, 3035, 3372, 3060], 2184)
-    femmesh.addVolume([983, 1011, 1221, 1244, 3358, 2174, 3243, 2978, 3316, 3324], 2185)
-    femmesh.addVolume([87, 163, 72, 1163, 387, 351, 212, 3167, 2636, 3468], 2186)
-    femmesh.addVolume([1067, 822, 1068, 1108, 1782, 2468, 2289, 2891, 2292, 3370], 2187)
-    femmesh.addVolume([1107, 1210, 984, 1239, 1733, 1621, 3128, 2341, 3490, 3142], 2188)
-    femmesh.addVolume([983, 1112, 1194, 1221, 2162, 2728, 2729, 3243, 3252, 2173], 2189)
-    femmesh.addVolume([1010, 1190, 1029, 1220, 3368, 2622, 2226, 2334, 3124, 3123], 2190)
-    femmesh.addVolume([1012, 988, 1060, 1174, 2008, 2210, 3464, 2943, 1372, 2909], 2191)
-    femmesh.addVolume([137, 138, 173, 1134, 591, 529, 444, 3237, 3161, 2996], 2192)
-    femmesh.addVolume([646, 1091, 1048, 1150, 2877, 2879, 1347, 3337, 3555, 3553], 2193)
-    femmesh.addVolume([1060, 1010, 1061, 1137, 1816, 2420, 3543, 1818, 1817, 2794], 2194)
-    femmesh.addVolume([39, 816, 1115, 1122, 869, 2853, 3112, 3545, 3514, 3390], 2195)
-    femmesh.addVolume([838, 837, 839, 1189, 982, 847, 980, 2089, 2169, 2090], 2196)
-    femmesh.addVolume([825, 824, 807, 1141, 925, 895, 924, 3492, 2950, 1292], 2197)
-    femmesh.addVolume([1124, 1017, 1218, 1219, 3503, 2764, 1722, 3139, 2988, 2802], 2198)
-    femmesh.addVolume([97, 96, 1193, 1236, 329, 3556, 3227, 3156, 3557, 1944], 2199)
-    femmesh.addVolume([808, 6, 1098, 1192, 852, 3541, 3519, 3254, 3296, 3558], 2200)
-    femmesh.addVolume([142, 135, 133, 1070, 583, 581, 250, 1322, 2581, 2785], 2201)
-    femmesh.addVolume([37, 808, 806, 1192, 851, 864, 860, 3295, 3254, 1895], 2202)
-    femmesh.addVolume([131, 130, 1193, 1198, 558, 3559, 3394, 3395, 3560, 2932], 2203)
-    femmesh.addVolume([53, 55, 54, 1080, 286, 287, 288, 3420, 2947, 3073], 2204)
-    femmesh.addVolume([113, 111, 161, 1167, 538, 378, 543, 1640, 2754, 3285], 2205)
-    femmesh.addVolume([614, 1076, 613, 1135, 2408, 2407, 750, 3411, 3561, 3521], 2206)
-    femmesh.addVolume([48, 180, 105, 1109, 242, 258, 256, 3262, 3323, 1691], 2207)
-    femmesh.addVolume([620, 1078, 1110, 1232, 2780, 3348, 2719, 1252, 2477, 2720], 2208)
-    femmesh.addVolume([1034, 1081, 1117, 1181, 2423, 1906, 2638, 2427, 2426, 2749], 2209)
-    femmesh.addVolume([76, 52, 1151, 1207, 282, 3387, 3067, 3088, 3388, 2608], 2210)
-    femmesh.addVolume([58, 1002, 1203, 1236, 3222, 1951, 3223, 3502, 1835, 3314], 2211)
-    femmesh.addVolume([48, 12, 13, 1109, 232, 22, 233, 3262, 1934, 3022], 2212)
-    femmesh.addVolume([801, 825, 1118, 1187, 908, 3298, 3343, 3003, 1791, 3410], 2213)
-    femmesh.addVolume([29, 30, 1146, 1173, 35, 1649, 2617, 2377, 2042, 2185], 2214)
-    femmesh.addVolume([1007, 1022, 1031, 1127, 2519, 2380, 2004, 2120, 2522, 2314], 2215)
-    femmesh.addVolume([625, 1179, 1117, 1181, 2612, 3562, 2506, 2748, 3563, 2749], 2216)
-    femmesh.addVolume([822, 1115, 816, 1154, 2854, 2853, 871, 3181, 2982, 3224], 2217)
-    femmesh.addVolume([622, 1066, 646, 1150, 2524, 2526, 781, 3449, 3542, 3337], 2218)
-    femmesh.addVolume([825, 1141, 1043, 1158, 3492, 1985, 3564, 2782, 3319, 2029], 2219)
-    femmesh.addVolume([136, 138, 137, 1085, 573, 591, 592, 3326, 3160, 3238], 2220)
-    femmesh.addVolume([1030, 1044, 1088, 1243, 2079, 2156, 2155, 3438, 3565, 3551], 2221)
-    femmesh.addVolume([122, 172, 117, 1210, 561, 498, 560, 3475, 1705, 2722], 2222)
-    femmesh.addVolume([4, 636, 1088, 1243, 659, 2991, 2990, 2652, 3532, 3551], 2223)
-    femmesh.addVolume([40, 817, 816, 1122, 879, 881, 874, 2715, 2717, 3514], 2224)
-    femmesh.addVolume([2, 1160, 73, 1238, 3360, 3258, 194, 3385, 3386, 3491], 2225)
-    femmesh.addVolume([12, 11, 80, 1116, 21, 228, 229, 1854, 2958, 3241], 2226)
-    femmesh.addVolume([151, 86, 1129, 1225, 396, 2243, 3566, 3567, 2535, 2536], 2227)
-    femmesh.addVolume([120, 56, 119, 1130, 314, 316, 315, 3507, 2926, 2824], 2228)
-    femmesh.addVolume([1042, 1141, 1118, 1192, 2760, 3175, 2963, 2302, 1894, 2965], 2229)
-    femmesh.addVolume([62, 80, 11, 1143, 231, 228, 220, 2543, 3242, 2959], 2230)
-    femmesh.addVolume([816, 1154, 1122, 1212, 3224, 3568, 3514, 2863, 2329, 3504], 2231)
-    femmesh.addVolume([165, 164, 109, 1229, 535, 347, 534, 2367, 3569, 3185], 2232)
-    femmesh.addVolume([618, 1062, 1079, 1243, 2646, 3428, 3247, 3256, 3255, 3439], 2233)
-    femmesh.addVolume([155, 129, 1124, 1219, 326, 3418, 3509, 3061, 3419, 3139], 2234)
-    femmesh.addVolume([802, 1082, 1098, 1186, 1830, 1521, 3205, 2941, 3253, 3570], 2235)
-    femmesh.addVolume([1021, 1172, 1046, 1195, 2656, 2919, 3345, 3571, 3400, 3399], 2236)
-    femmesh.addVolume([986, 1121, 1175, 1233, 2230, 3351, 2711, 3149, 2851, 3273], 2237)
-    femmesh.addVolume([801, 1098, 1082, 1187, 3204, 1521, 1829, 3003, 3165, 2452], 2238)
-    femmesh.addVolume([1017, 1139, 1048, 1150, 2967, 2662, 3572, 3105, 2572, 3553], 2239)
-    femmesh.addVolume([13, 14, 180, 1109, 23, 241, 240, 3022, 1389, 3323], 2240)
-    femmesh.addVolume([1009, 1079, 1091, 1157, 2279, 2565, 2276, 2977, 3429, 3455], 2241)
-    femmesh.addVolume([1034, 1021, 1165, 1209, 2624, 2655, 2347, 2576, 3106, 2363], 2242)
-    femmesh.addVolume([5, 840, 1211, 1240, 849, 1758, 3573, 3146, 2706, 3004], 2243)
-    femmesh.addVolume([30, 634, 29, 1146, 686, 687, 35, 1649, 1651, 2617], 2244)
-    femmesh.addVolume([138, 121, 102, 1121, 513, 510, 507, 3159, 2793, 1879], 2245)
-    femmesh.addVolume([625, 632, 614, 1179, 761, 753, 760, 2612, 3527, 2610], 2246)
-    femmesh.addVolume([986, 1175, 1140, 1233, 2711, 3015, 2936, 3149, 3273, 2313], 2247)
-    femmesh.addVolume([1075, 817, 1122, 1212, 1529, 2717, 2716, 1566, 2862, 3504], 2248)
-    femmesh.addVolume([70, 87, 73, 1095, 385, 206, 382, 2845, 3168, 3257], 2249)
-    femmesh.addVolume([836, 1074, 1075, 1222, 3402, 2641, 3544, 2480, 3403, 1911], 2250)
-    femmesh.addVolume([1160, 1035, 1227, 1231, 3266, 3217, 3269, 2830, 2530, 2752], 2251)
-    femmesh.addVolume([140, 177, 136, 1085, 501, 576, 593, 3281, 2139, 3326], 2252)
-    femmesh.addVolume([1048, 1091, 1112, 1224, 2879, 2278, 1729, 1730, 3209, 1731], 2253)
-    femmesh.addVolume([633, 619, 28, 1164, 683, 672, 681, 2175, 2033, 2032], 2254)
-    femmesh.addVolume([61, 163, 168, 1163, 352, 353, 342, 3177, 2636, 3446], 2255)
-    femmesh.addVolume([994, 1027, 1045, 1226, 3182, 3259, 1268, 1779, 3517, 1780], 2256)
-    femmesh.addVolume([1010, 1060, 1061, 1101, 1816, 3543, 2420, 1536, 3164, 2772], 2257)
-    femmesh.addVolume([83, 140, 137, 1220, 434, 443, 442, 1860, 3312, 3239], 2258)
-    femmesh.addVolume([1011, 1161, 1026, 1244, 2267, 3018, 3136, 3316, 3125, 1557], 2259)
-    femmesh.addVolume([1020, 1043, 1104, 1187, 3510, 3284, 2130, 2503, 3443, 1614], 2260)
-    femmesh.addVolume([77, 1148, 146, 1177, 3496, 3574, 410, 3522, 2216, 3575], 2261)
-    femmesh.addVolume([71, 53, 63, 1201, 294, 293, 276, 3173, 3421, 3465], 2262)
-    femmesh.addVolume([53, 71, 69, 1080, 294, 296, 291, 3420, 3171, 3231], 2263)
-    femmesh.addVolume([804, 805, 807, 1133, 875, 919, 894, 3432, 2094, 2096], 2264)
-    femmesh.addVolume([1062, 1009, 1079, 1237, 1796, 2279, 3428, 2138, 2281, 2283], 2265)
-    femmesh.addVolume([81, 100, 140, 1220, 435, 437, 433, 3261, 3225, 3312], 2266)
-    femmesh.addVolume([1052, 1055, 1084, 1159, 2252, 2665, 1753, 2887, 2889, 3416], 2267)
-    femmesh.addVolume([92, 116, 130, 1198, 471, 472, 461, 2840, 3380, 3560], 2268)
-    femmesh.addVolume([620, 1078, 622, 1228, 2780, 2326, 747, 3299, 3220, 3300], 2269)
-    femmesh.addVolume([1017, 1048, 1139, 1241, 3572, 2662, 2967, 2968, 2064, 2745], 2270)
-    femmesh.addVolume([170, 112, 171, 1182, 542, 470, 207, 2223, 3081, 2868], 2271)
-    femmesh.addVolume([1045, 1076, 1013, 1135, 2770, 2435, 1572, 3576, 3561, 3577], 2272)
-    femmesh.addVolume([806, 1125, 37, 1192, 3042, 3041, 860, 1895, 2301, 3295], 2273)
-    femmesh.addVolume([636, 618, 1079, 1243, 670, 3247, 3246, 3532, 3256, 3439], 2274)
-    femmesh.addVolume([1121, 996, 1175, 1233, 2331, 3014, 3351, 2851, 2148, 3273], 2275)
-    femmesh.addVolume([1140, 1184, 1202, 1216, 2938, 3578, 2939, 3117, 3116, 1569], 2276)
-    femmesh.addVolume([625, 623, 1106, 1179, 759, 3279, 3278, 2612, 2611, 2260], 2277)
-    femmesh.addVolume([12, 49, 11, 1006, 226, 227, 21, 1853, 2686, 2957], 2278)
-    femmesh.addVolume([53, 63, 1201, 1215, 293, 3465, 3421, 3450, 3466, 3292], 2279)
-    femmesh.addVolume([624, 1137, 637, 1223, 2165, 2575, 783, 3089, 3137, 2971], 2280)
-    femmesh.addVolume([149, 119, 54, 1111, 301, 300, 299, 3028, 2822, 3074], 2281)
-    femmesh.addVolume([1086, 1145, 1057, 1235, 2335, 1479, 3153, 3423, 3341, 1916], 2282)
-    femmesh.addVolume([1023, 1051, 1075, 1122, 2432, 1667, 2317, 2523, 2444, 2716], 2283)
-    femmesh.addVolume([1026, 1073, 1094, 1183, 3102, 1624, 3456, 3579, 3501, 3021], 2284)
-    femmesh.addVolume([1148, 985, 1168, 1177, 3134, 3057, 2248, 2216, 3126, 3367], 2285)
-    femmesh.addVolume([829, 826, 1104, 1158, 971, 1612, 3071, 3048, 2783, 2591], 2286)
-    femmesh.addVolume([122, 118, 127, 1210, 559, 548, 562, 3475, 3141, 2699], 2287)
-    femmesh.addVolume([1048, 1066, 1091, 1224, 3580, 3235, 2879, 1730, 3236, 3209], 2288)
-    femmesh.addVolume([131, 1130, 1193, 1236, 3393, 2931, 3394, 3581, 2930, 1944], 2289)
-    femmesh.addVolume([1184, 1019, 1202, 1216, 2915, 1567, 3578, 3116, 1406, 1569], 2290)
-    femmesh.addVolume([181, 158, 170, 1191, 600, 544, 213, 2628, 3414, 2319], 2291)
-    femmesh.addVolume([825, 1043, 1141, 1187, 3564, 1985, 3492, 1791, 3443, 3531], 2292)
-    femmesh.addVolume([1022, 1078, 1088, 1232, 3178, 3286, 2157, 3582, 2477, 2836], 2293)
-    femmesh.addVolume([51, 52, 93, 1207, 263, 274, 275, 2912, 3388, 2559], 2294)
-    femmesh.addVolume([642, 1060, 1119, 1169, 1248, 1852, 1851, 1540, 3302, 3091], 2295)
-    femmesh.addVolume([90, 2, 171, 1035, 199, 195, 201, 3265, 3359, 2869], 2296)
-    femmesh.addVolume([624, 621, 631, 1180, 764, 703, 777, 1709, 3379, 3275], 2297)
-    femmesh.addVolume([1043, 1020, 1104, 1172, 3510, 2130, 3284, 1610, 3424, 2568], 2298)
-    femmesh.addVolume([153, 128, 124, 1215, 580, 579, 297, 3109, 2603, 2867], 2299)
-    femmesh.addVolume([1037, 1015, 1074, 1075, 1581, 2020, 3044, 1910, 1562, 2641], 2300)
-    femmesh.addVolume([81, 140, 83, 1220, 433, 434, 428, 3261, 3312, 1860], 2301)
-    femmesh.addVolume([999, 1209, 1210, 1239, 3000, 3489, 1706, 2159, 3190, 3490], 2302)
-    femmesh.addVolume([14, 142, 15, 1145, 245, 244, 24, 1478, 1325, 3184], 2303)
-    femmesh.addVolume([15, 169, 176, 1057, 184, 253, 247, 3183, 3082, 2973], 2304)
-    femmesh.addVolume([987, 1127, 1030, 1231, 1939, 2512, 1308, 1512, 2831, 1513], 2305)
-    femmesh.addVolume([92, 90, 171, 1035, 456, 201, 460, 3008, 3265, 2869], 2306)
-    femmesh.addVolume([1035, 1138, 1160, 1238, 1644, 2924, 3266, 2413, 2619, 3386], 2307)
-    femmesh.addVolume([626, 1088, 636, 1230, 2834, 2991, 742, 2490, 3287, 3583], 2308)
-    femmesh.addVolume([823, 6, 1108, 1186, 853, 3401, 2290, 3363, 3364, 3584], 2309)
-    femmesh.addVolume([1048, 1039, 1113, 1139, 3369, 3271, 2344, 2662, 2742, 3442], 2310)
-    femmesh.addVolume([998, 1200, 1003, 1219, 1575, 2680, 3113, 1578, 1580, 3039], 2311)
-    femmesh.addVolume([1026, 1040, 1073, 1183, 1333, 2799, 3102, 3579, 3585, 3501], 2312)
-    femmesh.addVolume([1169, 1038, 1173, 1185, 3586, 2186, 2041, 2880, 1465, 2678], 2313)
-    femmesh.addVolume([2, 90, 152, 1227, 199, 200, 197, 3477, 3268, 3407], 2314)
-    femmesh.addVolume([37, 1108, 6, 1192, 2291, 3401, 42, 3295, 3587, 3296], 2315)
-    femmesh.addVolume([610, 1185, 1195, 1223, 3211, 3495, 2670, 2972, 3467, 3336], 2316)
-    femmesh.addVolume([5, 1092, 1211, 1222, 3308, 1982, 3573, 3310, 1414, 3588], 2317)
-    femmesh.addVolume([158, 157, 67, 1191, 379, 366, 376, 3414, 2113, 1523], 2318)
-    femmesh.addVolume([57, 1124, 178, 1203, 3375, 1989, 310, 3036, 2985, 2984], 2319)
-    femmesh.addVolume([134, 133, 1070, 1168, 553, 2785, 3077, 3366, 3589, 3058], 2320)
-    femmesh.addVolume([138, 103, 107, 1121, 506, 518, 520, 3159, 3132, 2918], 2321)
-    femmesh.addVolume([610, 607, 606, 1185, 725, 720, 724, 3211, 2264, 2263], 2322)
-    femmesh.addVolume([811, 1094, 1067, 1154, 1271, 2455, 1783, 1874, 1876, 2221], 2323)
-    femmesh.addVolume([12, 48, 49, 1214, 232, 236, 226, 2474, 3263, 2687], 2324)
-    femmesh.addVolume([112, 111, 113, 1182, 540, 538, 539, 3081, 3097, 1619], 2325)
-    femmesh.addVolume([999, 1209, 1089, 1210, 3000, 2448, 2998, 1706, 3489, 2602], 2326)
-    femmesh.addVolume([1031, 1066, 1007, 1224, 3234, 3459, 2004, 2861, 3236, 2737], 2327)
-    femmesh.addVolume([632, 645, 1076, 1181, 756, 2789, 2409, 2779, 3540, 2629], 2328)
-    femmesh.addVolume([148, 114, 174, 1087, 397, 451, 453, 1368, 2874, 3206], 2329)
-    femmesh.addVolume([93, 168, 162, 1204, 476, 478, 280, 2558, 2697, 2551], 2330)
-    femmesh.addVolume([76, 1151, 108, 1152, 3067, 3533, 284, 3002, 2540, 3534], 2331)
-    femmesh.addVolume([646, 647, 639, 1150, 797, 708, 782, 3337, 2571, 3131], 2332)
-    femmesh.addVolume([146, 1148, 1168, 1177, 3574, 2248, 3590, 3575, 2216, 3367], 2333)
-    femmesh.addVolume([1025, 1052, 1128, 1159, 2249, 3031, 2483, 2888, 2887, 3547], 2334)
-    femmesh.addVolume([131, 120, 1130, 1236, 488, 3507, 3393, 3581, 3508, 2930], 2335)
-    femmesh.addVolume([90, 1198, 91, 1227, 3270, 3591, 458, 3268, 2751, 3592], 2336)
-    femmesh.addVolume([140, 99, 177, 1153, 499, 500, 501, 3282, 3511, 2140], 2337)
-    femmesh.addVolume([829, 1104, 1128, 1158, 3071, 2892, 3208, 3048, 2591, 3427], 2338)
-    femmesh.addVolume([5, 839, 1189, 1211, 846, 2090, 3365, 3573, 3451, 3593], 2339)
-    femmesh.addVolume([841, 41, 798, 1114, 844, 876, 882, 2855, 2085, 2615], 2340)
-    femmesh.addVolume([1003, 1027, 1053, 1219, 2883, 2632, 3498, 3039, 2801, 2803], 2341)
-    femmesh.addVolume([1080, 1160, 1227, 1231, 2935, 3269, 2948, 3441, 2830, 2752], 2342)
-    femmesh.addVolume([1066, 1031, 1078, 1230, 3234, 3499, 3305, 3200, 3500, 2489], 2343)
-    femmesh.addVolume([824, 1158, 800, 1159, 2784, 3049, 892, 1615, 3526, 2681], 2344)
-    femmesh.addVolume([606, 1090, 628, 1195, 2989, 1533, 722, 2671, 3398, 3452], 2345)
-    femmesh.addVolume([1048, 1039, 1139, 1241, 3369, 2742, 2662, 2064, 2505, 2745], 2346)
-    femmesh.addVolume([822, 1068, 1115, 1154, 2468, 2980, 2854, 3181, 2736, 2982], 2347)
-    femmesh.addVolume([151, 1129, 175, 1235, 3566, 2553, 598, 3594, 3595, 3085], 2348)
-    femmesh.addVolume([1030, 1081, 1044, 1243, 2160, 2424, 2079, 3438, 3430, 3565], 2349)
-    femmesh.addVolume([138, 102, 103, 1121, 507, 505, 506, 3159, 1879, 3132], 2350)
-    femmesh.addVolume([94, 109, 168, 1204, 482, 348, 477, 3382, 2776, 2697], 2351)
-    femmesh.addVolume([72, 1163, 68, 1178, 3468, 3101, 218, 3469, 3170, 3478], 2352)
-    femmesh.addVolume([986, 1140, 1175, 1202, 2936, 3015, 2711, 2517, 2939, 2712], 2353)
-    femmesh.addVolume([1084, 798, 1114, 1159, 3330, 2615, 2562, 3416, 2682, 3457], 2354)
-    femmesh.addVolume([798, 804, 1084, 1197, 880, 3331, 3330, 3095, 3293, 1946], 2355)
-    femmesh.addVolume([1013, 1072, 1076, 1179, 1357, 3596, 2435, 3597, 2402, 3528], 2356)
-    femmesh.addVolume([1027, 1110, 1045, 1226, 3347, 3346, 3259, 3517, 3598, 1780], 2357)
-    femmesh.addVolume([164, 165, 166, 1229, 535, 597, 427, 3569, 2367, 2723], 2358)
-    femmesh.addVolume([136, 137, 140, 1085, 592, 443, 593, 3326, 3238, 3281], 2359)
-    femmesh.addVolume([1012, 1069, 1060, 1101, 2858, 3512, 3464, 1515, 2859, 3164], 2360)
-    femmesh.addVolume([1089, 1209, 984, 1210, 2448, 1768, 2447, 2602, 3489, 1621], 2361)
-    femmesh.addVolume([1069, 1038, 1146, 1173, 2796, 2180, 2616, 2933, 2186, 2185], 2362)
-    femmesh.addVolume([824, 800, 799, 1159, 892, 887, 891, 1615, 2681, 1616], 2363)
-    femmesh.addVolume([1020, 1043, 1165, 1172, 3510, 3166, 2757, 3424, 1610, 2657], 2364)
-    femmesh.addVolume([1092, 1211, 1059, 1240, 1982, 1981, 1978, 2439, 3004, 2708], 2365)
-    femmesh.addVolume([124, 50, 63, 1215, 270, 266, 269, 2867, 3291, 3466], 2366)
-    femmesh.addVolume([1014, 1103, 1163, 1178, 2590, 2417, 2816, 2145, 1630, 3170], 2367)
-    femmesh.addVolume([986, 1140, 1202, 1216, 2936, 2939, 2517, 1914, 3117, 1569], 2368)
-    femmesh.addVolume([611, 1205, 1088, 1232, 3355, 3354, 2835, 1771, 3435, 2836], 2369)
-    femmesh.addVolume([614, 1076, 1135, 1179, 2408, 3561, 3411, 2610, 3528, 3599], 2370)
-    femmesh.addVolume([646, 1066, 1091, 1150, 2526, 3235, 2877, 3337, 3542, 3555], 2371)
-    femmesh.addVolume([171, 112, 92, 1182, 470, 469, 460, 2868, 3081, 2838], 2372)
-    femmesh.addVolume([1088, 1044, 1205, 1243, 2156, 3433, 3354, 3551, 3565, 3600], 2373)
-    femmesh.addVolume([638, 1137, 1060, 1169, 2167, 1818, 1249, 1542, 2411, 3302], 2374)
-    femmesh.addVolume([1012, 1049, 1060, 1119, 2684, 3601, 3464, 3470, 3471, 1852], 2375)
-    femmesh.addVolume([179, 86, 83, 1129, 440, 438, 441, 3069, 2243, 1892], 2376)
-    femmesh.addVolume([1002, 1072, 1047, 1226, 1833, 3493, 2884, 3515, 3602, 3516], 2377)
-    femmesh.addVolume([625, 632, 1179, 1181, 761, 3527, 2612, 2748, 2779, 3563], 2378)
-    femmesh.addVolume([617, 1091, 627, 1230, 3454, 2881, 773, 3603, 3604, 2761], 2379)
-    femmesh.addVolume([69, 71, 70, 1093, 296, 380, 381, 3230, 3172, 2846], 2380)
-    femmesh.addVolume([155, 78, 129, 1152, 417, 419, 326, 3377, 2725, 3417], 2381)
-    femmesh.addVolume([605, 28, 640, 1176, 678, 674, 682, 2533, 1547, 1998], 2382)
-    femmesh.addVolume([1031, 1022, 1078, 1088, 2380, 3178, 3499, 2381, 2157, 3286], 2383)
-    femmesh.addVolume([14, 13, 141, 1171, 23, 238, 239, 1704, 3023, 3357], 2384)
-    femmesh.addVolume([1076, 1044, 1205, 1232, 2436, 3433, 3605, 3524, 3434, 3435], 2385)
-    femmesh.addVolume([617, 636, 1079, 1230, 769, 3246, 3248, 3603, 3583, 3606], 2386)
-    femmesh.addVolume([604, 1119, 1139, 1242, 2476, 3186, 1362, 3607, 3463, 3608], 2387)
-    femmesh.addVolume([798, 1084, 1114, 1197, 3330, 2562, 2615, 3095, 1946, 2564], 2388)
-    femmesh.addVolume([1104, 1043, 1158, 1187, 3284, 2029, 2591, 1614, 3443, 2790], 2389)
-    femmesh.addVolume([166, 80, 164, 1229, 425, 354, 427, 2723, 3415, 3569], 2390)
-    femmesh.addVolume([1039, 1049, 1119, 1139, 2683, 3471, 3462, 2742, 2743, 3186], 2391)
-    femmesh.addVolume([1007, 1078, 1022, 1218, 3537, 3178, 2519, 1588, 2635, 2896], 2392)
-    femmesh.addVolume([838, 1074, 1189, 1208, 3404, 3047, 2089, 2586, 2198, 2672], 2393)
-    femmesh.addVolume([841, 1092, 1114, 1240, 3309, 1411, 2855, 1497, 2439, 2856], 2394)
-    femmesh.addVolume([833, 821, 834, 1162, 966, 973, 975, 1773, 2018, 1756], 2395)
-    femmesh.addVolume([1072, 1013, 1135, 1226, 1357, 3577, 3413, 3602, 1778, 3609], 2396)
-    femmesh.addVolume([10, 68, 62, 1103, 215, 224, 221, 2733, 3100, 2414], 2397)
-    femmesh.addVolume([1069, 3, 1119, 1169, 2132, 2676, 3197, 3215, 2324, 3091], 2398)
-    femmesh.addVolume([84, 78, 85, 1200, 409, 415, 416, 2038, 2727, 3610], 2399)
-    femmesh.addVolume([645, 1076, 1205, 1232, 2789, 3605, 3611, 3525, 3524, 3435], 2400)
-    femmesh.addVolume([823, 1183, 835, 1186, 2142, 3333, 859, 3363, 3612, 3216], 2401)
-    femmesh.addVolume([1073, 810, 1183, 1217, 1291, 2141, 3501, 3264, 2766, 3334], 2402)
-    femmesh.addVolume([63, 50, 51, 1201, 266, 264, 265, 3465, 3289, 2911], 2403)
-    femmesh.addVolume([151, 1225, 1129, 1235, 3567, 2536, 3566, 3594, 3362, 3595], 2404)
-    femmesh.addVolume([127, 126, 122, 1107, 575, 570, 562, 3140, 2354, 3460], 2405)
-    femmesh.addVolume([117, 116, 118, 1210, 496, 556, 557, 2722, 3196, 3141], 2406)
-    femmesh.addVolume([101, 59, 58, 1203, 328, 318, 327, 2322, 3518, 3223], 2407)
-    femmesh.addVolume([139, 141, 166, 1171, 590, 595, 594, 2273, 3357, 2692], 2408)
-    femmesh.addVolume([62, 164, 80, 1229, 345, 354, 231, 2738, 3569, 3415], 2409)
-    femmesh.addVolume([4, 645, 1181, 1205, 664, 3540, 3539, 3353, 3611, 3613], 2410)
-    femmesh.addVolume([164, 62, 60, 1229, 345, 339, 344, 3569, 2738, 2074], 2411)
-    femmesh.addVolume([55, 53, 69, 1080, 286, 291, 292, 2947, 3420, 3231], 2412)
-    femmesh.addVolume([1049, 1119, 1139, 1246, 3471, 3186, 2743, 3554, 3075, 1745], 2413)
-    femmesh.addVolume([1041, 1115, 1122, 1197, 3389, 3390, 2204, 1959, 3538, 3157], 2414)
-    femmesh.addVolume([614, 1135, 1072, 1179, 3411, 3413, 2117, 2610, 3599, 2402], 2415)
-    femmesh.addVolume([78, 155, 85, 1200, 417, 337, 415, 2727, 3059, 3610], 2416)
-    femmesh.addVolume([77, 146, 79, 1177, 410, 411, 404, 3522, 3575, 2214], 2417)
-    femmesh.addVolume([1021, 1117, 1165, 1172, 3444, 2925, 2655, 2656, 3425, 2657], 2418)
-    femmesh.addVolume([99, 97, 98, 1153, 490, 485, 489, 3511, 3155, 3098], 2419)
-    femmesh.addVolume([4, 1205, 1181, 1243, 3353, 3613, 3539, 2652, 3600, 3614], 2420)
-    femmesh.addVolume([616, 1110, 1135, 1232, 2718, 3616, 3615, 1250, 2720, 3617], 2421)
-    femmesh.addVolume([807, 1055, 1141, 1159, 3228, 1987, 1292, 1617, 2889, 2951], 2422)
-    femmesh.addVolume([799, 1084, 1133, 1159, 3332, 3618, 3431, 1616, 3416, 3619], 2423)
-    femmesh.addVolume([153, 54, 1111, 1215, 290, 3074, 2125, 3109, 3129, 3108], 2424)
-    femmesh.addVolume([1054, 1204, 1207, 1221, 2108, 2560, 2362, 3199, 3244, 3480], 2425)
-    femmesh.addVolume([109, 164, 60, 1229, 347, 344, 346, 3185, 3569, 2074], 2426)
-    femmesh.addVolume([1003, 1027, 1047, 1100, 2883, 2886, 2885, 3374, 3620, 2804], 2427)
-    femmesh.addVolume([147, 81, 82, 1097, 431, 430, 432, 2059, 3260, 2528], 2428)
-    femmesh.addVolume([623, 1072, 1106, 1179, 2119, 2401, 3279, 2611, 2402, 2260], 2429)
-    femmesh.addVolume([801, 1118, 1098, 1187, 3343, 3409, 3204, 3003, 3410, 3165], 2430)
-    femmesh.addVolume([645, 4, 611, 1205, 664, 662, 663, 3611, 3353, 3355], 2431)
-    femmesh.addVolume([1190, 1085, 1220, 1233, 1965, 3240, 3124, 2147, 2146, 3549], 2432)
-    femmesh.addVolume([1027, 1078, 1110, 1228, 2631, 3348, 3347, 3218, 3220, 3621], 2433)
-    femmesh.addVolume([151, 1, 1225, 1235, 190, 3361, 3567, 3594, 3340, 3362], 2434)
-    femmesh.addVolume([131, 132, 130, 1198, 566, 463, 558, 3395, 3482, 3560], 2435)
-    femmesh.addVolume([1013, 1076, 1034, 1179, 2435, 2434, 2433, 3597, 3528, 2259], 2436)
-    femmesh.addVolume([1106, 625, 1117, 1195, 3278, 2506, 3622, 3548, 3453, 3529], 2437)
-    femmesh.addVolume([833, 800, 1128, 1240, 898, 3426, 3093, 3472, 1496, 2440], 2438)
-    femmesh.addVolume([804, 805, 1133, 1197, 875, 2094, 3432, 3293, 2904, 3623], 2439)
-    femmesh.addVolume([799, 1084, 804, 1133, 3332, 3331, 889, 3431, 3618, 3432], 2440)
-    femmesh.addVolume([10, 9, 68, 1103, 19, 214, 215, 2733, 1626, 3100], 2441)
-    femmesh.addVolume([1013, 1045, 1135, 1226, 1572, 3576, 3577, 1778, 1780, 3609], 2442)
-    femmesh.addVolume([1072, 1013, 1076, 1135, 1357, 2435, 3596, 3413, 3577, 3561], 2443)
-    femmesh.addVolume([2, 73, 7, 1238, 194, 193, 16, 3385, 3491, 3530], 2444)
-    femmesh.addVolume([1049, 1150, 1053, 1246, 3104, 3328, 2994, 3554, 3318, 3624], 2445)
-    femmesh.addVolume([822, 816, 811, 1154, 871, 943, 945, 3181, 3224, 1874], 2446)
-    femmesh.addVolume([1038, 1069, 1169, 1173, 2796, 3215, 3586, 2186, 2933, 2041], 2447)
-    femmesh.addVolume([76, 79, 95, 1207, 405, 407, 283, 3088, 2594, 3484], 2448)
-    femmesh.addVolume([1026, 1094, 1067, 1183, 3456, 2455, 1553, 3579, 3021, 2818], 2449)
-    femmesh.addVolume([1074, 836, 1075, 1212, 3402, 3544, 2641, 2024, 2873, 1566], 2450)
-    femmesh.addVolume([805, 1125, 1133, 1197, 1971, 3384, 2094, 2904, 2903, 3623], 2451)
-    femmesh.addVolume([173, 179, 83, 1134, 446, 441, 445, 2996, 3070, 1857], 2452)
-    femmesh.addVolume([608, 3, 609, 1169, 652, 648, 653, 1541, 2324, 1740], 2453)
-    femmesh.addVolume([622, 1078, 1150, 1228, 2326, 3327, 3449, 3300, 3220, 3329], 2454)
-    femmesh.addVolume([1081, 1205, 1044, 1243, 3625, 3433, 2424, 3430, 3600, 3565], 2455)
-    femmesh.addVolume([4, 1088, 1205, 1243, 2990, 3354, 3353, 2652, 3551, 3600], 2456)
-    femmesh.addVolume([108, 50, 125, 1151, 267, 271, 272, 3533, 3290, 1931], 2457)
-    femmesh.addVolume([1041, 1016, 1042, 1133, 1499, 3447, 3158, 3626, 3627, 3628], 2458)
-    femmesh.addVolume([1134, 1010, 1220, 1233, 2333, 2334, 1861, 3150, 2588, 3549], 2459)
-    femmesh.addVolume([813, 818, 838, 1208, 949, 953, 954, 3094, 2584, 2586], 2460)
-    femmesh.addVolume([1003, 1053, 1027, 1100, 3498, 2632, 2883, 3374, 3536, 3620], 2461)
-    femmesh.addVolume([134, 146, 1168, 1177, 588, 3590, 3366, 3078, 3575, 3367], 2462)
-    femmesh.addVolume([78, 84, 77, 1148, 409, 408, 402, 2739, 1822, 3496], 2463)
-    femmesh.addVolume([142, 133, 15, 1145, 250, 251, 244, 1325, 2788, 3184], 2464)
-    femmesh.addVolume([174, 84, 85, 1200, 448, 416, 447, 3207, 2038, 3610], 2465)
-    femmesh.addVolume([1065, 1196, 1036, 1208, 1805, 1804, 1801, 3408, 3392, 2197], 2466)
-    femmesh.addVolume([50, 52, 51, 1151, 262, 263, 264, 3290, 3387, 2910], 2467)
-    femmesh.addVolume([835, 823, 810, 1183, 859, 938, 941, 3333, 2142, 2141], 2468)
-    femmesh.addVolume([77, 76, 78, 1152, 403, 401, 402, 3497, 3002, 2725], 2469)
-    femmesh.addVolume([1082, 1040, 1186, 1188, 1517, 3629, 3253, 1716, 2245, 2942], 2470)
-    femmesh.addVolume([145, 79, 144, 1177, 421, 423, 422, 2359, 2214, 2894], 2471)
-    femmesh.addVolume([825, 830, 1118, 1141, 926, 3274, 3298, 3492, 1294, 3175], 2472)
-    femmesh.addVolume([151, 74, 86, 1225, 189, 392, 396, 3567, 2084, 2535], 2473)
-    femmesh.addVolume([644, 1069, 1119, 1242, 2133, 3197, 2677, 2908, 3440, 3463], 2474)
-    femmesh.addVolume([1, 74, 151, 1225, 188, 189, 190, 3361, 2084, 3567], 2475)
-    femmesh.addVolume([127, 113, 161, 1167, 547, 543, 550, 2698, 1640, 3285], 2476)
-    femmesh.addVolume([817, 836, 815, 1212, 883, 962, 961, 2862, 2873, 2099], 2477)
-    femmesh.addVolume([126, 161, 66, 1167, 374, 371, 372, 2356, 3285, 2035], 2478)
-    femmesh.addVolume([162, 70, 71, 1093, 384, 380, 279, 2549, 2846, 3172], 2479)
-    femmesh.addVolume([1060, 638, 1100, 1137, 1249, 2311, 2405, 1818, 2167, 2406], 2480)
-    femmesh.addVolume([1003, 1049, 1100, 1174, 3114, 3535, 3374, 2675, 3202, 2987], 2481)
-    femmesh.addVolume([623, 1106, 1072, 1223, 3279, 2401, 2119, 3090, 3120, 3630], 2482)
-    femmesh.addVolume([7, 170, 171, 1238, 205, 207, 196, 3530, 1975, 2870], 2483)
-    femmesh.addVolume([1014, 1067, 1068, 1108, 1554, 2289, 1672, 3520, 2891, 3370], 2484)
-    femmesh.addVolume([1086, 1129, 1225, 1235, 2614, 2536, 1724, 3423, 3595, 3362], 2485)
-    femmesh.addVolume([95, 1204, 93, 1207, 3483, 2558, 285, 3484, 2560, 2559], 2486)
-    femmesh.addVolume([983, 1207, 1204, 1221, 2561, 2560, 1902, 3243, 3480, 3244], 2487)
-    femmesh.addVolume([1049, 1100, 1119, 1246, 3535, 3193, 3471, 3554, 3194, 3075], 2488)
-    femmesh.addVolume([996, 1021, 1190, 1239, 3344, 2694, 1966, 1967, 3191, 1968], 2489)
-    femmesh.addVolume([627, 636, 617, 1230, 772, 769, 773, 2761, 3583, 3603], 2490)
-    femmesh.addVolume([68, 9, 72, 1178, 214, 209, 218, 3478, 1629, 3469], 2491)
-    femmesh.addVolume([1082, 1040, 1098, 1186, 1517, 1519, 1521, 3253, 3629, 3570], 2492)
-    femmesh.addVolume([1042, 1125, 1141, 1192, 2235, 3303, 2760, 2302, 2301, 1894], 2493)
-    femmesh.addVolume([799, 1133, 1055, 1159, 3431, 3461, 3229, 1616, 3619, 2889], 2494)
-    femmesh.addVolume([837, 5, 1189, 1222, 843, 3365, 2169, 2478, 3310, 2479], 2495)
-    femmesh.addVolume([825, 807, 830, 1141, 924, 922, 926, 3492, 1292, 1294], 2496)
-    femmesh.addVolume([1079, 617, 1091, 1157, 3248, 3454, 2565, 3429, 2781, 3455], 2497)
-    femmesh.addVolume([1049, 1012, 1060, 1174, 2684, 3464, 3601, 3202, 2943, 2909], 2498)
-    femmesh.addVolume([1066, 627, 1091, 1230, 2525, 2881, 3235, 3200, 2761, 3604], 2499)
-    femmesh.addVolume([1072, 1135, 1180, 1226, 3413, 3631, 3448, 3602, 3609, 3632], 2500)
-    femmesh.addVolume([96, 97, 58, 1236, 329, 330, 311, 3557, 3156, 3502], 2501)
-    femmesh.addVolume([616, 613, 612, 1232, 744, 737, 743, 1250, 3523, 1251], 2502)
-    femmesh.addVolume([122, 126, 121, 1107, 570, 511, 569, 3460, 2354, 2791], 2503)
-    femmesh.addVolume([97, 96, 98, 1193, 329, 484, 485, 3227, 3556, 3099], 2504)
-    femmesh.addVolume([167, 15, 133, 1145, 183, 251, 252, 3111, 3184, 2788], 2505)
-    femmesh.addVolume([150, 92, 112, 1182, 468, 469, 467, 2599, 2838, 3081], 2506)
-    femmesh.addVolume([621, 1110, 620, 1206, 3103, 2719, 699, 3485, 3633, 3486], 2507)
-    femmesh.addVolume([56, 58, 1203, 1236, 306, 3223, 3488, 2928, 3502, 3314], 2508)
-    femmesh.addVolume([148, 85, 147, 1200, 452, 334, 439, 1994, 3610, 2679], 2509)
-    femmesh.addVolume([1008, 1046, 1090, 1185, 1374, 3397, 2975, 1464, 1466, 3152], 2510)
-    femmesh.addVolume([7, 171, 2, 1238, 196, 195, 16, 3530, 2870, 3385], 2511)
-    femmesh.addVolume([604, 644, 1119, 1242, 717, 2677, 2476, 3607, 2908, 3463], 2512)
-    femmesh.addVolume([634, 635, 1113, 1242, 715, 2343, 3494, 2907, 3634, 2192], 2513)
-    femmesh.addVolume([813, 832, 814, 1196, 951, 952, 947, 2808, 2469, 2639], 2514)
-    femmesh.addVolume([1053, 1027, 1100, 1206, 2632, 3620, 3536, 3635, 3636, 3546], 2515)
-    femmesh.addVolume([137, 173, 83, 1134, 444, 445, 442, 3237, 2996, 1857], 2516)
-    femmesh.addVolume([1009, 1149, 1073, 1217, 1286, 1288, 1283, 2315, 3016, 3264], 2517)
-    femmesh.addVolume([1128, 800, 1158, 1159, 3426, 3049, 3427, 3547, 2681, 3526], 2518)
-    femmesh.addVolume([144, 146, 134, 1177, 424, 588, 587, 2894, 3575, 3078], 2519)
-    femmesh.addVolume([131, 130, 116, 1193, 558, 472, 497, 3394, 3559, 3349], 2520)
-    femmesh.addVolume([1034, 1021, 1106, 1117, 2624, 2625, 2256, 2638, 3444, 3622], 2521)
-    femmesh.addVolume([75, 74, 1, 1225, 187, 188, 186, 2103, 2084, 3361], 2522)
-    femmesh.addVolume([1026, 1067, 1108, 1183, 1553, 2891, 1331, 3579, 2818, 3552], 2523)
-    femmesh.addVolume([620, 639, 601, 1228, 702, 695, 700, 3299, 3301, 3637], 2524)
-    femmesh.addVolume([128, 178, 57, 1124, 325, 310, 322, 2604, 1989, 3375], 2525)
-    femmesh.addVolume([613, 645, 611, 1232, 741, 663, 738, 3523, 3525, 1771], 2526)
-    femmesh.addVolume([106, 176, 169, 1057, 523, 253, 526, 3086, 2973, 3082], 2527)
-    femmesh.addVolume([1037, 1189, 1099, 1211, 3046, 3315, 2092, 1980, 3593, 2093], 2528)
-    femmesh.addVolume([828, 835, 831, 1217, 913, 942, 972, 2154, 2765, 2767], 2529)
-    femmesh.addVolume([11, 49, 89, 1143, 227, 230, 222, 2959, 3226, 1736], 2530)
-    femmesh.addVolume([8, 9, 181, 1178, 18, 210, 211, 3052, 1629, 2627], 2531)
-    femmesh.addVolume([152, 73, 2, 1160, 198, 194, 197, 3405, 3258, 3360], 2532)
-    femmesh.addVolume([1074, 1032, 1096, 1212, 2021, 2395, 2195, 2024, 2023, 2100], 2533)
-    femmesh.addVolume([1014, 1068, 1033, 1108, 1672, 1761, 1600, 3520, 3370, 1549], 2534)
-    femmesh.addVolume([1092, 841, 1114, 1222, 3309, 2855, 1411, 1414, 3311, 1415], 2535)
-    femmesh.addVolume([90, 92, 91, 1198, 456, 457, 458, 3270, 2840, 3591], 2536)
-    femmesh.addVolume([98, 116, 117, 1193, 495, 496, 494, 3099, 3349, 2721], 2537)
-    femmesh.addVolume([143, 88, 1214, 1234, 261, 1469, 2826, 2827, 3063, 1418], 2538)
-    femmesh.addVolume([634, 1113, 1146, 1242, 3494, 2190, 1651, 2907, 2192, 2191], 2539)
-    femmesh.addVolume([148, 174, 85, 1200, 453, 447, 452, 1994, 3207, 3610], 2540)
-    femmesh.addVolume([1066, 622, 1078, 1150, 2524, 2326, 3305, 3542, 3449, 3327], 2541)
-    femmesh.addVolume([52, 108, 76, 1151, 268, 284, 282, 3387, 3533, 3067], 2542)
-    femmesh.addVolume([103, 104, 105, 1132, 504, 515, 514, 3133, 1492, 2298], 2543)
-    femmesh.addVolume([152, 69, 73, 1160, 303, 383, 198, 3405, 3232, 3258], 2544)
-    femmesh.addVolume([134, 115, 133, 1168, 554, 552, 553, 3366, 3381, 3589], 2545)
-    femmesh.addVolume([6, 835, 802, 1186, 858, 857, 855, 3364, 3216, 2941], 2546)
-    femmesh.addVolume([85, 59, 147, 1200, 335, 336, 334, 3610, 3473, 2679], 2547)
-    femmesh.addVolume([1036, 1196, 1099, 1208, 1804, 2470, 2934, 2197, 3392, 3391], 2548)
-    femmesh.addVolume([1046, 1106, 1021, 1195, 3119, 2625, 3345, 3399, 3548, 3571], 2549)
-    femmesh.addVolume([635, 604, 1139, 1242, 714, 1362, 1665, 3634, 3607, 3608], 2550)
-    femmesh.addVolume([140, 100, 99, 1153, 437, 491, 499, 3282, 3050, 3511], 2551)
-    femmesh.addVolume([123, 122, 121, 1107, 568, 569, 567, 1824, 3460, 2791], 2552)
-    femmesh.addVolume([64, 88, 143, 1234, 359, 261, 362, 3638, 3063, 2827], 2553)
-    femmesh.addVolume([112, 113, 150, 1182, 539, 545, 467, 3081, 1619, 2599], 2554)
-    femmesh.addVolume([11, 10, 62, 1143, 20, 221, 220, 2959, 2735, 2543], 2555)
-    femmesh.addVolume([1055, 1025, 1158, 1159, 1437, 2028, 2030, 2889, 2888, 3526], 2556)
-    femmesh.addVolume([76, 95, 52, 1207, 283, 281, 282, 3088, 3484, 3388], 2557)
-    femmesh.addVolume([159, 114, 115, 1168, 450, 399, 551, 2660, 2876, 3381], 2558)
-    femmesh.addVolume([1029, 1072, 1106, 1223, 2577, 2401, 2579, 3188, 3630, 3120], 2559)
-    femmesh.addVolume([1106, 1034, 1117, 1179, 2256, 2638, 3622, 2260, 2259, 3562], 2560)
-    femmesh.addVolume([1018, 1118, 1043, 1187, 2962, 3210, 2080, 2453, 3410, 3443], 2561)
-    femmesh.addVolume([117, 118, 122, 1210, 557, 559, 560, 2722, 3141, 3475], 2562)
-    femmesh.addVolume([1114, 1052, 1159, 1240, 3012, 2887, 3457, 2856, 2833, 2920], 2563)
-    femmesh.addVolume([181, 156, 158, 1191, 219, 599, 600, 2628, 2328, 3414], 2564)
-    femmesh.addVolume([1128, 800, 1159, 1240, 3426, 2681, 3547, 2440, 1496, 2920], 2565)
-    femmesh.addVolume([147, 101, 81, 1097, 338, 436, 431, 2059, 2321, 3260], 2566)
-    femmesh.addVolume([132, 120, 119, 1130, 563, 315, 564, 3481, 3507, 2824], 2567)
-    femmesh.addVolume([1055, 1133, 807, 1141, 3461, 2096, 3228, 1987, 3032, 1292], 2568)
-    femmesh.addVolume([1049, 1060, 1100, 1174, 3601, 2405, 3535, 3202, 2909, 2987], 2569)
-    femmesh.addVolume([816, 1115, 1122, 1154, 2853, 3390, 3514, 3224, 2982, 3568], 2570)
-    femmesh.addVolume([1045, 1044, 1076, 1232, 1921, 2436, 2770, 3639, 3434, 3524], 2571)
-    femmesh.addVolume([37, 1125, 1068, 1192, 3041, 1794, 2466, 3295, 2301, 2700], 2572)
-    femmesh.addVolume([615, 613, 616, 1135, 751, 744, 755, 3412, 3521, 3615], 2573)
-    femmesh.addVolume([38, 1115, 1068, 1125, 2852, 2980, 2467, 1970, 3214, 1794], 2574)
-    femmesh.addVolume([625, 1106, 1117, 1179, 3278, 3622, 2506, 2612, 2260, 3562], 2575)
-    femmesh.addVolume([617, 1079, 1091, 1230, 3248, 2565, 3454, 3603, 3606, 3604], 2576)
-    femmesh.addVolume([95, 93, 52, 1207, 285, 274, 281, 3484, 2559, 3388], 2577)
-    femmesh.addVolume([839, 1099, 1189, 1211, 3198, 3315, 2090, 3451, 2093, 3593], 2578)
-    femmesh.addVolume([153, 54, 119, 1111, 290, 300, 302, 2125, 3074, 2822], 2579)
-    femmesh.addVolume([1017, 1224, 1048, 1241, 3065, 1730, 3572, 2968, 2065, 2064], 2580)
-    femmesh.addVolume([808, 1098, 1118, 1192, 3519, 3409, 3297, 3254, 3558, 2965], 2581)
-    femmesh.addVolume([602, 603, 601, 1246, 693, 694, 692, 1484, 1483, 3250], 2582)
-    femmesh.addVolume([51, 71, 63, 1201, 277, 276, 265, 2911, 3173, 3465], 2583)
-    femmesh.addVolume([1060, 1049, 1100, 1119, 3601, 3535, 2405, 1852, 3471, 3193], 2584)
-    femmesh.addVolume([120, 132, 131, 1130, 563, 566, 488, 3507, 3481, 3393], 2585)
-    femmesh.addVolume([106, 103, 105, 1132, 517, 514, 516, 3087, 3133, 2298], 2586)
-    femmesh.addVolume([93, 95, 94, 1204, 285, 474, 475, 2558, 3483, 3382], 2587)
-    femmesh.addVolume([37, 1068, 1108, 1192, 2466, 3370, 2291, 3295, 2700, 3587], 2588)
-    femmesh.addVolume([1065, 1096, 1196, 1208, 1827, 2809, 1805, 3408, 2199, 3392], 2589)
-    femmesh.addVolume([829, 824, 826, 1158, 896, 977, 971, 3048, 2784, 2783], 2590)
-    femmesh.addVolume([1022, 1045, 1078, 1232, 1269, 3179, 3178, 3582, 3639, 2477], 2591)
-    femmesh.addVolume([1027, 1047, 1100, 1206, 2886, 2804, 3620, 3636, 3640, 3546], 2592)
-    femmesh.addVolume([151, 179, 175, 1129, 454, 531, 598, 3566, 3069, 2553], 2593)
-    femmesh.addVolume([1085, 1134, 1220, 1233, 3162, 1861, 3240, 2146, 3150, 3549], 2594)
-    femmesh.addVolume([154, 64, 143, 1234, 360, 362, 363, 2871, 3638, 2827], 2595)
-    femmesh.addVolume([631, 1100, 1206, 1246, 2309, 3546, 3320, 3445, 3194, 3641], 2596)
-    femmesh.addVolume([1113, 635, 1139, 1242, 2343, 1665, 3442, 2192, 3634, 3608], 2597)
-    femmesh.addVolume([39, 1122, 1115, 1197, 3545, 3390, 3112, 2902, 3157, 3538], 2598)
-    femmesh.addVolume([1061, 1046, 1185, 1223, 1742, 1466, 1744, 2900, 2899, 3467], 2599)
-    femmesh.addVolume([108, 125, 129, 1152, 272, 532, 418, 3534, 2539, 3417], 2600)
-    femmesh.addVolume([56, 96, 58, 1236, 312, 311, 306, 2928, 3557, 3502], 2601)
-    femmesh.addVolume([630, 645, 632, 1181, 665, 756, 792, 2750, 3540, 2779], 2602)
-    femmesh.addVolume([623, 641, 1106, 1223, 785, 3277, 3279, 3090, 3335, 3120], 2603)
-    femmesh.addVolume([645, 1076, 1181, 1205, 2789, 2629, 3540, 3611, 3605, 3613], 2604)
-    femmesh.addVolume([81, 101, 100, 1097, 436, 333, 435, 3260, 2321, 3025], 2605)
-    femmesh.addVolume([639, 601, 1228, 1246, 695, 3637, 3301, 3251, 3250, 3642], 2606)
-    femmesh.addVolume([168, 93, 94, 1204, 476, 475, 477, 2697, 2558, 3382], 2607)
-    femmesh.addVolume([615, 621, 624, 1180, 763, 764, 765, 1711, 3379, 1709], 2608)
-    femmesh.addVolume([606, 1185, 1090, 1195, 2263, 3152, 2989, 2671, 3495, 3398], 2609)
-    femmesh.addVolume([1042, 1125, 1041, 1133, 2235, 2945, 3158, 3628, 3384, 3626], 2610)
-    femmesh.addVolume([626, 636, 627, 1230, 742, 772, 778, 2490, 3583, 2761], 2611)
-    femmesh.addVolume([88, 64, 65, 1234, 359, 357, 358, 3063, 3638, 3506], 2612)
-    femmesh.addVolume([146, 1148, 159, 1168, 3574, 2659, 414, 3590, 2248, 2660], 2613)
-    femmesh.addVolume([66, 65, 64, 1234, 356, 357, 355, 2037, 3506, 3638], 2614)
-    femmesh.addVolume([157, 158, 156, 1191, 379, 599, 455, 2113, 3414, 2328], 2615)
-    femmesh.addVolume([151, 175, 169, 1235, 598, 527, 192, 3594, 3085, 3084], 2616)
-    femmesh.addVolume([620, 601, 1206, 1228, 700, 3487, 3486, 3299, 3637, 3643], 2617)
-    femmesh.addVolume([154, 143, 104, 1234, 363, 521, 509, 2871, 2827, 1316], 2618)
-    femmesh.addVolume([611, 645, 1205, 1232, 663, 3611, 3355, 1771, 3525, 3435], 2619)
-    femmesh.addVolume([1, 15, 1145, 1235, 25, 3184, 3339, 3340, 3474, 3341], 2620)
-    femmesh.addVolume([155, 59, 85, 1200, 320, 335, 337, 3059, 3473, 3610], 2621)
-    femmesh.addVolume([1016, 1041, 1084, 1133, 1499, 1958, 1254, 3627, 3626, 3618], 2622)
-    femmesh.addVolume([1061, 1038, 1169, 1185, 1743, 3586, 3376, 1744, 1465, 2880], 2623)
-    femmesh.addVolume([160, 166, 141, 1171, 426, 595, 243, 2922, 2692, 3357], 2624)
-    femmesh.addVolume([116, 98, 131, 1193, 495, 486, 497, 3349, 3099, 3394], 2625)
-    femmesh.addVolume([634, 604, 635, 1242, 716, 714, 715, 2907, 3607, 3634], 2626)
-    femmesh.addVolume([6, 802, 1098, 1186, 855, 3205, 3541, 3364, 2941, 3570], 2627)
-    femmesh.addVolume([1076, 1072, 1135, 1179, 3596, 3413, 3561, 3528, 2402, 3599], 2628)
-    femmesh.addVolume([134, 133, 135, 1070, 553, 581, 582, 3077, 2785, 2581], 2629)
-    femmesh.addVolume([616, 1135, 613, 1232, 3615, 3521, 744, 1250, 3617, 3523], 2630)
-    femmesh.addVolume([615, 1072, 1135, 1180, 2118, 3413, 3412, 1711, 3448, 3631], 2631)
-    femmesh.addVolume([149, 91, 1198, 1227, 466, 3591, 3233, 3030, 3592, 2751], 2632)
-    femmesh.addVolume([1135, 1110, 1180, 1226, 3616, 3644, 3631, 3609, 3598, 3632], 2633)
-    femmesh.addVolume([639, 1228, 1150, 1246, 3301, 3329, 3131, 3251, 3642, 3318], 2634)
-    femmesh.addVolume([1072, 1137, 1180, 1223, 3645, 3276, 3448, 3630, 3137, 3476], 2635)
-    femmesh.addVolume([620, 1110, 1078, 1228, 2719, 3348, 2780, 3299, 3621, 3220], 2636)
-    femmesh.addVolume([1115, 1051, 1122, 1154, 3325, 2444, 3390, 2982, 2583, 3568], 2637)
-    femmesh.addVolume([5, 840, 839, 1211, 849, 848, 846, 3573, 1758, 3451], 2638)
-    femmesh.addVolume([141, 13, 160, 1171, 238, 234, 243, 3357, 3023, 2922], 2639)
-    femmesh.addVolume([41, 5, 837, 1222, 47, 843, 842, 3107, 3310, 2478], 2640)
-    femmesh.addVolume([57, 56, 58, 1203, 308, 306, 307, 3036, 3488, 3223], 2641)
-    femmesh.addVolume([53, 54, 153, 1215, 288, 290, 289, 3450, 3129, 3109], 2642)
-    femmesh.addVolume([76, 108, 78, 1152, 284, 406, 401, 3002, 3534, 2725], 2643)
-    femmesh.addVolume([1011, 1155, 1221, 1244, 2491, 2492, 2174, 3316, 2027, 3324], 2644)
-    femmesh.addVolume([1047, 1072, 1137, 1180, 3493, 3645, 2806, 3646, 3448, 3276], 2645)
-    femmesh.addVolume([100, 97, 99, 1153, 332, 490, 491, 3050, 3155, 3511], 2646)
-    femmesh.addVolume([84, 159, 77, 1148, 412, 413, 408, 1822, 2659, 3496], 2647)
-    femmesh.addVolume([841, 41, 1114, 1222, 844, 2085, 2855, 3311, 3107, 1415], 2648)
-    femmesh.addVolume([1040, 1186, 1188, 1217, 3629, 2942, 2245, 3064, 3436, 2153], 2649)
-    femmesh.addVolume([823, 1108, 1183, 1186, 2290, 3552, 2142, 3363, 3584, 3612], 2650)
-    femmesh.addVolume([1137, 1100, 1180, 1206, 2406, 3647, 3276, 3321, 3546, 3322], 2651)
-    femmesh.addVolume([1036, 1099, 1189, 1208, 2934, 3315, 3045, 2197, 3391, 2672], 2652)
-    femmesh.addVolume([1043, 1118, 1141, 1187, 3210, 3175, 1985, 3443, 3410, 3531], 2653)
-    femmesh.addVolume([87, 72, 8, 1178, 212, 208, 202, 3169, 3469, 3052], 2654)
-    femmesh.addVolume([50, 108, 52, 1151, 267, 268, 262, 3290, 3533, 3387], 2655)
-    femmesh.addVolume([1072, 1180, 1047, 1226, 3448, 3646, 3493, 3602, 3632, 3516], 2656)
-    femmesh.addVolume([96, 131, 1193, 1236, 487, 3394, 3556, 3557, 3581, 1944], 2657)
-    femmesh.addVolume([1027, 1110, 1206, 1228, 3347, 3633, 3636, 3218, 3621, 3643], 2658)
-    femmesh.addVolume([1061, 1060, 1137, 1169, 3543, 1818, 2794, 3376, 3302, 2411], 2659)
-    femmesh.addVolume([125, 128, 129, 1124, 578, 324, 532, 1932, 2604, 3418], 2660)
-    femmesh.addVolume([1074, 1036, 1189, 1208, 2196, 3045, 3047, 2198, 2197, 2672], 2661)
-    femmesh.addVolume([601, 631, 1206, 1246, 698, 3320, 3487, 3250, 3445, 3641], 2662)
-    femmesh.addVolume([128, 57, 129, 1124, 322, 323, 324, 2604, 3375, 3418], 2663)
-    femmesh.addVolume([40, 39, 804, 1197, 45, 873, 872, 3096, 2902, 3293], 2664)
-    femmesh.addVolume([1042, 1125, 1133, 1141, 2235, 3384, 3628, 2760, 3303, 3032], 2665)
-    femmesh.addVolume([9, 8, 72, 1178, 18, 208, 209, 1629, 3052, 3469], 2666)
-    femmesh.addVolume([132, 149, 91, 1198, 465, 466, 464, 3482, 3233, 3591], 2667)
-    femmesh.addVolume([129, 78, 108, 1152, 419, 406, 418, 3417, 2725, 3534], 2668)
-    femmesh.addVolume([1092, 1052, 1114, 1240, 2832, 3012, 1411, 2439, 2833, 2856], 2669)
-    femmesh.addVolume([57, 155, 129, 1124, 321, 326, 323, 3375, 3509, 3418], 2670)
-    femmesh.addVolume([48, 13, 180, 1109, 233, 240, 242, 3262, 3022, 3323], 2671)
-    femmesh.addVolume([616, 615, 1135, 1180, 755, 3412, 3615, 3378, 1711, 3631], 2672)
-    femmesh.addVolume([106, 107, 103, 1132, 519, 518, 517, 3087, 2338, 3133], 2673)
-    femmesh.addVolume([126, 127, 161, 1167, 575, 550, 374, 2356, 2698, 3285], 2674)
-    femmesh.addVolume([163, 61, 72, 1163, 352, 350, 351, 2636, 3177, 3468], 2675)
-    femmesh.addVolume([1042, 1016, 1055, 1133, 3447, 2663, 3006, 3628, 3627, 3461], 2676)
-    femmesh.addVolume([40, 1122, 39, 1197, 2715, 3545, 45, 3096, 3157, 2902], 2677)
-    femmesh.addVolume([835, 1186, 1183, 1217, 3216, 3612, 3333, 2765, 3436, 3334], 2678)
-    femmesh.addVolume([1049, 1053, 1100, 1246, 2994, 3536, 3535, 3554, 3624, 3194], 2679)
-    femmesh.addVolume([4, 26, 636, 1243, 31, 660, 659, 2652, 2651, 3532], 2680)
-    femmesh.addVolume([61, 68, 72, 1163, 349, 218, 350, 3177, 3101, 3468], 2681)
-    femmesh.addVolume([606, 628, 641, 1195, 722, 728, 726, 2671, 3452, 2669], 2682)
-    femmesh.addVolume([631, 1180, 621, 1206, 3275, 3379, 703, 3320, 3322, 3485], 2683)
-    femmesh.addVolume([115, 134, 159, 1168, 554, 555, 551, 3381, 3366, 2660], 2684)
-    femmesh.addVolume([59, 57, 58, 1203, 319, 307, 318, 3518, 3036, 3223], 2685)
-    femmesh.addVolume([621, 601, 631, 1206, 701, 698, 703, 3485, 3487, 3320], 2686)
-    femmesh.addVolume([1, 15, 167, 1145, 25, 183, 182, 3339, 3184, 3111], 2687)
-    femmesh.addVolume([1053, 1027, 1206, 1228, 2632, 3636, 3635, 3219, 3218, 3643], 2688)
-    femmesh.addVolume([90, 91, 152, 1227, 458, 459, 200, 3268, 3592, 3407], 2689)
-    femmesh.addVolume([1115, 1041, 1125, 1197, 3389, 2945, 3214, 3538, 1959, 2903], 2690)
-    femmesh.addVolume([124, 53, 153, 1215, 295, 289, 297, 2867, 3450, 3109], 2691)
-    femmesh.addVolume([634, 644, 604, 1242, 691, 717, 716, 2907, 2908, 3607], 2692)
-    femmesh.addVolume([1044, 1081, 1181, 1205, 2424, 2426, 2425, 3433, 3625, 3613], 2693)
-    femmesh.addVolume([48, 105, 143, 1214, 256, 257, 255, 3263, 2529, 2826], 2694)
-    femmesh.addVolume([151, 86, 179, 1129, 396, 440, 454, 3566, 2243, 3069], 2695)
-    femmesh.addVolume([91, 92, 130, 1198, 457, 461, 462, 3591, 2840, 3560], 2696)
-    femmesh.addVolume([1141, 1055, 1158, 1159, 1987, 2030, 3319, 2951, 2889, 3526], 2697)
-    femmesh.addVolume([1027, 1110, 1047, 1206, 3347, 3648, 2886, 3636, 3633, 3640], 2698)
-    femmesh.addVolume([1060, 1069, 1119, 1169, 3512, 3197, 1852, 3302, 3215, 3091], 2699)
-    femmesh.addVolume([1161, 1026, 1244, 1245, 3018, 1557, 3125, 2810, 1748, 2541], 2700)
-    femmesh.addVolume([56, 120, 96, 1236, 314, 313, 312, 2928, 3508, 3557], 2701)
-    femmesh.addVolume([144, 79, 146, 1177, 423, 411, 424, 2894, 2214, 3575], 2702)
-    femmesh.addVolume([169, 15, 1, 1235, 184, 25, 185, 3084, 3474, 3340], 2703)
-    femmesh.addVolume([1012, 1060, 1069, 1119, 3464, 3512, 2858, 3470, 1852, 3197], 2704)
-    femmesh.addVolume([1119, 1039, 1139, 1242, 3462, 2742, 3186, 3463, 3272, 3608], 2705)
-    femmesh.addVolume([151, 169, 1, 1235, 192, 185, 190, 3594, 3084, 3340], 2706)
-    femmesh.addVolume([96, 120, 131, 1236, 313, 488, 487, 3557, 3508, 3581], 2707)
-    femmesh.addVolume([1042, 1133, 1055, 1141, 3628, 3461, 3006, 2760, 3032, 1987], 2708)
-    femmesh.addVolume([146, 159, 134, 1168, 414, 555, 588, 3590, 2660, 3366], 2709)
-    femmesh.addVolume([1034, 1117, 1179, 1181, 2638, 3562, 2259, 2427, 2749, 3563], 2710)
-    femmesh.addVolume([149, 152, 91, 1227, 305, 459, 466, 3030, 3407, 3592], 2711)
-    femmesh.addVolume([1017, 1066, 1048, 1224, 3304, 3580, 3572, 3065, 3236, 1730], 2712)
-    femmesh.addVolume([1017, 1048, 1066, 1150, 3572, 3580, 3304, 3105, 3553, 3542], 2713)
-    femmesh.addVolume([5, 1211, 1189, 1222, 3573, 3593, 3365, 3310, 3588, 2479], 2714)
-    femmesh.addVolume([49, 48, 143, 1214, 236, 255, 254, 2687, 3263, 2826], 2715)
-    femmesh.addVolume([841, 800, 840, 1240, 890, 901, 850, 1497, 1496, 2706], 2716)
-    femmesh.addVolume([632, 1076, 1179, 1181, 2409, 3528, 3527, 2779, 2629, 3563], 2717)
-    femmesh.addVolume([623, 637, 641, 1223, 784, 735, 785, 3090, 2971, 3335], 2718)
-    femmesh.addVolume([88, 49, 143, 1214, 260, 254, 261, 1469, 2687, 2826], 2719)
-    femmesh.addVolume([96, 131, 98, 1193, 487, 486, 484, 3556, 3394, 3099], 2720)
-    femmesh.addVolume([53, 124, 63, 1215, 295, 269, 293, 3450, 2867, 3466], 2721)
-    femmesh.addVolume([1088, 636, 1230, 1243, 2991, 3583, 3287, 3551, 3532, 3649], 2722)
-    femmesh.addVolume([1052, 1084, 1114, 1159, 1753, 2562, 3012, 2887, 3416, 3457], 2723)
-    femmesh.addVolume([152, 149, 55, 1227, 305, 298, 304, 3407, 3030, 2949], 2724)
-    femmesh.addVolume([1100, 1053, 1206, 1246, 3536, 3635, 3546, 3194, 3624, 3641], 2725)
-    femmesh.addVolume([1034, 1179, 1076, 1181, 2259, 3528, 2434, 2427, 3563, 2629], 2726)
-    femmesh.addVolume([1037, 1211, 1092, 1222, 1980, 1982, 1694, 1696, 3588, 1414], 2727)
-    femmesh.addVolume([1079, 1230, 636, 1243, 3606, 3583, 3246, 3439, 3649, 3532], 2728)
-    femmesh.addVolume([1045, 1110, 1135, 1226, 3346, 3616, 3576, 1780, 3598, 3609], 2729)
-    femmesh.addVolume([1016, 1084, 1055, 1133, 1254, 2665, 2663, 3627, 3618, 3461], 2730)
-    femmesh.addVolume([1047, 1180, 1110, 1226, 3646, 3644, 3648, 3516, 3632, 3598], 2731)
-    femmesh.addVolume([1021, 1106, 1117, 1195, 2625, 3622, 3444, 3571, 3548, 3529], 2732)
-    femmesh.addVolume([1066, 1048, 1091, 1150, 3580, 2879, 3235, 3542, 3553, 3555], 2733)
-    femmesh.addVolume([1025, 1128, 1158, 1159, 2483, 3427, 2028, 2888, 3547, 3526], 2734)
-    femmesh.addVolume([57, 178, 56, 1203, 310, 309, 308, 3036, 2984, 3488], 2735)
-    femmesh.addVolume([146, 77, 159, 1148, 410, 413, 414, 3574, 3496, 2659], 2736)
-    femmesh.addVolume([1027, 1047, 1110, 1226, 2886, 3648, 3347, 3517, 3516, 3598], 2737)
-    femmesh.addVolume([1076, 1044, 1181, 1205, 2436, 2425, 2629, 3605, 3433, 3613], 2738)
-    femmesh.addVolume([1031, 1066, 1091, 1230, 3234, 3235, 2275, 3500, 3200, 3604], 2739)
-    femmesh.addVolume([1051, 1122, 1154, 1212, 2444, 3568, 2583, 1668, 3504, 2329], 2740)
-    femmesh.addVolume([1046, 1106, 1195, 1223, 3119, 3548, 3399, 2899, 3120, 3336], 2741)
-    femmesh.addVolume([611, 612, 613, 1232, 736, 737, 738, 1771, 1251, 3523], 2742)
-    femmesh.addVolume([1076, 613, 1135, 1232, 2407, 3521, 3561, 3524, 3523, 3617], 2743)
-    femmesh.addVolume([1029, 1137, 1072, 1223, 2228, 3645, 2577, 3188, 3137, 3630], 2744)
-    femmesh.addVolume([1155, 1058, 1221, 1244, 2056, 3245, 2492, 2027, 2702, 3324], 2745)
-    femmesh.addVolume([1031, 1079, 1088, 1230, 2280, 3550, 2381, 3500, 3606, 3287], 2746)
-    femmesh.addVolume([64, 154, 66, 1234, 360, 361, 355, 3638, 2871, 2037], 2747)
-    femmesh.addVolume([1185, 1046, 1195, 1223, 1466, 3399, 3495, 3467, 2899, 3336], 2748)
-    femmesh.addVolume([10, 11, 89, 1143, 20, 222, 223, 2735, 2959, 1736], 2749)
-    femmesh.addVolume([1029, 1047, 1072, 1137, 3127, 3493, 2577, 2228, 2806, 3645], 2750)
-    femmesh.addVolume([132, 91, 130, 1198, 464, 462, 463, 3482, 3591, 3560], 2751)
-    femmesh.addVolume([1078, 1045, 1110, 1232, 3179, 3346, 3348, 2477, 3639, 2720], 2752)
-    femmesh.addVolume([1031, 1091, 1079, 1230, 2275, 2565, 2280, 3500, 3604, 3606], 2753)
-    femmesh.addVolume([1110, 621, 1180, 1206, 3103, 3379, 3644, 3633, 3485, 3322], 2754)
-    femmesh.addVolume([641, 1195, 1106, 1223, 2669, 3548, 3277, 3335, 3336, 3120], 2755)
-    femmesh.addVolume([1046, 1090, 1185, 1195, 3397, 3152, 1466, 3399, 3398, 3495], 2756)
-    femmesh.addVolume([1047, 1110, 1180, 1206, 3648, 3644, 3646, 3640, 3633, 3322], 2757)
-    femmesh.addVolume([1113, 1139, 1039, 1242, 3442, 2742, 3271, 2192, 3608, 3272], 2758)
-    femmesh.addVolume([1081, 1181, 1205, 1243, 2426, 3613, 3625, 3430, 3614, 3600], 2759)
-    femmesh.addVolume([1079, 1088, 1230, 1243, 3550, 3287, 3606, 3439, 3551, 3649], 2760)
-    femmesh.addVolume([1047, 1180, 1100, 1206, 3646, 3647, 2804, 3640, 3322, 3546], 2761)
-    femmesh.addVolume([1068, 1033, 1108, 1192, 1761, 1549, 3370, 2700, 2300, 3587], 2762)
-    femmesh.addVolume([1100, 1047, 1137, 1180, 2804, 2806, 2406, 3647, 3646, 3276], 2763)
-    femmesh.addVolume([620, 1206, 1110, 1228, 3486, 3633, 2719, 3299, 3643, 3621], 2764)
-    femmesh.addVolume([804, 1133, 1084, 1197, 3432, 3618, 3331, 3293, 3623, 1946], 2765)
-    femmesh.addVolume([1125, 1041, 1133, 1197, 2945, 3626, 3384, 2903, 1959, 3623], 2766)
-    femmesh.addVolume([1037, 1189, 1211, 1222, 3046, 3593, 1980, 1696, 2479, 3588], 2767)
-    femmesh.addVolume([1084, 1055, 1133, 1159, 2665, 3461, 3618, 3416, 2889, 3619], 2768)
-    femmesh.addVolume([1110, 1045, 1135, 1232, 3346, 3576, 3616, 2720, 3639, 3617], 2769)
-    femmesh.addVolume([1041, 1084, 1133, 1197, 1958, 3618, 3626, 1959, 1946, 3623], 2770)
-    femmesh.addVolume([1045, 1076, 1135, 1232, 2770, 3561, 3576, 3639, 3524, 3617], 2771)
-    femmesh.addVolume([1053, 1150, 1228, 1246, 3328, 3329, 3219, 3624, 3318, 3642], 2772)
-    femmesh.addVolume([601, 1206, 1228, 1246, 3487, 3643, 3637, 3250, 3641, 3642], 2773)
-    femmesh.addVolume([1206, 1053, 1228, 1246, 3635, 3219, 3643, 3641, 3624, 3642], 2774)
-    femmesh.addVolume([1162, 1008, 1173, 1059, 2499, 2976, 1385, 1381, 2500, 1384], 2775)
-    femmesh.addVolume([1008, 1162, 1173, 1050, 2499, 1385, 2976, 2496, 1451, 1453], 2776)
-    femmesh.addVolume([1072, 1226, 1236, 1013, 3602, 3294, 1834, 1357, 1778, 1943], 2777)
-    femmesh.addVolume([1226, 1072, 1236, 1002, 3602, 1834, 3294, 3515, 1833, 1835], 2778)
-    femmesh.addVolume([1108, 1183, 1040, 1026, 3552, 3585, 1332, 1331, 3579, 1333], 2779)
-    femmesh.addVolume([1108, 1040, 1183, 1186, 1332, 3585, 3552, 3584, 3629, 3612], 2780)
-    femmesh.addVolume([1138, 1014, 1108, 1026, 1746, 3520, 1336, 1334, 1552, 1331], 2781)
-    femmesh.addVolume([1138, 1108, 1014, 1033, 1336, 3520, 1746, 1551, 1549, 1600], 2782)
-    femmesh.addVolume([983, 1093, 93, 1201, 1899, 2774, 2557, 2580, 2461, 2777], 2783)
-    femmesh.addVolume([983, 93, 1093, 1204, 2557, 2774, 1899, 1902, 2558, 1903], 2784)
-    femmesh.addVolume([1041, 1042, 1142, 1005, 3158, 3350, 1353, 1351, 2234, 1352], 2785)
-    femmesh.addVolume([1042, 1041, 1142, 1016, 3158, 1353, 3350, 3447, 1499, 1500], 2786)
-    femmesh.addVolume([1126, 1015, 1171, 995, 2545, 1400, 2274, 1699, 1563, 2017], 2787)
-    femmesh.addVolume([1015, 1126, 1171, 1070, 2545, 2274, 1400, 1398, 2450, 1342], 2788)
-    femmesh.addVolume([1218, 1152, 1017, 1124, 3650, 3283, 2764, 1722, 2538, 3503], 2789)
-    femmesh.addVolume([1152, 1218, 1017, 1007, 3650, 2764, 3283, 3651, 1588, 3458], 2790)
-    femmesh.addVolume([1152, 1218, 1151, 1124, 3650, 1587, 2540, 2538, 1722, 1721], 2791)
-    femmesh.addVolume([1218, 1152, 1151, 1007, 3650, 2540, 1587, 1588, 3651, 1586], 2792)
-    femmesh.addVolume([1235, 1132, 175, 1057, 3652, 2554, 3085, 1916, 2299, 3083], 2793)
-    femmesh.addVolume([1132, 1235, 175, 1129, 3652, 3085, 2554, 1296, 3595, 2553], 2794)
-    femmesh.addVolume([1132, 1235, 986, 1057, 3652, 1917, 1295, 2299, 1916, 1915], 2795)
-    femmesh.addVolume([1235, 1132, 986, 1129, 3652, 1295, 1917, 3595, 1296, 1297], 2796)
-    femmesh.addVolume([1131, 1104, 1162, 819, 1460, 2498, 2391, 1459, 1458, 2390], 2797)
-    femmesh.addVolume([1104, 1131, 1162, 1050, 1460, 2391, 2498, 2392, 1632, 1451], 2798)
-    femmesh.addVolume([1152, 1007, 1224, 1151, 3651, 2737, 3307, 2540, 1586, 3213], 2799)
-    femmesh.addVolume([1007, 1152, 1224, 1017, 3651, 3307, 2737, 3458, 3283, 3065], 2800)
-    femmesh.addVolume([1147, 1174, 1049, 998, 2906, 3202, 2685, 1809, 2905, 2842], 2801)
-    femmesh.addVolume([1147, 1049, 1174, 1012, 2685, 3202, 2906, 1328, 2684, 2943], 2802)
-    femmesh.addVolume([1235, 1086, 986, 1216, 3423, 2613, 1917, 1918, 1961, 1914], 2803)
-    femmesh.addVolume([1235, 986, 1086, 1129, 1917, 2613, 3423, 3595, 1297, 2614], 2804)
-    femmesh.addVolume([1166, 1167, 1083, 984, 2106, 1345, 1687, 1685, 1641, 1682], 2805)
-    femmesh.addVolume([1166, 1083, 1167, 1000, 1687, 1345, 2106, 1838, 1260, 1343], 2806)
-    femmesh.addVolume([1214, 105, 104, 1001, 2529, 515, 1417, 1416, 1688, 1315], 2807)
-    femmesh.addVolume([1214, 104, 105, 143, 1417, 515, 2529, 2826, 521, 257], 2808)
-    femmesh.addVolume([1032, 1015, 1126, 995, 2022, 2545, 1472, 2136, 1563, 1699], 2809)
-    femmesh.addVolume([1032, 1126, 1015, 1170, 1472, 2545, 2022, 1474, 1476, 1426], 2810)
-    femmesh.addVolume([1170, 1011, 1065, 1096, 2396, 1454, 2384, 2385, 2394, 1827], 2811)
-    femmesh.addVolume([1170, 1065, 1011, 992, 2384, 1454, 2396, 2071, 2183, 2460], 2812)
-    femmesh.addVolume([1144, 1184, 1216, 1019, 2917, 3116, 1560, 1559, 2915, 1406], 2813)
-    femmesh.addVolume([1184, 1144, 1216, 1086, 2917, 1560, 3116, 2598, 1693, 1961], 2814)
-    femmesh.addVolume([1197, 1122, 1006, 1023, 3157, 2203, 1947, 1945, 2523, 1485], 2815)
-    femmesh.addVolume([1197, 1006, 1122, 1041, 1947, 2203, 3157, 1959, 1350, 2204], 2816)
-    femmesh.addVolume([1199, 1069, 1242, 1039, 2841, 3440, 2193, 1702, 3011, 3272], 2817)
-    femmesh.addVolume([1069, 1199, 1242, 1146, 2841, 2193, 3440, 2616, 2188, 2191], 2818)
-    femmesh.addVolume([1179, 1013, 999, 1034, 3597, 1358, 2258, 2259, 2433, 2257], 2819)
-    femmesh.addVolume([1179, 999, 1013, 1072, 2258, 1358, 3597, 2402, 1356, 1357], 2820)
-    femmesh.addVolume([1011, 1094, 1244, 1026, 3143, 3653, 3316, 3136, 3456, 1557], 2821)
-    femmesh.addVolume([1011, 1244, 1094, 1155, 3316, 3653, 3143, 2491, 2027, 2456], 2822)
-    femmesh.addVolume([1067, 1244, 1094, 1026, 1556, 3653, 2455, 1553, 1557, 3456], 2823)
-    femmesh.addVolume([1067, 1094, 1244, 1155, 2455, 3653, 1556, 2025, 2456, 2027], 2824)
-    femmesh.addVolume([1217, 831, 820, 1149, 2767, 959, 2152, 3016, 1481, 2813], 2825)
-    femmesh.addVolume([1217, 820, 831, 828, 2152, 959, 2767, 2154, 918, 972], 2826)
-    femmesh.addVolume([1201, 1207, 93, 983, 2609, 2559, 2777, 2580, 2561, 2557], 2827)
-    femmesh.addVolume([1201, 93, 1207, 51, 2777, 2559, 2609, 2911, 275, 2912], 2828)
-    femmesh.addVolume([1169, 1101, 1038, 1061, 3513, 2771, 3586, 3376, 2772, 1743], 2829)
-    femmesh.addVolume([1169, 1038, 1101, 1069, 3586, 2771, 3513, 3215, 2796, 2859], 2830)
-    femmesh.addVolume([1078, 1007, 1031, 1066, 3537, 2004, 3499, 3305, 3459, 3234], 2831)
-    femmesh.addVolume([1078, 1031, 1007, 1022, 3499, 2004, 3537, 3178, 2380, 2519], 2832)
-    femmesh.addVolume([1177, 985, 1070, 1126, 3126, 1956, 3079, 2895, 2544, 2450], 2833)
-    femmesh.addVolume([1177, 1070, 985, 1168, 3079, 1956, 3126, 3367, 3058, 3057], 2834)
-    femmesh.addVolume([1201, 71, 162, 51, 3173, 279, 2778, 2911, 277, 278], 2835)
-    femmesh.addVolume([1201, 162, 71, 1093, 2778, 279, 3173, 2461, 2549, 3172], 2836)
-    femmesh.addVolume([623, 1223, 1180, 624, 3090, 3476, 1710, 766, 3089, 1709], 2837)
-    femmesh.addVolume([1223, 623, 1180, 1072, 3090, 1710, 3476, 3630, 2119, 3448], 2838)
-    femmesh.addVolume([1240, 1162, 833, 840, 2707, 1773, 3472, 2706, 1757, 900], 2839)
-    femmesh.addVolume([1240, 833, 1162, 1128, 3472, 1773, 2707, 2440, 3093, 2893], 2840)
-    femmesh.addVolume([1109, 105, 176, 180, 1691, 522, 2974, 3323, 258, 249], 2841)
-    femmesh.addVolume([1109, 176, 105, 1057, 2974, 522, 1691, 1391, 2973, 1690], 2842)
-    femmesh.addVolume([1097, 1203, 59, 101, 1953, 3518, 3373, 2321, 2322, 328], 2843)
-    femmesh.addVolume([1097, 59, 1203, 1003, 3373, 3518, 1953, 1949, 3372, 1952], 2844)
-    femmesh.addVolume([1217, 820, 1056, 1149, 2152, 2812, 2316, 3016, 2813, 2398], 2845)
-    femmesh.addVolume([1217, 1056, 820, 1188, 2316, 2812, 2152, 2153, 1798, 2151], 2846)
-    femmesh.addVolume([1154, 1155, 1032, 1094, 2400, 2365, 3148, 1876, 2456, 3147], 2847)
-    femmesh.addVolume([1154, 1032, 1155, 1051, 3148, 2365, 2400, 2583, 2330, 2366], 2848)
-    femmesh.addVolume([128, 178, 1218, 153, 325, 1992, 2605, 580, 565, 2126], 2849)
-    femmesh.addVolume([178, 128, 1218, 1124, 325, 2605, 1992, 1989, 2604, 1722], 2850)
-    femmesh.addVolume([610, 1185, 1169, 609, 3211, 2880, 1741, 729, 2837, 1740], 2851)
-    femmesh.addVolume([1185, 610, 1169, 1061, 3211, 1741, 2880, 1744, 1663, 3376], 2852)
-    femmesh.addVolume([1197, 40, 1075, 1114, 3096, 1530, 3040, 2564, 2087, 2086], 2853)
-    femmesh.addVolume([1197, 1075, 40, 1122, 3040, 1530, 3096, 3157, 2716, 2715], 2854)
-    femmesh.addVolume([87, 73, 1238, 7, 206, 3491, 3280, 203, 193, 3530], 2855)
-    femmesh.addVolume([73, 87, 1238, 1095, 206, 3280, 3491, 3257, 3168, 3055], 2856)
-    femmesh.addVolume([1194, 992, 1224, 1071, 2072, 1732, 2731, 2371, 2369, 3051], 2857)
-    femmesh.addVolume([992, 1194, 1224, 1112, 2072, 2731, 1732, 1728, 2728, 1731], 2858)
-    femmesh.addVolume([1191, 170, 111, 158, 2319, 541, 2986, 3414, 544, 375], 2859)
-    femmesh.addVolume([1191, 111, 170, 1083, 2986, 541, 2319, 1522, 2753, 1973], 2860)
-    femmesh.addVolume([1198, 1193, 116, 130, 2932, 3349, 3380, 3560, 3559, 472], 2861)
-    femmesh.addVolume([1198, 116, 1193, 1089, 3380, 3349, 2932, 2050, 3195, 3027], 2862)
-    femmesh.addVolume([1075, 836, 41, 817, 3544, 884, 1531, 1529, 883, 878], 2863)
-    femmesh.addVolume([1075, 41, 836, 1222, 1531, 884, 3544, 1911, 3107, 2480], 2864)
-    femmesh.addVolume([1240, 1092, 5, 841, 2439, 3308, 3146, 1497, 3309, 845], 2865)
-    femmesh.addVolume([1240, 5, 1092, 1211, 3146, 3308, 2439, 3004, 3573, 1982], 2866)
-    femmesh.addVolume([1163, 60, 168, 61, 1862, 343, 3446, 3177, 341, 342], 2867)
-    femmesh.addVolume([1163, 168, 60, 1058, 3446, 343, 1862, 1863, 2696, 1430], 2868)
-    femmesh.addVolume([1215, 1201, 1127, 1007, 3292, 2122, 3221, 1585, 2121, 2120], 2869)
-    femmesh.addVolume([1215, 1127, 1201, 1080, 3221, 2122, 3292, 3130, 2464, 3174], 2870)
-    femmesh.addVolume([1184, 1059, 1202, 1019, 2944, 2286, 3578, 2915, 2232, 1567], 2871)
-    femmesh.addVolume([1059, 1184, 1202, 1140, 2944, 3578, 2286, 2501, 2938, 2939], 2872)
-    femmesh.addVolume([1187, 825, 1158, 826, 1791, 2782, 2790, 1613, 976, 2783], 2873)
-    femmesh.addVolume([1187, 1158, 825, 1043, 2790, 2782, 1791, 3443, 2029, 3564], 2874)
-    femmesh.addVolume([1168, 1063, 133, 1070, 2704, 2786, 3589, 3058, 2128, 2785], 2875)
-    femmesh.addVolume([1168, 133, 1063, 115, 3589, 2786, 2704, 3381, 552, 3371], 2876)
-    femmesh.addVolume([1172, 1117, 1195, 1021, 3425, 3529, 3400, 2656, 3444, 3571], 2877)
-    femmesh.addVolume([1117, 1172, 1195, 1090, 3425, 3400, 3529, 3062, 3396, 3398], 2878)
-    femmesh.addVolume([1183, 1217, 1040, 1073, 3334, 3064, 3585, 3501, 3264, 2799], 2879)
-    femmesh.addVolume([1183, 1040, 1217, 1186, 3585, 3064, 3334, 3612, 3629, 3436], 2880)
-    femmesh.addVolume([1192, 1098, 1018, 1033, 3558, 1678, 2964, 2300, 2253, 2481], 2881)
-    femmesh.addVolume([1192, 1018, 1098, 1118, 2964, 1678, 3558, 2965, 2962, 3409], 2882)
-    femmesh.addVolume([1232, 1044, 1022, 1045, 3434, 1920, 3582, 3639, 1921, 1269], 2883)
-    femmesh.addVolume([1232, 1022, 1044, 1088, 3582, 1920, 3434, 2836, 2157, 2156], 2884)
-    femmesh.addVolume([1222, 1037, 1074, 1075, 1696, 3044, 3403, 1911, 1910, 2641], 2885)
-    femmesh.addVolume([1222, 1074, 1037, 1189, 3403, 3044, 1696, 2479, 3047, 3046], 2886)
-    femmesh.addVolume([1180, 1110, 616, 621, 3644, 2718, 3378, 3379, 3103, 762], 2887)
-    femmesh.addVolume([1180, 616, 1110, 1135, 3378, 2718, 3644, 3631, 3615, 3616], 2888)
-    femmesh.addVolume([1243, 630, 1181, 4, 2653, 2750, 3614, 2652, 658, 3539], 2889)
-    femmesh.addVolume([1243, 1181, 630, 1081, 3614, 2750, 2653, 3430, 2426, 1808], 2890)
-    femmesh.addVolume([1033, 1186, 1040, 1108, 3654, 3629, 1550, 1549, 3584, 1332], 2891)
-    femmesh.addVolume([1033, 1040, 1186, 1098, 1550, 3629, 3654, 2253, 1519, 3570], 2892)
-    femmesh.addVolume([6, 1186, 1033, 1108, 3364, 3654, 3655, 3401, 3584, 1549], 2893)
-    femmesh.addVolume([6, 1033, 1186, 1098, 3655, 3654, 3364, 3541, 2253, 3570], 2894)
-    femmesh.addVolume([1192, 6, 1033, 1108, 3296, 3655, 2300, 3587, 3401, 1549], 2895)
-    femmesh.addVolume([1192, 1033, 6, 1098, 2300, 3655, 3296, 3558, 2253, 3541], 2896)
-    return True
+    return load_mesh(femmesh, __name__, nodes=False)
@@ -1,10931 +1,11 @@
+from . import load_mesh
+
+
 def create_nodes(femmesh):
     # nodes
-    femmesh.addNode(102.5, -2.5e-14, 10.0, 1)
-    femmesh.addNode(102.5, -2.5e-14, 0.0, 2)
-    femmesh.addNode(3.0, -1e-15, 10.0, 3)
-    femmesh.addNode(-4.99999999999884, 97.3717104707524, 10.0, 4)
-    femmesh.addNode(-4.99999999999885, -97.3717104707523, 10.0, 5)
-    femmesh.addNode(97.5, -2.4e-14, 10.0, 6)
-    femmesh.addNode(4.99999999999908, 97.3717104707523, 10.0, 7)
-    femmesh.addNode(4.99999999999909, -97.3717104707523, 10.0, 8)
-    femmesh.addNode(3.0, -1e-15, 0.0, 9)
-    femmesh.addNode(-4.99999999999885, -97.3717104707523, 0.0, 10)
-    femmesh.addNode(-4.99999999999884, 97.3717104707524, 0.0, 11)
-    femmesh.addNode(4.99999999999909, -97.3717104707523, 0.0, 12)
-    femmesh.addNode(97.5, -2.4e-14, 0.0, 13)
-    femmesh.addNode(4.99999999999908, 97.3717104707523, 0.0, 14)
-    femmesh.addNode(102.5, -2.5e-14, 30.0, 15)
-    femmesh.addNode(102.5, -2.5e-14, 20.0, 16)
-    femmesh.addNode(3.0, -1e-15, 30.0, 17)
-    femmesh.addNode(-4.99999999999884, 97.3717104707524, 30.0, 18)
-    femmesh.addNode(-4.99999999999885, -97.3717104707523, 30.0, 19)
-    femmesh.addNode(97.5, -2.4e-14, 30.0, 20)
-    femmesh.addNode(4.99999999999908, 97.3717104707523, 30.0, 21)
-    femmesh.addNode(4.99999999999909, -97.3717104707523, 30.0, 22)
-    femmesh.addNode(3.0, -1e-15, 20.0, 23)
-    femmesh.addNode(-4.99999999999885, -97.3717104707523, 20.0, 24)
-    femmesh.addNode(-4.99999999999884, 97.3717104707524, 20.0, 25)
-    femmesh.addNode(4.99999999999909, -97.3717104707523, 20.0, 26)
-    femmesh.addNode(97.5, -2.4e-14, 20.0, 27)
-    femmesh.addNode(4.99999999999908, 97.3717104707523, 20.0, 28)
-    femmesh.addNode(102.37844066218436, 4.990479694337564, 10.0, 29)
-    femmesh.addNode(102.01405097405667, 9.969122522196567, 10.0, 30)
-    femmesh.addNode(101.4076952276988, 14.92411969283799, 10.0, 31)
-    femmesh.addNode(100.56081163194992, 19.84371850040931, 10.0, 32)
-    femmesh.addNode(99.47540890113405, 24.71625020006434, 10.0, 33)
-    femmesh.addNode(98.15406149061162, 29.53015768493683, 10.0, 34)
-    femmesh.addNode(96.59990349045574, 34.27402289832108, 10.0, 35)
-    femmesh.addNode(94.81662119173684, 38.93659391604098, 10.0, 36)
-    femmesh.addNode(92.80844434304754, 43.50681163477103, 10.0, 37)
-    femmesh.addNode(90.58013611800622, 47.973836003007555, 10.0, 38)
-    femmesh.addNode(88.13698181753554, 52.32707173247332, 10.0, 39)
-    femmesh.addNode(85.4847763337125, 56.556193428970694, 10.0, 40)
-    femmesh.addNode(82.6298104049247, 60.65117008307587, 10.0, 41)
-    femmesh.addNode(79.57885569493389, 64.60228886258511, 10.0, 42)
-    femmesh.addNode(76.33914873123767, 68.40017815027952, 10.0, 43)
-    femmesh.addNode(72.91837374082576, 72.03582977236573, 10.0, 44)
-    femmesh.addNode(69.32464442404257, 75.50062036486894, 10.0, 45)
-    femmesh.addNode(65.56648470978638, 78.78633182729952, 10.0, 46)
-    femmesh.addNode(61.65280853769175, 81.88517081507935, 10.0, 47)
-    femmesh.addNode(57.592898715249476, 84.78978722449429, 10.0, 48)
-    femmesh.addNode(53.396384900012876, 87.493291626328, 10.0, 49)
-    femmesh.addNode(49.07322075911397, 89.98927160682692, 10.0, 50)
-    femmesh.addNode(44.63366036026462, 92.27180697723733, 10.0, 51)
-    femmesh.addNode(40.08823385024101, 94.33548381583883, 10.0, 52)
-    femmesh.addNode(35.44772247853867, 96.17540730916872, 10.0, 53)
-    femmesh.addNode(30.723133025439985, 97.78721336197856, 10.0, 54)
-    femmesh.addNode(25.92567169514729, 99.16707894838608, 10.0, 55)
-    femmesh.addNode(21.066717535904573, 100.31173117967016, 10.0, 56)
-    femmesh.addNode(16.157795450152296, 101.21845506720125, 10.0, 57)
-    femmesh.addNode(11.210548858732139, 101.88509996209446, 10.0, 58)
-    femmesh.addNode(6.236712083978917, 102.31008465631115, 10.0, 59)
-    femmesh.addNode(1.2480825172047367, 102.49240113310961, 10.0, 60)
-    femmesh.addNode(-3.743507363410042, 102.43161695794954, 10.0, 61)
-    femmesh.addNode(-8.72621805814769, 102.12787630417886, 10.0, 62)
-    femmesh.addNode(-13.688231127738325, 101.58189961107055, 10.0, 63)
-    femmesh.addNode(-18.617777225392295, 100.79498187502026, 10.0, 64)
-    femmesh.addNode(-23.503164012390265, 99.76898957795795, 10.0, 65)
-    femmesh.addNode(-28.33280389101911, 98.50635626025893, 10.0, 66)
-    femmesh.addNode(-33.095241489073274, 97.01007674865494, 10.0, 67)
-    femmesh.addNode(-37.779180830732116, 95.28370005283612, 10.0, 68)
-    femmesh.addNode(-42.373512129366546, 93.331320947592, 10.0, 69)
-    femmesh.addNode(-46.867338138725486, 91.15757026045817, 10.0, 70)
-    femmesh.addNode(-51.25000000000002, 88.76760388790494, 10.0, 71)
-    femmesh.addNode(-55.511102523458916, 86.16709056612062, 10.0, 72)
-    femmesh.addNode(-59.64053884469015, 83.36219842539546, 10.0, 73)
-    femmesh.addNode(-63.62851439696672, 80.35958035999815, 10.0, 74)
-    femmesh.addNode(-67.46557014287666, 77.16635824824566, 10.0, 75)
-    femmesh.addNode(-71.14260501011495, 73.7901060601946, 10.0, 76)
-    femmesh.addNode(-74.65089747822138, 70.23883189302113, 10.0, 77)
-    femmesh.addNode(-77.98212626506347, 66.5209589766992, 10.0, 78)
-    femmesh.addNode(-81.12839006399851, 62.64530569502959, 10.0, 79)
-    femmesh.addNode(-84.08222628489983, 58.621064669407886, 10.0, 80)
-    femmesh.addNode(-86.83662875459612, 54.457780954942045, 10.0, 81)
-    femmesh.addNode(-89.38506433474022, 50.165329400636374, 10.0, 82)
-    femmesh.addNode(-91.72148841769136, 45.753891227340524, 10.0, 83)
-    femmesh.addNode(-93.84035926365677, 41.233929879018675, 10.0, 84)
-    femmesh.addNode(-95.73665114508611, 36.61616620461624, 10.0, 85)
-    femmesh.addNode(-97.40586626714214, 31.91155302939078, 10.0, 86)
-    femmesh.addNode(-98.84404543597297, 27.131249176020468, 10.0, 87)
-    femmesh.addNode(-100.0477774494825, 22.286592997109796, 10.0, 88)
-    femmesh.addNode(-101.01420718832499, 17.38907548186937, 10.0, 89)
-    femmesh.addNode(-101.74104238793268, 12.450313000759673, 10.0, 90)
-    femmesh.addNode(-102.22655907551403, 7.482019752743251, 10.0, 91)
-    femmesh.addNode(-102.46960565912678, 2.495979980499136, 10.0, 92)
-    femmesh.addNode(-102.4696056591268, -2.495979980498747, 10.0, 93)
-    femmesh.addNode(-102.22655907551406, -7.482019752742862, 10.0, 94)
-    femmesh.addNode(-101.74104238793272, -12.450313000759287, 10.0, 95)
-    femmesh.addNode(-101.01420718832505, -17.38907548186903, 10.0, 96)
-    femmesh.addNode(-100.04777744948255, -22.28659299710946, 10.0, 97)
-    femmesh.addNode(-98.84404543597303, -27.13124917602023, 10.0, 98)
-    femmesh.addNode(-97.40586626714223, -31.911553029390497, 10.0, 99)
-    femmesh.addNode(-95.73665114508621, -36.616166204616015, 10.0, 100)
-    femmesh.addNode(-93.84035926365688, -41.233929879018405, 10.0, 101)
-    femmesh.addNode(-91.72148841769148, -45.7538912273403, 10.0, 102)
-    femmesh.addNode(-89.38506433474035, -50.16532940063615, 10.0, 103)
-    femmesh.addNode(-86.83662875459626, -54.45778095494183, 10.0, 104)
-    femmesh.addNode(-84.08222628489995, -58.621064669407716, 10.0, 105)
-    femmesh.addNode(-81.12839006399861, -62.64530569502947, 10.0, 106)
-    femmesh.addNode(-77.98212626506354, -66.5209589766991, 10.0, 107)
-    femmesh.addNode(-74.65089747822142, -70.23883189302109, 10.0, 108)
-    femmesh.addNode(-71.14260501011502, -73.79010606019452, 10.0, 109)
-    femmesh.addNode(-67.46557014287671, -77.1663582482456, 10.0, 110)
-    femmesh.addNode(-63.62851439696674, -80.35958035999812, 10.0, 111)
-    femmesh.addNode(-59.64053884469017, -83.36219842539545, 10.0, 112)
-    femmesh.addNode(-55.511102523458895, -86.16709056612063, 10.0, 113)
-    femmesh.addNode(-51.24999999999996, -88.76760388790498, 10.0, 114)
-    femmesh.addNode(-46.86733813872539, -91.15757026045821, 10.0, 115)
-    femmesh.addNode(-42.37351212936651, -93.33132094759203, 10.0, 116)
-    femmesh.addNode(-37.77918083073205, -95.28370005283615, 10.0, 117)
-    femmesh.addNode(-33.09524148907328, -97.01007674865494, 10.0, 118)
-    femmesh.addNode(-28.332803891019093, -98.50635626025893, 10.0, 119)
-    femmesh.addNode(-23.503164012390222, -99.76898957795797, 10.0, 120)
-    femmesh.addNode(-18.617777225392206, -100.79498187502028, 10.0, 121)
-    femmesh.addNode(-13.688231127738236, -101.58189961107057, 10.0, 122)
-    femmesh.addNode(-8.726218058147579, -102.12787630417887, 10.0, 123)
-    femmesh.addNode(-3.7435073634099303, -102.43161695794954, 10.0, 124)
-    femmesh.addNode(1.2480825172047798, -102.49240113310961, 10.0, 125)
-    femmesh.addNode(6.236712083978983, -102.31008465631113, 10.0, 126)
-    femmesh.addNode(11.210548858732205, -101.88509996209444, 10.0, 127)
-    femmesh.addNode(16.157795450152406, -101.21845506720123, 10.0, 128)
-    femmesh.addNode(21.066717535904683, -100.31173117967013, 10.0, 129)
-    femmesh.addNode(25.92567169514742, -99.16707894838605, 10.0, 130)
-    femmesh.addNode(30.723133025440156, -97.7872133619785, 10.0, 131)
-    femmesh.addNode(35.44772247853886, -96.17540730916865, 10.0, 132)
-    femmesh.addNode(40.08823385024112, -94.3354838158388, 10.0, 133)
-    femmesh.addNode(44.63366036026474, -92.27180697723726, 10.0, 134)
-    femmesh.addNode(49.07322075911409, -89.98927160682685, 10.0, 135)
-    femmesh.addNode(53.39638490001303, -87.4932916263279, 10.0, 136)
-    femmesh.addNode(57.59289871524963, -84.78978722449419, 10.0, 137)
-    femmesh.addNode(61.65280853769184, -81.88517081507929, 10.0, 138)
-    femmesh.addNode(65.5664847097865, -78.78633182729942, 10.0, 139)
-    femmesh.addNode(69.3246444240427, -75.50062036486882, 10.0, 140)
-    femmesh.addNode(72.9183737408259, -72.03582977236559, 10.0, 141)
-    femmesh.addNode(76.33914873123781, -68.40017815027934, 10.0, 142)
-    femmesh.addNode(79.57885569493405, -64.60228886258491, 10.0, 143)
-    femmesh.addNode(82.62981040492487, -60.651170083075655, 10.0, 144)
-    femmesh.addNode(85.48477633371262, -56.55619342897051, 10.0, 145)
-    femmesh.addNode(88.13698181753566, -52.32707173247313, 10.0, 146)
-    femmesh.addNode(90.58013611800635, -47.97383600300733, 10.0, 147)
-    femmesh.addNode(92.80844434304763, -43.50681163477085, 10.0, 148)
-    femmesh.addNode(94.81662119173693, -38.93659391604078, 10.0, 149)
-    femmesh.addNode(96.59990349045582, -34.27402289832085, 10.0, 150)
-    femmesh.addNode(98.1540614906117, -29.530157684936572, 10.0, 151)
-    femmesh.addNode(99.47540890113412, -24.716250200064056, 10.0, 152)
-    femmesh.addNode(100.56081163194997, -19.843718500408993, 10.0, 153)
-    femmesh.addNode(101.40769522769884, -14.924119692837735, 10.0, 154)
-    femmesh.addNode(102.0140509740567, -9.969122522196285, 10.0, 155)
-    femmesh.addNode(102.37844066218437, -4.9904796943372505, 10.0, 156)
-    femmesh.addNode(102.5, -2.511e-14, 5.0, 157)
-    femmesh.addNode(102.37844066218436, 4.990479694337564, 0.0, 158)
-    femmesh.addNode(102.01405097405667, 9.969122522196567, 0.0, 159)
-    femmesh.addNode(101.4076952276988, 14.92411969283799, 0.0, 160)
-    femmesh.addNode(100.56081163194992, 19.84371850040931, 0.0, 161)
-    femmesh.addNode(99.47540890113405, 24.71625020006434, 0.0, 162)
-    femmesh.addNode(98.15406149061162, 29.53015768493683, 0.0, 163)
-    femmesh.addNode(96.59990349045574, 34.27402289832108, 0.0, 164)
-    femmesh.addNode(94.81662119173684, 38.93659391604098, 0.0, 165)
-    femmesh.addNode(92.80844434304754, 43.50681163477103, 0.0, 166)
-    femmesh.addNode(90.58013611800622, 47.973836003007555, 0.0, 167)
-    femmesh.addNode(88.13698181753554, 52.32707173247332, 0.0, 168)
-    femmesh.addNode(85.4847763337125, 56.556193428970694, 0.0, 169)
-    femmesh.addNode(82.6298104049247, 60.65117008307587, 0.0, 170)
-    femmesh.addNode(79.57885569493389, 64.60228886258511, 0.0, 171)
-    femmesh.addNode(76.33914873123767, 68.40017815027952, 0.0, 172)
-    femmesh.addNode(72.91837374082576, 72.03582977236573, 0.0, 173)
-    femmesh.addNode(69.32464442404257, 75.50062036486894, 0.0, 174)
-    femmesh.addNode(65.56648470978638, 78.78633182729952, 0.0, 175)
-    femmesh.addNode(61.65280853769175, 81.88517081507935, 0.0, 176)
-    femmesh.addNode(57.592898715249476, 84.78978722449429, 0.0, 177)
-    femmesh.addNode(53.396384900012876, 87.493291626328, 0.0, 178)
-    femmesh.addNode(49.07322075911397, 89.98927160682692, 0.0, 179)
-    femmesh.addNode(44.63366036026462, 92.27180697723733, 0.0, 180)
-    femmesh.addNode(40.08823385024101, 94.33548381583883, 0.0, 181)
-    femmesh.addNode(35.44772247853867, 96.17540730916872, 0.0, 182)
-    femmesh.addNode(30.723133025439985, 97.78721336197856, 0.0, 183)
-    femmesh.addNode(25.92567169514729, 99.16707894838608, 0.0, 184)
-    femmesh.addNode(21.066717535904573, 100.31173117967016, 0.0, 185)
-    femmesh.addNode(16.157795450152296, 101.21845506720125, 0.0, 186)
-    femmesh.addNode(11.210548858732139, 101.88509996209446, 0.0, 187)
-    femmesh.addNode(6.236712083978917, 102.31008465631115, 0.0, 188)
-    femmesh.addNode(1.2480825172047367, 102.49240113310961, 0.0, 189)
-    femmesh.addNode(-3.743507363410042, 102.43161695794954, 0.0, 190)
-    femmesh.addNode(-8.72621805814769, 102.12787630417886, 0.0, 191)
-    femmesh.addNode(-13.688231127738325, 101.58189961107055, 0.0, 192)
-    femmesh.addNode(-18.617777225392295, 100.79498187502026, 0.0, 193)
-    femmesh.addNode(-23.503164012390265, 99.76898957795795, 0.0, 194)
-    femmesh.addNode(-28.33280389101911, 98.50635626025893, 0.0, 195)
-    femmesh.addNode(-33.095241489073274, 97.01007674865494, 0.0, 196)
-    femmesh.addNode(-37.779180830732116, 95.28370005283612, 0.0, 197)
-    femmesh.addNode(-42.373512129366546, 93.331320947592, 0.0, 198)
-    femmesh.addNode(-46.867338138725486, 91.15757026045817, 0.0, 199)
-    femmesh.addNode(-51.25000000000002, 88.76760388790494, 0.0, 200)
-    femmesh.addNode(-55.511102523458916, 86.16709056612062, 0.0, 201)
-    femmesh.addNode(-59.64053884469015, 83.36219842539546, 0.0, 202)
-    femmesh.addNode(-63.62851439696672, 80.35958035999815, 0.0, 203)
-    femmesh.addNode(-67.46557014287666, 77.16635824824566, 0.0, 204)
-    femmesh.addNode(-71.14260501011495, 73.7901060601946, 0.0, 205)
-    femmesh.addNode(-74.65089747822138, 70.23883189302113, 0.0, 206)
-    femmesh.addNode(-77.98212626506347, 66.5209589766992, 0.0, 207)
-    femmesh.addNode(-81.12839006399851, 62.64530569502959, 0.0, 208)
-    femmesh.addNode(-84.08222628489983, 58.621064669407886, 0.0, 209)
-    femmesh.addNode(-86.83662875459612, 54.457780954942045, 0.0, 210)
-    femmesh.addNode(-89.38506433474022, 50.165329400636374, 0.0, 211)
-    femmesh.addNode(-91.72148841769136, 45.753891227340524, 0.0, 212)
-    femmesh.addNode(-93.84035926365677, 41.233929879018675, 0.0, 213)
-    femmesh.addNode(-95.73665114508611, 36.61616620461624, 0.0, 214)
-    femmesh.addNode(-97.40586626714214, 31.91155302939078, 0.0, 215)
-    femmesh.addNode(-98.84404543597297, 27.131249176020468, 0.0, 216)
-    femmesh.addNode(-100.0477774494825, 22.286592997109796, 0.0, 217)
-    femmesh.addNode(-101.01420718832499, 17.38907548186937, 0.0, 218)
-    femmesh.addNode(-101.74104238793268, 12.450313000759673, 0.0, 219)
-    femmesh.addNode(-102.22655907551403, 7.482019752743251, 0.0, 220)
-    femmesh.addNode(-102.46960565912678, 2.495979980499136, 0.0, 221)
-    femmesh.addNode(-102.4696056591268, -2.495979980498747, 0.0, 222)
-    femmesh.addNode(-102.22655907551406, -7.482019752742862, 0.0, 223)
-    femmesh.addNode(-101.74104238793272, -12.450313000759287, 0.0, 224)
-    femmesh.addNode(-101.01420718832505, -17.38907548186903, 0.0, 225)
-    femmesh.addNode(-100.04777744948255, -22.28659299710946, 0.0, 226)
-    femmesh.addNode(-98.84404543597303, -27.13124917602023, 0.0, 227)
-    femmesh.addNode(-97.40586626714223, -31.911553029390497, 0.0, 228)
-    femmesh.addNode(-95.73665114508621, -36.616166204616015, 0.0, 229)
-    femmesh.addNode(-93.84035926365688, -41.233929879018405, 0.0, 230)
-    femmesh.addNode(-91.72148841769148, -45.7538912273403, 0.0, 231)
-    femmesh.addNode(-89.38506433474035, -50.16532940063615, 0.0, 232)
-    femmesh.addNode(-86.83662875459626, -54.45778095494183, 0.0, 233)
-    femmesh.addNode(-84.08222628489995, -58.621064669407716, 0.0, 234)
-    femmesh.addNode(-81.12839006399861, -62.64530569502947, 0.0, 235)
-    femmesh.addNode(-77.98212626506354, -66.5209589766991, 0.0, 236)
-    femmesh.addNode(-74.65089747822142, -70.23883189302109, 0.0, 237)
-    femmesh.addNode(-71.14260501011502, -73.79010606019452, 0.0, 238)
-    femmesh.addNode(-67.46557014287671, -77.1663582482456, 0.0, 239)
-    femmesh.addNode(-63.62851439696674, -80.35958035999812, 0.0, 240)
-    femmesh.addNode(-59.64053884469017, -83.36219842539545, 0.0, 241)
-    femmesh.addNode(-55.511102523458895, -86.16709056612063, 0.0, 242)
-    femmesh.addNode(-51.24999999999996, -88.76760388790498, 0.0, 243)
-    femmesh.addNode(-46.86733813872539, -91.15757026045821, 0.0, 244)
-    femmesh.addNode(-42.37351212936651, -93.33132094759203, 0.0, 245)
-    femmesh.addNode(-37.77918083073205, -95.28370005283615, 0.0, 246)
-    femmesh.addNode(-33.09524148907328, -97.01007674865494, 0.0, 247)
-    femmesh.addNode(-28.332803891019093, -98.50635626025893, 0.0, 248)
-    femmesh.addNode(-23.503164012390222, -99.76898957795797, 0.0, 249)
-    femmesh.addNode(-18.617777225392206, -100.79498187502028, 0.0, 250)
-    femmesh.addNode(-13.688231127738236, -101.58189961107057, 0.0, 251)
-    femmesh.addNode(-8.726218058147579, -102.12787630417887, 0.0, 252)
-    femmesh.addNode(-3.7435073634099303, -102.43161695794954, 0.0, 253)
-    femmesh.addNode(1.2480825172047798, -102.49240113310961, 0.0, 254)
-    femmesh.addNode(6.236712083978983, -102.31008465631113, 0.0, 255)
-    femmesh.addNode(11.210548858732205, -101.88509996209444, 0.0, 256)
-    femmesh.addNode(16.157795450152406, -101.21845506720123, 0.0, 257)
-    femmesh.addNode(21.066717535904683, -100.31173117967013, 0.0, 258)
-    femmesh.addNode(25.92567169514742, -99.16707894838605, 0.0, 259)
-    femmesh.addNode(30.723133025440156, -97.7872133619785, 0.0, 260)
-    femmesh.addNode(35.44772247853886, -96.17540730916865, 0.0, 261)
-    femmesh.addNode(40.08823385024112, -94.3354838158388, 0.0, 262)
-    femmesh.addNode(44.63366036026474, -92.27180697723726, 0.0, 263)
-    femmesh.addNode(49.07322075911409, -89.98927160682685, 0.0, 264)
-    femmesh.addNode(53.39638490001303, -87.4932916263279, 0.0, 265)
-    femmesh.addNode(57.59289871524963, -84.78978722449419, 0.0, 266)
-    femmesh.addNode(61.65280853769184, -81.88517081507929, 0.0, 267)
-    femmesh.addNode(65.5664847097865, -78.78633182729942, 0.0, 268)
-    femmesh.addNode(69.3246444240427, -75.50062036486882, 0.0, 269)
-    femmesh.addNode(72.9183737408259, -72.03582977236559, 0.0, 270)
-    femmesh.addNode(76.33914873123781, -68.40017815027934, 0.0, 271)
-    femmesh.addNode(79.57885569493405, -64.60228886258491, 0.0, 272)
-    femmesh.addNode(82.62981040492487, -60.651170083075655, 0.0, 273)
-    femmesh.addNode(85.48477633371262, -56.55619342897051, 0.0, 274)
-    femmesh.addNode(88.13698181753566, -52.32707173247313, 0.0, 275)
-    femmesh.addNode(90.58013611800635, -47.97383600300733, 0.0, 276)
-    femmesh.addNode(92.80844434304763, -43.50681163477085, 0.0, 277)
-    femmesh.addNode(94.81662119173693, -38.93659391604078, 0.0, 278)
-    femmesh.addNode(96.59990349045582, -34.27402289832085, 0.0, 279)
-    femmesh.addNode(98.1540614906117, -29.530157684936572, 0.0, 280)
-    femmesh.addNode(99.47540890113412, -24.716250200064056, 0.0, 281)
-    femmesh.addNode(100.56081163194997, -19.843718500408993, 0.0, 282)
-    femmesh.addNode(101.40769522769884, -14.924119692837735, 0.0, 283)
-    femmesh.addNode(102.0140509740567, -9.969122522196285, 0.0, 284)
-    femmesh.addNode(102.37844066218437, -4.9904796943372505, 0.0, 285)
-    femmesh.addNode(6.178901352847948e-15, -3.0, 10.0, 286)
-    femmesh.addNode(-3.0, -1.1025535076145708e-14, 10.0, 287)
-    femmesh.addNode(-5.51091059616309e-16, 3.0, 10.0, 288)
-    femmesh.addNode(-9.923329892153278, 96.99369837186072, 10.0, 289)
-    femmesh.addNode(-14.821207968105751, 96.36691234218392, 10.0, 290)
-    femmesh.addNode(-19.68107192327408, 95.49295999156645, 10.0, 291)
-    femmesh.addNode(-24.490456953454412, 94.37408287348279, 10.0, 292)
-    femmesh.addNode(-29.237027725128208, 93.01315073579696, 10.0, 293)
-    femmesh.addNode(-33.908610013696915, 91.41365416030044, 10.0, 294)
-    femmesh.addNode(-38.49322192849735, 89.57969560990621, 10.0, 295)
-    femmesh.addNode(-42.979104644509746, 87.51597890646188, 10.0, 296)
-    femmesh.addNode(-47.3547525619371, 85.2277971661694, 10.0, 297)
-    femmesh.addNode(-51.60894281630028, 82.72101922355556, 10.0, 298)
-    femmesh.addNode(-55.730764063360965, 80.00207457881324, 10.0, 299)
-    femmesh.addNode(-59.70964446504272, 77.07793690712143, 10.0, 300)
-    femmesh.addNode(-63.53537880457094, 73.9561061722403, 10.0, 301)
-    femmesh.addNode(-67.19815466128574, 70.64458939025637, 10.0, 302)
-    femmesh.addNode(-70.68857757799296, 67.151880092817, 10.0, 303)
-    femmesh.addNode(-73.99769515630308, 63.48693654252692, 10.0, 304)
-    femmesh.addNode(-77.1170200181575, 59.65915875638119, 10.0, 305)
-    femmesh.addNode(-80.03855157464888, 55.67836439616624, 10.0, 306)
-    femmesh.addNode(-82.75479654630207, 51.554763587666166, 10.0, 307)
-    femmesh.addNode(-85.2587881821847, 47.29893273325902, 10.0, 308)
-    femmesh.addNode(-87.5441041285524, 42.92178738507022, 10.0, 309)
-    femmesh.addNode(-89.6048829011995, 38.4345542482585, 10.0, 310)
-    femmesh.addNode(-91.43583891926498, 33.848742386242776, 10.0, 311)
-    femmesh.addNode(-93.03227606193524, 29.176113701723068, 10.0, 312)
-    femmesh.addNode(-94.39009971327236, 24.42865276920731, 10.0, 313)
-    femmesh.addNode(-95.50582726427469, 19.618536096419813, 10.0, 314)
-    femmesh.addNode(-96.37659704523365, 14.758100893430004, 10.0, 315)
-    femmesh.addNode(-97.00017566547697, 9.859813429604573, 10.0, 316)
-    femmesh.addNode(-97.37496374167233, 4.936237059542291, 10.0, 317)
-    femmesh.addNode(-97.5, 1.4183640017283e-13, 10.0, 318)
-    femmesh.addNode(-97.37496374167235, -4.936237059541965, 10.0, 319)
-    femmesh.addNode(-97.00017566547699, -9.859813429604293, 10.0, 320)
-    femmesh.addNode(-96.37659704523371, -14.75810089342968, 10.0, 321)
-    femmesh.addNode(-95.50582726427474, -19.618536096419533, 10.0, 322)
-    femmesh.addNode(-94.39009971327245, -24.428652769206998, 10.0, 323)
-    femmesh.addNode(-93.03227606193532, -29.176113701722763, 10.0, 324)
-    femmesh.addNode(-91.43583891926508, -33.848742386242506, 10.0, 325)
-    femmesh.addNode(-89.60488290119963, -38.434554248258195, 10.0, 326)
-    femmesh.addNode(-87.54410412855258, -42.92178738506988, 10.0, 327)
-    femmesh.addNode(-85.25878818218484, -47.29893273325877, 10.0, 328)
-    femmesh.addNode(-82.75479654630223, -51.55476358766592, 10.0, 329)
-    femmesh.addNode(-80.03855157464906, -55.67836439616598, 10.0, 330)
-    femmesh.addNode(-77.11702001815767, -59.65915875638096, 10.0, 331)
-    femmesh.addNode(-73.99769515630328, -63.48693654252667, 10.0, 332)
-    femmesh.addNode(-70.68857757799319, -67.15188009281677, 10.0, 333)
-    femmesh.addNode(-67.19815466128601, -70.64458939025612, 10.0, 334)
-    femmesh.addNode(-63.53537880457125, -73.95610617224003, 10.0, 335)
-    femmesh.addNode(-59.70964446504306, -77.07793690712118, 10.0, 336)
-    femmesh.addNode(-55.73076406336134, -80.00207457881297, 10.0, 337)
-    femmesh.addNode(-51.60894281630067, -82.72101922355532, 10.0, 338)
-    femmesh.addNode(-47.3547525619375, -85.22779716616918, 10.0, 339)
-    femmesh.addNode(-42.979104644510194, -87.51597890646165, 10.0, 340)
-    femmesh.addNode(-38.4932219284978, -89.57969560990601, 10.0, 341)
-    femmesh.addNode(-33.908610013697405, -91.41365416030025, 10.0, 342)
-    femmesh.addNode(-29.237027725128705, -93.01315073579678, 10.0, 343)
-    femmesh.addNode(-24.490456953454935, -94.37408287348265, 10.0, 344)
-    femmesh.addNode(-19.68107192327461, -95.49295999156635, 10.0, 345)
-    femmesh.addNode(-14.82120796810631, -96.36691234218384, 10.0, 346)
-    femmesh.addNode(-9.92332989215384, -96.99369837186066, 10.0, 347)
-    femmesh.addNode(-5.0, -92.37828942097019, 10.0, 348)
-    femmesh.addNode(-5.0, -87.38486837118802, 10.0, 349)
-    femmesh.addNode(-5.0, -82.39144732140586, 10.0, 350)
-    femmesh.addNode(-5.0, -77.3980262716237, 10.0, 351)
-    femmesh.addNode(-5.0, -72.40460522184154, 10.0, 352)
-    femmesh.addNode(-5.0, -67.41118417205936, 10.0, 353)
-    femmesh.addNode(-5.0, -62.41776312227721, 10.0, 354)
-    femmesh.addNode(-5.0, -57.424342072495044, 10.0, 355)
-    femmesh.addNode(-5.0, -52.43092102271288, 10.0, 356)
-    femmesh.addNode(-5.0, -47.43749997293072, 10.0, 357)
-    femmesh.addNode(-5.0, -42.44407892314855, 10.0, 358)
-    femmesh.addNode(-5.0, -37.45065787336639, 10.0, 359)
-    femmesh.addNode(-5.0, -32.45723682358424, 10.0, 360)
-    femmesh.addNode(-5.0, -27.463815773802068, 10.0, 361)
-    femmesh.addNode(-5.0, -22.47039472401991, 10.0, 362)
-    femmesh.addNode(-5.0, -17.47697367423774, 10.0, 363)
-    femmesh.addNode(-5.0, -12.48355262445557, 10.0, 364)
-    femmesh.addNode(-5.0, -7.4901315746733985, 10.0, 365)
-    femmesh.addNode(-5.0, -2.496710524891256, 10.0, 366)
-    femmesh.addNode(-5.0, 2.4967105248909007, 10.0, 367)
-    femmesh.addNode(-5.0, 7.490131574673072, 10.0, 368)
-    femmesh.addNode(-5.0, 12.483552624455243, 10.0, 369)
-    femmesh.addNode(-5.0, 17.4769736742374, 10.0, 370)
-    femmesh.addNode(-5.0, 22.47039472401957, 10.0, 371)
-    femmesh.addNode(-5.0, 27.463815773801727, 10.0, 372)
-    femmesh.addNode(-5.0, 32.457236823583884, 10.0, 373)
-    femmesh.addNode(-5.0, 37.450657873366055, 10.0, 374)
-    femmesh.addNode(-5.0, 42.444078923148226, 10.0, 375)
-    femmesh.addNode(-5.0, 47.4374999729304, 10.0, 376)
-    femmesh.addNode(-5.0, 52.43092102271254, 10.0, 377)
-    femmesh.addNode(-5.0, 57.42434207249471, 10.0, 378)
-    femmesh.addNode(-5.0, 62.41776312227685, 10.0, 379)
-    femmesh.addNode(-5.0, 67.411184172059, 10.0, 380)
-    femmesh.addNode(-5.0, 72.40460522184117, 10.0, 381)
-    femmesh.addNode(-5.0, 77.39802627162334, 10.0, 382)
-    femmesh.addNode(-5.0, 82.39144732140551, 10.0, 383)
-    femmesh.addNode(-5.0, 87.38486837118768, 10.0, 384)
-    femmesh.addNode(-5.0, 92.37828942096982, 10.0, 385)
-    femmesh.addNode(97.37496374167235, 4.936237059542162, 10.0, 386)
-    femmesh.addNode(97.00017566547697, 9.859813429604458, 10.0, 387)
-    femmesh.addNode(96.37659704523368, 14.758100893429901, 10.0, 388)
-    femmesh.addNode(95.5058272642747, 19.618536096419724, 10.0, 389)
-    femmesh.addNode(94.39009971327239, 24.42865276920723, 10.0, 390)
-    femmesh.addNode(93.03227606193525, 29.17611370172301, 10.0, 391)
-    femmesh.addNode(91.43583891926498, 33.84874238624277, 10.0, 392)
-    femmesh.addNode(89.60488290119952, 38.434554248258465, 10.0, 393)
-    femmesh.addNode(87.54410412855243, 42.92178738507017, 10.0, 394)
-    femmesh.addNode(85.25878818218472, 47.298932733259015, 10.0, 395)
-    femmesh.addNode(82.75479654630207, 51.554763587666166, 10.0, 396)
-    femmesh.addNode(80.03855157464888, 55.67836439616624, 10.0, 397)
-    femmesh.addNode(77.11702001815753, 59.65915875638117, 10.0, 398)
-    femmesh.addNode(73.9976951563031, 63.4869365425269, 10.0, 399)
-    femmesh.addNode(70.68857757799296, 67.15188009281698, 10.0, 400)
-    femmesh.addNode(67.19815466128578, 70.64458939025631, 10.0, 401)
-    femmesh.addNode(63.535378804570996, 73.95610617224025, 10.0, 402)
-    femmesh.addNode(59.7096444650428, 77.07793690712137, 10.0, 403)
-    femmesh.addNode(55.73076406336107, 80.00207457881315, 10.0, 404)
-    femmesh.addNode(51.6089428163004, 82.72101922355547, 10.0, 405)
-    femmesh.addNode(47.354752561937225, 85.22779716616932, 10.0, 406)
-    femmesh.addNode(42.97910464450991, 87.5159789064618, 10.0, 407)
-    femmesh.addNode(38.49322192849753, 89.57969560990614, 10.0, 408)
-    femmesh.addNode(33.90861001369713, 91.41365416030035, 10.0, 409)
-    femmesh.addNode(29.237027725128424, 93.01315073579687, 10.0, 410)
-    femmesh.addNode(24.490456953454654, 94.37408287348272, 10.0, 411)
-    femmesh.addNode(19.681071923274324, 95.49295999156641, 10.0, 412)
-    femmesh.addNode(14.82120796810602, 96.36691234218388, 10.0, 413)
-    femmesh.addNode(9.923329892153571, 96.9936983718607, 10.0, 414)
-    femmesh.addNode(9.923329892153891, -96.99369837186066, 10.0, 415)
-    femmesh.addNode(14.82120796810636, -96.36691234218382, 10.0, 416)
-    femmesh.addNode(19.68107192327466, -95.49295999156634, 10.0, 417)
-    femmesh.addNode(24.490456953454984, -94.37408287348264, 10.0, 418)
-    femmesh.addNode(29.237027725128755, -93.01315073579677, 10.0, 419)
-    femmesh.addNode(33.908610013697455, -91.41365416030024, 10.0, 420)
-    femmesh.addNode(38.49322192849785, -89.579695609906, 10.0, 421)
-    femmesh.addNode(42.97910464451024, -87.51597890646164, 10.0, 422)
-    femmesh.addNode(47.354752561937545, -85.22779716616914, 10.0, 423)
-    femmesh.addNode(51.60894281630071, -82.72101922355529, 10.0, 424)
-    femmesh.addNode(55.730764063361384, -80.00207457881294, 10.0, 425)
-    femmesh.addNode(59.70964446504309, -77.07793690712114, 10.0, 426)
-    femmesh.addNode(63.535378804571295, -73.95610617223998, 10.0, 427)
-    femmesh.addNode(67.19815466128607, -70.64458939025604, 10.0, 428)
-    femmesh.addNode(70.68857757799324, -67.1518800928167, 10.0, 429)
-    femmesh.addNode(73.99769515630335, -63.4869365425266, 10.0, 430)
-    femmesh.addNode(77.11702001815776, -59.659158756380855, 10.0, 431)
-    femmesh.addNode(80.0385515746491, -55.678364396165904, 10.0, 432)
-    femmesh.addNode(82.7547965463023, -51.5547635876658, 10.0, 433)
-    femmesh.addNode(85.2587881821849, -47.29893273325865, 10.0, 434)
-    femmesh.addNode(87.54410412855262, -42.92178738506979, 10.0, 435)
-    femmesh.addNode(89.60488290119969, -38.434554248258074, 10.0, 436)
-    femmesh.addNode(91.43583891926512, -33.84874238624238, 10.0, 437)
-    femmesh.addNode(93.03227606193538, -29.17611370172263, 10.0, 438)
-    femmesh.addNode(94.39009971327249, -24.428652769206863, 10.0, 439)
-    femmesh.addNode(95.50582726427477, -19.618536096419355, 10.0, 440)
-    femmesh.addNode(96.37659704523374, -14.758100893429544, 10.0, 441)
-    femmesh.addNode(97.00017566547702, -9.859813429604113, 10.0, 442)
-    femmesh.addNode(97.37496374167235, -4.936237059541828, 10.0, 443)
-    femmesh.addNode(5.0, -92.37828942097016, 10.0, 444)
-    femmesh.addNode(5.0, -87.384868371188, 10.0, 445)
-    femmesh.addNode(5.0, -82.39144732140585, 10.0, 446)
-    femmesh.addNode(5.0, -77.39802627162368, 10.0, 447)
-    femmesh.addNode(5.0, -72.4046052218415, 10.0, 448)
-    femmesh.addNode(5.0, -67.41118417205935, 10.0, 449)
-    femmesh.addNode(5.0, -62.417763122277194, 10.0, 450)
-    femmesh.addNode(5.0, -57.42434207249503, 10.0, 451)
-    femmesh.addNode(5.0, -52.43092102271287, 10.0, 452)
-    femmesh.addNode(5.0, -47.43749997293071, 10.0, 453)
-    femmesh.addNode(5.0, -42.444078923148545, 10.0, 454)
-    femmesh.addNode(5.0, -37.45065787336638, 10.0, 455)
-    femmesh.addNode(5.0, -32.457236823584225, 10.0, 456)
-    femmesh.addNode(5.0, -27.463815773802054, 10.0, 457)
-    femmesh.addNode(5.0, -22.470394724019897, 10.0, 458)
-    femmesh.addNode(5.0, -17.476973674237726, 10.0, 459)
-    femmesh.addNode(5.0, -12.48355262445557, 10.0, 460)
-    femmesh.addNode(5.0, -7.490131574673413, 10.0, 461)
-    femmesh.addNode(5.0, -2.496710524891242, 10.0, 462)
-    femmesh.addNode(5.0, 2.496710524890915, 10.0, 463)
-    femmesh.addNode(5.0, 7.490131574673072, 10.0, 464)
-    femmesh.addNode(5.0, 12.483552624455228, 10.0, 465)
-    femmesh.addNode(5.0, 17.4769736742374, 10.0, 466)
-    femmesh.addNode(5.0, 22.47039472401957, 10.0, 467)
-    femmesh.addNode(5.0, 27.463815773801727, 10.0, 468)
-    femmesh.addNode(5.0, 32.457236823583884, 10.0, 469)
-    femmesh.addNode(5.0, 37.450657873366055, 10.0, 470)
-    femmesh.addNode(5.0, 42.4440789231482, 10.0, 471)
-    femmesh.addNode(5.0, 47.43749997293037, 10.0, 472)
-    femmesh.addNode(5.0, 52.43092102271254, 10.0, 473)
-    femmesh.addNode(5.0, 57.42434207249471, 10.0, 474)
-    femmesh.addNode(5.0, 62.41776312227685, 10.0, 475)
-    femmesh.addNode(5.0, 67.41118417205902, 10.0, 476)
-    femmesh.addNode(5.0, 72.40460522184117, 10.0, 477)
-    femmesh.addNode(5.0, 77.39802627162337, 10.0, 478)
-    femmesh.addNode(5.0, 82.39144732140551, 10.0, 479)
-    femmesh.addNode(5.0, 87.38486837118768, 10.0, 480)
-    femmesh.addNode(5.0, 92.37828942096985, 10.0, 481)
-    femmesh.addNode(6.178901352847948e-15, 3.0, 0.0, 482)
-    femmesh.addNode(-3.0, 1.1025535076145708e-14, 0.0, 483)
-    femmesh.addNode(-5.51091059616309e-16, -3.0, 0.0, 484)
-    femmesh.addNode(-5.0, -92.37828942097019, 0.0, 485)
-    femmesh.addNode(-5.0, -87.38486837118802, 0.0, 486)
-    femmesh.addNode(-5.0, -82.39144732140586, 0.0, 487)
-    femmesh.addNode(-5.0, -77.3980262716237, 0.0, 488)
-    femmesh.addNode(-5.0, -72.40460522184154, 0.0, 489)
-    femmesh.addNode(-5.0, -67.41118417205936, 0.0, 490)
-    femmesh.addNode(-5.0, -62.41776312227721, 0.0, 491)
-    femmesh.addNode(-5.0, -57.424342072495044, 0.0, 492)
-    femmesh.addNode(-5.0, -52.43092102271288, 0.0, 493)
-    femmesh.addNode(-5.0, -47.43749997293072, 0.0, 494)
-    femmesh.addNode(-5.0, -42.44407892314855, 0.0, 495)
-    femmesh.addNode(-5.0, -37.45065787336639, 0.0, 496)
-    femmesh.addNode(-5.0, -32.45723682358424, 0.0, 497)
-    femmesh.addNode(-5.0, -27.463815773802068, 0.0, 498)
-    femmesh.addNode(-5.0, -22.47039472401991, 0.0, 499)
-    femmesh.addNode(-5.0, -17.47697367423774, 0.0, 500)
-    femmesh.addNode(-5.0, -12.48355262445557, 0.0, 501)
-    femmesh.addNode(-5.0, -7.4901315746733985, 0.0, 502)
-    femmesh.addNode(-5.0, -2.496710524891256, 0.0, 503)
-    femmesh.addNode(-5.0, 2.4967105248909007, 0.0, 504)
-    femmesh.addNode(-5.0, 7.490131574673072, 0.0, 505)
-    femmesh.addNode(-5.0, 12.483552624455243, 0.0, 506)
-    femmesh.addNode(-5.0, 17.4769736742374, 0.0, 507)
-    femmesh.addNode(-5.0, 22.47039472401957, 0.0, 508)
-    femmesh.addNode(-5.0, 27.463815773801727, 0.0, 509)
-    femmesh.addNode(-5.0, 32.457236823583884, 0.0, 510)
-    femmesh.addNode(-5.0, 37.450657873366055, 0.0, 511)
-    femmesh.addNode(-5.0, 42.444078923148226, 0.0, 512)
-    femmesh.addNode(-5.0, 47.4374999729304, 0.0, 513)
-    femmesh.addNode(-5.0, 52.43092102271254, 0.0, 514)
-    femmesh.addNode(-5.0, 57.42434207249471, 0.0, 515)
-    femmesh.addNode(-5.0, 62.41776312227685, 0.0, 516)
-    femmesh.addNode(-5.0, 67.411184172059, 0.0, 517)
-    femmesh.addNode(-5.0, 72.40460522184117, 0.0, 518)
-    femmesh.addNode(-5.0, 77.39802627162334, 0.0, 519)
-    femmesh.addNode(-5.0, 82.39144732140551, 0.0, 520)
-    femmesh.addNode(-5.0, 87.38486837118768, 0.0, 521)
-    femmesh.addNode(-5.0, 92.37828942096982, 0.0, 522)
-    femmesh.addNode(-9.923329892153278, 96.99369837186072, 0.0, 523)
-    femmesh.addNode(-14.821207968105751, 96.36691234218392, 0.0, 524)
-    femmesh.addNode(-19.68107192327408, 95.49295999156645, 0.0, 525)
-    femmesh.addNode(-24.490456953454412, 94.37408287348279, 0.0, 526)
-    femmesh.addNode(-29.237027725128208, 93.01315073579696, 0.0, 527)
-    femmesh.addNode(-33.908610013696915, 91.41365416030044, 0.0, 528)
-    femmesh.addNode(-38.49322192849735, 89.57969560990621, 0.0, 529)
-    femmesh.addNode(-42.979104644509746, 87.51597890646188, 0.0, 530)
-    femmesh.addNode(-47.3547525619371, 85.2277971661694, 0.0, 531)
-    femmesh.addNode(-51.60894281630028, 82.72101922355556, 0.0, 532)
-    femmesh.addNode(-55.730764063360965, 80.00207457881324, 0.0, 533)
-    femmesh.addNode(-59.70964446504272, 77.07793690712143, 0.0, 534)
-    femmesh.addNode(-63.53537880457094, 73.9561061722403, 0.0, 535)
-    femmesh.addNode(-67.19815466128574, 70.64458939025637, 0.0, 536)
-    femmesh.addNode(-70.68857757799296, 67.151880092817, 0.0, 537)
-    femmesh.addNode(-73.99769515630308, 63.48693654252692, 0.0, 538)
-    femmesh.addNode(-77.1170200181575, 59.65915875638119, 0.0, 539)
-    femmesh.addNode(-80.03855157464888, 55.67836439616624, 0.0, 540)
-    femmesh.addNode(-82.75479654630207, 51.554763587666166, 0.0, 541)
-    femmesh.addNode(-85.2587881821847, 47.29893273325902, 0.0, 542)
-    femmesh.addNode(-87.5441041285524, 42.92178738507022, 0.0, 543)
-    femmesh.addNode(-89.6048829011995, 38.4345542482585, 0.0, 544)
-    femmesh.addNode(-91.43583891926498, 33.848742386242776, 0.0, 545)
-    femmesh.addNode(-93.03227606193524, 29.176113701723068, 0.0, 546)
-    femmesh.addNode(-94.39009971327236, 24.42865276920731, 0.0, 547)
-    femmesh.addNode(-95.50582726427469, 19.618536096419813, 0.0, 548)
-    femmesh.addNode(-96.37659704523365, 14.758100893430004, 0.0, 549)
-    femmesh.addNode(-97.00017566547697, 9.859813429604573, 0.0, 550)
-    femmesh.addNode(-97.37496374167233, 4.936237059542291, 0.0, 551)
-    femmesh.addNode(-97.5, 1.4183640017283e-13, 0.0, 552)
-    femmesh.addNode(-97.37496374167235, -4.936237059541965, 0.0, 553)
-    femmesh.addNode(-97.00017566547699, -9.859813429604293, 0.0, 554)
-    femmesh.addNode(-96.37659704523371, -14.75810089342968, 0.0, 555)
-    femmesh.addNode(-95.50582726427474, -19.618536096419533, 0.0, 556)
-    femmesh.addNode(-94.39009971327245, -24.428652769206998, 0.0, 557)
-    femmesh.addNode(-93.03227606193532, -29.176113701722763, 0.0, 558)
-    femmesh.addNode(-91.43583891926508, -33.848742386242506, 0.0, 559)
-    femmesh.addNode(-89.60488290119963, -38.434554248258195, 0.0, 560)
-    femmesh.addNode(-87.54410412855258, -42.92178738506988, 0.0, 561)
-    femmesh.addNode(-85.25878818218484, -47.29893273325877, 0.0, 562)
-    femmesh.addNode(-82.75479654630223, -51.55476358766592, 0.0, 563)
-    femmesh.addNode(-80.03855157464906, -55.67836439616598, 0.0, 564)
-    femmesh.addNode(-77.11702001815767, -59.65915875638096, 0.0, 565)
-    femmesh.addNode(-73.99769515630328, -63.48693654252667, 0.0, 566)
-    femmesh.addNode(-70.68857757799319, -67.15188009281677, 0.0, 567)
-    femmesh.addNode(-67.19815466128601, -70.64458939025612, 0.0, 568)
-    femmesh.addNode(-63.53537880457125, -73.95610617224003, 0.0, 569)
-    femmesh.addNode(-59.70964446504306, -77.07793690712118, 0.0, 570)
-    femmesh.addNode(-55.73076406336134, -80.00207457881297, 0.0, 571)
-    femmesh.addNode(-51.60894281630067, -82.72101922355532, 0.0, 572)
-    femmesh.addNode(-47.3547525619375, -85.22779716616918, 0.0, 573)
-    femmesh.addNode(-42.979104644510194, -87.51597890646165, 0.0, 574)
-    femmesh.addNode(-38.4932219284978, -89.57969560990601, 0.0, 575)
-    femmesh.addNode(-33.908610013697405, -91.41365416030025, 0.0, 576)
-    femmesh.addNode(-29.237027725128705, -93.01315073579678, 0.0, 577)
-    femmesh.addNode(-24.490456953454935, -94.37408287348265, 0.0, 578)
-    femmesh.addNode(-19.68107192327461, -95.49295999156635, 0.0, 579)
-    femmesh.addNode(-14.82120796810631, -96.36691234218384, 0.0, 580)
-    femmesh.addNode(-9.92332989215384, -96.99369837186066, 0.0, 581)
-    femmesh.addNode(9.923329892153891, -96.99369837186066, 0.0, 582)
-    femmesh.addNode(14.82120796810636, -96.36691234218382, 0.0, 583)
-    femmesh.addNode(19.68107192327466, -95.49295999156634, 0.0, 584)
-    femmesh.addNode(24.490456953454984, -94.37408287348264, 0.0, 585)
-    femmesh.addNode(29.237027725128755, -93.01315073579677, 0.0, 586)
-    femmesh.addNode(33.908610013697455, -91.41365416030024, 0.0, 587)
-    femmesh.addNode(38.49322192849785, -89.579695609906, 0.0, 588)
-    femmesh.addNode(42.97910464451024, -87.51597890646164, 0.0, 589)
-    femmesh.addNode(47.354752561937545, -85.22779716616914, 0.0, 590)
-    femmesh.addNode(51.60894281630071, -82.72101922355529, 0.0, 591)
-    femmesh.addNode(55.730764063361384, -80.00207457881294, 0.0, 592)
-    femmesh.addNode(59.70964446504309, -77.07793690712114, 0.0, 593)
-    femmesh.addNode(63.535378804571295, -73.95610617223998, 0.0, 594)
-    femmesh.addNode(67.19815466128607, -70.64458939025604, 0.0, 595)
-    femmesh.addNode(70.68857757799324, -67.1518800928167, 0.0, 596)
-    femmesh.addNode(73.99769515630335, -63.4869365425266, 0.0, 597)
-    femmesh.addNode(77.11702001815776, -59.659158756380855, 0.0, 598)
-    femmesh.addNode(80.0385515746491, -55.678364396165904, 0.0, 599)
-    femmesh.addNode(82.7547965463023, -51.5547635876658, 0.0, 600)
-    femmesh.addNode(85.2587881821849, -47.29893273325865, 0.0, 601)
-    femmesh.addNode(87.54410412855262, -42.92178738506979, 0.0, 602)
-    femmesh.addNode(89.60488290119969, -38.434554248258074, 0.0, 603)
-    femmesh.addNode(91.43583891926512, -33.84874238624238, 0.0, 604)
-    femmesh.addNode(93.03227606193538, -29.17611370172263, 0.0, 605)
-    femmesh.addNode(94.39009971327249, -24.428652769206863, 0.0, 606)
-    femmesh.addNode(95.50582726427477, -19.618536096419355, 0.0, 607)
-    femmesh.addNode(96.37659704523374, -14.758100893429544, 0.0, 608)
-    femmesh.addNode(97.00017566547702, -9.859813429604113, 0.0, 609)
-    femmesh.addNode(97.37496374167235, -4.936237059541828, 0.0, 610)
-    femmesh.addNode(5.0, -92.37828942097016, 0.0, 611)
-    femmesh.addNode(5.0, -87.384868371188, 0.0, 612)
-    femmesh.addNode(5.0, -82.39144732140585, 0.0, 613)
-    femmesh.addNode(5.0, -77.39802627162368, 0.0, 614)
-    femmesh.addNode(5.0, -72.4046052218415, 0.0, 615)
-    femmesh.addNode(5.0, -67.41118417205935, 0.0, 616)
-    femmesh.addNode(5.0, -62.417763122277194, 0.0, 617)
-    femmesh.addNode(5.0, -57.42434207249503, 0.0, 618)
-    femmesh.addNode(5.0, -52.43092102271287, 0.0, 619)
-    femmesh.addNode(5.0, -47.43749997293071, 0.0, 620)
-    femmesh.addNode(5.0, -42.444078923148545, 0.0, 621)
-    femmesh.addNode(5.0, -37.45065787336638, 0.0, 622)
-    femmesh.addNode(5.0, -32.457236823584225, 0.0, 623)
-    femmesh.addNode(5.0, -27.463815773802054, 0.0, 624)
-    femmesh.addNode(5.0, -22.470394724019897, 0.0, 625)
-    femmesh.addNode(5.0, -17.476973674237726, 0.0, 626)
-    femmesh.addNode(5.0, -12.48355262445557, 0.0, 627)
-    femmesh.addNode(5.0, -7.490131574673413, 0.0, 628)
-    femmesh.addNode(5.0, -2.496710524891242, 0.0, 629)
-    femmesh.addNode(5.0, 2.496710524890915, 0.0, 630)
-    femmesh.addNode(5.0, 7.490131574673072, 0.0, 631)
-    femmesh.addNode(5.0, 12.483552624455228, 0.0, 632)
-    femmesh.addNode(5.0, 17.4769736742374, 0.0, 633)
-    femmesh.addNode(5.0, 22.47039472401957, 0.0, 634)
-    femmesh.addNode(5.0, 27.463815773801727, 0.0, 635)
-    femmesh.addNode(5.0, 32.457236823583884, 0.0, 636)
-    femmesh.addNode(5.0, 37.450657873366055, 0.0, 637)
-    femmesh.addNode(5.0, 42.4440789231482, 0.0, 638)
-    femmesh.addNode(5.0, 47.43749997293037, 0.0, 639)
-    femmesh.addNode(5.0, 52.43092102271254, 0.0, 640)
-    femmesh.addNode(5.0, 57.42434207249471, 0.0, 641)
-    femmesh.addNode(5.0, 62.41776312227685, 0.0, 642)
-    femmesh.addNode(5.0, 67.41118417205902, 0.0, 643)
-    femmesh.addNode(5.0, 72.40460522184117, 0.0, 644)
-    femmesh.addNode(5.0, 77.39802627162337, 0.0, 645)
-    femmesh.addNode(5.0, 82.39144732140551, 0.0, 646)
-    femmesh.addNode(5.0, 87.38486837118768, 0.0, 647)
-    femmesh.addNode(5.0, 92.37828942096985, 0.0, 648)
-    femmesh.addNode(97.37496374167235, 4.936237059542162, 0.0, 649)
-    femmesh.addNode(97.00017566547697, 9.859813429604458, 0.0, 650)
-    femmesh.addNode(96.37659704523368, 14.758100893429901, 0.0, 651)
-    femmesh.addNode(95.5058272642747, 19.618536096419724, 0.0, 652)
-    femmesh.addNode(94.39009971327239, 24.42865276920723, 0.0, 653)
-    femmesh.addNode(93.03227606193525, 29.17611370172301, 0.0, 654)
-    femmesh.addNode(91.43583891926498, 33.84874238624277, 0.0, 655)
-    femmesh.addNode(89.60488290119952, 38.434554248258465, 0.0, 656)
-    femmesh.addNode(87.54410412855243, 42.92178738507017, 0.0, 657)
-    femmesh.addNode(85.25878818218472, 47.298932733259015, 0.0, 658)
-    femmesh.addNode(82.75479654630207, 51.554763587666166, 0.0, 659)
-    femmesh.addNode(80.03855157464888, 55.67836439616624, 0.0, 660)
-    femmesh.addNode(77.11702001815753, 59.65915875638117, 0.0, 661)
-    femmesh.addNode(73.9976951563031, 63.4869365425269, 0.0, 662)
-    femmesh.addNode(70.68857757799296, 67.15188009281698, 0.0, 663)
-    femmesh.addNode(67.19815466128578, 70.64458939025631, 0.0, 664)
-    femmesh.addNode(63.535378804570996, 73.95610617224025, 0.0, 665)
-    femmesh.addNode(59.7096444650428, 77.07793690712137, 0.0, 666)
-    femmesh.addNode(55.73076406336107, 80.00207457881315, 0.0, 667)
-    femmesh.addNode(51.6089428163004, 82.72101922355547, 0.0, 668)
-    femmesh.addNode(47.354752561937225, 85.22779716616932, 0.0, 669)
-    femmesh.addNode(42.97910464450991, 87.5159789064618, 0.0, 670)
-    femmesh.addNode(38.49322192849753, 89.57969560990614, 0.0, 671)
-    femmesh.addNode(33.90861001369713, 91.41365416030035, 0.0, 672)
-    femmesh.addNode(29.237027725128424, 93.01315073579687, 0.0, 673)
-    femmesh.addNode(24.490456953454654, 94.37408287348272, 0.0, 674)
-    femmesh.addNode(19.681071923274324, 95.49295999156641, 0.0, 675)
-    femmesh.addNode(14.82120796810602, 96.36691234218388, 0.0, 676)
-    femmesh.addNode(9.923329892153571, 96.9936983718607, 0.0, 677)
-    femmesh.addNode(3.0, -7.3e-16, 5.0, 678)
-    femmesh.addNode(-5.0, -97.37171047075223, 5.0, 679)
-    femmesh.addNode(-5.0, 97.37171047075223, 5.0, 680)
-    femmesh.addNode(5.0, -97.37171047075223, 5.0, 681)
-    femmesh.addNode(5.0, 97.37171047075223, 5.0, 682)
-    femmesh.addNode(102.37844066218436, 4.990479694337564, 30.0, 683)
-    femmesh.addNode(102.01405097405667, 9.969122522196567, 30.0, 684)
-    femmesh.addNode(101.4076952276988, 14.92411969283799, 30.0, 685)
-    femmesh.addNode(100.56081163194992, 19.84371850040931, 30.0, 686)
-    femmesh.addNode(99.47540890113405, 24.71625020006434, 30.0, 687)
-    femmesh.addNode(98.15406149061162, 29.53015768493683, 30.0, 688)
-    femmesh.addNode(96.59990349045574, 34.27402289832108, 30.0, 689)
-    femmesh.addNode(94.81662119173684, 38.93659391604098, 30.0, 690)
-    femmesh.addNode(92.80844434304754, 43.50681163477103, 30.0, 691)
-    femmesh.addNode(90.58013611800622, 47.973836003007555, 30.0, 692)
-    femmesh.addNode(88.13698181753554, 52.32707173247332, 30.0, 693)
-    femmesh.addNode(85.4847763337125, 56.556193428970694, 30.0, 694)
-    femmesh.addNode(82.6298104049247, 60.65117008307587, 30.0, 695)
-    femmesh.addNode(79.57885569493389, 64.60228886258511, 30.0, 696)
-    femmesh.addNode(76.33914873123767, 68.40017815027952, 30.0, 697)
-    femmesh.addNode(72.91837374082576, 72.03582977236573, 30.0, 698)
-    femmesh.addNode(69.32464442404257, 75.50062036486894, 30.0, 699)
-    femmesh.addNode(65.56648470978638, 78.78633182729952, 30.0, 700)
-    femmesh.addNode(61.65280853769175, 81.88517081507935, 30.0, 701)
-    femmesh.addNode(57.592898715249476, 84.78978722449429, 30.0, 702)
-    femmesh.addNode(53.396384900012876, 87.493291626328, 30.0, 703)
-    femmesh.addNode(49.07322075911397, 89.98927160682692, 30.0, 704)
-    femmesh.addNode(44.63366036026462, 92.27180697723733, 30.0, 705)
-    femmesh.addNode(40.08823385024101, 94.33548381583883, 30.0, 706)
-    femmesh.addNode(35.44772247853867, 96.17540730916872, 30.0, 707)
-    femmesh.addNode(30.723133025439985, 97.78721336197856, 30.0, 708)
-    femmesh.addNode(25.92567169514729, 99.16707894838608, 30.0, 709)
-    femmesh.addNode(21.066717535904573, 100.31173117967016, 30.0, 710)
-    femmesh.addNode(16.157795450152296, 101.21845506720125, 30.0, 711)
-    femmesh.addNode(11.210548858732139, 101.88509996209446, 30.0, 712)
-    femmesh.addNode(6.236712083978917, 102.31008465631115, 30.0, 713)
-    femmesh.addNode(1.2480825172047367, 102.49240113310961, 30.0, 714)
-    femmesh.addNode(-3.743507363410042, 102.43161695794954, 30.0, 715)
-    femmesh.addNode(-8.72621805814769, 102.12787630417886, 30.0, 716)
-    femmesh.addNode(-13.688231127738325, 101.58189961107055, 30.0, 717)
-    femmesh.addNode(-18.617777225392295, 100.79498187502026, 30.0, 718)
-    femmesh.addNode(-23.503164012390265, 99.76898957795795, 30.0, 719)
-    femmesh.addNode(-28.33280389101911, 98.50635626025893, 30.0, 720)
-    femmesh.addNode(-33.095241489073274, 97.01007674865494, 30.0, 721)
-    femmesh.addNode(-37.779180830732116, 95.28370005283612, 30.0, 722)
-    femmesh.addNode(-42.373512129366546, 93.331320947592, 30.0, 723)
-    femmesh.addNode(-46.867338138725486, 91.15757026045817, 30.0, 724)
-    femmesh.addNode(-51.25000000000002, 88.76760388790494, 30.0, 725)
-    femmesh.addNode(-55.511102523458916, 86.16709056612062, 30.0, 726)
-    femmesh.addNode(-59.64053884469015, 83.36219842539546, 30.0, 727)
-    femmesh.addNode(-63.62851439696672, 80.35958035999815, 30.0, 728)
-    femmesh.addNode(-67.46557014287666, 77.16635824824566, 30.0, 729)
-    femmesh.addNode(-71.14260501011495, 73.7901060601946, 30.0, 730)
-    femmesh.addNode(-74.65089747822138, 70.23883189302113, 30.0, 731)
-    femmesh.addNode(-77.98212626506347, 66.5209589766992, 30.0, 732)
-    femmesh.addNode(-81.12839006399851, 62.64530569502959, 30.0, 733)
-    femmesh.addNode(-84.08222628489983, 58.621064669407886, 30.0, 734)
-    femmesh.addNode(-86.83662875459612, 54.457780954942045, 30.0, 735)
-    femmesh.addNode(-89.38506433474022, 50.165329400636374, 30.0, 736)
-    femmesh.addNode(-91.72148841769136, 45.753891227340524, 30.0, 737)
-    femmesh.addNode(-93.84035926365677, 41.233929879018675, 30.0, 738)
-    femmesh.addNode(-95.73665114508611, 36.61616620461624, 30.0, 739)
-    femmesh.addNode(-97.40586626714214, 31.91155302939078, 30.0, 740)
-    femmesh.addNode(-98.84404543597297, 27.131249176020468, 30.0, 741)
-    femmesh.addNode(-100.0477774494825, 22.286592997109796, 30.0, 742)
-    femmesh.addNode(-101.01420718832499, 17.38907548186937, 30.0, 743)
-    femmesh.addNode(-101.74104238793268, 12.450313000759673, 30.0, 744)
-    femmesh.addNode(-102.22655907551403, 7.482019752743251, 30.0, 745)
-    femmesh.addNode(-102.46960565912678, 2.495979980499136, 30.0, 746)
-    femmesh.addNode(-102.4696056591268, -2.495979980498747, 30.0, 747)
-    femmesh.addNode(-102.22655907551406, -7.482019752742862, 30.0, 748)
-    femmesh.addNode(-101.74104238793272, -12.450313000759287, 30.0, 749)
-    femmesh.addNode(-101.01420718832505, -17.38907548186903, 30.0, 750)
-    femmesh.addNode(-100.04777744948255, -22.28659299710946, 30.0, 751)
-    femmesh.addNode(-98.84404543597303, -27.13124917602023, 30.0, 752)
-    femmesh.addNode(-97.40586626714223, -31.911553029390497, 30.0, 753)
-    femmesh.addNode(-95.73665114508621, -36.616166204616015, 30.0, 754)
-    femmesh.addNode(-93.84035926365688, -41.233929879018405, 30.0, 755)
-    femmesh.addNode(-91.72148841769148, -45.7538912273403, 30.0, 756)
-    femmesh.addNode(-89.38506433474035, -50.16532940063615, 30.0, 757)
-    femmesh.addNode(-86.83662875459626, -54.45778095494183, 30.0, 758)
-    femmesh.addNode(-84.08222628489995, -58.621064669407716, 30.0, 759)
-    femmesh.addNode(-81.12839006399861, -62.64530569502947, 30.0, 760)
-    femmesh.addNode(-77.98212626506354, -66.5209589766991, 30.0, 761)
-    femmesh.addNode(-74.65089747822142, -70.23883189302109, 30.0, 762)
-    femmesh.addNode(-71.14260501011502, -73.79010606019452, 30.0, 763)
-    femmesh.addNode(-67.46557014287671, -77.1663582482456, 30.0, 764)
-    femmesh.addNode(-63.62851439696674, -80.35958035999812, 30.0, 765)
-    femmesh.addNode(-59.64053884469017, -83.36219842539545, 30.0, 766)
-    femmesh.addNode(-55.511102523458895, -86.16709056612063, 30.0, 767)
-    femmesh.addNode(-51.24999999999996, -88.76760388790498, 30.0, 768)
-    femmesh.addNode(-46.86733813872539, -91.15757026045821, 30.0, 769)
-    femmesh.addNode(-42.37351212936651, -93.33132094759203, 30.0, 770)
-    femmesh.addNode(-37.77918083073205, -95.28370005283615, 30.0, 771)
-    femmesh.addNode(-33.09524148907328, -97.01007674865494, 30.0, 772)
-    femmesh.addNode(-28.332803891019093, -98.50635626025893, 30.0, 773)
-    femmesh.addNode(-23.503164012390222, -99.76898957795797, 30.0, 774)
-    femmesh.addNode(-18.617777225392206, -100.79498187502028, 30.0, 775)
-    femmesh.addNode(-13.688231127738236, -101.58189961107057, 30.0, 776)
-    femmesh.addNode(-8.726218058147579, -102.12787630417887, 30.0, 777)
-    femmesh.addNode(-3.7435073634099303, -102.43161695794954, 30.0, 778)
-    femmesh.addNode(1.2480825172047798, -102.49240113310961, 30.0, 779)
-    femmesh.addNode(6.236712083978983, -102.31008465631113, 30.0, 780)
-    femmesh.addNode(11.210548858732205, -101.88509996209444, 30.0, 781)
-    femmesh.addNode(16.157795450152406, -101.21845506720123, 30.0, 782)
-    femmesh.addNode(21.066717535904683, -100.31173117967013, 30.0, 783)
-    femmesh.addNode(25.92567169514742, -99.16707894838605, 30.0, 784)
-    femmesh.addNode(30.723133025440156, -97.7872133619785, 30.0, 785)
-    femmesh.addNode(35.44772247853886, -96.17540730916865, 30.0, 786)
-    femmesh.addNode(40.08823385024112, -94.3354838158388, 30.0, 787)
-    femmesh.addNode(44.63366036026474, -92.27180697723726, 30.0, 788)
-    femmesh.addNode(49.07322075911409, -89.98927160682685, 30.0, 789)
-    femmesh.addNode(53.39638490001303, -87.4932916263279, 30.0, 790)
-    femmesh.addNode(57.59289871524963, -84.78978722449419, 30.0, 791)
-    femmesh.addNode(61.65280853769184, -81.88517081507929, 30.0, 792)
-    femmesh.addNode(65.5664847097865, -78.78633182729942, 30.0, 793)
-    femmesh.addNode(69.3246444240427, -75.50062036486882, 30.0, 794)
-    femmesh.addNode(72.9183737408259, -72.03582977236559, 30.0, 795)
-    femmesh.addNode(76.33914873123781, -68.40017815027934, 30.0, 796)
-    femmesh.addNode(79.57885569493405, -64.60228886258491, 30.0, 797)
-    femmesh.addNode(82.62981040492487, -60.651170083075655, 30.0, 798)
-    femmesh.addNode(85.48477633371262, -56.55619342897051, 30.0, 799)
-    femmesh.addNode(88.13698181753566, -52.32707173247313, 30.0, 800)
-    femmesh.addNode(90.58013611800635, -47.97383600300733, 30.0, 801)
-    femmesh.addNode(92.80844434304763, -43.50681163477085, 30.0, 802)
-    femmesh.addNode(94.81662119173693, -38.93659391604078, 30.0, 803)
-    femmesh.addNode(96.59990349045582, -34.27402289832085, 30.0, 804)
-    femmesh.addNode(98.1540614906117, -29.530157684936572, 30.0, 805)
-    femmesh.addNode(99.47540890113412, -24.716250200064056, 30.0, 806)
-    femmesh.addNode(100.56081163194997, -19.843718500408993, 30.0, 807)
-    femmesh.addNode(101.40769522769884, -14.924119692837735, 30.0, 808)
-    femmesh.addNode(102.0140509740567, -9.969122522196285, 30.0, 809)
-    femmesh.addNode(102.37844066218437, -4.9904796943372505, 30.0, 810)
-    femmesh.addNode(102.5, -2.511e-14, 25.0, 811)
-    femmesh.addNode(102.37844066218436, 4.990479694337564, 20.0, 812)
-    femmesh.addNode(102.01405097405667, 9.969122522196567, 20.0, 813)
-    femmesh.addNode(101.4076952276988, 14.92411969283799, 20.0, 814)
-    femmesh.addNode(100.56081163194992, 19.84371850040931, 20.0, 815)
-    femmesh.addNode(99.47540890113405, 24.71625020006434, 20.0, 816)
-    femmesh.addNode(98.15406149061162, 29.53015768493683, 20.0, 817)
-    femmesh.addNode(96.59990349045574, 34.27402289832108, 20.0, 818)
-    femmesh.addNode(94.81662119173684, 38.93659391604098, 20.0, 819)
-    femmesh.addNode(92.80844434304754, 43.50681163477103, 20.0, 820)
-    femmesh.addNode(90.58013611800622, 47.973836003007555, 20.0, 821)
-    femmesh.addNode(88.13698181753554, 52.32707173247332, 20.0, 822)
-    femmesh.addNode(85.4847763337125, 56.556193428970694, 20.0, 823)
-    femmesh.addNode(82.6298104049247, 60.65117008307587, 20.0, 824)
-    femmesh.addNode(79.57885569493389, 64.60228886258511, 20.0, 825)
-    femmesh.addNode(76.33914873123767, 68.40017815027952, 20.0, 826)
-    femmesh.addNode(72.91837374082576, 72.03582977236573, 20.0, 827)
-    femmesh.addNode(69.32464442404257, 75.50062036486894, 20.0, 828)
-    femmesh.addNode(65.56648470978638, 78.78633182729952, 20.0, 829)
-    femmesh.addNode(61.65280853769175, 81.88517081507935, 20.0, 830)
-    femmesh.addNode(57.592898715249476, 84.78978722449429, 20.0, 831)
-    femmesh.addNode(53.396384900012876, 87.493291626328, 20.0, 832)
-    femmesh.addNode(49.07322075911397, 89.98927160682692, 20.0, 833)
-    femmesh.addNode(44.63366036026462, 92.27180697723733, 20.0, 834)
-    femmesh.addNode(40.08823385024101, 94.33548381583883, 20.0, 835)
-    femmesh.addNode(35.44772247853867, 96.17540730916872, 20.0, 836)
-    femmesh.addNode(30.723133025439985, 97.78721336197856, 20.0, 837)
-    femmesh.addNode(25.92567169514729, 99.16707894838608, 20.0, 838)
-    femmesh.addNode(21.066717535904573, 100.31173117967016, 20.0, 839)
-    femmesh.addNode(16.157795450152296, 101.21845506720125, 20.0, 840)
-    femmesh.addNode(11.210548858732139, 101.88509996209446, 20.0, 841)
-    femmesh.addNode(6.236712083978917, 102.31008465631115, 20.0, 842)
-    femmesh.addNode(1.2480825172047367, 102.49240113310961, 20.0, 843)
-    femmesh.addNode(-3.743507363410042, 102.43161695794954, 20.0, 844)
-    femmesh.addNode(-8.72621805814769, 102.12787630417886, 20.0, 845)
-    femmesh.addNode(-13.688231127738325, 101.58189961107055, 20.0, 846)
-    femmesh.addNode(-18.617777225392295, 100.79498187502026, 20.0, 847)
-    femmesh.addNode(-23.503164012390265, 99.76898957795795, 20.0, 848)
-    femmesh.addNode(-28.33280389101911, 98.50635626025893, 20.0, 849)
-    femmesh.addNode(-33.095241489073274, 97.01007674865494, 20.0, 850)
-    femmesh.addNode(-37.779180830732116, 95.28370005283612, 20.0, 851)
-    femmesh.addNode(-42.373512129366546, 93.331320947592, 20.0, 852)
-    femmesh.addNode(-46.867338138725486, 91.15757026045817, 20.0, 853)
-    femmesh.addNode(-51.25000000000002, 88.76760388790494, 20.0, 854)
-    femmesh.addNode(-55.511102523458916, 86.16709056612062, 20.0, 855)
-    femmesh.addNode(-59.64053884469015, 83.36219842539546, 20.0, 856)
-    femmesh.addNode(-63.62851439696672, 80.35958035999815, 20.0, 857)
-    femmesh.addNode(-67.46557014287666, 77.16635824824566, 20.0, 858)
-    femmesh.addNode(-71.14260501011495, 73.7901060601946, 20.0, 859)
-    femmesh.addNode(-74.65089747822138, 70.23883189302113, 20.0, 860)
-    femmesh.addNode(-77.98212626506347, 66.5209589766992, 20.0, 861)
-    femmesh.addNode(-81.12839006399851, 62.64530569502959, 20.0, 862)
-    femmesh.addNode(-84.08222628489983, 58.621064669407886, 20.0, 863)
-    femmesh.addNode(-86.83662875459612, 54.457780954942045, 20.0, 864)
-    femmesh.addNode(-89.38506433474022, 50.165329400636374, 20.0, 865)
-    femmesh.addNode(-91.72148841769136, 45.753891227340524, 20.0, 866)
-    femmesh.addNode(-93.84035926365677, 41.233929879018675, 20.0, 867)
-    femmesh.addNode(-95.73665114508611, 36.61616620461624, 20.0, 868)
-    femmesh.addNode(-97.40586626714214, 31.91155302939078, 20.0, 869)
-    femmesh.addNode(-98.84404543597297, 27.131249176020468, 20.0, 870)
-    femmesh.addNode(-100.0477774494825, 22.286592997109796, 20.0, 871)
-    femmesh.addNode(-101.01420718832499, 17.38907548186937, 20.0, 872)
-    femmesh.addNode(-101.74104238793268, 12.450313000759673, 20.0, 873)
-    femmesh.addNode(-102.22655907551403, 7.482019752743251, 20.0, 874)
-    femmesh.addNode(-102.46960565912678, 2.495979980499136, 20.0, 875)
-    femmesh.addNode(-102.4696056591268, -2.495979980498747, 20.0, 876)
-    femmesh.addNode(-102.22655907551406, -7.482019752742862, 20.0, 877)
-    femmesh.addNode(-101.74104238793272, -12.450313000759287, 20.0, 878)
-    femmesh.addNode(-101.01420718832505, -17.38907548186903, 20.0, 879)
-    femmesh.addNode(-100.04777744948255, -22.28659299710946, 20.0, 880)
-    femmesh.addNode(-98.84404543597303, -27.13124917602023, 20.0, 881)
-    femmesh.addNode(-97.40586626714223, -31.911553029390497, 20.0, 882)
-    femmesh.addNode(-95.73665114508621, -36.616166204616015, 20.0, 883)
-    femmesh.addNode(-93.84035926365688, -41.233929879018405, 20.0, 884)
-    femmesh.addNode(-91.72148841769148, -45.7538912273403, 20.0, 885)
-    femmesh.addNode(-89.38506433474035, -50.16532940063615, 20.0, 886)
-    femmesh.addNode(-86.83662875459626, -54.45778095494183, 20.0, 887)
-    femmesh.addNode(-84.08222628489995, -58.621064669407716, 20.0, 888)
-    femmesh.addNode(-81.12839006399861, -62.64530569502947, 20.0, 889)
-    femmesh.addNode(-77.98212626506354, -66.5209589766991, 20.0, 890)
-    femmesh.addNode(-74.65089747822142, -70.23883189302109, 20.0, 891)
-    femmesh.addNode(-71.14260501011502, -73.79010606019452, 20.0, 892)
-    femmesh.addNode(-67.46557014287671, -77.1663582482456, 20.0, 893)
-    femmesh.addNode(-63.62851439696674, -80.35958035999812, 20.0, 894)
-    femmesh.addNode(-59.64053884469017, -83.36219842539545, 20.0, 895)
-    femmesh.addNode(-55.511102523458895, -86.16709056612063, 20.0, 896)
-    femmesh.addNode(-51.24999999999996, -88.76760388790498, 20.0, 897)
-    femmesh.addNode(-46.86733813872539, -91.15757026045821, 20.0, 898)
-    femmesh.addNode(-42.37351212936651, -93.33132094759203, 20.0, 899)
-    femmesh.addNode(-37.77918083073205, -95.28370005283615, 20.0, 900)
-    femmesh.addNode(-33.09524148907328, -97.01007674865494, 20.0, 901)
-    femmesh.addNode(-28.332803891019093, -98.50635626025893, 20.0, 902)
-    femmesh.addNode(-23.503164012390222, -99.76898957795797, 20.0, 903)
-    femmesh.addNode(-18.617777225392206, -100.79498187502028, 20.0, 904)
-    femmesh.addNode(-13.688231127738236, -101.58189961107057, 20.0, 905)
-    femmesh.addNode(-8.726218058147579, -102.12787630417887, 20.0, 906)
-    femmesh.addNode(-3.7435073634099303, -102.43161695794954, 20.0, 907)
-    femmesh.addNode(1.2480825172047798, -102.49240113310961, 20.0, 908)
-    femmesh.addNode(6.236712083978983, -102.31008465631113, 20.0, 909)
-    femmesh.addNode(11.210548858732205, -101.88509996209444, 20.0, 910)
-    femmesh.addNode(16.157795450152406, -101.21845506720123, 20.0, 911)
-    femmesh.addNode(21.066717535904683, -100.31173117967013, 20.0, 912)
-    femmesh.addNode(25.92567169514742, -99.16707894838605, 20.0, 913)
-    femmesh.addNode(30.723133025440156, -97.7872133619785, 20.0, 914)
-    femmesh.addNode(35.44772247853886, -96.17540730916865, 20.0, 915)
-    femmesh.addNode(40.08823385024112, -94.3354838158388, 20.0, 916)
-    femmesh.addNode(44.63366036026474, -92.27180697723726, 20.0, 917)
-    femmesh.addNode(49.07322075911409, -89.98927160682685, 20.0, 918)
-    femmesh.addNode(53.39638490001303, -87.4932916263279, 20.0, 919)
-    femmesh.addNode(57.59289871524963, -84.78978722449419, 20.0, 920)
-    femmesh.addNode(61.65280853769184, -81.88517081507929, 20.0, 921)
-    femmesh.addNode(65.5664847097865, -78.78633182729942, 20.0, 922)
-    femmesh.addNode(69.3246444240427, -75.50062036486882, 20.0, 923)
-    femmesh.addNode(72.9183737408259, -72.03582977236559, 20.0, 924)
-    femmesh.addNode(76.33914873123781, -68.40017815027934, 20.0, 925)
-    femmesh.addNode(79.57885569493405, -64.60228886258491, 20.0, 926)
-    femmesh.addNode(82.62981040492487, -60.651170083075655, 20.0, 927)
-    femmesh.addNode(85.48477633371262, -56.55619342897051, 20.0, 928)
-    femmesh.addNode(88.13698181753566, -52.32707173247313, 20.0, 929)
-    femmesh.addNode(90.58013611800635, -47.97383600300733, 20.0, 930)
-    femmesh.addNode(92.80844434304763, -43.50681163477085, 20.0, 931)
-    femmesh.addNode(94.81662119173693, -38.93659391604078, 20.0, 932)
-    femmesh.addNode(96.59990349045582, -34.27402289832085, 20.0, 933)
-    femmesh.addNode(98.1540614906117, -29.530157684936572, 20.0, 934)
-    femmesh.addNode(99.47540890113412, -24.716250200064056, 20.0, 935)
-    femmesh.addNode(100.56081163194997, -19.843718500408993, 20.0, 936)
-    femmesh.addNode(101.40769522769884, -14.924119692837735, 20.0, 937)
-    femmesh.addNode(102.0140509740567, -9.969122522196285, 20.0, 938)
-    femmesh.addNode(102.37844066218437, -4.9904796943372505, 20.0, 939)
-    femmesh.addNode(6.178901352847948e-15, -3.0, 30.0, 940)
-    femmesh.addNode(-3.0, -1.1025535076145708e-14, 30.0, 941)
-    femmesh.addNode(-5.51091059616309e-16, 3.0, 30.0, 942)
-    femmesh.addNode(-9.923329892153278, 96.99369837186072, 30.0, 943)
-    femmesh.addNode(-14.821207968105751, 96.36691234218392, 30.0, 944)
-    femmesh.addNode(-19.68107192327408, 95.49295999156645, 30.0, 945)
-    femmesh.addNode(-24.490456953454412, 94.37408287348279, 30.0, 946)
-    femmesh.addNode(-29.237027725128208, 93.01315073579696, 30.0, 947)
-    femmesh.addNode(-33.908610013696915, 91.41365416030044, 30.0, 948)
-    femmesh.addNode(-38.49322192849735, 89.57969560990621, 30.0, 949)
-    femmesh.addNode(-42.979104644509746, 87.51597890646188, 30.0, 950)
-    femmesh.addNode(-47.3547525619371, 85.2277971661694, 30.0, 951)
-    femmesh.addNode(-51.60894281630028, 82.72101922355556, 30.0, 952)
-    femmesh.addNode(-55.730764063360965, 80.00207457881324, 30.0, 953)
-    femmesh.addNode(-59.70964446504272, 77.07793690712143, 30.0, 954)
-    femmesh.addNode(-63.53537880457094, 73.9561061722403, 30.0, 955)
-    femmesh.addNode(-67.19815466128574, 70.64458939025637, 30.0, 956)
-    femmesh.addNode(-70.68857757799296, 67.151880092817, 30.0, 957)
-    femmesh.addNode(-73.99769515630308, 63.48693654252692, 30.0, 958)
-    femmesh.addNode(-77.1170200181575, 59.65915875638119, 30.0, 959)
-    femmesh.addNode(-80.03855157464888, 55.67836439616624, 30.0, 960)
-    femmesh.addNode(-82.75479654630207, 51.554763587666166, 30.0, 961)
-    femmesh.addNode(-85.2587881821847, 47.29893273325902, 30.0, 962)
-    femmesh.addNode(-87.5441041285524, 42.92178738507022, 30.0, 963)
-    femmesh.addNode(-89.6048829011995, 38.4345542482585, 30.0, 964)
-    femmesh.addNode(-91.43583891926498, 33.848742386242776, 30.0, 965)
-    femmesh.addNode(-93.03227606193524, 29.176113701723068, 30.0, 966)
-    femmesh.addNode(-94.39009971327236, 24.42865276920731, 30.0, 967)
-    femmesh.addNode(-95.50582726427469, 19.618536096419813, 30.0, 968)
-    femmesh.addNode(-96.37659704523365, 14.758100893430004, 30.0, 969)
-    femmesh.addNode(-97.00017566547697, 9.859813429604573, 30.0, 970)
-    femmesh.addNode(-97.37496374167233, 4.936237059542291, 30.0, 971)
-    femmesh.addNode(-97.5, 1.4183640017283e-13, 30.0, 972)
-    femmesh.addNode(-97.37496374167235, -4.936237059541965, 30.0, 973)
-    femmesh.addNode(-97.00017566547699, -9.859813429604293, 30.0, 974)
-    femmesh.addNode(-96.37659704523371, -14.75810089342968, 30.0, 975)
-    femmesh.addNode(-95.50582726427474, -19.618536096419533, 30.0, 976)
-    femmesh.addNode(-94.39009971327245, -24.428652769206998, 30.0, 977)
-    femmesh.addNode(-93.03227606193532, -29.176113701722763, 30.0, 978)
-    femmesh.addNode(-91.43583891926508, -33.848742386242506, 30.0, 979)
-    femmesh.addNode(-89.60488290119963, -38.434554248258195, 30.0, 980)
-    femmesh.addNode(-87.54410412855258, -42.92178738506988, 30.0, 981)
-    femmesh.addNode(-85.25878818218484, -47.29893273325877, 30.0, 982)
-    femmesh.addNode(-82.75479654630223, -51.55476358766592, 30.0, 983)
-    femmesh.addNode(-80.03855157464906, -55.67836439616598, 30.0, 984)
-    femmesh.addNode(-77.11702001815767, -59.65915875638096, 30.0, 985)
-    femmesh.addNode(-73.99769515630328, -63.48693654252667, 30.0, 986)
-    femmesh.addNode(-70.68857757799319, -67.15188009281677, 30.0, 987)
-    femmesh.addNode(-67.19815466128601, -70.64458939025612, 30.0, 988)
-    femmesh.addNode(-63.53537880457125, -73.95610617224003, 30.0, 989)
-    femmesh.addNode(-59.70964446504306, -77.07793690712118, 30.0, 990)
-    femmesh.addNode(-55.73076406336134, -80.00207457881297, 30.0, 991)
-    femmesh.addNode(-51.60894281630067, -82.72101922355532, 30.0, 992)
-    femmesh.addNode(-47.3547525619375, -85.22779716616918, 30.0, 993)
-    femmesh.addNode(-42.979104644510194, -87.51597890646165, 30.0, 994)
-    femmesh.addNode(-38.4932219284978, -89.57969560990601, 30.0, 995)
-    femmesh.addNode(-33.908610013697405, -91.41365416030025, 30.0, 996)
-    femmesh.addNode(-29.237027725128705, -93.01315073579678, 30.0, 997)
-    femmesh.addNode(-24.490456953454935, -94.37408287348265, 30.0, 998)
-    femmesh.addNode(-19.68107192327461, -95.49295999156635, 30.0, 999)
-    femmesh.addNode(-14.82120796810631, -96.36691234218384, 30.0, 1000)
-    femmesh.addNode(-9.92332989215384, -96.99369837186066, 30.0, 1001)
-    femmesh.addNode(-5.0, -92.37828942097019, 30.0, 1002)
-    femmesh.addNode(-5.0, -87.38486837118802, 30.0, 1003)
-    femmesh.addNode(-5.0, -82.39144732140586, 30.0, 1004)
-    femmesh.addNode(-5.0, -77.3980262716237, 30.0, 1005)
-    femmesh.addNode(-5.0, -72.40460522184154, 30.0, 1006)
-    femmesh.addNode(-5.0, -67.41118417205936, 30.0, 1007)
-    femmesh.addNode(-5.0, -62.41776312227721, 30.0, 1008)
-    femmesh.addNode(-5.0, -57.424342072495044, 30.0, 1009)
-    femmesh.addNode(-5.0, -52.43092102271288, 30.0, 1010)
-    femmesh.addNode(-5.0, -47.43749997293072, 30.0, 1011)
-    femmesh.addNode(-5.0, -42.44407892314855, 30.0, 1012)
-    femmesh.addNode(-5.0, -37.45065787336639, 30.0, 1013)
-    femmesh.addNode(-5.0, -32.45723682358424, 30.0, 1014)
-    femmesh.addNode(-5.0, -27.463815773802068, 30.0, 1015)
-    femmesh.addNode(-5.0, -22.47039472401991, 30.0, 1016)
-    femmesh.addNode(-5.0, -17.47697367423774, 30.0, 1017)
-    femmesh.addNode(-5.0, -12.48355262445557, 30.0, 1018)
-    femmesh.addNode(-5.0, -7.4901315746733985, 30.0, 1019)
-    femmesh.addNode(-5.0, -2.496710524891256, 30.0, 1020)
-    femmesh.addNode(-5.0, 2.4967105248909007, 30.0, 1021)
-    femmesh.addNode(-5.0, 7.490131574673072, 30.0, 1022)
-    femmesh.addNode(-5.0, 12.483552624455243, 30.0, 1023)
-    femmesh.addNode(-5.0, 17.4769736742374, 30.0, 1024)
-    femmesh.addNode(-5.0, 22.47039472401957, 30.0, 1025)
-    femmesh.addNode(-5.0, 27.463815773801727, 30.0, 1026)
-    femmesh.addNode(-5.0, 32.457236823583884, 30.0, 1027)
-    femmesh.addNode(-5.0, 37.450657873366055, 30.0, 1028)
-    femmesh.addNode(-5.0, 42.444078923148226, 30.0, 1029)
-    femmesh.addNode(-5.0, 47.4374999729304, 30.0, 1030)
-    femmesh.addNode(-5.0, 52.43092102271254, 30.0, 1031)
-    femmesh.addNode(-5.0, 57.42434207249471, 30.0, 1032)
-    femmesh.addNode(-5.0, 62.41776312227685, 30.0, 1033)
-    femmesh.addNode(-5.0, 67.411184172059, 30.0, 1034)
-    femmesh.addNode(-5.0, 72.40460522184117, 30.0, 1035)
-    femmesh.addNode(-5.0, 77.39802627162334, 30.0, 1036)
-    femmesh.addNode(-5.0, 82.39144732140551, 30.0, 1037)
-    femmesh.addNode(-5.0, 87.38486837118768, 30.0, 1038)
-    femmesh.addNode(-5.0, 92.37828942096982, 30.0, 1039)
-    femmesh.addNode(97.37496374167235, 4.936237059542162, 30.0, 1040)
-    femmesh.addNode(97.00017566547697, 9.859813429604458, 30.0, 1041)
-    femmesh.addNode(96.37659704523368, 14.758100893429901, 30.0, 1042)
-    femmesh.addNode(95.5058272642747, 19.618536096419724, 30.0, 1043)
-    femmesh.addNode(94.39009971327239, 24.42865276920723, 30.0, 1044)
-    femmesh.addNode(93.03227606193525, 29.17611370172301, 30.0, 1045)
-    femmesh.addNode(91.43583891926498, 33.84874238624277, 30.0, 1046)
-    femmesh.addNode(89.60488290119952, 38.434554248258465, 30.0, 1047)
-    femmesh.addNode(87.54410412855243, 42.92178738507017, 30.0, 1048)
-    femmesh.addNode(85.25878818218472, 47.298932733259015, 30.0, 1049)
-    femmesh.addNode(82.75479654630207, 51.554763587666166, 30.0, 1050)
-    femmesh.addNode(80.03855157464888, 55.67836439616624, 30.0, 1051)
-    femmesh.addNode(77.11702001815753, 59.65915875638117, 30.0, 1052)
-    femmesh.addNode(73.9976951563031, 63.4869365425269, 30.0, 1053)
-    femmesh.addNode(70.68857757799296, 67.15188009281698, 30.0, 1054)
-    femmesh.addNode(67.19815466128578, 70.64458939025631, 30.0, 1055)
-    femmesh.addNode(63.535378804570996, 73.95610617224025, 30.0, 1056)
-    femmesh.addNode(59.7096444650428, 77.07793690712137, 30.0, 1057)
-    femmesh.addNode(55.73076406336107, 80.00207457881315, 30.0, 1058)
-    femmesh.addNode(51.6089428163004, 82.72101922355547, 30.0, 1059)
-    femmesh.addNode(47.354752561937225, 85.22779716616932, 30.0, 1060)
-    femmesh.addNode(42.97910464450991, 87.5159789064618, 30.0, 1061)
-    femmesh.addNode(38.49322192849753, 89.57969560990614, 30.0, 1062)
-    femmesh.addNode(33.90861001369713, 91.41365416030035, 30.0, 1063)
-    femmesh.addNode(29.237027725128424, 93.01315073579687, 30.0, 1064)
-    femmesh.addNode(24.490456953454654, 94.37408287348272, 30.0, 1065)
-    femmesh.addNode(19.681071923274324, 95.49295999156641, 30.0, 1066)
-    femmesh.addNode(14.82120796810602, 96.36691234218388, 30.0, 1067)
-    femmesh.addNode(9.923329892153571, 96.9936983718607, 30.0, 1068)
-    femmesh.addNode(9.923329892153891, -96.99369837186066, 30.0, 1069)
-    femmesh.addNode(14.82120796810636, -96.36691234218382, 30.0, 1070)
-    femmesh.addNode(19.68107192327466, -95.49295999156634, 30.0, 1071)
-    femmesh.addNode(24.490456953454984, -94.37408287348264, 30.0, 1072)
-    femmesh.addNode(29.237027725128755, -93.01315073579677, 30.0, 1073)
-    femmesh.addNode(33.908610013697455, -91.41365416030024, 30.0, 1074)
-    femmesh.addNode(38.49322192849785, -89.579695609906, 30.0, 1075)
-    femmesh.addNode(42.97910464451024, -87.51597890646164, 30.0, 1076)
-    femmesh.addNode(47.354752561937545, -85.22779716616914, 30.0, 1077)
-    femmesh.addNode(51.60894281630071, -82.72101922355529, 30.0, 1078)
-    femmesh.addNode(55.730764063361384, -80.00207457881294, 30.0, 1079)
-    femmesh.addNode(59.70964446504309, -77.07793690712114, 30.0, 1080)
-    femmesh.addNode(63.535378804571295, -73.95610617223998, 30.0, 1081)
-    femmesh.addNode(67.19815466128607, -70.64458939025604, 30.0, 1082)
-    femmesh.addNode(70.68857757799324, -67.1518800928167, 30.0, 1083)
-    femmesh.addNode(73.99769515630335, -63.4869365425266, 30.0, 1084)
-    femmesh.addNode(77.11702001815776, -59.659158756380855, 30.0, 1085)
-    femmesh.addNode(80.0385515746491, -55.678364396165904, 30.0, 1086)
-    femmesh.addNode(82.7547965463023, -51.5547635876658, 30.0, 1087)
-    femmesh.addNode(85.2587881821849, -47.29893273325865, 30.0, 1088)
-    femmesh.addNode(87.54410412855262, -42.92178738506979, 30.0, 1089)
-    femmesh.addNode(89.60488290119969, -38.434554248258074, 30.0, 1090)
-    femmesh.addNode(91.43583891926512, -33.84874238624238, 30.0, 1091)
-    femmesh.addNode(93.03227606193538, -29.17611370172263, 30.0, 1092)
-    femmesh.addNode(94.39009971327249, -24.428652769206863, 30.0, 1093)
-    femmesh.addNode(95.50582726427477, -19.618536096419355, 30.0, 1094)
-    femmesh.addNode(96.37659704523374, -14.758100893429544, 30.0, 1095)
-    femmesh.addNode(97.00017566547702, -9.859813429604113, 30.0, 1096)
-    femmesh.addNode(97.37496374167235, -4.936237059541828, 30.0, 1097)
-    femmesh.addNode(5.0, -92.37828942097016, 30.0, 1098)
-    femmesh.addNode(5.0, -87.384868371188, 30.0, 1099)
-    femmesh.addNode(5.0, -82.39144732140585, 30.0, 1100)
-    femmesh.addNode(5.0, -77.39802627162368, 30.0, 1101)
-    femmesh.addNode(5.0, -72.4046052218415, 30.0, 1102)
-    femmesh.addNode(5.0, -67.41118417205935, 30.0, 1103)
-    femmesh.addNode(5.0, -62.417763122277194, 30.0, 1104)
-    femmesh.addNode(5.0, -57.42434207249503, 30.0, 1105)
-    femmesh.addNode(5.0, -52.43092102271287, 30.0, 1106)
-    femmesh.addNode(5.0, -47.43749997293071, 30.0, 1107)
-    femmesh.addNode(5.0, -42.444078923148545, 30.0, 1108)
-    femmesh.addNode(5.0, -37.45065787336638, 30.0, 1109)
-    femmesh.addNode(5.0, -32.457236823584225, 30.0, 1110)
-    femmesh.addNode(5.0, -27.463815773802054, 30.0, 1111)
-    femmesh.addNode(5.0, -22.470394724019897, 30.0, 1112)
-    femmesh.addNode(5.0, -17.476973674237726, 30.0, 1113)
-    femmesh.addNode(5.0, -12.48355262445557, 30.0, 1114)
-    femmesh.addNode(5.0, -7.490131574673413, 30.0, 1115)
-    femmesh.addNode(5.0, -2.496710524891242, 30.0, 1116)
-    femmesh.addNode(5.0, 2.496710524890915, 30.0, 1117)
-    femmesh.addNode(5.0, 7.490131574673072, 30.0, 1118)
-    femmesh.addNode(5.0, 12.483552624455228, 30.0, 1119)
-    femmesh.addNode(5.0, 17.4769736742374, 30.0, 1120)
-    femmesh.addNode(5.0, 22.47039472401957, 30.0, 1121)
-    femmesh.addNode(5.0, 27.463815773801727, 30.0, 1122)
-    femmesh.addNode(5.0, 32.457236823583884, 30.0, 1123)
-    femmesh.addNode(5.0, 37.450657873366055, 30.0, 1124)
-    femmesh.addNode(5.0, 42.4440789231482, 30.0, 1125)
-    femmesh.addNode(5.0, 47.43749997293037, 30.0, 1126)
-    femmesh.addNode(5.0, 52.43092102271254, 30.0, 1127)
-    femmesh.addNode(5.0, 57.42434207249471, 30.0, 1128)
-    femmesh.addNode(5.0, 62.41776312227685, 30.0, 1129)
-    femmesh.addNode(5.0, 67.41118417205902, 30.0, 1130)
-    femmesh.addNode(5.0, 72.40460522184117, 30.0, 1131)
-    femmesh.addNode(5.0, 77.39802627162337, 30.0, 1132)
-    femmesh.addNode(5.0, 82.39144732140551, 30.0, 1133)
-    femmesh.addNode(5.0, 87.38486837118768, 30.0, 1134)
-    femmesh.addNode(5.0, 92.37828942096985, 30.0, 1135)
-    femmesh.addNode(6.178901352847948e-15, 3.0, 20.0, 1136)
-    femmesh.addNode(-3.0, 1.1025535076145708e-14, 20.0, 1137)
-    femmesh.addNode(-5.51091059616309e-16, -3.0, 20.0, 1138)
-    femmesh.addNode(-5.0, -92.37828942097019, 20.0, 1139)
-    femmesh.addNode(-5.0, -87.38486837118802, 20.0, 1140)
-    femmesh.addNode(-5.0, -82.39144732140586, 20.0, 1141)
-    femmesh.addNode(-5.0, -77.3980262716237, 20.0, 1142)
-    femmesh.addNode(-5.0, -72.40460522184154, 20.0, 1143)
-    femmesh.addNode(-5.0, -67.41118417205936, 20.0, 1144)
-    femmesh.addNode(-5.0, -62.41776312227721, 20.0, 1145)
-    femmesh.addNode(-5.0, -57.424342072495044, 20.0, 1146)
-    femmesh.addNode(-5.0, -52.43092102271288, 20.0, 1147)
-    femmesh.addNode(-5.0, -47.43749997293072, 20.0, 1148)
-    femmesh.addNode(-5.0, -42.44407892314855, 20.0, 1149)
-    femmesh.addNode(-5.0, -37.45065787336639, 20.0, 1150)
-    femmesh.addNode(-5.0, -32.45723682358424, 20.0, 1151)
-    femmesh.addNode(-5.0, -27.463815773802068, 20.0, 1152)
-    femmesh.addNode(-5.0, -22.47039472401991, 20.0, 1153)
-    femmesh.addNode(-5.0, -17.47697367423774, 20.0, 1154)
-    femmesh.addNode(-5.0, -12.48355262445557, 20.0, 1155)
-    femmesh.addNode(-5.0, -7.4901315746733985, 20.0, 1156)
-    femmesh.addNode(-5.0, -2.496710524891256, 20.0, 1157)
-    femmesh.addNode(-5.0, 2.4967105248909007, 20.0, 1158)
-    femmesh.addNode(-5.0, 7.490131574673072, 20.0, 1159)
-    femmesh.addNode(-5.0, 12.483552624455243, 20.0, 1160)
-    femmesh.addNode(-5.0, 17.4769736742374, 20.0, 1161)
-    femmesh.addNode(-5.0, 22.47039472401957, 20.0, 1162)
-    femmesh.addNode(-5.0, 27.463815773801727, 20.0, 1163)
-    femmesh.addNode(-5.0, 32.457236823583884, 20.0, 1164)
-    femmesh.addNode(-5.0, 37.450657873366055, 20.0, 1165)
-    femmesh.addNode(-5.0, 42.444078923148226, 20.0, 1166)
-    femmesh.addNode(-5.0, 47.4374999729304, 20.0, 1167)
-    femmesh.addNode(-5.0, 52.43092102271254, 20.0, 1168)
-    femmesh.addNode(-5.0, 57.42434207249471, 20.0, 1169)
-    femmesh.addNode(-5.0, 62.41776312227685, 20.0, 1170)
-    femmesh.addNode(-5.0, 67.411184172059, 20.0, 1171)
-    femmesh.addNode(-5.0, 72.40460522184117, 20.0, 1172)
-    femmesh.addNode(-5.0, 77.39802627162334, 20.0, 1173)
-    femmesh.addNode(-5.0, 82.39144732140551, 20.0, 1174)
-    femmesh.addNode(-5.0, 87.38486837118768, 20.0, 1175)
-    femmesh.addNode(-5.0, 92.37828942096982, 20.0, 1176)
-    femmesh.addNode(-9.923329892153278, 96.99369837186072, 20.0, 1177)
-    femmesh.addNode(-14.821207968105751, 96.36691234218392, 20.0, 1178)
-    femmesh.addNode(-19.68107192327408, 95.49295999156645, 20.0, 1179)
-    femmesh.addNode(-24.490456953454412, 94.37408287348279, 20.0, 1180)
-    femmesh.addNode(-29.237027725128208, 93.01315073579696, 20.0, 1181)
-    femmesh.addNode(-33.908610013696915, 91.41365416030044, 20.0, 1182)
-    femmesh.addNode(-38.49322192849735, 89.57969560990621, 20.0, 1183)
-    femmesh.addNode(-42.979104644509746, 87.51597890646188, 20.0, 1184)
-    femmesh.addNode(-47.3547525619371, 85.2277971661694, 20.0, 1185)
-    femmesh.addNode(-51.60894281630028, 82.72101922355556, 20.0, 1186)
-    femmesh.addNode(-55.730764063360965, 80.00207457881324, 20.0, 1187)
-    femmesh.addNode(-59.70964446504272, 77.07793690712143, 20.0, 1188)
-    femmesh.addNode(-63.53537880457094, 73.9561061722403, 20.0, 1189)
-    femmesh.addNode(-67.19815466128574, 70.64458939025637, 20.0, 1190)
-    femmesh.addNode(-70.68857757799296, 67.151880092817, 20.0, 1191)
-    femmesh.addNode(-73.99769515630308, 63.48693654252692, 20.0, 1192)
-    femmesh.addNode(-77.1170200181575, 59.65915875638119, 20.0, 1193)
-    femmesh.addNode(-80.03855157464888, 55.67836439616624, 20.0, 1194)
-    femmesh.addNode(-82.75479654630207, 51.554763587666166, 20.0, 1195)
-    femmesh.addNode(-85.2587881821847, 47.29893273325902, 20.0, 1196)
-    femmesh.addNode(-87.5441041285524, 42.92178738507022, 20.0, 1197)
-    femmesh.addNode(-89.6048829011995, 38.4345542482585, 20.0, 1198)
-    femmesh.addNode(-91.43583891926498, 33.848742386242776, 20.0, 1199)
-    femmesh.addNode(-93.03227606193524, 29.176113701723068, 20.0, 1200)
-    femmesh.addNode(-94.39009971327236, 24.42865276920731, 20.0, 1201)
-    femmesh.addNode(-95.50582726427469, 19.618536096419813, 20.0, 1202)
-    femmesh.addNode(-96.37659704523365, 14.758100893430004, 20.0, 1203)
-    femmesh.addNode(-97.00017566547697, 9.859813429604573, 20.0, 1204)
-    femmesh.addNode(-97.37496374167233, 4.936237059542291, 20.0, 1205)
-    femmesh.addNode(-97.5, 1.4183640017283e-13, 20.0, 1206)
-    femmesh.addNode(-97.37496374167235, -4.936237059541965, 20.0, 1207)
-    femmesh.addNode(-97.00017566547699, -9.859813429604293, 20.0, 1208)
-    femmesh.addNode(-96.37659704523371, -14.75810089342968, 20.0, 1209)
-    femmesh.addNode(-95.50582726427474, -19.618536096419533, 20.0, 1210)
-    femmesh.addNode(-94.39009971327245, -24.428652769206998, 20.0, 1211)
-    femmesh.addNode(-93.03227606193532, -29.176113701722763, 20.0, 1212)
-    femmesh.addNode(-91.43583891926508, -33.848742386242506, 20.0, 1213)
-    femmesh.addNode(-89.60488290119963, -38.434554248258195, 20.0, 1214)
-    femmesh.addNode(-87.54410412855258, -42.92178738506988, 20.0, 1215)
-    femmesh.addNode(-85.25878818218484, -47.29893273325877, 20.0, 1216)
-    femmesh.addNode(-82.75479654630223, -51.55476358766592, 20.0, 1217)
-    femmesh.addNode(-80.03855157464906, -55.67836439616598, 20.0, 1218)
-    femmesh.addNode(-77.11702001815767, -59.65915875638096, 20.0, 1219)
-    femmesh.addNode(-73.99769515630328, -63.48693654252667, 20.0, 1220)
-    femmesh.addNode(-70.68857757799319, -67.15188009281677, 20.0, 1221)
-    femmesh.addNode(-67.19815466128601, -70.64458939025612, 20.0, 1222)
-    femmesh.addNode(-63.53537880457125, -73.95610617224003, 20.0, 1223)
-    femmesh.addNode(-59.70964446504306, -77.07793690712118, 20.0, 1224)
-    femmesh.addNode(-55.73076406336134, -80.00207457881297, 20.0, 1225)
-    femmesh.addNode(-51.60894281630067, -82.72101922355532, 20.0, 1226)
-    femmesh.addNode(-47.3547525619375, -85.22779716616918, 20.0, 1227)
-    femmesh.addNode(-42.979104644510194, -87.51597890646165, 20.0, 1228)
-    femmesh.addNode(-38.4932219284978, -89.57969560990601, 20.0, 1229)
-    femmesh.addNode(-33.908610013697405, -91.41365416030025, 20.0, 1230)
-    femmesh.addNode(-29.237027725128705, -93.01315073579678, 20.0, 1231)
-    femmesh.addNode(-24.490456953454935, -94.37408287348265, 20.0, 1232)
-    femmesh.addNode(-19.68107192327461, -95.49295999156635, 20.0, 1233)
-    femmesh.addNode(-14.82120796810631, -96.36691234218384, 20.0, 1234)
-    femmesh.addNode(-9.92332989215384, -96.99369837186066, 20.0, 1235)
-    femmesh.addNode(9.923329892153891, -96.99369837186066, 20.0, 1236)
-    femmesh.addNode(14.82120796810636, -96.36691234218382, 20.0, 1237)
-    femmesh.addNode(19.68107192327466, -95.49295999156634, 20.0, 1238)
-    femmesh.addNode(24.490456953454984, -94.37408287348264, 20.0, 1239)
-    femmesh.addNode(29.237027725128755, -93.01315073579677, 20.0, 1240)
-    femmesh.addNode(33.908610013697455, -91.41365416030024, 20.0, 1241)
-    femmesh.addNode(38.49322192849785, -89.579695609906, 20.0, 1242)
-    femmesh.addNode(42.97910464451024, -87.51597890646164, 20.0, 1243)
-    femmesh.addNode(47.354752561937545, -85.22779716616914, 20.0, 1244)
-    femmesh.addNode(51.60894281630071, -82.72101922355529, 20.0, 1245)
-    femmesh.addNode(55.730764063361384, -80.00207457881294, 20.0, 1246)
-    femmesh.addNode(59.70964446504309, -77.07793690712114, 20.0, 1247)
-    femmesh.addNode(63.535378804571295, -73.95610617223998, 20.0, 1248)
-    femmesh.addNode(67.19815466128607, -70.64458939025604, 20.0, 1249)
-    femmesh.addNode(70.68857757799324, -67.1518800928167, 20.0, 1250)
-    femmesh.addNode(73.99769515630335, -63.4869365425266, 20.0, 1251)
-    femmesh.addNode(77.11702001815776, -59.659158756380855, 20.0, 1252)
-    femmesh.addNode(80.0385515746491, -55.678364396165904, 20.0, 1253)
-    femmesh.addNode(82.7547965463023, -51.5547635876658, 20.0, 1254)
-    femmesh.addNode(85.2587881821849, -47.29893273325865, 20.0, 1255)
-    femmesh.addNode(87.54410412855262, -42.92178738506979, 20.0, 1256)
-    femmesh.addNode(89.60488290119969, -38.434554248258074, 20.0, 1257)
-    femmesh.addNode(91.43583891926512, -33.84874238624238, 20.0, 1258)
-    femmesh.addNode(93.03227606193538, -29.17611370172263, 20.0, 1259)
-    femmesh.addNode(94.39009971327249, -24.428652769206863, 20.0, 1260)
-    femmesh.addNode(95.50582726427477, -19.618536096419355, 20.0, 1261)
-    femmesh.addNode(96.37659704523374, -14.758100893429544, 20.0, 1262)
-    femmesh.addNode(97.00017566547702, -9.859813429604113, 20.0, 1263)
-    femmesh.addNode(97.37496374167235, -4.936237059541828, 20.0, 1264)
-    femmesh.addNode(5.0, -92.37828942097016, 20.0, 1265)
-    femmesh.addNode(5.0, -87.384868371188, 20.0, 1266)
-    femmesh.addNode(5.0, -82.39144732140585, 20.0, 1267)
-    femmesh.addNode(5.0, -77.39802627162368, 20.0, 1268)
-    femmesh.addNode(5.0, -72.4046052218415, 20.0, 1269)
-    femmesh.addNode(5.0, -67.41118417205935, 20.0, 1270)
-    femmesh.addNode(5.0, -62.417763122277194, 20.0, 1271)
-    femmesh.addNode(5.0, -57.42434207249503, 20.0, 1272)
-    femmesh.addNode(5.0, -52.43092102271287, 20.0, 1273)
-    femmesh.addNode(5.0, -47.43749997293071, 20.0, 1274)
-    femmesh.addNode(5.0, -42.444078923148545, 20.0, 1275)
-    femmesh.addNode(5.0, -37.45065787336638, 20.0, 1276)
-    femmesh.addNode(5.0, -32.457236823584225, 20.0, 1277)
-    femmesh.addNode(5.0, -27.463815773802054, 20.0, 1278)
-    femmesh.addNode(5.0, -22.470394724019897, 20.0, 1279)
-    femmesh.addNode(5.0, -17.476973674237726, 20.0, 1280)
-    femmesh.addNode(5.0, -12.48355262445557, 20.0, 1281)
-    femmesh.addNode(5.0, -7.490131574673413, 20.0, 1282)
-    femmesh.addNode(5.0, -2.496710524891242, 20.0, 1283)
-    femmesh.addNode(5.0, 2.496710524890915, 20.0, 1284)
-    femmesh.addNode(5.0, 7.490131574673072, 20.0, 1285)
-    femmesh.addNode(5.0, 12.483552624455228, 20.0, 1286)
-    femmesh.addNode(5.0, 17.4769736742374, 20.0, 1287)
-    femmesh.addNode(5.0, 22.47039472401957, 20.0, 1288)
-    femmesh.addNode(5.0, 27.463815773801727, 20.0, 1289)
-    femmesh.addNode(5.0, 32.457236823583884, 20.0, 1290)
-    femmesh.addNode(5.0, 37.450657873366055, 20.0, 1291)
-    femmesh.addNode(5.0, 42.4440789231482, 20.0, 1292)
-    femmesh.addNode(5.0, 47.43749997293037, 20.0, 1293)
-    femmesh.addNode(5.0, 52.43092102271254, 20.0, 1294)
-    femmesh.addNode(5.0, 57.42434207249471, 20.0, 1295)
-    femmesh.addNode(5.0, 62.41776312227685, 20.0, 1296)
-    femmesh.addNode(5.0, 67.41118417205902, 20.0, 1297)
-    femmesh.addNode(5.0, 72.40460522184117, 20.0, 1298)
-    femmesh.addNode(5.0, 77.39802627162337, 20.0, 1299)
-    femmesh.addNode(5.0, 82.39144732140551, 20.0, 1300)
-    femmesh.addNode(5.0, 87.38486837118768, 20.0, 1301)
-    femmesh.addNode(5.0, 92.37828942096985, 20.0, 1302)
-    femmesh.addNode(97.37496374167235, 4.936237059542162, 20.0, 1303)
-    femmesh.addNode(97.00017566547697, 9.859813429604458, 20.0, 1304)
-    femmesh.addNode(96.37659704523368, 14.758100893429901, 20.0, 1305)
-    femmesh.addNode(95.5058272642747, 19.618536096419724, 20.0, 1306)
-    femmesh.addNode(94.39009971327239, 24.42865276920723, 20.0, 1307)
-    femmesh.addNode(93.03227606193525, 29.17611370172301, 20.0, 1308)
-    femmesh.addNode(91.43583891926498, 33.84874238624277, 20.0, 1309)
-    femmesh.addNode(89.60488290119952, 38.434554248258465, 20.0, 1310)
-    femmesh.addNode(87.54410412855243, 42.92178738507017, 20.0, 1311)
-    femmesh.addNode(85.25878818218472, 47.298932733259015, 20.0, 1312)
-    femmesh.addNode(82.75479654630207, 51.554763587666166, 20.0, 1313)
-    femmesh.addNode(80.03855157464888, 55.67836439616624, 20.0, 1314)
-    femmesh.addNode(77.11702001815753, 59.65915875638117, 20.0, 1315)
-    femmesh.addNode(73.9976951563031, 63.4869365425269, 20.0, 1316)
-    femmesh.addNode(70.68857757799296, 67.15188009281698, 20.0, 1317)
-    femmesh.addNode(67.19815466128578, 70.64458939025631, 20.0, 1318)
-    femmesh.addNode(63.535378804570996, 73.95610617224025, 20.0, 1319)
-    femmesh.addNode(59.7096444650428, 77.07793690712137, 20.0, 1320)
-    femmesh.addNode(55.73076406336107, 80.00207457881315, 20.0, 1321)
-    femmesh.addNode(51.6089428163004, 82.72101922355547, 20.0, 1322)
-    femmesh.addNode(47.354752561937225, 85.22779716616932, 20.0, 1323)
-    femmesh.addNode(42.97910464450991, 87.5159789064618, 20.0, 1324)
-    femmesh.addNode(38.49322192849753, 89.57969560990614, 20.0, 1325)
-    femmesh.addNode(33.90861001369713, 91.41365416030035, 20.0, 1326)
-    femmesh.addNode(29.237027725128424, 93.01315073579687, 20.0, 1327)
-    femmesh.addNode(24.490456953454654, 94.37408287348272, 20.0, 1328)
-    femmesh.addNode(19.681071923274324, 95.49295999156641, 20.0, 1329)
-    femmesh.addNode(14.82120796810602, 96.36691234218388, 20.0, 1330)
-    femmesh.addNode(9.923329892153571, 96.9936983718607, 20.0, 1331)
-    femmesh.addNode(3.0, -7.3e-16, 25.0, 1332)
-    femmesh.addNode(-5.0, -97.37171047075223, 25.0, 1333)
-    femmesh.addNode(-5.0, 97.37171047075223, 25.0, 1334)
-    femmesh.addNode(5.0, -97.37171047075223, 25.0, 1335)
-    femmesh.addNode(5.0, 97.37171047075223, 25.0, 1336)
-    femmesh.addNode(102.46918662808096, 2.513123908507805, 7.5, 1337)
-    femmesh.addNode(102.22655907551405, 7.4820197527430174, 7.5, 1338)
-    femmesh.addNode(102.37844066218436, 4.990479694337563, 5.0, 1339)
-    femmesh.addNode(102.46918662808096, 2.513123908507805, 2.5000000000000004, 1340)
-    femmesh.addNode(102.46918662808096, -2.5131239085076476, 2.500000000000023, 1341)
-    femmesh.addNode(102.37844066218437, -4.9904796943372505, 5.0, 1342)
-    femmesh.addNode(102.22655907551405, 7.4820197527430174, 2.5, 1343)
-    femmesh.addNode(102.46918662808096, -2.5131239085077386, 7.499999999999999, 1344)
-    femmesh.addNode(101.74104238793271, 12.450313000759458, 7.5, 1345)
-    femmesh.addNode(102.01405097405667, 9.969122522196567, 5.0, 1346)
-    femmesh.addNode(101.74104238793271, 12.450313000759458, 2.5, 1347)
-    femmesh.addNode(101.01420718832503, 17.38907548186917, 7.5, 1348)
-    femmesh.addNode(101.4076952276988, 14.92411969283799, 5.0, 1349)
-    femmesh.addNode(101.01420718832503, 17.38907548186917, 2.5, 1350)
-    femmesh.addNode(100.04777744948254, 22.286592997109576, 7.5, 1351)
-    femmesh.addNode(100.56081163194992, 19.84371850040931, 5.0, 1352)
-    femmesh.addNode(100.04777744948254, 22.286592997109576, 2.5, 1353)
-    femmesh.addNode(98.84404543597302, 27.131249176020315, 7.499999999999999, 1354)
-    femmesh.addNode(99.47540890113405, 24.71625020006434, 5.0, 1355)
-    femmesh.addNode(98.84404543597302, 27.131249176020315, 2.5000000000000004, 1356)
-    femmesh.addNode(97.4058662671422, 31.911553029390607, 7.500000000000001, 1357)
-    femmesh.addNode(98.15406149061162, 29.53015768493683, 5.0, 1358)
-    femmesh.addNode(97.4058662671422, 31.911553029390607, 2.5000000000000004, 1359)
-    femmesh.addNode(95.73665114508619, 36.616166204616086, 7.499999999999999, 1360)
-    femmesh.addNode(96.59990349045574, 34.27402289832108, 5.0, 1361)
-    femmesh.addNode(95.73665114508619, 36.616166204616086, 2.5, 1362)
-    femmesh.addNode(93.84035926365682, 41.23392987901854, 7.5, 1363)
-    femmesh.addNode(94.81662119173684, 38.93659391604098, 4.999999999999999, 1364)
-    femmesh.addNode(93.84035926365682, 41.23392987901854, 2.5, 1365)
-    femmesh.addNode(91.72148841769142, 45.753891227340404, 7.5, 1366)
-    femmesh.addNode(92.80844434304754, 43.50681163477103, 5.0, 1367)
-    femmesh.addNode(91.72148841769142, 45.753891227340404, 2.5000000000000004, 1368)
-    femmesh.addNode(89.38506433474029, 50.165329400636246, 7.5, 1369)
-    femmesh.addNode(90.58013611800622, 47.973836003007555, 5.0, 1370)
-    femmesh.addNode(89.38506433474029, 50.165329400636246, 2.5, 1371)
-    femmesh.addNode(86.83662875459619, 54.457780954941946, 7.5, 1372)
-    femmesh.addNode(88.13698181753554, 52.32707173247332, 5.0, 1373)
-    femmesh.addNode(86.83662875459619, 54.457780954941946, 2.5, 1374)
-    femmesh.addNode(84.08222628489989, 58.621064669407794, 7.5, 1375)
-    femmesh.addNode(85.4847763337125, 56.556193428970694, 5.0, 1376)
-    femmesh.addNode(84.08222628489989, 58.621064669407794, 2.5, 1377)
-    femmesh.addNode(81.12839006399857, 62.64530569502953, 7.5, 1378)
-    femmesh.addNode(82.6298104049247, 60.65117008307587, 5.0, 1379)
-    femmesh.addNode(81.12839006399857, 62.64530569502953, 2.5, 1380)
-    femmesh.addNode(77.98212626506353, 66.52095897669915, 7.5, 1381)
-    femmesh.addNode(79.57885569493389, 64.60228886258511, 5.0, 1382)
-    femmesh.addNode(77.98212626506353, 66.52095897669915, 2.5, 1383)
-    femmesh.addNode(74.65089747822141, 70.23883189302109, 7.5, 1384)
-    femmesh.addNode(76.33914873123767, 68.40017815027952, 5.0, 1385)
-    femmesh.addNode(74.65089747822141, 70.23883189302109, 2.5, 1386)
-    femmesh.addNode(71.142605010115, 73.79010606019455, 7.5, 1387)
-    femmesh.addNode(72.91837374082576, 72.03582977236573, 5.000000000000001, 1388)
-    femmesh.addNode(71.142605010115, 73.79010606019455, 2.5, 1389)
-    femmesh.addNode(67.4655701428767, 77.1663582482456, 7.5, 1390)
-    femmesh.addNode(69.32464442404257, 75.50062036486894, 5.0, 1391)
-    femmesh.addNode(67.4655701428767, 77.1663582482456, 2.5, 1392)
-    femmesh.addNode(63.62851439696674, 80.35958035999812, 7.5, 1393)
-    femmesh.addNode(65.5664847097864, 78.7863318272995, 5.0, 1394)
-    femmesh.addNode(63.62851439696674, 80.35958035999812, 2.5, 1395)
-    femmesh.addNode(59.64053884469019, 83.36219842539543, 7.5, 1396)
-    femmesh.addNode(61.65280853769175, 81.88517081507935, 5.0, 1397)
-    femmesh.addNode(59.64053884469019, 83.36219842539543, 2.5, 1398)
-    femmesh.addNode(55.511102523458945, 86.1670905661206, 7.5, 1399)
-    femmesh.addNode(57.592898715249476, 84.78978722449429, 5.0, 1400)
-    femmesh.addNode(55.511102523458945, 86.1670905661206, 2.5, 1401)
-    femmesh.addNode(51.250000000000036, 88.76760388790494, 7.5, 1402)
-    femmesh.addNode(53.3963849000129, 87.49329162632799, 5.0, 1403)
-    femmesh.addNode(51.250000000000036, 88.76760388790494, 2.5, 1404)
-    femmesh.addNode(46.86733813872548, 91.15757026045817, 7.5, 1405)
-    femmesh.addNode(49.07322075911397, 89.98927160682692, 5.0, 1406)
-    femmesh.addNode(46.86733813872548, 91.15757026045817, 2.5, 1407)
-    femmesh.addNode(42.37351212936654, 93.331320947592, 7.5, 1408)
-    femmesh.addNode(44.63366036026462, 92.27180697723733, 5.0, 1409)
-    femmesh.addNode(42.37351212936654, 93.331320947592, 2.5, 1410)
-    femmesh.addNode(37.77918083073209, 95.28370005283614, 7.5, 1411)
-    femmesh.addNode(40.08823385024101, 94.33548381583883, 5.0, 1412)
-    femmesh.addNode(37.77918083073209, 95.28370005283614, 2.5, 1413)
-    femmesh.addNode(33.095241489073224, 97.01007674865497, 7.5, 1414)
-    femmesh.addNode(35.44772247853867, 96.17540730916872, 5.0, 1415)
-    femmesh.addNode(33.095241489073224, 97.01007674865497, 2.5, 1416)
-    femmesh.addNode(28.332803891019083, 98.50635626025893, 7.5, 1417)
-    femmesh.addNode(30.723133025439985, 97.78721336197856, 5.000000000000001, 1418)
-    femmesh.addNode(28.332803891019083, 98.50635626025893, 2.5, 1419)
-    femmesh.addNode(23.50316401239025, 99.76898957795795, 7.500000000000001, 1420)
-    femmesh.addNode(25.92567169514729, 99.16707894838608, 5.0, 1421)
-    femmesh.addNode(23.50316401239023, 99.76898957795797, 2.5000000000000004, 1422)
-    femmesh.addNode(18.617777225392242, 100.79498187502027, 7.5, 1423)
-    femmesh.addNode(21.066717535904573, 100.31173117967016, 5.0, 1424)
-    femmesh.addNode(18.617777225392242, 100.79498187502027, 2.5000000000000027, 1425)
-    femmesh.addNode(13.688231127738293, 101.58189961107055, 7.5, 1426)
-    femmesh.addNode(16.157795450152317, 101.21845506720125, 4.999999999999999, 1427)
-    femmesh.addNode(13.688231127738293, 101.58189961107055, 2.5, 1428)
-    femmesh.addNode(8.726218058147657, 102.12787630417886, 7.5, 1429)
-    femmesh.addNode(11.210548858732139, 101.88509996209446, 5.0, 1430)
-    femmesh.addNode(8.726218058147657, 102.12787630417886, 2.5, 1431)
-    femmesh.addNode(3.743507363410032, 102.43161695794954, 7.5, 1432)
-    femmesh.addNode(6.236712083978917, 102.31008465631115, 5.0, 1433)
-    femmesh.addNode(3.7435073634100093, 102.43161695794954, 2.5, 1434)
-    femmesh.addNode(-1.248082517204747, 102.49240113310961, 7.5, 1435)
-    femmesh.addNode(1.2480825172047367, 102.49240113310961, 5.0, 1436)
-    femmesh.addNode(-1.2480825172047696, 102.49240113310961, 2.5, 1437)
-    femmesh.addNode(-6.23671208397895, 102.31008465631113, 7.5, 1438)
-    femmesh.addNode(-3.743507363410042, 102.43161695794954, 5.0, 1439)
-    femmesh.addNode(-6.23671208397895, 102.31008465631113, 2.5, 1440)
-    femmesh.addNode(-11.21054885873217, 101.88509996209446, 7.5, 1441)
-    femmesh.addNode(-8.72621805814769, 102.12787630417886, 5.0, 1442)
-    femmesh.addNode(-11.21054885873217, 101.88509996209446, 2.5, 1443)
-    femmesh.addNode(-16.15779545015235, 101.21845506720123, 7.4999999999999964, 1444)
-    femmesh.addNode(-13.688231127738348, 101.58189961107055, 5.0, 1445)
-    femmesh.addNode(-16.15779545015235, 101.21845506720123, 2.500000000000003, 1446)
-    femmesh.addNode(-21.066717535904605, 100.31173117967015, 7.5, 1447)
-    femmesh.addNode(-18.617777225392295, 100.79498187502026, 5.0, 1448)
-    femmesh.addNode(-21.066717535904605, 100.31173117967015, 2.5, 1449)
-    femmesh.addNode(-25.925671695147305, 99.16707894838608, 7.5, 1450)
-    femmesh.addNode(-23.503164012390265, 99.76898957795795, 5.0, 1451)
-    femmesh.addNode(-25.925671695147305, 99.16707894838608, 2.5, 1452)
-    femmesh.addNode(-30.72313302544002, 97.78721336197856, 7.499999999999999, 1453)
-    femmesh.addNode(-28.33280389101911, 98.50635626025893, 5.0, 1454)
-    femmesh.addNode(-30.723133025440042, 97.78721336197854, 2.5, 1455)
-    femmesh.addNode(-35.4477224785387, 96.1754073091687, 7.5, 1456)
-    femmesh.addNode(-33.095241489073274, 97.01007674865494, 5.0, 1457)
-    femmesh.addNode(-35.44772247853872, 96.1754073091687, 2.5000000000000004, 1458)
-    femmesh.addNode(-40.08823385024104, 94.33548381583881, 7.499999999999999, 1459)
-    femmesh.addNode(-37.779180830732116, 95.28370005283612, 5.0, 1460)
-    femmesh.addNode(-40.08823385024104, 94.33548381583881, 2.5, 1461)
-    femmesh.addNode(-44.63366036026463, 92.27180697723732, 7.5, 1462)
-    femmesh.addNode(-42.373512129366546, 93.331320947592, 5.0, 1463)
-    femmesh.addNode(-44.63366036026463, 92.27180697723732, 2.5, 1464)
-    femmesh.addNode(-49.073220759113944, 89.98927160682695, 7.5, 1465)
-    femmesh.addNode(-46.867338138725486, 91.15757026045817, 5.0, 1466)
-    femmesh.addNode(-49.073220759113944, 89.98927160682695, 2.5000000000000004, 1467)
-    femmesh.addNode(-53.39638490001288, 87.493291626328, 7.499999999999999, 1468)
-    femmesh.addNode(-51.25000000000002, 88.76760388790494, 5.0, 1469)
-    femmesh.addNode(-53.39638490001288, 87.493291626328, 2.5, 1470)
-    femmesh.addNode(-57.592898715249454, 84.7897872244943, 7.499999999999999, 1471)
-    femmesh.addNode(-55.511102523458916, 86.16709056612062, 5.0, 1472)
-    femmesh.addNode(-57.592898715249454, 84.7897872244943, 2.5000000000000004, 1473)
-    femmesh.addNode(-61.65280853769174, 81.88517081507935, 7.5, 1474)
-    femmesh.addNode(-59.64053884469015, 83.36219842539546, 5.0, 1475)
-    femmesh.addNode(-61.652808537691705, 81.88517081507939, 2.5, 1476)
-    femmesh.addNode(-65.56648470978637, 78.78633182729952, 7.500000000000001, 1477)
-    femmesh.addNode(-63.62851439696672, 80.35958035999815, 5.0, 1478)
-    femmesh.addNode(-65.56648470978637, 78.78633182729952, 2.5000000000000004, 1479)
-    femmesh.addNode(-69.32464442404253, 75.50062036486898, 7.5, 1480)
-    femmesh.addNode(-67.46557014287666, 77.16635824824566, 5.0, 1481)
-    femmesh.addNode(-69.32464442404253, 75.50062036486898, 2.5, 1482)
-    femmesh.addNode(-72.9183737408257, 72.03582977236579, 7.5, 1483)
-    femmesh.addNode(-71.14260501011495, 73.7901060601946, 5.0, 1484)
-    femmesh.addNode(-72.9183737408257, 72.03582977236579, 2.5, 1485)
-    femmesh.addNode(-76.33914873123764, 68.40017815027954, 7.5, 1486)
-    femmesh.addNode(-74.65089747822138, 70.23883189302113, 5.0, 1487)
-    femmesh.addNode(-76.33914873123764, 68.40017815027954, 2.5, 1488)
-    femmesh.addNode(-79.57885569493385, 64.60228886258516, 7.5, 1489)
-    femmesh.addNode(-77.98212626506347, 66.5209589766992, 5.0, 1490)
-    femmesh.addNode(-79.57885569493385, 64.60228886258516, 2.500000000000001, 1491)
-    femmesh.addNode(-82.62981040492465, 60.65117008307594, 7.5, 1492)
-    femmesh.addNode(-81.12839006399851, 62.64530569502959, 5.000000000000001, 1493)
-    femmesh.addNode(-82.62981040492465, 60.65117008307594, 2.500000000000001, 1494)
-    femmesh.addNode(-85.48477633371243, 56.55619342897081, 7.5, 1495)
-    femmesh.addNode(-84.08222628489983, 58.621064669407886, 5.0, 1496)
-    femmesh.addNode(-85.48477633371243, 56.55619342897081, 2.5, 1497)
-    femmesh.addNode(-88.13698181753549, 52.32707173247342, 7.5, 1498)
-    femmesh.addNode(-86.83662875459612, 54.457780954942045, 5.0, 1499)
-    femmesh.addNode(-88.13698181753549, 52.32707173247342, 2.5, 1500)
-    femmesh.addNode(-90.58013611800615, 47.97383600300768, 7.5, 1501)
-    femmesh.addNode(-89.38506433474022, 50.165329400636374, 5.0, 1502)
-    femmesh.addNode(-90.58013611800615, 47.97383600300768, 2.5, 1503)
-    femmesh.addNode(-92.80844434304747, 43.50681163477117, 7.5, 1504)
-    femmesh.addNode(-91.72148841769136, 45.753891227340524, 5.0, 1505)
-    femmesh.addNode(-92.80844434304747, 43.50681163477117, 2.5, 1506)
-    femmesh.addNode(-94.81662119173679, 38.93659391604111, 7.499999999999999, 1507)
-    femmesh.addNode(-93.84035926365677, 41.233929879018675, 5.0, 1508)
-    femmesh.addNode(-94.81662119173679, 38.93659391604111, 2.5, 1509)
-    femmesh.addNode(-96.59990349045567, 34.27402289832127, 7.5, 1510)
-    femmesh.addNode(-95.73665114508611, 36.61616620461624, 5.0, 1511)
-    femmesh.addNode(-96.59990349045567, 34.27402289832127, 2.5, 1512)
-    femmesh.addNode(-98.15406149061157, 29.530157684937002, 7.5, 1513)
-    femmesh.addNode(-97.40586626714214, 31.91155302939078, 5.0, 1514)
-    femmesh.addNode(-98.15406149061157, 29.530157684937002, 2.5000000000000004, 1515)
-    femmesh.addNode(-99.475408901134, 24.716250200064533, 7.499999999999999, 1516)
-    femmesh.addNode(-98.84404543597297, 27.131249176020468, 5.0, 1517)
-    femmesh.addNode(-99.475408901134, 24.716250200064533, 2.5, 1518)
-    femmesh.addNode(-100.56081163194987, 19.843718500409473, 7.5, 1519)
-    femmesh.addNode(-100.0477774494825, 22.286592997109796, 5.0, 1520)
-    femmesh.addNode(-100.56081163194987, 19.843718500409473, 2.5000000000000004, 1521)
-    femmesh.addNode(-101.40769522769877, 14.924119692838172, 7.5, 1522)
-    femmesh.addNode(-101.01420718832499, 17.38907548186937, 5.0, 1523)
-    femmesh.addNode(-101.40769522769877, 14.924119692838172, 2.5000000000000004, 1524)
-    femmesh.addNode(-102.01405097405664, 9.969122522196816, 7.5, 1525)
-    femmesh.addNode(-101.74104238793268, 12.450313000759673, 5.0, 1526)
-    femmesh.addNode(-102.01405097405664, 9.969122522196816, 2.5000000000000004, 1527)
-    femmesh.addNode(-102.37844066218435, 4.990479694337784, 7.5, 1528)
-    femmesh.addNode(-102.22655907551403, 7.482019752743251, 5.0, 1529)
-    femmesh.addNode(-102.37844066218435, 4.990479694337784, 2.5000000000000004, 1530)
-    femmesh.addNode(-102.5, 1.9462920572978604e-13, 7.5, 1531)
-    femmesh.addNode(-102.46960565912678, 2.495979980499136, 5.0, 1532)
-    femmesh.addNode(-102.5, 1.9462920572978604e-13, 2.5000000000000004, 1533)
-    femmesh.addNode(-102.37844066218437, -4.990479694337395, 7.5, 1534)
-    femmesh.addNode(-102.4696056591268, -2.495979980498747, 5.0, 1535)
-    femmesh.addNode(-102.37844066218437, -4.990479694337395, 2.5, 1536)
-    femmesh.addNode(-102.01405097405669, -9.969122522196429, 7.5, 1537)
-    femmesh.addNode(-102.22655907551406, -7.482019752742862, 5.0, 1538)
-    femmesh.addNode(-102.01405097405669, -9.969122522196429, 2.500000000000001, 1539)
-    femmesh.addNode(-101.40769522769882, -14.924119692837834, 7.5, 1540)
-    femmesh.addNode(-101.74104238793272, -12.450313000759287, 5.000000000000001, 1541)
-    femmesh.addNode(-101.40769522769882, -14.924119692837834, 2.5000000000000004, 1542)
-    femmesh.addNode(-100.56081163194993, -19.84371850040918, 7.5, 1543)
-    femmesh.addNode(-101.01420718832505, -17.38907548186903, 5.0, 1544)
-    femmesh.addNode(-100.56081163194993, -19.84371850040918, 2.5, 1545)
-    femmesh.addNode(-99.47540890113407, -24.71625020006424, 7.5, 1546)
-    femmesh.addNode(-100.04777744948255, -22.28659299710946, 5.0, 1547)
-    femmesh.addNode(-99.47540890113407, -24.71625020006424, 2.5, 1548)
-    femmesh.addNode(-98.15406149061165, -29.530157684936714, 7.5, 1549)
-    femmesh.addNode(-98.84404543597303, -27.13124917602023, 5.0, 1550)
-    femmesh.addNode(-98.15406149061165, -29.530157684936714, 2.5, 1551)
-    femmesh.addNode(-96.59990349045576, -34.27402289832099, 7.5, 1552)
-    femmesh.addNode(-97.40586626714223, -31.911553029390497, 5.0, 1553)
-    femmesh.addNode(-96.59990349045576, -34.27402289832099, 2.5, 1554)
-    femmesh.addNode(-94.8166211917369, -38.93659391604087, 7.5, 1555)
-    femmesh.addNode(-95.73665114508621, -36.616166204616015, 5.0, 1556)
-    femmesh.addNode(-94.8166211917369, -38.93659391604087, 2.5, 1557)
-    femmesh.addNode(-92.8084443430476, -43.5068116347709, 7.5, 1558)
-    femmesh.addNode(-93.84035926365688, -41.233929879018405, 5.0, 1559)
-    femmesh.addNode(-92.8084443430476, -43.5068116347709, 2.5000000000000004, 1560)
-    femmesh.addNode(-90.58013611800628, -47.973836003007456, 7.5, 1561)
-    femmesh.addNode(-91.72148841769148, -45.7538912273403, 5.0, 1562)
-    femmesh.addNode(-90.58013611800628, -47.973836003007456, 2.5, 1563)
-    femmesh.addNode(-88.1369818175356, -52.32707173247324, 7.5, 1564)
-    femmesh.addNode(-89.38506433474035, -50.16532940063615, 5.0, 1565)
-    femmesh.addNode(-88.1369818175356, -52.32707173247324, 2.5, 1566)
-    femmesh.addNode(-85.48477633371256, -56.55619342897059, 7.5, 1567)
-    femmesh.addNode(-86.83662875459626, -54.45778095494183, 5.0, 1568)
-    femmesh.addNode(-85.48477633371256, -56.55619342897059, 2.5, 1569)
-    femmesh.addNode(-82.62981040492475, -60.651170083075804, 7.5, 1570)
-    femmesh.addNode(-84.08222628489995, -58.621064669407716, 5.0, 1571)
-    femmesh.addNode(-82.62981040492475, -60.651170083075804, 2.5, 1572)
-    femmesh.addNode(-79.57885569493392, -64.60228886258506, 7.5, 1573)
-    femmesh.addNode(-81.12839006399861, -62.64530569502947, 5.0, 1574)
-    femmesh.addNode(-79.57885569493392, -64.60228886258506, 2.5, 1575)
-    femmesh.addNode(-76.33914873123769, -68.40017815027949, 7.5, 1576)
-    femmesh.addNode(-77.98212626506354, -66.5209589766991, 5.0, 1577)
-    femmesh.addNode(-76.33914873123769, -68.40017815027949, 2.5, 1578)
-    femmesh.addNode(-72.9183737408258, -72.03582977236569, 7.5, 1579)
-    femmesh.addNode(-74.65089747822145, -70.23883189302104, 5.0, 1580)
-    femmesh.addNode(-72.9183737408258, -72.03582977236569, 2.5, 1581)
-    femmesh.addNode(-69.32464442404259, -75.50062036486894, 7.5, 1582)
-    femmesh.addNode(-71.14260501011502, -73.79010606019452, 5.0, 1583)
-    femmesh.addNode(-69.32464442404259, -75.50062036486894, 2.5, 1584)
-    femmesh.addNode(-65.5664847097864, -78.7863318272995, 7.5, 1585)
-    femmesh.addNode(-67.46557014287671, -77.1663582482456, 5.0, 1586)
-    femmesh.addNode(-65.5664847097864, -78.7863318272995, 2.5, 1587)
-    femmesh.addNode(-61.652808537691726, -81.88517081507936, 7.5, 1588)
-    femmesh.addNode(-63.62851439696674, -80.35958035999812, 4.999999999999999, 1589)
-    femmesh.addNode(-61.652808537691726, -81.88517081507936, 2.5, 1590)
-    femmesh.addNode(-57.59289871524944, -84.78978722449432, 7.5, 1591)
-    femmesh.addNode(-59.64053884469017, -83.36219842539545, 5.0, 1592)
-    femmesh.addNode(-57.59289871524944, -84.78978722449432, 2.5000000000000004, 1593)
-    femmesh.addNode(-53.396384900012826, -87.49329162632803, 7.5, 1594)
-    femmesh.addNode(-55.511102523458895, -86.16709056612063, 5.0, 1595)
-    femmesh.addNode(-53.396384900012826, -87.49329162632803, 2.5, 1596)
-    femmesh.addNode(-49.07322075911388, -89.98927160682696, 7.5, 1597)
-    femmesh.addNode(-51.24999999999996, -88.76760388790498, 5.0, 1598)
-    femmesh.addNode(-49.07322075911388, -89.98927160682696, 2.5, 1599)
-    femmesh.addNode(-44.63366036026453, -92.27180697723736, 7.500000000000002, 1600)
-    femmesh.addNode(-46.86733813872539, -91.15757026045821, 5.0, 1601)
-    femmesh.addNode(-44.633660360264614, -92.27180697723733, 2.5000000000000004, 1602)
-    femmesh.addNode(-40.088233850240975, -94.33548381583886, 7.5, 1603)
-    femmesh.addNode(-42.37351212936651, -93.33132094759203, 5.000000000000001, 1604)
-    femmesh.addNode(-40.088233850240975, -94.33548381583886, 2.5000000000000004, 1605)
-    femmesh.addNode(-35.44772247853864, -96.17540730916873, 7.499999999999999, 1606)
-    femmesh.addNode(-37.77918083073205, -95.28370005283615, 5.0, 1607)
-    femmesh.addNode(-35.44772247853864, -96.17540730916873, 2.5, 1608)
-    femmesh.addNode(-30.72313302544002, -97.78721336197856, 7.5, 1609)
-    femmesh.addNode(-33.09524148907328, -97.01007674865494, 5.0, 1610)
-    femmesh.addNode(-30.72313302544002, -97.78721336197856, 2.5, 1611)
-    femmesh.addNode(-25.925671695147287, -99.16707894838608, 7.5, 1612)
-    femmesh.addNode(-28.332803891019093, -98.50635626025893, 5.0, 1613)
-    femmesh.addNode(-25.925671695147287, -99.16707894838608, 2.5, 1614)
-    femmesh.addNode(-21.06671753590454, -100.31173117967018, 7.5, 1615)
-    femmesh.addNode(-23.503164012390222, -99.76898957795797, 5.0, 1616)
-    femmesh.addNode(-21.06671753590454, -100.31173117967018, 2.5000000000000004, 1617)
-    femmesh.addNode(-16.15779545015226, -101.21845506720126, 7.499999999999999, 1618)
-    femmesh.addNode(-18.617777225392206, -100.79498187502028, 5.0, 1619)
-    femmesh.addNode(-16.15779545015226, -101.21845506720126, 2.5000000000000004, 1620)
-    femmesh.addNode(-11.21054885873206, -101.88509996209447, 7.5, 1621)
-    femmesh.addNode(-13.688231127738236, -101.58189961107057, 5.0, 1622)
-    femmesh.addNode(-11.21054885873206, -101.88509996209447, 2.5000000000000004, 1623)
-    femmesh.addNode(-6.236712083978839, -102.31008465631115, 7.5, 1624)
-    femmesh.addNode(-8.726218058147579, -102.12787630417887, 5.0, 1625)
-    femmesh.addNode(-6.236712083978839, -102.31008465631115, 2.5, 1626)
-    femmesh.addNode(-1.2480825172046355, -102.49240113310961, 7.5, 1627)
-    femmesh.addNode(-3.7435073634099303, -102.43161695794954, 5.0, 1628)
-    femmesh.addNode(-1.2480825172046355, -102.49240113310961, 2.5000000000000004, 1629)
-    femmesh.addNode(3.743507363410075, -102.43161695794954, 7.5, 1630)
-    femmesh.addNode(1.2480825172047798, -102.49240113310961, 5.0, 1631)
-    femmesh.addNode(3.743507363410075, -102.43161695794954, 2.5, 1632)
-    femmesh.addNode(8.726218058147722, -102.12787630417886, 7.5, 1633)
-    femmesh.addNode(6.236712083978983, -102.31008465631113, 5.0, 1634)
-    femmesh.addNode(8.726218058147722, -102.12787630417886, 2.5, 1635)
-    femmesh.addNode(13.688231127738382, -101.58189961107054, 7.5, 1636)
-    femmesh.addNode(11.210548858732205, -101.88509996209444, 5.0, 1637)
-    femmesh.addNode(13.688231127738382, -101.58189961107054, 2.5000000000000004, 1638)
-    femmesh.addNode(18.61777722539235, -100.79498187502026, 7.5, 1639)
-    femmesh.addNode(16.157795450152406, -101.21845506720123, 5.0, 1640)
-    femmesh.addNode(18.61777722539235, -100.79498187502026, 2.5, 1641)
-    femmesh.addNode(23.50316401239036, -99.76898957795794, 7.5, 1642)
-    femmesh.addNode(21.066717535904683, -100.31173117967013, 5.0, 1643)
-    femmesh.addNode(23.50316401239036, -99.76898957795794, 2.5, 1644)
-    femmesh.addNode(28.332803891019232, -98.5063562602589, 7.5, 1645)
-    femmesh.addNode(25.92567169514742, -99.16707894838605, 5.0, 1646)
-    femmesh.addNode(28.332803891019232, -98.5063562602589, 2.5, 1647)
-    femmesh.addNode(33.095241489073416, -97.0100767486549, 7.5, 1648)
-    femmesh.addNode(30.723133025440156, -97.7872133619785, 5.0, 1649)
-    femmesh.addNode(33.095241489073416, -97.0100767486549, 2.5, 1650)
-    femmesh.addNode(37.77918083073227, -95.28370005283607, 7.5, 1651)
-    femmesh.addNode(35.44772247853886, -96.17540730916865, 5.0, 1652)
-    femmesh.addNode(37.77918083073227, -95.28370005283607, 2.5, 1653)
-    femmesh.addNode(42.37351212936664, -93.33132094759196, 7.499999999999999, 1654)
-    femmesh.addNode(40.08823385024112, -94.3354838158388, 5.0, 1655)
-    femmesh.addNode(42.37351212936664, -93.33132094759196, 2.5000000000000004, 1656)
-    femmesh.addNode(46.8673381387256, -91.15757026045812, 7.5, 1657)
-    femmesh.addNode(44.63366036026474, -92.27180697723726, 5.0, 1658)
-    femmesh.addNode(46.8673381387256, -91.15757026045812, 2.5, 1659)
-    femmesh.addNode(51.25000000000017, -88.76760388790487, 7.5, 1660)
-    femmesh.addNode(49.07322075911409, -89.98927160682685, 5.0, 1661)
-    femmesh.addNode(51.25000000000017, -88.76760388790487, 2.5, 1662)
-    femmesh.addNode(55.51110252345909, -86.1670905661205, 7.499999999999999, 1663)
-    femmesh.addNode(53.39638490001303, -87.4932916263279, 4.999999999999999, 1664)
-    femmesh.addNode(55.51110252345909, -86.1670905661205, 2.5, 1665)
-    femmesh.addNode(59.64053884469028, -83.36219842539536, 7.5, 1666)
-    femmesh.addNode(57.59289871524963, -84.78978722449419, 5.0, 1667)
-    femmesh.addNode(59.64053884469028, -83.36219842539536, 2.5, 1668)
-    femmesh.addNode(63.62851439696686, -80.35958035999803, 7.5, 1669)
-    femmesh.addNode(61.65280853769192, -81.88517081507923, 5.000000000000001, 1670)
-    femmesh.addNode(63.62851439696686, -80.35958035999803, 2.5, 1671)
-    femmesh.addNode(67.46557014287683, -77.1663582482455, 7.5, 1672)
-    femmesh.addNode(65.5664847097865, -78.78633182729942, 5.0, 1673)
-    femmesh.addNode(67.46557014287683, -77.1663582482455, 2.5, 1674)
-    femmesh.addNode(71.14260501011513, -73.79010606019442, 7.5, 1675)
-    femmesh.addNode(69.3246444240427, -75.50062036486882, 5.0, 1676)
-    femmesh.addNode(71.14260501011513, -73.79010606019442, 2.5000000000000004, 1677)
-    femmesh.addNode(74.65089747822155, -70.23883189302093, 7.499999999999999, 1678)
-    femmesh.addNode(72.9183737408259, -72.03582977236559, 5.0, 1679)
-    femmesh.addNode(74.65089747822155, -70.23883189302093, 2.5, 1680)
-    femmesh.addNode(77.98212626506367, -66.52095897669898, 7.5, 1681)
-    femmesh.addNode(76.33914873123781, -68.40017815027934, 5.0, 1682)
-    femmesh.addNode(77.98212626506367, -66.52095897669898, 2.5, 1683)
-    femmesh.addNode(81.12839006399872, -62.64530569502932, 7.5, 1684)
-    femmesh.addNode(79.57885569493405, -64.60228886258491, 5.0, 1685)
-    femmesh.addNode(81.12839006399872, -62.64530569502932, 2.5, 1686)
-    femmesh.addNode(84.08222628490006, -58.62106466940755, 7.5, 1687)
-    femmesh.addNode(82.62981040492487, -60.651170083075655, 5.0, 1688)
-    femmesh.addNode(84.08222628490006, -58.62106466940755, 2.5, 1689)
-    femmesh.addNode(86.83662875459632, -54.45778095494175, 7.499999999999999, 1690)
-    femmesh.addNode(85.48477633371262, -56.55619342897051, 5.0, 1691)
-    femmesh.addNode(86.83662875459632, -54.45778095494175, 2.5, 1692)
-    femmesh.addNode(89.38506433474042, -50.16532940063603, 7.5, 1693)
-    femmesh.addNode(88.13698181753566, -52.32707173247313, 5.0, 1694)
-    femmesh.addNode(89.38506433474042, -50.16532940063603, 2.5000000000000004, 1695)
-    femmesh.addNode(91.7214884176915, -45.75389122734025, 7.5, 1696)
-    femmesh.addNode(90.58013611800635, -47.97383600300733, 5.0, 1697)
-    femmesh.addNode(91.7214884176915, -45.75389122734025, 2.5000000000000004, 1698)
-    femmesh.addNode(93.8403592636569, -41.233929879018355, 7.5, 1699)
-    femmesh.addNode(92.80844434304763, -43.50681163477085, 5.0, 1700)
-    femmesh.addNode(93.8403592636569, -41.233929879018355, 2.5, 1701)
-    femmesh.addNode(95.73665114508627, -36.61616620461587, 7.5, 1702)
-    femmesh.addNode(94.81662119173693, -38.93659391604078, 5.0, 1703)
-    femmesh.addNode(95.73665114508627, -36.61616620461587, 2.5000000000000004, 1704)
-    femmesh.addNode(97.40586626714227, -31.91155302939036, 7.5, 1705)
-    femmesh.addNode(96.59990349045582, -34.27402289832085, 5.0, 1706)
-    femmesh.addNode(97.40586626714227, -31.91155302939036, 2.5, 1707)
-    femmesh.addNode(98.84404543597309, -27.13124917602004, 7.5, 1708)
-    femmesh.addNode(98.1540614906117, -29.530157684936572, 5.0, 1709)
-    femmesh.addNode(98.84404543597309, -27.13124917602004, 2.5, 1710)
-    femmesh.addNode(100.04777744948261, -22.286592997109274, 7.5, 1711)
-    femmesh.addNode(99.47540890113412, -24.716250200064056, 5.0, 1712)
-    femmesh.addNode(100.04777744948261, -22.286592997109274, 2.5, 1713)
-    femmesh.addNode(101.01420718832509, -17.38907548186884, 7.5, 1714)
-    femmesh.addNode(100.56081163194996, -19.843718500409082, 5.0, 1715)
-    femmesh.addNode(101.01420718832509, -17.38907548186884, 2.5, 1716)
-    femmesh.addNode(101.74104238793274, -12.450313000759188, 7.5, 1717)
-    femmesh.addNode(101.40769522769884, -14.924119692837735, 4.999999999999999, 1718)
-    femmesh.addNode(101.74104238793274, -12.450313000759188, 2.5, 1719)
-    femmesh.addNode(102.22655907551406, -7.482019752742719, 7.5, 1720)
-    femmesh.addNode(102.0140509740567, -9.969122522196285, 5.000000000000001, 1721)
-    femmesh.addNode(102.22655907551406, -7.482019752742719, 2.5, 1722)
-    femmesh.addNode(-0.2853112673120588, 94.72413287949848, 10.0, 1723)
-    femmesh.addNode(-0.2853112673122157, -94.72413287949868, 10.0, 1724)
-    femmesh.addNode(-4.479502520223326e-16, 54.92763154760362, 10.0, 1725)
-    femmesh.addNode(4.287564466048963e-14, 64.9144736471679, 10.0, 1726)
-    femmesh.addNode(0.0, 74.90131574673225, 10.0, 1727)
-    femmesh.addNode(1.395708945243054e-15, -9.333568703443396, 10.0, 1728)
-    femmesh.addNode(-4.308722690807155e-15, 34.953947348474976, 10.0, 1729)
-    femmesh.addNode(-4.801714581503802e-14, 84.88815784629651, 10.0, 1730)
-    femmesh.addNode(1.8464920793956026e-15, -34.95394734847532, 10.0, 1731)
-    femmesh.addNode(4.2165101616987295e-15, -24.967105248910986, 10.0, 1732)
-    femmesh.addNode(0.10498849441157056, 9.243460001242807, 10.0, 1733)
-    femmesh.addNode(-6.4207898257488215e-15, -54.92763154760395, 10.0, 1734)
-    femmesh.addNode(-4.7628567756419216e-14, -84.88815784629682, 10.0, 1735)
-    femmesh.addNode(0.0, -64.91447364716826, 10.0, 1736)
-    femmesh.addNode(-0.10498849441157235, 24.89702070275489, 10.0, 1737)
-    femmesh.addNode(-4.347399669712137e-15, -44.94078944803966, 10.0, 1738)
-    femmesh.addNode(-7.216449660063518e-15, 44.94078944803931, 10.0, 1739)
-    femmesh.addNode(-1.449133223237431e-14, -74.90131574673258, 10.0, 1740)
-    femmesh.addNode(0.10498849441157139, 19.926961168357977, 10.0, 1741)
-    femmesh.addNode(-0.12248657681350102, -14.906426523071014, 10.0, 1742)
-    femmesh.addNode(-0.04755187788535142, 89.85643438501832, 10.0, 1743)
-    femmesh.addNode(-0.047551877885377354, -89.85643438501862, 10.0, 1744)
-    femmesh.addNode(7.145940776748271e-15, 69.90789469695007, 10.0, 1745)
-    femmesh.addNode(-2.0688917950951327e-15, 39.94736839825713, 10.0, 1746)
-    femmesh.addNode(-8.002857635839668e-15, 79.89473679651441, 10.0, 1747)
-    femmesh.addNode(-1.0649376138032293e-14, -79.89473679651474, 10.0, 1748)
-    femmesh.addNode(1.0105003735157218e-15, -29.960526298693143, 10.0, 1749)
-    femmesh.addNode(-2.4152220387290515e-15, -69.90789469695042, 10.0, 1750)
-    femmesh.addNode(-4.1681793171942244e-16, -39.94736839825747, 10.0, 1751)
-    femmesh.addNode(-0.01749808240192944, 29.948845541000182, 10.0, 1752)
-    femmesh.addNode(-1.0701316376248033e-15, -59.92105259738611, 10.0, 1753)
-    femmesh.addNode(7.0712824014112165e-15, 59.92105259738577, 10.0, 1754)
-    femmesh.addNode(-1.4254297219643292e-15, 49.93421049782146, 10.0, 1755)
-    femmesh.addNode(-1.794698249243493e-15, -49.934210497821795, 10.0, 1756)
-    femmesh.addNode(-0.020414429468916133, -19.961378094749545, 10.0, 1757)
-    femmesh.addNode(0.03499616480385684, 14.848578961164343, 10.0, 1758)
-    femmesh.addNode(-1.08193663740298, 98.96321859746833, 10.0, 1759)
-    femmesh.addNode(-1.0819366374036892, -98.96321859746874, 10.0, 1760)
-    femmesh.addNode(-2.2627254638290366, -5.164465262893022, 10.0, 1761)
-    femmesh.addNode(2.4192029088375038, -5.1245003301337135, 10.0, 1762)
-    femmesh.addNode(2.270377686453866, 5.157897573227971, 10.0, 1763)
-    femmesh.addNode(-2.4133386482671932, 5.119467198528593, 10.0, 1764)
-    femmesh.addNode(-80.60171324798912, 59.15413544460329, 10.0, 1765)
-    femmesh.addNode(-80.60171324798927, -59.15413544460309, 10.0, 1766)
-    femmesh.addNode(-0.2853112673123716, 94.72413287949861, 0.0, 1767)
-    femmesh.addNode(-0.07533427848942643, -94.72413287949894, 0.0, 1768)
-    femmesh.addNode(-4.479502520223326e-16, 54.92763154760362, 0.0, 1769)
-    femmesh.addNode(4.287564466048963e-14, 64.9144736471679, 0.0, 1770)
-    femmesh.addNode(0.0, 74.90131574673225, 0.0, 1771)
-    femmesh.addNode(0.08999013806706094, -9.273496235309892, 0.0, 1772)
-    femmesh.addNode(-4.308722690807155e-15, 34.953947348474976, 0.0, 1773)
-    femmesh.addNode(-2.879567945329859e-15, -19.973684199128815, 0.0, 1774)
-    femmesh.addNode(0.10498849441157201, -34.883862802319555, 0.0, 1775)
-    femmesh.addNode(0.10498849441157163, 9.243460001242804, 0.0, 1776)
-    femmesh.addNode(-6.446305499989104e-15, -54.927631547603966, 0.0, 1777)
-    femmesh.addNode(2.968385764219323e-14, -84.88815784629692, 0.0, 1778)
-    femmesh.addNode(1.299545214078903e-15, -64.91447364716826, 0.0, 1779)
-    femmesh.addNode(-0.10498849441157235, 24.89702070275489, 0.0, 1780)
-    femmesh.addNode(2.4833617986310832e-15, -44.940789448039645, 0.0, 1781)
-    femmesh.addNode(0.0, 84.8881578462966, 0.0, 1782)
-    femmesh.addNode(-7.216449660063518e-15, 44.94078944803931, 0.0, 1783)
-    femmesh.addNode(-1.449133223237431e-14, -74.90131574673258, 0.0, 1784)
-    femmesh.addNode(0.1399846592154287, -29.913803267922646, 0.0, 1785)
-    femmesh.addNode(0.10498849441157139, 19.926961168357977, 0.0, 1786)
-    femmesh.addNode(-0.0475518778853954, 89.85643438501836, 0.0, 1787)
-    femmesh.addNode(-0.01255571308156642, -89.8564343850187, 0.0, 1788)
-    femmesh.addNode(7.145940776748271e-15, 69.90789469695007, 0.0, 1789)
-    femmesh.addNode(-2.0688917950951327e-15, 39.94736839825713, 0.0, 1790)
-    femmesh.addNode(2.236028095069777e-15, -79.89473679651475, 0.0, 1791)
-    femmesh.addNode(-1.9025716964825258e-15, -69.90789469695042, 0.0, 1792)
-    femmesh.addNode(0.0, 79.89473679651442, 0.0, 1793)
-    femmesh.addNode(0.017498082401929377, -39.93568764056484, 0.0, 1794)
-    femmesh.addNode(0.014998356344509526, -14.861372171970885, 0.0, 1795)
-    femmesh.addNode(-0.01749808240192944, 29.948845541000182, 0.0, 1796)
-    femmesh.addNode(-8.577933809850335e-16, -59.921052597386115, 0.0, 1797)
-    femmesh.addNode(7.0712824014112165e-15, 59.92105259738577, 0.0, 1798)
-    femmesh.addNode(-8.08520353509691e-16, -49.934210497821795, 0.0, 1799)
-    femmesh.addNode(-1.4254297219643292e-15, 49.93421049782146, 0.0, 1800)
-    femmesh.addNode(0.023330776535904298, -24.9593180771159, 0.0, 1801)
-    femmesh.addNode(0.03499616480385701, 14.848578961164343, 0.0, 1802)
-    femmesh.addNode(-1.0819366374048933, 98.96321859746932, 0.0, 1803)
-    femmesh.addNode(-1.081936637404952, -98.96321859746953, 0.0, 1804)
-    femmesh.addNode(2.2692845117931157, -5.160086803116528, 0.0, 1805)
-    femmesh.addNode(-2.414176399777149, -5.1211449090638475, 0.0, 1806)
-    femmesh.addNode(-2.255073241204368, 5.157897573227965, 0.0, 1807)
-    femmesh.addNode(2.425067169407999, 5.119467198528598, 0.0, 1808)
-    femmesh.addNode(-80.60171324798912, 59.15413544460329, 0.0, 1809)
-    femmesh.addNode(-80.60171324798927, -59.15413544460309, 0.0, 1810)
-    femmesh.addNode(2.121320343559643, 2.1213203435596424, 7.5, 1811)
-    femmesh.addNode(2.182098464197385e-15, 3.0, 5.000000000000001, 1812)
-    femmesh.addNode(2.121320343559644, -2.121320343559641, 7.5, 1813)
-    femmesh.addNode(2.1134441994840667e-15, -3.0, 5.0, 1814)
-    femmesh.addNode(2.121320343559642, -2.121320343559643, 2.5, 1815)
-    femmesh.addNode(2.121320343559644, 2.121320343559641, 2.5, 1816)
-    femmesh.addNode(-2.1213203435596433, 2.121320343559642, 7.5, 1817)
-    femmesh.addNode(-3.0, 3.6739403974420594e-16, 5.0, 1818)
-    femmesh.addNode(-2.12132034355964, -2.121320343559645, 7.5, 1819)
-    femmesh.addNode(-2.1213203435596375, 2.1213203435596473, 2.5, 1820)
-    femmesh.addNode(-2.121320343559643, -2.1213203435596424, 2.5, 1821)
-    femmesh.addNode(-7.481740346109426, 97.21251751391586, 7.499999999999801, 1822)
-    femmesh.addNode(-12.376237459793572, 96.7113165370982, 7.5, 1823)
-    femmesh.addNode(-9.92332989215345, 96.9936983718607, 4.9999999999999485, 1824)
-    femmesh.addNode(-7.481740346109836, 97.21251751391583, 2.4999999999999596, 1825)
-    femmesh.addNode(-7.481740346109924, -97.21251751391583, 2.500000000000086, 1826)
-    femmesh.addNode(-9.923329892154184, -96.99369837186063, 5.0, 1827)
-    femmesh.addNode(-12.376237459793572, 96.7113165370982, 2.5, 1828)
-    femmesh.addNode(-7.481740346110097, -97.21251751391581, 7.500000000000043, 1829)
-    femmesh.addNode(-17.256673422289886, 95.96070665848826, 7.5, 1830)
-    femmesh.addNode(-14.821207968105751, 96.36691234218392, 5.0, 1831)
-    femmesh.addNode(-17.256673422289886, 95.96070665848826, 2.5, 1832)
-    femmesh.addNode(-22.092848669382985, 94.96397231409259, 7.5, 1833)
-    femmesh.addNode(-19.68107192327408, 95.49295999156645, 5.0, 1834)
-    femmesh.addNode(-22.092848669382985, 94.96397231409259, 2.5, 1835)
-    femmesh.addNode(-26.87235915476493, 93.72366997433105, 7.5, 1836)
-    femmesh.addNode(-24.490456953454434, 94.37408287348278, 5.0, 1837)
-    femmesh.addNode(-26.87235915476493, 93.72366997433105, 2.5, 1838)
-    femmesh.addNode(-31.58294616853359, 92.24298082410124, 7.5, 1839)
-    femmesh.addNode(-29.237027725128208, 93.01315073579696, 5.0, 1840)
-    femmesh.addNode(-31.58294616853359, 92.24298082410124, 2.5, 1841)
-    femmesh.addNode(-36.212527778899606, 90.52570260352816, 7.4999999999999964, 1842)
-    femmesh.addNode(-33.908610013696936, 91.41365416030042, 5.0, 1843)
-    femmesh.addNode(-36.212527778899606, 90.52570260352816, 2.5000000000000027, 1844)
-    femmesh.addNode(-40.74922982048493, 88.57623986734424, 7.499999999999999, 1845)
-    femmesh.addNode(-38.49322192849735, 89.57969560990621, 5.0, 1846)
-    femmesh.addNode(-40.74922982048493, 88.57623986734424, 2.5, 1847)
-    femmesh.addNode(-45.181416349732025, 86.39959268788348, 7.499999999999998, 1848)
-    femmesh.addNode(-42.979104644509746, 87.51597890646188, 5.0, 1849)
-    femmesh.addNode(-45.181416349732025, 86.39959268788348, 2.4999999999999996, 1850)
-    femmesh.addNode(-49.497719489311166, 84.0013438306642, 7.5, 1851)
-    femmesh.addNode(-47.3547525619371, 85.2277971661694, 5.0, 1852)
-    femmesh.addNode(-49.497719489311166, 84.0013438306642, 2.4999999999999996, 1853)
-    femmesh.addNode(-53.68706858497857, 81.38764443545351, 7.5, 1854)
-    femmesh.addNode(-51.60894281630028, 82.72101922355556, 5.0, 1855)
-    femmesh.addNode(-53.68706858497857, 81.38764443545351, 2.5, 1856)
-    femmesh.addNode(-57.73871860010348, 78.56519823953903, 7.5, 1857)
-    femmesh.addNode(-55.730764063360965, 80.00207457881324, 5.0, 1858)
-    femmesh.addNode(-57.73871860010348, 78.56519823953903, 2.5, 1859)
-    femmesh.addNode(-61.64227767503579, 75.54124438367285, 7.5, 1860)
-    femmesh.addNode(-59.70964446504269, 77.07793690712147, 4.999999999999999, 1861)
-    femmesh.addNode(-61.64227767503579, 75.54124438367285, 2.5, 1862)
-    femmesh.addNode(-65.38773378062898, 72.32353884478825, 7.5, 1863)
-    femmesh.addNode(-63.53537880457094, 73.9561061722403, 5.0, 1864)
-    femmesh.addNode(-65.38773378062898, 72.32353884478825, 2.5, 1865)
-    femmesh.addNode(-68.96548039755643, 68.92033454311041, 7.5, 1866)
-    femmesh.addNode(-67.19815466128574, 70.64458939025637, 5.0, 1867)
-    femmesh.addNode(-68.9654803975564, 68.92033454311044, 2.5, 1868)
-    femmesh.addNode(-72.3663411555571, 65.3403601746847, 7.5, 1869)
-    femmesh.addNode(-70.68857757799296, 67.151880092817, 5.0, 1870)
-    femmesh.addNode(-72.3663411555571, 65.3403601746847, 2.5, 1871)
-    femmesh.addNode(-75.58159336941512, 61.592797823612344, 7.5, 1872)
-    femmesh.addNode(-73.99769515630308, 63.48693654252692, 5.0, 1873)
-    femmesh.addNode(-75.58159336941512, 61.592797823612344, 2.5, 1874)
-    femmesh.addNode(-78.60299041130689, 57.68725941141594, 7.5, 1875)
-    femmesh.addNode(-77.1170200181575, 59.65915875638119, 5.0, 1876)
-    femmesh.addNode(-78.60299041130689, 57.68725941141594, 2.5, 1877)
-    femmesh.addNode(-81.42278286213416, 53.633762043937885, 7.5, 1878)
-    femmesh.addNode(-80.03855157464888, 55.67836439616624, 5.0, 1879)
-    femmesh.addNode(-81.42278286213416, 53.633762043937885, 2.5, 1880)
-    femmesh.addNode(-84.03373838759308, 49.442702319003224, 7.5, 1881)
-    femmesh.addNode(-82.75479654630207, 51.554763587666166, 5.0, 1882)
-    femmesh.addNode(-84.03373838759308, 49.442702319003224, 2.5, 1883)
-    femmesh.addNode(-86.42916028800029, 45.12482966074391, 7.5, 1884)
-    femmesh.addNode(-85.2587881821847, 47.29893273325902, 5.0, 1885)
-    femmesh.addNode(-86.42916028800029, 45.12482966074391, 2.5, 1886)
-    femmesh.addNode(-88.6029046742985, 40.69121874897792, 7.5, 1887)
-    femmesh.addNode(-87.5441041285524, 42.92178738507022, 5.0, 1888)
-    femmesh.addNode(-88.6029046742985, 40.69121874897792, 2.5, 1889)
-    femmesh.addNode(-90.54939622618781, 36.153241114357186, 7.5, 1890)
-    femmesh.addNode(-89.6048829011995, 38.4345542482585, 5.0, 1891)
-    femmesh.addNode(-90.54939622618781, 36.153241114357186, 2.5, 1892)
-    femmesh.addNode(-92.26364249196524, 31.52253597213943, 7.5, 1893)
-    femmesh.addNode(-91.43583891926498, 33.848742386242776, 5.0, 1894)
-    femmesh.addNode(-92.26364249196524, 31.52253597213943, 2.5, 1895)
-    femmesh.addNode(-93.7412466933965, 26.8109803693893, 7.5, 1896)
-    femmesh.addNode(-93.03227606193524, 29.176113701723068, 5.0, 1897)
-    femmesh.addNode(-93.7412466933965, 26.8109803693893, 2.4999999999999996, 1898)
-    femmesh.addNode(-94.97841900277623, 22.030658722177893, 7.5, 1899)
-    femmesh.addNode(-94.39009971327236, 24.42865276920731, 5.0, 1900)
-    femmesh.addNode(-94.97841900277623, 22.030658722177893, 2.5, 1901)
-    femmesh.addNode(-95.97198626325374, 17.193831820912855, 7.499999999999999, 1902)
-    femmesh.addNode(-95.50582726427469, 19.618536096419813, 5.0, 1903)
-    femmesh.addNode(-95.97198626325374, 17.193831820912855, 2.4999999999999996, 1904)
-    femmesh.addNode(-96.71940012749266, 12.312905383294956, 7.5, 1905)
-    femmesh.addNode(-96.37659704523365, 14.758100893430004, 5.0, 1906)
-    femmesh.addNode(-96.71940012749266, 12.312905383294956, 2.5, 1907)
-    femmesh.addNode(-97.2187435937903, 7.400398235558702, 7.5, 1908)
-    femmesh.addNode(-97.00017566547697, 9.859813429604573, 5.0, 1909)
-    femmesh.addNode(-97.2187435937903, 7.400398235558702, 2.5, 1910)
-    femmesh.addNode(-97.46873592289235, 2.4689102036068826, 7.5, 1911)
-    femmesh.addNode(-97.37496374167233, 4.936237059542291, 4.999999999999999, 1912)
-    femmesh.addNode(-97.46873592289235, 2.4689102036068826, 2.5, 1913)
-    femmesh.addNode(-97.46873592289236, -2.4689102036065558, 7.5, 1914)
-    femmesh.addNode(-97.5, 1.4183640017283e-13, 5.0, 1915)
-    femmesh.addNode(-97.46873592289236, -2.4689102036065558, 2.5, 1916)
-    femmesh.addNode(-97.21874359379031, -7.400398235558376, 7.5, 1917)
-    femmesh.addNode(-97.37496374167235, -4.936237059541965, 5.0, 1918)
-    femmesh.addNode(-97.21874359379031, -7.400398235558376, 2.5, 1919)
-    femmesh.addNode(-96.7194001274927, -12.31290538329463, 7.5, 1920)
-    femmesh.addNode(-97.00017566547699, -9.859813429604293, 5.0, 1921)
-    femmesh.addNode(-96.7194001274927, -12.31290538329463, 2.5, 1922)
-    femmesh.addNode(-95.9719862632538, -17.193831820912532, 7.5, 1923)
-    femmesh.addNode(-96.37659704523371, -14.75810089342968, 5.0, 1924)
-    femmesh.addNode(-95.9719862632538, -17.193831820912532, 2.5, 1925)
-    femmesh.addNode(-94.9784190027763, -22.030658722177577, 7.5, 1926)
-    femmesh.addNode(-95.50582726427476, -19.61853609641949, 4.999999999999999, 1927)
-    femmesh.addNode(-94.9784190027763, -22.030658722177577, 2.5, 1928)
-    femmesh.addNode(-93.74124669339659, -26.81098036938898, 7.5, 1929)
-    femmesh.addNode(-94.39009971327245, -24.428652769206998, 5.0, 1930)
-    femmesh.addNode(-93.74124669339659, -26.81098036938898, 2.5, 1931)
-    femmesh.addNode(-92.26364249196534, -31.52253597213916, 7.5, 1932)
-    femmesh.addNode(-93.03227606193532, -29.176113701722763, 5.000000000000001, 1933)
-    femmesh.addNode(-92.26364249196534, -31.52253597213916, 2.5, 1934)
-    femmesh.addNode(-90.5493962261879, -36.15324111435692, 7.499999999999997, 1935)
-    femmesh.addNode(-91.43583891926508, -33.848742386242506, 5.0, 1936)
-    femmesh.addNode(-90.5493962261879, -36.15324111435692, 2.4999999999999996, 1937)
-    femmesh.addNode(-88.60290467429864, -40.69121874897762, 7.5, 1938)
-    femmesh.addNode(-89.60488290119963, -38.434554248258195, 5.0, 1939)
-    femmesh.addNode(-88.60290467429864, -40.69121874897762, 2.5, 1940)
-    femmesh.addNode(-86.42916028800045, -45.12482966074362, 7.5, 1941)
-    femmesh.addNode(-87.54410412855258, -42.92178738506988, 5.0, 1942)
-    femmesh.addNode(-86.42916028800042, -45.12482966074366, 2.5, 1943)
-    femmesh.addNode(-84.03373838759322, -49.442702319002976, 7.5, 1944)
-    femmesh.addNode(-85.25878818218484, -47.29893273325877, 5.0, 1945)
-    femmesh.addNode(-84.03373838759322, -49.442702319002976, 2.5, 1946)
-    femmesh.addNode(-81.42278286213431, -53.63376204393766, 7.5, 1947)
-    femmesh.addNode(-82.75479654630223, -51.55476358766592, 5.0, 1948)
-    femmesh.addNode(-81.42278286213433, -53.633762043937615, 2.4999999999999996, 1949)
-    femmesh.addNode(-78.60299041130705, -57.68725941141571, 7.5, 1950)
-    femmesh.addNode(-80.03855157464906, -55.67836439616598, 5.0, 1951)
-    femmesh.addNode(-78.6029904113071, -57.687259411415646, 2.500000000000006, 1952)
-    femmesh.addNode(-75.58159336941532, -61.59279782361209, 7.5, 1953)
-    femmesh.addNode(-77.11702001815772, -59.659158756380926, 5.0, 1954)
-    femmesh.addNode(-75.58159336941532, -61.59279782361209, 2.5, 1955)
-    femmesh.addNode(-72.36634115555732, -65.34036017468446, 7.5, 1956)
-    femmesh.addNode(-73.99769515630328, -63.48693654252667, 5.0, 1957)
-    femmesh.addNode(-72.36634115555732, -65.34036017468446, 2.5, 1958)
-    femmesh.addNode(-68.96548039755668, -68.92033454311019, 7.5, 1959)
-    femmesh.addNode(-70.68857757799319, -67.15188009281677, 5.0, 1960)
-    femmesh.addNode(-68.96548039755668, -68.92033454311019, 2.5, 1961)
-    femmesh.addNode(-65.38773378062928, -72.32353884478796, 7.5, 1962)
-    femmesh.addNode(-67.19815466128601, -70.64458939025612, 5.0, 1963)
-    femmesh.addNode(-65.38773378062928, -72.32353884478796, 2.5, 1964)
-    femmesh.addNode(-61.64227767503611, -75.54124438367258, 7.5, 1965)
-    femmesh.addNode(-63.53537880457125, -73.95610617224003, 5.0, 1966)
-    femmesh.addNode(-61.64227767503611, -75.54124438367258, 2.5, 1967)
-    femmesh.addNode(-57.738718600103844, -78.56519823953876, 7.5, 1968)
-    femmesh.addNode(-59.70964446504306, -77.07793690712118, 5.0, 1969)
-    femmesh.addNode(-57.738718600103844, -78.56519823953876, 2.5, 1970)
-    femmesh.addNode(-53.687068584978945, -81.38764443545327, 7.5, 1971)
-    femmesh.addNode(-55.73076406336134, -80.00207457881297, 5.0, 1972)
-    femmesh.addNode(-53.687068584978945, -81.38764443545327, 2.5, 1973)
-    femmesh.addNode(-49.497719489311564, -84.00134383066396, 7.500000000000001, 1974)
-    femmesh.addNode(-51.60894281630067, -82.72101922355532, 5.0, 1975)
-    femmesh.addNode(-49.497719489311564, -84.00134383066396, 2.5, 1976)
-    femmesh.addNode(-45.18141634973247, -86.39959268788324, 7.5, 1977)
-    femmesh.addNode(-47.3547525619375, -85.22779716616918, 5.0, 1978)
-    femmesh.addNode(-45.18141634973247, -86.39959268788324, 2.5, 1979)
-    femmesh.addNode(-40.74922982048538, -88.57623986734401, 7.5, 1980)
-    femmesh.addNode(-42.979104644510194, -87.51597890646165, 5.0, 1981)
-    femmesh.addNode(-40.74922982048538, -88.57623986734401, 2.5, 1982)
-    femmesh.addNode(-36.21252777890009, -90.52570260352796, 7.5, 1983)
-    femmesh.addNode(-38.4932219284978, -89.57969560990601, 5.0, 1984)
-    femmesh.addNode(-36.21252777890009, -90.52570260352796, 2.5, 1985)
-    femmesh.addNode(-31.58294616853408, -92.24298082410108, 7.5, 1986)
-    femmesh.addNode(-33.908610013697405, -91.41365416030025, 5.0, 1987)
-    femmesh.addNode(-31.58294616853408, -92.24298082410108, 2.5, 1988)
-    femmesh.addNode(-26.872359154765455, -93.72366997433089, 7.5, 1989)
-    femmesh.addNode(-29.237027725128705, -93.01315073579678, 5.0, 1990)
-    femmesh.addNode(-26.872359154765455, -93.72366997433089, 2.5, 1991)
-    femmesh.addNode(-22.092848669383514, -94.96397231409246, 7.5, 1992)
-    femmesh.addNode(-24.490456953454935, -94.37408287348265, 5.0, 1993)
-    femmesh.addNode(-22.092848669383514, -94.96397231409246, 2.5, 1994)
-    femmesh.addNode(-17.25667342229042, -95.96070665848818, 7.5, 1995)
-    femmesh.addNode(-19.68107192327461, -95.49295999156635, 5.0, 1996)
-    femmesh.addNode(-17.25667342229042, -95.96070665848818, 2.5, 1997)
-    femmesh.addNode(-12.376237459794131, -96.71131653709811, 7.5, 1998)
-    femmesh.addNode(-14.82120796810631, -96.36691234218384, 5.0, 1999)
-    femmesh.addNode(-12.376237459794131, -96.71131653709811, 2.5, 2000)
-    femmesh.addNode(-5.0, -90.18853304210681, 5.094971544492571, 2001)
-    femmesh.addNode(-5.0, 54.92763154760371, 5.0, 2002)
-    femmesh.addNode(-5.0, -4.9934210497823415, 5.0, 2003)
-    femmesh.addNode(-5.0, 64.91447364716791, 5.0, 2004)
-    femmesh.addNode(-5.0, 90.18853304210663, 5.094971544492484, 2005)
-    femmesh.addNode(-5.0, -30.030610844848923, 5.1049884944115735, 2006)
-    femmesh.addNode(-5.0, 44.870704901883556, 5.1049884944115504, 2007)
-    femmesh.addNode(-5.0, 19.973684199128613, 5.0, 2008)
-    femmesh.addNode(-5.0, -45.04591626727327, 5.122486576813504, 2009)
-    femmesh.addNode(-5.0, -60.026179416619755, 5.122486576813504, 2010)
-    femmesh.addNode(-5.0, 29.925484025614963, 5.017498082401989, 2011)
-    femmesh.addNode(-5.0, -74.90131574673262, 5.0, 2012)
-    femmesh.addNode(-5.0, -19.9035996529731, 5.1049884944115735, 2013)
-    femmesh.addNode(-5.0, 9.916757553408416, 5.104988494411548, 2014)
-    femmesh.addNode(-5.0, 74.8662734736543, 4.9825019175981025, 2015)
-    femmesh.addNode(-5.0, 84.90427459755665, 4.893342013935278, 2016)
-    femmesh.addNode(-5.0, 4.946698019011492, 4.895011505588423, 2017)
-    femmesh.addNode(-5.0, -84.90427459755702, 4.8933420139352615, 2018)
-    femmesh.addNode(-5.0, -49.98677390743862, 5.142901006282422, 2019)
-    femmesh.addNode(-5.0, -35.00067037924582, 5.139984659215433, 2020)
-    femmesh.addNode(-5.0, -64.9670370567851, 5.1429010062824165, 2021)
-    femmesh.addNode(-5.0, -14.933540118576161, 4.895011505588428, 2022)
-    femmesh.addNode(-5.0, 39.90064536748662, 5.139984659215445, 2023)
-    femmesh.addNode(-5.0, 49.92252974012885, 5.017498082401925, 2024)
-    femmesh.addNode(-5.0, 14.968582391653712, 5.017498082401924, 2025)
-    femmesh.addNode(-5.0, 24.961264870064355, 5.002916347066998, 2026)
-    femmesh.addNode(-5.0, -24.96710524891101, 5.034996164803857, 2027)
-    femmesh.addNode(-5.0, 59.92105259738577, 5.0, 2028)
-    femmesh.addNode(-5.0, 69.90205431810375, 4.997083652933017, 2029)
-    femmesh.addNode(-5.0, 79.8915825428781, 4.97930732192223, 2030)
-    femmesh.addNode(-5.0, -9.979054927769411, 4.982501917598071, 2031)
-    femmesh.addNode(-5.0, -79.8974229217248, 4.98222366898921, 2032)
-    femmesh.addNode(-5.0, -54.95391325241237, 5.044231263849321, 2033)
-    femmesh.addNode(-5.0, -0.007787171795257564, 4.98250191759807, 2034)
-    femmesh.addNode(-5.0, -69.91665526521993, 5.023816834380402, 2035)
-    femmesh.addNode(-5.0, -39.9726767065915, 5.0437452060048225, 2036)
-    femmesh.addNode(-5.0, 34.94031979783358, 5.026247123602905, 2037)
-    femmesh.addNode(-5.0, -93.82112677702426, 3.670984687479204, 2038)
-    femmesh.addNode(-5.0, 93.82112677702435, 3.670984687478688, 2039)
-    femmesh.addNode(-5.0, 94.226274036321, 6.753191246394235, 2040)
-    femmesh.addNode(-5.0, -94.22627403632117, 6.753191246394355, 2041)
-    femmesh.addNode(7.481740346109677, 97.21251751391584, 2.5000000000000817, 2042)
-    femmesh.addNode(9.923329892153594, 96.99369837186069, 5.0, 2043)
-    femmesh.addNode(7.481740346109802, -97.21251751391584, 7.499999999999936, 2044)
-    femmesh.addNode(12.376237459794183, -96.71131653709811, 7.5, 2045)
-    femmesh.addNode(9.923329892154063, -96.99369837186065, 4.999999999999934, 2046)
-    femmesh.addNode(7.481740346110109, 97.2125175139158, 7.499999999999999, 2047)
-    femmesh.addNode(7.481740346110234, -97.2125175139158, 2.4999999999999543, 2048)
-    femmesh.addNode(12.376237459794183, -96.71131653709811, 2.5, 2049)
-    femmesh.addNode(17.25667342229047, -95.96070665848816, 7.5, 2050)
-    femmesh.addNode(14.82120796810636, -96.36691234218382, 5.0, 2051)
-    femmesh.addNode(17.25667342229047, -95.96070665848816, 2.5, 2052)
-    femmesh.addNode(22.092848669383564, -94.96397231409246, 7.5, 2053)
-    femmesh.addNode(19.68107192327466, -95.49295999156634, 5.0, 2054)
-    femmesh.addNode(22.092848669383564, -94.96397231409246, 2.5, 2055)
-    femmesh.addNode(26.872359154765505, -93.72366997433087, 7.5, 2056)
-    femmesh.addNode(24.490456953454984, -94.37408287348264, 5.0, 2057)
-    femmesh.addNode(26.872359154765505, -93.72366997433087, 2.5, 2058)
-    femmesh.addNode(31.58294616853413, -92.24298082410105, 7.5, 2059)
-    femmesh.addNode(29.237027725128755, -93.01315073579677, 5.0, 2060)
-    femmesh.addNode(31.58294616853413, -92.24298082410105, 2.5, 2061)
-    femmesh.addNode(36.21252777890014, -90.52570260352795, 7.5, 2062)
-    femmesh.addNode(33.908610013697455, -91.41365416030024, 5.0, 2063)
-    femmesh.addNode(36.21252777890014, -90.52570260352795, 2.5, 2064)
-    femmesh.addNode(40.749229820485425, -88.576239867344, 7.5, 2065)
-    femmesh.addNode(38.49322192849785, -89.579695609906, 5.0, 2066)
-    femmesh.addNode(40.749229820485425, -88.576239867344, 2.5, 2067)
-    femmesh.addNode(45.181416349732515, -86.39959268788321, 7.5, 2068)
-    femmesh.addNode(42.97910464451024, -87.51597890646164, 5.0, 2069)
-    femmesh.addNode(45.181416349732515, -86.39959268788321, 2.5, 2070)
-    femmesh.addNode(49.497719489311606, -84.00134383066394, 7.5, 2071)
-    femmesh.addNode(47.354752561937545, -85.22779716616914, 5.0, 2072)
-    femmesh.addNode(49.497719489311606, -84.00134383066394, 2.5, 2073)
-    femmesh.addNode(53.68706858497899, -81.38764443545324, 7.5, 2074)
-    femmesh.addNode(51.60894281630071, -82.72101922355529, 5.0, 2075)
-    femmesh.addNode(53.68706858497899, -81.38764443545324, 2.5, 2076)
-    femmesh.addNode(57.73871860010388, -78.56519823953872, 7.5, 2077)
-    femmesh.addNode(55.730764063361384, -80.00207457881294, 5.0, 2078)
-    femmesh.addNode(57.73871860010388, -78.56519823953872, 2.5, 2079)
-    femmesh.addNode(61.64227767503615, -75.54124438367255, 7.5, 2080)
-    femmesh.addNode(59.70964446504309, -77.07793690712114, 5.0, 2081)
-    femmesh.addNode(61.64227767503615, -75.54124438367255, 2.5, 2082)
-    femmesh.addNode(65.3877337806293, -72.32353884478792, 7.5, 2083)
-    femmesh.addNode(63.535378804571295, -73.95610617223998, 5.0, 2084)
-    femmesh.addNode(65.3877337806293, -72.32353884478792, 2.5, 2085)
-    femmesh.addNode(68.96548039755673, -68.92033454311013, 7.5, 2086)
-    femmesh.addNode(67.19815466128607, -70.64458939025604, 5.000000000000001, 2087)
-    femmesh.addNode(68.96548039755673, -68.92033454311013, 2.5, 2088)
-    femmesh.addNode(72.36634115555738, -65.34036017468439, 7.5, 2089)
-    femmesh.addNode(70.68857757799324, -67.1518800928167, 5.0, 2090)
-    femmesh.addNode(72.36634115555738, -65.34036017468439, 2.5, 2091)
-    femmesh.addNode(75.58159336941539, -61.59279782361201, 7.5, 2092)
-    femmesh.addNode(73.99769515630335, -63.4869365425266, 5.0, 2093)
-    femmesh.addNode(75.58159336941539, -61.59279782361201, 2.5, 2094)
-    femmesh.addNode(78.60299041130715, -57.6872594114156, 7.5, 2095)
-    femmesh.addNode(77.11702001815776, -59.659158756380855, 5.0, 2096)
-    femmesh.addNode(78.60299041130715, -57.6872594114156, 2.5, 2097)
-    femmesh.addNode(81.42278286213438, -53.633762043937544, 7.5, 2098)
-    femmesh.addNode(80.0385515746491, -55.678364396165904, 5.0, 2099)
-    femmesh.addNode(81.42278286213438, -53.633762043937544, 2.5, 2100)
-    femmesh.addNode(84.03373838759327, -49.442702319002855, 7.5, 2101)
-    femmesh.addNode(82.7547965463023, -51.5547635876658, 5.0, 2102)
-    femmesh.addNode(84.03373838759327, -49.442702319002855, 2.5, 2103)
-    femmesh.addNode(86.42916028800049, -45.124829660743536, 7.5, 2104)
-    femmesh.addNode(85.2587881821849, -47.29893273325865, 5.0, 2105)
-    femmesh.addNode(86.42916028800049, -45.124829660743536, 2.5, 2106)
-    femmesh.addNode(88.6029046742987, -40.69121874897749, 7.5, 2107)
-    femmesh.addNode(87.54410412855262, -42.92178738506979, 5.0, 2108)
-    femmesh.addNode(88.6029046742987, -40.69121874897749, 2.5, 2109)
-    femmesh.addNode(90.54939622618795, -36.153241114356796, 7.5, 2110)
-    femmesh.addNode(89.60488290119969, -38.434554248258074, 5.0, 2111)
-    femmesh.addNode(90.54939622618795, -36.153241114356796, 2.5, 2112)
-    femmesh.addNode(92.26364249196538, -31.52253597213903, 7.5, 2113)
-    femmesh.addNode(91.43583891926512, -33.84874238624238, 5.0, 2114)
-    femmesh.addNode(92.26364249196538, -31.52253597213903, 2.5, 2115)
-    femmesh.addNode(93.74124669339663, -26.810980369388847, 7.5, 2116)
-    femmesh.addNode(93.03227606193538, -29.17611370172263, 5.0, 2117)
-    femmesh.addNode(93.74124669339663, -26.810980369388847, 2.5, 2118)
-    femmesh.addNode(94.97841900277635, -22.030658722177442, 7.5, 2119)
-    femmesh.addNode(94.39009971327249, -24.428652769206863, 5.0, 2120)
-    femmesh.addNode(94.97841900277635, -22.030658722177442, 2.5, 2121)
-    femmesh.addNode(95.97198626325383, -17.193831820912397, 7.5, 2122)
-    femmesh.addNode(95.50582726427477, -19.618536096419355, 5.0, 2123)
-    femmesh.addNode(95.97198626325383, -17.193831820912397, 2.5, 2124)
-    femmesh.addNode(96.7194001274927, -12.312905383294495, 7.5, 2125)
-    femmesh.addNode(96.37659704523374, -14.758100893429544, 5.0, 2126)
-    femmesh.addNode(96.7194001274927, -12.312905383294495, 2.5, 2127)
-    femmesh.addNode(97.21874359379031, -7.400398235558327, 7.499999999999992, 2128)
-    femmesh.addNode(97.00017566547702, -9.859813429604113, 5.0, 2129)
-    femmesh.addNode(97.21874359379031, -7.400398235558327, 2.500000000000014, 2130)
-    femmesh.addNode(97.46873592289236, -2.4689102036065917, 7.5, 2131)
-    femmesh.addNode(97.37496374167235, -4.936237059541915, 5.000000000000011, 2132)
-    femmesh.addNode(97.46873592289236, -2.468910203606505, 2.5, 2133)
-    femmesh.addNode(97.46873592289235, 2.468910203606803, 7.5, 2134)
-    femmesh.addNode(97.5, 1.4931417925815102e-13, 5.0, 2135)
-    femmesh.addNode(97.46873592289235, 2.4689102036068897, 2.5, 2136)
-    femmesh.addNode(97.2187435937903, 7.400398235558537, 7.5, 2137)
-    femmesh.addNode(97.37496374167233, 4.936237059542212, 4.999999999999989, 2138)
-    femmesh.addNode(97.2187435937903, 7.400398235558537, 2.5, 2139)
-    femmesh.addNode(96.71940012749268, 12.31290538329479, 7.5, 2140)
-    femmesh.addNode(97.00017566547697, 9.85981342960441, 5.0, 2141)
-    femmesh.addNode(96.71940012749268, 12.31290538329479, 2.5, 2142)
-    femmesh.addNode(95.97198626325377, 17.193831820912692, 7.5, 2143)
-    femmesh.addNode(96.37659704523368, 14.75810089342984, 4.999999999999999, 2144)
-    femmesh.addNode(95.97198626325377, 17.193831820912692, 2.5, 2145)
-    femmesh.addNode(94.97841900277626, 22.030658722177815, 7.5, 2146)
-    femmesh.addNode(95.5058272642747, 19.618536096419735, 5.0, 2147)
-    femmesh.addNode(94.97841900277626, 22.030658722177815, 2.5, 2148)
-    femmesh.addNode(93.74124669339653, 26.810980369389217, 7.5, 2149)
-    femmesh.addNode(94.39009971327239, 24.428652769207236, 5.0, 2150)
-    femmesh.addNode(93.74124669339653, 26.810980369389217, 2.5, 2151)
-    femmesh.addNode(92.26364249196526, 31.522535972139398, 7.5, 2152)
-    femmesh.addNode(93.03227606193525, 29.176113701722993, 5.0, 2153)
-    femmesh.addNode(92.26364249196526, 31.522535972139398, 2.5, 2154)
-    femmesh.addNode(90.54939622618781, 36.15324111435716, 7.499999999999998, 2155)
-    femmesh.addNode(91.435838919265, 33.84874238624274, 5.0, 2156)
-    femmesh.addNode(90.54939622618781, 36.15324111435716, 2.5, 2157)
-    femmesh.addNode(88.60290467429854, 40.691218748977846, 7.5, 2158)
-    femmesh.addNode(89.60488290119953, 38.43455424825843, 5.0, 2159)
-    femmesh.addNode(88.60290467429854, 40.691218748977846, 2.5, 2160)
-    femmesh.addNode(86.4291602880003, 45.12482966074388, 7.5, 2161)
-    femmesh.addNode(87.54410412855245, 42.92178738507014, 5.0, 2162)
-    femmesh.addNode(86.4291602880003, 45.12482966074388, 2.5, 2163)
-    femmesh.addNode(84.03373838759309, 49.442702319003196, 7.5, 2164)
-    femmesh.addNode(85.25878818218473, 47.298932733258994, 5.0, 2165)
-    femmesh.addNode(84.03373838759309, 49.442702319003196, 2.5, 2166)
-    femmesh.addNode(81.42278286213417, 53.633762043937864, 7.5, 2167)
-    femmesh.addNode(82.7547965463021, 51.55476358766613, 5.0, 2168)
-    femmesh.addNode(81.42278286213417, 53.633762043937864, 2.5, 2169)
-    femmesh.addNode(78.60299041130692, 57.687259411415916, 7.5, 2170)
-    femmesh.addNode(80.03855157464889, 55.67836439616622, 5.0, 2171)
-    femmesh.addNode(78.60299041130692, 57.687259411415916, 2.5, 2172)
-    femmesh.addNode(75.58159336941513, 61.592797823612315, 7.5, 2173)
-    femmesh.addNode(77.11702001815753, 59.65915875638115, 5.0, 2174)
-    femmesh.addNode(75.58159336941513, 61.592797823612315, 2.5, 2175)
-    femmesh.addNode(72.36634115555712, 65.34036017468468, 7.5, 2176)
-    femmesh.addNode(73.99769515630311, 63.48693654252689, 5.0, 2177)
-    femmesh.addNode(72.36634115555712, 65.34036017468468, 2.5, 2178)
-    femmesh.addNode(68.96548039755646, 68.9203345431104, 7.5, 2179)
-    femmesh.addNode(70.68857757799297, 67.15188009281697, 5.0, 2180)
-    femmesh.addNode(68.96548039755646, 68.9203345431104, 2.5, 2181)
-    femmesh.addNode(65.38773378062903, 72.32353884478819, 7.499999999999998, 2182)
-    femmesh.addNode(67.19815466128578, 70.64458939025631, 5.0, 2183)
-    femmesh.addNode(65.38773378062903, 72.32353884478819, 2.5, 2184)
-    femmesh.addNode(61.64227767503586, 75.5412443836728, 7.5, 2185)
-    femmesh.addNode(63.535378804571, 73.95610617224024, 5.0, 2186)
-    femmesh.addNode(61.64227767503586, 75.5412443836728, 2.5, 2187)
-    femmesh.addNode(57.738718600103574, 78.56519823953894, 7.5, 2188)
-    femmesh.addNode(59.70964446504279, 77.07793690712138, 5.0, 2189)
-    femmesh.addNode(57.738718600103574, 78.56519823953894, 2.5, 2190)
-    femmesh.addNode(53.68706858497874, 81.3876444354534, 7.5, 2191)
-    femmesh.addNode(55.73076406336107, 80.00207457881315, 5.0, 2192)
-    femmesh.addNode(53.68706858497874, 81.3876444354534, 2.5, 2193)
-    femmesh.addNode(49.49771948931135, 84.00134383066408, 7.5, 2194)
-    femmesh.addNode(51.60894281630046, 82.72101922355544, 5.0, 2195)
-    femmesh.addNode(49.49771948931135, 84.00134383066408, 2.5, 2196)
-    femmesh.addNode(45.181416349732245, 86.39959268788336, 7.499999999999999, 2197)
-    femmesh.addNode(47.35475256193728, 85.2277971661693, 5.0, 2198)
-    femmesh.addNode(45.181416349732245, 86.39959268788336, 2.4999999999999996, 2199)
-    femmesh.addNode(40.749229820485155, 88.57623986734413, 7.5, 2200)
-    femmesh.addNode(42.979104644509974, 87.51597890646177, 5.0, 2201)
-    femmesh.addNode(40.749229820485155, 88.57623986734413, 2.5, 2202)
-    femmesh.addNode(36.21252777889986, 90.52570260352806, 7.5, 2203)
-    femmesh.addNode(38.493221928497576, 89.57969560990611, 5.0, 2204)
-    femmesh.addNode(36.21252777889986, 90.52570260352806, 2.5, 2205)
-    femmesh.addNode(31.582946168533848, 92.24298082410115, 7.5, 2206)
-    femmesh.addNode(33.90861001369717, 91.41365416030034, 5.0, 2207)
-    femmesh.addNode(31.582946168533848, 92.24298082410115, 2.5, 2208)
-    femmesh.addNode(26.872359154765217, 93.72366997433096, 7.5, 2209)
-    femmesh.addNode(29.237027725128467, 93.01315073579687, 5.0, 2210)
-    femmesh.addNode(26.872359154765217, 93.72366997433096, 2.5, 2211)
-    femmesh.addNode(22.092848669383272, 94.96397231409252, 7.5, 2212)
-    femmesh.addNode(24.490456953454697, 94.3740828734827, 5.0, 2213)
-    femmesh.addNode(22.092848669383272, 94.96397231409252, 2.5, 2214)
-    femmesh.addNode(17.256673422290174, 95.96070665848822, 7.5, 2215)
-    femmesh.addNode(19.68107192327437, 95.49295999156641, 5.0, 2216)
-    femmesh.addNode(17.256673422290174, 95.96070665848822, 2.5, 2217)
-    femmesh.addNode(12.376237459793886, 96.71131653709814, 7.5, 2218)
-    femmesh.addNode(14.821207968106066, 96.36691234218387, 5.0, 2219)
-    femmesh.addNode(12.376237459793886, 96.71131653709814, 2.5, 2220)
-    femmesh.addNode(5.0, 74.9013157467322, 5.0, 2221)
-    femmesh.addNode(5.0, 64.91447364716808, 5.0, 2222)
-    femmesh.addNode(5.0, 34.95394734847497, 5.0, 2223)
-    femmesh.addNode(5.0, 44.94078944803934, 5.000000000000007, 2224)
-    femmesh.addNode(5.0, 54.92763154760371, 5.000000000000003, 2225)
-    femmesh.addNode(5.0, 84.95824239245218, 5.1049884944115895, 2226)
-    femmesh.addNode(5.0, -90.23144194791644, 5.159250214540474, 2227)
-    femmesh.addNode(5.0, -69.90789469695044, 5.0, 2228)
-    femmesh.addNode(5.0, -59.92105259738611, 5.0, 2229)
-    femmesh.addNode(5.0, -29.96052629869314, 5.0, 2230)
-    femmesh.addNode(5.0, -20.00872647220669, 5.017498082401937, 2231)
-    femmesh.addNode(5.0, -5.063505595938111, 5.104988494411592, 2232)
-    femmesh.addNode(5.0, -39.94736839825747, 5.000000000000003, 2233)
-    femmesh.addNode(5.0, 4.993421049781986, 5.0, 2234)
-    femmesh.addNode(5.0, 24.967105248910585, 5.0, 2235)
-    femmesh.addNode(5.0, -79.89473679651476, 5.0, 2236)
-    femmesh.addNode(5.0, -49.93421049782178, 5.000000000000002, 2237)
-    femmesh.addNode(5.0, 14.980263149346243, 5.0, 2238)
-    femmesh.addNode(5.0, 90.39513847423186, 5.101686242875829, 2239)
-    femmesh.addNode(5.0, -10.033565130335006, 5.139984659215445, 2240)
-    femmesh.addNode(5.0, 49.934210497821454, 5.000000000000002, 2241)
-    femmesh.addNode(5.0, 29.96052629869277, 5.0, 2242)
-    femmesh.addNode(5.0, 39.94736839825714, 5.000000000000001, 2243)
-    femmesh.addNode(5.0, -24.972945627757298, 5.002916347066989, 2244)
-    femmesh.addNode(5.0, 59.921052597385795, 5.0, 2245)
-    femmesh.addNode(5.0, -54.92763154760395, 5.0, 2246)
-    femmesh.addNode(5.0, -84.94646835493648, 5.026541702423412, 2247)
-    femmesh.addNode(5.0, -64.91447364716828, 5.0, 2248)
-    femmesh.addNode(5.0, -34.95394734847531, 5.0, 2249)
-    femmesh.addNode(5.0, -74.90131574673259, 5.0, 2250)
-    femmesh.addNode(5.0, 19.973684199128456, 5.0, 2251)
-    femmesh.addNode(5.0, -0.011680757692815291, 5.017498082401932, 2252)
-    femmesh.addNode(5.0, -44.940789448039624, 5.000000000000001, 2253)
-    femmesh.addNode(5.0, 9.986842099564129, 5.0, 2254)
-    femmesh.addNode(5.0, 69.90789469695008, 5.0, 2255)
-    femmesh.addNode(5.0, 79.906417554207, 5.017498082401931, 2256)
-    femmesh.addNode(5.0, -14.993890699988057, 5.0262471236028965, 2257)
-    femmesh.addNode(5.0, -93.8233606850735, 3.674331140522103, 2258)
-    femmesh.addNode(5.0, 93.9814667438041, 3.510084682257441, 2259)
-    femmesh.addNode(5.0, 94.37061000828385, 6.892668627718211, 2260)
-    femmesh.addNode(5.0, -94.23530259909293, 6.766716271012516, 2261)
-    femmesh.addNode(102.46918662808096, 2.513123908507805, 27.5, 2262)
-    femmesh.addNode(102.22655907551405, 7.4820197527430174, 27.5, 2263)
-    femmesh.addNode(102.37844066218436, 4.990479694337564, 25.0, 2264)
-    femmesh.addNode(102.46918662808096, 2.513123908507805, 22.5, 2265)
-    femmesh.addNode(102.46918662808096, -2.5131239085076476, 22.500000000000046, 2266)
-    femmesh.addNode(102.37844066218437, -4.9904796943372505, 25.0, 2267)
-    femmesh.addNode(102.22655907551405, 7.4820197527430174, 22.5, 2268)
-    femmesh.addNode(102.46918662808096, -2.5131239085077386, 27.5, 2269)
-    femmesh.addNode(101.74104238793271, 12.450313000759458, 27.5, 2270)
-    femmesh.addNode(102.01405097405667, 9.969122522196567, 25.0, 2271)
-    femmesh.addNode(101.74104238793271, 12.450313000759458, 22.5, 2272)
-    femmesh.addNode(101.01420718832503, 17.38907548186917, 27.5, 2273)
-    femmesh.addNode(101.4076952276988, 14.92411969283799, 25.0, 2274)
-    femmesh.addNode(101.01420718832503, 17.38907548186917, 22.5, 2275)
-    femmesh.addNode(100.04777744948254, 22.286592997109576, 27.5, 2276)
-    femmesh.addNode(100.56081163194992, 19.84371850040931, 25.0, 2277)
-    femmesh.addNode(100.04777744948254, 22.286592997109576, 22.5, 2278)
-    femmesh.addNode(98.84404543597302, 27.131249176020315, 27.5, 2279)
-    femmesh.addNode(99.47540890113405, 24.71625020006434, 25.0, 2280)
-    femmesh.addNode(98.84404543597302, 27.131249176020315, 22.5, 2281)
-    femmesh.addNode(97.40586626714222, 31.9115530293906, 27.5, 2282)
-    femmesh.addNode(98.15406149061162, 29.53015768493683, 25.0, 2283)
-    femmesh.addNode(97.4058662671422, 31.911553029390607, 22.5, 2284)
-    femmesh.addNode(95.73665114508619, 36.616166204616086, 27.5, 2285)
-    femmesh.addNode(96.59990349045574, 34.27402289832108, 25.0, 2286)
-    femmesh.addNode(95.73665114508619, 36.616166204616086, 22.5, 2287)
-    femmesh.addNode(93.84035926365682, 41.23392987901854, 27.5, 2288)
-    femmesh.addNode(94.81662119173684, 38.93659391604098, 25.0, 2289)
-    femmesh.addNode(93.84035926365682, 41.23392987901854, 22.5, 2290)
-    femmesh.addNode(91.72148841769142, 45.753891227340404, 27.5, 2291)
-    femmesh.addNode(92.80844434304754, 43.50681163477103, 25.0, 2292)
-    femmesh.addNode(91.72148841769142, 45.753891227340404, 22.5, 2293)
-    femmesh.addNode(89.38506433474029, 50.165329400636246, 27.5, 2294)
-    femmesh.addNode(90.58013611800622, 47.973836003007555, 25.0, 2295)
-    femmesh.addNode(89.38506433474029, 50.165329400636246, 22.5, 2296)
-    femmesh.addNode(86.83662875459619, 54.457780954941946, 27.5, 2297)
-    femmesh.addNode(88.13698181753554, 52.32707173247332, 25.0, 2298)
-    femmesh.addNode(86.83662875459619, 54.457780954941946, 22.5, 2299)
-    femmesh.addNode(84.08222628489989, 58.621064669407794, 27.5, 2300)
-    femmesh.addNode(85.4847763337125, 56.556193428970694, 25.0, 2301)
-    femmesh.addNode(84.08222628489989, 58.621064669407794, 22.5, 2302)
-    femmesh.addNode(81.12839006399857, 62.64530569502953, 27.5, 2303)
-    femmesh.addNode(82.6298104049247, 60.65117008307587, 25.0, 2304)
-    femmesh.addNode(81.12839006399857, 62.64530569502953, 22.5, 2305)
-    femmesh.addNode(77.98212626506353, 66.52095897669915, 27.5, 2306)
-    femmesh.addNode(79.57885569493389, 64.60228886258511, 25.0, 2307)
-    femmesh.addNode(77.98212626506353, 66.52095897669915, 22.5, 2308)
-    femmesh.addNode(74.65089747822141, 70.23883189302109, 27.5, 2309)
-    femmesh.addNode(76.33914873123767, 68.40017815027952, 25.0, 2310)
-    femmesh.addNode(74.65089747822141, 70.23883189302109, 22.5, 2311)
-    femmesh.addNode(71.142605010115, 73.79010606019455, 27.5, 2312)
-    femmesh.addNode(72.91837374082576, 72.03582977236573, 25.0, 2313)
-    femmesh.addNode(71.142605010115, 73.79010606019455, 22.5, 2314)
-    femmesh.addNode(67.4655701428767, 77.1663582482456, 27.5, 2315)
-    femmesh.addNode(69.32464442404257, 75.50062036486894, 25.0, 2316)
-    femmesh.addNode(67.4655701428767, 77.1663582482456, 22.5, 2317)
-    femmesh.addNode(63.62851439696674, 80.35958035999812, 27.5, 2318)
-    femmesh.addNode(65.5664847097864, 78.7863318272995, 25.0, 2319)
-    femmesh.addNode(63.62851439696674, 80.35958035999812, 22.5, 2320)
-    femmesh.addNode(59.64053884469019, 83.36219842539543, 27.5, 2321)
-    femmesh.addNode(61.65280853769175, 81.88517081507935, 25.0, 2322)
-    femmesh.addNode(59.64053884469019, 83.36219842539543, 22.5, 2323)
-    femmesh.addNode(55.511102523458945, 86.1670905661206, 27.5, 2324)
-    femmesh.addNode(57.592898715249476, 84.78978722449429, 25.0, 2325)
-    femmesh.addNode(55.511102523458945, 86.1670905661206, 22.5, 2326)
-    femmesh.addNode(51.250000000000036, 88.76760388790494, 27.5, 2327)
-    femmesh.addNode(53.396384900012876, 87.493291626328, 25.0, 2328)
-    femmesh.addNode(51.250000000000036, 88.76760388790494, 22.5, 2329)
-    femmesh.addNode(46.86733813872548, 91.15757026045817, 27.5, 2330)
-    femmesh.addNode(49.07322075911397, 89.98927160682692, 25.0, 2331)
-    femmesh.addNode(46.86733813872548, 91.15757026045817, 22.5, 2332)
-    femmesh.addNode(42.37351212936654, 93.331320947592, 27.5, 2333)
-    femmesh.addNode(44.63366036026462, 92.27180697723733, 25.0, 2334)
-    femmesh.addNode(42.37351212936654, 93.331320947592, 22.5, 2335)
-    femmesh.addNode(37.77918083073209, 95.28370005283614, 27.5, 2336)
-    femmesh.addNode(40.08823385024101, 94.33548381583883, 25.0, 2337)
-    femmesh.addNode(37.77918083073209, 95.28370005283614, 22.5, 2338)
-    femmesh.addNode(33.095241489073224, 97.01007674865497, 27.5, 2339)
-    femmesh.addNode(35.44772247853867, 96.17540730916872, 25.0, 2340)
-    femmesh.addNode(33.095241489073224, 97.01007674865497, 22.5, 2341)
-    femmesh.addNode(28.332803891019083, 98.50635626025893, 27.5, 2342)
-    femmesh.addNode(30.723133025439985, 97.78721336197856, 25.0, 2343)
-    femmesh.addNode(28.332803891019083, 98.50635626025893, 22.5, 2344)
-    femmesh.addNode(23.50316401239025, 99.76898957795795, 27.5, 2345)
-    femmesh.addNode(25.92567169514729, 99.16707894838608, 25.0, 2346)
-    femmesh.addNode(23.50316401239023, 99.76898957795797, 22.5, 2347)
-    femmesh.addNode(18.617777225392242, 100.79498187502027, 27.499999999999996, 2348)
-    femmesh.addNode(21.066717535904573, 100.31173117967016, 25.0, 2349)
-    femmesh.addNode(18.617777225392242, 100.79498187502027, 22.5, 2350)
-    femmesh.addNode(13.688231127738293, 101.58189961107055, 27.5, 2351)
-    femmesh.addNode(16.157795450152317, 101.21845506720125, 25.0, 2352)
-    femmesh.addNode(13.688231127738293, 101.58189961107055, 22.5, 2353)
-    femmesh.addNode(8.726218058147657, 102.12787630417886, 27.5, 2354)
-    femmesh.addNode(11.210548858732139, 101.88509996209446, 25.0, 2355)
-    femmesh.addNode(8.726218058147657, 102.12787630417886, 22.5, 2356)
-    femmesh.addNode(3.743507363410032, 102.43161695794954, 27.5, 2357)
-    femmesh.addNode(6.236712083978917, 102.31008465631115, 25.0, 2358)
-    femmesh.addNode(3.7435073634100093, 102.43161695794954, 22.5, 2359)
-    femmesh.addNode(-1.248082517204747, 102.49240113310961, 27.5, 2360)
-    femmesh.addNode(1.2480825172047367, 102.49240113310961, 25.0, 2361)
-    femmesh.addNode(-1.2480825172047925, 102.49240113310961, 22.5, 2362)
-    femmesh.addNode(-6.23671208397895, 102.31008465631113, 27.5, 2363)
-    femmesh.addNode(-3.743507363410042, 102.43161695794954, 25.0, 2364)
-    femmesh.addNode(-6.23671208397895, 102.31008465631113, 22.5, 2365)
-    femmesh.addNode(-11.21054885873217, 101.88509996209446, 27.5, 2366)
-    femmesh.addNode(-8.72621805814769, 102.12787630417886, 25.0, 2367)
-    femmesh.addNode(-11.21054885873217, 101.88509996209446, 22.5, 2368)
-    femmesh.addNode(-16.15779545015235, 101.21845506720123, 27.499999999999996, 2369)
-    femmesh.addNode(-13.688231127738348, 101.58189961107055, 25.0, 2370)
-    femmesh.addNode(-16.15779545015235, 101.21845506720123, 22.500000000000004, 2371)
-    femmesh.addNode(-21.066717535904605, 100.31173117967015, 27.5, 2372)
-    femmesh.addNode(-18.617777225392295, 100.79498187502026, 25.0, 2373)
-    femmesh.addNode(-21.066717535904605, 100.31173117967015, 22.5, 2374)
-    femmesh.addNode(-25.925671695147305, 99.16707894838608, 27.5, 2375)
-    femmesh.addNode(-23.503164012390265, 99.76898957795795, 25.0, 2376)
-    femmesh.addNode(-25.925671695147305, 99.16707894838608, 22.5, 2377)
-    femmesh.addNode(-30.72313302544002, 97.78721336197856, 27.5, 2378)
-    femmesh.addNode(-28.33280389101911, 98.50635626025893, 25.0, 2379)
-    femmesh.addNode(-30.723133025440042, 97.78721336197854, 22.5, 2380)
-    femmesh.addNode(-35.44772247853872, 96.1754073091687, 27.5, 2381)
-    femmesh.addNode(-33.095241489073274, 97.01007674865494, 25.0, 2382)
-    femmesh.addNode(-35.44772247853872, 96.1754073091687, 22.5, 2383)
-    femmesh.addNode(-40.08823385024104, 94.33548381583881, 27.5, 2384)
-    femmesh.addNode(-37.779180830732116, 95.28370005283612, 25.0, 2385)
-    femmesh.addNode(-40.08823385024104, 94.33548381583881, 22.5, 2386)
-    femmesh.addNode(-44.63366036026463, 92.27180697723732, 27.5, 2387)
-    femmesh.addNode(-42.373512129366546, 93.331320947592, 25.0, 2388)
-    femmesh.addNode(-44.63366036026463, 92.27180697723732, 22.5, 2389)
-    femmesh.addNode(-49.073220759113944, 89.98927160682695, 27.5, 2390)
-    femmesh.addNode(-46.867338138725486, 91.15757026045817, 25.0, 2391)
-    femmesh.addNode(-49.073220759113944, 89.98927160682695, 22.5, 2392)
-    femmesh.addNode(-53.39638490001288, 87.493291626328, 27.5, 2393)
-    femmesh.addNode(-51.25000000000002, 88.76760388790494, 25.0, 2394)
-    femmesh.addNode(-53.39638490001284, 87.49329162632802, 22.5, 2395)
-    femmesh.addNode(-57.59289871524942, 84.78978722449433, 27.5, 2396)
-    femmesh.addNode(-55.511102523458916, 86.16709056612062, 25.0, 2397)
-    femmesh.addNode(-57.59289871524942, 84.78978722449433, 22.5, 2398)
-    femmesh.addNode(-61.652808537691705, 81.88517081507939, 27.5, 2399)
-    femmesh.addNode(-59.64053884469015, 83.36219842539546, 25.0, 2400)
-    femmesh.addNode(-61.652808537691705, 81.88517081507939, 22.5, 2401)
-    femmesh.addNode(-65.56648470978637, 78.78633182729952, 27.5, 2402)
-    femmesh.addNode(-63.62851439696672, 80.35958035999815, 25.0, 2403)
-    femmesh.addNode(-65.56648470978637, 78.78633182729952, 22.5, 2404)
-    femmesh.addNode(-69.32464442404253, 75.50062036486898, 27.5, 2405)
-    femmesh.addNode(-67.46557014287666, 77.16635824824566, 25.0, 2406)
-    femmesh.addNode(-69.32464442404253, 75.50062036486898, 22.5, 2407)
-    femmesh.addNode(-72.9183737408257, 72.03582977236579, 27.5, 2408)
-    femmesh.addNode(-71.14260501011495, 73.7901060601946, 25.0, 2409)
-    femmesh.addNode(-72.9183737408257, 72.03582977236579, 22.5, 2410)
-    femmesh.addNode(-76.33914873123764, 68.40017815027954, 27.5, 2411)
-    femmesh.addNode(-74.65089747822138, 70.23883189302113, 25.0, 2412)
-    femmesh.addNode(-76.33914873123764, 68.40017815027954, 22.5, 2413)
-    femmesh.addNode(-79.57885569493385, 64.60228886258516, 27.5, 2414)
-    femmesh.addNode(-77.98212626506347, 66.5209589766992, 25.0, 2415)
-    femmesh.addNode(-79.57885569493382, 64.60228886258518, 22.5, 2416)
-    femmesh.addNode(-82.62981040492465, 60.65117008307594, 27.5, 2417)
-    femmesh.addNode(-81.12839006399851, 62.64530569502959, 25.0, 2418)
-    femmesh.addNode(-82.62981040492463, 60.651170083075975, 22.5, 2419)
-    femmesh.addNode(-85.48477633371243, 56.55619342897081, 27.5, 2420)
-    femmesh.addNode(-84.08222628489983, 58.621064669407886, 25.0, 2421)
-    femmesh.addNode(-85.48477633371243, 56.55619342897081, 22.5, 2422)
-    femmesh.addNode(-88.13698181753549, 52.32707173247342, 27.5, 2423)
-    femmesh.addNode(-86.83662875459612, 54.457780954942045, 25.0, 2424)
-    femmesh.addNode(-88.13698181753549, 52.32707173247342, 22.5, 2425)
-    femmesh.addNode(-90.58013611800615, 47.97383600300768, 27.5, 2426)
-    femmesh.addNode(-89.38506433474022, 50.165329400636374, 25.0, 2427)
-    femmesh.addNode(-90.58013611800615, 47.97383600300768, 22.5, 2428)
-    femmesh.addNode(-92.80844434304747, 43.50681163477117, 27.5, 2429)
-    femmesh.addNode(-91.72148841769136, 45.753891227340524, 25.0, 2430)
-    femmesh.addNode(-92.80844434304747, 43.50681163477117, 22.5, 2431)
-    femmesh.addNode(-94.81662119173679, 38.93659391604111, 27.5, 2432)
-    femmesh.addNode(-93.84035926365677, 41.233929879018675, 25.0, 2433)
-    femmesh.addNode(-94.81662119173679, 38.93659391604111, 22.5, 2434)
-    femmesh.addNode(-96.59990349045567, 34.27402289832127, 27.5, 2435)
-    femmesh.addNode(-95.73665114508611, 36.61616620461624, 25.0, 2436)
-    femmesh.addNode(-96.59990349045567, 34.27402289832127, 22.5, 2437)
-    femmesh.addNode(-98.15406149061157, 29.530157684937002, 27.5, 2438)
-    femmesh.addNode(-97.40586626714214, 31.91155302939078, 25.0, 2439)
-    femmesh.addNode(-98.15406149061157, 29.530157684937002, 22.5, 2440)
-    femmesh.addNode(-99.475408901134, 24.716250200064533, 27.5, 2441)
-    femmesh.addNode(-98.84404543597297, 27.131249176020468, 25.0, 2442)
-    femmesh.addNode(-99.475408901134, 24.716250200064533, 22.5, 2443)
-    femmesh.addNode(-100.56081163194987, 19.843718500409473, 27.5, 2444)
-    femmesh.addNode(-100.0477774494825, 22.286592997109796, 25.0, 2445)
-    femmesh.addNode(-100.56081163194987, 19.843718500409473, 22.5, 2446)
-    femmesh.addNode(-101.40769522769877, 14.924119692838172, 27.5, 2447)
-    femmesh.addNode(-101.01420718832499, 17.38907548186937, 25.0, 2448)
-    femmesh.addNode(-101.40769522769877, 14.924119692838172, 22.5, 2449)
-    femmesh.addNode(-102.01405097405664, 9.969122522196816, 27.5, 2450)
-    femmesh.addNode(-101.74104238793268, 12.450313000759673, 25.0, 2451)
-    femmesh.addNode(-102.01405097405664, 9.969122522196816, 22.5, 2452)
-    femmesh.addNode(-102.37844066218435, 4.990479694337784, 27.5, 2453)
-    femmesh.addNode(-102.22655907551403, 7.482019752743251, 25.0, 2454)
-    femmesh.addNode(-102.37844066218435, 4.990479694337784, 22.5, 2455)
-    femmesh.addNode(-102.5, 1.9462920572978604e-13, 27.5, 2456)
-    femmesh.addNode(-102.46960565912678, 2.495979980499136, 25.0, 2457)
-    femmesh.addNode(-102.5, 1.9462920572978604e-13, 22.5, 2458)
-    femmesh.addNode(-102.37844066218437, -4.990479694337395, 27.5, 2459)
-    femmesh.addNode(-102.4696056591268, -2.495979980498747, 25.0, 2460)
-    femmesh.addNode(-102.37844066218437, -4.990479694337395, 22.5, 2461)
-    femmesh.addNode(-102.01405097405669, -9.969122522196429, 27.5, 2462)
-    femmesh.addNode(-102.22655907551406, -7.482019752742862, 25.0, 2463)
-    femmesh.addNode(-102.01405097405669, -9.969122522196429, 22.5, 2464)
-    femmesh.addNode(-101.40769522769882, -14.924119692837834, 27.5, 2465)
-    femmesh.addNode(-101.74104238793272, -12.450313000759287, 25.0, 2466)
-    femmesh.addNode(-101.40769522769882, -14.924119692837834, 22.5, 2467)
-    femmesh.addNode(-100.56081163194993, -19.84371850040918, 27.5, 2468)
-    femmesh.addNode(-101.01420718832505, -17.38907548186903, 25.0, 2469)
-    femmesh.addNode(-100.56081163194993, -19.84371850040918, 22.5, 2470)
-    femmesh.addNode(-99.47540890113407, -24.71625020006424, 27.5, 2471)
-    femmesh.addNode(-100.04777744948255, -22.28659299710946, 25.0, 2472)
-    femmesh.addNode(-99.47540890113407, -24.71625020006424, 22.5, 2473)
-    femmesh.addNode(-98.15406149061165, -29.530157684936714, 27.5, 2474)
-    femmesh.addNode(-98.84404543597303, -27.13124917602023, 25.0, 2475)
-    femmesh.addNode(-98.15406149061165, -29.530157684936714, 22.5, 2476)
-    femmesh.addNode(-96.59990349045576, -34.27402289832099, 27.5, 2477)
-    femmesh.addNode(-97.40586626714223, -31.911553029390497, 25.0, 2478)
-    femmesh.addNode(-96.59990349045576, -34.27402289832099, 22.5, 2479)
-    femmesh.addNode(-94.8166211917369, -38.93659391604087, 27.5, 2480)
-    femmesh.addNode(-95.73665114508621, -36.616166204615965, 25.0, 2481)
-    femmesh.addNode(-94.8166211917369, -38.93659391604087, 22.5, 2482)
-    femmesh.addNode(-92.8084443430476, -43.5068116347709, 27.5, 2483)
-    femmesh.addNode(-93.84035926365688, -41.233929879018405, 25.0, 2484)
-    femmesh.addNode(-92.8084443430476, -43.5068116347709, 22.5, 2485)
-    femmesh.addNode(-90.58013611800628, -47.973836003007456, 27.5, 2486)
-    femmesh.addNode(-91.72148841769148, -45.7538912273403, 25.0, 2487)
-    femmesh.addNode(-90.58013611800628, -47.973836003007456, 22.5, 2488)
-    femmesh.addNode(-88.1369818175356, -52.32707173247324, 27.5, 2489)
-    femmesh.addNode(-89.38506433474035, -50.16532940063615, 25.0, 2490)
-    femmesh.addNode(-88.1369818175356, -52.32707173247324, 22.5, 2491)
-    femmesh.addNode(-85.48477633371256, -56.55619342897059, 27.5, 2492)
-    femmesh.addNode(-86.83662875459626, -54.45778095494183, 25.0, 2493)
-    femmesh.addNode(-85.48477633371256, -56.55619342897059, 22.5, 2494)
-    femmesh.addNode(-82.62981040492475, -60.651170083075804, 27.5, 2495)
-    femmesh.addNode(-84.08222628489995, -58.621064669407716, 25.0, 2496)
-    femmesh.addNode(-82.62981040492475, -60.651170083075804, 22.5, 2497)
-    femmesh.addNode(-79.57885569493392, -64.60228886258506, 27.5, 2498)
-    femmesh.addNode(-81.12839006399861, -62.64530569502947, 25.0, 2499)
-    femmesh.addNode(-79.57885569493392, -64.60228886258506, 22.5, 2500)
-    femmesh.addNode(-76.33914873123769, -68.40017815027949, 27.5, 2501)
-    femmesh.addNode(-77.98212626506354, -66.5209589766991, 25.0, 2502)
-    femmesh.addNode(-76.33914873123769, -68.40017815027949, 22.5, 2503)
-    femmesh.addNode(-72.9183737408258, -72.03582977236569, 27.5, 2504)
-    femmesh.addNode(-74.65089747822145, -70.23883189302104, 25.0, 2505)
-    femmesh.addNode(-72.9183737408258, -72.03582977236569, 22.5, 2506)
-    femmesh.addNode(-69.32464442404259, -75.50062036486894, 27.5, 2507)
-    femmesh.addNode(-71.14260501011502, -73.79010606019452, 25.0, 2508)
-    femmesh.addNode(-69.32464442404259, -75.50062036486894, 22.5, 2509)
-    femmesh.addNode(-65.5664847097864, -78.7863318272995, 27.5, 2510)
-    femmesh.addNode(-67.46557014287671, -77.1663582482456, 25.0, 2511)
-    femmesh.addNode(-65.5664847097864, -78.7863318272995, 22.5, 2512)
-    femmesh.addNode(-61.652808537691726, -81.88517081507936, 27.5, 2513)
-    femmesh.addNode(-63.62851439696674, -80.35958035999812, 25.0, 2514)
-    femmesh.addNode(-61.652808537691726, -81.88517081507936, 22.5, 2515)
-    femmesh.addNode(-57.59289871524944, -84.78978722449432, 27.5, 2516)
-    femmesh.addNode(-59.64053884469017, -83.36219842539545, 25.0, 2517)
-    femmesh.addNode(-57.59289871524944, -84.78978722449432, 22.5, 2518)
-    femmesh.addNode(-53.396384900012826, -87.49329162632803, 27.5, 2519)
-    femmesh.addNode(-55.511102523458895, -86.16709056612063, 25.0, 2520)
-    femmesh.addNode(-53.396384900012826, -87.49329162632803, 22.5, 2521)
-    femmesh.addNode(-49.07322075911388, -89.98927160682696, 27.5, 2522)
-    femmesh.addNode(-51.24999999999996, -88.76760388790498, 25.0, 2523)
-    femmesh.addNode(-49.07322075911388, -89.98927160682696, 22.5, 2524)
-    femmesh.addNode(-44.63366036026453, -92.27180697723736, 27.5, 2525)
-    femmesh.addNode(-46.86733813872539, -91.15757026045821, 25.0, 2526)
-    femmesh.addNode(-44.63366036026453, -92.27180697723736, 22.5, 2527)
-    femmesh.addNode(-40.088233850240975, -94.33548381583886, 27.5, 2528)
-    femmesh.addNode(-42.37351212936651, -93.33132094759203, 25.0, 2529)
-    femmesh.addNode(-40.088233850240975, -94.33548381583886, 22.5, 2530)
-    femmesh.addNode(-35.44772247853864, -96.17540730916873, 27.5, 2531)
-    femmesh.addNode(-37.77918083073205, -95.28370005283615, 25.0, 2532)
-    femmesh.addNode(-35.44772247853864, -96.17540730916873, 22.5, 2533)
-    femmesh.addNode(-30.72313302544002, -97.78721336197856, 27.5, 2534)
-    femmesh.addNode(-33.09524148907328, -97.01007674865494, 25.0, 2535)
-    femmesh.addNode(-30.72313302544002, -97.78721336197856, 22.5, 2536)
-    femmesh.addNode(-25.925671695147287, -99.16707894838608, 27.5, 2537)
-    femmesh.addNode(-28.332803891019093, -98.50635626025893, 25.0, 2538)
-    femmesh.addNode(-25.925671695147287, -99.16707894838608, 22.5, 2539)
-    femmesh.addNode(-21.06671753590454, -100.31173117967018, 27.5, 2540)
-    femmesh.addNode(-23.503164012390222, -99.76898957795797, 25.0, 2541)
-    femmesh.addNode(-21.06671753590454, -100.31173117967018, 22.5, 2542)
-    femmesh.addNode(-16.15779545015226, -101.21845506720126, 27.5, 2543)
-    femmesh.addNode(-18.617777225392206, -100.79498187502028, 25.0, 2544)
-    femmesh.addNode(-16.15779545015226, -101.21845506720126, 22.5, 2545)
-    femmesh.addNode(-11.21054885873206, -101.88509996209447, 27.5, 2546)
-    femmesh.addNode(-13.688231127738236, -101.58189961107057, 25.0, 2547)
-    femmesh.addNode(-11.21054885873206, -101.88509996209447, 22.5, 2548)
-    femmesh.addNode(-6.236712083978839, -102.31008465631115, 27.5, 2549)
-    femmesh.addNode(-8.726218058147579, -102.12787630417887, 25.0, 2550)
-    femmesh.addNode(-6.236712083978839, -102.31008465631115, 22.5, 2551)
-    femmesh.addNode(-1.2480825172046355, -102.49240113310961, 27.5, 2552)
-    femmesh.addNode(-3.7435073634099303, -102.43161695794954, 25.0, 2553)
-    femmesh.addNode(-1.2480825172047265, -102.49240113310961, 22.5, 2554)
-    femmesh.addNode(3.743507363410075, -102.43161695794954, 27.5, 2555)
-    femmesh.addNode(1.2480825172047798, -102.49240113310961, 25.0, 2556)
-    femmesh.addNode(3.743507363410075, -102.43161695794954, 22.5, 2557)
-    femmesh.addNode(8.726218058147722, -102.12787630417886, 27.5, 2558)
-    femmesh.addNode(6.236712083978983, -102.31008465631113, 25.0, 2559)
-    femmesh.addNode(8.726218058147722, -102.12787630417886, 22.5, 2560)
-    femmesh.addNode(13.688231127738382, -101.58189961107054, 27.5, 2561)
-    femmesh.addNode(11.210548858732205, -101.88509996209444, 25.0, 2562)
-    femmesh.addNode(13.688231127738382, -101.58189961107054, 22.5, 2563)
-    femmesh.addNode(18.61777722539235, -100.79498187502026, 27.5, 2564)
-    femmesh.addNode(16.157795450152406, -101.21845506720123, 25.0, 2565)
-    femmesh.addNode(18.61777722539235, -100.79498187502026, 22.5, 2566)
-    femmesh.addNode(23.50316401239036, -99.76898957795794, 27.5, 2567)
-    femmesh.addNode(21.066717535904683, -100.31173117967013, 25.0, 2568)
-    femmesh.addNode(23.50316401239036, -99.76898957795794, 22.5, 2569)
-    femmesh.addNode(28.332803891019232, -98.5063562602589, 27.5, 2570)
-    femmesh.addNode(25.92567169514742, -99.16707894838605, 25.0, 2571)
-    femmesh.addNode(28.332803891019232, -98.5063562602589, 22.5, 2572)
-    femmesh.addNode(33.095241489073416, -97.0100767486549, 27.5, 2573)
-    femmesh.addNode(30.723133025440156, -97.7872133619785, 25.0, 2574)
-    femmesh.addNode(33.095241489073416, -97.0100767486549, 22.5, 2575)
-    femmesh.addNode(37.77918083073227, -95.28370005283607, 27.5, 2576)
-    femmesh.addNode(35.44772247853886, -96.17540730916865, 25.0, 2577)
-    femmesh.addNode(37.77918083073227, -95.28370005283607, 22.5, 2578)
-    femmesh.addNode(42.37351212936664, -93.33132094759196, 27.5, 2579)
-    femmesh.addNode(40.08823385024112, -94.3354838158388, 25.0, 2580)
-    femmesh.addNode(42.37351212936664, -93.33132094759196, 22.5, 2581)
-    femmesh.addNode(46.8673381387256, -91.15757026045812, 27.5, 2582)
-    femmesh.addNode(44.63366036026474, -92.27180697723726, 25.0, 2583)
-    femmesh.addNode(46.8673381387256, -91.15757026045812, 22.5, 2584)
-    femmesh.addNode(51.25000000000017, -88.76760388790487, 27.5, 2585)
-    femmesh.addNode(49.07322075911409, -89.98927160682685, 25.0, 2586)
-    femmesh.addNode(51.25000000000017, -88.76760388790487, 22.5, 2587)
-    femmesh.addNode(55.51110252345909, -86.1670905661205, 27.5, 2588)
-    femmesh.addNode(53.39638490001303, -87.4932916263279, 25.0, 2589)
-    femmesh.addNode(55.51110252345909, -86.1670905661205, 22.5, 2590)
-    femmesh.addNode(59.64053884469028, -83.36219842539536, 27.5, 2591)
-    femmesh.addNode(57.59289871524963, -84.78978722449419, 25.0, 2592)
-    femmesh.addNode(59.64053884469028, -83.36219842539536, 22.5, 2593)
-    femmesh.addNode(63.62851439696686, -80.35958035999803, 27.5, 2594)
-    femmesh.addNode(61.65280853769192, -81.88517081507923, 25.0, 2595)
-    femmesh.addNode(63.62851439696686, -80.35958035999803, 22.5, 2596)
-    femmesh.addNode(67.46557014287683, -77.1663582482455, 27.5, 2597)
-    femmesh.addNode(65.5664847097865, -78.78633182729942, 25.0, 2598)
-    femmesh.addNode(67.46557014287683, -77.1663582482455, 22.5, 2599)
-    femmesh.addNode(71.14260501011513, -73.79010606019442, 27.5, 2600)
-    femmesh.addNode(69.3246444240427, -75.50062036486882, 25.0, 2601)
-    femmesh.addNode(71.14260501011513, -73.79010606019442, 22.5, 2602)
-    femmesh.addNode(74.65089747822155, -70.23883189302093, 27.5, 2603)
-    femmesh.addNode(72.9183737408259, -72.03582977236559, 25.0, 2604)
-    femmesh.addNode(74.65089747822155, -70.23883189302093, 22.5, 2605)
-    femmesh.addNode(77.98212626506367, -66.52095897669898, 27.5, 2606)
-    femmesh.addNode(76.33914873123781, -68.40017815027934, 25.0, 2607)
-    femmesh.addNode(77.98212626506367, -66.52095897669898, 22.5, 2608)
-    femmesh.addNode(81.12839006399872, -62.64530569502932, 27.5, 2609)
-    femmesh.addNode(79.57885569493405, -64.60228886258491, 25.0, 2610)
-    femmesh.addNode(81.12839006399872, -62.64530569502932, 22.5, 2611)
-    femmesh.addNode(84.08222628490006, -58.62106466940755, 27.5, 2612)
-    femmesh.addNode(82.62981040492487, -60.651170083075655, 25.0, 2613)
-    femmesh.addNode(84.08222628490006, -58.62106466940755, 22.5, 2614)
-    femmesh.addNode(86.83662875459632, -54.45778095494175, 27.5, 2615)
-    femmesh.addNode(85.48477633371262, -56.55619342897051, 25.0, 2616)
-    femmesh.addNode(86.83662875459632, -54.45778095494175, 22.5, 2617)
-    femmesh.addNode(89.38506433474042, -50.16532940063603, 27.5, 2618)
-    femmesh.addNode(88.13698181753566, -52.32707173247313, 25.0, 2619)
-    femmesh.addNode(89.38506433474042, -50.16532940063603, 22.5, 2620)
-    femmesh.addNode(91.7214884176915, -45.75389122734025, 27.5, 2621)
-    femmesh.addNode(90.58013611800635, -47.97383600300733, 25.0, 2622)
-    femmesh.addNode(91.7214884176915, -45.75389122734025, 22.5, 2623)
-    femmesh.addNode(93.8403592636569, -41.233929879018355, 27.5, 2624)
-    femmesh.addNode(92.80844434304763, -43.50681163477085, 25.0, 2625)
-    femmesh.addNode(93.8403592636569, -41.233929879018355, 22.5, 2626)
-    femmesh.addNode(95.73665114508627, -36.61616620461587, 27.5, 2627)
-    femmesh.addNode(94.81662119173693, -38.93659391604078, 25.0, 2628)
-    femmesh.addNode(95.73665114508627, -36.61616620461587, 22.5, 2629)
-    femmesh.addNode(97.40586626714227, -31.91155302939036, 27.5, 2630)
-    femmesh.addNode(96.59990349045582, -34.27402289832085, 25.0, 2631)
-    femmesh.addNode(97.40586626714227, -31.91155302939036, 22.5, 2632)
-    femmesh.addNode(98.84404543597309, -27.13124917602004, 27.5, 2633)
-    femmesh.addNode(98.1540614906117, -29.530157684936572, 25.0, 2634)
-    femmesh.addNode(98.84404543597309, -27.13124917602004, 22.5, 2635)
-    femmesh.addNode(100.04777744948261, -22.286592997109274, 27.5, 2636)
-    femmesh.addNode(99.47540890113412, -24.716250200064056, 25.0, 2637)
-    femmesh.addNode(100.04777744948261, -22.286592997109274, 22.5, 2638)
-    femmesh.addNode(101.01420718832509, -17.38907548186884, 27.5, 2639)
-    femmesh.addNode(100.56081163194996, -19.843718500409082, 25.0, 2640)
-    femmesh.addNode(101.01420718832509, -17.38907548186884, 22.5, 2641)
-    femmesh.addNode(101.74104238793274, -12.450313000759188, 27.5, 2642)
-    femmesh.addNode(101.40769522769884, -14.924119692837735, 25.0, 2643)
-    femmesh.addNode(101.74104238793274, -12.450313000759188, 22.5, 2644)
-    femmesh.addNode(102.22655907551406, -7.482019752742719, 27.5, 2645)
-    femmesh.addNode(102.0140509740567, -9.969122522196285, 25.0, 2646)
-    femmesh.addNode(102.22655907551406, -7.482019752742719, 22.5, 2647)
-    femmesh.addNode(-0.18032277290044454, 94.65404833334267, 30.0, 2648)
-    femmesh.addNode(-0.07533427848898568, -94.72413287949868, 30.0, 2649)
-    femmesh.addNode(2.08556908550086e-14, 69.90789469695007, 30.0, 2650)
-    femmesh.addNode(-0.01749808240194219, 44.90574717496142, 30.0, 2651)
-    femmesh.addNode(-0.10498849441157279, 59.85096805123001, 30.0, 2652)
-    femmesh.addNode(2.46099437125243e-15, -29.96052629869314, 30.0, 2653)
-    femmesh.addNode(0.10498849441156617, 34.883862802319214, 30.0, 2654)
-    femmesh.addNode(-1.913242660605076e-15, -19.973684199128815, 30.0, 2655)
-    femmesh.addNode(-7.307699519975692e-15, -59.921052597386115, 30.0, 2656)
-    femmesh.addNode(0.017498082401926907, 19.938641926050607, 30.0, 2657)
-    femmesh.addNode(0.0, 79.89473679651448, 30.0, 2658)
-    femmesh.addNode(0.10498849441162017, -84.81807330014108, 30.0, 2659)
-    femmesh.addNode(-0.017498082401947758, -69.87285242387256, 30.0, 2660)
-    femmesh.addNode(0.08999013806706264, -9.273496235309892, 30.0, 2661)
-    femmesh.addNode(-9.994344553503395e-15, -49.9342104978218, 30.0, 2662)
-    femmesh.addNode(1.9984014443252818e-15, -39.94736839825747, 30.0, 2663)
-    femmesh.addNode(-0.0899901380670633, 9.27349623530956, 30.0, 2664)
-    femmesh.addNode(0.092432781330129, 89.80971135424778, 30.0, 2665)
-    femmesh.addNode(0.13998465921542716, 29.913803267922304, 30.0, 2666)
-    femmesh.addNode(-0.139984659215437, 54.88090851683311, 30.0, 2667)
-    femmesh.addNode(-0.10498849441157315, -79.84801376574424, 30.0, 2668)
-    femmesh.addNode(0.004942369320439378, -89.84475362732601, 30.0, 2669)
-    femmesh.addNode(3.7720079490681414e-15, 74.90131574673225, 30.0, 2670)
-    femmesh.addNode(0.014581735334937182, 39.929847261718194, 30.0, 2671)
-    femmesh.addNode(-0.0029163470669926585, -64.90863326832195, 30.0, 2672)
-    femmesh.addNode(-1.480686921479706e-15, -44.94078944803963, 30.0, 2673)
-    femmesh.addNode(2.393216883912466e-16, -24.967105248910975, 30.0, 2674)
-    femmesh.addNode(0.014998356344510121, -14.861372171970885, 30.0, 2675)
-    femmesh.addNode(-0.012082009277523027, 14.85553179312424, 30.0, 2676)
-    femmesh.addNode(4.471731626962435e-16, -34.953947348475296, 30.0, 2677)
-    femmesh.addNode(-3.0317037488632014e-15, -54.92763154760395, 30.0, 2678)
-    femmesh.addNode(-0.01749808240192532, 64.9027928894753, 30.0, 2679)
-    femmesh.addNode(0.015405463555021351, 84.87617992265811, 30.0, 2680)
-    femmesh.addNode(0.02624712360289264, 24.953477698269246, 30.0, 2681)
-    femmesh.addNode(-0.02624712360289653, 49.92058294718005, 30.0, 2682)
-    femmesh.addNode(-0.020414429468920296, -74.88768819609119, 30.0, 2683)
-    femmesh.addNode(-1.08193663740298, 98.96321859746833, 30.0, 2684)
-    femmesh.addNode(-1.0819366374036892, -98.96321859746874, 30.0, 2685)
-    femmesh.addNode(-2.256166415864965, -5.160086803116528, 30.0, 2686)
-    femmesh.addNode(2.42422941789785, -5.1211449090638475, 30.0, 2687)
-    femmesh.addNode(2.2561664158650445, 5.160086803116218, 30.0, 2688)
-    femmesh.addNode(-2.4242294178979438, 5.121144909063526, 30.0, 2689)
-    femmesh.addNode(-80.60171324798912, 59.15413544460329, 30.0, 2690)
-    femmesh.addNode(-80.60171324798927, -59.15413544460309, 30.0, 2691)
-    femmesh.addNode(-0.18032277290081555, 94.65404833334284, 20.0, 2692)
-    femmesh.addNode(-0.07533427848942664, -94.72413287949894, 20.0, 2693)
-    femmesh.addNode(-0.1049884944115734, 54.99771609375938, 20.0, 2694)
-    femmesh.addNode(-0.0174980824019292, 69.94293697002794, 20.0, 2695)
-    femmesh.addNode(2.46099437125243e-15, -29.96052629869314, 20.0, 2696)
-    femmesh.addNode(-1.913242660605076e-15, -19.973684199128815, 20.0, 2697)
-    femmesh.addNode(0.10498849441156344, -74.83123120057685, 20.0, 2698)
-    femmesh.addNode(-5.796532892949653e-15, -59.921052597386115, 20.0, 2699)
-    femmesh.addNode(0.10498849441157163, 9.243460001242804, 20.0, 2700)
-    femmesh.addNode(-4.308722690807155e-15, 34.953947348474976, 20.0, 2701)
-    femmesh.addNode(-9.994344553503414e-15, -49.93421049782177, 20.0, 2702)
-    femmesh.addNode(-0.017498082401933807, 79.85969452343654, 20.0, 2703)
-    femmesh.addNode(-1.5790877446453186e-14, -84.88815784629692, 20.0, 2704)
-    femmesh.addNode(0.08999013806706144, -9.273496235309892, 20.0, 2705)
-    femmesh.addNode(-0.10498849441157235, 24.89702070275489, 20.0, 2706)
-    femmesh.addNode(5.646944883791222e-15, -39.94736839825746, 20.0, 2707)
-    femmesh.addNode(-7.216449660063518e-15, 44.94078944803931, 20.0, 2708)
-    femmesh.addNode(-0.15254037229697465, 89.80971135424787, 20.0, 2709)
-    femmesh.addNode(-0.13998465921542969, 59.967775628156275, 20.0, 2710)
-    femmesh.addNode(0.10498849441157139, 19.926961168357977, 20.0, 2711)
-    femmesh.addNode(0.13998465921542783, -69.86117166617993, 20.0, 2712)
-    femmesh.addNode(-0.012555713081573739, -89.8564343850187, 20.0, 2713)
-    femmesh.addNode(-0.005832694133976871, 74.90131574673224, 20.0, 2714)
-    femmesh.addNode(-2.0688917950951327e-15, 39.94736839825713, 20.0, 2715)
-    femmesh.addNode(2.393216883912466e-16, -24.967105248910975, 20.0, 2716)
-    femmesh.addNode(-2.6318129077421775e-15, -54.92763154760395, 20.0, 2717)
-    femmesh.addNode(0.01749808240192431, -79.88305603882213, 20.0, 2718)
-    femmesh.addNode(0.01499835634450992, -14.861372171970885, 20.0, 2719)
-    femmesh.addNode(1.055263735940567e-15, -34.953947348475296, 20.0, 2720)
-    femmesh.addNode(-0.01749808240192944, 29.948845541000182, 20.0, 2721)
-    femmesh.addNode(-7.245666116186985e-16, -44.940789448039624, 20.0, 2722)
-    femmesh.addNode(-0.01749808240193025, 49.945891255514084, 20.0, 2723)
-    femmesh.addNode(-0.028339742449818368, 84.8703395438118, 20.0, 2724)
-    femmesh.addNode(0.03499616480385701, 14.848578961164343, 20.0, 2725)
-    femmesh.addNode(-0.026247123602893295, 64.92810119780931, 20.0, 2726)
-    femmesh.addNode(0.02333077653590352, -64.90668647537318, 20.0, 2727)
-    femmesh.addNode(-1.0819366374048933, 98.96321859746932, 20.0, 2728)
-    femmesh.addNode(-1.081936637404952, -98.96321859746953, 20.0, 2729)
-    femmesh.addNode(2.269284511793116, -5.160086803116528, 20.0, 2730)
-    femmesh.addNode(-2.414176399777149, -5.1211449090638475, 20.0, 2731)
-    femmesh.addNode(-2.255073241204368, 5.157897573227965, 20.0, 2732)
-    femmesh.addNode(2.425067169407999, 5.119467198528598, 20.0, 2733)
-    femmesh.addNode(-80.60171324798912, 59.15413544460329, 20.0, 2734)
-    femmesh.addNode(-80.60171324798927, -59.15413544460309, 20.0, 2735)
-    femmesh.addNode(2.121320343559643, 2.1213203435596424, 27.5, 2736)
-    femmesh.addNode(2.8482322789724784e-15, 3.0, 25.0, 2737)
-    femmesh.addNode(2.121320343559644, -2.121320343559641, 27.5, 2738)
-    femmesh.addNode(2.1134441994840667e-15, -3.0, 25.0, 2739)
-    femmesh.addNode(2.121320343559642, -2.121320343559643, 22.5, 2740)
-    femmesh.addNode(2.121320343559644, 2.121320343559641, 22.5, 2741)
-    femmesh.addNode(-2.1213203435596433, 2.121320343559642, 27.5, 2742)
-    femmesh.addNode(-3.0, 3.6739403974420594e-16, 25.0, 2743)
-    femmesh.addNode(-2.1213203435596393, -2.121320343559646, 27.5, 2744)
-    femmesh.addNode(-2.121320343559639, 2.1213203435596464, 22.5, 2745)
-    femmesh.addNode(-2.121320343559643, -2.1213203435596424, 22.5, 2746)
-    femmesh.addNode(-7.481740346109534, 97.21251751391586, 27.49999999999989, 2747)
-    femmesh.addNode(-12.376237459793572, 96.7113165370982, 27.5, 2748)
-    femmesh.addNode(-9.923329892153514, 96.9936983718607, 24.9999999999999, 2749)
-    femmesh.addNode(-7.481740346109814, 97.21251751391584, 22.499999999999932, 2750)
-    femmesh.addNode(-7.48174034611001, -97.21251751391581, 22.500000000000128, 2751)
-    femmesh.addNode(-9.92332989215384, -96.99369837186066, 25.0, 2752)
-    femmesh.addNode(-12.376237459793572, 96.7113165370982, 22.5, 2753)
-    femmesh.addNode(-7.481740346110097, -97.21251751391581, 27.499999999999996, 2754)
-    femmesh.addNode(-17.256673422289886, 95.96070665848826, 27.5, 2755)
-    femmesh.addNode(-14.821207968105751, 96.36691234218392, 25.0, 2756)
-    femmesh.addNode(-17.256673422289886, 95.96070665848826, 22.5, 2757)
-    femmesh.addNode(-22.092848669382985, 94.96397231409259, 27.5, 2758)
-    femmesh.addNode(-19.68107192327408, 95.49295999156645, 25.0, 2759)
-    femmesh.addNode(-22.092848669382985, 94.96397231409259, 22.5, 2760)
-    femmesh.addNode(-26.87235915476493, 93.72366997433105, 27.5, 2761)
-    femmesh.addNode(-24.490456953454434, 94.37408287348278, 25.0, 2762)
-    femmesh.addNode(-26.87235915476493, 93.72366997433105, 22.5, 2763)
-    femmesh.addNode(-31.58294616853359, 92.24298082410124, 27.5, 2764)
-    femmesh.addNode(-29.237027725128208, 93.01315073579696, 25.0, 2765)
-    femmesh.addNode(-31.58294616853359, 92.24298082410124, 22.5, 2766)
-    femmesh.addNode(-36.212527778899606, 90.52570260352816, 27.499999999999996, 2767)
-    femmesh.addNode(-33.908610013696936, 91.41365416030042, 25.0, 2768)
-    femmesh.addNode(-36.212527778899606, 90.52570260352816, 22.500000000000004, 2769)
-    femmesh.addNode(-40.74922982048493, 88.57623986734424, 27.5, 2770)
-    femmesh.addNode(-38.49322192849735, 89.57969560990621, 25.0, 2771)
-    femmesh.addNode(-40.74922982048493, 88.57623986734424, 22.5, 2772)
-    femmesh.addNode(-45.181416349732025, 86.39959268788348, 27.5, 2773)
-    femmesh.addNode(-42.979104644509746, 87.51597890646188, 25.0, 2774)
-    femmesh.addNode(-45.181416349732025, 86.39959268788348, 22.5, 2775)
-    femmesh.addNode(-49.497719489311166, 84.0013438306642, 27.5, 2776)
-    femmesh.addNode(-47.3547525619371, 85.2277971661694, 25.0, 2777)
-    femmesh.addNode(-49.497719489311166, 84.0013438306642, 22.5, 2778)
-    femmesh.addNode(-53.68706858497857, 81.38764443545351, 27.5, 2779)
-    femmesh.addNode(-51.60894281630028, 82.72101922355556, 25.0, 2780)
-    femmesh.addNode(-53.68706858497857, 81.38764443545351, 22.5, 2781)
-    femmesh.addNode(-57.73871860010351, 78.56519823953899, 27.5, 2782)
-    femmesh.addNode(-55.730764063360965, 80.00207457881324, 25.0, 2783)
-    femmesh.addNode(-57.73871860010351, 78.56519823953899, 22.5, 2784)
-    femmesh.addNode(-61.64227767503579, 75.54124438367285, 27.5, 2785)
-    femmesh.addNode(-59.70964446504272, 77.07793690712143, 25.0, 2786)
-    femmesh.addNode(-61.64227767503579, 75.54124438367285, 22.5, 2787)
-    femmesh.addNode(-65.38773378062898, 72.32353884478825, 27.5, 2788)
-    femmesh.addNode(-63.53537880457094, 73.9561061722403, 25.0, 2789)
-    femmesh.addNode(-65.38773378062898, 72.32353884478825, 22.5, 2790)
-    femmesh.addNode(-68.96548039755643, 68.92033454311041, 27.5, 2791)
-    femmesh.addNode(-67.19815466128574, 70.64458939025637, 25.0, 2792)
-    femmesh.addNode(-68.96548039755643, 68.92033454311041, 22.5, 2793)
-    femmesh.addNode(-72.3663411555571, 65.3403601746847, 27.5, 2794)
-    femmesh.addNode(-70.68857757799296, 67.151880092817, 25.0, 2795)
-    femmesh.addNode(-72.3663411555571, 65.3403601746847, 22.5, 2796)
-    femmesh.addNode(-75.58159336941512, 61.592797823612344, 27.5, 2797)
-    femmesh.addNode(-73.99769515630308, 63.48693654252692, 25.0, 2798)
-    femmesh.addNode(-75.58159336941512, 61.592797823612344, 22.5, 2799)
-    femmesh.addNode(-78.60299041130689, 57.68725941141594, 27.5, 2800)
-    femmesh.addNode(-77.1170200181575, 59.65915875638119, 25.0, 2801)
-    femmesh.addNode(-78.60299041130689, 57.68725941141594, 22.5, 2802)
-    femmesh.addNode(-81.42278286213416, 53.633762043937885, 27.5, 2803)
-    femmesh.addNode(-80.03855157464888, 55.67836439616624, 25.0, 2804)
-    femmesh.addNode(-81.42278286213416, 53.633762043937885, 22.5, 2805)
-    femmesh.addNode(-84.03373838759308, 49.442702319003224, 27.5, 2806)
-    femmesh.addNode(-82.75479654630207, 51.554763587666166, 25.0, 2807)
-    femmesh.addNode(-84.03373838759308, 49.442702319003224, 22.5, 2808)
-    femmesh.addNode(-86.42916028800029, 45.12482966074391, 27.5, 2809)
-    femmesh.addNode(-85.25878818218469, 47.298932733259065, 25.0, 2810)
-    femmesh.addNode(-86.42916028800029, 45.12482966074391, 22.5, 2811)
-    femmesh.addNode(-88.6029046742985, 40.69121874897792, 27.5, 2812)
-    femmesh.addNode(-87.5441041285524, 42.92178738507022, 25.0, 2813)
-    femmesh.addNode(-88.6029046742985, 40.69121874897792, 22.5, 2814)
-    femmesh.addNode(-90.54939622618781, 36.153241114357186, 27.5, 2815)
-    femmesh.addNode(-89.6048829011995, 38.4345542482585, 25.0, 2816)
-    femmesh.addNode(-90.54939622618781, 36.153241114357186, 22.5, 2817)
-    femmesh.addNode(-92.26364249196524, 31.52253597213943, 27.5, 2818)
-    femmesh.addNode(-91.43583891926498, 33.848742386242776, 25.0, 2819)
-    femmesh.addNode(-92.26364249196524, 31.52253597213943, 22.5, 2820)
-    femmesh.addNode(-93.7412466933965, 26.8109803693893, 27.5, 2821)
-    femmesh.addNode(-93.03227606193524, 29.176113701723068, 25.0, 2822)
-    femmesh.addNode(-93.7412466933965, 26.8109803693893, 22.5, 2823)
-    femmesh.addNode(-94.97841900277623, 22.030658722177893, 27.5, 2824)
-    femmesh.addNode(-94.39009971327236, 24.42865276920731, 25.0, 2825)
-    femmesh.addNode(-94.97841900277623, 22.030658722177893, 22.5, 2826)
-    femmesh.addNode(-95.97198626325374, 17.193831820912855, 27.5, 2827)
-    femmesh.addNode(-95.50582726427469, 19.618536096419813, 25.0, 2828)
-    femmesh.addNode(-95.97198626325374, 17.193831820912855, 22.5, 2829)
-    femmesh.addNode(-96.71940012749266, 12.312905383294956, 27.5, 2830)
-    femmesh.addNode(-96.37659704523365, 14.758100893430004, 25.0, 2831)
-    femmesh.addNode(-96.71940012749266, 12.312905383294956, 22.5, 2832)
-    femmesh.addNode(-97.2187435937903, 7.400398235558702, 27.5, 2833)
-    femmesh.addNode(-97.00017566547697, 9.859813429604573, 25.0, 2834)
-    femmesh.addNode(-97.2187435937903, 7.400398235558702, 22.5, 2835)
-    femmesh.addNode(-97.46873592289235, 2.4689102036068826, 27.5, 2836)
-    femmesh.addNode(-97.37496374167233, 4.936237059542291, 25.0, 2837)
-    femmesh.addNode(-97.46873592289235, 2.4689102036068826, 22.5, 2838)
-    femmesh.addNode(-97.46873592289236, -2.4689102036065558, 27.5, 2839)
-    femmesh.addNode(-97.5, 1.4183640017283e-13, 25.0, 2840)
-    femmesh.addNode(-97.46873592289236, -2.4689102036065558, 22.5, 2841)
-    femmesh.addNode(-97.21874359379031, -7.400398235558376, 27.5, 2842)
-    femmesh.addNode(-97.37496374167235, -4.936237059541965, 25.0, 2843)
-    femmesh.addNode(-97.21874359379031, -7.400398235558376, 22.5, 2844)
-    femmesh.addNode(-96.7194001274927, -12.31290538329463, 27.5, 2845)
-    femmesh.addNode(-97.00017566547699, -9.859813429604293, 25.0, 2846)
-    femmesh.addNode(-96.7194001274927, -12.31290538329463, 22.5, 2847)
-    femmesh.addNode(-95.9719862632538, -17.193831820912532, 27.5, 2848)
-    femmesh.addNode(-96.37659704523371, -14.75810089342968, 25.0, 2849)
-    femmesh.addNode(-95.9719862632538, -17.193831820912532, 22.5, 2850)
-    femmesh.addNode(-94.9784190027763, -22.030658722177577, 27.5, 2851)
-    femmesh.addNode(-95.50582726427476, -19.61853609641949, 25.0, 2852)
-    femmesh.addNode(-94.9784190027763, -22.030658722177577, 22.5, 2853)
-    femmesh.addNode(-93.74124669339659, -26.81098036938898, 27.5, 2854)
-    femmesh.addNode(-94.39009971327245, -24.428652769206998, 25.0, 2855)
-    femmesh.addNode(-93.74124669339659, -26.81098036938898, 22.5, 2856)
-    femmesh.addNode(-92.26364249196534, -31.52253597213916, 27.5, 2857)
-    femmesh.addNode(-93.03227606193532, -29.176113701722763, 25.0, 2858)
-    femmesh.addNode(-92.26364249196534, -31.52253597213916, 22.5, 2859)
-    femmesh.addNode(-90.5493962261879, -36.15324111435692, 27.5, 2860)
-    femmesh.addNode(-91.43583891926508, -33.848742386242506, 25.0, 2861)
-    femmesh.addNode(-90.5493962261879, -36.15324111435692, 22.5, 2862)
-    femmesh.addNode(-88.60290467429864, -40.69121874897762, 27.5, 2863)
-    femmesh.addNode(-89.60488290119963, -38.434554248258195, 25.0, 2864)
-    femmesh.addNode(-88.60290467429864, -40.69121874897762, 22.5, 2865)
-    femmesh.addNode(-86.42916028800045, -45.12482966074362, 27.5, 2866)
-    femmesh.addNode(-87.54410412855258, -42.92178738506988, 25.0, 2867)
-    femmesh.addNode(-86.42916028800045, -45.12482966074362, 22.5, 2868)
-    femmesh.addNode(-84.03373838759322, -49.442702319002976, 27.5, 2869)
-    femmesh.addNode(-85.25878818218484, -47.29893273325877, 25.0, 2870)
-    femmesh.addNode(-84.03373838759322, -49.442702319002976, 22.5, 2871)
-    femmesh.addNode(-81.42278286213431, -53.63376204393766, 27.5, 2872)
-    femmesh.addNode(-82.75479654630223, -51.55476358766592, 25.0, 2873)
-    femmesh.addNode(-81.42278286213433, -53.633762043937615, 22.5, 2874)
-    femmesh.addNode(-78.60299041130705, -57.68725941141571, 27.5, 2875)
-    femmesh.addNode(-80.03855157464906, -55.67836439616598, 25.0, 2876)
-    femmesh.addNode(-78.6029904113071, -57.687259411415646, 22.500000000000007, 2877)
-    femmesh.addNode(-75.58159336941532, -61.59279782361209, 27.5, 2878)
-    femmesh.addNode(-77.11702001815772, -59.659158756380926, 25.0, 2879)
-    femmesh.addNode(-75.58159336941532, -61.59279782361209, 22.5, 2880)
-    femmesh.addNode(-72.36634115555732, -65.34036017468446, 27.5, 2881)
-    femmesh.addNode(-73.99769515630328, -63.48693654252667, 25.0, 2882)
-    femmesh.addNode(-72.36634115555732, -65.34036017468446, 22.5, 2883)
-    femmesh.addNode(-68.96548039755668, -68.92033454311019, 27.5, 2884)
-    femmesh.addNode(-70.68857757799319, -67.15188009281677, 25.0, 2885)
-    femmesh.addNode(-68.96548039755668, -68.92033454311019, 22.5, 2886)
-    femmesh.addNode(-65.38773378062928, -72.32353884478796, 27.5, 2887)
-    femmesh.addNode(-67.19815466128601, -70.64458939025612, 25.0, 2888)
-    femmesh.addNode(-65.38773378062928, -72.32353884478796, 22.5, 2889)
-    femmesh.addNode(-61.64227767503611, -75.54124438367258, 27.5, 2890)
-    femmesh.addNode(-63.53537880457125, -73.95610617224003, 25.0, 2891)
-    femmesh.addNode(-61.64227767503611, -75.54124438367258, 22.5, 2892)
-    femmesh.addNode(-57.738718600103844, -78.56519823953876, 27.5, 2893)
-    femmesh.addNode(-59.70964446504306, -77.07793690712118, 25.0, 2894)
-    femmesh.addNode(-57.738718600103844, -78.56519823953876, 22.5, 2895)
-    femmesh.addNode(-53.687068584978945, -81.38764443545327, 27.5, 2896)
-    femmesh.addNode(-55.73076406336134, -80.00207457881297, 25.0, 2897)
-    femmesh.addNode(-53.687068584978945, -81.38764443545327, 22.5, 2898)
-    femmesh.addNode(-49.497719489311564, -84.00134383066396, 27.5, 2899)
-    femmesh.addNode(-51.60894281630067, -82.72101922355532, 25.0, 2900)
-    femmesh.addNode(-49.497719489311564, -84.00134383066396, 22.5, 2901)
-    femmesh.addNode(-45.18141634973247, -86.39959268788324, 27.5, 2902)
-    femmesh.addNode(-47.3547525619375, -85.22779716616918, 25.0, 2903)
-    femmesh.addNode(-45.18141634973247, -86.39959268788324, 22.5, 2904)
-    femmesh.addNode(-40.74922982048538, -88.57623986734401, 27.5, 2905)
-    femmesh.addNode(-42.979104644510194, -87.51597890646165, 25.0, 2906)
-    femmesh.addNode(-40.74922982048538, -88.57623986734401, 22.5, 2907)
-    femmesh.addNode(-36.21252777890009, -90.52570260352796, 27.5, 2908)
-    femmesh.addNode(-38.4932219284978, -89.57969560990601, 25.0, 2909)
-    femmesh.addNode(-36.21252777890009, -90.52570260352796, 22.5, 2910)
-    femmesh.addNode(-31.58294616853408, -92.24298082410108, 27.5, 2911)
-    femmesh.addNode(-33.908610013697405, -91.41365416030025, 25.0, 2912)
-    femmesh.addNode(-31.58294616853408, -92.24298082410108, 22.5, 2913)
-    femmesh.addNode(-26.872359154765455, -93.72366997433089, 27.5, 2914)
-    femmesh.addNode(-29.237027725128705, -93.01315073579678, 25.0, 2915)
-    femmesh.addNode(-26.872359154765455, -93.72366997433089, 22.5, 2916)
-    femmesh.addNode(-22.092848669383514, -94.96397231409246, 27.5, 2917)
-    femmesh.addNode(-24.490456953454935, -94.37408287348265, 25.0, 2918)
-    femmesh.addNode(-22.092848669383514, -94.96397231409246, 22.5, 2919)
-    femmesh.addNode(-17.25667342229042, -95.96070665848818, 27.5, 2920)
-    femmesh.addNode(-19.68107192327461, -95.49295999156635, 25.0, 2921)
-    femmesh.addNode(-17.25667342229042, -95.96070665848818, 22.5, 2922)
-    femmesh.addNode(-12.376237459794131, -96.71131653709811, 27.5, 2923)
-    femmesh.addNode(-14.82120796810631, -96.36691234218384, 25.0, 2924)
-    femmesh.addNode(-12.376237459794131, -96.71131653709811, 22.5, 2925)
-    femmesh.addNode(-5.0, -90.23144194791645, 25.030692874444668, 2926)
-    femmesh.addNode(-5.0, 54.927631547603625, 24.99999999999997, 2927)
-    femmesh.addNode(-5.0, -4.9934210497823415, 25.0, 2928)
-    femmesh.addNode(-5.0, 64.91447364716791, 25.0, 2929)
-    femmesh.addNode(-5.0, 90.18853304210663, 25.094971544492484, 2930)
-    femmesh.addNode(-5.0, -29.96052629869314, 25.0, 2931)
-    femmesh.addNode(-5.0, 44.870704901883556, 25.10498849441155, 2932)
-    femmesh.addNode(-5.0, -39.947368398257474, 25.0, 2933)
-    femmesh.addNode(-5.0, -79.89473679651478, 25.0, 2934)
-    femmesh.addNode(-5.0, 19.90359965297276, 24.895011505588467, 2935)
-    femmesh.addNode(-5.0, -59.92105259738611, 25.0, 2936)
-    femmesh.addNode(-5.0, -49.93421049782184, 25.0, 2937)
-    femmesh.addNode(-5.0, 29.96052629869297, 25.0, 2938)
-    femmesh.addNode(-5.0, -69.90789469695045, 25.0, 2939)
-    femmesh.addNode(-5.0, -19.9035996529731, 24.89501150558843, 2940)
-    femmesh.addNode(-5.0, 4.9934210497818725, 24.999999999999993, 2941)
-    femmesh.addNode(-5.0, 74.90131574673208, 25.0, 2942)
-    femmesh.addNode(-5.0, 84.90427459755665, 25.138315167562215, 2943)
-    femmesh.addNode(-5.0, 14.933540118575792, 25.104988494411565, 2944)
-    femmesh.addNode(-5.0, -14.933540118576161, 25.10498849441157, 2945)
-    femmesh.addNode(-5.0, 39.90064536748662, 24.895011505588407, 2946)
-    femmesh.addNode(-5.0, 49.92252974012882, 25.01749808240192, 2947)
-    femmesh.addNode(-5.0, -44.940789448039645, 25.0, 2948)
-    femmesh.addNode(-5.0, -34.95394734847531, 25.0, 2949)
-    femmesh.addNode(-5.0, -84.9464683549365, 25.00511547907411, 2950)
-    femmesh.addNode(-5.0, 24.95542449121804, 24.98250191759808, 2951)
-    femmesh.addNode(-5.0, -64.9144736471683, 25.0, 2952)
-    femmesh.addNode(-5.0, -74.90131574673262, 25.0, 2953)
-    femmesh.addNode(-5.0, -54.927631547603966, 25.0, 2954)
-    femmesh.addNode(-5.0, -24.95542449121838, 24.98250191759807, 2955)
-    femmesh.addNode(-5.0, -1.9895196601282805e-13, 25.0, 2956)
-    femmesh.addNode(-5.0, 59.92105259738574, 24.999999999999993, 2957)
-    femmesh.addNode(-5.0, 69.90789469695002, 25.0, 2958)
-    femmesh.addNode(-5.0, 79.89742292172437, 25.023052527927035, 2959)
-    femmesh.addNode(-5.0, 9.979054927769042, 25.017498082401925, 2960)
-    femmesh.addNode(-5.0, -9.979054927769411, 25.01749808240193, 2961)
-    femmesh.addNode(-5.0, 34.94616017667988, 24.982501917598068, 2962)
-    femmesh.addNode(-5.0, -93.8233606850735, 23.66763823443631, 2963)
-    femmesh.addNode(-5.0, 93.82112677702435, 23.670984687478686, 2964)
-    femmesh.addNode(-5.0, 94.226274036321, 26.753191246394234, 2965)
-    femmesh.addNode(-5.0, -94.23530259909295, 26.739666221776197, 2966)
-    femmesh.addNode(7.481740346109677, 97.21251751391584, 22.500000000000096, 2967)
-    femmesh.addNode(9.923329892153765, 96.99369837186067, 25.000000000000092, 2968)
-    femmesh.addNode(7.481740346109976, -97.21251751391581, 27.499999999999925, 2969)
-    femmesh.addNode(12.376237459794183, -96.71131653709811, 27.5, 2970)
-    femmesh.addNode(9.923329892153976, -96.99369837186065, 24.999999999999932, 2971)
-    femmesh.addNode(7.481740346110023, 97.21251751391581, 27.500000000000057, 2972)
-    femmesh.addNode(7.481740346110147, -97.2125175139158, 22.499999999999964, 2973)
-    femmesh.addNode(12.376237459794183, -96.71131653709811, 22.5, 2974)
-    femmesh.addNode(17.25667342229047, -95.96070665848816, 27.5, 2975)
-    femmesh.addNode(14.82120796810636, -96.36691234218382, 25.0, 2976)
-    femmesh.addNode(17.25667342229047, -95.96070665848816, 22.5, 2977)
-    femmesh.addNode(22.092848669383564, -94.96397231409246, 27.5, 2978)
-    femmesh.addNode(19.68107192327466, -95.49295999156634, 25.0, 2979)
-    femmesh.addNode(22.092848669383564, -94.96397231409246, 22.5, 2980)
-    femmesh.addNode(26.872359154765505, -93.72366997433087, 27.5, 2981)
-    femmesh.addNode(24.490456953454984, -94.37408287348264, 25.0, 2982)
-    femmesh.addNode(26.872359154765505, -93.72366997433087, 22.5, 2983)
-    femmesh.addNode(31.58294616853413, -92.24298082410105, 27.5, 2984)
-    femmesh.addNode(29.237027725128755, -93.01315073579677, 25.0, 2985)
-    femmesh.addNode(31.58294616853413, -92.24298082410105, 22.5, 2986)
-    femmesh.addNode(36.21252777890014, -90.52570260352795, 27.5, 2987)
-    femmesh.addNode(33.908610013697455, -91.41365416030024, 25.0, 2988)
-    femmesh.addNode(36.21252777890014, -90.52570260352795, 22.5, 2989)
-    femmesh.addNode(40.749229820485425, -88.576239867344, 27.5, 2990)
-    femmesh.addNode(38.49322192849785, -89.579695609906, 25.0, 2991)
-    femmesh.addNode(40.749229820485425, -88.576239867344, 22.5, 2992)
-    femmesh.addNode(45.181416349732515, -86.39959268788321, 27.5, 2993)
-    femmesh.addNode(42.97910464451024, -87.51597890646164, 25.0, 2994)
-    femmesh.addNode(45.181416349732515, -86.39959268788321, 22.5, 2995)
-    femmesh.addNode(49.497719489311606, -84.00134383066394, 27.5, 2996)
-    femmesh.addNode(47.354752561937545, -85.22779716616914, 25.0, 2997)
-    femmesh.addNode(49.497719489311606, -84.00134383066394, 22.5, 2998)
-    femmesh.addNode(53.68706858497899, -81.38764443545324, 27.5, 2999)
-    femmesh.addNode(51.60894281630071, -82.72101922355529, 25.0, 3000)
-    femmesh.addNode(53.68706858497899, -81.38764443545324, 22.5, 3001)
-    femmesh.addNode(57.73871860010388, -78.56519823953872, 27.5, 3002)
-    femmesh.addNode(55.730764063361384, -80.00207457881294, 25.0, 3003)
-    femmesh.addNode(57.73871860010388, -78.56519823953872, 22.5, 3004)
-    femmesh.addNode(61.64227767503615, -75.54124438367255, 27.5, 3005)
-    femmesh.addNode(59.70964446504309, -77.07793690712114, 25.0, 3006)
-    femmesh.addNode(61.64227767503615, -75.54124438367255, 22.5, 3007)
-    femmesh.addNode(65.3877337806293, -72.32353884478792, 27.5, 3008)
-    femmesh.addNode(63.535378804571295, -73.95610617223998, 25.0, 3009)
-    femmesh.addNode(65.3877337806293, -72.32353884478792, 22.5, 3010)
-    femmesh.addNode(68.96548039755673, -68.92033454311013, 27.5, 3011)
-    femmesh.addNode(67.19815466128607, -70.64458939025604, 25.0, 3012)
-    femmesh.addNode(68.96548039755673, -68.92033454311013, 22.5, 3013)
-    femmesh.addNode(72.36634115555738, -65.34036017468439, 27.5, 3014)
-    femmesh.addNode(70.68857757799324, -67.1518800928167, 25.0, 3015)
-    femmesh.addNode(72.36634115555738, -65.34036017468439, 22.5, 3016)
-    femmesh.addNode(75.58159336941539, -61.59279782361201, 27.5, 3017)
-    femmesh.addNode(73.99769515630335, -63.4869365425266, 25.0, 3018)
-    femmesh.addNode(75.58159336941539, -61.59279782361201, 22.5, 3019)
-    femmesh.addNode(78.60299041130715, -57.6872594114156, 27.5, 3020)
-    femmesh.addNode(77.11702001815776, -59.659158756380855, 25.0, 3021)
-    femmesh.addNode(78.60299041130715, -57.6872594114156, 22.5, 3022)
-    femmesh.addNode(81.42278286213438, -53.633762043937544, 27.5, 3023)
-    femmesh.addNode(80.0385515746491, -55.678364396165904, 25.0, 3024)
-    femmesh.addNode(81.42278286213438, -53.633762043937544, 22.5, 3025)
-    femmesh.addNode(84.03373838759327, -49.442702319002855, 27.5, 3026)
-    femmesh.addNode(82.7547965463023, -51.5547635876658, 25.0, 3027)
-    femmesh.addNode(84.03373838759327, -49.442702319002855, 22.5, 3028)
-    femmesh.addNode(86.42916028800049, -45.124829660743536, 27.5, 3029)
-    femmesh.addNode(85.2587881821849, -47.29893273325865, 25.0, 3030)
-    femmesh.addNode(86.42916028800049, -45.124829660743536, 22.5, 3031)
-    femmesh.addNode(88.6029046742987, -40.69121874897749, 27.5, 3032)
-    femmesh.addNode(87.54410412855262, -42.92178738506979, 25.0, 3033)
-    femmesh.addNode(88.6029046742987, -40.69121874897749, 22.5, 3034)
-    femmesh.addNode(90.54939622618795, -36.153241114356796, 27.5, 3035)
-    femmesh.addNode(89.60488290119969, -38.434554248258074, 25.0, 3036)
-    femmesh.addNode(90.54939622618795, -36.153241114356796, 22.5, 3037)
-    femmesh.addNode(92.26364249196538, -31.52253597213903, 27.5, 3038)
-    femmesh.addNode(91.43583891926512, -33.84874238624238, 25.0, 3039)
-    femmesh.addNode(92.26364249196538, -31.52253597213903, 22.5, 3040)
-    femmesh.addNode(93.74124669339663, -26.810980369388847, 27.5, 3041)
-    femmesh.addNode(93.03227606193538, -29.17611370172263, 25.0, 3042)
-    femmesh.addNode(93.74124669339663, -26.810980369388847, 22.5, 3043)
-    femmesh.addNode(94.97841900277635, -22.030658722177442, 27.5, 3044)
-    femmesh.addNode(94.39009971327249, -24.428652769206863, 25.0, 3045)
-    femmesh.addNode(94.97841900277635, -22.030658722177442, 22.5, 3046)
-    femmesh.addNode(95.97198626325383, -17.193831820912397, 27.5, 3047)
-    femmesh.addNode(95.50582726427477, -19.618536096419355, 25.0, 3048)
-    femmesh.addNode(95.97198626325383, -17.193831820912397, 22.5, 3049)
-    femmesh.addNode(96.7194001274927, -12.312905383294495, 27.5, 3050)
-    femmesh.addNode(96.37659704523374, -14.758100893429544, 25.0, 3051)
-    femmesh.addNode(96.7194001274927, -12.312905383294495, 22.5, 3052)
-    femmesh.addNode(97.21874359379031, -7.400398235558327, 27.5, 3053)
-    femmesh.addNode(97.00017566547702, -9.859813429604113, 25.0, 3054)
-    femmesh.addNode(97.21874359379031, -7.400398235558327, 22.5, 3055)
-    femmesh.addNode(97.46873592289236, -2.4689102036065917, 27.5, 3056)
-    femmesh.addNode(97.37496374167235, -4.936237059541828, 25.0, 3057)
-    femmesh.addNode(97.46873592289236, -2.468910203606505, 22.5, 3058)
-    femmesh.addNode(97.46873592289235, 2.468910203606803, 27.5, 3059)
-    femmesh.addNode(97.5, 1.4931417925815102e-13, 25.0, 3060)
-    femmesh.addNode(97.46873592289235, 2.4689102036068897, 22.5, 3061)
-    femmesh.addNode(97.2187435937903, 7.400398235558624, 27.499999999999986, 3062)
-    femmesh.addNode(97.37496374167233, 4.936237059542212, 24.99999999999999, 3063)
-    femmesh.addNode(97.2187435937903, 7.400398235558537, 22.5, 3064)
-    femmesh.addNode(96.71940012749268, 12.31290538329479, 27.5, 3065)
-    femmesh.addNode(97.00017566547697, 9.85981342960441, 25.0, 3066)
-    femmesh.addNode(96.71940012749268, 12.31290538329479, 22.5, 3067)
-    femmesh.addNode(95.97198626325377, 17.193831820912692, 27.5, 3068)
-    femmesh.addNode(96.37659704523368, 14.75810089342984, 25.0, 3069)
-    femmesh.addNode(95.97198626325377, 17.193831820912692, 22.5, 3070)
-    femmesh.addNode(94.97841900277626, 22.030658722177815, 27.5, 3071)
-    femmesh.addNode(95.5058272642747, 19.618536096419735, 25.0, 3072)
-    femmesh.addNode(94.97841900277626, 22.030658722177815, 22.5, 3073)
-    femmesh.addNode(93.74124669339653, 26.810980369389217, 27.5, 3074)
-    femmesh.addNode(94.39009971327239, 24.428652769207236, 25.0, 3075)
-    femmesh.addNode(93.74124669339653, 26.810980369389217, 22.5, 3076)
-    femmesh.addNode(92.26364249196526, 31.522535972139398, 27.5, 3077)
-    femmesh.addNode(93.03227606193525, 29.176113701722993, 25.0, 3078)
-    femmesh.addNode(92.26364249196526, 31.522535972139398, 22.5, 3079)
-    femmesh.addNode(90.54939622618781, 36.15324111435716, 27.5, 3080)
-    femmesh.addNode(91.435838919265, 33.84874238624274, 25.0, 3081)
-    femmesh.addNode(90.54939622618781, 36.15324111435716, 22.5, 3082)
-    femmesh.addNode(88.60290467429854, 40.691218748977846, 27.5, 3083)
-    femmesh.addNode(89.60488290119953, 38.43455424825843, 25.0, 3084)
-    femmesh.addNode(88.60290467429854, 40.691218748977846, 22.5, 3085)
-    femmesh.addNode(86.4291602880003, 45.12482966074388, 27.5, 3086)
-    femmesh.addNode(87.54410412855245, 42.92178738507014, 25.0, 3087)
-    femmesh.addNode(86.4291602880003, 45.12482966074388, 22.5, 3088)
-    femmesh.addNode(84.03373838759309, 49.442702319003196, 27.5, 3089)
-    femmesh.addNode(85.25878818218473, 47.298932733258994, 25.0, 3090)
-    femmesh.addNode(84.03373838759309, 49.442702319003196, 22.5, 3091)
-    femmesh.addNode(81.42278286213417, 53.633762043937864, 27.5, 3092)
-    femmesh.addNode(82.7547965463021, 51.55476358766613, 25.0, 3093)
-    femmesh.addNode(81.42278286213417, 53.633762043937864, 22.5, 3094)
-    femmesh.addNode(78.60299041130692, 57.687259411415916, 27.5, 3095)
-    femmesh.addNode(80.03855157464889, 55.67836439616622, 25.0, 3096)
-    femmesh.addNode(78.60299041130692, 57.687259411415916, 22.5, 3097)
-    femmesh.addNode(75.58159336941513, 61.592797823612315, 27.5, 3098)
-    femmesh.addNode(77.11702001815753, 59.65915875638115, 25.0, 3099)
-    femmesh.addNode(75.58159336941513, 61.592797823612315, 22.5, 3100)
-    femmesh.addNode(72.36634115555712, 65.34036017468468, 27.5, 3101)
-    femmesh.addNode(73.99769515630311, 63.48693654252689, 25.0, 3102)
-    femmesh.addNode(72.36634115555712, 65.34036017468468, 22.5, 3103)
-    femmesh.addNode(68.96548039755646, 68.9203345431104, 27.5, 3104)
-    femmesh.addNode(70.68857757799297, 67.15188009281697, 25.0, 3105)
-    femmesh.addNode(68.96548039755646, 68.9203345431104, 22.5, 3106)
-    femmesh.addNode(65.38773378062903, 72.32353884478819, 27.5, 3107)
-    femmesh.addNode(67.19815466128578, 70.64458939025631, 25.0, 3108)
-    femmesh.addNode(65.38773378062903, 72.32353884478819, 22.5, 3109)
-    femmesh.addNode(61.64227767503586, 75.5412443836728, 27.5, 3110)
-    femmesh.addNode(63.535378804571, 73.95610617224024, 25.0, 3111)
-    femmesh.addNode(61.64227767503586, 75.5412443836728, 22.5, 3112)
-    femmesh.addNode(57.738718600103574, 78.56519823953894, 27.5, 3113)
-    femmesh.addNode(59.70964446504279, 77.07793690712138, 25.0, 3114)
-    femmesh.addNode(57.738718600103574, 78.56519823953894, 22.5, 3115)
-    femmesh.addNode(53.68706858497874, 81.3876444354534, 27.5, 3116)
-    femmesh.addNode(55.73076406336107, 80.00207457881315, 25.0, 3117)
-    femmesh.addNode(53.68706858497874, 81.3876444354534, 22.5, 3118)
-    femmesh.addNode(49.49771948931135, 84.00134383066408, 27.5, 3119)
-    femmesh.addNode(51.60894281630046, 82.72101922355544, 25.0, 3120)
-    femmesh.addNode(49.49771948931135, 84.00134383066408, 22.5, 3121)
-    femmesh.addNode(45.181416349732245, 86.39959268788336, 27.5, 3122)
-    femmesh.addNode(47.35475256193728, 85.2277971661693, 25.0, 3123)
-    femmesh.addNode(45.181416349732245, 86.39959268788336, 22.5, 3124)
-    femmesh.addNode(40.749229820485155, 88.57623986734413, 27.5, 3125)
-    femmesh.addNode(42.979104644509974, 87.51597890646177, 25.0, 3126)
-    femmesh.addNode(40.749229820485155, 88.57623986734413, 22.5, 3127)
-    femmesh.addNode(36.21252777889986, 90.52570260352806, 27.5, 3128)
-    femmesh.addNode(38.493221928497576, 89.57969560990611, 25.0, 3129)
-    femmesh.addNode(36.21252777889986, 90.52570260352806, 22.5, 3130)
-    femmesh.addNode(31.582946168533848, 92.24298082410115, 27.5, 3131)
-    femmesh.addNode(33.90861001369717, 91.41365416030034, 25.0, 3132)
-    femmesh.addNode(31.582946168533848, 92.24298082410115, 22.5, 3133)
-    femmesh.addNode(26.872359154765217, 93.72366997433096, 27.5, 3134)
-    femmesh.addNode(29.237027725128467, 93.01315073579687, 25.0, 3135)
-    femmesh.addNode(26.872359154765217, 93.72366997433096, 22.5, 3136)
-    femmesh.addNode(22.092848669383272, 94.96397231409252, 27.5, 3137)
-    femmesh.addNode(24.490456953454697, 94.3740828734827, 25.0, 3138)
-    femmesh.addNode(22.092848669383272, 94.96397231409252, 22.5, 3139)
-    femmesh.addNode(17.256673422290174, 95.96070665848822, 27.5, 3140)
-    femmesh.addNode(19.68107192327437, 95.49295999156641, 25.0, 3141)
-    femmesh.addNode(17.256673422290174, 95.96070665848822, 22.5, 3142)
-    femmesh.addNode(12.376237459793886, 96.71131653709814, 27.5, 3143)
-    femmesh.addNode(14.821207968106066, 96.36691234218387, 25.0, 3144)
-    femmesh.addNode(12.376237459793886, 96.71131653709814, 22.5, 3145)
-    femmesh.addNode(5.0, 74.9013157467322, 25.0, 3146)
-    femmesh.addNode(5.0, 64.91447364716808, 25.0, 3147)
-    femmesh.addNode(5.0, -90.23144194791644, 25.159250214540474, 3148)
-    femmesh.addNode(5.0, 34.95394734847497, 25.0, 3149)
-    femmesh.addNode(5.0, 44.94078944803934, 25.000000000000007, 3150)
-    femmesh.addNode(5.0, 54.92763154760371, 25.0, 3151)
-    femmesh.addNode(5.0, 84.95824239245218, 25.10498849441159, 3152)
-    femmesh.addNode(5.0, -64.91447364716828, 25.0, 3153)
-    femmesh.addNode(5.0, -29.96052629869314, 25.0, 3154)
-    femmesh.addNode(5.0, -19.973684199128783, 25.0, 3155)
-    femmesh.addNode(5.0, -5.063505595938111, 24.89501150558842, 3156)
-    femmesh.addNode(5.0, -39.947368398257474, 25.0, 3157)
-    femmesh.addNode(5.0, 4.993421049782, 24.999999999999996, 3158)
-    femmesh.addNode(5.0, -54.857547001448204, 25.10498849441157, 3159)
-    femmesh.addNode(5.0, 24.967105248910585, 25.0, 3160)
-    femmesh.addNode(5.0, -79.82465225035901, 25.10498849441157, 3161)
-    femmesh.addNode(5.0, 14.980263149346243, 25.0, 3162)
-    femmesh.addNode(5.0, 90.39513847423186, 25.10168624287583, 3163)
-    femmesh.addNode(5.0, -74.8545927159621, 25.13998465921543, 3164)
-    femmesh.addNode(5.0, -10.033565130335006, 25.104988494411582, 3165)
-    femmesh.addNode(5.0, -49.887487467051294, 24.89501150558843, 3166)
-    femmesh.addNode(5.0, 49.934210497821454, 25.0, 3167)
-    femmesh.addNode(5.0, 29.96052629869277, 25.0, 3168)
-    femmesh.addNode(5.0, 39.94736839825714, 25.0, 3169)
-    femmesh.addNode(5.0, -24.96710524891097, 25.0, 3170)
-    femmesh.addNode(5.0, 59.921052597385795, 25.0, 3171)
-    femmesh.addNode(5.0, -84.93478759724385, 25.04403978482534, 3172)
-    femmesh.addNode(5.0, -34.95394734847531, 25.0, 3173)
-    femmesh.addNode(5.0, 19.973684199128456, 25.0, 3174)
-    femmesh.addNode(5.0, -59.90937183969349, 25.01749808240193, 3175)
-    femmesh.addNode(5.0, -0.01168075769280108, 24.982501917598068, 3176)
-    femmesh.addNode(5.0, 9.986842099564129, 25.0, 3177)
-    femmesh.addNode(5.0, 69.90789469695008, 25.0, 3178)
-    femmesh.addNode(5.0, 79.906417554207, 25.017498082401932, 3179)
-    femmesh.addNode(5.0, -69.90010752515536, 25.023330776535904, 3180)
-    femmesh.addNode(5.0, -44.93300227624455, 24.98250191759807, 3181)
-    femmesh.addNode(5.0, -14.988050321141742, 25.01749808240193, 3182)
-    femmesh.addNode(5.0, -93.8233606850735, 23.674331140522103, 3183)
-    femmesh.addNode(5.0, 93.9814667438041, 23.510084682257443, 3184)
-    femmesh.addNode(5.0, 94.37061000828385, 26.892668627718212, 3185)
-    femmesh.addNode(5.0, -94.23530259909293, 26.766716271012516, 3186)
-    femmesh.addNode(-8.881784197001252e-16, 52.43092102271254, 5.000000000000045, 3187)
-    femmesh.addNode(0.6807372212162697, 43.80734714032761, 4.319262778783756, 3188)
-    femmesh.addNode(-1.3874656196826384e-14, 62.41776312227694, 5.000000000000001, 3189)
-    femmesh.addNode(0.48211138052040403, -66.44569102474819, 4.517888619479621, 3190)
-    femmesh.addNode(-0.7627553318587212, -67.40381086616866, 25.755258721185015, 3191)
-    femmesh.addNode(-7.993605777301127e-15, -37.450657873366396, 25.0, 3192)
-    femmesh.addNode(-3.4034502417370998e-15, -22.470394724019876, 25.0, 3193)
-    femmesh.addNode(-3.374785809835504e-15, -62.068915830877174, 25.0, 3194)
-    femmesh.addNode(0.5369470502186086, 37.41540413962623, 24.485803009070608, 3195)
-    return True
+    return load_mesh(femmesh, __name__, elements=False)
 
 
 def create_elements(femmesh):
     # elements
-    femmesh.addVolume([1740, 1784, 2236, 2250], 7737)
-    femmesh.addVolume([1790, 2223, 1746, 2243], 7738)
-    femmesh.addVolume([1799, 2246, 1756, 2237], 7739)
-    femmesh.addVolume([1777, 2229, 1734, 2246], 7740)
-    femmesh.addVolume([1740, 2012, 1748, 1784], 7741)
-    femmesh.addVolume([2236, 1784, 1740, 1748], 7742)
-    femmesh.addVolume([2236, 1784, 2032, 1791], 7743)
-    femmesh.addVolume([2032, 1784, 2236, 1748], 7744)
-    femmesh.addVolume([1748, 2032, 1784, 2012], 7745)
-    femmesh.addVolume([1735, 2032, 1778, 2236], 7746)
-    femmesh.addVolume([2032, 1735, 1748, 2236], 7747)
-    femmesh.addVolume([1778, 2236, 2032, 1791], 7748)
-    femmesh.addVolume([1793, 2030, 2221, 1771], 7749)
-    femmesh.addVolume([1792, 1784, 2035, 2250], 7750)
-    femmesh.addVolume([2228, 1792, 2035, 2250], 7751)
-    femmesh.addVolume([1740, 2035, 1784, 2250], 7752)
-    femmesh.addVolume([1784, 2035, 1740, 2012], 7753)
-    femmesh.addVolume([1740, 1750, 2035, 2250], 7754)
-    femmesh.addVolume([2228, 2035, 1750, 2250], 7755)
-    femmesh.addVolume([1727, 2030, 2256, 1747], 7756)
-    femmesh.addVolume([2223, 2037, 2242, 1773], 7757)
-    femmesh.addVolume([2037, 2242, 1729, 2223], 7758)
-    femmesh.addVolume([2256, 2030, 1727, 2221], 7759)
-    femmesh.addVolume([2221, 2256, 2030, 1793], 7760)
-    femmesh.addVolume([1730, 1782, 2030, 2256], 7761)
-    femmesh.addVolume([1730, 2030, 1747, 2256], 7762)
-    femmesh.addVolume([2256, 1782, 2030, 1793], 7763)
-    femmesh.addVolume([2221, 2030, 2015, 1771], 7764)
-    femmesh.addVolume([2015, 2030, 2221, 1727], 7765)
-    femmesh.addVolume([2015, 1745, 1727, 2255], 7766)
-    femmesh.addVolume([2255, 1727, 2015, 2221], 7767)
-    femmesh.addVolume([2242, 2037, 1796, 1773], 7768)
-    femmesh.addVolume([1796, 2235, 1752, 2242], 7769)
-    femmesh.addVolume([1789, 2255, 2015, 2221], 7770)
-    femmesh.addVolume([1789, 2221, 2015, 1771], 7771)
-    femmesh.addVolume([1729, 2037, 1752, 2242], 7772)
-    femmesh.addVolume([1745, 2015, 1789, 2255], 7773)
-    femmesh.addVolume([2253, 2036, 1781, 2233], 7774)
-    femmesh.addVolume([2036, 1738, 1751, 2233], 7775)
-    femmesh.addVolume([2253, 1738, 2036, 2233], 7776)
-    femmesh.addVolume([2015, 1789, 2029, 1745], 7777)
-    femmesh.addVolume([1734, 2229, 1777, 2033], 7778)
-    femmesh.addVolume([2229, 1777, 2033, 1797], 7779)
-    femmesh.addVolume([1734, 2229, 2033, 1753], 7780)
-    femmesh.addVolume([1752, 2037, 1796, 2242], 7781)
-    femmesh.addVolume([2011, 1796, 2026, 2235], 7782)
-    femmesh.addVolume([1778, 1788, 1735, 2247], 7783)
-    femmesh.addVolume([682, 1723, 2260, 2259], 7784)
-    femmesh.addVolume([2027, 2231, 2244, 1732], 7785)
-    femmesh.addVolume([2236, 1778, 1735, 2247], 7786)
-    femmesh.addVolume([1781, 2233, 2036, 1794], 7787)
-    femmesh.addVolume([1752, 2235, 1796, 2011], 7788)
-    femmesh.addVolume([1789, 1745, 2255, 3189], 7789)
-    femmesh.addVolume([2027, 1732, 1757, 2231], 7790)
-    femmesh.addVolume([2231, 1774, 2027, 1801], 7791)
-    femmesh.addVolume([1745, 1789, 2029, 3189], 7792)
-    femmesh.addVolume([2244, 2231, 2027, 1801], 7793)
-    femmesh.addVolume([2011, 2037, 1796, 1752], 7794)
-    femmesh.addVolume([2016, 1782, 2030, 1730], 7795)
-    femmesh.addVolume([2032, 1778, 2018, 1735], 7796)
-    femmesh.addVolume([1735, 1788, 1778, 2018], 7797)
-    femmesh.addVolume([1735, 2247, 1788, 1744], 7798)
-    femmesh.addVolume([1782, 1743, 1730, 2016], 7799)
-    femmesh.addVolume([1746, 2223, 1790, 2023], 7800)
-    femmesh.addVolume([2223, 1790, 2023, 1773], 7801)
-    femmesh.addVolume([2020, 1751, 1731, 2249], 7802)
-    femmesh.addVolume([2233, 1751, 2020, 2249], 7803)
-    femmesh.addVolume([2023, 1729, 1746, 2223], 7804)
-    femmesh.addVolume([1731, 2249, 2230, 1775], 7805)
-    femmesh.addVolume([1731, 2230, 1749, 1775], 7806)
-    femmesh.addVolume([2227, 1788, 2038, 2258], 7807)
-    femmesh.addVolume([2244, 1732, 1749, 1785], 7808)
-    femmesh.addVolume([1756, 2246, 1799, 2019], 7809)
-    femmesh.addVolume([1777, 2019, 1799, 2246], 7810)
-    femmesh.addVolume([1777, 1734, 2019, 2246], 7811)
-    femmesh.addVolume([1756, 2019, 1734, 2246], 7812)
-    femmesh.addVolume([2244, 1749, 2230, 1785], 7813)
-    femmesh.addVolume([1730, 1743, 1782, 2226], 7814)
-    femmesh.addVolume([1768, 2038, 1788, 2258], 7815)
-    femmesh.addVolume([1735, 1744, 1788, 2018], 7816)
-    femmesh.addVolume([2249, 2020, 2233, 1794], 7817)
-    femmesh.addVolume([2037, 2023, 2223, 1729], 7818)
-    femmesh.addVolume([2223, 2023, 2037, 1773], 7819)
-    femmesh.addVolume([1749, 1732, 2027, 1785], 7820)
-    femmesh.addVolume([2013, 2027, 2231, 1774], 7821)
-    femmesh.addVolume([1780, 2026, 1796, 2235], 7822)
-    femmesh.addVolume([2256, 1730, 1782, 2226], 7823)
-    femmesh.addVolume([2244, 2027, 1732, 1785], 7824)
-    femmesh.addVolume([1782, 1787, 1743, 2016], 7825)
-    femmesh.addVolume([2036, 2020, 2233, 1751], 7826)
-    femmesh.addVolume([2231, 2027, 2013, 1757], 7827)
-    femmesh.addVolume([2253, 1781, 2009, 2237], 7828)
-    femmesh.addVolume([2009, 1781, 1799, 2237], 7829)
-    femmesh.addVolume([2009, 1756, 1738, 2253], 7830)
-    femmesh.addVolume([2253, 2009, 1756, 2237], 7831)
-    femmesh.addVolume([1799, 1756, 2009, 2237], 7832)
-    femmesh.addVolume([2039, 2239, 1723, 2259], 7833)
-    femmesh.addVolume([1782, 2226, 1743, 1787], 7834)
-    femmesh.addVolume([2233, 2020, 2036, 1794], 7835)
-    femmesh.addVolume([1801, 2027, 2244, 1785], 7836)
-    femmesh.addVolume([2257, 2013, 2231, 1774], 7837)
-    femmesh.addVolume([1734, 2019, 2033, 1777], 7838)
-    femmesh.addVolume([2231, 1757, 2013, 2257], 7839)
-    femmesh.addVolume([2022, 1774, 2257, 1795], 7840)
-    femmesh.addVolume([1741, 2238, 2251, 1786], 7841)
-    femmesh.addVolume([1749, 2006, 1731, 1775], 7842)
-    femmesh.addVolume([1741, 2008, 2025, 1786], 7843)
-    femmesh.addVolume([2257, 2022, 2013, 1774], 7844)
-    femmesh.addVolume([2227, 2038, 1724, 2258], 7845)
-    femmesh.addVolume([2026, 1780, 2008, 1737], 7846)
-    femmesh.addVolume([2013, 1757, 1742, 2257], 7847)
-    femmesh.addVolume([1749, 2027, 2006, 1785], 7848)
-    femmesh.addVolume([2020, 1794, 2249, 1775], 7849)
-    femmesh.addVolume([1758, 2254, 2238, 1802], 7850)
-    femmesh.addVolume([1724, 681, 2261, 2258], 7851)
-    femmesh.addVolume([1799, 2019, 2009, 1756], 7852)
-    femmesh.addVolume([2014, 1758, 2025, 1802], 7853)
-    femmesh.addVolume([1742, 2022, 2013, 2257], 7854)
-    femmesh.addVolume([2228, 2035, 1792, 3190], 7855)
-    femmesh.addVolume([2035, 2228, 1750, 3190], 7856)
-    femmesh.addVolume([1731, 2006, 2020, 1775], 7857)
-    femmesh.addVolume([2039, 2040, 680, 1723], 7858)
-    femmesh.addVolume([2041, 2038, 679, 1724], 7859)
-    femmesh.addVolume([1723, 2239, 2260, 2259], 7860)
-    femmesh.addVolume([2001, 2018, 1788, 1744], 7861)
-    femmesh.addVolume([2005, 1787, 2016, 1743], 7862)
-    femmesh.addVolume([1788, 2227, 1744, 2247], 7863)
-    femmesh.addVolume([2227, 1724, 2261, 2258], 7864)
-    femmesh.addVolume([2225, 1769, 3189, 3187], 7865)
-    femmesh.addVolume([2028, 1754, 3189, 3187], 7866)
-    femmesh.addVolume([1754, 2225, 3189, 3187], 7867)
-    femmesh.addVolume([2239, 1787, 1743, 2226], 7868)
-    femmesh.addVolume([1728, 2031, 1742, 2240], 7869)
-    femmesh.addVolume([1753, 2229, 2010, 3190], 7870)
-    femmesh.addVolume([2229, 1797, 2010, 3190], 7871)
-    femmesh.addVolume([1790, 2243, 1746, 3188], 7872)
-    femmesh.addVolume([682, 1759, 680, 1436], 7873)
-    femmesh.addVolume([681, 679, 1760, 1631], 7874)
-    femmesh.addVolume([682, 680, 1803, 1436], 7875)
-    femmesh.addVolume([681, 1804, 679, 1631], 7876)
-    femmesh.addVolume([2031, 1795, 2240, 1772], 7877)
-    femmesh.addVolume([2023, 1790, 1746, 3188], 7878)
-    femmesh.addVolume([2245, 1769, 1798, 3189], 7879)
-    femmesh.addVolume([1769, 2028, 1798, 3189], 7880)
-    femmesh.addVolume([1769, 2245, 2225, 3189], 7881)
-    femmesh.addVolume([2028, 2002, 1754, 3187], 7882)
-    femmesh.addVolume([2245, 1754, 2225, 3189], 7883)
-    femmesh.addVolume([1754, 2002, 1725, 3187], 7884)
-    femmesh.addVolume([1754, 1725, 2225, 3187], 7885)
-    femmesh.addVolume([1789, 2255, 2222, 3189], 7886)
-    femmesh.addVolume([1745, 2222, 2255, 3189], 7887)
-    femmesh.addVolume([1789, 2222, 1770, 3189], 7888)
-    femmesh.addVolume([2222, 1745, 1726, 3189], 7889)
-    femmesh.addVolume([2029, 1726, 1745, 3189], 7890)
-    femmesh.addVolume([2029, 1789, 1770, 3189], 7891)
-    femmesh.addVolume([2029, 2004, 1726, 3189], 7892)
-    femmesh.addVolume([1770, 2004, 2029, 3189], 7893)
-    femmesh.addVolume([1804, 679, 1768, 681], 7894)
-    femmesh.addVolume([1759, 680, 1723, 682], 7895)
-    femmesh.addVolume([679, 1760, 1724, 681], 7896)
-    femmesh.addVolume([680, 1803, 1767, 682], 7897)
-    femmesh.addVolume([1733, 1812, 2254, 1776], 7898)
-    femmesh.addVolume([1812, 1733, 2014, 1776], 7899)
-    femmesh.addVolume([1737, 2026, 1780, 2235], 7900)
-    femmesh.addVolume([2020, 2249, 1731, 1775], 7901)
-    femmesh.addVolume([1755, 2024, 3188, 3187], 7902)
-    femmesh.addVolume([2241, 1755, 3188, 3187], 7903)
-    femmesh.addVolume([1728, 2003, 1814, 1761], 7904)
-    femmesh.addVolume([2024, 1800, 3188, 3187], 7905)
-    femmesh.addVolume([2010, 1736, 1753, 3190], 7906)
-    femmesh.addVolume([1807, 1812, 2017, 1776], 7907)
-    femmesh.addVolume([2003, 1814, 2031, 1728], 7908)
-    femmesh.addVolume([1812, 1763, 1733, 2234], 7909)
-    femmesh.addVolume([1755, 2024, 1739, 3188], 7910)
-    femmesh.addVolume([1806, 2003, 1814, 1772], 7911)
-    femmesh.addVolume([1772, 2232, 1814, 1805], 7912)
-    femmesh.addVolume([1733, 2017, 1764, 1812], 7913)
-    femmesh.addVolume([2003, 2031, 1814, 1772], 7914)
-    femmesh.addVolume([2232, 1814, 1728, 2240], 7915)
-    femmesh.addVolume([1812, 1733, 2254, 2234], 7916)
-    femmesh.addVolume([2234, 2254, 1812, 1776], 7917)
-    femmesh.addVolume([680, 1759, 1435, 1436], 7918)
-    femmesh.addVolume([1760, 679, 1627, 1631], 7919)
-    femmesh.addVolume([679, 1804, 1629, 1631], 7920)
-    femmesh.addVolume([1803, 680, 1437, 1436], 7921)
-    femmesh.addVolume([2024, 2007, 1739, 3188], 7922)
-    femmesh.addVolume([1812, 1808, 2234, 1776], 7923)
-    femmesh.addVolume([1762, 1814, 1728, 2232], 7924)
-    femmesh.addVolume([1814, 2240, 2232, 1772], 7925)
-    femmesh.addVolume([1736, 2010, 2021, 3190], 7926)
-    femmesh.addVolume([1753, 1736, 2248, 3190], 7927)
-    femmesh.addVolume([1753, 2248, 2229, 3190], 7928)
-    femmesh.addVolume([1800, 2241, 3188, 3187], 7929)
-    femmesh.addVolume([1627, 679, 1628, 1631], 7930)
-    femmesh.addVolume([1628, 679, 1629, 1631], 7931)
-    femmesh.addVolume([1437, 680, 1439, 1436], 7932)
-    femmesh.addVolume([1435, 1439, 680, 1436], 7933)
-    femmesh.addVolume([1812, 2014, 2017, 1776], 7934)
-    femmesh.addVolume([2010, 1797, 1779, 3190], 7935)
-    femmesh.addVolume([1733, 2014, 2017, 1812], 7936)
-    femmesh.addVolume([2021, 2010, 1779, 3190], 7937)
-    femmesh.addVolume([2241, 1755, 2224, 3188], 7938)
-    femmesh.addVolume([1755, 1739, 2224, 3188], 7939)
-    femmesh.addVolume([1783, 2024, 1800, 3188], 7940)
-    femmesh.addVolume([1779, 1797, 2248, 3190], 7941)
-    femmesh.addVolume([2229, 2248, 1797, 3190], 7942)
-    femmesh.addVolume([1783, 2007, 2024, 3188], 7943)
-    femmesh.addVolume([2003, 1728, 2031, 1761], 7944)
-    femmesh.addVolume([1764, 2014, 2017, 1733], 7945)
-    femmesh.addVolume([2017, 2014, 1807, 1776], 7946)
-    femmesh.addVolume([2003, 1806, 2031, 1772], 7947)
-    femmesh.addVolume([1761, 1814, 1728, 1762], 7948)
-    femmesh.addVolume([2254, 1733, 1763, 2234], 7949)
-    femmesh.addVolume([1772, 1814, 1806, 1805], 7950)
-    femmesh.addVolume([1807, 1808, 1812, 1776], 7951)
-    femmesh.addVolume([1751, 1738, 454, 2233], 7952)
-    femmesh.addVolume([1740, 2236, 447, 2250], 7953)
-    femmesh.addVolume([614, 2236, 1784, 2250], 7954)
-    femmesh.addVolume([2253, 454, 1738, 2233], 7955)
-    femmesh.addVolume([1749, 1731, 456, 2230], 7956)
-    femmesh.addVolume([2228, 1750, 448, 2250], 7957)
-    femmesh.addVolume([2233, 621, 1781, 2253], 7958)
-    femmesh.addVolume([2230, 1731, 456, 2249], 7959)
-    femmesh.addVolume([641, 2245, 1769, 1798], 7960)
-    femmesh.addVolume([2253, 1756, 453, 2237], 7961)
-    femmesh.addVolume([2229, 1753, 450, 2248], 7962)
-    femmesh.addVolume([615, 1792, 2228, 2250], 7963)
-    femmesh.addVolume([470, 2243, 1746, 2223], 7964)
-    femmesh.addVolume([1736, 450, 1753, 2248], 7965)
-    femmesh.addVolume([614, 1784, 2236, 1791], 7966)
-    femmesh.addVolume([2229, 617, 1797, 2248], 7967)
-    femmesh.addVolume([1790, 2223, 2243, 637], 7968)
-    femmesh.addVolume([1745, 477, 1727, 2255], 7969)
-    femmesh.addVolume([1779, 1797, 617, 2248], 7970)
-    femmesh.addVolume([1746, 1729, 470, 2223], 7971)
-    femmesh.addVolume([1773, 2223, 1790, 637], 7972)
-    femmesh.addVolume([1731, 1751, 455, 2249], 7973)
-    femmesh.addVolume([2229, 451, 1734, 2246], 7974)
-    femmesh.addVolume([1738, 1756, 453, 2253], 7975)
-    femmesh.addVolume([1792, 615, 1784, 2250], 7976)
-    femmesh.addVolume([1769, 2225, 2245, 641], 7977)
-    femmesh.addVolume([2233, 455, 1751, 2249], 7978)
-    femmesh.addVolume([448, 1750, 1740, 2250], 7979)
-    femmesh.addVolume([2237, 1756, 452, 2246], 7980)
-    femmesh.addVolume([452, 1756, 1734, 2246], 7981)
-    femmesh.addVolume([1740, 1748, 447, 2236], 7982)
-    femmesh.addVolume([1777, 1799, 619, 2246], 7983)
-    femmesh.addVolume([619, 1799, 2237, 2246], 7984)
-    femmesh.addVolume([2229, 1753, 1734, 451], 7985)
-    femmesh.addVolume([2255, 477, 1727, 2221], 7986)
-    femmesh.addVolume([1777, 618, 2229, 2246], 7987)
-    femmesh.addVolume([2028, 515, 1769, 1798], 7988)
-    femmesh.addVolume([1777, 1797, 2229, 618], 7989)
-    femmesh.addVolume([1781, 2237, 2253, 620], 7990)
-    femmesh.addVolume([2002, 515, 1769, 2028], 7991)
-    femmesh.addVolume([2237, 1781, 1799, 620], 7992)
-    femmesh.addVolume([2241, 1755, 472, 2224], 7993)
-    femmesh.addVolume([2221, 1789, 2255, 644], 7994)
-    femmesh.addVolume([1739, 472, 1755, 2224], 7995)
-    femmesh.addVolume([1771, 1789, 2221, 644], 7996)
-    femmesh.addVolume([1754, 378, 2002, 2028], 7997)
-    femmesh.addVolume([2002, 378, 1754, 1725], 7998)
-    femmesh.addVolume([2245, 1754, 474, 2225], 7999)
-    femmesh.addVolume([1725, 474, 1754, 2225], 8000)
-    femmesh.addVolume([1745, 2255, 2222, 476], 8001)
-    femmesh.addVolume([2222, 2255, 1789, 643], 8002)
-    femmesh.addVolume([2222, 643, 1789, 1770], 8003)
-    femmesh.addVolume([1745, 476, 2222, 1726], 8004)
-    femmesh.addVolume([446, 1748, 1735, 2236], 8005)
-    femmesh.addVolume([1745, 2029, 380, 1726], 8006)
-    femmesh.addVolume([380, 2029, 2004, 1726], 8007)
-    femmesh.addVolume([351, 2012, 1748, 1740], 8008)
-    femmesh.addVolume([1732, 1749, 457, 2244], 8009)
-    femmesh.addVolume([1789, 1770, 517, 2029], 8010)
-    femmesh.addVolume([2230, 457, 1749, 2244], 8011)
-    femmesh.addVolume([517, 2029, 1770, 2004], 8012)
-    femmesh.addVolume([1781, 621, 2233, 1794], 8013)
-    femmesh.addVolume([1793, 1771, 2221, 645], 8014)
-    femmesh.addVolume([1729, 2242, 469, 2223], 8015)
-    femmesh.addVolume([2223, 1773, 2242, 636], 8016)
-    femmesh.addVolume([478, 2256, 1727, 2221], 8017)
-    femmesh.addVolume([1747, 1727, 478, 2256], 8018)
-    femmesh.addVolume([1784, 489, 2035, 2012], 8019)
-    femmesh.addVolume([2035, 489, 1784, 1792], 8020)
-    femmesh.addVolume([2030, 382, 1747, 1727], 8021)
-    femmesh.addVolume([2012, 1748, 2032, 351], 8022)
-    femmesh.addVolume([488, 2032, 2012, 1784], 8023)
-    femmesh.addVolume([2032, 1784, 488, 1791], 8024)
-    femmesh.addVolume([1793, 2221, 2256, 645], 8025)
-    femmesh.addVolume([1773, 1796, 2242, 636], 8026)
-    femmesh.addVolume([1729, 1752, 469, 2242], 8027)
-    femmesh.addVolume([1782, 520, 2030, 1793], 8028)
-    femmesh.addVolume([2032, 487, 1778, 1791], 8029)
-    femmesh.addVolume([1764, 1763, 1733, 1812], 8030)
-    femmesh.addVolume([2236, 1791, 1778, 613], 8031)
-    femmesh.addVolume([2236, 1735, 446, 2247], 8032)
-    femmesh.addVolume([2030, 1793, 519, 1771], 8033)
-    femmesh.addVolume([382, 2030, 2015, 1727], 8034)
-    femmesh.addVolume([376, 2024, 1739, 1755], 8035)
-    femmesh.addVolume([2249, 1794, 2233, 622], 8036)
-    femmesh.addVolume([1747, 479, 1730, 2256], 8037)
-    femmesh.addVolume([2012, 352, 2035, 1740], 8038)
-    femmesh.addVolume([1750, 2035, 352, 1740], 8039)
-    femmesh.addVolume([1796, 2037, 510, 1773], 8040)
-    femmesh.addVolume([1727, 2015, 381, 1745], 8041)
-    femmesh.addVolume([1732, 2027, 361, 1749], 8042)
-    femmesh.addVolume([2029, 381, 2015, 1745], 8043)
-    femmesh.addVolume([519, 2015, 2030, 1771], 8044)
-    femmesh.addVolume([1747, 383, 2030, 1730], 8045)
-    femmesh.addVolume([2257, 1774, 2231, 626], 8046)
-    femmesh.addVolume([2026, 509, 1796, 2011], 8047)
-    femmesh.addVolume([1778, 2247, 2236, 613], 8048)
-    femmesh.addVolume([2032, 350, 1748, 1735], 8049)
-    femmesh.addVolume([2037, 1796, 510, 2011], 8050)
-    femmesh.addVolume([1757, 2027, 362, 1732], 8051)
-    femmesh.addVolume([373, 2037, 1752, 1729], 8052)
-    femmesh.addVolume([2015, 518, 1789, 1771], 8053)
-    femmesh.addVolume([507, 2025, 2008, 1786], 8054)
-    femmesh.addVolume([2029, 518, 1789, 2015], 8055)
-    femmesh.addVolume([2257, 1795, 1774, 626], 8056)
-    femmesh.addVolume([1774, 499, 2027, 1801], 8057)
-    femmesh.addVolume([1782, 1793, 2256, 646], 8058)
-    femmesh.addVolume([2242, 1752, 468, 2235], 8059)
-    femmesh.addVolume([2235, 2242, 1796, 635], 8060)
-    femmesh.addVolume([1783, 2024, 513, 1800], 8061)
-    femmesh.addVolume([1752, 2011, 2037, 373], 8062)
-    femmesh.addVolume([2030, 520, 1782, 2016], 8063)
-    femmesh.addVolume([1774, 2231, 625, 1801], 8064)
-    femmesh.addVolume([458, 2231, 1732, 2244], 8065)
-    femmesh.addVolume([1778, 487, 2032, 2018], 8066)
-    femmesh.addVolume([625, 2231, 2244, 1801], 8067)
-    femmesh.addVolume([2019, 1799, 493, 1777], 8068)
-    femmesh.addVolume([1751, 2036, 358, 1738], 8069)
-    femmesh.addVolume([1734, 2033, 355, 1753], 8070)
-    femmesh.addVolume([458, 1757, 1732, 2231], 8071)
-    femmesh.addVolume([370, 2008, 2025, 1741], 8072)
-    femmesh.addVolume([2027, 1801, 498, 1785], 8073)
-    femmesh.addVolume([639, 1800, 2241, 3188], 8074)
-    femmesh.addVolume([1808, 2254, 2234, 1776], 8075)
-    femmesh.addVolume([1796, 509, 2026, 1780], 8076)
-    femmesh.addVolume([2030, 383, 2016, 1730], 8077)
-    femmesh.addVolume([2256, 479, 1730, 2226], 8078)
-    femmesh.addVolume([1739, 2007, 2024, 376], 8079)
-    femmesh.addVolume([1775, 1794, 2249, 622], 8080)
-    femmesh.addVolume([492, 1797, 2033, 1777], 8081)
-    femmesh.addVolume([350, 2032, 2018, 1735], 8082)
-    femmesh.addVolume([493, 2033, 2019, 1777], 8083)
-    femmesh.addVolume([361, 2027, 2006, 1749], 8084)
-    femmesh.addVolume([1802, 2025, 507, 1786], 8085)
-    femmesh.addVolume([2036, 495, 1781, 1794], 8086)
-    femmesh.addVolume([496, 2036, 2020, 1794], 8087)
-    femmesh.addVolume([499, 2027, 2013, 1774], 8088)
-    femmesh.addVolume([1741, 2251, 467, 2235], 8089)
-    femmesh.addVolume([2251, 634, 2235, 1786], 8090)
-    femmesh.addVolume([362, 2013, 2027, 1757], 8091)
-    femmesh.addVolume([384, 2016, 1730, 1743], 8092)
-    femmesh.addVolume([349, 2018, 1744, 1735], 8093)
-    femmesh.addVolume([1735, 1744, 445, 2247], 8094)
-    femmesh.addVolume([1741, 2025, 370, 1758], 8095)
-    femmesh.addVolume([2026, 372, 2011, 1737], 8096)
-    femmesh.addVolume([498, 2006, 2027, 1785], 8097)
-    femmesh.addVolume([2226, 1782, 2256, 646], 8098)
-    femmesh.addVolume([468, 1752, 1737, 2235], 8099)
-    femmesh.addVolume([1780, 2235, 1796, 635], 8100)
-    femmesh.addVolume([2024, 1783, 513, 2007], 8101)
-    femmesh.addVolume([1752, 2011, 372, 1737], 8102)
-    femmesh.addVolume([1757, 2231, 459, 2257], 8103)
-    femmesh.addVolume([1772, 2240, 2232, 1805], 8104)
-    femmesh.addVolume([1794, 2020, 496, 1775], 8105)
-    femmesh.addVolume([500, 1774, 2022, 1795], 8106)
-    femmesh.addVolume([2009, 358, 2036, 1738], 8107)
-    femmesh.addVolume([355, 2033, 2010, 1753], 8108)
-    femmesh.addVolume([1781, 1799, 494, 2009], 8109)
-    femmesh.addVolume([1779, 2010, 491, 1797], 8110)
-    femmesh.addVolume([2009, 495, 1781, 2036], 8111)
-    femmesh.addVolume([492, 2010, 2033, 1797], 8112)
-    femmesh.addVolume([467, 1737, 1741, 2235], 8113)
-    femmesh.addVolume([634, 1780, 2235, 1786], 8114)
-    femmesh.addVolume([2013, 2022, 500, 1774], 8115)
-    femmesh.addVolume([466, 2251, 1741, 2238], 8116)
-    femmesh.addVolume([633, 2251, 2238, 1786], 8117)
-    femmesh.addVolume([459, 1742, 1757, 2257], 8118)
-    femmesh.addVolume([1762, 2232, 1728, 2240], 8119)
-    femmesh.addVolume([1775, 2249, 2230, 623], 8120)
-    femmesh.addVolume([2006, 1731, 360, 1749], 8121)
-    femmesh.addVolume([2020, 359, 1731, 1751], 8122)
-    femmesh.addVolume([374, 1746, 2023, 1729], 8123)
-    femmesh.addVolume([1436, 1803, 682, 1434], 8124)
-    femmesh.addVolume([1804, 1631, 681, 1632], 8125)
-    femmesh.addVolume([681, 1760, 1630, 1631], 8126)
-    femmesh.addVolume([1759, 682, 1432, 1436], 8127)
-    femmesh.addVolume([2244, 1785, 2230, 624], 8128)
-    femmesh.addVolume([2019, 1734, 356, 1756], 8129)
-    femmesh.addVolume([2037, 374, 2023, 1729], 8130)
-    femmesh.addVolume([1785, 2244, 1801, 624], 8131)
-    femmesh.addVolume([633, 2238, 1802, 1786], 8132)
-    femmesh.addVolume([1741, 1758, 466, 2238], 8133)
-    femmesh.addVolume([384, 2005, 2016, 1743], 8134)
-    femmesh.addVolume([2018, 1744, 2001, 349], 8135)
-    femmesh.addVolume([359, 2020, 2036, 1751], 8136)
-    femmesh.addVolume([2247, 1778, 1788, 612], 8137)
-    femmesh.addVolume([2226, 1787, 1782, 647], 8138)
-    femmesh.addVolume([494, 2009, 1799, 2019], 8139)
-    femmesh.addVolume([491, 2021, 2010, 1779], 8140)
-    femmesh.addVolume([356, 2019, 2033, 1734], 8141)
-    femmesh.addVolume([497, 2020, 2006, 1775], 8142)
-    femmesh.addVolume([1775, 2006, 497, 1785], 8143)
-    femmesh.addVolume([1738, 2009, 357, 1756], 8144)
-    femmesh.addVolume([1753, 2010, 354, 1736], 8145)
-    femmesh.addVolume([2008, 508, 1780, 2026], 8146)
-    femmesh.addVolume([2008, 371, 2026, 1737], 8147)
-    femmesh.addVolume([2227, 445, 1744, 2247], 8148)
-    femmesh.addVolume([623, 2230, 1775, 1785], 8149)
-    femmesh.addVolume([360, 2006, 2020, 1731], 8150)
-    femmesh.addVolume([1730, 480, 1743, 2226], 8151)
-    femmesh.addVolume([1778, 486, 2018, 1788], 8152)
-    femmesh.addVolume([2025, 506, 2014, 1802], 8153)
-    femmesh.addVolume([1737, 2008, 371, 1741], 8154)
-    femmesh.addVolume([508, 2008, 1780, 1786], 8155)
-    femmesh.addVolume([2240, 1795, 2257, 627], 8156)
-    femmesh.addVolume([1802, 2254, 2238, 632], 8157)
-    femmesh.addVolume([2238, 1758, 465, 2254], 8158)
-    femmesh.addVolume([357, 2009, 2019, 1756], 8159)
-    femmesh.addVolume([2021, 354, 2010, 1736], 8160)
-    femmesh.addVolume([1787, 1782, 521, 2016], 8161)
-    femmesh.addVolume([1742, 2013, 363, 1757], 8162)
-    femmesh.addVolume([2023, 1746, 375, 3188], 8163)
-    femmesh.addVolume([2247, 1788, 2227, 612], 8164)
-    femmesh.addVolume([2226, 2239, 1787, 647], 8165)
-    femmesh.addVolume([1788, 486, 2018, 2001], 8166)
-    femmesh.addVolume([363, 2022, 2013, 1742], 8167)
-    femmesh.addVolume([2031, 501, 2022, 1795], 8168)
-    femmesh.addVolume([1787, 2016, 521, 2005], 8169)
-    femmesh.addVolume([639, 2241, 2224, 3188], 8170)
-    femmesh.addVolume([639, 1783, 1800, 3188], 8171)
-    femmesh.addVolume([375, 1746, 1739, 3188], 8172)
-    femmesh.addVolume([2239, 1743, 480, 2226], 8173)
-    femmesh.addVolume([1742, 2022, 2031, 364], 8174)
-    femmesh.addVolume([2257, 460, 1742, 2240], 8175)
-    femmesh.addVolume([2014, 369, 2025, 1758], 8176)
-    femmesh.addVolume([627, 2240, 1795, 1772], 8177)
-    femmesh.addVolume([1802, 506, 2014, 1776], 8178)
-    femmesh.addVolume([364, 2031, 1742, 1728], 8179)
-    femmesh.addVolume([1572, 1810, 1575, 1952], 8180)
-    femmesh.addVolume([1573, 1766, 1570, 1950], 8181)
-    femmesh.addVolume([1494, 1491, 1809, 1877], 8182)
-    femmesh.addVolume([1489, 1875, 1492, 1765], 8183)
-    femmesh.addVolume([1492, 1875, 1495, 1765], 8184)
-    femmesh.addVolume([1497, 1494, 1809, 1877], 8185)
-    femmesh.addVolume([1766, 1567, 1570, 1950], 8186)
-    femmesh.addVolume([1952, 1572, 1810, 1569], 8187)
-    femmesh.addVolume([1776, 2254, 1802, 632], 8188)
-    femmesh.addVolume([465, 1758, 1733, 2254], 8189)
-    femmesh.addVolume([501, 1795, 2031, 1772], 8190)
-    femmesh.addVolume([1742, 460, 1728, 2240], 8191)
-    femmesh.addVolume([2007, 2023, 375, 3188], 8192)
-    femmesh.addVolume([1570, 106, 1766, 1573], 8193)
-    femmesh.addVolume([1575, 235, 1810, 1572], 8194)
-    femmesh.addVolume([1489, 1492, 79, 1765], 8195)
-    femmesh.addVolume([1491, 1809, 208, 1494], 8196)
-    femmesh.addVolume([1733, 369, 2014, 1758], 8197)
-    femmesh.addVolume([1494, 1809, 209, 1497], 8198)
-    femmesh.addVolume([1492, 1495, 80, 1765], 8199)
-    femmesh.addVolume([1810, 1572, 234, 1569], 8200)
-    femmesh.addVolume([1570, 1766, 105, 1567], 8201)
-    femmesh.addVolume([1816, 2234, 1812, 1808], 8202)
-    femmesh.addVolume([1812, 1811, 1763, 2234], 8203)
-    femmesh.addVolume([375, 1739, 2007, 3188], 8204)
-    femmesh.addVolume([1815, 1814, 2232, 1805], 8205)
-    femmesh.addVolume([1814, 2003, 1819, 1761], 8206)
-    femmesh.addVolume([1750, 353, 2035, 3190], 8207)
-    femmesh.addVolume([1764, 2017, 1817, 1812], 8208)
-    femmesh.addVolume([1821, 1814, 1806, 2003], 8209)
-    femmesh.addVolume([1807, 1820, 2017, 1812], 8210)
-    femmesh.addVolume([1723, 2260, 7, 682], 8211)
-    femmesh.addVolume([2232, 1762, 1814, 1813], 8212)
-    femmesh.addVolume([1624, 679, 1628, 1627], 8213)
-    femmesh.addVolume([1626, 679, 1629, 1628], 8214)
-    femmesh.addVolume([1438, 1439, 680, 1435], 8215)
-    femmesh.addVolume([1440, 1439, 1437, 680], 8216)
-    femmesh.addVolume([1728, 365, 2031, 1761], 8217)
-    femmesh.addVolume([1808, 2234, 2254, 631], 8218)
-    femmesh.addVolume([2254, 1763, 464, 2234], 8219)
-    femmesh.addVolume([2240, 1772, 628, 1805], 8220)
-    femmesh.addVolume([628, 2232, 2240, 1805], 8221)
-    femmesh.addVolume([353, 1750, 1736, 3190], 8222)
-    femmesh.addVolume([1776, 1808, 2254, 631], 8223)
-    femmesh.addVolume([502, 2031, 1806, 1772], 8224)
-    femmesh.addVolume([2031, 365, 2003, 1761], 8225)
-    femmesh.addVolume([1763, 464, 1733, 2254], 8226)
-    femmesh.addVolume([2243, 471, 1746, 3188], 8227)
-    femmesh.addVolume([2014, 505, 1807, 1776], 8228)
-    femmesh.addVolume([1728, 461, 1762, 2240], 8229)
-    femmesh.addVolume([2261, 1724, 8, 681], 8230)
-    femmesh.addVolume([1806, 2031, 502, 2003], 8231)
-    femmesh.addVolume([2021, 2035, 353, 3190], 8232)
-    femmesh.addVolume([2023, 512, 1790, 3188], 8233)
-    femmesh.addVolume([2017, 505, 1807, 2014], 8234)
-    femmesh.addVolume([2232, 1762, 461, 2240], 8235)
-    femmesh.addVolume([681, 12, 1804, 1632], 8236)
-    femmesh.addVolume([14, 682, 1803, 1434], 8237)
-    femmesh.addVolume([1630, 8, 1760, 681], 8238)
-    femmesh.addVolume([7, 1432, 1759, 682], 8239)
-    femmesh.addVolume([353, 1736, 2021, 3190], 8240)
-    femmesh.addVolume([385, 2040, 2005, 1743], 8241)
-    femmesh.addVolume([368, 2014, 1764, 1733], 8242)
-    femmesh.addVolume([449, 1750, 2228, 3190], 8243)
-    femmesh.addVolume([1739, 1746, 471, 3188], 8244)
-    femmesh.addVolume([1496, 1877, 1876, 1493], 8245)
-    femmesh.addVolume([1493, 1876, 1496, 1875], 8246)
-    femmesh.addVolume([1950, 1571, 1574, 1954], 8247)
-    femmesh.addVolume([1574, 1571, 1952, 1954], 8248)
-    femmesh.addVolume([2209, 1414, 1417, 2210], 8249)
-    femmesh.addVolume([1416, 2211, 1419, 2210], 8250)
-    femmesh.addVolume([2056, 1645, 1648, 2060], 8251)
-    femmesh.addVolume([2060, 1650, 2058, 1647], 8252)
-    femmesh.addVolume([2135, 157, 1344, 1337], 8253)
-    femmesh.addVolume([157, 1340, 2135, 1341], 8254)
-    femmesh.addVolume([1792, 2035, 490, 3190], 8255)
-    femmesh.addVolume([2060, 2057, 1646, 2058], 8256)
-    femmesh.addVolume([2060, 2056, 1646, 2057], 8257)
-    femmesh.addVolume([2210, 2213, 2211, 1421], 8258)
-    femmesh.addVolume([2210, 2209, 2213, 1421], 8259)
-    femmesh.addVolume([1650, 2060, 1649, 1647], 8260)
-    femmesh.addVolume([1649, 1648, 1645, 2060], 8261)
-    femmesh.addVolume([2210, 1419, 1416, 1418], 8262)
-    femmesh.addVolume([2210, 1414, 1417, 1418], 8263)
-    femmesh.addVolume([1877, 1496, 1494, 1493], 8264)
-    femmesh.addVolume([1875, 1496, 1493, 1492], 8265)
-    femmesh.addVolume([1570, 1571, 1574, 1950], 8266)
-    femmesh.addVolume([1572, 1571, 1952, 1574], 8267)
-    femmesh.addVolume([1952, 1955, 1575, 1954], 8268)
-    femmesh.addVolume([1573, 1953, 1950, 1954], 8269)
-    femmesh.addVolume([1491, 1874, 1877, 1876], 8270)
-    femmesh.addVolume([1875, 1876, 1872, 1489], 8271)
-    femmesh.addVolume([2135, 1339, 2138, 2136], 8272)
-    femmesh.addVolume([2134, 2138, 2135, 1339], 8273)
-    femmesh.addVolume([2135, 2131, 1342, 2132], 8274)
-    femmesh.addVolume([1342, 2133, 2135, 2132], 8275)
-    femmesh.addVolume([482, 1812, 1807, 1808], 8276)
-    femmesh.addVolume([1878, 1879, 1875, 1495], 8277)
-    femmesh.addVolume([1880, 1497, 1877, 1879], 8278)
-    femmesh.addVolume([1950, 1567, 1951, 1947], 8279)
-    femmesh.addVolume([1569, 1949, 1952, 1951], 8280)
-    femmesh.addVolume([682, 14, 1767, 2259], 8281)
-    femmesh.addVolume([2058, 1646, 2060, 1647], 8282)
-    femmesh.addVolume([2056, 1646, 1645, 2060], 8283)
-    femmesh.addVolume([2209, 2210, 1417, 1421], 8284)
-    femmesh.addVolume([2210, 2211, 1419, 1421], 8285)
-    femmesh.addVolume([2207, 2208, 1415, 2210], 8286)
-    femmesh.addVolume([1415, 2206, 2207, 2210], 8287)
-    femmesh.addVolume([1652, 2063, 2060, 2061], 8288)
-    femmesh.addVolume([2059, 2060, 1652, 2063], 8289)
-    femmesh.addVolume([1342, 1344, 2131, 2135], 8290)
-    femmesh.addVolume([1341, 2135, 1342, 2133], 8291)
-    femmesh.addVolume([2135, 1337, 2134, 1339], 8292)
-    femmesh.addVolume([1340, 1339, 2135, 2136], 8293)
-    femmesh.addVolume([1575, 1574, 1952, 1954], 8294)
-    femmesh.addVolume([1950, 1574, 1573, 1954], 8295)
-    femmesh.addVolume([1876, 1875, 1493, 1489], 8296)
-    femmesh.addVolume([1876, 1877, 1491, 1493], 8297)
-    femmesh.addVolume([288, 1763, 1764, 1812], 8298)
-    femmesh.addVolume([1496, 1877, 1497, 1879], 8299)
-    femmesh.addVolume([1496, 1875, 1879, 1495], 8300)
-    femmesh.addVolume([1571, 1567, 1951, 1950], 8301)
-    femmesh.addVolume([1951, 1952, 1569, 1571], 8302)
-    femmesh.addVolume([1416, 1415, 2208, 2210], 8303)
-    femmesh.addVolume([2206, 1415, 1414, 2210], 8304)
-    femmesh.addVolume([1652, 2059, 1648, 2060], 8305)
-    femmesh.addVolume([1652, 2061, 2060, 1650], 8306)
-    femmesh.addVolume([1646, 1649, 1645, 2060], 8307)
-    femmesh.addVolume([1649, 2060, 1646, 1647], 8308)
-    femmesh.addVolume([1418, 1417, 2210, 1421], 8309)
-    femmesh.addVolume([1419, 1418, 2210, 1421], 8310)
-    femmesh.addVolume([1806, 1814, 484, 1805], 8311)
-    femmesh.addVolume([1952, 1575, 1572, 1574], 8312)
-    femmesh.addVolume([1573, 1570, 1574, 1950], 8313)
-    femmesh.addVolume([1492, 1493, 1875, 1489], 8314)
-    femmesh.addVolume([1491, 1877, 1494, 1493], 8315)
-    femmesh.addVolume([1344, 1342, 157, 2135], 8316)
-    femmesh.addVolume([157, 2135, 1342, 1341], 8317)
-    femmesh.addVolume([157, 1337, 2135, 1339], 8318)
-    femmesh.addVolume([157, 1339, 2135, 1340], 8319)
-    femmesh.addVolume([1764, 2017, 2014, 368], 8320)
-    femmesh.addVolume([1804, 1768, 12, 681], 8321)
-    femmesh.addVolume([2023, 2007, 512, 3188], 8322)
-    femmesh.addVolume([1494, 1877, 1497, 1496], 8323)
-    femmesh.addVolume([1495, 1496, 1875, 1492], 8324)
-    femmesh.addVolume([1567, 1571, 1570, 1950], 8325)
-    femmesh.addVolume([1569, 1952, 1572, 1571], 8326)
-    femmesh.addVolume([1415, 2210, 1416, 1418], 8327)
-    femmesh.addVolume([2210, 1415, 1414, 1418], 8328)
-    femmesh.addVolume([1652, 1648, 1649, 2060], 8329)
-    femmesh.addVolume([2060, 1649, 1652, 1650], 8330)
-    femmesh.addVolume([286, 1814, 1761, 1762], 8331)
-    femmesh.addVolume([2056, 2053, 1642, 2057], 8332)
-    femmesh.addVolume([1644, 2057, 2055, 2058], 8333)
-    femmesh.addVolume([2214, 2213, 1422, 2211], 8334)
-    femmesh.addVolume([2209, 1420, 2212, 2213], 8335)
-    femmesh.addVolume([1767, 1803, 14, 682], 8336)
-    femmesh.addVolume([1760, 8, 1724, 681], 8337)
-    femmesh.addVolume([7, 1759, 1723, 682], 8338)
-    femmesh.addVolume([1577, 1957, 1953, 1954], 8339)
-    femmesh.addVolume([1957, 1577, 1955, 1954], 8340)
-    femmesh.addVolume([1873, 1876, 1490, 1872], 8341)
-    femmesh.addVolume([1490, 1874, 1876, 1873], 8342)
-    femmesh.addVolume([2040, 385, 1723, 1743], 8343)
-    femmesh.addVolume([1338, 2137, 2134, 2138], 8344)
-    femmesh.addVolume([1720, 2131, 2128, 2132], 8345)
-    femmesh.addVolume([2130, 2133, 1722, 2132], 8346)
-    femmesh.addVolume([2139, 2138, 1343, 2136], 8347)
-    femmesh.addVolume([1499, 1880, 1882, 1879], 8348)
-    femmesh.addVolume([1879, 1882, 1499, 1878], 8349)
-    femmesh.addVolume([1948, 1951, 1949, 1568], 8350)
-    femmesh.addVolume([1947, 1951, 1948, 1568], 8351)
-    femmesh.addVolume([2207, 2208, 2205, 1413], 8352)
-    femmesh.addVolume([2207, 2206, 1411, 2203], 8353)
-    femmesh.addVolume([1651, 2062, 2059, 2063], 8354)
-    femmesh.addVolume([2061, 2063, 2064, 1653], 8355)
-    femmesh.addVolume([1642, 1646, 2056, 2057], 8356)
-    femmesh.addVolume([2057, 1644, 1646, 2058], 8357)
-    femmesh.addVolume([2211, 2213, 1422, 1421], 8358)
-    femmesh.addVolume([2213, 2209, 1420, 1421], 8359)
-    femmesh.addVolume([1953, 1573, 1577, 1954], 8360)
-    femmesh.addVolume([1575, 1955, 1577, 1954], 8361)
-    femmesh.addVolume([1490, 1872, 1876, 1489], 8362)
-    femmesh.addVolume([1876, 1491, 1874, 1490], 8363)
-    femmesh.addVolume([2138, 2134, 1338, 1339], 8364)
-    femmesh.addVolume([1342, 1722, 2133, 2132], 8365)
-    femmesh.addVolume([1342, 2131, 1720, 2132], 8366)
-    femmesh.addVolume([1343, 2138, 1339, 2136], 8367)
-    femmesh.addVolume([1878, 1499, 1879, 1495], 8368)
-    femmesh.addVolume([1880, 1499, 1497, 1879], 8369)
-    femmesh.addVolume([1951, 1947, 1567, 1568], 8370)
-    femmesh.addVolume([1949, 1951, 1569, 1568], 8371)
-    femmesh.addVolume([1646, 2058, 1644, 1647], 8372)
-    femmesh.addVolume([2056, 1642, 1645, 1646], 8373)
-    femmesh.addVolume([1422, 1419, 2211, 1421], 8374)
-    femmesh.addVolume([1417, 1420, 2209, 1421], 8375)
-    femmesh.addVolume([1415, 2208, 2207, 1413], 8376)
-    femmesh.addVolume([1411, 2207, 1415, 2206], 8377)
-    femmesh.addVolume([2059, 1652, 1651, 2063], 8378)
-    femmesh.addVolume([2061, 1652, 2063, 1653], 8379)
-    femmesh.addVolume([1720, 1344, 2131, 1342], 8380)
-    femmesh.addVolume([2133, 1342, 1341, 1722], 8381)
-    femmesh.addVolume([1338, 2134, 1337, 1339], 8382)
-    femmesh.addVolume([1339, 1340, 1343, 2136], 8383)
-    femmesh.addVolume([1577, 1574, 1575, 1954], 8384)
-    femmesh.addVolume([1577, 1573, 1574, 1954], 8385)
-    femmesh.addVolume([1491, 1490, 1876, 1493], 8386)
-    femmesh.addVolume([1876, 1493, 1490, 1489], 8387)
-    femmesh.addVolume([1496, 1879, 1499, 1495], 8388)
-    femmesh.addVolume([1499, 1496, 1497, 1879], 8389)
-    femmesh.addVolume([1571, 1569, 1951, 1568], 8390)
-    femmesh.addVolume([1951, 1567, 1571, 1568], 8391)
-    femmesh.addVolume([1411, 1415, 1414, 2206], 8392)
-    femmesh.addVolume([1415, 1416, 2208, 1413], 8393)
-    femmesh.addVolume([2059, 1648, 1651, 1652], 8394)
-    femmesh.addVolume([1650, 1652, 2061, 1653], 8395)
-    femmesh.addVolume([482, 1816, 1812, 1808], 8396)
-    femmesh.addVolume([680, 1723, 2040, 1759], 8397)
-    femmesh.addVolume([1724, 679, 2041, 1760], 8398)
-    femmesh.addVolume([449, 1736, 1750, 3190], 8399)
-    femmesh.addVolume([2054, 2055, 1643, 2057], 8400)
-    femmesh.addVolume([2054, 1643, 2053, 2057], 8401)
-    femmesh.addVolume([2216, 2213, 2212, 1424], 8402)
-    femmesh.addVolume([2213, 1424, 2216, 2214], 8403)
-    femmesh.addVolume([1953, 1576, 1956, 1957], 8404)
-    femmesh.addVolume([1578, 1955, 1958, 1957], 8405)
-    femmesh.addVolume([1869, 1873, 1486, 1872], 8406)
-    femmesh.addVolume([1874, 1488, 1871, 1873], 8407)
-    femmesh.addVolume([1721, 2128, 2129, 2132], 8408)
-    femmesh.addVolume([1721, 2129, 2130, 2132], 8409)
-    femmesh.addVolume([1346, 2141, 2138, 2139], 8410)
-    femmesh.addVolume([2138, 1346, 2137, 2141], 8411)
-    femmesh.addVolume([1882, 1878, 1881, 1498], 8412)
-    femmesh.addVolume([1883, 1500, 1880, 1882], 8413)
-    femmesh.addVolume([1948, 1566, 1949, 1946], 8414)
-    femmesh.addVolume([1947, 1564, 1948, 1944], 8415)
-    femmesh.addVolume([1412, 2204, 2207, 2203], 8416)
-    femmesh.addVolume([2204, 1412, 2207, 2205], 8417)
-    femmesh.addVolume([2066, 2062, 1655, 2063], 8418)
-    femmesh.addVolume([2066, 2063, 1655, 2064], 8419)
-    femmesh.addVolume([1643, 1642, 2053, 2057], 8420)
-    femmesh.addVolume([1644, 1643, 2055, 2057], 8421)
-    femmesh.addVolume([1422, 1424, 2213, 2214], 8422)
-    femmesh.addVolume([2212, 2213, 1420, 1424], 8423)
-    femmesh.addVolume([1576, 1953, 1577, 1957], 8424)
-    femmesh.addVolume([1578, 1577, 1955, 1957], 8425)
-    femmesh.addVolume([1490, 1486, 1873, 1872], 8426)
-    femmesh.addVolume([1490, 1488, 1874, 1873], 8427)
-    femmesh.addVolume([1435, 680, 1438, 1759], 8428)
-    femmesh.addVolume([679, 1627, 1624, 1760], 8429)
-    femmesh.addVolume([1437, 1803, 1440, 680], 8430)
-    femmesh.addVolume([1626, 1629, 679, 1804], 8431)
-    femmesh.addVolume([2128, 1721, 1720, 2132], 8432)
-    femmesh.addVolume([1346, 2137, 1338, 2138], 8433)
-    femmesh.addVolume([2138, 1343, 1346, 2139], 8434)
-    femmesh.addVolume([1722, 1721, 2130, 2132], 8435)
-    femmesh.addVolume([1882, 1500, 1880, 1499], 8436)
-    femmesh.addVolume([1878, 1882, 1499, 1498], 8437)
-    femmesh.addVolume([1947, 1948, 1564, 1568], 8438)
-    femmesh.addVolume([1948, 1949, 1566, 1568], 8439)
-    femmesh.addVolume([1642, 1643, 1646, 2057], 8440)
-    femmesh.addVolume([1643, 1644, 1646, 2057], 8441)
-    femmesh.addVolume([1422, 2213, 1424, 1421], 8442)
-    femmesh.addVolume([1420, 1424, 2213, 1421], 8443)
-    femmesh.addVolume([2205, 1412, 2207, 1413], 8444)
-    femmesh.addVolume([2207, 1411, 1412, 2203], 8445)
-    femmesh.addVolume([1655, 2062, 1651, 2063], 8446)
-    femmesh.addVolume([1655, 2064, 2063, 1653], 8447)
-    femmesh.addVolume([1953, 1577, 1573, 1576], 8448)
-    femmesh.addVolume([1955, 1575, 1577, 1578], 8449)
-    femmesh.addVolume([1491, 1488, 1874, 1490], 8450)
-    femmesh.addVolume([1872, 1490, 1486, 1489], 8451)
-    femmesh.addVolume([1764, 1817, 288, 1812], 8452)
-    femmesh.addVolume([379, 2028, 1754, 3189], 8453)
-    femmesh.addVolume([516, 1798, 2028, 3189], 8454)
-    femmesh.addVolume([640, 1769, 2225, 3187], 8455)
-    femmesh.addVolume([2241, 1800, 640, 3187], 8456)
-    femmesh.addVolume([475, 1754, 2245, 3189], 8457)
-    femmesh.addVolume([642, 2245, 1798, 3189], 8458)
-    femmesh.addVolume([377, 1725, 2002, 3187], 8459)
-    femmesh.addVolume([473, 2225, 1725, 3187], 8460)
-    femmesh.addVolume([1755, 2241, 473, 3187], 8461)
-    femmesh.addVolume([2004, 379, 1726, 3189], 8462)
-    femmesh.addVolume([2004, 1770, 516, 3189], 8463)
-    femmesh.addVolume([1726, 475, 2222, 3189], 8464)
-    femmesh.addVolume([642, 1770, 2222, 3189], 8465)
-    femmesh.addVolume([1339, 1346, 2138, 1343], 8466)
-    femmesh.addVolume([1721, 1722, 1342, 2132], 8467)
-    femmesh.addVolume([2138, 1338, 1346, 1339], 8468)
-    femmesh.addVolume([1721, 1342, 1720, 2132], 8469)
-    femmesh.addVolume([1814, 1762, 286, 1813], 8470)
-    femmesh.addVolume([1821, 484, 1806, 1814], 8471)
-    femmesh.addVolume([514, 1800, 2024, 3187], 8472)
-    femmesh.addVolume([1880, 1500, 1497, 1499], 8473)
-    femmesh.addVolume([1499, 1495, 1878, 1498], 8474)
-    femmesh.addVolume([1947, 1564, 1567, 1568], 8475)
-    femmesh.addVolume([1566, 1949, 1569, 1568], 8476)
-    femmesh.addVolume([2002, 1769, 514, 3187], 8477)
-    femmesh.addVolume([2259, 1787, 2239, 648], 8478)
-    femmesh.addVolume([377, 2024, 1755, 3187], 8479)
-    femmesh.addVolume([1412, 2207, 1415, 1411], 8480)
-    femmesh.addVolume([2207, 1412, 1415, 1413], 8481)
-    femmesh.addVolume([1655, 1651, 1652, 2063], 8482)
-    femmesh.addVolume([2063, 1652, 1655, 1653], 8483)
-    femmesh.addVolume([2038, 10, 679, 1768], 8484)
-    femmesh.addVolume([2055, 1641, 2052, 2054], 8485)
-    femmesh.addVolume([1639, 2053, 2050, 2054], 8486)
-    femmesh.addVolume([1425, 2217, 2216, 2214], 8487)
-    femmesh.addVolume([2215, 2212, 1423, 2216], 8488)
-    femmesh.addVolume([681, 1768, 12, 2258], 8489)
-    femmesh.addVolume([1960, 1956, 1580, 1957], 8490)
-    femmesh.addVolume([1958, 1960, 1580, 1957], 8491)
-    femmesh.addVolume([1487, 1870, 1871, 1873], 8492)
-    femmesh.addVolume([1870, 1873, 1487, 1869], 8493)
-    femmesh.addVolume([2141, 2139, 1347, 2142], 8494)
-    femmesh.addVolume([1345, 2140, 2137, 2141], 8495)
-    femmesh.addVolume([2128, 2125, 1717, 2129], 8496)
-    femmesh.addVolume([1719, 2129, 2127, 2130], 8497)
-    femmesh.addVolume([1502, 1882, 1885, 1881], 8498)
-    femmesh.addVolume([1883, 1885, 1502, 1882], 8499)
-    femmesh.addVolume([1565, 1948, 1945, 1946], 8500)
-    femmesh.addVolume([1948, 1565, 1945, 1944], 8501)
-    femmesh.addVolume([2243, 1790, 638, 3188], 8502)
-    femmesh.addVolume([2204, 1410, 2205, 2202], 8503)
-    femmesh.addVolume([2204, 1408, 2200, 2203], 8504)
-    femmesh.addVolume([2062, 1654, 2065, 2066], 8505)
-    femmesh.addVolume([2064, 2066, 2067, 1656], 8506)
-    femmesh.addVolume([565, 1575, 1810, 1952], 8507)
-    femmesh.addVolume([1766, 1573, 331, 1950], 8508)
-    femmesh.addVolume([1809, 1491, 539, 1877], 8509)
-    femmesh.addVolume([305, 1875, 1489, 1765], 8510)
-    femmesh.addVolume([490, 2035, 2021, 3190], 8511)
-    femmesh.addVolume([611, 1768, 1788, 2258], 8512)
-    femmesh.addVolume([540, 1497, 1809, 1877], 8513)
-    femmesh.addVolume([1875, 306, 1495, 1765], 8514)
-    femmesh.addVolume([1567, 1766, 330, 1950], 8515)
-    femmesh.addVolume([1952, 1810, 564, 1569], 8516)
-    femmesh.addVolume([1643, 2053, 1639, 2054], 8517)
-    femmesh.addVolume([1643, 1641, 2055, 2054], 8518)
-    femmesh.addVolume([2216, 2212, 1423, 1424], 8519)
-    femmesh.addVolume([1425, 2216, 1424, 2214], 8520)
-    femmesh.addVolume([485, 1788, 2038, 2001], 8521)
-    femmesh.addVolume([1787, 2259, 1767, 648], 8522)
-    femmesh.addVolume([1576, 1580, 1956, 1957], 8523)
-    femmesh.addVolume([1580, 1578, 1958, 1957], 8524)
-    femmesh.addVolume([1486, 1487, 1873, 1869], 8525)
-    femmesh.addVolume([1487, 1871, 1488, 1873], 8526)
-    femmesh.addVolume([611, 1788, 2227, 2258], 8527)
-    femmesh.addVolume([1739, 471, 2224, 3188], 8528)
-    femmesh.addVolume([2137, 1346, 1345, 2141], 8529)
-    femmesh.addVolume([1346, 1347, 2141, 2139], 8530)
-    femmesh.addVolume([2129, 1717, 2128, 1721], 8531)
-    femmesh.addVolume([2130, 1719, 2129, 1721], 8532)
-    femmesh.addVolume([1639, 1642, 2053, 1643], 8533)
-    femmesh.addVolume([2055, 1644, 1641, 1643], 8534)
-    femmesh.addVolume([1424, 1422, 1425, 2214], 8535)
-    femmesh.addVolume([1423, 2212, 1420, 1424], 8536)
-    femmesh.addVolume([2228, 1792, 616, 3190], 8537)
-    femmesh.addVolume([1881, 1502, 1882, 1498], 8538)
-    femmesh.addVolume([1502, 1500, 1883, 1882], 8539)
-    femmesh.addVolume([1948, 1565, 1566, 1946], 8540)
-    femmesh.addVolume([1564, 1565, 1948, 1944], 8541)
-    femmesh.addVolume([1580, 1576, 1577, 1957], 8542)
-    femmesh.addVolume([1578, 1580, 1577, 1957], 8543)
-    femmesh.addVolume([1487, 1873, 1490, 1486], 8544)
-    femmesh.addVolume([1488, 1490, 1487, 1873], 8545)
-    femmesh.addVolume([1811, 1763, 288, 1812], 8546)
-    femmesh.addVolume([1815, 484, 1814, 1805], 8547)
-    femmesh.addVolume([1412, 1408, 2204, 2203], 8548)
-    femmesh.addVolume([2205, 2204, 1412, 1410], 8549)
-    femmesh.addVolume([2066, 2064, 1655, 1656], 8550)
-    femmesh.addVolume([1655, 1654, 2062, 2066], 8551)
-    femmesh.addVolume([1345, 2137, 1338, 1346], 8552)
-    femmesh.addVolume([1343, 1347, 1346, 2139], 8553)
-    femmesh.addVolume([2128, 1717, 1720, 1721], 8554)
-    femmesh.addVolume([1719, 2130, 1722, 1721], 8555)
-    femmesh.addVolume([485, 2038, 1788, 1768], 8556)
-    femmesh.addVolume([1882, 1502, 1500, 1499], 8557)
-    femmesh.addVolume([1499, 1882, 1502, 1498], 8558)
-    femmesh.addVolume([1566, 1565, 1948, 1568], 8559)
-    femmesh.addVolume([1564, 1948, 1565, 1568], 8560)
-    femmesh.addVolume([2039, 1787, 522, 2005], 8561)
-    femmesh.addVolume([1412, 1413, 2205, 1410], 8562)
-    femmesh.addVolume([1411, 1408, 1412, 2203], 8563)
-    femmesh.addVolume([2062, 1651, 1654, 1655], 8564)
-    femmesh.addVolume([1653, 1655, 2064, 1656], 8565)
-    femmesh.addVolume([1736, 449, 2248, 3190], 8566)
-    femmesh.addVolume([2243, 2224, 471, 3188], 8567)
-    femmesh.addVolume([1640, 2051, 2052, 2054], 8568)
-    femmesh.addVolume([2051, 1640, 2050, 2054], 8569)
-    femmesh.addVolume([2219, 2216, 1427, 2217], 8570)
-    femmesh.addVolume([1427, 2215, 2216, 2219], 8571)
-    femmesh.addVolume([1961, 1581, 1958, 1960], 8572)
-    femmesh.addVolume([1956, 1579, 1959, 1960], 8573)
-    femmesh.addVolume([1485, 1868, 1871, 1870], 8574)
-    femmesh.addVolume([1869, 1870, 1866, 1483], 8575)
-    femmesh.addVolume([2126, 2129, 2127, 1718], 8576)
-    femmesh.addVolume([2129, 2126, 2125, 1718], 8577)
-    femmesh.addVolume([1349, 2144, 2140, 2141], 8578)
-    femmesh.addVolume([2144, 2141, 1349, 2142], 8579)
-    femmesh.addVolume([1812, 1807, 1820, 482], 8580)
-    femmesh.addVolume([1814, 1761, 1819, 286], 8581)
-    femmesh.addVolume([1881, 1885, 1501, 1884], 8582)
-    femmesh.addVolume([1886, 1503, 1883, 1885], 8583)
-    femmesh.addVolume([1946, 1945, 1563, 1943], 8584)
-    femmesh.addVolume([1561, 1945, 1944, 1941], 8585)
-    femmesh.addVolume([2200, 2204, 2201, 1409], 8586)
-    femmesh.addVolume([2202, 2201, 2204, 1409], 8587)
-    femmesh.addVolume([2069, 2066, 1658, 2067], 8588)
-    femmesh.addVolume([2065, 2066, 1658, 2069], 8589)
-    femmesh.addVolume([106, 331, 1766, 1573], 8590)
-    femmesh.addVolume([565, 235, 1810, 1575], 8591)
-    femmesh.addVolume([539, 1809, 208, 1491], 8592)
-    femmesh.addVolume([305, 1489, 79, 1765], 8593)
-    femmesh.addVolume([1640, 2052, 1641, 2054], 8594)
-    femmesh.addVolume([2050, 1640, 1639, 2054], 8595)
-    femmesh.addVolume([2217, 2216, 1427, 1425], 8596)
-    femmesh.addVolume([2216, 1423, 2215, 1427], 8597)
-    femmesh.addVolume([1581, 1580, 1958, 1960], 8598)
-    femmesh.addVolume([1579, 1956, 1580, 1960], 8599)
-    femmesh.addVolume([1870, 1869, 1487, 1483], 8600)
-    femmesh.addVolume([1870, 1871, 1485, 1487], 8601)
-    femmesh.addVolume([1643, 1639, 1640, 2054], 8602)
-    femmesh.addVolume([1641, 1643, 1640, 2054], 8603)
-    femmesh.addVolume([1427, 2216, 1424, 1425], 8604)
-    femmesh.addVolume([1424, 1423, 2216, 1427], 8605)
-    femmesh.addVolume([1717, 2129, 2125, 1718], 8606)
-    femmesh.addVolume([2129, 1719, 2127, 1718], 8607)
-    femmesh.addVolume([1349, 2140, 1345, 2141], 8608)
-    femmesh.addVolume([1347, 1349, 2141, 2142], 8609)
-    femmesh.addVolume([1580, 1576, 1956, 1579], 8610)
-    femmesh.addVolume([1578, 1580, 1958, 1581], 8611)
-    femmesh.addVolume([1487, 1869, 1486, 1483], 8612)
-    femmesh.addVolume([1488, 1485, 1871, 1487], 8613)
-    femmesh.addVolume([61, 1435, 1438, 1759], 8614)
-    femmesh.addVolume([1627, 124, 1624, 1760], 8615)
-    femmesh.addVolume([1440, 190, 1803, 1437], 8616)
-    femmesh.addVolume([1629, 1804, 1626, 253], 8617)
-    femmesh.addVolume([490, 2021, 1779, 3190], 8618)
-    femmesh.addVolume([1783, 512, 2007, 3188], 8619)
-    femmesh.addVolume([1501, 1502, 1885, 1881], 8620)
-    femmesh.addVolume([1502, 1883, 1503, 1885], 8621)
-    femmesh.addVolume([1945, 1563, 1565, 1946], 8622)
-    femmesh.addVolume([1945, 1944, 1565, 1561], 8623)
-    femmesh.addVolume([540, 209, 1809, 1497], 8624)
-    femmesh.addVolume([306, 80, 1495, 1765], 8625)
-    femmesh.addVolume([330, 105, 1766, 1567], 8626)
-    femmesh.addVolume([234, 564, 1810, 1569], 8627)
-    femmesh.addVolume([1718, 2129, 1719, 1721], 8628)
-    femmesh.addVolume([1345, 1346, 1349, 2141], 8629)
-    femmesh.addVolume([1349, 2141, 1346, 1347], 8630)
-    femmesh.addVolume([1718, 1717, 2129, 1721], 8631)
-    femmesh.addVolume([1408, 2204, 2200, 1409], 8632)
-    femmesh.addVolume([2202, 2204, 1410, 1409], 8633)
-    femmesh.addVolume([2067, 2066, 1658, 1656], 8634)
-    femmesh.addVolume([1658, 2065, 1654, 2066], 8635)
-    femmesh.addVolume([1503, 1500, 1883, 1502], 8636)
-    femmesh.addVolume([1502, 1881, 1501, 1498], 8637)
-    femmesh.addVolume([1563, 1566, 1565, 1946], 8638)
-    femmesh.addVolume([1565, 1944, 1564, 1561], 8639)
-    femmesh.addVolume([1783, 1790, 512, 3188], 8640)
-    femmesh.addVolume([1412, 1410, 2204, 1409], 8641)
-    femmesh.addVolume([2204, 1408, 1412, 1409], 8642)
-    femmesh.addVolume([1658, 2066, 1655, 1656], 8643)
-    femmesh.addVolume([1654, 1655, 1658, 2066], 8644)
-    femmesh.addVolume([2049, 2052, 1638, 2051], 8645)
-    femmesh.addVolume([2050, 2045, 1636, 2051], 8646)
-    femmesh.addVolume([1426, 2218, 2215, 2219], 8647)
-    femmesh.addVolume([2217, 2219, 2220, 1428], 8648)
-    femmesh.addVolume([1960, 1583, 1959, 1963], 8649)
-    femmesh.addVolume([1960, 1961, 1583, 1963], 8650)
-    femmesh.addVolume([1870, 1484, 1868, 1867], 8651)
-    femmesh.addVolume([1867, 1870, 1484, 1866], 8652)
-    femmesh.addVolume([2124, 2127, 1716, 2126], 8653)
-    femmesh.addVolume([1714, 2125, 2122, 2126], 8654)
-    femmesh.addVolume([2143, 2140, 1348, 2144], 8655)
-    femmesh.addVolume([1350, 2145, 2144, 2142], 8656)
-    femmesh.addVolume([1888, 1505, 1885, 1884], 8657)
-    femmesh.addVolume([1886, 1885, 1888, 1505], 8658)
-    femmesh.addVolume([1562, 1943, 1945, 1942], 8659)
-    femmesh.addVolume([1942, 1945, 1562, 1941], 8660)
-    femmesh.addVolume([2202, 2201, 1407, 2199], 8661)
-    femmesh.addVolume([2200, 2201, 2197, 1405], 8662)
-    femmesh.addVolume([1657, 2068, 2065, 2069], 8663)
-    femmesh.addVolume([2067, 2069, 2070, 1659], 8664)
-    femmesh.addVolume([1767, 1787, 522, 2039], 8665)
-    femmesh.addVolume([1639, 2050, 1636, 1640], 8666)
-    femmesh.addVolume([1641, 1640, 1638, 2052], 8667)
-    femmesh.addVolume([1425, 1427, 2217, 1428], 8668)
-    femmesh.addVolume([2215, 1423, 1426, 1427], 8669)
-    femmesh.addVolume([1636, 1640, 2050, 2051], 8670)
-    femmesh.addVolume([2052, 1640, 1638, 2051], 8671)
-    femmesh.addVolume([2217, 1427, 2219, 1428], 8672)
-    femmesh.addVolume([2215, 1427, 1426, 2219], 8673)
-    femmesh.addVolume([1579, 1580, 1583, 1960], 8674)
-    femmesh.addVolume([1580, 1581, 1583, 1960], 8675)
-    femmesh.addVolume([1484, 1870, 1487, 1483], 8676)
-    femmesh.addVolume([1487, 1485, 1870, 1484], 8677)
-    femmesh.addVolume([1579, 1583, 1959, 1960], 8678)
-    femmesh.addVolume([1581, 1961, 1583, 1960], 8679)
-    femmesh.addVolume([1866, 1870, 1484, 1483], 8680)
-    femmesh.addVolume([1870, 1485, 1868, 1484], 8681)
-    femmesh.addVolume([1348, 2140, 1345, 1349], 8682)
-    femmesh.addVolume([1349, 1347, 1350, 2142], 8683)
-    femmesh.addVolume([2125, 1714, 1717, 1718], 8684)
-    femmesh.addVolume([1716, 2127, 1719, 1718], 8685)
-    femmesh.addVolume([2126, 1714, 2125, 1718], 8686)
-    femmesh.addVolume([2144, 2140, 1348, 1349], 8687)
-    femmesh.addVolume([1350, 2144, 1349, 2142], 8688)
-    femmesh.addVolume([2126, 2127, 1716, 1718], 8689)
-    femmesh.addVolume([1505, 1502, 1885, 1501], 8690)
-    femmesh.addVolume([1502, 1885, 1503, 1505], 8691)
-    femmesh.addVolume([1563, 1945, 1565, 1562], 8692)
-    femmesh.addVolume([1565, 1562, 1945, 1561], 8693)
-    femmesh.addVolume([1501, 1885, 1505, 1884], 8694)
-    femmesh.addVolume([1885, 1886, 1503, 1505], 8695)
-    femmesh.addVolume([1943, 1945, 1563, 1562], 8696)
-    femmesh.addVolume([1561, 1562, 1945, 1941], 8697)
-    femmesh.addVolume([2202, 1410, 1407, 1409], 8698)
-    femmesh.addVolume([2200, 1405, 1408, 1409], 8699)
-    femmesh.addVolume([1656, 1658, 2067, 1659], 8700)
-    femmesh.addVolume([2065, 1654, 1657, 1658], 8701)
-    femmesh.addVolume([1405, 2200, 2201, 1409], 8702)
-    femmesh.addVolume([2201, 2202, 1407, 1409], 8703)
-    femmesh.addVolume([2067, 1658, 2069, 1659], 8704)
-    femmesh.addVolume([2065, 1658, 1657, 2069], 8705)
-    femmesh.addVolume([449, 2228, 2248, 3190], 8706)
-    femmesh.addVolume([1637, 2045, 2046, 2051], 8707)
-    femmesh.addVolume([2049, 1637, 2046, 2051], 8708)
-    femmesh.addVolume([2219, 1430, 2043, 2220], 8709)
-    femmesh.addVolume([2218, 2043, 2219, 1430], 8710)
-    femmesh.addVolume([1961, 1964, 1584, 1963], 8711)
-    femmesh.addVolume([1959, 1582, 1962, 1963], 8712)
-    femmesh.addVolume([1865, 1868, 1482, 1867], 8713)
-    femmesh.addVolume([1480, 1867, 1866, 1863], 8714)
-    femmesh.addVolume([1715, 2123, 2124, 2126], 8715)
-    femmesh.addVolume([1715, 2122, 2123, 2126], 8716)
-    femmesh.addVolume([2143, 2147, 2144, 1352], 8717)
-    femmesh.addVolume([2144, 1352, 2147, 2145], 8718)
-    femmesh.addVolume([1943, 1560, 1940, 1942], 8719)
-    femmesh.addVolume([1506, 1886, 1889, 1888], 8720)
-    femmesh.addVolume([1888, 1887, 1504, 1884], 8721)
-    femmesh.addVolume([1938, 1942, 1558, 1941], 8722)
-    femmesh.addVolume([2199, 2201, 1406, 2198], 8723)
-    femmesh.addVolume([2197, 1406, 2201, 2198], 8724)
-    femmesh.addVolume([2069, 1661, 2072, 2070], 8725)
-    femmesh.addVolume([2072, 2068, 1661, 2069], 8726)
-    femmesh.addVolume([640, 1800, 1769, 3187], 8727)
-    femmesh.addVolume([2241, 640, 2225, 3187], 8728)
-    femmesh.addVolume([642, 2222, 2245, 3189], 8729)
-    femmesh.addVolume([475, 2245, 2222, 3189], 8730)
-    femmesh.addVolume([516, 2028, 2004, 3189], 8731)
-    femmesh.addVolume([379, 2004, 2028, 3189], 8732)
-    femmesh.addVolume([516, 1770, 1798, 3189], 8733)
-    femmesh.addVolume([379, 1754, 1726, 3189], 8734)
-    femmesh.addVolume([473, 2241, 2225, 3187], 8735)
-    femmesh.addVolume([473, 1725, 1755, 3187], 8736)
-    femmesh.addVolume([1726, 1754, 475, 3189], 8737)
-    femmesh.addVolume([642, 1798, 1770, 3189], 8738)
-    femmesh.addVolume([1725, 377, 1755, 3187], 8739)
-    femmesh.addVolume([2039, 11, 1767, 680], 8740)
-    femmesh.addVolume([514, 1769, 1800, 3187], 8741)
-    femmesh.addVolume([638, 1783, 639, 3188], 8742)
-    femmesh.addVolume([638, 639, 2224, 3188], 8743)
-    femmesh.addVolume([377, 2002, 2024, 3187], 8744)
-    femmesh.addVolume([1629, 1631, 1804, 1632], 8745)
-    femmesh.addVolume([1803, 1436, 1437, 1434], 8746)
-    femmesh.addVolume([1627, 1630, 1760, 1631], 8747)
-    femmesh.addVolume([1432, 1435, 1759, 1436], 8748)
-    femmesh.addVolume([514, 2024, 2002, 3187], 8749)
-    femmesh.addVolume([1792, 490, 1779, 3190], 8750)
-    femmesh.addVolume([1636, 1637, 1640, 2051], 8751)
-    femmesh.addVolume([1640, 1637, 1638, 2051], 8752)
-    femmesh.addVolume([2219, 1427, 1426, 1430], 8753)
-    femmesh.addVolume([1427, 1430, 2219, 1428], 8754)
-    femmesh.addVolume([1581, 1583, 1961, 1584], 8755)
-    femmesh.addVolume([1582, 1583, 1959, 1579], 8756)
-    femmesh.addVolume([1483, 1484, 1866, 1480], 8757)
-    femmesh.addVolume([1482, 1868, 1485, 1484], 8758)
-    femmesh.addVolume([1637, 1636, 2045, 2051], 8759)
-    femmesh.addVolume([1637, 2049, 1638, 2051], 8760)
-    femmesh.addVolume([2220, 2219, 1430, 1428], 8761)
-    femmesh.addVolume([2219, 1426, 2218, 1430], 8762)
-    femmesh.addVolume([1714, 2126, 1715, 1718], 8763)
-    femmesh.addVolume([2126, 1716, 1715, 1718], 8764)
-    femmesh.addVolume([1352, 2144, 1349, 1350], 8765)
-    femmesh.addVolume([1349, 1348, 2144, 1352], 8766)
-    femmesh.addVolume([1582, 1959, 1583, 1963], 8767)
-    femmesh.addVolume([1584, 1583, 1961, 1963], 8768)
-    femmesh.addVolume([1484, 1482, 1868, 1867], 8769)
-    femmesh.addVolume([1866, 1484, 1867, 1480], 8770)
-    femmesh.addVolume([1560, 1943, 1563, 1562], 8771)
-    femmesh.addVolume([1506, 1503, 1886, 1505], 8772)
-    femmesh.addVolume([1501, 1505, 1504, 1884], 8773)
-    femmesh.addVolume([1561, 1558, 1562, 1941], 8774)
-    femmesh.addVolume([2049, 1635, 2048, 2046], 8775)
-    femmesh.addVolume([2045, 2044, 1633, 2046], 8776)
-    femmesh.addVolume([2218, 1429, 2047, 2043], 8777)
-    femmesh.addVolume([2042, 2043, 1431, 2220], 8778)
-    femmesh.addVolume([1407, 1406, 2201, 1409], 8779)
-    femmesh.addVolume([1405, 2201, 1406, 1409], 8780)
-    femmesh.addVolume([1661, 1657, 1658, 2069], 8781)
-    femmesh.addVolume([2069, 1658, 1661, 1659], 8782)
-    femmesh.addVolume([1716, 1715, 2124, 2126], 8783)
-    femmesh.addVolume([2122, 1715, 1714, 2126], 8784)
-    femmesh.addVolume([2144, 1348, 2143, 1352], 8785)
-    femmesh.addVolume([2145, 2144, 1352, 1350], 8786)
-    femmesh.addVolume([1888, 1504, 1505, 1884], 8787)
-    femmesh.addVolume([1886, 1888, 1506, 1505], 8788)
-    femmesh.addVolume([1562, 1560, 1943, 1942], 8789)
-    femmesh.addVolume([1562, 1558, 1942, 1941], 8790)
-    femmesh.addVolume([1963, 1586, 1962, 1966], 8791)
-    femmesh.addVolume([1963, 1964, 1586, 1966], 8792)
-    femmesh.addVolume([1481, 1864, 1865, 1867], 8793)
-    femmesh.addVolume([1864, 1867, 1481, 1863], 8794)
-    femmesh.addVolume([2119, 1711, 2122, 2123], 8795)
-    femmesh.addVolume([2121, 2123, 2124, 1713], 8796)
-    femmesh.addVolume([2148, 2147, 1353, 2145], 8797)
-    femmesh.addVolume([2143, 1351, 2146, 2147], 8798)
-    femmesh.addVolume([1407, 2201, 1406, 2199], 8799)
-    femmesh.addVolume([2197, 2201, 1406, 1405], 8800)
-    femmesh.addVolume([1657, 1661, 2068, 2069], 8801)
-    femmesh.addVolume([1661, 2070, 2069, 1659], 8802)
-    femmesh.addVolume([1888, 1889, 1508, 1891], 8803)
-    femmesh.addVolume([1891, 1508, 1888, 1887], 8804)
-    femmesh.addVolume([1942, 1559, 1939, 1938], 8805)
-    femmesh.addVolume([1940, 1559, 1939, 1942], 8806)
-    femmesh.addVolume([1404, 2196, 2199, 2198], 8807)
-    femmesh.addVolume([2194, 1402, 2197, 2198], 8808)
-    femmesh.addVolume([1660, 2071, 2068, 2072], 8809)
-    femmesh.addVolume([2070, 2072, 2073, 1662], 8810)
-    femmesh.addVolume([2040, 4, 680, 1759], 8811)
-    femmesh.addVolume([5, 2041, 679, 1760], 8812)
-    femmesh.addVolume([2045, 1633, 1636, 1637], 8813)
-    femmesh.addVolume([1638, 1635, 2049, 1637], 8814)
-    femmesh.addVolume([1426, 1429, 2218, 1430], 8815)
-    femmesh.addVolume([2220, 1430, 1431, 1428], 8816)
-    femmesh.addVolume([1584, 1586, 1583, 1963], 8817)
-    femmesh.addVolume([1586, 1582, 1583, 1963], 8818)
-    femmesh.addVolume([1481, 1482, 1484, 1867], 8819)
-    femmesh.addVolume([1867, 1484, 1481, 1480], 8820)
-    femmesh.addVolume([2122, 1711, 1714, 1715], 8821)
-    femmesh.addVolume([1716, 1713, 2124, 1715], 8822)
-    femmesh.addVolume([2145, 1352, 1353, 1350], 8823)
-    femmesh.addVolume([1348, 1351, 2143, 1352], 8824)
-    femmesh.addVolume([1779, 2248, 616, 3190], 8825)
-    femmesh.addVolume([1506, 1888, 1508, 1505], 8826)
-    femmesh.addVolume([1508, 1505, 1888, 1504], 8827)
-    femmesh.addVolume([1559, 1942, 1562, 1558], 8828)
-    femmesh.addVolume([1560, 1562, 1559, 1942], 8829)
-    femmesh.addVolume([2046, 1633, 2045, 1637], 8830)
-    femmesh.addVolume([2046, 2049, 1635, 1637], 8831)
-    femmesh.addVolume([1431, 2043, 1430, 2220], 8832)
-    femmesh.addVolume([2043, 2218, 1429, 1430], 8833)
-    femmesh.addVolume([1406, 1404, 1407, 2199], 8834)
-    femmesh.addVolume([1406, 1402, 2197, 1405], 8835)
-    femmesh.addVolume([1661, 1662, 2070, 1659], 8836)
-    femmesh.addVolume([1657, 1660, 2068, 1661], 8837)
-    femmesh.addVolume([1587, 1964, 1967, 1966], 8838)
-    femmesh.addVolume([1585, 1965, 1962, 1966], 8839)
-    femmesh.addVolume([1864, 1860, 1863, 1477], 8840)
-    femmesh.addVolume([1865, 1479, 1862, 1864], 8841)
-    femmesh.addVolume([1582, 1586, 1962, 1963], 8842)
-    femmesh.addVolume([1964, 1586, 1584, 1963], 8843)
-    femmesh.addVolume([1481, 1865, 1482, 1867], 8844)
-    femmesh.addVolume([1480, 1481, 1867, 1863], 8845)
-    femmesh.addVolume([2120, 2119, 2123, 1712], 8846)
-    femmesh.addVolume([2123, 2121, 2120, 1712], 8847)
-    femmesh.addVolume([1355, 2150, 2147, 2148], 8848)
-    femmesh.addVolume([2146, 2147, 1355, 2150], 8849)
-    femmesh.addVolume([2123, 1711, 2122, 1715], 8850)
-    femmesh.addVolume([1713, 2123, 2124, 1715], 8851)
-    femmesh.addVolume([2147, 2143, 1351, 1352], 8852)
-    femmesh.addVolume([1353, 2147, 1352, 2145], 8853)
-    femmesh.addVolume([1940, 1939, 1557, 1937], 8854)
-    femmesh.addVolume([1939, 1938, 1555, 1935], 8855)
-    femmesh.addVolume([1892, 1509, 1889, 1891], 8856)
-    femmesh.addVolume([1887, 1891, 1507, 1890], 8857)
-    femmesh.addVolume([2198, 2194, 1403, 2195], 8858)
-    femmesh.addVolume([2198, 1403, 2196, 2195], 8859)
-    femmesh.addVolume([2073, 2072, 2075, 1664], 8860)
-    femmesh.addVolume([2075, 2072, 2071, 1664], 8861)
-    femmesh.addVolume([1504, 1888, 1508, 1887], 8862)
-    femmesh.addVolume([1889, 1508, 1506, 1888], 8863)
-    femmesh.addVolume([1559, 1940, 1560, 1942], 8864)
-    femmesh.addVolume([1558, 1559, 1942, 1938], 8865)
-    femmesh.addVolume([681, 2048, 1634, 2046], 8866)
-    femmesh.addVolume([1634, 2044, 681, 2046], 8867)
-    femmesh.addVolume([2047, 2043, 1433, 682], 8868)
-    femmesh.addVolume([1433, 682, 2043, 2042], 8869)
-    femmesh.addVolume([2199, 1406, 1404, 2198], 8870)
-    femmesh.addVolume([1402, 1406, 2197, 2198], 8871)
-    femmesh.addVolume([2070, 1661, 2072, 1662], 8872)
-    femmesh.addVolume([2068, 1661, 1660, 2072], 8873)
-    femmesh.addVolume([2046, 1634, 1633, 1637], 8874)
-    femmesh.addVolume([1634, 2046, 1635, 1637], 8875)
-    femmesh.addVolume([2043, 1429, 1433, 1430], 8876)
-    femmesh.addVolume([1430, 1433, 2043, 1431], 8877)
-    femmesh.addVolume([1586, 1964, 1584, 1587], 8878)
-    femmesh.addVolume([1586, 1582, 1962, 1585], 8879)
-    femmesh.addVolume([1481, 1863, 1480, 1477], 8880)
-    femmesh.addVolume([1482, 1479, 1865, 1481], 8881)
-    femmesh.addVolume([1712, 2123, 1713, 1715], 8882)
-    femmesh.addVolume([1712, 1711, 2123, 1715], 8883)
-    femmesh.addVolume([2147, 1351, 1355, 1352], 8884)
-    femmesh.addVolume([1352, 1355, 2147, 1353], 8885)
-    femmesh.addVolume([1508, 1507, 1504, 1887], 8886)
-    femmesh.addVolume([1889, 1509, 1506, 1508], 8887)
-    femmesh.addVolume([1558, 1555, 1559, 1938], 8888)
-    femmesh.addVolume([1560, 1559, 1557, 1940], 8889)
-    femmesh.addVolume([1589, 1969, 1965, 1966], 8890)
-    femmesh.addVolume([1589, 1967, 1969, 1966], 8891)
-    femmesh.addVolume([1862, 1861, 1864, 1478], 8892)
-    femmesh.addVolume([1864, 1478, 1861, 1860], 8893)
-    femmesh.addVolume([1406, 1402, 1403, 2198], 8894)
-    femmesh.addVolume([1404, 1406, 1403, 2198], 8895)
-    femmesh.addVolume([1662, 1661, 2072, 1664], 8896)
-    femmesh.addVolume([2072, 1661, 1660, 1664], 8897)
-    femmesh.addVolume([1634, 2048, 1635, 2046], 8898)
-    femmesh.addVolume([1634, 1633, 2044, 2046], 8899)
-    femmesh.addVolume([1433, 2047, 1429, 2043], 8900)
-    femmesh.addVolume([2043, 1431, 1433, 2042], 8901)
-    femmesh.addVolume([2119, 2116, 1708, 2120], 8902)
-    femmesh.addVolume([2120, 1710, 2121, 2118], 8903)
-    femmesh.addVolume([2150, 1356, 2151, 2148], 8904)
-    femmesh.addVolume([2149, 2146, 1354, 2150], 8905)
-    femmesh.addVolume([1891, 1894, 1511, 1890], 8906)
-    femmesh.addVolume([1511, 1892, 1894, 1891], 8907)
-    femmesh.addVolume([1556, 1936, 1939, 1935], 8908)
-    femmesh.addVolume([1556, 1937, 1939, 1936], 8909)
-    femmesh.addVolume([2194, 2191, 1399, 2195], 8910)
-    femmesh.addVolume([2196, 2193, 2195, 1401], 8911)
-    femmesh.addVolume([2074, 2071, 1663, 2075], 8912)
-    femmesh.addVolume([1665, 2075, 2073, 2076], 8913)
-    femmesh.addVolume([1964, 1587, 1586, 1966], 8914)
-    femmesh.addVolume([1586, 1585, 1962, 1966], 8915)
-    femmesh.addVolume([1864, 1863, 1481, 1477], 8916)
-    femmesh.addVolume([1864, 1865, 1479, 1481], 8917)
-    femmesh.addVolume([4, 1438, 680, 1759], 8918)
-    femmesh.addVolume([1624, 5, 679, 1760], 8919)
-    femmesh.addVolume([1440, 1803, 11, 680], 8920)
-    femmesh.addVolume([10, 1626, 679, 1804], 8921)
-    femmesh.addVolume([1711, 2123, 2119, 1712], 8922)
-    femmesh.addVolume([2123, 1713, 2121, 1712], 8923)
-    femmesh.addVolume([2147, 1353, 1355, 2148], 8924)
-    femmesh.addVolume([1355, 2146, 1351, 2147], 8925)
-    femmesh.addVolume([1432, 2047, 1429, 1433], 8926)
-    femmesh.addVolume([1635, 1634, 1632, 2048], 8927)
-    femmesh.addVolume([1431, 1434, 1433, 2042], 8928)
-    femmesh.addVolume([2044, 1630, 1633, 1634], 8929)
-    femmesh.addVolume([1508, 1889, 1509, 1891], 8930)
-    femmesh.addVolume([1507, 1508, 1891, 1887], 8931)
-    femmesh.addVolume([1559, 1555, 1939, 1938], 8932)
-    femmesh.addVolume([1557, 1559, 1939, 1940], 8933)
-    femmesh.addVolume([1403, 2196, 1404, 2198], 8934)
-    femmesh.addVolume([1402, 2194, 1403, 2198], 8935)
-    femmesh.addVolume([1662, 2072, 2073, 1664], 8936)
-    femmesh.addVolume([2071, 2072, 1660, 1664], 8937)
-    femmesh.addVolume([1589, 1585, 1586, 1966], 8938)
-    femmesh.addVolume([1589, 1586, 1587, 1966], 8939)
-    femmesh.addVolume([1864, 1481, 1478, 1477], 8940)
-    femmesh.addVolume([1479, 1478, 1864, 1481], 8941)
-    femmesh.addVolume([679, 1768, 10, 1804], 8942)
-    femmesh.addVolume([1710, 2121, 1713, 1712], 8943)
-    femmesh.addVolume([2119, 1708, 1711, 1712], 8944)
-    femmesh.addVolume([1354, 2146, 1351, 1355], 8945)
-    femmesh.addVolume([1353, 1356, 1355, 2148], 8946)
-    femmesh.addVolume([1968, 1969, 1965, 1588], 8947)
-    femmesh.addVolume([1969, 1970, 1967, 1590], 8948)
-    femmesh.addVolume([1862, 1476, 1859, 1861], 8949)
-    femmesh.addVolume([1861, 1857, 1860, 1474], 8950)
-    femmesh.addVolume([1891, 1511, 1508, 1507], 8951)
-    femmesh.addVolume([1509, 1511, 1508, 1891], 8952)
-    femmesh.addVolume([1559, 1556, 1939, 1555], 8953)
-    femmesh.addVolume([1556, 1559, 1939, 1557], 8954)
-    femmesh.addVolume([2120, 2117, 1709, 2118], 8955)
-    femmesh.addVolume([1709, 2120, 2116, 2117], 8956)
-    femmesh.addVolume([2149, 2150, 1358, 2153], 8957)
-    femmesh.addVolume([1358, 2153, 2150, 2151], 8958)
-    femmesh.addVolume([2196, 1403, 1404, 1401], 8959)
-    femmesh.addVolume([1399, 2194, 1403, 1402], 8960)
-    femmesh.addVolume([1660, 1663, 2071, 1664], 8961)
-    femmesh.addVolume([2073, 1665, 1662, 1664], 8962)
-    femmesh.addVolume([1937, 1554, 1934, 1936], 8963)
-    femmesh.addVolume([1936, 1552, 1932, 1935], 8964)
-    femmesh.addVolume([1512, 1892, 1895, 1894], 8965)
-    femmesh.addVolume([1893, 1894, 1890, 1510], 8966)
-    femmesh.addVolume([2195, 2192, 1400, 2193], 8967)
-    femmesh.addVolume([1400, 2191, 2192, 2195], 8968)
-    femmesh.addVolume([2075, 2078, 2076, 1667], 8969)
-    femmesh.addVolume([2078, 2075, 2074, 1667], 8970)
-    femmesh.addVolume([1589, 1965, 1585, 1966], 8971)
-    femmesh.addVolume([1967, 1589, 1587, 1966], 8972)
-    femmesh.addVolume([1478, 1860, 1864, 1477], 8973)
-    femmesh.addVolume([1864, 1479, 1862, 1478], 8974)
-    femmesh.addVolume([1433, 1432, 2047, 682], 8975)
-    femmesh.addVolume([681, 1632, 1634, 2048], 8976)
-    femmesh.addVolume([1433, 1434, 682, 2042], 8977)
-    femmesh.addVolume([681, 1630, 2044, 1634], 8978)
-    femmesh.addVolume([2120, 1708, 2119, 1712], 8979)
-    femmesh.addVolume([1710, 2120, 2121, 1712], 8980)
-    femmesh.addVolume([1355, 1354, 2146, 2150], 8981)
-    femmesh.addVolume([1355, 1356, 2150, 2148], 8982)
-    femmesh.addVolume([1556, 1557, 1939, 1937], 8983)
-    femmesh.addVolume([1511, 1509, 1892, 1891], 8984)
-    femmesh.addVolume([1511, 1507, 1891, 1890], 8985)
-    femmesh.addVolume([1939, 1555, 1556, 1935], 8986)
-    femmesh.addVolume([617, 616, 1779, 2248], 8987)
-    femmesh.addVolume([615, 616, 2228, 1792], 8988)
-    femmesh.addVolume([1734, 451, 452, 2246], 8989)
-    femmesh.addVolume([620, 1799, 2237, 619], 8990)
-    femmesh.addVolume([620, 2253, 1781, 621], 8991)
-    femmesh.addVolume([618, 1777, 619, 2246], 8992)
-    femmesh.addVolume([1749, 456, 457, 2230], 8993)
-    femmesh.addVolume([456, 1731, 455, 2249], 8994)
-    femmesh.addVolume([447, 448, 1740, 2250], 8995)
-    femmesh.addVolume([615, 614, 1784, 2250], 8996)
-    femmesh.addVolume([1750, 448, 449, 2228], 8997)
-    femmesh.addVolume([618, 617, 1797, 2229], 8998)
-    femmesh.addVolume([453, 454, 1738, 2253], 8999)
-    femmesh.addVolume([451, 1753, 450, 2229], 9000)
-    femmesh.addVolume([476, 477, 1745, 2255], 9001)
-    femmesh.addVolume([515, 2028, 516, 1798], 9002)
-    femmesh.addVolume([378, 379, 2028, 1754], 9003)
-    femmesh.addVolume([452, 453, 1756, 2237], 9004)
-    femmesh.addVolume([643, 2255, 1789, 644], 9005)
-    femmesh.addVolume([1770, 516, 517, 2004], 9006)
-    femmesh.addVolume([471, 1746, 470, 2243], 9007)
-    femmesh.addVolume([454, 455, 1751, 2233], 9008)
-    femmesh.addVolume([639, 640, 2241, 1800], 9009)
-    femmesh.addVolume([2243, 638, 1790, 637], 9010)
-    femmesh.addVolume([449, 450, 1736, 2248], 9011)
-    femmesh.addVolume([473, 1755, 472, 2241], 9012)
-    femmesh.addVolume([1739, 471, 472, 2224], 9013)
-    femmesh.addVolume([1727, 477, 478, 2221], 9014)
-    femmesh.addVolume([640, 2225, 1769, 641], 9015)
-    femmesh.addVolume([377, 378, 2002, 1725], 9016)
-    femmesh.addVolume([1725, 473, 474, 2225], 9017)
-    femmesh.addVolume([642, 2245, 641, 1798], 9018)
-    femmesh.addVolume([1754, 474, 475, 2245], 9019)
-    femmesh.addVolume([1726, 475, 476, 2222], 9020)
-    femmesh.addVolume([643, 1770, 2222, 642], 9021)
-    femmesh.addVolume([379, 380, 2004, 1726], 9022)
-    femmesh.addVolume([1748, 446, 447, 2236], 9023)
-    femmesh.addVolume([381, 2029, 380, 1745], 9024)
-    femmesh.addVolume([2194, 1399, 1403, 2195], 9025)
-    femmesh.addVolume([2195, 1403, 2196, 1401], 9026)
-    femmesh.addVolume([1665, 2073, 2075, 1664], 9027)
-    femmesh.addVolume([2075, 2071, 1663, 1664], 9028)
-    femmesh.addVolume([517, 518, 1789, 2029], 9029)
-    femmesh.addVolume([1587, 1967, 1590, 1589], 9030)
-    femmesh.addVolume([1588, 1965, 1585, 1589], 9031)
-    femmesh.addVolume([1862, 1479, 1476, 1478], 9032)
-    femmesh.addVolume([1477, 1478, 1860, 1474], 9033)
-    femmesh.addVolume([2012, 351, 352, 1740], 9034)
-    femmesh.addVolume([488, 2012, 489, 1784], 9035)
-    femmesh.addVolume([636, 2223, 1773, 637], 9036)
-    femmesh.addVolume([470, 1729, 469, 2223], 9037)
-    femmesh.addVolume([645, 1771, 2221, 644], 9038)
-    femmesh.addVolume([515, 1769, 514, 2002], 9039)
-    femmesh.addVolume([1592, 1969, 1970, 1972], 9040)
-    femmesh.addVolume([1969, 1592, 1968, 1972], 9041)
-    femmesh.addVolume([1861, 1475, 1858, 1857], 9042)
-    femmesh.addVolume([1859, 1858, 1861, 1475], 9043)
-    femmesh.addVolume([1709, 1708, 2120, 1712], 9044)
-    femmesh.addVolume([2120, 1710, 1709, 1712], 9045)
-    femmesh.addVolume([1355, 1358, 1354, 2150], 9046)
-    femmesh.addVolume([1358, 2150, 1355, 1356], 9047)
-    femmesh.addVolume([2115, 1707, 2117, 2118], 9048)
-    femmesh.addVolume([2113, 1705, 2116, 2117], 9049)
-    femmesh.addVolume([2153, 2154, 2151, 1359], 9050)
-    femmesh.addVolume([2149, 1357, 2152, 2153], 9051)
-    femmesh.addVolume([382, 2015, 381, 1727], 9052)
-    femmesh.addVolume([1555, 1552, 1556, 1935], 9053)
-    femmesh.addVolume([1937, 1556, 1557, 1554], 9054)
-    femmesh.addVolume([1890, 1511, 1507, 1510], 9055)
-    femmesh.addVolume([1512, 1509, 1892, 1511], 9056)
-    femmesh.addVolume([1732, 457, 458, 2244], 9057)
-    femmesh.addVolume([1936, 1553, 1933, 1932], 9058)
-    femmesh.addVolume([1933, 1936, 1934, 1553], 9059)
-    femmesh.addVolume([1897, 1514, 1894, 1893], 9060)
-    femmesh.addVolume([1895, 1894, 1897, 1514], 9061)
-    femmesh.addVolume([1774, 625, 2231, 626], 9062)
-    femmesh.addVolume([1403, 1399, 1400, 2195], 9063)
-    femmesh.addVolume([2195, 1400, 1403, 1401], 9064)
-    femmesh.addVolume([1667, 2075, 1663, 1664], 9065)
-    femmesh.addVolume([2075, 1667, 1665, 1664], 9066)
-    femmesh.addVolume([2188, 1396, 2191, 2192], 9067)
-    femmesh.addVolume([2190, 2192, 2193, 1398], 9068)
-    femmesh.addVolume([1666, 2077, 2074, 2078], 9069)
-    femmesh.addVolume([2079, 1668, 2076, 2078], 9070)
-    femmesh.addVolume([1791, 2236, 614, 613], 9071)
-    femmesh.addVolume([488, 487, 2032, 1791], 9072)
-    femmesh.addVolume([496, 2020, 497, 1775], 9073)
-    femmesh.addVolume([497, 2006, 498, 1785], 9074)
-    femmesh.addVolume([621, 2233, 1794, 622], 9075)
-    femmesh.addVolume([376, 377, 2024, 1755], 9076)
-    femmesh.addVolume([479, 1747, 478, 2256], 9077)
-    femmesh.addVolume([519, 2030, 520, 1793], 9078)
-    femmesh.addVolume([518, 2015, 519, 1771], 9079)
-    femmesh.addVolume([2035, 1750, 352, 353], 9080)
-    femmesh.addVolume([1801, 2244, 625, 624], 9081)
-    femmesh.addVolume([1432, 682, 1433, 1436], 9082)
-    femmesh.addVolume([1433, 1436, 682, 1434], 9083)
-    femmesh.addVolume([1630, 1634, 681, 1631], 9084)
-    femmesh.addVolume([681, 1631, 1634, 1632], 9085)
-    femmesh.addVolume([349, 350, 2018, 1735], 9086)
-    femmesh.addVolume([2016, 1730, 383, 384], 9087)
-    femmesh.addVolume([373, 374, 2037, 1729], 9088)
-    femmesh.addVolume([510, 1796, 509, 2011], 9089)
-    femmesh.addVolume([361, 362, 2027, 1732], 9090)
-    femmesh.addVolume([2035, 490, 489, 1792], 9091)
-    femmesh.addVolume([350, 2032, 1748, 351], 9092)
-    femmesh.addVolume([468, 1737, 467, 2235], 9093)
-    femmesh.addVolume([635, 1780, 2235, 634], 9094)
-    femmesh.addVolume([2013, 500, 499, 1774], 9095)
-    femmesh.addVolume([2008, 508, 507, 1786], 9096)
-    femmesh.addVolume([371, 2008, 370, 1741], 9097)
-    femmesh.addVolume([1747, 2030, 383, 382], 9098)
-    femmesh.addVolume([510, 2037, 511, 1773], 9099)
-    femmesh.addVolume([1790, 511, 512, 2023], 9100)
-    femmesh.addVolume([490, 2021, 491, 1779], 9101)
-    femmesh.addVolume([1799, 493, 494, 2019], 9102)
-    femmesh.addVolume([2011, 1752, 372, 373], 9103)
-    femmesh.addVolume([1821, 1819, 1814, 2003], 9104)
-    femmesh.addVolume([1811, 1812, 1816, 2234], 9105)
-    femmesh.addVolume([1819, 1821, 1818, 2003], 9106)
-    femmesh.addVolume([678, 1811, 1816, 2234], 9107)
-    femmesh.addVolume([2232, 678, 1813, 1815], 9108)
-    femmesh.addVolume([1590, 1967, 1969, 1589], 9109)
-    femmesh.addVolume([1965, 1588, 1969, 1589], 9110)
-    femmesh.addVolume([1476, 1861, 1862, 1478], 9111)
-    femmesh.addVolume([1861, 1860, 1478, 1474], 9112)
-    femmesh.addVolume([1593, 1970, 1973, 1972], 9113)
-    femmesh.addVolume([1591, 1971, 1968, 1972], 9114)
-    femmesh.addVolume([1473, 1856, 1859, 1858], 9115)
-    femmesh.addVolume([1857, 1858, 1854, 1471], 9116)
-    femmesh.addVolume([2256, 646, 1793, 645], 9117)
-    femmesh.addVolume([2024, 514, 513, 1800], 9118)
-    femmesh.addVolume([635, 2242, 1796, 636], 9119)
-    femmesh.addVolume([1752, 468, 469, 2242], 9120)
-    femmesh.addVolume([445, 446, 1735, 2247], 9121)
-    femmesh.addVolume([1592, 1590, 1969, 1589], 9122)
-    femmesh.addVolume([1592, 1969, 1588, 1589], 9123)
-    femmesh.addVolume([1475, 1861, 1478, 1474], 9124)
-    femmesh.addVolume([1861, 1478, 1476, 1475], 9125)
-    femmesh.addVolume([358, 359, 2036, 1751], 9126)
-    femmesh.addVolume([2113, 1706, 2117, 2114], 9127)
-    femmesh.addVolume([2115, 2117, 1706, 2114], 9128)
-    femmesh.addVolume([2156, 2152, 1361, 2153], 9129)
-    femmesh.addVolume([2153, 1361, 2156, 2154], 9130)
-    femmesh.addVolume([356, 2033, 355, 1734], 9131)
-    femmesh.addVolume([1709, 1710, 2120, 2118], 9132)
-    femmesh.addVolume([2120, 2116, 1708, 1709], 9133)
-    femmesh.addVolume([1354, 1358, 2149, 2150], 9134)
-    femmesh.addVolume([2151, 2150, 1358, 1356], 9135)
-    femmesh.addVolume([1929, 1933, 1549, 1932], 9136)
-    femmesh.addVolume([1898, 1515, 1895, 1897], 9137)
-    femmesh.addVolume([1893, 1896, 1897, 1513], 9138)
-    femmesh.addVolume([1551, 1931, 1934, 1933], 9139)
-    femmesh.addVolume([1708, 2116, 1705, 1709], 9140)
-    femmesh.addVolume([1710, 1709, 1707, 2118], 9141)
-    femmesh.addVolume([2149, 1354, 1357, 1358], 9142)
-    femmesh.addVolume([1358, 1359, 2151, 1356], 9143)
-    femmesh.addVolume([1554, 1937, 1556, 1936], 9144)
-    femmesh.addVolume([1556, 1552, 1936, 1935], 9145)
-    femmesh.addVolume([1892, 1894, 1512, 1511], 9146)
-    femmesh.addVolume([1890, 1894, 1511, 1510], 9147)
-    femmesh.addVolume([2189, 1397, 2192, 2190], 9148)
-    femmesh.addVolume([2188, 2192, 2189, 1397], 9149)
-    femmesh.addVolume([2079, 2078, 2081, 1670], 9150)
-    femmesh.addVolume([2078, 2077, 2081, 1670], 9151)
-    femmesh.addVolume([1514, 1512, 1894, 1511], 9152)
-    femmesh.addVolume([1511, 1894, 1514, 1510], 9153)
-    femmesh.addVolume([1936, 1556, 1554, 1553], 9154)
-    femmesh.addVolume([1556, 1553, 1936, 1552], 9155)
-    femmesh.addVolume([1813, 1814, 2232, 1815], 9156)
-    femmesh.addVolume([1399, 2191, 1396, 1400], 9157)
-    femmesh.addVolume([1398, 1400, 2193, 1401], 9158)
-    femmesh.addVolume([1665, 2076, 1668, 1667], 9159)
-    femmesh.addVolume([2074, 1663, 1666, 1667], 9160)
-    femmesh.addVolume([1400, 1399, 2191, 2195], 9161)
-    femmesh.addVolume([2193, 1400, 2195, 1401], 9162)
-    femmesh.addVolume([2075, 2076, 1665, 1667], 9163)
-    femmesh.addVolume([2075, 1663, 2074, 1667], 9164)
-    femmesh.addVolume([512, 513, 1783, 2007], 9165)
-    femmesh.addVolume([2027, 499, 498, 1801], 9166)
-    femmesh.addVolume([491, 2010, 492, 1797], 9167)
-    femmesh.addVolume([494, 495, 1781, 2009], 9168)
-    femmesh.addVolume([459, 1757, 458, 2231], 9169)
-    femmesh.addVolume([1438, 4, 61, 1759], 9170)
-    femmesh.addVolume([1624, 124, 5, 1760], 9171)
-    femmesh.addVolume([1803, 11, 190, 1440], 9172)
-    femmesh.addVolume([1804, 10, 1626, 253], 9173)
-    femmesh.addVolume([492, 2033, 493, 1777], 9174)
-    femmesh.addVolume([1595, 1975, 1971, 1972], 9175)
-    femmesh.addVolume([1595, 1973, 1975, 1972], 9176)
-    femmesh.addVolume([1858, 1472, 1855, 1854], 9177)
-    femmesh.addVolume([1856, 1855, 1858, 1472], 9178)
-    femmesh.addVolume([495, 2036, 496, 1794], 9179)
-    femmesh.addVolume([1704, 2112, 2115, 2114], 9180)
-    femmesh.addVolume([2113, 2110, 1702, 2114], 9181)
-    femmesh.addVolume([1360, 2155, 2152, 2156], 9182)
-    femmesh.addVolume([2154, 2156, 2157, 1362], 9183)
-    femmesh.addVolume([1900, 1898, 1897, 1517], 9184)
-    femmesh.addVolume([1517, 1897, 1900, 1896], 9185)
-    femmesh.addVolume([1930, 1933, 1550, 1929], 9186)
-    femmesh.addVolume([1930, 1931, 1550, 1933], 9187)
-    femmesh.addVolume([1591, 1968, 1588, 1592], 9188)
-    femmesh.addVolume([1593, 1590, 1970, 1592], 9189)
-    femmesh.addVolume([1473, 1859, 1476, 1475], 9190)
-    femmesh.addVolume([1474, 1475, 1857, 1471], 9191)
-    femmesh.addVolume([2190, 2187, 2189, 1395], 9192)
-    femmesh.addVolume([2185, 1393, 2188, 2189], 9193)
-    femmesh.addVolume([2082, 1671, 2079, 2081], 9194)
-    femmesh.addVolume([1669, 2080, 2077, 2081], 9195)
-    femmesh.addVolume([2117, 1705, 1709, 1706], 9196)
-    femmesh.addVolume([1706, 1709, 2117, 1707], 9197)
-    femmesh.addVolume([2153, 1358, 1361, 1359], 9198)
-    femmesh.addVolume([1361, 1357, 1358, 2153], 9199)
-    femmesh.addVolume([1510, 1893, 1514, 1513], 9200)
-    femmesh.addVolume([1895, 1515, 1512, 1514], 9201)
-    femmesh.addVolume([1551, 1934, 1554, 1553], 9202)
-    femmesh.addVolume([1932, 1553, 1549, 1552], 9203)
-    femmesh.addVolume([611, 2227, 1788, 612], 9204)
-    femmesh.addVolume([1397, 1396, 2192, 1400], 9205)
-    femmesh.addVolume([1400, 2192, 1397, 1398], 9206)
-    femmesh.addVolume([1666, 1670, 2078, 1667], 9207)
-    femmesh.addVolume([1670, 1668, 2078, 1667], 9208)
-    femmesh.addVolume([1590, 1969, 1970, 1592], 9209)
-    femmesh.addVolume([1969, 1588, 1968, 1592], 9210)
-    femmesh.addVolume([1857, 1861, 1475, 1474], 9211)
-    femmesh.addVolume([1861, 1476, 1859, 1475], 9212)
-    femmesh.addVolume([485, 486, 1788, 2001], 9213)
-    femmesh.addVolume([1709, 2116, 1705, 2117], 9214)
-    femmesh.addVolume([1707, 1709, 2117, 2118], 9215)
-    femmesh.addVolume([1358, 1357, 2149, 2153], 9216)
-    femmesh.addVolume([2151, 1358, 2153, 1359], 9217)
-    femmesh.addVolume([1894, 1895, 1512, 1514], 9218)
-    femmesh.addVolume([1932, 1936, 1553, 1552], 9219)
-    femmesh.addVolume([1934, 1936, 1554, 1553], 9220)
-    femmesh.addVolume([1893, 1514, 1894, 1510], 9221)
-    femmesh.addVolume([2192, 1396, 2191, 1400], 9222)
-    femmesh.addVolume([2193, 2192, 1400, 1398], 9223)
-    femmesh.addVolume([1666, 2078, 2074, 1667], 9224)
-    femmesh.addVolume([2078, 1668, 2076, 1667], 9225)
-    femmesh.addVolume([1975, 1594, 1971, 1974], 9226)
-    femmesh.addVolume([1973, 1976, 1596, 1975], 9227)
-    femmesh.addVolume([1854, 1855, 1851, 1468], 9228)
-    femmesh.addVolume([1855, 1470, 1856, 1853], 9229)
-    femmesh.addVolume([1344, 1, 6, 1337], 9230)
-    femmesh.addVolume([1340, 2, 13, 1341], 9231)
-    femmesh.addVolume([1703, 2111, 2112, 2114], 9232)
-    femmesh.addVolume([2111, 1703, 2110, 2114], 9233)
-    femmesh.addVolume([2155, 2159, 2156, 1364], 9234)
-    femmesh.addVolume([2156, 1364, 2159, 2157], 9235)
-    femmesh.addVolume([2007, 1739, 375, 376], 9236)
-    femmesh.addVolume([623, 1775, 2249, 622], 9237)
-    femmesh.addVolume([360, 361, 2006, 1749], 9238)
-    femmesh.addVolume([1417, 410, 1414, 2209], 9239)
-    femmesh.addVolume([2211, 1416, 1419, 673], 9240)
-    femmesh.addVolume([1650, 586, 2058, 1647], 9241)
-    femmesh.addVolume([419, 1648, 2056, 1645], 9242)
-    femmesh.addVolume([1898, 1901, 1518, 1900], 9243)
-    femmesh.addVolume([1900, 1516, 1896, 1899], 9244)
-    femmesh.addVolume([1930, 1548, 1931, 1928], 9245)
-    femmesh.addVolume([1930, 1546, 1926, 1929], 9246)
-    femmesh.addVolume([1394, 2189, 2186, 2187], 9247)
-    femmesh.addVolume([2186, 2185, 2189, 1394], 9248)
-    femmesh.addVolume([2082, 2081, 2084, 1673], 9249)
-    femmesh.addVolume([2081, 2080, 2084, 1673], 9250)
-    femmesh.addVolume([1817, 2017, 1820, 1812], 9251)
-    femmesh.addVolume([522, 1787, 521, 2005], 9252)
-    femmesh.addVolume([612, 2247, 1778, 613], 9253)
-    femmesh.addVolume([1591, 1592, 1595, 1972], 9254)
-    femmesh.addVolume([1592, 1593, 1595, 1972], 9255)
-    femmesh.addVolume([1475, 1473, 1858, 1472], 9256)
-    femmesh.addVolume([1472, 1858, 1475, 1471], 9257)
-    femmesh.addVolume([1706, 1704, 1707, 2115], 9258)
-    femmesh.addVolume([1702, 1705, 2113, 1706], 9259)
-    femmesh.addVolume([2152, 1357, 1360, 1361], 9260)
-    femmesh.addVolume([1362, 2154, 1361, 1359], 9261)
-    femmesh.addVolume([1820, 1818, 2017, 1817], 9262)
-    femmesh.addVolume([1515, 1514, 1897, 1517], 9263)
-    femmesh.addVolume([1897, 1517, 1514, 1513], 9264)
-    femmesh.addVolume([1550, 1933, 1551, 1553], 9265)
-    femmesh.addVolume([1553, 1550, 1933, 1549], 9266)
-    femmesh.addVolume([646, 2226, 1782, 647], 9267)
-    femmesh.addVolume([2188, 1393, 1396, 1397], 9268)
-    femmesh.addVolume([1395, 1397, 2190, 1398], 9269)
-    femmesh.addVolume([2077, 1666, 1669, 1670], 9270)
-    femmesh.addVolume([1668, 2079, 1671, 1670], 9271)
-    femmesh.addVolume([1952, 565, 1575, 1955], 9272)
-    femmesh.addVolume([331, 1950, 1573, 1953], 9273)
-    femmesh.addVolume([1489, 1872, 1875, 305], 9274)
-    femmesh.addVolume([1877, 1491, 539, 1874], 9275)
-    femmesh.addVolume([626, 2257, 1795, 627], 9276)
-    femmesh.addVolume([1767, 11, 1803, 680], 9277)
-    femmesh.addVolume([1877, 540, 1497, 1880], 9278)
-    femmesh.addVolume([1950, 330, 1567, 1947], 9279)
-    femmesh.addVolume([1495, 1875, 1878, 306], 9280)
-    femmesh.addVolume([1952, 564, 1949, 1569], 9281)
-    femmesh.addVolume([358, 2009, 357, 1738], 9282)
-    femmesh.addVolume([355, 2010, 354, 1753], 9283)
-    femmesh.addVolume([1976, 1598, 1975, 1978], 9284)
-    femmesh.addVolume([1978, 1598, 1975, 1974], 9285)
-    femmesh.addVolume([1855, 1853, 1852, 1469], 9286)
-    femmesh.addVolume([1852, 1851, 1855, 1469], 9287)
-    femmesh.addVolume([1699, 2110, 2107, 2111], 9288)
-    femmesh.addVolume([2112, 1701, 2109, 2111], 9289)
-    femmesh.addVolume([2160, 2159, 1365, 2157], 9290)
-    femmesh.addVolume([2155, 1363, 2158, 2159], 9291)
-    femmesh.addVolume([1592, 1970, 1593, 1972], 9292)
-    femmesh.addVolume([1968, 1592, 1591, 1972], 9293)
-    femmesh.addVolume([1858, 1859, 1473, 1475], 9294)
-    femmesh.addVolume([1858, 1857, 1475, 1471], 9295)
-    femmesh.addVolume([1900, 1901, 1520, 1903], 9296)
-    femmesh.addVolume([1903, 1520, 1900, 1899], 9297)
-    femmesh.addVolume([1547, 1930, 1927, 1928], 9298)
-    femmesh.addVolume([1930, 1547, 1927, 1926], 9299)
-    femmesh.addVolume([1741, 466, 467, 2251], 9300)
-    femmesh.addVolume([634, 2251, 633, 1786], 9301)
-    femmesh.addVolume([1392, 2186, 2184, 2187], 9302)
-    femmesh.addVolume([2185, 2182, 1390, 2186], 9303)
-    femmesh.addVolume([2080, 1672, 2083, 2084], 9304)
-    femmesh.addVolume([2082, 2085, 1674, 2084], 9305)
-    femmesh.addVolume([2117, 2113, 1705, 1706], 9306)
-    femmesh.addVolume([1706, 1707, 2117, 2115], 9307)
-    femmesh.addVolume([1361, 2154, 2153, 1359], 9308)
-    femmesh.addVolume([1361, 2152, 1357, 2153], 9309)
-    femmesh.addVolume([1731, 2020, 360, 359], 9310)
-    femmesh.addVolume([375, 1746, 2023, 374], 9311)
-    femmesh.addVolume([1785, 623, 2230, 624], 9312)
-    femmesh.addVolume([1549, 1933, 1553, 1932], 9313)
-    femmesh.addVolume([1897, 1515, 1895, 1514], 9314)
-    femmesh.addVolume([1893, 1897, 1514, 1513], 9315)
-    femmesh.addVolume([1933, 1934, 1551, 1553], 9316)
-    femmesh.addVolume([356, 357, 2019, 1756], 9317)
-    femmesh.addVolume([354, 2021, 353, 1736], 9318)
-    femmesh.addVolume([1742, 459, 460, 2257], 9319)
-    femmesh.addVolume([2192, 2188, 1396, 1397], 9320)
-    femmesh.addVolume([2190, 1397, 2192, 1398], 9321)
-    femmesh.addVolume([2078, 1666, 2077, 1670], 9322)
-    femmesh.addVolume([1668, 2078, 2079, 1670], 9323)
-    femmesh.addVolume([1414, 54, 410, 1417], 9324)
-    femmesh.addVolume([1416, 183, 1419, 673], 9325)
-    femmesh.addVolume([586, 1650, 260, 1647], 9326)
-    femmesh.addVolume([1648, 419, 131, 1645], 9327)
-    femmesh.addVolume([1594, 1971, 1591, 1595], 9328)
-    femmesh.addVolume([1593, 1973, 1596, 1595], 9329)
-    femmesh.addVolume([1856, 1473, 1470, 1472], 9330)
-    femmesh.addVolume([1471, 1472, 1854, 1468], 9331)
-    femmesh.addVolume([509, 1780, 508, 2026], 9332)
-    femmesh.addVolume([1702, 1703, 1706, 2114], 9333)
-    femmesh.addVolume([1704, 1706, 1703, 2114], 9334)
-    femmesh.addVolume([2156, 1361, 1360, 1364], 9335)
-    femmesh.addVolume([1361, 1364, 2156, 1362], 9336)
-    femmesh.addVolume([371, 372, 2026, 1737], 9337)
-    femmesh.addVolume([1517, 1513, 1896, 1516], 9338)
-    femmesh.addVolume([1551, 1931, 1550, 1548], 9339)
-    femmesh.addVolume([1898, 1518, 1515, 1517], 9340)
-    femmesh.addVolume([1550, 1549, 1546, 1929], 9341)
-    femmesh.addVolume([1758, 465, 466, 2238], 9342)
-    femmesh.addVolume([2238, 633, 1802, 632], 9343)
-    femmesh.addVolume([1393, 1397, 2189, 1394], 9344)
-    femmesh.addVolume([2189, 1394, 1397, 1395], 9345)
-    femmesh.addVolume([1670, 1669, 2081, 1673], 9346)
-    femmesh.addVolume([1671, 1670, 2081, 1673], 9347)
-    femmesh.addVolume([679, 1625, 1827, 1829], 9348)
-    femmesh.addVolume([679, 1826, 1827, 1625], 9349)
-    femmesh.addVolume([1825, 1824, 1442, 680], 9350)
-    femmesh.addVolume([1442, 680, 1824, 1822], 9351)
-    femmesh.addVolume([1599, 1976, 1979, 1978], 9352)
-    femmesh.addVolume([1978, 1977, 1597, 1974], 9353)
-    femmesh.addVolume([1850, 1852, 1853, 1467], 9354)
-    femmesh.addVolume([1848, 1852, 1465, 1851], 9355)
-    femmesh.addVolume([1700, 2108, 2109, 2111], 9356)
-    femmesh.addVolume([2108, 1700, 2107, 2111], 9357)
-    femmesh.addVolume([2158, 2162, 2159, 1367], 9358)
-    femmesh.addVolume([2159, 1367, 2162, 2160], 9359)
-    femmesh.addVolume([1899, 1903, 1519, 1902], 9360)
-    femmesh.addVolume([1904, 1521, 1901, 1903], 9361)
-    femmesh.addVolume([1928, 1927, 1545, 1925], 9362)
-    femmesh.addVolume([1923, 1926, 1927, 1543], 9363)
-    femmesh.addVolume([2186, 2183, 1391, 2184], 9364)
-    femmesh.addVolume([1391, 2186, 2182, 2183], 9365)
-    femmesh.addVolume([1676, 2087, 2083, 2084], 9366)
-    femmesh.addVolume([2087, 1676, 2085, 2084], 9367)
-    femmesh.addVolume([480, 1730, 479, 2226], 9368)
-    femmesh.addVolume([505, 2014, 506, 1776], 9369)
-    femmesh.addVolume([365, 2031, 364, 1728], 9370)
-    femmesh.addVolume([2055, 585, 1644, 2058], 9371)
-    femmesh.addVolume([418, 1642, 2056, 2053], 9372)
-    femmesh.addVolume([2211, 1422, 2214, 674], 9373)
-    femmesh.addVolume([411, 2212, 2209, 1420], 9374)
-    femmesh.addVolume([362, 363, 2013, 1757], 9375)
-    femmesh.addVolume([1824, 1441, 1822, 1823], 9376)
-    femmesh.addVolume([1826, 2000, 1827, 1623], 9377)
-    femmesh.addVolume([1829, 1827, 1998, 1621], 9378)
-    femmesh.addVolume([1828, 1443, 1825, 1824], 9379)
-    femmesh.addVolume([386, 2137, 2134, 1338], 9380)
-    femmesh.addVolume([1722, 610, 2133, 2130], 9381)
-    femmesh.addVolume([2131, 1720, 2128, 443], 9382)
-    femmesh.addVolume([2136, 1343, 2139, 649], 9383)
-    femmesh.addVolume([648, 1787, 2239, 647], 9384)
-    femmesh.addVolume([1975, 1595, 1594, 1598], 9385)
-    femmesh.addVolume([1595, 1975, 1596, 1598], 9386)
-    femmesh.addVolume([1470, 1469, 1855, 1472], 9387)
-    femmesh.addVolume([1472, 1469, 1855, 1468], 9388)
-    femmesh.addVolume([1973, 1595, 1593, 1972], 9389)
-    femmesh.addVolume([1595, 1971, 1591, 1972], 9390)
-    femmesh.addVolume([1858, 1473, 1856, 1472], 9391)
-    femmesh.addVolume([1854, 1858, 1472, 1471], 9392)
-    femmesh.addVolume([1779, 616, 1792, 3190], 9393)
-    femmesh.addVolume([2228, 616, 2248, 3190], 9394)
-    femmesh.addVolume([2112, 1703, 1704, 1701], 9395)
-    femmesh.addVolume([1702, 2110, 1699, 1703], 9396)
-    femmesh.addVolume([1360, 1363, 2155, 1364], 9397)
-    femmesh.addVolume([2157, 1364, 1365, 1362], 9398)
-    femmesh.addVolume([520, 521, 1782, 2016], 9399)
-    femmesh.addVolume([486, 2018, 487, 1778], 9400)
-    femmesh.addVolume([2206, 409, 1411, 2203], 9401)
-    femmesh.addVolume([2205, 1413, 2208, 672], 9402)
-    femmesh.addVolume([2061, 2064, 587, 1653], 9403)
-    femmesh.addVolume([2059, 420, 2062, 1651], 9404)
-    femmesh.addVolume([1979, 1978, 1981, 1601], 9405)
-    femmesh.addVolume([1981, 1601, 1978, 1977], 9406)
-    femmesh.addVolume([1849, 1848, 1852, 1466], 9407)
-    femmesh.addVolume([1852, 1850, 1849, 1466], 9408)
-    femmesh.addVolume([1930, 1550, 1547, 1546], 9409)
-    femmesh.addVolume([1550, 1930, 1547, 1548], 9410)
-    femmesh.addVolume([1518, 1900, 1520, 1517], 9411)
-    femmesh.addVolume([1520, 1517, 1900, 1516], 9412)
-    femmesh.addVolume([2025, 507, 506, 1802], 9413)
-    femmesh.addVolume([2104, 1696, 2107, 2108], 9414)
-    femmesh.addVolume([1698, 2106, 2109, 2108], 9415)
-    femmesh.addVolume([1366, 2161, 2158, 2162], 9416)
-    femmesh.addVolume([2162, 2160, 1368, 2163], 9417)
-    femmesh.addVolume([2115, 1706, 1704, 2114], 9418)
-    femmesh.addVolume([1702, 1706, 2113, 2114], 9419)
-    femmesh.addVolume([2152, 1361, 1360, 2156], 9420)
-    femmesh.addVolume([2154, 1361, 2156, 1362], 9421)
-    femmesh.addVolume([1523, 1903, 1906, 1902], 9422)
-    femmesh.addVolume([1927, 1544, 1924, 1923], 9423)
-    femmesh.addVolume([1927, 1925, 1924, 1544], 9424)
-    femmesh.addVolume([1906, 1523, 1904, 1903], 9425)
-    femmesh.addVolume([1394, 2187, 1392, 1395], 9426)
-    femmesh.addVolume([1390, 1393, 2185, 1394], 9427)
-    femmesh.addVolume([2080, 1669, 1672, 1673], 9428)
-    femmesh.addVolume([1674, 1671, 2082, 1673], 9429)
-    femmesh.addVolume([1389, 2183, 2181, 2184], 9430)
-    femmesh.addVolume([2182, 2179, 1387, 2183], 9431)
-    femmesh.addVolume([2087, 1675, 2083, 2086], 9432)
-    femmesh.addVolume([2087, 2085, 1677, 2088], 9433)
-    femmesh.addVolume([1896, 1517, 1897, 1513], 9434)
-    femmesh.addVolume([1515, 1897, 1898, 1517], 9435)
-    femmesh.addVolume([1551, 1550, 1931, 1933], 9436)
-    femmesh.addVolume([1549, 1550, 1933, 1929], 9437)
-    femmesh.addVolume([2031, 502, 501, 1772], 9438)
-    femmesh.addVolume([1445, 1824, 1831, 1823], 9439)
-    femmesh.addVolume([1831, 1445, 1828, 1824], 9440)
-    femmesh.addVolume([1999, 1827, 2000, 1622], 9441)
-    femmesh.addVolume([1827, 1622, 1999, 1998], 9442)
-    femmesh.addVolume([2189, 1393, 2188, 1397], 9443)
-    femmesh.addVolume([2190, 2189, 1397, 1395], 9444)
-    femmesh.addVolume([1669, 2081, 2077, 1670], 9445)
-    femmesh.addVolume([2081, 1671, 2079, 1670], 9446)
-    femmesh.addVolume([384, 385, 2005, 1743], 9447)
-    femmesh.addVolume([2001, 349, 1744, 348], 9448)
-    femmesh.addVolume([1981, 1980, 1600, 1977], 9449)
-    femmesh.addVolume([1602, 1979, 1982, 1981], 9450)
-    femmesh.addVolume([1849, 1850, 1847, 1464], 9451)
-    femmesh.addVolume([1849, 1848, 1462, 1845], 9452)
-    femmesh.addVolume([1697, 2104, 2105, 2108], 9453)
-    femmesh.addVolume([2106, 1697, 2105, 2108], 9454)
-    femmesh.addVolume([2165, 2162, 1370, 2163], 9455)
-    femmesh.addVolume([1370, 2161, 2162, 2165], 9456)
-    femmesh.addVolume([1906, 1522, 1902, 1905], 9457)
-    femmesh.addVolume([1904, 1907, 1524, 1906], 9458)
-    femmesh.addVolume([1924, 1542, 1925, 1922], 9459)
-    femmesh.addVolume([1923, 1924, 1920, 1540], 9460)
-    femmesh.addVolume([2180, 1388, 2179, 2183], 9461)
-    femmesh.addVolume([2183, 2180, 1388, 2181], 9462)
-    femmesh.addVolume([2090, 2088, 2087, 1679], 9463)
-    femmesh.addVolume([2086, 2090, 2087, 1679], 9464)
-    femmesh.addVolume([1830, 1831, 1823, 1444], 9465)
-    femmesh.addVolume([1446, 1828, 1832, 1831], 9466)
-    femmesh.addVolume([1618, 1999, 1998, 1995], 9467)
-    femmesh.addVolume([1997, 2000, 1620, 1999], 9468)
-    femmesh.addVolume([1596, 1976, 1599, 1598], 9469)
-    femmesh.addVolume([1598, 1597, 1594, 1974], 9470)
-    femmesh.addVolume([1467, 1853, 1470, 1469], 9471)
-    femmesh.addVolume([1469, 1465, 1851, 1468], 9472)
-    femmesh.addVolume([369, 370, 2025, 1758], 9473)
-    femmesh.addVolume([1700, 1701, 1703, 2111], 9474)
-    femmesh.addVolume([1699, 1700, 1703, 2111], 9475)
-    femmesh.addVolume([1364, 1363, 2159, 1367], 9476)
-    femmesh.addVolume([1367, 2159, 1364, 1365], 9477)
-    femmesh.addVolume([1723, 4, 2040, 1759], 9478)
-    femmesh.addVolume([1724, 2041, 5, 1760], 9479)
-    femmesh.addVolume([1901, 1521, 1518, 1520], 9480)
-    femmesh.addVolume([1520, 1519, 1516, 1899], 9481)
-    femmesh.addVolume([1546, 1547, 1926, 1543], 9482)
-    femmesh.addVolume([1547, 1545, 1548, 1928], 9483)
-    femmesh.addVolume([1440, 1825, 1443, 1442], 9484)
-    femmesh.addVolume([1822, 1442, 1438, 1441], 9485)
-    femmesh.addVolume([1625, 1829, 1624, 1621], 9486)
-    femmesh.addVolume([1826, 1626, 1623, 1625], 9487)
-    femmesh.addVolume([680, 1442, 1439, 1438], 9488)
-    femmesh.addVolume([1439, 1440, 1442, 680], 9489)
-    femmesh.addVolume([679, 1628, 1625, 1624], 9490)
-    femmesh.addVolume([1625, 679, 1626, 1628], 9491)
-    femmesh.addVolume([1390, 1394, 2186, 1391], 9492)
-    femmesh.addVolume([2186, 1391, 1394, 1392], 9493)
-    femmesh.addVolume([2084, 1672, 1676, 1673], 9494)
-    femmesh.addVolume([1674, 2084, 1676, 1673], 9495)
-    femmesh.addVolume([332, 1956, 1953, 1576], 9496)
-    femmesh.addVolume([1958, 566, 1955, 1578], 9497)
-    femmesh.addVolume([1872, 1486, 1869, 304], 9498)
-    femmesh.addVolume([538, 1871, 1874, 1488], 9499)
-    femmesh.addVolume([1984, 1982, 1981, 1604], 9500)
-    femmesh.addVolume([1604, 1981, 1984, 1980], 9501)
-    femmesh.addVolume([1845, 1463, 1849, 1846], 9502)
-    femmesh.addVolume([1847, 1849, 1463, 1846], 9503)
-    femmesh.addVolume([2104, 2101, 1693, 2105], 9504)
-    femmesh.addVolume([2106, 1695, 2103, 2105], 9505)
-    femmesh.addVolume([2166, 2165, 1371, 2163], 9506)
-    femmesh.addVolume([2161, 1369, 2164, 2165], 9507)
-    femmesh.addVolume([1526, 1906, 1909, 1905], 9508)
-    femmesh.addVolume([1907, 1909, 1526, 1906], 9509)
-    femmesh.addVolume([1541, 1922, 1924, 1921], 9510)
-    femmesh.addVolume([1541, 1921, 1924, 1920], 9511)
-    femmesh.addVolume([2179, 2176, 1384, 2180], 9512)
-    femmesh.addVolume([2180, 1386, 2181, 2178], 9513)
-    femmesh.addVolume([2086, 1678, 2089, 2090], 9514)
-    femmesh.addVolume([2088, 2091, 1680, 2090], 9515)
-    femmesh.addVolume([1975, 1596, 1973, 1595], 9516)
-    femmesh.addVolume([1971, 1594, 1975, 1595], 9517)
-    femmesh.addVolume([1855, 1854, 1472, 1468], 9518)
-    femmesh.addVolume([1470, 1855, 1856, 1472], 9519)
-    femmesh.addVolume([1448, 1831, 1834, 1830], 9520)
-    femmesh.addVolume([1834, 1448, 1832, 1831], 9521)
-    femmesh.addVolume([1996, 1999, 1619, 1995], 9522)
-    femmesh.addVolume([1996, 1997, 1619, 1999], 9523)
-    femmesh.addVolume([1880, 541, 1500, 1883], 9524)
-    femmesh.addVolume([1881, 1498, 1878, 307], 9525)
-    femmesh.addVolume([1949, 1946, 1566, 563], 9526)
-    femmesh.addVolume([1947, 329, 1564, 1944], 9527)
-    femmesh.addVolume([1703, 2112, 1704, 2114], 9528)
-    femmesh.addVolume([1703, 1702, 2110, 2114], 9529)
-    femmesh.addVolume([2157, 2156, 1364, 1362], 9530)
-    femmesh.addVolume([2156, 1360, 2155, 1364], 9531)
-    femmesh.addVolume([1896, 1900, 1517, 1516], 9532)
-    femmesh.addVolume([1900, 1518, 1898, 1517], 9533)
-    femmesh.addVolume([1546, 1930, 1550, 1929], 9534)
-    femmesh.addVolume([1931, 1930, 1550, 1548], 9535)
-    femmesh.addVolume([2187, 1394, 2189, 1395], 9536)
-    femmesh.addVolume([1393, 2189, 2185, 1394], 9537)
-    femmesh.addVolume([2081, 1669, 2080, 1673], 9538)
-    femmesh.addVolume([2081, 2082, 1671, 1673], 9539)
-    femmesh.addVolume([1978, 1599, 1598, 1601], 9540)
-    femmesh.addVolume([1601, 1598, 1978, 1597], 9541)
-    femmesh.addVolume([1469, 1852, 1465, 1466], 9542)
-    femmesh.addVolume([1469, 1467, 1852, 1466], 9543)
-    femmesh.addVolume([1980, 1984, 1603, 1983], 9544)
-    femmesh.addVolume([1605, 1982, 1985, 1984], 9545)
-    femmesh.addVolume([1845, 1842, 1459, 1846], 9546)
-    femmesh.addVolume([1844, 1847, 1461, 1846], 9547)
-    femmesh.addVolume([1700, 1701, 2109, 1698], 9548)
-    femmesh.addVolume([1699, 2107, 1696, 1700], 9549)
-    femmesh.addVolume([1367, 1365, 1368, 2160], 9550)
-    femmesh.addVolume([1366, 2158, 1363, 1367], 9551)
-    femmesh.addVolume([1694, 2105, 2101, 2102], 9552)
-    femmesh.addVolume([1373, 2168, 2164, 2165], 9553)
-    femmesh.addVolume([2105, 1694, 2103, 2102], 9554)
-    femmesh.addVolume([2165, 1373, 2168, 2166], 9555)
-    femmesh.addVolume([1525, 1909, 1908, 1905], 9556)
-    femmesh.addVolume([1527, 1907, 1910, 1909], 9557)
-    femmesh.addVolume([1537, 1921, 1920, 1917], 9558)
-    femmesh.addVolume([1919, 1922, 1539, 1921], 9559)
-    femmesh.addVolume([1645, 2056, 130, 1642], 9560)
-    femmesh.addVolume([2058, 259, 1644, 1647], 9561)
-    femmesh.addVolume([184, 2211, 1422, 1419], 9562)
-    femmesh.addVolume([55, 2209, 1417, 1420], 9563)
-    femmesh.addVolume([1520, 1903, 1523, 1519], 9564)
-    femmesh.addVolume([1521, 1523, 1520, 1903], 9565)
-    femmesh.addVolume([1547, 1544, 1927, 1543], 9566)
-    femmesh.addVolume([1545, 1927, 1547, 1544], 9567)
-    femmesh.addVolume([2177, 2176, 2180, 1385], 9568)
-    femmesh.addVolume([1385, 2180, 2177, 2178], 9569)
-    femmesh.addVolume([2089, 1682, 2093, 2090], 9570)
-    femmesh.addVolume([2091, 2093, 1682, 2090], 9571)
-    femmesh.addVolume([285, 2133, 1341, 1722], 9572)
-    femmesh.addVolume([2131, 156, 1344, 1720], 9573)
-    femmesh.addVolume([1337, 29, 2134, 1338], 9574)
-    femmesh.addVolume([1340, 158, 1343, 2136], 9575)
-    femmesh.addVolume([1832, 1835, 1449, 1834], 9576)
-    femmesh.addVolume([1834, 1447, 1830, 1833], 9577)
-    femmesh.addVolume([1996, 1997, 1994, 1617], 9578)
-    femmesh.addVolume([1996, 1992, 1995, 1615], 9579)
-    femmesh.addVolume([1387, 1390, 2182, 1391], 9580)
-    femmesh.addVolume([1391, 2184, 1389, 1392], 9581)
-    femmesh.addVolume([1674, 2085, 1677, 1676], 9582)
-    femmesh.addVolume([1672, 1675, 2083, 1676], 9583)
-    femmesh.addVolume([1443, 1445, 1442, 1824], 9584)
-    femmesh.addVolume([1442, 1824, 1445, 1441], 9585)
-    femmesh.addVolume([1622, 1827, 1623, 1625], 9586)
-    femmesh.addVolume([1625, 1622, 1827, 1621], 9587)
-    femmesh.addVolume([2022, 1742, 363, 364], 9588)
-    femmesh.addVolume([1985, 1987, 1607, 1984], 9589)
-    femmesh.addVolume([1607, 1984, 1987, 1983], 9590)
-    femmesh.addVolume([1460, 1842, 1843, 1846], 9591)
-    femmesh.addVolume([1843, 1844, 1460, 1846], 9592)
-    femmesh.addVolume([1692, 2103, 2102, 2100], 9593)
-    femmesh.addVolume([1690, 2101, 2098, 2102], 9594)
-    femmesh.addVolume([2168, 2169, 2166, 1374], 9595)
-    femmesh.addVolume([2167, 2164, 1372, 2168], 9596)
-    femmesh.addVolume([628, 2240, 627, 1772], 9597)
-    femmesh.addVolume([1921, 1538, 1918, 1917], 9598)
-    femmesh.addVolume([1538, 1918, 1919, 1921], 9599)
-    femmesh.addVolume([1529, 1909, 1912, 1908], 9600)
-    femmesh.addVolume([1912, 1910, 1909, 1529], 9601)
-    femmesh.addVolume([2175, 2177, 2178, 1383], 9602)
-    femmesh.addVolume([1381, 2176, 2173, 2177], 9603)
-    femmesh.addVolume([2092, 2093, 2089, 1681], 9604)
-    femmesh.addVolume([2094, 2091, 2093, 1683], 9605)
-    femmesh.addVolume([1835, 1834, 1837, 1451], 9606)
-    femmesh.addVolume([1837, 1451, 1834, 1833], 9607)
-    femmesh.addVolume([1994, 1996, 1616, 1993], 9608)
-    femmesh.addVolume([1993, 1996, 1616, 1992], 9609)
-    femmesh.addVolume([53, 1411, 1414, 2206], 9610)
-    femmesh.addVolume([1416, 182, 2208, 1413], 9611)
-    femmesh.addVolume([1651, 2059, 132, 1648], 9612)
-    femmesh.addVolume([261, 1650, 2061, 1653], 9613)
-    femmesh.addVolume([1608, 1985, 1988, 1987], 9614)
-    femmesh.addVolume([1987, 1986, 1606, 1983], 9615)
-    femmesh.addVolume([1843, 1841, 1458, 1844], 9616)
-    femmesh.addVolume([1843, 1839, 1842, 1456], 9617)
-    femmesh.addVolume([1376, 2171, 2168, 2169], 9618)
-    femmesh.addVolume([2098, 2102, 2099, 1691], 9619)
-    femmesh.addVolume([2099, 1691, 2102, 2100], 9620)
-    femmesh.addVolume([2167, 2168, 1376, 2171], 9621)
-    femmesh.addVolume([1530, 1910, 1913, 1912], 9622)
-    femmesh.addVolume([1536, 1916, 1919, 1918], 9623)
-    femmesh.addVolume([1534, 1918, 1917, 1914], 9624)
-    femmesh.addVolume([1912, 1528, 1908, 1911], 9625)
-    femmesh.addVolume([2173, 2177, 2174, 1382], 9626)
-    femmesh.addVolume([2174, 1382, 2177, 2175], 9627)
-    femmesh.addVolume([2096, 2094, 2093, 1685], 9628)
-    femmesh.addVolume([2092, 2096, 2093, 1685], 9629)
-    femmesh.addVolume([1836, 1837, 1833, 1450], 9630)
-    femmesh.addVolume([1452, 1835, 1838, 1837], 9631)
-    femmesh.addVolume([1612, 1993, 1992, 1989], 9632)
-    femmesh.addVolume([1994, 1614, 1991, 1993], 9633)
-    femmesh.addVolume([1597, 1601, 1600, 1977], 9634)
-    femmesh.addVolume([1979, 1602, 1599, 1601], 9635)
-    femmesh.addVolume([1848, 1462, 1465, 1466], 9636)
-    femmesh.addVolume([1464, 1850, 1467, 1466], 9637)
-    femmesh.addVolume([2162, 1367, 1370, 1368], 9638)
-    femmesh.addVolume([1366, 1370, 2162, 1367], 9639)
-    femmesh.addVolume([1697, 1698, 1700, 2108], 9640)
-    femmesh.addVolume([1696, 1697, 1700, 2108], 9641)
-    femmesh.addVolume([1987, 1988, 1610, 1990], 9642)
-    femmesh.addVolume([1990, 1610, 1987, 1986], 9643)
-    femmesh.addVolume([1840, 1839, 1843, 1457], 9644)
-    femmesh.addVolume([1843, 1841, 1840, 1457], 9645)
-    femmesh.addVolume([1902, 1523, 1519, 1522], 9646)
-    femmesh.addVolume([1545, 1542, 1925, 1544], 9647)
-    femmesh.addVolume([1544, 1540, 1923, 1543], 9648)
-    femmesh.addVolume([1524, 1521, 1904, 1523], 9649)
-    femmesh.addVolume([1375, 2170, 2167, 2171], 9650)
-    femmesh.addVolume([2169, 2171, 2172, 1377], 9651)
-    femmesh.addVolume([2098, 2099, 2095, 1687], 9652)
-    femmesh.addVolume([2099, 2100, 2097, 1689], 9653)
-    femmesh.addVolume([1912, 1915, 1532, 1911], 9654)
-    femmesh.addVolume([1532, 1913, 1915, 1912], 9655)
-    femmesh.addVolume([1535, 1915, 1916, 1918], 9656)
-    femmesh.addVolume([1918, 1535, 1915, 1914], 9657)
-    femmesh.addVolume([1378, 2173, 2170, 2174], 9658)
-    femmesh.addVolume([2172, 2174, 2175, 1380], 9659)
-    femmesh.addVolume([2092, 1684, 2095, 2096], 9660)
-    femmesh.addVolume([2096, 2097, 2094, 1686], 9661)
-    femmesh.addVolume([1990, 1993, 1613, 1989], 9662)
-    femmesh.addVolume([1836, 1840, 1837, 1454], 9663)
-    femmesh.addVolume([1613, 1990, 1991, 1993], 9664)
-    femmesh.addVolume([1837, 1840, 1838, 1454], 9665)
-    femmesh.addVolume([1387, 1388, 1391, 2183], 9666)
-    femmesh.addVolume([1391, 2183, 1388, 1389], 9667)
-    femmesh.addVolume([1679, 2087, 1675, 1676], 9668)
-    femmesh.addVolume([2087, 1679, 1677, 1676], 9669)
-    femmesh.addVolume([481, 1743, 480, 2239], 9670)
-    femmesh.addVolume([445, 1744, 444, 2227], 9671)
-    femmesh.addVolume([1986, 1990, 1609, 1989], 9672)
-    femmesh.addVolume([1991, 1611, 1988, 1990], 9673)
-    femmesh.addVolume([1839, 1840, 1836, 1453], 9674)
-    femmesh.addVolume([1841, 1840, 1455, 1838], 9675)
-    femmesh.addVolume([2171, 2170, 2174, 1379], 9676)
-    femmesh.addVolume([2099, 2096, 1688, 2097], 9677)
-    femmesh.addVolume([2099, 2095, 1688, 2096], 9678)
-    femmesh.addVolume([1379, 2174, 2171, 2172], 9679)
-    femmesh.addVolume([1531, 1911, 1915, 1914], 9680)
-    femmesh.addVolume([1913, 1916, 1533, 1915], 9681)
-    femmesh.addVolume([2052, 584, 1641, 2055], 9682)
-    femmesh.addVolume([2050, 417, 2053, 1639], 9683)
-    femmesh.addVolume([2217, 2214, 1425, 675], 9684)
-    femmesh.addVolume([1423, 412, 2212, 2215], 9685)
-    femmesh.addVolume([1823, 1445, 1441, 1444], 9686)
-    femmesh.addVolume([1446, 1443, 1828, 1445], 9687)
-    femmesh.addVolume([1623, 1620, 2000, 1622], 9688)
-    femmesh.addVolume([1621, 1622, 1998, 1618], 9689)
-    femmesh.addVolume([465, 1733, 464, 2254], 9690)
-    femmesh.addVolume([631, 2254, 1776, 632], 9691)
-    femmesh.addVolume([1975, 1598, 1594, 1974], 9692)
-    femmesh.addVolume([1596, 1975, 1976, 1598], 9693)
-    femmesh.addVolume([1855, 1469, 1851, 1468], 9694)
-    femmesh.addVolume([1853, 1855, 1470, 1469], 9695)
-    femmesh.addVolume([1701, 2112, 1703, 2111], 9696)
-    femmesh.addVolume([1703, 2110, 1699, 2111], 9697)
-    femmesh.addVolume([1365, 2159, 1364, 2157], 9698)
-    femmesh.addVolume([2159, 2155, 1363, 1364], 9699)
-    femmesh.addVolume([2137, 387, 2140, 1345], 9700)
-    femmesh.addVolume([1347, 2142, 2139, 650], 9701)
-    femmesh.addVolume([2125, 2128, 1717, 442], 9702)
-    femmesh.addVolume([1719, 2127, 609, 2130], 9703)
-    femmesh.addVolume([1790, 1783, 638, 3188], 9704)
-    femmesh.addVolume([2224, 2243, 638, 3188], 9705)
-    femmesh.addVolume([1516, 1900, 1520, 1899], 9706)
-    femmesh.addVolume([1520, 1518, 1901, 1900], 9707)
-    femmesh.addVolume([1547, 1926, 1930, 1546], 9708)
-    femmesh.addVolume([1548, 1930, 1547, 1928], 9709)
-    femmesh.addVolume([2185, 2186, 1390, 1394], 9710)
-    femmesh.addVolume([2186, 1392, 1394, 2187], 9711)
-    femmesh.addVolume([1672, 2084, 2080, 1673], 9712)
-    femmesh.addVolume([2082, 2084, 1674, 1673], 9713)
-    femmesh.addVolume([1408, 408, 2200, 2203], 9714)
-    femmesh.addVolume([2205, 2202, 1410, 671], 9715)
-    femmesh.addVolume([421, 2065, 2062, 1654], 9716)
-    femmesh.addVolume([588, 2064, 2067, 1656], 9717)
-    femmesh.addVolume([1602, 1601, 1981, 1604], 9718)
-    femmesh.addVolume([1981, 1604, 1601, 1600], 9719)
-    femmesh.addVolume([1462, 1849, 1463, 1466], 9720)
-    femmesh.addVolume([1464, 1463, 1849, 1466], 9721)
-    femmesh.addVolume([2161, 1366, 1369, 1370], 9722)
-    femmesh.addVolume([1371, 1370, 1368, 2163], 9723)
-    femmesh.addVolume([1696, 2104, 1693, 1697], 9724)
-    femmesh.addVolume([2106, 1698, 1695, 1697], 9725)
-    femmesh.addVolume([1906, 1526, 1523, 1522], 9726)
-    femmesh.addVolume([1523, 1524, 1526, 1906], 9727)
-    femmesh.addVolume([1542, 1541, 1924, 1544], 9728)
-    femmesh.addVolume([1544, 1541, 1924, 1540], 9729)
-    femmesh.addVolume([2179, 1384, 1387, 1388], 9730)
-    femmesh.addVolume([1386, 1388, 2181, 1389], 9731)
-    femmesh.addVolume([1675, 1678, 2086, 1679], 9732)
-    femmesh.addVolume([1677, 2088, 1680, 1679], 9733)
-    femmesh.addVolume([1448, 1445, 1446, 1831], 9734)
-    femmesh.addVolume([1445, 1831, 1448, 1444], 9735)
-    femmesh.addVolume([1999, 1620, 1619, 1622], 9736)
-    femmesh.addVolume([1622, 1619, 1999, 1618], 9737)
-    femmesh.addVolume([1728, 460, 461, 2240], 9738)
-    femmesh.addVolume([107, 1953, 1573, 1576], 9739)
-    femmesh.addVolume([1575, 1955, 236, 1578], 9740)
-    femmesh.addVolume([78, 1872, 1486, 1489], 9741)
-    femmesh.addVolume([1874, 1491, 207, 1488], 9742)
-    femmesh.addVolume([1825, 1442, 1440, 680], 9743)
-    femmesh.addVolume([1624, 1625, 679, 1829], 9744)
-    femmesh.addVolume([1438, 680, 1442, 1822], 9745)
-    femmesh.addVolume([1626, 1826, 679, 1625], 9746)
-    femmesh.addVolume([1497, 210, 1500, 1880], 9747)
-    femmesh.addVolume([1495, 81, 1878, 1498], 9748)
-    femmesh.addVolume([1567, 104, 1564, 1947], 9749)
-    femmesh.addVolume([1569, 233, 1949, 1566], 9750)
-    femmesh.addVolume([1982, 1605, 1602, 1604], 9751)
-    femmesh.addVolume([1604, 1603, 1600, 1980], 9752)
-    femmesh.addVolume([1463, 1464, 1847, 1461], 9753)
-    femmesh.addVolume([1463, 1462, 1459, 1845], 9754)
-    femmesh.addVolume([2022, 501, 500, 1795], 9755)
-    femmesh.addVolume([1694, 2105, 1695, 1697], 9756)
-    femmesh.addVolume([2105, 1694, 1693, 1697], 9757)
-    femmesh.addVolume([1370, 1373, 1369, 2165], 9758)
-    femmesh.addVolume([2165, 1370, 1373, 1371], 9759)
-    femmesh.addVolume([1524, 1907, 1527, 1526], 9760)
-    femmesh.addVolume([1541, 1537, 1920, 1540], 9761)
-    femmesh.addVolume([1539, 1542, 1541, 1922], 9762)
-    femmesh.addVolume([1525, 1522, 1526, 1905], 9763)
-    femmesh.addVolume([1384, 1388, 2180, 1385], 9764)
-    femmesh.addVolume([2180, 1385, 1388, 1386], 9765)
-    femmesh.addVolume([2090, 1678, 1682, 1679], 9766)
-    femmesh.addVolume([2090, 1682, 1680, 1679], 9767)
-    femmesh.addVolume([1832, 1449, 1446, 1448], 9768)
-    femmesh.addVolume([1448, 1444, 1830, 1447], 9769)
-    femmesh.addVolume([1620, 1997, 1619, 1617], 9770)
-    femmesh.addVolume([1619, 1995, 1618, 1615], 9771)
-    femmesh.addVolume([1597, 1598, 1978, 1974], 9772)
-    femmesh.addVolume([1598, 1976, 1599, 1978], 9773)
-    femmesh.addVolume([1851, 1852, 1465, 1469], 9774)
-    femmesh.addVolume([1467, 1852, 1853, 1469], 9775)
-    femmesh.addVolume([1700, 1699, 2107, 2111], 9776)
-    femmesh.addVolume([1701, 1700, 2109, 2111], 9777)
-    femmesh.addVolume([1365, 1367, 2159, 2160], 9778)
-    femmesh.addVolume([2159, 1363, 2158, 1367], 9779)
-    femmesh.addVolume([1519, 1520, 1903, 1899], 9780)
-    femmesh.addVolume([1520, 1901, 1521, 1903], 9781)
-    femmesh.addVolume([1545, 1547, 1927, 1928], 9782)
-    femmesh.addVolume([1926, 1547, 1927, 1543], 9783)
-    femmesh.addVolume([567, 1958, 1961, 1581], 9784)
-    femmesh.addVolume([333, 1959, 1956, 1579], 9785)
-    femmesh.addVolume([1483, 1866, 1869, 303], 9786)
-    femmesh.addVolume([1871, 1485, 537, 1868], 9787)
-    femmesh.addVolume([1607, 1604, 1984, 1603], 9788)
-    femmesh.addVolume([1605, 1984, 1607, 1604], 9789)
-    femmesh.addVolume([1461, 1463, 1460, 1846], 9790)
-    femmesh.addVolume([1459, 1460, 1463, 1846], 9791)
-    femmesh.addVolume([1693, 1694, 2101, 1690], 9792)
-    femmesh.addVolume([1695, 2103, 1694, 1692], 9793)
-    femmesh.addVolume([2164, 1372, 1373, 1369], 9794)
-    femmesh.addVolume([2166, 1371, 1373, 1374], 9795)
-    femmesh.addVolume([2186, 2182, 1390, 1391], 9796)
-    femmesh.addVolume([2184, 1391, 2186, 1392], 9797)
-    femmesh.addVolume([1676, 1674, 2085, 2084], 9798)
-    femmesh.addVolume([1676, 2083, 1672, 2084], 9799)
-    femmesh.addVolume([1529, 1526, 1909, 1525], 9800)
-    femmesh.addVolume([1909, 1527, 1526, 1529], 9801)
-    femmesh.addVolume([1539, 1541, 1538, 1921], 9802)
-    femmesh.addVolume([1538, 1921, 1541, 1537], 9803)
-    femmesh.addVolume([2178, 1385, 1386, 1383], 9804)
-    femmesh.addVolume([1381, 1384, 2176, 1385], 9805)
-    femmesh.addVolume([1680, 1682, 2091, 1683], 9806)
-    femmesh.addVolume([1682, 1678, 2089, 1681], 9807)
-    femmesh.addVolume([1451, 1448, 1834, 1447], 9808)
-    femmesh.addVolume([1834, 1449, 1448, 1451], 9809)
-    femmesh.addVolume([1996, 1616, 1619, 1617], 9810)
-    femmesh.addVolume([1616, 1996, 1619, 1615], 9811)
-    femmesh.addVolume([1442, 1825, 1443, 1824], 9812)
-    femmesh.addVolume([1442, 1822, 1824, 1441], 9813)
-    femmesh.addVolume([1829, 1625, 1827, 1621], 9814)
-    femmesh.addVolume([1623, 1827, 1826, 1625], 9815)
-    femmesh.addVolume([1883, 1886, 542, 1503], 9816)
-    femmesh.addVolume([1884, 1501, 1881, 308], 9817)
-    femmesh.addVolume([1943, 1563, 1946, 562], 9818)
-    femmesh.addVolume([328, 1561, 1944, 1941], 9819)
-    femmesh.addVolume([1603, 1607, 1606, 1983], 9820)
-    femmesh.addVolume([1605, 1985, 1608, 1607], 9821)
-    femmesh.addVolume([1460, 1458, 1461, 1844], 9822)
-    femmesh.addVolume([1460, 1456, 1842, 1459], 9823)
-    femmesh.addVolume([2168, 1373, 1376, 1374], 9824)
-    femmesh.addVolume([1694, 2102, 1690, 1691], 9825)
-    femmesh.addVolume([1691, 1694, 2102, 1692], 9826)
-    femmesh.addVolume([1376, 1372, 1373, 2168], 9827)
-    femmesh.addVolume([1538, 1917, 1537, 1534], 9828)
-    femmesh.addVolume([1538, 1539, 1919, 1536], 9829)
-    femmesh.addVolume([1530, 1527, 1910, 1529], 9830)
-    femmesh.addVolume([1529, 1525, 1908, 1528], 9831)
-    femmesh.addVolume([1385, 2177, 1382, 1383], 9832)
-    femmesh.addVolume([1382, 1381, 2177, 1385], 9833)
-    femmesh.addVolume([1685, 2093, 1682, 1683], 9834)
-    femmesh.addVolume([1681, 2093, 1682, 1685], 9835)
-    femmesh.addVolume([1833, 1451, 1447, 1450], 9836)
-    femmesh.addVolume([1452, 1449, 1835, 1451], 9837)
-    femmesh.addVolume([1994, 1614, 1616, 1617], 9838)
-    femmesh.addVolume([1615, 1616, 1992, 1612], 9839)
-    femmesh.addVolume([1458, 1843, 1460, 1457], 9840)
-    femmesh.addVolume([1456, 1460, 1843, 1457], 9841)
-    femmesh.addVolume([1987, 1610, 1607, 1606], 9842)
-    femmesh.addVolume([1607, 1608, 1610, 1987], 9843)
-    femmesh.addVolume([1375, 2167, 1372, 1376], 9844)
-    femmesh.addVolume([1374, 1376, 2169, 1377], 9845)
-    femmesh.addVolume([1692, 2100, 1691, 1689], 9846)
-    femmesh.addVolume([2098, 1687, 1690, 1691], 9847)
-    femmesh.addVolume([1530, 1912, 1532, 1529], 9848)
-    femmesh.addVolume([1532, 1529, 1912, 1528], 9849)
-    femmesh.addVolume([1918, 1538, 1535, 1534], 9850)
-    femmesh.addVolume([1535, 1536, 1538, 1918], 9851)
-    femmesh.addVolume([1380, 1382, 2175, 1383], 9852)
-    femmesh.addVolume([1381, 2173, 1378, 1382], 9853)
-    femmesh.addVolume([2092, 1681, 1684, 1685], 9854)
-    femmesh.addVolume([1686, 2094, 1685, 1683], 9855)
-    femmesh.addVolume([1450, 1837, 1451, 1454], 9856)
-    femmesh.addVolume([1452, 1451, 1837, 1454], 9857)
-    femmesh.addVolume([1993, 1616, 1613, 1612], 9858)
-    femmesh.addVolume([1613, 1614, 1616, 1993], 9859)
-    femmesh.addVolume([1641, 258, 1644, 2055], 9860)
-    femmesh.addVolume([2053, 129, 1642, 1639], 9861)
-    femmesh.addVolume([1422, 185, 1425, 2214], 9862)
-    femmesh.addVolume([1420, 56, 2212, 1423], 9863)
-    femmesh.addVolume([629, 1815, 2232, 1805], 9864)
-    femmesh.addVolume([1456, 1839, 1453, 1457], 9865)
-    femmesh.addVolume([1841, 1458, 1455, 1457], 9866)
-    femmesh.addVolume([1606, 1610, 1609, 1986], 9867)
-    femmesh.addVolume([1988, 1611, 1608, 1610], 9868)
-    femmesh.addVolume([1376, 1379, 2171, 1377], 9869)
-    femmesh.addVolume([2171, 1376, 1375, 1379], 9870)
-    femmesh.addVolume([1687, 2099, 1688, 1691], 9871)
-    femmesh.addVolume([1691, 2099, 1688, 1689], 9872)
-    femmesh.addVolume([1911, 1532, 1528, 1531], 9873)
-    femmesh.addVolume([1530, 1913, 1533, 1532], 9874)
-    femmesh.addVolume([1533, 1916, 1536, 1535], 9875)
-    femmesh.addVolume([1531, 1535, 1534, 1914], 9876)
-    femmesh.addVolume([2174, 1379, 1382, 1380], 9877)
-    femmesh.addVolume([1378, 1382, 2174, 1379], 9878)
-    femmesh.addVolume([1685, 1688, 2096, 1686], 9879)
-    femmesh.addVolume([2096, 1684, 1688, 1685], 9880)
-    femmesh.addVolume([1836, 1450, 1453, 1454], 9881)
-    femmesh.addVolume([1609, 1613, 1612, 1989], 9882)
-    femmesh.addVolume([1452, 1838, 1455, 1454], 9883)
-    femmesh.addVolume([1991, 1614, 1611, 1613], 9884)
-    femmesh.addVolume([369, 2014, 368, 1733], 9885)
-    femmesh.addVolume([1990, 1611, 1610, 1613], 9886)
-    femmesh.addVolume([1457, 1840, 1453, 1454], 9887)
-    femmesh.addVolume([1613, 1610, 1990, 1609], 9888)
-    femmesh.addVolume([1457, 1455, 1840, 1454], 9889)
-    femmesh.addVolume([1379, 1380, 2172, 1377], 9890)
-    femmesh.addVolume([1686, 1688, 2097, 1689], 9891)
-    femmesh.addVolume([2170, 1375, 1378, 1379], 9892)
-    femmesh.addVolume([1688, 1684, 2095, 1687], 9893)
-    femmesh.addVolume([1533, 1532, 1915, 1535], 9894)
-    femmesh.addVolume([1535, 1532, 1915, 1531], 9895)
-    femmesh.addVolume([1343, 159, 1347, 2139], 9896)
-    femmesh.addVolume([1338, 30, 2137, 1345], 9897)
-    femmesh.addVolume([1720, 2128, 155, 1717], 9898)
-    femmesh.addVolume([284, 1722, 1719, 2130], 9899)
-    femmesh.addVolume([1597, 1978, 1601, 1977], 9900)
-    femmesh.addVolume([1978, 1979, 1599, 1601], 9901)
-    femmesh.addVolume([1467, 1850, 1852, 1466], 9902)
-    femmesh.addVolume([1848, 1465, 1852, 1466], 9903)
-    femmesh.addVolume([1700, 1698, 2109, 2108], 9904)
-    femmesh.addVolume([1700, 2107, 1696, 2108], 9905)
-    femmesh.addVolume([2162, 2158, 1366, 1367], 9906)
-    femmesh.addVolume([1368, 2162, 1367, 2160], 9907)
-    femmesh.addVolume([1519, 1903, 1523, 1902], 9908)
-    femmesh.addVolume([1523, 1521, 1904, 1903], 9909)
-    femmesh.addVolume([1923, 1927, 1544, 1543], 9910)
-    femmesh.addVolume([1925, 1927, 1545, 1544], 9911)
-    femmesh.addVolume([1413, 181, 2205, 1410], 9912)
-    femmesh.addVolume([1411, 52, 1408, 2203], 9913)
-    femmesh.addVolume([1654, 2062, 133, 1651], 9914)
-    femmesh.addVolume([262, 1653, 2064, 1656], 9915)
-    femmesh.addVolume([1389, 1391, 2183, 2184], 9916)
-    femmesh.addVolume([1387, 1391, 2182, 2183], 9917)
-    femmesh.addVolume([2085, 2087, 1677, 1676], 9918)
-    femmesh.addVolume([1675, 2087, 2083, 1676], 9919)
-    femmesh.addVolume([1441, 1824, 1445, 1823], 9920)
-    femmesh.addVolume([1445, 1443, 1828, 1824], 9921)
-    femmesh.addVolume([1623, 2000, 1827, 1622], 9922)
-    femmesh.addVolume([1998, 1827, 1622, 1621], 9923)
-    femmesh.addVolume([583, 1638, 2049, 2052], 9924)
-    femmesh.addVolume([1636, 2050, 416, 2045], 9925)
-    femmesh.addVolume([1428, 2220, 2217, 676], 9926)
-    femmesh.addVolume([2215, 1426, 413, 2218], 9927)
-    femmesh.addVolume([2125, 1714, 2122, 441], 9928)
-    femmesh.addVolume([2145, 2142, 1350, 651], 9929)
-    femmesh.addVolume([1348, 388, 2140, 2143], 9930)
-    femmesh.addVolume([1716, 608, 2127, 2124], 9931)
-    femmesh.addVolume([2199, 1407, 2202, 670], 9932)
-    femmesh.addVolume([407, 2200, 2197, 1405], 9933)
-    femmesh.addVolume([2065, 422, 2068, 1657], 9934)
-    femmesh.addVolume([2067, 2070, 589, 1659], 9935)
-    femmesh.addVolume([1811, 463, 1763, 2234], 9936)
-    femmesh.addVolume([1981, 1600, 1601, 1977], 9937)
-    femmesh.addVolume([1981, 1602, 1979, 1601], 9938)
-    femmesh.addVolume([1850, 1464, 1849, 1466], 9939)
-    femmesh.addVolume([1462, 1848, 1849, 1466], 9940)
-    femmesh.addVolume([1437, 189, 1803, 1434], 9941)
-    femmesh.addVolume([1804, 254, 1629, 1632], 9942)
-    femmesh.addVolume([125, 1760, 1627, 1630], 9943)
-    femmesh.addVolume([1759, 60, 1435, 1432], 9944)
-    femmesh.addVolume([2162, 1366, 2161, 1370], 9945)
-    femmesh.addVolume([1697, 1696, 2104, 2108], 9946)
-    femmesh.addVolume([1697, 2106, 1698, 2108], 9947)
-    femmesh.addVolume([1368, 1370, 2162, 2163], 9948)
-    femmesh.addVolume([1523, 1902, 1906, 1522], 9949)
-    femmesh.addVolume([1524, 1523, 1904, 1906], 9950)
-    femmesh.addVolume([1924, 1923, 1544, 1540], 9951)
-    femmesh.addVolume([1542, 1924, 1925, 1544], 9952)
-    femmesh.addVolume([2181, 1388, 2183, 1389], 9953)
-    femmesh.addVolume([1388, 1387, 2179, 2183], 9954)
-    femmesh.addVolume([2088, 1677, 2087, 1679], 9955)
-    femmesh.addVolume([2086, 2087, 1675, 1679], 9956)
-    femmesh.addVolume([1445, 1823, 1831, 1444], 9957)
-    femmesh.addVolume([1445, 1828, 1446, 1831], 9958)
-    femmesh.addVolume([1999, 2000, 1620, 1622], 9959)
-    femmesh.addVolume([1999, 1998, 1622, 1618], 9960)
-    femmesh.addVolume([1578, 1958, 237, 1581], 9961)
-    femmesh.addVolume([1576, 108, 1956, 1579], 9962)
-    femmesh.addVolume([1869, 77, 1486, 1483], 9963)
-    femmesh.addVolume([1871, 206, 1485, 1488], 9964)
-    femmesh.addVolume([1883, 211, 1500, 1503], 9965)
-    femmesh.addVolume([1566, 1946, 1563, 232], 9966)
-    femmesh.addVolume([1944, 103, 1564, 1561], 9967)
-    femmesh.addVolume([1881, 82, 1501, 1498], 9968)
-    femmesh.addVolume([568, 1584, 1961, 1964], 9969)
-    femmesh.addVolume([334, 1962, 1959, 1582], 9970)
-    femmesh.addVolume([1863, 1866, 1480, 302], 9971)
-    femmesh.addVolume([1482, 1865, 536, 1868], 9972)
-    femmesh.addVolume([1761, 2003, 1819, 366], 9973)
-    femmesh.addVolume([1560, 1943, 1940, 561], 9974)
-    femmesh.addVolume([1504, 1884, 1887, 309], 9975)
-    femmesh.addVolume([1938, 1558, 327, 1941], 9976)
-    femmesh.addVolume([1889, 543, 1886, 1506], 9977)
-    femmesh.addVolume([1602, 1981, 1982, 1604], 9978)
-    femmesh.addVolume([1600, 1981, 1604, 1980], 9979)
-    femmesh.addVolume([1462, 1463, 1849, 1845], 9980)
-    femmesh.addVolume([1847, 1463, 1849, 1464], 9981)
-    femmesh.addVolume([1695, 2105, 2106, 1697], 9982)
-    femmesh.addVolume([2105, 1693, 2104, 1697], 9983)
-    femmesh.addVolume([1370, 1369, 2161, 2165], 9984)
-    femmesh.addVolume([1371, 2165, 1370, 2163], 9985)
-    femmesh.addVolume([1522, 1906, 1526, 1905], 9986)
-    femmesh.addVolume([1526, 1524, 1907, 1906], 9987)
-    femmesh.addVolume([1541, 1542, 1924, 1922], 9988)
-    femmesh.addVolume([1920, 1924, 1541, 1540], 9989)
-    femmesh.addVolume([2234, 1816, 2252, 630], 9990)
-    femmesh.addVolume([2181, 2180, 1388, 1386], 9991)
-    femmesh.addVolume([2180, 1384, 2179, 1388], 9992)
-    femmesh.addVolume([2090, 1680, 2088, 1679], 9993)
-    femmesh.addVolume([2090, 2086, 1678, 1679], 9994)
-    femmesh.addVolume([1830, 1448, 1831, 1444], 9995)
-    femmesh.addVolume([1832, 1448, 1446, 1831], 9996)
-    femmesh.addVolume([1620, 1619, 1997, 1999], 9997)
-    femmesh.addVolume([1618, 1619, 1999, 1995], 9998)
-    femmesh.addVolume([2252, 1815, 2232, 629], 9999)
-    femmesh.addVolume([2003, 2034, 1819, 366], 10000)
-    femmesh.addVolume([1811, 2252, 463, 2234], 10001)
-    femmesh.addVolume([1641, 1638, 257, 2052], 10002)
-    femmesh.addVolume([1636, 128, 2050, 1639], 10003)
-    femmesh.addVolume([186, 1425, 2217, 1428], 10004)
-    femmesh.addVolume([1426, 57, 1423, 2215], 10005)
-    femmesh.addVolume([2048, 582, 1635, 2049], 10006)
-    femmesh.addVolume([414, 2047, 2218, 1429], 10007)
-    femmesh.addVolume([1633, 415, 2044, 2045], 10008)
-    femmesh.addVolume([2220, 1431, 2042, 677], 10009)
-    femmesh.addVolume([1984, 1605, 1982, 1604], 10010)
-    femmesh.addVolume([1603, 1604, 1984, 1980], 10011)
-    femmesh.addVolume([1463, 1461, 1847, 1846], 10012)
-    femmesh.addVolume([1845, 1459, 1463, 1846], 10013)
-    femmesh.addVolume([1695, 1694, 2103, 2105], 10014)
-    femmesh.addVolume([1694, 1693, 2101, 2105], 10015)
-    femmesh.addVolume([1369, 1373, 2164, 2165], 10016)
-    femmesh.addVolume([1371, 1373, 2165, 2166], 10017)
-    femmesh.addVolume([1526, 1907, 1527, 1909], 10018)
-    femmesh.addVolume([1909, 1525, 1526, 1905], 10019)
-    femmesh.addVolume([1922, 1541, 1539, 1921], 10020)
-    femmesh.addVolume([1920, 1541, 1921, 1537], 10021)
-    femmesh.addVolume([1345, 31, 2140, 1348], 10022)
-    femmesh.addVolume([1347, 160, 1350, 2142], 10023)
-    femmesh.addVolume([1717, 154, 1714, 2125], 10024)
-    femmesh.addVolume([1719, 283, 2127, 1716], 10025)
-    femmesh.addVolume([2180, 2176, 1384, 1385], 10026)
-    femmesh.addVolume([1386, 2180, 1385, 2178], 10027)
-    femmesh.addVolume([1682, 1680, 2091, 2090], 10028)
-    femmesh.addVolume([1678, 1682, 2089, 2090], 10029)
-    femmesh.addVolume([1449, 1448, 1832, 1834], 10030)
-    femmesh.addVolume([1448, 1830, 1834, 1447], 10031)
-    femmesh.addVolume([1996, 1995, 1619, 1615], 10032)
-    femmesh.addVolume([1997, 1996, 1619, 1617], 10033)
-    femmesh.addVolume([503, 2034, 1821, 2003], 10034)
-    femmesh.addVolume([1711, 2119, 2122, 440], 10035)
-    femmesh.addVolume([389, 2146, 2143, 1351], 10036)
-    femmesh.addVolume([2145, 1353, 2148, 652], 10037)
-    femmesh.addVolume([607, 2121, 2124, 1713], 10038)
-    femmesh.addVolume([1407, 180, 1410, 2202], 10039)
-    femmesh.addVolume([1408, 2200, 51, 1405], 10040)
-    femmesh.addVolume([1657, 2065, 134, 1654], 10041)
-    femmesh.addVolume([263, 1656, 2067, 1659], 10042)
-    femmesh.addVolume([2196, 1404, 2199, 669], 10043)
-    femmesh.addVolume([2197, 2194, 406, 1402], 10044)
-    femmesh.addVolume([590, 2070, 2073, 1662], 10045)
-    femmesh.addVolume([2068, 423, 2071, 1660], 10046)
-    femmesh.addVolume([1985, 1607, 1605, 1984], 10047)
-    femmesh.addVolume([1603, 1984, 1607, 1983], 10048)
-    femmesh.addVolume([1460, 1844, 1461, 1846], 10049)
-    femmesh.addVolume([1460, 1459, 1842, 1846], 10050)
-    femmesh.addVolume([1690, 1694, 2101, 2102], 10051)
-    femmesh.addVolume([2102, 1694, 2103, 1692], 10052)
-    femmesh.addVolume([2164, 1373, 1372, 2168], 10053)
-    femmesh.addVolume([2166, 1373, 2168, 1374], 10054)
-    femmesh.addVolume([1537, 1538, 1921, 1917], 10055)
-    femmesh.addVolume([1539, 1538, 1919, 1921], 10056)
-    femmesh.addVolume([1909, 1910, 1527, 1529], 10057)
-    femmesh.addVolume([1909, 1908, 1529, 1525], 10058)
-    femmesh.addVolume([2176, 2177, 1381, 1385], 10059)
-    femmesh.addVolume([2178, 2177, 1385, 1383], 10060)
-    femmesh.addVolume([2089, 2093, 1682, 1681], 10061)
-    femmesh.addVolume([2093, 2091, 1682, 1683], 10062)
-    femmesh.addVolume([1834, 1835, 1449, 1451], 10063)
-    femmesh.addVolume([1447, 1834, 1451, 1833], 10064)
-    femmesh.addVolume([1994, 1616, 1996, 1617], 10065)
-    femmesh.addVolume([1992, 1996, 1616, 1615], 10066)
-    femmesh.addVolume([1607, 1985, 1608, 1987], 10067)
-    femmesh.addVolume([1606, 1607, 1987, 1983], 10068)
-    femmesh.addVolume([1843, 1842, 1460, 1456], 10069)
-    femmesh.addVolume([1458, 1460, 1843, 1844], 10070)
-    femmesh.addVolume([2017, 1817, 2034, 367], 10071)
-    femmesh.addVolume([2102, 2098, 1690, 1691], 10072)
-    femmesh.addVolume([1692, 2102, 1691, 2100], 10073)
-    femmesh.addVolume([1376, 2167, 1372, 2168], 10074)
-    femmesh.addVolume([1376, 2169, 2168, 1374], 10075)
-    femmesh.addVolume([1917, 1538, 1918, 1534], 10076)
-    femmesh.addVolume([1538, 1536, 1919, 1918], 10077)
-    femmesh.addVolume([1908, 1912, 1529, 1528], 10078)
-    femmesh.addVolume([1910, 1912, 1530, 1529], 10079)
-    femmesh.addVolume([2175, 1382, 2177, 1383], 10080)
-    femmesh.addVolume([2177, 2173, 1381, 1382], 10081)
-    femmesh.addVolume([1681, 2092, 2093, 1685], 10082)
-    femmesh.addVolume([2093, 1685, 2094, 1683], 10083)
-    femmesh.addVolume([1833, 1837, 1451, 1450], 10084)
-    femmesh.addVolume([1835, 1837, 1452, 1451], 10085)
-    femmesh.addVolume([1992, 1616, 1993, 1612], 10086)
-    femmesh.addVolume([1614, 1994, 1616, 1993], 10087)
-    femmesh.addVolume([1962, 335, 1965, 1585], 10088)
-    femmesh.addVolume([1967, 569, 1964, 1587], 10089)
-    femmesh.addVolume([1863, 1477, 1860, 301], 10090)
-    femmesh.addVolume([1862, 535, 1479, 1865], 10091)
-    femmesh.addVolume([238, 1581, 1961, 1584], 10092)
-    femmesh.addVolume([109, 1582, 1959, 1579], 10093)
-    femmesh.addVolume([76, 1483, 1866, 1480], 10094)
-    femmesh.addVolume([205, 1485, 1482, 1868], 10095)
-    femmesh.addVolume([1938, 326, 1555, 1935], 10096)
-    femmesh.addVolume([1937, 1557, 1940, 560], 10097)
-    femmesh.addVolume([1890, 1507, 1887, 310], 10098)
-    femmesh.addVolume([544, 1889, 1892, 1509], 10099)
-    femmesh.addVolume([1606, 1987, 1610, 1986], 10100)
-    femmesh.addVolume([1988, 1610, 1608, 1987], 10101)
-    femmesh.addVolume([1841, 1843, 1458, 1457], 10102)
-    femmesh.addVolume([1456, 1843, 1839, 1457], 10103)
-    femmesh.addVolume([2167, 1376, 1375, 2171], 10104)
-    femmesh.addVolume([2169, 1376, 2171, 1377], 10105)
-    femmesh.addVolume([2100, 2099, 1691, 1689], 10106)
-    femmesh.addVolume([1687, 2098, 2099, 1691], 10107)
-    femmesh.addVolume([1532, 1528, 1912, 1911], 10108)
-    femmesh.addVolume([1913, 1532, 1530, 1912], 10109)
-    femmesh.addVolume([1534, 1535, 1918, 1914], 10110)
-    femmesh.addVolume([1535, 1916, 1536, 1918], 10111)
-    femmesh.addVolume([2175, 2174, 1382, 1380], 10112)
-    femmesh.addVolume([2174, 1378, 2173, 1382], 10113)
-    femmesh.addVolume([1684, 2096, 2092, 1685], 10114)
-    femmesh.addVolume([2094, 1685, 2096, 1686], 10115)
-    femmesh.addVolume([1837, 1450, 1836, 1454], 10116)
-    femmesh.addVolume([1452, 1837, 1838, 1454], 10117)
-    femmesh.addVolume([1612, 1613, 1993, 1989], 10118)
-    femmesh.addVolume([1614, 1613, 1991, 1993], 10119)
-    femmesh.addVolume([83, 1501, 1504, 1884], 10120)
-    femmesh.addVolume([1503, 1886, 212, 1506], 10121)
-    femmesh.addVolume([1943, 1560, 1563, 231], 10122)
-    femmesh.addVolume([1561, 102, 1558, 1941], 10123)
-    femmesh.addVolume([1609, 1610, 1990, 1986], 10124)
-    femmesh.addVolume([1610, 1988, 1611, 1990], 10125)
-    femmesh.addVolume([1840, 1453, 1839, 1457], 10126)
-    femmesh.addVolume([1841, 1455, 1840, 1457], 10127)
-    femmesh.addVolume([2171, 1375, 2170, 1379], 10128)
-    femmesh.addVolume([1688, 2095, 2099, 1687], 10129)
-    femmesh.addVolume([2172, 2171, 1379, 1377], 10130)
-    femmesh.addVolume([2097, 1688, 2099, 1689], 10131)
-    femmesh.addVolume([1911, 1915, 1532, 1531], 10132)
-    femmesh.addVolume([1915, 1533, 1913, 1532], 10133)
-    femmesh.addVolume([1915, 1916, 1533, 1535], 10134)
-    femmesh.addVolume([1531, 1915, 1535, 1914], 10135)
-    femmesh.addVolume([2097, 2096, 1688, 1686], 10136)
-    femmesh.addVolume([1378, 2174, 2170, 1379], 10137)
-    femmesh.addVolume([2172, 1379, 2174, 1380], 10138)
-    femmesh.addVolume([1684, 1688, 2095, 2096], 10139)
-    femmesh.addVolume([1613, 1609, 1990, 1989], 10140)
-    femmesh.addVolume([1611, 1990, 1991, 1613], 10141)
-    femmesh.addVolume([1453, 1840, 1836, 1454], 10142)
-    femmesh.addVolume([1838, 1840, 1455, 1454], 10143)
-    femmesh.addVolume([462, 2232, 2252, 1813], 10144)
-    femmesh.addVolume([1816, 630, 2234, 1808], 10145)
-    femmesh.addVolume([1710, 606, 2121, 2118], 10146)
-    femmesh.addVolume([2116, 2119, 1708, 439], 10147)
-    femmesh.addVolume([1354, 390, 2146, 2149], 10148)
-    femmesh.addVolume([2151, 2148, 1356, 653], 10149)
-    femmesh.addVolume([1817, 367, 2017, 1764], 10150)
-    femmesh.addVolume([1432, 7, 2047, 682], 10151)
-    femmesh.addVolume([1632, 681, 12, 2048], 10152)
-    femmesh.addVolume([1434, 14, 682, 2042], 10153)
-    femmesh.addVolume([8, 1630, 2044, 681], 10154)
-    femmesh.addVolume([1401, 2196, 2193, 668], 10155)
-    femmesh.addVolume([405, 2191, 1399, 2194], 10156)
-    femmesh.addVolume([591, 1665, 2073, 2076], 10157)
-    femmesh.addVolume([2071, 1663, 424, 2074], 10158)
-    femmesh.addVolume([127, 1633, 1636, 2045], 10159)
-    femmesh.addVolume([2049, 256, 1635, 1638], 10160)
-    femmesh.addVolume([2218, 1426, 58, 1429], 10161)
-    femmesh.addVolume([2220, 1431, 187, 1428], 10162)
-    femmesh.addVolume([1714, 153, 1711, 2122], 10163)
-    femmesh.addVolume([282, 2124, 1716, 1713], 10164)
-    femmesh.addVolume([2143, 1348, 32, 1351], 10165)
-    femmesh.addVolume([161, 2145, 1353, 1350], 10166)
-    femmesh.addVolume([1402, 50, 2197, 1405], 10167)
-    femmesh.addVolume([1404, 179, 1407, 2199], 10168)
-    femmesh.addVolume([1660, 2068, 135, 1657], 10169)
-    femmesh.addVolume([1662, 264, 2070, 1659], 10170)
-    femmesh.addVolume([1970, 570, 1967, 1590], 10171)
-    femmesh.addVolume([336, 1968, 1965, 1588], 10172)
-    femmesh.addVolume([1859, 534, 1476, 1862], 10173)
-    femmesh.addVolume([1860, 1474, 1857, 300], 10174)
-    femmesh.addVolume([1554, 1937, 1934, 559], 10175)
-    femmesh.addVolume([1552, 325, 1932, 1935], 10176)
-    femmesh.addVolume([1510, 1890, 1893, 311], 10177)
-    femmesh.addVolume([1895, 1512, 545, 1892], 10178)
-    femmesh.addVolume([1821, 1806, 503, 2003], 10179)
-    femmesh.addVolume([1582, 110, 1962, 1585], 10180)
-    femmesh.addVolume([1964, 239, 1584, 1587], 10181)
-    femmesh.addVolume([1863, 75, 1480, 1477], 10182)
-    femmesh.addVolume([1865, 204, 1479, 1482], 10183)
-    femmesh.addVolume([1940, 1557, 1560, 230], 10184)
-    femmesh.addVolume([1558, 101, 1555, 1938], 10185)
-    femmesh.addVolume([1507, 84, 1504, 1887], 10186)
-    femmesh.addVolume([213, 1506, 1889, 1509], 10187)
-    femmesh.addVolume([1705, 2113, 2116, 438], 10188)
-    femmesh.addVolume([2152, 391, 1357, 2149], 10189)
-    femmesh.addVolume([2151, 1359, 2154, 654], 10190)
-    femmesh.addVolume([2115, 605, 1707, 2118], 10191)
-    femmesh.addVolume([1429, 59, 2047, 1432], 10192)
-    femmesh.addVolume([255, 1635, 1632, 2048], 10193)
-    femmesh.addVolume([1431, 188, 1434, 2042], 10194)
-    femmesh.addVolume([126, 1633, 2044, 1630], 10195)
-    femmesh.addVolume([2191, 404, 1396, 2188], 10196)
-    femmesh.addVolume([2077, 1666, 2074, 425], 10197)
-    femmesh.addVolume([2079, 2076, 1668, 592], 10198)
-    femmesh.addVolume([1398, 2193, 2190, 667], 10199)
-    femmesh.addVolume([1533, 552, 1916, 1913], 10200)
-    femmesh.addVolume([1911, 1531, 318, 1914], 10201)
-    femmesh.addVolume([1453, 1836, 1839, 293], 10202)
-    femmesh.addVolume([527, 1841, 1455, 1838], 10203)
-    femmesh.addVolume([1989, 1609, 1986, 343], 10204)
-    femmesh.addVolume([1611, 1991, 1988, 577], 10205)
-    femmesh.addVolume([1973, 571, 1970, 1593], 10206)
-    femmesh.addVolume([1968, 337, 1971, 1591], 10207)
-    femmesh.addVolume([533, 1859, 1473, 1856], 10208)
-    femmesh.addVolume([1471, 1854, 1857, 299], 10209)
-    femmesh.addVolume([2034, 2017, 504, 1820], 10210)
-    femmesh.addVolume([678, 1814, 1813, 1815], 10211)
-    femmesh.addVolume([1811, 678, 1816, 1812], 10212)
-    femmesh.addVolume([1817, 1820, 1818, 1812], 10213)
-    femmesh.addVolume([1814, 1821, 1818, 1819], 10214)
-    femmesh.addVolume([1931, 1551, 1934, 558], 10215)
-    femmesh.addVolume([1929, 1549, 324, 1932], 10216)
-    femmesh.addVolume([1896, 1513, 1893, 312], 10217)
-    femmesh.addVolume([1895, 546, 1515, 1898], 10218)
-    femmesh.addVolume([1684, 2092, 2095, 431], 10219)
-    femmesh.addVolume([1380, 2175, 2172, 661], 10220)
-    femmesh.addVolume([2170, 1378, 398, 2173], 10221)
-    femmesh.addVolume([2094, 1686, 2097, 598], 10222)
-    femmesh.addVolume([1711, 152, 1708, 2119], 10223)
-    femmesh.addVolume([1713, 281, 2121, 1710], 10224)
-    femmesh.addVolume([1351, 33, 2146, 1354], 10225)
-    femmesh.addVolume([1353, 162, 1356, 2148], 10226)
-    femmesh.addVolume([1377, 2172, 2169, 660], 10227)
-    femmesh.addVolume([2167, 1375, 397, 2170], 10228)
-    femmesh.addVolume([1687, 2095, 2098, 432], 10229)
-    femmesh.addVolume([2097, 1689, 2100, 599], 10230)
-    femmesh.addVolume([2017, 1807, 504, 1820], 10231)
-    femmesh.addVolume([2194, 1399, 49, 1402], 10232)
-    femmesh.addVolume([178, 2196, 1404, 1401], 10233)
-    femmesh.addVolume([1660, 136, 2071, 1663], 10234)
-    femmesh.addVolume([1665, 2073, 1662, 265], 10235)
-    femmesh.addVolume([1362, 2157, 2154, 655], 10236)
-    femmesh.addVolume([2152, 1360, 392, 2155], 10237)
-    femmesh.addVolume([604, 2115, 1704, 2112], 10238)
-    femmesh.addVolume([2110, 2113, 1702, 437], 10239)
-    femmesh.addVolume([1614, 1994, 1991, 578], 10240)
-    femmesh.addVolume([1989, 1992, 1612, 344], 10241)
-    femmesh.addVolume([1450, 1833, 1836, 292], 10242)
-    femmesh.addVolume([526, 1838, 1452, 1835], 10243)
-    femmesh.addVolume([2188, 403, 1393, 2185], 10244)
-    femmesh.addVolume([2187, 1395, 2190, 666], 10245)
-    femmesh.addVolume([2080, 1669, 2077, 426], 10246)
-    femmesh.addVolume([1671, 2082, 2079, 593], 10247)
-    femmesh.addVolume([1536, 1919, 1916, 553], 10248)
-    femmesh.addVolume([1534, 1917, 319, 1914], 10249)
-    femmesh.addVolume([1913, 1530, 551, 1910], 10250)
-    femmesh.addVolume([1908, 1911, 1528, 317], 10251)
-    femmesh.addVolume([1841, 528, 1458, 1844], 10252)
-    femmesh.addVolume([1842, 1456, 1839, 294], 10253)
-    femmesh.addVolume([1985, 1608, 1988, 576], 10254)
-    femmesh.addVolume([1606, 1983, 1986, 342], 10255)
-    femmesh.addVolume([1976, 1973, 1596, 572], 10256)
-    femmesh.addVolume([1971, 1974, 1594, 338], 10257)
-    femmesh.addVolume([1468, 1851, 1854, 298], 10258)
-    femmesh.addVolume([532, 1856, 1470, 1853], 10259)
-    femmesh.addVolume([1585, 111, 1965, 1588], 10260)
-    femmesh.addVolume([1590, 240, 1967, 1587], 10261)
-    femmesh.addVolume([203, 1479, 1476, 1862], 10262)
-    femmesh.addVolume([74, 1477, 1860, 1474], 10263)
-    femmesh.addVolume([1681, 2089, 2092, 430], 10264)
-    femmesh.addVolume([1683, 2094, 2091, 597], 10265)
-    femmesh.addVolume([2173, 1381, 399, 2176], 10266)
-    femmesh.addVolume([1383, 2178, 2175, 662], 10267)
-    femmesh.addVolume([1896, 1899, 1516, 313], 10268)
-    femmesh.addVolume([1546, 323, 1926, 1929], 10269)
-    femmesh.addVolume([1518, 547, 1901, 1898], 10270)
-    femmesh.addVolume([1931, 1928, 1548, 557], 10271)
-    femmesh.addVolume([2166, 1374, 2169, 659], 10272)
-    femmesh.addVolume([2167, 396, 1372, 2164], 10273)
-    femmesh.addVolume([2103, 1692, 600, 2100], 10274)
-    femmesh.addVolume([1690, 2098, 2101, 433], 10275)
-    femmesh.addVolume([1554, 1557, 1937, 229], 10276)
-    femmesh.addVolume([1555, 100, 1552, 1935], 10277)
-    femmesh.addVolume([1890, 1507, 85, 1510], 10278)
-    femmesh.addVolume([214, 1892, 1512, 1509], 10279)
-    femmesh.addVolume([1994, 1617, 1997, 579], 10280)
-    femmesh.addVolume([1995, 1615, 1992, 345], 10281)
-    femmesh.addVolume([1449, 525, 1835, 1832], 10282)
-    femmesh.addVolume([1830, 1833, 1447, 291], 10283)
-    femmesh.addVolume([393, 2158, 2155, 1363], 10284)
-    femmesh.addVolume([603, 2109, 2112, 1701], 10285)
-    femmesh.addVolume([2110, 1699, 2107, 436], 10286)
-    femmesh.addVolume([2157, 1365, 2160, 656], 10287)
-    femmesh.addVolume([1910, 550, 1907, 1527], 10288)
-    femmesh.addVolume([1922, 1919, 1539, 554], 10289)
-    femmesh.addVolume([1905, 1908, 1525, 316], 10290)
-    femmesh.addVolume([320, 1537, 1920, 1917], 10291)
-    femmesh.addVolume([2085, 2082, 1674, 594], 10292)
-    femmesh.addVolume([1390, 2185, 402, 2182], 10293)
-    femmesh.addVolume([2187, 2184, 1392, 665], 10294)
-    femmesh.addVolume([1672, 2080, 2083, 427], 10295)
-    femmesh.addVolume([1982, 1605, 1985, 575], 10296)
-    femmesh.addVolume([1842, 1845, 1459, 295], 10297)
-    femmesh.addVolume([1983, 1603, 1980, 341], 10298)
-    femmesh.addVolume([1461, 529, 1847, 1844], 10299)
-    femmesh.addVolume([1597, 1974, 1977, 339], 10300)
-    femmesh.addVolume([1976, 1599, 1979, 573], 10301)
-    femmesh.addVolume([1851, 1465, 1848, 297], 10302)
-    femmesh.addVolume([1850, 1853, 531, 1467], 10303)
-    femmesh.addVolume([2181, 2178, 1386, 663], 10304)
-    femmesh.addVolume([2091, 2088, 1680, 596], 10305)
-    femmesh.addVolume([1678, 2086, 2089, 429], 10306)
-    femmesh.addVolume([1384, 400, 2176, 2179], 10307)
-    femmesh.addVolume([1901, 1904, 548, 1521], 10308)
-    femmesh.addVolume([1902, 1519, 1899, 314], 10309)
-    femmesh.addVolume([1925, 1545, 1928, 556], 10310)
-    femmesh.addVolume([1923, 322, 1926, 1543], 10311)
-    femmesh.addVolume([2164, 2161, 395, 1369], 10312)
-    femmesh.addVolume([2163, 1371, 2166, 658], 10313)
-    femmesh.addVolume([2103, 2106, 601, 1695], 10314)
-    femmesh.addVolume([2101, 2104, 1693, 434], 10315)
-    femmesh.addVolume([1440, 11, 1825, 680], 10316)
-    femmesh.addVolume([1438, 4, 680, 1822], 10317)
-    femmesh.addVolume([1624, 679, 5, 1829], 10318)
-    femmesh.addVolume([10, 1826, 679, 1626], 10319)
-    femmesh.addVolume([1444, 1823, 1830, 290], 10320)
-    femmesh.addVolume([2000, 1997, 1620, 580], 10321)
-    femmesh.addVolume([1995, 1998, 1618, 346], 10322)
-    femmesh.addVolume([1832, 1446, 524, 1828], 10323)
-    femmesh.addVolume([2109, 602, 2106, 1698], 10324)
-    femmesh.addVolume([1368, 2163, 2160, 657], 10325)
-    femmesh.addVolume([1696, 2104, 2107, 435], 10326)
-    femmesh.addVolume([2158, 394, 2161, 1366], 10327)
-    femmesh.addVolume([254, 1804, 12, 1632], 10328)
-    femmesh.addVolume([1803, 189, 14, 1434], 10329)
-    femmesh.addVolume([1760, 125, 8, 1630], 10330)
-    femmesh.addVolume([1759, 7, 60, 1432], 10331)
-    femmesh.addVolume([1524, 549, 1907, 1904], 10332)
-    femmesh.addVolume([1902, 1905, 1522, 315], 10333)
-    femmesh.addVolume([1925, 1922, 1542, 555], 10334)
-    femmesh.addVolume([321, 1923, 1920, 1540], 10335)
-    femmesh.addVolume([1387, 2182, 401, 2179], 10336)
-    femmesh.addVolume([2083, 2086, 1675, 428], 10337)
-    femmesh.addVolume([2184, 2181, 1389, 664], 10338)
-    femmesh.addVolume([1677, 2088, 2085, 595], 10339)
-    femmesh.addVolume([1979, 1602, 1982, 574], 10340)
-    femmesh.addVolume([1462, 1845, 1848, 296], 10341)
-    femmesh.addVolume([1600, 1977, 1980, 340], 10342)
-    femmesh.addVolume([1850, 530, 1847, 1464], 10343)
-    femmesh.addVolume([2000, 1623, 1826, 581], 10344)
-    femmesh.addVolume([1822, 1823, 1441, 289], 10345)
-    femmesh.addVolume([1621, 1998, 1829, 347], 10346)
-    femmesh.addVolume([523, 1825, 1828, 1443], 10347)
-    femmesh.addVolume([1705, 151, 2116, 1708], 10348)
-    femmesh.addVolume([1710, 1707, 280, 2118], 10349)
-    femmesh.addVolume([1357, 34, 1354, 2149], 10350)
-    femmesh.addVolume([1359, 163, 2151, 1356], 10351)
-    femmesh.addVolume([1396, 1399, 48, 2191], 10352)
-    femmesh.addVolume([1398, 2193, 177, 1401], 10353)
-    femmesh.addVolume([2076, 1665, 1668, 266], 10354)
-    femmesh.addVolume([1666, 137, 1663, 2074], 10355)
-    femmesh.addVolume([1378, 41, 1375, 2170], 10356)
-    femmesh.addVolume([1380, 170, 2172, 1377], 10357)
-    femmesh.addVolume([1684, 144, 2095, 1687], 10358)
-    femmesh.addVolume([1689, 2097, 1686, 273], 10359)
-    femmesh.addVolume([1590, 1970, 241, 1593], 10360)
-    femmesh.addVolume([1588, 112, 1968, 1591], 10361)
-    femmesh.addVolume([73, 1474, 1857, 1471], 10362)
-    femmesh.addVolume([202, 1476, 1473, 1859], 10363)
-    femmesh.addVolume([1614, 1991, 1611, 248], 10364)
-    femmesh.addVolume([119, 1609, 1612, 1989], 10365)
-    femmesh.addVolume([1453, 1836, 66, 1450], 10366)
-    femmesh.addVolume([195, 1455, 1452, 1838], 10367)
-    femmesh.addVolume([1510, 86, 1893, 1513], 10368)
-    femmesh.addVolume([1512, 215, 1515, 1895], 10369)
-    femmesh.addVolume([1934, 1551, 1554, 228], 10370)
-    femmesh.addVolume([1932, 1549, 99, 1552], 10371)
-    femmesh.addVolume([1911, 1528, 92, 1531], 10372)
-    femmesh.addVolume([221, 1533, 1530, 1913], 10373)
-    femmesh.addVolume([222, 1916, 1536, 1533], 10374)
-    femmesh.addVolume([93, 1531, 1534, 1914], 10375)
-    femmesh.addVolume([1455, 196, 1458, 1841], 10376)
-    femmesh.addVolume([1453, 67, 1839, 1456], 10377)
-    femmesh.addVolume([118, 1606, 1609, 1986], 10378)
-    femmesh.addVolume([1611, 1988, 1608, 247], 10379)
-    femmesh.addVolume([2113, 1702, 150, 1705], 10380)
-    femmesh.addVolume([1704, 279, 1707, 2115], 10381)
-    femmesh.addVolume([1360, 35, 1357, 2152], 10382)
-    femmesh.addVolume([1362, 164, 2154, 1359], 10383)
-    femmesh.addVolume([2094, 1683, 1686, 272], 10384)
-    femmesh.addVolume([1378, 1381, 42, 2173], 10385)
-    femmesh.addVolume([1380, 2175, 171, 1383], 10386)
-    femmesh.addVolume([1684, 2092, 143, 1681], 10387)
-    femmesh.addVolume([1396, 47, 1393, 2188], 10388)
-    femmesh.addVolume([1395, 2190, 176, 1398], 10389)
-    femmesh.addVolume([2079, 1668, 1671, 267], 10390)
-    femmesh.addVolume([1669, 138, 1666, 2077], 10391)
-    femmesh.addVolume([1372, 1375, 40, 2167], 10392)
-    femmesh.addVolume([169, 1374, 2169, 1377], 10393)
-    femmesh.addVolume([1689, 1692, 2100, 274], 10394)
-    femmesh.addVolume([145, 1690, 2098, 1687], 10395)
-    femmesh.addVolume([1596, 242, 1973, 1593], 10396)
-    femmesh.addVolume([1591, 113, 1971, 1594], 10397)
-    femmesh.addVolume([72, 1471, 1854, 1468], 10398)
-    femmesh.addVolume([1470, 201, 1473, 1856], 10399)
-    femmesh.addVolume([1614, 1617, 1994, 249], 10400)
-    femmesh.addVolume([120, 1615, 1992, 1612], 10401)
-    femmesh.addVolume([1833, 1447, 65, 1450], 10402)
-    femmesh.addVolume([194, 1835, 1452, 1449], 10403)
-    femmesh.addVolume([1549, 98, 1546, 1929], 10404)
-    femmesh.addVolume([1515, 216, 1518, 1898], 10405)
-    femmesh.addVolume([1513, 87, 1896, 1516], 10406)
-    femmesh.addVolume([1931, 1548, 1551, 227], 10407)
-    femmesh.addVolume([1910, 1530, 220, 1527], 10408)
-    femmesh.addVolume([1525, 91, 1908, 1528], 10409)
-    femmesh.addVolume([1919, 1536, 1539, 223], 10410)
-    femmesh.addVolume([1917, 94, 1537, 1534], 10411)
-    femmesh.addVolume([1458, 197, 1461, 1844], 10412)
-    femmesh.addVolume([1456, 68, 1842, 1459], 10413)
-    femmesh.addVolume([1603, 1606, 117, 1983], 10414)
-    femmesh.addVolume([1985, 1605, 1608, 246], 10415)
-    femmesh.addVolume([2155, 1360, 36, 1363], 10416)
-    femmesh.addVolume([2157, 1365, 165, 1362], 10417)
-    femmesh.addVolume([1699, 149, 2110, 1702], 10418)
-    femmesh.addVolume([278, 2112, 1704, 1701], 10419)
-    femmesh.addVolume([1678, 142, 2089, 1681], 10420)
-    femmesh.addVolume([2176, 1381, 43, 1384], 10421)
-    femmesh.addVolume([1683, 2091, 1680, 271], 10422)
-    femmesh.addVolume([172, 2178, 1386, 1383], 10423)
-    femmesh.addVolume([2185, 46, 1393, 1390], 10424)
-    femmesh.addVolume([2187, 175, 1392, 1395], 10425)
-    femmesh.addVolume([1671, 1674, 2082, 268], 10426)
-    femmesh.addVolume([1672, 139, 1669, 2080], 10427)
-    femmesh.addVolume([1372, 2164, 39, 1369], 10428)
-    femmesh.addVolume([2166, 168, 1371, 1374], 10429)
-    femmesh.addVolume([2101, 146, 1693, 1690], 10430)
-    femmesh.addVolume([2103, 1692, 1695, 275], 10431)
-    femmesh.addVolume([1443, 191, 1825, 1440], 10432)
-    femmesh.addVolume([62, 1822, 1438, 1441], 10433)
-    femmesh.addVolume([1829, 123, 1624, 1621], 10434)
-    femmesh.addVolume([1626, 1826, 1623, 252], 10435)
-    femmesh.addVolume([1597, 114, 1594, 1974], 10436)
-    femmesh.addVolume([1976, 1596, 1599, 243], 10437)
-    femmesh.addVolume([71, 1851, 1465, 1468], 10438)
-    femmesh.addVolume([1853, 1470, 200, 1467], 10439)
-    femmesh.addVolume([1997, 1617, 1620, 250], 10440)
-    femmesh.addVolume([1995, 121, 1618, 1615], 10441)
-    femmesh.addVolume([1446, 193, 1449, 1832], 10442)
-    femmesh.addVolume([1444, 64, 1830, 1447], 10443)
-    femmesh.addVolume([1518, 1901, 217, 1521], 10444)
-    femmesh.addVolume([1519, 88, 1516, 1899], 10445)
-    femmesh.addVolume([1548, 1928, 1545, 226], 10446)
-    femmesh.addVolume([97, 1546, 1926, 1543], 10447)
-    femmesh.addVolume([1922, 1539, 1542, 224], 10448)
-    femmesh.addVolume([1537, 95, 1920, 1540], 10449)
-    femmesh.addVolume([1527, 219, 1907, 1524], 10450)
-    femmesh.addVolume([1525, 90, 1522, 1905], 10451)
-    femmesh.addVolume([1605, 1982, 1602, 245], 10452)
-    femmesh.addVolume([1464, 198, 1847, 1461], 10453)
-    femmesh.addVolume([1462, 69, 1459, 1845], 10454)
-    femmesh.addVolume([1603, 116, 1600, 1980], 10455)
-    femmesh.addVolume([1363, 37, 2158, 1366], 10456)
-    femmesh.addVolume([1365, 166, 1368, 2160], 10457)
-    femmesh.addVolume([1696, 148, 2107, 1699], 10458)
-    femmesh.addVolume([1701, 277, 2109, 1698], 10459)
-    femmesh.addVolume([2086, 1675, 141, 1678], 10460)
-    femmesh.addVolume([2088, 1677, 1680, 270], 10461)
-    femmesh.addVolume([1386, 2181, 173, 1389], 10462)
-    femmesh.addVolume([1384, 1387, 44, 2179], 10463)
-    femmesh.addVolume([2083, 1672, 140, 1675], 10464)
-    femmesh.addVolume([2085, 1674, 1677, 269], 10465)
-    femmesh.addVolume([2182, 45, 1390, 1387], 10466)
-    femmesh.addVolume([2184, 174, 1389, 1392], 10467)
-    femmesh.addVolume([1762, 2232, 462, 1813], 10468)
-    femmesh.addVolume([1369, 2161, 38, 1366], 10469)
-    femmesh.addVolume([1371, 1368, 167, 2163], 10470)
-    femmesh.addVolume([276, 1695, 2106, 1698], 10471)
-    femmesh.addVolume([1693, 147, 2104, 1696], 10472)
-    femmesh.addVolume([115, 1597, 1600, 1977], 10473)
-    femmesh.addVolume([1467, 199, 1850, 1464], 10474)
-    femmesh.addVolume([1465, 70, 1462, 1848], 10475)
-    femmesh.addVolume([1602, 1979, 1599, 244], 10476)
-    femmesh.addVolume([1620, 1623, 2000, 251], 10477)
-    femmesh.addVolume([1621, 1998, 122, 1618], 10478)
-    femmesh.addVolume([1828, 1446, 192, 1443], 10479)
-    femmesh.addVolume([63, 1823, 1441, 1444], 10480)
-    femmesh.addVolume([218, 1904, 1524, 1521], 10481)
-    femmesh.addVolume([89, 1902, 1519, 1522], 10482)
-    femmesh.addVolume([1540, 96, 1923, 1543], 10483)
-    femmesh.addVolume([1542, 1545, 1925, 225], 10484)
-    femmesh.addVolume([2259, 14, 1767, 648], 10485)
-    femmesh.addVolume([611, 12, 1768, 2258], 10486)
-    femmesh.addVolume([2252, 1816, 9, 630], 10487)
-    femmesh.addVolume([1819, 2034, 287, 366], 10488)
-    femmesh.addVolume([444, 1724, 8, 2261], 10489)
-    femmesh.addVolume([485, 10, 2038, 1768], 10490)
-    femmesh.addVolume([481, 7, 1723, 2260], 10491)
-    femmesh.addVolume([2034, 367, 1817, 287], 10492)
-    femmesh.addVolume([2034, 504, 483, 1820], 10493)
-    femmesh.addVolume([2252, 3, 462, 1813], 10494)
-    femmesh.addVolume([463, 3, 2252, 1811], 10495)
-    femmesh.addVolume([2034, 503, 1821, 483], 10496)
-    femmesh.addVolume([2134, 6, 29, 1337], 10497)
-    femmesh.addVolume([1340, 13, 158, 2136], 10498)
-    femmesh.addVolume([156, 1344, 6, 2131], 10499)
-    femmesh.addVolume([1341, 285, 13, 2133], 10500)
-    femmesh.addVolume([2056, 130, 419, 1645], 10501)
-    femmesh.addVolume([2058, 586, 259, 1647], 10502)
-    femmesh.addVolume([1417, 55, 410, 2209], 10503)
-    femmesh.addVolume([1419, 184, 2211, 673], 10504)
-    femmesh.addVolume([1815, 2252, 9, 629], 10505)
-    femmesh.addVolume([464, 1763, 463, 2234], 10506)
-    femmesh.addVolume([1414, 410, 53, 2206], 10507)
-    femmesh.addVolume([182, 1416, 2208, 673], 10508)
-    femmesh.addVolume([2059, 419, 132, 1648], 10509)
-    femmesh.addVolume([2061, 261, 586, 1650], 10510)
-    femmesh.addVolume([29, 6, 1, 1337], 10511)
-    femmesh.addVolume([13, 158, 2, 1340], 10512)
-    femmesh.addVolume([156, 1, 6, 1344], 10513)
-    femmesh.addVolume([285, 13, 2, 1341], 10514)
-    femmesh.addVolume([259, 586, 260, 1647], 10515)
-    femmesh.addVolume([131, 419, 130, 1645], 10516)
-    femmesh.addVolume([55, 410, 54, 1417], 10517)
-    femmesh.addVolume([1419, 183, 184, 673], 10518)
-    femmesh.addVolume([2056, 418, 130, 1642], 10519)
-    femmesh.addVolume([259, 1644, 585, 2058], 10520)
-    femmesh.addVolume([1422, 2211, 184, 674], 10521)
-    femmesh.addVolume([2209, 55, 411, 1420], 10522)
-    femmesh.addVolume([331, 1573, 107, 1953], 10523)
-    femmesh.addVolume([1575, 565, 236, 1955], 10524)
-    femmesh.addVolume([539, 1491, 207, 1874], 10525)
-    femmesh.addVolume([1489, 78, 1872, 305], 10526)
-    femmesh.addVolume([2133, 285, 610, 1722], 10527)
-    femmesh.addVolume([2134, 29, 386, 1338], 10528)
-    femmesh.addVolume([1720, 2131, 156, 443], 10529)
-    femmesh.addVolume([2136, 158, 1343, 649], 10530)
-    femmesh.addVolume([54, 410, 53, 1414], 10531)
-    femmesh.addVolume([1416, 182, 183, 673], 10532)
-    femmesh.addVolume([132, 419, 131, 1648], 10533)
-    femmesh.addVolume([586, 261, 260, 1650], 10534)
-    femmesh.addVolume([210, 1497, 540, 1880], 10535)
-    femmesh.addVolume([1495, 1878, 81, 306], 10536)
-    femmesh.addVolume([1949, 564, 233, 1569], 10537)
-    femmesh.addVolume([104, 1567, 330, 1947], 10538)
-    femmesh.addVolume([2059, 132, 420, 1651], 10539)
-    femmesh.addVolume([2061, 587, 261, 1653], 10540)
-    femmesh.addVolume([1411, 53, 409, 2206], 10541)
-    femmesh.addVolume([1413, 182, 2208, 672], 10542)
-    femmesh.addVolume([3, 2252, 462, 463], 10543)
-    femmesh.addVolume([2003, 1761, 365, 366], 10544)
-    femmesh.addVolume([503, 483, 2034, 504], 10545)
-    femmesh.addVolume([287, 2034, 367, 366], 10546)
-    femmesh.addVolume([565, 236, 235, 1575], 10547)
-    femmesh.addVolume([331, 106, 107, 1573], 10548)
-    femmesh.addVolume([78, 1489, 79, 305], 10549)
-    femmesh.addVolume([539, 208, 207, 1491], 10550)
-    femmesh.addVolume([540, 210, 209, 1497], 10551)
-    femmesh.addVolume([80, 1495, 81, 306], 10552)
-    femmesh.addVolume([233, 564, 234, 1569], 10553)
-    femmesh.addVolume([330, 104, 105, 1567], 10554)
-    femmesh.addVolume([2234, 1808, 630, 631], 10555)
-    femmesh.addVolume([629, 2232, 628, 1805], 10556)
-    femmesh.addVolume([1642, 418, 129, 2053], 10557)
-    femmesh.addVolume([585, 1644, 258, 2055], 10558)
-    femmesh.addVolume([2214, 1422, 185, 674], 10559)
-    femmesh.addVolume([56, 2212, 411, 1420], 10560)
-    femmesh.addVolume([1953, 107, 332, 1576], 10561)
-    femmesh.addVolume([1955, 566, 236, 1578], 10562)
-    femmesh.addVolume([1874, 207, 538, 1488], 10563)
-    femmesh.addVolume([1872, 78, 1486, 304], 10564)
-    femmesh.addVolume([1720, 155, 2128, 443], 10565)
-    femmesh.addVolume([1722, 284, 610, 2130], 10566)
-    femmesh.addVolume([2137, 386, 30, 1338], 10567)
-    femmesh.addVolume([159, 2139, 1343, 649], 10568)
-    femmesh.addVolume([1498, 81, 1878, 307], 10569)
-    femmesh.addVolume([1500, 210, 541, 1880], 10570)
-    femmesh.addVolume([1566, 233, 1949, 563], 10571)
-    femmesh.addVolume([1564, 104, 329, 1947], 10572)
-    femmesh.addVolume([1411, 409, 52, 2203], 10573)
-    femmesh.addVolume([1413, 2205, 181, 672], 10574)
-    femmesh.addVolume([587, 2064, 262, 1653], 10575)
-    femmesh.addVolume([2062, 420, 133, 1651], 10576)
-    femmesh.addVolume([2252, 630, 9, 629], 10577)
-    femmesh.addVolume([1380, 2172, 170, 661], 10578)
-    femmesh.addVolume([41, 1378, 398, 2170], 10579)
-    femmesh.addVolume([1684, 2095, 144, 431], 10580)
-    femmesh.addVolume([273, 2097, 1686, 598], 10581)
-    femmesh.addVolume([318, 1911, 92, 1531], 10582)
-    femmesh.addVolume([1533, 221, 552, 1913], 10583)
-    femmesh.addVolume([552, 1916, 222, 1533], 10584)
-    femmesh.addVolume([1531, 93, 318, 1914], 10585)
-    femmesh.addVolume([1989, 119, 1609, 343], 10586)
-    femmesh.addVolume([1453, 66, 1836, 293], 10587)
-    femmesh.addVolume([577, 1611, 1991, 248], 10588)
-    femmesh.addVolume([1455, 195, 527, 1838], 10589)
-    femmesh.addVolume([1377, 170, 2172, 660], 10590)
-    femmesh.addVolume([397, 1375, 41, 2170], 10591)
-    femmesh.addVolume([1687, 144, 2095, 432], 10592)
-    femmesh.addVolume([273, 1689, 2097, 599], 10593)
-    femmesh.addVolume([2053, 417, 129, 1639], 10594)
-    femmesh.addVolume([258, 1641, 584, 2055], 10595)
-    femmesh.addVolume([2214, 185, 1425, 675], 10596)
-    femmesh.addVolume([2212, 56, 412, 1423], 10597)
-    femmesh.addVolume([1956, 332, 108, 1576], 10598)
-    femmesh.addVolume([566, 1958, 237, 1578], 10599)
-    femmesh.addVolume([77, 1869, 1486, 304], 10600)
-    femmesh.addVolume([1871, 538, 206, 1488], 10601)
-    femmesh.addVolume([1453, 1839, 67, 293], 10602)
-    femmesh.addVolume([1455, 527, 196, 1841], 10603)
-    femmesh.addVolume([577, 1988, 1611, 247], 10604)
-    femmesh.addVolume([118, 1986, 1609, 343], 10605)
-    femmesh.addVolume([2137, 30, 387, 1345], 10606)
-    femmesh.addVolume([2139, 159, 1347, 650], 10607)
-    femmesh.addVolume([1717, 2128, 155, 442], 10608)
-    femmesh.addVolume([1719, 609, 284, 2130], 10609)
-    femmesh.addVolume([82, 1498, 1881, 307], 10610)
-    femmesh.addVolume([1500, 541, 211, 1883], 10611)
-    femmesh.addVolume([232, 1566, 1946, 563], 10612)
-    femmesh.addVolume([1564, 329, 103, 1944], 10613)
-    femmesh.addVolume([502, 503, 1806, 2003], 10614)
-    femmesh.addVolume([408, 1408, 52, 2203], 10615)
-    femmesh.addVolume([1410, 181, 2205, 671], 10616)
-    femmesh.addVolume([2062, 133, 421, 1654], 10617)
-    femmesh.addVolume([262, 2064, 588, 1656], 10618)
-    femmesh.addVolume([2017, 1764, 367, 368], 10619)
-    femmesh.addVolume([578, 1991, 1614, 248], 10620)
-    femmesh.addVolume([119, 1989, 1612, 344], 10621)
-    femmesh.addVolume([1450, 1836, 66, 292], 10622)
-    femmesh.addVolume([1452, 526, 195, 1838], 10623)
-    femmesh.addVolume([1641, 257, 584, 2052], 10624)
-    femmesh.addVolume([2050, 128, 417, 1639], 10625)
-    femmesh.addVolume([1425, 186, 2217, 675], 10626)
-    femmesh.addVolume([412, 1423, 57, 2215], 10627)
-    femmesh.addVolume([2092, 1684, 143, 431], 10628)
-    femmesh.addVolume([272, 1686, 2094, 598], 10629)
-    femmesh.addVolume([398, 1378, 42, 2173], 10630)
-    femmesh.addVolume([2175, 1380, 171, 661], 10631)
-    femmesh.addVolume([1958, 567, 237, 1581], 10632)
-    femmesh.addVolume([1956, 108, 333, 1579], 10633)
-    femmesh.addVolume([77, 1483, 1869, 303], 10634)
-    femmesh.addVolume([1485, 537, 206, 1871], 10635)
-    femmesh.addVolume([1530, 551, 221, 1913], 10636)
-    femmesh.addVolume([1911, 92, 1528, 317], 10637)
-    femmesh.addVolume([553, 1916, 1536, 222], 10638)
-    femmesh.addVolume([93, 1534, 319, 1914], 10639)
-    femmesh.addVolume([2127, 609, 283, 1719], 10640)
-    femmesh.addVolume([2125, 1717, 154, 442], 10641)
-    femmesh.addVolume([31, 2140, 387, 1345], 10642)
-    femmesh.addVolume([160, 2142, 1347, 650], 10643)
-    femmesh.addVolume([40, 1375, 397, 2167], 10644)
-    femmesh.addVolume([169, 1377, 2169, 660], 10645)
-    femmesh.addVolume([274, 2100, 1689, 599], 10646)
-    femmesh.addVolume([145, 1687, 2098, 432], 10647)
-    femmesh.addVolume([211, 1883, 542, 1503], 10648)
-    femmesh.addVolume([1881, 1501, 82, 308], 10649)
-    femmesh.addVolume([1944, 328, 103, 1561], 10650)
-    femmesh.addVolume([232, 1946, 1563, 562], 10651)
-    femmesh.addVolume([2200, 51, 408, 1408], 10652)
-    femmesh.addVolume([2202, 180, 1410, 671], 10653)
-    femmesh.addVolume([2065, 421, 134, 1654], 10654)
-    femmesh.addVolume([2067, 263, 588, 1656], 10655)
-    femmesh.addVolume([1456, 67, 1839, 294], 10656)
-    femmesh.addVolume([528, 1458, 196, 1841], 10657)
-    femmesh.addVolume([1986, 118, 1606, 342], 10658)
-    femmesh.addVolume([247, 1988, 1608, 576], 10659)
-    femmesh.addVolume([257, 1638, 583, 2052], 10660)
-    femmesh.addVolume([2050, 416, 128, 1636], 10661)
-    femmesh.addVolume([1426, 413, 57, 2215], 10662)
-    femmesh.addVolume([1428, 2217, 186, 676], 10663)
-    femmesh.addVolume([1959, 333, 109, 1579], 10664)
-    femmesh.addVolume([567, 1961, 238, 1581], 10665)
-    femmesh.addVolume([1485, 205, 537, 1868], 10666)
-    femmesh.addVolume([1483, 76, 1866, 303], 10667)
-    femmesh.addVolume([249, 1994, 1614, 578], 10668)
-    femmesh.addVolume([120, 1612, 1992, 344], 10669)
-    femmesh.addVolume([1833, 1450, 65, 292], 10670)
-    femmesh.addVolume([1452, 194, 526, 1835], 10671)
-    femmesh.addVolume([2140, 31, 388, 1348], 10672)
-    femmesh.addVolume([2142, 160, 1350, 651], 10673)
-    femmesh.addVolume([2125, 154, 1714, 441], 10674)
-    femmesh.addVolume([2127, 283, 608, 1716], 10675)
-    femmesh.addVolume([1886, 212, 542, 1503], 10676)
-    femmesh.addVolume([1884, 83, 1501, 308], 10677)
-    femmesh.addVolume([231, 1563, 1943, 562], 10678)
-    femmesh.addVolume([102, 1561, 328, 1941], 10679)
-    femmesh.addVolume([143, 1681, 2092, 430], 10680)
-    femmesh.addVolume([272, 2094, 1683, 597], 10681)
-    femmesh.addVolume([171, 1383, 2175, 662], 10682)
-    femmesh.addVolume([1381, 399, 42, 2173], 10683)
-    femmesh.addVolume([180, 2202, 1407, 670], 10684)
-    femmesh.addVolume([2200, 407, 51, 1405], 10685)
-    femmesh.addVolume([2065, 134, 422, 1657], 10686)
-    femmesh.addVolume([263, 2067, 589, 1659], 10687)
-    femmesh.addVolume([1530, 220, 551, 1910], 10688)
-    femmesh.addVolume([1528, 91, 1908, 317], 10689)
-    femmesh.addVolume([94, 1917, 319, 1534], 10690)
-    femmesh.addVolume([223, 1919, 1536, 553], 10691)
-    femmesh.addVolume([1374, 169, 2169, 659], 10692)
-    femmesh.addVolume([1372, 40, 396, 2167], 10693)
-    femmesh.addVolume([1690, 145, 2098, 433], 10694)
-    femmesh.addVolume([2100, 1692, 600, 274], 10695)
-    femmesh.addVolume([197, 1458, 528, 1844], 10696)
-    femmesh.addVolume([1456, 1842, 68, 294], 10697)
-    femmesh.addVolume([1983, 1606, 117, 342], 10698)
-    femmesh.addVolume([246, 1608, 1985, 576], 10699)
-    femmesh.addVolume([661, 2172, 170, 660], 10700)
-    femmesh.addVolume([144, 431, 2095, 432], 10701)
-    femmesh.addVolume([273, 599, 2097, 598], 10702)
-    femmesh.addVolume([41, 398, 397, 2170], 10703)
-    femmesh.addVolume([1636, 416, 127, 2045], 10704)
-    femmesh.addVolume([2049, 583, 256, 1638], 10705)
-    femmesh.addVolume([1426, 58, 413, 2218], 10706)
-    femmesh.addVolume([1428, 187, 2220, 676], 10707)
-    femmesh.addVolume([1959, 109, 334, 1582], 10708)
-    femmesh.addVolume([238, 1961, 568, 1584], 10709)
-    femmesh.addVolume([1480, 1866, 76, 302], 10710)
-    femmesh.addVolume([1482, 536, 205, 1868], 10711)
-    femmesh.addVolume([1716, 282, 608, 2124], 10712)
-    femmesh.addVolume([2122, 1714, 153, 441], 10713)
-    femmesh.addVolume([1350, 161, 2145, 651], 10714)
-    femmesh.addVolume([388, 1348, 32, 2143], 10715)
-    femmesh.addVolume([231, 1943, 1560, 561], 10716)
-    femmesh.addVolume([212, 1886, 543, 1506], 10717)
-    femmesh.addVolume([1884, 1504, 83, 309], 10718)
-    femmesh.addVolume([1558, 102, 327, 1941], 10719)
-    femmesh.addVolume([2197, 50, 407, 1405], 10720)
-    femmesh.addVolume([2199, 179, 1407, 670], 10721)
-    femmesh.addVolume([2070, 264, 589, 1659], 10722)
-    femmesh.addVolume([2068, 422, 135, 1657], 10723)
-    femmesh.addVolume([249, 1617, 1994, 579], 10724)
-    femmesh.addVolume([1615, 120, 1992, 345], 10725)
-    femmesh.addVolume([1833, 65, 1447, 291], 10726)
-    femmesh.addVolume([1835, 194, 525, 1449], 10727)
-    femmesh.addVolume([597, 2091, 1683, 271], 10728)
-    femmesh.addVolume([1681, 142, 2089, 430], 10729)
-    femmesh.addVolume([399, 1381, 43, 2176], 10730)
-    femmesh.addVolume([1383, 172, 2178, 662], 10731)
-    femmesh.addVolume([344, 119, 1989, 343], 10732)
-    femmesh.addVolume([577, 1991, 578, 248], 10733)
-    femmesh.addVolume([293, 66, 1836, 292], 10734)
-    femmesh.addVolume([527, 195, 526, 1838], 10735)
-    femmesh.addVolume([1537, 320, 94, 1917], 10736)
-    femmesh.addVolume([91, 1525, 1908, 316], 10737)
-    femmesh.addVolume([1910, 220, 550, 1527], 10738)
-    femmesh.addVolume([1919, 223, 1539, 554], 10739)
-    femmesh.addVolume([318, 92, 1911, 317], 10740)
-    femmesh.addVolume([552, 221, 551, 1913], 10741)
-    femmesh.addVolume([1916, 222, 553, 552], 10742)
-    femmesh.addVolume([319, 318, 93, 1914], 10743)
-    femmesh.addVolume([1372, 396, 39, 2164], 10744)
-    femmesh.addVolume([1374, 2166, 168, 659], 10745)
-    femmesh.addVolume([1692, 2103, 600, 275], 10746)
-    femmesh.addVolume([146, 1690, 2101, 433], 10747)
-    femmesh.addVolume([1461, 197, 529, 1844], 10748)
-    femmesh.addVolume([1459, 68, 1842, 295], 10749)
-    femmesh.addVolume([575, 1605, 1985, 246], 10750)
-    femmesh.addVolume([1983, 117, 1603, 341], 10751)
-    femmesh.addVolume([196, 527, 528, 1841], 10752)
-    femmesh.addVolume([294, 67, 1839, 293], 10753)
-    femmesh.addVolume([343, 118, 1986, 342], 10754)
-    femmesh.addVolume([247, 577, 1988, 576], 10755)
-    femmesh.addVolume([1633, 127, 415, 2045], 10756)
-    femmesh.addVolume([1635, 582, 256, 2049], 10757)
-    femmesh.addVolume([2218, 58, 414, 1429], 10758)
-    femmesh.addVolume([2220, 187, 1431, 677], 10759)
-    femmesh.addVolume([1584, 568, 239, 1964], 10760)
-    femmesh.addVolume([1962, 334, 110, 1582], 10761)
-    femmesh.addVolume([204, 1865, 536, 1482], 10762)
-    femmesh.addVolume([1863, 1480, 75, 302], 10763)
-    femmesh.addVolume([2143, 32, 389, 1351], 10764)
-    femmesh.addVolume([2145, 161, 1353, 652], 10765)
-    femmesh.addVolume([2122, 153, 1711, 440], 10766)
-    femmesh.addVolume([607, 2124, 282, 1713], 10767)
-    femmesh.addVolume([1558, 327, 101, 1938], 10768)
-    femmesh.addVolume([1887, 84, 1504, 309], 10769)
-    femmesh.addVolume([1889, 213, 543, 1506], 10770)
-    femmesh.addVolume([1940, 230, 1560, 561], 10771)
-    femmesh.addVolume([423, 2068, 135, 1660], 10772)
-    femmesh.addVolume([2070, 590, 264, 1662], 10773)
-    femmesh.addVolume([2199, 1404, 179, 669], 10774)
-    femmesh.addVolume([2197, 406, 50, 1402], 10775)
-    femmesh.addVolume([250, 1997, 1617, 579], 10776)
-    femmesh.addVolume([1615, 1995, 121, 345], 10777)
-    femmesh.addVolume([525, 1449, 193, 1832], 10778)
-    femmesh.addVolume([1447, 64, 1830, 291], 10779)
-    femmesh.addVolume([142, 1678, 2089, 429], 10780)
-    femmesh.addVolume([1680, 271, 2091, 596], 10781)
-    femmesh.addVolume([2176, 43, 400, 1384], 10782)
-    femmesh.addVolume([2178, 172, 1386, 663], 10783)
-    femmesh.addVolume([504, 505, 1807, 2017], 10784)
-    femmesh.addVolume([1907, 550, 219, 1527], 10785)
-    femmesh.addVolume([1905, 1525, 90, 316], 10786)
-    femmesh.addVolume([1539, 224, 1922, 554], 10787)
-    femmesh.addVolume([95, 1920, 320, 1537], 10788)
-    femmesh.addVolume([2047, 414, 59, 1429], 10789)
-    femmesh.addVolume([582, 1635, 255, 2048], 10790)
-    femmesh.addVolume([2042, 1431, 188, 677], 10791)
-    femmesh.addVolume([2044, 126, 415, 1633], 10792)
-    femmesh.addVolume([2164, 395, 39, 1369], 10793)
-    femmesh.addVolume([168, 2166, 1371, 658], 10794)
-    femmesh.addVolume([1695, 601, 2103, 275], 10795)
-    femmesh.addVolume([146, 2101, 1693, 434], 10796)
-    femmesh.addVolume([529, 1847, 198, 1461], 10797)
-    femmesh.addVolume([1845, 69, 1459, 295], 10798)
-    femmesh.addVolume([575, 1982, 1605, 245], 10799)
-    femmesh.addVolume([116, 1980, 1603, 341], 10800)
-    femmesh.addVolume([2047, 59, 7, 1432], 10801)
-    femmesh.addVolume([1632, 12, 255, 2048], 10802)
-    femmesh.addVolume([1434, 188, 14, 2042], 10803)
-    femmesh.addVolume([2044, 8, 126, 1630], 10804)
-    femmesh.addVolume([1964, 569, 239, 1587], 10805)
-    femmesh.addVolume([1962, 110, 335, 1585], 10806)
-    femmesh.addVolume([1477, 1863, 75, 301], 10807)
-    femmesh.addVolume([1479, 535, 204, 1865], 10808)
-    femmesh.addVolume([152, 2119, 1711, 440], 10809)
-    femmesh.addVolume([2121, 607, 281, 1713], 10810)
-    femmesh.addVolume([2146, 389, 33, 1351], 10811)
-    femmesh.addVolume([162, 2148, 1353, 652], 10812)
-    femmesh.addVolume([560, 1557, 1940, 230], 10813)
-    femmesh.addVolume([1555, 101, 326, 1938], 10814)
-    femmesh.addVolume([84, 1887, 1507, 310], 10815)
-    femmesh.addVolume([1889, 544, 213, 1509], 10816)
-    femmesh.addVolume([1762, 461, 462, 2232], 10817)
-    femmesh.addVolume([2194, 49, 406, 1402], 10818)
-    femmesh.addVolume([2196, 178, 1404, 669], 10819)
-    femmesh.addVolume([590, 1662, 2073, 265], 10820)
-    femmesh.addVolume([136, 2071, 423, 1660], 10821)
-    femmesh.addVolume([1767, 522, 11, 2039], 10822)
-    femmesh.addVolume([1620, 580, 1997, 250], 10823)
-    femmesh.addVolume([121, 1995, 1618, 346], 10824)
-    femmesh.addVolume([64, 1444, 1830, 290], 10825)
-    femmesh.addVolume([1446, 524, 193, 1832], 10826)
-    femmesh.addVolume([1678, 141, 2086, 429], 10827)
-    femmesh.addVolume([1680, 596, 2088, 270], 10828)
-    femmesh.addVolume([400, 1384, 44, 2179], 10829)
-    femmesh.addVolume([1386, 173, 2181, 663], 10830)
-    femmesh.addVolume([1542, 555, 1922, 224], 10831)
-    femmesh.addVolume([1907, 219, 549, 1524], 10832)
-    femmesh.addVolume([1905, 90, 1522, 315], 10833)
-    femmesh.addVolume([1920, 95, 321, 1540], 10834)
-    femmesh.addVolume([395, 2161, 38, 1369], 10835)
-    femmesh.addVolume([2163, 167, 1371, 658], 10836)
-    femmesh.addVolume([147, 1693, 2104, 434], 10837)
-    femmesh.addVolume([601, 2106, 276, 1695], 10838)
-    femmesh.addVolume([69, 1845, 1462, 296], 10839)
-    femmesh.addVolume([1847, 530, 198, 1464], 10840)
-    femmesh.addVolume([245, 1982, 1602, 574], 10841)
-    femmesh.addVolume([1980, 116, 1600, 340], 10842)
-    femmesh.addVolume([1817, 1818, 2034, 287], 10843)
-    femmesh.addVolume([1965, 335, 111, 1585], 10844)
-    femmesh.addVolume([1967, 240, 569, 1587], 10845)
-    femmesh.addVolume([1477, 74, 1860, 301], 10846)
-    femmesh.addVolume([1479, 203, 535, 1862], 10847)
-    femmesh.addVolume([9, 1816, 2252, 678], 10848)
-    femmesh.addVolume([606, 2121, 281, 1710], 10849)
-    femmesh.addVolume([2119, 152, 1708, 439], 10850)
-    femmesh.addVolume([2146, 33, 390, 1354], 10851)
-    femmesh.addVolume([2148, 162, 1356, 653], 10852)
-    femmesh.addVolume([430, 2092, 143, 431], 10853)
-    femmesh.addVolume([597, 272, 2094, 598], 10854)
-    femmesh.addVolume([662, 2175, 171, 661], 10855)
-    femmesh.addVolume([398, 42, 399, 2173], 10856)
-    femmesh.addVolume([287, 1818, 2034, 1819], 10857)
-    femmesh.addVolume([1555, 326, 100, 1935], 10858)
-    femmesh.addVolume([1892, 214, 544, 1509], 10859)
-    femmesh.addVolume([1890, 85, 1507, 310], 10860)
-    femmesh.addVolume([560, 1937, 1557, 229], 10861)
-    femmesh.addVolume([678, 2252, 9, 1815], 10862)
-    femmesh.addVolume([1399, 49, 405, 2194], 10863)
-    femmesh.addVolume([1401, 178, 2196, 668], 10864)
-    femmesh.addVolume([2073, 1665, 591, 265], 10865)
-    femmesh.addVolume([2071, 136, 424, 1663], 10866)
-    femmesh.addVolume([552, 222, 221, 1533], 10867)
-    femmesh.addVolume([93, 318, 92, 1531], 10868)
-    femmesh.addVolume([122, 1618, 1998, 346], 10869)
-    femmesh.addVolume([2000, 580, 1620, 251], 10870)
-    femmesh.addVolume([1823, 1444, 63, 290], 10871)
-    femmesh.addVolume([524, 1446, 192, 1828], 10872)
-    femmesh.addVolume([397, 396, 40, 2167], 10873)
-    femmesh.addVolume([660, 2169, 169, 659], 10874)
-    femmesh.addVolume([274, 600, 2100, 599], 10875)
-    femmesh.addVolume([432, 2098, 145, 433], 10876)
-    femmesh.addVolume([595, 1677, 2088, 270], 10877)
-    femmesh.addVolume([2086, 141, 1675, 428], 10878)
-    femmesh.addVolume([1387, 401, 44, 2179], 10879)
-    femmesh.addVolume([1389, 2181, 173, 664], 10880)
-    femmesh.addVolume([1453, 67, 66, 293], 10881)
-    femmesh.addVolume([195, 527, 196, 1455], 10882)
-    femmesh.addVolume([1609, 119, 118, 343], 10883)
-    femmesh.addVolume([248, 577, 1611, 247], 10884)
-    femmesh.addVolume([549, 1524, 218, 1904], 10885)
-    femmesh.addVolume([1522, 89, 1902, 315], 10886)
-    femmesh.addVolume([1925, 555, 1542, 225], 10887)
-    femmesh.addVolume([1923, 321, 96, 1540], 10888)
-    femmesh.addVolume([2163, 1368, 167, 657], 10889)
-    femmesh.addVolume([2161, 394, 38, 1366], 10890)
-    femmesh.addVolume([276, 2106, 602, 1698], 10891)
-    femmesh.addVolume([1696, 147, 2104, 435], 10892)
-    femmesh.addVolume([530, 1850, 199, 1464], 10893)
-    femmesh.addVolume([1848, 70, 1462, 296], 10894)
-    femmesh.addVolume([1977, 1600, 115, 340], 10895)
-    femmesh.addVolume([244, 1602, 1979, 574], 10896)
-    femmesh.addVolume([240, 1967, 570, 1590], 10897)
-    femmesh.addVolume([1965, 111, 336, 1588], 10898)
-    femmesh.addVolume([1476, 534, 203, 1862], 10899)
-    femmesh.addVolume([1474, 1860, 74, 300], 10900)
-    femmesh.addVolume([1708, 151, 2116, 439], 10901)
-    femmesh.addVolume([1710, 280, 606, 2118], 10902)
-    femmesh.addVolume([390, 1354, 34, 2149], 10903)
-    femmesh.addVolume([1356, 163, 2151, 653], 10904)
-    femmesh.addVolume([1552, 100, 325, 1935], 10905)
-    femmesh.addVolume([1937, 559, 1554, 229], 10906)
-    femmesh.addVolume([545, 1512, 214, 1892], 10907)
-    femmesh.addVolume([1510, 85, 1890, 311], 10908)
-    femmesh.addVolume([1401, 2193, 177, 668], 10909)
-    femmesh.addVolume([1399, 405, 48, 2191], 10910)
-    femmesh.addVolume([2076, 591, 1665, 266], 10911)
-    femmesh.addVolume([1663, 137, 424, 2074], 10912)
-    femmesh.addVolume([1621, 122, 1998, 347], 10913)
-    femmesh.addVolume([581, 2000, 1623, 251], 10914)
-    femmesh.addVolume([1823, 63, 1441, 289], 10915)
-    femmesh.addVolume([1828, 192, 523, 1443], 10916)
-    femmesh.addVolume([1677, 595, 2085, 269], 10917)
-    femmesh.addVolume([1675, 140, 2083, 428], 10918)
-    femmesh.addVolume([45, 2182, 401, 1387], 10919)
-    femmesh.addVolume([174, 2184, 1389, 664], 10920)
-    femmesh.addVolume([556, 1925, 1545, 225], 10921)
-    femmesh.addVolume([1923, 96, 322, 1543], 10922)
-    femmesh.addVolume([548, 1904, 218, 1521], 10923)
-    femmesh.addVolume([1902, 89, 1519, 314], 10924)
-    femmesh.addVolume([1686, 272, 273, 598], 10925)
-    femmesh.addVolume([143, 1684, 144, 431], 10926)
-    femmesh.addVolume([171, 1380, 170, 661], 10927)
-    femmesh.addVolume([398, 41, 42, 1378], 10928)
-    femmesh.addVolume([2158, 37, 394, 1366], 10929)
-    femmesh.addVolume([2160, 166, 1368, 657], 10930)
-    femmesh.addVolume([602, 2109, 277, 1698], 10931)
-    femmesh.addVolume([1696, 2107, 148, 435], 10932)
-    femmesh.addVolume([1850, 531, 199, 1467], 10933)
-    femmesh.addVolume([70, 1848, 1465, 297], 10934)
-    femmesh.addVolume([244, 1979, 1599, 573], 10935)
-    femmesh.addVolume([1977, 115, 1597, 339], 10936)
-    femmesh.addVolume([1970, 241, 570, 1590], 10937)
-    femmesh.addVolume([1968, 336, 112, 1588], 10938)
-    femmesh.addVolume([1474, 73, 1857, 300], 10939)
-    femmesh.addVolume([1476, 202, 534, 1859], 10940)
-    femmesh.addVolume([151, 1705, 2116, 438], 10941)
-    femmesh.addVolume([280, 1707, 605, 2118], 10942)
-    femmesh.addVolume([1359, 2151, 163, 654], 10943)
-    femmesh.addVolume([1357, 391, 34, 2149], 10944)
-    femmesh.addVolume([1512, 545, 215, 1895], 10945)
-    femmesh.addVolume([86, 1510, 1893, 311], 10946)
-    femmesh.addVolume([1932, 99, 325, 1552], 10947)
-    femmesh.addVolume([1934, 228, 1554, 559], 10948)
-    femmesh.addVolume([11, 1825, 191, 1440], 10949)
-    femmesh.addVolume([1624, 5, 123, 1829], 10950)
-    femmesh.addVolume([1626, 10, 1826, 252], 10951)
-    femmesh.addVolume([1438, 62, 4, 1822], 10952)
-    femmesh.addVolume([404, 1396, 48, 2191], 10953)
-    femmesh.addVolume([2193, 1398, 177, 667], 10954)
-    femmesh.addVolume([137, 2074, 1666, 425], 10955)
-    femmesh.addVolume([1668, 592, 2076, 266], 10956)
-    femmesh.addVolume([170, 1377, 169, 660], 10957)
-    femmesh.addVolume([397, 40, 41, 1375], 10958)
-    femmesh.addVolume([144, 1687, 145, 432], 10959)
-    femmesh.addVolume([1689, 273, 274, 599], 10960)
-    femmesh.addVolume([62, 4, 61, 1438], 10961)
-    femmesh.addVolume([191, 190, 11, 1440], 10962)
-    femmesh.addVolume([123, 124, 5, 1624], 10963)
-    femmesh.addVolume([253, 10, 1626, 252], 10964)
-    femmesh.addVolume([2083, 140, 1672, 427], 10965)
-    femmesh.addVolume([1392, 2184, 174, 665], 10966)
-    femmesh.addVolume([594, 1674, 2085, 269], 10967)
-    femmesh.addVolume([1390, 402, 45, 2182], 10968)
-    femmesh.addVolume([88, 1899, 1519, 314], 10969)
-    femmesh.addVolume([217, 1901, 548, 1521], 10970)
-    femmesh.addVolume([226, 1928, 1545, 556], 10971)
-    femmesh.addVolume([97, 1926, 322, 1543], 10972)
-    femmesh.addVolume([2158, 393, 37, 1363], 10973)
-    femmesh.addVolume([2160, 1365, 166, 656], 10974)
-    femmesh.addVolume([277, 2109, 603, 1701], 10975)
-    femmesh.addVolume([1699, 148, 2107, 436], 10976)
-    femmesh.addVolume([1441, 62, 1822, 289], 10977)
-    femmesh.addVolume([1825, 523, 191, 1443], 10978)
-    femmesh.addVolume([252, 1826, 1623, 581], 10979)
-    femmesh.addVolume([1621, 1829, 123, 347], 10980)
-    femmesh.addVolume([1853, 200, 531, 1467], 10981)
-    femmesh.addVolume([1851, 71, 1465, 297], 10982)
-    femmesh.addVolume([1974, 1597, 114, 339], 10983)
-    femmesh.addVolume([1599, 573, 1976, 243], 10984)
-    femmesh.addVolume([241, 1970, 571, 1593], 10985)
-    femmesh.addVolume([337, 1968, 112, 1591], 10986)
-    femmesh.addVolume([1473, 533, 202, 1859], 10987)
-    femmesh.addVolume([1471, 1857, 73, 299], 10988)
-    femmesh.addVolume([1357, 35, 391, 2152], 10989)
-    femmesh.addVolume([1359, 164, 2154, 654], 10990)
-    femmesh.addVolume([1707, 279, 605, 2115], 10991)
-    femmesh.addVolume([1705, 150, 2113, 438], 10992)
-    femmesh.addVolume([1549, 99, 324, 1932], 10993)
-    femmesh.addVolume([1515, 215, 546, 1895], 10994)
-    femmesh.addVolume([1513, 86, 1893, 312], 10995)
-    femmesh.addVolume([558, 1551, 1934, 228], 10996)
-    femmesh.addVolume([1398, 2190, 176, 667], 10997)
-    femmesh.addVolume([1396, 404, 47, 2188], 10998)
-    femmesh.addVolume([2077, 138, 1666, 425], 10999)
-    femmesh.addVolume([2079, 592, 1668, 267], 11000)
-    femmesh.addVolume([1899, 88, 1516, 313], 11001)
-    femmesh.addVolume([226, 1548, 1928, 557], 11002)
-    femmesh.addVolume([1901, 217, 547, 1518], 11003)
-    femmesh.addVolume([1926, 97, 323, 1546], 11004)
-    femmesh.addVolume([594, 2082, 1674, 268], 11005)
-    femmesh.addVolume([2187, 1392, 175, 665], 11006)
-    femmesh.addVolume([2185, 402, 46, 1390], 11007)
-    femmesh.addVolume([2080, 1672, 139, 427], 11008)
-    femmesh.addVolume([1974, 114, 1594, 338], 11009)
-    femmesh.addVolume([1468, 71, 1851, 298], 11010)
-    femmesh.addVolume([1470, 200, 532, 1853], 11011)
-    femmesh.addVolume([1596, 243, 1976, 572], 11012)
-    femmesh.addVolume([1973, 242, 571, 1593], 11013)
-    femmesh.addVolume([1971, 337, 113, 1591], 11014)
-    femmesh.addVolume([1473, 201, 533, 1856], 11015)
-    femmesh.addVolume([1471, 72, 1854, 299], 11016)
-    femmesh.addVolume([2155, 36, 393, 1363], 11017)
-    femmesh.addVolume([1365, 2157, 165, 656], 11018)
-    femmesh.addVolume([2112, 278, 603, 1701], 11019)
-    femmesh.addVolume([1699, 2110, 149, 436], 11020)
-    femmesh.addVolume([1551, 558, 1931, 227], 11021)
-    femmesh.addVolume([1549, 324, 98, 1929], 11022)
-    femmesh.addVolume([1513, 1896, 87, 312], 11023)
-    femmesh.addVolume([216, 1515, 546, 1898], 11024)
-    femmesh.addVolume([1360, 392, 35, 2152], 11025)
-    femmesh.addVolume([2113, 150, 1702, 437], 11026)
-    femmesh.addVolume([1362, 2154, 164, 655], 11027)
-    femmesh.addVolume([279, 1704, 604, 2115], 11028)
-    femmesh.addVolume([1393, 47, 403, 2188], 11029)
-    femmesh.addVolume([1395, 176, 2190, 666], 11030)
-    femmesh.addVolume([1671, 593, 2079, 267], 11031)
-    femmesh.addVolume([138, 2077, 1669, 426], 11032)
-    femmesh.addVolume([2080, 139, 1669, 426], 11033)
-    femmesh.addVolume([2082, 593, 1671, 268], 11034)
-    femmesh.addVolume([1393, 403, 46, 2185], 11035)
-    femmesh.addVolume([1395, 2187, 175, 666], 11036)
-    femmesh.addVolume([1362, 165, 2157, 655], 11037)
-    femmesh.addVolume([392, 1360, 36, 2155], 11038)
-    femmesh.addVolume([1702, 149, 2110, 437], 11039)
-    femmesh.addVolume([604, 1704, 278, 2112], 11040)
-    femmesh.addVolume([1548, 227, 1931, 557], 11041)
-    femmesh.addVolume([1546, 98, 323, 1929], 11042)
-    femmesh.addVolume([1516, 87, 1896, 313], 11043)
-    femmesh.addVolume([1518, 216, 547, 1898], 11044)
-    femmesh.addVolume([1594, 113, 1971, 338], 11045)
-    femmesh.addVolume([242, 1596, 1973, 572], 11046)
-    femmesh.addVolume([1468, 1854, 72, 298], 11047)
-    femmesh.addVolume([1470, 532, 201, 1856], 11048)
-    femmesh.addVolume([579, 1994, 249, 578], 11049)
-    femmesh.addVolume([345, 120, 1992, 344], 11050)
-    femmesh.addVolume([291, 1833, 65, 292], 11051)
-    femmesh.addVolume([526, 194, 525, 1835], 11052)
-    femmesh.addVolume([551, 220, 550, 1910], 11053)
-    femmesh.addVolume([316, 1908, 91, 317], 11054)
-    femmesh.addVolume([554, 1919, 223, 553], 11055)
-    femmesh.addVolume([319, 94, 320, 1917], 11056)
-    femmesh.addVolume([483, 1818, 2034, 1820], 11057)
-    femmesh.addVolume([1811, 3, 2252, 678], 11058)
-    femmesh.addVolume([68, 294, 1842, 295], 11059)
-    femmesh.addVolume([528, 529, 197, 1844], 11060)
-    femmesh.addVolume([342, 117, 1983, 341], 11061)
-    femmesh.addVolume([246, 1985, 575, 576], 11062)
-    femmesh.addVolume([1821, 1818, 2034, 483], 11063)
-    femmesh.addVolume([1813, 2252, 3, 678], 11064)
-    femmesh.addVolume([578, 1614, 249, 248], 11065)
-    femmesh.addVolume([1612, 120, 119, 344], 11066)
-    femmesh.addVolume([526, 195, 194, 1452], 11067)
-    femmesh.addVolume([65, 1450, 66, 292], 11068)
-    femmesh.addVolume([91, 1528, 92, 317], 11069)
-    femmesh.addVolume([221, 220, 551, 1530], 11070)
-    femmesh.addVolume([553, 1536, 223, 222], 11071)
-    femmesh.addVolume([94, 319, 93, 1534], 11072)
-    femmesh.addVolume([528, 197, 196, 1458], 11073)
-    femmesh.addVolume([67, 1456, 68, 294], 11074)
-    femmesh.addVolume([247, 1608, 246, 576], 11075)
-    femmesh.addVolume([1606, 118, 117, 342], 11076)
-    femmesh.addVolume([1723, 2040, 4, 385], 11077)
-    femmesh.addVolume([2041, 1724, 5, 348], 11078)
-    femmesh.addVolume([429, 2089, 142, 430], 11079)
-    femmesh.addVolume([2091, 271, 597, 596], 11080)
-    femmesh.addVolume([663, 2178, 172, 662], 11081)
-    femmesh.addVolume([43, 400, 399, 2176], 11082)
-    femmesh.addVolume([2166, 658, 168, 659], 11083)
-    femmesh.addVolume([395, 39, 396, 2164], 11084)
-    femmesh.addVolume([2103, 601, 600, 275], 11085)
-    femmesh.addVolume([2101, 434, 146, 433], 11086)
-    femmesh.addVolume([2252, 678, 2232, 1815], 11087)
-    femmesh.addVolume([597, 1683, 272, 271], 11088)
-    femmesh.addVolume([1681, 143, 142, 430], 11089)
-    femmesh.addVolume([1383, 171, 172, 662], 11090)
-    femmesh.addVolume([43, 399, 42, 1381], 11091)
-    femmesh.addVolume([396, 39, 40, 1372], 11092)
-    femmesh.addVolume([169, 1374, 168, 659], 11093)
-    femmesh.addVolume([1690, 146, 145, 433], 11094)
-    femmesh.addVolume([1692, 275, 600, 274], 11095)
-    femmesh.addVolume([250, 580, 1997, 579], 11096)
-    femmesh.addVolume([1995, 346, 121, 345], 11097)
-    femmesh.addVolume([193, 524, 525, 1832], 11098)
-    femmesh.addVolume([290, 1830, 64, 291], 11099)
-    femmesh.addVolume([315, 1905, 90, 316], 11100)
-    femmesh.addVolume([549, 550, 219, 1907], 11101)
-    femmesh.addVolume([1922, 224, 555, 554], 11102)
-    femmesh.addVolume([95, 321, 320, 1920], 11103)
-    femmesh.addVolume([529, 530, 198, 1847], 11104)
-    femmesh.addVolume([295, 1845, 69, 296], 11105)
-    femmesh.addVolume([340, 1980, 116, 341], 11106)
-    femmesh.addVolume([245, 575, 1982, 574], 11107)
-    femmesh.addVolume([2252, 678, 1816, 2234], 11108)
-    femmesh.addVolume([678, 2252, 1811, 2234], 11109)
-    femmesh.addVolume([2034, 1819, 1818, 2003], 11110)
-    femmesh.addVolume([2252, 1813, 2232, 678], 11111)
-    femmesh.addVolume([1617, 249, 250, 579], 11112)
-    femmesh.addVolume([1615, 121, 120, 345], 11113)
-    femmesh.addVolume([64, 1447, 65, 291], 11114)
-    femmesh.addVolume([525, 194, 193, 1449], 11115)
-    femmesh.addVolume([1818, 1821, 2034, 2003], 11116)
-    femmesh.addVolume([219, 550, 220, 1527], 11117)
-    femmesh.addVolume([1525, 91, 90, 316], 11118)
-    femmesh.addVolume([320, 94, 95, 1537], 11119)
-    femmesh.addVolume([223, 224, 1539, 554], 11120)
-    femmesh.addVolume([529, 198, 197, 1461], 11121)
-    femmesh.addVolume([68, 1459, 69, 295], 11122)
-    femmesh.addVolume([1603, 117, 116, 341], 11123)
-    femmesh.addVolume([246, 575, 1605, 245], 11124)
-    femmesh.addVolume([429, 141, 2086, 428], 11125)
-    femmesh.addVolume([595, 2088, 596, 270], 11126)
-    femmesh.addVolume([663, 173, 2181, 664], 11127)
-    femmesh.addVolume([400, 44, 401, 2179], 11128)
-    femmesh.addVolume([658, 2163, 167, 657], 11129)
-    femmesh.addVolume([38, 395, 394, 2161], 11130)
-    femmesh.addVolume([602, 276, 601, 2106], 11131)
-    femmesh.addVolume([434, 2104, 147, 435], 11132)
-    femmesh.addVolume([596, 1680, 271, 270], 11133)
-    femmesh.addVolume([1678, 142, 141, 429], 11134)
-    femmesh.addVolume([173, 1386, 172, 663], 11135)
-    femmesh.addVolume([400, 43, 44, 1384], 11136)
-    femmesh.addVolume([39, 395, 38, 1369], 11137)
-    femmesh.addVolume([1371, 167, 168, 658], 11138)
-    femmesh.addVolume([1693, 147, 146, 434], 11139)
-    femmesh.addVolume([601, 1695, 276, 275], 11140)
-    femmesh.addVolume([1998, 347, 122, 346], 11141)
-    femmesh.addVolume([580, 2000, 581, 251], 11142)
-    femmesh.addVolume([192, 523, 524, 1828], 11143)
-    femmesh.addVolume([289, 1823, 63, 290], 11144)
-    femmesh.addVolume([555, 1925, 556, 225], 11145)
-    femmesh.addVolume([321, 96, 322, 1923], 11146)
-    femmesh.addVolume([218, 548, 549, 1904], 11147)
-    femmesh.addVolume([314, 1902, 89, 315], 11148)
-    femmesh.addVolume([1848, 297, 70, 296], 11149)
-    femmesh.addVolume([531, 199, 530, 1850], 11150)
-    femmesh.addVolume([115, 339, 1977, 340], 11151)
-    femmesh.addVolume([1979, 573, 244, 574], 11152)
-    femmesh.addVolume([2034, 2017, 1818, 1817], 11153)
-    femmesh.addVolume([250, 1620, 580, 251], 11154)
-    femmesh.addVolume([1618, 122, 121, 346], 11155)
-    femmesh.addVolume([192, 524, 193, 1446], 11156)
-    femmesh.addVolume([1444, 64, 63, 290], 11157)
-    femmesh.addVolume([549, 219, 218, 1524], 11158)
-    femmesh.addVolume([89, 1522, 90, 315], 11159)
-    femmesh.addVolume([1542, 225, 555, 224], 11160)
-    femmesh.addVolume([96, 321, 95, 1540], 11161)
-    femmesh.addVolume([2085, 595, 594, 269], 11162)
-    femmesh.addVolume([428, 140, 2083, 427], 11163)
-    femmesh.addVolume([401, 45, 402, 2182], 11164)
-    femmesh.addVolume([664, 174, 2184, 665], 11165)
-    femmesh.addVolume([37, 394, 393, 2158], 11166)
-    femmesh.addVolume([657, 2160, 166, 656], 11167)
-    femmesh.addVolume([435, 2107, 148, 436], 11168)
-    femmesh.addVolume([602, 603, 277, 2109], 11169)
-    femmesh.addVolume([198, 530, 199, 1464], 11170)
-    femmesh.addVolume([1462, 70, 69, 296], 11171)
-    femmesh.addVolume([245, 1602, 244, 574], 11172)
-    femmesh.addVolume([1600, 116, 115, 340], 11173)
-    femmesh.addVolume([1829, 5, 123, 347], 11174)
-    femmesh.addVolume([252, 10, 1826, 581], 11175)
-    femmesh.addVolume([523, 191, 11, 1825], 11176)
-    femmesh.addVolume([1822, 62, 4, 289], 11177)
-    femmesh.addVolume([2017, 2034, 1818, 1820], 11178)
-    femmesh.addVolume([314, 88, 1899, 313], 11179)
-    femmesh.addVolume([217, 547, 548, 1901], 11180)
-    femmesh.addVolume([557, 1928, 226, 556], 11181)
-    femmesh.addVolume([322, 97, 323, 1926], 11182)
-    femmesh.addVolume([1675, 141, 140, 428], 11183)
-    femmesh.addVolume([269, 1677, 595, 270], 11184)
-    femmesh.addVolume([174, 1389, 173, 664], 11185)
-    femmesh.addVolume([401, 44, 45, 1387], 11186)
-    femmesh.addVolume([532, 200, 531, 1853], 11187)
-    femmesh.addVolume([298, 71, 1851, 297], 11188)
-    femmesh.addVolume([1976, 243, 573, 572], 11189)
-    femmesh.addVolume([339, 114, 1974, 338], 11190)
-    femmesh.addVolume([38, 394, 37, 1366], 11191)
-    femmesh.addVolume([167, 1368, 166, 657], 11192)
-    femmesh.addVolume([602, 277, 276, 1698], 11193)
-    femmesh.addVolume([147, 1696, 148, 435], 11194)
-    femmesh.addVolume([427, 139, 2080, 426], 11195)
-    femmesh.addVolume([594, 593, 2082, 268], 11196)
-    femmesh.addVolume([402, 46, 403, 2185], 11197)
-    femmesh.addVolume([665, 175, 2187, 666], 11198)
-    femmesh.addVolume([165, 656, 2157, 655], 11199)
-    femmesh.addVolume([36, 393, 392, 2155], 11200)
-    femmesh.addVolume([149, 436, 2110, 437], 11201)
-    femmesh.addVolume([278, 603, 604, 2112], 11202)
-    femmesh.addVolume([581, 1623, 252, 251], 11203)
-    femmesh.addVolume([1621, 123, 122, 347], 11204)
-    femmesh.addVolume([191, 523, 192, 1443], 11205)
-    femmesh.addVolume([62, 1441, 63, 289], 11206)
-    femmesh.addVolume([1519, 89, 88, 314], 11207)
-    femmesh.addVolume([218, 217, 548, 1521], 11208)
-    femmesh.addVolume([556, 1545, 226, 225], 11209)
-    femmesh.addVolume([322, 96, 97, 1543], 11210)
-    femmesh.addVolume([199, 531, 200, 1467], 11211)
-    femmesh.addVolume([1465, 71, 70, 297], 11212)
-    femmesh.addVolume([573, 1599, 244, 243], 11213)
-    femmesh.addVolume([1597, 115, 114, 339], 11214)
-    femmesh.addVolume([1931, 227, 558, 557], 11215)
-    femmesh.addVolume([98, 324, 323, 1929], 11216)
-    femmesh.addVolume([546, 547, 216, 1898], 11217)
-    femmesh.addVolume([312, 1896, 87, 313], 11218)
-    femmesh.addVolume([299, 72, 1854, 298], 11219)
-    femmesh.addVolume([533, 201, 532, 1856], 11220)
-    femmesh.addVolume([1971, 113, 337, 338], 11221)
-    femmesh.addVolume([242, 1973, 571, 572], 11222)
-    femmesh.addVolume([1672, 140, 139, 427], 11223)
-    femmesh.addVolume([1674, 269, 594, 268], 11224)
-    femmesh.addVolume([46, 402, 45, 1390], 11225)
-    femmesh.addVolume([175, 1392, 174, 665], 11226)
-    femmesh.addVolume([37, 393, 36, 1363], 11227)
-    femmesh.addVolume([166, 1365, 165, 656], 11228)
-    femmesh.addVolume([603, 278, 277, 1701], 11229)
-    femmesh.addVolume([148, 1699, 149, 436], 11230)
-    femmesh.addVolume([425, 2077, 138, 426], 11231)
-    femmesh.addVolume([592, 2079, 593, 267], 11232)
-    femmesh.addVolume([403, 47, 404, 2188], 11233)
-    femmesh.addVolume([666, 176, 2190, 667], 11234)
-    femmesh.addVolume([655, 2154, 164, 654], 11235)
-    femmesh.addVolume([392, 391, 35, 2152], 11236)
-    femmesh.addVolume([604, 605, 279, 2115], 11237)
-    femmesh.addVolume([438, 150, 2113, 437], 11238)
-    femmesh.addVolume([1, 1344, 157, 1337], 11239)
-    femmesh.addVolume([1340, 157, 2, 1341], 11240)
-    femmesh.addVolume([228, 1934, 558, 559], 11241)
-    femmesh.addVolume([324, 99, 325, 1932], 11242)
-    femmesh.addVolume([546, 215, 545, 1895], 11243)
-    femmesh.addVolume([311, 1893, 86, 312], 11244)
-    femmesh.addVolume([98, 323, 97, 1546], 11245)
-    femmesh.addVolume([1548, 226, 227, 557], 11246)
-    femmesh.addVolume([216, 547, 217, 1518], 11247)
-    femmesh.addVolume([1516, 88, 87, 313], 11248)
-    femmesh.addVolume([300, 73, 1857, 299], 11249)
-    femmesh.addVolume([534, 202, 533, 1859], 11250)
-    femmesh.addVolume([241, 570, 571, 1970], 11251)
-    femmesh.addVolume([112, 337, 336, 1968], 11252)
-    femmesh.addVolume([71, 1468, 72, 298], 11253)
-    femmesh.addVolume([532, 201, 200, 1470], 11254)
-    femmesh.addVolume([243, 1596, 242, 572], 11255)
-    femmesh.addVolume([113, 1594, 114, 338], 11256)
-    femmesh.addVolume([2074, 137, 424, 425], 11257)
-    femmesh.addVolume([592, 591, 2076, 266], 11258)
-    femmesh.addVolume([404, 48, 405, 2191], 11259)
-    femmesh.addVolume([667, 177, 2193, 668], 11260)
-    femmesh.addVolume([34, 391, 390, 2149], 11261)
-    femmesh.addVolume([654, 2151, 163, 653], 11262)
-    femmesh.addVolume([438, 2116, 151, 439], 11263)
-    femmesh.addVolume([605, 606, 280, 2118], 11264)
-    femmesh.addVolume([1669, 139, 138, 426], 11265)
-    femmesh.addVolume([1671, 268, 593, 267], 11266)
-    femmesh.addVolume([403, 46, 47, 1393], 11267)
-    femmesh.addVolume([176, 1395, 175, 666], 11268)
-    femmesh.addVolume([1362, 164, 165, 655], 11269)
-    femmesh.addVolume([392, 35, 36, 1360], 11270)
-    femmesh.addVolume([279, 278, 604, 1704], 11271)
-    femmesh.addVolume([1702, 150, 149, 437], 11272)
-    femmesh.addVolume([559, 1937, 560, 229], 11273)
-    femmesh.addVolume([310, 1890, 85, 311], 11274)
-    femmesh.addVolume([100, 326, 325, 1935], 11275)
-    femmesh.addVolume([214, 544, 545, 1892], 11276)
-    femmesh.addVolume([535, 203, 534, 1862], 11277)
-    femmesh.addVolume([301, 74, 1860, 300], 11278)
-    femmesh.addVolume([335, 111, 336, 1965], 11279)
-    femmesh.addVolume([240, 569, 570, 1967], 11280)
-    femmesh.addVolume([259, 585, 586, 2058], 11281)
-    femmesh.addVolume([418, 130, 419, 2056], 11282)
-    femmesh.addVolume([673, 184, 2211, 674], 11283)
-    femmesh.addVolume([410, 55, 411, 2209], 11284)
-    femmesh.addVolume([2136, 13, 158, 649], 11285)
-    femmesh.addVolume([386, 6, 29, 2134], 11286)
-    femmesh.addVolume([156, 2131, 6, 443], 11287)
-    femmesh.addVolume([610, 13, 285, 2133], 11288)
-    femmesh.addVolume([255, 12, 582, 2048], 11289)
-    femmesh.addVolume([7, 414, 59, 2047], 11290)
-    femmesh.addVolume([415, 8, 126, 2044], 11291)
-    femmesh.addVolume([2042, 188, 14, 677], 11292)
-    femmesh.addVolume([423, 136, 424, 2071], 11293)
-    femmesh.addVolume([2073, 591, 590, 265], 11294)
-    femmesh.addVolume([405, 49, 406, 2194], 11295)
-    femmesh.addVolume([668, 178, 2196, 669], 11296)
-    femmesh.addVolume([607, 281, 606, 2121], 11297)
-    femmesh.addVolume([439, 2119, 152, 440], 11298)
-    femmesh.addVolume([33, 390, 389, 2146], 11299)
-    femmesh.addVolume([653, 2148, 162, 652], 11300)
-    femmesh.addVolume([182, 673, 2208, 672], 11301)
-    femmesh.addVolume([409, 53, 410, 2206], 11302)
-    femmesh.addVolume([132, 420, 419, 2059], 11303)
-    femmesh.addVolume([586, 587, 261, 2061], 11304)
-    femmesh.addVolume([107, 332, 331, 1953], 11305)
-    femmesh.addVolume([207, 538, 539, 1874], 11306)
-    femmesh.addVolume([78, 304, 1872, 305], 11307)
-    femmesh.addVolume([566, 236, 565, 1955], 11308)
-    femmesh.addVolume([81, 306, 1878, 307], 11309)
-    femmesh.addVolume([540, 541, 210, 1880], 11310)
-    femmesh.addVolume([564, 1949, 233, 563], 11311)
-    femmesh.addVolume([330, 329, 104, 1947], 11312)
-    femmesh.addVolume([86, 1513, 87, 312], 11313)
-    femmesh.addVolume([546, 216, 215, 1515], 11314)
-    femmesh.addVolume([227, 1551, 558, 228], 11315)
-    femmesh.addVolume([99, 324, 98, 1549], 11316)
-    femmesh.addVolume([101, 327, 326, 1938], 11317)
-    femmesh.addVolume([230, 1940, 560, 561], 11318)
-    femmesh.addVolume([543, 544, 213, 1889], 11319)
-    femmesh.addVolume([309, 1887, 84, 310], 11320)
-    femmesh.addVolume([533, 202, 201, 1473], 11321)
-    femmesh.addVolume([72, 1471, 73, 299], 11322)
-    femmesh.addVolume([113, 337, 112, 1591], 11323)
-    femmesh.addVolume([571, 242, 241, 1593], 11324)
-    femmesh.addVolume([536, 204, 535, 1865], 11325)
-    femmesh.addVolume([1863, 302, 75, 301], 11326)
-    femmesh.addVolume([334, 110, 335, 1962], 11327)
-    femmesh.addVolume([569, 239, 568, 1964], 11328)
-    femmesh.addVolume([129, 418, 417, 2053], 11329)
-    femmesh.addVolume([258, 584, 585, 2055], 11330)
-    femmesh.addVolume([675, 2214, 185, 674], 11331)
-    femmesh.addVolume([56, 412, 411, 2212], 11332)
-    femmesh.addVolume([155, 442, 2128, 443], 11333)
-    femmesh.addVolume([650, 2139, 159, 649], 11334)
-    femmesh.addVolume([30, 387, 386, 2137], 11335)
-    femmesh.addVolume([610, 284, 609, 2130], 11336)
-    femmesh.addVolume([52, 409, 408, 2203], 11337)
-    femmesh.addVolume([672, 2205, 181, 671], 11338)
-    femmesh.addVolume([420, 133, 421, 2062], 11339)
-    femmesh.addVolume([588, 262, 587, 2064], 11340)
-    femmesh.addVolume([589, 590, 264, 2070], 11341)
-    femmesh.addVolume([423, 422, 135, 2068], 11342)
-    femmesh.addVolume([406, 50, 407, 2197], 11343)
-    femmesh.addVolume([669, 179, 2199, 670], 11344)
-    femmesh.addVolume([608, 282, 607, 2124], 11345)
-    femmesh.addVolume([2122, 441, 153, 440], 11346)
-    femmesh.addVolume([652, 2145, 161, 651], 11347)
-    femmesh.addVolume([32, 389, 388, 2143], 11348)
-    femmesh.addVolume([414, 413, 58, 2218], 11349)
-    femmesh.addVolume([677, 2220, 187, 676], 11350)
-    femmesh.addVolume([415, 127, 416, 2045], 11351)
-    femmesh.addVolume([583, 256, 582, 2049], 11352)
-    femmesh.addVolume([566, 567, 237, 1958], 11353)
-    femmesh.addVolume([333, 332, 108, 1956], 11354)
-    femmesh.addVolume([77, 303, 1869, 304], 11355)
-    femmesh.addVolume([206, 537, 538, 1871], 11356)
-    femmesh.addVolume([1946, 562, 232, 563], 11357)
-    femmesh.addVolume([542, 211, 541, 1883], 11358)
-    femmesh.addVolume([308, 82, 1881, 307], 11359)
-    femmesh.addVolume([328, 103, 329, 1944], 11360)
-    femmesh.addVolume([562, 1943, 231, 561], 11361)
-    femmesh.addVolume([308, 1884, 83, 309], 11362)
-    femmesh.addVolume([328, 327, 102, 1941], 11363)
-    femmesh.addVolume([212, 542, 543, 1886], 11364)
-    femmesh.addVolume([537, 205, 536, 1868], 11365)
-    femmesh.addVolume([1866, 303, 76, 302], 11366)
-    femmesh.addVolume([238, 567, 568, 1961], 11367)
-    femmesh.addVolume([333, 109, 334, 1959], 11368)
-    femmesh.addVolume([416, 128, 417, 2050], 11369)
-    femmesh.addVolume([583, 584, 257, 2052], 11370)
-    femmesh.addVolume([57, 413, 412, 2215], 11371)
-    femmesh.addVolume([186, 676, 2217, 675], 11372)
-    femmesh.addVolume([608, 609, 283, 2127], 11373)
-    femmesh.addVolume([441, 2125, 154, 442], 11374)
-    femmesh.addVolume([651, 2142, 160, 650], 11375)
-    femmesh.addVolume([388, 387, 31, 2140], 11376)
-    femmesh.addVolume([134, 422, 421, 2065], 11377)
-    femmesh.addVolume([408, 407, 51, 2200], 11378)
-    femmesh.addVolume([671, 2202, 180, 670], 11379)
-    femmesh.addVolume([588, 589, 263, 2067], 11380)
-    femmesh.addVolume([404, 47, 48, 1396], 11381)
-    femmesh.addVolume([267, 592, 1668, 266], 11382)
-    femmesh.addVolume([1666, 138, 137, 425], 11383)
-    femmesh.addVolume([177, 1398, 176, 667], 11384)
-    femmesh.addVolume([1359, 163, 164, 654], 11385)
-    femmesh.addVolume([35, 391, 34, 1357], 11386)
-    femmesh.addVolume([279, 605, 280, 1707], 11387)
-    femmesh.addVolume([150, 1705, 151, 438], 11388)
-    femmesh.addVolume([1810, 235, 234, 1572], 11389)
-    femmesh.addVolume([1766, 105, 106, 1570], 11390)
-    femmesh.addVolume([1492, 80, 79, 1765], 11391)
-    femmesh.addVolume([208, 1809, 209, 1494], 11392)
-    femmesh.addVolume([1554, 559, 228, 229], 11393)
-    femmesh.addVolume([100, 325, 99, 1552], 11394)
-    femmesh.addVolume([1510, 86, 85, 311], 11395)
-    femmesh.addVolume([545, 215, 214, 1512], 11396)
-    femmesh.addVolume([534, 203, 202, 1476], 11397)
-    femmesh.addVolume([73, 1474, 74, 300], 11398)
-    femmesh.addVolume([240, 570, 241, 1590], 11399)
-    femmesh.addVolume([112, 336, 111, 1588], 11400)
-    femmesh.addVolume([1763, 288, 463, 1811], 11401)
-    femmesh.addVolume([1820, 1807, 504, 482], 11402)
-    femmesh.addVolume([266, 591, 1665, 265], 11403)
-    femmesh.addVolume([137, 424, 136, 1663], 11404)
-    femmesh.addVolume([178, 1401, 177, 668], 11405)
-    femmesh.addVolume([405, 48, 49, 1399], 11406)
-    femmesh.addVolume([1356, 162, 163, 653], 11407)
-    femmesh.addVolume([34, 390, 33, 1354], 11408)
-    femmesh.addVolume([280, 606, 281, 1710], 11409)
-    femmesh.addVolume([1708, 152, 151, 439], 11410)
-    femmesh.addVolume([60, 7, 59, 1432], 11411)
-    femmesh.addVolume([188, 14, 189, 1434], 11412)
-    femmesh.addVolume([126, 8, 125, 1630], 11413)
-    femmesh.addVolume([254, 12, 255, 1632], 11414)
-    femmesh.addVolume([482, 630, 1816, 1808], 11415)
-    femmesh.addVolume([326, 100, 101, 1555], 11416)
-    femmesh.addVolume([544, 214, 213, 1509], 11417)
-    femmesh.addVolume([229, 1557, 560, 230], 11418)
-    femmesh.addVolume([1507, 85, 84, 310], 11419)
-    femmesh.addVolume([535, 204, 203, 1479], 11420)
-    femmesh.addVolume([74, 1477, 75, 301], 11421)
-    femmesh.addVolume([111, 335, 110, 1585], 11422)
-    femmesh.addVolume([569, 240, 239, 1587], 11423)
-    femmesh.addVolume([366, 1819, 1761, 286], 11424)
-    femmesh.addVolume([264, 1662, 590, 265], 11425)
-    femmesh.addVolume([423, 135, 136, 1660], 11426)
-    femmesh.addVolume([179, 1404, 178, 669], 11427)
-    femmesh.addVolume([406, 49, 50, 1402], 11428)
-    femmesh.addVolume([1353, 161, 162, 652], 11429)
-    femmesh.addVolume([33, 389, 32, 1351], 11430)
-    femmesh.addVolume([281, 607, 282, 1713], 11431)
-    femmesh.addVolume([1711, 153, 152, 440], 11432)
-    femmesh.addVolume([59, 414, 58, 1429], 11433)
-    femmesh.addVolume([188, 1431, 187, 677], 11434)
-    femmesh.addVolume([127, 415, 126, 1633], 11435)
-    femmesh.addVolume([255, 582, 256, 1635], 11436)
-    femmesh.addVolume([230, 231, 1560, 561], 11437)
-    femmesh.addVolume([543, 213, 212, 1506], 11438)
-    femmesh.addVolume([102, 327, 101, 1558], 11439)
-    femmesh.addVolume([83, 1504, 84, 309], 11440)
-    femmesh.addVolume([536, 205, 204, 1482], 11441)
-    femmesh.addVolume([75, 1480, 76, 302], 11442)
-    femmesh.addVolume([568, 239, 238, 1584], 11443)
-    femmesh.addVolume([110, 334, 109, 1582], 11444)
-    femmesh.addVolume([629, 484, 1815, 1805], 11445)
-    femmesh.addVolume([130, 418, 129, 1642], 11446)
-    femmesh.addVolume([259, 258, 585, 1644], 11447)
-    femmesh.addVolume([185, 1422, 184, 674], 11448)
-    femmesh.addVolume([411, 55, 56, 1420], 11449)
-    femmesh.addVolume([263, 589, 264, 1659], 11450)
-    femmesh.addVolume([407, 50, 51, 1405], 11451)
-    femmesh.addVolume([135, 422, 134, 1657], 11452)
-    femmesh.addVolume([1407, 179, 180, 670], 11453)
-    femmesh.addVolume([285, 284, 610, 1722], 11454)
-    femmesh.addVolume([1720, 156, 155, 443], 11455)
-    femmesh.addVolume([1343, 158, 159, 649], 11456)
-    femmesh.addVolume([30, 386, 29, 1338], 11457)
-    femmesh.addVolume([1350, 160, 161, 651], 11458)
-    femmesh.addVolume([32, 388, 31, 1348], 11459)
-    femmesh.addVolume([283, 282, 608, 1716], 11460)
-    femmesh.addVolume([153, 1714, 154, 441], 11461)
-    femmesh.addVolume([409, 52, 53, 1411], 11462)
-    femmesh.addVolume([182, 1413, 181, 672], 11463)
-    femmesh.addVolume([133, 420, 132, 1651], 11464)
-    femmesh.addVolume([262, 261, 587, 1653], 11465)
-    femmesh.addVolume([58, 413, 57, 1426], 11466)
-    femmesh.addVolume([1428, 186, 187, 676], 11467)
-    femmesh.addVolume([128, 416, 127, 1636], 11468)
-    femmesh.addVolume([257, 256, 583, 1638], 11469)
-    femmesh.addVolume([462, 286, 1762, 1813], 11470)
-    femmesh.addVolume([237, 236, 566, 1578], 11471)
-    femmesh.addVolume([108, 332, 107, 1576], 11472)
-    femmesh.addVolume([206, 538, 207, 1488], 11473)
-    femmesh.addVolume([1486, 78, 77, 304], 11474)
-    femmesh.addVolume([82, 1501, 83, 308], 11475)
-    femmesh.addVolume([542, 212, 211, 1503], 11476)
-    femmesh.addVolume([232, 1563, 231, 562], 11477)
-    femmesh.addVolume([103, 328, 102, 1561], 11478)
-    femmesh.addVolume([232, 233, 1566, 563], 11479)
-    femmesh.addVolume([104, 329, 103, 1564], 11480)
-    femmesh.addVolume([210, 541, 211, 1500], 11481)
-    femmesh.addVolume([1498, 82, 81, 307], 11482)
-    femmesh.addVolume([76, 1483, 77, 303], 11483)
-    femmesh.addVolume([537, 206, 205, 1485], 11484)
-    femmesh.addVolume([238, 237, 567, 1581], 11485)
-    femmesh.addVolume([109, 333, 108, 1579], 11486)
-    femmesh.addVolume([1425, 185, 186, 675], 11487)
-    femmesh.addVolume([57, 412, 56, 1423], 11488)
-    femmesh.addVolume([129, 417, 128, 1639], 11489)
-    femmesh.addVolume([257, 584, 258, 1641], 11490)
-    femmesh.addVolume([134, 421, 133, 1654], 11491)
-    femmesh.addVolume([408, 51, 52, 1408], 11492)
-    femmesh.addVolume([1410, 180, 181, 671], 11493)
-    femmesh.addVolume([262, 588, 263, 1656], 11494)
-    femmesh.addVolume([1347, 159, 160, 650], 11495)
-    femmesh.addVolume([154, 1717, 155, 442], 11496)
-    femmesh.addVolume([283, 609, 284, 1719], 11497)
-    femmesh.addVolume([387, 30, 31, 1345], 11498)
-    femmesh.addVolume([484, 1806, 503, 1821], 11499)
-    femmesh.addVolume([462, 3, 286, 1813], 11500)
-    femmesh.addVolume([288, 367, 1817, 1764], 11501)
-    femmesh.addVolume([483, 1820, 504, 482], 11502)
-    femmesh.addVolume([484, 1821, 503, 483], 11503)
-    femmesh.addVolume([463, 288, 3, 1811], 11504)
-    femmesh.addVolume([366, 287, 1819, 286], 11505)
-    femmesh.addVolume([630, 1816, 9, 482], 11506)
-    femmesh.addVolume([1817, 287, 367, 288], 11507)
-    femmesh.addVolume([484, 1815, 9, 629], 11508)
-    femmesh.addVolume([1435, 61, 60, 1759], 11509)
-    femmesh.addVolume([124, 1627, 125, 1760], 11510)
-    femmesh.addVolume([1803, 190, 189, 1437], 11511)
-    femmesh.addVolume([253, 1629, 1804, 254], 11512)
-    femmesh.addVolume([1766, 331, 330, 1950], 11513)
-    femmesh.addVolume([1809, 539, 540, 1877], 11514)
-    femmesh.addVolume([306, 1875, 305, 1765], 11515)
-    femmesh.addVolume([565, 1810, 564, 1952], 11516)
-    femmesh.addVolume([2039, 682, 2259, 1723], 11517)
-    femmesh.addVolume([682, 2039, 2259, 1767], 11518)
-    femmesh.addVolume([682, 2039, 680, 1723], 11519)
-    femmesh.addVolume([2039, 682, 680, 1767], 11520)
-    femmesh.addVolume([2258, 681, 2038, 1724], 11521)
-    femmesh.addVolume([2258, 2038, 681, 1768], 11522)
-    femmesh.addVolume([679, 2038, 681, 1724], 11523)
-    femmesh.addVolume([679, 681, 2038, 1768], 11524)
-    femmesh.addVolume([3187, 1769, 2028, 2002], 11525)
-    femmesh.addVolume([3187, 2028, 1769, 3189], 11526)
-    femmesh.addVolume([2259, 2039, 1787, 1767], 11527)
-    femmesh.addVolume([2259, 1787, 2039, 2239], 11528)
-    femmesh.addVolume([1724, 444, 2227, 2261], 11529)
-    femmesh.addVolume([444, 1724, 2227, 1744], 11530)
-    femmesh.addVolume([1743, 2039, 2239, 1723], 11531)
-    femmesh.addVolume([2039, 1743, 2040, 1723], 11532)
-    femmesh.addVolume([1743, 2039, 2040, 2005], 11533)
-    femmesh.addVolume([2010, 2033, 2229, 1753], 11534)
-    femmesh.addVolume([2033, 2010, 2229, 1797], 11535)
-    femmesh.addVolume([2009, 2036, 2253, 1738], 11536)
-    femmesh.addVolume([2036, 2009, 2253, 1781], 11537)
-    femmesh.addVolume([1758, 1786, 1802, 2238], 11538)
-    femmesh.addVolume([1786, 1758, 1802, 2025], 11539)
-    femmesh.addVolume([1786, 1758, 1741, 2238], 11540)
-    femmesh.addVolume([1758, 1786, 1741, 2025], 11541)
-    femmesh.addVolume([1780, 1741, 1786, 2008], 11542)
-    femmesh.addVolume([1741, 1780, 1737, 2008], 11543)
-    femmesh.addVolume([1749, 1775, 1785, 2006], 11544)
-    femmesh.addVolume([1775, 1749, 1785, 2230], 11545)
-    femmesh.addVolume([2031, 2240, 2022, 1742], 11546)
-    femmesh.addVolume([2031, 2022, 2240, 1795], 11547)
-    femmesh.addVolume([2257, 2022, 2240, 1742], 11548)
-    femmesh.addVolume([2257, 2240, 2022, 1795], 11549)
-    femmesh.addVolume([1744, 2038, 1788, 2001], 11550)
-    femmesh.addVolume([2038, 1744, 1788, 2227], 11551)
-    femmesh.addVolume([1744, 2038, 1724, 2227], 11552)
-    femmesh.addVolume([1787, 2039, 1743, 2005], 11553)
-    femmesh.addVolume([2039, 1787, 1743, 2239], 11554)
-    femmesh.addVolume([2239, 481, 1723, 2260], 11555)
-    femmesh.addVolume([2239, 1723, 481, 1743], 11556)
-    femmesh.addVolume([2031, 1814, 2240, 1728], 11557)
-    femmesh.addVolume([2031, 2240, 1814, 1772], 11558)
-    femmesh.addVolume([1733, 1802, 1776, 2254], 11559)
-    femmesh.addVolume([1802, 1733, 1776, 2014], 11560)
-    femmesh.addVolume([1802, 1733, 1758, 2254], 11561)
-    femmesh.addVolume([1733, 1802, 1758, 2014], 11562)
-    femmesh.addVolume([1737, 2235, 2011, 2026], 11563)
-    femmesh.addVolume([1737, 2011, 2235, 1752], 11564)
-    femmesh.addVolume([1773, 511, 2023, 2037], 11565)
-    femmesh.addVolume([1773, 2023, 511, 1790], 11566)
-    femmesh.addVolume([2235, 1741, 1780, 1737], 11567)
-    femmesh.addVolume([1786, 1741, 2235, 2251], 11568)
-    femmesh.addVolume([1786, 2235, 1741, 1780], 11569)
-    femmesh.addVolume([1951, 1571, 1954, 1952], 11570)
-    femmesh.addVolume([1571, 1951, 1954, 1950], 11571)
-    femmesh.addVolume([1876, 1496, 1879, 1877], 11572)
-    femmesh.addVolume([1876, 1879, 1496, 1875], 11573)
-    femmesh.addVolume([2131, 1337, 2134, 2135], 11574)
-    femmesh.addVolume([1337, 2131, 2134, 6], 11575)
-    femmesh.addVolume([1337, 2131, 1344, 2135], 11576)
-    femmesh.addVolume([2131, 1337, 1344, 6], 11577)
-    femmesh.addVolume([1341, 1340, 2133, 13], 11578)
-    femmesh.addVolume([1341, 2133, 1340, 2135], 11579)
-    femmesh.addVolume([2136, 2133, 1340, 13], 11580)
-    femmesh.addVolume([2136, 1340, 2133, 2135], 11581)
-    femmesh.addVolume([2058, 1650, 2061, 586], 11582)
-    femmesh.addVolume([2058, 2061, 1650, 2060], 11583)
-    femmesh.addVolume([2209, 1414, 2206, 410], 11584)
-    femmesh.addVolume([2209, 2206, 1414, 2210], 11585)
-    femmesh.addVolume([2059, 1648, 2056, 419], 11586)
-    femmesh.addVolume([2059, 2056, 1648, 2060], 11587)
-    femmesh.addVolume([2211, 1416, 2208, 2210], 11588)
-    femmesh.addVolume([2211, 2208, 1416, 673], 11589)
-    femmesh.addVolume([1744, 2041, 348, 1724], 11590)
-    femmesh.addVolume([2041, 1744, 348, 2001], 11591)
-    femmesh.addVolume([2041, 1744, 2038, 1724], 11592)
-    femmesh.addVolume([1744, 2041, 2038, 2001], 11593)
-    femmesh.addVolume([2963, 2649, 2926, 3183], 11594)
-    femmesh.addVolume([2708, 3150, 2682, 3167], 11595)
-    femmesh.addVolume([3178, 2726, 2650, 3147], 11596)
-    femmesh.addVolume([1336, 2648, 3185, 3184], 11597)
-    femmesh.addVolume([2658, 2680, 2703, 3179], 11598)
-    femmesh.addVolume([2703, 2680, 2658, 2959], 11599)
-    femmesh.addVolume([2679, 2726, 2958, 2929], 11600)
-    femmesh.addVolume([2650, 2670, 2695, 3178], 11601)
-    femmesh.addVolume([2695, 3178, 2670, 3146], 11602)
-    femmesh.addVolume([2723, 2708, 2682, 3167], 11603)
-    femmesh.addVolume([2679, 2650, 2726, 3147], 11604)
-    femmesh.addVolume([2958, 2726, 2679, 2650], 11605)
-    femmesh.addVolume([2670, 2695, 2958, 2650], 11606)
-    femmesh.addVolume([2695, 2958, 2942, 2670], 11607)
-    femmesh.addVolume([2695, 2670, 2942, 3146], 11608)
-    femmesh.addVolume([2670, 2703, 2942, 3146], 11609)
-    femmesh.addVolume([2714, 2942, 2703, 3146], 11610)
-    femmesh.addVolume([2942, 2714, 2695, 3146], 11611)
-    femmesh.addVolume([2708, 2651, 3150, 3195], 11612)
-    femmesh.addVolume([2650, 2726, 2695, 2958], 11613)
-    femmesh.addVolume([2695, 2726, 2650, 3178], 11614)
-    femmesh.addVolume([2682, 2708, 2651, 3150], 11615)
-    femmesh.addVolume([2926, 2713, 2963, 3183], 11616)
-    femmesh.addVolume([3179, 2703, 2670, 3146], 11617)
-    femmesh.addVolume([2670, 2703, 3179, 2658], 11618)
-    femmesh.addVolume([2682, 2708, 2723, 2947], 11619)
-    femmesh.addVolume([2703, 3179, 2680, 2724], 11620)
-    femmesh.addVolume([2670, 2703, 2959, 2942], 11621)
-    femmesh.addVolume([2959, 2703, 2670, 2658], 11622)
-    femmesh.addVolume([2703, 2724, 2680, 2959], 11623)
-    femmesh.addVolume([2651, 2947, 2708, 2682], 11624)
-    femmesh.addVolume([2653, 2696, 3154, 3193], 11625)
-    femmesh.addVolume([2696, 2653, 2931, 3193], 11626)
-    femmesh.addVolume([2653, 3154, 2696, 3192], 11627)
-    femmesh.addVolume([2696, 2931, 2653, 3192], 11628)
-    femmesh.addVolume([2673, 2948, 3181, 3192], 11629)
-    femmesh.addVolume([3181, 2948, 2722, 3192], 11630)
-    femmesh.addVolume([2673, 2948, 2662, 3166], 11631)
-    femmesh.addVolume([2937, 2662, 2948, 3166], 11632)
-    femmesh.addVolume([2702, 3166, 2948, 2722], 11633)
-    femmesh.addVolume([2937, 3166, 2948, 2702], 11634)
-    femmesh.addVolume([2948, 3166, 3181, 2722], 11635)
-    femmesh.addVolume([3181, 3166, 2948, 2673], 11636)
-    femmesh.addVolume([2953, 3164, 2683, 3191], 11637)
-    femmesh.addVolume([2954, 3159, 2937, 2717], 11638)
-    femmesh.addVolume([2954, 2678, 2937, 3159], 11639)
-    femmesh.addVolume([2662, 2937, 2678, 3159], 11640)
-    femmesh.addVolume([2693, 2963, 2713, 3183], 11641)
-    femmesh.addVolume([2704, 2659, 2934, 2718], 11642)
-    femmesh.addVolume([2651, 2708, 2932, 3195], 11643)
-    femmesh.addVolume([3163, 2648, 2964, 3184], 11644)
-    femmesh.addVolume([3161, 2953, 2934, 2718], 11645)
-    femmesh.addVolume([3171, 2679, 2710, 3147], 11646)
-    femmesh.addVolume([2657, 2681, 2706, 3174], 11647)
-    femmesh.addVolume([3168, 2721, 2666, 3160], 11648)
-    femmesh.addVolume([2957, 2929, 2710, 2679], 11649)
-    femmesh.addVolume([3174, 3162, 2935, 2657], 11650)
-    femmesh.addVolume([2947, 2708, 2932, 2651], 11651)
-    femmesh.addVolume([2721, 2951, 2938, 2666], 11652)
-    femmesh.addVolume([3160, 2706, 2681, 3174], 11653)
-    femmesh.addVolume([2666, 2721, 3168, 3195], 11654)
-    femmesh.addVolume([2721, 2666, 2938, 3195], 11655)
-    femmesh.addVolume([2681, 2706, 2951, 2657], 11656)
-    femmesh.addVolume([2723, 2947, 2927, 2667], 11657)
-    femmesh.addVolume([2679, 2710, 2726, 2929], 11658)
-    femmesh.addVolume([2726, 2710, 2679, 3147], 11659)
-    femmesh.addVolume([2724, 2959, 2943, 2680], 11660)
-    femmesh.addVolume([2704, 3172, 2659, 2718], 11661)
-    femmesh.addVolume([2706, 3160, 2666, 2721], 11662)
-    femmesh.addVolume([2950, 2659, 2934, 2704], 11663)
-    femmesh.addVolume([2667, 2723, 2947, 2682], 11664)
-    femmesh.addVolume([2681, 2666, 2706, 3160], 11665)
-    femmesh.addVolume([2706, 2721, 2666, 2951], 11666)
-    femmesh.addVolume([3164, 2953, 2698, 3191], 11667)
-    femmesh.addVolume([2706, 2666, 2681, 2951], 11668)
-    femmesh.addVolume([2724, 3179, 2680, 3152], 11669)
-    femmesh.addVolume([2966, 2963, 1333, 2649], 11670)
-    femmesh.addVolume([2935, 3162, 3174, 2711], 11671)
-    femmesh.addVolume([2668, 2953, 2934, 3161], 11672)
-    femmesh.addVolume([3166, 3159, 2937, 2662], 11673)
-    femmesh.addVolume([3183, 2649, 3186, 1335], 11674)
-    femmesh.addVolume([2657, 2706, 2935, 3174], 11675)
-    femmesh.addVolume([2657, 2944, 2676, 3162], 11676)
-    femmesh.addVolume([2934, 2659, 3161, 2718], 11677)
-    femmesh.addVolume([2683, 2953, 2668, 3161], 11678)
-    femmesh.addVolume([2698, 2953, 3161, 2718], 11679)
-    femmesh.addVolume([2657, 2935, 2944, 3162], 11680)
-    femmesh.addVolume([2951, 2706, 2935, 2657], 11681)
-    femmesh.addVolume([2710, 2679, 2652, 2957], 11682)
-    femmesh.addVolume([2667, 2723, 2694, 2927], 11683)
-    femmesh.addVolume([2652, 2679, 2710, 3171], 11684)
-    femmesh.addVolume([2694, 2723, 2667, 3151], 11685)
-    femmesh.addVolume([3161, 2683, 2953, 3164], 11686)
-    femmesh.addVolume([3171, 2694, 2652, 3151], 11687)
-    femmesh.addVolume([2694, 2927, 2957, 2652], 11688)
-    femmesh.addVolume([2659, 3172, 3161, 2718], 11689)
-    femmesh.addVolume([3174, 2706, 2935, 2711], 11690)
-    femmesh.addVolume([3161, 2659, 2934, 2668], 11691)
-    femmesh.addVolume([3162, 2935, 2944, 2711], 11692)
-    femmesh.addVolume([2944, 2725, 3162, 2711], 11693)
-    femmesh.addVolume([2675, 2961, 2945, 2719], 11694)
-    femmesh.addVolume([3164, 2953, 3161, 2698], 11695)
-    femmesh.addVolume([2964, 2965, 1334, 2648], 11696)
-    femmesh.addVolume([2652, 2710, 2694, 3171], 11697)
-    femmesh.addVolume([2652, 2694, 2667, 3151], 11698)
-    femmesh.addVolume([2957, 2710, 2694, 2652], 11699)
-    femmesh.addVolume([2667, 2927, 2694, 2652], 11700)
-    femmesh.addVolume([3165, 2675, 3182, 2719], 11701)
-    femmesh.addVolume([3159, 2954, 2678, 3194], 11702)
-    femmesh.addVolume([2954, 3159, 2717, 3194], 11703)
-    femmesh.addVolume([2966, 2926, 2963, 2649], 11704)
-    femmesh.addVolume([2713, 2926, 2950, 2669], 11705)
-    femmesh.addVolume([3163, 3185, 2648, 3184], 11706)
-    femmesh.addVolume([3172, 2713, 2669, 3148], 11707)
-    femmesh.addVolume([2943, 2930, 2709, 2665], 11708)
-    femmesh.addVolume([2698, 3180, 3164, 3191], 11709)
-    femmesh.addVolume([2960, 2664, 2676, 3177], 11710)
-    femmesh.addVolume([2725, 2960, 3177, 2700], 11711)
-    femmesh.addVolume([2712, 3180, 2698, 3191], 11712)
-    femmesh.addVolume([2651, 2932, 2671, 3195], 11713)
-    femmesh.addVolume([2666, 2654, 2938, 3195], 11714)
-    femmesh.addVolume([3152, 2665, 2709, 3163], 11715)
-    femmesh.addVolume([2962, 2938, 2654, 3195], 11716)
-    femmesh.addVolume([2361, 1334, 2684, 1336], 11717)
-    femmesh.addVolume([2556, 2685, 1333, 1335], 11718)
-    femmesh.addVolume([2361, 2728, 1334, 1336], 11719)
-    femmesh.addVolume([2556, 1333, 2729, 1335], 11720)
-    femmesh.addVolume([2953, 2939, 2698, 3191], 11721)
-    femmesh.addVolume([2651, 3169, 3150, 3195], 11722)
-    femmesh.addVolume([2708, 2715, 2932, 3195], 11723)
-    femmesh.addVolume([2651, 2671, 3169, 3195], 11724)
-    femmesh.addVolume([2932, 2946, 2671, 3195], 11725)
-    femmesh.addVolume([3182, 2697, 2719, 3193], 11726)
-    femmesh.addVolume([2675, 2655, 3182, 3193], 11727)
-    femmesh.addVolume([2660, 2683, 3164, 3191], 11728)
-    femmesh.addVolume([2660, 3164, 3180, 3191], 11729)
-    femmesh.addVolume([2962, 2721, 2938, 3195], 11730)
-    femmesh.addVolume([2721, 2962, 2701, 3195], 11731)
-    femmesh.addVolume([2675, 2945, 2655, 3193], 11732)
-    femmesh.addVolume([2697, 2940, 2719, 3193], 11733)
-    femmesh.addVolume([2653, 3154, 2674, 3193], 11734)
-    femmesh.addVolume([2696, 2716, 3154, 3193], 11735)
-    femmesh.addVolume([3170, 2674, 3154, 3193], 11736)
-    femmesh.addVolume([3170, 3154, 2716, 3193], 11737)
-    femmesh.addVolume([3173, 2653, 2677, 3192], 11738)
-    femmesh.addVolume([2696, 3173, 2720, 3192], 11739)
-    femmesh.addVolume([2949, 2677, 2653, 3192], 11740)
-    femmesh.addVolume([2949, 2696, 2720, 3192], 11741)
-    femmesh.addVolume([2674, 2931, 2653, 3193], 11742)
-    femmesh.addVolume([2696, 2931, 2716, 3193], 11743)
-    femmesh.addVolume([2696, 2949, 2931, 3192], 11744)
-    femmesh.addVolume([2653, 3173, 3154, 3192], 11745)
-    femmesh.addVolume([2696, 3154, 3173, 3192], 11746)
-    femmesh.addVolume([2949, 2653, 2931, 3192], 11747)
-    femmesh.addVolume([2673, 2933, 2948, 3192], 11748)
-    femmesh.addVolume([2948, 2933, 2722, 3192], 11749)
-    femmesh.addVolume([2673, 2663, 2933, 3192], 11750)
-    femmesh.addVolume([2673, 3157, 2663, 3192], 11751)
-    femmesh.addVolume([2933, 2707, 2722, 3192], 11752)
-    femmesh.addVolume([3181, 2722, 2707, 3192], 11753)
-    femmesh.addVolume([3157, 2673, 3181, 3192], 11754)
-    femmesh.addVolume([2697, 3182, 3155, 3193], 11755)
-    femmesh.addVolume([2716, 2931, 2955, 3193], 11756)
-    femmesh.addVolume([2940, 2945, 2719, 3193], 11757)
-    femmesh.addVolume([3181, 2707, 3157, 3192], 11758)
-    femmesh.addVolume([2655, 3155, 3182, 3193], 11759)
-    femmesh.addVolume([2674, 2955, 2931, 3193], 11760)
-    femmesh.addVolume([2666, 3168, 2654, 3195], 11761)
-    femmesh.addVolume([2932, 2715, 2946, 3195], 11762)
-    femmesh.addVolume([2712, 2698, 2939, 3191], 11763)
-    femmesh.addVolume([2654, 3168, 3149, 3195], 11764)
-    femmesh.addVolume([2940, 2655, 2945, 3193], 11765)
-    femmesh.addVolume([2715, 3150, 3169, 3195], 11766)
-    femmesh.addVolume([2708, 3150, 2715, 3195], 11767)
-    femmesh.addVolume([2953, 2683, 2939, 3191], 11768)
-    femmesh.addVolume([1333, 2685, 2649, 1335], 11769)
-    femmesh.addVolume([2729, 1333, 2693, 1335], 11770)
-    femmesh.addVolume([3168, 2721, 2701, 3195], 11771)
-    femmesh.addVolume([3149, 3168, 2701, 3195], 11772)
-    femmesh.addVolume([2660, 2939, 2683, 3191], 11773)
-    femmesh.addVolume([2684, 1334, 2648, 1336], 11774)
-    femmesh.addVolume([1334, 2728, 2692, 1336], 11775)
-    femmesh.addVolume([2661, 2739, 2961, 2705], 11776)
-    femmesh.addVolume([3165, 2739, 2661, 2705], 11777)
-    femmesh.addVolume([3159, 3175, 2717, 3194], 11778)
-    femmesh.addVolume([2678, 2954, 2656, 3194], 11779)
-    femmesh.addVolume([2699, 2954, 2717, 3194], 11780)
-    femmesh.addVolume([2699, 2936, 2954, 3194], 11781)
-    femmesh.addVolume([2656, 2954, 2936, 3194], 11782)
-    femmesh.addVolume([3175, 2699, 2717, 3194], 11783)
-    femmesh.addVolume([2678, 2656, 3175, 3194], 11784)
-    femmesh.addVolume([3159, 2678, 3175, 3194], 11785)
-    femmesh.addVolume([2686, 2739, 2928, 2661], 11786)
-    femmesh.addVolume([2688, 2664, 2737, 3158], 11787)
-    femmesh.addVolume([2732, 2737, 2941, 2700], 11788)
-    femmesh.addVolume([2731, 2928, 2739, 2705], 11789)
-    femmesh.addVolume([3158, 2664, 2737, 3177], 11790)
-    femmesh.addVolume([2961, 2739, 2928, 2705], 11791)
-    femmesh.addVolume([2961, 2928, 2739, 2661], 11792)
-    femmesh.addVolume([2689, 2941, 2737, 2664], 11793)
-    femmesh.addVolume([2960, 2941, 2737, 2700], 11794)
-    femmesh.addVolume([3177, 2737, 3158, 2700], 11795)
-    femmesh.addVolume([2960, 2737, 2941, 2664], 11796)
-    femmesh.addVolume([1334, 2684, 2360, 2361], 11797)
-    femmesh.addVolume([2685, 1333, 2552, 2556], 11798)
-    femmesh.addVolume([1333, 2729, 2554, 2556], 11799)
-    femmesh.addVolume([2728, 1334, 2362, 2361], 11800)
-    femmesh.addVolume([2733, 3158, 2737, 2700], 11801)
-    femmesh.addVolume([2739, 2661, 2687, 3156], 11802)
-    femmesh.addVolume([3165, 2661, 2739, 3156], 11803)
-    femmesh.addVolume([2554, 2553, 1333, 2556], 11804)
-    femmesh.addVolume([2552, 1333, 2553, 2556], 11805)
-    femmesh.addVolume([2360, 2364, 1334, 2361], 11806)
-    femmesh.addVolume([2362, 1334, 2364, 2361], 11807)
-    femmesh.addVolume([2686, 2928, 2961, 2661], 11808)
-    femmesh.addVolume([3158, 2688, 2664, 3177], 11809)
-    femmesh.addVolume([2941, 2960, 2732, 2700], 11810)
-    femmesh.addVolume([2961, 2928, 2731, 2705], 11811)
-    femmesh.addVolume([2687, 2739, 2686, 2661], 11812)
-    femmesh.addVolume([2664, 2737, 2689, 2688], 11813)
-    femmesh.addVolume([2705, 2739, 2731, 2730], 11814)
-    femmesh.addVolume([2733, 2737, 2732, 2700], 11815)
-    femmesh.addVolume([1035, 2670, 2958, 2650], 11816)
-    femmesh.addVolume([3150, 1292, 2715, 3169], 11817)
-    femmesh.addVolume([2715, 1292, 3150, 2708], 11818)
-    femmesh.addVolume([2696, 3173, 3154, 1277], 11819)
-    femmesh.addVolume([2720, 3173, 2696, 1277], 11820)
-    femmesh.addVolume([2931, 2696, 1151, 2949], 11821)
-    femmesh.addVolume([3154, 2653, 1110, 3173], 11822)
-    femmesh.addVolume([1014, 2653, 2949, 2677], 11823)
-    femmesh.addVolume([1110, 2653, 2677, 3173], 11824)
-    femmesh.addVolume([2949, 2696, 1151, 2720], 11825)
-    femmesh.addVolume([3170, 2716, 3154, 1278], 11826)
-    femmesh.addVolume([3154, 1111, 2674, 3170], 11827)
-    femmesh.addVolume([2653, 2949, 2931, 1014], 11828)
-    femmesh.addVolume([2653, 1111, 2674, 3154], 11829)
-    femmesh.addVolume([2716, 1152, 2931, 2696], 11830)
-    femmesh.addVolume([2670, 2958, 2942, 1035], 11831)
-    femmesh.addVolume([2673, 1012, 2933, 2663], 11832)
-    femmesh.addVolume([2716, 2696, 3154, 1278], 11833)
-    femmesh.addVolume([1012, 2933, 2948, 2673], 11834)
-    femmesh.addVolume([2670, 1131, 3178, 2650], 11835)
-    femmesh.addVolume([1149, 2948, 2933, 2722], 11836)
-    femmesh.addVolume([2656, 2936, 2954, 1009], 11837)
-    femmesh.addVolume([3178, 1131, 2670, 3146], 11838)
-    femmesh.addVolume([1146, 2936, 2954, 2699], 11839)
-    femmesh.addVolume([1009, 2954, 2656, 2678], 11840)
-    femmesh.addVolume([1146, 2699, 2954, 2717], 11841)
-    femmesh.addVolume([2948, 2662, 1011, 2673], 11842)
-    femmesh.addVolume([1149, 2722, 2933, 2707], 11843)
-    femmesh.addVolume([2937, 1011, 2948, 2662], 11844)
-    femmesh.addVolume([2954, 1010, 2937, 2678], 11845)
-    femmesh.addVolume([2937, 1147, 2954, 2717], 11846)
-    femmesh.addVolume([1148, 2702, 2948, 2722], 11847)
-    femmesh.addVolume([2678, 1010, 2937, 2662], 11848)
-    femmesh.addVolume([2702, 1147, 2937, 2717], 11849)
-    femmesh.addVolume([2948, 1148, 2937, 2702], 11850)
-    femmesh.addVolume([2673, 1108, 2663, 3157], 11851)
-    femmesh.addVolume([2931, 1152, 2716, 2955], 11852)
-    femmesh.addVolume([2701, 3168, 3149, 1290], 11853)
-    femmesh.addVolume([2653, 1015, 2931, 2674], 11854)
-    femmesh.addVolume([3167, 2708, 3150, 1293], 11855)
-    femmesh.addVolume([1130, 3178, 2650, 3147], 11856)
-    femmesh.addVolume([1132, 3179, 2670, 3146], 11857)
-    femmesh.addVolume([1034, 2958, 2679, 2650], 11858)
-    femmesh.addVolume([2658, 2670, 1132, 3179], 11859)
-    femmesh.addVolume([2958, 2679, 2929, 1034], 11860)
-    femmesh.addVolume([1108, 3157, 2673, 3181], 11861)
-    femmesh.addVolume([2701, 2721, 3168, 1290], 11862)
-    femmesh.addVolume([2931, 1015, 2955, 2674], 11863)
-    femmesh.addVolume([3167, 2723, 2708, 1293], 11864)
-    femmesh.addVolume([2650, 2679, 1130, 3147], 11865)
-    femmesh.addVolume([2959, 2670, 2942, 1036], 11866)
-    femmesh.addVolume([1036, 2959, 2670, 2658], 11867)
-    femmesh.addVolume([2726, 3147, 3178, 1297], 11868)
-    femmesh.addVolume([3150, 1126, 2682, 3167], 11869)
-    femmesh.addVolume([3182, 2697, 3155, 1280], 11870)
-    femmesh.addVolume([1141, 2704, 2934, 2718], 11871)
-    femmesh.addVolume([1275, 3157, 3181, 2707], 11872)
-    femmesh.addVolume([1275, 3181, 2722, 2707], 11873)
-    femmesh.addVolume([2934, 1141, 2950, 2704], 11874)
-    femmesh.addVolume([2929, 2679, 2957, 1033], 11875)
-    femmesh.addVolume([2656, 1105, 2678, 3175], 11876)
-    femmesh.addVolume([1267, 3172, 2704, 2718], 11877)
-    femmesh.addVolume([3150, 2651, 1125, 3169], 11878)
-    femmesh.addVolume([2682, 3167, 1127, 3151], 11879)
-    femmesh.addVolume([3146, 2695, 3178, 1298], 11880)
-    femmesh.addVolume([1006, 2939, 2953, 2683], 11881)
-    femmesh.addVolume([2941, 2689, 2960, 2664], 11882)
-    femmesh.addVolume([2721, 2962, 1164, 2701], 11883)
-    femmesh.addVolume([2938, 1164, 2721, 2962], 11884)
-    femmesh.addVolume([3146, 2714, 2695, 1298], 11885)
-    femmesh.addVolume([3178, 2695, 2726, 1297], 11886)
-    femmesh.addVolume([2651, 1126, 2682, 3150], 11887)
-    femmesh.addVolume([2651, 1030, 2947, 2682], 11888)
-    femmesh.addVolume([1163, 2938, 2721, 2951], 11889)
-    femmesh.addVolume([3160, 2681, 1121, 3174], 11890)
-    femmesh.addVolume([2929, 1171, 2726, 2958], 11891)
-    femmesh.addVolume([1125, 2651, 2671, 3169], 11892)
-    femmesh.addVolume([2714, 3146, 2703, 1299], 11893)
-    femmesh.addVolume([3155, 1113, 2655, 3182], 11894)
-    femmesh.addVolume([2927, 2723, 1168, 2947], 11895)
-    femmesh.addVolume([2683, 1006, 2939, 2660], 11896)
-    femmesh.addVolume([2703, 3146, 3179, 1299], 11897)
-    femmesh.addVolume([2719, 2697, 3182, 1280], 11898)
-    femmesh.addVolume([2942, 2695, 1172, 2958], 11899)
-    femmesh.addVolume([2681, 2951, 1025, 2657], 11900)
-    femmesh.addVolume([2657, 1121, 2681, 3174], 11901)
-    femmesh.addVolume([2695, 2726, 1171, 2958], 11902)
-    femmesh.addVolume([2695, 1172, 2714, 2942], 11903)
-    femmesh.addVolume([2680, 2658, 1133, 3179], 11904)
-    femmesh.addVolume([2673, 1107, 3166, 2662], 11905)
-    femmesh.addVolume([3151, 2723, 3167, 1294], 11906)
-    femmesh.addVolume([3160, 3168, 2721, 1289], 11907)
-    femmesh.addVolume([1272, 3175, 2699, 2717], 11908)
-    femmesh.addVolume([1142, 2934, 2953, 2718], 11909)
-    femmesh.addVolume([3171, 1129, 2679, 3147], 11910)
-    femmesh.addVolume([1173, 2703, 2714, 2942], 11911)
-    femmesh.addVolume([3166, 1107, 2673, 3181], 11912)
-    femmesh.addVolume([2942, 1173, 2703, 2959], 11913)
-    femmesh.addVolume([2675, 2655, 1113, 3182], 11914)
-    femmesh.addVolume([2708, 1167, 2723, 2947], 11915)
-    femmesh.addVolume([3158, 2733, 3177, 2700], 11916)
-    femmesh.addVolume([2947, 1030, 2651, 2932], 11917)
-    femmesh.addVolume([2657, 3162, 1120, 3174], 11918)
-    femmesh.addVolume([1267, 3161, 3172, 2718], 11919)
-    femmesh.addVolume([3159, 2678, 1105, 3175], 11920)
-    femmesh.addVolume([2652, 2957, 2679, 1033], 11921)
-    femmesh.addVolume([2950, 1004, 2934, 2659], 11922)
-    femmesh.addVolume([3179, 2724, 2703, 1300], 11923)
-    femmesh.addVolume([2935, 1025, 2951, 2657], 11924)
-    femmesh.addVolume([2723, 1168, 2694, 2927], 11925)
-    femmesh.addVolume([2721, 2706, 1163, 2951], 11926)
-    femmesh.addVolume([1127, 2667, 2682, 3151], 11927)
-    femmesh.addVolume([1273, 2702, 3166, 2717], 11928)
-    femmesh.addVolume([2676, 1120, 2657, 3162], 11929)
-    femmesh.addVolume([2694, 3151, 3171, 1295], 11930)
-    femmesh.addVolume([2953, 2939, 1143, 2698], 11931)
-    femmesh.addVolume([3171, 2652, 1128, 3151], 11932)
-    femmesh.addVolume([2680, 3179, 1133, 3152], 11933)
-    femmesh.addVolume([2724, 2703, 1174, 2959], 11934)
-    femmesh.addVolume([2723, 3151, 2694, 1294], 11935)
-    femmesh.addVolume([2706, 3160, 2721, 1289], 11936)
-    femmesh.addVolume([1272, 3159, 3175, 2717], 11937)
-    femmesh.addVolume([2932, 1167, 2708, 2947], 11938)
-    femmesh.addVolume([2953, 2698, 1142, 2718], 11939)
-    femmesh.addVolume([1129, 2679, 2652, 3171], 11940)
-    femmesh.addVolume([2938, 1027, 2962, 2654], 11941)
-    femmesh.addVolume([1004, 2668, 2934, 2659], 11942)
-    femmesh.addVolume([3152, 2724, 3179, 1300], 11943)
-    femmesh.addVolume([2945, 2655, 1017, 2675], 11944)
-    femmesh.addVolume([3165, 2687, 2661, 3156], 11945)
-    femmesh.addVolume([2940, 1154, 2697, 2719], 11946)
-    femmesh.addVolume([2702, 1274, 3166, 2722], 11947)
-    femmesh.addVolume([2668, 2934, 2953, 1005], 11948)
-    femmesh.addVolume([3159, 1273, 3166, 2717], 11949)
-    femmesh.addVolume([1174, 2943, 2724, 2959], 11950)
-    femmesh.addVolume([3166, 1274, 3181, 2722], 11951)
-    femmesh.addVolume([2940, 1017, 2945, 2655], 11952)
-    femmesh.addVolume([2683, 2668, 2953, 1005], 11953)
-    femmesh.addVolume([3162, 1287, 3174, 2711], 11954)
-    femmesh.addVolume([1024, 2944, 2676, 2657], 11955)
-    femmesh.addVolume([3149, 2654, 1123, 3168], 11956)
-    femmesh.addVolume([1032, 2957, 2927, 2652], 11957)
-    femmesh.addVolume([2957, 2694, 1169, 2927], 11958)
-    femmesh.addVolume([3171, 2710, 2694, 1295], 11959)
-    femmesh.addVolume([2698, 2939, 1143, 2712], 11960)
-    femmesh.addVolume([2667, 1128, 2652, 3151], 11961)
-    femmesh.addVolume([2654, 2938, 1027, 2666], 11962)
-    femmesh.addVolume([2950, 1140, 2713, 2704], 11963)
-    femmesh.addVolume([1268, 2698, 3161, 2718], 11964)
-    femmesh.addVolume([3180, 2660, 1102, 3164], 11965)
-    femmesh.addVolume([2683, 1102, 2660, 3164], 11966)
-    femmesh.addVolume([1122, 3168, 2666, 3160], 11967)
-    femmesh.addVolume([1170, 2929, 2710, 2957], 11968)
-    femmesh.addVolume([2728, 1336, 2361, 2359], 11969)
-    femmesh.addVolume([2556, 2729, 2557, 1335], 11970)
-    femmesh.addVolume([2685, 2556, 2555, 1335], 11971)
-    femmesh.addVolume([2361, 2684, 2357, 1336], 11972)
-    femmesh.addVolume([1024, 2935, 2944, 2657], 11973)
-    femmesh.addVolume([2713, 1266, 3172, 2704], 11974)
-    femmesh.addVolume([1031, 2927, 2947, 2667], 11975)
-    femmesh.addVolume([2666, 2681, 1122, 3160], 11976)
-    femmesh.addVolume([2726, 2710, 1170, 2929], 11977)
-    femmesh.addVolume([2659, 2669, 1099, 3172], 11978)
-    femmesh.addVolume([2945, 1154, 2940, 2719], 11979)
-    femmesh.addVolume([1287, 3162, 2725, 2711], 11980)
-    femmesh.addVolume([2667, 2947, 1031, 2682], 11981)
-    femmesh.addVolume([2669, 1003, 2950, 2659], 11982)
-    femmesh.addVolume([2678, 1106, 2662, 3159], 11983)
-    femmesh.addVolume([1029, 2651, 2932, 2671], 11984)
-    femmesh.addVolume([1003, 2950, 2926, 2669], 11985)
-    femmesh.addVolume([3164, 2698, 3161, 1268], 11986)
-    femmesh.addVolume([2666, 1123, 2654, 3168], 11987)
-    femmesh.addVolume([2927, 2667, 1032, 2652], 11988)
-    femmesh.addVolume([1169, 2710, 2694, 2957], 11989)
-    femmesh.addVolume([2665, 2943, 1038, 2680], 11990)
-    femmesh.addVolume([3152, 2709, 2724, 1301], 11991)
-    femmesh.addVolume([2668, 1101, 2683, 3161], 11992)
-    femmesh.addVolume([1140, 2950, 2713, 2926], 11993)
-    femmesh.addVolume([2946, 1029, 2932, 2671], 11994)
-    femmesh.addVolume([3161, 1101, 2683, 3164], 11995)
-    femmesh.addVolume([1099, 3172, 2669, 3148], 11996)
-    femmesh.addVolume([3159, 1106, 2662, 3166], 11997)
-    femmesh.addVolume([1269, 3180, 3164, 2698], 11998)
-    femmesh.addVolume([3180, 2698, 1269, 2712], 11999)
-    femmesh.addVolume([3165, 2719, 3182, 1281], 12000)
-    femmesh.addVolume([2725, 3177, 3162, 1286], 12001)
-    femmesh.addVolume([2706, 2935, 1162, 2951], 12002)
-    femmesh.addVolume([2713, 3148, 3172, 1266], 12003)
-    femmesh.addVolume([3162, 2676, 1119, 3177], 12004)
-    femmesh.addVolume([3161, 2659, 1100, 3172], 12005)
-    femmesh.addVolume([1038, 2930, 2943, 2665], 12006)
-    femmesh.addVolume([2709, 2724, 1175, 2943], 12007)
-    femmesh.addVolume([2944, 2676, 2960, 1023], 12008)
-    femmesh.addVolume([1162, 2935, 2706, 2711], 12009)
-    femmesh.addVolume([1100, 2668, 2659, 3161], 12010)
-    femmesh.addVolume([3163, 2709, 3152, 1301], 12011)
-    femmesh.addVolume([1155, 2945, 2961, 2719], 12012)
-    femmesh.addVolume([2944, 1160, 2960, 2725], 12013)
-    femmesh.addVolume([1018, 2961, 2945, 2675], 12014)
-    femmesh.addVolume([1175, 2930, 2709, 2943], 12015)
-    femmesh.addVolume([3182, 1114, 2675, 3165], 12016)
-    femmesh.addVolume([1281, 3165, 2719, 2705], 12017)
-    femmesh.addVolume([2665, 2680, 1134, 3152], 12018)
-    femmesh.addVolume([2676, 2664, 2960, 1023], 12019)
-    femmesh.addVolume([2500, 2497, 2735, 2877], 12020)
-    femmesh.addVolume([2691, 2495, 2498, 2875], 12021)
-    femmesh.addVolume([2419, 2416, 2734, 2802], 12022)
-    femmesh.addVolume([2800, 2417, 2414, 2690], 12023)
-    femmesh.addVolume([1155, 2719, 2961, 2705], 12024)
-    femmesh.addVolume([2734, 2422, 2419, 2802], 12025)
-    femmesh.addVolume([2417, 2800, 2420, 2690], 12026)
-    femmesh.addVolume([2691, 2492, 2495, 2875], 12027)
-    femmesh.addVolume([2877, 2497, 2735, 2494], 12028)
-    femmesh.addVolume([1119, 2676, 2664, 3177], 12029)
-    femmesh.addVolume([2700, 3177, 2725, 1286], 12030)
-    femmesh.addVolume([2661, 2961, 1018, 2675], 12031)
-    femmesh.addVolume([2725, 1160, 2960, 2700], 12032)
-    femmesh.addVolume([2727, 3153, 1270, 3191], 12033)
-    femmesh.addVolume([2497, 2735, 889, 2500], 12034)
-    femmesh.addVolume([760, 2498, 2691, 2495], 12035)
-    femmesh.addVolume([2416, 2734, 862, 2419], 12036)
-    femmesh.addVolume([2417, 733, 2414, 2690], 12037)
-    femmesh.addVolume([3152, 1134, 2665, 3163], 12038)
-    femmesh.addVolume([3180, 1270, 3153, 3191], 12039)
-    femmesh.addVolume([2661, 2675, 1114, 3165], 12040)
-    femmesh.addVolume([734, 2417, 2420, 2690], 12041)
-    femmesh.addVolume([2419, 2734, 863, 2422], 12042)
-    femmesh.addVolume([2735, 2497, 888, 2494], 12043)
-    femmesh.addVolume([2495, 2691, 759, 2492], 12044)
-    femmesh.addVolume([2737, 2741, 3158, 2733], 12045)
-    femmesh.addVolume([2742, 2941, 2737, 2689], 12046)
-    femmesh.addVolume([3180, 2712, 1270, 3191], 12047)
-    femmesh.addVolume([2737, 2732, 2941, 2745], 12048)
-    femmesh.addVolume([3158, 2737, 2688, 2736], 12049)
-    femmesh.addVolume([2739, 2928, 2744, 2686], 12050)
-    femmesh.addVolume([2738, 2739, 2687, 3156], 12051)
-    femmesh.addVolume([2727, 1270, 2712, 3191], 12052)
-    femmesh.addVolume([2739, 2731, 2746, 2928], 12053)
-    femmesh.addVolume([2740, 2739, 3156, 2730], 12054)
-    femmesh.addVolume([2648, 3185, 21, 1336], 12055)
-    femmesh.addVolume([2553, 2549, 1333, 2552], 12056)
-    femmesh.addVolume([2363, 2364, 1334, 2360], 12057)
-    femmesh.addVolume([2553, 2554, 1333, 2551], 12058)
-    femmesh.addVolume([2365, 2364, 2362, 1334], 12059)
-    femmesh.addVolume([3165, 1282, 3156, 2730], 12060)
-    femmesh.addVolume([2733, 3158, 3177, 1285], 12061)
-    femmesh.addVolume([2664, 2688, 1118, 3177], 12062)
-    femmesh.addVolume([2960, 1159, 2732, 2700], 12063)
-    femmesh.addVolume([1156, 2961, 2731, 2705], 12064)
-    femmesh.addVolume([2705, 1282, 3165, 2730], 12065)
-    femmesh.addVolume([2941, 1159, 2732, 2960], 12066)
-    femmesh.addVolume([3158, 1118, 2688, 3177], 12067)
-    femmesh.addVolume([2686, 2961, 1019, 2661], 12068)
-    femmesh.addVolume([2700, 2733, 3177, 1285], 12069)
-    femmesh.addVolume([2689, 2941, 2960, 1022], 12070)
-    femmesh.addVolume([2960, 2664, 2689, 1022], 12071)
-    femmesh.addVolume([1019, 2928, 2961, 2686], 12072)
-    femmesh.addVolume([1156, 2928, 2731, 2961], 12073)
-    femmesh.addVolume([2962, 2654, 1028, 3195], 12074)
-    femmesh.addVolume([1028, 2671, 2946, 3195], 12075)
-    femmesh.addVolume([2727, 3153, 3191, 3194], 12076)
-    femmesh.addVolume([1115, 2687, 2661, 3165], 12077)
-    femmesh.addVolume([3186, 2649, 22, 1335], 12078)
-    femmesh.addVolume([2557, 2729, 26, 1335], 12079)
-    femmesh.addVolume([1336, 2728, 28, 2359], 12080)
-    femmesh.addVolume([2555, 22, 2685, 1335], 12081)
-    femmesh.addVolume([21, 2357, 2684, 1336], 12082)
-    femmesh.addVolume([1039, 2965, 2930, 2665], 12083)
-    femmesh.addVolume([2687, 3165, 1115, 3156], 12084)
-    femmesh.addVolume([1028, 2654, 2671, 3195], 12085)
-    femmesh.addVolume([1028, 2946, 2962, 3195], 12086)
-    femmesh.addVolume([2649, 1333, 2966, 2685], 12087)
-    femmesh.addVolume([2421, 2418, 2802, 2801], 12088)
-    femmesh.addVolume([2418, 2801, 2421, 2800], 12089)
-    femmesh.addVolume([2879, 2499, 2496, 2875], 12090)
-    femmesh.addVolume([2496, 2877, 2499, 2879], 12091)
-    femmesh.addVolume([3134, 2339, 2342, 3135], 12092)
-    femmesh.addVolume([2341, 3136, 2344, 3135], 12093)
-    femmesh.addVolume([2575, 2983, 2985, 2572], 12094)
-    femmesh.addVolume([2981, 2570, 2573, 2985], 12095)
-    femmesh.addVolume([2262, 2269, 811, 3060], 12096)
-    femmesh.addVolume([2266, 2265, 811, 3060], 12097)
-    femmesh.addVolume([1334, 2648, 2965, 2684], 12098)
-    femmesh.addVolume([2571, 2985, 2982, 2983], 12099)
-    femmesh.addVolume([2981, 2985, 2982, 2571], 12100)
-    femmesh.addVolume([3135, 3134, 3138, 2346], 12101)
-    femmesh.addVolume([3135, 3138, 3136, 2346], 12102)
-    femmesh.addVolume([2574, 2573, 2570, 2985], 12103)
-    femmesh.addVolume([2574, 2575, 2985, 2572], 12104)
-    femmesh.addVolume([3135, 2339, 2342, 2343], 12105)
-    femmesh.addVolume([3135, 2344, 2341, 2343], 12106)
-    femmesh.addVolume([2495, 2496, 2499, 2875], 12107)
-    femmesh.addVolume([2418, 2800, 2421, 2417], 12108)
-    femmesh.addVolume([2418, 2802, 2419, 2421], 12109)
-    femmesh.addVolume([2877, 2499, 2497, 2496], 12110)
-    femmesh.addVolume([2500, 2879, 2877, 2880], 12111)
-    femmesh.addVolume([2875, 2879, 2498, 2878], 12112)
-    femmesh.addVolume([2416, 2799, 2802, 2801], 12113)
-    femmesh.addVolume([2800, 2801, 2797, 2414], 12114)
-    femmesh.addVolume([2965, 1039, 2648, 2665], 12115)
-    femmesh.addVolume([3061, 3063, 2264, 3060], 12116)
-    femmesh.addVolume([3059, 2264, 3063, 3060], 12117)
-    femmesh.addVolume([3057, 2267, 3056, 3060], 12118)
-    femmesh.addVolume([2267, 3057, 3058, 3060], 12119)
-    femmesh.addVolume([2732, 1136, 2737, 2733], 12120)
-    femmesh.addVolume([2804, 2800, 2803, 2420], 12121)
-    femmesh.addVolume([2422, 2802, 2805, 2804], 12122)
-    femmesh.addVolume([2872, 2876, 2492, 2875], 12123)
-    femmesh.addVolume([2877, 2494, 2874, 2876], 12124)
-    femmesh.addVolume([2983, 2571, 2985, 2572], 12125)
-    femmesh.addVolume([2985, 2981, 2570, 2571], 12126)
-    femmesh.addVolume([3134, 3135, 2342, 2346], 12127)
-    femmesh.addVolume([3135, 3136, 2344, 2346], 12128)
-    femmesh.addVolume([3131, 3132, 2340, 3135], 12129)
-    femmesh.addVolume([3133, 2340, 3132, 3135], 12130)
-    femmesh.addVolume([2985, 2984, 2988, 2577], 12131)
-    femmesh.addVolume([2985, 2577, 2988, 2986], 12132)
-    femmesh.addVolume([3056, 2267, 2269, 3060], 12133)
-    femmesh.addVolume([2267, 3058, 2266, 3060], 12134)
-    femmesh.addVolume([3061, 2264, 2265, 3060], 12135)
-    femmesh.addVolume([2264, 3059, 2262, 3060], 12136)
-    femmesh.addVolume([2500, 2499, 2877, 2879], 12137)
-    femmesh.addVolume([2879, 2498, 2499, 2875], 12138)
-    femmesh.addVolume([2802, 2418, 2416, 2801], 12139)
-    femmesh.addVolume([2800, 2418, 2801, 2414], 12140)
-    femmesh.addVolume([2688, 2737, 2689, 942], 12141)
-    femmesh.addVolume([940, 2739, 2686, 2687], 12142)
-    femmesh.addVolume([1336, 28, 2692, 3184], 12143)
-    femmesh.addVolume([2804, 2422, 2802, 2421], 12144)
-    femmesh.addVolume([2800, 2804, 2421, 2420], 12145)
-    femmesh.addVolume([2496, 2492, 2876, 2875], 12146)
-    femmesh.addVolume([2876, 2877, 2494, 2496], 12147)
-    femmesh.addVolume([2341, 2340, 3133, 3135], 12148)
-    femmesh.addVolume([3131, 2340, 2339, 3135], 12149)
-    femmesh.addVolume([2985, 2573, 2984, 2577], 12150)
-    femmesh.addVolume([2986, 2985, 2577, 2575], 12151)
-    femmesh.addVolume([2985, 2570, 2574, 2571], 12152)
-    femmesh.addVolume([2985, 2571, 2574, 2572], 12153)
-    femmesh.addVolume([2342, 2346, 3135, 2343], 12154)
-    femmesh.addVolume([2346, 2344, 3135, 2343], 12155)
-    femmesh.addVolume([2730, 2739, 2731, 1138], 12156)
-    femmesh.addVolume([2497, 2877, 2500, 2499], 12157)
-    femmesh.addVolume([2495, 2499, 2498, 2875], 12158)
-    femmesh.addVolume([2416, 2802, 2419, 2418], 12159)
-    femmesh.addVolume([2414, 2800, 2418, 2417], 12160)
-    femmesh.addVolume([2267, 811, 2269, 3060], 12161)
-    femmesh.addVolume([2266, 811, 2267, 3060], 12162)
-    femmesh.addVolume([811, 2265, 2264, 3060], 12163)
-    femmesh.addVolume([811, 2264, 2262, 3060], 12164)
-    femmesh.addVolume([2729, 2693, 26, 1335], 12165)
-    femmesh.addVolume([2685, 22, 2649, 1335], 12166)
-    femmesh.addVolume([2692, 2728, 28, 1336], 12167)
-    femmesh.addVolume([21, 2684, 2648, 1336], 12168)
-    femmesh.addVolume([2419, 2802, 2422, 2421], 12169)
-    femmesh.addVolume([2420, 2421, 2800, 2417], 12170)
-    femmesh.addVolume([2492, 2496, 2495, 2875], 12171)
-    femmesh.addVolume([2497, 2494, 2877, 2496], 12172)
-    femmesh.addVolume([2340, 3135, 2341, 2343], 12173)
-    femmesh.addVolume([3135, 2340, 2339, 2343], 12174)
-    femmesh.addVolume([2985, 2574, 2573, 2577], 12175)
-    femmesh.addVolume([2574, 2577, 2985, 2575], 12176)
-    femmesh.addVolume([2981, 2978, 2567, 2982], 12177)
-    femmesh.addVolume([2982, 2980, 2569, 2983], 12178)
-    femmesh.addVolume([3139, 3138, 2347, 3136], 12179)
-    femmesh.addVolume([3134, 2345, 3137, 3138], 12180)
-    femmesh.addVolume([3153, 2672, 3191, 3194], 12181)
-    femmesh.addVolume([2878, 2882, 2879, 2502], 12182)
-    femmesh.addVolume([2880, 2879, 2882, 2502], 12183)
-    femmesh.addVolume([2798, 2799, 2415, 2801], 12184)
-    femmesh.addVolume([2801, 2415, 2798, 2797], 12185)
-    femmesh.addVolume([2952, 2727, 3191, 3194], 12186)
-    femmesh.addVolume([2263, 3062, 3059, 3063], 12187)
-    femmesh.addVolume([2645, 3056, 3053, 3057], 12188)
-    femmesh.addVolume([3064, 3063, 2268, 3061], 12189)
-    femmesh.addVolume([3055, 3058, 2647, 3057], 12190)
-    femmesh.addVolume([2807, 2805, 2804, 2424], 12191)
-    femmesh.addVolume([2424, 2804, 2807, 2803], 12192)
-    femmesh.addVolume([2873, 2876, 2874, 2493], 12193)
-    femmesh.addVolume([2872, 2876, 2873, 2493], 12194)
-    femmesh.addVolume([3131, 2336, 3132, 3128], 12195)
-    femmesh.addVolume([3132, 3133, 3130, 2338], 12196)
-    femmesh.addVolume([2576, 2987, 2984, 2988], 12197)
-    femmesh.addVolume([2986, 2988, 2989, 2578], 12198)
-    femmesh.addVolume([2982, 2567, 2981, 2571], 12199)
-    femmesh.addVolume([2571, 2982, 2569, 2983], 12200)
-    femmesh.addVolume([3136, 3138, 2347, 2346], 12201)
-    femmesh.addVolume([3138, 3134, 2345, 2346], 12202)
-    femmesh.addVolume([2878, 2879, 2498, 2502], 12203)
-    femmesh.addVolume([2880, 2500, 2879, 2502], 12204)
-    femmesh.addVolume([2415, 2799, 2416, 2801], 12205)
-    femmesh.addVolume([2415, 2797, 2801, 2414], 12206)
-    femmesh.addVolume([2672, 1103, 3153, 3191], 12207)
-    femmesh.addVolume([3063, 3059, 2263, 2264], 12208)
-    femmesh.addVolume([2267, 2647, 3058, 3057], 12209)
-    femmesh.addVolume([2268, 3063, 2264, 3061], 12210)
-    femmesh.addVolume([2267, 3056, 2645, 3057], 12211)
-    femmesh.addVolume([2422, 2804, 2805, 2424], 12212)
-    femmesh.addVolume([2803, 2424, 2804, 2420], 12213)
-    femmesh.addVolume([2876, 2872, 2492, 2493], 12214)
-    femmesh.addVolume([2874, 2876, 2494, 2493], 12215)
-    femmesh.addVolume([2981, 2567, 2570, 2571], 12216)
-    femmesh.addVolume([2983, 2569, 2571, 2572], 12217)
-    femmesh.addVolume([2347, 2344, 3136, 2346], 12218)
-    femmesh.addVolume([2342, 2345, 3134, 2346], 12219)
-    femmesh.addVolume([2340, 2336, 3132, 3131], 12220)
-    femmesh.addVolume([3133, 3132, 2340, 2338], 12221)
-    femmesh.addVolume([2576, 2988, 2984, 2577], 12222)
-    femmesh.addVolume([2988, 2986, 2577, 2578], 12223)
-    femmesh.addVolume([3058, 2267, 2266, 2647], 12224)
-    femmesh.addVolume([3056, 2645, 2269, 2267], 12225)
-    femmesh.addVolume([2263, 3059, 2262, 2264], 12226)
-    femmesh.addVolume([2264, 2265, 2268, 3061], 12227)
-    femmesh.addVolume([2879, 2500, 2499, 2502], 12228)
-    femmesh.addVolume([2499, 2498, 2879, 2502], 12229)
-    femmesh.addVolume([2415, 2416, 2418, 2801], 12230)
-    femmesh.addVolume([2801, 2418, 2415, 2414], 12231)
-    femmesh.addVolume([1104, 2672, 3153, 3194], 12232)
-    femmesh.addVolume([3180, 3153, 1103, 3191], 12233)
-    femmesh.addVolume([2672, 1008, 2952, 3194], 12234)
-    femmesh.addVolume([2804, 2424, 2421, 2420], 12235)
-    femmesh.addVolume([2422, 2421, 2804, 2424], 12236)
-    femmesh.addVolume([2496, 2494, 2876, 2493], 12237)
-    femmesh.addVolume([2876, 2492, 2496, 2493], 12238)
-    femmesh.addVolume([1145, 2727, 2952, 3194], 12239)
-    femmesh.addVolume([3180, 1103, 2660, 3191], 12240)
-    femmesh.addVolume([2336, 2340, 2339, 3131], 12241)
-    femmesh.addVolume([2340, 2341, 3133, 2338], 12242)
-    femmesh.addVolume([2984, 2573, 2576, 2577], 12243)
-    femmesh.addVolume([2575, 2577, 2986, 2578], 12244)
-    femmesh.addVolume([1136, 2741, 2737, 2733], 12245)
-    femmesh.addVolume([3184, 2709, 3163, 1302], 12246)
-    femmesh.addVolume([2979, 2568, 2982, 2980], 12247)
-    femmesh.addVolume([2978, 2982, 2979, 2568], 12248)
-    femmesh.addVolume([3141, 3137, 2349, 3138], 12249)
-    femmesh.addVolume([3138, 2349, 3141, 3139], 12250)
-    femmesh.addVolume([2952, 2727, 1144, 3191], 12251)
-    femmesh.addVolume([1271, 3153, 2727, 3194], 12252)
-    femmesh.addVolume([2501, 2878, 2882, 2881], 12253)
-    femmesh.addVolume([2503, 2882, 2880, 2883], 12254)
-    femmesh.addVolume([2798, 2411, 2794, 2797], 12255)
-    femmesh.addVolume([2796, 2799, 2413, 2798], 12256)
-    femmesh.addVolume([2689, 2737, 2742, 942], 12257)
-    femmesh.addVolume([2687, 940, 2739, 2738], 12258)
-    femmesh.addVolume([2712, 2939, 1144, 3191], 12259)
-    femmesh.addVolume([2646, 3053, 3054, 3057], 12260)
-    femmesh.addVolume([3054, 3055, 2646, 3057], 12261)
-    femmesh.addVolume([3063, 2271, 3066, 3064], 12262)
-    femmesh.addVolume([3066, 3063, 3062, 2271], 12263)
-    femmesh.addVolume([2807, 2803, 2806, 2423], 12264)
-    femmesh.addVolume([2808, 2425, 2805, 2807], 12265)
-    femmesh.addVolume([2873, 2872, 2489, 2869], 12266)
-    femmesh.addVolume([2873, 2491, 2874, 2871], 12267)
-    femmesh.addVolume([1165, 2701, 2962, 3195], 12268)
-    femmesh.addVolume([3129, 3132, 3130, 2337], 12269)
-    femmesh.addVolume([3129, 3128, 3132, 2337], 12270)
-    femmesh.addVolume([2988, 2580, 2991, 2989], 12271)
-    femmesh.addVolume([2987, 2991, 2988, 2580], 12272)
-    femmesh.addVolume([2569, 2982, 2568, 2980], 12273)
-    femmesh.addVolume([2982, 2978, 2567, 2568], 12274)
-    femmesh.addVolume([2347, 2349, 3138, 3139], 12275)
-    femmesh.addVolume([2349, 3137, 2345, 3138], 12276)
-    femmesh.addVolume([2671, 1124, 3169, 3195], 12277)
-    femmesh.addVolume([2501, 2882, 2878, 2502], 12278)
-    femmesh.addVolume([2882, 2503, 2880, 2502], 12279)
-    femmesh.addVolume([2415, 2411, 2798, 2797], 12280)
-    femmesh.addVolume([2415, 2413, 2799, 2798], 12281)
-    femmesh.addVolume([2360, 1334, 2363, 2684], 12282)
-    femmesh.addVolume([1333, 2552, 2549, 2685], 12283)
-    femmesh.addVolume([2362, 2728, 2365, 1334], 12284)
-    femmesh.addVolume([1333, 2551, 2554, 2729], 12285)
-    femmesh.addVolume([3053, 2646, 2645, 3057], 12286)
-    femmesh.addVolume([3055, 2647, 2646, 3057], 12287)
-    femmesh.addVolume([3062, 3063, 2263, 2271], 12288)
-    femmesh.addVolume([2268, 2271, 3063, 3064], 12289)
-    femmesh.addVolume([2807, 2425, 2805, 2424], 12290)
-    femmesh.addVolume([2803, 2807, 2424, 2423], 12291)
-    femmesh.addVolume([2872, 2873, 2489, 2493], 12292)
-    femmesh.addVolume([2491, 2873, 2874, 2493], 12293)
-    femmesh.addVolume([2982, 2569, 2568, 2571], 12294)
-    femmesh.addVolume([2568, 2567, 2982, 2571], 12295)
-    femmesh.addVolume([2349, 2347, 3138, 2346], 12296)
-    femmesh.addVolume([3138, 2345, 2349, 2346], 12297)
-    femmesh.addVolume([2709, 3184, 2692, 1302], 12298)
-    femmesh.addVolume([3132, 3128, 2336, 2337], 12299)
-    femmesh.addVolume([3132, 2338, 3130, 2337], 12300)
-    femmesh.addVolume([2988, 2576, 2987, 2580], 12301)
-    femmesh.addVolume([2989, 2988, 2580, 2578], 12302)
-    femmesh.addVolume([2498, 2501, 2878, 2502], 12303)
-    femmesh.addVolume([2503, 2500, 2880, 2502], 12304)
-    femmesh.addVolume([2416, 2413, 2799, 2415], 12305)
-    femmesh.addVolume([2797, 2415, 2411, 2414], 12306)
-    femmesh.addVolume([2677, 1109, 3173, 3192], 12307)
-    femmesh.addVolume([3173, 1276, 2720, 3192], 12308)
-    femmesh.addVolume([1109, 2663, 3157, 3192], 12309)
-    femmesh.addVolume([2949, 1013, 2677, 3192], 12310)
-    femmesh.addVolume([2949, 2720, 1150, 3192], 12311)
-    femmesh.addVolume([1112, 2674, 3170, 3193], 12312)
-    femmesh.addVolume([3170, 2716, 1279, 3193], 12313)
-    femmesh.addVolume([2933, 2663, 1013, 3192], 12314)
-    femmesh.addVolume([3157, 2707, 1276, 3192], 12315)
-    femmesh.addVolume([1112, 3155, 2655, 3193], 12316)
-    femmesh.addVolume([2697, 3155, 1279, 3193], 12317)
-    femmesh.addVolume([2707, 2933, 1150, 3192], 12318)
-    femmesh.addVolume([2646, 2647, 2267, 3057], 12319)
-    femmesh.addVolume([2267, 2645, 2646, 3057], 12320)
-    femmesh.addVolume([2264, 2263, 3063, 2271], 12321)
-    femmesh.addVolume([2271, 3063, 2264, 2268], 12322)
-    femmesh.addVolume([2952, 3191, 2672, 3194], 12323)
-    femmesh.addVolume([2731, 2739, 2746, 1138], 12324)
-    femmesh.addVolume([2712, 1144, 2727, 3191], 12325)
-    femmesh.addVolume([2805, 2425, 2422, 2424], 12326)
-    femmesh.addVolume([2424, 2420, 2803, 2423], 12327)
-    femmesh.addVolume([2492, 2872, 2489, 2493], 12328)
-    femmesh.addVolume([2874, 2494, 2491, 2493], 12329)
-    femmesh.addVolume([2340, 2338, 3132, 2337], 12330)
-    femmesh.addVolume([3132, 2336, 2340, 2337], 12331)
-    femmesh.addVolume([2577, 2576, 2988, 2580], 12332)
-    femmesh.addVolume([2580, 2988, 2577, 2578], 12333)
-    femmesh.addVolume([2963, 24, 1333, 2693], 12334)
-    femmesh.addVolume([2955, 1153, 2716, 3193], 12335)
-    femmesh.addVolume([2977, 2566, 2979, 2980], 12336)
-    femmesh.addVolume([2564, 2978, 2975, 2979], 12337)
-    femmesh.addVolume([3141, 2350, 3142, 3139], 12338)
-    femmesh.addVolume([3140, 3137, 2348, 3141], 12339)
-    femmesh.addVolume([3183, 26, 2693, 1335], 12340)
-    femmesh.addVolume([2505, 2882, 2885, 2881], 12341)
-    femmesh.addVolume([2882, 2505, 2885, 2883], 12342)
-    femmesh.addVolume([2798, 2412, 2795, 2794], 12343)
-    femmesh.addVolume([2796, 2795, 2798, 2412], 12344)
-    femmesh.addVolume([3066, 3064, 2272, 3067], 12345)
-    femmesh.addVolume([3053, 3050, 2642, 3054], 12346)
-    femmesh.addVolume([2644, 3054, 3052, 3055], 12347)
-    femmesh.addVolume([2270, 3065, 3062, 3066], 12348)
-    femmesh.addVolume([2946, 2715, 1165, 3195], 12349)
-    femmesh.addVolume([2807, 2810, 2427, 2806], 12350)
-    femmesh.addVolume([2427, 2808, 2810, 2807], 12351)
-    femmesh.addVolume([2873, 2871, 2870, 2490], 12352)
-    femmesh.addVolume([2873, 2490, 2870, 2869], 12353)
-    femmesh.addVolume([3128, 3125, 2333, 3129], 12354)
-    femmesh.addVolume([3127, 3130, 2335, 3129], 12355)
-    femmesh.addVolume([2989, 2991, 2992, 2581], 12356)
-    femmesh.addVolume([2987, 2579, 2990, 2991], 12357)
-    femmesh.addVolume([2940, 1016, 2655, 3193], 12358)
-    femmesh.addVolume([1219, 2500, 2735, 2877], 12359)
-    femmesh.addVolume([2734, 2416, 1193, 2802], 12360)
-    femmesh.addVolume([2691, 2498, 985, 2875], 12361)
-    femmesh.addVolume([959, 2800, 2414, 2690], 12362)
-    femmesh.addVolume([1265, 2693, 2713, 3183], 12363)
-    femmesh.addVolume([1124, 2654, 3149, 3195], 12364)
-    femmesh.addVolume([2422, 2734, 1194, 2802], 12365)
-    femmesh.addVolume([2690, 2800, 2420, 960], 12366)
-    femmesh.addVolume([2492, 2691, 984, 2875], 12367)
-    femmesh.addVolume([2877, 2735, 1218, 2494], 12368)
-    femmesh.addVolume([2566, 2568, 2979, 2980], 12369)
-    femmesh.addVolume([2978, 2979, 2564, 2568], 12370)
-    femmesh.addVolume([2349, 2350, 3141, 3139], 12371)
-    femmesh.addVolume([2349, 2348, 3137, 3141], 12372)
-    femmesh.addVolume([1016, 2955, 2674, 3193], 12373)
-    femmesh.addVolume([2503, 2505, 2882, 2883], 12374)
-    femmesh.addVolume([2501, 2882, 2505, 2881], 12375)
-    femmesh.addVolume([2794, 2798, 2412, 2411], 12376)
-    femmesh.addVolume([2798, 2413, 2796, 2412], 12377)
-    femmesh.addVolume([1265, 2713, 3148, 3183], 12378)
-    femmesh.addVolume([1008, 2656, 2936, 3194], 12379)
-    femmesh.addVolume([1139, 2713, 2963, 2926], 12380)
-    femmesh.addVolume([2272, 3066, 2271, 3064], 12381)
-    femmesh.addVolume([3054, 2642, 3053, 2646], 12382)
-    femmesh.addVolume([2644, 2646, 3054, 3055], 12383)
-    femmesh.addVolume([3066, 3062, 2270, 2271], 12384)
-    femmesh.addVolume([2564, 2567, 2978, 2568], 12385)
-    femmesh.addVolume([2568, 2566, 2569, 2980], 12386)
-    femmesh.addVolume([2347, 2350, 2349, 3139], 12387)
-    femmesh.addVolume([2348, 3137, 2345, 2349], 12388)
-    femmesh.addVolume([2699, 1145, 2936, 3194], 12389)
-    femmesh.addVolume([2699, 3175, 1271, 3194], 12390)
-    femmesh.addVolume([2806, 2427, 2807, 2423], 12391)
-    femmesh.addVolume([2427, 2425, 2808, 2807], 12392)
-    femmesh.addVolume([2871, 2873, 2491, 2490], 12393)
-    femmesh.addVolume([2490, 2873, 2489, 2869], 12394)
-    femmesh.addVolume([2882, 2501, 2505, 2502], 12395)
-    femmesh.addVolume([2505, 2503, 2882, 2502], 12396)
-    femmesh.addVolume([2798, 2415, 2413, 2412], 12397)
-    femmesh.addVolume([2415, 2412, 2798, 2411], 12398)
-    femmesh.addVolume([2739, 2730, 2740, 1138], 12399)
-    femmesh.addVolume([2656, 1104, 3175, 3194], 12400)
-    femmesh.addVolume([3129, 3130, 2335, 2337], 12401)
-    femmesh.addVolume([3129, 2333, 3128, 2337], 12402)
-    femmesh.addVolume([2991, 2989, 2580, 2581], 12403)
-    femmesh.addVolume([2579, 2991, 2987, 2580], 12404)
-    femmesh.addVolume([2697, 1153, 2940, 3193], 12405)
-    femmesh.addVolume([2271, 2268, 2272, 3064], 12406)
-    femmesh.addVolume([3053, 2642, 2645, 2646], 12407)
-    femmesh.addVolume([2270, 3062, 2263, 2271], 12408)
-    femmesh.addVolume([2647, 2646, 2644, 3055], 12409)
-    femmesh.addVolume([1139, 2963, 2713, 2693], 12410)
-    femmesh.addVolume([2807, 2427, 2425, 2424], 12411)
-    femmesh.addVolume([2424, 2807, 2427, 2423], 12412)
-    femmesh.addVolume([2493, 2873, 2489, 2490], 12413)
-    femmesh.addVolume([2493, 2491, 2873, 2490], 12414)
-    femmesh.addVolume([3128, 2333, 2336, 2337], 12415)
-    femmesh.addVolume([2335, 3130, 2338, 2337], 12416)
-    femmesh.addVolume([2987, 2576, 2579, 2580], 12417)
-    femmesh.addVolume([2578, 2580, 2989, 2581], 12418)
-    femmesh.addVolume([2565, 2979, 2975, 2976], 12419)
-    femmesh.addVolume([2979, 2565, 2977, 2976], 12420)
-    femmesh.addVolume([3140, 2352, 3144, 3141], 12421)
-    femmesh.addVolume([3144, 3141, 2352, 3142], 12422)
-    femmesh.addVolume([2884, 2885, 2881, 2504], 12423)
-    femmesh.addVolume([2883, 2885, 2886, 2506], 12424)
-    femmesh.addVolume([2410, 2793, 2796, 2795], 12425)
-    femmesh.addVolume([2794, 2795, 2791, 2408], 12426)
-    femmesh.addVolume([3051, 3054, 3052, 2643], 12427)
-    femmesh.addVolume([3054, 3051, 3050, 2643], 12428)
-    femmesh.addVolume([2274, 3069, 3066, 3067], 12429)
-    femmesh.addVolume([3065, 3066, 2274, 3069], 12430)
-    femmesh.addVolume([2732, 2745, 2737, 1136], 12431)
-    femmesh.addVolume([1165, 2962, 2946, 3195], 12432)
-    femmesh.addVolume([2806, 2810, 2426, 2809], 12433)
-    femmesh.addVolume([2811, 2428, 2808, 2810], 12434)
-    femmesh.addVolume([2871, 2870, 2488, 2868], 12435)
-    femmesh.addVolume([2486, 2870, 2869, 2866], 12436)
-    femmesh.addVolume([2964, 25, 2692, 1334], 12437)
-    femmesh.addVolume([2739, 2686, 2744, 940], 12438)
-    femmesh.addVolume([2737, 942, 2688, 2736], 12439)
-    femmesh.addVolume([3126, 2334, 3125, 3129], 12440)
-    femmesh.addVolume([2334, 3126, 3127, 3129], 12441)
-    femmesh.addVolume([2583, 2994, 2991, 2992], 12442)
-    femmesh.addVolume([2991, 2583, 2990, 2994], 12443)
-    femmesh.addVolume([1124, 2671, 2654, 3195], 12444)
-    femmesh.addVolume([760, 985, 2691, 2498], 12445)
-    femmesh.addVolume([1219, 889, 2735, 2500], 12446)
-    femmesh.addVolume([1193, 2734, 862, 2416], 12447)
-    femmesh.addVolume([959, 2414, 733, 2690], 12448)
-    femmesh.addVolume([2977, 2979, 2566, 2565], 12449)
-    femmesh.addVolume([2979, 2975, 2564, 2565], 12450)
-    femmesh.addVolume([3142, 3141, 2352, 2350], 12451)
-    femmesh.addVolume([2348, 2352, 3140, 3141], 12452)
-    femmesh.addVolume([2883, 2505, 2885, 2506], 12453)
-    femmesh.addVolume([2505, 2881, 2885, 2504], 12454)
-    femmesh.addVolume([2795, 2796, 2410, 2412], 12455)
-    femmesh.addVolume([2795, 2794, 2412, 2408], 12456)
-    femmesh.addVolume([2564, 2568, 2979, 2565], 12457)
-    femmesh.addVolume([2566, 2979, 2568, 2565], 12458)
-    femmesh.addVolume([2352, 3141, 2349, 2350], 12459)
-    femmesh.addVolume([2349, 2352, 2348, 3141], 12460)
-    femmesh.addVolume([2642, 3054, 3050, 2643], 12461)
-    femmesh.addVolume([2644, 3052, 3054, 2643], 12462)
-    femmesh.addVolume([2274, 3065, 2270, 3066], 12463)
-    femmesh.addVolume([3066, 2272, 2274, 3067], 12464)
-    femmesh.addVolume([2505, 2883, 2503, 2506], 12465)
-    femmesh.addVolume([2881, 2505, 2501, 2504], 12466)
-    femmesh.addVolume([2411, 2412, 2794, 2408], 12467)
-    femmesh.addVolume([2410, 2796, 2413, 2412], 12468)
-    femmesh.addVolume([715, 2360, 2363, 2684], 12469)
-    femmesh.addVolume([2552, 778, 2549, 2685], 12470)
-    femmesh.addVolume([2365, 844, 2728, 2362], 12471)
-    femmesh.addVolume([2554, 2729, 2551, 907], 12472)
-    femmesh.addVolume([2810, 2426, 2427, 2806], 12473)
-    femmesh.addVolume([2808, 2810, 2428, 2427], 12474)
-    femmesh.addVolume([2870, 2869, 2490, 2486], 12475)
-    femmesh.addVolume([2870, 2871, 2488, 2490], 12476)
-    femmesh.addVolume([863, 2734, 1194, 2422], 12477)
-    femmesh.addVolume([734, 2690, 2420, 960], 12478)
-    femmesh.addVolume([984, 759, 2691, 2492], 12479)
-    femmesh.addVolume([888, 1218, 2735, 2494], 12480)
-    femmesh.addVolume([3066, 2270, 2274, 2271], 12481)
-    femmesh.addVolume([2642, 2646, 3054, 2643], 12482)
-    femmesh.addVolume([2644, 3054, 2646, 2643], 12483)
-    femmesh.addVolume([2271, 2274, 3066, 2272], 12484)
-    femmesh.addVolume([2334, 3127, 2335, 3129], 12485)
-    femmesh.addVolume([2334, 2333, 3125, 3129], 12486)
-    femmesh.addVolume([2992, 2991, 2583, 2581], 12487)
-    femmesh.addVolume([2583, 2990, 2579, 2991], 12488)
-    femmesh.addVolume([2428, 2425, 2808, 2427], 12489)
-    femmesh.addVolume([2427, 2806, 2426, 2423], 12490)
-    femmesh.addVolume([2871, 2491, 2488, 2490], 12491)
-    femmesh.addVolume([2869, 2489, 2490, 2486], 12492)
-    femmesh.addVolume([3129, 2334, 2333, 2337], 12493)
-    femmesh.addVolume([2334, 3129, 2335, 2337], 12494)
-    femmesh.addVolume([2583, 2991, 2579, 2580], 12495)
-    femmesh.addVolume([2580, 2583, 2991, 2581], 12496)
-    femmesh.addVolume([2974, 2977, 2563, 2976], 12497)
-    femmesh.addVolume([2975, 2970, 2561, 2976], 12498)
-    femmesh.addVolume([2351, 3143, 3140, 3144], 12499)
-    femmesh.addVolume([3142, 3144, 3145, 2353], 12500)
-    femmesh.addVolume([2886, 2508, 2885, 2888], 12501)
-    femmesh.addVolume([2884, 2885, 2508, 2888], 12502)
-    femmesh.addVolume([2793, 2409, 2792, 2795], 12503)
-    femmesh.addVolume([2792, 2795, 2409, 2791], 12504)
-    femmesh.addVolume([3049, 3052, 2641, 3051], 12505)
-    femmesh.addVolume([2639, 3050, 3047, 3051], 12506)
-    femmesh.addVolume([3068, 3065, 2273, 3069], 12507)
-    femmesh.addVolume([3069, 2275, 3070, 3067], 12508)
-    femmesh.addVolume([2813, 2430, 2810, 2809], 12509)
-    femmesh.addVolume([2810, 2813, 2811, 2430], 12510)
-    femmesh.addVolume([2870, 2868, 2867, 2487], 12511)
-    femmesh.addVolume([2870, 2487, 2867, 2866], 12512)
-    femmesh.addVolume([3127, 2332, 3124, 3126], 12513)
-    femmesh.addVolume([2330, 3125, 3122, 3126], 12514)
-    femmesh.addVolume([2994, 2995, 2992, 2584], 12515)
-    femmesh.addVolume([2990, 2582, 2993, 2994], 12516)
-    femmesh.addVolume([2964, 2709, 1176, 2930], 12517)
-    femmesh.addVolume([2564, 2975, 2561, 2565], 12518)
-    femmesh.addVolume([2563, 2977, 2566, 2565], 12519)
-    femmesh.addVolume([2350, 2352, 3142, 2353], 12520)
-    femmesh.addVolume([3140, 2348, 2351, 2352], 12521)
-    femmesh.addVolume([2561, 2565, 2975, 2976], 12522)
-    femmesh.addVolume([2565, 2563, 2977, 2976], 12523)
-    femmesh.addVolume([2351, 3144, 3140, 2352], 12524)
-    femmesh.addVolume([3144, 3142, 2352, 2353], 12525)
-    femmesh.addVolume([2508, 2885, 2505, 2506], 12526)
-    femmesh.addVolume([2885, 2508, 2505, 2504], 12527)
-    femmesh.addVolume([2795, 2410, 2409, 2412], 12528)
-    femmesh.addVolume([2412, 2409, 2795, 2408], 12529)
-    femmesh.addVolume([2886, 2885, 2508, 2506], 12530)
-    femmesh.addVolume([2884, 2508, 2885, 2504], 12531)
-    femmesh.addVolume([2410, 2409, 2793, 2795], 12532)
-    femmesh.addVolume([2791, 2795, 2409, 2408], 12533)
-    femmesh.addVolume([2272, 2275, 2274, 3067], 12534)
-    femmesh.addVolume([2273, 3065, 2270, 2274], 12535)
-    femmesh.addVolume([2641, 3052, 2644, 2643], 12536)
-    femmesh.addVolume([3050, 2639, 2642, 2643], 12537)
-    femmesh.addVolume([2274, 2275, 3069, 3067], 12538)
-    femmesh.addVolume([2274, 2273, 3065, 3069], 12539)
-    femmesh.addVolume([3051, 2639, 3050, 2643], 12540)
-    femmesh.addVolume([3051, 3052, 2641, 2643], 12541)
-    femmesh.addVolume([2427, 2810, 2428, 2430], 12542)
-    femmesh.addVolume([2810, 2430, 2427, 2426], 12543)
-    femmesh.addVolume([2488, 2487, 2870, 2490], 12544)
-    femmesh.addVolume([2490, 2487, 2870, 2486], 12545)
-    femmesh.addVolume([2428, 2810, 2811, 2430], 12546)
-    femmesh.addVolume([2426, 2810, 2430, 2809], 12547)
-    femmesh.addVolume([2868, 2870, 2488, 2487], 12548)
-    femmesh.addVolume([2486, 2487, 2870, 2866], 12549)
-    femmesh.addVolume([2334, 2330, 3125, 2333], 12550)
-    femmesh.addVolume([2332, 2335, 2334, 3127], 12551)
-    femmesh.addVolume([2582, 2990, 2579, 2583], 12552)
-    femmesh.addVolume([2583, 2584, 2992, 2581], 12553)
-    femmesh.addVolume([2330, 2334, 3125, 3126], 12554)
-    femmesh.addVolume([2332, 3127, 2334, 3126], 12555)
-    femmesh.addVolume([2992, 2583, 2994, 2584], 12556)
-    femmesh.addVolume([2583, 2582, 2990, 2994], 12557)
-    femmesh.addVolume([2562, 2970, 2971, 2976], 12558)
-    femmesh.addVolume([2974, 2562, 2971, 2976], 12559)
-    femmesh.addVolume([2355, 2968, 3144, 3145], 12560)
-    femmesh.addVolume([3144, 3143, 2968, 2355], 12561)
-    femmesh.addVolume([2884, 2507, 2887, 2888], 12562)
-    femmesh.addVolume([2509, 2886, 2889, 2888], 12563)
-    femmesh.addVolume([2793, 2407, 2790, 2792], 12564)
-    femmesh.addVolume([2792, 2788, 2791, 2405], 12565)
-    femmesh.addVolume([3047, 3048, 2640, 3051], 12566)
-    femmesh.addVolume([3048, 3049, 2640, 3051], 12567)
-    femmesh.addVolume([3069, 2277, 3072, 3070], 12568)
-    femmesh.addVolume([3072, 3068, 2277, 3069], 12569)
-    femmesh.addVolume([2936, 2952, 1008, 3194], 12570)
-    femmesh.addVolume([2431, 2811, 2814, 2813], 12571)
-    femmesh.addVolume([2809, 2813, 2429, 2812], 12572)
-    femmesh.addVolume([2865, 2485, 2867, 2868], 12573)
-    femmesh.addVolume([2863, 2867, 2483, 2866], 12574)
-    femmesh.addVolume([2672, 1104, 2656, 3194], 12575)
-    femmesh.addVolume([1008, 2672, 2656, 3194], 12576)
-    femmesh.addVolume([3122, 3123, 2331, 3126], 12577)
-    femmesh.addVolume([3123, 3124, 2331, 3126], 12578)
-    femmesh.addVolume([2994, 2586, 2997, 2995], 12579)
-    femmesh.addVolume([2997, 2993, 2586, 2994], 12580)
-    femmesh.addVolume([2952, 2936, 1145, 3194], 12581)
-    femmesh.addVolume([2692, 2709, 1176, 2964], 12582)
-    femmesh.addVolume([1104, 3153, 3175, 3194], 12583)
-    femmesh.addVolume([1271, 3175, 3153, 3194], 12584)
-    femmesh.addVolume([1145, 2699, 2727, 3194], 12585)
-    femmesh.addVolume([3157, 3173, 1109, 3192], 12586)
-    femmesh.addVolume([3173, 3157, 1276, 3192], 12587)
-    femmesh.addVolume([2949, 2933, 1013, 3192], 12588)
-    femmesh.addVolume([2949, 1150, 2933, 3192], 12589)
-    femmesh.addVolume([2677, 2663, 1109, 3192], 12590)
-    femmesh.addVolume([1112, 3170, 3155, 3193], 12591)
-    femmesh.addVolume([3155, 3170, 1279, 3193], 12592)
-    femmesh.addVolume([1153, 2697, 2716, 3193], 12593)
-    femmesh.addVolume([2720, 1276, 2707, 3192], 12594)
-    femmesh.addVolume([2716, 2697, 1279, 3193], 12595)
-    femmesh.addVolume([2677, 1013, 2663, 3192], 12596)
-    femmesh.addVolume([1112, 2655, 2674, 3193], 12597)
-    femmesh.addVolume([2707, 1150, 2720, 3192], 12598)
-    femmesh.addVolume([2728, 2361, 2362, 2359], 12599)
-    femmesh.addVolume([2729, 2557, 2554, 2556], 12600)
-    femmesh.addVolume([2552, 2555, 2685, 2556], 12601)
-    femmesh.addVolume([2357, 2360, 2684, 2361], 12602)
-    femmesh.addVolume([2727, 2699, 1271, 3194], 12603)
-    femmesh.addVolume([2565, 2561, 2562, 2976], 12604)
-    femmesh.addVolume([2563, 2565, 2562, 2976], 12605)
-    femmesh.addVolume([2352, 2351, 3144, 2355], 12606)
-    femmesh.addVolume([2355, 3144, 2352, 2353], 12607)
-    femmesh.addVolume([2506, 2508, 2886, 2509], 12608)
-    femmesh.addVolume([2507, 2508, 2884, 2504], 12609)
-    femmesh.addVolume([2408, 2409, 2791, 2405], 12610)
-    femmesh.addVolume([2793, 2410, 2407, 2409], 12611)
-    femmesh.addVolume([2562, 2974, 2563, 2976], 12612)
-    femmesh.addVolume([2562, 2561, 2970, 2976], 12613)
-    femmesh.addVolume([3143, 3144, 2351, 2355], 12614)
-    femmesh.addVolume([3145, 3144, 2355, 2353], 12615)
-    femmesh.addVolume([3051, 2641, 2640, 2643], 12616)
-    femmesh.addVolume([2639, 3051, 2640, 2643], 12617)
-    femmesh.addVolume([2277, 3069, 2274, 2275], 12618)
-    femmesh.addVolume([2274, 2277, 2273, 3069], 12619)
-    femmesh.addVolume([2886, 2509, 2508, 2888], 12620)
-    femmesh.addVolume([2507, 2884, 2508, 2888], 12621)
-    femmesh.addVolume([2407, 2792, 2793, 2409], 12622)
-    femmesh.addVolume([2792, 2791, 2409, 2405], 12623)
-    femmesh.addVolume([2431, 2428, 2811, 2430], 12624)
-    femmesh.addVolume([2426, 2430, 2429, 2809], 12625)
-    femmesh.addVolume([2485, 2868, 2488, 2487], 12626)
-    femmesh.addVolume([2487, 2486, 2483, 2866], 12627)
-    femmesh.addVolume([2973, 2974, 2560, 2971], 12628)
-    femmesh.addVolume([2558, 2970, 2969, 2971], 12629)
-    femmesh.addVolume([3143, 2354, 2972, 2968], 12630)
-    femmesh.addVolume([2356, 2967, 2968, 3145], 12631)
-    femmesh.addVolume([2330, 2331, 2334, 3126], 12632)
-    femmesh.addVolume([2331, 2332, 2334, 3126], 12633)
-    femmesh.addVolume([2994, 2583, 2586, 2584], 12634)
-    femmesh.addVolume([2586, 2582, 2583, 2994], 12635)
-    femmesh.addVolume([2641, 2640, 3049, 3051], 12636)
-    femmesh.addVolume([3047, 2640, 2639, 3051], 12637)
-    femmesh.addVolume([2273, 2277, 3068, 3069], 12638)
-    femmesh.addVolume([3070, 3069, 2277, 2275], 12639)
-    femmesh.addVolume([3169, 1291, 2715, 3195], 12640)
-    femmesh.addVolume([2813, 2429, 2430, 2809], 12641)
-    femmesh.addVolume([2811, 2813, 2431, 2430], 12642)
-    femmesh.addVolume([2483, 2867, 2487, 2866], 12643)
-    femmesh.addVolume([2868, 2485, 2867, 2487], 12644)
-    femmesh.addVolume([2889, 2891, 2511, 2888], 12645)
-    femmesh.addVolume([2887, 2511, 2891, 2888], 12646)
-    femmesh.addVolume([2789, 2792, 2406, 2788], 12647)
-    femmesh.addVolume([2406, 2790, 2792, 2789], 12648)
-    femmesh.addVolume([3044, 2636, 3047, 3048], 12649)
-    femmesh.addVolume([3049, 2638, 3046, 3048], 12650)
-    femmesh.addVolume([3073, 3072, 2278, 3070], 12651)
-    femmesh.addVolume([3068, 2276, 3071, 3072], 12652)
-    femmesh.addVolume([3124, 2332, 2331, 3126], 12653)
-    femmesh.addVolume([2331, 2330, 3122, 3126], 12654)
-    femmesh.addVolume([2586, 2993, 2582, 2994], 12655)
-    femmesh.addVolume([2586, 2995, 2994, 2584], 12656)
-    femmesh.addVolume([2701, 1291, 3149, 3195], 12657)
-    femmesh.addVolume([2813, 2814, 2433, 2816], 12658)
-    femmesh.addVolume([2816, 2433, 2813, 2812], 12659)
-    femmesh.addVolume([2484, 2864, 2867, 2863], 12660)
-    femmesh.addVolume([2864, 2484, 2867, 2865], 12661)
-    femmesh.addVolume([2655, 1016, 2674, 3193], 12662)
-    femmesh.addVolume([2329, 3121, 3124, 3123], 12663)
-    femmesh.addVolume([3119, 2327, 3122, 3123], 12664)
-    femmesh.addVolume([2585, 2996, 2993, 2997], 12665)
-    femmesh.addVolume([2995, 2997, 2998, 2587], 12666)
-    femmesh.addVolume([2965, 18, 1334, 2684], 12667)
-    femmesh.addVolume([19, 2966, 1333, 2685], 12668)
-    femmesh.addVolume([1153, 2955, 2940, 3193], 12669)
-    femmesh.addVolume([2955, 1016, 2940, 3193], 12670)
-    femmesh.addVolume([2563, 2560, 2974, 2562], 12671)
-    femmesh.addVolume([2561, 2970, 2558, 2562], 12672)
-    femmesh.addVolume([3145, 2355, 2356, 2353], 12673)
-    femmesh.addVolume([2351, 2354, 3143, 2355], 12674)
-    femmesh.addVolume([2509, 2511, 2508, 2888], 12675)
-    femmesh.addVolume([2511, 2507, 2508, 2888], 12676)
-    femmesh.addVolume([2406, 2792, 2409, 2405], 12677)
-    femmesh.addVolume([2409, 2407, 2792, 2406], 12678)
-    femmesh.addVolume([3047, 2636, 2639, 2640], 12679)
-    femmesh.addVolume([2641, 2638, 3049, 2640], 12680)
-    femmesh.addVolume([3070, 2277, 2278, 2275], 12681)
-    femmesh.addVolume([2273, 2276, 3068, 2277], 12682)
-    femmesh.addVolume([2952, 1007, 2672, 3191], 12683)
-    femmesh.addVolume([1165, 2715, 2701, 3195], 12684)
-    femmesh.addVolume([2431, 2813, 2433, 2430], 12685)
-    femmesh.addVolume([2433, 2430, 2813, 2429], 12686)
-    femmesh.addVolume([2867, 2485, 2484, 2487], 12687)
-    femmesh.addVolume([2867, 2487, 2484, 2483], 12688)
-    femmesh.addVolume([2971, 2558, 2970, 2562], 12689)
-    femmesh.addVolume([2971, 2974, 2560, 2562], 12690)
-    femmesh.addVolume([2356, 2968, 2355, 3145], 12691)
-    femmesh.addVolume([2968, 3143, 2354, 2355], 12692)
-    femmesh.addVolume([2329, 2332, 2331, 3124], 12693)
-    femmesh.addVolume([2331, 2327, 3122, 2330], 12694)
-    femmesh.addVolume([2993, 2582, 2585, 2586], 12695)
-    femmesh.addVolume([2587, 2995, 2586, 2584], 12696)
-    femmesh.addVolume([2891, 2892, 2889, 2512], 12697)
-    femmesh.addVolume([2891, 2887, 2890, 2510], 12698)
-    femmesh.addVolume([2789, 2785, 2788, 2402], 12699)
-    femmesh.addVolume([2790, 2404, 2787, 2789], 12700)
-    femmesh.addVolume([2507, 2511, 2887, 2888], 12701)
-    femmesh.addVolume([2511, 2509, 2889, 2888], 12702)
-    femmesh.addVolume([2792, 2407, 2790, 2406], 12703)
-    femmesh.addVolume([2788, 2792, 2406, 2405], 12704)
-    femmesh.addVolume([3048, 3044, 2637, 3045], 12705)
-    femmesh.addVolume([3046, 3048, 2637, 3045], 12706)
-    femmesh.addVolume([3072, 2280, 3075, 3073], 12707)
-    femmesh.addVolume([3075, 3071, 2280, 3072], 12708)
-    femmesh.addVolume([2640, 2638, 3049, 3048], 12709)
-    femmesh.addVolume([2640, 3047, 2636, 3048], 12710)
-    femmesh.addVolume([2278, 3072, 2277, 3070], 12711)
-    femmesh.addVolume([2277, 2276, 3068, 3072], 12712)
-    femmesh.addVolume([2863, 2480, 2864, 2860], 12713)
-    femmesh.addVolume([2865, 2864, 2482, 2862], 12714)
-    femmesh.addVolume([2817, 2434, 2814, 2816], 12715)
-    femmesh.addVolume([2812, 2816, 2432, 2815], 12716)
-    femmesh.addVolume([3119, 3123, 3120, 2328], 12717)
-    femmesh.addVolume([3123, 3121, 3120, 2328], 12718)
-    femmesh.addVolume([2998, 2997, 3000, 2589], 12719)
-    femmesh.addVolume([3000, 2997, 2996, 2589], 12720)
-    femmesh.addVolume([2429, 2813, 2433, 2812], 12721)
-    femmesh.addVolume([2814, 2433, 2431, 2813], 12722)
-    femmesh.addVolume([2485, 2867, 2484, 2865], 12723)
-    femmesh.addVolume([2867, 2483, 2484, 2863], 12724)
-    femmesh.addVolume([2559, 2973, 2971, 1335], 12725)
-    femmesh.addVolume([1336, 2968, 2972, 2358], 12726)
-    femmesh.addVolume([2969, 2559, 2971, 1335], 12727)
-    femmesh.addVolume([2968, 2358, 1336, 2967], 12728)
-    femmesh.addVolume([3124, 2331, 2329, 3123], 12729)
-    femmesh.addVolume([2327, 2331, 3122, 3123], 12730)
-    femmesh.addVolume([2995, 2586, 2997, 2587], 12731)
-    femmesh.addVolume([2993, 2586, 2585, 2997], 12732)
-    femmesh.addVolume([2939, 2660, 1007, 3191], 12733)
-    femmesh.addVolume([1124, 3149, 3169, 3195], 12734)
-    femmesh.addVolume([2660, 1103, 2672, 3191], 12735)
-    femmesh.addVolume([2562, 2560, 2971, 2559], 12736)
-    femmesh.addVolume([2558, 2562, 2971, 2559], 12737)
-    femmesh.addVolume([2355, 2354, 2968, 2358], 12738)
-    femmesh.addVolume([2358, 2968, 2355, 2356], 12739)
-    femmesh.addVolume([2511, 2507, 2887, 2510], 12740)
-    femmesh.addVolume([2509, 2511, 2889, 2512], 12741)
-    femmesh.addVolume([2790, 2407, 2404, 2406], 12742)
-    femmesh.addVolume([2405, 2406, 2788, 2402], 12743)
-    femmesh.addVolume([2637, 2638, 2640, 3048], 12744)
-    femmesh.addVolume([2636, 2637, 2640, 3048], 12745)
-    femmesh.addVolume([3072, 2277, 2280, 2278], 12746)
-    femmesh.addVolume([2280, 2276, 2277, 3072], 12747)
-    femmesh.addVolume([2433, 2432, 2429, 2812], 12748)
-    femmesh.addVolume([2814, 2434, 2431, 2433], 12749)
-    femmesh.addVolume([2484, 2483, 2480, 2863], 12750)
-    femmesh.addVolume([2485, 2484, 2482, 2865], 12751)
-    femmesh.addVolume([2891, 2514, 2894, 2892], 12752)
-    femmesh.addVolume([2514, 2891, 2894, 2890], 12753)
-    femmesh.addVolume([2786, 2789, 2403, 2785], 12754)
-    femmesh.addVolume([2789, 2403, 2787, 2786], 12755)
-    femmesh.addVolume([3123, 2331, 2329, 2328], 12756)
-    femmesh.addVolume([3123, 2327, 2331, 2328], 12757)
-    femmesh.addVolume([2587, 2586, 2997, 2589], 12758)
-    femmesh.addVolume([2997, 2586, 2585, 2589], 12759)
-    femmesh.addVolume([2972, 2968, 2354, 2358], 12760)
-    femmesh.addVolume([2973, 2971, 2560, 2559], 12761)
-    femmesh.addVolume([2558, 2971, 2969, 2559], 12762)
-    femmesh.addVolume([2967, 2968, 2358, 2356], 12763)
-    femmesh.addVolume([3044, 3041, 2633, 3045], 12764)
-    femmesh.addVolume([3043, 3046, 2635, 3045], 12765)
-    femmesh.addVolume([3074, 3071, 2279, 3075], 12766)
-    femmesh.addVolume([3075, 2281, 3076, 3073], 12767)
-    femmesh.addVolume([2861, 2864, 2481, 2860], 12768)
-    femmesh.addVolume([2862, 2864, 2481, 2861], 12769)
-    femmesh.addVolume([2817, 2819, 2436, 2816], 12770)
-    femmesh.addVolume([2436, 2816, 2819, 2815], 12771)
-    femmesh.addVolume([2952, 1144, 2939, 3191], 12772)
-    femmesh.addVolume([3120, 2324, 3116, 3119], 12773)
-    femmesh.addVolume([3118, 3120, 3121, 2326], 12774)
-    femmesh.addVolume([2999, 2996, 2588, 3000], 12775)
-    femmesh.addVolume([2590, 3000, 2998, 3001], 12776)
-    femmesh.addVolume([2887, 2891, 2511, 2510], 12777)
-    femmesh.addVolume([2891, 2889, 2511, 2512], 12778)
-    femmesh.addVolume([2406, 2404, 2790, 2789], 12779)
-    femmesh.addVolume([2788, 2406, 2789, 2402], 12780)
-    femmesh.addVolume([2363, 1334, 18, 2684], 12781)
-    femmesh.addVolume([2549, 19, 1333, 2685], 12782)
-    femmesh.addVolume([2365, 2728, 25, 1334], 12783)
-    femmesh.addVolume([2551, 1333, 24, 2729], 12784)
-    femmesh.addVolume([2638, 2637, 3046, 3048], 12785)
-    femmesh.addVolume([2637, 2636, 3044, 3048], 12786)
-    femmesh.addVolume([2276, 2280, 3071, 3072], 12787)
-    femmesh.addVolume([2278, 2280, 3072, 3073], 12788)
-    femmesh.addVolume([2357, 2972, 2354, 2358], 12789)
-    femmesh.addVolume([2560, 2557, 2973, 2559], 12790)
-    femmesh.addVolume([2555, 2558, 2969, 2559], 12791)
-    femmesh.addVolume([2967, 2358, 2359, 2356], 12792)
-    femmesh.addVolume([2433, 2814, 2434, 2816], 12793)
-    femmesh.addVolume([2432, 2433, 2816, 2812], 12794)
-    femmesh.addVolume([2480, 2864, 2484, 2863], 12795)
-    femmesh.addVolume([2482, 2484, 2864, 2865], 12796)
-    femmesh.addVolume([2327, 3123, 3119, 2328], 12797)
-    femmesh.addVolume([3123, 2329, 3121, 2328], 12798)
-    femmesh.addVolume([2587, 2997, 2998, 2589], 12799)
-    femmesh.addVolume([2996, 2997, 2585, 2589], 12800)
-    femmesh.addVolume([2514, 2511, 2891, 2510], 12801)
-    femmesh.addVolume([2511, 2514, 2891, 2512], 12802)
-    femmesh.addVolume([2406, 2403, 2789, 2402], 12803)
-    femmesh.addVolume([2404, 2789, 2406, 2403], 12804)
-    femmesh.addVolume([1333, 2693, 24, 2729], 12805)
-    femmesh.addVolume([2635, 3046, 2638, 2637], 12806)
-    femmesh.addVolume([3044, 2633, 2636, 2637], 12807)
-    femmesh.addVolume([2279, 3071, 2276, 2280], 12808)
-    femmesh.addVolume([2278, 2281, 2280, 3073], 12809)
-    femmesh.addVolume([2893, 2894, 2890, 2513], 12810)
-    femmesh.addVolume([2894, 2895, 2892, 2515], 12811)
-    femmesh.addVolume([2787, 2401, 2784, 2786], 12812)
-    femmesh.addVolume([2786, 2782, 2785, 2399], 12813)
-    femmesh.addVolume([2433, 2816, 2436, 2432], 12814)
-    femmesh.addVolume([2484, 2481, 2864, 2480], 12815)
-    femmesh.addVolume([2434, 2436, 2433, 2816], 12816)
-    femmesh.addVolume([2481, 2484, 2864, 2482], 12817)
-    femmesh.addVolume([3043, 2634, 3042, 3045], 12818)
-    femmesh.addVolume([3041, 3042, 2634, 3045], 12819)
-    femmesh.addVolume([3078, 3075, 2283, 3076], 12820)
-    femmesh.addVolume([2283, 3074, 3075, 3078], 12821)
-    femmesh.addVolume([2324, 2327, 3119, 2328], 12822)
-    femmesh.addVolume([2328, 2329, 3121, 2326], 12823)
-    femmesh.addVolume([2585, 2588, 2996, 2589], 12824)
-    femmesh.addVolume([2998, 2590, 2587, 2589], 12825)
-    femmesh.addVolume([2861, 2477, 2857, 2860], 12826)
-    femmesh.addVolume([2862, 2479, 2859, 2861], 12827)
-    femmesh.addVolume([2437, 2817, 2820, 2819], 12828)
-    femmesh.addVolume([2818, 2819, 2815, 2435], 12829)
-    femmesh.addVolume([3116, 3120, 3117, 2325], 12830)
-    femmesh.addVolume([3117, 2325, 3120, 3118], 12831)
-    femmesh.addVolume([3000, 3003, 3001, 2592], 12832)
-    femmesh.addVolume([3003, 3000, 2999, 2592], 12833)
-    femmesh.addVolume([2892, 2891, 2514, 2512], 12834)
-    femmesh.addVolume([2891, 2890, 2514, 2510], 12835)
-    femmesh.addVolume([2789, 2404, 2787, 2403], 12836)
-    femmesh.addVolume([2785, 2789, 2403, 2402], 12837)
-    femmesh.addVolume([1336, 2972, 2357, 2358], 12838)
-    femmesh.addVolume([2559, 2557, 2973, 1335], 12839)
-    femmesh.addVolume([2555, 2559, 2969, 1335], 12840)
-    femmesh.addVolume([2359, 1336, 2358, 2967], 12841)
-    femmesh.addVolume([2633, 2637, 3044, 3045], 12842)
-    femmesh.addVolume([2637, 2635, 3046, 3045], 12843)
-    femmesh.addVolume([2280, 2279, 3071, 3075], 12844)
-    femmesh.addVolume([2280, 2281, 3075, 3073], 12845)
-    femmesh.addVolume([2482, 2864, 2481, 2862], 12846)
-    femmesh.addVolume([2480, 2481, 2864, 2860], 12847)
-    femmesh.addVolume([2432, 2816, 2436, 2815], 12848)
-    femmesh.addVolume([2436, 2434, 2817, 2816], 12849)
-    femmesh.addVolume([1013, 2933, 1012, 2663], 12850)
-    femmesh.addVolume([1010, 2954, 1009, 2678], 12851)
-    femmesh.addVolume([1150, 2949, 1151, 2720], 12852)
-    femmesh.addVolume([2954, 1147, 1146, 2717], 12853)
-    femmesh.addVolume([2677, 2949, 1014, 1013], 12854)
-    femmesh.addVolume([1111, 2653, 1110, 3154], 12855)
-    femmesh.addVolume([1277, 3154, 2696, 1278], 12856)
-    femmesh.addVolume([2677, 1109, 1110, 3173], 12857)
-    femmesh.addVolume([3173, 1277, 2720, 1276], 12858)
-    femmesh.addVolume([2696, 1151, 1152, 2931], 12859)
-    femmesh.addVolume([2933, 1150, 1149, 2707], 12860)
-    femmesh.addVolume([1011, 1012, 2948, 2673], 12861)
-    femmesh.addVolume([2674, 1111, 1112, 3170], 12862)
-    femmesh.addVolume([1279, 2716, 3170, 1278], 12863)
-    femmesh.addVolume([2948, 1149, 1148, 2722], 12864)
-    femmesh.addVolume([2707, 1275, 3157, 1276], 12865)
-    femmesh.addVolume([1292, 2715, 3169, 1291], 12866)
-    femmesh.addVolume([1034, 1035, 2958, 2650], 12867)
-    femmesh.addVolume([2936, 2656, 1008, 1009], 12868)
-    femmesh.addVolume([2937, 1148, 1147, 2702], 12869)
-    femmesh.addVolume([1011, 2937, 1010, 2662], 12870)
-    femmesh.addVolume([2670, 1131, 1132, 3146], 12871)
-    femmesh.addVolume([2942, 1036, 2670, 1035], 12872)
-    femmesh.addVolume([2672, 1103, 1104, 3153], 12873)
-    femmesh.addVolume([3119, 3120, 2324, 2328], 12874)
-    femmesh.addVolume([3120, 2328, 3121, 2326], 12875)
-    femmesh.addVolume([2590, 2998, 3000, 2589], 12876)
-    femmesh.addVolume([3000, 2996, 2588, 2589], 12877)
-    femmesh.addVolume([2952, 2672, 1007, 1008], 12878)
-    femmesh.addVolume([1108, 1109, 2663, 3157], 12879)
-    femmesh.addVolume([2514, 2510, 2890, 2513], 12880)
-    femmesh.addVolume([2515, 2892, 2514, 2512], 12881)
-    femmesh.addVolume([2402, 2403, 2785, 2399], 12882)
-    femmesh.addVolume([2787, 2404, 2401, 2403], 12883)
-    femmesh.addVolume([2936, 2699, 1146, 1145], 12884)
-    femmesh.addVolume([1298, 3146, 2714, 1299], 12885)
-    femmesh.addVolume([1290, 3149, 2701, 1291], 12886)
-    femmesh.addVolume([2653, 2931, 1015, 1014], 12887)
-    femmesh.addVolume([1293, 2708, 3150, 1292], 12888)
-    femmesh.addVolume([1131, 2650, 1130, 3178], 12889)
-    femmesh.addVolume([2893, 2894, 2517, 2897], 12890)
-    femmesh.addVolume([2895, 2517, 2894, 2897], 12891)
-    femmesh.addVolume([2784, 2400, 2783, 2786], 12892)
-    femmesh.addVolume([2783, 2786, 2400, 2782], 12893)
-    femmesh.addVolume([2637, 2633, 2634, 3045], 12894)
-    femmesh.addVolume([2635, 2637, 2634, 3045], 12895)
-    femmesh.addVolume([3075, 2280, 2279, 2283], 12896)
-    femmesh.addVolume([2280, 2283, 3075, 2281], 12897)
-    femmesh.addVolume([2651, 1125, 1126, 3150], 12898)
-    femmesh.addVolume([2630, 3041, 3038, 3042], 12899)
-    femmesh.addVolume([3043, 3042, 2632, 3040], 12900)
-    femmesh.addVolume([3076, 3078, 3079, 2284], 12901)
-    femmesh.addVolume([2282, 3077, 3074, 3078], 12902)
-    femmesh.addVolume([1297, 3178, 2695, 1298], 12903)
-    femmesh.addVolume([2481, 2480, 2477, 2860], 12904)
-    femmesh.addVolume([2862, 2481, 2482, 2479], 12905)
-    femmesh.addVolume([2815, 2436, 2432, 2435], 12906)
-    femmesh.addVolume([2437, 2434, 2817, 2436], 12907)
-    femmesh.addVolume([2861, 2478, 2858, 2857], 12908)
-    femmesh.addVolume([2859, 2478, 2858, 2861], 12909)
-    femmesh.addVolume([2439, 2820, 2822, 2819], 12910)
-    femmesh.addVolume([2819, 2822, 2439, 2818], 12911)
-    femmesh.addVolume([2714, 1172, 1173, 2942], 12912)
-    femmesh.addVolume([1113, 2655, 1112, 3155], 12913)
-    femmesh.addVolume([1279, 3155, 2697, 1280], 12914)
-    femmesh.addVolume([3120, 2325, 2328, 2326], 12915)
-    femmesh.addVolume([2328, 3120, 2324, 2325], 12916)
-    femmesh.addVolume([2589, 3000, 2590, 2592], 12917)
-    femmesh.addVolume([3000, 2589, 2588, 2592], 12918)
-    femmesh.addVolume([3118, 3115, 3117, 2323], 12919)
-    femmesh.addVolume([2321, 3116, 3113, 3117], 12920)
-    femmesh.addVolume([2593, 3001, 3004, 3003], 12921)
-    femmesh.addVolume([2999, 2591, 3002, 3003], 12922)
-    femmesh.addVolume([1124, 1125, 2671, 3169], 12923)
-    femmesh.addVolume([3181, 2722, 1274, 1275], 12924)
-    femmesh.addVolume([1164, 2962, 1165, 2701], 12925)
-    femmesh.addVolume([2955, 1153, 1152, 2716], 12926)
-    femmesh.addVolume([2658, 1132, 1133, 3179], 12927)
-    femmesh.addVolume([1034, 2679, 2929, 1033], 12928)
-    femmesh.addVolume([1164, 2721, 1163, 2938], 12929)
-    femmesh.addVolume([2656, 1104, 1105, 3175], 12930)
-    femmesh.addVolume([2683, 2953, 1006, 1005], 12931)
-    femmesh.addVolume([1171, 1172, 2695, 2958], 12932)
-    femmesh.addVolume([1007, 2939, 1006, 2660], 12933)
-    femmesh.addVolume([2673, 1107, 1108, 3181], 12934)
-    femmesh.addVolume([1036, 1037, 2959, 2658], 12935)
-    femmesh.addVolume([1336, 2357, 2361, 2358], 12936)
-    femmesh.addVolume([2358, 2361, 1336, 2359], 12937)
-    femmesh.addVolume([2555, 2556, 2559, 1335], 12938)
-    femmesh.addVolume([2556, 2557, 2559, 1335], 12939)
-    femmesh.addVolume([2726, 1170, 1171, 2929], 12940)
-    femmesh.addVolume([1121, 1122, 2681, 3160], 12941)
-    femmesh.addVolume([2662, 1106, 1107, 3166], 12942)
-    femmesh.addVolume([2692, 25, 2728, 1334], 12943)
-    femmesh.addVolume([1025, 2935, 1024, 2657], 12944)
-    femmesh.addVolume([1144, 2952, 1145, 2727], 12945)
-    femmesh.addVolume([1273, 3159, 1272, 2717], 12946)
-    femmesh.addVolume([1166, 1167, 2708, 2932], 12947)
-    femmesh.addVolume([3160, 1289, 2706, 1288], 12948)
-    femmesh.addVolume([2660, 1102, 1103, 3180], 12949)
-    femmesh.addVolume([2940, 1016, 1017, 2655], 12950)
-    femmesh.addVolume([1271, 1270, 2727, 3153], 12951)
-    femmesh.addVolume([1127, 2682, 1126, 3167], 12952)
-    femmesh.addVolume([1297, 2726, 3147, 1296], 12953)
-    femmesh.addVolume([1295, 3171, 2710, 1296], 12954)
-    femmesh.addVolume([1143, 2939, 1144, 2712], 12955)
-    femmesh.addVolume([1128, 2667, 1127, 3151], 12956)
-    femmesh.addVolume([1027, 2938, 1026, 2666], 12957)
-    femmesh.addVolume([2746, 2744, 2739, 2928], 12958)
-    femmesh.addVolume([2737, 2736, 3158, 2741], 12959)
-    femmesh.addVolume([2745, 2941, 2737, 2742], 12960)
-    femmesh.addVolume([2744, 2746, 2743, 2928], 12961)
-    femmesh.addVolume([2736, 1332, 3158, 2741], 12962)
-    femmesh.addVolume([2745, 2743, 2941, 2742], 12963)
-    femmesh.addVolume([3179, 1300, 2703, 1299], 12964)
-    femmesh.addVolume([3156, 1332, 2738, 2740], 12965)
-    femmesh.addVolume([2514, 2890, 2894, 2513], 12966)
-    femmesh.addVolume([2892, 2514, 2894, 2515], 12967)
-    femmesh.addVolume([2785, 2403, 2786, 2399], 12968)
-    femmesh.addVolume([2403, 2401, 2787, 2786], 12969)
-    femmesh.addVolume([2516, 2896, 2893, 2897], 12970)
-    femmesh.addVolume([2518, 2895, 2898, 2897], 12971)
-    femmesh.addVolume([2782, 2783, 2779, 2396], 12972)
-    femmesh.addVolume([2398, 2781, 2784, 2783], 12973)
-    femmesh.addVolume([1271, 3175, 2699, 1272], 12974)
-    femmesh.addVolume([1016, 2955, 1015, 2674], 12975)
-    femmesh.addVolume([1294, 2723, 3167, 1293], 12976)
-    femmesh.addVolume([1289, 3168, 2721, 1290], 12977)
-    femmesh.addVolume([1130, 2679, 1129, 3147], 12978)
-    femmesh.addVolume([1120, 1121, 2657, 3174], 12979)
-    femmesh.addVolume([1028, 1029, 2946, 2671], 12980)
-    femmesh.addVolume([2517, 2894, 2514, 2515], 12981)
-    femmesh.addVolume([2894, 2517, 2514, 2513], 12982)
-    femmesh.addVolume([2403, 2400, 2401, 2786], 12983)
-    femmesh.addVolume([2400, 2786, 2403, 2399], 12984)
-    femmesh.addVolume([3039, 3038, 3042, 2631], 12985)
-    femmesh.addVolume([3042, 3040, 3039, 2631], 12986)
-    femmesh.addVolume([2286, 3081, 3077, 3078], 12987)
-    femmesh.addVolume([3081, 3078, 2286, 3079], 12988)
-    femmesh.addVolume([2682, 2947, 1031, 1030], 12989)
-    femmesh.addVolume([2634, 3043, 2635, 3045], 12990)
-    femmesh.addVolume([2634, 2633, 3041, 3045], 12991)
-    femmesh.addVolume([3076, 3075, 2283, 2281], 12992)
-    femmesh.addVolume([3075, 2279, 3074, 2283], 12993)
-    femmesh.addVolume([2934, 1142, 1141, 2718], 12994)
-    femmesh.addVolume([2857, 2474, 2858, 2854], 12995)
-    femmesh.addVolume([2856, 2858, 2859, 2476], 12996)
-    femmesh.addVolume([2821, 2822, 2818, 2438], 12997)
-    femmesh.addVolume([2820, 2823, 2440, 2822], 12998)
-    femmesh.addVolume([3041, 2630, 2633, 2634], 12999)
-    femmesh.addVolume([2634, 2632, 2635, 3043], 13000)
-    femmesh.addVolume([2282, 3074, 2279, 2283], 13001)
-    femmesh.addVolume([2281, 2283, 3076, 2284], 13002)
-    femmesh.addVolume([2479, 2862, 2481, 2861], 13003)
-    femmesh.addVolume([2477, 2861, 2481, 2860], 13004)
-    femmesh.addVolume([2436, 2817, 2437, 2819], 13005)
-    femmesh.addVolume([2436, 2815, 2819, 2435], 13006)
-    femmesh.addVolume([3113, 3117, 3114, 2322], 13007)
-    femmesh.addVolume([3114, 2322, 3117, 3115], 13008)
-    femmesh.addVolume([3004, 3003, 3006, 2595], 13009)
-    femmesh.addVolume([3003, 3002, 3006, 2595], 13010)
-    femmesh.addVolume([2478, 2861, 2481, 2477], 13011)
-    femmesh.addVolume([2479, 2481, 2478, 2861], 13012)
-    femmesh.addVolume([2439, 2436, 2437, 2819], 13013)
-    femmesh.addVolume([2819, 2439, 2436, 2435], 13014)
-    femmesh.addVolume([2950, 1003, 1004, 2659], 13015)
-    femmesh.addVolume([3156, 2738, 2739, 2740], 13016)
-    femmesh.addVolume([2324, 3116, 2321, 2325], 13017)
-    femmesh.addVolume([2323, 2325, 3118, 2326], 13018)
-    femmesh.addVolume([2590, 3001, 2593, 2592], 13019)
-    femmesh.addVolume([2999, 2588, 2591, 2592], 13020)
-    femmesh.addVolume([3118, 2325, 3120, 2326], 13021)
-    femmesh.addVolume([3120, 3116, 2324, 2325], 13022)
-    femmesh.addVolume([3000, 3001, 2590, 2592], 13023)
-    femmesh.addVolume([3000, 2588, 2999, 2592], 13024)
-    femmesh.addVolume([2962, 1027, 1028, 2654], 13025)
-    femmesh.addVolume([2953, 1143, 1142, 2698], 13026)
-    femmesh.addVolume([1295, 2694, 3151, 1294], 13027)
-    femmesh.addVolume([2652, 1128, 1129, 3171], 13028)
-    femmesh.addVolume([1167, 1168, 2723, 2947], 13029)
-    femmesh.addVolume([2951, 1025, 1026, 2681], 13030)
-    femmesh.addVolume([2703, 1173, 1174, 2959], 13031)
-    femmesh.addVolume([2363, 18, 715, 2684], 13032)
-    femmesh.addVolume([2549, 778, 19, 2685], 13033)
-    femmesh.addVolume([2728, 25, 844, 2365], 13034)
-    femmesh.addVolume([2729, 24, 2551, 907], 13035)
-    femmesh.addVolume([2898, 2520, 2897, 2900], 13036)
-    femmesh.addVolume([2520, 2896, 2897, 2900], 13037)
-    femmesh.addVolume([2780, 2783, 2397, 2779], 13038)
-    femmesh.addVolume([2397, 2781, 2783, 2780], 13039)
-    femmesh.addVolume([3038, 3035, 2627, 3039], 13040)
-    femmesh.addVolume([3040, 3039, 2629, 3037], 13041)
-    femmesh.addVolume([2285, 3080, 3077, 3081], 13042)
-    femmesh.addVolume([3079, 3081, 3082, 2287], 13043)
-    femmesh.addVolume([1267, 1268, 3161, 2718], 13044)
-    femmesh.addVolume([1140, 2950, 1141, 2704], 13045)
-    femmesh.addVolume([2825, 2823, 2822, 2442], 13046)
-    femmesh.addVolume([2442, 2822, 2825, 2821], 13047)
-    femmesh.addVolume([2858, 2475, 2855, 2854], 13048)
-    femmesh.addVolume([2856, 2855, 2858, 2475], 13049)
-    femmesh.addVolume([2515, 2517, 2895, 2518], 13050)
-    femmesh.addVolume([2513, 2893, 2517, 2516], 13051)
-    femmesh.addVolume([2398, 2784, 2401, 2400], 13052)
-    femmesh.addVolume([2399, 2400, 2782, 2396], 13053)
-    femmesh.addVolume([3115, 3112, 3114, 2320], 13054)
-    femmesh.addVolume([3110, 2318, 3113, 3114], 13055)
-    femmesh.addVolume([3007, 2596, 3004, 3006], 13056)
-    femmesh.addVolume([2594, 3005, 3002, 3006], 13057)
-    femmesh.addVolume([3042, 2630, 2634, 2631], 13058)
-    femmesh.addVolume([2634, 2632, 3042, 2631], 13059)
-    femmesh.addVolume([3078, 2283, 2286, 2284], 13060)
-    femmesh.addVolume([2286, 2282, 2283, 3078], 13061)
-    femmesh.addVolume([2439, 2435, 2818, 2438], 13062)
-    femmesh.addVolume([2479, 2859, 2478, 2476], 13063)
-    femmesh.addVolume([2857, 2478, 2474, 2477], 13064)
-    femmesh.addVolume([2820, 2440, 2437, 2439], 13065)
-    femmesh.addVolume([1265, 3148, 2713, 1266], 13066)
-    femmesh.addVolume([3117, 2322, 2325, 2323], 13067)
-    femmesh.addVolume([2321, 2325, 3117, 2322], 13068)
-    femmesh.addVolume([2591, 2595, 3003, 2592], 13069)
-    femmesh.addVolume([2595, 2593, 3003, 2592], 13070)
-    femmesh.addVolume([2895, 2894, 2517, 2515], 13071)
-    femmesh.addVolume([2893, 2517, 2894, 2513], 13072)
-    femmesh.addVolume([2401, 2400, 2784, 2786], 13073)
-    femmesh.addVolume([2782, 2786, 2400, 2399], 13074)
-    femmesh.addVolume([2634, 3041, 2630, 3042], 13075)
-    femmesh.addVolume([2632, 2634, 3042, 3043], 13076)
-    femmesh.addVolume([3076, 2283, 3078, 2284], 13077)
-    femmesh.addVolume([3074, 2283, 2282, 3078], 13078)
-    femmesh.addVolume([2479, 2478, 2859, 2861], 13079)
-    femmesh.addVolume([2820, 2439, 2437, 2819], 13080)
-    femmesh.addVolume([2857, 2861, 2478, 2477], 13081)
-    femmesh.addVolume([2818, 2439, 2819, 2435], 13082)
-    femmesh.addVolume([1174, 1175, 2724, 2943], 13083)
-    femmesh.addVolume([3117, 2321, 3116, 2325], 13084)
-    femmesh.addVolume([3118, 3117, 2325, 2323], 13085)
-    femmesh.addVolume([2591, 3003, 2999, 2592], 13086)
-    femmesh.addVolume([3003, 2593, 3001, 2592], 13087)
-    femmesh.addVolume([2898, 2901, 2521, 2900], 13088)
-    femmesh.addVolume([2896, 2900, 2519, 2899], 13089)
-    femmesh.addVolume([2778, 2781, 2395, 2780], 13090)
-    femmesh.addVolume([2776, 2779, 2780, 2393], 13091)
-    femmesh.addVolume([20, 2269, 15, 2262], 13092)
-    femmesh.addVolume([2265, 16, 27, 2266], 13093)
-    femmesh.addVolume([2628, 3039, 3036, 3037], 13094)
-    femmesh.addVolume([3036, 3035, 3039, 2628], 13095)
-    femmesh.addVolume([2289, 3084, 3081, 3082], 13096)
-    femmesh.addVolume([3081, 2289, 3080, 3084], 13097)
-    femmesh.addVolume([1139, 1140, 2713, 2926], 13098)
-    femmesh.addVolume([1124, 2654, 1123, 3149], 13099)
-    femmesh.addVolume([2957, 2652, 1032, 1033], 13100)
-    femmesh.addVolume([2342, 1064, 2339, 3134], 13101)
-    femmesh.addVolume([3136, 2341, 2344, 1327], 13102)
-    femmesh.addVolume([2575, 1240, 2983, 2572], 13103)
-    femmesh.addVolume([1073, 2573, 2981, 2570], 13104)
-    femmesh.addVolume([2823, 2826, 2443, 2825], 13105)
-    femmesh.addVolume([2825, 2441, 2821, 2824], 13106)
-    femmesh.addVolume([2473, 2856, 2855, 2853], 13107)
-    femmesh.addVolume([2855, 2471, 2851, 2854], 13108)
-    femmesh.addVolume([2319, 3114, 3111, 3112], 13109)
-    femmesh.addVolume([3111, 3110, 3114, 2319], 13110)
-    femmesh.addVolume([3009, 2598, 3007, 3006], 13111)
-    femmesh.addVolume([3009, 3005, 2598, 3006], 13112)
-    femmesh.addVolume([1301, 2724, 3152, 1300], 13113)
-    femmesh.addVolume([2897, 2517, 2516, 2520], 13114)
-    femmesh.addVolume([2517, 2897, 2518, 2520], 13115)
-    femmesh.addVolume([2400, 2398, 2783, 2397], 13116)
-    femmesh.addVolume([2397, 2783, 2400, 2396], 13117)
-    femmesh.addVolume([1169, 2694, 1168, 2927], 13118)
-    femmesh.addVolume([2630, 3038, 2627, 2631], 13119)
-    femmesh.addVolume([3040, 2632, 2629, 2631], 13120)
-    femmesh.addVolume([3077, 2282, 2285, 2286], 13121)
-    femmesh.addVolume([2286, 2287, 3079, 2284], 13122)
-    femmesh.addVolume([2440, 2439, 2822, 2442], 13123)
-    femmesh.addVolume([2822, 2442, 2439, 2438], 13124)
-    femmesh.addVolume([2475, 2858, 2478, 2474], 13125)
-    femmesh.addVolume([2478, 2476, 2858, 2475], 13126)
-    femmesh.addVolume([3113, 2318, 2321, 2322], 13127)
-    femmesh.addVolume([2320, 2322, 3115, 2323], 13128)
-    femmesh.addVolume([3002, 2591, 2594, 2595], 13129)
-    femmesh.addVolume([3004, 2596, 2593, 2595], 13130)
-    femmesh.addVolume([2877, 1219, 2500, 2880], 13131)
-    femmesh.addVolume([985, 2875, 2498, 2878], 13132)
-    femmesh.addVolume([2802, 2416, 1193, 2799], 13133)
-    femmesh.addVolume([2414, 2797, 2800, 959], 13134)
-    femmesh.addVolume([1002, 1003, 2926, 2669], 13135)
-    femmesh.addVolume([1004, 2934, 2668, 1005], 13136)
-    femmesh.addVolume([2702, 3166, 1274, 1273], 13137)
-    femmesh.addVolume([2715, 1165, 1166, 2946], 13138)
-    femmesh.addVolume([1280, 3182, 2719, 1281], 13139)
-    femmesh.addVolume([1194, 2805, 2422, 2802], 13140)
-    femmesh.addVolume([2803, 2420, 2800, 960], 13141)
-    femmesh.addVolume([984, 2872, 2492, 2875], 13142)
-    femmesh.addVolume([1218, 2874, 2877, 2494], 13143)
-    femmesh.addVolume([2704, 1266, 3172, 1267], 13144)
-    femmesh.addVolume([2900, 2903, 2523, 2899], 13145)
-    femmesh.addVolume([2903, 2523, 2901, 2900], 13146)
-    femmesh.addVolume([2778, 2394, 2777, 2780], 13147)
-    femmesh.addVolume([2394, 2776, 2777, 2780], 13148)
-    femmesh.addVolume([1302, 2709, 3163, 1301], 13149)
-    femmesh.addVolume([2624, 3035, 3032, 3036], 13150)
-    femmesh.addVolume([3034, 3036, 3037, 2626], 13151)
-    femmesh.addVolume([3085, 3084, 2290, 3082], 13152)
-    femmesh.addVolume([3080, 2288, 3083, 3084], 13153)
-    femmesh.addVolume([2517, 2516, 2893, 2897], 13154)
-    femmesh.addVolume([2895, 2518, 2517, 2897], 13155)
-    femmesh.addVolume([2783, 2784, 2398, 2400], 13156)
-    femmesh.addVolume([2783, 2782, 2400, 2396], 13157)
-    femmesh.addVolume([2825, 2828, 2826, 2445], 13158)
-    femmesh.addVolume([2828, 2445, 2825, 2824], 13159)
-    femmesh.addVolume([2472, 2852, 2855, 2851], 13160)
-    femmesh.addVolume([2852, 2472, 2855, 2853], 13161)
-    femmesh.addVolume([1288, 3174, 1287, 2711], 13162)
-    femmesh.addVolume([2317, 3111, 3109, 3112], 13163)
-    femmesh.addVolume([3110, 3107, 2315, 3111], 13164)
-    femmesh.addVolume([3007, 3010, 2599, 3009], 13165)
-    femmesh.addVolume([3005, 2597, 3008, 3009], 13166)
-    femmesh.addVolume([2668, 1100, 1101, 3161], 13167)
-    femmesh.addVolume([3040, 3042, 2632, 2631], 13168)
-    femmesh.addVolume([3042, 3038, 2630, 2631], 13169)
-    femmesh.addVolume([2282, 2286, 3077, 3078], 13170)
-    femmesh.addVolume([2286, 3079, 3078, 2284], 13171)
-    femmesh.addVolume([2710, 1169, 1170, 2957], 13172)
-    femmesh.addVolume([1123, 2666, 1122, 3168], 13173)
-    femmesh.addVolume([2927, 1031, 1032, 2667], 13174)
-    femmesh.addVolume([2478, 2859, 2858, 2476], 13175)
-    femmesh.addVolume([2474, 2858, 2478, 2857], 13176)
-    femmesh.addVolume([2822, 2440, 2820, 2439], 13177)
-    femmesh.addVolume([2818, 2822, 2439, 2438], 13178)
-    femmesh.addVolume([3117, 3113, 2321, 2322], 13179)
-    femmesh.addVolume([3115, 2322, 3117, 2323], 13180)
-    femmesh.addVolume([3003, 2591, 3002, 2595], 13181)
-    femmesh.addVolume([2593, 3003, 3004, 2595], 13182)
-    femmesh.addVolume([2698, 3164, 1269, 1268], 13183)
-    femmesh.addVolume([2339, 708, 1064, 2342], 13184)
-    femmesh.addVolume([2341, 837, 2344, 1327], 13185)
-    femmesh.addVolume([1240, 2575, 914, 2572], 13186)
-    femmesh.addVolume([2573, 1073, 785, 2570], 13187)
-    femmesh.addVolume([1153, 1154, 2697, 2940], 13188)
-    femmesh.addVolume([2678, 1105, 1106, 3159], 13189)
-    femmesh.addVolume([2898, 2521, 2518, 2520], 13190)
-    femmesh.addVolume([2896, 2516, 2519, 2520], 13191)
-    femmesh.addVolume([2781, 2398, 2395, 2397], 13192)
-    femmesh.addVolume([2396, 2397, 2779, 2393], 13193)
-    femmesh.addVolume([3039, 2629, 2628, 2631], 13194)
-    femmesh.addVolume([2628, 2627, 3039, 2631], 13195)
-    femmesh.addVolume([3081, 2285, 2289, 2286], 13196)
-    femmesh.addVolume([2286, 2289, 3081, 2287], 13197)
-    femmesh.addVolume([2442, 2438, 2821, 2441], 13198)
-    femmesh.addVolume([2475, 2474, 2471, 2854], 13199)
-    femmesh.addVolume([2473, 2856, 2476, 2475], 13200)
-    femmesh.addVolume([2823, 2443, 2440, 2442], 13201)
-    femmesh.addVolume([2935, 1162, 1161, 2711], 13202)
-    femmesh.addVolume([1038, 2943, 1037, 2680], 13203)
-    femmesh.addVolume([1114, 2675, 1113, 3182], 13204)
-    femmesh.addVolume([3162, 1287, 2725, 1286], 13205)
-    femmesh.addVolume([2318, 2322, 3114, 2319], 13206)
-    femmesh.addVolume([3114, 2319, 2322, 2320], 13207)
-    femmesh.addVolume([3006, 2594, 2598, 2595], 13208)
-    femmesh.addVolume([3006, 2598, 2596, 2595], 13209)
-    femmesh.addVolume([2367, 1334, 2750, 2749], 13210)
-    femmesh.addVolume([2752, 1333, 2550, 2754], 13211)
-    femmesh.addVolume([2550, 2751, 1333, 2752], 13212)
-    femmesh.addVolume([2749, 2367, 1334, 2747], 13213)
-    femmesh.addVolume([1154, 2945, 1155, 2719], 13214)
-    femmesh.addVolume([2524, 2901, 2904, 2903], 13215)
-    femmesh.addVolume([2903, 2902, 2522, 2899], 13216)
-    femmesh.addVolume([2778, 2392, 2775, 2777], 13217)
-    femmesh.addVolume([2390, 2776, 2773, 2777], 13218)
-    femmesh.addVolume([2625, 3036, 3032, 3033], 13219)
-    femmesh.addVolume([3034, 3036, 2625, 3033], 13220)
-    femmesh.addVolume([3083, 3084, 2292, 3087], 13221)
-    femmesh.addVolume([2292, 3087, 3084, 3085], 13222)
-    femmesh.addVolume([2649, 2966, 19, 2685], 13223)
-    femmesh.addVolume([2930, 1038, 1039, 2665], 13224)
-    femmesh.addVolume([2944, 1161, 1160, 2725], 13225)
-    femmesh.addVolume([2824, 2828, 2444, 2827], 13226)
-    femmesh.addVolume([2829, 2446, 2826, 2828], 13227)
-    femmesh.addVolume([2853, 2852, 2470, 2850], 13228)
-    femmesh.addVolume([2848, 2851, 2852, 2468], 13229)
-    femmesh.addVolume([3111, 3108, 2316, 3109], 13230)
-    femmesh.addVolume([2316, 3111, 3107, 3108], 13231)
-    femmesh.addVolume([3008, 2601, 3012, 3009], 13232)
-    femmesh.addVolume([3010, 3012, 2601, 3009], 13233)
-    femmesh.addVolume([2961, 1156, 1155, 2705], 13234)
-    femmesh.addVolume([1163, 2706, 1162, 2951], 13235)
-    femmesh.addVolume([2567, 2981, 1072, 2978], 13236)
-    femmesh.addVolume([2980, 1239, 2569, 2983], 13237)
-    femmesh.addVolume([3136, 2347, 3139, 1328], 13238)
-    femmesh.addVolume([1065, 3137, 3134, 2345], 13239)
-    femmesh.addVolume([1119, 2664, 1118, 3177], 13240)
-    femmesh.addVolume([2683, 1101, 1102, 3164], 13241)
-    femmesh.addVolume([2747, 2749, 2366, 2748], 13242)
-    femmesh.addVolume([2750, 2753, 2368, 2749], 13243)
-    femmesh.addVolume([2548, 2925, 2751, 2752], 13244)
-    femmesh.addVolume([2752, 2546, 2923, 2754], 13245)
-    femmesh.addVolume([1029, 2932, 2651, 1030], 13246)
-    femmesh.addVolume([2960, 1160, 1159, 2700], 13247)
-    femmesh.addVolume([1269, 1270, 3180, 2712], 13248)
-    femmesh.addVolume([1040, 3062, 3059, 2263], 13249)
-    femmesh.addVolume([2647, 1264, 3058, 3055], 13250)
-    femmesh.addVolume([3056, 2645, 3053, 1097], 13251)
-    femmesh.addVolume([3061, 2268, 3064, 1303], 13252)
-    femmesh.addVolume([1120, 2676, 1119, 3162], 13253)
-    femmesh.addVolume([2521, 2523, 2520, 2900], 13254)
-    femmesh.addVolume([2523, 2519, 2520, 2900], 13255)
-    femmesh.addVolume([2397, 2394, 2395, 2780], 13256)
-    femmesh.addVolume([2780, 2397, 2394, 2393], 13257)
-    femmesh.addVolume([2896, 2897, 2516, 2520], 13258)
-    femmesh.addVolume([2518, 2897, 2898, 2520], 13259)
-    femmesh.addVolume([2783, 2398, 2781, 2397], 13260)
-    femmesh.addVolume([2779, 2783, 2397, 2396], 13261)
-    femmesh.addVolume([3037, 2628, 2629, 2626], 13262)
-    femmesh.addVolume([2627, 3035, 2624, 2628], 13263)
-    femmesh.addVolume([3082, 2289, 2290, 2287], 13264)
-    femmesh.addVolume([2285, 2288, 3080, 2289], 13265)
-    femmesh.addVolume([3131, 1063, 2336, 3128], 13266)
-    femmesh.addVolume([3130, 2338, 3133, 1326], 13267)
-    femmesh.addVolume([1241, 2986, 2989, 2578], 13268)
-    femmesh.addVolume([2984, 1074, 2987, 2576], 13269)
-    femmesh.addVolume([2526, 2903, 2906, 2902], 13270)
-    femmesh.addVolume([2906, 2904, 2903, 2526], 13271)
-    femmesh.addVolume([2777, 2774, 2773, 2391], 13272)
-    femmesh.addVolume([2777, 2775, 2774, 2391], 13273)
-    femmesh.addVolume([1133, 1134, 2680, 3152], 13274)
-    femmesh.addVolume([2855, 2473, 2472, 2475], 13275)
-    femmesh.addVolume([2855, 2475, 2472, 2471], 13276)
-    femmesh.addVolume([2445, 2443, 2825, 2442], 13277)
-    femmesh.addVolume([2442, 2825, 2445, 2441], 13278)
-    femmesh.addVolume([3034, 2623, 3031, 3033], 13279)
-    femmesh.addVolume([3029, 2621, 3032, 3033], 13280)
-    femmesh.addVolume([2291, 3086, 3083, 3087], 13281)
-    femmesh.addVolume([3087, 3085, 2293, 3088], 13282)
-    femmesh.addVolume([3039, 2627, 3038, 2631], 13283)
-    femmesh.addVolume([3039, 3040, 2629, 2631], 13284)
-    femmesh.addVolume([2285, 3081, 3077, 2286], 13285)
-    femmesh.addVolume([3081, 3079, 2286, 2287], 13286)
-    femmesh.addVolume([2852, 2850, 2849, 2469], 13287)
-    femmesh.addVolume([2852, 2469, 2849, 2848], 13288)
-    femmesh.addVolume([2828, 2831, 2448, 2827], 13289)
-    femmesh.addVolume([2829, 2448, 2828, 2831], 13290)
-    femmesh.addVolume([2319, 3112, 2317, 2320], 13291)
-    femmesh.addVolume([2315, 2318, 3110, 2319], 13292)
-    femmesh.addVolume([2597, 2594, 2598, 3005], 13293)
-    femmesh.addVolume([2598, 3007, 2596, 2599], 13294)
-    femmesh.addVolume([2314, 3108, 3106, 3109], 13295)
-    femmesh.addVolume([3107, 3104, 2312, 3108], 13296)
-    femmesh.addVolume([3010, 2602, 3012, 3013], 13297)
-    femmesh.addVolume([3012, 2600, 3008, 3011], 13298)
-    femmesh.addVolume([2821, 2442, 2822, 2438], 13299)
-    femmesh.addVolume([2440, 2822, 2823, 2442], 13300)
-    femmesh.addVolume([2474, 2475, 2858, 2854], 13301)
-    femmesh.addVolume([2858, 2476, 2856, 2475], 13302)
-    femmesh.addVolume([1018, 1019, 2961, 2661], 13303)
-    femmesh.addVolume([2753, 2756, 2370, 2749], 13304)
-    femmesh.addVolume([2370, 2749, 2756, 2748], 13305)
-    femmesh.addVolume([2547, 2924, 2925, 2752], 13306)
-    femmesh.addVolume([2752, 2547, 2924, 2923], 13307)
-    femmesh.addVolume([3114, 2318, 3113, 2322], 13308)
-    femmesh.addVolume([3115, 3114, 2322, 2320], 13309)
-    femmesh.addVolume([2594, 3006, 3002, 2595], 13310)
-    femmesh.addVolume([3006, 2596, 3004, 2595], 13311)
-    femmesh.addVolume([2648, 18, 2965, 2684], 13312)
-    femmesh.addVolume([2902, 2906, 2525, 2905], 13313)
-    femmesh.addVolume([2907, 2527, 2904, 2906], 13314)
-    femmesh.addVolume([2770, 2774, 2387, 2773], 13315)
-    femmesh.addVolume([2774, 2775, 2772, 2389], 13316)
-    femmesh.addVolume([2622, 3030, 3031, 3033], 13317)
-    femmesh.addVolume([3030, 2622, 3029, 3033], 13318)
-    femmesh.addVolume([3087, 2295, 3086, 3090], 13319)
-    femmesh.addVolume([3090, 3087, 2295, 3088], 13320)
-    femmesh.addVolume([2831, 2447, 2827, 2830], 13321)
-    femmesh.addVolume([2829, 2832, 2449, 2831], 13322)
-    femmesh.addVolume([2849, 2467, 2850, 2847], 13323)
-    femmesh.addVolume([2848, 2849, 2845, 2465], 13324)
-    femmesh.addVolume([3105, 2313, 3108, 3106], 13325)
-    femmesh.addVolume([3108, 3104, 2313, 3105], 13326)
-    femmesh.addVolume([3012, 2604, 3015, 3013], 13327)
-    femmesh.addVolume([2604, 3012, 3015, 3011], 13328)
-    femmesh.addVolume([2371, 2753, 2757, 2756], 13329)
-    femmesh.addVolume([2755, 2756, 2748, 2369], 13330)
-    femmesh.addVolume([2543, 2924, 2923, 2920], 13331)
-    femmesh.addVolume([2922, 2925, 2545, 2924], 13332)
-    femmesh.addVolume([2521, 2901, 2524, 2523], 13333)
-    femmesh.addVolume([2522, 2519, 2523, 2899], 13334)
-    femmesh.addVolume([2395, 2392, 2778, 2394], 13335)
-    femmesh.addVolume([2394, 2390, 2776, 2393], 13336)
-    femmesh.addVolume([3036, 2625, 2628, 2626], 13337)
-    femmesh.addVolume([2628, 3036, 2624, 2625], 13338)
-    femmesh.addVolume([3084, 2289, 2292, 2290], 13339)
-    femmesh.addVolume([2292, 2288, 2289, 3084], 13340)
-    femmesh.addVolume([1099, 1100, 2659, 3172], 13341)
-    femmesh.addVolume([2443, 2826, 2446, 2445], 13342)
-    femmesh.addVolume([2445, 2444, 2441, 2824], 13343)
-    femmesh.addVolume([2472, 2470, 2473, 2853], 13344)
-    femmesh.addVolume([2472, 2468, 2851, 2471], 13345)
-    femmesh.addVolume([2368, 2365, 2750, 2367], 13346)
-    femmesh.addVolume([2366, 2363, 2367, 2747], 13347)
-    femmesh.addVolume([2546, 2550, 2549, 2754], 13348)
-    femmesh.addVolume([2751, 2551, 2548, 2550], 13349)
-    femmesh.addVolume([1334, 2365, 2364, 2367], 13350)
-    femmesh.addVolume([2367, 2364, 1334, 2363], 13351)
-    femmesh.addVolume([2553, 2551, 1333, 2550], 13352)
-    femmesh.addVolume([2553, 2550, 1333, 2549], 13353)
-    femmesh.addVolume([2315, 2319, 3111, 2316], 13354)
-    femmesh.addVolume([3111, 2316, 2319, 2317], 13355)
-    femmesh.addVolume([2598, 2599, 2601, 3009], 13356)
-    femmesh.addVolume([2601, 2597, 2598, 3009], 13357)
-    femmesh.addVolume([2501, 986, 2878, 2881], 13358)
-    femmesh.addVolume([2503, 2880, 1220, 2883], 13359)
-    femmesh.addVolume([2794, 2797, 2411, 958], 13360)
-    femmesh.addVolume([2413, 1192, 2799, 2796], 13361)
-    femmesh.addVolume([2906, 2909, 2529, 2905], 13362)
-    femmesh.addVolume([2907, 2529, 2906, 2909], 13363)
-    femmesh.addVolume([2774, 2771, 2770, 2388], 13364)
-    femmesh.addVolume([2771, 2774, 2772, 2388], 13365)
-    femmesh.addVolume([1098, 1099, 2669, 3148], 13366)
-    femmesh.addVolume([3029, 3026, 2618, 3030], 13367)
-    femmesh.addVolume([3028, 3030, 3031, 2620], 13368)
-    femmesh.addVolume([3091, 3090, 2296, 3088], 13369)
-    femmesh.addVolume([3086, 2294, 3089, 3090], 13370)
-    femmesh.addVolume([1176, 2709, 1175, 2930], 13371)
-    femmesh.addVolume([2451, 2832, 2834, 2831], 13372)
-    femmesh.addVolume([2831, 2834, 2451, 2830], 13373)
-    femmesh.addVolume([2466, 2846, 2849, 2845], 13374)
-    femmesh.addVolume([2466, 2847, 2849, 2846], 13375)
-    femmesh.addVolume([3104, 3101, 2309, 3105], 13376)
-    femmesh.addVolume([3103, 3105, 3106, 2311], 13377)
-    femmesh.addVolume([3015, 2603, 3011, 3014], 13378)
-    femmesh.addVolume([3015, 2605, 3016, 3013], 13379)
-    femmesh.addVolume([2521, 2520, 2898, 2900], 13380)
-    femmesh.addVolume([2896, 2520, 2519, 2900], 13381)
-    femmesh.addVolume([2397, 2395, 2781, 2780], 13382)
-    femmesh.addVolume([2779, 2397, 2780, 2393], 13383)
-    femmesh.addVolume([2373, 2757, 2759, 2756], 13384)
-    femmesh.addVolume([2756, 2759, 2373, 2755], 13385)
-    femmesh.addVolume([2924, 2922, 2921, 2544], 13386)
-    femmesh.addVolume([2544, 2921, 2924, 2920], 13387)
-    femmesh.addVolume([2805, 1195, 2425, 2808], 13388)
-    femmesh.addVolume([2806, 2423, 2803, 961], 13389)
-    femmesh.addVolume([2872, 983, 2489, 2869], 13390)
-    femmesh.addVolume([2874, 2871, 2491, 1217], 13391)
-    femmesh.addVolume([2629, 3039, 2628, 3037], 13392)
-    femmesh.addVolume([3039, 3035, 2627, 2628], 13393)
-    femmesh.addVolume([2289, 3080, 2285, 3081], 13394)
-    femmesh.addVolume([3082, 3081, 2289, 2287], 13395)
-    femmesh.addVolume([2821, 2825, 2442, 2441], 13396)
-    femmesh.addVolume([2825, 2443, 2823, 2442], 13397)
-    femmesh.addVolume([2471, 2855, 2475, 2854], 13398)
-    femmesh.addVolume([2856, 2473, 2855, 2475], 13399)
-    femmesh.addVolume([3112, 2319, 3114, 2320], 13400)
-    femmesh.addVolume([2318, 3114, 3110, 2319], 13401)
-    femmesh.addVolume([3007, 2598, 2596, 3006], 13402)
-    femmesh.addVolume([3005, 2594, 2598, 3006], 13403)
-    femmesh.addVolume([2903, 2526, 2523, 2522], 13404)
-    femmesh.addVolume([2524, 2523, 2903, 2526], 13405)
-    femmesh.addVolume([2394, 2392, 2777, 2391], 13406)
-    femmesh.addVolume([2390, 2394, 2777, 2391], 13407)
-    femmesh.addVolume([2905, 2909, 2528, 2908], 13408)
-    femmesh.addVolume([2530, 2907, 2910, 2909], 13409)
-    femmesh.addVolume([2770, 2767, 2384, 2771], 13410)
-    femmesh.addVolume([2769, 2772, 2386, 2771], 13411)
-    femmesh.addVolume([2623, 2625, 3034, 2626], 13412)
-    femmesh.addVolume([2624, 3032, 2621, 2625], 13413)
-    femmesh.addVolume([2293, 2292, 2290, 3085], 13414)
-    femmesh.addVolume([3083, 2288, 2291, 2292], 13415)
-    femmesh.addVolume([2298, 3093, 3089, 3090], 13416)
-    femmesh.addVolume([3027, 3026, 3030, 2619], 13417)
-    femmesh.addVolume([3030, 3028, 3027, 2619], 13418)
-    femmesh.addVolume([3090, 2298, 3093, 3091], 13419)
-    femmesh.addVolume([2846, 2842, 2845, 2462], 13420)
-    femmesh.addVolume([2844, 2847, 2464, 2846], 13421)
-    femmesh.addVolume([2834, 2833, 2450, 2830], 13422)
-    femmesh.addVolume([2832, 2835, 2452, 2834], 13423)
-    femmesh.addVolume([2570, 2981, 784, 2567], 13424)
-    femmesh.addVolume([2983, 913, 2569, 2572], 13425)
-    femmesh.addVolume([838, 3136, 2347, 2344], 13426)
-    femmesh.addVolume([709, 3134, 2342, 2345], 13427)
-    femmesh.addVolume([2445, 2828, 2448, 2444], 13428)
-    femmesh.addVolume([2448, 2446, 2828, 2445], 13429)
-    femmesh.addVolume([2470, 2852, 2472, 2469], 13430)
-    femmesh.addVolume([2469, 2852, 2472, 2468], 13431)
-    femmesh.addVolume([2310, 3101, 3102, 3105], 13432)
-    femmesh.addVolume([3105, 3102, 2310, 3103], 13433)
-    femmesh.addVolume([3015, 3014, 3018, 2607], 13434)
-    femmesh.addVolume([3018, 3016, 3015, 2607], 13435)
-    femmesh.addVolume([3058, 2266, 939, 2647], 13436)
-    femmesh.addVolume([2269, 3056, 810, 2645], 13437)
-    femmesh.addVolume([2262, 683, 3059, 2263], 13438)
-    femmesh.addVolume([2265, 812, 2268, 3061], 13439)
-    femmesh.addVolume([2757, 2760, 2374, 2759], 13440)
-    femmesh.addVolume([2759, 2372, 2755, 2758], 13441)
-    femmesh.addVolume([2921, 2922, 2919, 2542], 13442)
-    femmesh.addVolume([2921, 2917, 2920, 2540], 13443)
-    femmesh.addVolume([2312, 2315, 3107, 2316], 13444)
-    femmesh.addVolume([2316, 3109, 2314, 2317], 13445)
-    femmesh.addVolume([3008, 2601, 2597, 2600], 13446)
-    femmesh.addVolume([2602, 2601, 2599, 3010], 13447)
-    femmesh.addVolume([2749, 2370, 2367, 2366], 13448)
-    femmesh.addVolume([2367, 2368, 2370, 2749], 13449)
-    femmesh.addVolume([2752, 2550, 2547, 2546], 13450)
-    femmesh.addVolume([2550, 2547, 2548, 2752], 13451)
-    femmesh.addVolume([2909, 2910, 2532, 2912], 13452)
-    femmesh.addVolume([2912, 2532, 2909, 2908], 13453)
-    femmesh.addVolume([2769, 2385, 2768, 2771], 13454)
-    femmesh.addVolume([2767, 2768, 2385, 2771], 13455)
-    femmesh.addVolume([3027, 2617, 3028, 3025], 13456)
-    femmesh.addVolume([3023, 3026, 3027, 2615], 13457)
-    femmesh.addVolume([3093, 3094, 3091, 2299], 13458)
-    femmesh.addVolume([3092, 3089, 2297, 3093], 13459)
-    femmesh.addVolume([2846, 2844, 2843, 2463], 13460)
-    femmesh.addVolume([2463, 2843, 2846, 2842], 13461)
-    femmesh.addVolume([2837, 2454, 2834, 2833], 13462)
-    femmesh.addVolume([2834, 2835, 2454, 2837], 13463)
-    femmesh.addVolume([3100, 3102, 3103, 2308], 13464)
-    femmesh.addVolume([2306, 3101, 3098, 3102], 13465)
-    femmesh.addVolume([3018, 3019, 3016, 2608], 13466)
-    femmesh.addVolume([3017, 3018, 3014, 2606], 13467)
-    femmesh.addVolume([2759, 2762, 2760, 2376], 13468)
-    femmesh.addVolume([2762, 2376, 2759, 2758], 13469)
-    femmesh.addVolume([2919, 2921, 2541, 2918], 13470)
-    femmesh.addVolume([2918, 2921, 2541, 2917], 13471)
-    femmesh.addVolume([707, 2336, 2339, 3131], 13472)
-    femmesh.addVolume([2341, 836, 3133, 2338], 13473)
-    femmesh.addVolume([2576, 2984, 786, 2573], 13474)
-    femmesh.addVolume([2575, 2986, 915, 2578], 13475)
-    femmesh.addVolume([1282, 3165, 1281, 2705], 13476)
-    femmesh.addVolume([2533, 2910, 2913, 2912], 13477)
-    femmesh.addVolume([2912, 2911, 2531, 2908], 13478)
-    femmesh.addVolume([2768, 2764, 2767, 2381], 13479)
-    femmesh.addVolume([2768, 2766, 2383, 2769], 13480)
-    femmesh.addVolume([2301, 3096, 3092, 3093], 13481)
-    femmesh.addVolume([2616, 3027, 3024, 3025], 13482)
-    femmesh.addVolume([3023, 3027, 3024, 2616], 13483)
-    femmesh.addVolume([3093, 2301, 3096, 3094], 13484)
-    femmesh.addVolume([2843, 2839, 2842, 2459], 13485)
-    femmesh.addVolume([2841, 2843, 2844, 2461], 13486)
-    femmesh.addVolume([2836, 2837, 2833, 2453], 13487)
-    femmesh.addVolume([2835, 2838, 2455, 2837], 13488)
-    femmesh.addVolume([3102, 3099, 2307, 3100], 13489)
-    femmesh.addVolume([2307, 3102, 3098, 3099], 13490)
-    femmesh.addVolume([3017, 3018, 2610, 3021], 13491)
-    femmesh.addVolume([3019, 2610, 3018, 3021], 13492)
-    femmesh.addVolume([2761, 2762, 2758, 2375], 13493)
-    femmesh.addVolume([2377, 2760, 2763, 2762], 13494)
-    femmesh.addVolume([2537, 2918, 2917, 2914], 13495)
-    femmesh.addVolume([2919, 2539, 2916, 2918], 13496)
-    femmesh.addVolume([2904, 2527, 2524, 2526], 13497)
-    femmesh.addVolume([2522, 2526, 2525, 2902], 13498)
-    femmesh.addVolume([2773, 2387, 2390, 2391], 13499)
-    femmesh.addVolume([2389, 2775, 2392, 2391], 13500)
-    femmesh.addVolume([1024, 2676, 2944, 1023], 13501)
-    femmesh.addVolume([2292, 2295, 3087, 2293], 13502)
-    femmesh.addVolume([2291, 3087, 2292, 2295], 13503)
-    femmesh.addVolume([2622, 2623, 2625, 3033], 13504)
-    femmesh.addVolume([2621, 2622, 2625, 3033], 13505)
-    femmesh.addVolume([2912, 2915, 2535, 2911], 13506)
-    femmesh.addVolume([2535, 2913, 2915, 2912], 13507)
-    femmesh.addVolume([2766, 2768, 2382, 2765], 13508)
-    femmesh.addVolume([2764, 2382, 2768, 2765], 13509)
-    femmesh.addVolume([2827, 2448, 2444, 2447], 13510)
-    femmesh.addVolume([2470, 2467, 2850, 2469], 13511)
-    femmesh.addVolume([2469, 2465, 2848, 2468], 13512)
-    femmesh.addVolume([2449, 2446, 2829, 2448], 13513)
-    femmesh.addVolume([3094, 3096, 3097, 2302], 13514)
-    femmesh.addVolume([3092, 2300, 3095, 3096], 13515)
-    femmesh.addVolume([3024, 3020, 3023, 2612], 13516)
-    femmesh.addVolume([3022, 3024, 3025, 2614], 13517)
-    femmesh.addVolume([2837, 2840, 2838, 2457], 13518)
-    femmesh.addVolume([2457, 2837, 2840, 2836], 13519)
-    femmesh.addVolume([2843, 2840, 2460, 2841], 13520)
-    femmesh.addVolume([2840, 2843, 2460, 2839], 13521)
-    femmesh.addVolume([2303, 3098, 3095, 3099], 13522)
-    femmesh.addVolume([3097, 3099, 3100, 2305], 13523)
-    femmesh.addVolume([3022, 3019, 3021, 2611], 13524)
-    femmesh.addVolume([3017, 2609, 3020, 3021], 13525)
-    femmesh.addVolume([2761, 2762, 2379, 2765], 13526)
-    femmesh.addVolume([2915, 2918, 2538, 2914], 13527)
-    femmesh.addVolume([2538, 2915, 2916, 2918], 13528)
-    femmesh.addVolume([2379, 2762, 2763, 2765], 13529)
-    femmesh.addVolume([2313, 2316, 2312, 3108], 13530)
-    femmesh.addVolume([2316, 3108, 2313, 2314], 13531)
-    femmesh.addVolume([2604, 3012, 2601, 2602], 13532)
-    femmesh.addVolume([2604, 2601, 3012, 2600], 13533)
-    femmesh.addVolume([2915, 2914, 2534, 2911], 13534)
-    femmesh.addVolume([2916, 2536, 2913, 2915], 13535)
-    femmesh.addVolume([2766, 2380, 2763, 2765], 13536)
-    femmesh.addVolume([2761, 2378, 2764, 2765], 13537)
-    femmesh.addVolume([3096, 2304, 3095, 3099], 13538)
-    femmesh.addVolume([3020, 2613, 3024, 3021], 13539)
-    femmesh.addVolume([3021, 2613, 3024, 3022], 13540)
-    femmesh.addVolume([3099, 3096, 2304, 3097], 13541)
-    femmesh.addVolume([2840, 2458, 2841, 2838], 13542)
-    femmesh.addVolume([2840, 2456, 2836, 2839], 13543)
-    femmesh.addVolume([2977, 1238, 2566, 2980], 13544)
-    femmesh.addVolume([2975, 1071, 2978, 2564], 13545)
-    femmesh.addVolume([3142, 3139, 2350, 1329], 13546)
-    femmesh.addVolume([2348, 1066, 3137, 3140], 13547)
-    femmesh.addVolume([2748, 2370, 2366, 2369], 13548)
-    femmesh.addVolume([2371, 2368, 2753, 2370], 13549)
-    femmesh.addVolume([2925, 2545, 2547, 2548], 13550)
-    femmesh.addVolume([2546, 2547, 2923, 2543], 13551)
-    femmesh.addVolume([1285, 3177, 2700, 1286], 13552)
-    femmesh.addVolume([2519, 2900, 2523, 2899], 13553)
-    femmesh.addVolume([2523, 2521, 2901, 2900], 13554)
-    femmesh.addVolume([2776, 2780, 2394, 2393], 13555)
-    femmesh.addVolume([2394, 2778, 2395, 2780], 13556)
-    femmesh.addVolume([1022, 2960, 2664, 1023], 13557)
-    femmesh.addVolume([3036, 2624, 3035, 2628], 13558)
-    femmesh.addVolume([2628, 3037, 3036, 2626], 13559)
-    femmesh.addVolume([2289, 2288, 3080, 3084], 13560)
-    femmesh.addVolume([2290, 3084, 2289, 3082], 13561)
-    femmesh.addVolume([2272, 3067, 3064, 1304], 13562)
-    femmesh.addVolume([3050, 3053, 2642, 1096], 13563)
-    femmesh.addVolume([1263, 2644, 3052, 3055], 13564)
-    femmesh.addVolume([3062, 1041, 3065, 2270], 13565)
-    femmesh.addVolume([2443, 2825, 2826, 2445], 13566)
-    femmesh.addVolume([2441, 2825, 2445, 2824], 13567)
-    femmesh.addVolume([2472, 2851, 2855, 2471], 13568)
-    femmesh.addVolume([2473, 2855, 2472, 2853], 13569)
-    femmesh.addVolume([3110, 3111, 2315, 2319], 13570)
-    femmesh.addVolume([3111, 2317, 2319, 3112], 13571)
-    femmesh.addVolume([2599, 2598, 3007, 3009], 13572)
-    femmesh.addVolume([2597, 3005, 2598, 3009], 13573)
-    femmesh.addVolume([2333, 1062, 3125, 3128], 13574)
-    femmesh.addVolume([3130, 3127, 2335, 1325], 13575)
-    femmesh.addVolume([1075, 2990, 2987, 2579], 13576)
-    femmesh.addVolume([1242, 2989, 2992, 2581], 13577)
-    femmesh.addVolume([2529, 2527, 2906, 2526], 13578)
-    femmesh.addVolume([2526, 2906, 2529, 2525], 13579)
-    femmesh.addVolume([2388, 2774, 2389, 2391], 13580)
-    femmesh.addVolume([2774, 2388, 2387, 2391], 13581)
-    femmesh.addVolume([3086, 2291, 2294, 2295], 13582)
-    femmesh.addVolume([2296, 2295, 2293, 3088], 13583)
-    femmesh.addVolume([2621, 3029, 2618, 2622], 13584)
-    femmesh.addVolume([3031, 2623, 2620, 2622], 13585)
-    femmesh.addVolume([2831, 2451, 2448, 2447], 13586)
-    femmesh.addVolume([2449, 2451, 2448, 2831], 13587)
-    femmesh.addVolume([2469, 2466, 2849, 2465], 13588)
-    femmesh.addVolume([2467, 2466, 2849, 2469], 13589)
-    femmesh.addVolume([3104, 2309, 2312, 2313], 13590)
-    femmesh.addVolume([2311, 2313, 3106, 2314], 13591)
-    femmesh.addVolume([2605, 2604, 2602, 3013], 13592)
-    femmesh.addVolume([3011, 2604, 2600, 2603], 13593)
-    femmesh.addVolume([2756, 2373, 2370, 2369], 13594)
-    femmesh.addVolume([2370, 2371, 2373, 2756], 13595)
-    femmesh.addVolume([2924, 2547, 2545, 2544], 13596)
-    femmesh.addVolume([2547, 2544, 2924, 2543], 13597)
-    femmesh.addVolume([761, 2878, 2498, 2501], 13598)
-    femmesh.addVolume([2500, 2880, 890, 2503], 13599)
-    femmesh.addVolume([732, 2797, 2411, 2414], 13600)
-    femmesh.addVolume([2799, 2416, 861, 2413], 13601)
-    femmesh.addVolume([1334, 2750, 2365, 2367], 13602)
-    femmesh.addVolume([2549, 2550, 1333, 2754], 13603)
-    femmesh.addVolume([2363, 1334, 2367, 2747], 13604)
-    femmesh.addVolume([1333, 2551, 2751, 2550], 13605)
-    femmesh.addVolume([2422, 864, 2425, 2805], 13606)
-    femmesh.addVolume([2420, 735, 2803, 2423], 13607)
-    femmesh.addVolume([758, 2489, 2492, 2872], 13608)
-    femmesh.addVolume([2491, 2874, 887, 2494], 13609)
-    femmesh.addVolume([2525, 2529, 2528, 2905], 13610)
-    femmesh.addVolume([2907, 2530, 2527, 2529], 13611)
-    femmesh.addVolume([2386, 2772, 2389, 2388], 13612)
-    femmesh.addVolume([2387, 2770, 2384, 2388], 13613)
-    femmesh.addVolume([1017, 1018, 2945, 2675], 13614)
-    femmesh.addVolume([2622, 3030, 2618, 2619], 13615)
-    femmesh.addVolume([3030, 2622, 2620, 2619], 13616)
-    femmesh.addVolume([2298, 3090, 2295, 2296], 13617)
-    femmesh.addVolume([2295, 2298, 2294, 3090], 13618)
-    femmesh.addVolume([2451, 2450, 2447, 2830], 13619)
-    femmesh.addVolume([2449, 2832, 2452, 2451], 13620)
-    femmesh.addVolume([2464, 2467, 2466, 2847], 13621)
-    femmesh.addVolume([2466, 2462, 2845, 2465], 13622)
-    femmesh.addVolume([2310, 2313, 2309, 3105], 13623)
-    femmesh.addVolume([2313, 3105, 2310, 2311], 13624)
-    femmesh.addVolume([2605, 2604, 3015, 2607], 13625)
-    femmesh.addVolume([2603, 3015, 2604, 2607], 13626)
-    femmesh.addVolume([2757, 2374, 2371, 2373], 13627)
-    femmesh.addVolume([2373, 2369, 2755, 2372], 13628)
-    femmesh.addVolume([2542, 2922, 2545, 2544], 13629)
-    femmesh.addVolume([2544, 2920, 2543, 2540], 13630)
-    femmesh.addVolume([2903, 2524, 2901, 2523], 13631)
-    femmesh.addVolume([2522, 2523, 2903, 2899], 13632)
-    femmesh.addVolume([2777, 2778, 2392, 2394], 13633)
-    femmesh.addVolume([2777, 2390, 2776, 2394], 13634)
-    femmesh.addVolume([3036, 3032, 2624, 2625], 13635)
-    femmesh.addVolume([3034, 2625, 3036, 2626], 13636)
-    femmesh.addVolume([2288, 2292, 3083, 3084], 13637)
-    femmesh.addVolume([3084, 2290, 2292, 3085], 13638)
-    femmesh.addVolume([2444, 2445, 2828, 2824], 13639)
-    femmesh.addVolume([2828, 2446, 2826, 2445], 13640)
-    femmesh.addVolume([2470, 2472, 2852, 2853], 13641)
-    femmesh.addVolume([2852, 2851, 2472, 2468], 13642)
-    femmesh.addVolume([1221, 2883, 2886, 2506], 13643)
-    femmesh.addVolume([987, 2884, 2881, 2504], 13644)
-    femmesh.addVolume([2408, 2791, 2794, 957], 13645)
-    femmesh.addVolume([2796, 2410, 1191, 2793], 13646)
-    femmesh.addVolume([2532, 2529, 2530, 2909], 13647)
-    femmesh.addVolume([2529, 2909, 2532, 2528], 13648)
-    femmesh.addVolume([2771, 2386, 2385, 2388], 13649)
-    femmesh.addVolume([2771, 2385, 2384, 2388], 13650)
-    femmesh.addVolume([3028, 2619, 2620, 2617], 13651)
-    femmesh.addVolume([3026, 2615, 2618, 2619], 13652)
-    femmesh.addVolume([3091, 2296, 2298, 2299], 13653)
-    femmesh.addVolume([3089, 2297, 2298, 2294], 13654)
-    femmesh.addVolume([3111, 3107, 2315, 2316], 13655)
-    femmesh.addVolume([3109, 2316, 3111, 2317], 13656)
-    femmesh.addVolume([3008, 2597, 2601, 3009], 13657)
-    femmesh.addVolume([3010, 2601, 2599, 3009], 13658)
-    femmesh.addVolume([2846, 2466, 2464, 2463], 13659)
-    femmesh.addVolume([2452, 2834, 2454, 2451], 13660)
-    femmesh.addVolume([2454, 2451, 2834, 2450], 13661)
-    femmesh.addVolume([2466, 2463, 2846, 2462], 13662)
-    femmesh.addVolume([2310, 2311, 3103, 2308], 13663)
-    femmesh.addVolume([2306, 2309, 3101, 2310], 13664)
-    femmesh.addVolume([2603, 2606, 3014, 2607], 13665)
-    femmesh.addVolume([2605, 2607, 3016, 2608], 13666)
-    femmesh.addVolume([2373, 2759, 2376, 2372], 13667)
-    femmesh.addVolume([2376, 2374, 2759, 2373], 13668)
-    femmesh.addVolume([2921, 2542, 2541, 2544], 13669)
-    femmesh.addVolume([2921, 2544, 2541, 2540], 13670)
-    femmesh.addVolume([2749, 2366, 2367, 2747], 13671)
-    femmesh.addVolume([2368, 2367, 2750, 2749], 13672)
-    femmesh.addVolume([2546, 2752, 2550, 2754], 13673)
-    femmesh.addVolume([2751, 2550, 2548, 2752], 13674)
-    femmesh.addVolume([2808, 2811, 1196, 2428], 13675)
-    femmesh.addVolume([2809, 2426, 2806, 962], 13676)
-    femmesh.addVolume([982, 2486, 2869, 2866], 13677)
-    femmesh.addVolume([2868, 2488, 2871, 1216], 13678)
-    femmesh.addVolume([2530, 2910, 2533, 2532], 13679)
-    femmesh.addVolume([2528, 2532, 2531, 2908], 13680)
-    femmesh.addVolume([2383, 2386, 2385, 2769], 13681)
-    femmesh.addVolume([2385, 2381, 2767, 2384], 13682)
-    femmesh.addVolume([3093, 2298, 2301, 2299], 13683)
-    femmesh.addVolume([2619, 3027, 2616, 2617], 13684)
-    femmesh.addVolume([2301, 2297, 2298, 3093], 13685)
-    femmesh.addVolume([3027, 2616, 2615, 2619], 13686)
-    femmesh.addVolume([2461, 2844, 2464, 2463], 13687)
-    femmesh.addVolume([2462, 2463, 2842, 2459], 13688)
-    femmesh.addVolume([2835, 2455, 2452, 2454], 13689)
-    femmesh.addVolume([2833, 2454, 2450, 2453], 13690)
-    femmesh.addVolume([2310, 3102, 2307, 2308], 13691)
-    femmesh.addVolume([2307, 2306, 3102, 2310], 13692)
-    femmesh.addVolume([3018, 2606, 2610, 2607], 13693)
-    femmesh.addVolume([2607, 2610, 3018, 2608], 13694)
-    femmesh.addVolume([2758, 2376, 2372, 2375], 13695)
-    femmesh.addVolume([2377, 2374, 2760, 2376], 13696)
-    femmesh.addVolume([2919, 2539, 2541, 2542], 13697)
-    femmesh.addVolume([2540, 2541, 2917, 2537], 13698)
-    femmesh.addVolume([2701, 2715, 1291, 3195], 13699)
-    femmesh.addVolume([2768, 2385, 2382, 2381], 13700)
-    femmesh.addVolume([2385, 2768, 2382, 2383], 13701)
-    femmesh.addVolume([2535, 2532, 2533, 2912], 13702)
-    femmesh.addVolume([2912, 2535, 2532, 2531], 13703)
-    femmesh.addVolume([2300, 3092, 2297, 2301], 13704)
-    femmesh.addVolume([2299, 2301, 3094, 2302], 13705)
-    femmesh.addVolume([3023, 2612, 2615, 2616], 13706)
-    femmesh.addVolume([3025, 2616, 2617, 2614], 13707)
-    femmesh.addVolume([2837, 2455, 2454, 2457], 13708)
-    femmesh.addVolume([2457, 2454, 2837, 2453], 13709)
-    femmesh.addVolume([2843, 2461, 2460, 2463], 13710)
-    femmesh.addVolume([2843, 2463, 2460, 2459], 13711)
-    femmesh.addVolume([2305, 2307, 3100, 2308], 13712)
-    femmesh.addVolume([2306, 3098, 2303, 2307], 13713)
-    femmesh.addVolume([2609, 2610, 3017, 2606], 13714)
-    femmesh.addVolume([2611, 3019, 2610, 2608], 13715)
-    femmesh.addVolume([2379, 2376, 2762, 2375], 13716)
-    femmesh.addVolume([2762, 2379, 2377, 2376], 13717)
-    femmesh.addVolume([2918, 2541, 2538, 2537], 13718)
-    femmesh.addVolume([2538, 2539, 2541, 2918], 13719)
-    femmesh.addVolume([2566, 912, 2569, 2980], 13720)
-    femmesh.addVolume([2978, 783, 2567, 2564], 13721)
-    femmesh.addVolume([2347, 839, 2350, 3139], 13722)
-    femmesh.addVolume([2345, 710, 3137, 2348], 13723)
-    femmesh.addVolume([2382, 2378, 2764, 2381], 13724)
-    femmesh.addVolume([2382, 2380, 2383, 2766], 13725)
-    femmesh.addVolume([2531, 2535, 2534, 2911], 13726)
-    femmesh.addVolume([2913, 2536, 2533, 2535], 13727)
-    femmesh.addVolume([2301, 2300, 3096, 2304], 13728)
-    femmesh.addVolume([2304, 3096, 2301, 2302], 13729)
-    femmesh.addVolume([2613, 2616, 3024, 2614], 13730)
-    femmesh.addVolume([2612, 3024, 2613, 2616], 13731)
-    femmesh.addVolume([2839, 2460, 2456, 2459], 13732)
-    femmesh.addVolume([2458, 2455, 2838, 2457], 13733)
-    femmesh.addVolume([2456, 2457, 2836, 2453], 13734)
-    femmesh.addVolume([2460, 2461, 2841, 2458], 13735)
-    femmesh.addVolume([2307, 3099, 2304, 2305], 13736)
-    femmesh.addVolume([2303, 2304, 2307, 3099], 13737)
-    femmesh.addVolume([2609, 2610, 2613, 3021], 13738)
-    femmesh.addVolume([3021, 2610, 2613, 2611], 13739)
-    femmesh.addVolume([2380, 2379, 2377, 2763], 13740)
-    femmesh.addVolume([2538, 2537, 2534, 2914], 13741)
-    femmesh.addVolume([2536, 2916, 2539, 2538], 13742)
-    femmesh.addVolume([2379, 2375, 2761, 2378], 13743)
-    femmesh.addVolume([3169, 3149, 1291, 3195], 13744)
-    femmesh.addVolume([2915, 2538, 2535, 2534], 13745)
-    femmesh.addVolume([2536, 2535, 2915, 2538], 13746)
-    femmesh.addVolume([2382, 2378, 2379, 2765], 13747)
-    femmesh.addVolume([2379, 2380, 2382, 2765], 13748)
-    femmesh.addVolume([2302, 2304, 3097, 2305], 13749)
-    femmesh.addVolume([2303, 3095, 2300, 2304], 13750)
-    femmesh.addVolume([2614, 3022, 2613, 2611], 13751)
-    femmesh.addVolume([2613, 2609, 3020, 2612], 13752)
-    femmesh.addVolume([2460, 2457, 2840, 2456], 13753)
-    femmesh.addVolume([2460, 2458, 2840, 2457], 13754)
-    femmesh.addVolume([2268, 813, 2272, 3064], 13755)
-    femmesh.addVolume([2645, 3053, 809, 2642], 13756)
-    femmesh.addVolume([2263, 684, 3062, 2270], 13757)
-    femmesh.addVolume([938, 2647, 2644, 3055], 13758)
-    femmesh.addVolume([2524, 2903, 2904, 2526], 13759)
-    femmesh.addVolume([2522, 2903, 2526, 2902], 13760)
-    femmesh.addVolume([2777, 2392, 2775, 2391], 13761)
-    femmesh.addVolume([2390, 2777, 2773, 2391], 13762)
-    femmesh.addVolume([2623, 3034, 2625, 3033], 13763)
-    femmesh.addVolume([2625, 3032, 2621, 3033], 13764)
-    femmesh.addVolume([2293, 3087, 2292, 3085], 13765)
-    femmesh.addVolume([3083, 2292, 2291, 3087], 13766)
-    femmesh.addVolume([2828, 2829, 2446, 2448], 13767)
-    femmesh.addVolume([2448, 2444, 2828, 2827], 13768)
-    femmesh.addVolume([2848, 2852, 2469, 2468], 13769)
-    femmesh.addVolume([2850, 2852, 2470, 2469], 13770)
-    femmesh.addVolume([2338, 835, 3130, 2335], 13771)
-    femmesh.addVolume([2336, 706, 2333, 3128], 13772)
-    femmesh.addVolume([2579, 2987, 787, 2576], 13773)
-    femmesh.addVolume([916, 2578, 2989, 2581], 13774)
-    femmesh.addVolume([2314, 2316, 3108, 3109], 13775)
-    femmesh.addVolume([2312, 2316, 3107, 3108], 13776)
-    femmesh.addVolume([2602, 3012, 2601, 3010], 13777)
-    femmesh.addVolume([3008, 3012, 2601, 2600], 13778)
-    femmesh.addVolume([1135, 2665, 1134, 3163], 13779)
-    femmesh.addVolume([2366, 2749, 2370, 2748], 13780)
-    femmesh.addVolume([2370, 2368, 2753, 2749], 13781)
-    femmesh.addVolume([2547, 2923, 2752, 2546], 13782)
-    femmesh.addVolume([2925, 2548, 2547, 2752], 13783)
-    femmesh.addVolume([1237, 2563, 2974, 2977], 13784)
-    femmesh.addVolume([2561, 2975, 1070, 2970], 13785)
-    femmesh.addVolume([2353, 3145, 3142, 1330], 13786)
-    femmesh.addVolume([3140, 2351, 1067, 3143], 13787)
-    femmesh.addVolume([3050, 2639, 3047, 1095], 13788)
-    femmesh.addVolume([3070, 3067, 2275, 1305], 13789)
-    femmesh.addVolume([2273, 1042, 3065, 3068], 13790)
-    femmesh.addVolume([2641, 1262, 3052, 3049], 13791)
-    femmesh.addVolume([3122, 1061, 3125, 2330], 13792)
-    femmesh.addVolume([2332, 3127, 3124, 1324], 13793)
-    femmesh.addVolume([2995, 1243, 2992, 2584], 13794)
-    femmesh.addVolume([1076, 2993, 2990, 2582], 13795)
-    femmesh.addVolume([2906, 2525, 2526, 2902], 13796)
-    femmesh.addVolume([2906, 2527, 2904, 2526], 13797)
-    femmesh.addVolume([2773, 2774, 2387, 2391], 13798)
-    femmesh.addVolume([2775, 2389, 2774, 2391], 13799)
-    femmesh.addVolume([908, 2554, 2729, 2557], 13800)
-    femmesh.addVolume([2362, 843, 2728, 2359], 13801)
-    femmesh.addVolume([779, 2685, 2552, 2555], 13802)
-    femmesh.addVolume([2684, 714, 2360, 2357], 13803)
-    femmesh.addVolume([2941, 2732, 1158, 2745], 13804)
-    femmesh.addVolume([3087, 2291, 3086, 2295], 13805)
-    femmesh.addVolume([2622, 3031, 2623, 3033], 13806)
-    femmesh.addVolume([2622, 2621, 3029, 3033], 13807)
-    femmesh.addVolume([2293, 2295, 3087, 3088], 13808)
-    femmesh.addVolume([2448, 2827, 2831, 2447], 13809)
-    femmesh.addVolume([2449, 2448, 2829, 2831], 13810)
-    femmesh.addVolume([2849, 2848, 2469, 2465], 13811)
-    femmesh.addVolume([2467, 2849, 2850, 2469], 13812)
-    femmesh.addVolume([3106, 2313, 3108, 2314], 13813)
-    femmesh.addVolume([3104, 2313, 2312, 3108], 13814)
-    femmesh.addVolume([2600, 3012, 2604, 3011], 13815)
-    femmesh.addVolume([2602, 2604, 3012, 3013], 13816)
-    femmesh.addVolume([2370, 2748, 2756, 2369], 13817)
-    femmesh.addVolume([2370, 2753, 2371, 2756], 13818)
-    femmesh.addVolume([2925, 2547, 2545, 2924], 13819)
-    femmesh.addVolume([2923, 2547, 2924, 2543], 13820)
-    femmesh.addVolume([2686, 2928, 2744, 1020], 13821)
-    femmesh.addVolume([762, 2881, 2501, 2504], 13822)
-    femmesh.addVolume([2883, 891, 2503, 2506], 13823)
-    femmesh.addVolume([2413, 2410, 860, 2796], 13824)
-    femmesh.addVolume([731, 2411, 2794, 2408], 13825)
-    femmesh.addVolume([2808, 865, 2425, 2428], 13826)
-    femmesh.addVolume([2806, 736, 2426, 2423], 13827)
-    femmesh.addVolume([2869, 757, 2489, 2486], 13828)
-    femmesh.addVolume([2491, 2871, 2488, 886], 13829)
-    femmesh.addVolume([3158, 2688, 1117, 2736], 13830)
-    femmesh.addVolume([2889, 1222, 2886, 2509], 13831)
-    femmesh.addVolume([988, 2887, 2884, 2507], 13832)
-    femmesh.addVolume([2791, 2405, 2788, 956], 13833)
-    femmesh.addVolume([2790, 1190, 2407, 2793], 13834)
-    femmesh.addVolume([2868, 2865, 2485, 1215], 13835)
-    femmesh.addVolume([981, 2863, 2483, 2866], 13836)
-    femmesh.addVolume([2812, 2429, 2809, 963], 13837)
-    femmesh.addVolume([2814, 1197, 2811, 2431], 13838)
-    femmesh.addVolume([2661, 1114, 1115, 3165], 13839)
-    femmesh.addVolume([2529, 2525, 2906, 2905], 13840)
-    femmesh.addVolume([2527, 2906, 2907, 2529], 13841)
-    femmesh.addVolume([2774, 2389, 2772, 2388], 13842)
-    femmesh.addVolume([2774, 2770, 2387, 2388], 13843)
-    femmesh.addVolume([3030, 2618, 3029, 2622], 13844)
-    femmesh.addVolume([2620, 3030, 3031, 2622], 13845)
-    femmesh.addVolume([2295, 2294, 3086, 3090], 13846)
-    femmesh.addVolume([2296, 3090, 2295, 3088], 13847)
-    femmesh.addVolume([2451, 2449, 2832, 2831], 13848)
-    femmesh.addVolume([2451, 2447, 2831, 2830], 13849)
-    femmesh.addVolume([2466, 2467, 2849, 2847], 13850)
-    femmesh.addVolume([2845, 2849, 2466, 2465], 13851)
-    femmesh.addVolume([2736, 1117, 3158, 3176], 13852)
-    femmesh.addVolume([2309, 2313, 3104, 3105], 13853)
-    femmesh.addVolume([2313, 3106, 3105, 2311], 13854)
-    femmesh.addVolume([2604, 2605, 3015, 3013], 13855)
-    femmesh.addVolume([3011, 3015, 2604, 2603], 13856)
-    femmesh.addVolume([2928, 2956, 2744, 1020], 13857)
-    femmesh.addVolume([2956, 2746, 1157, 2928], 13858)
-    femmesh.addVolume([2941, 2742, 2956, 1021], 13859)
-    femmesh.addVolume([2956, 2941, 1158, 2745], 13860)
-    femmesh.addVolume([2757, 2373, 2371, 2756], 13861)
-    femmesh.addVolume([2755, 2373, 2756, 2369], 13862)
-    femmesh.addVolume([2924, 2543, 2544, 2920], 13863)
-    femmesh.addVolume([2922, 2924, 2545, 2544], 13864)
-    femmesh.addVolume([3156, 1116, 2738, 3176], 13865)
-    femmesh.addVolume([3158, 1284, 2741, 3176], 13866)
-    femmesh.addVolume([2566, 2563, 911, 2977], 13867)
-    femmesh.addVolume([2561, 782, 2975, 2564], 13868)
-    femmesh.addVolume([840, 2350, 3142, 2353], 13869)
-    femmesh.addVolume([2351, 711, 2348, 3140], 13870)
-    femmesh.addVolume([2560, 2973, 1236, 2974], 13871)
-    femmesh.addVolume([2969, 2558, 1069, 2970], 13872)
-    femmesh.addVolume([1068, 2972, 3143, 2354], 13873)
-    femmesh.addVolume([2967, 3145, 2356, 1331], 13874)
-    femmesh.addVolume([2529, 2907, 2530, 2909], 13875)
-    femmesh.addVolume([2528, 2529, 2909, 2905], 13876)
-    femmesh.addVolume([2771, 2384, 2770, 2388], 13877)
-    femmesh.addVolume([2771, 2772, 2386, 2388], 13878)
-    femmesh.addVolume([3030, 2620, 3028, 2619], 13879)
-    femmesh.addVolume([2618, 3030, 3026, 2619], 13880)
-    femmesh.addVolume([2296, 2298, 3090, 3091], 13881)
-    femmesh.addVolume([2294, 2298, 3089, 3090], 13882)
-    femmesh.addVolume([2450, 2451, 2834, 2830], 13883)
-    femmesh.addVolume([2834, 2452, 2832, 2451], 13884)
-    femmesh.addVolume([2845, 2466, 2846, 2462], 13885)
-    femmesh.addVolume([2847, 2466, 2464, 2846], 13886)
-    femmesh.addVolume([2270, 685, 3065, 2273], 13887)
-    femmesh.addVolume([2272, 814, 2275, 3067], 13888)
-    femmesh.addVolume([2642, 808, 2639, 3050], 13889)
-    femmesh.addVolume([2644, 937, 3052, 2641], 13890)
-    femmesh.addVolume([3101, 2310, 2309, 3105], 13891)
-    femmesh.addVolume([3103, 2310, 3105, 2311], 13892)
-    femmesh.addVolume([2605, 3015, 3016, 2607], 13893)
-    femmesh.addVolume([3014, 3015, 2603, 2607], 13894)
-    femmesh.addVolume([2759, 2374, 2757, 2373], 13895)
-    femmesh.addVolume([2755, 2759, 2373, 2372], 13896)
-    femmesh.addVolume([2922, 2542, 2921, 2544], 13897)
-    femmesh.addVolume([2921, 2920, 2544, 2540], 13898)
-    femmesh.addVolume([2636, 3044, 3047, 1094], 13899)
-    femmesh.addVolume([1043, 3071, 3068, 2276], 13900)
-    femmesh.addVolume([3070, 2278, 3073, 1306], 13901)
-    femmesh.addVolume([3046, 3049, 1261, 2638], 13902)
-    femmesh.addVolume([2332, 834, 2335, 3127], 13903)
-    femmesh.addVolume([2330, 705, 3125, 2333], 13904)
-    femmesh.addVolume([2584, 917, 2992, 2581], 13905)
-    femmesh.addVolume([2990, 2579, 788, 2582], 13906)
-    femmesh.addVolume([3121, 2329, 3124, 1323], 13907)
-    femmesh.addVolume([3122, 3119, 1060, 2327], 13908)
-    femmesh.addVolume([2993, 1077, 2996, 2585], 13909)
-    femmesh.addVolume([2995, 2998, 1244, 2587], 13910)
-    femmesh.addVolume([2910, 2532, 2530, 2909], 13911)
-    femmesh.addVolume([2528, 2909, 2532, 2908], 13912)
-    femmesh.addVolume([2385, 2384, 2767, 2771], 13913)
-    femmesh.addVolume([2385, 2769, 2386, 2771], 13914)
-    femmesh.addVolume([2615, 3026, 3027, 2619], 13915)
-    femmesh.addVolume([3027, 2619, 3028, 2617], 13916)
-    femmesh.addVolume([3089, 2298, 2297, 3093], 13917)
-    femmesh.addVolume([3091, 2298, 3093, 2299], 13918)
-    femmesh.addVolume([2844, 2846, 2464, 2463], 13919)
-    femmesh.addVolume([2454, 2452, 2835, 2834], 13920)
-    femmesh.addVolume([2450, 2834, 2454, 2833], 13921)
-    femmesh.addVolume([2842, 2846, 2463, 2462], 13922)
-    femmesh.addVolume([3101, 3102, 2306, 2310], 13923)
-    femmesh.addVolume([3103, 3102, 2310, 2308], 13924)
-    femmesh.addVolume([3016, 2607, 3018, 2608], 13925)
-    femmesh.addVolume([2606, 3018, 3014, 2607], 13926)
-    femmesh.addVolume([2374, 2759, 2760, 2376], 13927)
-    femmesh.addVolume([2372, 2759, 2376, 2758], 13928)
-    femmesh.addVolume([2919, 2541, 2921, 2542], 13929)
-    femmesh.addVolume([2541, 2917, 2921, 2540], 13930)
-    femmesh.addVolume([2532, 2910, 2533, 2912], 13931)
-    femmesh.addVolume([2531, 2532, 2912, 2908], 13932)
-    femmesh.addVolume([2768, 2383, 2385, 2769], 13933)
-    femmesh.addVolume([2767, 2385, 2768, 2381], 13934)
-    femmesh.addVolume([2615, 3027, 3023, 2616], 13935)
-    femmesh.addVolume([2617, 3027, 2616, 3025], 13936)
-    femmesh.addVolume([2297, 2301, 3092, 3093], 13937)
-    femmesh.addVolume([2301, 3094, 3093, 2299], 13938)
-    femmesh.addVolume([2455, 2454, 2835, 2837], 13939)
-    femmesh.addVolume([2454, 2833, 2837, 2453], 13940)
-    femmesh.addVolume([2843, 2842, 2463, 2459], 13941)
-    femmesh.addVolume([2844, 2461, 2843, 2463], 13942)
-    femmesh.addVolume([3100, 2307, 3102, 2308], 13943)
-    femmesh.addVolume([3102, 3098, 2306, 2307], 13944)
-    femmesh.addVolume([3019, 3018, 2610, 2608], 13945)
-    femmesh.addVolume([3017, 2610, 3018, 2606], 13946)
-    femmesh.addVolume([2758, 2762, 2376, 2375], 13947)
-    femmesh.addVolume([2760, 2762, 2377, 2376], 13948)
-    femmesh.addVolume([2917, 2541, 2918, 2537], 13949)
-    femmesh.addVolume([2539, 2919, 2541, 2918], 13950)
-    femmesh.addVolume([2738, 2687, 1116, 3156], 13951)
-    femmesh.addVolume([2887, 989, 2890, 2510], 13952)
-    femmesh.addVolume([2892, 1223, 2889, 2512], 13953)
-    femmesh.addVolume([2788, 2402, 2785, 955], 13954)
-    femmesh.addVolume([2787, 1189, 2404, 2790], 13955)
-    femmesh.addVolume([2506, 2886, 892, 2509], 13956)
-    femmesh.addVolume([763, 2507, 2884, 2504], 13957)
-    femmesh.addVolume([859, 2410, 2407, 2793], 13958)
-    femmesh.addVolume([730, 2408, 2791, 2405], 13959)
-    femmesh.addVolume([2863, 980, 2480, 2860], 13960)
-    femmesh.addVolume([2862, 2482, 2865, 1214], 13961)
-    femmesh.addVolume([2815, 2432, 2812, 964], 13962)
-    femmesh.addVolume([1198, 2814, 2817, 2434], 13963)
-    femmesh.addVolume([2913, 2535, 2533, 2912], 13964)
-    femmesh.addVolume([2535, 2531, 2912, 2911], 13965)
-    femmesh.addVolume([2382, 2383, 2768, 2766], 13966)
-    femmesh.addVolume([2382, 2764, 2768, 2381], 13967)
-    femmesh.addVolume([3096, 3092, 2300, 2301], 13968)
-    femmesh.addVolume([3094, 2301, 3096, 2302], 13969)
-    femmesh.addVolume([3025, 3024, 2616, 2614], 13970)
-    femmesh.addVolume([2612, 3023, 3024, 2616], 13971)
-    femmesh.addVolume([2837, 2836, 2457, 2453], 13972)
-    femmesh.addVolume([2837, 2838, 2455, 2457], 13973)
-    femmesh.addVolume([2843, 2841, 2460, 2461], 13974)
-    femmesh.addVolume([2460, 2839, 2843, 2459], 13975)
-    femmesh.addVolume([2307, 3098, 2303, 3099], 13976)
-    femmesh.addVolume([2307, 3100, 3099, 2305], 13977)
-    femmesh.addVolume([2609, 3017, 2610, 3021], 13978)
-    femmesh.addVolume([2610, 3021, 3019, 2611], 13979)
-    femmesh.addVolume([2762, 2761, 2379, 2375], 13980)
-    femmesh.addVolume([2763, 2379, 2377, 2762], 13981)
-    femmesh.addVolume([2538, 2916, 2539, 2918], 13982)
-    femmesh.addVolume([2537, 2538, 2918, 2914], 13983)
-    femmesh.addVolume([737, 2426, 2429, 2809], 13984)
-    femmesh.addVolume([2428, 2811, 866, 2431], 13985)
-    femmesh.addVolume([2868, 2485, 2488, 885], 13986)
-    femmesh.addVolume([2486, 756, 2483, 2866], 13987)
-    femmesh.addVolume([2915, 2536, 2913, 2535], 13988)
-    femmesh.addVolume([2915, 2534, 2535, 2911], 13989)
-    femmesh.addVolume([2380, 2766, 2382, 2765], 13990)
-    femmesh.addVolume([2378, 2382, 2764, 2765], 13991)
-    femmesh.addVolume([3096, 2300, 3095, 2304], 13992)
-    femmesh.addVolume([2613, 3020, 3024, 2612], 13993)
-    femmesh.addVolume([3097, 3096, 2304, 2302], 13994)
-    femmesh.addVolume([3024, 3022, 2613, 2614], 13995)
-    femmesh.addVolume([2836, 2840, 2457, 2456], 13996)
-    femmesh.addVolume([2838, 2840, 2458, 2457], 13997)
-    femmesh.addVolume([2460, 2456, 2840, 2839], 13998)
-    femmesh.addVolume([2460, 2841, 2840, 2458], 13999)
-    femmesh.addVolume([2304, 2303, 3095, 3099], 14000)
-    femmesh.addVolume([3097, 2304, 3099, 2305], 14001)
-    femmesh.addVolume([2609, 2613, 3020, 3021], 14002)
-    femmesh.addVolume([2613, 3022, 3021, 2611], 14003)
-    femmesh.addVolume([2534, 2915, 2538, 2914], 14004)
-    femmesh.addVolume([2763, 2380, 2379, 2765], 14005)
-    femmesh.addVolume([2378, 2761, 2379, 2765], 14006)
-    femmesh.addVolume([2915, 2916, 2536, 2538], 14007)
-    femmesh.addVolume([1284, 3158, 2741, 2733], 14008)
-    femmesh.addVolume([2740, 3156, 3176, 1283], 14009)
-    femmesh.addVolume([2635, 1260, 3046, 3043], 14010)
-    femmesh.addVolume([3041, 3044, 2633, 1093], 14011)
-    femmesh.addVolume([2279, 1044, 3071, 3074], 14012)
-    femmesh.addVolume([3076, 3073, 2281, 1307], 14013)
-    femmesh.addVolume([2742, 1021, 2941, 2689], 14014)
-    femmesh.addVolume([2357, 21, 2972, 1336], 14015)
-    femmesh.addVolume([2973, 2557, 26, 1335], 14016)
-    femmesh.addVolume([22, 2555, 2969, 1335], 14017)
-    femmesh.addVolume([2359, 28, 1336, 2967], 14018)
-    femmesh.addVolume([2326, 3121, 3118, 1322], 14019)
-    femmesh.addVolume([1059, 3116, 2324, 3119], 14020)
-    femmesh.addVolume([1245, 2590, 2998, 3001], 14021)
-    femmesh.addVolume([2996, 2588, 1078, 2999], 14022)
-    femmesh.addVolume([2974, 910, 2560, 2563], 14023)
-    femmesh.addVolume([781, 2558, 2561, 2970], 14024)
-    femmesh.addVolume([3143, 2351, 712, 2354], 14025)
-    femmesh.addVolume([841, 3145, 2356, 2353], 14026)
-    femmesh.addVolume([2639, 807, 2636, 3047], 14027)
-    femmesh.addVolume([936, 3049, 2641, 2638], 14028)
-    femmesh.addVolume([3068, 2273, 686, 2276], 14029)
-    femmesh.addVolume([3070, 2278, 815, 2275], 14030)
-    femmesh.addVolume([2329, 833, 2332, 3124], 14031)
-    femmesh.addVolume([2327, 704, 3122, 2330], 14032)
-    femmesh.addVolume([2585, 2993, 789, 2582], 14033)
-    femmesh.addVolume([2587, 918, 2995, 2584], 14034)
-    femmesh.addVolume([2895, 1224, 2892, 2515], 14035)
-    femmesh.addVolume([990, 2893, 2890, 2513], 14036)
-    femmesh.addVolume([2784, 1188, 2401, 2787], 14037)
-    femmesh.addVolume([2785, 2399, 2782, 954], 14038)
-    femmesh.addVolume([2740, 2730, 3156, 1283], 14039)
-    femmesh.addVolume([2479, 2862, 2859, 1213], 14040)
-    femmesh.addVolume([2477, 979, 2857, 2860], 14041)
-    femmesh.addVolume([2435, 2815, 2818, 965], 14042)
-    femmesh.addVolume([2820, 2437, 1199, 2817], 14043)
-    femmesh.addVolume([2746, 2731, 1157, 2928], 14044)
-    femmesh.addVolume([2509, 2889, 893, 2512], 14045)
-    femmesh.addVolume([2507, 764, 2887, 2510], 14046)
-    femmesh.addVolume([858, 2407, 2404, 2790], 14047)
-    femmesh.addVolume([2405, 2788, 729, 2402], 14048)
-    femmesh.addVolume([2865, 2482, 2485, 884], 14049)
-    femmesh.addVolume([2483, 755, 2480, 2863], 14050)
-    femmesh.addVolume([2432, 738, 2429, 2812], 14051)
-    femmesh.addVolume([867, 2431, 2814, 2434], 14052)
-    femmesh.addVolume([1045, 3074, 2282, 3077], 14053)
-    femmesh.addVolume([3041, 2630, 3038, 1092], 14054)
-    femmesh.addVolume([1259, 3043, 2632, 3040], 14055)
-    femmesh.addVolume([2284, 3079, 3076, 1308], 14056)
-    femmesh.addVolume([2354, 713, 2972, 2357], 14057)
-    femmesh.addVolume([2973, 909, 2557, 2560], 14058)
-    femmesh.addVolume([2969, 780, 2558, 2555], 14059)
-    femmesh.addVolume([2967, 2359, 842, 2356], 14060)
-    femmesh.addVolume([3113, 2321, 1058, 3116], 14061)
-    femmesh.addVolume([3115, 2323, 3118, 1321], 14062)
-    femmesh.addVolume([2591, 2999, 3002, 1079], 14063)
-    femmesh.addVolume([3001, 2593, 3004, 1246], 14064)
-    femmesh.addVolume([1206, 2841, 2458, 2838], 14065)
-    femmesh.addVolume([972, 2836, 2456, 2839], 14066)
-    femmesh.addVolume([2378, 2761, 2764, 947], 14067)
-    femmesh.addVolume([2763, 1181, 2380, 2766], 14068)
-    femmesh.addVolume([2536, 2916, 2913, 1231], 14069)
-    femmesh.addVolume([2534, 2911, 2914, 997], 14070)
-    femmesh.addVolume([2898, 1225, 2895, 2518], 14071)
-    femmesh.addVolume([2893, 991, 2896, 2516], 14072)
-    femmesh.addVolume([1187, 2784, 2398, 2781], 14073)
-    femmesh.addVolume([2396, 2779, 2782, 953], 14074)
-    femmesh.addVolume([2739, 2738, 1332, 2740], 14075)
-    femmesh.addVolume([2736, 2737, 1332, 2741], 14076)
-    femmesh.addVolume([2743, 2739, 2746, 2744], 14077)
-    femmesh.addVolume([2743, 2745, 2737, 2742], 14078)
-    femmesh.addVolume([2857, 978, 2474, 2854], 14079)
-    femmesh.addVolume([2476, 2859, 2856, 1212], 14080)
-    femmesh.addVolume([2438, 2818, 2821, 966], 14081)
-    femmesh.addVolume([2823, 2440, 1200, 2820], 14082)
-    femmesh.addVolume([2609, 3017, 3020, 1085], 14083)
-    femmesh.addVolume([2305, 3100, 3097, 1315], 14084)
-    femmesh.addVolume([3095, 2303, 1052, 3098], 14085)
-    femmesh.addVolume([3019, 2611, 3022, 1252], 14086)
-    femmesh.addVolume([2636, 806, 2633, 3044], 14087)
-    femmesh.addVolume([2638, 935, 3046, 2635], 14088)
-    femmesh.addVolume([2276, 687, 3071, 2279], 14089)
-    femmesh.addVolume([2278, 816, 2281, 3073], 14090)
-    femmesh.addVolume([2302, 3097, 3094, 1314], 14091)
-    femmesh.addVolume([2300, 3095, 1051, 3092], 14092)
-    femmesh.addVolume([2614, 3025, 3022, 1253], 14093)
-    femmesh.addVolume([3023, 2612, 3020, 1086], 14094)
-    femmesh.addVolume([3119, 2324, 703, 2327], 14095)
-    femmesh.addVolume([832, 3121, 2329, 2326], 14096)
-    femmesh.addVolume([2585, 790, 2996, 2588], 14097)
-    femmesh.addVolume([2590, 2998, 2587, 919], 14098)
-    femmesh.addVolume([2939, 1007, 2952, 3191], 14099)
-    femmesh.addVolume([2287, 3082, 3079, 1309], 14100)
-    femmesh.addVolume([3040, 2629, 1258, 3037], 14101)
-    femmesh.addVolume([3077, 2285, 1046, 3080], 14102)
-    femmesh.addVolume([3035, 3038, 2627, 1091], 14103)
-    femmesh.addVolume([2539, 2919, 2916, 1232], 14104)
-    femmesh.addVolume([2914, 2917, 2537, 998], 14105)
-    femmesh.addVolume([2375, 2758, 2761, 946], 14106)
-    femmesh.addVolume([1180, 2763, 2377, 2760], 14107)
-    femmesh.addVolume([3113, 1057, 2318, 3110], 14108)
-    femmesh.addVolume([3112, 2320, 3115, 1320], 14109)
-    femmesh.addVolume([3005, 2594, 3002, 1080], 14110)
-    femmesh.addVolume([2596, 3007, 3004, 1247], 14111)
-    femmesh.addVolume([2455, 1205, 2838, 2835], 14112)
-    femmesh.addVolume([2453, 2833, 2836, 971], 14113)
-    femmesh.addVolume([2839, 973, 2842, 2459], 14114)
-    femmesh.addVolume([2461, 2844, 2841, 1207], 14115)
-    femmesh.addVolume([2766, 1182, 2383, 2769], 14116)
-    femmesh.addVolume([2767, 2381, 2764, 948], 14117)
-    femmesh.addVolume([2910, 2533, 2913, 1230], 14118)
-    femmesh.addVolume([2531, 2908, 2911, 996], 14119)
-    femmesh.addVolume([2901, 2898, 2521, 1226], 14120)
-    femmesh.addVolume([2896, 2899, 2519, 992], 14121)
-    femmesh.addVolume([1186, 2781, 2395, 2778], 14122)
-    femmesh.addVolume([2393, 2776, 2779, 952], 14123)
-    femmesh.addVolume([2510, 765, 2890, 2513], 14124)
-    femmesh.addVolume([2515, 894, 2892, 2512], 14125)
-    femmesh.addVolume([857, 2404, 2401, 2787], 14126)
-    femmesh.addVolume([728, 2402, 2785, 2399], 14127)
-    femmesh.addVolume([2606, 3014, 3017, 1084], 14128)
-    femmesh.addVolume([3016, 2608, 3019, 1251], 14129)
-    femmesh.addVolume([3098, 2306, 1053, 3101], 14130)
-    femmesh.addVolume([2308, 3103, 3100, 1316], 14131)
-    femmesh.addVolume([2821, 2824, 2441, 967], 14132)
-    femmesh.addVolume([2471, 977, 2851, 2854], 14133)
-    femmesh.addVolume([2443, 1201, 2826, 2823], 14134)
-    femmesh.addVolume([2856, 2853, 2473, 1211], 14135)
-    femmesh.addVolume([3091, 2299, 3094, 1313], 14136)
-    femmesh.addVolume([3092, 1050, 2297, 3089], 14137)
-    femmesh.addVolume([3026, 2615, 3023, 1087], 14138)
-    femmesh.addVolume([2617, 1254, 3028, 3025], 14139)
-    femmesh.addVolume([2479, 2482, 2862, 883], 14140)
-    femmesh.addVolume([2480, 754, 2477, 2860], 14141)
-    femmesh.addVolume([868, 2817, 2437, 2434], 14142)
-    femmesh.addVolume([739, 2815, 2432, 2435], 14143)
-    femmesh.addVolume([2919, 2542, 2922, 1233], 14144)
-    femmesh.addVolume([2920, 2540, 2917, 999], 14145)
-    femmesh.addVolume([2374, 1179, 2760, 2757], 14146)
-    femmesh.addVolume([2755, 2758, 2372, 945], 14147)
-    femmesh.addVolume([1047, 3083, 3080, 2288], 14148)
-    femmesh.addVolume([1257, 3034, 3037, 2626], 14149)
-    femmesh.addVolume([3035, 2624, 3032, 1090], 14150)
-    femmesh.addVolume([3082, 2290, 3085, 1310], 14151)
-    femmesh.addVolume([2450, 2830, 2833, 970], 14152)
-    femmesh.addVolume([1204, 2452, 2832, 2835], 14153)
-    femmesh.addVolume([2847, 2844, 2464, 1208], 14154)
-    femmesh.addVolume([2842, 974, 2845, 2462], 14155)
-    femmesh.addVolume([3010, 3007, 2599, 1248], 14156)
-    femmesh.addVolume([2315, 3110, 1056, 3107], 14157)
-    femmesh.addVolume([3112, 3109, 2317, 1319], 14158)
-    femmesh.addVolume([2597, 3005, 3008, 1081], 14159)
-    femmesh.addVolume([2767, 2770, 2384, 949], 14160)
-    femmesh.addVolume([2907, 2530, 2910, 1229], 14161)
-    femmesh.addVolume([2908, 2528, 2905, 995], 14162)
-    femmesh.addVolume([2386, 1183, 2772, 2769], 14163)
-    femmesh.addVolume([1007, 2660, 2672, 3191], 14164)
-    femmesh.addVolume([2522, 2899, 2902, 993], 14165)
-    femmesh.addVolume([2901, 2524, 2904, 1227], 14166)
-    femmesh.addVolume([1185, 2775, 2778, 2392], 14167)
-    femmesh.addVolume([2776, 2390, 2773, 951], 14168)
-    femmesh.addVolume([3016, 3013, 2605, 1250], 14169)
-    femmesh.addVolume([2309, 1054, 3101, 3104], 14170)
-    femmesh.addVolume([2311, 3106, 3103, 1317], 14171)
-    femmesh.addVolume([3011, 3014, 2603, 1083], 14172)
-    femmesh.addVolume([2826, 2829, 1202, 2446], 14173)
-    femmesh.addVolume([2827, 2444, 2824, 968], 14174)
-    femmesh.addVolume([2850, 2470, 2853, 1210], 14175)
-    femmesh.addVolume([2848, 976, 2851, 2468], 14176)
-    femmesh.addVolume([3089, 3086, 1049, 2294], 14177)
-    femmesh.addVolume([3088, 2296, 3091, 1312], 14178)
-    femmesh.addVolume([1255, 3028, 3031, 2620], 14179)
-    femmesh.addVolume([3026, 3029, 2618, 1088], 14180)
-    femmesh.addVolume([2365, 25, 2750, 1334], 14181)
-    femmesh.addVolume([1334, 2363, 18, 2747], 14182)
-    femmesh.addVolume([2549, 1333, 19, 2754], 14183)
-    femmesh.addVolume([2751, 1333, 24, 2551], 14184)
-    femmesh.addVolume([2369, 2748, 2755, 944], 14185)
-    femmesh.addVolume([2925, 2922, 2545, 1234], 14186)
-    femmesh.addVolume([2920, 2923, 2543, 1000], 14187)
-    femmesh.addVolume([2757, 2371, 1178, 2753], 14188)
-    femmesh.addVolume([1256, 3031, 3034, 2623], 14189)
-    femmesh.addVolume([2293, 3088, 3085, 1311], 14190)
-    femmesh.addVolume([2621, 3029, 3032, 1089], 14191)
-    femmesh.addVolume([3083, 1048, 3086, 2291], 14192)
-    femmesh.addVolume([908, 2729, 26, 2557], 14193)
-    femmesh.addVolume([28, 2728, 843, 2359], 14194)
-    femmesh.addVolume([2685, 779, 22, 2555], 14195)
-    femmesh.addVolume([714, 2684, 21, 2357], 14196)
-    femmesh.addVolume([2449, 1203, 2832, 2829], 14197)
-    femmesh.addVolume([2827, 2830, 2447, 969], 14198)
-    femmesh.addVolume([975, 2848, 2845, 2465], 14199)
-    femmesh.addVolume([2850, 2847, 2467, 1209], 14200)
-    femmesh.addVolume([2312, 3107, 1055, 3104], 14201)
-    femmesh.addVolume([3008, 3011, 2600, 1082], 14202)
-    femmesh.addVolume([3109, 3106, 2314, 1318], 14203)
-    femmesh.addVolume([2602, 3013, 3010, 1249], 14204)
-    femmesh.addVolume([2905, 2525, 2902, 994], 14205)
-    femmesh.addVolume([2527, 2907, 2904, 1228], 14206)
-    femmesh.addVolume([2775, 1184, 2772, 2389], 14207)
-    femmesh.addVolume([2773, 2387, 2770, 950], 14208)
-    femmesh.addVolume([2925, 2548, 2751, 1235], 14209)
-    femmesh.addVolume([2748, 2366, 2747, 943], 14210)
-    femmesh.addVolume([2923, 2754, 2546, 1001], 14211)
-    femmesh.addVolume([2368, 1177, 2753, 2750], 14212)
-    femmesh.addVolume([2633, 3041, 805, 2630], 14213)
-    femmesh.addVolume([2632, 934, 2635, 3043], 14214)
-    femmesh.addVolume([2279, 2282, 688, 3074], 14215)
-    femmesh.addVolume([2281, 3076, 817, 2284], 14216)
-    femmesh.addVolume([2321, 2324, 702, 3116], 14217)
-    femmesh.addVolume([2323, 3118, 831, 2326], 14218)
-    femmesh.addVolume([3001, 2590, 2593, 920], 14219)
-    femmesh.addVolume([2591, 791, 2588, 2999], 14220)
-    femmesh.addVolume([2300, 2303, 695, 3095], 14221)
-    femmesh.addVolume([824, 2302, 3097, 2305], 14222)
-    femmesh.addVolume([2609, 798, 3020, 2612], 14223)
-    femmesh.addVolume([3022, 2611, 2614, 927], 14224)
-    femmesh.addVolume([895, 2515, 2895, 2518], 14225)
-    femmesh.addVolume([2513, 766, 2893, 2516], 14226)
-    femmesh.addVolume([856, 2401, 2398, 2784], 14227)
-    femmesh.addVolume([727, 2399, 2782, 2396], 14228)
-    femmesh.addVolume([2537, 773, 2534, 2914], 14229)
-    femmesh.addVolume([2916, 2536, 2539, 902], 14230)
-    femmesh.addVolume([849, 2380, 2377, 2763], 14231)
-    femmesh.addVolume([2375, 720, 2761, 2378], 14232)
-    femmesh.addVolume([2437, 869, 2440, 2820], 14233)
-    femmesh.addVolume([2435, 740, 2818, 2438], 14234)
-    femmesh.addVolume([753, 2857, 2474, 2477], 14235)
-    femmesh.addVolume([2859, 2476, 2479, 882], 14236)
-    femmesh.addVolume([875, 2838, 2458, 2455], 14237)
-    femmesh.addVolume([746, 2456, 2836, 2453], 14238)
-    femmesh.addVolume([2841, 2458, 2461, 876], 14239)
-    femmesh.addVolume([747, 2839, 2456, 2459], 14240)
-    femmesh.addVolume([2378, 721, 2764, 2381], 14241)
-    femmesh.addVolume([2380, 850, 2383, 2766], 14242)
-    femmesh.addVolume([772, 2531, 2534, 2911], 14243)
-    femmesh.addVolume([2536, 2913, 2533, 901], 14244)
-    femmesh.addVolume([3038, 2627, 804, 2630], 14245)
-    femmesh.addVolume([2629, 933, 2632, 3040], 14246)
-    femmesh.addVolume([2285, 689, 2282, 3077], 14247)
-    femmesh.addVolume([2287, 818, 3079, 2284], 14248)
-    femmesh.addVolume([3019, 2608, 2611, 926], 14249)
-    femmesh.addVolume([2303, 2306, 696, 3098], 14250)
-    femmesh.addVolume([2609, 3017, 797, 2606], 14251)
-    femmesh.addVolume([825, 2305, 3100, 2308], 14252)
-    femmesh.addVolume([2321, 701, 2318, 3113], 14253)
-    femmesh.addVolume([2320, 3115, 830, 2323], 14254)
-    femmesh.addVolume([2594, 792, 2591, 3002], 14255)
-    femmesh.addVolume([2596, 3004, 2593, 921], 14256)
-    femmesh.addVolume([2299, 3094, 823, 2302], 14257)
-    femmesh.addVolume([694, 2297, 2300, 3092], 14258)
-    femmesh.addVolume([2614, 2617, 3025, 928], 14259)
-    femmesh.addVolume([799, 2615, 3023, 2612], 14260)
-    femmesh.addVolume([896, 2518, 2898, 2521], 14261)
-    femmesh.addVolume([767, 2519, 2896, 2516], 14262)
-    femmesh.addVolume([2395, 855, 2398, 2781], 14263)
-    femmesh.addVolume([726, 2396, 2779, 2393], 14264)
-    femmesh.addVolume([774, 2540, 2917, 2537], 14265)
-    femmesh.addVolume([2539, 2542, 2919, 903], 14266)
-    femmesh.addVolume([2758, 2372, 719, 2375], 14267)
-    femmesh.addVolume([2760, 2377, 848, 2374], 14268)
-    femmesh.addVolume([2474, 752, 2471, 2854], 14269)
-    femmesh.addVolume([2440, 870, 2443, 2823], 14270)
-    femmesh.addVolume([2438, 741, 2821, 2441], 14271)
-    femmesh.addVolume([2856, 2473, 2476, 881], 14272)
-    femmesh.addVolume([2462, 2842, 748, 2459], 14273)
-    femmesh.addVolume([2452, 874, 2455, 2835], 14274)
-    femmesh.addVolume([745, 2833, 2450, 2453], 14275)
-    femmesh.addVolume([2844, 2461, 2464, 877], 14276)
-    femmesh.addVolume([2383, 851, 2386, 2769], 14277)
-    femmesh.addVolume([2381, 722, 2767, 2384], 14278)
-    femmesh.addVolume([2910, 2530, 2533, 900], 14279)
-    femmesh.addVolume([771, 2528, 2531, 2908], 14280)
-    femmesh.addVolume([3080, 2285, 690, 2288], 14281)
-    femmesh.addVolume([3082, 2290, 819, 2287], 14282)
-    femmesh.addVolume([2624, 803, 3035, 2627], 14283)
-    femmesh.addVolume([932, 3037, 2629, 2626], 14284)
-    femmesh.addVolume([796, 3014, 2603, 2606], 14285)
-    femmesh.addVolume([3101, 2306, 697, 2309], 14286)
-    femmesh.addVolume([2608, 3016, 2605, 925], 14287)
-    femmesh.addVolume([2311, 826, 3103, 2308], 14288)
-    femmesh.addVolume([3110, 700, 2318, 2315], 14289)
-    femmesh.addVolume([3112, 829, 2317, 2320], 14290)
-    femmesh.addVolume([2594, 2597, 793, 3005], 14291)
-    femmesh.addVolume([2596, 2599, 3007, 922], 14292)
-    femmesh.addVolume([2297, 3089, 693, 2294], 14293)
-    femmesh.addVolume([3091, 822, 2296, 2299], 14294)
-    femmesh.addVolume([3026, 800, 2618, 2615], 14295)
-    femmesh.addVolume([3028, 2617, 2620, 929], 14296)
-    femmesh.addVolume([845, 2750, 2368, 2365], 14297)
-    femmesh.addVolume([2366, 716, 2363, 2747], 14298)
-    femmesh.addVolume([2546, 2549, 777, 2754], 14299)
-    femmesh.addVolume([2551, 2751, 2548, 906], 14300)
-    femmesh.addVolume([2522, 768, 2519, 2899], 14301)
-    femmesh.addVolume([2901, 2521, 2524, 897], 14302)
-    femmesh.addVolume([725, 2776, 2390, 2393], 14303)
-    femmesh.addVolume([2778, 2395, 854, 2392], 14304)
-    femmesh.addVolume([2922, 2542, 2545, 904], 14305)
-    femmesh.addVolume([2920, 775, 2543, 2540], 14306)
-    femmesh.addVolume([2371, 847, 2374, 2757], 14307)
-    femmesh.addVolume([2369, 718, 2755, 2372], 14308)
-    femmesh.addVolume([2446, 871, 2826, 2443], 14309)
-    femmesh.addVolume([2444, 742, 2441, 2824], 14310)
-    femmesh.addVolume([2473, 2853, 2470, 880], 14311)
-    femmesh.addVolume([2468, 751, 2851, 2471], 14312)
-    femmesh.addVolume([2847, 2464, 2467, 878], 14313)
-    femmesh.addVolume([2462, 749, 2845, 2465], 14314)
-    femmesh.addVolume([2450, 744, 2447, 2830], 14315)
-    femmesh.addVolume([2452, 873, 2832, 2449], 14316)
-    femmesh.addVolume([2389, 852, 2772, 2386], 14317)
-    femmesh.addVolume([2384, 2387, 723, 2770], 14318)
-    femmesh.addVolume([2525, 2528, 770, 2905], 14319)
-    femmesh.addVolume([2530, 2907, 2527, 899], 14320)
-    femmesh.addVolume([2291, 3083, 691, 2288], 14321)
-    femmesh.addVolume([2621, 802, 3032, 2624], 14322)
-    femmesh.addVolume([2293, 2290, 820, 3085], 14323)
-    femmesh.addVolume([931, 2623, 3034, 2626], 14324)
-    femmesh.addVolume([3011, 2600, 795, 2603], 14325)
-    femmesh.addVolume([3013, 2602, 2605, 924], 14326)
-    femmesh.addVolume([827, 2311, 3106, 2314], 14327)
-    femmesh.addVolume([2309, 2312, 698, 3104], 14328)
-    femmesh.addVolume([3010, 2599, 2602, 923], 14329)
-    femmesh.addVolume([794, 3008, 2597, 2600], 14330)
-    femmesh.addVolume([3107, 699, 2315, 2312], 14331)
-    femmesh.addVolume([3109, 828, 2314, 2317], 14332)
-    femmesh.addVolume([2294, 3086, 692, 2291], 14333)
-    femmesh.addVolume([821, 2296, 2293, 3088], 14334)
-    femmesh.addVolume([930, 2620, 3031, 2623], 14335)
-    femmesh.addVolume([2618, 801, 3029, 2621], 14336)
-    femmesh.addVolume([769, 2522, 2525, 2902], 14337)
-    femmesh.addVolume([2527, 2904, 2524, 898], 14338)
-    femmesh.addVolume([2392, 853, 2775, 2389], 14339)
-    femmesh.addVolume([2390, 724, 2387, 2773], 14340)
-    femmesh.addVolume([2545, 2548, 2925, 905], 14341)
-    femmesh.addVolume([2546, 2923, 776, 2543], 14342)
-    femmesh.addVolume([2753, 2371, 846, 2368], 14343)
-    femmesh.addVolume([717, 2748, 2366, 2369], 14344)
-    femmesh.addVolume([872, 2829, 2449, 2446], 14345)
-    femmesh.addVolume([743, 2827, 2444, 2447], 14346)
-    femmesh.addVolume([2465, 750, 2848, 2468], 14347)
-    femmesh.addVolume([2467, 2470, 2850, 879], 14348)
-    femmesh.addVolume([2693, 1265, 26, 3183], 14349)
-    femmesh.addVolume([2736, 17, 1117, 3176], 14350)
-    femmesh.addVolume([1137, 2746, 1157, 2956], 14351)
-    femmesh.addVolume([1020, 2956, 2744, 941], 14352)
-    femmesh.addVolume([1021, 2742, 2956, 941], 14353)
-    femmesh.addVolume([1158, 1137, 2956, 2745], 14354)
-    femmesh.addVolume([1139, 24, 2963, 2693], 14355)
-    femmesh.addVolume([2740, 3176, 23, 1283], 14356)
-    femmesh.addVolume([1284, 23, 2741, 3176], 14357)
-    femmesh.addVolume([3184, 28, 2692, 1302], 14358)
-    femmesh.addVolume([1135, 21, 2648, 3185], 14359)
-    femmesh.addVolume([2265, 27, 812, 3061], 14360)
-    femmesh.addVolume([3059, 20, 683, 2262], 14361)
-    femmesh.addVolume([3056, 810, 20, 2269], 14362)
-    femmesh.addVolume([2266, 939, 27, 3058], 14363)
-    femmesh.addVolume([2981, 784, 1073, 2570], 14364)
-    femmesh.addVolume([913, 2983, 1240, 2572], 14365)
-    femmesh.addVolume([2342, 709, 1064, 3134], 14366)
-    femmesh.addVolume([2344, 838, 3136, 1327], 14367)
-    femmesh.addVolume([2738, 1116, 17, 3176], 14368)
-    femmesh.addVolume([836, 2341, 3133, 1327], 14369)
-    femmesh.addVolume([707, 2339, 1064, 3131], 14370)
-    femmesh.addVolume([2984, 1073, 786, 2573], 14371)
-    femmesh.addVolume([2986, 915, 1240, 2575], 14372)
-    femmesh.addVolume([812, 16, 27, 2265], 14373)
-    femmesh.addVolume([15, 683, 20, 2262], 14374)
-    femmesh.addVolume([20, 810, 15, 2269], 14375)
-    femmesh.addVolume([939, 27, 16, 2266], 14376)
-    femmesh.addVolume([785, 1073, 784, 2570], 14377)
-    femmesh.addVolume([1240, 914, 913, 2572], 14378)
-    femmesh.addVolume([709, 1064, 708, 2342], 14379)
-    femmesh.addVolume([2344, 837, 838, 1327], 14380)
-    femmesh.addVolume([1098, 2649, 22, 3186], 14381)
-    femmesh.addVolume([1137, 2956, 1157, 1158], 14382)
-    femmesh.addVolume([1020, 1021, 2956, 941], 14383)
-    femmesh.addVolume([1158, 1159, 2732, 2941], 14384)
-    femmesh.addVolume([2928, 2686, 1019, 1020], 14385)
-    femmesh.addVolume([2981, 1072, 784, 2567], 14386)
-    femmesh.addVolume([913, 2569, 1239, 2983], 14387)
-    femmesh.addVolume([2347, 3136, 838, 1328], 14388)
-    femmesh.addVolume([3134, 709, 1065, 2345], 14389)
-    femmesh.addVolume([985, 2498, 761, 2878], 14390)
-    femmesh.addVolume([2500, 1219, 890, 2880], 14391)
-    femmesh.addVolume([1193, 2416, 861, 2799], 14392)
-    femmesh.addVolume([2414, 732, 2797, 959], 14393)
-    femmesh.addVolume([3058, 939, 1264, 2647], 14394)
-    femmesh.addVolume([2645, 3056, 810, 1097], 14395)
-    femmesh.addVolume([3059, 683, 1040, 2263], 14396)
-    femmesh.addVolume([3061, 812, 2268, 1303], 14397)
-    femmesh.addVolume([1064, 707, 708, 2339], 14398)
-    femmesh.addVolume([2341, 836, 837, 1327], 14399)
-    femmesh.addVolume([786, 1073, 785, 2573], 14400)
-    femmesh.addVolume([1240, 915, 914, 2575], 14401)
-    femmesh.addVolume([1117, 1118, 2688, 3158], 14402)
-    femmesh.addVolume([2422, 1194, 864, 2805], 14403)
-    femmesh.addVolume([2420, 2803, 735, 960], 14404)
-    femmesh.addVolume([2874, 1218, 887, 2494], 14405)
-    femmesh.addVolume([758, 2492, 984, 2872], 14406)
-    femmesh.addVolume([2984, 786, 1074, 2576], 14407)
-    femmesh.addVolume([915, 2986, 1241, 2578], 14408)
-    femmesh.addVolume([2336, 707, 1063, 3131], 14409)
-    femmesh.addVolume([2338, 836, 3133, 1326], 14410)
-    femmesh.addVolume([3176, 1284, 23, 1283], 14411)
-    femmesh.addVolume([19, 1002, 2966, 2649], 14412)
-    femmesh.addVolume([3158, 2733, 1284, 1285], 14413)
-    femmesh.addVolume([890, 889, 1219, 2500], 14414)
-    femmesh.addVolume([985, 760, 761, 2498], 14415)
-    femmesh.addVolume([732, 2414, 733, 959], 14416)
-    femmesh.addVolume([1193, 862, 861, 2416], 14417)
-    femmesh.addVolume([1194, 864, 863, 2422], 14418)
-    femmesh.addVolume([734, 2420, 735, 960], 14419)
-    femmesh.addVolume([887, 1218, 888, 2494], 14420)
-    femmesh.addVolume([984, 758, 759, 2492], 14421)
-    femmesh.addVolume([2567, 1072, 783, 2978], 14422)
-    femmesh.addVolume([1239, 2569, 912, 2980], 14423)
-    femmesh.addVolume([3139, 2347, 839, 1328], 14424)
-    femmesh.addVolume([710, 3137, 1065, 2345], 14425)
-    femmesh.addVolume([2941, 2689, 1021, 1022], 14426)
-    femmesh.addVolume([2878, 761, 986, 2501], 14427)
-    femmesh.addVolume([2880, 1220, 890, 2503], 14428)
-    femmesh.addVolume([2799, 861, 1192, 2413], 14429)
-    femmesh.addVolume([2797, 732, 2411, 958], 14430)
-    femmesh.addVolume([2645, 809, 3053, 1097], 14431)
-    femmesh.addVolume([2647, 938, 1264, 3055], 14432)
-    femmesh.addVolume([3062, 1040, 684, 2263], 14433)
-    femmesh.addVolume([813, 3064, 2268, 1303], 14434)
-    femmesh.addVolume([2423, 735, 2803, 961], 14435)
-    femmesh.addVolume([1195, 2425, 864, 2805], 14436)
-    femmesh.addVolume([2491, 887, 2874, 1217], 14437)
-    femmesh.addVolume([2489, 758, 983, 2872], 14438)
-    femmesh.addVolume([2338, 3130, 835, 1326], 14439)
-    femmesh.addVolume([706, 2336, 1063, 3128], 14440)
-    femmesh.addVolume([2987, 1074, 787, 2576], 14441)
-    femmesh.addVolume([2989, 916, 1241, 2578], 14442)
-    femmesh.addVolume([1117, 17, 1116, 3176], 14443)
-    femmesh.addVolume([1115, 1116, 2687, 3156], 14444)
-    femmesh.addVolume([2692, 1176, 25, 2964], 14445)
-    femmesh.addVolume([2305, 3097, 824, 1315], 14446)
-    femmesh.addVolume([695, 2303, 1052, 3095], 14447)
-    femmesh.addVolume([2609, 3020, 798, 1085], 14448)
-    femmesh.addVolume([927, 3022, 2611, 1252], 14449)
-    femmesh.addVolume([2458, 875, 1206, 2838], 14450)
-    femmesh.addVolume([2456, 746, 2836, 972], 14451)
-    femmesh.addVolume([1206, 2458, 2841, 876], 14452)
-    femmesh.addVolume([747, 972, 2456, 2839], 14453)
-    femmesh.addVolume([2914, 773, 2534, 997], 14454)
-    femmesh.addVolume([1231, 2536, 2916, 902], 14455)
-    femmesh.addVolume([2380, 849, 1181, 2763], 14456)
-    femmesh.addVolume([2378, 720, 2761, 947], 14457)
-    femmesh.addVolume([2300, 695, 1051, 3095], 14458)
-    femmesh.addVolume([2302, 824, 3097, 1314], 14459)
-    femmesh.addVolume([2612, 798, 3020, 1086], 14460)
-    femmesh.addVolume([3022, 927, 2614, 1253], 14461)
-    femmesh.addVolume([2978, 1071, 783, 2564], 14462)
-    femmesh.addVolume([912, 2566, 1238, 2980], 14463)
-    femmesh.addVolume([3137, 710, 1066, 2348], 14464)
-    femmesh.addVolume([3139, 839, 2350, 1329], 14465)
-    femmesh.addVolume([891, 2503, 1220, 2883], 14466)
-    femmesh.addVolume([986, 2501, 762, 2881], 14467)
-    femmesh.addVolume([2413, 860, 1192, 2796], 14468)
-    femmesh.addVolume([2411, 731, 2794, 958], 14469)
-    femmesh.addVolume([2380, 1181, 850, 2766], 14470)
-    femmesh.addVolume([2378, 2764, 721, 947], 14471)
-    femmesh.addVolume([1231, 2913, 2536, 901], 14472)
-    femmesh.addVolume([2911, 2534, 772, 997], 14473)
-    femmesh.addVolume([3064, 813, 2272, 1304], 14474)
-    femmesh.addVolume([2642, 3053, 809, 1096], 14475)
-    femmesh.addVolume([3062, 684, 1041, 2270], 14476)
-    femmesh.addVolume([2644, 1263, 938, 3055], 14477)
-    femmesh.addVolume([736, 2423, 2806, 961], 14478)
-    femmesh.addVolume([2425, 1195, 865, 2808], 14479)
-    femmesh.addVolume([886, 2491, 2871, 1217], 14480)
-    femmesh.addVolume([2489, 983, 757, 2869], 14481)
-    femmesh.addVolume([2333, 706, 1062, 3128], 14482)
-    femmesh.addVolume([2335, 835, 3130, 1325], 14483)
-    femmesh.addVolume([2987, 787, 1075, 2579], 14484)
-    femmesh.addVolume([2989, 1242, 916, 2581], 14485)
-    femmesh.addVolume([1156, 1157, 2731, 2928], 14486)
-    femmesh.addVolume([773, 2914, 2537, 998], 14487)
-    femmesh.addVolume([2539, 1232, 2916, 902], 14488)
-    femmesh.addVolume([2375, 2761, 720, 946], 14489)
-    femmesh.addVolume([2377, 1180, 849, 2763], 14490)
-    femmesh.addVolume([2566, 911, 1238, 2977], 14491)
-    femmesh.addVolume([2975, 782, 1071, 2564], 14492)
-    femmesh.addVolume([2350, 840, 3142, 1329], 14493)
-    femmesh.addVolume([1066, 2348, 711, 3140], 14494)
-    femmesh.addVolume([2609, 797, 3017, 1085], 14495)
-    femmesh.addVolume([926, 2611, 3019, 1252], 14496)
-    femmesh.addVolume([1052, 2303, 696, 3098], 14497)
-    femmesh.addVolume([3100, 2305, 825, 1315], 14498)
-    femmesh.addVolume([2883, 1221, 891, 2506], 14499)
-    femmesh.addVolume([2881, 762, 987, 2504], 14500)
-    femmesh.addVolume([860, 2410, 1191, 2796], 14501)
-    femmesh.addVolume([2408, 2794, 731, 957], 14502)
-    femmesh.addVolume([2838, 875, 1205, 2455], 14503)
-    femmesh.addVolume([746, 2453, 2836, 971], 14504)
-    femmesh.addVolume([2839, 747, 973, 2459], 14505)
-    femmesh.addVolume([2461, 1207, 2841, 876], 14506)
-    femmesh.addVolume([3050, 2642, 808, 1096], 14507)
-    femmesh.addVolume([3052, 1263, 937, 2644], 14508)
-    femmesh.addVolume([814, 3067, 2272, 1304], 14509)
-    femmesh.addVolume([3065, 1041, 685, 2270], 14510)
-    femmesh.addVolume([2300, 1051, 694, 3092], 14511)
-    femmesh.addVolume([2302, 3094, 823, 1314], 14512)
-    femmesh.addVolume([928, 3025, 2614, 1253], 14513)
-    femmesh.addVolume([2612, 3023, 799, 1086], 14514)
-    femmesh.addVolume([865, 2808, 1196, 2428], 14515)
-    femmesh.addVolume([2806, 2426, 736, 962], 14516)
-    femmesh.addVolume([886, 2871, 2488, 1216], 14517)
-    femmesh.addVolume([757, 2869, 982, 2486], 14518)
-    femmesh.addVolume([3125, 705, 1062, 2333], 14519)
-    femmesh.addVolume([3127, 834, 2335, 1325], 14520)
-    femmesh.addVolume([2992, 917, 1242, 2581], 14521)
-    femmesh.addVolume([2990, 1075, 788, 2579], 14522)
-    femmesh.addVolume([1182, 2383, 850, 2766], 14523)
-    femmesh.addVolume([2381, 721, 2764, 948], 14524)
-    femmesh.addVolume([2911, 772, 2531, 996], 14525)
-    femmesh.addVolume([901, 2913, 2533, 1230], 14526)
-    femmesh.addVolume([911, 2563, 1237, 2977], 14527)
-    femmesh.addVolume([2975, 1070, 782, 2561], 14528)
-    femmesh.addVolume([2351, 1067, 711, 3140], 14529)
-    femmesh.addVolume([2353, 3142, 840, 1330], 14530)
-    femmesh.addVolume([2884, 987, 763, 2504], 14531)
-    femmesh.addVolume([1221, 2886, 892, 2506], 14532)
-    femmesh.addVolume([2410, 859, 1191, 2793], 14533)
-    femmesh.addVolume([2408, 730, 2791, 957], 14534)
-    femmesh.addVolume([774, 2537, 2917, 998], 14535)
-    femmesh.addVolume([903, 2919, 2539, 1232], 14536)
-    femmesh.addVolume([2758, 2375, 719, 946], 14537)
-    femmesh.addVolume([2377, 848, 1180, 2760], 14538)
-    femmesh.addVolume([3065, 685, 1042, 2273], 14539)
-    femmesh.addVolume([3067, 814, 2275, 1305], 14540)
-    femmesh.addVolume([3050, 808, 2639, 1095], 14541)
-    femmesh.addVolume([3052, 937, 1262, 2641], 14542)
-    femmesh.addVolume([2811, 866, 1196, 2428], 14543)
-    femmesh.addVolume([2809, 737, 2426, 962], 14544)
-    femmesh.addVolume([885, 2488, 2868, 1216], 14545)
-    femmesh.addVolume([2486, 982, 756, 2866], 14546)
-    femmesh.addVolume([797, 2606, 3017, 1084], 14547)
-    femmesh.addVolume([926, 3019, 2608, 1251], 14548)
-    femmesh.addVolume([2306, 1053, 696, 3098], 14549)
-    femmesh.addVolume([825, 2308, 3100, 1316], 14550)
-    femmesh.addVolume([3125, 1061, 705, 2330], 14551)
-    femmesh.addVolume([3127, 2332, 834, 1324], 14552)
-    femmesh.addVolume([2990, 788, 1076, 2582], 14553)
-    femmesh.addVolume([2992, 1243, 917, 2584], 14554)
-    femmesh.addVolume([2833, 2453, 745, 971], 14555)
-    femmesh.addVolume([1205, 2455, 874, 2835], 14556)
-    femmesh.addVolume([877, 2844, 2461, 1207], 14557)
-    femmesh.addVolume([748, 2842, 973, 2459], 14558)
-    femmesh.addVolume([2299, 823, 3094, 1313], 14559)
-    femmesh.addVolume([1050, 2297, 694, 3092], 14560)
-    femmesh.addVolume([1254, 3025, 2617, 928], 14561)
-    femmesh.addVolume([2615, 799, 3023, 1087], 14562)
-    femmesh.addVolume([851, 2383, 1182, 2769], 14563)
-    femmesh.addVolume([2381, 2767, 722, 948], 14564)
-    femmesh.addVolume([2908, 2531, 771, 996], 14565)
-    femmesh.addVolume([900, 2533, 2910, 1230], 14566)
-    femmesh.addVolume([1052, 1051, 695, 3095], 14567)
-    femmesh.addVolume([1315, 3097, 824, 1314], 14568)
-    femmesh.addVolume([798, 1085, 3020, 1086], 14569)
-    femmesh.addVolume([927, 1253, 3022, 1252], 14570)
-    femmesh.addVolume([2561, 1070, 781, 2970], 14571)
-    femmesh.addVolume([2974, 1237, 910, 2563], 14572)
-    femmesh.addVolume([2351, 712, 1067, 3143], 14573)
-    femmesh.addVolume([2353, 841, 3145, 1330], 14574)
-    femmesh.addVolume([2886, 1222, 892, 2509], 14575)
-    femmesh.addVolume([2884, 763, 988, 2507], 14576)
-    femmesh.addVolume([2407, 1190, 859, 2793], 14577)
-    femmesh.addVolume([2405, 2791, 730, 956], 14578)
-    femmesh.addVolume([2641, 936, 1262, 3049], 14579)
-    femmesh.addVolume([3047, 2639, 807, 1095], 14580)
-    femmesh.addVolume([2273, 686, 1042, 3068], 14581)
-    femmesh.addVolume([2275, 815, 3070, 1305], 14582)
-    femmesh.addVolume([866, 2811, 1197, 2431], 14583)
-    femmesh.addVolume([2809, 2429, 737, 963], 14584)
-    femmesh.addVolume([2485, 885, 2868, 1215], 14585)
-    femmesh.addVolume([2483, 756, 981, 2866], 14586)
-    femmesh.addVolume([3122, 704, 1061, 2330], 14587)
-    femmesh.addVolume([3124, 833, 2332, 1324], 14588)
-    femmesh.addVolume([2993, 1076, 789, 2582], 14589)
-    femmesh.addVolume([2995, 918, 1243, 2584], 14590)
-    femmesh.addVolume([903, 2542, 2919, 1233], 14591)
-    femmesh.addVolume([2540, 774, 2917, 999], 14592)
-    femmesh.addVolume([2760, 848, 1179, 2374], 14593)
-    femmesh.addVolume([2758, 719, 2372, 945], 14594)
-    femmesh.addVolume([1251, 3016, 2608, 925], 14595)
-    femmesh.addVolume([2606, 796, 3014, 1084], 14596)
-    femmesh.addVolume([1053, 2306, 697, 3101], 14597)
-    femmesh.addVolume([2308, 826, 3103, 1316], 14598)
-    femmesh.addVolume([998, 773, 2914, 997], 14599)
-    femmesh.addVolume([1231, 2916, 1232, 902], 14600)
-    femmesh.addVolume([947, 720, 2761, 946], 14601)
-    femmesh.addVolume([1181, 849, 1180, 2763], 14602)
-    femmesh.addVolume([877, 2464, 2844, 1208], 14603)
-    femmesh.addVolume([2452, 1204, 874, 2835], 14604)
-    femmesh.addVolume([2833, 745, 2450, 970], 14605)
-    femmesh.addVolume([2842, 748, 974, 2462], 14606)
-    femmesh.addVolume([971, 2836, 746, 972], 14607)
-    femmesh.addVolume([1206, 875, 1205, 2838], 14608)
-    femmesh.addVolume([747, 973, 972, 2839], 14609)
-    femmesh.addVolume([1206, 2841, 1207, 876], 14610)
-    femmesh.addVolume([2299, 3091, 822, 1313], 14611)
-    femmesh.addVolume([2297, 1050, 693, 3089], 14612)
-    femmesh.addVolume([2615, 3026, 800, 1087], 14613)
-    femmesh.addVolume([2617, 3028, 1254, 929], 14614)
-    femmesh.addVolume([2386, 851, 1183, 2769], 14615)
-    femmesh.addVolume([2384, 722, 2767, 949], 14616)
-    femmesh.addVolume([1229, 2530, 2910, 900], 14617)
-    femmesh.addVolume([2908, 771, 2528, 995], 14618)
-    femmesh.addVolume([850, 1181, 1182, 2766], 14619)
-    femmesh.addVolume([948, 721, 2764, 947], 14620)
-    femmesh.addVolume([997, 772, 2911, 996], 14621)
-    femmesh.addVolume([901, 1231, 2913, 1230], 14622)
-    femmesh.addVolume([2558, 781, 1069, 2970], 14623)
-    femmesh.addVolume([2560, 1236, 910, 2974], 14624)
-    femmesh.addVolume([3143, 712, 1068, 2354], 14625)
-    femmesh.addVolume([3145, 841, 2356, 1331], 14626)
-    femmesh.addVolume([2889, 893, 1222, 2509], 14627)
-    femmesh.addVolume([2887, 988, 764, 2507], 14628)
-    femmesh.addVolume([2407, 858, 1190, 2790], 14629)
-    femmesh.addVolume([2405, 729, 2788, 956], 14630)
-    femmesh.addVolume([3068, 686, 1043, 2276], 14631)
-    femmesh.addVolume([3070, 815, 2278, 1306], 14632)
-    femmesh.addVolume([3047, 807, 2636, 1094], 14633)
-    femmesh.addVolume([1261, 3049, 936, 2638], 14634)
-    femmesh.addVolume([884, 2485, 2865, 1215], 14635)
-    femmesh.addVolume([2483, 981, 755, 2863], 14636)
-    femmesh.addVolume([2814, 867, 1197, 2431], 14637)
-    femmesh.addVolume([2812, 738, 2429, 963], 14638)
-    femmesh.addVolume([2995, 1244, 918, 2587], 14639)
-    femmesh.addVolume([1077, 2993, 789, 2585], 14640)
-    femmesh.addVolume([3122, 1060, 704, 2327], 14641)
-    femmesh.addVolume([3124, 2329, 833, 1323], 14642)
-    femmesh.addVolume([904, 2922, 2542, 1233], 14643)
-    femmesh.addVolume([2540, 2920, 775, 999], 14644)
-    femmesh.addVolume([1179, 2374, 847, 2757], 14645)
-    femmesh.addVolume([2372, 718, 2755, 945], 14646)
-    femmesh.addVolume([3014, 796, 2603, 1083], 14647)
-    femmesh.addVolume([2311, 3103, 826, 1317], 14648)
-    femmesh.addVolume([2605, 925, 3016, 1250], 14649)
-    femmesh.addVolume([3101, 697, 1054, 2309], 14650)
-    femmesh.addVolume([2832, 1204, 873, 2452], 14651)
-    femmesh.addVolume([2830, 2450, 744, 970], 14652)
-    femmesh.addVolume([749, 2845, 974, 2462], 14653)
-    femmesh.addVolume([2464, 878, 2847, 1208], 14654)
-    femmesh.addVolume([2972, 1068, 713, 2354], 14655)
-    femmesh.addVolume([2973, 1236, 909, 2560], 14656)
-    femmesh.addVolume([780, 2558, 1069, 2969], 14657)
-    femmesh.addVolume([2356, 842, 2967, 1331], 14658)
-    femmesh.addVolume([3089, 1049, 693, 2294], 14659)
-    femmesh.addVolume([822, 3091, 2296, 1312], 14660)
-    femmesh.addVolume([2620, 1255, 3028, 929], 14661)
-    femmesh.addVolume([800, 3026, 2618, 1088], 14662)
-    femmesh.addVolume([1183, 2772, 852, 2386], 14663)
-    femmesh.addVolume([2770, 723, 2384, 949], 14664)
-    femmesh.addVolume([2905, 2528, 770, 995], 14665)
-    femmesh.addVolume([1229, 2907, 2530, 899], 14666)
-    femmesh.addVolume([2972, 713, 21, 2357], 14667)
-    femmesh.addVolume([2557, 26, 909, 2973], 14668)
-    femmesh.addVolume([2969, 22, 780, 2555], 14669)
-    femmesh.addVolume([2359, 842, 28, 2967], 14670)
-    femmesh.addVolume([2889, 1223, 893, 2512], 14671)
-    femmesh.addVolume([2887, 764, 989, 2510], 14672)
-    femmesh.addVolume([2404, 1189, 858, 2790], 14673)
-    femmesh.addVolume([2402, 2788, 729, 955], 14674)
-    femmesh.addVolume([935, 3046, 1261, 2638], 14675)
-    femmesh.addVolume([3044, 2636, 806, 1094], 14676)
-    femmesh.addVolume([3071, 1043, 687, 2276], 14677)
-    femmesh.addVolume([816, 3073, 2278, 1306], 14678)
-    femmesh.addVolume([2730, 1282, 3156, 1283], 14679)
-    femmesh.addVolume([1214, 2482, 2865, 884], 14680)
-    femmesh.addVolume([2480, 755, 980, 2863], 14681)
-    femmesh.addVolume([738, 2812, 2432, 964], 14682)
-    femmesh.addVolume([2814, 1198, 867, 2434], 14683)
-    femmesh.addVolume([3119, 703, 1060, 2327], 14684)
-    femmesh.addVolume([3121, 832, 2329, 1323], 14685)
-    femmesh.addVolume([2587, 2998, 1244, 919], 14686)
-    femmesh.addVolume([790, 2996, 1077, 2585], 14687)
-    femmesh.addVolume([2545, 1234, 2922, 904], 14688)
-    femmesh.addVolume([775, 2920, 2543, 1000], 14689)
-    femmesh.addVolume([2371, 1178, 847, 2757], 14690)
-    femmesh.addVolume([2369, 2755, 718, 944], 14691)
-    femmesh.addVolume([2603, 795, 3011, 1083], 14692)
-    femmesh.addVolume([2605, 1250, 3013, 924], 14693)
-    femmesh.addVolume([3106, 2311, 827, 1317], 14694)
-    femmesh.addVolume([1054, 2309, 698, 3104], 14695)
-    femmesh.addVolume([2467, 1209, 2847, 878], 14696)
-    femmesh.addVolume([2832, 873, 1203, 2449], 14697)
-    femmesh.addVolume([2830, 744, 2447, 969], 14698)
-    femmesh.addVolume([2845, 749, 975, 2465], 14699)
-    femmesh.addVolume([1049, 3086, 692, 2294], 14700)
-    femmesh.addVolume([3088, 821, 2296, 1312], 14701)
-    femmesh.addVolume([801, 2618, 3029, 1088], 14702)
-    femmesh.addVolume([3031, 930, 1255, 2620], 14703)
-    femmesh.addVolume([723, 2770, 2387, 950], 14704)
-    femmesh.addVolume([2772, 1184, 852, 2389], 14705)
-    femmesh.addVolume([899, 2907, 2527, 1228], 14706)
-    femmesh.addVolume([2905, 770, 2525, 994], 14707)
-    femmesh.addVolume([2892, 894, 1223, 2512], 14708)
-    femmesh.addVolume([2890, 989, 765, 2510], 14709)
-    femmesh.addVolume([2404, 857, 1189, 2787], 14710)
-    femmesh.addVolume([2402, 728, 2785, 955], 14711)
-    femmesh.addVolume([2736, 1332, 17, 3176], 14712)
-    femmesh.addVolume([3044, 806, 2633, 1093], 14713)
-    femmesh.addVolume([1260, 3046, 935, 2635], 14714)
-    femmesh.addVolume([3071, 687, 1044, 2279], 14715)
-    femmesh.addVolume([3073, 816, 2281, 1307], 14716)
-    femmesh.addVolume([1252, 3019, 926, 1251], 14717)
-    femmesh.addVolume([1084, 3017, 797, 1085], 14718)
-    femmesh.addVolume([1316, 3100, 825, 1315], 14719)
-    femmesh.addVolume([1052, 696, 1053, 3098], 14720)
-    femmesh.addVolume([754, 2480, 980, 2860], 14721)
-    femmesh.addVolume([2817, 868, 1198, 2434], 14722)
-    femmesh.addVolume([2815, 739, 2432, 964], 14723)
-    femmesh.addVolume([1214, 2862, 2482, 883], 14724)
-    femmesh.addVolume([2738, 17, 1332, 3176], 14725)
-    femmesh.addVolume([3121, 2326, 832, 1322], 14726)
-    femmesh.addVolume([2324, 703, 1059, 3119], 14727)
-    femmesh.addVolume([2996, 790, 1078, 2588], 14728)
-    femmesh.addVolume([2998, 2590, 1245, 919], 14729)
-    femmesh.addVolume([2458, 876, 1206, 875], 14730)
-    femmesh.addVolume([746, 2456, 747, 972], 14731)
-    femmesh.addVolume([776, 2543, 2923, 1000], 14732)
-    femmesh.addVolume([2925, 1234, 2545, 905], 14733)
-    femmesh.addVolume([2748, 2369, 717, 944], 14734)
-    femmesh.addVolume([1178, 2371, 846, 2753], 14735)
-    femmesh.addVolume([694, 1051, 1050, 3092], 14736)
-    femmesh.addVolume([1314, 3094, 823, 1313], 14737)
-    femmesh.addVolume([928, 1254, 3025, 1253], 14738)
-    femmesh.addVolume([799, 1086, 3023, 1087], 14739)
-    femmesh.addVolume([1249, 2602, 3013, 924], 14740)
-    femmesh.addVolume([3011, 795, 2600, 1082], 14741)
-    femmesh.addVolume([2314, 3106, 827, 1318], 14742)
-    femmesh.addVolume([2312, 1055, 698, 3104], 14743)
-    femmesh.addVolume([2378, 721, 720, 947], 14744)
-    femmesh.addVolume([849, 1181, 850, 2380], 14745)
-    femmesh.addVolume([2534, 773, 772, 997], 14746)
-    femmesh.addVolume([902, 1231, 2536, 901], 14747)
-    femmesh.addVolume([1203, 2449, 872, 2829], 14748)
-    femmesh.addVolume([2447, 743, 2827, 969], 14749)
-    femmesh.addVolume([2850, 1209, 2467, 879], 14750)
-    femmesh.addVolume([750, 2848, 975, 2465], 14751)
-    femmesh.addVolume([3086, 1048, 692, 2291], 14752)
-    femmesh.addVolume([3088, 2293, 821, 1311], 14753)
-    femmesh.addVolume([930, 3031, 1256, 2623], 14754)
-    femmesh.addVolume([2621, 801, 3029, 1089], 14755)
-    femmesh.addVolume([2775, 853, 1184, 2389], 14756)
-    femmesh.addVolume([2773, 724, 2387, 950], 14757)
-    femmesh.addVolume([2904, 898, 2527, 1228], 14758)
-    femmesh.addVolume([769, 2902, 2525, 994], 14759)
-    femmesh.addVolume([894, 2892, 1224, 2515], 14760)
-    femmesh.addVolume([2890, 765, 990, 2513], 14761)
-    femmesh.addVolume([2401, 1188, 857, 2787], 14762)
-    femmesh.addVolume([2399, 2785, 728, 954], 14763)
-    femmesh.addVolume([2635, 934, 1260, 3043], 14764)
-    femmesh.addVolume([2633, 805, 3041, 1093], 14765)
-    femmesh.addVolume([2279, 688, 1044, 3074], 14766)
-    femmesh.addVolume([2281, 817, 3076, 1307], 14767)
-    femmesh.addVolume([2477, 754, 979, 2860], 14768)
-    femmesh.addVolume([2862, 1213, 2479, 883], 14769)
-    femmesh.addVolume([1199, 2437, 868, 2817], 14770)
-    femmesh.addVolume([2435, 739, 2815, 965], 14771)
-    femmesh.addVolume([2326, 3118, 831, 1322], 14772)
-    femmesh.addVolume([2324, 1059, 702, 3116], 14773)
-    femmesh.addVolume([3001, 1245, 2590, 920], 14774)
-    femmesh.addVolume([2588, 791, 1078, 2999], 14775)
-    femmesh.addVolume([2648, 2965, 18, 1039], 14776)
-    femmesh.addVolume([2546, 776, 2923, 1001], 14777)
-    femmesh.addVolume([1235, 2925, 2548, 905], 14778)
-    femmesh.addVolume([2748, 717, 2366, 943], 14779)
-    femmesh.addVolume([2753, 846, 1177, 2368], 14780)
-    femmesh.addVolume([2743, 2956, 1137, 2745], 14781)
-    femmesh.addVolume([2956, 2742, 2743, 941], 14782)
-    femmesh.addVolume([2743, 2744, 2956, 941], 14783)
-    femmesh.addVolume([2956, 1137, 2746, 2743], 14784)
-    femmesh.addVolume([2600, 794, 3008, 1082], 14785)
-    femmesh.addVolume([2602, 1249, 3010, 923], 14786)
-    femmesh.addVolume([699, 3107, 1055, 2312], 14787)
-    femmesh.addVolume([828, 3109, 2314, 1318], 14788)
-    femmesh.addVolume([1210, 2850, 2470, 879], 14789)
-    femmesh.addVolume([1202, 2829, 872, 2446], 14790)
-    femmesh.addVolume([2848, 750, 976, 2468], 14791)
-    femmesh.addVolume([2827, 743, 2444, 968], 14792)
-    femmesh.addVolume([2611, 926, 927, 1252], 14793)
-    femmesh.addVolume([797, 2609, 798, 1085], 14794)
-    femmesh.addVolume([825, 2305, 824, 1315], 14795)
-    femmesh.addVolume([1052, 695, 696, 2303], 14796)
-    femmesh.addVolume([1256, 3034, 931, 2623], 14797)
-    femmesh.addVolume([3085, 820, 2293, 1311], 14798)
-    femmesh.addVolume([3083, 691, 1048, 2291], 14799)
-    femmesh.addVolume([2621, 3032, 802, 1089], 14800)
-    femmesh.addVolume([2775, 1185, 853, 2392], 14801)
-    femmesh.addVolume([724, 2773, 2390, 951], 14802)
-    femmesh.addVolume([898, 2904, 2524, 1227], 14803)
-    femmesh.addVolume([2902, 769, 2522, 993], 14804)
-    femmesh.addVolume([2893, 990, 766, 2513], 14805)
-    femmesh.addVolume([2895, 895, 1224, 2515], 14806)
-    femmesh.addVolume([2399, 727, 2782, 954], 14807)
-    femmesh.addVolume([2401, 856, 1188, 2784], 14808)
-    femmesh.addVolume([688, 2282, 1045, 3074], 14809)
-    femmesh.addVolume([2630, 3041, 805, 1092], 14810)
-    femmesh.addVolume([2632, 1259, 934, 3043], 14811)
-    femmesh.addVolume([2284, 3076, 817, 1308], 14812)
-    femmesh.addVolume([2437, 1199, 869, 2820], 14813)
-    femmesh.addVolume([740, 2435, 2818, 965], 14814)
-    femmesh.addVolume([2859, 882, 2479, 1213], 14815)
-    femmesh.addVolume([2857, 753, 979, 2477], 14816)
-    femmesh.addVolume([25, 2750, 845, 2365], 14817)
-    femmesh.addVolume([2551, 24, 2751, 906], 14818)
-    femmesh.addVolume([2549, 19, 777, 2754], 14819)
-    femmesh.addVolume([2363, 716, 18, 2747], 14820)
-    femmesh.addVolume([1058, 2321, 702, 3116], 14821)
-    femmesh.addVolume([2323, 831, 3118, 1321], 14822)
-    femmesh.addVolume([2593, 1246, 3001, 920], 14823)
-    femmesh.addVolume([2999, 2591, 791, 1079], 14824)
-    femmesh.addVolume([824, 2302, 823, 1314], 14825)
-    femmesh.addVolume([1051, 694, 695, 2300], 14826)
-    femmesh.addVolume([798, 2612, 799, 1086], 14827)
-    femmesh.addVolume([927, 928, 2614, 1253], 14828)
-    femmesh.addVolume([716, 18, 715, 2363], 14829)
-    femmesh.addVolume([845, 844, 25, 2365], 14830)
-    femmesh.addVolume([777, 778, 19, 2549], 14831)
-    femmesh.addVolume([907, 24, 2551, 906], 14832)
-    femmesh.addVolume([2315, 1056, 699, 3107], 14833)
-    femmesh.addVolume([2317, 3109, 828, 1319], 14834)
-    femmesh.addVolume([1248, 2599, 3010, 923], 14835)
-    femmesh.addVolume([3008, 794, 2597, 1081], 14836)
-    femmesh.addVolume([742, 2824, 2444, 968], 14837)
-    femmesh.addVolume([871, 2826, 1202, 2446], 14838)
-    femmesh.addVolume([880, 2853, 2470, 1210], 14839)
-    femmesh.addVolume([751, 2851, 976, 2468], 14840)
-    femmesh.addVolume([3083, 1047, 691, 2288], 14841)
-    femmesh.addVolume([3085, 2290, 820, 1310], 14842)
-    femmesh.addVolume([931, 3034, 1257, 2626], 14843)
-    femmesh.addVolume([2624, 802, 3032, 1090], 14844)
-    femmesh.addVolume([716, 2747, 2366, 943], 14845)
-    femmesh.addVolume([2368, 845, 1177, 2750], 14846)
-    femmesh.addVolume([906, 2751, 2548, 1235], 14847)
-    femmesh.addVolume([2754, 777, 2546, 1001], 14848)
-    femmesh.addVolume([2778, 854, 1185, 2392], 14849)
-    femmesh.addVolume([2390, 2776, 725, 951], 14850)
-    femmesh.addVolume([2899, 2522, 768, 993], 14851)
-    femmesh.addVolume([2524, 1227, 2901, 897], 14852)
-    femmesh.addVolume([895, 2895, 1225, 2518], 14853)
-    femmesh.addVolume([2398, 1187, 856, 2784], 14854)
-    femmesh.addVolume([2396, 2782, 727, 953], 14855)
-    femmesh.addVolume([2893, 766, 991, 2516], 14856)
-    femmesh.addVolume([2282, 689, 1045, 3077], 14857)
-    femmesh.addVolume([2284, 818, 3079, 1308], 14858)
-    femmesh.addVolume([2630, 804, 3038, 1092], 14859)
-    femmesh.addVolume([2632, 933, 1259, 3040], 14860)
-    femmesh.addVolume([2474, 753, 978, 2857], 14861)
-    femmesh.addVolume([2438, 740, 2818, 966], 14862)
-    femmesh.addVolume([2440, 869, 1200, 2820], 14863)
-    femmesh.addVolume([1212, 2476, 2859, 882], 14864)
-    femmesh.addVolume([2321, 1058, 701, 3113], 14865)
-    femmesh.addVolume([2323, 3115, 830, 1321], 14866)
-    femmesh.addVolume([3002, 792, 2591, 1079], 14867)
-    femmesh.addVolume([1246, 2593, 3004, 921], 14868)
-    femmesh.addVolume([880, 2473, 2853, 1211], 14869)
-    femmesh.addVolume([2824, 742, 2441, 967], 14870)
-    femmesh.addVolume([2826, 871, 1201, 2443], 14871)
-    femmesh.addVolume([2851, 751, 977, 2471], 14872)
-    femmesh.addVolume([1248, 3007, 2599, 922], 14873)
-    femmesh.addVolume([3112, 2317, 829, 1319], 14874)
-    femmesh.addVolume([3005, 2597, 793, 1081], 14875)
-    femmesh.addVolume([700, 3110, 1056, 2315], 14876)
-    femmesh.addVolume([2899, 768, 2519, 992], 14877)
-    femmesh.addVolume([2395, 854, 1186, 2778], 14878)
-    femmesh.addVolume([2521, 897, 2901, 1226], 14879)
-    femmesh.addVolume([2393, 725, 2776, 952], 14880)
-    femmesh.addVolume([2898, 896, 1225, 2518], 14881)
-    femmesh.addVolume([2896, 991, 767, 2516], 14882)
-    femmesh.addVolume([2396, 726, 2779, 953], 14883)
-    femmesh.addVolume([2398, 855, 1187, 2781], 14884)
-    femmesh.addVolume([3080, 690, 1047, 2288], 14885)
-    femmesh.addVolume([2290, 3082, 819, 1310], 14886)
-    femmesh.addVolume([3037, 932, 1257, 2626], 14887)
-    femmesh.addVolume([2624, 3035, 803, 1090], 14888)
-    femmesh.addVolume([2476, 1212, 2856, 881], 14889)
-    femmesh.addVolume([2474, 978, 752, 2854], 14890)
-    femmesh.addVolume([870, 2440, 1200, 2823], 14891)
-    femmesh.addVolume([741, 2438, 2821, 966], 14892)
-    femmesh.addVolume([3038, 804, 2627, 1091], 14893)
-    femmesh.addVolume([2285, 1046, 689, 3077], 14894)
-    femmesh.addVolume([2287, 3079, 818, 1309], 14895)
-    femmesh.addVolume([2629, 1258, 933, 3040], 14896)
-    femmesh.addVolume([2318, 701, 1057, 3113], 14897)
-    femmesh.addVolume([2320, 830, 3115, 1320], 14898)
-    femmesh.addVolume([792, 3002, 2594, 1080], 14899)
-    femmesh.addVolume([1247, 3004, 2596, 921], 14900)
-    femmesh.addVolume([3005, 793, 2594, 1080], 14901)
-    femmesh.addVolume([1247, 2596, 3007, 922], 14902)
-    femmesh.addVolume([2318, 1057, 700, 3110], 14903)
-    femmesh.addVolume([2320, 3112, 829, 1320], 14904)
-    femmesh.addVolume([2287, 819, 3082, 1309], 14905)
-    femmesh.addVolume([1046, 2285, 690, 3080], 14906)
-    femmesh.addVolume([2627, 803, 3035, 1091], 14907)
-    femmesh.addVolume([1258, 2629, 932, 3037], 14908)
-    femmesh.addVolume([2471, 752, 977, 2854], 14909)
-    femmesh.addVolume([2473, 881, 2856, 1211], 14910)
-    femmesh.addVolume([2443, 870, 1201, 2823], 14911)
-    femmesh.addVolume([2441, 741, 2821, 967], 14912)
-    femmesh.addVolume([2395, 1186, 855, 2781], 14913)
-    femmesh.addVolume([2519, 767, 2896, 992], 14914)
-    femmesh.addVolume([896, 2521, 2898, 1226], 14915)
-    femmesh.addVolume([726, 2393, 2779, 952], 14916)
-    femmesh.addVolume([1233, 2919, 903, 1232], 14917)
-    femmesh.addVolume([999, 774, 2917, 998], 14918)
-    femmesh.addVolume([1180, 848, 1179, 2760], 14919)
-    femmesh.addVolume([946, 719, 2758, 945], 14920)
-    femmesh.addVolume([874, 1204, 1205, 2835], 14921)
-    femmesh.addVolume([970, 2833, 745, 971], 14922)
-    femmesh.addVolume([1208, 2844, 877, 1207], 14923)
-    femmesh.addVolume([973, 748, 974, 2842], 14924)
-    femmesh.addVolume([1332, 2741, 23, 3176], 14925)
-    femmesh.addVolume([1182, 1183, 851, 2769], 14926)
-    femmesh.addVolume([948, 2767, 722, 949], 14927)
-    femmesh.addVolume([996, 771, 2908, 995], 14928)
-    femmesh.addVolume([900, 2910, 1229, 1230], 14929)
-    femmesh.addVolume([3176, 23, 1332, 2740], 14930)
-    femmesh.addVolume([1232, 2539, 903, 902], 14931)
-    femmesh.addVolume([2537, 774, 773, 998], 14932)
-    femmesh.addVolume([1180, 849, 848, 2377], 14933)
-    femmesh.addVolume([719, 2375, 720, 946], 14934)
-    femmesh.addVolume([2453, 746, 745, 971], 14935)
-    femmesh.addVolume([874, 1205, 875, 2455], 14936)
-    femmesh.addVolume([1207, 2461, 877, 876], 14937)
-    femmesh.addVolume([748, 973, 747, 2459], 14938)
-    femmesh.addVolume([1182, 851, 850, 2383], 14939)
-    femmesh.addVolume([721, 2381, 722, 948], 14940)
-    femmesh.addVolume([901, 2533, 900, 1230], 14941)
-    femmesh.addVolume([2531, 772, 771, 996], 14942)
-    femmesh.addVolume([1083, 3014, 796, 1084], 14943)
-    femmesh.addVolume([3016, 925, 1251, 1250], 14944)
-    femmesh.addVolume([1317, 3103, 826, 1316], 14945)
-    femmesh.addVolume([697, 1054, 1053, 3101], 14946)
-    femmesh.addVolume([3091, 1312, 822, 1313], 14947)
-    femmesh.addVolume([1049, 693, 1050, 3089], 14948)
-    femmesh.addVolume([1088, 800, 3026, 1087], 14949)
-    femmesh.addVolume([1254, 3028, 1255, 929], 14950)
-    femmesh.addVolume([1332, 3156, 2738, 3176], 14951)
-    femmesh.addVolume([1251, 2608, 926, 925], 14952)
-    femmesh.addVolume([2606, 797, 796, 1084], 14953)
-    femmesh.addVolume([2308, 825, 826, 1316], 14954)
-    femmesh.addVolume([697, 1053, 696, 2306], 14955)
-    femmesh.addVolume([1050, 693, 694, 2297], 14956)
-    femmesh.addVolume([823, 2299, 822, 1313], 14957)
-    femmesh.addVolume([799, 2615, 800, 1087], 14958)
-    femmesh.addVolume([1254, 928, 2617, 929], 14959)
-    femmesh.addVolume([904, 1234, 2922, 1233], 14960)
-    femmesh.addVolume([2920, 1000, 775, 999], 14961)
-    femmesh.addVolume([847, 1178, 1179, 2757], 14962)
-    femmesh.addVolume([944, 2755, 718, 945], 14963)
-    femmesh.addVolume([1203, 1204, 873, 2832], 14964)
-    femmesh.addVolume([969, 2830, 744, 970], 14965)
-    femmesh.addVolume([749, 975, 974, 2845], 14966)
-    femmesh.addVolume([2847, 878, 1209, 1208], 14967)
-    femmesh.addVolume([949, 2770, 723, 950], 14968)
-    femmesh.addVolume([852, 1183, 1184, 2772], 14969)
-    femmesh.addVolume([994, 2905, 770, 995], 14970)
-    femmesh.addVolume([899, 1229, 2907, 1228], 14971)
-    femmesh.addVolume([2956, 2744, 2743, 2928], 14972)
-    femmesh.addVolume([2743, 2746, 2956, 2928], 14973)
-    femmesh.addVolume([2743, 2956, 2941, 2742], 14974)
-    femmesh.addVolume([2743, 2941, 2956, 2745], 14975)
-    femmesh.addVolume([2736, 3158, 1332, 3176], 14976)
-    femmesh.addVolume([2741, 1332, 3158, 3176], 14977)
-    femmesh.addVolume([3176, 1332, 3156, 2740], 14978)
-    femmesh.addVolume([2540, 775, 774, 999], 14979)
-    femmesh.addVolume([2542, 903, 904, 1233], 14980)
-    femmesh.addVolume([847, 1179, 848, 2374], 14981)
-    femmesh.addVolume([718, 2372, 719, 945], 14982)
-    femmesh.addVolume([873, 1204, 874, 2452], 14983)
-    femmesh.addVolume([2450, 745, 744, 970], 14984)
-    femmesh.addVolume([974, 748, 749, 2462], 14985)
-    femmesh.addVolume([878, 2464, 877, 1208], 14986)
-    femmesh.addVolume([722, 2384, 723, 949], 14987)
-    femmesh.addVolume([1183, 852, 851, 2386], 14988)
-    femmesh.addVolume([900, 1229, 2530, 899], 14989)
-    femmesh.addVolume([770, 2528, 771, 995], 14990)
-    femmesh.addVolume([1083, 795, 3011, 1082], 14991)
-    femmesh.addVolume([3013, 1250, 1249, 924], 14992)
-    femmesh.addVolume([1054, 698, 1055, 3104], 14993)
-    femmesh.addVolume([1317, 827, 3106, 1318], 14994)
-    femmesh.addVolume([1312, 3088, 821, 1311], 14995)
-    femmesh.addVolume([692, 1049, 1048, 3086], 14996)
-    femmesh.addVolume([801, 1088, 3029, 1089], 14997)
-    femmesh.addVolume([1255, 1256, 930, 3031], 14998)
-    femmesh.addVolume([1250, 2605, 925, 924], 14999)
-    femmesh.addVolume([795, 2603, 796, 1083], 15000)
-    femmesh.addVolume([827, 2311, 826, 1317], 15001)
-    femmesh.addVolume([1054, 697, 698, 2309], 15002)
-    femmesh.addVolume([693, 1049, 692, 2294], 15003)
-    femmesh.addVolume([2296, 821, 822, 1312], 15004)
-    femmesh.addVolume([2618, 801, 800, 1088], 15005)
-    femmesh.addVolume([2620, 930, 1255, 929], 15006)
-    femmesh.addVolume([2923, 1001, 776, 1000], 15007)
-    femmesh.addVolume([1234, 2925, 1235, 905], 15008)
-    femmesh.addVolume([846, 1177, 1178, 2753], 15009)
-    femmesh.addVolume([943, 2748, 717, 944], 15010)
-    femmesh.addVolume([1209, 2850, 1210, 879], 15011)
-    femmesh.addVolume([975, 750, 976, 2848], 15012)
-    femmesh.addVolume([872, 1202, 1203, 2829], 15013)
-    femmesh.addVolume([968, 2827, 743, 969], 15014)
-    femmesh.addVolume([951, 724, 2773, 950], 15015)
-    femmesh.addVolume([1185, 853, 1184, 2775], 15016)
-    femmesh.addVolume([993, 2902, 769, 994], 15017)
-    femmesh.addVolume([1227, 898, 2904, 1228], 15018)
-    femmesh.addVolume([904, 2545, 1234, 905], 15019)
-    femmesh.addVolume([2543, 776, 775, 1000], 15020)
-    femmesh.addVolume([846, 1178, 847, 2371], 15021)
-    femmesh.addVolume([717, 2369, 718, 944], 15022)
-    femmesh.addVolume([1203, 873, 872, 2449], 15023)
-    femmesh.addVolume([743, 2447, 744, 969], 15024)
-    femmesh.addVolume([750, 975, 749, 2465], 15025)
-    femmesh.addVolume([2467, 879, 1209, 878], 15026)
-    femmesh.addVolume([3010, 1249, 1248, 923], 15027)
-    femmesh.addVolume([1082, 794, 3008, 1081], 15028)
-    femmesh.addVolume([1055, 699, 1056, 3107], 15029)
-    femmesh.addVolume([1318, 828, 3109, 1319], 15030)
-    femmesh.addVolume([691, 1048, 1047, 3083], 15031)
-    femmesh.addVolume([1311, 3085, 820, 1310], 15032)
-    femmesh.addVolume([1089, 3032, 802, 1090], 15033)
-    femmesh.addVolume([1256, 1257, 931, 3034], 15034)
-    femmesh.addVolume([852, 1184, 853, 2389], 15035)
-    femmesh.addVolume([2387, 724, 723, 950], 15036)
-    femmesh.addVolume([899, 2527, 898, 1228], 15037)
-    femmesh.addVolume([2525, 770, 769, 994], 15038)
-    femmesh.addVolume([2754, 19, 777, 1001], 15039)
-    femmesh.addVolume([906, 24, 2751, 1235], 15040)
-    femmesh.addVolume([1177, 845, 25, 2750], 15041)
-    femmesh.addVolume([2747, 716, 18, 943], 15042)
-    femmesh.addVolume([967, 2824, 742, 968], 15043)
-    femmesh.addVolume([871, 1201, 1202, 2826], 15044)
-    femmesh.addVolume([976, 751, 977, 2851], 15045)
-    femmesh.addVolume([1210, 880, 2853, 1211], 15046)
-    femmesh.addVolume([794, 2600, 795, 1082], 15047)
-    femmesh.addVolume([923, 2602, 1249, 924], 15048)
-    femmesh.addVolume([828, 2314, 827, 1318], 15049)
-    femmesh.addVolume([1055, 698, 699, 2312], 15050)
-    femmesh.addVolume([1186, 854, 1185, 2778], 15051)
-    femmesh.addVolume([952, 725, 2776, 951], 15052)
-    femmesh.addVolume([993, 768, 2899, 992], 15053)
-    femmesh.addVolume([2901, 897, 1227, 1226], 15054)
-    femmesh.addVolume([692, 1048, 691, 2291], 15055)
-    femmesh.addVolume([821, 2293, 820, 1311], 15056)
-    femmesh.addVolume([1256, 931, 930, 2623], 15057)
-    femmesh.addVolume([801, 2621, 802, 1089], 15058)
-    femmesh.addVolume([1081, 793, 3005, 1080], 15059)
-    femmesh.addVolume([1247, 3007, 1248, 922], 15060)
-    femmesh.addVolume([1056, 700, 1057, 3110], 15061)
-    femmesh.addVolume([1319, 829, 3112, 1320], 15062)
-    femmesh.addVolume([819, 1310, 3082, 1309], 15063)
-    femmesh.addVolume([690, 1047, 1046, 3080], 15064)
-    femmesh.addVolume([803, 1090, 3035, 1091], 15065)
-    femmesh.addVolume([932, 1257, 1258, 3037], 15066)
-    femmesh.addVolume([1235, 2548, 906, 905], 15067)
-    femmesh.addVolume([2546, 777, 776, 1001], 15068)
-    femmesh.addVolume([2366, 717, 716, 943], 15069)
-    femmesh.addVolume([845, 1177, 846, 2368], 15070)
-    femmesh.addVolume([2444, 743, 742, 968], 15071)
-    femmesh.addVolume([872, 871, 1202, 2446], 15072)
-    femmesh.addVolume([976, 750, 751, 2468], 15073)
-    femmesh.addVolume([1210, 2470, 880, 879], 15074)
-    femmesh.addVolume([853, 1185, 854, 2392], 15075)
-    femmesh.addVolume([2390, 725, 724, 951], 15076)
-    femmesh.addVolume([1227, 2524, 898, 897], 15077)
-    femmesh.addVolume([2522, 769, 768, 993], 15078)
-    femmesh.addVolume([2856, 881, 1212, 1211], 15079)
-    femmesh.addVolume([752, 978, 977, 2854], 15080)
-    femmesh.addVolume([1200, 1201, 870, 2823], 15081)
-    femmesh.addVolume([966, 2821, 741, 967], 15082)
-    femmesh.addVolume([953, 726, 2779, 952], 15083)
-    femmesh.addVolume([1187, 855, 1186, 2781], 15084)
-    femmesh.addVolume([2896, 767, 991, 992], 15085)
-    femmesh.addVolume([896, 2898, 1225, 1226], 15086)
-    femmesh.addVolume([2597, 794, 793, 1081], 15087)
-    femmesh.addVolume([2599, 923, 1248, 922], 15088)
-    femmesh.addVolume([829, 2317, 828, 1319], 15089)
-    femmesh.addVolume([1056, 699, 700, 2315], 15090)
-    femmesh.addVolume([691, 1047, 690, 2288], 15091)
-    femmesh.addVolume([820, 2290, 819, 1310], 15092)
-    femmesh.addVolume([1257, 932, 931, 2626], 15093)
-    femmesh.addVolume([802, 2624, 803, 1090], 15094)
-    femmesh.addVolume([1079, 3002, 792, 1080], 15095)
-    femmesh.addVolume([1246, 3004, 1247, 921], 15096)
-    femmesh.addVolume([1057, 701, 1058, 3113], 15097)
-    femmesh.addVolume([1320, 830, 3115, 1321], 15098)
-    femmesh.addVolume([1309, 3079, 818, 1308], 15099)
-    femmesh.addVolume([1045, 689, 1046, 3077], 15100)
-    femmesh.addVolume([1091, 3038, 804, 1092], 15101)
-    femmesh.addVolume([1259, 933, 1258, 3040], 15102)
-    femmesh.addVolume([2269, 811, 15, 2262], 15103)
-    femmesh.addVolume([16, 2265, 811, 2266], 15104)
-    femmesh.addVolume([882, 2859, 1212, 1213], 15105)
-    femmesh.addVolume([978, 753, 979, 2857], 15106)
-    femmesh.addVolume([1200, 869, 1199, 2820], 15107)
-    femmesh.addVolume([965, 2818, 740, 966], 15108)
-    femmesh.addVolume([752, 977, 751, 2471], 15109)
-    femmesh.addVolume([2473, 880, 881, 1211], 15110)
-    femmesh.addVolume([741, 2441, 742, 967], 15111)
-    femmesh.addVolume([870, 1201, 871, 2443], 15112)
-    femmesh.addVolume([1188, 856, 1187, 2784], 15113)
-    femmesh.addVolume([954, 727, 2782, 953], 15114)
-    femmesh.addVolume([895, 1224, 1225, 2895], 15115)
-    femmesh.addVolume([766, 991, 990, 2893], 15116)
-    femmesh.addVolume([725, 2393, 726, 952], 15117)
-    femmesh.addVolume([1186, 855, 854, 2395], 15118)
-    femmesh.addVolume([897, 2521, 896, 1226], 15119)
-    femmesh.addVolume([767, 2519, 768, 992], 15120)
-    femmesh.addVolume([2999, 791, 1078, 1079], 15121)
-    femmesh.addVolume([1246, 1245, 3001, 920], 15122)
-    femmesh.addVolume([1058, 702, 1059, 3116], 15123)
-    femmesh.addVolume([1321, 831, 3118, 1322], 15124)
-    femmesh.addVolume([1045, 1044, 688, 3074], 15125)
-    femmesh.addVolume([1308, 3076, 817, 1307], 15126)
-    femmesh.addVolume([1092, 3041, 805, 1093], 15127)
-    femmesh.addVolume([1259, 1260, 934, 3043], 15128)
-    femmesh.addVolume([2594, 793, 792, 1080], 15129)
-    femmesh.addVolume([922, 1247, 2596, 921], 15130)
-    femmesh.addVolume([1057, 700, 701, 2318], 15131)
-    femmesh.addVolume([830, 2320, 829, 1320], 15132)
-    femmesh.addVolume([2287, 818, 819, 1309], 15133)
-    femmesh.addVolume([1046, 689, 690, 2285], 15134)
-    femmesh.addVolume([2627, 804, 803, 1091], 15135)
-    femmesh.addVolume([932, 1258, 933, 2629], 15136)
-    femmesh.addVolume([1213, 2862, 1214, 883], 15137)
-    femmesh.addVolume([980, 979, 754, 2860], 15138)
-    femmesh.addVolume([964, 2815, 739, 965], 15139)
-    femmesh.addVolume([868, 1198, 1199, 2817], 15140)
-    femmesh.addVolume([954, 2785, 728, 955], 15141)
-    femmesh.addVolume([1189, 857, 1188, 2787], 15142)
-    femmesh.addVolume([989, 765, 990, 2890], 15143)
-    femmesh.addVolume([894, 1223, 1224, 2892], 15144)
-    femmesh.addVolume([913, 1239, 1240, 2983], 15145)
-    femmesh.addVolume([1072, 784, 1073, 2981], 15146)
-    femmesh.addVolume([1064, 709, 1065, 3134], 15147)
-    femmesh.addVolume([1327, 838, 3136, 1328], 15148)
-    femmesh.addVolume([3061, 27, 812, 1303], 15149)
-    femmesh.addVolume([1040, 20, 683, 3059], 15150)
-    femmesh.addVolume([3056, 20, 810, 1097], 15151)
-    femmesh.addVolume([1264, 27, 939, 3058], 15152)
-    femmesh.addVolume([909, 26, 1236, 2973], 15153)
-    femmesh.addVolume([1068, 713, 21, 2972], 15154)
-    femmesh.addVolume([1069, 22, 780, 2969], 15155)
-    femmesh.addVolume([2967, 842, 28, 1331], 15156)
-    femmesh.addVolume([1077, 790, 1078, 2996], 15157)
-    femmesh.addVolume([1244, 2998, 1245, 919], 15158)
-    femmesh.addVolume([1059, 703, 1060, 3119], 15159)
-    femmesh.addVolume([1322, 832, 3121, 1323], 15160)
-    femmesh.addVolume([1261, 935, 1260, 3046], 15161)
-    femmesh.addVolume([1094, 806, 3044, 1093], 15162)
-    femmesh.addVolume([1043, 687, 1044, 3071], 15163)
-    femmesh.addVolume([1307, 3073, 816, 1306], 15164)
-    femmesh.addVolume([1327, 3133, 836, 1326], 15165)
-    femmesh.addVolume([1064, 1063, 707, 3131], 15166)
-    femmesh.addVolume([915, 1240, 1241, 2986], 15167)
-    femmesh.addVolume([786, 1074, 1073, 2984], 15168)
-    femmesh.addVolume([761, 986, 985, 2878], 15169)
-    femmesh.addVolume([861, 1192, 1193, 2799], 15170)
-    femmesh.addVolume([732, 958, 2797, 959], 15171)
-    femmesh.addVolume([890, 1219, 1220, 2880], 15172)
-    femmesh.addVolume([864, 1194, 1195, 2805], 15173)
-    femmesh.addVolume([735, 960, 2803, 961], 15174)
-    femmesh.addVolume([1218, 2874, 887, 1217], 15175)
-    femmesh.addVolume([984, 983, 758, 2872], 15176)
-    femmesh.addVolume([2438, 741, 740, 966], 15177)
-    femmesh.addVolume([869, 1200, 870, 2440], 15178)
-    femmesh.addVolume([881, 2476, 1212, 882], 15179)
-    femmesh.addVolume([978, 752, 753, 2474], 15180)
-    femmesh.addVolume([755, 981, 980, 2863], 15181)
-    femmesh.addVolume([1214, 884, 2865, 1215], 15182)
-    femmesh.addVolume([1197, 1198, 867, 2814], 15183)
-    femmesh.addVolume([963, 2812, 738, 964], 15184)
-    femmesh.addVolume([1187, 856, 855, 2398], 15185)
-    femmesh.addVolume([726, 2396, 727, 953], 15186)
-    femmesh.addVolume([767, 991, 766, 2516], 15187)
-    femmesh.addVolume([1225, 896, 895, 2518], 15188)
-    femmesh.addVolume([1190, 858, 1189, 2790], 15189)
-    femmesh.addVolume([2788, 956, 729, 955], 15190)
-    femmesh.addVolume([988, 764, 989, 2887], 15191)
-    femmesh.addVolume([1223, 893, 1222, 2889], 15192)
-    femmesh.addVolume([912, 1238, 1239, 2980], 15193)
-    femmesh.addVolume([1329, 3139, 839, 1328], 15194)
-    femmesh.addVolume([1071, 783, 1072, 2978], 15195)
-    femmesh.addVolume([710, 1066, 1065, 3137], 15196)
-    femmesh.addVolume([3053, 1097, 809, 1096], 15197)
-    femmesh.addVolume([1040, 684, 1041, 3062], 15198)
-    femmesh.addVolume([1304, 3064, 813, 1303], 15199)
-    femmesh.addVolume([1264, 938, 1263, 3055], 15200)
-    femmesh.addVolume([1063, 1062, 706, 3128], 15201)
-    femmesh.addVolume([1326, 3130, 835, 1325], 15202)
-    femmesh.addVolume([1074, 787, 1075, 2987], 15203)
-    femmesh.addVolume([1242, 916, 1241, 2989], 15204)
-    femmesh.addVolume([1077, 1076, 789, 2993], 15205)
-    femmesh.addVolume([918, 1243, 1244, 2995], 15206)
-    femmesh.addVolume([1060, 704, 1061, 3122], 15207)
-    femmesh.addVolume([1323, 833, 3124, 1324], 15208)
-    femmesh.addVolume([1262, 936, 1261, 3049], 15209)
-    femmesh.addVolume([1043, 1042, 686, 3068], 15210)
-    femmesh.addVolume([1306, 3070, 815, 1305], 15211)
-    femmesh.addVolume([3047, 1095, 807, 1094], 15212)
-    femmesh.addVolume([1331, 3145, 841, 1330], 15213)
-    femmesh.addVolume([1068, 1067, 712, 3143], 15214)
-    femmesh.addVolume([1069, 781, 1070, 2970], 15215)
-    femmesh.addVolume([1237, 910, 1236, 2974], 15216)
-    femmesh.addVolume([1220, 1221, 891, 2883], 15217)
-    femmesh.addVolume([762, 987, 986, 2881], 15218)
-    femmesh.addVolume([957, 2794, 731, 958], 15219)
-    femmesh.addVolume([1191, 1192, 860, 2796], 15220)
-    femmesh.addVolume([1196, 865, 1195, 2808], 15221)
-    femmesh.addVolume([962, 736, 2806, 961], 15222)
-    femmesh.addVolume([2871, 1216, 886, 1217], 15223)
-    femmesh.addVolume([982, 757, 983, 2869], 15224)
-    femmesh.addVolume([1216, 2868, 885, 1215], 15225)
-    femmesh.addVolume([1196, 1197, 866, 2811], 15226)
-    femmesh.addVolume([962, 2809, 737, 963], 15227)
-    femmesh.addVolume([756, 982, 981, 2866], 15228)
-    femmesh.addVolume([1191, 859, 1190, 2793], 15229)
-    femmesh.addVolume([2791, 957, 730, 956], 15230)
-    femmesh.addVolume([987, 763, 988, 2884], 15231)
-    femmesh.addVolume([1222, 892, 1221, 2886], 15232)
-    femmesh.addVolume([1330, 3142, 840, 1329], 15233)
-    femmesh.addVolume([1237, 1238, 911, 2977], 15234)
-    femmesh.addVolume([1070, 782, 1071, 2975], 15235)
-    femmesh.addVolume([711, 1067, 1066, 3140], 15236)
-    femmesh.addVolume([1262, 1263, 937, 3052], 15237)
-    femmesh.addVolume([1095, 3050, 808, 1096], 15238)
-    femmesh.addVolume([1305, 3067, 814, 1304], 15239)
-    femmesh.addVolume([1042, 1041, 685, 3065], 15240)
-    femmesh.addVolume([788, 1076, 1075, 2990], 15241)
-    femmesh.addVolume([1062, 1061, 705, 3125], 15242)
-    femmesh.addVolume([1325, 3127, 834, 1324], 15243)
-    femmesh.addVolume([1242, 1243, 917, 2992], 15244)
-    femmesh.addVolume([1058, 701, 702, 2321], 15245)
-    femmesh.addVolume([2593, 921, 1246, 920], 15246)
-    femmesh.addVolume([2591, 792, 791, 1079], 15247)
-    femmesh.addVolume([831, 2323, 830, 1321], 15248)
-    femmesh.addVolume([2284, 817, 818, 1308], 15249)
-    femmesh.addVolume([1045, 688, 689, 2282], 15250)
-    femmesh.addVolume([1259, 934, 933, 2632], 15251)
-    femmesh.addVolume([804, 2630, 805, 1092], 15252)
-    femmesh.addVolume([2735, 889, 888, 2497], 15253)
-    femmesh.addVolume([2691, 759, 760, 2495], 15254)
-    femmesh.addVolume([2417, 734, 733, 2690], 15255)
-    femmesh.addVolume([862, 2734, 863, 2419], 15256)
-    femmesh.addVolume([1283, 2740, 2730, 1138], 15257)
-    femmesh.addVolume([2479, 1213, 882, 883], 15258)
-    femmesh.addVolume([754, 979, 753, 2477], 15259)
-    femmesh.addVolume([2435, 740, 739, 965], 15260)
-    femmesh.addVolume([1199, 869, 868, 2437], 15261)
-    femmesh.addVolume([1188, 857, 856, 2401], 15262)
-    femmesh.addVolume([727, 2399, 728, 954], 15263)
-    femmesh.addVolume([894, 1224, 895, 2515], 15264)
-    femmesh.addVolume([766, 990, 765, 2513], 15265)
-    femmesh.addVolume([920, 1245, 2590, 919], 15266)
-    femmesh.addVolume([1078, 790, 791, 2588], 15267)
-    femmesh.addVolume([832, 2326, 831, 1322], 15268)
-    femmesh.addVolume([1059, 702, 703, 2324], 15269)
-    femmesh.addVolume([688, 1044, 687, 2279], 15270)
-    femmesh.addVolume([2281, 816, 817, 1307], 15271)
-    femmesh.addVolume([934, 1260, 935, 2635], 15272)
-    femmesh.addVolume([2633, 806, 805, 1093], 15273)
-    femmesh.addVolume([2741, 1136, 1284, 2733], 15274)
-    femmesh.addVolume([2745, 2732, 1158, 1136], 15275)
-    femmesh.addVolume([714, 21, 713, 2357], 15276)
-    femmesh.addVolume([842, 28, 843, 2359], 15277)
-    femmesh.addVolume([780, 22, 779, 2555], 15278)
-    femmesh.addVolume([909, 908, 26, 2557], 15279)
-    femmesh.addVolume([1020, 2744, 2686, 940], 15280)
-    femmesh.addVolume([980, 754, 755, 2480], 15281)
-    femmesh.addVolume([1198, 868, 867, 2434], 15282)
-    femmesh.addVolume([883, 2482, 1214, 884], 15283)
-    femmesh.addVolume([2432, 739, 738, 964], 15284)
-    femmesh.addVolume([2689, 2742, 1021, 942], 15285)
-    femmesh.addVolume([1189, 858, 857, 2404], 15286)
-    femmesh.addVolume([765, 989, 764, 2510], 15287)
-    femmesh.addVolume([728, 2402, 729, 955], 15288)
-    femmesh.addVolume([1223, 894, 893, 2512], 15289)
-    femmesh.addVolume([1117, 2688, 942, 2736], 15290)
-    femmesh.addVolume([2587, 1244, 918, 919], 15291)
-    femmesh.addVolume([1077, 789, 790, 2585], 15292)
-    femmesh.addVolume([704, 1060, 703, 2327], 15293)
-    femmesh.addVolume([833, 2329, 832, 1323], 15294)
-    femmesh.addVolume([2278, 815, 816, 1306], 15295)
-    femmesh.addVolume([806, 2636, 807, 1094], 15296)
-    femmesh.addVolume([687, 1043, 686, 2276], 15297)
-    femmesh.addVolume([1261, 936, 935, 2638], 15298)
-    femmesh.addVolume([713, 1068, 712, 2354], 15299)
-    femmesh.addVolume([2356, 841, 842, 1331], 15300)
-    femmesh.addVolume([781, 1069, 780, 2558], 15301)
-    femmesh.addVolume([909, 1236, 910, 2560], 15302)
-    femmesh.addVolume([2485, 884, 885, 1215], 15303)
-    femmesh.addVolume([1197, 867, 866, 2431], 15304)
-    femmesh.addVolume([737, 2429, 738, 963], 15305)
-    femmesh.addVolume([981, 755, 756, 2483], 15306)
-    femmesh.addVolume([858, 1190, 859, 2407], 15307)
-    femmesh.addVolume([729, 2405, 730, 956], 15308)
-    femmesh.addVolume([1222, 893, 892, 2509], 15309)
-    femmesh.addVolume([764, 988, 763, 2507], 15310)
-    femmesh.addVolume([784, 1072, 783, 2567], 15311)
-    femmesh.addVolume([913, 912, 1239, 2569], 15312)
-    femmesh.addVolume([839, 2347, 838, 1328], 15313)
-    femmesh.addVolume([1065, 709, 710, 2345], 15314)
-    femmesh.addVolume([917, 1243, 918, 2584], 15315)
-    femmesh.addVolume([789, 1076, 788, 2582], 15316)
-    femmesh.addVolume([705, 1061, 704, 2330], 15317)
-    femmesh.addVolume([2332, 833, 834, 1324], 15318)
-    femmesh.addVolume([939, 938, 1264, 2647], 15319)
-    femmesh.addVolume([809, 2645, 810, 1097], 15320)
-    femmesh.addVolume([2268, 812, 813, 1303], 15321)
-    femmesh.addVolume([684, 1040, 683, 2263], 15322)
-    femmesh.addVolume([2275, 814, 815, 1305], 15323)
-    femmesh.addVolume([686, 1042, 685, 2273], 15324)
-    femmesh.addVolume([937, 936, 1262, 2641], 15325)
-    femmesh.addVolume([807, 2639, 808, 1095], 15326)
-    femmesh.addVolume([1063, 706, 707, 2336], 15327)
-    femmesh.addVolume([836, 2338, 835, 1326], 15328)
-    femmesh.addVolume([787, 1074, 786, 2576], 15329)
-    femmesh.addVolume([1241, 916, 915, 2578], 15330)
-    femmesh.addVolume([712, 1067, 711, 2351], 15331)
-    femmesh.addVolume([2353, 840, 841, 1330], 15332)
-    femmesh.addVolume([782, 1070, 781, 2561], 15333)
-    femmesh.addVolume([911, 910, 1237, 2563], 15334)
-    femmesh.addVolume([891, 890, 1220, 2503], 15335)
-    femmesh.addVolume([762, 986, 761, 2501], 15336)
-    femmesh.addVolume([860, 1192, 861, 2413], 15337)
-    femmesh.addVolume([2411, 732, 731, 958], 15338)
-    femmesh.addVolume([736, 2426, 737, 962], 15339)
-    femmesh.addVolume([982, 756, 757, 2486], 15340)
-    femmesh.addVolume([1196, 866, 865, 2428], 15341)
-    femmesh.addVolume([886, 2488, 885, 1216], 15342)
-    femmesh.addVolume([886, 887, 2491, 1217], 15343)
-    femmesh.addVolume([758, 983, 757, 2489], 15344)
-    femmesh.addVolume([2423, 736, 735, 961], 15345)
-    femmesh.addVolume([864, 1195, 865, 2425], 15346)
-    femmesh.addVolume([730, 2408, 731, 957], 15347)
-    femmesh.addVolume([1191, 860, 859, 2410], 15348)
-    femmesh.addVolume([892, 891, 1221, 2506], 15349)
-    femmesh.addVolume([763, 987, 762, 2504], 15350)
-    femmesh.addVolume([840, 2350, 839, 1329], 15351)
-    femmesh.addVolume([783, 1071, 782, 2564], 15352)
-    femmesh.addVolume([1066, 710, 711, 2348], 15353)
-    femmesh.addVolume([911, 1238, 912, 2566], 15354)
-    femmesh.addVolume([1242, 917, 916, 2581], 15355)
-    femmesh.addVolume([788, 1075, 787, 2579], 15356)
-    femmesh.addVolume([1062, 705, 706, 2333], 15357)
-    femmesh.addVolume([2335, 834, 835, 1325], 15358)
-    femmesh.addVolume([685, 1041, 684, 2270], 15359)
-    femmesh.addVolume([2272, 813, 814, 1304], 15360)
-    femmesh.addVolume([808, 2642, 809, 1096], 15361)
-    femmesh.addVolume([937, 1263, 938, 2644], 15362)
-    femmesh.addVolume([2746, 1157, 2731, 1138], 15363)
-    femmesh.addVolume([940, 2687, 1116, 2738], 15364)
-    femmesh.addVolume([1283, 23, 2740, 1138], 15365)
-    femmesh.addVolume([941, 2744, 1020, 940], 15366)
-    femmesh.addVolume([1157, 2746, 1137, 1138], 15367)
-    femmesh.addVolume([941, 1021, 2742, 942], 15368)
-    femmesh.addVolume([2745, 1158, 1137, 1136], 15369)
-    femmesh.addVolume([23, 1284, 2741, 1136], 15370)
-    femmesh.addVolume([17, 1117, 942, 2736], 15371)
-    femmesh.addVolume([1116, 17, 940, 2738], 15372)
-    femmesh.addVolume([2360, 715, 714, 2684], 15373)
-    femmesh.addVolume([778, 2552, 779, 2685], 15374)
-    femmesh.addVolume([2728, 844, 843, 2362], 15375)
-    femmesh.addVolume([907, 2554, 2729, 908], 15376)
-    femmesh.addVolume([2691, 985, 984, 2875], 15377)
-    femmesh.addVolume([1193, 1194, 2734, 2802], 15378)
-    femmesh.addVolume([2800, 2690, 959, 960], 15379)
-    femmesh.addVolume([1219, 2735, 1218, 2877], 15380)
-    femmesh.addVolume([3184, 1336, 2964, 2692], 15381)
-    femmesh.addVolume([3184, 2964, 1336, 2648], 15382)
-    femmesh.addVolume([1334, 2964, 1336, 2692], 15383)
-    femmesh.addVolume([1334, 1336, 2964, 2648], 15384)
-    femmesh.addVolume([3183, 1335, 2963, 2649], 15385)
-    femmesh.addVolume([3183, 2963, 1335, 2693], 15386)
-    femmesh.addVolume([1333, 2963, 1335, 2649], 15387)
-    femmesh.addVolume([1333, 1335, 2963, 2693], 15388)
-    femmesh.addVolume([2926, 1002, 2649, 2966], 15389)
-    femmesh.addVolume([2926, 2649, 1002, 2669], 15390)
-    femmesh.addVolume([2711, 1161, 2944, 2725], 15391)
-    femmesh.addVolume([2711, 2944, 1161, 2935], 15392)
-    femmesh.addVolume([3184, 2964, 2709, 2692], 15393)
-    femmesh.addVolume([3184, 2709, 2964, 3163], 15394)
-    femmesh.addVolume([2680, 1037, 2959, 2943], 15395)
-    femmesh.addVolume([1037, 2680, 2959, 2658], 15396)
-    femmesh.addVolume([2713, 2669, 2704, 3172], 15397)
-    femmesh.addVolume([2713, 2704, 2669, 2950], 15398)
-    femmesh.addVolume([2659, 2704, 2669, 3172], 15399)
-    femmesh.addVolume([2659, 2669, 2704, 2950], 15400)
-    femmesh.addVolume([2675, 3193, 2719, 2945], 15401)
-    femmesh.addVolume([3193, 2675, 2719, 3182], 15402)
-    femmesh.addVolume([3162, 2960, 2944, 2676], 15403)
-    femmesh.addVolume([2960, 3162, 2944, 2725], 15404)
-    femmesh.addVolume([2960, 3162, 3177, 2676], 15405)
-    femmesh.addVolume([3162, 2960, 3177, 2725], 15406)
-    femmesh.addVolume([2680, 2709, 2665, 2943], 15407)
-    femmesh.addVolume([2709, 2680, 2665, 3152], 15408)
-    femmesh.addVolume([2709, 2680, 2724, 2943], 15409)
-    femmesh.addVolume([2680, 2709, 2724, 3152], 15410)
-    femmesh.addVolume([2669, 3183, 2713, 2926], 15411)
-    femmesh.addVolume([3183, 2669, 2713, 3148], 15412)
-    femmesh.addVolume([3183, 2669, 2649, 2926], 15413)
-    femmesh.addVolume([2951, 1026, 2666, 2681], 15414)
-    femmesh.addVolume([1026, 2951, 2666, 2938], 15415)
-    femmesh.addVolume([2665, 2964, 3163, 2648], 15416)
-    femmesh.addVolume([2964, 2665, 2965, 2648], 15417)
-    femmesh.addVolume([2665, 2964, 2965, 2930], 15418)
-    femmesh.addVolume([2709, 2964, 2665, 2930], 15419)
-    femmesh.addVolume([2709, 2665, 2964, 3163], 15420)
-    femmesh.addVolume([3177, 2737, 2960, 2664], 15421)
-    femmesh.addVolume([2737, 3177, 2960, 2700], 15422)
-    femmesh.addVolume([2661, 2719, 2705, 2961], 15423)
-    femmesh.addVolume([2719, 2661, 2705, 3165], 15424)
-    femmesh.addVolume([2719, 2661, 2675, 2961], 15425)
-    femmesh.addVolume([2661, 2719, 2675, 3165], 15426)
-    femmesh.addVolume([3163, 1135, 2648, 3185], 15427)
-    femmesh.addVolume([3163, 2648, 1135, 2665], 15428)
-    femmesh.addVolume([2710, 1296, 3147, 2726], 15429)
-    femmesh.addVolume([1296, 2710, 3147, 3171], 15430)
-    femmesh.addVolume([3151, 2723, 2682, 3167], 15431)
-    femmesh.addVolume([3151, 2682, 2723, 2667], 15432)
-    femmesh.addVolume([2706, 1288, 3174, 3160], 15433)
-    femmesh.addVolume([1288, 2706, 3174, 2711], 15434)
-    femmesh.addVolume([2717, 2937, 3166, 3159], 15435)
-    femmesh.addVolume([2717, 3166, 2937, 2702], 15436)
-    femmesh.addVolume([2715, 1166, 2932, 2946], 15437)
-    femmesh.addVolume([1166, 2715, 2932, 2708], 15438)
-    femmesh.addVolume([3165, 2739, 2730, 3156], 15439)
-    femmesh.addVolume([2739, 3165, 2730, 2705], 15440)
-    femmesh.addVolume([2876, 2496, 2879, 2877], 15441)
-    femmesh.addVolume([2876, 2879, 2496, 2875], 15442)
-    femmesh.addVolume([2801, 2421, 2804, 2802], 15443)
-    femmesh.addVolume([2801, 2804, 2421, 2800], 15444)
-    femmesh.addVolume([3058, 2265, 3061, 27], 15445)
-    femmesh.addVolume([2265, 3058, 3061, 3060], 15446)
-    femmesh.addVolume([2265, 3058, 2266, 27], 15447)
-    femmesh.addVolume([3058, 2265, 2266, 3060], 15448)
-    femmesh.addVolume([3056, 2262, 2269, 20], 15449)
-    femmesh.addVolume([2262, 3056, 2269, 3060], 15450)
-    femmesh.addVolume([2262, 3056, 3059, 20], 15451)
-    femmesh.addVolume([3056, 2262, 3059, 3060], 15452)
-    femmesh.addVolume([3134, 2339, 3131, 1064], 15453)
-    femmesh.addVolume([3134, 3131, 2339, 3135], 15454)
-    femmesh.addVolume([2984, 2573, 2981, 1073], 15455)
-    femmesh.addVolume([2984, 2981, 2573, 2985], 15456)
-    femmesh.addVolume([2983, 2575, 2986, 1240], 15457)
-    femmesh.addVolume([2983, 2986, 2575, 2985], 15458)
-    femmesh.addVolume([3136, 2341, 3133, 3135], 15459)
-    femmesh.addVolume([3136, 3133, 2341, 1327], 15460)
-    femmesh.addVolume([2669, 3186, 3183, 2649], 15461)
-    femmesh.addVolume([3186, 2669, 3183, 3148], 15462)
-    femmesh.addVolume([3186, 2669, 1098, 2649], 15463)
-    femmesh.addVolume([2669, 3186, 1098, 3148], 15464)
-    return True
+    return load_mesh(femmesh, __name__, nodes=False)
@@ -1,5412 +1,11 @@
+from . import load_mesh
+
+
 def create_nodes(femmesh):
     # nodes
-    femmesh.addNode(0.0, 0.0, 100.0, 1)
-    femmesh.addNode(0.0, 0.0, 0.0, 2)
-    femmesh.addNode(0.0, 200.0, 100.0, 3)
-    femmesh.addNode(0.0, 200.0, 0.0, 4)
-    femmesh.addNode(1000.0, 0.0, 100.0, 5)
-    femmesh.addNode(1000.0, 0.0, 0.0, 6)
-    femmesh.addNode(1000.0, 200.0, 100.0, 7)
-    femmesh.addNode(1000.0, 200.0, 0.0, 8)
-    femmesh.addNode(0.0, 0.0, 33.33333333333322, 9)
-    femmesh.addNode(0.0, 0.0, 66.66666666666659, 10)
-    femmesh.addNode(0.0, 0.0, 16.66666666666661, 11)
-    femmesh.addNode(0.0, 0.0, 49.99999999999991, 12)
-    femmesh.addNode(0.0, 0.0, 83.3333333333333, 13)
-    femmesh.addNode(0.0, 39.99999999999987, 100.0, 14)
-    femmesh.addNode(0.0, 79.99999999999973, 100.0, 15)
-    femmesh.addNode(0.0, 119.99999999999982, 100.0, 16)
-    femmesh.addNode(0.0, 159.99999999999991, 100.0, 17)
-    femmesh.addNode(0.0, 19.999999999999936, 100.0, 18)
-    femmesh.addNode(0.0, 59.9999999999998, 100.0, 19)
-    femmesh.addNode(0.0, 99.99999999999977, 100.0, 20)
-    femmesh.addNode(0.0, 139.99999999999986, 100.0, 21)
-    femmesh.addNode(0.0, 179.99999999999997, 100.0, 22)
-    femmesh.addNode(0.0, 200.0, 33.33333333333322, 23)
-    femmesh.addNode(0.0, 200.0, 66.66666666666659, 24)
-    femmesh.addNode(0.0, 200.0, 16.66666666666661, 25)
-    femmesh.addNode(0.0, 200.0, 49.99999999999991, 26)
-    femmesh.addNode(0.0, 200.0, 83.3333333333333, 27)
-    femmesh.addNode(0.0, 39.99999999999987, 0.0, 28)
-    femmesh.addNode(0.0, 79.99999999999973, 0.0, 29)
-    femmesh.addNode(0.0, 119.99999999999982, 0.0, 30)
-    femmesh.addNode(0.0, 159.99999999999991, 0.0, 31)
-    femmesh.addNode(0.0, 19.999999999999936, 0.0, 32)
-    femmesh.addNode(0.0, 59.9999999999998, 0.0, 33)
-    femmesh.addNode(0.0, 99.99999999999977, 0.0, 34)
-    femmesh.addNode(0.0, 139.99999999999986, 0.0, 35)
-    femmesh.addNode(0.0, 179.99999999999997, 0.0, 36)
-    femmesh.addNode(1000.0, 0.0, 33.33333333333322, 37)
-    femmesh.addNode(1000.0, 0.0, 66.66666666666659, 38)
-    femmesh.addNode(1000.0, 0.0, 16.66666666666661, 39)
-    femmesh.addNode(1000.0, 0.0, 49.99999999999991, 40)
-    femmesh.addNode(1000.0, 0.0, 83.3333333333333, 41)
-    femmesh.addNode(1000.0, 39.99999999999987, 100.0, 42)
-    femmesh.addNode(1000.0, 79.99999999999973, 100.0, 43)
-    femmesh.addNode(1000.0, 119.99999999999982, 100.0, 44)
-    femmesh.addNode(1000.0, 159.99999999999991, 100.0, 45)
-    femmesh.addNode(1000.0, 19.999999999999936, 100.0, 46)
-    femmesh.addNode(1000.0, 59.9999999999998, 100.0, 47)
-    femmesh.addNode(1000.0, 99.99999999999977, 100.0, 48)
-    femmesh.addNode(1000.0, 139.99999999999986, 100.0, 49)
-    femmesh.addNode(1000.0, 179.99999999999997, 100.0, 50)
-    femmesh.addNode(1000.0, 200.0, 33.33333333333322, 51)
-    femmesh.addNode(1000.0, 200.0, 66.66666666666659, 52)
-    femmesh.addNode(1000.0, 200.0, 16.66666666666661, 53)
-    femmesh.addNode(1000.0, 200.0, 49.99999999999991, 54)
-    femmesh.addNode(1000.0, 200.0, 83.3333333333333, 55)
-    femmesh.addNode(1000.0, 39.99999999999987, 0.0, 56)
-    femmesh.addNode(1000.0, 79.99999999999973, 0.0, 57)
-    femmesh.addNode(1000.0, 119.99999999999982, 0.0, 58)
-    femmesh.addNode(1000.0, 159.99999999999991, 0.0, 59)
-    femmesh.addNode(1000.0, 19.999999999999936, 0.0, 60)
-    femmesh.addNode(1000.0, 59.9999999999998, 0.0, 61)
-    femmesh.addNode(1000.0, 99.99999999999977, 0.0, 62)
-    femmesh.addNode(1000.0, 139.99999999999986, 0.0, 63)
-    femmesh.addNode(1000.0, 179.99999999999997, 0.0, 64)
-    femmesh.addNode(39.999999999999986, 0.0, 0.0, 65)
-    femmesh.addNode(79.99999999999999, 0.0, 0.0, 66)
-    femmesh.addNode(120.0, 0.0, 0.0, 67)
-    femmesh.addNode(160.0, 0.0, 0.0, 68)
-    femmesh.addNode(199.99999999999997, 0.0, 0.0, 69)
-    femmesh.addNode(240.0, 0.0, 0.0, 70)
-    femmesh.addNode(280.0, 0.0, 0.0, 71)
-    femmesh.addNode(320.0, 0.0, 0.0, 72)
-    femmesh.addNode(359.99999999999994, 0.0, 0.0, 73)
-    femmesh.addNode(399.99999999999994, 0.0, 0.0, 74)
-    femmesh.addNode(440.0, 0.0, 0.0, 75)
-    femmesh.addNode(480.0, 0.0, 0.0, 76)
-    femmesh.addNode(520.0, 0.0, 0.0, 77)
-    femmesh.addNode(560.0, 0.0, 0.0, 78)
-    femmesh.addNode(600.0, 0.0, 0.0, 79)
-    femmesh.addNode(640.0, 0.0, 0.0, 80)
-    femmesh.addNode(679.9999999999999, 0.0, 0.0, 81)
-    femmesh.addNode(719.9999999999999, 0.0, 0.0, 82)
-    femmesh.addNode(759.9999999999999, 0.0, 0.0, 83)
-    femmesh.addNode(799.9999999999999, 0.0, 0.0, 84)
-    femmesh.addNode(839.9999999999999, 0.0, 0.0, 85)
-    femmesh.addNode(880.0, 0.0, 0.0, 86)
-    femmesh.addNode(920.0, 0.0, 0.0, 87)
-    femmesh.addNode(960.0, 0.0, 0.0, 88)
-    femmesh.addNode(19.999999999999993, 0.0, 0.0, 89)
-    femmesh.addNode(59.999999999999986, 0.0, 0.0, 90)
-    femmesh.addNode(99.99999999999999, 0.0, 0.0, 91)
-    femmesh.addNode(140.0, 0.0, 0.0, 92)
-    femmesh.addNode(180.0, 0.0, 0.0, 93)
-    femmesh.addNode(220.0, 0.0, 0.0, 94)
-    femmesh.addNode(260.0, 0.0, 0.0, 95)
-    femmesh.addNode(300.0, 0.0, 0.0, 96)
-    femmesh.addNode(340.0, 0.0, 0.0, 97)
-    femmesh.addNode(379.99999999999994, 0.0, 0.0, 98)
-    femmesh.addNode(420.0, 0.0, 0.0, 99)
-    femmesh.addNode(460.0, 0.0, 0.0, 100)
-    femmesh.addNode(500.0, 0.0, 0.0, 101)
-    femmesh.addNode(540.0, 0.0, 0.0, 102)
-    femmesh.addNode(580.0, 0.0, 0.0, 103)
-    femmesh.addNode(620.0, 0.0, 0.0, 104)
-    femmesh.addNode(660.0, 0.0, 0.0, 105)
-    femmesh.addNode(699.9999999999999, 0.0, 0.0, 106)
-    femmesh.addNode(739.9999999999999, 0.0, 0.0, 107)
-    femmesh.addNode(779.9999999999999, 0.0, 0.0, 108)
-    femmesh.addNode(819.9999999999999, 0.0, 0.0, 109)
-    femmesh.addNode(860.0, 0.0, 0.0, 110)
-    femmesh.addNode(900.0, 0.0, 0.0, 111)
-    femmesh.addNode(940.0, 0.0, 0.0, 112)
-    femmesh.addNode(980.0, 0.0, 0.0, 113)
-    femmesh.addNode(39.999999999999986, 0.0, 100.0, 114)
-    femmesh.addNode(79.99999999999999, 0.0, 100.0, 115)
-    femmesh.addNode(120.0, 0.0, 100.0, 116)
-    femmesh.addNode(160.0, 0.0, 100.0, 117)
-    femmesh.addNode(199.99999999999997, 0.0, 100.0, 118)
-    femmesh.addNode(240.0, 0.0, 100.0, 119)
-    femmesh.addNode(280.0, 0.0, 100.0, 120)
-    femmesh.addNode(320.0, 0.0, 100.0, 121)
-    femmesh.addNode(359.99999999999994, 0.0, 100.0, 122)
-    femmesh.addNode(399.99999999999994, 0.0, 100.0, 123)
-    femmesh.addNode(440.0, 0.0, 100.0, 124)
-    femmesh.addNode(480.0, 0.0, 100.0, 125)
-    femmesh.addNode(520.0, 0.0, 100.0, 126)
-    femmesh.addNode(560.0, 0.0, 100.0, 127)
-    femmesh.addNode(600.0, 0.0, 100.0, 128)
-    femmesh.addNode(640.0, 0.0, 100.0, 129)
-    femmesh.addNode(679.9999999999999, 0.0, 100.0, 130)
-    femmesh.addNode(719.9999999999999, 0.0, 100.0, 131)
-    femmesh.addNode(759.9999999999999, 0.0, 100.0, 132)
-    femmesh.addNode(799.9999999999999, 0.0, 100.0, 133)
-    femmesh.addNode(839.9999999999999, 0.0, 100.0, 134)
-    femmesh.addNode(880.0, 0.0, 100.0, 135)
-    femmesh.addNode(920.0, 0.0, 100.0, 136)
-    femmesh.addNode(960.0, 0.0, 100.0, 137)
-    femmesh.addNode(19.999999999999993, 0.0, 100.0, 138)
-    femmesh.addNode(59.999999999999986, 0.0, 100.0, 139)
-    femmesh.addNode(99.99999999999999, 0.0, 100.0, 140)
-    femmesh.addNode(140.0, 0.0, 100.0, 141)
-    femmesh.addNode(180.0, 0.0, 100.0, 142)
-    femmesh.addNode(220.0, 0.0, 100.0, 143)
-    femmesh.addNode(260.0, 0.0, 100.0, 144)
-    femmesh.addNode(300.0, 0.0, 100.0, 145)
-    femmesh.addNode(340.0, 0.0, 100.0, 146)
-    femmesh.addNode(379.99999999999994, 0.0, 100.0, 147)
-    femmesh.addNode(420.0, 0.0, 100.0, 148)
-    femmesh.addNode(460.0, 0.0, 100.0, 149)
-    femmesh.addNode(500.0, 0.0, 100.0, 150)
-    femmesh.addNode(540.0, 0.0, 100.0, 151)
-    femmesh.addNode(580.0, 0.0, 100.0, 152)
-    femmesh.addNode(620.0, 0.0, 100.0, 153)
-    femmesh.addNode(660.0, 0.0, 100.0, 154)
-    femmesh.addNode(699.9999999999999, 0.0, 100.0, 155)
-    femmesh.addNode(739.9999999999999, 0.0, 100.0, 156)
-    femmesh.addNode(779.9999999999999, 0.0, 100.0, 157)
-    femmesh.addNode(819.9999999999999, 0.0, 100.0, 158)
-    femmesh.addNode(860.0, 0.0, 100.0, 159)
-    femmesh.addNode(900.0, 0.0, 100.0, 160)
-    femmesh.addNode(940.0, 0.0, 100.0, 161)
-    femmesh.addNode(980.0, 0.0, 100.0, 162)
-    femmesh.addNode(39.999999999999986, 200.0, 0.0, 163)
-    femmesh.addNode(79.99999999999999, 200.0, 0.0, 164)
-    femmesh.addNode(120.0, 200.0, 0.0, 165)
-    femmesh.addNode(160.0, 200.0, 0.0, 166)
-    femmesh.addNode(199.99999999999997, 200.0, 0.0, 167)
-    femmesh.addNode(240.0, 200.0, 0.0, 168)
-    femmesh.addNode(280.0, 200.0, 0.0, 169)
-    femmesh.addNode(320.0, 200.0, 0.0, 170)
-    femmesh.addNode(359.99999999999994, 200.0, 0.0, 171)
-    femmesh.addNode(399.99999999999994, 200.0, 0.0, 172)
-    femmesh.addNode(440.0, 200.0, 0.0, 173)
-    femmesh.addNode(480.0, 200.0, 0.0, 174)
-    femmesh.addNode(520.0, 200.0, 0.0, 175)
-    femmesh.addNode(560.0, 200.0, 0.0, 176)
-    femmesh.addNode(600.0, 200.0, 0.0, 177)
-    femmesh.addNode(640.0, 200.0, 0.0, 178)
-    femmesh.addNode(679.9999999999999, 200.0, 0.0, 179)
-    femmesh.addNode(719.9999999999999, 200.0, 0.0, 180)
-    femmesh.addNode(759.9999999999999, 200.0, 0.0, 181)
-    femmesh.addNode(799.9999999999999, 200.0, 0.0, 182)
-    femmesh.addNode(839.9999999999999, 200.0, 0.0, 183)
-    femmesh.addNode(880.0, 200.0, 0.0, 184)
-    femmesh.addNode(920.0, 200.0, 0.0, 185)
-    femmesh.addNode(960.0, 200.0, 0.0, 186)
-    femmesh.addNode(19.999999999999993, 200.0, 0.0, 187)
-    femmesh.addNode(59.999999999999986, 200.0, 0.0, 188)
-    femmesh.addNode(99.99999999999999, 200.0, 0.0, 189)
-    femmesh.addNode(140.0, 200.0, 0.0, 190)
-    femmesh.addNode(180.0, 200.0, 0.0, 191)
-    femmesh.addNode(220.0, 200.0, 0.0, 192)
-    femmesh.addNode(260.0, 200.0, 0.0, 193)
-    femmesh.addNode(300.0, 200.0, 0.0, 194)
-    femmesh.addNode(340.0, 200.0, 0.0, 195)
-    femmesh.addNode(379.99999999999994, 200.0, 0.0, 196)
-    femmesh.addNode(420.0, 200.0, 0.0, 197)
-    femmesh.addNode(460.0, 200.0, 0.0, 198)
-    femmesh.addNode(500.0, 200.0, 0.0, 199)
-    femmesh.addNode(540.0, 200.0, 0.0, 200)
-    femmesh.addNode(580.0, 200.0, 0.0, 201)
-    femmesh.addNode(620.0, 200.0, 0.0, 202)
-    femmesh.addNode(660.0, 200.0, 0.0, 203)
-    femmesh.addNode(699.9999999999999, 200.0, 0.0, 204)
-    femmesh.addNode(739.9999999999999, 200.0, 0.0, 205)
-    femmesh.addNode(779.9999999999999, 200.0, 0.0, 206)
-    femmesh.addNode(819.9999999999999, 200.0, 0.0, 207)
-    femmesh.addNode(860.0, 200.0, 0.0, 208)
-    femmesh.addNode(900.0, 200.0, 0.0, 209)
-    femmesh.addNode(940.0, 200.0, 0.0, 210)
-    femmesh.addNode(980.0, 200.0, 0.0, 211)
-    femmesh.addNode(39.999999999999986, 200.0, 100.0, 212)
-    femmesh.addNode(79.99999999999999, 200.0, 100.0, 213)
-    femmesh.addNode(120.0, 200.0, 100.0, 214)
-    femmesh.addNode(160.0, 200.0, 100.0, 215)
-    femmesh.addNode(199.99999999999997, 200.0, 100.0, 216)
-    femmesh.addNode(240.0, 200.0, 100.0, 217)
-    femmesh.addNode(280.0, 200.0, 100.0, 218)
-    femmesh.addNode(320.0, 200.0, 100.0, 219)
-    femmesh.addNode(359.99999999999994, 200.0, 100.0, 220)
-    femmesh.addNode(399.99999999999994, 200.0, 100.0, 221)
-    femmesh.addNode(440.0, 200.0, 100.0, 222)
-    femmesh.addNode(480.0, 200.0, 100.0, 223)
-    femmesh.addNode(520.0, 200.0, 100.0, 224)
-    femmesh.addNode(560.0, 200.0, 100.0, 225)
-    femmesh.addNode(600.0, 200.0, 100.0, 226)
-    femmesh.addNode(640.0, 200.0, 100.0, 227)
-    femmesh.addNode(679.9999999999999, 200.0, 100.0, 228)
-    femmesh.addNode(719.9999999999999, 200.0, 100.0, 229)
-    femmesh.addNode(759.9999999999999, 200.0, 100.0, 230)
-    femmesh.addNode(799.9999999999999, 200.0, 100.0, 231)
-    femmesh.addNode(839.9999999999999, 200.0, 100.0, 232)
-    femmesh.addNode(880.0, 200.0, 100.0, 233)
-    femmesh.addNode(920.0, 200.0, 100.0, 234)
-    femmesh.addNode(960.0, 200.0, 100.0, 235)
-    femmesh.addNode(19.999999999999993, 200.0, 100.0, 236)
-    femmesh.addNode(59.999999999999986, 200.0, 100.0, 237)
-    femmesh.addNode(99.99999999999999, 200.0, 100.0, 238)
-    femmesh.addNode(140.0, 200.0, 100.0, 239)
-    femmesh.addNode(180.0, 200.0, 100.0, 240)
-    femmesh.addNode(220.0, 200.0, 100.0, 241)
-    femmesh.addNode(260.0, 200.0, 100.0, 242)
-    femmesh.addNode(300.0, 200.0, 100.0, 243)
-    femmesh.addNode(340.0, 200.0, 100.0, 244)
-    femmesh.addNode(379.99999999999994, 200.0, 100.0, 245)
-    femmesh.addNode(420.0, 200.0, 100.0, 246)
-    femmesh.addNode(460.0, 200.0, 100.0, 247)
-    femmesh.addNode(500.0, 200.0, 100.0, 248)
-    femmesh.addNode(540.0, 200.0, 100.0, 249)
-    femmesh.addNode(580.0, 200.0, 100.0, 250)
-    femmesh.addNode(620.0, 200.0, 100.0, 251)
-    femmesh.addNode(660.0, 200.0, 100.0, 252)
-    femmesh.addNode(699.9999999999999, 200.0, 100.0, 253)
-    femmesh.addNode(739.9999999999999, 200.0, 100.0, 254)
-    femmesh.addNode(779.9999999999999, 200.0, 100.0, 255)
-    femmesh.addNode(819.9999999999999, 200.0, 100.0, 256)
-    femmesh.addNode(860.0, 200.0, 100.0, 257)
-    femmesh.addNode(900.0, 200.0, 100.0, 258)
-    femmesh.addNode(940.0, 200.0, 100.0, 259)
-    femmesh.addNode(980.0, 200.0, 100.0, 260)
-    femmesh.addNode(0.0, 47.77777777777793, 49.9999999999999, 261)
-    femmesh.addNode(0.0, 152.2222222222223, 49.9999999999999, 262)
-    femmesh.addNode(0.0, 100.00000000000003, 62.58695128860694, 263)
-    femmesh.addNode(0.0, 74.51820036692226, 31.850000730288084, 264)
-    femmesh.addNode(0.0, 129.22299077280817, 34.38734370857363, 265)
-    femmesh.addNode(0.0, 67.46077493090439, 69.23507426755235, 266)
-    femmesh.addNode(0.0, 135.3165343105602, 69.65472037173055, 267)
-    femmesh.addNode(0.0, 28.961268756290313, 72.6502901557031, 268)
-    femmesh.addNode(0.0, 30.137506328959958, 27.53055567727018, 269)
-    femmesh.addNode(0.0, 171.50161611728709, 72.72023117306614, 270)
-    femmesh.addNode(0.0, 170.48602552766175, 27.953446173651106, 271)
-    femmesh.addNode(0.0, 180.1296302742535, 50.06874258639964, 272)
-    femmesh.addNode(0.0, 19.981228575766828, 50.01845365642576, 273)
-    femmesh.addNode(0.0, 14.480634378145156, 86.32514507785154, 274)
-    femmesh.addNode(0.0, 14.480634378145156, 69.65847841118484, 275)
-    femmesh.addNode(0.0, 34.48063437814509, 86.32514507785154, 276)
-    femmesh.addNode(0.0, 15.068753164479979, 30.4319445053017, 277)
-    femmesh.addNode(0.0, 15.068753164479979, 13.76527783863509, 278)
-    femmesh.addNode(0.0, 35.068753164479915, 13.76527783863509, 279)
-    femmesh.addNode(0.0, 185.75080805864354, 86.36011558653307, 280)
-    femmesh.addNode(0.0, 165.75080805864349, 86.36011558653307, 281)
-    femmesh.addNode(0.0, 185.75080805864354, 69.69344891986637, 282)
-    femmesh.addNode(0.0, 185.24301276383088, 13.976723086825553, 283)
-    femmesh.addNode(0.0, 185.24301276383088, 30.643389753492166, 284)
-    femmesh.addNode(0.0, 165.24301276383085, 13.976723086825553, 285)
-    femmesh.addNode(0.0, 9.990614287883414, 58.342560161546174, 286)
-    femmesh.addNode(0.0, 9.990614287883414, 41.67589349487949, 287)
-    femmesh.addNode(0.0, 25.059367452363393, 38.774504666847974, 288)
-    femmesh.addNode(0.0, 24.471248666028572, 61.33437190606443, 289)
-    femmesh.addNode(0.0, 73.73038746545205, 84.61753713377618, 290)
-    femmesh.addNode(0.0, 53.73038746545213, 84.61753713377618, 291)
-    femmesh.addNode(0.0, 48.21102184359735, 70.94268221162773, 292)
-    femmesh.addNode(0.0, 109.99999999999991, 81.29347564430347, 293)
-    femmesh.addNode(0.0, 89.99999999999989, 81.29347564430347, 294)
-    femmesh.addNode(0.0, 83.73038746545221, 65.91101277807965, 295)
-    femmesh.addNode(0.0, 147.65826715528004, 84.82736018586527, 296)
-    femmesh.addNode(0.0, 127.65826715528002, 84.82736018586527, 297)
-    femmesh.addNode(0.0, 117.65826715528011, 66.12083583016874, 298)
-    femmesh.addNode(0.0, 153.40907521392364, 71.18747577239834, 299)
-    femmesh.addNode(0.0, 190.06481513712674, 41.701037959866426, 300)
-    femmesh.addNode(0.0, 190.06481513712674, 58.36770462653311, 301)
-    femmesh.addNode(0.0, 175.30782790095762, 39.01109438002537, 302)
-    femmesh.addNode(0.0, 175.81562319577029, 61.39448687973289, 303)
-    femmesh.addNode(0.0, 57.259100183461065, 15.925000365144042, 304)
-    femmesh.addNode(0.0, 77.25910018346099, 15.925000365144042, 305)
-    femmesh.addNode(0.0, 52.32785334794111, 29.69027820377913, 306)
-    femmesh.addNode(0.0, 97.25910018346104, 15.925000365144042, 307)
-    femmesh.addNode(0.0, 124.61149538640399, 17.193671854286816, 308)
-    femmesh.addNode(0.0, 144.61149538640404, 17.193671854286816, 309)
-    femmesh.addNode(0.0, 101.87059556986522, 33.118672219430856, 310)
-    femmesh.addNode(0.0, 149.85450815023495, 31.17039494111237, 311)
-    femmesh.addNode(0.0, 61.14798907235009, 40.925000365143994, 312)
-    femmesh.addNode(0.0, 57.61927635434116, 59.617537133776125, 313)
-    femmesh.addNode(0.0, 70.98948764891333, 50.54253749892022, 314)
-    femmesh.addNode(0.0, 38.95764205336894, 38.76527783863504, 315)
-    femmesh.addNode(0.0, 38.36952326703412, 61.3251450778515, 316)
-    femmesh.addNode(0.0, 33.879503176772374, 50.00922682821283, 317)
-    femmesh.addNode(0.0, 140.72260649751524, 42.19367185428676, 318)
-    femmesh.addNode(0.0, 132.2697625416842, 52.02103204015209, 319)
-    femmesh.addNode(0.0, 143.76937826639124, 59.827360185865224, 320)
-    femmesh.addNode(0.0, 161.35412387494205, 38.9767230868255, 321)
-    femmesh.addNode(0.0, 161.86191916975469, 61.36011558653302, 322)
-    femmesh.addNode(0.0, 166.1759262482379, 50.03437129319977, 323)
-    femmesh.addNode(0.0, 87.25910018346114, 47.218476009447514, 324)
-    femmesh.addNode(0.0, 114.6114953864041, 48.48714749859029, 325)
-    femmesh.addNode(1000.0, 47.77777777777793, 49.9999999999999, 326)
-    femmesh.addNode(1000.0, 152.22222222222211, 49.99999999999991, 327)
-    femmesh.addNode(1000.0, 99.99999999999996, 62.58695128860704, 328)
-    femmesh.addNode(1000.0, 74.5182003669223, 31.850000730288112, 329)
-    femmesh.addNode(1000.0, 129.22299077280812, 34.38734370857367, 330)
-    femmesh.addNode(1000.0, 67.46077493090434, 69.2350742675524, 331)
-    femmesh.addNode(1000.0, 135.31653431056012, 69.65472037173058, 332)
-    femmesh.addNode(1000.0, 28.961268756290302, 72.65029015570312, 333)
-    femmesh.addNode(1000.0, 30.137506328959965, 27.53055567727019, 334)
-    femmesh.addNode(1000.0, 171.50161611728703, 72.72023117306614, 335)
-    femmesh.addNode(1000.0, 170.4860255276617, 27.953446173651116, 336)
-    femmesh.addNode(1000.0, 180.12963027425346, 50.06874258639964, 337)
-    femmesh.addNode(1000.0, 19.981228575766824, 50.01845365642578, 338)
-    femmesh.addNode(1000.0, 14.480634378145151, 69.65847841118486, 339)
-    femmesh.addNode(1000.0, 14.480634378145151, 86.32514507785156, 340)
-    femmesh.addNode(1000.0, 34.48063437814508, 86.32514507785156, 341)
-    femmesh.addNode(1000.0, 15.068753164479983, 13.765277838635095, 342)
-    femmesh.addNode(1000.0, 15.068753164479983, 30.431944505301708, 343)
-    femmesh.addNode(1000.0, 35.068753164479915, 13.765277838635095, 344)
-    femmesh.addNode(1000.0, 165.75080805864349, 86.36011558653307, 345)
-    femmesh.addNode(1000.0, 185.7508080586435, 86.36011558653307, 346)
-    femmesh.addNode(1000.0, 185.7508080586435, 69.69344891986637, 347)
-    femmesh.addNode(1000.0, 185.24301276383085, 30.64338975349217, 348)
-    femmesh.addNode(1000.0, 185.24301276383085, 13.976723086825558, 349)
-    femmesh.addNode(1000.0, 165.2430127638308, 13.976723086825558, 350)
-    femmesh.addNode(1000.0, 9.990614287883412, 41.6758934948795, 351)
-    femmesh.addNode(1000.0, 9.990614287883412, 58.34256016154618, 352)
-    femmesh.addNode(1000.0, 25.059367452363396, 38.77450466684798, 353)
-    femmesh.addNode(1000.0, 24.471248666028565, 61.33437190606445, 354)
-    femmesh.addNode(1000.0, 53.730387465452104, 84.61753713377621, 355)
-    femmesh.addNode(1000.0, 73.73038746545203, 84.61753713377621, 356)
-    femmesh.addNode(1000.0, 48.21102184359732, 70.94268221162775, 357)
-    femmesh.addNode(1000.0, 89.99999999999984, 81.29347564430353, 358)
-    femmesh.addNode(1000.0, 109.99999999999989, 81.29347564430353, 359)
-    femmesh.addNode(1000.0, 83.73038746545214, 65.91101277807972, 360)
-    femmesh.addNode(1000.0, 127.65826715527996, 84.82736018586529, 361)
-    femmesh.addNode(1000.0, 147.65826715528002, 84.82736018586529, 362)
-    femmesh.addNode(1000.0, 117.65826715528004, 66.1208358301688, 363)
-    femmesh.addNode(1000.0, 153.4090752139236, 71.18747577239836, 364)
-    femmesh.addNode(1000.0, 190.06481513712674, 58.36770462653311, 365)
-    femmesh.addNode(1000.0, 190.06481513712674, 41.701037959866426, 366)
-    femmesh.addNode(1000.0, 175.3078279009576, 39.011094380025376, 367)
-    femmesh.addNode(1000.0, 175.81562319577023, 61.39448687973289, 368)
-    femmesh.addNode(1000.0, 77.25910018346102, 15.925000365144056, 369)
-    femmesh.addNode(1000.0, 57.259100183461086, 15.925000365144056, 370)
-    femmesh.addNode(1000.0, 52.32785334794113, 29.69027820377915, 371)
-    femmesh.addNode(1000.0, 97.25910018346106, 15.925000365144056, 372)
-    femmesh.addNode(1000.0, 144.61149538640402, 17.193671854286833, 373)
-    femmesh.addNode(1000.0, 124.61149538640396, 17.193671854286833, 374)
-    femmesh.addNode(1000.0, 101.8705955698652, 33.11867221943089, 375)
-    femmesh.addNode(1000.0, 149.8545081502349, 31.17039494111239, 376)
-    femmesh.addNode(1000.0, 70.98948764891333, 50.54253749892026, 377)
-    femmesh.addNode(1000.0, 57.61927635434113, 59.61753713377615, 378)
-    femmesh.addNode(1000.0, 61.147989072350114, 40.92500036514401, 379)
-    femmesh.addNode(1000.0, 38.95764205336894, 38.76527783863504, 380)
-    femmesh.addNode(1000.0, 38.36952326703411, 61.32514507785151, 381)
-    femmesh.addNode(1000.0, 33.879503176772374, 50.00922682821284, 382)
-    femmesh.addNode(1000.0, 143.76937826639113, 59.827360185865246, 383)
-    femmesh.addNode(1000.0, 132.26976254168412, 52.02103204015212, 384)
-    femmesh.addNode(1000.0, 140.72260649751513, 42.19367185428679, 385)
-    femmesh.addNode(1000.0, 161.3541238749419, 38.976723086825515, 386)
-    femmesh.addNode(1000.0, 161.86191916975457, 61.36011558653303, 387)
-    femmesh.addNode(1000.0, 166.17592624823777, 50.03437129319977, 388)
-    femmesh.addNode(1000.0, 114.61149538640404, 48.48714749859035, 389)
-    femmesh.addNode(1000.0, 87.25910018346113, 47.21847600944758, 390)
-    femmesh.addNode(47.7777777777779, 0.0, 49.9999999999999, 391)
-    femmesh.addNode(952.2222222222225, 0.0, 49.999999999999844, 392)
-    femmesh.addNode(654.6753990333275, 0.0, 48.55423280423287, 393)
-    femmesh.addNode(850.9076736888621, 0.0, 55.34324145182758, 394)
-    femmesh.addNode(299.99999999999994, 0.0, 50.0, 395)
-    femmesh.addNode(374.6753990333275, 0.0, 48.55423280423281, 396)
-    femmesh.addNode(149.09232631113744, 0.0, 52.4517070602926, 397)
-    femmesh.addNode(220.0, 0.0, 50.0, 398)
-    femmesh.addNode(500.0, 0.0, 50.0, 399)
-    femmesh.addNode(579.9999999999999, 0.0, 50.00000000000004, 400)
-    femmesh.addNode(779.9999999999986, 0.0, 50.0, 401)
-    femmesh.addNode(713.5166700993956, 0.0, 50.427334115034746, 402)
-    femmesh.addNode(433.5166700993956, 0.0, 49.5726658849652, 403)
-    femmesh.addNode(908.9208488203869, 0.0, 61.03422672481413, 404)
-    femmesh.addNode(91.07915117961267, 0.0, 61.03422672481412, 405)
-    femmesh.addNode(818.5405805278888, 0.0, 31.35246980341248, 406)
-    femmesh.addNode(188.18205438518953, 0.0, 68.29618398094823, 407)
-    femmesh.addNode(260.0, 0.0, 35.31448961647688, 408)
-    femmesh.addNode(540.0, 0.0, 35.314489616476884, 409)
-    femmesh.addNode(339.3147887210861, 0.0, 67.42075936764857, 410)
-    femmesh.addNode(619.314788721086, 0.0, 67.42075936764869, 411)
-    femmesh.addNode(467.9550845795583, 0.0, 67.23577976493918, 412)
-    femmesh.addNode(747.9550845795577, 0.0, 32.76422023506059, 413)
-    femmesh.addNode(747.4055061386067, 0.0, 69.12531338248067, 414)
-    femmesh.addNode(467.40550613860717, 0.0, 30.874686617519323, 415)
-    femmesh.addNode(619.2448692028296, 0.0, 29.371662358129228, 416)
-    femmesh.addNode(339.24486920282953, 0.0, 29.371662358129214, 417)
-    femmesh.addNode(259.99999999999994, 0.0, 70.47349851663955, 418)
-    femmesh.addNode(540.0, 0.0, 70.47349851663955, 419)
-    femmesh.addNode(182.62828438428053, 0.0, 30.456762148385074, 420)
-    femmesh.addNode(811.5747090361247, 0.0, 69.28261854253995, 421)
-    femmesh.addNode(930.9903181297045, 0.0, 33.57407222021367, 422)
-    femmesh.addNode(69.00968187029532, 0.0, 33.574072220213736, 423)
-    femmesh.addNode(109.91988503070093, 0.0, 34.166174335266405, 424)
-    femmesh.addNode(890.0801149692986, 0.0, 34.579250676914384, 425)
-    femmesh.addNode(685.4166666666666, 0.0, 31.166666666666874, 426)
-    femmesh.addNode(685.4166666666666, 0.0, 68.83333333333317, 427)
-    femmesh.addNode(405.41666666666634, 0.0, 31.166666666666867, 428)
-    femmesh.addNode(405.41666666666634, 0.0, 68.83333333333314, 429)
-    femmesh.addNode(28.888888888888943, 0.0, 72.66666666666659, 430)
-    femmesh.addNode(29.21941991285549, 0.0, 27.817900925591122, 431)
-    femmesh.addNode(971.1111111111118, 0.0, 72.66666666666715, 432)
-    femmesh.addNode(970.7805800871447, 0.0, 27.817900925591108, 433)
-    femmesh.addNode(936.1262330172977, 0.0, 70.77054696244574, 434)
-    femmesh.addNode(63.87376698270195, 0.0, 70.77054696244566, 435)
-    femmesh.addNode(119.13442586022421, 0.0, 70.65377034408968, 436)
-    femmesh.addNode(880.8655741397756, 0.0, 70.65377034408962, 437)
-    femmesh.addNode(300.0, 0.0, 21.0, 438)
-    femmesh.addNode(300.0, 0.0, 79.0, 439)
-    femmesh.addNode(220.00000000000003, 0.0, 21.000000000000025, 440)
-    femmesh.addNode(500.0, 0.0, 21.0, 441)
-    femmesh.addNode(580.0, 0.0, 21.0, 442)
-    femmesh.addNode(779.9999999999986, 0.0, 21.00000000000029, 443)
-    femmesh.addNode(220.0, 0.0, 78.99999999999999, 444)
-    femmesh.addNode(500.0, 0.0, 79.0, 445)
-    femmesh.addNode(580.0, 0.0, 79.0, 446)
-    femmesh.addNode(779.946908328546, 0.0, 78.65680611854523, 447)
-    femmesh.addNode(979.5793991089085, 0.0, 50.069223941751105, 448)
-    femmesh.addNode(20.420600891091688, 0.0, 50.069223941751034, 449)
-    femmesh.addNode(143.41253081619894, 0.0, 22.85336164840765, 450)
-    femmesh.addNode(855.90567383721, 0.0, 24.254992386430885, 451)
-    femmesh.addNode(655.8673869805648, 0.0, 21.818512365805795, 452)
-    femmesh.addNode(655.881370884216, 0.0, 76.96166510104295, 453)
-    femmesh.addNode(375.8673869805646, 0.0, 21.81851236580578, 454)
-    femmesh.addNode(375.881370884216, 0.0, 76.96166510104291, 455)
-    femmesh.addNode(14.444444444444471, 0.0, 69.66666666666659, 456)
-    femmesh.addNode(14.444444444444471, 0.0, 86.33333333333329, 457)
-    femmesh.addNode(34.444444444444464, 0.0, 86.33333333333329, 458)
-    femmesh.addNode(14.609709956427745, 0.0, 13.908950462795561, 459)
-    femmesh.addNode(14.609709956427745, 0.0, 30.575617129462174, 460)
-    femmesh.addNode(34.609709956427736, 0.0, 13.908950462795561, 461)
-    femmesh.addNode(985.5555555555559, 0.0, 86.33333333333357, 462)
-    femmesh.addNode(985.5555555555559, 0.0, 69.66666666666687, 463)
-    femmesh.addNode(965.5555555555559, 0.0, 86.33333333333357, 464)
-    femmesh.addNode(985.3902900435723, 0.0, 30.575617129462167, 465)
-    femmesh.addNode(985.3902900435723, 0.0, 13.908950462795554, 466)
-    femmesh.addNode(965.3902900435723, 0.0, 13.908950462795554, 467)
-    femmesh.addNode(10.210300445545844, 0.0, 41.70127863754213, 468)
-    femmesh.addNode(10.210300445545844, 0.0, 58.36794530420881, 469)
-    femmesh.addNode(24.82001040197359, 0.0, 38.943562433671076, 470)
-    femmesh.addNode(24.654744889990315, 0.0, 61.36794530420881, 471)
-    femmesh.addNode(989.7896995544543, 0.0, 58.367945304208845, 472)
-    femmesh.addNode(989.7896995544543, 0.0, 41.70127863754216, 473)
-    femmesh.addNode(975.1799895980266, 0.0, 38.943562433671104, 474)
-    femmesh.addNode(975.3452551100102, 0.0, 61.36794530420913, 475)
-    femmesh.addNode(74.50484093514766, 0.0, 16.787036110106868, 476)
-    femmesh.addNode(54.504840935147655, 0.0, 16.787036110106868, 477)
-    femmesh.addNode(49.114550891575405, 0.0, 30.695986572902427, 478)
-    femmesh.addNode(114.95994251535046, 0.0, 17.083087167633202, 479)
-    femmesh.addNode(94.95994251535046, 0.0, 17.083087167633202, 480)
-    femmesh.addNode(89.46478345049812, 0.0, 33.87012327774007, 481)
-    femmesh.addNode(151.70626540809945, 0.0, 11.426680824203824, 482)
-    femmesh.addNode(131.70626540809945, 0.0, 11.426680824203824, 483)
-    femmesh.addNode(126.66620792344993, 0.0, 28.509767991837027, 484)
-    femmesh.addNode(191.31414219214025, 0.0, 15.228381074192537, 485)
-    femmesh.addNode(171.31414219214025, 0.0, 15.228381074192537, 486)
-    femmesh.addNode(163.02040760023974, 0.0, 26.65506189839636, 487)
-    femmesh.addNode(230.0, 0.0, 10.500000000000012, 488)
-    femmesh.addNode(210.0, 0.0, 10.500000000000012, 489)
-    femmesh.addNode(201.31414219214028, 0.0, 25.728381074192548, 490)
-    femmesh.addNode(270.0, 0.0, 17.65724480823844, 491)
-    femmesh.addNode(250.0, 0.0, 17.65724480823844, 492)
-    femmesh.addNode(240.0, 0.0, 28.157244808238453, 493)
-    femmesh.addNode(310.0, 0.0, 10.5, 494)
-    femmesh.addNode(290.0, 0.0, 10.5, 495)
-    femmesh.addNode(280.0, 0.0, 28.15724480823844, 496)
-    femmesh.addNode(349.62243460141474, 0.0, 14.685831179064607, 497)
-    femmesh.addNode(329.62243460141474, 0.0, 14.685831179064607, 498)
-    femmesh.addNode(319.62243460141474, 0.0, 25.185831179064607, 499)
-    femmesh.addNode(387.9336934902823, 0.0, 10.90925618290289, 500)
-    femmesh.addNode(367.9336934902823, 0.0, 10.90925618290289, 501)
-    femmesh.addNode(357.5561280916971, 0.0, 25.595087361967497, 502)
-    femmesh.addNode(422.70833333333314, 0.0, 15.583333333333433, 503)
-    femmesh.addNode(402.70833333333314, 0.0, 15.583333333333433, 504)
-    femmesh.addNode(390.6420268236155, 0.0, 26.492589516236322, 505)
-    femmesh.addNode(473.7027530693036, 0.0, 15.437343308759662, 506)
-    femmesh.addNode(453.7027530693036, 0.0, 15.437343308759662, 507)
-    femmesh.addNode(436.7583350496978, 0.0, 24.7863329424826, 508)
-    femmesh.addNode(450.4610881190014, 0.0, 40.22367625124226, 509)
-    femmesh.addNode(419.466668383031, 0.0, 40.36966627581603, 510)
-    femmesh.addNode(510.0, 0.0, 10.5, 511)
-    femmesh.addNode(490.0, 0.0, 10.5, 512)
-    femmesh.addNode(483.7027530693036, 0.0, 25.93734330875966, 513)
-    femmesh.addNode(550.0, 0.0, 17.657244808238442, 514)
-    femmesh.addNode(530.0, 0.0, 17.657244808238442, 515)
-    femmesh.addNode(520.0, 0.0, 28.157244808238442, 516)
-    femmesh.addNode(590.0, 0.0, 10.5, 517)
-    femmesh.addNode(570.0, 0.0, 10.5, 518)
-    femmesh.addNode(560.0, 0.0, 28.157244808238442, 519)
-    femmesh.addNode(629.6224346014149, 0.0, 14.685831179064614, 520)
-    femmesh.addNode(609.6224346014149, 0.0, 14.685831179064614, 521)
-    femmesh.addNode(599.6224346014149, 0.0, 25.185831179064614, 522)
-    femmesh.addNode(667.9336934902824, 0.0, 10.909256182902897, 523)
-    femmesh.addNode(647.9336934902824, 0.0, 10.909256182902897, 524)
-    femmesh.addNode(637.5561280916972, 0.0, 25.59508736196751, 525)
-    femmesh.addNode(702.7083333333333, 0.0, 15.583333333333437, 526)
-    femmesh.addNode(682.7083333333333, 0.0, 15.583333333333437, 527)
-    femmesh.addNode(670.6420268236157, 0.0, 26.492589516236336, 528)
-    femmesh.addNode(753.9775422897787, 0.0, 16.382110117530296, 529)
-    femmesh.addNode(733.9775422897787, 0.0, 16.382110117530296, 530)
-    femmesh.addNode(716.7583350496977, 0.0, 25.213667057517373, 531)
-    femmesh.addNode(730.7358773394767, 0.0, 41.59577717504767, 532)
-    femmesh.addNode(699.4666683830311, 0.0, 40.79700039085081, 533)
-    femmesh.addNode(789.9999999999993, 0.0, 10.500000000000146, 534)
-    femmesh.addNode(769.9999999999993, 0.0, 10.500000000000146, 535)
-    femmesh.addNode(763.9775422897782, 0.0, 26.88211011753044, 536)
-    femmesh.addNode(829.2702902639444, 0.0, 15.67623490170624, 537)
-    femmesh.addNode(809.2702902639444, 0.0, 15.67623490170624, 538)
-    femmesh.addNode(799.2702902639437, 0.0, 26.176234901706387, 539)
-    femmesh.addNode(867.952836918605, 0.0, 12.127496193215443, 540)
-    femmesh.addNode(847.9528369186049, 0.0, 12.127496193215443, 541)
-    femmesh.addNode(837.2231271825494, 0.0, 27.80373109492168, 542)
-    femmesh.addNode(905.0400574846493, 0.0, 17.289625338457192, 543)
-    femmesh.addNode(885.0400574846493, 0.0, 17.289625338457192, 544)
-    femmesh.addNode(872.9928944032542, 0.0, 29.417121531672635, 545)
-    femmesh.addNode(945.4951590648523, 0.0, 16.787036110106836, 546)
-    femmesh.addNode(925.4951590648523, 0.0, 16.787036110106836, 547)
-    femmesh.addNode(910.5352165495016, 0.0, 34.076661448564025, 548)
-    femmesh.addNode(950.8854491084246, 0.0, 30.69598657290239, 549)
-    femmesh.addNode(51.93688349135097, 0.0, 85.38527348122284, 550)
-    femmesh.addNode(71.93688349135097, 0.0, 85.38527348122284, 551)
-    femmesh.addNode(46.38132793579545, 0.0, 71.71860681455613, 552)
-    femmesh.addNode(99.5672129301121, 0.0, 85.32688517204484, 553)
-    femmesh.addNode(119.5672129301121, 0.0, 85.32688517204484, 554)
-    femmesh.addNode(85.53957558980633, 0.0, 80.51711336240706, 555)
-    femmesh.addNode(77.47645908115732, 0.0, 65.9023868436299, 556)
-    femmesh.addNode(105.10678851991844, 0.0, 65.8439985344519, 557)
-    femmesh.addNode(139.5672129301121, 0.0, 85.32688517204484, 558)
-    femmesh.addNode(174.09102719259477, 0.0, 84.14809199047411, 559)
-    femmesh.addNode(194.09102719259477, 0.0, 84.14809199047411, 560)
-    femmesh.addNode(154.5461631555687, 0.0, 76.2258535301463, 561)
-    femmesh.addNode(168.63719034816347, 0.0, 60.37394552062041, 562)
-    femmesh.addNode(134.11337608568084, 0.0, 61.552738702191135, 563)
-    femmesh.addNode(210.0, 0.0, 89.5, 564)
-    femmesh.addNode(230.0, 0.0, 89.5, 565)
-    femmesh.addNode(204.09102719259477, 0.0, 73.64809199047411, 566)
-    femmesh.addNode(249.99999999999997, 0.0, 85.23674925831978, 567)
-    femmesh.addNode(270.0, 0.0, 85.23674925831978, 568)
-    femmesh.addNode(239.99999999999997, 0.0, 74.73674925831978, 569)
-    femmesh.addNode(290.0, 0.0, 89.5, 570)
-    femmesh.addNode(310.0, 0.0, 89.5, 571)
-    femmesh.addNode(280.0, 0.0, 74.73674925831978, 572)
-    femmesh.addNode(329.65739436054304, 0.0, 83.71037968382429, 573)
-    femmesh.addNode(349.657394360543, 0.0, 83.71037968382429, 574)
-    femmesh.addNode(319.65739436054304, 0.0, 73.21037968382429, 575)
-    femmesh.addNode(367.94068544210796, 0.0, 88.48083255052146, 576)
-    femmesh.addNode(387.94068544210796, 0.0, 88.48083255052146, 577)
-    femmesh.addNode(357.598079802651, 0.0, 72.19121223434574, 578)
-    femmesh.addNode(402.70833333333314, 0.0, 84.41666666666657, 579)
-    femmesh.addNode(422.70833333333314, 0.0, 84.41666666666657, 580)
-    femmesh.addNode(390.64901877544116, 0.0, 72.89749921718803, 581)
-    femmesh.addNode(453.97754228977914, 0.0, 83.6178898824696, 582)
-    femmesh.addNode(473.97754228977914, 0.0, 83.6178898824696, 583)
-    femmesh.addNode(436.7583350496978, 0.0, 74.7863329424826, 584)
-    femmesh.addNode(450.73587733947693, 0.0, 58.404222824952186, 585)
-    femmesh.addNode(419.466668383031, 0.0, 59.202999609149174, 586)
-    femmesh.addNode(490.0, 0.0, 89.5, 587)
-    femmesh.addNode(510.0, 0.0, 89.5, 588)
-    femmesh.addNode(483.97754228977914, 0.0, 73.1178898824696, 589)
-    femmesh.addNode(530.0, 0.0, 85.23674925831978, 590)
-    femmesh.addNode(550.0, 0.0, 85.23674925831978, 591)
-    femmesh.addNode(520.0, 0.0, 74.73674925831978, 592)
-    femmesh.addNode(570.0, 0.0, 89.5, 593)
-    femmesh.addNode(590.0, 0.0, 89.5, 594)
-    femmesh.addNode(560.0, 0.0, 74.73674925831978, 595)
-    femmesh.addNode(609.657394360543, 0.0, 83.71037968382434, 596)
-    femmesh.addNode(629.657394360543, 0.0, 83.71037968382434, 597)
-    femmesh.addNode(599.657394360543, 0.0, 73.21037968382434, 598)
-    femmesh.addNode(647.940685442108, 0.0, 88.48083255052148, 599)
-    femmesh.addNode(667.9406854421079, 0.0, 88.48083255052148, 600)
-    femmesh.addNode(637.598079802651, 0.0, 72.19121223434581, 601)
-    femmesh.addNode(682.7083333333333, 0.0, 84.41666666666659, 602)
-    femmesh.addNode(702.7083333333333, 0.0, 84.41666666666659, 603)
-    femmesh.addNode(670.6490187754414, 0.0, 72.89749921718806, 604)
-    femmesh.addNode(733.7027530693033, 0.0, 84.56265669124033, 605)
-    femmesh.addNode(753.7027530693033, 0.0, 84.56265669124033, 606)
-    femmesh.addNode(716.7583350496977, 0.0, 75.21366705751737, 607)
-    femmesh.addNode(730.4610881190011, 0.0, 59.776323748757704, 608)
-    femmesh.addNode(699.4666683830311, 0.0, 59.630333724183956, 609)
-    femmesh.addNode(769.9734541642729, 0.0, 89.32840305927262, 610)
-    femmesh.addNode(789.9734541642729, 0.0, 89.32840305927262, 611)
-    femmesh.addNode(763.6762072335764, 0.0, 73.89105975051295, 612)
-    femmesh.addNode(805.7873545180623, 0.0, 84.64130927126998, 613)
-    femmesh.addNode(825.7873545180623, 0.0, 84.64130927126998, 614)
-    femmesh.addNode(795.7608086823353, 0.0, 73.96971233054259, 615)
-    femmesh.addNode(860.4327870698878, 0.0, 85.32688517204481, 616)
-    femmesh.addNode(880.4327870698878, 0.0, 85.32688517204481, 617)
-    femmesh.addNode(845.453836844431, 0.0, 77.67162072591378, 618)
-    femmesh.addNode(831.2411913624934, 0.0, 62.312929997183765, 619)
-    femmesh.addNode(865.8866239143189, 0.0, 62.9985058979586, 620)
-    femmesh.addNode(900.4327870698878, 0.0, 85.32688517204481, 621)
-    femmesh.addNode(928.0631165086488, 0.0, 85.38527348122287, 622)
-    femmesh.addNode(948.0631165086488, 0.0, 85.38527348122287, 623)
-    femmesh.addNode(914.4604244101935, 0.0, 80.51711336240706, 624)
-    femmesh.addNode(922.5235409188424, 0.0, 65.90238684362993, 625)
-    femmesh.addNode(894.8932114800813, 0.0, 65.84399853445188, 626)
-    femmesh.addNode(953.6186720642047, 0.0, 71.71860681455644, 627)
-    femmesh.addNode(58.39372982403661, 0.0, 41.78703611010682, 628)
-    femmesh.addNode(38.49859884531669, 0.0, 38.90895046279551, 629)
-    femmesh.addNode(66.44172442649864, 0.0, 52.1723095913297, 630)
-    femmesh.addNode(55.825772380239925, 0.0, 60.38527348122278, 631)
-    femmesh.addNode(38.33333333333342, 0.0, 61.33333333333324, 632)
-    femmesh.addNode(34.0991893344348, 0.0, 50.03461197087547, 633)
-    femmesh.addNode(941.6062701759636, 0.0, 41.787036110106754, 634)
-    femmesh.addNode(961.5014011546837, 0.0, 38.908950462795474, 635)
-    femmesh.addNode(944.1742276197601, 0.0, 60.38527348122279, 636)
-    femmesh.addNode(933.5582755735011, 0.0, 52.17230959132971, 637)
-    femmesh.addNode(961.6666666666672, 0.0, 61.3333333333335, 638)
-    femmesh.addNode(965.9008106655656, 0.0, 50.034611970875474, 639)
-    femmesh.addNode(636.9950938772067, 0.0, 57.987496085940776, 640)
-    femmesh.addNode(619.2798289619577, 0.0, 48.39621086288896, 641)
-    femmesh.addNode(636.9601341180785, 0.0, 38.96294758118105, 642)
-    femmesh.addNode(655.2783849587718, 0.0, 62.75794895263791, 643)
-    femmesh.addNode(655.2713930069461, 0.0, 35.18637258501933, 644)
-    femmesh.addNode(670.0460328499971, 0.0, 39.86044973544987, 645)
-    femmesh.addNode(685.4166666666666, 0.0, 50.00000000000002, 646)
-    femmesh.addNode(670.0460328499971, 0.0, 58.69378306878302, 647)
-    femmesh.addNode(834.7241271083755, 0.0, 43.34785562762003, 648)
-    femmesh.addNode(815.0576447820067, 0.0, 50.31754417297621, 649)
-    femmesh.addNode(853.406673763036, 0.0, 39.79911691912923, 650)
-    femmesh.addNode(870.4938943290804, 0.0, 44.96124606437098, 651)
-    femmesh.addNode(885.4728445545371, 0.0, 52.616510510502, 652)
-    femmesh.addNode(280.0, 0.0, 42.65724480823844, 653)
-    femmesh.addNode(279.99999999999994, 0.0, 60.236749258319776, 654)
-    femmesh.addNode(260.0, 0.0, 52.893994066558214, 655)
-    femmesh.addNode(300.0, 0.0, 35.5, 656)
-    femmesh.addNode(319.657394360543, 0.0, 58.710379683824286, 657)
-    femmesh.addNode(319.62243460141474, 0.0, 39.68583117906461, 658)
-    femmesh.addNode(339.27982896195783, 0.0, 48.39621086288889, 659)
-    femmesh.addNode(300.0, 0.0, 64.5, 660)
-    femmesh.addNode(356.9950938772068, 0.0, 57.98749608594069, 661)
-    femmesh.addNode(356.9601341180785, 0.0, 38.96294758118101, 662)
-    femmesh.addNode(375.27838495877177, 0.0, 62.75794895263786, 663)
-    femmesh.addNode(375.271393006946, 0.0, 35.1863725850193, 664)
-    femmesh.addNode(390.0460328499969, 0.0, 39.86044973544984, 665)
-    femmesh.addNode(405.41666666666634, 0.0, 50.00000000000001, 666)
-    femmesh.addNode(390.0460328499969, 0.0, 58.69378306878298, 667)
-    femmesh.addNode(165.860305347709, 0.0, 41.454234604338836, 668)
-    femmesh.addNode(185.40516938473502, 0.0, 49.376473064666655, 669)
-    femmesh.addNode(146.2524285636682, 0.0, 37.652534354350124, 670)
-    femmesh.addNode(129.50610567091917, 0.0, 43.308940697779505, 671)
-    femmesh.addNode(114.52715544546257, 0.0, 52.40997233967804, 672)
-    femmesh.addNode(204.09102719259477, 0.0, 59.148091990474114, 673)
-    femmesh.addNode(201.31414219214025, 0.0, 40.22838107419254, 674)
-    femmesh.addNode(220.0, 0.0, 64.5, 675)
-    femmesh.addNode(240.0, 0.0, 42.65724480823844, 676)
-    femmesh.addNode(239.99999999999997, 0.0, 60.236749258319776, 677)
-    femmesh.addNode(220.0, 0.0, 35.500000000000014, 678)
-    femmesh.addNode(520.0, 0.0, 42.657244808238445, 679)
-    femmesh.addNode(540.0, 0.0, 52.89399406655822, 680)
-    femmesh.addNode(520.0, 0.0, 60.236749258319776, 681)
-    femmesh.addNode(500.0, 0.0, 35.5, 682)
-    femmesh.addNode(483.97754228977914, 0.0, 58.61788988246959, 683)
-    femmesh.addNode(467.6802953590827, 0.0, 49.05523319122925, 684)
-    femmesh.addNode(483.7027530693036, 0.0, 40.437343308759665, 685)
-    femmesh.addNode(500.0, 0.0, 64.5, 686)
-    femmesh.addNode(560.0, 0.0, 42.65724480823846, 687)
-    femmesh.addNode(560.0, 0.0, 60.2367492583198, 688)
-    femmesh.addNode(580.0, 0.0, 35.50000000000002, 689)
-    femmesh.addNode(599.6573943605429, 0.0, 58.710379683824364, 690)
-    femmesh.addNode(599.6224346014147, 0.0, 39.685831179064635, 691)
-    femmesh.addNode(580.0, 0.0, 64.50000000000003, 692)
-    femmesh.addNode(799.2702902639437, 0.0, 40.67623490170624, 693)
-    femmesh.addNode(795.7873545180616, 0.0, 59.641309271269975, 694)
-    femmesh.addNode(779.9999999999986, 0.0, 35.50000000000014, 695)
-    femmesh.addNode(763.9775422897782, 0.0, 41.382110117530296, 696)
-    femmesh.addNode(763.7027530693026, 0.0, 59.562656691240335, 697)
-    femmesh.addNode(747.6802953590823, 0.0, 50.94476680877063, 698)
-    femmesh.addNode(779.9734541642723, 0.0, 64.32840305927262, 699)
-    femmesh.addNode(919.9555834750457, 0.0, 47.3041494725139, 700)
-    femmesh.addNode(899.5004818948428, 0.0, 47.80673870086426, 701)
-    femmesh.addNode(80.04441652495399, 0.0, 47.30414947251393, 702)
-    femmesh.addNode(100.4995181051568, 0.0, 47.60020053004026, 703)
-    femmesh.addNode(47.77777777777766, 200.0, 49.99999999999991, 704)
-    femmesh.addNode(952.2222222222225, 200.0, 49.999999999999844, 705)
-    femmesh.addNode(665.3246009666716, 200.0, 48.55423280423258, 706)
-    femmesh.addNode(379.99999999999983, 200.0, 50.0, 707)
-    femmesh.addNode(860.0000000000005, 200.0, 50.00000000000001, 708)
-    femmesh.addNode(174.77511413304276, 200.0, 51.383464174145345, 709)
-    femmesh.addNode(300.0, 200.0, 50.0, 710)
-    femmesh.addNode(460.0, 200.0, 50.0, 711)
-    femmesh.addNode(540.0, 200.0, 50.0, 712)
-    femmesh.addNode(740.0000000000007, 200.0, 50.0, 713)
-    femmesh.addNode(105.29506763741718, 200.0, 51.383464174145345, 714)
-    femmesh.addNode(806.483329900605, 200.0, 50.42733411503479, 715)
-    femmesh.addNode(233.5166700993958, 200.0, 50.427334115034796, 716)
-    femmesh.addNode(606.4833299006038, 200.0, 50.42733411503478, 717)
-    femmesh.addNode(908.9208488203869, 200.0, 61.03422672481413, 718)
-    femmesh.addNode(700.6852112789139, 200.0, 67.4207593676483, 719)
-    femmesh.addNode(419.9999999999998, 200.0, 35.31448961647713, 720)
-    femmesh.addNode(340.00000000000006, 200.0, 64.68551038352307, 721)
-    femmesh.addNode(500.0, 200.0, 35.314489616476884, 722)
-    femmesh.addNode(139.96837004710048, 200.0, 31.04154126243813, 723)
-    femmesh.addNode(772.0449154204418, 200.0, 32.76422023506071, 724)
-    femmesh.addNode(267.9550845795584, 200.0, 32.76422023506079, 725)
-    femmesh.addNode(572.0449154204415, 200.0, 32.76422023506076, 726)
-    femmesh.addNode(772.5944938613931, 200.0, 69.12531338248077, 727)
-    femmesh.addNode(267.4055061386073, 200.0, 69.12531338248067, 728)
-    femmesh.addNode(572.5944938613925, 200.0, 69.1253133824806, 729)
-    femmesh.addNode(139.96385148240051, 200.0, 70.11781577230583, 730)
-    femmesh.addNode(339.99999999999983, 200.0, 29.526501483360466, 731)
-    femmesh.addNode(500.0, 200.0, 70.47349851663955, 732)
-    femmesh.addNode(419.99999999999983, 200.0, 70.47349851663955, 733)
-    femmesh.addNode(700.7551307971703, 200.0, 29.37166235812895, 734)
-    femmesh.addNode(68.22111313102714, 200.0, 69.20750985136765, 735)
-    femmesh.addNode(67.32596079443397, 200.0, 31.335982676680096, 736)
-    femmesh.addNode(930.9903181297045, 200.0, 33.57407222021367, 737)
-    femmesh.addNode(886.2779284851154, 200.0, 32.30268334540959, 738)
-    femmesh.addNode(634.5833333333326, 200.0, 68.8333333333333, 739)
-    femmesh.addNode(634.5833333333326, 200.0, 31.166666666666668, 740)
-    femmesh.addNode(205.41666666666666, 200.0, 68.8333333333333, 741)
-    femmesh.addNode(205.41666666666663, 200.0, 31.166666666666703, 742)
-    femmesh.addNode(839.3399848191738, 200.0, 29.956512448526258, 743)
-    femmesh.addNode(836.8677248642331, 200.0, 67.40924010805351, 744)
-    femmesh.addNode(29.087991789644093, 200.0, 72.645696086339, 745)
-    femmesh.addNode(28.93879973354523, 200.0, 27.44488600166885, 746)
-    femmesh.addNode(971.1111111111118, 200.0, 72.66666666666715, 747)
-    femmesh.addNode(970.7805800871447, 200.0, 27.817900925591108, 748)
-    femmesh.addNode(936.1262330172977, 200.0, 70.77054696244574, 749)
-    femmesh.addNode(880.8655741397756, 200.0, 70.65377034408962, 750)
-    femmesh.addNode(300.0, 200.0, 21.0, 751)
-    femmesh.addNode(379.99999999999983, 200.0, 21.000000000000203, 752)
-    femmesh.addNode(300.0, 200.0, 79.0, 753)
-    femmesh.addNode(379.99999999999983, 200.0, 78.9999999999998, 754)
-    femmesh.addNode(460.0, 200.0, 21.0, 755)
-    femmesh.addNode(540.0, 200.0, 21.0, 756)
-    femmesh.addNode(740.0000000000007, 200.0, 21.000000000000174, 757)
-    femmesh.addNode(460.0, 200.0, 79.0, 758)
-    femmesh.addNode(540.0, 200.0, 79.0, 759)
-    femmesh.addNode(740.0000000000007, 200.0, 78.99999999999983, 760)
-    femmesh.addNode(979.5793991089085, 200.0, 50.069223941751105, 761)
-    femmesh.addNode(20.408955565583796, 200.0, 50.01294029828677, 762)
-    femmesh.addNode(101.09887812592693, 200.0, 78.57242862208548, 763)
-    femmesh.addNode(101.46825587734912, 200.0, 21.77238245786512, 764)
-    femmesh.addNode(664.1326130194349, 200.0, 21.818512365805642, 765)
-    femmesh.addNode(664.1186291157836, 200.0, 76.96166510104284, 766)
-    femmesh.addNode(176.031126456422, 200.0, 78.06692265595689, 767)
-    femmesh.addNode(177.29447927823765, 200.0, 22.14911976237576, 768)
-    femmesh.addNode(14.543995894822046, 200.0, 86.3228480431695, 769)
-    femmesh.addNode(14.543995894822046, 200.0, 69.65618137650279, 770)
-    femmesh.addNode(34.54399589482204, 200.0, 86.3228480431695, 771)
-    femmesh.addNode(14.469399866772616, 200.0, 30.389109667501035, 772)
-    femmesh.addNode(14.469399866772616, 200.0, 13.722443000834424, 773)
-    femmesh.addNode(34.469399866772605, 200.0, 13.722443000834424, 774)
-    femmesh.addNode(985.5555555555559, 200.0, 69.66666666666687, 775)
-    femmesh.addNode(985.5555555555559, 200.0, 86.33333333333357, 776)
-    femmesh.addNode(965.5555555555559, 200.0, 86.33333333333357, 777)
-    femmesh.addNode(985.3902900435723, 200.0, 13.908950462795554, 778)
-    femmesh.addNode(985.3902900435723, 200.0, 30.575617129462167, 779)
-    femmesh.addNode(965.3902900435723, 200.0, 13.908950462795554, 780)
-    femmesh.addNode(10.204477782791898, 200.0, 58.33980348247668, 781)
-    femmesh.addNode(10.204477782791898, 200.0, 41.67313681581, 782)
-    femmesh.addNode(24.673877649564513, 200.0, 38.728913149977814, 783)
-    femmesh.addNode(24.748473677613944, 200.0, 61.32931819231288, 784)
-    femmesh.addNode(989.7896995544543, 200.0, 41.70127863754216, 785)
-    femmesh.addNode(989.7896995544543, 200.0, 58.367945304208845, 786)
-    femmesh.addNode(975.1799895980266, 200.0, 38.943562433671104, 787)
-    femmesh.addNode(975.3452551100102, 200.0, 61.36794530420913, 788)
-    femmesh.addNode(53.66298039721698, 200.0, 15.667991338340048, 789)
-    femmesh.addNode(73.66298039721698, 200.0, 15.667991338340048, 790)
-    femmesh.addNode(48.1323802639896, 200.0, 29.390434339174472, 791)
-    femmesh.addNode(90.73412793867456, 200.0, 10.88619122893256, 792)
-    femmesh.addNode(110.73412793867456, 200.0, 10.88619122893256, 793)
-    femmesh.addNode(84.39710833589155, 200.0, 26.55418256727261, 794)
-    femmesh.addNode(129.98418502355025, 200.0, 15.520770631219065, 795)
-    femmesh.addNode(149.98418502355025, 200.0, 15.520770631219065, 796)
-    femmesh.addNode(120.7183129622248, 200.0, 26.406961860151625, 797)
-    femmesh.addNode(168.64723963911882, 200.0, 11.07455988118788, 798)
-    femmesh.addNode(188.64723963911882, 200.0, 11.07455988118788, 799)
-    femmesh.addNode(158.63142466266908, 200.0, 26.595330512406946, 800)
-    femmesh.addNode(202.70833333333331, 200.0, 15.583333333333352, 801)
-    femmesh.addNode(222.70833333333331, 200.0, 15.583333333333352, 802)
-    femmesh.addNode(191.35557297245214, 200.0, 26.65789321452123, 803)
-    femmesh.addNode(253.9775422897792, 200.0, 16.382110117530395, 804)
-    femmesh.addNode(273.9775422897792, 200.0, 16.382110117530395, 805)
-    femmesh.addNode(250.7358773394771, 200.0, 41.59577717504779, 806)
-    femmesh.addNode(236.7583350496979, 200.0, 25.213667057517398, 807)
-    femmesh.addNode(219.46666838303122, 200.0, 40.79700039085075, 808)
-    femmesh.addNode(290.0, 200.0, 10.5, 809)
-    femmesh.addNode(310.0, 200.0, 10.5, 810)
-    femmesh.addNode(283.9775422897792, 200.0, 26.882110117530395, 811)
-    femmesh.addNode(329.9999999999999, 200.0, 14.763250741680233, 812)
-    femmesh.addNode(349.9999999999999, 200.0, 14.763250741680233, 813)
-    femmesh.addNode(319.9999999999999, 200.0, 25.26325074168023, 814)
-    femmesh.addNode(369.9999999999999, 200.0, 10.500000000000101, 815)
-    femmesh.addNode(389.9999999999999, 200.0, 10.500000000000101, 816)
-    femmesh.addNode(359.99999999999983, 200.0, 25.263250741680334, 817)
-    femmesh.addNode(409.9999999999999, 200.0, 17.657244808238566, 818)
-    femmesh.addNode(429.9999999999999, 200.0, 17.657244808238566, 819)
-    femmesh.addNode(399.9999999999998, 200.0, 28.157244808238666, 820)
-    femmesh.addNode(450.0, 200.0, 10.5, 821)
-    femmesh.addNode(470.0, 200.0, 10.5, 822)
-    femmesh.addNode(439.9999999999999, 200.0, 28.157244808238566, 823)
-    femmesh.addNode(490.0, 200.0, 17.657244808238442, 824)
-    femmesh.addNode(510.0, 200.0, 17.657244808238442, 825)
-    femmesh.addNode(480.0, 200.0, 28.157244808238442, 826)
-    femmesh.addNode(530.0, 200.0, 10.5, 827)
-    femmesh.addNode(550.0, 200.0, 10.5, 828)
-    femmesh.addNode(520.0, 200.0, 28.157244808238442, 829)
-    femmesh.addNode(566.0224577102208, 200.0, 16.38211011753038, 830)
-    femmesh.addNode(586.0224577102208, 200.0, 16.38211011753038, 831)
-    femmesh.addNode(556.0224577102208, 200.0, 26.88211011753038, 832)
-    femmesh.addNode(617.2916666666663, 200.0, 15.583333333333334, 833)
-    femmesh.addNode(637.2916666666663, 200.0, 15.583333333333334, 834)
-    femmesh.addNode(589.2641226605226, 200.0, 41.59577717504777, 835)
-    femmesh.addNode(603.2416649503019, 200.0, 25.21366705751739, 836)
-    femmesh.addNode(620.5333316169682, 200.0, 40.79700039085073, 837)
-    femmesh.addNode(652.0663065097174, 200.0, 10.909256182902821, 838)
-    femmesh.addNode(672.0663065097174, 200.0, 10.909256182902821, 839)
-    femmesh.addNode(649.3579731763837, 200.0, 26.492589516236155, 840)
-    femmesh.addNode(690.3775653985851, 200.0, 14.685831179064476, 841)
-    femmesh.addNode(710.3775653985851, 200.0, 14.685831179064476, 842)
-    femmesh.addNode(682.4438719083025, 200.0, 25.595087361967295, 843)
-    femmesh.addNode(730.0000000000002, 200.0, 10.500000000000087, 844)
-    femmesh.addNode(750.0000000000002, 200.0, 10.500000000000087, 845)
-    femmesh.addNode(720.3775653985855, 200.0, 25.185831179064564, 846)
-    femmesh.addNode(766.0224577102208, 200.0, 16.382110117530356, 847)
-    femmesh.addNode(786.0224577102208, 200.0, 16.382110117530356, 848)
-    femmesh.addNode(756.0224577102213, 200.0, 26.882110117530445, 849)
-    femmesh.addNode(819.6699924095868, 200.0, 14.978256224263129, 850)
-    femmesh.addNode(839.6699924095868, 200.0, 14.978256224263129, 851)
-    femmesh.addNode(789.2641226605234, 200.0, 41.59577717504775, 852)
-    femmesh.addNode(803.2416649503025, 200.0, 25.213667057517394, 853)
-    femmesh.addNode(822.9116573598894, 200.0, 40.191923281780525, 854)
-    femmesh.addNode(859.6699924095869, 200.0, 14.978256224263129, 855)
-    femmesh.addNode(883.1389642425577, 200.0, 16.151341672704795, 856)
-    femmesh.addNode(903.1389642425577, 200.0, 16.151341672704795, 857)
-    femmesh.addNode(862.8089566521446, 200.0, 31.129597896967923, 858)
-    femmesh.addNode(925.4951590648523, 200.0, 16.787036110106836, 859)
-    femmesh.addNode(945.4951590648523, 200.0, 16.787036110106836, 860)
-    femmesh.addNode(908.6341233074099, 200.0, 32.93837778281163, 861)
-    femmesh.addNode(950.8854491084246, 200.0, 30.69598657290239, 862)
-    femmesh.addNode(74.11055656551356, 200.0, 84.60375492568383, 863)
-    femmesh.addNode(54.11055656551356, 200.0, 84.60375492568383, 864)
-    femmesh.addNode(48.654552460335616, 200.0, 70.92660296885333, 865)
-    femmesh.addNode(110.54943906296347, 200.0, 89.28621431104274, 866)
-    femmesh.addNode(90.54943906296346, 200.0, 89.28621431104274, 867)
-    femmesh.addNode(84.65999562847703, 200.0, 73.88996923672656, 868)
-    femmesh.addNode(149.98192574120026, 200.0, 85.05890788615292, 869)
-    femmesh.addNode(129.98192574120026, 200.0, 85.05890788615292, 870)
-    femmesh.addNode(120.53136480416373, 200.0, 74.34512219719565, 871)
-    femmesh.addNode(188.01556322821097, 200.0, 89.03346132797844, 872)
-    femmesh.addNode(168.015563228211, 200.0, 89.03346132797844, 873)
-    femmesh.addNode(157.99748896941125, 200.0, 74.09236921413137, 874)
-    femmesh.addNode(222.70833333333331, 200.0, 84.41666666666666, 875)
-    femmesh.addNode(202.70833333333331, 200.0, 84.41666666666666, 876)
-    femmesh.addNode(190.72389656154434, 200.0, 73.4501279946451, 877)
-    femmesh.addNode(273.70275306930364, 200.0, 84.56265669124033, 878)
-    femmesh.addNode(253.70275306930364, 200.0, 84.56265669124033, 879)
-    femmesh.addNode(250.46108811900154, 200.0, 59.77632374875773, 880)
-    femmesh.addNode(236.7583350496979, 200.0, 75.2136670575174, 881)
-    femmesh.addNode(219.46666838303122, 200.0, 59.63033372418405, 882)
-    femmesh.addNode(310.0, 200.0, 89.5, 883)
-    femmesh.addNode(290.0, 200.0, 89.5, 884)
-    femmesh.addNode(283.70275306930364, 200.0, 74.06265669124033, 885)
-    femmesh.addNode(350.0, 200.0, 82.34275519176154, 886)
-    femmesh.addNode(330.0, 200.0, 82.34275519176154, 887)
-    femmesh.addNode(320.0, 200.0, 71.84275519176154, 888)
-    femmesh.addNode(389.9999999999999, 200.0, 89.4999999999999, 889)
-    femmesh.addNode(369.9999999999999, 200.0, 89.4999999999999, 890)
-    femmesh.addNode(359.99999999999994, 200.0, 71.84275519176143, 891)
-    femmesh.addNode(429.9999999999999, 200.0, 85.23674925831978, 892)
-    femmesh.addNode(409.9999999999999, 200.0, 85.23674925831978, 893)
-    femmesh.addNode(399.99999999999983, 200.0, 74.73674925831968, 894)
-    femmesh.addNode(470.0, 200.0, 89.5, 895)
-    femmesh.addNode(450.0, 200.0, 89.5, 896)
-    femmesh.addNode(439.9999999999999, 200.0, 74.73674925831978, 897)
-    femmesh.addNode(510.0, 200.0, 85.23674925831978, 898)
-    femmesh.addNode(490.0, 200.0, 85.23674925831978, 899)
-    femmesh.addNode(480.0, 200.0, 74.73674925831978, 900)
-    femmesh.addNode(550.0, 200.0, 89.5, 901)
-    femmesh.addNode(530.0, 200.0, 89.5, 902)
-    femmesh.addNode(520.0, 200.0, 74.73674925831978, 903)
-    femmesh.addNode(586.2972469306962, 200.0, 84.5626566912403, 904)
-    femmesh.addNode(566.2972469306962, 200.0, 84.5626566912403, 905)
-    femmesh.addNode(556.2972469306962, 200.0, 74.0626566912403, 906)
-    femmesh.addNode(637.2916666666663, 200.0, 84.41666666666666, 907)
-    femmesh.addNode(617.2916666666663, 200.0, 84.41666666666666, 908)
-    femmesh.addNode(589.5389118809982, 200.0, 59.77632374875769, 909)
-    femmesh.addNode(603.2416649503019, 200.0, 75.2136670575174, 910)
-    femmesh.addNode(620.5333316169682, 200.0, 59.63033372418404, 911)
-    femmesh.addNode(672.0593145578918, 200.0, 88.48083255052143, 912)
-    femmesh.addNode(652.0593145578919, 200.0, 88.48083255052143, 913)
-    femmesh.addNode(649.3509812245582, 200.0, 72.89749921718807, 914)
-    femmesh.addNode(710.3426056394569, 200.0, 83.71037968382416, 915)
-    femmesh.addNode(690.3426056394569, 200.0, 83.71037968382416, 916)
-    femmesh.addNode(682.4019201973488, 200.0, 72.19121223434557, 917)
-    femmesh.addNode(750.0000000000002, 200.0, 89.49999999999991, 918)
-    femmesh.addNode(730.0000000000002, 200.0, 89.49999999999991, 919)
-    femmesh.addNode(720.3426056394574, 200.0, 73.21037968382407, 920)
-    femmesh.addNode(786.2972469306965, 200.0, 84.56265669124039, 921)
-    femmesh.addNode(766.2972469306965, 200.0, 84.56265669124039, 922)
-    femmesh.addNode(756.2972469306969, 200.0, 74.0626566912403, 923)
-    femmesh.addNode(838.4338624321165, 200.0, 83.70462005402675, 924)
-    femmesh.addNode(818.4338624321165, 200.0, 83.70462005402675, 925)
-    femmesh.addNode(789.538911880999, 200.0, 59.776323748757775, 926)
-    femmesh.addNode(803.2416649503025, 200.0, 75.2136670575174, 927)
-    femmesh.addNode(821.675527382419, 200.0, 58.918287111544146, 928)
-    femmesh.addNode(880.4327870698878, 200.0, 85.32688517204481, 929)
-    femmesh.addNode(860.4327870698878, 200.0, 85.32688517204481, 930)
-    femmesh.addNode(858.8666495020043, 200.0, 69.03150522607157, 931)
-    femmesh.addNode(900.4327870698878, 200.0, 85.32688517204481, 932)
-    femmesh.addNode(948.0631165086488, 200.0, 85.38527348122287, 933)
-    femmesh.addNode(928.0631165086488, 200.0, 85.38527348122287, 934)
-    femmesh.addNode(922.5235409188424, 200.0, 65.90238684362993, 935)
-    femmesh.addNode(914.4604244101935, 200.0, 80.51711336240706, 936)
-    femmesh.addNode(894.8932114800813, 200.0, 65.84399853445188, 937)
-    femmesh.addNode(953.6186720642047, 200.0, 71.71860681455644, 938)
-    femmesh.addNode(67.77353696273056, 200.0, 50.271746264023875, 939)
-    femmesh.addNode(57.55186928610581, 200.0, 40.66799133834, 940)
-    femmesh.addNode(57.9994454544024, 200.0, 59.60375492568377, 941)
-    femmesh.addNode(38.432884783710875, 200.0, 61.32284804316946, 942)
-    femmesh.addNode(38.35828875566145, 200.0, 38.722443000834375, 943)
-    femmesh.addNode(34.09336667168073, 200.0, 50.00647014914334, 944)
-    femmesh.addNode(961.5014011546837, 200.0, 38.908950462795474, 945)
-    femmesh.addNode(941.6062701759636, 200.0, 41.787036110106754, 946)
-    femmesh.addNode(933.5582755735011, 200.0, 52.17230959132971, 947)
-    femmesh.addNode(944.1742276197601, 200.0, 60.38527348122279, 948)
-    femmesh.addNode(961.6666666666672, 200.0, 61.3333333333335, 949)
-    femmesh.addNode(965.9008106655656, 200.0, 50.034611970875474, 950)
-    femmesh.addNode(700.720171038042, 200.0, 48.39621086288862, 951)
-    femmesh.addNode(683.039865881921, 200.0, 38.96294758118077, 952)
-    femmesh.addNode(683.0049061227928, 200.0, 57.98749608594044, 953)
-    femmesh.addNode(664.7216150412276, 200.0, 62.75794895263771, 954)
-    femmesh.addNode(664.7286069930533, 200.0, 35.186372585019114, 955)
-    femmesh.addNode(649.9539671500021, 200.0, 39.86044973544963, 956)
-    femmesh.addNode(634.5833333333326, 200.0, 49.999999999999986, 957)
-    femmesh.addNode(649.9539671500021, 200.0, 58.69378306878294, 958)
-    femmesh.addNode(399.99999999999983, 200.0, 60.236749258319776, 959)
-    femmesh.addNode(419.9999999999998, 200.0, 52.89399406655834, 960)
-    femmesh.addNode(399.9999999999998, 200.0, 42.657244808238566, 961)
-    femmesh.addNode(379.99999999999983, 200.0, 35.5000000000001, 962)
-    femmesh.addNode(359.99999999999983, 200.0, 39.76325074168023, 963)
-    femmesh.addNode(339.99999999999994, 200.0, 47.106005933441764, 964)
-    femmesh.addNode(359.99999999999994, 200.0, 57.34275519176153, 965)
-    femmesh.addNode(379.99999999999983, 200.0, 64.4999999999999, 966)
-    femmesh.addNode(849.6699924095872, 200.0, 39.978256224263134, 967)
-    femmesh.addNode(873.1389642425579, 200.0, 41.1513416727048, 968)
-    femmesh.addNode(870.432787069888, 200.0, 60.32688517204481, 969)
-    femmesh.addNode(883.5717513124455, 200.0, 51.47822684474961, 970)
-    femmesh.addNode(838.1038548417034, 200.0, 48.68287627828988, 971)
-    femmesh.addNode(848.4338624321167, 200.0, 58.70462005402676, 972)
-    femmesh.addNode(139.9661107647505, 200.0, 50.57967851737198, 973)
-    femmesh.addNode(157.36948280772162, 200.0, 60.75063997322559, 974)
-    femmesh.addNode(157.37174209007162, 200.0, 41.21250271829174, 975)
-    femmesh.addNode(176.0347967056402, 200.0, 36.76629196826055, 976)
-    femmesh.addNode(175.4031202947324, 200.0, 64.72519341505111, 977)
-    femmesh.addNode(205.41666666666663, 200.0, 50.0, 978)
-    femmesh.addNode(190.09589039985468, 200.0, 41.27506542040602, 979)
-    femmesh.addNode(190.0958903998547, 200.0, 60.10839875373932, 980)
-    femmesh.addNode(319.9999999999999, 200.0, 39.76325074168023, 981)
-    femmesh.addNode(320.0, 200.0, 57.34275519176153, 982)
-    femmesh.addNode(300.0, 200.0, 64.5, 983)
-    femmesh.addNode(267.68029535908283, 200.0, 50.94476680877073, 984)
-    femmesh.addNode(283.70275306930364, 200.0, 59.562656691240335, 985)
-    femmesh.addNode(283.9775422897792, 200.0, 41.382110117530395, 986)
-    femmesh.addNode(300.0, 200.0, 35.5, 987)
-    femmesh.addNode(439.9999999999999, 200.0, 60.236749258319776, 988)
-    femmesh.addNode(439.9999999999999, 200.0, 42.657244808238566, 989)
-    femmesh.addNode(460.0, 200.0, 35.5, 990)
-    femmesh.addNode(480.0, 200.0, 60.236749258319776, 991)
-    femmesh.addNode(500.0, 200.0, 52.89399406655822, 992)
-    femmesh.addNode(480.0, 200.0, 42.657244808238445, 993)
-    femmesh.addNode(460.0, 200.0, 64.5, 994)
-    femmesh.addNode(520.0, 200.0, 60.236749258319776, 995)
-    femmesh.addNode(520.0, 200.0, 42.657244808238445, 996)
-    femmesh.addNode(540.0, 200.0, 35.5, 997)
-    femmesh.addNode(556.2972469306962, 200.0, 59.5626566912403, 998)
-    femmesh.addNode(572.319704640917, 200.0, 50.94476680877068, 999)
-    femmesh.addNode(556.0224577102208, 200.0, 41.38211011753038, 1000)
-    femmesh.addNode(540.0, 200.0, 64.5, 1001)
-    femmesh.addNode(720.3775653985855, 200.0, 39.68583117906448, 1002)
-    femmesh.addNode(720.3426056394574, 200.0, 58.71037968382415, 1003)
-    femmesh.addNode(740.0000000000007, 200.0, 64.49999999999991, 1004)
-    femmesh.addNode(756.2972469306969, 200.0, 59.562656691240385, 1005)
-    femmesh.addNode(772.3197046409175, 200.0, 50.94476680877074, 1006)
-    femmesh.addNode(756.0224577102213, 200.0, 41.38211011753036, 1007)
-    femmesh.addNode(740.0000000000007, 200.0, 35.500000000000085, 1008)
-    femmesh.addNode(122.62945955990884, 200.0, 60.75063997322559, 1009)
-    femmesh.addNode(122.63171884225883, 200.0, 41.21250271829174, 1010)
-    femmesh.addNode(103.38166175738314, 200.0, 36.57792331600523, 1011)
-    femmesh.addNode(103.19697288167205, 200.0, 64.97794639811542, 1012)
-    femmesh.addNode(86.31051421592556, 200.0, 41.359723425412724, 1013)
-    femmesh.addNode(86.75809038422216, 200.0, 60.295487012756496, 1014)
-    femmesh.addNode(897.5993886527511, 200.0, 46.66845503511186, 1015)
-    femmesh.addNode(919.9555834750457, 200.0, 47.3041494725139, 1016)
-    femmesh.addNode(661.7202969637989, 100.29286697690952, 0.0, 1017)
-    femmesh.addNode(339.99999999999994, 99.99999999999999, 0.0, 1018)
-    femmesh.addNode(179.99999999999994, 99.99999999999999, 0.0, 1019)
-    femmesh.addNode(457.670079922499, 100.96386426511363, 0.0, 1020)
-    femmesh.addNode(779.9999999999986, 100.00000000000021, 0.0, 1021)
-    femmesh.addNode(892.5394232984211, 104.01224232228054, 0.0, 1022)
-    femmesh.addNode(560.3335028727163, 103.44136476243341, 0.0, 1023)
-    femmesh.addNode(90.206051682268, 99.9999999999998, 0.0, 1024)
-    femmesh.addNode(260.4378359381641, 115.81814769082683, 0.0, 1025)
-    femmesh.addNode(837.9584828332065, 69.04430401709482, 0.0, 1026)
-    femmesh.addNode(400.5512726083837, 68.65034512815359, 0.0, 1027)
-    femmesh.addNode(719.9999999999993, 132.00000000000023, 0.0, 1028)
-    femmesh.addNode(718.9158164764513, 67.59518016304337, 0.0, 1029)
-    femmesh.addNode(394.2619607275658, 135.2813794422652, 0.0, 1030)
-    femmesh.addNode(839.6218892131161, 132.51758814460896, 0.0, 1031)
-    femmesh.addNode(233.53717372412862, 65.3260458049336, 0.0, 1032)
-    femmesh.addNode(609.9999999999998, 137.99999999999994, 0.0, 1033)
-    femmesh.addNode(510.0, 137.99999999999997, 0.0, 1034)
-    femmesh.addNode(609.8288944449038, 61.65384221650975, 0.0, 1035)
-    femmesh.addNode(508.1479098553445, 62.948371871690995, 0.0, 1036)
-    femmesh.addNode(292.1404358437092, 63.80499850186514, 0.0, 1037)
-    femmesh.addNode(134.44444444444426, 140.66666666666657, 0.0, 1038)
-    femmesh.addNode(134.44444444444449, 59.33333333333328, 0.0, 1039)
-    femmesh.addNode(945.9103234587294, 60.400672874779104, 0.0, 1040)
-    femmesh.addNode(942.4999999999999, 142.50000000000003, 0.0, 1041)
-    femmesh.addNode(55.28919183243086, 148.65120118983907, 0.0, 1042)
-    femmesh.addNode(55.28919183243076, 51.34879881016082, 0.0, 1043)
-    femmesh.addNode(308.7403847499711, 144.59560700023633, 0.0, 1044)
-    femmesh.addNode(199.58583823064262, 134.79573931111955, 0.0, 1045)
-    femmesh.addNode(779.9999999999986, 48.00000000000015, 0.0, 1046)
-    femmesh.addNode(779.9999999999986, 151.99999999999986, 0.0, 1047)
-    femmesh.addNode(660.7273844332979, 165.54995884627152, 0.0, 1048)
-    femmesh.addNode(659.9871896192079, 34.59996079110192, 0.0, 1049)
-    femmesh.addNode(458.2794018954646, 161.34967076254657, 0.0, 1050)
-    femmesh.addNode(458.4872665926614, 39.07541046265069, 0.0, 1051)
-    femmesh.addNode(343.34277853435503, 48.66855570687099, 0.0, 1052)
-    femmesh.addNode(887.910447761193, 50.41791044776143, 0.0, 1053)
-    femmesh.addNode(892.0833333333328, 150.41666666666657, 0.0, 1054)
-    femmesh.addNode(174.19058310618422, 37.59803948234969, 0.0, 1055)
-    femmesh.addNode(559.7715002061935, 142.49052102737767, 0.0, 1056)
-    femmesh.addNode(560.2304312694071, 44.80096426863516, 0.0, 1057)
-    femmesh.addNode(30.088620235896265, 99.99999999999984, 0.0, 1058)
-    femmesh.addNode(357.28257618740446, 154.30517727872942, 0.0, 1059)
-    femmesh.addNode(959.6471007584693, 98.30528641917118, 0.0, 1060)
-    femmesh.addNode(95.55346681431143, 40.373951591528616, 0.0, 1061)
-    femmesh.addNode(95.55346681431145, 159.62604840847152, 0.0, 1062)
-    femmesh.addNode(260.0, 172.36522738886052, 0.0, 1063)
-    femmesh.addNode(300.33415064557863, 106.44484148680812, 0.0, 1064)
-    femmesh.addNode(174.05245683773717, 164.72220871752586, 0.0, 1065)
-    femmesh.addNode(224.37339728574443, 102.56839612572189, 0.0, 1066)
-    femmesh.addNode(134.4733477344046, 100.11556132036631, 0.0, 1067)
-    femmesh.addNode(262.6508877591819, 38.17984380496399, 0.0, 1068)
-    femmesh.addNode(820.0612965704302, 164.28092232937337, 0.0, 1069)
-    femmesh.addNode(740.0097516016616, 35.89366890318307, 0.0, 1070)
-    femmesh.addNode(420.40353360691995, 165.34679896994115, 0.0, 1071)
-    femmesh.addNode(822.0034528798217, 100.86494986792829, 0.0, 1072)
-    femmesh.addNode(416.32100402052225, 101.42788316939638, 0.0, 1073)
-    femmesh.addNode(737.4125785406384, 99.32789551952972, 0.0, 1074)
-    femmesh.addNode(819.737880566232, 36.958360574802214, 0.0, 1075)
-    femmesh.addNode(739.7343597549949, 163.42240273222527, 0.0, 1076)
-    femmesh.addNode(418.8687244073274, 35.41133585321526, 0.0, 1077)
-    femmesh.addNode(701.1547874680748, 165.3778584946716, 0.0, 1078)
-    femmesh.addNode(375.7979039904908, 34.669208141426346, 0.0, 1079)
-    femmesh.addNode(619.0542751679609, 98.22571227623664, 0.0, 1080)
-    femmesh.addNode(500.6973964456904, 98.33835896194303, 0.0, 1081)
-    femmesh.addNode(378.53333333333336, 100.00000000000011, 0.0, 1082)
-    femmesh.addNode(698.5333333333327, 100.00000000000006, 0.0, 1083)
-    femmesh.addNode(855.5568410537131, 101.03060578563534, 0.0, 1084)
-    femmesh.addNode(700.5007968470297, 34.75853705487549, 0.0, 1085)
-    femmesh.addNode(263.4830385565243, 82.78222945834587, 0.0, 1086)
-    femmesh.addNode(858.2098668004571, 165.13228210846466, 0.0, 1087)
-    femmesh.addNode(854.965526285778, 35.05883180907869, 0.0, 1088)
-    femmesh.addNode(219.01864805247732, 34.166541054231196, 0.0, 1089)
-    femmesh.addNode(530.4700390971173, 33.49516759630921, 0.0, 1090)
-    femmesh.addNode(528.8375115736887, 168.66253824934765, 0.0, 1091)
-    femmesh.addNode(386.389614104378, 170.98667113818715, 0.0, 1092)
-    femmesh.addNode(623.0717610558725, 166.57367301438381, 0.0, 1093)
-    femmesh.addNode(622.9198776610083, 33.39362062792993, 0.0, 1094)
-    femmesh.addNode(493.69149373397937, 166.38980035394616, 0.0, 1095)
-    femmesh.addNode(496.12841555381675, 34.91659643093692, 0.0, 1096)
-    femmesh.addNode(807.9399632558515, 70.97352289196513, 0.0, 1097)
-    femmesh.addNode(751.429387659126, 129.35005965035106, 0.0, 1098)
-    femmesh.addNode(438.5939375548619, 69.91824458891669, 0.0, 1099)
-    femmesh.addNode(919.6112726445882, 33.14862889309759, 0.0, 1100)
-    femmesh.addNode(966.5833333333333, 33.41666666666652, 0.0, 1101)
-    femmesh.addNode(966.5833333333335, 166.5833333333334, 0.0, 1102)
-    femmesh.addNode(312.1804197983476, 33.552550447369846, 0.0, 1103)
-    femmesh.addNode(680.4117540701209, 131.54000927714696, 0.0, 1104)
-    femmesh.addNode(140.0, 173.44402829796078, 0.0, 1105)
-    femmesh.addNode(140.0, 26.55597170203909, 0.0, 1106)
-    femmesh.addNode(751.2676293237497, 70.1633489171513, 0.0, 1107)
-    femmesh.addNode(808.337327732673, 129.93269206838212, 0.0, 1108)
-    femmesh.addNode(437.7668763251248, 131.73149465904868, 0.0, 1109)
-    femmesh.addNode(920.525618938233, 167.05350306278703, 0.0, 1110)
-    femmesh.addNode(679.9986925770071, 68.53786227348353, 0.0, 1111)
-    femmesh.addNode(199.10524006934412, 68.71336140830243, 0.0, 1112)
-    femmesh.addNode(31.614912707742075, 31.61491270774205, 0.0, 1113)
-    femmesh.addNode(31.614912707742107, 168.38508729225785, 0.0, 1114)
-    femmesh.addNode(590.5686522524131, 169.41283880835226, 0.0, 1115)
-    femmesh.addNode(587.3684596797162, 30.127292104997128, 0.0, 1116)
-    femmesh.addNode(641.4382203818919, 129.76647953557102, 0.0, 1117)
-    femmesh.addNode(478.8025114675638, 127.78326143129632, 0.0, 1118)
-    femmesh.addNode(476.6208343208123, 67.69347443020865, 0.0, 1119)
-    femmesh.addNode(642.251537738981, 66.11731086036187, 0.0, 1120)
-    femmesh.addNode(588.1004661805562, 111.79498722513102, 0.0, 1121)
-    femmesh.addNode(531.9869009501056, 111.68637972944398, 0.0, 1122)
-    femmesh.addNode(539.7400869853664, 74.75564631294966, 0.0, 1123)
-    femmesh.addNode(104.28394405570623, 126.70416996372802, 0.0, 1124)
-    femmesh.addNode(104.28394405570651, 73.31267570979463, 0.0, 1125)
-    femmesh.addNode(164.33691518907355, 128.3033445803527, 0.0, 1126)
-    femmesh.addNode(924.640257076232, 113.07494995294721, 0.0, 1127)
-    femmesh.addNode(362.324237239965, 70.4941033982375, 0.0, 1128)
-    femmesh.addNode(913.332698290487, 71.94615397281999, 0.0, 1129)
-    femmesh.addNode(580.6651595143751, 74.97140130955611, 0.0, 1130)
-    femmesh.addNode(324.330958425201, 71.2350916781898, 0.0, 1131)
-    femmesh.addNode(163.5116382475304, 72.62114598257826, 0.0, 1132)
-    femmesh.addNode(218.92780771418853, 168.85552923625096, 0.0, 1133)
-    femmesh.addNode(297.47392279062075, 172.81294013895644, 0.0, 1134)
-    femmesh.addNode(974.4281515101064, 62.42452519212328, 0.0, 1135)
-    femmesh.addNode(973.7460868183606, 137.47772395050086, 0.0, 1136)
-    femmesh.addNode(24.724194041022212, 138.366329426149, 0.0, 1137)
-    femmesh.addNode(61.63367057385086, 24.724194041022187, 0.0, 1138)
-    femmesh.addNode(61.63367057385086, 175.27580595897777, 0.0, 1139)
-    femmesh.addNode(24.724194041022187, 61.63367057385074, 0.0, 1140)
-    femmesh.addNode(335.27588266395674, 130.22036567833976, 0.0, 1141)
-    femmesh.addNode(329.9691179079952, 171.3882255783417, 0.0, 1142)
-    femmesh.addNode(867.6022707398081, 130.62187700553122, 0.0, 1143)
-    femmesh.addNode(361.0707505824521, 123.96138447986692, 0.0, 1144)
-    femmesh.addNode(65.54166666666661, 117.89466972879572, 0.0, 1145)
-    femmesh.addNode(65.54166666666661, 82.10533027120398, 0.0, 1146)
-    femmesh.addNode(239.92855121675157, 141.25, 0.0, 1147)
-    femmesh.addNode(277.819140890181, 142.2144606176147, 0.0, 1148)
-    femmesh.addNode(868.6437810945258, 71.98507462686582, 0.0, 1149)
-    femmesh.addNode(340.58939516468104, 21.130571553509423, 0.0, 1150)
-    femmesh.addNode(15.807456353871038, 35.80745635387096, 0.0, 1151)
-    femmesh.addNode(15.807456353871038, 15.807456353871025, 0.0, 1152)
-    femmesh.addNode(35.80745635387103, 15.807456353871025, 0.0, 1153)
-    femmesh.addNode(15.807456353871054, 184.1925436461289, 0.0, 1154)
-    femmesh.addNode(15.807456353871054, 164.19254364612888, 0.0, 1155)
-    femmesh.addNode(35.807456353871046, 184.1925436461289, 0.0, 1156)
-    femmesh.addNode(983.2916666666666, 16.70833333333326, 0.0, 1157)
-    femmesh.addNode(983.2916666666666, 36.7083333333332, 0.0, 1158)
-    femmesh.addNode(963.2916666666666, 16.70833333333326, 0.0, 1159)
-    femmesh.addNode(983.2916666666667, 163.29166666666666, 0.0, 1160)
-    femmesh.addNode(983.2916666666667, 183.29166666666669, 0.0, 1161)
-    femmesh.addNode(963.2916666666667, 183.29166666666669, 0.0, 1162)
-    femmesh.addNode(12.362097020511094, 70.81683528692524, 0.0, 1163)
-    femmesh.addNode(12.362097020511094, 50.81683528692531, 0.0, 1164)
-    femmesh.addNode(28.169553374382133, 46.6242916407964, 0.0, 1165)
-    femmesh.addNode(15.044310117948132, 109.99999999999983, 0.0, 1166)
-    femmesh.addNode(15.044310117948132, 89.99999999999979, 0.0, 1167)
-    femmesh.addNode(27.406407138459226, 80.8168352869253, 0.0, 1168)
-    femmesh.addNode(12.362097020511106, 149.18316471307446, 0.0, 1169)
-    femmesh.addNode(12.362097020511106, 129.1831647130744, 0.0, 1170)
-    femmesh.addNode(27.406407138459237, 119.18316471307443, 0.0, 1171)
-    femmesh.addNode(28.16955337438216, 153.37570835920343, 0.0, 1172)
-    femmesh.addNode(987.2140757550533, 51.21226259606158, 0.0, 1173)
-    femmesh.addNode(987.2140757550533, 71.2122625960615, 0.0, 1174)
-    femmesh.addNode(970.5057424217198, 47.920595929394906, 0.0, 1175)
-    femmesh.addNode(979.8235503792346, 89.15264320958545, 0.0, 1176)
-    femmesh.addNode(979.8235503792346, 109.1526432095855, 0.0, 1177)
-    femmesh.addNode(967.0376261342878, 80.36490580564723, 0.0, 1178)
-    femmesh.addNode(986.8730434091804, 128.73886197525033, 0.0, 1179)
-    femmesh.addNode(986.8730434091804, 148.7388619752504, 0.0, 1180)
-    femmesh.addNode(966.6965937884149, 117.89150518483602, 0.0, 1181)
-    femmesh.addNode(970.1647100758471, 152.03052864191713, 0.0, 1182)
-    femmesh.addNode(50.816835286925425, 12.362097020511094, 0.0, 1183)
-    femmesh.addNode(70.81683528692542, 12.362097020511094, 0.0, 1184)
-    femmesh.addNode(46.624291640796464, 28.16955337438212, 0.0, 1185)
-    femmesh.addNode(87.77673340715572, 20.186975795764308, 0.0, 1186)
-    femmesh.addNode(107.77673340715572, 20.186975795764308, 0.0, 1187)
-    femmesh.addNode(78.59356869408114, 32.5490728162754, 0.0, 1188)
-    femmesh.addNode(130.0, 13.277985851019546, 0.0, 1189)
-    femmesh.addNode(150.0, 13.277985851019546, 0.0, 1190)
-    femmesh.addNode(117.77673340715572, 33.464961646783856, 0.0, 1191)
-    femmesh.addNode(167.09529155309212, 18.799019741174845, 0.0, 1192)
-    femmesh.addNode(187.0952915530921, 18.799019741174845, 0.0, 1193)
-    femmesh.addNode(157.09529155309212, 32.07700559219439, 0.0, 1194)
-    femmesh.addNode(209.50932402623863, 17.083270527115598, 0.0, 1195)
-    femmesh.addNode(229.50932402623866, 17.083270527115598, 0.0, 1196)
-    femmesh.addNode(196.60461557933075, 35.88229026829045, 0.0, 1197)
-    femmesh.addNode(251.32544387959095, 19.089921902481993, 0.0, 1198)
-    femmesh.addNode(271.3254438795909, 19.089921902481993, 0.0, 1199)
-    femmesh.addNode(240.8347679058296, 36.17319242959759, 0.0, 1200)
-    femmesh.addNode(296.09020989917383, 16.776275223684923, 0.0, 1201)
-    femmesh.addNode(316.09020989917383, 16.776275223684923, 0.0, 1202)
-    femmesh.addNode(287.41565377876475, 35.86619712616692, 0.0, 1203)
-    femmesh.addNode(330.2946975823405, 10.565285776754711, 0.0, 1204)
-    femmesh.addNode(350.2946975823405, 10.565285776754711, 0.0, 1205)
-    femmesh.addNode(326.38490748151435, 27.341561000439633, 0.0, 1206)
-    femmesh.addNode(367.8989519952454, 17.334604070713173, 0.0, 1207)
-    femmesh.addNode(387.8989519952454, 17.334604070713173, 0.0, 1208)
-    femmesh.addNode(358.1936495775859, 27.899889847467882, 0.0, 1209)
-    femmesh.addNode(409.4343622036637, 17.70566792660763, 0.0, 1210)
-    femmesh.addNode(429.4343622036637, 17.70566792660763, 0.0, 1211)
-    femmesh.addNode(397.3333141989091, 35.0402719973208, 0.0, 1212)
-    femmesh.addNode(449.2436332963307, 19.537705231325344, 0.0, 1213)
-    femmesh.addNode(469.2436332963307, 19.537705231325344, 0.0, 1214)
-    femmesh.addNode(438.6779954999944, 37.24337315793298, 0.0, 1215)
-    femmesh.addNode(488.06420777690835, 17.45829821546846, 0.0, 1216)
-    femmesh.addNode(508.06420777690835, 17.45829821546846, 0.0, 1217)
-    femmesh.addNode(477.30784107323905, 36.99600344679381, 0.0, 1218)
-    femmesh.addNode(525.2350195485586, 16.747583798154604, 0.0, 1219)
-    femmesh.addNode(545.2350195485586, 16.747583798154604, 0.0, 1220)
-    femmesh.addNode(513.299227325467, 34.20588201362307, 0.0, 1221)
-    femmesh.addNode(573.6842298398581, 15.063646052498564, 0.0, 1222)
-    femmesh.addNode(593.6842298398581, 15.063646052498564, 0.0, 1223)
-    femmesh.addNode(560.1152156347035, 22.40048213431758, 0.0, 1224)
-    femmesh.addNode(545.3502351832622, 39.148065932472186, 0.0, 1225)
-    femmesh.addNode(573.7994454745617, 37.46412818681615, 0.0, 1226)
-    femmesh.addNode(611.4599388305041, 16.696810313964964, 0.0, 1227)
-    femmesh.addNode(631.4599388305041, 16.696810313964964, 0.0, 1228)
-    femmesh.addNode(605.1441686703622, 31.76045636646353, 0.0, 1229)
-    femmesh.addNode(649.993594809604, 17.29998039555096, 0.0, 1230)
-    femmesh.addNode(669.9935948096039, 17.29998039555096, 0.0, 1231)
-    femmesh.addNode(641.4535336401082, 33.99679070951592, 0.0, 1232)
-    femmesh.addNode(690.2503984235148, 17.379268527437745, 0.0, 1233)
-    femmesh.addNode(710.2503984235148, 17.379268527437745, 0.0, 1234)
-    femmesh.addNode(680.2439932331188, 34.679248922988705, 0.0, 1235)
-    femmesh.addNode(730.0048758008307, 17.946834451591535, 0.0, 1236)
-    femmesh.addNode(750.0048758008307, 17.946834451591535, 0.0, 1237)
-    femmesh.addNode(720.2552742243456, 35.32610297902928, 0.0, 1238)
-    femmesh.addNode(769.9999999999993, 24.000000000000075, 0.0, 1239)
-    femmesh.addNode(789.9999999999993, 24.000000000000075, 0.0, 1240)
-    femmesh.addNode(760.0048758008302, 41.94683445159161, 0.0, 1241)
-    femmesh.addNode(809.868940283116, 18.479180287401107, 0.0, 1242)
-    femmesh.addNode(829.868940283116, 18.479180287401107, 0.0, 1243)
-    femmesh.addNode(799.8689402831153, 42.47918028740118, 0.0, 1244)
-    femmesh.addNode(847.4827631428889, 17.529415904539345, 0.0, 1245)
-    femmesh.addNode(867.482763142889, 17.529415904539345, 0.0, 1246)
-    femmesh.addNode(837.351703426005, 36.008596191940455, 0.0, 1247)
-    femmesh.addNode(899.805636322294, 16.574314446548794, 0.0, 1248)
-    femmesh.addNode(919.805636322294, 16.574314446548794, 0.0, 1249)
-    femmesh.addNode(883.9552238805966, 25.208955223880714, 0.0, 1250)
-    femmesh.addNode(871.4379870234854, 42.738371128420056, 0.0, 1251)
-    femmesh.addNode(903.7608602028906, 41.783269670429505, 0.0, 1252)
-    femmesh.addNode(939.805636322294, 16.574314446548794, 0.0, 1253)
-    femmesh.addNode(943.0973029889608, 33.282647779882055, 0.0, 1254)
-    femmesh.addNode(70.81683528692542, 187.6379029794889, 0.0, 1255)
-    femmesh.addNode(50.816835286925425, 187.6379029794889, 0.0, 1256)
-    femmesh.addNode(46.624291640796486, 171.8304466256178, 0.0, 1257)
-    femmesh.addNode(107.77673340715572, 179.81302420423577, 0.0, 1258)
-    femmesh.addNode(87.77673340715572, 179.81302420423577, 0.0, 1259)
-    femmesh.addNode(78.59356869408116, 167.45092718372464, 0.0, 1260)
-    femmesh.addNode(150.0, 186.7220141489804, 0.0, 1261)
-    femmesh.addNode(130.0, 186.7220141489804, 0.0, 1262)
-    femmesh.addNode(117.77673340715572, 166.53503835321615, 0.0, 1263)
-    femmesh.addNode(187.02622841886858, 182.36110435876293, 0.0, 1264)
-    femmesh.addNode(167.02622841886858, 182.36110435876293, 0.0, 1265)
-    femmesh.addNode(157.02622841886858, 169.08311850774334, 0.0, 1266)
-    femmesh.addNode(229.46390385709427, 184.42776461812548, 0.0, 1267)
-    femmesh.addNode(209.46390385709424, 184.42776461812548, 0.0, 1268)
-    femmesh.addNode(196.49013227596285, 166.7888689768884, 0.0, 1269)
-    femmesh.addNode(270.0, 186.18261369443024, 0.0, 1270)
-    femmesh.addNode(250.0, 186.18261369443024, 0.0, 1271)
-    femmesh.addNode(239.46390385709427, 170.61037831255572, 0.0, 1272)
-    femmesh.addNode(308.73696139531035, 186.40647006947822, 0.0, 1273)
-    femmesh.addNode(288.73696139531035, 186.40647006947822, 0.0, 1274)
-    femmesh.addNode(278.73696139531035, 172.5890837639085, 0.0, 1275)
-    femmesh.addNode(344.9845589539976, 185.69411278917084, 0.0, 1276)
-    femmesh.addNode(324.98455895399763, 185.69411278917084, 0.0, 1277)
-    femmesh.addNode(313.721520349308, 172.10058285864906, 0.0, 1278)
-    femmesh.addNode(393.19480705218893, 185.49333556909357, 0.0, 1279)
-    femmesh.addNode(373.19480705218893, 185.49333556909357, 0.0, 1280)
-    femmesh.addNode(358.6412880937022, 177.1525886393647, 0.0, 1281)
-    femmesh.addNode(371.83609514589125, 162.64592420845827, 0.0, 1282)
-    femmesh.addNode(343.62584704769984, 162.84670142853554, 0.0, 1283)
-    femmesh.addNode(430.20176680346, 182.67339948497056, 0.0, 1284)
-    femmesh.addNode(410.2017668034599, 182.67339948497056, 0.0, 1285)
-    femmesh.addNode(403.39657385564897, 168.16673505406413, 0.0, 1286)
-    femmesh.addNode(469.1397009477323, 180.67483538127328, 0.0, 1287)
-    femmesh.addNode(449.1397009477323, 180.67483538127328, 0.0, 1288)
-    femmesh.addNode(439.3414677511923, 163.34823486624384, 0.0, 1289)
-    femmesh.addNode(506.84574686698966, 183.19490017697308, 0.0, 1290)
-    femmesh.addNode(486.84574686698966, 183.19490017697308, 0.0, 1291)
-    femmesh.addNode(475.98544781472197, 163.86973555824636, 0.0, 1292)
-    femmesh.addNode(544.4187557868444, 184.33126912467384, 0.0, 1293)
-    femmesh.addNode(524.4187557868444, 184.33126912467384, 0.0, 1294)
-    femmesh.addNode(511.26450265383403, 167.52616930164692, 0.0, 1295)
-    femmesh.addNode(595.2843261262066, 184.70641940417613, 0.0, 1296)
-    femmesh.addNode(575.2843261262066, 184.70641940417613, 0.0, 1297)
-    femmesh.addNode(559.8857501030968, 171.24526051368883, 0.0, 1298)
-    femmesh.addNode(544.3045058899411, 155.57652963836267, 0.0, 1299)
-    femmesh.addNode(575.1700762293033, 155.95167991786496, 0.0, 1300)
-    femmesh.addNode(631.5358805279362, 183.2868365071919, 0.0, 1301)
-    femmesh.addNode(611.5358805279362, 183.2868365071919, 0.0, 1302)
-    femmesh.addNode(606.8202066541428, 167.99325591136804, 0.0, 1303)
-    femmesh.addNode(670.3636922166488, 182.77497942313576, 0.0, 1304)
-    femmesh.addNode(650.3636922166489, 182.77497942313576, 0.0, 1305)
-    femmesh.addNode(641.8995727445852, 166.06181593032767, 0.0, 1306)
-    femmesh.addNode(710.5773937340373, 182.6889292473358, 0.0, 1307)
-    femmesh.addNode(690.5773937340373, 182.6889292473358, 0.0, 1308)
-    femmesh.addNode(680.9410859506863, 165.46390867047157, 0.0, 1309)
-    femmesh.addNode(749.8671798774974, 181.71120136611262, 0.0, 1310)
-    femmesh.addNode(729.8671798774974, 181.71120136611262, 0.0, 1311)
-    femmesh.addNode(720.4445736115349, 164.40013061344843, 0.0, 1312)
-    femmesh.addNode(789.9999999999993, 175.99999999999994, 0.0, 1313)
-    femmesh.addNode(769.9999999999993, 175.99999999999994, 0.0, 1314)
-    femmesh.addNode(759.8671798774967, 157.71120136611256, 0.0, 1315)
-    femmesh.addNode(830.030648285215, 182.14046116468668, 0.0, 1316)
-    femmesh.addNode(810.030648285215, 182.14046116468668, 0.0, 1317)
-    femmesh.addNode(800.0306482852144, 158.1404611646866, 0.0, 1318)
-    femmesh.addNode(869.1049334002286, 182.56614105423233, 0.0, 1319)
-    femmesh.addNode(849.1049334002284, 182.56614105423233, 0.0, 1320)
-    femmesh.addNode(839.1355816854436, 164.70660221891902, 0.0, 1321)
-    femmesh.addNode(920.2628094691165, 183.52675153139353, 0.0, 1322)
-    femmesh.addNode(900.2628094691165, 183.52675153139353, 0.0, 1323)
-    femmesh.addNode(886.0416666666664, 175.2083333333333, 0.0, 1324)
-    femmesh.addNode(875.146600066895, 157.77447438756562, 0.0, 1325)
-    femmesh.addNode(906.3044761357829, 158.7350848647268, 0.0, 1326)
-    femmesh.addNode(940.2628094691165, 183.52675153139353, 0.0, 1327)
-    femmesh.addNode(943.5544761357833, 166.81841819806021, 0.0, 1328)
-    femmesh.addNode(640.3872860658798, 99.25928962657308, 0.0, 1329)
-    femmesh.addNode(630.2462477749264, 113.99609590590383, 0.0, 1330)
-    femmesh.addNode(651.5792586728454, 115.02967325624027, 0.0, 1331)
-    femmesh.addNode(651.98591735139, 83.2050889186357, 0.0, 1332)
-    femmesh.addNode(630.6529064534709, 82.17151156829925, 0.0, 1333)
-    femmesh.addNode(680.1268151485658, 100.14643348845479, 0.0, 1334)
-    femmesh.addNode(671.0660255169598, 115.91643812702824, 0.0, 1335)
-    femmesh.addNode(689.4725437017269, 115.77000463857351, 0.0, 1336)
-    femmesh.addNode(689.2660129551699, 84.2689311367418, 0.0, 1337)
-    femmesh.addNode(670.859494770403, 84.41536462519653, 0.0, 1338)
-    femmesh.addNode(660.9249872260064, 130.653244406359, 0.0, 1339)
-    femmesh.addNode(661.1251151579941, 67.32758656692269, 0.0, 1340)
-    femmesh.addNode(320.1670753227893, 103.22242074340406, 0.0, 1341)
-    femmesh.addNode(332.1654792126005, 85.6175458390949, 0.0, 1342)
-    femmesh.addNode(312.3325545353898, 88.83996658249896, 0.0, 1343)
-    femmesh.addNode(317.80501665476766, 118.33260358257394, 0.0, 1344)
-    femmesh.addNode(337.63794133197837, 115.11018283916988, 0.0, 1345)
-    femmesh.addNode(359.26666666666665, 100.00000000000006, 0.0, 1346)
-    femmesh.addNode(370.42878528664914, 85.2470516991188, 0.0, 1347)
-    femmesh.addNode(351.1621186199825, 85.24705169911874, 0.0, 1348)
-    femmesh.addNode(350.53537529122605, 111.98069223993346, 0.0, 1349)
-    femmesh.addNode(369.8020419578927, 111.98069223993352, 0.0, 1350)
-    femmesh.addNode(343.327597832583, 70.86459753821364, 0.0, 1351)
-    femmesh.addNode(348.1733166232044, 127.09087507910334, 0.0, 1352)
-    femmesh.addNode(189.7929191153213, 117.39786965555976, 0.0, 1353)
-    femmesh.addNode(211.9796177581935, 118.68206771842071, 0.0, 1354)
-    femmesh.addNode(202.1866986428722, 101.28419806286094, 0.0, 1355)
-    femmesh.addNode(172.16845759453673, 114.15167229017635, 0.0, 1356)
-    femmesh.addNode(181.9613767098581, 131.5495419457361, 0.0, 1357)
-    femmesh.addNode(211.73931867754428, 85.64087876701217, 0.0, 1358)
-    femmesh.addNode(189.55262003467203, 84.35668070415122, 0.0, 1359)
-    femmesh.addNode(157.23667386720228, 100.05778066018314, 0.0, 1360)
-    femmesh.addNode(149.40513146173907, 114.2094529503595, 0.0, 1361)
-    femmesh.addNode(171.75581912376518, 86.31057299128912, 0.0, 1362)
-    femmesh.addNode(148.9924929909675, 86.36835365147229, 0.0, 1363)
-    femmesh.addNode(181.30843915843727, 70.66725369544034, 0.0, 1364)
-    femmesh.addNode(436.99554197151065, 101.19587371725501, 0.0, 1365)
-    femmesh.addNode(448.13200873868044, 85.44105442701516, 0.0, 1366)
-    femmesh.addNode(427.45747078769205, 85.67306387915653, 0.0, 1367)
-    femmesh.addNode(427.04394017282357, 116.57968891422253, 0.0, 1368)
-    femmesh.addNode(447.7184781238119, 116.34767946208115, 0.0, 1369)
-    femmesh.addNode(479.1837381840947, 99.65111161352833, 0.0, 1370)
-    femmesh.addNode(468.2362956950314, 114.37356284820498, 0.0, 1371)
-    femmesh.addNode(489.7499539566271, 113.06081019661968, 0.0, 1372)
-    femmesh.addNode(488.65911538325133, 83.01591669607583, 0.0, 1373)
-    femmesh.addNode(467.1454571216557, 84.32866934766113, 0.0, 1374)
-    femmesh.addNode(457.6073859378371, 68.80585950956268, 0.0, 1375)
-    femmesh.addNode(458.2846938963443, 129.75737804517252, 0.0, 1376)
-    femmesh.addNode(779.9999999999986, 74.00000000000018, 0.0, 1377)
-    femmesh.addNode(793.9699816279251, 85.48676144598267, 0.0, 1378)
-    femmesh.addNode(793.9699816279251, 59.48676144598264, 0.0, 1379)
-    femmesh.addNode(765.6338146618741, 59.08167445857572, 0.0, 1380)
-    femmesh.addNode(765.6338146618741, 85.08167445857575, 0.0, 1381)
-    femmesh.addNode(779.9999999999986, 126.00000000000003, 0.0, 1382)
-    femmesh.addNode(765.7146938295623, 114.67502982517564, 0.0, 1383)
-    femmesh.addNode(765.7146938295623, 140.67502982517544, 0.0, 1384)
-    femmesh.addNode(794.1686638663358, 140.966346034191, 0.0, 1385)
-    femmesh.addNode(794.1686638663358, 114.96634603419116, 0.0, 1386)
-    femmesh.addNode(801.0017264399102, 100.43247493396424, 0.0, 1387)
-    femmesh.addNode(814.9717080678365, 85.91923637994671, 0.0, 1388)
-    femmesh.addNode(815.1703903062473, 115.3988209681552, 0.0, 1389)
-    femmesh.addNode(758.7062892703185, 99.66394775976497, 0.0, 1390)
-    femmesh.addNode(744.4209830998822, 114.33897758494038, 0.0, 1391)
-    femmesh.addNode(744.3401039321941, 84.74562221834051, 0.0, 1392)
-    femmesh.addNode(892.3113783158769, 127.21445449447356, 0.0, 1393)
-    femmesh.addNode(908.3617952047824, 131.74580830980688, 0.0, 1394)
-    femmesh.addNode(908.5898401873266, 108.54359613761387, 0.0, 1395)
-    femmesh.addNode(880.0708470191146, 117.31705966390588, 0.0, 1396)
-    femmesh.addNode(879.8428020365704, 140.51927183609888, 0.0, 1397)
-    femmesh.addNode(874.0481321760672, 102.52142405395794, 0.0, 1398)
-    femmesh.addNode(861.5795558967607, 115.82624139558328, 0.0, 1399)
-    femmesh.addNode(880.5916021964734, 87.99865847457318, 0.0, 1400)
-    femmesh.addNode(862.1003110741194, 86.50784020625059, 0.0, 1401)
-    femmesh.addNode(918.9864776833595, 92.5105519628836, 0.0, 1402)
-    femmesh.addNode(902.9360607944541, 87.97919814755026, 0.0, 1403)
-    femmesh.addNode(890.9882396925063, 71.96561429984291, 0.0, 1404)
-    femmesh.addNode(560.0525015394549, 122.96594289490554, 0.0, 1405)
-    femmesh.addNode(573.9359831933748, 127.14275412625435, 0.0, 1406)
-    femmesh.addNode(574.2169845266362, 107.61817599378222, 0.0, 1407)
-    femmesh.addNode(546.1602019114109, 107.5638722459387, 0.0, 1408)
-    femmesh.addNode(545.8792005781495, 127.08845037841083, 0.0, 1409)
-    femmesh.addNode(584.3828128474656, 93.38319426734357, 0.0, 1410)
-    femmesh.addNode(570.4993311935457, 89.20638303599476, 0.0, 1411)
-    femmesh.addNode(550.0367949290413, 89.09850553769154, 0.0, 1412)
-    femmesh.addNode(535.863493967736, 93.22101302119682, 0.0, 1413)
-    femmesh.addNode(560.2026232498707, 74.86352381125289, 0.0, 1414)
-    femmesh.addNode(112.3396997083363, 100.05778066018306, 0.0, 1415)
-    femmesh.addNode(97.24499786898711, 113.35208498186391, 0.0, 1416)
-    femmesh.addNode(119.37864589505541, 113.40986564204717, 0.0, 1417)
-    femmesh.addNode(119.37864589505556, 86.71411851508047, 0.0, 1418)
-    femmesh.addNode(97.24499786898726, 86.65633785489722, 0.0, 1419)
-    femmesh.addNode(77.8738591744673, 108.94733486439776, 0.0, 1420)
-    femmesh.addNode(84.91280536118643, 122.29941984626187, 0.0, 1421)
-    femmesh.addNode(84.91280536118657, 77.7090029904993, 0.0, 1422)
-    femmesh.addNode(77.8738591744673, 91.0526651356019, 0.0, 1423)
-    femmesh.addNode(65.54166666666661, 99.99999999999986, 0.0, 1424)
-    femmesh.addNode(280.3859932918714, 111.13149458881747, 0.0, 1425)
-    femmesh.addNode(281.9085946010515, 94.61353547257698, 0.0, 1426)
-    femmesh.addNode(261.9604372473442, 99.30018857458634, 0.0, 1427)
-    femmesh.addNode(269.1284884141726, 129.01630415422076, 0.0, 1428)
-    femmesh.addNode(289.0766457678798, 124.3296510522114, 0.0, 1429)
-    femmesh.addNode(242.40561661195426, 109.19327190827437, 0.0, 1430)
-    femmesh.addNode(243.92821792113438, 92.67531279203388, 0.0, 1431)
-    femmesh.addNode(232.150974251248, 121.90919806286095, 0.0, 1432)
-    femmesh.addNode(250.1831935774578, 128.53407384541342, 0.0, 1433)
-    femmesh.addNode(258.8738460534663, 141.73223030880735, 0.0, 1434)
-    femmesh.addNode(829.9809678565141, 84.95462694251155, 0.0, 1435)
-    femmesh.addNode(838.7801469667675, 100.94777782678182, 0.0, 1436)
-    femmesh.addNode(846.7576619434599, 85.03745490136508, 0.0, 1437)
-    femmesh.addNode(822.9492230445289, 70.00891345452997, 0.0, 1438)
-    femmesh.addNode(828.8481816997192, 53.001332295948515, 0.0, 1439)
-    femmesh.addNode(846.4620045594922, 52.05156791308676, 0.0, 1440)
-    femmesh.addNode(813.8389219110418, 53.96594173338367, 0.0, 1441)
-    femmesh.addNode(853.3011319638662, 70.51468932198031, 0.0, 1442)
-    femmesh.addNode(861.8046536901519, 53.52195321797225, 0.0, 1443)
-    femmesh.addNode(408.436138314453, 85.03911414877498, 0.0, 1444)
-    femmesh.addNode(389.54230297085854, 84.32517256407685, 0.0, 1445)
-    femmesh.addNode(397.4271686769278, 100.71394158469825, 0.0, 1446)
-    femmesh.addNode(419.5726050816228, 69.28429485853513, 0.0, 1447)
-    femmesh.addNode(409.7099985078556, 52.030840490684426, 0.0, 1448)
-    femmesh.addNode(388.17458829943723, 51.659776634789964, 0.0, 1449)
-    femmesh.addNode(428.73133098109463, 52.66479022106598, 0.0, 1450)
-    femmesh.addNode(369.0610706152279, 52.581655769831926, 0.0, 1451)
-    femmesh.addNode(381.4377549241743, 69.57222426319555, 0.0, 1452)
-    femmesh.addNode(728.7062892703188, 115.66394775976497, 0.0, 1453)
-    femmesh.addNode(717.9729559369855, 99.66394775976488, 0.0, 1454)
-    femmesh.addNode(709.266666666666, 116.00000000000014, 0.0, 1455)
-    femmesh.addNode(735.7146938295626, 130.67502982517564, 0.0, 1456)
-    femmesh.addNode(729.8671798774972, 147.71120136611273, 0.0, 1457)
-    femmesh.addNode(710.5773937340371, 148.68892924733592, 0.0, 1458)
-    femmesh.addNode(745.5818737070604, 146.38623119128818, 0.0, 1459)
-    femmesh.addNode(700.2058770350601, 131.7700046385736, 0.0, 1460)
-    femmesh.addNode(690.7832707690978, 148.4589338859093, 0.0, 1461)
-    femmesh.addNode(729.4627840390565, 51.74442453311322, 0.0, 1462)
-    femmesh.addNode(709.7083066617405, 51.17685860895943, 0.0, 1463)
-    femmesh.addNode(735.0917229001004, 68.87926454009732, 0.0, 1464)
-    femmesh.addNode(745.6386904627057, 53.02850891016718, 0.0, 1465)
-    femmesh.addNode(728.1641975085448, 83.46153784128654, 0.0, 1466)
-    femmesh.addNode(708.724574904892, 83.79759008152172, 0.0, 1467)
-    femmesh.addNode(699.4572545267292, 68.06652121826345, 0.0, 1468)
-    femmesh.addNode(690.2497447120184, 51.64819966417951, 0.0, 1469)
-    femmesh.addNode(375.7722684574851, 144.7932783604973, 0.0, 1470)
-    femmesh.addNode(390.3257874159719, 153.1340252902262, 0.0, 1471)
-    femmesh.addNode(377.66635565500894, 129.62138196106605, 0.0, 1472)
-    femmesh.addNode(359.17666338492825, 139.13328087929818, 0.0, 1473)
-    femmesh.addNode(407.33274716724287, 150.31408920610318, 0.0, 1474)
-    femmesh.addNode(429.0852049660224, 148.53914681449493, 0.0, 1475)
-    femmesh.addNode(416.0144185263453, 133.50643705065693, 0.0, 1476)
-    femmesh.addNode(405.291482374044, 118.3546313058308, 0.0, 1477)
-    femmesh.addNode(386.39764703044955, 117.64068972113266, 0.0, 1478)
-    femmesh.addNode(829.8415928917732, 148.39925523699117, 0.0, 1479)
-    femmesh.addNode(848.9158780067867, 148.82493512653681, 0.0, 1480)
-    femmesh.addNode(823.9796084728946, 131.22514010649553, 0.0, 1481)
-    femmesh.addNode(814.1993121515516, 147.10680719887773, 0.0, 1482)
-    femmesh.addNode(830.812671046469, 116.69126900626863, 0.0, 1483)
-    femmesh.addNode(847.5893651334146, 116.77409696512215, 0.0, 1484)
-    femmesh.addNode(853.6120799764622, 131.56973257507008, 0.0, 1485)
-    femmesh.addNode(862.9060687701326, 147.87707955699796, 0.0, 1486)
-    femmesh.addNode(228.9552855049365, 83.94722096532774, 0.0, 1487)
-    femmesh.addNode(248.51010614032646, 74.05413763163973, 0.0, 1488)
-    femmesh.addNode(216.32120689673638, 67.01970360661801, 0.0, 1489)
-    femmesh.addNode(248.09403074165527, 51.7529448049488, 0.0, 1490)
-    femmesh.addNode(263.06696315785314, 60.48103663165493, 0.0, 1491)
-    femmesh.addNode(226.27791088830298, 49.746293429582394, 0.0, 1492)
-    femmesh.addNode(209.06194406091072, 51.43995123126682, 0.0, 1493)
-    femmesh.addNode(584.8857501030966, 140.2452605136888, 0.0, 1494)
-    femmesh.addNode(600.2843261262065, 153.7064194041761, 0.0, 1495)
-    femmesh.addNode(599.050233090278, 124.89749361256548, 0.0, 1496)
-    femmesh.addNode(614.5271375839803, 118.11285613811829, 0.0, 1497)
-    femmesh.addNode(625.7191101909459, 133.88323976778548, 0.0, 1498)
-    femmesh.addNode(603.5773706742585, 105.01034975068383, 0.0, 1499)
-    femmesh.addNode(616.5358805279361, 152.28683650719188, 0.0, 1500)
-    femmesh.addNode(632.2549907188823, 148.17007627497742, 0.0, 1501)
-    femmesh.addNode(534.8857501030968, 140.24526051368883, 0.0, 1502)
-    femmesh.addNode(519.4187557868444, 153.3312691246738, 0.0, 1503)
-    femmesh.addNode(520.9934504750528, 124.84318986472198, 0.0, 1504)
-    femmesh.addNode(505.3486982228452, 118.16917948097151, 0.0, 1505)
-    femmesh.addNode(494.4012557337819, 132.89163071564815, 0.0, 1506)
-    femmesh.addNode(516.342148697898, 105.01236934569351, 0.0, 1507)
-    femmesh.addNode(501.84574686698966, 152.19490017697308, 0.0, 1508)
-    femmesh.addNode(486.24700260077157, 147.08653089262123, 0.0, 1509)
-    femmesh.addNode(614.4415848064323, 79.9397772463732, 0.0, 1510)
-    femmesh.addNode(626.0402160919424, 63.885576538435814, 0.0, 1511)
-    femmesh.addNode(595.2470269796395, 68.31262176303294, 0.0, 1512)
-    femmesh.addNode(599.859717341168, 86.59855679289637, 0.0, 1513)
-    femmesh.addNode(616.374386052956, 47.52373142221984, 0.0, 1514)
-    femmesh.addNode(598.59867706231, 45.89056716075344, 0.0, 1515)
-    femmesh.addNode(632.5857076999946, 49.755465744145894, 0.0, 1516)
-    femmesh.addNode(584.0168095970457, 52.54934670727662, 0.0, 1517)
-    femmesh.addNode(504.4226531505175, 80.643365416817, 0.0, 1518)
-    femmesh.addNode(492.3843720880784, 65.32092315094982, 0.0, 1519)
-    femmesh.addNode(520.2187417155284, 86.54700263744635, 0.0, 1520)
-    femmesh.addNode(523.9439984203555, 68.85200909232033, 0.0, 1521)
-    femmesh.addNode(519.3089744762309, 48.221769734000105, 0.0, 1522)
-    femmesh.addNode(502.1381627045806, 48.93248415131396, 0.0, 1523)
-    femmesh.addNode(535.1050630412418, 54.12540695462944, 0.0, 1524)
-    femmesh.addNode(486.37462493731454, 51.30503543057279, 0.0, 1525)
-    femmesh.addNode(296.2372932446439, 85.12491999433664, 0.0, 1526)
-    femmesh.addNode(277.8117372001168, 73.2936139801055, 0.0, 1527)
-    femmesh.addNode(308.2356971344551, 67.52004509002748, 0.0, 1528)
-    femmesh.addNode(277.39566180144556, 50.99242115341457, 0.0, 1529)
-    femmesh.addNode(302.1604278210284, 48.6787744746175, 0.0, 1530)
-    femmesh.addNode(318.2556891117743, 52.39382106277982, 0.0, 1531)
-    femmesh.addNode(114.99895562937786, 150.14635753756903, 0.0, 1532)
-    femmesh.addNode(137.22222222222211, 157.05534748231366, 0.0, 1533)
-    femmesh.addNode(119.36419425007524, 133.6854183151973, 0.0, 1534)
-    femmesh.addNode(99.91870543500883, 143.16510918609976, 0.0, 1535)
-    femmesh.addNode(154.2484506410907, 152.69443769209622, 0.0, 1536)
-    femmesh.addNode(169.19468601340537, 146.51277664893928, 0.0, 1537)
-    femmesh.addNode(149.3906798167589, 134.48500562350964, 0.0, 1538)
-    femmesh.addNode(134.45889608942443, 120.39111399351644, 0.0, 1539)
-    femmesh.addNode(154.31751377531435, 48.46568640784149, 0.0, 1540)
-    femmesh.addNode(137.22222222222223, 42.94465251768619, 0.0, 1541)
-    femmesh.addNode(148.97804134598744, 65.97723965795576, 0.0, 1542)
-    femmesh.addNode(168.85111067685733, 55.10959273246397, 0.0, 1543)
-    femmesh.addNode(114.99895562937796, 49.85364246243095, 0.0, 1544)
-    femmesh.addNode(99.91870543500897, 56.84331365066163, 0.0, 1545)
-    femmesh.addNode(119.3641942500755, 66.32300452156396, 0.0, 1546)
-    femmesh.addNode(134.45889608942454, 79.7244473268498, 0.0, 1547)
-    femmesh.addNode(952.7787121085994, 79.35297964697514, 0.0, 1548)
-    femmesh.addNode(929.6215108746082, 66.17341342379954, 0.0, 1549)
-    femmesh.addNode(936.4898995244781, 85.12572019599558, 0.0, 1550)
-    femmesh.addNode(960.1692374844179, 61.412599033451194, 0.0, 1551)
-    femmesh.addNode(932.7607980516589, 46.77465088393835, 0.0, 1552)
-    femmesh.addNode(956.2468283960313, 46.90866977072281, 0.0, 1553)
-    femmesh.addNode(916.4719854675376, 52.54739143295879, 0.0, 1554)
-    femmesh.addNode(917.2916666666663, 146.45833333333331, 0.0, 1555)
-    femmesh.addNode(931.5128094691165, 154.77675153139353, 0.0, 1556)
-    femmesh.addNode(933.570128538116, 127.78747497647362, 0.0, 1557)
-    femmesh.addNode(951.0735503792346, 120.4026432095856, 0.0, 1558)
-    femmesh.addNode(942.1436789173506, 105.6901181860592, 0.0, 1559)
-    femmesh.addNode(958.1230434091802, 139.98886197525044, 0.0, 1560)
-    femmesh.addNode(954.5416666666667, 154.5416666666667, 0.0, 1561)
-    femmesh.addNode(75.42132932337115, 154.1386247991553, 0.0, 1562)
-    femmesh.addNode(58.46143120314086, 161.96350357440843, 0.0, 1563)
-    femmesh.addNode(80.54756674048903, 138.76035906863362, 0.0, 1564)
-    femmesh.addNode(60.41542924954874, 133.2729354593174, 0.0, 1565)
-    femmesh.addNode(43.45205227008648, 158.51814424104845, 0.0, 1566)
-    femmesh.addNode(40.00669293672654, 143.50876530799405, 0.0, 1567)
-    femmesh.addNode(45.132930353844415, 128.13049957747236, 0.0, 1568)
-    femmesh.addNode(75.4213293233711, 45.86137520084472, 0.0, 1569)
-    femmesh.addNode(58.461431203140805, 38.03649642559151, 0.0, 1570)
-    femmesh.addNode(60.41542924954869, 66.7270645406824, 0.0, 1571)
-    femmesh.addNode(80.54756674048903, 61.239640931366296, 0.0, 1572)
-    femmesh.addNode(43.45205227008642, 41.48185575895144, 0.0, 1573)
-    femmesh.addNode(40.00669293672647, 56.49123469200578, 0.0, 1574)
-    femmesh.addNode(45.1329303538444, 71.86950042252737, 0.0, 1575)
-    femmesh.addNode(304.53726769777484, 125.52022424352222, 0.0, 1576)
-    femmesh.addNode(322.0081337069639, 137.40798633928804, 0.0, 1577)
-    femmesh.addNode(293.27976282007603, 143.4050338089255, 0.0, 1578)
-    femmesh.addNode(303.1071537702959, 158.70427356959638, 0.0, 1579)
-    femmesh.addNode(319.3547513289832, 157.991916289289, 0.0, 1580)
-    femmesh.addNode(287.6465318404009, 157.51370037828556, 0.0, 1581)
-    femmesh.addNode(332.622500285976, 150.80429562834072, 0.0, 1582)
-    femmesh.addNode(186.81914753418988, 149.7589740143227, 0.0, 1583)
-    femmesh.addNode(209.2568229724156, 151.82563427368524, 0.0, 1584)
-    femmesh.addNode(219.7571947236971, 138.02286965555976, 0.0, 1585)
-    femmesh.addNode(229.42817946547007, 155.05276461812548, 0.0, 1586)
-    femmesh.addNode(670.5695692517094, 148.54498406170924, 0.0, 1587)
-    femmesh.addNode(651.082802407595, 147.65821919092127, 0.0, 1588)
-    femmesh.addNode(669.9929410981075, 51.568911532292724, 0.0, 1589)
-    femmesh.addNode(651.1193636790945, 50.358635825731895, 0.0, 1590)
-    femmesh.addNode(448.0231391102947, 146.54058271079762, 0.0, 1591)
-    femmesh.addNode(468.5409566815142, 144.56646609692143, 0.0, 1592)
-    femmesh.addNode(448.54060207376165, 54.49682752578369, 0.0, 1593)
-    femmesh.addNode(467.55405045673683, 53.384442446429674, 0.0, 1594)
-    femmesh.addNode(359.5703412624229, 41.668881924148664, 0.0, 1595)
-    femmesh.addNode(352.83350788716, 59.581329552554244, 0.0, 1596)
-    femmesh.addNode(341.96608684951804, 34.89956363019021, 0.0, 1597)
-    femmesh.addNode(327.7615991663513, 41.110553077120414, 0.0, 1598)
-    femmesh.addNode(333.836868479778, 59.9518236925304, 0.0, 1599)
-    femmesh.addNode(878.2771144278595, 61.20149253731363, 0.0, 1600)
-    femmesh.addNode(900.62157302584, 61.18203221029071, 0.0, 1601)
-    femmesh.addNode(186.64791158776416, 53.15570044532606, 0.0, 1602)
-    femmesh.addNode(549.9852591273867, 59.77830529079242, 0.0, 1603)
-    femmesh.addNode(570.4477953918911, 59.88618278909564, 0.0, 1604)
-    femmesh.addNode(47.81514345128144, 108.94733486439779, 0.0, 1605)
-    femmesh.addNode(47.81514345128144, 91.05266513560191, 0.0, 1606)
-    femmesh.addNode(346.27922942568057, 142.2627714785346, 0.0, 1607)
-    femmesh.addNode(249.96427560837577, 156.80761369443024, 0.0, 1608)
-    femmesh.addNode(268.9095704450905, 157.2898440032376, 0.0, 1609)
-    femmesh.addNode(661.7202969637987, 99.70713302309053, 100.0, 1610)
-    femmesh.addNode(339.99999999999994, 99.99999999999999, 100.0, 1611)
-    femmesh.addNode(182.91382022781812, 96.56700592730661, 100.0, 1612)
-    femmesh.addNode(457.6700799224989, 100.96386426511364, 100.0, 1613)
-    femmesh.addNode(779.9999999999985, 109.06836641591485, 100.0, 1614)
-    femmesh.addNode(892.5394232984211, 104.01224232228054, 100.0, 1615)
-    femmesh.addNode(560.3335028727162, 103.44136476243334, 100.0, 1616)
-    femmesh.addNode(91.40734220276585, 99.99999999999983, 100.0, 1617)
-    femmesh.addNode(259.56216406183574, 84.18185230917317, 100.0, 1618)
-    femmesh.addNode(837.9584828332065, 69.04430401709482, 100.0, 1619)
-    femmesh.addNode(394.72374214567594, 66.33812465069967, 100.0, 1620)
-    femmesh.addNode(719.9999999999992, 67.9999999999998, 100.0, 1621)
-    femmesh.addNode(718.9158164764513, 132.40481983695673, 100.0, 1622)
-    femmesh.addNode(398.8801611655977, 132.41257646213404, 100.0, 1623)
-    femmesh.addNode(839.6218892131161, 132.51758814460896, 100.0, 1624)
-    femmesh.addNode(286.63904720414666, 134.9206634946519, 100.0, 1625)
-    femmesh.addNode(609.9999999999995, 137.99999999999997, 100.0, 1626)
-    femmesh.addNode(509.9999999999999, 137.99999999999994, 100.0, 1627)
-    femmesh.addNode(609.8288944449035, 61.65384221650967, 100.0, 1628)
-    femmesh.addNode(508.1479098553444, 62.94837187169099, 100.0, 1629)
-    femmesh.addNode(226.81379007465952, 139.91172595520425, 100.0, 1630)
-    femmesh.addNode(134.4444444444443, 140.6666666666666, 100.0, 1631)
-    femmesh.addNode(134.44444444444446, 59.33333333333325, 100.0, 1632)
-    femmesh.addNode(945.9103234587294, 60.400672874779104, 100.0, 1633)
-    femmesh.addNode(942.4999999999999, 142.50000000000003, 100.0, 1634)
-    femmesh.addNode(55.28919183243087, 148.651201189839, 100.0, 1635)
-    femmesh.addNode(55.289191832430774, 51.34879881016083, 100.0, 1636)
-    femmesh.addNode(308.68213961928427, 55.46120922915411, 100.0, 1637)
-    femmesh.addNode(200.1411727668416, 64.91088633634843, 100.0, 1638)
-    femmesh.addNode(339.8354717678049, 165.25134833656273, 100.0, 1639)
-    femmesh.addNode(779.9999999999992, 35.38975802195439, 100.0, 1640)
-    femmesh.addNode(779.9999999999987, 156.05920770412456, 100.0, 1641)
-    femmesh.addNode(659.987189619208, 165.40003920889816, 100.0, 1642)
-    femmesh.addNode(660.7273844332975, 34.450041153728556, 100.0, 1643)
-    femmesh.addNode(458.2794018954646, 161.34967076254662, 100.0, 1644)
-    femmesh.addNode(458.4872665926613, 39.07541046265068, 100.0, 1645)
-    femmesh.addNode(887.910447761193, 50.41791044776143, 100.0, 1646)
-    femmesh.addNode(892.0833333333328, 150.41666666666657, 100.0, 1647)
-    femmesh.addNode(559.7715002061934, 142.4905210273777, 100.0, 1648)
-    femmesh.addNode(560.2304312694068, 44.80096426863516, 100.0, 1649)
-    femmesh.addNode(180.7524894005644, 155.38416173179405, 100.0, 1650)
-    femmesh.addNode(358.4304906374207, 47.08409487962392, 100.0, 1651)
-    femmesh.addNode(30.088620235896286, 99.99999999999984, 100.0, 1652)
-    femmesh.addNode(959.6471007584693, 98.30528641917118, 100.0, 1653)
-    femmesh.addNode(95.55346681431145, 40.37395159152862, 100.0, 1654)
-    femmesh.addNode(95.55346681431142, 159.62604840847146, 100.0, 1655)
-    femmesh.addNode(259.87561950908906, 27.70118937813075, 100.0, 1656)
-    femmesh.addNode(223.2686207596742, 98.42934382064968, 100.0, 1657)
-    femmesh.addNode(174.13179034290854, 35.235880660683776, 100.0, 1658)
-    femmesh.addNode(298.2763209305566, 93.29229746314563, 100.0, 1659)
-    femmesh.addNode(137.0182110079111, 99.7562740886776, 100.0, 1660)
-    femmesh.addNode(258.56711410318303, 162.2151215886562, 100.0, 1661)
-    femmesh.addNode(819.4033350853209, 164.6698257950074, 100.0, 1662)
-    femmesh.addNode(741.1028864714357, 164.44292309741735, 100.0, 1663)
-    femmesh.addNode(417.55175503846215, 165.35124624822637, 100.0, 1664)
-    femmesh.addNode(822.0034528798217, 102.37634427058073, 100.0, 1665)
-    femmesh.addNode(416.1194490164095, 100.56437925979891, 100.0, 1666)
-    femmesh.addNode(737.4125785406386, 102.18349888312284, 100.0, 1667)
-    femmesh.addNode(817.5121951219497, 35.46341463414753, 100.0, 1668)
-    femmesh.addNode(741.0829859377147, 35.2659469558437, 100.0, 1669)
-    femmesh.addNode(421.5935578898741, 35.26488555476648, 100.0, 1670)
-    femmesh.addNode(700.2890000010648, 34.69788437018832, 100.0, 1671)
-    femmesh.addNode(619.0542751679607, 98.14203599711965, 100.0, 1672)
-    femmesh.addNode(500.69739644569034, 98.338358961943, 100.0, 1673)
-    femmesh.addNode(701.4346159976506, 100.08970831361881, 100.0, 1674)
-    femmesh.addNode(379.51557684267925, 100.76010625508871, 100.0, 1675)
-    femmesh.addNode(855.5568410537131, 101.28250485274408, 100.0, 1676)
-    femmesh.addNode(380.0549156568355, 165.42811908834068, 100.0, 1677)
-    femmesh.addNode(700.6829859919923, 165.29756161189124, 100.0, 1678)
-    femmesh.addNode(257.12544438778707, 117.63618914247827, 100.0, 1679)
-    femmesh.addNode(857.7899641159329, 164.080035711261, 100.0, 1680)
-    femmesh.addNode(854.8689655886603, 34.99397402670265, 100.0, 1681)
-    femmesh.addNode(300.5410403172853, 166.39591239934566, 100.0, 1682)
-    femmesh.addNode(530.4700390971173, 33.495167596309244, 100.0, 1683)
-    femmesh.addNode(528.8375115736886, 168.66253824934768, 100.0, 1684)
-    femmesh.addNode(622.9483952535243, 166.5486864081551, 100.0, 1685)
-    femmesh.addNode(623.0432434633564, 33.36863402170103, 100.0, 1686)
-    femmesh.addNode(386.9495581345941, 29.73742101701802, 100.0, 1687)
-    femmesh.addNode(493.6914937339793, 166.38980035394619, 100.0, 1688)
-    femmesh.addNode(496.1284155538167, 34.91659643093692, 100.0, 1689)
-    femmesh.addNode(798.6182362187024, 70.34134113190137, 100.0, 1690)
-    femmesh.addNode(759.518966782842, 70.04148523478946, 100.0, 1691)
-    femmesh.addNode(438.0432288908162, 69.36454880799998, 100.0, 1692)
-    femmesh.addNode(919.6112726445882, 33.14862889309759, 100.0, 1693)
-    femmesh.addNode(966.5833333333333, 33.41666666666652, 100.0, 1694)
-    femmesh.addNode(966.5833333333335, 166.5833333333334, 100.0, 1695)
-    femmesh.addNode(220.00000000000006, 172.8979699896531, 100.0, 1696)
-    femmesh.addNode(680.751003269672, 68.48756591926607, 100.0, 1697)
-    femmesh.addNode(140.00000000000003, 173.44402829796087, 100.0, 1698)
-    femmesh.addNode(140.0, 26.55597170203908, 100.0, 1699)
-    femmesh.addNode(752.1253315593083, 132.87593515157693, 100.0, 1700)
-    femmesh.addNode(807.9209438949463, 132.9336039369333, 100.0, 1701)
-    femmesh.addNode(438.0276874693684, 131.11018472380812, 100.0, 1702)
-    femmesh.addNode(320.03827117421827, 127.4496462054364, 100.0, 1703)
-    femmesh.addNode(920.525618938233, 167.05350306278703, 100.0, 1704)
-    femmesh.addNode(359.7207327678559, 131.88363272459375, 100.0, 1705)
-    femmesh.addNode(680.5126045452205, 131.48643888991415, 100.0, 1706)
-    femmesh.addNode(31.614912707742132, 168.3850872922578, 100.0, 1707)
-    femmesh.addNode(31.614912707742075, 31.614912707742054, 100.0, 1708)
-    femmesh.addNode(590.5439790919435, 169.40784148710657, 100.0, 1709)
-    femmesh.addNode(587.3684596797161, 30.127292104997366, 100.0, 1710)
-    femmesh.addNode(642.5208496238314, 65.96820872190258, 100.0, 1711)
-    femmesh.addNode(641.3733640773564, 129.6901286117813, 100.0, 1712)
-    femmesh.addNode(478.8138266810271, 127.75630608563995, 100.0, 1713)
-    femmesh.addNode(476.52904954347116, 67.60119180005586, 100.0, 1714)
-    femmesh.addNode(588.1004661805558, 111.78644882930274, 100.0, 1715)
-    femmesh.addNode(531.9869009501056, 111.68637972944396, 100.0, 1716)
-    femmesh.addNode(539.7400869853665, 74.75564631294958, 100.0, 1717)
-    femmesh.addNode(104.5183177918913, 127.18408557857967, 100.0, 1718)
-    femmesh.addNode(104.51831779189156, 72.79053687963322, 100.0, 1719)
-    femmesh.addNode(164.3369151890737, 71.6966554196472, 100.0, 1720)
-    femmesh.addNode(195.54774277554642, 123.64139075969334, 100.0, 1721)
-    femmesh.addNode(924.640257076232, 113.07494995294721, 100.0, 1722)
-    femmesh.addNode(913.332698290487, 71.94615397281999, 100.0, 1723)
-    femmesh.addNode(165.522384955188, 124.54927598588034, 100.0, 1724)
-    femmesh.addNode(580.6651595143751, 74.95822778456392, 100.0, 1725)
-    femmesh.addNode(329.9296798708335, 30.25648557407389, 100.0, 1726)
-    femmesh.addNode(219.01285563926507, 31.099659395860485, 100.0, 1727)
-    femmesh.addNode(974.4281515101064, 62.42452519212328, 100.0, 1728)
-    femmesh.addNode(973.7460868183606, 137.47772395050086, 100.0, 1729)
-    femmesh.addNode(296.42648129707584, 28.694814030226457, 100.0, 1730)
-    femmesh.addNode(24.724194041022255, 138.366329426149, 100.0, 1731)
-    femmesh.addNode(61.63367057385084, 24.724194041022184, 100.0, 1732)
-    femmesh.addNode(61.633670573850935, 175.27580595897766, 100.0, 1733)
-    femmesh.addNode(24.72419404102219, 61.633670573850736, 100.0, 1734)
-    femmesh.addNode(335.23570074240035, 69.8068841305318, 100.0, 1735)
-    femmesh.addNode(867.5182902029032, 130.46180753951222, 100.0, 1736)
-    femmesh.addNode(65.54166666666664, 117.8946697287957, 100.0, 1737)
-    femmesh.addNode(65.54166666666663, 82.105330271204, 100.0, 1738)
-    femmesh.addNode(239.92855121675146, 58.74999999999998, 100.0, 1739)
-    femmesh.addNode(277.1252127724321, 58.013560401638344, 100.0, 1740)
-    femmesh.addNode(868.6437810945258, 71.98507462686582, 100.0, 1741)
-    femmesh.addNode(361.58110207363524, 76.79784198318882, 100.0, 1742)
-    femmesh.addNode(15.807456353871038, 15.807456353871027, 100.0, 1743)
-    femmesh.addNode(15.807456353871038, 35.80745635387096, 100.0, 1744)
-    femmesh.addNode(35.80745635387103, 15.807456353871027, 100.0, 1745)
-    femmesh.addNode(15.807456353871066, 164.19254364612885, 100.0, 1746)
-    femmesh.addNode(15.807456353871066, 184.1925436461289, 100.0, 1747)
-    femmesh.addNode(35.80745635387106, 184.1925436461289, 100.0, 1748)
-    femmesh.addNode(983.2916666666666, 36.7083333333332, 100.0, 1749)
-    femmesh.addNode(983.2916666666666, 16.70833333333326, 100.0, 1750)
-    femmesh.addNode(963.2916666666666, 16.70833333333326, 100.0, 1751)
-    femmesh.addNode(983.2916666666667, 183.29166666666669, 100.0, 1752)
-    femmesh.addNode(983.2916666666667, 163.29166666666666, 100.0, 1753)
-    femmesh.addNode(963.2916666666667, 183.29166666666669, 100.0, 1754)
-    femmesh.addNode(12.362097020511095, 50.816835286925304, 100.0, 1755)
-    femmesh.addNode(12.362097020511095, 70.81683528692523, 100.0, 1756)
-    femmesh.addNode(28.169553374382133, 46.62429164079639, 100.0, 1757)
-    femmesh.addNode(15.044310117948143, 89.99999999999979, 100.0, 1758)
-    femmesh.addNode(15.044310117948143, 109.99999999999983, 100.0, 1759)
-    femmesh.addNode(27.406407138459237, 80.81683528692528, 100.0, 1760)
-    femmesh.addNode(12.362097020511127, 129.1831647130744, 100.0, 1761)
-    femmesh.addNode(12.362097020511127, 149.18316471307446, 100.0, 1762)
-    femmesh.addNode(27.406407138459272, 119.18316471307443, 100.0, 1763)
-    femmesh.addNode(28.169553374382193, 153.3757083592034, 100.0, 1764)
-    femmesh.addNode(987.2140757550533, 71.2122625960615, 100.0, 1765)
-    femmesh.addNode(987.2140757550533, 51.21226259606158, 100.0, 1766)
-    femmesh.addNode(970.5057424217198, 47.920595929394906, 100.0, 1767)
-    femmesh.addNode(979.8235503792346, 109.1526432095855, 100.0, 1768)
-    femmesh.addNode(979.8235503792346, 89.15264320958545, 100.0, 1769)
-    femmesh.addNode(967.0376261342878, 80.36490580564723, 100.0, 1770)
-    femmesh.addNode(986.8730434091804, 148.7388619752504, 100.0, 1771)
-    femmesh.addNode(986.8730434091804, 128.73886197525033, 100.0, 1772)
-    femmesh.addNode(966.6965937884149, 117.89150518483602, 100.0, 1773)
-    femmesh.addNode(970.1647100758471, 152.03052864191713, 100.0, 1774)
-    femmesh.addNode(70.81683528692541, 12.362097020511092, 100.0, 1775)
-    femmesh.addNode(50.81683528692541, 12.362097020511092, 100.0, 1776)
-    femmesh.addNode(46.62429164079646, 28.16955337438212, 100.0, 1777)
-    femmesh.addNode(107.77673340715572, 20.18697579576431, 100.0, 1778)
-    femmesh.addNode(87.77673340715572, 20.18697579576431, 100.0, 1779)
-    femmesh.addNode(78.59356869408114, 32.549072816275405, 100.0, 1780)
-    femmesh.addNode(150.0, 13.27798585101954, 100.0, 1781)
-    femmesh.addNode(130.0, 13.27798585101954, 100.0, 1782)
-    femmesh.addNode(117.77673340715572, 33.46496164678385, 100.0, 1783)
-    femmesh.addNode(187.06589517145426, 17.617940330341888, 100.0, 1784)
-    femmesh.addNode(167.06589517145426, 17.617940330341888, 100.0, 1785)
-    femmesh.addNode(157.06589517145426, 30.89592618136143, 100.0, 1786)
-    femmesh.addNode(229.50642781963253, 15.549829697930242, 100.0, 1787)
-    femmesh.addNode(209.5064278196325, 15.549829697930242, 100.0, 1788)
-    femmesh.addNode(196.57232299108682, 33.16777002827213, 100.0, 1789)
-    femmesh.addNode(269.93780975454456, 13.850594689065375, 100.0, 1790)
-    femmesh.addNode(249.93780975454453, 13.850594689065375, 100.0, 1791)
-    femmesh.addNode(239.44423757417707, 29.400424386995617, 100.0, 1792)
-    femmesh.addNode(308.2132406485379, 14.347407015113228, 100.0, 1793)
-    femmesh.addNode(288.2132406485379, 14.347407015113228, 100.0, 1794)
-    femmesh.addNode(278.1510504030824, 28.1980017041786, 100.0, 1795)
-    femmesh.addNode(344.96483993541676, 15.128242787036944, 100.0, 1796)
-    femmesh.addNode(324.96483993541676, 15.128242787036944, 100.0, 1797)
-    femmesh.addNode(313.1780805839547, 29.475649802150173, 100.0, 1798)
-    femmesh.addNode(393.47477906729705, 14.86871050850901, 100.0, 1799)
-    femmesh.addNode(373.47477906729705, 14.86871050850901, 100.0, 1800)
-    femmesh.addNode(372.6900243860074, 38.41075794832097, 100.0, 1801)
-    femmesh.addNode(359.21524531871034, 23.54204743981196, 100.0, 1802)
-    femmesh.addNode(344.1800852541271, 38.670290226848905, 100.0, 1803)
-    femmesh.addNode(430.79677894493705, 17.63244277738324, 100.0, 1804)
-    femmesh.addNode(410.79677894493705, 17.63244277738324, 100.0, 1805)
-    femmesh.addNode(404.2715580122341, 32.50115328589225, 100.0, 1806)
-    femmesh.addNode(469.24363329633064, 19.53770523132534, 100.0, 1807)
-    femmesh.addNode(449.24363329633064, 19.53770523132534, 100.0, 1808)
-    femmesh.addNode(440.0404122412677, 37.17014800870858, 100.0, 1809)
-    femmesh.addNode(508.06420777690835, 17.45829821546846, 100.0, 1810)
-    femmesh.addNode(488.06420777690835, 17.45829821546846, 100.0, 1811)
-    femmesh.addNode(477.307841073239, 36.9960034467938, 100.0, 1812)
-    femmesh.addNode(545.2350195485586, 16.747583798154622, 100.0, 1813)
-    femmesh.addNode(525.2350195485586, 16.747583798154622, 100.0, 1814)
-    femmesh.addNode(513.299227325467, 34.20588201362308, 100.0, 1815)
-    femmesh.addNode(593.6842298398581, 15.063646052498683, 100.0, 1816)
-    femmesh.addNode(573.6842298398581, 15.063646052498683, 100.0, 1817)
-    femmesh.addNode(545.350235183262, 39.14806593247221, 100.0, 1818)
-    femmesh.addNode(560.1152156347034, 22.40048213431758, 100.0, 1819)
-    femmesh.addNode(573.7994454745615, 37.46412818681627, 100.0, 1820)
-    femmesh.addNode(631.5216217316781, 16.684317010850513, 100.0, 1821)
-    femmesh.addNode(611.5216217316781, 16.684317010850513, 100.0, 1822)
-    femmesh.addNode(605.2058515715362, 31.747963063349196, 100.0, 1823)
-    femmesh.addNode(670.3636922166487, 17.225020576864278, 100.0, 1824)
-    femmesh.addNode(650.3636922166488, 17.225020576864278, 100.0, 1825)
-    femmesh.addNode(641.8853139483269, 33.90933758771479, 100.0, 1826)
-    femmesh.addNode(710.1445000005324, 17.34894218509416, 100.0, 1827)
-    femmesh.addNode(690.1445000005324, 17.34894218509416, 100.0, 1828)
-    femmesh.addNode(680.5081922171812, 34.57396276195844, 100.0, 1829)
-    femmesh.addNode(750.5414929688573, 17.63297347792185, 100.0, 1830)
-    femmesh.addNode(730.5414929688573, 17.63297347792185, 100.0, 1831)
-    femmesh.addNode(720.6859929693898, 34.98191566301601, 100.0, 1832)
-    femmesh.addNode(789.9999999999995, 17.694879010977196, 100.0, 1833)
-    femmesh.addNode(769.9999999999995, 17.694879010977196, 100.0, 1834)
-    femmesh.addNode(760.541492968857, 35.32785248889905, 100.0, 1835)
-    femmesh.addNode(828.7560975609748, 17.731707317073766, 100.0, 1836)
-    femmesh.addNode(808.7560975609748, 17.731707317073766, 100.0, 1837)
-    femmesh.addNode(798.7560975609745, 35.42658632805096, 100.0, 1838)
-    femmesh.addNode(867.4344827943302, 17.496987013351326, 100.0, 1839)
-    femmesh.addNode(847.43448279433, 17.496987013351326, 100.0, 1840)
-    femmesh.addNode(836.190580355305, 35.22869433042509, 100.0, 1841)
-    femmesh.addNode(919.805636322294, 16.574314446548794, 100.0, 1842)
-    femmesh.addNode(899.805636322294, 16.574314446548794, 100.0, 1843)
-    femmesh.addNode(871.3897066749266, 42.70594223723204, 100.0, 1844)
-    femmesh.addNode(883.9552238805966, 25.208955223880714, 100.0, 1845)
-    femmesh.addNode(903.7608602028906, 41.783269670429505, 100.0, 1846)
-    femmesh.addNode(939.805636322294, 16.574314446548794, 100.0, 1847)
-    femmesh.addNode(943.0973029889608, 33.282647779882055, 100.0, 1848)
-    femmesh.addNode(50.81683528692546, 187.63790297948884, 100.0, 1849)
-    femmesh.addNode(70.81683528692545, 187.63790297948884, 100.0, 1850)
-    femmesh.addNode(46.624291640796535, 171.83044662561772, 100.0, 1851)
-    femmesh.addNode(87.7767334071557, 179.81302420423572, 100.0, 1852)
-    femmesh.addNode(107.77673340715572, 179.81302420423572, 100.0, 1853)
-    femmesh.addNode(78.59356869408117, 167.45092718372456, 100.0, 1854)
-    femmesh.addNode(130.0, 186.72201414898043, 100.0, 1855)
-    femmesh.addNode(150.0, 186.72201414898043, 100.0, 1856)
-    femmesh.addNode(117.77673340715572, 166.53503835321618, 100.0, 1857)
-    femmesh.addNode(170.3762447002822, 177.69208086589703, 100.0, 1858)
-    femmesh.addNode(190.3762447002822, 177.69208086589703, 100.0, 1859)
-    femmesh.addNode(160.3762447002822, 164.41409501487746, 100.0, 1860)
-    femmesh.addNode(210.0, 186.44898499482656, 100.0, 1861)
-    femmesh.addNode(230.00000000000003, 186.44898499482656, 100.0, 1862)
-    femmesh.addNode(200.37624470028223, 164.1410658607236, 100.0, 1863)
-    femmesh.addNode(249.28355705159152, 181.1075607943281, 100.0, 1864)
-    femmesh.addNode(269.2835570515915, 181.1075607943281, 100.0, 1865)
-    femmesh.addNode(239.28355705159154, 167.55654578915465, 100.0, 1866)
-    femmesh.addNode(290.2705201586426, 183.19795619967283, 100.0, 1867)
-    femmesh.addNode(310.2705201586426, 183.19795619967283, 100.0, 1868)
-    femmesh.addNode(279.55407721023414, 164.30551699400093, 100.0, 1869)
-    femmesh.addNode(329.9177358839024, 182.62567416828136, 100.0, 1870)
-    femmesh.addNode(349.9177358839024, 182.62567416828136, 100.0, 1871)
-    femmesh.addNode(320.1882560425451, 165.8236303679542, 100.0, 1872)
-    femmesh.addNode(370.0274578284177, 182.71405954417034, 100.0, 1873)
-    femmesh.addNode(390.0274578284177, 182.71405954417034, 100.0, 1874)
-    femmesh.addNode(359.9451937123202, 165.3397337124517, 100.0, 1875)
-    femmesh.addNode(408.775877519231, 182.6756231241132, 100.0, 1876)
-    femmesh.addNode(428.7758775192311, 182.6756231241132, 100.0, 1877)
-    femmesh.addNode(398.80333534764884, 165.3896826682835, 100.0, 1878)
-    femmesh.addNode(449.1397009477323, 180.6748353812733, 100.0, 1879)
-    femmesh.addNode(469.1397009477323, 180.6748353812733, 100.0, 1880)
-    femmesh.addNode(437.9155784669634, 163.35045850538648, 100.0, 1881)
-    femmesh.addNode(486.84574686698966, 183.19490017697308, 100.0, 1882)
-    femmesh.addNode(506.84574686698966, 183.19490017697308, 100.0, 1883)
-    femmesh.addNode(475.98544781472197, 163.86973555824642, 100.0, 1884)
-    femmesh.addNode(524.4187557868443, 184.33126912467384, 100.0, 1885)
-    femmesh.addNode(544.4187557868443, 184.33126912467384, 100.0, 1886)
-    femmesh.addNode(511.264502653834, 167.52616930164692, 100.0, 1887)
-    femmesh.addNode(575.2719895459718, 184.70392074355328, 100.0, 1888)
-    femmesh.addNode(595.2719895459718, 184.70392074355328, 100.0, 1889)
-    femmesh.addNode(544.3045058899411, 155.57652963836267, 100.0, 1890)
-    femmesh.addNode(559.8857501030967, 171.24526051368883, 100.0, 1891)
-    femmesh.addNode(575.1577396490684, 155.94918125724212, 100.0, 1892)
-    femmesh.addNode(611.4741976267621, 183.27434320407755, 100.0, 1893)
-    femmesh.addNode(631.4741976267621, 183.27434320407755, 100.0, 1894)
-    femmesh.addNode(606.7461871727339, 167.97826394763084, 100.0, 1895)
-    femmesh.addNode(649.993594809604, 182.7000196044491, 100.0, 1896)
-    femmesh.addNode(669.993594809604, 182.7000196044491, 100.0, 1897)
-    femmesh.addNode(641.4677924363662, 165.97436280852662, 100.0, 1898)
-    femmesh.addNode(690.3414929959961, 182.64878080594562, 100.0, 1899)
-    femmesh.addNode(710.3414929959961, 182.64878080594562, 100.0, 1900)
-    femmesh.addNode(680.3350878056001, 165.3488004103947, 100.0, 1901)
-    femmesh.addNode(730.5514432357178, 182.22146154870867, 100.0, 1902)
-    femmesh.addNode(750.5514432357178, 182.22146154870867, 100.0, 1903)
-    femmesh.addNode(720.892936231714, 164.8702423546543, 100.0, 1904)
-    femmesh.addNode(769.9999999999993, 178.02960385206228, 100.0, 1905)
-    femmesh.addNode(789.9999999999993, 178.02960385206228, 100.0, 1906)
-    femmesh.addNode(760.5514432357172, 160.25106540077095, 100.0, 1907)
-    femmesh.addNode(809.7016675426604, 182.3349128975037, 100.0, 1908)
-    femmesh.addNode(829.7016675426604, 182.3349128975037, 100.0, 1909)
-    femmesh.addNode(799.7016675426598, 160.36451674956598, 100.0, 1910)
-    femmesh.addNode(848.8949820579664, 182.04001785563048, 100.0, 1911)
-    femmesh.addNode(868.8949820579664, 182.04001785563048, 100.0, 1912)
-    femmesh.addNode(838.596649600627, 164.3749307531342, 100.0, 1913)
-    femmesh.addNode(900.2628094691165, 183.52675153139353, 100.0, 1914)
-    femmesh.addNode(920.2628094691165, 183.52675153139353, 100.0, 1915)
-    femmesh.addNode(874.9366487246328, 157.2483511889638, 100.0, 1916)
-    femmesh.addNode(886.0416666666664, 175.2083333333333, 100.0, 1917)
-    femmesh.addNode(906.3044761357829, 158.7350848647268, 100.0, 1918)
-    femmesh.addNode(940.2628094691165, 183.52675153139353, 100.0, 1919)
-    femmesh.addNode(943.5544761357833, 166.81841819806021, 100.0, 1920)
-    femmesh.addNode(630.787562395896, 82.05512235951112, 100.0, 1921)
-    femmesh.addNode(652.120573293815, 82.83767087249656, 100.0, 1922)
-    femmesh.addNode(640.3872860658796, 98.92458451010509, 100.0, 1923)
-    femmesh.addNode(651.5468305205775, 114.69863081743591, 100.0, 1924)
-    femmesh.addNode(630.2138196226585, 113.91608230445047, 100.0, 1925)
-    femmesh.addNode(671.2356501167353, 84.0973494711783, 100.0, 1926)
-    femmesh.addNode(691.0928096336613, 84.28863711644244, 100.0, 1927)
-    femmesh.addNode(681.5774564807245, 99.89842066835467, 100.0, 1928)
-    femmesh.addNode(690.9736102714355, 115.78807360176648, 100.0, 1929)
-    femmesh.addNode(671.1164507545095, 115.59678595650234, 100.0, 1930)
-    femmesh.addNode(661.6359264467517, 67.22788732058433, 100.0, 1931)
-    femmesh.addNode(660.9429843112885, 130.58828375084772, 100.0, 1932)
-    femmesh.addNode(330.0191355871091, 113.72482310271819, 100.0, 1933)
-    femmesh.addNode(309.15729605238744, 110.37097183429101, 100.0, 1934)
-    femmesh.addNode(319.13816046527825, 96.64614873157281, 100.0, 1935)
-    femmesh.addNode(316.7560108364785, 81.54959079683871, 100.0, 1936)
-    femmesh.addNode(337.6178503712001, 84.90344206526589, 100.0, 1937)
-    femmesh.addNode(369.6181548052676, 116.32186948984123, 100.0, 1938)
-    femmesh.addNode(349.86036638392795, 115.94181636229686, 100.0, 1939)
-    femmesh.addNode(359.75778842133957, 100.38005312754436, 100.0, 1940)
-    femmesh.addNode(350.7905510368176, 88.3989209915944, 100.0, 1941)
-    femmesh.addNode(370.5483394581572, 88.77897411913877, 100.0, 1942)
-    femmesh.addNode(339.8795019710371, 129.66663946501507, 100.0, 1943)
-    femmesh.addNode(348.40840140801777, 73.30236305686032, 100.0, 1944)
-    femmesh.addNode(211.70489676325792, 81.67011507849905, 100.0, 1945)
-    femmesh.addNode(203.09122049374616, 97.49817487397814, 100.0, 1946)
-    femmesh.addNode(191.52749649732988, 80.73894613182752, 100.0, 1947)
-    femmesh.addNode(173.6253677084459, 84.13183067347691, 100.0, 1948)
-    femmesh.addNode(182.23904397795764, 68.3037708779978, 100.0, 1949)
-    femmesh.addNode(209.4081817676103, 111.03536729017151, 100.0, 1950)
-    femmesh.addNode(189.23078150168226, 110.10419834349997, 100.0, 1951)
-    femmesh.addNode(150.67756309849239, 85.72646475416241, 100.0, 1952)
-    femmesh.addNode(159.96601561786463, 98.1616400079921, 100.0, 1953)
-    femmesh.addNode(174.21810259150305, 110.55814095659348, 100.0, 1954)
-    femmesh.addNode(151.27029798154956, 112.15277503727897, 100.0, 1955)
-    femmesh.addNode(180.5350638653672, 124.09533337278684, 100.0, 1956)
-    femmesh.addNode(427.0813389536128, 84.96446403389945, 100.0, 1957)
-    femmesh.addNode(447.8566544066575, 85.1642065365568, 100.0, 1958)
-    femmesh.addNode(436.89476446945423, 100.76412176245628, 100.0, 1959)
-    femmesh.addNode(447.84888369593364, 116.03702449446088, 100.0, 1960)
-    femmesh.addNode(427.07356824288894, 115.83728199180351, 100.0, 1961)
-    femmesh.addNode(489.7556115633587, 113.04733252379148, 100.0, 1962)
-    femmesh.addNode(468.24195330176303, 114.3600851753768, 100.0, 1963)
-    femmesh.addNode(479.18373818409464, 99.65111161352831, 100.0, 1964)
-    femmesh.addNode(467.0995647329851, 84.28252803258475, 100.0, 1965)
-    femmesh.addNode(488.6132229945807, 82.96977538099944, 100.0, 1966)
-    femmesh.addNode(457.28613921714367, 68.48287030402793, 100.0, 1967)
-    femmesh.addNode(458.42075707519774, 129.43324540472403, 100.0, 1968)
-    femmesh.addNode(766.0626657796536, 144.46757142785074, 100.0, 1969)
-    femmesh.addNode(766.0626657796533, 120.97215078374589, 100.0, 1970)
-    femmesh.addNode(779.9999999999986, 132.5637870600197, 100.0, 1971)
-    femmesh.addNode(793.9604719474723, 121.00098517642408, 100.0, 1972)
-    femmesh.addNode(793.9604719474726, 144.49640582052893, 100.0, 1973)
-    femmesh.addNode(789.3091181093505, 89.70485377390811, 100.0, 1974)
-    femmesh.addNode(810.310844549262, 86.35884270124106, 100.0, 1975)
-    femmesh.addNode(801.00172643991, 105.72235534324778, 100.0, 1976)
-    femmesh.addNode(814.962198387384, 117.65497410375701, 100.0, 1977)
-    femmesh.addNode(748.4657726617403, 86.11249205895615, 100.0, 1978)
-    femmesh.addNode(769.7594833914202, 89.55492582535216, 100.0, 1979)
-    femmesh.addNode(758.7062892703186, 105.62593264951884, 100.0, 1980)
-    femmesh.addNode(744.7689550499734, 117.52971701734988, 100.0, 1981)
-    femmesh.addNode(779.0686015007722, 70.19141318334542, 100.0, 1982)
-    femmesh.addNode(908.5898401873266, 108.54359613761387, 100.0, 1983)
-    femmesh.addNode(908.3617952047824, 131.74580830980688, 100.0, 1984)
-    femmesh.addNode(892.3113783158769, 127.21445449447356, 100.0, 1985)
-    femmesh.addNode(879.800811768118, 140.4392371030894, 100.0, 1986)
-    femmesh.addNode(880.0288567506622, 117.23702493089638, 100.0, 1987)
-    femmesh.addNode(861.5375656283081, 115.87215619612815, 100.0, 1988)
-    femmesh.addNode(874.0481321760672, 102.6473735875123, 100.0, 1989)
-    femmesh.addNode(862.1003110741194, 86.63378973980495, 100.0, 1990)
-    femmesh.addNode(880.5916021964734, 87.99865847457318, 100.0, 1991)
-    femmesh.addNode(902.9360607944541, 87.97919814755026, 100.0, 1992)
-    femmesh.addNode(918.9864776833595, 92.5105519628836, 100.0, 1993)
-    femmesh.addNode(890.9882396925063, 71.96561429984291, 100.0, 1994)
-    femmesh.addNode(574.216984526636, 107.61390679586805, 100.0, 1995)
-    femmesh.addNode(573.9359831933746, 127.13848492834022, 100.0, 1996)
-    femmesh.addNode(560.0525015394549, 122.96594289490551, 100.0, 1997)
-    femmesh.addNode(545.8792005781495, 127.08845037841083, 100.0, 1998)
-    femmesh.addNode(546.1602019114109, 107.56387224593865, 100.0, 1999)
-    femmesh.addNode(570.4993311935457, 89.19979627349863, 100.0, 2000)
-    femmesh.addNode(584.3828128474654, 93.37233830693333, 100.0, 2001)
-    femmesh.addNode(535.8634939677361, 93.22101302119677, 100.0, 2002)
-    femmesh.addNode(550.0367949290413, 89.09850553769147, 100.0, 2003)
-    femmesh.addNode(560.2026232498708, 74.85693704875675, 100.0, 2004)
-    femmesh.addNode(120.7682643999012, 113.47017983362863, 100.0, 2005)
-    femmesh.addNode(97.96282999732858, 113.59204278928975, 100.0, 2006)
-    femmesh.addNode(114.21277660533848, 99.87813704433871, 100.0, 2007)
-    femmesh.addNode(97.9628299973287, 86.39526843981653, 100.0, 2008)
-    femmesh.addNode(120.76826439990134, 86.2734054841554, 100.0, 2009)
-    femmesh.addNode(85.02999222927897, 122.5393776536877, 100.0, 2010)
-    femmesh.addNode(78.47450443471624, 108.94733486439776, 100.0, 2011)
-    femmesh.addNode(78.47450443471624, 91.05266513560191, 100.0, 2012)
-    femmesh.addNode(85.02999222927909, 77.4479335754186, 100.0, 2013)
-    femmesh.addNode(65.54166666666663, 99.99999999999986, 100.0, 2014)
-    femmesh.addNode(258.3438042248114, 100.90902072582571, 100.0, 2015)
-    femmesh.addNode(240.19703257373064, 108.03276648156398, 100.0, 2016)
-    femmesh.addNode(241.41539241075498, 91.30559806491142, 100.0, 2017)
-    femmesh.addNode(231.59858598821285, 78.58967191032482, 100.0, 2018)
-    femmesh.addNode(249.74535763929362, 71.46592615458657, 100.0, 2019)
-    femmesh.addNode(277.70088265917184, 105.46424330281195, 100.0, 2020)
-    femmesh.addNode(278.91924249619615, 88.7370748861594, 100.0, 2021)
-    femmesh.addNode(268.34368841713393, 71.09770635540576, 100.0, 2022)
-    femmesh.addNode(287.70076685149434, 75.65292893239199, 100.0, 2023)
-    femmesh.addNode(258.5268819945918, 58.381780200819165, 100.0, 2024)
-    femmesh.addNode(846.7576619434599, 85.16340443491944, 100.0, 2025)
-    femmesh.addNode(838.7801469667675, 101.8294245616624, 100.0, 2026)
-    femmesh.addNode(829.9809678565141, 85.71032414383777, 100.0, 2027)
-    femmesh.addNode(818.2883595259544, 69.6928225744981, 100.0, 2028)
-    femmesh.addNode(846.4137242109334, 52.01913902189874, 100.0, 2029)
-    femmesh.addNode(827.7353389775781, 52.25385932562118, 100.0, 2030)
-    femmesh.addNode(808.0652156703261, 52.90237788302446, 100.0, 2031)
-    femmesh.addNode(853.3011319638662, 70.51468932198031, 100.0, 2032)
-    femmesh.addNode(861.7563733415931, 53.489524326784235, 100.0, 2033)
-    femmesh.addNode(390.836650140135, 48.037772833858845, 100.0, 2034)
-    femmesh.addNode(376.5771163915483, 56.711109765161794, 100.0, 2035)
-    femmesh.addNode(378.1524221096556, 71.56798331694424, 100.0, 2036)
-    femmesh.addNode(360.005796355528, 61.94096843140637, 100.0, 2037)
-    femmesh.addNode(397.81751292954436, 100.6622427574438, 100.0, 2038)
-    femmesh.addNode(387.1196594941776, 83.5491154528942, 100.0, 2039)
-    femmesh.addNode(405.4215955810427, 83.45125195524929, 100.0, 2040)
-    femmesh.addNode(416.38348551824606, 67.85133672934982, 100.0, 2041)
-    femmesh.addNode(408.158650017775, 50.801505102733074, 100.0, 2042)
-    femmesh.addNode(429.81839339034514, 52.31471718138323, 100.0, 2043)
-    femmesh.addNode(719.4235972691446, 101.13660359837083, 100.0, 2044)
-    femmesh.addNode(710.7173079988249, 84.04485415680931, 100.0, 2045)
-    femmesh.addNode(728.7062892703188, 85.09174944156132, 100.0, 2046)
-    femmesh.addNode(739.7594833914206, 69.02074261739463, 100.0, 2047)
-    femmesh.addNode(710.1445000005319, 51.34894218509406, 100.0, 2048)
-    femmesh.addNode(730.541492968857, 51.63297347792175, 100.0, 2049)
-    femmesh.addNode(750.3009763602784, 52.65371609531658, 100.0, 2050)
-    femmesh.addNode(700.3755016348356, 68.24378295963294, 100.0, 2051)
-    femmesh.addNode(690.5200016353683, 51.5927251447272, 100.0, 2052)
-    femmesh.addNode(709.7994012342217, 148.851190724424, 100.0, 2053)
-    femmesh.addNode(730.0093514739435, 148.42387146718704, 100.0, 2054)
-    femmesh.addNode(735.5205740178798, 132.64037749426683, 100.0, 2055)
-    femmesh.addNode(746.6141090153719, 148.65942912449714, 100.0, 2056)
-    femmesh.addNode(710.1752162370509, 116.24726407528777, 100.0, 2057)
-    femmesh.addNode(728.1641975085449, 117.29415936003979, 100.0, 2058)
-    femmesh.addNode(699.7142105108359, 131.94562936343544, 100.0, 2059)
-    femmesh.addNode(690.5977952686064, 148.3920002509027, 100.0, 2060)
-    femmesh.addNode(389.4675384112166, 148.92034777523736, 100.0, 2061)
-    femmesh.addNode(408.21595810202996, 148.8819113551802, 100.0, 2062)
-    femmesh.addNode(418.45392431748303, 131.76138059297108, 100.0, 2063)
-    femmesh.addNode(427.7897212539153, 148.23071548601723, 100.0, 2064)
-    femmesh.addNode(389.1978690041385, 116.58634135861138, 100.0, 2065)
-    femmesh.addNode(407.4998050910036, 116.48847786096647, 100.0, 2066)
-    femmesh.addNode(379.3004469667268, 132.14810459336388, 100.0, 2067)
-    femmesh.addNode(369.88782421234566, 148.6558759064672, 100.0, 2068)
-    femmesh.addNode(848.7059266645244, 148.298811927935, 100.0, 2069)
-    femmesh.addNode(829.5126121492185, 148.59370696980818, 100.0, 2070)
-    femmesh.addNode(813.6621394901335, 148.80171486597035, 100.0, 2071)
-    femmesh.addNode(823.7714165540312, 132.72559604077114, 100.0, 2072)
-    femmesh.addNode(847.5893651334146, 116.90004649867652, 100.0, 2073)
-    femmesh.addNode(830.812671046469, 117.44696620759484, 100.0, 2074)
-    femmesh.addNode(853.5700897080096, 131.4896978420606, 100.0, 2075)
-    femmesh.addNode(862.6541271594181, 147.27092162538662, 100.0, 2076)
-    femmesh.addNode(271.88224579596687, 126.2784263185651, 100.0, 2077)
-    femmesh.addNode(292.45768406735164, 114.10648047889876, 100.0, 2078)
-    femmesh.addNode(303.33865918918247, 131.18515485004414, 100.0, 2079)
-    femmesh.addNode(257.84627924548505, 139.92565536556722, 100.0, 2080)
-    femmesh.addNode(272.60308065366485, 148.56789254165403, 100.0, 2081)
-    femmesh.addNode(293.59004376071596, 150.65828794699877, 100.0, 2082)
-    femmesh.addNode(310.2896557457518, 146.92277930239104, 100.0, 2083)
-    femmesh.addNode(600.2719895459716, 153.70392074355328, 100.0, 2084)
-    femmesh.addNode(584.8857501030965, 140.24526051368883, 100.0, 2085)
-    femmesh.addNode(599.0502330902777, 124.89322441465136, 100.0, 2086)
-    femmesh.addNode(625.686682038678, 133.84506430589062, 100.0, 2087)
-    femmesh.addNode(614.5271375839801, 118.07101799855981, 100.0, 2088)
-    femmesh.addNode(603.5773706742582, 104.9642424132112, 100.0, 2089)
-    femmesh.addNode(616.4741976267619, 152.27434320407752, 100.0, 2090)
-    femmesh.addNode(632.1608796654403, 148.1194075099682, 100.0, 2091)
-    femmesh.addNode(519.4187557868443, 153.3312691246738, 100.0, 2092)
-    femmesh.addNode(534.8857501030966, 140.24526051368883, 100.0, 2093)
-    femmesh.addNode(520.9934504750527, 124.84318986472195, 100.0, 2094)
-    femmesh.addNode(494.4069133405135, 132.87815304281995, 100.0, 2095)
-    femmesh.addNode(505.3486982228451, 118.16917948097148, 100.0, 2096)
-    femmesh.addNode(516.342148697898, 105.01236934569349, 100.0, 2097)
-    femmesh.addNode(501.8457468669896, 152.19490017697308, 100.0, 2098)
-    femmesh.addNode(486.2526602075032, 147.07305321979305, 100.0, 2099)
-    femmesh.addNode(626.1748720343675, 63.81102546920613, 100.0, 2100)
-    femmesh.addNode(614.441584806432, 79.89793910681466, 100.0, 2101)
-    femmesh.addNode(599.8597173411679, 86.55013189084178, 100.0, 2102)
-    femmesh.addNode(595.2470269796393, 68.3060350005368, 100.0, 2103)
-    femmesh.addNode(598.5986770623099, 45.89056716075352, 100.0, 2104)
-    femmesh.addNode(616.43606895413, 47.51123811910535, 100.0, 2105)
-    femmesh.addNode(632.7820465435939, 49.668421371801806, 100.0, 2106)
-    femmesh.addNode(584.0168095970456, 52.54275994478064, 100.0, 2107)
-    femmesh.addNode(492.3384796994078, 65.27478183587343, 100.0, 2108)
-    femmesh.addNode(504.42265315051736, 80.64336541681699, 100.0, 2109)
-    femmesh.addNode(523.9439984203555, 68.85200909232029, 100.0, 2110)
-    femmesh.addNode(520.2187417155284, 86.5470026374463, 100.0, 2111)
-    femmesh.addNode(502.1381627045805, 48.93248415131396, 100.0, 2112)
-    femmesh.addNode(519.3089744762308, 48.22176973400012, 100.0, 2113)
-    femmesh.addNode(535.1050630412419, 54.12540695462941, 100.0, 2114)
-    femmesh.addNode(486.3287325486439, 51.25889411549639, 100.0, 2115)
-    femmesh.addNode(223.40689503732978, 156.40484797242868, 100.0, 2116)
-    femmesh.addNode(203.78313973761198, 147.64794384349915, 100.0, 2117)
-    femmesh.addNode(188.15011608805543, 139.51277624574368, 100.0, 2118)
-    femmesh.addNode(211.18076642510297, 131.77655835744878, 100.0, 2119)
-    femmesh.addNode(241.9696172312233, 128.77395754884125, 100.0, 2120)
-    femmesh.addNode(225.04120541716685, 119.17053488792696, 100.0, 2121)
-    femmesh.addNode(242.6904520889213, 151.06342377193022, 100.0, 2122)
-    femmesh.addNode(137.22222222222217, 157.05534748231372, 100.0, 2123)
-    femmesh.addNode(157.59846692250434, 148.02541419923034, 100.0, 2124)
-    femmesh.addNode(149.98341469981614, 132.60797132627346, 100.0, 2125)
-    femmesh.addNode(173.1374371778762, 139.9667188588372, 100.0, 2126)
-    femmesh.addNode(114.99895562937786, 150.14635753756903, 100.0, 2127)
-    femmesh.addNode(100.03589230310136, 143.40506699352557, 100.0, 2128)
-    femmesh.addNode(119.4813811181678, 133.92537612262313, 100.0, 2129)
-    femmesh.addNode(135.7313277261777, 120.2114703776721, 100.0, 2130)
-    femmesh.addNode(137.22222222222223, 42.944652517686166, 100.0, 2131)
-    femmesh.addNode(114.99895562937795, 49.85364246243094, 100.0, 2132)
-    femmesh.addNode(119.481381118168, 66.06193510648323, 100.0, 2133)
-    femmesh.addNode(100.0358923031015, 56.58224423558092, 100.0, 2134)
-    femmesh.addNode(154.2881173936765, 47.28460699700851, 100.0, 2135)
-    femmesh.addNode(169.2343527659911, 53.46626804016549, 100.0, 2136)
-    femmesh.addNode(149.39067981675908, 65.51499437649022, 100.0, 2137)
-    femmesh.addNode(135.73132772617777, 79.54480371100543, 100.0, 2138)
-    femmesh.addNode(936.4898995244781, 85.12572019599558, 100.0, 2139)
-    femmesh.addNode(929.6215108746082, 66.17341342379954, 100.0, 2140)
-    femmesh.addNode(952.7787121085994, 79.35297964697514, 100.0, 2141)
-    femmesh.addNode(960.1692374844179, 61.412599033451194, 100.0, 2142)
-    femmesh.addNode(956.2468283960313, 46.90866977072281, 100.0, 2143)
-    femmesh.addNode(932.7607980516589, 46.77465088393835, 100.0, 2144)
-    femmesh.addNode(916.4719854675376, 52.54739143295879, 100.0, 2145)
-    femmesh.addNode(931.5128094691165, 154.77675153139353, 100.0, 2146)
-    femmesh.addNode(917.2916666666663, 146.45833333333331, 100.0, 2147)
-    femmesh.addNode(933.570128538116, 127.78747497647362, 100.0, 2148)
-    femmesh.addNode(942.1436789173506, 105.6901181860592, 100.0, 2149)
-    femmesh.addNode(951.0735503792346, 120.4026432095856, 100.0, 2150)
-    femmesh.addNode(958.1230434091802, 139.98886197525044, 100.0, 2151)
-    femmesh.addNode(954.5416666666667, 154.5416666666667, 100.0, 2152)
-    femmesh.addNode(58.461431203140904, 161.96350357440832, 100.0, 2153)
-    femmesh.addNode(75.42132932337114, 154.13862479915525, 100.0, 2154)
-    femmesh.addNode(60.41542924954876, 133.27293545931735, 100.0, 2155)
-    femmesh.addNode(80.54756674048903, 138.7603590686336, 100.0, 2156)
-    femmesh.addNode(40.006692936726566, 143.508765307994, 100.0, 2157)
-    femmesh.addNode(43.452052270086504, 158.5181442410484, 100.0, 2158)
-    femmesh.addNode(45.13293035384445, 128.13049957747236, 100.0, 2159)
-    femmesh.addNode(58.461431203140805, 38.03649642559151, 100.0, 2160)
-    femmesh.addNode(75.42132932337111, 45.861375200844726, 100.0, 2161)
-    femmesh.addNode(80.54756674048903, 61.23964093136631, 100.0, 2162)
-    femmesh.addNode(60.4154292495487, 66.72706454068242, 100.0, 2163)
-    femmesh.addNode(43.452052270086426, 41.48185575895144, 100.0, 2164)
-    femmesh.addNode(40.00669293672648, 56.49123469200578, 100.0, 2165)
-    femmesh.addNode(45.13293035384441, 71.86950042252737, 100.0, 2166)
-    femmesh.addNode(321.9589201808423, 62.63404667984295, 100.0, 2167)
-    femmesh.addNode(303.47923027492044, 74.37675334614987, 100.0, 2168)
-    femmesh.addNode(292.9036761958582, 56.737384815396226, 100.0, 2169)
-    femmesh.addNode(302.55431045818005, 42.07801162969028, 100.0, 2170)
-    femmesh.addNode(319.3059097450589, 42.858847401614, 100.0, 2171)
-    femmesh.addNode(332.58269030661694, 50.031684852302845, 100.0, 2172)
-    femmesh.addNode(286.77584703475395, 43.3541872159324, 100.0, 2173)
-    femmesh.addNode(220.03486199179653, 61.8304431681742, 100.0, 2174)
-    femmesh.addNode(187.13648155487508, 50.0733834985161, 100.0, 2175)
-    femmesh.addNode(209.57701420305335, 48.005272866104455, 100.0, 2176)
-    femmesh.addNode(229.47070342800828, 44.924829697930235, 100.0, 2177)
-    femmesh.addNode(349.7781022678304, 148.56749053057825, 100.0, 2178)
-    femmesh.addNode(329.9368714710116, 146.35049727099957, 100.0, 2179)
-    femmesh.addNode(789.3091181093507, 52.86554957692788, 100.0, 2180)
-    femmesh.addNode(769.7594833914206, 52.71562162837193, 100.0, 2181)
-    femmesh.addNode(670.2498970822143, 148.44323904940615, 100.0, 2182)
-    femmesh.addNode(650.6802768482822, 147.5450839103397, 100.0, 2183)
-    femmesh.addNode(670.7391938514847, 51.46880353649732, 100.0, 2184)
-    femmesh.addNode(651.6241170285645, 50.209124937815574, 100.0, 2185)
-    femmesh.addNode(448.1535446824165, 146.22992774317737, 100.0, 2186)
-    femmesh.addNode(468.54661428824585, 144.5529884240933, 100.0, 2187)
-    femmesh.addNode(448.26524774173873, 54.21997963532533, 100.0, 2188)
-    femmesh.addNode(467.5081580680662, 53.33830113135327, 100.0, 2189)
-    femmesh.addNode(878.2771144278595, 61.20149253731363, 100.0, 2190)
-    femmesh.addNode(900.62157302584, 61.18203221029071, 100.0, 2191)
-    femmesh.addNode(549.9852591273866, 59.778305290792375, 100.0, 2192)
-    femmesh.addNode(570.447795391891, 59.87959602659954, 100.0, 2193)
-    femmesh.addNode(346.8330956899105, 58.44548950507786, 100.0, 2194)
-    femmesh.addNode(47.815143451281465, 108.94733486439777, 100.0, 2195)
-    femmesh.addNode(47.81514345128146, 91.05266513560193, 100.0, 2196)
-    femmesh.addNode(249.90208536292027, 43.22559468906536, 100.0, 2197)
-    femmesh.addNode(268.5004161407606, 42.85737488988455, 100.0, 2198)
-    femmesh.addNode(247.40971357271673, 40.99580564926922, 52.89399406655819, 2199)
-    femmesh.addNode(292.4841820350936, 51.55081539397768, 50.63690922379849, 2200)
-    femmesh.addNode(569.5077111074808, 51.11230740130173, 50.000000000000014, 2201)
-    femmesh.addNode(50.21114888696287, 50.21114888696286, 50.0, 2202)
-    femmesh.addNode(259.02822759488083, 135.66707064126518, 48.94819072025979, 2203)
-    femmesh.addNode(180.37166146913557, 118.69132934888145, 49.526563133568025, 2204)
-    femmesh.addNode(791.0111108346216, 44.02911811652857, 56.36075300724483, 2205)
-    femmesh.addNode(135.11539211628968, 47.01871234739016, 47.71241770332924, 2206)
-    femmesh.addNode(717.1418396612174, 110.71707144948863, 34.01040850273198, 2207)
-    femmesh.addNode(652.4605227527044, 97.15490009197156, 49.983335283818576, 2208)
-    femmesh.addNode(367.3242289390946, 161.4601619851921, 60.31820781681575, 2209)
-    femmesh.addNode(436.8962169415786, 92.3449450940447, 49.966970162970135, 2210)
-    femmesh.addNode(346.32135848831234, 81.16737733301623, 49.40970854318136, 2211)
-    femmesh.addNode(852.7879001219552, 119.40497482250574, 49.96976735141047, 2212)
-    femmesh.addNode(300.95540225327716, 106.78902787881397, 50.94417395407234, 2213)
-    femmesh.addNode(801.6106261658796, 122.32867180918393, 50.24607528602474, 2214)
-    femmesh.addNode(333.1567699956225, 40.98921155379969, 41.14761771727652, 2215)
-    femmesh.addNode(481.193968785053, 149.0211432937624, 50.00545841908933, 2216)
-    femmesh.addNode(490.65860468571617, 53.85470117190255, 49.99999999999998, 2217)
-    femmesh.addNode(494.42493689260834, 102.28325497843345, 48.04604128658759, 2218)
-    femmesh.addNode(534.3245785156693, 147.13971916211472, 48.33080054197373, 2219)
-    femmesh.addNode(671.7813691899858, 42.269831875376724, 43.6515684211784, 2220)
-    femmesh.addNode(213.83224355221512, 154.27162021711644, 46.43763507895413, 2221)
-    femmesh.addNode(907.4575214325523, 39.56390117344587, 42.13988555757915, 2222)
-    femmesh.addNode(858.8631262608598, 45.36174474157767, 45.73738412093903, 2223)
-    femmesh.addNode(397.75191256633053, 88.39399480281645, 65.02335943754518, 2224)
-    femmesh.addNode(93.14389243741778, 54.527850670518, 58.44284524758723, 2225)
-    femmesh.addNode(529.5503828657149, 37.16519531167086, 52.89399406655822, 2226)
-    femmesh.addNode(823.3275304199341, 75.89535148537227, 50.0, 2227)
-    femmesh.addNode(328.59752929747555, 149.57146165292394, 49.76542439136512, 2228)
-    femmesh.addNode(437.72735294027905, 47.522386652437376, 40.0677207853699, 2229)
-    femmesh.addNode(699.4471563976762, 143.11282064479184, 49.98706750920248, 2230)
-    femmesh.addNode(47.4260864481082, 100.0, 46.86098533284908, 2231)
-    femmesh.addNode(50.21114888696286, 149.78885111303714, 50.00000000000001, 2232)
-    femmesh.addNode(156.8826827860529, 158.3742253293622, 59.846091805446335, 2233)
-    femmesh.addNode(239.5501606226015, 86.55417423585446, 49.59659372427428, 2234)
-    femmesh.addNode(937.1931195380073, 100.06156960653364, 47.31822481128914, 2235)
-    femmesh.addNode(746.4667270235249, 52.75649194510298, 50.04428249779345, 2236)
-    femmesh.addNode(113.53814638165602, 146.27031074086798, 49.885835865669165, 2237)
-    femmesh.addNode(758.2969902708755, 100.03635392708188, 44.39178563323547, 2238)
-    femmesh.addNode(627.5778138121943, 52.71646426469323, 50.000000000000036, 2239)
-    femmesh.addNode(588.3784068403331, 148.84884629576527, 49.99843511715834, 2240)
-    femmesh.addNode(645.8386189345603, 149.65314571756375, 50.01808776824604, 2241)
-    femmesh.addNode(949.1999540863177, 149.19995408631772, 49.99999999999999, 2242)
-    femmesh.addNode(890.9947660492707, 79.45921439934153, 50.0, 2243)
-    femmesh.addNode(180.7433543067396, 65.52024397047542, 49.799822275902216, 2244)
-    femmesh.addNode(867.297237776036, 158.73004641431956, 41.32889814993039, 2245)
-    femmesh.addNode(709.0700405915732, 39.67756527333443, 60.332465505964166, 2246)
-    femmesh.addNode(290.2227319085889, 161.1823944816518, 39.14552108015112, 2247)
-    femmesh.addNode(114.81036765222747, 91.85959419233195, 50.07380729095675, 2248)
-    femmesh.addNode(900.8537662714178, 134.75318581323458, 52.762021365975414, 2249)
-    femmesh.addNode(752.1307983872235, 148.45459562332655, 49.386097101140294, 2250)
-    femmesh.addNode(426.8303445591629, 147.65701445272634, 50.22472843522589, 2251)
-    femmesh.addNode(949.1009102489265, 50.899089751073426, 49.99999999999999, 2252)
-    femmesh.addNode(699.7008189473527, 78.12168894651839, 49.85944161755234, 2253)
-    femmesh.addNode(379.4299274093472, 122.56224552774556, 50.68161824560605, 2254)
-    femmesh.addNode(542.3867071454029, 94.59048718635185, 49.99999999999997, 2255)
-    femmesh.addNode(595.5850174057323, 95.22438134436808, 49.998585500599795, 2256)
-    femmesh.addNode(829.1220070538365, 153.60056181333698, 59.86970836705848, 2257)
-    femmesh.addNode(390.2133124196943, 50.96180732311488, 49.18508660164195, 2258)
-    femmesh.addNode(201.8201411144049, 108.56033658476557, 74.76328156678402, 2259)
-    femmesh.addNode(187.959702122341, 121.1663600542874, 74.76328156678402, 2260)
-    femmesh.addNode(218.55043215594466, 126.35048201888306, 73.21881753947707, 2261)
-    femmesh.addNode(204.68999316388079, 138.9565054884049, 73.21881753947707, 2262)
-    femmesh.addNode(197.10195251067535, 136.48147478299893, 47.982099106261074, 2263)
-    femmesh.addNode(231.40939069113784, 92.49175902825206, 74.79829686213714, 2264)
-    femmesh.addNode(209.96091104586856, 102.62275179236795, 49.56157842892115, 2265)
-    femmesh.addNode(226.69120208740833, 120.41289722648546, 48.01711440161421, 2266)
-    femmesh.addNode(643.6384196582261, 139.70981262656738, 25.00904388412302, 2267)
-    femmesh.addNode(620.7118181701462, 122.43876353096591, 50.00833663442292, 2268)
-    femmesh.addNode(618.511618893812, 112.49543043996955, 24.999292750299897, 2269)
-    femmesh.addNode(646.9493715672982, 113.4606898137713, 24.991667641909288, 2270)
-    femmesh.addNode(624.0227700792184, 96.18964071816981, 49.99096039220919, 2271)
-    femmesh.addNode(649.1495708436323, 123.40402290476766, 50.000711526032305, 2272)
-    femmesh.addNode(618.4791907415444, 112.45725497807469, 74.9992927502999, 2273)
-    femmesh.addNode(643.6059915059584, 139.67163716467252, 75.00904388412302, 2274)
-    femmesh.addNode(646.9169434150303, 113.42251435187643, 74.99166764190929, 2275)
-    femmesh.addNode(114.17425701694174, 119.06495246659998, 49.97982157831296, 2276)
-    femmesh.addNode(90.17601715944706, 104.87713196056383, 75.03690364547838, 2277)
-    femmesh.addNode(89.53990652416132, 132.08249023483185, 74.94291793283458, 2278)
-    femmesh.addNode(80.48211641488211, 123.13515537043399, 48.373410599259124, 2279)
-    femmesh.addNode(56.48387655738742, 108.94733486439785, 73.43049266642454, 2280)
-    femmesh.addNode(81.11822705016783, 95.92979709616597, 48.46739631190292, 2281)
-    femmesh.addNode(146.9549039253958, 132.48082004487472, 49.70619949961859, 2282)
-    femmesh.addNode(124.00574705803031, 123.19293603061715, 24.942917932834582, 2283)
-    femmesh.addNode(157.42250460177007, 109.40344533462388, 24.763281566784013, 2284)
-    femmesh.addNode(147.59101456068151, 105.27546177060671, 49.80018521226239, 2285)
-    femmesh.addNode(124.64185769331604, 95.98757775634914, 25.036903645478375, 2286)
-    femmesh.addNode(125.27817869478356, 123.01329241477279, 74.94291793283458, 2287)
-    femmesh.addNode(158.69493623852333, 109.22380171877953, 74.76328156678402, 2288)
-    femmesh.addNode(125.9142893300693, 95.80793414050478, 75.03690364547838, 2289)
-    femmesh.addNode(168.62717212759424, 138.53277733912182, 54.68632746950718, 2290)
-    femmesh.addNode(146.950446896982, 129.0652497090199, 79.92304590272317, 2291)
-    femmesh.addNode(135.21041458385446, 152.3222680351151, 54.86596383555775, 2292)
-    femmesh.addNode(108.91104521868112, 136.487240352298, 24.942917932834582, 2293)
-    femmesh.addNode(101.87209903196201, 123.13515537043389, 24.942917932834582, 2294)
-    femmesh.addNode(109.54715585396684, 109.28188207802998, 25.036903645478375, 2295)
-    femmesh.addNode(102.50820966724774, 95.92979709616588, 25.036903645478375, 2296)
-    femmesh.addNode(236.54366717336507, 75.94011002039403, 24.79829686213714, 2297)
-    femmesh.addNode(210.14675746467054, 76.03720910316494, 49.69820800008824, 2298)
-    femmesh.addNode(207.14026401543413, 65.42314488770451, 24.899911137951108, 2299)
-    femmesh.addNode(240.4734436484227, 53.160925727101414, 26.446997033279096, 2300)
-    femmesh.addNode(214.07653393972817, 53.258024809872325, 51.346908171230204, 2301)
-    femmesh.addNode(243.4799370976591, 63.774989942561845, 51.24529389541624, 2302)
-    femmesh.addNode(157.60835102057212, 82.81790264542087, 24.899911137951108, 2303)
-    femmesh.addNode(180.5575078879376, 92.10578665967844, 49.663192704735124, 2304)
-    femmesh.addNode(147.77686097948353, 78.68991908140369, 49.93681478342948, 2305)
-    femmesh.addNode(81.87464763430944, 148.02958092695258, 49.94291793283459, 2306)
-    femmesh.addNode(57.87640777681475, 133.84176042091642, 75.0, 2307)
-    femmesh.addNode(48.818617667535534, 124.89442555651857, 48.43049266642454, 2308)
-    femmesh.addNode(790.8122603454049, 87.96585270622708, 47.195892816617736, 2309)
-    femmesh.addNode(783.1184767633636, 85.5049384095235, 22.195892816617736, 2310)
-    femmesh.addNode(815.6337468378928, 73.43443718866871, 25.0, 2311)
-    femmesh.addNode(807.1693206272778, 59.96223480095043, 53.18037650362241, 2312)
-    femmesh.addNode(799.4755370452365, 57.50132050424685, 28.180376503622416, 2313)
-    femmesh.addNode(774.6540505527486, 72.03273602180522, 50.376269320240155, 2314)
-    femmesh.addNode(90.17601715944704, 104.87713196056384, 25.036903645478375, 2315)
-    femmesh.addNode(89.53990652416132, 132.08249023483185, 24.942917932834582, 2316)
-    femmesh.addNode(56.483876557387404, 108.94733486439786, 23.43049266642454, 2317)
-    femmesh.addNode(700.4408861976633, 121.60126447920533, 74.99353375460124, 2318)
-    femmesh.addNode(699.5739876725145, 110.61725479565511, 49.92325456337741, 2319)
-    femmesh.addNode(700.5677174725016, 89.1056986300686, 74.92972080877617, 2320)
-    femmesh.addNode(676.9475693751774, 98.62230420279519, 74.99166764190929, 2321)
-    femmesh.addNode(676.0806708500286, 87.63829451924497, 49.921388450685455, 2322)
-    femmesh.addNode(675.9538395751903, 120.1338603683817, 49.98520139651053, 2323)
-    femmesh.addNode(171.941649858333, 95.65623766572986, 24.763281566784013, 2324)
-    femmesh.addNode(172.127496277135, 69.07069497652684, 24.899911137951108, 2325)
-    femmesh.addNode(689.9798804714483, 137.299629767353, 74.99353375460124, 2326)
-    femmesh.addNode(666.4865636489624, 114.32066949094286, 74.99166764190929, 2327)
-    femmesh.addNode(139.16100294987893, 82.2403700874551, 25.036903645478375, 2328)
-    femmesh.addNode(158.88078265732537, 82.63825902957652, 74.89991113795111, 2329)
-    femmesh.addNode(577.9592601392242, 99.3328730534007, 74.9992927502999, 2330)
-    femmesh.addNode(568.9858622755676, 94.90743426535997, 49.99929275029989, 2331)
-    femmesh.addNode(551.3601050090595, 99.01592597439259, 74.99999999999999, 2332)
-    femmesh.addNode(574.3559548565247, 126.14510552909931, 74.99921755857918, 2333)
-    femmesh.addNode(565.382556992868, 121.71966674105856, 49.999217558579154, 2334)
-    femmesh.addNode(591.9817121230327, 122.03661382006668, 49.99851030887906, 2335)
-    femmesh.addNode(577.9592601392243, 99.33287305340075, 24.999292750299897, 2336)
-    femmesh.addNode(551.3601050090596, 99.01592597439263, 24.999999999999986, 2337)
-    femmesh.addNode(574.3559548565247, 126.14510552909934, 24.99921755857917, 2338)
-    femmesh.addNode(437.4619522054735, 111.72756490892641, 74.98348508148507, 2339)
-    femmesh.addNode(431.86328075037073, 120.00097977338552, 50.09584929909801, 2340)
-    femmesh.addNode(432.42901601426564, 139.38359958826723, 75.11236421761295, 2341)
-    femmesh.addNode(459.6108281272107, 140.06566400878526, 75.00272920954467, 2342)
-    femmesh.addNode(454.01215667210795, 148.33907887324438, 50.11509342715761, 2343)
-    femmesh.addNode(459.0450928633158, 120.68304419390356, 49.98621429102973, 2344)
-    femmesh.addNode(766.0653991936111, 152.25690166372556, 74.69304855057015, 2345)
-    femmesh.addNode(762.3626461243083, 174.22729781166328, 59.25570524181053, 2346)
-    femmesh.addNode(776.2972469306959, 178.02960385206228, 84.56265669124039, 2347)
-    femmesh.addNode(804.5610035269176, 154.82988475873077, 79.93485418352924, 2348)
-    femmesh.addNode(800.8582504576148, 176.8002809066685, 64.49751087476963, 2349)
-    femmesh.addNode(790.62640272053, 151.02757871833177, 54.627902734099386, 2350)
-    femmesh.addNode(139.57364142065057, 81.77812480598958, 75.03690364547838, 2351)
-    femmesh.addNode(172.54013474790665, 68.60844969506131, 74.89991113795111, 2352)
-    femmesh.addNode(149.7261536526817, 59.357683883518675, 73.85620885166462, 2353)
-    femmesh.addNode(157.92937321151464, 56.269478158932785, 48.756119989615726, 2354)
-    femmesh.addNode(124.96287988425857, 69.43915326986105, 48.893112497142994, 2355)
-    femmesh.addNode(989.7896995544543, 9.990614287883412, 50.04383879908844, 2356)
-    femmesh.addNode(989.7896995544543, 14.480634378145151, 61.35975704872711, 2357)
-    femmesh.addNode(974.5504551244633, 39.930179253681864, 61.32514507785156, 2358)
-    femmesh.addNode(964.3401546789175, 25.449544875536713, 50.034611970875545, 2359)
-    femmesh.addNode(974.5504551244633, 35.44015916342013, 50.00922682821289, 2360)
-    femmesh.addNode(57.87640777681474, 133.84176042091644, 25.000000000000004, 2361)
-    femmesh.addNode(447.28314843203873, 96.65440467957917, 74.98348508148507, 2362)
-    femmesh.addNode(469.432024353776, 124.99250377943802, 75.00272920954467, 2363)
-    femmesh.addNode(362.87564294882975, 101.8648114303809, 50.045663394393706, 2364)
-    femmesh.addNode(343.16067924415614, 90.58368866650811, 74.70485427159068, 2365)
-    femmesh.addNode(359.71496370467355, 111.28112276387277, 75.34080912280302, 2366)
-    femmesh.addNode(354.01372835341135, 136.06685359033474, 50.22352131848559, 2367)
-    femmesh.addNode(334.29876464873774, 124.78573082646196, 74.88271219568256, 2368)
-    femmesh.addNode(337.45944389289394, 115.36941949297008, 49.58756646727324, 2369)
-    femmesh.addNode(800.114431192291, 96.33500647054265, 75.12303764301237, 2370)
-    femmesh.addNode(812.4690782929068, 99.11201164727811, 50.12303764301237, 2371)
-    femmesh.addNode(810.9728833193183, 73.11834630863683, 75.0, 2372)
-    femmesh.addNode(778.457613244789, 85.18884752949162, 72.19589281661774, 2373)
-    femmesh.addNode(779.9538082183776, 111.1825128681329, 47.31893045963011, 2374)
-    femmesh.addNode(199.88100117960846, 49.843392512353304, 24.899911137951108, 2375)
-    femmesh.addNode(233.21418081259702, 37.58117335175021, 26.446997033279096, 2376)
-    femmesh.addNode(839.4421857368236, 88.58892816905818, 75.0, 2377)
-    femmesh.addNode(838.0577152709446, 97.650163153939, 49.984883675705234, 2378)
-    femmesh.addNode(854.1723705878342, 110.34373983762491, 74.98488367570523, 2379)
-    femmesh.addNode(873.2758035514919, 90.3708596260428, 75.0, 2380)
-    femmesh.addNode(871.8913330856129, 99.43209461092363, 49.984883675705234, 2381)
-    femmesh.addNode(857.1611482346024, 77.6772829423569, 50.0, 2382)
-    femmesh.addNode(102.47274429221093, 123.1351553704339, 74.94291793283458, 2383)
-    femmesh.addNode(109.02823208677367, 136.72719815972383, 74.94291793283458, 2384)
-    femmesh.addNode(103.10885492749665, 95.92979709616588, 75.03690364547838, 2385)
-    femmesh.addNode(109.66434272205939, 109.52183988545582, 75.03690364547838, 2386)
-    femmesh.addNode(149.31351518191005, 59.8199291649842, 23.85620885166462, 2387)
-    femmesh.addNode(794.814673526662, 57.18522962421497, 78.18037650362241, 2388)
-    femmesh.addNode(839.4421857368236, 88.46297863550382, 25.0, 2389)
-    femmesh.addNode(854.1723705878342, 110.21779030407055, 24.984883675705234, 2390)
-    femmesh.addNode(873.2758035514919, 90.24491009248844, 25.0, 2391)
-    femmesh.addNode(200.3716771533698, 32.76012198523771, 49.89991113795111, 2392)
-    femmesh.addNode(219.50932402623866, 17.083270527115598, 25.0, 2393)
-    femmesh.addNode(233.70485678635836, 20.49790282463461, 51.4469970332791, 2394)
-    femmesh.addNode(607.3196462868466, 96.72504681030236, 24.999292750299897, 2395)
-    femmesh.addNode(635.7573989603327, 97.69030618410409, 24.991667641909288, 2396)
-    femmesh.addNode(369.57533008860156, 127.22293912616965, 75.34080912280302, 2397)
-    femmesh.addNode(344.15913103266575, 140.72754718875885, 74.88271219568256, 2398)
-    femmesh.addNode(607.3196462868465, 96.68320867074387, 74.9992927502999, 2399)
-    femmesh.addNode(635.7573989603325, 97.64846804454561, 74.99166764190929, 2400)
-    femmesh.addNode(199.87810497300234, 48.30995168316795, 74.89991113795111, 2401)
-    femmesh.addNode(219.50642781963253, 15.549829697930242, 75.0, 2402)
-    femmesh.addNode(233.2112846059909, 36.04773252256486, 76.4469970332791, 2403)
-    femmesh.addNode(202.0059875332069, 81.97479389556256, 74.89991113795111, 2404)
-    femmesh.addNode(437.3315466333517, 112.03821987654669, 24.983485081485068, 2405)
-    femmesh.addNode(432.29861044214385, 139.6942545558875, 25.112364217612946, 2406)
-    femmesh.addNode(459.4804225550889, 140.37631897640554, 25.002729209544665, 2407)
-    femmesh.addNode(219.84566669472156, 75.73253028610145, 74.79829686213714, 2408)
-    femmesh.addNode(190.44226353679062, 65.21556515341192, 74.89991113795111, 2409)
-    femmesh.addNode(223.77544316977918, 52.95334599280882, 76.4469970332791, 2410)
-    femmesh.addNode(157.4080529567899, 129.678998007774, 24.763281566784013, 2411)
-    femmesh.addNode(123.99129541305014, 143.46848870376726, 24.942917932834582, 2412)
-    femmesh.addNode(202.37252937744, 110.62986273730166, 24.763281566784013, 2413)
-    femmesh.addNode(202.55837579624202, 84.04432004809865, 24.899911137951108, 2414)
-    femmesh.addNode(231.96177895417298, 94.56128518078818, 24.79829686213714, 2415)
-    femmesh.addNode(779.3070641439142, 174.22729781166328, 49.90671560808754, 2416)
-    femmesh.addNode(817.8026684772208, 176.8002809066685, 55.14852124104664, 2417)
-    femmesh.addNode(465.66057691709346, 97.31410003623907, 49.00650572477886, 2418)
-    femmesh.addNode(476.04750840755366, 101.62355962177355, 74.02302064329379, 2419)
-    femmesh.addNode(487.8094528388307, 125.65219913609792, 49.02574985283846, 2420)
-    femmesh.addNode(469.432024353776, 124.99250377943801, 25.002729209544665, 2421)
-    femmesh.addNode(447.2831484320388, 96.65440467957916, 24.983485081485068, 2422)
-    femmesh.addNode(476.04750840755366, 101.62355962177354, 24.023020643293794, 2423)
-    femmesh.addNode(276.0231730484647, 67.86633385157542, 75.31845461189924, 2424)
-    femmesh.addNode(266.01717132884755, 69.05249481491607, 50.116751474036384, 2425)
-    femmesh.addNode(249.5561623422186, 85.36801327251382, 74.79829686213714, 2426)
-    femmesh.addNode(280.2587831575564, 95.48544009399356, 75.47208697703617, 2427)
-    femmesh.addNode(270.25278143793935, 96.67160105733421, 50.270383839173306, 2428)
-    femmesh.addNode(296.71979214418536, 79.16992163639583, 50.79054158893541, 2429)
-    femmesh.addNode(68.8160690651881, 99.9999999999999, 23.43049266642454, 2430)
-    femmesh.addNode(172.35428832910463, 95.19399238426433, 74.76328156678402, 2431)
-    femmesh.addNode(189.92429718804186, 67.11680268938892, 24.899911137951108, 2432)
-    femmesh.addNode(219.3277003459728, 77.63376782207845, 24.79829686213714, 2433)
-    femmesh.addNode(219.10282041897977, 128.42000817141917, 23.218817539477065, 2434)
-    femmesh.addNode(480.00389773304005, 138.38872468970118, 75.00272920954467, 2435)
-    femmesh.addNode(790.8053130829392, 139.19393975665423, 75.12303764301237, 2436)
-    femmesh.addNode(776.8707122765516, 135.39163371625523, 49.81608619358252, 2437)
-    femmesh.addNode(815.366316609858, 137.96461681126044, 55.057891826541606, 2438)
-    femmesh.addNode(456.7126332425249, 79.97306844705028, 74.98348508148507, 2439)
-    femmesh.addNode(463.7774108136474, 73.09982313297363, 49.98348508148506, 2440)
-    femmesh.addNode(483.59382711459364, 60.7279464859792, 74.99999999999999, 2441)
-    femmesh.addNode(457.1282012418751, 57.56178922624662, 70.03386039268494, 2442)
-    femmesh.addNode(464.1929788129976, 50.68854391216996, 45.03386039268494, 2443)
-    femmesh.addNode(437.3117849409288, 69.93366587324104, 45.017345474170014, 2444)
-    femmesh.addNode(989.7896995544543, 190.06481513712674, 50.06898326407537, 2445)
-    femmesh.addNode(989.7896995544543, 185.7508080586435, 61.39472755740862, 2446)
-    femmesh.addNode(964.3896765976131, 174.59997704315884, 50.034611970875545, 2447)
-    femmesh.addNode(974.5999770431588, 160.3507851018024, 61.36011558653307, 2448)
-    femmesh.addNode(974.5999770431588, 164.6647921802856, 50.03437129319981, 2449)
-    femmesh.addNode(591.8427417931442, 103.50968428474955, 24.999292750299897, 2450)
-    femmesh.addNode(588.2394365104446, 130.32191676044815, 24.99921755857917, 2451)
-    femmesh.addNode(220.32301681343733, 147.09167308616034, 73.21881753947707, 2452)
-    femmesh.addNode(591.8427417931441, 103.50541508683541, 74.9992927502999, 2453)
-    femmesh.addNode(588.2394365104444, 130.317647562534, 74.99921755857918, 2454)
-    femmesh.addNode(720.2750214345559, 153.7778718711046, 74.99353375460124, 2455)
-    femmesh.addNode(719.7235781988384, 171.55641032239592, 64.49353375460116, 2456)
-    femmesh.addNode(740.5514432357181, 182.22146154870867, 89.49999999999991, 2457)
-    femmesh.addNode(746.6168424293296, 156.44875936037195, 74.69304855057015, 2458)
-    femmesh.addNode(746.0653991936122, 174.22729781166328, 64.19304855057007, 2459)
-    femmesh.addNode(725.7889773924499, 145.7837081340592, 49.686582305171385, 2460)
-    femmesh.addNode(719.7235781988384, 171.55641032239592, 35.49353375460133, 2461)
-    femmesh.addNode(719.5907580763355, 153.26761168850857, 24.99353375460124, 2462)
-    femmesh.addNode(739.8671798774978, 181.71120136611262, 10.500000000000087, 2463)
-    femmesh.addNode(746.0653991936122, 174.22729781166328, 35.19304855057023, 2464)
-    femmesh.addNode(745.9325790711092, 155.9384991777759, 24.693048550570147, 2465)
-    femmesh.addNode(681.7898847085555, 171.55641032239592, 35.90278993750406, 2466)
-    femmesh.addNode(682.3858786821738, 171.55641032239592, 49.27065015671754, 2467)
-    femmesh.addNode(655.581609950616, 174.82657285878187, 49.28616028623931, 2468)
-    femmesh.addNode(672.6428876661182, 146.3829831811778, 50.00257763872426, 2469)
-    femmesh.addNode(654.9856159769976, 174.82657285878187, 35.91830006702584, 2470)
-    femmesh.addNode(680.087270415487, 154.33138974553168, 24.99353375460124, 2471)
-    femmesh.addNode(662.4299987263664, 182.77497942313576, 10.909256182902821, 2472)
-    femmesh.addNode(653.2830016839291, 157.60155228191763, 25.00904388412302, 2473)
-    femmesh.addNode(486.6193817868177, 115.01978053203669, 74.02302064329379, 2474)
-    femmesh.addNode(203.5974550122273, 15.549829697930242, 84.14809199047411, 2475)
-    femmesh.addNode(184.46270434596457, 32.76012198523771, 59.04800312842522, 2476)
-    femmesh.addNode(10.204477782791898, 185.75080805864354, 61.36658573567645, 2477)
-    femmesh.addNode(10.204477782791898, 190.06481513712674, 50.04084144234321, 2478)
-    femmesh.addNode(35.31005222627333, 174.89442555651857, 50.00647014914339, 2479)
-    femmesh.addNode(25.10557444348143, 164.9592406936453, 50.034371293199825, 2480)
-    femmesh.addNode(25.10557444348143, 160.6452336151621, 61.36011558653307, 2481)
-    femmesh.addNode(327.50174905379833, 68.31429328108517, 74.70485427159068, 2482)
-    femmesh.addNode(319.402770261703, 66.35909636349696, 50.023308883489925, 2483)
-    femmesh.addNode(300.583160827189, 53.5060123115659, 75.31845461189924, 2484)
-    femmesh.addNode(304.8187709362807, 81.12511855398404, 75.47208697703617, 2485)
-    femmesh.addNode(323.6383803707947, 93.9782026059151, 50.17694124862685, 2486)
-    femmesh.addNode(479.9982401263084, 138.40220236252935, 25.002729209544665, 2487)
-    femmesh.addNode(486.6137241800861, 115.0332582048649, 24.023020643293794, 2488)
-    femmesh.addNode(320.4777011266385, 103.39451393940698, 75.47208697703617, 2489)
-    femmesh.addNode(314.7764657753763, 128.18024476586896, 50.35479917271873, 2490)
-    femmesh.addNode(200.82346621837894, 17.083270527115598, 15.228381074192537, 2491)
-    femmesh.addNode(181.68581934551008, 32.76012198523771, 40.12829221214365, 2492)
-    femmesh.addNode(189.73845076923985, 93.70234537859194, 24.763281566784013, 2493)
-    femmesh.addNode(383.04734165195515, 25.48090366155744, 63.07337585134243, 2494)
-    femmesh.addNode(382.44435572651093, 25.48090366155744, 48.86965970293738, 2495)
-    femmesh.addNode(354.51907043991923, 20.494605776899846, 59.054641409159714, 2496)
-    femmesh.addNode(353.91608451447496, 20.494605776899846, 44.850925260754664, 2497)
-    femmesh.addNode(361.6850412076584, 45.97550943845729, 45.16635215945924, 2498)
-    femmesh.addNode(525.2673085003737, 78.76942952902142, 24.999999999999986, 2499)
-    femmesh.addNode(516.5226559155595, 74.2225941791272, 49.99999999999997, 2500)
-    femmesh.addNode(499.40325727053033, 58.40153652179677, 24.99999999999999, 2501)
-    femmesh.addNode(518.8491463605297, 50.056783591680926, 26.44699703327911, 2502)
-    femmesh.addNode(510.1044937757156, 45.5099482417867, 51.446997033279104, 2503)
-    femmesh.addNode(535.9685450055589, 65.87784124901135, 51.4469970332791, 2504)
-    femmesh.addNode(343.16067924415614, 90.58368866650811, 24.70485427159068, 2505)
-    femmesh.addNode(340.79862057613457, 105.693871505678, 24.70485427159068, 2506)
-    femmesh.addNode(318.11564245861695, 118.50469677857686, 25.47208697703617, 2507)
-    femmesh.addNode(320.4777011266385, 103.39451393940698, 25.47208697703617, 2508)
-    femmesh.addNode(10.210300445545844, 14.480634378145156, 61.35975704872707, 2509)
-    femmesh.addNode(10.210300445545844, 9.990614287883414, 50.0438387990884, 2510)
-    femmesh.addNode(25.105574443481434, 35.09618873136485, 50.00922682821288, 2511)
-    femmesh.addNode(35.31587488902728, 25.10557444348143, 50.03461197087552, 2512)
-    femmesh.addNode(25.105574443481434, 39.586208821626585, 61.32514507785155, 2513)
-    femmesh.addNode(421.5756742898426, 124.54244881106136, 25.112364217612946, 2514)
-    femmesh.addNode(403.13013598425505, 135.10962999023596, 50.45317334041597, 2515)
-    femmesh.addNode(397.87546571493476, 111.99506434857096, 25.340809122803027, 2516)
-    femmesh.addNode(426.6086104810504, 96.88641413172054, 24.983485081485068, 2517)
-    femmesh.addNode(408.1630721754629, 107.45359531089514, 50.324294204288094, 2518)
-    femmesh.addNode(492.54177078916223, 78.06897807516799, 49.02302064329378, 2519)
-    femmesh.addNode(485.47699321803975, 84.94222338924465, 74.02302064329379, 2520)
-    femmesh.addNode(662.0529093674959, 182.7000196044491, 88.48083255052143, 2521)
-    femmesh.addNode(681.7828927567299, 171.55641032239592, 63.47436630512266, 2522)
-    femmesh.addNode(679.7171730084422, 154.256429926845, 74.99353375460124, 2523)
-    femmesh.addNode(652.9129042768841, 157.52659246323094, 75.00904388412302, 2524)
-    femmesh.addNode(654.9786240251719, 174.82657285878187, 63.489876434644444, 2525)
-    femmesh.addNode(410.54615264336434, 141.4691969474958, 25.112364217612946, 2526)
-    femmesh.addNode(386.8459440684565, 128.92181248500538, 25.340809122803027, 2527)
-    femmesh.addNode(373.3770781742209, 142.01120375646883, 55.4999130312109, 2528)
-    femmesh.addNode(380.7930948333302, 148.37077071372863, 30.159103908407875, 2529)
-    femmesh.addNode(397.07728674912875, 154.55858821895922, 55.27146812602082, 2530)
-    femmesh.addNode(845.98565575723, 73.94021305611905, 75.0, 2531)
-    femmesh.addNode(879.8192735718983, 75.72214451310367, 75.0, 2532)
-    femmesh.addNode(123.99129541305015, 143.4684887037673, 74.94291793283458, 2533)
-    femmesh.addNode(145.6635636152486, 149.5204459980144, 79.92304590272317, 2534)
-    femmesh.addNode(735.5233074318373, 140.42970773014164, 74.69304855057015, 2535)
-    femmesh.addNode(744.771688463931, 125.3190472532247, 74.69304855057015, 2536)
-    femmesh.addNode(727.2772091009281, 106.45028516630573, 67.005204251366, 2537)
-    femmesh.addNode(734.6363190242205, 129.5858335364076, 41.698252801936135, 2538)
-    femmesh.addNode(718.0288280688344, 121.56094564322268, 67.005204251366, 2539)
-    femmesh.addNode(845.98565575723, 73.94021305611905, 25.0, 2540)
-    femmesh.addNode(879.8192735718983, 75.72214451310367, 25.0, 2541)
-    femmesh.addNode(331.93670598071617, 139.89591366563184, 24.88271219568256, 2542)
-    femmesh.addNode(627.9193094672801, 143.82657285878184, 25.00904388412302, 2543)
-    femmesh.addNode(602.792508702866, 116.61219067218401, 24.999292750299897, 2544)
-    femmesh.addNode(682.6437002437549, 182.6889292473358, 10.909256182902821, 2545)
-    femmesh.addNode(700.3009719328754, 154.24533956973173, 24.99353375460124, 2546)
-    femmesh.addNode(627.9193094672798, 143.82657285878184, 75.00904388412302, 2547)
-    femmesh.addNode(602.7925087028659, 116.61219067218403, 74.9992927502999, 2548)
-    femmesh.addNode(69.41671432543703, 99.99999999999991, 73.43049266642454, 2549)
-    femmesh.addNode(362.42734591082285, 90.58368866650818, 24.70485427159068, 2550)
-    femmesh.addNode(354.3227978641387, 75.83074036562687, 24.70485427159068, 2551)
-    femmesh.addNode(384.37332287651384, 75.4809036615575, 24.592543300820974, 2552)
-    femmesh.addNode(376.2687748298297, 60.72795536067619, 24.592543300820974, 2553)
-    femmesh.addNode(368.26733545400333, 66.06459232806556, 49.297397572411654, 2554)
-    femmesh.addNode(525.2673085003736, 78.76942952902142, 74.99999999999999, 2555)
-    femmesh.addNode(499.4032572705303, 58.40153652179677, 74.99999999999999, 2556)
-    femmesh.addNode(501.2864233739764, 82.61581342506221, 74.02302064329379, 2557)
-    femmesh.addNode(518.4058220190057, 98.43687108239266, 49.023020643293776, 2558)
-    femmesh.addNode(406.60997933177043, 159.32184279545675, 25.112364217612946, 2559)
-    femmesh.addNode(376.8569215217363, 166.22341656168962, 30.159103908407875, 2560)
-    femmesh.addNode(249.28919410874119, 111.11062243855983, 49.27239222226703, 2561)
-    femmesh.addNode(241.70081244031263, 119.11773338349354, 24.474095360129894, 2562)
-    femmesh.addNode(236.43023557354798, 144.9693454291908, 47.69291289960696, 2563)
-    femmesh.addNode(172.35428832910458, 123.49733696461708, 24.763281566784013, 2564)
-    femmesh.addNode(682.400807553888, 182.64878080594562, 88.48083255052143, 2565)
-    femmesh.addNode(700.0650711948342, 154.20519112834154, 74.99353375460124, 2566)
-    femmesh.addNode(437.4697229161974, 80.85474695102235, 74.98348508148507, 2567)
-    femmesh.addNode(437.8852909155476, 58.44346773021868, 70.03386039268494, 2568)
-    femmesh.addNode(752.128064973266, 140.66526538745174, 74.69304855057015, 2569)
-    femmesh.addNode(709.8504094736759, 73.0608444732591, 74.92972080877617, 2570)
-    femmesh.addNode(718.5566987439956, 90.15259391482061, 74.92972080877617, 2571)
-    femmesh.addNode(741.9396527820818, 77.4699954141129, 75.02214124889673, 2572)
-    femmesh.addNode(723.0837729854388, 65.43909044581068, 49.9518620576729, 2573)
-    femmesh.addNode(733.233363511762, 60.37824597255139, 75.02214124889673, 2574)
-    femmesh.addNode(456.7585256311954, 80.01920976212668, 24.983485081485068, 2575)
-    femmesh.addNode(483.63971950326425, 60.7740878010556, 24.99999999999999, 2576)
-    femmesh.addNode(485.52288560671036, 84.98836470432104, 24.023020643293794, 2577)
-    femmesh.addNode(518.8491463605296, 50.056783591680926, 76.4469970332791, 2578)
-    femmesh.addNode(388.14262294983195, 94.19699740140828, 32.51167971877259, 2579)
-    femmesh.addNode(393.9826124930124, 69.67790106296567, 57.10422301959356, 2580)
-    femmesh.addNode(372.03663552732144, 84.78068606791635, 57.216533990363274, 2581)
-    femmesh.addNode(719.7235781988384, 171.55641032239592, 49.993533754601245, 2582)
-    femmesh.addNode(746.0653991936122, 174.22729781166328, 49.69304855057015, 2583)
-    femmesh.addNode(720.8940488751748, 182.22146154870867, 83.71037968382416, 2584)
-    femmesh.addNode(700.066183838295, 171.55641032239592, 58.70391343842539, 2585)
-    femmesh.addNode(501.2864233739764, 82.61581342506221, 24.023020643293794, 2586)
-    femmesh.addNode(180.18583073456776, 109.34566467444071, 24.763281566784013, 2587)
-    femmesh.addNode(180.37167715336977, 82.7601219852377, 24.899911137951108, 2588)
-    femmesh.addNode(145.66356361524856, 149.5204459980144, 29.923045902723167, 2589)
-    femmesh.addNode(666.4361384114127, 114.34745468455927, 24.991667641909288, 2590)
-    femmesh.addNode(675.4969280430186, 98.57745004598581, 24.991667641909288, 2591)
-    femmesh.addNode(698.7767968656692, 121.1285403633178, 17.00520425136599, 2592)
-    femmesh.addNode(707.8375864972751, 105.35853572474434, 17.00520425136599, 2593)
-    femmesh.addNode(684.8011812069609, 103.9359857707301, 41.99687189327528, 2594)
-    femmesh.addNode(801.2929099353731, 22.014559058264286, 62.82168577489239, 2595)
-    femmesh.addNode(804.2616529782856, 39.74626637533805, 78.18037650362241, 2596)
-    femmesh.addNode(814.5434520790373, 17.731707317073766, 84.64130927126998, 2597)
-    femmesh.addNode(835.2189176484922, 22.680872370788833, 57.51000133173949, 2598)
-    femmesh.addNode(838.1876606914047, 40.4125796878626, 72.86869206046951, 2599)
-    femmesh.addNode(824.9371185477407, 44.695431429053116, 51.04906856409193, 2600)
-    femmesh.addNode(689.9294552338986, 137.3264149609694, 24.99353375460124, 2601)
-    femmesh.addNode(708.2944980294468, 126.91494604714023, 41.998738005967226, 2602)
-    femmesh.addNode(340.7785296153563, 75.48713073177402, 74.70485427159068, 2603)
-    femmesh.addNode(318.09555149783876, 88.29795600467288, 75.47208697703617, 2604)
-    femmesh.addNode(59.216131008995, 174.89442555651857, 59.60375492568383, 2605)
-    femmesh.addNode(77.75310826219001, 174.89442555651857, 50.69173208707268, 2606)
-    femmesh.addNode(109.41660700953659, 173.135155370434, 50.634650019907255, 2607)
-    femmesh.addNode(90.87962975634159, 173.135155370434, 59.546672858518406, 2608)
-    femmesh.addNode(720.2447452760825, 181.71120136611262, 14.685831179064476, 2609)
-    femmesh.addNode(700.1011435974233, 171.55641032239592, 39.67936493366572, 2610)
-    femmesh.addNode(790.805313082939, 115.69851911254939, 75.12303764301237, 2611)
-    femmesh.addNode(769.1484951354371, 104.55236017149836, 72.19589281661774, 2612)
-    femmesh.addNode(700.6840986354531, 182.64878080594562, 83.71037968382416, 2613)
-    femmesh.addNode(657.0904098582515, 98.43101655753105, 74.99166764190929, 2614)
-    femmesh.addNode(599.1892034201665, 143.4244231478826, 24.99921755857917, 2615)
-    femmesh.addNode(617.1085128874468, 149.2509960066645, 50.00826144270219, 2616)
-    femmesh.addNode(599.1892034201663, 143.42442314788264, 74.99921755857918, 2617)
-    femmesh.addNode(277.98361029580894, 67.16652242616178, 25.318454611899245, 2618)
-    femmesh.addNode(251.51659958956293, 84.66820184710016, 24.79829686213714, 2619)
-    femmesh.addNode(282.21922040490074, 94.78562866857992, 25.47208697703617, 2620)
-    femmesh.addNode(181.64274084847685, 107.62916763809403, 74.76328156678402, 2621)
-    femmesh.addNode(181.82858726727886, 81.04362494889102, 74.89991113795111, 2622)
-    femmesh.addNode(755.2138943290495, 124.24547477520422, 46.88894136718788, 2623)
-    femmesh.addNode(747.8547844057571, 101.10992640510236, 72.19589281661774, 2624)
-    femmesh.addNode(737.7194149660465, 105.37671268828525, 39.201097067983724, 2625)
-    femmesh.addNode(663.1756117398904, 140.56979230373895, 75.00904388412302, 2626)
-    femmesh.addNode(663.1251865023405, 140.59657749735536, 25.00904388412302, 2627)
-    femmesh.addNode(58.768554840698414, 174.89442555651857, 40.66799133834005, 2628)
-    femmesh.addNode(90.432053588045, 173.135155370434, 40.610909271174634, 2629)
-    femmesh.addNode(709.1814864370638, 137.7588202408743, 74.99353375460124, 2630)
-    femmesh.addNode(92.27561732009181, 77.26392533525892, 79.22142262379361, 2631)
-    femmesh.addNode(103.97713004482262, 73.19372243142497, 54.25832626927199, 2632)
-    femmesh.addNode(70.28498944276299, 77.263925335259, 52.651915290218156, 2633)
-    femmesh.addNode(647.4906861882679, 81.56155440693706, 74.99166764190929, 2634)
-    femmesh.addNode(666.6057630111882, 82.82123300561881, 74.99166764190929, 2635)
-    femmesh.addNode(657.1511094069085, 54.119020298639654, 71.8257842105892, 2636)
-    femmesh.addNode(676.2661862298289, 55.3786988973214, 71.8257842105892, 2637)
-    femmesh.addNode(662.120945971345, 69.71236598367415, 46.81745185249849, 2638)
-    femmesh.addNode(378.9816303713403, 111.28112276387284, 25.340809122803027, 2639)
-    femmesh.addNode(388.5909199878389, 105.47812016528101, 57.85248884157562, 2640)
-    femmesh.addNode(457.1740936305457, 57.607930541323014, 20.03386039268495, 2641)
-    femmesh.addNode(960.1060106800192, 25.449544875536713, 61.33333333333357, 2642)
-    femmesh.addNode(950.6615662355746, 25.449544875536713, 49.999999999999915, 2643)
-    femmesh.addNode(805.3744957004268, 40.49373934566539, 28.180376503622416, 2644)
-    femmesh.addNode(821.5327054930831, 56.426856030087244, 25.0, 2645)
-    femmesh.addNode(841.0953283403969, 60.62854811347497, 47.86869206046951, 2646)
-    femmesh.addNode(839.3005034135458, 41.16005265818994, 22.868692060469517, 2647)
-    femmesh.addNode(367.15593076081836, 23.54204743981196, 88.48083255052146, 2648)
-    femmesh.addNode(374.32190152855753, 49.0229511013694, 74.59254330082098, 2649)
-    femmesh.addNode(345.79363031652156, 44.036653216711805, 70.57380885863826, 2650)
-    femmesh.addNode(700.9549591326225, 182.6889292473358, 14.685831179064476, 2651)
-    femmesh.addNode(758.9079785268588, 85.03891958093567, 72.19589281661774, 2652)
-    femmesh.addNode(775.2650388087318, 57.035301675659014, 78.18037650362241, 2653)
-    femmesh.addNode(769.1484951354371, 74.01817696354101, 22.195892816617736, 2654)
-    femmesh.addNode(785.5055554173101, 46.01455905826436, 28.180376503622416, 2655)
-    femmesh.addNode(407.0364582934264, 94.91093898610642, 32.51167971877259, 2656)
-    femmesh.addNode(819.1392305470604, 18.479180287401107, 15.67623490170624, 2657)
-    femmesh.addNode(804.7758456812552, 22.014559058264286, 43.85661140532866, 2658)
-    femmesh.addNode(838.7018533943742, 22.680872370788833, 38.54492696217576, 2659)
-    femmesh.addNode(657.0904098582516, 98.72388353444055, 24.991667641909288, 2660)
-    femmesh.addNode(708.4213293042851, 94.41938019800351, 41.93492506014216, 2661)
-    femmesh.addNode(709.2882278294339, 105.40338988155372, 67.005204251366, 2662)
-    femmesh.addNode(239.73935591967648, 72.65208711792722, 74.79829686213714, 2663)
-    femmesh.addNode(243.6691323947341, 49.8729028246346, 76.4469970332791, 2664)
-    femmesh.addNode(124.62740604833596, 75.5964637628326, 75.03690364547838, 2665)
-    femmesh.addNode(134.77991828036707, 53.1760228403617, 73.85620885166462, 2666)
-    femmesh.addNode(259.73303176652246, 125.74260916604601, 24.474095360129894, 2667)
-    femmesh.addNode(249.9939982803828, 101.18616096334065, 24.79829686213714, 2668)
-    femmesh.addNode(280.6966190957206, 111.3035877848204, 25.47208697703617, 2669)
-    femmesh.addNode(279.991814924079, 121.22804926003957, 49.946182337166064, 2670)
-    femmesh.addNode(959.9407451680356, 25.449544875536713, 38.90895046279555, 2671)
-    femmesh.addNode(820.4198627709419, 55.6793830597599, 75.0, 2672)
-    femmesh.addNode(776.0224577102202, 175.99999999999994, 16.382110117530356, 2673)
-    femmesh.addNode(793.2416649503018, 175.99999999999994, 25.213667057517394, 2674)
-    femmesh.addNode(762.0878569038327, 174.22729781166328, 41.0751586681005, 2675)
-    femmesh.addNode(766.065399193611, 150.22729781166322, 24.693048550570147, 2676)
-    femmesh.addNode(755.2111609150919, 116.4561445393294, 72.19589281661774, 2677)
-    femmesh.addNode(336.2357793583543, 20.494605776899846, 54.284188542462545, 2678)
-    femmesh.addNode(189.97874984988908, 126.7435343300005, 24.763281566784013, 2679)
-    femmesh.addNode(206.70904089142886, 144.533679764118, 23.218817539477065, 2680)
-    femmesh.addNode(10.210300445545844, 15.068753164479979, 38.7998898095106, 2681)
-    femmesh.addNode(25.105574443481434, 40.17432760796141, 38.765277838635086, 2682)
-    femmesh.addNode(474.5729356391887, 46.465055817276614, 74.99999999999999, 2683)
-    femmesh.addNode(448.10730976647017, 43.29889855754403, 70.03386039268494, 2684)
-    femmesh.addNode(412.8552528623803, 140.0347954574302, 75.11236421761295, 2685)
-    femmesh.addNode(389.1550442874725, 127.48741099493981, 75.34080912280302, 2686)
-    femmesh.addNode(398.3160368659641, 110.40328563247525, 82.5116797187726, 2687)
-    femmesh.addNode(412.29112856274674, 118.0255046277714, 57.62404393638553, 2688)
-    femmesh.addNode(395.382292514039, 59.806076225634236, 24.592543300820974, 2689)
-    femmesh.addNode(399.15159258735713, 78.52216996548502, 32.51167971877259, 2690)
-    femmesh.addNode(370.25033899589965, 123.26181500380625, 25.340809122803027, 2691)
-    femmesh.addNode(353.69605453538225, 102.56438090644158, 24.70485427159068, 2692)
-    femmesh.addNode(324.3179002358469, 138.51055392918016, 74.88271219568256, 2693)
-    femmesh.addNode(310.4968367137477, 117.11933704212518, 75.47208697703617, 2694)
-    femmesh.addNode(160.60979898756324, 143.33878495485743, 29.923045902723167, 2695)
-    femmesh.addNode(541.0633970653846, 84.67306674965076, 24.999999999999986, 2696)
-    femmesh.addNode(534.6452349255406, 55.96042081231026, 26.44699703327911, 2697)
-    femmesh.addNode(863.7534536776927, 58.673409684221745, 22.868692060469517, 2698)
-    femmesh.addNode(874.9289461550652, 62.4104795704596, 47.86869206046951, 2699)
-    femmesh.addNode(635.0493317180128, 59.34233649329791, 75.00000000000001, 2700)
-    femmesh.addNode(640.0191682824493, 74.9356821783324, 49.9916676419093, 2701)
-    femmesh.addNode(649.67959150109, 47.49314807003498, 46.82578421058922, 2702)
-    femmesh.addNode(249.4783894058162, 138.4585353206326, 24.474095360129894, 2703)
-    femmesh.addNode(226.88039738448333, 147.76081010855822, 23.218817539477065, 2704)
-    femmesh.addNode(830.6430066265702, 72.46982775123354, 25.0, 2705)
-    femmesh.addNode(940.095136108011, 174.59997704315884, 41.78703611010683, 2706)
-    femmesh.addNode(929.0604014533524, 174.59997704315884, 55.51711336240706, 2707)
-    femmesh.addNode(904.8873075459023, 167.3765929066173, 56.89812404539477, 2708)
-    femmesh.addNode(925.0268601788678, 141.97656994977615, 51.38101068298771, 2709)
-    femmesh.addNode(915.9220422005612, 167.3765929066173, 43.16804679309455, 2710)
-    femmesh.addNode(603.341624200401, 15.063646052498683, 83.71037968382434, 2711)
-    femmesh.addNode(607.4731367459552, 41.4218781848453, 75.00000000000001, 2712)
-    femmesh.addNode(623.4463012666401, 26.358232132346615, 58.71037968382436, 2713)
-    femmesh.addNode(594.4112499142834, 25.556153700650864, 58.71037968382435, 2714)
-    femmesh.addNode(598.5427624598376, 51.91438583299748, 50.00000000000003, 2715)
-    femmesh.addNode(578.4380853935984, 40.61979975314955, 75.0, 2716)
-    femmesh.addNode(417.32406475395453, 90.36946994843058, 57.495164800257655, 2717)
-    femmesh.addNode(979.8235503792346, 116.81091036486565, 84.82736018586529, 2718)
-    femmesh.addNode(954.4235274223935, 123.75262025274445, 75.0, 2719)
-    femmesh.addNode(974.5999770431588, 142.25824419843892, 59.82736018586529, 2720)
-    femmesh.addNode(968.5965597690036, 117.68905195854688, 58.48647259150986, 2721)
-    femmesh.addNode(943.1965368121625, 124.63076184642568, 48.659112405644564, 2722)
-    femmesh.addNode(948.4201101482383, 99.1834280128524, 73.65911240564458, 2723)
-    femmesh.addNode(107.31851225379148, 173.135155370434, 64.22913224387733, 2724)
-    femmesh.addNode(950.7110881542701, 174.59997704315884, 49.999999999999915, 2725)
-    femmesh.addNode(960.1555325987147, 174.59997704315884, 61.33333333333357, 2726)
-    femmesh.addNode(690.2259111085123, 73.30462743289223, 74.92972080877617, 2727)
-    femmesh.addNode(685.7410940686692, 60.19576041094756, 46.75550501936537, 2728)
-    femmesh.addNode(974.5999770431588, 150.71108815426993, 49.99999999999995, 2729)
-    femmesh.addNode(258.3376866975168, 72.2838673187464, 74.79829686213714, 2730)
-    femmesh.addNode(284.8046974037629, 54.782187897808015, 75.31845461189924, 2731)
-    femmesh.addNode(421.4748967877862, 124.11069685626262, 75.11236421761295, 2732)
-    femmesh.addNode(406.93568079137003, 94.47918703130767, 82.5116797187726, 2733)
-    femmesh.addNode(974.5504551244633, 49.33843376442567, 49.99999999999994, 2734)
-    femmesh.addNode(420.20176680345986, 182.67339948497056, 17.657244808238566, 2735)
-    femmesh.addNode(403.1948070521889, 185.49333556909357, 17.657244808238566, 2736)
-    femmesh.addNode(423.4151722795813, 173.82850722636317, 42.76960902585151, 2737)
-    femmesh.addNode(423.6169390830414, 156.50190671133373, 25.112364217612946, 2738)
-    femmesh.addNode(603.3066644412729, 15.063646052498564, 14.685831179064614, 2739)
-    femmesh.addNode(623.4113415075119, 26.358232132346615, 39.685831179064635, 2740)
-    femmesh.addNode(607.4731367459553, 41.42187818484518, 25.000000000000018, 2741)
-    femmesh.addNode(578.4380853935985, 40.61979975314943, 25.000000000000007, 2742)
-    femmesh.addNode(594.3762901551552, 25.556153700650864, 39.68583117906462, 2743)
-    femmesh.addNode(56.483876557387404, 91.05266513560198, 23.43049266642454, 2744)
-    femmesh.addNode(90.17601715944704, 86.98246223176797, 25.036903645478375, 2745)
-    femmesh.addNode(79.3427795520422, 68.31659047086099, 29.221422623793615, 2746)
-    femmesh.addNode(863.7534536776927, 58.673409684221745, 72.86869206046951, 2747)
-    femmesh.addNode(413.97033267998665, 49.24209698777613, 44.62640369350592, 2748)
-    femmesh.addNode(414.1282706552553, 60.16317806555743, 74.59254330082098, 2749)
-    femmesh.addNode(417.8975707285733, 78.87927180540822, 82.5116797187726, 2750)
-    femmesh.addNode(417.7396327533048, 67.95819072762691, 52.54554011145754, 2751)
-    femmesh.addNode(801.6637652099664, 87.94767574268624, 25.0, 2752)
-    femmesh.addNode(769.1484951354371, 100.01817696354104, 22.195892816617736, 2753)
-    femmesh.addNode(107.50320112950257, 173.135155370434, 35.82910916176714, 2754)
-    femmesh.addNode(699.1170761403428, 89.06084447325922, 24.92972080877617, 2755)
-    femmesh.addNode(830.6430066265702, 72.46982775123354, 75.0, 2756)
-    femmesh.addNode(124.62740604833598, 75.59646376283261, 25.036903645478375, 2757)
-    femmesh.addNode(134.7799182803671, 53.17602284036172, 23.85620885166462, 2758)
-    femmesh.addNode(986.8730434091804, 136.3971291305305, 84.82736018586529, 2759)
-    femmesh.addNode(961.4730204523391, 143.3388390184093, 75.0, 2760)
-    femmesh.addNode(219.5093240262387, 17.083270527115598, 10.500000000000012, 2761)
-    femmesh.addNode(195.56336141522638, 177.13581010855822, 34.293377420664946, 2762)
-    femmesh.addNode(194.30367884262893, 177.13581010855822, 48.91054962654974, 2763)
-    femmesh.addNode(167.08858103214527, 179.18711266468108, 40.99760578391105, 2764)
-    femmesh.addNode(165.82889845954782, 179.18711266468108, 55.61477798979584, 2765)
-    femmesh.addNode(185.357463169134, 156.32292277323933, 53.14186344220023, 2766)
-    femmesh.addNode(178.40943374523238, 18.799019741174845, 15.228381074192537, 2767)
-    femmesh.addNode(177.4669687064619, 51.559141726412555, 24.899911137951108, 2768)
-    femmesh.addNode(959.9902670867311, 174.59997704315884, 38.90895046279555, 2769)
-    femmesh.addNode(893.5658473782667, 167.3765929066173, 42.5323523556925, 2770)
-    femmesh.addNode(405.90343515478423, 43.11334643894068, 74.59254330082098, 2771)
-    femmesh.addNode(429.66045541507657, 41.39363610360193, 70.03386039268494, 2772)
-    femmesh.addNode(308.4075702301473, 61.39295353608374, 25.318454611899245, 2773)
-    femmesh.addNode(335.3261584567567, 76.20123450560303, 24.70485427159068, 2774)
-    femmesh.addNode(312.64318033923905, 89.01205977850188, 25.47208697703617, 2775)
-    femmesh.addNode(262.2674631725744, 49.50468302545379, 76.4469970332791, 2776)
-    femmesh.addNode(269.9469478039052, 46.27331052162345, 51.765451645178345, 2777)
-    femmesh.addNode(253.48593881727624, 62.58882897922119, 76.4469970332791, 2778)
-    femmesh.addNode(366.77804547702465, 49.815181514992936, 24.592543300820974, 2779)
-    femmesh.addNode(347.7405036177937, 55.741657476018595, 20.57380885863826, 2780)
-    femmesh.addNode(338.2497742649888, 44.82888363033534, 20.57380885863826, 2781)
-    femmesh.addNode(603.788906906097, 26.358232132346615, 50.00000000000004, 2782)
-    femmesh.addNode(574.7538555537403, 25.556153700650864, 50.00000000000003, 2783)
-    femmesh.addNode(348.8726396792534, 23.54204743981196, 83.71037968382429, 2784)
-    femmesh.addNode(320.91945480745335, 48.2252103914769, 70.57380885863826, 2785)
-    femmesh.addNode(339.7390642419674, 61.07829444340796, 45.278663130228935, 2786)
-    femmesh.addNode(312.82047601535805, 46.27001347388868, 45.8922634705375, 2787)
-    femmesh.addNode(248.3378025051943, 102.09518168916637, 74.79829686213714, 2788)
-    femmesh.addNode(279.0404233205321, 112.21260851064612, 75.47208697703617, 2789)
-    femmesh.addNode(751.7800930231747, 138.9023276368388, 24.693048550570147, 2790)
-    femmesh.addNode(776.5200069125028, 125.8393657297675, 25.12303764301237, 2791)
-    femmesh.addNode(754.8631889650007, 114.69320678871647, 22.195892816617736, 2792)
-    femmesh.addNode(533.1557397328875, 129.41304944577934, 74.16540027098686, 2793)
-    femmesh.addNode(538.355642830536, 120.86510317423328, 49.16540027098685, 2794)
-    femmesh.addNode(537.1868040477542, 103.1384334578979, 74.99999999999999, 2795)
-    femmesh.addNode(513.2059189213569, 106.9848173539387, 74.02302064329379, 2796)
-    femmesh.addNode(514.3747577041388, 124.71148707027407, 48.188420914280655, 2797)
-    femmesh.addNode(979.8235503792346, 99.15264320958556, 81.29347564430353, 2798)
-    femmesh.addNode(968.5965597690036, 100.0307848032668, 54.95258804994809, 2799)
-    femmesh.addNode(25.10557444348143, 151.0055366676297, 49.99999999999996, 2800)
-    femmesh.addNode(985.5555555555559, 14.480634378145151, 72.65847841118514, 2801)
-    femmesh.addNode(39.57497431025405, 174.89442555651857, 38.72244300083443, 2802)
-    femmesh.addNode(48.99446333237026, 174.89442555651857, 49.99999999999996, 2803)
-    femmesh.addNode(39.64957033830348, 174.89442555651857, 61.3228480431695, 2804)
-    femmesh.addNode(521.5420517955466, 96.46442307414742, 74.99999999999999, 2805)
-    femmesh.addNode(497.5611666691493, 100.31080697018822, 74.02302064329379, 2806)
-    femmesh.addNode(72.88230785063715, 154.7074497607543, 75.0, 2807)
-    femmesh.addNode(81.88728997266928, 179.81302420423572, 84.60375492568383, 2808)
-    femmesh.addNode(104.54580659798373, 152.94817957466972, 74.94291793283458, 2809)
-    femmesh.addNode(602.706955925318, 78.43911178043888, 74.9992927502999, 2810)
-    femmesh.addNode(611.5814156089633, 73.97042280453066, 49.999292750299915, 2811)
-    femmesh.addNode(618.7033541285489, 57.18515324060145, 75.00000000000001, 2812)
-    femmesh.addNode(589.6683027761921, 56.383074808905704, 75.0, 2813)
-    femmesh.addNode(582.5463642566065, 73.16834437283491, 49.9992927502999, 2814)
-    femmesh.addNode(602.706955925318, 78.43911178043892, 24.999292750299897, 2815)
-    femmesh.addNode(618.7033541285491, 57.185153240601494, 25.000000000000018, 2816)
-    femmesh.addNode(589.6683027761923, 56.38307480890574, 25.000000000000007, 2817)
-    femmesh.addNode(295.3802514828251, 72.42155642856166, 75.31845461189924, 2818)
-    femmesh.addNode(299.6158615919169, 100.0406626709798, 75.47208697703617, 2819)
-    femmesh.addNode(39.5500188879259, 25.10557444348143, 61.33333333333329, 2820)
-    femmesh.addNode(48.99446333237039, 25.10557444348143, 49.99999999999995, 2821)
-    femmesh.addNode(732.6912717499881, 60.17583605407317, 25.022141248896727, 2822)
-    femmesh.addNode(752.3818586472003, 76.39642293609242, 47.21803406551446, 2823)
-    femmesh.addNode(738.6064033736634, 83.81576704506261, 22.195892816617736, 2824)
-    femmesh.addNode(718.0288280688344, 89.156125806266, 17.00520425136599, 2825)
-    femmesh.addNode(731.8042833423711, 81.73678169729581, 42.02734550026271, 2826)
-    femmesh.addNode(541.0633970653846, 84.67306674965072, 74.99999999999999, 2827)
-    femmesh.addNode(534.6452349255408, 55.96042081231022, 76.4469970332791, 2828)
-    femmesh.addNode(813.2723132355176, 182.14046116468668, 25.213667057517394, 2829)
-    femmesh.addNode(804.5610035269176, 152.80028090666843, 29.93485418352924, 2830)
-    femmesh.addNode(824.5916518121333, 158.94074207135517, 29.93485418352924, 2831)
-    femmesh.addNode(709.308317711902, 72.85843455478087, 24.92972080877617, 2832)
-    femmesh.addNode(426.50783297899403, 96.4546621769218, 74.98348508148507, 2833)
-    femmesh.addNode(867.4077639894697, 144.5959269769159, 70.66444907496519, 2834)
-    femmesh.addNode(860.0425689489956, 139.06751061841265, 45.649332750670425, 2835)
-    femmesh.addNode(860.1530951624293, 124.93339118100897, 74.98488367570523, 2836)
-    femmesh.addNode(848.3201486283699, 142.0311846764246, 79.93485418352924, 2837)
-    femmesh.addNode(840.9549535878958, 136.50276831792135, 54.91973785923447, 2838)
-    femmesh.addNode(848.2096224149362, 156.16530411382826, 50.59930325849443, 2839)
-    femmesh.addNode(537.1868040477542, 103.13843345789792, 24.999999999999986, 2840)
-    femmesh.addNode(533.1557397328875, 129.41304944577934, 24.165400270986865, 2841)
-    femmesh.addNode(547.3290406941928, 125.29054196227406, 24.165400270986865, 2842)
-    femmesh.addNode(551.0791036757981, 118.54050410686477, 74.99999999999999, 2843)
-    femmesh.addNode(574.0749535232633, 145.66968366157147, 74.99921755857918, 2844)
-    femmesh.addNode(848.4108045470332, 57.20302437933624, 72.86869206046951, 2845)
-    femmesh.addNode(752.9928469031834, 61.39898858994622, 75.02214124889673, 2846)
-    femmesh.addNode(768.7389189290732, 48.39280503081578, 53.20251775251914, 2847)
-    femmesh.addNode(72.88230785063715, 154.70744976075434, 25.000000000000004, 2848)
-    femmesh.addNode(81.4397138043727, 179.81302420423577, 15.667991338340048, 2849)
-    femmesh.addNode(104.54580659798373, 152.94817957466975, 24.942917932834582, 2850)
-    femmesh.addNode(154.65298761123694, 42.30837591486993, 23.85620885166462, 2851)
-    femmesh.addNode(158.87183825028512, 23.50935617369508, 39.08458992585716, 2852)
-    femmesh.addNode(39.71528439990918, 25.10557444348143, 38.90895046279556, 2853)
-    femmesh.addNode(258.07683599133395, 126.65162989187172, 74.4740953601299, 2854)
-    femmesh.addNode(383.04034970012947, 25.48090366155744, 35.501799483723865, 2855)
-    femmesh.addNode(354.51207848809355, 20.494605776899846, 31.48306504154115, 2856)
-    femmesh.addNode(255.44637606462052, 61.88901755380755, 26.446997033279096, 2857)
-    femmesh.addNode(658.3043776587567, 17.225020576864278, 88.48083255052148, 2858)
-    femmesh.addNode(641.7295923482052, 26.358232132346615, 63.4808325505215, 2859)
-    femmesh.addNode(644.1525991227459, 43.583252709210896, 75.00000000000001, 2860)
-    femmesh.addNode(666.2543768116416, 38.35993651455264, 71.8257842105892, 2861)
-    femmesh.addNode(663.8313700371009, 21.134915937688362, 60.306616761110675, 2862)
-    femmesh.addNode(680.7105579555757, 88.91441098480446, 74.92972080877617, 2863)
-    femmesh.addNode(181.15692236404902, 17.617940330341888, 84.14809199047411, 2864)
-    femmesh.addNode(177.4375723248241, 50.3780623155796, 74.89991113795111, 2865)
-    femmesh.addNode(437.74507724822024, 81.1315948414807, 24.983485081485068, 2866)
-    femmesh.addNode(438.16064524757047, 58.720315620677034, 20.03386039268495, 2867)
-    femmesh.addNode(763.2333635117618, 50.37824597255157, 25.022141248896727, 2868)
-    femmesh.addNode(974.5999770431588, 159.8429898069897, 38.97672308682556, 2869)
-    femmesh.addNode(383.0056082050926, 42.81550773227062, 24.592543300820974, 2870)
-    femmesh.addNode(748.8671781736373, 61.45992043112714, 25.022141248896727, 2871)
-    femmesh.addNode(754.7823097973126, 85.09985142211659, 22.195892816617736, 2872)
-    femmesh.addNode(422.1910497988125, 156.50413035047637, 75.11236421761295, 2873)
-    femmesh.addNode(392.4379919887784, 163.40570411670922, 80.15910390840787, 2874)
-    femmesh.addNode(383.10219505234613, 146.93636922366306, 80.15910390840787, 2875)
-    femmesh.addNode(884.1860282371606, 132.6074966763734, 76.38101068298771, 2876)
-    femmesh.addNode(876.8208331966865, 127.07908031787017, 51.36589435869294, 2877)
-    femmesh.addNode(884.0755020237269, 146.74161611377707, 47.0454597579529, 2878)
-    femmesh.addNode(713.9929285340122, 53.636372718188895, 30.166232752982083, 2879)
-    femmesh.addNode(724.5398960966174, 37.785617088258746, 30.166232752982083, 2880)
-    femmesh.addNode(704.7854187193014, 37.21805116410496, 30.166232752982083, 2881)
-    femmesh.addNode(985.5555555555559, 185.7508080586435, 72.69344891986665, 2882)
-    femmesh.addNode(292.3123089394014, 57.677906947921414, 25.318454611899245, 2883)
-    femmesh.addNode(296.5479190484932, 85.29701319033956, 25.47208697703617, 2884)
-    femmesh.addNode(459.1397009477323, 180.6748353812733, 89.5, 2885)
-    femmesh.addNode(442.55487322731375, 154.50334260763648, 75.11236421761295, 2886)
-    femmesh.addNode(443.41517227958144, 173.82850722636317, 64.61236421761295, 2887)
-    femmesh.addNode(470.5969843925265, 174.5105716468812, 64.50272920954467, 2888)
-    femmesh.addNode(469.7366853402588, 155.18540702815451, 75.00272920954467, 2889)
-    femmesh.addNode(822.6654916498778, 89.1358478779765, 75.0, 2890)
-    femmesh.addNode(811.8070395228506, 112.35250803988234, 75.12303764301237, 2891)
-    femmesh.addNode(987.2140757550533, 64.9426500615138, 84.61753713377621, 2892)
-    femmesh.addNode(979.8235503792346, 82.88303067503776, 84.61753713377621, 2893)
-    femmesh.addNode(974.5504551244633, 59.179932340988884, 59.617537133776196, 2894)
-    femmesh.addNode(954.3740055036978, 74.60218808512231, 75.0, 2895)
-    femmesh.addNode(961.7645308795165, 56.66180747159835, 75.0, 2896)
-    femmesh.addNode(307.61828825081113, 142.24606257378792, 74.88271219568256, 2897)
-    femmesh.addNode(293.7972247287119, 120.85484568673294, 75.47208697703617, 2898)
-    femmesh.addNode(288.4308895563678, 148.05152898815186, 69.57276054007556, 2899)
-    femmesh.addNode(295.58906708093303, 133.9857111802329, 45.044847517111734, 2900)
-    femmesh.addNode(309.41013060303226, 155.37692806728788, 44.45547273575812, 2901)
-    femmesh.addNode(175.6734680579874, 182.36110435876293, 11.07455988118788, 2902)
-    femmesh.addNode(193.94235019497614, 159.49691446732115, 23.218817539477065, 2903)
-    femmesh.addNode(165.46756981189503, 161.548217023444, 29.923045902723167, 2904)
-    femmesh.addNode(521.5420517955466, 96.46442307414745, 24.999999999999986, 2905)
-    femmesh.addNode(497.5611666691494, 100.31080697018824, 24.023020643293794, 2906)
-    femmesh.addNode(743.2382393125932, 44.325080424143025, 25.022141248896727, 2907)
-    femmesh.addNode(727.7683838075491, 46.2170286092187, 55.18837400187881, 2908)
-    femmesh.addNode(334.19623536901145, 55.398047842165745, 70.57380885863826, 2909)
-    femmesh.addNode(547.0480393609314, 144.8151200947462, 74.16540027098686, 2910)
-    femmesh.addNode(561.3514926780013, 147.99428272894, 49.16461782956603, 2911)
-    femmesh.addNode(418.7237447749811, 80.49764511109915, 24.983485081485068, 2912)
-    femmesh.addNode(766.065399193611, 128.7614810196207, 74.69304855057015, 2913)
-    femmesh.addNode(259.5141137974404, 154.01614901506287, 24.474095360129894, 2914)
-    femmesh.addNode(246.27244884713832, 167.8335353206326, 49.68776241764729, 2915)
-    femmesh.addNode(246.7583350496979, 186.18261369443024, 25.213667057517398, 2916)
-    femmesh.addNode(236.91612177610756, 163.3184238029885, 23.218817539477065, 2917)
-    femmesh.addNode(223.67445682580546, 177.13581010855822, 48.43248459699446, 2918)
-    femmesh.addNode(423.4151722795814, 173.82850722636317, 60.349113475932725, 2919)
-    femmesh.addNode(418.775877519231, 182.6756231241132, 85.23674925831978, 2920)
-    femmesh.addNode(393.6621144695472, 180.73008099259604, 65.39585316672765, 2921)
-    femmesh.addNode(368.35625179837587, 138.43371140323748, 25.340809122803027, 2922)
-    femmesh.addNode(342.94005274244, 151.93831946582668, 24.88271219568256, 2923)
-    femmesh.addNode(344.83413993996385, 136.76642306639542, 24.88271219568256, 2924)
-    femmesh.addNode(943.1470148934669, 75.48032967880353, 48.659112405644564, 2925)
-    femmesh.addNode(968.5965597690036, 83.76117226871898, 58.276649539420774, 2926)
-    femmesh.addNode(443.41517227958144, 173.82850722636317, 50.11236421761295, 2927)
-    femmesh.addNode(470.5969843925265, 174.5105716468812, 50.00272920954467, 2928)
-    femmesh.addNode(164.91784030893854, 32.76012198523771, 51.1257646680974, 2929)
-    femmesh.addNode(161.612058327023, 17.617940330341888, 76.2258535301463, 2930)
-    femmesh.addNode(154.62359122959913, 41.12729650403696, 73.85620885166462, 2931)
-    femmesh.addNode(142.10385921371358, 23.50935617369508, 50.082062381810914, 2932)
-    femmesh.addNode(834.2099344054059, 17.731707317073766, 77.67162072591378, 2933)
-    femmesh.addNode(854.885399974861, 22.680872370788833, 50.54031278638331, 2934)
-    femmesh.addNode(657.9272882998864, 17.29998039555096, 10.909256182902897, 2935)
-    femmesh.addNode(643.7825017157011, 43.658212527897575, 25.000000000000018, 2936)
-    femmesh.addNode(641.7226003963796, 26.358232132346615, 35.909256182902915, 2937)
-    femmesh.addNode(663.8243780852753, 21.134915937688362, 32.7350403934921, 2938)
-    femmesh.addNode(665.8842794045968, 38.43489633323932, 21.8257842105892, 2939)
-    femmesh.addNode(219.50642781963253, 15.549829697930242, 89.5, 2940)
-    femmesh.addNode(837.3956765008884, 110.13496234521702, 24.984883675705234, 2941)
-    femmesh.addNode(822.6654916498778, 88.38015067665029, 25.0, 2942)
-    femmesh.addNode(25.10557444348143, 160.13743832034945, 38.97672308682556, 2943)
-    femmesh.addNode(820.6162576894978, 127.42312997689645, 25.12303764301237, 2944)
-    femmesh.addNode(827.1992631439174, 120.86682331584484, 50.1079213187176, 2945)
-    femmesh.addNode(846.2048946675357, 125.96128148355734, 24.984883675705234, 2946)
-    femmesh.addNode(834.3719481334763, 143.05907497897297, 29.93485418352924, 2947)
-    femmesh.addNode(639.3936323207865, 16.696810313964964, 10.909256182902897, 2948)
-    femmesh.addNode(625.2488457366013, 43.055042446311575, 25.000000000000018, 2949)
-    femmesh.addNode(375.8326454855277, 17.334604070713173, 10.90925618290289, 2950)
-    femmesh.addNode(354.4773369930566, 37.829209847613015, 20.57380885863826, 2951)
-    femmesh.addNode(639.4623071737863, 16.684317010850513, 88.48083255052148, 2952)
-    femmesh.addNode(625.3105286377754, 43.04254914319713, 75.00000000000001, 2953)
-    femmesh.addNode(392.46852728268516, 58.649965986907276, 74.59254330082098, 2954)
-    femmesh.addNode(396.2378273560032, 77.36605972675807, 82.5116797187726, 2955)
-    femmesh.addNode(837.3956765008884, 110.89065954654323, 74.98488367570523, 2956)
-    femmesh.addNode(25.105574443481434, 48.994463332370394, 49.99999999999995, 2957)
-    femmesh.addNode(298.2132406485379, 14.347407015113228, 89.5, 2958)
-    femmesh.addNode(314.96483993541676, 15.128242787036944, 89.5, 2959)
-    femmesh.addNode(296.24209101754684, 25.77540769698884, 64.81845461189924, 2960)
-    femmesh.addNode(311.2069309529636, 40.90365048402578, 75.31845461189924, 2961)
-    femmesh.addNode(294.4553316660847, 40.12281471210207, 75.31845461189924, 2962)
-    femmesh.addNode(459.1397009477323, 180.67483538127328, 10.5, 2963)
-    femmesh.addNode(443.41517227958144, 173.82850722636317, 35.61236421761295, 2964)
-    femmesh.addNode(442.55487322731375, 154.50334260763645, 25.112364217612946, 2965)
-    femmesh.addNode(469.7366853402588, 155.1854070281545, 25.002729209544665, 2966)
-    femmesh.addNode(470.5969843925265, 174.5105716468812, 35.50272920954467, 2967)
-    femmesh.addNode(942.6135716331121, 25.449544875536713, 60.38527348122287, 2968)
-    femmesh.addNode(177.21205915343637, 141.70676903320367, 24.763281566784013, 2969)
-    femmesh.addNode(14.543995894822046, 185.75080805864354, 72.68296362970257, 2970)
-    femmesh.addNode(763.702753069303, 17.694879010977196, 84.56265669124033, 2971)
-    femmesh.addNode(779.9734541642727, 17.694879010977196, 89.32840305927262, 2972)
-    femmesh.addNode(785.4790095815838, 22.014559058264286, 67.50877956289503, 2973)
-    femmesh.addNode(785.5055554173105, 39.709438069241486, 78.18037650362241, 2974)
-    femmesh.addNode(769.2083084866142, 22.014559058264286, 62.74303319486275, 2975)
-    femmesh.addNode(747.854784405757, 99.6821247233058, 22.195892816617736, 2976)
-    femmesh.addNode(727.2772091009278, 105.02248348450917, 17.00520425136599, 2977)
-    femmesh.addNode(109.54715585396698, 82.58613495106329, 25.036903645478375, 2978)
-    femmesh.addNode(98.71391824656214, 63.92026319015632, 29.221422623793615, 2979)
-    femmesh.addNode(888.1090432982114, 179.36502320715977, 51.181562437372264, 2980)
-    femmesh.addNode(876.7875831305757, 179.36502320715977, 36.81579074766999, 2981)
-    femmesh.addNode(666.2296076648557, 82.84638118272754, 24.991667641909288, 2982)
-    femmesh.addNode(647.3560302458427, 81.6361054761667, 24.991667641909288, 2983)
-    femmesh.addNode(675.8900308834964, 55.403847074430125, 21.8257842105892, 2984)
-    femmesh.addNode(657.0164534644834, 54.193571367869296, 21.8257842105892, 2985)
-    femmesh.addNode(241.14842417727752, 117.04820723095743, 74.4740953601299, 2986)
-    femmesh.addNode(373.689572297965, 163.44414053676638, 80.15910390840787, 2987)
-    femmesh.addNode(463.2211755861098, 19.53770523132534, 83.6178898824696, 2988)
-    femmesh.addNode(479.3068446326372, 26.927350585951274, 58.61788988246958, 2989)
-    femmesh.addNode(452.84121875991866, 23.761193326218688, 53.65175027515454, 2990)
-    femmesh.addNode(98.32617247011918, 179.81302420423572, 89.28621431104274, 2991)
-    femmesh.addNode(974.5504551244633, 40.518298040016695, 38.76527783863509, 2992)
-    femmesh.addNode(790.8053130829392, 111.16433590459206, 25.12303764301237, 2993)
-    femmesh.addNode(98.51086134583028, 179.81302420423577, 10.88619122893256, 2994)
-    femmesh.addNode(379.47275212601323, 111.66117589141714, 75.34080912280302, 2995)
-    femmesh.addNode(362.91846766549577, 90.96374179405248, 74.70485427159068, 2996)
-    femmesh.addNode(14.444444444444471, 14.480634378145156, 72.65847841118484, 2997)
-    femmesh.addNode(496.84574686698966, 183.19490017697308, 85.23674925831978, 2998)
-    femmesh.addNode(487.44273125951617, 157.70547182385428, 75.00272920954467, 2999)
-    femmesh.addNode(490.5969843925265, 174.5105716468812, 60.239478467864444, 3000)
-    femmesh.addNode(517.1622892578346, 173.56985958105736, 59.40214952930664, 3001)
-    femmesh.addNode(507.75927365036114, 148.08043122793856, 49.16812948053153, 3002)
-    femmesh.addNode(514.0080361248242, 156.76475975803044, 74.16540027098686, 3003)
-    femmesh.addNode(513.2059189213569, 106.98481735393872, 24.023020643293794, 3004)
-    femmesh.addNode(56.48387655738742, 91.052665135602, 73.43049266642454, 3005)
-    femmesh.addNode(79.3427795520422, 68.316590470861, 79.22142262379361, 3006)
-    femmesh.addNode(246.04189210128942, 181.1075607943281, 75.2136670575174, 3007)
-    femmesh.addNode(258.79767084903193, 148.9410961149607, 74.4740953601299, 3008)
-    femmesh.addNode(236.19967882769907, 158.2433709028863, 73.21881753947707, 3009)
-    femmesh.addNode(860.1950854308816, 125.01342591401848, 24.984883675705234, 3010)
-    femmesh.addNode(872.6636617101881, 111.70860857239313, 24.984883675705234, 3011)
-    femmesh.addNode(884.2280185056129, 132.6875314093829, 26.381010682987707, 3012)
-    femmesh.addNode(896.6965947849194, 119.38271406775756, 26.381010682987707, 3013)
-    femmesh.addNode(853.4595634945761, 145.62381727946428, 20.664449074965194, 3014)
-    femmesh.addNode(843.679267173233, 161.50548437184648, 20.664449074965194, 3015)
-    femmesh.addNode(623.3160444900776, 75.47108827046493, 25.000000000000018, 3016)
-    femmesh.addNode(623.3160444900775, 75.42925013090644, 75.00000000000001, 3017)
-    femmesh.addNode(25.10557444348143, 142.55269271179867, 59.827360185865274, 3018)
-    femmesh.addNode(37.46767146399256, 144.0775902695931, 75.0, 3019)
-    femmesh.addNode(12.362097020511127, 136.84143186835462, 84.82736018586527, 3020)
-    femmesh.addNode(23.7130432240541, 117.6582671552801, 58.257852852289815, 3021)
-    femmesh.addNode(36.075140244565226, 119.1831647130745, 73.43049266642454, 3022)
-    femmesh.addNode(490.5969843925265, 174.5105716468812, 42.65997401778311, 3023)
-    femmesh.addNode(487.4427312595162, 157.70547182385428, 25.002729209544665, 3024)
-    femmesh.addNode(496.84574686698966, 183.19490017697308, 17.657244808238442, 3025)
-    femmesh.addNode(517.1622892578346, 173.56985958105736, 41.82264507922531, 3026)
-    femmesh.addNode(514.0080361248243, 156.76475975803044, 24.165400270986865, 3027)
-    femmesh.addNode(700.1008078971912, 56.44011300069694, 24.92972080877617, 3028)
-    femmesh.addNode(704.3854297694629, 58.89962710992641, 55.09595356175825, 3029)
-    femmesh.addNode(804.9739769492762, 126.13068193878303, 25.12303764301237, 3030)
-    femmesh.addNode(818.7296673932547, 141.76662694085957, 29.93485418352924, 3031)
-    femmesh.addNode(263.21686686674406, 167.8335353206326, 59.03675205137023, 3032)
-    femmesh.addNode(263.4916560872196, 167.8335353206326, 40.85620547766029, 3033)
-    femmesh.addNode(278.8141190235981, 180.59119724082592, 54.1354172313159, 3034)
-    femmesh.addNode(279.08890824407365, 180.59119724082592, 35.95487065760595, 3035)
-    femmesh.addNode(274.6254797517349, 148.42473256145848, 44.04685590020546, 3036)
-    femmesh.addNode(263.9775422897792, 186.18261369443024, 16.382110117530395, 3037)
-    femmesh.addNode(811.8070395228506, 111.59681083855611, 25.12303764301237, 3038)
-    femmesh.addNode(848.4108045470332, 57.20302437933624, 22.868692060469517, 3039)
-    femmesh.addNode(57.876407776814744, 66.15823957908341, 25.0, 3040)
-    femmesh.addNode(48.818617667535534, 75.10557444348143, 48.43049266642454, 3041)
-    femmesh.addNode(71.67752066219032, 52.36949977874043, 54.221422623793615, 3042)
-    femmesh.addNode(862.5436009459845, 161.40504106279027, 70.66444907496519, 3043)
-    femmesh.addNode(843.4559855848847, 158.84029876229897, 79.93485418352924, 3044)
-    femmesh.addNode(272.83363739951375, 135.29386706795856, 74.4740953601299, 3045)
-    femmesh.addNode(856.8660459247601, 40.17785938414016, 72.86869206046951, 3046)
-    femmesh.addNode(64.92739185243903, 187.63790297948884, 84.60375492568383, 3047)
-    femmesh.addNode(55.9224097304069, 162.5323285360074, 75.0, 3048)
-    femmesh.addNode(940.0456141893155, 25.449544875536713, 41.78703611010683, 3049)
-    femmesh.addNode(680.7105579555757, 89.20727796171396, 24.92972080877617, 3050)
-    femmesh.addNode(316.5783849978112, 20.494605776899846, 60.07380885863826, 3051)
-    femmesh.addNode(331.543224933228, 35.62284856393679, 70.57380885863826, 3052)
-    femmesh.addNode(689.8497557621799, 73.32977561000095, 24.92972080877617, 3053)
-    femmesh.addNode(15.044310117948143, 117.65826715528002, 84.82736018586527, 3054)
-    femmesh.addNode(38.75735334200225, 99.99999999999991, 73.43049266642454, 3055)
-    femmesh.addNode(709.7235781988377, 137.55641032239603, 24.99353375460124, 3056)
-    femmesh.addNode(736.0653991936115, 140.2272978116634, 24.693048550570147, 3057)
-    femmesh.addNode(641.1266064227609, 26.358232132346615, 49.27711640211645, 3058)
-    femmesh.addNode(663.2283841116566, 21.134915937688362, 46.10290061270564, 3059)
-    femmesh.addNode(440.20176680346, 182.67339948497056, 10.5, 3060)
-    femmesh.addNode(553.4595361885308, 173.56985958105736, 58.728056962227164, 3061)
-    femmesh.addNode(537.1622892578346, 173.56985958105736, 49.165400270986865, 3062)
-    femmesh.addNode(580.4864503508628, 174.42442314788264, 59.56187424981947, 3063)
-    femmesh.addNode(564.1892034201666, 174.42442314788264, 49.99921755857917, 3064)
-    femmesh.addNode(328.74386421041174, 56.11215161599475, 20.57380885863826, 3065)
-    femmesh.addNode(867.449754257922, 144.6759617099254, 20.664449074965194, 3066)
-    femmesh.addNode(634.9146757755877, 59.41688756252755, 25.000000000000018, 3067)
-    femmesh.addNode(747.2109058015412, 26.37824597255149, 41.40425136642702, 3068)
-    femmesh.addNode(743.9824180906096, 17.946834451591535, 16.382110117530296, 3069)
-    femmesh.addNode(728.5125625855654, 19.838782636667215, 46.54834287051238, 3070)
-    femmesh.addNode(262.98631012089515, 181.1075607943281, 84.56265669124033, 3071)
-    femmesh.addNode(634.4551899952164, 158.11340936597378, 25.00904388412302, 3072)
-    femmesh.addNode(626.1609744175821, 174.82657285878187, 50.222710941640415, 3073)
-    femmesh.addNode(614.7775454782382, 183.2868365071919, 25.21366705751739, 3074)
-    femmesh.addNode(605.7250839481028, 157.71125965507454, 24.99921755857917, 3075)
-    femmesh.addNode(597.4308683704685, 174.42442314788264, 50.21288461609656, 3076)
-    femmesh.addNode(763.2333635117618, 26.37824597255149, 35.52214124889687, 3077)
-    femmesh.addNode(763.2333635117618, 26.37824597255149, 50.02214124889673, 3078)
-    femmesh.addNode(785.5055554173101, 22.014559058264286, 38.68037650362256, 3079)
-    femmesh.addNode(785.5055554173101, 22.014559058264286, 53.18037650362241, 3080)
-    femmesh.addNode(158.80155696119158, 18.799019741174845, 11.426680824203824, 3081)
-    femmesh.addNode(139.26396146624433, 23.50935617369508, 35.28288967586845, 3082)
-    femmesh.addNode(375.8972072466648, 63.87982465315185, 74.59254330082098, 3083)
-    femmesh.addNode(353.9512302809738, 78.98260965810252, 74.70485427159068, 3084)
-    femmesh.addNode(379.6665073199829, 82.59591839300263, 82.5116797187726, 3085)
-    femmesh.addNode(57.04245793483241, 25.10557444348143, 60.38527348122283, 3086)
-    femmesh.addNode(55.922409730406855, 37.467671463992524, 75.0, 3087)
-    femmesh.addNode(62.753718778276394, 12.362097020511092, 85.38527348122284, 3088)
-    femmesh.addNode(78.50882971005987, 27.263925335259, 64.60669610501645, 3089)
-    femmesh.addNode(77.38878150563431, 39.62602235577009, 79.22142262379361, 3090)
-    femmesh.addNode(15.044310117948143, 99.99999999999994, 81.29347564430347, 3091)
-    femmesh.addNode(23.7130432240541, 100.00000000000001, 54.72396831072801, 3092)
-    femmesh.addNode(64.47981568414241, 187.6379029794889, 15.667991338340048, 3093)
-    femmesh.addNode(55.922409730406855, 162.53232853600747, 25.000000000000004, 3094)
-    femmesh.addNode(380.02745782841765, 182.71405954417034, 89.4999999999999, 3095)
-    femmesh.addNode(398.775877519231, 182.6756231241132, 89.4999999999999, 3096)
-    femmesh.addNode(373.6621144695472, 180.73008099259604, 69.65910390840777, 3097)
-    femmesh.addNode(621.1790160922212, 16.684317010850513, 83.71037968382434, 3098)
-    femmesh.addNode(942.6630935518077, 174.59997704315884, 60.38527348122287, 3099)
-    femmesh.addNode(634.3935070940422, 158.10091606285943, 75.00904388412302, 3100)
-    femmesh.addNode(614.7158625770641, 183.27434320407755, 75.2136670575174, 3101)
-    femmesh.addNode(605.6634010469287, 157.6987663519602, 74.99921755857918, 3102)
-    femmesh.addNode(362.3034025632495, 157.88266963196077, 30.159103908407875, 3103)
-    femmesh.addNode(934.8627865122753, 158.12672857455237, 24.999999999999996, 3104)
-    femmesh.addNode(925.7579685339688, 183.52675153139353, 16.787036110106836, 3105)
-    femmesh.addNode(910.6896926048255, 150.9033444380108, 26.381010682987707, 3106)
-    femmesh.addNode(891.7670946738458, 91.73572836081104, 25.0, 3107)
-    femmesh.addNode(895.9242661603442, 107.10620010628806, 51.38101068298771, 3108)
-    femmesh.addNode(852.8883196387612, 17.496987013351326, 77.67162072591378, 3109)
-    femmesh.addNode(986.8730434091804, 153.98187473908126, 13.976723086825558, 3110)
-    femmesh.addNode(986.8730434091804, 144.8499730863615, 24.999999999999954, 3111)
-    femmesh.addNode(961.4730204523391, 143.3388390184093, 24.999999999999996, 3112)
-    femmesh.addNode(846.2048946675357, 125.96128148355734, 74.98488367570523, 3113)
-    femmesh.addNode(820.6162576894978, 127.42312997689645, 75.12303764301237, 3114)
-    femmesh.addNode(37.46767146399253, 55.9224097304068, 75.0, 3115)
-    femmesh.addNode(25.105574443481434, 58.835961908933626, 59.617537133776175, 3116)
-    femmesh.addNode(12.362097020511095, 64.54722275237756, 84.61753713377618, 3117)
-    femmesh.addNode(36.0751402445652, 80.81683528692537, 73.43049266642454, 3118)
-    femmesh.addNode(23.7130432240541, 83.7303874654522, 58.048029800200716, 3119)
-    femmesh.addNode(914.8662714182142, 102.03690596440708, 73.65911240564458, 3120)
-    femmesh.addNode(914.0939427936389, 89.76039200293758, 48.65911240564457, 3121)
-    femmesh.addNode(891.7670946738458, 91.73572836081104, 75.0, 3122)
-    femmesh.addNode(896.6965947849194, 119.38271406775756, 76.38101068298771, 3123)
-    femmesh.addNode(919.0234429047125, 117.40737770988412, 50.04012308863228, 3124)
-    femmesh.addNode(987.2140757550533, 55.101151484950606, 24.99999999999995, 3125)
-    femmesh.addNode(987.2140757550533, 46.28101576054162, 13.765277838635095, 3126)
-    femmesh.addNode(961.7645308795165, 56.66180747159835, 24.999999999999996, 3127)
-    femmesh.addNode(352.37592456286654, 64.12573610632008, 74.70485427159068, 3128)
-    femmesh.addNode(275.11136595429446, 166.77381093525617, 19.57276054007556, 3129)
-    femmesh.addNode(934.8627865122753, 158.12672857455237, 75.0, 3130)
-    femmesh.addNode(914.72323387931, 183.52675153139353, 80.51711336240706, 3131)
-    femmesh.addNode(910.6896926048255, 150.9033444380108, 76.38101068298771, 3132)
-    femmesh.addNode(588.1250884600537, 85.091304564466, 74.9992927502999, 3133)
-    femmesh.addNode(575.086435310928, 63.035267592932826, 75.0, 3134)
-    femmesh.addNode(522.1622892578346, 142.56985958105733, 74.16540027098686, 3135)
-    femmesh.addNode(502.2124684463041, 120.14162748921669, 74.02302064329379, 3136)
-    femmesh.addNode(588.1250884600537, 85.0978913269621, 24.999292750299897, 3137)
-    femmesh.addNode(575.086435310928, 63.041854355428924, 25.000000000000007, 3138)
-    femmesh.addNode(872.6636617101881, 111.70860857239313, 74.98488367570523, 3139)
-    femmesh.addNode(274.39492300588597, 161.69875803515401, 69.57276054007556, 3140)
-    femmesh.addNode(746.9361165810658, 26.37824597255149, 59.584797940137065, 3141)
-    femmesh.addNode(763.233363511762, 44.073124983528686, 75.02214124889673, 3142)
-    femmesh.addNode(621.082373431919, 16.696810313964964, 14.685831179064614, 3143)
-    femmesh.addNode(553.1847469680554, 173.56985958105736, 40.547510388517246, 3144)
-    femmesh.addNode(580.2116611303873, 174.42442314788264, 41.38132767610955, 3145)
-    femmesh.addNode(403.4151722795814, 173.82850722636317, 50.11236421761295, 3146)
-    femmesh.addNode(373.6621144695472, 180.73008099259604, 55.15910390840787, 3147)
-    femmesh.addNode(686.1410830185077, 38.51418446512611, 21.8257842105892, 3148)
-    femmesh.addNode(690.4257048907795, 40.97369857435558, 51.99201696357129, 3149)
-    femmesh.addNode(76.35641087673176, 12.362097020511092, 80.51711336240706, 3150)
-    femmesh.addNode(92.11152180851522, 27.263925335259, 59.738535986200674, 3151)
-    femmesh.addNode(363.52248085347526, 146.6718973548929, 80.15910390840787, 3152)
-    femmesh.addNode(347.9608791182851, 155.515811819058, 55.04181610409044, 3153)
-    femmesh.addNode(397.81498954318033, 25.48090366155744, 59.00920996748755, 3154)
-    femmesh.addNode(413.5051122782702, 17.63244277738324, 84.41666666666657, 3155)
-    femmesh.addNode(421.5720098034727, 23.761193326218688, 54.45052705935152, 3156)
-    femmesh.addNode(799.8689402831153, 18.479180287401107, 10.500000000000146, 3157)
-    femmesh.addNode(903.4017737116742, 183.52675153139353, 16.151341672704795, 3158)
-    femmesh.addNode(893.9114283571346, 162.8917747385533, 20.664449074965194, 3159)
-    femmesh.addNode(479.03205541216164, 26.927350585951274, 40.43734330875965, 3160)
-    femmesh.addNode(452.5664295394431, 23.761193326218688, 35.47120370144461, 3161)
-    femmesh.addNode(65.3216762220731, 12.362097020511094, 16.787036110106868, 3162)
-    femmesh.addNode(82.28157434230337, 20.186975795764308, 16.787036110106868, 3163)
-    femmesh.addNode(72.88230785063715, 45.29255023924574, 25.0, 3164)
-    femmesh.addNode(59.6104153786291, 25.10557444348143, 41.78703611010687, 3165)
-    femmesh.addNode(55.92240973040686, 37.467671463992524, 25.0, 3166)
-    femmesh.addNode(15.044310117948143, 83.73038746545211, 84.61753713377618, 3167)
-    femmesh.addNode(554.6238990464235, 62.9339768571257, 25.000000000000007, 3168)
-    femmesh.addNode(555.9472091264417, 72.85139729382679, 49.99999999999999, 3169)
-    femmesh.addNode(549.5290469865979, 44.138751356486296, 51.44699703327912, 3170)
-    femmesh.addNode(974.5999770431588, 139.21147242956292, 42.19367185428683, 3171)
-    femmesh.addNode(986.8730434091804, 133.3503573616545, 17.193671854286833, 3172)
-    femmesh.addNode(968.5965597690036, 114.64228018967088, 40.852784259931404, 3173)
-    femmesh.addNode(955.4696031781839, 118.76964677851726, 23.65911240564457, 3174)
-    femmesh.addNode(834.3719481334763, 143.05907497897297, 79.93485418352924, 3175)
-    femmesh.addNode(574.0749535232633, 145.66968366157147, 24.99921755857917, 3176)
-    femmesh.addNode(314.5692848073804, 157.98368702613482, 74.88271219568256, 3177)
-    femmesh.addNode(295.3818861129371, 163.78915344049875, 69.57276054007556, 3178)
-    femmesh.addNode(914.8662714182142, 102.03690596440708, 23.65911240564457, 3179)
-    femmesh.addNode(318.66895702372335, 147.08353432658015, 24.88271219568256, 3180)
-    femmesh.addNode(304.8478935016241, 125.69231743952514, 25.47208697703617, 3181)
-    femmesh.addNode(566.182997033793, 171.24526051368883, 84.5626566912403, 3182)
-    femmesh.addNode(388.6337447045049, 94.57705052895258, 82.5116797187726, 3183)
-    femmesh.addNode(514.4187557868443, 184.33126912467384, 85.23674925831978, 3184)
-    femmesh.addNode(531.581045044679, 157.9011287057312, 74.16540027098686, 3185)
-    femmesh.addNode(233.70485678635836, 20.49790282463461, 65.94699703327909, 3186)
-    femmesh.addNode(268.42368424253095, 138.94076562943994, 24.474095360129894, 3187)
-    femmesh.addNode(289.3872715717291, 124.50174424821432, 25.47208697703617, 3188)
-    femmesh.addNode(299.48155832928, 152.88900074094408, 19.57276054007556, 3189)
-    femmesh.addNode(284.02093639938494, 151.69842754963327, 19.57276054007556, 3190)
-    femmesh.addNode(862.7535522882465, 161.9311642613921, 20.664449074965194, 3191)
-    femmesh.addNode(172.94702321216178, 121.6203026673809, 74.76328156678402, 3192)
-    femmesh.addNode(381.41546450940507, 14.86871050850901, 88.48083255052146, 3193)
-    femmesh.addNode(388.58143527714424, 40.34961417006645, 74.59254330082098, 3194)
-    femmesh.addNode(419.1393127743314, 58.08636589029548, 20.03386039268495, 3195)
-    femmesh.addNode(744.2442460381608, 17.63297347792185, 84.56265669124033, 3196)
-    femmesh.addNode(743.7748564806197, 44.01121945047334, 75.02214124889673, 3197)
-    femmesh.addNode(890.8596702055968, 167.3765929066173, 61.70789585503252, 3198)
-    femmesh.addNode(874.0814059579059, 179.36502320715977, 55.99133424701, 3199)
-    femmesh.addNode(561.525933329889, 84.77435748545788, 74.99999999999999, 3200)
-    femmesh.addNode(561.525933329889, 84.78094424795398, 24.999999999999986, 3201)
-    femmesh.addNode(278.21324064853786, 14.347407015113228, 85.23674925831978, 3202)
-    femmesh.addNode(259.9378097545445, 13.850594689065375, 85.23674925831978, 3203)
-    femmesh.addNode(276.17990077209134, 39.62600238605421, 75.31845461189924, 3204)
-    femmesh.addNode(276.2420910175468, 25.77540769698884, 60.55520387021902, 3205)
-    femmesh.addNode(947.505616853828, 55.64988131292627, 75.0, 3206)
-    femmesh.addNode(954.3740055036978, 74.60218808512231, 24.999999999999996, 3207)
-    femmesh.addNode(947.505616853828, 55.64988131292627, 24.999999999999996, 3208)
-    femmesh.addNode(537.1622892578346, 173.56985958105736, 63.665400270986865, 3209)
-    femmesh.addNode(549.8857501030967, 171.24526051368883, 89.5, 3210)
-    femmesh.addNode(70.64515003328776, 25.10557444348143, 55.51711336240706, 3211)
-    femmesh.addNode(514.4187557868444, 184.33126912467384, 17.657244808238442, 3212)
-    femmesh.addNode(531.5810450446791, 157.9011287057312, 24.165400270986865, 3213)
-    femmesh.addNode(495.59698439252645, 143.51057164688117, 75.00272920954467, 3214)
-    femmesh.addNode(14.609709956427745, 15.068753164479979, 27.674228301430652, 3215)
-    femmesh.addNode(790.8053130829392, 137.1643359045919, 25.12303764301237, 3216)
-    femmesh.addNode(779.9999999999986, 24.000000000000075, 10.500000000000146, 3217)
-    femmesh.addNode(139.98192574120026, 186.72201414898043, 85.05890788615292, 3218)
-    femmesh.addNode(120.54943906296347, 186.72201414898043, 89.28621431104274, 3219)
-    femmesh.addNode(126.76907319082802, 159.8571695194144, 74.94291793283458, 3220)
-    femmesh.addNode(126.75099893202827, 173.135155370434, 60.0018258189875, 3221)
-    femmesh.addNode(45.261279731369896, 12.362097020511092, 86.33333333333329, 3222)
-    femmesh.addNode(119.6996680859981, 60.1656940285924, 23.85620885166462, 3223)
-    femmesh.addNode(114.12964227685373, 50.77328150895408, 53.07763147545823, 3224)
-    femmesh.addNode(928.3259259777653, 183.52675153139353, 85.38527348122287, 3225)
-    femmesh.addNode(283.97327322794627, 183.19795619967283, 84.56265669124033, 3226)
-    femmesh.addNode(226.75833504969793, 186.44898499482656, 75.2136670575174, 3227)
-    femmesh.addNode(216.9161217761076, 163.58479510338475, 73.21881753947707, 3228)
-    femmesh.addNode(694.9105219306225, 54.082565596300256, 80.16623275298208, 3229)
-    femmesh.addNode(684.8987125124354, 37.06380321353149, 80.16623275298208, 3230)
-    femmesh.addNode(242.9210088347702, 137.78939829823472, 74.4740953601299, 3231)
-    femmesh.addNode(52.75017035969681, 50.77997384856184, 25.0, 3232)
-    femmesh.addNode(74.21654213492427, 52.93832474033941, 29.221422623793615, 3233)
-    femmesh.addNode(166.45690462123744, 179.18711266468108, 68.95650723070162, 3234)
-    femmesh.addNode(181.14967472635976, 179.18711266468108, 64.33971256938982, 3235)
-    femmesh.addNode(81.07678715385654, 27.263925335259, 46.00845873390048, 3236)
-    femmesh.addNode(94.3486796258646, 47.45090113102331, 29.221422623793615, 3237)
-    femmesh.addNode(704.679520296319, 37.18772482176138, 80.16623275298208, 3238)
-    femmesh.addNode(726.7632108505286, 17.946834451591535, 25.213667057517373, 3239)
-    femmesh.addNode(707.0087334732127, 17.379268527437745, 25.213667057517373, 3240)
-    femmesh.addNode(711.2933553454843, 19.838782636667215, 55.37989981049945, 3241)
-    femmesh.addNode(277.56753489713776, 44.86532959947083, 25.318454611899245, 3242)
-    femmesh.addNode(255.0303006659493, 39.587824727116605, 26.446997033279096, 3243)
-    femmesh.addNode(120.73412793867456, 186.7220141489804, 10.88619122893256, 3244)
-    femmesh.addNode(139.98418502355025, 186.7220141489804, 15.520770631219065, 3245)
-    femmesh.addNode(126.75325821437825, 173.135155370434, 40.46368856405365, 3246)
-    femmesh.addNode(126.76907319082801, 159.85716951941438, 24.942917932834582, 3247)
-    femmesh.addNode(233.7048567863584, 20.49790282463461, 36.94699703327911, 3248)
-    femmesh.addNode(52.75017035969687, 149.22002615143808, 75.0, 3249)
-    femmesh.addNode(52.75017035969686, 149.2200261514381, 25.000000000000004, 3250)
-    femmesh.addNode(439.1397009477322, 180.6748353812733, 85.23674925831978, 3251)
-    femmesh.addNode(987.2140757550533, 45.69289697420679, 86.32514507785156, 3252)
-    femmesh.addNode(148.4255264165767, 179.18711266468108, 45.44381653394223, 3253)
-    femmesh.addNode(148.4232671342267, 179.18711266468108, 64.98195378887608, 3254)
-    femmesh.addNode(474.5729356391888, 46.46505581727662, 24.99999999999999, 3255)
-    femmesh.addNode(462.9463863656343, 19.537705231325344, 15.437343308759662, 3256)
-    femmesh.addNode(448.1073097664702, 43.298898557544035, 20.03386039268495, 3257)
-    femmesh.addNode(804.7657850304129, 127.63113787305862, 75.12303764301237, 3258)
-    femmesh.addNode(818.5214754743913, 143.26708287513515, 79.93485418352924, 3259)
-    femmesh.addNode(945.8499770431588, 145.84997704315887, 24.999999999999996, 3260)
-    femmesh.addNode(939.8465597690035, 121.28078480326684, 23.65911240564457, 3261)
-    femmesh.addNode(718.5709198306083, 121.35853572474443, 17.00520425136599, 3262)
-    femmesh.addNode(628.8275471946025, 183.2868365071919, 15.583333333333334, 3263)
-    femmesh.addNode(640.2109761339464, 174.82657285878187, 40.59237721745635, 3264)
-    femmesh.addNode(358.2283910726228, 10.565285776754711, 10.90925618290289, 3265)
-    femmesh.addNode(336.87308258015173, 31.05989155365456, 20.57380885863826, 3266)
-    femmesh.addNode(12.362097020511106, 154.42617747690537, 13.976723086825553, 3267)
-    femmesh.addNode(12.362097020511106, 145.29427582418566, 24.99999999999995, 3268)
-    femmesh.addNode(37.46767146399254, 144.0775902695931, 25.000000000000004, 3269)
-    femmesh.addNode(554.6238990464236, 62.93397685712566, 75.0, 3270)
-    femmesh.addNode(148.44134139302645, 165.9091268136615, 29.923045902723167, 3271)
-    femmesh.addNode(547.0480393609314, 144.8151200947462, 24.165400270986865, 3272)
-    femmesh.addNode(565.9082078133175, 171.24526051368883, 16.38211011753038, 3273)
-    femmesh.addNode(180.56207543485, 137.03774554033777, 74.76328156678402, 3274)
-    femmesh.addNode(197.29236647638976, 154.82789097445524, 73.21881753947707, 3275)
-    femmesh.addNode(855.4356000614939, 17.529415904539345, 12.127496193215443, 3276)
-    femmesh.addNode(836.7530534068334, 17.529415904539345, 15.67623490170624, 3277)
-    femmesh.addNode(857.3844000490349, 22.680872370788833, 34.99618825368496, 3278)
-    femmesh.addNode(856.9143262733189, 40.21028827532818, 22.868692060469517, 3279)
-    femmesh.addNode(763.9775422897782, 24.000000000000075, 16.382110117530296, 3280)
-    femmesh.addNode(334.6222342959598, 15.128242787036944, 83.71037968382429, 3281)
-    femmesh.addNode(300.6447764494279, 106.61693468281103, 25.47208697703617, 3282)
-    femmesh.addNode(157.01041344241884, 182.36110435876293, 15.520770631219065, 3283)
-    femmesh.addNode(522.1622892578346, 142.56985958105736, 24.165400270986865, 3284)
-    femmesh.addNode(502.2124684463042, 120.14162748921672, 24.023020643293794, 3285)
-    femmesh.addNode(209.62445510944087, 177.13581010855822, 57.635484206143715, 3286)
-    femmesh.addNode(628.7658642934284, 183.27434320407755, 84.41666666666666, 3287)
-    femmesh.addNode(640.2109761339464, 174.82657285878187, 59.425710550789674, 3288)
-    femmesh.addNode(216.38002563320183, 161.5635747266837, 23.218817539477065, 3289)
-    femmesh.addNode(339.9177358839025, 182.62567416828136, 82.34275519176154, 3290)
-    femmesh.addNode(319.9177358839024, 182.62567416828136, 89.5, 3291)
-    femmesh.addNode(334.2987646487378, 174.785730826462, 57.2254673874441, 3292)
-    femmesh.addNode(314.2987646487378, 174.785730826462, 64.38271219568256, 3293)
-    femmesh.addNode(334.2165005326402, 157.41140499474335, 74.88271219568256, 3294)
-    femmesh.addNode(446.00196834602843, 19.53770523132534, 74.7863329424826, 3295)
-    femmesh.addNode(427.55511399463484, 17.63244277738324, 74.7863329424826, 3296)
-    femmesh.addNode(435.6220115198373, 23.761193326218688, 44.820193335167545, 3297)
-    femmesh.addNode(57.876407776814744, 66.15823957908343, 75.0, 3298)
-    femmesh.addNode(193.08457803361551, 177.69208086589703, 84.41666666666666, 3299)
-    femmesh.addNode(178.3918079284932, 177.69208086589703, 89.03346132797844, 3300)
-    femmesh.addNode(168.81758609330865, 156.8791935305781, 79.92304590272317, 3301)
-    femmesh.addNode(493.39351011976646, 44.385648801419734, 24.99999999999999, 3302)
-    femmesh.addNode(512.8393992097658, 36.04089587130389, 26.44699703327911, 3303)
-    femmesh.addNode(931.2168042697067, 61.42262186194671, 24.999999999999996, 3304)
-    femmesh.addNode(925.2629089142472, 86.00386178967682, 23.65911240564457, 3305)
-    femmesh.addNode(910.3951098615196, 55.75502757313293, 21.069942778789574, 3306)
-    femmesh.addNode(922.3253204852798, 69.81273538998975, 44.729055184434145, 3307)
-    femmesh.addNode(928.2792158407394, 45.231495462259645, 46.06994277878957, 3308)
-    femmesh.addNode(296.2420910175468, 25.77540769698884, 50.31845461189924, 3309)
-    femmesh.addNode(316.5783849978112, 20.494605776899846, 45.57380885863826, 3310)
-    femmesh.addNode(941.5517214983684, 80.23112124065636, 73.65911240564458, 3311)
-    femmesh.addNode(534.4187557868443, 184.33126912467384, 89.5, 3312)
-    femmesh.addNode(896.4685498023753, 142.58492623995056, 26.381010682987707, 3313)
-    femmesh.addNode(879.6902855546844, 154.57335654049308, 20.664449074965194, 3314)
-    femmesh.addNode(45.360831181747514, 187.63790297948884, 86.3228480431695, 3315)
-    femmesh.addNode(495.5969843925265, 143.5105716468812, 25.002729209544665, 3316)
-    femmesh.addNode(300.2705201586426, 183.19795619967283, 89.5, 3317)
-    femmesh.addNode(481.766960846212, 17.45829821546846, 15.437343308759662, 3318)
-    femmesh.addNode(941.5517214983684, 80.23112124065636, 23.65911240564457, 3319)
-    femmesh.addNode(948.4201101482383, 99.1834280128524, 23.65911240564457, 3320)
-    femmesh.addNode(902.1637321698788, 75.70268418608076, 25.0, 3321)
-    femmesh.addNode(899.2261437409115, 59.5115577863937, 46.069942778789574, 3322)
-    femmesh.addNode(295.11136595429446, 180.59119724082592, 59.07276054007556, 3323)
-    femmesh.addNode(796.053105995436, 182.14046116468668, 16.382110117530356, 3324)
-    femmesh.addNode(253.6426665409029, 34.34849751369998, 76.4469970332791, 3325)
-    femmesh.addNode(253.70485678635833, 20.49790282463461, 61.68374629159887, 3326)
-    femmesh.addNode(858.8949820579667, 182.04001785563048, 75.0, 3327)
-    femmesh.addNode(869.3277691278543, 182.04001785563048, 85.32688517204481, 3328)
-    femmesh.addNode(863.6486188880183, 179.36502320715977, 45.6644490749652, 3329)
-    femmesh.addNode(339.91713218375526, 10.565285776754711, 14.685831179064607, 3330)
-    femmesh.addNode(336.200819599226, 20.494605776899846, 35.259640037702866, 3331)
-    femmesh.addNode(931.2168042697067, 61.42262186194671, 75.0, 3332)
-    femmesh.addNode(925.2629089142472, 86.00386178967682, 73.65911240564458, 3333)
-    femmesh.addNode(896.4685498023753, 142.58492623995056, 76.38101068298771, 3334)
-    femmesh.addNode(879.6902855546844, 154.57335654049308, 70.66444907496519, 3335)
-    femmesh.addNode(226.22223890679217, 184.42776461812548, 25.213667057517398, 3336)
-    femmesh.addNode(45.286235153698044, 187.6379029794889, 13.722443000834424, 3337)
-    femmesh.addNode(549.8857501030968, 171.24526051368883, 10.5, 3338)
-    femmesh.addNode(537.1622892578346, 173.56985958105736, 34.665400270986865, 3339)
-    femmesh.addNode(482.0417500666875, 17.45829821546846, 83.6178898824696, 3340)
-    femmesh.addNode(493.39351011976646, 44.385648801419734, 74.99999999999999, 3341)
-    femmesh.addNode(756.8486901664144, 182.22146154870867, 84.56265669124039, 3342)
-    femmesh.addNode(209.62445510944087, 177.13581010855822, 38.802150872810415, 3343)
-    femmesh.addNode(979.8235503792346, 113.76413859598965, 17.193671854286833, 3344)
-    femmesh.addNode(979.8235503792346, 99.15264320958556, 31.29347564430352, 3345)
-    femmesh.addNode(930.9166883071197, 106.56825977974043, 73.65911240564458, 3346)
-    femmesh.addNode(912.747011673825, 123.9140678830909, 76.38101068298771, 3347)
-    femmesh.addNode(714.5350202957861, 53.83878263666712, 80.16623275298208, 3348)
-    femmesh.addNode(498.06420777690835, 17.45829821546846, 10.5, 3349)
-    femmesh.addNode(495.3293023428581, 26.927350585951274, 35.499999999999986, 3350)
-    femmesh.addNode(383.19480705218893, 185.49333556909357, 10.500000000000101, 3351)
-    femmesh.addNode(368.64128809370214, 177.1525886393647, 10.500000000000101, 3352)
-    femmesh.addNode(373.6621144695472, 180.73008099259604, 40.65910390840798, 3353)
-    femmesh.addNode(570.1152156347035, 22.40048213431758, 10.5, 3354)
-    femmesh.addNode(550.1152156347035, 22.40048213431758, 17.657244808238442, 3355)
-    femmesh.addNode(574.7538555537403, 25.556153700650864, 35.50000000000001, 3356)
-    femmesh.addNode(554.7538555537403, 25.556153700650864, 42.657244808238445, 3357)
-    femmesh.addNode(564.869071188444, 47.956635834968445, 25.000000000000007, 3358)
-    femmesh.addNode(334.2987646487377, 174.785730826462, 39.645962937362796, 3359)
-    femmesh.addNode(348.64128809370214, 177.1525886393647, 14.763250741680233, 3360)
-    femmesh.addNode(353.6621144695472, 180.73008099259604, 44.92235465008811, 3361)
-    femmesh.addNode(281.3254438795909, 19.089921902481993, 10.5, 3362)
-    femmesh.addNode(261.3254438795909, 19.089921902481993, 17.65724480823844, 3363)
-    femmesh.addNode(276.24209101754684, 25.77540769698884, 42.97569942013769, 3364)
-    femmesh.addNode(296.24209101754684, 25.77540769698884, 35.81845461189924, 3365)
-    femmesh.addNode(544.890407067561, 40.98307979015301, 26.44699703327911, 3366)
-    femmesh.addNode(534.7751914328575, 18.58259765583543, 44.10424184151755, 3367)
-    femmesh.addNode(534.4187557868444, 184.33126912467384, 10.5, 3368)
-    femmesh.addNode(530.0102109814161, 35.330181453990036, 26.44699703327911, 3369)
-    femmesh.addNode(598.5259910765085, 184.70641940417613, 25.21366705751739, 3370)
-    femmesh.addNode(589.4735295463731, 159.13084255205877, 24.99921755857917, 3371)
-    femmesh.addNode(498.06420777690835, 17.45829821546846, 89.5, 3372)
-    femmesh.addNode(495.3293023428581, 26.927350585951274, 64.49999999999999, 3373)
-    femmesh.addNode(979.8235503792346, 86.41174339304675, 15.925000365144056, 3374)
-    femmesh.addNode(968.5965597690036, 87.28988498672797, 39.58411277078863, 3375)
-    femmesh.addNode(101.53188873405935, 27.263925335259, 46.30450979142682, 3376)
-    femmesh.addNode(514.7751914328575, 18.58259765583543, 36.94699703327911, 3377)
-    femmesh.addNode(760.0048758008302, 17.946834451591535, 10.500000000000146, 3378)
-    femmesh.addNode(148.44134139302645, 165.90912681366154, 79.92304590272317, 3379)
-    femmesh.addNode(900.5020910768599, 175.2083333333333, 80.51711336240706, 3380)
-    femmesh.addNode(886.4744537365542, 175.2083333333333, 85.32688517204481, 3381)
-    femmesh.addNode(45.426545243353175, 12.362097020511094, 13.908950462795561, 3382)
-    femmesh.addNode(30.27685622064367, 184.1925436461289, 13.722443000834424, 3383)
-    femmesh.addNode(40.913030797352484, 159.08696920264748, 25.000000000000004, 3384)
-    femmesh.addNode(987.2140757550533, 68.47136277952279, 15.925000365144056, 3385)
-    femmesh.addNode(974.5504551244633, 62.70864505899786, 40.92500036514405, 3386)
-    femmesh.addNode(755.8896375877184, 181.71120136611262, 16.382110117530356, 3387)
-    femmesh.addNode(30.25190079831551, 15.807456353871027, 86.33333333333329, 3388)
-    femmesh.addNode(40.91303079735247, 40.913030797352455, 75.0, 3389)
-    femmesh.addNode(30.351452248693114, 184.1925436461289, 86.3228480431695, 3390)
-    femmesh.addNode(40.9130307973525, 159.08696920264748, 75.0, 3391)
-    femmesh.addNode(951.3547831753156, 16.70833333333326, 85.38527348122287, 3392)
-    femmesh.addNode(968.8472222222225, 16.70833333333326, 86.33333333333357, 3393)
-    femmesh.addNode(957.8421217911299, 42.157878208869974, 75.0, 3394)
-    femmesh.addNode(598.5136544962736, 184.70392074355328, 75.2136670575174, 3395)
-    femmesh.addNode(589.4611929661382, 159.12834389143592, 74.99921755857918, 3396)
-    femmesh.addNode(983.2916666666666, 31.188967711478412, 86.32514507785156, 3397)
-    femmesh.addNode(853.3186112976049, 179.36502320715977, 35.642705299228325, 3398)
-    femmesh.addNode(829.7006406948019, 182.14046116468668, 14.978256224263129, 3399)
-    femmesh.addNode(834.2309959365051, 176.8002809066685, 44.91311040779237, 3400)
-    femmesh.addNode(52.750170359696824, 50.779973848561845, 75.0, 3401)
-    femmesh.addNode(74.21654213492428, 52.93832474033941, 79.22142262379361, 3402)
-    femmesh.addNode(12.362097020511094, 45.885588451405354, 13.76527783863509, 3403)
-    femmesh.addNode(12.362097020511094, 54.70572417581434, 24.99999999999995, 3404)
-    femmesh.addNode(37.46767146399253, 55.9224097304068, 25.0, 3405)
-    femmesh.addNode(550.1152156347034, 22.40048213431758, 85.23674925831978, 3406)
-    femmesh.addNode(570.1152156347034, 22.40048213431758, 89.5, 3407)
-    femmesh.addNode(554.7538555537403, 25.556153700650864, 60.23674925831978, 3408)
-    femmesh.addNode(574.7538555537403, 25.556153700650864, 64.5, 3409)
-    femmesh.addNode(564.8690711884437, 47.956635834968445, 75.0, 3410)
-    femmesh.addNode(476.84574686698966, 183.19490017697308, 10.5, 3411)
-    femmesh.addNode(30.417166310298782, 15.807456353871025, 13.908950462795561, 3412)
-    femmesh.addNode(40.91303079735247, 40.913030797352455, 25.0, 3413)
-    femmesh.addNode(102.73667592250618, 20.186975795764308, 17.083087167633202, 3414)
-    femmesh.addNode(141.70626540809945, 13.277985851019546, 11.426680824203824, 3415)
-    femmesh.addNode(137.55769605814484, 36.787342024714626, 23.85620885166462, 3416)
-    femmesh.addNode(115.33442946530056, 43.696331969459386, 23.85620885166462, 3417)
-    femmesh.addNode(873.3867870110264, 47.88982759466955, 72.86869206046951, 3418)
-    femmesh.addNode(889.4526069052318, 64.93856242355147, 75.0, 3419)
-    femmesh.addNode(897.6839845968727, 44.99090581060365, 71.06994277878957, 3420)
-    femmesh.addNode(883.160323846706, 42.46282295751177, 43.938634839259095, 3421)
-    femmesh.addNode(113.79416844093112, 56.930592001925625, 79.22142262379361, 3422)
-    femmesh.addNode(314.2987646487378, 174.785730826462, 49.88271219568256, 3423)
-    femmesh.addNode(295.11136595429446, 180.59119724082592, 44.57276054007556, 3424)
-    femmesh.addNode(334.9845589539975, 185.69411278917084, 14.763250741680233, 3425)
-    femmesh.addNode(329.2833236027354, 160.47984361563283, 24.88271219568256, 3426)
-    femmesh.addNode(315.11136595429434, 180.59119724082592, 34.336011281755795, 3427)
-    femmesh.addNode(310.0959249082921, 166.28531002999677, 19.57276054007556, 3428)
-    femmesh.addNode(122.5176385734953, 23.50935617369508, 40.93929601929782, 3429)
-    femmesh.addNode(253.70485678635836, 20.49790282463461, 44.104241841517535, 3430)
-    femmesh.addNode(12.362097020511127, 154.93397277171806, 86.36011558653307, 3431)
-    femmesh.addNode(512.8393992097658, 36.04089587130389, 76.4469970332791, 3432)
-    femmesh.addNode(514.7751914328575, 18.58259765583543, 65.9469970332791, 3433)
-    femmesh.addNode(930.9166883071197, 106.56825977974043, 23.65911240564457, 3434)
-    femmesh.addNode(912.747011673825, 123.9140678830909, 26.381010682987707, 3435)
-    femmesh.addNode(314.98455895399763, 185.69411278917084, 10.5, 3436)
-    femmesh.addNode(295.11136595429446, 180.59119724082592, 30.07276054007556, 3437)
-    femmesh.addNode(889.1806309092241, 175.2083333333333, 16.151341672704795, 3438)
-    femmesh.addNode(476.84574686698966, 183.19490017697308, 89.5, 3439)
-    femmesh.addNode(945.8499770431588, 145.84997704315887, 75.0, 3440)
-    femmesh.addNode(939.8465597690035, 121.28078480326684, 73.65911240564458, 3441)
-    femmesh.addNode(678.5990179283262, 21.134915937688362, 56.24245087725579, 3442)
-    femmesh.addNode(673.0720255499821, 17.225020576864278, 84.41666666666659, 3443)
-    femmesh.addNode(697.2433536291198, 19.838782636667215, 64.58289941964867, 3444)
-    femmesh.addNode(581.569236476668, 184.70392074355328, 84.5626566912403, 3445)
-    femmesh.addNode(934.3560914467573, 42.02385932208551, 75.0, 3446)
-    femmesh.addNode(927.868752830943, 16.574314446548794, 85.38527348122287, 3447)
-    femmesh.addNode(913.5343970385702, 36.356265033271725, 71.06994277878957, 3448)
-    femmesh.addNode(921.791877224925, 19.781950586722935, 56.45521626001244, 3449)
-    femmesh.addNode(795.998914473357, 182.3349128975037, 84.56265669124039, 3450)
-    femmesh.addNode(951.3547831753156, 183.29166666666669, 85.38527348122287, 3451)
-    femmesh.addNode(968.8472222222226, 183.29166666666669, 86.33333333333357, 3452)
-    femmesh.addNode(957.8916437098255, 157.89164370982556, 75.0, 3453)
-    femmesh.addNode(968.681956710239, 16.70833333333326, 13.908950462795554, 3454)
-    femmesh.addNode(948.7868257315189, 16.70833333333326, 16.787036110106836, 3455)
-    femmesh.addNode(957.8421217911299, 42.157878208869974, 24.999999999999996, 3456)
-    femmesh.addNode(15.807456353871066, 169.94335170477245, 86.36011558653307, 3457)
-    femmesh.addNode(983.2916666666667, 150.94993382194676, 84.82736018586529, 3458)
-    femmesh.addNode(983.2916666666667, 169.04247472531023, 86.36011558653307, 3459)
-    femmesh.addNode(534.7751914328575, 18.58259765583543, 61.68374629159889, 3460)
-    femmesh.addNode(544.8904070675609, 40.98307979015301, 76.4469970332791, 3461)
-    femmesh.addNode(692.8528333338656, 17.34894218509416, 84.41666666666659, 3462)
-    femmesh.addNode(396.1831124006302, 14.86871050850901, 84.41666666666657, 3463)
-    femmesh.addNode(15.807456353871038, 30.288090732016183, 86.32514507785154, 3464)
-    femmesh.addNode(144.5461631555687, 13.27798585101954, 76.2258535301463, 3465)
-    femmesh.addNode(137.55769605814484, 36.78734202471462, 73.85620885166462, 3466)
-    femmesh.addNode(189.7345617522019, 182.36110435876293, 15.583333333333352, 3467)
-    femmesh.addNode(872.5228206275383, 17.529415904539345, 17.289625338457192, 3468)
-    femmesh.addNode(874.4716206150792, 22.680872370788833, 40.15831739892671, 3469)
-    femmesh.addNode(869.8643502003176, 22.680872370788833, 58.195577232514324, 3470)
-    femmesh.addNode(884.3880109504844, 25.208955223880714, 85.32688517204481, 3471)
-    femmesh.addNode(894.161547786164, 19.781950586722935, 56.396827950834385, 3472)
-    femmesh.addNode(581.3067838364273, 184.70641940417613, 16.38211011753038, 3473)
-    femmesh.addNode(824.2626710695787, 159.1351938041722, 79.93485418352924, 3474)
-    femmesh.addNode(734.2856136601717, 120.03356554991984, 17.00520425136599, 3475)
-    femmesh.addNode(812.943332492963, 182.3349128975037, 75.2136670575174, 3476)
-    femmesh.addNode(109.66434272205952, 82.32506553598259, 75.03690364547838, 3477)
-    femmesh.addNode(98.83110511465466, 63.65919377507561, 79.22142262379361, 3478)
-    femmesh.addNode(848.7749258098154, 182.56614105423233, 14.978256224263129, 3479)
-    femmesh.addNode(93.31630899696205, 20.18697579576431, 80.51711336240706, 3480)
-    femmesh.addNode(94.3486796258646, 47.450901131023315, 79.22142262379361, 3481)
-    femmesh.addNode(36.075140244565205, 119.1831647130745, 23.43049266642454, 3482)
-    femmesh.addNode(12.362097020511095, 45.29746966507052, 86.32514507785154, 3483)
-    femmesh.addNode(36.07514024456519, 80.81683528692537, 23.43049266642454, 3484)
-    femmesh.addNode(14.469399866772616, 185.24301276383088, 27.699166087659975, 3485)
-    femmesh.addNode(15.807456353871054, 169.43555640995982, 13.976723086825553, 3486)
-    femmesh.addNode(725.076513264644, 37.47175611458907, 80.16623275298208, 3487)
-    femmesh.addNode(728.2377733650899, 19.838782636667215, 64.72888944422242, 3488)
-    femmesh.addNode(948.786825731519, 183.29166666666669, 16.787036110106836, 3489)
-    femmesh.addNode(968.6819567102391, 183.29166666666669, 13.908950462795554, 3490)
-    femmesh.addNode(957.8916437098255, 157.89164370982556, 24.999999999999996, 3491)
-    femmesh.addNode(678.5990179283262, 21.134915937688362, 37.40911754392264, 3492)
-    femmesh.addNode(692.9587317568482, 17.379268527437745, 15.583333333333437, 3493)
-    femmesh.addNode(697.2433536291198, 19.838782636667215, 45.74956608631552, 3494)
-    femmesh.addNode(495.3293023428581, 26.927350585951274, 49.999999999999986, 3495)
-    femmesh.addNode(647.6553588833152, 182.77497942313576, 15.583333333333334, 3496)
-    femmesh.addNode(404.54101841351087, 43.18657158816507, 24.592543300820974, 3497)
-    femmesh.addNode(397.81498954318033, 25.48090366155744, 40.175876634154406, 3498)
-    femmesh.addNode(412.1426955369969, 17.70566792660763, 15.583333333333433, 3499)
-    femmesh.addNode(428.29803867380326, 41.46686125282632, 20.03386039268495, 3500)
-    femmesh.addNode(421.5720098034727, 23.761193326218688, 35.617193726018385, 3501)
-    femmesh.addNode(353.57985035344973, 163.3557551608774, 80.15910390840787, 3502)
-    femmesh.addNode(983.2916666666666, 31.777086497813244, 13.765277838635095, 3503)
-    femmesh.addNode(25.10557444348143, 139.50592094292267, 42.19367185428682, 3504)
-    femmesh.addNode(23.7130432240541, 114.61149538640409, 40.62416452071136, 3505)
-    femmesh.addNode(312.64860291966585, 52.39710502783242, 20.57380885863826, 3506)
-    femmesh.addNode(514.7751914328575, 18.58259765583543, 51.44699703327911, 3507)
-    femmesh.addNode(795.7873545180619, 17.694879010977196, 84.64130927126998, 3508)
-    femmesh.addNode(647.2852614762703, 182.7000196044491, 84.41666666666666, 3509)
-    femmesh.addNode(390.60728532857854, 17.334604070713173, 15.583333333333433, 3510)
-    femmesh.addNode(535.2350195485586, 16.747583798154604, 17.657244808238442, 3511)
-    femmesh.addNode(919.2239197811284, 19.781950586722935, 37.85697888889641, 3512)
-    femmesh.addNode(983.2916666666667, 168.53467943049753, 13.976723086825558, 3513)
-    femmesh.addNode(985.3902900435723, 185.24301276383085, 27.88567354962111, 3514)
-    femmesh.addNode(985.3902900435723, 15.068753164479983, 27.67422830143065, 3515)
-    femmesh.addNode(515.2350195485586, 16.747583798154604, 10.5, 3516)
-    femmesh.addNode(212.70833333333337, 186.44898499482656, 84.41666666666666, 3517)
-    femmesh.addNode(921.6768831357089, 138.6265929066173, 26.381010682987707, 3518)
-    femmesh.addNode(12.362097020511106, 133.7946600994786, 17.193671854286816, 3519)
-    femmesh.addNode(306.09020989917383, 16.776275223684923, 10.5, 3520)
-    femmesh.addNode(302.3323009167206, 42.55168292067376, 25.318454611899245, 3521)
-    femmesh.addNode(910.3951098615196, 55.75502757313293, 71.06994277878957, 3522)
-    femmesh.addNode(15.807456353871038, 30.876209518351004, 13.76527783863509, 3523)
-    femmesh.addNode(900.2384233921819, 16.574314446548794, 85.32688517204481, 3524)
-    femmesh.addNode(914.2660607324876, 16.574314446548794, 80.51711336240706, 3525)
-    femmesh.addNode(908.1891851264696, 19.781950586722935, 51.58705614119664, 3526)
-    femmesh.addNode(115.33442946530056, 43.69633196945939, 73.85620885166462, 3527)
-    femmesh.addNode(127.12490898825695, 23.50935617369508, 59.18309402370946, 3528)
-    femmesh.addNode(107.34394633726782, 20.18697579576431, 85.32688517204484, 3529)
-    femmesh.addNode(106.139159148821, 27.263925335259, 64.54830779583845, 3530)
-    femmesh.addNode(411.8649912595449, 25.48090366155744, 49.37887624330357, 3531)
-    femmesh.addNode(554.7751914328574, 18.58259765583543, 51.44699703327913, 3532)
-    femmesh.addNode(298.73696139531035, 186.40647006947822, 10.5, 3533)
-    femmesh.addNode(293.8483273496048, 166.9976673103041, 19.57276054007556, 3534)
-    femmesh.addNode(926.6839224456409, 49.98228702411249, 21.069942778789574, 3535)
-    femmesh.addNode(12.362097020511094, 68.0759354703865, 15.925000365144042, 3536)
-    femmesh.addNode(25.105574443481434, 62.36467462694256, 40.925000365144044, 3537)
-    femmesh.addNode(23.7130432240541, 87.25910018346113, 39.355493031568585, 3538)
-    femmesh.addNode(161.20253387062044, 141.46175065762128, 79.92304590272317, 3539)
-    femmesh.addNode(873.3867870110264, 47.88982759466955, 22.868692060469517, 3540)
-    femmesh.addNode(888.9952813652458, 25.208955223880714, 17.289625338457192, 3541)
-    femmesh.addNode(897.6839845968727, 44.99090581060365, 21.069942778789574, 3542)
-    femmesh.addNode(898.7688182009255, 19.781950586722935, 38.359568117246766, 3543)
-    femmesh.addNode(316.5783849978112, 20.494605776899846, 31.07380885863826, 3544)
-    femmesh.addNode(38.75735334200223, 99.99999999999991, 23.43049266642454, 3545)
-    femmesh.addNode(583.6842298398581, 15.063646052498683, 89.5, 3546)
-    femmesh.addNode(925.3007953871463, 16.574314446548794, 16.787036110106836, 3547)
-    femmesh.addNode(934.3560914467573, 42.02385932208551, 24.999999999999996, 3548)
-    femmesh.addNode(530.0102109814161, 35.33018145399005, 76.4469970332791, 3549)
-    femmesh.addNode(241.32544387959098, 19.089921902481993, 10.500000000000012, 3550)
-    femmesh.addNode(239.93780975454453, 13.850594689065375, 89.5, 3551)
-    femmesh.addNode(867.867269864218, 17.496987013351326, 85.32688517204481, 3552)
-    femmesh.addNode(844.5610035269185, 176.8002809066685, 54.93485418352924, 3553)
-    femmesh.addNode(583.6842298398581, 15.063646052498564, 10.5, 3554)
-    femmesh.addNode(322.66859489698504, 37.270881000584765, 20.57380885863826, 3555)
-    femmesh.addNode(353.6621144695473, 180.73008099259604, 62.50185910016941, 3556)
-    femmesh.addNode(212.17223719042758, 184.42776461812548, 15.583333333333352, 3557)
-    femmesh.addNode(124.95994251535046, 13.277985851019546, 17.083087167633202, 3558)
-    femmesh.addNode(15.044310117948132, 114.61149538640402, 17.193671854286816, 3559)
-    femmesh.addNode(129.5672129301121, 13.27798585101954, 85.32688517204484, 3560)
-    femmesh.addNode(902.1637321698788, 75.70268418608076, 75.0, 3561)
-    femmesh.addNode(921.6768831357089, 138.6265929066173, 76.38101068298771, 3562)
-    femmesh.addNode(913.5343970385702, 36.356265033271725, 21.069942778789574, 3563)
-    femmesh.addNode(438.8636764701395, 23.761193326218688, 20.03386039268495, 3564)
-    femmesh.addNode(15.044310117948132, 87.25910018346104, 15.925000365144042, 3565)
-    femmesh.addNode(889.4526069052318, 64.93856242355147, 25.0, 3566)
-    femmesh.addNode(847.3288444900829, 182.04001785563048, 83.70462005402675, 3567)
-    femmesh.addNode(515.2350195485586, 16.747583798154622, 89.5, 3568)
-    femmesh.addNode(714.5350202957866, 19.838782636667215, 80.16623275298208, 3569)
-    femmesh.addNode(535.2350195485586, 16.747583798154622, 85.23674925831978, 3570)
-    femmesh.addNode(672.7019281429373, 17.29998039555096, 15.583333333333437, 3571)
-    femmesh.addNode(363.6621144695473, 180.73008099259604, 80.15910390840787, 3572)
-    femmesh.addNode(872.2438976427862, 182.56614105423233, 16.151341672704795, 3573)
-    femmesh.addNode(81.55096322559999, 187.6379029794889, 10.88619122893256, 3574)
-    femmesh.addNode(426.19269725336153, 17.70566792660763, 24.7863329424826, 3575)
-    femmesh.addNode(81.36627434988893, 187.63790297948884, 89.28621431104274, 3576)
-    femmesh.addNode(828.135529974777, 182.3349128975037, 83.70462005402675, 3577)
-    femmesh.addNode(832.9948659590348, 176.8002809066685, 63.639474237555994, 3578)
-    femmesh.addNode(282.71450368508954, 186.40647006947822, 16.382110117530395, 3579)
-    femmesh.addNode(158.01556322821102, 186.72201414898043, 89.03346132797844, 3580)
-    femmesh.addNode(900.6955965390043, 183.52675153139353, 85.32688517204481, 3581)
-    femmesh.addNode(14.469399866772616, 190.06481513712674, 38.75681429403424, 3582)
-    femmesh.addNode(985.3902900435723, 9.990614287883412, 38.91817729100844, 3583)
-    femmesh.addNode(985.3902900435723, 190.06481513712674, 38.94332175599537, 3584)
-    femmesh.addNode(904.8456938069435, 16.574314446548794, 17.289625338457192, 3585)
-    femmesh.addNode(325.71264450058857, 16.776275223684923, 14.685831179064607, 3586)
-    femmesh.addNode(403.4151722795814, 173.82850722636317, 35.61236421761305, 3587)
-    return True
+    return load_mesh(femmesh, __name__, elements=False)
 
 
 def create_elements(femmesh):
     # elements
-    femmesh.addVolume([1657, 1721, 2204, 2221, 1950, 2260, 2259, 2261, 2262, 2263], 1231)
-    femmesh.addVolume([1657, 2204, 2234, 2221, 2259, 2265, 2264, 2261, 2263, 2266], 1232)
-    femmesh.addVolume([1117, 2256, 2241, 2208, 2269, 2268, 2267, 2270, 2271, 2272], 1233)
-    femmesh.addVolume([1712, 2241, 2256, 2208, 2274, 2268, 2273, 2275, 2272, 2271], 1234)
-    femmesh.addVolume([2237, 1737, 2248, 2231, 2278, 2277, 2276, 2279, 2280, 2281], 1235)
-    femmesh.addVolume([2204, 1067, 2237, 2248, 2284, 2283, 2282, 2285, 2286, 2276], 1236)
-    femmesh.addVolume([1660, 2204, 2237, 2248, 2288, 2282, 2287, 2289, 2285, 2276], 1237)
-    femmesh.addVolume([2204, 1660, 2237, 2233, 2288, 2287, 2282, 2290, 2291, 2292], 1238)
-    femmesh.addVolume([1124, 1024, 2237, 2248, 1416, 2294, 2293, 2295, 2296, 2276], 1239)
-    femmesh.addVolume([1032, 2244, 2234, 2199, 2299, 2298, 2297, 2300, 2301, 2302], 1240)
-    femmesh.addVolume([1067, 2204, 2244, 2248, 2284, 2304, 2303, 2286, 2285, 2305], 1241)
-    femmesh.addVolume([2232, 1737, 2237, 2231, 2307, 2278, 2306, 2308, 2280, 2279], 1242)
-    femmesh.addVolume([2227, 1097, 2238, 2205, 2311, 2310, 2309, 2312, 2313, 2314], 1243)
-    femmesh.addVolume([1145, 2237, 2248, 2231, 2316, 2276, 2315, 2317, 2279, 2281], 1244)
-    femmesh.addVolume([1674, 2253, 2230, 2208, 2320, 2319, 2318, 2321, 2322, 2323], 1245)
-    femmesh.addVolume([1132, 1067, 2204, 2244, 1363, 2284, 2324, 2325, 2303, 2304], 1246)
-    femmesh.addVolume([1706, 1674, 2230, 2208, 1929, 2318, 2326, 2327, 2321, 2323], 1247)
-    femmesh.addVolume([1132, 1067, 2244, 2248, 1363, 2303, 2325, 2328, 2286, 2305], 1248)
-    femmesh.addVolume([2204, 1660, 2244, 2248, 2288, 2329, 2304, 2285, 2289, 2305], 1249)
-    femmesh.addVolume([1616, 2255, 2256, 2240, 2332, 2331, 2330, 2333, 2334, 2335], 1250)
-    femmesh.addVolume([2255, 1023, 2256, 2240, 2337, 2336, 2331, 2334, 2338, 2335], 1251)
-    femmesh.addVolume([1702, 2251, 2210, 2216, 2341, 2340, 2339, 2342, 2343, 2344], 1252)
-    femmesh.addVolume([1641, 727, 2250, 2257, 2347, 2346, 2345, 2348, 2349, 2350], 1253)
-    femmesh.addVolume([1720, 2244, 2248, 2206, 2352, 2305, 2351, 2353, 2354, 2355], 1254)
-    femmesh.addVolume([333, 448, 338, 2252, 2357, 2356, 354, 2358, 2359, 2360], 1255)
-    femmesh.addVolume([1145, 2232, 2237, 2231, 2361, 2306, 2316, 2317, 2308, 2279], 1256)
-    femmesh.addVolume([1613, 1702, 2210, 2216, 1960, 2339, 2362, 2363, 2342, 2344], 1257)
-    femmesh.addVolume([2254, 1611, 2211, 2228, 2366, 2365, 2364, 2367, 2368, 2369], 1258)
-    femmesh.addVolume([1690, 2227, 2214, 2238, 2372, 2371, 2370, 2373, 2309, 2374], 1259)
-    femmesh.addVolume([1032, 1089, 2244, 2199, 1492, 2375, 2299, 2300, 2376, 2301], 1260)
-    femmesh.addVolume([1676, 2212, 2227, 2243, 2379, 2378, 2377, 2380, 2381, 2382], 1261)
-    femmesh.addVolume([1617, 1718, 2237, 2248, 2006, 2384, 2383, 2385, 2386, 2276], 1262)
-    femmesh.addVolume([2244, 1132, 2248, 2206, 2325, 2328, 2305, 2354, 2387, 2355], 1263)
-    femmesh.addVolume([1690, 2227, 2238, 2205, 2372, 2309, 2373, 2388, 2312, 2314], 1264)
-    femmesh.addVolume([2212, 1084, 2227, 2243, 2390, 2389, 2378, 2381, 2391, 2382], 1265)
-    femmesh.addVolume([1089, 398, 2244, 2199, 2393, 2392, 2375, 2376, 2394, 2301], 1266)
-    femmesh.addVolume([1117, 1080, 2256, 2208, 1330, 2395, 2269, 2270, 2396, 2271], 1267)
-    femmesh.addVolume([1705, 1611, 2254, 2228, 1939, 2366, 2397, 2398, 2368, 2367], 1268)
-    femmesh.addVolume([1672, 1712, 2256, 2208, 1925, 2273, 2399, 2400, 2275, 2271], 1269)
-    femmesh.addVolume([398, 1727, 2244, 2199, 2402, 2401, 2392, 2394, 2403, 2301], 1270)
-    femmesh.addVolume([1657, 2204, 2244, 2234, 2259, 2304, 2404, 2264, 2265, 2298], 1271)
-    femmesh.addVolume([2251, 1109, 2210, 2216, 2406, 2405, 2340, 2343, 2407, 2344], 1272)
-    femmesh.addVolume([2244, 1638, 2234, 2199, 2409, 2408, 2298, 2301, 2410, 2302], 1273)
-    femmesh.addVolume([1067, 1038, 2204, 2237, 1539, 2411, 2284, 2283, 2412, 2282], 1274)
-    femmesh.addVolume([1145, 2237, 1024, 2248, 2316, 2294, 1420, 2315, 2276, 2296], 1275)
-    femmesh.addVolume([1066, 2244, 2204, 2234, 2414, 2304, 2413, 2415, 2298, 2265], 1276)
-    femmesh.addVolume([727, 715, 2250, 2257, 926, 2416, 2346, 2349, 2417, 2350], 1277)
-    femmesh.addVolume([1720, 2244, 1660, 2248, 2352, 2329, 1952, 2351, 2305, 2289], 1278)
-    femmesh.addVolume([2210, 1613, 2216, 2218, 2362, 2363, 2344, 2418, 2419, 2420], 1279)
-    femmesh.addVolume([1020, 2210, 2216, 2218, 2422, 2344, 2421, 2423, 2418, 2420], 1280)
-    femmesh.addVolume([1618, 2234, 2200, 2213, 2426, 2425, 2424, 2427, 2428, 2429], 1281)
-    femmesh.addVolume([1024, 1145, 2248, 2231, 1420, 2315, 2296, 2430, 2317, 2281], 1282)
-    femmesh.addVolume([1720, 2204, 1660, 2244, 2431, 2288, 1952, 2352, 2304, 2329], 1283)
-    femmesh.addVolume([1112, 1032, 2244, 2234, 1489, 2299, 2432, 2433, 2297, 2298], 1284)
-    femmesh.addVolume([2204, 1066, 2234, 2221, 2413, 2415, 2265, 2263, 2434, 2266], 1285)
-    femmesh.addVolume([1713, 1702, 1613, 2216, 1968, 1960, 1963, 2435, 2342, 2363], 1286)
-    femmesh.addVolume([1641, 2250, 2214, 2257, 2345, 2437, 2436, 2348, 2350, 2438], 1287)
-    femmesh.addVolume([1714, 2217, 2210, 2229, 2441, 2440, 2439, 2442, 2443, 2444], 1288)
-    femmesh.addVolume([761, 335, 337, 2242, 2446, 368, 2445, 2447, 2448, 2449], 1289)
-    femmesh.addVolume([1023, 1121, 2256, 2240, 1407, 2450, 2336, 2338, 2451, 2335], 1290)
-    femmesh.addVolume([1630, 1721, 1657, 2221, 2119, 1950, 2121, 2452, 2262, 2261], 1291)
-    femmesh.addVolume([1715, 1616, 2256, 2240, 1995, 2330, 2453, 2454, 2333, 2335], 1292)
-    femmesh.addVolume([1020, 2210, 1109, 2216, 2422, 2405, 1369, 2421, 2344, 2407], 1293)
-    femmesh.addVolume([1089, 1112, 1032, 2244, 1493, 1489, 1492, 2375, 2432, 2299], 1294)
-    femmesh.addVolume([1663, 760, 2230, 2250, 2457, 2456, 2455, 2458, 2459, 2460], 1295)
-    femmesh.addVolume([757, 1076, 2230, 2250, 2463, 2462, 2461, 2464, 2465, 2460], 1296)
-    femmesh.addVolume([1617, 2237, 1737, 2248, 2383, 2278, 2011, 2385, 2276, 2277], 1297)
-    femmesh.addVolume([706, 2230, 765, 2241, 2467, 2466, 955, 2468, 2469, 2470], 1298)
-    femmesh.addVolume([1048, 765, 2230, 2241, 2472, 2466, 2471, 2473, 2470, 2469], 1299)
-    femmesh.addVolume([1713, 2216, 1613, 2218, 2435, 2363, 1963, 2474, 2420, 2419], 1300)
-    femmesh.addVolume([1727, 407, 398, 2244, 2475, 673, 2402, 2401, 2476, 2392], 1301)
-    femmesh.addVolume([762, 272, 270, 2232, 2478, 303, 2477, 2479, 2480, 2481], 1302)
-    femmesh.addVolume([1637, 2200, 2211, 2213, 2484, 2483, 2482, 2485, 2429, 2486], 1303)
-    femmesh.addVolume([1020, 2216, 1118, 2218, 2421, 2487, 1371, 2423, 2420, 2488], 1304)
-    femmesh.addVolume([1611, 2211, 2228, 2213, 2365, 2369, 2368, 2489, 2486, 2490], 1305)
-    femmesh.addVolume([420, 1089, 398, 2244, 2491, 2393, 674, 2492, 2375, 2392], 1306)
-    femmesh.addVolume([1066, 1112, 2204, 2244, 1358, 2493, 2413, 2414, 2432, 2304], 1307)
-    femmesh.addVolume([455, 396, 2258, 2215, 663, 2495, 2494, 2496, 2497, 2498], 1308)
-    femmesh.addVolume([1036, 2217, 2255, 2226, 2501, 2500, 2499, 2502, 2503, 2504], 1309)
-    femmesh.addVolume([1141, 2211, 1018, 2213, 2506, 2505, 1345, 2507, 2486, 2508], 1310)
-    femmesh.addVolume([1066, 1112, 2244, 2234, 1358, 2432, 2414, 2415, 2433, 2298], 1311)
-    femmesh.addVolume([273, 449, 268, 2202, 2510, 2509, 289, 2511, 2512, 2513], 1312)
-    femmesh.addVolume([1073, 2254, 2251, 2210, 2516, 2515, 2514, 2517, 2518, 2340], 1313)
-    femmesh.addVolume([2217, 1714, 2210, 2218, 2441, 2439, 2440, 2519, 2520, 2418], 1314)
-    femmesh.addVolume([1642, 2230, 766, 2241, 2523, 2522, 2521, 2524, 2469, 2525], 1315)
-    femmesh.addVolume([1124, 1024, 1145, 2237, 1416, 1420, 1421, 2293, 2294, 2316], 1316)
-    femmesh.addVolume([2254, 1030, 2251, 2209, 2527, 2526, 2515, 2528, 2529, 2530], 1317)
-    femmesh.addVolume([1676, 2227, 1741, 2243, 2377, 2531, 1990, 2380, 2382, 2532], 1318)
-    femmesh.addVolume([1631, 2237, 1660, 2233, 2533, 2287, 2130, 2534, 2292, 2291], 1319)
-    femmesh.addVolume([1667, 2250, 1622, 2207, 2536, 2535, 2058, 2537, 2538, 2539], 1320)
-    femmesh.addVolume([1020, 1109, 1118, 2216, 1369, 1376, 1371, 2421, 2407, 2487], 1321)
-    femmesh.addVolume([1149, 2227, 1084, 2243, 2540, 2389, 1401, 2541, 2382, 2391], 1322)
-    femmesh.addVolume([1141, 2228, 2211, 2213, 2542, 2369, 2506, 2507, 2490, 2486], 1323)
-    femmesh.addVolume([1117, 1033, 2241, 2256, 1498, 2543, 2267, 2269, 2544, 2268], 1324)
-    femmesh.addVolume([1078, 1048, 765, 2230, 1309, 2472, 2545, 2546, 2471, 2466], 1325)
-    femmesh.addVolume([1626, 1712, 2241, 2256, 2087, 2274, 2547, 2548, 2273, 2268], 1326)
-    femmesh.addVolume([1737, 1617, 2248, 2231, 2011, 2385, 2277, 2280, 2549, 2281], 1327)
-    femmesh.addVolume([1727, 1638, 2244, 2199, 2176, 2409, 2401, 2403, 2410, 2301], 1328)
-    femmesh.addVolume([1082, 1128, 2211, 2258, 1347, 2551, 2550, 2552, 2553, 2554], 1329)
-    femmesh.addVolume([1629, 2217, 2255, 2218, 2556, 2500, 2555, 2557, 2519, 2558], 1330)
-    femmesh.addVolume([1092, 2251, 1030, 2209, 2559, 2526, 1471, 2560, 2530, 2529], 1331)
-    femmesh.addVolume([2234, 1066, 2203, 2221, 2415, 2562, 2561, 2266, 2434, 2563], 1332)
-    femmesh.addVolume([1067, 1038, 1126, 2204, 1539, 1538, 1361, 2284, 2411, 2564], 1333)
-    femmesh.addVolume([706, 766, 2230, 2241, 954, 2522, 2467, 2468, 2525, 2469], 1334)
-    femmesh.addVolume([766, 1642, 1678, 2230, 2521, 1901, 2565, 2522, 2523, 2566], 1335)
-    femmesh.addVolume([1714, 2210, 1692, 2229, 2439, 2567, 1967, 2442, 2444, 2568], 1336)
-    femmesh.addVolume([1667, 1700, 1622, 2250, 1981, 2055, 2058, 2536, 2569, 2535], 1337)
-    femmesh.addVolume([1667, 2253, 1621, 2236, 2571, 2570, 2046, 2572, 2573, 2574], 1338)
-    femmesh.addVolume([1119, 2217, 2210, 2218, 2576, 2440, 2575, 2577, 2519, 2418], 1339)
-    femmesh.addVolume([2217, 1629, 2255, 2226, 2556, 2555, 2500, 2503, 2578, 2504], 1340)
-    femmesh.addVolume([1082, 2258, 2211, 2224, 2552, 2554, 2550, 2579, 2580, 2581], 1341)
-    femmesh.addVolume([713, 757, 2230, 2250, 1008, 2461, 2582, 2583, 2464, 2460], 1342)
-    femmesh.addVolume([1663, 760, 719, 2230, 2457, 920, 2584, 2455, 2456, 2585], 1343)
-    femmesh.addVolume([2217, 1036, 2255, 2218, 2501, 2499, 2500, 2519, 2586, 2558], 1344)
-    femmesh.addVolume([1019, 2204, 1112, 2244, 2587, 2493, 1359, 2588, 2304, 2432], 1345)
-    femmesh.addVolume([1038, 2204, 2237, 2233, 2411, 2282, 2412, 2589, 2290, 2292], 1346)
-    femmesh.addVolume([760, 713, 2230, 2250, 1004, 2582, 2456, 2459, 2583, 2460], 1347)
-    femmesh.addVolume([1104, 1083, 2208, 2207, 1336, 2591, 2590, 2592, 2593, 2594], 1348)
-    femmesh.addVolume([421, 1668, 2205, 2223, 2597, 2596, 2595, 2598, 2599, 2600], 1349)
-    femmesh.addVolume([1104, 2208, 2230, 2207, 2590, 2323, 2601, 2592, 2594, 2602], 1350)
-    femmesh.addVolume([1637, 2211, 1735, 2213, 2482, 2603, 2167, 2485, 2486, 2604], 1351)
-    femmesh.addVolume([714, 2232, 735, 2237, 2606, 2605, 1014, 2607, 2306, 2608], 1352)
-    femmesh.addVolume([734, 757, 1076, 2230, 846, 2463, 2609, 2610, 2461, 2462], 1353)
-    femmesh.addVolume([1614, 1690, 2214, 2238, 1974, 2370, 2611, 2612, 2373, 2374], 1354)
-    femmesh.addVolume([1678, 1663, 719, 2230, 1904, 2584, 2613, 2566, 2455, 2585], 1355)
-    femmesh.addVolume([1706, 1610, 1674, 2208, 1930, 1928, 1929, 2327, 2614, 2321], 1356)
-    femmesh.addVolume([1033, 2241, 2256, 2240, 2543, 2268, 2544, 2615, 2616, 2335], 1357)
-    femmesh.addVolume([1626, 2256, 2241, 2240, 2548, 2268, 2547, 2617, 2335, 2616], 1358)
-    femmesh.addVolume([2234, 1086, 2200, 2213, 2619, 2618, 2425, 2428, 2620, 2429], 1359)
-    femmesh.addVolume([1657, 2204, 1612, 2244, 2259, 2621, 1946, 2404, 2304, 2622], 1360)
-    femmesh.addVolume([1667, 2238, 2250, 2207, 2624, 2623, 2536, 2537, 2625, 2538], 1361)
-    femmesh.addVolume([1706, 2230, 2241, 2208, 2326, 2469, 2626, 2327, 2323, 2272], 1362)
-    femmesh.addVolume([2230, 1104, 2241, 2208, 2601, 2627, 2469, 2323, 2590, 2272], 1363)
-    femmesh.addVolume([1657, 2244, 1638, 2234, 2404, 2409, 1945, 2264, 2298, 2408], 1364)
-    femmesh.addVolume([1718, 1737, 1617, 2237, 2010, 2011, 2006, 2384, 2278, 2383], 1365)
-    femmesh.addVolume([714, 736, 2232, 2237, 1013, 2628, 2606, 2607, 2629, 2306], 1366)
-    femmesh.addVolume([2230, 1622, 2250, 2207, 2630, 2535, 2460, 2602, 2539, 2538], 1367)
-    femmesh.addVolume([1617, 2248, 2231, 2225, 2385, 2281, 2549, 2631, 2632, 2633], 1368)
-    femmesh.addVolume([1711, 1697, 2208, 2220, 1931, 2635, 2634, 2636, 2637, 2638], 1369)
-    femmesh.addVolume([1082, 2211, 2254, 2224, 2550, 2364, 2639, 2579, 2581, 2640], 1370)
-    femmesh.addVolume([1119, 2210, 2217, 2229, 2575, 2440, 2576, 2641, 2444, 2443], 1371)
-    femmesh.addVolume([448, 432, 392, 2252, 475, 638, 639, 2359, 2642, 2643], 1372)
-    femmesh.addVolume([766, 1678, 719, 2230, 2565, 2613, 917, 2522, 2566, 2585], 1373)
-    femmesh.addVolume([2227, 1075, 2205, 2223, 2645, 2644, 2312, 2646, 2647, 2600], 1374)
-    femmesh.addVolume([455, 2258, 1651, 2215, 2494, 2649, 2648, 2496, 2498, 2650], 1375)
-    femmesh.addVolume([1078, 765, 734, 2230, 2545, 843, 2651, 2546, 2466, 2610], 1376)
-    femmesh.addVolume([1690, 2238, 1691, 2205, 2373, 2652, 1982, 2388, 2314, 2653], 1377)
-    femmesh.addVolume([1613, 2210, 1714, 2218, 2362, 2439, 1965, 2419, 2418, 2520], 1378)
-    femmesh.addVolume([1066, 1112, 1019, 2204, 1358, 1359, 1355, 2413, 2493, 2587], 1379)
-    femmesh.addVolume([1046, 2238, 1097, 2205, 2654, 2310, 1379, 2655, 2314, 2313], 1380)
-    femmesh.addVolume([1073, 1082, 2254, 2224, 1446, 2639, 2516, 2656, 2579, 2640], 1381)
-    femmesh.addVolume([406, 2205, 1075, 2223, 2658, 2644, 2657, 2659, 2600, 2647], 1382)
-    femmesh.addVolume([1017, 1104, 1083, 2208, 1335, 1336, 1334, 2660, 2590, 2591], 1383)
-    femmesh.addVolume([760, 713, 719, 2230, 1004, 1003, 920, 2456, 2582, 2585], 1384)
-    femmesh.addVolume([2253, 1674, 2230, 2207, 2320, 2318, 2319, 2661, 2662, 2602], 1385)
-    femmesh.addVolume([1739, 2234, 1638, 2199, 2663, 2408, 2174, 2664, 2302, 2410], 1386)
-    femmesh.addVolume([1720, 2248, 1632, 2206, 2351, 2665, 2137, 2353, 2355, 2666], 1387)
-    femmesh.addVolume([1025, 2234, 2203, 2213, 2668, 2561, 2667, 2669, 2428, 2670], 1388)
-    femmesh.addVolume([448, 392, 433, 2252, 639, 635, 474, 2359, 2643, 2671], 1389)
-    femmesh.addVolume([1668, 2227, 2205, 2223, 2672, 2312, 2596, 2599, 2646, 2600], 1390)
-    femmesh.addVolume([724, 715, 1047, 2250, 852, 2674, 2673, 2675, 2416, 2676], 1391)
-    femmesh.addVolume([1674, 1622, 2230, 2207, 2057, 2630, 2318, 2662, 2539, 2602], 1392)
-    femmesh.addVolume([1667, 1700, 2250, 2238, 1981, 2569, 2536, 2624, 2677, 2623], 1393)
-    femmesh.addVolume([455, 410, 396, 2215, 578, 661, 663, 2496, 2678, 2497], 1394)
-    femmesh.addVolume([420, 398, 407, 2244, 674, 673, 669, 2492, 2392, 2476], 1395)
-    femmesh.addVolume([1073, 2254, 1030, 2251, 2516, 2527, 1477, 2514, 2515, 2526], 1396)
-    femmesh.addVolume([734, 1076, 1078, 2230, 2609, 1312, 2651, 2610, 2462, 2546], 1397)
-    femmesh.addVolume([713, 757, 734, 2230, 1008, 846, 1002, 2582, 2461, 2610], 1398)
-    femmesh.addVolume([1045, 1066, 2204, 2221, 1354, 2413, 2679, 2680, 2434, 2263], 1399)
-    femmesh.addVolume([269, 449, 273, 2202, 2681, 2510, 288, 2682, 2512, 2511], 1400)
-    femmesh.addVolume([734, 765, 706, 2230, 843, 955, 952, 2610, 2466, 2467], 1401)
-    femmesh.addVolume([1714, 1645, 2217, 2229, 2189, 2683, 2441, 2442, 2684, 2443], 1402)
-    femmesh.addVolume([2254, 1623, 2251, 2224, 2686, 2685, 2515, 2640, 2687, 2688], 1403)
-    femmesh.addVolume([1082, 1027, 2258, 2224, 1445, 2689, 2552, 2579, 2690, 2580], 1404)
-    femmesh.addVolume([1082, 1144, 2254, 2211, 1350, 2691, 2639, 2550, 2692, 2364], 1405)
-    femmesh.addVolume([719, 706, 766, 2230, 953, 954, 917, 2585, 2467, 2522], 1406)
-    femmesh.addVolume([1703, 1611, 2228, 2213, 1933, 2368, 2693, 2694, 2489, 2490], 1407)
-    femmesh.addVolume([714, 736, 735, 2232, 1013, 939, 1014, 2606, 2628, 2605], 1408)
-    femmesh.addVolume([1117, 1080, 1033, 2256, 1330, 1497, 1498, 2269, 2395, 2544], 1409)
-    femmesh.addVolume([406, 421, 2205, 2223, 649, 2595, 2658, 2659, 2598, 2600], 1410)
-    femmesh.addVolume([1038, 1126, 2204, 2233, 1538, 2564, 2411, 2589, 2695, 2290], 1411)
-    femmesh.addVolume([1036, 2255, 1123, 2226, 2499, 2696, 1521, 2502, 2504, 2697], 1412)
-    femmesh.addVolume([1672, 1712, 1626, 2256, 1925, 2087, 2088, 2399, 2273, 2548], 1413)
-    femmesh.addVolume([1149, 2227, 2243, 2223, 2540, 2382, 2541, 2698, 2646, 2699], 1414)
-    femmesh.addVolume([1711, 2208, 2239, 2220, 2634, 2701, 2700, 2636, 2638, 2702], 1415)
-    femmesh.addVolume([1147, 2203, 1066, 2221, 2703, 2562, 1432, 2704, 2563, 2434], 1416)
-    femmesh.addVolume([1119, 2210, 1020, 2218, 2575, 2422, 1374, 2577, 2418, 2423], 1417)
-    femmesh.addVolume([1082, 1027, 1128, 2258, 1445, 1452, 1347, 2552, 2689, 2553], 1418)
-    femmesh.addVolume([1149, 1026, 1084, 2227, 1442, 1437, 1401, 2540, 2705, 2389], 1419)
-    femmesh.addVolume([1667, 1622, 1674, 2207, 2058, 2057, 2044, 2537, 2539, 2662], 1420)
-    femmesh.addVolume([718, 2242, 737, 2249, 2707, 2706, 1016, 2708, 2709, 2710], 1421)
-    femmesh.addVolume([411, 2239, 1710, 2201, 2713, 2712, 2711, 2714, 2715, 2716], 1422)
-    femmesh.addVolume([1073, 2254, 2210, 2224, 2516, 2518, 2517, 2656, 2640, 2717], 1423)
-    femmesh.addVolume([332, 2242, 1653, 2235, 2720, 2719, 2718, 2721, 2722, 2723], 1424)
-    femmesh.addVolume([1720, 1612, 2204, 2244, 1948, 2621, 2431, 2352, 2622, 2304], 1425)
-    femmesh.addVolume([763, 714, 735, 2237, 1012, 1014, 868, 2724, 2607, 2608], 1426)
-    femmesh.addVolume([705, 747, 761, 2242, 949, 788, 950, 2725, 2726, 2447], 1427)
-    femmesh.addVolume([2253, 2208, 1697, 2220, 2322, 2635, 2727, 2728, 2638, 2637], 1428)
-    femmesh.addVolume([337, 335, 327, 2242, 368, 387, 388, 2449, 2448, 2729], 1429)
-    femmesh.addVolume([1132, 1067, 1019, 2204, 1363, 1360, 1362, 2324, 2284, 2587], 1430)
-    femmesh.addVolume([1618, 2234, 1740, 2200, 2426, 2730, 2022, 2424, 2425, 2731], 1431)
-    femmesh.addVolume([1666, 2251, 1623, 2224, 2732, 2685, 2066, 2733, 2688, 2687], 1432)
-    femmesh.addVolume([333, 338, 326, 2252, 354, 382, 381, 2358, 2360, 2734], 1433)
-    femmesh.addVolume([1092, 720, 1071, 2251, 2736, 2735, 1286, 2559, 2737, 2738], 1434)
-    femmesh.addVolume([1116, 2239, 416, 2201, 2741, 2740, 2739, 2742, 2715, 2743], 1435)
-    femmesh.addVolume([1086, 2234, 1025, 2213, 2619, 2668, 1427, 2620, 2428, 2669], 1436)
-    femmesh.addVolume([2248, 1146, 2231, 2225, 2745, 2744, 2281, 2632, 2746, 2633], 1437)
-    femmesh.addVolume([1073, 1027, 1082, 2224, 1444, 1445, 1446, 2656, 2690, 2579], 1438)
-    femmesh.addVolume([1741, 2243, 2227, 2223, 2532, 2382, 2531, 2747, 2699, 2646], 1439)
-    femmesh.addVolume([1692, 2258, 2229, 2224, 2749, 2748, 2568, 2750, 2580, 2751], 1440)
-    femmesh.addVolume([1021, 2227, 1097, 2238, 2752, 2311, 1378, 2753, 2309, 2310], 1441)
-    femmesh.addVolume([764, 736, 714, 2237, 794, 1013, 1011, 2754, 2629, 2607], 1442)
-    femmesh.addVolume([2253, 2208, 1083, 2207, 2322, 2591, 2755, 2661, 2594, 2593], 1443)
-    femmesh.addVolume([1676, 1619, 1741, 2227, 2025, 2032, 1990, 2377, 2756, 2531], 1444)
-    femmesh.addVolume([1039, 2248, 1132, 2206, 2757, 2328, 1542, 2758, 2355, 2387], 1445)
-    femmesh.addVolume([1729, 1653, 332, 2242, 1773, 2718, 2759, 2760, 2719, 2720], 1446)
-    femmesh.addVolume([398, 440, 1089, 420, 678, 2761, 2393, 674, 490, 2491], 1447)
-    femmesh.addVolume([768, 709, 2221, 2233, 976, 2763, 2762, 2764, 2765, 2766], 1448)
-    femmesh.addVolume([1089, 420, 1055, 2244, 2491, 2767, 1197, 2375, 2492, 2768], 1449)
-    femmesh.addVolume([705, 761, 748, 2242, 950, 787, 945, 2725, 2447, 2769], 1450)
-    femmesh.addVolume([738, 718, 737, 2249, 1015, 1016, 861, 2770, 2708, 2710], 1451)
-    femmesh.addVolume([1667, 1674, 2253, 2207, 2044, 2320, 2571, 2537, 2662, 2661], 1452)
-    femmesh.addVolume([1692, 1645, 1714, 2229, 2188, 2189, 1967, 2568, 2684, 2442], 1453)
-    femmesh.addVolume([1692, 2258, 1670, 2229, 2749, 2771, 2043, 2568, 2748, 2772], 1454)
-    femmesh.addVolume([1131, 2211, 2200, 2213, 2774, 2483, 2773, 2775, 2486, 2429], 1455)
-    femmesh.addVolume([2234, 1740, 2200, 2199, 2730, 2731, 2425, 2302, 2776, 2777], 1456)
-    femmesh.addVolume([1740, 2234, 1618, 2199, 2730, 2426, 2022, 2776, 2302, 2778], 1457)
-    femmesh.addVolume([1128, 2258, 1052, 2215, 2553, 2779, 1596, 2780, 2498, 2781], 1458)
-    femmesh.addVolume([400, 416, 2239, 2201, 691, 2740, 2782, 2783, 2743, 2715], 1459)
-    femmesh.addVolume([455, 1651, 410, 2215, 2648, 2784, 578, 2496, 2650, 2678], 1460)
-    femmesh.addVolume([1637, 2211, 2200, 2215, 2482, 2483, 2484, 2785, 2786, 2787], 1461)
-    femmesh.addVolume([1019, 1132, 2204, 2244, 1362, 2324, 2587, 2588, 2325, 2304], 1462)
-    femmesh.addVolume([1018, 1144, 1082, 2211, 1349, 1350, 1346, 2505, 2692, 2550], 1463)
-    femmesh.addVolume([1705, 1703, 1611, 2228, 1943, 1933, 1939, 2398, 2693, 2368], 1464)
-    femmesh.addVolume([1660, 1720, 1612, 2204, 1952, 1948, 1953, 2288, 2431, 2621], 1465)
-    femmesh.addVolume([1679, 2234, 1618, 2213, 2788, 2426, 2015, 2789, 2428, 2427], 1466)
-    femmesh.addVolume([2214, 1098, 2250, 2238, 2791, 2790, 2437, 2374, 2792, 2623], 1467)
-    femmesh.addVolume([1716, 2255, 2219, 2218, 2795, 2794, 2793, 2796, 2558, 2797], 1468)
-    femmesh.addVolume([332, 1653, 328, 2235, 2718, 2798, 363, 2721, 2723, 2799], 1469)
-    femmesh.addVolume([272, 262, 270, 2232, 323, 322, 303, 2480, 2800, 2481], 1470)
-    femmesh.addVolume([411, 400, 2239, 2201, 690, 2782, 2713, 2714, 2783, 2715], 1471)
-    femmesh.addVolume([333, 432, 448, 2252, 2801, 475, 2357, 2358, 2642, 2359], 1472)
-    femmesh.addVolume([746, 762, 704, 2232, 783, 944, 943, 2802, 2479, 2803], 1473)
-    femmesh.addVolume([704, 762, 745, 2232, 944, 784, 942, 2803, 2479, 2804], 1474)
-    femmesh.addVolume([1629, 2255, 1673, 2218, 2555, 2805, 2109, 2557, 2558, 2806], 1475)
-    femmesh.addVolume([1655, 735, 2232, 2237, 2808, 2605, 2807, 2809, 2608, 2306], 1476)
-    femmesh.addVolume([1628, 2239, 2256, 2201, 2812, 2811, 2810, 2813, 2715, 2814], 1477)
-    femmesh.addVolume([2239, 1035, 2256, 2201, 2816, 2815, 2811, 2715, 2817, 2814], 1478)
-    femmesh.addVolume([1618, 2200, 1659, 2213, 2424, 2818, 2021, 2427, 2429, 2819], 1479)
-    femmesh.addVolume([430, 449, 391, 2202, 471, 633, 632, 2820, 2512, 2821], 1480)
-    femmesh.addVolume([1029, 2238, 2236, 2207, 2824, 2823, 2822, 2825, 2625, 2826], 1481)
-    femmesh.addVolume([1637, 1659, 2200, 2213, 2168, 2818, 2484, 2485, 2819, 2429], 1482)
-    femmesh.addVolume([1717, 2255, 1629, 2226, 2827, 2555, 2110, 2828, 2504, 2578], 1483)
-    femmesh.addVolume([1047, 715, 1069, 2257, 2674, 2829, 1318, 2830, 2417, 2831], 1484)
-    femmesh.addVolume([1029, 2236, 2253, 2207, 2822, 2573, 2832, 2825, 2826, 2661], 1485)
-    femmesh.addVolume([2251, 1666, 2210, 2224, 2732, 2833, 2340, 2688, 2733, 2717], 1486)
-    femmesh.addVolume([1657, 1612, 1638, 2244, 1946, 1947, 1945, 2404, 2622, 2409], 1487)
-    femmesh.addVolume([1736, 2212, 2245, 2257, 2836, 2835, 2834, 2837, 2838, 2839], 1488)
-    femmesh.addVolume([1122, 1023, 2255, 2219, 1408, 2337, 2840, 2841, 2842, 2794], 1489)
-    femmesh.addVolume([1712, 1706, 2241, 2208, 1932, 2626, 2274, 2275, 2327, 2272], 1490)
-    femmesh.addVolume([1648, 2255, 1616, 2240, 2843, 2332, 1997, 2844, 2334, 2333], 1491)
-    femmesh.addVolume([1117, 2241, 1104, 2208, 2267, 2627, 1339, 2270, 2272, 2590], 1492)
-    femmesh.addVolume([1668, 1619, 2227, 2223, 2030, 2756, 2672, 2599, 2845, 2646], 1493)
-    femmesh.addVolume([2253, 2230, 2208, 2207, 2319, 2323, 2322, 2661, 2602, 2594], 1494)
-    femmesh.addVolume([2236, 1691, 2238, 2205, 2846, 2652, 2823, 2847, 2653, 2314], 1495)
-    femmesh.addVolume([736, 1062, 2232, 2237, 2849, 2848, 2628, 2629, 2850, 2306], 1496)
-    femmesh.addVolume([1055, 2244, 420, 2206, 2768, 2492, 2767, 2851, 2354, 2852], 1497)
-    femmesh.addVolume([391, 449, 431, 2202, 633, 470, 629, 2821, 2512, 2853], 1498)
-    femmesh.addVolume([1679, 2203, 2234, 2213, 2854, 2561, 2788, 2789, 2670, 2428], 1499)
-    femmesh.addVolume([396, 454, 2258, 2215, 664, 2855, 2495, 2497, 2856, 2498], 1500)
-    femmesh.addVolume([1086, 2234, 2200, 2199, 2619, 2425, 2618, 2857, 2302, 2777], 1501)
-    femmesh.addVolume([1643, 2239, 453, 2220, 2860, 2859, 2858, 2861, 2702, 2862], 1502)
-    femmesh.addVolume([1674, 1610, 2253, 2208, 1928, 2863, 2320, 2321, 2614, 2322], 1503)
-    femmesh.addVolume([1637, 1735, 1659, 2213, 2167, 1936, 2168, 2485, 2604, 2819], 1504)
-    femmesh.addVolume([1727, 1658, 407, 2244, 1789, 2864, 2475, 2401, 2865, 2476], 1505)
-    femmesh.addVolume([1119, 1099, 2210, 2229, 1375, 2866, 2575, 2641, 2867, 2444], 1506)
-    femmesh.addVolume([1046, 2236, 2238, 2205, 2868, 2823, 2654, 2655, 2847, 2314], 1507)
-    femmesh.addVolume([327, 336, 337, 2242, 386, 367, 388, 2729, 2869, 2449], 1508)
-    femmesh.addVolume([1079, 1052, 1128, 2258, 1595, 1596, 1451, 2870, 2779, 2553], 1509)
-    femmesh.addVolume([727, 715, 724, 2250, 926, 852, 1006, 2346, 2416, 2675], 1510)
-    femmesh.addVolume([1029, 1107, 2236, 2238, 1464, 2871, 2822, 2824, 2872, 2823], 1511)
-    femmesh.addVolume([1664, 1623, 2251, 2209, 2062, 2685, 2873, 2874, 2875, 2530], 1512)
-    femmesh.addVolume([1736, 2212, 2249, 2245, 2836, 2877, 2876, 2834, 2835, 2878], 1513)
-    femmesh.addVolume([1623, 2254, 2251, 2209, 2686, 2515, 2685, 2875, 2528, 2530], 1514)
-    femmesh.addVolume([1029, 1070, 1085, 2246, 1462, 1238, 1463, 2879, 2880, 2881], 1515)
-    femmesh.addVolume([761, 747, 335, 2242, 788, 2882, 2446, 2447, 2726, 2448], 1516)
-    femmesh.addVolume([1663, 2230, 1622, 2250, 2455, 2630, 2054, 2458, 2460, 2535], 1517)
-    femmesh.addVolume([1086, 1037, 2200, 2213, 1527, 2883, 2618, 2620, 2884, 2429], 1518)
-    femmesh.addVolume([758, 2251, 1644, 2216, 2887, 2886, 2885, 2888, 2343, 2889], 1519)
-    femmesh.addVolume([1665, 1690, 2227, 2214, 1975, 2372, 2890, 2891, 2370, 2371], 1520)
-    femmesh.addVolume([331, 1653, 1728, 2252, 2893, 1770, 2892, 2894, 2895, 2896], 1521)
-    femmesh.addVolume([1625, 2213, 2228, 2247, 2898, 2490, 2897, 2899, 2900, 2901], 1522)
-    femmesh.addVolume([768, 2221, 1065, 2233, 2762, 2903, 2902, 2764, 2766, 2904], 1523)
-    femmesh.addVolume([1081, 2255, 1036, 2218, 2905, 2499, 1518, 2906, 2558, 2586], 1524)
-    femmesh.addVolume([1029, 2236, 1070, 2246, 2822, 2907, 1462, 2879, 2908, 2880], 1525)
-    femmesh.addVolume([1637, 1735, 2211, 2215, 2167, 2603, 2482, 2785, 2909, 2786], 1526)
-    femmesh.addVolume([1648, 2219, 2255, 2240, 2910, 2794, 2843, 2844, 2911, 2334], 1527)
-    femmesh.addVolume([1666, 1702, 2251, 2210, 1961, 2341, 2732, 2833, 2339, 2340], 1528)
-    femmesh.addVolume([1073, 2210, 1027, 2224, 2517, 2912, 1444, 2656, 2717, 2690], 1529)
-    femmesh.addVolume([1614, 2250, 1700, 2238, 2913, 2569, 1970, 2612, 2623, 2677], 1530)
-    femmesh.addVolume([1063, 716, 2203, 2221, 2916, 2915, 2914, 2917, 2918, 2563], 1531)
-    femmesh.addVolume([733, 1664, 2251, 2209, 2920, 2873, 2919, 2921, 2874, 2530], 1532)
-    femmesh.addVolume([1059, 2254, 1144, 2228, 2922, 2691, 1473, 2923, 2367, 2924], 1533)
-    femmesh.addVolume([1720, 1660, 1632, 2248, 1952, 2138, 2137, 2351, 2289, 2665], 1534)
-    femmesh.addVolume([1653, 2252, 331, 2235, 2895, 2894, 2893, 2723, 2925, 2926], 1535)
-    femmesh.addVolume([758, 711, 2251, 2216, 994, 2927, 2887, 2888, 2928, 2343], 1536)
-    femmesh.addVolume([1658, 397, 2244, 2206, 2930, 2929, 2865, 2931, 2932, 2354], 1537)
-    femmesh.addVolume([394, 1668, 421, 2223, 2933, 2597, 619, 2934, 2599, 2598], 1538)
-    femmesh.addVolume([452, 2239, 1049, 2220, 2937, 2936, 2935, 2938, 2702, 2939], 1539)
-    femmesh.addVolume([444, 398, 1727, 407, 675, 2402, 2940, 566, 673, 2475], 1540)
-    femmesh.addVolume([1643, 1697, 1711, 2220, 2184, 1931, 2185, 2861, 2637, 2636], 1541)
-    femmesh.addVolume([1628, 1710, 2239, 2201, 2104, 2712, 2812, 2813, 2716, 2715], 1542)
-    femmesh.addVolume([1072, 2212, 1084, 2227, 2941, 2390, 1436, 2942, 2378, 2389], 1543)
-    femmesh.addVolume([1116, 1035, 2239, 2201, 1515, 2816, 2741, 2742, 2817, 2715], 1544)
-    femmesh.addVolume([271, 262, 272, 2232, 321, 323, 302, 2943, 2800, 2480], 1545)
-    femmesh.addVolume([1031, 2212, 2214, 2257, 2946, 2945, 2944, 2947, 2838, 2438], 1546)
-    femmesh.addVolume([452, 1094, 1049, 2239, 2948, 1232, 2935, 2937, 2949, 2936], 1547)
-    femmesh.addVolume([1702, 1623, 1666, 2251, 2063, 2066, 1961, 2341, 2685, 2732], 1548)
-    femmesh.addVolume([454, 1079, 2258, 2215, 2950, 2870, 2855, 2856, 2951, 2498], 1549)
-    femmesh.addVolume([1686, 453, 1643, 2239, 2952, 2858, 1826, 2953, 2859, 2860], 1550)
-    femmesh.addVolume([1620, 2258, 1692, 2224, 2954, 2749, 2041, 2955, 2580, 2750], 1551)
-    femmesh.addVolume([1676, 2212, 1665, 2227, 2379, 2956, 2026, 2377, 2378, 2890], 1552)
-    femmesh.addVolume([273, 268, 261, 2202, 289, 316, 317, 2511, 2513, 2957], 1553)
-    femmesh.addVolume([439, 1726, 1730, 2200, 2959, 1798, 2958, 2960, 2961, 2962], 1554)
-    femmesh.addVolume([1050, 2251, 755, 2216, 2965, 2964, 2963, 2966, 2343, 2967], 1555)
-    femmesh.addVolume([1642, 1706, 2230, 2241, 2182, 2326, 2523, 2524, 2626, 2469], 1556)
-    femmesh.addVolume([432, 434, 392, 2252, 627, 636, 638, 2642, 2968, 2643], 1557)
-    femmesh.addVolume([2204, 1065, 2221, 2233, 2969, 2903, 2263, 2290, 2904, 2766], 1558)
-    femmesh.addVolume([270, 745, 762, 2232, 2970, 784, 2477, 2481, 2804, 2479], 1559)
-    femmesh.addVolume([1618, 1740, 1659, 2200, 2022, 2023, 2021, 2424, 2731, 2818], 1560)
-    femmesh.addVolume([1067, 1124, 2237, 2248, 1417, 2293, 2283, 2286, 2295, 2276], 1561)
-    femmesh.addVolume([447, 1640, 414, 2205, 2972, 2971, 612, 2973, 2974, 2975], 1562)
-    femmesh.addVolume([1048, 2230, 1104, 2241, 2471, 2601, 1587, 2473, 2469, 2627], 1563)
-    femmesh.addVolume([1029, 1074, 2238, 2207, 1466, 2976, 2824, 2825, 2977, 2625], 1564)
-    femmesh.addVolume([397, 420, 2244, 2206, 668, 2492, 2929, 2932, 2852, 2354], 1565)
-    femmesh.addVolume([1146, 2248, 1125, 2225, 2745, 2978, 1422, 2746, 2632, 2979], 1566)
-    femmesh.addVolume([718, 2249, 738, 2245, 2708, 2770, 1015, 2980, 2878, 2981], 1567)
-    femmesh.addVolume([1111, 1120, 2208, 2220, 1340, 2983, 2982, 2984, 2985, 2638], 1568)
-    femmesh.addVolume([1679, 1657, 2234, 2203, 2016, 2264, 2788, 2854, 2986, 2561], 1569)
-    femmesh.addVolume([1664, 1677, 1623, 2209, 1878, 2061, 2062, 2874, 2987, 2875], 1570)
-    femmesh.addVolume([1620, 1670, 1692, 2258, 2042, 2043, 2041, 2954, 2771, 2749], 1571)
-    femmesh.addVolume([412, 2217, 1645, 2229, 2989, 2683, 2988, 2990, 2443, 2684], 1572)
-    femmesh.addVolume([763, 735, 1655, 2237, 868, 2808, 2991, 2724, 2608, 2809], 1573)
-    femmesh.addVolume([711, 755, 2251, 2216, 990, 2964, 2927, 2928, 2967, 2343], 1574)
-    femmesh.addVolume([326, 338, 334, 2252, 382, 353, 380, 2734, 2360, 2992], 1575)
-    femmesh.addVolume([1718, 1660, 2237, 2248, 2005, 2287, 2384, 2386, 2289, 2276], 1576)
-    femmesh.addVolume([2227, 1021, 2214, 2238, 2752, 2993, 2371, 2309, 2753, 2374], 1577)
-    femmesh.addVolume([1037, 1131, 2200, 2213, 1528, 2773, 2883, 2884, 2775, 2429], 1578)
-    femmesh.addVolume([1147, 1063, 2203, 2221, 1608, 2914, 2703, 2704, 2917, 2563], 1579)
-    femmesh.addVolume([1062, 736, 764, 2237, 2849, 794, 2994, 2850, 2629, 2754], 1580)
-    femmesh.addVolume([1079, 1052, 2258, 2215, 1595, 2779, 2870, 2951, 2781, 2498], 1581)
-    femmesh.addVolume([1611, 1675, 2254, 2211, 1940, 2995, 2366, 2365, 2996, 2364], 1582)
-    femmesh.addVolume([430, 268, 449, 2202, 2997, 2509, 471, 2820, 2513, 2512], 1583)
-    femmesh.addVolume([732, 2216, 1688, 2219, 3000, 2999, 2998, 3001, 3002, 3003], 1584)
-    femmesh.addVolume([2255, 1122, 2219, 2218, 2840, 2841, 2794, 2558, 3004, 2797], 1585)
-    femmesh.addVolume([1738, 1617, 2231, 2225, 2012, 2549, 3005, 3006, 2631, 2633], 1586)
-    femmesh.addVolume([407, 1658, 397, 2244, 2864, 2930, 562, 2476, 2865, 2929], 1587)
-    femmesh.addVolume([1661, 2203, 716, 2221, 3008, 2915, 3007, 3009, 2563, 2918], 1588)
-    femmesh.addVolume([407, 397, 420, 2244, 562, 668, 669, 2476, 2929, 2492], 1589)
-    femmesh.addVolume([1039, 1067, 1132, 2248, 1547, 1363, 1542, 2757, 2286, 2328], 1590)
-    femmesh.addVolume([1143, 1022, 2212, 2249, 1396, 3011, 3010, 3012, 3013, 2877], 1591)
-    femmesh.addVolume([1069, 2245, 1031, 2257, 3015, 3014, 1479, 2831, 2839, 2947], 1592)
-    femmesh.addVolume([1614, 1691, 1690, 2238, 1979, 1982, 1974, 2612, 2652, 2373], 1593)
-    femmesh.addVolume([1080, 2239, 2256, 2208, 3016, 2811, 2395, 2396, 2701, 2271], 1594)
-    femmesh.addVolume([2239, 1672, 2256, 2208, 3017, 2399, 2811, 2701, 2400, 2271], 1595)
-    femmesh.addVolume([267, 1731, 2232, 2231, 3020, 3019, 3018, 3021, 3022, 2308], 1596)
-    femmesh.addVolume([1092, 1071, 1030, 2251, 1286, 1474, 1471, 2559, 2738, 2526], 1597)
-    femmesh.addVolume([722, 1095, 2216, 2219, 3025, 3024, 3023, 3026, 3027, 3002], 1598)
-    femmesh.addVolume([1029, 1085, 2253, 2246, 1463, 3028, 2832, 2879, 2881, 3029], 1599)
-    femmesh.addVolume([1692, 2229, 2210, 2224, 2568, 2444, 2567, 2750, 2751, 2717], 1600)
-    femmesh.addVolume([1108, 1031, 2214, 2257, 1481, 2944, 3030, 3031, 2947, 2438], 1601)
-    femmesh.addVolume([1643, 1711, 2239, 2220, 2185, 2700, 2860, 2861, 2636, 2702], 1602)
-    femmesh.addVolume([728, 725, 2203, 2247, 984, 3033, 3032, 3034, 3035, 3036], 1603)
-    femmesh.addVolume([1029, 1074, 1107, 2238, 1466, 1392, 1464, 2824, 2976, 2872], 1604)
-    femmesh.addVolume([1146, 1024, 2248, 2231, 1423, 2296, 2745, 2744, 2430, 2281], 1605)
-    femmesh.addVolume([725, 1063, 716, 2203, 3037, 2916, 806, 3033, 2914, 2915], 1606)
-    femmesh.addVolume([1072, 1031, 2212, 2214, 1483, 2946, 2941, 3038, 2944, 2945], 1607)
-    femmesh.addVolume([1026, 2227, 1149, 2223, 2705, 2540, 1442, 3039, 2646, 2698], 1608)
-    femmesh.addVolume([2212, 1031, 2245, 2257, 2946, 3014, 2835, 2838, 2947, 2839], 1609)
-    femmesh.addVolume([1739, 1638, 1727, 2199, 2174, 2176, 2177, 2664, 2410, 2403], 1610)
-    femmesh.addVolume([1663, 1678, 1622, 2230, 1904, 2053, 2054, 2455, 2566, 2630], 1611)
-    femmesh.addVolume([1614, 2214, 2250, 2238, 2611, 2437, 2913, 2612, 2374, 2623], 1612)
-    femmesh.addVolume([1667, 1621, 1691, 2236, 2046, 2047, 1978, 2572, 2574, 2846], 1613)
-    femmesh.addVolume([1107, 1046, 2236, 2238, 1380, 2868, 2871, 2872, 2654, 2823], 1614)
-    femmesh.addVolume([1638, 1658, 1727, 2244, 2175, 1789, 2176, 2409, 2865, 2401], 1615)
-    femmesh.addVolume([2202, 2231, 1146, 2225, 3041, 2744, 3040, 3042, 2633, 2746], 1616)
-    femmesh.addVolume([1653, 331, 328, 2235, 2893, 360, 2798, 2723, 2926, 2799], 1617)
-    femmesh.addVolume([1667, 2236, 1691, 2238, 2572, 2846, 1978, 2624, 2823, 2652], 1618)
-    femmesh.addVolume([1680, 1736, 2245, 2257, 2076, 2834, 3043, 3044, 2837, 2839], 1619)
-    femmesh.addVolume([1741, 2227, 1619, 2223, 2531, 2756, 2032, 2747, 2646, 2845], 1620)
-    femmesh.addVolume([1073, 2251, 1109, 2210, 2514, 2406, 1368, 2517, 2340, 2405], 1621)
-    femmesh.addVolume([1625, 2203, 2213, 2247, 3045, 2670, 2898, 2899, 3036, 2900], 1622)
-    femmesh.addVolume([1668, 1681, 1619, 2223, 1841, 2029, 2030, 2599, 3046, 2845], 1623)
-    femmesh.addVolume([735, 1733, 1655, 2232, 3047, 1854, 2808, 2605, 3048, 2807], 1624)
-    femmesh.addVolume([433, 392, 422, 2252, 635, 634, 549, 2671, 2643, 3049], 1625)
-    femmesh.addVolume([1017, 1083, 2253, 2208, 1334, 2755, 3050, 2660, 2591, 2322], 1626)
-    femmesh.addVolume([439, 1726, 2200, 2215, 2959, 2961, 2960, 3051, 3052, 2787], 1627)
-    femmesh.addVolume([1111, 2208, 2253, 2220, 2982, 2322, 3053, 2984, 2638, 2728], 1628)
-    femmesh.addVolume([1072, 2212, 2227, 2214, 2941, 2378, 2942, 3038, 2945, 2371], 1629)
-    femmesh.addVolume([1652, 1731, 267, 2231, 1763, 3020, 3054, 3055, 3022, 3021], 1630)
-    femmesh.addVolume([1028, 2230, 1076, 2250, 3056, 2462, 1457, 3057, 2460, 2465], 1631)
-    femmesh.addVolume([393, 453, 2239, 2220, 643, 2859, 3058, 3059, 2862, 2702], 1632)
-    femmesh.addVolume([1128, 2211, 2258, 2215, 2551, 2554, 2553, 2780, 2786, 2498], 1633)
-    femmesh.addVolume([755, 1071, 720, 2251, 3060, 2735, 823, 2964, 2738, 2737], 1634)
-    femmesh.addVolume([729, 712, 2219, 2240, 998, 3062, 3061, 3063, 3064, 2911], 1635)
-    femmesh.addVolume([2254, 2251, 2210, 2224, 2515, 2340, 2518, 2640, 2688, 2717], 1636)
-    femmesh.addVolume([1131, 2200, 2211, 2215, 2773, 2483, 2774, 3065, 2787, 2786], 1637)
-    femmesh.addVolume([1143, 2249, 2212, 2245, 3012, 2877, 3010, 3066, 2878, 2835], 1638)
-    femmesh.addVolume([1080, 1120, 2239, 2208, 1333, 3067, 3016, 2396, 2983, 2701], 1639)
-    femmesh.addVolume([413, 1070, 2236, 2246, 3069, 2907, 3068, 3070, 2880, 2908], 1640)
-    femmesh.addVolume([1108, 1069, 1031, 2257, 1482, 1479, 1481, 3031, 2831, 2947], 1641)
-    femmesh.addVolume([728, 716, 1661, 2203, 880, 3007, 3071, 3032, 2915, 3008], 1642)
-    femmesh.addVolume([1093, 717, 2241, 2240, 3074, 3073, 3072, 3075, 3076, 2616], 1643)
-    femmesh.addVolume([443, 401, 2236, 2205, 695, 3078, 3077, 3079, 3080, 2847], 1644)
-    femmesh.addVolume([1055, 420, 450, 2206, 2767, 487, 3081, 2851, 2852, 3082], 1645)
-    femmesh.addVolume([1711, 1672, 2239, 2208, 1921, 3017, 2700, 2634, 2400, 2701], 1646)
-    femmesh.addVolume([1742, 2211, 2258, 2224, 3084, 2554, 3083, 3085, 2581, 2580], 1647)
-    femmesh.addVolume([435, 1732, 2202, 2225, 3088, 3087, 3086, 3089, 3090, 3042], 1648)
-    femmesh.addVolume([1035, 1080, 2239, 2256, 1510, 3016, 2816, 2815, 2395, 2811], 1649)
-    femmesh.addVolume([394, 421, 406, 2223, 619, 649, 648, 2934, 2598, 2659], 1650)
-    femmesh.addVolume([1652, 267, 263, 2231, 3054, 298, 3091, 3055, 3021, 3092], 1651)
-    femmesh.addVolume([1628, 2239, 1672, 2256, 2812, 3017, 2101, 2810, 2811, 2399], 1652)
-    femmesh.addVolume([1062, 1139, 736, 2232, 1260, 3093, 2849, 2848, 3094, 2628], 1653)
-    femmesh.addVolume([1677, 1664, 754, 2209, 1878, 3096, 3095, 2987, 2874, 3097], 1654)
-    femmesh.addVolume([1710, 411, 1686, 2239, 2711, 3098, 1823, 2712, 2713, 2953], 1655)
-    femmesh.addVolume([749, 747, 705, 2242, 938, 949, 948, 3099, 2726, 2725], 1656)
-    femmesh.addVolume([1120, 2239, 2208, 2220, 3067, 2701, 2983, 2985, 2702, 2638], 1657)
-    femmesh.addVolume([717, 1685, 2241, 2240, 3101, 3100, 3073, 3076, 3102, 2616], 1658)
-    femmesh.addVolume([1147, 1066, 1045, 2221, 1432, 1354, 1585, 2704, 2434, 2680], 1659)
-    femmesh.addVolume([1059, 1030, 2254, 2209, 1470, 2527, 2922, 3103, 2529, 2528], 1660)
-    femmesh.addVolume([2212, 1665, 2227, 2214, 2956, 2890, 2378, 2945, 2891, 2371], 1661)
-    femmesh.addVolume([1110, 737, 2242, 2249, 3105, 2706, 3104, 3106, 2710, 2709], 1662)
-    femmesh.addVolume([331, 333, 326, 2252, 357, 381, 378, 2894, 2358, 2734], 1663)
-    femmesh.addVolume([332, 327, 335, 2242, 383, 387, 364, 2720, 2729, 2448], 1664)
-    femmesh.addVolume([1022, 2243, 2212, 2249, 3107, 2381, 3011, 3013, 3108, 2877], 1665)
-    femmesh.addVolume([1611, 1735, 2211, 2213, 1937, 2603, 2365, 2489, 2604, 2486], 1666)
-    femmesh.addVolume([1119, 1036, 2217, 2218, 1519, 2501, 2576, 2577, 2586, 2519], 1667)
-    femmesh.addVolume([394, 1681, 1668, 2223, 3109, 1841, 2933, 2934, 3046, 2599], 1668)
-    femmesh.addVolume([336, 327, 1136, 2242, 386, 3111, 3110, 2869, 2729, 3112], 1669)
-    femmesh.addVolume([1117, 1104, 1017, 2208, 1339, 1335, 1331, 2270, 2590, 2660], 1670)
-    femmesh.addVolume([452, 393, 2239, 2220, 644, 3058, 2937, 2938, 3059, 2702], 1671)
-    femmesh.addVolume([1119, 1099, 1020, 2210, 1375, 1366, 1374, 2575, 2866, 2422], 1672)
-    femmesh.addVolume([1092, 1030, 1059, 2209, 1471, 1470, 1282, 2560, 2529, 3103], 1673)
-    femmesh.addVolume([1029, 2253, 2236, 2246, 2832, 2573, 2822, 2879, 3029, 2908], 1674)
-    femmesh.addVolume([735, 704, 745, 2232, 941, 942, 865, 2605, 2803, 2804], 1675)
-    femmesh.addVolume([1610, 1706, 1712, 2208, 1930, 1932, 1924, 2614, 2327, 2275], 1676)
-    femmesh.addVolume([1665, 2212, 1624, 2214, 2956, 3113, 2074, 2891, 2945, 3114], 1677)
-    femmesh.addVolume([1734, 266, 2202, 2231, 3117, 3116, 3115, 3118, 3119, 3041], 1678)
-    femmesh.addVolume([1615, 2243, 2235, 2249, 3122, 3121, 3120, 3123, 3108, 3124], 1679)
-    femmesh.addVolume([334, 1135, 326, 2252, 3126, 3125, 380, 2992, 3127, 2734], 1680)
-    femmesh.addVolume([2211, 1651, 2258, 2215, 3128, 2649, 2554, 2786, 2650, 2498], 1681)
-    femmesh.addVolume([725, 1063, 2203, 2247, 3037, 2914, 3033, 3035, 3129, 3036], 1682)
-    femmesh.addVolume([718, 1704, 2242, 2249, 3131, 3130, 2707, 2708, 3132, 2709], 1683)
-    femmesh.addVolume([755, 1050, 1071, 2251, 2963, 1289, 3060, 2964, 2965, 2738], 1684)
-    femmesh.addVolume([1628, 2256, 1725, 2201, 2810, 3133, 2103, 2813, 2814, 3134], 1685)
-    femmesh.addVolume([1097, 2227, 1075, 2205, 2311, 2645, 1441, 2313, 2312, 2644], 1686)
-    femmesh.addVolume([1716, 2219, 1627, 2218, 2793, 3135, 2094, 2796, 2797, 3136], 1687)
-    femmesh.addVolume([1657, 1721, 1612, 2204, 1950, 1951, 1946, 2259, 2260, 2621], 1688)
-    femmesh.addVolume([1130, 2256, 1035, 2201, 3137, 2815, 1512, 3138, 2814, 2817], 1689)
-    femmesh.addVolume([1676, 1615, 2212, 2243, 1989, 3139, 2379, 2380, 3122, 2381], 1690)
-    femmesh.addVolume([1661, 728, 2203, 2247, 3071, 3032, 3008, 3140, 3034, 3036], 1691)
-    femmesh.addVolume([1675, 1705, 1611, 2254, 1938, 1939, 1940, 2995, 2397, 2366], 1692)
-    femmesh.addVolume([414, 1640, 2236, 2205, 2971, 3142, 3141, 2975, 2974, 2847], 1693)
-    femmesh.addVolume([1084, 2212, 1022, 2243, 2390, 3011, 1398, 2391, 2381, 3107], 1694)
-    femmesh.addVolume([1116, 1094, 416, 2239, 1229, 3143, 2739, 2741, 2949, 2740], 1695)
-    femmesh.addVolume([1706, 1678, 1642, 2230, 2060, 1901, 2182, 2326, 2566, 2523], 1696)
-    femmesh.addVolume([1131, 1018, 2211, 2213, 1342, 2505, 2774, 2775, 2508, 2486], 1697)
-    femmesh.addVolume([1080, 1120, 1035, 2239, 1333, 1511, 1510, 3016, 3067, 2816], 1698)
-    femmesh.addVolume([267, 270, 262, 2232, 299, 322, 320, 3018, 2481, 2800], 1699)
-    femmesh.addVolume([435, 430, 391, 2202, 552, 632, 631, 3086, 2820, 2821], 1700)
-    femmesh.addVolume([712, 726, 2219, 2240, 1000, 3144, 3062, 3064, 3145, 2911], 1701)
-    femmesh.addVolume([707, 733, 2251, 2209, 959, 2919, 3146, 3147, 2921, 2530], 1702)
-    femmesh.addVolume([1085, 2220, 2253, 2246, 3148, 2728, 3028, 2881, 3149, 3029], 1703)
-    femmesh.addVolume([1615, 1736, 1676, 2212, 1987, 1988, 1989, 3139, 2836, 2379], 1704)
-    femmesh.addVolume([411, 453, 1686, 2239, 601, 2952, 3098, 2713, 2859, 2953], 1705)
-    femmesh.addVolume([1736, 2212, 1615, 2249, 2836, 3139, 1987, 2876, 2877, 3123], 1706)
-    femmesh.addVolume([435, 405, 1732, 2225, 556, 3150, 3088, 3089, 3151, 3090], 1707)
-    femmesh.addVolume([1672, 1628, 1711, 2239, 2101, 2100, 1921, 3017, 2812, 2700], 1708)
-    femmesh.addVolume([2254, 1705, 2228, 2209, 2397, 2398, 2367, 2528, 3152, 3153], 1709)
-    femmesh.addVolume([1086, 1032, 2234, 2199, 1488, 2297, 2619, 2857, 2300, 2302], 1710)
-    femmesh.addVolume([429, 1670, 2258, 2229, 3155, 2771, 3154, 3156, 2772, 2748], 1711)
-    femmesh.addVolume([1075, 406, 443, 2205, 2657, 539, 3157, 2644, 2658, 3079], 1712)
-    femmesh.addVolume([1644, 2251, 1702, 2216, 2886, 2341, 2186, 2889, 2343, 2342], 1713)
-    femmesh.addVolume([1143, 1022, 1084, 2212, 1396, 1398, 1399, 3010, 3011, 2390], 1714)
-    femmesh.addVolume([1065, 1045, 2204, 2221, 1583, 2679, 2969, 2903, 2680, 2263], 1715)
-    femmesh.addVolume([738, 2249, 1110, 2245, 2770, 3106, 3158, 2981, 2878, 3159], 1716)
-    femmesh.addVolume([1111, 2253, 1085, 2220, 3053, 3028, 1469, 2984, 2728, 3148], 1717)
-    femmesh.addVolume([412, 415, 2217, 2229, 684, 3160, 2989, 2990, 3161, 2443], 1718)
-    femmesh.addVolume([416, 1094, 452, 2239, 3143, 2948, 525, 2740, 2949, 2937], 1719)
-    femmesh.addVolume([1111, 1029, 1085, 2253, 1468, 1463, 1469, 3053, 2832, 3028], 1720)
-    femmesh.addVolume([1061, 423, 1138, 2202, 3163, 3162, 1188, 3164, 3165, 3166], 1721)
-    femmesh.addVolume([1652, 266, 1734, 2231, 3167, 3117, 1760, 3055, 3119, 3118], 1722)
-    femmesh.addVolume([1123, 2255, 2201, 2226, 2696, 3169, 3168, 2697, 2504, 3170], 1723)
-    femmesh.addVolume([330, 1136, 2242, 2235, 3172, 3112, 3171, 3173, 3174, 2722], 1724)
-    femmesh.addVolume([1048, 1078, 1104, 2230, 1309, 1461, 1587, 2471, 2546, 2601], 1725)
-    femmesh.addVolume([1624, 2214, 2212, 2257, 3114, 2945, 3113, 3175, 2438, 2838], 1726)
-    femmesh.addVolume([1056, 1121, 1023, 2240, 1406, 1407, 1405, 3176, 2451, 2338], 1727)
-    femmesh.addVolume([1648, 1616, 1715, 2240, 1997, 1995, 1996, 2844, 2333, 2454], 1728)
-    femmesh.addVolume([1682, 1625, 2228, 2247, 2082, 2897, 3177, 3178, 2899, 2901], 1729)
-    femmesh.addVolume([1021, 1097, 1046, 2238, 1378, 1379, 1377, 2753, 2310, 2654], 1730)
-    femmesh.addVolume([1022, 2235, 2243, 2249, 3179, 3121, 3107, 3013, 3124, 3108], 1731)
-    femmesh.addVolume([1706, 1674, 1622, 2230, 1929, 2057, 2059, 2326, 2318, 2630], 1732)
-    femmesh.addVolume([443, 401, 413, 2236, 695, 696, 536, 3077, 3078, 3068], 1733)
-    femmesh.addVolume([1141, 1044, 2228, 2213, 1577, 3180, 2542, 2507, 3181, 2490], 1734)
-    femmesh.addVolume([1066, 1025, 2234, 2203, 1430, 2668, 2415, 2562, 2667, 2561], 1735)
-    femmesh.addVolume([729, 2219, 1648, 2240, 3061, 2910, 3182, 3063, 2911, 2844], 1736)
-    femmesh.addVolume([1661, 2203, 1625, 2247, 3008, 3045, 2081, 3140, 3036, 2899], 1737)
-    femmesh.addVolume([737, 705, 748, 2242, 946, 945, 862, 2706, 2725, 2769], 1738)
-    femmesh.addVolume([1126, 1065, 2204, 2233, 1537, 2969, 2564, 2695, 2904, 2290], 1739)
-    femmesh.addVolume([1651, 1742, 2211, 2258, 2037, 3084, 3128, 2649, 3083, 2554], 1740)
-    femmesh.addVolume([738, 737, 1110, 2249, 861, 3105, 3158, 2770, 2710, 3106], 1741)
-    femmesh.addVolume([1116, 1035, 1094, 2239, 1515, 1514, 1229, 2741, 2816, 2949], 1742)
-    femmesh.addVolume([1081, 1123, 1036, 2255, 1520, 1521, 1518, 2905, 2696, 2499], 1743)
-    femmesh.addVolume([1717, 1673, 1629, 2255, 2111, 2109, 2110, 2827, 2805, 2555], 1744)
-    femmesh.addVolume([1614, 1690, 1665, 2214, 1974, 1975, 1976, 2611, 2370, 2891], 1745)
-    femmesh.addVolume([729, 726, 712, 2240, 999, 1000, 998, 3063, 3145, 3064], 1746)
-    femmesh.addVolume([1675, 2254, 2211, 2224, 2995, 2364, 2996, 3183, 2640, 2581], 1747)
-    femmesh.addVolume([732, 1688, 1684, 2219, 2998, 1887, 3184, 3001, 3003, 3185], 1748)
-    femmesh.addVolume([398, 444, 1727, 2199, 675, 2940, 2402, 2394, 3186, 2403], 1749)
-    femmesh.addVolume([1710, 1686, 1628, 2239, 1823, 2105, 2104, 2712, 2953, 2812], 1750)
-    femmesh.addVolume([1148, 1025, 2203, 2213, 1428, 2667, 3187, 3188, 2669, 2670], 1751)
-    femmesh.addVolume([1658, 2244, 1720, 2206, 2865, 2352, 2136, 2931, 2354, 2353], 1752)
-    femmesh.addVolume([1615, 2212, 2243, 2249, 3139, 2381, 3122, 3123, 2877, 3108], 1753)
-    femmesh.addVolume([1044, 2213, 1148, 2247, 3181, 3188, 1578, 3189, 2900, 3190], 1754)
-    femmesh.addVolume([1069, 1087, 1031, 2245, 1321, 1480, 1479, 3015, 3191, 3014], 1755)
-    femmesh.addVolume([1078, 1076, 1028, 2230, 1312, 1457, 1458, 2546, 2462, 3056], 1756)
-    femmesh.addVolume([1146, 1024, 1125, 2248, 1423, 1419, 1422, 2745, 2296, 2978], 1757)
-    femmesh.addVolume([1674, 1621, 1667, 2253, 2045, 2046, 2044, 2320, 2570, 2571], 1758)
-    femmesh.addVolume([1612, 1724, 1660, 2204, 1954, 1955, 1953, 2621, 3192, 2288], 1759)
-    femmesh.addVolume([1651, 455, 1687, 2258, 2648, 3193, 1801, 2649, 2494, 3194], 1760)
-    femmesh.addVolume([722, 2216, 732, 2219, 3023, 3000, 992, 3026, 3002, 3001], 1761)
-    femmesh.addVolume([1099, 1027, 2210, 2229, 1447, 2912, 2866, 2867, 3195, 2444], 1762)
-    femmesh.addVolume([269, 273, 261, 2202, 288, 317, 315, 2682, 2511, 2957], 1763)
-    femmesh.addVolume([1669, 414, 1640, 2236, 3196, 2971, 1835, 3197, 3141, 3142], 1764)
-    femmesh.addVolume([746, 704, 736, 2232, 943, 940, 791, 2802, 2803, 2628], 1765)
-    femmesh.addVolume([718, 750, 2249, 2245, 937, 3198, 2708, 2980, 3199, 2878], 1766)
-    femmesh.addVolume([1075, 2227, 1026, 2223, 2645, 2705, 1439, 2647, 2646, 3039], 1767)
-    femmesh.addVolume([431, 423, 391, 2202, 478, 628, 629, 2853, 3165, 2821], 1768)
-    femmesh.addVolume([1073, 1030, 1109, 2251, 1477, 1476, 1368, 2514, 2526, 2406], 1769)
-    femmesh.addVolume([2255, 1725, 2256, 2201, 3200, 3133, 2331, 3169, 3134, 2814], 1770)
-    femmesh.addVolume([1130, 2255, 2256, 2201, 3201, 2331, 3137, 3138, 3169, 2814], 1771)
-    femmesh.addVolume([1730, 1656, 418, 2200, 1795, 3203, 3202, 2962, 3204, 3205], 1772)
-    femmesh.addVolume([1017, 1083, 1111, 2253, 1334, 1337, 1338, 3050, 2755, 3053], 1773)
-    femmesh.addVolume([1059, 2254, 2228, 2209, 2922, 2367, 2923, 3103, 2528, 3153], 1774)
-    femmesh.addVolume([1633, 1728, 1653, 2252, 2142, 1770, 2141, 3206, 2896, 2895], 1775)
-    femmesh.addVolume([1060, 1135, 1040, 2252, 1178, 1551, 1548, 3207, 3127, 3208], 1776)
-    femmesh.addVolume([1067, 1124, 1038, 2237, 1417, 1534, 1539, 2283, 2293, 2412], 1777)
-    femmesh.addVolume([759, 729, 712, 2219, 906, 998, 1001, 3209, 3061, 3062], 1778)
-    femmesh.addVolume([1648, 729, 759, 2219, 3182, 906, 3210, 2910, 3061, 3209], 1779)
-    femmesh.addVolume([1730, 1726, 1637, 2200, 1798, 2171, 2170, 2962, 2961, 2484], 1780)
-    femmesh.addVolume([435, 2202, 405, 2225, 3086, 3211, 556, 3089, 3042, 3151], 1781)
-    femmesh.addVolume([733, 754, 1664, 2209, 894, 3096, 2920, 2921, 3097, 2874], 1782)
-    femmesh.addVolume([722, 1091, 1095, 2219, 3212, 1295, 3025, 3026, 3213, 3027], 1783)
-    femmesh.addVolume([1610, 1697, 2253, 2208, 1926, 2727, 2863, 2614, 2635, 2322], 1784)
-    femmesh.addVolume([1627, 2219, 2216, 2218, 3135, 3002, 3214, 3136, 2797, 2420], 1785)
-    femmesh.addVolume([269, 431, 449, 2202, 3215, 470, 2681, 2682, 2853, 2512], 1786)
-    femmesh.addVolume([1098, 1047, 2214, 2250, 1384, 3216, 2791, 2790, 2676, 2437], 1787)
-    femmesh.addVolume([443, 2236, 1046, 2205, 3077, 2868, 3217, 3079, 2847, 2655], 1788)
-    femmesh.addVolume([1674, 1610, 1697, 2253, 1928, 1926, 1927, 2320, 2863, 2727], 1789)
-    femmesh.addVolume([1111, 1017, 2253, 2208, 1338, 3050, 3053, 2982, 2660, 2322], 1790)
-    femmesh.addVolume([411, 400, 416, 2239, 690, 691, 641, 2713, 2782, 2740], 1791)
-    femmesh.addVolume([1725, 1616, 2255, 2256, 2000, 2332, 3200, 3133, 2330, 2331], 1792)
-    femmesh.addVolume([1023, 1130, 2255, 2256, 1411, 3201, 2337, 2336, 3137, 2331], 1793)
-    femmesh.addVolume([763, 1698, 730, 2237, 3219, 3218, 871, 2724, 3220, 3221], 1794)
-    femmesh.addVolume([435, 1732, 430, 2202, 3088, 3222, 552, 3086, 3087, 2820], 1795)
-    femmesh.addVolume([1125, 2248, 2206, 2225, 2978, 2355, 3223, 2979, 2632, 3224], 1796)
-    femmesh.addVolume([2228, 2213, 1044, 2247, 2490, 3181, 3180, 2901, 2900, 3189], 1797)
-    femmesh.addVolume([718, 1704, 749, 2242, 3131, 3225, 935, 2707, 3130, 3099], 1798)
-    femmesh.addVolume([1742, 1675, 1611, 2211, 1942, 1940, 1941, 3084, 2996, 2365], 1799)
-    femmesh.addVolume([1661, 1682, 728, 2247, 1869, 3226, 3071, 3140, 3178, 3034], 1800)
-    femmesh.addVolume([1661, 716, 1696, 2221, 3007, 3227, 1866, 3009, 2918, 3228], 1801)
-    femmesh.addVolume([1697, 2220, 1643, 2246, 2637, 2861, 2184, 3229, 3149, 3230], 1802)
-    femmesh.addVolume([1630, 1657, 1679, 2203, 2121, 2016, 2120, 3231, 2986, 2854], 1803)
-    femmesh.addVolume([1742, 1675, 2211, 2224, 1942, 2996, 3084, 3085, 3183, 2581], 1804)
-    femmesh.addVolume([268, 266, 261, 2202, 292, 313, 316, 2513, 3116, 2957], 1805)
-    femmesh.addVolume([1703, 2228, 1625, 2213, 2693, 2897, 2079, 2694, 2490, 2898], 1806)
-    femmesh.addVolume([418, 439, 1730, 2200, 572, 2958, 3202, 3205, 2960, 2962], 1807)
-    femmesh.addVolume([1109, 2251, 1050, 2216, 2406, 2965, 1591, 2407, 2343, 2966], 1808)
-    femmesh.addVolume([1613, 1692, 1714, 2210, 1958, 1967, 1965, 2362, 2567, 2439], 1809)
-    femmesh.addVolume([1072, 1084, 1026, 2227, 1436, 1437, 1435, 2942, 2389, 2705], 1810)
-    femmesh.addVolume([1146, 1043, 2202, 2225, 1571, 3232, 3040, 2746, 3233, 3042], 1811)
-    femmesh.addVolume([713, 734, 719, 2230, 1002, 951, 1003, 2582, 2610, 2585], 1812)
-    femmesh.addVolume([1726, 1637, 2200, 2215, 2171, 2484, 2961, 3052, 2785, 2787], 1813)
-    femmesh.addVolume([709, 767, 741, 2233, 977, 877, 980, 2765, 3234, 3235], 1814)
-    femmesh.addVolume([423, 2202, 1061, 2225, 3165, 3164, 3163, 3236, 3042, 3237], 1815)
-    femmesh.addVolume([2203, 1148, 2213, 2247, 3187, 3188, 2670, 3036, 3190, 2900], 1816)
-    femmesh.addVolume([1697, 1643, 1671, 2246, 2184, 1829, 2052, 3229, 3230, 3238], 1817)
-    femmesh.addVolume([402, 1085, 1070, 2246, 3240, 1238, 3239, 3241, 2881, 2880], 1818)
-    femmesh.addVolume([1068, 1086, 2200, 2199, 1491, 2618, 3242, 3243, 2857, 2777], 1819)
-    femmesh.addVolume([723, 1105, 764, 2237, 3245, 3244, 797, 3246, 3247, 2754], 1820)
-    femmesh.addVolume([398, 1089, 440, 2199, 2393, 2761, 678, 2394, 2376, 3248], 1821)
-    femmesh.addVolume([1655, 1635, 1737, 2232, 2154, 2155, 2156, 2807, 3249, 2307], 1822)
-    femmesh.addVolume([1062, 1145, 1042, 2232, 1564, 1565, 1562, 2848, 2361, 3250], 1823)
-    femmesh.addVolume([758, 733, 1644, 2251, 897, 3251, 2885, 2887, 2919, 2886], 1824)
-    femmesh.addVolume([392, 434, 422, 2252, 636, 637, 634, 2643, 2968, 3049], 1825)
-    femmesh.addVolume([1661, 1625, 1682, 2247, 2081, 2082, 1869, 3140, 2899, 3178], 1826)
-    femmesh.addVolume([1728, 333, 331, 2252, 3252, 357, 2892, 2896, 2358, 2894], 1827)
-    femmesh.addVolume([723, 2237, 730, 2233, 3246, 3221, 973, 3253, 2292, 3254], 1828)
-    femmesh.addVolume([1736, 1624, 2212, 2257, 2075, 3113, 2836, 2837, 3175, 2838], 1829)
-    femmesh.addVolume([416, 452, 393, 2239, 525, 644, 642, 2740, 2937, 3058], 1830)
-    femmesh.addVolume([1147, 1025, 1066, 2203, 1433, 1430, 1432, 2703, 2667, 2562], 1831)
-    femmesh.addVolume([415, 1051, 2217, 2229, 3256, 3255, 3160, 3161, 3257, 2443], 1832)
-    femmesh.addVolume([1089, 1055, 1112, 2244, 1197, 1602, 1493, 2375, 2768, 2432], 1833)
-    femmesh.addVolume([1718, 1660, 1631, 2237, 2005, 2130, 2129, 2384, 2287, 2533], 1834)
-    femmesh.addVolume([1665, 1624, 1701, 2214, 2074, 2072, 1977, 2891, 3114, 3258], 1835)
-    femmesh.addVolume([1701, 1641, 2214, 2257, 1973, 2436, 3258, 3259, 2348, 2438], 1836)
-    femmesh.addVolume([1072, 1108, 1031, 2214, 1389, 1481, 1483, 3038, 3030, 2944], 1837)
-    femmesh.addVolume([1030, 1073, 1082, 2254, 1477, 1446, 1478, 2527, 2516, 2639], 1838)
-    femmesh.addVolume([1624, 1701, 2214, 2257, 2072, 3258, 3114, 3175, 3259, 2438], 1839)
-    femmesh.addVolume([1652, 263, 266, 2231, 3091, 295, 3167, 3055, 3092, 3119], 1840)
-    femmesh.addVolume([450, 420, 397, 2206, 487, 668, 670, 3082, 2852, 2932], 1841)
-    femmesh.addVolume([725, 716, 728, 2203, 806, 880, 984, 3033, 2915, 3032], 1842)
-    femmesh.addVolume([1021, 1098, 2214, 2238, 1383, 2791, 2993, 2753, 2792, 2374], 1843)
-    femmesh.addVolume([1644, 1702, 1713, 2216, 2186, 1968, 2187, 2889, 2342, 2435], 1844)
-    femmesh.addVolume([1041, 2242, 1136, 2235, 3260, 3112, 1560, 3261, 2722, 3174], 1845)
-    femmesh.addVolume([1028, 2230, 2250, 2207, 3056, 2460, 3057, 3262, 2602, 2538], 1846)
-    femmesh.addVolume([763, 730, 714, 2237, 871, 1009, 1012, 2724, 3221, 2607], 1847)
-    femmesh.addVolume([411, 393, 453, 2239, 640, 643, 601, 2713, 3058, 2859], 1848)
-    femmesh.addVolume([1021, 1072, 1097, 2227, 1387, 1388, 1378, 2752, 2942, 2311], 1849)
-    femmesh.addVolume([1072, 2227, 1021, 2214, 2942, 2752, 1387, 3038, 2371, 2993], 1850)
-    femmesh.addVolume([717, 740, 1093, 2241, 837, 3263, 3074, 3073, 3264, 3072], 1851)
-    femmesh.addVolume([1150, 1079, 454, 2215, 1209, 2950, 3265, 3266, 2951, 2856], 1852)
-    femmesh.addVolume([1137, 262, 271, 2232, 3268, 321, 3267, 3269, 2800, 2943], 1853)
-    femmesh.addVolume([1717, 2201, 2255, 2226, 3270, 3169, 2827, 2828, 3170, 2504], 1854)
-    femmesh.addVolume([1019, 1067, 1126, 2204, 1360, 1361, 1356, 2587, 2284, 2564], 1855)
-    femmesh.addVolume([723, 1105, 2237, 2233, 3245, 3247, 3246, 3253, 3271, 2292], 1856)
-    femmesh.addVolume([1676, 1665, 1619, 2227, 2026, 2027, 2025, 2377, 2890, 2756], 1857)
-    femmesh.addVolume([726, 1056, 2219, 2240, 3273, 3272, 3144, 3145, 3176, 2911], 1858)
-    femmesh.addVolume([1650, 2204, 1721, 2221, 3274, 2260, 2118, 3275, 2263, 2262], 1859)
-    femmesh.addVolume([733, 720, 707, 2251, 960, 961, 959, 2919, 2737, 3146], 1860)
-    femmesh.addVolume([451, 406, 1088, 2223, 542, 3277, 3276, 3278, 2659, 3279], 1861)
-    femmesh.addVolume([443, 413, 1046, 2236, 536, 3280, 3217, 3077, 3068, 2868], 1862)
-    femmesh.addVolume([439, 410, 1726, 2215, 575, 3281, 2959, 3051, 2678, 3052], 1863)
-    femmesh.addVolume([1086, 1025, 1064, 2213, 1427, 1425, 1426, 2620, 2669, 3282], 1864)
-    femmesh.addVolume([1065, 723, 768, 2233, 3283, 800, 2902, 2904, 3253, 2764], 1865)
-    femmesh.addVolume([1122, 1034, 2219, 2218, 1504, 3284, 2841, 3004, 3285, 2797], 1866)
-    femmesh.addVolume([709, 741, 2221, 2233, 980, 3286, 2763, 2765, 3235, 2766], 1867)
-    femmesh.addVolume([1148, 1064, 1025, 2213, 1429, 1425, 1428, 3188, 3282, 2669], 1868)
-    femmesh.addVolume([717, 1685, 739, 2241, 3101, 3287, 911, 3073, 3100, 3288], 1869)
-    femmesh.addVolume([1133, 1063, 1147, 2221, 1272, 1608, 1586, 3289, 2917, 2704], 1870)
-    femmesh.addVolume([1064, 1037, 1086, 2213, 1526, 1527, 1426, 3282, 2884, 2620], 1871)
-    femmesh.addVolume([1064, 1148, 1044, 2213, 1429, 1578, 1576, 3282, 3188, 3181], 1872)
-    femmesh.addVolume([1661, 1630, 2203, 2221, 2122, 3231, 3008, 3009, 2452, 2563], 1873)
-    femmesh.addVolume([1064, 1018, 1131, 2213, 1341, 1342, 1343, 3282, 2508, 2775], 1874)
-    femmesh.addVolume([1064, 1131, 1037, 2213, 1343, 1528, 1526, 3282, 2775, 2884], 1875)
-    femmesh.addVolume([721, 753, 1639, 2228, 888, 3291, 3290, 3292, 3293, 3294], 1876)
-    femmesh.addVolume([1645, 1670, 403, 2229, 1809, 3296, 3295, 2684, 2772, 3297], 1877)
-    femmesh.addVolume([1664, 1644, 733, 2251, 1881, 3251, 2920, 2873, 2886, 2919], 1878)
-    femmesh.addVolume([1610, 1711, 1697, 2208, 1922, 1931, 1926, 2614, 2634, 2635], 1879)
-    femmesh.addVolume([1738, 2231, 2202, 2225, 3005, 3041, 3298, 3006, 2633, 3042], 1880)
-    femmesh.addVolume([1726, 1735, 1637, 2215, 2172, 2167, 2171, 3052, 2909, 2785], 1881)
-    femmesh.addVolume([1697, 2253, 2220, 2246, 2727, 2728, 2637, 3229, 3029, 3149], 1882)
-    femmesh.addVolume([741, 767, 1650, 2233, 877, 3300, 3299, 3235, 3234, 3301], 1883)
-    femmesh.addVolume([1611, 1659, 1735, 2213, 1935, 1936, 1937, 2489, 2819, 2604], 1884)
-    femmesh.addVolume([1036, 1096, 2217, 2226, 1523, 3302, 2501, 2502, 3303, 2503], 1885)
-    femmesh.addVolume([1126, 1065, 1045, 2204, 1537, 1583, 1357, 2564, 2969, 2679], 1886)
-    femmesh.addVolume([1129, 2235, 2252, 2222, 3305, 2925, 3304, 3306, 3307, 3308], 1887)
-    femmesh.addVolume([1648, 1716, 1616, 2255, 1998, 1999, 1997, 2843, 2795, 2332], 1888)
-    femmesh.addVolume([423, 405, 435, 2202, 702, 556, 630, 3165, 3211, 3086], 1889)
-    femmesh.addVolume([706, 719, 734, 2230, 953, 951, 952, 2467, 2585, 2610], 1890)
-    femmesh.addVolume([730, 723, 714, 2237, 973, 1010, 1009, 3221, 3246, 2607], 1891)
-    femmesh.addVolume([1739, 1618, 2234, 2199, 2019, 2426, 2663, 2664, 2778, 2302], 1892)
-    femmesh.addVolume([1081, 1036, 1119, 2218, 1518, 1519, 1373, 2906, 2586, 2577], 1893)
-    femmesh.addVolume([1657, 1638, 1739, 2234, 1945, 2174, 2018, 2264, 2408, 2663], 1894)
-    femmesh.addVolume([439, 2200, 395, 2215, 2960, 3309, 660, 3051, 2787, 3310], 1895)
-    femmesh.addVolume([1633, 2252, 1653, 2235, 3206, 2895, 2141, 3311, 2925, 2723], 1896)
-    femmesh.addVolume([1059, 1144, 1141, 2228, 1473, 1352, 1607, 2923, 2924, 2542], 1897)
-    femmesh.addVolume([1073, 1099, 1027, 2210, 1367, 1447, 1444, 2517, 2866, 2912], 1898)
-    femmesh.addVolume([759, 732, 1684, 2219, 903, 3184, 3312, 3209, 3001, 3185], 1899)
-    femmesh.addVolume([1054, 1110, 2249, 2245, 1326, 3106, 3313, 3314, 3159, 2878], 1900)
-    femmesh.addVolume([735, 745, 1733, 2232, 865, 3315, 3047, 2605, 2804, 3048], 1901)
-    femmesh.addVolume([718, 749, 737, 2242, 935, 947, 1016, 2707, 3099, 2706], 1902)
-    femmesh.addVolume([1034, 2216, 2219, 2218, 3316, 3002, 3284, 3285, 2420, 2797], 1903)
-    femmesh.addVolume([1682, 1639, 753, 2228, 1872, 3291, 3317, 3177, 3294, 3293], 1904)
-    femmesh.addVolume([1096, 415, 1051, 2217, 3318, 3256, 1218, 3302, 3160, 3255], 1905)
-    femmesh.addVolume([1064, 1044, 1141, 2213, 1576, 1577, 1344, 3282, 3181, 2507], 1906)
-    femmesh.addVolume([723, 764, 714, 2237, 797, 1011, 1010, 3246, 2754, 2607], 1907)
-    femmesh.addVolume([705, 737, 749, 2242, 946, 947, 948, 2725, 2706, 3099], 1908)
-    femmesh.addVolume([391, 423, 435, 2202, 628, 630, 631, 2821, 3165, 3086], 1909)
-    femmesh.addVolume([1040, 1060, 2252, 2235, 1548, 3207, 3208, 3319, 3320, 2925], 1910)
-    femmesh.addVolume([1109, 1050, 1118, 2216, 1591, 1592, 1376, 2407, 2966, 2487], 1911)
-    femmesh.addVolume([1120, 1017, 1111, 2208, 1332, 1338, 1340, 2983, 2660, 2982], 1912)
-    femmesh.addVolume([1031, 1143, 2212, 2245, 1485, 3010, 2946, 3014, 3066, 2835], 1913)
-    femmesh.addVolume([1129, 2243, 2235, 2222, 3321, 3121, 3305, 3306, 3322, 3307], 1914)
-    femmesh.addVolume([753, 1682, 2228, 2247, 3317, 3177, 3293, 3323, 3178, 2901], 1915)
-    femmesh.addVolume([402, 1070, 413, 2246, 3239, 3069, 532, 3241, 2880, 3070], 1916)
-    femmesh.addVolume([715, 1069, 724, 1047, 2829, 3324, 852, 2674, 1318, 2673], 1917)
-    femmesh.addVolume([1740, 1618, 1739, 2199, 2022, 2019, 2024, 2776, 2778, 2664], 1918)
-    femmesh.addVolume([447, 414, 401, 2205, 612, 697, 699, 2973, 2975, 3080], 1919)
-    femmesh.addVolume([1656, 418, 2200, 2199, 3203, 3205, 3204, 3325, 3326, 2777], 1920)
-    femmesh.addVolume([1084, 1072, 1031, 2212, 1436, 1483, 1484, 2390, 2941, 2946], 1921)
-    femmesh.addVolume([1141, 1018, 1064, 2213, 1345, 1341, 1344, 2507, 2508, 3282], 1922)
-    femmesh.addVolume([1655, 1733, 1635, 2232, 1854, 2153, 2154, 2807, 3048, 3249], 1923)
-    femmesh.addVolume([1062, 1042, 1139, 2232, 1562, 1563, 1260, 2848, 3250, 3094], 1924)
-    femmesh.addVolume([720, 711, 755, 2251, 989, 990, 823, 2737, 2927, 2964], 1925)
-    femmesh.addVolume([1663, 1622, 1700, 2250, 2054, 2055, 2056, 2458, 2535, 2569], 1926)
-    femmesh.addVolume([1716, 2255, 1648, 2219, 2795, 2843, 1998, 2793, 2794, 2910], 1927)
-    femmesh.addVolume([1680, 750, 708, 2245, 3328, 969, 3327, 3043, 3199, 3329], 1928)
-    femmesh.addVolume([1061, 1138, 1043, 2202, 1188, 1570, 1569, 3164, 3166, 3232], 1929)
-    femmesh.addVolume([1150, 454, 417, 2215, 3265, 502, 3330, 3266, 2856, 3331], 1930)
-    femmesh.addVolume([1633, 1723, 2252, 2235, 2140, 3332, 3206, 3311, 3333, 2925], 1931)
-    femmesh.addVolume([1647, 1736, 2249, 2245, 1986, 2876, 3334, 3335, 2834, 2878], 1932)
-    femmesh.addVolume([423, 405, 2202, 2225, 702, 3211, 3165, 3236, 3151, 3042], 1933)
-    femmesh.addVolume([1043, 1061, 2202, 2225, 1569, 3164, 3232, 3233, 3237, 3042], 1934)
-    femmesh.addVolume([413, 1070, 1046, 2236, 3069, 1241, 3280, 3068, 2907, 2868], 1935)
-    femmesh.addVolume([1133, 716, 1063, 2221, 3336, 2916, 1272, 3289, 2918, 2917], 1936)
-    femmesh.addVolume([746, 736, 1139, 2232, 791, 3093, 3337, 2802, 2628, 3094], 1937)
-    femmesh.addVolume([1680, 1736, 1647, 2245, 2076, 1986, 1916, 3043, 2834, 3335], 1938)
-    femmesh.addVolume([1620, 1742, 2258, 2224, 2036, 3083, 2954, 2955, 3085, 2580], 1939)
-    femmesh.addVolume([1627, 1688, 2216, 2219, 2098, 2999, 3214, 3135, 3003, 3002], 1940)
-    femmesh.addVolume([1714, 1673, 1613, 2218, 1966, 1964, 1965, 2520, 2806, 2419], 1941)
-    femmesh.addVolume([1132, 2244, 1055, 2206, 2325, 2768, 1543, 2387, 2354, 2851], 1942)
-    femmesh.addVolume([1731, 1737, 2232, 2231, 2159, 2307, 3019, 3022, 2280, 2308], 1943)
-    femmesh.addVolume([1038, 1065, 1126, 2233, 1536, 1537, 1538, 2589, 2904, 2695], 1944)
-    femmesh.addVolume([1033, 1093, 2241, 2240, 1500, 3072, 2543, 2615, 3075, 2616], 1945)
-    femmesh.addVolume([1121, 1033, 2256, 2240, 1496, 2544, 2450, 2451, 2615, 2335], 1946)
-    femmesh.addVolume([1626, 1715, 2256, 2240, 2086, 2453, 2548, 2617, 2454, 2335], 1947)
-    femmesh.addVolume([1648, 759, 1684, 2219, 3210, 3312, 1890, 2910, 3209, 3185], 1948)
-    femmesh.addVolume([1730, 1740, 1656, 2200, 2173, 2198, 1795, 2962, 2731, 3204], 1949)
-    femmesh.addVolume([728, 1682, 753, 2247, 3226, 3317, 885, 3034, 3178, 3323], 1950)
-    femmesh.addVolume([756, 726, 1056, 2219, 832, 3273, 3338, 3339, 3144, 3272], 1951)
-    femmesh.addVolume([1066, 1032, 1112, 2234, 1487, 1489, 1358, 2415, 2297, 2433], 1952)
-    femmesh.addVolume([1626, 2241, 1685, 2240, 2547, 3100, 2090, 2617, 2616, 3102], 1953)
-    femmesh.addVolume([1738, 1734, 2202, 2231, 2166, 3115, 3298, 3005, 3118, 3041], 1954)
-    femmesh.addVolume([758, 711, 733, 2251, 994, 988, 897, 2887, 2927, 2919], 1955)
-    femmesh.addVolume([1645, 412, 1689, 2217, 2988, 3340, 1812, 2683, 2989, 3341], 1956)
-    femmesh.addVolume([1144, 1059, 1030, 2254, 1473, 1470, 1472, 2691, 2922, 2527], 1957)
-    femmesh.addVolume([1650, 2204, 2221, 2233, 3274, 2263, 3275, 3301, 2290, 2766], 1958)
-    femmesh.addVolume([741, 1650, 2221, 2233, 3299, 3275, 3286, 3235, 3301, 2766], 1959)
-    femmesh.addVolume([1663, 727, 760, 2250, 3342, 923, 2457, 2458, 2346, 2459], 1960)
-    femmesh.addVolume([742, 768, 709, 2221, 803, 976, 979, 3343, 2762, 2763], 1961)
-    femmesh.addVolume([330, 328, 1060, 2235, 389, 3345, 3344, 3173, 2799, 3320], 1962)
-    femmesh.addVolume([1717, 1725, 2255, 2201, 2004, 3200, 2827, 3270, 3134, 3169], 1963)
-    femmesh.addVolume([1123, 2255, 1130, 2201, 2696, 3201, 1414, 3168, 3169, 3138], 1964)
-    femmesh.addVolume([412, 1645, 403, 2229, 2988, 3295, 585, 2990, 2684, 3297], 1965)
-    femmesh.addVolume([759, 712, 732, 2219, 1001, 995, 903, 3209, 3062, 3001], 1966)
-    femmesh.addVolume([1722, 1615, 2235, 2249, 1983, 3120, 3346, 3347, 3123, 3124], 1967)
-    femmesh.addVolume([735, 736, 704, 2232, 939, 940, 941, 2605, 2628, 2803], 1968)
-    femmesh.addVolume([1621, 2236, 2253, 2246, 2574, 2573, 2570, 3348, 2908, 3029], 1969)
-    femmesh.addVolume([1066, 1019, 1045, 2204, 1355, 1353, 1354, 2413, 2587, 2679], 1970)
-    femmesh.addVolume([415, 1096, 441, 2217, 3318, 3349, 513, 3160, 3302, 3350], 1971)
-    femmesh.addVolume([1059, 752, 1092, 2209, 3352, 3351, 1282, 3103, 3353, 2560], 1972)
-    femmesh.addVolume([442, 409, 1057, 2201, 519, 3355, 3354, 3356, 3357, 3358], 1973)
-    femmesh.addVolume([1075, 1088, 406, 2223, 1247, 3277, 2657, 2647, 3279, 2659], 1974)
-    femmesh.addVolume([731, 1059, 2228, 2209, 3360, 2923, 3359, 3361, 3103, 3153], 1975)
-    femmesh.addVolume([408, 1068, 438, 2200, 3363, 3362, 496, 3364, 3242, 3365], 1976)
-    femmesh.addVolume([1645, 1692, 1670, 2229, 2188, 2043, 1809, 2684, 2568, 2772], 1977)
-    femmesh.addVolume([1057, 2201, 409, 2226, 3358, 3357, 3355, 3366, 3170, 3367], 1978)
-    femmesh.addVolume([1056, 1023, 1122, 2219, 1405, 1408, 1409, 3272, 2842, 2841], 1979)
-    femmesh.addVolume([756, 1091, 722, 2219, 3368, 3212, 829, 3339, 3213, 3026], 1980)
-    femmesh.addVolume([1075, 443, 1046, 2205, 3157, 3217, 1244, 2644, 3079, 2655], 1981)
-    femmesh.addVolume([1661, 1696, 1630, 2221, 1866, 2116, 2122, 3009, 3228, 2452], 1982)
-    femmesh.addVolume([1676, 1624, 1665, 2212, 2073, 2074, 2026, 2379, 3113, 2956], 1983)
-    femmesh.addVolume([1036, 1123, 1090, 2226, 1521, 1524, 1522, 2502, 2697, 3369], 1984)
-    femmesh.addVolume([1658, 1720, 1632, 2206, 2136, 2137, 2135, 2931, 2353, 2666], 1985)
-    femmesh.addVolume([1107, 1021, 1046, 2238, 1381, 1377, 1380, 2872, 2753, 2654], 1986)
-    femmesh.addVolume([1679, 1618, 1659, 2213, 2015, 2021, 2020, 2789, 2427, 2819], 1987)
-    femmesh.addVolume([1057, 1123, 2201, 2226, 1603, 3168, 3358, 3366, 2697, 3170], 1988)
-    femmesh.addVolume([1652, 1734, 1738, 2231, 1760, 2166, 2196, 3055, 3118, 3005], 1989)
-    femmesh.addVolume([1652, 1737, 1731, 2231, 2195, 2159, 1763, 3055, 2280, 3022], 1990)
-    femmesh.addVolume([1115, 717, 1093, 2240, 3370, 3074, 1303, 3371, 3076, 3075], 1991)
-    femmesh.addVolume([412, 445, 1689, 2217, 589, 3372, 3340, 2989, 3373, 3341], 1992)
-    femmesh.addVolume([328, 329, 1060, 2235, 390, 3374, 3345, 2799, 3375, 3320], 1993)
-    femmesh.addVolume([423, 424, 405, 2225, 481, 703, 702, 3236, 3376, 3151], 1994)
-    femmesh.addVolume([1096, 441, 2217, 2226, 3349, 3350, 3302, 3303, 3377, 2503], 1995)
-    femmesh.addVolume([1068, 1032, 1086, 2199, 1490, 1488, 1491, 3243, 2300, 2857], 1996)
-    femmesh.addVolume([1690, 1668, 1619, 2227, 2031, 2030, 2028, 2372, 2672, 2756], 1997)
-    femmesh.addVolume([1070, 443, 413, 1046, 3378, 536, 3069, 1241, 3217, 3280], 1998)
-    femmesh.addVolume([1097, 1026, 1075, 2227, 1438, 1439, 1441, 2311, 2705, 2645], 1999)
-    femmesh.addVolume([1698, 730, 2237, 2233, 3218, 3221, 3220, 3379, 3254, 2292], 2000)
-    femmesh.addVolume([718, 750, 1647, 2249, 937, 3381, 3380, 2708, 3198, 3334], 2001)
-    femmesh.addVolume([1138, 423, 431, 2202, 3162, 478, 3382, 3166, 3165, 2853], 2002)
-    femmesh.addVolume([1736, 1680, 1624, 2257, 2076, 2069, 2075, 2837, 3044, 3175], 2003)
-    femmesh.addVolume([1647, 2249, 750, 2245, 3334, 3198, 3381, 3335, 2878, 3199], 2004)
-    femmesh.addVolume([1114, 746, 1139, 2232, 3383, 3337, 1257, 3384, 2802, 3094], 2005)
-    femmesh.addVolume([1060, 329, 1135, 2252, 3374, 3385, 1178, 3207, 3386, 3127], 2006)
-    femmesh.addVolume([757, 724, 1076, 2250, 849, 3387, 2463, 2464, 2675, 2465], 2007)
-    femmesh.addVolume([1732, 1708, 430, 2202, 1777, 3388, 3222, 3087, 3389, 2820], 2008)
-    femmesh.addVolume([1690, 1668, 2227, 2205, 2031, 2672, 2372, 2388, 2596, 2312], 2009)
-    femmesh.addVolume([1614, 1700, 1667, 2238, 1970, 1981, 1980, 2612, 2677, 2624], 2010)
-    femmesh.addVolume([1120, 1049, 2239, 2220, 1590, 2936, 3067, 2985, 2939, 2702], 2011)
-    femmesh.addVolume([1707, 1733, 745, 2232, 1851, 3315, 3390, 3391, 3048, 2804], 2012)
-    femmesh.addVolume([1716, 1673, 2255, 2218, 2097, 2805, 2795, 2796, 2806, 2558], 2013)
-    femmesh.addVolume([432, 1694, 434, 2252, 3393, 3392, 627, 2642, 3394, 2968], 2014)
-    femmesh.addVolume([1082, 1128, 1018, 2211, 1347, 1348, 1346, 2550, 2551, 2505], 2015)
-    femmesh.addVolume([1709, 1685, 717, 2240, 1895, 3101, 3395, 3396, 3102, 3076], 2016)
-    femmesh.addVolume([333, 1728, 1694, 2252, 3252, 1767, 3397, 2358, 2896, 3394], 2017)
-    femmesh.addVolume([1679, 1625, 2203, 2213, 2077, 3045, 2854, 2789, 2898, 2670], 2018)
-    femmesh.addVolume([1069, 743, 2245, 2257, 3399, 3398, 3015, 2831, 3400, 2839], 2019)
-    femmesh.addVolume([1105, 1038, 2237, 2233, 1533, 2412, 3247, 3271, 2589, 2292], 2020)
-    femmesh.addVolume([1048, 1104, 1117, 2241, 1587, 1339, 1588, 2473, 2627, 2267], 2021)
-    femmesh.addVolume([1642, 1712, 1706, 2241, 2183, 1932, 2182, 2524, 2274, 2626], 2022)
-    femmesh.addVolume([756, 712, 726, 2219, 997, 1000, 832, 3339, 3062, 3144], 2023)
-    femmesh.addVolume([1732, 1636, 2202, 2225, 2160, 3401, 3087, 3090, 3402, 3042], 2024)
-    femmesh.addVolume([1735, 1651, 2211, 2215, 2194, 3128, 2603, 2909, 2650, 2786], 2025)
-    femmesh.addVolume([401, 414, 2236, 2205, 697, 3141, 3078, 3080, 2975, 2847], 2026)
-    femmesh.addVolume([1059, 731, 752, 2209, 3360, 817, 3352, 3103, 3361, 3353], 2027)
-    femmesh.addVolume([269, 261, 1140, 2202, 315, 3404, 3403, 2682, 2957, 3405], 2028)
-    femmesh.addVolume([722, 732, 712, 2219, 992, 995, 996, 3026, 3001, 3062], 2029)
-    femmesh.addVolume([419, 446, 1649, 2201, 595, 3407, 3406, 3408, 3409, 3410], 2030)
-    femmesh.addVolume([1703, 1682, 1625, 2228, 2083, 2082, 2079, 2693, 3177, 2897], 2031)
-    femmesh.addVolume([1740, 1656, 2200, 2199, 2198, 3204, 2731, 2776, 3325, 2777], 2032)
-    femmesh.addVolume([1643, 1711, 1686, 2239, 2185, 2106, 1826, 2860, 2700, 2953], 2033)
-    femmesh.addVolume([722, 1095, 755, 2216, 3025, 3411, 826, 3023, 3024, 2967], 2034)
-    femmesh.addVolume([431, 1113, 1138, 2202, 3412, 1185, 3382, 2853, 3413, 3166], 2035)
-    femmesh.addVolume([1051, 1119, 2217, 2229, 1594, 2576, 3255, 3257, 2641, 2443], 2036)
-    femmesh.addVolume([410, 1651, 1726, 2215, 2784, 1803, 3281, 2678, 2650, 3052], 2037)
-    femmesh.addVolume([1061, 424, 423, 2225, 3414, 481, 3163, 3237, 3376, 3236], 2038)
-    femmesh.addVolume([450, 1106, 1055, 2206, 3415, 1194, 3081, 3082, 3416, 2851], 2039)
-    femmesh.addVolume([1090, 1096, 1036, 2226, 1221, 1523, 1522, 3369, 3303, 2502], 2040)
-    femmesh.addVolume([1125, 2206, 1061, 2225, 3223, 3417, 1545, 2979, 3224, 3237], 2041)
-    femmesh.addVolume([1646, 2243, 2223, 2222, 3419, 2699, 3418, 3420, 3322, 3421], 2042)
-    femmesh.addVolume([2248, 1632, 2206, 2225, 2665, 2666, 2355, 2632, 3422, 3224], 2043)
-    femmesh.addVolume([1713, 1627, 2216, 2218, 2095, 3214, 2435, 2474, 3136, 2420], 2044)
-    femmesh.addVolume([727, 1663, 1641, 2250, 3342, 1907, 2347, 2346, 2458, 2345], 2045)
-    femmesh.addVolume([1146, 1125, 1061, 2225, 1422, 1545, 1572, 2746, 2979, 3237], 2046)
-    femmesh.addVolume([753, 2228, 710, 2247, 3293, 3423, 983, 3323, 2901, 3424], 2047)
-    femmesh.addVolume([417, 454, 396, 2215, 502, 664, 662, 3331, 2856, 2497], 2048)
-    femmesh.addVolume([731, 2228, 1142, 2247, 3359, 3426, 3425, 3427, 2901, 3428], 2049)
-    femmesh.addVolume([1040, 2252, 1129, 2235, 3208, 3304, 1549, 3319, 2925, 3305], 2050)
-    femmesh.addVolume([1061, 2206, 424, 2225, 3417, 3429, 3414, 3237, 3224, 3376], 2051)
-    femmesh.addVolume([1694, 432, 333, 2252, 3393, 2801, 3397, 3394, 2642, 2358], 2052)
-    femmesh.addVolume([408, 1068, 2200, 2199, 3363, 3242, 3364, 3430, 3243, 2777], 2053)
-    femmesh.addVolume([270, 267, 1731, 2232, 299, 3020, 3431, 2481, 3018, 3019], 2054)
-    femmesh.addVolume([1095, 1034, 2216, 2219, 1508, 3316, 3024, 3027, 3284, 3002], 2055)
-    femmesh.addVolume([1068, 1086, 1037, 2200, 1491, 1527, 1529, 3242, 2618, 2883], 2056)
-    femmesh.addVolume([1120, 1049, 1094, 2239, 1590, 1232, 1516, 3067, 2936, 2949], 2057)
-    femmesh.addVolume([1146, 1061, 1043, 2225, 1572, 1569, 1571, 2746, 3237, 3233], 2058)
-    femmesh.addVolume([1689, 2217, 445, 2226, 3341, 3373, 3372, 3432, 2503, 3433], 2059)
-    femmesh.addVolume([1022, 1127, 2235, 2249, 1395, 3434, 3179, 3013, 3435, 3124], 2060)
-    femmesh.addVolume([418, 408, 2200, 2199, 655, 3364, 3205, 3326, 3430, 2777], 2061)
-    femmesh.addVolume([731, 1142, 751, 2247, 3425, 3436, 814, 3427, 3428, 3437], 2062)
-    femmesh.addVolume([738, 1110, 1054, 2245, 3158, 1326, 3438, 2981, 3159, 3314], 2063)
-    femmesh.addVolume([732, 758, 1688, 2216, 900, 3439, 2998, 3000, 2888, 2999], 2064)
-    femmesh.addVolume([1039, 1125, 2248, 2206, 1546, 2978, 2757, 2758, 3223, 2355], 2065)
-    femmesh.addVolume([1653, 2242, 1634, 2235, 2719, 3440, 2150, 2723, 2722, 3441], 2066)
-    femmesh.addVolume([1091, 756, 1056, 2219, 3368, 3338, 1299, 3213, 3339, 3272], 2067)
-    femmesh.addVolume([756, 722, 712, 2219, 829, 996, 997, 3339, 3026, 3062], 2068)
-    femmesh.addVolume([1688, 758, 1644, 2216, 3439, 2885, 1884, 2999, 2888, 2889], 2069)
-    femmesh.addVolume([707, 754, 733, 2209, 966, 894, 959, 3147, 3097, 2921], 2070)
-    femmesh.addVolume([427, 1643, 2220, 2246, 3443, 2861, 3442, 3444, 3230, 3149], 2071)
-    femmesh.addVolume([330, 1060, 1136, 2235, 3344, 1181, 3172, 3173, 3320, 3174], 2072)
-    femmesh.addVolume([1135, 329, 326, 2252, 3385, 379, 3125, 3127, 3386, 2734], 2073)
-    femmesh.addVolume([729, 1648, 1709, 2240, 3182, 1892, 3445, 3063, 2844, 3396], 2074)
-    femmesh.addVolume([1693, 434, 2252, 2222, 3447, 2968, 3446, 3448, 3449, 3308], 2075)
-    femmesh.addVolume([768, 723, 709, 2233, 800, 975, 976, 2764, 3253, 2765], 2076)
-    femmesh.addVolume([1662, 231, 1641, 727, 1908, 1906, 1910, 3450, 921, 2347], 2077)
-    femmesh.addVolume([1695, 747, 749, 2242, 3452, 938, 3451, 3453, 2726, 3099], 2078)
-    femmesh.addVolume([1081, 1122, 2255, 2218, 1507, 2840, 2905, 2906, 3004, 2558], 2079)
-    femmesh.addVolume([433, 422, 1101, 2252, 549, 3455, 3454, 2671, 3049, 3456], 2080)
-    femmesh.addVolume([745, 270, 1707, 2232, 2970, 3457, 3390, 2804, 2481, 3391], 2081)
-    femmesh.addVolume([1705, 2254, 1623, 2209, 2397, 2686, 2067, 3152, 2528, 2875], 2082)
-    femmesh.addVolume([439, 395, 410, 2215, 660, 657, 575, 3051, 3310, 2678], 2083)
-    femmesh.addVolume([332, 335, 1695, 2242, 364, 3459, 3458, 2720, 2448, 3453], 2084)
-    femmesh.addVolume([419, 2201, 1649, 2226, 3408, 3410, 3406, 3460, 3170, 3461], 2085)
-    femmesh.addVolume([1725, 1616, 1717, 2255, 2000, 2003, 2004, 3200, 2332, 2827], 2086)
-    femmesh.addVolume([1671, 1643, 427, 2246, 1829, 3443, 3462, 3238, 3230, 3444], 2087)
-    femmesh.addVolume([1123, 1023, 1130, 2255, 1412, 1411, 1414, 2696, 2337, 3201], 2088)
-    femmesh.addVolume([429, 1670, 1687, 2258, 3155, 1806, 3463, 3154, 2771, 3194], 2089)
-    femmesh.addVolume([1065, 1105, 723, 2233, 1266, 3245, 3283, 2904, 3271, 3253], 2090)
-    femmesh.addVolume([1060, 329, 2252, 2235, 3374, 3386, 3207, 3320, 3375, 2925], 2091)
-    femmesh.addVolume([1708, 268, 430, 2202, 3464, 2997, 3388, 3389, 2513, 2820], 2092)
-    femmesh.addVolume([1658, 1699, 397, 2206, 1786, 3465, 2930, 2931, 3466, 2932], 2093)
-    femmesh.addVolume([742, 1065, 768, 2221, 3467, 2902, 803, 3343, 2903, 2762], 2094)
-    femmesh.addVolume([1627, 1684, 1688, 2219, 2092, 1887, 2098, 3135, 3185, 3003], 2095)
-    femmesh.addVolume([1634, 1653, 1729, 2242, 2150, 1773, 2151, 3440, 2719, 2760], 2096)
-    femmesh.addVolume([1620, 1742, 1651, 2258, 2036, 2037, 2035, 2954, 3083, 2649], 2097)
-    femmesh.addVolume([451, 1088, 425, 2223, 3276, 3468, 545, 3278, 3279, 3469], 2098)
-    femmesh.addVolume([327, 330, 1136, 2242, 385, 3172, 3111, 2729, 3171, 3112], 2099)
-    femmesh.addVolume([437, 1646, 2223, 2222, 3471, 3418, 3470, 3472, 3420, 3421], 2100)
-    femmesh.addVolume([726, 1115, 1056, 2240, 3473, 1300, 3273, 3145, 3371, 3176], 2101)
-    femmesh.addVolume([1701, 1662, 1641, 2257, 2071, 1910, 1973, 3259, 3474, 2348], 2102)
-    femmesh.addVolume([1050, 755, 1095, 2216, 2963, 3411, 1292, 2966, 2967, 3024], 2103)
-    femmesh.addVolume([1726, 1651, 1735, 2215, 1803, 2194, 2172, 3052, 2650, 2909], 2104)
-    femmesh.addVolume([1676, 1741, 1615, 2243, 1990, 1991, 1989, 2380, 2532, 3122], 2105)
-    femmesh.addVolume([718, 1647, 1704, 2249, 3380, 1918, 3131, 2708, 3334, 3132], 2106)
-    femmesh.addVolume([408, 438, 395, 2200, 496, 656, 653, 3364, 3365, 3309], 2107)
-    femmesh.addVolume([335, 747, 1695, 2242, 2882, 3452, 3459, 2448, 2726, 3453], 2108)
-    femmesh.addVolume([429, 403, 1670, 2229, 586, 3296, 3155, 3156, 3297, 2772], 2109)
-    femmesh.addVolume([1701, 1641, 1614, 2214, 1973, 1971, 1972, 3258, 2436, 2611], 2110)
-    femmesh.addVolume([1640, 1691, 2236, 2205, 2181, 2846, 3142, 2974, 2653, 2847], 2111)
-    femmesh.addVolume([1028, 2250, 1098, 2207, 3057, 2790, 1456, 3262, 2538, 3475], 2112)
-    femmesh.addVolume([727, 1662, 231, 715, 3450, 1908, 921, 926, 3476, 927], 2113)
-    femmesh.addVolume([1719, 1632, 2248, 2225, 2133, 2665, 3477, 3478, 3422, 2632], 2114)
-    femmesh.addVolume([1084, 1022, 1149, 2243, 1398, 1400, 1401, 2391, 3107, 2541], 2115)
-    femmesh.addVolume([1069, 743, 1087, 2245, 3399, 3479, 1321, 3015, 3398, 3191], 2116)
-    femmesh.addVolume([1150, 1052, 1079, 2215, 1597, 1595, 1209, 3266, 2781, 2951], 2117)
-    femmesh.addVolume([1689, 1629, 2217, 2226, 2112, 2556, 3341, 3432, 2578, 2503], 2118)
-    femmesh.addVolume([1672, 1626, 1715, 2256, 2088, 2086, 2089, 2399, 2548, 2453], 2119)
-    femmesh.addVolume([724, 1069, 715, 182, 3324, 2829, 852, 848, 1317, 853], 2120)
-    femmesh.addVolume([1698, 763, 1655, 2237, 3219, 2991, 1857, 3220, 2724, 2809], 2121)
-    femmesh.addVolume([1725, 1710, 1628, 2201, 2107, 2104, 2103, 3134, 2716, 2813], 2122)
-    femmesh.addVolume([1130, 1035, 1116, 2201, 1512, 1515, 1517, 3138, 2817, 2742], 2123)
-    femmesh.addVolume([1121, 1033, 1080, 2256, 1496, 1497, 1499, 2450, 2544, 2395], 2124)
-    femmesh.addVolume([1654, 1732, 405, 2225, 1780, 3150, 3480, 3481, 3090, 3151], 2125)
-    femmesh.addVolume([1145, 1137, 2232, 2231, 1568, 3269, 2361, 2317, 3482, 2308], 2126)
-    femmesh.addVolume([1065, 1038, 1105, 2233, 1536, 1533, 1266, 2904, 2589, 3271], 2127)
-    femmesh.addVolume([1740, 1637, 1659, 2200, 2169, 2168, 2023, 2731, 2484, 2818], 2128)
-    femmesh.addVolume([268, 1734, 266, 2202, 3483, 3117, 292, 2513, 3115, 3116], 2129)
-    femmesh.addVolume([1098, 1047, 1021, 2214, 1384, 1382, 1383, 2791, 3216, 2993], 2130)
-    femmesh.addVolume([1062, 764, 1105, 2237, 2994, 3244, 1263, 2850, 2754, 3247], 2131)
-    femmesh.addVolume([1146, 2202, 1140, 2231, 3040, 3405, 1575, 2744, 3041, 3484], 2132)
-    femmesh.addVolume([1084, 1031, 1143, 2212, 1484, 1485, 1399, 2390, 2946, 3010], 2133)
-    femmesh.addVolume([1717, 1649, 2201, 2226, 2192, 3410, 3270, 2828, 3461, 3170], 2134)
-    femmesh.addVolume([1098, 2250, 2238, 2207, 2790, 2623, 2792, 3475, 2538, 2625], 2135)
-    femmesh.addVolume([395, 439, 418, 2200, 660, 572, 654, 3309, 2960, 3205], 2136)
-    femmesh.addVolume([731, 1059, 1142, 2228, 3360, 1283, 3425, 3359, 2923, 3426], 2137)
-    femmesh.addVolume([1666, 1613, 1702, 2210, 1959, 1960, 1961, 2833, 2362, 2339], 2138)
-    femmesh.addVolume([1741, 1619, 1681, 2223, 2032, 2029, 2033, 2747, 2845, 3046], 2139)
-    femmesh.addVolume([1114, 271, 746, 2232, 3486, 3485, 3383, 3384, 2943, 2802], 2140)
-    femmesh.addVolume([1119, 1020, 1081, 2218, 1374, 1370, 1373, 2577, 2423, 2906], 2141)
-    femmesh.addVolume([1122, 1123, 1081, 2255, 1413, 1520, 1507, 2840, 2696, 2905], 2142)
-    femmesh.addVolume([1716, 1673, 1717, 2255, 2097, 2111, 2002, 2795, 2805, 2827], 2143)
-    femmesh.addVolume([1669, 414, 2236, 2246, 3196, 3141, 3197, 3487, 3488, 2908], 2144)
-    femmesh.addVolume([1624, 1676, 1736, 2212, 2073, 1988, 2075, 3113, 2379, 2836], 2145)
-    femmesh.addVolume([1697, 1621, 2253, 2246, 2051, 2570, 2727, 3229, 3348, 3029], 2146)
-    femmesh.addVolume([1047, 1076, 724, 2250, 1315, 3387, 2673, 2676, 2465, 2675], 2147)
-    femmesh.addVolume([753, 721, 710, 2228, 888, 982, 983, 3293, 3292, 3423], 2148)
-    femmesh.addVolume([737, 748, 1102, 2242, 862, 3490, 3489, 2706, 2769, 3491], 2149)
-    femmesh.addVolume([332, 1695, 1729, 2242, 3458, 1774, 2759, 2720, 3453, 2760], 2150)
-    femmesh.addVolume([1097, 1075, 1046, 2205, 1441, 1244, 1379, 2313, 2644, 2655], 2151)
-    femmesh.addVolume([1118, 2216, 1034, 2218, 2487, 3316, 1506, 2488, 2420, 3285], 2152)
-    femmesh.addVolume([1085, 426, 2220, 2246, 3493, 3492, 3148, 2881, 3494, 3149], 2153)
-    femmesh.addVolume([415, 441, 399, 2217, 513, 682, 685, 3160, 3350, 3495], 2154)
-    femmesh.addVolume([418, 408, 395, 2200, 655, 653, 654, 3205, 3364, 3309], 2155)
-    femmesh.addVolume([765, 1048, 740, 2241, 2472, 3496, 840, 2470, 2473, 3264], 2156)
-    femmesh.addVolume([1667, 1691, 1614, 2238, 1978, 1979, 1980, 2624, 2652, 2612], 2157)
-    femmesh.addVolume([1077, 428, 2258, 2229, 3499, 3498, 3497, 3500, 3501, 2748], 2158)
-    femmesh.addVolume([1639, 2228, 1705, 2209, 3294, 2398, 2178, 3502, 3153, 3152], 2159)
-    femmesh.addVolume([334, 1101, 1135, 2252, 3503, 1175, 3126, 2992, 3456, 3127], 2160)
-    femmesh.addVolume([1719, 2248, 1617, 2225, 3477, 2385, 2008, 3478, 2632, 2631], 2161)
-    femmesh.addVolume([1627, 1673, 1716, 2218, 2096, 2097, 2094, 3136, 2806, 2796], 2162)
-    femmesh.addVolume([724, 1047, 1069, 182, 2673, 1318, 3324, 848, 1313, 1317], 2163)
-    femmesh.addVolume([267, 2232, 265, 2231, 3018, 3504, 319, 3021, 2308, 3505], 2164)
-    femmesh.addVolume([1640, 1691, 1669, 2236, 2181, 2050, 1835, 3142, 2846, 3197], 2165)
-    femmesh.addVolume([427, 1643, 453, 2220, 3443, 2858, 604, 3442, 2861, 2862], 2166)
-    femmesh.addVolume([1131, 1037, 2200, 2215, 1528, 2883, 2773, 3065, 3506, 2787], 2167)
-    femmesh.addVolume([441, 399, 2217, 2226, 682, 3495, 3350, 3377, 3507, 2503], 2168)
-    femmesh.addVolume([1090, 1123, 1057, 2226, 1524, 1603, 1225, 3369, 2697, 3366], 2169)
-    femmesh.addVolume([1041, 1136, 1060, 2235, 1560, 1181, 1558, 3261, 3174, 3320], 2170)
-    femmesh.addVolume([1029, 1111, 1083, 2253, 1468, 1337, 1467, 2832, 3053, 2755], 2171)
-    femmesh.addVolume([412, 415, 399, 2217, 684, 685, 683, 2989, 3160, 3495], 2172)
-    femmesh.addVolume([412, 399, 445, 2217, 683, 686, 589, 2989, 3495, 3373], 2173)
-    femmesh.addVolume([1075, 1026, 1088, 2223, 1439, 1440, 1247, 2647, 3039, 3279], 2174)
-    femmesh.addVolume([447, 421, 1640, 2205, 615, 3508, 2972, 2973, 2595, 2974], 2175)
-    femmesh.addVolume([739, 1642, 766, 2241, 3509, 2521, 914, 3288, 2524, 2525], 2176)
-    femmesh.addVolume([428, 454, 1079, 2258, 505, 2950, 3510, 3498, 2855, 2870], 2177)
-    femmesh.addVolume([1057, 409, 1090, 2226, 3355, 3511, 1225, 3366, 3367, 3369], 2178)
-    femmesh.addVolume([434, 422, 2252, 2222, 637, 3049, 2968, 3449, 3512, 3308], 2179)
-    femmesh.addVolume([1650, 1721, 1630, 2221, 2118, 2119, 2117, 3275, 2262, 2452], 2180)
-    femmesh.addVolume([1030, 1082, 1144, 2254, 1478, 1350, 1472, 2527, 2639, 2691], 2181)
-    femmesh.addVolume([1705, 1639, 1703, 2228, 2178, 2179, 1943, 2398, 3294, 2693], 2182)
-    femmesh.addVolume([1073, 1109, 1020, 2210, 1368, 1369, 1365, 2517, 2405, 2422], 2183)
-    femmesh.addVolume([748, 336, 1102, 2242, 3514, 3513, 3490, 2769, 2869, 3491], 2184)
-    femmesh.addVolume([1721, 1650, 1724, 2204, 2118, 2126, 1956, 2260, 3274, 3192], 2185)
-    femmesh.addVolume([419, 400, 446, 2201, 688, 692, 595, 3408, 2783, 3409], 2186)
-    femmesh.addVolume([1713, 1613, 1673, 2218, 1963, 1964, 1962, 2474, 2419, 2806], 2187)
-    femmesh.addVolume([1675, 1623, 2254, 2224, 2065, 2686, 2995, 3183, 2687, 2640], 2188)
-    femmesh.addVolume([1687, 1670, 1620, 2258, 1806, 2042, 2034, 3194, 2771, 2954], 2189)
-    femmesh.addVolume([334, 433, 1101, 2252, 3515, 3454, 3503, 2992, 2671, 3456], 2190)
-    femmesh.addVolume([1621, 1674, 1697, 2253, 2045, 1927, 2051, 2570, 2320, 2727], 2191)
-    femmesh.addVolume([442, 400, 409, 2201, 689, 687, 519, 3356, 2783, 3357], 2192)
-    femmesh.addVolume([1711, 1610, 1672, 2208, 1922, 1923, 1921, 2634, 2614, 2400], 2193)
-    femmesh.addVolume([1017, 1120, 1080, 2208, 1332, 1333, 1329, 2660, 2983, 2396], 2194)
-    femmesh.addVolume([1707, 270, 1731, 2232, 3457, 3431, 1764, 3391, 2481, 3019], 2195)
-    femmesh.addVolume([1028, 1076, 1098, 2250, 1457, 1459, 1456, 3057, 2465, 2790], 2196)
-    femmesh.addVolume([1694, 1693, 434, 2252, 1848, 3447, 3392, 3394, 3446, 2968], 2197)
-    femmesh.addVolume([1647, 750, 1680, 2245, 3381, 3328, 1916, 3335, 3199, 3043], 2198)
-    femmesh.addVolume([1132, 1055, 1039, 2206, 1543, 1540, 1542, 2387, 2851, 2758], 2199)
-    femmesh.addVolume([401, 414, 413, 2236, 697, 698, 696, 3078, 3141, 3068], 2200)
-    femmesh.addVolume([1077, 2258, 1027, 2229, 3497, 2689, 1448, 3500, 2748, 3195], 2201)
-    femmesh.addVolume([1623, 1702, 1664, 2251, 2063, 2064, 2062, 2685, 2341, 2873], 2202)
-    femmesh.addVolume([455, 429, 1687, 2258, 581, 3463, 3193, 2494, 3154, 3194], 2203)
-    femmesh.addVolume([1096, 1090, 441, 2226, 1221, 3516, 3349, 3303, 3369, 3377], 2204)
-    femmesh.addVolume([1078, 1028, 1104, 2230, 1458, 1460, 1461, 2546, 3056, 2601], 2205)
-    femmesh.addVolume([330, 336, 327, 1136, 376, 386, 385, 3172, 3110, 3111], 2206)
-    femmesh.addVolume([399, 445, 2217, 2226, 686, 3373, 3495, 3507, 3433, 2503], 2207)
-    femmesh.addVolume([741, 1650, 1696, 2221, 3299, 1863, 3517, 3286, 3275, 3228], 2208)
-    femmesh.addVolume([1077, 428, 1079, 2258, 3499, 3510, 1212, 3497, 3498, 2870], 2209)
-    femmesh.addVolume([731, 710, 2228, 2247, 981, 3423, 3359, 3427, 3424, 2901], 2210)
-    femmesh.addVolume([1102, 336, 1136, 2242, 3513, 3110, 1182, 3491, 2869, 3112], 2211)
-    femmesh.addVolume([1048, 1093, 740, 2241, 1306, 3263, 3496, 2473, 3072, 3264], 2212)
-    femmesh.addVolume([1041, 1110, 2242, 2249, 1556, 3104, 3260, 3518, 3106, 2709], 2213)
-    femmesh.addVolume([1622, 1678, 1706, 2230, 2053, 2060, 2059, 2630, 2566, 2326], 2214)
-    femmesh.addVolume([1070, 402, 82, 1085, 3239, 531, 1236, 1238, 3240, 1234], 2215)
-    femmesh.addVolume([1623, 1705, 1675, 2254, 2067, 1938, 2065, 2686, 2397, 2995], 2216)
-    femmesh.addVolume([1117, 1017, 1080, 2208, 1331, 1329, 1330, 2270, 2660, 2396], 2217)
-    femmesh.addVolume([1712, 1672, 1610, 2208, 1925, 1923, 1924, 2275, 2400, 2614], 2218)
-    femmesh.addVolume([1143, 1054, 2249, 2245, 1397, 3313, 3012, 3066, 3314, 2878], 2219)
-    femmesh.addVolume([1083, 1029, 2253, 2207, 1467, 2832, 2755, 2593, 2825, 2661], 2220)
-    femmesh.addVolume([1137, 265, 2232, 2231, 3519, 3504, 3269, 3482, 3505, 2308], 2221)
-    femmesh.addVolume([1708, 1734, 268, 2202, 1757, 3483, 3464, 3389, 3115, 2513], 2222)
-    femmesh.addVolume([731, 751, 710, 2247, 814, 987, 981, 3427, 3437, 3424], 2223)
-    femmesh.addVolume([411, 416, 393, 2239, 641, 642, 640, 2713, 2740, 3058], 2224)
-    femmesh.addVolume([1621, 1669, 2236, 2246, 2049, 3197, 2574, 3348, 3487, 2908], 2225)
-    femmesh.addVolume([1022, 1129, 2243, 2235, 1403, 3321, 3107, 3179, 3305, 3121], 2226)
-    femmesh.addVolume([1685, 1642, 739, 2241, 1898, 3509, 3287, 3100, 2524, 3288], 2227)
-    femmesh.addVolume([1635, 1731, 1737, 2232, 2157, 2159, 2155, 3249, 3019, 2307], 2228)
-    femmesh.addVolume([1145, 1137, 1042, 2232, 1568, 1567, 1565, 2361, 3269, 3250], 2229)
-    femmesh.addVolume([1103, 438, 1068, 2200, 3520, 3362, 1203, 3521, 3365, 3242], 2230)
-    femmesh.addVolume([265, 262, 1137, 2232, 318, 3268, 3519, 3504, 2800, 3269], 2231)
-    femmesh.addVolume([1693, 2252, 1723, 2222, 3446, 3332, 2145, 3448, 3308, 3522], 2232)
-    femmesh.addVolume([722, 755, 711, 2216, 826, 990, 993, 3023, 2967, 2928], 2233)
-    femmesh.addVolume([431, 269, 1113, 2202, 3215, 3523, 3412, 2853, 2682, 3413], 2234)
-    femmesh.addVolume([1043, 1140, 1146, 2202, 1574, 1575, 1571, 3232, 3405, 3040], 2235)
-    femmesh.addVolume([1738, 1734, 1636, 2202, 2166, 2165, 2163, 3298, 3115, 3401], 2236)
-    femmesh.addVolume([711, 758, 732, 2216, 994, 900, 991, 2928, 2888, 3000], 2237)
-    femmesh.addVolume([404, 1693, 437, 2222, 3525, 3524, 626, 3526, 3448, 3472], 2238)
-    femmesh.addVolume([1071, 1109, 1030, 2251, 1475, 1476, 1474, 2738, 2406, 2526], 2239)
-    femmesh.addVolume([1654, 436, 2206, 2225, 3529, 3528, 3527, 3481, 3530, 3224], 2240)
-    femmesh.addVolume([1079, 1128, 1027, 2258, 1451, 1452, 1449, 2870, 2553, 2689], 2241)
-    femmesh.addVolume([429, 2258, 403, 2229, 3154, 3531, 586, 3156, 2748, 3297], 2242)
-    femmesh.addVolume([400, 409, 2201, 2226, 687, 3357, 2783, 3532, 3367, 3170], 2243)
-    femmesh.addVolume([1735, 1651, 1742, 2211, 2194, 2037, 1944, 2603, 3128, 3084], 2244)
-    femmesh.addVolume([428, 403, 2258, 2229, 510, 3531, 3498, 3501, 3297, 2748], 2245)
-    femmesh.addVolume([1063, 1148, 2203, 2247, 1609, 3187, 2914, 3129, 3190, 3036], 2246)
-    femmesh.addVolume([751, 1142, 1134, 2247, 3436, 1278, 3533, 3437, 3428, 3534], 2247)
-    femmesh.addVolume([1725, 1715, 1616, 2256, 2001, 1995, 2000, 3133, 2453, 2330], 2248)
-    femmesh.addVolume([1121, 1130, 1023, 2256, 1410, 1411, 1407, 2450, 3137, 2336], 2249)
-    femmesh.addVolume([760, 727, 713, 2250, 923, 1005, 1004, 2459, 2346, 2583], 2250)
-    femmesh.addVolume([1129, 2252, 1040, 2222, 3304, 3208, 1549, 3306, 3308, 3535], 2251)
-    femmesh.addVolume([715, 743, 1069, 2257, 854, 3399, 2829, 2417, 3400, 2831], 2252)
-    femmesh.addVolume([132, 414, 447, 1640, 606, 612, 610, 1834, 2971, 2972], 2253)
-    femmesh.addVolume([1096, 1051, 1119, 2217, 1218, 1594, 1525, 3302, 3255, 2576], 2254)
-    femmesh.addVolume([1140, 2202, 264, 2231, 3405, 3537, 3536, 3484, 3041, 3538], 2255)
-    femmesh.addVolume([1724, 2204, 1650, 2233, 3192, 3274, 2126, 3539, 2290, 3301], 2256)
-    femmesh.addVolume([1095, 1091, 1034, 2219, 1295, 1503, 1508, 3027, 3213, 3284], 2257)
-    femmesh.addVolume([266, 264, 2202, 2231, 314, 3537, 3116, 3119, 3538, 3041], 2258)
-    femmesh.addVolume([401, 443, 406, 2205, 695, 539, 693, 3080, 3079, 2658], 2259)
-    femmesh.addVolume([1645, 1689, 1714, 2217, 1812, 2115, 2189, 2683, 3341, 2441], 2260)
-    femmesh.addVolume([1104, 2230, 1028, 2207, 2601, 3056, 1460, 2592, 2602, 3262], 2261)
-    femmesh.addVolume([720, 733, 711, 2251, 960, 988, 989, 2737, 2919, 2927], 2262)
-    femmesh.addVolume([1693, 404, 434, 2222, 3525, 625, 3447, 3448, 3526, 3449], 2263)
-    femmesh.addVolume([1143, 1054, 1022, 2249, 1397, 1393, 1396, 3012, 3313, 3013], 2264)
-    femmesh.addVolume([1679, 1659, 1625, 2213, 2020, 2078, 2077, 2789, 2819, 2898], 2265)
-    femmesh.addVolume([1048, 1117, 1093, 2241, 1588, 1501, 1306, 2473, 2267, 3072], 2266)
-    femmesh.addVolume([451, 394, 406, 2223, 650, 648, 542, 3278, 2934, 2659], 2267)
-    femmesh.addVolume([400, 2201, 419, 2226, 2783, 3408, 688, 3532, 3170, 3460], 2268)
-    femmesh.addVolume([1632, 1699, 1658, 2206, 2131, 1786, 2135, 2666, 3466, 2931], 2269)
-    femmesh.addVolume([1053, 425, 2223, 2222, 3541, 3469, 3540, 3542, 3543, 3421], 2270)
-    femmesh.addVolume([329, 331, 326, 2252, 377, 378, 379, 3386, 2894, 2734], 2271)
-    femmesh.addVolume([394, 134, 421, 1668, 618, 614, 619, 2933, 1836, 2597], 2272)
-    femmesh.addVolume([438, 395, 2200, 2215, 656, 3309, 3365, 3544, 3310, 2787], 2273)
-    femmesh.addVolume([424, 2206, 436, 2225, 3429, 3528, 672, 3376, 3224, 3530], 2274)
-    femmesh.addVolume([1705, 1623, 1677, 2209, 2067, 2061, 2068, 3152, 2875, 2987], 2275)
-    femmesh.addVolume([1741, 1646, 2243, 2223, 2190, 3419, 2532, 2747, 3418, 2699], 2276)
-    femmesh.addVolume([1685, 1712, 1642, 2241, 2091, 2183, 1898, 3100, 2274, 2524], 2277)
-    femmesh.addVolume([1147, 1063, 1148, 2203, 1608, 1609, 1434, 2703, 2914, 3187], 2278)
-    femmesh.addVolume([1704, 1695, 749, 2242, 1920, 3451, 3225, 3130, 3453, 3099], 2279)
-    femmesh.addVolume([1137, 271, 1114, 2232, 3267, 3486, 1172, 3269, 2943, 3384], 2280)
-    femmesh.addVolume([1709, 717, 729, 2240, 3395, 909, 3445, 3396, 3076, 3063], 2281)
-    femmesh.addVolume([1146, 1140, 1058, 2231, 1575, 1168, 1606, 2744, 3484, 3545], 2282)
-    femmesh.addVolume([1058, 1137, 1145, 2231, 1171, 1568, 1605, 3545, 3482, 2317], 2283)
-    femmesh.addVolume([1649, 446, 1710, 2201, 3407, 3546, 1820, 3410, 3409, 2716], 2284)
-    femmesh.addVolume([1644, 1664, 1702, 2251, 1881, 2064, 2186, 2886, 2873, 2341], 2285)
-    femmesh.addVolume([1628, 1672, 1725, 2256, 2101, 2102, 2103, 2810, 2399, 3133], 2286)
-    femmesh.addVolume([1130, 1080, 1035, 2256, 1513, 1510, 1512, 3137, 2395, 2815], 2287)
-    femmesh.addVolume([1100, 1101, 422, 2252, 1254, 3455, 3547, 3548, 3456, 3049], 2288)
-    femmesh.addVolume([1044, 1142, 2228, 2247, 1580, 3426, 3180, 3189, 3428, 2901], 2289)
-    femmesh.addVolume([424, 436, 405, 2225, 672, 557, 703, 3376, 3530, 3151], 2290)
-    femmesh.addVolume([1683, 1717, 1629, 2226, 2114, 2110, 2113, 3549, 2828, 2578], 2291)
-    femmesh.addVolume([124, 1670, 403, 1645, 1804, 3296, 584, 1808, 1809, 3295], 2292)
-    femmesh.addVolume([1632, 1654, 2206, 2225, 2132, 3527, 2666, 3422, 3481, 3224], 2293)
-    femmesh.addVolume([1107, 1070, 1029, 2236, 1465, 1462, 1464, 2871, 2907, 2822], 2294)
-    femmesh.addVolume([1125, 1067, 1039, 2248, 1418, 1547, 1546, 2978, 2286, 2757], 2295)
-    femmesh.addVolume([1053, 425, 1088, 2223, 3541, 3468, 1251, 3540, 3469, 3279], 2296)
-    femmesh.addVolume([1111, 1049, 1120, 2220, 1589, 1590, 1340, 2984, 2939, 2985], 2297)
-    femmesh.addVolume([721, 753, 219, 1639, 888, 883, 887, 3290, 3291, 1870], 2298)
-    femmesh.addVolume([1031, 1087, 1143, 2245, 1480, 1486, 1485, 3014, 3191, 3066], 2299)
-    femmesh.addVolume([1668, 394, 134, 1681, 2933, 618, 1836, 1841, 3109, 1840], 2300)
-    femmesh.addVolume([1060, 328, 330, 329, 3345, 389, 3344, 3374, 390, 375], 2301)
-    femmesh.addVolume([1669, 1691, 1621, 2236, 2050, 2047, 2049, 3197, 2846, 2574], 2302)
-    femmesh.addVolume([726, 717, 1115, 2240, 835, 3370, 3473, 3145, 3076, 3371], 2303)
-    femmesh.addVolume([70, 408, 440, 1068, 492, 493, 488, 1198, 3363, 3550], 2304)
-    femmesh.addVolume([1639, 1682, 1703, 2228, 1872, 2083, 2179, 3294, 3177, 2693], 2305)
-    femmesh.addVolume([332, 330, 327, 2242, 384, 385, 383, 2720, 3171, 2729], 2306)
-    femmesh.addVolume([755, 1071, 173, 720, 3060, 1284, 821, 823, 2735, 819], 2307)
-    femmesh.addVolume([1067, 1024, 1124, 2248, 1415, 1416, 1417, 2286, 2296, 2295], 2308)
-    femmesh.addVolume([262, 265, 267, 2232, 318, 319, 320, 2800, 3504, 3018], 2309)
-    femmesh.addVolume([765, 740, 706, 2241, 840, 956, 955, 2470, 3264, 2468], 2310)
-    femmesh.addVolume([1727, 444, 1656, 2199, 2940, 3551, 1792, 2403, 3186, 3325], 2311)
-    femmesh.addVolume([1681, 437, 1646, 2223, 3552, 3471, 1844, 3046, 3470, 3418], 2312)
-    femmesh.addVolume([743, 708, 2245, 2257, 967, 3329, 3398, 3400, 3553, 2839], 2313)
-    femmesh.addVolume([1021, 1047, 1108, 2214, 1382, 1385, 1386, 2993, 3216, 3030], 2314)
-    femmesh.addVolume([1713, 1673, 1627, 2218, 1962, 2096, 2095, 2474, 2806, 3136], 2315)
-    femmesh.addVolume([1619, 1665, 1690, 2227, 2027, 1975, 2028, 2756, 2890, 2372], 2316)
-    femmesh.addVolume([1723, 1693, 1633, 2252, 2145, 2144, 2140, 3332, 3446, 3206], 2317)
-    femmesh.addVolume([1057, 1116, 442, 2201, 1226, 3554, 3354, 3358, 2742, 3356], 2318)
-    femmesh.addVolume([421, 133, 447, 1640, 613, 611, 615, 3508, 1833, 2972], 2319)
-    femmesh.addVolume([1039, 1061, 1125, 2206, 1544, 1545, 1546, 2758, 3417, 3223], 2320)
-    femmesh.addVolume([1085, 402, 426, 2246, 3240, 533, 3493, 2881, 3241, 3494], 2321)
-    femmesh.addVolume([757, 713, 724, 2250, 1008, 1007, 849, 2464, 2583, 2675], 2322)
-    femmesh.addVolume([1738, 1617, 1737, 2231, 2012, 2011, 2014, 3005, 2549, 2280], 2323)
-    femmesh.addVolume([1103, 438, 2200, 2215, 3520, 3365, 3521, 3555, 3544, 2787], 2324)
-    femmesh.addVolume([444, 418, 1656, 2199, 569, 3203, 3551, 3186, 3326, 3325], 2325)
-    femmesh.addVolume([455, 396, 429, 2258, 663, 667, 581, 2494, 2495, 3154], 2326)
-    femmesh.addVolume([264, 1140, 261, 2202, 3536, 3404, 312, 3537, 3405, 2957], 2327)
-    femmesh.addVolume([1070, 82, 402, 413, 1236, 531, 3239, 3069, 530, 532], 2328)
-    femmesh.addVolume([1639, 721, 2228, 2209, 3290, 3292, 3294, 3502, 3556, 3153], 2329)
-    femmesh.addVolume([1109, 1071, 1050, 2251, 1475, 1289, 1591, 2406, 2738, 2965], 2330)
-    femmesh.addVolume([1633, 1653, 1723, 2235, 2141, 2139, 2140, 3311, 2723, 3333], 2331)
-    femmesh.addVolume([396, 454, 428, 2258, 664, 505, 665, 2495, 2855, 3498], 2332)
-    femmesh.addVolume([1701, 1614, 1665, 2214, 1972, 1976, 1977, 3258, 2611, 2891], 2333)
-    femmesh.addVolume([1738, 2202, 1636, 2225, 3298, 3401, 2163, 3006, 3042, 3402], 2334)
-    femmesh.addVolume([1133, 1065, 742, 2221, 1269, 3467, 3557, 3289, 2903, 3343], 2335)
-    femmesh.addVolume([264, 261, 266, 2202, 312, 313, 314, 3537, 2957, 3116], 2336)
-    femmesh.addVolume([1096, 1119, 1036, 2217, 1525, 1519, 1523, 3302, 2576, 2501], 2337)
-    femmesh.addVolume([1077, 1079, 1027, 2258, 1212, 1449, 1448, 3497, 2870, 2689], 2338)
-    femmesh.addVolume([1714, 1689, 1629, 2217, 2115, 2112, 2108, 2441, 3341, 2556], 2339)
-    femmesh.addVolume([1035, 1120, 1094, 2239, 1511, 1516, 1514, 2816, 3067, 2949], 2340)
-    femmesh.addVolume([1657, 1739, 1618, 2234, 2018, 2019, 2017, 2264, 2663, 2426], 2341)
-    femmesh.addVolume([1025, 1086, 1066, 2234, 1427, 1431, 1430, 2668, 2619, 2415], 2342)
-    femmesh.addVolume([403, 412, 124, 1645, 585, 582, 584, 3295, 2988, 1808], 2343)
-    femmesh.addVolume([1106, 424, 1061, 2206, 3558, 3414, 1191, 3416, 3429, 3417], 2344)
-    femmesh.addVolume([1679, 1657, 1618, 2234, 2016, 2017, 2015, 2788, 2264, 2426], 2345)
-    femmesh.addVolume([1058, 265, 1137, 2231, 3559, 3519, 1171, 3545, 3505, 3482], 2346)
-    femmesh.addVolume([739, 766, 706, 2241, 914, 954, 958, 3288, 2525, 2468], 2347)
-    femmesh.addVolume([1686, 1711, 1628, 2239, 2106, 2100, 2105, 2953, 2700, 2812], 2348)
-    femmesh.addVolume([1081, 1034, 1122, 2218, 1505, 1504, 1507, 2906, 3285, 3004], 2349)
-    femmesh.addVolume([1638, 1720, 1658, 2244, 1949, 2136, 2175, 2409, 2352, 2865], 2350)
-    femmesh.addVolume([1649, 1725, 1717, 2201, 2193, 2004, 2192, 3410, 3134, 3270], 2351)
-    femmesh.addVolume([1123, 1130, 1057, 2201, 1414, 1604, 1603, 3168, 3138, 3358], 2352)
-    femmesh.addVolume([1689, 1683, 1629, 2226, 1815, 2113, 2112, 3432, 3549, 2578], 2353)
-    femmesh.addVolume([765, 1078, 179, 1048, 2545, 1308, 839, 2472, 1309, 1304], 2354)
-    femmesh.addVolume([1703, 1659, 1611, 2213, 1934, 1935, 1933, 2694, 2819, 2489], 2355)
-    femmesh.addVolume([1020, 1099, 1073, 2210, 1366, 1367, 1365, 2422, 2866, 2517], 2356)
-    femmesh.addVolume([1699, 1654, 436, 2206, 1783, 3529, 3560, 3466, 3527, 3528], 2357)
-    femmesh.addVolume([1137, 265, 271, 262, 3519, 311, 3267, 3268, 318, 321], 2358)
-    femmesh.addVolume([1646, 1723, 2243, 2222, 2191, 3561, 3419, 3420, 3522, 3322], 2359)
-    femmesh.addVolume([217, 728, 716, 1661, 879, 880, 881, 1864, 3071, 3007], 2360)
-    femmesh.addVolume([737, 1102, 1110, 2242, 3489, 1328, 3105, 2706, 3491, 3104], 2361)
-    femmesh.addVolume([727, 724, 713, 2250, 1006, 1007, 1005, 2346, 2675, 2583], 2362)
-    femmesh.addVolume([1668, 1640, 421, 2205, 1838, 3508, 2597, 2596, 2974, 2595], 2363)
-    femmesh.addVolume([440, 1089, 70, 1068, 2761, 1196, 488, 3550, 1200, 1198], 2364)
-    femmesh.addVolume([1113, 269, 1140, 2202, 3523, 3403, 1165, 3413, 2682, 3405], 2365)
-    femmesh.addVolume([1696, 1650, 1630, 2221, 1863, 2117, 2116, 3228, 3275, 2452], 2366)
-    femmesh.addVolume([1666, 1692, 2210, 2224, 1957, 2567, 2833, 2733, 2750, 2717], 2367)
-    femmesh.addVolume([400, 419, 409, 2226, 688, 680, 687, 3532, 3460, 3367], 2368)
-    femmesh.addVolume([409, 441, 1090, 2226, 516, 3516, 3511, 3367, 3377, 3369], 2369)
-    femmesh.addVolume([1617, 1660, 1718, 2248, 2007, 2005, 2006, 2385, 2289, 2386], 2370)
-    femmesh.addVolume([766, 1678, 1642, 228, 2565, 1901, 2521, 912, 1899, 1897], 2371)
-    femmesh.addVolume([1044, 1134, 1142, 2247, 1579, 1278, 1580, 3189, 3534, 3428], 2372)
-    femmesh.addVolume([1051, 1099, 1119, 2229, 1593, 1375, 1594, 3257, 2867, 2641], 2373)
-    femmesh.addVolume([1068, 1089, 1032, 2199, 1200, 1492, 1490, 3243, 2376, 2300], 2374)
-    femmesh.addVolume([1117, 1033, 1093, 2241, 1498, 1500, 1501, 2267, 2543, 3072], 2375)
-    femmesh.addVolume([1699, 1632, 1654, 2206, 2131, 2132, 1783, 3466, 2666, 3527], 2376)
-    femmesh.addVolume([1632, 1660, 1719, 2248, 2138, 2009, 2133, 2665, 2289, 3477], 2377)
-    femmesh.addVolume([1704, 1634, 2242, 2249, 2146, 3440, 3130, 3132, 3562, 2709], 2378)
-    femmesh.addVolume([1641, 1663, 1700, 2250, 1907, 2056, 1969, 2345, 2458, 2569], 2379)
-    femmesh.addVolume([428, 403, 429, 2258, 510, 586, 666, 3498, 3531, 3154], 2380)
-    femmesh.addVolume([1685, 1626, 1712, 2241, 2090, 2087, 2091, 3100, 2547, 2274], 2381)
-    femmesh.addVolume([1019, 1112, 1132, 2244, 1359, 1364, 1362, 2588, 2432, 2325], 2382)
-    femmesh.addVolume([267, 265, 263, 2231, 319, 325, 298, 3021, 3505, 3092], 2383)
-    femmesh.addVolume([422, 1100, 2252, 2222, 3547, 3548, 3049, 3512, 3563, 3308], 2384)
-    femmesh.addVolume([1045, 1065, 1133, 2221, 1583, 1269, 1584, 2680, 2903, 3289], 2385)
-    femmesh.addVolume([1682, 219, 753, 1639, 1868, 883, 3317, 1872, 1870, 3291], 2386)
-    femmesh.addVolume([1678, 228, 766, 719, 1899, 912, 2565, 2613, 916, 917], 2387)
-    femmesh.addVolume([415, 75, 1051, 2229, 507, 1213, 3256, 3161, 3564, 3257], 2388)
-    femmesh.addVolume([1733, 1707, 1635, 2232, 1851, 2158, 2153, 3048, 3391, 3249], 2389)
-    femmesh.addVolume([1042, 1114, 1139, 2232, 1566, 1257, 1563, 3250, 3384, 3094], 2390)
-    femmesh.addVolume([1103, 2200, 1037, 2215, 3521, 2883, 1530, 3555, 2787, 3506], 2391)
-    femmesh.addVolume([1026, 1097, 1072, 2227, 1438, 1388, 1435, 2705, 2311, 2942], 2392)
-    femmesh.addVolume([1671, 1621, 1697, 2246, 2048, 2051, 2052, 3238, 3348, 3229], 2393)
-    femmesh.addVolume([442, 78, 1057, 409, 518, 1224, 3354, 519, 514, 3355], 2394)
-    femmesh.addVolume([1100, 1040, 1101, 2252, 1552, 1553, 1254, 3548, 3208, 3456], 2395)
-    femmesh.addVolume([1694, 1633, 1693, 2252, 2143, 2144, 1848, 3394, 3206, 3446], 2396)
-    femmesh.addVolume([217, 716, 1696, 1661, 881, 3227, 1862, 1864, 3007, 1866], 2397)
-    femmesh.addVolume([1138, 1113, 1043, 2202, 1185, 1573, 1570, 3166, 3413, 3232], 2398)
-    femmesh.addVolume([1636, 1708, 1732, 2202, 2164, 1777, 2160, 3401, 3389, 3087], 2399)
-    femmesh.addVolume([1115, 1093, 1033, 2240, 1303, 1500, 1495, 3371, 3075, 2615], 2400)
-    femmesh.addVolume([1140, 264, 1058, 2231, 3536, 3565, 1168, 3484, 3538, 3545], 2401)
-    femmesh.addVolume([1020, 1118, 1081, 2218, 1371, 1372, 1370, 2423, 2488, 2906], 2402)
-    femmesh.addVolume([1638, 1612, 1720, 2244, 1947, 1948, 1949, 2409, 2622, 2352], 2403)
-    femmesh.addVolume([1131, 1018, 1128, 2211, 1342, 1348, 1351, 2774, 2505, 2551], 2404)
-    femmesh.addVolume([1626, 1685, 1709, 2240, 2090, 1895, 2084, 2617, 3102, 3396], 2405)
-    femmesh.addVolume([403, 415, 412, 2229, 509, 684, 585, 3297, 3161, 2990], 2406)
-    femmesh.addVolume([732, 722, 711, 2216, 992, 993, 991, 3000, 3023, 2928], 2407)
-    femmesh.addVolume([1053, 2223, 2243, 2222, 3540, 2699, 3566, 3542, 3421, 3322], 2408)
-    femmesh.addVolume([1054, 1041, 1127, 2249, 1555, 1557, 1394, 3313, 3518, 3435], 2409)
-    femmesh.addVolume([1680, 750, 744, 708, 3328, 931, 3567, 3327, 969, 972], 2410)
-    femmesh.addVolume([1651, 1687, 1620, 2258, 1801, 2034, 2035, 2649, 3194, 2954], 2411)
-    femmesh.addVolume([132, 1669, 414, 1640, 1830, 3196, 606, 1834, 1835, 2971], 2412)
-    femmesh.addVolume([1640, 1690, 1691, 2205, 2180, 1982, 2181, 2974, 2388, 2653], 2413)
-    femmesh.addVolume([1653, 1634, 1722, 2235, 2150, 2148, 2149, 2723, 3441, 3346], 2414)
-    femmesh.addVolume([721, 731, 710, 2228, 964, 981, 982, 3292, 3359, 3423], 2415)
-    femmesh.addVolume([1142, 1141, 1044, 2228, 1582, 1577, 1580, 3426, 2542, 3180], 2416)
-    femmesh.addVolume([721, 731, 2228, 2209, 964, 3359, 3292, 3556, 3361, 3153], 2417)
-    femmesh.addVolume([1689, 445, 1683, 2226, 3372, 3568, 1815, 3432, 3433, 3549], 2418)
-    femmesh.addVolume([1730, 1637, 1740, 2200, 2170, 2169, 2173, 2962, 2484, 2731], 2419)
-    femmesh.addVolume([765, 734, 179, 1078, 843, 841, 839, 2545, 2651, 1308], 2420)
-    femmesh.addVolume([172, 1071, 1092, 720, 1285, 1286, 1279, 818, 2735, 2736], 2421)
-    femmesh.addVolume([1133, 168, 1063, 716, 1267, 1271, 1272, 3336, 807, 2916], 2422)
-    femmesh.addVolume([752, 731, 707, 2209, 817, 963, 962, 3353, 3361, 3147], 2423)
-    femmesh.addVolume([754, 1677, 221, 1664, 3095, 1874, 889, 3096, 1878, 1876], 2424)
-    femmesh.addVolume([1072, 1021, 1108, 2214, 1387, 1386, 1389, 3038, 2993, 3030], 2425)
-    femmesh.addVolume([424, 1106, 450, 2206, 3558, 3415, 484, 3429, 3416, 3082], 2426)
-    femmesh.addVolume([1631, 1698, 2237, 2233, 2123, 3220, 2533, 2534, 3379, 2292], 2427)
-    femmesh.addVolume([1613, 1666, 1692, 2210, 1959, 1957, 1958, 2362, 2833, 2567], 2428)
-    femmesh.addVolume([1732, 435, 115, 405, 3088, 551, 1775, 3150, 556, 555], 2429)
-    femmesh.addVolume([1095, 1118, 1050, 2216, 1509, 1592, 1292, 3024, 2487, 2966], 2430)
-    femmesh.addVolume([173, 1050, 1071, 755, 1288, 1289, 1284, 821, 2963, 3060], 2431)
-    femmesh.addVolume([1688, 1644, 1713, 2216, 1884, 2187, 2099, 2999, 2889, 2435], 2432)
-    femmesh.addVolume([414, 1669, 131, 2246, 3196, 1831, 605, 3488, 3487, 3569], 2433)
-    femmesh.addVolume([1100, 1040, 2252, 2222, 1552, 3208, 3548, 3563, 3535, 3308], 2434)
-    femmesh.addVolume([728, 753, 710, 2247, 885, 983, 985, 3034, 3323, 3424], 2435)
-    femmesh.addVolume([1103, 1037, 1131, 2215, 1530, 1528, 1531, 3555, 3506, 3065], 2436)
-    femmesh.addVolume([1694, 1728, 1633, 2252, 1767, 2142, 2143, 3394, 2896, 3206], 2437)
-    femmesh.addVolume([1040, 1135, 1101, 2252, 1551, 1175, 1553, 3208, 3127, 3456], 2438)
-    femmesh.addVolume([455, 122, 410, 1651, 576, 574, 578, 2648, 1802, 2784], 2439)
-    femmesh.addVolume([718, 738, 750, 2245, 1015, 970, 937, 2980, 2981, 3199], 2440)
-    femmesh.addVolume([1739, 1656, 1740, 2199, 2197, 2198, 2024, 2664, 3325, 2776], 2441)
-    femmesh.addVolume([434, 404, 422, 2222, 625, 700, 637, 3449, 3526, 3512], 2442)
-    femmesh.addVolume([1132, 1112, 1055, 2244, 1364, 1602, 1543, 2325, 2432, 2768], 2443)
-    femmesh.addVolume([1068, 1037, 1103, 2200, 1529, 1530, 1203, 3242, 2883, 3521], 2444)
-    femmesh.addVolume([437, 1693, 1646, 2222, 3524, 1846, 3471, 3472, 3448, 3420], 2445)
-    femmesh.addVolume([1717, 1683, 1649, 2226, 2114, 1818, 2192, 2828, 3549, 3461], 2446)
-    femmesh.addVolume([1067, 1125, 1024, 2248, 1418, 1419, 1415, 2286, 2978, 2296], 2447)
-    femmesh.addVolume([1066, 1086, 1032, 2234, 1431, 1488, 1487, 2415, 2619, 2297], 2448)
-    femmesh.addVolume([1111, 1085, 1049, 2220, 1469, 1235, 1589, 2984, 3148, 2939], 2449)
-    femmesh.addVolume([1719, 1617, 1738, 2225, 2008, 2012, 2013, 3478, 2631, 3006], 2450)
-    femmesh.addVolume([1696, 716, 741, 2221, 3227, 882, 3517, 3228, 2918, 3286], 2451)
-    femmesh.addVolume([419, 1649, 1683, 2226, 3406, 1818, 3570, 3460, 3461, 3549], 2452)
-    femmesh.addVolume([1741, 1681, 1646, 2223, 2033, 1844, 2190, 2747, 3046, 3418], 2453)
-    femmesh.addVolume([1077, 1027, 1099, 2229, 1448, 1447, 1450, 3500, 3195, 2867], 2454)
-    femmesh.addVolume([1710, 1725, 1649, 2201, 2107, 2193, 1820, 2716, 3134, 3410], 2455)
-    femmesh.addVolume([1130, 1116, 1057, 2201, 1517, 1226, 1604, 3138, 2742, 3358], 2456)
-    femmesh.addVolume([1041, 1054, 1110, 2249, 1555, 1326, 1556, 3518, 3313, 3106], 2457)
-    femmesh.addVolume([221, 733, 754, 1664, 893, 894, 889, 1876, 2920, 3096], 2458)
-    femmesh.addVolume([1135, 326, 329, 334, 3125, 379, 3385, 3126, 380, 371], 2459)
-    femmesh.addVolume([1022, 1127, 1129, 2235, 1395, 1402, 1403, 3179, 3434, 3305], 2460)
-    femmesh.addVolume([1654, 1636, 1732, 2225, 2161, 2160, 1780, 3481, 3402, 3090], 2461)
-    femmesh.addVolume([1039, 1055, 1106, 2206, 1540, 1194, 1541, 2758, 2851, 3416], 2462)
-    femmesh.addVolume([1724, 1612, 1721, 2204, 1954, 1951, 1956, 3192, 2621, 2260], 2463)
-    femmesh.addVolume([443, 84, 406, 1075, 534, 538, 539, 3157, 1242, 2657], 2464)
-    femmesh.addVolume([1681, 394, 437, 2223, 3109, 620, 3552, 3046, 2934, 3470], 2465)
-    femmesh.addVolume([417, 396, 410, 2215, 662, 661, 659, 3331, 2497, 2678], 2466)
-    femmesh.addVolume([1049, 1085, 426, 2220, 1235, 3493, 3571, 2939, 3148, 3492], 2467)
-    femmesh.addVolume([1149, 2243, 1053, 2223, 2541, 3566, 1600, 2698, 2699, 3540], 2468)
-    femmesh.addVolume([1672, 1715, 1725, 2256, 2089, 2001, 2102, 2399, 2453, 3133], 2469)
-    femmesh.addVolume([1092, 752, 172, 720, 3351, 816, 1279, 2736, 820, 818], 2470)
-    femmesh.addVolume([1121, 1080, 1130, 2256, 1499, 1513, 1410, 2450, 2395, 3137], 2471)
-    femmesh.addVolume([1625, 1661, 1679, 2203, 2081, 2080, 2077, 3045, 3008, 2854], 2472)
-    femmesh.addVolume([425, 437, 2223, 2222, 652, 3470, 3469, 3543, 3472, 3421], 2473)
-    femmesh.addVolume([439, 120, 418, 1730, 570, 568, 572, 2958, 1794, 3202], 2474)
-    femmesh.addVolume([1022, 1054, 1127, 2249, 1393, 1394, 1395, 3013, 3313, 3435], 2475)
-    femmesh.addVolume([1070, 1107, 1046, 2236, 1465, 1380, 1241, 2907, 2871, 2868], 2476)
-    femmesh.addVolume([16, 1652, 267, 263, 1759, 3054, 297, 293, 3091, 298], 2477)
-    femmesh.addVolume([743, 708, 738, 2245, 967, 968, 858, 3398, 3329, 2981], 2478)
-    femmesh.addVolume([1656, 418, 120, 1730, 3203, 568, 1790, 1795, 3202, 1794], 2479)
-    femmesh.addVolume([220, 721, 1639, 2209, 886, 3290, 1871, 3572, 3556, 3502], 2480)
-    femmesh.addVolume([1074, 1098, 2238, 2207, 1391, 2792, 2976, 2977, 3475, 2625], 2481)
-    femmesh.addVolume([415, 403, 75, 2229, 509, 508, 507, 3161, 3297, 3564], 2482)
-    femmesh.addVolume([1668, 133, 421, 1640, 1837, 613, 2597, 1838, 1833, 3508], 2483)
-    femmesh.addVolume([1118, 1034, 1081, 2218, 1506, 1505, 1372, 2488, 3285, 2906], 2484)
-    femmesh.addVolume([263, 264, 266, 2231, 324, 314, 295, 3092, 3538, 3119], 2485)
-    femmesh.addVolume([1735, 1742, 1611, 2211, 1944, 1941, 1937, 2603, 3084, 2365], 2486)
-    femmesh.addVolume([1142, 1059, 1141, 2228, 1283, 1607, 1582, 3426, 2923, 2542], 2487)
-    femmesh.addVolume([1675, 1666, 1623, 2224, 2038, 2066, 2065, 3183, 2733, 2687], 2488)
-    femmesh.addVolume([418, 119, 444, 1656, 567, 565, 569, 3203, 1791, 3551], 2489)
-    femmesh.addVolume([1660, 1617, 1719, 2248, 2007, 2008, 2009, 2289, 2385, 3477], 2490)
-    femmesh.addVolume([1045, 1019, 1126, 2204, 1353, 1356, 1357, 2679, 2587, 2564], 2491)
-    femmesh.addVolume([406, 421, 401, 2205, 649, 694, 693, 2658, 2595, 3080], 2492)
-    femmesh.addVolume([446, 1649, 127, 419, 3407, 1819, 593, 595, 3406, 591], 2493)
-    femmesh.addVolume([1087, 738, 1054, 2245, 3573, 3438, 1325, 3191, 2981, 3314], 2494)
-    femmesh.addVolume([1105, 1038, 1062, 2237, 1533, 1532, 1263, 3247, 2412, 2850], 2495)
-    femmesh.addVolume([764, 1139, 164, 736, 3574, 1255, 792, 794, 3093, 790], 2496)
-    femmesh.addVolume([1139, 764, 1062, 736, 3574, 2994, 1260, 3093, 794, 2849], 2497)
-    femmesh.addVolume([1077, 1051, 75, 2229, 1215, 1213, 1211, 3500, 3257, 3564], 2498)
-    femmesh.addVolume([451, 86, 425, 1088, 540, 544, 545, 3276, 1246, 3468], 2499)
-    femmesh.addVolume([1077, 403, 428, 2229, 3575, 510, 3499, 3500, 3297, 3501], 2500)
-    femmesh.addVolume([1736, 1615, 1647, 2249, 1987, 1985, 1986, 2876, 3123, 3334], 2501)
-    femmesh.addVolume([1077, 75, 403, 2229, 1211, 508, 3575, 3500, 3564, 3297], 2502)
-    femmesh.addVolume([220, 1639, 1677, 2209, 1871, 1875, 1873, 3572, 3502, 2987], 2503)
-    femmesh.addVolume([1733, 735, 763, 213, 3047, 868, 3576, 1850, 863, 867], 2504)
-    femmesh.addVolume([725, 1063, 168, 716, 3037, 1271, 804, 806, 2916, 807], 2505)
-    femmesh.addVolume([1703, 1625, 1659, 2213, 2079, 2078, 1934, 2694, 2898, 2819], 2506)
-    femmesh.addVolume([1654, 405, 436, 2225, 3480, 557, 3529, 3481, 3151, 3530], 2507)
-    femmesh.addVolume([759, 1648, 225, 729, 3210, 1891, 901, 906, 3182, 905], 2508)
-    femmesh.addVolume([83, 413, 1070, 443, 529, 3069, 1237, 535, 536, 3378], 2509)
-    femmesh.addVolume([1122, 1023, 1123, 2255, 1408, 1412, 1413, 2840, 2337, 2696], 2510)
-    femmesh.addVolume([1717, 1616, 1716, 2255, 2003, 1999, 2002, 2827, 2332, 2795], 2511)
-    femmesh.addVolume([265, 1058, 264, 2231, 3559, 3565, 310, 3505, 3545, 3538], 2512)
-    femmesh.addVolume([741, 742, 709, 2221, 978, 979, 980, 3286, 3343, 2763], 2513)
-    femmesh.addVolume([1679, 1661, 1630, 2203, 2080, 2122, 2120, 2854, 3008, 3231], 2514)
-    femmesh.addVolume([398, 440, 408, 2199, 678, 493, 676, 2394, 3248, 3430], 2515)
-    femmesh.addVolume([715, 1662, 744, 2257, 3476, 3577, 928, 2417, 3474, 3578], 2516)
-    femmesh.addVolume([1059, 171, 752, 731, 1281, 815, 3352, 3360, 813, 817], 2517)
-    femmesh.addVolume([1106, 1061, 1039, 2206, 1191, 1544, 1541, 3416, 3417, 2758], 2518)
-    femmesh.addVolume([1093, 177, 717, 1115, 1302, 836, 3074, 1303, 1296, 3370], 2519)
-    femmesh.addVolume([444, 119, 1727, 1656, 565, 1787, 2940, 3551, 1791, 1792], 2520)
-    femmesh.addVolume([739, 740, 717, 2241, 957, 837, 911, 3288, 3264, 3073], 2521)
-    femmesh.addVolume([1698, 1655, 1631, 2237, 1857, 2127, 2123, 3220, 2809, 2533], 2522)
-    femmesh.addVolume([1722, 1723, 1653, 2235, 1993, 2139, 2149, 3346, 3333, 2723], 2523)
-    femmesh.addVolume([429, 396, 428, 2258, 667, 665, 666, 3154, 2495, 3498], 2524)
-    femmesh.addVolume([1040, 1129, 1060, 2235, 1549, 1550, 1548, 3319, 3305, 3320], 2525)
-    femmesh.addVolume([723, 730, 709, 2233, 973, 974, 975, 3253, 3254, 2765], 2526)
-    femmesh.addVolume([716, 1133, 742, 2221, 3336, 3557, 808, 2918, 3289, 3343], 2527)
-    femmesh.addVolume([427, 453, 393, 2220, 604, 643, 647, 3442, 2862, 3059], 2528)
-    femmesh.addVolume([1133, 1147, 1045, 2221, 1586, 1585, 1584, 3289, 2704, 2680], 2529)
-    femmesh.addVolume([729, 717, 726, 2240, 909, 835, 999, 3063, 3076, 3145], 2530)
-    femmesh.addVolume([1655, 735, 763, 1733, 2808, 868, 2991, 1854, 3047, 3576], 2531)
-    femmesh.addVolume([71, 438, 408, 1068, 495, 496, 491, 1199, 3362, 3363], 2532)
-    femmesh.addVolume([69, 1055, 1089, 420, 1193, 1197, 1195, 485, 2767, 2491], 2533)
-    femmesh.addVolume([1026, 1149, 1088, 2223, 1442, 1443, 1440, 3039, 2698, 3279], 2534)
-    femmesh.addVolume([1118, 1095, 1034, 2216, 1509, 1508, 1506, 2487, 3024, 3316], 2535)
-    femmesh.addVolume([1713, 1627, 1688, 2216, 2095, 2098, 2099, 2435, 3214, 2999], 2536)
-    femmesh.addVolume([1716, 1648, 1627, 2219, 1998, 2093, 2094, 2793, 2910, 3135], 2537)
-    femmesh.addVolume([1147, 1148, 1025, 2203, 1434, 1428, 1433, 2703, 3187, 2667], 2538)
-    femmesh.addVolume([453, 1686, 129, 411, 2952, 1821, 599, 601, 3098, 597], 2539)
-    femmesh.addVolume([1089, 440, 69, 420, 2761, 489, 1195, 2491, 490, 485], 2540)
-    femmesh.addVolume([226, 1709, 1685, 717, 1889, 1895, 1893, 910, 3395, 3101], 2541)
-    femmesh.addVolume([450, 1055, 68, 420, 3081, 1192, 482, 487, 2767, 486], 2542)
-    femmesh.addVolume([754, 721, 220, 2209, 891, 886, 890, 3097, 3556, 3572], 2543)
-    femmesh.addVolume([726, 176, 756, 1056, 830, 828, 832, 3273, 1298, 3338], 2544)
-    femmesh.addVolume([1682, 728, 218, 1661, 3226, 878, 1867, 1869, 3071, 1865], 2545)
-    femmesh.addVolume([16, 1731, 267, 1652, 1761, 3020, 297, 1759, 1763, 3054], 2546)
-    femmesh.addVolume([407, 1658, 117, 397, 2864, 1785, 559, 562, 2930, 561], 2547)
-    femmesh.addVolume([452, 1049, 426, 2220, 2935, 3571, 528, 2938, 2939, 3492], 2548)
-    femmesh.addVolume([1057, 78, 1090, 409, 1224, 1220, 1225, 3355, 514, 3511], 2549)
-    femmesh.addVolume([1652, 1738, 1737, 2231, 2196, 2014, 2195, 3055, 3005, 2280], 2550)
-    femmesh.addVolume([220, 1677, 754, 2209, 1873, 3095, 890, 3572, 2987, 3097], 2551)
-    femmesh.addVolume([1114, 1042, 1137, 2232, 1566, 1567, 1172, 3384, 3250, 3269], 2552)
-    femmesh.addVolume([1635, 1707, 1731, 2232, 2158, 1764, 2157, 3249, 3391, 3019], 2553)
-    femmesh.addVolume([1739, 1727, 1656, 2199, 2177, 1792, 2197, 2664, 2403, 3325], 2554)
-    femmesh.addVolume([1134, 1063, 725, 2247, 1275, 3037, 3579, 3534, 3129, 3035], 2555)
-    femmesh.addVolume([419, 1683, 445, 2226, 3570, 3568, 592, 3460, 3549, 3433], 2556)
-    femmesh.addVolume([1104, 1028, 1083, 2207, 1460, 1455, 1336, 2592, 3262, 2593], 2557)
-    femmesh.addVolume([131, 1669, 1671, 2246, 1831, 1832, 1827, 3569, 3487, 3238], 2558)
-    femmesh.addVolume([1113, 1140, 1043, 2202, 1165, 1574, 1573, 3413, 3405, 3232], 2559)
-    femmesh.addVolume([1734, 1708, 1636, 2202, 1757, 2164, 2165, 3115, 3389, 3401], 2560)
-    femmesh.addVolume([767, 730, 1698, 2233, 874, 3218, 3580, 3234, 3254, 3379], 2561)
-    femmesh.addVolume([743, 738, 1087, 2245, 858, 3573, 3479, 3398, 2981, 3191], 2562)
-    femmesh.addVolume([750, 1647, 1704, 718, 3381, 1918, 3581, 937, 3380, 3131], 2563)
-    femmesh.addVolume([1693, 1723, 1646, 2222, 2145, 2191, 1846, 3448, 3522, 3420], 2564)
-    femmesh.addVolume([1076, 1047, 1098, 2250, 1315, 1384, 1459, 2465, 2676, 2790], 2565)
-    femmesh.addVolume([1083, 1074, 1029, 2207, 1454, 1466, 1467, 2593, 2977, 2825], 2566)
-    femmesh.addVolume([1686, 129, 1643, 453, 1821, 1825, 1826, 2952, 599, 2858], 2567)
-    femmesh.addVolume([272, 24, 762, 270, 301, 781, 2478, 303, 282, 2477], 2568)
-    femmesh.addVolume([762, 746, 23, 272, 783, 772, 782, 2478, 3582, 300], 2569)
-    femmesh.addVolume([337, 52, 335, 761, 365, 347, 368, 2445, 786, 2446], 2570)
-    femmesh.addVolume([739, 706, 740, 2241, 958, 956, 957, 3288, 2468, 3264], 2571)
-    femmesh.addVolume([1648, 1715, 1626, 2240, 1996, 2086, 2085, 2844, 2454, 2617], 2572)
-    femmesh.addVolume([1056, 1033, 1121, 2240, 1494, 1496, 1406, 3176, 2615, 2451], 2573)
-    femmesh.addVolume([1146, 1145, 1024, 2231, 1424, 1420, 1423, 2744, 2317, 2430], 2574)
-    femmesh.addVolume([451, 425, 394, 2223, 545, 651, 650, 3278, 3469, 2934], 2575)
-    femmesh.addVolume([1726, 410, 122, 1651, 3281, 574, 1796, 1803, 2784, 1802], 2576)
-    femmesh.addVolume([1662, 1680, 744, 2257, 1913, 3567, 3577, 3474, 3044, 3578], 2577)
-    femmesh.addVolume([338, 448, 37, 433, 2356, 473, 351, 3583, 474, 465], 2578)
-    femmesh.addVolume([757, 724, 181, 1076, 849, 847, 845, 2463, 3387, 1310], 2579)
-    femmesh.addVolume([51, 761, 337, 748, 785, 2445, 366, 779, 787, 3584], 2580)
-    femmesh.addVolume([1728, 331, 43, 1653, 2892, 356, 1765, 1770, 2893, 1769], 2581)
-    femmesh.addVolume([753, 728, 218, 1682, 885, 878, 884, 3317, 3226, 1867], 2582)
-    femmesh.addVolume([1049, 80, 1094, 452, 1230, 1228, 1232, 2935, 524, 2948], 2583)
-    femmesh.addVolume([452, 80, 1094, 416, 524, 1228, 2948, 525, 520, 3143], 2584)
-    femmesh.addVolume([1722, 1634, 1647, 2249, 2148, 2147, 1984, 3347, 3562, 3334], 2585)
-    femmesh.addVolume([743, 744, 708, 2257, 971, 972, 967, 3400, 3578, 3553], 2586)
-    femmesh.addVolume([1621, 1671, 1669, 2246, 2048, 1832, 2049, 3348, 3238, 3487], 2587)
-    femmesh.addVolume([1041, 1060, 1127, 2235, 1558, 1559, 1557, 3261, 3320, 3434], 2588)
-    femmesh.addVolume([767, 1698, 1650, 2233, 3580, 1860, 3300, 3234, 3379, 3301], 2589)
-    femmesh.addVolume([1648, 225, 1684, 759, 1891, 1886, 1890, 3210, 901, 3312], 2590)
-    femmesh.addVolume([1634, 1695, 1704, 2242, 2152, 1920, 2146, 3440, 3453, 3130], 2591)
-    femmesh.addVolume([1110, 1102, 1041, 2242, 1328, 1561, 1556, 3104, 3491, 3260], 2592)
-    femmesh.addVolume([1640, 1668, 1690, 2205, 1838, 2031, 2180, 2974, 2596, 2388], 2593)
-    femmesh.addVolume([1095, 755, 174, 722, 3411, 822, 1291, 3025, 826, 824], 2594)
-    femmesh.addVolume([1115, 176, 726, 1056, 1297, 830, 3473, 1300, 1298, 3273], 2595)
-    femmesh.addVolume([1666, 1620, 1692, 2224, 2040, 2041, 1957, 2733, 2955, 2750], 2596)
-    femmesh.addVolume([1699, 117, 1658, 397, 1781, 1785, 1786, 3465, 561, 2930], 2597)
-    femmesh.addVolume([225, 1648, 1709, 729, 1891, 1892, 1888, 905, 3182, 3445], 2598)
-    femmesh.addVolume([409, 399, 441, 2226, 679, 682, 516, 3367, 3507, 3377], 2599)
-    femmesh.addVolume([177, 717, 740, 1093, 836, 837, 833, 1302, 3074, 3263], 2600)
-    femmesh.addVolume([264, 269, 261, 1140, 306, 315, 312, 3536, 3403, 3404], 2601)
-    femmesh.addVolume([1085, 81, 1049, 426, 1233, 1231, 1235, 3493, 527, 3571], 2602)
-    femmesh.addVolume([447, 401, 421, 2205, 699, 694, 615, 2973, 3080, 2595], 2603)
-    femmesh.addVolume([1663, 230, 760, 727, 1903, 918, 2457, 3342, 922, 923], 2604)
-    femmesh.addVolume([425, 86, 1053, 1088, 544, 1250, 3541, 3468, 1246, 1251], 2605)
-    femmesh.addVolume([1091, 756, 176, 1056, 3368, 828, 1293, 1299, 3338, 1298], 2606)
-    femmesh.addVolume([265, 264, 263, 2231, 310, 324, 325, 3505, 3538, 3092], 2607)
-    femmesh.addVolume([43, 331, 328, 1653, 356, 360, 358, 1769, 2893, 2798], 2608)
-    femmesh.addVolume([1134, 725, 751, 2247, 3579, 811, 3533, 3534, 3035, 3437], 2609)
-    femmesh.addVolume([181, 724, 1047, 1076, 847, 2673, 1314, 1310, 3387, 1315], 2610)
-    femmesh.addVolume([1641, 230, 1663, 727, 1905, 1903, 1907, 2347, 922, 3342], 2611)
-    femmesh.addVolume([115, 1654, 1732, 405, 1779, 1780, 1775, 555, 3480, 3150], 2612)
-    femmesh.addVolume([1699, 436, 397, 2206, 3560, 563, 3465, 3466, 3528, 2932], 2613)
-    femmesh.addVolume([1063, 169, 1134, 725, 1270, 1274, 1275, 3037, 805, 3579], 2614)
-    femmesh.addVolume([1079, 74, 428, 1077, 1208, 504, 3510, 1212, 1210, 3499], 2615)
-    femmesh.addVolume([263, 15, 1652, 266, 294, 1758, 3091, 295, 290, 3167], 2616)
-    femmesh.addVolume([82, 1085, 402, 426, 1234, 3240, 531, 526, 3493, 533], 2617)
-    femmesh.addVolume([768, 167, 1065, 742, 799, 1264, 2902, 803, 801, 3467], 2618)
-    femmesh.addVolume([1704, 1647, 1634, 2249, 1918, 2147, 2146, 3132, 3334, 3562], 2619)
-    femmesh.addVolume([1685, 739, 226, 717, 3287, 908, 1893, 3101, 911, 910], 2620)
-    femmesh.addVolume([1684, 1627, 1648, 2219, 2092, 2093, 1890, 3185, 3135, 2910], 2621)
-    femmesh.addVolume([130, 1671, 1643, 427, 1828, 1829, 1824, 602, 3462, 3443], 2622)
-    femmesh.addVolume([1062, 1038, 1124, 2237, 1532, 1534, 1535, 2850, 2412, 2293], 2623)
-    femmesh.addVolume([438, 417, 395, 2215, 499, 658, 656, 3544, 3331, 3310], 2624)
-    femmesh.addVolume([1689, 125, 412, 1645, 1811, 583, 3340, 1812, 1807, 2988], 2625)
-    femmesh.addVolume([429, 403, 124, 1670, 586, 584, 580, 3155, 3296, 1804], 2626)
-    femmesh.addVolume([424, 450, 397, 2206, 484, 670, 671, 3429, 3082, 2932], 2627)
-    femmesh.addVolume([414, 131, 402, 2246, 605, 607, 608, 3488, 3569, 3241], 2628)
-    femmesh.addVolume([66, 1138, 1061, 423, 1184, 1188, 1186, 476, 3162, 3163], 2629)
-    femmesh.addVolume([164, 1062, 1139, 764, 1259, 1260, 1255, 792, 2994, 3574], 2630)
-    femmesh.addVolume([454, 74, 428, 1079, 500, 504, 505, 2950, 1208, 3510], 2631)
-    femmesh.addVolume([398, 418, 444, 2199, 677, 569, 675, 2394, 3326, 3186], 2632)
-    femmesh.addVolume([428, 75, 403, 1077, 503, 508, 510, 3499, 1211, 3575], 2633)
-    femmesh.addVolume([1075, 443, 84, 1046, 3157, 534, 1242, 1244, 3217, 1240], 2634)
-    femmesh.addVolume([1671, 427, 131, 2246, 3462, 603, 1827, 3238, 3444, 3569], 2635)
-    femmesh.addVolume([443, 1070, 83, 1046, 3378, 1237, 535, 3217, 1241, 1239], 2636)
-    femmesh.addVolume([767, 709, 730, 2233, 977, 974, 874, 3234, 2765, 3254], 2637)
-    femmesh.addVolume([1723, 1615, 1741, 2243, 1992, 1991, 1994, 3561, 3122, 2532], 2638)
-    femmesh.addVolume([1149, 1022, 1129, 2243, 1400, 1403, 1404, 2541, 3107, 3321], 2639)
-    femmesh.addVolume([128, 1686, 1710, 411, 1822, 1823, 1816, 596, 3098, 2711], 2640)
-    femmesh.addVolume([1056, 1122, 1034, 2219, 1409, 1504, 1502, 3272, 2841, 3284], 2641)
-    femmesh.addVolume([1051, 76, 415, 1096, 1214, 506, 3256, 1218, 1216, 3318], 2642)
-    femmesh.addVolume([1658, 118, 1727, 407, 1784, 1788, 1789, 2864, 560, 2475], 2643)
-    femmesh.addVolume([752, 1059, 1092, 171, 3352, 1282, 3351, 815, 1281, 1280], 2644)
-    femmesh.addVolume([1624, 1662, 1701, 2257, 2070, 2071, 2072, 3175, 3474, 3259], 2645)
-    femmesh.addVolume([1650, 767, 741, 216, 3300, 877, 3299, 1859, 872, 876], 2646)
-    femmesh.addVolume([1639, 1705, 1677, 2209, 2178, 2068, 1875, 3502, 3152, 2987], 2647)
-    femmesh.addVolume([707, 731, 721, 2209, 963, 964, 965, 3147, 3361, 3556], 2648)
-    femmesh.addVolume([1626, 1709, 1648, 2240, 2084, 1892, 2085, 2617, 3396, 2844], 2649)
-    femmesh.addVolume([1056, 1115, 1033, 2240, 1300, 1495, 1494, 3176, 3371, 2615], 2650)
-    femmesh.addVolume([1710, 446, 128, 411, 3546, 594, 1816, 2711, 598, 596], 2651)
-    femmesh.addVolume([1090, 77, 441, 409, 1219, 511, 3516, 3511, 515, 516], 2652)
-    femmesh.addVolume([1647, 1615, 1722, 2249, 1985, 1983, 1984, 3334, 3123, 3347], 2653)
-    femmesh.addVolume([423, 1061, 66, 424, 3163, 1186, 476, 481, 3414, 480], 2654)
-    femmesh.addVolume([417, 410, 395, 2215, 659, 657, 658, 3331, 2678, 3310], 2655)
-    femmesh.addVolume([1733, 763, 1655, 213, 3576, 2991, 1854, 1850, 867, 1852], 2656)
-    femmesh.addVolume([125, 1689, 412, 445, 1811, 3340, 583, 587, 3372, 589], 2657)
-    femmesh.addVolume([175, 722, 756, 1091, 825, 829, 827, 1294, 3212, 3368], 2658)
-    femmesh.addVolume([708, 750, 738, 2245, 969, 970, 968, 3329, 3199, 2981], 2659)
-    femmesh.addVolume([169, 751, 1134, 725, 809, 3533, 1274, 805, 811, 3579], 2660)
-    femmesh.addVolume([1734, 1652, 15, 266, 1760, 1758, 1756, 3117, 3167, 290], 2661)
-    femmesh.addVolume([223, 732, 758, 1688, 899, 900, 895, 1882, 2998, 3439], 2662)
-    femmesh.addVolume([435, 1732, 114, 430, 3088, 1776, 550, 552, 3222, 458], 2663)
-    femmesh.addVolume([1129, 1040, 1100, 2222, 1549, 1552, 1554, 3306, 3535, 3563], 2664)
-    femmesh.addVolume([1719, 1654, 1632, 2225, 2134, 2132, 2133, 3478, 3481, 3422], 2665)
-    femmesh.addVolume([1053, 1100, 425, 2222, 1252, 3585, 3541, 3542, 3563, 3543], 2666)
-    femmesh.addVolume([178, 1093, 740, 1048, 1301, 3263, 834, 1305, 1306, 3496], 2667)
-    femmesh.addVolume([1624, 1680, 1662, 2257, 2069, 1913, 2070, 3175, 3044, 3474], 2668)
-    femmesh.addVolume([175, 1095, 722, 1091, 1290, 3025, 825, 1294, 1295, 3212], 2669)
-    femmesh.addVolume([1150, 73, 454, 1079, 1205, 501, 3265, 1209, 1207, 2950], 2670)
-    femmesh.addVolume([426, 427, 2220, 2246, 646, 3442, 3492, 3494, 3444, 3149], 2671)
-    femmesh.addVolume([1698, 763, 730, 214, 3219, 871, 3218, 1855, 866, 870], 2672)
-    femmesh.addVolume([1129, 1053, 2243, 2222, 1601, 3566, 3321, 3306, 3542, 3322], 2673)
-    femmesh.addVolume([1103, 417, 438, 2215, 3586, 499, 3520, 3555, 3331, 3544], 2674)
-    femmesh.addVolume([1620, 1675, 1742, 2224, 2039, 1942, 2036, 2955, 3183, 3085], 2675)
-    femmesh.addVolume([744, 231, 1662, 715, 925, 1908, 3577, 928, 927, 3476], 2676)
-    femmesh.addVolume([1642, 227, 1685, 739, 1896, 1894, 1898, 3509, 907, 3287], 2677)
-    femmesh.addVolume([1127, 1060, 1129, 2235, 1559, 1550, 1402, 3434, 3320, 3305], 2678)
-    femmesh.addVolume([729, 1709, 226, 717, 3445, 1889, 904, 909, 3395, 910], 2679)
-    femmesh.addVolume([437, 394, 425, 2223, 620, 651, 652, 3470, 2934, 3469], 2680)
-    femmesh.addVolume([737, 1102, 748, 186, 3489, 3490, 862, 860, 1162, 780], 2681)
-    femmesh.addVolume([1065, 167, 1133, 742, 1264, 1268, 1269, 3467, 801, 3557], 2682)
-    femmesh.addVolume([740, 765, 178, 1048, 840, 838, 834, 3496, 2472, 1305], 2683)
-    femmesh.addVolume([1631, 1655, 1718, 2237, 2127, 2128, 2129, 2533, 2809, 2384], 2684)
-    femmesh.addVolume([717, 177, 726, 1115, 836, 831, 835, 3370, 1296, 3473], 2685)
-    femmesh.addVolume([764, 165, 1105, 723, 793, 1262, 3244, 797, 795, 3245], 2686)
-    femmesh.addVolume([122, 1651, 455, 1687, 1802, 2648, 576, 1800, 1801, 3193], 2687)
-    femmesh.addVolume([88, 433, 422, 1101, 467, 549, 546, 1159, 3454, 3455], 2688)
-    femmesh.addVolume([441, 415, 76, 1096, 513, 506, 512, 3349, 3318, 1216], 2689)
-    femmesh.addVolume([171, 1059, 1142, 731, 1281, 1283, 1276, 813, 3360, 3425], 2690)
-    femmesh.addVolume([1069, 743, 715, 182, 3399, 854, 2829, 1317, 850, 853], 2691)
-    femmesh.addVolume([1738, 1636, 1654, 2225, 2163, 2161, 2162, 3006, 3402, 3481], 2692)
-    femmesh.addVolume([1729, 1695, 1634, 2242, 1774, 2152, 2151, 2760, 3453, 3440], 2693)
-    femmesh.addVolume([1041, 1102, 1136, 2242, 1561, 1182, 1560, 3260, 3491, 3112], 2694)
-    femmesh.addVolume([333, 331, 42, 1728, 357, 355, 341, 3252, 2892, 1766], 2695)
-    femmesh.addVolume([452, 1049, 81, 426, 2935, 1231, 523, 528, 3571, 527], 2696)
-    femmesh.addVolume([1134, 1148, 1063, 2247, 1581, 1609, 1275, 3534, 3190, 3129], 2697)
-    femmesh.addVolume([227, 1642, 766, 739, 1896, 2521, 913, 907, 3509, 914], 2698)
-    femmesh.addVolume([1131, 1052, 1103, 2215, 1599, 1598, 1531, 3065, 2781, 3555], 2699)
-    femmesh.addVolume([1150, 417, 1103, 2215, 3330, 3586, 1206, 3266, 3331, 3555], 2700)
-    femmesh.addVolume([1055, 68, 1106, 450, 1192, 1190, 1194, 3081, 482, 3415], 2701)
-    femmesh.addVolume([1021, 1074, 1098, 2238, 1390, 1391, 1383, 2753, 2976, 2792], 2702)
-    femmesh.addVolume([1074, 1021, 1107, 2238, 1390, 1381, 1392, 2976, 2753, 2872], 2703)
-    femmesh.addVolume([121, 439, 410, 1726, 571, 575, 573, 1797, 2959, 3281], 2704)
-    femmesh.addVolume([444, 1727, 118, 407, 2940, 1788, 564, 566, 2475, 560], 2705)
-    femmesh.addVolume([1719, 1738, 1654, 2225, 2013, 2162, 2134, 3478, 3006, 3481], 2706)
-    femmesh.addVolume([728, 710, 725, 2247, 985, 986, 984, 3034, 3424, 3035], 2707)
-    femmesh.addVolume([1650, 741, 1696, 216, 3299, 3517, 1863, 1859, 876, 1861], 2708)
-    femmesh.addVolume([419, 445, 399, 2226, 592, 686, 681, 3460, 3433, 3507], 2709)
-    femmesh.addVolume([127, 1649, 1683, 419, 1819, 1818, 1813, 591, 3406, 3570], 2710)
-    femmesh.addVolume([1643, 453, 130, 427, 2858, 600, 1824, 3443, 604, 602], 2711)
-    femmesh.addVolume([1034, 1091, 1056, 2219, 1503, 1299, 1502, 3284, 3213, 3272], 2712)
-    femmesh.addVolume([445, 126, 1683, 419, 588, 1814, 3568, 592, 590, 3570], 2713)
-    femmesh.addVolume([1068, 71, 438, 1103, 1199, 495, 3362, 1203, 1201, 3520], 2714)
-    femmesh.addVolume([1053, 1149, 1129, 2243, 1600, 1404, 1601, 3566, 2541, 3321], 2715)
-    femmesh.addVolume([1741, 1646, 1723, 2243, 2190, 2191, 1994, 2532, 3419, 3561], 2716)
-    femmesh.addVolume([742, 168, 1133, 716, 802, 1267, 3557, 808, 807, 3336], 2717)
-    femmesh.addVolume([425, 1100, 422, 2222, 3585, 3547, 548, 3543, 3563, 3512], 2718)
-    femmesh.addVolume([454, 417, 73, 1150, 502, 497, 501, 3265, 3330, 1205], 2719)
-    femmesh.addVolume([1733, 745, 735, 212, 3315, 865, 3047, 1849, 771, 864], 2720)
-    femmesh.addVolume([1724, 1650, 1631, 2233, 2126, 2124, 2125, 3539, 3301, 2534], 2721)
-    femmesh.addVolume([184, 1087, 738, 1054, 1319, 3573, 856, 1324, 1325, 3438], 2722)
-    femmesh.addVolume([67, 1061, 1106, 424, 1187, 1191, 1189, 479, 3414, 3558], 2723)
-    femmesh.addVolume([1116, 1094, 79, 416, 1229, 1227, 1223, 2739, 3143, 521], 2724)
-    femmesh.addVolume([398, 408, 418, 2199, 676, 655, 677, 2394, 3430, 3326], 2725)
-    femmesh.addVolume([424, 397, 436, 2206, 671, 563, 672, 3429, 2932, 3528], 2726)
-    femmesh.addVolume([736, 1139, 163, 746, 3093, 1256, 789, 791, 3337, 774], 2727)
-    femmesh.addVolume([1143, 1087, 1054, 2245, 1486, 1325, 1397, 3066, 3191, 3314], 2728)
-    femmesh.addVolume([114, 1732, 1708, 430, 1776, 1777, 1745, 458, 3222, 3388], 2729)
-    femmesh.addVolume([404, 437, 425, 2222, 626, 652, 701, 3526, 3472, 3543], 2730)
-    femmesh.addVolume([79, 442, 1116, 416, 517, 3554, 1223, 521, 522, 2739], 2731)
-    femmesh.addVolume([1028, 1098, 1074, 2207, 1456, 1391, 1453, 3262, 3475, 2977], 2732)
-    femmesh.addVolume([1145, 1146, 1058, 2231, 1424, 1606, 1605, 2317, 2744, 3545], 2733)
-    femmesh.addVolume([131, 427, 402, 2246, 603, 609, 607, 3569, 3444, 3241], 2734)
-    femmesh.addVolume([1149, 1053, 1088, 2223, 1600, 1251, 1443, 2698, 3540, 3279], 2735)
-    femmesh.addVolume([1655, 763, 1698, 214, 2991, 3219, 1857, 1853, 866, 1855], 2736)
-    femmesh.addVolume([393, 452, 426, 2220, 644, 528, 645, 3059, 2938, 3492], 2737)
-    femmesh.addVolume([165, 1105, 1062, 764, 1262, 1263, 1258, 793, 3244, 2994], 2738)
-    femmesh.addVolume([1114, 163, 1139, 746, 1156, 1256, 1257, 3383, 774, 3337], 2739)
-    femmesh.addVolume([224, 732, 1684, 759, 898, 3184, 1885, 902, 903, 3312], 2740)
-    femmesh.addVolume([1110, 737, 738, 185, 3105, 861, 3158, 1322, 859, 857], 2741)
-    femmesh.addVolume([173, 1071, 172, 720, 1284, 1285, 197, 819, 2735, 818], 2742)
-    femmesh.addVolume([721, 219, 220, 1639, 887, 244, 886, 3290, 1870, 1871], 2743)
-    femmesh.addVolume([223, 1688, 758, 1644, 1882, 3439, 895, 1880, 1884, 2885], 2744)
-    femmesh.addVolume([170, 1142, 751, 731, 1277, 3436, 810, 812, 3425, 814], 2745)
-    femmesh.addVolume([743, 1069, 1087, 183, 3399, 1321, 3479, 851, 1316, 1320], 2746)
-    femmesh.addVolume([1051, 1077, 1099, 2229, 1215, 1450, 1593, 3257, 3500, 2867], 2747)
-    femmesh.addVolume([1650, 1698, 767, 215, 1860, 3580, 3300, 1858, 1856, 873], 2748)
-    femmesh.addVolume([270, 267, 17, 1731, 299, 296, 281, 3431, 3020, 1762], 2749)
-    femmesh.addVolume([1733, 1707, 745, 212, 1851, 3390, 3315, 1849, 1748, 771], 2750)
-    femmesh.addVolume([431, 1138, 65, 423, 3382, 1183, 461, 478, 3162, 477], 2751)
-    femmesh.addVolume([270, 24, 762, 745, 282, 781, 2477, 2970, 770, 784], 2752)
-    femmesh.addVolume([42, 1694, 333, 1728, 1749, 3397, 341, 1766, 1767, 3252], 2753)
-    femmesh.addVolume([335, 52, 747, 761, 347, 775, 2882, 2446, 786, 788], 2754)
-    femmesh.addVolume([72, 1150, 417, 1103, 1204, 3330, 498, 1202, 1206, 3586], 2755)
-    femmesh.addVolume([422, 1100, 88, 1101, 3547, 1253, 546, 3455, 1254, 1159], 2756)
-    femmesh.addVolume([127, 1710, 1649, 446, 1817, 1820, 1819, 593, 3546, 3407], 2757)
-    femmesh.addVolume([767, 1698, 730, 215, 3580, 3218, 874, 873, 1856, 869], 2758)
-    femmesh.addVolume([235, 749, 1695, 747, 933, 3451, 1754, 777, 938, 3452], 2759)
-    femmesh.addVolume([1102, 737, 1110, 186, 3489, 3105, 1328, 1162, 860, 1327], 2760)
-    femmesh.addVolume([86, 425, 1053, 1100, 544, 3541, 1250, 1248, 3585, 1252], 2761)
-    femmesh.addVolume([1050, 174, 1095, 755, 1287, 1291, 1292, 2963, 822, 3411], 2762)
-    femmesh.addVolume([427, 393, 426, 2220, 647, 645, 646, 3442, 3059, 3492], 2763)
-    femmesh.addVolume([234, 750, 1704, 718, 932, 3581, 1915, 936, 937, 3131], 2764)
-    femmesh.addVolume([137, 434, 432, 1694, 623, 627, 464, 1751, 3392, 3393], 2765)
-    femmesh.addVolume([1680, 232, 1662, 744, 1911, 1909, 1913, 3567, 924, 3577], 2766)
-    femmesh.addVolume([1087, 738, 743, 184, 3573, 858, 3479, 1319, 856, 855], 2767)
-    femmesh.addVolume([417, 438, 72, 1103, 499, 494, 498, 3586, 3520, 1202], 2768)
-    femmesh.addVolume([1134, 1044, 1148, 2247, 1579, 1578, 1581, 3534, 3189, 3190], 2769)
-    femmesh.addVolume([425, 87, 422, 1100, 543, 547, 548, 3585, 1249, 3547], 2770)
-    femmesh.addVolume([29, 264, 30, 1058, 305, 307, 34, 1167, 3565, 1166], 2771)
-    femmesh.addVolume([123, 1687, 429, 1670, 1799, 3463, 579, 1805, 1806, 3155], 2772)
-    femmesh.addVolume([1116, 78, 1057, 442, 1222, 1224, 1226, 3554, 518, 3354], 2773)
-    femmesh.addVolume([716, 1696, 741, 217, 3227, 3517, 882, 881, 1862, 875], 2774)
-    femmesh.addVolume([271, 23, 746, 272, 284, 772, 3485, 302, 300, 3582], 2775)
-    femmesh.addVolume([1138, 65, 1113, 431, 1183, 1153, 1185, 3382, 461, 3412], 2776)
-    femmesh.addVolume([134, 394, 437, 1681, 618, 620, 616, 1840, 3109, 3552], 2777)
-    femmesh.addVolume([1060, 58, 57, 329, 1177, 62, 1176, 3374, 372, 369], 2778)
-    femmesh.addVolume([337, 336, 51, 748, 367, 348, 366, 3584, 3514, 779], 2779)
-    femmesh.addVolume([404, 136, 437, 1693, 624, 621, 626, 3525, 1842, 3524], 2780)
-    femmesh.addVolume([43, 328, 44, 1653, 358, 359, 48, 1769, 2798, 1768], 2781)
-    femmesh.addVolume([754, 707, 721, 2209, 966, 965, 891, 3097, 3147, 3556], 2782)
-    femmesh.addVolume([436, 1654, 115, 405, 3529, 1779, 553, 557, 3480, 555], 2783)
-    femmesh.addVolume([58, 1060, 330, 329, 1177, 3344, 374, 372, 3374, 375], 2784)
-    femmesh.addVolume([409, 419, 399, 2226, 680, 681, 679, 3367, 3460, 3507], 2785)
-    femmesh.addVolume([14, 268, 1734, 266, 276, 3483, 1755, 291, 292, 3117], 2786)
-    femmesh.addVolume([229, 228, 1678, 719, 253, 1899, 1900, 915, 916, 2613], 2787)
-    femmesh.addVolume([1652, 16, 15, 263, 1759, 20, 1758, 3091, 293, 294], 2788)
-    femmesh.addVolume([744, 743, 715, 2257, 971, 854, 928, 3578, 3400, 2417], 2789)
-    femmesh.addVolume([182, 724, 1047, 181, 848, 2673, 1313, 206, 847, 1314], 2790)
-    femmesh.addVolume([1681, 437, 135, 1646, 3552, 617, 1839, 1844, 3471, 1845], 2791)
-    femmesh.addVolume([1052, 1150, 1103, 2215, 1597, 1206, 1598, 2781, 3266, 3555], 2792)
-    femmesh.addVolume([1680, 1647, 233, 750, 1916, 1917, 1912, 3328, 3381, 929], 2793)
-    femmesh.addVolume([1684, 1688, 732, 224, 1887, 2998, 3184, 1885, 1883, 898], 2794)
-    femmesh.addVolume([17, 1707, 270, 1731, 1746, 3457, 281, 1762, 1764, 3431], 2795)
-    femmesh.addVolume([128, 129, 1686, 411, 153, 1821, 1822, 596, 597, 3098], 2796)
-    femmesh.addVolume([37, 334, 338, 433, 343, 353, 351, 465, 3515, 3583], 2797)
-    femmesh.addVolume([1693, 434, 137, 1694, 3447, 623, 1847, 1848, 3392, 1751], 2798)
-    femmesh.addVolume([1650, 1698, 1631, 2233, 1860, 2123, 2124, 3301, 3379, 2534], 2799)
-    femmesh.addVolume([402, 427, 426, 2246, 609, 646, 533, 3241, 3444, 3494], 2800)
-    femmesh.addVolume([1726, 121, 439, 1730, 1797, 571, 2959, 1798, 1793, 2958], 2801)
-    femmesh.addVolume([1695, 235, 1704, 749, 1754, 1919, 1920, 3451, 933, 3225], 2802)
-    femmesh.addVolume([184, 738, 1110, 1054, 856, 3158, 1323, 1324, 3438, 1326], 2803)
-    femmesh.addVolume([268, 1, 1708, 430, 274, 1743, 3464, 2997, 457, 3388], 2804)
-    femmesh.addVolume([3, 745, 270, 1707, 769, 2970, 280, 1747, 3390, 3457], 2805)
-    femmesh.addVolume([1087, 184, 743, 183, 1319, 855, 3479, 1320, 208, 851], 2806)
-    femmesh.addVolume([77, 1090, 78, 409, 1219, 1220, 102, 515, 3511, 514], 2807)
-    femmesh.addVolume([1095, 722, 174, 175, 3025, 824, 1291, 1290, 825, 199], 2808)
-    femmesh.addVolume([58, 1136, 330, 1060, 1179, 3172, 374, 1177, 1181, 3344], 2809)
-    femmesh.addVolume([1693, 135, 437, 1646, 1843, 617, 3524, 1846, 1845, 3471], 2810)
-    femmesh.addVolume([230, 1641, 231, 727, 1905, 1906, 255, 922, 2347, 921], 2811)
-    femmesh.addVolume([7, 747, 1695, 335, 776, 3452, 1752, 346, 2882, 3459], 2812)
-    femmesh.addVolume([333, 5, 432, 1694, 340, 462, 2801, 3397, 1750, 3393], 2813)
-    femmesh.addVolume([1106, 450, 67, 424, 3415, 483, 1189, 3558, 484, 479], 2814)
-    femmesh.addVolume([744, 1680, 232, 750, 3567, 1911, 924, 931, 3328, 930], 2815)
-    femmesh.addVolume([447, 133, 132, 1640, 611, 157, 610, 2972, 1833, 1834], 2816)
-    femmesh.addVolume([4, 746, 1114, 271, 773, 3383, 1154, 283, 3485, 3486], 2817)
-    femmesh.addVolume([1689, 126, 1683, 445, 1810, 1814, 1815, 3372, 588, 3568], 2818)
-    femmesh.addVolume([1058, 264, 30, 265, 3565, 307, 1166, 3559, 310, 308], 2819)
-    femmesh.addVolume([8, 748, 336, 1102, 778, 3514, 349, 1161, 3490, 3513], 2820)
-    femmesh.addVolume([1704, 233, 1647, 750, 1914, 1917, 1918, 3581, 929, 3381], 2821)
-    femmesh.addVolume([14, 1708, 1734, 268, 1744, 1757, 1755, 276, 3464, 3483], 2822)
-    femmesh.addVolume([425, 422, 404, 2222, 548, 700, 701, 3543, 3512, 3526], 2823)
-    femmesh.addVolume([1083, 1028, 1074, 2207, 1455, 1453, 1454, 2593, 3262, 2977], 2824)
-    femmesh.addVolume([751, 1134, 1142, 170, 3533, 1278, 3436, 810, 1273, 1277], 2825)
-    femmesh.addVolume([66, 1061, 67, 424, 1186, 1187, 91, 480, 3414, 479], 2826)
-    femmesh.addVolume([68, 1055, 69, 420, 1192, 1193, 93, 486, 2767, 485], 2827)
-    femmesh.addVolume([183, 743, 1069, 182, 851, 3399, 1316, 207, 850, 1317], 2828)
-    femmesh.addVolume([742, 741, 716, 2221, 978, 882, 808, 3343, 3286, 2918], 2829)
-    femmesh.addVolume([746, 4, 23, 271, 773, 25, 772, 3485, 283, 284], 2830)
-    femmesh.addVolume([1096, 77, 441, 1090, 1217, 511, 3349, 1221, 1219, 3516], 2831)
-    femmesh.addVolume([268, 10, 1, 430, 275, 13, 274, 2997, 456, 457], 2832)
-    femmesh.addVolume([57, 1135, 1060, 329, 1174, 1178, 1176, 369, 3385, 3374], 2833)
-    femmesh.addVolume([71, 408, 70, 1068, 491, 492, 95, 1199, 3363, 1198], 2834)
-    femmesh.addVolume([116, 1699, 1654, 436, 1782, 1783, 1778, 554, 3560, 3529], 2835)
-    femmesh.addVolume([1671, 130, 131, 427, 1828, 155, 1827, 3462, 602, 603], 2836)
-    femmesh.addVolume([270, 3, 24, 745, 280, 27, 282, 2970, 769, 770], 2837)
-    femmesh.addVolume([1666, 1675, 1620, 2224, 2038, 2039, 2040, 2733, 3183, 2955], 2838)
-    femmesh.addVolume([412, 125, 124, 1645, 583, 149, 582, 2988, 1807, 1808], 2839)
-    femmesh.addVolume([1102, 336, 59, 1136, 3513, 350, 1160, 1182, 3110, 1180], 2840)
-    femmesh.addVolume([425, 86, 87, 1100, 544, 111, 543, 3585, 1248, 1249], 2841)
-    femmesh.addVolume([88, 422, 87, 1100, 546, 547, 112, 1253, 3547, 1249], 2842)
-    femmesh.addVolume([431, 2, 1113, 269, 459, 1152, 3412, 3215, 278, 3523], 2843)
-    femmesh.addVolume([1085, 82, 81, 426, 1234, 106, 1233, 3493, 526, 527], 2844)
-    femmesh.addVolume([433, 6, 334, 1101, 466, 342, 3515, 3454, 1157, 3503], 2845)
-    femmesh.addVolume([431, 9, 2, 269, 460, 11, 459, 3215, 277, 278], 2846)
-    femmesh.addVolume([76, 415, 75, 1051, 506, 507, 100, 1214, 3256, 1213], 2847)
-    femmesh.addVolume([429, 124, 123, 1670, 580, 148, 579, 3155, 1804, 1805], 2848)
-    femmesh.addVolume([185, 738, 1110, 184, 857, 3158, 1322, 209, 856, 1323], 2849)
-    femmesh.addVolume([136, 404, 434, 1693, 624, 625, 622, 1842, 3525, 3447], 2850)
-    femmesh.addVolume([1704, 749, 234, 718, 3225, 934, 1915, 3131, 935, 936], 2851)
-    femmesh.addVolume([130, 1643, 129, 453, 1824, 1825, 154, 600, 2858, 599], 2852)
-    femmesh.addVolume([336, 8, 51, 748, 349, 53, 348, 3514, 778, 779], 2853)
-    femmesh.addVolume([228, 1642, 766, 227, 1897, 2521, 912, 252, 1896, 913], 2854)
-    femmesh.addVolume([1140, 264, 29, 1058, 3536, 305, 1163, 1168, 3565, 1167], 2855)
-    femmesh.addVolume([1049, 81, 80, 452, 1231, 105, 1230, 2935, 523, 524], 2856)
-    femmesh.addVolume([116, 1654, 115, 436, 1778, 1779, 140, 554, 3529, 553], 2857)
-    femmesh.addVolume([227, 226, 1685, 739, 251, 1893, 1894, 907, 908, 3287], 2858)
-    femmesh.addVolume([1669, 414, 131, 132, 3196, 605, 1831, 1830, 606, 156], 2859)
-    femmesh.addVolume([432, 38, 5, 333, 463, 41, 462, 2801, 339, 340], 2860)
-    femmesh.addVolume([215, 767, 1650, 216, 873, 3300, 1858, 240, 872, 1859], 2861)
-    femmesh.addVolume([179, 734, 180, 1078, 841, 842, 204, 1308, 2651, 1307], 2862)
-    femmesh.addVolume([75, 428, 74, 1077, 503, 504, 99, 1211, 3499, 1210], 2863)
-    femmesh.addVolume([1704, 234, 233, 750, 1915, 258, 1914, 3581, 932, 929], 2864)
-    femmesh.addVolume([218, 728, 217, 1661, 878, 879, 242, 1865, 3071, 1864], 2865)
-    femmesh.addVolume([133, 421, 134, 1668, 613, 614, 158, 1837, 2597, 1836], 2866)
-    femmesh.addVolume([765, 179, 178, 1048, 839, 203, 838, 2472, 1304, 1305], 2867)
-    femmesh.addVolume([1094, 80, 79, 416, 1228, 104, 1227, 3143, 520, 521], 2868)
-    femmesh.addVolume([747, 7, 52, 335, 776, 55, 775, 2882, 346, 347], 2869)
-    femmesh.addVolume([186, 737, 1110, 185, 860, 3105, 1327, 210, 859, 1322], 2870)
-    femmesh.addVolume([177, 740, 178, 1093, 833, 834, 202, 1302, 3263, 1301], 2871)
-    femmesh.addVolume([1695, 45, 7, 335, 1753, 50, 1752, 3459, 345, 346], 2872)
-    femmesh.addVolume([59, 336, 330, 1136, 350, 376, 373, 1180, 3110, 3172], 2873)
-    femmesh.addVolume([6, 334, 37, 433, 342, 343, 39, 466, 3515, 465], 2874)
-    femmesh.addVolume([221, 222, 733, 1664, 246, 892, 893, 1876, 1877, 2920], 2875)
-    femmesh.addVolume([135, 437, 136, 1693, 617, 621, 160, 1843, 3524, 1842], 2876)
-    femmesh.addVolume([334, 56, 1135, 1101, 344, 1173, 3126, 3503, 1158, 1175], 2877)
-    femmesh.addVolume([231, 1662, 232, 744, 1908, 1909, 256, 925, 3577, 924], 2878)
-    femmesh.addVolume([114, 1708, 1, 430, 1745, 1743, 138, 458, 3388, 457], 2879)
-    femmesh.addVolume([333, 42, 5, 1694, 341, 46, 340, 3397, 1749, 1750], 2880)
-    femmesh.addVolume([270, 17, 3, 1707, 281, 22, 280, 3457, 1746, 1747], 2881)
-    femmesh.addVolume([232, 1680, 233, 750, 1911, 1912, 257, 930, 3328, 929], 2882)
-    femmesh.addVolume([751, 725, 710, 2247, 811, 986, 987, 3437, 3035, 3424], 2883)
-    femmesh.addVolume([84, 443, 83, 1046, 534, 535, 108, 1240, 3217, 1239], 2884)
-    femmesh.addVolume([454, 73, 74, 1079, 501, 98, 500, 2950, 1207, 1208], 2885)
-    femmesh.addVolume([1114, 1137, 31, 271, 1172, 1169, 1155, 3486, 3267, 285], 2886)
-    femmesh.addVolume([1708, 14, 1, 268, 1744, 18, 1743, 3464, 276, 274], 2887)
-    femmesh.addVolume([85, 406, 84, 1075, 537, 538, 109, 1243, 2657, 1242], 2888)
-    femmesh.addVolume([329, 56, 1135, 334, 370, 1173, 3385, 371, 344, 3126], 2889)
-    femmesh.addVolume([134, 437, 135, 1681, 616, 617, 159, 1840, 3552, 1839], 2890)
-    femmesh.addVolume([1114, 4, 163, 746, 1154, 187, 1156, 3383, 773, 774], 2891)
-    femmesh.addVolume([1699, 436, 117, 397, 3560, 558, 1781, 3465, 563, 561], 2892)
-    femmesh.addVolume([136, 434, 137, 1693, 622, 623, 161, 1842, 3447, 1847], 2893)
-    femmesh.addVolume([30, 1137, 1058, 265, 1170, 1171, 1166, 308, 3519, 3559], 2894)
-    femmesh.addVolume([745, 1707, 3, 212, 3390, 1747, 769, 771, 1748, 236], 2895)
-    femmesh.addVolume([455, 429, 123, 1687, 581, 579, 577, 3193, 3463, 1799], 2896)
-    femmesh.addVolume([121, 410, 122, 1726, 573, 574, 146, 1797, 3281, 1796], 2897)
-    femmesh.addVolume([758, 222, 223, 1644, 896, 247, 895, 2885, 1879, 1880], 2898)
-    femmesh.addVolume([10, 273, 9, 449, 286, 287, 12, 469, 2510, 468], 2899)
-    femmesh.addVolume([448, 37, 38, 338, 473, 40, 472, 2356, 351, 352], 2900)
-    femmesh.addVolume([337, 51, 52, 761, 366, 54, 365, 2445, 785, 786], 2901)
-    femmesh.addVolume([762, 23, 24, 272, 782, 26, 781, 2478, 300, 301], 2902)
-    femmesh.addVolume([234, 1704, 235, 749, 1915, 1919, 259, 934, 3225, 933], 2903)
-    femmesh.addVolume([220, 221, 754, 1677, 245, 889, 890, 1873, 1874, 3095], 2904)
-    femmesh.addVolume([118, 1658, 117, 407, 1784, 1785, 142, 560, 2864, 559], 2905)
-    femmesh.addVolume([173, 174, 1050, 755, 198, 1287, 1288, 821, 822, 2963], 2906)
-    femmesh.addVolume([2, 1113, 65, 431, 1152, 1153, 89, 459, 3412, 461], 2907)
-    femmesh.addVolume([167, 1065, 166, 768, 1264, 1265, 191, 799, 2902, 798], 2908)
-    femmesh.addVolume([1683, 126, 127, 419, 1814, 151, 1813, 3570, 590, 591], 2909)
-    femmesh.addVolume([336, 59, 8, 1102, 350, 64, 349, 3513, 1160, 1161], 2910)
-    femmesh.addVolume([165, 1062, 164, 764, 1258, 1259, 189, 793, 2994, 792], 2911)
-    femmesh.addVolume([732, 1688, 223, 224, 2998, 1882, 899, 898, 1883, 248], 2912)
-    femmesh.addVolume([213, 763, 1655, 214, 867, 2991, 1852, 238, 866, 1853], 2913)
-    femmesh.addVolume([31, 271, 1137, 265, 285, 3267, 1169, 309, 311, 3519], 2914)
-    femmesh.addVolume([82, 1070, 83, 413, 1236, 1237, 107, 530, 3069, 529], 2915)
-    femmesh.addVolume([1114, 31, 4, 271, 1155, 36, 1154, 3486, 285, 283], 2916)
-    femmesh.addVolume([212, 735, 1733, 213, 864, 3047, 1849, 237, 863, 1850], 2917)
-    femmesh.addVolume([1129, 1100, 1053, 2222, 1554, 1252, 1601, 3306, 3563, 3542], 2918)
-    femmesh.addVolume([269, 28, 1113, 1140, 279, 1151, 3523, 3403, 1164, 1165], 2919)
-    femmesh.addVolume([65, 1138, 66, 423, 1183, 1184, 90, 477, 3162, 476], 2920)
-    femmesh.addVolume([164, 1139, 163, 736, 1255, 1256, 188, 790, 3093, 789], 2921)
-    femmesh.addVolume([331, 43, 42, 1728, 356, 47, 355, 2892, 1765, 1766], 2922)
-    femmesh.addVolume([126, 1689, 125, 445, 1810, 1811, 150, 588, 3372, 587], 2923)
-    femmesh.addVolume([334, 6, 56, 1101, 342, 60, 344, 3503, 1157, 1158], 2924)
-    femmesh.addVolume([748, 1102, 8, 186, 3490, 1161, 778, 780, 1162, 211], 2925)
-    femmesh.addVolume([264, 28, 269, 1140, 304, 279, 306, 3536, 1164, 3403], 2926)
-    femmesh.addVolume([1695, 7, 235, 747, 1752, 260, 1754, 3452, 776, 777], 2927)
-    femmesh.addVolume([168, 169, 1063, 725, 193, 1270, 1271, 804, 805, 3037], 2928)
-    femmesh.addVolume([1663, 229, 760, 230, 1902, 919, 2457, 1903, 254, 918], 2929)
-    femmesh.addVolume([168, 1133, 167, 742, 1267, 1268, 192, 802, 3557, 801], 2930)
-    femmesh.addVolume([451, 85, 86, 1088, 541, 110, 540, 3276, 1245, 1246], 2931)
-    femmesh.addVolume([6, 433, 88, 1101, 466, 467, 113, 1157, 3454, 1159], 2932)
-    femmesh.addVolume([1113, 2, 28, 269, 1152, 32, 1151, 3523, 278, 279], 2933)
-    femmesh.addVolume([441, 76, 77, 1096, 512, 101, 511, 3349, 1216, 1217], 2934)
-    femmesh.addVolume([45, 1729, 44, 332, 1771, 1772, 49, 362, 2759, 361], 2935)
-    femmesh.addVolume([418, 120, 119, 1656, 568, 144, 567, 3203, 1790, 1791], 2936)
-    femmesh.addVolume([5, 137, 432, 1694, 162, 464, 462, 1750, 1751, 3393], 2937)
-    femmesh.addVolume([171, 1142, 170, 731, 1276, 1277, 195, 813, 3425, 812], 2938)
-    femmesh.addVolume([439, 121, 120, 1730, 571, 145, 570, 2958, 1793, 1794], 2939)
-    femmesh.addVolume([757, 181, 180, 1076, 845, 205, 844, 2463, 1310, 1311], 2940)
-    femmesh.addVolume([1732, 114, 115, 435, 1776, 139, 1775, 3088, 550, 551], 2941)
-    femmesh.addVolume([753, 218, 219, 1682, 884, 243, 883, 3317, 1867, 1868], 2942)
-    femmesh.addVolume([438, 71, 72, 1103, 495, 96, 494, 3520, 1201, 1202], 2943)
-    femmesh.addVolume([267, 16, 17, 1731, 297, 21, 296, 3020, 1761, 1762], 2944)
-    femmesh.addVolume([455, 123, 122, 1687, 577, 147, 576, 3193, 1799, 1800], 2945)
-    femmesh.addVolume([1734, 15, 14, 266, 1756, 19, 1755, 3117, 290, 291], 2946)
-    femmesh.addVolume([417, 72, 73, 1150, 498, 97, 497, 3330, 1204, 1205], 2947)
-    femmesh.addVolume([117, 1699, 116, 436, 1781, 1782, 141, 558, 3560, 554], 2948)
-    femmesh.addVolume([170, 751, 1134, 169, 810, 3533, 1273, 194, 809, 1274], 2949)
-    femmesh.addVolume([1135, 57, 56, 329, 1174, 61, 1173, 3385, 369, 370], 2950)
-    femmesh.addVolume([166, 1105, 165, 723, 1261, 1262, 190, 796, 3245, 795], 2951)
-    femmesh.addVolume([216, 741, 1696, 217, 876, 3517, 1861, 241, 875, 1862], 2952)
-    femmesh.addVolume([177, 176, 726, 1115, 201, 830, 831, 1296, 1297, 3473], 2953)
-    femmesh.addVolume([1727, 118, 119, 444, 1788, 143, 1787, 2940, 564, 565], 2954)
-    femmesh.addVolume([69, 1089, 70, 440, 1195, 1196, 94, 489, 2761, 488], 2955)
-    femmesh.addVolume([752, 1092, 172, 171, 3351, 1279, 816, 815, 1280, 196], 2956)
-    femmesh.addVolume([264, 29, 28, 1140, 305, 33, 304, 3536, 1163, 1164], 2957)
-    femmesh.addVolume([1710, 127, 128, 446, 1817, 152, 1816, 3546, 593, 594], 2958)
-    femmesh.addVolume([225, 1709, 226, 729, 1888, 1889, 250, 905, 3445, 904], 2959)
-    femmesh.addVolume([1116, 79, 78, 442, 1223, 103, 1222, 3554, 517, 518], 2960)
-    femmesh.addVolume([224, 1684, 225, 759, 1885, 1886, 249, 902, 3312, 901], 2961)
-    femmesh.addVolume([330, 58, 59, 1136, 374, 63, 373, 3172, 1179, 1180], 2962)
-    femmesh.addVolume([756, 176, 175, 1091, 828, 200, 827, 3368, 1293, 1294], 2963)
-    femmesh.addVolume([214, 730, 1698, 215, 870, 3218, 1855, 239, 869, 1856], 2964)
-    femmesh.addVolume([67, 1106, 68, 450, 1189, 1190, 92, 483, 3415, 482], 2965)
-    femmesh.addVolume([1137, 30, 31, 265, 1170, 35, 1169, 3519, 308, 309], 2966)
-    femmesh.addVolume([1144, 1141, 2211, 1018, 1352, 2506, 2692, 1349, 1345, 2505], 2967)
-    femmesh.addVolume([2250, 1047, 2257, 715, 2676, 2830, 2350, 2416, 2674, 2417], 2968)
-    femmesh.addVolume([1047, 2250, 2257, 2214, 2676, 2350, 2830, 3216, 2437, 2438], 2969)
-    femmesh.addVolume([2235, 330, 332, 2242, 3173, 384, 2721, 2722, 3171, 2720], 2970)
-    femmesh.addVolume([2235, 332, 330, 328, 2721, 384, 3173, 2799, 363, 389], 2971)
-    femmesh.addVolume([2228, 2211, 1144, 1141, 2369, 2692, 2924, 2542, 2506, 1352], 2972)
-    femmesh.addVolume([2228, 1144, 2211, 2254, 2924, 2692, 2369, 2367, 2691, 2364], 2973)
-    femmesh.addVolume([2233, 1724, 1660, 1631, 3539, 1955, 2291, 2534, 2125, 2130], 2974)
-    femmesh.addVolume([2233, 1660, 1724, 2204, 2291, 1955, 3539, 2290, 2288, 3192], 2975)
-    femmesh.addVolume([2237, 1062, 1145, 1124, 2850, 1564, 2316, 2293, 1535, 1421], 2976)
-    femmesh.addVolume([2237, 1145, 1062, 2232, 2316, 1564, 2850, 2306, 2361, 2848], 2977)
-    femmesh.addVolume([2235, 329, 331, 328, 3375, 377, 2926, 2799, 390, 360], 2978)
-    femmesh.addVolume([2235, 331, 329, 2252, 2926, 377, 3375, 2925, 2894, 3386], 2979)
-    femmesh.addVolume([338, 2252, 433, 334, 2360, 2671, 3583, 353, 2992, 3515], 2980)
-    femmesh.addVolume([2252, 338, 433, 448, 2360, 3583, 2671, 2359, 2356, 474], 2981)
-    femmesh.addVolume([449, 9, 269, 273, 468, 277, 2681, 2510, 287, 288], 2982)
-    femmesh.addVolume([449, 269, 9, 431, 2681, 277, 468, 470, 3215, 460], 2983)
-    femmesh.addVolume([1737, 1655, 2237, 1718, 2156, 2809, 2278, 2010, 2128, 2384], 2984)
-    femmesh.addVolume([1655, 1737, 2237, 2232, 2156, 2278, 2809, 2807, 2307, 2306], 2985)
-    femmesh.addVolume([1657, 2221, 2203, 1630, 2261, 2563, 2986, 2121, 2452, 3231], 2986)
-    femmesh.addVolume([2221, 1657, 2203, 2234, 2261, 2986, 2563, 2266, 2264, 2561], 2987)
-    femmesh.addVolume([727, 1662, 2257, 1641, 3450, 3474, 2349, 2347, 1910, 2348], 2988)
-    femmesh.addVolume([1662, 727, 2257, 715, 3450, 2349, 3474, 3476, 926, 2417], 2989)
-    femmesh.addVolume([2250, 1641, 1614, 1700, 2345, 1971, 2913, 2569, 1969, 1970], 2990)
-    femmesh.addVolume([2250, 1614, 1641, 2214, 2913, 1971, 2345, 2437, 2611, 2436], 2991)
-    femmesh.addVolume([1663, 229, 719, 760, 1902, 915, 2584, 2457, 919, 920], 2992)
-    femmesh.addVolume([229, 1663, 719, 1678, 1902, 2584, 915, 1900, 1904, 2613], 2993)
-    femmesh.addVolume([2209, 2251, 752, 1092, 2530, 3587, 3353, 2560, 2559, 3351], 2994)
-    femmesh.addVolume([2209, 752, 2251, 707, 3353, 3587, 2530, 3147, 962, 3146], 2995)
-    femmesh.addVolume([720, 752, 2251, 1092, 820, 3587, 2737, 2736, 3351, 2559], 2996)
-    femmesh.addVolume([720, 2251, 752, 707, 2737, 3587, 820, 961, 3146, 962], 2997)
-    femmesh.addVolume([2201, 411, 446, 1710, 2714, 598, 3409, 2716, 2711, 3546], 2998)
-    femmesh.addVolume([2201, 446, 411, 400, 3409, 598, 2714, 2783, 692, 690], 2999)
-    femmesh.addVolume([2257, 1047, 1108, 1069, 2830, 1385, 3031, 2831, 1318, 1482], 3000)
-    femmesh.addVolume([2257, 1108, 1047, 2214, 3031, 1385, 2830, 2438, 3030, 3216], 3001)
-    femmesh.addVolume([2201, 416, 442, 400, 2743, 522, 3356, 2783, 691, 689], 3002)
-    femmesh.addVolume([2201, 442, 416, 1116, 3356, 522, 2743, 2742, 3554, 2739], 3003)
-    femmesh.addVolume([2235, 1723, 2222, 2243, 3333, 3522, 3307, 3121, 3561, 3322], 3004)
-    femmesh.addVolume([1723, 2235, 2222, 2252, 3333, 3307, 3522, 3332, 2925, 3308], 3005)
-    femmesh.addVolume([2218, 1714, 1629, 2217, 2520, 2108, 2557, 2519, 2441, 2556], 3006)
-    femmesh.addVolume([2218, 1629, 1714, 1673, 2557, 2108, 2520, 2806, 2109, 1966], 3007)
-    femmesh.addVolume([2207, 1667, 2236, 2253, 2537, 2572, 2826, 2661, 2571, 2573], 3008)
-    femmesh.addVolume([2207, 2236, 1667, 2238, 2826, 2572, 2537, 2625, 2823, 2624], 3009)
-    femmesh.addVolume([1076, 180, 734, 1078, 1311, 842, 2609, 1312, 1307, 2651], 3010)
-    femmesh.addVolume([1076, 734, 180, 757, 2609, 842, 1311, 2463, 846, 844], 3011)
-    femmesh.addVolume([1023, 2240, 2219, 1056, 2338, 2911, 2842, 1405, 3176, 3272], 3012)
-    femmesh.addVolume([2240, 1023, 2219, 2255, 2338, 2842, 2911, 2334, 2337, 2794], 3013)
-    femmesh.addVolume([332, 44, 1653, 1729, 361, 1768, 2718, 2759, 1772, 1773], 3014)
-    femmesh.addVolume([332, 1653, 44, 328, 2718, 1768, 361, 363, 2798, 359], 3015)
-    femmesh.addVolume([2235, 1723, 1615, 1722, 3333, 1992, 3120, 3346, 1993, 1983], 3016)
-    femmesh.addVolume([2235, 1615, 1723, 2243, 3120, 1992, 3333, 3121, 3122, 3561], 3017)
-    femmesh.addVolume([2215, 1131, 1128, 2211, 3065, 1351, 2780, 2786, 2774, 2551], 3018)
-    femmesh.addVolume([2215, 1128, 1131, 1052, 2780, 1351, 3065, 2781, 1596, 1599], 3019)
-    femmesh.addVolume([1088, 85, 406, 451, 1245, 537, 3277, 3276, 541, 542], 3020)
-    femmesh.addVolume([1088, 406, 85, 1075, 3277, 537, 1245, 1247, 2657, 1243], 3021)
-    femmesh.addVolume([2257, 1680, 708, 2245, 3044, 3327, 3553, 2839, 3043, 3329], 3022)
-    femmesh.addVolume([2257, 708, 1680, 744, 3553, 3327, 3044, 3578, 972, 3567], 3023)
-    femmesh.addVolume([2229, 1027, 2224, 2258, 3195, 2690, 2751, 2748, 2689, 2580], 3024)
-    femmesh.addVolume([1027, 2229, 2224, 2210, 3195, 2751, 2690, 2912, 2444, 2717], 3025)
-    femmesh.addVolume([2235, 2249, 1634, 1722, 3124, 3562, 3441, 3346, 3347, 2148], 3026)
-    femmesh.addVolume([2235, 1634, 2249, 2242, 3441, 3562, 3124, 2722, 3440, 2709], 3027)
-    femmesh.addVolume([440, 2199, 1068, 408, 3248, 3243, 3550, 493, 3430, 3363], 3028)
-    femmesh.addVolume([2199, 440, 1068, 1089, 3248, 3550, 3243, 2376, 2761, 1200], 3029)
-    femmesh.addVolume([1644, 222, 733, 758, 1879, 892, 3251, 2885, 896, 897], 3030)
-    femmesh.addVolume([1644, 733, 222, 1664, 3251, 892, 1879, 1881, 2920, 1877], 3031)
-    femmesh.addVolume([2235, 2249, 1041, 2242, 3124, 3518, 3261, 2722, 2709, 3260], 3032)
-    femmesh.addVolume([2235, 1041, 2249, 1127, 3261, 3518, 3124, 3434, 1557, 3435], 3033)
-    femmesh.addVolume([1065, 166, 723, 1105, 1265, 796, 3283, 1266, 1261, 3245], 3034)
-    femmesh.addVolume([166, 1065, 723, 768, 1265, 3283, 796, 798, 2902, 800], 3035)
-    femmesh.addVolume([332, 45, 1695, 335, 362, 1753, 3458, 364, 345, 3459], 3036)
-    femmesh.addVolume([332, 1695, 45, 1729, 3458, 1753, 362, 2759, 1774, 1771], 3037)
-    femmesh.addVolume([748, 2242, 337, 336, 2769, 2449, 3584, 3514, 2869, 367], 3038)
-    femmesh.addVolume([748, 337, 2242, 761, 3584, 2449, 2769, 787, 2445, 2447], 3039)
-    femmesh.addVolume([2246, 414, 413, 402, 3488, 698, 3070, 3241, 608, 532], 3040)
-    femmesh.addVolume([2246, 413, 414, 2236, 3070, 698, 3488, 2908, 3068, 3141], 3041)
-    femmesh.addVolume([449, 10, 268, 430, 469, 275, 2509, 471, 456, 2997], 3042)
-    femmesh.addVolume([449, 268, 10, 273, 2509, 275, 469, 2510, 289, 286], 3043)
-    femmesh.addVolume([333, 38, 448, 432, 339, 472, 2357, 2801, 463, 475], 3044)
-    femmesh.addVolume([333, 448, 38, 338, 2357, 472, 339, 354, 2356, 352], 3045)
-    femmesh.addVolume([272, 2232, 746, 271, 2480, 2802, 3582, 302, 2943, 3485], 3046)
-    femmesh.addVolume([272, 746, 2232, 762, 3582, 2802, 2480, 2478, 783, 2479], 3047)
-    return True
+    return load_mesh(femmesh, __name__, nodes=False)
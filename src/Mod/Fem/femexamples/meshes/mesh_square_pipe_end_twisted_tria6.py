@@ -1,2480 +1,11 @@
+from . import load_mesh
+
+
 def create_nodes(femmesh):
     # nodes
-    femmesh.addNode(-142.5, 142.5, 0.0, 1)
-    femmesh.addNode(-142.5, -142.5, 0.0, 2)
-    femmesh.addNode(-142.5, 142.5, 1000.0, 3)
-    femmesh.addNode(-142.5, -142.5, 1000.0, 4)
-    femmesh.addNode(-142.5, 95.0, 0.0, 5)
-    femmesh.addNode(-142.5, 47.5, 0.0, 6)
-    femmesh.addNode(-142.5, 0.0, 0.0, 7)
-    femmesh.addNode(-142.5, -47.5, 0.0, 8)
-    femmesh.addNode(-142.5, -95.0, 0.0, 9)
-    femmesh.addNode(-142.5, 142.5, 50.0, 10)
-    femmesh.addNode(-142.5, 142.5, 100.0, 11)
-    femmesh.addNode(-142.5, 142.5, 150.0, 12)
-    femmesh.addNode(-142.5, 142.5, 200.0, 13)
-    femmesh.addNode(-142.5, 142.5, 250.0, 14)
-    femmesh.addNode(-142.5, 142.5, 300.0, 15)
-    femmesh.addNode(-142.5, 142.5, 350.0, 16)
-    femmesh.addNode(-142.5, 142.5, 400.0, 17)
-    femmesh.addNode(-142.5, 142.5, 450.0, 18)
-    femmesh.addNode(-142.5, 142.5, 500.0, 19)
-    femmesh.addNode(-142.5, 142.5, 550.0, 20)
-    femmesh.addNode(-142.5, 142.5, 600.0, 21)
-    femmesh.addNode(-142.5, 142.5, 650.0, 22)
-    femmesh.addNode(-142.5, 142.5, 700.0, 23)
-    femmesh.addNode(-142.5, 142.5, 750.0, 24)
-    femmesh.addNode(-142.5, 142.5, 800.0, 25)
-    femmesh.addNode(-142.5, 142.5, 850.0, 26)
-    femmesh.addNode(-142.5, 142.5, 900.0, 27)
-    femmesh.addNode(-142.5, 142.5, 950.0, 28)
-    femmesh.addNode(-142.5, 95.0, 1000.0, 29)
-    femmesh.addNode(-142.5, 47.5, 1000.0, 30)
-    femmesh.addNode(-142.5, 0.0, 1000.0, 31)
-    femmesh.addNode(-142.5, -47.5, 1000.0, 32)
-    femmesh.addNode(-142.5, -95.0, 1000.0, 33)
-    femmesh.addNode(-142.5, -142.5, 50.0, 34)
-    femmesh.addNode(-142.5, -142.5, 100.0, 35)
-    femmesh.addNode(-142.5, -142.5, 150.0, 36)
-    femmesh.addNode(-142.5, -142.5, 200.0, 37)
-    femmesh.addNode(-142.5, -142.5, 250.0, 38)
-    femmesh.addNode(-142.5, -142.5, 300.0, 39)
-    femmesh.addNode(-142.5, -142.5, 350.0, 40)
-    femmesh.addNode(-142.5, -142.5, 400.0, 41)
-    femmesh.addNode(-142.5, -142.5, 450.0, 42)
-    femmesh.addNode(-142.5, -142.5, 500.0, 43)
-    femmesh.addNode(-142.5, -142.5, 550.0, 44)
-    femmesh.addNode(-142.5, -142.5, 600.0, 45)
-    femmesh.addNode(-142.5, -142.5, 650.0, 46)
-    femmesh.addNode(-142.5, -142.5, 700.0, 47)
-    femmesh.addNode(-142.5, -142.5, 750.0, 48)
-    femmesh.addNode(-142.5, -142.5, 800.0, 49)
-    femmesh.addNode(-142.5, -142.5, 850.0, 50)
-    femmesh.addNode(-142.5, -142.5, 900.0, 51)
-    femmesh.addNode(-142.5, -142.5, 950.0, 52)
-    femmesh.addNode(-142.5, 78.2801, 37.6071, 53)
-    femmesh.addNode(-142.5, 82.8778, 81.1309, 54)
-    femmesh.addNode(-142.5, 83.7987, 132.243, 55)
-    femmesh.addNode(-142.5, 26.5975, 51.4008, 56)
-    femmesh.addNode(-142.5, -24.9195, 38.6958, 57)
-    femmesh.addNode(-142.5, 28.3071, 109.277, 58)
-    femmesh.addNode(-142.5, 28.6437, 161.076, 59)
-    femmesh.addNode(-142.5, -25.856, 84.5406, 60)
-    femmesh.addNode(-142.5, -26.1584, 137.428, 61)
-    femmesh.addNode(-142.5, 84.3969, 181.746, 62)
-    femmesh.addNode(-142.5, 84.2758, 232.086, 63)
-    femmesh.addNode(-142.5, 84.2827, 282.032, 64)
-    femmesh.addNode(-142.5, 84.1337, 332.651, 65)
-    femmesh.addNode(-142.5, 29.2616, 210.927, 66)
-    femmesh.addNode(-142.5, 29.3967, 260.858, 67)
-    femmesh.addNode(-142.5, -26.0842, 188.506, 68)
-    femmesh.addNode(-142.5, -25.9315, 238.681, 69)
-    femmesh.addNode(-142.5, 29.1757, 311.391, 70)
-    femmesh.addNode(-142.5, 28.7076, 361.897, 71)
-    femmesh.addNode(-142.5, -25.946, 288.852, 72)
-    femmesh.addNode(-142.5, -26.2889, 339.654, 73)
-    femmesh.addNode(-142.5, -79.9661, 55.4097, 74)
-    femmesh.addNode(-142.5, -83.1462, 115.644, 75)
-    femmesh.addNode(-142.5, -83.7177, 168.069, 76)
-    femmesh.addNode(-142.5, -83.7677, 218.68, 77)
-    femmesh.addNode(-142.5, -83.7551, 268.845, 78)
-    femmesh.addNode(-142.5, -83.8444, 319.301, 79)
-    femmesh.addNode(-142.5, -83.832, 369.493, 80)
-    femmesh.addNode(-142.5, 84.4685, 381.956, 81)
-    femmesh.addNode(-142.5, 84.2929, 432.126, 82)
-    femmesh.addNode(-142.5, 84.2867, 482.039, 83)
-    femmesh.addNode(-142.5, 84.1346, 532.653, 84)
-    femmesh.addNode(-142.5, 29.0852, 411.479, 85)
-    femmesh.addNode(-142.5, 29.3382, 461.022, 86)
-    femmesh.addNode(-142.5, -26.5143, 389.778, 87)
-    femmesh.addNode(-142.5, -26.0976, 439.168, 88)
-    femmesh.addNode(-142.5, 29.1615, 511.431, 89)
-    femmesh.addNode(-142.5, 28.887, 561.607, 90)
-    femmesh.addNode(-142.5, -26.0013, 489.005, 91)
-    femmesh.addNode(-142.5, -26.0668, 539.096, 92)
-    femmesh.addNode(-142.5, 84.4986, 581.908, 93)
-    femmesh.addNode(-142.5, 84.2979, 632.118, 94)
-    femmesh.addNode(-142.5, 84.2875, 682.038, 95)
-    femmesh.addNode(-142.5, 84.1347, 732.652, 96)
-    femmesh.addNode(-142.5, 29.3337, 611.072, 97)
-    femmesh.addNode(-142.5, 29.4161, 660.894, 98)
-    femmesh.addNode(-142.5, -26.0193, 588.998, 99)
-    femmesh.addNode(-142.5, -25.9036, 638.814, 100)
-    femmesh.addNode(-142.5, 29.1806, 711.4, 101)
-    femmesh.addNode(-142.5, 28.7088, 761.899, 102)
-    femmesh.addNode(-142.5, -25.9364, 688.886, 103)
-    femmesh.addNode(-142.5, -26.286, 739.662, 104)
-    femmesh.addNode(-142.5, -83.898, 419.24, 105)
-    femmesh.addNode(-142.5, -83.8166, 469.052, 106)
-    femmesh.addNode(-142.5, -83.8027, 519.019, 107)
-    femmesh.addNode(-142.5, -83.8003, 569.008, 108)
-    femmesh.addNode(-142.5, -83.7654, 618.944, 109)
-    femmesh.addNode(-142.5, -83.7483, 668.918, 110)
-    femmesh.addNode(-142.5, -83.8412, 719.32, 111)
-    femmesh.addNode(-142.5, -83.8309, 769.498, 112)
-    femmesh.addNode(-142.5, 84.4689, 781.957, 113)
-    femmesh.addNode(-142.5, 84.293, 832.127, 114)
-    femmesh.addNode(-142.5, 83.9065, 883.976, 115)
-    femmesh.addNode(-142.5, 80.6013, 944.348, 116)
-    femmesh.addNode(-142.5, 29.0855, 811.479, 117)
-    femmesh.addNode(-142.5, 29.2116, 861.667, 118)
-    femmesh.addNode(-142.5, -26.5134, 789.781, 119)
-    femmesh.addNode(-142.5, -26.129, 839.33, 120)
-    femmesh.addNode(-142.5, 28.4518, 914.46, 121)
-    femmesh.addNode(-142.5, 26.4487, 961.198, 122)
-    femmesh.addNode(-142.5, -26.0999, 891.348, 123)
-    femmesh.addNode(-142.5, -25.5438, 949.788, 124)
-    femmesh.addNode(-142.5, -83.9044, 819.276, 125)
-    femmesh.addNode(-142.5, -83.834, 869.725, 126)
-    femmesh.addNode(-142.5, -83.119, 920.663, 127)
-    femmesh.addNode(-142.5, -78.7325, 964.09, 128)
-    femmesh.addNode(142.5, -142.5, 0.0, 129)
-    femmesh.addNode(142.5, -142.5, 1000.0, 130)
-    femmesh.addNode(-95.0, -142.5, 0.0, 131)
-    femmesh.addNode(-47.5, -142.5, 0.0, 132)
-    femmesh.addNode(0.0, -142.5, 0.0, 133)
-    femmesh.addNode(47.5, -142.5, 0.0, 134)
-    femmesh.addNode(95.0, -142.5, 0.0, 135)
-    femmesh.addNode(-95.0, -142.5, 1000.0, 136)
-    femmesh.addNode(-47.5, -142.5, 1000.0, 137)
-    femmesh.addNode(0.0, -142.5, 1000.0, 138)
-    femmesh.addNode(47.5, -142.5, 1000.0, 139)
-    femmesh.addNode(95.0, -142.5, 1000.0, 140)
-    femmesh.addNode(142.5, -142.5, 50.0, 141)
-    femmesh.addNode(142.5, -142.5, 100.0, 142)
-    femmesh.addNode(142.5, -142.5, 150.0, 143)
-    femmesh.addNode(142.5, -142.5, 200.0, 144)
-    femmesh.addNode(142.5, -142.5, 250.0, 145)
-    femmesh.addNode(142.5, -142.5, 300.0, 146)
-    femmesh.addNode(142.5, -142.5, 350.0, 147)
-    femmesh.addNode(142.5, -142.5, 400.0, 148)
-    femmesh.addNode(142.5, -142.5, 450.0, 149)
-    femmesh.addNode(142.5, -142.5, 500.0, 150)
-    femmesh.addNode(142.5, -142.5, 550.0, 151)
-    femmesh.addNode(142.5, -142.5, 600.0, 152)
-    femmesh.addNode(142.5, -142.5, 650.0, 153)
-    femmesh.addNode(142.5, -142.5, 700.0, 154)
-    femmesh.addNode(142.5, -142.5, 750.0, 155)
-    femmesh.addNode(142.5, -142.5, 800.0, 156)
-    femmesh.addNode(142.5, -142.5, 850.0, 157)
-    femmesh.addNode(142.5, -142.5, 900.0, 158)
-    femmesh.addNode(142.5, -142.5, 950.0, 159)
-    femmesh.addNode(-78.2801, -142.5, 37.6071, 160)
-    femmesh.addNode(-82.8778, -142.5, 81.1309, 161)
-    femmesh.addNode(-83.7987, -142.5, 132.243, 162)
-    femmesh.addNode(-26.5975, -142.5, 51.4008, 163)
-    femmesh.addNode(24.9195, -142.5, 38.6958, 164)
-    femmesh.addNode(-28.3071, -142.5, 109.277, 165)
-    femmesh.addNode(-28.6437, -142.5, 161.076, 166)
-    femmesh.addNode(25.856, -142.5, 84.5406, 167)
-    femmesh.addNode(26.1584, -142.5, 137.428, 168)
-    femmesh.addNode(-84.3969, -142.5, 181.746, 169)
-    femmesh.addNode(-84.2758, -142.5, 232.086, 170)
-    femmesh.addNode(-84.2827, -142.5, 282.032, 171)
-    femmesh.addNode(-84.1337, -142.5, 332.651, 172)
-    femmesh.addNode(-29.2616, -142.5, 210.927, 173)
-    femmesh.addNode(-29.3967, -142.5, 260.858, 174)
-    femmesh.addNode(26.0842, -142.5, 188.506, 175)
-    femmesh.addNode(25.9315, -142.5, 238.681, 176)
-    femmesh.addNode(-29.1757, -142.5, 311.391, 177)
-    femmesh.addNode(-28.7076, -142.5, 361.897, 178)
-    femmesh.addNode(25.946, -142.5, 288.852, 179)
-    femmesh.addNode(26.2889, -142.5, 339.654, 180)
-    femmesh.addNode(79.9661, -142.5, 55.4097, 181)
-    femmesh.addNode(83.1462, -142.5, 115.644, 182)
-    femmesh.addNode(83.7177, -142.5, 168.069, 183)
-    femmesh.addNode(83.7677, -142.5, 218.68, 184)
-    femmesh.addNode(83.7551, -142.5, 268.845, 185)
-    femmesh.addNode(83.8444, -142.5, 319.301, 186)
-    femmesh.addNode(83.832, -142.5, 369.493, 187)
-    femmesh.addNode(-84.4685, -142.5, 381.956, 188)
-    femmesh.addNode(-84.2929, -142.5, 432.126, 189)
-    femmesh.addNode(-84.2867, -142.5, 482.039, 190)
-    femmesh.addNode(-84.1346, -142.5, 532.653, 191)
-    femmesh.addNode(-29.0852, -142.5, 411.479, 192)
-    femmesh.addNode(-29.3382, -142.5, 461.022, 193)
-    femmesh.addNode(26.5143, -142.5, 389.778, 194)
-    femmesh.addNode(26.0976, -142.5, 439.168, 195)
-    femmesh.addNode(-29.1615, -142.5, 511.431, 196)
-    femmesh.addNode(-28.887, -142.5, 561.607, 197)
-    femmesh.addNode(26.0013, -142.5, 489.005, 198)
-    femmesh.addNode(26.0668, -142.5, 539.096, 199)
-    femmesh.addNode(-84.4986, -142.5, 581.908, 200)
-    femmesh.addNode(-84.2979, -142.5, 632.118, 201)
-    femmesh.addNode(-84.2875, -142.5, 682.038, 202)
-    femmesh.addNode(-84.1347, -142.5, 732.652, 203)
-    femmesh.addNode(-29.3337, -142.5, 611.072, 204)
-    femmesh.addNode(-29.4161, -142.5, 660.894, 205)
-    femmesh.addNode(26.0193, -142.5, 588.998, 206)
-    femmesh.addNode(25.9036, -142.5, 638.814, 207)
-    femmesh.addNode(-29.1806, -142.5, 711.4, 208)
-    femmesh.addNode(-28.7088, -142.5, 761.899, 209)
-    femmesh.addNode(25.9364, -142.5, 688.886, 210)
-    femmesh.addNode(26.286, -142.5, 739.662, 211)
-    femmesh.addNode(83.898, -142.5, 419.24, 212)
-    femmesh.addNode(83.8166, -142.5, 469.052, 213)
-    femmesh.addNode(83.8027, -142.5, 519.019, 214)
-    femmesh.addNode(83.8003, -142.5, 569.008, 215)
-    femmesh.addNode(83.7654, -142.5, 618.944, 216)
-    femmesh.addNode(83.7483, -142.5, 668.918, 217)
-    femmesh.addNode(83.8412, -142.5, 719.32, 218)
-    femmesh.addNode(83.8309, -142.5, 769.498, 219)
-    femmesh.addNode(-84.4689, -142.5, 781.957, 220)
-    femmesh.addNode(-84.293, -142.5, 832.127, 221)
-    femmesh.addNode(-83.9065, -142.5, 883.976, 222)
-    femmesh.addNode(-80.6013, -142.5, 944.348, 223)
-    femmesh.addNode(-29.0855, -142.5, 811.479, 224)
-    femmesh.addNode(-29.2116, -142.5, 861.667, 225)
-    femmesh.addNode(26.5134, -142.5, 789.781, 226)
-    femmesh.addNode(26.129, -142.5, 839.33, 227)
-    femmesh.addNode(-28.4518, -142.5, 914.46, 228)
-    femmesh.addNode(-26.4487, -142.5, 961.198, 229)
-    femmesh.addNode(26.0999, -142.5, 891.348, 230)
-    femmesh.addNode(25.5438, -142.5, 949.788, 231)
-    femmesh.addNode(83.9044, -142.5, 819.276, 232)
-    femmesh.addNode(83.834, -142.5, 869.725, 233)
-    femmesh.addNode(83.119, -142.5, 920.663, 234)
-    femmesh.addNode(78.7325, -142.5, 964.09, 235)
-    femmesh.addNode(142.5, 142.5, 0.0, 236)
-    femmesh.addNode(142.5, 142.5, 1000.0, 237)
-    femmesh.addNode(142.5, -95.0, 0.0, 238)
-    femmesh.addNode(142.5, -47.5, 0.0, 239)
-    femmesh.addNode(142.5, 0.0, 0.0, 240)
-    femmesh.addNode(142.5, 47.5, 0.0, 241)
-    femmesh.addNode(142.5, 95.0, 0.0, 242)
-    femmesh.addNode(142.5, -95.0, 1000.0, 243)
-    femmesh.addNode(142.5, -47.5, 1000.0, 244)
-    femmesh.addNode(142.5, 0.0, 1000.0, 245)
-    femmesh.addNode(142.5, 47.5, 1000.0, 246)
-    femmesh.addNode(142.5, 95.0, 1000.0, 247)
-    femmesh.addNode(142.5, 142.5, 50.0, 248)
-    femmesh.addNode(142.5, 142.5, 100.0, 249)
-    femmesh.addNode(142.5, 142.5, 150.0, 250)
-    femmesh.addNode(142.5, 142.5, 200.0, 251)
-    femmesh.addNode(142.5, 142.5, 250.0, 252)
-    femmesh.addNode(142.5, 142.5, 300.0, 253)
-    femmesh.addNode(142.5, 142.5, 350.0, 254)
-    femmesh.addNode(142.5, 142.5, 400.0, 255)
-    femmesh.addNode(142.5, 142.5, 450.0, 256)
-    femmesh.addNode(142.5, 142.5, 500.0, 257)
-    femmesh.addNode(142.5, 142.5, 550.0, 258)
-    femmesh.addNode(142.5, 142.5, 600.0, 259)
-    femmesh.addNode(142.5, 142.5, 650.0, 260)
-    femmesh.addNode(142.5, 142.5, 700.0, 261)
-    femmesh.addNode(142.5, 142.5, 750.0, 262)
-    femmesh.addNode(142.5, 142.5, 800.0, 263)
-    femmesh.addNode(142.5, 142.5, 850.0, 264)
-    femmesh.addNode(142.5, 142.5, 900.0, 265)
-    femmesh.addNode(142.5, 142.5, 950.0, 266)
-    femmesh.addNode(142.5, -78.2801, 37.6071, 267)
-    femmesh.addNode(142.5, -82.8778, 81.1309, 268)
-    femmesh.addNode(142.5, -83.7987, 132.243, 269)
-    femmesh.addNode(142.5, -26.5975, 51.4008, 270)
-    femmesh.addNode(142.5, 24.9195, 38.6958, 271)
-    femmesh.addNode(142.5, -28.3071, 109.277, 272)
-    femmesh.addNode(142.5, -28.6437, 161.076, 273)
-    femmesh.addNode(142.5, 25.856, 84.5406, 274)
-    femmesh.addNode(142.5, 26.1584, 137.428, 275)
-    femmesh.addNode(142.5, -84.3969, 181.746, 276)
-    femmesh.addNode(142.5, -84.2758, 232.086, 277)
-    femmesh.addNode(142.5, -84.2827, 282.032, 278)
-    femmesh.addNode(142.5, -84.1337, 332.651, 279)
-    femmesh.addNode(142.5, -29.2616, 210.927, 280)
-    femmesh.addNode(142.5, -29.3967, 260.858, 281)
-    femmesh.addNode(142.5, 26.0842, 188.506, 282)
-    femmesh.addNode(142.5, 25.9315, 238.681, 283)
-    femmesh.addNode(142.5, -29.1757, 311.391, 284)
-    femmesh.addNode(142.5, -28.7076, 361.897, 285)
-    femmesh.addNode(142.5, 25.946, 288.852, 286)
-    femmesh.addNode(142.5, 26.2889, 339.654, 287)
-    femmesh.addNode(142.5, 79.9661, 55.4097, 288)
-    femmesh.addNode(142.5, 83.1462, 115.644, 289)
-    femmesh.addNode(142.5, 83.7177, 168.069, 290)
-    femmesh.addNode(142.5, 83.7677, 218.68, 291)
-    femmesh.addNode(142.5, 83.7551, 268.845, 292)
-    femmesh.addNode(142.5, 83.8444, 319.301, 293)
-    femmesh.addNode(142.5, 83.832, 369.493, 294)
-    femmesh.addNode(142.5, -84.4685, 381.956, 295)
-    femmesh.addNode(142.5, -84.2929, 432.126, 296)
-    femmesh.addNode(142.5, -84.2867, 482.039, 297)
-    femmesh.addNode(142.5, -84.1346, 532.653, 298)
-    femmesh.addNode(142.5, -29.0852, 411.479, 299)
-    femmesh.addNode(142.5, -29.3382, 461.022, 300)
-    femmesh.addNode(142.5, 26.5143, 389.778, 301)
-    femmesh.addNode(142.5, 26.0976, 439.168, 302)
-    femmesh.addNode(142.5, -29.1615, 511.431, 303)
-    femmesh.addNode(142.5, -28.887, 561.607, 304)
-    femmesh.addNode(142.5, 26.0013, 489.005, 305)
-    femmesh.addNode(142.5, 26.0668, 539.096, 306)
-    femmesh.addNode(142.5, -84.4986, 581.908, 307)
-    femmesh.addNode(142.5, -84.2979, 632.118, 308)
-    femmesh.addNode(142.5, -84.2875, 682.038, 309)
-    femmesh.addNode(142.5, -84.1347, 732.652, 310)
-    femmesh.addNode(142.5, -29.3337, 611.072, 311)
-    femmesh.addNode(142.5, -29.4161, 660.894, 312)
-    femmesh.addNode(142.5, 26.0193, 588.998, 313)
-    femmesh.addNode(142.5, 25.9036, 638.814, 314)
-    femmesh.addNode(142.5, -29.1806, 711.4, 315)
-    femmesh.addNode(142.5, -28.7088, 761.899, 316)
-    femmesh.addNode(142.5, 25.9364, 688.886, 317)
-    femmesh.addNode(142.5, 26.286, 739.662, 318)
-    femmesh.addNode(142.5, 83.898, 419.24, 319)
-    femmesh.addNode(142.5, 83.8166, 469.052, 320)
-    femmesh.addNode(142.5, 83.8027, 519.019, 321)
-    femmesh.addNode(142.5, 83.8003, 569.008, 322)
-    femmesh.addNode(142.5, 83.7654, 618.944, 323)
-    femmesh.addNode(142.5, 83.7483, 668.918, 324)
-    femmesh.addNode(142.5, 83.8412, 719.32, 325)
-    femmesh.addNode(142.5, 83.8309, 769.498, 326)
-    femmesh.addNode(142.5, -84.4689, 781.957, 327)
-    femmesh.addNode(142.5, -84.293, 832.127, 328)
-    femmesh.addNode(142.5, -83.9065, 883.976, 329)
-    femmesh.addNode(142.5, -80.6013, 944.348, 330)
-    femmesh.addNode(142.5, -29.0855, 811.479, 331)
-    femmesh.addNode(142.5, -29.2116, 861.667, 332)
-    femmesh.addNode(142.5, 26.5134, 789.781, 333)
-    femmesh.addNode(142.5, 26.129, 839.33, 334)
-    femmesh.addNode(142.5, -28.4518, 914.46, 335)
-    femmesh.addNode(142.5, -26.4487, 961.198, 336)
-    femmesh.addNode(142.5, 26.0999, 891.348, 337)
-    femmesh.addNode(142.5, 25.5438, 949.788, 338)
-    femmesh.addNode(142.5, 83.9044, 819.276, 339)
-    femmesh.addNode(142.5, 83.834, 869.725, 340)
-    femmesh.addNode(142.5, 83.119, 920.663, 341)
-    femmesh.addNode(142.5, 78.7325, 964.09, 342)
-    femmesh.addNode(95.0, 142.5, 0.0, 343)
-    femmesh.addNode(47.5, 142.5, 0.0, 344)
-    femmesh.addNode(0.0, 142.5, 0.0, 345)
-    femmesh.addNode(-47.5, 142.5, 0.0, 346)
-    femmesh.addNode(-95.0, 142.5, 0.0, 347)
-    femmesh.addNode(95.0, 142.5, 1000.0, 348)
-    femmesh.addNode(47.5, 142.5, 1000.0, 349)
-    femmesh.addNode(0.0, 142.5, 1000.0, 350)
-    femmesh.addNode(-47.5, 142.5, 1000.0, 351)
-    femmesh.addNode(-95.0, 142.5, 1000.0, 352)
-    femmesh.addNode(78.2801, 142.5, 37.6071, 353)
-    femmesh.addNode(82.8778, 142.5, 81.1309, 354)
-    femmesh.addNode(83.7987, 142.5, 132.243, 355)
-    femmesh.addNode(26.5975, 142.5, 51.4008, 356)
-    femmesh.addNode(-24.9195, 142.5, 38.6958, 357)
-    femmesh.addNode(28.3071, 142.5, 109.277, 358)
-    femmesh.addNode(28.6437, 142.5, 161.076, 359)
-    femmesh.addNode(-25.856, 142.5, 84.5406, 360)
-    femmesh.addNode(-26.1584, 142.5, 137.428, 361)
-    femmesh.addNode(84.3969, 142.5, 181.746, 362)
-    femmesh.addNode(84.2758, 142.5, 232.086, 363)
-    femmesh.addNode(84.2827, 142.5, 282.032, 364)
-    femmesh.addNode(84.1337, 142.5, 332.651, 365)
-    femmesh.addNode(29.2616, 142.5, 210.927, 366)
-    femmesh.addNode(29.3967, 142.5, 260.858, 367)
-    femmesh.addNode(-26.0842, 142.5, 188.506, 368)
-    femmesh.addNode(-25.9315, 142.5, 238.681, 369)
-    femmesh.addNode(29.1757, 142.5, 311.391, 370)
-    femmesh.addNode(28.7076, 142.5, 361.897, 371)
-    femmesh.addNode(-25.946, 142.5, 288.852, 372)
-    femmesh.addNode(-26.2889, 142.5, 339.654, 373)
-    femmesh.addNode(-79.9661, 142.5, 55.4097, 374)
-    femmesh.addNode(-83.1462, 142.5, 115.644, 375)
-    femmesh.addNode(-83.7177, 142.5, 168.069, 376)
-    femmesh.addNode(-83.7677, 142.5, 218.68, 377)
-    femmesh.addNode(-83.7551, 142.5, 268.845, 378)
-    femmesh.addNode(-83.8444, 142.5, 319.301, 379)
-    femmesh.addNode(-83.832, 142.5, 369.493, 380)
-    femmesh.addNode(84.4685, 142.5, 381.956, 381)
-    femmesh.addNode(84.2929, 142.5, 432.126, 382)
-    femmesh.addNode(84.2867, 142.5, 482.039, 383)
-    femmesh.addNode(84.1346, 142.5, 532.653, 384)
-    femmesh.addNode(29.0852, 142.5, 411.479, 385)
-    femmesh.addNode(29.3382, 142.5, 461.022, 386)
-    femmesh.addNode(-26.5143, 142.5, 389.778, 387)
-    femmesh.addNode(-26.0976, 142.5, 439.168, 388)
-    femmesh.addNode(29.1615, 142.5, 511.431, 389)
-    femmesh.addNode(28.887, 142.5, 561.607, 390)
-    femmesh.addNode(-26.0013, 142.5, 489.005, 391)
-    femmesh.addNode(-26.0668, 142.5, 539.096, 392)
-    femmesh.addNode(84.4986, 142.5, 581.908, 393)
-    femmesh.addNode(84.2979, 142.5, 632.118, 394)
-    femmesh.addNode(84.2875, 142.5, 682.038, 395)
-    femmesh.addNode(84.1347, 142.5, 732.652, 396)
-    femmesh.addNode(29.3337, 142.5, 611.072, 397)
-    femmesh.addNode(29.4161, 142.5, 660.894, 398)
-    femmesh.addNode(-26.0193, 142.5, 588.998, 399)
-    femmesh.addNode(-25.9036, 142.5, 638.814, 400)
-    femmesh.addNode(29.1806, 142.5, 711.4, 401)
-    femmesh.addNode(28.7088, 142.5, 761.899, 402)
-    femmesh.addNode(-25.9364, 142.5, 688.886, 403)
-    femmesh.addNode(-26.286, 142.5, 739.662, 404)
-    femmesh.addNode(-83.898, 142.5, 419.24, 405)
-    femmesh.addNode(-83.8166, 142.5, 469.052, 406)
-    femmesh.addNode(-83.8027, 142.5, 519.019, 407)
-    femmesh.addNode(-83.8003, 142.5, 569.008, 408)
-    femmesh.addNode(-83.7654, 142.5, 618.944, 409)
-    femmesh.addNode(-83.7483, 142.5, 668.918, 410)
-    femmesh.addNode(-83.8412, 142.5, 719.32, 411)
-    femmesh.addNode(-83.8309, 142.5, 769.498, 412)
-    femmesh.addNode(84.4689, 142.5, 781.957, 413)
-    femmesh.addNode(84.293, 142.5, 832.127, 414)
-    femmesh.addNode(83.9065, 142.5, 883.976, 415)
-    femmesh.addNode(80.6013, 142.5, 944.348, 416)
-    femmesh.addNode(29.0855, 142.5, 811.479, 417)
-    femmesh.addNode(29.2116, 142.5, 861.667, 418)
-    femmesh.addNode(-26.5134, 142.5, 789.781, 419)
-    femmesh.addNode(-26.129, 142.5, 839.33, 420)
-    femmesh.addNode(28.4518, 142.5, 914.46, 421)
-    femmesh.addNode(26.4487, 142.5, 961.198, 422)
-    femmesh.addNode(-26.0999, 142.5, 891.348, 423)
-    femmesh.addNode(-25.5438, 142.5, 949.788, 424)
-    femmesh.addNode(-83.9044, 142.5, 819.276, 425)
-    femmesh.addNode(-83.834, 142.5, 869.725, 426)
-    femmesh.addNode(-83.119, 142.5, 920.663, 427)
-    femmesh.addNode(-78.7325, 142.5, 964.09, 428)
-    femmesh.addNode(-142.5, 118.75, 0.0, 429)
-    femmesh.addNode(-142.5, 142.5, 25.0, 430)
-    femmesh.addNode(-142.5, -118.75, 0.0, 431)
-    femmesh.addNode(-142.5, -142.5, 25.0, 432)
-    femmesh.addNode(-142.5, 142.5, 975.0, 433)
-    femmesh.addNode(-142.5, 118.75, 1000.0, 434)
-    femmesh.addNode(-142.5, -118.75, 1000.0, 435)
-    femmesh.addNode(-142.5, -142.5, 975.0, 436)
-    femmesh.addNode(-142.5, 71.25, 0.0, 437)
-    femmesh.addNode(-142.5, 118.75, 25.0, 438)
-    femmesh.addNode(-142.5, 86.6401, 18.8035, 439)
-    femmesh.addNode(-142.5, 23.75, 0.0, 440)
-    femmesh.addNode(-142.5, 62.8901, 18.8035, 441)
-    femmesh.addNode(-142.5, 37.0488, 25.7004, 442)
-    femmesh.addNode(-142.5, -23.75, 0.0, 443)
-    femmesh.addNode(-142.5, 13.2988, 25.7004, 444)
-    femmesh.addNode(-142.5, -12.4598, 19.3479, 445)
-    femmesh.addNode(-142.5, -71.25, 0.0, 446)
-    femmesh.addNode(-142.5, -36.2098, 19.3479, 447)
-    femmesh.addNode(-142.5, -63.7331, 27.7049, 448)
-    femmesh.addNode(-142.5, -118.75, 25.0, 449)
-    femmesh.addNode(-142.5, -87.4831, 27.7049, 450)
-    femmesh.addNode(-142.5, 142.5, 75.0, 451)
-    femmesh.addNode(-142.5, 110.39, 43.8035, 452)
-    femmesh.addNode(-142.5, 112.689, 65.5654, 453)
-    femmesh.addNode(-142.5, 142.5, 125.0, 454)
-    femmesh.addNode(-142.5, 112.689, 90.5654, 455)
-    femmesh.addNode(-142.5, 113.149, 116.121, 456)
-    femmesh.addNode(-142.5, 142.5, 175.0, 457)
-    femmesh.addNode(-142.5, 113.149, 141.121, 458)
-    femmesh.addNode(-142.5, 113.448, 165.873, 459)
-    femmesh.addNode(-142.5, 142.5, 225.0, 460)
-    femmesh.addNode(-142.5, 113.448, 190.873, 461)
-    femmesh.addNode(-142.5, 113.388, 216.043, 462)
-    femmesh.addNode(-142.5, 142.5, 275.0, 463)
-    femmesh.addNode(-142.5, 113.388, 241.043, 464)
-    femmesh.addNode(-142.5, 113.391, 266.016, 465)
-    femmesh.addNode(-142.5, 142.5, 325.0, 466)
-    femmesh.addNode(-142.5, 113.391, 291.016, 467)
-    femmesh.addNode(-142.5, 113.317, 316.326, 468)
-    femmesh.addNode(-142.5, 142.5, 375.0, 469)
-    femmesh.addNode(-142.5, 113.317, 341.326, 470)
-    femmesh.addNode(-142.5, 113.484, 365.978, 471)
-    femmesh.addNode(-142.5, 142.5, 425.0, 472)
-    femmesh.addNode(-142.5, 113.484, 390.978, 473)
-    femmesh.addNode(-142.5, 113.396, 416.063, 474)
-    femmesh.addNode(-142.5, 142.5, 475.0, 475)
-    femmesh.addNode(-142.5, 113.396, 441.063, 476)
-    femmesh.addNode(-142.5, 113.393, 466.02, 477)
-    femmesh.addNode(-142.5, 142.5, 525.0, 478)
-    femmesh.addNode(-142.5, 113.393, 491.02, 479)
-    femmesh.addNode(-142.5, 113.317, 516.326, 480)
-    femmesh.addNode(-142.5, 142.5, 575.0, 481)
-    femmesh.addNode(-142.5, 113.317, 541.326, 482)
-    femmesh.addNode(-142.5, 113.499, 565.954, 483)
-    femmesh.addNode(-142.5, 142.5, 625.0, 484)
-    femmesh.addNode(-142.5, 113.499, 590.954, 485)
-    femmesh.addNode(-142.5, 113.399, 616.059, 486)
-    femmesh.addNode(-142.5, 142.5, 675.0, 487)
-    femmesh.addNode(-142.5, 113.399, 641.059, 488)
-    femmesh.addNode(-142.5, 113.394, 666.019, 489)
-    femmesh.addNode(-142.5, 142.5, 725.0, 490)
-    femmesh.addNode(-142.5, 113.394, 691.019, 491)
-    femmesh.addNode(-142.5, 113.317, 716.326, 492)
-    femmesh.addNode(-142.5, 142.5, 775.0, 493)
-    femmesh.addNode(-142.5, 113.317, 741.326, 494)
-    femmesh.addNode(-142.5, 113.484, 765.978, 495)
-    femmesh.addNode(-142.5, 142.5, 825.0, 496)
-    femmesh.addNode(-142.5, 113.484, 790.978, 497)
-    femmesh.addNode(-142.5, 113.396, 816.063, 498)
-    femmesh.addNode(-142.5, 142.5, 875.0, 499)
-    femmesh.addNode(-142.5, 113.396, 841.063, 500)
-    femmesh.addNode(-142.5, 113.203, 866.988, 501)
-    femmesh.addNode(-142.5, 142.5, 925.0, 502)
-    femmesh.addNode(-142.5, 113.203, 891.988, 503)
-    femmesh.addNode(-142.5, 111.551, 922.174, 504)
-    femmesh.addNode(-142.5, 118.75, 975.0, 505)
-    femmesh.addNode(-142.5, 111.551, 947.174, 506)
-    femmesh.addNode(-142.5, 71.25, 1000.0, 507)
-    femmesh.addNode(-142.5, 87.8006, 972.174, 508)
-    femmesh.addNode(-142.5, 23.75, 1000.0, 509)
-    femmesh.addNode(-142.5, 64.0506, 972.174, 510)
-    femmesh.addNode(-142.5, 36.9743, 980.599, 511)
-    femmesh.addNode(-142.5, -23.75, 1000.0, 512)
-    femmesh.addNode(-142.5, 13.2243, 980.599, 513)
-    femmesh.addNode(-142.5, -12.7719, 974.894, 514)
-    femmesh.addNode(-142.5, -71.25, 1000.0, 515)
-    femmesh.addNode(-142.5, -36.5219, 974.894, 516)
-    femmesh.addNode(-142.5, -63.1163, 982.045, 517)
-    femmesh.addNode(-142.5, -118.75, 975.0, 518)
-    femmesh.addNode(-142.5, -86.8663, 982.045, 519)
-    femmesh.addNode(-142.5, -142.5, 75.0, 520)
-    femmesh.addNode(-142.5, -111.233, 52.7049, 521)
-    femmesh.addNode(-142.5, -142.5, 125.0, 522)
-    femmesh.addNode(-142.5, -111.233, 77.7049, 523)
-    femmesh.addNode(-142.5, -112.823, 107.822, 524)
-    femmesh.addNode(-142.5, -142.5, 175.0, 525)
-    femmesh.addNode(-142.5, -112.823, 132.822, 526)
-    femmesh.addNode(-142.5, -113.109, 159.034, 527)
-    femmesh.addNode(-142.5, -142.5, 225.0, 528)
-    femmesh.addNode(-142.5, -113.109, 184.034, 529)
-    femmesh.addNode(-142.5, -113.134, 209.34, 530)
-    femmesh.addNode(-142.5, -142.5, 275.0, 531)
-    femmesh.addNode(-142.5, -113.134, 234.34, 532)
-    femmesh.addNode(-142.5, -113.128, 259.422, 533)
-    femmesh.addNode(-142.5, -142.5, 325.0, 534)
-    femmesh.addNode(-142.5, -113.128, 284.422, 535)
-    femmesh.addNode(-142.5, -113.172, 309.65, 536)
-    femmesh.addNode(-142.5, -142.5, 375.0, 537)
-    femmesh.addNode(-142.5, -113.172, 334.65, 538)
-    femmesh.addNode(-142.5, -113.166, 359.747, 539)
-    femmesh.addNode(-142.5, -142.5, 425.0, 540)
-    femmesh.addNode(-142.5, -113.166, 384.747, 541)
-    femmesh.addNode(-142.5, -113.199, 409.62, 542)
-    femmesh.addNode(-142.5, -142.5, 475.0, 543)
-    femmesh.addNode(-142.5, -113.199, 434.62, 544)
-    femmesh.addNode(-142.5, -113.158, 459.526, 545)
-    femmesh.addNode(-142.5, -142.5, 525.0, 546)
-    femmesh.addNode(-142.5, -113.158, 484.526, 547)
-    femmesh.addNode(-142.5, -113.151, 509.51, 548)
-    femmesh.addNode(-142.5, -142.5, 575.0, 549)
-    femmesh.addNode(-142.5, -113.151, 534.51, 550)
-    femmesh.addNode(-142.5, -113.15, 559.504, 551)
-    femmesh.addNode(-142.5, -142.5, 625.0, 552)
-    femmesh.addNode(-142.5, -113.15, 584.504, 553)
-    femmesh.addNode(-142.5, -113.133, 609.472, 554)
-    femmesh.addNode(-142.5, -142.5, 675.0, 555)
-    femmesh.addNode(-142.5, -113.133, 634.472, 556)
-    femmesh.addNode(-142.5, -113.124, 659.459, 557)
-    femmesh.addNode(-142.5, -142.5, 725.0, 558)
-    femmesh.addNode(-142.5, -113.124, 684.459, 559)
-    femmesh.addNode(-142.5, -113.171, 709.66, 560)
-    femmesh.addNode(-142.5, -142.5, 775.0, 561)
-    femmesh.addNode(-142.5, -113.171, 734.66, 562)
-    femmesh.addNode(-142.5, -113.165, 759.749, 563)
-    femmesh.addNode(-142.5, -142.5, 825.0, 564)
-    femmesh.addNode(-142.5, -113.165, 784.749, 565)
-    femmesh.addNode(-142.5, -113.202, 809.638, 566)
-    femmesh.addNode(-142.5, -142.5, 875.0, 567)
-    femmesh.addNode(-142.5, -113.202, 834.638, 568)
-    femmesh.addNode(-142.5, -113.167, 859.862, 569)
-    femmesh.addNode(-142.5, -142.5, 925.0, 570)
-    femmesh.addNode(-142.5, -113.167, 884.862, 571)
-    femmesh.addNode(-142.5, -112.809, 910.331, 572)
-    femmesh.addNode(-142.5, -112.809, 935.331, 573)
-    femmesh.addNode(-142.5, -110.616, 957.045, 574)
-    femmesh.addNode(-142.5, 80.579, 59.369, 575)
-    femmesh.addNode(-142.5, 52.4388, 44.5039, 576)
-    femmesh.addNode(-142.5, 83.3383, 106.687, 577)
-    femmesh.addNode(-142.5, 54.7377, 66.2659, 578)
-    femmesh.addNode(-142.5, 55.5925, 95.204, 579)
-    femmesh.addNode(-142.5, 56.0529, 120.76, 580)
-    femmesh.addNode(-142.5, 56.2212, 146.66, 581)
-    femmesh.addNode(-142.5, 84.0978, 156.995, 582)
-    femmesh.addNode(-142.5, 0.839004, 45.0483, 583)
-    femmesh.addNode(-142.5, 27.4523, 80.3389, 584)
-    femmesh.addNode(-142.5, 0.370743, 67.9707, 585)
-    femmesh.addNode(-142.5, -25.3878, 61.6182, 586)
-    femmesh.addNode(-142.5, -52.4428, 47.0528, 587)
-    femmesh.addNode(-142.5, 28.4754, 135.177, 588)
-    femmesh.addNode(-142.5, 1.22553, 96.9088, 589)
-    femmesh.addNode(-142.5, 1.07434, 123.353, 590)
-    femmesh.addNode(-142.5, 1.24264, 149.252, 591)
-    femmesh.addNode(-142.5, 56.5203, 171.411, 592)
-    femmesh.addNode(-142.5, 28.9526, 186.002, 593)
-    femmesh.addNode(-142.5, 1.27977, 174.791, 594)
-    femmesh.addNode(-142.5, -26.0072, 110.985, 595)
-    femmesh.addNode(-142.5, -52.9111, 69.9752, 596)
-    femmesh.addNode(-142.5, -54.5011, 100.092, 597)
-    femmesh.addNode(-142.5, -26.1213, 162.967, 598)
-    femmesh.addNode(-142.5, -54.6523, 126.536, 599)
-    femmesh.addNode(-142.5, -54.938, 152.749, 600)
-    femmesh.addNode(-142.5, 84.3363, 206.916, 601)
-    femmesh.addNode(-142.5, 56.8292, 196.337, 602)
-    femmesh.addNode(-142.5, 84.2793, 257.059, 603)
-    femmesh.addNode(-142.5, 56.7687, 221.506, 604)
-    femmesh.addNode(-142.5, 56.8363, 246.472, 605)
-    femmesh.addNode(-142.5, 84.2082, 307.341, 606)
-    femmesh.addNode(-142.5, 56.8397, 271.445, 607)
-    femmesh.addNode(-142.5, 56.7292, 296.711, 608)
-    femmesh.addNode(-142.5, 56.6547, 322.021, 609)
-    femmesh.addNode(-142.5, 56.4206, 347.274, 610)
-    femmesh.addNode(-142.5, 84.3011, 357.304, 611)
-    femmesh.addNode(-142.5, 29.3292, 235.893, 612)
-    femmesh.addNode(-142.5, 1.58871, 199.717, 613)
-    femmesh.addNode(-142.5, 1.66506, 224.804, 614)
-    femmesh.addNode(-142.5, 1.73262, 249.769, 615)
-    femmesh.addNode(-142.5, 29.2862, 286.125, 616)
-    femmesh.addNode(-142.5, 1.72536, 274.855, 617)
-    femmesh.addNode(-142.5, -26.0078, 213.593, 618)
-    femmesh.addNode(-142.5, -54.9009, 178.287, 619)
-    femmesh.addNode(-142.5, -54.9259, 203.593, 620)
-    femmesh.addNode(-142.5, -25.9387, 263.766, 621)
-    femmesh.addNode(-142.5, -54.8496, 228.68, 622)
-    femmesh.addNode(-142.5, -54.8433, 253.763, 623)
-    femmesh.addNode(-142.5, 28.9416, 336.644, 624)
-    femmesh.addNode(-142.5, 1.61485, 300.122, 625)
-    femmesh.addNode(-142.5, 1.44341, 325.522, 626)
-    femmesh.addNode(-142.5, 1.20936, 350.775, 627)
-    femmesh.addNode(-142.5, 56.588, 371.927, 628)
-    femmesh.addNode(-142.5, 28.8964, 386.688, 629)
-    femmesh.addNode(-142.5, 1.09664, 375.838, 630)
-    femmesh.addNode(-142.5, -26.1174, 314.253, 631)
-    femmesh.addNode(-142.5, -54.8505, 278.848, 632)
-    femmesh.addNode(-142.5, -54.8952, 304.076, 633)
-    femmesh.addNode(-142.5, -55.0667, 329.477, 634)
-    femmesh.addNode(-142.5, -55.0604, 354.573, 635)
-    femmesh.addNode(-142.5, -26.4016, 364.716, 636)
-    femmesh.addNode(-142.5, -81.5561, 85.5268, 637)
-    femmesh.addNode(-142.5, -83.4319, 141.856, 638)
-    femmesh.addNode(-142.5, -83.7427, 193.374, 639)
-    femmesh.addNode(-142.5, -83.7614, 243.762, 640)
-    femmesh.addNode(-142.5, -83.7998, 294.073, 641)
-    femmesh.addNode(-142.5, -83.8382, 344.397, 642)
-    femmesh.addNode(-142.5, -55.1731, 379.636, 643)
-    femmesh.addNode(-142.5, -83.865, 394.367, 644)
-    femmesh.addNode(-142.5, 84.3807, 407.041, 645)
-    femmesh.addNode(-142.5, 56.7768, 396.717, 646)
-    femmesh.addNode(-142.5, 84.2898, 457.083, 647)
-    femmesh.addNode(-142.5, 56.6891, 421.803, 648)
-    femmesh.addNode(-142.5, 56.8156, 446.574, 649)
-    femmesh.addNode(-142.5, 84.2106, 507.346, 650)
-    femmesh.addNode(-142.5, 56.8125, 471.53, 651)
-    femmesh.addNode(-142.5, 56.7241, 496.735, 652)
-    femmesh.addNode(-142.5, 56.6481, 522.042, 653)
-    femmesh.addNode(-142.5, 56.5108, 547.13, 654)
-    femmesh.addNode(-142.5, 84.3166, 557.28, 655)
-    femmesh.addNode(-142.5, 29.2117, 436.25, 656)
-    femmesh.addNode(-142.5, 1.28543, 400.628, 657)
-    femmesh.addNode(-142.5, 1.4938, 425.323, 658)
-    femmesh.addNode(-142.5, 1.62033, 450.095, 659)
-    femmesh.addNode(-142.5, 29.2499, 486.226, 660)
-    femmesh.addNode(-142.5, 1.66847, 475.013, 661)
-    femmesh.addNode(-142.5, -26.3059, 414.473, 662)
-    femmesh.addNode(-142.5, -55.2062, 404.509, 663)
-    femmesh.addNode(-142.5, -26.0494, 464.087, 664)
-    femmesh.addNode(-142.5, -54.9978, 429.204, 665)
-    femmesh.addNode(-142.5, -54.9571, 454.11, 666)
-    femmesh.addNode(-142.5, 29.0243, 536.519, 667)
-    femmesh.addNode(-142.5, 1.58012, 500.218, 668)
-    femmesh.addNode(-142.5, 1.54736, 525.264, 669)
-    femmesh.addNode(-142.5, 1.4101, 550.352, 670)
-    femmesh.addNode(-142.5, 56.6928, 571.757, 671)
-    femmesh.addNode(-142.5, 29.1104, 586.339, 672)
-    femmesh.addNode(-142.5, 1.43386, 575.302, 673)
-    femmesh.addNode(-142.5, -26.0341, 514.051, 674)
-    femmesh.addNode(-142.5, -54.9089, 479.029, 675)
-    femmesh.addNode(-142.5, -54.902, 504.012, 676)
-    femmesh.addNode(-142.5, -26.0431, 564.047, 677)
-    femmesh.addNode(-142.5, -54.9347, 529.058, 678)
-    femmesh.addNode(-142.5, -54.9336, 554.052, 679)
-    femmesh.addNode(-142.5, 84.3983, 607.013, 680)
-    femmesh.addNode(-142.5, 56.9161, 596.49, 681)
-    femmesh.addNode(-142.5, 84.2927, 657.078, 682)
-    femmesh.addNode(-142.5, 56.8158, 621.595, 683)
-    femmesh.addNode(-142.5, 56.857, 646.506, 684)
-    femmesh.addNode(-142.5, 84.2111, 707.345, 685)
-    femmesh.addNode(-142.5, 56.8518, 671.466, 686)
-    femmesh.addNode(-142.5, 56.734, 696.719, 687)
-    femmesh.addNode(-142.5, 56.6577, 722.026, 688)
-    femmesh.addNode(-142.5, 56.4217, 747.276, 689)
-    femmesh.addNode(-142.5, 84.3018, 757.304, 690)
-    femmesh.addNode(-142.5, 29.3749, 635.983, 691)
-    femmesh.addNode(-142.5, 1.65719, 600.035, 692)
-    femmesh.addNode(-142.5, 1.71503, 624.943, 693)
-    femmesh.addNode(-142.5, 1.75623, 649.854, 694)
-    femmesh.addNode(-142.5, 29.2983, 686.147, 695)
-    femmesh.addNode(-142.5, 1.73983, 674.89, 696)
-    femmesh.addNode(-142.5, -25.9615, 613.906, 697)
-    femmesh.addNode(-142.5, -54.9098, 579.003, 698)
-    femmesh.addNode(-142.5, -54.8924, 603.971, 699)
-    femmesh.addNode(-142.5, -25.92, 663.85, 700)
-    femmesh.addNode(-142.5, -54.8345, 628.879, 701)
-    femmesh.addNode(-142.5, -54.8259, 653.866, 702)
-    femmesh.addNode(-142.5, 28.9447, 736.649, 703)
-    femmesh.addNode(-142.5, 1.62209, 700.143, 704)
-    femmesh.addNode(-142.5, 1.44731, 725.531, 705)
-    femmesh.addNode(-142.5, 1.2114, 750.781, 706)
-    femmesh.addNode(-142.5, 56.5888, 771.928, 707)
-    femmesh.addNode(-142.5, 28.8971, 786.689, 708)
-    femmesh.addNode(-142.5, 1.09769, 775.84, 709)
-    femmesh.addNode(-142.5, -26.1112, 714.274, 710)
-    femmesh.addNode(-142.5, -54.8423, 678.902, 711)
-    femmesh.addNode(-142.5, -54.8888, 704.103, 712)
-    femmesh.addNode(-142.5, -55.0636, 729.491, 713)
-    femmesh.addNode(-142.5, -55.0584, 754.58, 714)
-    femmesh.addNode(-142.5, -26.3997, 764.721, 715)
-    femmesh.addNode(-142.5, -83.8573, 444.146, 716)
-    femmesh.addNode(-142.5, -83.8096, 494.035, 717)
-    femmesh.addNode(-142.5, -83.8015, 544.014, 718)
-    femmesh.addNode(-142.5, -83.7829, 593.976, 719)
-    femmesh.addNode(-142.5, -83.7569, 643.931, 720)
-    femmesh.addNode(-142.5, -83.7947, 694.119, 721)
-    femmesh.addNode(-142.5, -83.836, 744.409, 722)
-    femmesh.addNode(-142.5, -55.1721, 779.639, 723)
-    femmesh.addNode(-142.5, -83.8677, 794.387, 724)
-    femmesh.addNode(-142.5, 84.3809, 807.042, 725)
-    femmesh.addNode(-142.5, 56.7772, 796.718, 726)
-    femmesh.addNode(-142.5, 84.0997, 858.051, 727)
-    femmesh.addNode(-142.5, 56.6892, 821.803, 728)
-    femmesh.addNode(-142.5, 56.7523, 846.897, 729)
-    femmesh.addNode(-142.5, 82.2539, 914.162, 730)
-    femmesh.addNode(-142.5, 56.559, 872.821, 731)
-    femmesh.addNode(-142.5, 56.1791, 899.218, 732)
-    femmesh.addNode(-142.5, 54.5266, 929.404, 733)
-    femmesh.addNode(-142.5, 53.525, 952.773, 734)
-    femmesh.addNode(-142.5, 29.1485, 836.573, 735)
-    femmesh.addNode(-142.5, 1.28606, 800.63, 736)
-    femmesh.addNode(-142.5, 1.47824, 825.404, 737)
-    femmesh.addNode(-142.5, 1.54127, 850.498, 738)
-    femmesh.addNode(-142.5, 28.8317, 888.064, 739)
-    femmesh.addNode(-142.5, 1.55582, 876.507, 740)
-    femmesh.addNode(-142.5, -26.3212, 814.555, 741)
-    femmesh.addNode(-142.5, -55.2089, 804.528, 742)
-    femmesh.addNode(-142.5, -26.1145, 865.339, 743)
-    femmesh.addNode(-142.5, -55.0167, 829.303, 744)
-    femmesh.addNode(-142.5, -54.9815, 854.527, 745)
-    femmesh.addNode(-142.5, 27.4503, 937.829, 746)
-    femmesh.addNode(-142.5, 1.17596, 902.904, 747)
-    femmesh.addNode(-142.5, 1.45404, 932.124, 748)
-    femmesh.addNode(-142.5, 0.452457, 955.493, 749)
-    femmesh.addNode(-142.5, -25.8218, 920.568, 750)
-    femmesh.addNode(-142.5, -54.967, 880.536, 751)
-    femmesh.addNode(-142.5, -54.6094, 906.005, 752)
-    femmesh.addNode(-142.5, -54.3314, 935.226, 753)
-    femmesh.addNode(-142.5, -52.1382, 956.939, 754)
-    femmesh.addNode(-142.5, -83.8692, 844.501, 755)
-    femmesh.addNode(-142.5, -83.4765, 895.194, 756)
-    femmesh.addNode(-142.5, -80.9258, 942.377, 757)
-    femmesh.addNode(118.75, -142.5, 0.0, 758)
-    femmesh.addNode(142.5, -142.5, 25.0, 759)
-    femmesh.addNode(118.75, -142.5, 1000.0, 760)
-    femmesh.addNode(142.5, -142.5, 975.0, 761)
-    femmesh.addNode(-71.25, -142.5, 0.0, 762)
-    femmesh.addNode(-86.6401, -142.5, 18.8035, 763)
-    femmesh.addNode(-118.75, -142.5, 0.0, 764)
-    femmesh.addNode(-118.75, -142.5, 25.0, 765)
-    femmesh.addNode(-23.75, -142.5, 0.0, 766)
-    femmesh.addNode(-62.8901, -142.5, 18.8035, 767)
-    femmesh.addNode(-37.0488, -142.5, 25.7004, 768)
-    femmesh.addNode(23.75, -142.5, 0.0, 769)
-    femmesh.addNode(-13.2988, -142.5, 25.7004, 770)
-    femmesh.addNode(12.4598, -142.5, 19.3479, 771)
-    femmesh.addNode(71.25, -142.5, 0.0, 772)
-    femmesh.addNode(36.2098, -142.5, 19.3479, 773)
-    femmesh.addNode(63.7331, -142.5, 27.7049, 774)
-    femmesh.addNode(118.75, -142.5, 25.0, 775)
-    femmesh.addNode(87.4831, -142.5, 27.7049, 776)
-    femmesh.addNode(-71.25, -142.5, 1000.0, 777)
-    femmesh.addNode(-87.8006, -142.5, 972.174, 778)
-    femmesh.addNode(-118.75, -142.5, 975.0, 779)
-    femmesh.addNode(-118.75, -142.5, 1000.0, 780)
-    femmesh.addNode(-23.75, -142.5, 1000.0, 781)
-    femmesh.addNode(-64.0506, -142.5, 972.174, 782)
-    femmesh.addNode(-36.9743, -142.5, 980.599, 783)
-    femmesh.addNode(23.75, -142.5, 1000.0, 784)
-    femmesh.addNode(-13.2243, -142.5, 980.599, 785)
-    femmesh.addNode(12.7719, -142.5, 974.894, 786)
-    femmesh.addNode(71.25, -142.5, 1000.0, 787)
-    femmesh.addNode(36.5219, -142.5, 974.894, 788)
-    femmesh.addNode(63.1163, -142.5, 982.045, 789)
-    femmesh.addNode(118.75, -142.5, 975.0, 790)
-    femmesh.addNode(86.8663, -142.5, 982.045, 791)
-    femmesh.addNode(142.5, -142.5, 75.0, 792)
-    femmesh.addNode(111.233, -142.5, 52.7049, 793)
-    femmesh.addNode(142.5, -142.5, 125.0, 794)
-    femmesh.addNode(111.233, -142.5, 77.7049, 795)
-    femmesh.addNode(112.823, -142.5, 107.822, 796)
-    femmesh.addNode(142.5, -142.5, 175.0, 797)
-    femmesh.addNode(112.823, -142.5, 132.822, 798)
-    femmesh.addNode(113.109, -142.5, 159.034, 799)
-    femmesh.addNode(142.5, -142.5, 225.0, 800)
-    femmesh.addNode(113.109, -142.5, 184.034, 801)
-    femmesh.addNode(113.134, -142.5, 209.34, 802)
-    femmesh.addNode(142.5, -142.5, 275.0, 803)
-    femmesh.addNode(113.134, -142.5, 234.34, 804)
-    femmesh.addNode(113.128, -142.5, 259.422, 805)
-    femmesh.addNode(142.5, -142.5, 325.0, 806)
-    femmesh.addNode(113.128, -142.5, 284.422, 807)
-    femmesh.addNode(113.172, -142.5, 309.65, 808)
-    femmesh.addNode(142.5, -142.5, 375.0, 809)
-    femmesh.addNode(113.172, -142.5, 334.65, 810)
-    femmesh.addNode(113.166, -142.5, 359.747, 811)
-    femmesh.addNode(142.5, -142.5, 425.0, 812)
-    femmesh.addNode(113.166, -142.5, 384.747, 813)
-    femmesh.addNode(113.199, -142.5, 409.62, 814)
-    femmesh.addNode(142.5, -142.5, 475.0, 815)
-    femmesh.addNode(113.199, -142.5, 434.62, 816)
-    femmesh.addNode(113.158, -142.5, 459.526, 817)
-    femmesh.addNode(142.5, -142.5, 525.0, 818)
-    femmesh.addNode(113.158, -142.5, 484.526, 819)
-    femmesh.addNode(113.151, -142.5, 509.51, 820)
-    femmesh.addNode(142.5, -142.5, 575.0, 821)
-    femmesh.addNode(113.151, -142.5, 534.51, 822)
-    femmesh.addNode(113.15, -142.5, 559.504, 823)
-    femmesh.addNode(142.5, -142.5, 625.0, 824)
-    femmesh.addNode(113.15, -142.5, 584.504, 825)
-    femmesh.addNode(113.133, -142.5, 609.472, 826)
-    femmesh.addNode(142.5, -142.5, 675.0, 827)
-    femmesh.addNode(113.133, -142.5, 634.472, 828)
-    femmesh.addNode(113.124, -142.5, 659.459, 829)
-    femmesh.addNode(142.5, -142.5, 725.0, 830)
-    femmesh.addNode(113.124, -142.5, 684.459, 831)
-    femmesh.addNode(113.171, -142.5, 709.66, 832)
-    femmesh.addNode(142.5, -142.5, 775.0, 833)
-    femmesh.addNode(113.171, -142.5, 734.66, 834)
-    femmesh.addNode(113.165, -142.5, 759.749, 835)
-    femmesh.addNode(142.5, -142.5, 825.0, 836)
-    femmesh.addNode(113.165, -142.5, 784.749, 837)
-    femmesh.addNode(113.202, -142.5, 809.638, 838)
-    femmesh.addNode(142.5, -142.5, 875.0, 839)
-    femmesh.addNode(113.202, -142.5, 834.638, 840)
-    femmesh.addNode(113.167, -142.5, 859.862, 841)
-    femmesh.addNode(142.5, -142.5, 925.0, 842)
-    femmesh.addNode(113.167, -142.5, 884.862, 843)
-    femmesh.addNode(112.809, -142.5, 910.331, 844)
-    femmesh.addNode(112.809, -142.5, 935.331, 845)
-    femmesh.addNode(110.616, -142.5, 957.045, 846)
-    femmesh.addNode(-80.579, -142.5, 59.369, 847)
-    femmesh.addNode(-52.4388, -142.5, 44.5039, 848)
-    femmesh.addNode(-110.39, -142.5, 43.8035, 849)
-    femmesh.addNode(-83.3383, -142.5, 106.687, 850)
-    femmesh.addNode(-54.7377, -142.5, 66.2659, 851)
-    femmesh.addNode(-55.5925, -142.5, 95.204, 852)
-    femmesh.addNode(-112.689, -142.5, 65.5654, 853)
-    femmesh.addNode(-112.689, -142.5, 90.5654, 854)
-    femmesh.addNode(-56.0529, -142.5, 120.76, 855)
-    femmesh.addNode(-56.2212, -142.5, 146.66, 856)
-    femmesh.addNode(-84.0978, -142.5, 156.995, 857)
-    femmesh.addNode(-113.149, -142.5, 116.121, 858)
-    femmesh.addNode(-113.149, -142.5, 141.121, 859)
-    femmesh.addNode(-0.839004, -142.5, 45.0483, 860)
-    femmesh.addNode(-27.4523, -142.5, 80.3389, 861)
-    femmesh.addNode(-0.370743, -142.5, 67.9707, 862)
-    femmesh.addNode(25.3878, -142.5, 61.6182, 863)
-    femmesh.addNode(52.4428, -142.5, 47.0528, 864)
-    femmesh.addNode(-28.4754, -142.5, 135.177, 865)
-    femmesh.addNode(-1.22553, -142.5, 96.9088, 866)
-    femmesh.addNode(-1.07434, -142.5, 123.353, 867)
-    femmesh.addNode(-1.24264, -142.5, 149.252, 868)
-    femmesh.addNode(-56.5203, -142.5, 171.411, 869)
-    femmesh.addNode(-28.9526, -142.5, 186.002, 870)
-    femmesh.addNode(-1.27977, -142.5, 174.791, 871)
-    femmesh.addNode(26.0072, -142.5, 110.985, 872)
-    femmesh.addNode(52.9111, -142.5, 69.9752, 873)
-    femmesh.addNode(54.5011, -142.5, 100.092, 874)
-    femmesh.addNode(26.1213, -142.5, 162.967, 875)
-    femmesh.addNode(54.6523, -142.5, 126.536, 876)
-    femmesh.addNode(54.938, -142.5, 152.749, 877)
-    femmesh.addNode(-84.3363, -142.5, 206.916, 878)
-    femmesh.addNode(-56.8292, -142.5, 196.337, 879)
-    femmesh.addNode(-113.448, -142.5, 165.873, 880)
-    femmesh.addNode(-113.448, -142.5, 190.873, 881)
-    femmesh.addNode(-84.2793, -142.5, 257.059, 882)
-    femmesh.addNode(-56.7687, -142.5, 221.506, 883)
-    femmesh.addNode(-56.8363, -142.5, 246.472, 884)
-    femmesh.addNode(-113.388, -142.5, 216.043, 885)
-    femmesh.addNode(-113.388, -142.5, 241.043, 886)
-    femmesh.addNode(-84.2082, -142.5, 307.341, 887)
-    femmesh.addNode(-56.8397, -142.5, 271.445, 888)
-    femmesh.addNode(-56.7292, -142.5, 296.711, 889)
-    femmesh.addNode(-113.391, -142.5, 266.016, 890)
-    femmesh.addNode(-113.391, -142.5, 291.016, 891)
-    femmesh.addNode(-56.6547, -142.5, 322.021, 892)
-    femmesh.addNode(-56.4206, -142.5, 347.274, 893)
-    femmesh.addNode(-84.3011, -142.5, 357.304, 894)
-    femmesh.addNode(-113.317, -142.5, 316.326, 895)
-    femmesh.addNode(-113.317, -142.5, 341.326, 896)
-    femmesh.addNode(-29.3292, -142.5, 235.893, 897)
-    femmesh.addNode(-1.58871, -142.5, 199.717, 898)
-    femmesh.addNode(-1.66506, -142.5, 224.804, 899)
-    femmesh.addNode(-1.73262, -142.5, 249.769, 900)
-    femmesh.addNode(-29.2862, -142.5, 286.125, 901)
-    femmesh.addNode(-1.72536, -142.5, 274.855, 902)
-    femmesh.addNode(26.0078, -142.5, 213.593, 903)
-    femmesh.addNode(54.9009, -142.5, 178.287, 904)
-    femmesh.addNode(54.9259, -142.5, 203.593, 905)
-    femmesh.addNode(25.9387, -142.5, 263.766, 906)
-    femmesh.addNode(54.8496, -142.5, 228.68, 907)
-    femmesh.addNode(54.8433, -142.5, 253.763, 908)
-    femmesh.addNode(-28.9416, -142.5, 336.644, 909)
-    femmesh.addNode(-1.61485, -142.5, 300.122, 910)
-    femmesh.addNode(-1.44341, -142.5, 325.522, 911)
-    femmesh.addNode(-1.20936, -142.5, 350.775, 912)
-    femmesh.addNode(-56.588, -142.5, 371.927, 913)
-    femmesh.addNode(-28.8964, -142.5, 386.688, 914)
-    femmesh.addNode(-1.09664, -142.5, 375.838, 915)
-    femmesh.addNode(26.1174, -142.5, 314.253, 916)
-    femmesh.addNode(54.8505, -142.5, 278.848, 917)
-    femmesh.addNode(54.8952, -142.5, 304.076, 918)
-    femmesh.addNode(55.0667, -142.5, 329.477, 919)
-    femmesh.addNode(55.0604, -142.5, 354.573, 920)
-    femmesh.addNode(26.4016, -142.5, 364.716, 921)
-    femmesh.addNode(81.5561, -142.5, 85.5268, 922)
-    femmesh.addNode(83.4319, -142.5, 141.856, 923)
-    femmesh.addNode(83.7427, -142.5, 193.374, 924)
-    femmesh.addNode(83.7614, -142.5, 243.762, 925)
-    femmesh.addNode(83.7998, -142.5, 294.073, 926)
-    femmesh.addNode(83.8382, -142.5, 344.397, 927)
-    femmesh.addNode(55.1731, -142.5, 379.636, 928)
-    femmesh.addNode(83.865, -142.5, 394.367, 929)
-    femmesh.addNode(-84.3807, -142.5, 407.041, 930)
-    femmesh.addNode(-56.7768, -142.5, 396.717, 931)
-    femmesh.addNode(-113.484, -142.5, 365.978, 932)
-    femmesh.addNode(-113.484, -142.5, 390.978, 933)
-    femmesh.addNode(-84.2898, -142.5, 457.083, 934)
-    femmesh.addNode(-56.6891, -142.5, 421.803, 935)
-    femmesh.addNode(-56.8156, -142.5, 446.574, 936)
-    femmesh.addNode(-113.396, -142.5, 416.063, 937)
-    femmesh.addNode(-113.396, -142.5, 441.063, 938)
-    femmesh.addNode(-84.2106, -142.5, 507.346, 939)
-    femmesh.addNode(-56.8125, -142.5, 471.53, 940)
-    femmesh.addNode(-56.7241, -142.5, 496.735, 941)
-    femmesh.addNode(-113.393, -142.5, 491.02, 942)
-    femmesh.addNode(-113.393, -142.5, 466.02, 943)
-    femmesh.addNode(-56.6481, -142.5, 522.042, 944)
-    femmesh.addNode(-56.5108, -142.5, 547.13, 945)
-    femmesh.addNode(-84.3166, -142.5, 557.28, 946)
-    femmesh.addNode(-113.317, -142.5, 541.326, 947)
-    femmesh.addNode(-113.317, -142.5, 516.326, 948)
-    femmesh.addNode(-29.2117, -142.5, 436.25, 949)
-    femmesh.addNode(-1.28543, -142.5, 400.628, 950)
-    femmesh.addNode(-1.4938, -142.5, 425.323, 951)
-    femmesh.addNode(-1.62033, -142.5, 450.095, 952)
-    femmesh.addNode(-29.2499, -142.5, 486.226, 953)
-    femmesh.addNode(-1.66847, -142.5, 475.013, 954)
-    femmesh.addNode(26.3059, -142.5, 414.473, 955)
-    femmesh.addNode(55.2062, -142.5, 404.509, 956)
-    femmesh.addNode(26.0494, -142.5, 464.087, 957)
-    femmesh.addNode(54.9978, -142.5, 429.204, 958)
-    femmesh.addNode(54.9571, -142.5, 454.11, 959)
-    femmesh.addNode(-29.0243, -142.5, 536.519, 960)
-    femmesh.addNode(-1.58012, -142.5, 500.218, 961)
-    femmesh.addNode(-1.54736, -142.5, 525.264, 962)
-    femmesh.addNode(-1.4101, -142.5, 550.352, 963)
-    femmesh.addNode(-56.6928, -142.5, 571.757, 964)
-    femmesh.addNode(-29.1104, -142.5, 586.339, 965)
-    femmesh.addNode(-1.43386, -142.5, 575.302, 966)
-    femmesh.addNode(26.0341, -142.5, 514.051, 967)
-    femmesh.addNode(54.9089, -142.5, 479.029, 968)
-    femmesh.addNode(54.902, -142.5, 504.012, 969)
-    femmesh.addNode(26.0431, -142.5, 564.047, 970)
-    femmesh.addNode(54.9347, -142.5, 529.058, 971)
-    femmesh.addNode(54.9336, -142.5, 554.052, 972)
-    femmesh.addNode(-84.3983, -142.5, 607.013, 973)
-    femmesh.addNode(-56.9161, -142.5, 596.49, 974)
-    femmesh.addNode(-113.499, -142.5, 565.954, 975)
-    femmesh.addNode(-113.499, -142.5, 590.954, 976)
-    femmesh.addNode(-84.2927, -142.5, 657.078, 977)
-    femmesh.addNode(-56.8158, -142.5, 621.595, 978)
-    femmesh.addNode(-56.857, -142.5, 646.506, 979)
-    femmesh.addNode(-113.399, -142.5, 616.059, 980)
-    femmesh.addNode(-113.399, -142.5, 641.059, 981)
-    femmesh.addNode(-84.2111, -142.5, 707.345, 982)
-    femmesh.addNode(-56.8518, -142.5, 671.466, 983)
-    femmesh.addNode(-56.734, -142.5, 696.719, 984)
-    femmesh.addNode(-113.394, -142.5, 666.019, 985)
-    femmesh.addNode(-113.394, -142.5, 691.019, 986)
-    femmesh.addNode(-56.6577, -142.5, 722.026, 987)
-    femmesh.addNode(-56.4217, -142.5, 747.276, 988)
-    femmesh.addNode(-84.3018, -142.5, 757.304, 989)
-    femmesh.addNode(-113.317, -142.5, 716.326, 990)
-    femmesh.addNode(-113.317, -142.5, 741.326, 991)
-    femmesh.addNode(-29.3749, -142.5, 635.983, 992)
-    femmesh.addNode(-1.65719, -142.5, 600.035, 993)
-    femmesh.addNode(-1.71503, -142.5, 624.943, 994)
-    femmesh.addNode(-1.75623, -142.5, 649.854, 995)
-    femmesh.addNode(-29.2983, -142.5, 686.147, 996)
-    femmesh.addNode(-1.73983, -142.5, 674.89, 997)
-    femmesh.addNode(25.9615, -142.5, 613.906, 998)
-    femmesh.addNode(54.9098, -142.5, 579.003, 999)
-    femmesh.addNode(54.8924, -142.5, 603.971, 1000)
-    femmesh.addNode(25.92, -142.5, 663.85, 1001)
-    femmesh.addNode(54.8345, -142.5, 628.879, 1002)
-    femmesh.addNode(54.8259, -142.5, 653.866, 1003)
-    femmesh.addNode(-28.9447, -142.5, 736.649, 1004)
-    femmesh.addNode(-1.62209, -142.5, 700.143, 1005)
-    femmesh.addNode(-1.44731, -142.5, 725.531, 1006)
-    femmesh.addNode(-1.2114, -142.5, 750.781, 1007)
-    femmesh.addNode(-56.5888, -142.5, 771.928, 1008)
-    femmesh.addNode(-28.8971, -142.5, 786.689, 1009)
-    femmesh.addNode(-1.09769, -142.5, 775.84, 1010)
-    femmesh.addNode(26.1112, -142.5, 714.274, 1011)
-    femmesh.addNode(54.8423, -142.5, 678.902, 1012)
-    femmesh.addNode(54.8888, -142.5, 704.103, 1013)
-    femmesh.addNode(55.0636, -142.5, 729.491, 1014)
-    femmesh.addNode(55.0584, -142.5, 754.58, 1015)
-    femmesh.addNode(26.3997, -142.5, 764.721, 1016)
-    femmesh.addNode(83.8573, -142.5, 444.146, 1017)
-    femmesh.addNode(83.8096, -142.5, 494.035, 1018)
-    femmesh.addNode(83.8015, -142.5, 544.014, 1019)
-    femmesh.addNode(83.7829, -142.5, 593.976, 1020)
-    femmesh.addNode(83.7569, -142.5, 643.931, 1021)
-    femmesh.addNode(83.7947, -142.5, 694.119, 1022)
-    femmesh.addNode(83.836, -142.5, 744.409, 1023)
-    femmesh.addNode(55.1721, -142.5, 779.639, 1024)
-    femmesh.addNode(83.8677, -142.5, 794.387, 1025)
-    femmesh.addNode(-84.3809, -142.5, 807.042, 1026)
-    femmesh.addNode(-56.7772, -142.5, 796.718, 1027)
-    femmesh.addNode(-113.484, -142.5, 765.978, 1028)
-    femmesh.addNode(-113.484, -142.5, 790.978, 1029)
-    femmesh.addNode(-84.0997, -142.5, 858.051, 1030)
-    femmesh.addNode(-56.6892, -142.5, 821.803, 1031)
-    femmesh.addNode(-56.7523, -142.5, 846.897, 1032)
-    femmesh.addNode(-113.396, -142.5, 816.063, 1033)
-    femmesh.addNode(-113.396, -142.5, 841.063, 1034)
-    femmesh.addNode(-82.2539, -142.5, 914.162, 1035)
-    femmesh.addNode(-56.559, -142.5, 872.821, 1036)
-    femmesh.addNode(-56.1791, -142.5, 899.218, 1037)
-    femmesh.addNode(-113.203, -142.5, 866.988, 1038)
-    femmesh.addNode(-113.203, -142.5, 891.988, 1039)
-    femmesh.addNode(-54.5266, -142.5, 929.404, 1040)
-    femmesh.addNode(-53.525, -142.5, 952.773, 1041)
-    femmesh.addNode(-111.551, -142.5, 922.174, 1042)
-    femmesh.addNode(-111.551, -142.5, 947.174, 1043)
-    femmesh.addNode(-29.1485, -142.5, 836.573, 1044)
-    femmesh.addNode(-1.28606, -142.5, 800.63, 1045)
-    femmesh.addNode(-1.47824, -142.5, 825.404, 1046)
-    femmesh.addNode(-1.54127, -142.5, 850.498, 1047)
-    femmesh.addNode(-28.8317, -142.5, 888.064, 1048)
-    femmesh.addNode(-1.55582, -142.5, 876.507, 1049)
-    femmesh.addNode(26.3212, -142.5, 814.555, 1050)
-    femmesh.addNode(55.2089, -142.5, 804.528, 1051)
-    femmesh.addNode(26.1145, -142.5, 865.339, 1052)
-    femmesh.addNode(55.0167, -142.5, 829.303, 1053)
-    femmesh.addNode(54.9815, -142.5, 854.527, 1054)
-    femmesh.addNode(-27.4503, -142.5, 937.829, 1055)
-    femmesh.addNode(-1.17596, -142.5, 902.904, 1056)
-    femmesh.addNode(-1.45404, -142.5, 932.124, 1057)
-    femmesh.addNode(-0.452457, -142.5, 955.493, 1058)
-    femmesh.addNode(25.8218, -142.5, 920.568, 1059)
-    femmesh.addNode(54.967, -142.5, 880.536, 1060)
-    femmesh.addNode(54.6094, -142.5, 906.005, 1061)
-    femmesh.addNode(54.3314, -142.5, 935.226, 1062)
-    femmesh.addNode(52.1382, -142.5, 956.939, 1063)
-    femmesh.addNode(83.8692, -142.5, 844.501, 1064)
-    femmesh.addNode(83.4765, -142.5, 895.194, 1065)
-    femmesh.addNode(80.9258, -142.5, 942.377, 1066)
-    femmesh.addNode(142.5, 118.75, 0.0, 1067)
-    femmesh.addNode(142.5, 142.5, 25.0, 1068)
-    femmesh.addNode(142.5, 118.75, 1000.0, 1069)
-    femmesh.addNode(142.5, 142.5, 975.0, 1070)
-    femmesh.addNode(142.5, -71.25, 0.0, 1071)
-    femmesh.addNode(142.5, -86.6401, 18.8035, 1072)
-    femmesh.addNode(142.5, -118.75, 0.0, 1073)
-    femmesh.addNode(142.5, -118.75, 25.0, 1074)
-    femmesh.addNode(142.5, -23.75, 0.0, 1075)
-    femmesh.addNode(142.5, -62.8901, 18.8035, 1076)
-    femmesh.addNode(142.5, -37.0488, 25.7004, 1077)
-    femmesh.addNode(142.5, 23.75, 0.0, 1078)
-    femmesh.addNode(142.5, -13.2988, 25.7004, 1079)
-    femmesh.addNode(142.5, 12.4598, 19.3479, 1080)
-    femmesh.addNode(142.5, 71.25, 0.0, 1081)
-    femmesh.addNode(142.5, 36.2098, 19.3479, 1082)
-    femmesh.addNode(142.5, 63.7331, 27.7049, 1083)
-    femmesh.addNode(142.5, 118.75, 25.0, 1084)
-    femmesh.addNode(142.5, 87.4831, 27.7049, 1085)
-    femmesh.addNode(142.5, -71.25, 1000.0, 1086)
-    femmesh.addNode(142.5, -87.8006, 972.174, 1087)
-    femmesh.addNode(142.5, -118.75, 975.0, 1088)
-    femmesh.addNode(142.5, -118.75, 1000.0, 1089)
-    femmesh.addNode(142.5, -23.75, 1000.0, 1090)
-    femmesh.addNode(142.5, -64.0506, 972.174, 1091)
-    femmesh.addNode(142.5, -36.9743, 980.599, 1092)
-    femmesh.addNode(142.5, 23.75, 1000.0, 1093)
-    femmesh.addNode(142.5, -13.2243, 980.599, 1094)
-    femmesh.addNode(142.5, 12.7719, 974.894, 1095)
-    femmesh.addNode(142.5, 71.25, 1000.0, 1096)
-    femmesh.addNode(142.5, 36.5219, 974.894, 1097)
-    femmesh.addNode(142.5, 63.1163, 982.045, 1098)
-    femmesh.addNode(142.5, 118.75, 975.0, 1099)
-    femmesh.addNode(142.5, 86.8663, 982.045, 1100)
-    femmesh.addNode(142.5, 142.5, 75.0, 1101)
-    femmesh.addNode(142.5, 111.233, 52.7049, 1102)
-    femmesh.addNode(142.5, 142.5, 125.0, 1103)
-    femmesh.addNode(142.5, 111.233, 77.7049, 1104)
-    femmesh.addNode(142.5, 112.823, 107.822, 1105)
-    femmesh.addNode(142.5, 142.5, 175.0, 1106)
-    femmesh.addNode(142.5, 112.823, 132.822, 1107)
-    femmesh.addNode(142.5, 113.109, 159.034, 1108)
-    femmesh.addNode(142.5, 142.5, 225.0, 1109)
-    femmesh.addNode(142.5, 113.109, 184.034, 1110)
-    femmesh.addNode(142.5, 113.134, 209.34, 1111)
-    femmesh.addNode(142.5, 142.5, 275.0, 1112)
-    femmesh.addNode(142.5, 113.134, 234.34, 1113)
-    femmesh.addNode(142.5, 113.128, 259.422, 1114)
-    femmesh.addNode(142.5, 142.5, 325.0, 1115)
-    femmesh.addNode(142.5, 113.128, 284.422, 1116)
-    femmesh.addNode(142.5, 113.172, 309.65, 1117)
-    femmesh.addNode(142.5, 142.5, 375.0, 1118)
-    femmesh.addNode(142.5, 113.172, 334.65, 1119)
-    femmesh.addNode(142.5, 113.166, 359.747, 1120)
-    femmesh.addNode(142.5, 142.5, 425.0, 1121)
-    femmesh.addNode(142.5, 113.166, 384.747, 1122)
-    femmesh.addNode(142.5, 113.199, 409.62, 1123)
-    femmesh.addNode(142.5, 142.5, 475.0, 1124)
-    femmesh.addNode(142.5, 113.199, 434.62, 1125)
-    femmesh.addNode(142.5, 113.158, 459.526, 1126)
-    femmesh.addNode(142.5, 142.5, 525.0, 1127)
-    femmesh.addNode(142.5, 113.158, 484.526, 1128)
-    femmesh.addNode(142.5, 113.151, 509.51, 1129)
-    femmesh.addNode(142.5, 142.5, 575.0, 1130)
-    femmesh.addNode(142.5, 113.151, 534.51, 1131)
-    femmesh.addNode(142.5, 113.15, 559.504, 1132)
-    femmesh.addNode(142.5, 142.5, 625.0, 1133)
-    femmesh.addNode(142.5, 113.15, 584.504, 1134)
-    femmesh.addNode(142.5, 113.133, 609.472, 1135)
-    femmesh.addNode(142.5, 142.5, 675.0, 1136)
-    femmesh.addNode(142.5, 113.133, 634.472, 1137)
-    femmesh.addNode(142.5, 113.124, 659.459, 1138)
-    femmesh.addNode(142.5, 142.5, 725.0, 1139)
-    femmesh.addNode(142.5, 113.124, 684.459, 1140)
-    femmesh.addNode(142.5, 113.171, 709.66, 1141)
-    femmesh.addNode(142.5, 142.5, 775.0, 1142)
-    femmesh.addNode(142.5, 113.171, 734.66, 1143)
-    femmesh.addNode(142.5, 113.165, 759.749, 1144)
-    femmesh.addNode(142.5, 142.5, 825.0, 1145)
-    femmesh.addNode(142.5, 113.165, 784.749, 1146)
-    femmesh.addNode(142.5, 113.202, 809.638, 1147)
-    femmesh.addNode(142.5, 142.5, 875.0, 1148)
-    femmesh.addNode(142.5, 113.202, 834.638, 1149)
-    femmesh.addNode(142.5, 113.167, 859.862, 1150)
-    femmesh.addNode(142.5, 142.5, 925.0, 1151)
-    femmesh.addNode(142.5, 113.167, 884.862, 1152)
-    femmesh.addNode(142.5, 112.809, 910.331, 1153)
-    femmesh.addNode(142.5, 112.809, 935.331, 1154)
-    femmesh.addNode(142.5, 110.616, 957.045, 1155)
-    femmesh.addNode(142.5, -80.579, 59.369, 1156)
-    femmesh.addNode(142.5, -52.4388, 44.5039, 1157)
-    femmesh.addNode(142.5, -110.39, 43.8035, 1158)
-    femmesh.addNode(142.5, -83.3383, 106.687, 1159)
-    femmesh.addNode(142.5, -54.7377, 66.2659, 1160)
-    femmesh.addNode(142.5, -55.5925, 95.204, 1161)
-    femmesh.addNode(142.5, -112.689, 65.5654, 1162)
-    femmesh.addNode(142.5, -112.689, 90.5654, 1163)
-    femmesh.addNode(142.5, -56.0529, 120.76, 1164)
-    femmesh.addNode(142.5, -56.2212, 146.66, 1165)
-    femmesh.addNode(142.5, -84.0978, 156.995, 1166)
-    femmesh.addNode(142.5, -113.149, 116.121, 1167)
-    femmesh.addNode(142.5, -113.149, 141.121, 1168)
-    femmesh.addNode(142.5, -0.839004, 45.0483, 1169)
-    femmesh.addNode(142.5, -27.4523, 80.3389, 1170)
-    femmesh.addNode(142.5, -0.370743, 67.9707, 1171)
-    femmesh.addNode(142.5, 25.3878, 61.6182, 1172)
-    femmesh.addNode(142.5, 52.4428, 47.0528, 1173)
-    femmesh.addNode(142.5, -28.4754, 135.177, 1174)
-    femmesh.addNode(142.5, -1.22553, 96.9088, 1175)
-    femmesh.addNode(142.5, -1.07434, 123.353, 1176)
-    femmesh.addNode(142.5, -1.24264, 149.252, 1177)
-    femmesh.addNode(142.5, -56.5203, 171.411, 1178)
-    femmesh.addNode(142.5, -28.9526, 186.002, 1179)
-    femmesh.addNode(142.5, -1.27977, 174.791, 1180)
-    femmesh.addNode(142.5, 26.0072, 110.985, 1181)
-    femmesh.addNode(142.5, 52.9111, 69.9752, 1182)
-    femmesh.addNode(142.5, 54.5011, 100.092, 1183)
-    femmesh.addNode(142.5, 26.1213, 162.967, 1184)
-    femmesh.addNode(142.5, 54.6523, 126.536, 1185)
-    femmesh.addNode(142.5, 54.938, 152.749, 1186)
-    femmesh.addNode(142.5, -84.3363, 206.916, 1187)
-    femmesh.addNode(142.5, -56.8292, 196.337, 1188)
-    femmesh.addNode(142.5, -113.448, 165.873, 1189)
-    femmesh.addNode(142.5, -113.448, 190.873, 1190)
-    femmesh.addNode(142.5, -84.2793, 257.059, 1191)
-    femmesh.addNode(142.5, -56.7687, 221.506, 1192)
-    femmesh.addNode(142.5, -56.8363, 246.472, 1193)
-    femmesh.addNode(142.5, -113.388, 216.043, 1194)
-    femmesh.addNode(142.5, -113.388, 241.043, 1195)
-    femmesh.addNode(142.5, -84.2082, 307.341, 1196)
-    femmesh.addNode(142.5, -56.8397, 271.445, 1197)
-    femmesh.addNode(142.5, -56.7292, 296.711, 1198)
-    femmesh.addNode(142.5, -113.391, 266.016, 1199)
-    femmesh.addNode(142.5, -113.391, 291.016, 1200)
-    femmesh.addNode(142.5, -56.6547, 322.021, 1201)
-    femmesh.addNode(142.5, -56.4206, 347.274, 1202)
-    femmesh.addNode(142.5, -84.3011, 357.304, 1203)
-    femmesh.addNode(142.5, -113.317, 316.326, 1204)
-    femmesh.addNode(142.5, -113.317, 341.326, 1205)
-    femmesh.addNode(142.5, -29.3292, 235.893, 1206)
-    femmesh.addNode(142.5, -1.58871, 199.717, 1207)
-    femmesh.addNode(142.5, -1.66506, 224.804, 1208)
-    femmesh.addNode(142.5, -1.73262, 249.769, 1209)
-    femmesh.addNode(142.5, -29.2862, 286.125, 1210)
-    femmesh.addNode(142.5, -1.72536, 274.855, 1211)
-    femmesh.addNode(142.5, 26.0078, 213.593, 1212)
-    femmesh.addNode(142.5, 54.9009, 178.287, 1213)
-    femmesh.addNode(142.5, 54.9259, 203.593, 1214)
-    femmesh.addNode(142.5, 25.9387, 263.766, 1215)
-    femmesh.addNode(142.5, 54.8496, 228.68, 1216)
-    femmesh.addNode(142.5, 54.8433, 253.763, 1217)
-    femmesh.addNode(142.5, -28.9416, 336.644, 1218)
-    femmesh.addNode(142.5, -1.61485, 300.122, 1219)
-    femmesh.addNode(142.5, -1.44341, 325.522, 1220)
-    femmesh.addNode(142.5, -1.20936, 350.775, 1221)
-    femmesh.addNode(142.5, -56.588, 371.927, 1222)
-    femmesh.addNode(142.5, -28.8964, 386.688, 1223)
-    femmesh.addNode(142.5, -1.09664, 375.838, 1224)
-    femmesh.addNode(142.5, 26.1174, 314.253, 1225)
-    femmesh.addNode(142.5, 54.8505, 278.848, 1226)
-    femmesh.addNode(142.5, 54.8952, 304.076, 1227)
-    femmesh.addNode(142.5, 55.0667, 329.477, 1228)
-    femmesh.addNode(142.5, 55.0604, 354.573, 1229)
-    femmesh.addNode(142.5, 26.4016, 364.716, 1230)
-    femmesh.addNode(142.5, 81.5561, 85.5268, 1231)
-    femmesh.addNode(142.5, 83.4319, 141.856, 1232)
-    femmesh.addNode(142.5, 83.7427, 193.374, 1233)
-    femmesh.addNode(142.5, 83.7614, 243.762, 1234)
-    femmesh.addNode(142.5, 83.7998, 294.073, 1235)
-    femmesh.addNode(142.5, 83.8382, 344.397, 1236)
-    femmesh.addNode(142.5, 55.1731, 379.636, 1237)
-    femmesh.addNode(142.5, 83.865, 394.367, 1238)
-    femmesh.addNode(142.5, -84.3807, 407.041, 1239)
-    femmesh.addNode(142.5, -56.7768, 396.717, 1240)
-    femmesh.addNode(142.5, -113.484, 365.978, 1241)
-    femmesh.addNode(142.5, -113.484, 390.978, 1242)
-    femmesh.addNode(142.5, -84.2898, 457.083, 1243)
-    femmesh.addNode(142.5, -56.6891, 421.803, 1244)
-    femmesh.addNode(142.5, -56.8156, 446.574, 1245)
-    femmesh.addNode(142.5, -113.396, 416.063, 1246)
-    femmesh.addNode(142.5, -113.396, 441.063, 1247)
-    femmesh.addNode(142.5, -84.2106, 507.346, 1248)
-    femmesh.addNode(142.5, -56.8125, 471.53, 1249)
-    femmesh.addNode(142.5, -56.7241, 496.735, 1250)
-    femmesh.addNode(142.5, -113.393, 491.02, 1251)
-    femmesh.addNode(142.5, -113.393, 466.02, 1252)
-    femmesh.addNode(142.5, -56.6481, 522.042, 1253)
-    femmesh.addNode(142.5, -56.5108, 547.13, 1254)
-    femmesh.addNode(142.5, -84.3166, 557.28, 1255)
-    femmesh.addNode(142.5, -113.317, 541.326, 1256)
-    femmesh.addNode(142.5, -113.317, 516.326, 1257)
-    femmesh.addNode(142.5, -29.2117, 436.25, 1258)
-    femmesh.addNode(142.5, -1.28543, 400.628, 1259)
-    femmesh.addNode(142.5, -1.4938, 425.323, 1260)
-    femmesh.addNode(142.5, -1.62033, 450.095, 1261)
-    femmesh.addNode(142.5, -29.2499, 486.226, 1262)
-    femmesh.addNode(142.5, -1.66847, 475.013, 1263)
-    femmesh.addNode(142.5, 26.3059, 414.473, 1264)
-    femmesh.addNode(142.5, 55.2062, 404.509, 1265)
-    femmesh.addNode(142.5, 26.0494, 464.087, 1266)
-    femmesh.addNode(142.5, 54.9978, 429.204, 1267)
-    femmesh.addNode(142.5, 54.9571, 454.11, 1268)
-    femmesh.addNode(142.5, -29.0243, 536.519, 1269)
-    femmesh.addNode(142.5, -1.58012, 500.218, 1270)
-    femmesh.addNode(142.5, -1.54736, 525.264, 1271)
-    femmesh.addNode(142.5, -1.4101, 550.352, 1272)
-    femmesh.addNode(142.5, -56.6928, 571.757, 1273)
-    femmesh.addNode(142.5, -29.1104, 586.339, 1274)
-    femmesh.addNode(142.5, -1.43386, 575.302, 1275)
-    femmesh.addNode(142.5, 26.0341, 514.051, 1276)
-    femmesh.addNode(142.5, 54.9089, 479.029, 1277)
-    femmesh.addNode(142.5, 54.902, 504.012, 1278)
-    femmesh.addNode(142.5, 26.0431, 564.047, 1279)
-    femmesh.addNode(142.5, 54.9347, 529.058, 1280)
-    femmesh.addNode(142.5, 54.9336, 554.052, 1281)
-    femmesh.addNode(142.5, -84.3983, 607.013, 1282)
-    femmesh.addNode(142.5, -56.9161, 596.49, 1283)
-    femmesh.addNode(142.5, -113.499, 565.954, 1284)
-    femmesh.addNode(142.5, -113.499, 590.954, 1285)
-    femmesh.addNode(142.5, -84.2927, 657.078, 1286)
-    femmesh.addNode(142.5, -56.8158, 621.595, 1287)
-    femmesh.addNode(142.5, -56.857, 646.506, 1288)
-    femmesh.addNode(142.5, -113.399, 616.059, 1289)
-    femmesh.addNode(142.5, -113.399, 641.059, 1290)
-    femmesh.addNode(142.5, -84.2111, 707.345, 1291)
-    femmesh.addNode(142.5, -56.8518, 671.466, 1292)
-    femmesh.addNode(142.5, -56.734, 696.719, 1293)
-    femmesh.addNode(142.5, -113.394, 666.019, 1294)
-    femmesh.addNode(142.5, -113.394, 691.019, 1295)
-    femmesh.addNode(142.5, -56.6577, 722.026, 1296)
-    femmesh.addNode(142.5, -56.4217, 747.276, 1297)
-    femmesh.addNode(142.5, -84.3018, 757.304, 1298)
-    femmesh.addNode(142.5, -113.317, 716.326, 1299)
-    femmesh.addNode(142.5, -113.317, 741.326, 1300)
-    femmesh.addNode(142.5, -29.3749, 635.983, 1301)
-    femmesh.addNode(142.5, -1.65719, 600.035, 1302)
-    femmesh.addNode(142.5, -1.71503, 624.943, 1303)
-    femmesh.addNode(142.5, -1.75623, 649.854, 1304)
-    femmesh.addNode(142.5, -29.2983, 686.147, 1305)
-    femmesh.addNode(142.5, -1.73983, 674.89, 1306)
-    femmesh.addNode(142.5, 25.9615, 613.906, 1307)
-    femmesh.addNode(142.5, 54.9098, 579.003, 1308)
-    femmesh.addNode(142.5, 54.8924, 603.971, 1309)
-    femmesh.addNode(142.5, 25.92, 663.85, 1310)
-    femmesh.addNode(142.5, 54.8345, 628.879, 1311)
-    femmesh.addNode(142.5, 54.8259, 653.866, 1312)
-    femmesh.addNode(142.5, -28.9447, 736.649, 1313)
-    femmesh.addNode(142.5, -1.62209, 700.143, 1314)
-    femmesh.addNode(142.5, -1.44731, 725.531, 1315)
-    femmesh.addNode(142.5, -1.2114, 750.781, 1316)
-    femmesh.addNode(142.5, -56.5888, 771.928, 1317)
-    femmesh.addNode(142.5, -28.8971, 786.689, 1318)
-    femmesh.addNode(142.5, -1.09769, 775.84, 1319)
-    femmesh.addNode(142.5, 26.1112, 714.274, 1320)
-    femmesh.addNode(142.5, 54.8423, 678.902, 1321)
-    femmesh.addNode(142.5, 54.8888, 704.103, 1322)
-    femmesh.addNode(142.5, 55.0636, 729.491, 1323)
-    femmesh.addNode(142.5, 55.0584, 754.58, 1324)
-    femmesh.addNode(142.5, 26.3997, 764.721, 1325)
-    femmesh.addNode(142.5, 83.8573, 444.146, 1326)
-    femmesh.addNode(142.5, 83.8096, 494.035, 1327)
-    femmesh.addNode(142.5, 83.8015, 544.014, 1328)
-    femmesh.addNode(142.5, 83.7829, 593.976, 1329)
-    femmesh.addNode(142.5, 83.7569, 643.931, 1330)
-    femmesh.addNode(142.5, 83.7947, 694.119, 1331)
-    femmesh.addNode(142.5, 83.836, 744.409, 1332)
-    femmesh.addNode(142.5, 55.1721, 779.639, 1333)
-    femmesh.addNode(142.5, 83.8677, 794.387, 1334)
-    femmesh.addNode(142.5, -84.3809, 807.042, 1335)
-    femmesh.addNode(142.5, -56.7772, 796.718, 1336)
-    femmesh.addNode(142.5, -113.484, 765.978, 1337)
-    femmesh.addNode(142.5, -113.484, 790.978, 1338)
-    femmesh.addNode(142.5, -84.0997, 858.051, 1339)
-    femmesh.addNode(142.5, -56.6892, 821.803, 1340)
-    femmesh.addNode(142.5, -56.7523, 846.897, 1341)
-    femmesh.addNode(142.5, -113.396, 816.063, 1342)
-    femmesh.addNode(142.5, -113.396, 841.063, 1343)
-    femmesh.addNode(142.5, -82.2539, 914.162, 1344)
-    femmesh.addNode(142.5, -56.559, 872.821, 1345)
-    femmesh.addNode(142.5, -56.1791, 899.218, 1346)
-    femmesh.addNode(142.5, -113.203, 866.988, 1347)
-    femmesh.addNode(142.5, -113.203, 891.988, 1348)
-    femmesh.addNode(142.5, -54.5266, 929.404, 1349)
-    femmesh.addNode(142.5, -53.525, 952.773, 1350)
-    femmesh.addNode(142.5, -111.551, 922.174, 1351)
-    femmesh.addNode(142.5, -111.551, 947.174, 1352)
-    femmesh.addNode(142.5, -29.1485, 836.573, 1353)
-    femmesh.addNode(142.5, -1.28606, 800.63, 1354)
-    femmesh.addNode(142.5, -1.47824, 825.404, 1355)
-    femmesh.addNode(142.5, -1.54127, 850.498, 1356)
-    femmesh.addNode(142.5, -28.8317, 888.064, 1357)
-    femmesh.addNode(142.5, -1.55582, 876.507, 1358)
-    femmesh.addNode(142.5, 26.3212, 814.555, 1359)
-    femmesh.addNode(142.5, 55.2089, 804.528, 1360)
-    femmesh.addNode(142.5, 26.1145, 865.339, 1361)
-    femmesh.addNode(142.5, 55.0167, 829.303, 1362)
-    femmesh.addNode(142.5, 54.9815, 854.527, 1363)
-    femmesh.addNode(142.5, -27.4503, 937.829, 1364)
-    femmesh.addNode(142.5, -1.17596, 902.904, 1365)
-    femmesh.addNode(142.5, -1.45404, 932.124, 1366)
-    femmesh.addNode(142.5, -0.452457, 955.493, 1367)
-    femmesh.addNode(142.5, 25.8218, 920.568, 1368)
-    femmesh.addNode(142.5, 54.967, 880.536, 1369)
-    femmesh.addNode(142.5, 54.6094, 906.005, 1370)
-    femmesh.addNode(142.5, 54.3314, 935.226, 1371)
-    femmesh.addNode(142.5, 52.1382, 956.939, 1372)
-    femmesh.addNode(142.5, 83.8692, 844.501, 1373)
-    femmesh.addNode(142.5, 83.4765, 895.194, 1374)
-    femmesh.addNode(142.5, 80.9258, 942.377, 1375)
-    femmesh.addNode(71.25, 142.5, 0.0, 1376)
-    femmesh.addNode(86.6401, 142.5, 18.8035, 1377)
-    femmesh.addNode(118.75, 142.5, 0.0, 1378)
-    femmesh.addNode(118.75, 142.5, 25.0, 1379)
-    femmesh.addNode(23.75, 142.5, 0.0, 1380)
-    femmesh.addNode(62.8901, 142.5, 18.8035, 1381)
-    femmesh.addNode(37.0488, 142.5, 25.7004, 1382)
-    femmesh.addNode(-23.75, 142.5, 0.0, 1383)
-    femmesh.addNode(13.2988, 142.5, 25.7004, 1384)
-    femmesh.addNode(-12.4598, 142.5, 19.3479, 1385)
-    femmesh.addNode(-71.25, 142.5, 0.0, 1386)
-    femmesh.addNode(-36.2098, 142.5, 19.3479, 1387)
-    femmesh.addNode(-63.7331, 142.5, 27.7049, 1388)
-    femmesh.addNode(-87.4831, 142.5, 27.7049, 1389)
-    femmesh.addNode(-118.75, 142.5, 0.0, 1390)
-    femmesh.addNode(-118.75, 142.5, 25.0, 1391)
-    femmesh.addNode(71.25, 142.5, 1000.0, 1392)
-    femmesh.addNode(87.8006, 142.5, 972.174, 1393)
-    femmesh.addNode(118.75, 142.5, 975.0, 1394)
-    femmesh.addNode(118.75, 142.5, 1000.0, 1395)
-    femmesh.addNode(23.75, 142.5, 1000.0, 1396)
-    femmesh.addNode(64.0506, 142.5, 972.174, 1397)
-    femmesh.addNode(36.9743, 142.5, 980.599, 1398)
-    femmesh.addNode(-23.75, 142.5, 1000.0, 1399)
-    femmesh.addNode(13.2243, 142.5, 980.599, 1400)
-    femmesh.addNode(-12.7719, 142.5, 974.894, 1401)
-    femmesh.addNode(-71.25, 142.5, 1000.0, 1402)
-    femmesh.addNode(-36.5219, 142.5, 974.894, 1403)
-    femmesh.addNode(-63.1163, 142.5, 982.045, 1404)
-    femmesh.addNode(-86.8663, 142.5, 982.045, 1405)
-    femmesh.addNode(-118.75, 142.5, 975.0, 1406)
-    femmesh.addNode(-118.75, 142.5, 1000.0, 1407)
-    femmesh.addNode(80.579, 142.5, 59.369, 1408)
-    femmesh.addNode(52.4388, 142.5, 44.5039, 1409)
-    femmesh.addNode(110.39, 142.5, 43.8035, 1410)
-    femmesh.addNode(83.3383, 142.5, 106.687, 1411)
-    femmesh.addNode(54.7377, 142.5, 66.2659, 1412)
-    femmesh.addNode(55.5925, 142.5, 95.204, 1413)
-    femmesh.addNode(112.689, 142.5, 65.5654, 1414)
-    femmesh.addNode(112.689, 142.5, 90.5654, 1415)
-    femmesh.addNode(56.0529, 142.5, 120.76, 1416)
-    femmesh.addNode(56.2212, 142.5, 146.66, 1417)
-    femmesh.addNode(84.0978, 142.5, 156.995, 1418)
-    femmesh.addNode(113.149, 142.5, 116.121, 1419)
-    femmesh.addNode(113.149, 142.5, 141.121, 1420)
-    femmesh.addNode(0.839004, 142.5, 45.0483, 1421)
-    femmesh.addNode(27.4523, 142.5, 80.3389, 1422)
-    femmesh.addNode(0.370743, 142.5, 67.9707, 1423)
-    femmesh.addNode(-25.3878, 142.5, 61.6182, 1424)
-    femmesh.addNode(-52.4428, 142.5, 47.0528, 1425)
-    femmesh.addNode(28.4754, 142.5, 135.177, 1426)
-    femmesh.addNode(1.22553, 142.5, 96.9088, 1427)
-    femmesh.addNode(1.07434, 142.5, 123.353, 1428)
-    femmesh.addNode(1.24264, 142.5, 149.252, 1429)
-    femmesh.addNode(56.5203, 142.5, 171.411, 1430)
-    femmesh.addNode(28.9526, 142.5, 186.002, 1431)
-    femmesh.addNode(1.27977, 142.5, 174.791, 1432)
-    femmesh.addNode(-26.0072, 142.5, 110.985, 1433)
-    femmesh.addNode(-52.9111, 142.5, 69.9752, 1434)
-    femmesh.addNode(-54.5011, 142.5, 100.092, 1435)
-    femmesh.addNode(-26.1213, 142.5, 162.967, 1436)
-    femmesh.addNode(-54.6523, 142.5, 126.536, 1437)
-    femmesh.addNode(-54.938, 142.5, 152.749, 1438)
-    femmesh.addNode(84.3363, 142.5, 206.916, 1439)
-    femmesh.addNode(56.8292, 142.5, 196.337, 1440)
-    femmesh.addNode(113.448, 142.5, 165.873, 1441)
-    femmesh.addNode(113.448, 142.5, 190.873, 1442)
-    femmesh.addNode(84.2793, 142.5, 257.059, 1443)
-    femmesh.addNode(56.7687, 142.5, 221.506, 1444)
-    femmesh.addNode(56.8363, 142.5, 246.472, 1445)
-    femmesh.addNode(113.388, 142.5, 216.043, 1446)
-    femmesh.addNode(113.388, 142.5, 241.043, 1447)
-    femmesh.addNode(84.2082, 142.5, 307.341, 1448)
-    femmesh.addNode(56.8397, 142.5, 271.445, 1449)
-    femmesh.addNode(56.7292, 142.5, 296.711, 1450)
-    femmesh.addNode(113.391, 142.5, 266.016, 1451)
-    femmesh.addNode(113.391, 142.5, 291.016, 1452)
-    femmesh.addNode(56.6547, 142.5, 322.021, 1453)
-    femmesh.addNode(56.4206, 142.5, 347.274, 1454)
-    femmesh.addNode(84.3011, 142.5, 357.304, 1455)
-    femmesh.addNode(113.317, 142.5, 316.326, 1456)
-    femmesh.addNode(113.317, 142.5, 341.326, 1457)
-    femmesh.addNode(29.3292, 142.5, 235.893, 1458)
-    femmesh.addNode(1.58871, 142.5, 199.717, 1459)
-    femmesh.addNode(1.66506, 142.5, 224.804, 1460)
-    femmesh.addNode(1.73262, 142.5, 249.769, 1461)
-    femmesh.addNode(29.2862, 142.5, 286.125, 1462)
-    femmesh.addNode(1.72536, 142.5, 274.855, 1463)
-    femmesh.addNode(-26.0078, 142.5, 213.593, 1464)
-    femmesh.addNode(-54.9009, 142.5, 178.287, 1465)
-    femmesh.addNode(-54.9259, 142.5, 203.593, 1466)
-    femmesh.addNode(-25.9387, 142.5, 263.766, 1467)
-    femmesh.addNode(-54.8496, 142.5, 228.68, 1468)
-    femmesh.addNode(-54.8433, 142.5, 253.763, 1469)
-    femmesh.addNode(28.9416, 142.5, 336.644, 1470)
-    femmesh.addNode(1.61485, 142.5, 300.122, 1471)
-    femmesh.addNode(1.44341, 142.5, 325.522, 1472)
-    femmesh.addNode(1.20936, 142.5, 350.775, 1473)
-    femmesh.addNode(56.588, 142.5, 371.927, 1474)
-    femmesh.addNode(28.8964, 142.5, 386.688, 1475)
-    femmesh.addNode(1.09664, 142.5, 375.838, 1476)
-    femmesh.addNode(-26.1174, 142.5, 314.253, 1477)
-    femmesh.addNode(-54.8505, 142.5, 278.848, 1478)
-    femmesh.addNode(-54.8952, 142.5, 304.076, 1479)
-    femmesh.addNode(-55.0667, 142.5, 329.477, 1480)
-    femmesh.addNode(-55.0604, 142.5, 354.573, 1481)
-    femmesh.addNode(-26.4016, 142.5, 364.716, 1482)
-    femmesh.addNode(-81.5561, 142.5, 85.5268, 1483)
-    femmesh.addNode(-111.233, 142.5, 52.7049, 1484)
-    femmesh.addNode(-111.233, 142.5, 77.7049, 1485)
-    femmesh.addNode(-83.4319, 142.5, 141.856, 1486)
-    femmesh.addNode(-112.823, 142.5, 107.822, 1487)
-    femmesh.addNode(-112.823, 142.5, 132.822, 1488)
-    femmesh.addNode(-83.7427, 142.5, 193.374, 1489)
-    femmesh.addNode(-113.109, 142.5, 159.034, 1490)
-    femmesh.addNode(-113.109, 142.5, 184.034, 1491)
-    femmesh.addNode(-83.7614, 142.5, 243.762, 1492)
-    femmesh.addNode(-113.134, 142.5, 209.34, 1493)
-    femmesh.addNode(-113.134, 142.5, 234.34, 1494)
-    femmesh.addNode(-83.7998, 142.5, 294.073, 1495)
-    femmesh.addNode(-113.128, 142.5, 259.422, 1496)
-    femmesh.addNode(-113.128, 142.5, 284.422, 1497)
-    femmesh.addNode(-83.8382, 142.5, 344.397, 1498)
-    femmesh.addNode(-113.172, 142.5, 309.65, 1499)
-    femmesh.addNode(-113.172, 142.5, 334.65, 1500)
-    femmesh.addNode(-55.1731, 142.5, 379.636, 1501)
-    femmesh.addNode(-83.865, 142.5, 394.367, 1502)
-    femmesh.addNode(-113.166, 142.5, 359.747, 1503)
-    femmesh.addNode(-113.166, 142.5, 384.747, 1504)
-    femmesh.addNode(84.3807, 142.5, 407.041, 1505)
-    femmesh.addNode(56.7768, 142.5, 396.717, 1506)
-    femmesh.addNode(113.484, 142.5, 365.978, 1507)
-    femmesh.addNode(113.484, 142.5, 390.978, 1508)
-    femmesh.addNode(84.2898, 142.5, 457.083, 1509)
-    femmesh.addNode(56.6891, 142.5, 421.803, 1510)
-    femmesh.addNode(56.8156, 142.5, 446.574, 1511)
-    femmesh.addNode(113.396, 142.5, 416.063, 1512)
-    femmesh.addNode(113.396, 142.5, 441.063, 1513)
-    femmesh.addNode(84.2106, 142.5, 507.346, 1514)
-    femmesh.addNode(56.8125, 142.5, 471.53, 1515)
-    femmesh.addNode(56.7241, 142.5, 496.735, 1516)
-    femmesh.addNode(113.393, 142.5, 491.02, 1517)
-    femmesh.addNode(113.393, 142.5, 466.02, 1518)
-    femmesh.addNode(56.6481, 142.5, 522.042, 1519)
-    femmesh.addNode(56.5108, 142.5, 547.13, 1520)
-    femmesh.addNode(84.3166, 142.5, 557.28, 1521)
-    femmesh.addNode(113.317, 142.5, 541.326, 1522)
-    femmesh.addNode(113.317, 142.5, 516.326, 1523)
-    femmesh.addNode(29.2117, 142.5, 436.25, 1524)
-    femmesh.addNode(1.28543, 142.5, 400.628, 1525)
-    femmesh.addNode(1.4938, 142.5, 425.323, 1526)
-    femmesh.addNode(1.62033, 142.5, 450.095, 1527)
-    femmesh.addNode(29.2499, 142.5, 486.226, 1528)
-    femmesh.addNode(1.66847, 142.5, 475.013, 1529)
-    femmesh.addNode(-26.3059, 142.5, 414.473, 1530)
-    femmesh.addNode(-55.2062, 142.5, 404.509, 1531)
-    femmesh.addNode(-26.0494, 142.5, 464.087, 1532)
-    femmesh.addNode(-54.9978, 142.5, 429.204, 1533)
-    femmesh.addNode(-54.9571, 142.5, 454.11, 1534)
-    femmesh.addNode(29.0243, 142.5, 536.519, 1535)
-    femmesh.addNode(1.58012, 142.5, 500.218, 1536)
-    femmesh.addNode(1.54736, 142.5, 525.264, 1537)
-    femmesh.addNode(1.4101, 142.5, 550.352, 1538)
-    femmesh.addNode(56.6928, 142.5, 571.757, 1539)
-    femmesh.addNode(29.1104, 142.5, 586.339, 1540)
-    femmesh.addNode(1.43386, 142.5, 575.302, 1541)
-    femmesh.addNode(-26.0341, 142.5, 514.051, 1542)
-    femmesh.addNode(-54.9089, 142.5, 479.029, 1543)
-    femmesh.addNode(-54.902, 142.5, 504.012, 1544)
-    femmesh.addNode(-26.0431, 142.5, 564.047, 1545)
-    femmesh.addNode(-54.9347, 142.5, 529.058, 1546)
-    femmesh.addNode(-54.9336, 142.5, 554.052, 1547)
-    femmesh.addNode(84.3983, 142.5, 607.013, 1548)
-    femmesh.addNode(56.9161, 142.5, 596.49, 1549)
-    femmesh.addNode(113.499, 142.5, 565.954, 1550)
-    femmesh.addNode(113.499, 142.5, 590.954, 1551)
-    femmesh.addNode(84.2927, 142.5, 657.078, 1552)
-    femmesh.addNode(56.8158, 142.5, 621.595, 1553)
-    femmesh.addNode(56.857, 142.5, 646.506, 1554)
-    femmesh.addNode(113.399, 142.5, 616.059, 1555)
-    femmesh.addNode(113.399, 142.5, 641.059, 1556)
-    femmesh.addNode(84.2111, 142.5, 707.345, 1557)
-    femmesh.addNode(56.8518, 142.5, 671.466, 1558)
-    femmesh.addNode(56.734, 142.5, 696.719, 1559)
-    femmesh.addNode(113.394, 142.5, 666.019, 1560)
-    femmesh.addNode(113.394, 142.5, 691.019, 1561)
-    femmesh.addNode(56.6577, 142.5, 722.026, 1562)
-    femmesh.addNode(56.4217, 142.5, 747.276, 1563)
-    femmesh.addNode(84.3018, 142.5, 757.304, 1564)
-    femmesh.addNode(113.317, 142.5, 716.326, 1565)
-    femmesh.addNode(113.317, 142.5, 741.326, 1566)
-    femmesh.addNode(29.3749, 142.5, 635.983, 1567)
-    femmesh.addNode(1.65719, 142.5, 600.035, 1568)
-    femmesh.addNode(1.71503, 142.5, 624.943, 1569)
-    femmesh.addNode(1.75623, 142.5, 649.854, 1570)
-    femmesh.addNode(29.2983, 142.5, 686.147, 1571)
-    femmesh.addNode(1.73983, 142.5, 674.89, 1572)
-    femmesh.addNode(-25.9615, 142.5, 613.906, 1573)
-    femmesh.addNode(-54.9098, 142.5, 579.003, 1574)
-    femmesh.addNode(-54.8924, 142.5, 603.971, 1575)
-    femmesh.addNode(-25.92, 142.5, 663.85, 1576)
-    femmesh.addNode(-54.8345, 142.5, 628.879, 1577)
-    femmesh.addNode(-54.8259, 142.5, 653.866, 1578)
-    femmesh.addNode(28.9447, 142.5, 736.649, 1579)
-    femmesh.addNode(1.62209, 142.5, 700.143, 1580)
-    femmesh.addNode(1.44731, 142.5, 725.531, 1581)
-    femmesh.addNode(1.2114, 142.5, 750.781, 1582)
-    femmesh.addNode(56.5888, 142.5, 771.928, 1583)
-    femmesh.addNode(28.8971, 142.5, 786.689, 1584)
-    femmesh.addNode(1.09769, 142.5, 775.84, 1585)
-    femmesh.addNode(-26.1112, 142.5, 714.274, 1586)
-    femmesh.addNode(-54.8423, 142.5, 678.902, 1587)
-    femmesh.addNode(-54.8888, 142.5, 704.103, 1588)
-    femmesh.addNode(-55.0636, 142.5, 729.491, 1589)
-    femmesh.addNode(-55.0584, 142.5, 754.58, 1590)
-    femmesh.addNode(-26.3997, 142.5, 764.721, 1591)
-    femmesh.addNode(-83.8573, 142.5, 444.146, 1592)
-    femmesh.addNode(-113.199, 142.5, 409.62, 1593)
-    femmesh.addNode(-113.199, 142.5, 434.62, 1594)
-    femmesh.addNode(-83.8096, 142.5, 494.035, 1595)
-    femmesh.addNode(-113.158, 142.5, 484.526, 1596)
-    femmesh.addNode(-113.158, 142.5, 459.526, 1597)
-    femmesh.addNode(-83.8015, 142.5, 544.014, 1598)
-    femmesh.addNode(-113.151, 142.5, 534.51, 1599)
-    femmesh.addNode(-113.151, 142.5, 509.51, 1600)
-    femmesh.addNode(-83.7829, 142.5, 593.976, 1601)
-    femmesh.addNode(-113.15, 142.5, 559.504, 1602)
-    femmesh.addNode(-113.15, 142.5, 584.504, 1603)
-    femmesh.addNode(-83.7569, 142.5, 643.931, 1604)
-    femmesh.addNode(-113.133, 142.5, 609.472, 1605)
-    femmesh.addNode(-113.133, 142.5, 634.472, 1606)
-    femmesh.addNode(-83.7947, 142.5, 694.119, 1607)
-    femmesh.addNode(-113.124, 142.5, 659.459, 1608)
-    femmesh.addNode(-113.124, 142.5, 684.459, 1609)
-    femmesh.addNode(-83.836, 142.5, 744.409, 1610)
-    femmesh.addNode(-113.171, 142.5, 709.66, 1611)
-    femmesh.addNode(-113.171, 142.5, 734.66, 1612)
-    femmesh.addNode(-55.1721, 142.5, 779.639, 1613)
-    femmesh.addNode(-83.8677, 142.5, 794.387, 1614)
-    femmesh.addNode(-113.165, 142.5, 759.749, 1615)
-    femmesh.addNode(-113.165, 142.5, 784.749, 1616)
-    femmesh.addNode(84.3809, 142.5, 807.042, 1617)
-    femmesh.addNode(56.7772, 142.5, 796.718, 1618)
-    femmesh.addNode(113.484, 142.5, 765.978, 1619)
-    femmesh.addNode(113.484, 142.5, 790.978, 1620)
-    femmesh.addNode(84.0997, 142.5, 858.051, 1621)
-    femmesh.addNode(56.6892, 142.5, 821.803, 1622)
-    femmesh.addNode(56.7523, 142.5, 846.897, 1623)
-    femmesh.addNode(113.396, 142.5, 816.063, 1624)
-    femmesh.addNode(113.396, 142.5, 841.063, 1625)
-    femmesh.addNode(82.2539, 142.5, 914.162, 1626)
-    femmesh.addNode(56.559, 142.5, 872.821, 1627)
-    femmesh.addNode(56.1791, 142.5, 899.218, 1628)
-    femmesh.addNode(113.203, 142.5, 866.988, 1629)
-    femmesh.addNode(113.203, 142.5, 891.988, 1630)
-    femmesh.addNode(54.5266, 142.5, 929.404, 1631)
-    femmesh.addNode(53.525, 142.5, 952.773, 1632)
-    femmesh.addNode(111.551, 142.5, 922.174, 1633)
-    femmesh.addNode(111.551, 142.5, 947.174, 1634)
-    femmesh.addNode(29.1485, 142.5, 836.573, 1635)
-    femmesh.addNode(1.28606, 142.5, 800.63, 1636)
-    femmesh.addNode(1.47824, 142.5, 825.404, 1637)
-    femmesh.addNode(1.54127, 142.5, 850.498, 1638)
-    femmesh.addNode(28.8317, 142.5, 888.064, 1639)
-    femmesh.addNode(1.55582, 142.5, 876.507, 1640)
-    femmesh.addNode(-26.3212, 142.5, 814.555, 1641)
-    femmesh.addNode(-55.2089, 142.5, 804.528, 1642)
-    femmesh.addNode(-26.1145, 142.5, 865.339, 1643)
-    femmesh.addNode(-55.0167, 142.5, 829.303, 1644)
-    femmesh.addNode(-54.9815, 142.5, 854.527, 1645)
-    femmesh.addNode(27.4503, 142.5, 937.829, 1646)
-    femmesh.addNode(1.17596, 142.5, 902.904, 1647)
-    femmesh.addNode(1.45404, 142.5, 932.124, 1648)
-    femmesh.addNode(0.452457, 142.5, 955.493, 1649)
-    femmesh.addNode(-25.8218, 142.5, 920.568, 1650)
-    femmesh.addNode(-54.967, 142.5, 880.536, 1651)
-    femmesh.addNode(-54.6094, 142.5, 906.005, 1652)
-    femmesh.addNode(-54.3314, 142.5, 935.226, 1653)
-    femmesh.addNode(-52.1382, 142.5, 956.939, 1654)
-    femmesh.addNode(-83.8692, 142.5, 844.501, 1655)
-    femmesh.addNode(-113.202, 142.5, 809.638, 1656)
-    femmesh.addNode(-113.202, 142.5, 834.638, 1657)
-    femmesh.addNode(-83.4765, 142.5, 895.194, 1658)
-    femmesh.addNode(-113.167, 142.5, 859.862, 1659)
-    femmesh.addNode(-113.167, 142.5, 884.862, 1660)
-    femmesh.addNode(-80.9258, 142.5, 942.377, 1661)
-    femmesh.addNode(-112.809, 142.5, 910.331, 1662)
-    femmesh.addNode(-112.809, 142.5, 935.331, 1663)
-    femmesh.addNode(-110.616, 142.5, 957.045, 1664)
-    return True
+    return load_mesh(femmesh, __name__, elements=False)
 
 
 def create_elements(femmesh):
     # elements
-    femmesh.addFace([125, 112, 49, 724, 565, 566], 1)
-    femmesh.addFace([125, 119, 112, 742, 723, 724], 2)
-    femmesh.addFace([125, 120, 119, 744, 741, 742], 3)
-    femmesh.addFace([125, 126, 120, 755, 745, 744], 4)
-    femmesh.addFace([125, 50, 126, 568, 569, 755], 5)
-    femmesh.addFace([125, 49, 50, 566, 564, 568], 6)
-    femmesh.addFace([120, 117, 119, 737, 736, 741], 7)
-    femmesh.addFace([120, 118, 117, 738, 735, 737], 8)
-    femmesh.addFace([120, 123, 118, 743, 740, 738], 9)
-    femmesh.addFace([120, 126, 123, 745, 751, 743], 10)
-    femmesh.addFace([115, 121, 116, 732, 733, 730], 11)
-    femmesh.addFace([115, 118, 121, 731, 739, 732], 12)
-    femmesh.addFace([115, 114, 118, 727, 729, 731], 13)
-    femmesh.addFace([115, 26, 114, 501, 500, 727], 14)
-    femmesh.addFace([115, 27, 26, 503, 499, 501], 15)
-    femmesh.addFace([115, 116, 27, 730, 504, 503], 16)
-    femmesh.addFace([110, 109, 46, 720, 556, 557], 17)
-    femmesh.addFace([110, 100, 109, 702, 701, 720], 18)
-    femmesh.addFace([110, 103, 100, 711, 700, 702], 19)
-    femmesh.addFace([110, 111, 103, 721, 712, 711], 20)
-    femmesh.addFace([110, 47, 111, 559, 560, 721], 21)
-    femmesh.addFace([110, 46, 47, 557, 555, 559], 22)
-    femmesh.addFace([105, 80, 41, 644, 541, 542], 23)
-    femmesh.addFace([105, 87, 80, 663, 643, 644], 24)
-    femmesh.addFace([105, 88, 87, 665, 662, 663], 25)
-    femmesh.addFace([105, 106, 88, 716, 666, 665], 26)
-    femmesh.addFace([105, 42, 106, 544, 545, 716], 27)
-    femmesh.addFace([105, 41, 42, 542, 540, 544], 28)
-    femmesh.addFace([100, 99, 109, 697, 699, 701], 29)
-    femmesh.addFace([100, 97, 99, 693, 692, 697], 30)
-    femmesh.addFace([100, 98, 97, 694, 691, 693], 31)
-    femmesh.addFace([100, 103, 98, 700, 696, 694], 32)
-    femmesh.addFace([95, 101, 96, 687, 688, 685], 33)
-    femmesh.addFace([95, 98, 101, 686, 695, 687], 34)
-    femmesh.addFace([95, 94, 98, 682, 684, 686], 35)
-    femmesh.addFace([95, 22, 94, 489, 488, 682], 36)
-    femmesh.addFace([95, 23, 22, 491, 487, 489], 37)
-    femmesh.addFace([95, 96, 23, 685, 492, 491], 38)
-    femmesh.addFace([90, 89, 92, 667, 669, 670], 39)
-    femmesh.addFace([90, 84, 89, 654, 653, 667], 40)
-    femmesh.addFace([90, 93, 84, 671, 655, 654], 41)
-    femmesh.addFace([90, 97, 93, 672, 681, 671], 42)
-    femmesh.addFace([90, 99, 97, 673, 692, 672], 43)
-    femmesh.addFace([90, 92, 99, 670, 677, 673], 44)
-    femmesh.addFace([85, 81, 71, 646, 628, 629], 45)
-    femmesh.addFace([85, 82, 81, 648, 645, 646], 46)
-    femmesh.addFace([85, 86, 82, 656, 649, 648], 47)
-    femmesh.addFace([85, 88, 86, 658, 659, 656], 48)
-    femmesh.addFace([85, 87, 88, 657, 662, 658], 49)
-    femmesh.addFace([85, 71, 87, 629, 630, 657], 50)
-    femmesh.addFace([80, 87, 73, 643, 636, 635], 51)
-    femmesh.addFace([80, 40, 41, 539, 537, 541], 52)
-    femmesh.addFace([80, 79, 40, 642, 538, 539], 53)
-    femmesh.addFace([80, 73, 79, 635, 634, 642], 54)
-    femmesh.addFace([75, 74, 35, 637, 523, 524], 55)
-    femmesh.addFace([75, 60, 74, 597, 596, 637], 56)
-    femmesh.addFace([75, 61, 60, 599, 595, 597], 57)
-    femmesh.addFace([75, 76, 61, 638, 600, 599], 58)
-    femmesh.addFace([75, 36, 76, 526, 527, 638], 59)
-    femmesh.addFace([75, 35, 36, 524, 522, 526], 60)
-    femmesh.addFace([70, 67, 72, 616, 617, 625], 61)
-    femmesh.addFace([70, 64, 67, 608, 607, 616], 62)
-    femmesh.addFace([70, 65, 64, 609, 606, 608], 63)
-    femmesh.addFace([70, 71, 65, 624, 610, 609], 64)
-    femmesh.addFace([70, 73, 71, 626, 627, 624], 65)
-    femmesh.addFace([70, 72, 73, 625, 631, 626], 66)
-    femmesh.addFace([65, 15, 64, 468, 467, 606], 67)
-    femmesh.addFace([65, 16, 15, 470, 466, 468], 68)
-    femmesh.addFace([65, 81, 16, 611, 471, 470], 69)
-    femmesh.addFace([65, 71, 81, 610, 628, 611], 70)
-    femmesh.addFace([60, 57, 74, 586, 587, 596], 71)
-    femmesh.addFace([60, 56, 57, 585, 583, 586], 72)
-    femmesh.addFace([60, 58, 56, 589, 584, 585], 73)
-    femmesh.addFace([60, 61, 58, 595, 590, 589], 74)
-    femmesh.addFace([55, 59, 62, 581, 592, 582], 75)
-    femmesh.addFace([55, 58, 59, 580, 588, 581], 76)
-    femmesh.addFace([55, 54, 58, 577, 579, 580], 77)
-    femmesh.addFace([55, 11, 54, 456, 455, 577], 78)
-    femmesh.addFace([55, 12, 11, 458, 454, 456], 79)
-    femmesh.addFace([55, 62, 12, 582, 459, 458], 80)
-    femmesh.addFace([50, 51, 126, 567, 571, 569], 81)
-    femmesh.addFace([45, 108, 44, 553, 551, 549], 82)
-    femmesh.addFace([45, 109, 108, 554, 719, 553], 83)
-    femmesh.addFace([45, 46, 109, 552, 556, 554], 84)
-    femmesh.addFace([40, 79, 39, 538, 536, 534], 85)
-    femmesh.addFace([35, 74, 34, 523, 521, 520], 86)
-    femmesh.addFace([30, 122, 31, 511, 513, 509], 87)
-    femmesh.addFace([30, 116, 122, 510, 734, 511], 88)
-    femmesh.addFace([30, 29, 116, 507, 508, 510], 89)
-    femmesh.addFace([25, 24, 113, 493, 495, 497], 90)
-    femmesh.addFace([25, 114, 26, 498, 500, 496], 91)
-    femmesh.addFace([25, 113, 114, 497, 725, 498], 92)
-    femmesh.addFace([20, 19, 84, 478, 480, 482], 93)
-    femmesh.addFace([20, 93, 21, 483, 485, 481], 94)
-    femmesh.addFace([20, 84, 93, 482, 655, 483], 95)
-    femmesh.addFace([15, 14, 64, 463, 465, 467], 96)
-    femmesh.addFace([10, 54, 11, 453, 455, 451], 97)
-    femmesh.addFace([10, 53, 54, 452, 575, 453], 98)
-    femmesh.addFace([10, 5, 53, 438, 439, 452], 99)
-    femmesh.addFace([10, 1, 5, 430, 429, 438], 100)
-    femmesh.addFace([5, 6, 53, 437, 441, 439], 101)
-    femmesh.addFace([124, 122, 121, 749, 746, 748], 102)
-    femmesh.addFace([124, 31, 122, 514, 513, 749], 103)
-    femmesh.addFace([124, 32, 31, 516, 512, 514], 104)
-    femmesh.addFace([124, 128, 32, 754, 517, 516], 105)
-    femmesh.addFace([124, 127, 128, 753, 757, 754], 106)
-    femmesh.addFace([124, 123, 127, 750, 752, 753], 107)
-    femmesh.addFace([124, 121, 123, 748, 747, 750], 108)
-    femmesh.addFace([119, 104, 112, 715, 714, 723], 109)
-    femmesh.addFace([119, 102, 104, 709, 706, 715], 110)
-    femmesh.addFace([119, 117, 102, 736, 708, 709], 111)
-    femmesh.addFace([114, 117, 118, 728, 735, 729], 112)
-    femmesh.addFace([114, 113, 117, 725, 726, 728], 113)
-    femmesh.addFace([109, 99, 108, 699, 698, 719], 114)
-    femmesh.addFace([104, 111, 112, 713, 722, 714], 115)
-    femmesh.addFace([104, 103, 111, 710, 712, 713], 116)
-    femmesh.addFace([104, 101, 103, 705, 704, 710], 117)
-    femmesh.addFace([104, 102, 101, 706, 703, 705], 118)
-    femmesh.addFace([99, 92, 108, 677, 679, 698], 119)
-    femmesh.addFace([94, 22, 21, 488, 484, 486], 120)
-    femmesh.addFace([94, 97, 98, 683, 691, 684], 121)
-    femmesh.addFace([94, 93, 97, 680, 681, 683], 122)
-    femmesh.addFace([94, 21, 93, 486, 485, 680], 123)
-    femmesh.addFace([89, 91, 92, 668, 674, 669], 124)
-    femmesh.addFace([89, 86, 91, 660, 661, 668], 125)
-    femmesh.addFace([89, 83, 86, 652, 651, 660], 126)
-    femmesh.addFace([89, 84, 83, 653, 650, 652], 127)
-    femmesh.addFace([84, 19, 83, 480, 479, 650], 128)
-    femmesh.addFace([79, 73, 72, 634, 631, 633], 129)
-    femmesh.addFace([79, 78, 39, 641, 535, 536], 130)
-    femmesh.addFace([79, 72, 78, 633, 632, 641], 131)
-    femmesh.addFace([74, 9, 34, 450, 449, 521], 132)
-    femmesh.addFace([74, 8, 9, 448, 446, 450], 133)
-    femmesh.addFace([74, 57, 8, 587, 447, 448], 134)
-    femmesh.addFace([69, 78, 72, 623, 632, 621], 135)
-    femmesh.addFace([69, 77, 78, 622, 640, 623], 136)
-    femmesh.addFace([69, 68, 77, 618, 620, 622], 137)
-    femmesh.addFace([69, 66, 68, 614, 613, 618], 138)
-    femmesh.addFace([69, 67, 66, 615, 612, 614], 139)
-    femmesh.addFace([69, 72, 67, 621, 617, 615], 140)
-    femmesh.addFace([64, 63, 67, 603, 605, 607], 141)
-    femmesh.addFace([64, 14, 63, 465, 464, 603], 142)
-    femmesh.addFace([59, 58, 61, 588, 590, 591], 143)
-    femmesh.addFace([59, 66, 62, 593, 602, 592], 144)
-    femmesh.addFace([59, 68, 66, 594, 613, 593], 145)
-    femmesh.addFace([59, 61, 68, 591, 598, 594], 146)
-    femmesh.addFace([54, 56, 58, 578, 584, 579], 147)
-    femmesh.addFace([54, 53, 56, 575, 576, 578], 148)
-    femmesh.addFace([49, 112, 48, 565, 563, 561], 149)
-    femmesh.addFace([44, 107, 43, 550, 548, 546], 150)
-    femmesh.addFace([44, 108, 107, 551, 718, 550], 151)
-    femmesh.addFace([39, 78, 38, 535, 533, 531], 152)
-    femmesh.addFace([34, 9, 2, 449, 431, 432], 153)
-    femmesh.addFace([29, 28, 116, 505, 506, 508], 154)
-    femmesh.addFace([29, 3, 28, 434, 433, 505], 155)
-    femmesh.addFace([24, 96, 113, 494, 690, 495], 156)
-    femmesh.addFace([24, 23, 96, 490, 492, 494], 157)
-    femmesh.addFace([19, 18, 83, 475, 477, 479], 158)
-    femmesh.addFace([14, 13, 63, 460, 462, 464], 159)
-    femmesh.addFace([4, 33, 52, 435, 518, 436], 160)
-    femmesh.addFace([128, 33, 32, 519, 515, 517], 161)
-    femmesh.addFace([128, 52, 33, 574, 518, 519], 162)
-    femmesh.addFace([128, 127, 52, 757, 573, 574], 163)
-    femmesh.addFace([123, 126, 127, 751, 756, 752], 164)
-    femmesh.addFace([123, 121, 118, 747, 739, 740], 165)
-    femmesh.addFace([113, 102, 117, 707, 708, 726], 166)
-    femmesh.addFace([113, 96, 102, 690, 689, 707], 167)
-    femmesh.addFace([108, 92, 107, 679, 678, 718], 168)
-    femmesh.addFace([103, 101, 98, 704, 695, 696], 169)
-    femmesh.addFace([88, 91, 86, 664, 661, 659], 170)
-    femmesh.addFace([88, 106, 91, 666, 675, 664], 171)
-    femmesh.addFace([83, 82, 86, 647, 649, 651], 172)
-    femmesh.addFace([83, 18, 82, 477, 476, 647], 173)
-    femmesh.addFace([78, 77, 38, 640, 532, 533], 174)
-    femmesh.addFace([73, 87, 71, 636, 630, 627], 175)
-    femmesh.addFace([68, 76, 77, 619, 639, 620], 176)
-    femmesh.addFace([68, 61, 76, 598, 600, 619], 177)
-    femmesh.addFace([63, 66, 67, 604, 612, 605], 178)
-    femmesh.addFace([63, 62, 66, 601, 602, 604], 179)
-    femmesh.addFace([63, 13, 62, 462, 461, 601], 180)
-    femmesh.addFace([53, 6, 56, 441, 442, 576], 181)
-    femmesh.addFace([48, 111, 47, 562, 560, 558], 182)
-    femmesh.addFace([48, 112, 111, 563, 722, 562], 183)
-    femmesh.addFace([43, 106, 42, 547, 545, 543], 184)
-    femmesh.addFace([43, 107, 106, 548, 717, 547], 185)
-    femmesh.addFace([38, 77, 37, 532, 530, 528], 186)
-    femmesh.addFace([28, 27, 116, 502, 504, 506], 187)
-    femmesh.addFace([18, 17, 82, 472, 474, 476], 188)
-    femmesh.addFace([13, 12, 62, 457, 459, 461], 189)
-    femmesh.addFace([8, 57, 7, 447, 445, 443], 190)
-    femmesh.addFace([127, 51, 52, 572, 570, 573], 191)
-    femmesh.addFace([127, 126, 51, 756, 571, 572], 192)
-    femmesh.addFace([122, 116, 121, 734, 733, 746], 193)
-    femmesh.addFace([107, 91, 106, 676, 675, 717], 194)
-    femmesh.addFace([107, 92, 91, 678, 674, 676], 195)
-    femmesh.addFace([102, 96, 101, 689, 688, 703], 196)
-    femmesh.addFace([82, 17, 81, 474, 473, 645], 197)
-    femmesh.addFace([77, 76, 37, 639, 529, 530], 198)
-    femmesh.addFace([57, 56, 7, 583, 444, 445], 199)
-    femmesh.addFace([37, 76, 36, 529, 527, 525], 200)
-    femmesh.addFace([17, 16, 81, 469, 471, 473], 201)
-    femmesh.addFace([7, 56, 6, 444, 442, 440], 202)
-    femmesh.addFace([232, 219, 156, 1025, 837, 838], 203)
-    femmesh.addFace([232, 226, 219, 1051, 1024, 1025], 204)
-    femmesh.addFace([232, 227, 226, 1053, 1050, 1051], 205)
-    femmesh.addFace([232, 233, 227, 1064, 1054, 1053], 206)
-    femmesh.addFace([232, 157, 233, 840, 841, 1064], 207)
-    femmesh.addFace([232, 156, 157, 838, 836, 840], 208)
-    femmesh.addFace([227, 224, 226, 1046, 1045, 1050], 209)
-    femmesh.addFace([227, 225, 224, 1047, 1044, 1046], 210)
-    femmesh.addFace([227, 230, 225, 1052, 1049, 1047], 211)
-    femmesh.addFace([227, 233, 230, 1054, 1060, 1052], 212)
-    femmesh.addFace([222, 228, 223, 1037, 1040, 1035], 213)
-    femmesh.addFace([222, 225, 228, 1036, 1048, 1037], 214)
-    femmesh.addFace([222, 221, 225, 1030, 1032, 1036], 215)
-    femmesh.addFace([222, 50, 221, 1038, 1034, 1030], 216)
-    femmesh.addFace([222, 51, 50, 1039, 567, 1038], 217)
-    femmesh.addFace([222, 223, 51, 1035, 1042, 1039], 218)
-    femmesh.addFace([217, 216, 153, 1021, 828, 829], 219)
-    femmesh.addFace([217, 207, 216, 1003, 1002, 1021], 220)
-    femmesh.addFace([217, 210, 207, 1012, 1001, 1003], 221)
-    femmesh.addFace([217, 218, 210, 1022, 1013, 1012], 222)
-    femmesh.addFace([217, 154, 218, 831, 832, 1022], 223)
-    femmesh.addFace([217, 153, 154, 829, 827, 831], 224)
-    femmesh.addFace([212, 187, 148, 929, 813, 814], 225)
-    femmesh.addFace([212, 194, 187, 956, 928, 929], 226)
-    femmesh.addFace([212, 195, 194, 958, 955, 956], 227)
-    femmesh.addFace([212, 213, 195, 1017, 959, 958], 228)
-    femmesh.addFace([212, 149, 213, 816, 817, 1017], 229)
-    femmesh.addFace([212, 148, 149, 814, 812, 816], 230)
-    femmesh.addFace([207, 206, 216, 998, 1000, 1002], 231)
-    femmesh.addFace([207, 204, 206, 994, 993, 998], 232)
-    femmesh.addFace([207, 205, 204, 995, 992, 994], 233)
-    femmesh.addFace([207, 210, 205, 1001, 997, 995], 234)
-    femmesh.addFace([202, 208, 203, 984, 987, 982], 235)
-    femmesh.addFace([202, 205, 208, 983, 996, 984], 236)
-    femmesh.addFace([202, 201, 205, 977, 979, 983], 237)
-    femmesh.addFace([202, 46, 201, 985, 981, 977], 238)
-    femmesh.addFace([202, 47, 46, 986, 555, 985], 239)
-    femmesh.addFace([202, 203, 47, 982, 990, 986], 240)
-    femmesh.addFace([197, 196, 199, 960, 962, 963], 241)
-    femmesh.addFace([197, 191, 196, 945, 944, 960], 242)
-    femmesh.addFace([197, 200, 191, 964, 946, 945], 243)
-    femmesh.addFace([197, 204, 200, 965, 974, 964], 244)
-    femmesh.addFace([197, 206, 204, 966, 993, 965], 245)
-    femmesh.addFace([197, 199, 206, 963, 970, 966], 246)
-    femmesh.addFace([192, 188, 178, 931, 913, 914], 247)
-    femmesh.addFace([192, 189, 188, 935, 930, 931], 248)
-    femmesh.addFace([192, 193, 189, 949, 936, 935], 249)
-    femmesh.addFace([192, 195, 193, 951, 952, 949], 250)
-    femmesh.addFace([192, 194, 195, 950, 955, 951], 251)
-    femmesh.addFace([192, 178, 194, 914, 915, 950], 252)
-    femmesh.addFace([187, 194, 180, 928, 921, 920], 253)
-    femmesh.addFace([187, 147, 148, 811, 809, 813], 254)
-    femmesh.addFace([187, 186, 147, 927, 810, 811], 255)
-    femmesh.addFace([187, 180, 186, 920, 919, 927], 256)
-    femmesh.addFace([182, 181, 142, 922, 795, 796], 257)
-    femmesh.addFace([182, 167, 181, 874, 873, 922], 258)
-    femmesh.addFace([182, 168, 167, 876, 872, 874], 259)
-    femmesh.addFace([182, 183, 168, 923, 877, 876], 260)
-    femmesh.addFace([182, 143, 183, 798, 799, 923], 261)
-    femmesh.addFace([182, 142, 143, 796, 794, 798], 262)
-    femmesh.addFace([177, 174, 179, 901, 902, 910], 263)
-    femmesh.addFace([177, 171, 174, 889, 888, 901], 264)
-    femmesh.addFace([177, 172, 171, 892, 887, 889], 265)
-    femmesh.addFace([177, 178, 172, 909, 893, 892], 266)
-    femmesh.addFace([177, 180, 178, 911, 912, 909], 267)
-    femmesh.addFace([177, 179, 180, 910, 916, 911], 268)
-    femmesh.addFace([172, 39, 171, 895, 891, 887], 269)
-    femmesh.addFace([172, 40, 39, 896, 534, 895], 270)
-    femmesh.addFace([172, 188, 40, 894, 932, 896], 271)
-    femmesh.addFace([172, 178, 188, 893, 913, 894], 272)
-    femmesh.addFace([167, 164, 181, 863, 864, 873], 273)
-    femmesh.addFace([167, 163, 164, 862, 860, 863], 274)
-    femmesh.addFace([167, 165, 163, 866, 861, 862], 275)
-    femmesh.addFace([167, 168, 165, 872, 867, 866], 276)
-    femmesh.addFace([162, 166, 169, 856, 869, 857], 277)
-    femmesh.addFace([162, 165, 166, 855, 865, 856], 278)
-    femmesh.addFace([162, 161, 165, 850, 852, 855], 279)
-    femmesh.addFace([162, 35, 161, 858, 854, 850], 280)
-    femmesh.addFace([162, 36, 35, 859, 522, 858], 281)
-    femmesh.addFace([162, 169, 36, 857, 880, 859], 282)
-    femmesh.addFace([157, 158, 233, 839, 843, 841], 283)
-    femmesh.addFace([152, 215, 151, 825, 823, 821], 284)
-    femmesh.addFace([152, 216, 215, 826, 1020, 825], 285)
-    femmesh.addFace([152, 153, 216, 824, 828, 826], 286)
-    femmesh.addFace([147, 186, 146, 810, 808, 806], 287)
-    femmesh.addFace([142, 181, 141, 795, 793, 792], 288)
-    femmesh.addFace([137, 229, 138, 783, 785, 781], 289)
-    femmesh.addFace([137, 223, 229, 782, 1041, 783], 290)
-    femmesh.addFace([137, 136, 223, 777, 778, 782], 291)
-    femmesh.addFace([132, 160, 131, 767, 763, 762], 292)
-    femmesh.addFace([132, 163, 160, 768, 848, 767], 293)
-    femmesh.addFace([132, 133, 163, 766, 770, 768], 294)
-    femmesh.addFace([49, 48, 220, 561, 1028, 1029], 295)
-    femmesh.addFace([49, 221, 50, 1033, 1034, 564], 296)
-    femmesh.addFace([49, 220, 221, 1029, 1026, 1033], 297)
-    femmesh.addFace([44, 43, 191, 546, 948, 947], 298)
-    femmesh.addFace([44, 200, 45, 975, 976, 549], 299)
-    femmesh.addFace([44, 191, 200, 947, 946, 975], 300)
-    femmesh.addFace([39, 38, 171, 531, 890, 891], 301)
-    femmesh.addFace([34, 161, 35, 853, 854, 520], 302)
-    femmesh.addFace([34, 160, 161, 849, 847, 853], 303)
-    femmesh.addFace([34, 131, 160, 765, 763, 849], 304)
-    femmesh.addFace([34, 2, 131, 432, 764, 765], 305)
-    femmesh.addFace([231, 229, 228, 1058, 1055, 1057], 306)
-    femmesh.addFace([231, 138, 229, 786, 785, 1058], 307)
-    femmesh.addFace([231, 139, 138, 788, 784, 786], 308)
-    femmesh.addFace([231, 235, 139, 1063, 789, 788], 309)
-    femmesh.addFace([231, 234, 235, 1062, 1066, 1063], 310)
-    femmesh.addFace([231, 230, 234, 1059, 1061, 1062], 311)
-    femmesh.addFace([231, 228, 230, 1057, 1056, 1059], 312)
-    femmesh.addFace([226, 211, 219, 1016, 1015, 1024], 313)
-    femmesh.addFace([226, 209, 211, 1010, 1007, 1016], 314)
-    femmesh.addFace([226, 224, 209, 1045, 1009, 1010], 315)
-    femmesh.addFace([221, 224, 225, 1031, 1044, 1032], 316)
-    femmesh.addFace([221, 220, 224, 1026, 1027, 1031], 317)
-    femmesh.addFace([216, 206, 215, 1000, 999, 1020], 318)
-    femmesh.addFace([211, 218, 219, 1014, 1023, 1015], 319)
-    femmesh.addFace([211, 210, 218, 1011, 1013, 1014], 320)
-    femmesh.addFace([211, 208, 210, 1006, 1005, 1011], 321)
-    femmesh.addFace([211, 209, 208, 1007, 1004, 1006], 322)
-    femmesh.addFace([206, 199, 215, 970, 972, 999], 323)
-    femmesh.addFace([201, 46, 45, 981, 552, 980], 324)
-    femmesh.addFace([201, 204, 205, 978, 992, 979], 325)
-    femmesh.addFace([201, 200, 204, 973, 974, 978], 326)
-    femmesh.addFace([201, 45, 200, 980, 976, 973], 327)
-    femmesh.addFace([196, 198, 199, 961, 967, 962], 328)
-    femmesh.addFace([196, 193, 198, 953, 954, 961], 329)
-    femmesh.addFace([196, 190, 193, 941, 940, 953], 330)
-    femmesh.addFace([196, 191, 190, 944, 939, 941], 331)
-    femmesh.addFace([191, 43, 190, 948, 942, 939], 332)
-    femmesh.addFace([186, 180, 179, 919, 916, 918], 333)
-    femmesh.addFace([186, 185, 146, 926, 807, 808], 334)
-    femmesh.addFace([186, 179, 185, 918, 917, 926], 335)
-    femmesh.addFace([181, 135, 141, 776, 775, 793], 336)
-    femmesh.addFace([181, 134, 135, 774, 772, 776], 337)
-    femmesh.addFace([181, 164, 134, 864, 773, 774], 338)
-    femmesh.addFace([176, 185, 179, 908, 917, 906], 339)
-    femmesh.addFace([176, 184, 185, 907, 925, 908], 340)
-    femmesh.addFace([176, 175, 184, 903, 905, 907], 341)
-    femmesh.addFace([176, 173, 175, 899, 898, 903], 342)
-    femmesh.addFace([176, 174, 173, 900, 897, 899], 343)
-    femmesh.addFace([176, 179, 174, 906, 902, 900], 344)
-    femmesh.addFace([171, 170, 174, 882, 884, 888], 345)
-    femmesh.addFace([171, 38, 170, 890, 886, 882], 346)
-    femmesh.addFace([166, 165, 168, 865, 867, 868], 347)
-    femmesh.addFace([166, 173, 169, 870, 879, 869], 348)
-    femmesh.addFace([166, 175, 173, 871, 898, 870], 349)
-    femmesh.addFace([166, 168, 175, 868, 875, 871], 350)
-    femmesh.addFace([161, 163, 165, 851, 861, 852], 351)
-    femmesh.addFace([161, 160, 163, 847, 848, 851], 352)
-    femmesh.addFace([156, 219, 155, 837, 835, 833], 353)
-    femmesh.addFace([151, 214, 150, 822, 820, 818], 354)
-    femmesh.addFace([151, 215, 214, 823, 1019, 822], 355)
-    femmesh.addFace([146, 185, 145, 807, 805, 803], 356)
-    femmesh.addFace([141, 135, 129, 775, 758, 759], 357)
-    femmesh.addFace([136, 52, 223, 779, 1043, 778], 358)
-    femmesh.addFace([136, 4, 52, 780, 436, 779], 359)
-    femmesh.addFace([48, 203, 220, 991, 989, 1028], 360)
-    femmesh.addFace([48, 47, 203, 558, 990, 991], 361)
-    femmesh.addFace([43, 42, 190, 543, 943, 942], 362)
-    femmesh.addFace([38, 37, 170, 528, 885, 886], 363)
-    femmesh.addFace([130, 140, 159, 760, 790, 761], 364)
-    femmesh.addFace([235, 140, 139, 791, 787, 789], 365)
-    femmesh.addFace([235, 159, 140, 846, 790, 791], 366)
-    femmesh.addFace([235, 234, 159, 1066, 845, 846], 367)
-    femmesh.addFace([230, 233, 234, 1060, 1065, 1061], 368)
-    femmesh.addFace([230, 228, 225, 1056, 1048, 1049], 369)
-    femmesh.addFace([220, 209, 224, 1008, 1009, 1027], 370)
-    femmesh.addFace([220, 203, 209, 989, 988, 1008], 371)
-    femmesh.addFace([215, 199, 214, 972, 971, 1019], 372)
-    femmesh.addFace([210, 208, 205, 1005, 996, 997], 373)
-    femmesh.addFace([195, 198, 193, 957, 954, 952], 374)
-    femmesh.addFace([195, 213, 198, 959, 968, 957], 375)
-    femmesh.addFace([190, 189, 193, 934, 936, 940], 376)
-    femmesh.addFace([190, 42, 189, 943, 938, 934], 377)
-    femmesh.addFace([185, 184, 145, 925, 804, 805], 378)
-    femmesh.addFace([180, 194, 178, 921, 915, 912], 379)
-    femmesh.addFace([175, 183, 184, 904, 924, 905], 380)
-    femmesh.addFace([175, 168, 183, 875, 877, 904], 381)
-    femmesh.addFace([170, 173, 174, 883, 897, 884], 382)
-    femmesh.addFace([170, 169, 173, 878, 879, 883], 383)
-    femmesh.addFace([170, 37, 169, 885, 881, 878], 384)
-    femmesh.addFace([155, 218, 154, 834, 832, 830], 385)
-    femmesh.addFace([155, 219, 218, 835, 1023, 834], 386)
-    femmesh.addFace([150, 213, 149, 819, 817, 815], 387)
-    femmesh.addFace([150, 214, 213, 820, 1018, 819], 388)
-    femmesh.addFace([145, 184, 144, 804, 802, 800], 389)
-    femmesh.addFace([52, 51, 223, 570, 1042, 1043], 390)
-    femmesh.addFace([42, 41, 189, 540, 937, 938], 391)
-    femmesh.addFace([37, 36, 169, 525, 880, 881], 392)
-    femmesh.addFace([234, 158, 159, 844, 842, 845], 393)
-    femmesh.addFace([234, 233, 158, 1065, 843, 844], 394)
-    femmesh.addFace([229, 223, 228, 1041, 1040, 1055], 395)
-    femmesh.addFace([214, 198, 213, 969, 968, 1018], 396)
-    femmesh.addFace([214, 199, 198, 971, 967, 969], 397)
-    femmesh.addFace([209, 203, 208, 988, 987, 1004], 398)
-    femmesh.addFace([189, 41, 188, 937, 933, 930], 399)
-    femmesh.addFace([184, 183, 144, 924, 801, 802], 400)
-    femmesh.addFace([164, 133, 134, 771, 769, 773], 401)
-    femmesh.addFace([164, 163, 133, 860, 770, 771], 402)
-    femmesh.addFace([144, 183, 143, 801, 799, 797], 403)
-    femmesh.addFace([41, 40, 188, 537, 932, 933], 404)
-    femmesh.addFace([339, 326, 263, 1334, 1146, 1147], 405)
-    femmesh.addFace([339, 333, 326, 1360, 1333, 1334], 406)
-    femmesh.addFace([339, 334, 333, 1362, 1359, 1360], 407)
-    femmesh.addFace([339, 340, 334, 1373, 1363, 1362], 408)
-    femmesh.addFace([339, 264, 340, 1149, 1150, 1373], 409)
-    femmesh.addFace([339, 263, 264, 1147, 1145, 1149], 410)
-    femmesh.addFace([334, 331, 333, 1355, 1354, 1359], 411)
-    femmesh.addFace([334, 332, 331, 1356, 1353, 1355], 412)
-    femmesh.addFace([334, 337, 332, 1361, 1358, 1356], 413)
-    femmesh.addFace([334, 340, 337, 1363, 1369, 1361], 414)
-    femmesh.addFace([329, 335, 330, 1346, 1349, 1344], 415)
-    femmesh.addFace([329, 332, 335, 1345, 1357, 1346], 416)
-    femmesh.addFace([329, 328, 332, 1339, 1341, 1345], 417)
-    femmesh.addFace([329, 157, 328, 1347, 1343, 1339], 418)
-    femmesh.addFace([329, 158, 157, 1348, 839, 1347], 419)
-    femmesh.addFace([329, 330, 158, 1344, 1351, 1348], 420)
-    femmesh.addFace([324, 323, 260, 1330, 1137, 1138], 421)
-    femmesh.addFace([324, 314, 323, 1312, 1311, 1330], 422)
-    femmesh.addFace([324, 317, 314, 1321, 1310, 1312], 423)
-    femmesh.addFace([324, 325, 317, 1331, 1322, 1321], 424)
-    femmesh.addFace([324, 261, 325, 1140, 1141, 1331], 425)
-    femmesh.addFace([324, 260, 261, 1138, 1136, 1140], 426)
-    femmesh.addFace([319, 294, 255, 1238, 1122, 1123], 427)
-    femmesh.addFace([319, 301, 294, 1265, 1237, 1238], 428)
-    femmesh.addFace([319, 302, 301, 1267, 1264, 1265], 429)
-    femmesh.addFace([319, 320, 302, 1326, 1268, 1267], 430)
-    femmesh.addFace([319, 256, 320, 1125, 1126, 1326], 431)
-    femmesh.addFace([319, 255, 256, 1123, 1121, 1125], 432)
-    femmesh.addFace([314, 313, 323, 1307, 1309, 1311], 433)
-    femmesh.addFace([314, 311, 313, 1303, 1302, 1307], 434)
-    femmesh.addFace([314, 312, 311, 1304, 1301, 1303], 435)
-    femmesh.addFace([314, 317, 312, 1310, 1306, 1304], 436)
-    femmesh.addFace([309, 315, 310, 1293, 1296, 1291], 437)
-    femmesh.addFace([309, 312, 315, 1292, 1305, 1293], 438)
-    femmesh.addFace([309, 308, 312, 1286, 1288, 1292], 439)
-    femmesh.addFace([309, 153, 308, 1294, 1290, 1286], 440)
-    femmesh.addFace([309, 154, 153, 1295, 827, 1294], 441)
-    femmesh.addFace([309, 310, 154, 1291, 1299, 1295], 442)
-    femmesh.addFace([304, 303, 306, 1269, 1271, 1272], 443)
-    femmesh.addFace([304, 298, 303, 1254, 1253, 1269], 444)
-    femmesh.addFace([304, 307, 298, 1273, 1255, 1254], 445)
-    femmesh.addFace([304, 311, 307, 1274, 1283, 1273], 446)
-    femmesh.addFace([304, 313, 311, 1275, 1302, 1274], 447)
-    femmesh.addFace([304, 306, 313, 1272, 1279, 1275], 448)
-    femmesh.addFace([299, 295, 285, 1240, 1222, 1223], 449)
-    femmesh.addFace([299, 296, 295, 1244, 1239, 1240], 450)
-    femmesh.addFace([299, 300, 296, 1258, 1245, 1244], 451)
-    femmesh.addFace([299, 302, 300, 1260, 1261, 1258], 452)
-    femmesh.addFace([299, 301, 302, 1259, 1264, 1260], 453)
-    femmesh.addFace([299, 285, 301, 1223, 1224, 1259], 454)
-    femmesh.addFace([294, 301, 287, 1237, 1230, 1229], 455)
-    femmesh.addFace([294, 254, 255, 1120, 1118, 1122], 456)
-    femmesh.addFace([294, 293, 254, 1236, 1119, 1120], 457)
-    femmesh.addFace([294, 287, 293, 1229, 1228, 1236], 458)
-    femmesh.addFace([289, 288, 249, 1231, 1104, 1105], 459)
-    femmesh.addFace([289, 274, 288, 1183, 1182, 1231], 460)
-    femmesh.addFace([289, 275, 274, 1185, 1181, 1183], 461)
-    femmesh.addFace([289, 290, 275, 1232, 1186, 1185], 462)
-    femmesh.addFace([289, 250, 290, 1107, 1108, 1232], 463)
-    femmesh.addFace([289, 249, 250, 1105, 1103, 1107], 464)
-    femmesh.addFace([284, 281, 286, 1210, 1211, 1219], 465)
-    femmesh.addFace([284, 278, 281, 1198, 1197, 1210], 466)
-    femmesh.addFace([284, 279, 278, 1201, 1196, 1198], 467)
-    femmesh.addFace([284, 285, 279, 1218, 1202, 1201], 468)
-    femmesh.addFace([284, 287, 285, 1220, 1221, 1218], 469)
-    femmesh.addFace([284, 286, 287, 1219, 1225, 1220], 470)
-    femmesh.addFace([279, 146, 278, 1204, 1200, 1196], 471)
-    femmesh.addFace([279, 147, 146, 1205, 806, 1204], 472)
-    femmesh.addFace([279, 295, 147, 1203, 1241, 1205], 473)
-    femmesh.addFace([279, 285, 295, 1202, 1222, 1203], 474)
-    femmesh.addFace([274, 271, 288, 1172, 1173, 1182], 475)
-    femmesh.addFace([274, 270, 271, 1171, 1169, 1172], 476)
-    femmesh.addFace([274, 272, 270, 1175, 1170, 1171], 477)
-    femmesh.addFace([274, 275, 272, 1181, 1176, 1175], 478)
-    femmesh.addFace([269, 273, 276, 1165, 1178, 1166], 479)
-    femmesh.addFace([269, 272, 273, 1164, 1174, 1165], 480)
-    femmesh.addFace([269, 268, 272, 1159, 1161, 1164], 481)
-    femmesh.addFace([269, 142, 268, 1167, 1163, 1159], 482)
-    femmesh.addFace([269, 143, 142, 1168, 794, 1167], 483)
-    femmesh.addFace([269, 276, 143, 1166, 1189, 1168], 484)
-    femmesh.addFace([264, 265, 340, 1148, 1152, 1150], 485)
-    femmesh.addFace([259, 322, 258, 1134, 1132, 1130], 486)
-    femmesh.addFace([259, 323, 322, 1135, 1329, 1134], 487)
-    femmesh.addFace([259, 260, 323, 1133, 1137, 1135], 488)
-    femmesh.addFace([254, 293, 253, 1119, 1117, 1115], 489)
-    femmesh.addFace([249, 288, 248, 1104, 1102, 1101], 490)
-    femmesh.addFace([244, 336, 245, 1092, 1094, 1090], 491)
-    femmesh.addFace([244, 330, 336, 1091, 1350, 1092], 492)
-    femmesh.addFace([244, 243, 330, 1086, 1087, 1091], 493)
-    femmesh.addFace([239, 267, 238, 1076, 1072, 1071], 494)
-    femmesh.addFace([239, 270, 267, 1077, 1157, 1076], 495)
-    femmesh.addFace([239, 240, 270, 1075, 1079, 1077], 496)
-    femmesh.addFace([156, 155, 327, 833, 1337, 1338], 497)
-    femmesh.addFace([156, 328, 157, 1342, 1343, 836], 498)
-    femmesh.addFace([156, 327, 328, 1338, 1335, 1342], 499)
-    femmesh.addFace([151, 150, 298, 818, 1257, 1256], 500)
-    femmesh.addFace([151, 307, 152, 1284, 1285, 821], 501)
-    femmesh.addFace([151, 298, 307, 1256, 1255, 1284], 502)
-    femmesh.addFace([146, 145, 278, 803, 1199, 1200], 503)
-    femmesh.addFace([141, 268, 142, 1162, 1163, 792], 504)
-    femmesh.addFace([141, 267, 268, 1158, 1156, 1162], 505)
-    femmesh.addFace([141, 238, 267, 1074, 1072, 1158], 506)
-    femmesh.addFace([141, 129, 238, 759, 1073, 1074], 507)
-    femmesh.addFace([338, 336, 335, 1367, 1364, 1366], 508)
-    femmesh.addFace([338, 245, 336, 1095, 1094, 1367], 509)
-    femmesh.addFace([338, 246, 245, 1097, 1093, 1095], 510)
-    femmesh.addFace([338, 342, 246, 1372, 1098, 1097], 511)
-    femmesh.addFace([338, 341, 342, 1371, 1375, 1372], 512)
-    femmesh.addFace([338, 337, 341, 1368, 1370, 1371], 513)
-    femmesh.addFace([338, 335, 337, 1366, 1365, 1368], 514)
-    femmesh.addFace([333, 318, 326, 1325, 1324, 1333], 515)
-    femmesh.addFace([333, 316, 318, 1319, 1316, 1325], 516)
-    femmesh.addFace([333, 331, 316, 1354, 1318, 1319], 517)
-    femmesh.addFace([328, 331, 332, 1340, 1353, 1341], 518)
-    femmesh.addFace([328, 327, 331, 1335, 1336, 1340], 519)
-    femmesh.addFace([323, 313, 322, 1309, 1308, 1329], 520)
-    femmesh.addFace([318, 325, 326, 1323, 1332, 1324], 521)
-    femmesh.addFace([318, 317, 325, 1320, 1322, 1323], 522)
-    femmesh.addFace([318, 315, 317, 1315, 1314, 1320], 523)
-    femmesh.addFace([318, 316, 315, 1316, 1313, 1315], 524)
-    femmesh.addFace([313, 306, 322, 1279, 1281, 1308], 525)
-    femmesh.addFace([308, 153, 152, 1290, 824, 1289], 526)
-    femmesh.addFace([308, 311, 312, 1287, 1301, 1288], 527)
-    femmesh.addFace([308, 307, 311, 1282, 1283, 1287], 528)
-    femmesh.addFace([308, 152, 307, 1289, 1285, 1282], 529)
-    femmesh.addFace([303, 305, 306, 1270, 1276, 1271], 530)
-    femmesh.addFace([303, 300, 305, 1262, 1263, 1270], 531)
-    femmesh.addFace([303, 297, 300, 1250, 1249, 1262], 532)
-    femmesh.addFace([303, 298, 297, 1253, 1248, 1250], 533)
-    femmesh.addFace([298, 150, 297, 1257, 1251, 1248], 534)
-    femmesh.addFace([293, 287, 286, 1228, 1225, 1227], 535)
-    femmesh.addFace([293, 292, 253, 1235, 1116, 1117], 536)
-    femmesh.addFace([293, 286, 292, 1227, 1226, 1235], 537)
-    femmesh.addFace([288, 242, 248, 1085, 1084, 1102], 538)
-    femmesh.addFace([288, 241, 242, 1083, 1081, 1085], 539)
-    femmesh.addFace([288, 271, 241, 1173, 1082, 1083], 540)
-    femmesh.addFace([283, 292, 286, 1217, 1226, 1215], 541)
-    femmesh.addFace([283, 291, 292, 1216, 1234, 1217], 542)
-    femmesh.addFace([283, 282, 291, 1212, 1214, 1216], 543)
-    femmesh.addFace([283, 280, 282, 1208, 1207, 1212], 544)
-    femmesh.addFace([283, 281, 280, 1209, 1206, 1208], 545)
-    femmesh.addFace([283, 286, 281, 1215, 1211, 1209], 546)
-    femmesh.addFace([278, 277, 281, 1191, 1193, 1197], 547)
-    femmesh.addFace([278, 145, 277, 1199, 1195, 1191], 548)
-    femmesh.addFace([273, 272, 275, 1174, 1176, 1177], 549)
-    femmesh.addFace([273, 280, 276, 1179, 1188, 1178], 550)
-    femmesh.addFace([273, 282, 280, 1180, 1207, 1179], 551)
-    femmesh.addFace([273, 275, 282, 1177, 1184, 1180], 552)
-    femmesh.addFace([268, 270, 272, 1160, 1170, 1161], 553)
-    femmesh.addFace([268, 267, 270, 1156, 1157, 1160], 554)
-    femmesh.addFace([263, 326, 262, 1146, 1144, 1142], 555)
-    femmesh.addFace([258, 321, 257, 1131, 1129, 1127], 556)
-    femmesh.addFace([258, 322, 321, 1132, 1328, 1131], 557)
-    femmesh.addFace([253, 292, 252, 1116, 1114, 1112], 558)
-    femmesh.addFace([248, 242, 236, 1084, 1067, 1068], 559)
-    femmesh.addFace([243, 159, 330, 1088, 1352, 1087], 560)
-    femmesh.addFace([243, 130, 159, 1089, 761, 1088], 561)
-    femmesh.addFace([155, 310, 327, 1300, 1298, 1337], 562)
-    femmesh.addFace([155, 154, 310, 830, 1299, 1300], 563)
-    femmesh.addFace([150, 149, 297, 815, 1252, 1251], 564)
-    femmesh.addFace([145, 144, 277, 800, 1194, 1195], 565)
-    femmesh.addFace([237, 247, 266, 1069, 1099, 1070], 566)
-    femmesh.addFace([342, 247, 246, 1100, 1096, 1098], 567)
-    femmesh.addFace([342, 266, 247, 1155, 1099, 1100], 568)
-    femmesh.addFace([342, 341, 266, 1375, 1154, 1155], 569)
-    femmesh.addFace([337, 340, 341, 1369, 1374, 1370], 570)
-    femmesh.addFace([337, 335, 332, 1365, 1357, 1358], 571)
-    femmesh.addFace([327, 316, 331, 1317, 1318, 1336], 572)
-    femmesh.addFace([327, 310, 316, 1298, 1297, 1317], 573)
-    femmesh.addFace([322, 306, 321, 1281, 1280, 1328], 574)
-    femmesh.addFace([317, 315, 312, 1314, 1305, 1306], 575)
-    femmesh.addFace([302, 305, 300, 1266, 1263, 1261], 576)
-    femmesh.addFace([302, 320, 305, 1268, 1277, 1266], 577)
-    femmesh.addFace([297, 296, 300, 1243, 1245, 1249], 578)
-    femmesh.addFace([297, 149, 296, 1252, 1247, 1243], 579)
-    femmesh.addFace([292, 291, 252, 1234, 1113, 1114], 580)
-    femmesh.addFace([287, 301, 285, 1230, 1224, 1221], 581)
-    femmesh.addFace([282, 290, 291, 1213, 1233, 1214], 582)
-    femmesh.addFace([282, 275, 290, 1184, 1186, 1213], 583)
-    femmesh.addFace([277, 280, 281, 1192, 1206, 1193], 584)
-    femmesh.addFace([277, 276, 280, 1187, 1188, 1192], 585)
-    femmesh.addFace([277, 144, 276, 1194, 1190, 1187], 586)
-    femmesh.addFace([262, 325, 261, 1143, 1141, 1139], 587)
-    femmesh.addFace([262, 326, 325, 1144, 1332, 1143], 588)
-    femmesh.addFace([257, 320, 256, 1128, 1126, 1124], 589)
-    femmesh.addFace([257, 321, 320, 1129, 1327, 1128], 590)
-    femmesh.addFace([252, 291, 251, 1113, 1111, 1109], 591)
-    femmesh.addFace([159, 158, 330, 842, 1351, 1352], 592)
-    femmesh.addFace([149, 148, 296, 812, 1246, 1247], 593)
-    femmesh.addFace([144, 143, 276, 797, 1189, 1190], 594)
-    femmesh.addFace([341, 265, 266, 1153, 1151, 1154], 595)
-    femmesh.addFace([341, 340, 265, 1374, 1152, 1153], 596)
-    femmesh.addFace([336, 330, 335, 1350, 1349, 1364], 597)
-    femmesh.addFace([321, 305, 320, 1278, 1277, 1327], 598)
-    femmesh.addFace([321, 306, 305, 1280, 1276, 1278], 599)
-    femmesh.addFace([316, 310, 315, 1297, 1296, 1313], 600)
-    femmesh.addFace([296, 148, 295, 1246, 1242, 1239], 601)
-    femmesh.addFace([291, 290, 251, 1233, 1110, 1111], 602)
-    femmesh.addFace([271, 240, 241, 1080, 1078, 1082], 603)
-    femmesh.addFace([271, 270, 240, 1169, 1079, 1080], 604)
-    femmesh.addFace([251, 290, 250, 1110, 1108, 1106], 605)
-    femmesh.addFace([148, 147, 295, 809, 1241, 1242], 606)
-    femmesh.addFace([425, 412, 25, 1614, 1616, 1656], 607)
-    femmesh.addFace([425, 419, 412, 1642, 1613, 1614], 608)
-    femmesh.addFace([425, 420, 419, 1644, 1641, 1642], 609)
-    femmesh.addFace([425, 426, 420, 1655, 1645, 1644], 610)
-    femmesh.addFace([425, 26, 426, 1657, 1659, 1655], 611)
-    femmesh.addFace([425, 25, 26, 1656, 496, 1657], 612)
-    femmesh.addFace([420, 417, 419, 1637, 1636, 1641], 613)
-    femmesh.addFace([420, 418, 417, 1638, 1635, 1637], 614)
-    femmesh.addFace([420, 423, 418, 1643, 1640, 1638], 615)
-    femmesh.addFace([420, 426, 423, 1645, 1651, 1643], 616)
-    femmesh.addFace([415, 421, 416, 1628, 1631, 1626], 617)
-    femmesh.addFace([415, 418, 421, 1627, 1639, 1628], 618)
-    femmesh.addFace([415, 414, 418, 1621, 1623, 1627], 619)
-    femmesh.addFace([415, 264, 414, 1629, 1625, 1621], 620)
-    femmesh.addFace([415, 265, 264, 1630, 1148, 1629], 621)
-    femmesh.addFace([415, 416, 265, 1626, 1633, 1630], 622)
-    femmesh.addFace([410, 409, 22, 1604, 1606, 1608], 623)
-    femmesh.addFace([410, 400, 409, 1578, 1577, 1604], 624)
-    femmesh.addFace([410, 403, 400, 1587, 1576, 1578], 625)
-    femmesh.addFace([410, 411, 403, 1607, 1588, 1587], 626)
-    femmesh.addFace([410, 23, 411, 1609, 1611, 1607], 627)
-    femmesh.addFace([410, 22, 23, 1608, 487, 1609], 628)
-    femmesh.addFace([405, 380, 17, 1502, 1504, 1593], 629)
-    femmesh.addFace([405, 387, 380, 1531, 1501, 1502], 630)
-    femmesh.addFace([405, 388, 387, 1533, 1530, 1531], 631)
-    femmesh.addFace([405, 406, 388, 1592, 1534, 1533], 632)
-    femmesh.addFace([405, 18, 406, 1594, 1597, 1592], 633)
-    femmesh.addFace([405, 17, 18, 1593, 472, 1594], 634)
-    femmesh.addFace([400, 399, 409, 1573, 1575, 1577], 635)
-    femmesh.addFace([400, 397, 399, 1569, 1568, 1573], 636)
-    femmesh.addFace([400, 398, 397, 1570, 1567, 1569], 637)
-    femmesh.addFace([400, 403, 398, 1576, 1572, 1570], 638)
-    femmesh.addFace([395, 401, 396, 1559, 1562, 1557], 639)
-    femmesh.addFace([395, 398, 401, 1558, 1571, 1559], 640)
-    femmesh.addFace([395, 394, 398, 1552, 1554, 1558], 641)
-    femmesh.addFace([395, 260, 394, 1560, 1556, 1552], 642)
-    femmesh.addFace([395, 261, 260, 1561, 1136, 1560], 643)
-    femmesh.addFace([395, 396, 261, 1557, 1565, 1561], 644)
-    femmesh.addFace([390, 389, 392, 1535, 1537, 1538], 645)
-    femmesh.addFace([390, 384, 389, 1520, 1519, 1535], 646)
-    femmesh.addFace([390, 393, 384, 1539, 1521, 1520], 647)
-    femmesh.addFace([390, 397, 393, 1540, 1549, 1539], 648)
-    femmesh.addFace([390, 399, 397, 1541, 1568, 1540], 649)
-    femmesh.addFace([390, 392, 399, 1538, 1545, 1541], 650)
-    femmesh.addFace([385, 381, 371, 1506, 1474, 1475], 651)
-    femmesh.addFace([385, 382, 381, 1510, 1505, 1506], 652)
-    femmesh.addFace([385, 386, 382, 1524, 1511, 1510], 653)
-    femmesh.addFace([385, 388, 386, 1526, 1527, 1524], 654)
-    femmesh.addFace([385, 387, 388, 1525, 1530, 1526], 655)
-    femmesh.addFace([385, 371, 387, 1475, 1476, 1525], 656)
-    femmesh.addFace([380, 387, 373, 1501, 1482, 1481], 657)
-    femmesh.addFace([380, 16, 17, 1503, 469, 1504], 658)
-    femmesh.addFace([380, 379, 16, 1498, 1500, 1503], 659)
-    femmesh.addFace([380, 373, 379, 1481, 1480, 1498], 660)
-    femmesh.addFace([375, 374, 11, 1483, 1485, 1487], 661)
-    femmesh.addFace([375, 360, 374, 1435, 1434, 1483], 662)
-    femmesh.addFace([375, 361, 360, 1437, 1433, 1435], 663)
-    femmesh.addFace([375, 376, 361, 1486, 1438, 1437], 664)
-    femmesh.addFace([375, 12, 376, 1488, 1490, 1486], 665)
-    femmesh.addFace([375, 11, 12, 1487, 454, 1488], 666)
-    femmesh.addFace([370, 367, 372, 1462, 1463, 1471], 667)
-    femmesh.addFace([370, 364, 367, 1450, 1449, 1462], 668)
-    femmesh.addFace([370, 365, 364, 1453, 1448, 1450], 669)
-    femmesh.addFace([370, 371, 365, 1470, 1454, 1453], 670)
-    femmesh.addFace([370, 373, 371, 1472, 1473, 1470], 671)
-    femmesh.addFace([370, 372, 373, 1471, 1477, 1472], 672)
-    femmesh.addFace([365, 253, 364, 1456, 1452, 1448], 673)
-    femmesh.addFace([365, 254, 253, 1457, 1115, 1456], 674)
-    femmesh.addFace([365, 381, 254, 1455, 1507, 1457], 675)
-    femmesh.addFace([365, 371, 381, 1454, 1474, 1455], 676)
-    femmesh.addFace([360, 357, 374, 1424, 1425, 1434], 677)
-    femmesh.addFace([360, 356, 357, 1423, 1421, 1424], 678)
-    femmesh.addFace([360, 358, 356, 1427, 1422, 1423], 679)
-    femmesh.addFace([360, 361, 358, 1433, 1428, 1427], 680)
-    femmesh.addFace([355, 359, 362, 1417, 1430, 1418], 681)
-    femmesh.addFace([355, 358, 359, 1416, 1426, 1417], 682)
-    femmesh.addFace([355, 354, 358, 1411, 1413, 1416], 683)
-    femmesh.addFace([355, 249, 354, 1419, 1415, 1411], 684)
-    femmesh.addFace([355, 250, 249, 1420, 1103, 1419], 685)
-    femmesh.addFace([355, 362, 250, 1418, 1441, 1420], 686)
-    femmesh.addFace([350, 349, 422, 1396, 1398, 1400], 687)
-    femmesh.addFace([350, 424, 351, 1401, 1403, 1399], 688)
-    femmesh.addFace([350, 422, 424, 1400, 1649, 1401], 689)
-    femmesh.addFace([345, 356, 344, 1384, 1382, 1380], 690)
-    femmesh.addFace([345, 357, 356, 1385, 1421, 1384], 691)
-    femmesh.addFace([345, 346, 357, 1383, 1387, 1385], 692)
-    femmesh.addFace([264, 263, 414, 1145, 1624, 1625], 693)
-    femmesh.addFace([259, 258, 393, 1130, 1550, 1551], 694)
-    femmesh.addFace([259, 394, 260, 1555, 1556, 1133], 695)
-    femmesh.addFace([259, 393, 394, 1551, 1548, 1555], 696)
-    femmesh.addFace([254, 381, 255, 1507, 1508, 1118], 697)
-    femmesh.addFace([249, 248, 354, 1101, 1414, 1415], 698)
-    femmesh.addFace([25, 412, 24, 1616, 1615, 493], 699)
-    femmesh.addFace([20, 407, 19, 1599, 1600, 478], 700)
-    femmesh.addFace([20, 408, 407, 1602, 1598, 1599], 701)
-    femmesh.addFace([20, 21, 408, 481, 1603, 1602], 702)
-    femmesh.addFace([15, 378, 14, 1497, 1496, 463], 703)
-    femmesh.addFace([15, 379, 378, 1499, 1495, 1497], 704)
-    femmesh.addFace([15, 16, 379, 466, 1500, 1499], 705)
-    femmesh.addFace([10, 347, 1, 1391, 1390, 430], 706)
-    femmesh.addFace([10, 374, 347, 1484, 1389, 1391], 707)
-    femmesh.addFace([10, 11, 374, 451, 1485, 1484], 708)
-    femmesh.addFace([424, 422, 421, 1649, 1646, 1648], 709)
-    femmesh.addFace([424, 428, 351, 1654, 1404, 1403], 710)
-    femmesh.addFace([424, 427, 428, 1653, 1661, 1654], 711)
-    femmesh.addFace([424, 423, 427, 1650, 1652, 1653], 712)
-    femmesh.addFace([424, 421, 423, 1648, 1647, 1650], 713)
-    femmesh.addFace([419, 404, 412, 1591, 1590, 1613], 714)
-    femmesh.addFace([419, 402, 404, 1585, 1582, 1591], 715)
-    femmesh.addFace([419, 417, 402, 1636, 1584, 1585], 716)
-    femmesh.addFace([414, 417, 418, 1622, 1635, 1623], 717)
-    femmesh.addFace([414, 413, 417, 1617, 1618, 1622], 718)
-    femmesh.addFace([414, 263, 413, 1624, 1620, 1617], 719)
-    femmesh.addFace([409, 21, 22, 1605, 484, 1606], 720)
-    femmesh.addFace([409, 408, 21, 1601, 1603, 1605], 721)
-    femmesh.addFace([409, 399, 408, 1575, 1574, 1601], 722)
-    femmesh.addFace([404, 411, 412, 1589, 1610, 1590], 723)
-    femmesh.addFace([404, 403, 411, 1586, 1588, 1589], 724)
-    femmesh.addFace([404, 401, 403, 1581, 1580, 1586], 725)
-    femmesh.addFace([404, 402, 401, 1582, 1579, 1581], 726)
-    femmesh.addFace([399, 392, 408, 1545, 1547, 1574], 727)
-    femmesh.addFace([394, 397, 398, 1553, 1567, 1554], 728)
-    femmesh.addFace([394, 393, 397, 1548, 1549, 1553], 729)
-    femmesh.addFace([389, 391, 392, 1536, 1542, 1537], 730)
-    femmesh.addFace([389, 386, 391, 1528, 1529, 1536], 731)
-    femmesh.addFace([389, 383, 386, 1516, 1515, 1528], 732)
-    femmesh.addFace([389, 384, 383, 1519, 1514, 1516], 733)
-    femmesh.addFace([384, 393, 258, 1521, 1550, 1522], 734)
-    femmesh.addFace([384, 257, 383, 1523, 1517, 1514], 735)
-    femmesh.addFace([384, 258, 257, 1522, 1127, 1523], 736)
-    femmesh.addFace([379, 372, 378, 1479, 1478, 1495], 737)
-    femmesh.addFace([379, 373, 372, 1480, 1477, 1479], 738)
-    femmesh.addFace([374, 346, 347, 1388, 1386, 1389], 739)
-    femmesh.addFace([374, 357, 346, 1425, 1387, 1388], 740)
-    femmesh.addFace([369, 378, 372, 1469, 1478, 1467], 741)
-    femmesh.addFace([369, 377, 378, 1468, 1492, 1469], 742)
-    femmesh.addFace([369, 368, 377, 1464, 1466, 1468], 743)
-    femmesh.addFace([369, 366, 368, 1460, 1459, 1464], 744)
-    femmesh.addFace([369, 367, 366, 1461, 1458, 1460], 745)
-    femmesh.addFace([369, 372, 367, 1467, 1463, 1461], 746)
-    femmesh.addFace([364, 363, 367, 1443, 1445, 1449], 747)
-    femmesh.addFace([364, 252, 363, 1451, 1447, 1443], 748)
-    femmesh.addFace([364, 253, 252, 1452, 1112, 1451], 749)
-    femmesh.addFace([359, 358, 361, 1426, 1428, 1429], 750)
-    femmesh.addFace([359, 366, 362, 1431, 1440, 1430], 751)
-    femmesh.addFace([359, 368, 366, 1432, 1459, 1431], 752)
-    femmesh.addFace([359, 361, 368, 1429, 1436, 1432], 753)
-    femmesh.addFace([354, 356, 358, 1412, 1422, 1413], 754)
-    femmesh.addFace([354, 353, 356, 1408, 1409, 1412], 755)
-    femmesh.addFace([354, 248, 353, 1414, 1410, 1408], 756)
-    femmesh.addFace([349, 416, 422, 1397, 1632, 1398], 757)
-    femmesh.addFace([349, 348, 416, 1392, 1393, 1397], 758)
-    femmesh.addFace([344, 353, 343, 1381, 1377, 1376], 759)
-    femmesh.addFace([344, 356, 353, 1382, 1409, 1381], 760)
-    femmesh.addFace([263, 262, 413, 1142, 1619, 1620], 761)
-    femmesh.addFace([248, 343, 353, 1379, 1377, 1410], 762)
-    femmesh.addFace([248, 236, 343, 1068, 1378, 1379], 763)
-    femmesh.addFace([24, 411, 23, 1612, 1611, 490], 764)
-    femmesh.addFace([24, 412, 411, 1615, 1610, 1612], 765)
-    femmesh.addFace([19, 406, 18, 1596, 1597, 475], 766)
-    femmesh.addFace([19, 407, 406, 1600, 1595, 1596], 767)
-    femmesh.addFace([14, 377, 13, 1494, 1493, 460], 768)
-    femmesh.addFace([14, 378, 377, 1496, 1492, 1494], 769)
-    femmesh.addFace([3, 352, 28, 1407, 1406, 433], 770)
-    femmesh.addFace([428, 352, 351, 1405, 1402, 1404], 771)
-    femmesh.addFace([428, 28, 352, 1664, 1406, 1405], 772)
-    femmesh.addFace([428, 427, 28, 1661, 1663, 1664], 773)
-    femmesh.addFace([423, 426, 427, 1651, 1658, 1652], 774)
-    femmesh.addFace([423, 421, 418, 1647, 1639, 1640], 775)
-    femmesh.addFace([413, 402, 417, 1583, 1584, 1618], 776)
-    femmesh.addFace([413, 396, 402, 1564, 1563, 1583], 777)
-    femmesh.addFace([413, 262, 396, 1619, 1566, 1564], 778)
-    femmesh.addFace([408, 392, 407, 1547, 1546, 1598], 779)
-    femmesh.addFace([403, 401, 398, 1580, 1571, 1572], 780)
-    femmesh.addFace([388, 391, 386, 1532, 1529, 1527], 781)
-    femmesh.addFace([388, 406, 391, 1534, 1543, 1532], 782)
-    femmesh.addFace([383, 382, 386, 1509, 1511, 1515], 783)
-    femmesh.addFace([383, 256, 382, 1518, 1513, 1509], 784)
-    femmesh.addFace([383, 257, 256, 1517, 1124, 1518], 785)
-    femmesh.addFace([373, 387, 371, 1482, 1476, 1473], 786)
-    femmesh.addFace([368, 376, 377, 1465, 1489, 1466], 787)
-    femmesh.addFace([368, 361, 376, 1436, 1438, 1465], 788)
-    femmesh.addFace([363, 362, 366, 1439, 1440, 1444], 789)
-    femmesh.addFace([363, 251, 362, 1446, 1442, 1439], 790)
-    femmesh.addFace([363, 252, 251, 1447, 1109, 1446], 791)
-    femmesh.addFace([363, 366, 367, 1444, 1458, 1445], 792)
-    femmesh.addFace([348, 266, 416, 1394, 1634, 1393], 793)
-    femmesh.addFace([348, 237, 266, 1395, 1070, 1394], 794)
-    femmesh.addFace([262, 261, 396, 1139, 1565, 1566], 795)
-    femmesh.addFace([28, 427, 27, 1663, 1662, 502], 796)
-    femmesh.addFace([13, 376, 12, 1491, 1490, 457], 797)
-    femmesh.addFace([13, 377, 376, 1493, 1489, 1491], 798)
-    femmesh.addFace([427, 426, 27, 1658, 1660, 1662], 799)
-    femmesh.addFace([422, 416, 421, 1632, 1631, 1646], 800)
-    femmesh.addFace([407, 391, 406, 1544, 1543, 1595], 801)
-    femmesh.addFace([407, 392, 391, 1546, 1542, 1544], 802)
-    femmesh.addFace([402, 396, 401, 1563, 1562, 1579], 803)
-    femmesh.addFace([382, 255, 381, 1512, 1508, 1505], 804)
-    femmesh.addFace([382, 256, 255, 1513, 1121, 1512], 805)
-    femmesh.addFace([362, 251, 250, 1442, 1106, 1441], 806)
-    femmesh.addFace([266, 265, 416, 1151, 1633, 1634], 807)
-    femmesh.addFace([27, 426, 26, 1660, 1659, 499], 808)
-    return True
+    return load_mesh(femmesh, __name__, nodes=False)
@@ -1,8699 +1,11 @@
+from . import load_mesh
+
+
 def create_nodes(femmesh):
     # nodes
-    femmesh.addNode(4.0, -9.797174393178826e-16, 0.0, 1)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 50.0, 2)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 0.0, 3)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 50.0, 4)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 1.7999999999999998, 5)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 3.65, 6)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 5.45, 7)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 7.1499999999999995, 8)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 9.0, 9)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 10.85, 10)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 12.55, 11)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 14.399999999999999, 12)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 16.05, 13)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 17.9, 14)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 19.7, 15)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 21.45, 16)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 23.3, 17)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 25.1, 18)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 26.85, 19)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 28.65, 20)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 30.5, 21)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 32.25, 22)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 34.050000000000004, 23)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 35.9, 24)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 37.65, 25)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 39.4, 26)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 41.25, 27)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 42.95, 28)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 44.800000000000004, 29)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 46.45, 30)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 48.3, 31)
-    femmesh.addNode(3.6085358374728114, 1.7258241827238356, 0.0, 32)
-    femmesh.addNode(2.4714384523613377, 3.1451537285464752, 0.0, 33)
-    femmesh.addNode(0.8234504350795254, 3.9143236173018883, 0.0, 34)
-    femmesh.addNode(-0.9459959880948977, 3.886526931658696, 0.0, 35)
-    femmesh.addNode(-2.588223846277776, 3.0497700440457924, 0.0, 36)
-    femmesh.addNode(-3.6710185027359246, 1.5885915625391225, 0.0, 37)
-    femmesh.addNode(-3.997157890562357, -0.15076073067973716, 0.0, 38)
-    femmesh.addNode(-3.529164905739814, -1.8828157286613287, 0.0, 39)
-    femmesh.addNode(-2.431721190778423, -3.17596159459134, 0.0, 40)
-    femmesh.addNode(-0.897083043797526, -3.8981074911463085, 0.0, 41)
-    femmesh.addNode(0.9703969231816284, -3.8805063859604236, 0.0, 42)
-    femmesh.addNode(2.5107654451627996, -3.1138492062680956, 0.0, 43)
-    femmesh.addNode(3.586564147140943, -1.7710329241556066, 0.0, 44)
-    femmesh.addNode(3.6085358374728114, 1.7258241827238356, 50.0, 45)
-    femmesh.addNode(2.4714384523613377, 3.1451537285464752, 50.0, 46)
-    femmesh.addNode(0.8234504350795254, 3.9143236173018883, 50.0, 47)
-    femmesh.addNode(-0.9459959880948977, 3.886526931658696, 50.0, 48)
-    femmesh.addNode(-2.588223846277776, 3.0497700440457924, 50.0, 49)
-    femmesh.addNode(-3.6710185027359246, 1.5885915625391225, 50.0, 50)
-    femmesh.addNode(-3.997157890562357, -0.15076073067973716, 50.0, 51)
-    femmesh.addNode(-3.529164905739814, -1.8828157286613287, 50.0, 52)
-    femmesh.addNode(-2.431721190778423, -3.17596159459134, 50.0, 53)
-    femmesh.addNode(-0.897083043797526, -3.8981074911463085, 50.0, 54)
-    femmesh.addNode(0.9703969231816284, -3.8805063859604236, 50.0, 55)
-    femmesh.addNode(2.5107654451627996, -3.1138492062680956, 50.0, 56)
-    femmesh.addNode(3.586564147140943, -1.7710329241556066, 50.0, 57)
-    femmesh.addNode(4.648882429441257, 1.8406227634233896, 0.0, 58)
-    femmesh.addNode(3.6875655867908694, 3.376664040605122, 0.0, 59)
-    femmesh.addNode(2.2978993031074397, 4.440682244067722, 0.0, 60)
-    femmesh.addNode(0.5954858004743485, 4.964413022849069, 0.0, 61)
-    femmesh.addNode(-1.2738536284169102, 4.835007438812175, 0.0, 62)
-    femmesh.addNode(-2.887863517111337, 4.08169625358592, 0.0, 63)
-    femmesh.addNode(-4.170392168065856, 2.758229353142152, 0.0, 64)
-    femmesh.addNode(-4.865492554910633, 1.1519471333829523, 0.0, 65)
-    femmesh.addNode(-4.956538155347533, -0.6578217954614131, 0.0, 66)
-    femmesh.addNode(-4.366312274049601, -2.4362506286266603, 0.0, 67)
-    femmesh.addNode(-3.138456806453501, -3.892311507835118, 0.0, 68)
-    femmesh.addNode(-1.485207907885175, -4.774322723733214, 0.0, 69)
-    femmesh.addNode(0.31395259764656414, -4.990133642141358, 0.0, 70)
-    femmesh.addNode(2.100428642059029, -4.5374221227055855, 0.0, 71)
-    femmesh.addNode(3.6232656509352337, -3.4455690419367424, 0.0, 72)
-    femmesh.addNode(4.671644712283059, -1.7820593935662565, 0.0, 73)
-    femmesh.addNode(4.648882429441257, 1.8406227634233896, 50.0, 74)
-    femmesh.addNode(3.6875655867908694, 3.376664040605122, 50.0, 75)
-    femmesh.addNode(2.2978993031074397, 4.440682244067722, 50.0, 76)
-    femmesh.addNode(0.5954858004743485, 4.964413022849069, 50.0, 77)
-    femmesh.addNode(-1.2738536284169102, 4.835007438812175, 50.0, 78)
-    femmesh.addNode(-2.887863517111337, 4.08169625358592, 50.0, 79)
-    femmesh.addNode(-4.170392168065856, 2.758229353142152, 50.0, 80)
-    femmesh.addNode(-4.865492554910633, 1.1519471333829523, 50.0, 81)
-    femmesh.addNode(-4.956538155347533, -0.6578217954614131, 50.0, 82)
-    femmesh.addNode(-4.366312274049601, -2.4362506286266603, 50.0, 83)
-    femmesh.addNode(-3.138456806453501, -3.892311507835118, 50.0, 84)
-    femmesh.addNode(-1.485207907885175, -4.774322723733214, 50.0, 85)
-    femmesh.addNode(0.31395259764656414, -4.990133642141358, 50.0, 86)
-    femmesh.addNode(2.100428642059029, -4.5374221227055855, 50.0, 87)
-    femmesh.addNode(3.6232656509352337, -3.4455690419367424, 50.0, 88)
-    femmesh.addNode(4.671644712283059, -1.7820593935662565, 50.0, 89)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 1.8499999999999999, 90)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 3.55, 91)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 5.35, 92)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 7.199999999999999, 93)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 8.9, 94)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 10.65, 95)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 12.5, 96)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 14.249999999999998, 97)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 16.0, 98)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 17.65, 99)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 19.45, 100)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 21.3, 101)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 23.0, 102)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 24.8, 103)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 26.6, 104)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 28.349999999999998, 105)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 30.099999999999998, 106)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 31.95, 107)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 33.7, 108)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 35.4, 109)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 37.25, 110)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 39.050000000000004, 111)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 40.75, 112)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 42.65, 113)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 44.4, 114)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 46.1, 115)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 48.15, 116)
-    femmesh.addNode(3.7961456836748657, -1.2606656766632007, 2.883830848705585, 117)
-    femmesh.addNode(3.6877770546054456, -1.5492902876883927, 4.4941423116273, 118)
-    femmesh.addNode(3.6757198803454507, -1.577682908962769, 6.221063462457196, 119)
-    femmesh.addNode(3.6912905946922443, -1.540900303568202, 8.112967220251909, 120)
-    femmesh.addNode(3.688555337088441, -1.5474364365738507, 9.884975351909484, 121)
-    femmesh.addNode(3.689149992884908, -1.5460182178736708, 11.623494904838338, 122)
-    femmesh.addNode(3.6844378391785026, -1.5572147601502007, 13.440971418929063, 123)
-    femmesh.addNode(3.687897917351167, -1.5490025665559515, 15.257242260238195, 124)
-    femmesh.addNode(3.675761527065428, -1.5775858759971306, 16.97350398128666, 125)
-    femmesh.addNode(3.6815557212597145, -1.5640164549197881, 18.8264728673247, 126)
-    femmesh.addNode(3.685877319975452, -1.5538044864430596, 20.57839152460661, 127)
-    femmesh.addNode(3.6831308067769255, -1.5603036435805548, 22.339770372101643, 128)
-    femmesh.addNode(3.6817673418082766, -1.5635182252836124, 24.218426481273774, 129)
-    femmesh.addNode(3.684529565126202, -1.5569977147417136, 25.971837791496114, 130)
-    femmesh.addNode(3.6795202823991158, -1.5687990602411548, 27.7207893138508, 131)
-    femmesh.addNode(3.6767931472416033, -1.575180038089991, 29.571703781695465, 132)
-    femmesh.addNode(3.680130112971408, -1.5673679694318918, 31.402875907082326, 133)
-    femmesh.addNode(3.6815955248669243, -1.563922757453141, 33.11968989876505, 134)
-    femmesh.addNode(3.67828505294448, -1.571693058228999, 34.954291684354246, 135)
-    femmesh.addNode(3.6818166133066437, -1.5634021958469917, 36.78156850148122, 136)
-    femmesh.addNode(3.6879068067525695, -1.5489814023118758, 38.493482049022276, 137)
-    femmesh.addNode(3.683895575674766, -1.5584971567262742, 40.269396357986885, 138)
-    femmesh.addNode(3.685146298569151, -1.5555374499323644, 42.07562359153149, 139)
-    femmesh.addNode(3.689561010052927, -1.545037071754988, 43.87123331658667, 140)
-    femmesh.addNode(3.721415333426648, -1.4666519410333962, 45.57992278601976, 141)
-    femmesh.addNode(3.7145628438532583, -1.4839214531318006, 47.496332656697525, 142)
-    femmesh.addNode(2.960931858374523, 2.689401890767312, 1.5106263798579327, 143)
-    femmesh.addNode(1.6447121224276389, 3.646220239417741, 1.5972675238337404, 144)
-    femmesh.addNode(-0.08415110705926115, 3.9991147259338162, 1.513454082473138, 145)
-    femmesh.addNode(-1.8034363557799509, 3.5703805554381915, 1.4919588438946627, 146)
-    femmesh.addNode(-3.2220226267781666, 2.3703523351032696, 1.5070812885249536, 147)
-    femmesh.addNode(-3.9286743176388317, 0.7520093788810474, 1.5085261016689135, 148)
-    femmesh.addNode(-3.8712815584319507, -1.0065679785015456, 1.5120698274506505, 149)
-    femmesh.addNode(-3.07244623174257, -2.5612641708833714, 1.5393319719024217, 150)
-    femmesh.addNode(-1.686720908013875, -3.6269784364493884, 1.5520743912061028, 151)
-    femmesh.addNode(0.08818296641570951, -3.9990278524204013, 1.6198542211418636, 152)
-    femmesh.addNode(1.7892075845216164, -3.577532140944414, 1.5951947425256174, 153)
-    femmesh.addNode(3.015167137600237, -2.6284533726767143, 1.221238378008383, 154)
-    femmesh.addNode(3.6845050708107556, 1.5570556776075246, 2.522962083281601, 155)
-    femmesh.addNode(3.6923851938686387, 1.5382755215174089, 6.336889717826475, 156)
-    femmesh.addNode(3.6950704343089837, 1.5318141158429177, 9.969070209466665, 157)
-    femmesh.addNode(3.7048369518452358, 1.5080395088465364, 13.466799988018028, 158)
-    femmesh.addNode(3.6776746606215265, 1.5731208124687501, 17.002544871037227, 159)
-    femmesh.addNode(3.7024611996812755, 1.5138629610551582, 20.587882946588895, 160)
-    femmesh.addNode(3.7050088839951414, 1.5076170500220127, 24.213667873137513, 161)
-    femmesh.addNode(3.70134690377778, 1.5165853414478985, 27.823223627871993, 162)
-    femmesh.addNode(3.7286291306449635, 1.4482143508837986, 31.38403498124994, 163)
-    femmesh.addNode(3.684014995929334, 1.558214847114412, 34.89617174443122, 164)
-    femmesh.addNode(3.692969816649052, 1.5368714758622684, 38.51983653382191, 165)
-    femmesh.addNode(3.6695816090412285, 1.5919079164908965, 42.137025953702036, 166)
-    femmesh.addNode(3.6830174162203035, 1.5605712773910454, 45.67016797952025, 167)
-    femmesh.addNode(3.2805081321857905, 2.2887259326234095, 48.50792313832653, 168)
-    femmesh.addNode(0.0600779894392467, 3.999548803950883, 48.33878109208654, 169)
-    femmesh.addNode(-3.187919508544602, 2.41602342849583, 48.44374432506269, 170)
-    femmesh.addNode(-3.8728572404037083, -1.000488278518331, 48.39423813546468, 171)
-    femmesh.addNode(-1.731654091926927, -3.605741824633695, 48.35955544975923, 172)
-    femmesh.addNode(1.565468994218045, -3.680938308114107, 48.472892948302764, 173)
-    femmesh.addNode(2.890761104834615, -2.7646880899615702, 48.25463729817945, 174)
-    femmesh.addNode(3.6540979585302744, 1.6271349389232845, 4.457084885314051, 175)
-    femmesh.addNode(3.6927782569049863, 1.5373316965865795, 8.16107237199779, 176)
-    femmesh.addNode(3.69408549371517, 1.5341878519670102, 11.749420409816048, 177)
-    femmesh.addNode(3.6891430672796726, 1.5460347438341513, 15.234587728083508, 178)
-    femmesh.addNode(3.6867408156907318, 1.5517545417752245, 18.798369518676637, 179)
-    femmesh.addNode(3.695689497417317, 1.5303199465077033, 22.3952839615566, 180)
-    femmesh.addNode(3.7069110821243196, 1.5029338738693416, 26.020111911794068, 181)
-    femmesh.addNode(3.7004654461262083, 1.5187348293977994, 29.63072100046721, 182)
-    femmesh.addNode(3.7265382338112354, 1.453586183183866, 33.13930049688207, 183)
-    femmesh.addNode(3.684615619632915, 1.5567940568865068, 36.70538580439079, 184)
-    femmesh.addNode(3.6832185185515938, 1.5600965818174855, 40.35682417972301, 185)
-    femmesh.addNode(3.6610205012652948, 1.6114989572802114, 43.946038946651925, 186)
-    femmesh.addNode(3.749710577034973, 1.392720570851184, 47.20828536009407, 187)
-    femmesh.addNode(1.868187214822781, 3.536930382460574, 48.342091347935714, 188)
-    femmesh.addNode(-1.765356906858334, 3.5893613626114016, 48.44542038299227, 189)
-    femmesh.addNode(-3.9242906730959497, 0.7745596897929409, 48.41049983068989, 190)
-    femmesh.addNode(-3.0789620713509445, -2.5534276107190315, 48.35183422031484, 191)
-    femmesh.addNode(-0.06951627741217847, -3.9993958902782745, 48.43869598278144, 192)
-    femmesh.addNode(3.7273448185262392, -1.4515166563996418, 1.4532202560533378, 193)
-    femmesh.addNode(2.623601591017534, -3.019389787955551, 5.187530471760324, 194)
-    femmesh.addNode(2.87653060569779, -2.779491261811036, 7.194834324109028, 195)
-    femmesh.addNode(2.8612160031735474, -2.7952536527448792, 8.987019580537082, 196)
-    femmesh.addNode(2.8416309859646316, -2.8151613345607167, 10.758094825448564, 197)
-    femmesh.addNode(2.8016584676719947, -2.8549448034107088, 12.48817867547991, 198)
-    femmesh.addNode(2.777608017361538, -2.8783491278663376, 14.316946376615443, 199)
-    femmesh.addNode(2.7967828393217498, -2.8597212713261713, 16.13665509958972, 200)
-    femmesh.addNode(2.771355905746343, -2.8843693320524797, 17.863769489607286, 201)
-    femmesh.addNode(2.7995035460035482, -2.8570579090934713, 19.706708283258603, 202)
-    femmesh.addNode(2.8001776546301613, -2.8563972242161855, 21.436841999224896, 203)
-    femmesh.addNode(2.768909827547603, -2.886717576575565, 23.272384474788872, 204)
-    femmesh.addNode(2.7957130588443344, -2.8607671161084145, 25.10533867186365, 205)
-    femmesh.addNode(2.7924455223928333, -2.863956704363426, 26.83329963050099, 206)
-    femmesh.addNode(2.754812828713959, -2.90017349114721, 28.665474073994396, 207)
-    femmesh.addNode(2.7599689150897344, -2.895267101277254, 30.500620604007388, 208)
-    femmesh.addNode(2.792771152386435, -2.863639169029182, 32.254162075544286, 209)
-    femmesh.addNode(2.7638170940143767, -2.8915938633967815, 34.0092089069084, 210)
-    femmesh.addNode(2.762641886346588, -2.8927166829476, 35.862581608563225, 211)
-    femmesh.addNode(2.7941726844290145, -2.8622716519559694, 37.61065889031373, 212)
-    femmesh.addNode(2.77782556561966, -2.878139177835189, 39.35774129506331, 213)
-    femmesh.addNode(2.7412552596732045, -2.9129915209821657, 41.19213869076014, 214)
-    femmesh.addNode(2.779116238955525, -2.8768929299460724, 43.01179451368555, 215)
-    femmesh.addNode(2.8717557106462315, -2.7844243818733445, 44.707802558095054, 216)
-    femmesh.addNode(2.9719234024102157, -2.6772506961819036, 46.467585294114414, 217)
-    femmesh.addNode(-1.0272641090974004, 3.8658412344741118, 2.9550579170742832, 218)
-    femmesh.addNode(2.5637614328193674, 3.070362733552501, 3.3709100358704682, 219)
-    femmesh.addNode(-3.9989073926672716, -0.0934861747588679, 3.028886569692816, 220)
-    femmesh.addNode(-2.6126465274506057, 3.0288740684617927, 2.9631202530717218, 221)
-    femmesh.addNode(-3.668344529160723, 1.5947565379632695, 3.0119161876726057, 222)
-    femmesh.addNode(-2.465585170279011, -3.149744397264677, 3.0100511558517393, 223)
-    femmesh.addNode(-0.8704413589198045, -3.9041429073078056, 3.0277555738191158, 224)
-    femmesh.addNode(1.1544914051033421, -3.829771480851372, 3.420494781817115, 225)
-    femmesh.addNode(2.813197046878739, 2.8435756320929366, 12.62218688651625, 226)
-    femmesh.addNode(2.7542733625682474, 2.90068582308512, 5.513173206579237, 227)
-    femmesh.addNode(2.796164270423457, 2.860326095536531, 14.37070802557734, 228)
-    femmesh.addNode(2.82789366306673, 2.8289604858299158, 9.151481019502635, 229)
-    femmesh.addNode(2.8013755057289957, 2.8552224564649276, 17.911169286224617, 230)
-    femmesh.addNode(2.8093573374779726, 2.847369198112299, 7.367478458902481, 231)
-    femmesh.addNode(2.821700504554202, 2.8351377854697932, 21.50407228059377, 232)
-    femmesh.addNode(-0.8375911414690195, 3.9113221651677614, 46.816708392961864, 233)
-    femmesh.addNode(2.8262995284755816, 2.8305531218012328, 25.179389323203893, 234)
-    femmesh.addNode(2.8731753838289675, 2.782959434443712, 30.682996646076102, 235)
-    femmesh.addNode(2.8169093516443025, 2.8398981856078707, 28.821050660278445, 236)
-    femmesh.addNode(2.856479558779665, 2.800093664553729, 33.84313204401549, 237)
-    femmesh.addNode(2.7794361596077093, 2.876583848015758, 35.67779362604048, 238)
-    femmesh.addNode(2.7478912965724107, 2.906732430448595, 39.420469443232, 239)
-    femmesh.addNode(2.7506800367852224, 2.9040935479476633, 41.271771996762936, 240)
-    femmesh.addNode(2.7441694075176537, 2.9102464264807906, 45.019968205132805, 241)
-    femmesh.addNode(2.8702774591125513, 2.7859481882673975, 46.875531870553, 242)
-    femmesh.addNode(1.2201867729516283, 3.8093495821614867, 46.45556379347497, 243)
-    femmesh.addNode(2.7996590815146774, 2.8569054984882496, 19.70719736790477, 244)
-    femmesh.addNode(0.7705427250612483, 3.9250813888192413, 3.13719561900474, 245)
-    femmesh.addNode(-2.52073283615337, 3.1057858858488925, 46.88546044088118, 246)
-    femmesh.addNode(-3.645307278871712, 1.6467345999294838, 46.899222946888365, 247)
-    femmesh.addNode(-3.571552447948978, -1.8011144082344306, 46.83399985785779, 248)
-    femmesh.addNode(-0.959193785921177, -3.8832907798734566, 46.8605486945776, 249)
-    femmesh.addNode(0.7215859599992132, -3.9343758974368495, 46.99720004427378, 250)
-    femmesh.addNode(2.8344206093104702, 2.8224209128895112, 23.33282097514087, 251)
-    femmesh.addNode(2.793756528688526, 2.862677847472579, 16.131169827145033, 252)
-    femmesh.addNode(2.8104157455927017, 2.8463245312024097, 26.997836370967924, 253)
-    femmesh.addNode(2.826345112285642, 2.8305076057589145, 10.920407916883846, 254)
-    femmesh.addNode(-3.5727980771016266, -1.7986422379836742, 3.016492977457936, 255)
-    femmesh.addNode(2.9407256765775776, -2.7114816051593174, 2.9265397629938152, 256)
-    femmesh.addNode(3.077056729756346, 2.555723357850216, 32.25921501551382, 257)
-    femmesh.addNode(2.7600506409633665, 2.895189192318476, 37.5484014057244, 258)
-    femmesh.addNode(2.712637518691569, 2.9396594517370285, 43.16953231183083, 259)
-    femmesh.addNode(-3.99950113265784, -0.0631719072741712, 46.848371445962435, 260)
-    femmesh.addNode(-2.48291527194333, -3.1361013619381914, 46.79614982063089, 261)
-    femmesh.addNode(2.0460580472550416, -3.4370985536150815, 47.18067269057437, 262)
-    femmesh.addNode(-3.135172019918133, 2.4840886468728227, 45.352849071047835, 263)
-    femmesh.addNode(1.2111340947064204, 3.812237427632185, 42.33494957258343, 264)
-    femmesh.addNode(1.5918641667375995, -3.6696005878919316, 8.15123113038731, 265)
-    femmesh.addNode(1.5332527687344486, -3.6944737036779878, 9.81517458162568, 266)
-    femmesh.addNode(1.4815483912086456, -3.715509973678859, 11.605616771029005, 267)
-    femmesh.addNode(1.4439193553189331, -3.7302944783670036, 13.41688358487622, 268)
-    femmesh.addNode(1.4307024189513249, -3.7353835932079087, 15.156273023747206, 269)
-    femmesh.addNode(1.4385913438042472, -3.7323524680195317, 17.00394575105951, 270)
-    femmesh.addNode(1.4010334331895442, -3.7466125125351724, 18.731291749323695, 271)
-    femmesh.addNode(1.4288480092643774, -3.7360933294580887, 20.554611076459487, 272)
-    femmesh.addNode(1.4044401637548263, -3.74533681081319, 22.387287866670846, 273)
-    femmesh.addNode(1.3830045474307984, -3.75330499983491, 24.130335445868013, 274)
-    femmesh.addNode(1.4234910673336154, -3.7381376621549673, 25.964949406417652, 275)
-    femmesh.addNode(1.3798747762363206, -3.7544567652200715, 27.796842039895708, 276)
-    femmesh.addNode(1.3793636544302712, -3.7546445782306437, 29.55318226198831, 277)
-    femmesh.addNode(1.423149007318577, -3.7382679014442166, 31.30842197288943, 278)
-    femmesh.addNode(1.4224389604222525, -3.73853813727677, 33.15981404894767, 279)
-    femmesh.addNode(1.3795264029211918, -3.7545847844526454, 34.91812663599174, 280)
-    femmesh.addNode(1.4149215677379612, -3.7413897093392916, 36.66781557645598, 281)
-    femmesh.addNode(1.3928473437313442, -3.7496634885094076, 38.469605871135315, 282)
-    femmesh.addNode(1.296854413195719, -3.7839356007964495, 40.33696362017952, 283)
-    femmesh.addNode(1.2381365488098959, -3.80355332373573, 42.149568188778474, 284)
-    femmesh.addNode(1.4107350263988292, -3.742970302485914, 44.01743558570556, 285)
-    femmesh.addNode(-1.7345991342625988, 3.6043259901700684, 45.299353980653656, 286)
-    femmesh.addNode(-3.219975471766387, 2.3731325207882583, 4.44218796145572, 287)
-    femmesh.addNode(-1.7829198414818748, -3.580669886885727, 4.575851267877147, 288)
-    femmesh.addNode(-0.2785040175279571, -3.9902926599712942, 4.446347827387059, 289)
-    femmesh.addNode(1.497638063147997, 3.7090538189422806, 22.43672452454067, 290)
-    femmesh.addNode(-3.9192385882696517, 0.799730509745694, 4.540745098972653, 291)
-    femmesh.addNode(1.3751019973544418, 3.756207461905136, 38.40756065914961, 292)
-    femmesh.addNode(1.469847241389809, 3.7201544439685255, 13.529764408926246, 293)
-    femmesh.addNode(1.6882936137173, 3.626246637210627, 32.2364221645039, 294)
-    femmesh.addNode(-1.7504018939200157, -3.5966780798065905, 45.17870175525123, 295)
-    femmesh.addNode(1.2985352596369426, 3.783359113206096, 40.33147365734663, 296)
-    femmesh.addNode(1.306038272157926, 3.780775585995384, 44.19945065817064, 297)
-    femmesh.addNode(1.3925435962233679, 3.7497763043436723, 36.450867898791685, 298)
-    femmesh.addNode(-3.1338146707192145, -2.4858007984520847, 45.24340123565719, 299)
-    femmesh.addNode(-3.9010296903464865, 0.8842891806616183, 45.32645139506123, 300)
-    femmesh.addNode(-3.890768256444441, -0.928397745928051, 45.26715620265566, 301)
-    femmesh.addNode(0.06997370412114692, -3.9993879132601737, 45.32066419242402, 302)
-    femmesh.addNode(1.4677882203989663, 3.720967312414614, 34.4967878656512, 303)
-    femmesh.addNode(1.5155870192766192, 3.7017557978613627, 24.26813149595095, 304)
-    femmesh.addNode(-0.31608973806978286, 3.987491351399646, 4.417959237019846, 305)
-    femmesh.addNode(-0.10607767566820211, 3.998593193452521, 45.22851872369789, 306)
-    femmesh.addNode(1.5450750530597568, 3.6895451048079613, 29.98415260249426, 307)
-    femmesh.addNode(1.3233137022147154, 3.774763680752847, 4.831675808204436, 308)
-    femmesh.addNode(1.7337300425478517, -3.604744115685193, 45.75433307392107, 309)
-    femmesh.addNode(-3.889698417189976, -0.9328698855198382, 4.626647846974178, 310)
-    femmesh.addNode(1.5033815494584035, 3.706729544591573, 28.02117757112522, 311)
-    femmesh.addNode(-3.1035015982213388, -2.523544695430932, 4.624848856269478, 312)
-    femmesh.addNode(-1.909973938136429, 3.5145411586207977, 4.297888553461844, 313)
-    femmesh.addNode(1.738750818933354, -3.602325025543724, 6.587447300085367, 314)
-    femmesh.addNode(1.4888059445469408, 3.712607824627009, 26.16573166687488, 315)
-    femmesh.addNode(1.4374739121045106, 3.7327829768175587, 18.819381154065862, 316)
-    femmesh.addNode(1.49289203053678, 3.7109666375702934, 10.103268073761958, 317)
-    femmesh.addNode(1.4697245782385648, 3.7202029063105515, 6.653399044851032, 318)
-    femmesh.addNode(1.44549025368268, 3.7296860359162114, 20.625664714052412, 319)
-    femmesh.addNode(0.8883341258228422, -3.900110572906692, 5.414434159186237, 320)
-    femmesh.addNode(1.4630425268189202, 3.722835822960678, 17.028002244652097, 321)
-    femmesh.addNode(1.4455368505551431, 3.729667976333432, 15.267141629115631, 322)
-    femmesh.addNode(1.4854758746738737, 3.7139414946606104, 11.818313518967297, 323)
-    femmesh.addNode(1.4778920630277876, 3.716965839234936, 8.384930347177265, 324)
-    femmesh.addNode(-0.6720369227093598, -3.943141688364157, 43.3428703940623, 325)
-    femmesh.addNode(-0.8760040100333759, -3.9028985349872274, 5.954634844328398, 326)
-    femmesh.addNode(-0.06161300084700843, -3.9995254516163072, 10.701282537725884, 327)
-    femmesh.addNode(-0.13011181383699058, -3.997883304437493, 12.418789991161507, 328)
-    femmesh.addNode(-0.1674247121580106, -3.996494584727822, 14.21952261935647, 329)
-    femmesh.addNode(-0.19701609494651265, -3.9951451360785413, 16.022751306279392, 330)
-    femmesh.addNode(-0.19870267314879722, -3.995061607495374, 17.809507456220693, 331)
-    femmesh.addNode(-0.23030680749668275, -3.9933643428092918, 19.59525834726852, 332)
-    femmesh.addNode(-0.2602423788515546, -3.9915252603797566, 21.435793297188237, 333)
-    femmesh.addNode(-0.24404126340008406, -3.992548542191828, 23.225795402525808, 334)
-    femmesh.addNode(-0.24311608218004543, -3.9926049855433265, 25.029576479584392, 335)
-    femmesh.addNode(-0.23980412872219664, -3.99280527697605, 26.836727391387424, 336)
-    femmesh.addNode(-0.22422126897140096, -3.9937106583402926, 28.63763957860234, 337)
-    femmesh.addNode(-0.22789308662352817, -3.9935028159585917, 30.410879339731768, 338)
-    femmesh.addNode(-0.24610510956809373, -3.992421855846959, 32.21753405889645, 339)
-    femmesh.addNode(-0.23428762098987685, -3.993132768973617, 34.01239856760076, 340)
-    femmesh.addNode(-0.23789524758137254, -3.9929194646496686, 35.79558790750798, 341)
-    femmesh.addNode(-0.26157926058857567, -3.991437872550434, 37.57651527104442, 342)
-    femmesh.addNode(-0.27273017827841356, -3.99069145009436, 39.37738655929549, 343)
-    femmesh.addNode(-0.3279773493386206, -3.9865311811549664, 41.2464574332424, 344)
-    femmesh.addNode(-3.601959989760029, 1.7395068933947728, 6.059613964258514, 345)
-    femmesh.addNode(-0.7228486145038525, 3.9341441102875048, 43.433402278467035, 346)
-    femmesh.addNode(-3.5283646892426113, 1.8843148939882346, 43.76148372883602, 347)
-    femmesh.addNode(-0.18275768760008598, 3.9958227722989754, 17.939208992387105, 348)
-    femmesh.addNode(-0.0676635777707792, 3.999427664084357, 31.13640795753358, 349)
-    femmesh.addNode(-0.19704298413647875, 3.995143809977632, 37.28626735767967, 350)
-    femmesh.addNode(-2.5276367432756612, -3.1001697524559537, 43.65295986248309, 351)
-    femmesh.addNode(0.25846157444183904, -3.99164096763938, 7.128696354756854, 352)
-    femmesh.addNode(-1.2893942083009828, 3.7864841971939986, 5.4865720712363215, 353)
-    femmesh.addNode(0.054372708408780376, -3.9996304340001583, 8.862741246822623, 354)
-    femmesh.addNode(-2.444351675738682, 3.1662509195124597, 43.96112319110806, 355)
-    femmesh.addNode(-0.18094681923059763, 3.9959051851376968, 35.34782680835974, 356)
-    femmesh.addNode(-0.10348027700211992, 3.998661255004175, 23.394113084932574, 357)
-    femmesh.addNode(-0.1034131632320313, 3.9986629912597467, 33.24404802495216, 358)
-    femmesh.addNode(0.05002577632948649, 3.9996871654796493, 6.063106555485686, 359)
-    femmesh.addNode(-2.5679361752261944, 3.0668719894975505, 5.80241087323176, 360)
-    femmesh.addNode(-3.9979921118418296, 0.12672440037540594, 43.74195474766778, 361)
-    femmesh.addNode(-3.9998275695570102, -0.037140460574154925, 6.145485815662697, 362)
-    femmesh.addNode(-0.10572074384420868, 3.9986026464655158, 29.05622677504197, 363)
-    femmesh.addNode(-2.481329096066389, -3.1373565173588984, 6.126544236224471, 364)
-    femmesh.addNode(-0.5971024535138704, 3.9551825065359143, 41.2966439109185, 365)
-    femmesh.addNode(-0.09777724189046931, 3.998804772800029, 9.292299040117157, 366)
-    femmesh.addNode(-0.146922882275024, 3.997300797621315, 19.7806220286597, 367)
-    femmesh.addNode(-0.3394961623060329, 3.9855667546510216, 39.25502295405979, 368)
-    femmesh.addNode(-0.12428544345198485, 3.998068674816122, 21.53741154806995, 369)
-    femmesh.addNode(-3.6487650904972857, -1.6390586671526846, 43.74658842008444, 370)
-    femmesh.addNode(-0.1808858263876642, 3.995907946613892, 16.129233186133494, 371)
-    femmesh.addNode(-0.10412695782536764, 3.998644467398175, 25.299225822030785, 372)
-    femmesh.addNode(-0.14157505472260337, 3.9974937778413477, 14.411994904629166, 373)
-    femmesh.addNode(-0.11864217778788057, 3.998240117057722, 12.709424977708407, 374)
-    femmesh.addNode(-0.10019486324165632, 3.9987449267713973, 27.157441145861934, 375)
-    femmesh.addNode(-1.752290239702094, 3.5957584618331606, 36.153149821403204, 376)
-    femmesh.addNode(-1.7147351102915638, -3.613818410149212, 13.237857494889626, 377)
-    femmesh.addNode(-1.7843599759179463, -3.5799524405139946, 14.975017625533189, 378)
-    femmesh.addNode(-1.833971445888851, -3.554792361821483, 16.800275584001028, 379)
-    femmesh.addNode(-1.851941786815904, -3.545463526570978, 18.649450736718595, 380)
-    femmesh.addNode(-1.841406198728029, -3.5509468049079516, 20.416031760442678, 381)
-    femmesh.addNode(-1.830105566408198, -3.556784167728164, 22.242807587560062, 382)
-    femmesh.addNode(-1.8764236865580073, -3.5325676424555637, 24.045955907429793, 383)
-    femmesh.addNode(-1.8821417479303877, -3.5295243929880336, 25.862099555614463, 384)
-    femmesh.addNode(-1.8828055385541547, -3.529170342161143, 27.67771755830813, 385)
-    femmesh.addNode(-1.8459488629141114, -3.5485874366437837, 29.44750872089116, 386)
-    femmesh.addNode(-1.8510694494805955, -3.5459190477504707, 31.278110660910077, 387)
-    femmesh.addNode(-1.8548258332932288, -3.543955576491906, 33.11946447901958, 388)
-    femmesh.addNode(-1.8432312593345899, -3.549999792198842, 34.90503098063331, 389)
-    femmesh.addNode(-1.8554723550313728, -3.5436171265691687, 36.67894110999438, 390)
-    femmesh.addNode(-1.8335607106637257, -3.555004236328043, 38.48031909124146, 391)
-    femmesh.addNode(-1.7884279602678355, -3.577921943102201, 40.19365474695426, 392)
-    femmesh.addNode(-0.07232187663348279, 3.999346139828386, 11.034147374225102, 393)
-    femmesh.addNode(-3.598233471964711, -1.7472023011754485, 6.1728807335054645, 394)
-    femmesh.addNode(-1.9956329430878363, -3.4666192690375706, 41.92691395422011, 395)
-    femmesh.addNode(-2.5624721429994692, 3.0714388348706714, 42.18574350649854, 396)
-    femmesh.addNode(-1.7960671037716354, 3.57409330582588, 18.898318057232725, 397)
-    femmesh.addNode(-0.030258663534173103, 3.9998855500227912, 7.66640032831378, 398)
-    femmesh.addNode(-1.7779557864429663, 3.5831373433701885, 34.17090443707735, 399)
-    femmesh.addNode(-1.5601602184991328, -3.683191563388027, 7.755387853617894, 400)
-    femmesh.addNode(-1.7793000530596712, 3.582470002830708, 32.15239830565107, 401)
-    femmesh.addNode(-1.7317898364893494, 3.605676630291767, 24.387278336863275, 402)
-    femmesh.addNode(-1.7322881258727554, 3.605437261825569, 10.17526031376651, 403)
-    femmesh.addNode(-1.8804394611403306, 3.5304316213440905, 38.06418853889916, 404)
-    femmesh.addNode(-2.0936544368737726, 3.408314994092941, 40.017648178325466, 405)
-    femmesh.addNode(-1.7452623736110369, 3.599174800875552, 30.139187544096654, 406)
-    femmesh.addNode(-3.298376277260317, -2.262899452827361, 42.2223140551844, 407)
-    femmesh.addNode(-3.8512198190732665, 1.0807894823587407, 7.751165798893041, 408)
-    femmesh.addNode(-1.7258807686906528, 3.6085087740317, 20.71356210112652, 409)
-    femmesh.addNode(-1.7013975651014, 3.6201168938954207, 26.279229833997345, 410)
-    femmesh.addNode(-3.803074585368664, 1.23960626737806, 42.20130081799675, 411)
-    femmesh.addNode(-1.6910324877616225, 3.624970224061811, 8.517654668109959, 412)
-    femmesh.addNode(-1.7605993694838742, 3.5916973508597554, 22.543389301753205, 413)
-    femmesh.addNode(-1.5080994464706508, -3.7048125539026824, 9.73327521778013, 414)
-    femmesh.addNode(-1.8233088577130232, 3.5602731369075085, 17.106826264003388, 415)
-    femmesh.addNode(-1.5905267730939103, -3.6701804566085676, 11.501058265545504, 416)
-    femmesh.addNode(-1.7386791742587002, 3.602359605730539, 15.299125636648542, 417)
-    femmesh.addNode(-1.4805109867245396, 3.715923467751715, 6.924609378431491, 418)
-    femmesh.addNode(-1.7077285217430425, 3.6171346803824327, 13.577506131281314, 419)
-    femmesh.addNode(-1.6976558372783814, 3.6218730869751132, 11.878776122970446, 420)
-    femmesh.addNode(-2.940745155317656, 2.7114604794235406, 7.440372788731542, 421)
-    femmesh.addNode(-3.4252930227794782, 2.065760806119195, 40.54169493283702, 422)
-    femmesh.addNode(-3.13584693949303, 2.4832365920451878, 35.04832998721887, 423)
-    femmesh.addNode(-3.1433163456997093, -2.473774919198799, 15.697159990336615, 424)
-    femmesh.addNode(-3.178551616927749, -2.428334741860354, 17.49810611400894, 425)
-    femmesh.addNode(-3.1662548546150253, -2.444346578459524, 19.38480559072655, 426)
-    femmesh.addNode(-3.1617103995851763, -2.4502218979420918, 21.245067366835155, 427)
-    femmesh.addNode(-3.1585990791364167, -2.4542314188516494, 23.008114776107277, 428)
-    femmesh.addNode(-3.1542594077406454, -2.4598064128462696, 24.840902589817418, 429)
-    femmesh.addNode(-3.162705018275959, -2.4489379264023956, 26.680740641169727, 430)
-    femmesh.addNode(-3.163522561265979, -2.4478817382302482, 28.467688580242996, 431)
-    femmesh.addNode(-3.175797427500355, -2.431935587033943, 30.31151044642051, 432)
-    femmesh.addNode(-3.145971846135882, -2.470396960676642, 32.16649136644358, 433)
-    femmesh.addNode(-3.1430514846249813, -2.4741114293816073, 34.00549385573993, 434)
-    femmesh.addNode(-3.137183344036313, -2.4815480382013835, 35.829241895655535, 435)
-    femmesh.addNode(-3.1292279905676215, -2.491572231152074, 37.652152681157496, 436)
-    femmesh.addNode(-3.0493023819460228, -2.588774803542848, 39.39129586320457, 437)
-    femmesh.addNode(-3.9475132565523916, -0.645863057732158, 42.17920021441007, 438)
-    femmesh.addNode(-2.8834698619488672, -2.772291751463504, 40.86516706551972, 439)
-    femmesh.addNode(-3.2286310633672817, 2.3613431467408237, 9.410462818306948, 440)
-    femmesh.addNode(-1.672362224553983, 3.633621415321752, 28.18587570199482, 441)
-    femmesh.addNode(-3.0283970127748088, 2.6131994820557836, 25.374813241244716, 442)
-    femmesh.addNode(-3.0564044452186363, 2.580385991910466, 31.14179823821287, 443)
-    femmesh.addNode(-2.877290685095325, -2.7787044307489195, 10.529060590841185, 444)
-    femmesh.addNode(-3.0859958537238215, 2.5449223152778915, 33.11135404364432, 445)
-    femmesh.addNode(-2.9119055492046315, -2.7424088084221276, 12.245004777824086, 446)
-    femmesh.addNode(-3.154095085746659, 2.4600171117430825, 36.91833113604179, 447)
-    femmesh.addNode(-3.9938281751684426, 0.22211822804692677, 40.675535240836254, 448)
-    femmesh.addNode(-3.089547201626394, 2.5406097868272726, 18.062689777263902, 449)
-    femmesh.addNode(-3.139317615265508, -2.4788474964151557, 7.608366721443421, 450)
-    femmesh.addNode(-2.8762204628771215, 2.77981219670087, 11.052259860542874, 451)
-    femmesh.addNode(-3.0825671442673688, 2.549074302778034, 29.203654174585907, 452)
-    femmesh.addNode(-3.0766116407157154, 2.5562591441816993, 27.332025124427652, 453)
-    femmesh.addNode(-3.174995782934026, 2.4329820752219184, 38.74301862207657, 454)
-    femmesh.addNode(-3.0563051069587495, 2.5805036510685015, 23.54256350511801, 455)
-    femmesh.addNode(-3.9054101299338186, -0.8647379470165025, 7.753556631037689, 456)
-    femmesh.addNode(-2.6295076564079847, -3.0142477477625804, 8.9594533457418, 457)
-    femmesh.addNode(-3.1213668374639902, 2.501413413648381, 16.254119508020402, 458)
-    femmesh.addNode(-3.0092414668038785, -2.6352354343526962, 13.964950404500502, 459)
-    femmesh.addNode(-3.094643004413244, 2.53440025947682, 14.482303451988669, 460)
-    femmesh.addNode(-3.120032854728002, 2.5030771033705363, 19.896333250822334, 461)
-    femmesh.addNode(-3.9957577454058235, 0.1841739396043091, 9.500934738975642, 462)
-    femmesh.addNode(-3.9043951202503, -0.8693093494065529, 18.28788746325027, 463)
-    femmesh.addNode(-3.910350547289183, -0.8421155486720258, 20.14338499915578, 464)
-    femmesh.addNode(-3.9128590710413502, -0.8303817737459217, 21.969450683527104, 465)
-    femmesh.addNode(-3.9093556412989456, -0.8467221916568094, 23.793573660989626, 466)
-    femmesh.addNode(-3.904142987390287, -0.8704409997301633, 25.638486761217813, 467)
-    femmesh.addNode(-3.907168874466239, -0.8567563168148952, 27.48123614226932, 468)
-    femmesh.addNode(-3.9060621524131784, -0.8617879446159181, 29.325624913631213, 469)
-    femmesh.addNode(-3.9011734789281785, -0.883654619920823, 31.199410054311826, 470)
-    femmesh.addNode(-3.9028813852869377, -0.8760804143346169, 33.08032279623643, 471)
-    femmesh.addNode(-3.8991389614723793, -0.8925891323157015, 34.94810480858729, 472)
-    femmesh.addNode(-3.8992417479620736, -0.892140006360926, 36.81903705618622, 473)
-    femmesh.addNode(-3.900104424717069, -0.8883611181846833, 38.84178454357476, 474)
-    femmesh.addNode(-3.7167710215010628, -1.478381944468325, 40.64294142617957, 475)
-    femmesh.addNode(-3.8797515343637134, 0.9734105154570758, 32.14318827314523, 476)
-    femmesh.addNode(-3.1129059632870772, 2.51193480483307, 21.741750671332152, 477)
-    femmesh.addNode(-3.908033406641499, -0.8528041349419232, 14.41059178211651, 478)
-    femmesh.addNode(-3.8203393133017545, -1.1853301359710218, 11.191035641007023, 479)
-    femmesh.addNode(-3.8569922826666994, 1.060004967653229, 24.589606159302654, 480)
-    femmesh.addNode(-3.877765985707193, 0.9812904565378816, 30.20352700185609, 481)
-    femmesh.addNode(-3.6229223343834818, -1.6954155122050003, 9.268103176801969, 482)
-    femmesh.addNode(-3.0195277339243276, 2.623442826528113, 12.669481425379542, 483)
-    femmesh.addNode(-3.8834743124218734, 0.9584504498196345, 34.03361084641903, 484)
-    femmesh.addNode(-3.9001562521486113, -0.8881335534851142, 16.40289513149547, 485)
-    femmesh.addNode(-3.6710033175906145, -1.5886266528793676, 12.907838047399066, 486)
-    femmesh.addNode(-3.8834107837049348, 0.9587078204563819, 17.241027765472943, 487)
-    femmesh.addNode(-3.892028418677332, 0.9231006381798387, 35.91593265577363, 488)
-    femmesh.addNode(-3.8849182680647014, 0.9525807317267968, 19.087380361969124, 489)
-    femmesh.addNode(-3.8724504714646, 1.0020615480366446, 22.72092290074363, 490)
-    femmesh.addNode(-3.8600394473398283, 1.048854358326471, 26.496926463541865, 491)
-    femmesh.addNode(-3.8255114426952326, 1.1685299319263673, 11.359358105881837, 492)
-    femmesh.addNode(-3.876588504766785, 0.9859318255893862, 15.369653135142528, 493)
-    femmesh.addNode(-3.8762115938090034, 0.9874126189292225, 28.34301030140859, 494)
-    femmesh.addNode(-3.903261773859805, 0.8743840830692239, 37.67901409568997, 495)
-    femmesh.addNode(-3.88132101126713, 0.9671335003484802, 39.29289102578628, 496)
-    femmesh.addNode(-3.881310128633899, 0.9671771737194303, 20.921915251281344, 497)
-    femmesh.addNode(-3.8395220496333864, 1.121637388097883, 13.562998028715823, 498)
-    femmesh.addNode(-3.9948962435438355, -0.20200000821622055, 12.655788736377525, 499)
-    femmesh.addNode(4.34070796209047, 2.481583040690842, 48.495531356918626, 500)
-    femmesh.addNode(3.0864495130113005, 3.9336788638159446, 48.48867287294651, 501)
-    femmesh.addNode(1.501226819491412, 4.769310016809528, 48.47235909384219, 502)
-    femmesh.addNode(-0.35054803449509264, 4.987696469865787, 48.45539236021307, 503)
-    femmesh.addNode(-2.1437873123602524, 4.51709817907063, 48.427055971505254, 504)
-    femmesh.addNode(-3.5904629278073443, 3.479737915999008, 48.417357055786944, 505)
-    femmesh.addNode(-4.588424370786952, 1.9865451904168616, 48.39310184662904, 506)
-    femmesh.addNode(-4.9942868039024395, 0.2389546408127628, 48.44737472828771, 507)
-    femmesh.addNode(-4.719212208985274, -1.6519794570648647, 48.45969825755819, 508)
-    femmesh.addNode(-3.805795374183107, -3.242826170155666, 48.46379111749622, 509)
-    femmesh.addNode(-2.3633154347142984, -4.406216081406036, 48.42632007036664, 510)
-    femmesh.addNode(-0.6141382356347548, -4.962140085440095, 48.39085880907438, 511)
-    femmesh.addNode(1.3050512764246371, -4.826680139174588, 48.35104397028744, 512)
-    femmesh.addNode(2.975393098213877, -4.018337456100623, 48.37395401219642, 513)
-    femmesh.addNode(4.212850779260485, -2.692933031414693, 48.50289617156126, 514)
-    femmesh.addNode(4.838459685548445, -1.2606775445459655, 48.771351314336606, 515)
-    femmesh.addNode(4.737209858616445, -1.5996383201921514, 2.433401814050531, 516)
-    femmesh.addNode(4.755452153985415, -1.54456298387456, 6.235695768678595, 517)
-    femmesh.addNode(4.761978415803524, -1.524323314596139, 9.767036165847182, 518)
-    femmesh.addNode(4.774062026758257, -1.4860456805444597, 13.363081750798044, 519)
-    femmesh.addNode(4.7788728877938125, -1.4705012486595264, 16.81711444038559, 520)
-    femmesh.addNode(4.755122291587062, -1.5455782063848496, 20.417633331252546, 521)
-    femmesh.addNode(4.746039645670448, -1.5732474953815514, 23.917005252615365, 522)
-    femmesh.addNode(4.796477547122001, -1.4120209417549394, 27.461073364534688, 523)
-    femmesh.addNode(4.730159476805501, -1.620367650870354, 30.987557369968233, 524)
-    femmesh.addNode(4.7418860678848676, -1.5857227119516808, 34.64333374225961, 525)
-    femmesh.addNode(4.746585005286109, -1.5716013449959463, 38.25824963413179, 526)
-    femmesh.addNode(4.765046762670099, -1.5147043769551867, 41.79284100008845, 527)
-    femmesh.addNode(4.75144394318111, -1.5568495286338822, 45.4115490297467, 528)
-    femmesh.addNode(4.756380132218338, -1.5417029667995945, 47.1390919286572, 529)
-    femmesh.addNode(4.105756104928017, 2.8535533649900993, 1.500428359953368, 530)
-    femmesh.addNode(1.4151825105856526, 4.795545689672083, 1.5616849906114034, 531)
-    femmesh.addNode(-2.07317192641526, 4.549940457140471, 1.6985548949112137, 532)
-    femmesh.addNode(-4.579630898675664, 2.0067338717167074, 1.6508071090036582, 533)
-    femmesh.addNode(-4.738860511451409, -1.594741688489547, 1.6378401238127516, 534)
-    femmesh.addNode(-2.3675168861665212, -4.4039600127290415, 1.6112659938468556, 535)
-    femmesh.addNode(1.2446942307656457, -4.842596026089593, 1.6950391147487014, 536)
-    femmesh.addNode(4.085728770791882, -2.8821555148054485, 1.5231237616469924, 537)
-    femmesh.addNode(4.885019664174602, 1.0661064114934558, 2.9025396543952215, 538)
-    femmesh.addNode(4.80928507196762, 1.3677635382438744, 4.3735395570846896, 539)
-    femmesh.addNode(4.758704178710869, 1.5345144311865269, 6.144667457560099, 540)
-    femmesh.addNode(4.7539673977389665, 1.549126844785473, 7.973145502034023, 541)
-    femmesh.addNode(4.75057034853189, 1.5595131816209808, 9.76071696742829, 542)
-    femmesh.addNode(4.763296509485707, 1.5201994483360646, 11.547609984781039, 543)
-    femmesh.addNode(4.771008248546297, 1.4958209425941325, 13.331568233330724, 544)
-    femmesh.addNode(4.774960270567023, 1.4831569082556646, 15.099870004587322, 545)
-    femmesh.addNode(4.779921486654322, 1.4670891525126692, 16.84383601591458, 546)
-    femmesh.addNode(4.777296092531345, 1.4756158186617339, 18.597075259425004, 547)
-    femmesh.addNode(4.778066175150841, 1.4731203704651592, 20.38269371428916, 548)
-    femmesh.addNode(4.779879989846199, 1.4672243463996586, 22.157373672325644, 549)
-    femmesh.addNode(4.780415705571206, 1.4654779704683898, 23.923512919009223, 550)
-    femmesh.addNode(4.7676731365688205, 1.5064172273444132, 25.706987058280458, 551)
-    femmesh.addNode(4.771018551926967, 1.4957880789632951, 27.48395190587348, 552)
-    femmesh.addNode(4.7707275967835505, 1.4967158037810142, 29.251765461359927, 553)
-    femmesh.addNode(4.7667352237839955, 1.5093824254763737, 31.03739610044038, 554)
-    femmesh.addNode(4.770015930267399, 1.4989823297808555, 32.82176047495411, 555)
-    femmesh.addNode(4.76959794884263, 1.5003117697319364, 34.58271051764254, 556)
-    femmesh.addNode(4.768667385304574, 1.503266898568727, 36.36171278685726, 557)
-    femmesh.addNode(4.774402399641283, 1.4849517589132508, 38.157157100079495, 558)
-    femmesh.addNode(4.775756476921128, 1.4805911228782573, 39.93454382321948, 559)
-    femmesh.addNode(4.769615855905045, 1.5002548407184633, 41.72394380189614, 560)
-    femmesh.addNode(4.759400515082764, 1.5323533329587933, 43.4363822400917, 561)
-    femmesh.addNode(4.765642194843493, 1.512829954333035, 45.13608749229087, 562)
-    femmesh.addNode(4.785788520069797, 1.4478357093151641, 1.5004084175157568, 563)
-    femmesh.addNode(4.725335794328994, -1.6343811155398158, 4.365547559570369, 564)
-    femmesh.addNode(4.7494170474729795, -1.5630219797472615, 7.94035946361696, 565)
-    femmesh.addNode(4.764248234715387, -1.5172141437553637, 11.51110165978995, 566)
-    femmesh.addNode(4.778993866960242, -1.4701080298931766, 15.084785624068312, 567)
-    femmesh.addNode(4.757652734162767, -1.5377712642371573, 18.549599368152386, 568)
-    femmesh.addNode(4.75284660194716, -1.5525621334939654, 22.17803191053965, 569)
-    femmesh.addNode(4.768010492940081, -1.505349108749622, 25.757639448773848, 570)
-    femmesh.addNode(4.771146030823846, -1.4953814070510125, 29.174120535800572, 571)
-    femmesh.addNode(4.741337767974435, -1.5873613860678373, 32.73905884069535, 572)
-    femmesh.addNode(4.744941232623362, -1.5765572298367996, 36.40524705373649, 573)
-    femmesh.addNode(4.758434671777805, -1.5353499517773948, 39.96806580486501, 574)
-    femmesh.addNode(4.7765586304358285, -1.4780012347792557, 43.53845268371723, 575)
-    femmesh.addNode(-3.558519101476528, 3.5123982980901642, 1.6781644139776222, 576)
-    femmesh.addNode(2.9556377792046433, 4.032890442119429, 1.502436193358705, 577)
-    femmesh.addNode(-0.3383284532931329, 4.988540253189532, 1.6397431462858987, 578)
-    femmesh.addNode(-4.994447973332931, 0.23556196991573602, 1.6426314625921883, 579)
-    femmesh.addNode(-3.820223926188566, -3.225816044627532, 1.6069067583089118, 580)
-    femmesh.addNode(-0.5953396428440259, -4.964430552405617, 1.644107526524547, 581)
-    femmesh.addNode(2.8962956972578295, -4.075717266205519, 1.6811273065422232, 582)
-    femmesh.addNode(4.7082257203671745, 1.683036115498715, 46.82938758339907, 583)
-    femmesh.addNode(2.3529940771595284, 4.411736491774207, 46.89930074318079, 584)
-    femmesh.addNode(0.5565469379493558, 4.968929009943611, 46.79257568992882, 585)
-    femmesh.addNode(-1.2458458617732222, 4.842299875957966, 46.77791083828524, 586)
-    femmesh.addNode(-2.89422509471563, 4.077187891319004, 46.82230014657741, 587)
-    femmesh.addNode(-4.154467464747365, 2.782157451395517, 46.8505123414633, 588)
-    femmesh.addNode(-4.874147375384702, 1.1147588811175386, 46.83207436989451, 589)
-    femmesh.addNode(-4.9415747624815225, -0.76212785463181, 46.77512084918191, 590)
-    femmesh.addNode(-4.334584324010338, -2.492263777781927, 46.80539089396019, 591)
-    femmesh.addNode(-3.1518931316394694, -3.881439125726944, 46.78514451119311, 592)
-    femmesh.addNode(-1.5052174202552635, -4.768052067433837, 46.772100090063425, 593)
-    femmesh.addNode(0.3821523970535763, -4.985374564205403, 46.693098108058614, 594)
-    femmesh.addNode(2.156914350390137, -4.510844764019384, 46.6677898931915, 595)
-    femmesh.addNode(3.8518531333548225, -3.187981718746931, 46.52188791364465, 596)
-    femmesh.addNode(3.7711963219444233, -3.282998370598568, 3.4816687275722793, 597)
-    femmesh.addNode(4.064825489924211, -2.9115620784146774, 10.597865525781266, 598)
-    femmesh.addNode(4.119934145848145, -2.833044763831754, 14.182500651946592, 599)
-    femmesh.addNode(3.5414341012477135, 3.5296238477378576, 3.0570235656388136, 600)
-    femmesh.addNode(4.094973653962807, -2.869005188798113, 17.71612710874238, 601)
-    femmesh.addNode(4.0612609033497655, -2.9165321659331394, 19.462399305977648, 602)
-    femmesh.addNode(4.04501031079293, -2.939029020880686, 21.343103790149236, 603)
-    femmesh.addNode(4.05256560772025, -2.9286023962161547, 24.8952972617523, 604)
-    femmesh.addNode(4.150614309725861, -2.787902590102265, 26.711888117537487, 605)
-    femmesh.addNode(3.8535621246746805, -3.185915716285157, 29.78105525496396, 606)
-    femmesh.addNode(3.9881593186208066, -3.0157230060630615, 31.884931579051923, 607)
-    femmesh.addNode(4.021847966552949, -2.9706462148720965, 35.52904973035076, 608)
-    femmesh.addNode(4.051446814800336, -2.9301499461365808, 39.21139915597631, 609)
-    femmesh.addNode(4.14689031398354, -2.793438870601879, 42.66125624649294, 610)
-    femmesh.addNode(0.6033684815348889, 4.963461138710596, 3.1707087352350567, 611)
-    femmesh.addNode(-2.7848902008325656, 4.152636098830086, 3.283365531282996, 612)
-    femmesh.addNode(-4.863613093279671, 1.1598567492921505, 3.289996656330226, 613)
-    femmesh.addNode(2.204474262849065, 4.487793803689745, 3.0456214843752325, 614)
-    femmesh.addNode(-3.1418704548025262, -3.889556535807002, 3.2580096169582973, 615)
-    femmesh.addNode(-4.116233368604431, 2.83841907673751, 3.290627569859587, 616)
-    femmesh.addNode(-4.955333878117439, -0.6668329298869289, 3.2849087353458604, 617)
-    femmesh.addNode(4.013510333961637, -2.981901205469952, 6.993662835451373, 618)
-    femmesh.addNode(-1.5050761251615599, -4.768096670314966, 3.17986553145601, 619)
-    femmesh.addNode(4.197587055562703, 2.7166639304434463, 45.765185937895524, 620)
-    femmesh.addNode(2.1303002195895475, -4.523474436140512, 3.4530546198999907, 621)
-    femmesh.addNode(-1.1678745526016807, 4.8616940493397385, 3.2595189952761245, 622)
-    femmesh.addNode(4.090240652593835, -2.8757488422789566, 12.43936173635943, 623)
-    femmesh.addNode(0.33808040899556274, -4.988557069639816, 3.2408512690257676, 624)
-    femmesh.addNode(4.0639711887355965, 2.912754396980114, 4.908751917004122, 625)
-    femmesh.addNode(4.004367476250166, 2.994167850196425, 6.95444312112697, 626)
-    femmesh.addNode(3.978962948861465, 3.0278464048870894, 8.825825947747935, 627)
-    femmesh.addNode(4.023453471098591, 2.968471351706918, 10.652219932729492, 628)
-    femmesh.addNode(4.080732181290772, 2.889225651377521, 12.406273609779294, 629)
-    femmesh.addNode(4.1174058981539465, 2.836717939776017, 14.206987173505304, 630)
-    femmesh.addNode(4.110862710385616, 2.846191802454822, 15.97892069426001, 631)
-    femmesh.addNode(4.111780109650354, 2.8448663114254984, 17.73659554357187, 632)
-    femmesh.addNode(4.1267728583604715, 2.8230738168704246, 19.505310580911683, 633)
-    femmesh.addNode(4.111398092969667, 2.8454183736535796, 21.280088707224056, 634)
-    femmesh.addNode(4.098633968159488, 2.8637736633765614, 23.051445929252395, 635)
-    femmesh.addNode(4.112056262374622, 2.8444671372799597, 24.825436377983014, 636)
-    femmesh.addNode(4.108264203202944, 2.849941268988061, 26.606084397773394, 637)
-    femmesh.addNode(4.093662631610792, 2.8708755212571306, 28.381082150118033, 638)
-    femmesh.addNode(4.106904724174244, 2.851899995889631, 30.15771316174971, 639)
-    femmesh.addNode(4.106058951250764, 2.853117573611974, 31.94153269688246, 640)
-    femmesh.addNode(4.090196609758731, 2.875811484349797, 33.72166303383408, 641)
-    femmesh.addNode(4.106224559202737, 2.8528792244678507, 35.49622841826013, 642)
-    femmesh.addNode(4.119517489830361, 2.8336505873134326, 37.27745068016176, 643)
-    femmesh.addNode(4.097930013242262, 2.864780900272877, 39.058940360094546, 644)
-    femmesh.addNode(4.0769925284822115, 2.8945002889445743, 40.83621421656144, 645)
-    femmesh.addNode(4.048433693001078, 2.9343116114982832, 42.60547971396046, 646)
-    femmesh.addNode(4.0591877968328385, 2.9194167962186155, 44.277567404029924, 647)
-    femmesh.addNode(4.11044212551521, -2.8467991732452784, 5.275076216422966, 648)
-    femmesh.addNode(3.742185779579251, 3.3160285871980704, 47.050983112087785, 649)
-    femmesh.addNode(4.007964813475265, -2.9893507746572974, 8.741134676432411, 650)
-    femmesh.addNode(-4.352327609385517, -2.4611469644416903, 3.2904763333929465, 651)
-    femmesh.addNode(4.4231703863703995, 2.331429547109655, 3.0502009882213117, 652)
-    femmesh.addNode(4.132445816596628, -2.814763146854994, 15.901805029714026, 653)
-    femmesh.addNode(4.033715090471771, -2.9545122387460685, 23.11685407414162, 654)
-    femmesh.addNode(4.262442753123976, -2.613729476503048, 28.236363765210807, 655)
-    femmesh.addNode(3.987202308563317, -3.01698819198673, 33.723655643775714, 656)
-    femmesh.addNode(4.0340266802678695, -2.954086786620697, 37.42420623289332, 657)
-    femmesh.addNode(4.061957891011408, -2.915561368184548, 40.9691388121134, 658)
-    femmesh.addNode(4.076063478006404, -2.8958084403603666, 44.504000662635534, 659)
-    femmesh.addNode(-0.13548392916710433, 4.9981640734311075, 4.785737768885799, 660)
-    femmesh.addNode(-0.3071925868292843, 4.9905543494282405, 45.28055659283728, 661)
-    femmesh.addNode(-2.0899293442012796, 4.54226764251584, 45.28234902487752, 662)
-    femmesh.addNode(-3.579030713666323, 3.4914952600043914, 45.319462346763856, 663)
-    femmesh.addNode(-4.583942757769181, 1.9968647409114797, 45.301059857424775, 664)
-    femmesh.addNode(-4.99801995456772, 0.1407001554472516, 45.27977447894215, 665)
-    femmesh.addNode(-4.73068582520646, -1.6188303256335042, 45.23512161460043, 666)
-    femmesh.addNode(-3.789179066762696, -3.2622265402646984, 45.21879281051847, 667)
-    femmesh.addNode(-2.407765466561584, -4.3820846018799635, 45.18387403068131, 668)
-    femmesh.addNode(-0.6157537307217438, -4.961939877014055, 45.11843716871826, 669)
-    femmesh.addNode(1.2289778268003555, -4.846608453468577, 45.085667221702494, 670)
-    femmesh.addNode(2.8362892885800473, -4.11770118773644, 45.0180337704639, 671)
-    femmesh.addNode(2.9291654946983687, -4.052158622841468, 22.246998340594835, 672)
-    femmesh.addNode(2.9361917243661173, -4.0470703178674725, 20.436313936021225, 673)
-    femmesh.addNode(3.006692302252759, -3.994972014867439, 26.018132195607187, 674)
-    femmesh.addNode(2.9281677853360213, -4.0528796455014975, 24.122930319967832, 675)
-    femmesh.addNode(-2.351183151484393, -4.412701869396562, 4.769774360916296, 676)
-    femmesh.addNode(2.9673173969569833, -4.024304594053044, 38.37783772411119, 677)
-    femmesh.addNode(2.9015923948670315, -4.071948130078502, 34.659240220919024, 678)
-    femmesh.addNode(2.7127486713035873, -4.2001184086095265, 30.99791119740102, 679)
-    femmesh.addNode(2.8887134478277057, -4.081094781592235, 32.85616516384708, 680)
-    femmesh.addNode(3.0301235558549253, -3.9772290902402267, 41.98685298410124, 681)
-    femmesh.addNode(2.925350163099278, -4.054913861385348, 36.49435380634029, 682)
-    femmesh.addNode(2.956170068860362, -4.032500281955864, 40.22923484839545, 683)
-    femmesh.addNode(2.808784240373469, -4.136511947405644, 5.5288557585479445, 684)
-    femmesh.addNode(3.0178385273700274, -3.9865587444211963, 18.589095543358873, 685)
-    femmesh.addNode(3.092944362771439, -3.9285741903138827, 15.037235013043519, 686)
-    femmesh.addNode(3.1230858266852812, 3.904655544239148, 45.44341649044722, 687)
-    femmesh.addNode(-4.991223728352338, 0.2961177021601153, 4.92723475115212, 688)
-    femmesh.addNode(3.056413882724888, -3.957061305752866, 13.280995787267317, 689)
-    femmesh.addNode(2.8207294025440763, 4.128375665758064, 5.982138642804372, 690)
-    femmesh.addNode(2.742706285545955, 4.180617446170686, 7.8476551772083205, 691)
-    femmesh.addNode(2.799975283442176, 4.142479741907365, 9.757719885569209, 692)
-    femmesh.addNode(2.9252632934758322, 4.0549765306155505, 11.504822587202243, 693)
-    femmesh.addNode(3.037431324224162, 3.9716509099645014, 13.338005447030842, 694)
-    femmesh.addNode(3.0680310759388036, 3.9480609566056337, 15.101555035512183, 695)
-    femmesh.addNode(3.046457782749861, 3.96473138786511, 16.86064881518542, 696)
-    femmesh.addNode(3.0637825429011443, 3.9513588206861443, 18.625873520784708, 697)
-    femmesh.addNode(3.064938699592667, 3.9504620954692395, 20.391127601254702, 698)
-    femmesh.addNode(3.04813811244189, 3.9634396737529882, 22.166815369722173, 699)
-    femmesh.addNode(3.068483412066059, 3.947709405449626, 23.946990875938372, 700)
-    femmesh.addNode(3.086756106335688, 3.933438284757922, 25.720623026943127, 701)
-    femmesh.addNode(3.067441156547725, 3.9485193112250516, 27.49552776089055, 702)
-    femmesh.addNode(3.066976028820127, 3.948880605772062, 29.27694929524969, 703)
-    femmesh.addNode(3.0840826284899423, 3.9355348226952036, 31.055362860409538, 704)
-    femmesh.addNode(3.0649518560999094, 3.950451888048976, 32.8391314099748, 705)
-    femmesh.addNode(3.0555587255370265, 3.9577216772777923, 34.640881820072885, 706)
-    femmesh.addNode(3.069801975718924, 3.946684156335821, 36.38408473368118, 707)
-    femmesh.addNode(3.044231033414731, 3.9664414044826986, 38.16613111538738, 708)
-    femmesh.addNode(2.9976792639243377, 4.0017395005969645, 39.929540634657506, 709)
-    femmesh.addNode(2.956429843194439, 4.032309832127153, 41.73693571796692, 710)
-    femmesh.addNode(1.540210668279881, 4.756863577749192, 45.27443068993589, 711)
-    femmesh.addNode(3.2854964499049224, -3.7690201747486247, 27.89242287745099, 712)
-    femmesh.addNode(3.2663422158283644, -3.7856318533499067, 43.52058604075831, 713)
-    femmesh.addNode(2.9633820241014712, -4.027203369490081, 11.472615195023206, 714)
-    femmesh.addNode(3.0484821530223556, -3.96317506081982, 16.797420752820933, 715)
-    femmesh.addNode(2.884460203472694, -4.0841020230379, 9.629392462101249, 716)
-    femmesh.addNode(2.8430877066130384, -4.113010125504898, 7.73513415990324, 717)
-    femmesh.addNode(-4.734737178777325, -1.606942390972287, 4.863842390236016, 718)
-    femmesh.addNode(-0.663848812867207, -4.9557345322015385, 4.758725920517299, 719)
-    femmesh.addNode(2.2792521114393574, -4.450281992469604, 29.1832247266663, 720)
-    femmesh.addNode(-1.8929642916836964, 4.627816568362498, 4.834861696611705, 721)
-    femmesh.addNode(-4.520298343361961, 2.137031325694389, 5.039503599516988, 722)
-    femmesh.addNode(-3.4344180965511697, 3.633837136978189, 5.012054021589022, 723)
-    femmesh.addNode(-3.792924840208236, -3.2578706476057837, 4.820252852695275, 724)
-    femmesh.addNode(1.1154154763529562, -4.873997159940936, 4.961436633314457, 725)
-    femmesh.addNode(2.71403020179809, 4.199290423836844, 43.66033924203727, 726)
-    femmesh.addNode(1.569115649226651, 4.747407300764495, 4.775798411429668, 727)
-    femmesh.addNode(2.9222097425541103, 4.057177617571338, 4.4186309314780114, 728)
-    femmesh.addNode(-4.1528765478653344, 2.7845316263583904, 43.81404276609418, 729)
-    femmesh.addNode(-4.944664421448055, -0.7418178747278694, 43.65339711880076, 730)
-    femmesh.addNode(-4.960778786921047, -0.6250390605667312, 6.612855160999561, 731)
-    femmesh.addNode(-2.4722685211295152, 4.34601982961791, 6.575279842492676, 732)
-    femmesh.addNode(1.5179653002509017, -4.764008957509861, 21.41582096090037, 733)
-    femmesh.addNode(1.586146184633882, -4.741744434379755, 19.508935997795124, 734)
-    femmesh.addNode(-1.210773354855778, 4.851188295992157, 43.70160454531926, 735)
-    femmesh.addNode(-0.9469650035199684, 4.909506826770732, 6.200497554829569, 736)
-    femmesh.addNode(-1.4581399515101006, -4.7826590806590135, 6.31282732707889, 737)
-    femmesh.addNode(1.7896621154596313, -4.6687374645067115, 27.233073990158086, 738)
-    femmesh.addNode(1.0004373588329947, 4.898890189731881, 6.637767998297282, 739)
-    femmesh.addNode(1.7730147819333917, -4.675084874421606, 14.156907344329243, 740)
-    femmesh.addNode(1.0134404942844164, 4.896216739947748, 8.78883145556521, 741)
-    femmesh.addNode(1.2293321229709453, 4.846518599100983, 10.6982916586186, 742)
-    femmesh.addNode(1.5729070252573711, 4.746152493325094, 12.481344046826194, 743)
-    femmesh.addNode(1.7333416443142144, 4.689938884898831, 14.239534030641762, 744)
-    femmesh.addNode(1.726933222149412, 4.692302382225239, 15.960071561315846, 745)
-    femmesh.addNode(1.7183251984000387, 4.695461480253401, 17.72032470146288, 746)
-    femmesh.addNode(1.7027334366574354, 4.70113803708089, 19.490273201216365, 747)
-    femmesh.addNode(1.7282933339361806, 4.691801589141613, 21.266044523666682, 748)
-    femmesh.addNode(1.7485129542508473, 4.6843038382258015, 23.05115107248476, 749)
-    femmesh.addNode(1.7280809301192006, 4.6918798257157395, 24.82631296913643, 750)
-    femmesh.addNode(1.7320559983573176, 4.6904138429945, 26.596834946003366, 751)
-    femmesh.addNode(1.7530345925102655, 4.682613556280549, 28.377641555409074, 752)
-    femmesh.addNode(1.7324249162052572, 4.690277594099437, 30.16103845997668, 753)
-    femmesh.addNode(1.7323436722490562, 4.690307601982908, 31.94072747419808, 754)
-    femmesh.addNode(1.7533734947643367, 4.68248666713082, 33.730363292000185, 755)
-    femmesh.addNode(1.726805944857409, 4.692349222809947, 35.51158313698794, 756)
-    femmesh.addNode(1.6947428149972938, 4.7040245312939275, 37.272884307103226, 757)
-    femmesh.addNode(1.66511731065246, 4.714592701577255, 39.04457520334357, 758)
-    femmesh.addNode(1.5790406181307275, 4.744115378686876, 40.808707156150874, 759)
-    femmesh.addNode(-1.5517216575036588, -4.753121069111757, 43.54375388768041, 760)
-    femmesh.addNode(1.6695978788450703, -4.713007842445846, 12.415506121003604, 761)
-    femmesh.addNode(0.2842143421855241, -4.991915685154954, 43.40559030985022, 762)
-    femmesh.addNode(-4.349202600014699, -2.4666651057704168, 43.65691986647459, 763)
-    femmesh.addNode(-2.8917978933523596, 4.078909773947305, 43.81862719697314, 764)
-    femmesh.addNode(-4.886381687031599, 1.0598462193366651, 43.70441345334438, 765)
-    femmesh.addNode(1.6109914843236186, 4.733361008568519, 42.41325610204301, 766)
-    femmesh.addNode(1.4368621484433974, -4.789094608208385, 6.789138086357442, 767)
-    femmesh.addNode(-3.024682719347399, -3.981368413910125, 6.44845188103155, 768)
-    femmesh.addNode(1.7500857731617523, -4.68371645027502, 15.891189116287812, 769)
-    femmesh.addNode(1.0083094073518644, -4.897275991716796, 30.47891221176442, 770)
-    femmesh.addNode(1.5778978605509086, -4.744495583480805, 39.40195779737771, 771)
-    femmesh.addNode(0.05325537206386949, -4.999716378490518, 6.077216985033147, 772)
-    femmesh.addNode(1.3274539309823932, -4.82056698544055, 8.672564713725741, 773)
-    femmesh.addNode(1.5621848918368362, -4.749692449382037, 25.192590929810454, 774)
-    femmesh.addNode(1.5877511259043644, -4.741207268427464, 37.432206269088475, 775)
-    femmesh.addNode(1.4658889111243945, -4.780289708819177, 35.50895441715575, 776)
-    femmesh.addNode(-4.819723794570086, 1.3305121360043781, 6.657755674272031, 777)
-    femmesh.addNode(1.444043386991839, -4.7869341646282475, 10.545582508199498, 778)
-    femmesh.addNode(-3.928880379869425, 3.092555409475646, 6.704979646531309, 779)
-    femmesh.addNode(0.7068515065964088, 4.949783929387462, 43.75950110971815, 780)
-    femmesh.addNode(1.4835242831771618, -4.774846144246292, 23.28872650931348, 781)
-    femmesh.addNode(1.4153834263721234, -4.795486394136794, 33.698975006838204, 782)
-    femmesh.addNode(1.9731674662073404, -4.59419309022824, 43.350294656731464, 783)
-    femmesh.addNode(-3.1684530476339474, -3.8679329473168416, 43.61421467895461, 784)
-    femmesh.addNode(-4.31649358247682, -2.5234664952078187, 6.536996363365341, 785)
-    femmesh.addNode(1.6699546027786898, -4.7128814566736414, 17.658359645871712, 786)
-    femmesh.addNode(-0.21615078658903364, -4.995325698836558, 7.670513589814993, 787)
-    femmesh.addNode(-0.6892261108075232, -4.952268911133677, 41.84313340930202, 788)
-    femmesh.addNode(-2.0326668111486073, -4.568179685044685, 7.982719263692156, 789)
-    femmesh.addNode(-0.20439915644126658, 4.995820351538484, 41.96249465153944, 790)
-    femmesh.addNode(-3.838790549424818, -3.2036989742556496, 42.02685885390285, 791)
-    femmesh.addNode(-0.975430548473134, 4.903930591383345, 7.87503051307328, 792)
-    femmesh.addNode(1.6074477287637579, -4.7345656399813745, 32.06954056145694, 793)
-    femmesh.addNode(-0.018727155754201193, -4.99996492924074, 36.477707933833, 794)
-    femmesh.addNode(0.10466596727725223, -4.998904383491839, 26.414221656784623, 795)
-    femmesh.addNode(0.48735218856061147, -4.97619210283377, 28.48403372631914, 796)
-    femmesh.addNode(-3.629150178343074, 3.439370434110352, 42.35759360728745, 797)
-    femmesh.addNode(-0.015421206559524964, -4.999976218582269, 20.470637102340863, 798)
-    femmesh.addNode(1.3611847988542116, -4.811151207701564, 41.47046915965535, 799)
-    femmesh.addNode(-2.4559250758257614, -4.355276342774386, 42.02292757135528, 800)
-    femmesh.addNode(-1.1041754615928046, 4.876555808151519, 9.933857533544314, 801)
-    femmesh.addNode(0.3715002369695276, 4.986179657205663, 13.432048605839077, 802)
-    femmesh.addNode(0.21394371362544085, 4.99542071175193, 15.003712207912201, 803)
-    femmesh.addNode(0.20698280405630862, 4.995713974881367, 16.76696137218931, 804)
-    femmesh.addNode(0.19994560398784245, 4.996000576005365, 18.558422753026186, 805)
-    femmesh.addNode(0.20746042103643758, 4.995694163347411, 20.342243079293727, 806)
-    femmesh.addNode(0.22886808258542365, 4.994759193472061, 22.132307182923796, 807)
-    femmesh.addNode(0.1879356238931893, 4.996466771757006, 23.914083341031173, 808)
-    femmesh.addNode(0.18425025744476828, 4.996604031002611, 25.682143742102433, 809)
-    femmesh.addNode(0.21054647782334904, 4.995565051190524, 27.460580040148194, 810)
-    femmesh.addNode(0.21182694563324922, 4.995510919325839, 29.249185479644648, 811)
-    femmesh.addNode(0.18970156158399482, 4.99640003577902, 31.03588319856755, 812)
-    femmesh.addNode(0.20921970831636297, 4.9956207936203505, 32.82416600668767, 813)
-    femmesh.addNode(0.206087542886734, 4.99575098705559, 34.60860991084874, 814)
-    femmesh.addNode(0.17887260318296822, 4.996799434821309, 36.367663184443494, 815)
-    femmesh.addNode(0.20195197165146272, 4.995919875372911, 38.120237532894166, 816)
-    femmesh.addNode(0.08917555434915041, 4.999204708801843, 39.917564828867015, 817)
-    femmesh.addNode(-4.709952238385686, -1.6781984126216014, 8.201217323318724, 818)
-    femmesh.addNode(0.2843169326740686, -4.991909843115639, 13.281598289856161, 819)
-    femmesh.addNode(-2.146031298070981, 4.516032514021547, 42.2547526765485, 820)
-    femmesh.addNode(-0.019062058033274244, -4.999963663662321, 40.15205186607451, 821)
-    femmesh.addNode(-0.2307308017888257, -4.994673492542419, 32.237643268743426, 822)
-    femmesh.addNode(-3.6715813366664065, -3.3940374906949575, 8.13409970289553, 823)
-    femmesh.addNode(-0.603113131198862, -4.9634921729539885, 9.639745760976115, 824)
-    femmesh.addNode(-0.19804069268907581, 4.996076448978661, 11.883549286864364, 825)
-    femmesh.addNode(-4.9960095221299285, 0.19972194367942342, 42.03835718789331, 826)
-    femmesh.addNode(-2.8795655920166663, 4.087554525786011, 8.420839948310283, 827)
-    femmesh.addNode(-0.03617733224807498, -4.999869118350141, 24.387315562271326, 828)
-    femmesh.addNode(0.023076887978302867, -4.999946745440519, 11.555769798326441, 829)
-    femmesh.addNode(0.21043212074313095, -4.995569869650463, 15.021317577766991, 830)
-    femmesh.addNode(-0.05180979382021087, -4.99973156732082, 22.406145220095947, 831)
-    femmesh.addNode(-0.17928463309911047, -4.996784668197592, 34.50834977515199, 832)
-    femmesh.addNode(-0.9060318191150205, -4.917225472026997, 29.93150312415969, 833)
-    femmesh.addNode(0.03977709676922876, -4.99984177575377, 18.56167194581934, 834)
-    femmesh.addNode(0.15903266832381596, -4.997470221062433, 38.30937460474619, 835)
-    femmesh.addNode(-4.738655175294533, -1.59535172600099, 42.00259883114803, 836)
-    femmesh.addNode(-4.986501202540683, 0.36715903510647274, 8.291405735811534, 837)
-    femmesh.addNode(-4.613232925182947, 1.9282328640514323, 42.17360635818143, 838)
-    femmesh.addNode(-4.23594495390373, -2.656458233719763, 9.736108440252462, 839)
-    femmesh.addNode(-1.9984581211295518, 4.583248317306333, 11.662309789315483, 840)
-    femmesh.addNode(-1.3095858324884146, -4.8254517868636535, 27.765310196515227, 841)
-    femmesh.addNode(-1.7616801009394203, -4.679367822895959, 40.448231764630435, 842)
-    femmesh.addNode(-2.768046857211941, -4.163882394626329, 9.645729611502905, 843)
-    femmesh.addNode(-4.381679041850042, 2.408503430392429, 8.482752954569845, 844)
-    femmesh.addNode(-1.6066768009335408, -4.734827310192206, 21.41939463092771, 845)
-    femmesh.addNode(-1.5572211824222584, -4.751322151676881, 19.508037246131945, 846)
-    femmesh.addNode(-1.466731421505429, -4.780031269476034, 37.52024874718349, 847)
-    femmesh.addNode(-1.427706431372365, 4.791832044825652, 13.573513766464604, 848)
-    femmesh.addNode(0.1457116767734639, -4.997876359740391, 16.707844566433568, 849)
-    femmesh.addNode(-1.7298081720272631, -4.691243298741571, 35.626838337017574, 850)
-    femmesh.addNode(-1.4297793128537586, 4.791213950194192, 15.68485997768997, 851)
-    femmesh.addNode(-1.3752828317993337, 4.807140223933352, 17.611100740313567, 852)
-    femmesh.addNode(-1.352524780426624, 4.813592911571554, 19.397591465385222, 853)
-    femmesh.addNode(-1.361203290080382, 4.811145976072057, 21.163013507812902, 854)
-    femmesh.addNode(-1.3669056210960853, 4.8095289814092945, 23.011056770197612, 855)
-    femmesh.addNode(-1.3599187710654739, 4.81150921604685, 24.76026701935402, 856)
-    femmesh.addNode(-1.3563614824720278, 4.812513223760147, 26.498391516744718, 857)
-    femmesh.addNode(-1.3585004294415846, 4.811909868566434, 28.31871074460301, 858)
-    femmesh.addNode(-1.3512802487841957, 4.813942426872773, 30.14825587289198, 859)
-    femmesh.addNode(-1.3614107696243387, 4.811087269666896, 31.881048112823358, 860)
-    femmesh.addNode(-1.38057953573028, 4.805621723099184, 33.69896657562533, 861)
-    femmesh.addNode(-1.3763959792228135, 4.806821622275916, 35.49241867695234, 862)
-    femmesh.addNode(-1.362491178767919, 4.810781411348847, 37.16486548566059, 863)
-    femmesh.addNode(-1.3511584876349436, 4.813976603733347, 38.88726398656678, 864)
-    femmesh.addNode(-1.5912835945460602, 4.740022839789758, 40.63855443667234, 865)
-    femmesh.addNode(-1.145446561674209, -4.867027036533569, 39.06624822865136, 866)
-    femmesh.addNode(-1.9813560321971744, -4.590667519400188, 33.57558185033049, 867)
-    femmesh.addNode(-1.5246247571513707, -4.761881912635079, 25.57039506986808, 868)
-    femmesh.addNode(-4.364351864520154, -2.439760808493213, 40.35550473524809, 869)
-    femmesh.addNode(-3.233865155937266, -3.813412664951807, 40.38260691572195, 870)
-    femmesh.addNode(-3.495429098444199, 3.575188864626535, 10.45896742161176, 871)
-    femmesh.addNode(-2.3022976030457727, -4.4384035133153095, 31.405611061167104, 872)
-    femmesh.addNode(-4.837727573793916, 1.2634840409573966, 40.23439525395439, 873)
-    femmesh.addNode(-1.0900061692564031, -4.879742467690583, 12.592785551015583, 874)
-    femmesh.addNode(-1.6255018737216145, -4.728397578305733, 23.539882425024665, 875)
-    femmesh.addNode(-1.842128676918748, -4.648285913933607, 11.191290493931968, 876)
-    femmesh.addNode(-4.946636088509635, -0.7285543273182156, 40.36220677995062, 877)
-    femmesh.addNode(-1.4998589086343501, -4.769740375973327, 17.589160320527885, 878)
-    femmesh.addNode(-4.947119315292115, -0.725265799733916, 9.887270684056224, 879)
-    femmesh.addNode(-3.1250083359018195, 3.903117074921548, 40.884416796980155, 880)
-    femmesh.addNode(-1.2818646308448767, -4.83288972232855, 14.081947803148877, 881)
-    femmesh.addNode(-3.0057201957535353, 3.99570345556816, 14.655571822891236, 882)
-    femmesh.addNode(-2.92707121159038, -4.053671684075909, 26.87523297448566, 883)
-    femmesh.addNode(-1.4076135185533003, -4.7977728356380105, 15.762785655110092, 884)
-    femmesh.addNode(-4.651936525797673, -1.8328902203758615, 11.435527048023866, 885)
-    femmesh.addNode(-3.5160332105121093, -3.554927631130612, 11.390079280886663, 886)
-    femmesh.addNode(-3.0590794931370784, -3.9550009677202604, 24.691695955586255, 887)
-    femmesh.addNode(-3.2961462823307053, 3.75971005337878, 12.682087941231742, 888)
-    femmesh.addNode(-2.673685879792325, -4.225092166592244, 29.142314836016105, 889)
-    femmesh.addNode(-2.8746382656852907, 4.09102124676197, 16.590232226053836, 890)
-    femmesh.addNode(-4.796917418214253, 1.4105258887495478, 10.085238119383327, 891)
-    femmesh.addNode(-3.0485822604664548, -3.9630980559619315, 20.467344737238193, 892)
-    femmesh.addNode(-3.1115883697804154, -3.9138239379214874, 22.560700359988935, 893)
-    femmesh.addNode(-3.0178598992104098, -3.986542565775228, 37.001200545488615, 894)
-    femmesh.addNode(-2.777507565447234, 4.157577626922121, 18.44737125432974, 895)
-    femmesh.addNode(-2.7859941289363555, 4.151895556674344, 20.241463085736335, 896)
-    femmesh.addNode(-2.8486230431368167, 4.109178355597375, 22.03511651670347, 897)
-    femmesh.addNode(-2.7961451411463316, 4.145066024762906, 23.829630838975927, 898)
-    femmesh.addNode(-2.7715671776687394, 4.161540024999079, 25.61703548718775, 899)
-    femmesh.addNode(-2.810153717409521, 4.135581710537158, 27.366206252311205, 900)
-    femmesh.addNode(-2.7994015598787847, 4.142867473930131, 29.184466782678673, 901)
-    femmesh.addNode(-2.7642653529594066, 4.166393771408099, 30.986890302072677, 902)
-    femmesh.addNode(-2.8446663211768937, 4.11191847209571, 32.77735528739681, 903)
-    femmesh.addNode(-2.863392784151182, 4.098900067538967, 34.56252383770614, 904)
-    femmesh.addNode(-2.7975591832964373, 4.144111800609845, 36.32039560635154, 905)
-    femmesh.addNode(-2.7991792036320184, 4.143017714897442, 38.022670124636655, 906)
-    femmesh.addNode(-3.326274346948905, -3.733081698654563, 34.98917531488802, 907)
-    femmesh.addNode(-4.179083343126631, 2.7450432439583783, 40.95936104118357, 908)
-    femmesh.addNode(-3.955884766481116, 3.0579365124741633, 39.26261717389748, 909)
-    femmesh.addNode(-2.593139235330335, -4.275000456864351, 12.869766384908905, 910)
-    femmesh.addNode(-2.9693173413617933, -4.022829169413999, 18.476448309117597, 911)
-    femmesh.addNode(-3.841787831525308, -3.2001041010479754, 38.64414815910396, 912)
-    femmesh.addNode(-3.59786657350825, -3.472082389464859, 32.80581319373918, 913)
-    femmesh.addNode(-4.682052379314146, -1.7545328487545455, 38.73993160455824, 914)
-    femmesh.addNode(-4.718225835990831, 1.6547945372730193, 38.2688518222417, 915)
-    femmesh.addNode(-4.487002494795993, 2.2060844525299874, 11.999000905593114, 916)
-    femmesh.addNode(-4.99559427292114, 0.2098519963152799, 11.547268943666717, 917)
-    femmesh.addNode(-4.999961498059521, -0.019621873569870465, 38.75793081394362, 918)
-    femmesh.addNode(-2.670712008103867, 4.226972601019529, 39.53369452481894, 919)
-    femmesh.addNode(-2.530803877191705, -4.312195697691773, 38.82406405388969, 920)
-    femmesh.addNode(-4.099021821065078, -2.8632184880711313, 19.427657859613596, 921)
-    femmesh.addNode(-4.134682249555515, -2.8114769597509683, 13.390023204128086, 922)
-    femmesh.addNode(-4.00739408100572, 2.9901158304521114, 37.27612650569759, 923)
-    femmesh.addNode(-4.243952785165201, 2.6436461104483207, 13.904405746969562, 924)
-    femmesh.addNode(-4.019137605693694, 2.974312173679616, 15.698828905124671, 925)
-    femmesh.addNode(-4.33444417780649, -2.4925075064038262, 36.59134733566233, 926)
-    femmesh.addNode(-4.041011971831691, -2.9445241115523157, 28.276789736155777, 927)
-    femmesh.addNode(-3.9197560529929847, 3.1041121895036032, 17.524847134829763, 928)
-    femmesh.addNode(-3.9490725452222293, 3.066728881491161, 19.29265397620976, 929)
-    femmesh.addNode(-3.964831310821908, 3.0463277362631604, 21.087717510038942, 930)
-    femmesh.addNode(-3.978573729133953, 3.0283578193214145, 22.872489395690444, 931)
-    femmesh.addNode(-3.967522814178502, 3.042821506262419, 24.665154854980383, 932)
-    femmesh.addNode(-3.9342998998617413, 3.085657838767593, 26.461102742819463, 933)
-    femmesh.addNode(-3.9117422645098063, 3.114204947662836, 28.23986586081518, 934)
-    femmesh.addNode(-3.9301899081525704, 3.090891018113659, 30.040957663445305, 935)
-    femmesh.addNode(-3.973394446173824, 3.0351501734041113, 31.843526752030037, 936)
-    femmesh.addNode(-4.011075828853751, 2.985175153183677, 33.63869715205996, 937)
-    femmesh.addNode(-4.023562214662955, 2.9683239554901237, 35.43151999917499, 938)
-    femmesh.addNode(-4.1192244529644935, -2.8340765526180416, 25.987395054295938, 939)
-    femmesh.addNode(-3.871424438736967, -3.1641859640593446, 30.573304778567813, 940)
-    femmesh.addNode(-4.211286012810423, -2.6953794015513455, 21.501309149598608, 941)
-    femmesh.addNode(-2.817855425384144, -4.130337855627932, 14.727765833006464, 942)
-    femmesh.addNode(-4.908972472900076, -0.9497311515946566, 12.967595287526338, 943)
-    femmesh.addNode(-4.743282451761067, 1.5815408887586566, 36.31485227375417, 944)
-    femmesh.addNode(-4.513381767871602, -2.1516005710735935, 34.24060158782659, 945)
-    femmesh.addNode(-2.86728617422877, -4.096177485788005, 16.5876238539587, 946)
-    femmesh.addNode(-4.010632465328837, -2.9857707929528576, 17.53762168877557, 947)
-    femmesh.addNode(-4.254669496477671, -2.6263639267516674, 23.747629565185807, 948)
-    femmesh.addNode(-4.985351488709603, 0.38245330959601115, 37.21686055074472, 949)
-    femmesh.addNode(-4.930743094181421, 0.8293205286149781, 13.382306842679668, 950)
-    femmesh.addNode(-4.901268424030993, -0.9887203020049422, 37.33173390792712, 951)
-    femmesh.addNode(-4.767023172540001, -1.5084727615925537, 18.39290496069713, 952)
-    femmesh.addNode(-4.670389044792361, -1.785347632894922, 32.07415591937206, 953)
-    femmesh.addNode(-4.04607641117985, -2.9375611780682935, 15.543210823505461, 954)
-    femmesh.addNode(-4.835395512030505, -1.272379755511401, 25.099699020543508, 955)
-    femmesh.addNode(-4.977738616519641, -0.4712942452535678, 35.58264421283958, 956)
-    femmesh.addNode(-4.696223357916799, 1.7162418747241506, 18.317553139269357, 957)
-    femmesh.addNode(-4.693297834213479, 1.724226040682331, 20.14162270512597, 958)
-    femmesh.addNode(-4.740506204003698, 1.589843051940175, 21.939771516711172, 959)
-    femmesh.addNode(-4.733457617939322, 1.610707602009812, 23.67348863147089, 960)
-    femmesh.addNode(-4.690877716968814, 1.7307993079630744, 25.574704459554674, 961)
-    femmesh.addNode(-4.691419075107072, 1.7293313915272286, 27.327451746298358, 962)
-    femmesh.addNode(-4.681814330822464, 1.7551679611095343, 29.041560363186868, 963)
-    femmesh.addNode(-4.702497953090176, 1.6989741025638692, 30.864988380221302, 964)
-    femmesh.addNode(-4.766126642876439, 1.5113030219196162, 32.691096490492725, 965)
-    femmesh.addNode(-4.829671245597828, 1.2939380431247587, 15.214841084065178, 966)
-    femmesh.addNode(-4.802094376672282, 1.392799194978388, 34.47374896322823, 967)
-    femmesh.addNode(-4.715871490276847, -1.6614921267324834, 16.627551878923168, 968)
-    femmesh.addNode(-4.806455321361856, -1.3776745783211275, 20.304305345644387, 969)
-    femmesh.addNode(-4.800861041559749, -1.3970444730336429, 27.288606174973282, 970)
-    femmesh.addNode(-4.915005057658458, -0.91800069890593, 14.85567923319535, 971)
-    femmesh.addNode(-4.806607883038358, -1.3771422071498352, 29.716024726249945, 972)
-    femmesh.addNode(-4.630123997488081, 1.8873133729947977, 16.738706384430657, 973)
-    femmesh.addNode(-4.963656763968784, -0.6017570352783108, 22.804441658087306, 974)
-    femmesh.addNode(-4.997773087278673, 0.1492118228325269, 17.04539327910152, 975)
-    femmesh.addNode(-4.995478908770573, 0.21258050716931684, 26.390735240774216, 976)
-    femmesh.addNode(-4.997909648756237, 0.14456535846912238, 19.12175521723329, 977)
-    femmesh.addNode(-4.992369819968228, 0.27612240160915685, 20.900553234271552, 978)
-    femmesh.addNode(-4.990112379610926, 0.31429037346662014, 24.65982495389454, 979)
-    femmesh.addNode(-4.996564711288057, 0.18531348011111026, 28.2521391473775, 980)
-    femmesh.addNode(-4.999800774694319, -0.04463421743559257, 31.50057255504089, 981)
-    femmesh.addNode(-4.992108945499974, -0.28079935231253333, 33.44803241039061, 982)
-    femmesh.addNode(-4.983449388378861, 0.4064876301517117, 29.86730637541477, 983)
-    femmesh.addNode(4.352342404632709, 0.6089123543689304, 49.24293707399806, 984)
-    femmesh.addNode(4.425636153919441, -0.31253798473341593, 0.8917370108088196, 985)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 0.8999999999999999, 986)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 2.7249999999999996, 987)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 4.55, 988)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 6.3, 989)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 8.075, 990)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 9.925, 991)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 11.7, 992)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 13.475, 993)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 15.225, 994)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 16.975, 995)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 18.799999999999997, 996)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 20.575, 997)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 22.375, 998)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 24.200000000000003, 999)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 25.975, 1000)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 27.75, 1001)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 29.575, 1002)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 31.375, 1003)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 33.150000000000006, 1004)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 34.975, 1005)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 36.775, 1006)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 38.525, 1007)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 40.325, 1008)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 42.1, 1009)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 43.875, 1010)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 45.625, 1011)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 47.375, 1012)
-    femmesh.addNode(4.0, -9.797174393178826e-16, 49.15, 1013)
-    femmesh.addNode(3.900906519636894, 0.884832371160988, 0.0, 1014)
-    femmesh.addNode(3.121721629353319, 2.5009706253428203, 0.0, 1015)
-    femmesh.addNode(1.6917383883412138, 3.624640840885159, 0.0, 1016)
-    femmesh.addNode(-0.0628292692472821, 3.9995065299266424, 0.0, 1017)
-    femmesh.addNode(-1.8159619989581868, 3.5640260967534716, 0.0, 1018)
-    femmesh.addNode(-3.2137656004485096, 2.381535358833421, 0.0, 1019)
-    femmesh.addNode(-3.9314843125295167, 0.7371777942493337, 0.0, 1020)
-    femmesh.addNode(-3.861526555333096, -1.0433660251595855, 0.0, 1021)
-    femmesh.addNode(-3.0497700440457924, -2.588223846277776, 0.0, 1022)
-    femmesh.addNode(-1.7031171662602917, -3.6193082098640774, 0.0, 1023)
-    femmesh.addNode(0.03769855373257295, -3.9998223484357993, 0.0, 1024)
-    femmesh.addNode(1.7822916895075833, -3.5809825932992476, 0.0, 1025)
-    femmesh.addNode(3.121721629353317, -2.5009706253428234, 0.0, 1026)
-    femmesh.addNode(3.8952699899085155, -0.9093248625865865, 0.0, 1027)
-    femmesh.addNode(3.900906519636894, 0.8848323711609879, 50.0, 1028)
-    femmesh.addNode(3.121721629353319, 2.5009706253428203, 50.0, 1029)
-    femmesh.addNode(1.6917383883412138, 3.624640840885159, 50.0, 1030)
-    femmesh.addNode(-0.0628292692472821, 3.9995065299266424, 50.0, 1031)
-    femmesh.addNode(-1.8159619989581852, 3.5640260967534725, 50.0, 1032)
-    femmesh.addNode(-3.2137656004485096, 2.381535358833421, 50.0, 1033)
-    femmesh.addNode(-3.9314843125295167, 0.7371777942493337, 50.0, 1034)
-    femmesh.addNode(-3.861526555333096, -1.0433660251595855, 50.0, 1035)
-    femmesh.addNode(-3.0497700440457924, -2.588223846277776, 50.0, 1036)
-    femmesh.addNode(-1.7031171662602917, -3.6193082098640774, 50.0, 1037)
-    femmesh.addNode(0.03769855373257295, -3.9998223484357993, 50.0, 1038)
-    femmesh.addNode(1.7822916895075833, -3.5809825932992476, 50.0, 1039)
-    femmesh.addNode(3.121721629353317, -2.5009706253428234, 50.0, 1040)
-    femmesh.addNode(3.8952699899085155, -0.9093248625865865, 50.0, 1041)
-    femmesh.addNode(4.911436253643443, 0.9369065729286224, 0.0, 1042)
-    femmesh.addNode(4.238389680425416, 2.6525559215336703, 0.0, 1043)
-    femmesh.addNode(3.0396514884730275, 3.9699519932391762, 0.0, 1044)
-    femmesh.addNode(1.4702016261615194, 4.7789650739916505, 0.0, 1045)
-    femmesh.addNode(-0.3453001285720294, 4.9880625318061265, 0.0, 1046)
-    femmesh.addNode(-2.1146729854265156, 4.530801051106449, 0.0, 1047)
-    femmesh.addNode(-3.5906314888159434, 3.4795639829615723, 0.0, 1048)
-    femmesh.addNode(-4.588773128419906, 1.985739453173903, 0.0, 1049)
-    femmesh.addNode(-4.993684783030087, 0.2512215908988483, 0.0, 1050)
-    femmesh.addNode(-4.745480724951473, -1.5749325982765237, 0.0, 1051)
-    femmesh.addNode(-3.8223576571154587, -3.223287443137956, 0.0, 1052)
-    femmesh.addNode(-2.353519660826662, -4.4114561321747665, 0.0, 1053)
-    femmesh.addNode(-0.5954858004743524, -4.964413022849068, 0.0, 1054)
-    femmesh.addNode(1.228228855962129, -4.846798312018147, 0.0, 1055)
-    femmesh.addNode(2.9134523983428773, -4.063470822165472, 0.0, 1056)
-    femmesh.addNode(4.230035528339209, -2.665858103685946, 0.0, 1057)
-    femmesh.addNode(4.917226024976648, -0.906028818135689, 0.0, 1058)
-    femmesh.addNode(4.911436253643443, 0.9369065729286223, 50.0, 1059)
-    femmesh.addNode(4.238389680425416, 2.6525559215336703, 50.0, 1060)
-    femmesh.addNode(3.0396514884730275, 3.9699519932391762, 50.0, 1061)
-    femmesh.addNode(1.4702016261615205, 4.7789650739916505, 50.0, 1062)
-    femmesh.addNode(-0.3453001285720283, 4.9880625318061265, 50.0, 1063)
-    femmesh.addNode(-2.1146729854265156, 4.530801051106449, 50.0, 1064)
-    femmesh.addNode(-3.5906314888159434, 3.4795639829615723, 50.0, 1065)
-    femmesh.addNode(-4.588773128419906, 1.985739453173903, 50.0, 1066)
-    femmesh.addNode(-4.993684783030087, 0.2512215908988483, 50.0, 1067)
-    femmesh.addNode(-4.745480724951473, -1.5749325982765237, 50.0, 1068)
-    femmesh.addNode(-3.8223576571154587, -3.223287443137956, 50.0, 1069)
-    femmesh.addNode(-2.353519660826662, -4.4114561321747665, 50.0, 1070)
-    femmesh.addNode(-0.5954858004743524, -4.964413022849068, 50.0, 1071)
-    femmesh.addNode(1.228228855962129, -4.846798312018147, 50.0, 1072)
-    femmesh.addNode(2.9134523983428773, -4.063470822165472, 50.0, 1073)
-    femmesh.addNode(4.230035528339209, -2.665858103685946, 50.0, 1074)
-    femmesh.addNode(4.917226024976648, -0.906028818135689, 50.0, 1075)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 0.9249999999999999, 1076)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 2.6999999999999997, 1077)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 4.449999999999999, 1078)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 6.2749999999999995, 1079)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 8.05, 1080)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 9.775, 1081)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 11.575, 1082)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 13.375, 1083)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 15.125, 1084)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 16.825, 1085)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 18.549999999999997, 1086)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 20.375, 1087)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 22.15, 1088)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 23.9, 1089)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 25.700000000000003, 1090)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 27.475, 1091)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 29.224999999999998, 1092)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 31.025, 1093)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 32.825, 1094)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 34.55, 1095)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 36.325, 1096)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 38.150000000000006, 1097)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 39.900000000000006, 1098)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 41.7, 1099)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 43.525, 1100)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 45.25, 1101)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 47.125, 1102)
-    femmesh.addNode(5.0, -1.2246467991473533e-15, 49.075, 1103)
-    femmesh.addNode(3.9312453035968553, -0.7384513274059903, 0.7266101280266689, 1104)
-    femmesh.addNode(3.660442425562362, -1.6128115975349169, 0.7266101280266689, 1105)
-    femmesh.addNode(3.948707556574508, -0.6385206595337206, 2.341915424352792, 1106)
-    femmesh.addNode(3.948707556574508, -0.6385206595337206, 3.2669154243527925, 1107)
-    femmesh.addNode(3.9211674421287883, -0.7902188878970023, 4.07207115581365, 1108)
-    femmesh.addNode(3.9211674421287883, -0.7902188878970023, 4.97207115581365, 1109)
-    femmesh.addNode(3.7447431059632947, -1.4060224288183936, 3.6889865801664428, 1110)
-    femmesh.addNode(3.918091341544795, -0.8053323781592967, 5.835531731228598, 1111)
-    femmesh.addNode(3.918091341544795, -0.8053323781592967, 6.685531731228598, 1112)
-    femmesh.addNode(3.6817758368745817, -1.5634982209796324, 5.357602887042248, 1113)
-    femmesh.addNode(3.9220633841620174, -0.785760021008694, 7.631483610125954, 1114)
-    femmesh.addNode(3.9220633841620174, -0.785760021008694, 8.556483610125955, 1115)
-    femmesh.addNode(3.683551150024074, -1.5593110418246645, 7.167015341354553, 1116)
-    femmesh.addNode(3.9213659194439905, -0.7892333785536363, 9.442487675954741, 1117)
-    femmesh.addNode(3.9213659194439905, -0.7892333785536363, 10.367487675954742, 1118)
-    femmesh.addNode(3.6899244131097935, -1.54416897570711, 8.998971286080696, 1119)
-    femmesh.addNode(3.9215175615786477, -0.7884795585367166, 11.23674745241917, 1120)
-    femmesh.addNode(3.9215175615786477, -0.7884795585367166, 12.08674745241917, 1121)
-    femmesh.addNode(3.6888527331428342, -1.5467273558014816, 10.75423512837391, 1122)
-    femmesh.addNode(3.920315762583027, -0.7944333336681306, 12.995485709464532, 1123)
-    femmesh.addNode(3.920315762583027, -0.7944333336681306, 13.920485709464531, 1124)
-    femmesh.addNode(3.686798166421391, -1.5516182778221808, 12.5322331618837, 1125)
-    femmesh.addNode(3.9211982651610806, -0.7900659246529576, 14.828621130119096, 1126)
-    femmesh.addNode(3.9211982651610806, -0.7900659246529576, 15.653621130119099, 1127)
-    femmesh.addNode(3.686170165196174, -1.5531096269155034, 14.34910683958363, 1128)
-    femmesh.addNode(3.9181019708690896, -0.8052806627951239, 16.511751990643333, 1129)
-    femmesh.addNode(3.9181019708690896, -0.8052806627951239, 17.43675199064333, 1130)
-    femmesh.addNode(3.68185745986059, -1.5633059986032563, 16.115373120762428, 1131)
-    femmesh.addNode(3.919580518692829, -0.7980529791208428, 18.36323643366235, 1132)
-    femmesh.addNode(3.919580518692829, -0.7980529791208428, 19.26323643366235, 1133)
-    femmesh.addNode(3.6786648808260254, -1.5708038370774515, 17.899988424305683, 1134)
-    femmesh.addNode(3.920682930300643, -0.792619303353863, 20.139195762303302, 1135)
-    femmesh.addNode(3.920682930300643, -0.792619303353863, 21.014195762303302, 1136)
-    femmesh.addNode(3.6837200593077037, -1.558911968218234, 19.702432195965656, 1137)
-    femmesh.addNode(3.919982348627834, -0.7960768721965322, 21.89488518605082, 1138)
-    femmesh.addNode(3.919982348627834, -0.7960768721965322, 22.819885186050822, 1139)
-    femmesh.addNode(3.684505496372142, -1.5570546705891464, 21.459080948354128, 1140)
-    femmesh.addNode(3.919634508932364, -0.7977877639990126, 23.75921324063689, 1141)
-    femmesh.addNode(3.919634508932364, -0.7977877639990126, 24.659213240636888, 1142)
-    femmesh.addNode(3.6824494250623885, -1.5619110832111043, 23.27909842668771, 1143)
-    femmesh.addNode(3.9203391601049438, -0.7943178644268695, 25.535918895748058, 1144)
-    femmesh.addNode(3.9203391601049438, -0.7943178644268695, 26.410918895748058, 1145)
-    femmesh.addNode(3.6831498964259595, -1.5602585812798613, 25.095132136384944, 1146)
-    femmesh.addNode(3.9190611841096965, -0.8005994224359042, 27.2853946569254, 1147)
-    femmesh.addNode(3.9190611841096965, -0.8005994224359042, 28.1853946569254, 1148)
-    femmesh.addNode(3.682029651856204, -1.5629003944115185, 26.846313552673458, 1149)
-    femmesh.addNode(3.9183652579207697, -0.8039985730829998, 29.110851890847734, 1150)
-    femmesh.addNode(3.9183652579207697, -0.8039985730829998, 30.03585189084773, 1151)
-    femmesh.addNode(3.6781580985593423, -1.5719901405550618, 28.64624654777313, 1152)
-    femmesh.addNode(3.919216787310934, -0.799837342251638, 30.951437953541163, 1153)
-    femmesh.addNode(3.919216787310934, -0.799837342251638, 31.826437953541163, 1154)
-    femmesh.addNode(3.6784637039489714, -1.5712748896135311, 30.487289844388897, 1155)
-    femmesh.addNode(3.9195906737478037, -0.7980031016664275, 32.68484494938252, 1156)
-    femmesh.addNode(3.9195906737478037, -0.7980031016664275, 33.58484494938253, 1157)
-    femmesh.addNode(3.6808632220000974, -1.5656455348919374, 32.26128290292369, 1158)
-    femmesh.addNode(3.9187459863948986, -0.8021408193789134, 34.50214584217713, 1159)
-    femmesh.addNode(3.9187459863948986, -0.8021408193789134, 35.427145842177126, 1160)
-    femmesh.addNode(3.6799423398070954, -1.5678087816105255, 34.036990791559646, 1161)
-    femmesh.addNode(3.9196470793440303, -0.7977260014502551, 36.34078425074061, 1162)
-    femmesh.addNode(3.9196470793440303, -0.7977260014502551, 37.21578425074061, 1163)
-    femmesh.addNode(3.6800531679566677, -1.5675486215783205, 35.86793009291773, 1164)
-    femmesh.addNode(3.9212005321718846, -0.7900546731049235, 38.07174102451114, 1165)
-    femmesh.addNode(3.9212005321718846, -0.7900546731049235, 38.94674102451114, 1166)
-    femmesh.addNode(3.684868764537465, -1.55619477834111, 37.63752527525175, 1167)
-    femmesh.addNode(3.920177438758285, -0.7951156196746053, 39.83469817899344, 1168)
-    femmesh.addNode(3.920177438758285, -0.7951156196746053, 40.759698178993446, 1169)
-    femmesh.addNode(3.6859042620211735, -1.5537405739743522, 39.381439203504584, 1170)
-    femmesh.addNode(3.920496473297513, -0.7935410530412157, 41.66281179576575, 1171)
-    femmesh.addNode(3.920496473297513, -0.7935410530412157, 42.51281179576574, 1172)
-    femmesh.addNode(3.68452123430659, -1.5570174289146044, 41.17250997475919, 1173)
-    femmesh.addNode(3.9216223709207116, -0.7879581079563913, 43.410616658293335, 1174)
-    femmesh.addNode(3.9216223709207116, -0.7879581079563913, 44.33561665829333, 1175)
-    femmesh.addNode(3.6873573920148344, -1.5502888322998265, 42.973428454059075, 1176)
-    femmesh.addNode(3.9297367172436926, -0.7464377624067307, 45.18996139300988, 1177)
-    femmesh.addNode(3.9297367172436926, -0.7464377624067307, 46.014961393009884, 1178)
-    femmesh.addNode(3.705695433799577, -1.5059287340100003, 44.725578051303216, 1179)
-    femmesh.addNode(3.9279925773486957, -0.7555622491188616, 46.97316632834877, 1180)
-    femmesh.addNode(3.9279925773486957, -0.7555622491188616, 47.898166328348765, 1181)
-    femmesh.addNode(3.7179991154191767, -1.4752906756779225, 46.53812772135864, 1182)
-    femmesh.addNode(3.8952699899085155, -0.9093248625865865, 49.15, 1183)
-    femmesh.addNode(3.900906519636894, 0.884832371160988, 0.8999999999999999, 1184)
-    femmesh.addNode(3.319879056766324, 2.2312335262012226, 0.7553131899289663, 1185)
-    femmesh.addNode(2.7257272850839556, 2.9275263905469493, 0.7553131899289663, 1186)
-    femmesh.addNode(2.0732681449019132, 3.4207541857512913, 0.7986337619168702, 1187)
-    femmesh.addNode(1.2413405889918843, 3.8025088483948704, 0.7986337619168702, 1188)
-    femmesh.addNode(2.3519915938528215, 3.235449820727508, 1.5539469518458366, 1189)
-    femmesh.addNode(0.3720729191014232, 3.9826576231043695, 0.756727041236569, 1190)
-    femmesh.addNode(-0.5181406780677354, 3.966299312675672, 0.756727041236569, 1191)
-    femmesh.addNode(-1.3837744347206429, 3.7530212248019015, 0.7459794219473314, 1192)
-    femmesh.addNode(-2.2112052502490673, 3.3332523668739755, 0.7459794219473314, 1193)
-    femmesh.addNode(-0.967832555096569, 3.8811467564748496, 1.5027064631839004, 1194)
-    femmesh.addNode(-2.9249176270830683, 2.7285265024878815, 0.7535406442624768, 1195)
-    femmesh.addNode(-3.4686152106674286, 1.9921617706216908, 0.7535406442624768, 1196)
-    femmesh.addNode(-2.583375007377944, 3.0538784473608325, 1.4995200662098083, 1197)
-    femmesh.addNode(-3.822800044276128, 1.1773698745434396, 0.7542630508344568, 1198)
-    femmesh.addNode(-3.9885401484526866, 0.30256814799482673, 0.7542630508344568, 1199)
-    femmesh.addNode(-3.6657707482482293, 1.60066386892677, 1.5078036950969336, 1200)
-    femmesh.addNode(-3.957421679828723, -0.5820770121054482, 0.7560349137253253, 1201)
-    femmesh.addNode(-3.726070919505194, -1.4547836618610057, 0.7560349137253253, 1202)
-    femmesh.addNode(-3.3181908436407563, -2.2337433883905837, 0.7696659859512108, 1203)
-    femmesh.addNode(-2.7691926593258045, -2.8864462606353993, 0.7696659859512108, 1204)
-    femmesh.addNode(-3.557823628098317, -1.828083978198302, 1.525700899676536, 1205)
-    femmesh.addNode(-2.071532133032693, -3.421805754541456, 0.7760371956030514, 1206)
-    femmesh.addNode(-1.2989951718250035, -3.783201229590534, 0.7760371956030514, 1207)
-    femmesh.addNode(-2.438514853346783, -3.170748383269653, 1.5457031815542623, 1208)
-    femmesh.addNode(-0.4075856518906673, -3.979180058300059, 0.8099271105709318, 1209)
-    femmesh.addNode(0.5325971086739677, -3.9643839773452987, 0.8099271105709318, 1210)
-    femmesh.addNode(-0.8206315127167909, -3.9149155700137586, 1.5859643061739832, 1211)
-    femmesh.addNode(1.3880931553823463, -3.751426047782454, 0.7975973712628087, 1212)
-    femmesh.addNode(2.16245057284099, -3.3650865546103974, 0.7975973712628087, 1213)
-    femmesh.addNode(0.9620620972084282, -3.882581167356958, 1.6075244818337406, 1214)
-    femmesh.addNode(2.773605055902466, -2.88220661887247, 0.6106191890041915, 1215)
-    femmesh.addNode(3.328589257533622, -2.218218554297969, 0.6106191890041915, 1216)
-    femmesh.addNode(2.4486101659395403, -3.1629587817828955, 1.4082165602670003, 1217)
-    femmesh.addNode(3.6533850171935462, -1.6287350662847873, 48.74816632834876, 1218)
-    femmesh.addNode(3.920332912090687, 0.7943487007470665, 3.0864810416408, 1219)
-    femmesh.addNode(3.920332912090687, 0.7943487007470665, 2.1614810416408003, 1220)
-    femmesh.addNode(3.9223424618125056, 0.784365738837829, 6.743444858913238, 1221)
-    femmesh.addNode(3.9223424618125056, 0.784365738837829, 5.893444858913238, 1222)
-    femmesh.addNode(3.923027003299607, 0.7809347804920095, 10.409535104733333, 1223)
-    femmesh.addNode(3.923027003299607, 0.7809347804920095, 9.484535104733332, 1224)
-    femmesh.addNode(3.9255157500244984, 0.7683268160812808, 13.933399994009013, 1225)
-    femmesh.addNode(3.9255157500244984, 0.7683268160812808, 13.008399994009014, 1226)
-    femmesh.addNode(3.9185902211433477, 0.8029014128519955, 17.45127243551861, 1227)
-    femmesh.addNode(3.9185902211433477, 0.8029014128519955, 16.526272435518614, 1228)
-    femmesh.addNode(3.92491049571358, 0.7714127304092022, 21.018941473294447, 1229)
-    femmesh.addNode(3.92491049571358, 0.7714127304092022, 20.143941473294447, 1230)
-    femmesh.addNode(3.9255595483943706, 0.7681030087233006, 24.65683393656876, 1231)
-    femmesh.addNode(3.9255595483943706, 0.7681030087233006, 23.756833936568757, 1232)
-    femmesh.addNode(3.924626581925405, 0.7728558678333947, 28.236611813935994, 1233)
-    femmesh.addNode(3.924626581925405, 0.7728558678333947, 27.336611813935995, 1234)
-    femmesh.addNode(3.9315719834807332, 0.7367100777845869, 31.81701749062497, 1235)
-    femmesh.addNode(3.9315719834807332, 0.7367100777845869, 30.94201749062497, 1236)
-    femmesh.addNode(3.9202079016116738, 0.7949654131730487, 35.39808587221561, 1237)
-    femmesh.addNode(3.9202079016116738, 0.7949654131730487, 34.47308587221561, 1238)
-    femmesh.addNode(3.9224915083780885, 0.7836200397525508, 38.959918266910954, 1239)
-    femmesh.addNode(3.9224915083780885, 0.7836200397525508, 38.084918266910954, 1240)
-    femmesh.addNode(3.916524379865741, 0.812918680999074, 42.54351297685102, 1241)
-    femmesh.addNode(3.916524379865741, 0.812918680999074, 41.69351297685102, 1242)
-    femmesh.addNode(3.9199534222284798, 0.7962192961485115, 46.06008398976013, 1243)
-    femmesh.addNode(3.9199534222284798, 0.7962192961485115, 45.23508398976013, 1244)
-    femmesh.addNode(3.900906519636894, 0.884832371160988, 49.15, 1245)
-    femmesh.addNode(2.9076776850740096, 2.746891057126702, 49.253961569163266, 1246)
-    femmesh.addNode(3.4560014900144633, 2.0139646722367823, 49.253961569163266, 1247)
-    femmesh.addNode(-0.44654916973344755, 3.97499608037673, 49.169390546043275, 1248)
-    femmesh.addNode(0.4438146599008191, 3.9753023215419883, 49.169390546043275, 1249)
-    femmesh.addNode(-3.454333298025658, 2.01682459974862, 49.22187216253134, 1250)
-    femmesh.addNode(-2.905403019728173, 2.749296872466561, 49.22187216253134, 1251)
-    femmesh.addNode(-3.727211879584755, -1.451857983647946, 49.197119067732345, 1252)
-    femmesh.addNode(-3.957877432007905, -0.5789699760803776, 49.197119067732345, 1253)
-    femmesh.addNode(-1.3224727418448743, -3.7750583898897907, 49.179777724879614, 1254)
-    femmesh.addNode(-2.0927496739204243, -3.408870605098697, 49.179777724879614, 1255)
-    femmesh.addNode(2.057746173257787, -3.4301138008006284, 49.23644647415138, 1256)
-    femmesh.addNode(1.2718533100091463, -3.7924120501099003, 49.23644647415138, 1257)
-    femmesh.addNode(3.2765489851524787, -2.294390278025136, 49.12731864908973, 1258)
-    femmesh.addNode(2.7063999406715356, -2.9454030897541186, 49.12731864908973, 1259)
-    femmesh.addNode(2.274725321768004, -3.290231710762549, 48.36376512324111, 1260)
-    femmesh.addNode(3.3641740310633845, -2.163869933410679, 47.87548497743849, 1261)
-    femmesh.addNode(3.8158899701597067, 1.1995764817778616, 48.403961569163265, 1262)
-    femmesh.addNode(0.7999820625023858, 3.919187249886694, 1.5553608031534392, 1263)
-    femmesh.addNode(-3.99787149588846, -0.13047414442167704, 1.510297964559782, 1264)
-    femmesh.addNode(3.9125689664287533, 0.8317476077144066, 4.053542442657025, 1265)
-    femmesh.addNode(3.6694688145942824, 1.5921678990357873, 3.4900234842978257, 1266)
-    femmesh.addNode(3.9125689664287533, 0.8317476077144066, 4.953542442657025, 1267)
-    femmesh.addNode(3.673510266235239, 1.5828210018395334, 5.396987301570263, 1268)
-    femmesh.addNode(3.9224426718321714, 0.7838644565166205, 8.580536185998895, 1269)
-    femmesh.addNode(3.9224426718321714, 0.7838644565166205, 7.655536185998894, 1270)
-    femmesh.addNode(3.922775928781867, 0.7821949965127357, 12.149710204908025, 1271)
-    femmesh.addNode(3.922775928781867, 0.7821949965127357, 11.299710204908024, 1272)
-    femmesh.addNode(3.921515795525943, 0.7884883419813695, 15.642293864041754, 1273)
-    femmesh.addNode(3.921515795525943, 0.7884883419813695, 14.817293864041753, 1274)
-    femmesh.addNode(3.9209031652645283, 0.7915291331458384, 19.24918475933832, 1275)
-    femmesh.addNode(3.9209031652645283, 0.7915291331458384, 18.349184759338318, 1276)
-    femmesh.addNode(3.923184802534105, 0.7801416571145502, 22.8476419807783, 1277)
-    femmesh.addNode(3.923184802534105, 0.7801416571145502, 21.9226419807783, 1278)
-    femmesh.addNode(3.926044085876863, 0.7656225151804942, 26.435055955897035, 1279)
-    femmesh.addNode(3.926044085876863, 0.7656225151804942, 25.560055955897035, 1280)
-    femmesh.addNode(3.9244019789328854, 0.7739955476277974, 30.065360500233606, 1281)
-    femmesh.addNode(3.9244019789328854, 0.7739955476277974, 29.140360500233605, 1282)
-    femmesh.addNode(3.9310401254150684, 0.7395427860351848, 33.59465024844104, 1283)
-    femmesh.addNode(3.9310401254150684, 0.7395427860351848, 32.694650248441036, 1284)
-    femmesh.addNode(3.9203611108246115, 0.794209519417904, 37.17769290219539, 1285)
-    femmesh.addNode(3.9203611108246115, 0.794209519417904, 36.30269290219539, 1286)
-    femmesh.addNode(3.92000472411745, 0.7959666845395448, 40.80341208986151, 1287)
-    femmesh.addNode(3.92000472411745, 0.7959666845395448, 39.878412089861506, 1288)
-    femmesh.addNode(3.9143378753666593, 0.823382655555743, 44.37301947332597, 1289)
-    femmesh.addNode(3.9143378753666593, 0.823382655555743, 43.448019473325964, 1290)
-    femmesh.addNode(3.69464958405622, 1.5328289046834942, 19.693126232632764, 1291)
-    femmesh.addNode(3.9369304228129187, 0.7075159686749793, 47.75414268004703, 1292)
-    femmesh.addNode(3.9369304228129187, 0.7075159686749793, 46.829142680047035, 1293)
-    femmesh.addNode(1.358982973778071, 3.7620692812574985, 49.17104567396785, 1294)
-    femmesh.addNode(2.178637181693738, 3.3546296413377092, 49.17104567396785, 1295)
-    femmesh.addNode(-2.1934461564601406, 3.3449654645018736, 49.222710191496134, 1296)
-    femmesh.addNode(-1.3637945131507752, 3.760327715226406, 49.222710191496134, 1297)
-    femmesh.addNode(-3.9876548630501065, 0.31402021144002157, 49.20524991534495, 1298)
-    femmesh.addNode(-3.8194034012631985, 1.1883423994872477, 49.20524991534495, 1299)
-    femmesh.addNode(-2.772867585036519, -2.8829161201557256, 49.17591711015742, 1300)
-    femmesh.addNode(-3.3210338165137085, -2.229514384248819, 49.17591711015742, 1301)
-    femmesh.addNode(0.45434586279590156, -3.9741124590228, 49.21934799139072, 1302)
-    femmesh.addNode(-0.48594587856076554, -3.9703723506882582, 49.21934799139072, 1303)
-    femmesh.addNode(3.7041352819601934, 1.509762170985112, 26.92166776983303, 1304)
-    femmesh.addNode(3.6474966928777603, 1.641879372988711, 1.2614810416408004, 1305)
-    femmesh.addNode(3.9312453035968553, -0.7384513274059903, 1.6266101280266687, 1306)
-    femmesh.addNode(3.6945781546503276, 1.5330010630069966, 10.859245309641356, 1307)
-    femmesh.addNode(3.697038820498783, 1.5270572876368997, 14.350693858050768, 1308)
-    femmesh.addNode(3.6822232355355253, 1.5624442529838583, 17.900457194856934, 1309)
-    femmesh.addNode(3.6990845005673556, 1.5220952196437505, 21.491583454072746, 1310)
-    femmesh.addNode(3.705960722818686, 1.5052757624187014, 25.116889892465792, 1311)
-    femmesh.addNode(3.7009063310049353, 1.5176601494167223, 28.7269723141696, 1312)
-    femmesh.addNode(3.7275846498984784, 1.450900643683515, 32.261667739066006, 1313)
-    femmesh.addNode(3.6843153762689127, 1.5575044809529313, 35.800778774411, 1314)
-    femmesh.addNode(3.6881124495430146, 1.548491704700359, 39.43833035677246, 1315)
-    femmesh.addNode(3.6653141443984603, 1.6017091567674149, 43.04153245017698, 1316)
-    femmesh.addNode(3.7173115043471454, 1.477022403231706, 46.439226669807155, 1317)
-    femmesh.addNode(-0.8769592241424939, 3.90268401477642, 48.39210073753941, 1318)
-    femmesh.addNode(-3.649586855841066, 1.6372280786964664, 48.42712207787629, 1319)
-    femmesh.addNode(-3.561580137831317, -1.8207544924578538, 48.37303617788976, 1320)
-    femmesh.addNode(-0.9218430211784915, -3.892326482234566, 48.39912571627033, 1321)
-    femmesh.addNode(3.7003666019108774, 1.5189756454474657, 23.304475917347055, 1322)
-    femmesh.addNode(3.714714638047606, 1.483541424387887, 30.507377990858576, 1323)
-    femmesh.addNode(3.7056459061860685, 1.506050602724368, 34.01773612065665, 1324)
-    femmesh.addNode(3.6888061679517143, 1.5468384063247809, 37.612611169106344, 1325)
-    femmesh.addNode(3.6764344709698937, 1.5760169988500494, 41.24692506671252, 1326)
-    femmesh.addNode(3.6721072479587624, 1.586073251615046, 44.808103463086084, 1327)
-    femmesh.addNode(0.9914916164364107, 3.8751702381361666, 48.34043622001113, 1328)
-    femmesh.addNode(-2.545175296272813, 3.0857872109467626, 48.444582354027474, 1329)
-    femmesh.addNode(-3.998321862819382, -0.11585456961443542, 48.40236898307729, 1330)
-    femmesh.addNode(-2.4621836383175717, -3.1524041192717096, 48.355694835037035, 1331)
-    femmesh.addNode(0.7647368440449402, -3.92621669796258, 48.4557944655421, 1332)
-    femmesh.addNode(3.6834337611539, 1.5595883197791767, 16.118566299560367, 1333)
-    femmesh.addNode(3.692581755542052, 1.5378036216103719, 7.248981044912132, 1334)
-    femmesh.addNode(3.6994843252562077, 1.5211231794906093, 12.60811019891704, 1335)
-    femmesh.addNode(3.6939253758017783, 1.5345733341902212, 9.065071290732227, 1336)
-    femmesh.addNode(2.648918558813178, 2.997203774983462, 48.42500724313112, 1337)
-    femmesh.addNode(3.2401656188043177, -2.345490729616818, 4.840836391693812, 1338)
-    femmesh.addNode(3.231097713027379, -2.357966829467548, 5.70429696710876, 1339)
-    femmesh.addNode(3.3307780528285713, -2.2149305999952937, 6.7079488932831115, 1340)
-    femmesh.addNode(3.3417952840542724, -2.198273022049951, 7.653900772180468, 1341)
-    femmesh.addNode(2.7526807608307418, -2.902197207109174, 6.191182397934676, 1342)
-    femmesh.addNode(3.335743734148422, -2.2074450706845554, 8.549993400394495, 1343)
-    femmesh.addNode(3.333787351296922, -2.2103985831366826, 9.435997466223283, 1344)
-    femmesh.addNode(2.8688841297873315, -2.787382975095885, 8.090926952323056, 1345)
-    femmesh.addNode(3.3260509553653517, -2.2220227366778293, 10.321535088679024, 1346)
-    femmesh.addNode(3.3264780340593814, -2.2213833277758326, 11.190794865143452, 1347)
-    femmesh.addNode(2.8514408681102648, -2.805224585602832, 9.872557202992823, 1348)
-    femmesh.addNode(3.310735691578173, -2.2447782029658065, 12.055836790159123, 1349)
-    femmesh.addNode(3.307323259333803, -2.2498028487557815, 12.964575047204487, 1350)
-    femmesh.addNode(2.821714841276495, -2.835123516624975, 11.623136750464237, 1351)
-    femmesh.addNode(3.2978566020070366, -2.2636567391277773, 13.878958897772254, 1352)
-    femmesh.addNode(3.3003760873530696, -2.2599817879859216, 14.787094318426819, 1353)
-    femmesh.addNode(2.789657786961586, -2.8666721876846304, 13.402562526047676, 1354)
-    femmesh.addNode(3.307909764451085, -2.248940415006402, 15.696948679913959, 1355)
-    femmesh.addNode(3.2991552610788544, -2.261763595802116, 16.555079540438193, 1356)
-    femmesh.addNode(2.787210990403916, -2.8690512186037425, 15.226800738102582, 1357)
-    femmesh.addNode(3.2891110574700133, -2.2763454157110012, 17.418636735446974, 1358)
-    femmesh.addNode(3.2933038193480453, -2.2702753034527725, 18.345121178465995, 1359)
-    femmesh.addNode(2.7840966493292774, -2.8720734404247903, 17.000212294598505, 1360)
-    femmesh.addNode(3.3043942496316756, -2.2541026247713556, 19.26659057529165, 1361)
-    femmesh.addNode(3.307515474659839, -2.249520256607106, 20.142549903932604, 1362)
-    femmesh.addNode(2.7854631995852657, -2.8707481191766395, 18.785238886432943, 1363)
-    femmesh.addNode(3.307780863891977, -2.2491299999044183, 21.007616761915752, 1364)
-    femmesh.addNode(3.305795939540154, -2.2520464484818756, 21.888306185663268, 1365)
-    femmesh.addNode(2.7998406198047725, -2.8567275865387005, 20.57177514124175, 1366)
-    femmesh.addNode(3.2934860812157103, -2.2700108882642795, 22.80607742344526, 1367)
-    femmesh.addNode(3.292494968353715, -2.2714481907728974, 23.745405478031323, 1368)
-    femmesh.addNode(2.7845850098316385, -2.8715999587374514, 22.354613237006884, 1369)
-    femmesh.addNode(3.303051885211312, -2.2560692018646056, 24.66188257656871, 1370)
-    femmesh.addNode(3.3050476213463655, -2.2531445183637757, 25.53858823167988, 1371)
-    femmesh.addNode(2.782341697839943, -2.8737735951986796, 24.18886157332626, 1372)
-    femmesh.addNode(3.303761041786386, -2.255030593755777, 26.40256871099855, 1373)
-    femmesh.addNode(3.300142978021401, -2.260322172747956, 27.277044472175895, 1374)
-    femmesh.addNode(2.794079745753859, -2.8623623764939423, 25.96931915118232, 1375)
-    femmesh.addNode(3.2853158318507787, -2.2818194242732326, 28.1931316939226, 1376)
-    femmesh.addNode(3.2833353118663045, -2.284668297554767, 29.118588927844932, 1377)
-    femmesh.addNode(2.7736882877122744, -2.8821265209230065, 27.749386852247692, 1378)
-    femmesh.addNode(3.2853666348469868, -2.2817462774450155, 30.036162192851428, 1379)
-    femmesh.addNode(3.2877876906664216, -2.2782563729972005, 30.951748255544857, 1380)
-    femmesh.addNode(2.7573919631806096, -2.8977214430284675, 29.583047339000892, 1381)
-    femmesh.addNode(3.300710901229726, -2.2594927631004373, 31.828518991313306, 1382)
-    femmesh.addNode(3.3017679590659457, -2.25794781704217, 32.686925987154666, 1383)
-    femmesh.addNode(2.776415070871677, -2.8794998444585165, 31.377391339775837, 1384)
-    femmesh.addNode(3.2903667878062115, -2.2745299298320596, 33.56444940283673, 1385)
-    femmesh.addNode(3.287963587364344, -2.278002512765558, 34.48175029563132, 1386)
-    femmesh.addNode(2.778329282364532, -2.877652932296698, 33.13168549122634, 1387)
-    femmesh.addNode(3.287500694081709, -2.2786704865803395, 35.40843664645874, 1388)
-    femmesh.addNode(3.290065438534966, -2.274965804173268, 36.322075055022225, 1389)
-    femmesh.addNode(2.7632295472117447, -2.8921553328643976, 34.93589525773581, 1390)
-    femmesh.addNode(3.302480100182576, -2.256906109677158, 37.19611369589747, 1391)
-    femmesh.addNode(3.306889997029269, -2.2504396342821025, 38.052070469668, 1392)
-    femmesh.addNode(2.778448986120498, -2.877537355365865, 36.736620249438474, 1393)
-    femmesh.addNode(3.3004679783097033, -2.2598475886997913, 38.92561167204279, 1394)
-    femmesh.addNode(3.297548148691185, -2.2641060503128685, 39.8135688265251, 1395)
-    femmesh.addNode(2.7860104215940664, -2.870217052901967, 38.484200092688525, 1396)
-    femmesh.addNode(3.2831851242267436, -2.2848841196122445, 40.73076752437351, 1397)
-    femmesh.addNode(3.28410256168983, -2.283565274806546, 41.633881141145814, 1398)
-    femmesh.addNode(2.7595954342049023, -2.895623083123122, 40.274939992911726, 1399)
-    femmesh.addNode(3.2989646276757685, -2.2620416409394584, 42.54370905260852, 1400)
-    femmesh.addNode(3.302182058081027, -2.257342166196289, 43.44151391513611, 1401)
-    femmesh.addNode(2.7602447622967783, -2.895004119550299, 42.101966602222845, 1402)
-    femmesh.addNode(3.338673314873229, -2.2030116877931913, 44.28951793734086, 1403)
-    femmesh.addNode(3.361786304267303, -2.1675776443857298, 45.14386267205741, 1404)
-    femmesh.addNode(2.825814228818777, -2.8310376091117795, 43.859798535890306, 1405)
-    femmesh.addNode(3.4009679790693683, -2.1055680481392227, 46.02375404006709, 1406)
-    femmesh.addNode(3.3960687936122804, -2.113460846349615, 46.98195897540597, 1407)
-    femmesh.addNode(2.9316682507285643, -2.7212719944302, 47.36111129614693, 1408)
-    femmesh.addNode(2.922330909363144, -2.731296771898063, 45.587693926104734, 1409)
-    femmesh.addNode(-0.5596886648458436, 3.960650022211389, 2.2342559997737106, 1410)
-    femmesh.addNode(-1.4230391890873348, 3.738309707116528, 2.223508380484473, 1411)
-    femmesh.addNode(2.76890624279238, 2.8867210150316547, 2.4407682078642003, 1412)
-    femmesh.addNode(2.123844481846212, 3.3895847263243613, 2.4840887798521045, 1413)
-    femmesh.addNode(3.370609734389596, 2.1538314740104654, 2.016794231569767, 1414)
-    femmesh.addNode(-3.9862706413640967, 0.3311289383286739, 2.2687063356808648, 1415)
-    femmesh.addNode(-3.9614893823638893, -0.5537164196754257, 2.270478198571733, 1416)
-    femmesh.addNode(-2.2245795842700726, 3.3243413893956184, 2.2275395484831924, 1417)
-    femmesh.addNode(-2.9358565620876957, 2.716752886599482, 2.2351007707983377, 1418)
-    femmesh.addNode(-1.8674490273522204, 3.5373201905172857, 2.9590890850730025, 1419)
-    femmesh.addNode(-3.466940595978725, 1.9950746612482153, 2.2594987380987797, 1420)
-    femmesh.addNode(-3.8218097196474927, 1.1805805634550959, 2.2602211446707594, 1421)
-    femmesh.addNode(-3.221317344833952, 2.371310726976104, 2.9875182203721637, 1422)
-    femmesh.addNode(3.422230541351254, -2.070830297692861, 1.3372293170308605, 1423)
-    femmesh.addNode(-2.7846050342292665, -2.8715805409817476, 2.2746915638770804, 1424)
-    femmesh.addNode(-2.0898204525742803, -3.410667159955986, 2.2810627735289213, 1425)
-    femmesh.addNode(-1.286069496891075, -3.7876147176245816, 2.2899149825126095, 1426)
-    femmesh.addNode(-0.3939959852118067, -3.9805486008384543, 2.32380489748049, 1427)
-    femmesh.addNode(-1.7101308513875852, -3.615999512048138, 3.0189033648354275, 1428)
-    femmesh.addNode(0.6270740213377205, -3.950541503612301, 2.5201745014794894, 1429)
-    femmesh.addNode(1.4772430763177318, -3.717223815358893, 2.5078447621713664, 1430)
-    femmesh.addNode(0.14681241245831536, -3.9973048564686895, 3.2241251778181157, 1431)
-    femmesh.addNode(3.326726016109794, 2.2210119346231036, 13.044493437267139, 1432)
-    femmesh.addNode(3.3188560688083486, 2.232754889040441, 12.18580364816615, 1433)
-    femmesh.addNode(3.543543449282133, 1.8556130585468735, 47.8581042492103, 1434)
-    femmesh.addNode(3.2945245625547144, 2.2685034508952517, 5.925031462202856, 1435)
-    femmesh.addNode(3.2668469065610246, 2.3081835475309718, 4.985129045946644, 1436)
-    femmesh.addNode(3.3085711803446576, 2.2479672472242025, 14.802647876830424, 1437)
-    femmesh.addNode(3.320078911128536, 2.2309361317347385, 13.918754006797684, 1438)
-    femmesh.addNode(3.325343941640509, 2.2230806710047126, 9.560275614484649, 1439)
-    femmesh.addNode(3.323682717149304, 2.225563568115505, 8.656276695750211, 1440)
-    femmesh.addNode(3.3088775288946817, 2.247516295552899, 18.35476940245063, 1441)
-    femmesh.addNode(3.302342944169452, 2.2571067939054714, 17.45685707863092, 1442)
-    femmesh.addNode(3.3163973504069477, 2.2364052884514867, 7.764275415450135, 1443)
-    femmesh.addNode(3.3161115104148484, 2.2368291062336776, 6.852184088364478, 1444)
-    femmesh.addNode(2.781943081238152, 2.8741594758731077, 6.440325832740859, 1445)
-    femmesh.addNode(2.818640528864498, 2.8381799747448127, 8.259479739202558, 1446)
-    femmesh.addNode(3.3233613266803816, 2.226043461463682, 21.949678121075188, 1447)
-    femmesh.addNode(3.328304865267273, 2.2186452451525907, 21.045977613591333, 1448)
-    femmesh.addNode(-1.311392132494629, 3.7789218931900654, 47.63106438797706, 1449)
-    femmesh.addNode(-0.3912514029915771, 3.980819305074914, 47.5777447425242, 1450)
-    femmesh.addNode(3.3333696820911127, 2.2110283947782743, 25.59975061749898, 1451)
-    femmesh.addNode(3.331971992260828, 2.213134122187223, 24.6965285981707, 1452)
-    femmesh.addNode(3.3676908737818754, 2.158392498746757, 31.033515813663023, 1453)
-    femmesh.addNode(3.347051598543716, 2.190261536138083, 30.156858823271655, 1454)
-    femmesh.addNode(3.32496792722896, 2.2236430205630477, 29.225885830372828, 1455)
-    femmesh.addNode(3.3256135334275667, 2.222677355416979, 28.32213714407522, 1456)
-    femmesh.addNode(2.8451848058715816, 2.8115695652851076, 29.752023653177275, 1457)
-    femmesh.addNode(3.3286758635147207, 2.218088590578503, 34.36965189422335, 1458)
-    femmesh.addNode(3.359657931060569, 2.170875073849672, 33.49121627044878, 1459)
-    femmesh.addNode(3.2987046888693485, 2.2624206893571706, 36.191589715215635, 1460)
-    femmesh.addNode(3.298268396543484, 2.263056690487994, 35.286982685235856, 1461)
-    femmesh.addNode(3.28529304488221, 2.2818522321238452, 39.88864681147751, 1462)
-    femmesh.addNode(3.2924614999539443, 2.271496702907804, 38.970152988526955, 1463)
-    femmesh.addNode(3.276491672974185, 2.2944721216285955, 41.704398975232486, 1464)
-    femmesh.addNode(3.2863877763182145, 2.280275286816533, 40.81429808824298, 1465)
-    femmesh.addNode(3.2836851811381234, 2.2841654123933077, 45.34506809232653, 1466)
-    femmesh.addNode(3.2677669269835556, 2.3068808618809182, 44.48300357589237, 1467)
-    femmesh.addNode(3.382503687827475, 2.135103932325903, 47.041908615323536, 1468)
-    femmesh.addNode(3.333437501168037, 2.210926146619691, 46.272849925036624, 1469)
-    femmesh.addNode(2.8079113087060232, 2.8487951984024455, 45.9477500378429, 1470)
-    femmesh.addNode(3.085425147432303, 2.5456142008545504, 47.69172750443977, 1471)
-    femmesh.addNode(0.6471579416548067, 3.9473011791036563, 47.39717244278076, 1472)
-    femmesh.addNode(1.5501827399314028, 3.6874019950120394, 47.39882757070534, 1473)
-    femmesh.addNode(0.19797589810018837, 3.99509768888965, 46.63613609321842, 1474)
-    femmesh.addNode(3.319688667951259, 2.2315167818943227, 20.14754015724683, 1475)
-    femmesh.addNode(3.308202028528992, 2.2485104710533728, 19.252783443290703, 1476)
-    femmesh.addNode(2.800517420055192, 2.8560641064176786, 18.809183327064694, 1477)
-    femmesh.addNode(2.8107008658526142, 2.8460429797695195, 20.60563482424927, 1478)
-    femmesh.addNode(1.2156499824131268, 3.8107998006007824, 2.3672315714192402, 1479)
-    femmesh.addNode(0.3451863222480689, 3.9850779669829364, 2.325324850738939, 1480)
-    femmesh.addNode(1.7210555044008355, 3.610812644097113, 3.2540528274376044, 1481)
-    femmesh.addNode(-2.87508625262789, 2.7809852642454103, 47.664602382971935, 1482)
-    femmesh.addNode(-2.1566415167382536, 3.3688124566797906, 47.66544041193673, 1483)
-    femmesh.addNode(-3.8098393085635784, 1.218656819175848, 47.65486138878913, 1484)
-    femmesh.addNode(-3.43819697043454, 2.044211728881026, 47.67148363597553, 1485)
-    femmesh.addNode(-3.346465244330324, -2.1911573125837367, 47.592917039086316, 1486)
-    femmesh.addNode(-3.7436692498009174, -1.4088791815109754, 47.61411899666123, 1487)
-    femmesh.addNode(-0.5176207084017298, -3.9663672046639467, 47.64962233867952, 1488)
-    femmesh.addNode(-1.3525619878840769, -3.764382561447637, 47.610052072168415, 1489)
-    femmesh.addNode(1.1505271590983361, -3.830964272370223, 47.73504649628828, 1490)
-    femmesh.addNode(0.32765167114569416, -3.9865579617503912, 47.71794801352761, 1491)
-    femmesh.addNode(3.3351479463332625, 2.208345121594227, 23.773244424139193, 1492)
-    femmesh.addNode(3.3283578125447693, 2.218565814140342, 22.864052468348735, 1493)
-    femmesh.addNode(3.2993324697768545, 2.261505085971765, 16.56685734909113, 1494)
-    femmesh.addNode(3.307625138742484, 2.249359006819224, 15.68287877761427, 1495)
-    femmesh.addNode(2.7949606469090904, 2.861502224746561, 15.250938926361187, 1496)
-    femmesh.addNode(2.7975685007440045, 2.8589526899976754, 17.021169556684825, 1497)
-    femmesh.addNode(3.3230730925787735, 2.2264737189957904, 27.410529999419957, 1498)
-    femmesh.addNode(3.327170248029537, 2.2203464010435554, 26.508974141380996, 1499)
-    femmesh.addNode(2.818368669029532, 2.8384499371017102, 26.08861284708591, 1500)
-    femmesh.addNode(2.8136643833225365, 2.8431132123118505, 27.909443515623185, 1501)
-    femmesh.addNode(3.32402091568871, 2.225058415427332, 11.334914163349946, 1502)
-    femmesh.addNode(3.3247355350507, 2.223990472545045, 10.444739063175255, 1503)
-    femmesh.addNode(2.8271194935074098, 2.829734151723516, 10.03594446819324, 1504)
-    femmesh.addNode(2.8197786499255892, 2.837049235636178, 11.771297401700048, 1505)
-    femmesh.addNode(-3.7430503353781557, -1.4105226644139668, 2.2642814024542934, 1506)
-    femmesh.addNode(-3.344430599398244, -2.19426159921936, 2.277912474680179, 1507)
-    femmesh.addNode(-3.0938466868543073, -2.5353722957862868, 3.013272066654838, 1508)
-    femmesh.addNode(-3.880666209585632, -0.9697575829970505, 3.022689773575376, 1509)
-    femmesh.addNode(3.214456896037778, 2.3806022060636622, 2.9469360595760348, 1510)
-    femmesh.addNode(3.7629554021133544, -1.3565274201821074, 2.1685255523794615, 1511)
-    femmesh.addNode(3.3930324121563715, -2.118332138748859, 2.1898800095235766, 1512)
-    femmesh.addNode(3.445660407779466, -2.0316063482527924, 2.9051853058497, 1513)
-    femmesh.addNode(-1.7267910003801157, 3.608073286534829, 46.85108441692152, 1514)
-    femmesh.addNode(-3.925459065186989, 0.7686163721527713, 3.0204013786827106, 1515)
-    femmesh.addNode(2.9782357571792444, -2.670226914451087, 2.073889070501099, 1516)
-    femmesh.addNode(3.1915780531650264, 2.4111884062750755, 3.9139974605922596, 1517)
-    femmesh.addNode(2.804693163523944, 2.8519635794452305, 13.496447456046795, 1518)
-    femmesh.addNode(2.4042832707995103, -3.1967830632924734, 2.2608672527597165, 1519)
-    femmesh.addNode(2.1082722812059407, 3.3992922775628895, 46.665547832013985, 1520)
-    femmesh.addNode(2.3988029161503865, 3.200897463129427, 47.608811609244356, 1521)
-    femmesh.addNode(2.8280677048805765, 2.828786498944646, 22.41844662786732, 1522)
-    femmesh.addNode(2.122579515127726, -3.3903769999750986, 3.173517272405465, 1523)
-    femmesh.addNode(-0.13173388412610065, 3.9978301844591964, 3.0461267680395117, 1524)
-    femmesh.addNode(2.8303629895809443, 2.8264899340366343, 24.25610514917238, 1525)
-    femmesh.addNode(2.818217376859525, 2.8386001509136536, 34.76046283502799, 1526)
-    femmesh.addNode(3.446143162292502, 2.0307873608491445, 32.699257756197945, 1527)
-    femmesh.addNode(3.4476055542570236, 2.0283037105562176, 31.82162499838188, 1528)
-    femmesh.addNode(2.97728477140023, 2.6712872159294814, 31.47110583079496, 1529)
-    femmesh.addNode(3.297214735394517, 2.2645915721598153, 38.034118969773154, 1530)
-    femmesh.addNode(3.291087386754673, 2.2734871481370416, 37.12689360505759, 1531)
-    femmesh.addNode(2.7492859832928986, 2.9054133237921933, 40.34612071999747, 1532)
-    femmesh.addNode(2.7284430979947003, 2.9249954292280664, 44.09475025848182, 1533)
-    femmesh.addNode(3.2552851969679555, 2.3244608592964733, 43.55778562924138, 1534)
-    femmesh.addNode(3.261485673552711, 2.31575283681364, 42.65327913276643, 1535)
-    femmesh.addNode(2.6603704788477875, 2.987043507429243, 4.442041621224853, 1536)
-    femmesh.addNode(-3.1681572465341845, 2.441880353586747, 46.892341693884774, 1537)
-    femmesh.addNode(-3.9639812163314594, -0.5355865164204217, 47.62130479071356, 1538)
-    femmesh.addNode(-3.983976368204777, 0.35767624688518707, 47.629435638326164, 1539)
-    femmesh.addNode(-2.1203276331187864, -3.3917857727505263, 47.57785263519506, 1540)
-    femmesh.addNode(-2.7961575546723827, -2.8603326606268302, 47.573992020472865, 1541)
-    femmesh.addNode(-0.1215186901012221, -3.9981537249030437, 46.92887436942569, 1542)
-    femmesh.addNode(2.491200472265813, -3.1295239585250965, 47.717654994376915, 1543)
-    femmesh.addNode(1.809874677786114, -3.5671211993298755, 47.82678281943856, 1544)
-    femmesh.addNode(1.405981695078237, -3.7447583998310128, 47.088936367424076, 1545)
-    femmesh.addNode(2.5375926877469315, -3.092025768180677, 46.82412899234439, 1546)
-    femmesh.addNode(3.3648082083420916, -2.162883658700505, 3.710341037310558, 1547)
-    femmesh.addNode(2.7317166601559015, 2.9219384128736676, 42.220652154296886, 1548)
-    femmesh.addNode(2.7697590225747892, 2.885902797542833, 36.613097515882444, 1549)
-    femmesh.addNode(2.7864199876335656, -2.869819445978468, 4.05703511737707, 1550)
-    femmesh.addNode(2.9692831514597517, 2.680178644504363, 33.051173529764654, 1551)
-    femmesh.addNode(2.7539770166802366, 2.9009671820958305, 38.4844354244782, 1552)
-    femmesh.addNode(-1.7611364791333182, -3.5914340174735075, 46.828349257604245, 1553)
-    femmesh.addNode(-3.8839830218816385, -0.9563868912397204, 46.84118565191011, 1554)
-    femmesh.addNode(-3.9168506453647076, 0.8113451928162713, 46.8737971964254, 1555)
-    femmesh.addNode(-3.0999503841905742, -2.527905776637395, 46.81507483924434, 1556)
-    femmesh.addNode(-3.415994047171723, 2.081101792245481, 46.1260360089681, 1557)
-    femmesh.addNode(-2.8449853777253296, 2.811771363487626, 46.11915475596451, 1558)
-    femmesh.addNode(2.0098119313837333, 3.4584181355740644, 42.75224094220713, 1559)
-    femmesh.addNode(2.0322829846455495, 3.445261364587624, 41.80336078467319, 1560)
-    femmesh.addNode(2.2780938553263588, -3.2879003005450587, 7.673032727248169, 1561)
-    femmesh.addNode(2.2690529722031627, -3.2941461123234945, 8.569125355462196, 1562)
-    femmesh.addNode(2.2427635010893283, -3.312100825485471, 9.401097081081382, 1563)
-    femmesh.addNode(2.2311879184410874, -3.319909708501502, 10.286634703537121, 1564)
-    femmesh.addNode(1.5626079588514141, -3.682153767421211, 8.983202856006496, 1565)
-    femmesh.addNode(2.207968953539624, -3.3353969928938203, 11.181855798238786, 1566)
-    femmesh.addNode(2.184401142662732, -3.3508792350566368, 12.046897723254457, 1567)
-    femmesh.addNode(1.5074372755317031, -3.7050820315260977, 10.710395676327343, 1568)
-    femmesh.addNode(2.167439047846536, -3.3618756630592546, 12.952531130178066, 1569)
-    femmesh.addNode(2.153317454448559, -3.370938139504666, 13.866914980745833, 1570)
-    femmesh.addNode(1.4627525523436973, -3.7229497674037986, 12.511250177952613, 1571)
-    femmesh.addNode(2.1473463159889032, -3.374744997656695, 14.736609700181324, 1572)
-    femmesh.addNode(2.158611597235647, -3.36755044094068, 15.646464061668464, 1573)
-    femmesh.addNode(1.4373131395244538, -3.7328448854660916, 14.286578304311714, 1574)
-    femmesh.addNode(2.162167874873155, -3.3652682034076427, 16.570300425324618, 1575)
-    femmesh.addNode(2.1472500577997624, -3.3748062447018965, 17.4338576203334, 1576)
-    femmesh.addNode(1.4346476818985852, -3.733870114080432, 16.080109387403358, 1577)
-    femmesh.addNode(2.130275574776475, -3.3855466287603777, 18.29753061946549, 1578)
-    femmesh.addNode(2.1468475904262143, -3.3750622843854536, 19.219000016291147, 1579)
-    femmesh.addNode(1.4198302911780185, -3.7395296421145456, 17.867618750191603, 1580)
-    femmesh.addNode(2.159378391180769, -3.3670588001550485, 20.130659679859043, 1581)
-    femmesh.addNode(2.1597756424833756, -3.3668039999583463, 20.99572653784219, 1582)
-    femmesh.addNode(1.414950496621498, -3.741378768864571, 19.64295141289159, 1583)
-    femmesh.addNode(2.1487801532091457, -3.3738322206616145, 21.91206493294787, 1584)
-    femmesh.addNode(2.1303800798982366, -3.3854808691193017, 22.82983617072986, 1585)
-    femmesh.addNode(1.4166516256050814, -3.740734977470401, 21.470949471565167, 1586)
-    femmesh.addNode(2.1206936801024785, -3.3915569161040784, 23.701359960328443, 1587)
-    femmesh.addNode(2.136486877263929, -3.381630349887318, 24.61783705886583, 1588)
-    femmesh.addNode(1.393728050047158, -3.7493362242551345, 23.25881165626943, 1589)
-    femmesh.addNode(2.1547309886287844, -3.370034772319541, 25.53514403914065, 1590)
-    femmesh.addNode(2.1528071021088513, -3.371264092459932, 26.39912451845932, 1591)
-    femmesh.addNode(1.4032682997046753, -3.7457760316180075, 25.047642426142833, 1592)
-    femmesh.addNode(2.133145976764241, -3.3837387963338026, 27.315070835198348, 1593)
-    femmesh.addNode(2.1110093262994396, -3.3975932105354794, 28.231158056945052, 1594)
-    femmesh.addNode(1.401706670992493, -3.7463606885209466, 26.88089572315668, 1595)
-    femmesh.addNode(2.1107780575209163, -3.397736892681396, 29.109328167991354, 1596)
-    femmesh.addNode(2.113800118801839, -3.3958576321385046, 30.02690143299785, 1597)
-    femmesh.addNode(1.3796192185292635, -3.7545506804229856, 28.67501215094201, 1598)
-    femmesh.addNode(2.1336076198458596, -3.3834477274720363, 30.904521288448407, 1599)
-    femmesh.addNode(2.1528445260036047, -3.371240194180224, 31.78129202421686, 1600)
-    femmesh.addNode(1.4012802552313708, -3.7465202049767066, 30.430802117438873, 1601)
-    femmesh.addNode(2.1525243610565132, -3.3714446273160488, 32.70698806224598, 1602)
-    femmesh.addNode(2.135535902084473, -3.3822309813063116, 33.58451147792803, 1603)
-    femmesh.addNode(1.4227939902862596, -3.7384030362181795, 32.23411801091855, 1604)
-    femmesh.addNode(2.116131415072443, -3.394405372689523, 34.46366777145007, 1605)
-    femmesh.addNode(2.11544172461748, -3.3948352404420783, 35.390354122277486, 1606)
-    femmesh.addNode(1.4010056559719848, -3.7466228996170017, 34.03897034246971, 1607)
-    femmesh.addNode(2.1314480006928025, -3.384808623887421, 36.265198592509606, 1608)
-    femmesh.addNode(2.1499606381538943, -3.3730800841943998, 37.139237233384854, 1609)
-    femmesh.addNode(1.3972395616650983, -3.748029029679189, 35.79297110622386, 1610)
-    femmesh.addNode(2.1400117399094087, -3.3794007979299976, 38.04013238072452, 1611)
-    femmesh.addNode(2.1303794932413496, -3.385481238284556, 38.91367358309931, 1612)
-    femmesh.addNode(1.4038905509008959, -3.745542860666686, 37.56871072379565, 1613)
-    femmesh.addNode(2.0870723567726004, -3.412349480577226, 39.84735245762141, 1614)
-    femmesh.addNode(2.0654825901159364, -3.4254607967291, 40.76455115546983, 1615)
-    femmesh.addNode(1.344960047631262, -3.767105317120257, 39.403284745657416, 1616)
-    femmesh.addNode(2.0389126691670576, -3.441342053256268, 41.6708534397693, 1617)
-    femmesh.addNode(2.061372082269803, -3.42793598808943, 42.580681351232016, 1618)
-    femmesh.addNode(1.2675334347171552, -3.7938580616404365, 41.243265904478996, 1619)
-    femmesh.addNode(2.1392138533243323, -3.3799059291266174, 43.51461504969556, 1620)
-    femmesh.addNode(2.1942274947462117, -3.3444529748973544, 44.36261907190031, 1621)
-    femmesh.addNode(1.3247821447706514, -3.774248570099335, 43.08350188724202, 1622)
-    femmesh.addNode(-2.142218033607989, 3.3780026489753854, 46.09240721076742, 1623)
-    femmesh.addNode(-1.2952229022480488, 3.7844943695944564, 46.05803118680776, 1624)
-    femmesh.addNode(-2.934683814446287, 2.71801966682123, 3.702654107263721, 1625)
-    femmesh.addNode(-3.466079254929388, 1.9965707096289225, 3.727052074564163, 1626)
-    femmesh.addNode(-2.13515172836496, -3.382473517540104, 3.7929512118644433, 1627)
-    femmesh.addNode(-1.3365029418914336, -3.770114041553059, 3.8018034208481315, 1628)
-    femmesh.addNode(-0.5760853361144707, -3.9582983320505134, 3.7370517006030872, 1629)
-    femmesh.addNode(0.44528669195804904, -3.9751377035223645, 3.9334213046020867, 1630)
-    femmesh.addNode(-1.0508638283245408, -3.8594928700956412, 4.511099547632103, 1631)
-    femmesh.addNode(2.032517306825015, 3.445123132408592, 45.73776599930389, 1632)
-    femmesh.addNode(2.210930248317467, 3.3334347806841618, 22.88477274984077, 1633)
-    femmesh.addNode(2.2034299907191834, 3.338397261561191, 21.97039840256722, 1634)
-    femmesh.addNode(-3.814560392412824, 1.2037977457344402, 3.7763306433226296, 1635)
-    femmesh.addNode(-3.984183474091802, 0.35536185047607477, 3.7848158343327345, 1636)
-    femmesh.addNode(-3.6552691858251056, 1.624502132703269, 4.491466530214186, 1637)
-    femmesh.addNode(2.1047969932300012, 3.4014452247963582, 38.9140150511908, 1638)
-    femmesh.addNode(2.111920914875676, 3.3970266483074116, 37.977981032437, 1639)
-    femmesh.addNode(2.1758997568645815, 3.356405852705637, 13.950236217251792, 1640)
-    femmesh.addNode(2.185912783524438, 3.349893327081393, 13.075975647721247, 1641)
-    femmesh.addNode(2.4420577382448894, 3.1680205180961587, 32.24781859000886, 1642)
-    femmesh.addNode(2.3193820686728968, 3.258905770272997, 31.45970940529, 1643)
-    femmesh.addNode(-1.3623560096441103, -3.760849119944401, 46.01962522491442, 1644)
-    femmesh.addNode(-2.1291491927433412, -3.386255116650306, 45.98742578794106, 1645)
-    femmesh.addNode(2.0717898331539626, 3.4216497318164927, 40.801622827054786, 1646)
-    femmesh.addNode(2.070147471542212, 3.4226436341032334, 39.875971550289314, 1647)
-    femmesh.addNode(1.3368875601692147, 3.7699776725419483, 39.369517158248115, 1648)
-    femmesh.addNode(1.2549177488160652, 3.7980496894730615, 41.33321161496503, 1649)
-    femmesh.addNode(2.0713524124393623, 3.4219145494125995, 44.60970943165172, 1650)
-    femmesh.addNode(2.052877947131243, 3.4330295853927932, 43.684491485000734, 1651)
-    femmesh.addNode(2.1198088375346056, 3.3921100354071925, 36.99963465225804, 1652)
-    femmesh.addNode(2.1311898172647283, 3.3849711908356226, 36.064330762416084, 1653)
-    femmesh.addNode(1.3838265327921566, 3.7530020153392454, 37.42921427897065, 1654)
-    femmesh.addNode(-2.827125133049138, -2.8297285173814632, 46.01977552814404, 1655)
-    femmesh.addNode(-3.370116602176377, -2.1546030000292746, 46.03870054675749, 1656)
-    femmesh.addNode(-2.5044769805557445, -3.1189092731059653, 45.211051495454214, 1657)
-    femmesh.addNode(2.309626156095258, 3.265827156951305, 33.0397771042597, 1658)
-    femmesh.addNode(-3.9785697743785406, 0.4135003632422706, 46.08741142051183, 1659)
-    femmesh.addNode(-3.7923780359542194, 1.2719547289160946, 46.1128371709748, 1660)
-    femmesh.addNode(-3.7565896990450574, -1.3740574343995104, 46.05057803025673, 1661)
-    femmesh.addNode(-3.968783402520184, -0.49875675823021137, 46.05776382430905, 1662)
-    femmesh.addNode(-3.999935910031697, -0.022643225011047367, 45.29680379885845, 1663)
-    femmesh.addNode(-3.5975779897247158, -1.7485515742603284, 45.25527871915642, 1664)
-    femmesh.addNode(0.39711247275295375, -3.9802388978532477, 46.1589321183489, 1665)
-    femmesh.addNode(-0.44838345705912264, -3.9747895888255154, 46.09060644350081, 1666)
-    femmesh.addNode(1.9320135335654398, -3.5024739408195433, 4.30401262678872, 1667)
-    femmesh.addNode(2.1651731090765187, 3.3633354586974997, 35.08729074584584, 1668)
-    femmesh.addNode(2.210616435599049, 3.333642898490982, 34.169959954833345, 1669)
-    femmesh.addNode(1.4302384468330789, 3.73556126776158, 35.47382788222144, 1670)
-    femmesh.addNode(2.2142139065777005, 3.3312545348438802, 24.723760409577423, 1671)
-    femmesh.addNode(2.218997307832442, 3.3280701536825172, 23.800476235545908, 1672)
-    femmesh.addNode(0.22935917292253896, 3.9934188823358223, 3.777577428012293, 1673)
-    femmesh.addNode(-0.6744253683037331, 3.942733876714021, 3.6865085770470647, 1674)
-    femmesh.addNode(-0.4738478312745503, 3.9718343662338698, 46.02261355832988, 1675)
-    femmesh.addNode(0.5650336771077596, 3.959891026749863, 45.842041258586434, 1676)
-    femmesh.addNode(-0.9412143414491829, 3.887687688517479, 45.263936352175776, 1677)
-    femmesh.addNode(2.2551515747714306, 3.3036784611711134, 30.33357462428518, 1678)
-    femmesh.addNode(2.221981538750141, 3.3260784779456958, 29.402601631386354, 1679)
-    femmesh.addNode(1.9751920033141008, 3.4783065635512966, 4.1012929220374525, 1680)
-    femmesh.addNode(1.0496225692365946, 3.859830626096069, 3.9844357136045883, 1681)
-    femmesh.addNode(0.5147215693478794, 3.966744471988088, 4.624817522612141, 1682)
-    femmesh.addNode(2.085109611756586, 3.4135491657452803, 5.1724245073918365, 1683)
-    femmesh.addNode(1.2631933197056233, 3.7953053417414373, 45.327507225822806, 1684)
-    femmesh.addNode(1.2586844890583815, 3.796803044273411, 43.26720011537704, 1685)
-    femmesh.addNode(-2.4984796776946347, 3.1237156240840673, 45.326101525850746, 1686)
-    femmesh.addNode(2.3389860777990563, -3.2448642695592347, 45.231067816008064, 1687)
-    femmesh.addNode(2.3980939507902232, -3.2014286503346185, 46.110959184017744, 1688)
-    femmesh.addNode(1.8917520343782581, -3.5243828169518876, 46.467502882247715, 1689)
-    femmesh.addNode(1.5737508577077608, -3.677405095697792, 44.885884329813315, 1690)
-    femmesh.addNode(-0.8640043563312985, -3.9055724896922013, 45.24968297383762, 1691)
-    femmesh.addNode(-3.966568625310894, -0.5160749370965867, 3.827767208333497, 1692)
-    femmesh.addNode(-3.7562752725805386, -1.3749167526072268, 3.821570412216057, 1693)
-    femmesh.addNode(-3.9994187479217187, -0.06818855308827522, 4.583696472973416, 1694)
-    femmesh.addNode(2.203197113008138, 3.3385509553146866, 28.421114115701833, 1695)
-    femmesh.addNode(2.199383089064832, 3.3410648044501676, 27.509506971046573, 1696)
-    femmesh.addNode(1.5242525186470286, 3.6981960817942294, 29.002665086809742, 1697)
-    femmesh.addNode(-3.3577693833677404, -2.173795015202267, 3.8206709168637065, 1698)
-    femmesh.addNode(-2.8020908934962843, -2.854520384335203, 3.8174500060606085, 1699)
-    femmesh.addNode(-2.4997313934098706, -3.122714037628349, 4.600350062073312, 1700)
-    femmesh.addNode(-3.5859131614705424, -1.7723506420548782, 4.625748351621828, 1701)
-    femmesh.addNode(1.5066169601514956, 3.7054156764638253, 23.35242801024581, 1702)
-    femmesh.addNode(-1.4790857893824525, 3.716490983124658, 3.6264732352680635, 1703)
-    femmesh.addNode(-2.2743113462213995, 3.29051787724191, 3.630504403266783, 1704)
-    femmesh.addNode(2.2005642480865637, -3.3402869622299245, 5.887488885922846, 1705)
-    femmesh.addNode(2.3440284784571466, -3.2412236103332757, 6.8911408120971975, 1706)
-    femmesh.addNode(2.1928151931612927, 3.3453791307774075, 26.581784018921404, 1707)
-    femmesh.addNode(2.2021668727692782, 3.3392306096580957, 25.672560495039384, 1708)
-    femmesh.addNode(1.5022062814039088, 3.7072059948309644, 25.216931581412915, 1709)
-    femmesh.addNode(1.4960966340328892, 3.7096758432018637, 27.09345461900005, 1710)
-    femmesh.addNode(2.1633571921125263, 3.364503776091655, 19.263289260985317, 1711)
-    femmesh.addNode(2.1643680864137944, 3.363853561990101, 18.36527522014524, 1712)
-    femmesh.addNode(2.2040313973865144, 3.3380002395647677, 10.511837995322903, 1713)
-    femmesh.addNode(2.2049446626704383, 3.3373970447882204, 9.627374546632296, 1714)
-    femmesh.addNode(1.6169940964097405, 3.658596738119145, 31.110287383499077, 1715)
-    femmesh.addNode(1.5787514489264682, 3.675261060457145, 33.36660501507755, 1716)
-    femmesh.addNode(-2.6276983572452406, 3.015825151319397, 4.370038257458782, 1717)
-    femmesh.addNode(2.1513813500655248, 3.3721741186644323, 6.0832861257151345, 1718)
-    femmesh.addNode(1.3967855699950118, 3.748198243350225, 5.7425374265277345, 1719)
-    femmesh.addNode(2.1835968448627363, 3.351403410379822, 7.010438751876756, 1720)
-    femmesh.addNode(2.1799732532511866, 3.353761562053784, 21.06486849732309, 1721)
-    femmesh.addNode(2.1669701627295495, 3.3621779122824345, 20.16643104097859, 1722)
-    femmesh.addNode(1.4414829145931607, 3.731236659197056, 19.722522934059135, 1723)
-    femmesh.addNode(1.4716003174867007, 3.719461319273672, 21.531194619296542, 1724)
-    femmesh.addNode(1.6656471853355659, -3.636704477130869, 7.369339215236339, 1725)
-    femmesh.addNode(-3.6078904099087783, 1.7271730631550124, 45.33965023305453, 1726)
-    femmesh.addNode(1.0220180695167356, -3.8672314471183755, 4.417464470501676, 1727)
-    femmesh.addNode(1.8103426181434081, -3.5668837386342815, 5.300982315473281, 1728)
-    femmesh.addNode(2.1758914328395305, 3.356411249012185, 17.469585765438357, 1729)
-    femmesh.addNode(2.171417160621494, 3.3593075945138593, 16.579586035898565, 1730)
-    femmesh.addNode(1.2386720494046206, -3.803378965344337, 46.37576655909743, 1731)
-    femmesh.addNode(-1.1378753639319052, 3.8347411459128287, 4.357923895240845, 1732)
-    femmesh.addNode(0.609784786471139, 3.953247084889629, 44.71398469093427, 1733)
-    femmesh.addNode(2.1649355478524352, 3.363488378699245, 14.818924827346486, 1734)
-    femmesh.addNode(1.4576998071331209, 3.7249310426213347, 14.398453019020938, 1735)
-    femmesh.addNode(2.163520293344009, 3.3643988973200925, 15.699155728130332, 1736)
-    femmesh.addNode(2.1929503882449835, 3.345290509760875, 12.220250202741774, 1737)
-    femmesh.addNode(2.2006962341294027, 3.340200006749396, 11.369360717925572, 1738)
-    femmesh.addNode(1.489184695442745, 3.7124559179684677, 10.960790796364627, 1739)
-    femmesh.addNode(1.4776648233851488, 3.7170561832894236, 12.67403896394677, 1740)
-    femmesh.addNode(2.1982006406782237, 3.3418428962657485, 8.76820568333995, 1741)
-    femmesh.addNode(2.187276030841542, 3.349003368900376, 7.876204403039873, 1742)
-    femmesh.addNode(1.473809209368158, 3.718586615151193, 7.5191646960141485, 1743)
-    femmesh.addNode(1.4853950754762908, 3.713973811128827, 9.244099210469612, 1744)
-    femmesh.addNode(1.4502667477342666, 3.727831321347074, 17.92369169935898, 1745)
-    femmesh.addNode(0.9231861855432415, -3.8920081277949716, 45.53749863317255, 1746)
-    femmesh.addNode(-0.3023424205234274, -3.9885572655726076, 44.33176729324316, 1747)
-    femmesh.addNode(-1.223544732771406, -3.8082723493609736, 44.260786074656764, 1748)
-    femmesh.addNode(-1.3391888729576111, -3.769160803487498, 5.265243056102772, 1749)
-    femmesh.addNode(-0.5789055447102609, -3.9578868566829595, 5.200491335857729, 1750)
-    femmesh.addNode(0.7514619377166075, -3.928779066855656, 10.258228559675782, 1751)
-    femmesh.addNode(0.7240306113192243, -3.933926749937359, 11.153449654377445, 1752)
-    femmesh.addNode(0.6903107127540202, -3.9399836446179615, 12.012203381095256, 1753)
-    femmesh.addNode(0.6703905645013952, -3.9434219265794397, 12.917836788018864, 1754)
-    femmesh.addNode(-0.09586592357685114, -3.9988510505764974, 11.560036264443696, 1755)
-    femmesh.addNode(0.6519779656271676, -3.9465079161629286, 13.818203102116346, 1756)
-    femmesh.addNode(0.6449902158916355, -3.9476559654311396, 14.687897821551838, 1757)
-    femmesh.addNode(-0.14876988341361808, -3.9972324828297263, 13.31915630525899, 1758)
-    femmesh.addNode(0.6303685440263207, -3.95001715169721, 15.5895121650133, 1759)
-    femmesh.addNode(0.6345409925611817, -3.9493490259483868, 16.513348528669454, 1760)
-    femmesh.addNode(-0.18222165273002916, -3.9958472529960822, 15.121136962817932, 1761)
-    femmesh.addNode(0.6337073472006408, -3.949482877302284, 17.406726603640102, 1762)
-    femmesh.addNode(0.6138660703539415, -3.9526153933399857, 18.270399602772194, 1763)
-    femmesh.addNode(-0.19785938845547224, -3.9951034607879716, 16.916129381250045, 1764)
-    femmesh.addNode(0.5982238915846124, -3.9550130436621016, 19.163275048296107, 1765)
-    femmesh.addNode(0.6129211586016325, -3.952762028422459, 20.074934711864003, 1766)
-    femmesh.addNode(-0.21450641901299775, -3.994244233419161, 18.702382901744606, 1767)
-    femmesh.addNode(0.5980979415547516, -3.955032092449816, 20.99520218682386, 1768)
-    femmesh.addNode(0.5851917044180186, -3.9569623032169936, 21.911540581929543, 1769)
-    femmesh.addNode(-0.2452763168607501, -3.992472858816604, 20.515525822228376, 1770)
-    femmesh.addNode(0.5932198681931995, -3.9557667003984, 22.806541634598325, 1771)
-    femmesh.addNode(0.581909536554083, -3.9574463093347725, 23.67806542419691, 1772)
-    femmesh.addNode(-0.2521423402307921, -3.9920451200184273, 22.330794349857022, 1773)
-    femmesh.addNode(0.5823680529468869, -3.9573788611790572, 24.579955962726203, 1774)
-    femmesh.addNode(0.603746371469357, -3.9541737846151355, 25.497262943001022, 1775)
-    femmesh.addNode(-0.24357867442498235, -3.992576790666069, 24.1276859410551, 1776)
-    femmesh.addNode(0.6053863152316081, -3.9539230403904293, 26.400838398902536, 1777)
-    femmesh.addNode(0.5823596599998041, -3.9573800962764385, 27.316784715641568, 1778)
-    femmesh.addNode(-0.24146012621886662, -3.9927054746683193, 25.93315193548591, 1779)
-    femmesh.addNode(0.5900799636971947, -3.956236296841117, 28.217240809249024, 1780)
-    femmesh.addNode(0.5898106732976338, -3.956276452633738, 29.095410920295325, 1781)
-    femmesh.addNode(-0.2320131404792191, -3.9932655687601057, 27.73718348499488, 1782)
-    femmesh.addNode(0.5879918635186089, -3.956547177582483, 29.982030800860038, 1783)
-    femmesh.addNode(0.6111017872548867, -3.953043714103587, 30.8596506563106, 1784)
-    femmesh.addNode(-0.22605720168437105, -3.993607159144053, 29.524259459167055, 1785)
-    femmesh.addNode(0.6020852451628352, -3.9544270580650758, 31.76297801589294, 1786)
-    femmesh.addNode(0.6017097039315065, -3.9544842182255144, 32.68867405392206, 1787)
-    femmesh.addNode(-0.2369997143815126, -3.9929727190882587, 31.314206699314106, 1788)
-    femmesh.addNode(0.6075611145976616, -3.953589444040548, 33.58610630827422, 1789)
-    femmesh.addNode(0.5849096102303464, -3.957004011605268, 34.465262601796255, 1790)
-    femmesh.addNode(-0.2401966282914964, -3.9927816844597697, 33.1149663132486, 1791)
-    femmesh.addNode(0.5831220100947825, -3.957267835431792, 35.35685727174986, 1792)
-    femmesh.addNode(0.6018010834463294, -3.9544703129449363, 36.23170174198198, 1793)
-    femmesh.addNode(-0.2360914583751964, -3.993026524239762, 34.903993237554374, 1794)
-    femmesh.addNode(0.5900683353195457, -3.9562380312176897, 37.122165423750204, 1795)
-    femmesh.addNode(0.5784077992033453, -3.957959628119107, 38.02306057108987, 1796)
-    femmesh.addNode(-0.24973835279485843, -3.992196232043624, 36.686051589276204, 1797)
-    femmesh.addNode(0.5728780285997558, -3.958763792441734, 38.9234962152154, 1798)
-    femmesh.addNode(0.5223931540910064, -3.965741468194674, 39.8571750897375, 1799)
-    femmesh.addNode(-0.2671549801186756, -3.9910685557376473, 38.47695091516995, 1800)
-    femmesh.addNode(0.49491608734473774, -3.969264171919951, 40.79171052671096, 1801)
-    femmesh.addNode(0.4641849482396012, -3.9729752495866117, 41.698012811010436, 1802)
-    femmesh.addNode(-0.3003609668271754, -3.9887069696339745, 40.31192199626894, 1803)
-    femmesh.addNode(0.7513734650215064, -3.928795988093754, 44.669049889064794, 1804)
-    femmesh.addNode(0.3082310699016219, -3.9881065190823706, 4.930390993286648, 1805)
-    femmesh.addNode(-3.425649021606078, 2.0651703999353948, 5.250900962857116, 1806)
-    femmesh.addNode(-3.789841939363054, 1.2794913343375511, 5.3001795316155835, 1807)
-    femmesh.addNode(-0.41571398787471464, 3.9783390856342677, 44.33096050108246, 1808)
-    femmesh.addNode(0.3015095691016576, 3.988620310300309, 43.81642646831884, 1809)
-    femmesh.addNode(-3.7481979761876474, 1.3967862869110736, 44.54396756194862, 1810)
-    femmesh.addNode(-3.345237287136075, 2.1930315758680887, 44.55716639994193, 1811)
-    femmesh.addNode(0.2516366176916489, 3.992077029897683, 42.884175925525234, 1812)
-    femmesh.addNode(0.6409958537387676, 3.9483065123530756, 18.379295073226483, 1813)
-    femmesh.addNode(0.6545324942360368, 3.9460850490060593, 17.4836056185196, 1814)
-    femmesh.addNode(0.8315205638208455, 3.912617225329238, 31.686415061018742, 1815)
-    femmesh.addNode(0.7547800785426861, 3.928142949669105, 30.56028028001392, 1816)
-    femmesh.addNode(1.3219541916399853, -3.775240007629379, 6.000940729635802, 1817)
-    femmesh.addNode(0.6010227984561255, 3.954588675922689, 37.84691400841464, 1818)
-    femmesh.addNode(0.6102103994365452, 3.9531814110181553, 36.86856762823568, 1819)
-    femmesh.addNode(-2.1533772951150323, -3.3708999132105757, 44.415830808867156, 1820)
-    femmesh.addNode(-2.8473444349370713, -2.8093824354887835, 44.44818054907014, 1821)
-    femmesh.addNode(-1.6544268836618468, -3.641822577586249, 43.497915128272695, 1822)
-    femmesh.addNode(1.0174016226423166, -3.86844851823632, 6.85807182742111, 1823)
-    femmesh.addNode(0.9390707314482785, -3.888206033807519, 7.639963742572082, 1824)
-    femmesh.addNode(-0.809009050953047, 3.9173338325289624, 4.952265654128084, 1825)
-    femmesh.addNode(-1.6054523936156675, 3.6636761062945675, 4.892230312349083, 1826)
-    femmesh.addNode(0.8394962102971832, -3.910913718416282, 8.506986188604966, 1827)
-    femmesh.addNode(0.8083432571833221, -3.917471273483222, 9.338957914224151, 1828)
-    femmesh.addNode(-0.0036205267535256995, -3.999998361472918, 9.782011892274253, 1829)
-    femmesh.addNode(0.15646814380201254, -3.9969385434323548, 7.995718800789739, 1830)
-    femmesh.addNode(0.0063206899934599966, -3.9999950061066336, 5.684534501757318, 1831)
-    femmesh.addNode(-2.810535093029839, 2.846206684492142, 44.65698613107794, 1832)
-    femmesh.addNode(-2.1009247749467495, 3.4038382878766362, 44.63023858588086, 1833)
-    femmesh.addNode(1.4542937008050847, 3.7262621796914197, 16.147571936883864, 1834)
-    femmesh.addNode(0.6181719372431103, 3.9519442627654935, 35.89934735357571, 1835)
-    femmesh.addNode(0.6579421755778917, 3.945517975322864, 34.92230733700547, 1836)
-    femmesh.addNode(-1.2397408429056425, 3.803030718049962, 44.366378129560346, 1837)
-    femmesh.addNode(0.7214912165196401, 3.9343932727277036, 23.831122290441762, 1838)
-    femmesh.addNode(0.7119600409599932, 3.9361291772598426, 22.91541880473662, 1839)
-    femmesh.addNode(0.696174221489805, 3.9389518216567545, 33.87041794530168, 1840)
-    femmesh.addNode(0.8140239528243717, 3.916294805581953, 32.74023509472803, 1841)
-    femmesh.addNode(0.6958182049419094, 3.939014727780466, 5.447391181845061, 1842)
-    femmesh.addNode(-0.13317166517132634, 3.997782548813216, 5.240532896252766, 1843)
-    femmesh.addNode(-0.6287864533872232, 3.950269306773491, 5.774839313361004, 1844)
-    femmesh.addNode(0.7726177242550831, 3.9246734707701347, 6.3582528001683585, 1845)
-    femmesh.addNode(-2.2501159230324816, 3.3071102692404564, 5.050149713346801, 1846)
-    femmesh.addNode(-2.9146696075128364, 2.739470948749223, 5.12229941734374, 1847)
-    femmesh.addNode(-3.1555315235736128, 2.4581742826197646, 5.931012418745137, 1848)
-    femmesh.addNode(-1.9619403289312067, 3.4857983512695205, 5.644491472234041, 1849)
-    femmesh.addNode(0.3826693978218932, -3.981653441972396, 43.680152989883936, 1850)
-    femmesh.addNode(0.575221303348854, -3.9584239859031833, 6.271565256971545, 1851)
-    femmesh.addNode(-1.6294797966644061, 3.6530529139697014, 43.69726273478754, 1852)
-    femmesh.addNode(-3.9676331051325953, 0.507826292206185, 44.5342030713645, 1853)
-    femmesh.addNode(-3.864426575847607, 1.0325731159984457, 43.7517192382519, 1854)
-    femmesh.addNode(-3.979504456960181, -0.40440607937326334, 44.50455547516172, 1855)
-    femmesh.addNode(0.29152774233604717, -3.9893623018533235, 42.74621929142039, 1856)
-    femmesh.addNode(-3.981581401685784, 0.38341823346036596, 5.343115457317675, 1857)
-    femmesh.addNode(-3.9701055243616477, -0.48812101515211054, 5.386066831318438, 1858)
-    femmesh.addNode(-3.903320699012503, 0.8741209988671745, 6.102549889960605, 1859)
-    femmesh.addNode(0.7360803949831941, 3.9316899231909663, 29.520189688768113, 1860)
-    femmesh.addNode(0.713905742228903, 3.935776745600873, 28.538702173083596, 1861)
-    femmesh.addNode(-0.08669314222584254, 3.999060427036707, 30.096317366287778, 1862)
-    femmesh.addNode(-3.054369851134047, 2.582793993427153, 43.861303459972035, 1863)
-    femmesh.addNode(-2.1436152724414748, -3.3771161608324434, 5.351197752050809, 1864)
-    femmesh.addNode(-1.7217534787292696, -3.6104798792520167, 6.040589540276434, 1865)
-    femmesh.addNode(-2.809230269868932, -2.847494563796765, 5.375696546246974, 1866)
-    femmesh.addNode(-0.6600593602241062, 3.945164336371876, 42.365023094692766, 1867)
-    femmesh.addNode(0.31522537650602844, 3.987559775352168, 41.815796741750965, 1868)
-    femmesh.addNode(0.7122492656370393, 3.9360768518411193, 9.697783556939559, 1869)
-    femmesh.addNode(0.7042993156314589, 3.937507139549217, 8.838614693647212, 1870)
-    femmesh.addNode(0.6629281406698656, 3.9446832927762396, 20.203143371356056, 1871)
-    femmesh.addNode(0.6586902986451627, 3.945393147770035, 19.30000159136278, 1872)
-    femmesh.addNode(-0.16484194150157067, 3.9966019484459534, 18.8599155105234, 1873)
-    femmesh.addNode(0.5303501510230901, 3.9646851977565363, 38.831291806604696, 1874)
-    femmesh.addNode(-0.26831230667544165, 3.990990917815587, 38.27064515586973, 1875)
-    femmesh.addNode(0.4900622206594261, 3.9698663730511576, 39.79324830570321, 1876)
-    femmesh.addNode(-0.14218667757630588, 3.9974720697860806, 34.295937416655946, 1877)
-    femmesh.addNode(0.7017170022422732, 3.9379681624873655, 21.98706803630531, 1878)
-    femmesh.addNode(0.6740940942183704, 3.942790528564752, 21.08153813106118, 1879)
-    femmesh.addNode(-0.13560470638867417, 3.9977007596373744, 20.659016788364823, 1880)
-    femmesh.addNode(-0.11388324565674297, 3.9983784971358936, 22.465762316501262, 1881)
-    femmesh.addNode(-3.417614681842376, -2.078439291019931, 44.49499482787081, 1882)
-    femmesh.addNode(-3.786476001330255, -1.289418276336288, 44.50687231137005, 1883)
-    femmesh.addNode(-3.923993041312839, -0.7760661129880722, 43.74427158387611, 1884)
-    femmesh.addNode(-3.1734360406283173, -2.435016159297771, 43.69977414128377, 1885)
-    femmesh.addNode(-0.31194305534400296, -3.9878178908047754, 6.541665599542625, 1886)
-    femmesh.addNode(0.6554567470797453, 3.94593163305038, 16.578617715392795, 1887)
-    femmesh.addNode(0.6461861060681311, 3.947460388189412, 15.698187407624562, 1888)
-    femmesh.addNode(-0.18182176198135883, 3.9958654690654933, 17.0342210892603, 1889)
-    femmesh.addNode(-0.5004775700229471, -3.9685667692384774, 42.29466391365235, 1890)
-    femmesh.addNode(-0.18899528508776003, 3.995532603072411, 36.3170470830197, 1891)
-    femmesh.addNode(0.7211730699305183, 3.9344516013298465, 24.783678658990866, 1892)
-    femmesh.addNode(-0.1038036177531146, 3.9986528742742053, 24.34666945348168, 1893)
-    femmesh.addNode(-0.08553922497408924, 3.999085275533748, 32.19022799124287, 1894)
-    femmesh.addNode(0.3610856061938076, 3.9836688096526864, 40.81405878413256, 1895)
-    femmesh.addNode(0.665591283172446, 3.9442348109316283, 14.839568266872398, 1896)
-    femmesh.addNode(0.678458566897667, 3.9420418532789787, 13.970879656777706, 1897)
-    femmesh.addNode(-0.16123239028425185, 3.9967491935725996, 15.270614045381329, 1898)
-    femmesh.addNode(0.6897620541682005, 3.9400797337908866, 13.119594693317326, 1899)
-    femmesh.addNode(0.698043705945447, 3.9386209495951685, 12.263869248337851, 1900)
-    femmesh.addNode(-0.13010915140531157, 3.997883391085912, 13.560709941168787, 1901)
-    femmesh.addNode(0.706957010234155, 3.937030833722386, 25.732478744452834, 1902)
-    femmesh.addNode(0.7088926534300252, 3.9366827667355846, 26.661586406368407, 1903)
-    femmesh.addNode(-0.10216092288178366, 3.9986951804102224, 26.228333483946358, 1904)
-    femmesh.addNode(0.7166250518588058, 3.9352825229007844, 27.58930935849358, 1905)
-    femmesh.addNode(-0.9949131461929048, 3.874293204125436, 36.71970858954144, 1906)
-    femmesh.addNode(-0.9871072543296628, 3.876289368513367, 35.75048831488147, 1907)
-    femmesh.addNode(-0.9422003524319836, -3.887448841576831, 12.828323743025567, 1908)
-    femmesh.addNode(-0.9603341413077057, -3.883008928271836, 13.728690057123048, 1909)
-    femmesh.addNode(-0.9978690829087309, -3.8735329214264964, 14.59727012244483, 1910)
-    femmesh.addNode(-1.0122050321752953, -3.869811490607651, 15.49888446590629, 1911)
-    femmesh.addNode(-1.7496294840790503, -3.5970538873418723, 14.106437560211408, 1912)
-    femmesh.addNode(-1.0390886580103411, -3.8626797383156513, 16.41151344514021, 1913)
-    femmesh.addNode(-1.039903971875564, -3.86246032073825, 17.30489152011086, 1914)
-    femmesh.addNode(-1.8092094480458993, -3.5674586435026057, 15.88764660476711, 1915)
-    femmesh.addNode(-1.0496762757575315, -3.8598160210185926, 18.229479096469646, 1916)
-    femmesh.addNode(-1.0649383021684562, -3.855633075459148, 19.12235454199356, 1917)
-    femmesh.addNode(-1.8429625190298344, -3.550139314653892, 17.72486316035981, 1918)
-    femmesh.addNode(-1.0592129221740165, -3.8572098705540485, 20.0056450538556, 1919)
-    femmesh.addNode(-1.0736661630910542, -3.8532117733435487, 20.92591252881546, 1920)
-    femmesh.addNode(-1.8466760279393029, -3.5482090761163327, 19.532741248580635, 1921)
-    femmesh.addNode(-1.0675385648643194, -3.8549139306250964, 21.83930044237415, 1922)
-    femmesh.addNode(-1.0597140724806542, -3.857072216667257, 22.734301495042935, 1923)
-    femmesh.addNode(-1.8357582027828723, -3.5538699780542617, 21.32941967400137, 1924)
-    femmesh.addNode(-1.0848910120514599, -3.8500664269555087, 23.635875654977802, 1925)
-    femmesh.addNode(-1.0844449257909126, -3.850192099483653, 24.537766193507093, 1926)
-    femmesh.addNode(-1.8533041805914154, -3.544751558882848, 23.144381747494926, 1927)
-    femmesh.addNode(-1.087562007386711, -3.849312780236102, 25.445838017599428, 1928)
-    femmesh.addNode(-1.0859654093142823, -3.8497635160841845, 26.349413473500945, 1929)
-    femmesh.addNode(-1.8792833332615293, -3.5310471751769947, 24.954027731522128, 1930)
-    femmesh.addNode(-1.0863274313475588, -3.849661376264387, 27.25722247484778, 1931)
-    femmesh.addNode(-1.078814125902134, -3.85177362805163, 28.157678568455236, 1932)
-    femmesh.addNode(-1.8824736515658929, -3.5293473831800934, 26.769908556961298, 1933)
-    femmesh.addNode(-1.0587420669646803, -3.8573391393082557, 29.04257414974675, 1934)
-    femmesh.addNode(-1.0605152198826675, -3.8568520153613903, 29.929194030311464, 1935)
-    femmesh.addNode(-1.8644024786796398, -3.538926870888012, 28.562613139599648, 1936)
-    femmesh.addNode(-1.0632986946392267, -3.856085565178568, 30.844495000320922, 1937)
-    femmesh.addNode(-1.0720897687177657, -3.853650675374026, 31.74782235990326, 1938)
-    femmesh.addNode(-1.8485096376866077, -3.5472541661656734, 30.36280969090062, 1939)
-    femmesh.addNode(-1.0741313735280178, -3.8530821159693462, 32.668499268958016, 1940)
-    femmesh.addNode(-1.068428188404633, -3.854667457281159, 33.56593152331017, 1941)
-    femmesh.addNode(-1.85294790146031, -3.5449378096764734, 32.19878756996483, 1942)
-    femmesh.addNode(-1.0621265853475546, -3.85640857751068, 34.45871477411704, 1943)
-    femmesh.addNode(-1.0638685743585186, -3.8559283780293914, 35.350309444070646, 1944)
-    femmesh.addNode(-1.8490310160242345, -3.5469824219722863, 34.01224772982644, 1945)
-    femmesh.addNode(-1.0705209608726958, -3.854086775402469, 36.23726450875118, 1946)
-    femmesh.addNode(-1.0819485851610888, -3.8508943453525077, 37.127728190519406, 1947)
-    femmesh.addNode(-1.8493545607416912, -3.5468137403398994, 35.79198604531385, 1948)
-    femmesh.addNode(-1.0700567529299592, -3.854215684871436, 38.02841718114294, 1949)
-    femmesh.addNode(-1.0754399863635828, -3.85271707185076, 38.92885282526848, 1950)
-    femmesh.addNode(-1.844525320106803, -3.549327590331005, 37.57963010061792, 1951)
-    femmesh.addNode(-1.0510413333924324, -3.8594445345801587, 39.78552065312488, 1952)
-    femmesh.addNode(-1.0777445133184314, -3.8520730475955434, 40.720056090098325, 1953)
-    femmesh.addNode(-1.8110305873756223, -3.5665344820413427, 39.33698691909786, 1954)
-    femmesh.addNode(0.7247727746480974, 3.9337900840193414, 10.56870772399353, 1955)
-    femmesh.addNode(-0.08504999000717842, 3.999095710182463, 10.163223207171129, 1956)
-    femmesh.addNode(-3.766041066551296, -1.3479371962555144, 5.399764290239821, 1957)
-    femmesh.addNode(-3.3732758730972434, -2.1496534334585258, 5.398864794887471, 1958)
-    femmesh.addNode(-3.118237072584956, -2.505313864400388, 6.149712484864968, 1959)
-    femmesh.addNode(-3.8940609615595703, -0.9144885060282355, 6.15918327458408, 1960)
-    femmesh.addNode(-1.1905327785737148, -3.818721213068787, 41.586685693731255, 1961)
-    femmesh.addNode(-1.3549479813819605, -3.763524407752519, 42.63489217414121, 1962)
-    femmesh.addNode(-2.2690446174424994, -3.294151867181479, 42.7899369083516, 1963)
-    femmesh.addNode(-1.8928487264939435, -3.5237939353217373, 41.06028435058718, 1964)
-    femmesh.addNode(-1.6983516178864497, 3.6215468769605175, 42.80957289248279, 1965)
-    femmesh.addNode(-1.6404202592732315, 3.6481531454923797, 41.74119370870852, 1966)
-    femmesh.addNode(-2.5038607231272767, 3.1194040262813907, 43.0734333488033, 1967)
-    femmesh.addNode(-0.9942729337291517, 3.874457553420043, 19.33947004294621, 1968)
-    femmesh.addNode(-1.0116327517727952, 3.869961133595608, 18.418763524809915, 1969)
-    femmesh.addNode(-3.1027228593614686, 2.5245021010083937, 42.97361361766728, 1970)
-    femmesh.addNode(0.7375103426537551, 3.9314219430733637, 8.025665337745522, 1971)
-    femmesh.addNode(0.7331924203065722, 3.93222950434038, 7.159899686582406, 1972)
-    femmesh.addNode(0.009884054136456353, 3.9999877881655874, 6.864753441899733, 1973)
-    femmesh.addNode(-0.06402023343700126, 3.9994876434001734, 8.47934968421547, 1974)
-    femmesh.addNode(-1.0009591287502257, 3.8727355735412132, 34.75936562271855, 1975)
-    femmesh.addNode(-0.9633549045986811, 3.882260595038111, 33.70747623101475, 1976)
-    femmesh.addNode(-1.2230256847005467, -3.8084390732375857, 6.855011348973147, 1977)
-    femmesh.addNode(-0.668872258902565, -3.943679741215123, 7.442042104187374, 1978)
-    femmesh.addNode(-0.7693389344718035, -3.925317516317093, 8.309064550220258, 1979)
-    femmesh.addNode(-2.0390912054895707, -3.4412362685080327, 6.940966044921183, 1980)
-    femmesh.addNode(0.720843262030977, 3.9345120398322, 11.4262304465962, 1981)
-    femmesh.addNode(-0.9640831990060688, 3.8820798015231763, 32.69822316530161, 1982)
-    femmesh.addNode(-0.9467217575516653, 3.886350204726574, 31.644403131592327, 1983)
-    femmesh.addNode(-0.9387510581413928, 3.88828322667452, 24.84325207944703, 1984)
-    femmesh.addNode(-0.9384366394079571, 3.8883591235657105, 23.890695710897923, 1985)
-    femmesh.addNode(-0.4685456673818681, 3.9724633362156636, 40.275833432489144, 1986)
-    femmesh.addNode(-0.9235504135280098, 3.8919217147409637, 10.604703843995805, 1987)
-    femmesh.addNode(-0.9359323224698852, 3.8889626750273814, 9.733779676941833, 1988)
-    femmesh.addNode(-0.09548362865880941, 3.998860197188462, 11.871786175966754, 1989)
-    femmesh.addNode(-1.064411894978264, 3.8557784321494384, 37.67522794828942, 1990)
-    femmesh.addNode(-1.8166585174070933, 3.563671117139215, 37.10866918015118, 1991)
-    femmesh.addNode(-1.1330558417187522, 3.836167939434744, 38.65960574647947, 1992)
-    femmesh.addNode(-2.334148681771056, 3.2483457222694816, 41.101695842412, 1993)
-    femmesh.addNode(-1.3728835274096427, 3.757018874076527, 40.65714604462198, 1994)
-    femmesh.addNode(-1.7623010064810594, 3.5908627323466216, 31.14579292487386, 1995)
-    femmesh.addNode(-0.9282918263805561, 3.890793528970029, 30.637797750815118, 1996)
-    femmesh.addNode(-2.942934303976949, -2.709084288551338, 42.93763695883374, 1997)
-    femmesh.addNode(-3.487547508976773, -1.958829337290492, 42.98445123763442, 1998)
-    femmesh.addNode(-2.71456603442826, -2.937878698096372, 42.074614004702255, 1999)
-    femmesh.addNode(-3.74111607312591, 1.4156449157182638, 6.905389881575777, 2000)
-    femmesh.addNode(-3.965120189093414, 0.5270881198090216, 6.948325807277869, 2001)
-    femmesh.addNode(-0.9467947381738604, 3.8863324257925096, 29.59770715956931, 2002)
-    femmesh.addNode(-1.7651342935980994, 3.589470841999408, 35.16202712924027, 2003)
-    femmesh.addNode(-0.9563671827122417, 3.883987874830591, 20.24709206489311, 2004)
-    femmesh.addNode(-1.7610580087544996, 3.5914724960385866, 19.80594007917962, 2005)
-    femmesh.addNode(-0.9453665861521346, 3.8866800765932688, 21.125486824598234, 2006)
-    femmesh.addNode(-1.7786279510495588, 3.58280373614649, 33.16165137136421, 2007)
-    femmesh.addNode(-0.9204746690079479, 3.8926503032914104, 26.71833548992964, 2008)
-    femmesh.addNode(-0.9223884657223574, 3.892197260969998, 25.789227828014063, 2009)
-    femmesh.addNode(-1.250344095974751, 3.7995578218604704, 39.63633556619263, 2010)
-    femmesh.addNode(-3.6798658620437665, 1.567988277177124, 42.98139227341639, 2011)
-    femmesh.addNode(-3.3119403567379337, 2.2430004621958077, 42.193522162247646, 2012)
-    femmesh.addNode(-1.711688169640412, 3.6152625921104344, 9.346457490938235, 2013)
-    femmesh.addNode(-0.9137276014683173, 3.894239575361916, 8.904976854113558, 2014)
-    femmesh.addNode(-0.8808241494715382, 3.9018135293357807, 8.09202749821187, 2015)
-    femmesh.addNode(-0.9539932583247974, 3.8845716447339256, 22.96875119334289, 2016)
-    femmesh.addNode(-0.964096521486235, 3.88207649296844, 22.040400424911578, 2017)
-    femmesh.addNode(-1.7462085919393844, 3.5987158200442937, 23.465333819308242, 2018)
-    femmesh.addNode(-0.7416601329756802, -3.9306412005109923, 9.298008232301378, 2019)
-    femmesh.addNode(-0.7985694802806994, -3.91947532013715, 10.217278877753007, 2020)
-    femmesh.addNode(-1.0264022687396663, 3.8660701471553858, 17.523017628195248, 2021)
-    femmesh.addNode(-1.0254967112583564, 3.866310449924876, 16.61802972506844, 2022)
-    femmesh.addNode(-1.809701173373792, 3.567209226144371, 18.002572160618058, 2023)
-    femmesh.addNode(-0.10295782812057738, 3.9986747411647143, 28.10683396045195, 2024)
-    femmesh.addNode(-3.940023720240467, 0.6900819400205113, 42.97162778283227, 2025)
-    femmesh.addNode(-1.716608884957081, 3.61292872003952, 25.333254085430312, 2026)
-    femmesh.addNode(-1.5494098740113889, -3.687726812321652, 10.617166741662817, 2027)
-    femmesh.addNode(-0.8423232690563283, -3.910305807786171, 11.101170401635695, 2028)
-    femmesh.addNode(-0.8757834069150686, -3.9029480427200456, 11.959924128353506, 2029)
-    femmesh.addNode(-0.9797461518572391, 3.878156453512536, 15.714179411391019, 2030)
-    femmesh.addNode(-0.9606621387838036, 3.8829277942175704, 14.855560270638854, 2031)
-    femmesh.addNode(-0.7291792943622425, 3.9329756618460507, 6.493857966958588, 2032)
-    femmesh.addNode(-1.3854018916878172, 3.7524207651205397, 6.205590724833906, 2033)
-    femmesh.addNode(-2.0500726965480705, 3.4347055097734542, 6.363510125831626, 2034)
-    femmesh.addNode(-0.7686122885288608, 3.9254598647702954, 7.295504853372636, 2035)
-    femmesh.addNode(-0.9440069863284732, 3.887010523495278, 13.99475051795524, 2036)
-    femmesh.addNode(-0.9328546625772097, 3.8897020680905574, 13.14346555449486, 2037)
-    femmesh.addNode(-1.7232196834625446, 3.609780314995256, 14.438315883964929, 2038)
-    femmesh.addNode(-1.6528711987056022, -3.642528901805654, 12.369457880217565, 2039)
-    femmesh.addNode(-0.9048904648310964, 3.8963025096439523, 11.456461748597775, 2040)
-    femmesh.addNode(-1.7149916710224333, 3.6136966624667988, 11.027018218368479, 2041)
-    femmesh.addNode(-0.9274414564903957, 3.8909963177550004, 12.294100550339426, 2042)
-    femmesh.addNode(-3.307252802131451, 2.249906420897026, 6.749993376495028, 2043)
-    femmesh.addNode(-3.492487513006399, 1.9500079413926448, 7.595769293812292, 2044)
-    femmesh.addNode(-2.7600673607258, 2.8951732528911145, 6.621391830981651, 2045)
-    femmesh.addNode(-3.0358161990650956, 2.604576742101095, 41.36371921966778, 2046)
-    femmesh.addNode(-2.8399486267369016, 2.8168584979539153, 40.279671555581245, 2047)
-    femmesh.addNode(-3.63771321026025, 1.6634429956863772, 41.371497875416885, 2048)
-    femmesh.addNode(-2.506570864416177, 3.117226732475509, 35.60073990431104, 2049)
-    femmesh.addNode(-2.5176992916239365, 3.1082455303525056, 34.60961721214811, 2050)
-    femmesh.addNode(-2.525154581371634, -3.1021918606330345, 15.336088807934903, 2051)
-    femmesh.addNode(-2.546664115639613, -3.0845586203075324, 16.24871778716882, 2052)
-    femmesh.addNode(-2.5687688794842174, -3.0661745618593534, 17.149190849004984, 2053)
-    femmesh.addNode(-2.5765209395, -3.059663355390269, 18.07377842536377, 2054)
-    femmesh.addNode(-3.161015633724863, -2.4511181455301174, 16.597633052172778, 2055)
-    femmesh.addNode(-2.568791353218445, -3.066155733753612, 19.017128163722575, 2056)
-    femmesh.addNode(-2.5642364012672796, -3.069966071215744, 19.900418675584614, 2057)
-    femmesh.addNode(-3.172413337675371, -2.4363484182151396, 18.441455852367746, 2058)
-    femmesh.addNode(-2.5613849289556656, -3.0723455609222703, 20.830549563638918, 2059)
-    femmesh.addNode(-2.55649695360922, -3.076414036859599, 21.74393747719761, 2060)
-    femmesh.addNode(-3.163983990862787, -2.4472852930469697, 20.31493647878085, 2061)
-    femmesh.addNode(-2.554544803116913, -3.078035225410582, 22.62546118183367, 2062)
-    femmesh.addNode(-2.574600127310633, -3.0612798278582884, 23.527035341768535, 2063)
-    femmesh.addNode(-3.160155375257518, -2.4522271518419774, 22.126591071471218, 2064)
-    femmesh.addNode(-2.57189565549469, -3.06355230692207, 24.443429248623605, 2065)
-    femmesh.addNode(-2.5743753202416864, -3.0614688811958413, 25.35150107271594, 2066)
-    femmesh.addNode(-3.1564304742815814, -2.4570198739584, 23.924508682962347, 2067)
-    femmesh.addNode(-2.5796388316130905, -3.0570350829576443, 26.271420098392095, 2068)
-    femmesh.addNode(-2.5799262998743826, -3.0567924835056233, 27.17922909973893, 2069)
-    femmesh.addNode(-3.158486887876727, -2.4543758023397286, 25.760821615493573, 2070)
-    femmesh.addNode(-2.5804366072439655, -3.056361712231596, 28.072703069275562, 2071)
-    femmesh.addNode(-2.5644861563376384, -3.069757442201681, 28.95759865056708, 2072)
-    femmesh.addNode(-3.1631138338546436, -2.448409866439314, 27.574214610706363, 2073)
-    femmesh.addNode(-2.5721997958225944, -3.0632969510594634, 29.879509583655835, 2074)
-    femmesh.addNode(-2.574410114454817, -3.0614396225620286, 30.794810553665293, 2075)
-    femmesh.addNode(-3.1696700222464154, -2.439916381778771, 29.389599513331753, 2076)
-    femmesh.addNode(-2.5557371475699058, -3.0770452763213023, 31.722301013676827, 2077)
-    femmesh.addNode(-2.5573670802296746, -3.0756907544416014, 32.642977922731575, 2078)
-    femmesh.addNode(-3.160943135614501, -2.451211637825581, 31.239000906432047, 2079)
-    femmesh.addNode(-2.5555500476444815, -3.0772006684622126, 33.56247916737975, 2080)
-    femmesh.addNode(-2.55051717167076, -3.0813734205728114, 34.45526241818662, 2081)
-    femmesh.addNode(-3.1445122138470145, -2.4722546262403773, 33.085992611091754, 2082)
-    femmesh.addNode(-2.546866642174562, -3.0843913997705403, 35.36713643814443, 2083)
-    femmesh.addNode(-2.5521854202768703, -3.079991815009607, 36.25409150282496, 2084)
-    femmesh.addNode(-3.1401196158061047, -2.477831470949895, 34.917367875697735, 2085)
-    femmesh.addNode(-2.5472551892863247, -3.0840705245914677, 37.16554689557594, 2086)
-    femmesh.addNode(-2.5377233558200545, -3.0919185256609527, 38.06623588619948, 2087)
-    femmesh.addNode(-3.13320967615068, -2.4865633161606304, 36.740697288406515, 2088)
-    femmesh.addNode(-2.488772352884615, -3.1314552807787592, 38.935807477223015, 2089)
-    femmesh.addNode(-2.4689090165331047, -3.147139696308624, 39.792475305079414, 2090)
-    femmesh.addNode(-3.0896474679222297, -2.5404878515674416, 38.52172427218103, 2091)
-    femmesh.addNode(-3.830466102331015, -1.1521846375008828, 42.96289431724726, 2092)
-    femmesh.addNode(-3.991489287834987, -0.2607935296332096, 42.960577481038925, 2093)
-    femmesh.addNode(-3.712065524720753, -1.4901575554885604, 42.200757134797236, 2094)
-    femmesh.addNode(-2.3704255560401757, -3.2219687588913124, 40.52941090623699, 2095)
-    femmesh.addNode(-2.4641294042614996, -3.150883412481945, 41.39604050986992, 2096)
-    femmesh.addNode(-3.1013989667071273, -2.5261283517089868, 41.54374056035206, 2097)
-    femmesh.addNode(-2.967804953501169, -2.681815384767178, 40.128231464362145, 2098)
-    femmesh.addNode(-2.557268531527133, 3.075772692781614, 9.792861566036729, 2099)
-    femmesh.addNode(-2.5396772849538496, 3.090313784761904, 8.964058743208454, 2100)
-    femmesh.addNode(-0.9048858779021535, 3.896303574924989, 27.671658423928378, 2101)
-    femmesh.addNode(-1.6868934087839167, 3.626898210234384, 27.232552767996083, 2102)
-    femmesh.addNode(-1.9879848327441794, 3.471010847689632, 39.040918358612316, 2103)
-    femmesh.addNode(-2.417893681655697, 3.186501238695736, 25.82702153762103, 2104)
-    femmesh.addNode(-2.431274857439591, 3.1763032864608656, 24.881045789053996, 2105)
-    femmesh.addNode(-1.5864236904980216, 3.6719558649617015, 7.721132023270725, 2106)
-    femmesh.addNode(-1.5341679209681793, -3.694093771180176, 8.744331535699013, 2107)
-    femmesh.addNode(-2.4692210492182407, 3.1468948838652953, 31.64709827193197, 2108)
-    femmesh.addNode(-2.454278655548365, 3.1585623756575885, 30.640492891154764, 2109)
-    femmesh.addNode(-0.9075778674021822, 3.8956774012489417, 28.621051238518397, 2110)
-    femmesh.addNode(-3.9883143830214367, 0.30552967480154347, 42.19025051620341, 2111)
-    femmesh.addNode(-2.241055714490959, -3.313256598053857, 10.131167904310658, 2112)
-    femmesh.addNode(-2.277944377305112, -3.288003864642502, 11.015059428193345, 2113)
-    femmesh.addNode(-1.7811183292223858, 3.581566346908578, 16.202975950325964, 2114)
-    femmesh.addNode(-2.486760744544939, 3.133052983814717, 33.64112924036083, 2115)
-    femmesh.addNode(-2.487348460937308, 3.1325864128340983, 32.631876174647694, 2116)
-    femmesh.addNode(-2.2985134896307793, -3.2736578529200844, 11.873031521684794, 2117)
-    femmesh.addNode(-2.3539943970884276, -3.233992946571821, 12.741431136356855, 2118)
-    femmesh.addNode(-2.894655005844085, -2.7606108739084867, 11.387032684332635, 2119)
-    femmesh.addNode(-2.5180610286515805, 3.1079524861210706, 36.5357404787225, 2120)
-    femmesh.addNode(-3.1449924413717545, 2.471643692710285, 35.98333056163033, 2121)
-    femmesh.addNode(-2.573534793147026, 3.0621754796976766, 37.49125983747048, 2122)
-    femmesh.addNode(-3.089651480115521, 2.540482972078335, 8.425417803519245, 2123)
-    femmesh.addNode(-2.3605012279429074, 3.2292466540789393, 7.9790137284207505, 2124)
-    femmesh.addNode(-3.931506535904936, 0.7370592636530454, 41.4384180294165, 2125)
-    femmesh.addNode(-3.8223807144735322, 1.1787305347791797, 40.608615086836636, 2126)
-    femmesh.addNode(-3.9943176904080917, -0.21313420207223405, 41.427367727623164, 2127)
-    femmesh.addNode(-1.708899094682701, 3.6165817955899526, 29.162531623045737, 2128)
-    femmesh.addNode(-2.496863799106199, 3.125007386985343, 18.480503917248313, 2129)
-    femmesh.addNode(-2.5087779897434013, 3.115450689415427, 17.584758020633643, 2130)
-    femmesh.addNode(-3.3885800619415445, -2.1254470503431127, 6.890623727474443, 2131)
-    femmesh.addNode(-2.8295451747703306, -2.82730863259283, 6.867455478833946, 2132)
-    femmesh.addNode(-1.743260334677134, 3.600144914519604, 21.62847570143986, 2133)
-    femmesh.addNode(-2.3409404179060216, 3.2434546335372074, 10.613760087154692, 2134)
-    femmesh.addNode(-3.059588554988362, 2.5766097636592593, 10.231361339424911, 2135)
-    femmesh.addNode(-2.325371526877763, 3.2546347355711336, 11.46551799175666, 2136)
-    femmesh.addNode(-2.4703567004481832, 3.146003460352637, 29.671420859341282, 2137)
-    femmesh.addNode(-2.4385239255433455, 3.170741406130855, 28.694764938290362, 2138)
-    femmesh.addNode(-2.4348235170269037, 3.1735838481018175, 27.758950413211238, 2139)
-    femmesh.addNode(-2.4475071645697497, 3.163812364755493, 26.805627479212497, 2140)
-    femmesh.addNode(-3.0526370919776635, 2.5848417330045863, 26.353419182836184, 2141)
-    femmesh.addNode(-3.079591487816675, 2.5526684602915197, 28.26783964950678, 2142)
-    femmesh.addNode(-2.679083305969006, 2.9702714757540565, 39.38033340020102, 2143)
-    femmesh.addNode(-2.5865914353307753, 3.051154657940741, 38.40360358048787, 2144)
-    femmesh.addNode(-3.164574304595206, 2.4465219129809097, 37.83067487905918, 2145)
-    femmesh.addNode(-3.3052482425419374, 2.2528502069985556, 39.6423567774568, 2146)
-    femmesh.addNode(-2.266961169080341, 3.2955859961290486, 7.1824910835815166, 2147)
-    femmesh.addNode(-2.448307212381597, 3.1631932906163436, 23.964920920990643, 2148)
-    femmesh.addNode(-2.4609490767622146, 3.1533679838520596, 23.04297640343561, 2149)
-    femmesh.addNode(-2.4256718936047266, -3.1805842017742685, 7.681877287530657, 2150)
-    femmesh.addNode(-3.07125133719176, 2.56269686537402, 32.12657614092859, 2151)
-    femmesh.addNode(-3.0695257206282145, 2.5647635076945865, 30.17272620639939, 2152)
-    femmesh.addNode(-3.9984492351499603, 0.11137196204026807, 7.752361214965365, 2153)
-    femmesh.addNode(-3.9742200708131104, -0.45340360469038676, 6.949521223350193, 2154)
-    femmesh.addNode(-3.0423949818873783, 2.596889056965372, 24.458688373181364, 2155)
-    femmesh.addNode(-3.777678210246136, -1.3149704710872985, 6.963218682271577, 2156)
-    femmesh.addNode(-2.097419383985436, -3.4059994021846443, 9.346364281760966, 2157)
-    femmesh.addNode(-2.75591675437473, -2.8991244959395335, 9.744256968291491, 2158)
-    femmesh.addNode(-2.528388896313774, 3.0995563535766237, 16.680472886011895, 2159)
-    femmesh.addNode(-2.4915923499796713, 3.1292119713312454, 15.776622572334471, 2160)
-    femmesh.addNode(-2.412134912347571, -3.190862761798755, 13.601403949695065, 2161)
-    femmesh.addNode(-2.4429032427315893, -3.167368583959165, 14.469984015016845, 2162)
-    femmesh.addNode(-3.111074286800109, 2.5142030112962623, 34.079842015431595, 2163)
-    femmesh.addNode(-2.4749515373076183, 3.142389996161943, 14.890714544318605, 2164)
-    femmesh.addNode(-2.461457195516652, 3.1529713723152164, 14.02990479163499, 2165)
-    femmesh.addNode(-3.1080486839137653, 2.5179422905265145, 15.368211480004536, 2166)
-    femmesh.addNode(-1.7026938278184955, 3.619507387574834, 12.72814112712588, 2167)
-    femmesh.addNode(-2.9610584305825465, -2.6892625328658464, 13.104977591162294, 2168)
-    femmesh.addNode(-3.077338019057732, -2.555384651370872, 14.831055197418559, 2169)
-    femmesh.addNode(-2.515706387273535, 3.109858738436706, 19.39732565402753, 2170)
-    femmesh.addNode(-3.104846742538258, 2.5218895109321435, 18.979511514043118, 2171)
-    femmesh.addNode(-2.4851990878059778, 3.1342918648345974, 20.304947675974425, 2172)
-    femmesh.addNode(-3.949018116220382, 0.6365971392986518, 8.626050268934343, 2173)
-    femmesh.addNode(-3.9852437171455826, -0.3432674102673573, 8.627245685006667, 2174)
-    femmesh.addNode(-3.5973638335918108, 1.7489921237002841, 8.580814308599994, 2175)
-    femmesh.addNode(-3.6262478768005155, -1.6882909512284174, 17.892996788629606, 2176)
-    femmesh.addNode(-3.62197575019311, -1.697436792641499, 18.83634652698841, 2177)
-    femmesh.addNode(-3.6278605364267458, -1.6848228180545999, 19.764095294941164, 2178)
-    femmesh.addNode(-3.6262946676615897, -1.6881904463919708, 20.694226182995468, 2179)
-    femmesh.addNode(-3.9073964909874936, -0.8557176299566468, 19.215636231203028, 2180)
-    femmesh.addNode(-3.6288226473144585, -1.6827495934742294, 21.60725902518113, 2181)
-    femmesh.addNode(-3.6277544031948046, -1.6850513315922175, 22.48878272981719, 2182)
-    femmesh.addNode(-3.9116092089386107, -0.8362496018215224, 21.056417841341442, 2183)
-    femmesh.addNode(-3.6242264638684185, -1.692625929907674, 23.40084421854845, 2184)
-    femmesh.addNode(-3.622730264097906, -1.6958258853989447, 24.31723812540352, 2185)
-    femmesh.addNode(-3.9111158898455844, -0.8385538123444323, 22.881512172258365, 2186)
-    femmesh.addNode(-3.6175657142607482, -1.706815251573855, 25.239694675517615, 2187)
-    femmesh.addNode(-3.6204969715041906, -1.7005886273079047, 26.15961370119377, 2188)
-    femmesh.addNode(-3.9067673146216726, -0.8585855515927138, 24.71603021110372, 2189)
-    femmesh.addNode(-3.623470682134917, -1.6942432575367439, 27.080988391719522, 2190)
-    femmesh.addNode(-3.6237534920986993, -1.6936382814823483, 27.97446236125616, 2191)
-    femmesh.addNode(-3.9056619244926636, -0.8635999835388276, 26.559861451743565, 2192)
-    femmesh.addNode(-3.6226620580040256, -1.6959715839300016, 28.896656746937104, 2193)
-    femmesh.addNode(-3.6269166908197086, -1.6868536741085207, 29.81856768002586, 2194)
-    femmesh.addNode(-3.906616323516731, -0.8592723088943461, 28.403430527950267, 2195)
-    femmesh.addNode(-3.6221779071280578, -1.6970053650809134, 30.75546025036617, 2196)
-    femmesh.addNode(-3.6117865554493966, -1.7190107265153942, 31.682950710377703, 2197)
-    femmesh.addNode(-3.9036331268055586, -0.8727247053374038, 30.26251748397152, 2198)
-    femmesh.addNode(-3.613453235066803, -1.7155045082963947, 32.623407081340005, 2199)
-    femmesh.addNode(-3.612439381233123, -1.7176384127388549, 33.54290832598818, 2200)
-    femmesh.addNode(-3.902029269888614, -0.8798679315286656, 32.13986642527413, 2201)
-    femmesh.addNode(-3.6087968582064582, -1.7252783068824569, 34.47679933216361, 2202)
-    femmesh.addNode(-3.6067513773329707, -1.7295503757065647, 35.388673352121415, 2203)
-    femmesh.addNode(-3.9010189062928085, -0.8843367530223207, 34.01421380241186, 2204)
-    femmesh.addNode(-3.6068509799742188, -1.7293426520672581, 36.32413947592087, 2205)
-    femmesh.addNode(-3.6040799903410488, -1.7351102049216545, 37.23559486867185, 2206)
-    femmesh.addNode(-3.899190361183765, -0.8923645708182398, 35.88357093238675, 2207)
-    femmesh.addNode(-3.604920251451214, -1.733363776209978, 38.24696861236613, 2208)
-    femmesh.addNode(-3.577207768142891, -1.7898560231309542, 39.11654020338966, 2209)
-    femmesh.addNode(-3.8996735440700876, -0.8902506667674236, 37.83041079988049, 2210)
-    femmesh.addNode(-3.5294390256895336, -1.882301825940706, 41.43262774068198, 2211)
-    femmesh.addNode(-3.854683553535551, -1.0683701147554336, 41.411070820294825, 2212)
-    femmesh.addNode(-3.9479437941923448, -0.6432260861455728, 40.659238333507915, 2213)
-    femmesh.addNode(-3.3629370462516675, -2.16579186972066, 40.754054245849645, 2214)
-    femmesh.addNode(-3.613638700860757, -1.7151137978692201, 7.680961676240555, 2215)
-    femmesh.addNode(-3.77266018270992, 1.3292987421174938, 9.455698778641295, 2216)
-    femmesh.addNode(-3.5704091506300237, 1.803379742898703, 32.62727115839478, 2217)
-    femmesh.addNode(-3.5599378490009332, 1.8239634073222548, 31.64249325567905, 2218)
-    femmesh.addNode(-2.495843614108286, 3.1258222364547366, 22.14256998654268, 2219)
-    femmesh.addNode(-2.4807424043760853, 3.137820441505594, 21.227656386229334, 2220)
-    femmesh.addNode(-3.1164725559514563, 2.507508486127494, 20.819041961077243, 2221)
-    femmesh.addNode(-3.084796059544201, 2.5463764982854697, 22.642157088225083, 2222)
-    femmesh.addNode(-3.571615636232238, -1.8009891024160543, 14.187771093308505, 2223)
-    femmesh.addNode(-3.617633190818084, -1.7066722288393188, 15.053875886226564, 2224)
-    femmesh.addNode(-3.1055188598944463, 2.5210618022650495, 17.158404642642154, 2225)
-    femmesh.addNode(-3.442277198261034, -2.0373334754850925, 10.860048115924105, 2226)
-    femmesh.addNode(-3.4549824486144396, -2.015712350452358, 11.718020209415554, 2227)
-    femmesh.addNode(-3.529199588764775, 1.8827507170792803, 24.982209700273685, 2228)
-    femmesh.addNode(-3.5392653561033107, 1.8637598394339616, 24.066084832210333, 2229)
-    femmesh.addNode(-3.558083265479837, 1.8275785826914093, 30.67266262003448, 2230)
-    femmesh.addNode(-3.5673583878245876, 1.809407121909704, 29.703590588220997, 2231)
-    femmesh.addNode(-3.9235552329972605, -0.77827651488389, 9.384518957888805, 2232)
-    femmesh.addNode(-3.787011186628434, -1.2878455933655624, 8.510829903919829, 2233)
-    femmesh.addNode(-2.121367644380204, -3.3911354023950127, 8.357420599679847, 2234)
-    femmesh.addNode(-2.4152833791909254, 3.18848023330929, 13.123493778330428, 2235)
-    femmesh.addNode(-2.410844449016053, 3.1918378785033057, 12.274128774174994, 2236)
-    femmesh.addNode(-2.9489107387311666, 2.7025775576282736, 11.860870642961208, 2237)
-    femmesh.addNode(-3.0574095406197426, 2.579195010255598, 13.575892438684106, 2238)
-    femmesh.addNode(-3.5915123422136817, 1.7609767448001112, 34.54097041681895, 2239)
-    femmesh.addNode(-3.5738777041425007, 1.796496077321943, 33.572482445031675, 2240)
-    femmesh.addNode(-3.6098741244428063, -1.723023158775959, 16.050027560916043, 2241)
-    femmesh.addNode(-3.6221652639127693, -1.697032351165922, 16.950500622752205, 2242)
-    femmesh.addNode(-3.90413479260935, -0.8704777545331904, 15.406743456805991, 2243)
-    femmesh.addNode(-3.341627687631461, -2.198527779504915, 12.576421412611577, 2244)
-    femmesh.addNode(-3.3808675040916203, -2.137693832095068, 13.436394225949783, 2245)
-    femmesh.addNode(-3.807336091191649, -1.2264550088403132, 13.659214914757788, 2246)
-    femmesh.addNode(-3.751095256520947, -1.3889868165342858, 12.049436844203044, 2247)
-    femmesh.addNode(-3.4037352574235054, -2.101091691805035, 8.438234949122695, 2248)
-    femmesh.addNode(-3.5750719187306386, 1.7941183840269934, 17.651858771368424, 2249)
-    femmesh.addNode(-3.5863229800618965, 1.771521234047156, 16.747573636746672, 2250)
-    femmesh.addNode(-3.902287036952591, -0.8787240074288211, 17.34539129737287, 2251)
-    femmesh.addNode(-3.6058968609174347, 1.7313312301306731, 36.417131895907715, 2252)
-    femmesh.addNode(-3.599481082201547, 1.744630602412207, 35.482131321496254, 2253)
-    femmesh.addNode(-3.576485875400081, 1.7912980720873108, 18.57503506961651, 2254)
-    femmesh.addNode(-3.8841657340342866, 0.9556445733398435, 18.164204063721034, 2255)
-    femmesh.addNode(-3.5531371116991335, 1.837176275011829, 23.13174320293082, 2256)
-    femmesh.addNode(-3.57333603835772, 1.797573241059723, 22.231336786037893, 2257)
-    femmesh.addNode(-3.88162013055643, 0.9659322761245134, 33.08839955978213, 2258)
-    femmesh.addNode(-3.428291177916885, -2.0607813080036554, 40.01711864469207, 2259)
-    femmesh.addNode(-3.531916354160271, 1.8776492929232598, 25.93586985239329, 2260)
-    femmesh.addNode(-3.858519892977614, 1.0544307637280053, 25.543266311422258, 2261)
-    femmesh.addNode(-3.5492744859275294, 1.844627502653008, 26.914475793984757, 2262)
-    femmesh.addNode(-3.8877915431036865, 0.9407852663448008, 34.97477175109633, 2263)
-    femmesh.addNode(-3.1950038832253265, -2.406647083844053, 9.113778261271884, 2264)
-    femmesh.addNode(-3.2949311138338375, -2.2679129072981854, 9.898581883821578, 2265)
-    femmesh.addNode(-3.5771402635790497, 1.7899909314523372, 10.384910462094393, 2266)
-    femmesh.addNode(-3.941484759337506, 0.6816875324590896, 10.43014642242874, 2267)
-    femmesh.addNode(-3.8787607611090973, 0.9773509902181379, 31.173357637500658, 2268)
-    femmesh.addNode(-2.896808521642621, -2.75835102714261, 8.28391003359261, 2269)
-    femmesh.addNode(-3.999990343807768, -0.00878916632067292, 11.275196873444429, 2270)
-    femmesh.addNode(-3.967584738986508, -0.5082040328070639, 10.345985189991332, 2271)
-    femmesh.addNode(-3.7303596022015633, -1.4437510998307823, 10.229569408904496, 2272)
-    femmesh.addNode(-3.5800860120809666, 1.7840919668285604, 15.811886321581465, 2273)
-    femmesh.addNode(-3.5705679956176644, 1.8030652203042614, 14.9259782935656, 2274)
-    femmesh.addNode(-3.8800235213055436, 0.9723258065667753, 16.305340450307735, 2275)
-    femmesh.addNode(-3.8648299680991696, 1.0310622278420316, 23.655264530023143, 2276)
-    femmesh.addNode(-3.876989998198093, 0.9843518445515058, 29.273268651632343, 2277)
-    femmesh.addNode(-3.5659286567558284, 1.8122231691840756, 28.77333223799725, 2278)
-    femmesh.addNode(-3.5638122267567063, 1.8163816813707978, 27.83751771291812, 2279)
-    femmesh.addNode(-3.5872475253035527, 1.7696483244428924, 19.49185680639573, 2280)
-    femmesh.addNode(-3.8198467292107727, -1.1869165789295222, 39.74236298487716, 2281)
-    femmesh.addNode(-3.6166461654912005, 1.708762860562517, 37.29867261586588, 2282)
-    femmesh.addNode(-3.8977212088798607, 0.8987599111265018, 36.7974733757318, 2283)
-    femmesh.addNode(-3.623912172689128, 1.693298722799838, 38.21101635888327, 2284)
-    femmesh.addNode(-3.9858291568361777, -0.3364014454704455, 39.75865989220551, 2285)
-    femmesh.addNode(-3.999736477913069, 0.045914129105925086, 17.764457614361607, 2286)
-    femmesh.addNode(-3.9997714475053376, 0.042759416753007005, 18.687633912609698, 2287)
-    femmesh.addNode(-3.9551555742024673, 0.5972808249518414, 39.98421313331127, 2288)
-    femmesh.addNode(-3.6943737831840275, 1.5334935116010555, 39.917292979311654, 2289)
-    femmesh.addNode(-3.999484849453275, 0.06419454021732456, 20.532650125218563, 2290)
-    femmesh.addNode(-3.999384067665276, 0.07019315711057639, 21.445682967404224, 2291)
-    femmesh.addNode(-3.9990277943576484, 0.08818559947633291, 22.345186792135365, 2292)
-    femmesh.addNode(-3.999203286055837, 0.07983155266056573, 23.257248280866627, 2293)
-    femmesh.addNode(-3.9989443466754313, 0.09189185052336502, 26.067706612379837, 2294)
-    femmesh.addNode(-3.9987772243382853, 0.0988974727351479, 26.989081302905593, 2295)
-    femmesh.addNode(-3.999436540860871, 0.0671368425443845, 27.912123221838954, 2296)
-    femmesh.addNode(-3.999478946855304, 0.06456123961936454, 28.8343176075199, 2297)
-    femmesh.addNode(-3.999528674625147, 0.06140342703151333, 29.764575957743652, 2298)
-    femmesh.addNode(-3.9996849667401375, 0.05020126326044644, 30.701468528083957, 2299)
-    femmesh.addNode(-3.9997338967582494, 0.04613843433701359, 31.671299163728527, 2300)
-    femmesh.addNode(-3.999687233441258, 0.05002034233205566, 32.61175553469083, 2301)
-    femmesh.addNode(-3.999776198200877, 0.04231269674386637, 33.556966821327734, 2302)
-    femmesh.addNode(-3.9998567757367005, 0.03384927758765458, 34.49085782750316, 2303)
-    femmesh.addNode(-3.9999693276383743, 0.015664544430398924, 35.43201873218046, 2304)
-    femmesh.addNode(-3.9999684188490194, 0.015894911464879733, 36.367484855979924, 2305)
-    femmesh.addNode(-3.999989642692208, -0.009102656483680643, 37.24902557593809, 2306)
-    femmesh.addNode(-3.581387122308803, 1.7814786779977674, 21.33183296130675, 2307)
-    femmesh.addNode(-3.583915183307295, 1.7763873335676084, 20.40912425105184, 2308)
-    femmesh.addNode(-3.883121056759838, 0.9598806480747268, 20.004647806625236, 2309)
-    femmesh.addNode(-3.876919536281716, 0.9846293257856817, 21.82141907601249, 2310)
-    femmesh.addNode(-3.4463546346455707, 2.030428460265713, 11.205808983212355, 2311)
-    femmesh.addNode(-3.603481606189344, 1.7363525891520606, 39.017954823931426, 2312)
-    femmesh.addNode(-3.9998355860625057, 0.036266850814627404, 16.821961448484206, 2313)
-    femmesh.addNode(-3.868247512085303, 1.0181655981449504, 27.419968382475226, 2314)
-    femmesh.addNode(-3.9984924826781763, 0.109808314649284, 24.191589910146142, 2315)
-    femmesh.addNode(-3.999415214632306, 0.06839547475984889, 14.89012245862952, 2316)
-    femmesh.addNode(-3.9996837393491713, 0.050298958098838456, 15.886274133318999, 2317)
-    femmesh.addNode(-3.9997950602245895, 0.040490445823345086, 39.06733778468052, 2318)
-    femmesh.addNode(-3.9995984374217666, 0.05667750323861054, 19.615382680562455, 2319)
-    femmesh.addNode(-3.4989760237941385, 1.9383412457340325, 12.01441976563069, 2320)
-    femmesh.addNode(-3.998807394496159, 0.09766996325810764, 25.114046460260234, 2321)
-    femmesh.addNode(-3.892567648509794, 0.9208241426976881, 38.48595256073813, 2322)
-    femmesh.addNode(-3.51076855931246, 1.9168996121192976, 13.116239727047683, 2323)
-    femmesh.addNode(-3.8325884643797257, 1.145105088061116, 12.46117806729883, 2324)
-    femmesh.addNode(-3.9697962383419068, 0.4906300297030826, 12.007573421129681, 2325)
-    femmesh.addNode(-3.9384275081920044, -0.6991342951940785, 11.923412188692275, 2326)
-    femmesh.addNode(-3.5383097634152945, 1.865573375163787, 14.022650740352246, 2327)
-    femmesh.addNode(-3.8586519047272674, 1.0539475689732543, 14.466325581929176, 2328)
-    femmesh.addNode(-3.8951492119395024, -0.9098420834007808, 12.781813391888296, 2329)
-    femmesh.addNode(-4.996718791864096, 0.18111133325170614, 30.68393946522783, 2330)
-    femmesh.addNode(-4.975604404847249, -0.4933161323782732, 29.791665550832356, 2331)
-    femmesh.addNode(-4.948263036286244, -0.7174210226381976, 30.608298640645415, 2332)
-    femmesh.addNode(-3.9727234345404967, 0.466335193452906, 13.109393382546674, 2333)
-    femmesh.addNode(-3.997594116339187, 0.13871294463861616, 13.986794905416167, 2334)
-    femmesh.addNode(-4.991232298596126, 0.2959732106979115, 29.059722761396134, 2335)
-    femmesh.addNode(-4.963452948522945, -0.6034358522650813, 28.984081936813723, 2336)
-    femmesh.addNode(-3.9999935835459697, -0.007164606833069707, 38.26039931963237, 2337)
-    femmesh.addNode(-3.9648405726820086, -0.5291873328175978, 13.533190259247018, 2338)
-    femmesh.addNode(-4.928863220275538, 0.8404209396576539, 31.182780467631098, 2339)
-    femmesh.addNode(-4.885900561387838, 1.062062005831117, 30.366147377818038, 2340)
-    femmesh.addNode(-4.999801229357236, -0.044583258268916376, 36.399752381792155, 2341)
-    femmesh.addNode(-4.946274098537561, -0.731007894715534, 36.45718906038336, 2342)
-    femmesh.addNode(-4.9906254711245674, -0.3060349766982331, 37.27429722933592, 2343)
-    femmesh.addNode(4.1287091334570345, 1.7832234730736127, 0.0, 2344)
-    femmesh.addNode(3.64805071213184, 2.5512441116644786, 0.0, 2345)
-    femmesh.addNode(3.0795020195761036, 3.2609088845757985, 0.0, 2346)
-    femmesh.addNode(2.3846688777343887, 3.7929179863070988, 0.0, 2347)
-    femmesh.addNode(1.5606748690934826, 4.177502930684805, 0.0, 2348)
-    femmesh.addNode(0.709468117776937, 4.439368320075479, 0.0, 2349)
-    femmesh.addNode(-0.1752550938102746, 4.425469977253883, 0.0, 2350)
-    femmesh.addNode(-1.109924808255904, 4.360767185235435, 0.0, 2351)
-    femmesh.addNode(-2.7380436816945566, 3.5657331488158563, 0.0, 2352)
-    femmesh.addNode(-3.379308007171816, 2.9039996985939722, 0.0, 2353)
-    femmesh.addNode(-3.92070533540089, 2.173410457840637, 0.0, 2354)
-    femmesh.addNode(-4.268255528823278, 1.3702693479610373, 0.0, 2355)
-    femmesh.addNode(-4.431325222736495, 0.5005932013516076, 0.0, 2356)
-    femmesh.addNode(-4.476848022954945, -0.4042912630705751, 0.0, 2357)
-    femmesh.addNode(-4.242851530543674, -1.270318762061371, 0.0, 2358)
-    femmesh.addNode(-3.9477385898947075, -2.1595331786439944, 0.0, 2359)
-    femmesh.addNode(-2.785088998615962, -3.534136551213229, 0.0, 2360)
-    femmesh.addNode(-1.958464549331799, -3.975142159162277, 0.0, 2361)
-    femmesh.addNode(0.6421747604140963, -4.435320014050891, 0.0, 2362)
-    femmesh.addNode(1.5354127826203288, -4.208964254333004, 0.0, 2363)
-    femmesh.addNode(2.3055970436109146, -3.825635664486841, 0.0, 2364)
-    femmesh.addNode(3.0670155480490164, -3.279709124102419, 0.0, 2365)
-    femmesh.addNode(3.6049148990380884, -2.6083009830461745, 0.0, 2366)
-    femmesh.addNode(4.129104429712001, -1.7765461588609317, 0.0, 2367)
-    femmesh.addNode(4.335822356141529, -0.8910296967831287, 0.0, 2368)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 0.0, 2369)
-    femmesh.addNode(4.324441214720629, 0.9203113817116942, 0.0, 2370)
-    femmesh.addNode(-1.9169297526031173, 3.984111592622308, 0.0, 2371)
-    femmesh.addNode(-0.29156522307548094, -4.444120566643833, 0.0, 2372)
-    femmesh.addNode(-1.1911454758413504, -4.336215107439761, 0.0, 2373)
-    femmesh.addNode(-3.3338108560966573, -2.8875636182482234, 0.0, 2374)
-    femmesh.addNode(3.64805071213184, 2.5512441116644786, 50.0, 2375)
-    femmesh.addNode(4.1287091334570345, 1.7832234730736127, 50.0, 2376)
-    femmesh.addNode(2.3846688777343887, 3.7929179863070988, 50.0, 2377)
-    femmesh.addNode(3.0795020195761036, 3.2609088845757985, 50.0, 2378)
-    femmesh.addNode(0.709468117776937, 4.439368320075479, 50.0, 2379)
-    femmesh.addNode(1.5606748690934826, 4.177502930684805, 50.0, 2380)
-    femmesh.addNode(-1.109924808255904, 4.360767185235435, 50.0, 2381)
-    femmesh.addNode(-0.1752550938102746, 4.425469977253883, 50.0, 2382)
-    femmesh.addNode(-3.379308007171816, 2.9039996985939722, 50.0, 2383)
-    femmesh.addNode(-2.7380436816945566, 3.5657331488158563, 50.0, 2384)
-    femmesh.addNode(-4.268255528823278, 1.3702693479610373, 50.0, 2385)
-    femmesh.addNode(-3.92070533540089, 2.173410457840637, 50.0, 2386)
-    femmesh.addNode(-4.476848022954945, -0.4042912630705751, 50.0, 2387)
-    femmesh.addNode(-4.431325222736495, 0.5005932013516076, 50.0, 2388)
-    femmesh.addNode(-3.9477385898947075, -2.1595331786439944, 50.0, 2389)
-    femmesh.addNode(-4.242851530543674, -1.270318762061371, 50.0, 2390)
-    femmesh.addNode(-1.958464549331799, -3.975142159162277, 50.0, 2391)
-    femmesh.addNode(-2.785088998615962, -3.534136551213229, 50.0, 2392)
-    femmesh.addNode(1.5354127826203288, -4.208964254333004, 50.0, 2393)
-    femmesh.addNode(0.6421747604140963, -4.435320014050891, 50.0, 2394)
-    femmesh.addNode(3.0670155480490164, -3.279709124102419, 50.0, 2395)
-    femmesh.addNode(2.3055970436109146, -3.825635664486841, 50.0, 2396)
-    femmesh.addNode(4.129104429712001, -1.7765461588609317, 50.0, 2397)
-    femmesh.addNode(3.6049148990380884, -2.6083009830461745, 50.0, 2398)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 50.0, 2399)
-    femmesh.addNode(4.335822356141529, -0.8910296967831287, 50.0, 2400)
-    femmesh.addNode(4.324441214720629, 0.9203113817116942, 50.0, 2401)
-    femmesh.addNode(-1.9169297526031173, 3.984111592622308, 50.0, 2402)
-    femmesh.addNode(-0.29156522307548094, -4.444120566643833, 50.0, 2403)
-    femmesh.addNode(-1.1911454758413504, -4.336215107439761, 50.0, 2404)
-    femmesh.addNode(-3.3338108560966573, -2.8875636182482234, 50.0, 2405)
-    femmesh.addNode(4.911436253643443, 0.9369065729286224, 49.075, 2406)
-    femmesh.addNode(4.506205873141898, 2.166589169376941, 49.24776567845932, 2407)
-    femmesh.addNode(4.039008113759961, 2.9472722061223315, 49.24776567845932, 2408)
-    femmesh.addNode(3.398438835907757, 3.6675078021176626, 49.244336436473255, 2409)
-    femmesh.addNode(2.7040832365713885, 4.205702539373607, 49.244336436473255, 2410)
-    femmesh.addNode(3.7838885567460805, 3.268361575793912, 48.492102114932564, 2411)
-    femmesh.addNode(1.9066564654146625, 4.622192242096002, 49.23617954692109, 2412)
-    femmesh.addNode(1.0528852019200914, 4.8878863276039555, 49.23617954692109, 2413)
-    femmesh.addNode(2.331579590945391, 4.423091295811893, 48.480515983394355, 2414)
-    femmesh.addNode(0.12302096173809722, 4.998486355185241, 49.227696180106534, 2415)
-    femmesh.addNode(-0.8157810218856999, 4.933001249171859, 49.227696180106534, 2416)
-    femmesh.addNode(0.5856095775164953, 4.965587721782886, 48.46387572702763, 2417)
-    femmesh.addNode(-1.7161975336121107, 4.696239562205458, 49.21352798575263, 2418)
-    femmesh.addNode(-2.5252269653655706, 4.315463911723812, 49.21352798575263, 2419)
-    femmesh.addNode(-1.2691701593825389, 4.836238942249741, 48.44122416585916, 2420)
-    femmesh.addNode(-3.2531164814345086, 3.797003181223208, 49.20867852789347, 2421)
-    femmesh.addNode(-3.897160710870704, 3.132433302345917, 49.20867852789347, 2422)
-    femmesh.addNode(-2.91366359298123, 4.063319390219739, 48.4222065136461, 2423)
-    femmesh.addNode(-4.396372470807105, 2.381577019105078, 49.19655092331452, 2424)
-    femmesh.addNode(-4.745342431131706, 1.5753492347098872, 49.19655092331452, 2425)
-    femmesh.addNode(-4.1570368641267805, 2.7783168484337755, 48.40522945120799, 2426)
-    femmesh.addNode(-4.950979809491395, 0.6984260347442302, 49.223687364143856, 2427)
-    femmesh.addNode(-4.995576176635906, -0.21028234216831362, 49.223687364143856, 2428)
-    femmesh.addNode(-4.87038053406967, 1.1311027598566084, 48.420238287458375, 2429)
-    femmesh.addNode(-4.8633449026624715, -1.160980774064306, 49.229849128779094, 2430)
-    femmesh.addNode(-4.559655590128747, -2.051716573849241, 49.229849128779094, 2431)
-    femmesh.addNode(-4.947921150238093, -0.7197751669976853, 48.45353649292295, 2432)
-    femmesh.addNode(-4.105907558582384, -2.853335437759823, 49.23189555874811, 2433)
-    femmesh.addNode(-3.4872793676495344, -3.5831386537456043, 49.23189555874811, 2434)
-    femmesh.addNode(-4.3360854338226575, -2.4896512025966566, 48.4617446875272, 2435)
-    femmesh.addNode(-2.7628606418176926, -4.167325410127547, 49.21316003518332, 2436)
-    femmesh.addNode(-1.9330438703414003, -4.611219079086954, 49.21316003518332, 2437)
-    femmesh.addNode(-3.1389251447763526, -3.891933829793455, 48.44505559393143, 2438)
-    femmesh.addNode(-1.05386545532037, -4.887675071246286, 49.195429404537194, 2439)
-    femmesh.addNode(-0.15074403509853035, -4.997727106983955, 49.195429404537194, 2440)
-    femmesh.addNode(-1.514453850182288, -4.7651263924126965, 48.408589439720515, 2441)
-    femmesh.addNode(0.8136170155375617, -4.933358627955984, 49.17552198514372, 2442)
-    femmesh.addNode(1.7088712411477087, -4.6989104142533185, 49.17552198514372, 2443)
-    femmesh.addNode(0.3520334596927851, -4.987591848102321, 48.37095138968091, 2444)
-    femmesh.addNode(2.5511475471897906, -4.3001914134684185, 49.18697700609821, 2445)
-    femmesh.addNode(3.311735230358307, -3.74598582004839, 49.18697700609821, 2446)
-    femmesh.addNode(2.1780508452301017, -4.500677117456044, 48.362498991241935, 2447)
-    femmesh.addNode(3.936088847825974, -3.0833755175164757, 49.25144808578063, 2448)
-    femmesh.addNode(4.4655333086706515, -2.249224815164759, 49.25144808578063, 2449)
-    femmesh.addNode(3.654707475675659, -3.41220064873689, 48.43842509187884, 2450)
-    femmesh.addNode(4.762192895351413, -1.5236531191398273, 49.385675657168306, 2451)
-    femmesh.addNode(4.959450495152774, -0.6354925539523676, 49.385675657168306, 2452)
-    femmesh.addNode(4.959450495152774, -0.6354925539523676, 48.4606756571683, 2453)
-    femmesh.addNode(4.581964014209019, -2.0014009524564473, 48.63712374294893, 2454)
-    femmesh.addNode(4.917226024976648, -0.906028818135689, 0.9249999999999999, 2455)
-    femmesh.addNode(4.933865081915182, -0.8105401615330943, 2.9917009070252654, 2456)
-    femmesh.addNode(4.933865081915182, -0.8105401615330943, 2.1417009070252653, 2457)
-    femmesh.addNode(4.938484624352219, -0.7819012821556991, 6.717847884339298, 2458)
-    femmesh.addNode(4.938484624352219, -0.7819012821556991, 5.792847884339297, 2459)
-    femmesh.addNode(4.940136236938112, -0.7713974076252486, 10.208518082923591, 2460)
-    femmesh.addNode(4.940136236938112, -0.7713974076252486, 9.333518082923591, 2461)
-    femmesh.addNode(4.943192800902646, -0.7515616628755445, 13.80654087539902, 2462)
-    femmesh.addNode(4.943192800902646, -0.7515616628755445, 12.931540875399023, 2463)
-    femmesh.addNode(4.9444091881118215, -0.7435171689446054, 17.233557220192793, 2464)
-    femmesh.addNode(4.9444091881118215, -0.7435171689446054, 16.408557220192797, 2465)
-    femmesh.addNode(4.938401130828418, -0.7824284446724845, 20.85881666562627, 2466)
-    femmesh.addNode(4.938401130828418, -0.7824284446724845, 19.933816665626274, 2467)
-    femmesh.addNode(4.936101611005987, -0.796806680333507, 24.358502626307683, 2468)
-    femmesh.addNode(4.936101611005987, -0.796806680333507, 23.458502626307684, 2469)
-    femmesh.addNode(4.948857834672973, -0.713306478448033, 27.905536682267343, 2470)
-    femmesh.addNode(4.948857834672973, -0.713306478448033, 27.030536682267346, 2471)
-    femmesh.addNode(4.932078536683461, -0.8213411641859498, 31.468778684984116, 2472)
-    femmesh.addNode(4.932078536683461, -0.8213411641859498, 30.543778684984115, 2473)
-    femmesh.addNode(4.935049662335002, -0.803296228229152, 35.0216668711298, 2474)
-    femmesh.addNode(4.935049662335002, -0.803296228229152, 34.1716668711298, 2475)
-    femmesh.addNode(4.936239713913319, -0.7959506811260074, 38.6541248170659, 2476)
-    femmesh.addNode(4.936239713913319, -0.7959506811260074, 37.7541248170659, 2477)
-    femmesh.addNode(4.940912558088332, -0.7664092205375773, 42.221420500044225, 2478)
-    femmesh.addNode(4.940912558088332, -0.7664092205375773, 41.27142050004423, 2479)
-    femmesh.addNode(4.937469985524286, -0.788283034224897, 45.75577451487335, 2480)
-    femmesh.addNode(4.937469985524286, -0.788283034224897, 44.90577451487335, 2481)
-    femmesh.addNode(4.938719503124901, -0.7804163436613389, 47.6445459643286, 2482)
-    femmesh.addNode(4.938719503124901, -0.7804163436613389, 46.6195459643286, 2483)
-    femmesh.addNode(4.753918070052342, -1.549278213630402, 46.27532047920195, 2484)
-    femmesh.addNode(4.799477221962714, -1.4017911384586015, 47.955221621496904, 2485)
-    femmesh.addNode(4.946157225581686, 0.7317982644322641, 0.7502042087578784, 2486)
-    femmesh.addNode(4.721421861987732, 1.6456535483340025, 0.7502042087578784, 2487)
-    femmesh.addNode(3.9054291623827546, 3.1221183606023546, 0.750214179976684, 2488)
-    femmesh.addNode(4.406521424861505, 2.3627460575010035, 0.750214179976684, 2489)
-    femmesh.addNode(1.0088735343584079, 4.897159808671877, 0.7808424953057017, 2490)
-    femmesh.addNode(1.8650003096652124, 4.639156587672878, 0.7808424953057017, 2491)
-    femmesh.addNode(-2.491541957608293, 4.334999270297221, 0.8492774474556068, 2492)
-    femmesh.addNode(-1.6795716156760918, 4.709462728148, 0.8492774474556068, 2493)
-    femmesh.addNode(-4.741861908088356, 1.5857949566765113, 0.8254035545018291, 2494)
-    femmesh.addNode(-4.391117429741308, 2.3912523326119492, 0.8254035545018291, 2495)
-    femmesh.addNode(-4.5719883188323855, -2.024085673201659, 0.8189200619063758, 2496)
-    femmesh.addNode(-4.870281670348203, -1.1315283697151894, 0.8189200619063758, 2497)
-    femmesh.addNode(-1.9352426770564712, -4.610296712891623, 0.8056329969234278, 2498)
-    femmesh.addNode(-2.7648476674305087, -4.166007366280582, 0.8056329969234278, 2499)
-    femmesh.addNode(1.6795072302316327, -4.709485689924078, 0.8475195573743507, 2500)
-    femmesh.addNode(0.7828070138721287, -4.938341136356682, 0.8475195573743507, 2501)
-    femmesh.addNode(4.413099868517315, -2.350436034120576, 0.7615618808234962, 2502)
-    femmesh.addNode(3.864777800753062, -3.1723008291784573, 0.7615618808234962, 2503)
-    femmesh.addNode(4.971171809587403, 0.536144420434924, 2.3762698271976106, 2504)
-    femmesh.addNode(4.971171809587403, 0.536144420434924, 3.2262698271976107, 2505)
-    femmesh.addNode(4.952091747930265, 0.6904978784044014, 3.9617697785423447, 2506)
-    femmesh.addNode(4.952091747930265, 0.6904978784044014, 4.861769778542344, 2507)
-    femmesh.addNode(4.849498462194536, 1.2175239895676937, 3.6380396057399556, 2508)
-    femmesh.addNode(4.939307689016495, 0.7766849768229972, 5.747333728780049, 2509)
-    femmesh.addNode(4.939307689016495, 0.7766849768229972, 6.67233372878005, 2510)
-    femmesh.addNode(4.784721103716399, 1.4513593489039598, 5.259103507322394, 2511)
-    femmesh.addNode(4.938108797338085, 0.7842713214520941, 7.586572751017011, 2512)
-    femmesh.addNode(4.938108797338085, 0.7842713214520941, 8.436572751017012, 2513)
-    femmesh.addNode(4.756341399753276, 1.5418224570270889, 7.058906479797061, 2514)
-    femmesh.addNode(4.937248816023977, 0.7896670999033943, 9.330358483714146, 2515)
-    femmesh.addNode(4.937248816023977, 0.7896670999033943, 10.205358483714146, 2516)
-    femmesh.addNode(4.752271710621152, 1.5543209412569556, 8.866931234731156, 2517)
-    femmesh.addNode(4.940469742212221, 0.7692585561990912, 11.09880499239052, 2518)
-    femmesh.addNode(4.940469742212221, 0.7692585561990912, 12.02380499239052, 2519)
-    femmesh.addNode(4.756974042437862, 1.539869461861099, 10.654163476104664, 2520)
-    femmesh.addNode(4.94242052251383, 0.7566236704162282, 12.915784116665362, 2521)
-    femmesh.addNode(4.94242052251383, 0.7566236704162282, 13.79078411666536, 2522)
-    femmesh.addNode(4.767167962495498, 1.508015125042358, 12.43958910905588, 2523)
-    femmesh.addNode(4.9434199372921634, 0.7500662127988063, 14.67493500229366, 2524)
-    femmesh.addNode(4.9434199372921634, 0.7500662127988063, 15.549935002293662, 2525)
-    femmesh.addNode(4.772988459698711, 1.4894902361489089, 14.215719118959022, 2526)
-    femmesh.addNode(4.944674278113359, 0.7417521711219552, 16.421918007957288, 2527)
-    femmesh.addNode(4.944674278113359, 0.7417521711219552, 17.24691800795729, 2528)
-    femmesh.addNode(4.777447633602483, 1.4751251161125394, 15.97185301025095, 2529)
-    femmesh.addNode(4.944010541182982, 0.7461633659404328, 18.1235376297125, 2530)
-    femmesh.addNode(4.944010541182982, 0.7461633659404328, 19.0235376297125, 2531)
-    femmesh.addNode(4.778610691402135, 1.4713530711617828, 17.720455637669794, 2532)
-    femmesh.addNode(4.944205238243774, 0.7448721783788288, 19.916346857144582, 2533)
-    femmesh.addNode(4.944205238243774, 0.7448721783788288, 20.84134685714458, 2534)
-    femmesh.addNode(4.77768129676693, 1.4743681448415316, 19.489884486857083, 2535)
-    femmesh.addNode(4.944663787823754, 0.7418220982044422, 21.728686836162822, 2536)
-    femmesh.addNode(4.944663787823754, 0.7418220982044422, 22.578686836162824, 2537)
-    femmesh.addNode(4.7789739917706555, 1.4701726381550053, 21.270033693307404, 2538)
-    femmesh.addNode(4.944799213712127, 0.7409188458069658, 23.461756459504613, 2539)
-    femmesh.addNode(4.944799213712127, 0.7409188458069658, 24.361756459504612, 2540)
-    femmesh.addNode(4.780147927461175, 1.4663511828987756, 23.040443295667433, 2541)
-    femmesh.addNode(4.941576958969901, 0.7621136126443238, 25.25349352914023, 2542)
-    femmesh.addNode(4.941576958969901, 0.7621136126443238, 26.153493529140228, 2543)
-    femmesh.addNode(4.77408830459158, 1.4859612578939918, 24.81524998864484, 2544)
-    femmesh.addNode(4.942423128367052, 0.7566066482541962, 27.04197595293674, 2545)
-    femmesh.addNode(4.942423128367052, 0.7566066482541962, 27.91697595293674, 2546)
-    femmesh.addNode(4.769348805313308, 1.5011035851188015, 26.595469482076968, 2547)
-    femmesh.addNode(4.942349541661234, 0.7570871865518446, 28.800882730679962, 2548)
-    femmesh.addNode(4.942349541661234, 0.7570871865518446, 29.675882730679962, 2549)
-    femmesh.addNode(4.770873096905464, 1.4962519484444006, 28.367858683616703, 2550)
-    femmesh.addNode(4.941339702900436, 0.7636504046616048, 30.56869805022019, 2551)
-    femmesh.addNode(4.941339702900436, 0.7636504046616048, 31.49369805022019, 2552)
-    femmesh.addNode(4.768735615889536, 1.5030504401871028, 30.144580780900153, 2553)
-    femmesh.addNode(4.942169546430863, 0.7582612836821884, 32.38588023747705, 2554)
-    femmesh.addNode(4.942169546430863, 0.7582612836821884, 33.26088023747705, 2555)
-    femmesh.addNode(4.768378412424162, 1.5041832720540507, 31.929578287697247, 2556)
-    femmesh.addNode(4.942063827198787, 0.7589500167292161, 34.14135525882127, 2557)
-    femmesh.addNode(4.942063827198787, 0.7589500167292161, 34.99135525882127, 2558)
-    femmesh.addNode(4.76980698587268, 1.499647064318862, 33.70223549629833, 2559)
-    femmesh.addNode(4.941828453443279, 0.7604811218816733, 35.88085639342863, 2560)
-    femmesh.addNode(4.941828453443279, 0.7604811218816733, 36.80585639342863, 2561)
-    femmesh.addNode(4.76913289596182, 1.5017894062267256, 35.4722116522499, 2562)
-    femmesh.addNode(4.943278871265843, 0.7509953401298103, 37.70357855003975, 2563)
-    femmesh.addNode(4.943278871265843, 0.7509953401298103, 38.60357855003975, 2564)
-    femmesh.addNode(4.771543680107287, 1.494112080410372, 37.25943494346838, 2565)
-    femmesh.addNode(4.943621263032082, 0.7487381436103606, 39.49227191160974, 2566)
-    femmesh.addNode(4.943621263032082, 0.7487381436103606, 40.34227191160974, 2567)
-    femmesh.addNode(4.775079936051606, 1.4827715954648548, 39.045850461649486, 2568)
-    femmesh.addNode(4.942068356443763, 0.7589205230043787, 41.23697190094807, 2569)
-    femmesh.addNode(4.942068356443763, 0.7589205230043787, 42.186971900948066, 2570)
-    femmesh.addNode(4.772696293346212, 1.4904261442551698, 40.829243812557806, 2571)
-    femmesh.addNode(4.939483909044262, 0.7755634805048612, 43.04319112004585, 2572)
-    femmesh.addNode(4.939483909044262, 0.7755634805048612, 43.91819112004585, 2573)
-    femmesh.addNode(4.764535216360505, 1.5163126894082741, 42.58016302099392, 2574)
-    femmesh.addNode(4.941063194000753, 0.7654374650427532, 44.76804374614544, 2575)
-    femmesh.addNode(4.941063194000753, 0.7654374650427532, 45.61804374614543, 2576)
-    femmesh.addNode(4.762531359167945, 1.5225948420186919, 44.286234866191286, 2577)
-    femmesh.addNode(4.705311407982139, -1.6911666251180395, 1.2167009070252655, 2578)
-    femmesh.addNode(4.832366905071032, 1.28383413834273, 48.32276567845931, 2579)
-    femmesh.addNode(4.946157225581686, 0.7317982644322643, 1.6752042087578785, 2580)
-    femmesh.addNode(4.930855857335705, -0.8286498139613453, 4.857773779785184, 2581)
-    femmesh.addNode(4.930855857335705, -0.8286498139613453, 3.9577737797851844, 2582)
-    femmesh.addNode(4.936956817583369, -0.7914906072197518, 8.42017973180848, 2583)
-    femmesh.addNode(4.936956817583369, -0.7914906072197518, 7.57017973180848, 2584)
-    femmesh.addNode(4.940710534608176, -0.7677105009128117, 12.005550829894975, 2585)
-    femmesh.addNode(4.940710534608176, -0.7677105009128117, 11.080550829894975, 2586)
-    femmesh.addNode(4.944439772856038, -0.7433137511168022, 15.542392812034155, 2587)
-    femmesh.addNode(4.944439772856038, -0.7433137511168022, 14.667392812034155, 2588)
-    femmesh.addNode(4.939041590775143, -0.7783753365782746, 18.999799684076194, 2589)
-    femmesh.addNode(4.939041590775143, -0.7783753365782746, 18.099799684076192, 2590)
-    femmesh.addNode(4.937825078399223, -0.7860556565102189, 22.589015955269826, 2591)
-    femmesh.addNode(4.937825078399223, -0.7860556565102189, 21.739015955269828, 2592)
-    femmesh.addNode(4.941662294446064, -0.7615600880101702, 26.178819724386926, 2593)
-    femmesh.addNode(4.941662294446064, -0.7615600880101702, 25.278819724386924, 2594)
-    femmesh.addNode(4.942455369253196, -0.7563960093365497, 29.637060267900285, 2595)
-    femmesh.addNode(4.942455369253196, -0.7563960093365497, 28.762060267900285, 2596)
-    femmesh.addNode(4.934910781355297, -0.804148978773988, 33.219529420347676, 2597)
-    femmesh.addNode(4.934910781355297, -0.804148978773988, 32.344529420347676, 2598)
-    femmesh.addNode(4.935823445136402, -0.7985279697304399, 36.827623526868244, 2599)
-    femmesh.addNode(4.935823445136402, -0.7985279697304399, 35.90262352686824, 2600)
-    femmesh.addNode(4.9392394839129645, -0.7771186013442182, 40.3590329024325, 2601)
-    femmesh.addNode(4.9392394839129645, -0.7771186013442182, 39.50903290243251, 2602)
-    femmesh.addNode(4.94382408425802, -0.7473977682000048, 43.969226341858615, 2603)
-    femmesh.addNode(4.94382408425802, -0.7473977682000048, 43.094226341858615, 2604)
-    femmesh.addNode(-3.2357359683449163, 3.811825382039291, 0.8390822069888111, 2605)
-    femmesh.addNode(-2.8632340790383974, 4.099010930533503, 1.688359654444418, 2606)
-    femmesh.addNode(-3.882809556557759, 3.150204746917847, 0.8390822069888111, 2607)
-    femmesh.addNode(4.7524435628253645, -1.5537954119380573, 7.0880276161477775, 2608)
-    femmesh.addNode(3.3377681185195507, 3.722808615413161, 0.7512180966793525, 2609)
-    femmesh.addNode(3.579599123099646, 3.4909125050485357, 1.5014322766560366, 2610)
-    femmesh.addNode(2.6346700945737354, 4.249530973267382, 0.7512180966793525, 2611)
-    femmesh.addNode(2.218429232152727, 4.4809119319542825, 1.5320605919850543, 2612)
-    femmesh.addNode(-0.8097381350902277, 4.933996772656078, 0.8198715731429493, 2613)
-    femmesh.addNode(0.12914335489406367, 4.998331921139963, 0.8198715731429493, 2614)
-    femmesh.addNode(-4.138130942522354, 2.806398457550006, 1.6644857614906403, 2615)
-    femmesh.addNode(-4.995504466153305, -0.21197907595418747, 0.8213157312960941, 2616)
-    femmesh.addNode(-4.951216744102475, 0.6967443956855948, 0.8213157312960941, 2617)
-    femmesh.addNode(-4.951951775359563, -0.6915009866321687, 1.64023579320247, 2618)
-    femmesh.addNode(-3.4952629994508397, -3.575351250530487, 0.8034533791544559, 2619)
-    femmesh.addNode(-4.112261801732553, -2.8441699798027775, 0.8034533791544559, 2620)
-    femmesh.addNode(-0.14127926070990296, -4.9980036184954155, 0.8220537632622735, 2621)
-    femmesh.addNode(-1.044607473811093, -4.889662076837008, 0.8220537632622735, 2622)
-    femmesh.addNode(3.2749720211553877, -3.778168638460887, 0.8405636532711116, 2623)
-    femmesh.addNode(2.5090050566727378, -4.3249154472186655, 0.8405636532711116, 2624)
-    femmesh.addNode(4.457832893144075, -2.264448254388412, 1.9782627878487618, 2625)
-    femmesh.addNode(4.755737094434504, -1.5436854241132365, 8.85369781473207, 2626)
-    femmesh.addNode(4.926516446833042, 0.8540700785553477, 46.46469379169953, 2627)
-    femmesh.addNode(4.926516446833042, 0.8540700785553477, 47.48969379169954, 2628)
-    femmesh.addNode(4.740606696871182, -1.589543376438687, 5.300621664124482, 2629)
-    femmesh.addNode(4.776534594170182, -1.4780789122017455, 14.223933687433178, 2630)
-    femmesh.addNode(4.768381439053249, -1.5041736773698937, 17.68335690426899, 2631)
-    femmesh.addNode(4.753985729250043, -1.5490705878322455, 21.2978326208961, 2632)
-    femmesh.addNode(4.757146209412274, -1.539337501094037, 24.837322350694606, 2633)
-    femmesh.addNode(4.783993360583803, -1.4537563502492714, 28.31759695016763, 2634)
-    femmesh.addNode(4.735777377352902, -1.6038742569642013, 31.86330810533179, 2635)
-    femmesh.addNode(4.7434158640090445, -1.581140708813522, 35.524290397998044, 2636)
-    femmesh.addNode(4.752544403392841, -1.5534869467682644, 39.1131577194984, 2637)
-    femmesh.addNode(4.770837992386498, -1.4963638763354217, 42.66564684190284, 2638)
-    femmesh.addNode(0.5470058414350542, 4.969988391277783, 1.6007140684486512, 2639)
-    femmesh.addNode(-4.86826550614216, 1.140171461538313, 1.6467192857979231, 2640)
-    femmesh.addNode(-4.356556265156806, -2.4536539096871386, 1.6223734410608317, 2641)
-    femmesh.addNode(-1.507700736000289, -4.7672674028906945, 1.6276867601857012, 2642)
-    femmesh.addNode(2.105700632589654, -4.534977932240854, 1.6880832106454622, 2643)
-    femmesh.addNode(4.769180593069222, -1.5016379292931803, 12.437091705293998, 2644)
-    femmesh.addNode(4.778933381421366, -1.4703046405206457, 15.950950032226952, 2645)
-    femmesh.addNode(4.756389114624541, -1.5416752544816843, 19.483616349702466, 2646)
-    femmesh.addNode(4.749454385226143, -1.5629085202455608, 23.047518581577506, 2647)
-    femmesh.addNode(4.782471683534709, -1.4587544674100195, 26.609356406654268, 2648)
-    femmesh.addNode(4.751063773263095, -1.5580093139603002, 30.080838952884402, 2649)
-    femmesh.addNode(4.741611988719208, -1.5865420726959254, 33.69119629147748, 2650)
-    femmesh.addNode(4.745763765868422, -1.574079501985326, 37.33174834393414, 2651)
-    femmesh.addNode(4.761751906389959, -1.5250307478839853, 40.88045340247673, 2652)
-    femmesh.addNode(4.764164409849191, -1.517477339509987, 44.47500085673197, 2653)
-    femmesh.addNode(4.731304716880567, -1.617020617068223, 3.39947468681045, 2654)
-    femmesh.addNode(4.763114651605785, -1.520769152652136, 10.639068912818566, 2655)
-    femmesh.addNode(3.5416541095536953, -3.529403089515481, 1.6021255340946077, 2656)
-    femmesh.addNode(0.33034263752085236, -4.989075439581542, 1.6695733206366241, 2657)
-    femmesh.addNode(-1.2255308913316325, 4.847481205161285, 1.6691490205985562, 2658)
-    femmesh.addNode(-3.149450728716637, -3.8834211859372454, 1.6090863760778837, 2659)
-    femmesh.addNode(4.7376983708378075, 1.5981908981597848, 45.98273753784497, 2660)
-    femmesh.addNode(4.839169561847981, 1.2579499003076486, 2.2014740359554894, 2661)
-    femmesh.addNode(2.730205379925612, 4.188792019595296, 47.69398680806365, 2662)
-    femmesh.addNode(1.9353861078597676, 4.610236502990212, 47.68582991851149, 2663)
-    femmesh.addNode(1.0337166656331962, 4.891976068542465, 47.632467391885505, 2664)
-    femmesh.addNode(0.10342601918310637, 4.998930191406551, 47.62398402507094, 2665)
-    femmesh.addNode(1.4812066382589129, 4.775565609933313, 46.8459382165548, 2666)
-    femmesh.addNode(-0.8015007238865847, 4.935341587935863, 47.61665159924915, 2667)
-    femmesh.addNode(-1.7025986901530952, 4.701186839542645, 47.602483404895246, 2668)
-    femmesh.addNode(-0.3504168745794626, 4.987705686386273, 46.785243264107024, 2669)
-    femmesh.addNode(-2.5285910145335966, 4.313493651463968, 47.62467805904133, 2670)
-    femmesh.addNode(-3.2560760595563307, 3.794465534747169, 47.61982860118218, 2671)
-    femmesh.addNode(-2.1050881141777213, 4.5352622891678145, 46.80010549243133, 2672)
-    femmesh.addNode(-3.8881411140192625, 3.1436219043442626, 47.633934698625126, 2673)
-    femmesh.addNode(-4.389508985002528, 2.3942035983980308, 47.62180709404617, 2674)
-    femmesh.addNode(-3.583335409857748, 3.4870771916405294, 46.83640624402035, 2675)
-    femmesh.addNode(-4.751322853178033, 1.5572190420323517, 47.612588108261775, 2676)
-    femmesh.addNode(-4.953610456481677, 0.6795170678028611, 47.63972454909111, 2677)
-    femmesh.addNode(-4.590645486301782, 1.9814070806114195, 46.8412933556789, 2678)
-    femmesh.addNode(-4.993082996231678, -0.2629109977579761, 47.611247788734815, 2679)
-    femmesh.addNode(-4.850841184331223, -1.2121632746441615, 47.61740955337005, 2680)
-    femmesh.addNode(-4.996776583624381, 0.17950981405776015, 46.80359760953821, 2681)
-    femmesh.addNode(-4.546353192409449, -2.08102682584065, 47.632544575759184, 2682)
-    femmesh.addNode(-4.087454144562509, -2.87970807827786, 47.634591005728204, 2683)
-    femmesh.addNode(-4.7180636311541315, -1.6552569505610573, 46.79025587157105, 2684)
-    femmesh.addNode(-3.493467326707005, -3.5771058185676607, 47.62446781434467, 2685)
-    femmesh.addNode(-2.770059402954719, -4.1625438020640875, 47.605732290779876, 2686)
-    femmesh.addNode(-3.807136484329781, -3.2412515776602517, 46.79526770257665, 2687)
-    femmesh.addNode(-1.9427089160990363, -4.607155528882144, 47.59921008021503, 2688)
-    femmesh.addNode(-1.0641121363472847, -4.885454468243299, 47.5814794495689, 2689)
-    femmesh.addNode(-2.37037767038139, -4.402420890800571, 46.77862230062827, 2690)
-    femmesh.addNode(-0.11657322838640126, -4.998640883522597, 47.5419784585665, 2691)
-    femmesh.addNode(0.8473252262758644, -4.927680992202778, 47.52207103917303, 2692)
-    femmesh.addNode(-0.5719493233540782, -4.9671796798097425, 46.73259909906102, 2693)
-    femmesh.addNode(1.7381713081171037, -4.6881510751722235, 47.509416931739466, 2694)
-    femmesh.addNode(2.577942163594302, -4.284181859020778, 47.52087195269396, 2695)
-    femmesh.addNode(1.2915144675185002, -4.830319904539492, 46.68044400062506, 2696)
-    femmesh.addNode(3.438778189888993, -3.6297113605276903, 47.447920962920534, 2697)
-    femmesh.addNode(4.039941905553285, -2.9459920909185247, 47.512392042602954, 2698)
-    femmesh.addNode(3.076331147253674, -3.9415969698127302, 46.59483890341807, 2699)
-    femmesh.addNode(4.521405583585195, -2.1346876934869465, 47.820994050109235, 2700)
-    femmesh.addNode(3.933571751853257, -3.0865860222942274, 2.5023962446096357, 2701)
-    femmesh.addNode(3.3572255313568773, -3.7052714787995678, 2.5813980170572512, 2702)
-    femmesh.addNode(4.4692490699780905, -2.241832453708344, 11.054483592785608, 2703)
-    femmesh.addNode(4.467574805697635, -2.2451671108173086, 10.182450845814223, 2704)
-    femmesh.addNode(4.501347473753503, -2.1766650914950043, 14.633643138007452, 2705)
-    femmesh.addNode(4.497709818583154, -2.1841717853274956, 13.772791201372318, 2706)
-    femmesh.addNode(3.258267188429538, 3.7925842019398157, 2.2797298794987593, 2707)
-    femmesh.addNode(3.838508478142175, 3.2040369322513493, 2.278725962796091, 2708)
-    femmesh.addNode(4.542050142315903, 2.0904019959539095, 47.66245947015885, 2709)
-    femmesh.addNode(4.476080253124342, -2.228161925801247, 18.132863238447385, 2710)
-    femmesh.addNode(4.491685811508642, -2.1965333074396924, 17.266620774563986, 2711)
-    femmesh.addNode(4.461169336596584, -2.2578680542074174, 19.940016318615097, 2712)
-    femmesh.addNode(4.463020820306079, -2.254206103601544, 19.005999337065017, 2713)
-    femmesh.addNode(4.453217283236812, -2.2735117831849796, 21.760567850344444, 2714)
-    femmesh.addNode(4.454886053309671, -2.2702401309172093, 20.88036856070089, 2715)
-    femmesh.addNode(4.4673317726527895, -2.2456506480409826, 25.326468355263074, 2716)
-    femmesh.addNode(4.451192012040292, -2.277474406431101, 24.406151257183833, 2717)
-    femmesh.addNode(4.52613253797134, -2.124646852706849, 27.086480741036087, 2718)
-    femmesh.addNode(4.505186228205678, -2.168708613250268, 26.234763783155667, 2719)
-    femmesh.addNode(4.362660234216105, -2.4427844114431134, 30.384306312466094, 2720)
-    femmesh.addNode(4.394413983064826, -2.3851888280478617, 29.477587895382264, 2721)
-    femmesh.addNode(4.422791434783251, -2.332148349571251, 32.311995209873636, 2722)
-    femmesh.addNode(4.414637561169553, -2.347546635002368, 31.436244474510076, 2723)
-    femmesh.addNode(4.4384703716761615, -2.3021687079258286, 35.967148392043626, 2724)
-    femmesh.addNode(4.436244113417031, -2.306455758555265, 35.08619173630518, 2725)
-    femmesh.addNode(4.459806016852752, -2.2605597298111797, 39.589732480420665, 2726)
-    femmesh.addNode(4.451152047754501, -2.2775525126264173, 38.73482439505405, 2727)
-    femmesh.addNode(4.509942273394365, -2.158800752883524, 43.09985446510508, 2728)
-    femmesh.addNode(4.501604835041454, -2.176132787568673, 42.2270486232907, 2729)
-    femmesh.addNode(0.13311196279222132, 4.99822780646917, 2.4052259407604777, 2730)
-    femmesh.addNode(1.01276153484138, 4.896357224870927, 2.36619686292323, 2731)
-    femmesh.addNode(-3.187818455390989, 3.851988252249559, 2.4807649726303094, 2732)
-    femmesh.addNode(-2.4371406599400864, 4.365815548516314, 2.4909602130971047, 2733)
-    femmesh.addNode(-4.950648665383283, 0.7007694285131996, 2.466314059461207, 2734)
-    femmesh.addNode(-4.740571114119214, 1.5896494934351157, 2.470401882666942, 2735)
-    femmesh.addNode(1.8163580580930738, 4.658416405260521, 2.303653237493318, 2736)
-    femmesh.addNode(2.5900624198519955, 4.276865284442617, 2.2740288388669687, 2737)
-    femmesh.addNode(2.9126256450617944, 4.064063465514333, 3.051322525007023, 2738)
-    femmesh.addNode(1.4239241808125631, 4.792957325837282, 3.1081651098051446, 2739)
-    femmesh.addNode(-2.766674890997281, -4.164794118263853, 2.4346378054025766, 2740)
-    femmesh.addNode(-3.4968310514471184, -3.5738176503055157, 2.4324581876336047, 2741)
-    femmesh.addNode(-4.367772762953951, 2.4336312562090443, 2.4707173394316224, 2742)
-    femmesh.addNode(-3.8521446451239822, 3.187629469220447, 2.4843959919186043, 2743)
-    femmesh.addNode(-3.5125728783114774, 3.55834677547743, 3.2869965505712915, 2744)
-    femmesh.addNode(-4.567691264909735, 2.033764123114407, 3.2903121130949065, 2745)
-    femmesh.addNode(-4.869250956950074, -1.1359555969494537, 2.461374429579306, 2746)
-    femmesh.addNode(-4.995309686261728, -0.21652052637050218, 2.4637700989690243, 2747)
-    femmesh.addNode(4.438527755615843, -2.302058071080699, 7.467011149534166, 2748)
-    femmesh.addNode(4.442990104599515, -2.293433873132337, 6.6146793020649834, 2749)
-    femmesh.addNode(-1.054785925169409, -4.887476511663714, 2.4119865289902784, 2750)
-    femmesh.addNode(-1.9448375341389275, -4.606257370773415, 2.3955657626514326, 2751)
-    femmesh.addNode(4.521855118128361, 2.1337352906713485, 45.4506367150932, 2752)
-    femmesh.addNode(4.482797331458979, 2.2146169160972864, 46.297286760647296, 2753)
-    femmesh.addNode(2.523249541488783, -4.3166204085345115, 2.5670909632211067, 2754)
-    femmesh.addNode(1.6950240506477756, -4.70392319959899, 2.574046867324346, 2755)
-    femmesh.addNode(-1.6280028087659297, 4.727537081255973, 2.479036945093669, 2756)
-    femmesh.addNode(-0.7557674004609217, 4.942551530980789, 2.4496310707810114, 2757)
-    femmesh.addNode(-2.00792880682891, 4.579107108018618, 3.2714422632795603, 2758)
-    femmesh.addNode(4.486288467901501, -2.2075361339679143, 12.901221743578738, 2759)
-    femmesh.addNode(4.479050959259445, -2.222184174265725, 11.97523169807469, 2760)
-    femmesh.addNode(4.105142928671542, -2.854435414434531, 13.31093119415301, 2761)
-    femmesh.addNode(0.7947452715344454, -4.936433930822294, 2.4679451918872344, 2762)
-    femmesh.addNode(-0.12919404227155876, -4.998330611258276, 2.4424793977751573, 2763)
-    femmesh.addNode(-0.5938185306177344, -4.964612729377286, 3.2103584002408887, 2764)
-    femmesh.addNode(1.2559065235474751, -4.839700280400729, 3.3469529444628794, 2765)
-    femmesh.addNode(4.33666567747348, -2.4886403520443614, 2.9575352708114053, 2766)
-    femmesh.addNode(4.500989000925163, 2.1774062582693903, 1.5004183887345626, 2767)
-    femmesh.addNode(4.503378548980824, 2.1724598142611002, 4.641145737044406, 2768)
-    femmesh.addNode(4.464838912062228, 2.250602916850278, 5.526709687282111, 2769)
-    femmesh.addNode(4.441903109412114, 2.2955384480759617, 6.549555289343535, 2770)
-    femmesh.addNode(4.438371696699818, 2.3023589385528007, 7.4637943115804966, 2771)
-    femmesh.addNode(4.034374702579969, 2.9536114773583186, 5.931597519065546, 2772)
-    femmesh.addNode(4.42861953592819, 2.321062042685457, 8.39948572489098, 2773)
-    femmesh.addNode(4.426080490819816, 2.3259001459186126, 9.293271457588112, 2774)
-    femmesh.addNode(3.9917007315666564, 3.011033920368587, 7.890134534437452, 2775)
-    femmesh.addNode(4.443215533611386, 2.2929971046371787, 10.20646845007889, 2776)
-    femmesh.addNode(4.452652769063609, 2.2746171805713105, 11.099914958755265, 2777)
-    femmesh.addNode(4.001318343852013, 2.99824140308171, 9.739022940238714, 2778)
-    femmesh.addNode(4.4746808888426095, 2.2309708521239604, 11.976941797280166, 2779)
-    femmesh.addNode(4.480370668808359, 2.2195221715679567, 12.86892092155501, 2780)
-    femmesh.addNode(4.052286544946394, 2.9289885212554885, 11.529246771254392, 2781)
-    femmesh.addNode(4.494494153970837, 2.1907812076795725, 13.769277703418014, 2782)
-    femmesh.addNode(4.497396567589497, 2.18481672316792, 14.653428589046314, 2783)
-    femmesh.addNode(4.099153114651219, 2.8630305172395936, 13.3066303916423, 2784)
-    femmesh.addNode(4.494878034263838, 2.189993483344746, 15.539395349423666, 2785)
-    femmesh.addNode(4.498554427741532, 2.1824316852188193, 16.411378355087294, 2786)
-    femmesh.addNode(4.114137031272525, 2.841456754538434, 15.092953933882658, 2787)
-    femmesh.addNode(4.498906177543277, 2.1817064893479468, 17.290215779743225, 2788)
-    femmesh.addNode(4.496957933985103, 2.1857194101641757, 18.16683540149844, 2789)
-    femmesh.addNode(4.1113214634353135, 2.8455290939113786, 16.85775811891594, 2790)
-    femmesh.addNode(4.50272381284849, 2.1738165205939426, 19.051192920168344, 2791)
-    femmesh.addNode(4.503291366328832, 2.1726405293900326, 19.944002147600422, 2792)
-    femmesh.addNode(4.119290895273691, 2.833979978778127, 18.620953062241774, 2793)
-    femmesh.addNode(4.497381926847708, 2.1848468605519247, 20.831391210756607, 2794)
-    femmesh.addNode(4.498728840537051, 2.1820721388900406, 21.71873118977485, 2795)
-    femmesh.addNode(4.11910062703491, 2.8342565205641868, 20.392699644067868, 2796)
-    femmesh.addNode(4.49383911865039, 2.1921245347122684, 22.60440980078902, 2797)
-    femmesh.addNode(4.494239478303928, 2.1913036101039114, 23.48747942413081, 2798)
-    femmesh.addNode(4.105026289849721, 2.854603152741662, 22.165767318238224, 2799)
-    femmesh.addNode(4.499379646764795, 2.1807298765043566, 24.37447464849612, 2800)
-    femmesh.addNode(4.489988077933581, 2.200001604548121, 25.266211718131736, 2801)
-    femmesh.addNode(4.105356464539291, 2.8541282905758547, 23.938441153617703, 2802)
-    femmesh.addNode(4.4885220426673476, 2.202991119475823, 26.156535728026924, 2803)
-    femmesh.addNode(4.4909740899831245, 2.19798810804341, 27.045018151823434, 2804)
-    femmesh.addNode(4.110161144131435, 2.8472048344423984, 25.715760387878206, 2805)
-    femmesh.addNode(4.485349427851835, 2.209443484244215, 27.932517027995758, 2806)
-    femmesh.addNode(4.485134586898917, 2.209879575316963, 28.816423805738978, 2807)
-    femmesh.addNode(4.100976775310844, 2.8604177122163588, 27.493583273945713, 2808)
-    femmesh.addNode(4.490236068979506, 2.199495406868466, 29.704739311554818, 2809)
-    femmesh.addNode(4.487310980778713, 2.205456905446757, 30.597554631095043, 2810)
-    femmesh.addNode(4.100294654879396, 2.8613954188765063, 29.269397655933872, 2811)
-    femmesh.addNode(4.486983970911475, 2.2061221282566144, 31.48946439866142, 2812)
-    femmesh.addNode(4.4893871397138305, 2.201227636972621, 32.38164658591829, 2813)
-    femmesh.addNode(4.106481882839195, 2.852508816097412, 31.049622929316087, 2814)
-    femmesh.addNode(4.483275163742128, 2.2136494316338773, 33.2717117543941, 2815)
-    femmesh.addNode(4.482966626173367, 2.2142741990584147, 34.152186775738315, 2816)
-    femmesh.addNode(4.0981434892815685, 2.8644755089298783, 32.831597865358276, 2817)
-    femmesh.addNode(4.489144236765668, 2.201722966568136, 35.039469467951335, 2818)
-    femmesh.addNode(4.4884618873539, 2.203113679720469, 35.92897060255869, 2819)
-    femmesh.addNode(4.098226624637264, 2.86435656528901, 34.60894572604711, 2820)
-    femmesh.addNode(4.493599646548351, 2.1926153827200365, 36.81958173350951, 2821)
-    femmesh.addNode(4.497799448899061, 2.1839872063460684, 37.71730389012063, 2822)
-    femmesh.addNode(4.112882261800052, 2.8432726743262746, 36.38683954921095, 2823)
-    femmesh.addNode(4.489493593492994, 2.201010512011555, 38.60804873008702, 2824)
-    femmesh.addNode(4.490498114506699, 2.1989603642657554, 39.49674209165701, 2825)
-    femmesh.addNode(4.108753234319975, 2.849236188782029, 38.16819552012815, 2826)
-    femmesh.addNode(4.482474319016153, 2.2152706334352645, 40.38537901989046, 2827)
-    femmesh.addNode(4.4779013018548, 2.2244999282641236, 41.280079009228785, 2828)
-    femmesh.addNode(4.087488281489561, 2.879659623755126, 39.94757728832799, 2829)
-    femmesh.addNode(4.466948529723255, 2.2464128811959854, 42.1647117579283, 2830)
-    femmesh.addNode(4.459356188169473, 2.26144696754857, 43.02093097702608, 2831)
-    femmesh.addNode(4.062761875318675, 2.9144409317152196, 41.72084696526095, 2832)
-    femmesh.addNode(4.463503244822627, 2.2532507147359087, 43.85697482206081, 2833)
-    femmesh.addNode(4.468112323055436, 2.2440972056843163, 44.706827448160396, 2834)
-    femmesh.addNode(4.129631935406939, 2.8188898662535826, 45.021376670962724, 2835)
-    femmesh.addNode(4.053817585867023, 2.926869143046074, 43.44152355899519, 2836)
-    femmesh.addNode(4.480510586645943, -2.2192397083131037, 5.755385992550781, 2837)
-    femmesh.addNode(4.459286069413346, -2.261585229686486, 4.8203118879966675, 2838)
-    femmesh.addNode(4.062537880529582, -2.914753157518182, 6.134369525937169, 2839)
-    femmesh.addNode(4.062925996409471, 2.914212131554617, 47.773257234503205, 2840)
-    femmesh.addNode(3.428255818321417, 3.6396513629941745, 47.76982799251715, 2841)
-    femmesh.addNode(3.096441235439932, 3.925818599409202, 46.97514192763428, 2842)
-    femmesh.addNode(4.303374226437096, 2.5457749836222603, 46.94018534774342, 2843)
-    femmesh.addNode(4.445734182998276, -2.2881100441457463, 9.254085421139797, 2844)
-    femmesh.addNode(4.436387913879514, -2.3061791512334358, 8.340747070024685, 2845)
-    femmesh.addNode(4.010739303327659, -2.9856272775989243, 7.867398755941892, 2846)
-    femmesh.addNode(4.0365825386062575, -2.95059339947392, 9.669500101106838, 2847)
-    femmesh.addNode(-4.104123457079679, -2.8559010222779673, 2.448691545850929, 2848)
-    femmesh.addNode(-4.56618986548535, -2.037132816568151, 2.464158228602849, 2849)
-    femmesh.addNode(-4.73951804565985, -1.592786456140508, 3.2876925343694037, 2850)
-    femmesh.addNode(-3.8145562824806123, -3.2325161047994317, 3.274242975175622, 2851)
-    femmesh.addNode(4.272446616845259, 2.597344780002744, 2.27531467408734, 2852)
-    femmesh.addNode(4.625625963334383, 1.898310945900818, 2.2753047028685343, 2853)
-    femmesh.addNode(4.696899100858689, 1.7143916811373185, 2.9763703213082664, 2854)
-    femmesh.addNode(4.027114172277912, 2.963503238304015, 3.0536122769300627, 2855)
-    femmesh.addNode(4.382120311094592, -2.4077004753690256, 46.83048992115093, 2856)
-    femmesh.addNode(4.077572389815006, -2.893683363089048, 11.518613631070348, 2857)
-    femmesh.addNode(4.0781865138642015, -2.8928177886165156, 18.589263207360013, 2858)
-    femmesh.addNode(4.102193230255971, -2.8586728916827955, 25.803592689644894, 2859)
-    femmesh.addNode(4.506069271054357, -2.166873259897694, 16.35945973504981, 2860)
-    femmesh.addNode(4.506158414249494, -2.1666878745422653, 15.493295326891168, 2861)
-    femmesh.addNode(4.053151215588959, -2.9277918682122444, 20.402751548063442, 2862)
-    femmesh.addNode(4.043161103947404, -2.9415724175220994, 24.00607566794696, 2863)
-    femmesh.addNode(4.443871778023956, -2.2917250316044027, 23.51692966337849, 2864)
-    femmesh.addNode(4.448851831436501, -2.2820423707556543, 22.647442992340636, 2865)
-    femmesh.addNode(4.126200106092751, -2.8239108846562724, 15.042152840830308, 2866)
-    femmesh.addNode(4.551275335603843, -2.070239797589672, 28.70524215050569, 2867)
-    femmesh.addNode(4.569139426869534, -2.0305085318280103, 27.848718564872748, 2868)
-    femmesh.addNode(3.9217840568054303, -3.101549582351819, 30.83299341700794, 2869)
-    femmesh.addNode(4.42282445836894, -2.3320857210774864, 34.183494693017664, 2870)
-    femmesh.addNode(4.422421414562695, -2.332849937740807, 33.23135724223553, 2871)
-    femmesh.addNode(4.042754463598514, -2.94213125931769, 38.31780269443482, 2872)
-    femmesh.addNode(4.444389934760002, -2.2907199976871855, 37.841227933512556, 2873)
-    femmesh.addNode(4.443193257539562, -2.293040269196112, 36.91472664331491, 2874)
-    femmesh.addNode(4.104878279470189, -2.8548159854417694, 41.81519752930317, 2875)
-    femmesh.addNode(4.468736159866224, -2.242854683991826, 41.38098990610092, 2876)
-    femmesh.addNode(4.463863475614135, -2.252536985507253, 40.46860230848921, 2877)
-    femmesh.addNode(4.641306011426972, 1.8596447263635718, 3.711870272653001, 2878)
-    femmesh.addNode(4.464238407567812, -2.2517938272400535, 44.957774846191114, 2879)
-    femmesh.addNode(4.482719472236664, -2.2147745106963463, 44.021226673176386, 2880)
-    femmesh.addNode(4.327499187075079, -2.5045460239062334, 3.9236081435713244, 2881)
-    femmesh.addNode(-4.993708912499937, 0.25074149480829744, 3.2874526958380432, 2882)
-    femmesh.addNode(4.3782791370796295, -2.4146784046355436, 45.96671847169567, 2883)
-    femmesh.addNode(4.039370119185508, -2.946776041749908, 22.22997893214543, 2884)
-    femmesh.addNode(-2.3646323860687315, -4.405509468694273, 3.2189375742071533, 2885)
-    femmesh.addNode(3.981181692205979, 3.0249284840544473, 46.40808452499165, 2886)
-    femmesh.addNode(4.207429898889238, -2.70139475936652, 27.474125941374147, 2887)
-    femmesh.addNode(-0.2868029134915177, 4.991767631692483, 3.2151138652555904, 2888)
-    femmesh.addNode(4.11379913655415, -2.8419459291278444, 16.808966069228205, 2889)
-    femmesh.addNode(4.2535135681272225, 2.6282355917530724, 3.979476452612717, 2890)
-    femmesh.addNode(3.9468498310755873, -3.0695889644932284, 4.378372471997623, 2891)
-    femmesh.addNode(3.0152297714648557, -3.9885322394675455, 3.467361673736135, 2892)
-    femmesh.addNode(4.1117954896253766, -2.844844082106506, 43.58262845456424, 2893)
-    femmesh.addNode(3.9666493108573397, -3.043960125342478, 45.51294428814009, 2894)
-    femmesh.addNode(4.056708910770368, -2.9228603821045396, 40.090268984044855, 2895)
-    femmesh.addNode(4.027945833174598, -2.9623727592947176, 36.476627981622045, 2896)
-    femmesh.addNode(3.987680863768327, -3.0163556369791493, 32.80429361141382, 2897)
-    femmesh.addNode(4.0680748600980685, -2.907020284180708, 29.008709510087385, 2898)
-    femmesh.addNode(4.004592172999106, -2.9938673196977676, 34.62635268706324, 2899)
-    femmesh.addNode(-0.6552418254880115, 4.956879880542914, 4.022628382080962, 2900)
-    femmesh.addNode(0.2345848716470449, 4.9944939621541575, 3.9782232520604275, 2901)
-    femmesh.addNode(0.1251451634405989, 4.998433623453194, 46.03656614138305, 2902)
-    femmesh.addNode(-0.780049327245097, 4.938777485073049, 46.02923371556126, 2903)
-    femmesh.addNode(-1.6746205216331007, 4.711225542098922, 46.03012993158138, 2904)
-    femmesh.addNode(-2.502903046761377, 4.328449646064121, 46.05232458572746, 2905)
-    femmesh.addNode(-3.249849097232324, 3.7998001059553443, 46.07088124667064, 2906)
-    femmesh.addNode(-3.8829806271165346, 3.149993880857181, 46.08498734411358, 2907)
-    femmesh.addNode(-2.8827604278516468, 4.08530198585277, 45.30090568582069, 2908)
-    femmesh.addNode(-4.3868125631864165, 2.399140582681602, 46.07578609944404, 2909)
-    femmesh.addNode(-4.749567867573461, 1.5625636215251157, 46.066567113659644, 2910)
-    femmesh.addNode(-4.149338992055088, 2.789800338556734, 45.310261102094316, 2911)
-    femmesh.addNode(-4.960052373504583, 0.6307776566204246, 46.05592442441833, 2912)
-    femmesh.addNode(-4.99025654538363, -0.3119929666768664, 46.02744766406203, 2913)
-    femmesh.addNode(-4.855063439337394, -1.1951397407873905, 46.00512123189117, 2914)
-    femmesh.addNode(-4.553625173244159, -2.06506604775661, 46.02025625428031, 2915)
-    femmesh.addNode(-4.080084995587493, -2.890139517182831, 46.01209185223933, 2916)
-    femmesh.addNode(-3.484318709928274, -3.5860177255060757, 46.001968660855795, 2917)
-    femmesh.addNode(-2.7910772840133635, -4.1484801547873635, 45.98450927093721, 2918)
-    femmesh.addNode(-1.9659861365854927, -4.597270767613503, 45.97798706037237, 2919)
-    femmesh.addNode(-3.1486585884802993, -3.884063476977333, 45.201333420599894, 2920)
-    femmesh.addNode(-1.064907402779707, -4.885281181621481, 45.94526862939084, 2921)
-    femmesh.addNode(-0.11738693246615758, -4.998621840876361, 45.90576763838844, 2922)
-    femmesh.addNode(0.808547560707583, -4.934192015119985, 45.88938266488056, 2923)
-    femmesh.addNode(1.7012497678702045, -4.7016751511904324, 45.876728557446995, 2924)
-    femmesh.addNode(2.5043284754499395, -4.327625086239632, 45.8429118318277, 2925)
-    femmesh.addNode(3.376226715843506, -3.687965992688188, 45.769960842054275, 2926)
-    femmesh.addNode(3.5097593455899494, -3.5611219209743448, 44.76101721654972, 2927)
-    femmesh.addNode(2.0650485782081667, -4.553633095632589, 45.0518504960832, 2928)
-    femmesh.addNode(3.5244337711135594, -3.546599299756635, 22.681926207368228, 2929)
-    femmesh.addNode(3.5312244928875436, -3.5398380726851206, 21.795051065372036, 2930)
-    femmesh.addNode(3.5342940374122693, -3.5367733397988736, 20.889708863085232, 2931)
-    femmesh.addNode(3.5440957870129064, -3.5269512404451198, 19.94935662099944, 2932)
-    femmesh.addNode(2.9326797130815097, -4.0496159941999625, 21.341656138308032, 2933)
-    femmesh.addNode(3.6291891151488986, -3.439329348359176, 26.36501015657234, 2934)
-    femmesh.addNode(3.569673178425838, -3.5010617531296386, 25.456714728679742, 2935)
-    femmesh.addNode(3.535344326872054, -3.5357234748285373, 24.509113790860066, 2936)
-    femmesh.addNode(3.5239971671629418, -3.5470331216141133, 23.619892197054725, 2937)
-    femmesh.addNode(2.928666662206205, -4.052519164875345, 23.184964330281332, 2938)
-    femmesh.addNode(2.9675712945496353, -4.0241173705254925, 25.070531257787508, 2939)
-    femmesh.addNode(-1.9363006657822888, -4.609852463115394, 3.9748199461861526, 2940)
-    femmesh.addNode(-2.7589544650823488, -4.169912500233329, 4.013891988937297, 2941)
-    femmesh.addNode(3.551768061607108, -3.5192248630270395, 38.79461844004375, 2942)
-    femmesh.addNode(3.541333966284246, -3.529724314906405, 37.90102197850226, 2943)
-    femmesh.addNode(3.5052422293822048, -3.56556824550529, 35.09414497563489, 2944)
-    femmesh.addNode(3.4845528026199983, -3.585790256798788, 34.19144793234737, 2945)
-    femmesh.addNode(3.4023874102976115, -3.663844962638063, 31.441421388226473, 2946)
-    femmesh.addNode(3.3220868656053915, -3.736808646073832, 30.38948322618249, 2947)
-    femmesh.addNode(3.4788841717936947, -3.5912901469031016, 33.2899104038114, 2948)
-    femmesh.addNode(3.4794538388238205, -3.5907382226353093, 32.3705483714495, 2949)
-    femmesh.addNode(2.80136326169292, -4.141541244034303, 31.927038180624052, 2950)
-    femmesh.addNode(2.8951565334701144, -4.076526541886524, 33.75770269238305, 2951)
-    femmesh.addNode(3.6369935170401035, -3.4310753645188647, 42.32405461529709, 2952)
-    femmesh.addNode(3.585552872328031, -3.484797067225035, 41.477995898107324, 2953)
-    femmesh.addNode(3.5229514010459075, -3.5480717898414453, 36.959280019616806, 2954)
-    femmesh.addNode(3.515650657485762, -3.5553059579338497, 36.01170176834553, 2955)
-    femmesh.addNode(2.913483728294568, -4.063448358840406, 35.57679701362966, 2956)
-    femmesh.addNode(2.9463735294674547, -4.039663726704673, 37.436095765225744, 2957)
-    femmesh.addNode(3.553226442200418, -3.517752386176116, 40.599186830254425, 2958)
-    femmesh.addNode(3.5468954964537676, -3.524135686552943, 39.72031700218588, 2959)
-    femmesh.addNode(2.961746567778692, -4.028406293840176, 39.30353628625332, 2960)
-    femmesh.addNode(2.9932743887731257, -4.005035384801846, 41.10804391624835, 2961)
-    femmesh.addNode(3.31755292445626, -3.7408344782189595, 4.505262243060112, 2962)
-    femmesh.addNode(2.4771099728481154, -4.343262159070807, 4.490955189223968, 2963)
-    femmesh.addNode(3.5191992179414564, -3.5517934715352246, 5.401965987485456, 2964)
-    femmesh.addNode(3.5797557747940143, -3.490751866407709, 19.02574742466826, 2965)
-    femmesh.addNode(3.6000355233179917, -3.4698334586617485, 18.152611326050625, 2966)
-    femmesh.addNode(3.6553672279487506, -3.411493870555576, 15.469520021378774, 2967)
-    femmesh.addNode(3.6478007451203154, -3.419583267578035, 14.609867832495055, 2968)
-    femmesh.addNode(3.4452298879151195, 3.623588141527176, 46.2471998012675, 2969)
-    femmesh.addNode(2.7497537253652506, 4.175985446555091, 46.171358616814004, 2970)
-    femmesh.addNode(3.7082197724558337, 3.3539687117156602, 45.60430121417137, 2971)
-    femmesh.addNode(-4.996530849964352, -0.18622423406879457, 4.10607174324899, 2972)
-    femmesh.addNode(-4.9463080656822624, 0.7307780233193875, 4.108615703741173, 2973)
-    femmesh.addNode(3.6319204359994077, -3.4364449575935114, 13.731748219606954, 2974)
-    femmesh.addNode(3.61399736064012, -3.455289145250546, 12.860178761813373, 2975)
-    femmesh.addNode(3.0747121144588374, -3.9428600549854753, 14.159115400155418, 2976)
-    femmesh.addNode(3.495598564647855, 3.5750231712300633, 5.445445279904247, 2977)
-    femmesh.addNode(3.459348738340544, 3.6101116750789974, 6.468290881965672, 2978)
-    femmesh.addNode(3.425298052392889, 3.6424350717992877, 7.401049149167646, 2979)
-    femmesh.addNode(3.4099016983779027, 3.6568525274338715, 8.336740562478127, 2980)
-    femmesh.addNode(2.7818404815487927, 4.154679715118409, 6.914896910006346, 2981)
-    femmesh.addNode(3.4349822064099236, 3.633303901636528, 9.291772916658573, 2982)
-    femmesh.addNode(3.4618447274738995, 3.607718265449945, 10.204969909149352, 2983)
-    femmesh.addNode(2.771406387544382, 4.161647106024032, 8.802687531388765, 2984)
-    femmesh.addNode(3.516573551700586, 3.554393120559391, 11.078521259965868, 2985)
-    femmesh.addNode(3.5511599409525156, 3.5198385010926456, 11.95554809849077, 2986)
-    femmesh.addNode(2.8629536136050353, 4.0992068264904455, 10.631271236385725, 2987)
-    femmesh.addNode(3.599996393459466, 3.4698740563713315, 12.872139528405068, 2988)
-    femmesh.addNode(3.6221460670970362, 3.4467459826064166, 13.772496310268073, 2989)
-    femmesh.addNode(2.9816384029173193, 4.013705573936466, 12.421414017116543, 2990)
-    femmesh.addNode(3.635436280892316, 3.432725309076135, 14.654271104508744, 2991)
-    femmesh.addNode(3.6314815030574765, 3.4369087990447773, 15.540237864886096, 2992)
-    femmesh.addNode(3.0527539863909436, 3.9598854905886105, 14.219780241271511, 2993)
-    femmesh.addNode(3.622097715605737, 3.4467967939238453, 16.419784754722716, 2994)
-    femmesh.addNode(3.62265329260273, 3.4462128665528766, 17.298622179378647, 2995)
-    femmesh.addNode(3.057255791813395, 3.956410876466631, 15.981101925348803, 2996)
-    femmesh.addNode(3.630186808338511, 3.4382762740310815, 18.181234532178287, 2997)
-    femmesh.addNode(3.6392689522912667, 3.4286617641419266, 19.065592050848196, 2998)
-    femmesh.addNode(3.055127479450107, 3.95805458329074, 17.743261167985064, 2999)
-    femmesh.addNode(3.639770578742409, 3.4281292469977194, 19.948219091083192, 3000)
-    femmesh.addNode(3.6304590407896775, 3.4379888238835936, 20.83560815423938, 3001)
-    femmesh.addNode(3.064360654048043, 3.950910500368523, 19.508500561019705, 3002)
-    femmesh.addNode(3.6231522982091544, 3.4456882366200405, 21.723452038473113, 3003)
-    femmesh.addNode(3.615439686484883, 3.4537799399194635, 22.609130649487284, 3004)
-    femmesh.addNode(3.056545293602431, 3.9569598011802984, 21.278971485488437, 3005)
-    femmesh.addNode(3.624309873440504, 3.444470632953876, 23.499218402595382, 3006)
-    femmesh.addNode(3.63239912174071, 3.4359389721555473, 24.386213626960693, 3007)
-    femmesh.addNode(3.058320875718195, 3.955587620208443, 23.05690312283027, 3008)
-    femmesh.addNode(3.640355672181421, 3.427507925595002, 25.27302970246307, 3009)
-    femmesh.addNode(3.6380723961272956, 3.429931375485026, 26.16335371235826, 3010)
-    femmesh.addNode(3.077628031202779, 3.940584436546806, 24.83380695144075, 3011)
-    femmesh.addNode(3.6296563585564785, 3.438836244834948, 27.05080607933197, 3012)
-    femmesh.addNode(3.6208674237961844, 3.4480891953793162, 27.938304955504293, 3013)
-    femmesh.addNode(3.077107870543418, 3.9409906309251426, 26.608075393916838, 3014)
-    femmesh.addNode(3.6206643377803243, 3.4483024451352535, 28.829015722683863, 3015)
-    femmesh.addNode(3.628633748280452, 3.4399152781485998, 29.717331228499702, 3016)
-    femmesh.addNode(3.067208598003655, 3.9486999653471333, 28.38623852807012, 3017)
-    femmesh.addNode(3.636088679613038, 3.432034253032728, 30.606538011079625, 3018)
-    femmesh.addNode(3.635579838135426, 3.432573268051709, 31.498447778646, 3019)
-    femmesh.addNode(3.0755365676412905, 3.9422169931526128, 30.166156077829612, 3020)
-    femmesh.addNode(3.627242016904146, 3.4413827672616053, 32.39033205342863, 3021)
-    femmesh.addNode(3.617699599391206, 3.4514126975145567, 33.28039722190444, 3022)
-    femmesh.addNode(3.074526289183179, 3.943004957785561, 31.947247135192168, 3023)
-    femmesh.addNode(3.6135975487548633, 3.4557072728506455, 34.181272426953484, 3024)
-    femmesh.addNode(3.6232518772198077, 3.4455835259391323, 35.068555119166504, 3025)
-    femmesh.addNode(3.060257449536114, 3.954089571893727, 33.740006615023844, 3026)
-    femmesh.addNode(3.6294547131379367, 3.439049067006869, 35.940156575970654, 3027)
-    femmesh.addNode(3.637483955411139, 3.4305554177314397, 36.83076770692147, 3028)
-    femmesh.addNode(3.0626853228563706, 3.9522093331654595, 35.512483276877035, 3029)
-    femmesh.addNode(3.6263793217118385, 3.442291825958512, 37.72179089777457, 3030)
-    femmesh.addNode(3.6133128941083816, 3.4560049087450837, 38.61253573774096, 3031)
-    femmesh.addNode(3.0570324657104258, 3.9565834382194485, 37.27510792453428, 3032)
-    femmesh.addNode(3.593060877339288, 3.4770552960420154, 39.494240497376026, 3033)
-    femmesh.addNode(3.5803966135784253, 3.4900945674116257, 40.38287742560947, 3034)
-    femmesh.addNode(3.021006702933691, 3.984158443238636, 39.04783587502244, 3035)
-    femmesh.addNode(3.562430378792127, 3.5084312443396954, 41.28657496726418, 3036)
-    femmesh.addNode(3.545197923009052, 3.5258434007613415, 42.17120771596369, 3037)
-    femmesh.addNode(2.97709379280552, 4.017077612996648, 40.833238176312214, 3038)
-    femmesh.addNode(1.9542361612266492, 4.602277808450303, 46.086865716558336, 3039)
-    femmesh.addNode(1.0537272188294036, 4.8877048753272785, 46.033503189932354, 3040)
-    femmesh.addNode(0.627484056759942, 4.96047011466777, 45.277493641386584, 3041)
-    femmesh.addNode(2.3702633151367265, 4.402482460716573, 45.35892359019155, 3042)
-    femmesh.addNode(3.8179209921787334, -3.2285413575608657, 28.064393321330897, 3043)
-    femmesh.addNode(3.750277821188716, -3.3068740925381506, 27.30215549749424, 3044)
-    femmesh.addNode(3.148122199297259, -3.8844982453711814, 26.95527753652909, 3045)
-    femmesh.addNode(3.58141620524482, -3.489048289263104, 28.836739066207475, 3046)
-    femmesh.addNode(3.6980639218096596, -3.365163180324211, 44.012293351696925, 3047)
-    femmesh.addNode(3.739667881512801, -3.3188678997485814, 43.09092114362562, 3048)
-    femmesh.addNode(3.1496900924996982, -3.883227049917277, 42.753719512429775, 3049)
-    femmesh.addNode(3.055829728626824, -3.957512434552861, 44.26930990561111, 3050)
-    femmesh.addNode(3.459654217707133, -3.609818928132164, 6.2612592969996586, 3051)
-    femmesh.addNode(3.573494102186107, -3.4971616922357356, 11.955988465691318, 3052)
-    femmesh.addNode(3.5581018939377285, -3.512820933716484, 11.035240360402236, 3053)
-    femmesh.addNode(3.0101022685678247, -3.992403327917012, 12.376805491145262, 3054)
-    femmesh.addNode(3.613383752633897, -3.4559308234108754, 17.256773930781655, 3055)
-    femmesh.addNode(3.636089122567039, -3.4320337837424706, 16.34961289126748, 3056)
-    femmesh.addNode(3.070761992939817, -3.9459372502253864, 15.917327882932227, 3057)
-    femmesh.addNode(3.0331828742269673, -3.9748964328012666, 17.693258148089903, 3058)
-    femmesh.addNode(3.5237558644936877, -3.5472728408520178, 10.113628993941258, 3059)
-    femmesh.addNode(3.4894126622575583, -3.581061193623563, 9.18526356926683, 3060)
-    femmesh.addNode(2.9240595144154953, -4.0558446661769745, 10.551003828562227, 3061)
-    femmesh.addNode(-1.2193394240156343, 4.849042314626798, 45.281452808857395, 3062)
-    femmesh.addNode(-4.880044989263248, 1.0886509554336796, 45.29041716818347, 3063)
-    femmesh.addNode(-4.943269759563618, -0.7510553136646159, 45.25744804677129, 3064)
-    femmesh.addNode(-4.338457355317819, -2.4855155956237174, 45.226957212559455, 3065)
-    femmesh.addNode(0.3119876316747884, -4.990256878927372, 45.102052195210376, 3066)
-    femmesh.addNode(-1.5393099490064701, -4.757155124745219, 45.151155599699784, 3067)
-    femmesh.addNode(3.4746346598957207, -3.595401782868133, 7.364398497677307, 3068)
-    femmesh.addNode(2.825960404922798, -4.124796696785015, 6.631994959225592, 3069)
-    femmesh.addNode(-4.5635625315537185, -2.0430117524378124, 4.0771593618144815, 3070)
-    femmesh.addNode(-4.867783964148642, -1.142225581212982, 4.074375562790938, 3071)
-    femmesh.addNode(-0.16370886653170003, -4.997319222044846, 3.999788594771533, 3072)
-    femmesh.addNode(-1.0885131319849648, -4.88007573317221, 3.9692957259866546, 3073)
-    femmesh.addNode(2.9771688686195703, -4.017021972521742, 19.51270473969005, 3074)
-    femmesh.addNode(3.4712941019788053, -3.598627135112383, 8.238134418167826, 3075)
-    femmesh.addNode(3.8151906093989973, 3.2317674133442376, 3.982887741321468, 3076)
-    femmesh.addNode(3.130895739841809, -3.8983960632855674, 29.482139990815128, 3077)
-    femmesh.addNode(2.8031475262313617, -4.140333796468951, 28.537823802058647, 3078)
-    femmesh.addNode(2.499132531179364, -4.330627736437412, 30.09056796203366, 3079)
-    femmesh.addNode(-1.5348805415076014, 4.758586105483574, 4.047190345943915, 3080)
-    femmesh.addNode(-1.0309897500930363, 4.892551495406369, 4.810299732748752, 3081)
-    femmesh.addNode(-2.350963586052832, 4.412818851601957, 4.059113613947351, 3082)
-    femmesh.addNode(3.624767226791361, 3.4439893367400645, 44.86049194723857, 3083)
-    femmesh.addNode(-4.717326149512422, 1.6573575350920224, 4.164750127923607, 3084)
-    femmesh.addNode(-4.332482682859627, 2.495915423791729, 4.165065584688287, 3085)
-    femmesh.addNode(-4.844017317527398, 1.2391514142729583, 4.983369175334554, 3086)
-    femmesh.addNode(-3.796216123945558, 3.25403490151777, 4.1513407957243045, 3087)
-    femmesh.addNode(-3.120454616747611, 3.906758628942735, 4.14770977643601, 3088)
-    femmesh.addNode(-4.047157683983917, 2.9360713003893366, 5.025778810553005, 3089)
-    femmesh.addNode(-3.4817528934810884, -3.5885089924279234, 4.039131234826787, 3090)
-    femmesh.addNode(-4.0920626246102065, -2.8731556651647376, 4.055364593044111, 3091)
-    femmesh.addNode(-4.342999643639151, -2.477570199883388, 4.842047621465646, 3092)
-    femmesh.addNode(-3.125847811570362, -3.902444805362503, 4.795013606805785, 3093)
-    femmesh.addNode(-4.955198111203222, -0.6678410579831267, 4.895538570694068, 3094)
-    femmesh.addNode(-2.709658567998767, 4.202112616871528, 4.923457859100363, 3095)
-    femmesh.addNode(1.6322941339406263, -4.726057115641221, 4.207245626607223, 3096)
-    femmesh.addNode(0.729001759537531, -4.94657016877262, 4.101143951170112, 3097)
-    femmesh.addNode(0.2294523096395965, -4.9947323889875275, 4.860081276915878, 3098)
-    femmesh.addNode(1.9964485878343143, -4.584124020588271, 5.2451461959312, 3099)
-    femmesh.addNode(3.4398796971743737, 3.6286674784233863, 43.132909477998865, 3100)
-    femmesh.addNode(3.4465402420272473, 3.6223418336880857, 43.968953323033595, 3101)
-    femmesh.addNode(2.836459044295583, 4.117584254151187, 42.69863748000209, 3102)
-    femmesh.addNode(1.0916004946068312, 4.879386063858251, 3.9732535733323626, 3103)
-    femmesh.addNode(1.8912548739119668, 4.6285154209426835, 3.9107099479024505, 3104)
-    femmesh.addNode(0.7276982320641735, 4.946762100915171, 4.780768090157734, 3105)
-    femmesh.addNode(-1.5317720309281126, -4.759587633951744, 4.764250140716797, 3106)
-    femmesh.addNode(3.242568608355989, 3.806014821319579, 3.7378272485584123, 3107)
-    femmesh.addNode(3.5396478819415127, 3.53141513728802, 4.663691424241067, 3108)
-    femmesh.addNode(2.871690233397689, 4.093091155032871, 5.200384787141192, 3109)
-    femmesh.addNode(2.5723685190405607, 4.287530781492894, 3.7321262079266218, 3110)
-    femmesh.addNode(-3.882080224577513, 3.1511034781397145, 44.56675255642902, 3111)
-    femmesh.addNode(-4.386126728154841, 2.4003942019105335, 44.55755131175948, 3112)
-    femmesh.addNode(-4.9908869621203715, -0.30174050330853247, 44.466585798871456, 3113)
-    femmesh.addNode(-4.857508446582487, -1.1851631496885968, 44.44425936670059, 3114)
-    femmesh.addNode(-4.872554873764293, -1.1216991584894047, 5.738348775617789, 3115)
-    femmesh.addNode(-4.997271351585913, -0.1651636722124502, 5.770044956075841, 3116)
-    femmesh.addNode(-2.974733222794283, 4.018825979462651, 5.793666932040849, 3117)
-    femmesh.addNode(-2.1871595113313274, 4.496257696350701, 5.70507076955219, 3118)
-    femmesh.addNode(2.2518716219158392, -4.464199166525854, 21.831409650747602, 3119)
-    femmesh.addNode(2.2557435477549053, -4.4622439474733016, 20.9260674484608, 3120)
-    femmesh.addNode(2.2876905544308985, -4.445950059005122, 19.972624966908175, 3121)
-    femmesh.addNode(2.332754844314401, -4.422471575525126, 19.049015770577, 3122)
-    femmesh.addNode(-0.7621750942150196, 4.941567476596705, 44.49108056907827, 3123)
-    femmesh.addNode(-1.6575637452076941, 4.717253695803634, 44.49197678509839, 3124)
-    femmesh.addNode(-1.4269327071940814, 4.792062504719629, 5.517679625720637, 3125)
-    femmesh.addNode(-0.5430367849558901, 4.97042362884541, 5.493117661857684, 3126)
-    femmesh.addNode(-1.7326767941574874, 4.690184551484956, 6.387888698661122, 3127)
-    femmesh.addNode(-1.064517664023157, -4.885366121692691, 5.535776623798094, 3128)
-    femmesh.addNode(-1.913622927928134, -4.619312426076824, 5.541300843997593, 3129)
-    femmesh.addNode(2.8638104310828467, -4.098608277796389, 8.682263311002245, 3130)
-    femmesh.addNode(2.577145982723707, -4.284660848157186, 27.562748433804536, 3131)
-    femmesh.addNode(2.4217233317119984, -4.374386368925559, 26.625603092882635, 3132)
-    femmesh.addNode(2.037387161238869, -4.566076385171302, 28.208149358412193, 3133)
-    femmesh.addNode(1.9490387406307654, 4.604481294078676, 6.309953320550827, 3134)
-    femmesh.addNode(1.905717717593782, 4.622579364472735, 7.242711587752801, 3135)
-    femmesh.addNode(2.4614445250416983, -4.352159331888281, 14.597071178686381, 3136)
-    femmesh.addNode(2.441256800921883, -4.363515237964989, 13.71895156579828, 3137)
-    femmesh.addNode(1.911852568903369, 4.62004542778289, 8.318243316386766, 3138)
-    femmesh.addNode(1.9435958527969053, 4.606781431866577, 9.273275670567209, 3139)
-    femmesh.addNode(1.0069398138184011, 4.897557780296967, 7.713299726931247, 3140)
-    femmesh.addNode(2.0451765747616637, 4.5625927692537, 10.228005772093905, 3141)
-    femmesh.addNode(2.1146632072593863, 4.530805614883897, 11.101557122910421, 3142)
-    femmesh.addNode(1.1216615931191196, 4.872563521445511, 9.743561557091905, 3143)
-    femmesh.addNode(2.275481291274915, 4.452211236347377, 11.993083317014218, 3144)
-    femmesh.addNode(2.337470448976053, 4.4199809841405076, 12.909674746928518, 3145)
-    femmesh.addNode(1.4020179741226557, 4.799410963882652, 11.589817852722398, 3146)
-    femmesh.addNode(2.4122713535314464, 4.379605794695633, 13.7887697388363, 3147)
-    femmesh.addNode(2.4291749041228154, 4.370252771314253, 14.670544533076972, 3148)
-    femmesh.addNode(1.6533632567297627, 4.718727576507883, 13.360439038733979, 3149)
-    femmesh.addNode(2.426189291850033, 4.371910968914193, 15.530813298414014, 3150)
-    femmesh.addNode(2.4142608204940137, 4.378509414244483, 16.410360188250635, 3151)
-    femmesh.addNode(1.7301378368210643, 4.6911217278599935, 15.099802795978803, 3152)
-    femmesh.addNode(2.4102449733056246, 4.380721306891705, 17.29048675832415, 3153)
-    femmesh.addNode(2.419826606256651, 4.375435886360629, 18.173099111123793, 3154)
-    femmesh.addNode(1.7226299344510456, 4.693883904500961, 16.840198131389364, 3155)
-    femmesh.addNode(2.412563131646929, 4.379445071674945, 19.058073361000538, 3156)
-    femmesh.addNode(2.4132038852992452, 4.3790920300875875, 19.94070040123553, 3157)
-    femmesh.addNode(1.7105316723024107, 4.69830622650869, 18.60529895133962, 3158)
-    femmesh.addNode(2.425111212507976, 4.372509074543825, 20.828586062460694, 3159)
-    femmesh.addNode(2.415823277981031, 4.377647529160495, 21.716429946694426, 3160)
-    femmesh.addNode(1.7155197368283301, 4.696487201361509, 20.378158862441524, 3161)
-    femmesh.addNode(2.4252580583943613, 4.372427626638686, 22.608983221103465, 3162)
-    femmesh.addNode(2.4364946825054052, 4.3661760915156504, 23.499070974211566, 3163)
-    femmesh.addNode(1.7384071863235653, 4.688063614600232, 22.15859779807572, 3164)
-    femmesh.addNode(2.4269744077309636, 4.371475177124873, 24.386651922537403, 3165)
-    femmesh.addNode(2.4371032630291856, 4.365836424481854, 25.273467998039777, 3166)
-    femmesh.addNode(1.7383010694659353, 4.688102963021779, 23.938732020810598, 3167)
-    femmesh.addNode(2.438952751495256, 4.36480348652419, 26.158728986473246, 3168)
-    femmesh.addNode(2.4282493918568644, 4.3707670826694445, 27.046181353446958, 3169)
-    femmesh.addNode(1.7300686195142847, 4.691147255392004, 25.711573957569897, 3170)
-    femmesh.addNode(2.4380258821370733, 4.365321270883707, 27.936584658149812, 3171)
-    femmesh.addNode(2.4377687765865375, 4.36546485404473, 28.827295425329382, 3172)
-    femmesh.addNode(1.742549660054669, 4.686525438130403, 27.48723825070622, 3173)
-    femmesh.addNode(2.42816386007068, 4.370814600122802, 29.718993877613187, 3174)
-    femmesh.addNode(2.437641358931541, 4.3655360043443, 30.60820066019311, 3175)
-    femmesh.addNode(1.742733967389397, 4.686456904624987, 29.269340007692875, 3176)
-    femmesh.addNode(2.4376035495341397, 4.365557116256591, 31.498045167303808, 3177)
-    femmesh.addNode(2.4270059159260207, 4.37145768412095, 32.38992944208644, 3178)
-    femmesh.addNode(1.7323842942921297, 4.690292598217083, 31.050882967087382, 3179)
-    femmesh.addNode(2.4368080609974028, 4.366001199479689, 33.28474735098749, 3180)
-    femmesh.addNode(2.4316205188089373, 4.368892497247713, 34.185622556036535, 3181)
-    femmesh.addNode(1.7428629704765837, 4.6864089307423376, 32.83554538309913, 3182)
-    femmesh.addNode(2.419229705468958, 4.37576594805716, 35.076232478530414, 3183)
-    femmesh.addNode(2.4271106245440075, 4.371399548911721, 35.94783393533456, 3184)
-    femmesh.addNode(1.7400967072242322, 4.687436767520964, 34.62097321449406, 3185)
-    femmesh.addNode(2.412180108651018, 4.3796560508136215, 36.8284845203922, 3186)
-    femmesh.addNode(2.3980149084656164, 4.387428004967903, 37.7195077112453, 3187)
-    femmesh.addNode(1.710784339776018, 4.698214229127609, 36.39223372204558, 3188)
-    femmesh.addNode(2.384202811691906, 4.394949027317656, 38.60535315936548, 3189)
-    femmesh.addNode(2.3584863568631107, 4.408802797187755, 39.487057919000534, 3190)
-    femmesh.addNode(1.6799383731371162, 4.709331912539338, 38.1587297552234, 3191)
-    femmesh.addNode(2.318269118500959, 4.430082199486233, 40.369123895404186, 3192)
-    femmesh.addNode(2.295493380608862, 4.441926399613224, 41.272821437058894, 3193)
-    femmesh.addNode(1.622146129002451, 4.729549866124932, 39.92664117974722, 3194)
-    femmesh.addNode(-1.9884168542871286, -4.587613585905736, 44.36381395918086, 3195)
-    femmesh.addNode(-1.0887555801344309, -4.880021648182121, 44.331095528199334, 3196)
-    femmesh.addNode(2.9222736542910837, 4.057131583944035, 44.55187786624224, 3197)
-    femmesh.addNode(2.393044208578445, -4.390141161259985, 12.84825095413546, 3198)
-    femmesh.addNode(2.341731760697572, -4.417724794613201, 11.944060658013406, 3199)
-    femmesh.addNode(-0.16644587350289508, -4.997228809169524, 44.26201373928424, 3200)
-    femmesh.addNode(0.7600764323180669, -4.941890712777311, 44.24562876577636, 3201)
-    femmesh.addNode(-0.644902640527239, -4.958235632182177, 43.47467209876531, 3202)
-    femmesh.addNode(-4.559692907117585, -2.051633640000472, 44.446020740537506, 3203)
-    femmesh.addNode(-4.088586985444681, -2.8780994531899644, 44.43785633849653, 3204)
-    femmesh.addNode(-4.726284539230012, -1.6316355151305548, 43.655158492637675, 3205)
-    femmesh.addNode(-2.501614817660199, 4.32919430195307, 44.55048811092533, 3206)
-    femmesh.addNode(-3.2487181576970237, 3.8007670715067055, 44.5690447718685, 3207)
-    femmesh.addNode(-2.087313163030505, 4.543470453237216, 43.7601158711462, 3208)
-    femmesh.addNode(-4.758283535046129, 1.5358182835573069, 44.50273665538458, 3209)
-    femmesh.addNode(-4.963522572206515, 0.6028628991706313, 44.492093966143266, 3210)
-    femmesh.addNode(-4.997385843991179, 0.16166238361651264, 43.67890528607257, 3211)
-    femmesh.addNode(-4.6011609727960865, 1.9568642524248245, 43.75922810971928, 3212)
-    femmesh.addNode(-3.5813004890572953, 3.4891670649422872, 43.81633498153366, 3213)
-    femmesh.addNode(2.310455059888861, 4.434162538319266, 42.07509591000496, 3214)
-    femmesh.addNode(2.178935747957004, 4.500248771598638, 43.03679767204014, 3215)
-    femmesh.addNode(1.5950251150974033, 4.7387651220764795, 41.61098162909694, 3216)
-    femmesh.addNode(1.552095665510333, -4.752998952777502, 20.46237847934775, 3217)
-    femmesh.addNode(2.1665099232146217, -4.506243973933566, 7.262136123130341, 3218)
-    femmesh.addNode(2.1477533254565, -4.515213799255861, 6.158996922452694, 3219)
-    femmesh.addNode(-2.276936858532302, -4.451467010127903, 6.3806396040552205, 3220)
-    femmesh.addNode(-2.696571082458, -4.210523055067065, 5.609113120973923, 3221)
-    femmesh.addNode(1.2768446966376266, -4.834218408457397, 5.87528735983595, 3222)
-    femmesh.addNode(2.450774404670014, -4.358176776751298, 15.464212064665666, 3223)
-    femmesh.addNode(1.7615555643672884, -4.6794147063117455, 15.024048230308527, 3224)
-    femmesh.addNode(2.426181878802773, -4.37191508277197, 16.344304934554373, 3225)
-    femmesh.addNode(1.892901339241746, -4.627842317959505, 30.73841170458272, 3226)
-    femmesh.addNode(1.6589050888463226, -4.716782155898211, 29.83106846921536, 3227)
-    femmesh.addNode(0.027258052777176574, 4.99992569930382, 6.419132776563426, 3228)
-    femmesh.addNode(0.4353159023845915, 4.981013959539873, 5.71175288359154, 3229)
-    femmesh.addNode(2.2948153138062417, -4.4422767445894635, 39.81559632288658, 3230)
-    femmesh.addNode(2.3009594085046645, -4.43909740830429, 38.88989776074445, 3231)
-    femmesh.addNode(0.5877067452925413, -4.965339946220968, 5.519326809173801, 3232)
-    femmesh.addNode(-0.3060877132273648, -4.990622236937118, 5.417971452775223, 3233)
-    femmesh.addNode(-0.7107767849520609, -4.949221793572522, 6.195022156056018, 3234)
-    femmesh.addNode(0.7524645764150693, -4.943055437807722, 6.433177535695295, 3235)
-    femmesh.addNode(2.1379079328217845, -4.519883811645792, 9.150978587913496, 3236)
-    femmesh.addNode(2.1150682176326314, -4.53061656231912, 8.20384943681449, 3237)
-    femmesh.addNode(1.6764122456826058, -4.710588284123905, 26.21283245998427, 3238)
-    femmesh.addNode(2.3153963887921583, -4.431584317461221, 25.605361562708822, 3239)
-    femmesh.addNode(2.305569273113174, -4.436704895175742, 37.90502199659983, 3240)
-    femmesh.addNode(2.2824921623830545, -4.448621081712841, 36.963280037714384, 3241)
-    femmesh.addNode(2.225373604983761, -4.47746717667942, 36.001654111748024, 3242)
-    femmesh.addNode(2.2122748896983833, -4.4839535916878095, 35.08409731903738, 3243)
-    femmesh.addNode(-4.932663153467547, 0.8178228502699079, 5.792495212712076, 3244)
-    femmesh.addNode(-4.687389645111617, 1.7402236393350103, 5.848629636894509, 3245)
-    femmesh.addNode(-4.987043493618361, 0.3597182129928548, 6.635305417635796, 3246)
-    femmesh.addNode(2.2362127378356003, -4.472063571902999, 11.009098851611352, 3247)
-    femmesh.addNode(2.192596426153928, -4.493608896201028, 10.087487485150373, 3248)
-    femmesh.addNode(1.3858506909272488, -4.804104272646096, 9.60907361096262, 3249)
-    femmesh.addNode(1.557259374143716, -4.751309634368352, 11.480544314601552, 3250)
-    femmesh.addNode(2.2720266718510396, 4.453975168587886, 4.597214671453839, 3251)
-    femmesh.addNode(1.7214107647258345, -4.694331153538917, 13.286206732666423, 3252)
-    femmesh.addNode(-4.251518768975457, 2.6314612208902894, 5.8722416230241485, 3253)
-    femmesh.addNode(-3.6915833446295894, 3.3722711055983345, 5.858516834060166, 3254)
-    femmesh.addNode(-3.26136015740851, 3.7899247912944576, 6.6401297445119924, 3255)
-    femmesh.addNode(-4.462142744764196, 2.2559437327531566, 6.68136766040167, 3256)
-    femmesh.addNode(-3.427944787112148, -3.6399443040396444, 5.634352366863412, 3257)
-    femmesh.addNode(0.2008665473013886, 4.9959636337923055, 44.520028851277715, 3258)
-    femmesh.addNode(-0.2567383532304422, 4.99340419132885, 43.73055282751871, 3259)
-    femmesh.addNode(2.23573859883958, -4.472300629168261, 22.76786242495416, 3260)
-    femmesh.addNode(1.5007545738763803, -4.76945863898505, 22.352273735106927, 3261)
-    femmesh.addNode(2.2351880532009707, -4.472575808952561, 23.705828414640656, 3262)
-    femmesh.addNode(2.188594746676805, -4.495559257180211, 34.179107613878614, 3263)
-    femmesh.addNode(2.1814906187384278, -4.499010855772214, 33.277570085342646, 3264)
-    femmesh.addNode(1.4406562065658908, -4.787954646243339, 34.60396471199698, 3265)
-    femmesh.addNode(1.1276642540928135, 4.871177817534615, 44.51696589982702, 3266)
-    femmesh.addNode(2.272048373662071, -4.453964098164638, 24.657760624889143, 3267)
-    femmesh.addNode(1.6060392268816825, -4.735043611384935, 44.21798093921698, 3268)
-    femmesh.addNode(2.416501541966488, -4.377273157763128, 44.18416421359768, 3269)
-    femmesh.addNode(-2.799935929710922, -4.142506341517636, 44.39904435481796, 3270)
-    femmesh.addNode(-2.401229229893878, -4.385669639348506, 43.57898428331751, 3271)
-    femmesh.addNode(-3.4919738290409024, -3.578563786953283, 44.416503744736545, 3272)
-    femmesh.addNode(2.145311935512299, 4.516374286897452, 44.46738496598658, 3273)
-    femmesh.addNode(-4.071302513116727, -2.9024982078701482, 5.678624608030308, 3274)
-    femmesh.addNode(-4.548757927366383, -2.075765236779315, 5.700419376800678, 3275)
-    femmesh.addNode(-4.734760008189252, -1.6068751242245676, 6.574925762182451, 3276)
-    femmesh.addNode(1.146075465596801, -4.866878982177087, 43.37794248329084, 3277)
-    femmesh.addNode(2.371863671957441, -4.401620465425042, 18.123727594615293, 3278)
-    femmesh.addNode(2.388812733267534, -4.39244507368947, 17.227890199346323, 3279)
-    femmesh.addNode(1.7100823642928025, -4.6984697835928175, 16.774774381079762, 3280)
-    femmesh.addNode(1.628114354803651, -4.727498667126443, 18.583647821833416, 3281)
-    femmesh.addNode(-3.823568294158451, -3.2218512535351835, 43.635567272714596, 3282)
-    femmesh.addNode(1.5828253471609863, -4.742853984721088, 38.41708203323309, 3283)
-    femmesh.addNode(1.3822476168817055, -4.805142196191997, 7.730851400041592, 3284)
-    femmesh.addNode(0.5624800633461393, -4.968260880664191, 8.171539151770368, 3285)
-    femmesh.addNode(0.6190047438626927, -4.961535359853388, 7.229825838086217, 3286)
-    femmesh.addNode(2.65076559610208, -4.239509612504916, 43.43544034874489, 3287)
-    femmesh.addNode(1.5269450639178213, -4.761138390319799, 36.47058034312211, 3288)
-    femmesh.addNode(-1.1248896349509157, -4.87181930177834, 42.69344364849121, 3289)
-    femmesh.addNode(-0.2034738308801597, -4.995858124501431, 42.62436185957612, 3290)
-    femmesh.addNode(-1.7486947464728329, -4.684235976512959, 7.147773295385523, 3291)
-    femmesh.addNode(-2.545639985423028, -4.3034540853383625, 7.215585572361853, 3292)
-    femmesh.addNode(0.25227847527102903, 4.993631501313941, 42.860997880628794, 3293)
-    femmesh.addNode(-0.7112720415253155, 4.949150642579433, 42.83204959842935, 3294)
-    femmesh.addNode(-4.110548951738766, -2.846644922599117, 42.841889360188716, 3295)
-    femmesh.addNode(-3.519327691459294, -3.551666172393993, 42.82053676642873, 3296)
-    femmesh.addNode(2.2166382059154657, 4.481798195376033, 5.378968527117021, 3297)
-    femmesh.addNode(0.01275486390781735, 4.999983731318202, 7.256399255685281, 3298)
-    femmesh.addNode(0.01939239209472191, 4.999962393371459, 8.331930984319245, 3299)
-    femmesh.addNode(-0.9612018196929255, 4.90673935132273, 7.037764033951424, 3300)
-    femmesh.addNode(2.17656442463097, -4.501396150688234, 31.533725879428978, 3301)
-    femmesh.addNode(1.3104064306257963, -4.82522900871809, 31.274226386610678, 3302)
-    femmesh.addNode(1.2870071607103029, 4.8315228001408, 5.706783204863475, 3303)
-    femmesh.addNode(0.7951087576462078, -4.936375397345131, 36.954957101460735, 3304)
-    femmesh.addNode(0.7318699250336442, -4.946146622658011, 35.993331175494376, 3305)
-    femmesh.addNode(0.9614428063381262, -4.906692137289711, 26.823647823471354, 3306)
-    femmesh.addNode(0.8426889068079569, -4.9284759719758, 25.803406293297538, 3307)
-    femmesh.addNode(2.271700326223441, -4.454141626378343, 32.462852862652014, 3308)
-    femmesh.addNode(-1.7462741260070227, 4.685138917560333, 7.225155177782978, 3309)
-    femmesh.addNode(-3.7422702834982986, -3.3159332208664223, 6.492724122198446, 3310)
-    femmesh.addNode(1.4080732222580805, -4.7976379397324, 28.833629226492718, 3311)
-    femmesh.addNode(1.1488388154284852, -4.866227427501192, 27.858553858238615, 3312)
-    femmesh.addNode(-3.276117149956028, 3.777175720000857, 43.0881104021303, 3313)
-    femmesh.addNode(-3.9047648402803743, 3.12294917379553, 43.085818186690815, 3314)
-    femmesh.addNode(1.5229065210256478, -4.7624317032601695, 24.240658719561967, 3315)
-    femmesh.addNode(0.7604799967432462, -4.9418286265868625, 20.943229031620618, 3316)
-    femmesh.addNode(0.7959052410814781, -4.936247040740469, 19.989786550067993, 3317)
-    femmesh.addNode(0.748871043985761, -4.943601132724977, 29.481472969041782, 3318)
-    femmesh.addNode(2.2348945816375085, -4.4727224605342215, 41.72866107187829, 3319)
-    femmesh.addNode(2.19350463402429, -4.493165634662711, 40.8498520040254, 3320)
-    femmesh.addNode(-2.8227262026606055, -4.127010635413148, 42.818571125154946, 3321)
-    femmesh.addNode(-2.0136728113969644, -4.576584076430875, 42.783340729517846, 3322)
-    femmesh.addNode(-1.60065425010028, -4.736866682907163, 41.93303049032865, 3323)
-    femmesh.addNode(-3.1995927568386184, -3.842213709619215, 42.02489321262907, 3324)
-    femmesh.addNode(-0.04642032564252607, 4.99978451069316, 9.361344494554762, 3325)
-    femmesh.addNode(0.0643553102216997, 4.999585822250306, 10.316074596081457, 3326)
-    femmesh.addNode(-1.0398930877570254, 4.890666863121548, 8.904444023308796, 3327)
-    femmesh.addNode(0.9795831563478252, 4.90310277679345, 12.956696326332636, 3328)
-    femmesh.addNode(1.0627932466363696, 4.88574155220107, 13.83579131824042, 3329)
-    femmesh.addNode(0.9855505329240061, 4.901906786858886, 14.621623119276983, 3330)
-    femmesh.addNode(0.9822021178862854, 4.902578811158439, 15.481891884614024, 3331)
-    femmesh.addNode(0.29275843983452077, 4.9914218911954995, 14.21788040687564, 3332)
-    femmesh.addNode(0.9787862114600281, 4.903261929803029, 16.36351646675258, 3333)
-    femmesh.addNode(0.9742898009391577, 4.904157357159937, 17.243643036826093, 3334)
-    femmesh.addNode(0.21046330992060544, 4.99556855574791, 15.885336790050756, 3335)
-    femmesh.addNode(0.9708355446950081, 4.904842336421911, 18.139373727244532, 3336)
-    femmesh.addNode(0.9626956227924893, 4.906446487821525, 19.024347977121273, 3337)
-    femmesh.addNode(0.2034642544856174, 4.995858514524467, 17.662692062607746, 3338)
-    femmesh.addNode(0.9663855190212303, 4.90572105083708, 19.916258140255046, 3339)
-    femmesh.addNode(0.979731250975448, 4.90307318687597, 20.804143801480205, 3340)
-    femmesh.addNode(0.20370307012585767, 4.995848782661591, 19.450332916159958, 3341)
-    femmesh.addNode(0.9902353407581197, 4.900962555449047, 21.699175853295237, 3342)
-    femmesh.addNode(1.0008019649815787, 4.898815716771658, 22.591729127704276, 3343)
-    femmesh.addNode(0.21816475267648097, 4.995238146544128, 21.23727513110876, 3344)
-    femmesh.addNode(0.9807240683382639, 4.90287469774438, 23.482617206757965, 3345)
-    femmesh.addNode(0.9700377109876624, 4.905000187488459, 24.370198155083802, 3346)
-    femmesh.addNode(0.2084036021509159, 4.9956549058767585, 23.023195261977484, 3347)
-    femmesh.addNode(0.9682287193920375, 4.905357596235412, 25.254228355619432, 3348)
-    femmesh.addNode(0.9703069227393204, 4.904946939130347, 26.139489344052897, 3349)
-    femmesh.addNode(0.18609295332401274, 4.996535741163386, 24.798113541566803, 3350)
-    femmesh.addNode(0.9832117829250154, 4.902376422707401, 27.02870749307578, 3351)
-    femmesh.addNode(0.9941817311164585, 4.900163536609189, 27.919110797778636, 3352)
-    femmesh.addNode(0.197399051199223, 4.9961018418949035, 26.571361891125314, 3353)
-    femmesh.addNode(0.9948097335521398, 4.900036080890621, 28.81341351752686, 3354)
-    femmesh.addNode(0.9840328608708686, 4.9022116772663225, 29.705111969810666, 3355)
-    femmesh.addNode(0.21118671346269965, 4.995538026284739, 28.35488275989642, 3356)
-    femmesh.addNode(0.9731753626560429, 4.904378626647751, 30.598460829272113, 3357)
-    femmesh.addNode(0.9731328864718412, 4.904387055001571, 31.488305336382815, 3358)
-    femmesh.addNode(0.20076474580723563, 4.995967725760541, 30.1425343391061, 3359)
-    femmesh.addNode(0.98271111036562, 4.902476810099562, 32.38244674044287, 3360)
-    femmesh.addNode(0.9937083402531853, 4.900259557871528, 33.27726464934393, 3361)
-    femmesh.addNode(0.1994610154875227, 4.996019946247281, 31.93002460262761, 3362)
-    femmesh.addNode(0.9921721237031809, 4.900570831744637, 34.16948660142447, 3363)
-    femmesh.addNode(0.9782803618486322, 4.903362880067242, 35.06009652391834, 3364)
-    femmesh.addNode(0.20765363580503648, 4.995686135811271, 33.71638795876821, 3365)
-    femmesh.addNode(0.96492236216961, 4.906009053699862, 35.93962316071571, 3366)
-    femmesh.addNode(0.9481761280719893, 4.909273065348312, 36.82027374577336, 3367)
-    femmesh.addNode(0.1924807869013964, 4.996293741031828, 35.48813654764612, 3368)
-    femmesh.addNode(0.9595121163381409, 4.907070052342874, 37.696560919998696, 3369)
-    femmesh.addNode(0.944072651288218, 4.910063831467941, 38.58240636811887, 3370)
-    femmesh.addNode(0.19041279527821098, 4.996372981212906, 37.243950358668826, 3371)
-    femmesh.addNode(0.8886151375680083, 4.9204027413703635, 39.48107001610529, 3372)
-    femmesh.addNode(0.8438032597215024, 4.928285306157037, 40.363135992508944, 3373)
-    femmesh.addNode(0.14557302851652684, 4.997880400066465, 39.01890118088059, 3374)
-    femmesh.addNode(-4.532968185648569, -2.1100235609817055, 7.369106843342033, 3375)
-    femmesh.addNode(-4.863953720602484, -1.15842747025321, 7.407036242159142, 3376)
-    femmesh.addNode(0.8276494018670217, -4.931023876193377, 42.43802973475279, 3377)
-    femmesh.addNode(1.6707016379547448, -4.712616686824352, 42.41038190819341, 3378)
-    femmesh.addNode(1.0407919874693663, -4.890475645458176, 13.719252817092702, 3379)
-    femmesh.addNode(0.986859845248213, -4.901643361754981, 12.848552205429883, 3380)
-    femmesh.addNode(-1.6867473785440248, 4.706897415599246, 42.97817861093388, 3381)
-    femmesh.addNode(-2.5283788903093143, 4.313617992710787, 43.03668993676082, 3382)
-    femmesh.addNode(-2.9373424349152213, 4.046235215610472, 42.306173141917974, 3383)
-    femmesh.addNode(-1.1994498416492723, 4.854000420000758, 42.10862366404397, 3384)
-    femmesh.addNode(1.4699192028013104, -4.7790519496272434, 40.436213478516535, 3385)
-    femmesh.addNode(2.5205934632904317, -4.318171904037349, 42.668573820416356, 3386)
-    femmesh.addNode(0.677669461270659, -4.953863552951487, 40.81126051286493, 3387)
-    femmesh.addNode(0.7898153263908783, -4.937225106291799, 39.77700483172611, 3388)
-    femmesh.addNode(0.70053650725423, -4.950681630038842, 32.15359191510018, 3389)
-    femmesh.addNode(0.3918273730217977, -4.984623487260682, 31.358277740253925, 3390)
-    femmesh.addNode(-3.3609860874906423, -3.701860683452897, 7.29127579196354, 3391)
-    femmesh.addNode(-4.017686982955132, -2.976271376570505, 7.335548033130435, 3392)
-    femmesh.addNode(1.511722488648875, -4.765993612806595, 32.88425778414757, 3393)
-    femmesh.addNode(0.3433084198881689, -4.988200008904403, 41.65680128447869, 3394)
-    femmesh.addNode(0.36915349228234534, -4.986353948441261, 9.156155237350928, 3395)
-    femmesh.addNode(-0.40994107514344985, -4.983166494801296, 8.655129675395553, 3396)
-    femmesh.addNode(-0.08147728846302403, -4.999336101070292, 6.87386528742407, 3397)
-    femmesh.addNode(-2.9119176166401166, -4.064570800699742, 8.058409483293843, 3398)
-    femmesh.addNode(0.42963252478518565, -4.981507391708528, 10.092664134587807, 3399)
-    femmesh.addNode(1.1639625220785268, 4.86263213159258, 43.08637860588058, 3400)
-    femmesh.addNode(0.7154346377492145, 4.948550624082636, 42.187875376791226, 3401)
-    femmesh.addNode(-4.277680703709978, -2.58871547241239, 8.167658513107128, 3402)
-    femmesh.addNode(-0.6538448011675353, 4.957064350599676, 10.908703410204339, 3403)
-    femmesh.addNode(0.5210397212870514, 4.9727776552789, 11.290920472741483, 3404)
-    femmesh.addNode(0.2962268322309594, -4.991217252721666, 27.44912769155188, 3405)
-    femmesh.addNode(0.6006407705750625, -4.9637919642872825, 32.96830913779081, 3406)
-    femmesh.addNode(-4.9598757489600445, 0.6321649744157252, 42.87138532061884, 3407)
-    femmesh.addNode(-4.992581889217659, -0.27226105019968533, 42.84587715334703, 3408)
-    femmesh.addNode(-2.6790358661242335, 4.22170188763015, 7.498059895401479, 3409)
-    femmesh.addNode(-1.970245233700321, 4.595447064114781, 8.14793523069178, 3410)
-    femmesh.addNode(0.773189407197799, -4.939856085008663, 24.789953246040888, 3411)
-    femmesh.addNode(0.7323674854940941, -4.946072974208029, 23.8380210357924, 3412)
-    femmesh.addNode(0.034247714673780315, -4.999882708028221, 25.400768609527972, 3413)
-    femmesh.addNode(-0.35494609433637714, -4.98738541423413, 40.997592637688264, 3414)
-    femmesh.addNode(1.7511190825233316, 4.683330220988335, 43.70992017587771, 3415)
-    femmesh.addNode(0.858411585472333, -4.9257618243198555, 11.985637959665024, 3416)
-    femmesh.addNode(0.7412516881623414, -4.94474932982416, 11.05067615326297, 3417)
-    femmesh.addNode(0.15374943314874973, -4.997635552119266, 12.4186840440913, 3418)
-    femmesh.addNode(1.0045860152209354, -4.898041132740978, 14.589112461048117, 3419)
-    femmesh.addNode(0.24738129560025884, -4.993876499733162, 14.151457933811576, 3420)
-    femmesh.addNode(0.9925828639842642, -4.900487655134415, 15.456253347027403, 3421)
-    femmesh.addNode(0.7424919389814129, -4.944563248715464, 21.910983090498156, 3422)
-    femmesh.addNode(-0.03361572275848151, -4.999886997041376, 21.438391161218405, 3423)
-    femmesh.addNode(0.7246343616856668, -4.947211845258337, 22.847435864704714, 3424)
-    femmesh.addNode(0.6523458890170509, -4.95726182898206, 35.00865209615387, 3425)
-    femmesh.addNode(0.6261911093810684, -4.9606334972997255, 34.1036623909951, 3426)
-    femmesh.addNode(0.05210251150432047, -4.999728525459652, 30.205207667962057, 3427)
-    femmesh.addNode(-0.21140582808312075, -4.995528758385091, 29.207768425239415, 3428)
-    femmesh.addNode(-0.5696989231528194, -4.967438287181686, 31.084573196451558, 3429)
-    femmesh.addNode(0.012178130632216101, -4.999985169291436, 19.5161545240801, 3430)
-    femmesh.addNode(0.8231404428520464, -4.931778564710843, 19.03530397180723, 3431)
-    femmesh.addNode(0.8776280290360222, -4.922374329797598, 38.85566620106195, 3432)
-    femmesh.addNode(0.8827406647302104, -4.921460039341137, 37.87079043691733, 3433)
-    femmesh.addNode(0.6986986861372686, 4.950941339380831, 12.18244666684528, 3434)
-    femmesh.addNode(0.08687082362534333, 4.9992452890414025, 12.65779894635172, 3435)
-    femmesh.addNode(-0.057636647094466684, 4.999667790654866, 40.94002974020323, 3436)
-    femmesh.addNode(0.6987479054622138, 4.950934393083004, 41.38560090384516, 3437)
-    femmesh.addNode(-0.09901866312113976, -4.999019434284458, 35.49302885449249, 3438)
-    femmesh.addNode(0.8668230368951658, -4.924288560056959, 18.110015795845527, 3439)
-    femmesh.addNode(-3.4403836920303843, 3.62818963831983, 7.5629097974207955, 3440)
-    femmesh.addNode(0.06999640883842834, -4.999510026267546, 39.23071323541035, 3441)
-    femmesh.addNode(0.07016384472489595, -4.99950767925137, 37.3935412692896, 3442)
-    femmesh.addNode(-4.860432039642365, -1.1731156754634011, 42.827997974974394, 3443)
-    femmesh.addNode(-4.5647657648014315, -2.0403219139382895, 42.82975934881131, 3444)
-    femmesh.addNode(-4.363466398160087, -2.4413440953965986, 42.01472884252544, 3445)
-    femmesh.addNode(-4.949393555044437, -0.709579761044937, 42.02047800952067, 3446)
-    femmesh.addNode(-4.99832062421479, -0.1295798500889537, 7.452130448405548, 3447)
-    femmesh.addNode(-4.926715383776745, 0.8529217591652593, 7.474580705041783, 3448)
-    femmesh.addNode(-4.954914137021728, -0.6699446952862836, 8.24631152956513, 3449)
-    femmesh.addNode(-4.403916520093035, 2.36759778764292, 42.9938245621378, 3450)
-    femmesh.addNode(-4.769611439764205, 1.5002688804579076, 42.9390099057629, 3451)
-    femmesh.addNode(-4.881733565371057, 1.0810538361846675, 42.10598177303737, 3452)
-    femmesh.addNode(-4.189881143329294, 2.7285336730144287, 42.26559998273444, 3453)
-    femmesh.addNode(-2.0305612405064655, 4.569116002965218, 9.177348740927298, 3454)
-    femmesh.addNode(-3.970925433585275, -3.0383796999232326, 8.935104071573996, 3455)
-    femmesh.addNode(-4.499613007042573, -2.180248331464398, 8.968662881785594, 3456)
-    femmesh.addNode(-1.5582333291920745, 4.7509903064303325, 10.7980836614299, 3457)
-    femmesh.addNode(-1.1174786469330922, 4.873524543248816, 11.772929538089922, 3458)
-    femmesh.addNode(-0.4179685418981184, -4.982499603410276, 28.124671961417185, 3459)
-    femmesh.addNode(-0.6086702072672717, -4.962813776355628, 27.089765926649925, 3460)
-    femmesh.addNode(-0.2905903384941527, -4.991548582872239, 10.597757779651278, 3461)
-    femmesh.addNode(-1.233026384829035, -4.8455800410596295, 41.14568258696623, 3462)
-    femmesh.addNode(-0.9046856263168628, -4.917473326570838, 40.300141815352475, 3463)
-    femmesh.addNode(-2.1150194274854677, -4.5306393391395705, 41.23557966799286, 3464)
-    femmesh.addNode(-2.4088538781244315, -4.381486390923163, 8.814224437597531, 3465)
-    femmesh.addNode(-3.242740833442499, -3.805868085880624, 8.889914657199217, 3466)
-    femmesh.addNode(-0.8438715195708523, -4.928273618464906, 6.991670458446942, 3467)
-    femmesh.addNode(-1.1445123748775823, -4.867246801195936, 7.826616426753574, 3468)
-    femmesh.addNode(-1.33262971859906, -4.819138723164814, 8.811232512334136, 3469)
-    femmesh.addNode(-0.20501043504477426, -4.995795304205603, 33.37299652194771, 3470)
-    femmesh.addNode(-4.632166863058181, 1.8822938539945697, 7.5702543144209375, 3471)
-    femmesh.addNode(-4.169332231065926, 2.7598312895890613, 7.593866300550577, 3472)
-    femmesh.addNode(-4.794003755514976, 1.4203971247888072, 8.387079345190688, 3473)
-    femmesh.addNode(-0.04399361679278624, -4.999806452422082, 23.396730391183638, 3474)
-    femmesh.addNode(-0.839754733601437, -4.928976768802423, 21.912769925511828, 3475)
-    femmesh.addNode(-0.821812918115724, -4.931999952110514, 20.945015866634286, 3476)
-    femmesh.addNode(-0.7960893367908738, -4.936217354194188, 19.989337174236404, 3477)
-    femmesh.addNode(-0.7688300456917175, -4.940536444642593, 19.034854595975645, 3478)
-    femmesh.addNode(-1.5819704903125167, -4.7431391891636885, 20.463715938529827, 3479)
-    femmesh.addNode(-0.6628264717733965, -4.955871373261863, 37.91481167596484, 3480)
-    femmesh.addNode(-0.7508258785247729, -4.943304613326747, 36.998978340508245, 3481)
-    femmesh.addNode(-0.8192633105451662, 4.932424112745636, 12.728531526664483, 3482)
-    femmesh.addNode(-0.5369689282293718, 4.971082816662403, 13.50278118615184, 3483)
-    femmesh.addNode(-1.7162539666528454, 4.696218938885662, 12.617911777890043, 3484)
-    femmesh.addNode(0.9189486021370695, -4.914827918313145, 17.18310210615264, 3485)
-    femmesh.addNode(0.9608257412116555, -4.906813007953846, 16.299516841360692, 3486)
-    femmesh.addNode(0.17807563309313001, -4.996827900668431, 15.864581072100279, 3487)
-    femmesh.addNode(0.09274959295123343, -4.999139677285221, 17.634758256126453, 3488)
-    femmesh.addNode(-0.6153593016058853, 4.96198880792038, 14.288612987188403, 3489)
-    femmesh.addNode(-0.8877900705737996, -4.920551675431381, 36.05227313542529, 3490)
-    femmesh.addNode(-0.9666942209191669, -4.905660229086548, 35.067594056084786, 3491)
-    femmesh.addNode(-1.5988862277198825, -4.7374637550917145, 36.57354354210053, 3492)
-    femmesh.addNode(-0.6164326009014868, 4.961855585216667, 15.344286092801084, 3493)
-    femmesh.addNode(-0.6198894179645232, 4.9614249071708825, 16.22591067493964, 3494)
-    femmesh.addNode(-0.591710447424951, 4.964864423769109, 17.189031056251437, 3495)
-    femmesh.addNode(-0.595207071459347, 4.964446448707528, 18.084761746669876, 3496)
-    femmesh.addNode(-1.4025536782562926, 4.799254439973957, 16.647980359001767, 3497)
-    femmesh.addNode(-0.5834619340629278, 4.965840530212338, 18.978007109205706, 3498)
-    femmesh.addNode(-0.5797269299077865, 4.966277951015196, 19.869917272339475, 3499)
-    femmesh.addNode(-1.3639076221005246, 4.8103800263987555, 18.504346102849397, 3500)
-    femmesh.addNode(-0.58420472466707, 4.965753199634138, 20.752628293553315, 3501)
-    femmesh.addNode(-0.5735627332152374, 4.966993637107528, 21.64766034536835, 3502)
-    femmesh.addNode(-1.3568645868463636, 4.812371400147982, 20.280302486599062, 3503)
-    femmesh.addNode(-0.5765066501170408, 4.966652804693602, 22.571681976560704, 3504)
-    femmesh.addNode(-0.596849225466875, 4.964249288871338, 23.462570055614393, 3505)
-    femmesh.addNode(-1.364054695192992, 4.810338323706759, 22.08703513900526, 3506)
-    femmesh.addNode(-0.5932440043243846, 4.964681414887885, 24.337175180192595, 3507)
-    femmesh.addNode(-0.5950748995798467, 4.964462293530895, 25.22120538072823, 3508)
-    femmesh.addNode(-1.3634125555950105, 4.810520367199985, 23.885661894775815, 3509)
-    femmesh.addNode(-0.5932398648825438, 4.964681909519898, 26.090267629423575, 3510)
-    femmesh.addNode(-0.5801723873989366, 4.966225931318451, 26.979485778446456, 3511)
-    femmesh.addNode(-1.358140219545578, 4.812011548620045, 25.629329268049368, 3512)
-    femmesh.addNode(-0.5812760749286027, 4.966096870250881, 27.889645392375602, 3513)
-    femmesh.addNode(-0.5806396094622917, 4.966171326477116, 28.78394811212383, 3514)
-    femmesh.addNode(-1.3574309894794578, 4.812211665004026, 27.408551130673864, 3515)
-    femmesh.addNode(-0.5769144103570559, 4.966605456760419, 29.698720676268316, 3516)
-    femmesh.addNode(-0.587910670425996, 4.965315805021797, 30.592069535729763, 3517)
-    femmesh.addNode(-1.3548907202592981, 4.812927501651696, 29.233483308747495, 3518)
-    femmesh.addNode(-0.5931364281275809, 4.964694268293673, 31.458465655695456, 3519)
-    femmesh.addNode(-0.5834374137852296, 4.9658434111634655, 32.35260705975551, 3520)
-    femmesh.addNode(-1.3563462604804317, 4.812517513908988, 31.01465199285767, 3521)
-    femmesh.addNode(-0.5933345371866942, 4.964670596019584, 33.2615662911565, 3522)
-    femmesh.addNode(-0.5948908677779432, 4.964484349399684, 34.15378824323703, 3523)
-    femmesh.addNode(-1.3709978762618489, 4.808364048539326, 32.79000734422434, 3524)
-    femmesh.addNode(-0.5927301538288317, 4.964742789384164, 35.05051429390054, 3525)
-    femmesh.addNode(-0.6062494959622887, 4.963110068157412, 35.93004093069791, 3526)
-    femmesh.addNode(-1.3784878880324725, 4.80622212788254, 34.59569262628884, 3527)
-    femmesh.addNode(-0.5990733756234617, 4.963981374926694, 36.76626433505204, 3528)
-    femmesh.addNode(-0.5876069056164663, 4.965351762410378, 37.64255150927738, 3529)
-    femmesh.addNode(-1.3694450102264106, 4.808806542580601, 36.32864208130647, 3530)
-    femmesh.addNode(-0.5817600386910258, 4.9660401989293455, 38.50375075973047, 3531)
-    femmesh.addNode(-0.6377519844755981, 4.959160453776167, 39.4024144077169, 3532)
-    femmesh.addNode(-1.3568257737475675, 4.812382343465066, 38.02606473611368, 3533)
-    femmesh.addNode(-0.7621521838916044, 4.941571010173714, 40.278059632769676, 3534)
-    femmesh.addNode(-0.9069053022796538, 4.917064446669074, 41.30052454410588, 3535)
-    femmesh.addNode(-1.8720105683872954, 4.636332217588196, 41.446653556610414, 3536)
-    femmesh.addNode(-1.4716856463075856, 4.778508277533086, 39.76290921161956, 3537)
-    femmesh.addNode(-0.5860359358020331, -4.9655374212615335, 39.60915004736293, 3538)
-    femmesh.addNode(-0.49750070185501327, -4.975187740342445, 38.68781141669878, 3539)
-    femmesh.addNode(-1.3068131158752763, -4.826203422999941, 38.293248487917424, 3540)
-    femmesh.addNode(-1.4565886012308258, -4.783131782291225, 39.7572399966409, 3541)
-    femmesh.addNode(-3.7264220847161758, 3.333733409638442, 8.451796451440064, 3542)
-    femmesh.addNode(-1.0992382843449402, -4.877671083030342, 34.04196581274124, 3543)
-    femmesh.addNode(-1.1243385819480571, -4.871946505570749, 32.90661255953695, 3544)
-    femmesh.addNode(-1.8562633998241493, -4.642659387729547, 34.60121009367403, 3545)
-    femmesh.addNode(-1.7323463470846145, -4.690306614043755, 9.64273768623951, 3546)
-    femmesh.addNode(-3.5821860954959313, -3.488257842711117, 9.690919025877683, 3547)
-    femmesh.addNode(-0.7198025105249252, -4.94791717249208, 25.99230836332635, 3548)
-    femmesh.addNode(-0.7894208434605378, -4.93728819615688, 24.978855316069705, 3549)
-    femmesh.addNode(-1.4287429055376357, 4.7915231096046975, 14.629186872077288, 3550)
-    femmesh.addNode(-4.571043750214795, -2.026217913656443, 41.17905178319806, 3551)
-    femmesh.addNode(-4.119318723544339, -2.8339395289697054, 41.19118179457547, 3552)
-    femmesh.addNode(-1.4174617098299107, -4.794872501033376, 26.667852633191654, 3553)
-    femmesh.addNode(-3.5494439533261386, -3.521568914872533, 41.2047328848124, 3554)
-    femmesh.addNode(-2.8577670096952064, -4.102824358694596, 41.20276724353862, 3555)
-    femmesh.addNode(-2.5350222261887065, -4.309717196374868, 40.41541934017619, 3556)
-    femmesh.addNode(-3.860693633038153, -3.1772700029771888, 40.36905582548502, 3557)
-    femmesh.addNode(-2.3900793935800424, 4.391755969129439, 10.196412477578036, 3558)
-    femmesh.addNode(-2.792802384770021, 4.147318994196477, 11.060638605463621, 3559)
-    femmesh.addNode(-3.197775628235207, 3.84372619101113, 9.43990368496102, 3560)
-    femmesh.addNode(-1.2966947587489615, -4.828931838681612, 31.821627164955267, 3561)
-    femmesh.addNode(-1.6219315760267388, -4.729623448297699, 30.6685570926634, 3562)
-    femmesh.addNode(-2.1431794601875245, -4.5173866119063035, 32.49059645574879, 3563)
-    femmesh.addNode(-4.737154877957504, 1.599801132092181, 41.20400080606791, 3564)
-    femmesh.addNode(-4.94555292842356, 0.735871070338512, 41.13637622092385, 3565)
-    femmesh.addNode(-0.4067298446309394, -4.983429625617933, 12.937191920435872, 3566)
-    femmesh.addNode(-0.5368396314631492, -4.971096781404533, 12.074277674671013, 3567)
-    femmesh.addNode(-0.8418542897394808, -4.928618605131384, 23.963598993647995, 3568)
-    femmesh.addNode(-0.8495582033728866, -4.92729650610574, 22.973013822560304, 3569)
-    femmesh.addNode(-1.5751522935243965, -4.745407806733246, 24.55513874744637, 3570)
-    femmesh.addNode(-1.6160925349703592, -4.731621806359113, 22.479638527976185, 3571)
-    femmesh.addNode(-1.1087587640448666, -4.875515767911503, 28.84840666033746, 3572)
-    femmesh.addNode(-1.232737044739412, -4.845653658540521, 10.415518127454042, 3573)
-    femmesh.addNode(-2.3177772339579135, -4.430339568672633, 10.418510052717437, 3574)
-    femmesh.addNode(-4.99294248349777, -0.26556610567450084, 41.20028198392197, 3575)
-    femmesh.addNode(-4.862000735167696, -1.1665971246444906, 41.18240280554932, 3576)
-    femmesh.addNode(-4.7334639610618225, -1.6106889610750188, 40.35885575759936, 3577)
-    femmesh.addNode(-4.9925441694813575, 0.27295185615360884, 40.29830101695251, 3578)
-    femmesh.addNode(-0.7390510049243205, -4.945078726584679, 18.07541613317361, 3579)
-    femmesh.addNode(-0.6866150217992815, -4.952631604696595, 17.148502443480726, 3580)
-    femmesh.addNode(-1.5285677866978036, -4.760617661760896, 18.548598783329915, 3581)
-    femmesh.addNode(-3.981519419654755, 3.0244839412554443, 9.470860188090803, 3582)
-    femmesh.addNode(-4.851987004247794, -1.207568677388791, 9.044244003687474, 3583)
-    femmesh.addNode(-4.996754161755529, -0.18013285924228403, 9.089338209933878, 3584)
-    femmesh.addNode(-2.653277414745739, 4.237938055281148, 41.56958473676433, 3585)
-    femmesh.addNode(-3.3850302133957215, 3.679887288273666, 41.6210052021338, 3586)
-    femmesh.addNode(-2.394985429626952, 4.389082454440176, 40.76148561682625, 3587)
-    femmesh.addNode(-0.5050714823018626, -4.974424871054482, 13.681773046502519, 3588)
-    femmesh.addNode(-1.1861667538884493, -4.85726347154133, 13.33736667708223, 3589)
-    femmesh.addNode(-0.541856174190688, -4.970552472964291, 14.551632690457934, 3590)
-    femmesh.addNode(-0.9263658498755712, -4.913435286251801, 11.373530146129205, 3591)
-    femmesh.addNode(-4.69196583505433, -1.72784738987068, 9.811689562154342, 3592)
-    femmesh.addNode(-2.252170752226256, 4.46404826394346, 14.11454279467792, 3593)
-    femmesh.addNode(-2.2531363051264215, 4.463560998857443, 15.170215900290604, 3594)
-    femmesh.addNode(-2.1531899263768164, -4.512623753532904, 27.320271585500443, 3595)
-    femmesh.addNode(-2.253838876559003, -4.463206282316699, 26.22281402217687, 3596)
-    femmesh.addNode(-0.6388344227269471, -4.959021131265638, 16.23531511077183, 3597)
-    femmesh.addNode(-0.6067056464881787, -4.963054327580886, 15.392051616438541, 3598)
-    femmesh.addNode(-1.3448537013204356, -4.815741741626592, 14.922366729129484, 3599)
-    femmesh.addNode(-1.4538037809184654, -4.7839789471304295, 16.675972987818987, 3600)
-    femmesh.addNode(-4.462978306854802, -2.254290272467911, 10.585817744138165, 3601)
-    femmesh.addNode(-4.831374154874638, -1.2875650568454335, 10.661398866040045, 3602)
-    femmesh.addNode(-3.1567581551944306, -3.8774834557498057, 10.517904446194784, 3603)
-    femmesh.addNode(-3.9019358246793336, -3.1264831392611105, 10.563093860569563, 3604)
-    femmesh.addNode(-4.173761566540289, -2.7531281092007225, 11.412803164455266, 3605)
-    femmesh.addNode(-2.7342883510380345, -4.186127949953, 11.290684887409316, 3606)
-    femmesh.addNode(-2.3270905393537706, -4.425454736142963, 25.13104551272717, 3607)
-    femmesh.addNode(-2.373996888161111, -4.400470290207782, 24.11578919030546, 3608)
-    femmesh.addNode(-1.470628002966021, -4.778833882537891, 11.892038022473775, 3609)
-    femmesh.addNode(-2.6791347045868013, 4.221639164433478, 12.172198865273613, 3610)
-    femmesh.addNode(-2.4176465966922254, 4.376640827564275, 13.127800853848173, 3611)
-    femmesh.addNode(-3.153141845583467, 3.8804247836584196, 13.66882988206149, 3612)
-    femmesh.addNode(-3.3970407791873174, 3.668802794446497, 11.570527681421751, 3613)
-    femmesh.addNode(-1.8230076327572253, -4.655818206385307, 29.536908980087897, 3614)
-    femmesh.addNode(-2.0141304083596676, -4.576382708878369, 28.453812516265664, 3615)
-    femmesh.addNode(-2.4902767593240704, -4.335726197763231, 30.273962948591603, 3616)
-    femmesh.addNode(-2.1804976789925745, 4.499492179336241, 16.1375461018719, 3617)
-    femmesh.addNode(-2.154916223679101, 4.511799648579777, 17.1006664831837, 3618)
-    femmesh.addNode(-2.9405654692734378, 4.043893510086126, 15.622902024472536, 3619)
-    femmesh.addNode(-4.919448503140762, 0.8938827803163664, 9.18832192759743, 3620)
-    femmesh.addNode(-4.616345745021939, 1.9207685863783377, 9.283995536976587, 3621)
-    femmesh.addNode(-4.987681274914177, 0.3507641656020375, 9.986254401719776, 3622)
-    femmesh.addNode(-2.3593962665574666, -4.408315920774586, 20.943369684082953, 3623)
-    femmesh.addNode(-2.3363819561231187, -4.420556453106589, 19.98769099168507, 3624)
-    femmesh.addNode(-4.285113083440003, 2.5763939648530676, 10.272102770497543, 3625)
-    femmesh.addNode(-2.403307834562868, -4.384530927286149, 23.0502913925068, 3626)
-    femmesh.addNode(-2.3945810050221645, -4.389303112156535, 21.99004749545832, 3627)
-    femmesh.addNode(-3.08018384729162, -3.9385869886145453, 21.514022548613564, 3628)
-    femmesh.addNode(-3.085402624546179, -3.9345000501262613, 23.626198157787595, 3629)
-    femmesh.addNode(-2.277124482583435, -4.451371034953065, 37.26072464633605, 3630)
-    femmesh.addNode(-2.3998414133902783, -4.38642920729116, 36.314019441253095, 3631)
-    femmesh.addNode(-2.1016421942672956, 4.5368601573417875, 18.029235997321656, 3632)
-    femmesh.addNode(-2.0909043038625894, 4.54181892991001, 18.922481359857482, 3633)
-    femmesh.addNode(-2.8262688410751373, 4.124585365581345, 17.51880174019179, 3634)
-    femmesh.addNode(-2.095541824483135, 4.539681096932019, 19.81952727556078, 3635)
-    femmesh.addNode(-2.0996343460097084, 4.537789727726086, 20.702238296774617, 3636)
-    femmesh.addNode(-2.7817522979828446, 4.154738758654648, 19.34441717003304, 3637)
-    femmesh.addNode(-2.1339749469030123, 4.521742023378853, 21.599065012258187, 3638)
-    femmesh.addNode(-2.136654681858964, 4.5204763875602945, 22.52308664345054, 3639)
-    femmesh.addNode(-2.817389546862919, 4.1306556551263816, 21.138289801219905, 3640)
-    femmesh.addNode(-2.107872308143993, 4.5339689381997, 23.42034380458677, 3641)
-    femmesh.addNode(-2.104579160402199, 4.535498490530095, 24.294948929164974, 3642)
-    femmesh.addNode(-2.8224411322068974, 4.127205598855798, 22.9323736778397, 3643)
-    femmesh.addNode(-2.0911501676043067, 4.541705734251007, 25.188651253270884, 3644)
-    femmesh.addNode(-2.0894712924990513, 4.542478367347757, 26.057713501966234, 3645)
-    femmesh.addNode(-2.783868345386005, 4.153321205440025, 24.72333316308184, 3646)
-    femmesh.addNode(-2.110573688860244, 4.532712069378648, 26.93229888452796, 3647)
-    femmesh.addNode(-2.111580993793534, 4.532242900226102, 27.842458498457106, 3648)
-    femmesh.addNode(-2.790890627767549, 4.148605730102495, 26.491620869749475, 3649)
-    femmesh.addNode(-2.1056926816735224, 4.534981624036262, 28.75158876364084, 3650)
-    femmesh.addNode(-2.1022904811913894, 4.536559790490155, 29.666361327785324, 3651)
-    femmesh.addNode(-2.804780004354231, 4.1392280834927035, 28.27533651749494, 3652)
-    femmesh.addNode(-2.0830887439824486, 4.54540881381352, 30.56757308748233, 3653)
-    femmesh.addNode(-2.0878717139204093, 4.543213808111066, 31.433969207448015, 3654)
-    femmesh.addNode(-2.781858326896046, 4.1546677663898866, 30.085678542375675, 3655)
-    femmesh.addNode(-2.131895957900825, 4.522722589844101, 32.32920170011008, 3656)
-    femmesh.addNode(-2.1409067443351675, 4.518464154119206, 33.23816093151107, 3657)
-    femmesh.addNode(-2.804598103265627, 4.139351335554744, 31.88212279473474, 3658)
-    femmesh.addNode(-2.1512064376967057, 4.513569636375653, 34.130745206665736, 3659)
-    femmesh.addNode(-2.1492418247888474, 4.514505463345715, 35.02747125732924, 3660)
-    femmesh.addNode(-2.8540369754426775, 4.105419947192493, 33.66993956255148, 3661)
-    femmesh.addNode(-2.113118903803222, 4.53152606727463, 35.90640714165194, 3662)
-    femmesh.addNode(-2.1065651772958613, 4.5345764029073825, 36.74263054600607, 3663)
-    femmesh.addNode(-2.107451584617694, 4.534164511626411, 37.59376780514862, 3664)
-    femmesh.addNode(-2.1021113661058513, 4.536642790047349, 38.45496705560171, 3665)
-    femmesh.addNode(-2.798369246933921, 4.143564836926591, 37.1715328654941, 3666)
-    femmesh.addNode(-2.5730353714327503, -4.2871306228474, 35.3080068259528, 3667)
-    femmesh.addNode(-2.688233327000181, -4.215851228353004, 34.282378582609255, 3668)
-    femmesh.addNode(-3.6976644741522446, 3.365602091244954, 40.921888919081866, 3669)
-    femmesh.addNode(-3.9195216855118264, 3.1044081169850286, 41.658477324235506, 3670)
-    femmesh.addNode(-4.415087897163221, 2.3466995675464832, 41.5664836996825, 3671)
-    femmesh.addNode(-3.5655776990031107, 3.505232613161598, 40.073516985438815, 3672)
-    femmesh.addNode(-4.0704916269972085, 2.9036352929639113, 40.110989107540526, 3673)
-    femmesh.addNode(-1.8662310260910013, -4.638661634270743, 12.731275967962244, 3674)
-    femmesh.addNode(-2.2254743025860964, -4.477417126930316, 12.030528439420436, 3675)
-    femmesh.addNode(-3.075731329594664, -3.9420650410856792, 12.129922832897783, 3676)
-    femmesh.addNode(-1.9574789523383587, -4.600899493702543, 13.47585709402889, 3677)
-    femmesh.addNode(-4.568859178818914, 2.03113904106099, 40.59687814756898, 3678)
-    femmesh.addNode(-4.4874179007412245, 2.205239348485153, 39.748506213925936, 3679)
-    femmesh.addNode(-2.9934819262012935, -4.004880267561839, 25.783464465035955, 3680)
-    femmesh.addNode(-2.2923924747141755, -4.443527511096766, 18.99224277762477, 3681)
-    femmesh.addNode(-2.265580097017371, -4.457257769525873, 18.03280431482274, 3682)
-    femmesh.addNode(-4.120644689655614, -2.8320111831723036, 39.49982644717603, 3683)
-    femmesh.addNode(-3.5510918248317473, -3.519907222017809, 39.51337753741296, 3684)
-    femmesh.addNode(-3.0090980136744805, -3.9931602953175194, 19.471896523177897, 3685)
-    femmesh.addNode(-2.845125549818742, -4.111600735208685, 33.19069752203484, 3686)
-    femmesh.addNode(-2.9893859664106346, -4.007938565375866, 32.105712127453145, 3687)
-    femmesh.addNode(-3.4645291211702505, -3.6051404922087698, 33.8974942543136, 3688)
-    femmesh.addNode(-4.536159363924272, -2.1031543512263067, 39.54771816990316, 3689)
-    femmesh.addNode(-4.322774808655353, -2.5126913765233234, 38.6920398818311, 3690)
-    femmesh.addNode(-4.841597709869425, -1.2485718304475495, 39.55106919225443, 3691)
-    femmesh.addNode(-4.393432659848708, 2.3869959076996143, 38.76573449806959, 3692)
-    femmesh.addNode(-4.781981008810666, 1.4603621576082149, 39.251623538098045, 3693)
-    femmesh.addNode(-4.049495679463709, 2.9328458435459503, 11.228984163602437, 3694)
-    femmesh.addNode(-3.9683484409290566, 3.0417446722852866, 12.340544423412428, 3695)
-    femmesh.addNode(-4.993295474677225, -0.25884416657121656, 10.71726981386147, 3696)
-    femmesh.addNode(-4.932922638178023, 0.816256237802061, 10.816253531525021, 3697)
-    femmesh.addNode(-4.930711061198039, -0.8295109589265883, 11.491397995845292, 3698)
-    femmesh.addNode(-2.8305662542394376, 4.1216373785621805, 35.44145972202884, 3699)
-    femmesh.addNode(-4.658972053457506, 1.8149323417422343, 11.04211951248822, 3700)
-    femmesh.addNode(-4.9605062005394025, 0.627198720032287, 39.496163033949, 3701)
-    femmesh.addNode(-4.98591488026824, -0.375037073793706, 39.56006879694712, 3702)
-    femmesh.addNode(-4.918112158477906, -0.9012063008167391, 38.74893120925093, 3703)
-    femmesh.addNode(-4.93069050378865, 0.8296331453410134, 38.51339131809266, 3704)
-    femmesh.addNode(-2.8016898908739045, -4.141320291329199, 28.008773905250884, 3705)
-    femmesh.addNode(-3.17459768098467, -3.8628913476678006, 35.99518793018832, 3706)
-    femmesh.addNode(-2.032241126422863, 4.5683690748532495, 39.21047925569286, 3707)
-    femmesh.addNode(-2.1463822507017447, 4.515865723631794, 40.08612448074564, 3708)
-    femmesh.addNode(-2.9023807773836996, 4.0713862286785805, 40.20905566089955, 3709)
-    femmesh.addNode(-2.735267733290887, 4.185488075149388, 38.778182324727794, 3710)
-    femmesh.addNode(-3.364462445520166, 3.698701454927724, 39.39815584935821, 3711)
-    femmesh.addNode(-2.8931035919608417, -4.07798376727805, 39.603335484805825, 3712)
-    femmesh.addNode(-2.1540795059630757, -4.512199184653739, 39.63614790926006, 3713)
-    femmesh.addNode(-3.234450216239813, -3.8129164426546547, 38.734106106496824, 3714)
-    femmesh.addNode(-3.615867087234367, -3.4533324785568005, 19.947501298425895, 3715)
-    femmesh.addNode(-3.5814143661190005, -3.489050177076339, 18.952053084365595, 3716)
-    femmesh.addNode(-3.843376313597825, -3.198196134084837, 12.390051242507376, 3717)
-    femmesh.addNode(-4.420472302533694, -2.3365411664536246, 12.412775126075976, 3718)
-    femmesh.addNode(-3.9817838228531826, 3.0241358415363377, 38.269371839797536, 3719)
-    femmesh.addNode(-4.41360187069238, 2.349493248983857, 37.772489163969645, 3720)
-    femmesh.addNode(-4.370956425805526, 2.427908549288747, 12.951703326281338, 3721)
-    femmesh.addNode(-3.8111249216064484, 3.2365609575458705, 13.293246844100652, 3722)
-    femmesh.addNode(-1.85894157411091, -4.641587683545583, 38.94515614127053, 3723)
-    femmesh.addNode(-3.4510540284266793, 3.618041748360567, 36.798261056024565, 3724)
-    femmesh.addNode(-3.4517612400883397, 3.61736704543841, 37.64939831516712, 3725)
-    femmesh.addNode(-3.549361466562245, 3.5216520526143844, 15.177200364007954, 3726)
-    femmesh.addNode(-3.4918184703211406, 3.578715379898788, 16.144530565589253, 3727)
-    femmesh.addNode(-2.012408916358769, -4.5771399752858475, 38.17215640053659, 3728)
-    femmesh.addNode(-2.7791059563231855, -4.156509362858333, 37.91263229968915, 3729)
-    femmesh.addNode(-3.4522909947088154, -3.616861469264812, 37.82267435229629, 3730)
-    femmesh.addNode(-4.103396849293705, -2.8569449237264797, 37.61774774738315, 3731)
-    femmesh.addNode(-3.7512836469516584, -3.305733050340433, 36.796273940575475, 3732)
-    femmesh.addNode(-4.5233233567782225, -2.1306209916417784, 37.66563947011028, 3733)
-    femmesh.addNode(-3.4178583126789923, -3.6494170156959473, 28.70955228608594, 3734)
-    femmesh.addNode(-3.527902761866311, -3.5431486142717827, 27.576011355320716, 3735)
-    femmesh.addNode(-3.4328480757590665, 3.6353203557262015, 17.0575396804418, 3736)
-    femmesh.addNode(-3.3898056508715113, 3.675488763323807, 17.986109194579754, 3737)
-    femmesh.addNode(-3.9699773477956857, 3.0396183737418636, 16.611838019977217, 3738)
-    femmesh.addNode(-3.880258774939771, -3.1533461337923097, 35.790261325275175, 3739)
-    femmesh.addNode(-3.407228748215511, 3.659343145611486, 18.87001261526975, 3740)
-    femmesh.addNode(-3.41096429980921, 3.655861395817279, 19.767058530973046, 3741)
-    femmesh.addNode(-3.9344586991035864, 3.085455354570556, 18.40875055551976, 3742)
-    femmesh.addNode(-3.420377330193892, 3.64705619905914, 20.66459029788764, 3743)
-    femmesh.addNode(-3.4479273365493306, 3.6210215522523255, 21.561417013371205, 3744)
-    femmesh.addNode(-3.9569650759590003, 3.056538464937221, 20.190185743124353, 3745)
-    femmesh.addNode(-3.456110125521812, 3.613212255080734, 22.45380295619696, 3746)
-    femmesh.addNode(-3.4330690710875382, 3.6351116562138976, 23.351060117333184, 3747)
-    femmesh.addNode(-3.9717126830471723, 3.0373505499566944, 21.980103452864693, 3748)
-    femmesh.addNode(-3.426446672154353, 3.6413545835145413, 24.247392846978155, 3749)
-    femmesh.addNode(-3.4156575151199697, 3.6514769257664046, 25.141095171084068, 3750)
-    femmesh.addNode(-3.9730548534434456, 3.035594691576838, 23.76882212533541, 3751)
-    femmesh.addNode(-3.3958127061191496, 3.6699395178885084, 26.039069115003606, 3752)
-    femmesh.addNode(-3.412843196370008, 3.6541074583256234, 26.913654497565332, 3753)
-    femmesh.addNode(-3.950969411280756, 3.0642846981185996, 25.563128798899925, 3754)
-    femmesh.addNode(-3.3995255582023693, 3.6665005085406537, 27.803036056563194, 3755)
-    femmesh.addNode(-3.3947605962931275, 3.6709127603166394, 28.712166321746928, 3756)
-    femmesh.addNode(-3.9230470486129287, 3.0999519116220804, 27.35048430181732, 3757)
-    femmesh.addNode(-3.4056591061861448, 3.660804017214168, 29.61271222306199, 3758)
-    femmesh.addNode(-3.3901488689797246, 3.6751721927217904, 30.51392398275899, 3759)
-    femmesh.addNode(-3.9209834142708475, 3.102561693989811, 29.140411762130242, 3760)
-    femmesh.addNode(-3.4159834472258273, 3.6511720157066216, 31.415208527051355, 3761)
-    femmesh.addNode(-3.4512817400334077, 3.617824532908136, 32.31044101971342, 3762)
-    femmesh.addNode(-3.9518904554567893, 3.0630967709279986, 30.94224220773767, 3763)
-    femmesh.addNode(-3.473857759552516, 3.596152425356408, 33.20802621972838, 3764)
-    femmesh.addNode(-3.4820504697677364, 3.5882202449111573, 34.10061049488305, 3765)
-    femmesh.addNode(-3.992313335506275, 3.010221624920457, 32.741111952045, 3766)
-    femmesh.addNode(-4.845218918644483, 1.2344446647823395, 11.773134924629915, 3767)
-    femmesh.addNode(-3.4208292290087883, 3.6466323349028675, 38.64264364926707, 3768)
-    femmesh.addNode(-3.489568436813848, 3.580909399132091, 34.997021918440566, 3769)
-    femmesh.addNode(-3.4608587872957957, 3.608664081678631, 35.87595780276327, 3770)
-    femmesh.addNode(-4.015492930785543, 2.9792308609457123, 36.353823252436285, 3771)
-    femmesh.addNode(-4.017327857332212, 2.9767561013127324, 34.53510857561747, 3772)
-    femmesh.addNode(-3.575531249934399, -3.4950788661691963, 26.4313140143908, 3773)
-    femmesh.addNode(-3.632647763236782, -3.435676094781172, 25.339545504941096, 3774)
-    femmesh.addNode(-3.151922992874026, -3.8814148769478436, 30.98945791986746, 3775)
-    femmesh.addNode(-3.315267374297063, -3.7428601679626583, 29.857809807291957, 3776)
-    femmesh.addNode(-3.9577424524828397, -3.05553181620076, 29.425047257361797, 3777)
-    femmesh.addNode(-3.7378171582617803, -3.3209521061592904, 31.6895589861535, 3778)
-    femmesh.addNode(-3.687337026729269, 3.3769136280502288, 14.2799887849304, 3779)
-    femmesh.addNode(-4.134851957835864, 2.8112273630535336, 14.801617326047117, 3780)
-    femmesh.addNode(-3.6848608498853825, -3.3796154392152338, 20.984326943418402, 3781)
-    femmesh.addNode(-4.156001270835233, -2.779865722803158, 20.4644835046061, 3782)
-    femmesh.addNode(-3.711775057549886, -3.3500337195542587, 22.03100475479377, 3783)
-    femmesh.addNode(-2.1389283092654554, -4.519401031975677, 15.245275744058278, 3784)
-    femmesh.addNode(-2.07974058868231, -4.546941728655356, 14.40485681807767, 3785)
-    femmesh.addNode(-4.800805943332619, -1.3972338009303256, 12.201561167775102, 3786)
-    femmesh.addNode(-4.986107587571295, -0.3724662738610838, 12.257432115596528, 3787)
-    femmesh.addNode(-4.616648898096526, -1.9200398307598034, 13.178809245827212, 3788)
-    femmesh.addNode(-4.431659484535177, 2.315252516061565, 36.79548938972588, 3789)
-    femmesh.addNode(-4.730895929319797, 1.618216211124265, 37.291852047997935, 3790)
-    femmesh.addNode(-3.998790146892168, -3.0016124601817133, 34.6148884513573, 3791)
-    femmesh.addNode(-4.109015146243386, -2.848858460496493, 33.523207390782886, 3792)
-    femmesh.addNode(-2.2093914966459023, -4.485375036108885, 17.088392087243292, 3793)
-    femmesh.addNode(-2.1660449798115673, -4.506467479682185, 16.175204754534395, 3794)
-    femmesh.addNode(-2.8426221142862467, -4.113331923802258, 15.657694843482581, 3795)
-    femmesh.addNode(-2.9185321898909677, -4.059823870141441, 17.53203608153815, 3796)
-    femmesh.addNode(-2.706464044028526, -4.2041708312556425, 13.798766108957684, 3797)
-    femmesh.addNode(-3.5282853264761735, -3.542767654669569, 18.007034998946583, 3798)
-    femmesh.addNode(-3.48348847550344, -3.5868242277862903, 17.062622771367135, 3799)
-    femmesh.addNode(-3.442581987371443, -3.626103867820899, 13.129894794518496, 3800)
-    femmesh.addNode(-4.427195542992502, -2.323777016864425, 35.415974461744455, 3801)
-    femmesh.addNode(-4.080491918011998, -2.889564968475144, 27.132092395225857, 3802)
-    femmesh.addNode(-4.188234843327451, -2.7310600317711593, 24.867512309740874, 3803)
-    femmesh.addNode(-3.716725732070006, -3.344540302129529, 24.21966276038603, 3804)
-    femmesh.addNode(-4.893318533880879, 1.0273430420156109, 37.74285618649321, 3805)
-    femmesh.addNode(-4.996702410006474, 0.18156273250724836, 37.98739568234417, 3806)
-    femmesh.addNode(-4.90112561995152, 0.9894279445491867, 36.76585641224945, 3807)
-    femmesh.addNode(-3.7389606922435203, -3.319664582733903, 23.154164962587373, 3808)
-    femmesh.addNode(-4.972824016292105, 0.5205970639452979, 12.464787893173192, 3809)
-    femmesh.addNode(-4.758923483333516, 1.5338341761014462, 12.690653874136391, 3810)
-    femmesh.addNode(-4.676184924577766, 1.770111451618694, 13.643356294824615, 3811)
-    femmesh.addNode(-4.999625669035711, -0.06118144750838151, 13.174951065103002, 3812)
-    femmesh.addNode(-4.055290116386836, -2.9248285542806176, 18.48263977419458, 3813)
-    femmesh.addNode(-4.80693526263324, -1.3759990482747804, 38.035832756242684, 3814)
-    femmesh.addNode(-4.678668700064408, -1.7635359919881475, 36.961540621794725, 3815)
-    femmesh.addNode(-4.484475716626086, -2.211216304885379, 18.910281410155363, 3816)
-    femmesh.addNode(-4.4505518750617075, -2.278725083766078, 17.96526332473635, 3817)
-    femmesh.addNode(-4.437925548028932, 2.303218797715949, 35.87318613646458, 3818)
-    femmesh.addNode(-4.233118407894094, -2.660960079510434, 22.624469357392208, 3819)
-    femmesh.addNode(-4.595535538820853, -1.9700388603869046, 33.157378753599325, 3820)
-    femmesh.addNode(-4.219274970554397, -2.682856448424549, 32.43998455655562, 3821)
-    femmesh.addNode(-3.50488851412714, -3.565915941737781, 16.065417338732082, 3822)
-    femmesh.addNode(-3.4833990748809573, -3.5869110506281716, 15.135488328255963, 3823)
-    femmesh.addNode(-4.028426556603123, -2.9617190072751165, 16.540416256140517, 3824)
-    femmesh.addNode(-3.5382613733339485, -3.532804332817338, 14.058894518567275, 3825)
-    femmesh.addNode(-4.544890416819217, -2.084219541964052, 25.54354703741972, 3826)
-    femmesh.addNode(-4.595175594982164, -1.970878294385605, 24.423664292864657, 3827)
-    femmesh.addNode(-4.0908651131302705, -2.8748604533391973, 14.466617013816773, 3828)
-    femmesh.addNode(-4.764505521089629, -1.5164059942859776, 36.08699577425095, 3829)
-    femmesh.addNode(-4.819356686830623, -1.331841253716435, 34.911622900333086, 3830)
-    femmesh.addNode(-4.843920181580979, -1.2395310703941615, 33.8443169991086, 3831)
-    femmesh.addNode(-4.985833649304424, -0.3761154363539637, 34.515338311615096, 3832)
-    femmesh.addNode(-4.363521663171544, 2.441245316438445, 17.92120013704956, 3833)
-    femmesh.addNode(-4.375070182530768, 2.4204877396777267, 18.805103557739557, 3834)
-    femmesh.addNode(-4.373010394823225, 2.4242071047598275, 19.717138340667866, 3835)
-    femmesh.addNode(-4.37924517427253, 2.4129259631432456, 20.614670107582455, 3836)
-    femmesh.addNode(-4.69476229335335, 1.7202345796162775, 19.229587922197666, 3837)
-    femmesh.addNode(-4.413169181061645, 2.350305890586945, 21.51374451337506, 3838)
-    femmesh.addNode(-4.41847483913877, 2.3403162384382203, 22.406130456200806, 3839)
-    femmesh.addNode(-4.71738056073352, 1.657202656651713, 21.040697110918572, 3840)
-    femmesh.addNode(-4.413310048337444, 2.350041365006953, 23.272989013580666, 3841)
-    femmesh.addNode(-4.409025139269589, 2.3580706777551805, 24.169321743225638, 3842)
-    femmesh.addNode(-4.736993398479009, 1.6002792077529144, 22.806630074091032, 3843)
-    femmesh.addNode(-4.378621415656853, 2.4140576833106495, 25.119929657267527, 3844)
-    femmesh.addNode(-4.365470494699567, 2.437758675486054, 26.01790360118707, 3845)
-    femmesh.addNode(-4.712550225796983, 1.6708890954640887, 24.62409654551278, 3846)
-    femmesh.addNode(-4.3658518431865625, 2.4370756416952872, 26.89427724455891, 3847)
-    femmesh.addNode(-4.3569559270769895, 2.4529441594762593, 27.78365880355677, 3848)
-    femmesh.addNode(-4.691148453454018, 1.7300653709198308, 26.451078102926516, 3849)
-    femmesh.addNode(-4.35017805635591, 2.4649443965330167, 28.640713112001023, 3850)
-    femmesh.addNode(-4.357487036616928, 2.4520005558146645, 29.541259013316086, 3851)
-    femmesh.addNode(-4.686634507041305, 1.7422562949835199, 28.184506054742613, 3852)
-    femmesh.addNode(-4.372091387695433, 2.4258641548197666, 30.4529730218333, 3853)
-    femmesh.addNode(-4.389090891514207, 2.3949699676670324, 31.354257566125668, 3854)
-    femmesh.addNode(-4.692240264301582, 1.727101995270405, 29.953274371704083, 3855)
-    femmesh.addNode(-4.435688757313226, 2.307523618133744, 32.267311621261385, 3856)
-    femmesh.addNode(-4.450044446099552, 2.2797158655715255, 33.16489682127634, 3857)
-    femmesh.addNode(-4.735242131450463, 1.6054538163822936, 31.778042435357015, 3858)
-    femmesh.addNode(-4.58672990589799, 1.9904544130275934, 14.55962341551737, 3859)
-    femmesh.addNode(-4.503472973865059, 2.172264066283609, 15.456834994594924, 3860)
-    femmesh.addNode(-4.885733248934024, 1.062831416669923, 14.298573963372423, 3861)
-    femmesh.addNode(-4.326192689042702, -2.5068021097153794, 31.32373034896994, 3862)
-    femmesh.addNode(-4.4825911184035565, 2.215034280820402, 34.95263448120161, 3863)
-    femmesh.addNode(-4.773621325151466, 1.4874607369806987, 35.3943006184912, 3864)
-    femmesh.addNode(-4.413207033241498, -2.350234814172357, 17.08258678384937, 3865)
-    femmesh.addNode(-4.42719107481301, -2.323785529496221, 16.085381351214316, 3866)
-    femmesh.addNode(-4.556753360979732, -2.0581542233758663, 20.902807247621496, 3867)
-    femmesh.addNode(-4.514265273609542, -2.149746273280399, 19.86598160262899, 3868)
-    femmesh.addNode(-4.784477417543468, 1.452162470599134, 33.58242272686048, 3869)
-    femmesh.addNode(-4.477935636647804, 2.224430811250291, 34.0562230576441, 3870)
-    femmesh.addNode(-4.517548738735108, -2.142837696409327, 26.63800061463461, 3871)
-    femmesh.addNode(-4.818531458297382, -1.334823803128526, 26.194152597758396, 3872)
-    femmesh.addNode(-4.4881346798132675, -2.203780183198283, 27.78269795556453, 3873)
-    femmesh.addNode(-4.5929186151108095, -1.976132231144618, 15.199445028350405, 3874)
-    femmesh.addNode(-4.622826319166974, -1.9051185849749972, 14.122851218661719, 3875)
-    femmesh.addNode(-4.912014386749767, -0.9338707963970728, 13.911637260360845, 3876)
-    femmesh.addNode(-4.8297661067804665, -1.2935839183426232, 15.741615556059259, 3877)
-    femmesh.addNode(-4.4926902611505595, -2.1944781195908334, 28.99640723120286, 3878)
-    femmesh.addNode(-4.80374476937799, -1.387096316292997, 28.50231545061161, 3879)
-    femmesh.addNode(-4.4300612401773805, -2.3183091701233574, 30.14466475240888, 3880)
-    femmesh.addNode(-4.787185985470704, -1.4432083496546442, 19.34860515317076, 3881)
-    femmesh.addNode(-4.358649236660496, 2.4499340464099997, 16.218767644777664, 3882)
-    femmesh.addNode(-4.318015986465505, 2.5208605555699295, 17.13177675963021, 3883)
-    femmesh.addNode(-4.719019286595212, -1.6525304755865833, 23.27603561163656, 3884)
-    femmesh.addNode(-4.70539131129674, -1.6909442946392819, 22.152875403842955, 3885)
-    femmesh.addNode(-4.742064584972143, -1.5851887811718144, 17.510228419810147, 3886)
-    femmesh.addNode(-4.977950826611335, 0.46904751128166955, 35.02819658803391, 3887)
-    femmesh.addNode(-4.967705272492488, 0.5673661301578874, 35.948748243296876, 3888)
-    femmesh.addNode(-4.974271447511082, -0.5065802665678952, 38.044832360935374, 3889)
-    femmesh.addNode(-4.910986671246919, -0.9392603019584645, 23.952070339315405, 3890)
-    femmesh.addNode(-4.663958095094448, 1.8020807105129792, 17.528129761850007, 3891)
-    femmesh.addNode(-4.7391935053131435, 1.5937518373943043, 15.976773734247917, 3892)
-    femmesh.addNode(-4.900437179311768, -0.9928320359551852, 21.554373501865847, 3893)
-    femmesh.addNode(-4.946945022819914, 0.7264536745018744, 16.13011718158335, 3894)
-    femmesh.addNode(-4.891763467133482, 1.0347222726984342, 16.892049831766087, 3895)
-    femmesh.addNode(-4.9099172666907585, 0.9448346068238362, 17.68147320918544, 3896)
-    femmesh.addNode(-4.963848532120395, -0.6001731001687773, 26.83967070787375, 3897)
-    femmesh.addNode(-4.971197010260783, -0.5359107063441159, 25.74521713065886, 3898)
-    femmesh.addNode(-4.999797199427282, -0.04503292794289509, 14.118993037937509, 3899)
-    femmesh.addNode(-4.910355939817767, 0.942552144072875, 18.719654178251325, 3900)
-    femmesh.addNode(-4.909552687081024, 0.9467272113843037, 19.63168896117963, 3901)
-    femmesh.addNode(-4.742892114515182, -1.5827110886291609, 30.895090322811, 3902)
-    femmesh.addNode(-4.9973277270399805, -0.1634490396344322, 21.852497446179427, 3903)
-    femmesh.addNode(-4.9687025117526655, -0.5585654390514682, 20.602429289957968, 3904)
-    femmesh.addNode(-4.896661159830258, 1.0112909995692585, 20.521087969698762, 3905)
-    femmesh.addNode(-4.910568644391248, 0.9414433539632105, 21.420162375491362, 3906)
-    femmesh.addNode(-4.904806599849966, 0.9710160750822926, 24.166656792682716, 3907)
-    femmesh.addNode(-4.892036048814033, 1.0334327733839208, 25.117264706724605, 3908)
-    femmesh.addNode(-4.902307951569567, 0.9835531241258892, 25.982719850164443, 3909)
-    femmesh.addNode(-4.902461774334736, 0.9827861167042964, 26.859093493536285, 3910)
-    femmesh.addNode(-4.905125410125417, 0.9694043072639797, 27.78979544683793, 3911)
-    femmesh.addNode(-4.902434700592141, 0.9829211598241447, 28.646849755282183, 3912)
-    femmesh.addNode(-4.9445494996528145, 0.7425834939473829, 32.09583452276681, 3913)
-    femmesh.addNode(-4.996283349994827, 0.19275032182715168, 15.035260158630264, 3914)
-    femmesh.addNode(-4.960916923625037, -0.6239417255567239, 19.71303028143884, 3915)
-    femmesh.addNode(-4.951930129525345, -0.6916559782862441, 18.75733008896521, 3916)
-    femmesh.addNode(-4.985030419097224, -0.3866157274030084, 15.950536256148435, 3917)
-    femmesh.addNode(-4.962192259335746, -0.6137165317867878, 27.77037266117539, 3918)
-    femmesh.addNode(-4.9930546330753955, 0.2634491053777341, 25.525280097334377, 3919)
-    femmesh.addNode(-4.997841907991324, 0.14688860652087518, 18.083574248167405, 3920)
-    femmesh.addNode(-4.889466559375679, -1.0455222449794928, 32.761094164881335, 3921)
-    femmesh.addNode(-4.976397477766932, -0.4852505984281871, 24.879761987219023, 3922)
-    femmesh.addNode(-4.996040412064312, 0.19894773439337365, 27.321437194075855, 3923)
-    femmesh.addNode(-4.9404842822349995, -0.7691651688609662, 16.836472579012344, 3924)
-    femmesh.addNode(-4.995572817976366, 0.2103621170640535, 20.01115422575242, 3925)
-    femmesh.addNode(-4.997350143512175, -0.16276222884575947, 32.47430248271575, 3926)
-    femmesh.addNode(-4.9128060805323965, -0.9296969479803135, 31.787364237206475, 3927)
-    femmesh.addNode(-4.960715490682371, 0.6255412220661115, 33.06956445044167, 3928)
-    femmesh.addNode(-4.968081893788034, 0.5640587705332643, 33.96089068680942, 3929)
-    femmesh.addNode(-4.974281100100531, 0.5064854757864737, 22.372106587399237, 3930)
-    femmesh.addNode(-4.973153604783022, 0.517439100990288, 23.238965144779097, 3931)
-    femmesh.addNode(-4.8794533863134415, 1.0912995238678929, 29.45443336930082, 3932)
-    femmesh.addNode(-4.952251108768838, -0.6893540133326365, 17.719149119899328, 3933)
-    femmesh.addNode(-4.997916141221955, -0.14434072645321122, 23.73213330599092, 3934)
-    femmesh.addNode(2.9783634860619257, 3.359813526041671, 47.68210237174975, 3935)
-    femmesh.addNode(2.477318363917041, 3.7353046231382594, 48.415382110441115, 3936)
-    femmesh.addNode(3.1834788225985458, 3.1112023982196773, 48.49829800563652, 3937)
-    femmesh.addNode(4.3732925026430545, -0.7858006724979736, 37.954124817065896, 3938)
-    femmesh.addNode(4.3732925026430545, -0.7858006724979736, 38.829124817065896, 3939)
-    femmesh.addNode(4.21724590601934, -1.560291373653911, 38.37586584157704, 3940)
-    femmesh.addNode(2.8327047444407043, -3.481770996737642, 34.33422456391371, 3941)
-    femmesh.addNode(2.162015677644642, -3.9052431336776356, 33.90952713493335, 3942)
-    femmesh.addNode(2.1405593988941116, -3.9132664572655735, 34.788683428455386, 3943)
-    femmesh.addNode(1.5943385584829999, -4.208034459147276, 16.44756743367366, 3944)
-    femmesh.addNode(1.5542729732914684, -4.222616962346587, 17.331152698465612, 3945)
-    femmesh.addNode(2.2435367484133013, -3.8477637644196756, 16.900683251940222, 3946)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 44.6, 3947)
-    femmesh.addNode(4.382821097421747, 0.7564149771665171, 44.96804374614544, 3948)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 45.45, 3949)
-    femmesh.addNode(2.2536392828069856, 3.8459026769665137, 13.433884927978543, 3950)
-    femmesh.addNode(1.6015944428520117, 4.205046664433678, 13.884649219784004, 3951)
-    femmesh.addNode(1.5213771333235901, 4.23315346864681, 13.005554227876221, 3952)
-    femmesh.addNode(4.213331348054394, 1.5621644558066232, 44.5410632194714, 3953)
-    femmesh.addNode(4.330510250632647, 0.805749478640105, 44.173019473325965, 3954)
-    femmesh.addNode(4.210210508174029, 1.5719261451195023, 43.691210593371814, 3955)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 46.275000000000006, 3956)
-    femmesh.addNode(4.378190066109169, -0.7708514833997977, 46.794545964328606, 3957)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 47.3, 3958)
-    femmesh.addNode(2.179006751981373, -3.894125976149778, 21.40080470852716, 3959)
-    femmesh.addNode(2.1825198668152472, -3.8915818236627806, 20.495462506240358, 3960)
-    femmesh.addNode(2.864671574664265, -3.4542779235288266, 21.841920169909866, 3961)
-    femmesh.addNode(2.8681846894981393, -3.451733771041829, 20.93657796762306, 3962)
-    femmesh.addNode(-0.7746949806053056, -4.409128531919851, 27.301018793951325, 3963)
-    femmesh.addNode(0.12377402991920741, -4.48449868990491, 27.660380558853284, 3964)
-    femmesh.addNode(-0.0675690807224722, -4.495854830233944, 26.625474524086023, 3965)
-    femmesh.addNode(0.13156545979460527, -4.484951380587031, 28.56083665246074, 3966)
-    femmesh.addNode(-0.7669035507299078, -4.4095812226019735, 28.20147488755878, 3967)
-    femmesh.addNode(-0.5723918641491519, 4.4509382572980005, 46.04863249289957, 3968)
-    femmesh.addNode(-1.0417185016211208, 4.376811020562863, 46.79730961562355, 3969)
-    femmesh.addNode(-0.14052210175983182, 4.440125587555686, 46.80464204144534, 3970)
-    femmesh.addNode(-4.4498109480804295, -0.3289302462804232, 26.014611000996013, 3971)
-    femmesh.addNode(-4.427759178055201, 0.6307174327478938, 26.44383085215804, 3972)
-    femmesh.addNode(-4.451323891618406, -0.32208790482278915, 26.93598569152177, 3973)
-    femmesh.addNode(0.8350126654376144, 4.359274898921022, 16.897481808420704, 3974)
-    femmesh.addNode(1.5906838626094795, 4.209148651607039, 17.374163473057486, 3975)
-    femmesh.addNode(1.5949878744841661, 4.2075691025929585, 16.49403690298397, 3976)
-    femmesh.addNode(-4.359524292530523, 1.1153087706529385, 39.76364313987034, 3977)
-    femmesh.addNode(-3.918602888874123, 2.012535006411322, 39.277754099841886, 3978)
-    femmesh.addNode(-4.299773423628981, 1.3109640188107496, 38.780871424013995, 3979)
-    femmesh.addNode(4.224329805531898, 1.5367006158620402, 45.40312773590556, 3980)
-    femmesh.addNode(4.341508708110152, 0.780285638695522, 45.885083989760126, 3981)
-    femmesh.addNode(4.195621568293739, 1.6218036964448803, 46.249777781459656, 3982)
-    femmesh.addNode(2.2547501547843907, 3.843783605412894, 16.944325529918757, 3983)
-    femmesh.addNode(-4.4283020793139425, 0.6170839192187906, 27.37453280545968, 3984)
-    femmesh.addNode(-4.451866792877148, -0.33572141835189245, 27.866687644823408, 3985)
-    femmesh.addNode(-4.354014958012994, -1.126900394924269, 27.384921158621303, 3986)
-    femmesh.addNode(4.379217335888903, -0.7676749758886978, 39.684032902432506, 3987)
-    femmesh.addNode(4.223170739265187, -1.5421656770446353, 39.23077392694364, 3988)
-    femmesh.addNode(-2.976637144689339, 3.301517413320262, 37.470500630339224, 3989)
-    femmesh.addNode(-2.9870874932830223, 3.2879998950596803, 38.38284437335661, 3990)
-    femmesh.addNode(-2.3398093323861744, 3.836724668120766, 38.04342933176791, 3991)
-    femmesh.addNode(-1.7033832525408792, -4.145703152811556, 25.716247312741274, 3992)
-    femmesh.addNode(-1.700524221854689, -4.147224777545322, 24.808175488648935, 3993)
-    femmesh.addNode(-0.8838704196657081, -4.377243449089203, 25.299985774726238, 3994)
-    femmesh.addNode(4.219598732473137, 1.5460813786046799, 41.93048487779909, 3995)
-    femmesh.addNode(4.214491062061996, 1.562130624724845, 42.78670409689687, 3996)
-    femmesh.addNode(4.384807927952522, 0.7501274203592312, 42.33697190094807, 3997)
-    femmesh.addNode(4.379700257541382, 0.7661766664793962, 43.19319112004585, 3998)
-    femmesh.addNode(4.229509009637099, 1.5208729078998788, 37.43127145223514, 3999)
-    femmesh.addNode(4.233686108145168, 1.5109116173877597, 38.3384968169507, 4000)
-    femmesh.addNode(4.387201199820641, 0.742475879456625, 37.90357855003975, 4001)
-    femmesh.addNode(-1.8480569792039665, 4.102560702140723, 11.770542956142965, 4002)
-    femmesh.addNode(-2.4373392920033368, 3.681530257003602, 11.357284824929177, 4003)
-    femmesh.addNode(-2.4969010598045434, 3.6907915701769465, 12.280432032101094, 4004)
-    femmesh.addNode(-3.086183372603913, 3.269761125039825, 11.867173900887309, 4005)
-    femmesh.addNode(1.4818262851447013, 4.248975907391675, 39.688024430345095, 4006)
-    femmesh.addNode(1.4387879388838352, 4.263737245946486, 40.57009040674875, 4007)
-    femmesh.addNode(0.6938554069930465, 4.391281911003969, 40.12451924310682, 4008)
-    femmesh.addNode(-4.4911294739732535, 0.2756664873553909, 8.896170237393587, 4009)
-    femmesh.addNode(-4.188718393627933, 1.296338684998369, 8.991843846772744, 4010)
-    femmesh.addNode(-4.396337581810038, 0.7973499141769285, 9.793086429179485, 4011)
-    femmesh.addNode(1.418911193397188, -4.267012265706782, 33.42939452789294, 4012)
-    femmesh.addNode(1.3974549146466577, -4.27503558929472, 34.30855082141497, 4013)
-    femmesh.addNode(-0.8492807908915737, -4.38240099173435, 17.69933388837429, 4014)
-    femmesh.addNode(-1.6669151772616004, -4.162266368897405, 17.194717952264455, 4015)
-    femmesh.addNode(-0.8484375017904314, -4.3824427560259345, 16.80595581340364, 4016)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 16.025, 4017)
-    femmesh.addNode(4.389960743327161, 0.7335445762563342, 16.44691800795729, 4018)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 16.85, 4019)
-    femmesh.addNode(-2.6987683641415856, 3.590755083645939, 3.123242892177359, 4020)
-    femmesh.addNode(-3.0024328362994765, 3.2628843098091718, 3.862776746369358, 4021)
-    femmesh.addNode(-2.3474320694844972, 3.8335886287254417, 3.79062704237242, 4022)
-    femmesh.addNode(2.2145620494216036, 3.842715565117266, 44.82143357430893, 4023)
-    femmesh.addNode(2.010034236978008, 3.990033004916114, 43.92989495010396, 4024)
-    femmesh.addNode(1.4231244702189034, 4.268819581872288, 44.736940674053265, 4025)
-    femmesh.addNode(-3.6018584950538246, -2.6967310189773555, 27.478765188662752, 4026)
-    femmesh.addNode(-3.602267266548835, -2.696202924891282, 28.372239158199385, 4027)
-    femmesh.addNode(-3.974090423148965, -1.9006402141836054, 27.87901293921255, 4028)
-    femmesh.addNode(-4.47176138934116, -0.2230705570263673, 42.10877870115169, 4029)
-    femmesh.addNode(-4.447074672531013, -0.6872086925251868, 41.27070349718035, 4030)
-    femmesh.addNode(-4.343084215923462, -1.120607391866574, 42.090899522779054, 4031)
-    femmesh.addNode(3.766846118823044, -2.3766418428585245, 30.591965581023143, 4032)
-    femmesh.addNode(4.205144794888454, -1.593867810151123, 31.19521663852528, 4033)
-    femmesh.addNode(3.834144715796107, -2.291545487747477, 31.643903743067124, 4034)
-    femmesh.addNode(-4.4405919354918035, 0.5539598216444545, 17.143210522287234, 4035)
-    femmesh.addNode(-4.289817070810867, 1.3374748475902662, 17.77929045237115, 4036)
-    femmesh.addNode(-4.440660216230586, 0.5516365894627522, 18.181391491353118, 4037)
-    femmesh.addNode(-3.588443659971931, -2.715058685706191, 18.46121363975106, 4038)
-    femmesh.addNode(-3.6326383378400515, -2.6537825332653275, 19.406231725170073, 4039)
-    femmesh.addNode(-3.966639013577513, -1.976409670026039, 18.88885527571184, 4040)
-    femmesh.addNode(-3.5945920411282932, -2.707052767406606, 17.517863901392253, 4041)
-    femmesh.addNode(-3.972787394733875, -1.9684037517264539, 17.945505537353036, 4042)
-    femmesh.addNode(2.9308938023136646, 3.4053694020391063, 15.616362431328607, 4043)
-    femmesh.addNode(2.93209767318113, 3.404193526071082, 14.73613153054476, 4044)
-    femmesh.addNode(2.2567839632469733, 3.838864466469533, 15.184348332313906, 4045)
-    femmesh.addNode(2.2753113996474648, -3.7767170011439717, 14.236926860472343, 4046)
-    femmesh.addNode(2.917010950043213, -3.417705216809602, 13.79897108194138, 4047)
-    femmesh.addNode(1.6084670686261624, -4.202689676394305, 13.786895464602733, 4048)
-    femmesh.addNode(2.2501666190219103, -3.843677892059935, 13.34893968607177, 4049)
-    femmesh.addNode(2.776031811511964, 3.5139933221414923, 7.607566818055401, 4050)
-    femmesh.addNode(2.1102991742868715, 3.948791642702811, 8.116292762192792, 4051)
-    femmesh.addNode(2.7852999743063425, 3.5047889660003007, 8.499568098355478, 4052)
-    femmesh.addNode(2.7290998046578716, 3.5547684251588176, 44.34015372358503, 4053)
-    femmesh.addNode(3.401678602175246, 2.914831611349703, 44.64876780458137, 4054)
-    femmesh.addNode(2.7133338602448296, 3.5694749377869366, 43.414935776934044, 4055)
-    femmesh.addNode(3.385912657762204, 2.9295381239778218, 43.72354985793038, 4056)
-    femmesh.addNode(0.058446110258028997, -4.494202213921731, 13.750560454606315, 4057)
-    femmesh.addNode(0.07710255941853901, -4.4948965737765665, 12.850194140508833, 4058)
-    femmesh.addNode(-0.6287154407072069, -4.438118526209203, 13.406154085186026, 4059)
-    femmesh.addNode(-0.6100589915466968, -4.438812886064039, 12.505787771088546, 4060)
-    femmesh.addNode(-2.913548446094011, -3.382786644990314, 14.346358118753482, 4061)
-    femmesh.addNode(-2.9805858855419265, -3.3020563874133657, 15.21246291167154, 4062)
-    femmesh.addNode(-3.5276589389918644, -2.786398306210495, 14.754080614002982, 4063)
-    femmesh.addNode(-3.59469637843978, -2.7056680486335463, 15.620185406921038, 4064)
-    femmesh.addNode(-2.4016443936253222, -3.788810765617741, 17.638361946559314, 4065)
-    femmesh.addNode(-1.675900347725127, -4.157601951272152, 18.11930552862324, 4066)
-    femmesh.addNode(-2.4106295640888487, -3.784146347992489, 18.562949522918096, 4067)
-    femmesh.addNode(-1.2322056030882202, -4.325671423653647, 46.81632439232051, 4068)
-    femmesh.addNode(-1.9940663460992967, -3.9520767146860143, 46.78412495534715, 4069)
-    femmesh.addNode(-1.6278096570876395, -4.182365073620214, 45.97540092265733, 4070)
-    femmesh.addNode(-4.451084103764487, -0.360048763287013, 17.666640371175895, 4071)
-    femmesh.addNode(-4.335709146395151, -1.1888910554995533, 18.3403962119737, 4072)
-    femmesh.addNode(-4.310133305263573, -1.265400738069518, 17.45771967108672, 4073)
-    femmesh.addNode(-2.3113110538099297, 3.8475279077329496, 33.47412986223708, 4074)
-    femmesh.addNode(-2.3206742852970743, 3.8410187054545775, 34.36671413739174, 4075)
-    femmesh.addNode(-1.579267661086623, 4.194379533234686, 33.93493550635134, 4076)
-    femmesh.addNode(-3.361130205686843, -2.987995362859577, 41.44601295971128, 4077)
-    femmesh.addNode(-2.917211746256327, -3.33515912164661, 41.97688640406148, 4078)
-    femmesh.addNode(-3.5685834133425676, -2.733299213541505, 42.124586454543625, 4079)
-    femmesh.addNode(-4.430607687043027, 0.6938890433447966, 30.03541668863543, 4080)
-    femmesh.addNode(-4.442311433653519, -0.23858349488455563, 30.5333582148633, 4081)
-    femmesh.addNode(-4.438783380200756, 0.4683281195511445, 30.85204977844849, 4082)
-    femmesh.addNode(-4.4504871268112485, -0.46414441867820777, 31.349991304676358, 4083)
-    femmesh.addNode(4.2322773385713415, -1.5255774882958966, 1.9433110350519343, 4084)
-    femmesh.addNode(4.1994947654046495, -1.6167880249829492, 0.7266101280266689, 4085)
-    femmesh.addNode(3.906536794659061, -2.166836085602545, 1.488172008850165, 4086)
-    femmesh.addNode(-2.7199815589545455, -3.4826120918062067, 1.5752989828746387, 4087)
-    femmesh.addNode(-3.446335078965568, -2.8935401077554515, 1.5731193651056667, 4088)
-    femmesh.addNode(-2.416551028222766, -3.7768522049968594, 2.3106585748492976, 4089)
-    femmesh.addNode(-3.1429045482337887, -3.187780220946104, 2.3084789570803257, 4090)
-    femmesh.addNode(4.220499805781257, -1.5496913464139546, 20.498012427929577, 4091)
-    femmesh.addNode(3.8735691116626088, -2.2351683261880995, 20.02039541529213, 4092)
-    femmesh.addNode(3.865443815384191, -2.246416753661873, 20.960747657377922, 4093)
-    femmesh.addNode(3.3755097012888466, -2.954291027691756, 33.866432275342056, 4094)
-    femmesh.addNode(3.3928325302836626, -2.9311200391344387, 34.76912931862958, 4095)
-    femmesh.addNode(2.9167977973238095, 3.4159885027505164, 13.85435673630409, 4096)
-    femmesh.addNode(3.456785084288702, 2.8485220176562738, 14.288847599541322, 4097)
-    femmesh.addNode(3.424139333282292, -2.8946847561622846, 25.000317966807977, 4098)
-    femmesh.addNode(3.868547586423226, -2.2428000554789342, 25.43356752662421, 4099)
-    femmesh.addNode(3.867166474764263, -2.2460603107498835, 24.556861871513036, 4100)
-    femmesh.addNode(-4.287303981423689, 1.3457016072008807, 20.531768978203658, 4101)
-    femmesh.addNode(-3.9230707197279036, 2.0067524549912954, 21.004816380660145, 4102)
-    femmesh.addNode(-4.310908166318798, 1.2785101128298026, 21.430843383996258, 4103)
-    femmesh.addNode(2.261453599449018, 3.842796202312556, 12.57815948299907, 4104)
-    femmesh.addNode(2.205369584074853, 3.8844590126380805, 11.661568053084771, 4105)
-    femmesh.addNode(2.9253141855514504, 3.407613271028719, 12.980096166773546, 4106)
-    femmesh.addNode(2.8692301701772855, 3.4492760813542436, 12.063504736859247, 4107)
-    femmesh.addNode(2.2877810254413147, 3.8230230546924657, 25.943177346909003, 4108)
-    femmesh.addNode(2.9485859259641947, 3.389881407980166, 26.359229698955524, 4109)
-    femmesh.addNode(2.956527817405635, 3.3819957032795775, 25.45000617507351, 4110)
-    femmesh.addNode(3.4731636842850975, -2.8243348531053396, 25.908613394700566, 4111)
-    femmesh.addNode(3.9175719374260316, -2.1724501524219892, 26.3418629545168, 4112)
-    femmesh.addNode(2.716192915695501, -3.5779508676805976, 5.358193115154134, 4113)
-    femmesh.addNode(3.1973989564809786, -3.1511940792770594, 4.334599599666301, 4114)
-    femmesh.addNode(2.3769509053035405, -3.7714321120480316, 4.320292545830157, 4115)
-    femmesh.addNode(3.892784566568004, 2.1986325801120286, 12.936536798898661, 4116)
-    femmesh.addNode(4.237922600195766, 1.5019302257203344, 13.399184110674376, 4117)
-    femmesh.addNode(3.911121424999591, 2.172378724311277, 13.836893580761666, 4118)
-    femmesh.addNode(-4.399542053749296, 0.7196641055287416, 42.11982900294503, 4119)
-    femmesh.addNode(-4.344728136200131, 1.1497262433573625, 42.95285713567057, 4120)
-    femmesh.addNode(-4.497000816985879, 0.16322317202741468, 42.890155967780544, 4121)
-    femmesh.addNode(-4.442186899436714, 0.5932853098560356, 43.72318410050608, 4122)
-    femmesh.addNode(-3.1858247806606603, 3.1775005306637025, 10.755613641077318, 4123)
-    femmesh.addNode(0.317529397947072, 4.461622731125175, 3.9614666939452694, 4124)
-    femmesh.addNode(0.6869556032980686, 4.444271263764918, 3.1539521771198986, 4125)
-    femmesh.addNode(1.1698291871439497, 4.336244344791869, 3.956497015217204, 4126)
-    femmesh.addNode(4.373019822835224, -0.7866237476907761, 24.50850262630768, 4127)
-    femmesh.addNode(4.2139034937393625, -1.5683828603325818, 24.067715866944567, 4128)
-    femmesh.addNode(4.384005246470041, -0.7526745543748115, 25.428819724386926, 4129)
-    femmesh.addNode(4.224888917374178, -1.5344336670166172, 24.988032965023812, 4130)
-    femmesh.addNode(-0.714537173697559, 4.405257466875627, 31.50872803517847, 4131)
-    femmesh.addNode(-0.732411966428185, 4.404875130463321, 32.56254806888776, 4132)
-    femmesh.addNode(0.07077806527279187, 4.497524228852354, 31.980286982110627, 4133)
-    femmesh.addNode(0.052903272542165834, 4.497141892440048, 33.03410701581991, 4134)
-    femmesh.addNode(4.387031013379128, -0.7430228402722303, 13.881540875399022, 4135)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 14.325, 4136)
-    femmesh.addNode(4.387031013379128, -0.7430228402722303, 12.956540875399021, 4137)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 13.399999999999999, 4138)
-    femmesh.addNode(4.3899399949230995, 0.7336121731998289, 21.80368683616282, 4139)
-    femmesh.addNode(4.3899399949230995, 0.7336121731998289, 22.728686836162822, 4140)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 22.225, 4141)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 23.15, 4142)
-    femmesh.addNode(-3.8990871401681093, -2.102703533891948, 48.405766238936515, 4143)
-    femmesh.addNode(-3.7067731976806413, -2.5228456942504796, 47.57861255713752, 4144)
-    femmesh.addNode(-3.4423787227670255, -2.8981268904373487, 48.407812668905535, 4145)
-    femmesh.addNode(-1.5143618535130055, 4.22306731954095, 27.342133609369768, 4146)
-    femmesh.addNode(-1.515431326997784, 4.222765641944093, 28.252293223298913, 4147)
-    femmesh.addNode(-2.241257970981752, 3.884601562929455, 27.776040977153013, 4148)
-    femmesh.addNode(-3.1584079050191787, -3.181198146360326, 44.43587633650078, 4149)
-    femmesh.addNode(-3.43841967164518, -2.783417429113185, 43.654939864478834, 4150)
-    femmesh.addNode(-2.8480448954548043, -3.4840513498863976, 43.63358727071885, 4151)
-    femmesh.addNode(-2.138073151841296, -3.9343474742645057, 9.689502414641517, 4152)
-    femmesh.addNode(-2.8226687711536327, -3.4712934126876243, 10.087395101172046, 4153)
-    femmesh.addNode(-2.698777256809963, -3.5890650711944545, 9.302591478622352, 4154)
-    femmesh.addNode(-2.9980025515746407, 3.2962173302051756, 16.42217586703712, 4155)
-    femmesh.addNode(-3.063543516608763, 3.2485584346082703, 15.454845665455819, 4156)
-    femmesh.addNode(-2.3066587199719955, 3.846690426246255, 15.944678931351188, 4157)
-    femmesh.addNode(-2.3721996850061178, 3.7990315306493496, 14.97734872976989, 4158)
-    femmesh.addNode(-3.5702522215788424, 2.7378627936639983, 15.976474206572536, 4159)
-    femmesh.addNode(-1.5677174765577038, 4.2044833626040425, 13.57550994887296, 4160)
-    femmesh.addNode(-2.3567243587482887, 3.8064190679752965, 14.116538977086275, 4161)
-    femmesh.addNode(-1.5831928028155327, 4.197095825278096, 14.436319701556574, 4162)
-    femmesh.addNode(4.385504124273148, 0.7479104712970658, 12.940784116665363, 4163)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 12.525, 4164)
-    femmesh.addNode(-1.570355411342005, 4.196778636248801, 32.01672320923721, 4165)
-    femmesh.addNode(-2.3119831871182823, 3.847194237463209, 32.46487679652394, 4166)
-    femmesh.addNode(-1.5799397943949756, 4.194045862964946, 32.9256824406382, 4167)
-    femmesh.addNode(-4.43638815254853, 0.5863630495201664, 28.297574724393044, 4168)
-    femmesh.addNode(-4.279012962315734, 1.3712902900193784, 28.69228533229773, 4169)
-    femmesh.addNode(-4.283815334458038, 1.3583720052282255, 27.835231023853474, 4170)
-    femmesh.addNode(3.4708782315401785, 2.8134551784621182, 45.39257707151417, 4171)
-    femmesh.addNode(3.9403022358915036, 2.138617603917246, 45.717676958707884, 4172)
-    femmesh.addNode(3.871102606526571, 2.2399940368048306, 44.973867691775084, 4173)
-    femmesh.addNode(3.81060804713813, 2.3851544866571257, 48.50172724762258, 4174)
-    femmesh.addNode(3.48403685948833, 2.832694986614266, 49.253961569163266, 4175)
-    femmesh.addNode(4.213378922965003, -1.5699797128418957, 36.59340777760885, 4176)
-    femmesh.addNode(4.2142008092963765, -1.5675017704214689, 37.51990906780651, 4177)
-    femmesh.addNode(4.340908306653322, -0.7817010979234965, 37.01578425074061, 4178)
-    femmesh.addNode(-3.94786305523024, 1.980121999634501, 15.5342410201336, 4179)
-    femmesh.addNode(-4.060270644965993, 1.8147889680188534, 14.637029441056045, 4180)
-    femmesh.addNode(-4.353129875182306, 1.1399349343570724, 15.292247109603853, 4181)
-    femmesh.addNode(4.385509275963484, 0.7478940394816471, 27.16697595293674, 4182)
-    femmesh.addNode(4.385509275963484, 0.7478940394816471, 28.066975952936737, 4183)
-    femmesh.addNode(4.236182727852373, 1.5061867102055968, 27.653587766872736, 4184)
-    femmesh.addNode(-4.429830491093933, 0.6969501245404671, 29.10515833841168, 4185)
-    femmesh.addNode(3.8587694824068803, 2.251329601836964, 11.20082017127277, 4186)
-    femmesh.addNode(4.228691001600438, 1.5271936501515375, 11.648515197298543, 4187)
-    femmesh.addNode(3.8592619527037875, 2.2501427337749176, 10.31064507109808, 4188)
-    femmesh.addNode(4.229183471897345, 1.5260067820894911, 10.758340097123853, 4189)
-    femmesh.addNode(-3.690588894630297, 2.561848659296679, 39.90215605336725, 4190)
-    femmesh.addNode(-4.131510298286697, 1.6646224235382958, 40.388045093395704, 4191)
-    femmesh.addNode(-1.0941930240299653, 4.347602673162836, 40.96759917379542, 4192)
-    femmesh.addNode(-0.25396344958236, 4.4771936076688785, 40.60710436989275, 4193)
-    femmesh.addNode(-0.4007508049775685, 4.475501429037199, 41.62956928122897, 4194)
-    femmesh.addNode(3.53334398165127, 2.7714776278787054, 1.5055273699056504, 4195)
-    femmesh.addNode(3.324248722582696, 3.0330329656862167, 0.7553131899289663, 4196)
-    femmesh.addNode(2.958284818789583, 3.361146166443371, 1.5065312866083187, 4197)
-    femmesh.addNode(-0.0692250574513966, -4.495754684517583, 25.721899068184506, 4198)
-    femmesh.addNode(-0.1396467072140602, -4.496237051946734, 24.70844602092786, 4199)
-    femmesh.addNode(3.8874088375029707, 2.2117067516722657, 12.077847009797672, 4200)
-    femmesh.addNode(3.4248992916921166, 2.8994894787329164, 10.78631392480667, 4201)
-    femmesh.addNode(3.453538646788207, 2.8598666285682177, 11.66334076333157, 4202)
-    femmesh.addNode(3.461907037909273, 2.845899090748751, 29.48938191101408, 4203)
-    femmesh.addNode(3.9036850851502263, 2.185317412643715, 29.89421708110846, 4204)
-    femmesh.addNode(3.455285991627547, 2.855386853432501, 28.60106640519824, 4205)
-    femmesh.addNode(3.8970640388685003, 2.194805175327465, 29.005901575292622, 4206)
-    femmesh.addNode(-2.345649936445644, 3.826038404512056, 0.7459794219473314, 4207)
-    femmesh.addNode(-4.385132571907404, 0.9754789583564305, 13.472652435697746, 4208)
-    femmesh.addNode(-4.041737417399293, 1.8826417492731018, 13.733701887842692, 4209)
-    femmesh.addNode(-4.1632622722146895, 1.6638609203139352, 12.78099946715447, 4210)
-    femmesh.addNode(-3.3271967841587786, 3.0034848288832237, 4.727120991522371, 4211)
-    femmesh.addNode(-3.6681044201854087, 2.6057757987628842, 3.8664077656576534, 4212)
-    femmesh.addNode(0.05241286698957018, 4.497083848828019, 28.258403407595083, 4213)
-    femmesh.addNode(0.05305310089452027, 4.497056782895678, 29.152706127343308, 4214)
-    femmesh.addNode(-0.7321105866428966, 4.405256257515974, 28.68746875982249, 4215)
-    femmesh.addNode(-4.082012568888309, -1.7365430592042383, 23.770601613087717, 4216)
-    femmesh.addNode(-3.7044644521091583, -2.5430851697989683, 24.29426607750161, 4217)
-    femmesh.addNode(-4.372375576664726, -1.059550973584105, 24.446636340766567, 4218)
-    femmesh.addNode(-3.9948274598855753, -1.8660930841788352, 24.970300805180464, 4219)
-    femmesh.addNode(3.473909594326318, -2.8401164111168553, 44.605901610365294, 4220)
-    femmesh.addNode(3.069048963237298, -3.285028117611626, 44.114194299426686, 4221)
-    femmesh.addNode(3.4275898584809643, -2.8863506851532197, 43.757897588160546, 4222)
-    femmesh.addNode(3.0227292273919444, -3.3312623916479893, 43.26619027722193, 4223)
-    femmesh.addNode(3.0710042929281274, 3.2530876229495957, 32.54917321274431, 4224)
-    femmesh.addNode(3.5836266697575385, 2.7157674211000065, 32.99043902467395, 4225)
-    femmesh.addNode(2.960715707439787, 3.3752727763013524, 33.341131726995144, 4226)
-    femmesh.addNode(3.473338084269198, 2.837952574451763, 33.78239753892478, 4227)
-    femmesh.addNode(4.346484908324526, 0.7684357379311335, 38.78491826691096, 4228)
-    femmesh.addNode(4.23436314678509, 1.5087312993702628, 39.227190178520694, 4229)
-    femmesh.addNode(4.378190066109169, -0.7708514833997977, 47.7195459643286, 4230)
-    femmesh.addNode(4.235471488035798, -1.5128122099656975, 47.31771229267736, 4231)
-    femmesh.addNode(-4.094321436261342, 1.8658939318288295, 4.025709893594797, 4232)
-    femmesh.addNode(-4.265978811220197, 1.3773066436277102, 3.150956422001416, 4233)
-    femmesh.addNode(-3.8922889488825767, 2.2165878073503897, 3.1512718787660963, 4234)
-    femmesh.addNode(0.8249801657661527, 4.340574829195283, 33.48720565847617, 4235)
-    femmesh.addNode(0.05133718982735135, 4.497206989157668, 33.926328967900446, 4236)
-    femmesh.addNode(1.509317172706195, -4.211792504523602, 4.433744389543113, 4237)
-    femmesh.addNode(1.6423958123464448, -4.176622958495942, 3.436774700858553, 4238)
-    femmesh.addNode(1.0018748010878993, -4.387053866423814, 5.187935396250347, 4239)
-    femmesh.addNode(1.1349534407281492, -4.351884320396154, 4.190965707565786, 4240)
-    femmesh.addNode(-3.5296951499488225, 2.7900362443410014, 32.47744039783718, 4241)
-    femmesh.addNode(-2.9653310874503576, 3.328420393686801, 32.944354665520564, 4242)
-    femmesh.addNode(-3.5485358412887864, 2.7650487342307843, 33.375025597852144, 4243)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 30.299999999999997, 4244)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 29.375, 4245)
-    femmesh.addNode(4.338396573620802, -0.7875900190449961, 29.83585189084773, 4246)
-    femmesh.addNode(4.4192298427742225, -0.6303387722729832, 48.5356756571683, 4247)
-    femmesh.addNode(4.276511264700852, -1.372299498838883, 48.133841985517066, 4248)
-    femmesh.addNode(-1.7163277250063291, -4.159233185271087, 11.346174379738736, 4249)
-    femmesh.addNode(-2.0918330042121225, -3.9725904567364596, 12.185412325227205, 4250)
-    femmesh.addNode(-2.55327999180301, -3.61255404386959, 11.445568773216085, 4251)
-    femmesh.addNode(1.422707657022793, -4.267437246635911, 35.213540526573745, 4252)
-    femmesh.addNode(-4.290131969398685, 1.3401322795508754, 30.534257691038697, 4253)
-    femmesh.addNode(-4.291124743726945, 1.3361923090104724, 31.504088326683267, 4254)
-    femmesh.addNode(-3.8794511991544063, 2.1396800472371673, 31.00339330921709, 4255)
-    femmesh.addNode(-4.4500329613882945, -0.4539914958772769, 38.79985767875919, 4256)
-    femmesh.addNode(-4.496894836613982, 0.10124817723852815, 39.716733027389935, 4257)
-    femmesh.addNode(-4.423370256613352, -0.8084577227514494, 39.601995661762686, 4258)
-    femmesh.addNode(-4.470232131839039, -0.2532180496356444, 40.51887101039344, 4259)
-    femmesh.addNode(1.5201096540034509, 4.235400081741195, 38.72606793124659, 4260)
-    femmesh.addNode(2.2096665153845865, 3.8613244331939174, 38.2868458872685, 4261)
-    femmesh.addNode(1.534922406175868, 4.230115996599531, 37.84022248312642, 4262)
-    femmesh.addNode(-3.9081804454641214, -2.1278722967857817, 32.12032364290782, 4263)
-    femmesh.addNode(-4.2857812618602695, -1.3345011264078726, 31.636782986841943, 4264)
-    femmesh.addNode(-4.28663521503965, -1.3307140236147694, 32.577239357804245, 4265)
-    femmesh.addNode(3.8896953227393714, -2.2108835300763134, 12.031428320598884, 4266)
-    femmesh.addNode(3.465935819279233, -2.8454550884198366, 11.598728280903998, 4267)
-    femmesh.addNode(3.445949560132915, -2.865346822844833, 12.463770205919669, 4268)
-    femmesh.addNode(-3.7193792528960854, -2.498757399755016, 0.7696659859512108, 4269)
-    femmesh.addNode(-3.105451519098035, -3.2267878393592446, 0.7696659859512108, 4270)
-    femmesh.addNode(-1.9383041410976054, 4.060160506289331, 1.595256869402938, 4271)
-    femmesh.addNode(-2.6809777286282395, 3.541389426764178, 1.5850616289361423, 4272)
-    femmesh.addNode(-4.434883517598487, 0.22590319646313545, 35.74928843430661, 4273)
-    femmesh.addNode(-4.438689953693467, 0.6527769738879249, 36.56639660325918, 4274)
-    femmesh.addNode(-4.3176554352192, 1.2523207634692477, 36.1153924647639, 4275)
-    femmesh.addNode(-4.440641254663325, 0.4737558133893049, 39.02541091986495, 4276)
-    femmesh.addNode(-4.415777874481179, 0.7428011345021617, 40.45496524739532, 4277)
-    femmesh.addNode(4.379352089355434, 0.767257215593263, 5.79733372878005, 4278)
-    femmesh.addNode(4.206401068620572, 1.5808246850549057, 5.300876171437075, 4279)
-    femmesh.addNode(4.225544686289754, 1.5363949763519678, 6.240778587693287, 4280)
-    femmesh.addNode(-4.494918848649186, 0.2109200858631751, 41.35694621436478, 4281)
-    femmesh.addNode(4.238897732822493, -1.5041774539164954, 46.35950735733848, 4282)
-    femmesh.addNode(3.8483763350594025, 2.266221685856917, 6.645666419476722, 4283)
-    femmesh.addNode(4.223176295803802, 1.543701183151441, 7.155017609930249, 4284)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 10.75, 4285)
-    femmesh.addNode(4.381648254742854, 0.7600997241680318, 11.198804992390519, 4286)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 11.675, 4287)
-    femmesh.addNode(3.4469646140847554, 2.866400641735229, 12.514230248147772, 4288)
-    femmesh.addNode(-4.291078402015607, -1.3214469834696145, 38.7908580740665, 4289)
-    femmesh.addNode(-4.400686424374031, -0.9385407100948128, 38.08675922575094, 4290)
-    femmesh.addNode(-2.4231153533288143, -3.771158721672114, 47.611234945498765, 4291)
-    femmesh.addNode(-2.8174042017913994, -3.5087702438325676, 46.790647165912, 4292)
-    femmesh.addNode(0.5905479026911233, -4.394309581555206, 33.85568678721948, 4293)
-    femmesh.addNode(-3.6367419303525694, -2.6469414827321556, 25.414148822056678, 4294)
-    femmesh.addNode(-4.015248207299307, -1.7401462665785081, 37.49194329454231, 4295)
-    femmesh.addNode(-3.905640184940884, -2.12305253995331, 38.19604214285786, 4296)
-    femmesh.addNode(-0.21194781378125577, 4.414651186592353, 3.0628833261546697, 4297)
-    femmesh.addNode(-0.6827962811952666, 4.427190743831822, 2.2974005316800907, 4298)
-    femmesh.addNode(-1.0975693308495407, 4.363767641906925, 3.107288456175204, 4299)
-    femmesh.addNode(3.8801055235169026, 2.22729843538103, 40.596519198142225, 4300)
-    femmesh.addNode(4.22641718722832, 1.5301757112679744, 41.04038399080957, 4301)
-    femmesh.addNode(4.229487497736361, 1.5203438523478714, 40.145684001471245, 4302)
-    femmesh.addNode(-3.5807445833761893, 2.725066471097597, 37.09722882086969, 4303)
-    femmesh.addNode(-2.9758271345215483, 3.3020644561764634, 36.61936337119667, 4304)
-    femmesh.addNode(-3.588828650204807, 2.714170533616603, 36.17492556760839, 4305)
-    femmesh.addNode(-4.447127683500606, -0.2780753131317716, 25.149155857556174, 4306)
-    femmesh.addNode(-4.369769249710396, -1.0714103776207822, 25.36909289088066, 4307)
-    femmesh.addNode(-2.999619861822106, 3.2910683297920773, 34.80542691246251, 4308)
-    femmesh.addNode(-2.9667030613947336, 3.3136741963275163, 35.68436279678521, 4309)
-    femmesh.addNode(-3.5797045770779925, 2.725780273767656, 35.23992499319693, 4310)
-    femmesh.addNode(-0.7846407430474842, 4.3946629113335, 13.992754335546884, 4311)
-    femmesh.addNode(-0.785677183788181, 4.39435386401777, 15.048427441159568, 4312)
-    femmesh.addNode(0.03618432945141874, 4.496457244796638, 14.707853556270685, 4313)
-    femmesh.addNode(-2.03967920038966, -3.9266454107838555, 43.59835687508175, 4314)
-    femmesh.addNode(-1.1118792901065093, -4.348131378737957, 43.443312140871356, 4315)
-    femmesh.addNode(-1.6510617757118373, -4.1748995744591735, 44.36122782146582, 4316)
-    femmesh.addNode(-4.452614445504789, -0.2771296860683824, 21.435001958899328, 4317)
-    femmesh.addNode(-4.438257917505067, -0.7160694045121163, 22.386946170807207, 4318)
-    femmesh.addNode(-4.432410145716414, 0.6390919748229007, 21.810738067507593, 4319)
-    femmesh.addNode(-4.418053617716692, 0.2001522563791669, 22.76268227941547, 4320)
-    femmesh.addNode(-3.9039779469298814, 2.0360907373257704, 30.1222423326507, 4321)
-    femmesh.addNode(-3.493297176685603, 2.8356385050120627, 30.591377950829088, 4322)
-    femmesh.addNode(1.3801987206157547, 4.283106579955339, 45.86499724170543, 4323)
-    femmesh.addNode(0.7170664963058395, 4.377728385600856, 45.25147470681689, 4324)
-    femmesh.addNode(2.1481072617806403, 3.8925493069015302, 40.13050714600207, 4325)
-    femmesh.addNode(-0.7874737583214604, -4.422615328443756, 45.98949293164793, 4326)
-    femmesh.addNode(-0.28852069443380035, -4.43433267203943, 46.77682340131811, 4327)
-    femmesh.addNode(-0.27289001330029844, -4.4806638951371145, 45.21955068057114, 4328)
-    femmesh.addNode(0.2260630505873616, -4.492381238732788, 46.00688115024131, 4329)
-    femmesh.addNode(-0.7427443667661835, 4.40460732544409, 21.350212527941427, 4330)
-    femmesh.addNode(0.0522913195667194, 4.496413934144091, 21.834859365496875, 4331)
-    femmesh.addNode(-0.7455955322740351, 4.403798828112708, 22.274234159133783, 4332)
-    femmesh.addNode(-2.3975183127463606, -3.7910888379986885, 49.21316003518332, 4333)
-    femmesh.addNode(-4.273934999817756, 1.3954021378081518, 25.082155309428664, 4334)
-    femmesh.addNode(-4.423552331138812, 0.6871476705599247, 24.624715556598595, 4335)
-    femmesh.addNode(-4.295224950303011, 1.3353562848315206, 24.13154739538677, 4336)
-    femmesh.addNode(-0.7419963494811556, 4.402142357179465, 33.47150730028874, 4337)
-    femmesh.addNode(-4.407216001442615, -0.8813080665750705, 47.584679492323296, 4338)
-    femmesh.addNode(-4.433572022153074, -0.3807668188527842, 48.4208064318762, 4339)
-    femmesh.addNode(-4.296034724694492, -1.326233867791598, 48.42696819651144, 4340)
-    femmesh.addNode(-4.27572926122345, 1.3890928749268499, 26.91218910492011, 4341)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 21.375, 4342)
-    femmesh.addNode(4.38903308757542, 0.7365601852325792, 20.916346857144582, 4343)
-    femmesh.addNode(-4.275458582154321, 1.3898268331447725, 26.035815461548268, 4344)
-    femmesh.addNode(-3.897169673600785, 2.067256098547032, 26.479014603180666, 4345)
-    femmesh.addNode(-3.859637364871811, 2.171999395009429, 25.474758850399695, 4346)
-    femmesh.addNode(-3.4813484563182753, 2.8494286604116885, 25.91795799203209, 4347)
-    femmesh.addNode(4.379352089355434, 0.767257215593263, 6.647333728780049, 4348)
-    femmesh.addNode(-3.1088392861367478, -3.204616193285955, 23.849905365846766, 4349)
-    femmesh.addNode(-3.106669450438862, -3.207403690283265, 24.766299272701836, 4350)
-    femmesh.addNode(-2.467751589847543, -3.743784305087912, 24.368825931508024, 4351)
-    femmesh.addNode(-0.728278172856842, 4.4056290752657725, 26.827916331303328, 4352)
-    femmesh.addNode(-1.5288795237867139, 4.216315058827784, 26.388810675371033, 4353)
-    femmesh.addNode(-4.449734010454936, -0.2662159090950946, 24.226699307442082, 4354)
-    femmesh.addNode(-3.1350937244584163, -3.1840276783865686, 22.784407568048106, 4355)
-    femmesh.addNode(-3.6849425459734197, -2.5748054102014972, 22.254711962852944, 4356)
-    femmesh.addNode(-3.706634287807044, -2.5402976728016586, 23.37787217064654, 4357)
-    femmesh.addNode(-4.431281425537763, 0.6581759607516324, 23.690373927319087, 4358)
-    femmesh.addNode(-4.124188557362544, -1.7673975928630967, 49.229849128779094, 4359)
-    femmesh.addNode(-0.7246446715014436, -4.414692153528186, 14.150735211252673, 4360)
-    femmesh.addNode(-0.7807631774804388, 4.40076345411844, 34.52339669199253, 4361)
-    femmesh.addNode(0.6288614606996735, -4.377767108944809, 21.4258071290443, 4362)
-    femmesh.addNode(-0.15602608633588275, -4.495628413850288, 21.920969258642092, 4363)
-    femmesh.addNode(1.461202732002864, -4.254672884161526, 21.901554413785608, 4364)
-    femmesh.addNode(0.6763151849673077, -4.3725341890670055, 22.3967165433834, 4365)
-    femmesh.addNode(-4.302954044701961, 1.3063845750232281, 23.19720576610726, 4366)
-    femmesh.addNode(-3.576974405514273, -2.7297728560758285, 16.617390839556094, 4367)
-    femmesh.addNode(-3.9472115536022976, -2.0449134342964186, 17.062828996466052, 4368)
-    femmesh.addNode(-3.929593917988278, -2.0676335229656413, 16.162355934629893, 4369)
-    femmesh.addNode(-3.6409647356202264, -2.6415072395102186, 26.334067847732832, 4370)
-    femmesh.addNode(-3.0448881149331695, -3.2513048052391524, 26.777986807827695, 4371)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 43.675, 4372)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 42.8, 4373)
-    femmesh.addNode(-4.451313431850618, -0.33823723225240393, 28.788882030504354, 4374)
-    femmesh.addNode(-4.356335017725768, -1.1194650758828766, 29.52082481994058, 4375)
-    femmesh.addNode(-4.353461596986463, -1.1294162088247806, 28.30711554430225, 4376)
-    femmesh.addNode(-1.8275625152972301, 4.008719607752308, 43.83136386821366, 4377)
-    femmesh.addNode(-2.2951914869048315, 3.8411417167670034, 43.10793793382828, 4378)
-    femmesh.addNode(-2.668074784545521, 3.6225803467298823, 43.8898751940406, 4379)
-    femmesh.addNode(-4.495722347232398, 0.044096955066512816, 49.223687364143856, 4380)
-    femmesh.addNode(4.500612417036983, 1.22476755889616, 49.62146853699903, 4381)
-    femmesh.addNode(4.176171202316354, 0.3044561771844647, 49.62146853699903, 4382)
-    femmesh.addNode(3.9804391210527603, 1.167368268546383, 49.62146853699903, 4383)
-    femmesh.addNode(-2.313198513807479, 3.841617882058687, 44.5589905888134, 4384)
-    femmesh.addNode(-1.4726862445591884, 4.227757143081113, 44.50047926298646, 4385)
-    femmesh.addNode(4.392894260034899, 0.7239178546575816, 1.6502042087578783, 4386)
-    femmesh.addNode(4.212818076959721, -0.15626899236670846, 1.3458685054044097, 4387)
-    femmesh.addNode(4.392894260034899, 0.7239178546575816, 0.7502042087578784, 4388)
-    femmesh.addNode(4.605712336994619, 0.5676488622908741, 1.1960727141622882, 4389)
-    femmesh.addNode(4.212818076959721, -0.15626899236670846, 0.4458685054044098, 4390)
-    femmesh.addNode(-4.207373188137105, 1.47208055666245, 43.7329485910902, 4391)
-    femmesh.addNode(-4.393705688689042, 0.9720676999991418, 44.5154324242028, 4392)
-    femmesh.addNode(-3.8862989588325725, -2.0239202919900836, 30.88635741643982, 4393)
-    femmesh.addNode(-4.353890680983268, -1.130398413535329, 30.457717390280884, 4394)
-    femmesh.addNode(4.238964817025643, 1.4993609764163183, 26.75203190883377, 4395)
-    femmesh.addNode(4.23729210934657, 1.5046755506068774, 25.86354948503726, 4396)
-    femmesh.addNode(4.38383656828441, 0.7532086136722062, 26.278493529140228, 4397)
-    femmesh.addNode(4.389436443896907, -0.7352506243297636, 16.433557220192796, 4398)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 17.775, 4399)
-    femmesh.addNode(4.389436443896907, -0.7352506243297636, 17.358557220192793, 4400)
-    femmesh.addNode(4.22731720742962, -1.5240435623283286, 16.895309210836125, 4401)
-    femmesh.addNode(0.6655157017631957, 4.397330207802949, 1.5375695365422706, 4402)
-    femmesh.addNode(1.5299473165066457, 4.220882964544912, 1.5794762572225718, 4403)
-    femmesh.addNode(1.0928626178234504, 4.360313539245662, 2.3494403048080716, 4404)
-    femmesh.addNode(-3.523610933118661, -2.798060775546644, 30.44240761249416, 4405)
-    femmesh.addNode(-3.9912026552693565, -1.904538897091889, 30.013767586335227, 4406)
-    femmesh.addNode(0.143639371732553, 4.475476245055121, 3.7943339861274517, 4407)
-    femmesh.addNode(-0.7419821453357318, 4.4245927003696925, 3.8387391161479854, 4408)
-    femmesh.addNode(-0.7293476463416204, 4.405327397668915, 27.738075945232474, 4409)
-    femmesh.addNode(1.9713057127675393, 4.043451241742732, 0.7986337619168702, 4410)
-    femmesh.addNode(2.300174950816141, 3.839555340768585, 1.5498518585962227, 4411)
-    femmesh.addNode(2.778943982686319, 3.53941629618121, 49.244336436473255, 4412)
-    femmesh.addNode(-0.9668109846798152, 4.3926662031398305, 43.56750341189315, 4413)
-    femmesh.addNode(1.4462146757206833, 4.261085490758671, 4.803737109817052, 4414)
-    femmesh.addNode(1.7638939825318902, 4.131278742221296, 3.9386486462898347, 4415)
-    femmesh.addNode(1.4875084939551566, 4.206437596254493, 3.0914085516899865, 4416)
-    femmesh.addNode(-4.3204010795812895, 1.2515451541677283, 41.21784803597557, 4417)
-    femmesh.addNode(-4.208153755275806, 1.583919565714746, 42.18745358808909, 4418)
-    femmesh.addNode(3.8547270971331864, 2.2729052843892474, 43.275759330306194, 4419)
-    femmesh.addNode(3.3805356058463234, 2.9369855316176556, 42.88750601289564, 4420)
-    femmesh.addNode(3.8601041490490666, 2.2654578767494136, 44.111803175340924, 4421)
-    femmesh.addNode(2.7430792716883383, -3.5660933311843594, 49.18697700609821, 4422)
-    femmesh.addNode(2.270431046215961, -3.849637882107365, 48.423423480249596, 4423)
-    femmesh.addNode(1.832948818138537, -4.109180215409847, 49.23644647415138, 4424)
-    femmesh.addNode(-3.764613605446499, -2.3057973255623905, 10.982293819432526, 4425)
-    femmesh.addNode(-3.196661947803717, -3.1668160309397657, 10.959569935863925, 4426)
-    femmesh.addNode(-3.781921037501152, -2.2876495143989946, 11.840265912923975, 4427)
-    femmesh.addNode(-3.21396937985837, -3.14866821977637, 11.817542029355375, 4428)
-    femmesh.addNode(-0.65842551526199, 4.4248907447223385, 44.46506163450857, 4429)
-    femmesh.addNode(-0.20663513124874322, 4.494573771440381, 45.25453765826758, 4430)
-    femmesh.addNode(-1.0208958605459415, 4.297440169799154, 45.28995528674547, 4431)
-    femmesh.addNode(-4.391425840774661, 0.9797936295189222, 3.9153708776514398, 4432)
-    femmesh.addNode(-4.455231158310995, 0.5479241059529046, 4.733989925062387, 4433)
-    femmesh.addNode(-4.4312602429734715, 0.5331852872666413, 3.159441613011521, 4434)
-    femmesh.addNode(-4.495065560509805, 0.1013157637006237, 3.978060660422468, 4435)
-    femmesh.addNode(-4.1239877139181935, 1.8007452048399886, 2.331361648338132, 4436)
-    femmesh.addNode(-4.2541526081572485, 1.3793716252988775, 1.579666605336286, 4437)
-    femmesh.addNode(-4.396143705459251, 0.955933064086599, 2.3992613789995696, 4438)
-    femmesh.addNode(-4.461561145485881, 0.4937856743983917, 1.575578782130551, 4439)
-    femmesh.addNode(-4.477120635392355, -0.3801595523228984, 3.156897652519338, 4440)
-    femmesh.addNode(2.956019142158346, 3.3789076709157606, 34.24200693204419, 4441)
-    femmesh.addNode(3.4813520589912006, 2.82648644451079, 34.66968023113781, 4442)
-    femmesh.addNode(-2.444994229597242, -3.7570224304349416, 20.441688248840435, 4443)
-    femmesh.addNode(-3.10741855754074, -3.203722317210728, 19.92607516398237, 4444)
-    femmesh.addNode(-3.1051463300258155, -3.206659976952012, 20.856206052036676, 4445)
-    femmesh.addNode(4.384807927952522, 0.7501274203592312, 41.48697190094807, 4446)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 41.95, 4447)
-    femmesh.addNode(-4.116449430461654, 1.7446464563755848, 8.116959376731444, 4448)
-    femmesh.addNode(-3.6612120985838486, 2.5599819549079847, 7.961562871650694, 4449)
-    femmesh.addNode(-3.890050099471346, 2.0866724459171935, 7.2280727227121755, 4450)
-    femmesh.addNode(-3.4348127675935407, 2.9020079444495934, 7.072676217631425, 4451)
-    femmesh.addNode(-3.6674801399614605, -2.5628209494084975, 49.23189555874811, 4452)
-    femmesh.addNode(-1.5196052676376222, 4.212184400711788, 49.222710191496134, 4453)
-    femmesh.addNode(-2.3266102119848355, 3.835528808098661, 49.222710191496134, 4454)
-    femmesh.addNode(-4.3229390886200765, 1.2423567686883459, 32.41714238181898, 4455)
-    femmesh.addNode(-4.439776154529016, 0.4643881490107416, 31.82188041409306, 4456)
-    femmesh.addNode(-4.435930239931844, 0.3463055815722712, 32.79561034176792, 4457)
-    femmesh.addNode(3.857921646787257, -2.2587444912338444, 37.102887367187265, 4458)
-    femmesh.addNode(3.8609667435102195, -2.2515340944662863, 37.958844140957794, 4459)
-    femmesh.addNode(3.414099682348442, -2.908179219288333, 37.51743256160353, 4460)
-    femmesh.addNode(-3.157837008127516, 3.1915764399534465, 12.675784683305643, 4461)
-    femmesh.addNode(-2.501937402036874, 3.6884223668806064, 13.129797036256528, 4462)
-    femmesh.addNode(-3.1953946433719747, 3.1470551564278, 13.582195696610206, 4463)
-    femmesh.addNode(-2.910155373667161, 3.399507502604776, 7.9306063685209125, 4464)
-    femmesh.addNode(4.37470852373649, -0.7815109898736312, 8.47017973180848, 4465)
-    femmesh.addNode(4.380989207901762, -0.76216165729807, 9.38351808292359, 4466)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 8.95, 4467)
-    femmesh.addNode(-3.631740259544764, 2.6335444684882168, 13.286943586174552, 4468)
-    femmesh.addNode(-3.6692978947892225, 2.5890231849625702, 14.193354599479115, 4469)
-    femmesh.addNode(2.8728381033231205, -3.4396778378913897, 9.308206021319165, 4470)
-    femmesh.addNode(3.4345904083244063, -2.8923022137010883, 8.864077128484746, 4471)
-    femmesh.addNode(2.852151854893293, -3.4541318891248887, 8.361076870220161, 4472)
-    femmesh.addNode(0.5252315675812406, 4.4492886776057645, 6.350437276891484, 4473)
-    femmesh.addNode(1.2350809685357798, 4.309546548021216, 6.6455835215741565, 4474)
-    femmesh.addNode(0.4850893476494108, 4.449387869877336, 7.152084163305531, 4475)
-    femmesh.addNode(-0.8523133345434007, -4.386475367062851, 36.65791832734573, 4476)
-    femmesh.addNode(-0.9838517098043178, -4.342081381695619, 35.71121312226278, 4477)
-    femmesh.addNode(-1.661101888268401, -4.161824198022601, 37.099594928588935, 4478)
-    femmesh.addNode(-1.792640263529318, -4.1174302126553695, 36.15288972350598, 4479)
-    femmesh.addNode(-4.364913748873219, 0.20290224481982222, 15.808868107780324, 4480)
-    femmesh.addNode(-4.407580654903535, -0.9030671261955221, 15.62928718234541, 4481)
-    femmesh.addNode(-4.368852326119663, 0.22056695409141774, 14.812716433090845, 4482)
-    femmesh.addNode(-4.4115192321499785, -0.8854024169239265, 14.633135507655929, 4483)
-    femmesh.addNode(0.012112558228111317, 4.495768373590171, 17.353085182288208, 4484)
-    femmesh.addNode(0.008593958193878232, 4.49591167415217, 18.248815872706643, 4485)
-    femmesh.addNode(0.7677837553999763, 4.345642126276188, 17.82976684692499, 4486)
-    femmesh.addNode(-4.495802931947644, 0.04240061961799943, 0.8213157312960941, 4487)
-    femmesh.addNode(-4.4328647658824405, -0.38550300429290474, 1.5773506450214194, 4488)
-    femmesh.addNode(-4.413909856889742, -0.8321948869814793, 0.7560349137253253, 4489)
-    femmesh.addNode(-4.359657196201603, -1.1040281760335247, 21.136878014585747, 4490)
-    femmesh.addNode(-3.9840828604735163, -1.9139482381316095, 20.77468635623977, 4491)
-    femmesh.addNode(-4.062072541925887, -1.7628805876486335, 21.735379916562856, 4492)
-    femmesh.addNode(-3.6864982061977996, -2.5728006497467186, 21.37318825821688, 4493)
-    femmesh.addNode(2.8262652709210414, -3.4863443224945083, 33.43268703537774, 4494)
-    femmesh.addNode(2.155576204124979, -3.909816459434502, 33.00798960639737, 4495)
-    femmesh.addNode(4.36367240926312, -0.7257583281998216, 1.6516101280266688, 4496)
-    femmesh.addNode(4.398072841837433, -0.630332838331601, 2.3669154243527926, 4497)
-    femmesh.addNode(4.266677771145655, -1.430151998427676, 2.6586163313780578, 4498)
-    femmesh.addNode(-4.462819668862629, 0.31366026019937876, 13.019047789528596, 4499)
-    femmesh.addNode(-4.378127268438327, 0.9989252302706727, 12.370832474280753, 4500)
-    femmesh.addNode(-4.442727956713336, -0.25295390429433606, 38.02932254715974, 4501)
-    femmesh.addNode(-0.007998553953721843, 4.441964019837483, 43.59645169409259, 4502)
-    femmesh.addNode(-0.46362388547255956, 4.4649822309129945, 42.697948465003236, 4503)
-    femmesh.addNode(0.9589928006514146, 4.381010678509823, 43.04722534115079, 4504)
-    femmesh.addNode(0.5033674691325769, 4.404028889585335, 42.148722112061435, 4505)
-    femmesh.addNode(-1.5331123033814116, -4.206421081421272, 14.528482714341033, 4506)
-    femmesh.addNode(-1.5959867472356233, -4.188862638076003, 15.36890164032164, 4507)
-    femmesh.addNode(-0.7875191153556554, -4.397133710182916, 14.99115413723328, 4508)
-    femmesh.addNode(-4.334596647615607, 1.2077877156113208, 14.388919556390501, 4509)
-    femmesh.addNode(-2.4623951481422006, -3.7351132113463645, 3.9169304424177223, 4510)
-    femmesh.addNode(-1.6439979833217173, -4.174383278600347, 3.8778583996665787, 4511)
-    femmesh.addNode(-2.8037278125407683, -3.5196504665358397, 3.1340303864050183, 4512)
-    femmesh.addNode(-1.9853306477202852, -3.9589205337898212, 3.0949583436538743, 4513)
-    femmesh.addNode(3.460167236356845, 2.8494557244231773, 22.277759104923085, 4514)
-    femmesh.addNode(3.4665492987619344, 2.8402780795616867, 21.392080493908914, 4515)
-    femmesh.addNode(3.8971617327884025, 2.1970468049421323, 22.723364945404498, 4516)
-    femmesh.addNode(3.903543795193492, 2.1878691600806413, 21.837686334390327, 4517)
-    femmesh.addNode(2.2065043036124354, 3.8106625660129247, 39.23252232328778, 4518)
-    femmesh.addNode(2.896061164993571, 3.4365869174656467, 38.79330027930969, 4519)
-    femmesh.addNode(2.872785280248374, 3.4542359655227797, 39.675005038944754, 4520)
-    femmesh.addNode(1.199592817934494, -4.336183753470483, 2.557766948282908, 4521)
-    femmesh.addNode(0.6664385985906776, -4.420811939254997, 1.6574466679452824, 4522)
-    femmesh.addNode(0.7462859070494524, -4.409164275245594, 3.3306730254214414, 4523)
-    femmesh.addNode(0.21313168770563612, -4.493792461030108, 2.4303527450838156, 4524)
-    femmesh.addNode(-4.155829294276518, -1.6966919632366104, 2.3271665506353436, 4525)
-    femmesh.addNode(-3.6965110016450966, -2.5122291413056033, 2.3116998678834237, 4526)
-    femmesh.addNode(-3.9056533715969897, -2.078002929686459, 1.5885860478575866, 4527)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 26.725, 4528)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 27.6, 4529)
-    femmesh.addNode(-0.026495498187666666, -4.496468983617882, 17.258676011327132, 4530)
-    femmesh.addNode(-0.07946278818978422, -4.497451691624572, 18.185589701020017, 4531)
-    femmesh.addNode(3.9041036718310282, -2.1961745114260625, 16.437654505500344, 4532)
-    femmesh.addNode(3.4646143279591888, -2.837242209090583, 16.01923006465187, 4533)
-    femmesh.addNode(3.885367590514117, -2.223295532397622, 17.34481554501452, 4534)
-    femmesh.addNode(3.4458782466422786, -2.864363230062142, 16.92639110416605, 4535)
-    femmesh.addNode(1.6230755086994222, 4.196678828584041, 22.743937798512714, 4536)
-    femmesh.addNode(0.8632530728667104, 4.351906506207171, 22.28451585373223, 4537)
-    femmesh.addNode(1.6129656985420888, 4.200427704041947, 21.851384524103675, 4538)
-    femmesh.addNode(1.43326441530398, -4.264075572040602, 23.709530977590745, 4539)
-    femmesh.addNode(0.6197415098885388, -4.38369734321906, 23.257260955919644, 4540)
-    femmesh.addNode(1.443982223465994, -4.260091477529741, 22.83800718799216, 4541)
-    femmesh.addNode(-4.471328266644942, -0.3075467371762317, 43.69767593323427, 4542)
-    femmesh.addNode(-4.498006033204775, 0.13371227791132878, 44.51086461330497, 4543)
-    femmesh.addNode(3.9000028888326446, 2.1961132731444866, 15.606754211171758, 4544)
-    femmesh.addNode(3.9032744827168093, 2.1913763418050842, 14.720787450794406, 4545)
-    femmesh.addNode(3.4535134904045366, 2.853258948995676, 15.174814359918674, 4546)
-    femmesh.addNode(-3.055597881980357, 3.29276190092395, 47.65140874833406, 4547)
-    femmesh.addNode(-3.389191218175973, 2.947880672247419, 48.430550690424816, 4548)
-    femmesh.addNode(-2.677909917332839, 3.5345496393052045, 48.4313887193896, 4549)
-    femmesh.addNode(4.3874801352835116, 0.7415784541278319, 14.749935002293661, 4550)
-    femmesh.addNode(4.239898611206129, 1.4955982085511006, 14.283334996302674, 4551)
-    femmesh.addNode(4.232051668923348, 1.514595826044908, 15.167228866335414, 4552)
-    femmesh.addNode(-4.451360183628705, -0.2829965735314345, 20.521969116713667, 4553)
-    femmesh.addNode(-4.438644044016464, 0.6143515666679769, 19.99396679812034, 4554)
-    femmesh.addNode(-4.45413009802271, -0.34877509510145166, 19.632570108194535, 4555)
-    femmesh.addNode(-4.441413958410469, 0.5485730450979596, 19.104567789601205, 4556)
-    femmesh.addNode(-4.040561443010608, -1.959071376480769, 40.49922308071383, 4557)
-    femmesh.addNode(-4.227713098397798, -1.5368668352346575, 41.3227701286638, 4558)
-    femmesh.addNode(-3.8313640708902357, -2.351330130660287, 41.288909395216244, 4559)
-    femmesh.addNode(-4.018515726277425, -1.9291255894141754, 42.11245644316621, 4560)
-    femmesh.addNode(1.3607067962215202, 4.2893297994855075, 47.46396144365858, 4561)
-    femmesh.addNode(1.6847070171570966, 4.153120199635051, 48.407225220888954, 4562)
-    femmesh.addNode(0.7806524044653294, 4.384429410380205, 48.40557009296437, 4563)
-    femmesh.addNode(2.8619404220901776, -3.456823380804956, 24.614134495915742, 4564)
-    femmesh.addNode(2.8485388064418125, -3.4697986110385313, 23.69765739737835, 4565)
-    femmesh.addNode(3.4107377176339266, -2.90765998639586, 24.083840868270585, 4566)
-    femmesh.addNode(2.152438283010235, -3.9047493229189967, 35.70624022116601, 4567)
-    femmesh.addNode(4.38383656828441, 0.7532086136722062, 25.403493529140228, 4568)
-    femmesh.addNode(-4.29057081299075, 1.3344113032254736, 18.70246675061924, 4569)
-    femmesh.addNode(-4.436839974301064, 0.6216497876642936, 20.911234242776448, 4570)
-    femmesh.addNode(0.12972955096854166, -4.484847459396181, 29.447456533025452, 4571)
-    femmesh.addNode(-0.5651265440432107, -4.455468065183645, 29.284571351381015, 4572)
-    femmesh.addNode(-0.5669624528692744, -4.455364143992794, 30.171191231945727, 4573)
-    femmesh.addNode(1.9625821482522552, 4.005763925734515, 42.99764440731035, 4574)
-    femmesh.addNode(1.4110627895150194, 4.272799218100352, 42.37410283731322, 4575)
-    femmesh.addNode(4.377561145793531, -0.7727891031924252, 20.058816665626274, 4576)
-    femmesh.addNode(4.377561145793531, -0.7727891031924252, 20.933816665626274, 4577)
-    femmesh.addNode(2.177861713085284, -3.8113173806579965, 39.37984954622051, 4578)
-    femmesh.addNode(1.4853726021411264, -4.247079535995106, 38.93578183425652, 4579)
-    femmesh.addNode(1.4373761368733138, -4.264215592138627, 39.86946070877862, 4580)
-    femmesh.addNode(-3.0677860979884093, -3.2335878739367616, 18.930626949922072, 4581)
-    femmesh.addNode(-3.0739344791447714, -3.2255819556371765, 17.987277211563267, 4582)
-    femmesh.addNode(3.8590076510211535, 2.26310976399459, 42.37125283383125, 4583)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 1.8249999999999997, 4584)
-    femmesh.addNode(4.712818076959721, -0.15626899236670858, 1.3708685054044096, 4585)
-    femmesh.addNode(4.0764904862228395, -0.8820273205665289, 1.1724786334310786, 4586)
-    femmesh.addNode(1.5894392474346788, 4.209803430616132, 14.753337829878696, 4587)
-    femmesh.addNode(1.5862350363522775, 4.210985179279335, 15.613606595215739, 4588)
-    femmesh.addNode(0.8297402820902919, 4.36254434404268, 15.135426918513916, 4589)
-    femmesh.addNode(-3.5193098734243113, 2.803669334159217, 18.67767187673683, 4590)
-    femmesh.addNode(-3.5046516273096895, 2.822360988165438, 17.793768456046834, 4591)
-    femmesh.addNode(-3.8928852797715967, 2.1284258307757113, 18.19012145826663, 4592)
-    femmesh.addNode(3.8828122440296653, -2.220422756057677, 44.1876169896111, 4593)
-    femmesh.addNode(3.898739405716526, -2.1812301906968816, 45.04196172432765, 4594)
-    femmesh.addNode(4.218339006423388, -1.5547973306523188, 19.62205309928862, 4595)
-    femmesh.addNode(-2.450262023641179, -3.7542807912664546, 19.558397736978392, 4596)
-    femmesh.addNode(-1.7045814846190812, -4.14839283912393, 19.07874399142527, 4597)
-    femmesh.addNode(-1.8653731235011537, 4.094342789565951, 10.918785051540997, 4598)
-    femmesh.addNode(-2.6138586121584773, 3.590313063226052, 10.317113867689134, 4599)
-    femmesh.addNode(-1.41823179373278, 4.240996534988544, 10.054558923655412, 4600)
-    femmesh.addNode(2.8487126642667833, -3.4727459014690147, 40.71068676957779, 4601)
-    femmesh.addNode(2.051220029263708, -3.862071364341865, 41.33130392520775, 4602)
-    femmesh.addNode(2.885689407764065, -3.4451103056111965, 41.58949583743069, 4603)
-    femmesh.addNode(-4.414697697875621, -0.8291550369898721, 49.197119067732345, 4604)
-    femmesh.addNode(2.127482551415691, 3.9078344726666243, 41.034204687656775, 4605)
-    femmesh.addNode(2.87417965035478, 3.4529165242723137, 40.600656315710225, 4606)
-    femmesh.addNode(2.853554939989831, 3.468201690037408, 41.50435385736493, 4607)
-    femmesh.addNode(0.061018991906607804, 4.497913849931688, 31.086145578050566, 4608)
-    femmesh.addNode(3.899109590060328, -2.198044730466836, 4.8846092640251335, 4609)
-    femmesh.addNode(3.7294866882749345, -2.4161443291434805, 3.9879055195997895, 4610)
-    femmesh.addNode(4.20655642446722, -1.5918357016141043, 4.429844935598835, 4611)
-    femmesh.addNode(4.389496933480121, -0.7350540149465887, 15.567392812034157, 4612)
-    femmesh.addNode(4.233385402572489, -1.5097519076077388, 16.037178350311894, 4613)
-    femmesh.addNode(4.2334458921557045, -1.509555298224564, 15.171013942153253, 4614)
-    femmesh.addNode(3.455026916979083, -2.8465561373606656, 15.109375703164734, 4615)
-    femmesh.addNode(3.9101718669738976, -2.1818828567054727, 15.57952364497611, 4616)
-    femmesh.addNode(3.4487710816048414, -2.8556969458490458, 14.249723514281017, 4617)
-    femmesh.addNode(3.903916031599656, -2.191023665193853, 14.719871456092394, 4618)
-    femmesh.addNode(-4.114625018320447, 1.8217996704204817, 46.10014140215657, 4619)
-    femmesh.addNode(-4.259727327128207, 1.3807467405235112, 46.865648658391436, 4620)
-    femmesh.addNode(-3.8998873718095384, 2.2144460256625003, 46.874867644175836, 4621)
-    femmesh.addNode(3.9021859925133238, -2.1951297619909775, 13.811736035437828, 4622)
-    femmesh.addNode(3.9018214260773147, 2.185695356699287, 23.632556901194953, 4623)
-    femmesh.addNode(3.908532573184882, 2.1760420936509863, 24.519552125560264, 4624)
-    femmesh.addNode(4.242712294783174, 1.4865475102452013, 24.06859039607337, 4625)
-    femmesh.addNode(-2.278372255315103, 3.868381687811331, 23.186510070364566, 4626)
-    femmesh.addNode(-2.2639674888178405, 3.8753713275273367, 24.108454587919603, 4627)
-    femmesh.addNode(-1.5637524952899797, 4.200613166134525, 22.77722303597541, 4628)
-    femmesh.addNode(-1.5493477287927173, 4.207602805850531, 23.699167553530444, 4629)
-    femmesh.addNode(0.1770940231533355, -4.495651799207564, 44.363127251137115, 4630)
-    femmesh.addNode(-0.19391129026191783, -4.467528686759556, 43.37423035195626, 4631)
-    femmesh.addNode(-0.6438953267155518, -4.452540782689106, 44.23065378139028, 4632)
-    femmesh.addNode(2.9336276171014672, 3.4074509853599695, 45.231692347790016, 4633)
-    femmesh.addNode(-4.206260364671991, -1.5220948516946475, 34.59435319820694, 4634)
-    femmesh.addNode(-4.116791569639434, -1.692548319359764, 35.76972607212481, 4635)
-    femmesh.addNode(-3.825282555953957, -2.3165743046374887, 35.03492174174106, 4636)
-    femmesh.addNode(-3.7358137609214017, -2.487027772302605, 36.21029461565893, 4637)
-    femmesh.addNode(-3.9989838452559923, -2.0528618864615504, 43.701754143279516, 4638)
-    femmesh.addNode(-4.29671475597267, -1.190438270940277, 43.6999927694426, 4639)
-    femmesh.addNode(-4.19371013289591, -1.6172051965768373, 42.874593625616235, 4640)
-    femmesh.addNode(-3.136047169353013, -3.199163951101445, 46.007471315574676, 4641)
-    femmesh.addNode(-2.445340369252457, -3.7590929819090775, 45.9900119256561, 4642)
-    femmesh.addNode(-0.0687720953272851, 4.490743315011966, 38.687630243476974, 4643)
-    femmesh.addNode(-0.8453273249704882, 4.399771679192185, 39.07114347031329, 4644)
-    femmesh.addNode(-0.12516030397844125, 4.492385731726432, 39.5862938914634, 4645)
-    femmesh.addNode(4.22161460429543, -1.5469266357814764, 5.364919040152948, 4646)
-    femmesh.addNode(4.362667897164497, -0.8171905577699083, 4.907773779785185, 4647)
-    femmesh.addNode(4.377726076992707, -0.7722814919372805, 5.842847884339298, 4648)
-    femmesh.addNode(-3.0229188955782593, -3.2622561138241797, 17.04286498398382, 4649)
-    femmesh.addNode(-3.0053012599642397, -3.284976202493402, 16.14239192214766, 4650)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 5.4, 4651)
-    femmesh.addNode(-2.301107700651045, -3.8551451480709633, 14.851391729269826, 4652)
-    femmesh.addNode(-2.325823075073358, -3.838064963151, 15.781320739745944, 4653)
-    femmesh.addNode(1.6105808575816516, 4.201726989772717, 34.11357557882569, 4654)
-    femmesh.addNode(1.5972970826281876, 4.20665826761228, 35.00418550131957, 4655)
-    femmesh.addNode(0.8369378816428501, 4.358359149735103, 34.55269888824997, 4656)
-    femmesh.addNode(-0.2257868336184436, 4.492827712415377, 4.601848502952823, 4657)
-    femmesh.addNode(0.8187097580461765, 4.364391776411462, 18.688901953546022, 4658)
-    femmesh.addNode(1.5778995552522748, 4.21412222853548, 18.26985292776437, 4659)
-    femmesh.addNode(2.0830432589651102, 3.9888063132641483, 49.17104567396785, 4660)
-    femmesh.addNode(-4.448964669713642, -0.3694608653262937, 16.724144205298494, 4661)
-    femmesh.addNode(-4.308013871212729, -1.2748128401087988, 16.51522350520932, 4662)
-    femmesh.addNode(-2.590873350990139, -3.638349412611866, 35.83405821244121, 4663)
-    femmesh.addNode(-2.4366661271208914, -3.765079846172198, 36.8400708277415, 4664)
-    femmesh.addNode(-3.2317288454926087, -3.107314868427973, 35.40920860527178, 4665)
-    femmesh.addNode(-3.0775216216233616, -3.2340453019883055, 36.41522122057208, 4666)
-    femmesh.addNode(2.9352761900664883, -3.40346165909011, 14.67709069482948, 4667)
-    femmesh.addNode(-2.5847528031417473, -3.6415407454267026, 34.94710314776067, 4668)
-    femmesh.addNode(-3.2346629157869433, -3.103596564018085, 34.49733458531398, 4669)
-    femmesh.addNode(-4.449524822457104, 0.512494668054435, 45.303112937001686, 4670)
-    femmesh.addNode(-4.242486224057834, 1.440576960786549, 45.313755626243, 4671)
-    femmesh.addNode(-3.073543944889016, -3.2390573984636513, 37.32667661332306, 4672)
-    femmesh.addNode(4.2205024766170185, -1.550943300194435, 44.64139117316668, 4673)
-    femmesh.addNode(4.233059820244378, -1.511519153267122, 43.70484300015195, 4674)
-    femmesh.addNode(-0.14015320817138843, -4.495701400895587, 37.02711160243871, 4675)
-    femmesh.addNode(-0.12831120166778687, -4.496442196945204, 36.13664792067049, 4676)
-    femmesh.addNode(0.69809720599188, -4.3706773192900155, 36.57276175514449, 4677)
-    femmesh.addNode(0.30831246369430126, 4.4842389069472475, 47.56567839100768, 4678)
-    femmesh.addNode(-0.14523502252792297, 4.493622636908335, 48.39708672614981, 4679)
-    femmesh.addNode(3.463003276469532, -2.8351659002739757, 42.83652538008924, 4680)
-    femmesh.addNode(2.904619897405225, -3.4270610100931496, 42.499323748893396, 4681)
-    femmesh.addNode(-3.5734613841733904, 2.7342058726144325, 34.34351356963941, 4682)
-    femmesh.addNode(-3.8656773806300846, -2.171653826148697, 39.065613733881406, 4683)
-    femmesh.addNode(-3.7068271232330883, -2.5142678060180303, 39.87340029922633, 4684)
-    femmesh.addNode(-4.199411700407604, -1.6164573966114353, 39.691436515368906, 4685)
-    femmesh.addNode(1.5143631575904983, -4.2293475980501585, 7.470184608372376, 4686)
-    femmesh.addNode(0.8476618614426182, -4.390367787923883, 6.958917220557148, 4687)
-    femmesh.addNode(1.5878064836883756, -4.195709816876055, 6.688292693221404, 4688)
-    femmesh.addNode(4.2145852262236865, -1.5667755694810532, 23.128387812358504, 4689)
-    femmesh.addNode(4.373019822835224, -0.7866237476907761, 23.608502626307683, 4690)
-    femmesh.addNode(-3.9577953166701434, 1.9457122968349811, 35.67372632747431, 4691)
-    femmesh.addNode(2.2909192627731962, -3.857667575524311, 7.161290729994304, 4692)
-    femmesh.addNode(2.2737675296534112, -3.869418486474684, 6.058151529316656, 4693)
-    femmesh.addNode(3.918225662018233, -2.1692379711784335, 43.266244781539804, 4694)
-    femmesh.addNode(2.2511962590860564, 3.7790217677845694, 19.59873528456057, 4695)
-    femmesh.addNode(2.931720812207911, 3.404132159587197, 19.16653544434474, 4696)
-    femmesh.addNode(2.932298890553672, 3.4036837969787443, 20.049162484579735, 4697)
-    femmesh.addNode(0.7885269845029523, 4.3760636686390235, 38.26389909602189, 4698)
-    femmesh.addNode(-3.9008267627269158, 2.1885431034099883, 1.5789441987643058, 4699)
-    femmesh.addNode(-3.669127997691299, 2.60438570592039, 2.39885442919227, 4700)
-    femmesh.addNode(-0.44846961359524096, 4.454596996125191, 6.131802055157628, 4701)
-    femmesh.addNode(-0.4886118335270707, 4.4546961883967615, 6.933448941571674, 4702)
-    femmesh.addNode(-1.213737995122254, 4.3127151472612235, 6.56255346663053, 4703)
-    femmesh.addNode(4.33914252647224, -0.7858465291145001, 35.177145842177126, 4704)
-    femmesh.addNode(4.210085560414674, -1.5787078850903398, 34.79881271330693, 4705)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 34.725, 4706)
-    femmesh.addNode(4.370943033942433, -0.7928613559758408, 34.346666871129806, 4707)
-    femmesh.addNode(-2.074123232979942, -3.9934954749795466, 30.426559891029132, 4708)
-    femmesh.addNode(-2.2598173713532184, -3.886839801618014, 29.29491177845363, 4709)
-    femmesh.addNode(-1.375990341014566, -4.2329064543353905, 29.689505922525427, 4710)
-    femmesh.addNode(3.439784065396864, 2.864419889815954, 37.412926042943084, 4711)
-    femmesh.addNode(3.4289903271028144, 2.879985046295676, 38.30367088290947, 4712)
-    femmesh.addNode(3.9062436532397067, 2.1852610315878502, 37.89864360699184, 4713)
-    femmesh.addNode(3.895449914945657, 2.2008261880675724, 38.78938844695823, 4714)
-    femmesh.addNode(4.211613142783921, -1.5741251440328994, 35.67976936904537, 4715)
-    femmesh.addNode(3.080569679123144, 3.24562909027271, 31.657288937961678, 4716)
-    femmesh.addNode(2.3766227349086044, 3.7883492626298017, 32.53777678723935, 4717)
-    femmesh.addNode(2.386188121103621, 3.7808907299529153, 31.64589251245672, 4718)
-    femmesh.addNode(-4.41938825041146, -0.011741803163472564, 13.89644931239809, 4719)
-    femmesh.addNode(3.7832079886040404, -2.335951585939366, 47.00911028517109, 4720)
-    femmesh.addNode(3.9637068115568717, -2.088427242273247, 47.9996144141294, 4721)
-    femmesh.addNode(4.40464253598381, 0.6838817691219368, 4.911769778542345, 4722)
-    femmesh.addNode(-1.9122642392319391, 4.073296816342954, 45.29085150276559, 4723)
-    femmesh.addNode(-2.3144121144891145, 3.8407569407445363, 46.060827063615534, 4724)
-    femmesh.addNode(-1.4902224980179106, 4.223312933064017, 46.03863240946944, 4725)
-    femmesh.addNode(-1.8659081180923247, 3.9942550282433826, 46.81950426976964, 4726)
-    femmesh.addNode(-3.545739846210515, 2.7701463120772423, 22.307120033511296, 4727)
-    femmesh.addNode(-3.5388686370544926, 2.779131270548115, 21.41473409068555, 4728)
-    femmesh.addNode(-2.980764503211947, 3.3105565802152226, 21.888433594017812, 4729)
-    femmesh.addNode(4.222820391420437, 1.5456636487319493, 9.864893588447478, 4730)
-    femmesh.addNode(3.8590345736329352, 2.2699446679516995, 4.682918401159086, 4731)
-    femmesh.addNode(4.231691515248947, 1.4974492385835796, 4.41531222119937, 4732)
-    femmesh.addNode(2.902140837189049, 3.4308152984005873, 37.85726626055589, 4733)
-    femmesh.addNode(2.914926308341145, 3.4209366743271485, 36.966243069702784, 4734)
-    femmesh.addNode(2.22739672798033, 3.7996068618062018, 37.410642856413816, 4735)
-    femmesh.addNode(2.231172785971146, 3.8482302303397464, 36.41747631623643, 4736)
-    femmesh.addNode(1.5436432056103309, 4.2269004178188, 36.861876102947456, 4737)
-    femmesh.addNode(-2.9746943189375017, 3.321911191408429, 33.836938940675225, 4738)
-    femmesh.addNode(3.7836710028096445, -2.271832023630884, 3.182749788138932, 4739)
-    femmesh.addNode(4.26074073900193, -1.4475233961015084, 3.624689204137977, 4740)
-    femmesh.addNode(3.3559609992610007, -2.9972399878789426, 3.2041042452830473, 4741)
-    femmesh.addNode(-0.8779619277855278, -4.373191879586128, 18.658772351176317, 4742)
-    femmesh.addNode(-0.8937639949594706, -4.372343247243086, 19.55164779670023, 4743)
-    femmesh.addNode(-0.095264855363727, -4.496603059281531, 19.07846514654393, 4744)
-    femmesh.addNode(3.9746218997816403, 2.103703611707339, 49.24776567845932, 4745)
-    femmesh.addNode(2.264752957368836, 3.775132490217681, 14.30512102810955, 4746)
-    femmesh.addNode(4.36507973840275, -0.8101838254351774, 30.743778684984115, 4747)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 31.225, 4748)
-    femmesh.addNode(3.9409372272333743, -2.0714105957343247, 2.2034773051762886, 4749)
-    femmesh.addNode(1.439250155194675, -4.222610330728116, 46.83249496873264, 4750)
-    femmesh.addNode(0.9752818933997843, -4.390492175452714, 46.04143363298814, 4751)
-    femmesh.addNode(0.5518691785263947, -4.459875230821126, 46.845149076166194, 4752)
-    femmesh.addNode(-4.4177163389462475, -0.8351078103279602, 44.46027666072821, 4753)
-    femmesh.addNode(-4.44439410550608, -0.39384879524039973, 45.27346534079891, 4754)
-    femmesh.addNode(4.2287980736379245, 1.5201049824907096, 16.923190443475903, 4755)
-    femmesh.addNode(4.389960743327161, 0.7335445762563342, 17.37191800795729, 4756)
-    femmesh.addNode(4.2274853765764355, 1.5243683155652419, 17.799810065231114, 4757)
-    femmesh.addNode(4.388648046265672, 0.7378079093308665, 18.2485376297125, 4758)
-    femmesh.addNode(4.378826367081384, -0.7688856321185791, 19.124799684076194, 4759)
-    femmesh.addNode(4.378826367081384, -0.7688856321185791, 18.224799684076192, 4760)
-    femmesh.addNode(4.21960422771124, -1.5508938595784727, 18.68803611773854, 4761)
-    femmesh.addNode(-3.8701369075641736, 2.255081923241324, 4.740845780486354, 4762)
-    femmesh.addNode(-4.219768465815806, 1.4683809177200415, 4.79012434924482, 4763)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 18.674999999999997, 4764)
-    femmesh.addNode(0.4915909153751217, 4.4480511449852695, 8.227615891939495, 4765)
-    femmesh.addNode(-0.5028446060036535, 4.451908070703068, 7.77071542069353, 4766)
-    femmesh.addNode(0.45783162619697354, 4.447510756373889, 9.040565247841183, 4767)
-    femmesh.addNode(-0.5366038951818016, 4.451367682091687, 8.583664776595219, 4768)
-    femmesh.addNode(1.829563443837839, -4.102369378844838, 28.490033383281002, 4769)
-    femmesh.addNode(2.517032470076658, -3.675227741808407, 28.92434940033035, 4770)
-    femmesh.addNode(2.3326856130706215, -3.761738469984348, 27.84463245867335, 4771)
-    femmesh.addNode(3.0201546393094407, -3.334596832947917, 28.278948475722693, 4772)
-    femmesh.addNode(2.2506282275028275, 3.8420708987518513, 18.722627337425287, 4773)
-    femmesh.addNode(1.5701036743809729, 4.216960506949224, 19.154827177641113, 4774)
-    femmesh.addNode(0.7779052771912057, 4.349219417351103, 19.63544761493803, 4775)
-    femmesh.addNode(0.02651136085640922, 4.496650686813339, 19.169522390842943, 4776)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 37.45, 4777)
-    femmesh.addNode(-0.754063086177703, 4.404223386846686, 20.4718177682363, 4778)
-    femmesh.addNode(-0.749723831350824, 4.405446854596434, 19.589106747022463, 4779)
-    femmesh.addNode(0.030268769380706786, 4.496497480484363, 20.061432553976715, 4780)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 48.224999999999994, 4781)
-    femmesh.addNode(3.907587642663632, 2.176437571428701, 26.31309815478373, 4782)
-    femmesh.addNode(3.909483672249471, 2.1737005055746508, 25.422774144888542, 4783)
-    femmesh.addNode(1.8293078829348142, -4.102463285350124, 29.368203494327304, 4784)
-    femmesh.addNode(2.5196105132645457, -3.6727745468734287, 29.841922665336845, 4785)
-    femmesh.addNode(2.2603448754189692, 3.777490114848909, 16.04562069423044, 4786)
-    femmesh.addNode(2.9201071557191938, 3.413704617668844, 16.49590932116523, 4787)
-    femmesh.addNode(3.8518322899297965, -2.267024205359544, 36.15530911591599, 4788)
-    femmesh.addNode(3.8500665097487143, -2.271169636550548, 35.241670707352505, 4789)
-    femmesh.addNode(4.372470616311681, -0.7882786149184002, 36.15262352686824, 4790)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 36.575, 4791)
-    femmesh.addNode(-2.359709681007036, -3.713495172341263, 10.860175542386576, 4792)
-    femmesh.addNode(0.613996831771511, -4.386604586734423, 35.652271162331864, 4793)
-    femmesh.addNode(1.4404052394311777, -4.260839709079234, 36.088384996805864, 4794)
-    femmesh.addNode(3.8696768107764528, -2.2395656742242283, 38.85244060249929, 4795)
-    femmesh.addNode(3.422809749614675, -2.8962107990462753, 38.41102902314502, 4796)
-    femmesh.addNode(-1.4982998705682202, -4.223354066238881, 13.659902649019251, 4797)
-    femmesh.addNode(3.4653014725163427, 2.840146785934477, 13.414587030010777, 4798)
-    femmesh.addNode(3.4428303594052228, 2.8647315362418047, 35.58701102215031, 4799)
-    femmesh.addNode(3.8954200894178257, 2.2048366406771787, 36.10080711132546, 4800)
-    femmesh.addNode(3.8951197775660353, 2.205547035791131, 35.19620008134568, 4801)
-    femmesh.addNode(-2.2749247114992657, 3.869935131221503, 36.23677271387737, 4802)
-    femmesh.addNode(-2.338999322218384, 3.8372717109769674, 37.19229207262535, 4803)
-    femmesh.addNode(4.384333692652287, 0.751633449284363, 36.13085639342863, 4804)
-    femmesh.addNode(4.226641502468745, 1.530030477727617, 36.53354929562403, 4805)
-    femmesh.addNode(4.342307809816457, 0.7783970284432528, 36.97769290219539, 4806)
-    femmesh.addNode(-0.6806315167584415, -4.447705299748917, 42.59300190168216, 4807)
-    femmesh.addNode(2.83211714060681, -3.4823324065130508, 35.260910914741125, 4808)
-    femmesh.addNode(3.3922449264497683, -2.931681448909848, 35.69581566945699, 4809)
-    femmesh.addNode(2.843996024722933, -3.473815272166474, 36.17846770745176, 4810)
-    femmesh.addNode(3.9160183062763454, -2.1744881602671216, 42.36843991901222, 4811)
-    femmesh.addNode(4.23085246450249, -1.51676934235581, 42.80703813762436, 4812)
-    femmesh.addNode(-2.8586866508255393, -3.356386700351564, 30.010406749729487, 4813)
-    femmesh.addNode(4.216707130614098, -1.5576785701171438, 17.761551674719524, 4814)
-    femmesh.addNode(-4.397083436274732, 0.9519782561319998, 0.7542630508344568, 4815)
-    femmesh.addNode(4.375721971590555, -0.7784247643169415, 45.10577451487335, 4816)
-    femmesh.addNode(4.375721971590555, -0.7784247643169415, 45.93077451487335, 4817)
-    femmesh.addNode(4.236429638303879, -1.5117507348336392, 45.49573590788323, 4818)
-    femmesh.addNode(-4.0611291665609945, 1.938269109544581, 5.54955878188775, 4819)
-    femmesh.addNode(-4.210841892165058, 1.5350095146995755, 6.358684819265273, 4820)
-    femmesh.addNode(-4.296591859056184, 1.017812297777444, 5.493424357705317, 4821)
-    femmesh.addNode(3.8327436807538984, -2.2943406251078646, 34.33897366406498, 4822)
-    femmesh.addNode(-2.416256123775391, -3.7750291933777302, 5.448159298570383, 4823)
-    femmesh.addNode(-2.753005907706894, -3.5593624656345115, 6.28749805862801, 4824)
-    femmesh.addNode(-3.137126968137313, -3.197613582482341, 5.473398544459873, 4825)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 6.324999999999999, 4826)
-    femmesh.addNode(1.516950907643631, -4.210064083517004, 1.6451169286371594, 4827)
-    femmesh.addNode(1.119316472832589, 4.3549346534869855, 0.7808424953057017, 4828)
-    femmesh.addNode(4.224471169172433, -1.5366007668407304, 41.03111867903767, 4829)
-    femmesh.addNode(4.341947787837383, -0.7792485783631378, 40.509698178993446, 4830)
-    femmesh.addNode(4.221165123726285, -1.5469235542518345, 40.11873108142595, 4831)
-    femmesh.addNode(-3.08934338704256, 3.2647539800224, 49.20867852789347, 4832)
-    femmesh.addNode(-0.02565220908652438, -4.496510747909467, 16.36529793635648, 4833)
-    femmesh.addNode(-4.352502014475018, -1.133742736381903, 26.463546468095547, 4834)
-    femmesh.addNode(4.389496933480121, -0.7350540149465887, 14.742392812034154, 4835)
-    femmesh.addNode(4.231715853069373, -1.5136613950216886, 14.262878521498688, 4836)
-    femmesh.addNode(4.229249932968379, -1.5216302203473302, 13.402026584863552, 4837)
-    femmesh.addNode(-0.6482720112949951, 4.437111700762241, 49.227696180106534, 4838)
-    femmesh.addNode(0.3277818949567976, 4.481980913399976, 49.169390546043275, 4839)
-    femmesh.addNode(4.2345322769669975, 1.5065619481734103, 16.039211871999044, 4840)
-    femmesh.addNode(3.8942686855035715, 2.209656307461786, 16.490732782648617, 4841)
-    femmesh.addNode(3.8871058028440326, 2.217013165732104, 34.30891738913265, 4842)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 41.0, 4843)
-    femmesh.addNode(4.341609259275797, 0.7800482909087421, 40.55341208986151, 4844)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 24.950000000000003, 4845)
-    femmesh.addNode(0.15585847325285426, -4.495678673064949, 6.602956669895001, 4846)
-    femmesh.addNode(0.0211553939264027, -4.493483333237969, 7.399604972285923, 4847)
-    femmesh.addNode(-4.116865824829332, 1.8166398951731728, 47.6461623967587, 4848)
-    femmesh.addNode(-2.918604220529152, -3.336486952411246, 28.805001708129552, 4849)
-    femmesh.addNode(-3.0452968864281793, -3.2507767111530788, 27.671460777364327, 4850)
-    femmesh.addNode(0.9336134823984661, -4.36532443402692, 28.140437883107424, 4851)
-    femmesh.addNode(0.9333579214954413, -4.365418340532207, 29.018607994153726, 4852)
-    femmesh.addNode(0.20106778203113682, -4.49458074728088, 0.8099271105709318, 4853)
-    femmesh.addNode(-0.746211343320776, -4.431269021775963, 0.8220537632622735, 4854)
-    femmesh.addNode(-0.25357833821415815, -4.4817292024130095, 1.6319808738332053, 4855)
-    femmesh.addNode(-0.8023148067499065, -4.396458985858276, 15.892768480694741, 4856)
-    femmesh.addNode(-1.6207924822210757, -4.176282598729747, 16.28153061955556, 4857)
-    femmesh.addNode(4.376983698869483, 0.774563422392736, 8.486572751017011, 4858)
-    femmesh.addNode(4.3752851742659455, 0.77975659081049, 9.380358483714145, 4859)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 19.575, 4860)
-    femmesh.addNode(-4.256357521941451, 1.3805524401049012, 48.40180083865947, 4861)
-    femmesh.addNode(-4.399219024240326, 0.9446592854552398, 47.6212871002922, 4862)
-    femmesh.addNode(-1.9014691149100627, 4.071178863491648, 4.566375125036775, 4863)
-    femmesh.addNode(-1.5389242453690548, 4.1881176039802686, 3.778703774368984, 4864)
-    femmesh.addNode(-3.9169954066434656, 2.009654806608979, 19.190017169089444, 4865)
-    femmesh.addNode(-3.534552699975116, 2.7849029924308484, 19.594493613516047, 4866)
-    femmesh.addNode(4.215586017165433, -1.5611229464186644, 6.228379615567896, 4867)
-    femmesh.addNode(-2.305926858944711, 3.8464958938057903, 9.298050131038396, 4868)
-    femmesh.addNode(-2.770790068640399, -3.433942700166024, 45.21363763316925, 4869)
-    femmesh.addNode(-2.0790836802408, -3.989381340843277, 45.18128789296627, 4870)
-    femmesh.addNode(2.278123550547333, 3.8305635679260304, 26.830629713882715, 4871)
-    femmesh.addNode(2.9389284510702134, 3.3974219212137307, 27.246682065929235, 4872)
-    femmesh.addNode(-1.0112579462168503, -4.273392230198217, 34.706690377892656, 4873)
-    femmesh.addNode(-1.9122936457658821, -4.070333655799515, 34.240306415481896, 4874)
-    femmesh.addNode(-0.20678612704449367, -4.494958718585605, 34.26037417137638, 4875)
-    femmesh.addNode(-1.1078218265935256, -4.2919001441869025, 33.793990208965624, 4876)
-    femmesh.addNode(0.05517580729084636, 4.49715498898096, 27.309010593005063, 4877)
-    femmesh.addNode(0.04202769710155598, 4.497674478887004, 26.419792443982182, 4878)
-    femmesh.addNode(-2.1821822939277156, -3.9335999670099078, 38.65219157256558, 4879)
-    femmesh.addNode(-1.4895036361689673, -4.2110156364308065, 38.773283659946415, 4880)
-    femmesh.addNode(-1.6501460660845773, -4.167517752902039, 38.00028391921248, 4881)
-    femmesh.addNode(-1.5482713111976163, 4.206558613874162, 30.14372170849432, 4882)
-    femmesh.addNode(-1.5518814015263107, 4.2055423347209935, 29.228949144349833, 4883)
-    femmesh.addNode(-2.2723319667449107, 3.871021137402842, 29.661827163387663, 4884)
-    femmesh.addNode(-3.3902708641273476, 2.9413753165967167, 1.5926228512512879, 4885)
-    femmesh.addNode(4.241170594763737, 1.4905436537274084, 21.37262830945727, 4886)
-    femmesh.addNode(4.240263687416059, 1.4934916657601587, 20.485288330439026, 4887)
-    femmesh.addNode(0.7759400060275801, -4.3735668547859206, 38.38949023794075, 4888)
-    femmesh.addNode(0.6525838411362476, -4.367593516787583, 39.389672178336596, 4889)
-    femmesh.addNode(-0.0568487549772988, -4.494080835578396, 38.84338058202084, 4890)
-    femmesh.addNode(-0.9653898784260465, 4.36279479722039, 39.94678869536607, 4891)
-    femmesh.addNode(1.107545576973637, -4.361551206025008, 0.8475195573743507, 4892)
-    femmesh.addNode(3.4532282379444217, -2.863361706487697, 10.677980175614916, 4893)
-    femmesh.addNode(2.863045594718663, -3.4496316787993084, 10.193743643774907, 4894)
-    femmesh.addNode(2.9025065050330516, -3.421182352025399, 11.115355010235884, 4895)
-    femmesh.addNode(3.444072786828372, -2.853215195792022, 41.92669746862654, 4896)
-    femmesh.addNode(3.902066554731638, 2.1952223220999696, 36.991418242276275, 4897)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 39.225, 4898)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 38.35, 4899)
-    femmesh.addNode(-3.4327263051558576, -2.8353529907411716, 9.34778089299713, 4900)
-    femmesh.addNode(-3.929433644143606, -2.1759368729623816, 9.502105808527215, 4901)
-    femmesh.addNode(-3.1505444965371954, -3.2041426192287688, 8.546776524318664, 4902)
-    femmesh.addNode(-3.647251835524944, -2.544726501449979, 8.701101439848749, 4903)
-    femmesh.addNode(-3.716112381855869, 2.339488350744206, 42.2794472126421, 4904)
-    femmesh.addNode(-4.070798807212779, 1.9062738790198335, 42.96754504350872, 4905)
-    femmesh.addNode(-3.578757433792843, 2.6618426640492934, 43.059538668061734, 4906)
-    femmesh.addNode(3.389986730474876, -2.940313680507956, 32.98890885966, 4907)
-    femmesh.addNode(2.8407423001070704, -3.4723669753107083, 32.55516361969568, 4908)
-    femmesh.addNode(1.4902992348178543, -4.245435378468436, 37.9509060701119, 4909)
-    femmesh.addNode(-1.505601384315778, 4.215830619284684, 47.61166561063875, 4910)
-    femmesh.addNode(-2.329791000786982, 3.8332746269652027, 47.63386026478484, 4911)
-    femmesh.addNode(-1.9545721096092932, 4.053229770841016, 48.43623817724876, 4912)
-    femmesh.addNode(-3.8282166262482917, -2.3128560002276, 34.12304772178326, 4913)
-    femmesh.addNode(-3.3704590290666157, -2.973096909423233, 33.405653524739556, 4914)
-    femmesh.addNode(-1.5643431094624538, 4.201290042054539, 35.82278424917777, 4915)
-    femmesh.addNode(-1.57717588283289, 4.194979482823053, 34.83166155701484, 4916)
-    femmesh.addNode(-2.307841511926638, 3.8473292646860635, 35.35783682955467, 4917)
-    femmesh.addNode(3.5339322573376273, 2.751306059355422, 46.320358904224264, 4918)
-    femmesh.addNode(-3.90666534447074, 2.1136515720264337, 20.018977977974153, 4919)
-    femmesh.addNode(-4.28910805113909, 1.338403386204564, 19.614501533547546, 4920)
-    femmesh.addNode(-3.565440274707571, 2.745459293848041, 39.00281789798703, 4921)
-    femmesh.addNode(-2.9228538955189465, 3.329977338120724, 39.13835657344775, 4922)
-    femmesh.addNode(-0.13783179270553977, -4.495750739481013, 20.95321519976455, 4923)
-    femmesh.addNode(-0.9334595898925477, -4.363176285285982, 21.427593964057973, 4924)
-    femmesh.addNode(3.4555285872421724, 2.8511619360709144, 20.49364303756441, 4925)
-    femmesh.addNode(3.9069296463254712, 2.179640667354369, 20.933985826906476, 4926)
-    femmesh.addNode(3.4632159699375746, 2.839989657679337, 19.606253974408226, 4927)
-    femmesh.addNode(3.9146170290208735, 2.1684683889627916, 20.046596763750287, 4928)
-    femmesh.addNode(0.785708099703168, 4.373287869582491, 36.409265541617586, 4929)
-    femmesh.addNode(1.5596747705403884, 4.22106276357681, 35.98122551788981, 4930)
-    femmesh.addNode(-1.615798974387637, 4.172204112538719, 38.47572626273297, 4931)
-    femmesh.addNode(-1.7224064622543582, 4.111145798913144, 39.45245608244612, 4932)
-    femmesh.addNode(-2.2755757346220986, 3.87870211118181, 38.79894153185905, 4933)
-    femmesh.addNode(-2.3821832224888198, 3.817643797556235, 39.7756713515722, 4934)
-    femmesh.addNode(-4.49876054361278, 0.038764124086540196, 46.06407296245229, 4935)
-    femmesh.addNode(-4.470537947569682, -0.4126498809529906, 46.81174614757217, 4936)
-    femmesh.addNode(-4.416171509462981, -0.8452628002799305, 46.021138525918786, 4937)
-    femmesh.addNode(-3.9770549089106746, -1.8951826565051084, 14.976901302810987, 4938)
-    femmesh.addNode(-4.021357828098507, -1.8321405473464458, 13.900307493122298, 4939)
-    femmesh.addNode(3.412441912527311, 2.900616359696585, 40.12834182989672, 4940)
-    femmesh.addNode(3.4229106549073363, 2.885756665360736, 39.23970490166327, 4941)
-    femmesh.addNode(0.12221816011719283, -4.4947647662098165, 49.21934799139072, 4942)
-    femmesh.addNode(-0.3418272565234666, -4.480767987859185, 48.41477739592791, 4943)
-    femmesh.addNode(-0.7556106397161404, -4.430123788293201, 49.195429404537194, 4944)
-    femmesh.addNode(-2.9262251240525403, 3.362784837915704, 23.68609717204697, 4945)
-    femmesh.addNode(-2.91227107696057, 3.379132753409345, 24.60222204011032, 4946)
-    femmesh.addNode(-1.0579524706767134, 4.288528916238594, 48.45040637160267, 4947)
-    femmesh.addNode(-0.5940695879820561, 4.449509317516775, 47.63605037658746, 4948)
-    femmesh.addNode(-4.331703555005349, -1.1034681358932703, 40.50257410306509, 4949)
-    femmesh.addNode(0.30038691546410334, 4.474188561419991, 44.49400991670802, 4950)
-    femmesh.addNode(-3.8051550526086615, 2.3849232885666263, 8.946607886438397, 4951)
-    femmesh.addNode(-3.3620300809057406, 2.968266005683679, 9.934715119959353, 4952)
-    femmesh.addNode(-4.012774240790767, 1.8859345177451856, 9.747850468845137, 4953)
-    femmesh.addNode(-3.8021881829530546, 2.4054020250387866, 40.750527987010294, 4954)
-    femmesh.addNode(-3.2751506793406486, 2.9844389405203717, 40.71305586490858, 4955)
-    femmesh.addNode(-3.888171939665777, 2.2012843094563457, 48.41842308584586, 4956)
-    femmesh.addNode(-4.459288738499195, 0.5067571653028519, 48.42893727948881, 4957)
-    femmesh.addNode(-4.394891614003291, 0.9632534115879465, 49.20524991534495, 4958)
-    femmesh.addNode(2.1789489753405853, -3.8052297827452257, 25.14896480083705, 4959)
-    femmesh.addNode(2.901202680548547, -3.427869565487927, 25.561735433735418, 4960)
-    femmesh.addNode(0.8236569243330284, 4.340608101373032, 28.716934165225524, 4961)
-    femmesh.addNode(-2.7525223922674833, -3.5087046326432394, 12.557385581366496, 4962)
-    femmesh.addNode(-2.235881892216384, 3.8882444446259417, 28.685171242336747, 4963)
-    femmesh.addNode(4.3420074979646675, 0.7791074235572053, 35.14808587221561, 4964)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 35.65, 4965)
-    femmesh.addNode(2.261823390861382, -3.8319788917608957, 15.096754018395362, 4966)
-    femmesh.addNode(2.9448636010465945, -3.394147730820027, 15.586945056316619, 4967)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 9.825, 4968)
-    femmesh.addNode(-1.187758742040682, -4.336119788811386, 3.1038105526375626, 4969)
-    femmesh.addNode(2.222465207655058, -3.8713566715844703, 11.539115983026106, 4970)
-    femmesh.addNode(2.24831739641796, -3.8608385365840343, 10.643894888324443, 4971)
-    femmesh.addNode(2.1341300523324107, -3.8903912069879785, 42.06821058643986, 4972)
-    femmesh.addNode(0.8474746842921766, -4.3674429938204335, 43.71151294777789, 4973)
-    femmesh.addNode(0.76117544549771, -4.397734504445342, 42.77757924931434, 4974)
-    femmesh.addNode(-4.324800477649156, 1.2348767358696253, 33.36235366845588, 4975)
-    femmesh.addNode(-4.342784344547078, 1.1756248223990111, 34.25367990482363, 4976)
-    femmesh.addNode(-4.437791628960924, 0.33882554875355053, 33.74082162840482, 4977)
-    femmesh.addNode(-0.7837249425578038, -4.335063601024543, 11.528414031935974, 4978)
-    femmesh.addNode(-0.053517462929343854, -4.498915024939006, 11.987279894743974, 4979)
-    femmesh.addNode(-1.3402664711751568, -4.274961462149576, 12.046921908280543, 4980)
-    femmesh.addNode(3.4672818658392632, 2.840247195394647, 25.892736860488643, 4981)
-    femmesh.addNode(3.4691778954251022, 2.837510129540596, 25.00241285059345, 4982)
-    femmesh.addNode(-0.23250921138935127, -4.493903130758018, 33.1250209181721, 4983)
-    femmesh.addNode(-0.23841795567845972, -4.493547674194689, 32.22758866381994, 4984)
-    femmesh.addNode(-1.0427783175410272, -4.269314534517163, 32.6785538738815, 4985)
-    femmesh.addNode(1.6065765913966232, -4.203437563330839, 26.599011698287867, 4986)
-    femmesh.addNode(1.4928379795852258, -4.243915055768502, 25.578770168114055, 4987)
-    femmesh.addNode(0.7640785173054339, -4.368521022823403, 26.18958553160114, 4988)
-    femmesh.addNode(3.038970986148878, -3.3164884395560255, 27.36286125397599, 4989)
-    femmesh.addNode(2.8995689123227963, -3.429464359615433, 26.425715913054088, 4990)
-    femmesh.addNode(3.471529916059347, -2.8259296472328455, 26.772593874019236, 4991)
-    femmesh.addNode(1.5847684458479758, -4.211597114863391, 27.5149580150269, 4992)
-    femmesh.addNode(2.2910538189262324, -3.766347084435069, 27.03318681032954, 4993)
-    femmesh.addNode(-0.7351929490491026, 4.404095118206735, 23.20258492756509, 4994)
-    femmesh.addNode(1.6056520075086183, -4.198873206981985, 42.74993142275497, 4995)
-    femmesh.addNode(2.3761418525814326, -3.735543010087156, 43.18104458520851, 4996)
-    femmesh.addNode(-1.5842292435562295, 4.196786777962365, 15.491992807169256, 4997)
-    femmesh.addNode(-0.8053325696207114, 4.393560948404042, 15.907046581911732, 4998)
-    femmesh.addNode(-3.953068385979658, -2.146689093008179, 46.81969537590899, 4999)
-    femmesh.addNode(-4.25656360521525, -1.2816211314331203, 46.80456035351985, 5000)
-    femmesh.addNode(-4.151119136577719, -1.7099723669339673, 46.03456073622911, 5001)
-    femmesh.addNode(2.9557314174290332, -3.352085319441117, 1.451182842275303, 5002)
-    femmesh.addNode(2.9185106869177035, -3.393599435682418, 2.303833534768019, 5003)
-    femmesh.addNode(3.5504479541960596, -2.7553044437410814, 1.3721810698276877, 5004)
-    femmesh.addNode(3.51322722368473, -2.796818559982383, 2.2248317623204037, 5005)
-    femmesh.addNode(-3.727905598871164, -2.5011569958114874, 7.07268154240438, 5006)
-    femmesh.addNode(-3.0820001673064534, -3.2301079551626404, 7.0284093012374855, 5007)
-    femmesh.addNode(-3.4054494759659573, -2.936442493555057, 7.871233212169475, 5008)
-    femmesh.addNode(-3.0247696016774444, 3.2331257532835522, 39.64013267611148, 5009)
-    femmesh.addNode(-4.383729314296935, -0.9552979678524689, 10.539153162531623, 5010)
-    femmesh.addNode(-4.285020824837798, -1.2103406559694583, 9.577686930429095, 5011)
-    femmesh.addNode(-4.028142133602742, -1.9208941848453924, 10.463572040629742, 5012)
-    femmesh.addNode(-4.387588532865594, 0.9995240308895785, 46.07926288247786, 5013)
-    femmesh.addNode(1.4813539346741036, -4.225676284576885, 45.42000014781178, 5014)
-    femmesh.addNode(1.9453221964689944, -4.057794439852289, 46.21106148355628, 5015)
-    femmesh.addNode(-3.679155838305229, 2.587126390818991, 49.22187216253134, 5016)
-    femmesh.addNode(2.1555861663834097, -3.9030923226682037, 24.126632882917924, 5017)
-    femmesh.addNode(1.4725947196338174, -4.2514987246084734, 24.66146318783923, 5018)
-    femmesh.addNode(4.676171202316354, 0.3044561771844646, 49.62146853699903, 5019)
-    femmesh.addNode(1.6919512463030848, -4.1685816963570765, 43.68386512121852, 5020)
-    femmesh.addNode(-3.4855079110464646, -2.845838166100025, 38.14815042013073, 5021)
-    femmesh.addNode(-3.4455451067356653, -2.894439452295412, 39.01772201115426, 5022)
-    femmesh.addNode(4.235146795440277, 1.5024456934613444, 2.0116852503986786, 5023)
-    femmesh.addNode(4.197162178771304, 1.5868299460195, 0.7502042087578784, 5024)
-    femmesh.addNode(3.87140831230474, -2.2402743104264635, 19.144436086651176, 5025)
-    femmesh.addNode(3.4303822246766567, -2.8867950375133056, 19.584553794618124, 5026)
-    femmesh.addNode(-3.5566178194995275, -2.7175813322343414, 10.132584515546824, 5027)
-    femmesh.addNode(-2.2782457091732398, -3.8771312543766934, 28.41001619716212, 5028)
-    femmesh.addNode(2.978629006159455, 3.359247128569458, 30.86917975324282, 5029)
-    femmesh.addNode(1.3574039988224094, 4.280230046880797, 11.258302588792949, 5030)
-    femmesh.addNode(0.6437175909923989, 4.355008971819636, 11.85093140291583, 5031)
-    femmesh.addNode(1.5291914499656225, 4.230046993992852, 12.149828782896746, 5032)
-    femmesh.addNode(2.8490376611229857, -3.4694380997085164, 22.759691407691854, 5033)
-    femmesh.addNode(3.401312459009687, -2.9206149076608168, 23.194619274465246, 5034)
-    femmesh.addNode(4.376423300973579, -0.7762810667469832, 21.814015955269824, 5035)
-    femmesh.addNode(4.236341010281981, 1.507017138683213, 24.960327465708986, 5036)
-    femmesh.addNode(4.390207852785603, 0.7327389852341945, 24.51175645950461, 5037)
-    femmesh.addNode(2.7135381157829905, 3.589022085332952, 0.7512180966793525, 5038)
-    femmesh.addNode(-4.418860510806975, 0.7239742587326068, 8.021285767352287, 5039)
-    femmesh.addNode(-4.445955666237251, -0.2487894559550149, 8.022481183424611, 5040)
-    femmesh.addNode(-4.312217797983651, -1.2699061382460626, 4.745245118605097, 5041)
-    femmesh.addNode(-3.919119388499332, -2.0652435432016096, 4.744345623252746, 5042)
-    femmesh.addNode(-4.166485325371018, -1.6770723460738677, 5.518361561870741, 5043)
-    femmesh.addNode(-2.511146558102551, -3.695667304027004, 40.28813083133811, 5044)
-    femmesh.addNode(-1.775054030603628, -4.1286448829990805, 40.32094325579234, 5045)
-    femmesh.addNode(-2.15961591872977, -3.945058820396987, 39.508859400421976, 5046)
-    femmesh.addNode(3.4163084045480545, -2.9004507489928093, 18.663084397792467, 5047)
-    femmesh.addNode(2.908671036686788, -3.4218083267573336, 19.147901913308736, 5048)
-    femmesh.addNode(2.8945972165581852, -3.435464038236838, 18.22643251648308, 5049)
-    femmesh.addNode(3.413836282633717, 2.899296918446119, 41.05399310666219, 5050)
-    femmesh.addNode(3.9709815177615457, -2.091264268372101, 27.978576539530806, 5051)
-    femmesh.addNode(3.5274441377584047, -2.738843090433237, 27.5348316978559, 5052)
-    femmesh.addNode(3.5086277909189674, -2.7569514838251292, 28.4509189196026, 5053)
-    femmesh.addNode(3.890574265896928, 2.2124387410451813, 39.70788226990878, 5054)
-    femmesh.addNode(0.27445521900118636, -4.377911117434704, 41.99635079904024, 5055)
-    femmesh.addNode(-0.5086017300730719, -4.4694000461443215, 41.54479542127221, 5056)
-    femmesh.addNode(1.2996606738320537, -4.307352265718647, 41.81001867421691, 5057)
-    femmesh.addNode(0.5166037247577955, -4.3988411944282655, 41.358463296448875, 5058)
-    femmesh.addNode(-3.991078964247648, 1.992324755668219, 41.58033092959016, 5059)
-    femmesh.addNode(1.8485591830981556, -4.018311260156168, 5.47164495886709, 5060)
-    femmesh.addNode(1.4734066547576394, -4.250051143483975, 20.985216018679928, 5061)
-    femmesh.addNode(0.7067134013524262, -4.368034774020179, 20.512624089400177, 5062)
-    femmesh.addNode(3.4934863656064996, -2.8131452175281573, 6.234955270265997, 5063)
-    femmesh.addNode(2.8426574230356296, -3.45800160460834, 6.361845041328486, 5064)
-    femmesh.addNode(3.4450204698297133, -2.880696233640494, 7.0942485797802, 5065)
-    femmesh.addNode(2.3011715628061538, 3.817597041309642, 24.99437726144704, 5066)
-    femmesh.addNode(0.042227673445534686, 4.4975640133805905, 23.65409821298187, 5067)
-    femmesh.addNode(-0.7316995240337969, 4.405085235525513, 24.077190052143298, 5068)
-    femmesh.addNode(-4.335471806821676, 1.2056508091815594, 7.204460736582536, 5069)
-    femmesh.addNode(-4.405999302997157, 0.22787521089600477, 7.182010479946301, 5070)
-    femmesh.addNode(4.2695588113524385, 1.3466206752083703, 3.679812269854636, 5071)
-    femmesh.addNode(4.038634172450337, 1.9792822430164696, 3.7536429367676813, 5072)
-    femmesh.addNode(3.30418747669432, -3.043044603716184, 29.223264664479178, 5073)
-    femmesh.addNode(4.284762367492679, 1.3115810445504903, 2.712750868838411, 5074)
-    femmesh.addNode(4.053837728590578, 1.9442426123585896, 2.7865815357514565, 5075)
-    femmesh.addNode(1.6490548227850113, 4.1860793305442545, 29.180897078951666, 5076)
-    femmesh.addNode(1.6387499846325069, 4.189911349453699, 30.07259553123547, 5077)
-    femmesh.addNode(2.3060255409399417, 3.8192128552900115, 29.630550948871974, 5078)
-    femmesh.addNode(4.236037250280665, 1.5066505726144563, 28.53749454461596, 5079)
-    femmesh.addNode(4.235596521454879, 1.507725316589407, 29.44124323091357, 5080)
-    femmesh.addNode(4.385363798391776, 0.7483579018905067, 28.950882730679965, 5081)
-    femmesh.addNode(3.895130587869386, 2.205304521298812, 2.0116952216174844, 5082)
-    femmesh.addNode(1.6084434373330707, 4.202243825171374, 25.496022318005657, 5083)
-    femmesh.addNode(0.8119769861469165, 4.345262146556957, 25.062769395583608, 5084)
-    femmesh.addNode(0.8365281009958545, 4.35460592781481, 25.923937704488658, 5085)
-    femmesh.addNode(0.04006164980970032, 4.497624249200393, 25.49068478206661, 5086)
-    femmesh.addNode(-2.23648237138507, 3.89082845944725, 25.94813266059255, 5087)
-    femmesh.addNode(-2.8178487324815706, 3.352887366331507, 26.370166288408406, 5088)
-    femmesh.addNode(-2.25577564125546, 3.8778493022162897, 26.822718043154275, 5089)
-    femmesh.addNode(-3.731836084187056, -2.49203986877795, 37.12175000840991, 5090)
-    femmesh.addNode(0.8784509993465031, 4.3425280120669, 29.616669041069454, 5091)
-    femmesh.addNode(0.07208168393123501, 4.497469291705098, 30.192796718589115, 5092)
-    femmesh.addNode(4.54864043310125, -1.0472986891498361, 0.4458685054044098, 5093)
-    femmesh.addNode(-3.357101366792228, 2.987791953438607, 45.33615570890585, 5094)
-    femmesh.addNode(-3.0498817749098466, 3.298640572926642, 46.10246139382252, 5095)
-    femmesh.addNode(-2.6568149239644607, 3.54791062508723, 45.30940816370875, 5096)
-    femmesh.addNode(1.710318642983178, 4.158277119596767, 32.08857481935099, 5097)
-    femmesh.addNode(2.5107255727344593, -3.727718004857852, 47.777313351385395, 5098)
-    femmesh.addNode(1.4352601353213412, -4.253809223644348, 48.4119684592951, 5099)
-    femmesh.addNode(1.6755546618398394, -4.131889346394835, 47.7658583304309, 5100)
-    femmesh.addNode(-2.7074789654345, 3.5914868885839484, 46.8538802937293, 5101)
-    femmesh.addNode(-3.0116911947025025, 3.3288730897584253, 44.64029276893596, 5102)
-    femmesh.addNode(2.1389336732349817, 3.9297227905711503, 9.071325116373238, 5103)
-    femmesh.addNode(2.813934473254453, 3.4857201138686404, 9.45460045253592, 5104)
-    femmesh.addNode(2.146433656989478, 3.926723189738829, 9.930493979665584, 5105)
-    femmesh.addNode(1.3611120767538627, 4.278742618335638, 10.40077986619028, 5106)
-    femmesh.addNode(0.5785051231687313, 4.422932369464684, 10.86621951642185, 5107)
-    femmesh.addNode(1.2531662624105984, 4.30359168875902, 9.446049764663584, 5108)
-    femmesh.addNode(1.2456662786561021, 4.306591289591342, 8.586880901371238, 5109)
-    femmesh.addNode(-3.894881362449036, 2.0956056265391565, 23.60802606829445, 5110)
-    femmesh.addNode(-0.7866660107779659, -4.4227154326567755, 47.625703751825995, 5111)
-    femmesh.addNode(0.12642902959082353, 4.4922098871316924, 13.070736791773742, 5112)
-    femmesh.addNode(-0.7731743045801228, 4.395036080941687, 13.141469372086505, 5113)
-    femmesh.addNode(-0.15834143523847818, 4.497158283018192, 12.296487132286385, 5114)
-    femmesh.addNode(-4.426235595718636, 0.6362927374112729, 25.490170700038433, 5115)
-    femmesh.addNode(3.3995568648931505, 2.919202579722973, 41.9386258553617, 5116)
-    femmesh.addNode(0.6628105741732135, 4.350079728114138, 39.149799078701676, 5117)
-    femmesh.addNode(-3.741508635366957, -2.4762329521112507, 44.45016055106589, 5118)
-    femmesh.addNode(-4.189725457851873, -1.6289444963930944, 44.49085501734244, 5119)
-    femmesh.addNode(-3.932250247962837, -2.0523155620427946, 45.23926142512881, 5120)
-    femmesh.addNode(-1.5573907092350066, 4.203269936591004, 36.6590076535319, 5121)
-    femmesh.addNode(-1.6214653199541247, 4.170606516346469, 37.61452701227988, 5122)
-    femmesh.addNode(-0.7797670814521989, 4.40296261066324, 37.22556642167013, 5123)
-    femmesh.addNode(2.215091684793187, -3.8665548385112034, 25.99154080101242, 5124)
-    femmesh.addNode(-4.310743804925318, 1.2645893101711216, 37.97393295896583, 5125)
-    femmesh.addNode(-4.451611635959663, 0.4273811047496767, 38.21847245481679, 5126)
-    femmesh.addNode(-4.495245258232488, 0.003925994049529674, 12.101528840022121, 5127)
-    femmesh.addNode(-4.407966793111448, -0.48773906982787096, 11.36915229233687, 5128)
-    femmesh.addNode(-4.451934358221956, -0.5758655799054386, 12.811692011951932, 5129)
-    femmesh.addNode(-4.364655893100915, -1.0675306437828391, 12.079315464266681, 5130)
-    femmesh.addNode(-4.471438530348969, -0.27054593006480343, 9.694102711515933, 5131)
-    femmesh.addNode(-4.495676009163482, 0.1970129679597945, 10.52410184132118, 5132)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 4.5, 5133)
-    femmesh.addNode(4.362667897164497, -0.8171905577699083, 4.007773779785184, 5134)
-    femmesh.addNode(0.7765348391076198, -4.339430793176781, 15.956970211283602, 5135)
-    femmesh.addNode(0.006708012898309149, -4.495357502864502, 15.522034442023191, 5136)
-    femmesh.addNode(1.488648077863144, -4.240703934153117, 10.180378544912589, 5137)
-    femmesh.addNode(1.4303533498584209, -4.257520344559269, 9.24386964767571, 5138)
-    femmesh.addNode(0.7492080477003097, -4.393282299314203, 9.70416187751106, 5139)
-    femmesh.addNode(0.6909133196955868, -4.410098709720354, 8.767652980274182, 5140)
-    femmesh.addNode(1.535494017984117, -4.229746984604407, 18.194825697597704, 5141)
-    femmesh.addNode(2.209435980279786, -3.8665856284781843, 18.660193646341284, 5142)
-    femmesh.addNode(2.2206552542625166, -3.798625394363061, 17.7610645677395, 5143)
-    femmesh.addNode(1.5903940960565386, -4.209550021741465, 15.523731070017508, 5144)
-    femmesh.addNode(0.8205672698472279, -4.365476731429186, 15.088795300757099, 5145)
-    femmesh.addNode(3.466527288734979, 2.8430972881330363, 23.192133452196632, 5146)
-    femmesh.addNode(3.4732384358425463, 2.8334440250847353, 24.079128676561943, 5147)
-    femmesh.addNode(2.8825202458867327, -3.441074086450395, 11.980396935251559, 5148)
-    femmesh.addNode(1.4935898089117132, -4.244178473457463, 19.12011387355941, 5149)
-    femmesh.addNode(3.9162985925309997, 2.15335187839792, 32.54041659688227, 5150)
-    femmesh.addNode(3.908367421784983, 2.164698833766831, 33.43048176535808, 5151)
-    femmesh.addNode(4.248277082039317, 1.4762842564823608, 32.980530485918095, 5152)
-    femmesh.addNode(1.0064448893771674, 4.3652797576914235, 43.979475883944396, 5153)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 28.5, 5154)
-    femmesh.addNode(4.398238773561001, -0.7060104708774702, 27.155536682267346, 5155)
-    femmesh.addNode(4.398238773561001, -0.7060104708774702, 28.055536682267345, 5156)
-    femmesh.addNode(0.22523463114057685, 4.483761101698066, 46.01054720681336, 5157)
-    femmesh.addNode(-2.2516785070790446, 3.883608327645423, 25.002156912025512, 5158)
-    femmesh.addNode(-1.5458543037774115, 4.208592923169308, 24.573772678108647, 5159)
-    femmesh.addNode(2.0837819689504298, 3.922273629879669, 42.03594264527518, 5160)
-    femmesh.addNode(1.395087356418574, 4.278176403159531, 41.57182836436715, 5161)
-    femmesh.addNode(3.89308100293033, -2.212241041104024, 5.748069839440081, 5162)
-    femmesh.addNode(3.844615107153544, -2.2797920572163606, 6.607363148954285, 5163)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 7.174999999999999, 5164)
-    femmesh.addNode(4.37470852373649, -0.7815109898736312, 7.54517973180848, 5165)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 8.025, 5166)
-    femmesh.addNode(3.452309619537071, 2.8544348249637004, 16.05504526070252, 5167)
-    femmesh.addNode(0.04190433303391083, 4.49755561957759, 24.60665458153098, 5168)
-    femmesh.addNode(-0.7320228644454208, 4.405076841722512, 25.029746420692405, 5169)
-    femmesh.addNode(0.013048488834322206, 4.4958109607476295, 16.448097279161402, 5170)
-    femmesh.addNode(0.6001208849110407, -4.375684726325119, 34.71323820557187, 5171)
-    femmesh.addNode(3.456577807689675, 2.850044383945213, 17.823882414898243, 5172)
-    femmesh.addNode(2.923916644239428, 3.4099769221650185, 17.385909050705017, 5173)
-    femmesh.addNode(3.45276831916944, 2.8537720794490387, 16.93388268535845, 5174)
-    femmesh.addNode(3.3983342833072285, -2.9234017347841483, 36.64339392072827, 5175)
-    femmesh.addNode(2.859761423764146, -3.458592756670659, 37.052506348327015, 5176)
-    femmesh.addNode(-0.22931194420617695, -4.494088154250505, 31.324261304237595, 5177)
-    femmesh.addNode(0.3902081603641681, -4.445389403837694, 30.444895775748094, 5178)
-    femmesh.addNode(2.93257902431507, 3.4032906385755357, 18.268521403504664, 5179)
-    femmesh.addNode(2.2920352156713393, 3.8247326016554943, 24.10756118594466, 5180)
-    femmesh.addNode(1.62183397469791, 4.196817811788551, 24.54722223254369, 5181)
-    femmesh.addNode(-3.696207397422011, 2.564290844122711, 0.7535406442624768, 5182)
-    femmesh.addNode(-4.125324700705795, 1.797662717127915, 0.8254035545018291, 5183)
-    femmesh.addNode(-0.9478482649837287, 4.308974767976887, 11.881162704917404, 5184)
-    femmesh.addNode(-0.1351812846612793, 4.497711294403524, 11.458848330544733, 5185)
-    femmesh.addNode(-1.0353899988815174, 4.29129722856736, 11.348228581770293, 5186)
-    femmesh.addNode(-3.9255121002992768, 2.0152096836790294, 22.796706148217037, 5187)
-    femmesh.addNode(-3.9267060836453878, 2.0508889283866223, 21.840761094021662, 5188)
-    femmesh.addNode(-4.306478337734149, 1.2959522999884099, 22.330347208727403, 5189)
-    femmesh.addNode(-4.43843878899601, -0.6819416887846346, 35.265374510713436, 5190)
-    femmesh.addNode(-4.438490182240857, -0.681717125807247, 36.2008406345129, 5191)
-    femmesh.addNode(-0.7699264114502915, -4.429316533594383, 5.356680382422848, 5192)
-    femmesh.addNode(-0.471176415197582, -4.473013596086417, 4.602536873952179, 5193)
-    femmesh.addNode(-1.2233843271745408, -4.268202209543633, 4.667288594197223, 5194)
-    femmesh.addNode(2.9433196020734345, 3.3927999404695166, 20.947599940924235, 5195)
-    femmesh.addNode(-0.7094719132774875, 4.406685045478564, 30.64233191521278, 5196)
-    femmesh.addNode(-3.0501816000833895, 3.26505185752249, 14.568937637439952, 5197)
-    femmesh.addNode(1.5567586170820018, -4.221651160406425, 12.916194852939913, 5198)
-    femmesh.addNode(0.7697430325040399, -4.355445573441669, 12.417148056082556, 5199)
-    femmesh.addNode(0.8641181439965009, -4.361102160741321, 13.34924093736619, 5200)
-    femmesh.addNode(-4.442296618335838, -0.2548433483824575, 37.01794880346547, 5201)
-    femmesh.addNode(-4.400255085996534, -0.9404301541829341, 37.075385482056674, 5202)
-    femmesh.addNode(3.7866342333907355, -2.3273168298901634, 46.050905349832206, 5203)
-    femmesh.addNode(3.411888267882519, -2.9326162074644175, 46.49473660387953, 5204)
-    femmesh.addNode(4.232403495420787, 1.5124374561201919, 19.5905316164829, 5205)
-    femmesh.addNode(3.9067568370256014, 2.1874141793228246, 19.15184004979416, 5206)
-    femmesh.addNode(-2.2867873346094347, 3.8658354663740004, 18.672844655781233, 5207)
-    femmesh.addNode(-1.5742959420991296, 4.193843108698717, 19.147954761308974, 5208)
-    femmesh.addNode(-1.5856749677854847, 4.190616764879616, 18.254709398773144, 5209)
-    femmesh.addNode(-0.767641234013355, 4.404707841935265, 18.668400228886163, 5210)
-    femmesh.addNode(-3.6711934866459837, 2.5990904399456736, 47.647128333263, 5211)
-    femmesh.addNode(-3.337600150450368, 2.943971668622205, 46.86798639117224, 5212)
-    femmesh.addNode(-2.470610620533733, -3.742262680354147, 25.27689775560036, 5213)
-    femmesh.addNode(-2.4046064797603837, -3.7915980385319714, 26.36866626505006, 5214)
-    femmesh.addNode(2.9246190676633166, 3.4116340021757896, 36.03093917986083, 5215)
-    femmesh.addNode(3.449476824719035, 2.8551172176645956, 36.47762215310112, 5216)
-    femmesh.addNode(-3.408749797976834, -2.8141825698600593, 46.800770357295534, 5217)
-    femmesh.addNode(-3.7341994973647763, -2.4890322881170057, 46.024396064808684, 5218)
-    femmesh.addNode(4.22533315661148, -1.5320902336460835, 28.447454924825685, 5219)
-    femmesh.addNode(4.237998914760558, -1.4904100009980472, 27.590931339192743, 5220)
-    femmesh.addNode(4.385573015411923, -0.7476907035255067, 28.912060267900287, 5221)
-    femmesh.addNode(0.49096908230842856, 4.349648942611395, 41.05267553353468, 5222)
-    femmesh.addNode(2.122761722384413, 3.9159706491620927, 4.6251533698412235, 5223)
-    femmesh.addNode(-4.116842962884282, -1.692323756382376, 36.70519219592427, 5224)
-    femmesh.addNode(4.170353981045235, 1.2407915203454205, 48.39776567845931, 5225)
-    femmesh.addNode(4.676171202316354, 0.3044561771844646, 48.69646853699903, 5226)
-    femmesh.addNode(2.867847635184833, -3.452064113480472, 20.071511109639914, 5227)
-    femmesh.addNode(3.422256928398239, -2.8980434649870785, 20.524906036703918, 5228)
-    femmesh.addNode(-4.4330944584274325, -0.7448885037916169, 7.183205896018626, 5229)
-    femmesh.addNode(-3.5205614452284877, 2.8027628015759922, 16.889483321425082, 5230)
-    femmesh.addNode(-3.8757454174760353, 2.1943633933215896, 16.49641294622553, 5231)
-    femmesh.addNode(-3.765420184814727, 2.4160311514352095, 6.382296805394912, 5232)
-    femmesh.addNode(-0.11262432273204381, -4.495004519230906, 5.261782406210102, 5233)
-    femmesh.addNode(0.41845572941249953, -4.432144909956115, 4.703892230350758, 5234)
-    femmesh.addNode(0.06269390279165186, 4.496710224238118, 22.763210133928183, 5235)
-    femmesh.addNode(-3.6303661103251272, -2.6567201930066116, 20.336362613224374, 5236)
-    femmesh.addNode(1.3290196060249653, -4.297543404249007, 40.903716389917435, 5237)
-    femmesh.addNode(0.6388961775812223, -4.391949632229386, 40.244507743127016, 5238)
-    femmesh.addNode(-0.17351970368594744, -4.493247422408643, 40.69925464965846, 5239)
-    femmesh.addNode(-0.001037108023814709, 4.496352309979503, 35.85774499640162, 5240)
-    femmesh.addNode(0.7729295628134056, 4.344127203973821, 35.42970497267384, 5241)
-    femmesh.addNode(0.012570361828068186, 4.495828086096644, 34.97821835960424, 5242)
-    femmesh.addNode(-4.264065977609532, -1.2327375839353016, 3.1507008564018983, 5243)
-    femmesh.addNode(-3.962562843243572, -2.1298946012126825, 3.153484655425441, 5244)
-    femmesh.addNode(-3.5174394180463513, 2.8044307351949582, 23.207526450404227, 5245)
-    femmesh.addNode(-3.3644399480275182, 2.9336465725996517, 3.1268739114656543, 5246)
-    femmesh.addNode(3.3192163942677353, -3.0370112073067284, 0.6106191890041915, 5247)
-    femmesh.addNode(-1.770383128809629, -4.136496119473684, 8.857997240736143, 5248)
-    femmesh.addNode(-2.331087233778296, -3.7912137164036324, 8.471086304716977, 5249)
-    femmesh.addNode(-3.727914603803428, -2.492345829936311, 3.957662594831212, 5250)
-    femmesh.addNode(-4.1210130132877465, -1.6970084249807642, 3.9585620901835625, 5251)
-    femmesh.addNode(-0.9528846072160592, 4.306605564680547, 12.730527709072838, 5252)
-    femmesh.addNode(-1.853093321436297, 4.100191498844383, 12.619907960298399, 5253)
-    femmesh.addNode(4.380989207901762, -0.76216165729807, 10.308518082923591, 5254)
-    femmesh.addNode(-3.461496868740955, -2.8740136693583915, 45.23109702308783, 5255)
-    femmesh.addNode(-3.4482132192147876, -2.890707671518358, 4.722550854482376, 5256)
-    femmesh.addNode(-3.6955791560864735, -2.502536474390616, 5.49656679310037, 5257)
-    femmesh.addNode(-1.577767347701263, -4.187019611753719, 28.606409458703194, 5258)
-    femmesh.addNode(-1.5961956855212847, -4.1773110645123985, 27.72151387741168, 5259)
-    femmesh.addNode(-2.470846968094307, -3.7353040528248256, 22.401753973774497, 5260)
-    femmesh.addNode(-2.4940060281692116, -3.7231957901885258, 23.303328133709364, 5261)
-    femmesh.addNode(-4.166437286384584, -1.6868069624133009, 8.734660250060347, 5262)
-    femmesh.addNode(-2.047484763320613, -4.0059789530198655, 48.392937760062935, 5263)
-    femmesh.addNode(-1.608430999906051, -4.190032274183455, 49.179777724879614, 5264)
-    femmesh.addNode(-1.1728961637808408, -4.283940955036895, 48.37520712941681, 5265)
-    femmesh.addNode(4.387878238460564, 0.7402955614391282, 39.66727191160974, 5266)
-    femmesh.addNode(4.226806472385983, 1.5292633084231742, 34.739441131036884, 5267)
-    femmesh.addNode(4.384798974421315, 0.7501558848659677, 34.316355258821275, 5268)
-    femmesh.addNode(-0.009085190476755267, 4.495971622399471, 36.82696527106158, 5269)
-    femmesh.addNode(0.002454493757491988, 4.4955318426752715, 37.70325244528692, 5270)
-    femmesh.addNode(0.7488499154304076, 4.349584170635779, 37.279575832391444, 5271)
-    femmesh.addNode(-3.840620618553973, 2.3344232601733124, 43.7877632474651, 5272)
-    femmesh.addNode(-4.056153723505896, 1.9405898174498573, 44.5312717931304, 5273)
-    femmesh.addNode(-0.9518708388828782, -4.3239056827749565, 10.946286515828927, 5274)
-    femmesh.addNode(-0.01926805643435278, -4.4997360985284125, 11.128526168026163, 5275)
-    femmesh.addNode(-0.3323630660229352, -4.481508812285147, 10.170514149351, 5276)
-    femmesh.addNode(-1.6751140616946993, -4.176549233918145, 10.46228285585605, 5277)
-    femmesh.addNode(0.8027950348876906, -4.335789729574714, 14.188214981842856, 5278)
-    femmesh.addNode(1.6018586004423583, -4.205234233814758, 14.656590184038224, 5279)
-    femmesh.addNode(-4.01168372017739, -1.8522587761741025, 25.812940907756875, 5280)
-    femmesh.addNode(2.94739147027082, 3.3891312636254294, 24.56319009957113, 5281)
-    femmesh.addNode(4.3821241173576935, -0.7586070718776823, 11.180550829894976, 5282)
-    femmesh.addNode(4.3821241173576935, -0.7586070718776823, 12.030550829894976, 5283)
-    femmesh.addNode(4.223969589032724, -1.5352807225705019, 29.37291215874802, 5284)
-    femmesh.addNode(-1.7736773002957475, -4.109870169074664, 42.73533392095026, 5285)
-    femmesh.addNode(-2.609331386387796, 3.6557160345072446, 40.45103248765281, 5286)
-    femmesh.addNode(3.489617167539866, 2.818038504027843, 31.312264671479284, 5287)
-    femmesh.addNode(3.591557840503555, 2.7044204657310953, 32.10037385619814, 5288)
-    femmesh.addNode(3.4640741820447336, 2.839148136667676, 18.70823993356815, 5289)
-    femmesh.addNode(0.01652894361888832, 4.495664329182911, 15.566472697022848, 5290)
-    femmesh.addNode(-0.7090883699763113, -4.428859243313965, 39.221817393973424, 5291)
-    femmesh.addNode(-1.4669372609710223, -4.222474489817885, 39.62995148780281, 5292)
-    femmesh.addNode(-1.5435420293855175, 4.209827375051878, 20.93828780446971, 5293)
-    femmesh.addNode(-1.5609013297821281, 4.201421663465906, 21.853201404783054, 5294)
-    femmesh.addNode(4.376423300973579, -0.7762810667469832, 22.739015955269828, 5295)
-    femmesh.addNode(-0.7741007358857112, 4.404560206855489, 38.08676567212322, 5296)
-    femmesh.addNode(-4.35840293432552, -1.1098950634965767, 20.223845172400083, 5297)
-    femmesh.addNode(-0.8917900713447585, -4.37919466514313, 3.8131066794215345, 5298)
-    femmesh.addNode(4.390207852785603, 0.7327389852341945, 23.611756459504612, 5299)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 24.05, 5300)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 40.075, 5301)
-    femmesh.addNode(-2.2910306163539955, 3.8629944312501117, 19.569890571484528, 5302)
-    femmesh.addNode(2.813160197863909, 3.48649367383314, 10.339063901226528, 5303)
-    femmesh.addNode(2.875804202880737, 3.4427420681872327, 11.212615252043044, 5304)
-    femmesh.addNode(4.231606009821583, -1.5160319492090653, 12.493288327818192, 5305)
-    femmesh.addNode(-2.3506288100588106, -3.825484923804744, 16.693949718979866, 5306)
-    femmesh.addNode(4.226634505247884, -1.5326118090821705, 8.940001693049545, 5307)
-    femmesh.addNode(4.225266876445983, -1.5358798755849947, 9.826005758878333, 5308)
-    femmesh.addNode(0.02150370429256017, -4.496032227189143, 14.62042009856173, 5309)
-    femmesh.addNode(-2.3004082115801285, 3.8589253819148146, 17.777098759166563, 5310)
-    femmesh.addNode(-2.348973561699157, 3.8256471918347392, 16.84852924502861, 5311)
-    femmesh.addNode(-1.5992958447561785, 4.18370668042043, 17.358963502158478, 5312)
-    femmesh.addNode(-3.5086981424364243, -2.817291462367993, 31.3698980725057, 5313)
-    femmesh.addNode(1.5149433445930052, -4.236551888629072, 32.61467730520231, 5314)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 33.875, 5315)
-    femmesh.addNode(0.6630859326578944, -4.366322570488949, 37.50436077006645, 5316)
-    femmesh.addNode(1.5013363468211627, -4.241298488883378, 37.05001092277223, 5317)
-    femmesh.addNode(2.2854113530030644, 3.8276244279083125, 27.758352666007887, 5318)
-    femmesh.addNode(-4.49689396828014, 0.08789136676929579, 47.64787308712508, 5319)
-    femmesh.addNode(-4.436824254021271, 0.5257934869216837, 46.84022290792847, 5320)
-    femmesh.addNode(-0.7285004963142022, 4.406272536669144, 29.602241323966975, 5321)
-    femmesh.addNode(3.848572866577576, 2.2657497733915024, 7.55775774656238, 5322)
-    femmesh.addNode(3.835870602883226, 2.2825890507368345, 8.493449159872863, 5323)
-    femmesh.addNode(3.406862406864069, 2.920768524154362, 7.160960790014725, 5324)
-    femmesh.addNode(3.394160143169719, 2.937607801499694, 8.096652203325208, 5325)
-    femmesh.addNode(3.4331647798545752, -2.8766872604252964, 17.78994829917483, 5326)
-    femmesh.addNode(-1.9180909327452016, -4.067311547946047, 33.34752316467503, 5327)
-    femmesh.addNode(-2.078561718169501, -3.991179544903608, 32.26253777009334, 5328)
-    femmesh.addNode(2.273434306241751, -3.771718860800596, 16.013922107938768, 5329)
-    femmesh.addNode(-3.968970658082656, 1.938017893511788, 34.761039475223555, 5330)
-    femmesh.addNode(1.6282080709843345, 4.194671550436061, 28.199409563267146, 5331)
-    femmesh.addNode(2.285178789139265, 3.8278050751818173, 28.649063433187457, 5332)
-    femmesh.addNode(3.459339974397823, 2.8481329000952353, 26.80196038437066, 5333)
-    femmesh.addNode(-2.4393439134373263, -3.759941111845048, 21.35507616239913, 5334)
-    femmesh.addNode(-3.136649384682796, -3.1820229179317896, 21.902883863412043, 5335)
-    femmesh.addNode(-1.724041499830785, -4.1428870575500785, 20.917713195685195, 5336)
-    femmesh.addNode(-0.928413702643777, -4.27546151174511, 20.44333443139177, 5337)
-    femmesh.addNode(4.226270029033142, -1.5311734117456677, 25.86473862013498, 5338)
-    femmesh.addNode(-3.0586675089430666, -3.2928522082076555, 40.62388699062083, 5339)
-    femmesh.addNode(-3.623910863234511, -2.6060262799783587, 40.6103359003839, 5340)
-    femmesh.addNode(-2.399619038472472, -3.7899608036601906, 0.8056329969234278, 5341)
-    femmesh.addNode(2.917497442572368, 3.4171527626467753, 35.15933772305668, 5342)
-    femmesh.addNode(2.2616734729679964, 3.839344494846203, 34.568834842862046, 5343)
-    femmesh.addNode(-2.614749049512551, -3.6400159669946888, 41.15476043497103, 5344)
-    femmesh.addNode(-2.225779009456799, -3.910947805905978, 41.9749207627877, 5345)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 25.85, 5346)
-    femmesh.addNode(4.384005246470041, -0.7526745543748115, 26.303819724386926, 5347)
-    femmesh.addNode(4.220353821082612, -1.5519611416577317, 8.026663341934434, 5348)
-    femmesh.addNode(4.212568463909215, -1.5703524443550152, 7.080711463037078, 5349)
-    femmesh.addNode(3.8524004643269407, -2.261400754519077, 7.5533150278516406, 5350)
-    femmesh.addNode(1.6177187739078605, 4.198571693793037, 27.309006258564295, 5351)
-    femmesh.addNode(1.6104309714521292, 4.2015108338107545, 26.381283306439123, 5352)
-    femmesh.addNode(2.253121052232559, 3.7844665354128524, 35.59468838151421, 5353)
-    femmesh.addNode(-4.445623953486177, -0.5866942423141174, 34.19806860948895, 5354)
-    femmesh.addNode(-3.9472750706378124, 1.9718128015016558, 33.8361539992395, 5355)
-    femmesh.addNode(-3.9260612483001305, 2.028112668598754, 32.901225267068526, 5356)
-    femmesh.addNode(3.8947273851359405, 2.2089935619471244, 17.369570207304548, 5357)
-    femmesh.addNode(3.8992604626705427, 2.1983104266003615, 18.26748253112425, 5358)
-    femmesh.addNode(4.232018454111039, 1.5136851802184792, 18.69772238905082, 5359)
-    femmesh.addNode(-0.5882486691131437, 4.4379509739899525, 10.484002453884708, 5360)
-    femmesh.addNode(-1.5533365716176877, 4.205131035271224, 31.010117828460004, 5361)
-    femmesh.addNode(-2.7241347245908276, -3.4544002369959754, 31.786051213805344, 5362)
-    femmesh.addNode(-3.371919209822066, -2.97123967507075, 32.48615228009138, 5363)
-    femmesh.addNode(-2.7263462034007393, -3.5080189829783825, 32.962638836379384, 5364)
-    femmesh.addNode(4.226341190616954, 1.5307408728415695, 35.62894226564424, 5365)
-    femmesh.addNode(-3.9850652221521683, -1.9125119726900417, 29.09185665324647, 5366)
-    femmesh.addNode(-3.9735370621224346, -1.9031560280841169, 28.801207324893497, 5367)
-    femmesh.addNode(-3.902842783573065, -2.2000518063151677, 13.148930625763576, 5368)
-    femmesh.addNode(-3.5719618581796966, -2.7233561970518325, 13.677486804314295, 5369)
-    femmesh.addNode(2.7596996060120054, 3.551626587835965, 2.4366731146145866, 5370)
-    femmesh.addNode(2.384117847834216, 3.779078268621123, 3.2082657601228504, 5371)
-    femmesh.addNode(3.0525977670335402, 3.299993290645179, 3.213966800754641, 5372)
-    femmesh.addNode(-3.1832136463502394, -3.1519343633558017, 42.83990935819297, 5373)
-    femmesh.addNode(4.344780505026463, -0.7725185358774946, 44.13561665829333, 5374)
-    femmesh.addNode(-0.1458961181558439, -4.49532755687834, 39.764719212684994, 5375)
-    femmesh.addNode(-1.6135935807588844, -4.157800202191895, 5.362204602622347, 5376)
-    femmesh.addNode(-2.067051496483134, -3.9966858781411445, 4.672812814396721, 5377)
-    femmesh.addNode(4.38252338133505, -0.7573521884775938, 41.52142050004423, 5378)
-    femmesh.addNode(4.38252338133505, -0.7573521884775938, 42.37142050004422, 5379)
-    femmesh.addNode(3.8732870687617202, 2.243204102717735, 41.48662008513173, 5380)
-    femmesh.addNode(-4.430606464470757, 0.24357810228303334, 34.8081275296293, 5381)
-    femmesh.addNode(-1.8424690157099164, 4.07416891694135, 40.3281013074989, 5382)
-    femmesh.addNode(-4.347061397674807, 1.1579499165791134, 35.19484080950093, 5383)
-    femmesh.addNode(-4.352854991895755, -0.7470122365086461, 8.851076031147183, 5384)
-    femmesh.addNode(-4.307681184159752, -1.271468179819052, 7.977386977178207, 5385)
-    femmesh.addNode(3.597766029888994, 2.578379393330571, 3.7570542254764323, 5386)
-    femmesh.addNode(3.6129695860292346, 2.5433397626726912, 2.7899928244602075, 5387)
-    femmesh.addNode(-3.0540983276919738, 3.2244488362634174, 8.915651383308616, 5388)
-    femmesh.addNode(1.2391647109303912, 4.307928014483409, 7.511349172737274, 5389)
-    femmesh.addNode(2.10621543189226, 3.9504101762406187, 7.250527111029676, 5390)
-    femmesh.addNode(4.237784743631758, 1.498772146453681, 22.276328816941124, 5391)
-    femmesh.addNode(-1.3424295269476798, -4.209444090085624, 41.88502368176107, 5392)
-    femmesh.addNode(-2.2852990398891446, 3.856262374923911, 8.469247308210122, 5393)
-    femmesh.addNode(-1.3332315181173784, 4.2644504077225776, 8.19634259059162, 5394)
-    femmesh.addNode(-2.1800382893706027, 3.901738996768863, 7.672724663370887, 5395)
-    femmesh.addNode(-1.227970767598837, 4.30992702956753, 7.399819945752386, 5396)
-    femmesh.addNode(1.5868917938094302, 4.2107438125289125, 20.94585461885955, 5397)
-    femmesh.addNode(0.8020039452420978, 4.344935131978867, 21.401728035868317, 5398)
-    femmesh.addNode(0.8264753373595588, 4.362690099631811, 20.48395389667307, 5399)
-    femmesh.addNode(0.04158748879222637, 4.496881419081767, 20.93982731368184, 5400)
-    femmesh.addNode(2.9349193084980456, 3.3992887296113907, 21.835443825157974, 5401)
-    femmesh.addNode(0.9487566610168314, 4.310933715415489, 32.530294085595784, 5402)
-    femmesh.addNode(2.2381621851051468, -3.876851305464916, 8.89031179624428, 5403)
-    femmesh.addNode(1.4596590488599963, -4.245083786666241, 8.411897922056525, 5404)
-    femmesh.addNode(2.2088564861035715, -3.8892878633579437, 9.722283521863464, 5405)
-    femmesh.addNode(2.1105906459911545, 3.97433343711739, 47.62069604555825, 5406)
-    femmesh.addNode(1.7865904250555782, 4.110543036967846, 46.67743226832788, 5407)
-    femmesh.addNode(-4.236137919549714, -1.5091101781734415, 11.313281344515445, 5408)
-    femmesh.addNode(-2.4677011049186226, -3.7411271771679586, 44.4184169465822, 5409)
-    femmesh.addNode(-0.7035129111313924, -4.429232454542001, 38.32138174984789, 5410)
-    femmesh.addNode(-0.8641553410470023, -4.385734571013234, 37.54838200911395, 5411)
-    femmesh.addNode(4.210733940472921, -1.5773646777498644, 32.070967373888834, 5412)
-    femmesh.addNode(4.211466646420679, -1.575642071760489, 32.9293743697302, 5413)
-    femmesh.addNode(4.370668883987218, -0.7936806930339191, 32.494529420347675, 5414)
-    femmesh.addNode(-2.590550090121067, -3.6385186375732346, 34.0543198969538, 5415)
-    femmesh.addNode(-4.408502939770788, -0.9012676432682899, 13.689093534821424, 5416)
-    femmesh.addNode(3.9173440409478637, 2.1506659622478863, 31.6627838390662, 5417)
-    femmesh.addNode(4.2493225304561815, 1.4735983403323272, 32.10289772810202, 5418)
-    femmesh.addNode(3.8769877414045597, -2.2287901481441743, 11.110680215309802, 5419)
-    femmesh.addNode(-4.451341079990629, -0.46035731588510476, 32.29044767563866, 5420)
-    femmesh.addNode(-4.447495165393456, -0.5784398833235751, 33.26417760331352, 5421)
-    femmesh.addNode(4.248068091326933, 1.4769489764579011, 33.861005507262306, 5422)
-    femmesh.addNode(4.3632691169056175, 0.7267930915919323, 33.41965024844104, 5423)
-    femmesh.addNode(-3.8595573888436574, 2.240476693892151, 45.32695446423631, 5424)
-    femmesh.addNode(3.8496277040837548, -2.26512553911275, 8.42705094834216, 5425)
-    femmesh.addNode(-4.410552857808186, 0.6891909641208236, 11.453313524774277, 5426)
-    femmesh.addNode(-4.156256968745613, 1.6873071922281775, 11.679179505737476, 5427)
-    femmesh.addNode(-4.311214430454743, 1.2895279103379576, 10.722298112632583, 5428)
-    femmesh.addNode(4.398072841837433, -0.630332838331601, 3.216915424352792, 5429)
-    femmesh.addNode(3.8348774217438653, -2.2898228817581012, 32.50231073890849, 5430)
-    femmesh.addNode(2.742985587686739, 3.5637701755619196, 3.8947704836742396, 5431)
-    femmesh.addNode(3.313866310777482, 2.9915585652663075, 4.139830976437295, 5432)
-    femmesh.addNode(-2.4917809095507115, -3.7277230476151697, 42.837943716919185, 5433)
-    femmesh.addNode(-3.823789438637508, -2.364782279298889, 42.9396169608295, 5434)
-    femmesh.addNode(3.367021858266372, -2.9330944806004147, 5.2313033440916445, 5435)
-    femmesh.addNode(-1.1830778123208798, -4.279308978410323, 45.14856946198475, 5436)
-    femmesh.addNode(4.221674302718438, 1.5484224391037802, 8.96089466971304, 5437)
-    femmesh.addNode(4.376983698869483, 0.774563422392736, 7.561572751017011, 5438)
-    femmesh.addNode(-3.073371473877152, 3.2810841710679783, 0.8390822069888111, 5439)
-    femmesh.addNode(0.565777440540238, 4.422661685950506, 9.99529534936788, 5440)
-    femmesh.addNode(-0.6009763517416369, 4.4376802904757735, 9.613078286830735, 5441)
-    femmesh.addNode(2.922632496172053, -3.4114481660729954, 16.46703792620533, 5442)
-    femmesh.addNode(0.888366855450492, 4.389139296052549, 46.624069741701895, 5443)
-    femmesh.addNode(0.6177674995062293, -4.413038014726431, 48.39486997653444, 5444)
-    femmesh.addNode(1.1377240998031328, -4.353593262567506, 49.17552198514372, 5445)
-    femmesh.addNode(3.973648816298838, 2.054692250647315, 46.486735648994795, 5446)
-    femmesh.addNode(4.228968148701074, 1.5378783431749494, 47.01883647174657, 5447)
-    femmesh.addNode(-1.7278037200649061, -4.142590873016949, 22.89134500629236, 5448)
-    femmesh.addNode(-0.9347715685608493, -4.360473060248781, 23.382838913775238, 5449)
-    femmesh.addNode(-1.7509627801398109, -4.130482610380648, 23.79291916622723, 5450)
-    femmesh.addNode(0.7749289933687173, -4.330771370741381, 27.034900690772755, 5451)
-    femmesh.addNode(4.045209269562721, 1.937151805771013, 47.85190835850635, 5452)
-    femmesh.addNode(3.745948178307112, 2.3543745790246273, 47.12963423609092, 5453)
-    femmesh.addNode(3.5113469558825208, 2.80237725991074, 47.779453125207155, 5454)
-    femmesh.addNode(4.240503556124102, -1.4845093282483264, 26.7164555780154, 5455)
-    femmesh.addNode(3.8361464589664127, -2.3265942194805276, 0.7615618808234962, 5456)
-    femmesh.addNode(-2.266295267837854, -3.8720781328885723, 13.982811663948045, 5457)
-    femmesh.addNode(-4.256767390596508, 1.42301059672559, 16.9898670749518, 5458)
-    femmesh.addNode(-4.253356251127433, 1.436622599292092, 16.054179759786592, 5459)
-    femmesh.addNode(2.101486198822589, -3.973971658817233, 46.92423129188293, 5460)
-    femmesh.addNode(2.948955590304932, -3.3125401361810063, 46.85128030210951, 5461)
-    femmesh.addNode(4.24768217721448, 1.4787983881800861, 31.210715540845158, 5462)
-    femmesh.addNode(1.0133186182119251, -4.380528018305719, 47.674122007280616, 5463)
-    femmesh.addNode(0.1563180598206989, -4.492385227241838, 47.56589704542003, 5464)
-    femmesh.addNode(1.5741118451700578, 4.215412036498551, 20.057968957634387, 5465)
-    femmesh.addNode(4.225096530619625, -1.5351209134437755, 41.93423229580997, 5466)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 15.2, 5467)
-    femmesh.addNode(2.1668028292265973, -3.898747716827329, 22.31714310363284, 5468)
-    femmesh.addNode(3.9150672960624884, -2.17835082517171, 27.216338715694143, 5469)
-    femmesh.addNode(-1.0556062888347564, -4.334152363428336, 9.686510489378122, 5470)
-    femmesh.addNode(2.996681642898916, 3.3453018662532727, 46.15947418050011, 5471)
-    femmesh.addNode(3.306231619345901, 3.050988387732734, 46.96325749132039, 5472)
-    femmesh.addNode(0.8159305675578307, 4.344579384882949, 26.87713804593265, 5473)
-    femmesh.addNode(0.8569640136408763, 4.351147297891048, 27.740878805636708, 5474)
-    femmesh.addNode(1.6320499867637333, 4.193029818043582, 23.659641284217855, 5475)
-    femmesh.addNode(-1.6184357560910954, -4.186896946033766, 47.56582776991132, 5476)
-    femmesh.addNode(-3.5181890431555995, 2.686672015186481, 5.535833992923768, 5477)
-    femmesh.addNode(-3.085582814463567, 3.2706361832759785, 2.320642333524672, 5478)
-    femmesh.addNode(-1.626544085283391, 4.17574354355085, 16.395843120846678, 5479)
-    femmesh.addNode(-1.3976039746772135, 4.250763016106665, 9.225756100827137, 5480)
-    femmesh.addNode(3.8482600752818534, -2.2683936056155742, 9.313055014170947, 5481)
-    femmesh.addNode(0.7929577527121161, -4.406103976539965, 7.900630534241298, 5482)
-    femmesh.addNode(-1.79641351482387, -4.125685624216356, 7.869053558655025, 5483)
-    femmesh.addNode(2.8669978172400112, -3.4553197298955265, 39.793488071729385, 5484)
-    femmesh.addNode(3.419891728315534, -2.8968502730098686, 40.16344005358836, 5485)
-    femmesh.addNode(3.4016065753423064, -2.914276444583357, 41.080638751436766, 5486)
-    femmesh.addNode(0.7921515102888556, -4.365114413879962, 16.85589515874654, 5487)
-    femmesh.addNode(-1.3715668757924258, 4.235607510278731, 41.7756982937335, 5488)
-    femmesh.addNode(4.223372827321977, 1.5432292706860262, 8.067108937015906, 5489)
-    femmesh.addNode(2.9514520106882647, 3.3850651591695686, 23.639905925539622, 5490)
-    femmesh.addNode(4.2179887043620425, -1.5564328885372603, 22.25890114132065, 5491)
-    femmesh.addNode(3.8584229486243484, -2.2574079411633114, 22.728312223121634, 5492)
-    femmesh.addNode(2.7035305712103144, -3.5947832362368075, 0.8405636532711116, 5493)
-    femmesh.addNode(2.342751640889723, -3.8266247035749665, 1.6381610245339204, 5494)
-    femmesh.addNode(1.9448181132903226, -4.057477131824999, 0.7975973712628087, 5495)
-    femmesh.addNode(-2.2547638632852216, 3.882784286141826, 30.563038923084665, 5496)
-    femmesh.addNode(3.490040054001606, 2.8174297151666714, 30.42035490391291, 5497)
-    femmesh.addNode(2.9700757063245473, 3.365920020107887, 29.979972970662896, 5498)
-    femmesh.addNode(2.9419426902322146, 3.3943893956899664, 29.04899997776407, 5499)
-    femmesh.addNode(-4.3107270408254506, -1.2736140357807777, 45.25113890862805, 5500)
-    femmesh.addNode(3.4520391886017467, 2.8586000262297704, 27.68945926054298, 5501)
-    femmesh.addNode(2.9421752540960138, 3.394208748416461, 28.1582892105845, 5502)
-    femmesh.addNode(3.8640705587849276, -2.2496663322306203, 21.84143708112544, 5503)
-    femmesh.addNode(3.4169463725509663, -2.905454731481127, 22.27684803668326, 5504)
-    femmesh.addNode(3.4225939827115455, -2.897713122548436, 21.389972894687066, 5505)
-    femmesh.addNode(-0.7786713992267056, 4.401363403706807, 35.42012274265604, 5506)
-    femmesh.addNode(3.4630207465488794, -2.8534078655797783, 9.792442553159173, 5507)
-    femmesh.addNode(-1.7183911836708694, -4.145805738960185, 21.831101109243885, 5508)
-    femmesh.addNode(-0.9409576801142044, -4.278257867524492, 22.324476403828005, 5509)
-    femmesh.addNode(4.340065056485704, -0.7836839847159466, 31.67643795354116, 5510)
-    femmesh.addNode(4.4192298427742225, -0.6303387722729832, 49.385675657168306, 5511)
-    femmesh.addNode(4.212511916344694, -1.515855234350786, 49.385675657168306, 5512)
-    femmesh.addNode(-3.4971547043885876, 2.831639625220435, 28.721760017700543, 5513)
-    femmesh.addNode(-3.8821907375449163, 2.152121131943784, 29.122607268886387, 5514)
-    femmesh.addNode(-3.5063785262099696, 2.8199826604458464, 29.622305919015606, 5515)
-    femmesh.addNode(2.61163576813604, 3.598842340020802, 46.887416306866896, 5516)
-    femmesh.addNode(4.383367611891998, 0.7546912127381864, 30.768698050220188, 5517)
-    femmesh.addNode(1.519420113732608, 4.233805103537524, 5.71459872814035, 5518)
-    femmesh.addNode(2.1452269903913206, 3.9242892860343077, 6.317768843827702, 5519)
-    femmesh.addNode(2.072021552379396, 3.9515696732554555, 5.406907225504405, 5520)
-    femmesh.addNode(0.4707947489433558, -4.449913475698605, 5.745825572109691, 5521)
-    femmesh.addNode(1.1625981371331198, -4.344602590557539, 6.1017861227718395, 5522)
-    femmesh.addNode(-0.08088903909012662, -4.497478066418358, 8.266627418318809, 5523)
-    femmesh.addNode(-0.8881555025440833, -4.339258631112292, 7.712950721716444, 5524)
-    femmesh.addNode(2.1262170553623827, -3.8307818604109287, 23.280555492051178, 5525)
-    femmesh.addNode(-3.1226860265119325, -3.2065506156189674, 3.9414292366138874, 5526)
-    femmesh.addNode(-1.1181796059104756, 4.347995511982365, 5.843534813032946, 5527)
-    femmesh.addNode(4.226699113800148, -1.5316161808145172, 11.567298282314145, 5528)
-    femmesh.addNode(-0.2743702113950408, -4.481561303477074, 9.251243503899369, 5529)
-    femmesh.addNode(4.3874801352835116, 0.7415784541278319, 15.57493500229366, 5530)
-    femmesh.addNode(-2.3429092269329326, 3.7894072628011317, 2.3308375739914675, 5531)
-    femmesh.addNode(-1.5502180177563303, 4.207890845807292, 2.3268064059927482, 5532)
-    femmesh.addNode(-1.9060771549649829, 4.009238666652099, 3.1192117241786397, 5533)
-    femmesh.addNode(1.924593192638352, 4.067007021553743, 2.3214445041044867, 5534)
-    femmesh.addNode(0.6806713095978321, -4.363493747914166, 32.1435373101767, 5535)
-    femmesh.addNode(1.5152983680411674, -4.236416770712795, 31.688981267173183, 5536)
-    femmesh.addNode(-3.0367509270408783, 3.302810676811406, 43.15935839919776, 5537)
-    femmesh.addNode(-3.2986141118020083, 2.975391272935425, 43.88758297860112, 5538)
-    femmesh.addNode(0.7356259648149462, -4.353971532084508, 17.733933551046203, 5539)
-    femmesh.addNode(-0.04272907641880892, 4.498925619455378, 5.424422162185742, 5540)
-    femmesh.addNode(-0.7124390687340436, 4.392324135312553, 5.13615492006106, 5541)
-    femmesh.addNode(-0.12286400702810386, -4.49667028069578, 20.032947724804693, 5542)
-    femmesh.addNode(0.5939148865238055, 4.386463877091977, 4.808706788545118, 5543)
-    femmesh.addNode(-3.644819742332749, 2.63312304913417, 46.101680706255564, 5544)
-    femmesh.addNode(4.219361960961306, -1.5531833099685124, 21.37821171757313, 5545)
-    femmesh.addNode(-2.7920522445318947, 3.373913181492294, 28.212870781405, 5546)
-    femmesh.addNode(-3.4941769526127606, 2.8352320459222677, 27.785945492621416, 5547)
-    femmesh.addNode(0.7730236978808739, 4.344105164419565, 16.04465237372467, 5548)
-    femmesh.addNode(-4.44475577039602, -0.22765015723210322, 29.596465644522993, 5549)
-    femmesh.addNode(0.8095707127780687, 4.373547233122072, 5.419452483457677, 5550)
-    femmesh.addNode(1.1623386272854688, 4.341816817055708, 49.23617954692109, 5551)
-    femmesh.addNode(-0.21123978017619702, 4.493827489561674, 1.5765986143795183, 5552)
-    femmesh.addNode(0.25960868723781383, 4.481287932322206, 2.3420814088540975, 5553)
-    femmesh.addNode(3.8735520947902797, -2.2355494090584562, 41.52238120182244, 5554)
-    femmesh.addNode(2.2850096655639494, -3.8612226517108166, 45.38618342219249, 5555)
-    femmesh.addNode(2.8540224996131394, -3.4510627848048925, 44.86291816427948, 5556)
-    femmesh.addNode(2.1235121574894382, -3.9303357451111767, 44.517734678084736, 5557)
-    femmesh.addNode(3.361804422000527, -2.986203050310138, 45.61484523586985, 5558)
-    femmesh.addNode(0.6494757654607513, -4.422998183364376, 45.203165707063256, 5559)
-    femmesh.addNode(2.9041063454951317, -3.397475941959172, 45.74280953228916, 5560)
-    femmesh.addNode(2.5644188764001763, -3.5940477301006437, 46.567687593652956, 5561)
-    femmesh.addNode(2.217475936675319, -3.891305356698415, 7.943182645145276, 5562)
-    femmesh.addNode(2.859809156155414, -3.446250693657967, 7.464984242006134, 5563)
-    femmesh.addNode(-2.9335273835368136, 3.349093706874697, 18.255030515796822, 5564)
-    femmesh.addNode(-2.948770210087618, 3.3303273651463288, 19.171852252576038, 5565)
-    femmesh.addNode(-2.271782703009539, 3.8744318871194037, 31.56964430386187, 5566)
-    femmesh.addNode(3.8729267333430872, -2.237029262455411, 40.61926758505014, 5567)
-    femmesh.addNode(-3.0006831004474406, -3.1818004728030376, 25.9247473049552, 5568)
-    femmesh.addNode(-4.323272112810436, 1.2279624859139402, 36.99693318472207, 5569)
-    femmesh.addNode(-4.444306631284704, 0.6284186963326175, 37.447937323217346, 5570)
-    femmesh.addNode(3.7651776359581417, -2.380547877187574, 29.67637951832971, 5571)
-    femmesh.addNode(3.9696179501827897, -2.0944547572965195, 28.904033773453136, 5572)
-    femmesh.addNode(-3.893976929159405, 2.0508087832960293, 28.291438081111885, 5573)
-    femmesh.addNode(-3.906720264708671, -2.1297295311382647, 33.039824887555994, 5574)
-    femmesh.addNode(-4.2081315765792695, -1.5138404927041051, 33.66046219203151, 5575)
-    femmesh.addNode(-2.9494500461117164, 3.3319151807537066, 20.991606878534242, 5576)
-    femmesh.addNode(2.2914667817806587, 3.753362375557656, 23.191986023812817, 5577)
-    femmesh.addNode(2.9412793608761802, 3.3929302933212497, 22.74981817243152, 5578)
-    femmesh.addNode(-2.0768778687727645, 3.905730837330215, 41.41214897158544, 5579)
-    femmesh.addNode(-2.8437402394506446, 3.4872779548961095, 41.53508015173935, 5580)
-    femmesh.addNode(2.1701358654186196, -3.8981517853623195, 36.58108469139813, 5581)
-    femmesh.addNode(-0.9891470513699134, -4.2839050595224215, 8.422730255257388, 5582)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 20.5, 5583)
-    femmesh.addNode(4.38903308757542, 0.7365601852325792, 20.041346857144582, 5584)
-    femmesh.addNode(-0.2661804749621208, -4.446349988473811, 3.134303421422442, 5585)
-    femmesh.addNode(0.029788195733802814, -4.489424864805555, 3.843599548206413, 5586)
-    femmesh.addNode(3.4146361902099978, -2.904144561985885, 39.284570225519815, 5587)
-    femmesh.addNode(2.872571481288322, -3.4512218859441166, 38.867789509587254, 5588)
-    femmesh.addNode(1.9597539020555819, -4.050503288542464, 2.524124681212804, 5589)
-    femmesh.addNode(3.876690413506326, -2.229499257494264, 10.241420438845374, 5590)
-    femmesh.addNode(-1.1410302754289505, -4.295704494427503, 1.598090958865325, 5591)
-    femmesh.addNode(-0.7328905008819151, -4.434286729856711, 2.335931550171831, 5592)
-    femmesh.addNode(-4.496677683000101, 0.07103789757843407, 2.335759016142502, 5593)
-    femmesh.addNode(2.2598503520645172, 3.7753419683591645, 17.815746993843746, 5594)
-    femmesh.addNode(-2.2924214689232656, -3.832279988649076, 7.101919867324723, 5595)
-    femmesh.addNode(-1.5091500850046167, -4.232925322023521, 7.034107590348392, 5596)
-    femmesh.addNode(-1.9697345237882449, -3.960007799008956, 6.21968578165168, 5597)
-    femmesh.addNode(-3.9573635272207657, -2.1353343981916337, 6.354938548435403, 5598)
-    femmesh.addNode(-4.279506129442879, -1.1861206808710898, 6.392867947252513, 5599)
-    femmesh.addNode(-4.437180796022729, 0.5675718242109565, 16.207523207122023, 5600)
-    femmesh.addNode(1.3198564265995922, -4.294789377977246, 44.551551403704025, 5601)
-    femmesh.addNode(1.575573135026858, -4.2142589080623525, 12.010561446016304, 5602)
-    femmesh.addNode(0.7523126395934742, -4.3577283595596885, 11.580693284677723, 5603)
-    femmesh.addNode(-3.0958111606712717, 3.2554046344905117, 42.27166855689299, 5604)
-    femmesh.addNode(3.3067655198822075, -3.0405914087812054, 30.140837929485674, 5605)
-    femmesh.addNode(-3.644024283891734, 2.6343101366156065, 44.58344591857101, 5606)
-    femmesh.addNode(-2.4257103049370676, -3.7707734010516356, 37.740759818365035, 5607)
-    femmesh.addNode(-2.837674271094517, -3.3775541686880093, 38.56223362517271, 5608)
-    femmesh.addNode(-1.5958985165877175, -4.197537553382177, 2.3659699613310563, 5609)
-    femmesh.addNode(-2.076683526263184, -3.99216128053289, 31.34186086103859, 5610)
-    femmesh.addNode(-1.378550634297808, -4.231572259888734, 30.60480689253488, 5611)
-    femmesh.addNode(-1.0409001256347106, -4.270296270146445, 31.75787696482675, 5612)
-    femmesh.addNode(2.2552144766376734, 3.8400740656927255, 20.508396157653557, 5613)
-    femmesh.addNode(2.3145788407748498, 3.8125399637515827, 30.519757731451897, 5614)
-    femmesh.addNode(-1.1670719807717382, -4.34277880782312, 6.133731085703644, 5615)
-    femmesh.addNode(-3.924634926825597, -2.0785229545183785, 7.904792022381073, 5616)
-    femmesh.addNode(2.1928248653187152, -3.799401171736613, 19.607822140526864, 5617)
-    femmesh.addNode(2.171636299818455, 3.857002563200317, 45.94949014196109, 5618)
-    femmesh.addNode(2.2728880877949433, 3.8362467463476344, 22.30176994713142, 5619)
-    femmesh.addNode(-3.517473500001473, -2.8060338511447966, 29.520496679405404, 5620)
-    femmesh.addNode(2.9099190293843495, -3.4237721964361496, 17.33059512121411, 5621)
-    femmesh.addNode(-0.4113743189847532, -4.451307456738872, 6.015925914680772, 5622)
-    femmesh.addNode(3.857741216140024, -2.2590152320148404, 23.667640277707697, 5623)
-    femmesh.addNode(-2.801190351067107, -3.4551179456085235, 13.417358394704703, 5624)
-    femmesh.addNode(-2.1539371728109495, -3.944409433506782, 13.053811939899266, 5625)
-    femmesh.addNode(2.2356281732585326, -3.783976322928277, 12.451842398241757, 5626)
-    femmesh.addNode(3.8873392458861686, -2.2164818012145786, 12.940166577644247, 5627)
-    femmesh.addNode(-1.7865197156809265, -4.120621545470207, 35.265934658825444, 5628)
-    femmesh.addNode(-0.2085899403402415, -4.494852066423631, 35.15196884132999, 5629)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 32.1, 5630)
-    femmesh.addNode(1.6387093626544065, 4.1899263533954345, 30.96244003834617, 5631)
-    femmesh.addNode(0.8673883073218758, 4.34297257029349, 30.510017900530904, 5632)
-    femmesh.addNode(2.834533680943004, 3.485984641932091, 42.453234014898875, 5633)
-    femmesh.addNode(0.25566734670754365, 4.481763874391443, 0.756727041236569, 5634)
-    femmesh.addNode(0.8323400472391385, 4.344867633033632, 31.53856771586583, 5635)
-    femmesh.addNode(-2.4049383750722675, -3.7914210131185264, 27.276475266396893, 5636)
-    femmesh.addNode(-4.00468618417713, -1.8526670183715785, 19.785521429384687, 5637)
-    femmesh.addNode(-1.9763897539270274, 4.030971648684812, 6.749944610462084, 5638)
-    femmesh.addNode(2.1265122410280406, -3.9082179413761566, 40.283099234287484, 5639)
-    femmesh.addNode(4.3643145653224815, 0.7241071754418986, 31.66701749062497, 5640)
-    femmesh.addNode(3.9177669274096036, 2.150057173386715, 30.770874071499826, 5641)
-    femmesh.addNode(-1.5306581680834368, 4.215813054971135, 25.519748426675683, 5642)
-    femmesh.addNode(3.8975047676942864, 2.1937304313525146, 28.102152888995015, 5643)
-    femmesh.addNode(4.388648046265672, 0.7378079093308665, 19.1485376297125, 5644)
-    femmesh.addNode(2.2749969192451913, 3.7634696873057027, 21.385058402130227, 5645)
-    femmesh.addNode(-4.446088839000224, -0.6938404662300137, 42.916298666605414, 5646)
-    femmesh.addNode(4.3748552885174865, 0.6963602854255914, 47.679142680047036, 5647)
-    femmesh.addNode(-2.354251720535225, 3.7937356744461095, 42.220248091523516, 5648)
-    femmesh.addNode(-1.4344399562874168, 4.225088312154526, 42.84407747750777, 5649)
-    femmesh.addNode(-0.05127329613237985, -4.494454046806434, 37.942944937895305, 5650)
-    femmesh.addNode(0.7204052649793865, -4.373227144144471, 18.64648184757152, 5651)
-    femmesh.addNode(-0.14792552861014746, -4.496140054756324, 22.815970311310878, 5652)
-    femmesh.addNode(0.8225163386243637, 4.341482546614988, 23.222632078708667, 5653)
-    femmesh.addNode(0.6779196885685996, -4.367554388594524, 19.552097172531823, 5654)
-    femmesh.addNode(-0.14010929782407952, -4.496208830270985, 23.806555482398565, 5655)
-    femmesh.addNode(0.6734136075913617, -4.376587059092525, 24.25882550406967, 5656)
-    femmesh.addNode(-2.8612469441087813, -3.355052505904908, 30.925707719738945, 5657)
-    femmesh.addNode(-3.3989113392716046, -2.8304115062833586, 6.331770299794906, 5658)
-    femmesh.addNode(1.1938365308910677, -4.3259602849737195, 30.016047236876368, 5659)
-    femmesh.addNode(2.0460561628669294, -3.977381493420085, 30.275546729694668, 5660)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 3.5999999999999996, 5661)
-    femmesh.addNode(2.1559312275731415, -3.9096813415182257, 32.08229356836826, 5662)
-    femmesh.addNode(-2.899982095221774, 3.387369753527431, 25.495924364216233, 5663)
-    femmesh.addNode(3.4091222756519217, 2.9067201100326168, 5.21096256179168, 5664)
-    femmesh.addNode(2.838241552561179, 3.4789317203282293, 4.965902069028624, 5665)
-    femmesh.addNode(4.385007965133699, 0.7494911648904273, 32.53588023747706, 5666)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 32.975, 5667)
-    femmesh.addNode(0.8517613215849043, 4.349111284809184, 24.091107418491063, 5668)
-    femmesh.addNode(-2.7211387530326214, -3.479821846062534, 48.38907714534074, 5669)
-    femmesh.addNode(-3.115427601495207, -3.217433368222988, 47.568489365753976, 5670)
-    femmesh.addNode(2.933077101524246, -3.3915127730310966, 48.314295655187934, 5671)
-    femmesh.addNode(3.2570133778849244, -3.1051285659491565, 49.12731864908973, 5672)
-    femmesh.addNode(3.4034283059640975, 2.9284034453585024, 8.988653483625285, 5673)
-    femmesh.addNode(0.6912151930724153, -4.393229808122277, 10.623432522962691, 5674)
-    femmesh.addNode(4.3752851742659455, 0.77975659081049, 10.305358483714144, 5675)
-    femmesh.addNode(-1.5392027745586385, 4.211050842801627, 20.055576783255873, 5676)
-    femmesh.addNode(-2.255937448813504, 3.8802021653530216, 20.477512593431427, 5677)
-    femmesh.addNode(-0.7790202596997099, 4.401481498116164, 17.775154866350334, 5678)
-    femmesh.addNode(0.7958832947958056, 4.343716331370089, 14.325764467635464, 5679)
-    femmesh.addNode(0.11496259112346212, 4.491836717523506, 13.922021755234121, 5680)
-    femmesh.addNode(-3.4979599134766555, 2.828010494159101, 25.019984048112548, 5681)
-    femmesh.addNode(-0.7867194816796461, 4.400982716126775, 36.38934301731601, 5682)
-    femmesh.addNode(-1.6993136905751438, -4.151134478292416, 19.962034503287313, 5683)
-    femmesh.addNode(3.899707463200714, -2.23198297778515, 49.25144808578063, 5684)
-    femmesh.addNode(3.55180594204755, -2.7288105606881317, 48.378766734870354, 5685)
-    femmesh.addNode(-3.7532651143601603, 2.41476363952905, 12.334241165486329, 5686)
-    femmesh.addNode(-3.6816114788365573, 2.492948324615429, 11.525630383067995, 5687)
-    femmesh.addNode(-4.4097756820635485, 0.6466858377151116, 6.401620744967364, 5688)
-    femmesh.addNode(2.3049265267720007, 3.7412901658422744, 33.786747668007834, 5689)
-    femmesh.addNode(-4.338686859914592, -1.1752941551322897, 19.268144979926454, 5690)
-    femmesh.addNode(-2.953013491832179, 3.32748633002244, 20.068898168279333, 5691)
-    femmesh.addNode(3.4422477095865274, -2.8844210182341667, 7.9679845002707195, 5692)
-    femmesh.addNode(2.9290361751984415, -3.406003054581787, 12.884587231373613, 5693)
-    femmesh.addNode(-3.9015834183489595, 2.0314100049799926, 17.382937450151353, 5694)
-    femmesh.addNode(-4.311952448459173, -1.2571481308372032, 15.519071830519838, 5695)
-    femmesh.addNode(-1.595863790209401, -4.177488089925843, 26.813704876064847, 5696)
-    femmesh.addNode(3.46079630676007, -2.8439947836212314, 13.33533966371325, 5697)
-    femmesh.addNode(-0.5998391885341308, -4.3871500241491965, 6.720761840917872, 5698)
-    femmesh.addNode(-3.981783029917854, -1.9229911997180191, 26.984673408071504, 5699)
-    femmesh.addNode(-3.9553279274327626, 1.9322499567606677, 37.477570300693785, 5700)
-    femmesh.addNode(-4.279790158264828, 1.368229208823708, 29.62254368252148, 5701)
-    femmesh.addNode(2.7527599118450112, -3.531878788819354, 31.626036636472655, 5702)
-    femmesh.addNode(2.0679488393110823, -3.9691931550268715, 31.153166585145225, 5703)
-    femmesh.addNode(-3.8365689405456873, 2.095169042725209, 10.568748989963101, 5704)
-    femmesh.addNode(2.736358793196661, -3.54769275494339, 30.749265900704202, 5705)
-    femmesh.addNode(-2.790053129568864, -3.4504852506173105, 39.10767995854713, 5706)
-    femmesh.addNode(-3.1415837689416444, -3.2010937342473276, 39.88695138946326, 5707)
-    femmesh.addNode(-3.948688768753863, 2.0207790002508697, 36.616591704897985, 5708)
-    femmesh.addNode(4.346525183361589, 1.545247697529886, 48.86923421545834, 5709)
-    femmesh.addNode(-3.5054557702887283, 2.820958491474646, 26.896563933623558, 5710)
-    femmesh.addNode(-2.9433826790626183, 3.3459204273594287, 27.34911568836943, 5711)
-    femmesh.addNode(-2.2872519059137346, 3.8588435648145376, 21.374339308914998, 5712)
-    femmesh.addNode(-0.778084329093499, 4.401524085273622, 16.870166963223532, 5713)
-    femmesh.addNode(4.176171202316354, 0.3044561771844647, 48.77146853699902, 5714)
-    femmesh.addNode(-1.0448287251390205, -4.332949502025463, 40.84734459893642, 5715)
-    femmesh.addNode(-2.8377261408818035, 3.3450329094946056, 30.090072603770977, 5716)
-    femmesh.addNode(-3.912257548422601, 2.051413236957824, 24.627380507141517, 5717)
-    femmesh.addNode(4.595401045090577, -0.3258825950885175, 49.00714419416733, 5718)
-    femmesh.addNode(-2.950535383197765, 3.346152232003088, 31.95957676280484, 5719)
-    femmesh.addNode(-2.9103348990890217, 3.373389881659283, 31.064344270142776, 5720)
-    femmesh.addNode(-0.93430897795083, -4.36050128192453, 24.28472945230453, 5721)
-    femmesh.addNode(4.233600334955102, 1.5140586274370866, 30.334058550453797, 5722)
-    femmesh.addNode(-0.8822144429367836, -4.377343594805565, 26.203561230627752, 5723)
-    femmesh.addNode(4.350232723063105, 0.759367414698899, 29.865360500233606, 5724)
-    femmesh.addNode(-3.3707777430630506, 2.908241039414525, 41.572552273841055, 5725)
-    femmesh.addNode(4.377726076992707, -0.7722814919372805, 6.692847884339297, 5726)
-    femmesh.addNode(-4.1297214367614385, 1.7875683764779922, 49.19655092331452, 5727)
-    femmesh.addNode(-2.0271188970901983, -4.015469224589215, 1.5816701925264791, 5728)
-    femmesh.addNode(-1.585964407949525, -4.200650580091302, 0.7760371956030514, 5729)
-    femmesh.addNode(3.9048055534903625, 2.18326330521798, 27.21465401282269, 5730)
-    femmesh.addNode(4.232546871130733, 1.5150043972805713, 12.540494321573387, 5731)
-    femmesh.addNode(-2.9409843520730767, 3.3459708883540826, 29.194060478632288, 5732)
-    femmesh.addNode(-3.511913960568626, 2.8116625786654605, 24.1038591800492, 5733)
-    femmesh.addNode(-4.0837642837595105, -1.7283728502487945, 22.858540124356455, 5734)
-    femmesh.addNode(-3.001177135888682, 3.35035456323787, 5.407232447410391, 5735)
-    femmesh.addNode(-3.24840827754781, 3.0797136994865983, 6.2536952598815345, 5736)
-    femmesh.addNode(3.390465235503621, -2.9396810875461217, 32.069546827298105, 5737)
-    femmesh.addNode(4.712818076959721, -0.15626899236670858, 0.4458685054044098, 5738)
-    femmesh.addNode(-3.5232938993800733, -2.776942884086548, 12.817513990976085, 5739)
-    femmesh.addNode(-3.556890305053469, 2.754356216578218, 15.09056617855667, 5740)
-    femmesh.addNode(4.354112860183587, 0.8415180577493571, 46.639693791699536, 5741)
-    femmesh.addNode(2.1909619051666893, -3.801739460191717, 37.5214325797011, 5742)
-    femmesh.addNode(3.3740641168552705, -2.955495053670158, 31.192776091529655, 5743)
-    femmesh.addNode(1.5074970969491297, -4.238918881918922, 20.031773537127307, 5744)
-    femmesh.addNode(4.4425098320873015, 0.5330532057467274, 3.276269827197611, 5745)
-    femmesh.addNode(4.40464253598381, 0.6838817691219368, 4.0117697785423445, 5746)
-    femmesh.addNode(2.7875013825561616, 3.5145307444215916, 5.747655924691805, 5747)
-    femmesh.addNode(-4.134012708595612, -1.7387787085754378, 0.8189200619063758, 5748)
-    femmesh.addNode(3.8882646876112608, -2.2165108218589507, 18.27129998803354, 5749)
-    femmesh.addNode(4.238052601494262, 1.4978989584880464, 23.159398440282914, 5750)
-    femmesh.addNode(-1.4023706397739835, -4.246780438919898, 12.915321522952604, 5751)
-    femmesh.addNode(-4.110951856205319, -1.6941022211121606, 7.145276497201515, 5752)
-    femmesh.addNode(-1.8786565220136282, -4.072993545966765, 41.18757285942527, 5753)
-    femmesh.addNode(-4.451152384503269, -0.36237199546871524, 18.70482134024178, 5754)
-    femmesh.addNode(-3.408956389832264, -2.8054456808531834, 3.150263744622343, 5755)
-    femmesh.addNode(-4.436506202633865, -0.7242396134675602, 23.299007659538468, 5756)
-    femmesh.addNode(3.8571459712004144, 2.2896887738569673, 0.750214179976684, 5757)
-    femmesh.addNode(-2.304611206310345, 3.850437853228565, 22.28925290922834, 5758)
-    femmesh.addNode(-2.727342374852866, -3.468123282413747, 4.697311608592887, 5759)
-    femmesh.addNode(-3.5424320827749547, 2.7747024198168484, 20.49202538043064, 5760)
-    femmesh.addNode(0.5846391584020149, -4.393954124991876, 32.95825453286733, 5761)
-    femmesh.addNode(0.6595344048283953, -4.371148717462682, 25.11108370469742, 5762)
-    femmesh.addNode(3.8781781913021174, 2.2255149592487617, 5.622820817415299, 5763)
-    femmesh.addNode(-3.8840153579113936, 2.142795267854464, 27.329738435363005, 5764)
-    femmesh.addNode(-4.30507103494168, -1.3006548334955461, 1.5749549756317012, 5765)
-    femmesh.addNode(1.4627958891002422, -4.251222069153553, 11.075599639614252, 5766)
-    femmesh.addNode(1.2157292073352206, -4.317771946580507, 30.893667092326925, 5767)
-    femmesh.addNode(-3.51489944569623, 2.8077680826572884, 31.492662495121454, 5768)
-    femmesh.addNode(-3.9265729902687685, 2.0042803444305934, 31.993357512587632, 5769)
-    femmesh.addNode(2.5355129480835625, -3.617478020649915, 3.189797191446903, 5770)
-    femmesh.addNode(4.4425098320873015, 0.5330532057467274, 2.3512698271976107, 5771)
-    femmesh.addNode(-4.145382328467126, -1.7265469326496476, 47.64684905770799, 5772)
-    femmesh.addNode(-3.1187582824807647, -3.209393882373503, 49.23189555874811, 5773)
-    femmesh.addNode(-4.4133077182746945, -0.8367004541942372, 2.3984892813982555, 5774)
-    femmesh.addNode(-4.1614699216941435, -1.7107584366276145, 12.171682547711466, 5775)
-    femmesh.addNode(2.8150433700110247, 3.4878724319351813, 6.6748085508534265, 5776)
-    femmesh.addNode(-1.5911792499923396, 4.207150382778249, 5.160716883924014, 5777)
-    femmesh.addNode(4.5, -1.102182119232618e-15, 2.675, 5778)
-    femmesh.addNode(-2.520102348177855, 3.70644590955773, 6.188845357862218, 5779)
-    femmesh.addNode(-2.2304502334549454, 3.847344278930024, 5.318636284921732, 5780)
-    femmesh.addNode(-1.880831364715249, 4.066252013405954, 6.030925956864499, 5781)
-    femmesh.addNode(-1.5386449920984306, 4.202693997125183, 0.7459794219473314, 5782)
-    femmesh.addNode(-1.070882404536542, 4.279460404313862, 1.5658509950902806, 5783)
-    femmesh.addNode(1.7208335542408184, 4.154366652170723, 32.98339272825204, 5784)
-    femmesh.addNode(4.340797762433462, -0.7819613787265711, 33.40984494938253, 5785)
-    femmesh.addNode(0.3811021488918853, -4.444848923781878, 31.348223135330436, 5786)
-    femmesh.addNode(4.388279315217915, -0.7390006173896283, 43.24422634185862, 5787)
-    femmesh.addNode(0.9206737391796682, 4.3531670505870945, 13.480906507382661, 5788)
-    femmesh.addNode(4.211740796375896, -1.5748227347024109, 33.88151182051233, 5789)
-    femmesh.addNode(4.385504124273148, 0.7479104712970658, 13.865784116665361, 5790)
-    femmesh.addNode(3.834398916715121, -2.2904554747199355, 33.42167277127038, 5791)
-    femmesh.addNode(-4.422516147653708, -0.7998514077033836, 3.9557782911600192, 5792)
-    femmesh.addNode(-0.6421622206940153, 4.4375335924241135, 0.8198715731429493, 5793)
-    femmesh.addNode(-2.952464075047783, 3.344841003332938, 22.78884001091074, 5794)
-    femmesh.addNode(3.371307119094719, -2.9763349043542506, 47.38826260591205, 5795)
-    femmesh.addNode(2.2090776620063064, 3.882971584092922, 10.8040453304821, 5796)
-    femmesh.addNode(-0.7302442201486977, 4.405578845579161, 25.89880866938775, 5797)
-    femmesh.addNode(3.867671195237551, -2.2443235514314273, 39.740397756981594, 5798)
-    femmesh.addNode(3.2511829798111185, 3.109512869252585, 2.283824972748373, 5799)
-    femmesh.addNode(-2.6721960173437993, 3.574189147799493, 4.6549712875254325, 5800)
-    femmesh.addNode(4.381648254742854, 0.7600997241680318, 12.048804992390519, 5801)
-    femmesh.addNode(3.379320419409207, 2.9474268366407723, 6.233808163853103, 5802)
-    femmesh.addNode(2.880745040692999, -3.443288123004507, 37.99424830721246, 5803)
-    femmesh.addNode(-2.61587077758277, -3.538614527041492, 7.944743778256711, 5804)
-    femmesh.addNode(2.180082370344164, -3.8869840412812255, 38.42372179762325, 5805)
-    femmesh.addNode(-4.480303178239028, -0.33108976057044304, 6.379170488331129, 5806)
-    femmesh.addNode(-4.495525648954674, 0.12948862079298018, 5.536360283407409, 5807)
-    femmesh.addNode(-4.367282374167168, -0.822041425773221, 5.504664102949357, 5808)
-    femmesh.addNode(3.4256735670826606, 2.898715918768417, 9.901850476116064, 5809)
-    femmesh.addNode(3.8370166915852244, 2.279830260365004, 9.397448078607301, 5810)
-    femmesh.addNode(-4.440461072771157, -0.3183760916798615, 4.776941299063149, 5811)
-    femmesh.addNode(-4.289987895245345, -1.2691789022370121, 12.937716667462702, 5812)
-    femmesh.addNode(-2.9820927336558425, 3.3158155167946215, 17.32646100165887, 5813)
-    femmesh.addNode(-1.1045270148767397, 4.307653959881072, 4.626410466815775, 5814)
-    femmesh.addNode(-2.7065068382235857, 3.528740154520725, 7.007826315612109, 5815)
-    femmesh.addNode(-1.017205139608917, -4.335029636495159, 39.91280916196296, 5816)
-    femmesh.addNode(0.7271324237347453, 4.372196305191408, 12.595384512267302, 5817)
-    femmesh.addNode(2.338538621113597, -3.76430107791791, 43.76901081323194, 5818)
-    femmesh.addNode(4.226401785901914, -1.5323252901646072, 10.698038505849716, 5819)
-    femmesh.addNode(4.203476312023552, -1.5977738444801726, 30.27963057583185, 5820)
-    femmesh.addNode(-3.591194931969873, 2.711548952837015, 38.009572563887076, 5821)
-    femmesh.addNode(-3.9466108094624284, 2.043888306247469, 38.50593522215914, 5822)
-    return True
+    return load_mesh(femmesh, __name__, elements=False)
 
 
 def create_elements(femmesh):
     # elements
-    femmesh.addVolume([242, 188, 501, 168, 1521, 3936, 3935, 1471, 1337, 3937], 2085)
-    femmesh.addVolume([526, 25, 26, 137, 3938, 1007, 3939, 3940, 1165, 1166], 2086)
-    femmesh.addVolume([210, 279, 280, 678, 1603, 1607, 1605, 3941, 3942, 3943], 2087)
-    femmesh.addVolume([769, 786, 270, 715, 3280, 3945, 3944, 3225, 3279, 3946], 2088)
-    femmesh.addVolume([114, 562, 115, 29, 2575, 2576, 1101, 3947, 3948, 3949], 2089)
-    femmesh.addVolume([293, 694, 744, 743, 3950, 3147, 3951, 3952, 3145, 3149], 2090)
-    femmesh.addVolume([562, 114, 561, 186, 2575, 2573, 2577, 3953, 3954, 3955], 2091)
-    femmesh.addVolume([115, 529, 30, 116, 2483, 3957, 3956, 1102, 2482, 3958], 2092)
-    femmesh.addVolume([272, 672, 203, 673, 3959, 3961, 1582, 3960, 2933, 3962], 2093)
-    femmesh.addVolume([841, 796, 336, 795, 3459, 3964, 3963, 3460, 3405, 3965], 2094)
-    femmesh.addVolume([337, 796, 336, 841, 3966, 3964, 1782, 3967, 3459, 3963], 2095)
-    femmesh.addVolume([661, 233, 586, 585, 3968, 3969, 2903, 2902, 3970, 2669], 2096)
-    femmesh.addVolume([467, 491, 468, 976, 2294, 2295, 2192, 3971, 3972, 3973], 2097)
-    femmesh.addVolume([804, 321, 746, 745, 3974, 3975, 3334, 3333, 3976, 3155], 2098)
-    femmesh.addVolume([873, 496, 909, 915, 3977, 3978, 3679, 3693, 3979, 3692], 2099)
-    femmesh.addVolume([167, 562, 115, 583, 3980, 2576, 3981, 3982, 2660, 2627], 2100)
-    femmesh.addVolume([745, 321, 746, 696, 3976, 3975, 3155, 3151, 3983, 3153], 2101)
-    femmesh.addVolume([980, 491, 976, 468, 3984, 3972, 3923, 3985, 2295, 3973], 2102)
-    femmesh.addVolume([970, 980, 976, 468, 3918, 3923, 3897, 3986, 3985, 3973], 2103)
-    femmesh.addVolume([574, 26, 137, 526, 3987, 1166, 3988, 2637, 3939, 3940], 2104)
-    femmesh.addVolume([906, 447, 454, 404, 3989, 2145, 3990, 3991, 2122, 2144], 2105)
-    femmesh.addVolume([868, 384, 383, 335, 3992, 1930, 3993, 3994, 1928, 1926], 2106)
-    femmesh.addVolume([166, 560, 28, 561, 3995, 3997, 1241, 3996, 2574, 3998], 2107)
-    femmesh.addVolume([558, 184, 165, 25, 3999, 1325, 4000, 4001, 1285, 1240], 2108)
-    femmesh.addVolume([840, 420, 451, 888, 4002, 2136, 4003, 3610, 4004, 4005], 2109)
-    femmesh.addVolume([296, 758, 759, 817, 4006, 3194, 4007, 4008, 3372, 3373], 2110)
-    femmesh.addVolume([837, 844, 462, 891, 3473, 4010, 4009, 3620, 3621, 4011], 2111)
-    femmesh.addVolume([782, 279, 678, 280, 4012, 3942, 3263, 4013, 1607, 3943], 2112)
-    femmesh.addVolume([331, 379, 878, 330, 1914, 4015, 4014, 1764, 1913, 4016], 2113)
-    femmesh.addVolume([98, 546, 99, 13, 2527, 2528, 1085, 4017, 4018, 4019], 2114)
-    femmesh.addVolume([221, 287, 612, 313, 1625, 4021, 4020, 1704, 1717, 4022], 2115)
-    femmesh.addVolume([687, 297, 726, 711, 4023, 4024, 3197, 3042, 4025, 3273], 2116)
-    femmesh.addVolume([430, 431, 927, 468, 2073, 4027, 4026, 2190, 2191, 4028], 2117)
-    femmesh.addVolume([826, 877, 836, 438, 3575, 3576, 3446, 4029, 4030, 4031], 2118)
-    femmesh.addVolume([606, 133, 524, 607, 4032, 4033, 2720, 2869, 4034, 2723], 2119)
-    femmesh.addVolume([975, 957, 487, 977, 3896, 4036, 4035, 3920, 3900, 4037], 2120)
-    femmesh.addVolume([947, 426, 921, 952, 4038, 4039, 3813, 3817, 4040, 3816], 2121)
-    femmesh.addVolume([947, 425, 426, 952, 4041, 2058, 4038, 3817, 4042, 4040], 2122)
-    femmesh.addVolume([695, 252, 228, 322, 4043, 1496, 4044, 4045, 1736, 1734], 2123)
-    femmesh.addVolume([166, 186, 561, 28, 1316, 3955, 3996, 1241, 1290, 3998], 2124)
-    femmesh.addVolume([199, 268, 740, 689, 1570, 4048, 4046, 4047, 4049, 3137], 2125)
-    femmesh.addVolume([231, 324, 691, 229, 1742, 4051, 4050, 1446, 1741, 4052], 2126)
-    femmesh.addVolume([241, 726, 259, 647, 4053, 4055, 1533, 4054, 3101, 4056], 2127)
-    femmesh.addVolume([819, 329, 874, 328, 4057, 4059, 3566, 4058, 1758, 4060], 2128)
-    femmesh.addVolume([942, 459, 424, 954, 4061, 2169, 4062, 3823, 4063, 4064], 2129)
-    femmesh.addVolume([379, 380, 878, 911, 1918, 4066, 4015, 4065, 4067, 3682], 2130)
-    femmesh.addVolume([593, 249, 261, 295, 4068, 1553, 4069, 4070, 1644, 1645], 2131)
-    femmesh.addVolume([463, 975, 952, 968, 4071, 3933, 4072, 4073, 3924, 3886], 2132)
-    femmesh.addVolume([903, 904, 861, 399, 3661, 3659, 3657, 4074, 4075, 4076], 2133)
-    femmesh.addVolume([439, 395, 791, 407, 2096, 4078, 4077, 2097, 1999, 4079], 2134)
-    femmesh.addVolume([983, 981, 481, 470, 2330, 4082, 4080, 4081, 4083, 2299], 2135)
-    femmesh.addVolume([516, 73, 193, 537, 2578, 4085, 4084, 2625, 2502, 4086], 2136)
-    femmesh.addVolume([150, 535, 580, 223, 4087, 2659, 4088, 1424, 4089, 4090], 2137)
-    femmesh.addVolume([521, 602, 127, 603, 2712, 4092, 4091, 2715, 2862, 4093], 2138)
-    femmesh.addVolume([210, 656, 678, 608, 4094, 2945, 3941, 4095, 2899, 2944], 2139)
-    femmesh.addVolume([695, 694, 228, 630, 2993, 4096, 4044, 2991, 2989, 4097], 2140)
-    femmesh.addVolume([425, 463, 426, 952, 2176, 2177, 2058, 4042, 4072, 4040], 2141)
-    femmesh.addVolume([205, 604, 130, 129, 4098, 4099, 1371, 1370, 4100, 1146], 2142)
-    femmesh.addVolume([497, 958, 930, 959, 4101, 3836, 4102, 4103, 3840, 3838], 2143)
-    femmesh.addVolume([323, 694, 693, 226, 4104, 2990, 4105, 1737, 4106, 4107], 2144)
-    femmesh.addVolume([701, 315, 253, 234, 4108, 1707, 4109, 4110, 1708, 1500], 2145)
-    femmesh.addVolume([604, 205, 130, 605, 4098, 1371, 4099, 2859, 4111, 4112], 2146)
-    femmesh.addVolume([194, 684, 597, 621, 4113, 2962, 4114, 4115, 2963, 2892], 2147)
-    femmesh.addVolume([158, 629, 544, 630, 4116, 2780, 4117, 4118, 2784, 2782], 2148)
-    femmesh.addVolume([411, 826, 765, 361, 4119, 3407, 4120, 2025, 4121, 4122], 2149)
-    femmesh.addVolume([871, 840, 451, 888, 3559, 4003, 4123, 3613, 3610, 4005], 2150)
-    femmesh.addVolume([245, 660, 611, 727, 4124, 2901, 4125, 4126, 3105, 3103], 2151)
-    femmesh.addVolume([522, 18, 570, 129, 4127, 4129, 2633, 4128, 1142, 4130], 2152)
-    femmesh.addVolume([860, 813, 349, 358, 3520, 4133, 4131, 4132, 4134, 1894], 2153)
-    femmesh.addVolume([12, 519, 97, 11, 4135, 2462, 4136, 993, 4137, 4138], 2154)
-    femmesh.addVolume([549, 16, 17, 102, 4139, 998, 4140, 2537, 4141, 4142], 2155)
-    femmesh.addVolume([508, 191, 591, 509, 4143, 4144, 2682, 2435, 4145, 2683], 2156)
-    femmesh.addVolume([441, 857, 858, 900, 4146, 3515, 4147, 4148, 3647, 3648], 2157)
-    femmesh.addVolume([667, 763, 784, 351, 3204, 3282, 3272, 4149, 4150, 4151], 2158)
-    femmesh.addVolume([414, 444, 843, 457, 2112, 4153, 4152, 2157, 2158, 4154], 2159)
-    femmesh.addVolume([458, 417, 890, 882, 2160, 4157, 4155, 4156, 4158, 3619], 2160)
-    femmesh.addVolume([925, 458, 890, 882, 4159, 4155, 3727, 3726, 4156, 3619], 2161)
-    femmesh.addVolume([419, 848, 417, 882, 4160, 4162, 2038, 4161, 3593, 4158], 2162)
-    femmesh.addVolume([544, 96, 11, 97, 2521, 4164, 4163, 2522, 1083, 4138], 2163)
-    femmesh.addVolume([860, 903, 861, 401, 3656, 3657, 3524, 4165, 4166, 4167], 2164)
-    femmesh.addVolume([980, 494, 963, 962, 4168, 4169, 3912, 3911, 4170, 3852], 2165)
-    femmesh.addVolume([620, 241, 167, 647, 4171, 1466, 4172, 2835, 4054, 4173], 2166)
-    femmesh.addVolume([168, 500, 75, 501, 4174, 2408, 4175, 3937, 2411, 2409], 2167)
-    femmesh.addVolume([136, 573, 526, 110, 4176, 2651, 4177, 4178, 2599, 2477], 2168)
-    femmesh.addVolume([925, 493, 924, 966, 4179, 4180, 3780, 3860, 4181, 3859], 2169)
-    femmesh.addVolume([19, 552, 20, 162, 4182, 4183, 1001, 1234, 4184, 1233], 2170)
-    femmesh.addVolume([980, 983, 963, 494, 2335, 3932, 3912, 4168, 4185, 4169], 2171)
-    femmesh.addVolume([177, 628, 157, 543, 4186, 4188, 1307, 4187, 2777, 4189], 2172)
-    femmesh.addVolume([422, 496, 909, 873, 2289, 3978, 4190, 4191, 3977, 3679], 2173)
-    femmesh.addVolume([365, 865, 817, 790, 4192, 3534, 4193, 4194, 3535, 3436], 2174)
-    femmesh.addVolume([530, 59, 577, 143, 2488, 2609, 2610, 4195, 4196, 4197], 2175)
-    femmesh.addVolume([335, 868, 795, 828, 3994, 3548, 4198, 4199, 3549, 3413], 2176)
-    femmesh.addVolume([177, 254, 628, 629, 1502, 4201, 4186, 4200, 4202, 2781], 2177)
-    femmesh.addVolume([639, 236, 182, 638, 4203, 1455, 4204, 2811, 4205, 4206], 2178)
-    femmesh.addVolume([35, 63, 146, 36, 2371, 4207, 1192, 1018, 2352, 1193], 2179)
-    femmesh.addVolume([950, 924, 916, 498, 3811, 3721, 3810, 4208, 4209, 4210], 2180)
-    femmesh.addVolume([287, 612, 723, 616, 4021, 3088, 4211, 4212, 2744, 3087], 2181)
-    femmesh.addVolume([810, 811, 363, 858, 3356, 4214, 4213, 3513, 3514, 4215], 2182)
-    femmesh.addVolume([948, 466, 429, 955, 4216, 2185, 4217, 3827, 4218, 4219], 2183)
-    femmesh.addVolume([216, 659, 215, 713, 4220, 4222, 1405, 4221, 3047, 4223], 2184)
-    femmesh.addVolume([257, 705, 641, 237, 4224, 3022, 4225, 1551, 4226, 4227], 2185)
-    femmesh.addVolume([558, 111, 165, 559, 2564, 4228, 4000, 2568, 2566, 4229], 2186)
-    femmesh.addVolume([529, 31, 142, 30, 4230, 1181, 4231, 3957, 1012, 1180], 2187)
-    femmesh.addVolume([222, 722, 613, 616, 4232, 3084, 4233, 4234, 3085, 2745], 2188)
-    femmesh.addVolume([755, 813, 814, 358, 3361, 3365, 3363, 4235, 4134, 4236], 2189)
-    femmesh.addVolume([621, 320, 725, 225, 4237, 4239, 3096, 4238, 1727, 4240], 2190)
-    femmesh.addVolume([936, 903, 445, 937, 3762, 4242, 4241, 3766, 3764, 4243], 2191)
-    femmesh.addVolume([21, 106, 20, 132, 4244, 4245, 1002, 1151, 4246, 1150], 2192)
-    femmesh.addVolume([529, 31, 515, 142, 4230, 4247, 2485, 4231, 1181, 4248], 2193)
-    femmesh.addVolume([876, 910, 886, 416, 3675, 3676, 3606, 4249, 4250, 4251], 2194)
-    femmesh.addVolume([678, 782, 280, 776, 3263, 4013, 3943, 3243, 3265, 4252], 2195)
-    femmesh.addVolume([964, 481, 476, 443, 4253, 2268, 4254, 4255, 2230, 2218], 2196)
-    femmesh.addVolume([918, 474, 877, 448, 4256, 4258, 3702, 4257, 2285, 4259], 2197)
-    femmesh.addVolume([758, 708, 757, 292, 3189, 3187, 3191, 4260, 4261, 4262], 2198)
-    femmesh.addVolume([433, 953, 470, 471, 4263, 4264, 2197, 2199, 4265, 2201], 2199)
-    femmesh.addVolume([122, 623, 197, 198, 4266, 4267, 1347, 1349, 4268, 1351], 2200)
-    femmesh.addVolume([150, 67, 68, 39, 4269, 1052, 4270, 1203, 2359, 2374], 2201)
-    femmesh.addVolume([532, 576, 146, 63, 2606, 4272, 4271, 2492, 2605, 4207], 2202)
-    femmesh.addVolume([956, 488, 949, 944, 4273, 4274, 2341, 3888, 4275, 3807], 2203)
-    femmesh.addVolume([496, 474, 918, 448, 2318, 4256, 4276, 2288, 2285, 4257], 2204)
-    femmesh.addVolume([918, 873, 448, 877, 3701, 4277, 4257, 3702, 3578, 4259], 2205)
-    femmesh.addVolume([540, 7, 175, 156, 4278, 1267, 4279, 4280, 1222, 1268], 2206)
-    femmesh.addVolume([873, 826, 448, 877, 3565, 4281, 4277, 3578, 3575, 4259], 2207)
-    femmesh.addVolume([529, 142, 141, 30, 4231, 1182, 4282, 3957, 1180, 1178], 2208)
-    femmesh.addVolume([626, 540, 156, 541, 2770, 4280, 4283, 2771, 2514, 4284], 2209)
-    femmesh.addVolume([95, 543, 96, 10, 2518, 2519, 1082, 4285, 4286, 4287], 2210)
-    femmesh.addVolume([694, 629, 693, 226, 2988, 2986, 2990, 4106, 4288, 4107], 2211)
-    femmesh.addVolume([914, 474, 918, 951, 4289, 4256, 3703, 3814, 4290, 3889], 2212)
-    femmesh.addVolume([593, 510, 592, 261, 2688, 2686, 2690, 4069, 4291, 4292], 2213)
-    femmesh.addVolume([279, 782, 340, 280, 4012, 4293, 1789, 1607, 4013, 1790], 2214)
-    femmesh.addVolume([939, 948, 429, 955, 3803, 4217, 4294, 3826, 3827, 4219], 2215)
-    femmesh.addVolume([436, 951, 474, 914, 4295, 4290, 2208, 4296, 3814, 4289], 2216)
-    femmesh.addVolume([611, 578, 622, 218, 2730, 2757, 2888, 4297, 4298, 4299], 2217)
-    femmesh.addVolume([645, 560, 559, 185, 2828, 2571, 2827, 4300, 4301, 4302], 2218)
-    femmesh.addVolume([923, 447, 905, 938, 4303, 4304, 3724, 3771, 4305, 3770], 2219)
-    femmesh.addVolume([976, 467, 979, 955, 3971, 4306, 3919, 3898, 4307, 3922], 2220)
-    femmesh.addVolume([423, 904, 905, 938, 4308, 3699, 4309, 4310, 3769, 3770], 2221)
-    femmesh.addVolume([848, 851, 803, 373, 3550, 3493, 3489, 4311, 4312, 4313], 2222)
-    femmesh.addVolume([760, 351, 325, 295, 4314, 1822, 4315, 4316, 1820, 1748], 2223)
-    femmesh.addVolume([465, 978, 490, 974, 4317, 4319, 2292, 4318, 3903, 4320], 2224)
-    femmesh.addVolume([964, 481, 443, 935, 4253, 2230, 4255, 3853, 4321, 4322], 2225)
-    femmesh.addVolume([711, 243, 297, 306, 4323, 1684, 4025, 4324, 1676, 1733], 2226)
-    femmesh.addVolume([758, 296, 759, 709, 4006, 4007, 3194, 3190, 4325, 3192], 2227)
-    femmesh.addVolume([249, 302, 669, 594, 1666, 4328, 4326, 4327, 4329, 2922], 2228)
-    femmesh.addVolume([466, 467, 429, 955, 2189, 2187, 2185, 4218, 4307, 4219], 2229)
-    femmesh.addVolume([854, 807, 369, 855, 3502, 4331, 4330, 3506, 3504, 4332], 2230)
-    femmesh.addVolume([510, 84, 53, 85, 2436, 2392, 4333, 2437, 1070, 2391], 2231)
-    femmesh.addVolume([480, 961, 979, 960, 4334, 3908, 4335, 4336, 3846, 3907], 2232)
-    femmesh.addVolume([860, 401, 861, 358, 4165, 4167, 3524, 4132, 1982, 4337], 2233)
-    femmesh.addVolume([590, 507, 171, 508, 2679, 4339, 4338, 2680, 2432, 4340], 2234)
-    femmesh.addVolume([980, 491, 962, 976, 3984, 4341, 3911, 3923, 3972, 3910], 2235)
-    femmesh.addVolume([101, 549, 16, 548, 2536, 4139, 4342, 2534, 2538, 4343], 2236)
-    femmesh.addVolume([491, 961, 442, 933, 4344, 4346, 2260, 4345, 3845, 4347], 2237)
-    femmesh.addVolume([7, 540, 8, 156, 4278, 4348, 989, 1222, 4280, 1221], 2238)
-    femmesh.addVolume([428, 887, 429, 383, 4349, 4350, 2067, 2063, 4351, 2065], 2239)
-    femmesh.addVolume([441, 375, 857, 410, 2101, 4352, 4146, 2102, 2008, 4353], 2240)
-    femmesh.addVolume([467, 466, 979, 955, 2189, 4354, 4306, 4307, 4218, 3922], 2241)
-    femmesh.addVolume([428, 893, 941, 948, 4355, 3783, 4356, 4357, 3808, 3819], 2242)
-    femmesh.addVolume([466, 480, 979, 490, 2315, 4335, 4354, 2293, 2276, 4358], 2243)
-    femmesh.addVolume([82, 508, 83, 52, 2430, 2431, 1068, 2390, 4359, 2389], 2244)
-    femmesh.addVolume([881, 329, 874, 819, 4360, 4059, 3589, 3588, 4057, 3566], 2245)
-    femmesh.addVolume([399, 356, 861, 358, 1975, 4361, 4076, 1976, 1877, 4337], 2246)
-    femmesh.addVolume([333, 733, 831, 273, 4362, 3422, 4363, 1769, 4364, 4365], 2247)
-    femmesh.addVolume([979, 480, 960, 490, 4335, 4336, 3907, 4358, 2276, 4366], 2248)
-    femmesh.addVolume([947, 425, 968, 424, 4041, 4368, 3865, 4367, 2055, 4369], 2249)
-    femmesh.addVolume([939, 430, 883, 927, 4370, 4371, 3773, 3802, 4026, 3735], 2250)
-    femmesh.addVolume([114, 561, 28, 113, 2573, 3998, 4372, 1100, 2572, 4373], 2251)
-    femmesh.addVolume([980, 972, 469, 970, 2336, 4375, 4374, 3918, 3879, 4376], 2252)
-    femmesh.addVolume([735, 355, 820, 764, 4377, 4378, 3381, 3208, 4379, 3382], 2253)
-    femmesh.addVolume([81, 507, 82, 51, 2427, 2428, 1067, 2388, 4380, 2387], 2254)
-    femmesh.addVolume([74, 2, 984, 45, 2401, 4382, 4381, 2376, 1028, 4383], 2255)
-    femmesh.addVolume([764, 286, 735, 355, 4384, 4385, 3208, 4379, 1833, 4377], 2256)
-    femmesh.addVolume([5, 563, 1, 985, 4386, 4388, 986, 4387, 4389, 4390], 2257)
-    femmesh.addVolume([491, 961, 962, 976, 4344, 3849, 4341, 3972, 3909, 3910], 2258)
-    femmesh.addVolume([347, 300, 361, 765, 1810, 1853, 1854, 4391, 4392, 4122], 2259)
-    femmesh.addVolume([940, 470, 953, 972, 4393, 4264, 3862, 3880, 4394, 3902], 2260)
-    femmesh.addVolume([552, 551, 181, 19, 2547, 4396, 4395, 4182, 4397, 1279], 2261)
-    femmesh.addVolume([13, 99, 520, 14, 4019, 2464, 4398, 995, 4399, 4400], 2262)
-    femmesh.addVolume([125, 13, 520, 14, 1129, 4398, 4401, 1130, 995, 4400], 2263)
-    femmesh.addVolume([145, 144, 245, 531, 1263, 1479, 1480, 4402, 4403, 4404], 2264)
-    femmesh.addVolume([940, 470, 972, 432, 4393, 4394, 3880, 4405, 2196, 4406], 2265)
-    femmesh.addVolume([611, 305, 218, 622, 4407, 1674, 4297, 2888, 4408, 4299], 2266)
-    femmesh.addVolume([441, 375, 858, 857, 2101, 4409, 4147, 4146, 4352, 3515], 2267)
-    femmesh.addVolume([814, 813, 861, 358, 3365, 3522, 3523, 4236, 4134, 4337], 2268)
-    femmesh.addVolume([144, 60, 577, 531, 4410, 2611, 4411, 4403, 2491, 2612], 2269)
-    femmesh.addVolume([46, 76, 501, 75, 2377, 2410, 4412, 2378, 1061, 2409], 2270)
-    femmesh.addVolume([286, 346, 735, 355, 1837, 4413, 4385, 1833, 1852, 4377], 2271)
-    femmesh.addVolume([308, 727, 245, 614, 4414, 4126, 1681, 4415, 3104, 4416], 2272)
-    femmesh.addVolume([411, 826, 873, 838, 4119, 3565, 4417, 4418, 3452, 3564], 2273)
-    femmesh.addVolume([646, 186, 259, 647, 4419, 1534, 4420, 2836, 4421, 4056], 2274)
-    femmesh.addVolume([513, 56, 87, 173, 4422, 2396, 2445, 4423, 1256, 4424], 2275)
-    femmesh.addVolume([444, 885, 446, 886, 4425, 4427, 2119, 4426, 3605, 4428], 2276)
-    femmesh.addVolume([735, 306, 286, 661, 4429, 1677, 4385, 3123, 4430, 4431], 2277)
-    femmesh.addVolume([291, 613, 688, 220, 4432, 2973, 4433, 1636, 4434, 4435], 2278)
-    femmesh.addVolume([222, 148, 533, 613, 1421, 4437, 4436, 4233, 4438, 2735], 2279)
-    femmesh.addVolume([148, 579, 533, 613, 4439, 2640, 4437, 4438, 2734, 2735], 2280)
-    femmesh.addVolume([613, 617, 688, 220, 2882, 2972, 2973, 4434, 4440, 4435], 2281)
-    femmesh.addVolume([706, 642, 641, 237, 3025, 2820, 3024, 4441, 4442, 4227], 2282)
-    femmesh.addVolume([381, 892, 426, 427, 4443, 4444, 2057, 2059, 4445, 2061], 2283)
-    femmesh.addVolume([560, 27, 28, 113, 4446, 1009, 3997, 2570, 4447, 4373], 2284)
-    femmesh.addVolume([844, 408, 421, 779, 4448, 2044, 4449, 3472, 4450, 4451], 2285)
-    femmesh.addVolume([52, 84, 509, 83, 2405, 2434, 4452, 2389, 1069, 2433], 2286)
-    femmesh.addVolume([78, 48, 189, 79, 2381, 1297, 4453, 1064, 2402, 4454], 2287)
-    femmesh.addVolume([965, 981, 982, 476, 3913, 3926, 3928, 4455, 4456, 4457], 2288)
-    femmesh.addVolume([136, 137, 657, 212, 1167, 4459, 4458, 1391, 1392, 4460], 2289)
-    femmesh.addVolume([483, 419, 460, 888, 2235, 2165, 2238, 4461, 4462, 4463], 2290)
-    femmesh.addVolume([827, 844, 421, 779, 3542, 4449, 4464, 3440, 3472, 4451], 2291)
-    femmesh.addVolume([565, 518, 9, 94, 2626, 4466, 4465, 2583, 2461, 4467], 2292)
-    femmesh.addVolume([483, 888, 460, 924, 4461, 4463, 2238, 4468, 3722, 4469], 2293)
-    femmesh.addVolume([735, 306, 346, 286, 4429, 1808, 4413, 4385, 1677, 1837], 2294)
-    femmesh.addVolume([716, 650, 196, 717, 3060, 4471, 4470, 3130, 3075, 4472], 2295)
-    femmesh.addVolume([359, 318, 398, 739, 1845, 1972, 1973, 4473, 4474, 4475], 2296)
-    femmesh.addVolume([341, 390, 847, 850, 1946, 4478, 4476, 4477, 4479, 3492], 2297)
-    femmesh.addVolume([485, 966, 971, 478, 4480, 3914, 4481, 2243, 4482, 4483], 2298)
-    femmesh.addVolume([804, 348, 805, 746, 4484, 4485, 3338, 3334, 4486, 3336], 2299)
-    femmesh.addVolume([38, 579, 149, 66, 4487, 4488, 1201, 2357, 2616, 4489], 2300)
-    femmesh.addVolume([969, 465, 427, 941, 4490, 2181, 4491, 3867, 4492, 4493], 2301)
-    femmesh.addVolume([210, 279, 678, 680, 1603, 3942, 3941, 4494, 4495, 2951], 2302)
-    femmesh.addVolume([90, 193, 117, 516, 4496, 1511, 4497, 2457, 4084, 4498], 2303)
-    femmesh.addVolume([950, 499, 498, 492, 4499, 2333, 4208, 4500, 2325, 2324], 2304)
-    femmesh.addVolume([474, 949, 918, 951, 4501, 3806, 4256, 4290, 2343, 3889], 2305)
-    femmesh.addVolume([346, 780, 790, 264, 4502, 3293, 4503, 1812, 4504, 4505], 2306)
-    femmesh.addVolume([291, 222, 613, 220, 1635, 4233, 4432, 1636, 1515, 4434], 2307)
-    femmesh.addVolume([378, 881, 884, 329, 4506, 3599, 4507, 1910, 4360, 4508], 2308)
-    femmesh.addVolume([966, 498, 924, 950, 4509, 4209, 3859, 3861, 4208, 3811], 2309)
-    femmesh.addVolume([288, 615, 619, 223, 4510, 2885, 4511, 1627, 4512, 4513], 2310)
-    femmesh.addVolume([232, 180, 635, 634, 1447, 4516, 4514, 4515, 4517, 2799], 2311)
-    femmesh.addVolume([758, 708, 239, 709, 3189, 4519, 4518, 3190, 3035, 4520], 2312)
-    femmesh.addVolume([536, 225, 624, 152, 4521, 4523, 2762, 4522, 1429, 4524], 2313)
-    femmesh.addVolume([255, 150, 534, 580, 1507, 4527, 4525, 4526, 4088, 2641], 2314)
-    femmesh.addVolume([104, 552, 105, 19, 2545, 2546, 1091, 4528, 4182, 4529], 2315)
-    femmesh.addVolume([331, 849, 878, 834, 4530, 3580, 4014, 4531, 3488, 3579], 2316)
-    femmesh.addVolume([653, 125, 601, 200, 4532, 4534, 2889, 4533, 1356, 4535], 2317)
-    femmesh.addVolume([290, 749, 807, 748, 4536, 3343, 4537, 4538, 3164, 3342], 2318)
-    femmesh.addVolume([274, 334, 781, 273, 1772, 4540, 4539, 1589, 1771, 4541], 2319)
-    femmesh.addVolume([730, 665, 765, 361, 3113, 3210, 3211, 4542, 4543, 4122], 2320)
-    femmesh.addVolume([178, 631, 228, 630, 4544, 4546, 1437, 4545, 2787, 4097], 2321)
-    femmesh.addVolume([505, 246, 170, 189, 4547, 1482, 4548, 4549, 1483, 1329], 2322)
-    femmesh.addVolume([12, 158, 545, 178, 1225, 4551, 4550, 1274, 1308, 4552], 2323)
-    femmesh.addVolume([978, 464, 489, 977, 4553, 2319, 4554, 3925, 4555, 4556], 2324)
-    femmesh.addVolume([475, 407, 869, 836, 2211, 4559, 4557, 4558, 4560, 3551], 2325)
-    femmesh.addVolume([243, 188, 169, 502, 1473, 1328, 1472, 4561, 4562, 4563], 2326)
-    femmesh.addVolume([675, 205, 204, 604, 4564, 1372, 4565, 2936, 4098, 4566], 2327)
-    femmesh.addVolume([280, 678, 776, 682, 3943, 3243, 4252, 4567, 2956, 3242], 2328)
-    femmesh.addVolume([551, 18, 181, 19, 4568, 1280, 4396, 4397, 1000, 1279], 2329)
-    femmesh.addVolume([957, 489, 487, 977, 4569, 2255, 4036, 3900, 4556, 4037], 2330)
-    femmesh.addVolume([464, 978, 497, 465, 4553, 4570, 2290, 2183, 4317, 2291], 2331)
-    femmesh.addVolume([796, 337, 338, 833, 3966, 1785, 4571, 3428, 4572, 4573], 2332)
-    femmesh.addVolume([264, 726, 780, 766, 4574, 3415, 4504, 4575, 3215, 3400], 2333)
-    femmesh.addVolume([521, 15, 16, 127, 4576, 997, 4577, 4091, 1135, 1136], 2334)
-    femmesh.addVolume([213, 771, 282, 283, 4578, 4579, 1612, 1614, 4580, 1616], 2335)
-    femmesh.addVolume([426, 425, 911, 380, 2058, 4582, 4581, 2056, 2054, 4067], 2336)
-    femmesh.addVolume([166, 560, 561, 646, 3995, 2574, 3996, 4583, 2830, 2831], 2337)
-    femmesh.addVolume([90, 5, 193, 985, 4584, 1306, 4496, 4585, 4387, 4586], 2338)
-    femmesh.addVolume([744, 745, 322, 803, 3152, 4588, 4587, 3330, 3331, 4589], 2339)
-    femmesh.addVolume([411, 826, 448, 873, 4119, 4281, 2125, 4417, 3565, 4277], 2340)
-    femmesh.addVolume([348, 804, 321, 746, 4484, 3974, 1814, 4486, 3334, 3975], 2341)
-    femmesh.addVolume([929, 928, 957, 449, 3742, 3833, 3834, 4590, 4591, 4592], 2342)
-    femmesh.addVolume([659, 216, 140, 141, 4220, 1403, 4593, 4594, 1404, 1179], 2343)
-    femmesh.addVolume([15, 521, 126, 127, 4576, 4595, 1133, 1135, 4091, 1137], 2344)
-    femmesh.addVolume([892, 846, 380, 911, 3624, 4597, 4596, 3685, 3681, 4067], 2345)
-    femmesh.addVolume([403, 840, 871, 801, 4598, 3559, 4599, 4600, 3457, 3558], 2346)
-    femmesh.addVolume([214, 683, 799, 681, 4601, 3320, 4602, 4603, 2961, 3319], 2347)
-    femmesh.addVolume([507, 508, 82, 171, 2432, 2430, 2428, 4339, 4340, 4604], 2348)
-    femmesh.addVolume([296, 709, 240, 710, 4325, 4606, 1646, 4605, 3038, 4607], 2349)
-    femmesh.addVolume([813, 860, 349, 812, 3520, 4131, 4133, 3362, 3519, 4608], 2350)
-    femmesh.addVolume([44, 73, 193, 1, 2367, 4085, 1105, 1027, 2368, 1104], 2351)
-    femmesh.addVolume([648, 118, 597, 564, 4609, 4610, 2891, 2838, 4611, 2881], 2352)
-    femmesh.addVolume([13, 124, 520, 567, 1127, 4613, 4398, 4612, 4614, 2645], 2353)
-    femmesh.addVolume([653, 199, 599, 124, 4615, 4617, 2866, 4616, 1353, 4618], 2354)
-    femmesh.addVolume([664, 247, 589, 588, 4619, 4620, 2910, 2909, 4621, 2678], 2355)
-    femmesh.addVolume([199, 123, 599, 124, 1352, 4622, 4617, 1353, 1128, 4618], 2356)
-    femmesh.addVolume([635, 161, 636, 550, 4623, 4624, 2802, 2798, 4625, 2800], 2357)
-    femmesh.addVolume([898, 855, 413, 402, 3641, 4628, 4626, 4627, 4629, 2018], 2358)
-    femmesh.addVolume([762, 302, 669, 325, 4630, 4328, 3200, 4631, 1747, 4632], 2359)
-    femmesh.addVolume([241, 620, 687, 647, 4171, 2971, 4633, 4054, 2835, 3083], 2360)
-    femmesh.addVolume([472, 945, 926, 435, 4634, 3801, 4635, 2203, 4636, 4637], 2361)
-    femmesh.addVolume([535, 615, 223, 619, 2740, 4512, 4089, 2751, 2885, 4513], 2362)
-    femmesh.addVolume([763, 730, 836, 370, 3205, 3443, 3444, 4638, 4639, 4640], 2363)
-    femmesh.addVolume([261, 667, 592, 668, 4641, 2917, 4292, 4642, 2920, 2918], 2364)
-    femmesh.addVolume([816, 368, 864, 817, 4643, 4644, 3531, 3374, 4645, 3532], 2365)
-    femmesh.addVolume([118, 7, 564, 517, 1109, 4647, 4611, 4646, 4648, 2629], 2366)
-    femmesh.addVolume([947, 425, 424, 946, 4041, 2055, 4367, 3799, 4649, 4650], 2367)
-    femmesh.addVolume([7, 92, 564, 517, 4651, 2581, 4647, 4648, 2459, 2629], 2368)
-    femmesh.addVolume([378, 942, 424, 946, 4652, 4062, 2051, 4653, 3795, 4650], 2369)
-    femmesh.addVolume([755, 756, 303, 814, 3185, 4655, 4654, 3363, 3364, 4656], 2370)
-    femmesh.addVolume([653, 599, 567, 124, 2866, 2705, 2861, 4616, 4618, 4614], 2371)
-    femmesh.addVolume([245, 660, 305, 611, 4124, 4657, 1673, 4125, 2901, 4407], 2372)
-    femmesh.addVolume([348, 805, 746, 316, 4485, 3336, 4486, 1813, 4658, 4659], 2373)
-    femmesh.addVolume([188, 502, 501, 76, 4562, 2414, 3936, 4660, 2412, 2410], 2374)
-    femmesh.addVolume([485, 975, 968, 971, 4661, 3924, 4662, 4481, 3917, 3877], 2375)
-    femmesh.addVolume([390, 907, 435, 894, 4663, 4665, 2084, 4664, 3706, 4666], 2376)
-    femmesh.addVolume([199, 686, 599, 689, 4667, 2968, 4617, 4047, 2976, 2974], 2377)
-    femmesh.addVolume([389, 434, 435, 907, 2081, 2085, 2083, 4668, 4669, 4665], 2378)
-    femmesh.addVolume([621, 320, 225, 194, 4237, 1727, 4238, 4115, 1728, 1667], 2379)
-    femmesh.addVolume([665, 664, 765, 300, 3063, 3209, 3210, 4670, 4671, 4392], 2380)
-    femmesh.addVolume([945, 926, 435, 907, 3801, 4637, 4636, 3791, 3739, 4665], 2381)
-    femmesh.addVolume([390, 436, 894, 435, 2086, 4672, 4664, 2084, 2088, 4666], 2382)
-    femmesh.addVolume([907, 926, 435, 894, 3739, 4637, 4665, 3706, 3732, 4666], 2383)
-    femmesh.addVolume([140, 659, 528, 575, 4593, 2879, 4673, 4674, 2880, 2653], 2384)
-    femmesh.addVolume([794, 342, 341, 281, 4675, 1797, 4676, 4677, 1795, 1793], 2385)
-    femmesh.addVolume([502, 169, 585, 503, 4563, 4678, 2664, 2417, 4679, 2665], 2386)
-    femmesh.addVolume([610, 681, 215, 713, 2952, 4681, 4680, 3048, 3049, 4223], 2387)
-    femmesh.addVolume([389, 390, 907, 435, 1948, 4663, 4668, 2083, 2084, 4665], 2388)
-    femmesh.addVolume([904, 937, 938, 423, 3765, 3772, 3769, 4308, 4682, 4310], 2389)
-    femmesh.addVolume([437, 914, 475, 869, 4683, 4685, 2259, 4684, 3689, 4557], 2390)
-    femmesh.addVolume([767, 265, 352, 314, 4686, 1824, 4687, 4688, 1725, 1823], 2391)
-    femmesh.addVolume([128, 522, 129, 17, 4689, 4128, 1143, 1139, 4690, 1141], 2392)
-    femmesh.addVolume([488, 447, 938, 423, 2252, 4305, 4691, 2253, 2121, 4310], 2393)
-    femmesh.addVolume([717, 684, 314, 767, 3069, 4693, 4692, 3218, 3219, 4688], 2394)
-    femmesh.addVolume([610, 659, 140, 575, 2893, 4593, 4694, 2728, 2880, 4674], 2395)
-    femmesh.addVolume([747, 697, 244, 698, 3156, 4696, 4695, 3157, 3002, 4697], 2396)
-    femmesh.addVolume([758, 816, 292, 757, 3370, 4698, 4260, 3191, 3369, 4262], 2397)
-    femmesh.addVolume([147, 222, 533, 616, 1420, 4436, 4699, 4700, 4234, 2742], 2398)
-    femmesh.addVolume([519, 96, 97, 11, 2463, 1083, 2462, 4137, 4164, 4138], 2399)
-    femmesh.addVolume([359, 736, 398, 418, 4701, 4702, 1973, 2032, 4703, 2035], 2400)
-    femmesh.addVolume([135, 109, 23, 525, 4704, 4706, 1159, 4705, 2474, 4707], 2401)
-    femmesh.addVolume([872, 386, 889, 833, 4708, 4709, 3616, 3562, 4710, 3614], 2402)
-    femmesh.addVolume([258, 643, 165, 644, 4711, 4713, 1530, 4712, 2826, 4714], 2403)
-    femmesh.addVolume([135, 109, 525, 573, 4704, 2474, 4705, 4715, 2600, 2636], 2404)
-    femmesh.addVolume([257, 705, 294, 704, 4224, 4717, 1642, 4716, 3023, 4718], 2405)
-    femmesh.addVolume([966, 498, 950, 478, 4509, 4208, 3861, 4482, 2334, 4719], 2406)
-    femmesh.addVolume([29, 167, 115, 30, 1244, 3981, 3949, 1011, 1243, 3956], 2407)
-    femmesh.addVolume([142, 529, 596, 514, 4231, 2856, 4720, 4721, 2700, 2698], 2408)
-    femmesh.addVolume([321, 348, 746, 316, 1814, 4486, 3975, 1745, 1813, 4659], 2409)
-    femmesh.addVolume([540, 92, 539, 7, 2509, 2507, 2511, 4278, 4651, 4722], 2410)
-    femmesh.addVolume([662, 587, 586, 286, 2905, 2672, 2904, 4723, 4724, 4725], 2411)
-    femmesh.addVolume([587, 233, 586, 286, 4726, 3969, 2672, 4724, 1624, 4725], 2412)
-    femmesh.addVolume([477, 931, 930, 897, 4727, 3748, 4728, 4729, 3746, 3744], 2413)
-    femmesh.addVolume([543, 628, 157, 542, 2777, 4188, 4189, 2520, 2776, 4730], 2414)
-    femmesh.addVolume([175, 540, 625, 539, 4279, 2769, 4731, 4732, 2511, 2768], 2415)
-    femmesh.addVolume([708, 258, 707, 757, 4733, 4734, 3032, 3187, 4735, 3186], 2416)
-    femmesh.addVolume([258, 298, 707, 757, 1652, 4736, 4734, 4735, 4737, 3186], 2417)
-    femmesh.addVolume([903, 904, 399, 445, 3661, 4075, 4074, 4242, 4738, 2115], 2418)
-    femmesh.addVolume([509, 52, 508, 191, 4452, 4359, 2435, 4145, 1301, 4143], 2419)
-    femmesh.addVolume([118, 117, 597, 564, 1110, 4739, 4610, 4611, 4740, 2881], 2420)
-    femmesh.addVolume([117, 118, 597, 256, 1110, 4610, 4739, 1513, 1547, 4741], 2421)
-    femmesh.addVolume([117, 516, 597, 564, 4498, 2766, 4739, 4740, 2654, 2881], 2422)
-    femmesh.addVolume([331, 846, 332, 834, 4742, 4743, 1767, 4531, 3478, 4744], 2423)
-    femmesh.addVolume([500, 45, 75, 74, 4745, 2375, 2408, 2407, 2376, 1060], 2424)
-    femmesh.addVolume([694, 744, 695, 228, 3147, 3148, 2993, 4096, 4746, 4044], 2425)
-    femmesh.addVolume([524, 106, 107, 21, 2473, 1093, 2472, 4747, 4244, 4748], 2426)
-    femmesh.addVolume([597, 117, 537, 516, 4739, 4749, 2701, 2766, 4498, 2625], 2427)
-    femmesh.addVolume([708, 258, 757, 292, 4733, 4735, 3187, 4261, 1639, 4262], 2428)
-    femmesh.addVolume([250, 595, 670, 594, 4750, 2924, 4751, 4752, 2696, 2923], 2429)
-    femmesh.addVolume([301, 730, 361, 665, 4753, 4542, 1855, 4754, 3113, 4543], 2430)
-    femmesh.addVolume([258, 298, 757, 292, 1652, 4737, 4735, 1639, 1654, 4262], 2431)
-    femmesh.addVolume([546, 159, 547, 14, 4755, 4757, 2532, 4756, 1227, 4758], 2432)
-    femmesh.addVolume([736, 359, 398, 739, 4701, 1973, 4702, 3228, 4473, 4475], 2433)
-    femmesh.addVolume([475, 914, 437, 474, 4685, 4683, 2259, 2281, 4289, 2209], 2434)
-    femmesh.addVolume([15, 568, 14, 126, 4759, 4760, 996, 1133, 4761, 1132], 2435)
-    femmesh.addVolume([722, 287, 222, 291, 4762, 1626, 4232, 4763, 1637, 1635], 2436)
-    femmesh.addVolume([546, 547, 99, 14, 2532, 2530, 2528, 4756, 4758, 4399], 2437)
-    femmesh.addVolume([568, 100, 14, 99, 2589, 4764, 4760, 2590, 1086, 4399], 2438)
-    femmesh.addVolume([398, 741, 366, 792, 4765, 4767, 1974, 4766, 3299, 4768], 2439)
-    femmesh.addVolume([720, 276, 712, 207, 4769, 4771, 3078, 4770, 1594, 4772], 2440)
-    femmesh.addVolume([697, 747, 244, 316, 3156, 4695, 4696, 4773, 4774, 1711], 2441)
-    femmesh.addVolume([747, 367, 316, 805, 4775, 1872, 4774, 3337, 4776, 4658], 2442)
-    femmesh.addVolume([110, 136, 25, 526, 4178, 1163, 4777, 2477, 4177, 3938], 2443)
-    femmesh.addVolume([367, 854, 853, 806, 4778, 3503, 4779, 4780, 3501, 3499], 2444)
-    femmesh.addVolume([529, 31, 30, 116, 4230, 1012, 3957, 2482, 4781, 3958], 2445)
-    femmesh.addVolume([637, 551, 636, 181, 2803, 2801, 2805, 4782, 4396, 4783], 2446)
-    femmesh.addVolume([277, 208, 207, 720, 1597, 1381, 1596, 4784, 4785, 4770], 2447)
-    femmesh.addVolume([367, 348, 316, 805, 1873, 1813, 1872, 4776, 4485, 4658], 2448)
-    femmesh.addVolume([695, 252, 745, 696, 4043, 4786, 3150, 2996, 4787, 3151], 2449)
-    femmesh.addVolume([136, 573, 135, 608, 4176, 4715, 1164, 4788, 2724, 4789], 2450)
-    femmesh.addVolume([573, 136, 24, 110, 4176, 1162, 4790, 2599, 4178, 4791], 2451)
-    femmesh.addVolume([876, 444, 886, 843, 4792, 4426, 3606, 3574, 4153, 3603], 2452)
-    femmesh.addVolume([341, 280, 776, 281, 1792, 4252, 4793, 1793, 1610, 4794], 2453)
-    femmesh.addVolume([137, 609, 657, 212, 4795, 2872, 4459, 1392, 4796, 4460], 2454)
-    femmesh.addVolume([378, 881, 329, 377, 4506, 4360, 1910, 1912, 4797, 1909], 2455)
-    femmesh.addVolume([158, 228, 226, 630, 1438, 1518, 1432, 4118, 4097, 4798], 2456)
-    femmesh.addVolume([642, 238, 184, 164, 4799, 1460, 4800, 4801, 1461, 1314], 2457)
-    femmesh.addVolume([447, 376, 404, 905, 2120, 1991, 2122, 4304, 4802, 4803], 2458)
-    femmesh.addVolume([694, 629, 226, 630, 2988, 4288, 4106, 2989, 2784, 4798], 2459)
-    femmesh.addVolume([573, 136, 526, 657, 4176, 4177, 2651, 2874, 4458, 2873], 2460)
-    femmesh.addVolume([557, 24, 184, 110, 4804, 1286, 4805, 2561, 4791, 4806], 2461)
-    femmesh.addVolume([573, 525, 135, 608, 2636, 4705, 4715, 2724, 2725, 4789], 2462)
-    femmesh.addVolume([788, 760, 325, 762, 3289, 4315, 4807, 3290, 3202, 4631], 2463)
-    femmesh.addVolume([678, 211, 608, 682, 4808, 4809, 2944, 2956, 4810, 2955], 2464)
-    femmesh.addVolume([610, 139, 575, 140, 4811, 4812, 2728, 4694, 1176, 4674], 2465)
-    femmesh.addVolume([872, 386, 940, 889, 4708, 4813, 3775, 3616, 4709, 3776], 2466)
-    femmesh.addVolume([568, 125, 14, 126, 4814, 1130, 4760, 4761, 1134, 1132], 2467)
-    femmesh.addVolume([37, 65, 148, 38, 2355, 4815, 1198, 1020, 2356, 1199], 2468)
-    femmesh.addVolume([65, 579, 148, 38, 2617, 4439, 4815, 2356, 4487, 1199], 2469)
-    femmesh.addVolume([331, 846, 834, 878, 4742, 3478, 4531, 4014, 3581, 3579], 2470)
-    femmesh.addVolume([469, 980, 970, 468, 4374, 3918, 4376, 2195, 3985, 3986], 2471)
-    femmesh.addVolume([29, 30, 528, 141, 1011, 4817, 4816, 1177, 1178, 4818], 2472)
-    femmesh.addVolume([345, 722, 777, 688, 4819, 3245, 4820, 4821, 3086, 3244], 2473)
-    femmesh.addVolume([525, 656, 135, 608, 2870, 4822, 4705, 2725, 2899, 4789], 2474)
-    femmesh.addVolume([676, 364, 768, 724, 4823, 4824, 3221, 3093, 4825, 3257], 2475)
-    femmesh.addVolume([92, 540, 93, 7, 2509, 2510, 1079, 4651, 4278, 4826], 2476)
-    femmesh.addVolume([153, 225, 536, 152, 1430, 4521, 4827, 1214, 1429, 4522], 2477)
-    femmesh.addVolume([34, 144, 145, 531, 1188, 1263, 1190, 4828, 4403, 4402], 2478)
-    femmesh.addVolume([138, 527, 112, 574, 4829, 2479, 4830, 4831, 2652, 2601], 2479)
-    femmesh.addVolume([505, 79, 49, 80, 2421, 2384, 4832, 2422, 1065, 2383], 2480)
-    femmesh.addVolume([849, 331, 878, 330, 4530, 4014, 3580, 4833, 1764, 4016], 2481)
-    femmesh.addVolume([970, 467, 468, 976, 4834, 2192, 3986, 3897, 3971, 3973], 2482)
-    femmesh.addVolume([12, 123, 567, 519, 1124, 4836, 4835, 4135, 4837, 2630], 2483)
-    femmesh.addVolume([48, 169, 77, 503, 1248, 4839, 2382, 4838, 4679, 2415], 2484)
-    femmesh.addVolume([546, 631, 159, 178, 2786, 4841, 4755, 4840, 4544, 1333], 2485)
-    femmesh.addVolume([642, 164, 641, 237, 4801, 4842, 2820, 4442, 1458, 4227], 2486)
-    femmesh.addVolume([112, 560, 27, 185, 2569, 4446, 4843, 4844, 4301, 1287], 2487)
-    femmesh.addVolume([103, 18, 570, 522, 4845, 4129, 2594, 2468, 4127, 2633], 2488)
-    femmesh.addVolume([767, 772, 352, 787, 3235, 4846, 4687, 3286, 3397, 4847], 2489)
-    femmesh.addVolume([588, 247, 589, 506, 4621, 4620, 2678, 2674, 4848, 2676], 2490)
-    femmesh.addVolume([431, 889, 883, 927, 4849, 3705, 4850, 4027, 3734, 3735], 2491)
-    femmesh.addVolume([796, 276, 277, 337, 4851, 1598, 4852, 3966, 1780, 1781], 2492)
-    femmesh.addVolume([70, 41, 152, 581, 2372, 1209, 4853, 2621, 4854, 4855], 2493)
-    femmesh.addVolume([884, 378, 330, 379, 4507, 1911, 4856, 4857, 1915, 1913], 2494)
-    femmesh.addVolume([747, 697, 746, 316, 3156, 3154, 3158, 4774, 4773, 4659], 2495)
-    femmesh.addVolume([541, 542, 94, 9, 2517, 2515, 2513, 4858, 4859, 4467], 2496)
-    femmesh.addVolume([15, 100, 14, 568, 4860, 4764, 996, 4759, 2589, 4760], 2497)
-    femmesh.addVolume([247, 506, 190, 589, 4848, 4861, 1484, 4620, 2676, 4862], 2498)
-    femmesh.addVolume([144, 34, 60, 531, 1188, 2348, 4410, 4403, 4828, 2491], 2499)
-    femmesh.addVolume([612, 313, 721, 622, 4022, 4863, 3082, 2758, 4864, 3080], 2500)
-    femmesh.addVolume([489, 461, 929, 449, 2280, 4866, 4865, 2254, 2171, 4590], 2501)
-    femmesh.addVolume([118, 7, 517, 119, 1109, 4648, 4646, 1113, 1111, 4867], 2502)
-    femmesh.addVolume([827, 403, 871, 801, 4868, 4599, 3560, 3454, 4600, 3558], 2503)
-    femmesh.addVolume([299, 261, 295, 668, 1655, 1645, 1657, 4869, 4642, 4870], 2504)
-    femmesh.addVolume([136, 573, 24, 135, 4176, 4790, 1162, 1164, 4715, 1160], 2505)
-    femmesh.addVolume([701, 315, 702, 253, 4108, 4871, 3014, 4109, 1707, 4872], 2506)
-    femmesh.addVolume([389, 832, 340, 867, 4873, 4875, 1943, 4874, 3543, 4876], 2507)
-    femmesh.addVolume([375, 810, 857, 809, 4877, 3511, 4352, 4878, 3353, 3510], 2508)
-    femmesh.addVolume([920, 866, 391, 847, 3723, 4880, 4879, 3728, 3540, 4881], 2509)
-    femmesh.addVolume([859, 406, 858, 901, 4882, 4883, 3518, 3651, 4884, 3650], 2510)
-    femmesh.addVolume([780, 766, 790, 264, 3400, 3401, 3293, 4504, 4575, 4505], 2511)
-    femmesh.addVolume([41, 70, 152, 42, 2372, 4853, 1209, 1024, 2362, 1210], 2512)
-    femmesh.addVolume([576, 147, 533, 616, 4885, 4699, 2615, 2743, 4700, 2742], 2513)
-    femmesh.addVolume([16, 549, 160, 548, 4139, 4886, 1229, 4343, 2538, 4887], 2514)
-    femmesh.addVolume([282, 771, 835, 343, 4579, 3432, 4888, 1798, 4889, 4890], 2515)
-    femmesh.addVolume([368, 865, 864, 817, 4891, 3537, 4644, 4645, 3534, 3532], 2516)
-    femmesh.addVolume([70, 536, 152, 42, 2501, 4522, 4853, 2362, 4892, 1210], 2517)
-    femmesh.addVolume([598, 716, 197, 714, 3059, 4894, 4893, 3053, 3061, 4895], 2518)
-    femmesh.addVolume([13, 546, 99, 14, 4018, 2528, 4019, 995, 4756, 4399], 2519)
-    femmesh.addVolume([730, 301, 361, 370, 4753, 1855, 4542, 4639, 1883, 1884], 2520)
-    femmesh.addVolume([794, 341, 847, 850, 4676, 4476, 3481, 3490, 4477, 3492], 2521)
-    femmesh.addVolume([139, 214, 215, 610, 1398, 1402, 1400, 4811, 4896, 4680], 2522)
-    femmesh.addVolume([642, 557, 184, 643, 2819, 4805, 4800, 2823, 2821, 4897], 2523)
-    femmesh.addVolume([26, 25, 526, 111, 1007, 3938, 3939, 4898, 4899, 2476], 2524)
-    femmesh.addVolume([839, 457, 482, 823, 4900, 2264, 4901, 3455, 4902, 4903], 2525)
-    femmesh.addVolume([82, 51, 171, 52, 2387, 1253, 4604, 2390, 1035, 1252], 2526)
-    femmesh.addVolume([528, 30, 29, 115, 4817, 1011, 4816, 2480, 3956, 3949], 2527)
-    femmesh.addVolume([411, 838, 797, 347, 4418, 3453, 4904, 2011, 4905, 4906], 2528)
-    femmesh.addVolume([210, 656, 209, 680, 4094, 4907, 1387, 4494, 2948, 4908], 2529)
-    femmesh.addVolume([771, 282, 835, 775, 4579, 4888, 3432, 3283, 4909, 3433], 2530)
-    femmesh.addVolume([76, 188, 47, 46, 4660, 1294, 2380, 2377, 1295, 1030], 2531)
-    femmesh.addVolume([337, 796, 841, 833, 3966, 3459, 3967, 4572, 3428, 3572], 2532)
-    femmesh.addVolume([586, 189, 587, 504, 4910, 4911, 2672, 2668, 4912, 2670], 2533)
-    femmesh.addVolume([945, 434, 913, 907, 4913, 4914, 3792, 3791, 4669, 3688], 2534)
-    femmesh.addVolume([862, 376, 399, 904, 4915, 2003, 4916, 3660, 4917, 4075], 2535)
-    femmesh.addVolume([620, 241, 242, 167, 4171, 1470, 4918, 4172, 1466, 1469], 2536)
-    femmesh.addVolume([662, 661, 286, 586, 3062, 4431, 4723, 2904, 2903, 4725], 2537)
-    femmesh.addVolume([461, 958, 497, 489, 4919, 4101, 2308, 2280, 4920, 2309], 2538)
-    femmesh.addVolume([909, 906, 454, 919, 3768, 3990, 4921, 3711, 3710, 4922], 2539)
-    femmesh.addVolume([333, 798, 845, 831, 4923, 3476, 4924, 4363, 3423, 3475], 2540)
-    femmesh.addVolume([634, 244, 160, 633, 4925, 1475, 4926, 2796, 4927, 4928], 2541)
-    femmesh.addVolume([298, 815, 756, 757, 4929, 3366, 4930, 4737, 3367, 3188], 2542)
-    femmesh.addVolume([864, 404, 919, 405, 4931, 4933, 3707, 4932, 2103, 4934], 2543)
-    femmesh.addVolume([260, 301, 665, 590, 1662, 4754, 4935, 4936, 4937, 2913], 2544)
-    femmesh.addVolume([540, 7, 539, 175, 4278, 4722, 2511, 4279, 1267, 4732], 2545)
-    femmesh.addVolume([478, 954, 922, 971, 4938, 3828, 4939, 4483, 3874, 3875], 2546)
-    femmesh.addVolume([645, 709, 239, 644, 3034, 4520, 4940, 2829, 3033, 4941], 2547)
-    femmesh.addVolume([192, 54, 86, 511, 1303, 2403, 4942, 4943, 4944, 2440], 2548)
-    femmesh.addVolume([455, 898, 402, 442, 4945, 4627, 2148, 2155, 4946, 2105], 2549)
-    femmesh.addVolume([189, 169, 503, 233, 1318, 4679, 4947, 1449, 1450, 4948], 2550)
-    femmesh.addVolume([233, 169, 503, 585, 1450, 4679, 4948, 3970, 4678, 2665], 2551)
-    femmesh.addVolume([51, 507, 82, 171, 4380, 2428, 2387, 1253, 4339, 4604], 2552)
-    femmesh.addVolume([474, 475, 877, 448, 2281, 4949, 4258, 2285, 2213, 4259], 2553)
-    femmesh.addVolume([735, 306, 661, 780, 4429, 4430, 3123, 3259, 4950, 3258], 2554)
-    femmesh.addVolume([561, 560, 28, 113, 2574, 3997, 3998, 2572, 2570, 4373], 2555)
-    femmesh.addVolume([844, 871, 440, 891, 3582, 4952, 4951, 3621, 3625, 4953], 2556)
-    femmesh.addVolume([909, 422, 908, 880, 4190, 4954, 3673, 3672, 4955, 3669], 2557)
-    femmesh.addVolume([247, 170, 190, 506, 1485, 1319, 1484, 4848, 4956, 4861], 2558)
-    femmesh.addVolume([507, 81, 190, 51, 2427, 4958, 4957, 4380, 2388, 1298], 2559)
-    femmesh.addVolume([774, 675, 674, 205, 3267, 2939, 3239, 4959, 4564, 4960], 2560)
-    femmesh.addVolume([810, 752, 363, 811, 3352, 4961, 4213, 3356, 3354, 4214], 2561)
-    femmesh.addVolume([910, 446, 886, 416, 4962, 4428, 3676, 4250, 2117, 4251], 2562)
-    femmesh.addVolume([901, 441, 858, 900, 4963, 4147, 3650, 3652, 4148, 3648], 2563)
-    femmesh.addVolume([109, 164, 24, 23, 4964, 1237, 4965, 4706, 1238, 1005], 2564)
-    femmesh.addVolume([199, 686, 269, 200, 4667, 4966, 1572, 1357, 4967, 1573], 2565)
-    femmesh.addVolume([95, 542, 9, 94, 2516, 4859, 4968, 1081, 2515, 4467], 2566)
-    femmesh.addVolume([189, 78, 504, 503, 4453, 2418, 4912, 4947, 2416, 2420], 2567)
-    femmesh.addVolume([114, 29, 28, 186, 3947, 1010, 4372, 3954, 1289, 1290], 2568)
-    femmesh.addVolume([224, 288, 619, 223, 1628, 4511, 4969, 1428, 1627, 4513], 2569)
-    femmesh.addVolume([714, 197, 267, 266, 4895, 1566, 4970, 4971, 1564, 1568], 2570)
-    femmesh.addVolume([604, 205, 605, 674, 4098, 4111, 2859, 2935, 4960, 2934], 2571)
-    femmesh.addVolume([214, 681, 284, 215, 4603, 4972, 1617, 1402, 4681, 1618], 2572)
-    femmesh.addVolume([762, 285, 325, 284, 4973, 1850, 4631, 4974, 1622, 1856], 2573)
-    femmesh.addVolume([965, 967, 484, 982, 3869, 4976, 4975, 3928, 3929, 4977], 2574)
-    femmesh.addVolume([829, 874, 416, 328, 3567, 4980, 4978, 4979, 4060, 2029], 2575)
-    femmesh.addVolume([637, 701, 234, 636, 3010, 4110, 4981, 2805, 3009, 4982], 2576)
-    femmesh.addVolume([340, 822, 339, 388, 4983, 4984, 1791, 1941, 4985, 1940], 2577)
-    femmesh.addVolume([738, 774, 275, 795, 3238, 4987, 4986, 3306, 3307, 4988], 2578)
-    femmesh.addVolume([712, 206, 674, 605, 4989, 4990, 3045, 3044, 4991, 2934], 2579)
-    femmesh.addVolume([738, 276, 275, 206, 4992, 1595, 4986, 4993, 1593, 1591], 2580)
-    femmesh.addVolume([357, 855, 413, 369, 4994, 4628, 2016, 1881, 4332, 2017], 2581)
-    femmesh.addVolume([681, 783, 284, 215, 3386, 4995, 4972, 4681, 4996, 1618], 2582)
-    femmesh.addVolume([851, 373, 417, 371, 4312, 2031, 4997, 4998, 1898, 2030], 2583)
-    femmesh.addVolume([591, 590, 666, 248, 2684, 2914, 2915, 4999, 5000, 5001], 2584)
-    femmesh.addVolume([582, 154, 537, 256, 5002, 5004, 2656, 5003, 1516, 5005], 2585)
-    femmesh.addVolume([785, 450, 768, 823, 5006, 5007, 3310, 3392, 5008, 3391], 2586)
-    femmesh.addVolume([909, 454, 405, 919, 4921, 2143, 5009, 3711, 4922, 4934], 2587)
-    femmesh.addVolume([879, 839, 479, 482, 3592, 5012, 5010, 5011, 4901, 2272], 2588)
-    femmesh.addVolume([665, 664, 300, 589, 3063, 4671, 4670, 2912, 2910, 5013], 2589)
-    femmesh.addVolume([398, 741, 792, 739, 4765, 3299, 4766, 4475, 3140, 3298], 2590)
-    femmesh.addVolume([670, 595, 250, 309, 2924, 4750, 4751, 5014, 5015, 1731], 2591)
-    femmesh.addVolume([98, 13, 99, 520, 4017, 4019, 1085, 2465, 4398, 2464], 2592)
-    femmesh.addVolume([49, 170, 80, 50, 1251, 5016, 2383, 1033, 1250, 2386], 2593)
-    femmesh.addVolume([675, 774, 274, 205, 3267, 5018, 5017, 4564, 4959, 1588], 2594)
-    femmesh.addVolume([2, 4, 74, 984, 2399, 1059, 2401, 4382, 5019, 4381], 2595)
-    femmesh.addVolume([783, 285, 762, 284, 5020, 4973, 3277, 4995, 1622, 4974], 2596)
-    femmesh.addVolume([914, 436, 912, 437, 4296, 5021, 3690, 4683, 2091, 5022], 2597)
-    femmesh.addVolume([155, 32, 5, 563, 1305, 1184, 1220, 5023, 5024, 4386], 2598)
-    femmesh.addVolume([126, 202, 127, 602, 1361, 1362, 1137, 5025, 5026, 4092], 2599)
-    femmesh.addVolume([839, 444, 479, 482, 5027, 2226, 5012, 4901, 2265, 2272], 2600)
-    femmesh.addVolume([386, 431, 889, 385, 2072, 4849, 4709, 1936, 2071, 5028], 2601)
-    femmesh.addVolume([235, 257, 294, 704, 1529, 1642, 1643, 5029, 4716, 4718], 2602)
-    femmesh.addVolume([742, 323, 825, 743, 5030, 5031, 3404, 3146, 5032, 3434], 2603)
-    femmesh.addVolume([586, 189, 504, 503, 4910, 4912, 2668, 2667, 4947, 2420], 2604)
-    femmesh.addVolume([675, 672, 654, 204, 2938, 2929, 2937, 4565, 5033, 5034], 2605)
-    femmesh.addVolume([521, 101, 569, 16, 2466, 2592, 2632, 4577, 4342, 5035], 2606)
-    femmesh.addVolume([551, 18, 550, 161, 4568, 5037, 2544, 5036, 1231, 4625], 2607)
-    femmesh.addVolume([144, 60, 33, 577, 4410, 2347, 1187, 4411, 2611, 5038], 2608)
-    femmesh.addVolume([205, 206, 605, 674, 1375, 4991, 4111, 4960, 4990, 2934], 2609)
-    femmesh.addVolume([837, 408, 456, 462, 5039, 2153, 5040, 4009, 2173, 2174], 2610)
-    femmesh.addVolume([310, 312, 718, 394, 1701, 5042, 5041, 1957, 1958, 5043], 2611)
-    femmesh.addVolume([470, 981, 481, 476, 4083, 4082, 2299, 2300, 4456, 2268], 2612)
-    femmesh.addVolume([444, 839, 457, 482, 5027, 4900, 2158, 2265, 4901, 2264], 2613)
-    femmesh.addVolume([586, 189, 503, 233, 4910, 4947, 2667, 3969, 1449, 4948], 2614)
-    femmesh.addVolume([392, 870, 842, 920, 5044, 3556, 5045, 5046, 3712, 3713], 2615)
-    femmesh.addVolume([602, 202, 685, 201, 5026, 5048, 2965, 5047, 1363, 5049], 2616)
-    femmesh.addVolume([109, 557, 110, 24, 2560, 2561, 1096, 4965, 4804, 4791], 2617)
-    femmesh.addVolume([485, 463, 975, 487, 2251, 4071, 4661, 2313, 2286, 4035], 2618)
-    femmesh.addVolume([645, 709, 240, 239, 3034, 4606, 5050, 4940, 4520, 1532], 2619)
-    femmesh.addVolume([131, 206, 207, 655, 1374, 1378, 1376, 5051, 5052, 5053], 2620)
-    femmesh.addVolume([586, 189, 233, 587, 4910, 1449, 3969, 2672, 4911, 4726], 2621)
-    femmesh.addVolume([644, 165, 185, 559, 4714, 1315, 5054, 2825, 4229, 4302], 2622)
-    femmesh.addVolume([788, 799, 284, 344, 3394, 5057, 5055, 5056, 5058, 1802], 2623)
-    femmesh.addVolume([411, 873, 908, 838, 4417, 3678, 5059, 4418, 3564, 3671], 2624)
-    femmesh.addVolume([320, 194, 684, 314, 1728, 4113, 5060, 1817, 1705, 4693], 2625)
-    femmesh.addVolume([272, 733, 798, 333, 5061, 3316, 5062, 1768, 4362, 4923], 2626)
-    femmesh.addVolume([345, 287, 722, 291, 1806, 4762, 4819, 1807, 1637, 4763], 2627)
-    femmesh.addVolume([195, 648, 684, 618, 5063, 2964, 5064, 5065, 2839, 3051], 2628)
-    femmesh.addVolume([13, 125, 520, 124, 1129, 4401, 4398, 1127, 1131, 4613], 2629)
-    femmesh.addVolume([684, 194, 195, 314, 4113, 1342, 5064, 4693, 1705, 1706], 2630)
-    femmesh.addVolume([304, 315, 701, 234, 1709, 4108, 5066, 1671, 1708, 4110], 2631)
-    femmesh.addVolume([546, 631, 178, 545, 2786, 4544, 4840, 2529, 2785, 4552], 2632)
-    femmesh.addVolume([695, 744, 745, 322, 3148, 3152, 3150, 4045, 4587, 4588], 2633)
-    femmesh.addVolume([808, 357, 855, 856, 5067, 4994, 3505, 3507, 5068, 3509], 2634)
-    femmesh.addVolume([837, 408, 777, 731, 5039, 5069, 3448, 3447, 5070, 3246], 2635)
-    femmesh.addVolume([175, 538, 539, 652, 5071, 2508, 4732, 5072, 2854, 2878], 2636)
-    femmesh.addVolume([720, 606, 207, 712, 3077, 5073, 4770, 3078, 3046, 4772], 2637)
-    femmesh.addVolume([175, 155, 538, 652, 1266, 5074, 5071, 5072, 5075, 2854], 2638)
-    femmesh.addVolume([752, 307, 753, 703, 5076, 5077, 3176, 3172, 5078, 3174], 2639)
-    femmesh.addVolume([553, 162, 182, 20, 5079, 1312, 5080, 5081, 1233, 1282], 2640)
-    femmesh.addVolume([530, 155, 652, 563, 5082, 5075, 2852, 2767, 5023, 2853], 2641)
-    femmesh.addVolume([549, 634, 160, 548, 2795, 4926, 4886, 2538, 2794, 4887], 2642)
-    femmesh.addVolume([750, 315, 372, 809, 5083, 1902, 5084, 3348, 5085, 5086], 2643)
-    femmesh.addVolume([899, 410, 933, 900, 5087, 5088, 3752, 3649, 5089, 3753], 2644)
-    femmesh.addVolume([436, 914, 912, 926, 4296, 3690, 5021, 5090, 3733, 3731], 2645)
-    femmesh.addVolume([155, 538, 652, 563, 5074, 2854, 5075, 5023, 2661, 2853], 2646)
-    femmesh.addVolume([307, 349, 363, 811, 1816, 1862, 1860, 5091, 5092, 4214], 2647)
-    femmesh.addVolume([985, 73, 193, 90, 5093, 4085, 4586, 4585, 2455, 4496], 2648)
-    femmesh.addVolume([375, 810, 858, 857, 4877, 3513, 4409, 4352, 3511, 3515], 2649)
-    femmesh.addVolume([263, 246, 663, 286, 1558, 5095, 5094, 1686, 1623, 5096], 2650)
-    femmesh.addVolume([29, 562, 167, 186, 3948, 3980, 1244, 1289, 3953, 1327], 2651)
-    femmesh.addVolume([705, 294, 704, 754, 4717, 4718, 3023, 3178, 5097, 3177], 2652)
-    femmesh.addVolume([513, 173, 512, 262, 4423, 5099, 2447, 5098, 1544, 5100], 2653)
-    femmesh.addVolume([246, 587, 663, 286, 5101, 2906, 5095, 1623, 4724, 5096], 2654)
-    femmesh.addVolume([764, 286, 355, 663, 4384, 1833, 4379, 3207, 5096, 5102], 2655)
-    femmesh.addVolume([324, 692, 229, 317, 5103, 5104, 1741, 1744, 5105, 1714], 2656)
-    femmesh.addVolume([742, 323, 317, 393, 5030, 1739, 5106, 5107, 1981, 1955], 2657)
-    femmesh.addVolume([829, 876, 416, 874, 3591, 4249, 4978, 3567, 3609, 4980], 2658)
-    femmesh.addVolume([692, 741, 317, 324, 3139, 5108, 5105, 5103, 5109, 1744], 2659)
-    femmesh.addVolume([455, 480, 490, 960, 2229, 2276, 2256, 5110, 4336, 4366], 2660)
-    femmesh.addVolume([398, 741, 324, 366, 4765, 5109, 1971, 1974, 4767, 1870], 2661)
-    femmesh.addVolume([593, 249, 594, 511, 4068, 4327, 2693, 2689, 5111, 2691], 2662)
-    femmesh.addVolume([286, 263, 355, 663, 1686, 1832, 1833, 5096, 5094, 5102], 2663)
-    femmesh.addVolume([529, 31, 116, 515, 4230, 4781, 2482, 2485, 4247, 2453], 2664)
-    femmesh.addVolume([802, 848, 374, 825, 3483, 5113, 5112, 3435, 3482, 5114], 2665)
-    femmesh.addVolume([961, 480, 979, 976, 4334, 4335, 3908, 3909, 5115, 3919], 2666)
-    femmesh.addVolume([645, 646, 240, 710, 2832, 5116, 5050, 3036, 3037, 4607], 2667)
-    femmesh.addVolume([816, 758, 292, 368, 3370, 4260, 4698, 4643, 5117, 1874], 2668)
-    femmesh.addVolume([184, 558, 110, 25, 3999, 2563, 4806, 1285, 4001, 4777], 2669)
-    femmesh.addVolume([763, 370, 299, 666, 4638, 1882, 5118, 3203, 5119, 5120], 2670)
-    femmesh.addVolume([863, 376, 404, 350, 5121, 1991, 5122, 5123, 1906, 1990], 2671)
-    femmesh.addVolume([816, 758, 368, 817, 3370, 5117, 4643, 3374, 3372, 4645], 2672)
-    femmesh.addVolume([447, 906, 923, 905, 3989, 3725, 4303, 4304, 3666, 3724], 2673)
-    femmesh.addVolume([738, 206, 275, 674, 4993, 1591, 4986, 3132, 4990, 5124], 2674)
-    femmesh.addVolume([915, 496, 495, 918, 3979, 2322, 5125, 3704, 4276, 5126], 2675)
-    femmesh.addVolume([211, 678, 280, 682, 4808, 3943, 1606, 4810, 2956, 4567], 2676)
-    femmesh.addVolume([917, 499, 479, 943, 5127, 2326, 5128, 3787, 5129, 5130], 2677)
-    femmesh.addVolume([879, 917, 462, 479, 3696, 5132, 5131, 5010, 5128, 2271], 2678)
-    femmesh.addVolume([92, 7, 564, 6, 4651, 4647, 2581, 5133, 988, 5134], 2679)
-    femmesh.addVolume([408, 837, 777, 844, 5039, 3448, 5069, 4448, 3473, 3471], 2680)
-    femmesh.addVolume([774, 738, 275, 674, 3238, 4986, 4987, 3239, 3132, 5124], 2681)
-    femmesh.addVolume([849, 769, 330, 830, 3486, 5135, 4833, 3487, 3421, 5136], 2682)
-    femmesh.addVolume([266, 354, 778, 773, 1828, 5139, 5137, 5138, 5140, 3249], 2683)
-    femmesh.addVolume([271, 786, 685, 201, 5141, 3278, 5142, 1578, 5143, 5049], 2684)
-    femmesh.addVolume([769, 269, 330, 830, 5144, 1759, 5135, 3421, 5145, 5136], 2685)
-    femmesh.addVolume([161, 635, 636, 251, 4623, 2802, 4624, 1492, 5146, 5147], 2686)
-    femmesh.addVolume([623, 197, 198, 714, 4267, 1351, 4268, 3052, 4895, 5148], 2687)
-    femmesh.addVolume([786, 271, 685, 734, 5141, 5142, 3278, 3281, 5149, 3122], 2688)
-    femmesh.addVolume([640, 183, 641, 555, 5150, 5151, 2817, 2813, 5152, 2815], 2689)
-    femmesh.addVolume([783, 681, 713, 215, 3386, 3049, 3287, 4996, 4681, 4223], 2690)
-    femmesh.addVolume([780, 346, 297, 264, 4502, 1809, 5153, 4504, 1812, 1685], 2691)
-    femmesh.addVolume([199, 653, 200, 124, 4615, 4533, 1357, 1353, 4616, 1355], 2692)
-    femmesh.addVolume([105, 19, 20, 523, 4529, 1001, 5154, 2470, 5155, 5156], 2693)
-    femmesh.addVolume([587, 246, 505, 189, 5101, 4547, 2671, 4911, 1483, 4549], 2694)
-    femmesh.addVolume([233, 661, 306, 585, 3968, 4430, 1675, 3970, 2902, 5157], 2695)
-    femmesh.addVolume([899, 898, 402, 856, 3646, 4627, 5158, 3644, 3642, 5159], 2696)
-    femmesh.addVolume([573, 136, 657, 608, 4176, 4458, 2874, 2724, 4788, 2896], 2697)
-    femmesh.addVolume([264, 296, 710, 759, 1649, 4605, 5160, 5161, 4007, 3193], 2698)
-    femmesh.addVolume([195, 648, 618, 119, 5063, 2839, 5065, 1340, 5162, 5163], 2699)
-    femmesh.addVolume([93, 565, 8, 94, 2584, 5165, 5164, 1080, 2583, 5166], 2700)
-    femmesh.addVolume([408, 844, 440, 462, 4448, 4951, 2175, 2173, 4010, 2216], 2701)
-    femmesh.addVolume([408, 837, 844, 462, 5039, 3473, 4448, 2173, 4009, 4010], 2702)
-    femmesh.addVolume([631, 252, 159, 178, 5167, 1494, 4841, 4544, 1495, 1333], 2703)
-    femmesh.addVolume([808, 357, 856, 372, 5067, 5068, 3507, 5168, 1893, 5169], 2704)
-    femmesh.addVolume([252, 631, 696, 695, 5167, 2994, 4787, 4043, 2992, 2996], 2705)
-    femmesh.addVolume([348, 804, 371, 321, 4484, 5170, 1889, 1814, 3974, 1887], 2706)
-    femmesh.addVolume([782, 832, 340, 280, 3426, 4875, 4293, 4013, 5171, 1790], 2707)
-    femmesh.addVolume([230, 252, 632, 696, 1497, 5174, 5172, 5173, 4787, 2995], 2708)
-    femmesh.addVolume([657, 211, 212, 682, 5175, 1393, 4460, 2954, 4810, 5176], 2709)
-    femmesh.addVolume([822, 338, 833, 770, 5177, 4573, 3429, 3390, 5178, 3427], 2710)
-    femmesh.addVolume([697, 230, 632, 696, 5179, 5172, 2997, 2999, 5173, 2995], 2711)
-    femmesh.addVolume([304, 700, 701, 750, 5180, 3011, 5066, 5181, 3165, 3166], 2712)
-    femmesh.addVolume([147, 37, 64, 533, 1196, 2354, 5182, 4699, 5183, 2495], 2713)
-    femmesh.addVolume([825, 420, 393, 840, 5184, 2040, 5185, 3458, 4002, 5186], 2714)
-    femmesh.addVolume([931, 477, 959, 490, 4727, 5188, 3839, 5187, 2257, 5189], 2715)
-    femmesh.addVolume([488, 472, 956, 473, 2304, 5190, 4273, 2305, 2207, 5191], 2716)
-    femmesh.addVolume([436, 951, 914, 926, 4295, 3814, 4296, 5090, 3815, 3733], 2717)
-    femmesh.addVolume([477, 497, 959, 490, 2307, 4103, 5188, 2257, 2310, 5189], 2718)
-    femmesh.addVolume([326, 719, 289, 288, 5192, 5193, 1750, 1749, 5194, 1631], 2719)
-    femmesh.addVolume([634, 232, 244, 698, 4515, 1478, 4925, 3001, 5195, 4697], 2720)
-    femmesh.addVolume([860, 859, 349, 812, 3521, 5196, 4131, 3519, 3517, 4608], 2721)
-    femmesh.addVolume([419, 882, 460, 888, 4161, 5197, 2165, 4462, 3612, 4463], 2722)
-    femmesh.addVolume([761, 268, 819, 328, 5198, 5200, 3380, 5199, 1754, 4058], 2723)
-    femmesh.addVolume([474, 949, 951, 473, 4501, 2343, 4290, 2210, 5201, 5202], 2724)
-    femmesh.addVolume([142, 596, 141, 217, 4720, 5203, 1182, 1407, 5204, 1406], 2725)
-    femmesh.addVolume([160, 179, 548, 633, 1291, 5205, 4887, 4928, 5206, 2792], 2726)
-    femmesh.addVolume([13, 546, 159, 178, 4018, 4755, 1228, 1273, 4840, 1333], 2727)
-    femmesh.addVolume([895, 397, 853, 852, 5207, 5208, 3633, 3632, 5209, 3500], 2728)
-    femmesh.addVolume([142, 529, 141, 596, 4231, 4282, 1182, 4720, 2856, 5203], 2729)
-    femmesh.addVolume([529, 596, 528, 141, 2856, 2883, 2484, 4282, 5203, 4818], 2730)
-    femmesh.addVolume([397, 367, 853, 348, 1968, 4779, 5208, 1969, 1873, 5210], 2731)
-    femmesh.addVolume([170, 246, 588, 247, 1482, 5212, 5211, 1485, 1537, 4621], 2732)
-    femmesh.addVolume([752, 307, 363, 811, 5076, 1860, 4961, 3354, 5091, 4214], 2733)
-    femmesh.addVolume([766, 264, 710, 759, 4575, 5160, 3214, 3216, 5161, 3193], 2734)
-    femmesh.addVolume([887, 384, 868, 883, 5213, 3992, 3607, 3680, 5214, 3596], 2735)
-    femmesh.addVolume([238, 258, 707, 643, 1549, 4734, 5215, 5216, 4711, 3028], 2736)
-    femmesh.addVolume([261, 299, 248, 591, 1655, 1656, 1556, 5217, 5218, 4999], 2737)
-    femmesh.addVolume([131, 571, 20, 523, 5219, 5221, 1148, 5220, 2634, 5156], 2738)
-    femmesh.addVolume([365, 759, 790, 817, 5222, 3437, 4194, 4193, 3373, 3436], 2739)
-    femmesh.addVolume([585, 233, 586, 503, 3970, 3969, 2669, 2665, 4948, 2667], 2740)
-    femmesh.addVolume([258, 708, 707, 643, 4733, 3032, 4734, 4711, 3030, 3028], 2741)
-    femmesh.addVolume([728, 727, 308, 614, 3251, 4414, 5223, 3110, 3104, 4415], 2742)
-    femmesh.addVolume([238, 298, 707, 258, 1653, 4736, 5215, 1549, 1652, 4734], 2743)
-    femmesh.addVolume([142, 529, 514, 515, 4231, 2700, 4721, 4248, 2485, 2454], 2744)
-    femmesh.addVolume([956, 926, 951, 473, 3829, 3815, 2342, 5191, 5224, 5202], 2745)
-    femmesh.addVolume([136, 137, 25, 526, 1167, 1165, 1163, 4177, 3940, 3938], 2746)
-    femmesh.addVolume([500, 45, 31, 168, 4745, 1245, 5225, 4174, 1247, 1262], 2747)
-    femmesh.addVolume([74, 4, 116, 984, 1059, 1103, 2406, 4381, 5019, 5226], 2748)
-    femmesh.addVolume([653, 124, 567, 520, 4616, 4614, 2861, 2860, 4613, 2645], 2749)
-    femmesh.addVolume([956, 472, 926, 473, 5190, 4635, 3829, 5191, 2207, 5224], 2750)
-    femmesh.addVolume([202, 673, 603, 602, 5227, 2931, 5228, 5026, 2932, 2862], 2751)
-    femmesh.addVolume([837, 408, 731, 456, 5039, 5070, 3447, 5040, 2153, 5229], 2752)
-    femmesh.addVolume([925, 928, 458, 973, 3738, 5230, 4159, 3882, 3883, 5231], 2753)
-    femmesh.addVolume([722, 345, 777, 779, 4819, 4820, 3245, 3253, 5232, 3256], 2754)
-    femmesh.addVolume([289, 772, 725, 719, 5233, 3232, 5234, 5193, 3233, 3098], 2755)
-    femmesh.addVolume([357, 807, 808, 855, 5235, 3347, 5067, 4994, 3504, 3505], 2756)
-    femmesh.addVolume([892, 921, 427, 941, 3715, 5236, 4445, 3781, 3782, 4493], 2757)
-    femmesh.addVolume([839, 843, 457, 823, 3547, 4154, 4900, 3455, 3466, 4902], 2758)
-    femmesh.addVolume([799, 821, 283, 344, 3387, 5238, 5237, 5058, 5239, 1801], 2759)
-    femmesh.addVolume([815, 356, 756, 814, 5240, 5241, 3366, 3368, 5242, 3364], 2760)
-    femmesh.addVolume([617, 255, 534, 651, 5243, 4525, 2746, 2850, 5244, 2849], 2761)
-    femmesh.addVolume([222, 148, 613, 220, 1421, 4438, 4233, 1515, 1415, 4434], 2762)
-    femmesh.addVolume([455, 477, 931, 490, 2222, 4727, 5245, 2256, 2257, 5187], 2763)
-    femmesh.addVolume([287, 221, 616, 222, 1625, 5246, 4212, 1626, 1422, 4234], 2764)
-    femmesh.addVolume([43, 44, 72, 154, 1026, 2366, 2365, 1215, 1216, 5247], 2765)
-    femmesh.addVolume([414, 843, 789, 457, 4152, 3465, 5248, 2157, 4154, 5249], 2766)
-    femmesh.addVolume([312, 310, 718, 651, 1701, 5041, 5042, 5250, 5251, 3070], 2767)
-    femmesh.addVolume([825, 419, 840, 848, 5252, 5253, 3458, 3482, 4160, 3484], 2768)
-    femmesh.addVolume([95, 518, 9, 10, 2460, 4466, 4968, 4285, 5254, 991], 2769)
-    femmesh.addVolume([183, 257, 641, 237, 1527, 4225, 5151, 1459, 1551, 4227], 2770)
-    femmesh.addVolume([667, 299, 668, 261, 5255, 4869, 2920, 4641, 1655, 4642], 2771)
-    femmesh.addVolume([718, 312, 724, 394, 5042, 5256, 3092, 5043, 1958, 5257], 2772)
-    femmesh.addVolume([170, 247, 588, 506, 1485, 4621, 5211, 4956, 4848, 2674], 2773)
-    femmesh.addVolume([386, 337, 385, 841, 1934, 1932, 1936, 5258, 3967, 5259], 2774)
-    femmesh.addVolume([758, 708, 292, 239, 3189, 4261, 4260, 4518, 4519, 1638], 2775)
-    femmesh.addVolume([893, 428, 382, 383, 4355, 2062, 5260, 5261, 2063, 1927], 2776)
-    femmesh.addVolume([818, 879, 482, 839, 3583, 5011, 5262, 3456, 3592, 4901], 2777)
-    femmesh.addVolume([904, 423, 399, 445, 4308, 2050, 4075, 4738, 2163, 2115], 2778)
-    femmesh.addVolume([172, 510, 85, 511, 5263, 2437, 5264, 5265, 2441, 2439], 2779)
-    femmesh.addVolume([26, 165, 559, 185, 1239, 4229, 5266, 1288, 1315, 4302], 2780)
-    femmesh.addVolume([109, 164, 23, 556, 4964, 1238, 4706, 2558, 5267, 5268], 2781)
-    femmesh.addVolume([815, 816, 757, 350, 3371, 3369, 3367, 5269, 5270, 5271], 2782)
-    femmesh.addVolume([729, 664, 347, 765, 3112, 5273, 5272, 3212, 3209, 4391], 2783)
-    femmesh.addVolume([876, 829, 327, 824, 3591, 5275, 5274, 3573, 3461, 5276], 2784)
-    femmesh.addVolume([876, 444, 843, 414, 4792, 4153, 3574, 5277, 2112, 4152], 2785)
-    femmesh.addVolume([978, 497, 465, 490, 4570, 2291, 4317, 4319, 2310, 2292], 2786)
-    femmesh.addVolume([268, 329, 269, 740, 1756, 1757, 1574, 4048, 5278, 5279], 2787)
-    femmesh.addVolume([430, 939, 429, 467, 4370, 4294, 2070, 2188, 5280, 2187], 2788)
-    femmesh.addVolume([700, 304, 701, 234, 5180, 5066, 3011, 5281, 1671, 4110], 2789)
-    femmesh.addVolume([411, 347, 361, 765, 2011, 1854, 2025, 4120, 4391, 4122], 2790)
-    femmesh.addVolume([10, 566, 11, 96, 5282, 5283, 992, 4287, 2585, 4164], 2791)
-    femmesh.addVolume([840, 403, 420, 393, 4598, 2041, 4002, 5186, 1987, 2040], 2792)
-    femmesh.addVolume([571, 131, 20, 132, 5219, 1148, 5221, 5284, 1152, 1150], 2793)
-    femmesh.addVolume([351, 760, 325, 395, 4314, 4315, 1822, 1963, 5285, 1962], 2794)
-    femmesh.addVolume([857, 441, 410, 900, 4146, 2102, 4353, 3647, 4148, 5089], 2795)
-    femmesh.addVolume([726, 264, 297, 259, 4574, 1685, 4024, 4055, 1559, 1651], 2796)
-    femmesh.addVolume([880, 909, 405, 919, 3672, 5009, 5286, 3709, 3711, 4934], 2797)
-    femmesh.addVolume([235, 257, 704, 640, 1529, 4716, 5029, 5287, 5288, 3019], 2798)
-    femmesh.addVolume([697, 230, 633, 632, 5179, 5289, 2998, 2997, 5172, 2793], 2799)
-    femmesh.addVolume([373, 851, 803, 371, 4312, 3493, 4313, 1898, 4998, 5290], 2800)
-    femmesh.addVolume([252, 230, 321, 696, 1497, 1729, 1730, 4787, 5173, 3983], 2801)
-    femmesh.addVolume([758, 296, 368, 817, 4006, 1876, 5117, 3372, 4008, 4645], 2802)
-    femmesh.addVolume([343, 392, 866, 391, 1952, 5292, 5291, 1950, 1954, 4880], 2803)
-    femmesh.addVolume([854, 409, 413, 369, 5293, 2133, 5294, 4330, 2006, 2017], 2804)
-    femmesh.addVolume([569, 522, 17, 102, 2647, 4690, 5295, 2591, 2469, 4142], 2805)
-    femmesh.addVolume([404, 368, 864, 350, 1992, 4644, 4931, 1990, 1875, 5296], 2806)
-    femmesh.addVolume([111, 26, 25, 165, 4898, 1007, 4899, 4228, 1239, 1240], 2807)
-    femmesh.addVolume([298, 815, 350, 356, 4929, 5269, 1819, 1835, 5240, 1891], 2808)
-    femmesh.addVolume([733, 272, 273, 333, 5061, 1586, 4364, 4362, 1768, 1769], 2809)
-    femmesh.addVolume([978, 969, 464, 977, 3904, 5297, 4553, 3925, 3915, 4555], 2810)
-    femmesh.addVolume([288, 719, 289, 619, 5194, 5193, 1631, 4511, 3073, 5298], 2811)
-    femmesh.addVolume([18, 161, 17, 550, 1231, 1232, 999, 5037, 4625, 5299], 2812)
-    femmesh.addVolume([536, 153, 152, 42, 4827, 1214, 4522, 4892, 1212, 1210], 2813)
-    femmesh.addVolume([18, 103, 17, 522, 4845, 5300, 999, 4127, 2468, 4690], 2814)
-    femmesh.addVolume([18, 103, 550, 17, 4845, 2540, 5037, 999, 5300, 5299], 2815)
-    femmesh.addVolume([522, 103, 17, 102, 2468, 5300, 4690, 2469, 1089, 4142], 2816)
-    femmesh.addVolume([550, 103, 102, 17, 2540, 1089, 2539, 5299, 5300, 4142], 2817)
-    femmesh.addVolume([826, 411, 765, 838, 4119, 4120, 3407, 3452, 4418, 3451], 2818)
-    femmesh.addVolume([563, 32, 1, 58, 5024, 1014, 4388, 2487, 2344, 2370], 2819)
-    femmesh.addVolume([111, 26, 559, 112, 4898, 5266, 2566, 1098, 5301, 2567], 2820)
-    femmesh.addVolume([887, 428, 893, 383, 4349, 4355, 3629, 4351, 2063, 5261], 2821)
-    femmesh.addVolume([177, 628, 543, 629, 4186, 2777, 4187, 4200, 2781, 2779], 2822)
-    femmesh.addVolume([221, 147, 616, 222, 1418, 4700, 5246, 1422, 1420, 4234], 2823)
-    femmesh.addVolume([397, 895, 853, 896, 5207, 3633, 5208, 5302, 3637, 3635], 2824)
-    femmesh.addVolume([628, 254, 692, 693, 4201, 5303, 2983, 2985, 5304, 2987], 2825)
-    femmesh.addVolume([408, 345, 421, 779, 2000, 2043, 2044, 4450, 5232, 4451], 2826)
-    femmesh.addVolume([849, 884, 830, 330, 3597, 3598, 3487, 4833, 4856, 5136], 2827)
-    femmesh.addVolume([123, 122, 519, 11, 1125, 5305, 4837, 1123, 1121, 4137], 2828)
-    femmesh.addVolume([379, 884, 946, 878, 4857, 3794, 5306, 4015, 3600, 3793], 2829)
-    femmesh.addVolume([535, 150, 580, 68, 4087, 4088, 2659, 2499, 4270, 2619], 2830)
-    femmesh.addVolume([378, 884, 330, 329, 4507, 4856, 1911, 1910, 4508, 1761], 2831)
-    femmesh.addVolume([120, 518, 121, 9, 5307, 5308, 1119, 1115, 4466, 1117], 2832)
-    femmesh.addVolume([329, 819, 830, 740, 4057, 3420, 5309, 5278, 3379, 3419], 2833)
-    femmesh.addVolume([664, 247, 300, 589, 4619, 1660, 4671, 2910, 4620, 5013], 2834)
-    femmesh.addVolume([884, 329, 830, 330, 4508, 5309, 3598, 4856, 1761, 5136], 2835)
-    femmesh.addVolume([895, 890, 415, 852, 3634, 5311, 5310, 3632, 3618, 5312], 2836)
-    femmesh.addVolume([940, 470, 432, 433, 4393, 2196, 4405, 5313, 2197, 2079], 2837)
-    femmesh.addVolume([957, 489, 449, 487, 4569, 2254, 4592, 4036, 2255, 2249], 2838)
-    femmesh.addVolume([329, 268, 819, 740, 1756, 5200, 4057, 5278, 4048, 3379], 2839)
-    femmesh.addVolume([782, 793, 680, 279, 3393, 3308, 3264, 4012, 5314, 4495], 2840)
-    femmesh.addVolume([109, 23, 525, 108, 4706, 4707, 2474, 1095, 5315, 2475], 2841)
-    femmesh.addVolume([342, 794, 775, 281, 4675, 3304, 5316, 1795, 4677, 5317], 2842)
-    femmesh.addVolume([253, 315, 702, 311, 1707, 4871, 4872, 1696, 1710, 5318], 2843)
-    femmesh.addVolume([507, 260, 190, 589, 5319, 1539, 4957, 2677, 5320, 4862], 2844)
-    femmesh.addVolume([811, 859, 363, 858, 3516, 5321, 4214, 3514, 3518, 4215], 2845)
-    femmesh.addVolume([176, 626, 627, 231, 5322, 2775, 5323, 1443, 5324, 5325], 2846)
-    femmesh.addVolume([601, 125, 201, 200, 4534, 1358, 5326, 4535, 1356, 1360], 2847)
-    femmesh.addVolume([926, 472, 435, 473, 4635, 2203, 4637, 5224, 2207, 2205], 2848)
-    femmesh.addVolume([822, 867, 872, 388, 3544, 3563, 3561, 4985, 5327, 5328], 2849)
-    femmesh.addVolume([260, 247, 190, 589, 1555, 1484, 1539, 5320, 4620, 4862], 2850)
-    femmesh.addVolume([686, 769, 269, 200, 3223, 5144, 4966, 4967, 5329, 1573], 2851)
-    femmesh.addVolume([258, 238, 184, 643, 1549, 1460, 1531, 4711, 5216, 4897], 2852)
-    femmesh.addVolume([937, 967, 938, 423, 3870, 3863, 3772, 4682, 5330, 4310], 2853)
-    femmesh.addVolume([752, 703, 702, 311, 3172, 3017, 3171, 5331, 5332, 5318], 2854)
-    femmesh.addVolume([637, 701, 702, 253, 3010, 3014, 3012, 5333, 4109, 4872], 2855)
-    femmesh.addVolume([892, 893, 427, 382, 3628, 5335, 4445, 5334, 5260, 2060], 2856)
-    femmesh.addVolume([333, 381, 845, 798, 1920, 5336, 4924, 4923, 5337, 3476], 2857)
-    femmesh.addVolume([129, 18, 570, 130, 1142, 4129, 4130, 1146, 1144, 5338], 2858)
-    femmesh.addVolume([513, 56, 88, 87, 4422, 2395, 2446, 2445, 2396, 1073], 2859)
-    femmesh.addVolume([870, 439, 791, 869, 5339, 4077, 3554, 3557, 5340, 3552], 2860)
-    femmesh.addVolume([150, 40, 68, 535, 1204, 2360, 4270, 4087, 5341, 2499], 2861)
-    femmesh.addVolume([706, 238, 237, 303, 5342, 1526, 4441, 5343, 1668, 1669], 2862)
-    femmesh.addVolume([395, 870, 791, 800, 5344, 3554, 4078, 5345, 3555, 3324], 2863)
-    femmesh.addVolume([104, 18, 19, 570, 5346, 1000, 4528, 2593, 4129, 5347], 2864)
-    femmesh.addVolume([565, 120, 618, 119, 5348, 5350, 2748, 5349, 1116, 5163], 2865)
-    femmesh.addVolume([311, 315, 702, 751, 1710, 4871, 5318, 5351, 5352, 3169], 2866)
-    femmesh.addVolume([760, 762, 669, 325, 3202, 3200, 3196, 4315, 4631, 4632], 2867)
-    femmesh.addVolume([298, 238, 756, 303, 1653, 5353, 4930, 1670, 1668, 4655], 2868)
-    femmesh.addVolume([472, 945, 982, 956, 4634, 3831, 5354, 5190, 3830, 3832], 2869)
-    femmesh.addVolume([937, 445, 965, 484, 4243, 5356, 3857, 5355, 2240, 4975], 2870)
-    femmesh.addVolume([159, 632, 547, 179, 5357, 2789, 4757, 1309, 5358, 5359], 2871)
-    femmesh.addVolume([403, 840, 801, 393, 4598, 3457, 4600, 1987, 5186, 5360], 2872)
-    femmesh.addVolume([860, 406, 401, 349, 5361, 1995, 4165, 4131, 1996, 1983], 2873)
-    femmesh.addVolume([596, 659, 528, 141, 2894, 2879, 2883, 5203, 4594, 4818], 2874)
-    femmesh.addVolume([433, 388, 872, 913, 2078, 5328, 5362, 5363, 5364, 3687], 2875)
-    femmesh.addVolume([81, 507, 190, 506, 2427, 4957, 4958, 2425, 2429, 4861], 2876)
-    femmesh.addVolume([282, 771, 343, 283, 4579, 4889, 1798, 1616, 4580, 1799], 2877)
-    femmesh.addVolume([164, 557, 24, 184, 5365, 4804, 1237, 1314, 4805, 1286], 2878)
-    femmesh.addVolume([972, 431, 469, 927, 5366, 2193, 4375, 3878, 4027, 5367], 2879)
-    femmesh.addVolume([478, 486, 922, 459, 2246, 5368, 4939, 2223, 2245, 5369], 2880)
-    femmesh.addVolume([577, 219, 614, 600, 5370, 5371, 2737, 2707, 5372, 2738], 2881)
-    femmesh.addVolume([351, 407, 791, 395, 1997, 4079, 5373, 1963, 1999, 4078], 2882)
-    femmesh.addVolume([29, 114, 28, 140, 3947, 4372, 1010, 1175, 5374, 1174], 2883)
-    femmesh.addVolume([771, 821, 835, 343, 3388, 3441, 3432, 4889, 5375, 4890], 2884)
-    femmesh.addVolume([719, 326, 676, 288, 5192, 5376, 3106, 5194, 1749, 5377], 2885)
-    femmesh.addVolume([27, 527, 28, 113, 5378, 5379, 1009, 4447, 2478, 4373], 2886)
-    femmesh.addVolume([166, 645, 560, 646, 5380, 2828, 3995, 4583, 2832, 2830], 2887)
-    femmesh.addVolume([472, 956, 982, 484, 5190, 3832, 5354, 2303, 5381, 4977], 2888)
-    femmesh.addVolume([865, 864, 919, 405, 3537, 3707, 3708, 5382, 4932, 4934], 2889)
-    femmesh.addVolume([967, 488, 423, 484, 5383, 2253, 5330, 4976, 2263, 2239], 2890)
-    femmesh.addVolume([560, 166, 28, 27, 3995, 1241, 3997, 4446, 1242, 1009], 2891)
-    femmesh.addVolume([462, 818, 456, 837, 5384, 5385, 2174, 4009, 3449, 5040], 2892)
-    femmesh.addVolume([345, 408, 777, 779, 2000, 5069, 4820, 5232, 4450, 3256], 2893)
-    femmesh.addVolume([175, 600, 219, 155, 5386, 5372, 1517, 1266, 5387, 1510], 2894)
-    femmesh.addVolume([276, 738, 796, 720, 4992, 3312, 4851, 4769, 3133, 3311], 2895)
-    femmesh.addVolume([827, 844, 440, 421, 3542, 4951, 5388, 4464, 4449, 2123], 2896)
-    femmesh.addVolume([137, 609, 526, 657, 4795, 2727, 3940, 4459, 2872, 2873], 2897)
-    femmesh.addVolume([177, 254, 157, 628, 1502, 1503, 1307, 4186, 4201, 4188], 2898)
-    femmesh.addVolume([175, 600, 155, 652, 5386, 5387, 1266, 5072, 2855, 5075], 2899)
-    femmesh.addVolume([739, 318, 324, 691, 4474, 1743, 5389, 3135, 5390, 4051], 2900)
-    femmesh.addVolume([777, 408, 844, 779, 5069, 4448, 3471, 3256, 4450, 3472], 2901)
-    femmesh.addVolume([175, 600, 652, 625, 5386, 2855, 5072, 4731, 3076, 2890], 2902)
-    femmesh.addVolume([403, 827, 871, 440, 4868, 3560, 4599, 2099, 5388, 4952], 2903)
-    femmesh.addVolume([549, 180, 17, 16, 5391, 1277, 4140, 4139, 1278, 998], 2904)
-    femmesh.addVolume([788, 760, 395, 325, 3289, 5285, 5392, 4807, 4315, 1962], 2905)
-    femmesh.addVolume([164, 183, 641, 237, 1324, 5151, 4842, 1458, 1459, 4227], 2906)
-    femmesh.addVolume([412, 827, 418, 792, 5393, 5395, 2106, 5394, 3410, 5396], 2907)
-    femmesh.addVolume([16, 569, 17, 102, 5035, 5295, 998, 4141, 2591, 4142], 2908)
-    femmesh.addVolume([825, 419, 848, 374, 5252, 4160, 3482, 5114, 2037, 5113], 2909)
-    femmesh.addVolume([851, 848, 882, 417, 3550, 3593, 3594, 4997, 4162, 4158], 2910)
-    femmesh.addVolume([978, 959, 490, 974, 3906, 5189, 4319, 3903, 3930, 4320], 2911)
-    femmesh.addVolume([549, 101, 16, 102, 2536, 4342, 4139, 2537, 1088, 4141], 2912)
-    femmesh.addVolume([748, 319, 806, 369, 5397, 5399, 3340, 5398, 1879, 5400], 2913)
-    femmesh.addVolume([634, 232, 699, 635, 4515, 5401, 3003, 2799, 4514, 3004], 2914)
-    femmesh.addVolume([813, 294, 349, 358, 5402, 1815, 4133, 4134, 1841, 1894], 2915)
-    femmesh.addVolume([319, 290, 369, 748, 1724, 1878, 1879, 5397, 4538, 5398], 2916)
-    femmesh.addVolume([265, 716, 773, 266, 5403, 3236, 5404, 1565, 5405, 5138], 2917)
-    femmesh.addVolume([783, 285, 284, 215, 5020, 1622, 4995, 4996, 1620, 1618], 2918)
-    femmesh.addVolume([485, 966, 478, 493, 4480, 4482, 2243, 2317, 4181, 2316], 2919)
-    femmesh.addVolume([188, 243, 584, 502, 1473, 5407, 5406, 4562, 4561, 2663], 2920)
-    femmesh.addVolume([574, 609, 526, 137, 2726, 2727, 2637, 3988, 4795, 3940], 2921)
-    femmesh.addVolume([114, 140, 528, 575, 5374, 4673, 2481, 2603, 4674, 2653], 2922)
-    femmesh.addVolume([659, 610, 215, 713, 2893, 4680, 4222, 3047, 3048, 4223], 2923)
-    femmesh.addVolume([825, 419, 374, 420, 5252, 2037, 5114, 5184, 2167, 2042], 2924)
-    femmesh.addVolume([177, 158, 226, 629, 1335, 1432, 1433, 4200, 4116, 4288], 2925)
-    femmesh.addVolume([436, 926, 435, 473, 5090, 4637, 2088, 2206, 5224, 2205], 2926)
-    femmesh.addVolume([390, 847, 850, 894, 4478, 3492, 4479, 4664, 3630, 3631], 2927)
-    femmesh.addVolume([766, 264, 759, 790, 4575, 5161, 3216, 3401, 4505, 3437], 2928)
-    femmesh.addVolume([967, 937, 484, 423, 3870, 5355, 4976, 5330, 4682, 2239], 2929)
-    femmesh.addVolume([967, 937, 965, 484, 3870, 3857, 3869, 4976, 5355, 4975], 2930)
-    femmesh.addVolume([264, 365, 759, 790, 1868, 5222, 5161, 4505, 4194, 3437], 2931)
-    femmesh.addVolume([885, 879, 839, 479, 3602, 3592, 3601, 5408, 5010, 5012], 2932)
-    femmesh.addVolume([667, 351, 784, 668, 4149, 4151, 3272, 2920, 5409, 3270], 2933)
-    femmesh.addVolume([742, 393, 801, 825, 5107, 5360, 3326, 3404, 5185, 3403], 2934)
-    femmesh.addVolume([866, 342, 391, 847, 5410, 1949, 4880, 3540, 5411, 4881], 2935)
-    femmesh.addVolume([133, 134, 22, 572, 1158, 1156, 1154, 5412, 5413, 5414], 2936)
-    femmesh.addVolume([389, 340, 388, 867, 1943, 1941, 1945, 4874, 4876, 5327], 2937)
-    femmesh.addVolume([406, 859, 349, 860, 4882, 5196, 1996, 5361, 3521, 4131], 2938)
-    femmesh.addVolume([907, 434, 913, 388, 4669, 4914, 3688, 5415, 2080, 5364], 2939)
-    femmesh.addVolume([499, 950, 478, 943, 4499, 4719, 2338, 5129, 3812, 5416], 2940)
-    femmesh.addVolume([183, 640, 163, 555, 5150, 5417, 1313, 5152, 2813, 5418], 2941)
-    femmesh.addVolume([122, 598, 197, 623, 5419, 4893, 1347, 4266, 2857, 4267], 2942)
-    femmesh.addVolume([618, 120, 195, 119, 5350, 1341, 5065, 5163, 1116, 1340], 2943)
-    femmesh.addVolume([476, 981, 982, 471, 4456, 3926, 4457, 2301, 5420, 5421], 2944)
-    femmesh.addVolume([348, 367, 853, 805, 1873, 4779, 5210, 4485, 4776, 3498], 2945)
-    femmesh.addVolume([183, 23, 556, 108, 1283, 5268, 5422, 5423, 5315, 2557], 2946)
-    femmesh.addVolume([664, 263, 300, 247, 5424, 1726, 4671, 4619, 1557, 1660], 2947)
-    femmesh.addVolume([650, 565, 120, 618, 2845, 5348, 5425, 2846, 2748, 5350], 2948)
-    femmesh.addVolume([827, 871, 440, 844, 3560, 4952, 5388, 3542, 3582, 4951], 2949)
-    femmesh.addVolume([917, 492, 916, 891, 5426, 5427, 3767, 3697, 5428, 3700], 2950)
-    femmesh.addVolume([272, 672, 673, 733, 3959, 2933, 3960, 5061, 3119, 3120], 2951)
-    femmesh.addVolume([117, 516, 91, 90, 4498, 2456, 5429, 4497, 2457, 1077], 2952)
-    femmesh.addVolume([871, 403, 440, 451, 4599, 2099, 4952, 4123, 2134, 2135], 2953)
-    femmesh.addVolume([133, 134, 572, 607, 1158, 5413, 5412, 4034, 5430, 2722], 2954)
-    femmesh.addVolume([524, 133, 572, 607, 4033, 5412, 2635, 2723, 4034, 2722], 2955)
-    femmesh.addVolume([219, 728, 600, 625, 5431, 3107, 5372, 5432, 3108, 3076], 2956)
-    femmesh.addVolume([351, 760, 784, 668, 4314, 3271, 4151, 5409, 3195, 3270], 2957)
-    femmesh.addVolume([457, 450, 482, 823, 2269, 2248, 2264, 4902, 5008, 4903], 2958)
-    femmesh.addVolume([351, 784, 800, 791, 4151, 3321, 5433, 5373, 3296, 3324], 2959)
-    femmesh.addVolume([351, 407, 763, 791, 1997, 5434, 4150, 5373, 4079, 3295], 2960)
-    femmesh.addVolume([194, 648, 597, 684, 5435, 2891, 4114, 4113, 2964, 2962], 2961)
-    femmesh.addVolume([249, 302, 295, 669, 1666, 1691, 1644, 4326, 4328, 5436], 2962)
-    femmesh.addVolume([176, 157, 542, 9, 1336, 4730, 5437, 1269, 1224, 4859], 2963)
-    femmesh.addVolume([648, 194, 118, 119, 5435, 1338, 4609, 5162, 1339, 1113], 2964)
-    femmesh.addVolume([800, 351, 791, 395, 5433, 5373, 3324, 5345, 1963, 4078], 2965)
-    femmesh.addVolume([156, 540, 8, 541, 4280, 4348, 1221, 4284, 2514, 5438], 2966)
-    femmesh.addVolume([46, 188, 168, 501, 1295, 1337, 1246, 4412, 3936, 3937], 2967)
-    femmesh.addVolume([576, 147, 146, 36, 4885, 1197, 4272, 5439, 1195, 1193], 2968)
-    femmesh.addVolume([742, 741, 801, 366, 3143, 3325, 3326, 5440, 4767, 5441], 2969)
-    femmesh.addVolume([188, 584, 501, 502, 5406, 2662, 3936, 4562, 2663, 2414], 2970)
-    femmesh.addVolume([686, 769, 200, 715, 3223, 5329, 4967, 3057, 3225, 5442], 2971)
-    femmesh.addVolume([243, 169, 233, 585, 1472, 1450, 1474, 5443, 4678, 3970], 2972)
-    femmesh.addVolume([192, 55, 512, 86, 1302, 5445, 5444, 4942, 2394, 2442], 2973)
-    femmesh.addVolume([620, 167, 187, 583, 4172, 1317, 5446, 2753, 3982, 5447], 2974)
-    femmesh.addVolume([887, 384, 429, 383, 5213, 2066, 4350, 4351, 1930, 2065], 2975)
-    femmesh.addVolume([382, 334, 875, 383, 1923, 5449, 5448, 1927, 1925, 5450], 2976)
-    femmesh.addVolume([620, 562, 167, 583, 2752, 3980, 4172, 2753, 2660, 3982], 2977)
-    femmesh.addVolume([276, 738, 275, 336, 4992, 4986, 1595, 1778, 5451, 1777], 2978)
-    femmesh.addVolume([187, 500, 168, 649, 5452, 4174, 1434, 5453, 2840, 5454], 2979)
-    femmesh.addVolume([181, 637, 253, 234, 4782, 5333, 1499, 1451, 4981, 1500], 2980)
-    femmesh.addVolume([206, 738, 712, 674, 4993, 3131, 4989, 4990, 3132, 3045], 2981)
-    femmesh.addVolume([523, 19, 130, 570, 5155, 1145, 5455, 2648, 5347, 5338], 2982)
-    femmesh.addVolume([665, 300, 765, 361, 4670, 4392, 3210, 4543, 1853, 4122], 2983)
-    femmesh.addVolume([172, 54, 192, 511, 1254, 1303, 1321, 5265, 4944, 4943], 2984)
-    femmesh.addVolume([154, 44, 72, 537, 1216, 2366, 5247, 5004, 5456, 2503], 2985)
-    femmesh.addVolume([763, 370, 351, 299, 4638, 1885, 4150, 5118, 1882, 1821], 2986)
-    femmesh.addVolume([378, 942, 377, 459, 4652, 5457, 1912, 2162, 4061, 2161], 2987)
-    femmesh.addVolume([458, 973, 487, 493, 5231, 5458, 2250, 2273, 5459, 2275], 2988)
-    femmesh.addVolume([884, 379, 330, 878, 4857, 1913, 4856, 3600, 4015, 4016], 2989)
-    femmesh.addVolume([252, 631, 695, 228, 5167, 2992, 4043, 1496, 4546, 4044], 2990)
-    femmesh.addVolume([183, 164, 641, 556, 1324, 4842, 5151, 5422, 5267, 2816], 2991)
-    femmesh.addVolume([513, 595, 596, 262, 2695, 2699, 2697, 5098, 5460, 5461], 2992)
-    femmesh.addVolume([458, 417, 882, 460, 2160, 4158, 4156, 2166, 2164, 5197], 2993)
-    femmesh.addVolume([631, 252, 178, 228, 5167, 1495, 4544, 4546, 1496, 1437], 2994)
-    femmesh.addVolume([640, 554, 163, 555, 2812, 5462, 5417, 2813, 2556, 5418], 2995)
-    femmesh.addVolume([250, 192, 512, 594, 1491, 5444, 5463, 4752, 5464, 2692], 2996)
-    femmesh.addVolume([136, 211, 657, 608, 1389, 5175, 4458, 4788, 4809, 2896], 2997)
-    femmesh.addVolume([192, 511, 512, 594, 4943, 2444, 5444, 5464, 2691, 2692], 2998)
-    femmesh.addVolume([173, 192, 512, 250, 1332, 5444, 5099, 1490, 1491, 5463], 2999)
-    femmesh.addVolume([379, 425, 911, 946, 2053, 4582, 4065, 5306, 4649, 3796], 3000)
-    femmesh.addVolume([54, 192, 86, 55, 1303, 4942, 2403, 1038, 1302, 2394], 3001)
-    femmesh.addVolume([44, 73, 72, 537, 2367, 1057, 2366, 5456, 2502, 2503], 3002)
-    femmesh.addVolume([747, 319, 806, 748, 5465, 5399, 3339, 3161, 5397, 3340], 3003)
-    femmesh.addVolume([238, 642, 706, 237, 4799, 3025, 5342, 1526, 4442, 4441], 3004)
-    femmesh.addVolume([774, 205, 674, 275, 4959, 4960, 3239, 4987, 1590, 5124], 3005)
-    femmesh.addVolume([139, 527, 28, 27, 5466, 5379, 1172, 1171, 5378, 1009], 3006)
-    femmesh.addVolume([12, 98, 567, 13, 5467, 2587, 4835, 994, 4017, 4612], 3007)
-    femmesh.addVolume([518, 565, 9, 120, 2626, 4465, 4466, 5307, 5348, 1115], 3008)
-    femmesh.addVolume([551, 103, 18, 104, 2542, 4845, 4568, 2543, 1090, 5346], 3009)
-    femmesh.addVolume([202, 126, 201, 602, 1361, 1359, 1363, 5026, 5025, 5047], 3010)
-    femmesh.addVolume([205, 206, 674, 275, 1375, 4990, 4960, 1590, 1591, 5124], 3011)
-    femmesh.addVolume([733, 672, 781, 273, 3119, 3260, 3261, 4364, 5468, 4541], 3012)
-    femmesh.addVolume([747, 367, 806, 319, 4775, 4780, 3339, 5465, 1871, 5399], 3013)
-    femmesh.addVolume([206, 131, 605, 655, 1374, 5469, 4991, 5052, 5051, 2887], 3014)
-    femmesh.addVolume([376, 904, 905, 423, 4917, 3699, 4802, 2049, 4308, 4309], 3015)
-    femmesh.addVolume([643, 184, 165, 558, 4897, 1325, 4713, 2822, 3999, 4000], 3016)
-    femmesh.addVolume([873, 496, 915, 918, 3977, 3979, 3693, 3701, 4276, 3704], 3017)
-    femmesh.addVolume([455, 898, 413, 402, 4945, 4626, 2149, 2148, 4627, 2018], 3018)
-    femmesh.addVolume([414, 843, 876, 824, 4152, 3574, 5277, 5470, 3546, 3573], 3019)
-    femmesh.addVolume([620, 687, 649, 242, 2971, 2969, 2886, 4918, 5471, 5472], 3020)
-    femmesh.addVolume([375, 810, 751, 311, 4877, 3351, 5473, 1905, 5474, 5351], 3021)
-    femmesh.addVolume([304, 749, 700, 750, 5475, 3163, 5180, 5181, 3167, 3165], 3022)
-    femmesh.addVolume([172, 249, 593, 511, 1489, 4068, 5476, 5265, 5111, 2689], 3023)
-    femmesh.addVolume([158, 544, 545, 630, 4117, 2526, 4551, 4118, 2782, 2783], 3024)
-    femmesh.addVolume([345, 722, 723, 779, 4819, 3089, 5477, 5232, 3253, 3254], 3025)
-    femmesh.addVolume([653, 601, 715, 200, 2889, 3055, 3056, 4533, 4535, 5442], 3026)
-    femmesh.addVolume([595, 513, 512, 262, 2695, 2447, 2694, 5460, 5098, 5100], 3027)
-    femmesh.addVolume([147, 221, 616, 576, 1418, 5246, 4700, 4885, 5478, 2743], 3028)
-    femmesh.addVolume([417, 851, 371, 415, 4997, 4998, 2030, 2114, 5479, 2022], 3029)
-    femmesh.addVolume([631, 546, 159, 632, 2786, 4755, 4841, 2790, 2788, 5357], 3030)
-    femmesh.addVolume([412, 792, 366, 801, 5394, 4768, 2014, 5480, 3327, 5441], 3031)
-    femmesh.addVolume([249, 192, 594, 511, 1488, 5464, 4327, 5111, 4943, 2691], 3032)
-    femmesh.addVolume([112, 527, 138, 27, 2479, 4829, 4830, 4843, 5378, 1169], 3033)
-    femmesh.addVolume([865, 365, 368, 405, 4192, 1986, 4891, 5382, 1994, 2010], 3034)
-    femmesh.addVolume([855, 854, 413, 369, 3506, 5294, 4628, 4332, 4330, 2017], 3035)
-    femmesh.addVolume([650, 120, 121, 196, 5425, 1119, 5481, 4471, 1343, 1344], 3036)
-    femmesh.addVolume([265, 767, 352, 773, 4686, 4687, 1824, 5404, 3284, 5482], 3037)
-    femmesh.addVolume([780, 346, 790, 735, 4502, 4503, 3293, 3259, 4413, 3294], 3038)
-    femmesh.addVolume([400, 414, 789, 457, 2107, 5248, 5483, 2234, 2157, 5249], 3039)
-    femmesh.addVolume([213, 683, 214, 658, 5484, 4601, 1399, 5485, 2958, 5486], 3040)
-    femmesh.addVolume([331, 849, 270, 330, 4530, 5487, 1762, 1764, 4833, 1760], 3041)
-    femmesh.addVolume([312, 651, 718, 724, 5250, 3070, 5042, 5256, 3091, 3092], 3042)
-    femmesh.addVolume([422, 496, 873, 448, 2289, 3977, 4191, 2126, 2288, 4277], 3043)
-    femmesh.addVolume([246, 587, 233, 189, 5101, 4726, 1514, 1483, 4911, 1449], 3044)
-    femmesh.addVolume([365, 865, 790, 820, 4192, 3535, 4194, 5488, 3536, 3384], 3045)
-    femmesh.addVolume([541, 626, 627, 176, 2771, 2775, 2773, 5489, 5322, 5323], 3046)
-    femmesh.addVolume([769, 849, 270, 786, 3486, 5487, 3944, 3280, 3485, 3945], 3047)
-    femmesh.addVolume([635, 700, 636, 251, 3006, 3007, 2802, 5146, 5490, 5147], 3048)
-    femmesh.addVolume([128, 522, 569, 654, 4689, 2647, 5491, 5492, 2864, 2865], 3049)
-    femmesh.addVolume([365, 296, 759, 817, 1895, 4007, 5222, 4193, 4008, 3373], 3050)
-    femmesh.addVolume([648, 194, 597, 118, 5435, 4114, 2891, 4609, 1338, 4610], 3051)
-    femmesh.addVolume([63, 576, 146, 36, 2605, 4272, 4207, 2352, 5439, 1193], 3052)
-    femmesh.addVolume([43, 153, 582, 71, 1213, 5494, 5493, 2364, 5495, 2624], 3053)
-    femmesh.addVolume([859, 406, 902, 860, 4882, 5496, 3653, 3521, 5361, 3654], 3054)
-    femmesh.addVolume([296, 365, 368, 817, 1895, 1986, 1876, 4008, 4193, 4645], 3055)
-    femmesh.addVolume([639, 235, 236, 703, 5497, 1457, 4203, 3016, 5498, 5499], 3056)
-    femmesh.addVolume([722, 222, 613, 291, 4232, 4233, 3084, 4763, 1635, 4432], 3057)
-    femmesh.addVolume([222, 147, 533, 148, 1420, 4699, 4436, 1421, 1200, 4437], 3058)
-    femmesh.addVolume([37, 65, 533, 148, 2355, 2494, 5183, 1198, 4815, 4437], 3059)
-    femmesh.addVolume([26, 112, 27, 185, 5301, 4843, 1008, 1288, 4844, 1287], 3060)
-    femmesh.addVolume([590, 301, 666, 248, 4937, 5500, 2914, 5000, 1661, 5001], 3061)
-    femmesh.addVolume([788, 762, 325, 284, 3290, 4631, 4807, 5055, 4974, 1856], 3062)
-    femmesh.addVolume([462, 818, 837, 879, 5384, 3449, 4009, 5131, 3583, 3584], 3063)
-    femmesh.addVolume([147, 37, 533, 148, 1196, 5183, 4699, 1200, 1198, 4437], 3064)
-    femmesh.addVolume([93, 541, 94, 8, 2512, 2513, 1080, 5164, 5438, 5166], 3065)
-    femmesh.addVolume([253, 236, 702, 638, 1501, 5502, 4872, 5501, 4205, 3013], 3066)
-    femmesh.addVolume([796, 337, 277, 338, 3966, 1781, 4852, 4571, 1785, 1783], 3067)
-    femmesh.addVolume([128, 203, 654, 603, 1365, 5504, 5492, 5503, 5505, 2884], 3068)
-    femmesh.addVolume([862, 356, 861, 399, 5506, 4361, 3527, 4916, 1975, 4076], 3069)
-    femmesh.addVolume([236, 253, 702, 311, 1501, 4872, 5502, 1695, 1696, 5318], 3070)
-    femmesh.addVolume([716, 650, 598, 196, 3060, 2847, 3059, 4470, 4471, 5507], 3071)
-    femmesh.addVolume([276, 796, 336, 337, 4851, 3964, 1778, 1780, 3966, 1782], 3072)
-    femmesh.addVolume([931, 477, 930, 959, 4727, 4728, 3748, 3839, 5188, 3838], 3073)
-    femmesh.addVolume([382, 333, 845, 831, 1922, 4924, 5508, 5509, 4363, 3475], 3074)
-    femmesh.addVolume([186, 166, 561, 646, 1316, 3996, 3955, 4419, 4583, 2831], 3075)
-    femmesh.addVolume([524, 133, 21, 107, 4033, 1153, 4747, 2472, 5510, 4748], 3076)
-    femmesh.addVolume([2, 89, 515, 57, 2400, 2451, 5511, 1041, 2397, 5512], 3077)
-    femmesh.addVolume([46, 168, 75, 501, 1246, 4175, 2378, 4412, 3937, 2409], 3078)
-    femmesh.addVolume([747, 367, 319, 316, 4775, 1871, 5465, 4774, 1872, 1723], 3079)
-    femmesh.addVolume([742, 393, 317, 366, 5107, 1955, 5106, 5440, 1956, 1869], 3080)
-    femmesh.addVolume([934, 452, 963, 935, 5513, 5514, 3850, 3760, 5515, 3851], 3081)
-    femmesh.addVolume([854, 367, 409, 369, 4778, 2004, 5293, 4330, 1880, 2006], 3082)
-    femmesh.addVolume([687, 584, 649, 242, 2970, 2842, 2969, 5471, 5516, 5472], 3083)
-    femmesh.addVolume([106, 554, 107, 21, 2551, 2552, 1093, 4244, 5517, 4748], 3084)
-    femmesh.addVolume([500, 187, 583, 649, 5452, 5447, 2709, 2840, 5453, 2843], 3085)
-    femmesh.addVolume([318, 727, 308, 690, 5518, 4414, 1719, 5519, 3297, 5520], 3086)
-    femmesh.addVolume([320, 772, 352, 767, 5521, 4846, 1851, 5522, 3235, 4687], 3087)
-    femmesh.addVolume([354, 400, 787, 352, 1979, 5524, 5523, 1830, 1978, 4847], 3088)
-    femmesh.addVolume([781, 672, 204, 273, 3260, 5033, 5525, 4541, 5468, 1585], 3089)
-    femmesh.addVolume([967, 488, 938, 423, 5383, 4691, 3863, 5330, 2253, 4310], 3090)
-    femmesh.addVolume([950, 478, 943, 971, 4719, 5416, 3812, 3899, 4483, 3876], 3091)
-    femmesh.addVolume([187, 620, 583, 649, 5446, 2753, 5447, 5453, 2886, 2843], 3092)
-    femmesh.addVolume([312, 615, 288, 223, 5526, 4510, 1700, 1699, 4512, 1627], 3093)
-    femmesh.addVolume([359, 353, 736, 418, 1844, 5527, 4701, 2032, 2033, 4703], 3094)
-    femmesh.addVolume([122, 598, 623, 566, 5419, 2857, 4266, 5528, 2703, 2760], 3095)
-    femmesh.addVolume([692, 741, 324, 691, 3139, 5109, 5103, 2984, 3138, 4051], 3096)
-    femmesh.addVolume([620, 187, 242, 649, 5446, 1468, 4918, 2886, 5453, 5472], 3097)
-    femmesh.addVolume([491, 980, 962, 494, 3984, 3911, 4341, 2314, 4168, 4170], 3098)
-    femmesh.addVolume([824, 354, 773, 778, 5529, 5140, 3395, 3399, 5139, 3249], 3099)
-    femmesh.addVolume([274, 781, 204, 273, 4539, 5525, 1587, 1589, 4541, 1585], 3100)
-    femmesh.addVolume([546, 13, 545, 178, 4018, 5530, 2529, 4840, 1273, 4552], 3101)
-    femmesh.addVolume([221, 532, 218, 612, 5531, 5532, 1419, 4020, 2733, 5533], 3102)
-    femmesh.addVolume([38, 66, 149, 39, 2357, 4489, 1201, 1021, 2358, 1202], 3103)
-    femmesh.addVolume([158, 178, 228, 630, 1308, 1437, 1438, 4118, 4545, 4097], 3104)
-    femmesh.addVolume([239, 258, 165, 644, 1552, 1530, 1463, 4941, 4712, 4714], 3105)
-    femmesh.addVolume([144, 245, 531, 614, 1479, 4404, 4403, 5534, 4416, 2736], 3106)
-    femmesh.addVolume([838, 411, 797, 908, 4418, 4904, 3453, 3671, 5059, 3670], 3107)
-    femmesh.addVolume([793, 339, 278, 279, 5535, 1786, 5536, 5314, 1787, 1604], 3108)
-    femmesh.addVolume([255, 312, 651, 310, 1698, 5250, 5244, 1693, 1701, 5251], 3109)
-    femmesh.addVolume([797, 355, 347, 729, 5537, 1863, 4906, 3314, 5538, 5272], 3110)
-    femmesh.addVolume([849, 331, 786, 834, 4530, 5539, 3485, 3488, 4531, 3439], 3111)
-    femmesh.addVolume([359, 353, 305, 660, 1844, 1825, 1843, 5540, 5541, 4657], 3112)
-    femmesh.addVolume([637, 253, 702, 638, 5333, 4872, 3012, 2808, 5501, 3013], 3113)
-    femmesh.addVolume([353, 359, 736, 660, 1844, 4701, 5527, 5541, 5540, 3126], 3114)
-    femmesh.addVolume([332, 272, 798, 333, 1766, 5062, 5542, 1770, 1768, 4923], 3115)
-    femmesh.addVolume([245, 660, 727, 308, 4124, 3105, 4126, 1681, 5543, 4414], 3116)
-    femmesh.addVolume([505, 246, 588, 170, 4547, 5212, 2673, 4548, 1482, 5211], 3117)
-    femmesh.addVolume([275, 738, 795, 336, 4986, 3306, 4988, 1777, 5451, 3965], 3118)
-    femmesh.addVolume([551, 552, 104, 19, 2547, 2545, 2543, 4397, 4182, 4528], 3119)
-    femmesh.addVolume([246, 263, 588, 247, 1558, 5544, 5212, 1537, 1557, 4621], 3120)
-    femmesh.addVolume([359, 305, 308, 660, 1843, 1682, 1842, 5540, 4657, 5543], 3121)
-    femmesh.addVolume([245, 660, 308, 305, 4124, 5543, 1681, 1673, 4657, 1682], 3122)
-    femmesh.addVolume([521, 569, 603, 127, 2632, 2714, 2715, 4091, 5545, 4093], 3123)
-    femmesh.addVolume([441, 452, 453, 934, 2138, 2142, 2139, 5546, 5513, 5547], 3124)
-    femmesh.addVolume([371, 321, 745, 322, 1887, 3976, 5548, 1888, 1834, 4588], 3125)
-    femmesh.addVolume([191, 508, 171, 52, 4143, 4340, 1320, 1301, 4359, 1252], 3126)
-    femmesh.addVolume([980, 983, 494, 469, 2335, 4185, 4168, 4374, 5549, 2297], 3127)
-    femmesh.addVolume([228, 694, 226, 630, 4096, 4106, 1518, 4097, 2989, 4798], 3128)
-    femmesh.addVolume([727, 359, 308, 660, 5550, 1842, 4414, 3105, 5540, 5543], 3129)
-    femmesh.addVolume([502, 169, 77, 47, 4563, 4839, 2413, 5551, 1249, 2379], 3130)
-    femmesh.addVolume([907, 389, 388, 867, 4668, 1945, 5415, 3668, 4874, 5327], 3131)
-    femmesh.addVolume([978, 464, 497, 489, 4553, 2290, 4570, 4554, 2319, 2309], 3132)
-    femmesh.addVolume([653, 125, 200, 124, 4532, 1356, 4533, 4616, 1131, 1355], 3133)
-    femmesh.addVolume([672, 203, 204, 273, 3961, 1369, 5033, 5468, 1584, 1585], 3134)
-    femmesh.addVolume([145, 578, 611, 218, 5552, 2730, 5553, 1410, 4298, 4297], 3135)
-    femmesh.addVolume([527, 139, 610, 658, 5466, 4811, 2729, 2876, 5554, 2875], 3136)
-    femmesh.addVolume([967, 488, 944, 938, 5383, 4275, 3864, 3863, 4691, 3818], 3137)
-    femmesh.addVolume([309, 216, 285, 671, 1687, 1621, 1690, 5555, 5556, 5557], 3138)
-    femmesh.addVolume([434, 945, 435, 907, 4913, 4636, 2085, 4669, 3791, 4665], 3139)
-    femmesh.addVolume([712, 206, 605, 655, 4989, 4991, 3044, 3043, 5052, 2887], 3140)
-    femmesh.addVolume([596, 216, 671, 659, 5558, 5556, 2926, 2894, 4220, 2927], 3141)
-    femmesh.addVolume([302, 670, 669, 594, 5559, 3066, 4328, 4329, 2923, 2922], 3142)
-    femmesh.addVolume([254, 177, 226, 629, 1502, 1433, 1505, 4202, 4200, 4288], 3143)
-    femmesh.addVolume([216, 309, 217, 671, 1687, 1688, 1409, 5556, 5555, 5560], 3144)
-    femmesh.addVolume([595, 596, 217, 671, 2699, 5204, 5561, 2925, 2926, 5560], 3145)
-    femmesh.addVolume([717, 265, 195, 196, 5562, 1561, 5563, 4472, 1562, 1345], 3146)
-    femmesh.addVolume([245, 305, 218, 611, 1673, 1674, 1524, 4125, 4407, 4297], 3147)
-    femmesh.addVolume([309, 595, 217, 671, 5015, 5561, 1688, 5555, 2925, 5560], 3148)
-    femmesh.addVolume([449, 895, 461, 929, 5564, 5565, 2171, 4590, 3740, 4866], 3149)
-    femmesh.addVolume([860, 903, 401, 902, 3656, 4166, 4165, 3654, 3658, 5566], 3150)
-    femmesh.addVolume([574, 527, 658, 138, 2652, 2876, 2877, 4831, 4829, 5567], 3151)
-    femmesh.addVolume([939, 430, 384, 883, 4370, 2068, 5568, 3773, 4371, 5214], 3152)
-    femmesh.addVolume([495, 488, 944, 949, 2283, 4275, 5569, 5570, 4274, 3807], 3153)
-    femmesh.addVolume([132, 606, 655, 207, 5571, 2898, 5572, 1377, 5073, 5053], 3154)
-    femmesh.addVolume([494, 452, 963, 934, 2278, 5514, 4169, 5573, 5513, 3850], 3155)
-    femmesh.addVolume([434, 953, 471, 945, 5574, 4265, 2200, 4913, 3820, 5575], 3156)
-    femmesh.addVolume([896, 477, 930, 897, 5576, 4728, 3743, 3640, 4729, 3744], 3157)
-    femmesh.addVolume([700, 749, 251, 699, 3163, 5577, 5490, 3008, 3162, 5578], 3158)
-    femmesh.addVolume([206, 131, 130, 605, 1374, 1149, 1373, 4991, 5469, 4112], 3159)
-    femmesh.addVolume([396, 865, 880, 405, 5579, 3587, 5580, 1993, 5382, 5286], 3160)
-    femmesh.addVolume([682, 211, 212, 281, 4810, 1393, 5176, 5581, 1608, 1609], 3161)
-    femmesh.addVolume([789, 843, 823, 457, 3465, 3466, 3398, 5249, 4154, 4902], 3162)
-    femmesh.addVolume([23, 183, 556, 164, 1283, 5422, 5268, 1238, 1324, 5267], 3163)
-    femmesh.addVolume([500, 649, 501, 168, 2840, 2841, 2411, 4174, 5454, 3937], 3164)
-    femmesh.addVolume([354, 824, 787, 789, 5529, 3396, 5523, 5582, 3469, 3468], 3165)
-    femmesh.addVolume([15, 100, 101, 548, 4860, 1087, 5583, 5584, 2533, 2534], 3166)
-    femmesh.addVolume([716, 265, 196, 266, 5403, 1562, 4470, 5405, 1565, 1563], 3167)
-    femmesh.addVolume([719, 288, 676, 619, 5194, 5377, 3106, 3073, 4511, 2940], 3168)
-    femmesh.addVolume([224, 225, 624, 289, 1431, 4523, 5585, 1629, 1630, 5586], 3169)
-    femmesh.addVolume([775, 794, 776, 281, 3304, 3305, 3288, 5317, 4677, 4794], 3170)
-    femmesh.addVolume([213, 683, 609, 677, 5484, 2959, 5587, 5588, 2960, 2942], 3171)
-    femmesh.addVolume([225, 153, 536, 621, 1430, 4827, 4521, 4238, 5589, 2755], 3172)
-    femmesh.addVolume([598, 197, 196, 121, 4893, 1348, 5507, 5590, 1346, 1344], 3173)
-    femmesh.addVolume([151, 224, 152, 581, 1426, 1427, 1211, 5591, 5592, 4855], 3174)
-    femmesh.addVolume([179, 15, 160, 548, 1275, 1230, 1291, 5205, 5584, 4887], 3175)
-    femmesh.addVolume([197, 716, 196, 266, 4894, 4470, 1348, 1564, 5405, 1563], 3176)
-    femmesh.addVolume([650, 598, 196, 121, 2847, 5507, 4471, 5481, 5590, 1344], 3177)
-    femmesh.addVolume([579, 617, 613, 220, 2747, 2882, 2734, 5593, 4440, 4434], 3178)
-    femmesh.addVolume([136, 211, 212, 657, 1389, 1393, 1391, 4458, 5175, 4460], 3179)
-    femmesh.addVolume([230, 321, 746, 316, 1729, 3975, 5594, 1712, 1745, 4659], 3180)
-    femmesh.addVolume([400, 364, 768, 737, 1980, 4824, 5595, 5596, 5597, 3220], 3181)
-    femmesh.addVolume([785, 731, 718, 394, 3276, 3115, 3275, 5598, 5599, 5043], 3182)
-    femmesh.addVolume([975, 485, 487, 493, 4661, 2313, 4035, 5600, 2317, 2275], 3183)
-    femmesh.addVolume([26, 111, 559, 165, 4898, 2566, 5266, 1239, 4228, 4229], 3184)
-    femmesh.addVolume([945, 472, 926, 956, 4634, 4635, 3801, 3830, 5190, 3829], 3185)
-    femmesh.addVolume([112, 26, 559, 185, 5301, 5266, 2567, 4844, 1288, 4302], 3186)
-    femmesh.addVolume([717, 265, 314, 195, 5562, 1725, 4692, 5563, 1561, 1706], 3187)
-    femmesh.addVolume([285, 309, 670, 302, 1690, 5014, 5601, 1804, 1746, 5559], 3188)
-    femmesh.addVolume([771, 683, 213, 677, 3230, 5484, 4578, 3231, 2960, 5588], 3189)
-    femmesh.addVolume([794, 342, 847, 341, 4675, 5411, 3481, 4676, 1797, 4476], 3190)
-    femmesh.addVolume([761, 829, 267, 328, 3416, 5603, 5602, 5199, 4979, 1753], 3191)
-    femmesh.addVolume([351, 760, 395, 800, 4314, 5285, 1963, 5433, 3322, 5345], 3192)
-    femmesh.addVolume([797, 411, 347, 396, 4904, 2011, 4906, 5604, 2012, 1970], 3193)
-    femmesh.addVolume([260, 301, 300, 665, 1662, 1663, 1659, 4935, 4754, 4670], 3194)
-    femmesh.addVolume([628, 254, 693, 629, 4201, 5304, 2985, 2781, 4202, 2986], 3195)
-    femmesh.addVolume([764, 355, 729, 663, 4379, 5538, 3213, 3207, 5102, 3111], 3196)
-    femmesh.addVolume([650, 518, 120, 565, 2844, 5307, 5425, 2845, 2626, 5348], 3197)
-    femmesh.addVolume([208, 606, 207, 720, 5605, 5073, 1381, 4785, 3077, 4770], 3198)
-    femmesh.addVolume([263, 664, 729, 663, 5424, 3112, 5606, 5094, 2911, 3111], 3199)
-    femmesh.addVolume([701, 700, 234, 636, 3011, 5281, 4110, 3009, 3007, 4982], 3200)
-    femmesh.addVolume([391, 894, 912, 920, 5607, 3730, 5608, 4879, 3729, 3714], 3201)
-    femmesh.addVolume([224, 151, 223, 619, 1426, 1425, 1428, 4969, 5609, 4513], 3202)
-    femmesh.addVolume([872, 388, 433, 387, 5328, 2078, 5362, 5610, 1942, 2077], 3203)
-    femmesh.addVolume([833, 387, 822, 872, 5611, 5612, 3429, 3562, 5610, 3561], 3204)
-    femmesh.addVolume([307, 235, 703, 236, 1678, 5498, 5078, 1679, 1457, 5499], 3205)
-    femmesh.addVolume([747, 698, 319, 748, 3157, 5613, 5465, 3161, 3159, 5397], 3206)
-    femmesh.addVolume([290, 807, 369, 748, 4537, 4331, 1878, 4538, 3342, 5398], 3207)
-    femmesh.addVolume([571, 131, 655, 523, 5219, 5051, 2867, 2634, 5220, 2868], 3208)
-    femmesh.addVolume([703, 307, 753, 704, 5078, 5077, 3174, 3020, 5614, 3175], 3209)
-    femmesh.addVolume([821, 771, 283, 343, 3388, 4580, 5238, 5375, 4889, 1799], 3210)
-    femmesh.addVolume([364, 400, 326, 737, 1980, 1977, 1865, 5597, 5596, 5615], 3211)
-    femmesh.addVolume([610, 659, 215, 140, 2893, 4222, 4680, 4694, 4593, 1401], 3212)
-    femmesh.addVolume([818, 785, 823, 450, 3375, 3392, 3402, 5616, 5006, 5008], 3213)
-    femmesh.addVolume([29, 562, 115, 167, 3948, 2576, 3949, 1244, 3980, 3981], 3214)
-    femmesh.addVolume([235, 307, 703, 704, 1678, 5078, 5498, 5029, 5614, 3020], 3215)
-    femmesh.addVolume([55, 87, 512, 86, 2393, 2443, 5445, 2394, 1072, 2442], 3216)
-    femmesh.addVolume([725, 772, 289, 320, 3232, 5233, 5234, 4239, 5521, 1805], 3217)
-    femmesh.addVolume([156, 626, 541, 176, 4283, 2771, 4284, 1334, 5322, 5489], 3218)
-    femmesh.addVolume([940, 433, 872, 913, 5313, 5362, 3775, 3778, 5363, 3687], 3219)
-    femmesh.addVolume([780, 711, 726, 297, 3266, 3273, 3415, 5153, 4025, 4024], 3220)
-    femmesh.addVolume([235, 307, 704, 294, 1678, 5614, 5029, 1643, 1715, 4718], 3221)
-    femmesh.addVolume([202, 673, 685, 734, 5227, 3074, 5048, 5617, 3121, 3122], 3222)
-    femmesh.addVolume([687, 297, 711, 243, 4023, 4025, 3042, 5618, 1684, 4323], 3223)
-    femmesh.addVolume([620, 241, 687, 242, 4171, 4633, 2971, 4918, 1470, 5471], 3224)
-    femmesh.addVolume([584, 243, 687, 711, 5407, 5618, 2970, 3039, 4323, 3042], 3225)
-    femmesh.addVolume([290, 232, 251, 699, 1634, 1522, 1633, 5619, 5401, 5578], 3226)
-    femmesh.addVolume([579, 65, 66, 38, 2617, 1050, 2616, 4487, 2356, 2357], 3227)
-    femmesh.addVolume([822, 387, 833, 338, 5612, 5611, 3429, 5177, 1937, 4573], 3228)
-    femmesh.addVolume([15, 16, 160, 548, 997, 1229, 1230, 5584, 4343, 4887], 3229)
-    femmesh.addVolume([180, 634, 549, 635, 4517, 2795, 5391, 4516, 2799, 2797], 3230)
-    femmesh.addVolume([15, 101, 16, 548, 5583, 4342, 997, 5584, 2534, 4343], 3231)
-    femmesh.addVolume([816, 368, 350, 864, 4643, 1875, 5270, 3531, 4644, 5296], 3232)
-    femmesh.addVolume([117, 193, 90, 5, 1511, 4496, 4497, 1106, 1306, 4584], 3233)
-    femmesh.addVolume([940, 386, 431, 889, 4813, 2072, 5620, 3776, 4709, 4849], 3234)
-    femmesh.addVolume([601, 715, 201, 685, 3055, 5621, 5326, 2966, 3058, 5049], 3235)
-    femmesh.addVolume([320, 326, 352, 772, 1831, 1886, 1851, 5521, 5622, 4846], 3236)
-    femmesh.addVolume([708, 258, 239, 644, 4733, 1552, 4519, 3031, 4712, 4941], 3237)
-    femmesh.addVolume([741, 792, 801, 366, 3299, 3327, 3325, 4767, 4768, 5441], 3238)
-    femmesh.addVolume([125, 568, 520, 601, 4814, 2631, 4401, 4534, 2710, 2711], 3239)
-    femmesh.addVolume([687, 297, 243, 241, 4023, 1684, 5618, 4633, 1650, 1632], 3240)
-    femmesh.addVolume([562, 620, 167, 647, 2752, 4172, 3980, 2834, 2835, 4173], 3241)
-    femmesh.addVolume([337, 386, 338, 833, 1934, 1935, 1785, 4572, 4710, 4573], 3242)
-    femmesh.addVolume([462, 818, 879, 482, 5384, 3583, 5131, 2232, 5262, 5011], 3243)
-    femmesh.addVolume([654, 604, 204, 129, 2863, 4566, 5034, 5623, 4100, 1368], 3244)
-    femmesh.addVolume([431, 386, 940, 432, 2072, 4813, 5620, 2076, 2074, 4405], 3245)
-    femmesh.addVolume([459, 942, 377, 910, 4061, 5457, 2161, 5624, 3797, 5625], 3246)
-    femmesh.addVolume([686, 199, 269, 740, 4667, 1572, 4966, 3136, 4046, 5279], 3247)
-    femmesh.addVolume([761, 268, 267, 198, 5198, 1571, 5602, 5626, 1569, 1567], 3248)
-    femmesh.addVolume([123, 623, 599, 519, 5627, 2761, 4622, 4837, 2759, 2706], 3249)
-    femmesh.addVolume([389, 832, 850, 341, 4873, 3491, 5628, 1944, 5629, 4477], 3250)
-    femmesh.addVolume([21, 133, 22, 107, 1153, 1154, 1003, 4748, 5510, 5630], 3251)
-    femmesh.addVolume([754, 812, 307, 753, 3358, 5632, 5631, 3179, 3357, 5077], 3252)
-    femmesh.addVolume([381, 382, 333, 845, 1924, 1922, 1920, 5336, 5508, 4924], 3253)
-    femmesh.addVolume([907, 913, 867, 388, 3688, 3686, 3668, 5415, 5364, 5327], 3254)
-    femmesh.addVolume([388, 913, 867, 872, 5364, 3686, 5327, 5328, 3687, 3563], 3255)
-    femmesh.addVolume([535, 40, 68, 69, 5341, 2360, 2499, 2498, 2361, 1053], 3256)
-    femmesh.addVolume([150, 67, 534, 580, 4269, 2496, 4527, 4088, 2620, 2641], 3257)
-    femmesh.addVolume([276, 738, 720, 712, 4992, 3133, 4769, 4771, 3131, 3078], 3258)
-    femmesh.addVolume([726, 264, 259, 710, 4574, 1559, 4055, 3102, 5160, 5633], 3259)
-    femmesh.addVolume([340, 832, 822, 867, 4875, 3470, 4983, 4876, 3543, 3544], 3260)
-    femmesh.addVolume([148, 579, 613, 220, 4439, 2734, 4438, 1415, 5593, 4434], 3261)
-    femmesh.addVolume([34, 145, 61, 531, 1190, 5634, 2349, 4828, 4402, 2490], 3262)
-    femmesh.addVolume([722, 287, 723, 616, 4762, 4211, 3089, 3085, 4212, 3087], 3263)
-    femmesh.addVolume([722, 287, 616, 222, 4762, 4212, 3085, 4232, 1626, 4234], 3264)
-    femmesh.addVolume([349, 813, 812, 754, 4133, 3362, 4608, 5635, 3360, 3358], 3265)
-    femmesh.addVolume([883, 889, 431, 385, 3705, 4849, 4850, 5636, 5028, 2071], 3266)
-    femmesh.addVolume([427, 921, 464, 969, 5236, 5637, 2179, 4491, 3868, 5297], 3267)
-    femmesh.addVolume([354, 824, 773, 787, 5529, 3395, 5140, 5523, 3396, 3285], 3268)
-    femmesh.addVolume([418, 827, 732, 792, 5395, 3409, 5638, 5396, 3410, 3309], 3269)
-    femmesh.addVolume([799, 683, 214, 283, 3320, 4601, 4602, 5237, 5639, 1615], 3270)
-    femmesh.addVolume([648, 618, 119, 517, 2839, 5163, 5162, 2837, 2749, 4867], 3271)
-    femmesh.addVolume([221, 287, 616, 612, 1625, 4212, 5246, 4020, 4021, 2744], 3272)
-    femmesh.addVolume([41, 70, 69, 581, 2372, 1054, 2373, 4854, 2621, 2622], 3273)
-    femmesh.addVolume([431, 940, 889, 927, 5620, 3776, 4849, 4027, 3777, 3734], 3274)
-    femmesh.addVolume([257, 183, 640, 163, 1527, 5150, 5288, 1528, 1313, 5417], 3275)
-    femmesh.addVolume([554, 555, 107, 163, 2556, 2554, 2552, 5462, 5418, 5640], 3276)
-    femmesh.addVolume([554, 639, 640, 163, 2810, 2814, 2812, 5462, 5641, 5417], 3277)
-    femmesh.addVolume([257, 705, 704, 640, 4224, 3023, 4716, 5288, 3021, 3019], 3278)
-    femmesh.addVolume([899, 857, 856, 410, 3645, 3512, 3644, 5087, 4353, 5642], 3279)
-    femmesh.addVolume([236, 162, 638, 253, 1456, 5643, 4205, 1501, 1498, 5501], 3280)
-    femmesh.addVolume([15, 547, 179, 14, 5644, 5359, 1275, 996, 4758, 1276], 3281)
-    femmesh.addVolume([939, 887, 429, 948, 3774, 4350, 4294, 3803, 3804, 4217], 3282)
-    femmesh.addVolume([672, 675, 781, 204, 2938, 3262, 3260, 5033, 4565, 5525], 3283)
-    femmesh.addVolume([639, 235, 703, 704, 5497, 5498, 3016, 3018, 5029, 3020], 3284)
-    femmesh.addVolume([128, 522, 654, 129, 4689, 2864, 5492, 1143, 4128, 5623], 3285)
-    femmesh.addVolume([698, 232, 319, 748, 5195, 1721, 5613, 3159, 5645, 5397], 3286)
-    femmesh.addVolume([826, 730, 438, 836, 3408, 5646, 4029, 3446, 3443, 4031], 3287)
-    femmesh.addVolume([131, 19, 130, 523, 1147, 1145, 1149, 5220, 5155, 5455], 3288)
-    femmesh.addVolume([500, 187, 116, 583, 5452, 5647, 2579, 2709, 5447, 2628], 3289)
-    femmesh.addVolume([909, 422, 405, 454, 4190, 2047, 5009, 4921, 2146, 2143], 3290)
-    femmesh.addVolume([508, 82, 171, 52, 2430, 4604, 4340, 4359, 2390, 1252], 3291)
-    femmesh.addVolume([510, 172, 593, 511, 5263, 5476, 2688, 2441, 5265, 2689], 3292)
-    femmesh.addVolume([505, 189, 170, 49, 4549, 1329, 4548, 4832, 1296, 1251], 3293)
-    femmesh.addVolume([51, 507, 171, 190, 4380, 4339, 1253, 1298, 4957, 1330], 3294)
-    femmesh.addVolume([865, 396, 880, 820, 5579, 5580, 3587, 3536, 5648, 3585], 3295)
-    femmesh.addVolume([376, 904, 423, 399, 4917, 4308, 2049, 2003, 4075, 2050], 3296)
-    femmesh.addVolume([555, 183, 641, 556, 5152, 5151, 2815, 2559, 5422, 2816], 3297)
-    femmesh.addVolume([346, 820, 790, 735, 5649, 3384, 4503, 4413, 3381, 3294], 3298)
-    femmesh.addVolume([797, 820, 355, 764, 3383, 4378, 5537, 3313, 3382, 4379], 3299)
-    femmesh.addVolume([832, 782, 776, 280, 3426, 3265, 3425, 5171, 4013, 4252], 3300)
-    femmesh.addVolume([232, 290, 319, 748, 1634, 1724, 1721, 5645, 4538, 5397], 3301)
-    femmesh.addVolume([422, 873, 909, 908, 4191, 3679, 4190, 4954, 3678, 3673], 3302)
-    femmesh.addVolume([816, 815, 863, 350, 3371, 3528, 3529, 5270, 5269, 5123], 3303)
-    femmesh.addVolume([246, 587, 588, 663, 5101, 2675, 5212, 5095, 2906, 2907], 3304)
-    femmesh.addVolume([835, 342, 794, 775, 5650, 4675, 3442, 3433, 5316, 3304], 3305)
-    femmesh.addVolume([282, 342, 835, 775, 1796, 5650, 4888, 4909, 5316, 3433], 3306)
-    femmesh.addVolume([290, 749, 748, 699, 4536, 3164, 4538, 5619, 3162, 3160], 3307)
-    femmesh.addVolume([431, 430, 883, 385, 2073, 4371, 4850, 2071, 2069, 5636], 3308)
-    femmesh.addVolume([829, 327, 267, 328, 5275, 1752, 5603, 4979, 1755, 1753], 3309)
-    femmesh.addVolume([153, 582, 536, 621, 5494, 2643, 4827, 5589, 2754, 2755], 3310)
-    femmesh.addVolume([646, 726, 259, 710, 3100, 4055, 4420, 3037, 3102, 5633], 3311)
-    femmesh.addVolume([521, 126, 127, 602, 4595, 1137, 4091, 2712, 5025, 4092], 3312)
-    femmesh.addVolume([331, 271, 786, 834, 1763, 5141, 5539, 4531, 5651, 3439], 3313)
-    femmesh.addVolume([382, 334, 831, 875, 1923, 5652, 5509, 5448, 5449, 3569], 3314)
-    femmesh.addVolume([290, 749, 357, 807, 4536, 5653, 1839, 4537, 3343, 5235], 3315)
-    femmesh.addVolume([271, 332, 734, 834, 1765, 5654, 5149, 5651, 4744, 3431], 3316)
-    femmesh.addVolume([726, 264, 710, 766, 4574, 5160, 3102, 3215, 4575, 3214], 3317)
-    femmesh.addVolume([334, 274, 828, 335, 1772, 5656, 5655, 1776, 1774, 4199], 3318)
-    femmesh.addVolume([686, 653, 715, 200, 2967, 3056, 3057, 4967, 4533, 5442], 3319)
-    femmesh.addVolume([277, 276, 720, 207, 1598, 4769, 4784, 1596, 1594, 4770], 3320)
-    femmesh.addVolume([560, 112, 27, 113, 2569, 4843, 4446, 2570, 1099, 4447], 3321)
-    femmesh.addVolume([296, 709, 710, 759, 4325, 3038, 4605, 4007, 3192, 3193], 3322)
-    femmesh.addVolume([296, 365, 759, 264, 1895, 5222, 4007, 1649, 1868, 5161], 3323)
-    femmesh.addVolume([872, 386, 833, 387, 4708, 4710, 3562, 5610, 1939, 5611], 3324)
-    femmesh.addVolume([192, 249, 594, 250, 1488, 4327, 5464, 1491, 1542, 4752], 3325)
-    femmesh.addVolume([872, 386, 387, 940, 4708, 1939, 5610, 3775, 4813, 5657], 3326)
-    femmesh.addVolume([364, 785, 394, 450, 5658, 5598, 1959, 2132, 5006, 2131], 3327)
-    femmesh.addVolume([386, 841, 385, 889, 5258, 5259, 1936, 4709, 3615, 5028], 3328)
-    femmesh.addVolume([277, 720, 770, 679, 4784, 3227, 5659, 5660, 3079, 3226], 3329)
-    femmesh.addVolume([888, 882, 460, 924, 3612, 5197, 4463, 3722, 3779, 4469], 3330)
-    femmesh.addVolume([91, 117, 6, 564, 5429, 1107, 5661, 2582, 4740, 5134], 3331)
-    femmesh.addVolume([799, 783, 762, 284, 3378, 3277, 3377, 5057, 4995, 4974], 3332)
-    femmesh.addVolume([209, 279, 680, 278, 1602, 4495, 4908, 1600, 1604, 5662], 3333)
-    femmesh.addVolume([898, 855, 402, 856, 3641, 4629, 4627, 3642, 3509, 5159], 3334)
-    femmesh.addVolume([266, 265, 354, 773, 1565, 1827, 1828, 5138, 5404, 5140], 3335)
-    femmesh.addVolume([442, 898, 402, 899, 4946, 4627, 2105, 5663, 3646, 5158], 3336)
-    femmesh.addVolume([227, 219, 625, 728, 1536, 5432, 5664, 5665, 5431, 3108], 3337)
-    femmesh.addVolume([349, 859, 811, 812, 5196, 3516, 5092, 4608, 3517, 3359], 3338)
-    femmesh.addVolume([604, 205, 204, 129, 4098, 1372, 4566, 4100, 1370, 1368], 3339)
-    femmesh.addVolume([183, 555, 22, 108, 5152, 5666, 1284, 5423, 2555, 5667], 3340)
-    femmesh.addVolume([307, 349, 811, 812, 1816, 5092, 5091, 5632, 4608, 3359], 3341)
-    femmesh.addVolume([304, 749, 808, 357, 5475, 3345, 5668, 1838, 5653, 5067], 3342)
-    femmesh.addVolume([23, 183, 22, 108, 1283, 1284, 1004, 5315, 5423, 5667], 3343)
-    femmesh.addVolume([356, 298, 756, 303, 1835, 4930, 5241, 1836, 1670, 4655], 3344)
-    femmesh.addVolume([749, 304, 808, 750, 5475, 5668, 3345, 3167, 5181, 3346], 3345)
-    femmesh.addVolume([76, 502, 77, 47, 2412, 2413, 1062, 2380, 5551, 2379], 3346)
-    femmesh.addVolume([211, 136, 135, 608, 1389, 1164, 1388, 4809, 4788, 4789], 3347)
-    femmesh.addVolume([686, 199, 740, 689, 4667, 4046, 3136, 2976, 4047, 3137], 3348)
-    femmesh.addVolume([271, 331, 332, 834, 1763, 1767, 1765, 5651, 4531, 4744], 3349)
-    femmesh.addVolume([593, 249, 295, 669, 4068, 1644, 4070, 2921, 4326, 5436], 3350)
-    femmesh.addVolume([761, 268, 740, 819, 5198, 4048, 3252, 3380, 5200, 3379], 3351)
-    femmesh.addVolume([689, 268, 740, 761, 4049, 4048, 3137, 3198, 5198, 3252], 3352)
-    femmesh.addVolume([510, 191, 509, 592, 5669, 4145, 2438, 2686, 5670, 2685], 3353)
-    femmesh.addVolume([769, 686, 269, 740, 3223, 4966, 5144, 3224, 3136, 5279], 3354)
-    femmesh.addVolume([620, 167, 242, 187, 4172, 1469, 4918, 5446, 1317, 1468], 3355)
-    femmesh.addVolume([838, 411, 765, 347, 4418, 4120, 3451, 4905, 2011, 4391], 3356)
-    femmesh.addVolume([774, 274, 828, 781, 5018, 5656, 3411, 3315, 4539, 3412], 3357)
-    femmesh.addVolume([884, 881, 830, 329, 3599, 3590, 3598, 4508, 4360, 5309], 3358)
-    femmesh.addVolume([205, 675, 204, 274, 4564, 4565, 1372, 1588, 5017, 1587], 3359)
-    femmesh.addVolume([56, 513, 88, 174, 4422, 2446, 2395, 1259, 5671, 5672], 3360)
-    femmesh.addVolume([469, 983, 481, 470, 5549, 4080, 2298, 2198, 4081, 2299], 3361)
-    femmesh.addVolume([892, 381, 426, 380, 4443, 2057, 4444, 4596, 1921, 2056], 3362)
-    femmesh.addVolume([176, 231, 627, 229, 1443, 5325, 5323, 1440, 1446, 5673], 3363)
-    femmesh.addVolume([829, 824, 778, 327, 3461, 3399, 3417, 5275, 5276, 5674], 3364)
-    femmesh.addVolume([659, 216, 215, 140, 4220, 1405, 4222, 4593, 1403, 1401], 3365)
-    femmesh.addVolume([439, 475, 407, 869, 2214, 2211, 2097, 5340, 4557, 4559], 3366)
-    femmesh.addVolume([827, 412, 801, 792, 5393, 5480, 3454, 3410, 5394, 3327], 3367)
-    femmesh.addVolume([365, 865, 396, 405, 4192, 5579, 1966, 1994, 5382, 1993], 3368)
-    femmesh.addVolume([157, 10, 542, 9, 1223, 5675, 4730, 1224, 991, 4859], 3369)
-    femmesh.addVolume([827, 403, 801, 412, 4868, 4600, 3454, 5393, 2013, 5480], 3370)
-    femmesh.addVolume([412, 398, 792, 418, 2015, 4766, 5394, 2106, 2035, 5396], 3371)
-    femmesh.addVolume([398, 736, 792, 418, 4702, 3300, 4766, 2035, 4703, 5396], 3372)
-    femmesh.addVolume([942, 881, 377, 910, 3785, 4797, 5457, 3797, 3677, 5625], 3373)
-    femmesh.addVolume([547, 159, 179, 14, 4757, 1309, 5359, 4758, 1227, 1276], 3374)
-    femmesh.addVolume([854, 409, 853, 896, 5293, 5676, 3503, 3636, 5677, 3635], 3375)
-    femmesh.addVolume([397, 895, 415, 852, 5207, 5310, 2023, 5209, 3632, 5312], 3376)
-    femmesh.addVolume([521, 15, 101, 16, 4576, 5583, 2466, 4577, 997, 4342], 3377)
-    femmesh.addVolume([376, 862, 863, 905, 4915, 3530, 5121, 4802, 3662, 3663], 3378)
-    femmesh.addVolume([348, 804, 805, 852, 4484, 3338, 4485, 5678, 3495, 3496], 3379)
-    femmesh.addVolume([805, 348, 852, 853, 4485, 5678, 3496, 3498, 5210, 3500], 3380)
-    femmesh.addVolume([403, 393, 801, 366, 1987, 5360, 4600, 1988, 1956, 5441], 3381)
-    femmesh.addVolume([744, 373, 802, 803, 5679, 5680, 3329, 3330, 4313, 3332], 3382)
-    femmesh.addVolume([832, 782, 340, 822, 3426, 4293, 4875, 3470, 3406, 4983], 3383)
-    femmesh.addVolume([863, 816, 350, 864, 3529, 5270, 5123, 3533, 3531, 5296], 3384)
-    femmesh.addVolume([970, 939, 467, 955, 3871, 5280, 4834, 3872, 3826, 4307], 3385)
-    femmesh.addVolume([442, 898, 899, 932, 4946, 3646, 5663, 5681, 3749, 3750], 3386)
-    femmesh.addVolume([356, 862, 350, 376, 5506, 5682, 1891, 1907, 4915, 1906], 3387)
-    femmesh.addVolume([368, 816, 350, 292, 4643, 5270, 1875, 1874, 4698, 1818], 3388)
-    femmesh.addVolume([656, 210, 678, 680, 4094, 3941, 2945, 2948, 4494, 2951], 3389)
-    femmesh.addVolume([643, 558, 165, 644, 2822, 4000, 4713, 2826, 2824, 4714], 3390)
-    femmesh.addVolume([804, 371, 745, 803, 5170, 5548, 3333, 3335, 5290, 3331], 3391)
-    femmesh.addVolume([381, 892, 845, 846, 4443, 3623, 5336, 5683, 3624, 3479], 3392)
-    femmesh.addVolume([753, 307, 811, 812, 5077, 5091, 3355, 3357, 5632, 3359], 3393)
-    femmesh.addVolume([467, 939, 429, 955, 5280, 4294, 2187, 4307, 3826, 4219], 3394)
-    femmesh.addVolume([375, 810, 809, 751, 4877, 3353, 4878, 5473, 3351, 3349], 3395)
-    femmesh.addVolume([57, 514, 174, 88, 5684, 5685, 1258, 2398, 2448, 5672], 3396)
-    femmesh.addVolume([884, 378, 946, 942, 4507, 4653, 3794, 3784, 4652, 3795], 3397)
-    femmesh.addVolume([888, 483, 451, 916, 4461, 2237, 4005, 3695, 5686, 5687], 3398)
-    femmesh.addVolume([345, 408, 362, 777, 2000, 2001, 1859, 4820, 5069, 5688], 3399)
-    femmesh.addVolume([973, 975, 493, 966, 3895, 5600, 5459, 3892, 3894, 4181], 3400)
-    femmesh.addVolume([705, 706, 641, 237, 3026, 3024, 3022, 4226, 4441, 4227], 3401)
-    femmesh.addVolume([533, 222, 613, 616, 4436, 4233, 2735, 2742, 4234, 2745], 3402)
-    femmesh.addVolume([887, 428, 429, 948, 4349, 2067, 4350, 3804, 4357, 4217], 3403)
-    femmesh.addVolume([755, 705, 237, 706, 3180, 4226, 5689, 3181, 3026, 4441], 3404)
-    femmesh.addVolume([464, 969, 921, 952, 5297, 3868, 5637, 5690, 3881, 3816], 3405)
-    femmesh.addVolume([367, 397, 853, 409, 1968, 5208, 4779, 2004, 2005, 5676], 3406)
-    femmesh.addVolume([483, 492, 451, 916, 2320, 2311, 2237, 5686, 5427, 5687], 3407)
-    femmesh.addVolume([461, 397, 409, 896, 2170, 2005, 2172, 5691, 5302, 5677], 3408)
-    femmesh.addVolume([574, 26, 138, 137, 3987, 1168, 4831, 3988, 1166, 1170], 3409)
-    femmesh.addVolume([980, 972, 983, 469, 2336, 2331, 2335, 4374, 4375, 5549], 3410)
-    femmesh.addVolume([895, 397, 461, 896, 5207, 2170, 5565, 3637, 5302, 5691], 3411)
-    femmesh.addVolume([605, 131, 130, 523, 5469, 1149, 4112, 2718, 5220, 5455], 3412)
-    femmesh.addVolume([571, 105, 20, 523, 2596, 5154, 5221, 2634, 2470, 5156], 3413)
-    femmesh.addVolume([697, 230, 746, 316, 5179, 5594, 3154, 4773, 1712, 4659], 3414)
-    femmesh.addVolume([461, 477, 896, 409, 2221, 5576, 5691, 2172, 2220, 5677], 3415)
-    femmesh.addVolume([745, 371, 322, 803, 5548, 1888, 4588, 3331, 5290, 4589], 3416)
-    femmesh.addVolume([401, 399, 861, 358, 2007, 4076, 4167, 1982, 1976, 4337], 3417)
-    femmesh.addVolume([650, 717, 195, 196, 3075, 5563, 5692, 4471, 4472, 1345], 3418)
-    femmesh.addVolume([972, 469, 432, 470, 4375, 2194, 4406, 4394, 2198, 2196], 3419)
-    femmesh.addVolume([386, 841, 889, 833, 5258, 3615, 4709, 4710, 3572, 3614], 3420)
-    femmesh.addVolume([689, 268, 761, 198, 4049, 5198, 3198, 5693, 1569, 5626], 3421)
-    femmesh.addVolume([972, 431, 927, 940, 5366, 4027, 3878, 3880, 5620, 3777], 3422)
-    femmesh.addVolume([596, 216, 659, 141, 5558, 4220, 2894, 5203, 1404, 4594], 3423)
-    femmesh.addVolume([953, 433, 940, 913, 4263, 5313, 3862, 3821, 5363, 3778], 3424)
-    femmesh.addVolume([562, 114, 186, 29, 2575, 3954, 3953, 3948, 3947, 1289], 3425)
-    femmesh.addVolume([587, 246, 588, 505, 5101, 5212, 2675, 2671, 4547, 2673], 3426)
-    femmesh.addVolume([393, 840, 801, 825, 5186, 3457, 5360, 5185, 3458, 3403], 3427)
-    femmesh.addVolume([423, 937, 484, 445, 4682, 5355, 2239, 2163, 4243, 2240], 3428)
-    femmesh.addVolume([458, 973, 928, 487, 5231, 3883, 5230, 2250, 5458, 5694], 3429)
-    femmesh.addVolume([356, 815, 350, 862, 5240, 5269, 1891, 5506, 3526, 5682], 3430)
-    femmesh.addVolume([692, 254, 229, 317, 5303, 1504, 5104, 5105, 1713, 1714], 3431)
-    femmesh.addVolume([945, 472, 434, 435, 4634, 2202, 4913, 4636, 2203, 2085], 3432)
-    femmesh.addVolume([972, 431, 940, 432, 5366, 5620, 3880, 4406, 2076, 4405], 3433)
-    femmesh.addVolume([895, 461, 929, 896, 5565, 4866, 3740, 3637, 5691, 3741], 3434)
-    femmesh.addVolume([958, 461, 929, 489, 4919, 4866, 3835, 4920, 2280, 4865], 3435)
-    femmesh.addVolume([477, 497, 930, 959, 2307, 4102, 4728, 5188, 4103, 3838], 3436)
-    femmesh.addVolume([199, 268, 269, 740, 1570, 1574, 1572, 4046, 4048, 5279], 3437)
-    femmesh.addVolume([595, 309, 670, 671, 5015, 5014, 2924, 2925, 5555, 2928], 3438)
-    femmesh.addVolume([323, 393, 825, 374, 1981, 5185, 5031, 1900, 1989, 5114], 3439)
-    femmesh.addVolume([478, 968, 954, 971, 5695, 3866, 4938, 4483, 3877, 3874], 3440)
-    femmesh.addVolume([942, 378, 424, 459, 4652, 2051, 4062, 4061, 2162, 2169], 3441)
-    femmesh.addVolume([323, 742, 825, 393, 5030, 3404, 5031, 1981, 5107, 5185], 3442)
-    femmesh.addVolume([365, 346, 790, 264, 1867, 4503, 4194, 1868, 1812, 4505], 3443)
-    femmesh.addVolume([895, 397, 415, 449, 5207, 2023, 5310, 5564, 2129, 2130], 3444)
-    femmesh.addVolume([461, 895, 449, 397, 5565, 5564, 2171, 2170, 5207, 2129], 3445)
-    femmesh.addVolume([682, 280, 281, 776, 4567, 1610, 5581, 3242, 4252, 4794], 3446)
-    femmesh.addVolume([841, 384, 385, 883, 5696, 1933, 5259, 3595, 5214, 5636], 3447)
-    femmesh.addVolume([214, 681, 610, 658, 4603, 2952, 4896, 5486, 2953, 2875], 3448)
-    femmesh.addVolume([972, 431, 432, 469, 5366, 2076, 4406, 4375, 2193, 2194], 3449)
-    femmesh.addVolume([199, 689, 599, 198, 4047, 2974, 4617, 1354, 5693, 5697], 3450)
-    femmesh.addVolume([323, 742, 693, 743, 5030, 3142, 4105, 5032, 3146, 3144], 3451)
-    femmesh.addVolume([492, 917, 462, 891, 5426, 5132, 2267, 5428, 3697, 4011], 3452)
-    femmesh.addVolume([385, 841, 883, 889, 5259, 3595, 5636, 5028, 3615, 3705], 3453)
-    femmesh.addVolume([851, 417, 882, 890, 4997, 4158, 3594, 3617, 4157, 3619], 3454)
-    femmesh.addVolume([505, 170, 506, 80, 4548, 4956, 2426, 2422, 5016, 2424], 3455)
-    femmesh.addVolume([910, 459, 446, 377, 5624, 2168, 4962, 5625, 2161, 2118], 3456)
-    femmesh.addVolume([326, 400, 352, 737, 1977, 1978, 1886, 5615, 5596, 5698], 3457)
-    femmesh.addVolume([431, 469, 927, 468, 2193, 5367, 4027, 2191, 2195, 4028], 3458)
-    femmesh.addVolume([939, 430, 927, 970, 4370, 4026, 3802, 3871, 5699, 3873], 3459)
-    femmesh.addVolume([177, 543, 157, 10, 4187, 4189, 1307, 1272, 4286, 1223], 3460)
-    femmesh.addVolume([923, 495, 944, 915, 5700, 5569, 3789, 3720, 5125, 3790], 3461)
-    femmesh.addVolume([469, 972, 927, 970, 4375, 3878, 5367, 4376, 3879, 3873], 3462)
-    femmesh.addVolume([111, 165, 25, 558, 4228, 1240, 4899, 2564, 4000, 4001], 3463)
-    femmesh.addVolume([818, 450, 482, 456, 5616, 2248, 5262, 5385, 2215, 2233], 3464)
-    femmesh.addVolume([426, 464, 921, 952, 2178, 5637, 4039, 4040, 5690, 3816], 3465)
-    femmesh.addVolume([983, 494, 481, 963, 4185, 2277, 4080, 3932, 4169, 5701], 3466)
-    femmesh.addVolume([679, 209, 680, 278, 5702, 4908, 2950, 5703, 1600, 5662], 3467)
-    femmesh.addVolume([481, 964, 963, 935, 4253, 3855, 5701, 4321, 3853, 3851], 3468)
-    femmesh.addVolume([912, 436, 391, 437, 5021, 2087, 5608, 5022, 2091, 2089], 3469)
-    femmesh.addVolume([605, 604, 570, 130, 2859, 2716, 2719, 4112, 4099, 5338], 3470)
-    femmesh.addVolume([417, 419, 882, 460, 2038, 4161, 4158, 2164, 2165, 5197], 3471)
-    femmesh.addVolume([451, 492, 891, 916, 2311, 5428, 5704, 5687, 5427, 3700], 3472)
-    femmesh.addVolume([599, 123, 567, 124, 4622, 4836, 2705, 4618, 1128, 4614], 3473)
-    femmesh.addVolume([382, 334, 333, 831, 1923, 1773, 1922, 5509, 5652, 4363], 3474)
-    femmesh.addVolume([973, 925, 966, 493, 3882, 3860, 3892, 5459, 4179, 4181], 3475)
-    femmesh.addVolume([928, 895, 449, 929, 3737, 5564, 4591, 3742, 3740, 4590], 3476)
-    femmesh.addVolume([859, 406, 363, 858, 4882, 2002, 5321, 3518, 4883, 4215], 3477)
-    femmesh.addVolume([679, 208, 209, 278, 5705, 1384, 5702, 5703, 1599, 1600], 3478)
-    femmesh.addVolume([683, 771, 213, 283, 3230, 4578, 5484, 5639, 4580, 1614], 3479)
-    femmesh.addVolume([593, 249, 669, 594, 4068, 4326, 2921, 2693, 4327, 2922], 3480)
-    femmesh.addVolume([406, 441, 363, 858, 2128, 2110, 2002, 4883, 4147, 4215], 3481)
-    femmesh.addVolume([736, 418, 732, 792, 4703, 5638, 3127, 3300, 5396, 3309], 3482)
-    femmesh.addVolume([920, 870, 912, 437, 3712, 3684, 3714, 5706, 5707, 5022], 3483)
-    femmesh.addVolume([532, 221, 218, 146, 5531, 1419, 5532, 4271, 1417, 1411], 3484)
-    femmesh.addVolume([488, 447, 495, 944, 2252, 2282, 2283, 4275, 5708, 5569], 3485)
-    femmesh.addVolume([307, 812, 754, 349, 5632, 3358, 5631, 1816, 4608, 5635], 3486)
-    femmesh.addVolume([382, 831, 845, 875, 5509, 3475, 5508, 5448, 3569, 3571], 3487)
-    femmesh.addVolume([332, 381, 333, 798, 1919, 1920, 1770, 5542, 5337, 4923], 3488)
-    femmesh.addVolume([488, 956, 967, 944, 4273, 3887, 5383, 4275, 3888, 3864], 3489)
-    femmesh.addVolume([274, 334, 828, 781, 1772, 5655, 5656, 4539, 4540, 3412], 3490)
-    femmesh.addVolume([500, 984, 45, 74, 5709, 4383, 4745, 2407, 4381, 2376], 3491)
-    femmesh.addVolume([410, 453, 933, 900, 2140, 5710, 5088, 5089, 5711, 3753], 3492)
-    femmesh.addVolume([915, 495, 944, 949, 5125, 5569, 3790, 3805, 5570, 3807], 3493)
-    femmesh.addVolume([335, 275, 795, 336, 1775, 4988, 4198, 1779, 1777, 3965], 3494)
-    femmesh.addVolume([409, 854, 897, 896, 5293, 3638, 5712, 5677, 3636, 3640], 3495)
-    femmesh.addVolume([923, 495, 447, 944, 5700, 2282, 4303, 3789, 5569, 5708], 3496)
-    femmesh.addVolume([928, 925, 458, 890, 3738, 4159, 5230, 3736, 3727, 4155], 3497)
-    femmesh.addVolume([848, 419, 417, 373, 4160, 2038, 4162, 4311, 2036, 2031], 3498)
-    femmesh.addVolume([851, 852, 371, 415, 3497, 5713, 4998, 5479, 5312, 2022], 3499)
-    femmesh.addVolume([890, 851, 415, 852, 3617, 5479, 5311, 3618, 3497, 5312], 3500)
-    femmesh.addVolume([355, 263, 729, 663, 1832, 5606, 5538, 5102, 5094, 3111], 3501)
-    femmesh.addVolume([500, 984, 31, 45, 5709, 5714, 5225, 4745, 4383, 1245], 3502)
-    femmesh.addVolume([880, 865, 919, 405, 3587, 3708, 3709, 5286, 5382, 4934], 3503)
-    femmesh.addVolume([342, 390, 847, 341, 1947, 4478, 5411, 1797, 1946, 4476], 3504)
-    femmesh.addVolume([639, 703, 236, 638, 3016, 5499, 4203, 2811, 3015, 4205], 3505)
-    femmesh.addVolume([788, 821, 344, 842, 3414, 5239, 5056, 3462, 3463, 5715], 3506)
-    femmesh.addVolume([430, 939, 467, 970, 4370, 5280, 2188, 5699, 3871, 4834], 3507)
-    femmesh.addVolume([406, 901, 902, 935, 4884, 3655, 5496, 5716, 3758, 3759], 3508)
-    femmesh.addVolume([467, 480, 491, 976, 2321, 2261, 2294, 3971, 5115, 3972], 3509)
-    femmesh.addVolume([662, 286, 735, 764, 4723, 4385, 3124, 3206, 4384, 3208], 3510)
-    femmesh.addVolume([760, 351, 784, 800, 4314, 4151, 3271, 3322, 5433, 3321], 3511)
-    femmesh.addVolume([961, 480, 932, 960, 4334, 5717, 3844, 3846, 4336, 3842], 3512)
-    femmesh.addVolume([480, 961, 442, 491, 4334, 4346, 2228, 2261, 4344, 2260], 3513)
-    femmesh.addVolume([984, 116, 31, 515, 5226, 4781, 5714, 5718, 2453, 4247], 3514)
-    femmesh.addVolume([491, 442, 453, 933, 2260, 2141, 2262, 4345, 4347, 5710], 3515)
-    femmesh.addVolume([447, 488, 938, 944, 2252, 4691, 4305, 5708, 4275, 3818], 3516)
-    femmesh.addVolume([945, 472, 471, 434, 4634, 2204, 5575, 4913, 2202, 2200], 3517)
-    femmesh.addVolume([392, 920, 866, 391, 5046, 3723, 5292, 1954, 4879, 4880], 3518)
-    femmesh.addVolume([903, 401, 902, 443, 4166, 5566, 3658, 5719, 2108, 5720], 3519)
-    femmesh.addVolume([912, 894, 391, 436, 3730, 5607, 5608, 5021, 4672, 2087], 3520)
-    femmesh.addVolume([335, 334, 383, 875, 1776, 1925, 1926, 5721, 5449, 5450], 3521)
-    femmesh.addVolume([474, 949, 473, 495, 4501, 5201, 2210, 2337, 5570, 2306], 3522)
-    femmesh.addVolume([494, 452, 934, 453, 2278, 5513, 5573, 2279, 2142, 5547], 3523)
-    femmesh.addVolume([639, 554, 553, 182, 2810, 2553, 2809, 4204, 5722, 5080], 3524)
-    femmesh.addVolume([335, 868, 336, 795, 3994, 5723, 1779, 4198, 3548, 3965], 3525)
-    femmesh.addVolume([106, 553, 182, 20, 2549, 5080, 5724, 4245, 5081, 1282], 3526)
-    femmesh.addVolume([396, 422, 880, 908, 2046, 4955, 5580, 5725, 4954, 3669], 3527)
-    femmesh.addVolume([879, 837, 462, 891, 3584, 4009, 5131, 3622, 3620, 4011], 3528)
-    femmesh.addVolume([500, 45, 168, 75, 4745, 1247, 4174, 2408, 2375, 4175], 3529)
-    femmesh.addVolume([918, 915, 949, 495, 3704, 3805, 3806, 5126, 5125, 5570], 3530)
-    femmesh.addVolume([169, 502, 77, 503, 4563, 2413, 4839, 4679, 2417, 2415], 3531)
-    femmesh.addVolume([923, 447, 938, 944, 4303, 4305, 3771, 3789, 5708, 3818], 3532)
-    femmesh.addVolume([492, 440, 891, 462, 2266, 4953, 5428, 2267, 2216, 4011], 3533)
-    femmesh.addVolume([565, 93, 8, 517, 2584, 5164, 5165, 2608, 2458, 5726], 3534)
-    femmesh.addVolume([618, 684, 195, 717, 3051, 5064, 5065, 3068, 3069, 5563], 3535)
-    femmesh.addVolume([156, 626, 176, 231, 4283, 5322, 1334, 1444, 5324, 1443], 3536)
-    femmesh.addVolume([506, 81, 80, 50, 2425, 1066, 2424, 5727, 2385, 2386], 3537)
-    femmesh.addVolume([440, 844, 891, 462, 4951, 3621, 4953, 2216, 4010, 4011], 3538)
-    femmesh.addVolume([210, 678, 280, 211, 3941, 3943, 1605, 1390, 4808, 1606], 3539)
-    femmesh.addVolume([650, 618, 195, 717, 2846, 5065, 5692, 3075, 3068, 5563], 3540)
-    femmesh.addVolume([238, 642, 184, 643, 4799, 4800, 1460, 5216, 2823, 4897], 3541)
-    femmesh.addVolume([111, 26, 574, 526, 4898, 3987, 2602, 2476, 3939, 2637], 3542)
-    femmesh.addVolume([659, 140, 528, 141, 4593, 4673, 2879, 4594, 1179, 4818], 3543)
-    femmesh.addVolume([93, 7, 8, 517, 4826, 989, 5164, 2458, 4648, 5726], 3544)
-    femmesh.addVolume([349, 859, 363, 811, 5196, 5321, 1862, 5092, 3516, 4214], 3545)
-    femmesh.addVolume([106, 571, 20, 132, 2595, 5221, 4245, 4246, 5284, 1150], 3546)
-    femmesh.addVolume([265, 716, 196, 717, 5403, 4470, 1562, 5562, 3130, 4472], 3547)
-    femmesh.addVolume([871, 440, 891, 451, 4952, 4953, 3625, 4123, 2135, 5704], 3548)
-    femmesh.addVolume([725, 719, 624, 289, 3098, 3072, 3097, 5234, 5193, 5586], 3549)
-    femmesh.addVolume([224, 624, 152, 581, 5585, 4524, 1427, 5592, 2763, 4855], 3550)
-    femmesh.addVolume([535, 40, 69, 151, 5341, 2361, 2498, 5728, 1206, 5729], 3551)
-    femmesh.addVolume([440, 492, 891, 451, 2266, 5428, 4953, 2135, 2311, 5704], 3552)
-    femmesh.addVolume([772, 326, 352, 737, 5622, 1886, 4846, 3234, 5615, 5698], 3553)
-    femmesh.addVolume([492, 950, 916, 498, 4500, 3810, 5427, 2324, 4208, 4210], 3554)
-    femmesh.addVolume([205, 206, 130, 605, 1375, 1373, 1371, 4111, 4991, 4112], 3555)
-    femmesh.addVolume([181, 637, 162, 253, 4782, 5730, 1304, 1499, 5333, 1498], 3556)
-    femmesh.addVolume([871, 451, 891, 916, 4123, 5704, 3625, 3694, 5687, 3700], 3557)
-    femmesh.addVolume([158, 177, 544, 629, 1335, 5731, 4117, 4116, 4200, 2780], 3558)
-    femmesh.addVolume([293, 744, 228, 322, 3951, 4746, 1640, 1735, 4587, 1734], 3559)
-    femmesh.addVolume([100, 15, 521, 568, 4860, 4576, 2467, 2589, 4759, 2646], 3560)
-    femmesh.addVolume([623, 122, 519, 123, 4266, 5305, 2759, 5627, 1125, 4837], 3561)
-    femmesh.addVolume([557, 643, 558, 184, 2821, 2822, 2565, 4805, 4897, 3999], 3562)
-    femmesh.addVolume([384, 430, 385, 883, 2068, 2069, 1933, 5214, 4371, 5636], 3563)
-    femmesh.addVolume([738, 276, 206, 712, 4992, 1593, 4993, 3131, 4771, 4989], 3564)
-    femmesh.addVolume([488, 473, 949, 495, 2305, 5201, 4274, 2283, 2306, 5570], 3565)
-    femmesh.addVolume([406, 452, 901, 935, 2137, 5732, 4884, 5716, 5515, 3758], 3566)
-    femmesh.addVolume([474, 949, 495, 918, 4501, 5570, 2337, 4256, 3806, 5126], 3567)
-    femmesh.addVolume([956, 951, 949, 473, 2342, 2343, 2341, 5191, 5202, 5201], 3568)
-    femmesh.addVolume([488, 956, 949, 473, 4273, 2341, 4274, 2305, 5191, 5201], 3569)
-    femmesh.addVolume([673, 202, 603, 203, 5227, 5228, 2931, 3962, 1366, 5505], 3570)
-    femmesh.addVolume([140, 29, 528, 141, 1175, 4816, 4673, 1179, 1177, 4818], 3571)
-    femmesh.addVolume([653, 125, 520, 601, 4532, 4401, 2860, 2889, 4534, 2711], 3572)
-    femmesh.addVolume([595, 250, 512, 594, 4750, 5463, 2694, 2696, 4752, 2692], 3573)
-    femmesh.addVolume([480, 455, 932, 960, 2229, 5733, 5717, 4336, 5110, 3842], 3574)
-    femmesh.addVolume([596, 216, 141, 217, 5558, 1404, 5203, 5204, 1409, 1406], 3575)
-    femmesh.addVolume([465, 948, 941, 974, 5734, 3819, 4492, 4318, 3884, 3885], 3576)
-    femmesh.addVolume([345, 287, 360, 723, 1806, 1847, 1848, 5477, 4211, 5735], 3577)
-    femmesh.addVolume([513, 173, 262, 174, 4423, 1544, 5098, 5671, 1260, 1543], 3578)
-    femmesh.addVolume([345, 360, 779, 723, 1848, 5736, 5232, 5477, 5735, 3254], 3579)
-    femmesh.addVolume([670, 302, 250, 594, 5559, 1665, 4751, 2923, 4329, 4752], 3580)
-    femmesh.addVolume([668, 593, 295, 669, 2919, 4070, 4870, 3067, 2921, 5436], 3581)
-    femmesh.addVolume([516, 117, 537, 193, 4498, 4749, 2625, 4084, 1511, 4086], 3582)
-    femmesh.addVolume([959, 931, 490, 960, 3839, 5187, 5189, 3843, 3841, 4366], 3583)
-    femmesh.addVolume([453, 934, 933, 900, 5547, 3757, 5710, 5711, 3755, 3753], 3584)
-    femmesh.addVolume([667, 763, 351, 299, 3204, 4150, 4149, 5255, 5118, 1821], 3585)
-    femmesh.addVolume([607, 656, 680, 209, 2897, 2948, 2949, 5737, 4907, 4908], 3586)
-    femmesh.addVolume([298, 292, 350, 757, 1654, 1818, 1819, 4737, 4262, 5271], 3587)
-    femmesh.addVolume([60, 59, 33, 577, 1044, 2346, 2347, 2611, 2609, 5038], 3588)
-    femmesh.addVolume([769, 269, 270, 330, 5144, 1577, 3944, 5135, 1759, 1760], 3589)
-    femmesh.addVolume([469, 970, 927, 468, 4376, 3873, 5367, 2195, 3986, 4028], 3590)
-    femmesh.addVolume([221, 532, 612, 576, 5531, 2733, 4020, 5478, 2606, 2732], 3591)
-    femmesh.addVolume([985, 73, 90, 3, 5093, 2455, 4585, 5738, 1058, 1076], 3592)
-    femmesh.addVolume([849, 769, 270, 330, 3486, 3944, 5487, 4833, 5135, 1760], 3593)
-    femmesh.addVolume([34, 144, 60, 33, 1188, 4410, 2348, 1016, 1187, 2347], 3594)
-    femmesh.addVolume([985, 563, 1, 3, 4389, 4388, 4390, 5738, 2486, 2369], 3595)
-    femmesh.addVolume([430, 431, 883, 927, 2073, 4850, 4371, 4026, 4027, 3735], 3596)
-    femmesh.addVolume([172, 510, 593, 261, 5263, 2688, 5476, 1540, 4291, 4069], 3597)
-    femmesh.addVolume([188, 502, 76, 47, 4562, 2412, 4660, 1294, 5551, 2380], 3598)
-    femmesh.addVolume([123, 12, 567, 124, 1124, 4835, 4836, 1128, 1126, 4614], 3599)
-    femmesh.addVolume([876, 444, 416, 886, 4792, 2113, 4249, 3606, 4426, 4251], 3600)
-    femmesh.addVolume([459, 910, 446, 922, 5624, 4962, 2168, 5369, 3800, 5739], 3601)
-    femmesh.addVolume([478, 968, 971, 485, 5695, 3877, 4483, 2243, 4662, 4481], 3602)
-    femmesh.addVolume([511, 54, 86, 85, 4944, 2403, 2440, 2439, 2404, 1071], 3603)
-    femmesh.addVolume([252, 695, 745, 322, 4043, 3150, 4786, 1736, 4045, 4588], 3604)
-    femmesh.addVolume([89, 4, 2, 515, 1075, 2399, 2400, 2451, 2452, 5511], 3605)
-    femmesh.addVolume([478, 968, 485, 424, 5695, 4662, 2243, 2224, 4369, 2241], 3606)
-    femmesh.addVolume([576, 147, 64, 533, 4885, 5182, 2607, 2615, 4699, 2495], 3607)
-    femmesh.addVolume([576, 63, 64, 36, 2605, 1048, 2607, 5439, 2352, 2353], 3608)
-    femmesh.addVolume([924, 493, 925, 460, 4180, 4179, 3780, 4469, 2274, 5740], 3609)
-    femmesh.addVolume([365, 865, 368, 817, 4192, 4891, 1986, 4193, 3534, 4645], 3610)
-    femmesh.addVolume([167, 115, 30, 583, 3981, 3956, 1243, 3982, 2627, 5741], 3611)
-    femmesh.addVolume([924, 483, 916, 498, 4468, 5686, 3721, 4209, 2323, 4210], 3612)
-    femmesh.addVolume([167, 30, 187, 583, 1243, 1293, 1317, 3982, 5741, 5447], 3613)
-    femmesh.addVolume([871, 888, 451, 916, 3613, 4005, 4123, 3694, 3695, 5687], 3614)
-    femmesh.addVolume([775, 682, 212, 281, 3241, 5176, 5742, 5317, 5581, 1609], 3615)
-    femmesh.addVolume([771, 683, 799, 283, 3230, 3320, 3385, 4580, 5639, 5237], 3616)
-    femmesh.addVolume([942, 459, 922, 910, 4061, 5369, 3825, 3797, 5624, 3800], 3617)
-    femmesh.addVolume([483, 492, 916, 498, 2320, 5427, 5686, 2323, 2324, 4210], 3618)
-    femmesh.addVolume([607, 208, 209, 679, 5743, 1384, 5737, 2946, 5705, 5702], 3619)
-    femmesh.addVolume([566, 519, 11, 96, 2644, 4137, 5283, 2585, 2463, 4164], 3620)
-    femmesh.addVolume([351, 299, 295, 668, 1821, 1657, 1820, 5409, 4869, 4870], 3621)
-    femmesh.addVolume([389, 434, 907, 388, 2081, 4669, 4668, 1945, 2080, 5415], 3622)
-    femmesh.addVolume([985, 73, 3, 1, 5093, 1058, 5738, 4390, 2368, 2369], 3623)
-    femmesh.addVolume([299, 667, 591, 261, 5255, 2916, 5218, 1655, 4641, 5217], 3624)
-    femmesh.addVolume([459, 942, 922, 954, 4061, 3825, 5369, 4063, 3823, 3828], 3625)
-    femmesh.addVolume([133, 524, 572, 107, 4033, 2635, 5412, 5510, 2472, 2598], 3626)
-    femmesh.addVolume([472, 945, 471, 982, 4634, 5575, 2204, 5354, 3831, 5421], 3627)
-    femmesh.addVolume([401, 903, 399, 445, 4166, 4074, 2007, 2116, 4242, 2115], 3628)
-    femmesh.addVolume([914, 474, 436, 437, 4289, 2208, 4296, 4683, 2209, 2091], 3629)
-    femmesh.addVolume([623, 598, 197, 714, 2857, 4893, 4267, 3052, 3053, 4895], 3630)
-    femmesh.addVolume([846, 331, 380, 878, 4742, 1916, 4597, 3581, 4014, 4066], 3631)
-    femmesh.addVolume([425, 485, 968, 424, 2242, 4662, 4368, 2055, 2241, 4369], 3632)
-    femmesh.addVolume([332, 271, 734, 272, 1765, 5149, 5654, 1766, 1583, 5744], 3633)
-    femmesh.addVolume([538, 175, 539, 6, 5071, 4732, 2508, 5745, 1265, 5746], 3634)
-    femmesh.addVolume([7, 118, 564, 6, 1109, 4611, 4647, 988, 1108, 5134], 3635)
-    femmesh.addVolume([15, 100, 521, 101, 4860, 2467, 4576, 5583, 1087, 2466], 3636)
-    femmesh.addVolume([175, 155, 6, 538, 1266, 1219, 1265, 5071, 5074, 5745], 3637)
-    femmesh.addVolume([224, 151, 619, 581, 1426, 5609, 4969, 5592, 5591, 2750], 3638)
-    femmesh.addVolume([538, 539, 91, 6, 2508, 2506, 2505, 5745, 5746, 5661], 3639)
-    femmesh.addVolume([494, 934, 963, 962, 5573, 3850, 4169, 4170, 3848, 3852], 3640)
-    femmesh.addVolume([232, 634, 699, 698, 4515, 3003, 5401, 5195, 3001, 3005], 3641)
-    femmesh.addVolume([698, 232, 748, 699, 5195, 5645, 3159, 3005, 5401, 3160], 3642)
-    femmesh.addVolume([186, 646, 561, 647, 4419, 2831, 3955, 4421, 2836, 2833], 3643)
-    femmesh.addVolume([535, 151, 581, 619, 5728, 5591, 2642, 2751, 5609, 2750], 3644)
-    femmesh.addVolume([326, 320, 289, 772, 1831, 1805, 1750, 5622, 5521, 5233], 3645)
-    femmesh.addVolume([298, 238, 707, 756, 1653, 5215, 4736, 4930, 5353, 3184], 3646)
-    femmesh.addVolume([452, 481, 963, 935, 2231, 5701, 5514, 5515, 4321, 3851], 3647)
-    femmesh.addVolume([227, 318, 308, 690, 1718, 1719, 1683, 5747, 5519, 5520], 3648)
-    femmesh.addVolume([318, 727, 690, 739, 5518, 3297, 5519, 4474, 3303, 3134], 3649)
-    femmesh.addVolume([719, 326, 289, 772, 5192, 1750, 5193, 3233, 5622, 5233], 3650)
-    femmesh.addVolume([67, 66, 39, 534, 1051, 2358, 2359, 2496, 2497, 5748], 3651)
-    femmesh.addVolume([964, 983, 481, 963, 2340, 4080, 4253, 3855, 3932, 5701], 3652)
-    femmesh.addVolume([151, 535, 581, 69, 5728, 2642, 5591, 5729, 2498, 2622], 3653)
-    femmesh.addVolume([425, 947, 911, 946, 4041, 3798, 4582, 4649, 3799, 3796], 3654)
-    femmesh.addVolume([398, 318, 324, 739, 1972, 1743, 1971, 4475, 4474, 5389], 3655)
-    femmesh.addVolume([568, 601, 126, 602, 2710, 5749, 4761, 2713, 2858, 5025], 3656)
-    femmesh.addVolume([887, 939, 429, 384, 3774, 4294, 4350, 5213, 5568, 2066], 3657)
-    femmesh.addVolume([180, 549, 17, 550, 5391, 4140, 1277, 5750, 2541, 5299], 3658)
-    femmesh.addVolume([478, 459, 954, 424, 2223, 4063, 4938, 2224, 2169, 4064], 3659)
-    femmesh.addVolume([191, 510, 261, 592, 5669, 4291, 1541, 5670, 2686, 4292], 3660)
-    femmesh.addVolume([550, 549, 17, 102, 2541, 4140, 5299, 2539, 2537, 4142], 3661)
-    femmesh.addVolume([851, 848, 417, 373, 3550, 4162, 4997, 4312, 4311, 2031], 3662)
-    femmesh.addVolume([128, 522, 17, 569, 4689, 4690, 1139, 5491, 2647, 5295], 3663)
-    femmesh.addVolume([675, 274, 781, 204, 5017, 4539, 3262, 4565, 1587, 5525], 3664)
-    femmesh.addVolume([252, 321, 745, 696, 1730, 3976, 4786, 4787, 3983, 3151], 3665)
-    femmesh.addVolume([966, 498, 478, 493, 4509, 2334, 4482, 4181, 2328, 2316], 3666)
-    femmesh.addVolume([254, 323, 693, 226, 1738, 4105, 5304, 1505, 1737, 4107], 3667)
-    femmesh.addVolume([939, 430, 429, 384, 4370, 2070, 4294, 5568, 2068, 2066], 3668)
-    femmesh.addVolume([375, 810, 363, 858, 4877, 4213, 2024, 4409, 3513, 4215], 3669)
-    femmesh.addVolume([41, 151, 152, 581, 1207, 1211, 1209, 4854, 5591, 4855], 3670)
-    femmesh.addVolume([304, 750, 372, 808, 5181, 5084, 1892, 5668, 3346, 5168], 3671)
-    femmesh.addVolume([756, 356, 303, 814, 5241, 1836, 4655, 3364, 5242, 4656], 3672)
-    femmesh.addVolume([874, 377, 416, 328, 5751, 2039, 4980, 4060, 1908, 2029], 3673)
-    femmesh.addVolume([151, 41, 69, 581, 1207, 2373, 5729, 5591, 4854, 2622], 3674)
-    femmesh.addVolume([876, 444, 414, 416, 4792, 2112, 5277, 4249, 2113, 2027], 3675)
-    femmesh.addVolume([346, 365, 790, 820, 1867, 4194, 4503, 5649, 5488, 3384], 3676)
-    femmesh.addVolume([150, 40, 535, 151, 1204, 5341, 4087, 1208, 1206, 5728], 3677)
-    femmesh.addVolume([966, 498, 493, 924, 4509, 2328, 4181, 3859, 4209, 4180], 3678)
-    femmesh.addVolume([785, 818, 456, 450, 3375, 5385, 5752, 5006, 5616, 2215], 3679)
-    femmesh.addVolume([304, 700, 251, 234, 5180, 5490, 1672, 1671, 5281, 1525], 3680)
-    femmesh.addVolume([65, 579, 533, 148, 2617, 2640, 2494, 4815, 4439, 4437], 3681)
-    femmesh.addVolume([272, 672, 733, 273, 3959, 3119, 5061, 1586, 5468, 4364], 3682)
-    femmesh.addVolume([722, 291, 613, 688, 4763, 4432, 3084, 3086, 4433, 2973], 3683)
-    femmesh.addVolume([56, 57, 174, 88, 1040, 1258, 1259, 2395, 2398, 5672], 3684)
-    femmesh.addVolume([596, 216, 217, 671, 5558, 1409, 5204, 2926, 5556, 5560], 3685)
-    femmesh.addVolume([263, 355, 729, 347, 1832, 5538, 5606, 1811, 1863, 5272], 3686)
-    femmesh.addVolume([458, 925, 493, 460, 4159, 4179, 2273, 2166, 5740, 2274], 3687)
-    femmesh.addVolume([527, 139, 575, 610, 5466, 4812, 2638, 2729, 4811, 2728], 3688)
-    femmesh.addVolume([200, 769, 270, 715, 5329, 3944, 1575, 5442, 3225, 3946], 3689)
-    femmesh.addVolume([115, 529, 528, 30, 2483, 2484, 2480, 3956, 3957, 4817], 3690)
-    femmesh.addVolume([395, 392, 842, 344, 1964, 5045, 5753, 1961, 1953, 5715], 3691)
-    femmesh.addVolume([528, 140, 114, 29, 4673, 5374, 2481, 4816, 1175, 3947], 3692)
-    femmesh.addVolume([334, 333, 831, 273, 1773, 4363, 5652, 1771, 1769, 4365], 3693)
-    femmesh.addVolume([144, 577, 33, 143, 4411, 5038, 1187, 1189, 4197, 1186], 3694)
-    femmesh.addVolume([342, 390, 391, 847, 1947, 1951, 1949, 5411, 4478, 4881], 3695)
-    femmesh.addVolume([947, 425, 911, 426, 4041, 4582, 3798, 4038, 2058, 4581], 3696)
-    femmesh.addVolume([463, 975, 977, 952, 4071, 3920, 5754, 4072, 3933, 3916], 3697)
-    femmesh.addVolume([624, 224, 619, 581, 5585, 4969, 2764, 2763, 5592, 2750], 3698)
-    femmesh.addVolume([150, 535, 223, 151, 4087, 4089, 1424, 1208, 5728, 1425], 3699)
-    femmesh.addVolume([752, 311, 702, 751, 5331, 5318, 3171, 3173, 5351, 3169], 3700)
-    femmesh.addVolume([810, 752, 751, 311, 3352, 3173, 3351, 5474, 5331, 5351], 3701)
-    femmesh.addVolume([651, 255, 580, 223, 5244, 4526, 2848, 5755, 1508, 4090], 3702)
-    femmesh.addVolume([899, 410, 856, 402, 5087, 5642, 3644, 5158, 2026, 5159], 3703)
-    femmesh.addVolume([441, 375, 363, 858, 2101, 2024, 2110, 4147, 4409, 4215], 3704)
-    femmesh.addVolume([615, 651, 580, 223, 2851, 2848, 2741, 4512, 5755, 4090], 3705)
-    femmesh.addVolume([979, 466, 974, 955, 4354, 5756, 3934, 3922, 4218, 3890], 3706)
-    femmesh.addVolume([32, 155, 530, 563, 1305, 5082, 5757, 5024, 5023, 2767], 3707)
-    femmesh.addVolume([191, 591, 509, 592, 4144, 2683, 4145, 5670, 2687, 2685], 3708)
-    femmesh.addVolume([387, 822, 872, 388, 5612, 3561, 5610, 1942, 4985, 5328], 3709)
-    femmesh.addVolume([390, 847, 894, 391, 4478, 3630, 4664, 1951, 4881, 5607], 3710)
-    femmesh.addVolume([225, 224, 624, 152, 1431, 5585, 4523, 1429, 1427, 4524], 3711)
-    femmesh.addVolume([531, 245, 611, 614, 4404, 4125, 2731, 2736, 4416, 2739], 3712)
-    femmesh.addVolume([389, 390, 341, 850, 1948, 1946, 1944, 5628, 4479, 4477], 3713)
-    femmesh.addVolume([191, 261, 591, 592, 1541, 5217, 4144, 5670, 4292, 2687], 3714)
-    femmesh.addVolume([602, 202, 127, 603, 5026, 1362, 4092, 2862, 5228, 4093], 3715)
-    femmesh.addVolume([466, 948, 974, 955, 4216, 3884, 5756, 4218, 3827, 3890], 3716)
-    femmesh.addVolume([571, 106, 20, 105, 2595, 4245, 5221, 2596, 1092, 5154], 3717)
-    femmesh.addVolume([307, 752, 311, 703, 5076, 5331, 1697, 5078, 3172, 5332], 3718)
-    femmesh.addVolume([466, 979, 974, 490, 4354, 3934, 5756, 2293, 4358, 4320], 3719)
-    femmesh.addVolume([327, 829, 416, 328, 5275, 4978, 2028, 1755, 4979, 2029], 3720)
-    femmesh.addVolume([881, 378, 884, 942, 4506, 4507, 3599, 3785, 4652, 3784], 3721)
-    femmesh.addVolume([307, 703, 311, 236, 5078, 5332, 1697, 1679, 5499, 1695], 3722)
-    femmesh.addVolume([21, 106, 182, 20, 4244, 5724, 1281, 1002, 4245, 1282], 3723)
-    femmesh.addVolume([406, 860, 401, 902, 5361, 4165, 1995, 5496, 3654, 5566], 3724)
-    femmesh.addVolume([406, 859, 902, 901, 4882, 3653, 5496, 4884, 3651, 3655], 3725)
-    femmesh.addVolume([357, 402, 856, 372, 1985, 5159, 5068, 1893, 1984, 5169], 3726)
-    femmesh.addVolume([276, 738, 336, 796, 4992, 5451, 1778, 4851, 3312, 3964], 3727)
-    femmesh.addVolume([202, 203, 127, 603, 1366, 1364, 1362, 5228, 5505, 4093], 3728)
-    femmesh.addVolume([348, 397, 852, 853, 1969, 5209, 5678, 5210, 5208, 3500], 3729)
-    femmesh.addVolume([855, 854, 897, 413, 3506, 3638, 3639, 4628, 5294, 5758], 3730)
-    femmesh.addVolume([489, 958, 977, 957, 4920, 3901, 4556, 4569, 3837, 3900], 3731)
-    femmesh.addVolume([422, 909, 405, 880, 4190, 5009, 2047, 4955, 3672, 5286], 3732)
-    femmesh.addVolume([315, 701, 702, 751, 4108, 3014, 4871, 5352, 3168, 3169], 3733)
-    femmesh.addVolume([948, 466, 974, 465, 4216, 5756, 3884, 5734, 2186, 4318], 3734)
-    femmesh.addVolume([298, 815, 757, 350, 4929, 3367, 4737, 1819, 5269, 5271], 3735)
-    femmesh.addVolume([147, 576, 64, 36, 4885, 2607, 5182, 1195, 5439, 2353], 3736)
-    femmesh.addVolume([979, 960, 974, 490, 3907, 3931, 3934, 4358, 4366, 4320], 3737)
-    femmesh.addVolume([37, 147, 64, 36, 1196, 5182, 2354, 1019, 1195, 2353], 3738)
-    femmesh.addVolume([569, 128, 603, 127, 5491, 5503, 2714, 5545, 1140, 4093], 3739)
-    femmesh.addVolume([2, 31, 984, 45, 1013, 5714, 4382, 1028, 1245, 4383], 3740)
-    femmesh.addVolume([885, 444, 839, 886, 4425, 5027, 3601, 3605, 4426, 3604], 3741)
-    femmesh.addVolume([400, 354, 787, 789, 1979, 5523, 5524, 5483, 5582, 3468], 3742)
-    femmesh.addVolume([285, 670, 762, 302, 5601, 3201, 4973, 1804, 5559, 4630], 3743)
-    femmesh.addVolume([364, 312, 724, 676, 1866, 5256, 4825, 4823, 5759, 3093], 3744)
-    femmesh.addVolume([8, 565, 517, 119, 5165, 2608, 5726, 1112, 5349, 4867], 3745)
-    femmesh.addVolume([87, 56, 55, 173, 2396, 1039, 2393, 4424, 1256, 1257], 3746)
-    femmesh.addVolume([969, 465, 941, 974, 4490, 4492, 3867, 3893, 4318, 3885], 3747)
-    femmesh.addVolume([2, 57, 515, 31, 1041, 5512, 5511, 1013, 1183, 4247], 3748)
-    femmesh.addVolume([242, 187, 168, 649, 1468, 1434, 1471, 5472, 5453, 5454], 3749)
-    femmesh.addVolume([128, 203, 603, 127, 1365, 5505, 5503, 1140, 1364, 4093], 3750)
-    femmesh.addVolume([76, 188, 46, 501, 4660, 1295, 2377, 2410, 3936, 4412], 3751)
-    femmesh.addVolume([758, 296, 239, 292, 4006, 1647, 4518, 4260, 1648, 1638], 3752)
-    femmesh.addVolume([749, 807, 808, 357, 3343, 3347, 3345, 5653, 5235, 5067], 3753)
-    femmesh.addVolume([461, 958, 929, 930, 4919, 3835, 4866, 5760, 3836, 3745], 3754)
-    femmesh.addVolume([258, 708, 643, 644, 4733, 3030, 4711, 4712, 3031, 2826], 3755)
-    femmesh.addVolume([557, 184, 558, 110, 4805, 3999, 2565, 2561, 4806, 2563], 3756)
-    femmesh.addVolume([87, 173, 55, 512, 4424, 1257, 2393, 2443, 5099, 5445], 3757)
-    femmesh.addVolume([863, 404, 864, 350, 5122, 4931, 3533, 5123, 1990, 5296], 3758)
-    femmesh.addVolume([173, 192, 55, 512, 1332, 1302, 1257, 5099, 5444, 5445], 3759)
-    femmesh.addVolume([144, 219, 245, 614, 1413, 1481, 1479, 5534, 5371, 4416], 3760)
-    femmesh.addVolume([793, 339, 782, 822, 5535, 5761, 3393, 3389, 4984, 3406], 3761)
-    femmesh.addVolume([219, 308, 245, 614, 1680, 1681, 1481, 5371, 4415, 4416], 3762)
-    femmesh.addVolume([326, 719, 737, 772, 5192, 3128, 5615, 5622, 3233, 3234], 3763)
-    femmesh.addVolume([805, 367, 853, 806, 4776, 4779, 3498, 3341, 4780, 3499], 3764)
-    femmesh.addVolume([354, 265, 352, 773, 1827, 1824, 1830, 5140, 5404, 5482], 3765)
-    femmesh.addVolume([352, 354, 773, 787, 1830, 5140, 5482, 4847, 5523, 3285], 3766)
-    femmesh.addVolume([606, 208, 207, 132, 5605, 1381, 5073, 5571, 1379, 1377], 3767)
-    femmesh.addVolume([411, 826, 361, 438, 4119, 4121, 2025, 2111, 4029, 2093], 3768)
-    femmesh.addVolume([552, 19, 20, 105, 4182, 1001, 4183, 2546, 4529, 5154], 3769)
-    femmesh.addVolume([236, 703, 702, 638, 5499, 3017, 5502, 4205, 3015, 3013], 3770)
-    femmesh.addVolume([906, 863, 905, 404, 3664, 3663, 3666, 3991, 5122, 4803], 3771)
-    femmesh.addVolume([774, 274, 275, 335, 5018, 1592, 4987, 5762, 1774, 1775], 3772)
-    femmesh.addVolume([752, 810, 363, 311, 3352, 4213, 4961, 5331, 5474, 1861], 3773)
-    femmesh.addVolume([841, 337, 385, 336, 3967, 1932, 5259, 3963, 1782, 1931], 3774)
-    femmesh.addVolume([219, 728, 308, 614, 5431, 5223, 1680, 5371, 3110, 4415], 3775)
-    femmesh.addVolume([846, 381, 332, 798, 5683, 1919, 4743, 3477, 5337, 5542], 3776)
-    femmesh.addVolume([227, 175, 625, 219, 1436, 4731, 5664, 1536, 1517, 5432], 3777)
-    femmesh.addVolume([604, 522, 570, 129, 2717, 2633, 2716, 4100, 4128, 4130], 3778)
-    femmesh.addVolume([103, 18, 104, 570, 4845, 5346, 1090, 2594, 4129, 2593], 3779)
-    femmesh.addVolume([950, 499, 478, 498, 4499, 2338, 4719, 4208, 2333, 2334], 3780)
-    femmesh.addVolume([818, 837, 731, 456, 3449, 3447, 3376, 5385, 5040, 5229], 3781)
-    femmesh.addVolume([540, 175, 625, 156, 4279, 4731, 2769, 4280, 1268, 5763], 3782)
-    femmesh.addVolume([249, 172, 593, 261, 1489, 5476, 4068, 1553, 1540, 4069], 3783)
-    femmesh.addVolume([436, 951, 926, 473, 4295, 3815, 5090, 2206, 5202, 5224], 3784)
-    femmesh.addVolume([436, 951, 473, 474, 4295, 5202, 2206, 2208, 4290, 2210], 3785)
-    femmesh.addVolume([175, 227, 625, 156, 1436, 5664, 4731, 1268, 1435, 5763], 3786)
-    femmesh.addVolume([749, 290, 251, 699, 4536, 1633, 5577, 3162, 5619, 5578], 3787)
-    femmesh.addVolume([530, 155, 32, 143, 5082, 1305, 5757, 4195, 1414, 1185], 3788)
-    femmesh.addVolume([442, 899, 402, 410, 5663, 5158, 2105, 2104, 5087, 2026], 3789)
-    femmesh.addVolume([978, 958, 497, 959, 3905, 4101, 4570, 3906, 3840, 4103], 3790)
-    femmesh.addVolume([21, 554, 107, 163, 5517, 2552, 4748, 1236, 5462, 5640], 3791)
-    femmesh.addVolume([780, 711, 297, 306, 3266, 4025, 5153, 4950, 4324, 1733], 3792)
-    femmesh.addVolume([389, 390, 850, 907, 1948, 4479, 5628, 4668, 4663, 3667], 3793)
-    femmesh.addVolume([876, 414, 327, 416, 5277, 2020, 5274, 4249, 2027, 2028], 3794)
-    femmesh.addVolume([654, 128, 129, 204, 5492, 1143, 5623, 5034, 1367, 1368], 3795)
-    femmesh.addVolume([203, 128, 654, 204, 1365, 5492, 5504, 1369, 1367, 5034], 3796)
-    femmesh.addVolume([799, 283, 284, 344, 5237, 1619, 5057, 5058, 1801, 1802], 3797)
-    femmesh.addVolume([463, 425, 968, 952, 2176, 4368, 4073, 4072, 4042, 3886], 3798)
-    femmesh.addVolume([793, 679, 680, 278, 3301, 2950, 3308, 5536, 5703, 5662], 3799)
-    femmesh.addVolume([478, 968, 424, 954, 5695, 4369, 2224, 4938, 3866, 4064], 3800)
-    femmesh.addVolume([681, 799, 284, 783, 3319, 5057, 4972, 3386, 3378, 4995], 3801)
-    femmesh.addVolume([670, 285, 762, 783, 5601, 4973, 3201, 3268, 5020, 3277], 3802)
-    femmesh.addVolume([969, 464, 977, 952, 5297, 4555, 3915, 3881, 5690, 3916], 3803)
-    femmesh.addVolume([683, 681, 214, 658, 2961, 4603, 4601, 2958, 2953, 5486], 3804)
-    femmesh.addVolume([370, 763, 351, 407, 4638, 4150, 1885, 1998, 5434, 1997], 3805)
-    femmesh.addVolume([411, 422, 873, 448, 2048, 4191, 4417, 2125, 2126, 4277], 3806)
-    femmesh.addVolume([98, 12, 567, 97, 5467, 4835, 2587, 1084, 4136, 2588], 3807)
-    femmesh.addVolume([661, 711, 306, 585, 3041, 4324, 4430, 2902, 3040, 5157], 3808)
-    femmesh.addVolume([465, 466, 974, 490, 2186, 5756, 4318, 2292, 2293, 4320], 3809)
-    femmesh.addVolume([917, 492, 462, 479, 5426, 2267, 5132, 5128, 2270, 2271], 3810)
-    femmesh.addVolume([527, 139, 138, 27, 5466, 1173, 4829, 5378, 1171, 1169], 3811)
-    femmesh.addVolume([562, 186, 561, 647, 3953, 3955, 2577, 2834, 4421, 2833], 3812)
-    femmesh.addVolume([244, 634, 698, 633, 4925, 3001, 4697, 4927, 2796, 3000], 3813)
-    femmesh.addVolume([462, 818, 482, 456, 5384, 5262, 2232, 2174, 5385, 2233], 3814)
-    femmesh.addVolume([10, 543, 157, 542, 4286, 4189, 1223, 5675, 2520, 4730], 3815)
-    femmesh.addVolume([321, 230, 746, 696, 1729, 5594, 3975, 3983, 5173, 3153], 3816)
-    femmesh.addVolume([159, 230, 632, 179, 1442, 5172, 5357, 1309, 1441, 5358], 3817)
-    femmesh.addVolume([865, 368, 864, 405, 4891, 4644, 3537, 5382, 2010, 4932], 3818)
-    femmesh.addVolume([491, 494, 962, 453, 2314, 4170, 4341, 2262, 2279, 5764], 3819)
-    femmesh.addVolume([673, 202, 685, 602, 5227, 5048, 3074, 2932, 5026, 2965], 3820)
-    femmesh.addVolume([854, 367, 369, 806, 4778, 1880, 4330, 3501, 4780, 5400], 3821)
-    femmesh.addVolume([150, 39, 149, 534, 1203, 1202, 1205, 4527, 5748, 5765], 3822)
-    femmesh.addVolume([829, 761, 267, 778, 3416, 5602, 5603, 3417, 3250, 5766], 3823)
-    femmesh.addVolume([870, 392, 439, 437, 5044, 2095, 5339, 5707, 2090, 2098], 3824)
-    femmesh.addVolume([653, 199, 686, 599, 4615, 4667, 2967, 2866, 4617, 2968], 3825)
-    femmesh.addVolume([825, 420, 374, 393, 5184, 2042, 5114, 5185, 2040, 1989], 3826)
-    femmesh.addVolume([475, 877, 836, 869, 4949, 3576, 4558, 4557, 3577, 3551], 3827)
-    femmesh.addVolume([214, 681, 215, 610, 4603, 4681, 1402, 4896, 2952, 4680], 3828)
-    femmesh.addVolume([202, 271, 685, 201, 1579, 5142, 5048, 1363, 1578, 5049], 3829)
-    femmesh.addVolume([213, 609, 137, 212, 5587, 4795, 1394, 1396, 4796, 1392], 3830)
-    femmesh.addVolume([642, 557, 556, 164, 2819, 2562, 2818, 4801, 5365, 5267], 3831)
-    femmesh.addVolume([107, 555, 22, 163, 2554, 5666, 5630, 5640, 5418, 1235], 3832)
-    femmesh.addVolume([338, 796, 833, 770, 4571, 3428, 4573, 5178, 3318, 3427], 3833)
-    femmesh.addVolume([236, 162, 182, 638, 1456, 1312, 1455, 4205, 5643, 4206], 3834)
-    femmesh.addVolume([799, 788, 284, 762, 3394, 5055, 5057, 3377, 3290, 4974], 3835)
-    femmesh.addVolume([150, 67, 39, 534, 4269, 2359, 1203, 4527, 2496, 5748], 3836)
-    femmesh.addVolume([30, 115, 116, 583, 3956, 1102, 3958, 5741, 2627, 2628], 3837)
-    femmesh.addVolume([868, 841, 336, 795, 3553, 3963, 5723, 3548, 3460, 3965], 3838)
-    femmesh.addVolume([106, 554, 21, 182, 2551, 5517, 4244, 5724, 5722, 1281], 3839)
-    femmesh.addVolume([338, 277, 770, 278, 1783, 5659, 5178, 1784, 1601, 5767], 3840)
-    femmesh.addVolume([936, 445, 443, 476, 4241, 2151, 5768, 5769, 2217, 2218], 3841)
-    femmesh.addVolume([12, 519, 567, 97, 4135, 2630, 4835, 4136, 2462, 2588], 3842)
-    femmesh.addVolume([225, 153, 621, 256, 1430, 5589, 4238, 1523, 1519, 5770], 3843)
-    femmesh.addVolume([90, 538, 5, 563, 2504, 5771, 4584, 2580, 2661, 4386], 3844)
-    femmesh.addVolume([508, 191, 248, 591, 4143, 1486, 5772, 2682, 4144, 4999], 3845)
-    femmesh.addVolume([508, 590, 248, 171, 2680, 5000, 5772, 4340, 4338, 1487], 3846)
-    femmesh.addVolume([478, 950, 966, 971, 4719, 3861, 4482, 4483, 3899, 3914], 3847)
-    femmesh.addVolume([227, 219, 728, 308, 1536, 5431, 5665, 1683, 1680, 5223], 3848)
-    femmesh.addVolume([12, 98, 545, 97, 5467, 2525, 4550, 4136, 1084, 2524], 3849)
-    femmesh.addVolume([13, 12, 545, 178, 994, 4550, 5530, 1273, 1274, 4552], 3850)
-    femmesh.addVolume([763, 730, 370, 666, 3205, 4639, 4638, 3203, 3114, 5119], 3851)
-    femmesh.addVolume([593, 261, 592, 668, 4069, 4292, 2690, 2919, 4642, 2918], 3852)
-    femmesh.addVolume([79, 505, 49, 189, 2421, 4832, 2384, 4454, 4549, 1296], 3853)
-    femmesh.addVolume([153, 43, 42, 71, 1213, 1025, 1212, 5495, 2364, 2363], 3854)
-    femmesh.addVolume([260, 507, 171, 590, 5319, 4339, 1538, 4936, 2679, 4338], 3855)
-    femmesh.addVolume([70, 71, 536, 42, 1055, 2500, 2501, 2362, 2363, 4892], 3856)
-    femmesh.addVolume([287, 345, 722, 723, 1806, 4819, 4762, 4211, 5477, 3089], 3857)
-    femmesh.addVolume([261, 191, 591, 248, 1541, 4144, 5217, 1556, 1486, 4999], 3858)
-    femmesh.addVolume([32, 563, 1, 5, 5024, 4388, 1014, 1184, 4386, 986], 3859)
-    femmesh.addVolume([98, 12, 545, 13, 5467, 4550, 2525, 4017, 994, 5530], 3860)
-    femmesh.addVolume([191, 508, 248, 171, 4143, 5772, 1486, 1320, 4340, 1487], 3861)
-    femmesh.addVolume([188, 243, 242, 584, 1473, 1520, 1521, 5406, 5407, 5516], 3862)
-    femmesh.addVolume([590, 508, 248, 591, 2680, 5772, 5000, 2684, 2682, 4999], 3863)
-    femmesh.addVolume([464, 463, 977, 952, 2180, 5754, 4555, 5690, 4072, 3916], 3864)
-    femmesh.addVolume([313, 305, 622, 218, 1732, 4408, 4864, 1703, 1674, 4299], 3865)
-    femmesh.addVolume([298, 756, 707, 757, 4930, 3184, 4736, 4737, 3188, 3186], 3866)
-    femmesh.addVolume([187, 30, 116, 583, 1293, 3958, 5647, 5447, 5741, 2628], 3867)
-    femmesh.addVolume([52, 191, 509, 53, 1301, 4145, 4452, 1036, 1300, 5773], 3868)
-    femmesh.addVolume([54, 172, 53, 85, 1254, 1255, 1037, 2404, 5264, 2391], 3869)
-    femmesh.addVolume([747, 367, 805, 806, 4775, 4776, 3337, 3339, 4780, 3341], 3870)
-    femmesh.addVolume([302, 249, 250, 594, 1666, 1542, 1665, 4329, 4327, 4752], 3871)
-    femmesh.addVolume([249, 172, 192, 511, 1489, 1321, 1488, 5111, 5265, 4943], 3872)
-    femmesh.addVolume([261, 667, 591, 592, 4641, 2916, 5217, 4292, 2917, 2687], 3873)
-    femmesh.addVolume([747, 244, 319, 698, 4695, 1722, 5465, 3157, 4697, 5613], 3874)
-    femmesh.addVolume([255, 617, 534, 149, 5243, 2746, 4525, 1506, 5774, 5765], 3875)
-    femmesh.addVolume([885, 486, 446, 922, 5775, 2244, 4427, 3718, 5368, 5739], 3876)
-    femmesh.addVolume([16, 128, 569, 127, 1138, 5491, 5035, 1136, 1140, 5545], 3877)
-    femmesh.addVolume([84, 52, 509, 53, 2405, 4452, 2434, 2392, 1036, 5773], 3878)
-    femmesh.addVolume([122, 519, 11, 566, 5305, 4137, 1121, 5528, 2644, 5283], 3879)
-    femmesh.addVolume([510, 191, 53, 509, 5669, 1300, 4333, 2438, 4145, 5773], 3880)
-    femmesh.addVolume([807, 357, 369, 855, 5235, 1881, 4331, 3504, 4994, 4332], 3881)
-    femmesh.addVolume([172, 510, 53, 85, 5263, 4333, 1255, 5264, 2437, 2391], 3882)
-    femmesh.addVolume([690, 318, 691, 231, 5519, 5390, 2981, 5776, 1720, 4050], 3883)
-    femmesh.addVolume([257, 705, 640, 641, 4224, 3021, 5288, 4225, 3022, 2817], 3884)
-    femmesh.addVolume([112, 26, 138, 574, 5301, 1168, 4830, 2601, 3987, 4831], 3885)
-    femmesh.addVolume([241, 186, 167, 647, 1467, 1327, 1466, 4054, 4421, 4173], 3886)
-    femmesh.addVolume([107, 22, 108, 572, 5630, 5667, 1094, 2598, 5414, 2597], 3887)
-    femmesh.addVolume([210, 211, 135, 608, 1390, 1388, 1386, 4095, 4809, 4789], 3888)
-    femmesh.addVolume([175, 539, 625, 652, 4732, 2768, 4731, 5072, 2878, 2890], 3889)
-    femmesh.addVolume([615, 312, 724, 651, 5526, 5256, 3090, 2851, 5250, 3091], 3890)
-    femmesh.addVolume([26, 112, 138, 27, 5301, 4830, 1168, 1008, 4843, 1169], 3891)
-    femmesh.addVolume([323, 694, 293, 743, 4104, 3950, 1740, 5032, 3145, 3952], 3892)
-    femmesh.addVolume([668, 760, 669, 295, 3195, 3196, 3067, 4870, 4316, 5436], 3893)
-    femmesh.addVolume([353, 736, 721, 660, 5527, 3125, 5777, 5541, 3126, 3081], 3894)
-    femmesh.addVolume([576, 221, 616, 612, 5478, 5246, 2743, 2732, 4020, 2744], 3895)
-    femmesh.addVolume([538, 90, 5, 91, 2504, 4584, 5771, 2505, 1077, 5778], 3896)
-    femmesh.addVolume([188, 584, 242, 501, 5406, 5516, 1521, 3936, 2662, 3935], 3897)
-    femmesh.addVolume([711, 243, 306, 585, 4323, 1676, 4324, 3040, 5443, 5157], 3898)
-    femmesh.addVolume([232, 635, 251, 699, 4514, 5146, 1522, 5401, 3004, 5578], 3899)
-    femmesh.addVolume([89, 57, 514, 515, 2397, 5684, 2449, 2451, 5512, 2454], 3900)
-    femmesh.addVolume([360, 353, 732, 721, 1849, 5781, 5779, 5780, 5777, 3118], 3901)
-    femmesh.addVolume([62, 532, 578, 146, 2493, 2658, 2613, 5782, 4271, 5783], 3902)
-    femmesh.addVolume([906, 447, 404, 905, 3989, 2122, 3991, 3666, 4304, 4803], 3903)
-    femmesh.addVolume([307, 752, 363, 311, 5076, 4961, 1860, 1697, 5331, 1861], 3904)
-    femmesh.addVolume([162, 637, 638, 253, 5730, 2808, 5643, 1498, 5333, 5501], 3905)
-    femmesh.addVolume([705, 755, 237, 294, 3180, 5689, 4226, 4717, 5784, 1658], 3906)
-    femmesh.addVolume([131, 132, 655, 207, 1152, 5572, 5051, 1376, 1377, 5053], 3907)
-    femmesh.addVolume([239, 645, 644, 185, 4940, 2829, 4941, 1462, 4300, 5054], 3908)
-    femmesh.addVolume([22, 134, 108, 572, 1156, 5785, 5667, 5414, 5413, 2597], 3909)
-    femmesh.addVolume([35, 34, 145, 61, 1017, 1190, 1191, 2350, 2349, 5634], 3910)
-    femmesh.addVolume([908, 873, 411, 422, 3678, 4417, 5059, 4954, 4191, 2048], 3911)
-    femmesh.addVolume([238, 706, 756, 303, 5342, 3183, 5353, 1668, 5343, 4655], 3912)
-    femmesh.addVolume([755, 294, 358, 303, 5784, 1841, 4235, 4654, 1716, 1840], 3913)
-    femmesh.addVolume([936, 964, 965, 476, 3854, 3858, 3856, 5769, 4254, 4455], 3914)
-    femmesh.addVolume([770, 339, 793, 822, 5786, 5535, 3302, 3390, 4984, 3389], 3915)
-    femmesh.addVolume([555, 107, 22, 108, 2554, 5630, 5666, 2555, 1094, 5667], 3916)
-    femmesh.addVolume([505, 49, 170, 80, 4832, 1251, 4548, 2422, 2383, 5016], 3917)
-    femmesh.addVolume([109, 164, 556, 557, 4964, 5267, 2558, 2560, 5365, 2562], 3918)
-    femmesh.addVolume([500, 984, 74, 116, 5709, 4381, 2407, 2579, 5226, 2406], 3919)
-    femmesh.addVolume([57, 142, 514, 515, 1218, 4721, 5684, 5512, 4248, 2454], 3920)
-    femmesh.addVolume([224, 288, 289, 619, 1628, 1631, 1629, 4969, 4511, 5298], 3921)
-    femmesh.addVolume([320, 767, 352, 314, 5522, 4687, 1851, 1817, 4688, 1823], 3922)
-    femmesh.addVolume([301, 665, 361, 300, 4754, 4543, 1855, 1663, 4670, 1853], 3923)
-    femmesh.addVolume([352, 772, 737, 787, 4846, 3234, 5698, 4847, 3397, 3467], 3924)
-    femmesh.addVolume([538, 155, 5, 563, 5074, 1220, 5771, 2661, 5023, 4386], 3925)
-    femmesh.addVolume([621, 320, 684, 725, 4237, 5060, 2963, 3096, 4239, 3099], 3926)
-    femmesh.addVolume([537, 117, 597, 256, 4749, 4739, 2701, 5005, 1513, 4741], 3927)
-    femmesh.addVolume([309, 595, 262, 217, 5015, 5460, 1689, 1688, 5561, 1546], 3928)
-    femmesh.addVolume([60, 34, 61, 531, 2348, 2349, 1045, 2491, 4828, 2490], 3929)
-    femmesh.addVolume([736, 359, 739, 660, 4701, 4473, 3228, 3126, 5540, 3229], 3930)
-    femmesh.addVolume([109, 164, 557, 24, 4964, 5365, 2560, 4965, 1237, 4804], 3931)
-    femmesh.addVolume([318, 727, 739, 359, 5518, 3303, 4474, 1845, 5550, 4473], 3932)
-    femmesh.addVolume([642, 238, 706, 707, 4799, 5342, 3025, 3027, 5215, 3029], 3933)
-    femmesh.addVolume([557, 642, 184, 164, 2819, 4800, 4805, 5365, 4801, 1314], 3934)
-    femmesh.addVolume([23, 134, 108, 22, 1157, 5785, 5315, 1004, 1156, 5667], 3935)
-    femmesh.addVolume([354, 824, 327, 778, 5529, 5276, 1829, 5139, 3399, 5674], 3936)
-    femmesh.addVolume([91, 92, 564, 6, 1078, 2581, 2582, 5661, 5133, 5134], 3937)
-    femmesh.addVolume([728, 227, 308, 690, 5665, 1683, 5223, 3109, 5747, 5520], 3938)
-    femmesh.addVolume([318, 727, 359, 308, 5518, 5550, 1845, 1719, 4414, 1842], 3939)
-    femmesh.addVolume([727, 728, 308, 690, 3251, 5223, 4414, 3297, 3109, 5520], 3940)
-    femmesh.addVolume([539, 92, 91, 6, 2507, 1078, 2506, 5746, 5133, 5661], 3941)
-    femmesh.addVolume([632, 230, 633, 179, 5172, 5289, 2793, 5358, 1441, 5206], 3942)
-    femmesh.addVolume([117, 256, 537, 193, 1513, 5005, 4749, 1511, 1512, 4086], 3943)
-    femmesh.addVolume([90, 117, 5, 91, 4497, 1106, 4584, 1077, 5429, 5778], 3944)
-    femmesh.addVolume([645, 166, 240, 646, 5380, 1464, 5050, 2832, 4583, 5116], 3945)
-    femmesh.addVolume([516, 117, 91, 564, 4498, 5429, 2456, 2654, 4740, 2582], 3946)
-    femmesh.addVolume([15, 100, 548, 547, 4860, 2533, 5584, 5644, 2531, 2535], 3947)
-    femmesh.addVolume([140, 114, 28, 575, 5374, 4372, 1174, 4674, 2603, 5787], 3948)
-    femmesh.addVolume([538, 5, 6, 91, 5771, 987, 5745, 2505, 5778, 5661], 3949)
-    femmesh.addVolume([917, 879, 885, 479, 3696, 3602, 3698, 5128, 5010, 5408], 3950)
-    femmesh.addVolume([331, 846, 380, 332, 4742, 4597, 1916, 1767, 4743, 1917], 3951)
-    femmesh.addVolume([265, 716, 717, 773, 5403, 3130, 5562, 5404, 3236, 3237], 3952)
-    femmesh.addVolume([714, 689, 761, 198, 3054, 3198, 3199, 5148, 5693, 5626], 3953)
-    femmesh.addVolume([118, 194, 597, 256, 1338, 4114, 4610, 1547, 1550, 4741], 3954)
-    femmesh.addVolume([414, 824, 327, 354, 5470, 5276, 2020, 2019, 5529, 1829], 3955)
-    femmesh.addVolume([582, 154, 72, 537, 5002, 5247, 2623, 2656, 5004, 2503], 3956)
-    femmesh.addVolume([648, 118, 564, 517, 4609, 4611, 2838, 2837, 4646, 2629], 3957)
-    femmesh.addVolume([293, 373, 374, 802, 1897, 1901, 1899, 5788, 5680, 5112], 3958)
-    femmesh.addVolume([194, 621, 597, 256, 4115, 2892, 4114, 1550, 5770, 4741], 3959)
-    femmesh.addVolume([225, 725, 624, 289, 4240, 3097, 4523, 1630, 5234, 5586], 3960)
-    femmesh.addVolume([525, 134, 572, 108, 5789, 5413, 2650, 2475, 5785, 2597], 3961)
-    femmesh.addVolume([874, 881, 910, 377, 3589, 3677, 3674, 5751, 4797, 5625], 3962)
-    femmesh.addVolume([180, 549, 160, 16, 5391, 4886, 1310, 1278, 4139, 1229], 3963)
-    femmesh.addVolume([186, 241, 259, 647, 1467, 1533, 1534, 4421, 4054, 4056], 3964)
-    femmesh.addVolume([206, 712, 207, 655, 4989, 4772, 1378, 5052, 3043, 5053], 3965)
-    femmesh.addVolume([100, 547, 14, 99, 2531, 4758, 4764, 1086, 2530, 4399], 3966)
-    femmesh.addVolume([100, 15, 14, 547, 4860, 996, 4764, 2531, 5644, 4758], 3967)
-    femmesh.addVolume([936, 964, 443, 935, 3854, 4255, 5768, 3763, 3853, 4322], 3968)
-    femmesh.addVolume([508, 52, 509, 83, 4359, 4452, 2435, 2431, 2389, 2433], 3969)
-    femmesh.addVolume([300, 664, 765, 347, 4671, 3209, 4392, 1810, 5273, 4391], 3970)
-    femmesh.addVolume([954, 947, 968, 424, 3824, 3865, 3866, 4064, 4367, 4369], 3971)
-    femmesh.addVolume([969, 464, 427, 465, 5297, 2179, 4491, 4490, 2183, 2181], 3972)
-    femmesh.addVolume([744, 293, 373, 322, 3951, 1897, 5679, 4587, 1735, 1896], 3973)
-    femmesh.addVolume([558, 165, 644, 559, 4000, 4714, 2824, 2568, 4229, 2825], 3974)
-    femmesh.addVolume([186, 562, 167, 647, 3953, 3980, 1327, 4421, 2834, 4173], 3975)
-    femmesh.addVolume([780, 726, 264, 297, 3415, 4574, 4504, 5153, 4024, 1685], 3976)
-    femmesh.addVolume([263, 664, 588, 247, 5424, 2909, 5544, 1557, 4619, 4621], 3977)
-    femmesh.addVolume([529, 30, 141, 528, 3957, 1178, 4282, 2484, 4817, 4818], 3978)
-    femmesh.addVolume([434, 433, 913, 388, 2082, 5363, 4914, 2080, 2078, 5364], 3979)
-    femmesh.addVolume([942, 954, 424, 946, 3823, 4064, 4062, 3795, 3822, 4650], 3980)
-    femmesh.addVolume([238, 706, 707, 756, 5342, 3029, 5215, 5353, 3183, 3184], 3981)
-    femmesh.addVolume([21, 107, 22, 163, 4748, 5630, 1003, 1236, 5640, 1235], 3982)
-    femmesh.addVolume([547, 632, 633, 179, 2789, 2793, 2791, 5359, 5358, 5206], 3983)
-    femmesh.addVolume([271, 331, 786, 270, 1763, 5539, 5141, 1580, 1762, 3945], 3984)
-    femmesh.addVolume([244, 179, 160, 633, 1476, 1291, 1475, 4927, 5206, 4928], 3985)
-    femmesh.addVolume([373, 744, 322, 803, 5679, 4587, 1896, 4313, 3330, 4589], 3986)
-    femmesh.addVolume([736, 353, 732, 418, 5527, 5781, 3127, 4703, 2033, 5638], 3987)
-    femmesh.addVolume([23, 134, 135, 525, 1157, 1161, 1159, 4707, 5789, 4705], 3988)
-    femmesh.addVolume([98, 13, 520, 567, 4017, 4398, 2465, 2587, 4612, 2645], 3989)
-    femmesh.addVolume([12, 544, 11, 97, 5790, 4163, 993, 4136, 2522, 4138], 3990)
-    femmesh.addVolume([230, 244, 633, 179, 1477, 4927, 5289, 1441, 1476, 5206], 3991)
-    femmesh.addVolume([544, 12, 545, 97, 5790, 4550, 2526, 2522, 4136, 2524], 3992)
-    femmesh.addVolume([590, 260, 248, 171, 4936, 1554, 5000, 4338, 1538, 1487], 3993)
-    femmesh.addVolume([820, 355, 735, 346, 4378, 4377, 3381, 5649, 1852, 4413], 3994)
-    femmesh.addVolume([587, 662, 663, 286, 2905, 2908, 2906, 4724, 4723, 5096], 3995)
-    femmesh.addVolume([23, 134, 525, 108, 1157, 5789, 4707, 5315, 5785, 2475], 3996)
-    femmesh.addVolume([726, 646, 259, 647, 3100, 4420, 4055, 3101, 2836, 4056], 3997)
-    femmesh.addVolume([735, 306, 780, 346, 4429, 4950, 3259, 4413, 1808, 4502], 3998)
-    femmesh.addVolume([360, 723, 732, 779, 5735, 3117, 5779, 5736, 3254, 3255], 3999)
-    femmesh.addVolume([181, 161, 636, 234, 1311, 4624, 4783, 1451, 1452, 4982], 4000)
-    femmesh.addVolume([892, 381, 845, 382, 4443, 5336, 3623, 5334, 1924, 5508], 4001)
-    femmesh.addVolume([455, 898, 932, 931, 4945, 3749, 5733, 5245, 3747, 3751], 4002)
-    femmesh.addVolume([855, 357, 413, 402, 4994, 2016, 4628, 4629, 1985, 2018], 4003)
-    femmesh.addVolume([134, 656, 135, 525, 5791, 4822, 1161, 5789, 2870, 4705], 4004)
-    femmesh.addVolume([522, 604, 654, 129, 2717, 2863, 2864, 4128, 4100, 5623], 4005)
-    femmesh.addVolume([304, 315, 372, 750, 1709, 1902, 1892, 5181, 5083, 5084], 4006)
-    femmesh.addVolume([868, 335, 383, 875, 3994, 1926, 3993, 3570, 5721, 5450], 4007)
-    femmesh.addVolume([139, 140, 28, 575, 1176, 1174, 1172, 4812, 4674, 5787], 4008)
-    femmesh.addVolume([210, 656, 135, 134, 4094, 4822, 1386, 1385, 5791, 1161], 4009)
-    femmesh.addVolume([730, 301, 370, 666, 4753, 1883, 4639, 3114, 5500, 5119], 4010)
-    femmesh.addVolume([660, 305, 611, 622, 4657, 4407, 2901, 2900, 4408, 2888], 4011)
-    femmesh.addVolume([687, 297, 241, 726, 4023, 1650, 4633, 3197, 4024, 4053], 4012)
-    femmesh.addVolume([417, 458, 890, 415, 2160, 4155, 4157, 2114, 2159, 5311], 4013)
-    femmesh.addVolume([661, 233, 306, 286, 3968, 1675, 4430, 4431, 1624, 1677], 4014)
-    femmesh.addVolume([348, 804, 852, 371, 4484, 3495, 5678, 1889, 5170, 5713], 4015)
-    femmesh.addVolume([527, 139, 28, 575, 5466, 1172, 5379, 2638, 4812, 5787], 4016)
-    femmesh.addVolume([114, 186, 28, 561, 3954, 1290, 4372, 2573, 3955, 3998], 4017)
-    femmesh.addVolume([804, 851, 852, 371, 3494, 3497, 3495, 5170, 4998, 5713], 4018)
-    femmesh.addVolume([18, 551, 104, 19, 4568, 2543, 5346, 1000, 4397, 4528], 4019)
-    femmesh.addVolume([716, 598, 197, 196, 3059, 4893, 4894, 4470, 5507, 1348], 4020)
-    femmesh.addVolume([294, 307, 704, 754, 1715, 5614, 4718, 5097, 5631, 3177], 4021)
-    femmesh.addVolume([852, 348, 371, 415, 5678, 1889, 5713, 5312, 2021, 2022], 4022)
-    femmesh.addVolume([447, 423, 905, 938, 2121, 4309, 4304, 4305, 4310, 3770], 4023)
-    femmesh.addVolume([120, 565, 9, 8, 5348, 4465, 1115, 1114, 5165, 990], 4024)
-    femmesh.addVolume([92, 7, 93, 517, 4651, 4826, 1079, 2459, 4648, 2458], 4025)
-    femmesh.addVolume([551, 161, 636, 181, 5036, 4624, 2801, 4396, 1311, 4783], 4026)
-    femmesh.addVolume([310, 617, 718, 651, 5792, 3071, 5041, 5251, 2850, 3070], 4027)
-    femmesh.addVolume([612, 313, 622, 218, 4022, 4864, 2758, 5533, 1703, 4299], 4028)
-    femmesh.addVolume([95, 10, 96, 566, 4285, 4287, 1082, 2586, 5282, 2585], 4029)
-    femmesh.addVolume([360, 723, 721, 732, 5735, 3095, 5780, 5779, 3117, 3118], 4030)
-    femmesh.addVolume([531, 145, 61, 578, 4402, 5634, 2490, 2639, 5552, 2614], 4031)
-    femmesh.addVolume([887, 868, 383, 875, 3607, 3993, 4351, 3608, 3570, 5450], 4032)
-    femmesh.addVolume([714, 197, 198, 267, 4895, 1351, 5148, 4970, 1566, 1567], 4033)
-    femmesh.addVolume([749, 290, 304, 251, 4536, 1702, 5475, 5577, 1633, 1672], 4034)
-    femmesh.addVolume([887, 384, 383, 868, 5213, 1930, 4351, 3607, 3992, 3993], 4035)
-    femmesh.addVolume([178, 158, 545, 630, 1308, 4551, 4552, 4545, 4118, 2783], 4036)
-    femmesh.addVolume([917, 950, 916, 492, 3809, 3810, 3767, 5426, 4500, 5427], 4037)
-    femmesh.addVolume([428, 466, 429, 948, 2184, 2185, 2067, 4357, 4216, 4217], 4038)
-    femmesh.addVolume([733, 333, 831, 798, 4362, 4363, 3422, 3316, 4923, 3423], 4039)
-    femmesh.addVolume([145, 35, 578, 146, 1191, 5793, 5552, 1194, 1192, 5783], 4040)
-    femmesh.addVolume([455, 898, 931, 897, 4945, 3747, 5245, 5794, 3643, 3746], 4041)
-    femmesh.addVolume([35, 62, 578, 146, 2351, 2613, 5793, 1192, 5782, 5783], 4042)
-    femmesh.addVolume([755, 813, 358, 294, 3361, 4134, 4235, 5784, 5402, 1841], 4043)
-    femmesh.addVolume([978, 969, 465, 464, 3904, 4490, 4317, 4553, 5297, 2183], 4044)
-    femmesh.addVolume([30, 187, 116, 31, 1293, 5647, 3958, 1012, 1292, 4781], 4045)
-    femmesh.addVolume([474, 914, 918, 877, 4289, 3703, 4256, 4258, 3691, 3702], 4046)
-    femmesh.addVolume([142, 596, 174, 514, 4720, 5795, 1261, 4721, 2698, 5685], 4047)
-    femmesh.addVolume([344, 788, 325, 284, 5056, 4807, 1890, 1802, 5055, 1856], 4048)
-    femmesh.addVolume([914, 474, 475, 877, 4289, 2281, 4685, 3691, 4258, 4949], 4049)
-    femmesh.addVolume([392, 870, 920, 437, 5044, 3712, 5046, 2090, 5707, 5706], 4050)
-    femmesh.addVolume([484, 965, 982, 476, 4975, 3928, 4977, 2258, 4455, 4457], 4051)
-    femmesh.addVolume([873, 496, 918, 448, 3977, 4276, 3701, 4277, 2288, 4257], 4052)
-    femmesh.addVolume([917, 499, 950, 492, 5127, 4499, 3809, 5426, 2325, 4500], 4053)
-    femmesh.addVolume([500, 187, 31, 116, 5452, 1292, 5225, 2579, 5647, 4781], 4054)
-    femmesh.addVolume([263, 246, 588, 663, 1558, 5212, 5544, 5094, 5095, 2907], 4055)
-    femmesh.addVolume([364, 312, 676, 288, 1866, 5759, 4823, 1864, 1700, 5377], 4056)
-    femmesh.addVolume([241, 687, 726, 647, 4633, 3197, 4053, 4054, 3083, 3101], 4057)
-    femmesh.addVolume([825, 419, 420, 840, 5252, 2167, 5184, 3458, 5253, 4002], 4058)
-    femmesh.addVolume([532, 612, 622, 218, 2733, 2758, 2756, 5532, 5533, 4299], 4059)
-    femmesh.addVolume([260, 665, 300, 589, 4935, 4670, 1659, 5320, 2912, 5013], 4060)
-    femmesh.addVolume([541, 8, 176, 9, 5438, 1270, 5489, 4858, 990, 1269], 4061)
-    femmesh.addVolume([741, 398, 324, 739, 4765, 1971, 5109, 3140, 4475, 5389], 4062)
-    femmesh.addVolume([8, 541, 94, 9, 5438, 2513, 5166, 990, 4858, 4467], 4063)
-    femmesh.addVolume([247, 260, 300, 589, 1555, 1659, 1660, 4620, 5320, 5013], 4064)
-    femmesh.addVolume([714, 761, 778, 267, 3199, 3250, 3247, 4970, 5602, 5766], 4065)
-    femmesh.addVolume([420, 483, 451, 888, 2236, 2237, 2136, 4004, 4461, 4005], 4066)
-    femmesh.addVolume([483, 924, 460, 498, 4468, 4469, 2238, 2323, 4209, 2327], 4067)
-    femmesh.addVolume([827, 412, 418, 421, 5393, 2106, 5395, 4464, 2124, 2147], 4068)
-    femmesh.addVolume([805, 747, 746, 316, 3337, 3158, 3336, 4658, 4774, 4659], 4069)
-    femmesh.addVolume([848, 373, 803, 802, 4311, 4313, 3489, 3483, 5680, 3332], 4070)
-    femmesh.addVolume([692, 254, 317, 693, 5303, 1713, 5105, 2987, 5304, 5796], 4071)
-    femmesh.addVolume([486, 459, 446, 922, 2245, 2168, 2244, 5368, 5369, 5739], 4072)
-    femmesh.addVolume([920, 912, 391, 437, 3714, 5608, 4879, 5706, 5022, 2089], 4073)
-    femmesh.addVolume([404, 906, 864, 919, 3991, 3665, 4931, 4933, 3710, 3707], 4074)
-    femmesh.addVolume([637, 551, 181, 552, 2803, 4396, 4782, 2804, 2547, 4395], 4075)
-    femmesh.addVolume([18, 551, 181, 161, 4568, 4396, 1280, 1231, 5036, 1311], 4076)
-    femmesh.addVolume([254, 323, 317, 693, 1738, 1739, 1713, 5304, 4105, 5796], 4077)
-    femmesh.addVolume([553, 106, 105, 20, 2549, 1092, 2548, 5081, 4245, 5154], 4078)
-    femmesh.addVolume([18, 522, 17, 129, 4127, 4690, 999, 1142, 4128, 1141], 4079)
-    femmesh.addVolume([857, 809, 856, 372, 3510, 3508, 3512, 5797, 5086, 5169], 4080)
-    femmesh.addVolume([180, 232, 635, 251, 1447, 4514, 4516, 1493, 1522, 5146], 4081)
-    femmesh.addVolume([912, 914, 437, 869, 3690, 4683, 5022, 3683, 3689, 4684], 4082)
-    femmesh.addVolume([708, 258, 292, 239, 4733, 1639, 4261, 4519, 1552, 1638], 4083)
-    femmesh.addVolume([2, 984, 31, 515, 4382, 5714, 1013, 5511, 5718, 4247], 4084)
-    femmesh.addVolume([111, 558, 25, 110, 2564, 4001, 4899, 1097, 2563, 4777], 4085)
-    femmesh.addVolume([661, 662, 286, 735, 3062, 4723, 4431, 3123, 3124, 4385], 4086)
-    femmesh.addVolume([683, 213, 214, 283, 5484, 1399, 4601, 5639, 1614, 1615], 4087)
-    femmesh.addVolume([342, 282, 835, 343, 1796, 4888, 5650, 1800, 1798, 4890], 4088)
-    femmesh.addVolume([232, 634, 244, 160, 4515, 4925, 1478, 1448, 4926, 1475], 4089)
-    femmesh.addVolume([609, 574, 658, 138, 2726, 2877, 2895, 5798, 4831, 5567], 4090)
-    femmesh.addVolume([741, 742, 317, 366, 3143, 5106, 5108, 4767, 5440, 1869], 4091)
-    femmesh.addVolume([104, 19, 105, 523, 4528, 4529, 1091, 2471, 5155, 2470], 4092)
-    femmesh.addVolume([260, 590, 665, 589, 4936, 2913, 4935, 5320, 2681, 2912], 4093)
-    femmesh.addVolume([386, 337, 841, 833, 1934, 3967, 5258, 4710, 4572, 3572], 4094)
-    femmesh.addVolume([434, 953, 945, 913, 5574, 3820, 4913, 4914, 3821, 3792], 4095)
-    femmesh.addVolume([862, 356, 399, 376, 5506, 1975, 4916, 4915, 1907, 2003], 4096)
-    femmesh.addVolume([235, 639, 182, 163, 5497, 4204, 1454, 1453, 5641, 1323], 4097)
-    femmesh.addVolume([741, 692, 317, 742, 3139, 5105, 5108, 3143, 3141, 5106], 4098)
-    femmesh.addVolume([635, 700, 251, 699, 3006, 5490, 5146, 3004, 3008, 5578], 4099)
-    femmesh.addVolume([568, 99, 14, 520, 2590, 4399, 4760, 2631, 2464, 4400], 4100)
-    femmesh.addVolume([602, 601, 201, 685, 2858, 5326, 5047, 2965, 2966, 5049], 4101)
-    femmesh.addVolume([260, 507, 590, 589, 5319, 2679, 4936, 5320, 2677, 2681], 4102)
-    femmesh.addVolume([975, 973, 487, 957, 3895, 5458, 4035, 3896, 3891, 4036], 4103)
-    femmesh.addVolume([530, 577, 600, 143, 2610, 2707, 2708, 4195, 4197, 5799], 4104)
-    femmesh.addVolume([692, 742, 693, 317, 3141, 3142, 2987, 5105, 5106, 5796], 4105)
-    femmesh.addVolume([978, 958, 977, 489, 3905, 3901, 3925, 4554, 4920, 4556], 4106)
-    femmesh.addVolume([180, 634, 160, 549, 4517, 4926, 1310, 5391, 2795, 4886], 4107)
-    femmesh.addVolume([577, 219, 600, 143, 5370, 5372, 2707, 4197, 1412, 5799], 4108)
-    femmesh.addVolume([898, 455, 413, 897, 4945, 2149, 4626, 3643, 5794, 5758], 4109)
-    femmesh.addVolume([161, 180, 17, 550, 1322, 1277, 1232, 4625, 5750, 5299], 4110)
-    femmesh.addVolume([458, 928, 449, 487, 5230, 4591, 2225, 2250, 5694, 2249], 4111)
-    femmesh.addVolume([175, 600, 625, 219, 5386, 3076, 4731, 1517, 5372, 5432], 4112)
-    femmesh.addVolume([200, 769, 269, 270, 5329, 5144, 1573, 1575, 3944, 1577], 4113)
-    femmesh.addVolume([464, 921, 427, 426, 5637, 5236, 2179, 2178, 4039, 2061], 4114)
-    femmesh.addVolume([957, 928, 973, 487, 3833, 3883, 3891, 4036, 5694, 5458], 4115)
-    femmesh.addVolume([381, 892, 427, 382, 4443, 4445, 2059, 1924, 5334, 2060], 4116)
-    femmesh.addVolume([609, 574, 138, 137, 2726, 4831, 5798, 4795, 3988, 1170], 4117)
-    femmesh.addVolume([960, 959, 974, 490, 3843, 3930, 3931, 4366, 5189, 4320], 4118)
-    femmesh.addVolume([593, 261, 668, 295, 4069, 4642, 2919, 4070, 1645, 4870], 4119)
-    femmesh.addVolume([799, 771, 283, 821, 3385, 4580, 5237, 3387, 3388, 5238], 4120)
-    femmesh.addVolume([213, 609, 138, 137, 5587, 5798, 1395, 1394, 4795, 1170], 4121)
-    femmesh.addVolume([475, 439, 437, 869, 2214, 2098, 2259, 4557, 5340, 4684], 4122)
-    femmesh.addVolume([446, 910, 886, 922, 4962, 3676, 4428, 5739, 3800, 3717], 4123)
-    femmesh.addVolume([843, 414, 789, 824, 4152, 5248, 3465, 3546, 5470, 3469], 4124)
-    femmesh.addVolume([414, 400, 789, 354, 2107, 5483, 5248, 2019, 1979, 5582], 4125)
-    femmesh.addVolume([560, 112, 559, 185, 2569, 2567, 2571, 4301, 4844, 4302], 4126)
-    femmesh.addVolume([84, 510, 53, 509, 2436, 4333, 2392, 2434, 2438, 5773], 4127)
-    femmesh.addVolume([271, 786, 201, 270, 5141, 5143, 1578, 1580, 3945, 1576], 4128)
-    femmesh.addVolume([480, 455, 442, 932, 2229, 2155, 2228, 5717, 5733, 5681], 4129)
-    femmesh.addVolume([155, 219, 143, 600, 1510, 1412, 1414, 5387, 5372, 5799], 4130)
-    femmesh.addVolume([854, 367, 853, 409, 4778, 4779, 3503, 5293, 2004, 5676], 4131)
-    femmesh.addVolume([155, 530, 652, 600, 5082, 2852, 5075, 5387, 2708, 2855], 4132)
-    femmesh.addVolume([530, 155, 143, 600, 5082, 1414, 4195, 2708, 5387, 5799], 4133)
-    femmesh.addVolume([290, 807, 357, 369, 4537, 5235, 1839, 1878, 4331, 1881], 4134)
-    femmesh.addVolume([426, 892, 380, 911, 4444, 4596, 2056, 4581, 3685, 4067], 4135)
-    femmesh.addVolume([150, 255, 534, 149, 1507, 4525, 4527, 1205, 1506, 5765], 4136)
-    femmesh.addVolume([364, 676, 768, 737, 4823, 3221, 4824, 5597, 3129, 3220], 4137)
-    femmesh.addVolume([436, 390, 894, 391, 2086, 4664, 4672, 2087, 1951, 5607], 4138)
-    femmesh.addVolume([940, 470, 433, 953, 4393, 2197, 5313, 3862, 4264, 4263], 4139)
-    femmesh.addVolume([847, 920, 894, 391, 3728, 3729, 3630, 4881, 4879, 5607], 4140)
-    femmesh.addVolume([282, 775, 212, 281, 4909, 5742, 1611, 1613, 5317, 1609], 4141)
-    femmesh.addVolume([579, 66, 534, 149, 2616, 2497, 2618, 4488, 4489, 5765], 4142)
-    femmesh.addVolume([892, 426, 921, 911, 4444, 4039, 3715, 3685, 4581, 3716], 4143)
-    femmesh.addVolume([39, 66, 149, 534, 2358, 4489, 1202, 5748, 2497, 5765], 4144)
-    femmesh.addVolume([617, 579, 534, 149, 2747, 2618, 2746, 5774, 4488, 5765], 4145)
-    femmesh.addVolume([445, 936, 965, 476, 4241, 3856, 5356, 2217, 5769, 4455], 4146)
-    femmesh.addVolume([730, 826, 438, 361, 3408, 4029, 5646, 4542, 4121, 2093], 4147)
-    femmesh.addVolume([644, 645, 559, 185, 2829, 2827, 2825, 5054, 4300, 4302], 4148)
-    femmesh.addVolume([813, 860, 861, 358, 3520, 3524, 3522, 4134, 4132, 4337], 4149)
-    femmesh.addVolume([376, 862, 905, 904, 4915, 3662, 4802, 4917, 3660, 3699], 4150)
-    femmesh.addVolume([165, 239, 644, 185, 1463, 4941, 4714, 1315, 1462, 5054], 4151)
-    femmesh.addVolume([239, 645, 185, 240, 4940, 4300, 1462, 1532, 5050, 1465], 4152)
-    femmesh.addVolume([709, 296, 240, 239, 4325, 1646, 4606, 4520, 1647, 1532], 4153)
-    femmesh.addVolume([531, 145, 578, 611, 4402, 5552, 2639, 2731, 5553, 2730], 4154)
-    femmesh.addVolume([360, 313, 721, 723, 1846, 4863, 5780, 5735, 5800, 3095], 4155)
-    femmesh.addVolume([485, 966, 493, 975, 4480, 4181, 2317, 4661, 3894, 5600], 4156)
-    femmesh.addVolume([489, 929, 957, 449, 4865, 3834, 4569, 2254, 4590, 4592], 4157)
-    femmesh.addVolume([543, 544, 96, 11, 2523, 2521, 2519, 5801, 4163, 4164], 4158)
-    femmesh.addVolume([245, 145, 531, 611, 1480, 4402, 4404, 4125, 5553, 2731], 4159)
-    femmesh.addVolume([463, 464, 977, 489, 2180, 4555, 5754, 2287, 2319, 4556], 4160)
-    femmesh.addVolume([177, 543, 10, 11, 4187, 4286, 1272, 1271, 5801, 992], 4161)
-    femmesh.addVolume([964, 936, 443, 476, 3854, 5768, 4255, 4254, 5769, 2218], 4162)
-    femmesh.addVolume([855, 357, 402, 856, 4994, 1985, 4629, 3509, 5068, 5159], 4163)
-    femmesh.addVolume([463, 489, 977, 487, 2287, 4556, 5754, 2286, 2255, 4037], 4164)
-    femmesh.addVolume([146, 532, 578, 218, 4271, 2658, 5783, 1411, 5532, 4298], 4165)
-    femmesh.addVolume([552, 637, 162, 181, 2804, 5730, 4184, 4395, 4782, 1304], 4166)
-    femmesh.addVolume([785, 450, 456, 394, 5006, 2215, 5752, 5598, 2131, 2156], 4167)
-    femmesh.addVolume([809, 808, 856, 372, 3350, 3507, 3508, 5086, 5168, 5169], 4168)
-    femmesh.addVolume([887, 939, 384, 883, 3774, 5568, 5213, 3680, 3773, 5214], 4169)
-    femmesh.addVolume([507, 260, 171, 190, 5319, 1538, 4339, 4957, 1539, 1330], 4170)
-    femmesh.addVolume([826, 730, 765, 361, 3408, 3211, 3407, 4121, 4542, 4122], 4171)
-    femmesh.addVolume([683, 213, 609, 658, 5484, 5587, 2959, 2958, 5485, 2895], 4172)
-    femmesh.addVolume([957, 928, 487, 449, 3833, 5694, 4036, 4592, 4591, 2249], 4173)
-    femmesh.addVolume([445, 965, 484, 476, 5356, 4975, 2240, 2217, 4455, 2258], 4174)
-    femmesh.addVolume([285, 302, 762, 325, 1804, 4630, 4973, 1850, 1747, 4631], 4175)
-    femmesh.addVolume([118, 648, 119, 517, 4609, 5162, 1113, 4646, 2837, 4867], 4176)
-    femmesh.addVolume([967, 956, 484, 982, 3887, 5381, 4976, 3929, 3832, 4977], 4177)
-    femmesh.addVolume([972, 983, 470, 981, 2331, 4081, 4394, 2332, 2330, 4083], 4178)
-    femmesh.addVolume([32, 59, 530, 143, 2345, 2488, 5757, 1185, 4196, 4195], 4179)
-    femmesh.addVolume([582, 621, 256, 597, 2754, 5770, 5003, 2702, 2892, 4741], 4180)
-    femmesh.addVolume([824, 414, 789, 354, 5470, 5248, 3469, 5529, 2019, 5582], 4181)
-    femmesh.addVolume([983, 972, 470, 469, 2331, 4394, 4081, 5549, 4375, 2198], 4182)
-    femmesh.addVolume([838, 729, 347, 765, 3450, 5272, 4905, 3451, 3212, 4391], 4183)
-    femmesh.addVolume([242, 584, 649, 501, 5516, 2842, 5472, 3935, 2662, 2841], 4184)
-    femmesh.addVolume([264, 296, 240, 710, 1649, 1646, 1560, 5160, 4605, 4607], 4185)
-    femmesh.addVolume([230, 697, 633, 244, 5179, 2998, 5289, 1477, 4696, 4927], 4186)
-    femmesh.addVolume([937, 936, 965, 445, 3766, 3856, 3857, 4243, 4241, 5356], 4187)
-    femmesh.addVolume([555, 183, 556, 108, 5152, 5422, 2559, 2555, 5423, 2557], 4188)
-    femmesh.addVolume([945, 953, 471, 982, 3820, 4265, 5575, 3831, 3921, 5421], 4189)
-    femmesh.addVolume([139, 214, 658, 138, 1398, 5486, 5554, 1173, 1397, 5567], 4190)
-    femmesh.addVolume([697, 244, 698, 633, 4696, 4697, 3002, 2998, 4927, 3000], 4191)
-    femmesh.addVolume([227, 626, 156, 231, 5802, 4283, 1435, 1445, 5324, 1444], 4192)
-    femmesh.addVolume([527, 139, 658, 138, 5466, 5554, 2876, 4829, 1173, 5567], 4193)
-    femmesh.addVolume([32, 530, 58, 563, 5757, 2489, 2344, 5024, 2767, 2487], 4194)
-    femmesh.addVolume([469, 983, 494, 481, 5549, 4185, 2297, 2298, 4080, 2277], 4195)
-    femmesh.addVolume([626, 540, 625, 156, 2770, 2769, 2772, 4283, 4280, 5763], 4196)
-    femmesh.addVolume([117, 118, 6, 564, 1110, 1108, 1107, 4740, 4611, 5134], 4197)
-    femmesh.addVolume([387, 433, 940, 432, 2077, 5313, 5657, 2075, 2079, 4405], 4198)
-    femmesh.addVolume([386, 387, 940, 432, 1939, 5657, 4813, 2074, 2075, 4405], 4199)
-    femmesh.addVolume([161, 551, 636, 550, 5036, 2801, 4624, 4625, 2544, 2800], 4200)
-    femmesh.addVolume([315, 375, 372, 809, 1903, 1904, 1902, 5085, 4878, 5086], 4201)
-    femmesh.addVolume([409, 397, 853, 896, 2005, 5208, 5676, 5677, 5302, 3635], 4202)
-    femmesh.addVolume([626, 227, 625, 690, 5802, 5664, 2772, 2978, 5747, 2977], 4203)
-    femmesh.addVolume([213, 214, 138, 658, 1399, 1397, 1395, 5485, 5486, 5567], 4204)
-    femmesh.addVolume([452, 494, 963, 481, 2278, 4169, 5514, 2231, 2277, 5701], 4205)
-    femmesh.addVolume([136, 137, 526, 657, 1167, 3940, 4177, 4458, 4459, 2873], 4206)
-    femmesh.addVolume([642, 238, 707, 643, 4799, 5215, 3027, 2823, 5216, 3028], 4207)
-    femmesh.addVolume([661, 233, 286, 586, 3968, 1624, 4431, 2903, 3969, 4725], 4208)
-    femmesh.addVolume([396, 797, 880, 820, 5604, 3586, 5580, 5648, 3383, 3585], 4209)
-    femmesh.addVolume([355, 820, 797, 396, 4378, 3383, 5537, 1967, 5648, 5604], 4210)
-    femmesh.addVolume([62, 35, 578, 61, 2351, 5793, 2613, 1046, 2350, 2614], 4211)
-    femmesh.addVolume([452, 901, 935, 934, 5732, 3758, 5515, 5513, 3756, 3760], 4212)
-    femmesh.addVolume([639, 554, 182, 163, 2810, 5722, 4204, 5641, 5462, 1323], 4213)
-    femmesh.addVolume([483, 888, 924, 916, 4461, 3722, 4468, 5686, 3695, 3721], 4214)
-    femmesh.addVolume([645, 166, 560, 185, 5380, 3995, 2828, 4300, 1326, 4301], 4215)
-    femmesh.addVolume([609, 657, 212, 677, 2872, 4460, 4796, 2942, 2943, 5803], 4216)
-    femmesh.addVolume([180, 549, 550, 635, 5391, 2541, 5750, 4516, 2797, 2798], 4217)
-    femmesh.addVolume([327, 829, 267, 778, 5275, 5603, 1752, 5674, 3417, 5766], 4218)
-    femmesh.addVolume([840, 403, 871, 451, 4598, 4599, 3559, 4003, 2134, 4123], 4219)
-    femmesh.addVolume([266, 327, 267, 778, 1751, 1752, 1568, 5137, 5674, 5766], 4220)
-    femmesh.addVolume([110, 111, 526, 25, 1097, 2476, 2477, 4777, 4899, 3938], 4221)
-    femmesh.addVolume([144, 219, 577, 143, 1413, 5370, 4411, 1189, 1412, 4197], 4222)
-    femmesh.addVolume([682, 775, 212, 677, 3241, 5742, 5176, 2957, 3240, 5803], 4223)
-    femmesh.addVolume([657, 682, 212, 677, 2954, 5176, 4460, 2943, 2957, 5803], 4224)
-    femmesh.addVolume([609, 213, 138, 658, 5587, 1395, 5798, 2895, 5485, 5567], 4225)
-    femmesh.addVolume([646, 259, 240, 710, 4420, 1548, 5116, 3037, 5633, 4607], 4226)
-    femmesh.addVolume([309, 670, 302, 250, 5014, 5559, 1746, 1731, 4751, 1665], 4227)
-    femmesh.addVolume([169, 48, 189, 503, 1248, 1297, 1318, 4679, 4838, 4947], 4228)
-    femmesh.addVolume([260, 301, 590, 248, 1662, 4937, 4936, 1554, 1661, 5000], 4229)
-    femmesh.addVolume([48, 78, 189, 503, 2381, 4453, 1297, 4838, 2416, 4947], 4230)
-    femmesh.addVolume([312, 615, 223, 651, 5526, 4512, 1699, 5250, 2851, 5755], 4231)
-    femmesh.addVolume([975, 463, 977, 487, 4071, 5754, 3920, 4035, 2286, 4037], 4232)
-    femmesh.addVolume([384, 868, 336, 335, 3992, 5723, 1929, 1928, 3994, 1779], 4233)
-    femmesh.addVolume([921, 969, 427, 941, 3868, 4491, 5236, 3782, 3867, 4493], 4234)
-    femmesh.addVolume([560, 166, 27, 185, 3995, 1242, 4446, 4301, 1326, 1287], 4235)
-    femmesh.addVolume([312, 615, 676, 288, 5526, 2941, 5759, 1700, 4510, 5377], 4236)
-    femmesh.addVolume([596, 217, 174, 262, 5204, 1408, 5795, 5461, 1546, 1543], 4237)
-    femmesh.addVolume([312, 615, 724, 676, 5526, 3090, 5256, 5759, 2941, 3093], 4238)
-    femmesh.addVolume([684, 717, 314, 195, 3069, 4692, 4693, 5064, 5563, 1706], 4239)
-    femmesh.addVolume([453, 491, 933, 962, 2262, 4345, 5710, 5764, 4341, 3847], 4240)
-    femmesh.addVolume([147, 221, 576, 146, 1418, 5478, 4885, 1197, 1417, 4272], 4241)
-    femmesh.addVolume([179, 547, 548, 633, 5359, 2535, 5205, 5206, 2791, 2792], 4242)
-    femmesh.addVolume([851, 804, 803, 371, 3494, 3335, 3493, 4998, 5170, 5290], 4243)
-    femmesh.addVolume([44, 154, 193, 537, 1216, 1423, 1105, 5456, 5004, 4086], 4244)
-    femmesh.addVolume([219, 144, 577, 614, 1413, 4411, 5370, 5371, 5534, 2737], 4245)
-    femmesh.addVolume([57, 89, 514, 88, 2397, 2449, 5684, 2398, 1074, 2448], 4246)
-    femmesh.addVolume([206, 276, 207, 712, 1593, 1594, 1378, 4989, 4771, 4772], 4247)
-    femmesh.addVolume([181, 552, 19, 162, 4395, 4182, 1279, 1304, 4184, 1234], 4248)
-    femmesh.addVolume([577, 144, 531, 614, 4411, 4403, 2612, 2737, 5534, 2736], 4249)
-    femmesh.addVolume([810, 375, 363, 311, 4877, 2024, 4213, 5474, 1905, 1861], 4250)
-    femmesh.addVolume([227, 626, 231, 690, 5802, 5324, 1445, 5747, 2978, 5776], 4251)
-    femmesh.addVolume([760, 325, 669, 295, 4315, 4632, 3196, 4316, 1748, 5436], 4252)
-    femmesh.addVolume([606, 571, 132, 655, 2721, 5284, 5571, 2898, 2867, 5572], 4253)
-    femmesh.addVolume([318, 739, 690, 691, 4474, 3134, 5519, 5390, 3135, 2981], 4254)
-    femmesh.addVolume([604, 129, 570, 130, 4100, 4130, 2716, 4099, 1146, 5338], 4255)
-    femmesh.addVolume([827, 403, 412, 440, 4868, 2013, 5393, 5388, 2099, 2100], 4256)
-    femmesh.addVolume([29, 114, 528, 115, 3947, 2481, 4816, 3949, 1101, 2480], 4257)
-    femmesh.addVolume([670, 285, 783, 671, 5601, 5020, 3268, 2928, 5557, 3269], 4258)
-    femmesh.addVolume([519, 123, 567, 599, 4837, 4836, 2630, 2706, 4622, 2705], 4259)
-    femmesh.addVolume([19, 18, 130, 570, 1000, 1144, 1145, 5347, 4129, 5338], 4260)
-    femmesh.addVolume([571, 131, 132, 655, 5219, 1152, 5284, 2867, 5051, 5572], 4261)
-    femmesh.addVolume([125, 568, 14, 520, 4814, 4760, 1130, 4401, 2631, 4400], 4262)
-    femmesh.addVolume([131, 605, 655, 523, 5469, 2887, 5051, 5220, 2718, 2868], 4263)
-    femmesh.addVolume([325, 302, 669, 295, 1747, 4328, 4632, 1748, 1691, 5436], 4264)
-    femmesh.addVolume([402, 410, 856, 372, 2026, 5642, 5159, 1984, 2009, 5169], 4265)
-    femmesh.addVolume([191, 510, 172, 261, 5669, 5263, 1331, 1541, 4291, 1540], 4266)
-    femmesh.addVolume([4, 116, 984, 515, 1103, 5226, 5019, 2452, 2453, 5718], 4267)
-    femmesh.addVolume([104, 19, 523, 570, 4528, 5155, 2471, 2593, 5347, 2648], 4268)
-    femmesh.addVolume([139, 610, 215, 140, 4811, 4680, 1400, 1176, 4694, 1401], 4269)
-    femmesh.addVolume([211, 280, 281, 682, 1606, 1610, 1608, 4810, 4567, 5581], 4270)
-    femmesh.addVolume([661, 711, 780, 306, 3041, 3266, 3258, 4430, 4324, 4950], 4271)
-    femmesh.addVolume([591, 299, 248, 666, 5218, 1656, 4999, 2915, 5120, 5001], 4272)
-    femmesh.addVolume([299, 301, 248, 666, 1664, 1661, 1656, 5120, 5500, 5001], 4273)
-    femmesh.addVolume([450, 400, 768, 823, 2150, 5595, 5007, 5008, 5804, 3391], 4274)
-    femmesh.addVolume([164, 642, 641, 556, 4801, 2820, 4842, 5267, 2818, 2816], 4275)
-    femmesh.addVolume([299, 667, 666, 591, 5255, 3065, 5120, 5218, 2916, 2915], 4276)
-    femmesh.addVolume([667, 763, 299, 666, 3204, 5118, 5255, 3065, 3203, 5120], 4277)
-    femmesh.addVolume([161, 180, 550, 635, 1322, 5750, 4625, 4623, 4516, 2798], 4278)
-    femmesh.addVolume([393, 742, 801, 366, 5107, 3326, 5360, 1956, 5440, 5441], 4279)
-    femmesh.addVolume([736, 398, 792, 739, 4702, 4766, 3300, 3228, 4475, 3298], 4280)
-    femmesh.addVolume([230, 697, 746, 696, 5179, 3154, 5594, 5173, 2999, 3153], 4281)
-    femmesh.addVolume([742, 323, 693, 317, 5030, 4105, 3142, 5106, 1739, 5796], 4282)
-    femmesh.addVolume([359, 727, 739, 660, 5550, 3303, 4473, 5540, 3105, 3229], 4283)
-    femmesh.addVolume([518, 650, 120, 121, 2844, 5425, 5307, 5308, 5481, 1119], 4284)
-    femmesh.addVolume([161, 180, 635, 251, 1322, 4516, 4623, 1492, 1493, 5146], 4285)
-    femmesh.addVolume([551, 103, 550, 18, 2542, 2540, 2544, 4568, 4845, 5037], 4286)
-    femmesh.addVolume([672, 203, 654, 204, 3961, 5504, 2929, 5033, 1369, 5034], 4287)
-    femmesh.addVolume([282, 775, 677, 212, 4909, 3240, 5805, 1611, 5742, 5803], 4288)
-    femmesh.addVolume([637, 552, 162, 638, 2804, 4184, 5730, 2808, 2806, 5643], 4289)
-    femmesh.addVolume([769, 269, 830, 740, 5144, 5145, 3421, 3224, 5279, 3419], 4290)
-    femmesh.addVolume([269, 329, 830, 740, 1757, 5309, 5145, 5279, 5278, 3419], 4291)
-    femmesh.addVolume([282, 771, 677, 775, 4579, 3231, 5805, 4909, 3283, 3240], 4292)
-    femmesh.addVolume([213, 282, 677, 212, 1612, 5805, 5588, 1396, 1611, 5803], 4293)
-    femmesh.addVolume([38, 579, 148, 149, 4487, 4439, 1199, 1201, 4488, 1264], 4294)
-    femmesh.addVolume([318, 324, 691, 231, 1743, 4051, 5390, 1720, 1742, 4050], 4295)
-    femmesh.addVolume([148, 579, 220, 149, 4439, 5593, 1415, 1264, 4488, 1416], 4296)
-    femmesh.addVolume([43, 582, 72, 71, 5493, 2623, 2365, 2364, 2624, 1056], 4297)
-    femmesh.addVolume([370, 301, 299, 666, 1883, 1664, 1882, 5119, 5500, 5120], 4298)
-    femmesh.addVolume([689, 623, 198, 714, 2975, 4268, 5693, 3054, 3052, 5148], 4299)
-    femmesh.addVolume([62, 35, 63, 146, 2351, 2371, 1047, 5782, 1192, 4207], 4300)
-    femmesh.addVolume([612, 221, 313, 218, 4020, 1704, 4022, 5533, 1419, 1703], 4301)
-    femmesh.addVolume([128, 654, 569, 603, 5492, 2865, 5491, 5503, 2884, 2714], 4302)
-    femmesh.addVolume([324, 741, 317, 366, 5109, 5108, 1744, 1870, 4767, 1869], 4303)
-    femmesh.addVolume([35, 145, 578, 61, 1191, 5552, 5793, 2350, 5634, 2614], 4304)
-    femmesh.addVolume([672, 203, 603, 654, 3961, 5505, 2930, 2929, 5504, 2884], 4305)
-    femmesh.addVolume([213, 771, 677, 282, 4578, 3231, 5588, 1612, 4579, 5805], 4306)
-    femmesh.addVolume([672, 673, 603, 203, 2933, 2931, 2930, 3961, 3962, 5505], 4307)
-    femmesh.addVolume([722, 345, 291, 688, 4819, 1807, 4763, 3086, 4821, 4433], 4308)
-    femmesh.addVolume([252, 631, 159, 632, 5167, 4841, 1494, 5174, 2790, 5357], 4309)
-    femmesh.addVolume([244, 747, 319, 316, 4695, 5465, 1722, 1711, 4774, 1723], 4310)
-    femmesh.addVolume([731, 362, 688, 718, 5806, 5807, 3116, 3115, 5808, 3094], 4311)
-    femmesh.addVolume([777, 362, 688, 731, 5688, 5807, 3244, 3246, 5806, 3116], 4312)
-    femmesh.addVolume([546, 159, 632, 547, 4755, 5357, 2788, 2532, 4757, 2789], 4313)
-    femmesh.addVolume([230, 252, 159, 632, 1497, 1494, 1442, 5172, 5174, 5357], 4314)
-    femmesh.addVolume([356, 814, 861, 358, 5242, 3523, 4361, 1877, 4236, 4337], 4315)
-    femmesh.addVolume([642, 238, 164, 237, 4799, 1461, 4801, 4442, 1526, 1458], 4316)
-    femmesh.addVolume([709, 708, 239, 644, 3035, 4519, 4520, 3033, 3031, 4941], 4317)
-    femmesh.addVolume([628, 627, 229, 157, 2778, 5673, 5809, 4188, 5810, 1439], 4318)
-    femmesh.addVolume([815, 298, 756, 356, 4929, 4930, 3366, 5240, 1835, 5241], 4319)
-    femmesh.addVolume([90, 563, 5, 985, 2580, 4386, 4584, 4585, 4389, 4387], 4320)
-    femmesh.addVolume([646, 166, 240, 259, 4583, 1464, 5116, 4420, 1535, 1548], 4321)
-    femmesh.addVolume([465, 428, 427, 941, 2182, 2064, 2181, 4492, 4356, 4493], 4322)
-    femmesh.addVolume([40, 41, 69, 151, 1023, 2373, 2361, 1206, 1207, 5729], 4323)
-    femmesh.addVolume([849, 331, 270, 786, 4530, 1762, 5487, 3485, 5539, 3945], 4324)
-    femmesh.addVolume([624, 719, 619, 289, 3072, 3073, 2764, 5586, 5193, 5298], 4325)
-    femmesh.addVolume([426, 947, 921, 911, 4038, 3813, 4039, 4581, 3798, 3716], 4326)
-    femmesh.addVolume([345, 362, 291, 688, 1859, 1857, 1807, 4821, 5807, 4433], 4327)
-    femmesh.addVolume([351, 763, 784, 791, 4150, 3282, 4151, 5373, 3295, 3296], 4328)
-    femmesh.addVolume([345, 777, 362, 688, 4820, 5688, 1859, 4821, 3244, 5807], 4329)
-    femmesh.addVolume([310, 291, 688, 220, 1694, 4433, 5811, 1692, 1636, 4435], 4330)
-    femmesh.addVolume([617, 310, 688, 220, 5792, 5811, 2972, 4440, 1692, 4435], 4331)
-    femmesh.addVolume([256, 154, 537, 193, 1516, 5004, 5005, 1512, 1423, 4086], 4332)
-    femmesh.addVolume([903, 936, 445, 443, 3762, 4241, 4242, 5719, 5768, 2151], 4333)
-    femmesh.addVolume([621, 225, 624, 536, 4238, 4523, 2765, 2755, 4521, 2762], 4334)
-    femmesh.addVolume([403, 840, 420, 451, 4598, 4002, 2041, 2134, 4003, 2136], 4335)
-    femmesh.addVolume([725, 225, 624, 621, 4240, 4523, 3097, 3096, 4238, 2765], 4336)
-    femmesh.addVolume([293, 744, 373, 802, 3951, 5679, 1897, 5788, 3329, 5680], 4337)
-    femmesh.addVolume([245, 145, 611, 218, 1480, 5553, 4125, 1524, 1410, 4297], 4338)
-    femmesh.addVolume([315, 304, 701, 750, 1709, 5066, 4108, 5083, 5181, 3166], 4339)
-    femmesh.addVolume([232, 290, 748, 699, 1634, 4538, 5645, 5401, 5619, 3160], 4340)
-    femmesh.addVolume([310, 617, 688, 718, 5792, 2972, 5811, 5041, 3071, 3094], 4341)
-    femmesh.addVolume([235, 639, 640, 704, 5497, 2814, 5287, 5029, 3018, 3019], 4342)
-    femmesh.addVolume([166, 186, 259, 646, 1316, 1534, 1535, 4583, 4419, 4420], 4343)
-    femmesh.addVolume([114, 113, 28, 575, 1100, 4373, 4372, 2603, 2604, 5787], 4344)
-    femmesh.addVolume([362, 310, 688, 718, 1858, 5811, 5807, 5808, 5041, 3094], 4345)
-    femmesh.addVolume([874, 329, 377, 328, 4059, 1909, 5751, 4060, 1758, 1908], 4346)
-    femmesh.addVolume([210, 678, 211, 608, 3941, 4808, 1390, 4095, 2944, 4809], 4347)
-    femmesh.addVolume([326, 364, 676, 288, 1865, 4823, 5376, 1749, 1864, 5377], 4348)
-    femmesh.addVolume([719, 326, 737, 676, 5192, 5615, 3128, 3106, 5376, 3129], 4349)
-    femmesh.addVolume([799, 681, 284, 214, 3319, 4972, 5057, 4602, 4603, 1617], 4350)
-    femmesh.addVolume([573, 109, 110, 24, 2600, 1096, 2599, 4790, 4965, 4791], 4351)
-    femmesh.addVolume([876, 874, 910, 416, 3609, 3674, 3675, 4249, 4980, 4250], 4352)
-    femmesh.addVolume([835, 821, 866, 343, 3441, 3538, 3539, 4890, 5375, 5291], 4353)
-    femmesh.addVolume([269, 329, 330, 830, 1757, 1761, 1759, 5145, 5309, 5136], 4354)
-    femmesh.addVolume([786, 715, 201, 270, 3279, 5621, 5143, 3945, 3946, 1576], 4355)
-    femmesh.addVolume([377, 910, 416, 446, 5625, 4250, 2039, 2118, 4962, 2117], 4356)
-    femmesh.addVolume([472, 484, 982, 471, 2303, 4977, 5354, 2204, 2302, 5421], 4357)
-    femmesh.addVolume([310, 362, 688, 291, 1858, 5807, 5811, 1694, 1857, 4433], 4358)
-    femmesh.addVolume([346, 780, 297, 306, 4502, 5153, 1809, 1808, 4950, 1733], 4359)
-    femmesh.addVolume([670, 302, 669, 762, 5559, 4328, 3066, 3201, 4630, 3200], 4360)
-    femmesh.addVolume([788, 760, 800, 395, 3289, 3322, 3323, 5392, 5285, 5345], 4361)
-    femmesh.addVolume([334, 828, 831, 875, 5655, 3474, 5652, 5449, 3568, 3569], 4362)
-    femmesh.addVolume([637, 701, 253, 234, 3010, 4109, 5333, 4981, 4110, 1500], 4363)
-    femmesh.addVolume([315, 375, 751, 311, 1903, 5473, 5352, 1710, 1905, 5351], 4364)
-    femmesh.addVolume([395, 870, 392, 439, 5344, 5044, 1964, 2096, 5339, 2095], 4365)
-    femmesh.addVolume([277, 208, 720, 679, 1597, 4785, 4784, 5660, 5705, 3079], 4366)
-    femmesh.addVolume([357, 304, 372, 808, 1838, 1892, 1893, 5067, 5668, 5168], 4367)
-    femmesh.addVolume([441, 453, 410, 900, 2139, 2140, 2102, 4148, 5711, 5089], 4368)
-    femmesh.addVolume([832, 794, 850, 341, 3438, 3490, 3491, 5629, 4676, 4477], 4369)
-    femmesh.addVolume([499, 486, 479, 943, 2329, 2247, 2326, 5129, 5812, 5130], 4370)
-    femmesh.addVolume([386, 387, 338, 833, 1939, 1937, 1935, 4710, 5611, 4573], 4371)
-    femmesh.addVolume([422, 411, 908, 396, 2048, 5059, 4954, 2046, 2012, 5725], 4372)
-    femmesh.addVolume([832, 389, 850, 867, 4873, 5628, 3491, 3543, 4874, 3545], 4373)
-    femmesh.addVolume([279, 793, 680, 278, 5314, 3308, 4495, 1604, 5536, 5662], 4374)
-    femmesh.addVolume([885, 917, 479, 943, 3698, 5128, 5408, 3786, 3787, 5130], 4375)
-    femmesh.addVolume([208, 606, 679, 607, 5605, 2947, 5705, 5743, 2869, 2946], 4376)
-    femmesh.addVolume([797, 396, 880, 908, 5604, 5580, 3586, 3670, 5725, 3669], 4377)
-    femmesh.addVolume([511, 192, 512, 86, 4943, 5444, 2444, 2440, 4942, 2442], 4378)
-    femmesh.addVolume([279, 210, 209, 680, 1603, 1387, 1602, 4495, 4494, 4908], 4379)
-    femmesh.addVolume([410, 857, 856, 372, 4353, 3512, 5642, 2009, 5797, 5169], 4380)
-    femmesh.addVolume([486, 499, 478, 943, 2329, 2338, 2246, 5812, 5129, 5416], 4381)
-    femmesh.addVolume([536, 70, 152, 581, 2501, 4853, 4522, 2657, 2621, 4855], 4382)
-    femmesh.addVolume([123, 199, 599, 198, 1352, 4617, 4622, 1350, 1354, 5697], 4383)
-    femmesh.addVolume([95, 10, 9, 542, 4285, 991, 4968, 2516, 5675, 4859], 4384)
-    femmesh.addVolume([324, 692, 691, 229, 5103, 2984, 4051, 1741, 5104, 4052], 4385)
-    femmesh.addVolume([981, 964, 481, 476, 2339, 4253, 4082, 4456, 4254, 2268], 4386)
-    femmesh.addVolume([417, 851, 415, 890, 4997, 5479, 2114, 4157, 3617, 5311], 4387)
-    femmesh.addVolume([910, 874, 377, 416, 3674, 5751, 5625, 4250, 4980, 2039], 4388)
-    femmesh.addVolume([486, 885, 479, 943, 5775, 5408, 2247, 5812, 3786, 5130], 4389)
-    femmesh.addVolume([885, 486, 479, 446, 5775, 2247, 5408, 4427, 2244, 2227], 4390)
-    femmesh.addVolume([444, 885, 479, 446, 4425, 5408, 2226, 2119, 4427, 2227], 4391)
-    femmesh.addVolume([452, 441, 406, 901, 2138, 2128, 2137, 5732, 4963, 4884], 4392)
-    femmesh.addVolume([692, 628, 627, 229, 2983, 2778, 2982, 5104, 5809, 5673], 4393)
-    femmesh.addVolume([441, 452, 934, 901, 2138, 5513, 5546, 4963, 5732, 3756], 4394)
-    femmesh.addVolume([703, 236, 702, 311, 5499, 5502, 3017, 5332, 1695, 5318], 4395)
-    femmesh.addVolume([422, 396, 880, 405, 2046, 5580, 4955, 2047, 1993, 5286], 4396)
-    femmesh.addVolume([700, 234, 636, 251, 5281, 4982, 3007, 5490, 1525, 5147], 4397)
-    femmesh.addVolume([868, 384, 841, 883, 3992, 5696, 3553, 3596, 5214, 3595], 4398)
-    femmesh.addVolume([259, 264, 240, 710, 1559, 1560, 1548, 5633, 5160, 4607], 4399)
-    femmesh.addVolume([637, 181, 636, 234, 4782, 4783, 2805, 4981, 1451, 4982], 4400)
-    femmesh.addVolume([675, 205, 604, 674, 4564, 4098, 2936, 2939, 4960, 2935], 4401)
-    femmesh.addVolume([309, 285, 670, 671, 1690, 5601, 5014, 5555, 5557, 2928], 4402)
-    femmesh.addVolume([781, 334, 831, 273, 4540, 5652, 3424, 4541, 1771, 4365], 4403)
-    femmesh.addVolume([752, 307, 811, 753, 5076, 5091, 3354, 3176, 5077, 3355], 4404)
-    femmesh.addVolume([733, 781, 831, 273, 3261, 3424, 3422, 4364, 4541, 4365], 4405)
-    femmesh.addVolume([277, 679, 770, 278, 5660, 3226, 5659, 1601, 5703, 5767], 4406)
-    femmesh.addVolume([953, 972, 470, 981, 3902, 4394, 4264, 3927, 2332, 4083], 4407)
-    femmesh.addVolume([434, 953, 913, 433, 5574, 3821, 4914, 2082, 4263, 5363], 4408)
-    femmesh.addVolume([679, 793, 770, 278, 3301, 3302, 3226, 5703, 5536, 5767], 4409)
-    femmesh.addVolume([272, 672, 273, 203, 3959, 5468, 1586, 1582, 3961, 1584], 4410)
-    femmesh.addVolume([412, 827, 440, 421, 5393, 5388, 2100, 2124, 4464, 2123], 4411)
-    femmesh.addVolume([494, 934, 962, 453, 5573, 3848, 4170, 2279, 5547, 5764], 4412)
-    femmesh.addVolume([497, 978, 959, 490, 4570, 3906, 4103, 2310, 4319, 5189], 4413)
-    femmesh.addVolume([313, 287, 723, 360, 1717, 4211, 5800, 1846, 1847, 5735], 4414)
-    femmesh.addVolume([612, 287, 723, 313, 4021, 4211, 3088, 4022, 1717, 5800], 4415)
-    femmesh.addVolume([964, 981, 965, 476, 2339, 3913, 3858, 4254, 4456, 4455], 4416)
-    femmesh.addVolume([353, 360, 732, 418, 1849, 5779, 5781, 2033, 2034, 5638], 4417)
-    femmesh.addVolume([353, 313, 721, 360, 1826, 4863, 5777, 1849, 1846, 5780], 4418)
-    femmesh.addVolume([749, 304, 700, 251, 5475, 5180, 3163, 5577, 1672, 5490], 4419)
-    femmesh.addVolume([890, 458, 449, 415, 4155, 2225, 5813, 5311, 2159, 2130], 4420)
-    femmesh.addVolume([673, 733, 734, 272, 3120, 3217, 3121, 3960, 5061, 5744], 4421)
-    femmesh.addVolume([202, 673, 734, 272, 5227, 3121, 5617, 1581, 3960, 5744], 4422)
-    femmesh.addVolume([271, 202, 734, 272, 1579, 5617, 5149, 1583, 1581, 5744], 4423)
-    femmesh.addVolume([755, 705, 754, 294, 3180, 3178, 3182, 5784, 4717, 5097], 4424)
-    femmesh.addVolume([601, 125, 126, 201, 4534, 1134, 5749, 5326, 1358, 1359], 4425)
-    femmesh.addVolume([7, 92, 539, 6, 4651, 2507, 4722, 988, 5133, 5746], 4426)
-    femmesh.addVolume([356, 862, 861, 814, 5506, 3527, 4361, 5242, 3525, 3523], 4427)
-    femmesh.addVolume([755, 294, 303, 237, 5784, 1716, 4654, 5689, 1658, 1669], 4428)
-    femmesh.addVolume([376, 862, 350, 863, 4915, 5682, 1906, 5121, 3530, 5123], 4429)
-    femmesh.addVolume([379, 378, 424, 946, 1915, 2051, 2052, 5306, 4653, 4650], 4430)
-    femmesh.addVolume([321, 252, 745, 322, 1730, 4786, 3976, 1834, 1736, 4588], 4431)
-    femmesh.addVolume([706, 755, 756, 303, 3181, 3185, 3183, 5343, 4654, 4655], 4432)
-    femmesh.addVolume([958, 978, 497, 489, 3905, 4570, 4101, 4920, 4554, 2309], 4433)
-    femmesh.addVolume([755, 706, 237, 303, 3181, 4441, 5689, 4654, 5343, 1669], 4434)
-    femmesh.addVolume([320, 725, 767, 684, 4239, 3222, 5522, 5060, 3099, 3219], 4435)
-    femmesh.addVolume([313, 305, 721, 622, 1732, 5814, 4863, 4864, 4408, 3080], 4436)
-    femmesh.addVolume([428, 893, 427, 941, 4355, 5335, 2064, 4356, 3783, 4493], 4437)
-    femmesh.addVolume([175, 7, 539, 6, 1267, 4722, 4732, 1265, 988, 5746], 4438)
-    femmesh.addVolume([896, 461, 929, 930, 5691, 4866, 3741, 3743, 5760, 3745], 4439)
-    femmesh.addVolume([313, 353, 721, 305, 1826, 5777, 4863, 1732, 1825, 5814], 4440)
-    femmesh.addVolume([305, 660, 721, 622, 4657, 3081, 5814, 4408, 2900, 3080], 4441)
-    femmesh.addVolume([506, 507, 190, 589, 2429, 4957, 4861, 2676, 2677, 4862], 4442)
-    femmesh.addVolume([54, 172, 85, 511, 1254, 5264, 2404, 4944, 5265, 2439], 4443)
-    femmesh.addVolume([395, 870, 439, 791, 5344, 5339, 2096, 4078, 3554, 4077], 4444)
-    femmesh.addVolume([305, 353, 721, 660, 1825, 5777, 5814, 4657, 5541, 3081], 4445)
-    femmesh.addVolume([827, 418, 732, 421, 5395, 5638, 3409, 4464, 2147, 5815], 4446)
-    femmesh.addVolume([265, 717, 767, 773, 5562, 3218, 4686, 5404, 3237, 3284], 4447)
-    femmesh.addVolume([418, 360, 732, 421, 2034, 5779, 5638, 2147, 2045, 5815], 4448)
-    femmesh.addVolume([48, 169, 47, 77, 1248, 1249, 1031, 2382, 4839, 2379], 4449)
-    femmesh.addVolume([90, 563, 985, 3, 2580, 4389, 4585, 1076, 2486, 5738], 4450)
-    femmesh.addVolume([827, 421, 732, 779, 4464, 5815, 3409, 3440, 4451, 3255], 4451)
-    femmesh.addVolume([158, 12, 545, 544, 1225, 4550, 4551, 4117, 5790, 2526], 4452)
-    femmesh.addVolume([444, 885, 839, 479, 4425, 3601, 5027, 2226, 5408, 5012], 4453)
-    femmesh.addVolume([767, 352, 773, 787, 4687, 5482, 3284, 3286, 4847, 3285], 4454)
-    femmesh.addVolume([450, 818, 482, 823, 5616, 5262, 2248, 5008, 3402, 4903], 4455)
-    femmesh.addVolume([400, 789, 768, 823, 5483, 3292, 5595, 5804, 3398, 3391], 4456)
-    femmesh.addVolume([970, 430, 927, 468, 5699, 4026, 3873, 3986, 2190, 4028], 4457)
-    femmesh.addVolume([854, 409, 897, 413, 5293, 5712, 3638, 5294, 2133, 5758], 4458)
-    femmesh.addVolume([268, 329, 819, 328, 1756, 4057, 5200, 1754, 1758, 4058], 4459)
-    femmesh.addVolume([829, 761, 819, 328, 3416, 3380, 3418, 4979, 5199, 4058], 4460)
-    femmesh.addVolume([381, 846, 845, 798, 5683, 3479, 5336, 5337, 3477, 3476], 4461)
-    femmesh.addVolume([428, 887, 893, 948, 4349, 3629, 4355, 4357, 3804, 3808], 4462)
-    femmesh.addVolume([788, 395, 842, 344, 5392, 5753, 3462, 5056, 1961, 5715], 4463)
-    femmesh.addVolume([928, 458, 449, 890, 5230, 2225, 4591, 3736, 4155, 5813], 4464)
-    femmesh.addVolume([835, 342, 866, 847, 5650, 5410, 3539, 3480, 5411, 3540], 4465)
-    femmesh.addVolume([607, 679, 209, 680, 2946, 5702, 5737, 2949, 2950, 4908], 4466)
-    femmesh.addVolume([45, 46, 168, 75, 1029, 1246, 1247, 2375, 2378, 4175], 4467)
-    femmesh.addVolume([169, 243, 502, 585, 1472, 4561, 4563, 4678, 5443, 2664], 4468)
-    femmesh.addVolume([57, 142, 515, 31, 1218, 4248, 5512, 1183, 1181, 4247], 4469)
-    femmesh.addVolume([78, 48, 77, 503, 2381, 2382, 1063, 2416, 4838, 2415], 4470)
-    femmesh.addVolume([187, 500, 31, 168, 5452, 5225, 1292, 1434, 4174, 1262], 4471)
-    femmesh.addVolume([546, 13, 159, 14, 4018, 1228, 4755, 4756, 995, 1227], 4472)
-    femmesh.addVolume([263, 664, 663, 588, 5424, 2911, 5094, 5544, 2909, 2907], 4473)
-    femmesh.addVolume([421, 360, 732, 779, 2045, 5779, 5815, 4451, 5736, 3255], 4474)
-    femmesh.addVolume([521, 568, 126, 602, 2646, 4761, 4595, 2712, 2713, 5025], 4475)
-    femmesh.addVolume([653, 199, 200, 686, 4615, 1357, 4533, 2967, 4667, 4967], 4476)
-    femmesh.addVolume([406, 441, 858, 901, 2128, 4147, 4883, 4884, 4963, 3650], 4477)
-    femmesh.addVolume([360, 345, 779, 421, 1848, 5232, 5736, 2045, 2043, 4451], 4478)
-    femmesh.addVolume([715, 786, 201, 685, 3279, 5143, 5621, 3058, 3278, 5049], 4479)
-    femmesh.addVolume([631, 252, 696, 632, 5167, 4787, 2994, 2790, 5174, 2995], 4480)
-    femmesh.addVolume([126, 601, 201, 602, 5749, 5326, 1359, 5025, 2858, 5047], 4481)
-    femmesh.addVolume([797, 396, 347, 355, 5604, 1970, 4906, 5537, 1967, 1863], 4482)
-    femmesh.addVolume([213, 609, 212, 677, 5587, 4796, 1396, 5588, 2942, 5803], 4483)
-    femmesh.addVolume([392, 343, 866, 842, 1952, 5291, 5292, 5045, 5816, 3541], 4484)
-    femmesh.addVolume([832, 389, 340, 341, 4873, 1943, 4875, 5629, 1944, 1794], 4485)
-    femmesh.addVolume([638, 162, 182, 553, 5643, 1312, 4206, 2807, 5079, 5080], 4486)
-    femmesh.addVolume([750, 315, 809, 751, 5083, 5085, 3348, 3170, 5352, 3349], 4487)
-    femmesh.addVolume([797, 838, 729, 347, 3453, 3450, 3314, 4906, 4905, 5272], 4488)
-    femmesh.addVolume([135, 109, 573, 24, 4704, 2600, 4715, 1160, 4965, 4790], 4489)
-    femmesh.addVolume([796, 277, 770, 338, 4852, 5659, 3318, 4571, 1783, 5178], 4490)
-    femmesh.addVolume([716, 714, 778, 266, 3061, 3247, 3248, 5405, 4971, 5137], 4491)
-    femmesh.addVolume([582, 153, 154, 256, 5494, 1217, 5002, 5003, 1519, 1516], 4492)
-    femmesh.addVolume([277, 796, 770, 720, 4852, 3318, 5659, 4784, 3311, 3227], 4493)
-    femmesh.addVolume([374, 802, 825, 743, 5112, 3435, 5114, 5817, 3328, 3434], 4494)
-    femmesh.addVolume([953, 981, 470, 471, 3927, 4083, 4264, 4265, 5420, 2201], 4495)
-    femmesh.addVolume([750, 315, 751, 701, 5083, 5352, 3170, 3166, 4108, 3168], 4496)
-    femmesh.addVolume([505, 79, 504, 189, 2421, 2419, 2423, 4549, 4454, 4912], 4497)
-    femmesh.addVolume([387, 433, 872, 940, 2077, 5362, 5610, 5657, 5313, 3775], 4498)
-    femmesh.addVolume([755, 814, 303, 358, 3363, 4656, 4654, 4235, 4236, 1840], 4499)
-    femmesh.addVolume([389, 907, 850, 867, 4668, 3667, 5628, 4874, 3668, 3545], 4500)
-    femmesh.addVolume([764, 797, 729, 355, 3313, 3314, 3213, 4379, 5537, 5538], 4501)
-    femmesh.addVolume([434, 953, 433, 471, 5574, 4263, 2082, 2200, 4265, 2199], 4502)
-    femmesh.addVolume([844, 408, 440, 421, 4448, 2175, 4951, 4449, 2044, 2123], 4503)
-    femmesh.addVolume([170, 506, 80, 50, 4956, 2424, 5016, 1250, 5727, 2386], 4504)
-    femmesh.addVolume([917, 879, 462, 891, 3696, 5131, 5132, 3697, 3622, 4011], 4505)
-    femmesh.addVolume([961, 480, 442, 932, 4334, 2228, 4346, 3844, 5717, 5681], 4506)
-    femmesh.addVolume([400, 450, 457, 823, 2150, 2269, 2234, 5804, 5008, 4902], 4507)
-    femmesh.addVolume([917, 499, 492, 479, 5127, 2325, 5426, 5128, 2326, 2270], 4508)
-    femmesh.addVolume([814, 356, 303, 358, 5242, 1836, 4656, 4236, 1877, 1840], 4509)
-    femmesh.addVolume([188, 169, 502, 47, 1328, 4563, 4562, 1294, 1249, 5551], 4510)
-    femmesh.addVolume([815, 356, 814, 862, 5240, 5242, 3368, 3526, 5506, 3525], 4511)
-    femmesh.addVolume([293, 802, 374, 743, 5788, 5112, 1899, 3952, 3328, 5817], 4512)
-    femmesh.addVolume([288, 615, 676, 619, 4510, 2941, 5377, 4511, 2885, 2940], 4513)
-    femmesh.addVolume([931, 455, 490, 960, 5245, 2256, 5187, 3841, 5110, 4366], 4514)
-    femmesh.addVolume([323, 293, 374, 743, 1740, 1899, 1900, 5032, 3952, 5817], 4515)
-    femmesh.addVolume([553, 552, 20, 105, 2550, 4183, 5081, 2548, 2546, 5154], 4516)
-    femmesh.addVolume([491, 980, 494, 468, 3984, 4168, 2314, 2295, 3985, 2296], 4517)
-    femmesh.addVolume([71, 153, 536, 42, 5495, 4827, 2500, 2363, 1212, 4892], 4518)
-    femmesh.addVolume([81, 506, 190, 50, 2425, 4861, 4958, 2385, 5727, 1299], 4519)
-    femmesh.addVolume([970, 430, 468, 467, 5699, 2190, 3986, 4834, 2188, 2192], 4520)
-    femmesh.addVolume([596, 142, 174, 217, 4720, 1261, 5795, 5204, 1407, 1408], 4521)
-    femmesh.addVolume([821, 343, 344, 842, 5375, 1803, 5239, 3463, 5816, 5715], 4522)
-    femmesh.addVolume([307, 753, 704, 754, 5077, 3175, 5614, 5631, 3179, 3177], 4523)
-    femmesh.addVolume([343, 821, 866, 842, 5375, 3538, 5291, 5816, 3463, 3541], 4524)
-    femmesh.addVolume([225, 194, 256, 621, 1667, 1550, 1523, 4238, 4115, 5770], 4525)
-    femmesh.addVolume([5, 117, 6, 91, 1106, 1107, 987, 5778, 5429, 5661], 4526)
-    femmesh.addVolume([315, 375, 809, 751, 1903, 4878, 5085, 5352, 5473, 3349], 4527)
-    femmesh.addVolume([789, 400, 457, 823, 5483, 2234, 5249, 3398, 5804, 4902], 4528)
-    femmesh.addVolume([12, 13, 567, 124, 994, 4612, 4835, 1126, 1127, 4614], 4529)
-    femmesh.addVolume([160, 634, 633, 548, 4926, 2796, 4928, 4887, 2794, 2792], 4530)
-    femmesh.addVolume([232, 180, 634, 160, 1447, 4517, 4515, 1448, 1310, 4926], 4531)
-    femmesh.addVolume([244, 232, 319, 698, 1478, 1721, 1722, 4697, 5195, 5613], 4532)
-    femmesh.addVolume([789, 400, 768, 737, 5483, 5595, 3292, 3291, 5596, 3220], 4533)
-    femmesh.addVolume([294, 813, 349, 754, 5402, 4133, 1815, 5097, 3360, 5635], 4534)
-    femmesh.addVolume([26, 111, 574, 112, 4898, 2602, 3987, 5301, 1098, 2601], 4535)
-    femmesh.addVolume([645, 166, 185, 240, 5380, 1326, 4300, 5050, 1464, 1465], 4536)
-    femmesh.addVolume([162, 552, 20, 553, 4184, 4183, 1233, 5079, 2550, 5081], 4537)
-    femmesh.addVolume([513, 87, 512, 173, 2445, 2443, 2447, 4423, 4424, 5099], 4538)
-    femmesh.addVolume([395, 842, 870, 800, 5753, 3556, 5344, 5345, 3464, 3555], 4539)
-    femmesh.addVolume([643, 258, 165, 184, 4711, 1530, 4713, 4897, 1531, 1325], 4540)
-    femmesh.addVolume([343, 392, 344, 842, 1952, 1953, 1803, 5816, 5045, 5715], 4541)
-    femmesh.addVolume([788, 395, 800, 842, 5392, 5345, 3323, 3462, 5753, 3464], 4542)
-    femmesh.addVolume([370, 730, 438, 361, 4639, 5646, 2092, 1884, 4542, 2093], 4543)
-    femmesh.addVolume([763, 370, 836, 407, 4638, 4640, 3444, 5434, 1998, 4560], 4544)
-    femmesh.addVolume([95, 543, 10, 542, 2518, 4286, 4285, 2516, 2520, 5675], 4545)
-    femmesh.addVolume([518, 95, 566, 10, 2460, 2586, 2655, 5254, 4285, 5282], 4546)
-    femmesh.addVolume([761, 714, 198, 267, 3199, 5148, 5626, 5602, 4970, 1567], 4547)
-    femmesh.addVolume([499, 917, 950, 943, 5127, 3809, 4499, 5129, 3787, 3812], 4548)
-    femmesh.addVolume([730, 370, 438, 836, 4639, 2092, 5646, 3443, 4640, 4031], 4549)
-    femmesh.addVolume([870, 912, 437, 869, 3684, 5022, 5707, 3557, 3683, 4684], 4550)
-    femmesh.addVolume([475, 407, 836, 438, 2211, 4560, 4558, 2212, 2094, 4031], 4551)
-    femmesh.addVolume([373, 848, 374, 802, 4311, 5113, 1901, 5680, 3483, 5112], 4552)
-    femmesh.addVolume([552, 162, 638, 553, 4184, 5643, 2806, 2550, 5079, 2807], 4553)
-    femmesh.addVolume([895, 890, 449, 415, 3634, 5813, 5564, 5310, 5311, 2130], 4554)
-    femmesh.addVolume([370, 407, 438, 836, 1998, 2094, 2092, 4640, 4560, 4031], 4555)
-    femmesh.addVolume([133, 606, 208, 607, 4032, 5605, 1380, 4034, 2869, 5743], 4556)
-    femmesh.addVolume([307, 294, 349, 754, 1715, 1815, 1816, 5631, 5097, 5635], 4557)
-    femmesh.addVolume([904, 903, 937, 445, 3661, 3764, 3765, 4738, 4242, 4243], 4558)
-    femmesh.addVolume([904, 937, 423, 445, 3765, 4682, 4308, 4738, 4243, 2163], 4559)
-    femmesh.addVolume([925, 882, 924, 460, 3726, 3779, 3780, 5740, 5197, 4469], 4560)
-    femmesh.addVolume([656, 134, 572, 525, 5791, 5413, 2871, 2870, 5789, 2650], 4561)
-    femmesh.addVolume([532, 578, 218, 622, 2658, 4298, 5532, 2756, 2757, 4299], 4562)
-    femmesh.addVolume([419, 848, 882, 888, 4160, 3593, 4161, 4462, 3611, 3612], 4563)
-    femmesh.addVolume([577, 59, 33, 143, 2609, 2346, 5038, 4197, 4196, 1186], 4564)
-    femmesh.addVolume([59, 32, 33, 143, 2345, 1015, 2346, 4196, 1185, 1186], 4565)
-    femmesh.addVolume([153, 582, 621, 256, 5494, 2754, 5589, 1519, 5003, 5770], 4566)
-    femmesh.addVolume([848, 419, 840, 888, 4160, 5253, 3484, 3611, 4462, 3610], 4567)
-    femmesh.addVolume([582, 153, 536, 71, 5494, 4827, 2643, 2624, 5495, 2500], 4568)
-    femmesh.addVolume([483, 419, 888, 420, 2235, 4462, 4461, 2236, 2167, 4004], 4569)
-    femmesh.addVolume([419, 840, 888, 420, 5253, 3610, 4462, 2167, 4002, 4004], 4570)
-    femmesh.addVolume([195, 648, 119, 194, 5063, 5162, 1340, 1342, 5435, 1339], 4571)
-    femmesh.addVolume([925, 458, 882, 460, 4159, 4156, 3726, 5740, 2166, 5197], 4572)
-    femmesh.addVolume([898, 455, 932, 442, 4945, 5733, 3749, 4946, 2155, 5681], 4573)
-    femmesh.addVolume([425, 379, 424, 946, 2053, 2052, 2055, 4649, 5306, 4650], 4574)
-    femmesh.addVolume([364, 326, 676, 737, 1865, 5376, 4823, 5597, 5615, 3129], 4575)
-    femmesh.addVolume([954, 947, 424, 946, 3824, 4367, 4064, 3822, 3799, 4650], 4576)
-    femmesh.addVolume([650, 120, 195, 618, 5425, 1341, 5692, 2846, 5350, 5065], 4577)
-    femmesh.addVolume([176, 627, 542, 157, 5323, 2774, 5437, 1336, 5810, 4730], 4578)
-    femmesh.addVolume([8, 565, 9, 94, 5165, 4465, 990, 5166, 2583, 4467], 4579)
-    femmesh.addVolume([453, 934, 962, 933, 5547, 3848, 5764, 5710, 3757, 3847], 4580)
-    femmesh.addVolume([441, 901, 934, 900, 4963, 3756, 5546, 4148, 3652, 3755], 4581)
-    femmesh.addVolume([684, 320, 314, 767, 5060, 1817, 4693, 3219, 5522, 4688], 4582)
-    femmesh.addVolume([7, 8, 517, 119, 989, 5726, 4648, 1111, 1112, 4867], 4583)
-    femmesh.addVolume([23, 109, 556, 108, 4706, 2558, 5268, 5315, 1095, 2557], 4584)
-    femmesh.addVolume([2, 4, 984, 515, 2399, 5019, 4382, 5511, 2452, 5718], 4585)
-    femmesh.addVolume([513, 56, 173, 174, 4422, 1256, 4423, 5671, 1259, 1260], 4586)
-    femmesh.addVolume([364, 785, 768, 724, 5658, 3310, 4824, 4825, 3274, 3257], 4587)
-    femmesh.addVolume([943, 478, 922, 971, 5416, 4939, 3788, 3876, 4483, 3875], 4588)
-    femmesh.addVolume([178, 631, 630, 545, 4544, 2787, 4545, 4552, 2785, 2783], 4589)
-    femmesh.addVolume([235, 257, 640, 163, 1529, 5288, 5287, 1453, 1528, 5417], 4590)
-    femmesh.addVolume([446, 444, 886, 416, 2119, 4426, 4428, 2117, 2113, 4251], 4591)
-    femmesh.addVolume([881, 329, 819, 830, 4360, 4057, 3588, 3590, 5309, 3420], 4592)
-    femmesh.addVolume([381, 892, 846, 380, 4443, 3624, 5683, 1921, 4596, 4597], 4593)
-    femmesh.addVolume([463, 464, 426, 952, 2180, 2178, 2177, 4072, 5690, 4040], 4594)
-    femmesh.addVolume([425, 379, 911, 380, 2053, 4065, 4582, 2054, 1918, 4067], 4595)
-    femmesh.addVolume([895, 928, 449, 890, 3737, 4591, 5564, 3634, 3736, 5813], 4596)
-    femmesh.addVolume([48, 79, 49, 189, 2402, 2384, 1032, 1297, 4454, 1296], 4597)
-    femmesh.addVolume([893, 428, 427, 382, 4355, 2064, 5335, 5260, 2062, 2060], 4598)
-    femmesh.addVolume([428, 948, 941, 465, 4357, 3819, 4356, 2182, 5734, 4492], 4599)
-    femmesh.addVolume([892, 426, 427, 921, 4444, 2061, 4445, 3715, 4039, 5236], 4600)
-    femmesh.addVolume([893, 892, 427, 941, 3628, 4445, 5335, 3783, 3781, 4493], 4601)
-    femmesh.addVolume([692, 627, 691, 229, 2982, 2980, 2984, 5104, 5673, 4052], 4602)
-    femmesh.addVolume([627, 231, 691, 229, 5325, 4050, 2980, 5673, 1446, 4052], 4603)
-    femmesh.addVolume([734, 332, 798, 834, 5654, 5542, 3317, 3431, 4744, 3430], 4604)
-    femmesh.addVolume([744, 695, 228, 322, 3148, 4044, 4746, 4587, 4045, 1734], 4605)
-    femmesh.addVolume([899, 857, 410, 900, 3645, 4353, 5087, 3649, 3647, 5089], 4606)
-    femmesh.addVolume([371, 373, 322, 803, 1898, 1896, 1888, 5290, 4313, 4589], 4607)
-    femmesh.addVolume([453, 442, 410, 933, 2141, 2104, 2140, 5710, 4347, 5088], 4608)
-    femmesh.addVolume([211, 657, 608, 682, 5175, 2896, 4809, 4810, 2954, 2955], 4609)
-    femmesh.addVolume([173, 250, 512, 262, 1490, 5463, 5099, 1544, 1545, 5100], 4610)
-    femmesh.addVolume([899, 442, 932, 933, 5663, 5681, 3750, 3752, 4347, 3754], 4611)
-    femmesh.addVolume([442, 899, 410, 933, 5663, 5087, 2104, 4347, 3752, 5088], 4612)
-    femmesh.addVolume([863, 376, 905, 404, 5121, 4802, 3663, 5122, 1991, 4803], 4613)
-    femmesh.addVolume([135, 109, 24, 23, 4704, 4965, 1160, 1159, 4706, 1005], 4614)
-    femmesh.addVolume([134, 656, 572, 607, 5791, 2871, 5413, 5430, 2897, 2722], 4615)
-    femmesh.addVolume([401, 860, 349, 358, 4165, 4131, 1983, 1982, 4132, 1894], 4616)
-    femmesh.addVolume([274, 774, 828, 335, 5018, 3411, 5656, 1774, 5762, 4199], 4617)
-    femmesh.addVolume([340, 832, 341, 280, 4875, 5629, 1794, 1790, 5171, 1792], 4618)
-    femmesh.addVolume([774, 335, 795, 828, 5762, 4198, 3307, 3411, 4199, 3413], 4619)
-    femmesh.addVolume([893, 892, 845, 382, 3628, 3623, 3627, 5260, 5334, 5508], 4620)
-    femmesh.addVolume([436, 912, 894, 926, 5021, 3730, 4672, 5090, 3731, 3732], 4621)
-    femmesh.addVolume([595, 309, 262, 250, 5015, 1689, 5460, 4750, 1731, 1545], 4622)
-    femmesh.addVolume([807, 748, 806, 369, 3342, 3340, 3344, 4331, 5398, 5400], 4623)
-    femmesh.addVolume([463, 485, 975, 968, 2251, 4661, 4071, 4073, 4662, 3924], 4624)
-    femmesh.addVolume([231, 626, 627, 691, 5324, 2775, 5325, 4050, 2979, 2980], 4625)
-    femmesh.addVolume([219, 728, 614, 600, 5431, 3110, 5371, 5372, 3107, 2738], 4626)
-    femmesh.addVolume([145, 146, 578, 218, 1194, 5783, 5552, 1410, 1411, 4298], 4627)
-    femmesh.addVolume([843, 444, 886, 839, 4153, 4426, 3603, 3547, 5027, 3604], 4628)
-    femmesh.addVolume([79, 78, 504, 189, 1064, 2418, 2419, 4454, 4453, 4912], 4629)
-    femmesh.addVolume([245, 727, 611, 614, 4126, 3103, 4125, 4416, 3104, 2739], 4630)
-    femmesh.addVolume([554, 21, 182, 163, 5517, 1281, 5722, 5462, 1236, 1323], 4631)
-    femmesh.addVolume([513, 514, 88, 174, 2450, 2448, 2446, 5671, 5685, 5672], 4632)
-    femmesh.addVolume([587, 505, 504, 189, 2671, 2423, 2670, 4911, 4549, 4912], 4633)
-    femmesh.addVolume([985, 5, 193, 1, 4387, 1306, 4586, 4390, 986, 1104], 4634)
-    femmesh.addVolume([250, 595, 512, 262, 4750, 2694, 5463, 1545, 5460, 5100], 4635)
-    femmesh.addVolume([425, 947, 968, 952, 4041, 3865, 4368, 4042, 3817, 3886], 4636)
-    femmesh.addVolume([319, 367, 806, 369, 1871, 4780, 5399, 1879, 1880, 5400], 4637)
-    femmesh.addVolume([230, 697, 244, 316, 5179, 4696, 1477, 1712, 4773, 1711], 4638)
-    femmesh.addVolume([521, 15, 126, 568, 4576, 1133, 4595, 2646, 4759, 4761], 4639)
-    femmesh.addVolume([924, 498, 493, 460, 4209, 2328, 4180, 4469, 2327, 2274], 4640)
-    femmesh.addVolume([477, 461, 896, 930, 2221, 5691, 5576, 4728, 5760, 3743], 4641)
-    femmesh.addVolume([846, 381, 380, 332, 5683, 1921, 4597, 4743, 1919, 1917], 4642)
-    femmesh.addVolume([799, 788, 821, 344, 3394, 3414, 3387, 5058, 5056, 5239], 4643)
-    femmesh.addVolume([401, 406, 902, 443, 1995, 5496, 5566, 2108, 2109, 5720], 4644)
-    femmesh.addVolume([332, 846, 798, 834, 4743, 3477, 5542, 4744, 3478, 3430], 4645)
-    femmesh.addVolume([255, 312, 223, 651, 1698, 1699, 1508, 5244, 5250, 5755], 4646)
-    femmesh.addVolume([690, 626, 231, 691, 2978, 5324, 5776, 2981, 2979, 4050], 4647)
-    femmesh.addVolume([617, 255, 651, 310, 5243, 5244, 2850, 5792, 1693, 5251], 4648)
-    femmesh.addVolume([280, 832, 341, 776, 5171, 5629, 1792, 4252, 3425, 4793], 4649)
-    femmesh.addVolume([956, 488, 967, 484, 4273, 5383, 3887, 5381, 2263, 4976], 4650)
-    femmesh.addVolume([821, 343, 283, 344, 5375, 1799, 5238, 5239, 1803, 1801], 4651)
-    femmesh.addVolume([870, 842, 395, 392, 3556, 5753, 5344, 5044, 5045, 1964], 4652)
-    femmesh.addVolume([151, 535, 223, 619, 5728, 4089, 1425, 5609, 2751, 4513], 4653)
-    femmesh.addVolume([617, 255, 310, 220, 5243, 1693, 5792, 4440, 1509, 1692], 4654)
-    femmesh.addVolume([255, 150, 580, 223, 1507, 4088, 4526, 1508, 1424, 4090], 4655)
-    femmesh.addVolume([392, 920, 842, 866, 5046, 3713, 5045, 5292, 3723, 3541], 4656)
-    femmesh.addVolume([467, 480, 976, 979, 2321, 5115, 3971, 4306, 4335, 3919], 4657)
-    femmesh.addVolume([970, 467, 976, 955, 4834, 3971, 3897, 3872, 4307, 3898], 4658)
-    femmesh.addVolume([266, 716, 773, 778, 5405, 3236, 5138, 5137, 3248, 3249], 4659)
-    femmesh.addVolume([199, 268, 689, 198, 1570, 4049, 4047, 1354, 1569, 5693], 4660)
-    femmesh.addVolume([414, 876, 327, 824, 5277, 5274, 2020, 5470, 3573, 5276], 4661)
-    femmesh.addVolume([197, 716, 266, 714, 4894, 5405, 1564, 4895, 3061, 4971], 4662)
-    femmesh.addVolume([709, 645, 240, 710, 3034, 5050, 4606, 3038, 3036, 4607], 4663)
-    femmesh.addVolume([961, 491, 480, 976, 4344, 2261, 4334, 3909, 3972, 5115], 4664)
-    femmesh.addVolume([832, 794, 341, 776, 3438, 4676, 5629, 3425, 3305, 4793], 4665)
-    femmesh.addVolume([491, 961, 933, 962, 4344, 3845, 4345, 4341, 3849, 3847], 4666)
-    femmesh.addVolume([382, 893, 383, 875, 5260, 5261, 1927, 5448, 3626, 5450], 4667)
-    femmesh.addVolume([400, 352, 737, 787, 1978, 5698, 5596, 5524, 4847, 3467], 4668)
-    femmesh.addVolume([789, 400, 737, 787, 5483, 5596, 3291, 3468, 5524, 3467], 4669)
-    femmesh.addVolume([19, 131, 20, 523, 1147, 1148, 1001, 5155, 5220, 5156], 4670)
-    femmesh.addVolume([292, 816, 350, 757, 4698, 5270, 1818, 4262, 3369, 5271], 4671)
-    femmesh.addVolume([334, 781, 831, 828, 4540, 3424, 5652, 5655, 3412, 3474], 4672)
-    femmesh.addVolume([485, 966, 975, 971, 4480, 3894, 4661, 4481, 3914, 3917], 4673)
-    femmesh.addVolume([523, 605, 570, 130, 2718, 2719, 2648, 5455, 4112, 5338], 4674)
-    femmesh.addVolume([224, 624, 619, 289, 5585, 2764, 4969, 1629, 5586, 5298], 4675)
-    femmesh.addVolume([183, 257, 640, 641, 1527, 5288, 5150, 5151, 4225, 2817], 4676)
-    femmesh.addVolume([480, 466, 979, 467, 2315, 4354, 4335, 2321, 2189, 4306], 4677)
-    femmesh.addVolume([624, 536, 152, 581, 2762, 4522, 4524, 2763, 2657, 4855], 4678)
-    femmesh.addVolume([725, 320, 289, 225, 4239, 1805, 5234, 4240, 1727, 1630], 4679)
-    femmesh.addVolume([332, 272, 734, 798, 1766, 5744, 5654, 5542, 5062, 3317], 4680)
-    femmesh.addVolume([818, 785, 456, 731, 3375, 5752, 5385, 3376, 3276, 5229], 4681)
-    femmesh.addVolume([538, 155, 6, 5, 5074, 1219, 5745, 5771, 1220, 987], 4682)
-    femmesh.addVolume([272, 733, 734, 798, 5061, 3217, 5744, 5062, 3316, 3317], 4683)
-    femmesh.addVolume([664, 263, 729, 347, 5424, 5606, 3112, 5273, 1811, 5272], 4684)
-    femmesh.addVolume([16, 128, 17, 569, 1138, 1139, 998, 5035, 5491, 5295], 4685)
-    femmesh.addVolume([331, 379, 380, 878, 1914, 1918, 1916, 4014, 4015, 4066], 4686)
-    femmesh.addVolume([788, 395, 344, 325, 5392, 1961, 5056, 4807, 1962, 1890], 4687)
-    femmesh.addVolume([351, 667, 299, 668, 4149, 5255, 1821, 5409, 2920, 4869], 4688)
-    femmesh.addVolume([898, 855, 897, 413, 3641, 3639, 3643, 4626, 4628, 5758], 4689)
-    femmesh.addVolume([351, 760, 668, 295, 4314, 3195, 5409, 1820, 4316, 4870], 4690)
-    femmesh.addVolume([340, 822, 388, 867, 4983, 4985, 1941, 4876, 3544, 5327], 4691)
-    femmesh.addVolume([518, 10, 121, 9, 5254, 1118, 5308, 4466, 991, 1117], 4692)
-    femmesh.addVolume([408, 362, 731, 456, 2001, 5806, 5070, 2153, 2154, 5229], 4693)
-    femmesh.addVolume([518, 95, 9, 94, 2460, 4968, 4466, 2461, 1081, 4467], 4694)
-    femmesh.addVolume([265, 717, 314, 767, 5562, 4692, 1725, 4686, 3218, 4688], 4695)
-    femmesh.addVolume([777, 408, 362, 731, 5069, 2001, 5688, 3246, 5070, 5806], 4696)
-    femmesh.addVolume([387, 822, 388, 339, 5612, 4985, 1942, 1938, 4984, 1940], 4697)
-    femmesh.addVolume([973, 975, 487, 493, 3895, 4035, 5458, 5459, 5600, 2275], 4698)
-    femmesh.addVolume([804, 321, 745, 371, 3974, 3976, 3333, 5170, 1887, 5548], 4699)
-    femmesh.addVolume([348, 397, 415, 852, 1969, 2023, 2021, 5678, 5209, 5312], 4700)
-    femmesh.addVolume([477, 461, 930, 497, 2221, 5760, 4728, 2307, 2308, 4102], 4701)
-    femmesh.addVolume([378, 884, 946, 379, 4507, 3794, 4653, 1915, 4857, 5306], 4702)
-    femmesh.addVolume([461, 958, 930, 497, 4919, 3836, 5760, 2308, 4101, 4102], 4703)
-    femmesh.addVolume([444, 843, 457, 839, 4153, 4154, 2158, 5027, 3547, 4900], 4704)
-    femmesh.addVolume([623, 122, 123, 198, 4266, 1125, 5627, 4268, 1349, 1350], 4705)
-    femmesh.addVolume([601, 200, 201, 715, 4535, 1360, 5326, 3055, 5442, 5621], 4706)
-    femmesh.addVolume([568, 125, 126, 601, 4814, 1134, 4761, 2710, 4534, 5749], 4707)
-    femmesh.addVolume([799, 214, 284, 283, 4602, 1617, 5057, 5237, 1615, 1619], 4708)
-    femmesh.addVolume([786, 271, 734, 834, 5141, 5149, 3281, 3439, 5651, 3431], 4709)
-    femmesh.addVolume([689, 623, 599, 198, 2975, 2761, 2974, 5693, 4268, 5697], 4710)
-    femmesh.addVolume([489, 958, 957, 929, 4920, 3837, 4569, 4865, 3835, 3834], 4711)
-    femmesh.addVolume([342, 835, 866, 343, 5650, 3539, 5410, 1800, 4890, 5291], 4712)
-    femmesh.addVolume([623, 123, 599, 198, 5627, 4622, 2761, 4268, 1350, 5697], 4713)
-    femmesh.addVolume([475, 914, 877, 869, 4685, 3691, 4949, 4557, 3689, 3577], 4714)
-    femmesh.addVolume([134, 133, 209, 607, 1158, 1382, 1383, 5430, 4034, 5737], 4715)
-    femmesh.addVolume([296, 758, 239, 709, 4006, 4518, 1647, 4325, 3190, 4520], 4716)
-    femmesh.addVolume([656, 210, 209, 134, 4094, 1387, 4907, 5791, 1385, 1383], 4717)
-    femmesh.addVolume([375, 857, 372, 809, 4352, 5797, 1904, 4878, 3510, 5086], 4718)
-    femmesh.addVolume([725, 320, 767, 772, 4239, 5522, 3222, 3232, 5521, 3235], 4719)
-    femmesh.addVolume([254, 628, 692, 229, 4201, 2983, 5303, 1504, 5809, 5104], 4720)
-    femmesh.addVolume([629, 158, 226, 630, 4116, 1432, 4288, 2784, 4118, 4798], 4721)
-    femmesh.addVolume([293, 694, 226, 228, 3950, 4106, 1641, 1640, 4096, 1518], 4722)
-    femmesh.addVolume([656, 134, 209, 607, 5791, 1383, 4907, 2897, 5430, 5737], 4723)
-    femmesh.addVolume([639, 235, 640, 163, 5497, 5287, 2814, 5641, 1453, 5417], 4724)
-    femmesh.addVolume([555, 183, 22, 163, 5152, 1284, 5666, 5418, 1313, 1235], 4725)
-    femmesh.addVolume([582, 256, 537, 597, 5003, 5005, 2656, 2702, 4741, 2701], 4726)
-    femmesh.addVolume([411, 826, 438, 448, 4119, 4029, 2111, 2125, 4281, 2127], 4727)
-    femmesh.addVolume([263, 664, 300, 347, 5424, 4671, 1726, 1811, 5273, 1810], 4728)
-    femmesh.addVolume([221, 532, 576, 146, 5531, 2606, 5478, 1417, 4271, 4272], 4729)
-    femmesh.addVolume([40, 150, 68, 39, 1204, 4270, 2360, 1022, 1203, 2374], 4730)
-    femmesh.addVolume([241, 297, 259, 726, 1650, 1651, 1533, 4053, 4024, 4055], 4731)
-    femmesh.addVolume([764, 662, 286, 663, 3206, 4723, 4384, 3207, 2908, 5096], 4732)
-    femmesh.addVolume([808, 750, 372, 809, 3346, 5084, 5168, 3350, 3348, 5086], 4733)
-    femmesh.addVolume([113, 527, 28, 575, 2478, 5379, 4373, 2604, 2638, 5787], 4734)
-    femmesh.addVolume([254, 628, 229, 157, 4201, 5809, 1504, 1503, 4188, 1439], 4735)
-    femmesh.addVolume([877, 475, 836, 438, 4949, 4558, 3576, 4030, 2212, 4031], 4736)
-    femmesh.addVolume([342, 282, 281, 775, 1796, 1613, 1795, 5316, 4909, 5317], 4737)
-    femmesh.addVolume([436, 926, 894, 435, 5090, 3732, 4672, 2088, 4637, 4666], 4738)
-    femmesh.addVolume([447, 376, 905, 423, 2120, 4802, 4304, 2121, 2049, 4309], 4739)
-    femmesh.addVolume([472, 488, 956, 484, 2304, 4273, 5190, 2303, 2263, 5381], 4740)
-    femmesh.addVolume([396, 346, 355, 820, 1965, 1852, 1967, 5648, 5649, 4378], 4741)
-    femmesh.addVolume([353, 736, 732, 721, 5527, 3127, 5781, 5777, 3125, 3118], 4742)
-    femmesh.addVolume([516, 73, 90, 193, 2578, 2455, 2457, 4084, 4085, 4496], 4743)
-    femmesh.addVolume([365, 346, 396, 820, 1867, 1965, 1966, 5488, 5649, 5648], 4744)
-    femmesh.addVolume([985, 73, 1, 193, 5093, 2368, 4390, 4586, 4085, 1104], 4745)
-    femmesh.addVolume([342, 835, 794, 847, 5650, 3442, 4675, 5411, 3480, 3481], 4746)
-    femmesh.addVolume([774, 335, 275, 795, 5762, 1775, 4987, 3307, 4198, 4988], 4747)
-    femmesh.addVolume([774, 205, 275, 274, 4959, 1590, 4987, 5018, 1588, 1592], 4748)
-    femmesh.addVolume([865, 365, 396, 820, 4192, 1966, 5579, 3536, 5488, 5648], 4749)
-    femmesh.addVolume([313, 612, 721, 723, 4022, 3082, 4863, 5800, 3088, 3095], 4750)
-    femmesh.addVolume([849, 884, 330, 878, 3597, 4856, 4833, 3580, 3600, 4016], 4751)
-    femmesh.addVolume([582, 43, 72, 154, 5493, 2365, 2623, 5002, 1215, 5247], 4752)
-    femmesh.addVolume([907, 390, 850, 894, 4663, 4479, 3667, 3706, 4664, 3631], 4753)
-    femmesh.addVolume([153, 43, 582, 154, 1213, 5493, 5494, 1217, 1215, 5002], 4754)
-    femmesh.addVolume([659, 216, 671, 713, 4220, 5556, 2927, 3047, 4221, 3050], 4755)
-    femmesh.addVolume([335, 868, 828, 875, 3994, 3549, 4199, 5721, 3570, 3568], 4756)
-    femmesh.addVolume([744, 293, 743, 802, 3951, 3952, 3149, 3329, 5788, 3328], 4757)
-    femmesh.addVolume([893, 887, 383, 875, 3629, 4351, 5261, 3626, 3608, 5450], 4758)
-    femmesh.addVolume([741, 739, 324, 691, 3140, 5389, 5109, 3138, 3135, 4051], 4759)
-    femmesh.addVolume([500, 984, 116, 31, 5709, 5226, 2579, 5225, 5714, 4781], 4760)
-    femmesh.addVolume([540, 7, 8, 93, 4278, 989, 4348, 2510, 4826, 5164], 4761)
-    femmesh.addVolume([649, 242, 501, 168, 5472, 3935, 2841, 5454, 1471, 3937], 4762)
-    femmesh.addVolume([334, 335, 828, 875, 1776, 4199, 5655, 5449, 5721, 3568], 4763)
-    femmesh.addVolume([904, 862, 861, 399, 3660, 3527, 3659, 4075, 4916, 4076], 4764)
-    femmesh.addVolume([783, 285, 215, 713, 5020, 1620, 4996, 3287, 5818, 4223], 4765)
-    femmesh.addVolume([617, 255, 220, 149, 5243, 1509, 4440, 5774, 1506, 1416], 4766)
-    femmesh.addVolume([340, 782, 339, 822, 4293, 5761, 1791, 4983, 3406, 4984], 4767)
-    femmesh.addVolume([579, 617, 220, 149, 2747, 4440, 5593, 4488, 5774, 1416], 4768)
-    femmesh.addVolume([749, 290, 357, 304, 4536, 1839, 5653, 5475, 1702, 1838], 4769)
-    femmesh.addVolume([775, 682, 281, 776, 3241, 5581, 5317, 3288, 3242, 4794], 4770)
-    femmesh.addVolume([934, 441, 900, 453, 5546, 4148, 3755, 5547, 2139, 5711], 4771)
-    femmesh.addVolume([12, 158, 11, 544, 1225, 1226, 993, 5790, 4117, 4163], 4772)
-    femmesh.addVolume([694, 323, 693, 743, 4104, 4105, 2990, 3145, 5032, 3144], 4773)
-    femmesh.addVolume([255, 651, 580, 534, 5244, 2848, 4526, 4525, 2849, 2641], 4774)
-    femmesh.addVolume([793, 339, 279, 782, 5535, 1787, 5314, 3393, 5761, 4012], 4775)
-    femmesh.addVolume([463, 485, 968, 425, 2251, 4662, 4073, 2176, 2242, 4368], 4776)
-    femmesh.addVolume([694, 323, 293, 226, 4104, 1740, 3950, 4106, 1737, 1641], 4777)
-    femmesh.addVolume([279, 782, 339, 340, 4012, 5761, 1787, 1789, 4293, 1791], 4778)
-    femmesh.addVolume([177, 158, 544, 11, 1335, 4117, 5731, 1271, 1226, 4163], 4779)
-    femmesh.addVolume([266, 714, 778, 267, 4971, 3247, 5137, 1568, 4970, 5766], 4780)
-    femmesh.addVolume([981, 953, 982, 471, 3927, 3921, 3926, 5420, 4265, 5421], 4781)
-    femmesh.addVolume([596, 513, 174, 514, 2697, 5671, 5795, 2698, 2450, 5685], 4782)
-    femmesh.addVolume([983, 964, 481, 981, 2340, 4253, 4080, 2330, 2339, 4082], 4783)
-    femmesh.addVolume([862, 815, 350, 863, 3526, 5269, 5682, 3530, 3528, 5123], 4784)
-    femmesh.addVolume([796, 738, 336, 795, 3312, 5451, 3964, 3405, 3306, 3965], 4785)
-    femmesh.addVolume([191, 510, 53, 172, 5669, 4333, 1300, 1331, 5263, 1255], 4786)
-    femmesh.addVolume([342, 343, 866, 391, 1800, 5291, 5410, 1949, 1950, 4880], 4787)
-    femmesh.addVolume([285, 783, 671, 713, 5020, 3269, 5557, 5818, 3287, 3050], 4788)
-    femmesh.addVolume([257, 705, 237, 294, 4224, 4226, 1551, 1642, 4717, 1658], 4789)
-    femmesh.addVolume([285, 216, 215, 713, 1621, 1405, 1620, 5818, 4221, 4223], 4790)
-    femmesh.addVolume([868, 384, 336, 841, 3992, 1929, 5723, 3553, 5696, 3963], 4791)
-    femmesh.addVolume([208, 606, 720, 679, 5605, 3077, 4785, 5705, 2947, 3079], 4792)
-    femmesh.addVolume([596, 595, 217, 262, 2699, 5561, 5204, 5461, 5460, 1546], 4793)
-    femmesh.addVolume([406, 859, 363, 349, 4882, 5321, 2002, 1996, 5196, 1862], 4794)
-    femmesh.addVolume([675, 774, 781, 274, 3267, 3315, 3262, 5017, 5018, 4539], 4795)
-    femmesh.addVolume([392, 920, 391, 437, 5046, 4879, 1954, 2090, 5706, 2089], 4796)
-    femmesh.addVolume([271, 202, 685, 734, 1579, 5048, 5142, 5149, 5617, 3122], 4797)
-    femmesh.addVolume([125, 653, 520, 124, 4532, 2860, 4401, 1131, 4616, 4613], 4798)
-    femmesh.addVolume([442, 961, 932, 933, 4346, 3844, 5681, 4347, 3845, 3754], 4799)
-    femmesh.addVolume([863, 906, 864, 404, 3664, 3665, 3533, 5122, 3991, 4931], 4800)
-    femmesh.addVolume([384, 841, 385, 336, 5696, 5259, 1933, 1929, 3963, 1931], 4801)
-    femmesh.addVolume([513, 596, 174, 262, 2697, 5795, 5671, 5098, 5461, 1543], 4802)
-    femmesh.addVolume([454, 404, 405, 919, 2144, 2103, 2143, 4922, 4933, 4934], 4803)
-    femmesh.addVolume([606, 712, 655, 207, 3046, 3043, 2898, 5073, 4772, 5053], 4804)
-    femmesh.addVolume([906, 404, 454, 919, 3991, 2144, 3990, 3710, 4933, 4922], 4805)
-    femmesh.addVolume([216, 285, 671, 713, 1621, 5557, 5556, 4221, 5818, 3050], 4806)
-    femmesh.addVolume([521, 16, 569, 127, 4577, 5035, 2632, 4091, 1136, 5545], 4807)
-    femmesh.addVolume([893, 382, 845, 875, 5260, 5508, 3627, 3626, 5448, 3571], 4808)
-    femmesh.addVolume([946, 379, 878, 911, 5306, 4015, 3793, 3796, 4065, 3682], 4809)
-    femmesh.addVolume([650, 518, 598, 121, 2844, 2704, 2847, 5481, 5308, 5590], 4810)
-    femmesh.addVolume([380, 846, 878, 911, 4597, 3581, 4066, 4067, 3681, 3682], 4811)
-    femmesh.addVolume([598, 122, 197, 121, 5419, 1347, 4893, 5590, 1122, 1346], 4812)
-    femmesh.addVolume([202, 673, 272, 203, 5227, 3960, 1581, 1366, 3962, 1582], 4813)
-    femmesh.addVolume([518, 10, 566, 121, 5254, 5282, 2655, 5308, 1118, 5819], 4814)
-    femmesh.addVolume([10, 122, 566, 121, 1120, 5528, 5282, 1118, 1122, 5819], 4815)
-    femmesh.addVolume([791, 439, 407, 869, 4077, 2097, 4079, 3552, 5340, 4559], 4816)
-    femmesh.addVolume([826, 448, 877, 438, 4281, 4259, 3575, 4029, 2127, 4030], 4817)
-    femmesh.addVolume([791, 763, 836, 407, 3295, 3444, 3445, 4079, 5434, 4560], 4818)
-    femmesh.addVolume([518, 598, 121, 566, 2704, 5590, 5308, 2655, 2703, 5819], 4819)
-    femmesh.addVolume([407, 791, 869, 836, 4079, 3552, 4559, 4560, 3445, 3551], 4820)
-    femmesh.addVolume([598, 122, 121, 566, 5419, 1122, 5590, 2703, 5528, 5819], 4821)
-    femmesh.addVolume([496, 474, 495, 918, 2318, 2337, 2322, 4276, 4256, 5126], 4822)
-    femmesh.addVolume([448, 475, 877, 438, 2213, 4949, 4259, 2127, 2212, 4030], 4823)
-    femmesh.addVolume([439, 870, 437, 869, 5339, 5707, 2098, 5340, 3557, 4684], 4824)
-    femmesh.addVolume([484, 476, 982, 471, 2258, 4457, 4977, 2302, 2301, 5421], 4825)
-    femmesh.addVolume([639, 235, 182, 236, 5497, 1454, 4204, 4203, 1457, 1455], 4826)
-    femmesh.addVolume([925, 458, 493, 973, 4159, 2273, 4179, 3882, 5231, 5459], 4827)
-    femmesh.addVolume([10, 543, 96, 11, 4286, 2519, 4287, 992, 5801, 4164], 4828)
-    femmesh.addVolume([543, 177, 544, 11, 4187, 5731, 2523, 5801, 1271, 4163], 4829)
-    femmesh.addVolume([639, 638, 182, 553, 2811, 4206, 4204, 2809, 2807, 5080], 4830)
-    femmesh.addVolume([378, 881, 377, 942, 4506, 4797, 1912, 4652, 3785, 5457], 4831)
-    femmesh.addVolume([12, 123, 519, 11, 1124, 4837, 4135, 993, 1123, 4137], 4832)
-    femmesh.addVolume([524, 106, 132, 571, 2473, 4246, 5820, 2649, 2595, 5284], 4833)
-    femmesh.addVolume([106, 524, 132, 21, 2473, 5820, 4246, 4244, 4747, 1151], 4834)
-    femmesh.addVolume([419, 848, 374, 373, 4160, 5113, 2037, 2036, 4311, 1901], 4835)
-    femmesh.addVolume([133, 606, 132, 208, 4032, 5571, 1155, 1380, 5605, 1379], 4836)
-    femmesh.addVolume([403, 412, 366, 801, 2013, 2014, 1988, 4600, 5480, 5441], 4837)
-    femmesh.addVolume([329, 881, 874, 377, 4360, 3589, 4059, 1909, 4797, 5751], 4838)
-    femmesh.addVolume([455, 931, 932, 960, 5245, 3751, 5733, 5110, 3841, 3842], 4839)
-    femmesh.addVolume([428, 466, 948, 465, 2184, 4216, 4357, 2182, 2186, 5734], 4840)
-    femmesh.addVolume([978, 969, 974, 465, 3904, 3893, 3903, 4317, 4490, 4318], 4841)
-    femmesh.addVolume([16, 101, 569, 102, 4342, 2592, 5035, 4141, 1088, 2591], 4842)
-    femmesh.addVolume([807, 854, 369, 806, 3502, 4330, 4331, 3344, 3501, 5400], 4843)
-    femmesh.addVolume([133, 524, 21, 132, 4033, 4747, 1153, 1155, 5820, 1151], 4844)
-    femmesh.addVolume([524, 606, 571, 132, 2720, 2721, 2649, 5820, 5571, 5284], 4845)
-    femmesh.addVolume([547, 15, 179, 548, 5644, 1275, 5359, 2535, 5584, 5205], 4846)
-    femmesh.addVolume([133, 606, 524, 132, 4032, 2720, 4033, 1155, 5571, 5820], 4847)
-    femmesh.addVolume([675, 604, 204, 654, 2936, 4566, 4565, 2937, 2863, 5034], 4848)
-    femmesh.addVolume([301, 730, 665, 666, 4753, 3113, 4754, 5500, 3114, 3064], 4849)
-    femmesh.addVolume([590, 301, 665, 666, 4937, 4754, 2913, 2914, 5500, 3064], 4850)
-    femmesh.addVolume([65, 37, 533, 64, 2355, 5183, 2494, 1049, 2354, 2495], 4851)
-    femmesh.addVolume([818, 839, 482, 823, 3456, 4901, 5262, 3402, 3455, 4903], 4852)
-    femmesh.addVolume([980, 469, 494, 468, 4374, 2297, 4168, 3985, 2195, 2296], 4853)
-    femmesh.addVolume([170, 505, 506, 588, 4548, 2426, 4956, 5211, 2673, 2674], 4854)
-    femmesh.addVolume([532, 62, 63, 146, 2493, 1047, 2492, 4271, 5782, 4207], 4855)
-    femmesh.addVolume([364, 785, 724, 394, 5658, 3274, 4825, 1959, 5598, 5257], 4856)
-    femmesh.addVolume([623, 122, 566, 519, 4266, 5528, 2760, 2759, 5305, 2644], 4857)
-    femmesh.addVolume([885, 446, 886, 922, 4427, 4428, 3605, 3718, 5739, 3717], 4858)
-    femmesh.addVolume([401, 903, 445, 443, 4166, 4242, 2116, 2108, 5719, 2151], 4859)
-    femmesh.addVolume([177, 543, 544, 629, 4187, 2523, 5731, 4200, 2779, 2780], 4860)
-    femmesh.addVolume([176, 541, 542, 627, 5489, 2517, 5437, 5323, 2773, 2774], 4861)
-    femmesh.addVolume([631, 695, 228, 630, 2992, 4044, 4546, 2787, 2991, 4097], 4862)
-    femmesh.addVolume([541, 540, 8, 93, 2514, 4348, 5438, 2512, 2510, 5164], 4863)
-    femmesh.addVolume([3, 563, 1, 58, 2486, 4388, 2369, 1042, 2487, 2370], 4864)
-    femmesh.addVolume([227, 626, 625, 156, 5802, 2772, 5664, 1435, 4283, 5763], 4865)
-    femmesh.addVolume([486, 478, 922, 943, 2246, 4939, 5368, 5812, 5416, 3788], 4866)
-    femmesh.addVolume([32, 59, 58, 530, 2345, 1043, 2344, 5757, 2488, 2489], 4867)
-    femmesh.addVolume([478, 459, 922, 954, 2223, 5369, 4939, 4938, 4063, 3828], 4868)
-    femmesh.addVolume([885, 486, 922, 943, 5775, 5368, 3718, 3786, 5812, 3788], 4869)
-    femmesh.addVolume([627, 628, 542, 157, 2778, 2776, 2774, 5810, 4188, 4730], 4870)
-    femmesh.addVolume([120, 565, 8, 119, 5348, 5165, 1114, 1116, 5349, 1112], 4871)
-    femmesh.addVolume([318, 227, 231, 690, 1718, 1445, 1720, 5519, 5747, 5776], 4872)
-    femmesh.addVolume([156, 541, 8, 176, 4284, 5438, 1221, 1334, 5489, 1270], 4873)
-    femmesh.addVolume([554, 106, 553, 182, 2551, 2549, 2553, 5722, 5724, 5080], 4874)
-    femmesh.addVolume([857, 375, 372, 410, 4352, 1904, 5797, 4353, 2008, 2009], 4875)
-    femmesh.addVolume([136, 24, 110, 25, 1162, 4791, 4178, 1163, 1006, 4777], 4876)
-    femmesh.addVolume([813, 755, 754, 294, 3361, 3182, 3360, 5402, 5784, 5097], 4877)
-    femmesh.addVolume([234, 161, 636, 251, 1452, 4624, 4982, 1525, 1492, 5147], 4878)
-    femmesh.addVolume([24, 184, 110, 25, 1286, 4806, 4791, 1006, 1285, 4777], 4879)
-    femmesh.addVolume([296, 758, 368, 292, 4006, 5117, 1876, 1648, 4260, 1874], 4880)
-    femmesh.addVolume([139, 214, 610, 658, 1398, 4896, 4811, 5554, 5486, 2875], 4881)
-    femmesh.addVolume([409, 477, 897, 413, 2220, 4729, 5712, 2133, 2219, 5758], 4882)
-    femmesh.addVolume([477, 409, 897, 896, 2220, 5712, 4729, 5576, 5677, 3640], 4883)
-    femmesh.addVolume([455, 477, 413, 897, 2222, 2219, 2149, 5794, 4729, 5758], 4884)
-    femmesh.addVolume([112, 527, 27, 113, 2479, 5378, 4843, 1099, 2478, 4447], 4885)
-    femmesh.addVolume([656, 210, 135, 608, 4094, 1386, 4822, 2899, 4095, 4789], 4886)
-    femmesh.addVolume([731, 362, 718, 394, 5806, 5808, 3115, 5599, 1960, 5043], 4887)
-    femmesh.addVolume([794, 341, 776, 281, 4676, 4793, 3305, 4677, 1793, 4794], 4888)
-    femmesh.addVolume([422, 496, 454, 909, 2289, 2312, 2146, 4190, 3978, 4921], 4889)
-    femmesh.addVolume([107, 133, 22, 572, 5510, 1154, 5630, 2598, 5412, 5414], 4890)
-    femmesh.addVolume([412, 398, 366, 792, 2015, 1974, 2014, 5394, 4766, 4768], 4891)
-    femmesh.addVolume([401, 903, 861, 399, 4166, 3657, 4167, 2007, 4074, 4076], 4892)
-    femmesh.addVolume([362, 456, 394, 731, 2154, 2156, 1960, 5806, 5229, 5599], 4893)
-    femmesh.addVolume([584, 243, 711, 585, 5407, 4323, 3039, 2666, 5443, 3040], 4894)
-    femmesh.addVolume([243, 584, 502, 585, 5407, 2663, 4561, 5443, 2666, 2664], 4895)
-    femmesh.addVolume([541, 176, 542, 9, 5489, 5437, 2517, 4858, 1269, 4859], 4896)
-    femmesh.addVolume([362, 310, 718, 394, 1858, 5041, 5808, 1960, 1957, 5043], 4897)
-    femmesh.addVolume([477, 455, 931, 897, 2222, 5245, 4727, 4729, 5794, 3746], 4898)
-    femmesh.addVolume([142, 57, 514, 174, 1218, 5684, 4721, 1261, 1258, 5685], 4899)
-    femmesh.addVolume([782, 279, 680, 678, 4012, 4495, 3264, 3263, 3942, 2951], 4900)
-    femmesh.addVolume([793, 339, 770, 278, 5535, 5786, 3302, 5536, 1786, 5767], 4901)
-    femmesh.addVolume([822, 338, 770, 339, 5177, 5178, 3390, 4984, 1788, 5786], 4902)
-    femmesh.addVolume([208, 133, 607, 209, 1380, 4034, 5743, 1384, 1382, 5737], 4903)
-    femmesh.addVolume([276, 796, 277, 720, 4851, 4852, 1598, 4769, 3311, 4784], 4904)
-    femmesh.addVolume([120, 650, 195, 196, 5425, 5692, 1341, 1343, 4471, 1345], 4905)
-    femmesh.addVolume([195, 648, 194, 684, 5063, 5435, 1342, 5064, 2964, 4113], 4906)
-    femmesh.addVolume([785, 718, 724, 394, 3275, 3092, 3274, 5598, 5043, 5257], 4907)
-    femmesh.addVolume([456, 785, 394, 731, 5752, 5598, 2156, 5229, 3276, 5599], 4908)
-    femmesh.addVolume([73, 44, 193, 537, 2367, 1105, 4085, 2502, 5456, 4086], 4909)
-    femmesh.addVolume([243, 584, 687, 242, 5407, 2970, 5618, 1520, 5516, 5471], 4910)
-    femmesh.addVolume([323, 374, 825, 743, 1900, 5114, 5031, 5032, 5817, 3434], 4911)
-    femmesh.addVolume([936, 903, 902, 443, 3762, 3658, 3761, 5768, 5719, 5720], 4912)
-    femmesh.addVolume([10, 122, 11, 566, 1120, 1121, 992, 5282, 5528, 5283], 4913)
-    femmesh.addVolume([241, 243, 687, 242, 1632, 5618, 4633, 1470, 1520, 5471], 4914)
-    femmesh.addVolume([368, 404, 864, 405, 1992, 4931, 4644, 2010, 2103, 4932], 4915)
-    femmesh.addVolume([312, 364, 724, 394, 1866, 4825, 5256, 1958, 1959, 5257], 4916)
-    femmesh.addVolume([462, 879, 479, 482, 5131, 5010, 2271, 2232, 5011, 2272], 4917)
-    femmesh.addVolume([227, 728, 625, 690, 5665, 3108, 5664, 5747, 3109, 2977], 4918)
-    femmesh.addVolume([481, 452, 443, 935, 2231, 2152, 2230, 4321, 5515, 4322], 4919)
-    femmesh.addVolume([452, 406, 443, 935, 2137, 2109, 2152, 5515, 5716, 4322], 4920)
-    femmesh.addVolume([819, 829, 328, 874, 3418, 4979, 4058, 3566, 3567, 4060], 4921)
-    femmesh.addVolume([785, 364, 768, 450, 5658, 4824, 3310, 5006, 2132, 5007], 4922)
-    femmesh.addVolume([406, 902, 443, 935, 5496, 5720, 2109, 5716, 3759, 4322], 4923)
-    femmesh.addVolume([150, 67, 580, 68, 4269, 2620, 4088, 4270, 1052, 2619], 4924)
-    femmesh.addVolume([268, 761, 267, 328, 5198, 5602, 1571, 1754, 5199, 1753], 4925)
-    femmesh.addVolume([364, 400, 768, 450, 1980, 5595, 4824, 2132, 2150, 5007], 4926)
-    femmesh.addVolume([902, 936, 443, 935, 3761, 5768, 5720, 3759, 3763, 4322], 4927)
-    femmesh.addVolume([535, 615, 580, 223, 2740, 2741, 2659, 4089, 4512, 4090], 4928)
-    femmesh.addVolume([176, 627, 157, 229, 5323, 5810, 1336, 1440, 5673, 1439], 4929)
-    femmesh.addVolume([876, 829, 416, 327, 3591, 4978, 4249, 5274, 5275, 2028], 4930)
-    femmesh.addVolume([587, 246, 233, 286, 5101, 1514, 4726, 4724, 1623, 1624], 4931)
-    femmesh.addVolume([243, 233, 306, 585, 1474, 1675, 1676, 5443, 3970, 5157], 4932)
-    femmesh.addVolume([906, 909, 454, 923, 3768, 4921, 3990, 3725, 3719, 5821], 4933)
-    femmesh.addVolume([506, 170, 190, 50, 4956, 1319, 4861, 5727, 1250, 1299], 4934)
-    femmesh.addVolume([81, 51, 50, 190, 2388, 1034, 2385, 4958, 1298, 1299], 4935)
-    femmesh.addVolume([447, 906, 454, 923, 3989, 3990, 2145, 4303, 3725, 5821], 4936)
-    femmesh.addVolume([496, 915, 495, 454, 3979, 5125, 2322, 2312, 5822, 2284], 4937)
-    femmesh.addVolume([496, 909, 915, 454, 3978, 3692, 3979, 2312, 4921, 5822], 4938)
-    femmesh.addVolume([470, 981, 476, 471, 4083, 4456, 2300, 2201, 5420, 2301], 4939)
-    femmesh.addVolume([923, 495, 915, 454, 5700, 5125, 3720, 5821, 2284, 5822], 4940)
-    femmesh.addVolume([715, 200, 201, 270, 5442, 1360, 5621, 3946, 1575, 1576], 4941)
-    femmesh.addVolume([208, 277, 278, 679, 1597, 1601, 1599, 5705, 5660, 5703], 4942)
-    femmesh.addVolume([923, 495, 454, 447, 5700, 2284, 5821, 4303, 2282, 2145], 4943)
-    femmesh.addVolume([387, 338, 822, 339, 1937, 5177, 5612, 1938, 1788, 4984], 4944)
-    femmesh.addVolume([621, 320, 194, 684, 4237, 1728, 4115, 2963, 5060, 4113], 4945)
-    femmesh.addVolume([923, 909, 454, 915, 3719, 4921, 5821, 3720, 3692, 5822], 4946)
-    femmesh.addVolume([565, 618, 517, 119, 2748, 2749, 2608, 5349, 5163, 4867], 4947)
-    femmesh.addVolume([770, 338, 278, 339, 5178, 1784, 5767, 5786, 1788, 1786], 4948)
-    femmesh.addVolume([266, 354, 327, 778, 1828, 1829, 1751, 5137, 5139, 5674], 4949)
-    femmesh.addVolume([694, 293, 744, 228, 3950, 3951, 3147, 4096, 1640, 4746], 4950)
-    femmesh.addVolume([411, 797, 908, 396, 4904, 3670, 5059, 2012, 5604, 5725], 4951)
-    femmesh.addVolume([629, 254, 693, 226, 4202, 5304, 2986, 4288, 1505, 4107], 4952)
-    femmesh.addVolume([546, 98, 545, 13, 2527, 2525, 2529, 4018, 4017, 5530], 4953)
-    return True
+    return load_mesh(femmesh, __name__, nodes=False)
@@ -0,0 +1,319 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+# ***************************************************************************
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "FreeCAD binary mesh reader and writer"
+__author__ = "Bernd Hahnebach"
+__url__ = "https://www.freecad.org"
+
+## @package importBinaryMesh
+#  \ingroup FEM
+#  \brief FreeCAD binary mesh reader and writer for FEM workbench
+#
+#  A binary mesh file holds the nodes, the elements of each element type and the
+#  groups of a FemMesh as raw arrays. The file is memory mapped and the arrays are
+#  passed to FemMesh.addNodes() and FemMesh.addElements() without any conversion.
+#
+#  Layout of the file, all numbers are little endian:
+#  - 8 bytes magic b"FCFEMBIN"
+#  - 4 bytes format version, 4 bytes size of the header
+#  - header, JSON: {"arrays": {name: [dtype, shape, offset]}, "groups": [[name, type, array]]}
+#  - the arrays, each one starts at a multiple of 8 bytes
+#
+#  Arrays:
+#  - "Nodes": coordinates of the nodes, float64 (n, 3), "NodeIds": node IDs, int32 (n,)
+#  - "<type>": nodes of the elements, int32 (m, nodes per element), "<type>Ids": element
+#    IDs, int32 (m,), for each element type of FemMesh.addElements()
+#  - "Group<i>": IDs of the elements of group i, int32 (k,)
+
+import json
+import mmap
+import os
+import struct
+
+import numpy as np
+
+import FreeCAD
+from FreeCAD import Console
+
+from . import importToolsFem
+from builtins import open as pyopen
+
+
+MAGIC = b"FCFEMBIN"
+VERSION = 1
+# size of magic, version and header size
+PREAMBLE_SIZE = 16
+
+
+# ****************************************************************************
+# ********* generic FreeCAD import and export methods ************************
+# names are fix given from FreeCAD, these methods are called from FreeCAD
+# they are set in FEM modules Init.py
+
+
+def open(filename):
+    """called when freecad opens a file
+    a FEM mesh object is created in a new document"""
+
+    docname = os.path.splitext(os.path.basename(filename))[0]
+    return insert(filename, docname)
+
+
+def insert(filename, docname):
+    """called when freecad wants to import a file
+    a FEM mesh object is created in a existing document"""
+
+    try:
+        doc = FreeCAD.getDocument(docname)
+    except NameError:
+        doc = FreeCAD.newDocument(docname)
+    FreeCAD.ActiveDocument = doc
+
+    mesh_name = os.path.splitext(os.path.basename(filename))[0]
+    mesh_object = doc.addObject("Fem::FemMeshObject", mesh_name)
+    mesh_object.FemMesh = read(filename)
+    return doc
+
+
+def export(objectslist, filename):
+    "called when freecad exports a file"
+    if len(objectslist) != 1:
+        Console.PrintError("This exporter can only export one object.\n")
+        return
+    obj = objectslist[0]
+    if not obj.isDerivedFrom("Fem::FemMeshObject"):
+        Console.PrintError("No FEM mesh object selected.\n")
+        return
+
+    write(obj.FemMesh, filename)
+
+
+# ****************************************************************************
+# ********* module specific methods ******************************************
+# reader:
+# - a method reads a binary mesh file into a new FemMesh
+# - a method loads the nodes and/or the elements of a binary mesh file into
+#     an existing FemMesh
+#
+# writer:
+# - a method writes a FemMesh to a binary mesh file
+# - a method writes FEM mesh data of importToolsFem to a binary mesh file
+# - a method converts a Python mesh module of importPyMesh to a binary mesh file
+
+
+# ********* reader ***********************************************************
+class MeshFile:
+    """A memory mapped binary mesh file.
+
+    The arrays returned by array() use the memory of the file, they have to be
+    released before the file is closed.
+    """
+
+    def __init__(self, filename):
+        self._file = pyopen(filename, "rb")
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if self._data[: len(MAGIC)] != MAGIC:
+                raise ValueError(f"Not a binary FEM mesh file: {filename}")
+            version, header_size = struct.unpack_from("<II", self._data, len(MAGIC))
+            if version > VERSION:
+                raise ValueError(f"Unsupported binary FEM mesh file version {version}")
+            header = self._data[PREAMBLE_SIZE : PREAMBLE_SIZE + header_size]
+        except Exception:
+            self.close()
+            raise
+        self.header = json.loads(header)
+        self._start = PREAMBLE_SIZE + header_size
+
+    def close(self):
+        if getattr(self, "_data", None) is not None:
+            self._data.close()
+            self._data = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def has_array(self, name):
+        return name in self.header["arrays"]
+
+    def array(self, name):
+        """Returns the array name as read only numpy array."""
+        dtype, shape, offset = self.header["arrays"][name]
+        dtype = np.dtype(dtype)
+        count = int(np.prod(shape))
+        array = np.frombuffer(self._data, dtype, count, self._start + offset).reshape(shape)
+        # no copy on little endian machines
+        return array.astype(dtype.newbyteorder("="), copy=False)
+
+
+def read(filename):
+    """read a FemMesh from a binary mesh file and return the FemMesh"""
+    # no document object is created, just the FemMesh is returned
+    import Fem
+
+    femmesh = Fem.FemMesh()
+    load(femmesh, filename)
+    return femmesh
+
+
+def load(femmesh, filename, nodes=True, elements=True):
+    """load the nodes and/or the elements and groups of a binary mesh file into femmesh
+
+    The elements can only be loaded if femmesh has their nodes. Returns True, as
+    the create_nodes() and create_elements() methods of the Python mesh modules do.
+    """
+    with MeshFile(filename) as mesh_file:
+        if nodes:
+            femmesh.addNodes(mesh_file.array("Nodes"), mesh_file.array("NodeIds"))
+        if elements:
+            for key, elem_type in importToolsFem.FEMMESH_ELEMENT_TYPES:
+                if mesh_file.has_array(elem_type):
+                    femmesh.addElements(
+                        elem_type, mesh_file.array(elem_type), mesh_file.array(elem_type + "Ids")
+                    )
+            for name, group_type, array_name in mesh_file.header["groups"]:
+                group_id = femmesh.addGroup(name, group_type)
+                femmesh.addGroupElements(group_id, mesh_file.array(array_name).tolist())
+    return True
+
+
+# ********* writer ***********************************************************
+def _aligned(size):
+    return (size + 7) // 8 * 8
+
+
+def write(fem_mesh, filename):
+    """directly write a FemMesh to a binary mesh file
+    fem_mesh: a FemMesh"""
+
+    mesh_data = importToolsFem.make_dict_from_femmesh(fem_mesh)
+    groups = [
+        (
+            fem_mesh.getGroupName(group_id),
+            fem_mesh.getGroupElementType(group_id),
+            fem_mesh.getGroupElements(group_id),
+        )
+        for group_id in fem_mesh.Groups
+    ]
+    write_mesh_data(mesh_data, filename, groups)
+
+
+def write_mesh_data(mesh_data, filename, groups=()):
+    """write FEM mesh data in the format of importToolsFem.make_femmesh() to a binary mesh file
+
+    groups: list of (name, element type, element IDs) tuples
+    """
+    arrays = {}
+    nodes = mesh_data["Nodes"]
+    arrays["Nodes"] = np.array(list(nodes.values()), dtype="<f8").reshape(-1, 3)
+    arrays["NodeIds"] = np.fromiter(nodes.keys(), dtype="<i4", count=len(nodes))
+    for key, elem_type in importToolsFem.FEMMESH_ELEMENT_TYPES:
+        elms = mesh_data.get(key)
+        if elms:
+            arrays[elem_type] = np.array(list(elms.values()), dtype="<i4")
+            arrays[elem_type + "Ids"] = np.fromiter(elms.keys(), dtype="<i4", count=len(elms))
+
+    header = {"groups": []}
+    for i, (name, group_type, elements) in enumerate(groups):
+        array_name = f"Group{i}"
+        arrays[array_name] = np.array(elements, dtype="<i4").reshape(-1)
+        header["groups"].append([name, group_type, array_name])
+    write_arrays(arrays, filename, header)
+
+
+def write_arrays(arrays, filename, header=None):
+    """write the arrays of the dictionary name --> numpy array to a binary file
+
+    The file has the layout of a binary mesh file and can be read by MeshFile.
+    header: dictionary of further JSON data of the header, it must not use the key "arrays"
+    """
+    header = dict(header or {})
+    header["arrays"] = {}
+    offset = 0
+    for name, array in arrays.items():
+        header["arrays"][name] = [array.dtype.str, list(array.shape), offset]
+        offset += _aligned(array.nbytes)
+
+    # pad the header with blanks, thus the first array starts at a multiple of 8 bytes
+    data = json.dumps(header).encode()
+    header_size = _aligned(PREAMBLE_SIZE + len(data)) - PREAMBLE_SIZE
+    with pyopen(filename, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<II", VERSION, header_size))
+        f.write(data.ljust(header_size))
+        for array in arrays.values():
+            f.write(array.tobytes())
+            f.write(bytes(_aligned(array.nbytes) - array.nbytes))
+
+
+class _MeshRecorder:
+    """Records the nodes and elements a Python mesh module adds to a FemMesh."""
+
+    def __init__(self):
+        from .importPyMesh import ELEMENT_TYPES
+
+        self.element_types = ELEMENT_TYPES
+        self.mesh_data = {"Nodes": {}}
+
+    def _add_element(self, mesh_type, nodes, elem_id):
+        key = self.element_types[mesh_type][len(nodes)] + "Elem"
+        self.mesh_data.setdefault(key, {})[elem_id] = tuple(nodes)
+
+    def addNode(self, x, y, z, node_id):
+        self.mesh_data["Nodes"][node_id] = (x, y, z)
+
+    def addEdge(self, nodes, elem_id):
+        self._add_element("Edge", nodes, elem_id)
+
+    def addFace(self, nodes, elem_id):
+        self._add_element("Face", nodes, elem_id)
+
+    def addVolume(self, nodes, elem_id):
+        self._add_element("Solid", nodes, elem_id)
+
+    def addNodes(self, coordinates, ids):
+        self.mesh_data["Nodes"].update(zip(ids, map(tuple, coordinates)))
+
+    def addElements(self, elem_type, nodes, ids):
+        self.mesh_data.setdefault(elem_type + "Elem", {}).update(zip(ids, map(tuple, nodes)))
+
+
+def convert_python_mesh(py_file, mesh_file):
+    """convert a Python mesh module, as written by importPyMesh, to a binary mesh file
+
+    The module is executed, the nodes and elements it adds are written to mesh_file.
+    The element IDs of the module have to be given.
+    """
+    with pyopen(py_file) as f:
+        code = compile(f.read(), py_file, "exec")
+    module = {}
+    exec(code, module)
+    recorder = _MeshRecorder()
+    module["create_nodes"](recorder)
+    module["create_elements"](recorder)
+    write_mesh_data(recorder.mesh_data, mesh_file)
@@ -98,41 +98,56 @@ def write(fem_mesh, filename):
     f.close()
 
 
+# mesh type --> number of nodes --> element type of FemMesh.addElements()
+ELEMENT_TYPES = {
+    "Solid": {
+        4: "Tetra4",
+        5: "Pyra5",
+        6: "Penta6",
+        8: "Hexa8",
+        10: "Tetra10",
+        13: "Pyra13",
+        15: "Penta15",
+        20: "Hexa20",
+    },
+    "Face": {3: "Tria3", 4: "Quad4", 6: "Tria6", 8: "Quad8"},
+    "Edge": {2: "Seg2", 3: "Seg3"},
+}
+
+
 def write_python_mesh_to_file(femnodes_mesh, femelement_table, fem_mesh_type, f):
+    # the nodes and the elements of each type are added with one call
 
     mesh_name = "femmesh"
 
     # nodes
     f.write("def create_nodes(femmesh):\n")
     f.write("    # nodes\n")
+    f.write("    nodes = {\n")
     for node in femnodes_mesh:
-        # print(node, ' --> ', femnodes_mesh[node])
         vec = femnodes_mesh[node]
-        f.write(f"    {mesh_name}.addNode({vec.x}, {vec.y}, {vec.z}, {node})\n")
+        f.write(f"        {node}: ({vec.x}, {vec.y}, {vec.z}),\n")
+    f.write("    }\n")
+    f.write(f"    {mesh_name}.addNodes(list(nodes.values()), list(nodes.keys()))\n")
     f.write("    return True\n")
     f.write("\n\n")
 
-    # elements
+    # elements, grouped by element type
+    elements = {}
+    for element in femelement_table:
+        nodes = femelement_table[element]
+        elem_type = ELEMENT_TYPES[fem_mesh_type][len(nodes)]
+        elements.setdefault(elem_type, []).append((element, nodes))
     f.write("def create_elements(femmesh):\n")
     f.write("    # elements\n")
-    for element in femelement_table:
-        # print(element, ' --> ', femelement_table[element])
-        if fem_mesh_type == "Solid":
-            f.write(
-                "    {}.addVolume({}, {})\n".format(
-                    mesh_name, list(femelement_table[element]), element
-                )
-            )
-        elif fem_mesh_type == "Face":
-            f.write(
-                "    {}.addFace({}, {})\n".format(
-                    mesh_name, list(femelement_table[element]), element
-                )
-            )
-        elif fem_mesh_type == "Edge":
-            f.write(
-                "    {}.addEdge({}, {})\n".format(
-                    mesh_name, list(femelement_table[element]), element
-                )
+    for elem_type, elems in elements.items():
+        f.write("    elements = {\n")
+        for element, nodes in elems:
+            f.write(f"        {element}: {tuple(nodes)},\n")
+        f.write("    }\n")
+        f.write(
+            '    {}.addElements("{}", list(elements.values()), list(elements.keys()))\n'.format(
+                mesh_name, elem_type
             )
+        )
     f.write("    return True\n")
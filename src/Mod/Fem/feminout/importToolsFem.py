@@ -131,145 +131,66 @@ def get_MaxDimElementFromList(elem_list):
     return elem_list[-1]
 
 
+# mesh data key --> element type of FemMesh.addElements(), in the order the elements are added
+FEMMESH_ELEMENT_TYPES = (
+    ("Hexa8Elem", "Hexa8"),
+    ("Penta6Elem", "Penta6"),
+    ("Tetra4Elem", "Tetra4"),
+    ("Tetra10Elem", "Tetra10"),
+    ("Penta15Elem", "Penta15"),
+    ("Hexa20Elem", "Hexa20"),
+    ("Tria3Elem", "Tria3"),
+    ("Tria6Elem", "Tria6"),
+    ("Quad4Elem", "Quad4"),
+    ("Quad8Elem", "Quad8"),
+    ("Seg2Elem", "Seg2"),
+    ("Seg3Elem", "Seg3"),
+)
+
+
 def make_femmesh(mesh_data):
-    """makes an FreeCAD FEM Mesh object from FEM Mesh data"""
+    """makes an FreeCAD FEM Mesh object from FEM Mesh data
+
+    The nodes and the elements of each type are added in bulk, with one call of
+    FemMesh.addNodes() and one call of FemMesh.addElements() per element type.
+    """
     import Fem
 
     mesh = Fem.FemMesh()
     m = mesh_data
     if ("Nodes" in m) and (len(m["Nodes"]) > 0):
         FreeCAD.Console.PrintLog("Found: nodes\n")
-        if (
-            ("Seg2Elem" in m)
-            or ("Seg3Elem" in m)
-            or ("Tria3Elem" in m)
-            or ("Tria6Elem" in m)
-            or ("Quad4Elem" in m)
-            or ("Quad8Elem" in m)
-            or ("Tetra4Elem" in m)
-            or ("Tetra10Elem" in m)
-            or ("Penta6Elem" in m)
-            or ("Penta15Elem" in m)
-            or ("Hexa8Elem" in m)
-            or ("Hexa20Elem" in m)
-        ):
+        if any(key in m for key, elem_type in FEMMESH_ELEMENT_TYPES):
 
             nds = m["Nodes"]
             FreeCAD.Console.PrintLog("Found: elements\n")
-            for i in nds:
-                n = nds[i]
-                mesh.addNode(n[0], n[1], n[2], i)
-            elms_hexa8 = m["Hexa8Elem"]
-            for i in elms_hexa8:
-                e = elms_hexa8[i]
-                mesh.addVolume([e[0], e[1], e[2], e[3], e[4], e[5], e[6], e[7]], i)
-            elms_penta6 = m["Penta6Elem"]
-            for i in elms_penta6:
-                e = elms_penta6[i]
-                mesh.addVolume([e[0], e[1], e[2], e[3], e[4], e[5]], i)
-            elms_tetra4 = m["Tetra4Elem"]
-            for i in elms_tetra4:
-                e = elms_tetra4[i]
-                mesh.addVolume([e[0], e[1], e[2], e[3]], i)
-            elms_tetra10 = m["Tetra10Elem"]
-            for i in elms_tetra10:
-                e = elms_tetra10[i]
-                mesh.addVolume([e[0], e[1], e[2], e[3], e[4], e[5], e[6], e[7], e[8], e[9]], i)
-            elms_penta15 = m["Penta15Elem"]
-            for i in elms_penta15:
-                e = elms_penta15[i]
-                mesh.addVolume(
-                    [
-                        e[0],
-                        e[1],
-                        e[2],
-                        e[3],
-                        e[4],
-                        e[5],
-                        e[6],
-                        e[7],
-                        e[8],
-                        e[9],
-                        e[10],
-                        e[11],
-                        e[12],
-                        e[13],
-                        e[14],
-                    ],
-                    i,
-                )
-            elms_hexa20 = m["Hexa20Elem"]
-            for i in elms_hexa20:
-                e = elms_hexa20[i]
-                mesh.addVolume(
-                    [
-                        e[0],
-                        e[1],
-                        e[2],
-                        e[3],
-                        e[4],
-                        e[5],
-                        e[6],
-                        e[7],
-                        e[8],
-                        e[9],
-                        e[10],
-                        e[11],
-                        e[12],
-                        e[13],
-                        e[14],
-                        e[15],
-                        e[16],
-                        e[17],
-                        e[18],
-                        e[19],
-                    ],
-                    i,
-                )
-            elms_tria3 = m["Tria3Elem"]
-            for i in elms_tria3:
-                e = elms_tria3[i]
-                mesh.addFace([e[0], e[1], e[2]], i)
-            elms_tria6 = m["Tria6Elem"]
-            for i in elms_tria6:
-                e = elms_tria6[i]
-                mesh.addFace([e[0], e[1], e[2], e[3], e[4], e[5]], i)
-            elms_quad4 = m["Quad4Elem"]
-            for i in elms_quad4:
-                e = elms_quad4[i]
-                mesh.addFace([e[0], e[1], e[2], e[3]], i)
-            elms_quad8 = m["Quad8Elem"]
-            for i in elms_quad8:
-                e = elms_quad8[i]
-                mesh.addFace([e[0], e[1], e[2], e[3], e[4], e[5], e[6], e[7]], i)
-            elms_seg2 = m["Seg2Elem"]
-            for i in elms_seg2:
-                e = elms_seg2[i]
-                mesh.addEdge([e[0], e[1]], i)
-            elms_seg3 = m["Seg3Elem"]
-            for i in elms_seg3:
-                e = elms_seg3[i]
-                mesh.addEdge([e[0], e[1], e[2]], i)
+            mesh.addNodes(list(nds.values()), list(nds.keys()))
+            count = {}
+            for key, elem_type in FEMMESH_ELEMENT_TYPES:
+                elms = m.get(key, {})
+                count[elem_type] = len(elms)
+                if elms:
+                    mesh.addElements(elem_type, list(elms.values()), list(elms.keys()))
             Console.PrintLog(
                 "imported mesh: {} nodes, {} HEXA8, {} PENTA6, {} TETRA4, {} TETRA10, {} PENTA15\n".format(
                     len(nds),
-                    len(elms_hexa8),
-                    len(elms_penta6),
-                    len(elms_tetra4),
-                    len(elms_tetra10),
-                    len(elms_penta15),
+                    count["Hexa8"],
+                    count["Penta6"],
+                    count["Tetra4"],
+                    count["Tetra10"],
+                    count["Penta15"],
                 )
             )
             Console.PrintLog(
                 "imported mesh: {} "
                 "HEXA20, {} TRIA3, {} TRIA6, {} QUAD4, {} QUAD8, {} SEG2, {} SEG3\n".format(
-                    len(elms_hexa20),
-                    len(elms_tria3),
-                    len(elms_tria6),
-                    len(elms_quad4),
-                    len(elms_quad8),
-                    len(elms_seg2),
-                    len(elms_seg3),
+                    count["Hexa20"],
+                    count["Tria3"],
+                    count["Tria6"],
+                    count["Quad4"],
+                    count["Quad8"],
+                    count["Seg2"],
+                    count["Seg3"],
                 )
             )
         else:
@@ -353,6 +274,13 @@ def make_dict_from_femmesh(femmesh):
     return mesh_data
 
 
+def get_columns(values, count):
+    """returns the columns of a list of tuples as lists"""
+    if not values:
+        return [[] for i in range(count)]
+    return [list(column) for column in zip(*values)]
+
+
 def fill_femresult_mechanical(res_obj, result_set):
     """fills a FreeCAD FEM mechanical result object with result data"""
     if "number" in result_set:
@@ -379,20 +307,8 @@ def fill_femresult_mechanical(res_obj, result_set):
         # is the same as the number in NodeNumbers?
         if "stress" in result_set:
             stress = result_set["stress"]
-            Sxx = []
-            Syy = []
-            Szz = []
-            Sxy = []
-            Sxz = []
-            Syz = []
             # values_S .. stress_tensor .. (Sxx, Syy, Szz, Sxy, Sxz, Syz)
-            for i, values_S in enumerate(stress.values()):
-                Sxx.append(values_S[0])
-                Syy.append(values_S[1])
-                Szz.append(values_S[2])
-                Sxy.append(values_S[3])
-                Sxz.append(values_S[4])
-                Syz.append(values_S[5])
+            Sxx, Syy, Szz, Sxy, Sxz, Syz = get_columns(stress.values(), 6)
             res_obj.NodeStressXX = Sxx
             res_obj.NodeStressYY = Syy
             res_obj.NodeStressZZ = Szz
@@ -403,20 +319,8 @@ def fill_femresult_mechanical(res_obj, result_set):
         # fill res_obj.NodeStrainXX etc if they exist in result_set
         if "strain" in result_set:
             strain = result_set["strain"]
-            Exx = []
-            Eyy = []
-            Ezz = []
-            Exy = []
-            Exz = []
-            Eyz = []
             # values_E .. straintuple .. (Exx, Eyy, Ezz, Exy, Exz, Eyz)
-            for i, values_E in enumerate(strain.values()):
-                Exx.append(values_E[0])
-                Eyy.append(values_E[1])
-                Ezz.append(values_E[2])
-                Exy.append(values_E[3])
-                Exz.append(values_E[4])
-                Eyz.append(values_E[5])
+            Exx, Eyy, Ezz, Exy, Exz, Eyz = get_columns(strain.values(), 6)
             res_obj.NodeStrainXX = Exx
             res_obj.NodeStrainYY = Eyy
             res_obj.NodeStrainZZ = Ezz
@@ -72,6 +72,9 @@ def export(objectslist, filename):
         Console.PrintError("Use export to FEM mesh formats to export a FEM mesh object to vtk!\n")
         return
     elif obj.isDerivedFrom("Fem::FemResultObject"):
+        from femresult import resulttools
+
+        resulttools.load_result_data(obj)
         Fem.writeResult(filename, obj)
     else:
         Console.PrintError("Selected object is not supported by export to VTK.\n")
@@ -99,6 +99,8 @@ def import_z88_disp(filename, analysis=None, result_name_prefix=None):
             res_obj = importToolsFem.fill_femresult_mechanical(res_obj, result_set)
             res_obj = resulttools.add_disp_apps(res_obj)  # fill DisplacementLengths
             res_obj = resulttools.fill_femresult_stats(res_obj)  # fill Stats
+            if resulttools.use_lazy_result_storage():
+                res_obj = resulttools.store_result_data(res_obj)
 
             if analysis:
                 analysis_object.addObject(res_obj)
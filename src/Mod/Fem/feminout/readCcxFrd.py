@@ -0,0 +1,512 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+# ***************************************************************************
+# *                                                                         *
+# *   This file is part of FreeCAD.                                         *
+# *                                                                         *
+# *   FreeCAD is free software: you can redistribute it and/or modify it    *
+# *   under the terms of the GNU Lesser General Public License as           *
+# *   published by the Free Software Foundation, either version 2.1 of the  *
+# *   License, or (at your option) any later version.                       *
+# *                                                                         *
+# *   FreeCAD is distributed in the hope that it will be useful, but        *
+# *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU      *
+# *   Lesser General Public License for more details.                       *
+# *                                                                         *
+# *   You should have received a copy of the GNU Lesser General Public      *
+# *   License along with FreeCAD. If not, see                               *
+# *   <https://www.gnu.org/licenses/>.                                      *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "FreeCAD CalculiX frd result reader"
+__author__ = "Juergen Riegel, Michael Hindley, Bernd Hahnebach"
+__url__ = "https://www.freecad.org"
+
+## @package readCcxFrd
+#  \ingroup FEM
+#  \brief reads CalculiX frd result files into NumPy arrays
+#
+#  The file is indexed once, only the positions of the blocks are stored.
+#  Nodes, elements and the results of a step are parsed on request, each
+#  block at once with NumPy.
+
+import math
+import mmap
+import os
+
+import numpy as np
+
+
+# element types of the frd file:
+# type: (key of the mesh data, number of nodes, FreeCAD node order)
+# the node order fits with the node order in writeAbaqus() in FemMesh.cpp
+#
+# CalculiX uses a different node order in input file *.inp and result file *.frd
+# for hexa20 (C3D20), penta15 (C3D15) and seg3 (B32), according to Guido (the
+# developer of ccx): see note in the first line of cgx manual part element types
+# ccx (and thus the *.inp) follows the ABAQUS convention documented in the
+# ccx-documentation, cgx (and thus the *.frd) follows the FAM2 convention
+# documented in the cgx-documentation
+ELEMENT_TYPES = {
+    # C3D8 CalculiX --> hexa8 FreeCAD
+    1: ("Hexa8Elem", 8, (5, 6, 7, 4, 1, 2, 3, 0)),
+    # C3D6 Calculix --> penta6 FreeCAD
+    2: ("Penta6Elem", 6, (4, 5, 3, 1, 2, 0)),
+    # C3D4 Calculix --> tetra4 FreeCAD
+    3: ("Tetra4Elem", 4, (1, 0, 2, 3)),
+    # C3D20 Calculix --> hexa20 FreeCAD, FAM2 node order of the frd file
+    4: (
+        "Hexa20Elem",
+        20,
+        (7, 4, 5, 6, 3, 0, 1, 2, 19, 16, 17, 18, 11, 8, 9, 10, 15, 12, 13, 14),
+    ),
+    # C3D15 Calculix --> penta15 FreeCAD, FAM2 node order of the frd file
+    5: ("Penta15Elem", 15, (4, 5, 3, 1, 2, 0, 13, 14, 12, 7, 8, 6, 10, 11, 9)),
+    # C3D10 Calculix --> tetra10 FreeCAD
+    6: ("Tetra10Elem", 10, (1, 0, 2, 3, 4, 6, 5, 8, 7, 9)),
+    # S3 Calculix --> tria3 FreeCAD
+    7: ("Tria3Elem", 3, (0, 1, 2)),
+    # S6 CalculiX --> tria6 FreeCAD
+    8: ("Tria6Elem", 6, (0, 1, 2, 3, 4, 5)),
+    # S4 CalculiX --> quad4 FreeCAD
+    9: ("Quad4Elem", 4, (0, 1, 2, 3)),
+    # S8 CalculiX --> quad8 FreeCAD
+    10: ("Quad8Elem", 8, (0, 1, 2, 3, 4, 5, 6, 7)),
+    # B31 CalculiX --> seg2 FreeCAD
+    11: ("Seg2Elem", 2, (0, 1)),
+    # B32 CalculiX --> seg3 FreeCAD, also D elements
+    12: ("Seg3Elem", 3, (0, 1, 2)),
+}
+
+# result blocks of the frd file, the name in the file starts with the prefix:
+# prefix: (key of the result set, columns of the result)
+# CalculiX frd files: (Sxx, Syy, Szz, Sxy, Syz, Szx)
+# FreeCAD:            (Sxx, Syy, Szz, Sxy, Sxz, Syz)
+# thus the last two columns of stress and strain are exchanged
+RESULT_TYPES = {
+    "DISP": ("disp", (0, 1, 2)),
+    "STRESS": ("stress", (0, 1, 2, 3, 5, 4)),
+    "TOSTRAIN": ("strain", (0, 1, 2, 3, 5, 4)),
+    "PE": ("peeq", 0),
+    "NDTEMP": ("temp", 0),
+    "FLUX": ("heatflux", (0, 1, 2)),
+    "MAFLOW": ("mflow", 0),
+    "STPRES": ("npressure", 0),
+}
+
+# width of the node or element number and of the values in a data line
+INT_WIDTH = 10
+FLOAT_WIDTH = 12
+# data lines start with " -1" followed by the node or element number
+DATA_START = 3 + INT_WIDTH
+
+
+# exact powers of ten, see parse_floats()
+_POW10 = np.array([float(10**k) for k in range(23)])
+
+
+def _digit(chars):
+    """Returns the value of digit characters, values greater 9 for all other characters."""
+    return chars - np.uint8(ord("0"))
+
+
+def parse_ints(chars):
+    """Converts right aligned integers to an array of integers.
+
+    chars ... array of characters (uint8), the last axis holds the characters of an integer
+    Blank fields are 0.
+    """
+    digits = _digit(chars)
+    is_digit = digits <= 9
+    # only leading blanks and no signs
+    if (is_digit | (chars == ord(" "))).all() and (np.diff(is_digit, axis=-1) >= 0).all():
+        weights = 10 ** np.arange(chars.shape[-1] - 1, -1, -1, dtype=np.int64)
+        return (np.where(is_digit, digits, 0) * weights).sum(axis=-1)
+    fields = np.ascontiguousarray(chars).view("S%d" % chars.shape[-1])[..., 0]
+    return np.where(fields == b"", b"0", fields).astype(np.int64)
+
+
+def parse_floats(chars):
+    """Converts floats written with the format %12.5E, as CalculiX does, to an array of floats.
+
+    chars ... array of characters (uint8), the last axis holds the 12 characters of a float
+
+    The mantissa is read as integer and multiplied or divided by an exact power of ten,
+    which rounds only once and thus gives the same result as float(). Fields in any
+    other format, for example NaN, are converted with float().
+    """
+    chars = np.asarray(chars)
+    sign = chars[..., 0]
+    valid = (
+        ((sign == ord(" ")) | (sign == ord("-")))
+        & (chars[..., 2] == ord("."))
+        & (chars[..., 8] == ord("E"))
+        & ((chars[..., 9] == ord("+")) | (chars[..., 9] == ord("-")))
+    )
+    for i in (1, 3, 4, 5, 6, 7, 10, 11):
+        valid &= _digit(chars[..., i]) <= 9
+
+    mantissa = _digit(chars[..., 1]).astype(np.int64)
+    for i in (3, 4, 5, 6, 7):
+        mantissa = mantissa * 10 + _digit(chars[..., i])
+    exponent = _digit(chars[..., 10]).astype(np.int64) * 10 + _digit(chars[..., 11])
+    exponent = np.where(chars[..., 9] == ord("-"), -exponent, exponent) - 5
+    valid &= np.abs(exponent) <= 22
+
+    power = _POW10[np.minimum(np.abs(exponent), 22)]
+    with np.errstate(invalid="ignore"):
+        values = np.where(exponent >= 0, mantissa * power, mantissa / power)
+    values = np.where(sign == ord("-"), -values, values)
+
+    if not valid.all():
+        fields = np.ascontiguousarray(chars[~valid]).view("S%d" % chars.shape[-1])[:, 0]
+        # depending on c runtime lib and possibly locale calculix may format NAN
+        # differently, for example -NAN(IND)
+        nan = np.char.find(np.char.upper(fields), b"NAN") >= 0
+        values[~valid] = np.where(nan, b"nan", fields).astype(np.float64)
+    return values
+
+
+class NodeResult:
+    """Values of one result of a step, one row for each node in the order of the frd file.
+
+    Can be used like the dictionary node number --> value the frd reader used to return,
+    vector results return their values as tuples.
+    """
+
+    def __init__(self, nodes, data):
+        self.nodes = nodes
+        self.data = data
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def __iter__(self):
+        return iter(self.nodes.tolist())
+
+    def keys(self):
+        return self.nodes.tolist()
+
+    def values(self):
+        if self.data.ndim == 1:
+            return self.data.tolist()
+        return list(map(tuple, self.data.tolist()))
+
+    def items(self):
+        return zip(self.keys(), self.values())
+
+
+class FrdStep:
+    """A step or eigenmode of a frd file.
+
+    number ... eigenmode number, NaN if it is not an eigenmode
+    time ... step time or frequency, NaN if it is not known
+    blocks ... result key --> (start, end) of the result blocks in the file
+    """
+
+    def __init__(self, frd_file, number=float("NaN"), time=float("NaN")):
+        self.frd_file = frd_file
+        self.number = number
+        self.time = time
+        self.blocks = {}
+
+    def read(self, key):
+        """Returns the NodeResult of the result key, for example "disp" or "stress"."""
+        return self.frd_file.read_result(*self.blocks[key])
+
+    def result_set(self):
+        """Returns the results of the step in the format of fill_femresult_mechanical()."""
+        result_set = {"number": self.number, "time": self.time}
+        for key in self.blocks:
+            result_set[key] = self.read(key)
+        return result_set
+
+
+class FrdFile:
+    """CalculiX frd result file.
+
+    filename ... path of the frd file
+    inout_nodes ... lines of the inout nodes file of 1D flow analysis, split at ","
+    use_mmap ... memory map the file instead of reading it into memory
+
+    Opening the file only indexes its blocks. The data of the mesh and of each step
+    are parsed when they are requested, thus a step can be loaded without reading the
+    results of all other steps.
+    """
+
+    def __init__(self, filename, inout_nodes=None, use_mmap=True):
+        self.filename = filename
+        self.inout_nodes = inout_nodes or []
+        self.node_blocks = []
+        self.element_blocks = []
+        self.steps = []
+        self._file = open(filename, "rb")
+        self._data = b""
+        try:
+            if use_mmap and os.path.getsize(filename) > 0:
+                self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self._data = self._file.read()
+            self._index()
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self):
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    # ********* index *********
+    def _index(self):
+        """Finds the blocks of the file and groups the result blocks into steps.
+
+        A new step starts with a higher eigenmode number or a higher step time, like
+        read_frd_result() of importCcxFrdResults always did. The last step is only
+        added if the end of the frd data is found.
+        """
+        data = self._data
+        size = len(data)
+        eigenmode = 0
+        timestep = 0
+        step = FrdStep(self)
+        pos = 0
+        while pos < size:
+            eol = data.find(b"\n", pos)
+            if eol == -1:
+                eol = size
+            line = data[pos:eol]
+            if line[4:6] in (b"2C", b"3C") or line[1:3] == b"-4":
+                # data block, skip it up to its end line " -3"
+                end = data.find(b"\n -3", pos)
+                end = size if end == -1 else end + 1
+                if line[4:6] == b"2C":
+                    self.node_blocks.append((eol + 1, end))
+                elif line[4:6] == b"3C":
+                    self.element_blocks.append((eol + 1, end))
+                else:
+                    name = line[5:13].decode("ascii", "replace").strip()
+                    for prefix, (key, columns) in RESULT_TYPES.items():
+                        if name.startswith(prefix):
+                            step.blocks[key] = (pos, end)
+                            break
+                eol = data.find(b"\n", end)
+                pos = size if eol == -1 else eol + 1
+                continue
+
+            new_step = None
+            if line[5:10] == b"PMODE":
+                eigentemp = int(line[30:36])
+                if eigentemp > eigenmode:
+                    eigenmode = eigentemp
+                    new_step = ("number", eigenmode)
+            elif line[2:7] == b"100CL":
+                timetemp = float(line[13:25])
+                if timetemp > timestep:
+                    timestep = timetemp
+                    new_step = ("time", timestep)
+            elif line[1:5] == b"9999":
+                # end of frd data
+                if step.blocks:
+                    self.steps.append(step)
+                break
+
+            if new_step:
+                if step.blocks:
+                    self.steps.append(step)
+                    step = FrdStep(self)
+                setattr(step, *new_step)
+            pos = eol + 1
+
+    # ********* parsing *********
+    def _lines(self, start, end):
+        """Returns the data lines between start and end as 2D array of bytes.
+
+        Returns None if the lines do not have the same length or if there are lines
+        that do not start with " -1", for example continuation lines.
+        """
+        if end <= start:
+            return np.zeros((0, DATA_START), dtype=np.uint8)
+        chars = np.frombuffer(self._data, dtype=np.uint8, count=end - start, offset=start)
+        newline = chars == ord("\n")
+        length = int(newline.argmax()) + 1
+        if not newline[length - 1] or len(chars) % length != 0:
+            return None
+        lines = chars.reshape(-1, length)
+        if (lines[:, -1] != 10).any():
+            return None
+        if (lines[:, 1] != ord("-")).any() or (lines[:, 2] != ord("1")).any():
+            return None
+        return lines
+
+    def _split_lines(self, start, end):
+        """Returns the lines between start and end, the slow way for irregular blocks."""
+        return bytes(self._data[start:end]).replace(b"\r", b"").split(b"\n")
+
+    def _data_start(self, start, end):
+        """Returns the position of the first data line of the block between start and end."""
+        if self._data[start : start + 3] == b" -1":
+            return start
+        first = self._data.find(b"\n -1", start, end)
+        return end if first == -1 else first + 1
+
+    def _read_values(self, start, end):
+        """Returns the numbers and the values of the data lines between start and end."""
+        lines = self._lines(start, end)
+        if lines is not None:
+            width = lines.shape[1] - 1
+            if width > DATA_START and lines[0, width - 1] == ord("\r"):
+                width -= 1
+            count = (width - DATA_START) // FLOAT_WIDTH
+            numbers = parse_ints(lines[:, 3:DATA_START])
+            fields = lines[:, DATA_START : DATA_START + count * FLOAT_WIDTH]
+            return numbers, parse_floats(fields.reshape(len(lines), count, FLOAT_WIDTH))
+
+        # records with continuation lines " -2" or lines of different length
+        numbers = []
+        records = []
+        for line in self._split_lines(start, end):
+            if line[1:3] == b"-1":
+                numbers.append(int(line[3:DATA_START]))
+                records.append([])
+                values = line[DATA_START:]
+            elif line[1:3] == b"-2" and records:
+                values = line[DATA_START:]
+            else:
+                continue
+            records[-1].extend(
+                values[i : i + FLOAT_WIDTH] for i in range(0, len(values), FLOAT_WIDTH)
+            )
+        count = min((len(r) for r in records), default=0)
+        fields = np.array([r[:count] for r in records], dtype="S%d" % FLOAT_WIDTH)
+        fields = fields.view(np.uint8).reshape(len(records), count, -1)
+        return np.array(numbers, dtype=np.int64), parse_floats(fields)
+
+    # ********* mesh *********
+    def read_nodes(self):
+        """Returns the node numbers and an array of the node coordinates."""
+        numbers = []
+        coordinates = []
+        for start, end in self.node_blocks:
+            n, values = self._read_values(start, end)
+            numbers.append(n)
+            coordinates.append(values[:, :3])
+        if not numbers:
+            return np.zeros(0, dtype=np.int64), np.zeros((0, 3))
+        return np.concatenate(numbers), np.concatenate(coordinates)
+
+    def _read_element_block(self, start, end):
+        """Returns element numbers, element types and node numbers of an element block.
+
+        The node numbers are an array with ten columns, the element with index i uses
+        the rows first[i] to first[i] + lines[i].
+        """
+        lines = [line for line in self._split_lines(start, end) if line[1:3] in (b"-1", b"-2")]
+        is_head = np.array([line[1:3] == b"-1" for line in lines], dtype=bool)
+        # index of the element of each node line
+        owner = np.cumsum(is_head)[~is_head] - 1
+
+        head = np.array([line[3:18].ljust(15) for line in lines if line[1:3] == b"-1"], "S15")
+        head = head.view(np.uint8).reshape(-1, 15)
+        numbers = parse_ints(head[:, :INT_WIDTH])
+        types = parse_ints(head[:, INT_WIDTH:])
+
+        width = INT_WIDTH * 10
+        nodes = [line[3 : 3 + width].ljust(width) for line in lines if line[1:3] == b"-2"]
+        fields = np.array(nodes, dtype="S%d" % width).view(np.uint8)
+        # missing node numbers at the end of a line are 0
+        return numbers, types, parse_ints(fields.reshape(-1, 10, INT_WIDTH)), owner
+
+    def read_elements(self):
+        """Returns the elements of the mesh.
+
+        Returns a dictionary key of the mesh data, for example "Tetra10Elem" -->
+        (element numbers, array of the node numbers in FreeCAD node order).
+        """
+        blocks = [self._read_element_block(start, end) for start, end in self.element_blocks]
+        elements = {}
+        for numbers, types, fields, owner in blocks:
+            # the node lines of an element follow each other
+            count = np.bincount(owner, minlength=len(numbers))
+            first = np.concatenate(([0], np.cumsum(count)[:-1]))
+            for elem_type, (key, node_count, order) in ELEMENT_TYPES.items():
+                selected = np.flatnonzero(types == elem_type)
+                if len(selected) == 0:
+                    continue
+                line_count = math.ceil(node_count / 10)
+                rows = first[selected, np.newaxis] + np.arange(line_count)
+                rows = np.minimum(rows, len(fields) - 1)
+                connectivity = fields[rows].reshape(len(selected), -1)[:, :node_count]
+                connectivity = connectivity[:, list(order)]
+                if key in elements:
+                    old_numbers, old_connectivity = elements[key]
+                    elements[key] = (
+                        np.concatenate((old_numbers, numbers[selected])),
+                        np.concatenate((old_connectivity, connectivity)),
+                    )
+                else:
+                    elements[key] = (numbers[selected], connectivity)
+        return elements
+
+    def mesh_data(self):
+        """Returns the mesh in the format of importToolsFem.make_femmesh()."""
+        mesh_data = {}
+        numbers, coordinates = self.read_nodes()
+        mesh_data["Nodes"] = dict(zip(numbers.tolist(), map(tuple, coordinates.tolist())))
+        for key, node_count, order in ELEMENT_TYPES.values():
+            mesh_data[key] = {}
+        for key, (numbers, connectivity) in self.read_elements().items():
+            if key == "Seg3Elem" and self.inout_nodes:
+                mesh_data[key] = self._inout_seg3(numbers, connectivity)
+            else:
+                mesh_data[key] = dict(zip(numbers.tolist(), map(tuple, connectivity.tolist())))
+        return mesh_data
+
+    def _inout_seg3(self, numbers, connectivity):
+        """Returns the seg3 elements with the fluid inlet and outlet node numbering."""
+        elements = {}
+        for elem, (nd1, nd2, nd3) in zip(numbers.tolist(), connectivity.tolist()):
+            for inout in self.inout_nodes:
+                if nd1 == int(inout[1]):
+                    # fluid inlet node numbering
+                    elements[elem] = (int(inout[2]), nd3, nd1)
+                elif nd3 == int(inout[1]):
+                    # fluid outlet node numbering
+                    elements[elem] = (nd1, int(inout[2]), nd3)
+        return elements
+
+    # ********* results *********
+    def read_result(self, start, end):
+        """Returns the NodeResult of the result block between start and end."""
+        data_start = self._data_start(start, end)
+        name = bytes(self._data[start + 5 : start + 13]).decode("ascii", "replace").strip()
+        for prefix, (key, columns) in RESULT_TYPES.items():
+            if name.startswith(prefix):
+                break
+        else:
+            raise ValueError(f"Unknown result {name} in frd file.")
+
+        numbers, values = self._read_values(data_start, end)
+        values = values[:, columns]
+        if key == "mflow":
+            # convert units to kg/s from t/s
+            values = values * 1000
+        if key in ("mflow", "npressure") and self.inout_nodes:
+            # the values of the inlet and outlet nodes are copied to the inout nodes
+            result = {}
+            for elem, value in zip(numbers.tolist(), values.tolist()):
+                result[elem] = value
+                for inout in self.inout_nodes:
+                    if elem == int(inout[1]):
+                        result[int(inout[2])] = value
+            numbers = np.array(list(result), dtype=np.int64)
+            values = np.array(list(result.values()), dtype=np.float64)
+        return NodeResult(numbers, np.ascontiguousarray(values))
@@ -168,6 +168,9 @@ def femmesh_2_mesh(myFemMesh, myResults=None, myDispScale=1):
 
     output_mesh = []
     if myResults:
+        from femresult import resulttools
+
+        resulttools.load_result_data(myResults)
         FreeCAD.Console.PrintMessage(f"{myResults.Name}\n")
         for myFace in singleFaces:
             face_nodes = faceCodeDict[myFace]
@@ -33,8 +33,14 @@ import time
 import FreeCAD
 
 from femmesh import meshtools
+from femtools import femutils
 from femtools.femutils import type_of_obj
 
+# constraint sets of the last mesh, reused by the next MeshSetsGetter of an unchanged mesh
+# the sets contain document objects, thus they are only valid for the same document
+# {"document": document, "femmesh": fingerprint, "sets": {job fingerprint: (sets, force)}}
+_sets_cache = {"document": None, "femmesh": None, "sets": {}}
+
 
 class MeshSetsGetter:
     def __init__(
@@ -100,6 +106,7 @@ class MeshSetsGetter:
         self.femelement_edges_table = {}
         self.femelement_count_test = True
         self.mat_geo_sets = []
+        self.femmesh_fingerprint = None
 
         self._load_tables()
 
@@ -109,10 +116,16 @@ class MeshSetsGetter:
                 self.femnodes_mesh = self.femmesh.Nodes
             if not self.femelement_table:
                 self.femelement_table = meshtools.get_femelement_table(self.femmesh)
+            # the node to element index is built only once per mesh,
+            # all bit pattern searches of the constraint sets use it
             if not self.femnodes_ele_table:
                 self.femnodes_ele_table = meshtools.get_femnodes_ele_table(
                     self.femnodes_mesh, self.femelement_table
                 )
+            if not self.femmesh_fingerprint:
+                self.femmesh_fingerprint = meshtools.get_femmesh_fingerprint(
+                    self.femmesh, self.femnodes_mesh, self.femnodes_ele_table
+                )
 
     # ********************************************************************************************
     # ********************************************************************************************
@@ -141,50 +154,136 @@ class MeshSetsGetter:
         # materials and element geometry element sets getter
         self.get_element_sets_material_and_femelement_geometry()
 
-        # constraints element sets getter
-        self.get_constraints_centrif_elements()
-        self.get_constraints_bodyheatsource_elements()
-
-        # constraints node sets getter
-        self.get_constraints_fixed_nodes()
-        self.get_constraints_displacement_nodes()
-        self.get_constraints_rigidbody_nodes()
-        self.get_constraints_planerotation_nodes()
-
-        # constraints surface sets getter
-        self.get_constraints_contact_faces()
-        self.get_constraints_tie_faces()
-        self.get_constraints_sectionprint_faces()
-        self.get_constraints_transform_nodes()
-        self.get_constraints_temperature_nodes()
-        self.get_constraints_initialtemperature_nodes()
-        self.get_constraints_electrostatic_nodes()
-        self.get_constraints_electricchargedensity_nodes()
-
-        # constraints sets with constraint data
-        self.get_constraints_force_nodeloads()
-        self.get_constraints_pressure_faces()
-        self.get_constraints_heatflux_faces()
-        self.get_constraints_electrostatic_faces()
-        self.get_constraints_electricchargedensity_faces()
+        # constraints element sets, node sets, surface sets and sets with constraint data
+        self._load_force_tables()
+        self.run_constraint_set_jobs(self.get_constraint_set_jobs())
+
+        # constraints node sets which depend on the node sets of other constraints
+        self._add_constraint_conflict_nodes()
+        self._split_constraints_fixed_solid_nodes()
 
         setstime = round((time.process_time() - time_start), 3)
         FreeCAD.Console.PrintMessage(f"Getting mesh data time: {setstime} seconds.\n")
 
+    def get_constraint_set_jobs(self):
+        """list of (femobj, getter) pairs, getter(femobj) retrieves the sets of the constraint"""
+        m = self.member
+        jobs = []
+        jobs += [(femobj, self._get_centrif_elements) for femobj in m.cons_centrif]
+        jobs += [(femobj, self._get_bodyheatsource_elements) for femobj in m.cons_bodyheatsource]
+        for femobjs in (
+            m.cons_fixed,
+            m.cons_displacement,
+            m.cons_rigidbody,
+            m.cons_planerotation,
+        ):
+            jobs += [(femobj, self._get_nodes) for femobj in femobjs]
+        jobs += [(femobj, self._get_contact_faces) for femobj in m.cons_contact]
+        jobs += [(femobj, self._get_tie_faces) for femobj in m.cons_tie]
+        jobs += [(femobj, self._get_sectionprint_faces) for femobj in m.cons_sectionprint]
+        for femobjs in (
+            m.cons_transform,
+            m.cons_temperature,
+            m.cons_initialtemperature,
+        ):
+            jobs += [(femobj, self._get_nodes) for femobj in femobjs]
+        jobs += [(femobj, self._get_electrostatic_nodes) for femobj in m.cons_electrostatic]
+        jobs += [
+            (femobj, self._get_electricchargedensity_nodes)
+            for femobj in m.cons_electricchargedensity
+        ]
+        jobs += [(femobj, self._get_force_nodeloads) for femobj in m.cons_force]
+        jobs += [(femobj, self._get_pressure_faces) for femobj in m.cons_pressure]
+        jobs += [(femobj, self._get_heatflux_faces) for femobj in m.cons_heatflux]
+        jobs += [(femobj, self._get_electrostatic_faces) for femobj in m.cons_electrostatic]
+        jobs += [
+            (femobj, self._get_electricchargedensity_faces)
+            for femobj in m.cons_electricchargedensity
+        ]
+        return jobs
+
+    def run_constraint_set_jobs(self, jobs):
+        """run the jobs of get_constraint_set_jobs() and print the time of every job"""
+        if (
+            _sets_cache["document"] is not self.document
+            or _sets_cache["femmesh"] != self.femmesh_fingerprint
+        ):
+            _sets_cache["document"] = self.document
+            _sets_cache["femmesh"] = self.femmesh_fingerprint
+            _sets_cache["sets"] = {}
+        times = [self._run_job(*job) for job in jobs]
+        if jobs:
+            FreeCAD.Console.PrintMessage("Getting mesh data time per constraint:\n")
+        for (femobj, getter), (jobtime, cached) in zip(jobs, times):
+            FreeCAD.Console.PrintMessage(
+                "    {} ({}): {} seconds{}.\n".format(
+                    femobj["Object"].Label,
+                    getter.__name__.lstrip("_"),
+                    round(jobtime, 3),
+                    ", reused" if cached else "",
+                )
+            )
+
+    def _get_job_fingerprint(self, femobj, getter):
+        obj = femobj["Object"]
+        # besides the references the sets only depend on these properties
+        # the force is not one of them, cached node loads are scaled to the force
+        props = [getattr(obj, prop, None) for prop in ("BoundaryCondition", "Concentrated", "Mode")]
+        return femutils.get_fingerprint(
+            self.femmesh_fingerprint,
+            getter.__name__,
+            getattr(self.solver_obj, "ModelSpace", None),
+            femobj.get("RefShapeType"),
+            obj.References,
+            props,
+        )
+
+    def _run_job(self, femobj, getter):
+        """run getter(femobj) or take its sets from the cache of an unchanged mesh
+        returns the time of the job and if the sets were taken from the cache
+        """
+        time_start = time.perf_counter()
+        if self.femmesh_fingerprint is None:
+            getter(femobj)
+            return time.perf_counter() - time_start, False
+        force = getattr(femobj["Object"], "Force", None)
+        force = force.Value if force is not None else None
+        fingerprint = self._get_job_fingerprint(femobj, getter)
+        sets, cached_force = _sets_cache["sets"].get(fingerprint, (None, None))
+        if sets is not None and not (cached_force == 0 and force):
+            femobj.update(sets)
+            if "NodeLoadTable" in sets and force != cached_force:
+                femobj["NodeLoadTable"] = _scale_node_load_table(
+                    sets["NodeLoadTable"], force / cached_force if cached_force else 0
+                )
+            return time.perf_counter() - time_start, True
+        keys = set(femobj)
+        getter(femobj)
+        sets = {key: value for key, value in femobj.items() if key not in keys}
+        _sets_cache["sets"][fingerprint] = (sets, force)
+        return time.perf_counter() - time_start, False
+
     # ********************************************************************************************
     # ********************************************************************************************
     # node sets
-    def get_constraints_fixed_nodes(self):
+    def _get_nodes(self, femobj):
+        # femobj --> dict, FreeCAD document object is femobj["Object"]
+        print_obj_info(femobj["Object"])
+        femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
+
+    def _add_constraint_conflict_nodes(self):
+        # add nodes to constraint_conflict_nodes, needed by constraint plane rotation
+        for femobjs in (
+            self.member.cons_fixed,
+            self.member.cons_displacement,
+            self.member.cons_rigidbody,
+        ):
+            for femobj in femobjs:
+                self.constraint_conflict_nodes += femobj["Nodes"]
+
+    def _split_constraints_fixed_solid_nodes(self):
         if not self.member.cons_fixed:
             return
-        # get nodes
-        for femobj in self.member.cons_fixed:
-            # femobj --> dict, FreeCAD document object is femobj["Object"]
-            print_obj_info(femobj["Object"])
-            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
-            # add nodes to constraint_conflict_nodes, needed by constraint plane rotation
-            for node in femobj["Nodes"]:
-                self.constraint_conflict_nodes.append(node)
         # if mixed mesh with solids the node set needs to be split
         # because solid nodes do not have rotational degree of freedom
         if self.femmesh.Volumes and (
@@ -209,14 +308,23 @@ class MeshSetsGetter:
                 femobj["NodesSolid"] = set(nds_solid)
                 femobj["NodesFaceEdge"] = set(nds_faceedge)
 
+    def get_constraints_fixed_nodes(self):
+        if not self.member.cons_fixed:
+            return
+        # get nodes
+        for femobj in self.member.cons_fixed:
+            self._get_nodes(femobj)
+            # add nodes to constraint_conflict_nodes, needed by constraint plane rotation
+            for node in femobj["Nodes"]:
+                self.constraint_conflict_nodes.append(node)
+        self._split_constraints_fixed_solid_nodes()
+
     def get_constraints_rigidbody_nodes(self):
         if not self.member.cons_rigidbody:
             return
         # get nodes
         for femobj in self.member.cons_rigidbody:
-            # femobj --> dict, FreeCAD document object is femobj["Object"]
-            print_obj_info(femobj["Object"])
-            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
+            self._get_nodes(femobj)
             # add nodes to constraint_conflict_nodes, needed by constraint plane rotation
             for node in femobj["Nodes"]:
                 self.constraint_conflict_nodes.append(node)
@@ -226,83 +334,55 @@ class MeshSetsGetter:
             return
         # get nodes
         for femobj in self.member.cons_displacement:
-            # femobj --> dict, FreeCAD document object is femobj["Object"]
-            print_obj_info(femobj["Object"])
-            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
+            self._get_nodes(femobj)
             # add nodes to constraint_conflict_nodes, needed by constraint plane rotation
             for node in femobj["Nodes"]:
                 self.constraint_conflict_nodes.append(node)
 
     def get_constraints_planerotation_nodes(self):
-        if not self.member.cons_planerotation:
-            return
         # get nodes
         for femobj in self.member.cons_planerotation:
-            # femobj --> dict, FreeCAD document object is femobj["Object"]
-            print_obj_info(femobj["Object"])
-            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
+            self._get_nodes(femobj)
 
     def get_constraints_transform_nodes(self):
-        if not self.member.cons_transform:
-            return
         # get nodes
         for femobj in self.member.cons_transform:
-            # femobj --> dict, FreeCAD document object is femobj["Object"]
-            print_obj_info(femobj["Object"])
-            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
+            self._get_nodes(femobj)
 
     def get_constraints_temperature_nodes(self):
-        if not self.member.cons_temperature:
-            return
         # get nodes
         for femobj in self.member.cons_temperature:
-            # femobj --> dict, FreeCAD document object is femobj["Object"]
-            print_obj_info(femobj["Object"])
-            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
+            self._get_nodes(femobj)
 
     def get_constraints_initialtemperature_nodes(self):
-        if not self.member.cons_initialtemperature:
-            return
         # get nodes
         for femobj in self.member.cons_initialtemperature:
-            # femobj --> dict, FreeCAD document object is femobj["Object"]
-            print_obj_info(femobj["Object"])
-            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
+            self._get_nodes(femobj)
 
     def get_constraints_fluidsection_nodes(self):
-        if not self.member.geos_fluidsection:
-            return
         # get nodes
         for femobj in self.member.geos_fluidsection:
-            # femobj --> dict, FreeCAD document object is femobj["Object"]
-            print_obj_info(femobj["Object"])
-            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
+            self._get_nodes(femobj)
+
+    def _get_electrostatic_nodes(self, femobj):
+        if femobj["Object"].BoundaryCondition == "Dirichlet":
+            self._get_nodes(femobj)
 
     def get_constraints_electrostatic_nodes(self):
-        if not self.member.cons_electrostatic:
-            return
         # get nodes
         for femobj in self.member.cons_electrostatic:
-            # femobj --> dict, FreeCAD document object is femobj["Object"]
-            if femobj["Object"].BoundaryCondition == "Dirichlet":
-                print_obj_info(femobj["Object"])
-                femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(
-                    self.femmesh, femobj
-                )
+            self._get_electrostatic_nodes(femobj)
+
+    def _get_electricchargedensity_nodes(self, femobj):
+        if femobj["Object"].Concentrated:
+            self._get_nodes(femobj)
 
     def get_constraints_electricchargedensity_nodes(self):
-        if not self.member.cons_electricchargedensity:
-            return
         # get nodes
         for femobj in self.member.cons_electricchargedensity:
-            # femobj --> dict, FreeCAD document object is femobj["Object"]
-            if femobj["Object"].Concentrated:
-                print_obj_info(femobj["Object"])
-                femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(
-                    self.femmesh, femobj
-                )
+            self._get_electricchargedensity_nodes(femobj)
 
-    def get_constraints_force_nodeloads(self):
+    def _load_force_tables(self):
         if not self.member.cons_force:
             return
         # check shape type of reference shape
@@ -343,24 +423,32 @@ class MeshSetsGetter:
             "    The appropriate finite element mesh node load values will "
             "be calculated according to the finite element definition.\n"
         )
+
+    def _get_force_nodeloads(self, femobj):
+        # femobj --> dict, FreeCAD document object is femobj["Object"]
+        frc_obj = femobj["Object"]
+        print_obj_info(frc_obj)
+        if frc_obj.Force == 0:
+            FreeCAD.Console.PrintMessage("  Warning --> Force = 0\n")
+        if femobj["RefShapeType"] == "Vertex":  # point load on vertices
+            femobj["NodeLoadTable"] = meshtools.get_force_obj_vertex_nodeload_table(
+                self.femmesh, frc_obj
+            )
+        elif femobj["RefShapeType"] == "Edge":  # line load on edges
+            femobj["NodeLoadTable"] = meshtools.get_force_obj_edge_nodeload_table(
+                self.femmesh, self.femelement_table, self.femnodes_mesh, frc_obj
+            )
+        elif femobj["RefShapeType"] == "Face":  # area load on faces
+            femobj["NodeLoadTable"] = meshtools.get_force_obj_face_nodeload_table(
+                self.femmesh, self.femelement_table, self.femnodes_mesh, frc_obj
+            )
+
+    def get_constraints_force_nodeloads(self):
+        if not self.member.cons_force:
+            return
+        self._load_force_tables()
         for femobj in self.member.cons_force:
-            # femobj --> dict, FreeCAD document object is femobj["Object"]
-            frc_obj = femobj["Object"]
-            print_obj_info(frc_obj)
-            if frc_obj.Force == 0:
-                FreeCAD.Console.PrintMessage("  Warning --> Force = 0\n")
-            if femobj["RefShapeType"] == "Vertex":  # point load on vertices
-                femobj["NodeLoadTable"] = meshtools.get_force_obj_vertex_nodeload_table(
-                    self.femmesh, frc_obj
-                )
-            elif femobj["RefShapeType"] == "Edge":  # line load on edges
-                femobj["NodeLoadTable"] = meshtools.get_force_obj_edge_nodeload_table(
-                    self.femmesh, self.femelement_table, self.femnodes_mesh, frc_obj
-                )
-            elif femobj["RefShapeType"] == "Face":  # area load on faces
-                femobj["NodeLoadTable"] = meshtools.get_force_obj_face_nodeload_table(
-                    self.femmesh, self.femelement_table, self.femnodes_mesh, frc_obj
-                )
+            self._get_force_nodeloads(femobj)
 
     # ********************************************************************************************
     # ********************************************************************************************
@@ -374,38 +462,44 @@ class MeshSetsGetter:
         return result
 
     # faces sets
+    def _get_pressure_faces(self, femobj):
+        femobj["PressureFaces"] = self._get_ccx_elements(femobj["Object"])
+
     def get_constraints_pressure_faces(self):
         for femobj in self.member.cons_pressure:
-            obj = femobj["Object"]
-            result = self._get_ccx_elements(obj)
+            self._get_pressure_faces(femobj)
 
-            femobj["PressureFaces"] = result
+    def _get_electrostatic_faces(self, femobj):
+        obj = femobj["Object"]
+        if obj.BoundaryCondition == "Neumann":
+            femobj["ElectricFluxFaces"] = self._get_ccx_elements(obj)
 
     def get_constraints_electrostatic_faces(self):
         for femobj in self.member.cons_electrostatic:
-            obj = femobj["Object"]
-            if obj.BoundaryCondition == "Neumann":
-                result = self._get_ccx_elements(obj)
+            self._get_electrostatic_faces(femobj)
+
+    def _get_electricchargedensity_faces(self, femobj):
+        obj = femobj["Object"]
+        result = self._get_ccx_elements(obj)
 
-                femobj["ElectricFluxFaces"] = result
+        if obj.Mode in ["Interface", "Total Interface"]:
+            femobj["ChargeDensityFaces"] = result
+        elif obj.Mode in ["Source", "Total Source"]:
+            femobj["ChargeDensityElements"] = result
 
     def get_constraints_electricchargedensity_faces(self):
         for femobj in self.member.cons_electricchargedensity:
-            obj = femobj["Object"]
-            result = self._get_ccx_elements(obj)
+            self._get_electricchargedensity_faces(femobj)
 
-            if obj.Mode in ["Interface", "Total Interface"]:
-                femobj["ChargeDensityFaces"] = result
-            elif obj.Mode in ["Source", "Total Source"]:
-                femobj["ChargeDensityElements"] = result
+    def _get_contact_faces(self, femobj):
+        result = self._get_ccx_elements(femobj["Object"])
+
+        femobj["ContactSlaveFaces"] = result[:-1]
+        femobj["ContactMasterFaces"] = result[-1:]
 
     def get_constraints_contact_faces(self):
         for femobj in self.member.cons_contact:
-            obj = femobj["Object"]
-            result = self._get_ccx_elements(obj)
-
-            femobj["ContactSlaveFaces"] = result[:-1]
-            femobj["ContactMasterFaces"] = result[-1:]
+            self._get_contact_faces(femobj)
 
     # information in the regard of element faces constraints
     # forum post: https://forum.freecad.org/viewtopic.php?f=18&t=42783&p=370286#p366723
@@ -414,44 +508,46 @@ class MeshSetsGetter:
     # section print: only the element faces of solid elements
     #                from one side of the geometric face are needed
 
+    def _get_tie_faces(self, femobj):
+        result = self._get_ccx_elements(femobj["Object"])
+
+        femobj["TieSlaveFaces"] = result[:-1]
+        femobj["TieMasterFaces"] = result[-1:]
+
     def get_constraints_tie_faces(self):
         for femobj in self.member.cons_tie:
-            obj = femobj["Object"]
-            result = self._get_ccx_elements(obj)
+            self._get_tie_faces(femobj)
 
-            femobj["TieSlaveFaces"] = result[:-1]
-            femobj["TieMasterFaces"] = result[-1:]
+    def _get_sectionprint_faces(self, femobj):
+        femobj["SectionPrintFaces"] = self._get_ccx_elements(femobj["Object"])
 
     def get_constraints_sectionprint_faces(self):
         for femobj in self.member.cons_sectionprint:
-            obj = femobj["Object"]
-            result = self._get_ccx_elements(obj)
+            self._get_sectionprint_faces(femobj)
 
-            femobj["SectionPrintFaces"] = result
+    def _get_heatflux_faces(self, femobj):
+        femobj["HeatFluxFaces"] = self._get_ccx_elements(femobj["Object"])
 
     def get_constraints_heatflux_faces(self):
         for femobj in self.member.cons_heatflux:
-            obj = femobj["Object"]
-            result = self._get_ccx_elements(obj)
-
-            femobj["HeatFluxFaces"] = result
+            self._get_heatflux_faces(femobj)
 
     # ********************************************************************************************
     # ********************************************************************************************
     # element sets constraints
+    def _get_centrif_elements(self, femobj):
+        femobj["CentrifElements"] = self._get_ccx_elements(femobj["Object"])
+
     def get_constraints_centrif_elements(self):
         for femobj in self.member.cons_centrif:
-            obj = femobj["Object"]
-            result = self._get_ccx_elements(obj)
+            self._get_centrif_elements(femobj)
 
-            femobj["CentrifElements"] = result
+    def _get_bodyheatsource_elements(self, femobj):
+        femobj["BodyHeatSourceElements"] = self._get_ccx_elements(femobj["Object"])
 
     def get_constraints_bodyheatsource_elements(self):
         for femobj in self.member.cons_bodyheatsource:
-            obj = femobj["Object"]
-            result = self._get_ccx_elements(obj)
-
-            femobj["BodyHeatSourceElements"] = result
+            self._get_bodyheatsource_elements(femobj)
 
     # ********************************************************************************************
     # ********************************************************************************************
@@ -955,6 +1051,13 @@ def get_elset_name_short(names):
         raise Exception(error)
 
 
+def _scale_node_load_table(node_load_table, factor):
+    return [
+        (ref_shape, {node: load * factor for node, load in node_loads.items()})
+        for ref_shape, node_loads in node_load_table
+    ]
+
+
 def print_obj_info(obj, log=False):
     if log is False:
         FreeCAD.Console.PrintMessage(f"{obj.Label}:\n")
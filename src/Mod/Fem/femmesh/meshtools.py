@@ -27,6 +27,9 @@ __url__ = "https://www.freecad.org"
 ## \addtogroup FEM
 #  @{
 
+import hashlib
+import itertools
+
 import numpy as np
 
 import FreeCAD
@@ -171,6 +174,98 @@ def get_femelement_edges_table(femmesh, edges_only=None):
 
 
 # ************************************************************************************************
+class NodeElementIndex:
+    """node to element incidence of a femelement_table in compressed sparse row layout
+
+    The index is built once per mesh and replaces the former femnodes_ele_table dict
+    {nodeID : [[eleID, NodePosition], [], ...], ...}, see get_femnodes_ele_table().
+    The elements are numbered in the order of the femelement_table.
+    For node n the entries entry_elements[node_ptr[n]:node_ptr[n + 1]] are the
+    numbers of the elements the node belongs to and entry_positions the
+    position of the node in these elements.
+    All lookups take a node set and are done on the arrays, no Python loop
+    over the nodes or the elements of the mesh is needed.
+    """
+
+    def __init__(self, femelement_table, femnodes_mesh=None):
+        count = len(femelement_table)
+        self.element_ids = np.fromiter(femelement_table.keys(), dtype=np.int64, count=count)
+        self.element_lengths = np.fromiter(
+            (len(ele_nodes) for ele_nodes in femelement_table.values()),
+            dtype=np.int64,
+            count=count,
+        )
+        connectivity = np.fromiter(
+            itertools.chain.from_iterable(femelement_table.values()),
+            dtype=np.int64,
+            count=int(self.element_lengths.sum()),
+        )
+        element_ptr = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum(self.element_lengths, out=element_ptr[1:])
+        # element number and node position of each entry of the connectivity
+        entry_elements = np.repeat(np.arange(count), self.element_lengths)
+        entry_positions = np.arange(connectivity.size) - element_ptr[entry_elements]
+
+        if femnodes_mesh:
+            self.node_count = len(femnodes_mesh)
+            max_node = max(femnodes_mesh)
+        else:
+            self.node_count = np.unique(connectivity).size
+            max_node = 0
+        if connectivity.size:
+            max_node = max(max_node, int(connectivity.max()))
+        # a stable sort keeps the elements of a node in the order of the femelement_table
+        order = np.argsort(connectivity, kind="stable")
+        self.entry_elements = entry_elements[order]
+        self.entry_positions = entry_positions[order]
+        self.node_ptr = np.zeros(max_node + 2, dtype=np.int64)
+        np.cumsum(np.bincount(connectivity, minlength=max_node + 1), out=self.node_ptr[1:])
+
+    def __len__(self):
+        return self.node_count
+
+    def __getitem__(self, node):
+        """the entries of a node in the layout of the former femnodes_ele_table
+        [[eleID, NodePosition], [], ...]
+        """
+        row = slice(self.node_ptr[node], self.node_ptr[node + 1])
+        return [
+            [ele, 1 << pos]
+            for ele, pos in zip(
+                self.element_ids[self.entry_elements[row]].tolist(),
+                self.entry_positions[row].tolist(),
+            )
+        ]
+
+    def get_entries(self, node_set):
+        """the indices of all entries of the nodes of node_set
+        duplicate nodes and nodes without elements are ignored
+        """
+        nodes = np.unique(np.asarray(node_set, dtype=np.int64))
+        nodes = nodes[(nodes >= 0) & (nodes < self.node_ptr.size - 1)]
+        starts = self.node_ptr[nodes]
+        counts = self.node_ptr[nodes + 1] - starts
+        # concatenated ranges starts[i]:starts[i] + counts[i]
+        offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+        return offsets + np.arange(offsets.size)
+
+    def get_node_counts(self, node_set):
+        """for every element the number of its nodes which are in node_set"""
+        entries = self.get_entries(node_set)
+        return np.bincount(self.entry_elements[entries], minlength=self.element_ids.size)
+
+    def get_bit_patterns(self, node_set):
+        """for every element the bit array of its nodes which are in node_set
+        bit i is set, if node i of the element is in node_set
+        """
+        entries = self.get_entries(node_set)
+        bit_patterns = np.zeros(self.element_ids.size, dtype=np.int64)
+        np.bitwise_or.at(
+            bit_patterns, self.entry_elements[entries], 1 << self.entry_positions[entries]
+        )
+        return bit_patterns
+
+
 def get_femnodes_ele_table(femnodes_mesh, femelement_table):
     """the femnodes_ele_table contains for each node its membership in elements
     {nodeID : [[eleID, NodePosition], [], ...], nodeID : [[], [], ...], ...}
@@ -186,22 +281,42 @@ def get_femnodes_ele_table(femnodes_mesh, femelement_table):
     volume or face or edgemesh the femnodes_ele_table only
     has either volume or face or edge elements
     see get_femelement_table()
+    The table is returned as NodeElementIndex, which holds this information in arrays.
     """
-    femnodes_ele_table = {}  # node_dict in ulrichs class
-    for n in femnodes_mesh:  # initialize it with sorted node keys and empty lists
-        femnodes_ele_table[n] = []
-    for ele in femelement_table:
-        ele_list = femelement_table[ele]
-        # FreeCAD.Console.PrintMessage("{}\n".format(ele_list))
-        pos = int(1)
-        for ele_node in ele_list:
-            femnodes_ele_table[ele_node].append([ele, pos])
-            pos = pos << 1
+    femnodes_ele_table = NodeElementIndex(femelement_table, femnodes_mesh)
     FreeCAD.Console.PrintLog(f"len femnodes_ele_table: {len(femnodes_ele_table)}\n")
-    FreeCAD.Console.PrintLog(f"femnodes_ele_table: {femnodes_ele_table}\n")
     return femnodes_ele_table
 
 
+# ************************************************************************************************
+def get_femmesh_fingerprint(femmesh, femnodes_mesh, femnodes_ele_table):
+    """hex digest of the node coordinates, the elements of the femnodes_ele_table
+    and the group data of the femmesh, changes if the mesh has changed
+    """
+    digest = hashlib.sha1()
+    digest.update(np.fromiter(femnodes_mesh.keys(), dtype=np.int64, count=len(femnodes_mesh)))
+    digest.update(
+        np.fromiter(
+            itertools.chain.from_iterable((v.x, v.y, v.z) for v in femnodes_mesh.values()),
+            dtype=np.float64,
+            count=3 * len(femnodes_mesh),
+        )
+    )
+    for array in (
+        femnodes_ele_table.element_ids,
+        femnodes_ele_table.element_lengths,
+        femnodes_ele_table.node_ptr,
+        femnodes_ele_table.entry_elements,
+        femnodes_ele_table.entry_positions,
+    ):
+        digest.update(array)
+    for group_id in femmesh.Groups:
+        digest.update(femmesh.getGroupName(group_id).encode())
+        digest.update(femmesh.getGroupElementType(group_id).encode())
+        digest.update(np.array(femmesh.getGroupElements(group_id), dtype=np.int64))
+    return digest.hexdigest()
+
+
 # ************************************************************************************************
 def get_copy_of_empty_femelement_table(femelement_table):
     """{eleID : 0, eleID : 0, ...}"""
@@ -223,24 +338,53 @@ def get_bit_pattern_dict(femelement_table, femnodes_ele_table, node_set):
     or has this element a face we are searching for?
     The number in the ele_dict is organized as a bit array.
     The corresponding bit is set, if the node of the node_set is contained in the element.
+    Only the elements with at least one node in node_set are in the bit_pattern_dict,
+    all other elements would have an empty bit array, which never matches a mask.
     """
-    # print("BIT PATTERN", femelement_table, femnodes_ele_table, node_set)
     FreeCAD.Console.PrintLog("len femnodes_ele_table: " + str(len(femnodes_ele_table)) + "\n")
     FreeCAD.Console.PrintLog("len node_set: " + str(len(node_set)) + "\n")
-    FreeCAD.Console.PrintLog(f"node_set: {node_set}\n")
-    bit_pattern_dict = get_copy_of_empty_femelement_table(femelement_table)
-    # # initializing the bit_pattern_dict
-    for ele in femelement_table:
-        len_ele = len(femelement_table[ele])
-        bit_pattern_dict[ele] = [len_ele, 0]
-    for node in node_set:
-        for nList in femnodes_ele_table[node]:
-            bit_pattern_dict[nList[0]][1] += nList[1]
+    bit_patterns = femnodes_ele_table.get_bit_patterns(node_set)
+    (found,) = bit_patterns.nonzero()
+    bit_pattern_dict = {
+        ele: [len_ele, bits]
+        for ele, len_ele, bits in zip(
+            femnodes_ele_table.element_ids[found].tolist(),
+            femnodes_ele_table.element_lengths[found].tolist(),
+            bit_patterns[found].tolist(),
+        )
+    }
     FreeCAD.Console.PrintLog("len bit_pattern_dict: " + str(len(bit_pattern_dict)) + "\n")
     # FreeCAD.Console.PrintMessage("bit_pattern_dict: {}\n".format(bit_pattern_dict))
     return bit_pattern_dict
 
 
+def search_bit_pattern_dict(bit_pattern_dict, vol_dict):
+    """search the bit_pattern_dict for the masks of vol_dict
+    vol_dict: {lenEleNodes : {mask : value, ...}, ...}
+    returns [[eleID, value], ...] for every element and every mask with all mask bits set,
+    in the order of the bit_pattern_dict and the masks
+    """
+    count = len(bit_pattern_dict)
+    eles = np.fromiter(bit_pattern_dict.keys(), dtype=np.int64, count=count)
+    lens_bits = np.fromiter(
+        itertools.chain.from_iterable(bit_pattern_dict.values()),
+        dtype=np.int64,
+        count=2 * count,
+    ).reshape(count, 2)
+    lens, bits = lens_bits[:, 0], lens_bits[:, 1]
+    found = []  # (position in bit_pattern_dict, mask order, value)
+    for len_ele, mask_dict in vol_dict.items():
+        (same_len,) = (lens == len_ele).nonzero()
+        for order, (key, value) in enumerate(mask_dict.items()):
+            hits = same_len[(bits[same_len] & key) == key]
+            found.append((hits, np.full(hits.size, order), np.full(hits.size, value)))
+    if not found:
+        return []
+    positions, orders, values = (np.concatenate(f) for f in zip(*found))
+    order = np.lexsort((orders, positions))
+    return [list(pair) for pair in zip(eles[positions[order]].tolist(), values[order].tolist())]
+
+
 # ************************************************************************************************
 def get_ccxelement_volumes_elements_from_binary_search(bit_pattern_dict):
     tet10_mask = {0b1111111111: 1}
@@ -257,12 +401,7 @@ def get_ccxelement_volumes_elements_from_binary_search(bit_pattern_dict):
         15: pent15_mask,
         20: hex20_mask,
     }
-    volumes = []
-    for ele in bit_pattern_dict:
-        mask_dict = vol_dict[bit_pattern_dict[ele][0]]
-        for key in mask_dict:
-            if (key & bit_pattern_dict[ele][1]) == key:
-                volumes.append(ele)
+    volumes = [ele for ele, value in search_bit_pattern_dict(bit_pattern_dict, vol_dict)]
     # print("VOLUMES:", volumes)
     FreeCAD.Console.PrintLog(f"found Volumes: {len(volumes)}\n")
     # FreeCAD.Console.PrintMessage("faces: {}\n".format(faces))
@@ -280,12 +419,7 @@ def get_ccxelement_faces_elements_from_binary_search(bit_pattern_dict):
         4: quad4_mask,
         8: quad8_mask,
     }
-    faces = []
-    for ele in bit_pattern_dict:
-        mask_dict = vol_dict[bit_pattern_dict[ele][0]]
-        for key in mask_dict:
-            if (key & bit_pattern_dict[ele][1]) == key:
-                faces.append(ele)
+    faces = [ele for ele, value in search_bit_pattern_dict(bit_pattern_dict, vol_dict)]
     # print("CARAS:", faces)
     FreeCAD.Console.PrintMessage(f"found Edges: {len(faces)}\n")
     return faces
@@ -304,12 +438,9 @@ def get_ccxelement_edges_from_binary_search(bit_pattern_dict, sets_getter):
         4: quad4_mask,
         8: quad8_mask,
     }
-    faces = []
-    for ele in bit_pattern_dict:
-        mask_dict = vol_dict[bit_pattern_dict[ele][0]]
-        for key in mask_dict:
-            if (key & bit_pattern_dict[ele][1]) == key:
-                faces.append([ele, mask_dict[key] + offset])
+    faces = [
+        [ele, value + offset] for ele, value in search_bit_pattern_dict(bit_pattern_dict, vol_dict)
+    ]
     # print("EDGES:", faces)
     FreeCAD.Console.PrintMessage(f"found Edges: {len(faces)}\n")
 
@@ -337,12 +468,7 @@ def get_ccxelement_faces_from_binary_search(bit_pattern_dict):
         15: pent15_mask,
         20: hex20_mask,
     }
-    faces = []
-    for ele in bit_pattern_dict:
-        mask_dict = vol_dict[bit_pattern_dict[ele][0]]
-        for key in mask_dict:
-            if (key & bit_pattern_dict[ele][1]) == key:
-                faces.append([ele, mask_dict[key]])
+    faces = search_bit_pattern_dict(bit_pattern_dict, vol_dict)
     # print("FACES:", faces)
     FreeCAD.Console.PrintLog(f"found Faces: {len(faces)}\n")
     # FreeCAD.Console.PrintMessage("faces: {}\n".format(faces))
@@ -357,16 +483,13 @@ def get_femelements_by_femnodes_bin(femelement_table, femnodes_ele_table, node_l
     blind fast binary search, but works for volumes only
     """
     FreeCAD.Console.PrintMessage("binary search: get_femelements_by_femnodes_bin\n")
-    vol_masks = {4: 15, 6: 63, 8: 255, 10: 1023, 15: 32767, 20: 1048575}
-    # Now we are looking for nodes inside of the Volumes = filling the bit_pattern_dict
+    # Now we are looking for nodes inside of the Volumes = filling the bit patterns
     FreeCAD.Console.PrintMessage(f"len femnodes_ele_table: {len(femnodes_ele_table)}\n")
-    bit_pattern_dict = get_bit_pattern_dict(femelement_table, femnodes_ele_table, node_list)
-    # search
-    ele_list = []  # The ele_list contains the result of the search.
-    for ele in bit_pattern_dict:
-        FreeCAD.Console.PrintLog(f"bit_pattern_dict[ele][0]: {bit_pattern_dict[ele][0]}\n")
-        if bit_pattern_dict[ele][1] == vol_masks[bit_pattern_dict[ele][0]]:
-            ele_list.append(ele)
+    bit_patterns = femnodes_ele_table.get_bit_patterns(node_list)
+    # search, all bits of the element are set
+    vol_masks = (1 << femnodes_ele_table.element_lengths) - 1
+    # The ele_list contains the result of the search.
+    ele_list = femnodes_ele_table.element_ids[bit_patterns == vol_masks].tolist()
     FreeCAD.Console.PrintMessage(f"found Volumes: {len(ele_list)}\n")
     # FreeCAD.Console.PrintMessage("   volumes: {}\n".format(ele_list))
     return ele_list
@@ -380,14 +503,11 @@ def get_femelements_by_femnodes_std(femelement_table, node_list):
     e: elementlist
     nodes: nodelist"""
     FreeCAD.Console.PrintMessage("std search: get_femelements_by_femnodes_std\n")
+    node_set = set(node_list)
     e = []  # elementlist
     for elementID in sorted(femelement_table):
-        nodecount = 0
-        for nodeID in femelement_table[elementID]:
-            if nodeID in node_list:
-                nodecount = nodecount + 1
         # all nodes of the element are in the node_list!
-        if nodecount == len(femelement_table[elementID]):
+        if node_set.issuperset(femelement_table[elementID]):
             e.append(elementID)
     return e
 
@@ -406,45 +526,22 @@ def get_femvolumeelements_by_femfacenodes(femelement_table, node_list):
         --> if exact 6 or 8 element nodes are in node_list --> add femelement
     e: elementlist
     nodes: nodelist"""
+    # number of element nodes of one element face
+    face_node_counts = {
+        4: (3,),  # tetra4
+        10: (4,),  # tetra10
+        8: (4,),  # hexa8
+        20: (8,),  # hexa20
+        6: (3, 4),  # penta6
+        15: (6, 8),  # penta15
+    }
+    node_set = set(node_list)
     e = []  # elementlist
     for elementID in sorted(femelement_table):
-        nodecount = 0
         el_nd_ct = len(femelement_table[elementID])
-        if el_nd_ct == 4:  # tetra4
-            for nodeID in femelement_table[elementID]:
-                if nodeID in node_list:
-                    nodecount = nodecount + 1
-            if nodecount == 3:
-                e.append(elementID)
-        elif el_nd_ct == 10:  # tetra10
-            for nodeID in femelement_table[elementID]:
-                if nodeID in node_list:
-                    nodecount = nodecount + 1
-            if nodecount == 4:
-                e.append(elementID)
-        elif el_nd_ct == 8:  # hexa8
-            for nodeID in femelement_table[elementID]:
-                if nodeID in node_list:
-                    nodecount = nodecount + 1
-            if nodecount == 4:
-                e.append(elementID)
-        elif el_nd_ct == 20:  # hexa20
-            for nodeID in femelement_table[elementID]:
-                if nodeID in node_list:
-                    nodecount = nodecount + 1
-            if nodecount == 8:
-                e.append(elementID)
-        elif el_nd_ct == 6:  # penta6
-            for nodeID in femelement_table[elementID]:
-                if nodeID in node_list:
-                    nodecount = nodecount + 1
-            if nodecount == 3 or nodecount == 4:
-                e.append(elementID)
-        elif el_nd_ct == 15:  # penta15
-            for nodeID in femelement_table[elementID]:
-                if nodeID in node_list:
-                    nodecount = nodecount + 1
-            if nodecount == 6 or nodecount == 8:
+        if el_nd_ct in face_node_counts:
+            nodecount = len(node_set.intersection(femelement_table[elementID]))
+            if nodecount in face_node_counts[el_nd_ct]:
                 e.append(elementID)
         else:
             FreeCAD.Console.PrintError(
@@ -922,7 +1019,7 @@ def get_force_obj_edge_nodeload_table(femmesh, femelement_table, femnodes_mesh,
 # ************************************************************************************************
 def get_ref_edgenodes_table(femmesh, femelement_table, refedge):
     edge_table = {}  # { meshedgeID : ( nodeID, ... , nodeID ) }
-    refedge_nodes = femmesh.getNodesByEdge(refedge)
+    refedge_nodes = set(femmesh.getNodesByEdge(refedge))
     if is_solid_femmesh(femmesh):
         refedge_fem_volumeelements = []
         # if at least two nodes of a femvolumeelement are in
@@ -1135,6 +1232,7 @@ def get_ref_facenodes_table(femmesh, femelement_table, ref_face):
             # We need to sort them according to the
             # shell mesh notation of tria3, tria6, quad4, quad8
             ref_face_nodes = femmesh.getNodesByFace(ref_face)
+            ref_face_node_set = set(ref_face_nodes)
             # try to use getccxVolumesByFace() to get the volume ids
             # of element with elementfaces on the ref_face
             # --> should work for tetra4 and tetra10
@@ -1147,10 +1245,9 @@ def get_ref_facenodes_table(femmesh, femelement_table, ref_face):
                 )
                 for ve in ref_face_volume_elements:
                     veID = ve[0]
-                    ve_ref_face_nodes = []
-                    for nodeID in femelement_table[veID]:
-                        if nodeID in ref_face_nodes:
-                            ve_ref_face_nodes.append(nodeID)
+                    ve_ref_face_nodes = [
+                        nodeID for nodeID in femelement_table[veID] if nodeID in ref_face_node_set
+                    ]
                     # { volumeID : ( facenodeID, ... , facenodeID ) } only the ref_face nodes
                     face_table[veID] = ve_ref_face_nodes
             else:  # mesh with hexa or penta
@@ -1164,10 +1261,9 @@ def get_ref_facenodes_table(femmesh, femelement_table, ref_face):
                     femelement_table, ref_face_nodes
                 )
                 for veID in ref_face_volume_elements:
-                    ve_ref_face_nodes = []
-                    for nodeID in femelement_table[veID]:
-                        if nodeID in ref_face_nodes:
-                            ve_ref_face_nodes.append(nodeID)
+                    ve_ref_face_nodes = [
+                        nodeID for nodeID in femelement_table[veID] if nodeID in ref_face_node_set
+                    ]
                     # { volumeID : ( facenodeID, ... , facenodeID ) } only the ref_face nodes
                     face_table[veID] = ve_ref_face_nodes
                 # we need to resort the nodes to make them build an element face
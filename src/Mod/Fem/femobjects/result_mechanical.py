@@ -255,3 +255,8 @@ class ResultMechanical(base_fempythonobject.BaseFemPythonObject):
             for i in range(12, -1, -1):
                 del temp[3 * i + 1]
             obj.Stats = temp
+
+        # the node data of lazy stored results is loaded on demand
+        from femresult import resulttools
+
+        resulttools.set_node_data_transient(obj)
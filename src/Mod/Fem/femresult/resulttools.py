@@ -26,6 +26,8 @@ __url__ = "https://www.freecad.org"
 ## \addtogroup FEM
 #  @{
 
+import warnings
+
 import numpy as np
 from math import isnan
 
@@ -139,6 +141,7 @@ def reset_mesh_color(resultobj):
 
 def show_displacement(resultobj, displacement_factor=0.0):
     if FreeCAD.GuiUp:
+        load_result_data(resultobj)
         if resultobj.Mesh.ViewObject.Visibility is False:
             resultobj.Mesh.ViewObject.Visibility = True
         resultobj.Mesh.ViewObject.setNodeDisplacementByVectors(
@@ -169,6 +172,7 @@ def show_result(resultobj, result_type="Sabs", limit=None):
         reset_mesh_color(resultobj.Mesh)
         return
     if resultobj:
+        load_result_data(resultobj)
         if result_type == "Sabs":
             values = resultobj.vonMises
         elif result_type == "Uabs":
@@ -313,39 +317,28 @@ def fill_femresult_stats(res_obj):
     mflow_min = mflow_max = npress_min = npress_max = 0
 
     if res_obj.DisplacementVectors:
-        x_max, y_max, z_max = map(max, zip(*res_obj.DisplacementVectors))
-        x_min, y_min, z_min = map(min, zip(*res_obj.DisplacementVectors))
+        (x_min, y_min, z_min), (x_max, y_max, z_max) = _min_max(res_obj.DisplacementVectors)
     if res_obj.DisplacementLengths:
-        a_min = min(res_obj.DisplacementLengths)
-        a_max = max(res_obj.DisplacementLengths)
+        a_min, a_max = _min_max(res_obj.DisplacementLengths)
     if res_obj.vonMises:
-        s_min = min(res_obj.vonMises)
-        s_max = max(res_obj.vonMises)
+        s_min, s_max = _min_max(res_obj.vonMises)
     if res_obj.PrincipalMax:
-        p1_min = min(res_obj.PrincipalMax)
-        p1_max = max(res_obj.PrincipalMax)
+        p1_min, p1_max = _min_max(res_obj.PrincipalMax)
     if res_obj.PrincipalMed:
-        p2_min = min(res_obj.PrincipalMed)
-        p2_max = max(res_obj.PrincipalMed)
+        p2_min, p2_max = _min_max(res_obj.PrincipalMed)
     if res_obj.PrincipalMin:
-        p3_min = min(res_obj.PrincipalMin)
-        p3_max = max(res_obj.PrincipalMin)
+        p3_min, p3_max = _min_max(res_obj.PrincipalMin)
     if res_obj.MaxShear:
-        ms_min = min(res_obj.MaxShear)
-        ms_max = max(res_obj.MaxShear)
+        ms_min, ms_max = _min_max(res_obj.MaxShear)
     if res_obj.Peeq:
-        peeq_min = min(res_obj.Peeq)
-        peeq_max = max(res_obj.Peeq)
+        peeq_min, peeq_max = _min_max(res_obj.Peeq)
     if res_obj.Temperature:
-        temp_min = min(res_obj.Temperature)
-        temp_max = max(res_obj.Temperature)
+        temp_min, temp_max = _min_max(res_obj.Temperature)
     if res_obj.MassFlowRate:
         # DisplacementVectors is empty, no_of_values needs to be set
-        mflow_min = min(res_obj.MassFlowRate)
-        mflow_max = max(res_obj.MassFlowRate)
+        mflow_min, mflow_max = _min_max(res_obj.MassFlowRate)
     if res_obj.NetworkPressure:
-        npress_min = min(res_obj.NetworkPressure)
-        npress_max = max(res_obj.NetworkPressure)
+        npress_min, npress_max = _min_max(res_obj.NetworkPressure)
 
     res_obj.Stats = [
         x_min,
@@ -405,6 +398,43 @@ def fill_femresult_stats(res_obj):
     return res_obj
 
 
+def _min_max(values):
+    """Returns the minimum and the maximum of values, or of each column of values.
+
+    NaN values are ignored, the result is NaN only if all values are NaN.
+    """
+    values = np.asarray(values, dtype=float)
+    with warnings.catch_warnings():
+        # numpy warns about an all NaN slice
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return np.nanmin(values, axis=0).tolist(), np.nanmax(values, axis=0).tolist()
+
+
+def get_stress_tensors(res_obj):
+    """Returns the node stresses of a result object as array.
+
+    Parameters
+    ----------
+    res_obj : Fem::ResultMechanical
+        FreeCAD FEM mechanical result object
+
+    Returns
+    -------
+    numpy.ndarray
+        one row (Sxx, Syy, Szz, Sxy, Sxz, Syz) for each node
+    """
+    return np.column_stack(
+        (
+            np.asarray(res_obj.NodeStressXX, dtype=float),
+            np.asarray(res_obj.NodeStressYY, dtype=float),
+            np.asarray(res_obj.NodeStressZZ, dtype=float),
+            np.asarray(res_obj.NodeStressXY, dtype=float),
+            np.asarray(res_obj.NodeStressXZ, dtype=float),
+            np.asarray(res_obj.NodeStressYZ, dtype=float),
+        )
+    ).reshape(-1, 6)
+
+
 def add_disp_apps(res_obj):
     res_obj.DisplacementLengths = calculate_disp_abs(res_obj.DisplacementVectors)
     FreeCAD.Console.PrintLog("Added DisplacementLengths.\n")
@@ -412,18 +442,7 @@ def add_disp_apps(res_obj):
 
 
 def add_von_mises(res_obj):
-    mstress = []
-    iterator = zip(
-        res_obj.NodeStressXX,
-        res_obj.NodeStressYY,
-        res_obj.NodeStressZZ,
-        res_obj.NodeStressXY,
-        res_obj.NodeStressXZ,
-        res_obj.NodeStressYZ,
-    )
-    for Sxx, Syy, Szz, Sxy, Sxz, Syz in iterator:
-        mstress.append(calculate_von_mises((Sxx, Syy, Szz, Sxy, Sxz, Syz)))
-    res_obj.vonMises = mstress
+    res_obj.vonMises = calculate_von_mises_array(get_stress_tensors(res_obj)).tolist()
     FreeCAD.Console.PrintLog("Added von Mises stress.\n")
     return res_obj
 
@@ -433,28 +452,13 @@ def add_principal_stress_std(res_obj):
     # TODO may be use only one container for principal stresses in result object
     # https://forum.freecad.org/viewtopic.php?f=18&t=33106&p=416006#p416006
     # but which one is better
-    prinstress1 = []
-    prinstress2 = []
-    prinstress3 = []
-    shearstress = []
-    iterator = zip(
-        res_obj.NodeStressXX,
-        res_obj.NodeStressYY,
-        res_obj.NodeStressZZ,
-        res_obj.NodeStressXY,
-        res_obj.NodeStressXZ,
-        res_obj.NodeStressYZ,
+    prinstress1, prinstress2, prinstress3, shearstress = calculate_principal_stress_std_array(
+        get_stress_tensors(res_obj)
     )
-    for Sxx, Syy, Szz, Sxy, Sxz, Syz in iterator:
-        prin1, prin2, prin3, shear = calculate_principal_stress_std((Sxx, Syy, Szz, Sxy, Sxz, Syz))
-        prinstress1.append(prin1)
-        prinstress2.append(prin2)
-        prinstress3.append(prin3)
-        shearstress.append(shear)
-    res_obj.PrincipalMax = prinstress1
-    res_obj.PrincipalMed = prinstress2
-    res_obj.PrincipalMin = prinstress3
-    res_obj.MaxShear = shearstress
+    res_obj.PrincipalMax = prinstress1.tolist()
+    res_obj.PrincipalMed = prinstress2.tolist()
+    res_obj.PrincipalMin = prinstress3.tolist()
+    res_obj.MaxShear = shearstress.tolist()
     FreeCAD.Console.PrintLog("Added standard principal stresses and max shear values.\n")
 
     #
@@ -506,20 +510,18 @@ def calculate_csr(ps1, ps2, ps3, alpha, beta, res_obj):
             unless available from extensive research experiments
             T = pressure / von Mises stress (stress triaxiality)
     """
-    csr = []  # critical strain ratio
-    nsr = len(ps1)  # number of stress results
-    for i in range(nsr):
-        p = (ps1[i] + ps2[i] + ps3[i]) / 3.0  # pressure
-        svm = np.sqrt(
-            1.5 * (ps1[i] - p) ** 2 + 1.5 * (ps2[i] - p) ** 2 + 1.5 * (ps3[i] - p) ** 2
-        )  # von Mises stress: https://en.wikipedia.org/wiki/Von_Mises_yield_criterion
-        if svm != 0.0:
-            T = p / svm  # stress triaxiality
-        else:
-            T = 0.0
-        critical_strain = alpha * np.exp(-beta * T)  # critical strain
-        csr.append(abs(res_obj.Peeq[i]) / critical_strain)  # critical strain ratio
-    return csr
+    ps1 = np.asarray(ps1, dtype=float)
+    ps2 = np.asarray(ps2, dtype=float)
+    ps3 = np.asarray(ps3, dtype=float)
+    p = (ps1 + ps2 + ps3) / 3.0  # pressure
+    svm = np.sqrt(
+        1.5 * (ps1 - p) ** 2 + 1.5 * (ps2 - p) ** 2 + 1.5 * (ps3 - p) ** 2
+    )  # von Mises stress: https://en.wikipedia.org/wiki/Von_Mises_yield_criterion
+    with np.errstate(divide="ignore", invalid="ignore"):
+        T = np.where(svm != 0.0, p / svm, 0.0)  # stress triaxiality
+    critical_strain = alpha * np.exp(-beta * T)  # critical strain
+    peeq = np.asarray(res_obj.Peeq, dtype=float)[: len(ps1)]
+    return (np.abs(peeq) / critical_strain).tolist()  # critical strain ratio
 
 
 def get_concrete_nodes(res_obj):
@@ -542,27 +544,21 @@ def get_concrete_nodes(res_obj):
         ):
             FreeCAD.Console.PrintMessage("ReinforcedMaterial\n")
             if obj.References == []:
-                for iic in range(nsr):
-                    if ic[iic] == 0:
-                        ic[iic] = 1
+                ic[ic == 0] = 1
             else:
                 for ref in obj.References:
                     concrete_nodes = get_femnodes_by_refshape(femmesh, ref)
-                    for cn in concrete_nodes:
-                        ic[cn - 1] = 1
+                    ic[np.asarray(concrete_nodes, dtype=int) - 1] = 1
         elif obj.isDerivedFrom("App::MaterialObjectPython") and is_of_type(
             obj, "Fem::MaterialCommon"
         ):
             FreeCAD.Console.PrintMessage("No ReinforcedMaterial\n")
             if obj.References == []:
-                for iic in range(nsr):
-                    if ic[iic] == 0:
-                        ic[iic] = 2
+                ic[ic == 0] = 2
             else:
                 for ref in obj.References:
                     non_concrete_nodes = get_femnodes_by_refshape(femmesh, ref)
-                    for ncn in non_concrete_nodes:
-                        ic[ncn - 1] = 2
+                    ic[np.asarray(non_concrete_nodes, dtype=int) - 1] = 2
     return ic
 
 
@@ -579,22 +575,6 @@ def add_principal_stress_reinforced(res_obj):
     # TODO may be use only one container for principal stresses in result object
     # https://forum.freecad.org/viewtopic.php?f=18&t=33106&p=416006#p416006
     # but which one is better
-    prinstress1 = []
-    prinstress2 = []
-    prinstress3 = []
-    shearstress = []
-    ps1v = []
-    ps2v = []
-    ps3v = []
-    #
-    # additional arrays to hold reinforcement ratios
-    # and mohr coulomb stress
-    #
-    rhx = []
-    rhy = []
-    rhz = []
-    moc = []
-
     # material parameter
     for obj in res_obj.getParentGroup().Group:
         if is_of_type(obj, "Fem::MaterialReinforced"):
@@ -611,65 +591,54 @@ def add_principal_stress_reinforced(res_obj):
     # print(matrix_cs)
     # print(reinforce_yield)
 
-    iterator = zip(
-        res_obj.NodeStressXX,
-        res_obj.NodeStressYY,
-        res_obj.NodeStressZZ,
-        res_obj.NodeStressXY,
-        res_obj.NodeStressXZ,
-        res_obj.NodeStressYZ,
+    stress = get_stress_tensors(res_obj)
+    concrete = ic[: len(stress)] == 1
+
+    #
+    # for concrete scxx etc. are affected by
+    # reinforcement (see calculate_rho(stress_tensor)). for all other
+    # materials scxx etc. are the original stresses
+    #
+    # additional arrays to hold reinforcement ratios
+    # and mohr coulomb stress
+    #
+    rhx = np.zeros(len(stress))
+    rhy = np.zeros(len(stress))
+    rhz = np.zeros(len(stress))
+    moc = np.zeros(len(stress))
+    if concrete.any():
+        rhx[concrete], rhy[concrete], rhz[concrete] = calculate_rho_array(
+            stress[concrete], reinforce_yield
+        )
+
+    prinstress1, prinstress2, prinstress3, shearstress, psv = (
+        calculate_principal_stress_reinforced_array(stress)
     )
-    for isv, stress_tensor in enumerate(iterator):
-
-        rhox = 0.0
-        rhoy = 0.0
-        rhoz = 0.0
-        mc = 0.0
-
-        if ic[isv] == 1:
-            #
-            # for concrete scxx etc. are affected by
-            # reinforcement (see calculate_rho(stress_tensor)). for all other
-            # materials scxx etc. are the original stresses
-            #
-            rhox, rhoy, rhoz = calculate_rho(stress_tensor, reinforce_yield)
-
-        prin1, prin2, prin3, shear, psv = calculate_principal_stress_reinforced(stress_tensor)
-
-        prinstress1.append(prin1)
-        prinstress2.append(prin2)
-        prinstress3.append(prin3)
-        shearstress.append(shear)
-        ps1v.append(psv[0])
-        ps2v.append(psv[1])
-        ps3v.append(psv[2])
-
-        #
-        # reinforcement ratios and mohr coulomb criterion
-        #
-        rhx.append(rhox)
-        rhy.append(rhoy)
-        rhz.append(rhoz)
-        if ic[isv] == 1:
-            mc = calculate_mohr_coulomb(prin1, prin3, matrix_af, matrix_cs)
-        moc.append(mc)
-
-    res_obj.PrincipalMax = prinstress1
-    res_obj.PrincipalMed = prinstress2
-    res_obj.PrincipalMin = prinstress3
-    res_obj.MaxShear = shearstress
+
+    #
+    # mohr coulomb criterion
+    #
+    if concrete.any():
+        moc[concrete] = calculate_mohr_coulomb_array(
+            prinstress1[concrete], prinstress3[concrete], matrix_af, matrix_cs
+        )
+
+    res_obj.PrincipalMax = prinstress1.tolist()
+    res_obj.PrincipalMed = prinstress2.tolist()
+    res_obj.PrincipalMin = prinstress3.tolist()
+    res_obj.MaxShear = shearstress.tolist()
     #
     # additional concrete and principal stress plot
     # results for use in _ViewProviderFemResultMechanical
     #
-    res_obj.ReinforcementRatio_x = rhx
-    res_obj.ReinforcementRatio_y = rhy
-    res_obj.ReinforcementRatio_z = rhz
-    res_obj.MohrCoulomb = moc
+    res_obj.ReinforcementRatio_x = rhx.tolist()
+    res_obj.ReinforcementRatio_y = rhy.tolist()
+    res_obj.ReinforcementRatio_z = rhz.tolist()
+    res_obj.MohrCoulomb = moc.tolist()
 
-    res_obj.PS1Vector = ps1v
-    res_obj.PS2Vector = ps2v
-    res_obj.PS3Vector = ps3v
+    res_obj.PS1Vector = [tuple(v) for v in psv[:, 0].tolist()]
+    res_obj.PS2Vector = [tuple(v) for v in psv[:, 1].tolist()]
+    res_obj.PS3Vector = [tuple(v) for v in psv[:, 2].tolist()]
 
     FreeCAD.Console.PrintLog(
         "Added reinforcement principal stresses and max shear values as well as "
@@ -705,6 +674,121 @@ def compact_result(res_obj):
     return res_obj
 
 
+# lazy result storage
+# the node data of a result object is saved as binary file in the FCStd file,
+# the property ResultData, instead of in the Document.xml. The node data
+# properties are transient, they are empty after the document is opened and
+# are loaded from the binary file on demand. The Stats are saved as usual.
+def use_lazy_result_storage():
+    """Returns True if new result objects should store their node data lazy."""
+    prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/General")
+    return prefs.GetBool("LazyResultStorage", False)
+
+
+def get_node_data_properties(res_obj):
+    """Returns the names of the node data properties of a result object."""
+    names = ["NodeNumbers"]
+    for prop in res_obj.PropertiesList:
+        if res_obj.getGroupOfProperty(prop) == "NodeData":
+            names.append(prop)
+    return names
+
+
+def is_result_data_stored(res_obj):
+    """Returns True if the node data of res_obj is stored lazy."""
+    return bool(getattr(res_obj, "ResultData", ""))
+
+
+def is_result_data_loaded(res_obj):
+    """Returns True if the node data of res_obj is in memory."""
+    return not is_result_data_stored(res_obj) or len(res_obj.NodeNumbers) > 0
+
+
+def store_result_data(res_obj):
+    """Stores the node data of a result object lazy.
+
+    The Stats have to be filled before, see fill_femresult_stats(). The node data stays
+    in memory, see unload_result_data().
+    """
+    import os
+    import tempfile
+
+    from feminout.importBinaryMesh import write_arrays
+
+    arrays = {}
+    for prop in get_node_data_properties(res_obj):
+        values = getattr(res_obj, prop)
+        if len(values) == 0:
+            continue
+        if prop == "NodeNumbers":
+            arrays[prop] = np.array(values, dtype="<i4")
+        else:
+            # vector lists are stored as (n, 3) arrays
+            arrays[prop] = np.array(values, dtype="<f8")
+    if "ResultData" not in res_obj.PropertiesList:
+        res_obj.addProperty(
+            "App::PropertyFileIncluded",
+            "ResultData",
+            "Base",
+            "Binary file of the node data, loaded on demand",
+            True,
+        )
+        res_obj.setPropertyStatus("ResultData", "LockDynamic")
+    fd, file_name = tempfile.mkstemp(prefix=res_obj.Name + "_", suffix=".meshbin")
+    os.close(fd)
+    try:
+        write_arrays(arrays, file_name)
+        # the file is copied into the transient directory of the document
+        res_obj.ResultData = file_name
+    finally:
+        os.remove(file_name)
+    set_node_data_transient(res_obj)
+    FreeCAD.Console.PrintLog(f"Stored node data of {res_obj.Name} lazy.\n")
+    return res_obj
+
+
+def set_node_data_transient(res_obj):
+    """Excludes the node data properties from saving, if the node data is stored lazy.
+
+    The status of NodeNumbers is not saved in the document, thus this is called after the
+    document has been restored too.
+    """
+    if is_result_data_stored(res_obj):
+        for prop in get_node_data_properties(res_obj):
+            res_obj.setPropertyStatus(prop, "Transient")
+
+
+def load_result_data(res_obj):
+    """Loads the node data of a lazy stored result object, if it is not in memory."""
+    if is_result_data_loaded(res_obj):
+        return res_obj
+
+    from feminout.importBinaryMesh import MeshFile
+
+    FreeCAD.Console.PrintLog(f"Load node data of {res_obj.Name}.\n")
+    with MeshFile(res_obj.ResultData) as data_file:
+        for prop in data_file.header["arrays"]:
+            if prop not in res_obj.PropertiesList:
+                continue
+            values = data_file.array(prop).tolist()
+            if res_obj.getTypeIdOfProperty(prop) == "App::PropertyVectorList":
+                values = list(map(tuple, values))
+            setattr(res_obj, prop, values)
+    # the node data has not changed, nothing to recompute
+    res_obj.purgeTouched()
+    return res_obj
+
+
+def unload_result_data(res_obj):
+    """Frees the memory of the node data of a lazy stored result object."""
+    if not is_result_data_stored(res_obj):
+        return res_obj
+    for prop in get_node_data_properties(res_obj):
+        setattr(res_obj, prop, [])
+    res_obj.purgeTouched()
+    return res_obj
+
+
 def calculate_von_mises(stress_tensor):
     """Calculate Von mises stress.
     See http://en.wikipedia.org/wiki/Von_Mises_yield_criterion
@@ -721,6 +805,33 @@ def calculate_von_mises(stress_tensor):
     return von_mises
 
 
+def _norms(vectors):
+    """Returns the Euclidean norm of each row of vectors.
+
+    Computed like numpy.linalg.norm() of a single vector, as square root of the dot product,
+    which gives bitwise the same results as the functions working on a single node.
+    """
+    return np.sqrt((vectors[:, np.newaxis, :] @ vectors[:, :, np.newaxis])[:, 0, 0])
+
+
+def calculate_von_mises_array(stress_tensors):
+    """Calculate Von mises stress of many nodes at once.
+    Same as calculate_von_mises() for each row of stress_tensors.
+
+    stress_tensors ... array with one row (Sxx, Syy, Szz, Sxy, Sxz, Syz) per node
+    """
+    stress_tensors = np.asarray(stress_tensors, dtype=float).reshape(-1, 6)
+    normal = stress_tensors[:, :3]
+    shear = stress_tensors[:, 3:]
+    pressure = np.mean(normal, axis=1)
+    # float_power rounds like the power of a single value, array**2 is a multiplication
+    von_mises = np.sqrt(
+        1.5 * np.float_power(_norms(normal - pressure[:, np.newaxis]), 2)
+        + 3.0 * np.float_power(_norms(shear), 2)
+    )
+    return von_mises
+
+
 def calculate_principal_stress_std(stress_tensor):
     # if NaN is inside the array, which can happen on Calculix frd result files return NaN
     # https://forum.freecad.org/viewtopic.php?f=22&t=33911&start=10#p284229
@@ -746,6 +857,44 @@ def calculate_principal_stress_std(stress_tensor):
     return (eigvals[0], eigvals[1], eigvals[2], maxshear)
 
 
+def _stress_matrices(stress_tensors):
+    """Returns the symmetric 3x3 stress matrix of each row (Sxx, Syy, Szz, Sxy, Sxz, Syz)."""
+    s = stress_tensors
+    return np.stack(
+        (
+            np.stack((s[:, 0], s[:, 3], s[:, 4]), axis=1),
+            np.stack((s[:, 3], s[:, 1], s[:, 5]), axis=1),
+            np.stack((s[:, 4], s[:, 5], s[:, 2]), axis=1),
+        ),
+        axis=1,
+    )
+
+
+def calculate_principal_stress_std_array(stress_tensors):
+    """Calculate the principal stresses and the max shear of many nodes at once.
+    Same as calculate_principal_stress_std() for each row of stress_tensors.
+
+    Parameters
+    ----------
+    stress_tensors : numpy.ndarray
+        one row (Sxx, Syy, Szz, Sxy, Sxz, Syz) per node
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        max, mid and min principal stress and max shear, NaN for rows containing NaN
+    """
+    stress_tensors = np.asarray(stress_tensors, dtype=float).reshape(-1, 6)
+    eigvals = np.full((len(stress_tensors), 3), np.nan)
+    # if NaN is inside a row, which can happen on Calculix frd result files the row is NaN
+    valid = ~np.isnan(stress_tensors).any(axis=1)
+    if valid.any():
+        # eigvalsh returns the eigenvalues in ascending order
+        eigvals[valid] = np.linalg.eigvalsh(_stress_matrices(stress_tensors[valid]))[:, ::-1]
+    maxshear = (eigvals[:, 0] - eigvals[:, 2]) / 2.0
+    return (eigvals[:, 0], eigvals[:, 1], eigvals[:, 2], maxshear)
+
+
 def calculate_principal_stress_reinforced(stress_tensor):
     """Calculate principal stress vectors and values.
 
@@ -796,6 +945,51 @@ def calculate_principal_stress_reinforced(stress_tensor):
     )
 
 
+def calculate_principal_stress_reinforced_array(stress_tensors):
+    """Calculate principal stress vectors and values of many nodes at once.
+    Same as calculate_principal_stress_reinforced() for each row of stress_tensors.
+
+    Parameters
+    ----------
+    stress_tensors : numpy.ndarray
+        one row (Sxx, Syy, Szz, Sxy, Sxz, Syz) per node
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        max, mid and min principal stress, max shear and an array of shape (n, 3, 3)
+        holding the three principal stress vectors of each node
+    """
+    stress_tensors = np.asarray(stress_tensors, dtype=float).reshape(-1, 6)
+    if len(stress_tensors) == 0:
+        empty = np.zeros(0)
+        return (empty, empty, empty, empty, np.zeros((0, 3, 3)))
+
+    eigenvalues, eigenvectors = np.linalg.eig(_stress_matrices(stress_tensors))
+
+    #
+    #   suppress complex eigenvalue and vectors that may occur for
+    #   near-zero (numerical noise) stress fields
+    #
+
+    eigenvalues = eigenvalues.real
+    eigenvectors = eigenvectors.real * eigenvalues[:, np.newaxis, :]
+
+    idx = eigenvalues.argsort(axis=1)[:, ::-1]
+    eigenvalues = np.take_along_axis(eigenvalues, idx, axis=1)
+    eigenvectors = np.take_along_axis(eigenvectors, idx[:, np.newaxis, :], axis=2)
+
+    maxshear = (eigenvalues[:, 0] - eigenvalues[:, 2]) / 2.0
+
+    return (
+        eigenvalues[:, 0],
+        eigenvalues[:, 1],
+        eigenvalues[:, 2],
+        maxshear,
+        eigenvectors.transpose(0, 2, 1),
+    )
+
+
 def calculate_rho(stress_tensor, fy):
     """Calculation of Reinforcement Ratios and Concrete Stresses
     (in accordance with http://heronjournal.nl/53-4/3.pdf)
@@ -954,6 +1148,114 @@ def calculate_rho(stress_tensor, fy):
     return rhox[eqmin], rhoy[eqmin], rhoz[eqmin]
 
 
+def calculate_rho_array(stress_tensors, fy):
+    """Calculation of Reinforcement Ratios of many nodes at once.
+    Same as calculate_rho() for each row of stress_tensors.
+
+    Parameters
+    ----------
+    - stress_tensors: one row (Sxx, Syy, Szz, Sxy, Sxz, Syz) per node
+    - fy: factored yield strength of reinforcement bars
+
+    Returns the arrays of the reinforcement ratios in x, y and z.
+    """
+    stress_tensors = np.asarray(stress_tensors, dtype=float).reshape(-1, 6)
+    n = len(stress_tensors)
+
+    sxx = stress_tensors[:, 0]
+    syy = stress_tensors[:, 1]
+    szz = stress_tensors[:, 2]
+    sxy = stress_tensors[:, 3]
+    syz = stress_tensors[:, 5]
+    sxz = stress_tensors[:, 4]
+
+    rhox = np.zeros((15, n))
+    rhoy = np.zeros((15, n))
+    rhoz = np.zeros((15, n))
+
+    def solve(rho, row, mask, value):
+        # value is only evaluated where mask is set, like the if clauses of calculate_rho
+        rho[row, mask] = value(mask)
+
+    # squared like a Python float, value**2 calls the C pow() which may round differently
+    # than value * value
+    sxy2 = np.float_power(sxy, 2)
+    syz2 = np.float_power(syz, 2)
+    sxz2 = np.float_power(sxz, 2)
+
+    i3 = sxx * syy * szz + 2 * sxy * sxz * syz - sxx * syz2 - syy * sxz2 - szz * sxy2
+
+    # Solutions (5), (6) and (7)
+    d = sxx * syy - sxy2
+    solve(rhoz, 0, d != 0.0, lambda m: i3[m] / d[m] / fy)
+    d = sxx * szz - sxz2
+    solve(rhoy, 1, d != 0.0, lambda m: i3[m] / d[m] / fy)
+    d = syy * szz - syz2
+    solve(rhox, 2, d != 0.0, lambda m: i3[m] / d[m] / fy)
+
+    # Solutions (9), (10) and (11), each with + and -
+    for s_d, s_1, s_2, s_o, s_1d, s_2d, s_1d2, s_2d2, rho_1, rho_2, row in (
+        (sxx, syy, szz, syz, sxy, sxz, sxy2, sxz2, rhoy, rhoz, 3),
+        (syy, sxx, szz, sxz, sxy, syz, sxy2, syz2, rhox, rhoz, 5),
+        (szz, sxx, syy, sxy, sxz, syz, sxz2, syz2, rhox, rhoy, 7),
+    ):
+        m = s_d != 0.0
+        fc = s_2d[m] * s_1d[m] / s_d[m] - s_o[m]
+        f1 = s_1d2[m] / s_d[m]
+        f2 = s_2d2[m] / s_d[m]
+        rho_1[row, m] = (s_1[m] - f1 + fc) / fy
+        rho_2[row, m] = (s_2[m] - f2 + fc) / fy
+        rho_1[row + 1, m] = (s_1[m] - f1 - fc) / fy
+        rho_2[row + 1, m] = (s_2[m] - f2 - fc) / fy
+
+    # Solutions (13), (14), (15) and (16)
+    rhox[9] = (sxx + sxy + sxz) / fy
+    rhoy[9] = (syy + sxy + syz) / fy
+    rhoz[9] = (szz + sxz + syz) / fy
+
+    rhox[10] = (sxx + sxy - sxz) / fy
+    rhoy[10] = (syy + sxy - syz) / fy
+    rhoz[10] = (szz - sxz - syz) / fy
+
+    rhox[11] = (sxx - sxy - sxz) / fy
+    rhoy[11] = (syy - sxy + syz) / fy
+    rhoz[11] = (szz - sxz + syz) / fy
+
+    rhox[12] = (sxx - sxy + sxz) / fy
+    rhoy[12] = (syy - sxy - syz) / fy
+    rhoz[12] = (szz + sxz - syz) / fy
+
+    # Solution (17)
+    solve(rhox, 13, syz != 0.0, lambda m: (sxx[m] - sxy[m] * sxz[m] / syz[m]) / fy)
+    solve(rhoy, 13, sxz != 0.0, lambda m: (syy[m] - sxy[m] * syz[m] / sxz[m]) / fy)
+    solve(rhoz, 13, sxy != 0.0, lambda m: (szz[m] - sxz[m] * syz[m] / sxy[m]) / fy)
+
+    # Concrete Stresses of all solutions
+    scxx = sxx - rhox * fy
+    scyy = syy - rhoy * fy
+    sczz = szz - rhoz * fy
+    ic1 = scxx + scyy + sczz
+    ic2 = scxx * scyy + scyy * sczz + sczz * scxx - sxy2 - sxz2 - syz2
+    ic3 = scxx * scyy * sczz + 2 * sxy * sxz * syz - scxx * syz2 - scyy * sxz2 - sczz * sxy2
+
+    rsum = rhox + rhoy + rhoz
+    valid = (
+        (rhox >= -1.0e-10)
+        & (rhoy >= -1.0e-10)
+        & (rhoz > -1.0e-10)
+        & (ic1 <= 1.0e-6)
+        & (ic2 >= -1.0e-6)
+        & (ic3 <= 1.0e-6)
+        & (rsum < 1.0e9)
+        & (rsum > 0.0)
+    )
+    # the first solution with the smallest sum, solution (17) if there is none
+    rsum = np.where(valid, rsum, np.inf)
+    eqmin = np.where(valid.any(axis=0), rsum.argmin(axis=0), 14)
+    columns = np.arange(n)
+    return rhox[eqmin, columns], rhoy[eqmin, columns], rhoz[eqmin, columns]
+
+
 def calculate_mohr_coulomb(prin1, prin3, phi, fck):
     """Calculation of Mohr Coulomb yield criterion to judge
     concrete crushing and shear failure.
@@ -974,9 +1276,24 @@ def calculate_mohr_coulomb(prin1, prin3, phi, fck):
     return mc_stress
 
 
+def calculate_mohr_coulomb_array(prin1, prin3, phi, fck):
+    """Calculation of Mohr Coulomb yield criterion of many nodes at once.
+    Same as calculate_mohr_coulomb() for each item of prin1 and prin3.
+    """
+
+    prin1 = np.asarray(prin1, dtype=float)
+    prin3 = np.asarray(prin3, dtype=float)
+    coh = fck * (1 - np.sin(phi)) / 2 / np.cos(phi)
+
+    mc_stress = (prin1 - prin3) + (prin1 + prin3) * np.sin(phi) - 2.0 * coh * np.cos(phi)
+
+    return np.where(mc_stress < 0.0, 0.0, mc_stress)
+
+
 def calculate_disp_abs(displacements):
     # see https://forum.freecad.org/viewtopic.php?f=18&t=33106&start=100#p296657
-    return [np.linalg.norm(nd) for nd in displacements]
+    displacements = np.asarray(displacements, dtype=float).reshape(-1, 3)
+    return _norms(displacements).tolist()
 
 
 ##  @}
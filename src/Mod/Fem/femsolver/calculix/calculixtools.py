@@ -103,6 +103,7 @@ class CalculiXTools:
             meshdatagetter.member,
             self.obj.WorkingDirectory,
             meshdatagetter.mat_geo_sets,
+            meshdatagetter.femmesh_fingerprint,
         )
         self.model_file = w.write_solver_input()
         # report to user if task succeeded
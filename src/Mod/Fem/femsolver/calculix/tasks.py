@@ -96,6 +96,7 @@ class Prepare(run.Prepare):
             meshdatagetter.member,
             self.directory,
             meshdatagetter.mat_geo_sets,
+            meshdatagetter.femmesh_fingerprint,
         )
         path = w.write_solver_input()
         # report to user if task succeeded
@@ -29,6 +29,8 @@ __url__ = "https://www.freecad.org"
 import codecs
 from os.path import join
 
+import FreeCAD
+
 from femmesh import meshtools
 
 
@@ -68,14 +70,24 @@ def write_mesh(ccxwriter):
         file_name_split = ccxwriter.mesh_name + "_" + write_name + ".inp"
         ccxwriter.femmesh_file = join(ccxwriter.dir_name, file_name_split)
 
-        ccxwriter.femmesh.writeABAQUS(
-            ccxwriter.femmesh_file,
-            element_param,
-            group_param,
-            volVariant=vol_variant,
-            faceVariant=face_variant,
-            edgeVariant=edge_variant,
-        )
+        # the mesh file is modified for liquid fluid sections, thus it is not reused
+        fingerprint = None
+        if not ccxwriter.member.geos_fluidsection:
+            fingerprint = ccxwriter.get_input_fingerprint(
+                write_name, vol_variant, face_variant, edge_variant
+            )
+        if ccxwriter.is_input_file_unchanged(ccxwriter.femmesh_file, fingerprint):
+            FreeCAD.Console.PrintMessage(f"Unchanged input file reused: {file_name_split}\n")
+        else:
+            ccxwriter.femmesh.writeABAQUS(
+                ccxwriter.femmesh_file,
+                element_param,
+                group_param,
+                volVariant=vol_variant,
+                faceVariant=face_variant,
+                edgeVariant=edge_variant,
+            )
+            ccxwriter.set_input_file_fingerprint(ccxwriter.femmesh_file, fingerprint)
 
         inpfile = codecs.open(ccxwriter.file_name, "w", encoding="utf-8")
         inpfile.write("{}\n".format(59 * "*"))
@@ -112,10 +112,24 @@ units_information = """*********************************************************
 
 class FemInputWriterCcx(writerbase.FemInputWriter):
     def __init__(
-        self, analysis_obj, solver_obj, mesh_obj, member, dir_name=None, mat_geo_sets=None
+        self,
+        analysis_obj,
+        solver_obj,
+        mesh_obj,
+        member,
+        dir_name=None,
+        mat_geo_sets=None,
+        femmesh_fingerprint=None,
     ):
         writerbase.FemInputWriter.__init__(
-            self, analysis_obj, solver_obj, mesh_obj, member, dir_name, mat_geo_sets
+            self,
+            analysis_obj,
+            solver_obj,
+            mesh_obj,
+            member,
+            dir_name,
+            mat_geo_sets,
+            femmesh_fingerprint,
         )
         self.mesh_name = self.mesh_object.Name
         self.file_name = join(self.dir_name, self.mesh_name + ".inp")
@@ -135,6 +149,8 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
         if self.solver_obj.SplitInputWriter is True:
             FreeCAD.Console.PrintMessage("Split input file.\n")
             self.split_inpfile = True
+            # unchanged mesh and mesh sets files of a former run are reused
+            self.load_input_cache()
         else:
             FreeCAD.Console.PrintMessage("One monster input file.\n")
             self.split_inpfile = False
@@ -222,6 +238,8 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
 
         # close file
         inpfile.close()
+        if self.split_inpfile:
+            self.save_input_cache()
 
         writetime = round((time.process_time() - time_start), 3)
         FreeCAD.Console.PrintMessage(f"Writing time CalculiX input file: {writetime} seconds.\n")
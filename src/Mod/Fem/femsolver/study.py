@@ -0,0 +1,495 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+# ***************************************************************************
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Run parameter studies of an analysis.
+
+A study runs the solver of an analysis once for each variant of a table of
+parameter variations. The input of all variants is written one after the other,
+because it is taken from the document. The solver processes of the variants run
+concurrently, as many at the same time as the core budget of the study allows.
+The results are read from the result files of the working directories of the
+variants and collected in a summary table, no result objects are created.
+
+The study does not need the GUI and can be run from FreeCADCmd::
+
+    from femsolver.study import Study
+
+    variations = [
+        {"ConstraintForce.Force": "1000 N"},
+        {"ConstraintForce.Force": "2000 N"},
+        {"ConstraintForce.Force": "2000 N", "FemMaterial.Material": material},
+    ]
+    study = Study(doc.CalculiXCcxTools, variations, cores=4)
+    study.run()
+    print(study.format_summary())
+
+Supported are the CalculiX, the Elmer and the Z88 solver objects.
+"""
+
+__title__ = "FreeCAD FEM solver study"
+__author__ = "Markus Hovorka, Bernd Hahnebach"
+__url__ = "https://www.freecad.org"
+
+## \addtogroup FEM
+#  @{
+
+import csv
+import os
+import os.path
+import subprocess
+import tempfile
+import threading
+import time
+
+import FreeCAD
+
+from . import settings
+from femtools import femutils
+from femtools import membertools
+
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+ABORTED = "aborted"
+
+_CALCULIX_TYPES = ("Fem::SolverCcxTools", "Fem::SolverCalculiX", "Fem::SolverCalculix")
+_ELMER_TYPES = ("Fem::SolverElmer",)
+_Z88_TYPES = ("Fem::SolverZ88",)
+
+SUMMARY_FILE_NAME = "study_summary.csv"
+
+
+class Variant:
+    """One run of the solver of a study.
+
+    name ... name of the variant, the name of its working directory too
+    parameters ... "Object.Property" --> value, applied to the document for the input
+    directory ... working directory of the variant
+    input_deck ... name of the input file without extension, if the solver needs one
+    commands ... command lines, run one after the other in the working directory
+    environment ... environment variables of the solver processes
+    cores ... number of cores a solver process of the variant uses
+    state ... PENDING, RUNNING, DONE, FAILED or ABORTED
+    time ... wall time of the solver processes in seconds
+    results ... result name --> value, for example "Uabs max"
+    error ... description of the failure
+    """
+
+    def __init__(self, name, parameters, directory):
+        self.name = name
+        self.parameters = parameters
+        self.directory = directory
+        self.input_deck = None
+        self.commands = []
+        self.environment = {}
+        self.cores = 1
+        self.state = PENDING
+        self.time = None
+        self.results = {}
+        self.error = ""
+        self.process = None
+
+
+class _CoreBudget:
+    """Counts the cores used by the running solver processes."""
+
+    def __init__(self, cores):
+        self.cores = cores
+        self.used = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, cores):
+        # a variant which needs more cores than the budget runs alone
+        cores = min(cores, self.cores)
+        with self._condition:
+            self._condition.wait_for(lambda: self.used + cores <= self.cores)
+            self.used += cores
+        return cores
+
+    def release(self, cores):
+        with self._condition:
+            self.used -= cores
+            self._condition.notify_all()
+
+
+class Study:
+    """Parameter study of the analysis of solver.
+
+    solver ... a CalculiX, Elmer or Z88 solver object, its analysis is run
+    variations ... list of dictionaries "Object.Property" --> value, one per variant,
+        Object is the Name of a document object
+    directory ... study directory, the variants are written into subdirectories,
+        a temporary directory if not given
+    cores ... core budget of the concurrently running solver processes, the preference
+        NumOfStudyCores of the FEM General settings if not given
+    solver_command ... replaces the solver binary, a list of the program and its first
+        arguments, for example a Python interpreter and a script which fakes the solver
+    """
+
+    def __init__(self, solver, variations, directory=None, cores=None, solver_command=None):
+        self.solver = solver
+        self.analysis = solver.getParentGroup()
+        self.document = solver.Document
+        if directory is None:
+            directory = tempfile.mkdtemp(prefix="fem_study_")
+        self.directory = directory
+        if cores is None:
+            prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/General")
+            cores = prefs.GetInt("NumOfStudyCores", os.cpu_count() or 1)
+        self.cores = max(1, cores)
+        self.solver_command = solver_command
+        self.variants = []
+        for i, parameters in enumerate(variations):
+            name = f"Variant_{i:03d}"
+            self.variants.append(Variant(name, dict(parameters), os.path.join(directory, name)))
+        self._aborted = False
+        self._lock = threading.Lock()
+
+        if femutils.is_of_type(solver, *_CALCULIX_TYPES):
+            self._prepare_solver = self._prepare_calculix
+            self._read_results = self._read_calculix_results
+        elif femutils.is_of_type(solver, *_ELMER_TYPES):
+            self._prepare_solver = self._prepare_elmer
+            self._read_results = self._read_elmer_results
+        elif femutils.is_of_type(solver, *_Z88_TYPES):
+            self._prepare_solver = self._prepare_z88
+            self._read_results = self._read_z88_results
+        else:
+            raise TypeError(f"Solver {solver.Label} is not supported by studies.")
+
+    # ********************************************************************************************
+    def run(self):
+        """Prepare, solve and collect the results of all variants, blocks until all are done.
+
+        Returns the summary table, see get_summary().
+        """
+        self.prepare()
+        self.solve()
+        self.write_summary()
+        return self.get_summary()
+
+    def abort(self):
+        """Terminate the running solver processes, the pending variants are not started."""
+        with self._lock:
+            self._aborted = True
+            for variant in self.variants:
+                if variant.process is not None:
+                    variant.process.terminate()
+
+    # ********************************************************************************************
+    # prepare
+    def prepare(self):
+        """Write the solver input of all variants.
+
+        The parameters of a variant are applied to the document while its input is written,
+        afterwards the former values are restored.
+        """
+        for variant in self.variants:
+            os.makedirs(variant.directory, exist_ok=True)
+            FreeCAD.Console.PrintMessage(f"Study: writing input of {variant.name}.\n")
+            former_values = {}
+            try:
+                for key, value in variant.parameters.items():
+                    obj, prop = self._get_property(key)
+                    former_values[key] = getattr(obj, prop)
+                    setattr(obj, prop, value)
+                self.document.recompute()
+                self._prepare_solver(variant)
+            except Exception as e:
+                variant.state = FAILED
+                variant.error = f"Writing the input failed: {e}"
+                FreeCAD.Console.PrintError(f"Study: {variant.name}: {variant.error}\n")
+            finally:
+                for key, value in former_values.items():
+                    obj, prop = self._get_property(key)
+                    setattr(obj, prop, value)
+        self.document.recompute()
+
+    def _get_property(self, key):
+        obj_name, _, prop = key.partition(".")
+        obj = self.document.getObject(obj_name)
+        if obj is None:
+            raise ValueError(f"No object {obj_name} in document {self.document.Name}.")
+        if prop not in obj.PropertiesList:
+            raise ValueError(f"Object {obj_name} has no property {prop}.")
+        return obj, prop
+
+    def _get_binary(self, name, default):
+        if self.solver_command is not None:
+            return list(self.solver_command)
+        binary = settings.get_binary(name)
+        if binary is None:
+            raise RuntimeError(f"The {default} binary has not been found.")
+        return [binary]
+
+    def _prepare_calculix(self, variant):
+        from .calculix import writer
+        from femmesh import meshsetsgetter
+
+        mesh_obj = membertools.get_mesh_to_solve(self.analysis)[0]
+        meshdatagetter = meshsetsgetter.MeshSetsGetter(
+            self.analysis,
+            self.solver,
+            mesh_obj,
+            membertools.AnalysisMember(self.analysis),
+        )
+        meshdatagetter.get_mesh_sets()
+        w = writer.FemInputWriterCcx(
+            self.analysis,
+            self.solver,
+            mesh_obj,
+            meshdatagetter.member,
+            variant.directory,
+            meshdatagetter.mat_geo_sets,
+            meshdatagetter.femmesh_fingerprint,
+        )
+        input_file = w.write_solver_input()
+        if not input_file or not os.path.isfile(input_file):
+            raise RuntimeError("No solver input was written.")
+        variant.input_deck = os.path.splitext(os.path.basename(input_file))[0]
+
+        prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/Ccx")
+        variant.cores = prefs.GetInt("AnalysisNumCPUs", 1)
+        variant.environment["OMP_NUM_THREADS"] = str(variant.cores)
+        if hasattr(self.solver, "PastixMixedPrecision"):
+            pastix_prec = "1" if self.solver.PastixMixedPrecision else "0"
+            variant.environment["PASTIX_MIXED_PRECISION"] = pastix_prec
+        variant.commands = [self._get_binary("Calculix", "CalculiX") + ["-i", variant.input_deck]]
+
+    def _prepare_elmer(self, variant):
+        from .elmer import writer
+
+        w = writer.Writer(self.solver, variant.directory)
+        w.write_solver_input()
+        mesh = w.getSingleMember("Fem::FemMeshObject")
+        if not mesh.FemMesh.Groups:
+            raise ValueError(f"Mesh object '{mesh.Label}' has no groups, please remesh")
+        mesh_file = os.path.join(variant.directory, "mesh.unv")
+        mesh.FemMesh.write(mesh_file)
+
+        # a study runs one solver task per variant, NumberOfTasks is not used
+        prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/Elmer")
+        variant.cores = prefs.GetInt("ThreadsPerTask", 1)
+        variant.environment["OMP_NUM_THREADS"] = str(variant.cores)
+        if self.solver_command is None:
+            grid_command = self._get_binary("ElmerGrid", "ElmerGrid")
+            grid_command += ["8", "2", mesh_file, "-out", variant.directory]
+            variant.commands.append(grid_command)
+        variant.commands.append(self._get_binary("ElmerSolver", "ElmerSolver"))
+
+    def _prepare_z88(self, variant):
+        from .z88 import writer
+        from .z88.tasks import SOLVER_TYPES
+        from femmesh import meshsetsgetter
+
+        mesh_obj = membertools.get_mesh_to_solve(self.analysis)[0]
+        meshdatagetter = meshsetsgetter.MeshSetsGetter(
+            self.analysis,
+            self.solver,
+            mesh_obj,
+            membertools.AnalysisMember(self.analysis),
+        )
+        meshdatagetter.get_mesh_sets()
+        w = writer.FemInputWriterZ88(
+            self.analysis, self.solver, mesh_obj, meshdatagetter.member, variant.directory
+        )
+        if w.write_solver_input() is None:
+            raise RuntimeError("No solver input was written.")
+
+        prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/Z88")
+        solver_name = SOLVER_TYPES[prefs.GetInt("Solver", 0)]
+        # z88r runs in test mode first and in real mode afterwards
+        binary = self._get_binary("Z88", "z88r")
+        variant.commands = [binary + ["-t", "-" + solver_name], binary + ["-c", "-" + solver_name]]
+
+    # ********************************************************************************************
+    # solve
+    def solve(self):
+        """Run the solver processes of all prepared variants, blocks until all are done.
+
+        Each variant runs in a thread of its own, which waits until the cores for its
+        solver process are free, runs the process and reads the results.
+        """
+        budget = _CoreBudget(self.cores)
+        threads = []
+        for variant in self.variants:
+            if variant.state != PENDING:
+                continue
+            thread = threading.Thread(target=self._run_variant, args=(variant, budget))
+            thread.daemon = True
+            thread.start()
+            threads.append(thread)
+        for thread in threads:
+            thread.join()
+        for variant in self.variants:
+            message = f"Study: {variant.name} {variant.state}"
+            if variant.time is not None:
+                message += f" in {variant.time:.3f} seconds"
+            FreeCAD.Console.PrintMessage(message + ".\n")
+
+    def _run_variant(self, variant, budget):
+        cores = budget.acquire(variant.cores)
+        try:
+            start = time.perf_counter()
+            env = dict(os.environ, **variant.environment)
+            for command in variant.commands:
+                with self._lock:
+                    if self._aborted:
+                        variant.state = ABORTED
+                        return
+                    variant.state = RUNNING
+                    variant.process = subprocess.Popen(
+                        command,
+                        cwd=variant.directory,
+                        env=env,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.PIPE,
+                        startupinfo=femutils.startProgramInfo("hide"),
+                    )
+                out, err = variant.process.communicate()
+                with open(os.path.join(variant.directory, "solver_output.txt"), "ab") as f:
+                    f.write(out)
+                    f.write(err)
+                returncode = variant.process.returncode
+                variant.process = None
+                if self._aborted:
+                    variant.state = ABORTED
+                    return
+                if returncode != 0:
+                    variant.state = FAILED
+                    variant.error = f"{os.path.basename(command[0])} returned {returncode}"
+                    return
+            variant.time = time.perf_counter() - start
+        except Exception as e:
+            variant.state = FAILED
+            variant.error = str(e)
+            return
+        finally:
+            budget.release(cores)
+
+        # reading the results needs no cores of the budget
+        try:
+            variant.results = self._read_results(variant)
+            variant.state = DONE
+        except Exception as e:
+            variant.state = FAILED
+            variant.error = f"Reading the results failed: {e}"
+
+    # ********************************************************************************************
+    # results
+    def _read_calculix_results(self, variant):
+        import numpy as np
+
+        from feminout.readCcxFrd import FrdFile
+        from femresult.resulttools import calculate_von_mises_array
+
+        frd_file = os.path.join(variant.directory, variant.input_deck + ".frd")
+        results = {}
+        with FrdFile(frd_file) as frd:
+            if not frd.steps:
+                raise ValueError(f"No results in {frd_file}")
+            # the results of the last step, the last time step of a nonlinear analysis
+            step = frd.steps[-1]
+            if "disp" in step.blocks:
+                disp = step.read("disp").data
+                results["Uabs max"] = float(np.linalg.norm(disp, axis=1).max(initial=0.0))
+            if "stress" in step.blocks:
+                von_mises = calculate_von_mises_array(step.read("stress").data)
+                results["von Mises max"] = float(von_mises.max(initial=0.0))
+            if "temp" in step.blocks:
+                temp = step.read("temp").data
+                results["Temp min"] = float(temp.min(initial=np.inf))
+                results["Temp max"] = float(temp.max(initial=-np.inf))
+            if "peeq" in step.blocks:
+                results["Peeq max"] = float(step.read("peeq").data.max(initial=0.0))
+        return results
+
+    def _read_elmer_results(self, variant):
+        # the results are vtk files, only their existence is checked
+        result_files = [
+            f
+            for f in os.listdir(variant.directory)
+            if os.path.splitext(f)[1] in (".vtu", ".pvtu", ".pvd")
+        ]
+        if not result_files:
+            raise ValueError(f"No results in {variant.directory}")
+        return {}
+
+    def _read_z88_results(self, variant):
+        from feminout.importZ88O2Results import read_z88_disp
+
+        disp_file = os.path.join(variant.directory, "z88o2.txt")
+        disp = read_z88_disp(disp_file)["Results"][0]["disp"]
+        return {"Uabs max": max((v.Length for v in disp.values()), default=0.0)}
+
+    def get_summary(self):
+        """Returns the summary table as list of rows, the first row is the header.
+
+        There is one row per variant with its name, its parameters, its state, the wall time
+        of the solver and its results. Missing values are None.
+        """
+        parameter_keys = []
+        result_keys = []
+        for variant in self.variants:
+            parameter_keys += [key for key in variant.parameters if key not in parameter_keys]
+            result_keys += [key for key in variant.results if key not in result_keys]
+        table = [["Variant"] + parameter_keys + ["State", "Time"] + result_keys]
+        for variant in self.variants:
+            row = [variant.name]
+            row += [variant.parameters.get(key) for key in parameter_keys]
+            row += [variant.state, variant.time]
+            row += [variant.results.get(key) for key in result_keys]
+            table.append(row)
+        return table
+
+    def format_summary(self):
+        """Returns the summary table as text with aligned columns."""
+        rows = []
+        for row in self.get_summary():
+            cells = []
+            for value in row:
+                if value is None:
+                    cells.append("-")
+                elif isinstance(value, float):
+                    cells.append(f"{value:.6g}")
+                else:
+                    cells.append(str(value))
+            rows.append(cells)
+        widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+        return "\n".join(
+            "  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+            for row in rows
+        )
+
+    def write_summary(self, file_name=None):
+        """Writes the summary table as csv file, into the study directory if not given."""
+        if file_name is None:
+            file_name = os.path.join(self.directory, SUMMARY_FILE_NAME)
+        with open(file_name, "w", newline="") as f:
+            csv.writer(f).writerows(self.get_summary())
+        return file_name
+
+
+##  @}
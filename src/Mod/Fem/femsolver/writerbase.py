@@ -28,23 +28,34 @@ __url__ = "https://www.freecad.org"
 ## \addtogroup FEM
 #  @{
 
+import json
 import os
 from os.path import join
 
 import FreeCAD
 
 from femmesh import meshsetsgetter
+from femtools import femutils
 
 
 class FemInputWriter:
     def __init__(
-        self, analysis_obj, solver_obj, mesh_obj, member, dir_name=None, mat_geo_sets=None
+        self,
+        analysis_obj,
+        solver_obj,
+        mesh_obj,
+        member,
+        dir_name=None,
+        mat_geo_sets=None,
+        femmesh_fingerprint=None,
     ):
         # class attributes from parameter values
         self.analysis = analysis_obj
         self.solver_obj = solver_obj
         self.mesh_object = mesh_obj
         self.member = member
+        # fingerprint of the mesh from the MeshSetsGetter, without it input files are not reused
+        self.femmesh_fingerprint = femmesh_fingerprint
         # more attributes
         self.analysis_type = self.solver_obj.AnalysisType
         self.document = self.analysis.Document
@@ -73,6 +84,9 @@ class FemInputWriter:
                 f"The working directory '{dir_name}' was created and will be used."
             )
         self.dir_name = dir_name
+        # fingerprints of the split input files written into dir_name
+        self.input_cache_file = join(self.dir_name, "fem_input_cache.json")
+        self.input_cache = {}
 
         # new class attributes
         self.fc_ver = FreeCAD.Version()
@@ -132,13 +146,63 @@ class FemInputWriter:
         self.electricchargedensity_objects = member.cons_electricchargedensity
 
         # meshdatagetter, for compatibility, same with all getter methods
-        self.meshdatagetter = meshsetsgetter.MeshSetsGetter(
-            self.analysis,
-            self.solver_obj,
-            self.mesh_object,
-            self.member,
+        self._meshdatagetter = None
+
+    @property
+    def meshdatagetter(self):
+        # only created if a deprecated getter method is used, it loads the mesh tables again
+        if self._meshdatagetter is None:
+            self._meshdatagetter = meshsetsgetter.MeshSetsGetter(
+                self.analysis,
+                self.solver_obj,
+                self.mesh_object,
+                self.member,
+            )
+        return self._meshdatagetter
+
+    # ********************************************************************************************
+    # ********************************************************************************************
+    # reuse of split input files written by a former run into the working dir
+    def load_input_cache(self):
+        try:
+            with open(self.input_cache_file) as f:
+                self.input_cache = json.load(f)
+        except (OSError, ValueError):
+            self.input_cache = {}
+        # the cache is written again after all input files are written
+        # thus no file is reused after an aborted writing
+        if os.path.isfile(self.input_cache_file):
+            os.remove(self.input_cache_file)
+
+    def save_input_cache(self):
+        with open(self.input_cache_file, "w") as f:
+            json.dump(self.input_cache, f, indent=1)
+
+    def get_input_fingerprint(self, *values):
+        """fingerprint of an input file with the mesh, the solver and the analysis members
+        None if there is no mesh fingerprint, thus the file is always written
+        """
+        if not self.femmesh_fingerprint:
+            return None
+        return femutils.get_fingerprint(
+            self.femmesh_fingerprint,
+            femutils.get_obj_fingerprint(self.solver_obj),
+            [obj.Name for obj in self.analysis.Group],
+            values,
         )
 
+    def is_input_file_unchanged(self, file_name, fingerprint):
+        """True if file_name was written with the same fingerprint by a former run"""
+        return (
+            fingerprint is not None
+            and self.input_cache.get(os.path.basename(file_name)) == fingerprint
+            and os.path.isfile(file_name)
+        )
+
+    def set_input_file_fingerprint(self, file_name, fingerprint):
+        if fingerprint is not None:
+            self.input_cache[os.path.basename(file_name)] = fingerprint
+
     # ********************************************************************************************
     # ********************************************************************************************
     # generic writer for constraints mesh sets and constraints property data
@@ -173,9 +237,19 @@ class FemInputWriter:
         if self.split_inpfile is True:
             file_name_split = f"{self.mesh_name}_{write_name}.inp"
             f.write(f"*INCLUDE,INPUT={file_name_split}\n")
-            inpfile_split = open(join(self.dir_name, file_name_split), "w")
+            file_path = join(self.dir_name, file_name_split)
+            fingerprint = self.get_input_fingerprint(
+                write_name,
+                self.analysis_type,
+                [femutils.get_obj_fingerprint(femobj["Object"]) for femobj in femobjs],
+            )
+            if self.is_input_file_unchanged(file_path, fingerprint):
+                FreeCAD.Console.PrintMessage(f"Unchanged input file reused: {file_name_split}\n")
+                return
+            inpfile_split = open(file_path, "w")
             constraint_sets_loop_writing(inpfile_split, femobjs, write_before, write_after)
             inpfile_split.close()
+            self.set_input_file_fingerprint(file_path, fingerprint)
         else:
             constraint_sets_loop_writing(f, femobjs, write_before, write_after)
 
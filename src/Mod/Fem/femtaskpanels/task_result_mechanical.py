@@ -66,6 +66,9 @@ class _TaskPanel:
 
     def __init__(self, obj):
         self.result_obj = obj
+        # node data of lazy stored results is loaded when the result is shown
+        resulttools.load_result_data(self.result_obj)
+        self.node_data_changed = False
         self.mesh_obj = self.result_obj.Mesh
         # task panel should be started by use of setEdit of view provider
         # in view provider checks: Mesh, active analysis and
@@ -588,6 +591,7 @@ class _TaskPanel:
 
         if UserDefinedFormula:
             self.result_obj.UserDefined = UserDefinedFormula
+            self.node_data_changed = True
             minm = min(UserDefinedFormula)
             maxm = max(UserDefinedFormula)
             self.update_colors_stats(UserDefinedFormula, "", minm, maxm)
@@ -798,6 +802,11 @@ class _TaskPanel:
             FreeCAD.FEM_dialog["animate"][4] = self.result_widget.sb_displacement_factor.value()
         except:
             FreeCAD.FEM_dialog["animate"][4] = 1
+        # free the memory of lazy stored node data, changed node data is stored again
+        if resulttools.is_result_data_stored(self.result_obj):
+            if self.node_data_changed:
+                resulttools.store_result_data(self.result_obj)
+            resulttools.unload_result_data(self.result_obj)
 
     # animation start
 
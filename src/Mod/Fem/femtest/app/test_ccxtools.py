@@ -211,6 +211,90 @@ class TestCcxTools(unittest.TestCase):
         setup(self.document, "ccxtools")
         self.input_file_writing_test(get_namefromdef("test_"))
 
+    # ********************************************************************************************
+    def test_ccx_cantilever_faceload_split_input_reuse(self):
+        import os
+
+        from femexamples.ccx_cantilever_faceload import setup
+
+        setup(self.document, "ccxtools")
+        self.document.CalculiXCcxTools.SplitInputWriter = True
+        base_name = get_namefromdef("test_")
+        analysis_dir = testtools.get_fem_test_tmp_dir(self.pre_dir_name + base_name)
+        fea = ccxtools.FemToolsCcx(
+            self.document.Analysis, self.document.CalculiXCcxTools, test_mode=True
+        )
+        fea.update_objects()
+        fea.setup_working_dir(analysis_dir)
+
+        mesh_file = join(analysis_dir, self.mesh_name + "_femesh.inp")
+        fixed_file = join(analysis_dir, self.mesh_name + "_constraints_fixed_node_sets.inp")
+        force_file = join(analysis_dir, self.mesh_name + "_constraints_force_node_loads.inp")
+
+        def read(file_name):
+            with open(file_name) as f:
+                return f.read()
+
+        fea.write_inp_file()
+        mesh_mtime = os.stat(mesh_file).st_mtime_ns
+        fixed_mtime = os.stat(fixed_file).st_mtime_ns
+        force_input = read(force_file)
+
+        # only the force magnitude has changed, mesh and node sets are reused
+        self.document.ConstraintForce.Force = "4500000.0 N"
+        fea.write_inp_file()
+        self.assertEqual(os.stat(mesh_file).st_mtime_ns, mesh_mtime)
+        self.assertEqual(os.stat(fixed_file).st_mtime_ns, fixed_mtime)
+        self.assertNotEqual(read(force_file), force_input)
+
+        # back to the former force, the node loads are scaled back
+        self.document.ConstraintForce.Force = "9000000.0 N"
+        fea.write_inp_file()
+        self.assertEqual(read(force_file), force_input)
+
+    # ********************************************************************************************
+    def test_ccx_cantilever_faceload_study(self):
+        from freecad import utils
+        from femexamples.ccx_cantilever_faceload import setup
+        from femsolver.study import Study
+
+        python_exe = utils.get_python_exe()
+        if not python_exe:
+            self.skipTest("No Python interpreter found to run the fake solver.")
+        setup(self.document, "ccxtools")
+        base_name = get_namefromdef("test_")
+        study_dir = testtools.get_fem_test_tmp_dir(self.pre_dir_name + base_name)
+        fake_ccx = join(testtools.get_fem_test_home_dir(), "calculix", "fake_ccx.py")
+        forces = ["1000.0 N", "2000.0 N", "3000.0 N"]
+        study = Study(
+            self.document.CalculiXCcxTools,
+            [{"ConstraintForce.Force": force} for force in forces],
+            directory=study_dir,
+            cores=2,
+            solver_command=[python_exe, fake_ccx],
+        )
+        summary = study.run()
+        fcc_print(study.format_summary())
+
+        # the document is not changed by the study
+        self.assertEqual(float(self.document.ConstraintForce.Force.getValueAs("N")), 9000000.0)
+
+        # one row per variant, the fake solver returns the results of box_static
+        header = summary[0]
+        self.assertEqual(len(summary), len(forces) + 1)
+        for row, force in zip(summary[1:], forces):
+            values = dict(zip(header, row))
+            self.assertEqual(values["ConstraintForce.Force"], force)
+            self.assertEqual(values["State"], "done")
+            self.assertAlmostEqual(values["Uabs max"], 0.0937383460, places=8)
+            self.assertAlmostEqual(values["von Mises max"], 2203.5090958167, places=6)
+        # each variant is written with its own force
+        inputs = set()
+        for variant in study.variants:
+            with open(join(variant.directory, variant.input_deck + ".inp")) as f:
+                inputs.add(f.read())
+        self.assertEqual(len(inputs), len(forces))
+
     # ********************************************************************************************
     def test_ccx_cantilever_prescribeddisplacement(self):
         from femexamples.ccx_cantilever_prescribeddisplacement import setup
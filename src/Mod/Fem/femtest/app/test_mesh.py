@@ -25,6 +25,7 @@ __title__ = "Mesh FEM unit tests"
 __author__ = "Bernd Hahnebach"
 __url__ = "https://www.freecad.org"
 
+import os
 import unittest
 from os.path import join
 
@@ -129,6 +130,53 @@ class TestMeshCommon(unittest.TestCase):
             edge_data, expected_edges, "Edges of Python created seg3 element are unexpected"
         )
 
+    # ********************************************************************************************
+    def test_mesh_bulk_python(self):
+        import array
+
+        # one hexa8 and two tria3 elements, nodes and elements added in bulk
+        coords = [
+            (0, 0, 0),
+            (1, 0, 0),
+            (1, 1, 0),
+            (0, 1, 0),
+            (0, 0, 1),
+            (1, 0, 1),
+            (1, 1, 1),
+            (0, 1, 1),
+        ]
+        bulk = Fem.FemMesh()
+        bulk.addNodes(array.array("d", [c for xyz in coords for c in xyz]), range(11, 19))
+        bulk.addElements("Hexa8", [tuple(range(11, 19))], [5])
+        bulk.addElements("Tria3", [11, 12, 13, 11, 13, 14], array.array("i", [7, 8]))
+
+        single = Fem.FemMesh()
+        for i, xyz in enumerate(coords):
+            single.addNode(*xyz, 11 + i)
+        single.addVolume(list(range(11, 19)), 5)
+        single.addFace([11, 12, 13], 7)
+        single.addFace([11, 13, 14], 8)
+
+        self.assertEqual(bulk.Nodes, single.Nodes)
+        self.assertEqual(bulk.Volumes, (5,))
+        self.assertEqual(bulk.Faces, (7, 8))
+        for elem in (5, 7, 8):
+            self.assertEqual(bulk.getElementNodes(elem), single.getElementNodes(elem))
+
+        # automatic numbering
+        auto = Fem.FemMesh()
+        auto.addNodes([0, 0, 0, 1, 0, 0, 0, 1, 0])
+        auto.addElements("Tria3", [1, 2, 3])
+        self.assertEqual(auto.NodeCount, 3)
+        self.assertEqual(auto.getElementNodes(auto.Faces[0]), (1, 2, 3))
+
+        # invalid input
+        self.assertRaises(ValueError, auto.addNodes, [0, 0])
+        self.assertRaises(ValueError, auto.addNodes, [0, 0, 0], [21, 22])
+        self.assertRaises(ValueError, auto.addElements, "Tria4", [1, 2, 3, 1])
+        self.assertRaises(ValueError, auto.addElements, "Quad4", [1, 2, 3])
+        self.assertRaises(Exception, auto.addElements, "Seg2", [1, 99])
+
     # ********************************************************************************************
     def test_unv_save_load(self):
         tetra10 = Fem.FemMesh()
@@ -192,6 +240,159 @@ class TestMeshCommon(unittest.TestCase):
             f"Problem in test_writeAbaqus_precision, \n{read_node_line}\n{expected}",
         )
 
+    # ********************************************************************************************
+    def test_binary_mesh_save_load(self):
+        from feminout import importBinaryMesh
+
+        from femexamples.meshes.mesh_canticcx_tetra10 import create_elements
+        from femexamples.meshes.mesh_canticcx_tetra10 import create_nodes
+
+        fm = Fem.FemMesh()
+        create_nodes(fm)
+        create_elements(fm)
+        group_id = fm.addGroup("MyVolumeGroup", "Volume")
+        fm.addGroupElements(group_id, list(fm.Volumes[:10]))
+
+        mesh_file = join(testtools.get_fem_test_tmp_dir("mesh_common_binary"), "tetra10.meshbin")
+        importBinaryMesh.write(fm, mesh_file)
+        newmesh = importBinaryMesh.read(mesh_file)
+
+        self.assertEqual(newmesh.Nodes, fm.Nodes)
+        self.assertEqual(newmesh.Volumes, fm.Volumes)
+        for elem in fm.Volumes:
+            self.assertEqual(newmesh.getElementNodes(elem), fm.getElementNodes(elem))
+        self.assertEqual(newmesh.GroupCount, 1)
+        new_group = newmesh.Groups[0]
+        self.assertEqual(newmesh.getGroupName(new_group), "MyVolumeGroup")
+        self.assertEqual(newmesh.getGroupElementType(new_group), "Volume")
+        self.assertEqual(newmesh.getGroupElements(new_group), fm.getGroupElements(group_id))
+
+    # ********************************************************************************************
+    @unittest.skipUnless(os.environ.get("FEM_BENCHMARKS"), "set FEM_BENCHMARKS=1 to run")
+    def test_binary_mesh_benchmark(self):
+        # compares loading an example mesh from its binary mesh file with executing
+        # the same mesh as Python mesh module, as the example meshes were stored before,
+        # with one addNode() and one addFace() call per node and element
+        import time
+        import tracemalloc
+
+        from femexamples.meshes import mesh_contact_tube_tube_tria3 as mesh_module
+
+        try:
+            import resource
+        except ImportError:
+            resource = None
+
+        def measure(create_mesh):
+            rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else 0
+            tracemalloc.start()
+            start = time.perf_counter()
+            femmesh = create_mesh()
+            seconds = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            if resource:
+                rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss
+            return femmesh, seconds, peak, rss
+
+        def create_binary_mesh():
+            femmesh = Fem.FemMesh()
+            mesh_module.create_nodes(femmesh)
+            mesh_module.create_elements(femmesh)
+            return femmesh
+
+        # the binary mesh is loaded first, the peak RSS only grows if the Python
+        # mesh module needs more memory
+        binary_mesh, binary_seconds, binary_peak, binary_rss = measure(create_binary_mesh)
+
+        py_file = join(testtools.get_fem_test_tmp_dir("mesh_common_benchmark"), "mesh.py")
+        with open(py_file, "w") as f:
+            f.write("def create_nodes(femmesh):\n")
+            f.write("    # nodes\n")
+            for node, vec in binary_mesh.Nodes.items():
+                f.write(f"    femmesh.addNode({vec.x}, {vec.y}, {vec.z}, {node})\n")
+            f.write("    return True\n\n\n")
+            f.write("def create_elements(femmesh):\n")
+            f.write("    # elements\n")
+            for face in binary_mesh.Faces:
+                nodes = list(binary_mesh.getElementNodes(face))
+                f.write(f"    femmesh.addFace({nodes}, {face})\n")
+            f.write("    return True\n")
+
+        def create_python_mesh():
+            with open(py_file) as f:
+                code = compile(f.read(), py_file, "exec")
+            module = {}
+            exec(code, module)
+            femmesh = Fem.FemMesh()
+            module["create_nodes"](femmesh)
+            module["create_elements"](femmesh)
+            return femmesh
+
+        python_mesh, python_seconds, python_peak, python_rss = measure(create_python_mesh)
+
+        fcc_print(
+            "\nmesh with {} nodes and {} faces:\n"
+            "binary mesh file: {:.3f} s, peak Python memory {:.1f} MB, peak RSS +{} kB\n"
+            "Python mesh module: {:.3f} s, peak Python memory {:.1f} MB, peak RSS +{} kB".format(
+                binary_mesh.NodeCount,
+                binary_mesh.FaceCount,
+                binary_seconds,
+                binary_peak / 1e6,
+                binary_rss,
+                python_seconds,
+                python_peak / 1e6,
+                python_rss,
+            )
+        )
+        self.assertEqual(python_mesh.Nodes, binary_mesh.Nodes)
+        self.assertEqual(python_mesh.Faces, binary_mesh.Faces)
+
+    # ********************************************************************************************
+    def test_femnodes_ele_table(self):
+        from femmesh import meshtools
+
+        from femexamples.meshes.mesh_canticcx_tetra10 import create_elements
+        from femexamples.meshes.mesh_canticcx_tetra10 import create_nodes
+
+        fm = Fem.FemMesh()
+        create_nodes(fm)
+        create_elements(fm)
+        femelement_table = meshtools.get_femelement_table(fm)
+        femnodes_ele_table = meshtools.get_femnodes_ele_table(fm.Nodes, femelement_table)
+        self.assertEqual(len(femnodes_ele_table), fm.NodeCount)
+
+        # the entries of a node in the layout of the former dict
+        ele = fm.Volumes[0]
+        ele_nodes = fm.getElementNodes(ele)
+        for pos, node in enumerate(ele_nodes):
+            self.assertIn([ele, 1 << pos], femnodes_ele_table[node])
+
+        # all nodes of the first element
+        bit_pattern_dict = meshtools.get_bit_pattern_dict(
+            femelement_table, femnodes_ele_table, ele_nodes
+        )
+        self.assertEqual(bit_pattern_dict[ele], [10, 0b1111111111])
+        self.assertIn(
+            ele, meshtools.get_ccxelement_volumes_elements_from_binary_search(bit_pattern_dict)
+        )
+
+        # the binary search gives the same elements as the standard search
+        node_list = [node for node in fm.Nodes if fm.Nodes[node].x < 2000]
+        bin_elements = meshtools.get_femelements_by_femnodes_bin(
+            femelement_table, femnodes_ele_table, node_list
+        )
+        std_elements = meshtools.get_femelements_by_femnodes_std(femelement_table, node_list)
+        self.assertTrue(bin_elements)
+        self.assertEqual(sorted(bin_elements), std_elements)
+
+        # face 1 of a tetra10 consists of the nodes 1, 2, 3, 5, 6 and 7
+        face_nodes = [ele_nodes[i] for i in (0, 1, 2, 4, 5, 6)]
+        bit_pattern_dict = meshtools.get_bit_pattern_dict(
+            femelement_table, femnodes_ele_table, face_nodes
+        )
+        self.assertIn([ele, 1], meshtools.get_ccxelement_faces_from_binary_search(bit_pattern_dict))
+
 
 # ************************************************************************************************
 # ************************************************************************************************
@@ -112,7 +112,7 @@ class TestResult(unittest.TestCase):
         )
 
     # ********************************************************************************************
-    def test_rho(self):
+    def get_rho_cases(self):
         data = (
             (
                 # Case1: Governing Eq.14
@@ -170,10 +170,13 @@ class TestResult(unittest.TestCase):
                 (0.01000, 0.01000, 0.00000),
             ),
         )
+        return data
 
+    # ********************************************************************************************
+    def test_rho(self):
         from femresult.resulttools import calculate_rho as calrho
 
-        for i, case in enumerate(data):
+        for i, case in enumerate(self.get_rho_cases()):
             res = calrho(case[0], 500)
             rhores = (round(res[0], 5), round(res[1], 5), round(res[2], 5))
             # fcc_print("Case{}: {}".format(i + 1 , rhores))
@@ -191,3 +194,150 @@ class TestResult(unittest.TestCase):
         self.assertEqual(
             disp_abs, expected_dispabs, "Calculated displacement abs are not the expected values."
         )
+
+    # ********************************************************************************************
+    def test_stress_arrays(self):
+        # the functions for many nodes at once return the same values as the ones for one node
+        import numpy as np
+        from femresult import resulttools
+
+        stresses = [self.get_stress_values()] + [case[0] for case in self.get_rho_cases()]
+        stress_array = np.array(stresses)
+
+        mises = resulttools.calculate_von_mises_array(stress_array)
+        std = resulttools.calculate_principal_stress_std_array(stress_array)
+        reinforced = resulttools.calculate_principal_stress_reinforced_array(stress_array)
+        rho = resulttools.calculate_rho_array(stress_array, 500)
+        for i, stress in enumerate(stresses):
+            self.assertEqual(mises[i], resulttools.calculate_von_mises(stress))
+            self.assertEqual(
+                tuple(v[i] for v in std), resulttools.calculate_principal_stress_std(stress)
+            )
+            prin = resulttools.calculate_principal_stress_reinforced(stress)
+            self.assertEqual(tuple(v[i] for v in reinforced[:4]), prin[:4])
+            self.assertEqual(tuple(tuple(v) for v in reinforced[4][i].tolist()), prin[4])
+            self.assertEqual(tuple(v[i] for v in rho), resulttools.calculate_rho(stress, 500))
+
+        # rows containing NaN, which CalculiX writes for some nodes, are NaN
+        stress_array[1, 2] = float("NaN")
+        std = resulttools.calculate_principal_stress_std_array(stress_array)
+        self.assertTrue(all(np.isnan(v[1]) for v in std))
+        self.assertEqual(std[0][0], resulttools.calculate_principal_stress_std(stresses[0])[0])
+
+    # ********************************************************************************************
+    def test_read_frd(self):
+        from feminout.importCcxFrdResults import open_frd_result
+        from feminout.importCcxFrdResults import read_frd_result
+
+        frd_file = join(testtools.get_fem_test_home_dir(), "calculix", "box_static.frd")
+        m = read_frd_result(frd_file)
+        self.assertEqual(len(m["Nodes"]), 280)
+        self.assertEqual(len(m["Tetra10Elem"]), 129)
+        self.assertEqual(len(m["Results"]), 1)
+        result_set = m["Results"][0]
+        self.assertEqual(len(result_set["disp"]), 280)
+        self.assertEqual(list(result_set["stress"]), list(m["Nodes"]))
+        self.assertEqual(len(result_set["stress"].values()[0]), 6)
+
+        # the results of a step are only read when they are requested
+        with open_frd_result(frd_file) as frd:
+            self.assertEqual(len(frd.steps), 1)
+            self.assertEqual(sorted(frd.steps[0].blocks), ["disp", "strain", "stress"])
+            disp = frd.steps[0].read("disp")
+            self.assertEqual(disp.data.shape, (280, 3))
+            self.assertEqual(disp.values(), list(result_set["disp"].values()))
+
+    # ********************************************************************************************
+    def test_lazy_result_storage(self):
+        import ObjectsFem
+        from feminout import importToolsFem
+        from feminout.importCcxFrdResults import read_frd_result
+        from femresult import resulttools
+
+        frd_file = join(testtools.get_fem_test_home_dir(), "calculix", "box_static.frd")
+        result_set = read_frd_result(frd_file)["Results"][0]
+        res_obj = ObjectsFem.makeResultMechanical(self.document, "Result")
+        res_obj = importToolsFem.fill_femresult_mechanical(res_obj, result_set)
+        res_obj = resulttools.add_disp_apps(res_obj)
+        res_obj = resulttools.add_von_mises(res_obj)
+        res_obj = resulttools.fill_femresult_stats(res_obj)
+        von_mises = res_obj.vonMises
+        disp = res_obj.DisplacementVectors
+        stats = res_obj.Stats
+        resulttools.store_result_data(res_obj)
+        self.assertTrue(resulttools.is_result_data_loaded(res_obj))
+
+        # the node data is not saved in the document, but in the ResultData file
+        save_fc_file = join(testtools.get_fem_test_tmp_dir("result_lazy"), "result_lazy.FCStd")
+        self.document.saveAs(save_fc_file)
+        FreeCAD.closeDocument(self.document.Name)
+        self.document = FreeCAD.openDocument(save_fc_file)
+        res_obj = self.document.Result
+        self.assertFalse(resulttools.is_result_data_loaded(res_obj))
+        self.assertEqual(len(res_obj.NodeNumbers), 0)
+        self.assertEqual(len(res_obj.vonMises), 0)
+        self.assertEqual(res_obj.Stats, stats)
+
+        resulttools.load_result_data(res_obj)
+        self.assertEqual(len(res_obj.NodeNumbers), 280)
+        self.assertEqual(res_obj.vonMises, von_mises)
+        self.assertEqual(res_obj.DisplacementVectors, disp)
+        resulttools.unload_result_data(res_obj)
+        self.assertFalse(resulttools.is_result_data_loaded(res_obj))
+
+    # ********************************************************************************************
+    def test_lazy_result_storage_reopen(self):
+        import ObjectsFem
+        from feminout import importCcxFrdResults
+        from femmesh import femmesh2mesh
+        from femresult import resulttools
+
+        frd_file = join(testtools.get_fem_test_home_dir(), "calculix", "box_static.frd")
+        param = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/General")
+        lazy_result_storage = param.GetBool("LazyResultStorage", False)
+        param.SetBool("LazyResultStorage", True)
+        try:
+            analysis = ObjectsFem.makeAnalysis(self.document, "Analysis")
+            importCcxFrdResults.importFrd(frd_file, analysis)
+        finally:
+            param.SetBool("LazyResultStorage", lazy_result_storage)
+        res_obj = self.document.Results
+        self.assertTrue(resulttools.is_result_data_stored(res_obj))
+        out_mesh = femmesh2mesh.femmesh_2_mesh(res_obj.Mesh.FemMesh, res_obj)
+
+        save_fc_file = join(
+            testtools.get_fem_test_tmp_dir("result_lazy_reopen"), "result_lazy_reopen.FCStd"
+        )
+        self.document.saveAs(save_fc_file)
+        FreeCAD.closeDocument(self.document.Name)
+        self.document = FreeCAD.openDocument(save_fc_file)
+        res_obj = self.document.Results
+        self.assertFalse(resulttools.is_result_data_loaded(res_obj))
+
+        # the users of the node data load it on demand
+        self.assertEqual(femmesh2mesh.femmesh_2_mesh(res_obj.Mesh.FemMesh, res_obj), out_mesh)
+        self.assertTrue(resulttools.is_result_data_loaded(res_obj))
+        if "BUILD_FEM_VTK" in FreeCAD.__cmake__:
+            resulttools.unload_result_data(res_obj)
+            ObjectsFem.makePostVtkResult(self.document, [res_obj])
+            self.assertTrue(resulttools.is_result_data_loaded(res_obj))
+
+    # ********************************************************************************************
+    def test_frd_floats(self):
+        import numpy as np
+        from feminout.readCcxFrd import parse_floats
+
+        fields = [
+            b" 1.23456E+02",
+            b"-9.87654E-01",
+            b"-0.00000E+00",
+            b" 1.00001E-30",
+            b" 3.14159E+25",
+            b"   -NAN(IND)",
+        ]
+        chars = np.frombuffer(b"".join(fields), dtype=np.uint8).reshape(2, 3, 12)
+        values = parse_floats(chars).ravel()
+        for field, value in zip(fields[:-1], values[:-1]):
+            self.assertEqual(value, float(field))
+        self.assertTrue(np.signbit(values[2]))
+        self.assertTrue(np.isnan(values[-1]))
@@ -0,0 +1,53 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+# ***************************************************************************
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Fake CalculiX solver for the unit tests of solver runs.
+
+Called like ccx, "fake_ccx.py -i jobname", in the working directory of the job.
+It checks that the input file jobname.inp exists and writes the results of
+box_static as jobname.frd and jobname.dat, without any computation. It is run
+by a plain Python interpreter, FreeCAD is not imported.
+"""
+
+import os
+import shutil
+import sys
+
+
+def main(argv):
+    if len(argv) != 3 or argv[1] != "-i":
+        print("usage: fake_ccx.py -i jobname", file=sys.stderr)
+        return 2
+    job_name = argv[2]
+    if not os.path.isfile(job_name + ".inp"):
+        print(f"input file {job_name}.inp not found", file=sys.stderr)
+        return 1
+    data_dir = os.path.dirname(os.path.abspath(__file__))
+    for ext in (".frd", ".dat"):
+        shutil.copyfile(os.path.join(data_dir, "box_static" + ext), job_name + ext)
+    print(f"fake ccx job {job_name} finished")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -381,6 +381,7 @@ class FemToolsCcx(QtCore.QRunnable, QtCore.QObject):
                 meshdatagetter.member,
                 self.working_dir,
                 meshdatagetter.mat_geo_sets,
+                meshdatagetter.femmesh_fingerprint,
             )
             self.inp_file_name = inp_writer.write_solver_input()
         except Exception:
@@ -32,6 +32,7 @@ __title__ = "FEM Utilities"
 __author__ = "Markus Hovorka, Bernd Hahnebach, Uwe Stöhr"
 __url__ = "https://www.freecad.org"
 
+import hashlib
 import os
 import subprocess
 from platform import system
@@ -231,6 +232,40 @@ def make_dir(specific_path):
     return specific_path
 
 
+# ************************************************************************************************
+# fingerprints
+def get_fingerprint(*values):
+    """Return a hex digest of *values* to find out if input data has changed.
+
+    Lists, tuples and dicts are compared by their items. Document objects are
+    compared by their name and, if they have a shape, by their placement and the
+    bounding box of their shape. Thus the fingerprint of the references of a
+    constraint changes if the referenced geometry is moved or modified.
+    """
+    return hashlib.sha1(repr(_get_fingerprint_value(values)).encode()).hexdigest()
+
+
+def get_obj_fingerprint(obj, skip=("ExpressionEngine", "Label2", "Proxy", "Visibility")):
+    """Return a fingerprint of the values of all properties of *obj*."""
+    props = [(prop, getattr(obj, prop)) for prop in sorted(obj.PropertiesList) if prop not in skip]
+    return get_fingerprint(obj.TypeId, obj.Name, props)
+
+
+def _get_fingerprint_value(value):
+    if isinstance(value, (list, tuple)):
+        return tuple(_get_fingerprint_value(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((repr(k), _get_fingerprint_value(v)) for k, v in value.items()))
+    if isinstance(value, FreeCAD.DocumentObject):
+        shape = getattr(value, "Shape", None)
+        if shape is None:
+            return value.Name
+        return (value.Name, repr(value.Placement), repr(shape.BoundBox))
+    if isinstance(value, FreeCAD.Units.Quantity):
+        return (value.Value, str(value.Unit))
+    return repr(value)
+
+
 # ************************************************************************************************
 # other
 def getBoundBoxOfAllDocumentShapes(doc):
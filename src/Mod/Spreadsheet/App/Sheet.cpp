@@ -476,6 +476,24 @@ void Sheet::setCell(CellAddress address, const char* value)
     setContent(address, value);
 }
 
+/**
+ * Set the contents of many cells at once. The change of the cells is signalled once
+ * for all cells, instead of once per cell.
+ *
+ * @param contents   Pairs of cell position and string value of expression.
+ *
+ */
+
+void Sheet::setCells(const std::vector<std::pair<CellAddress, std::string>>& contents)
+{
+    PropertySheet::AtomicPropertyChange signaller(cells);
+
+    for (const auto& [address, value] : contents) {
+        setCell(address, value.c_str());
+    }
+    signaller.tryInvoke();
+}
+
 /**
  * Get the Python object for the Sheet.
  *
@@ -135,6 +135,8 @@ public:
 
     void setCell(App::CellAddress address, const char* value);
 
+    void setCells(const std::vector<std::pair<App::CellAddress, std::string>>& contents);
+
     void clearAll();
 
     void clear(App::CellAddress address, bool all = true);
@@ -25,6 +25,13 @@ class Sheet(DocumentObject):
         """Set data into a cell"""
         ...
 
+    def setCells(self, cells: dict[str, str], /) -> None:
+        """
+        Set data into many cells at once, given as a dictionary of cell addresses
+        and contents. The change of the cells is signalled once for all cells.
+        """
+        ...
+
     def get(self) -> Any:
         """Get evaluated cell contents"""
         ...
@@ -94,6 +94,39 @@ PyObject* SheetPy::set(PyObject* args)
     Py_Return;
 }
 
+PyObject* SheetPy::setCells(PyObject* args)
+{
+    PyObject* dict;
+
+    if (!PyArg_ParseTuple(args, "O!:setCells", &PyDict_Type, &dict)) {
+        return nullptr;
+    }
+
+    std::vector<std::pair<CellAddress, std::string>> contents;
+    contents.reserve(PyDict_Size(dict));
+
+    try {
+        PyObject* key;
+        PyObject* value;
+        Py_ssize_t pos = 0;
+
+        while (PyDict_Next(dict, &pos, &key, &value)) {
+            if (!PyUnicode_Check(key) || !PyUnicode_Check(value)) {
+                PyErr_SetString(PyExc_TypeError, "Cell addresses and contents must be strings");
+                return nullptr;
+            }
+            contents.emplace_back(CellAddress(PyUnicode_AsUTF8(key)), PyUnicode_AsUTF8(value));
+        }
+        getSheetPtr()->setCells(contents);
+    }
+    catch (const Base::Exception& e) {
+        PyErr_SetString(PyExc_ValueError, e.what());
+        return nullptr;
+    }
+
+    Py_Return;
+}
+
 PyObject* SheetPy::get(PyObject* args)
 {
     const char* address;
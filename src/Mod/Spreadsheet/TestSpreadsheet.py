@@ -29,6 +29,8 @@ import FreeCAD
 import Part
 import Sketcher
 import tempfile
+import time
+import zipfile
 from FreeCAD import Base
 from FreeCAD import Units
 
@@ -669,6 +671,34 @@ class SpreadsheetFunction(unittest.TestCase):
         self.assertEqual(self.sheet.J22, 0)
 
 
+def writeXLSX(fileName, sheets, strings=(), definedNames=()):
+    """Write a minimal Excel file with the given sheets, a list of pairs of sheet name
+    and the XML of the rows, the shared strings and the defined names."""
+    ns = 'xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"'
+    nsRel = 'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+    with zipfile.ZipFile(fileName, "w") as z:
+        book = [f"<workbook {ns} {nsRel}><sheets>"]
+        rels = [
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        ]
+        for i, (name, rows) in enumerate(sheets, 1):
+            book.append(f'<sheet name="{name}" sheetId="{i}" r:id="rId{i}"/>')
+            rels.append(f'<Relationship Id="rId{i}" Target="worksheets/sheet{i}.xml"/>')
+            z.writestr(
+                f"xl/worksheets/sheet{i}.xml",
+                f"<worksheet {ns}><sheetData>{rows}</sheetData></worksheet>",
+            )
+        book.append("</sheets><definedNames>")
+        for name, ref in definedNames:
+            book.append(f'<definedName name="{name}">{ref}</definedName>')
+        book.append("</definedNames></workbook>")
+        rels.append("</Relationships>")
+        z.writestr("xl/workbook.xml", "".join(book))
+        z.writestr("xl/_rels/workbook.xml.rels", "".join(rels))
+        if strings:
+            z.writestr("xl/sharedStrings.xml", f"<sst {ns}>{''.join(strings)}</sst>")
+
+
 #############################################################################################
 class SpreadsheetCases(unittest.TestCase):
     def setUp(self):
@@ -2018,3 +2048,87 @@ class SpreadsheetCases(unittest.TestCase):
         self.assertEqual(sheet.get("G8"), 10)
         self.assertEqual(sheet.get("G9"), 20)
         self.assertEqual(sheet.get("G10"), 10)
+
+    def testSetCells(self):
+        """Testing setting many cells at once"""
+        sheet = self.doc.addObject("Spreadsheet::Sheet", "Spreadsheet")
+        sheet.setCells({"A1": "1", "A2": "=A1 + 1", "B1": "Text", "B2": "=A2 * 2"})
+        self.doc.recompute()
+        self.assertEqual(sheet.get("A2"), 2)
+        self.assertEqual(sheet.get("B1"), "Text")
+        self.assertEqual(sheet.get("B2"), 4)
+        self.assertEqual(sheet.getContents("A2"), "=A1 + 1")
+        self.assertRaises(TypeError, sheet.setCells, {"A1": 1})
+        self.assertRaises(ValueError, sheet.setCells, {"1A": "1"})
+
+    def testImportXLSX(self):
+        """Testing the import of an Excel file"""
+        import importXLSX
+
+        fileName = os.path.join(self.TempPath, "testImportXLSX.xlsx")
+        sheet1 = (
+            '<row r="1"><c r="A1"><v>2</v></c><c r="B1"><f t="shared" ref="B1:B2" si="0">'
+            'A1*2</f><v>4</v></c><c r="C1"><f>SUM(A1:A2)+Sheet2!A1</f><v>15</v></c>'
+            '<c r="D1"><f t="shared" ref="D1:E1" si="1">$A$1+A2</f><v>5</v></c>'
+            '<c r="E1"><f t="shared" si="1"/><v>8</v></c></row>'
+            '<row r="2"><c r="A2"><v>3</v></c><c r="B2"><f t="shared" si="0"/><v>6</v></c>'
+            '<c r="C2" t="inlineStr"><is><t>Inline</t></is></c></row>'
+            '<row r="3"><c r="A3" t="s"><v>0</v></c><c r="B3" t="s"><v>1</v></c></row>'
+        )
+        sheet2 = '<row r="1"><c r="A1"><v>10</v></c></row>'
+        strings = ["<si><t>Hello</t></si>", "<si><r><t>Rich</t></r><r><t>Text</t></r></si>"]
+        writeXLSX(
+            fileName,
+            [("Sheet1", sheet1), ("Sheet2", sheet2)],
+            strings,
+            [("Width", "Sheet1!$A$1")],
+        )
+        doc = importXLSX.open(fileName)
+        try:
+            sheet = doc.getObject("Sheet1")
+            self.assertEqual(sheet.getContents("B1"), "=A1 * 2")
+            self.assertEqual(sheet.getContents("B2"), "=A2 * 2")
+            self.assertEqual(sheet.getContents("E1"), "=$A$1 + B2")
+            self.assertEqual(sheet.get("B1"), 4)
+            self.assertEqual(sheet.get("B2"), 6)
+            self.assertEqual(sheet.get("C1"), 15)
+            self.assertEqual(sheet.get("D1"), 5)
+            self.assertEqual(sheet.get("E1"), 8)
+            self.assertEqual(sheet.get("C2"), "Inline")
+            self.assertEqual(sheet.get("A3"), "Hello")
+            self.assertEqual(sheet.get("B3"), "RichText")
+            self.assertEqual(sheet.getAlias("A1"), "Width")
+        finally:
+            FreeCAD.closeDocument(doc.Name)
+            os.remove(fileName)
+
+    def testImportLargeXLSX(self):
+        """Testing the import of a large Excel file, with the import time"""
+        import importXLSX
+
+        fileName = os.path.join(self.TempPath, "testImportLargeXLSX.xlsx")
+        numRows = 2000
+        rows = []
+        for row in range(1, numRows + 1):
+            cells = [f'<c r="{col}{row}"><v>{row}</v></c>' for col in "ABCDEFGH"]
+            cells.append(f'<c r="I{row}" t="s"><v>{row % 100}</v></c>')
+            if row == 1:
+                cells.append(f'<c r="J1"><f t="shared" ref="J1:J{numRows}" si="0">A1+H1</f></c>')
+            else:
+                cells.append(f'<c r="J{row}"><f t="shared" si="0"/></c>')
+            rows.append(f'<row r="{row}">{"".join(cells)}</row>')
+        strings = [f"<si><t>Part {i}</t></si>" for i in range(100)]
+        writeXLSX(fileName, [("Sheet1", "".join(rows))], strings)
+        start = time.perf_counter()
+        doc = importXLSX.open(fileName)
+        FreeCAD.Console.PrintLog(
+            f"  Import of {numRows * 10} cells: {time.perf_counter() - start:.3f} s\n"
+        )
+        try:
+            sheet = doc.getObject("Sheet1")
+            self.assertEqual(len(sheet.getNonEmptyCells()), numRows * 10)
+            self.assertEqual(sheet.get(f"J{numRows}"), 2 * numRows)
+            self.assertEqual(sheet.get("I123"), "Part 23")
+        finally:
+            FreeCAD.closeDocument(doc.Name)
+            os.remove(fileName)
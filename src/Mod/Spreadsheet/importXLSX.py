@@ -30,6 +30,11 @@ __url__ = ["https://www.freecad.org"]
 """
 This library imports an Excel-XLSX-file into FreeCAD.
 
+Version 1.2:
+The worksheets and shared strings are parsed as a stream, the cells are set
+into the spreadsheets in batches and the document is recomputed once.
+Added support for shared formulas.
+
 Version 1.1, Nov. 2016:
 Changed parser, adds rad-unit to trigonometric functions in order
 to give the same result in FreeCAD.
@@ -54,8 +59,10 @@ known issues:
 """
 
 
+import re
 import zipfile
 import xml.dom.minidom
+import xml.etree.ElementTree as ET
 import FreeCAD as App
 
 try:
@@ -315,64 +322,146 @@ def getText(nodelist):
         return "".join(rc)
 
 
-def handleWorkSheet(theDom, actSheet, strList):
-    rows = theDom.getElementsByTagName("row")
-    for row in rows:
-        handleCells(row.getElementsByTagName("c"), actSheet, strList)
-
-
-def handleCells(cellList, actCellSheet, sList):
-    for cell in cellList:
-        cellAtts = cell.attributes
-        refRef = cellAtts.getNamedItem("r")
-        ref = getText(refRef.childNodes)
-
-        refType = cellAtts.getNamedItem("t")
-        if refType:
-            cellType = getText(refType.childNodes)
+# Number of cells set into a spreadsheet with one call of Sheet.setCells()
+CELL_BATCH_SIZE = 10000
+
+# Matches the strings and the cell references of a translated formula. The
+# strings are matched in order to leave the references inside them unchanged.
+cellRefPattern = re.compile(r"<<.*?>>|\"[^\"]*\"|(?<!\w)(\$?)([A-Z]{1,3})(\$?)([0-9]+)(?![\w(])")
+
+cellAddressPattern = re.compile(r"([A-Z]+)([0-9]+)")
+
+
+def localName(tag):
+    """Return the tag name of an ElementTree element without the namespace."""
+    return tag.rpartition("}")[2]
+
+
+def columnIndex(column):
+    """Return the index of the column name column, 0 for 'A'."""
+    index = 0
+    for char in column:
+        index = index * 26 + ord(char) - ord("A") + 1
+    return index - 1
+
+
+def columnName(index):
+    """Return the name of the column with the index index, 'A' for 0."""
+    name = ""
+    index += 1
+    while index > 0:
+        index, rest = divmod(index - 1, 26)
+        name = chr(ord("A") + rest) + name
+    return name
+
+
+def shiftFormula(formula, fromRef, toRef):
+    """Move the relative cell references of formula from cell fromRef to cell toRef.
+
+    This is how Excel derives the formula of a cell from the shared formula of
+    another cell. Absolute references ($A$1) are left unchanged.
+    """
+    fromCol, fromRow = cellAddressPattern.match(fromRef).groups()
+    toCol, toRow = cellAddressPattern.match(toRef).groups()
+    colOffset = columnIndex(toCol) - columnIndex(fromCol)
+    rowOffset = int(toRow) - int(fromRow)
+    if colOffset == 0 and rowOffset == 0:
+        return formula
+
+    def shift(match):
+        colAbs, col, rowAbs, row = match.groups()
+        if col is None:  # a string
+            return match.group(0)
+        if not colAbs:
+            col = columnName(columnIndex(col) + colOffset)
+        if not rowAbs:
+            row = str(int(row) + rowOffset)
+        return colAbs + col + rowAbs + row
+
+    return cellRefPattern.sub(shift, formula)
+
+
+def translateFormula(formula, translations):
+    """Return the FreeCAD expression of an Excel formula.
+
+    The translations are cached in the dict translations.
+    """
+    translated = translations.get(formula)
+    if translated is None:
+        translated = FormulaTranslator().translateForm(formula)
+        translations[formula] = translated
+    return translated
+
+
+def handleWorkSheet(theFile, actSheet, strList):
+    """Read the cells of a worksheet file into the spreadsheet actSheet.
+
+    The file is parsed as a stream, the cells are set in batches of CELL_BATCH_SIZE.
+    """
+    sharedFormulas = {}
+    translations = {}
+    cellContents = {}
+    for _, elem in ET.iterparse(theFile):
+        tag = localName(elem.tag)
+        if tag == "c":
+            handleCell(elem, cellContents, strList, sharedFormulas, translations)
+            if len(cellContents) >= CELL_BATCH_SIZE:
+                actSheet.setCells(cellContents)
+                cellContents = {}
+        elif tag == "row":
+            elem.clear()
+    if cellContents:
+        actSheet.setCells(cellContents)
+
+
+def handleCell(cell, cellContents, sList, sharedFormulas, translations):
+    """Add the content of a cell element to the dict cellContents.
+
+    sharedFormulas maps the index of a shared formula to the reference of the cell
+    that defines it and its translation.
+    """
+    ns = cell.tag[:-1]
+    ref = cell.get("r")
+    cellType = cell.get("t", "n")
+    content = None
+
+    # print("reference: ", ref, ' Cell type: ', cellType)
+
+    if cellType == "inlineStr":
+        stringEle = cell.find(ns + "is")
+        if stringEle is not None:
+            content = "".join(t.text or "" for t in stringEle.iter(ns + "t"))
+
+    formulaEle = cell.find(ns + "f")
+    if formulaEle is not None:
+        theFormula = formulaEle.text
+        attrName = formulaEle.get("t")
+        indexName = formulaEle.get("si")
+        if theFormula:
+            # print("theFormula: ", theFormula)
+            content = translateFormula(theFormula, translations)
+            if attrName == "shared":
+                sharedFormulas[indexName] = (ref, content)
+        elif attrName == "shared" and indexName in sharedFormulas:
+            masterRef, masterContent = sharedFormulas[indexName]
+            content = shiftFormula(masterContent, masterRef, ref)
         else:
-            cellType = "n"
-
-        # print("reference: ", ref, ' Cell type: ', cellType)
-
-        if cellType == "inlineStr":
-            iStringList = cell.getElementsByTagName("is")
-            # print('iString: ', iStringList)
-            for stringEle in iStringList:
-                tElement = stringEle.getElementsByTagName("t")[0]
-                theString = getText(tElement.childNodes)
-
-                # print('theString: ', theString)
-                actCellSheet.set(ref, theString)
-
-        formulaRef = cell.getElementsByTagName("f")
-        if len(formulaRef) == 1:
-            theFormula = getText(formulaRef[0].childNodes)
-            if theFormula:
-                # print("theFormula: ", theFormula)
-                fTrans = FormulaTranslator()
-                actCellSheet.set(ref, fTrans.translateForm(theFormula))
-            else:
-                attrs = formulaRef[0].attributes
-                attrRef = attrs.getNamedItem("t")
-                attrName = getText(attrRef.childNodes)
-                indexRef = attrs.getNamedItem("si")
-                indexName = getText(indexRef.childNodes)
-                content = "<f t='{}' si='{}'/>".format(attrName, indexName)
-                print(f"Unsupported formula in cell {ref}: {content}")
+            unsupported = "<f t='{}' si='{}'/>".format(attrName, indexName)
+            print(f"Unsupported formula in cell {ref}: {unsupported}")
 
-        else:
-            valueRef = cell.getElementsByTagName("v")
-            # print('valueRef: ', valueRef)
-            if len(valueRef) == 1:
-                valueRef = cell.getElementsByTagName("v")[0]
-                if valueRef:
-                    theValue = getText(valueRef.childNodes)
-                    # print("theValue: ", theValue)
-                    if cellType == "n":
-                        actCellSheet.set(ref, theValue)
-                    if cellType == "s":
-                        actCellSheet.set(ref, (sList[int(theValue)]))
+    else:
+        valueEle = cell.find(ns + "v")
+        if valueEle is not None:
+            theValue = valueEle.text or ""
+            # print("theValue: ", theValue)
+            if cellType == "n":
+                content = theValue
+            if cellType == "s":
+                content = sList[int(theValue)]
+
+    if content is not None:
+        cellContents[ref] = content
+    cell.clear()
 
 
 def handleWorkBookRels(theBookRels):
@@ -421,24 +510,25 @@ def handleWorkBook(theBook, theBookRels, sheetDict, Doc):
             actSheet.setAlias(addressList[0] + addressList[1], aliasName)
 
 
-def handleStrings(theStr, sList):
+def handleStrings(theStrFile, sList):
+    """Append the shared strings of the file theStrFile to the list sList."""
     # print("process Strings: ")
-    stringElements = theStr.getElementsByTagName("t")
-    for sElem in stringElements:
-        # print("string: ", getText(sElem.childNodes))
-        sList.append(getText(sElem.childNodes))
-
-
-def open(nameXLSX):
-
-    if len(nameXLSX) > 0:
-        z = zipfile.ZipFile(nameXLSX)
-
-        theDoc = App.newDocument()
-
-        sheetDict = dict()
-        stringList = []
+    for _, elem in ET.iterparse(theStrFile):
+        if localName(elem.tag) == "si":
+            ns = elem.tag[:-2]
+            # a plain string or a rich text made of runs
+            texts = elem.findall(ns + "t") + elem.findall(ns + "r/" + ns + "t")
+            # print("string: ", texts)
+            sList.append("".join(t.text or "" for t in texts))
+            elem.clear()
+
+
+def handleXLSX(nameXLSX, theDoc):
+    """Import the sheets of the Excel file nameXLSX into the document theDoc."""
+    sheetDict = dict()
+    stringList = []
 
+    with zipfile.ZipFile(nameXLSX) as z:
         theBookFile = z.open("xl/workbook.xml")
         theBook = xml.dom.minidom.parse(theBookFile)
         theBookRelsFile = z.open("xl/_rels/workbook.xml.rels")
@@ -448,25 +538,25 @@ def open(nameXLSX):
         theBookRels.unlink()
 
         if "xl/sharedStrings.xml" in z.namelist():
-            theStringFile = z.open("xl/sharedStrings.xml")
-            theStrings = xml.dom.minidom.parse(theStringFile)
-            handleStrings(theStrings, stringList)
-            theStrings.unlink()
+            with z.open("xl/sharedStrings.xml") as theStringFile:
+                handleStrings(theStringFile, stringList)
 
         for sheetSpec in sheetDict:
             # print("sheetSpec: ", sheetSpec)
             theSheet, sheetFile = sheetDict[sheetSpec]
-            f = z.open("xl/" + sheetFile)
-            myDom = xml.dom.minidom.parse(f)
+            with z.open("xl/" + sheetFile) as f:
+                handleWorkSheet(f, theSheet, stringList)
+
+    # All cells are set before the recompute, which follows the dependencies of
+    # the cells and of the sheets, so one recompute calculates all references.
+    theDoc.recompute()
 
-            handleWorkSheet(myDom, theSheet, stringList)
-            myDom.unlink()
 
-        z.close()
-        # This is needed more than once, otherwise some references are not calculated!
-        theDoc.recompute()
-        theDoc.recompute()
-        theDoc.recompute()
+def open(nameXLSX):
+
+    if len(nameXLSX) > 0:
+        theDoc = App.newDocument()
+        handleXLSX(nameXLSX, theDoc)
         return theDoc
 
 
@@ -477,35 +567,4 @@ def insert(nameXLSX, docname):
         theDoc = App.newDocument(docname)
     App.ActiveDocument = theDoc
 
-    sheetDict = dict()
-    stringList = []
-
-    z = zipfile.ZipFile(nameXLSX)
-    theBookFile = z.open("xl/workbook.xml")
-    theBook = xml.dom.minidom.parse(theBookFile)
-    theBookRelsFile = z.open("xl/_rels/workbook.xml.rels")
-    theBookRels = xml.dom.minidom.parse(theBookRelsFile)
-    handleWorkBook(theBook, theBookRels, sheetDict, theDoc)
-    theBook.unlink()
-    theBookRels.unlink()
-
-    if "xl/sharedStrings.xml" in z.namelist():
-        theStringFile = z.open("xl/sharedStrings.xml")
-        theStrings = xml.dom.minidom.parse(theStringFile)
-        handleStrings(theStrings, stringList)
-        theStrings.unlink()
-
-    for sheetSpec in sheetDict:
-        # print("sheetSpec: ", sheetSpec)
-        theSheet, sheetFile = sheetDict[sheetSpec]
-        f = z.open("xl/" + sheetFile)
-        myDom = xml.dom.minidom.parse(f)
-
-        handleWorkSheet(myDom, theSheet, stringList)
-        myDom.unlink()
-
-    z.close()
-    # This is needed more than once, otherwise some references are not calculated!
-    theDoc.recompute()
-    theDoc.recompute()
-    theDoc.recompute()
+    handleXLSX(nameXLSX, theDoc)
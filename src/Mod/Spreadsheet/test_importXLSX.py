@@ -3,7 +3,15 @@
 import unittest
 from unittest.mock import patch, MagicMock
 
-from importXLSX import FormulaTranslator, getText, handleStrings, open
+from importXLSX import (
+    FormulaTranslator,
+    columnIndex,
+    columnName,
+    getText,
+    handleStrings,
+    open,
+    shiftFormula,
+)
 
 
 class TestFormulaTranslator(unittest.TestCase):
@@ -98,3 +106,36 @@ class TestFormulaTranslator(unittest.TestCase):
         # Then
         expected = [f"={expression}" for _, expression in formulas_and_expressions]
         self.assertListEqual(expected, result)
+
+
+class TestSharedFormulas(unittest.TestCase):
+    def test_column_names(self):
+        # With
+        columns = [("A", 0), ("Z", 25), ("AA", 26), ("AZ", 51), ("BA", 52), ("XFD", 16383)]
+
+        # Then
+        for name, index in columns:
+            self.assertEqual(columnIndex(name), index)
+            self.assertEqual(columnName(index), name)
+
+    def test_shift_formula(self):
+        # With
+        formulas_and_expressions = [
+            ("=A1*2", "A1", "A5", "=A5*2"),
+            ("=A1*2", "A1", "C1", "=C1*2"),
+            ("=sum(A1:B2)+Sheet2.C3", "B2", "C4", "=sum(B3:C4)+Sheet2.D5"),
+            ("=$A$1+$B1+C$1", "A1", "B2", "=$A$1+$B2+D$1"),
+            ("=Z1+AZ1", "A1", "B1", "=AA1+BA1"),
+            ("=log10(A1)", "A1", "A2", "=log10(A2)"),
+            ("=<<A1>>", "A1", "A2", "=<<A1>>"),
+        ]
+
+        # When
+        result = [
+            shiftFormula(formula, fromRef, toRef)
+            for formula, fromRef, toRef, _ in formulas_and_expressions
+        ]
+
+        # Then
+        expected = [expression for _, _, _, expression in formulas_and_expressions]
+        self.assertListEqual(expected, result)